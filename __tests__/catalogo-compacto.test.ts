@@ -0,0 +1,24 @@
+import { describe, it, expect } from 'vitest';
+import { categoriasPlantas } from '../data/plantas-expandidas';
+import { sistemasCorporales } from '../data/enfermedades-expandidas';
+import { cargarPlantasCompactas } from '../data/plantas-compacto';
+import { cargarEnfermedadesCompactas } from '../data/enfermedades-compacto';
+import { decodificarPlantas } from '../data/compacto';
+
+describe('Catálogo compacto', () => {
+  it('plants should decode to the full module', () => {
+    expect(cargarPlantasCompactas()).toEqual(categoriasPlantas);
+  });
+
+  it('diseases should decode to the full module', () => {
+    expect(cargarEnfermedadesCompactas()).toEqual(sistemasCorporales);
+  });
+
+  it('should decode only once', () => {
+    expect(cargarPlantasCompactas()).toBe(cargarPlantasCompactas());
+  });
+
+  it('should reject an unknown format version', () => {
+    expect(() => decodificarPlantas('{"v":99,"campos":[],"cadenas":[],"bloques":[]}')).toThrow();
+  });
+});
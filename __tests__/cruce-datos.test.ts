@@ -5,18 +5,24 @@ import {
   getPlantaExpandidaById,
   buscarPlantasExpandidas,
   getPlantasBySistema,
-  totalPlantas
+  totalPlantas,
+  huellaPlantas
 } from "../data/plantas-expandidas";
 import { 
   getAllEnfermedades, 
   sistemasCorporales,
-  getEnfermedadExpandidaById 
+  getEnfermedadExpandidaById,
+  huellaEnfermedades
 } from "../data/enfermedades-expandidas";
 import { 
   getPlantasParaEnfermedad, 
   getEnfermedadesParaPlanta,
-  getMotivoRecomendacion 
+  getMotivoRecomendacion,
+  cargarCatalogoCruce,
+  CatalogoCruce
 } from "../data/cruce-datos";
+import { cruceIndex } from "../data/cruce-index";
+import { indicePropiedades } from "../data/propiedades-index";
 
 describe("Plantas Expandidas", () => {
   it("debe tener al menos 690 plantas", () => {
@@ -73,13 +79,29 @@ describe("Plantas Expandidas", () => {
   });
 });
 
+// El mismo catálogo que las pantallas cargan desde los chunks, leído del módulo completo
+const catalogo: CatalogoCruce = {
+  plantas: getAllPlantas(),
+  enfermedades: getAllEnfermedades(),
+  huellaPlantas,
+  huellaEnfermedades,
+};
+
 describe("Cruce de Datos", () => {
+  it("el catálogo cargado desde los chunks debe coincidir con el módulo completo", async () => {
+    const cargado = await cargarCatalogoCruce();
+    expect(cargado.plantas.map(p => p.id)).toEqual(catalogo.plantas.map(p => p.id));
+    expect(cargado.enfermedades.map(e => e.id)).toEqual(catalogo.enfermedades.map(e => e.id));
+    expect(cargado.huellaPlantas).toBe(huellaPlantas);
+    expect(cargado.huellaEnfermedades).toBe(huellaEnfermedades);
+  });
+
   it("debe obtener plantas recomendadas para una enfermedad", () => {
     const enfermedad = getEnfermedadExpandidaById("asma");
     expect(enfermedad).toBeDefined();
     
     if (enfermedad) {
-      const plantasRecomendadas = getPlantasParaEnfermedad(enfermedad);
+      const plantasRecomendadas = getPlantasParaEnfermedad(enfermedad, catalogo);
       expect(plantasRecomendadas.length).toBeGreaterThan(0);
       expect(plantasRecomendadas.length).toBeLessThanOrEqual(6);
     }
@@ -90,7 +112,7 @@ describe("Cruce de Datos", () => {
     expect(planta).toBeDefined();
     
     if (planta) {
-      const enfermedades = getEnfermedadesParaPlanta(planta);
+      const enfermedades = getEnfermedadesParaPlanta(planta, catalogo);
       expect(enfermedades.length).toBeGreaterThan(0);
       expect(enfermedades.length).toBeLessThanOrEqual(8);
     }
@@ -104,7 +126,7 @@ describe("Cruce de Datos", () => {
     expect(planta).toBeDefined();
     
     if (enfermedad && planta) {
-      const motivo = getMotivoRecomendacion(planta, enfermedad);
+      const motivo = getMotivoRecomendacion(planta, enfermedad, catalogo);
       expect(motivo).toBeDefined();
       expect(motivo.length).toBeGreaterThan(0);
       expect(motivo).toContain("Propiedades:");
@@ -115,7 +137,7 @@ describe("Cruce de Datos", () => {
     const plantasDigestivas = getPlantasBySistema("sistema-digestivo").slice(0, 5);
     
     plantasDigestivas.forEach(planta => {
-      const enfermedades = getEnfermedadesParaPlanta(planta);
+      const enfermedades = getEnfermedadesParaPlanta(planta, catalogo);
       // Al menos algunas enfermedades deberían ser del sistema digestivo
       const enfermedadesDigestivas = enfermedades.filter(e => e.sistemaId === "sistema-digestivo");
       expect(enfermedadesDigestivas.length).toBeGreaterThanOrEqual(0);
@@ -126,12 +148,103 @@ describe("Cruce de Datos", () => {
     const enfermedadRespiratoria = getEnfermedadExpandidaById("bronquitis-aguda");
     
     if (enfermedadRespiratoria) {
-      const plantas = getPlantasParaEnfermedad(enfermedadRespiratoria);
+      const plantas = getPlantasParaEnfermedad(enfermedadRespiratoria, catalogo);
+      expect(plantas.length).toBeGreaterThan(0);
+    }
+  });
+});
+
+describe("Índice precalculado del cruce", () => {
+  it("debe estar generado para el catálogo actual", () => {
+    expect(cruceIndex.totalPlantas).toBe(getAllPlantas().length);
+    expect(cruceIndex.totalEnfermedades).toBe(getAllEnfermedades().length);
+    expect(cruceIndex.huellaPlantas).toBe(huellaPlantas);
+    expect(cruceIndex.huellaEnfermedades).toBe(huellaEnfermedades);
+  });
+
+  it("con un índice desactualizado debe calcular el cruce en vivo", () => {
+    const enfermedad = getEnfermedadExpandidaById("asma");
+    expect(enfermedad).toBeDefined();
+
+    if (enfermedad) {
+      const desactualizado = { ...catalogo, huellaPlantas: "otra-huella" };
+      const plantas = getPlantasParaEnfermedad(enfermedad, desactualizado);
       expect(plantas.length).toBeGreaterThan(0);
+      expect(plantas.length).toBeLessThanOrEqual(6);
+    }
+  });
+
+  it("debe cubrir todas las enfermedades y plantas", () => {
+    getAllEnfermedades().forEach(e => {
+      expect(cruceIndex.plantasPorEnfermedad[`${e.sistemaId}/${e.id}`]).toBeDefined();
+    });
+    getAllPlantas().forEach(p => {
+      expect(cruceIndex.enfermedadesPorPlanta[`${p.categoriaId}/${p.id}`]).toBeDefined();
+    });
+  });
+
+  it("las plantas de cada enfermedad deben estar ordenadas por puntuación y sin repetir", () => {
+    Object.values(cruceIndex.plantasPorEnfermedad).forEach(pares => {
+      const plantas = getAllPlantas();
+      const ids = pares.map(([posicion]) => plantas[posicion].id);
+      expect(new Set(ids).size).toBe(ids.length);
+      for (let i = 1; i < pares.length; i++) {
+        expect(pares[i - 1][2]).toBeGreaterThanOrEqual(pares[i][2]);
+      }
+    });
+  });
+
+  it("el asma debe recomendar primero plantas broncodilatadoras o expectorantes", () => {
+    const enfermedad = getEnfermedadExpandidaById("asma");
+    expect(enfermedad).toBeDefined();
+
+    if (enfermedad) {
+      const [primera] = getPlantasParaEnfermedad(enfermedad, catalogo);
+      const propiedades = primera.propiedades.join(" ").toLowerCase();
+      expect(propiedades).toMatch(/broncodilatad|expectorante/);
+    }
+  });
+
+  it("el motivo debe usar propiedades de la planta recomendada", () => {
+    const enfermedad = getEnfermedadExpandidaById("asma");
+    expect(enfermedad).toBeDefined();
+
+    if (enfermedad) {
+      getPlantasParaEnfermedad(enfermedad, catalogo).forEach(planta => {
+        const motivo = getMotivoRecomendacion(planta, enfermedad, catalogo);
+        const propiedades = motivo.replace("Propiedades: ", "").split(", ");
+        propiedades.forEach(prop => expect(planta.propiedades).toContain(prop));
+      });
     }
   });
 });
 
+describe("Vocabulario de propiedades", () => {
+  it("debe estar generado para el catálogo actual", () => {
+    expect(indicePropiedades.totalPlantas).toBe(getAllPlantas().length);
+    expect(indicePropiedades.huellaPlantas).toBe(huellaPlantas);
+    expect(indicePropiedades.plantas.length).toBe(getAllPlantas().length);
+  });
+
+  it("debe unificar variantes de género y matices de una propiedad", () => {
+    const plantas = getAllPlantas();
+    const terminoDe = (texto: string) => {
+      const p = plantas.findIndex(planta => planta.propiedades.includes(texto));
+      return indicePropiedades.terminos[p][plantas[p].propiedades.indexOf(texto)];
+    };
+    expect(terminoDe("Antiinflamatoria")).toBe(terminoDe("Antiinflamatorio"));
+    expect(terminoDe("Diurética")).toBe(terminoDe("Diurético"));
+  });
+
+  it("plantas con propiedad en masculino deben cumplir requisitos en femenino", () => {
+    const plantas = getAllPlantas();
+    const p = plantas.findIndex(planta => planta.propiedades.includes("Antiinflamatorio"));
+    const bits = indicePropiedades.plantas[p];
+    const requisitos = indicePropiedades.requisitos["artritis"];
+    expect(bits.some((palabra, i) => (palabra & (requisitos[i] ?? 0)) !== 0)).toBe(true);
+  });
+});
+
 describe("Integración de Datos", () => {
   it("todos los sistemas corporales deben existir", () => {
     expect(sistemasCorporales.length).toBe(13);
@@ -6,7 +6,11 @@ import {
   getEnfermedadesBySistema,
   getEnfermedadExpandidaById,
   totalEnfermedades,
+  huellaEnfermedades,
 } from '../data/enfermedades-expandidas';
+import { buscarEnIndice } from '../data/busqueda';
+import { indiceBusquedaEnfermedades } from '../data/busqueda-index';
+import { resumenSistemas, cargarSistema, totalEnfermedades as totalIndice } from '../data/chunks/enfermedades';
 
 describe('Enfermedades Expandidas', () => {
   describe('sistemasCorporales', () => {
@@ -69,10 +73,28 @@ describe('Enfermedades Expandidas', () => {
       expect(results.length).toBeGreaterThan(0);
     });
 
+    it('should ignore accents and case', () => {
+      const conAcento = buscarEnfermedadesExpandidas('Inflamación');
+      const sinAcento = buscarEnfermedadesExpandidas('inflamacion');
+      expect(sinAcento.length).toBeGreaterThan(0);
+      expect(sinAcento).toEqual(conAcento);
+    });
+
+    it('should rank name matches first', () => {
+      const results = buscarEnfermedadesExpandidas('asma');
+      expect(results[0].nombre.toLowerCase()).toContain('asma');
+    });
+
     it('should return empty array for no matches', () => {
       const results = buscarEnfermedadesExpandidas('xyznonexistent123');
       expect(results.length).toBe(0);
     });
+
+    it('should use the index only when its fingerprint matches the catalog', () => {
+      expect(indiceBusquedaEnfermedades.huella).toBe(huellaEnfermedades);
+      expect(buscarEnIndice(indiceBusquedaEnfermedades, 'asma', huellaEnfermedades)).not.toBeNull();
+      expect(buscarEnIndice(indiceBusquedaEnfermedades, 'asma', 'otra-huella')).toBeNull();
+    });
   });
 
   describe('getEnfermedadesBySistema', () => {
@@ -127,4 +149,21 @@ describe('Enfermedades Expandidas', () => {
       });
     });
   });
+
+  describe('chunks por sistema', () => {
+    it('index should match the full module', () => {
+      expect(totalIndice).toBe(totalEnfermedades);
+      expect(resumenSistemas.map(s => s.id)).toEqual(sistemasCorporales.map(s => s.id));
+      resumenSistemas.forEach((resumen, i) => {
+        expect(resumen.total).toBe(sistemasCorporales[i].enfermedades.length);
+        expect(resumen.icono).toBe(sistemasCorporales[i].icono);
+      });
+    });
+
+    it('should load a system on demand', async () => {
+      const sistema = await cargarSistema('sistema-respiratorio');
+      expect(sistema).toEqual(sistemasCorporales.find(s => s.id === 'sistema-respiratorio'));
+      expect(await cargarSistema('no-existe')).toBeUndefined();
+    });
+  });
 });
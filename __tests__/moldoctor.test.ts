@@ -1,4 +1,6 @@
 import { describe, it, expect } from "vitest";
+import { normalizarAlias, resolverEnfermedad, resolverPlanta } from "../data/alias";
+import { recuperarContexto, terminosConsulta } from "../server/recuperacion";
 
 describe("MolDoctor - Asistente Médico IA", () => {
   describe("Sistema de Mensajes", () => {
@@ -147,4 +149,56 @@ describe("MolDoctor - Asistente Médico IA", () => {
       expect(parsed.timestamp.getTime()).toBe(message.timestamp.getTime());
     });
   });
+
+  describe("Resolución de etiquetas", () => {
+    it("debe normalizar alias sin acentos, mayúsculas ni separadores", () => {
+      expect(normalizarAlias("Diente de León")).toBe("dientedeleon");
+      expect(normalizarAlias("diente-de-leon")).toBe("dientedeleon");
+    });
+
+    it("debe resolver plantas por id, nombre y nombre científico", () => {
+      expect(resolverPlanta("manzanilla")?.metodo).toBe("exacto");
+      expect(resolverPlanta("Manzanilla")?.id).toBe("manzanilla");
+      expect(resolverPlanta("Matricaria chamomilla")?.id).toBe("manzanilla");
+    });
+
+    it("debe resolver enfermedades con su sistema corporal", () => {
+      const migrana = resolverEnfermedad("Migraña");
+      expect(migrana?.id).toBe("migraña");
+      expect(migrana?.bloqueId).toBe("sistema-nervioso");
+    });
+
+    it("debe tolerar errores de escritura y rechazar textos sin parecido", () => {
+      const jengibre = resolverPlanta("Jenjibre");
+      expect(jengibre?.id).toBe("jengibre");
+      expect(jengibre?.metodo).toBe("difuso");
+      expect(resolverPlanta("xyz")).toBeNull();
+      expect(resolverPlanta("constructor")).toBeNull();
+    });
+  });
+
+  describe("Recuperación de contexto", () => {
+    it("debe ignorar saludos y palabras de conversación", () => {
+      expect(terminosConsulta("Hola doctor, tengo Náuseas")).toEqual(["nause"]);
+      expect(recuperarContexto("hola, buenas tardes").texto).toBe("");
+      expect(recuperarContexto("constructor").texto).toBe("");
+    });
+
+    it("debe recuperar la enfermedad mencionada y plantas para ella", () => {
+      const contexto = recuperarContexto("Hola doctor, tengo gastritis");
+      expect(contexto.enfermedades).toContain("gastritis");
+      expect(contexto.plantas.length).toBeGreaterThan(0);
+      expect(contexto.texto).toContain("- Gastritis");
+    });
+
+    it("debe respetar el presupuesto de tokens", () => {
+      const amplio = recuperarContexto("tengo tos con flemas y fiebre");
+      expect(amplio.tokens).toBeLessThanOrEqual(700);
+      const corto = recuperarContexto("tengo tos con flemas y fiebre", undefined, 200);
+      expect(corto.tokens).toBeLessThanOrEqual(200);
+      expect(corto.plantas.length + corto.enfermedades.length).toBeLessThan(
+        amplio.plantas.length + amplio.enfermedades.length,
+      );
+    });
+  });
 });
@@ -1,5 +1,7 @@
 import { describe, it, expect } from "vitest";
 import { sistemasCorporales, EnfermedadExpandida } from "../data/enfermedades-expandidas";
+import { buscarPorSintomas, terminosSintoma } from "../data/sintomas";
+import { indiceSintomas } from "../data/sintomas-index";
 
 describe("Síntomas y Causas de Enfermedades", () => {
   // Obtener todas las enfermedades
@@ -83,3 +85,35 @@ describe("Síntomas y Causas de Enfermedades", () => {
     });
   });
 });
+
+describe("Búsqueda por síntomas", () => {
+  it("normaliza las frases de síntomas a términos", () => {
+    expect(terminosSintoma("Dolores de cabeza")).toEqual(["dolor", "cabeza"]);
+    expect(terminosSintoma("Náuseas y vómitos")).toEqual(["nausea", "vomito"]);
+  });
+
+  it("el índice cubre todas las enfermedades del catálogo", () => {
+    const ids = new Set(sistemasCorporales.flatMap((s) => s.enfermedades.map((e) => e.id)));
+    expect(indiceSintomas.enfermedades.length).toBe(ids.size);
+    indiceSintomas.enfermedades.forEach(([id]) => expect(ids.has(id)).toBe(true));
+  });
+
+  it("sibilancias y falta de aire devuelven el Asma primero", () => {
+    const resultados = buscarPorSintomas(["sibilancias", "falta de aire"]);
+    expect(resultados[0].id).toBe("asma");
+    expect(resultados[0].cubiertos).toBe(2);
+  });
+
+  it("ordena por puntuación y respeta el límite", () => {
+    const resultados = buscarPorSintomas(["fiebre", "tos", "dolor de garganta"], 5);
+    expect(resultados.length).toBe(5);
+    for (let i = 1; i < resultados.length; i++) {
+      expect(resultados[i - 1].puntuacion).toBeGreaterThanOrEqual(resultados[i].puntuacion);
+    }
+  });
+
+  it("una consulta sin términos no devuelve resultados", () => {
+    expect(buscarPorSintomas([])).toEqual([]);
+    expect(buscarPorSintomas(["de la", "constructor"])).toEqual([]);
+  });
+});
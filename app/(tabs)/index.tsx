@@ -13,13 +13,9 @@ import { ThemedText } from "../../components/themed-text";
 import { GlassBackground } from "../../components/ui/glass-background";
 import { Colors, Spacing, IronManColors, Fonts, BorderRadius } from "../../constants/theme";
 import { useColorScheme } from "../../hooks/use-color-scheme";
-import { 
-  sistemasCorporales, 
-  buscarEnfermedadesExpandidas, 
-  EnfermedadExpandida,
-  SistemaCorporal,
-  totalEnfermedades
-} from "../../data/enfermedades-expandidas";
+import type { EnfermedadExpandida } from "../../data/enfermedades-expandidas";
+import { resumenSistemas, ResumenSistema, totalEnfermedades } from "../../data/chunks/enfermedades";
+import { useBusquedaEnfermedades, useSistemaEnfermedades } from "../../hooks/use-catalogo";
 
 export default function EnfermedadesScreen() {
   const colorScheme = useColorScheme();
@@ -30,17 +26,15 @@ export default function EnfermedadesScreen() {
   const [searchQuery, setSearchQuery] = useState("");
   const [selectedSistema, setSelectedSistema] = useState<string | null>(null);
 
-  // Enfermedades filtradas
+  // Enfermedades filtradas (el sistema y el catálogo de búsqueda se cargan bajo demanda)
+  const { enfermedades: enfermedadesSistema } = useSistemaEnfermedades(selectedSistema);
+  const { resultados } = useBusquedaEnfermedades(searchQuery);
   const displayedEnfermedades = useMemo(() => {
     if (searchQuery.trim()) {
-      return buscarEnfermedadesExpandidas(searchQuery);
+      return resultados;
     }
-    if (selectedSistema) {
-      const sistema = sistemasCorporales.find(s => s.id === selectedSistema);
-      return sistema?.enfermedades || [];
-    }
-    return [];
-  }, [searchQuery, selectedSistema]);
+    return selectedSistema ? enfermedadesSistema : [];
+  }, [searchQuery, resultados, selectedSistema, enfermedadesSistema]);
 
   const handleEnfermedadPress = useCallback((enfermedad: EnfermedadExpandida) => {
     router.push({
@@ -56,7 +50,7 @@ export default function EnfermedadesScreen() {
 
   // Renderizar item de enfermedad
   const renderEnfermedadItem = useCallback(({ item }: { item: EnfermedadExpandida }) => {
-    const sistema = sistemasCorporales.find(s => s.id === item.sistemaId);
+    const sistema = resumenSistemas.find(s => s.id === item.sistemaId);
     return (
       <Pressable
         onPress={() => handleEnfermedadPress(item)}
@@ -87,7 +81,7 @@ export default function EnfermedadesScreen() {
   }, [handleEnfermedadPress]);
 
   // Renderizar sistema
-  const renderSistemaItem = useCallback(({ item }: { item: SistemaCorporal }) => {
+  const renderSistemaItem = useCallback(({ item }: { item: ResumenSistema }) => {
     const isSelected = selectedSistema === item.id;
     return (
       <Pressable
@@ -105,7 +99,7 @@ export default function EnfermedadesScreen() {
           {item.nombre.replace("Sistema ", "")}
         </ThemedText>
         <View style={[styles.sistemaCount, isSelected && styles.sistemaCountSelected]}>
-          <ThemedText style={styles.sistemaCountText}>{item.enfermedades.length}</ThemedText>
+          <ThemedText style={styles.sistemaCountText}>{item.total}</ThemedText>
         </View>
       </Pressable>
     );
@@ -117,7 +111,7 @@ export default function EnfermedadesScreen() {
       <View style={[styles.header, { paddingTop: insets.top + Spacing.md }]}>
         <ThemedText type="title" style={styles.title}>Enfermedades</ThemedText>
         <ThemedText style={styles.subtitle}>
-          {totalEnfermedades} enfermedades • {sistemasCorporales.length} sistemas
+          {totalEnfermedades} enfermedades • {resumenSistemas.length} sistemas
         </ThemedText>
 
         {/* Barra de búsqueda */}
@@ -146,7 +140,7 @@ export default function EnfermedadesScreen() {
       {/* Sistemas horizontales */}
       <View style={styles.sistemasContainer}>
         <FlatList
-          data={sistemasCorporales}
+          data={resumenSistemas}
           keyExtractor={(item) => item.id}
           renderItem={renderSistemaItem}
           horizontal
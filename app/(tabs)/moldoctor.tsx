@@ -36,8 +36,8 @@ interface ChatMessage {
   content: string;
   timestamp: Date;
   imageUri?: string;
-  plantLinks?: { id: string; nombre: string }[];
-  enfermedadLinks?: { id: string; nombre: string }[];
+  plantLinks?: { id: string; nombre: string; categoriaId?: string }[];
+  enfermedadLinks?: { id: string; nombre: string; sistemaId?: string }[];
   triageLevel?: "green" | "yellow" | "red";
 }
 
@@ -321,17 +321,17 @@ export default function MolDoctorScreen() {
     }
   };
 
-  const navigateToPlanta = (plantaId: string) => {
+  const navigateToPlanta = (plantaId: string, categoriaId?: string) => {
     router.push({
       pathname: "/planta-expandida-detail",
-      params: { id: plantaId },
+      params: categoriaId ? { id: plantaId, categoriaId } : { id: plantaId },
     });
   };
 
-  const navigateToEnfermedad = (enfermedadId: string) => {
+  const navigateToEnfermedad = (enfermedadId: string, sistemaId?: string) => {
     router.push({
       pathname: "/enfermedad-expandida-detail",
-      params: { id: enfermedadId, sistemaId: "general" },
+      params: { id: enfermedadId, sistemaId: sistemaId ?? "general" },
     });
   };
 
@@ -389,7 +389,7 @@ export default function MolDoctorScreen() {
                   {item.plantLinks.map((planta) => (
                     <Pressable
                       key={planta.id}
-                      onPress={() => navigateToPlanta(planta.id)}
+                      onPress={() => navigateToPlanta(planta.id, planta.categoriaId)}
                       style={[styles.linkButton, { backgroundColor: IronManColors.glassBlue, borderColor: IronManColors.borderHoloSubtle }]}
                     >
                       <ThemedText style={[styles.linkText, { color: IronManColors.arcReactorBlue }]}>
@@ -408,7 +408,7 @@ export default function MolDoctorScreen() {
                   {item.enfermedadLinks.map((enfermedad) => (
                     <Pressable
                       key={enfermedad.id}
-                      onPress={() => navigateToEnfermedad(enfermedad.id)}
+                      onPress={() => navigateToEnfermedad(enfermedad.id, enfermedad.sistemaId)}
                       style={[styles.linkButton, { backgroundColor: IronManColors.glassBlue, borderColor: IronManColors.borderHoloSubtle }]}
                     >
                       <ThemedText style={[styles.linkText, { color: IronManColors.jarvisAmber }]}>
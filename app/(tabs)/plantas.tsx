@@ -14,13 +14,9 @@ import { ThemedText } from "../../components/themed-text";
 import { GlassBackground } from "../../components/ui/glass-background";
 import { Colors, Spacing, IronManColors, Fonts, BorderRadius } from "../../constants/theme";
 import { useColorScheme } from "../../hooks/use-color-scheme";
-import { 
-  categoriasPlantas, 
-  buscarPlantasExpandidas, 
-  PlantaExpandida,
-  CategoriaPlanta,
-  totalPlantas
-} from "../../data/plantas-expandidas";
+import type { PlantaExpandida } from "../../data/plantas-expandidas";
+import { resumenCategorias, ResumenCategoria, totalPlantas } from "../../data/chunks/plantas";
+import { useBusquedaPlantas, useCategoriaPlantas } from "../../hooks/use-catalogo";
 
 // Iconos para categorías
 const categoriaIconos: Record<string, string> = {
@@ -73,22 +69,20 @@ export default function PlantasScreen() {
   const [searchQuery, setSearchQuery] = useState("");
   const [selectedCategoria, setSelectedCategoria] = useState<string | null>(null);
 
-  // Plantas filtradas
+  // Plantas filtradas (la categoría y el catálogo de búsqueda se cargan bajo demanda)
+  const { plantas: plantasCategoria } = useCategoriaPlantas(selectedCategoria);
+  const { resultados } = useBusquedaPlantas(searchQuery);
   const displayedPlantas = useMemo(() => {
     if (searchQuery.trim()) {
-      return buscarPlantasExpandidas(searchQuery);
+      return resultados;
     }
-    if (selectedCategoria) {
-      const categoria = categoriasPlantas.find(c => c.id === selectedCategoria);
-      return categoria?.plantas || [];
-    }
-    return [];
-  }, [searchQuery, selectedCategoria]);
+    return selectedCategoria ? plantasCategoria : [];
+  }, [searchQuery, resultados, selectedCategoria, plantasCategoria]);
 
   const handlePlantaPress = useCallback((planta: PlantaExpandida) => {
     router.push({
       pathname: "/planta-expandida-detail",
-      params: { id: planta.id },
+      params: { id: planta.id, categoriaId: planta.categoriaId },
     });
   }, [router]);
 
@@ -134,7 +128,7 @@ export default function PlantasScreen() {
   ), [handlePlantaPress]);
 
   // Renderizar categoría
-  const renderCategoriaItem = useCallback(({ item }: { item: CategoriaPlanta }) => {
+  const renderCategoriaItem = useCallback(({ item }: { item: ResumenCategoria }) => {
     const isSelected = selectedCategoria === item.id;
     return (
       <Pressable
@@ -154,7 +148,7 @@ export default function PlantasScreen() {
           {categoriaNombresCortos[item.id] || item.nombre}
         </ThemedText>
         <View style={[styles.categoriaCount, isSelected && styles.categoriaCountSelected]}>
-          <ThemedText style={styles.categoriaCountText}>{item.plantas.length}</ThemedText>
+          <ThemedText style={styles.categoriaCountText}>{item.total}</ThemedText>
         </View>
       </Pressable>
     );
@@ -166,7 +160,7 @@ export default function PlantasScreen() {
       <View style={[styles.header, { paddingTop: insets.top + Spacing.md }]}>
         <ThemedText type="title" style={styles.title}>Plantas Medicinales</ThemedText>
         <ThemedText style={styles.subtitle}>
-          {totalPlantas} plantas • {categoriasPlantas.length} categorías
+          {totalPlantas} plantas • {resumenCategorias.length} categorías
         </ThemedText>
 
         {/* Barra de búsqueda */}
@@ -195,7 +189,7 @@ export default function PlantasScreen() {
       {/* Categorías horizontales */}
       <View style={styles.categoriasContainer}>
         <FlatList
-          data={categoriasPlantas}
+          data={resumenCategorias}
           keyExtractor={(item) => item.id}
           renderItem={renderCategoriaItem}
           horizontal
@@ -1,6 +1,7 @@
 import { useLocalSearchParams, useRouter } from "expo-router";
 import { useMemo, useCallback } from "react";
 import {
+  ActivityIndicator,
   StyleSheet,
   ScrollView,
   Pressable,
@@ -12,10 +13,8 @@ import { ThemedText } from "../components/themed-text";
 import { ThemedView } from "../components/themed-view";
 import { Colors, Spacing, BorderRadius } from "../constants/theme";
 import { useColorScheme } from "../hooks/use-color-scheme";
-import { 
-  getEnfermedadExpandidaById, 
-  sistemasCorporales,
-} from "../data/enfermedades-expandidas";
+import { useCatalogoCruce } from "../hooks/use-catalogo";
+import { resumenSistemas } from "../data/chunks/enfermedades";
 import { getPlantasParaEnfermedad, getMotivoRecomendacion } from "../data/cruce-datos";
 
 export default function EnfermedadExpandidaDetailScreen() {
@@ -25,22 +24,24 @@ export default function EnfermedadExpandidaDetailScreen() {
   const insets = useSafeAreaInsets();
   const router = useRouter();
 
-  const enfermedad = useMemo(() => getEnfermedadExpandidaById(id || ""), [id]);
+  // El catálogo se carga desde los chunks al abrir la pantalla, no al arrancar la app
+  const { catalogo, loading } = useCatalogoCruce();
+  const enfermedad = useMemo(() => catalogo?.enfermedades.find(e => e.id === id), [catalogo, id]);
   const sistema = useMemo(() => 
-    sistemasCorporales.find(s => s.id === sistemaId), 
+    resumenSistemas.find(s => s.id === sistemaId), 
     [sistemaId]
   );
   
   // Usar el cruce de datos para obtener plantas recomendadas
   const plantasRecomendadas = useMemo(() => {
-    if (!enfermedad) return [];
-    return getPlantasParaEnfermedad(enfermedad);
-  }, [enfermedad]);
+    if (!enfermedad || !catalogo) return [];
+    return getPlantasParaEnfermedad(enfermedad, catalogo);
+  }, [enfermedad, catalogo]);
 
-  const handlePlantaPress = useCallback((plantaId: string) => {
+  const handlePlantaPress = useCallback((plantaId: string, categoriaId: string) => {
     router.push({
       pathname: "/planta-expandida-detail",
-      params: { id: plantaId },
+      params: { id: plantaId, categoriaId },
     });
   }, [router]);
 
@@ -53,8 +54,14 @@ export default function EnfermedadExpandidaDetailScreen() {
           </Pressable>
         </View>
         <View style={styles.errorContainer}>
-          <ThemedText style={styles.errorEmoji}>❌</ThemedText>
-          <ThemedText>Enfermedad no encontrada</ThemedText>
+          {loading ? (
+            <ActivityIndicator color={colors.tint} />
+          ) : (
+            <>
+              <ThemedText style={styles.errorEmoji}>❌</ThemedText>
+              <ThemedText>Enfermedad no encontrada</ThemedText>
+            </>
+          )}
         </View>
       </ThemedView>
     );
@@ -181,12 +188,12 @@ export default function EnfermedadExpandidaDetailScreen() {
             </ThemedText>
 
             {plantasRecomendadas.map((planta) => {
-              const motivo = getMotivoRecomendacion(planta, enfermedad);
+              const motivo = catalogo ? getMotivoRecomendacion(planta, enfermedad, catalogo) : "";
               
               return (
                 <Pressable
                   key={planta.id}
-                  onPress={() => handlePlantaPress(planta.id)}
+                  onPress={() => handlePlantaPress(planta.id, planta.categoriaId)}
                   style={({ pressed }) => [
                     styles.plantaCard,
                     {
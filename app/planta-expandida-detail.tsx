@@ -1,6 +1,7 @@
 import { useLocalSearchParams, useRouter } from "expo-router";
 import { useMemo, useCallback, useState } from "react";
 import {
+  ActivityIndicator,
   StyleSheet,
   ScrollView,
   Pressable,
@@ -12,9 +13,9 @@ import { ThemedText } from "../components/themed-text";
 import { ThemedView } from "../components/themed-view";
 import { Colors, Spacing, BorderRadius } from "../constants/theme";
 import { useColorScheme } from "../hooks/use-color-scheme";
-import { getPlantaExpandidaById } from "../data/plantas-expandidas";
+import { useCatalogoCruce } from "../hooks/use-catalogo";
 import { getEnfermedadesParaPlanta } from "../data/cruce-datos";
-import { sistemasCorporales } from "../data/enfermedades-expandidas";
+import { resumenSistemas } from "../data/chunks/enfermedades";
 
 // Iconos para contraindicaciones
 const contraindicacionIconos: Record<string, string> = {
@@ -40,20 +41,27 @@ const contraindicacionLabels: Record<string, string> = {
 };
 
 export default function PlantaExpandidaDetailScreen() {
-  const { id } = useLocalSearchParams<{ id: string }>();
+  const { id, categoriaId } = useLocalSearchParams<{ id: string; categoriaId?: string }>();
   const colorScheme = useColorScheme();
   const colors = Colors[colorScheme ?? "light"];
   const insets = useSafeAreaInsets();
   const router = useRouter();
 
-  const planta = useMemo(() => getPlantaExpandidaById(id || ""), [id]);
+  // El catálogo se carga desde los chunks al abrir la pantalla, no al arrancar la app
+  const { catalogo, loading } = useCatalogoCruce();
+  // Una planta puede estar en varias categorías: con categoriaId se abre la de ese bloque
+  const planta = useMemo(() => {
+    const plantas = catalogo?.plantas ?? [];
+    return (categoriaId && plantas.find(p => p.id === id && p.categoriaId === categoriaId))
+      || plantas.find(p => p.id === id);
+  }, [catalogo, id, categoriaId]);
   const [showNombresAlternativos, setShowNombresAlternativos] = useState(false);
   
   // Usar el cruce de datos para obtener enfermedades relacionadas
   const enfermedadesRelacionadas = useMemo(() => {
-    if (!planta) return [];
-    return getEnfermedadesParaPlanta(planta);
-  }, [planta]);
+    if (!planta || !catalogo) return [];
+    return getEnfermedadesParaPlanta(planta, catalogo);
+  }, [planta, catalogo]);
 
   const handleEnfermedadPress = useCallback((enfermedadId: string, sistemaId: string) => {
     router.push({
@@ -71,8 +79,14 @@ export default function PlantaExpandidaDetailScreen() {
           </Pressable>
         </View>
         <View style={styles.errorContainer}>
-          <ThemedText style={styles.errorEmoji}>❌</ThemedText>
-          <ThemedText>Planta no encontrada</ThemedText>
+          {loading ? (
+            <ActivityIndicator color={colors.tint} />
+          ) : (
+            <>
+              <ThemedText style={styles.errorEmoji}>❌</ThemedText>
+              <ThemedText>Planta no encontrada</ThemedText>
+            </>
+          )}
         </View>
       </ThemedView>
     );
@@ -287,7 +301,7 @@ export default function PlantaExpandidaDetailScreen() {
             </ThemedText>
             <View style={styles.sistemasContainer}>
               {planta.sistemasRelacionados.map((sistemaId, index) => {
-                const sistema = sistemasCorporales.find(s => s.id === sistemaId);
+                const sistema = resumenSistemas.find(s => s.id === sistemaId);
                 if (!sistema) return null;
                 return (
                   <View 
@@ -316,7 +330,7 @@ export default function PlantaExpandidaDetailScreen() {
             </ThemedText>
 
             {enfermedadesRelacionadas.map((enfermedad) => {
-              const sistema = sistemasCorporales.find(s => s.id === enfermedad.sistemaId);
+              const sistema = resumenSistemas.find(s => s.id === enfermedad.sistemaId);
               
               return (
                 <Pressable
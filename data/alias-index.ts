@@ -0,0 +1,5483 @@
+// Pócima Salvage - Índice de alias de plantas y enfermedades
+// Generado automáticamente por scripts/build-alias-index.py - no editar a mano
+
+export interface IndiceAlias {
+  // posición -> [id, categoría o sistema donde aparece primero]
+  entidades: [string, string][];
+  // forma normalizada (ver normalizarAlias en data/alias.ts) -> posición en entidades
+  formas: Record<string, number>;
+  // formas que comparten varias entidades con la misma prioridad: no se resuelven
+  ambiguas: string[];
+}
+
+export const aliasPlantas: IndiceAlias = {
+  entidades: [
+    ["albahaca","hierbas-aromaticas-culinarias"],
+    ["romero","hierbas-aromaticas-culinarias"],
+    ["tomillo","hierbas-aromaticas-culinarias"],
+    ["oregano","hierbas-aromaticas-culinarias"],
+    ["menta","hierbas-aromaticas-culinarias"],
+    ["hierbabuena","hierbas-aromaticas-culinarias"],
+    ["cilantro","hierbas-aromaticas-culinarias"],
+    ["perejil","hierbas-aromaticas-culinarias"],
+    ["eneldo","hierbas-aromaticas-culinarias"],
+    ["laurel","hierbas-aromaticas-culinarias"],
+    ["salvia","hierbas-aromaticas-culinarias"],
+    ["mejorana","hierbas-aromaticas-culinarias"],
+    ["estragon","hierbas-aromaticas-culinarias"],
+    ["cebollino","hierbas-aromaticas-culinarias"],
+    ["hinojo","hierbas-aromaticas-culinarias"],
+    ["comino","hierbas-aromaticas-culinarias"],
+    ["anis","hierbas-aromaticas-culinarias"],
+    ["curcuma","hierbas-aromaticas-culinarias"],
+    ["jengibre","hierbas-aromaticas-culinarias"],
+    ["canela","hierbas-aromaticas-culinarias"],
+    ["clavo-de-olor","hierbas-aromaticas-culinarias"],
+    ["cardamomo","hierbas-aromaticas-culinarias"],
+    ["azafran","hierbas-aromaticas-culinarias"],
+    ["lavanda","hierbas-aromaticas-culinarias"],
+    ["melisa","hierbas-aromaticas-culinarias"],
+    ["perifollo","hierbas-aromaticas-culinarias"],
+    ["angelica","hierbas-aromaticas-culinarias"],
+    ["ajedrea","hierbas-aromaticas-culinarias"],
+    ["hisopo","hierbas-aromaticas-culinarias"],
+    ["tanaceto","hierbas-aromaticas-culinarias"],
+    ["levistico","hierbas-aromaticas-culinarias"],
+    ["comino-negro","hierbas-aromaticas-culinarias"],
+    ["fenogreco","hierbas-aromaticas-culinarias"],
+    ["mostaza-negra","hierbas-aromaticas-culinarias"],
+    ["cilantro-vietnamita","hierbas-aromaticas-culinarias"],
+    ["epazote","hierbas-aromaticas-culinarias"],
+    ["pimpinela-mayor","hierbas-aromaticas-culinarias"],
+    ["agrimonia","hierbas-aromaticas-culinarias"],
+    ["galanga","hierbas-aromaticas-culinarias"],
+    ["lemongrass","hierbas-aromaticas-culinarias"],
+    ["ruibarbo","hierbas-aromaticas-culinarias"],
+    ["stevia","hierbas-aromaticas-culinarias"],
+    ["wasabi","hierbas-aromaticas-culinarias"],
+    ["bergamota","hierbas-aromaticas-culinarias"],
+    ["calendula","hierbas-aromaticas-culinarias"],
+    ["capuchina","hierbas-aromaticas-culinarias"],
+    ["borraja","hierbas-aromaticas-culinarias"],
+    ["verbena-olorosa","hierbas-aromaticas-culinarias"],
+    ["gordolobo","hierbas-aromaticas-culinarias"],
+    ["malva","hierbas-aromaticas-culinarias"],
+    ["aciano","hierbas-aromaticas-culinarias"],
+    ["ulmaria","hierbas-aromaticas-culinarias"],
+    ["milenrama","hierbas-aromaticas-culinarias"],
+    ["artemisa","hierbas-aromaticas-culinarias"],
+    ["ajenjo","hierbas-aromaticas-culinarias"],
+    ["lupulo","hierbas-aromaticas-culinarias"],
+    ["valeriana","hierbas-aromaticas-culinarias"],
+    ["ruda","hierbas-aromaticas-culinarias"],
+    ["ajedrea-de-jardin","hierbas-aromaticas-culinarias"],
+    ["perilla","hierbas-aromaticas-culinarias"],
+    ["manzanilla","hierbas-silvestres-medicinales"],
+    ["aloe-vera","hierbas-silvestres-medicinales"],
+    ["ajo","hierbas-silvestres-medicinales"],
+    ["eucalipto","hierbas-silvestres-medicinales"],
+    ["cola-de-caballo","hierbas-silvestres-medicinales"],
+    ["hiperico","hierbas-silvestres-medicinales"],
+    ["tila","hierbas-silvestres-medicinales"],
+    ["diente-de-leon","hierbas-silvestres-medicinales"],
+    ["ginkgo-biloba","hierbas-silvestres-medicinales"],
+    ["mate","hierbas-silvestres-medicinales"],
+    ["pasiflora","hierbas-silvestres-medicinales"],
+    ["corteza-de-sauce","hierbas-silvestres-medicinales"],
+    ["agave","hierbas-silvestres-medicinales"],
+    ["arandano","hierbas-silvestres-medicinales"],
+    ["acebo","hierbas-silvestres-medicinales"],
+    ["flor-de-sauco","hierbas-silvestres-medicinales"],
+    ["yuca","hierbas-silvestres-medicinales"],
+    ["ginseng","hierbas-silvestres-medicinales"],
+    ["poleo-menta","hierbas-silvestres-medicinales"],
+    ["ortiga","hierbas-silvestres-medicinales"],
+    ["dedalera","hierbas-silvestres-medicinales"],
+    ["sandalo","hierbas-silvestres-medicinales"],
+    ["amapola","hierbas-silvestres-medicinales"],
+    ["apio","hierbas-silvestres-medicinales"],
+    ["kava","hierbas-silvestres-medicinales"],
+    ["escaramujo","hierbas-silvestres-medicinales"],
+    ["bejuco-de-agua","hierbas-silvestres-medicinales"],
+    ["olmo","hierbas-silvestres-medicinales"],
+    ["limoncillo","hierbas-silvestres-medicinales"],
+    ["ricino","hierbas-silvestres-medicinales"],
+    ["konjac","hierbas-silvestres-medicinales"],
+    ["lechuga-silvestre","hierbas-silvestres-medicinales"],
+    ["helecho-gu-sui-bu","hierbas-silvestres-medicinales"],
+    ["junco-de-esteras","hierbas-silvestres-medicinales"],
+    ["apong-apong","hierbas-silvestres-medicinales"],
+    ["khat","hierbas-silvestres-medicinales"],
+    ["kaempferia-rotunda","hierbas-silvestres-medicinales"],
+    ["hierba-de-san-simon","hierbas-silvestres-medicinales"],
+    ["kadsura-longipedunculata","hierbas-silvestres-medicinales"],
+    ["guaco","hierbas-silvestres-medicinales"],
+    ["copaiba","hierbas-silvestres-medicinales"],
+    ["moringa","hierbas-silvestres-medicinales"],
+    ["centella-asiatica","hierbas-silvestres-medicinales"],
+    ["grosellero-de-la-india","hierbas-silvestres-medicinales"],
+    ["bardana","hierbas-silvestres-medicinales"],
+    ["anis-verde","hierbas-silvestres-medicinales"],
+    ["boldo","hierbas-silvestres-medicinales"],
+    ["sauce","arboles-medicinales"],
+    ["tilo","arboles-medicinales"],
+    ["olivo","arboles-medicinales"],
+    ["neem","arboles-medicinales"],
+    ["castano-de-indias","arboles-medicinales"],
+    ["fresno","arboles-medicinales"],
+    ["abedul","arboles-medicinales"],
+    ["cipres","arboles-medicinales"],
+    ["pino","arboles-medicinales"],
+    ["cedro","arboles-medicinales"],
+    ["arce","arboles-medicinales"],
+    ["roble","arboles-medicinales"],
+    ["haya","arboles-medicinales"],
+    ["nogal","arboles-medicinales"],
+    ["tejo","arboles-medicinales"],
+    ["espino-blanco","arboles-medicinales"],
+    ["avellano","arboles-medicinales"],
+    ["alcornoque","arboles-medicinales"],
+    ["encina","arboles-medicinales"],
+    ["serbal","arboles-medicinales"],
+    ["magnolia","arboles-medicinales"],
+    ["arbol-del-te","arboles-medicinales"],
+    ["canelo","arboles-medicinales"],
+    ["quina","arboles-medicinales"],
+    ["sangre-de-drago","arboles-medicinales"],
+    ["araucaria","arboles-medicinales"],
+    ["alerce","arboles-medicinales"],
+    ["abeto","arboles-medicinales"],
+    ["acacia","arboles-medicinales"],
+    ["algarrobo","arboles-medicinales"],
+    ["almendro","arboles-medicinales"],
+    ["caoba","arboles-medicinales"],
+    ["ceiba","arboles-medicinales"],
+    ["chopo","arboles-medicinales"],
+    ["granado","arboles-medicinales"],
+    ["guayabo","arboles-medicinales"],
+    ["higuera","arboles-medicinales"],
+    ["jaboncillo","arboles-medicinales"],
+    ["limonero","arboles-medicinales"],
+    ["madrono","arboles-medicinales"],
+    ["moral","arboles-medicinales"],
+    ["naranjo-amargo","arboles-medicinales"],
+    ["peral","arboles-medicinales"],
+    ["hamamelis","arbustos-medicinales"],
+    ["sauzgatillo","arbustos-medicinales"],
+    ["gayuba","arbustos-medicinales"],
+    ["arandano-rojo","arbustos-medicinales"],
+    ["grosellero-negro","arbustos-medicinales"],
+    ["enebro","arbustos-medicinales"],
+    ["zarzaparrilla","arbustos-medicinales"],
+    ["rusco","arbustos-medicinales"],
+    ["mirto","arbustos-medicinales"],
+    ["jara-pringosa","arbustos-medicinales"],
+    ["brezo","arbustos-medicinales"],
+    ["sauco","arbustos-medicinales"],
+    ["boj","arbustos-medicinales"],
+    ["aligustre","arbustos-medicinales"],
+    ["bonetero","arbustos-medicinales"],
+    ["cornejo-sanguineo","arbustos-medicinales"],
+    ["durillo","arbustos-medicinales"],
+    ["espino-cerval-de-mar","arbustos-medicinales"],
+    ["forsitia","arbustos-medicinales"],
+    ["mahonia","arbustos-medicinales"],
+    ["pirlitero","arbustos-medicinales"],
+    ["retama-negra","arbustos-medicinales"],
+    ["rosa-canina","arbustos-medicinales"],
+    ["salvia-real","arbustos-medicinales"],
+    ["te-de-aragon","arbustos-medicinales"],
+    ["tomillo-salsero","arbustos-medicinales"],
+    ["torvisco","arbustos-medicinales"],
+    ["viburno","arbustos-medicinales"],
+    ["agnocasto","arbustos-medicinales"],
+    ["aladierno","arbustos-medicinales"],
+    ["arayan","arbustos-medicinales"],
+    ["berberis","arbustos-medicinales"],
+    ["ceanoto","arbustos-medicinales"],
+    ["chicalote","arbustos-medicinales"],
+    ["damiana","arbustos-medicinales"],
+    ["equiseto-menor","arbustos-medicinales"],
+    ["gobernadora","arbustos-medicinales"],
+    ["guayule","arbustos-medicinales"],
+    ["hierba-del-pollo","arbustos-medicinales"],
+    ["hoja-santa","arbustos-medicinales"],
+    ["izote","arbustos-medicinales"],
+    ["jojoba","arbustos-medicinales"],
+    ["lentisco","arbustos-medicinales"],
+    ["membrillero","arbustos-medicinales"],
+    ["noni","plantas-tropicales-medicinales"],
+    ["una-de-gato","plantas-tropicales-medicinales"],
+    ["acai","plantas-tropicales-medicinales"],
+    ["guarana","plantas-tropicales-medicinales"],
+    ["yerba-mate","plantas-tropicales-medicinales"],
+    ["cacao","plantas-tropicales-medicinales"],
+    ["astragalo","raices-y-tuberculos-medicinales"],
+    ["regaliz","raices-y-tuberculos-medicinales"],
+    ["equinacea","raices-y-tuberculos-medicinales"],
+    ["diente-de-leon-raiz","raices-y-tuberculos-medicinales"],
+    ["maca","raices-y-tuberculos-medicinales"],
+    ["ashwagandha","raices-y-tuberculos-medicinales"],
+    ["sello-de-oro","raices-y-tuberculos-medicinales"],
+    ["malvavisco","raices-y-tuberculos-medicinales"],
+    ["osha","raices-y-tuberculos-medicinales"],
+    ["calamo-aromatico","raices-y-tuberculos-medicinales"],
+    ["genciana","raices-y-tuberculos-medicinales"],
+    ["rabano-picante","raices-y-tuberculos-medicinales"],
+    ["batata","raices-y-tuberculos-medicinales"],
+    ["remolacha","raices-y-tuberculos-medicinales"],
+    ["zanahoria","raices-y-tuberculos-medicinales"],
+    ["nabo","raices-y-tuberculos-medicinales"],
+    ["chirivia","raices-y-tuberculos-medicinales"],
+    ["apionabo","raices-y-tuberculos-medicinales"],
+    ["rabano","raices-y-tuberculos-medicinales"],
+    ["colirrabano","raices-y-tuberculos-medicinales"],
+    ["tupinambo","raices-y-tuberculos-medicinales"],
+    ["arracacha","raices-y-tuberculos-medicinales"],
+    ["ulluco","raices-y-tuberculos-medicinales"],
+    ["oca","raices-y-tuberculos-medicinales"],
+    ["mashua","raices-y-tuberculos-medicinales"],
+    ["taro","raices-y-tuberculos-medicinales"],
+    ["atractylodes","raices-y-tuberculos-medicinales"],
+    ["codonopsis","raices-y-tuberculos-medicinales"],
+    ["rehmannia","raices-y-tuberculos-medicinales"],
+    ["peonia-blanca","raices-y-tuberculos-medicinales"],
+    ["sarsaparrilla","raices-y-tuberculos-medicinales"],
+    ["mandioca","raices-y-tuberculos-medicinales"],
+    ["crosne","raices-y-tuberculos-medicinales"],
+    ["eleuterococo","raices-y-tuberculos-medicinales"],
+    ["cimicifuga","raices-y-tuberculos-medicinales"],
+    ["polygala","raices-y-tuberculos-medicinales"],
+    ["rosa","flores-medicinales"],
+    ["jazmin","flores-medicinales"],
+    ["hibisco","flores-medicinales"],
+    ["tilo-flor","flores-medicinales"],
+    ["azahar","flores-medicinales"],
+    ["violeta","flores-medicinales"],
+    ["arnica","flores-medicinales"],
+    ["girasol","flores-medicinales"],
+    ["clavel","flores-medicinales"],
+    ["crisantemo","flores-medicinales"],
+    ["margarita","flores-medicinales"],
+    ["loto","flores-medicinales"],
+    ["pensamiento","flores-medicinales"],
+    ["primavera","flores-medicinales"],
+    ["zinnia","flores-medicinales"],
+    ["dalia","flores-medicinales"],
+    ["geranio","flores-medicinales"],
+    ["peonia","flores-medicinales"],
+    ["verbena","flores-medicinales"],
+    ["yarrow","flores-medicinales"],
+    ["clitoria","flores-medicinales"],
+    ["meliloto","flores-medicinales"],
+    ["jazmin-amarillo","flores-medicinales"],
+    ["lirio-de-los-valles","flores-medicinales"],
+    ["digital","flores-medicinales"],
+    ["onagra","flores-medicinales"],
+    ["cempasuchil","flores-medicinales"],
+    ["centaurea-menor","flores-medicinales"],
+    ["reishi","hongos-medicinales"],
+    ["shiitake","hongos-medicinales"],
+    ["maitake","hongos-medicinales"],
+    ["cordyceps","hongos-medicinales"],
+    ["melena-de-leon","hongos-medicinales"],
+    ["chaga","hongos-medicinales"],
+    ["cola-de-pavo","hongos-medicinales"],
+    ["agarikon","hongos-medicinales"],
+    ["tremella","hongos-medicinales"],
+    ["poria-cocos","hongos-medicinales"],
+    ["agaricus-blazei","hongos-medicinales"],
+    ["enoki","hongos-medicinales"],
+    ["hongo-ostra","hongos-medicinales"],
+    ["polyporus-umbellatus","hongos-medicinales"],
+    ["schizophyllum-commune","hongos-medicinales"],
+    ["auricularia-auricula","hongos-medicinales"],
+    ["coprinus-comatus","hongos-medicinales"],
+    ["fomes-fomentarius","hongos-medicinales"],
+    ["ganoderma-applanatum","hongos-medicinales"],
+    ["phellinus-linteus","hongos-medicinales"],
+    ["pleurotus-eryngii","hongos-medicinales"],
+    ["sparassis-crispa","hongos-medicinales"],
+    ["laetiporus-sulphureus","hongos-medicinales"],
+    ["suillus-luteus","hongos-medicinales"],
+    ["cantharellus-cibarius","hongos-medicinales"],
+    ["craterellus-cornucopioides","hongos-medicinales"],
+    ["morchella-esculenta","hongos-medicinales"],
+    ["tuber-melanosporum","hongos-medicinales"],
+    ["boletus-edulis","hongos-medicinales"],
+    ["ganoderma-lingzhi","hongos-medicinales"],
+    ["amanita-caesarea","hongos-medicinales"],
+    ["espirulina","algas-y-plantas-acuaticas-medicinales"],
+    ["chlorella","algas-y-plantas-acuaticas-medicinales"],
+    ["kelp","algas-y-plantas-acuaticas-medicinales"],
+    ["wakame","algas-y-plantas-acuaticas-medicinales"],
+    ["nori","algas-y-plantas-acuaticas-medicinales"],
+    ["dulse","algas-y-plantas-acuaticas-medicinales"],
+    ["fucus","algas-y-plantas-acuaticas-medicinales"],
+    ["agar-agar","algas-y-plantas-acuaticas-medicinales"],
+    ["musgo-de-irlanda","algas-y-plantas-acuaticas-medicinales"],
+    ["kombu","algas-y-plantas-acuaticas-medicinales"],
+    ["arame","algas-y-plantas-acuaticas-medicinales"],
+    ["hijiki","algas-y-plantas-acuaticas-medicinales"],
+    ["lechuga-de-mar","algas-y-plantas-acuaticas-medicinales"],
+    ["esparrago-de-mar","algas-y-plantas-acuaticas-medicinales"],
+    ["lenteja-de-agua","algas-y-plantas-acuaticas-medicinales"],
+    ["jacinto-de-agua","algas-y-plantas-acuaticas-medicinales"],
+    ["nenufar-blanco","algas-y-plantas-acuaticas-medicinales"],
+    ["berro-de-agua","algas-y-plantas-acuaticas-medicinales"],
+    ["menta-acuatica","algas-y-plantas-acuaticas-medicinales"],
+    ["lirio-amarillo","algas-y-plantas-acuaticas-medicinales"],
+    ["cola-de-caballo-de-agua","algas-y-plantas-acuaticas-medicinales"],
+    ["castana-de-agua","algas-y-plantas-acuaticas-medicinales"],
+    ["aponogeton","algas-y-plantas-acuaticas-medicinales"],
+    ["elodea","algas-y-plantas-acuaticas-medicinales"],
+    ["azolla","algas-y-plantas-acuaticas-medicinales"],
+    ["limón","frutas-citricas-medicinales"],
+    ["naranja","frutas-citricas-medicinales"],
+    ["toronja","frutas-citricas-medicinales"],
+    ["mandarina","frutas-citricas-medicinales"],
+    ["lima","frutas-citricas-medicinales"],
+    ["pomelo","frutas-citricas-medicinales"],
+    ["kumquat","frutas-citricas-medicinales"],
+    ["cidra","frutas-citricas-medicinales"],
+    ["yuzu","frutas-citricas-medicinales"],
+    ["calamondin","frutas-citricas-medicinales"],
+    ["tangelo","frutas-citricas-medicinales"],
+    ["ugli","frutas-citricas-medicinales"],
+    ["sweetie","frutas-citricas-medicinales"],
+    ["oroblanco","frutas-citricas-medicinales"],
+    ["melogold","frutas-citricas-medicinales"],
+    ["kaffir-lime","frutas-citricas-medicinales"],
+    ["finger-lime","frutas-citricas-medicinales"],
+    ["sudachi","frutas-citricas-medicinales"],
+    ["kabosu","frutas-citricas-medicinales"],
+    ["rangpur","frutas-citricas-medicinales"],
+    ["limequat","frutas-citricas-medicinales"],
+    ["citrange","frutas-citricas-medicinales"],
+    ["citrumelo","frutas-citricas-medicinales"],
+    ["faustrime","frutas-citricas-medicinales"],
+    ["caimito","frutas-tropicales-medicinales"],
+    ["papaya","frutas-tropicales-medicinales"],
+    ["pina","frutas-tropicales-medicinales"],
+    ["mango","frutas-tropicales-medicinales"],
+    ["guayaba","frutas-tropicales-medicinales"],
+    ["maracuya","frutas-tropicales-medicinales"],
+    ["carambola","frutas-tropicales-medicinales"],
+    ["pitahaya","frutas-tropicales-medicinales"],
+    ["lichi","frutas-tropicales-medicinales"],
+    ["rambutan","frutas-tropicales-medicinales"],
+    ["durian","frutas-tropicales-medicinales"],
+    ["tamarindo","frutas-tropicales-medicinales"],
+    ["coco","frutas-tropicales-medicinales"],
+    ["guanabana","frutas-tropicales-medicinales"],
+    ["kiwi","frutas-tropicales-medicinales"],
+    ["granada","frutas-tropicales-medicinales"],
+    ["higo","frutas-tropicales-medicinales"],
+    ["chirimoya","frutas-tropicales-medicinales"],
+    ["lucuma","frutas-tropicales-medicinales"],
+    ["zapote","frutas-tropicales-medicinales"],
+    ["mamey","frutas-tropicales-medicinales"],
+    ["araza","frutas-tropicales-medicinales"],
+    ["borojo","frutas-tropicales-medicinales"],
+    ["camu-camu","frutas-tropicales-medicinales"],
+    ["copoazu","frutas-tropicales-medicinales"],
+    ["feijoa","frutas-tropicales-medicinales"],
+    ["jabuticaba","frutas-tropicales-medicinales"],
+    ["macambo","frutas-tropicales-medicinales"],
+    ["pomarrosa","frutas-tropicales-medicinales"],
+    ["tomatillo","frutas-tropicales-medicinales"],
+    ["tamarillo","frutas-tropicales-medicinales"],
+    ["lima-kaffir","frutas-tropicales-medicinales"],
+    ["anon","frutas-tropicales-medicinales"],
+    ["yaca","frutas-tropicales-medicinales"],
+    ["banana-roja","frutas-tropicales-medicinales"],
+    ["frutipan","frutas-tropicales-medicinales"],
+    ["fruta-hala","frutas-tropicales-medicinales"],
+    ["acerola","frutas-tropicales-medicinales"],
+    ["manzana","frutas-clima-templado-medicinales"],
+    ["pera","frutas-clima-templado-medicinales"],
+    ["durazno","frutas-clima-templado-medicinales"],
+    ["ciruela","frutas-clima-templado-medicinales"],
+    ["cereza","frutas-clima-templado-medicinales"],
+    ["albaricoque","frutas-clima-templado-medicinales"],
+    ["membrillo","frutas-clima-templado-medicinales"],
+    ["uva","frutas-clima-templado-medicinales"],
+    ["frambuesa","frutas-clima-templado-medicinales"],
+    ["fresa","frutas-clima-templado-medicinales"],
+    ["mora","frutas-clima-templado-medicinales"],
+    ["grosella","frutas-clima-templado-medicinales"],
+    ["zarzamora","frutas-clima-templado-medicinales"],
+    ["nectarina","frutas-clima-templado-medicinales"],
+    ["paraguayo","frutas-clima-templado-medicinales"],
+    ["nispero","frutas-clima-templado-medicinales"],
+    ["caqui","frutas-clima-templado-medicinales"],
+    ["avellana","frutas-clima-templado-medicinales"],
+    ["azarolo","frutas-clima-templado-medicinales"],
+    ["endrina","frutas-clima-templado-medicinales"],
+    ["grosella-espinosa","frutas-clima-templado-medicinales"],
+    ["grosella-negra","frutas-clima-templado-medicinales"],
+    ["grosella-roja","frutas-clima-templado-medicinales"],
+    ["nashi","frutas-clima-templado-medicinales"],
+    ["uva-espina","frutas-clima-templado-medicinales"],
+    ["serba","frutas-clima-templado-medicinales"],
+    ["endrino","bayas-y-frutos-del-bosque-medicinales"],
+    ["cornejo","bayas-y-frutos-del-bosque-medicinales"],
+    ["espino-amarillo","bayas-y-frutos-del-bosque-medicinales"],
+    ["baya-de-goji","bayas-y-frutos-del-bosque-medicinales"],
+    ["baya-de-acai","bayas-y-frutos-del-bosque-medicinales"],
+    ["uva-ursi","bayas-y-frutos-del-bosque-medicinales"],
+    ["baya-de-maqui","bayas-y-frutos-del-bosque-medicinales"],
+    ["baya-del-espino","bayas-y-frutos-del-bosque-medicinales"],
+    ["serbal-de-cazadores","bayas-y-frutos-del-bosque-medicinales"],
+    ["casis","bayas-y-frutos-del-bosque-medicinales"],
+    ["uva-de-california","bayas-y-frutos-del-bosque-medicinales"],
+    ["baya-de-agracejo","bayas-y-frutos-del-bosque-medicinales"],
+    ["murtilla","bayas-y-frutos-del-bosque-medicinales"],
+    ["calafate","bayas-y-frutos-del-bosque-medicinales"],
+    ["boysenberry","bayas-y-frutos-del-bosque-medicinales"],
+    ["loganberry","bayas-y-frutos-del-bosque-medicinales"],
+    ["tayberry","bayas-y-frutos-del-bosque-medicinales"],
+    ["lingonberry","bayas-y-frutos-del-bosque-medicinales"],
+    ["huckleberry","bayas-y-frutos-del-bosque-medicinales"],
+    ["linaza","semillas-y-frutos-secos-medicinales"],
+    ["chia","semillas-y-frutos-secos-medicinales"],
+    ["canamo","semillas-y-frutos-secos-medicinales"],
+    ["calabaza-semillas","semillas-y-frutos-secos-medicinales"],
+    ["girasol-semillas","semillas-y-frutos-secos-medicinales"],
+    ["sesamo","semillas-y-frutos-secos-medicinales"],
+    ["almendra","semillas-y-frutos-secos-medicinales"],
+    ["nuez","semillas-y-frutos-secos-medicinales"],
+    ["castana","semillas-y-frutos-secos-medicinales"],
+    ["pistacho","semillas-y-frutos-secos-medicinales"],
+    ["nuez-de-brasil","semillas-y-frutos-secos-medicinales"],
+    ["nuez-pecana","semillas-y-frutos-secos-medicinales"],
+    ["anacardo","semillas-y-frutos-secos-medicinales"],
+    ["pinon","semillas-y-frutos-secos-medicinales"],
+    ["nuez-de-macadamia","semillas-y-frutos-secos-medicinales"],
+    ["semillas-de-amapola","semillas-y-frutos-secos-medicinales"],
+    ["semillas-de-mostaza","semillas-y-frutos-secos-medicinales"],
+    ["semillas-de-apio","semillas-y-frutos-secos-medicinales"],
+    ["semillas-de-hinojo","semillas-y-frutos-secos-medicinales"],
+    ["semillas-de-comino","semillas-y-frutos-secos-medicinales"],
+    ["semillas-de-cardamomo","semillas-y-frutos-secos-medicinales"],
+    ["semillas-de-cilantro","semillas-y-frutos-secos-medicinales"],
+    ["semillas-de-anis","semillas-y-frutos-secos-medicinales"],
+    ["semillas-de-alcaravea","semillas-y-frutos-secos-medicinales"],
+    ["semillas-de-eneldo","semillas-y-frutos-secos-medicinales"],
+    ["semillas-de-fenogreco","semillas-y-frutos-secos-medicinales"],
+    ["cacahuete","semillas-y-frutos-secos-medicinales"],
+    ["semillas-de-uva","semillas-y-frutos-secos-medicinales"],
+    ["semillas-de-granada","semillas-y-frutos-secos-medicinales"],
+    ["semillas-de-sandia","semillas-y-frutos-secos-medicinales"],
+    ["semillas-de-melon","semillas-y-frutos-secos-medicinales"],
+    ["semillas-de-loto","semillas-y-frutos-secos-medicinales"],
+    ["semillas-de-nigella","semillas-y-frutos-secos-medicinales"],
+    ["castana-de-indias","semillas-y-frutos-secos-medicinales"],
+    ["semillas-de-psyllium","semillas-y-frutos-secos-medicinales"],
+    ["semillas-de-cacao","semillas-y-frutos-secos-medicinales"],
+    ["semillas-de-cafe","semillas-y-frutos-secos-medicinales"],
+    ["semillas-de-guarana","semillas-y-frutos-secos-medicinales"],
+    ["nuez-de-cola","semillas-y-frutos-secos-medicinales"],
+    ["clavo","especias-medicinales"],
+    ["pimienta-negra","especias-medicinales"],
+    ["nuez-moscada","especias-medicinales"],
+    ["mostaza","especias-medicinales"],
+    ["pimenton","especias-medicinales"],
+    ["vainilla","especias-medicinales"],
+    ["anís-estrellado","especias-medicinales"],
+    ["cayena","especias-medicinales"],
+    ["macis","especias-medicinales"],
+    ["azafran-de-la-india","especias-medicinales"],
+    ["pimienta-de-jamaica","especias-medicinales"],
+    ["sumac","especias-medicinales"],
+    ["asafoetida","especias-medicinales"],
+    ["pimienta-de-sichuan","especias-medicinales"],
+    ["ajwain","especias-medicinales"],
+    ["polvo-de-mango-seco","especias-medicinales"],
+    ["haba-tonka","especias-medicinales"],
+    ["pimienta-larga","especias-medicinales"],
+    ["cubeba","especias-medicinales"],
+    ["nopal","plantas-suculentas-y-cactus-medicinales"],
+    ["pitaya","plantas-suculentas-y-cactus-medicinales"],
+    ["siempreviva","plantas-suculentas-y-cactus-medicinales"],
+    ["kalanchoe","plantas-suculentas-y-cactus-medicinales"],
+    ["peyote","plantas-suculentas-y-cactus-medicinales"],
+    ["sabila","plantas-suculentas-y-cactus-medicinales"],
+    ["organo","plantas-suculentas-y-cactus-medicinales"],
+    ["chumbera","plantas-suculentas-y-cactus-medicinales"],
+    ["echeveria","plantas-suculentas-y-cactus-medicinales"],
+    ["sedum","plantas-suculentas-y-cactus-medicinales"],
+    ["yucca","plantas-suculentas-y-cactus-medicinales"],
+    ["san-pedro","plantas-suculentas-y-cactus-medicinales"],
+    ["fenestraria","plantas-suculentas-y-cactus-medicinales"],
+    ["lithops","plantas-suculentas-y-cactus-medicinales"],
+    ["gasteria","plantas-suculentas-y-cactus-medicinales"],
+    ["haworthia","plantas-suculentas-y-cactus-medicinales"],
+    ["crassula","plantas-suculentas-y-cactus-medicinales"],
+    ["senecio","plantas-suculentas-y-cactus-medicinales"],
+    ["euphorbia","plantas-suculentas-y-cactus-medicinales"],
+    ["stapelia","plantas-suculentas-y-cactus-medicinales"],
+    ["hoodia","plantas-suculentas-y-cactus-medicinales"],
+    ["caralluma","plantas-suculentas-y-cactus-medicinales"],
+    ["opuntia-streptacantha","plantas-suculentas-y-cactus-medicinales"],
+    ["rhodiola","plantas-adaptogenas"],
+    ["schisandra","plantas-adaptogenas"],
+    ["albahaca-sagrada","plantas-adaptogenas"],
+    ["bacopa","plantas-adaptogenas"],
+    ["gotu-kola","plantas-adaptogenas"],
+    ["amla","plantas-adaptogenas"],
+    ["madreselva","plantas-adaptogenas"],
+    ["bala","plantas-adaptogenas"],
+    ["brahmi","plantas-adaptogenas"],
+    ["guduchi","plantas-adaptogenas"],
+    ["ginseng-americano","plantas-adaptogenas"],
+    ["shatavari","plantas-adaptogenas"],
+    ["tribulus","plantas-adaptogenas"],
+  ],
+  formas: {
+    "aamchur": 481,
+    "aaronsrod": 508,
+    "ababol": 82,
+    "abatakola": 465,
+    "abedul": 113,
+    "abedulcomun": 113,
+    "abeduleuropeo": 113,
+    "abedullloron": 113,
+    "abedulpendulo": 113,
+    "abedulplateado": 113,
+    "abedulverrugoso": 113,
+    "abellera": 24,
+    "abesh": 452,
+    "abeson": 8,
+    "abeto": 134,
+    "abiesalba": 134,
+    "abish": 452,
+    "ablunos": 408,
+    "aborraja": 46,
+    "abranal": 408,
+    "abreculos": 408,
+    "abridor": 384,
+    "abrueno": 408,
+    "abrunal": 408,
+    "absenta": 54,
+    "absinthe": 54,
+    "absinthemugwort": 54,
+    "absinthium": 54,
+    "absinthsage": 54,
+    "absinthsagewort": 54,
+    "absinthwormwood": 54,
+    "absintio": 54,
+    "acacia": 135,
+    "acaciasenegal": 135,
+    "acafresno": 126,
+    "acahual": 243,
+    "acahualillo": 35,
+    "acai": 196,
+    "acapate": 14,
+    "acapuas": 11,
+    "accasellowiana": 369,
+    "acebillo": 157,
+    "acebo": 74,
+    "aceituno": 109,
+    "acelga": 213,
+    "acendria": 456,
+    "acenoria": 214,
+    "acere": 454,
+    "acerola": 381,
+    "acerolacherry": 381,
+    "acerollo": 126,
+    "acerolo": 170,
+    "acersaccharum": 117,
+    "achicoriaamarilla": 203,
+    "achin": 225,
+    "achotillo": 353,
+    "achuma": 496,
+    "aciano": 50,
+    "acoroaromatico": 209,
+    "acorobastardo": 314,
+    "acorodulce": 209,
+    "acoroverdadero": 209,
+    "acoruscalamus": 209,
+    "actaearacemosa": 234,
+    "actinidiadeliciosa": 358,
+    "adamsneedle": 495,
+    "admirable": 488,
+    "adrak": 18,
+    "afghanmelon": 456,
+    "agabanzo": 85,
+    "agaragar": 302,
+    "agaricoblanco": 271,
+    "agaricoyesquero": 271,
+    "agaricusblazei": 274,
+    "agaricussubrufescens": 274,
+    "agarikon": 271,
+    "agarrocha": 104,
+    "agarrucha": 104,
+    "agavanzo": 85,
+    "agave": 72,
+    "agaveamericana": 72,
+    "agavespp": 72,
+    "agcum": 212,
+    "aglaiaedulis": 94,
+    "agnocasto": 178,
+    "agrauz": 455,
+    "agrazon": 402,
+    "agrimona": 37,
+    "agrimonia": 37,
+    "agrimoniabastarda": 36,
+    "agrimoniacomun": 37,
+    "agrimoniaeupatoria": 37,
+    "agriodeguinea": 238,
+    "agrios": 455,
+    "aguacolla": 496,
+    "aguaturma": 220,
+    "aguipegotes": 104,
+    "agujadeadan": 495,
+    "aihena": 454,
+    "ainguerubedarra": 26,
+    "airplant": 488,
+    "ajamodika": 480,
+    "ajedrea": 27,
+    "ajedreablanca": 58,
+    "ajedreacomun": 58,
+    "ajedreadejardin": 58,
+    "ajedreademontana": 27,
+    "ajedreademonte": 27,
+    "ajedreamontesina": 27,
+    "ajemjoverde": 29,
+    "ajencio": 54,
+    "ajengible": 18,
+    "ajengibre": 18,
+    "ajenjio": 54,
+    "ajenjo": 54,
+    "ajenjocomun": 54,
+    "ajenjomacho": 54,
+    "ajenjomayor": 54,
+    "ajenjosdulces": 449,
+    "ajenjovulgar": 54,
+    "ajicillo": 129,
+    "ajidulce": 470,
+    "ajimorron": 470,
+    "ajingible": 18,
+    "ajizuelo": 129,
+    "ajo": 62,
+    "ajoamarillo": 469,
+    "ajoandaluz": 62,
+    "ajoblanco": 62,
+    "ajomorisco": 13,
+    "ajonjera": 26,
+    "ajonjoli": 432,
+    "ajorizo": 54,
+    "ajowan": 480,
+    "ajwain": 480,
+    "aladierno": 179,
+    "alamonegro": 140,
+    "albacar": 0,
+    "albacarcorriente": 0,
+    "albacarhembra": 0,
+    "albacarmacho": 0,
+    "albahaca": 0,
+    "albahacaarribeno": 0,
+    "albahacablanca": 0,
+    "albahacachina": 59,
+    "albahacacorriente": 0,
+    "albahacadecastilla": 0,
+    "albahacadelatierra": 0,
+    "albahacadetomillo": 58,
+    "albahacajaponesa": 59,
+    "albahacamorada": 0,
+    "albahacasagrada": 510,
+    "albahacasagradatulsi": 510,
+    "albar": 455,
+    "albaricoque": 387,
+    "albaricoquero": 387,
+    "albarillo": 387,
+    "alberchiguero": 387,
+    "albergero": 387,
+    "albillo": 454,
+    "albolba": 32,
+    "albolga": 32,
+    "alborecera": 146,
+    "albornio": 146,
+    "alcachofachina": 232,
+    "alcachofadegatos": 487,
+    "alcachofadejerusalen": 220,
+    "alcallaro": 85,
+    "alcamonia": 15,
+    "alcanfor": 52,
+    "alcarabaca": 450,
+    "alcarabia": 450,
+    "alcaracache": 85,
+    "alcarahueya": 450,
+    "alcaravea": 450,
+    "alcaraveta": 450,
+    "alcaravia": 450,
+    "alcarobea": 450,
+    "alcornoque": 124,
+    "alerce": 133,
+    "alexandris": 26,
+    "alezna": 469,
+    "alfabega": 0,
+    "alfalfa": 429,
+    "alficoz": 457,
+    "alfoncigo": 436,
+    "alforva": 32,
+    "algabala": 85,
+    "algabanzo": 85,
+    "algafil": 37,
+    "algaraz": 402,
+    "algarroba": 136,
+    "algarrobo": 136,
+    "algarzon": 402,
+    "alhabega": 0,
+    "alhena": 163,
+    "alhucema": 23,
+    "aligustre": 163,
+    "alimonia": 37,
+    "alisoeuropeo": 113,
+    "aljedrea": 58,
+    "alkarobea": 450,
+    "allheal": 56,
+    "alliumsativum": 62,
+    "alliumschoenoprasum": 13,
+    "alloza": 137,
+    "allozo": 137,
+    "allspice": 476,
+    "almaraco": 11,
+    "almendolero": 137,
+    "almendra": 433,
+    "almendro": 137,
+    "almondmushroom": 274,
+    "almoradijo": 11,
+    "almoraduj": 11,
+    "almoradux": 11,
+    "almoraduxcasero": 11,
+    "almoraduxmorisco": 11,
+    "almoraduxsalsero": 11,
+    "almoraduz": 11,
+    "aloebarbadensismiller": 61,
+    "aloedebarbados": 61,
+    "aloedecurazao": 61,
+    "aloevera": 61,
+    "aloysiacitrodora": 47,
+    "alpiniagalanga": 38,
+    "altarcina": 51,
+    "altareina": 51,
+    "altarreina": 51,
+    "altea": 207,
+    "althaeaofficinalis": 207,
+    "alvares": 455,
+    "alvolva": 32,
+    "amabia": 73,
+    "amadou": 281,
+    "amanitacaesarea": 294,
+    "amanitadeloscesares": 294,
+    "amapola": 82,
+    "amapolacolorada": 82,
+    "amapoladecalifornia": 82,
+    "amapolasilvestre": 82,
+    "amaraco": 11,
+    "amarillas": 469,
+    "amate": 360,
+    "amatenahuatl": 360,
+    "amchoor": 481,
+    "amchur": 481,
+    "ameixeira": 385,
+    "americanaloe": 72,
+    "americandill": 451,
+    "americanelderberry": 161,
+    "americanginseng": 518,
+    "americanredraspberry": 390,
+    "americanwitchhazel": 150,
+    "amisa": 449,
+    "amla": 513,
+    "amole": 144,
+    "amor": 488,
+    "amordehortelano": 104,
+    "amorespequenos": 37,
+    "amoricos": 37,
+    "amorphophalluskonjac": 90,
+    "anacardiumoccidentale": 439,
+    "anacardo": 439,
+    "anacate": 288,
+    "anana": 346,
+    "ananascomosus": 346,
+    "anar": 455,
+    "anastasia": 53,
+    "anavia": 73,
+    "ancho": 470,
+    "andoaanelada": 287,
+    "andrino": 408,
+    "anega": 451,
+    "aneldo": 451,
+    "aneta": 8,
+    "angelica": 26,
+    "angelicaarchangelica": 26,
+    "angelicamontana": 30,
+    "anis": 16,
+    "anisdechina": 472,
+    "aniseburnetsaxifrage": 449,
+    "anisestrella": 472,
+    "anisestrellado": 472,
+    "anisestrelladochino": 472,
+    "anisfrances": 472,
+    "anisverd": 16,
+    "anisverde": 105,
+    "anjengibre": 18,
+    "annonacherimola": 361,
+    "annonamuricata": 357,
+    "annonasquamosa": 376,
+    "anon": 376,
+    "ansuapricot": 387,
+    "anthriscuscerefolium": 25,
+    "antioquena": 45,
+    "anu": 224,
+    "anzarbedar": 29,
+    "apabila": 490,
+    "apazote": 35,
+    "apepu": 240,
+    "apichu": 212,
+    "apiha": 223,
+    "apilla": 223,
+    "apina": 223,
+    "apinamama": 224,
+    "apinu": 224,
+    "apio": 83,
+    "apiocriollo": 221,
+    "apiodecampo": 216,
+    "apiodemontana": 30,
+    "apiodemonte": 30,
+    "apionabo": 217,
+    "apiorabano": 217,
+    "apiosilvestredemonte": 30,
+    "apiumgraveolensvarrapaceum": 217,
+    "apongapong": 94,
+    "aponogeton": 317,
+    "aponogetondistachyos": 317,
+    "apple": 382,
+    "apricot": 387,
+    "arabarba": 40,
+    "arabiancoffee": 463,
+    "arabicacoffee": 463,
+    "arachishypogaea": 453,
+    "arame": 305,
+    "aran": 408,
+    "arandanera": 73,
+    "arandano": 73,
+    "arandanodefrutoencarnado": 153,
+    "arandanorojo": 153,
+    "arandanorojoamericano": 153,
+    "arandilla": 73,
+    "aranon": 408,
+    "aranonera": 408,
+    "aranonnegro": 408,
+    "arasaguarani": 348,
+    "araucaria": 132,
+    "araucariaaraucana": 132,
+    "arayan": 180,
+    "araza": 365,
+    "arboldejade": 501,
+    "arboldelacola": 465,
+    "arboldelcafe": 463,
+    "arboldelos40escudos": 68,
+    "arboldelosdedos": 503,
+    "arboldelte": 128,
+    "arbustodeleche": 503,
+    "arbutusunedo": 146,
+    "arce": 117,
+    "archangel": 26,
+    "arcticroot": 508,
+    "arctiumlappa": 104,
+    "ardagaieuskera": 271,
+    "ardagaigorria": 281,
+    "ardagaihori": 286,
+    "ardagaiyesca": 281,
+    "ardagaizapal": 282,
+    "ardai": 281,
+    "ardoa": 281,
+    "argana": 160,
+    "argemonemexicana": 183,
+    "aristoteliachilensis": 414,
+    "arizonaelderberry": 161,
+    "armaga": 57,
+    "armeniancucumber": 457,
+    "armenianplum": 387,
+    "armoraciarusticana": 211,
+    "arnica": 242,
+    "arnicamontana": 242,
+    "aronjina": 24,
+    "arquimonia": 37,
+    "arracacha": 221,
+    "arracache": 221,
+    "arracaciaxanthorrhiza": 221,
+    "arrachaca": 223,
+    "arrayan": 180,
+    "arrayanchileno": 180,
+    "arrayanrojo": 180,
+    "arrezu": 201,
+    "arruda": 57,
+    "artadeagua": 461,
+    "artamisa": 53,
+    "artamisia": 53,
+    "artemega": 53,
+    "artemisa": 53,
+    "artemisia": 53,
+    "artemisiaabsinthium": 54,
+    "artemisiaamarga": 54,
+    "artemisiadracunculus": 12,
+    "artemisiavulgaris": 53,
+    "arthrospiraplatensis": 295,
+    "artistsbracket": 282,
+    "artistsconk": 282,
+    "artoblanco": 410,
+    "artocarpusaltilis": 379,
+    "artocarpusheterophyllus": 377,
+    "asafetida": 478,
+    "asafoetida": 478,
+    "asencio": 54,
+    "asenjo": 54,
+    "asensio": 54,
+    "asentsio": 54,
+    "ash": 112,
+    "ashwagandha": 205,
+    "asianginseng": 77,
+    "asianmint": 34,
+    "asparagusracemosus": 519,
+    "astragalo": 200,
+    "astragalusmembranaceus": 200,
+    "atractylodes": 226,
+    "atractylodesmacrocephala": 226,
+    "auriculariaauricula": 279,
+    "auriculariaauriculajudae": 279,
+    "australianfingerlime": 336,
+    "autumncrocus": 22,
+    "avapepper": 84,
+    "avaroot": 84,
+    "avellana": 399,
+    "avellano": 123,
+    "avellanodebruja": 150,
+    "averrhoacarambola": 350,
+    "awa": 84,
+    "awahawaii": 84,
+    "ayakchichira": 204,
+    "ayakwillku": 204,
+    "ayakwillkuquechua": 204,
+    "ayote": 430,
+    "azabila": 490,
+    "azadirachtaindica": 110,
+    "azafran": 22,
+    "azafrandelaindia": 475,
+    "azafrandelaindiacurcuma": 475,
+    "azahar": 240,
+    "azahardenovio": 163,
+    "azarole": 170,
+    "azarollo": 126,
+    "azarolo": 400,
+    "azenoria": 214,
+    "azolla": 319,
+    "azollafiliculoides": 319,
+    "aztecmarigold": 262,
+    "azulejo": 50,
+    "azzufa": 28,
+    "babosa": 490,
+    "babosillo": 287,
+    "babytoes": 497,
+    "bacao": 462,
+    "bachelorsbutton": 50,
+    "bacoa": 429,
+    "bacopa": 511,
+    "badian": 472,
+    "badianadechina": 472,
+    "badianero": 472,
+    "baimuerchino": 272,
+    "bajiao": 472,
+    "bala": 515,
+    "balamte": 462,
+    "balaustia": 455,
+    "balaustra": 455,
+    "balmmint": 24,
+    "balsamo": 5,
+    "bananaroja": 378,
+    "barbadecabra": 51,
+    "barbadejupiter": 487,
+    "barbadija": 166,
+    "barbadosaloe": 61,
+    "barbadoscherry": 381,
+    "barbuda": 280,
+    "bardana": 104,
+    "bardanamayor": 104,
+    "bareta": 429,
+    "basil": 0,
+    "basilico": 0,
+    "bastardmelon": 456,
+    "bataca": 220,
+    "batata": 212,
+    "bayadeacai": 412,
+    "bayadeagracejo": 419,
+    "bayadegoji": 411,
+    "bayadelespino": 415,
+    "bayademaqui": 414,
+    "baylaurel": 9,
+    "bayonetaespanola": 495,
+    "baytree": 9,
+    "bearberry": 152,
+    "bearbread": 282,
+    "beardedhedgehog": 268,
+    "beardedtooth": 268,
+    "beardedtoothfungus": 268,
+    "beargrass": 495,
+    "bearroot": 208,
+    "becua": 212,
+    "bedukata": 56,
+    "beefsteakplant": 59,
+    "beeskloutjie": 498,
+    "beet": 213,
+    "beggarsbuttons": 104,
+    "beiqi": 200,
+    "bejucodeagua": 86,
+    "bejuquillo": 471,
+    "belar": 56,
+    "belladona": 488,
+    "bellisperennis": 246,
+    "bellpepper": 470,
+    "bembrillo": 388,
+    "ben": 101,
+    "benguama": 212,
+    "berberis": 181,
+    "berberismicrophylla": 421,
+    "bergamot": 43,
+    "bergamota": 43,
+    "bergamotadechile": 4,
+    "bergamotorange": 43,
+    "berrodeagua": 312,
+    "bertholletiaexcelsa": 437,
+    "berza": 215,
+    "betabel": 213,
+    "betarraga": 213,
+    "betavulgaris": 213,
+    "betiguera": 55,
+    "betulapendula": 113,
+    "bhutika": 480,
+    "bieiteiro": 161,
+    "bilberry": 73,
+    "bingcherry": 386,
+    "birchcankerpolypore": 269,
+    "birchconk": 269,
+    "birdcherry": 386,
+    "birdsnest": 214,
+    "birdsrape": 215,
+    "bishopslace": 214,
+    "bishopsweed": 480,
+    "bismalva": 207,
+    "bitau": 454,
+    "bitia": 35,
+    "bitingstonecrop": 494,
+    "bitterapple": 456,
+    "bitterbuttons": 29,
+    "bittermelon": 456,
+    "bitterroot": 210,
+    "bittersweet": 51,
+    "bitterwort": 210,
+    "bituca": 225,
+    "bixihuminahuatl": 161,
+    "biziaa": 199,
+    "bizoya": 199,
+    "blackberry": 392,
+    "blackbugbane": 234,
+    "blackchanterelle": 289,
+    "blackcohosh": 234,
+    "blackhoofmushroom": 283,
+    "blackmassandbirchcankerpolypore": 269,
+    "blackmulberry": 147,
+    "blackmushroom": 265,
+    "blackpepper": 467,
+    "blackpoplar": 140,
+    "blacksampson": 202,
+    "blacksnakeroot": 234,
+    "blacksugar": 201,
+    "blackthorn": 408,
+    "blackthornplum": 408,
+    "blacktruffle": 291,
+    "blacktrumpet": 289,
+    "bladderseed": 30,
+    "bladderwrack": 301,
+    "blaeberry": 73,
+    "blondplantain": 461,
+    "blondpsyllium": 461,
+    "bloodwort": 52,
+    "bloodydogwood": 165,
+    "blowball": 203,
+    "blueelderberry": 161,
+    "blueginger": 38,
+    "bluegum": 63,
+    "bluepea": 256,
+    "boighe": 129,
+    "boighemapudungun": 129,
+    "boj": 162,
+    "boja": 2,
+    "bojas": 2,
+    "boladenieve": 177,
+    "boldo": 106,
+    "boldu": 106,
+    "boletdesca": 281,
+    "boletoanillado": 287,
+    "boletoanilladoviscoso": 287,
+    "boletusedulis": 292,
+    "bolsita": 488,
+    "bonetero": 164,
+    "boniato": 212,
+    "bonnetbellflower": 227,
+    "borage": 46,
+    "boragoofficinalis": 46,
+    "boremorado": 225,
+    "borojo": 366,
+    "borojoapatinoi": 366,
+    "borracha": 46,
+    "borrachin": 146,
+    "borraina": 46,
+    "borraja": 46,
+    "borrajablanca": 46,
+    "botondeoro": 44,
+    "bourbon": 463,
+    "boxwood": 162,
+    "boysena": 422,
+    "boysenberi": 422,
+    "boysenberry": 422,
+    "brahmi": 516,
+    "bramble": 392,
+    "brassicanigrasinapisalba": 443,
+    "brassicaoleraceavargongylodes": 219,
+    "brassicarapa": 215,
+    "braziliancocoa": 464,
+    "brazilianguava": 369,
+    "brazilianteak": 482,
+    "brazilnut": 437,
+    "brecina": 160,
+    "bresquilla": 290,
+    "breval": 360,
+    "brezo": 160,
+    "bridewort": 51,
+    "brinon": 395,
+    "bronzefennel": 14,
+    "broom": 171,
+    "brosta": 51,
+    "browntrunkrot": 271,
+    "bruja": 488,
+    "bruno": 385,
+    "brunon": 395,
+    "brusco": 157,
+    "buddhashand": 327,
+    "bufalaga": 176,
+    "bufanagas": 214,
+    "bufera": 205,
+    "buje": 162,
+    "buldo": 106,
+    "bulgarianrose": 236,
+    "bullace": 385,
+    "bullshead": 520,
+    "burnetbloodwort": 36,
+    "bushbalm": 24,
+    "bushmanshat": 505,
+    "butchersbroom": 157,
+    "butterflypea": 256,
+    "buttermilkroot": 519,
+    "buxussempervirens": 162,
+    "caaehe": 41,
+    "cabsitiella": 37,
+    "cacahua": 199,
+    "cacahuacaspi": 199,
+    "cacahuat": 199,
+    "cacahuate": 453,
+    "cacahuete": 453,
+    "cacao": 199,
+    "cacaoarisco": 199,
+    "cacaoblanco": 462,
+    "cacaoblancoamazonico": 462,
+    "cacaocomun": 199,
+    "cacaocriollo": 199,
+    "cacaocuahuitl": 199,
+    "cacaodulce": 199,
+    "cacaosilvestre": 199,
+    "cacaotero": 462,
+    "cacaotree": 199,
+    "cacaumuyo": 199,
+    "cachaco": 45,
+    "caco": 199,
+    "cactopiedra": 498,
+    "cactuspiedra": 498,
+    "caesarsmushroom": 294,
+    "cafe": 463,
+    "cafeto": 463,
+    "cafetoarabico": 463,
+    "cafetodearabia": 463,
+    "caffeinenut": 465,
+    "cafresna": 126,
+    "cagarria": 290,
+    "cagau": 199,
+    "caimito": 344,
+    "cajiga": 118,
+    "cajon": 162,
+    "caju": 439,
+    "calabacillo": 462,
+    "calabazasemillas": 430,
+    "calafate": 421,
+    "calamansifilipino": 329,
+    "calambrojo": 85,
+    "calamentoblanco": 58,
+    "calamintoblanco": 58,
+    "calamoacuatico": 209,
+    "calamoaromatico": 209,
+    "calamondin": 329,
+    "calamondina": 329,
+    "calamus": 209,
+    "calanga": 38,
+    "calendula": 44,
+    "calendulaofficinalis": 44,
+    "calipes": 63,
+    "calipse": 63,
+    "calipto": 63,
+    "callunavulgaris": 160,
+    "camalote": 310,
+    "cambron": 410,
+    "camelmelon": 456,
+    "camohtli": 212,
+    "camoj": 212,
+    "camomila": 60,
+    "camomile": 60,
+    "camote": 212,
+    "campanasdoradas": 168,
+    "camucamu": 367,
+    "canadelimon": 39,
+    "canadianwaterweed": 318,
+    "canalimon": 39,
+    "canamiza": 55,
+    "canamo": 429,
+    "canasanta": 39,
+    "candelaria": 48,
+    "candilera": 173,
+    "candyleaf": 41,
+    "canela": 19,
+    "caneladeceilan": 19,
+    "canelero": 19,
+    "canelillo": 129,
+    "canelo": 129,
+    "canelodeparamo": 129,
+    "cangrejodelosbosques": 286,
+    "cankerwort": 203,
+    "cannabissativa": 429,
+    "cano": 429,
+    "cantaloupe": 457,
+    "cantarela": 288,
+    "cantharelluscibarius": 288,
+    "cantueso": 23,
+    "canuela": 39,
+    "canutillo": 64,
+    "caoba": 138,
+    "capepondweed": 317,
+    "capsicumannuum": 470,
+    "capsicumannuumvarannuum": 473,
+    "capuchina": 45,
+    "capulin": 386,
+    "capulinnahuatl": 386,
+    "capulinsilvestre": 161,
+    "caqui": 398,
+    "caralluma": 506,
+    "carallumafimbriata": 506,
+    "carambola": 350,
+    "carambolo": 350,
+    "caravai": 450,
+    "caraway": 450,
+    "carballo": 118,
+    "carbia": 450,
+    "carcarria": 290,
+    "cardamom": 447,
+    "cardamomo": 21,
+    "cardamomoverdadero": 21,
+    "cardamomoverde": 21,
+    "cardamon": 447,
+    "cardamum": 447,
+    "cardon": 492,
+    "caricapapaya": 345,
+    "carnation": 244,
+    "carobtree": 136,
+    "carolinajessamine": 258,
+    "carom": 480,
+    "carragaen": 303,
+    "carrazos": 454,
+    "carrionplant": 504,
+    "carrota": 214,
+    "carumcarvi": 450,
+    "carvallo": 118,
+    "carvayo": 118,
+    "carvia": 450,
+    "caryaillinoinensis": 438,
+    "casaba": 457,
+    "cascaradeispagula": 461,
+    "cascarilla": 130,
+    "cascodecaballo": 281,
+    "cashew": 439,
+    "cashisha": 471,
+    "casis": 417,
+    "castana": 435,
+    "castanaamazonica": 437,
+    "castanadeagua": 316,
+    "castanadeindias": 460,
+    "castaneasativa": 435,
+    "castano": 435,
+    "castanodeindias": 111,
+    "castanodesombra": 460,
+    "castorbean": 89,
+    "castoroilplant": 89,
+    "caterpillarfungus": 267,
+    "cathaedulis": 95,
+    "cathedralbells": 488,
+    "cauliflowerfungus": 285,
+    "cauliflowermushroom": 285,
+    "cavi": 223,
+    "caviarcitrico": 336,
+    "caviarlime": 336,
+    "cayatuna": 479,
+    "cayena": 473,
+    "ceanothusamericanus": 182,
+    "ceanoto": 182,
+    "cebolladehoja": 13,
+    "cebolleta": 13,
+    "cebollin": 13,
+    "cebollino": 13,
+    "cebollinocomun": 13,
+    "cebollinodeajo": 13,
+    "cedaroflebanon": 116,
+    "cedro": 116,
+    "cedrodellibano": 116,
+    "cedruslibani": 116,
+    "ceiba": 139,
+    "ceibapentandra": 139,
+    "celeriac": 217,
+    "celery": 83,
+    "celeryroot": 217,
+    "celiandre": 6,
+    "celima": 10,
+    "cempasuchil": 262,
+    "cempohualxochitl": 262,
+    "cenidor": 53,
+    "cenojo": 14,
+    "centaureacyanus": 50,
+    "centaureamenor": 263,
+    "centauriumerythraea": 263,
+    "centaury": 263,
+    "centellaasiatica": 102,
+    "cep": 292,
+    "cepa": 454,
+    "ceratoniasiliqua": 136,
+    "cerecera": 386,
+    "cerecita": 381,
+    "cerefolio": 25,
+    "cereizal": 386,
+    "cereza": 386,
+    "cerezadebarbados": 381,
+    "cerezadejamaica": 381,
+    "cerezadelasantillas": 381,
+    "cerezadelasindiasoccidentales": 381,
+    "cerezal": 386,
+    "cerezo": 386,
+    "cerezomorrino": 386,
+    "cerezosilvestre": 386,
+    "cerezu": 386,
+    "cerfull": 25,
+    "cerolero": 170,
+    "cerollero": 385,
+    "cerollo": 126,
+    "cerveza": 55,
+    "ceyloncinnamon": 19,
+    "chabacano": 387,
+    "chaga": 269,
+    "chambimbe": 144,
+    "chamomile": 60,
+    "champinondelsol": 274,
+    "champinonostra": 276,
+    "chan": 428,
+    "chantarela": 288,
+    "chanterelle": 288,
+    "chard": 213,
+    "chato": 396,
+    "chatos": 384,
+    "cheeses": 49,
+    "chervil": 25,
+    "chestnut": 435,
+    "chia": 428,
+    "chianahuatl": 428,
+    "chicalo": 225,
+    "chicalote": 183,
+    "chickenfungus": 286,
+    "chickenmushroom": 286,
+    "chickenofthewoods": 286,
+    "chicol": 225,
+    "chicolo": 225,
+    "chicul": 225,
+    "chilayo": 491,
+    "chileanfalselarch": 133,
+    "chileanmyrtle": 180,
+    "chileanpine": 132,
+    "chilemorron": 470,
+    "chilipepper": 470,
+    "chillipepper": 470,
+    "chiltepin": 470,
+    "chinaroot": 273,
+    "chineseartichoke": 232,
+    "chinesebasil": 59,
+    "chinesefoxglove": 228,
+    "chineseginseng": 77,
+    "chinesegooseberry": 358,
+    "chinesepersimmon": 398,
+    "chinesestaranise": 472,
+    "chinita": 44,
+    "chiribita": 246,
+    "chirimoya": 361,
+    "chirivia": 216,
+    "chiriviasilvestre": 26,
+    "chives": 13,
+    "chlorella": 296,
+    "chlorellavulgaris": 296,
+    "chocolatemint": 4,
+    "chocolatetree": 199,
+    "chonacate": 13,
+    "chondruscrispus": 303,
+    "chonzana": 210,
+    "choong": 506,
+    "chopi": 479,
+    "chopo": 140,
+    "chordon": 390,
+    "chordonera": 390,
+    "choriu": 9,
+    "christmaspepper": 470,
+    "chrysanthemum": 245,
+    "chrysanthemummorifolium": 245,
+    "chrysophyllumcainito": 344,
+    "chuchupaat": 208,
+    "chuchupate": 208,
+    "chuchupati": 208,
+    "chudenchu": 199,
+    "chugua": 222,
+    "chulivert": 7,
+    "chumbera": 492,
+    "chumbimbo": 144,
+    "chumbo": 492,
+    "chumbua": 492,
+    "chupalla": 162,
+    "churchsteeples": 37,
+    "ciboulette": 13,
+    "cidra": 327,
+    "cidrapapa": 327,
+    "cidro": 327,
+    "cidronela": 24,
+    "cientoenrama": 52,
+    "cilandre": 6,
+    "cilandro": 6,
+    "cilantro": 6,
+    "cilantrovietnamita": 34,
+    "cimicifuga": 234,
+    "cinchonaofficinalis": 130,
+    "cinderconk": 269,
+    "cinnamomumverum": 19,
+    "cipres": 114,
+    "ciprescomun": 114,
+    "cipresmediterraneo": 114,
+    "cirasera": 386,
+    "circaea": 97,
+    "circaealutetiana": 97,
+    "ciresera": 386,
+    "cirguelero": 385,
+    "cirguelo": 385,
+    "cirolero": 385,
+    "ciruela": 385,
+    "cirueladechina": 352,
+    "ciruelero": 385,
+    "ciruelo": 385,
+    "cissusverticillata": 86,
+    "cistusladanifer": 159,
+    "citrange": 341,
+    "citron": 327,
+    "citronela": 39,
+    "citronella": 24,
+    "citronellagrass": 39,
+    "citronmelon": 456,
+    "citrulluslanatus": 456,
+    "citrumelo": 342,
+    "citrusbergamota": 43,
+    "citruscalamondin": 329,
+    "citruscidra": 327,
+    "citruscitrange": 341,
+    "citruscitrumelo": 342,
+    "citrusfaustrime": 343,
+    "citrusfingerlime": 336,
+    "citrushystrix": 375,
+    "citrusjaponica": 326,
+    "citruskabosu": 338,
+    "citruskaffirlime": 335,
+    "citruskumquat": 326,
+    "citruslima": 324,
+    "citruslimequat": 340,
+    "citrusmandarina": 323,
+    "citrusmelogold": 334,
+    "citrusnaranja": 321,
+    "citrusoroblanco": 333,
+    "citruspomelo": 325,
+    "citrusrangpur": 339,
+    "citrussudachi": 337,
+    "citrussweetie": 332,
+    "citrustangelo": 330,
+    "citrustoronja": 322,
+    "citrusugli": 331,
+    "citrusyuzu": 328,
+    "ciwujia": 233,
+    "clavel": 244,
+    "clavelcomun": 244,
+    "claveldelasindias": 262,
+    "clavo": 466,
+    "clavodeespecia": 20,
+    "clavodeolor": 20,
+    "clementina": 323,
+    "clementine": 323,
+    "climbingasparagus": 519,
+    "clingstonepeach": 384,
+    "clinkerfungus": 269,
+    "clinkerpolypore": 269,
+    "clitoria": 256,
+    "clitoriabutterflypea": 256,
+    "clitoriaternatea": 256,
+    "clorela": 296,
+    "clovepink": 244,
+    "coco": 356,
+    "coconut": 356,
+    "cocosnucifera": 356,
+    "cocoyam": 225,
+    "codonopsis": 227,
+    "codonopsispilosula": 227,
+    "coffeaarabicarobusta": 463,
+    "cogumelodosol": 274,
+    "cohombro": 457,
+    "cohoshnegro": 234,
+    "colaacuminata": 465,
+    "coladecaballo": 64,
+    "coladecaballodeagua": 315,
+    "coladepavo": 270,
+    "coladesudan": 465,
+    "colanut": 465,
+    "colatero": 465,
+    "colinabo": 219,
+    "colirrabano": 219,
+    "colmenilla": 290,
+    "colmenillagris": 290,
+    "colocasiaesculenta": 225,
+    "colocynth": 456,
+    "colrabano": 219,
+    "comettailpeppercorn": 484,
+    "comicastella": 15,
+    "comino": 15,
+    "cominocomun": 15,
+    "cominodeprado": 450,
+    "cominodulce": 16,
+    "cominofino": 15,
+    "cominonegro": 31,
+    "commelinapallida": 188,
+    "commercialvanilla": 471,
+    "commonagrimony": 37,
+    "commonapple": 382,
+    "commonash": 112,
+    "commonbalm": 24,
+    "commonbeech": 119,
+    "commonbox": 162,
+    "commonboxwood": 162,
+    "commonbroom": 171,
+    "commoncentaury": 263,
+    "commoncrabapple": 382,
+    "commondaisy": 246,
+    "commondogwood": 165,
+    "commonfig": 360,
+    "commonginger": 18,
+    "commongrape": 389,
+    "commongumcistus": 159,
+    "commonhawthorn": 122,
+    "commonhop": 55,
+    "commonhorsetail": 64,
+    "commonjasmine": 237,
+    "commonjuniper": 155,
+    "commonmallow": 49,
+    "commonmarigold": 44,
+    "commonmarshmallow": 207,
+    "commonmint": 5,
+    "commonmorel": 290,
+    "commonmugwort": 53,
+    "commonmullein": 48,
+    "commonmyrtle": 158,
+    "commonoak": 118,
+    "commonolive": 109,
+    "commonpeach": 384,
+    "commonplum": 385,
+    "commonpoppy": 82,
+    "commonprivet": 163,
+    "commonquince": 388,
+    "commonrue": 57,
+    "commonsage": 10,
+    "commonsagewort": 54,
+    "commonsmilax": 156,
+    "commonspindle": 164,
+    "commonsplitgill": 278,
+    "commontansy": 29,
+    "commonthyme": 2,
+    "commonturmeric": 17,
+    "commonvalerian": 56,
+    "commonwalnut": 120,
+    "commonwitchhazel": 150,
+    "commonyarrow": 52,
+    "commonyucca": 495,
+    "conchitaazul": 256,
+    "coneflower": 202,
+    "coneheadthyme": 175,
+    "coniza": 461,
+    "consolva": 487,
+    "convalaria": 259,
+    "convallariamajalis": 259,
+    "cooguinanagali": 218,
+    "cooltankard": 46,
+    "copaiba": 100,
+    "copaiferaofficinalis": 100,
+    "copoazu": 368,
+    "coprinuscomatus": 280,
+    "copuazu": 462,
+    "coquitobrasileno": 437,
+    "corazoncillo": 65,
+    "cordonera": 390,
+    "cordyceps": 267,
+    "cordycepssinensis": 267,
+    "corkoak": 124,
+    "cornabois": 126,
+    "cornejo": 409,
+    "cornejodecornelia": 409,
+    "cornejomacho": 409,
+    "cornejosanguineo": 165,
+    "corneliancherry": 409,
+    "corneliancherrydogwood": 409,
+    "cornflower": 50,
+    "cornpoppy": 82,
+    "cornusmas": 409,
+    "cornussanguinea": 165,
+    "cortacalentura": 39,
+    "cortezadesauce": 71,
+    "corvallenaret": 287,
+    "countrymallow": 515,
+    "cowbitter": 29,
+    "cowslip": 249,
+    "cowtongue": 499,
+    "crabofthewoods": 286,
+    "crampbark": 177,
+    "crassula": 501,
+    "crassulaovata": 501,
+    "craterelluscornucopioides": 289,
+    "crespilla": 290,
+    "crisantemo": 245,
+    "crisantemodelachina": 245,
+    "croco": 22,
+    "crocussativus": 22,
+    "crosne": 232,
+    "crotonlechleri": 131,
+    "cubeb": 484,
+    "cubeba": 484,
+    "cubebapimientadejava": 484,
+    "cubebvine": 484,
+    "cubio": 224,
+    "cucumismelo": 457,
+    "cucurbitapepo": 430,
+    "cuernodelaabundancia": 289,
+    "cuerpodehombre": 55,
+    "cuirn": 126,
+    "culinarysage": 10,
+    "cultivatedapple": 382,
+    "cultivatedstrawberry": 391,
+    "cumaru": 482,
+    "cumaruna": 482,
+    "cumbaru": 482,
+    "cumin": 15,
+    "cummin": 15,
+    "cundumbo": 75,
+    "cupressussempervirens": 114,
+    "curcuma": 17,
+    "curcumacanadiense": 206,
+    "curlyleafparsley": 7,
+    "curlymint": 4,
+    "cuticulasdesemillasdeplantagoovata": 461,
+    "cuyanquillo": 471,
+    "cymbopogoncitratus": 39,
+    "cytisusscoparius": 171,
+    "dahlia": 251,
+    "dahliacoccinea": 251,
+    "daisy": 246,
+    "dalia": 251,
+    "damasco": 387,
+    "damaskrose": 236,
+    "damasquero": 387,
+    "damasquillo": 387,
+    "damasquina": 262,
+    "damiana": 184,
+    "damson": 385,
+    "daphnegnidium": 176,
+    "darim": 455,
+    "dasheen": 225,
+    "daucuscarota": 214,
+    "daunkesom": 34,
+    "daunlaksa": 34,
+    "dedalera": 80,
+    "dedosdebebe": 497,
+    "deepyaka": 480,
+    "desajo": 469,
+    "desertelderberry": 161,
+    "desertindianwheat": 461,
+    "dessertstrawberry": 391,
+    "deulkkae": 59,
+    "devilsbush": 233,
+    "devilsdung": 478,
+    "devilsnettle": 52,
+    "devilsroot": 489,
+    "devilsshrub": 233,
+    "dewberry": 392,
+    "dianthuscaryophyllus": 244,
+    "dientedeleon": 67,
+    "dientedeleonraiz": 203,
+    "digital": 260,
+    "digitalis": 260,
+    "dilloilplant": 8,
+    "dingxian": 20,
+    "diospyroskaki": 398,
+    "dipteryxodorata": 482,
+    "divinecactus": 489,
+    "dogberry": 85,
+    "dogsposy": 203,
+    "domesticatedapple": 382,
+    "dongchongxiacaochino": 267,
+    "donutpeach": 396,
+    "donzell": 54,
+    "douxdespagne": 470,
+    "drago": 12,
+    "dragoncillo": 12,
+    "dragonera": 12,
+    "dragonet": 12,
+    "dragonplant": 12,
+    "dragonsagewort": 12,
+    "dragonswort": 12,
+    "drimyswinteri": 129,
+    "drumsticktree": 101,
+    "drynaria": 92,
+    "drynariaroosii": 92,
+    "duckweed": 309,
+    "dulse": 300,
+    "dumplingcactus": 489,
+    "duraznillo": 288,
+    "durazno": 384,
+    "durian": 354,
+    "durillo": 166,
+    "duriozibethinus": 354,
+    "dwarfpomegranate": 455,
+    "dysphaniaambrosioides": 35,
+    "earthapple": 220,
+    "eastindiandill": 8,
+    "eastindianlotus": 458,
+    "echeveria": 493,
+    "echeveriaelegans": 493,
+    "echeverio": 493,
+    "echinaceapurpurea": 202,
+    "echinopsispachanoi": 496,
+    "eddo": 225,
+    "edibleburdock": 104,
+    "ediblefig": 360,
+    "ediblequince": 388,
+    "eggfruit": 362,
+    "egoma": 59,
+    "eichhorniacrassipes": 310,
+    "eiseniabicyclis": 305,
+    "elachi": 447,
+    "eladkham": 38,
+    "elderberry": 161,
+    "elderflower": 75,
+    "elephantear": 225,
+    "eleutero": 233,
+    "eleuterococo": 233,
+    "eleuthero": 233,
+    "eleutherococcussenticosus": 233,
+    "elodea": 318,
+    "elodeacanadensis": 318,
+    "elorrieuskera": 410,
+    "emblic": 513,
+    "emblicmyrobalan": 513,
+    "encens": 54,
+    "enchantersnightshade": 97,
+    "encina": 125,
+    "encinainglesa": 118,
+    "endrina": 401,
+    "endrino": 408,
+    "enebro": 155,
+    "eneldo": 8,
+    "englishbalm": 24,
+    "englishcoffeetree": 463,
+    "englishdaisy": 246,
+    "englishelm": 87,
+    "englishlavender": 23,
+    "englishmint": 4,
+    "englishoak": 118,
+    "englishviolet": 241,
+    "englishwalnut": 120,
+    "enoki": 275,
+    "enokitakejapones": 275,
+    "ensaladaitaliana": 36,
+    "epazote": 35,
+    "epazotedetoro": 35,
+    "epazotl": 35,
+    "equinacea": 202,
+    "equiseto": 64,
+    "equisetomenor": 185,
+    "equisetumfluviatile": 315,
+    "erenotz": 9,
+    "eriobotryajaponica": 397,
+    "escalerilla": 36,
+    "escambrones": 402,
+    "escarambrojo": 85,
+    "escaramojo": 85,
+    "escaramujo": 85,
+    "eschscholziacalifornica": 82,
+    "esclatasanccamelit": 290,
+    "escobaamarga": 171,
+    "escobilla": 50,
+    "escobillaparda": 53,
+    "escornabois": 126,
+    "eska": 281,
+    "esmermasangre": 37,
+    "esmirnio": 30,
+    "esparragodemar": 308,
+    "esparragodezarza": 55,
+    "esparragoortiguero": 55,
+    "esparraguera": 55,
+    "espino": 408,
+    "espinoalbar": 122,
+    "espinoamarillo": 410,
+    "espinoblanco": 122,
+    "espinocervaldemar": 167,
+    "espinonegro": 408,
+    "espirea": 51,
+    "espirulina": 295,
+    "espliego": 23,
+    "espueladegalan": 45,
+    "estevia": 41,
+    "estiercoldeldiablo": 478,
+    "estrago": 12,
+    "estragon": 12,
+    "estrellademar": 504,
+    "estremoncello": 2,
+    "estremoncillo": 2,
+    "etrog": 327,
+    "eucalipto": 63,
+    "eucaliptoazul": 63,
+    "eucaliptoblanco": 63,
+    "eucaliptocomun": 63,
+    "eucalyptusglobulus": 63,
+    "eugeniastipitata": 365,
+    "euonymuseuropaeus": 164,
+    "eupatoria": 37,
+    "euphorbia": 503,
+    "euphorbiatirucalli": 503,
+    "eurekalemon": 320,
+    "europeanash": 112,
+    "europeanbeech": 119,
+    "europeanbox": 162,
+    "europeancornel": 409,
+    "europeancranberrybush": 177,
+    "europeangooseberry": 402,
+    "europeangrape": 454,
+    "europeanhorsechestnut": 460,
+    "europeanmountainash": 126,
+    "europeanolive": 109,
+    "europeanplum": 385,
+    "europeanprivet": 163,
+    "europeanspindle": 164,
+    "europeanwhitebirch": 113,
+    "europeanwinegrape": 389,
+    "eutremajaponicum": 42,
+    "eveningprimrose": 261,
+    "eveningtrumpetflower": 258,
+    "evonimo": 164,
+    "eyeroot": 206,
+    "ezamillo": 451,
+    "faceclock": 203,
+    "fago": 119,
+    "fagussylvatica": 119,
+    "fairywashboard": 500,
+    "falsayesca": 271,
+    "falsetinderfungus": 281,
+    "falsoanis": 451,
+    "farigola": 2,
+    "faton": 385,
+    "fau": 119,
+    "faustrime": 343,
+    "faya": 119,
+    "feijoa": 369,
+    "felonherb": 53,
+    "fenestraria": 497,
+    "fenestrariarhopalophylla": 497,
+    "fennel": 14,
+    "fenogreco": 32,
+    "fenojo": 14,
+    "fenol": 14,
+    "fenoll": 14,
+    "fenolldeprat": 15,
+    "fenugreco": 452,
+    "ferulaassafoetida": 478,
+    "fevergrass": 39,
+    "fieldelm": 87,
+    "fieldhorsetail": 64,
+    "fieldmustard": 215,
+    "fieldpoppy": 82,
+    "fig": 360,
+    "figguava": 369,
+    "figtree": 143,
+    "filfilahmar": 473,
+    "filipendula": 51,
+    "filipendulaulmaria": 51,
+    "fingerlime": 336,
+    "finocchio": 14,
+    "fir": 134,
+    "fiuncho": 14,
+    "fivefinger": 350,
+    "fiveflavorberry": 509,
+    "flammulinavelutipes": 275,
+    "flanderspoppy": 82,
+    "flannelweed": 515,
+    "flatleafparsley": 7,
+    "flatleavedvanilla": 471,
+    "flatpeach": 396,
+    "flaxleaveddaphne": 176,
+    "flaxseed": 427,
+    "fleja": 112,
+    "flordearete": 488,
+    "flordecarrona": 504,
+    "flordecielo": 50,
+    "flordejamaica": 238,
+    "flordelanuezmoscada": 474,
+    "flordelapasion": 70,
+    "flordelapluma": 52,
+    "flordemuertos": 262,
+    "flordenabo": 215,
+    "flordepasion": 70,
+    "florderoma": 245,
+    "flordesantos": 53,
+    "flordesauco": 75,
+    "flordesauz": 161,
+    "florencefennel": 14,
+    "florfresca": 488,
+    "floridos": 469,
+    "floristschrysanthemum": 245,
+    "floristsdaisy": 245,
+    "flornegra": 471,
+    "floron": 51,
+    "floweringonion": 13,
+    "foddermelon": 456,
+    "foike": 129,
+    "foiye": 129,
+    "foiyel": 129,
+    "folle": 129,
+    "folomapudungun": 106,
+    "fomesfomentarius": 281,
+    "fomitopsisofficinalis": 271,
+    "fonolcomun": 14,
+    "forsitia": 168,
+    "forsythiasuspensa": 168,
+    "foye": 129,
+    "foyemapudungun": 129,
+    "fragariavesca": 391,
+    "fragariaxananassa": 391,
+    "fragino": 112,
+    "frambuesa": 390,
+    "frambueso": 390,
+    "fraughan": 73,
+    "fraxinusexcelsior": 112,
+    "freestonepeach": 384,
+    "frenchblacktruffle": 291,
+    "frenchparsley": 25,
+    "frenchtarragon": 12,
+    "fresa": 391,
+    "fresno": 112,
+    "fresnocomun": 112,
+    "fresnodehojaancha": 112,
+    "fresnodevizcaya": 112,
+    "fresnoelevado": 112,
+    "freson": 391,
+    "friegaplatos": 48,
+    "friendshiptree": 501,
+    "fruitingquince": 388,
+    "frutabomba": 345,
+    "frutadeestrella": 350,
+    "frutadelapasion": 349,
+    "frutadeldragon": 486,
+    "frutahala": 380,
+    "frutilla": 391,
+    "frutipan": 379,
+    "fucus": 301,
+    "fucusvesiculosus": 301,
+    "fulfulahhmar": 473,
+    "fuling": 273,
+    "fune": 129,
+    "furiegano": 3,
+    "gabancera": 85,
+    "gafeti": 37,
+    "galanga": 38,
+    "galangadejava": 38,
+    "galangadelaindia": 38,
+    "galangalmayor": 38,
+    "gallinadelosbosques": 266,
+    "gallocresta": 10,
+    "gamboa": 388,
+    "gamonita": 490,
+    "ganodermaapplanatum": 282,
+    "ganodermalingzhi": 293,
+    "ganodermalucidum": 264,
+    "gaoliangjiang": 38,
+    "gardenangelica": 26,
+    "gardenchervil": 25,
+    "gardengooseberry": 402,
+    "gardenheliotrope": 56,
+    "gardenlovage": 30,
+    "gardenmint": 5,
+    "gardenmum": 245,
+    "gardennasturtium": 45,
+    "gardenparsley": 7,
+    "gardenradish": 218,
+    "gardenrue": 57,
+    "gardensage": 10,
+    "gardenstrawberry": 391,
+    "gardenthyme": 2,
+    "gardenvalerian": 56,
+    "gardenviolet": 241,
+    "garlic": 62,
+    "garrobo": 136,
+    "garrofero": 136,
+    "gasteria": 499,
+    "gasteriaspp": 499,
+    "gayuba": 152,
+    "gean": 386,
+    "gebena": 469,
+    "gelidiumspp": 302,
+    "gelsemio": 258,
+    "gelsemiumsempervirens": 258,
+    "genciana": 210,
+    "gencianaamarilla": 210,
+    "gencianamayor": 210,
+    "geniva": 469,
+    "gentianalutea": 210,
+    "geranio": 252,
+    "geraniodeolor": 252,
+    "geranioderosa": 252,
+    "germancamomile": 60,
+    "germanchamomile": 60,
+    "germantarragon": 12,
+    "germanthyme": 2,
+    "germanturnip": 219,
+    "gguiagueza": 60,
+    "ghaap": 505,
+    "gillyflower": 244,
+    "giloy": 517,
+    "ginebro": 155,
+    "ginger": 18,
+    "ginkgo": 68,
+    "ginkgobiloba": 68,
+    "ginseng": 77,
+    "ginsengamericano": 518,
+    "ginsengsiberiano": 233,
+    "girasol": 243,
+    "girasoldecanada": 220,
+    "girasolsemillas": 431,
+    "girgola": 276,
+    "girgolagroga": 286,
+    "girofle": 20,
+    "givert": 7,
+    "glasswort": 308,
+    "globillo": 203,
+    "glycyrrhizaglabra": 201,
+    "goathead": 520,
+    "gobernadora": 186,
+    "gobo": 104,
+    "godsmushroom": 274,
+    "goetheplant": 488,
+    "goiabadocampo": 369,
+    "goiabeiradomato": 369,
+    "goiabeiraserrana": 369,
+    "goldenandsilverhoneysuckle": 514,
+    "goldenbells": 168,
+    "goldenbuttons": 29,
+    "goldenchanterelle": 288,
+    "goldenherb": 17,
+    "goldenlime": 329,
+    "goldenneedlemushroom": 275,
+    "goldenroot": 508,
+    "goldensage": 10,
+    "goldenseal": 206,
+    "goldmosssedum": 494,
+    "goldmossstonecrop": 494,
+    "gooranut": 465,
+    "gooseberry": 402,
+    "gordaldo": 52,
+    "gordolobo": 48,
+    "gorra": 465,
+    "gotukola": 512,
+    "gramonica": 51,
+    "granada": 359,
+    "granadelparaiso": 447,
+    "granadilla": 70,
+    "granado": 141,
+    "granadoborde": 455,
+    "granadocomun": 455,
+    "granao": 455,
+    "grapefruit": 322,
+    "grapevine": 389,
+    "greatburnet": 36,
+    "greaterburdock": 104,
+    "greaterburnet": 36,
+    "greatergalangal": 38,
+    "greatmullein": 48,
+    "greatyellowgentian": 210,
+    "grecianlaurel": 9,
+    "greekvalerian": 56,
+    "greenginger": 54,
+    "greenpepper": 470,
+    "grifa": 429,
+    "grifolafrondosa": 266,
+    "grosella": 393,
+    "grosellablanca": 402,
+    "grosellaespinosa": 402,
+    "grosellaespinosaeuropea": 402,
+    "grosellanegra": 403,
+    "grosellaroja": 404,
+    "grosellero": 393,
+    "grosellerodelaindia": 103,
+    "groselleronegro": 154,
+    "grosellorojo": 393,
+    "grosularia": 404,
+    "groundjuniper": 155,
+    "groundraspberry": 206,
+    "guaco": 99,
+    "guanabana": 357,
+    "guarana": 197,
+    "guaranaseedextract": 464,
+    "guaranine": 464,
+    "guatemalacoffee": 463,
+    "guava": 142,
+    "guavasteen": 369,
+    "guayaba": 348,
+    "guayabo": 142,
+    "guayabodelpais": 369,
+    "guayule": 187,
+    "guduchi": 517,
+    "guelderrose": 177,
+    "gugilaztilla": 218,
+    "gumarabictree": 135,
+    "gumrockrose": 159,
+    "haa": 199,
+    "habatonka": 482,
+    "hahuacollay": 496,
+    "hairymint": 4,
+    "haldi": 475,
+    "haldihindi": 17,
+    "hamamelis": 150,
+    "hamamelisvirginiana": 150,
+    "hamburgparsley": 7,
+    "hangdoukou": 38,
+    "happymajor": 104,
+    "harielachi": 447,
+    "haworthia": 500,
+    "haworthiaspp": 500,
+    "hawthorn": 122,
+    "haya": 119,
+    "hayacomun": 119,
+    "hazel": 123,
+    "hazelnut": 399,
+    "heartleafsida": 515,
+    "heartleavedmoonseed": 517,
+    "heartsdelight": 24,
+    "heartsease": 248,
+    "heather": 160,
+    "hedgehogconeflower": 202,
+    "heeng": 478,
+    "heimuer": 279,
+    "helba": 32,
+    "helechodeagua": 319,
+    "helechogusuibu": 92,
+    "helianthustuberosus": 220,
+    "hemp": 429,
+    "henandchicks": 487,
+    "henofthewoods": 266,
+    "henogriego": 32,
+    "herbaceoussagewort": 12,
+    "herbadesacervesa": 55,
+    "herbadracera": 12,
+    "herbadragonera": 12,
+    "herbagatera": 56,
+    "herbasana": 5,
+    "herbavinagrera": 12,
+    "hericiumerinaceus": 268,
+    "hibisco": 238,
+    "hibiscussabdariffa": 238,
+    "hidrastis": 206,
+    "hieldelatierra": 263,
+    "hierbaangelica": 26,
+    "hierbaazul": 59,
+    "hierbabacera": 37,
+    "hierbabuena": 5,
+    "hierbabuenadeagua": 313,
+    "hierbacanamera": 207,
+    "hierbadeaquiles": 52,
+    "hierbadecalentura": 39,
+    "hierbadecochino": 208,
+    "hierbadelalechuza": 488,
+    "hierbadelamora": 36,
+    "hierbadelaprincesa": 47,
+    "hierbadelasabejas": 51,
+    "hierbadelasalud": 10,
+    "hierbadelespiritusanto": 26,
+    "hierbadelmudo": 10,
+    "hierbadelosangeles": 26,
+    "hierbadelosgatos": 56,
+    "hierbadelosreyes": 0,
+    "hierbadelpodador": 37,
+    "hierbadelpollo": 188,
+    "hierbademiel": 41,
+    "hierbadesanguillermo": 37,
+    "hierbadesansimon": 97,
+    "hierbadetodoelano": 487,
+    "hierbadulce": 41,
+    "hierbalimon": 39,
+    "hierbalombriguera": 29,
+    "hierbaluisa": 47,
+    "hierbamaestra": 54,
+    "hierbamaravillosa": 488,
+    "hierbameona": 469,
+    "hierbamoramayor": 205,
+    "hierbaolivera": 58,
+    "hierbapulguera": 461,
+    "hierbapuntera": 487,
+    "hierbareal": 0,
+    "hierbasagrada": 254,
+    "hierbasdezorrillo": 35,
+    "highmallow": 49,
+    "higo": 360,
+    "higochumbo": 492,
+    "higodepala": 492,
+    "higomexico": 492,
+    "higuera": 143,
+    "higueradechumbo": 492,
+    "higuerainfernal": 89,
+    "higuerilla": 89,
+    "hijiki": 306,
+    "himalayanviagra": 267,
+    "himematsutake": 274,
+    "hindberry": 390,
+    "hing": 478,
+    "hinojo": 14,
+    "hinojoamargo": 14,
+    "hinojocomun": 14,
+    "hinojodeflorencia": 14,
+    "hinojodulce": 14,
+    "hinojoenrama": 14,
+    "hinojofalso": 451,
+    "hiperico": 65,
+    "hiratake": 276,
+    "hisopillodedosordenes": 28,
+    "hisopillohumedo": 28,
+    "hisopo": 28,
+    "hisopomontesino": 58,
+    "hisoporeal": 28,
+    "hoelen": 273,
+    "hojadelaire": 488,
+    "hojadelimon": 24,
+    "hojafresca": 488,
+    "hojasanta": 189,
+    "hojavidriosa": 488,
+    "holly": 74,
+    "hollyleavedbarberry": 169,
+    "holmoak": 125,
+    "holybasil": 510,
+    "holyghost": 26,
+    "holyherb": 254,
+    "honeybell": 330,
+    "honeydew": 457,
+    "honeyplant": 24,
+    "hongo": 292,
+    "hongoamarillo": 287,
+    "hongoblanco": 272,
+    "hongocoliflor": 285,
+    "hongodeabedul": 269,
+    "hongodelaorejaplateada": 272,
+    "hongodelarbolshii": 265,
+    "hongodelavida": 274,
+    "hongodelyesquero": 281,
+    "hongodenieve": 272,
+    "hongogelatinosoblanco": 272,
+    "hongoorugachino": 267,
+    "hongoostra": 276,
+    "hongopatadecaballo": 281,
+    "hongoyesca": 281,
+    "hongoyesquero": 281,
+    "hoodia": 505,
+    "hoodiagordonii": 505,
+    "hooffungus": 281,
+    "hop": 55,
+    "hornofplenty": 289,
+    "horseradish": 211,
+    "horseradishtree": 101,
+    "horsetail": 64,
+    "hotbasil": 510,
+    "hotmint": 34,
+    "houpumagnolia": 127,
+    "houseleek": 487,
+    "huachuma": 496,
+    "huangqi": 200,
+    "huckleberry": 426,
+    "huevoderey": 294,
+    "huiasampilla": 221,
+    "huisisaj": 223,
+    "huizhuhuachino": 266,
+    "humuluslupulus": 55,
+    "hungarianchamomile": 60,
+    "husera": 164,
+    "hydrastiscanadensis": 206,
+    "hypericumperforatum": 65,
+    "hysopo": 28,
+    "hyssop": 28,
+    "hyssopusofficinalis": 28,
+    "ibia": 223,
+    "icemanfungus": 281,
+    "iesca": 281,
+    "ilexaquifolium": 74,
+    "ilima": 515,
+    "illaku": 222,
+    "illiciumverum": 472,
+    "indianbread": 273,
+    "indiancress": 45,
+    "indiandill": 8,
+    "indianginseng": 205,
+    "indianlilac": 110,
+    "indianlongpepper": 483,
+    "indianparsley": 208,
+    "indianplantainseed": 461,
+    "indianpsyllium": 461,
+    "indiansaffron": 17,
+    "indiantreespurge": 503,
+    "inonotusobliquus": 269,
+    "insam": 77,
+    "ipazote": 35,
+    "ipomoeabatatas": 212,
+    "irishdaisy": 203,
+    "irishmoss": 303,
+    "irispseudacorus": 314,
+    "isabgul": 461,
+    "isano": 224,
+    "isau": 224,
+    "isopo": 28,
+    "isopohortelano": 28,
+    "ispaghul": 461,
+    "ispagula": 461,
+    "italiancypress": 114,
+    "italianparsley": 7,
+    "izote": 190,
+    "jaboncillo": 144,
+    "jabuticaba": 370,
+    "jacintodeagua": 310,
+    "jackpissthebed": 203,
+    "jadeplant": 501,
+    "jalapeno": 470,
+    "jamaicantangelo": 331,
+    "jamaicasorrel": 238,
+    "jammelon": 456,
+    "japaneseartichoke": 232,
+    "japanesebasil": 59,
+    "japanesehoneysuckle": 514,
+    "japanesehorseradish": 42,
+    "japanesepepper": 479,
+    "japanesepersimmon": 398,
+    "japanesepricklyash": 479,
+    "jaquima": 243,
+    "jaramao": 218,
+    "jaranegra": 159,
+    "jarapringosa": 159,
+    "jasminumofficinale": 237,
+    "jasoniaglutinosa": 174,
+    "javagalangal": 38,
+    "javapepper": 484,
+    "jazmin": 237,
+    "jazminamarillo": 258,
+    "jazminamarillogelsemium": 258,
+    "jazminblanco": 237,
+    "jazmincomun": 237,
+    "jazmindeespana": 237,
+    "jazmindepoeta": 237,
+    "jazminfrances": 101,
+    "jazminmorisco": 237,
+    "jebena": 469,
+    "jedrea": 58,
+    "jeera": 15,
+    "jellyear": 279,
+    "jengibre": 18,
+    "jengibredesiam": 38,
+    "jengibresiames": 38,
+    "jerusalemartichoke": 220,
+    "jerusalemsage": 173,
+    "jesuitstea": 35,
+    "jewsear": 279,
+    "jojoba": 191,
+    "jolivert": 7,
+    "juavert": 7,
+    "judassear": 279,
+    "juevert": 7,
+    "jufa": 28,
+    "julivert": 7,
+    "julivertdebosc": 36,
+    "junciana": 210,
+    "juncodeesteras": 93,
+    "juncofino": 93,
+    "juncuseffusus": 93,
+    "juniperuscommunis": 155,
+    "kaahee": 41,
+    "kaajee": 41,
+    "kabayakalina": 345,
+    "kabosu": 338,
+    "kabosujapones": 338,
+    "kadsuralongipedunculata": 98,
+    "kaempferiarotunda": 96,
+    "kaffirlime": 335,
+    "kaffirmelon": 456,
+    "kahana": 463,
+    "kahau": 199,
+    "kaki": 398,
+    "kakipersimmon": 398,
+    "kakiplum": 398,
+    "kalaharimelon": 456,
+    "kalanchoe": 488,
+    "kalanchoepinnata": 488,
+    "kallimoolian": 506,
+    "kalo": 225,
+    "kalongi": 459,
+    "kamala": 458,
+    "kanjang": 233,
+    "kapala": 483,
+    "kape": 463,
+    "kapoktree": 139,
+    "karallamu": 506,
+    "kardakiya": 281,
+    "karduba": 281,
+    "karraspinaarrunt": 290,
+    "katikasira": 483,
+    "kava": 84,
+    "kavakava": 84,
+    "kawaratakejapones": 270,
+    "kawi": 223,
+    "keirn": 126,
+    "kelp": 297,
+    "keylime": 324,
+    "khat": 95,
+    "khatai": 481,
+    "killarneystrawberrytree": 146,
+    "kingbolete": 292,
+    "kingoystermushroom": 284,
+    "kingscrown": 508,
+    "kingtrumpetmushroom": 284,
+    "kinnikinnick": 152,
+    "kion": 18,
+    "kitchensage": 10,
+    "kiwi": 358,
+    "kiwifruit": 358,
+    "kkayacha": 224,
+    "kneeholly": 157,
+    "kohlrabi": 219,
+    "kolanut": 465,
+    "kombu": 304,
+    "konjac": 90,
+    "koreanginseng": 77,
+    "koreanpepper": 479,
+    "kumaru": 482,
+    "kumquat": 326,
+    "kutou": 32,
+    "labrusca": 454,
+    "lacqueredbracket": 264,
+    "lactucavirosa": 91,
+    "ladano": 159,
+    "laetiporussulphureus": 286,
+    "lahual": 133,
+    "lahuan": 133,
+    "lahuanmapudungun": 133,
+    "lakachu": 221,
+    "laksaleaf": 34,
+    "lamaki": 223,
+    "lambmint": 5,
+    "lambrusquera": 454,
+    "laminaria": 297,
+    "laminariaspp": 297,
+    "lampazo": 104,
+    "lampazomayor": 104,
+    "lampwickplant": 173,
+    "lapa": 104,
+    "lapituq": 496,
+    "lappa": 104,
+    "laquchu": 221,
+    "larchbracketmushroom": 271,
+    "largeheadedatractylodes": 226,
+    "larixdecidua": 133,
+    "larreatridentata": 186,
+    "laurel": 9,
+    "laureldeapolo": 9,
+    "laureldedafne": 9,
+    "laurentina": 166,
+    "lauro": 9,
+    "laurusnobilis": 9,
+    "laurustinus": 166,
+    "laurustinusviburnum": 166,
+    "lavanda": 23,
+    "lavandulaangustifolia": 23,
+    "lavangam": 20,
+    "lavender": 23,
+    "lawyerstongue": 499,
+    "lawyerswig": 280,
+    "lazi": 473,
+    "leafbeet": 213,
+    "lebanoncedar": 116,
+    "lecachu": 221,
+    "lechosa": 345,
+    "lechugademar": 307,
+    "lechugasilvestre": 91,
+    "lechugavirosa": 91,
+    "lechuguilla": 203,
+    "legustico": 30,
+    "lemandarin": 339,
+    "lemnaminor": 309,
+    "lemongrass": 39,
+    "lemonverbena": 47,
+    "lendipeepar": 483,
+    "lengkuas": 38,
+    "lenguadebuey": 499,
+    "lenguadesuegra": 499,
+    "lenguadevaca": 499,
+    "lentejadeagua": 309,
+    "lentinulaedodes": 265,
+    "lentisco": 192,
+    "leopardsbane": 242,
+    "lepidiummeyenii": 204,
+    "lessergalangal": 38,
+    "levistico": 30,
+    "levisticumofficinale": 30,
+    "libertadora": 488,
+    "lichi": 352,
+    "licorice": 201,
+    "lifeplant": 488,
+    "lignumrhodium": 508,
+    "ligusticumporteri": 208,
+    "ligustrumvulgare": 163,
+    "lilymushroom": 275,
+    "lilyofthevalley": 259,
+    "lima": 324,
+    "limaaustraliana": 336,
+    "limadecanton": 339,
+    "limadedo": 336,
+    "limakaffir": 375,
+    "limaocravoportuguesbrasil": 339,
+    "limequat": 340,
+    "limon": 320,
+    "limonaria": 39,
+    "limoncillo": 88,
+    "limonera": 24,
+    "limonero": 145,
+    "limonfrances": 327,
+    "limonmexicano": 324,
+    "limonponcil": 327,
+    "limonrugoso": 339,
+    "limonsutil": 324,
+    "limonzon": 325,
+    "limpiaplata": 64,
+    "linaza": 427,
+    "linden": 66,
+    "ling": 160,
+    "lingonberry": 425,
+    "lingzhi": 293,
+    "lingzhichino": 264,
+    "lingzhimushroom": 293,
+    "lino": 427,
+    "linseed": 427,
+    "linumusitatissimum": 427,
+    "lionsmane": 268,
+    "lionstooth": 203,
+    "liquorice": 201,
+    "lirioamarillo": 314,
+    "liriodeaguablanco": 311,
+    "liriodelosvalles": 259,
+    "liriodelosvallesmuguete": 259,
+    "lisbonlemon": 320,
+    "litchichinensis": 352,
+    "lithops": 498,
+    "lithopsspp": 498,
+    "liuche": 129,
+    "liveforever": 487,
+    "liverwort": 37,
+    "livingstones": 498,
+    "llameiro": 126,
+    "llantendeperro": 461,
+    "llantenindio": 461,
+    "llapassa": 104,
+    "llavoretes": 16,
+    "llebistic": 30,
+    "llorer": 9,
+    "lloreru": 9,
+    "lloreu": 9,
+    "llorin": 9,
+    "lloureiro": 9,
+    "llupol": 55,
+    "locote": 470,
+    "locustbean": 136,
+    "loganas": 423,
+    "loganberris": 423,
+    "loganberry": 423,
+    "logma": 362,
+    "lohma": 362,
+    "longpepper": 483,
+    "lonicerajaponica": 514,
+    "lophophorawilliamsii": 489,
+    "loto": 247,
+    "lotosagrado": 247,
+    "louma": 362,
+    "lovage": 30,
+    "loveroot": 208,
+    "luckyplant": 501,
+    "lucma": 362,
+    "lucuma": 362,
+    "lucumochileno": 362,
+    "lumpybracket": 277,
+    "lupios": 55,
+    "lupulo": 55,
+    "luya": 18,
+    "lychee": 352,
+    "lyciumbarbarum": 411,
+    "maca": 204,
+    "macadamiaintegrifolia": 441,
+    "macadamianut": 441,
+    "macamaca": 204,
+    "macambo": 371,
+    "mace": 474,
+    "macis": 474,
+    "mackerelmint": 5,
+    "macona": 429,
+    "madra": 53,
+    "madreselva": 514,
+    "madreselvadejapon": 514,
+    "madrona": 146,
+    "madrone": 146,
+    "madronera": 146,
+    "madrono": 146,
+    "maggiplant": 30,
+    "magnolia": 127,
+    "magnoliabark": 127,
+    "magnoliagrandiflora": 127,
+    "magnoliaofficinalis": 127,
+    "magnoliavine": 509,
+    "magrano": 455,
+    "maguey": 72,
+    "mahogany": 138,
+    "mahonia": 169,
+    "maidenhairtree": 68,
+    "maino": 204,
+    "maitake": 266,
+    "maizdeteja": 243,
+    "majua": 224,
+    "maka": 204,
+    "makadasingi": 506,
+    "makrutlime": 335,
+    "malacaton": 384,
+    "malacatonero": 384,
+    "malagueta": 476,
+    "malanga": 225,
+    "malavadisco": 207,
+    "maldevisco": 207,
+    "malobispo": 207,
+    "malojillo": 39,
+    "malovisco": 207,
+    "malpighiaemarginata": 381,
+    "malungay": 101,
+    "malusdomestica": 382,
+    "malva": 49,
+    "malvablanca": 49,
+    "malvacomun": 49,
+    "malvamorada": 49,
+    "malvarisco": 207,
+    "malvasylvestris": 49,
+    "malvavisco": 207,
+    "mamey": 364,
+    "mamichamoya": 199,
+    "mammeaamericana": 364,
+    "mamonchino": 353,
+    "mandanga": 429,
+    "mandarin": 323,
+    "mandarina": 323,
+    "mandarinaacida": 339,
+    "mandarinlime": 339,
+    "mandarinorange": 323,
+    "mandioca": 231,
+    "manganakodu": 506,
+    "manglanera": 455,
+    "manglano": 455,
+    "mango": 347,
+    "mangopowder": 481,
+    "mani": 453,
+    "manjerona": 11,
+    "manzana": 382,
+    "manzanal": 382,
+    "manzanar": 382,
+    "manzanera": 382,
+    "manzanero": 382,
+    "manzanilla": 60,
+    "manzanillaalemana": 60,
+    "manzanillacimarrona": 60,
+    "manzanillacomun": 60,
+    "manzanilladearagon": 60,
+    "manzanilladecastilla": 60,
+    "manzanillon": 53,
+    "manzanita": 381,
+    "manzano": 382,
+    "mapajataino": 345,
+    "mapayamaipure": 345,
+    "maple": 117,
+    "maracuja": 349,
+    "maracuya": 349,
+    "maranon": 439,
+    "marduix": 11,
+    "margarita": 246,
+    "margosa": 110,
+    "mariapastora": 10,
+    "marigold": 262,
+    "marijuana": 429,
+    "marjoram": 11,
+    "marjorama": 11,
+    "marmaladeorange": 240,
+    "marshmallow": 207,
+    "mashua": 224,
+    "mashwa": 224,
+    "mastuerzo": 45,
+    "mastuerzodeindias": 45,
+    "matafaluga": 16,
+    "matagallo": 173,
+    "matalafuga": 16,
+    "matalauva": 16,
+    "matapollo": 176,
+    "mate": 69,
+    "matricariachamomilla": 60,
+    "matricariarecutita": 60,
+    "matsuhodo": 273,
+    "matzatlinahuatl": 346,
+    "mayorana": 11,
+    "maypop": 70,
+    "mayro": 225,
+    "maytree": 122,
+    "mazzardcherry": 386,
+    "mburucuya": 70,
+    "mburucuyaguarani": 349,
+    "meadowsweet": 51,
+    "meadowwort": 51,
+    "meadwort": 51,
+    "mediterraneancypress": 114,
+    "mediterraneanmedlar": 170,
+    "mediterraneansmilax": 156,
+    "meetingseed": 8,
+    "mejorama": 11,
+    "mejorana": 11,
+    "mejoranasilvestre": 3,
+    "melaleucaalternifolia": 128,
+    "melenadeleon": 268,
+    "melilot": 257,
+    "meliloto": 257,
+    "melilotusofficinalis": 257,
+    "melisa": 24,
+    "melisaverde": 59,
+    "melissabalm": 24,
+    "mello": 14,
+    "melocotondelostropicos": 347,
+    "melocotonero": 384,
+    "melocotonplano": 396,
+    "melogold": 334,
+    "melon": 457,
+    "melondeagua": 456,
+    "melonera": 457,
+    "membrillero": 193,
+    "membrillo": 388,
+    "mendaro": 11,
+    "mengranero": 455,
+    "menta": 4,
+    "mentaacuatica": 313,
+    "mentadejardin": 5,
+    "mentadelconsol": 5,
+    "mentadelesfaves": 5,
+    "mentamagica": 10,
+    "mentamelisa": 24,
+    "mentaperrera": 4,
+    "mentapiperita": 4,
+    "mentaromana": 4,
+    "menthaaquatica": 313,
+    "menthapiperita": 4,
+    "menthapulegium": 78,
+    "menthaspicata": 5,
+    "mercadela": 44,
+    "meridianfennel": 450,
+    "meruendano": 73,
+    "mescal": 489,
+    "mescalbuttons": 489,
+    "meshima": 283,
+    "meshimakobu": 283,
+    "mexicanelderberry": 161,
+    "mexicanfencepost": 491,
+    "mexicanhawthorn": 122,
+    "mexicanlime": 324,
+    "mexicanmarigold": 262,
+    "mexicansnowball": 493,
+    "mexicantea": 35,
+    "mexicanwitchhazel": 150,
+    "michu": 144,
+    "mickeymelon": 456,
+    "mikaniaglomerata": 99,
+    "milenrama": 52,
+    "milenramayarrow": 255,
+    "milflores": 52,
+    "milgrano": 455,
+    "milhojas": 52,
+    "milkbush": 503,
+    "milkvetch": 200,
+    "milkwort": 235,
+    "milluku": 222,
+    "mingranera": 359,
+    "miracleleaf": 488,
+    "mirasol": 243,
+    "miristica": 468,
+    "mirtillo": 73,
+    "mirtilo": 73,
+    "mirto": 158,
+    "miruendano": 73,
+    "mocambo": 462,
+    "mocha": 199,
+    "mollericdecalceta": 287,
+    "monardadidyma": 43,
+    "moneyplant": 501,
+    "mongolianmilkvetch": 200,
+    "monkeyheadmushroom": 268,
+    "monkeypuzzletree": 132,
+    "monkscress": 45,
+    "monteyuyo": 4,
+    "mora": 392,
+    "moradecastilla": 392,
+    "moraduix": 11,
+    "moraja": 203,
+    "moral": 147,
+    "moralogan": 423,
+    "morchellaesculenta": 290,
+    "morel": 290,
+    "morelmushroom": 290,
+    "moreranegra": 147,
+    "morilla": 290,
+    "morindacitrifolia": 194,
+    "moringa": 101,
+    "moringaoleifera": 101,
+    "morquera": 27,
+    "morrino": 386,
+    "morusnigra": 147,
+    "mosquitofern": 319,
+    "mossystonecrop": 494,
+    "mostaza": 469,
+    "mostazanegra": 33,
+    "mota": 429,
+    "motabelar": 29,
+    "mountainash": 126,
+    "mountainblueberry": 73,
+    "mountainsavory": 27,
+    "mountaintobacco": 242,
+    "muer": 279,
+    "muguete": 259,
+    "mugwort": 53,
+    "mullein": 48,
+    "mundillo": 177,
+    "murgula": 290,
+    "murgulagrisa": 290,
+    "murta": 158,
+    "murtilla": 420,
+    "murugula": 290,
+    "musaacuminatareddacca": 378,
+    "musgodeirlanda": 303,
+    "mushroomoflife": 274,
+    "muskmelon": 457,
+    "muskratroot": 209,
+    "myrciariacauliflora": 370,
+    "myrciariadubia": 367,
+    "myrobalan": 513,
+    "naba": 215,
+    "nabo": 215,
+    "nabodecanarios": 215,
+    "nabolza": 215,
+    "nabon": 218,
+    "nabosilvestre": 215,
+    "nagamikumquat": 326,
+    "nakedlady": 503,
+    "name": 225,
+    "nampi": 225,
+    "nanatupi": 346,
+    "naranja": 321,
+    "naranjachina": 326,
+    "naranjadesevilla": 240,
+    "naranjaenana": 326,
+    "naranjajaponesa": 326,
+    "naranjatangelo": 330,
+    "naranjero": 321,
+    "naranjoagrio": 148,
+    "naranjoamargo": 148,
+    "naranjodulce": 321,
+    "naranjoenano": 326,
+    "naranjominiatura": 329,
+    "narizdecarbon": 269,
+    "nashi": 405,
+    "nasturtium": 45,
+    "nasturtiumofficinale": 312,
+    "navelorange": 321,
+    "navios": 224,
+    "navo": 224,
+    "nectarina": 395,
+    "needlepalm": 495,
+    "neem": 110,
+    "negrillo": 87,
+    "neguilla": 459,
+    "nelumbo": 458,
+    "nenufarblanco": 311,
+    "nepheliumlappaceum": 353,
+    "nettle": 79,
+    "newmexicanelderberry": 161,
+    "newzealandyam": 223,
+    "nigela": 31,
+    "nightbloomingcereus": 486,
+    "nim": 110,
+    "nimhindi": 110,
+    "nimtree": 110,
+    "ninjin": 77,
+    "nispero": 397,
+    "nogal": 120,
+    "nogalcomun": 120,
+    "nogaldeljapon": 68,
+    "noguera": 120,
+    "noni": 194,
+    "nopal": 485,
+    "nopalcardon": 507,
+    "nopaldecastilla": 492,
+    "nori": 299,
+    "norotil": 51,
+    "norwegianangelica": 26,
+    "nosebleed": 52,
+    "nuez": 434,
+    "nuezdebrasil": 437,
+    "nuezdecola": 465,
+    "nuezdelaisla": 438,
+    "nuezdemacadamia": 441,
+    "nuezencarcelada": 438,
+    "nuezmoscada": 468,
+    "nuezpecana": 438,
+    "nutmeg": 468,
+    "nymphaeaalba": 311,
+    "obi": 465,
+    "oca": 223,
+    "ocimumbasilicum": 0,
+    "ocimumtenuiflorum": 510,
+    "oenotherabiennis": 261,
+    "officialburnet": 36,
+    "oilgrass": 39,
+    "oldfashionedrosegeranium": 252,
+    "oldmanspepper": 52,
+    "oldwoman": 54,
+    "oleaeuropaea": 109,
+    "oliva": 109,
+    "olivardilla": 174,
+    "olivera": 109,
+    "olivetree": 109,
+    "olivo": 109,
+    "olluco": 222,
+    "olmo": 87,
+    "omicha": 509,
+    "omija": 509,
+    "onagra": 261,
+    "oneseedhawthorn": 122,
+    "onkucha": 225,
+    "opiumlettuce": 91,
+    "opuntiastreptacantha": 507,
+    "orange": 321,
+    "orangebarkmyrtle": 180,
+    "orangeroot": 206,
+    "orchardapple": 382,
+    "oreganin": 3,
+    "oregano": 3,
+    "oreganobrujo": 3,
+    "oreganocomun": 3,
+    "oreganodelatierra": 3,
+    "oreganofrances": 3,
+    "oreganomayor": 11,
+    "oreganonano": 3,
+    "oreganoorejon": 3,
+    "oreganotrenzado": 3,
+    "oreganoturco": 3,
+    "oregongrape": 169,
+    "orejablancadelasnubes": 272,
+    "orejadeburro": 48,
+    "orejadejudas": 279,
+    "orejadejudio": 279,
+    "orejadelana": 279,
+    "orejadelasnieves": 272,
+    "orejadeliebre": 173,
+    "orejadeplata": 272,
+    "orellana": 276,
+    "orellazos": 290,
+    "orenga": 3,
+    "organo": 491,
+    "organpipecactus": 491,
+    "orientalpersimmon": 398,
+    "origanummajorana": 11,
+    "origanumvulgare": 3,
+    "ornamentalpepper": 470,
+    "oroblanco": 333,
+    "oronja": 294,
+    "orosus": 201,
+    "oroval": 205,
+    "orozus": 201,
+    "orozuz": 201,
+    "orpinrose": 508,
+    "ortiga": 79,
+    "ortigamayor": 79,
+    "orval": 205,
+    "osha": 208,
+    "otsalizarraeuskera": 126,
+    "ovalkumquat": 326,
+    "oxalistuberosa": 223,
+    "oxtongue": 499,
+    "oystermushroom": 276,
+    "pachycereusmarginatus": 491,
+    "paddymelon": 456,
+    "padma": 458,
+    "paico": 35,
+    "pajete": 39,
+    "palmaaguja": 495,
+    "palmaimperial": 29,
+    "palmariapalmata": 300,
+    "palodul": 201,
+    "palodulce": 201,
+    "paloduz": 201,
+    "palojeringa": 101,
+    "palosanto": 398,
+    "pampajarito": 494,
+    "pampanilla": 36,
+    "pamplemusa": 325,
+    "panamaorange": 329,
+    "panaxginseng": 77,
+    "panaxquinquefolius": 518,
+    "pandanustectorius": 380,
+    "pandecuco": 494,
+    "pandesanjuan": 136,
+    "panecillos": 49,
+    "pansy": 248,
+    "papadelaire": 327,
+    "papadepobre": 327,
+    "papaiootomaco": 345,
+    "papalisa": 222,
+    "papaoca": 223,
+    "papaverrhoeas": 82,
+    "papaya": 345,
+    "paprika": 470,
+    "paradiseapple": 382,
+    "paraguayas": 384,
+    "paraguayo": 396,
+    "paraguayos": 384,
+    "parchita": 349,
+    "parraborde": 389,
+    "parracultivada": 454,
+    "parradeuvas": 454,
+    "parral": 454,
+    "parrasilvestre": 389,
+    "parrena": 454,
+    "parrera": 454,
+    "parsley": 7,
+    "parsnip": 216,
+    "partheniumargentatum": 187,
+    "pasiflora": 70,
+    "pasionaria": 70,
+    "passifloraedulis": 349,
+    "passifloraincarnata": 70,
+    "passionflower": 70,
+    "pastinaca": 216,
+    "pastinacasativa": 216,
+    "pastocedron": 39,
+    "pastocitronella": 39,
+    "pastodelimon": 39,
+    "pastolimon": 39,
+    "pataca": 220,
+    "patadecuervo": 215,
+    "patagoniancypress": 133,
+    "pataxte": 462,
+    "patilla": 456,
+    "patxaraneuskera": 408,
+    "pazote": 35,
+    "peach": 384,
+    "peanut": 453,
+    "pear": 383,
+    "pearloystermushroom": 276,
+    "pearlydots": 500,
+    "pebbleplants": 498,
+    "pebreta": 31,
+    "pebretera": 31,
+    "pecan": 438,
+    "pedunculateoak": 118,
+    "peeabed": 203,
+    "pehuen": 132,
+    "peladillo": 395,
+    "pelargoniumgraveolens": 252,
+    "pelonchili": 45,
+    "pelosilla": 461,
+    "pempinela": 36,
+    "penca": 485,
+    "penciltree": 503,
+    "pennybun": 292,
+    "pennyroyal": 78,
+    "pensamiento": 248,
+    "peonia": 253,
+    "peoniablanca": 229,
+    "peoniahibrida": 229,
+    "pepitas": 430,
+    "pepitasdecalabaza": 430,
+    "pepperbark": 129,
+    "peppermint": 4,
+    "pepperoncini": 470,
+    "pepperroot": 211,
+    "pepperturnip": 211,
+    "peppervine": 484,
+    "pera": 383,
+    "peradecactus": 485,
+    "peradelbey": 43,
+    "peral": 149,
+    "peralcomun": 149,
+    "perdeklou": 498,
+    "perejil": 7,
+    "perejilbravio": 52,
+    "perejilcomun": 7,
+    "perejildegitano": 14,
+    "perejilfrances": 25,
+    "perejilrizado": 7,
+    "perejon": 383,
+    "perejonal": 383,
+    "perifollo": 25,
+    "perigordtruffle": 291,
+    "perilla": 59,
+    "perillafrutescens": 59,
+    "perillamint": 59,
+    "pero": 382,
+    "persiancumin": 450,
+    "persiancypress": 114,
+    "persianhyssop": 175,
+    "persianwalnut": 120,
+    "persicariaodorata": 34,
+    "persimmon": 398,
+    "persimo": 398,
+    "persimon": 398,
+    "peruvianginseng": 204,
+    "peruvianparsnip": 221,
+    "petroselinumcrispum": 7,
+    "peumusboldus": 106,
+    "pewen": 132,
+    "pewenmapudungun": 132,
+    "peyote": 489,
+    "phakphai": 34,
+    "phellinuslinteus": 283,
+    "philippinelime": 329,
+    "phlomislychnitis": 173,
+    "physalisphiladelphica": 373,
+    "picaespalda": 85,
+    "pickleweed": 308,
+    "picoto": 386,
+    "piedrasvivas": 498,
+    "piedrasvivientes": 498,
+    "piemelon": 456,
+    "pieplant": 40,
+    "piescar": 384,
+    "pigeonwings": 256,
+    "pimentadioica": 476,
+    "pimenterojapones": 479,
+    "pimenton": 470,
+    "pimienta": 467,
+    "pimientachiapa": 476,
+    "pimientadecayena": 473,
+    "pimientadejamaica": 476,
+    "pimientadejava": 484,
+    "pimientadesichuan": 479,
+    "pimientadetabasco": 476,
+    "pimientaguayabita": 476,
+    "pimientalarga": 483,
+    "pimientamalaguetadelasantillas": 476,
+    "pimientanegra": 467,
+    "pimiento": 470,
+    "pimientodeherbon": 470,
+    "pimientodepadron": 470,
+    "pimientodulce": 470,
+    "pimientomorron": 470,
+    "pimpineladelosprados": 36,
+    "pimpinelamayor": 36,
+    "pina": 346,
+    "pincel": 50,
+    "pineappleguava": 369,
+    "pinenut": 440,
+    "pinestrawberry": 391,
+    "pinetell": 287,
+    "pinillo": 64,
+    "pinklotus": 247,
+    "pino": 115,
+    "pinoalbar": 115,
+    "pinoaraucano": 132,
+    "pinoaraucaria": 132,
+    "pinobermejo": 115,
+    "pinochileno": 132,
+    "pinodebrazos": 132,
+    "pinodelnorte": 115,
+    "pinodeneuquen": 132,
+    "pinodevalsain": 115,
+    "pinodoncel": 440,
+    "pinomanso": 440,
+    "pinon": 440,
+    "pinonero": 132,
+    "pinonwormwood": 12,
+    "pinopinonero": 440,
+    "pinorojo": 115,
+    "pinoserrano": 115,
+    "pinosilvestre": 115,
+    "pinudionddolikin": 287,
+    "pinuela": 487,
+    "pinuspinea": 440,
+    "pinussylvestris": 115,
+    "piorno": 171,
+    "pipa": 282,
+    "pipal": 483,
+    "pipas": 430,
+    "pipasdegirasol": 243,
+    "piperauritum": 189,
+    "pipercubeba": 484,
+    "piperlongum": 483,
+    "pipermethysticum": 84,
+    "pipernigrum": 467,
+    "pipli": 483,
+    "pippali": 483,
+    "pirlitero": 170,
+    "pissybeds": 203,
+    "pistachio": 436,
+    "pistacho": 436,
+    "pistacialentiscus": 192,
+    "pistaciavera": 436,
+    "pita": 492,
+    "pitahaya": 351,
+    "pitahayaamarilla": 486,
+    "pitahayaroja": 486,
+    "pitajaya": 486,
+    "pitaperfoliada": 490,
+    "pitaya": 486,
+    "pitayademayo": 486,
+    "pitayaxoconostle": 486,
+    "pitazabila": 490,
+    "pito": 429,
+    "pitoreta": 4,
+    "pituca": 225,
+    "pituda": 4,
+    "pizoya": 199,
+    "plantadejade": 501,
+    "plantadelrosario": 502,
+    "plantadulce": 41,
+    "plantagodela": 461,
+    "plantagoovata": 461,
+    "plantaspiedra": 498,
+    "plantaventana": 497,
+    "plataformadeazufre": 286,
+    "pleurotoostra": 276,
+    "pleurotuseryngii": 284,
+    "pleurotusostreatus": 276,
+    "plum": 385,
+    "plumajillo": 52,
+    "plumajo": 52,
+    "pochote": 139,
+    "poetsjasmine": 237,
+    "poisongooseberry": 205,
+    "poleo": 78,
+    "poleomenta": 78,
+    "poliporoazufrado": 286,
+    "poliporoensombrilla": 277,
+    "pollodelosbosques": 286,
+    "polvodemangoseco": 481,
+    "polvodemangosecoamchur": 481,
+    "polygala": 235,
+    "polygalatenuifolia": 235,
+    "polyporusumbellatus": 277,
+    "pomarrosa": 372,
+    "pomelo": 325,
+    "pomelochino": 325,
+    "pompommushroom": 268,
+    "poormansginseng": 227,
+    "populusnigra": 140,
+    "porcini": 292,
+    "poria": 273,
+    "poriacocos": 273,
+    "porphyraspp": 299,
+    "porro": 429,
+    "porterslovage": 208,
+    "potmarigold": 44,
+    "potmarjoram": 3,
+    "pouterialucuma": 362,
+    "pouteriasapota": 363,
+    "praewleaf": 34,
+    "preservingmelon": 456,
+    "pricklypearcactus": 507,
+    "prideofthemeadow": 51,
+    "prifolio": 25,
+    "primavera": 249,
+    "primrose": 249,
+    "primulaveris": 249,
+    "prisco": 387,
+    "prunal": 385,
+    "pruneplum": 385,
+    "pruno": 385,
+    "prunusarmeniaca": 387,
+    "prunusavium": 386,
+    "prunusdomestica": 385,
+    "prunuspersica": 384,
+    "prunuspersicavarnucipersica": 395,
+    "prunuspersicavarplatycarpa": 396,
+    "prytree": 239,
+    "psyllium": 461,
+    "psylliumrubio": 461,
+    "puel": 224,
+    "pummelo": 325,
+    "pumpkinseeds": 430,
+    "puncturevine": 520,
+    "purpleconeflower": 202,
+    "purpleleafgrape": 389,
+    "purplepassionflower": 70,
+    "purpleperilla": 59,
+    "purpleshiso": 59,
+    "pyruspyrifolia": 405,
+    "queenanneslace": 214,
+    "queenofthemeadow": 51,
+    "queliteapestoso": 35,
+    "quercusilex": 125,
+    "quercusrobur": 118,
+    "quercussuber": 124,
+    "quesitos": 49,
+    "quetri": 180,
+    "quetrimapudungun": 180,
+    "queza": 60,
+    "quiba": 223,
+    "quickthorn": 122,
+    "quina": 130,
+    "quinaquinaquechua": 130,
+    "quince": 388,
+    "quinineconk": 271,
+    "quinoto": 326,
+    "raba": 215,
+    "rabaneta": 218,
+    "rabanete": 218,
+    "rabanito": 218,
+    "rabano": 218,
+    "rabanoblanco": 215,
+    "rabanodecaballo": 211,
+    "rabanopicante": 211,
+    "rabanopicantejapones": 42,
+    "rabanorusticano": 211,
+    "rabillo": 28,
+    "rabillodegato": 28,
+    "racacha": 221,
+    "radish": 218,
+    "raizpicante": 211,
+    "rakacha": 221,
+    "rambutan": 353,
+    "ramshead": 266,
+    "rangpur": 339,
+    "rangpurlime": 339,
+    "raphanussativus": 218,
+    "raspanera": 73,
+    "raspano": 73,
+    "raspberry": 390,
+    "raspona": 73,
+    "rasponera": 73,
+    "rastrera": 152,
+    "rauram": 34,
+    "rebozuelo": 288,
+    "recao": 448,
+    "redbeet": 213,
+    "redcole": 211,
+    "redpepper": 470,
+    "redpoppy": 82,
+    "redraspberry": 390,
+    "redseededcitron": 456,
+    "redsorrel": 238,
+    "regalicia": 201,
+    "regaliz": 201,
+    "rehmannia": 228,
+    "rehmanniaglutinosa": 228,
+    "reinadelosprados": 51,
+    "reishi": 264,
+    "reishimushroom": 293,
+    "remolacha": 213,
+    "renshen": 77,
+    "respingon": 104,
+    "retamanegra": 171,
+    "rhamnusalaternus": 179,
+    "rheumrhabarbarum": 40,
+    "rhodiola": 508,
+    "rhodiolarosea": 508,
+    "rhubarb": 40,
+    "rhuscoriaria": 477,
+    "ricino": 89,
+    "ricinuscommunis": 89,
+    "riversidewormwood": 53,
+    "roble": 118,
+    "roblealbar": 118,
+    "roblecarballo": 118,
+    "roblecarvallo": 118,
+    "roblecomun": 118,
+    "robledeeslavonia": 118,
+    "robleeuropeo": 118,
+    "roblefresnal": 118,
+    "roblepedunculado": 118,
+    "rockmelon": 457,
+    "rocktea": 174,
+    "rodiola": 508,
+    "romero": 1,
+    "romeroblanco": 1,
+    "romerocomun": 1,
+    "romerohembra": 1,
+    "romeromacho": 1,
+    "rootparsley": 7,
+    "rosa": 236,
+    "rosacanina": 172,
+    "rosacaninaescaramujo": 172,
+    "rosadealabastro": 493,
+    "rosadecastilla": 236,
+    "rosadedamasco": 236,
+    "rosadejamaica": 238,
+    "rosagallica": 236,
+    "rosalbravio": 85,
+    "rosalcomun": 85,
+    "rosaldealejandria": 236,
+    "rosamistica": 250,
+    "rosariodeperlas": 502,
+    "rosegeranium": 252,
+    "roselle": 238,
+    "rosemary": 1,
+    "roseroot": 508,
+    "rosescentgeranium": 252,
+    "rosmarinusofficinalis": 1,
+    "roughbindweed": 156,
+    "rowan": 126,
+    "royalsunagaricus": 274,
+    "rua": 57,
+    "ruba": 222,
+    "rubarbo": 40,
+    "rubusfruticosusxridaeus": 424,
+    "rubusidaeus": 390,
+    "rubusloganobaccus": 423,
+    "rubusursinusidaeus": 422,
+    "ruda": 57,
+    "rudacomun": 57,
+    "rudacultivada": 57,
+    "rudadehojasanchas": 57,
+    "ruddles": 44,
+    "rue": 57,
+    "ruibarbo": 40,
+    "ruibarbre": 40,
+    "rusco": 157,
+    "ruscusaculeatus": 157,
+    "rutagraveolens": 57,
+    "sabbathdayposy": 8,
+    "sabia": 10,
+    "sabila": 490,
+    "sabora": 27,
+    "saborida": 58,
+    "sabugo": 161,
+    "sabugueiro": 161,
+    "saccharinajaponica": 304,
+    "sadurija": 27,
+    "saffron": 22,
+    "sage": 10,
+    "sajolida": 58,
+    "sakaupohnpei": 84,
+    "saladburnet": 36,
+    "salguero": 107,
+    "salicornia": 308,
+    "salicorniaeuropaea": 308,
+    "salimafina": 10,
+    "salixspp": 71,
+    "sallyd": 10,
+    "salva": 10,
+    "salvacruz": 10,
+    "salve": 10,
+    "salvia": 10,
+    "salviablanca": 10,
+    "salviacimarrona": 10,
+    "salviadelpais": 10,
+    "salviadeplaya": 10,
+    "salviaencruz": 10,
+    "salviafina": 10,
+    "salviahispanica": 428,
+    "salviahortense": 10,
+    "salviaofficinalis": 10,
+    "salviareal": 173,
+    "sandalo": 81,
+    "sandalwood": 81,
+    "sandia": 456,
+    "sandiita": 457,
+    "sang": 518,
+    "sanghwang": 283,
+    "sangrededrago": 131,
+    "sangredegrado": 131,
+    "sanguesa": 390,
+    "sangueso": 390,
+    "sanguina": 36,
+    "sanguinary": 52,
+    "sanguino": 165,
+    "sanguisorba": 36,
+    "sanguisorbamayor": 36,
+    "sanguisorbaofficinalis": 36,
+    "sanpedro": 496,
+    "sanpedrocactus": 496,
+    "sansho": 479,
+    "santalumalbum": 81,
+    "santoreggiamontana": 27,
+    "sapindussaponaria": 144,
+    "sapotadosolimoes": 362,
+    "sargassumfusiforme": 306,
+    "saril": 238,
+    "sarrapia": 482,
+    "sarsaparrilla": 230,
+    "satamuli": 519,
+    "satawar": 519,
+    "satsuma": 323,
+    "saturagon": 58,
+    "saturejahortensis": 58,
+    "saturejamontana": 27,
+    "saturnpeach": 396,
+    "satyrsbeard": 268,
+    "sauce": 107,
+    "saucegatillo": 151,
+    "sauceplateado": 107,
+    "sauco": 161,
+    "saunf": 449,
+    "sauqueiro": 161,
+    "sauquillo": 177,
+    "sauzgatillo": 151,
+    "savory": 58,
+    "schisandra": 509,
+    "schisandrachinensis": 509,
+    "schizophyllumcommune": 278,
+    "scotchbroom": 171,
+    "scotchheather": 160,
+    "scotchmarigold": 44,
+    "scotchpine": 115,
+    "scotspine": 115,
+    "seaasparagus": 308,
+    "sealettuce": 307,
+    "sedum": 494,
+    "sedumacre": 494,
+    "segnexante": 471,
+    "sellodeoro": 206,
+    "semeruco": 381,
+    "semillaparapajaros": 215,
+    "semillasdealcaravea": 450,
+    "semillasdeamapola": 442,
+    "semillasdeanis": 449,
+    "semillasdeapio": 444,
+    "semillasdecacao": 462,
+    "semillasdecafe": 463,
+    "semillasdecafegrano": 463,
+    "semillasdecalabaza": 430,
+    "semillasdecardamomo": 447,
+    "semillasdecilantro": 448,
+    "semillasdecomino": 446,
+    "semillasdeeneldo": 451,
+    "semillasdefenogreco": 452,
+    "semillasdegirasol": 431,
+    "semillasdegranada": 455,
+    "semillasdegranadasecasanardana": 455,
+    "semillasdeguarana": 464,
+    "semillasdehinojo": 445,
+    "semillasdeloto": 458,
+    "semillasdemelon": 457,
+    "semillasdemostaza": 443,
+    "semillasdenigella": 459,
+    "semillasdenigellacominonegro": 459,
+    "semillasdepsyllium": 461,
+    "semillasdesandia": 456,
+    "semillasdeuva": 454,
+    "sempervivumtectorum": 487,
+    "senecasnakeroot": 235,
+    "senecio": 502,
+    "seneciorowleyanus": 502,
+    "senorita": 58,
+    "senyoridadejardi": 58,
+    "serai": 39,
+    "serba": 407,
+    "serbal": 126,
+    "serbaldecazadores": 416,
+    "serbaldeloscazadores": 416,
+    "serrano": 470,
+    "sesameseeds": 432,
+    "sesamo": 432,
+    "sesamumindicum": 432,
+    "setachina": 265,
+    "setacoliflor": 285,
+    "setadeagujadeoro": 275,
+    "setadecalabaza": 292,
+    "setadecardo": 284,
+    "setadecuaresma": 290,
+    "setadedios": 274,
+    "setadellama": 275,
+    "setadeostra": 276,
+    "setaderio": 266,
+    "setadetinta": 280,
+    "setatornillo": 286,
+    "shaddock": 325,
+    "shaggyinkcap": 280,
+    "sharonfruit": 398,
+    "shatavari": 519,
+    "sheepshead": 266,
+    "shengjiang": 18,
+    "shigoka": 233,
+    "shiitake": 265,
+    "shikshoodham": 161,
+    "shiso": 59,
+    "shoga": 18,
+    "siameseginger": 38,
+    "siberianapricot": 387,
+    "siberianginseng": 233,
+    "sichuanpepper": 479,
+    "sicklefruitfenugreek": 32,
+    "sidacordifolia": 515,
+    "siempreviva": 487,
+    "siemprevivamayor": 487,
+    "siemprevivapicante": 494,
+    "silam": 59,
+    "silkgrass": 495,
+    "silkywormwood": 12,
+    "silverbirch": 113,
+    "silverearfungus": 272,
+    "simmondsiachinensis": 191,
+    "sindria": 456,
+    "singleseededhawthorn": 122,
+    "sisbikkaax": 471,
+    "skaappootjie": 498,
+    "skeg": 385,
+    "slipperyjack": 287,
+    "sloe": 408,
+    "sloecherry": 408,
+    "smellage": 30,
+    "smilaxaspera": 156,
+    "smilaxofficinalis": 230,
+    "smoothleafelm": 87,
+    "smoothskinnedkiwifruit": 358,
+    "snowballtree": 177,
+    "snowear": 272,
+    "snowfungus": 272,
+    "soapberry": 144,
+    "softrush": 93,
+    "solanumbetaceum": 374,
+    "soldierswoundwort": 52,
+    "songgen": 283,
+    "sorbusdomestica": 407,
+    "southernbluegum": 63,
+    "southernwood": 54,
+    "spadeleaf": 512,
+    "spanishbayonet": 495,
+    "spanishoregano": 175,
+    "sparassiscrispa": 285,
+    "spearmint": 5,
+    "spindle": 164,
+    "spirulina": 295,
+    "splitgill": 278,
+    "splitgillmushroom": 278,
+    "spongemorel": 290,
+    "spoonleafyucca": 495,
+    "spurgeflax": 176,
+    "stachysaffinis": 232,
+    "stapelia": 504,
+    "stapeliagigantea": 504,
+    "staranise": 472,
+    "staraniseed": 472,
+    "staraniseseed": 472,
+    "starfishflower": 504,
+    "starflower": 46,
+    "starofanise": 472,
+    "starwindowplant": 500,
+    "stevia": 41,
+    "steviarebaudiana": 41,
+    "sticklewort": 37,
+    "stickybun": 287,
+    "stingingnettle": 79,
+    "stingnose": 211,
+    "stjohnsbread": 136,
+    "stjohnswort": 65,
+    "stockmelon": 456,
+    "storkalanga": 38,
+    "strawberry": 391,
+    "strawberrymadrone": 146,
+    "strawberrypear": 486,
+    "strawberrytree": 146,
+    "stringofbeads": 502,
+    "stringofpearls": 502,
+    "sudachi": 337,
+    "sudachijapones": 337,
+    "sugarleaf": 41,
+    "sugarmaple": 117,
+    "suillusluteus": 287,
+    "sulluku": 144,
+    "sulphurpolypore": 286,
+    "sulphurshelf": 286,
+    "sumac": 477,
+    "summerjasmine": 237,
+    "summersavory": 58,
+    "sunchoke": 220,
+    "sunflowerseeds": 243,
+    "sunmushroom": 274,
+    "sunroot": 220,
+    "supiztekoardagai": 281,
+    "sweetalmond": 137,
+    "sweetbalm": 24,
+    "sweetbasil": 0,
+    "sweetbay": 9,
+    "sweetcherry": 386,
+    "sweetclover": 257,
+    "sweetfennel": 14,
+    "sweetflag": 209,
+    "sweetherbofparaguay": 41,
+    "sweethoneyleaf": 41,
+    "sweetie": 332,
+    "sweetleaf": 41,
+    "sweetmarjoram": 11,
+    "sweetmelon": 457,
+    "sweetorange": 321,
+    "sweetpepper": 470,
+    "sweetpotato": 212,
+    "sweetscentedgeranium": 252,
+    "sweetviolet": 241,
+    "sweetwood": 201,
+    "swieteniamahagoni": 138,
+    "swinessnout": 203,
+    "syzygiumjambos": 372,
+    "tabacodemontana": 242,
+    "tablegrape": 454,
+    "tacodereina": 45,
+    "tageteserecta": 262,
+    "tagua": 482,
+    "taigaroot": 233,
+    "tamarillo": 374,
+    "tamarindo": 355,
+    "tamarindusindica": 355,
+    "tamrhindiarabe": 355,
+    "tanacet": 29,
+    "tanaceto": 29,
+    "tanacetumparthenium": 29,
+    "tanacetumvulgare": 29,
+    "tanarida": 29,
+    "tangelo": 330,
+    "tangerine": 323,
+    "tansi": 29,
+    "tansy": 29,
+    "tapaculos": 85,
+    "tapiro": 161,
+    "taro": 225,
+    "taronger": 321,
+    "tarongina": 24,
+    "taronji": 24,
+    "tarrago": 12,
+    "tarragon": 12,
+    "tasmanianbluegum": 63,
+    "taxusbaccata": 121,
+    "tayberry": 424,
+    "teatree": 128,
+    "tedearagon": 174,
+    "tedejardin": 10,
+    "tedelimon": 39,
+    "tedementa": 4,
+    "tedemilpa": 35,
+    "tederoca": 174,
+    "teja": 108,
+    "tejanegra": 108,
+    "tejo": 121,
+    "tejocote": 122,
+    "tella": 108,
+    "temoruno": 10,
+    "temu": 180,
+    "texa": 108,
+    "texao": 45,
+    "thaiginger": 38,
+    "theobromabicolor": 371,
+    "theobromagrandiflorum": 368,
+    "thornyburr": 104,
+    "thousandleaf": 52,
+    "thymbracapitata": 175,
+    "thymusvulgaris": 2,
+    "tibetanapricot": 387,
+    "tiddlebeds": 203,
+    "tila": 66,
+    "tilar": 108,
+    "tilia": 108,
+    "tiliaspp": 66,
+    "tillera": 108,
+    "tillomacho": 108,
+    "tillon": 108,
+    "tillori": 108,
+    "tilo": 108,
+    "tilodeeuropa": 66,
+    "tilodehojaspequenas": 66,
+    "tiloflor": 239,
+    "timbo": 223,
+    "timonet": 2,
+    "tinderconk": 281,
+    "tinderfungus": 281,
+    "tinderpolypore": 281,
+    "tinosporacordifolia": 517,
+    "tintadelpais": 389,
+    "tintadetoro": 389,
+    "tlalcacahuatlnahuatl": 453,
+    "tlapololotenahuatl": 243,
+    "tlilxochitl": 471,
+    "toadplant": 504,
+    "tomatillo": 373,
+    "tomello": 2,
+    "tomillo": 2,
+    "tomilloaceitunero": 175,
+    "tomilloandaluz": 175,
+    "tomillosalsero": 175,
+    "tonkabean": 482,
+    "topinambur": 220,
+    "torombolo": 350,
+    "toronja": 322,
+    "toronjildecana": 39,
+    "toronjildementa": 4,
+    "torvisco": 176,
+    "touchmenot": 233,
+    "trachyspermumammi": 480,
+    "trametesversicolor": 270,
+    "trapanatans": 316,
+    "treboldeolor": 257,
+    "treeear": 279,
+    "treehedgehogfungus": 268,
+    "treeoystermushroom": 276,
+    "tremella": 272,
+    "tremellafuciformis": 272,
+    "tremoncillo": 2,
+    "tribulus": 520,
+    "tribulusterrestris": 520,
+    "trinitaria": 248,
+    "trompetadelosmuertos": 289,
+    "trompetanegra": 289,
+    "tropaeolummajus": 45,
+    "tropaeolumtuberosum": 224,
+    "truecinnamon": 19,
+    "truejasmine": 237,
+    "truelaurel": 9,
+    "truelavender": 23,
+    "truemorel": 290,
+    "truemyrtle": 158,
+    "truepepper": 484,
+    "truesage": 10,
+    "trufadeperigord": 291,
+    "trufanegra": 291,
+    "trufavioleta": 291,
+    "trumpetofthedead": 289,
+    "tsammamelon": 456,
+    "tsuna": 496,
+    "tsyr": 269,
+    "tubermelanosporum": 291,
+    "tuberousnasturtium": 224,
+    "tuckahoe": 273,
+    "tuera": 456,
+    "tulasi": 510,
+    "tulkee": 59,
+    "tulsi": 510,
+    "tumeric": 206,
+    "tunacardona": 507,
+    "tupinamba": 220,
+    "tupinambo": 220,
+    "turkeytail": 270,
+    "turneradiffusa": 184,
+    "turnip": 215,
+    "turnipcabbage": 219,
+    "turniprootedparsley": 7,
+    "tuscancypress": 114,
+    "txarpoil": 450,
+    "txarpoila": 450,
+    "ugli": 331,
+    "uglifruit": 331,
+    "ugnimolinae": 420,
+    "ulluco": 222,
+    "ullucustuberosus": 222,
+    "ulluku": 222,
+    "ulluma": 222,
+    "ulmaria": 51,
+    "ulmeria": 51,
+    "ulmusminor": 87,
+    "ulmusrubra": 87,
+    "ulvalactuca": 307,
+    "umbrellapolypore": 277,
+    "unadegato": 195,
+    "uncariatomentosa": 195,
+    "undariapinnatifida": 298,
+    "uniqfruit": 331,
+    "uqa": 223,
+    "urticadioica": 79,
+    "uva": 389,
+    "uvacrispa": 402,
+    "uvadebosque": 73,
+    "uvadecalifornia": 418,
+    "uvadegato": 494,
+    "uvademonte": 73,
+    "uvadeoregon": 169,
+    "uvadeoso": 413,
+    "uvaespina": 406,
+    "uvaursi": 413,
+    "vacciniummacrocarpon": 153,
+    "vacciniummyrtillus": 73,
+    "vacciniumparvifolium": 426,
+    "vacciniumvitisidaea": 425,
+    "vaina": 215,
+    "vainilla": 471,
+    "vainilladepapantla": 471,
+    "vainillamansa": 471,
+    "vainillero": 471,
+    "vainillerodefloresaromaticas": 471,
+    "vainonputki": 26,
+    "valedriana": 56,
+    "valenciaorange": 321,
+    "valeriana": 56,
+    "valerianacomun": 56,
+    "valerianadelasboticas": 56,
+    "valerianamedicinal": 56,
+    "valerianaofficinalis": 56,
+    "valerianavera": 56,
+    "vanilla": 471,
+    "vanillaplanifolia": 471,
+    "varnishedconk": 264,
+    "vellorita": 246,
+    "velvetfoot": 275,
+    "velvetshank": 275,
+    "velvetstem": 275,
+    "verbasco": 48,
+    "verbascumthapsus": 48,
+    "verbena": 254,
+    "verbenaofficinalis": 254,
+    "verbenaolorosa": 47,
+    "vermicular": 494,
+    "vervain": 254,
+    "viburno": 177,
+    "viburnumopulus": 177,
+    "viburnumtinus": 166,
+    "vidbravia": 389,
+    "videira": 389,
+    "vietnamesecoriander": 34,
+    "vietnamesemint": 34,
+    "vine": 389,
+    "viola": 241,
+    "violaodorata": 241,
+    "violatricolor": 248,
+    "violeta": 241,
+    "violetacomun": 241,
+    "violetadeolor": 241,
+    "violetamorada": 241,
+    "viriato": 292,
+    "virraca": 221,
+    "voigue": 129,
+    "wachuma": 496,
+    "wakame": 298,
+    "wallpepper": 494,
+    "wartybirch": 113,
+    "wasabi": 42,
+    "waterchestnut": 316,
+    "watercress": 312,
+    "waterelder": 177,
+    "waterhorsetail": 315,
+    "waterhyacinth": 310,
+    "watermelon": 456,
+    "watermint": 313,
+    "waterroot": 519,
+    "weepingforsythia": 168,
+    "westernsoapberry": 144,
+    "westindiancherry": 381,
+    "westindianlemongrass": 39,
+    "westindianlime": 324,
+    "westindianvanilla": 471,
+    "wetabed": 203,
+    "wetthebed": 203,
+    "whitebirch": 113,
+    "whitecarrot": 221,
+    "whitecloudears": 272,
+    "whitejasmine": 237,
+    "whitejellymushroom": 272,
+    "whitemexicanrose": 493,
+    "whitemottledrot": 282,
+    "whitepeach": 384,
+    "whitepeppermint": 4,
+    "whitethorn": 122,
+    "whitewaterlily": 311,
+    "whitewillow": 107,
+    "whitewillowbark": 71,
+    "whortleberry": 73,
+    "wildasparagus": 519,
+    "wildcarrot": 214,
+    "wildcelery": 26,
+    "wildcherry": 386,
+    "wildchives": 13,
+    "wildcrepemyrtle": 381,
+    "wildenoki": 275,
+    "wildlettuce": 91,
+    "wildmarjoram": 3,
+    "wildpansy": 248,
+    "wildparsley": 208,
+    "wildparsnip": 216,
+    "wildpepper": 233,
+    "wildprivet": 163,
+    "wildradish": 218,
+    "wildtarragon": 12,
+    "wildwatermelon": 456,
+    "wildwormwood": 53,
+    "wimberry": 73,
+    "winberry": 73,
+    "windowplant": 497,
+    "wingleafsoapberry": 144,
+    "wintercherry": 205,
+    "wintermelon": 457,
+    "wintermushroom": 275,
+    "wintersavory": 27,
+    "wintersbark": 129,
+    "wintertruffle": 291,
+    "witchesbriar": 85,
+    "witchhazel": 150,
+    "witchwiggintree": 126,
+    "withaniasomnifera": 205,
+    "wolfiporiaextensa": 273,
+    "woodear": 279,
+    "woodmallow": 49,
+    "woodviolet": 241,
+    "woollyplantain": 461,
+    "wormseed": 35,
+    "wormwood": 54,
+    "xanzaina": 210,
+    "xebana": 469,
+    "xhoba": 505,
+    "xiangguchino": 265,
+    "xirupato": 290,
+    "xocolatl": 199,
+    "xocoxochitl": 476,
+    "xonacatl": 13,
+    "yaca": 377,
+    "yagabisoya": 199,
+    "yagabizoya": 199,
+    "yagapizija": 199,
+    "yamabushitake": 268,
+    "yamini": 480,
+    "yaminiki": 480,
+    "yanaoca": 224,
+    "yangtao": 358,
+    "yaqonafiji": 84,
+    "yarrow": 255,
+    "yartsagunbutibetano": 267,
+    "yau": 199,
+    "yautiacoco": 225,
+    "yaviniki": 480,
+    "yellowgentian": 210,
+    "yellowgingersaffron": 17,
+    "yellowiris": 314,
+    "yellowjessamine": 258,
+    "yellowmelilot": 257,
+    "yellowmorel": 290,
+    "yellowpuccoon": 206,
+    "yemadehuevo": 294,
+    "yeongjicoreano": 264,
+    "yerba": 429,
+    "yerbababosa": 490,
+    "yerbabruja": 488,
+    "yerbabuena": 5,
+    "yerbadelaguiluchoblanco": 56,
+    "yerbadelgato": 56,
+    "yerbadulce": 41,
+    "yerbamate": 198,
+    "yesqueroaplanado": 282,
+    "yew": 121,
+    "youthandage": 250,
+    "yuca": 76,
+    "yucadeshilachada": 495,
+    "yucca": 495,
+    "yuccafilamentosa": 495,
+    "yuccafilifera": 190,
+    "yuccaschidigera": 76,
+    "yuja": 328,
+    "yujacoreano": 328,
+    "yunzhichino": 270,
+    "yuyocrisantemo": 53,
+    "yuzu": 328,
+    "yuzujapones": 328,
+    "zabida": 490,
+    "zabila": 490,
+    "zabin": 490,
+    "zacatelimon": 39,
+    "zafran": 475,
+    "zanahoria": 214,
+    "zanahoriablanca": 216,
+    "zanthoxylumpiperitum": 479,
+    "zapote": 363,
+    "zaragatona": 461,
+    "zaramangon": 55,
+    "zarza": 392,
+    "zarzaboysen": 422,
+    "zarzadeboysen": 422,
+    "zarzadelogan": 423,
+    "zarzaframbuesa": 423,
+    "zarzalogan": 423,
+    "zarzamora": 394,
+    "zarzamorisca": 156,
+    "zarzaparrilla": 156,
+    "zarzaparrillanegra": 403,
+    "zarzarosa": 85,
+    "zebraplant": 500,
+    "zingiberofficinale": 18,
+    "zinnia": 250,
+    "zinniaelegans": 250,
+    "ziranda": 360,
+    "zisu": 59,
+    "zizaribelar": 29,
+    "zoom": 464,
+    "zrezal": 386,
+    "zumaquesumac": 477,
+    "zurracayoye": 487,
+  },
+  ambiguas: ["abesoda","achicoriaamarga","achilleamillefolium","acibar","aesculushippocastanum","agenabe","agenabo","agenave","agenuz","ajenabe","ajenabo","ajenuz","alberchigo","alholva","almond","altamisa","amargon","anet","anethumgraveolens","aneto","anise","aniseed","anix","apiumgraveolens","aquilea","arandanoencarnado","aranuel","arbolcasto","arctostaphylosuvaursi","asiaticpennywort","azafrancimarron","bacopamonnieri","badiana","barbaryfig","berberisvulgaris","birdsfoot","bitterorange","blackcaraway","blackcumin","blackcurrant","blackelder","blackmustard","blackseed","brassicanigra","briarrose","brownmustard","buckeye","cactuspear","cambroneracoloradadejarava","canillero","cascalleja","cassava","castanoloco","cayennepepper","cedron","cerraja","charlock","chasteberry","chastetree","chineseparsley","chinesepeony","citrusaurantium","citruslimon","clavelina","clavero","clove","cocoa","commongardenpeony","commongrapevine","commonpear","conkertree","coriander","coriandro","coriandrumsativum","corylusavellana","cowberry","crataegusazarolus","crataegusmonogyna","culantro","culantrocastilla","culantroeuropeo","cuminumcyminum","curcumalonga","cydoniaoblonga","dandelion","dannia","digitalispurpurea","dill","dillweed","dogrose","dragonfruit","elder","elettariacardamomum","equisetumarvense","espinofalso","europeanblackcurrant","europeanelder","europeanpear","euterpeoleracea","falsocastano","fennelflower","fenugreek","ficuscarica","flordemuerto","foeniculumvulgare","foxberry","foxglove","gardenredcurrant","goatshorn","grape","greekclover","greekhay","greekhayseed","greencardamom","grosellerorojo","guisador","helianthusannuus","herbofgrace","hierbadesanjuan","hierbasanta","higodelasindias","higueradepala","hilba","hippophaerhamnoides","hisopillo","horsechestnut","hortelana","hylocereusundatus","ilexparaguariensis","indianfigopuntia","indiangooseberry","indianlotus","indianpennywort","jengibrillo","juglansregia","kakaw","kalonji","lemon","lemonbalm","limonreal","littleleaflinden","lotoindio","mahoniaaquifolium","majuelo","mangiferaindica","manihotesculenta","manioc","maravilla","matalahuga","matalahuva","melissaofficinalis","mermasangre","methi","milfoil","mirtilorojo","monkspepper","mountaincranberry","myristicafragrans","myrtuscommunis","naranjaagria","nectarine","nelumbonucifera","nigella","nigellasativa","northernmountaincranberry","nutmegflower","opuntiaficusindica","paeonialactiflora","palera","palillo","palillocholon","palillochuncho","palocolorado","papaversomniferum","parra","parrabravia","parrillanegra","partridgeberry","paulliniacupana","peoniachina","perejilchino","phyllanthusemblica","pimientodelosmonjes","pimpinellaanisum","pinsus","polluelo","pomegranate","pricklypear","primula","prunusdulcis","prunusspinosa","psidiumguajava","punicagranatum","pyruscommunis","redcurrant","redmustard","redwhortleberry","ribes","ribesnigrum","ribesrubrum","ribesuvacrispa","rimas","rivas","romancoriander","rosadelnilo","rosademonte","rosalsilvestre","rosasinespinas","rubusfruticosus","rubusulmifolius","saborija","sabuco","sacredlotus","salixalba","sallowthorn","sambucusnigra","sandthorn","sarsaparilla","sauceblanco","seaberry","seabuckthorn","sevilleorange","smallleavedlime","sorbusaucuparia","sourorange","spinelesscactus","syzygiumaromaticum","taraxacumofficinale","tejoblanco","theobromacacao","tiliacordata","tilodehojapequena","tilonorteno","tilosilvestre","tomilloreal","toronjil","trigonellafoenumgraecum","truecardamom","truemustard","tuna","tunera","tuno","turmeric","turmerico","uvadefran","uvadeperro","uvadesenora","vid","vitex","vitexagnuscastus","vitisvinifera","walnut","waterhyssop","whimberry","winegrape","yuquilla"],
+};
+
+export const aliasEnfermedades: IndiceAlias = {
+  entidades: [
+    ["asma","sistema-respiratorio"],
+    ["bronquitis-aguda","sistema-respiratorio"],
+    ["neumonia","sistema-respiratorio"],
+    ["epoc","sistema-respiratorio"],
+    ["rinitis-alergica","sistema-respiratorio"],
+    ["sinusitis","sistema-respiratorio"],
+    ["faringitis","sistema-respiratorio"],
+    ["laringitis","sistema-respiratorio"],
+    ["traqueitis","sistema-respiratorio"],
+    ["tuberculosis","sistema-respiratorio"],
+    ["fibrosis-pulmonar","sistema-respiratorio"],
+    ["apnea-del-sueno","sistema-respiratorio"],
+    ["cancer-de-pulmon","sistema-respiratorio"],
+    ["embolia-pulmonar","sistema-respiratorio"],
+    ["hipertension-pulmonar","sistema-respiratorio"],
+    ["derrame-pleural","sistema-respiratorio"],
+    ["neumotorax","sistema-respiratorio"],
+    ["bronquiectasia","sistema-respiratorio"],
+    ["sarcoidosis","sistema-respiratorio"],
+    ["fibrosis-quistica","sistema-respiratorio"],
+    ["resfriado-comun","sistema-respiratorio"],
+    ["gripe","sistema-respiratorio"],
+    ["virus-sincitial-respiratorio","sistema-respiratorio"],
+    ["adenovirus","sistema-respiratorio"],
+    ["rinovirus","sistema-respiratorio"],
+    ["parainfluenza","sistema-respiratorio"],
+    ["metapneumovirus","sistema-respiratorio"],
+    ["crup","sistema-respiratorio"],
+    ["tos-ferina","sistema-respiratorio"],
+    ["difteria","sistema-respiratorio"],
+    ["edema-pulmonar","sistema-respiratorio"],
+    ["sindrome-de-dificultad-respiratoria-aguda","sistema-respiratorio"],
+    ["atelectasia","sistema-respiratorio"],
+    ["hemoptisis","sistema-respiratorio"],
+    ["disnea","sistema-respiratorio"],
+    ["hipoxia","sistema-respiratorio"],
+    ["mesotelioma","sistema-respiratorio"],
+    ["aspergilosis","sistema-respiratorio"],
+    ["silicosis","sistema-respiratorio"],
+    ["asbestosis","sistema-respiratorio"],
+    ["gastritis","sistema-digestivo"],
+    ["ulcera-peptica","sistema-digestivo"],
+    ["reflujo-gastroesofagico","sistema-digestivo"],
+    ["colitis-ulcerosa","sistema-digestivo"],
+    ["sindrome-del-intestino-irritable","sistema-digestivo"],
+    ["enfermedad-de-crohn","sistema-digestivo"],
+    ["hemorroides","sistema-digestivo"],
+    ["estrenimiento","sistema-digestivo"],
+    ["diarrea","sistema-digestivo"],
+    ["hepatitis","sistema-digestivo"],
+    ["cirrosis-hepatica","sistema-digestivo"],
+    ["pancreatitis","sistema-digestivo"],
+    ["enfermedad-celiaca","sistema-digestivo"],
+    ["intolerancia-a-la-lactosa","sistema-digestivo"],
+    ["diverticulosis","sistema-digestivo"],
+    ["diverticulitis","sistema-digestivo"],
+    ["apendicitis","sistema-digestivo"],
+    ["calculos-biliares","sistema-digestivo"],
+    ["colecistitis","sistema-digestivo"],
+    ["disfagia","sistema-digestivo"],
+    ["indigestion","sistema-digestivo"],
+    ["gastroenteritis","sistema-digestivo"],
+    ["hernia-de-hiato","sistema-digestivo"],
+    ["proctitis","sistema-digestivo"],
+    ["fisura-anal","sistema-digestivo"],
+    ["incontinencia-fecal","sistema-digestivo"],
+    ["polipos-de-colon","sistema-digestivo"],
+    ["cancer-de-colon","sistema-digestivo"],
+    ["cancer-de-estomago","sistema-digestivo"],
+    ["cancer-de-esofago","sistema-digestivo"],
+    ["cancer-de-higado","sistema-digestivo"],
+    ["cancer-de-pancreas","sistema-digestivo"],
+    ["esofagitis","sistema-digestivo"],
+    ["acalasia","sistema-digestivo"],
+    ["gastroparesia","sistema-digestivo"],
+    ["linfangiectasia-intestinal","sistema-digestivo"],
+    ["sindrome-de-dumping","sistema-digestivo"],
+    ["colangitis","sistema-digestivo"],
+    ["isquemia-mesenterica","sistema-digestivo"],
+    ["peritonitis","sistema-digestivo"],
+    ["hipertension-arterial","sistema-cardiovascular"],
+    ["ateroesclerosis","sistema-cardiovascular"],
+    ["cardiopatia-isquemica","sistema-cardiovascular"],
+    ["infarto-de-miocardio","sistema-cardiovascular"],
+    ["angina-de-pecho","sistema-cardiovascular"],
+    ["insuficiencia-cardiaca","sistema-cardiovascular"],
+    ["arritmia","sistema-cardiovascular"],
+    ["fibrilacion-auricular","sistema-cardiovascular"],
+    ["bradicardia","sistema-cardiovascular"],
+    ["taquicardia","sistema-cardiovascular"],
+    ["enfermedad-valvular-cardiaca","sistema-cardiovascular"],
+    ["endocarditis","sistema-cardiovascular"],
+    ["miocarditis","sistema-cardiovascular"],
+    ["pericarditis","sistema-cardiovascular"],
+    ["cardiomiopatia","sistema-cardiovascular"],
+    ["aneurisma-aortico","sistema-cardiovascular"],
+    ["diseccion-aortica","sistema-cardiovascular"],
+    ["enfermedad-arterial-periferica","sistema-cardiovascular"],
+    ["trombosis-venosa-profunda","sistema-cardiovascular"],
+    ["accidente-cerebrovascular","sistema-cardiovascular"],
+    ["cardiopatia-congenita","sistema-cardiovascular"],
+    ["soplo-cardiaco","sistema-cardiovascular"],
+    ["sindrome-de-marfan","sistema-cardiovascular"],
+    ["enfermedad-de-buerger","sistema-cardiovascular"],
+    ["enfermedad-de-raynaud","sistema-cardiovascular"],
+    ["varices","sistema-cardiovascular"],
+    ["linfedema","sistema-cardiovascular"],
+    ["shock-cardiogenico","sistema-cardiovascular"],
+    ["paro-cardiaco","sistema-cardiovascular"],
+    ["anemia","sistema-cardiovascular"],
+    ["hemofilia","sistema-cardiovascular"],
+    ["leucemia","sistema-cardiovascular"],
+    ["colesterol-alto","sistema-cardiovascular"],
+    ["trigliceridos-altos","sistema-cardiovascular"],
+    ["diabetes-mellitus","sistema-cardiovascular"],
+    ["obesidad","sistema-cardiovascular"],
+    ["lupus-eritematoso-sistemico","sistema-cardiovascular"],
+    ["migraña","sistema-nervioso"],
+    ["epilepsia","sistema-nervioso"],
+    ["parkinson","sistema-nervioso"],
+    ["alzheimer","sistema-nervioso"],
+    ["esclerosis-múltiple","sistema-nervioso"],
+    ["neuralgia","sistema-nervioso"],
+    ["neuropatía","sistema-nervioso"],
+    ["vértigo","sistema-nervioso"],
+    ["insomnio","sistema-nervioso"],
+    ["accidente-cerebrovascular-acv","sistema-nervioso"],
+    ["aneurisma-cerebral","sistema-nervioso"],
+    ["tumor-cerebral","sistema-nervioso"],
+    ["esclerosis-lateral-amiotrófica-ela","sistema-nervioso"],
+    ["hernia-de-disco","sistema-nervioso"],
+    ["enfermedad-de-huntington","sistema-nervioso"],
+    ["demencia-con-cuerpos-de-lewy","sistema-nervioso"],
+    ["ataxia-de-friedreich","sistema-nervioso"],
+    ["síndrome-de-la-persona-rígida","sistema-nervioso"],
+    ["encefalitis","sistema-nervioso"],
+    ["enfermedad-de-charcot-marie-tooth","sistema-nervioso"],
+    ["enfermedades-de-las-neuronas-motoras","sistema-nervioso"],
+    ["enfermedad-de-von-hippel-lindau","sistema-nervioso"],
+    ["enfermedades-de-la-médula-espinal","sistema-nervioso"],
+    ["absceso-cerebral-parasitario","sistema-nervioso"],
+    ["absceso-raquídeo","sistema-nervioso"],
+    ["accidente-isquémico-transitorio","sistema-nervioso"],
+    ["adrenoleucodistrofia","sistema-nervioso"],
+    ["afasia","sistema-nervioso"],
+    ["laberintitis","sistema-nervioso"],
+    ["enfermedad-de-lafora","sistema-nervioso"],
+    ["síndrome-de-landau-kleffner","sistema-nervioso"],
+    ["síndrome-de-leigh","sistema-nervioso"],
+    ["leucoaraiosis","sistema-nervioso"],
+    ["leucodistrofia-metacromática","sistema-nervioso"],
+    ["leucoencefalopatía","sistema-nervioso"],
+    ["ausencia-del-tabique-pelúcido","sistema-nervioso"],
+    ["enfermedad-por-depósito-de-lípidos-ácidos","sistema-nervioso"],
+    ["dolor-de-espalda","sistema-nervioso"],
+    ["síndrome-de-barth","sistema-nervioso"],
+    ["cadasil","sistema-nervioso"],
+    ["lupus","sistema-inmunologico"],
+    ["artritis-reumatoide","sistema-inmunologico"],
+    ["psoriasis","sistema-inmunologico"],
+    ["vitiligo","sistema-inmunologico"],
+    ["alergias","sistema-inmunologico"],
+    ["inmunodeficiencias","sistema-inmunologico"],
+    ["esclerosis-multiple","sistema-inmunologico"],
+    ["enfermedad-de-graves","sistema-inmunologico"],
+    ["tiroiditis-de-hashimoto","sistema-inmunologico"],
+    ["enfermedad-de-addison","sistema-inmunologico"],
+    ["miastenia-gravis","sistema-inmunologico"],
+    ["sindrome-de-sjogren","sistema-inmunologico"],
+    ["esclerodermia","sistema-inmunologico"],
+    ["polimiositis","sistema-inmunologico"],
+    ["dermatomiositis","sistema-inmunologico"],
+    ["diabetes-tipo-1","sistema-inmunologico"],
+    ["enfermedad-inflamatoria-intestinal","sistema-inmunologico"],
+    ["hepatitis-autoinmune","sistema-inmunologico"],
+    ["anemia-perniciosa","sistema-inmunologico"],
+    ["vasculitis-autoinmune","sistema-inmunologico"],
+    ["alopecia-areata","sistema-inmunologico"],
+    ["sindrome-de-guillain-barre","sistema-inmunologico"],
+    ["purpura-trombocitopenica-idiopatica","sistema-inmunologico"],
+    ["sindrome-antifosfolipido","sistema-inmunologico"],
+    ["enfermedad-de-behcet","sistema-inmunologico"],
+    ["espondilitis-aniquilosante","sistema-inmunologico"],
+    ["artritis-psoriasica","sistema-inmunologico"],
+    ["artritis-reactiva","sistema-inmunologico"],
+    ["fiebre-reumatica","sistema-inmunologico"],
+    ["uveitis-autoinmune","sistema-inmunologico"],
+    ["penfigoide","sistema-inmunologico"],
+    ["liquen-plano","sistema-inmunologico"],
+    ["urticaria-cronica-idiopatica","sistema-inmunologico"],
+    ["diabetes-mellitus-tipo-2","sistema-endocrino"],
+    ["diabetes-mellitus-tipo-1","sistema-endocrino"],
+    ["hipotiroidismo","sistema-endocrino"],
+    ["hipertiroidismo","sistema-endocrino"],
+    ["sindrome-de-ovario-poliquistico","sistema-endocrino"],
+    ["enfermedad-de-cushing","sistema-endocrino"],
+    ["acromegalia","sistema-endocrino"],
+    ["enanismo","sistema-endocrino"],
+    ["gigantismo","sistema-endocrino"],
+    ["prolactinoma","sistema-endocrino"],
+    ["sindrome-metabolico","sistema-endocrino"],
+    ["osteoporosis","sistema-endocrino"],
+    ["hiperparatiroidismo","sistema-endocrino"],
+    ["hipoparatiroidismo","sistema-endocrino"],
+    ["cancer-de-tiroides","sistema-endocrino"],
+    ["insulinoma","sistema-endocrino"],
+    ["glucagonoma","sistema-endocrino"],
+    ["feocromocitoma","sistema-endocrino"],
+    ["diabetes-insipida","sistema-endocrino"],
+    ["ginecomastia","sistema-endocrino"],
+    ["galactorrea","sistema-endocrino"],
+    ["pubertad-precoz","sistema-endocrino"],
+    ["retraso-de-la-pubertad","sistema-endocrino"],
+    ["sindrome-de-kallmann","sistema-endocrino"],
+    ["sindrome-de-turner","sistema-endocrino"],
+    ["sindrome-de-klinefelter","sistema-endocrino"],
+    ["hiperplasia-suprarrenal-congenita","sistema-endocrino"],
+    ["neoplasia-endocrina-multiple-tipo-1","sistema-endocrino"],
+    ["neoplasia-endocrina-multiple-tipo-2","sistema-endocrino"],
+    ["bocio","sistema-endocrino"],
+    ["resistencia-a-la-hormona-tiroidea","sistema-endocrino"],
+    ["artritis","sistema-musculoesqueletico"],
+    ["osteomalacia","sistema-musculoesqueletico"],
+    ["sindrome-del-tunel-carpiano","sistema-musculoesqueletico"],
+    ["tendinitis","sistema-musculoesqueletico"],
+    ["desgarro-del-manguito-rotatorio","sistema-musculoesqueletico"],
+    ["bursitis","sistema-musculoesqueletico"],
+    ["distrofia-muscular","sistema-musculoesqueletico"],
+    ["calambre-muscular","sistema-musculoesqueletico"],
+    ["enfermedades-neuromusculares","sistema-musculoesqueletico"],
+    ["fibromialgia","sistema-musculoesqueletico"],
+    ["miastenia-grave","sistema-musculoesqueletico"],
+    ["miositis","sistema-musculoesqueletico"],
+    ["sarcoma-de-tejido-blando","sistema-musculoesqueletico"],
+    ["enfermedad-discal-degenerativa","sistema-musculoesqueletico"],
+    ["epicondilitis","sistema-musculoesqueletico"],
+    ["distension-muscular","sistema-musculoesqueletico"],
+    ["gota","sistema-musculoesqueletico"],
+    ["espondilitis-anquilosante","sistema-musculoesqueletico"],
+    ["osteopenia","sistema-musculoesqueletico"],
+    ["lumbalgia","sistema-musculoesqueletico"],
+    ["fracturas-oseas","sistema-musculoesqueletico"],
+    ["escoliosis","sistema-musculoesqueletico"],
+    ["ciatica","sistema-musculoesqueletico"],
+    ["quiste-de-baker","sistema-musculoesqueletico"],
+    ["dedo-en-gatillo","sistema-musculoesqueletico"],
+    ["sindrome-del-tunel-tarsiano","sistema-musculoesqueletico"],
+    ["enfermedad-de-de-quervain","sistema-musculoesqueletico"],
+    ["sindrome-de-ehlers-danlos","sistema-musculoesqueletico"],
+    ["displasia-fibrosa","sistema-musculoesqueletico"],
+    ["lesiones-de-la-placa-de-crecimiento","sistema-musculoesqueletico"],
+    ["osteoartritis","sistema-musculoesqueletico"],
+    ["artrosis","sistema-musculoesqueletico"],
+    ["contractura-muscular","sistema-musculoesqueletico"],
+    ["infeccion-urinaria","sistema-urinario"],
+    ["cistitis","sistema-urinario"],
+    ["pielonefritis","sistema-urinario"],
+    ["calculos-renales","sistema-urinario"],
+    ["incontinencia-urinaria","sistema-urinario"],
+    ["insuficiencia-renal","sistema-urinario"],
+    ["enfermedad-renal-cronica","sistema-urinario"],
+    ["uretritis","sistema-urinario"],
+    ["nefritis","sistema-urinario"],
+    ["nefrosis","sistema-urinario"],
+    ["hidronefrosis","sistema-urinario"],
+    ["vejiga-neurogenica","sistema-urinario"],
+    ["nocturia","sistema-urinario"],
+    ["cistitis-intersticial","sistema-urinario"],
+    ["cancer-de-vejiga","sistema-urinario"],
+    ["cancer-de-rinon","sistema-urinario"],
+    ["enfermedad-poliquistica-renal","sistema-urinario"],
+    ["glomerulonefritis","sistema-urinario"],
+    ["sindrome-nefrotico","sistema-urinario"],
+    ["estenosis-de-la-arteria-renal","sistema-urinario"],
+    ["acidosis-tubular-renal","sistema-urinario"],
+    ["reflujo-vesicoureteral","sistema-urinario"],
+    ["extrofia-vesical","sistema-urinario"],
+    ["hipospadias","sistema-urinario"],
+    ["epispadias","sistema-urinario"],
+    ["sindrome-uremico-hemolitico","sistema-urinario"],
+    ["nefropatia-por-iga","sistema-urinario"],
+    ["vasculitis-renal","sistema-urinario"],
+    ["estenosis-uretral","sistema-urinario"],
+    ["endometriosis","sistema-reproductor"],
+    ["enfermedad-inflamatoria-pelvica","sistema-reproductor"],
+    ["fibromas-uterinos","sistema-reproductor"],
+    ["cancer-de-ovario","sistema-reproductor"],
+    ["cancer-de-cuello-uterino","sistema-reproductor"],
+    ["prolapso-de-organos-pelvicos","sistema-reproductor"],
+    ["vaginosis-bacteriana","sistema-reproductor"],
+    ["candidiasis-vaginal","sistema-reproductor"],
+    ["menopausia","sistema-reproductor"],
+    ["sindrome-premenstrual","sistema-reproductor"],
+    ["disfuncion-erectil","sistema-reproductor"],
+    ["prostatitis","sistema-reproductor"],
+    ["hiperplasia-prostatica-benigna","sistema-reproductor"],
+    ["cancer-de-prostata","sistema-reproductor"],
+    ["cancer-de-testiculo","sistema-reproductor"],
+    ["varicocele","sistema-reproductor"],
+    ["hidrocele","sistema-reproductor"],
+    ["epididimitis","sistema-reproductor"],
+    ["orquitis","sistema-reproductor"],
+    ["infertilidad","sistema-reproductor"],
+    ["clamidia","sistema-reproductor"],
+    ["gonorrea","sistema-reproductor"],
+    ["herpes-genital","sistema-reproductor"],
+    ["virus-del-papiloma-humano","sistema-reproductor"],
+    ["sifilis","sistema-reproductor"],
+    ["tricomoniasis","sistema-reproductor"],
+    ["embarazo-ectopico","sistema-reproductor"],
+    ["preeclampsia","sistema-reproductor"],
+    ["placenta-previa","sistema-reproductor"],
+    ["aborto-espontaneo","sistema-reproductor"],
+    ["dispareunia","sistema-reproductor"],
+    ["eyaculacion-precoz","sistema-reproductor"],
+    ["anorgasmia","sistema-reproductor"],
+    ["acne","enfermedades-de-la-piel"],
+    ["eczema","enfermedades-de-la-piel"],
+    ["dermatitis-de-contacto","enfermedades-de-la-piel"],
+    ["urticaria","enfermedades-de-la-piel"],
+    ["rosacea","enfermedades-de-la-piel"],
+    ["micosis-cutanea","enfermedades-de-la-piel"],
+    ["verrugas","enfermedades-de-la-piel"],
+    ["melanoma","enfermedades-de-la-piel"],
+    ["carcinoma-basocelular","enfermedades-de-la-piel"],
+    ["carcinoma-espinocelular","enfermedades-de-la-piel"],
+    ["queratosis-pilaris","enfermedades-de-la-piel"],
+    ["hiperhidrosis","enfermedades-de-la-piel"],
+    ["impetigo","enfermedades-de-la-piel"],
+    ["molusco-contagioso","enfermedades-de-la-piel"],
+    ["penfigo","enfermedades-de-la-piel"],
+    ["dermatitis-seborreica","enfermedades-de-la-piel"],
+    ["celulitis","enfermedades-de-la-piel"],
+    ["erisipela","enfermedades-de-la-piel"],
+    ["foliculitis","enfermedades-de-la-piel"],
+    ["forunculos","enfermedades-de-la-piel"],
+    ["hidradenitis-supurativa","enfermedades-de-la-piel"],
+    ["ictiosis-vulgar","enfermedades-de-la-piel"],
+    ["melasma","enfermedades-de-la-piel"],
+    ["nevos-melanociticos","enfermedades-de-la-piel"],
+    ["pitiriasis-rosada","enfermedades-de-la-piel"],
+    ["prurigo-nodular","enfermedades-de-la-piel"],
+    ["sarna","enfermedades-de-la-piel"],
+    ["tiña-versicolor","enfermedades-de-la-piel"],
+    ["xantelasma","enfermedades-de-la-piel"],
+    ["dermatofibroma","enfermedades-de-la-piel"],
+    ["granuloma-anular","enfermedades-de-la-piel"],
+    ["queratosis-actinica","enfermedades-de-la-piel"],
+    ["lentigo-solar","enfermedades-de-la-piel"],
+    ["poiquilodermia-de-civatte","enfermedades-de-la-piel"],
+    ["telangiectasias","enfermedades-de-la-piel"],
+    ["linfoma","sistema-linfatico"],
+    ["mononucleosis-infecciosa","sistema-linfatico"],
+    ["adenopatia","sistema-linfatico"],
+    ["linfangitis","sistema-linfatico"],
+    ["enfermedad-de-castleman","sistema-linfatico"],
+    ["filariasis-linfatica","sistema-linfatico"],
+    ["malformacion-linfatica","sistema-linfatico"],
+    ["quilotorax","sistema-linfatico"],
+    ["ascitis-quilosa","sistema-linfatico"],
+    ["quiluria","sistema-linfatico"],
+    ["sindrome-de-cloves","sistema-linfatico"],
+    ["bronquitis-plastica","sistema-linfatico"],
+    ["enteropatia-perdedora-de-proteinas","sistema-linfatico"],
+    ["higroma-quistico","sistema-linfatico"],
+    ["hiperplasia-linfofolicular","sistema-linfatico"],
+    ["linfadenitis-mesenterica","sistema-linfatico"],
+    ["linfangioleiomiomatosis","sistema-linfatico"],
+    ["amigdalitis","sistema-linfatico"],
+    ["esplenomegalia","sistema-linfatico"],
+    ["timoma","sistema-linfatico"],
+    ["linfangioma-cavernoso","sistema-linfatico"],
+    ["linfohistiocitosis-hemofagocitica","sistema-linfatico"],
+    ["sindrome-de-evans","sistema-linfatico"],
+    ["trastorno-de-ansiedad-generalizada","trastornos-mentales-emocionales"],
+    ["depresion-mayor","trastornos-mentales-emocionales"],
+    ["trastorno-bipolar","trastornos-mentales-emocionales"],
+    ["trastorno-obsesivo-compulsivo","trastornos-mentales-emocionales"],
+    ["trastorno-de-estres-postraumatico","trastornos-mentales-emocionales"],
+    ["trastorno-de-panico","trastornos-mentales-emocionales"],
+    ["fobia-social","trastornos-mentales-emocionales"],
+    ["esquizofrenia","trastornos-mentales-emocionales"],
+    ["trastorno-por-deficit-de-atencion-e-hiperactividad","trastornos-mentales-emocionales"],
+    ["trastornos-de-la-alimentacion","trastornos-mentales-emocionales"],
+    ["trastorno-limite-de-la-personalidad","trastornos-mentales-emocionales"],
+    ["agorafobia","trastornos-mentales-emocionales"],
+    ["trastorno-de-ansiedad-por-separacion","trastornos-mentales-emocionales"],
+    ["mutismo-selectivo","trastornos-mentales-emocionales"],
+    ["fobia-especifica","trastornos-mentales-emocionales"],
+    ["tricotilomania","trastornos-mentales-emocionales"],
+    ["trastorno-de-excoriacion","trastornos-mentales-emocionales"],
+    ["trastorno-dismorfico-corporal","trastornos-mentales-emocionales"],
+    ["trastorno-de-acumulacion","trastornos-mentales-emocionales"],
+    ["trastorno-afectivo-estacional","trastornos-mentales-emocionales"],
+    ["distimia","trastornos-mentales-emocionales"],
+    ["trastorno-ciclotimico","trastornos-mentales-emocionales"],
+    ["trastorno-disforico-premenstrual","trastornos-mentales-emocionales"],
+    ["trastorno-de-desregulacion-disruptiva-del-estado-de-animo","trastornos-mentales-emocionales"],
+    ["trastorno-esquizoafectivo","trastornos-mentales-emocionales"],
+    ["trastorno-delirante","trastornos-mentales-emocionales"],
+    ["trastorno-psicotico-breve","trastornos-mentales-emocionales"],
+    ["trastorno-de-la-personalidad-paranoide","trastornos-mentales-emocionales"],
+    ["trastorno-de-la-personalidad-esquizoide","trastornos-mentales-emocionales"],
+    ["trastorno-de-la-personalidad-esquizotipica","trastornos-mentales-emocionales"],
+    ["trastorno-de-la-personalidad-antisocial","trastornos-mentales-emocionales"],
+    ["trastorno-de-la-personalidad-histrionica","trastornos-mentales-emocionales"],
+    ["trastorno-de-la-personalidad-narcisista","trastornos-mentales-emocionales"],
+    ["trastorno-de-la-personalidad-evitativa","trastornos-mentales-emocionales"],
+    ["trastorno-de-la-personalidad-dependiente","trastornos-mentales-emocionales"],
+    ["trastorno-de-la-personalidad-obsesivo-compulsiva","trastornos-mentales-emocionales"],
+    ["trastorno-de-conversion","trastornos-mentales-emocionales"],
+    ["trastorno-de-sintomas-somaticos","trastornos-mentales-emocionales"],
+    ["trastorno-facticio","trastornos-mentales-emocionales"],
+    ["amnesia-disociativa","trastornos-mentales-emocionales"],
+    ["conjuntivitis","otorrinolaringologia-oftalmologia"],
+    ["cataratas","otorrinolaringologia-oftalmologia"],
+    ["glaucoma","otorrinolaringologia-oftalmologia"],
+    ["otitis-media","otorrinolaringologia-oftalmologia"],
+    ["tinnitus","otorrinolaringologia-oftalmologia"],
+    ["desviacion-del-tabique-nasal","otorrinolaringologia-oftalmologia"],
+    ["polipos-nasales","otorrinolaringologia-oftalmologia"],
+    ["vertigo","otorrinolaringologia-oftalmologia"],
+    ["enfermedad-de-meniere","otorrinolaringologia-oftalmologia"],
+    ["presbicia","otorrinolaringologia-oftalmologia"],
+    ["astigmatismo","otorrinolaringologia-oftalmologia"],
+    ["miopia","otorrinolaringologia-oftalmologia"],
+    ["hipermetropia","otorrinolaringologia-oftalmologia"],
+    ["estrabismo","otorrinolaringologia-oftalmologia"],
+    ["ojo-seco","otorrinolaringologia-oftalmologia"],
+    ["chalazion","otorrinolaringologia-oftalmologia"],
+    ["orzuelo","otorrinolaringologia-oftalmologia"],
+    ["epistaxis","otorrinolaringologia-oftalmologia"],
+    ["anosmia","otorrinolaringologia-oftalmologia"],
+    ["disfonia","otorrinolaringologia-oftalmologia"],
+    ["cerumen-impactado","otorrinolaringologia-oftalmologia"],
+    ["perforacion-del-timpano","otorrinolaringologia-oftalmologia"],
+    ["neuritis-vestibular","otorrinolaringologia-oftalmologia"],
+  ],
+  formas: {
+    "47xxy": 215,
+    "abortoespontaneo": 312,
+    "abscesocerebralparasitario": 140,
+    "abscesoepiduralespinal": 141,
+    "abscesoraquideo": 141,
+    "abscesoscutaneos": 335,
+    "acalasia": 73,
+    "accidentecerebrovascular": 99,
+    "accidentecerebrovascularacv": 126,
+    "accidenteisquemicotransitorio": 142,
+    "acidezestomacal": 42,
+    "acidosistubularrenal": 274,
+    "acne": 316,
+    "acneinverso": 336,
+    "acnerosacea": 320,
+    "acnevulgar": 316,
+    "acromegalia": 196,
+    "acufenos": 418,
+    "acumulacioncompulsiva": 392,
+    "acumulaciondeliquidoenelescroto": 299,
+    "acv": 99,
+    "adenitismesenterica": 366,
+    "adenomyosis": 283,
+    "adenopatia": 353,
+    "adenovirus": 23,
+    "adrenoleucodistrofia": 143,
+    "afasia": 144,
+    "afasiaepilepticaadquirida": 147,
+    "aft": 133,
+    "agorafobia": 385,
+    "agrandamientodelaprostata": 295,
+    "agrandamientodelasmamasenloshombres": 209,
+    "agrandamientodelatiroides": 219,
+    "aguaenlospulmones": 15,
+    "ait": 142,
+    "ald": 143,
+    "alergias": 161,
+    "almorranas": 46,
+    "alopeciaareata": 177,
+    "alzheimer": 120,
+    "amigdalitis": 368,
+    "amnesiadisociativa": 413,
+    "anemia": 109,
+    "anemiaperniciosa": 175,
+    "aneurismaaortico": 95,
+    "aneurismacerebral": 127,
+    "aneurismaintracraneal": 127,
+    "anginadepecho": 84,
+    "anginas": 368,
+    "angorpectoris": 84,
+    "anorexia": 383,
+    "anorgasmia": 315,
+    "anosmia": 432,
+    "anovulacionhiperandrogenica": 194,
+    "ansiedadcronica": 374,
+    "apendicitis": 56,
+    "apneadelsueno": 11,
+    "ar": 158,
+    "aranasvasculares": 350,
+    "arritmia": 86,
+    "arterioesclerosis": 81,
+    "arteriopatiacerebralautosomicadominanteconinfartossubcorticalesyleucoencefalopatia": 156,
+    "artritis": 221,
+    "artritisgotosa": 237,
+    "artritispsoriasica": 183,
+    "artritisreactiva": 184,
+    "artritisreumatoide": 158,
+    "artropatiapsoriasica": 183,
+    "artrosis": 252,
+    "artrosisdegenerativa": 251,
+    "asbestosis": 39,
+    "ascitisquilosa": 359,
+    "asma": 0,
+    "asmabronquial": 0,
+    "asp": 152,
+    "aspergilosis": 37,
+    "astigmatismo": 424,
+    "ataquealcorazon": 83,
+    "ataquesdepanico": 379,
+    "ataxiadefriedreich": 133,
+    "atelectasia": 32,
+    "ateroesclerosis": 81,
+    "atracon": 383,
+    "atrapamientodelnerviomediano": 223,
+    "atrapamientodelnerviotibial": 246,
+    "ausenciadeltabiquepelucido": 152,
+    "bajadensidadosea": 239,
+    "bajoniveldeoxigenoenlasangre": 35,
+    "barros": 316,
+    "bazoagrandado": 369,
+    "blenorragia": 304,
+    "bocio": 219,
+    "bociodifusotoxico": 164,
+    "bolsadeliquidodetrasdelarodilla": 244,
+    "borderline": 384,
+    "bradicardia": 88,
+    "bronquiectasia": 17,
+    "bronquitisaguda": 1,
+    "bronquitisplastica": 362,
+    "bths": 155,
+    "bulimia": 383,
+    "bursitis": 226,
+    "cadasil": 156,
+    "calambremuscular": 228,
+    "calculosbiliares": 57,
+    "calculosrenales": 257,
+    "cancercervical": 287,
+    "cancercolorrectal": 67,
+    "cancerdecolon": 67,
+    "cancerdecuellouterino": 287,
+    "cancerdeesofago": 69,
+    "cancerdeestomago": 68,
+    "cancerdehigado": 70,
+    "cancerdelasangre": 111,
+    "cancerdeovario": 286,
+    "cancerdepancreas": 71,
+    "cancerdepiel": 323,
+    "cancerdepielnomelanoma": 324,
+    "cancerdeprostata": 296,
+    "cancerdepulmon": 12,
+    "cancerderinon": 269,
+    "cancerdetejidoconectivo": 233,
+    "cancerdetesticulo": 297,
+    "cancerdetiroides": 204,
+    "cancerdevejiga": 268,
+    "cancergastrico": 68,
+    "cancerlinfatico": 351,
+    "candidiasisvaginal": 290,
+    "carcinomabasocelular": 324,
+    "carcinomadecelulasescamosas": 325,
+    "carcinomadecelulasrenales": 269,
+    "carcinomadeovario": 286,
+    "carcinomadeprostata": 296,
+    "carcinomadepulmon": 12,
+    "carcinomaespinocelular": 325,
+    "carcinomahepatocelular": 70,
+    "carcinomatesticular": 297,
+    "cardiomiopatia": 94,
+    "cardiopatiacongenita": 100,
+    "cardiopatiaisquemica": 82,
+    "caspa": 331,
+    "cataratas": 415,
+    "catarro": 20,
+    "celulitis": 332,
+    "cerumenimpactado": 434,
+    "cervicalgia": 154,
+    "chalazion": 429,
+    "choquecardiogenico": 107,
+    "ciatica": 243,
+    "cicatrizaciondelospulmones": 10,
+    "ciclotimia": 395,
+    "cirrosishepatica": 50,
+    "cistitis": 255,
+    "cistitisintersticial": 267,
+    "cistocele": 288,
+    "clamidia": 303,
+    "climaterio": 291,
+    "cloasma": 338,
+    "cmt": 136,
+    "cododetenista": 235,
+    "coitodoloroso": 313,
+    "colangitis": 77,
+    "colecistitis": 58,
+    "colelitiasis": 57,
+    "colesterolalto": 112,
+    "colitisulcerosa": 43,
+    "colonirritable": 44,
+    "compresiondelnerviomediano": 223,
+    "conjuntivitis": 414,
+    "contracturamuscular": 253,
+    "coreadehuntington": 131,
+    "costralactea": 331,
+    "crup": 27,
+    "cu": 43,
+    "curvaturadelacolumna": 242,
+    "dcl": 132,
+    "debilidadmuscularautoinmune": 231,
+    "debilidadmuscularprogresiva": 227,
+    "dedoengatillo": 245,
+    "dedoenresorte": 245,
+    "defectocardiacodenacimiento": 100,
+    "deficienciadelahormonadelcrecimiento": 197,
+    "deficienciadevitaminad": 222,
+    "demenciaconcuerposdelewy": 132,
+    "depositosdecolesterol": 344,
+    "depresionclinica": 375,
+    "depresioninvernal": 393,
+    "depresionmayor": 375,
+    "dermatilomania": 390,
+    "dermatitisalergica": 318,
+    "dermatitisatopica": 317,
+    "dermatitisdecontacto": 318,
+    "dermatitisirritante": 318,
+    "dermatitisnodular": 341,
+    "dermatitisseborreica": 331,
+    "dermatofibroma": 345,
+    "dermatomiositis": 171,
+    "derramecerebral": 126,
+    "derramepleural": 15,
+    "derramequiloso": 358,
+    "desgarrodelmanguitorotatorio": 225,
+    "desgarromuscularleve": 236,
+    "desgastearticular": 252,
+    "desgastedediscointervertebral": 234,
+    "desviaciondelacolumna": 242,
+    "desviaciondeltabiquenasal": 419,
+    "diabetes": 114,
+    "diabetesdeladulto": 190,
+    "diabetesinsipida": 208,
+    "diabetesjuvenil": 191,
+    "diabetesmellitus": 114,
+    "diabetesmellitustipo1": 191,
+    "diabetesmellitustipo2": 190,
+    "diabetesnoinsulinodependiente": 190,
+    "diabetestipo1": 172,
+    "diarrea": 48,
+    "dificultadparatragar": 59,
+    "difteria": 29,
+    "dilatacionbronquial": 17,
+    "dilataciondelaaorta": 95,
+    "discodeslizado": 130,
+    "discopatiadegenerativa": 234,
+    "discoroto": 130,
+    "diseccionaortica": 96,
+    "disfagia": 59,
+    "disfasia": 144,
+    "disfonia": 433,
+    "disfuncionerectil": 293,
+    "disfuncionorgasmica": 315,
+    "disfuncionvesicalneurogenica": 265,
+    "disnea": 34,
+    "dispareunia": 313,
+    "dispepsia": 60,
+    "displasiafibrosa": 249,
+    "distensionmuscular": 236,
+    "distimia": 394,
+    "distrofiamuscular": 227,
+    "diverticulitis": 55,
+    "diverticulosis": 54,
+    "dolordeespalda": 154,
+    "dolordeespaldabaja": 240,
+    "dolordegarganta": 6,
+    "dolordelnerviociatico": 243,
+    "dolormusculoesqueleticocronico": 230,
+    "dolorneuropatico": 122,
+    "dorsalgia": 154,
+    "eap": 97,
+    "eccema": 317,
+    "eczema": 317,
+    "edemalinfatico": 106,
+    "edemapulmonar": 30,
+    "eii": 173,
+    "elefantiasis": 356,
+    "embarazoectopico": 309,
+    "embarazotubarico": 309,
+    "emboliapulmonar": 13,
+    "enanismo": 197,
+    "encefalitis": 135,
+    "encefalomielopatianecrotizantesubaguda": 148,
+    "endocarditis": 91,
+    "endometrioma": 283,
+    "endometriosis": 283,
+    "enfermedadampollosa": 330,
+    "enfermedadarterialperiferica": 97,
+    "enfermedadarticulardegenerativa": 251,
+    "enfermedadceliaca": 52,
+    "enfermedadcoronaria": 82,
+    "enfermedaddeaddison": 166,
+    "enfermedaddebechterew": 238,
+    "enfermedaddebehcet": 181,
+    "enfermedaddeberger": 280,
+    "enfermedaddebesnierboeckschaumann": 18,
+    "enfermedaddebuerger": 103,
+    "enfermedaddecastleman": 355,
+    "enfermedaddecharcotmarietooth": 136,
+    "enfermedaddecrohn": 45,
+    "enfermedaddecushing": 195,
+    "enfermedaddedequervain": 247,
+    "enfermedaddegraves": 164,
+    "enfermedaddehuntington": 131,
+    "enfermedaddelafora": 146,
+    "enfermedaddelasustanciablanca": 151,
+    "enfermedaddelbeso": 352,
+    "enfermedaddelougehrig": 129,
+    "enfermedaddemeniere": 422,
+    "enfermedadderaynaud": 104,
+    "enfermedaddesmielinizante": 163,
+    "enfermedaddevonhippellindau": 138,
+    "enfermedaddewolman": 153,
+    "enfermedaddiscaldegenerativa": 234,
+    "enfermedadesdelamedulaespinal": 139,
+    "enfermedadesdelasneuronasmotoras": 137,
+    "enfermedadesneuromusculares": 229,
+    "enfermedadhepaticaenetapaterminal": 50,
+    "enfermedadinflamatoriaintestinal": 173,
+    "enfermedadinflamatoriapelvica": 284,
+    "enfermedadinflamatoriapelvicaeip": 284,
+    "enfermedadmaniacodepresiva": 376,
+    "enfermedadoseaporosa": 201,
+    "enfermedadpoliquisticarenal": 270,
+    "enfermedadpordepositodelipidosacidos": 153,
+    "enfermedadporreflujogastroesofagicoerge": 42,
+    "enfermedadpulmonarobstructivacronicaepoc": 3,
+    "enfermedadrenalcronica": 260,
+    "enfermedadvalvularcardiaca": 90,
+    "enm": 137,
+    "enteropatiaperdedoradeproteinas": 363,
+    "enteropatiasensiblealgluten": 52,
+    "epicondilalgia": 235,
+    "epicondilitis": 235,
+    "epididimitis": 300,
+    "epilepsia": 118,
+    "epilepsiamioclonicaprogresivadelafora": 146,
+    "epispadias": 278,
+    "epistaxis": 431,
+    "epoc": 3,
+    "erc": 260,
+    "erisipela": 333,
+    "eritrosiscoli": 349,
+    "erupciondearboldenavidad": 340,
+    "erupcionenanillo": 346,
+    "erupcionpruriginosa": 188,
+    "escabiosis": 342,
+    "esclerodermia": 169,
+    "esclerosislateralamiotroficaela": 129,
+    "esclerosissistemica": 169,
+    "escoliosis": 242,
+    "esofagitis": 72,
+    "espasmomuscular": 228,
+    "espinillas": 316,
+    "esplenomegalia": 369,
+    "espondilitisaniquilosante": 182,
+    "espondilitisanquilosante": 238,
+    "espondiloartritisanquilosante": 238,
+    "esquizofrenia": 381,
+    "estenosisdelaarteriarenal": 273,
+    "estenosisuretral": 282,
+    "esterilidad": 302,
+    "estrabismo": 427,
+    "estrenimiento": 47,
+    "excesodehormonadecrecimientoenninos": 198,
+    "extrofiavesical": 276,
+    "eyaculacionprecoz": 314,
+    "eyaculacionrapida": 314,
+    "fa": 87,
+    "fallocardiaco": 85,
+    "fallorenal": 259,
+    "faltadealiento": 34,
+    "faringitis": 6,
+    "fenomenoderaynaud": 104,
+    "feocromocitoma": 207,
+    "fibrilacionauricular": 87,
+    "fibromasuterinos": 285,
+    "fibromialgia": 230,
+    "fibrosispulmonar": 10,
+    "fibrosisquistica": 19,
+    "fiebredelheno": 4,
+    "fiebreglandular": 352,
+    "fiebrereumatica": 185,
+    "filariasislinfatica": 356,
+    "fisuraanal": 64,
+    "fobiaespecifica": 388,
+    "fobiasimple": 388,
+    "fobiasocial": 380,
+    "foliculitis": 334,
+    "forunculos": 335,
+    "fracturadelafisis": 250,
+    "fracturasoseas": 241,
+    "galactorrea": 210,
+    "ganglioslinfaticosinflamados": 353,
+    "gastritis": 40,
+    "gastroenteritis": 61,
+    "gastroparesia": 74,
+    "gigantismo": 198,
+    "gigantismoenadultos": 196,
+    "ginecomastia": 209,
+    "glaucoma": 416,
+    "glomerulonefritis": 271,
+    "glucagonoma": 206,
+    "gonorrea": 304,
+    "gota": 237,
+    "granulomaanular": 346,
+    "gripe": 21,
+    "gripeestomacal": 61,
+    "habones": 319,
+    "hemicranea": 117,
+    "hemofilia": 110,
+    "hemoptisis": 33,
+    "hemorragianasal": 431,
+    "hemorroides": 46,
+    "hepatitis": 49,
+    "hepatitisautoinmune": 174,
+    "herniadedisco": 130,
+    "herniadehiato": 62,
+    "herpesgenital": 305,
+    "hidradenitissupurativa": 336,
+    "hidrocele": 299,
+    "hidronefrosis": 264,
+    "hidropesiaendolinfatica": 422,
+    "higroma": 226,
+    "higromaquistico": 364,
+    "hipercolesterolemia": 112,
+    "hipercortisolismo": 195,
+    "hiperhidrosis": 327,
+    "hiperlaxitudarticular": 248,
+    "hipermetropia": 426,
+    "hiperparatiroidismo": 202,
+    "hiperplasiadeganglioslinfaticosangiofolicular": 355,
+    "hiperplasiafolicularreactiva": 365,
+    "hiperplasialinfofolicular": 365,
+    "hiperplasiaprostaticabenigna": 295,
+    "hiperplasiaprostaticabenignahpb": 295,
+    "hiperplasiasuprarrenalcongenita": 216,
+    "hipertensionarterial": 80,
+    "hipertensionpulmonar": 14,
+    "hipertiroidismo": 193,
+    "hipertrigliceridemia": 113,
+    "hiperuricemia": 237,
+    "hipocondria": 411,
+    "hipogonadismohipogonadotropicoconanosmia": 213,
+    "hipoparatiroidismo": 203,
+    "hipospadias": 277,
+    "hipotiroidismo": 192,
+    "hipoxia": 35,
+    "histiocitomafibroso": 345,
+    "hpv": 306,
+    "hsc": 216,
+    "huesoroto": 241,
+    "huesosporosos": 201,
+    "ictiosisvulgar": 337,
+    "impetigo": 328,
+    "implantacionbajadelaplacenta": 311,
+    "impotencia": 293,
+    "incontinenciafecal": 65,
+    "incontinenciaurinaria": 258,
+    "indigestion": 60,
+    "infartocerebral": 126,
+    "infartodemiocardio": 83,
+    "infeccionbacterianadelapiel": 332,
+    "infeccioncutaneabacteriana": 328,
+    "infeccioncutaneasuperficial": 333,
+    "infecciondelasamigdalas": 368,
+    "infecciondelatraquea": 8,
+    "infecciondelendocardio": 91,
+    "infecciondelfoliculopiloso": 334,
+    "infecciondeloidointerno": 145,
+    "infecciondeloidomedio": 417,
+    "infecciondelossenosparanasales": 5,
+    "infecciondelparpado": 430,
+    "infecciondeltractourinario": 254,
+    "infecciondevejiga": 255,
+    "infeccionporchlamydiatrachomatis": 303,
+    "infeccionporhongos": 321,
+    "infeccionporlevaduras": 290,
+    "infeccionrenal": 256,
+    "infeccionurinaria": 254,
+    "infertilidad": 302,
+    "inflamacionarticular": 221,
+    "inflamaciondelabursa": 226,
+    "inflamaciondelaconjuntiva": 414,
+    "inflamaciondelalaringe": 7,
+    "inflamaciondelaprostata": 294,
+    "inflamaciondelauretra": 261,
+    "inflamaciondelavesiculabiliar": 58,
+    "inflamaciondelcerebro": 135,
+    "inflamaciondelepididimo": 300,
+    "inflamaciondelestomago": 40,
+    "inflamaciondelhigado": 49,
+    "inflamaciondelmiocardio": 92,
+    "inflamaciondelnerviovestibular": 436,
+    "inflamaciondelostesticulos": 301,
+    "inflamaciondelosvasoslinfaticos": 354,
+    "inflamaciondelpancreas": 51,
+    "inflamaciondelpericardio": 93,
+    "inflamaciondelrinon": 262,
+    "inflamaciondeltendon": 224,
+    "inflamacionmuscular": 232,
+    "influenza": 21,
+    "inmunodeficiencias": 162,
+    "inmunosupresion": 162,
+    "insomnio": 125,
+    "insuficienciacardiaca": 85,
+    "insuficienciarenal": 259,
+    "insuficienciasuprarrenal": 166,
+    "insuficienciasuprarrenalprimaria": 166,
+    "insulinoma": 205,
+    "intoleranciaalalactosa": 53,
+    "isquemiamesenterica": 78,
+    "itu": 254,
+    "jaqueca": 117,
+    "laberintitis": 145,
+    "laringitis": 7,
+    "laringotraqueobronquitis": 27,
+    "latidoscardiacosirregulares": 86,
+    "ldm": 150,
+    "leiomiomas": 285,
+    "lentigosolar": 348,
+    "les": 116,
+    "lesiondelmanguitodelosrotadores": 225,
+    "lesionepifisaria": 250,
+    "lesionesdelaplacadecrecimiento": 250,
+    "lesionfibroosea": 249,
+    "leucemia": 111,
+    "leucoaraiosis": 149,
+    "leucoderma": 160,
+    "leucodistrofiametacromatica": 150,
+    "leucoencefalopatia": 151,
+    "linfadenitismesenterica": 366,
+    "linfadenopatia": 353,
+    "linfangiectasiaintestinal": 75,
+    "linfangioleiomiomatosis": 367,
+    "linfangioleiomiomatosislam": 367,
+    "linfangioma": 357,
+    "linfangiomacavernoso": 371,
+    "linfangiomaquistico": 364,
+    "linfangitis": 354,
+    "linfedema": 106,
+    "linfohistiocitosishemofagocitica": 372,
+    "linfohistiocitosishemofagociticalhh": 372,
+    "linfoma": 351,
+    "liquenplano": 188,
+    "lues": 307,
+    "lumbago": 240,
+    "lumbalgia": 240,
+    "lunares": 339,
+    "lupus": 157,
+    "lupuseritematososistemico": 116,
+    "maldealzheimer": 120,
+    "maldeparkinson": 119,
+    "malformacionlinfatica": 357,
+    "malformacionlinfaticamacroquistica": 371,
+    "manchasdelaedad": 348,
+    "manchashepaticas": 348,
+    "mareo": 124,
+    "mareos": 421,
+    "mascaradelembarazo": 338,
+    "melanoma": 323,
+    "melasma": 338,
+    "menopausia": 291,
+    "mesotelioma": 36,
+    "metapneumovirus": 26,
+    "miasteniagrave": 231,
+    "miasteniagravis": 167,
+    "micosiscutanea": 321,
+    "mielopatia": 139,
+    "migrana": 117,
+    "miocardiopatia": 94,
+    "miocarditis": 92,
+    "miomas": 285,
+    "miopatiahereditaria": 227,
+    "miopatiainflamatoria": 232,
+    "miopatias": 229,
+    "miopia": 425,
+    "miositis": 232,
+    "moldesbronquiales": 362,
+    "moluscocontagioso": 329,
+    "mononucleosisinfecciosa": 352,
+    "monosomiax": 214,
+    "mucoviscidosis": 19,
+    "muertesubitacardiaca": 108,
+    "murmullocardiaco": 101,
+    "mutismoselectivo": 387,
+    "narcisismo": 406,
+    "nefritis": 262,
+    "nefrolitiasis": 257,
+    "nefropatiaporiga": 280,
+    "nefrosis": 263,
+    "nem1": 217,
+    "nem2": 218,
+    "neoplasiacerebral": 128,
+    "neoplasiaendocrinamultipletipo1": 217,
+    "neoplasiaendocrinamultipletipo2": 218,
+    "neumonia": 2,
+    "neumotorax": 16,
+    "neuralgia": 122,
+    "neuralgiadelnerviotibialposterior": 246,
+    "neuritisvestibular": 436,
+    "neurocisticercosis": 140,
+    "neuronitisvestibular": 145,
+    "neuropatia": 123,
+    "neuropatiaperiferica": 123,
+    "nevosmelanociticos": 339,
+    "nicturia": 266,
+    "nocturia": 266,
+    "nudomuscular": 253,
+    "obesidad": 115,
+    "obstruccionlinfatica": 106,
+    "ojodepescado": 322,
+    "ojorojo": 414,
+    "ojosbizcos": 427,
+    "ojoseco": 428,
+    "ooforitis": 284,
+    "opacidaddelcristalino": 415,
+    "orinalechosa": 360,
+    "orquitis": 301,
+    "orzuelo": 430,
+    "osteoartritis": 251,
+    "osteoartrosis": 252,
+    "osteomalacia": 222,
+    "osteopenia": 239,
+    "osteoporosis": 201,
+    "otitismedia": 417,
+    "pancreatitis": 51,
+    "parainfluenza": 25,
+    "paranoia": 399,
+    "parkinson": 119,
+    "parocardiaco": 108,
+    "pcos": 194,
+    "penfigo": 330,
+    "penfigoide": 187,
+    "perdidadecabelloenparches": 177,
+    "perdidadecontroldelavejiga": 258,
+    "perdidadelembarazo": 312,
+    "perdidadelolfato": 432,
+    "perdidademasaosea": 201,
+    "perforaciondeltimpano": 435,
+    "pericarditis": 93,
+    "peritonitis": 79,
+    "peritonitisquilosa": 359,
+    "pertussis": 28,
+    "piedrasenelrinon": 257,
+    "pieldegallina": 326,
+    "pieldepescado": 337,
+    "pieldura": 169,
+    "pielonefritis": 256,
+    "pitiriasisrosada": 340,
+    "pitiriasisversicolor": 343,
+    "pkd": 270,
+    "placentaprevia": 311,
+    "poiquilodermiadecivatte": 349,
+    "poliartritis": 221,
+    "poliartritiscronica": 158,
+    "polimiositis": 170,
+    "poliposdecolon": 66,
+    "poliposnasales": 420,
+    "preeclampsia": 310,
+    "preosteoporosis": 239,
+    "presbicia": 423,
+    "presionarterialalta": 80,
+    "presionarterialaltaenlospulmones": 14,
+    "proctitis": 63,
+    "prolactinoma": 199,
+    "prolapsodeorganospelvicos": 288,
+    "prostatitis": 294,
+    "prurigonodular": 341,
+    "psicopatia": 404,
+    "psoriasis": 159,
+    "psoriasisartropatica": 183,
+    "psoriasisenplacas": 159,
+    "pti": 179,
+    "pubertadprecoz": 211,
+    "pulgardeesquiador": 247,
+    "pulmoncolapsado": 16,
+    "pulmonia": 2,
+    "puntogatillomiofascial": 253,
+    "purpuratrombocitopenicaidiopatica": 179,
+    "queratoconjuntivitisseca": 428,
+    "queratosisactinica": 347,
+    "queratosispilaris": 326,
+    "queratosissolar": 347,
+    "quilotorax": 358,
+    "quiluria": 360,
+    "quistedebaker": 244,
+    "quistedeparpado": 429,
+    "quistepopliteo": 244,
+    "radiculopatiaciatica": 243,
+    "rampa": 228,
+    "rarefacciondelasustanciablanca": 149,
+    "reaccionesdehipersensibilidad": 161,
+    "reblandecimientooseo": 222,
+    "rectocele": 288,
+    "reflujoacido": 42,
+    "reflujogastroesofagico": 42,
+    "reflujovesicoureteral": 275,
+    "resfriadocomun": 20,
+    "resfriadodepecho": 1,
+    "resistenciaalahormonatiroidea": 220,
+    "retrasodelapubertad": 212,
+    "rht": 220,
+    "rinitisalergica": 4,
+    "rinonhinchado": 264,
+    "rinovirus": 24,
+    "ritmocardiacolento": 88,
+    "ritmocardiacorapido": 89,
+    "ronchas": 319,
+    "ronquera": 433,
+    "rosacea": 320,
+    "roturadelaaorta": 96,
+    "rupturadelmanguitorotatorio": 225,
+    "rupturaosea": 241,
+    "rvu": 275,
+    "saf": 180,
+    "sahs": 11,
+    "salpingitis": 284,
+    "sarcoidosis": 18,
+    "sarcomadetejidoblando": 233,
+    "sarna": 342,
+    "sdra": 31,
+    "secrecionlacteadelpezon": 210,
+    "sed": 248,
+    "shockcardiogenico": 107,
+    "sifilis": 307,
+    "silicosis": 38,
+    "sindromeantifosfolipido": 180,
+    "sindromedeapneadelsueno": 11,
+    "sindromedebarth": 155,
+    "sindromedecloves": 361,
+    "sindromededificultadrespiratoriaaguda": 31,
+    "sindromededumping": 76,
+    "sindromedeehlersdanlos": 248,
+    "sindromedeevans": 373,
+    "sindromedefibromialgia": 230,
+    "sindromedeguillainbarre": 178,
+    "sindromedekallmann": 213,
+    "sindromedeklinefelter": 215,
+    "sindromedelandaukleffner": 147,
+    "sindromedelapersonarigida": 134,
+    "sindromedelavejigadolorosa": 267,
+    "sindromedeleigh": 148,
+    "sindromedelintestinoirritable": 44,
+    "sindromedelintestinoirritablesii": 44,
+    "sindromedeltunelcarpiano": 223,
+    "sindromedeltuneltarsiano": 246,
+    "sindromedemarfan": 102,
+    "sindromedemunchausen": 412,
+    "sindromedeovariopoliquistico": 194,
+    "sindromedeovariopoliquisticosop": 194,
+    "sindromedereiter": 184,
+    "sindromederesistenciaalainsulina": 200,
+    "sindromedesipple": 218,
+    "sindromedesjogren": 168,
+    "sindromedesteinleventhal": 194,
+    "sindromedeturner": 214,
+    "sindromedewermer": 217,
+    "sindromehemofagocitico": 372,
+    "sindromemetabolico": 200,
+    "sindromenefrotico": 272,
+    "sindromepremenstrual": 292,
+    "sindromepremenstrualspm": 292,
+    "sindromeuremicohemolitico": 279,
+    "sinusitis": 5,
+    "sobrecrecimientocongenitolipomatoso": 361,
+    "sobrepesosevero": 115,
+    "sociopatia": 404,
+    "sop": 194,
+    "soplocardiaco": 101,
+    "spr": 134,
+    "sudoracionexcesiva": 327,
+    "suh": 279,
+    "tabiquedesviado": 419,
+    "tae": 393,
+    "tag": 374,
+    "tapondecera": 434,
+    "taquicardia": 89,
+    "tb": 9,
+    "tdah": 382,
+    "tdc": 391,
+    "tddea": 397,
+    "tdpm": 396,
+    "telangiectasias": 350,
+    "tendinitis": 224,
+    "tendinopatia": 224,
+    "tenosinovitisdedequervain": 247,
+    "tenosinovitisestenosante": 245,
+    "tensionocularalta": 416,
+    "tensionpremenstrual": 292,
+    "tept": 378,
+    "timoma": 370,
+    "timpanoroto": 435,
+    "tina": 321,
+    "tinaversicolor": 343,
+    "tinnitus": 418,
+    "tiroideshiperactiva": 193,
+    "tiroideshipoactiva": 192,
+    "tiroiditisdehashimoto": 165,
+    "tiroiditislinfociticacronica": 165,
+    "tironmuscular": 236,
+    "tirotoxicosis": 193,
+    "tlp": 384,
+    "toc": 377,
+    "tosersangre": 33,
+    "tosferina": 28,
+    "toxemiadelembarazo": 310,
+    "tpoc": 409,
+    "traqueitis": 8,
+    "trastornoafectivoestacional": 393,
+    "trastornobipolar": 376,
+    "trastornociclotimico": 395,
+    "trastornoconvulsivo": 118,
+    "trastornodeacumulacion": 392,
+    "trastornodeansiedadgeneralizada": 374,
+    "trastornodeansiedadporseparacion": 386,
+    "trastornodeansiedadsocial": 380,
+    "trastornodearrancarseelcabello": 389,
+    "trastornodeconversion": 410,
+    "trastornodedesregulaciondisruptivadelestadodeanimo": 397,
+    "trastornodeestrespostraumatico": 378,
+    "trastornodeexcoriacion": 390,
+    "trastornodeinsomniocronico": 125,
+    "trastornodelapersonalidadantisocial": 404,
+    "trastornodelapersonalidaddependiente": 408,
+    "trastornodelapersonalidadesquizoide": 402,
+    "trastornodelapersonalidadesquizotipica": 403,
+    "trastornodelapersonalidadevasiva": 407,
+    "trastornodelapersonalidadevitativa": 407,
+    "trastornodelapersonalidadhistrionica": 405,
+    "trastornodelapersonalidadnarcisista": 406,
+    "trastornodelapersonalidadobsesivocompulsiva": 409,
+    "trastornodelapersonalidadparanoide": 401,
+    "trastornodelapersonalidadporevitacion": 407,
+    "trastornodelirante": 399,
+    "trastornodepanico": 379,
+    "trastornodepresivomayor": 375,
+    "trastornodepresivopersistente": 394,
+    "trastornodesintomasneurologicosfuncionales": 410,
+    "trastornodesintomassomaticos": 411,
+    "trastornodisforicopremenstrual": 396,
+    "trastornodismorficocorporal": 391,
+    "trastornoesquizoafectivo": 398,
+    "trastornofacticio": 412,
+    "trastornolimitedelapersonalidad": 384,
+    "trastornoobsesivocompulsivo": 377,
+    "trastornooseofibroso": 249,
+    "trastornopordeficitdeatencionehiperactividad": 382,
+    "trastornopsicoticobreve": 400,
+    "trastornosdelaalimentacion": 383,
+    "trastornosneuromusculares": 229,
+    "trich": 308,
+    "tricomoniasis": 308,
+    "tricotilomania": 389,
+    "trigliceridosaltos": 113,
+    "tromboangeitisobliterante": 103,
+    "tromboembolismopulmonar": 13,
+    "trombosisvenosaprofunda": 98,
+    "tuberculosis": 9,
+    "tumorcerebral": 128,
+    "tumordeganglioslinfaticos": 351,
+    "tumordelamedulasuprarrenal": 207,
+    "tumordeltimo": 370,
+    "tumordepartesblandas": 233,
+    "tumoresbenignosenlanariz": 420,
+    "tumorhipofisarioproductordeprolactina": 199,
+    "tvp": 98,
+    "uci": 189,
+    "ulceradeestomago": 41,
+    "ulceraduodenal": 41,
+    "ulcerapeptica": 41,
+    "uretritis": 261,
+    "urticaria": 319,
+    "urticariacronicaidiopatica": 189,
+    "uveitisautoinmune": 186,
+    "vaginosisbacteriana": 289,
+    "valvulopatia": 90,
+    "varices": 105,
+    "varicocele": 298,
+    "vasculitisautoinmune": 176,
+    "vasculitisrenal": 281,
+    "vb": 289,
+    "vejiganeurogenica": 265,
+    "venasvaricosas": 105,
+    "venasvaricosasdelescroto": 298,
+    "verrugas": 322,
+    "verrugasdeagua": 329,
+    "verrugavulgar": 322,
+    "vhl": 138,
+    "virusdelherpessimple": 305,
+    "virusdelpapilomahumano": 306,
+    "virusdelpapilomahumanovph": 306,
+    "virussincitialrespiratorio": 22,
+    "visionborrosa": 424,
+    "visioncorta": 425,
+    "visionlarga": 426,
+    "vistacansada": 423,
+    "vitiligo": 160,
+    "vsr": 22,
+    "xantelasma": 344,
+    "zumbidoenlosoidos": 418,
+  },
+  ambiguas: ["diabetesinsulinodependiente","em","esclerosismultiple","ictus","vertigo"],
+};
@@ -0,0 +1,131 @@
+// Pócima Salvage - Resolución de alias de plantas y enfermedades
+// Consulta el índice generado por scripts/build-alias-index.py (misma lógica que scripts/catalogo/alias.py)
+
+import { IndiceAlias, aliasEnfermedades, aliasPlantas } from './alias-index';
+
+export type MetodoAlias = 'exacto' | 'normalizado' | 'difuso' | 'ambiguo' | 'no-resuelto';
+
+export interface AliasResuelto {
+  id: string;
+  // categoría (plantas) o sistema (enfermedades) donde aparece primero
+  bloqueId: string;
+  metodo: MetodoAlias;
+}
+
+// Similitud mínima (coeficiente de Dice sobre trigramas) para aceptar una coincidencia difusa
+const UMBRAL_DIFUSO = 0.65;
+
+// Sin acentos, minúsculas y sólo letras y dígitos: 'Diente de León' -> 'dientedeleon'
+export const normalizarAlias = (texto: string): string =>
+  texto.toLowerCase().normalize('NFD').replace(/[\u0300-\u036f]/g, '').replace(/[^a-z0-9]+/g, '');
+
+// Con dos espacios delante y uno detrás, como pg_trgm
+const trigramasAlias = (forma: string): Set<string> => {
+  const relleno = `  ${forma} `;
+  const trigramas = new Set<string>();
+  for (let i = 0; i + 3 <= relleno.length; i++) {
+    trigramas.add(relleno.slice(i, i + 3));
+  }
+  return trigramas;
+};
+
+interface Auxiliares {
+  ids: Map<string, number>;
+  ambiguas: Set<string>;
+  trigramas?: Map<string, string[]>;
+}
+
+const auxiliares = new WeakMap<IndiceAlias, Auxiliares>();
+
+const auxiliaresDe = (indice: IndiceAlias): Auxiliares => {
+  let aux = auxiliares.get(indice);
+  if (!aux) {
+    aux = {
+      ids: new Map(indice.entidades.map(([id], i) => [id, i])),
+      ambiguas: new Set(indice.ambiguas),
+    };
+    auxiliares.set(indice, aux);
+  }
+  return aux;
+};
+
+// Índice trigrama -> formas, construido sólo la primera vez que hace falta
+const trigramasDe = (indice: IndiceAlias, aux: Auxiliares): Map<string, string[]> => {
+  if (!aux.trigramas) {
+    aux.trigramas = new Map();
+    for (const forma of Object.keys(indice.formas)) {
+      for (const t of trigramasAlias(forma)) {
+        const formas = aux.trigramas.get(t);
+        if (formas) formas.push(forma);
+        else aux.trigramas.set(t, [forma]);
+      }
+    }
+  }
+  return aux.trigramas;
+};
+
+const difuso = (indice: IndiceAlias, aux: Auxiliares, forma: string): number | null => {
+  const consulta = trigramasAlias(forma);
+  const comunes = new Map<string, number>();
+  const porTrigrama = trigramasDe(indice, aux);
+  for (const t of consulta) {
+    for (const candidata of porTrigrama.get(t) ?? []) {
+      comunes.set(candidata, (comunes.get(candidata) ?? 0) + 1);
+    }
+  }
+  let mejor: string | null = null;
+  let mejorScore = 0;
+  let empate = false;
+  for (const [candidata, n] of comunes) {
+    const score = (2 * n) / (consulta.size + trigramasAlias(candidata).size);
+    if (score > mejorScore) {
+      mejor = candidata;
+      mejorScore = score;
+      empate = false;
+    } else if (score === mejorScore && mejor !== null && indice.formas[candidata] !== indice.formas[mejor]) {
+      empate = true;
+    }
+  }
+  return mejor === null || mejorScore < UMBRAL_DIFUSO || empate ? null : indice.formas[mejor];
+};
+
+// Cuántas claves se resolvieron por cada método (para diagnosticar etiquetas de MolDoctor)
+export const estadisticasAlias: Record<MetodoAlias, number> = {
+  exacto: 0,
+  normalizado: 0,
+  difuso: 0,
+  ambiguo: 0,
+  'no-resuelto': 0,
+};
+
+const resuelto = (indice: IndiceAlias, posicion: number, metodo: MetodoAlias): AliasResuelto => {
+  estadisticasAlias[metodo]++;
+  const [id, bloqueId] = indice.entidades[posicion];
+  return { id, bloqueId, metodo };
+};
+
+// Id de la entidad de un alias cualquiera, o null si no se resuelve (o es ambiguo)
+export const resolverAlias = (indice: IndiceAlias, texto: string): AliasResuelto | null => {
+  const aux = auxiliaresDe(indice);
+  const exacto = aux.ids.get(texto.trim());
+  if (exacto !== undefined) return resuelto(indice, exacto, 'exacto');
+
+  const forma = normalizarAlias(texto);
+  // typeof evita claves heredadas de Object.prototype ('constructor')
+  const posicion = indice.formas[forma];
+  if (typeof posicion === 'number') return resuelto(indice, posicion, 'normalizado');
+  if (aux.ambiguas.has(forma)) {
+    estadisticasAlias.ambiguo++;
+    return null;
+  }
+  if (forma) {
+    const cercana = difuso(indice, aux, forma);
+    if (cercana !== null) return resuelto(indice, cercana, 'difuso');
+  }
+  estadisticasAlias['no-resuelto']++;
+  return null;
+};
+
+export const resolverPlanta = (texto: string): AliasResuelto | null => resolverAlias(aliasPlantas, texto);
+
+export const resolverEnfermedad = (texto: string): AliasResuelto | null => resolverAlias(aliasEnfermedades, texto);
@@ -0,0 +1,7958 @@
+// Pócima Salvage - Índice de búsqueda por trigramas
+// Generado automáticamente por scripts/build-search-index.py - no editar a mano
+
+export interface IndiceBusqueda {
+  // Número de registros indexados
+  total: number;
+  // Huella del módulo del catálogo al generar el índice (para detectar un índice desactualizado)
+  huella: string;
+  campos: string[];
+  pesos: number[];
+  // Textos de cada registro ya en minúsculas y sin acentos, en el orden de `campos`
+  normalizados: string[][];
+  // trigrama -> posiciones crecientes, codificadas como diferencias en base 36
+  trigramas: Record<string, string>;
+}
+
+// carácter -> carácter plegado (minúscula sin acento)
+export const plegadoAcentos: Record<string, string> = {"Á":"a","À":"a","Â":"a","Ä":"a","Ã":"a","É":"e","È":"e","Ê":"e","Ë":"e","Í":"i","Ì":"i","Î":"i","Ï":"i","Ó":"o","Ò":"o","Ô":"o","Ö":"o","Õ":"o","Ú":"u","Ù":"u","Û":"u","Ü":"u","Ñ":"n","Ç":"c","á":"a","à":"a","â":"a","ä":"a","ã":"a","é":"e","è":"e","ê":"e","ë":"e","í":"i","ì":"i","î":"i","ï":"i","ó":"o","ò":"o","ô":"o","ö":"o","õ":"o","ú":"u","ù":"u","û":"u","ü":"u","ñ":"n","ç":"c"};
+
+export const indiceBusquedaPlantas: IndiceBusqueda = {
+  total: 693,
+  huella: "ac331aec271b1127",
+  campos: ["nombre","nombreCientifico","propiedades","descripcion"],
+  pesos: [8,4,2,1],
+  normalizados: [
+    ["albahaca","ocimum basilicum","antiespasmodica\ndigestiva\ncarminativa\nrelajante","hierba aromatica con propiedades digestivas y relajantes."],
+    ["romero","rosmarinus officinalis","estimulante\nantioxidante\nantiinflamatoria\ncarminativa","arbusto aromatico con efectos estimulantes y antioxidantes."],
+    ["tomillo","thymus vulgaris","antiseptica\nexpectorante\nantitusiva","planta con potentes propiedades antisepticas, ideal para afecciones respiratorias."],
+    ["oregano","origanum vulgare","antibacteriano\nantifungico\nantioxidante\ndigestivo","hierba con fuertes propiedades antimicrobianas y antioxidantes."],
+    ["menta","mentha piperita","digestiva\ncarminativa\nanalgesica\nrefrescante","planta refrescante que alivia problemas digestivos y dolores de cabeza."],
+    ["hierbabuena","mentha spicata","digestiva\ncarminativa\nantiespasmodica","similar a la menta, es excelente para trastornos digestivos leves."],
+    ["cilantro","coriandrum sativum","digestivo\ncarminativo\nquelante de metales pesados","hierba y especia que ayuda a la digestion y a eliminar toxinas."],
+    ["perejil","petroselinum crispum","diuretico\nrico en vitaminas\nantiinflamatorio","planta muy nutritiva con efecto diuretico y depurativo."],
+    ["eneldo","anethum graveolens","carminativo\ndigestivo\nantiespasmodico","eficaz para aliviar gases, colicos y otros problemas digestivos."],
+    ["laurel","laurus nobilis","digestivo\ncarminativo\nexpectorante","facilita la digestion y ayuda a expulsar la mucosidad de las vias respiratorias."],
+    ["salvia","salvia officinalis","antiinflamatoria\nantiseptica\nregulador hormonal\nantisudoral","planta con propiedades antiinflamatorias y reguladoras hormonales, util en la menopausia."],
+    ["mejorana","origanum majorana","sedante\ndigestiva\nantiespasmodica","hierba con un suave efecto sedante, util para el insomnio y la ansiedad."],
+    ["estragon","artemisia dracunculus","digestivo\nvermifugo\nanestesico local","estimula el apetito y la digestion, y tiene un ligero efecto anestesico."],
+    ["cebollino","allium schoenoprasum","rico en vitamina c\ndigestivo\nantiseptico suave","aporta vitaminas y un suave efecto digestivo y antiseptico."],
+    ["hinojo","foeniculum vulgare","carminativo\nexpectorante\ndiuretico\ngalactagogo","excelente para los gases y la hinchazon abdominal. tambien ayuda en la lactancia."],
+    ["comino","cuminum cyminum","carminativo\ndigestivo\nantiespasmodico","especia muy potente para aliviar los gases y mejorar la digestion."],
+    ["anis","pimpinella anisum","carminativo\ndigestivo\nexpectorante","clasico remedio para los gases y colicos, especialmente en ninos."],
+    ["curcuma","curcuma longa","antiinflamatoria\nantioxidante\nhepatoprotectora\nanticancerigena","potente antiinflamatorio natural, util en enfermedades cronicas."],
+    ["jengibre","zingiber officinale","antiemetico\nantiinflamatorio\ndigestivo\ncirculatorio","eficaz contra las nauseas y mareos, ademas de ser un buen antiinflamatorio."],
+    ["canela","cinnamomum verum","hipoglucemiante\nantimicrobiana\ntermogenica","ayuda a regular los niveles de azucar en sangre y tiene efecto calorifico."],
+    ["clavo de olor","syzygium aromaticum","analgesico dental\nantiseptico\ncarminativo","potente analgesico natural, especialmente para el dolor de muelas."],
+    ["cardamomo","elettaria cardamomum","digestivo\ncarminativo\nexpectorante","alivia la indigestion y el mal aliento, y ayuda a limpiar las vias respiratorias."],
+    ["azafran","crocus sativus","antidepresivo\nantioxidante\nafrodisiaco","especia valiosa con efectos positivos sobre el estado de animo."],
+    ["lavanda","lavandula angustifolia","relajante\nansiolitica\nantiseptica\ncicatrizante","aroma calmante que promueve el sueno y alivia la ansiedad. buena para la piel."],
+    ["melisa","melissa officinalis","sedante\nantiviral\ndigestiva\nansiolitica","conocida como toronjil, es excelente para calmar los nervios y problemas digestivos asociados."],
+    ["perifollo","anthriscus cerefolium","depurativo\ndiuretico\nexpectorante","hierba de sabor anisado que ayuda a depurar el organismo."],
+    ["angelica","angelica archangelica","digestiva\nexpectorante\ntonico nervioso","planta robusta que tonifica el sistema digestivo y nervioso."],
+    ["ajedrea","satureja montana","digestiva\nantiseptica\nafrodisiaca","facilita la digestion de alimentos pesados y tiene fama de estimulante."],
+    ["hisopo","hyssopus officinalis","expectorante\nantitusivo\nantiviral","remedio tradicional para la tos, los resfriados y otras afecciones respiratorias."],
+    ["tanaceto","tanacetum vulgare","vermifugo\nemenagogo\ndigestivo","planta toxica que debe ser usada solo bajo supervision experta como antiparasitario."],
+    ["levistico","levisticum officinale","diuretico\ncarminativo\nemenagogo","conocido como apio de monte, es un potente diuretico y digestivo."],
+    ["comino negro","nigella sativa","inmunoestimulante\nantihistaminico\nantiinflamatorio\nantitumoral","semilla con potentes efectos sobre el sistema inmune, alergias y procesos inflamatorios."],
+    ["fenogreco","trigonella foenum-graecum","galactagogo\nhipoglucemiante\nanabolizante natural","aumenta la produccion de leche materna y ayuda a regular el azucar en sangre."],
+    ["mostaza negra","brassica nigra","rubefaciente\nestimulante digestivo\nexpectorante","utilizada en cataplasmas para aliviar dolores musculares y congestion pulmonar."],
+    ["cilantro vietnamita","persicaria odorata","digestivo\nantiinflamatorio\nantibacteriano","hierba con sabor picante y citrico, usada en la cocina asiatica por sus propiedades digestivas."],
+    ["epazote","dysphania ambrosioides","vermifugo\nantiespasmodico\ncarminativo","hierba tradicional mexicana para expulsar parasitos intestinales y aliviar gases."],
+    ["pimpinela mayor","sanguisorba officinalis","astringente\nantihemorragica\nantiinflamatoria","planta utilizada para detener sangrados y tratar diarreas."],
+    ["agrimonia","agrimonia eupatoria","astringente\ncolagoga\nantiinflamatoria para la garganta","conocida como la \"hierba de los cantores\", es excelente para la afonia y la garganta irritada."],
+    ["galanga","alpinia galanga","carminativa\nantiemetica\nantiinflamatoria","pariente del jengibre, se usa para problemas digestivos y mareos."],
+    ["lemongrass","cymbopogon citratus","digestivo\nfebrifugo\nsedante suave\nantibacteriano","hierba con aroma a limon, ayuda a la digestion, calma los nervios y baja la fiebre."],
+    ["ruibarbo","rheum rhabarbarum","laxante\npurgante\nastringente (en dosis bajas)","su raiz es un laxante eficaz, pero debe usarse con cuidado. los tallos son comestibles."],
+    ["stevia","stevia rebaudiana","edulcorante natural\nhipoglucemiante\nhipotensora","endulzante natural sin calorias que puede ayudar a regular el azucar y la presion arterial."],
+    ["wasabi","eutrema japonicum","antimicrobiano\ndescongestionante\nantiinflamatorio","potente descongestionante nasal y con propiedades antimicrobianas, ideal para acompanar pescado crudo."],
+    ["bergamota","monarda didyma","carminativa\nantiseptica\nfebrifuga","tambien conocida como te de oswego, se usa para problemas digestivos y resfriados."],
+    ["calendula","calendula officinalis","cicatrizante\nantiinflamatoria\nantiseptica\nemenagoga","maravillosa para la piel, acelera la cicatrizacion y reduce la inflamacion."],
+    ["capuchina","tropaeolum majus","antibiotica natural\nexpectorante\nrica en vitamina c","considerada un antibiotico vegetal, es util para infecciones respiratorias y urinarias."],
+    ["borraja","borago officinalis","sudorifica\nexpectorante\nantiinflamatoria\nemoliente","el aceite de sus semillas es rico en omega-6, beneficioso para la piel y la inflamacion."],
+    ["hierbaluisa","aloysia citrodora","digestiva\ncarminativa\nrelajante\nantiespasmodica","tambien llamada verbena de olor, es una planta con aroma a limon excelente para la digestion y los nervios."],
+    ["gordolobo","verbascum thapsus","expectorante\nemoliente\nbalsamica","remedio pectoral por excelencia, suaviza la garganta y ayuda a expulsar la mucosidad."],
+    ["malva","malva sylvestris","emoliente\nantiinflamatoria\nlaxante suave\nbalsamica","rica en mucilagos, suaviza las mucosas respiratorias, digestivas y la piel."],
+    ["aciano","centaurea cyanus","antiinflamatorio ocular\ndiuretico\ntonico","la flor de aciano es el remedio principal para la inflamacion y el cansancio de los ojos."],
+    ["ulmaria","filipendula ulmaria","antiinflamatoria\nanalgesica\nantipiretica\ndiuretica","conocida como la \"aspirina vegetal\", alivia el dolor y la fiebre."],
+    ["milenrama","achillea millefolium","antihemorragica\nemenagoga\nantiinflamatoria\ndigestiva","planta de la mujer, regula los ciclos menstruales y corta hemorragias."],
+    ["artemisa","artemisia vulgaris","emenagoga\ntonico digestivo\nvermifuga","potente regulador menstrual y tonico para la digestion."],
+    ["ajenjo","artemisia absinthium","tonico amargo\nvermifugo\ncolagogo\nemenagogo","uno de los tonicos amargos mas potentes, para la falta de apetito y problemas de vesicula."],
+    ["lupulo","humulus lupulus","sedante\nhipnotico\nansiolitico\nfitoestrogenico","inductor del sueno y calmante de la ansiedad. tambien usado en la menopausia."],
+    ["valeriana","valeriana officinalis","sedante\nhipnotica\nrelajante muscular\nansiolitica","el remedio clasico para el insomnio y la ansiedad, relaja la mente y el cuerpo."],
+    ["ruda","ruta graveolens","emenagoga\nantiespasmodica\nrubefaciente","planta muy potente para regular la menstruacion, pero toxica en dosis altas."],
+    ["ajedrea de jardin","satureja hortensis","digestiva\ncarminativa\nantiseptica\nexpectorante","similar a la ajedrea de montana, pero con un sabor mas suave. ayuda a la digestion y alivia los gases."],
+    ["perilla","perilla frutescens","antialergica\nantiinflamatoria\nexpectorante\nantimicrobiana","hierba asiatica muy usada para tratar alergias estacionales, asma y resfriados."],
+    ["manzanilla","matricaria chamomilla","digestiva\nantiinflamatoria\ncalmante\nantibacteriana\nrelajante","la manzanilla es una de las plantas medicinales que mas se conocen por las propiedades de su flor. sus efectos son especialmente relevantes en el tratamiento de molestias gastrointestinales."],
+    ["aloe vera","aloe barbadensis miller","antiinflamatoria\ncicatrizante\nregeneradora\nhidratante","otra de las plantas medicinales mas conocidas es el aloe vera. se trata de una conocida planta con capacidad antiinflamatoria y que se utiliza en diversos productos de higiene personal debido a su accion favorecedora para la regeneracion cutanea."],
+    ["ajo","allium sativum","antibiotico\nanticoagulante\nantioxidante\nfortalecedor del sistema inmune","el ajo es un potente fortalecedor del sistema inmune y tiene efectos que promueven una circulacion sanguinea eficiente (es anticoagulante), ademas de ser antibacteriano y antibiotico y tener propiedades antioxidantes."],
+    ["eucalipto","eucalyptus globulus","expectorante\nantimicrobiano\nhipoglucemiante","el eucalipto es otra de las plantas medicinales mas conocidas, especialmente en lo que se refiere a su accion ante enfermedades respiratorias."],
+    ["cola de caballo","equisetum arvense","diuretica\ndepurativa\nregeneradora\nastringente","esta planta, en concreto su tallo, es especialmente conocida por aquellas personas con cistitis u otras infecciones del aparato urinario."],
+    ["hiperico","hypericum perforatum","antidepresivo\nansiolitico\nanalgesico","tambien llamada hierba de san juan. esta planta medicinal tiene diferentes propiedades, pero destaca el hecho de que posee propiedades antidepresivas."],
+    ["jengibre","zingiber officinale","antiemetico\nantiinflamatorio\nantibacteriano\nantiviral","esta especia es de gran utilidad, poseyendo multiples propiedades que la hacen una planta medicinal cada vez mas relevante."],
+    ["tomillo","thymus vulgaris","antiseptico\nexpectorante\nantioxidante","el tomillo posee propiedades antioxidantes y antisepticas. rico en flavonoides, vitamina c, hierro y magnesio."],
+    ["lavanda","lavandula angustifolia","relajante\ncicatrizante\nanalgesica","la lavanda posee propiedades relajantes, siendo util para situaciones de estres e insomnio."],
+    ["tila","tilia cordata","relajante\ndiuretica\nantiespasmodica","otra planta medicinal altamente conocida y con propiedades relajantes es la tila."],
+    ["diente de leon","taraxacum officinale","diuretico\ndepurativo\nestimulante","el diente de leon es una planta muy nutritiva y con multiples propiedades medicinales."],
+    ["ginkgo biloba","ginkgo biloba","vasodilatador\nantioxidante\nmejora la memoria","el extracto de sus hojas mejora la circulacion sanguinea y se centra especialmente en el riego cerebral, con lo que mejora la concentracion y la memoria."],
+    ["mate","ilex paraguariensis","estimulante\nantioxidante\ndiuretico","la planta con la que esta hecha la conocida bebida argentina es tambien muy positiva para la salud."],
+    ["oregano","origanum vulgare","antioxidante\nantifungico\nantibacteriano\nantiinflamatorio\nantihistaminico","el oregano es un viejo conocido de nuestras cocinas, tradicionalmente muy bien valorado y que posee tambien grandes propiedades medicinales."],
+    ["pasiflora","passiflora incarnata","calmante\nanalgesico\nantiespasmodico","se trata de una planta que posee propiedades calmantes. disminuye la tension arterial y reduce el ritmo cardiaco."],
+    ["corteza de sauce","salix alba","antiinflamatorio\nanalgesico\nantipiretico","el extracto de esta corteza es util como antiinflamatorio. tambien se ha visto util para la perdida de peso, el tratamiento de la cefalea, la artritis y el dolor de huesos."],
+    ["agave","agave americana","antiseptico\nestimulante intestinal\nhipoglucemiante","el agave posee tambien propiedades medicinales. concretamente destaca su uso en la curacion de heridas y llagas, pudiendo emplearse como desinfectante."],
+    ["arandano","vaccinium myrtillus","antioxidante\ndiuretico\nantibacteriano\nastringente","los arandanos tambien tienen propiedades medicinales. su fruto no solo es comestible sino que tambien es un potente antioxidante, que ademas es diuretico y beneficioso en la prevencion de problemas urinarios y renales."],
+    ["acebo","ilex aquifolium","antipiretico\npurgante\ndiuretico\nrelajante","algunas variedades de esta planta han sido empleada para tratar gran cantidad de problemas, desde para bajar la fiebre hasta como purgante, pasando por ser un elemento que contribuye a combatir la ictericia."],
+    ["flor de sauco","sambucus nigra","antiseptico\nantiinflamatorio\ndiuretico\nlaxante","esta bonita flor ha sido empleada como remedio para tratar diferentes problemas. con propiedades antisepticas y antiinflamatorias, ademas de diureticas y laxantes, se ha utilizado para tratar episodios gripales y disminuir la tos y los problemas con las mucosas."],
+    ["yuca","manihot esculenta","energetica\nmetabolismo\ndigestiva","este arbusto perenne originario de ciertas regiones centrales de sudamerica, en partes tropicales. lo que la hace especial es que sus raices son muy ricas en almidones y ayudan a aumentar el ritmo metabolico y a perder peso."],
+    ["ginseng","panax ginseng","energizante\ninmunoestimulante\nhipotensor","esta planta es utilizada como ingrediente para infusiones que pueden ser utilizadas para aportar energia y mantener activas a las personas."],
+    ["poleo menta","mentha pulegium","digestivo\naperitivo\ncarminativo","el poleo menta ha sido utilizado durante mucho tiempo por su capacidad para aumentar el apetito y mejorar la asimilacion de nutrientes por parte del organismo, lo cual mejora el proceso de la digestion."],
+    ["ortiga","urtica dioica","vasoconstrictor\nantianemico\ndiuretico","la ortiga es una planta con mala reputacion debido a que sus hojas producen urticaria, pero mas alla de esta molesta caracteristica podemos encontrar propiedades medicinales."],
+    ["dedalera","digitalis purpurea","diuretico\ncardiotonico","esta planta es rica en digoxina y digitoxina, las cuales ejercen un efecto diuretico y favorecen la circulacion sanguinea."],
+    ["sandalo","santalum album","antiseptico\ndiuretico\nrelajante","sus propiedades antisepticas basadas en el sandalo hacen de los aceites esenciales de esta planta una buena ayuda para desinfectar heridas."],
+    ["amapola","papaver somniferum","analgesico\nnarcotico\nsedante","la amapola es una hierba que crece de manera natural en una gran variedad de ambientes, y desde hace milenios ha sido aprovechada como ingrediente por sus propiedades narcoticas contra el dolor."],
+    ["eneldo","anethum graveolens","antiespasmodico\ncarminativo\ncicatrizante","las semillas del eneldo son utilizadas con fines medicinales desde la antiguedad, especialmente contra el dolor asociado a la menstruacion (dismenorrea) y los espasmos."],
+    ["apio","apium graveolens","digestivo\nlaxante\ndiuretico","el apio es un ingrediente habitual a la hora de preparar platos muy conocidos en cocina, pero tambien puede ser considerado un miembro del grupo de las plantas medicinales."],
+    ["ajenjo","artemisia absinthium","aperitivo\nantiparasitario\ndigestivo","el ajenjo, tambien conocido como hierba santa o artemisa amarga, es una planta medicinal muy conocida en todos los continentes y que viene usandose desde hace miles de anos."],
+    ["kava","piper methysticum","anestesico\nsedante\nansiolitico","el kava es una planta medicinal originaria de la polinesia. sus raices se utilizan especialmente para hacer mezclas con efectos anestesicos y sedantes, y de consumo oral."],
+    ["ruda","ruta graveolens","antiespasmodico\nsedante\nemenagogo","la ruda es una planta de tipo arbusto con hojas a partir de las cuales es posible elaborar aceites esenciales usados en medicina tradicional."],
+    ["calendula","calendula officinalis","antiinflamatoria\ncicatrizante\nantiseptica","la calendula es otra de las plantas medicinales que mas alla de los remedios caseros ha sido usada tambien en la cocina como un ingrediente mas."],
+    ["escaramujo","rosa canina","vitaminico (vitamina c)\nantiinflamatorio\nantioxidante","el escaramujo se usa para aliviar el dolor relacionado con dolencias como la artritis y ciertas infecciones. ademas, es una de las plantas mas ricas en vitamina c."],
+    ["bejuco de agua","cissus verticillata","anticonvulsivo\nantihemorragico\nantiinflamatorio","el bejuco de agua (cissus verticillata) es una planta trepadora de zonas de centroamerica, colombia y venezuela. se la usa como anticonvulsivo y para tratar las hemorragias."],
+    ["olmo","ulmus rubra","antibacteriano\ndemulcente\nnutritivo","la corteza de este arbol es utilizada por sus propiedades antibacterianas, y tambien como suplemento dietetico, asi como contra la irritacion de la garganta."],
+    ["hinojo","foeniculum vulgare","diuretico\ncarminativo\nexpectorante","el hinojo es una planta medicinal habitual en los ecosistemas mediterraneos. es apreciada por sus propiedades diureticas y por favorecer la expulsion de gases y la digestion."],
+    ["limoncillo","melissa officinalis","relajante\nsedante\ndigestivo","el limoncillo (melissa officinalis), toronjil u hoja de limon es una planta perenne utilizada en infusiones para favorecer un estado de relajacion."],
+    ["ricino","ricinus communis","purgante\nlaxante","el aceite de ricino es un purgante muy conocido, y se consume de manera oral a pesar de su desagradable sabor."],
+    ["konjac","amorphophallus konjac","saciante\nhipocolesterolemiante\nlaxante","el konjac (amorphophallus konjac), tambien conocido como lengua del diablo, es una planta originaria de china y el sudeste asiatico que por su alta concentracion de fibra se usa como dietetico."],
+    ["lechuga silvestre","lactuca virosa","sedante\nanalgesico\nhipnotico","la lechuga silvestre (lactuca virosa) es una planta con propiedades psicoactivas que se utiliza como sedante en algunos contextos."],
+    ["helecho gu-sui-bu","drynaria roosii","regenerador oseo\nanalgesico","esta variedad de helecho se ha utilizado durante siglos en la medicina tradicional china para favorecer la regeneracion de los huesos tras sufrir danos."],
+    ["junco de esteras","juncus effusus","energizante\ntonico","este tipo de junco se utiliza en algunas regiones de asia occidental como ingrediente a anadir en alimentos para personas cansadas y con poca energia."],
+    ["apong-apong","aglaia edulis","antiparasitario","ciertas partes de este arbol tropical son utilizadas para contribuir a eliminar parasitos como los piojos o la sarna."],
+    ["khat","catha edulis","estimulante\nanorexigeno","las hojas de este arbusto del cuerno de africa y la peninsula arabiga se mastican por sus efectos estimulantes."],
+    ["kaempferia rotunda","kaempferia rotunda","antipruriginoso\nantiinflamatorio","esta planta medicinal se hierve para ser utilizada sobre la piel y aliviar el picor."],
+    ["hierba de san simon","circaea lutetiana","antipiretico\nantirreumatico","la circaea lutetiana se ha utilizado durante siglos para bajar la fiebre y aliviar el malestar por reumatismo."],
+    ["kadsura longipedunculata","kadsura longipedunculata","digestivo\nantibacteriano","este arbusto originario de china y zonas del sudeste asiatico se utiliza para tratar algunos problemas gastrointestinales (digestion lenta), e infecciones."],
+    ["guaco","mikania glomerata","antiinflamatorio\nbroncodilatador\nexpectorante","las infusiones de esta planta trepadora, tambien llamada bejuco, se utilizan como antiinflamatorio y para problemas respiratorios."],
+    ["copaiba","copaifera officinalis","laxante\ndiuretico\nbalsamico","la copaifera officinalis, o copaiba es una de las principales plantas medicinales de sudamerica. tiene efectos laxantes y diureticos, y sus vapores pueden ser inhalados para aprovechar sus beneficios balsamicos."],
+    ["fenogreco","trigonella foenum-graecum","digestivo\nhipoglucemiante\ngalactogogo","el fenogreco (trigonella foenum-graecum), tambien conocido como alholva, es una de las plantas medicinales mas tradicionales. parece ser que facilita la digestion."],
+    ["moringa","moringa oleifera","antiinflamatorio\nhipotensor\nnutritivo","la moringa oleifera es una de las plantas medicinales mas importantes de la india. las hojas de este arbol tienen propiedades antiinflamatorias y ayuda a las personas que sufren hipotension."],
+    ["centella asiatica","centella asiatica","cicatrizante\nantiulceroso\nvenotonico","la centella asiatica, tambien llamada gotu kola, se ha usado tradicionalmente en muchas culturas de asia. esta demostrada su utilidad a la hora de tratar las ulceras y para prevenir la aparicion de cicatrices queloides."],
+    ["grosellero de la india","phyllanthus emblica","hipolipemiante\nantioxidante\nhepatoprotector","la amla, o grosellero de la india, es un pequeno arbol cuyos aceites ayudan a disminuir la presencia de trigliceridos en la sangre."],
+    ["bardana","arctium lappa","depurativa\ndesintoxicante\nantiinflamatoria\nantibacteriana","la bardana es conocida por sus propiedades depurativas y desintoxicantes. se ha usado tradicionalmente para mejorar afecciones de la piel como el acne, el eccema o la psoriasis."],
+    ["malva","malva sylvestris","emoliente\nantiinflamatoria\nsuavizante\nlaxante suave","la malva es una planta muy valorada por sus efectos emolientes, antiinflamatorios y suavizantes. se emplea principalmente para aliviar irritaciones en la garganta y las vias respiratorias."],
+    ["anis verde","pimpinella anisum","carminativo\ndigestivo\nsedante suave\nexpectorante","el anis verde es una planta medicinal empleada para favorecer la digestion y aliviar los gases. sus semillas son ricas en aceites esenciales con propiedades carminativas."],
+    ["salvia","salvia officinalis","antiseptica\nantiinflamatoria\nastringente\nemenagoga\nhipoglucemiante","conocida desde tiempos antiguos, la salvia tiene multiples beneficios para la salud. posee propiedades antisepticas, antiinflamatorias y astringentes, y es muy utilizada para tratar problemas bucales."],
+    ["romero","rosmarinus officinalis","estimulante circulatorio\nanalgesico\nantioxidante\ncarminativo","el romero es una planta aromatica muy apreciada por su efecto estimulante sobre la circulacion y su capacidad para aliviar dolores musculares y articulares."],
+    ["boldo","peumus boldus","hepatoprotector\ncoleretico\ndiuretico\nsedante suave","el boldo es un arbol originario de chile, muy apreciado por sus beneficios para el higado y la vesicula biliar. facilita la digestion de las grasas."],
+    ["eucalipto","eucalyptus globulus","expectorante\nantiseptico\nantiinflamatorio\ndescongestionante","arbol de gran porte conocido por sus propiedades para tratar afecciones respiratorias."],
+    ["sauce","salix alba","analgesico\nantiinflamatorio\nantipiretico","la corteza de sauce es la fuente original del acido salicilico, precursor de la aspirina."],
+    ["tilo","tilia cordata","relajante\nsedante\nantiespasmodico\ndiaforetico","arbol ornamental cuyas flores se utilizan en infusion por sus propiedades relajantes y para combatir el insomnio."],
+    ["olivo","olea europaea","hipotensor\nhipoglucemiante\nantioxidante","las hojas de olivo se utilizan para regular la presion arterial y los niveles de azucar en sangre."],
+    ["neem","azadirachta indica","antibacteriano\nantifungico\ninsecticida\nantiinflamatorio","arbol originario de la india con multiples propiedades medicinales, especialmente para la piel."],
+    ["moringa","moringa oleifera","nutritivo\nantioxidante\nantiinflamatorio","conocido como el “arbol de la vida” por su alto valor nutricional y sus multiples beneficios para la salud."],
+    ["ginkgo biloba","ginkgo biloba","vasodilatador cerebral\nantioxidante\nneuroprotector","uno de los arboles mas antiguos del mundo, utilizado para mejorar la memoria y la circulacion cerebral."],
+    ["castano de indias","aesculus hippocastanum","venotonico\nantiinflamatorio\nantiedematoso","utilizado tradicionalmente para tratar problemas de circulacion venosa, como las varices y las hemorroides."],
+    ["fresno","fraxinus excelsior","diuretico\nantiinflamatorio\nanalgesico","arbol utilizado para aliviar dolores articulares y musculares, y para favorecer la eliminacion de liquidos."],
+    ["abedul","betula pendula","diuretico\ndepurativo\nantiinflamatorio","conocido por sus propiedades diureticas y depurativas, ayuda a eliminar toxinas y a tratar afecciones de la piel."],
+    ["cipres","cupressus sempervirens","astringente\nvasoconstrictor\nantiespasmodico","utilizado para tratar problemas circulatorios como varices y hemorroides, y para aliviar la tos."],
+    ["pino","pinus sylvestris","expectorante\nantiseptico\nbalsamico","las yemas de pino son un remedio tradicional para la tos y las afecciones respiratorias."],
+    ["cedro","cedrus libani","antiseptico\nexpectorante\nrelajante","el aceite esencial de cedro se utiliza en aromaterapia por sus propiedades relajantes y para aliviar la congestion."],
+    ["arce","acer saccharum","antiinflamatorio\nantioxidante","el jarabe de arce, ademas de ser un edulcorante natural, contiene compuestos con propiedades antiinflamatorias y antioxidantes."],
+    ["roble","quercus robur","astringente\nantiinflamatorio\nantiseptico","la corteza de roble es rica en taninos, lo que le confiere propiedades astringentes para tratar inflamaciones de la boca y la garganta."],
+    ["haya","fagus sylvatica","antiseptico\nexpectorante\nfebrifugo","utilizada tradicionalmente para bajar la fiebre y tratar afecciones respiratorias."],
+    ["nogal","juglans regia","astringente\nantifungico\nhipoglucemiante","las hojas de nogal se usan para tratar problemas de piel y regular los niveles de azucar en sangre."],
+    ["tejo","taxus baccata","antitumoral","del tejo se extrae el paclitaxel, un potente farmaco utilizado en quimioterapia para tratar diversos tipos de cancer."],
+    ["espino blanco","crataegus monogyna","cardiotonico\nhipotensor\nrelajante","conocido como el “arbol del corazon”, se utiliza para regular el ritmo cardiaco y la presion arterial."],
+    ["avellano","corylus avellana","astringente\nantiinflamatorio\nvenotonico","las hojas y la corteza de avellano se utilizan en preparados para mejorar la circulacion y tratar problemas de piel."],
+    ["alcornoque","quercus suber","astringente\nantiinflamatorio","la corteza del alcornoque, de donde se extrae el corcho, tiene propiedades similares a la del roble."],
+    ["encina","quercus ilex","astringente\nantiinflamatorio","al igual que otros arboles del genero quercus, la encina tiene propiedades astringentes."],
+    ["serbal","sorbus aucuparia","vitaminico\nastringente","los frutos del serbal son ricos en vitamina c y se utilizan para preparar mermeladas y licores."],
+    ["laurel","laurus nobilis","digestivo\ncarminativo\nexpectorante","ademas de su uso culinario, el laurel facilita la digestion y ayuda a expulsar los gases."],
+    ["magnolia","magnolia grandiflora","ansiolitico\nantiinflamatorio","la corteza de magnolia se utiliza en la medicina tradicional china por sus efectos ansioliticos y antiinflamatorios."],
+    ["arbol del te","melaleuca alternifolia","antiseptico\nantibacteriano\nantifungico","el aceite esencial de arbol del te es un potente antiseptico natural para tratar infecciones de la piel."],
+    ["canelo","drimys winteri","antiescorbutico\ntonico\nestimulante","arbol sagrado del pueblo mapuche, utilizado tradicionalmente para combatir el escorbuto y como tonico general."],
+    ["boldo","peumus boldus","hepatoprotector\ncoleretico\ndigestivo","las hojas de boldo estimulan la produccion de bilis y protegen el higado, facilitando la digestion de las grasas."],
+    ["quina","cinchona officinalis","antipaludico\nfebrifugo\namargo","de la corteza de la quina se extrae la quinina, el primer tratamiento eficaz contra la malaria."],
+    ["sangre de drago","croton lechleri","cicatrizante\nantiinflamatorio\nantiviral","el latex de este arbol amazonico es un potente cicatrizante y se utiliza para curar heridas y ulceras."],
+    ["araucaria","araucaria araucana","nutritivo\nenergetico","los pinones de la araucaria son un alimento muy nutritivo y energetico, base de la dieta de los pueblos originarios del sur de chile y argentina."],
+    ["alerce","larix decidua","expectorante\nantiseptico","utilizado en la medicina popular europea para tratar afecciones respiratorias."],
+    ["abeto","abies alba","balsamico\nexpectorante\nantiseptico","las yemas de abeto se utilizan para preparar jarabes contra la tos y los resfriados."],
+    ["acacia","acacia senegal","emoliente\nantiinflamatorio\nastringente","la goma arabiga, exudado de la acacia, se utiliza para aliviar la irritacion de garganta y las molestias digestivas."],
+    ["algarrobo","ceratonia siliqua","antidiarreico\nnutritivo\nexpectorante","la harina de algarroba es un remedio eficaz contra la diarrea y una alternativa saludable al cacao."],
+    ["almendro","prunus dulcis","emoliente\nnutritivo\nlaxante suave","el aceite de almendras es un excelente emoliente para la piel, y las almendras son un alimento muy nutritivo."],
+    ["caoba","swietenia mahagoni","astringente\nfebrifugo","la corteza de caoba se ha utilizado en la medicina tradicional para tratar la fiebre y la diarrea."],
+    ["ceiba","ceiba pentandra","diuretico\nemoliente\nfebrifugo","arbol sagrado en muchas culturas de america, utilizado por sus propiedades diureticas y para bajar la fiebre."],
+    ["chopo","populus nigra","antiinflamatorio\nanalgesico\nantiseptico","las yemas de chopo se utilizan para preparar unguentos antiinflamatorios y analgesicos."],
+    ["granado","punica granatum","astringente\nvermifugo\nantioxidante","la corteza de la raiz del granado es un potente vermifugo, mientras que el fruto es un excelente antioxidante."],
+    ["guayabo","psidium guajava","astringente\nantidiarreico\nantiseptico","las hojas de guayabo son un remedio muy eficaz para detener la diarrea."],
+    ["higuera","ficus carica","laxante\nemoliente\nexpectorante","los higos son un laxante suave y eficaz, y el latex de la higuera se usa para eliminar verrugas."],
+    ["jaboncillo","sapindus saponaria","detergente\ninsecticida","los frutos de este arbol, ricos en saponinas, se han utilizado tradicionalmente como jabon natural."],
+    ["limonero","citrus limon","antiseptico\nvitaminico\nalcalinizante","el limon es una fuente excepcional de vitamina c y un potente antiseptico natural."],
+    ["madrono","arbutus unedo","astringente\nantiseptico urinario\nantiinflamatorio","las hojas de madrono son un buen antiseptico para las vias urinarias."],
+    ["moral","morus nigra","laxante suave\nexpectorante\nhipoglucemiante","las moras son un laxante suave y las hojas del moral ayudan a regular los niveles de azucar."],
+    ["naranjo amargo","citrus aurantium","sedante\ndigestivo\nantiespasmodico","la flor de azahar, del naranjo amargo, es un remedio tradicional para calmar los nervios y facilitar el sueno."],
+    ["olmo","ulmus minor","astringente\nantiinflamatorio\ncicatrizante","la corteza de olmo se utiliza en preparados para tratar afecciones de la piel como eccemas y heridas."],
+    ["peral","pyrus communis","diuretico\nastringente\nremineralizante","la pera es una fruta diuretica y rica en minerales. las hojas tienen propiedades astringentes."],
+    ["romero","rosmarinus officinalis","antioxidante\nantiinflamatorio\nantiseptico\nestimulante circulatorio\ncarminativo","arbusto aromatico perenne, muy utilizado en la cocina mediterranea y con notables propiedades medicinales."],
+    ["lavanda","lavandula angustifolia","relajante\nansiolitico\nantiseptico\nanalgesico\ncicatrizante","conocida por su aroma relajante, la lavanda es un arbusto popular en jardineria y aromaterapia."],
+    ["hamamelis","hamamelis virginiana","astringente\nantiinflamatorio\nhermostatico\ncicatrizante","arbusto de norteamerica cuyo extracto es ampliamente utilizado en cosmetica y para tratar problemas de piel y circulatorios."],
+    ["espino blanco","crataegus monogyna","cardiotonico\nhipotensor\nvasodilatador coronario\nsedante","conocido como el 'alimento del corazon', es un arbusto espinoso usado tradicionalmente para trastornos cardiacos y nerviosos."],
+    ["sauzgatillo","vitex agnus-castus","regulador hormonal (progesterogenico)\nalivia sintomas del sindrome premenstrual (spm)\nemenagogo","arbusto mediterraneo utilizado desde la antiguedad para regular el ciclo menstrual y aliviar sus sintomas."],
+    ["gayuba","arctostaphylos uva-ursi","antiseptico urinario\ndiuretico\nastringente","pequeno arbusto rastrero cuyas hojas son un remedio clasico para las infecciones del tracto urinario."],
+    ["arandano rojo americano","vaccinium macrocarpon","antiadherente bacteriano (vias urinarias)\nantioxidante\nantiinflamatorio","famoso por su capacidad para prevenir infecciones urinarias recurrentes al impedir que las bacterias se adhieran a las paredes de la vejiga."],
+    ["grosellero negro","ribes nigrum","antiinflamatorio (similar a la cortisona)\nantialergico\ndiuretico\nrico en vitamina c","arbusto cuyos frutos son muy nutritivos y sus hojas y yemas tienen potentes efectos antiinflamatorios y antialergicos."],
+    ["enebro","juniperus communis","diuretico potente\nantiseptico (urinario y respiratorio)\ncarminativo\nantirreumatico","conifera arbustiva cuyas bayas se usan para aromatizar la ginebra y como un potente diuretico y antiseptico."],
+    ["madrono","arbutus unedo","antiseptico urinario\nastringente\ndiuretico\nantiinflamatorio","arbol o arbusto mediterraneo con frutos comestibles y hojas con propiedades similares a la gayuba para el sistema urinario."],
+    ["zarzaparrilla","smilax aspera","depurativa\ndiuretica\nsudorifica\nantiinflamatoria","arbusto trepador cuya raiz es famosa por sus propiedades depurativas, usada para limpiar la sangre y tratar problemas de piel."],
+    ["rusco","ruscus aculeatus","venotonico\nantiinflamatorio\nantiedematoso\ndiuretico","pequeno arbusto de hojas rigidas y punzantes, muy eficaz para tratar la insuficiencia venosa cronica, hemorroides y piernas cansadas."],
+    ["mirto","myrtus communis","antiseptico\nexpectorante\nbalsamico\nastringente","arbusto aromatico mediterraneo, sagrado en la antiguedad, utilizado para afecciones respiratorias y como tonico para la piel."],
+    ["jara pringosa","cistus ladanifer","antiviral\nantibacteriano\ncicatrizante\nantihemorragico","arbusto mediterraneo cubierto de una resina pegajosa (ladano) con potentes propiedades antivirales y cicatrizantes."],
+    ["brezo","calluna vulgaris","antiseptico urinario\ndiuretico\nantiinflamatorio\nsedante suave","arbusto de bajo crecimiento que cubre grandes extensiones (brezales), cuyas flores son un remedio suave para las vias urinarias y el reumatismo."],
+    ["sauco","sambucus nigra","antiviral (gripe)\nsudorifico\nantiinflamatorio\ndiuretico","arbusto o pequeno arbol cuyas flores y bayas son un remedio tradicional muy efectivo para gripes y resfriados."],
+    ["artemisa","artemisia vulgaris","emenagogo (regula la menstruacion)\ntonico digestivo\nvermifugo\ncoleretico","planta herbacea o arbustiva con un aroma caracteristico, utilizada tradicionalmente para problemas digestivos y ginecologicos."],
+    ["boj","buxus sempervirens","sudorifico\ndepurativo\nfebrifugo\ncolagogo","arbusto de crecimiento lento muy usado en jardineria ornamental. medicinalmente es toxico y su uso casero esta obsoleto y es peligroso."],
+    ["aligustre","ligustrum vulgare","astringente\nvulnerario\nantiinflamatorio (uso externo)","arbusto muy comun en setos de jardin. sus hojas se usan externamente para aftas bucales y heridas, pero sus frutos son venenosos."],
+    ["bonetero","euonymus europaeus","laxante drastico\nvomitivo\ninsecticida (uso externo)","arbusto con frutos rosados muy caracteristicos y decorativos, pero extremadamente toxicos. su uso medicinal es obsoleto y peligroso."],
+    ["cornejo sanguineo","cornus sanguinea","febrifugo\nastringente\ntonico","arbusto con ramas rojizas en invierno, cuya corteza se usaba antiguamente como sustituto de la quinina para bajar la fiebre."],
+    ["durillo","viburnum tinus","febrifugo\npurgante\nantipiretico","arbusto ornamental de floracion invernal. se ha usado como febrifugo, pero su toxicidad hace que su uso interno sea desaconsejable."],
+    ["espino cerval de mar","hippophae rhamnoides","muy rico en vitamina c\nantioxidante\ncicatrizante\ninmunoestimulante","arbusto espinoso cuyos frutos anaranjados son una de las fuentes vegetales mas ricas en vitamina c y otros nutrientes."],
+    ["forsitia","forsythia suspensa","antibacterial\nantiinflamatorio\nantipiretico\nantiviral","arbusto ornamental conocido por su espectacular floracion amarilla en primavera. su fruto es una importante hierba en la medicina china."],
+    ["mahonia","mahonia aquifolium","antimicrobiano (berberina)\ncolagogo\nalterativo (depurativo)\nantiinflamatorio","tambien llamado 'uva de oregon', es un arbusto con bayas comestibles y una raiz rica en berberina, usada para infecciones y problemas de piel."],
+    ["pirlitero","crataegus azarolus","cardiotonico\nastringente\nrico en vitamina c","arbusto o pequeno arbol mediterraneo, pariente del espino blanco, con frutos comestibles (acerolas) ricos en vitamina c y con propiedades para el corazon."],
+    ["retama negra","cytisus scoparius","cardiotonico (esparteina)\ndiuretico\nhipertensor","arbusto de flores amarillas muy vistosas. contiene esparteina, un alcaloide toxico con accion sobre el corazon. su uso casero es muy peligroso."],
+    ["rosa canina (escaramujo)","rosa canina","muy rico en vitamina c\nastringente\nantiinflamatorio\ndiuretico suave","rosal silvestre cuyos frutos, los escaramujos, son excepcionalmente ricos en vitamina c, ideales para prevenir resfriados y reforzar el sistema inmune."],
+    ["salvia real","phlomis lychnitis","antiinflamatorio\ncicatrizante\nantiseptico (uso externo)","arbusto mediterraneo con hojas que recuerdan a las del gordolobo, tradicionalmente usado para desinfectar y cicatrizar heridas."],
+    ["te de aragon","jasonia glutinosa","digestivo\ncarminativo\nantiespasmodico\naperitivo","pequeno arbusto que crece en roquedos calcareos, muy popular en aragon y otras zonas de espana como remedio para todo tipo de trastornos digestivos."],
+    ["tomillo salsero","thymbra capitata","antiseptico potente\nexpectorante\nantifungico\nantiespasmodico","arbusto de intenso aroma, considerado uno de los tomillos con mayor poder antiseptico gracias a su alto contenido en carvacrol."],
+    ["torvisco","daphne gnidium","purgante drastico\nvesicante (produce ampollas en la piel)","arbusto mediterraneo muy venenoso. se usaba en el pasado como veneno para pescar (embarbascar) y como purgante, practicas hoy prohibidas y muy peligrosas."],
+    ["viburno","viburnum opulus","antiespasmodico (especialmente uterino)\nsedante\nastringente\nhipotensor","conocido como 'cramp bark' en ingles, es un arbusto cuya corteza es un relajante muscular muy eficaz, especialmente para calambres menstruales."],
+    ["agnocasto","vitex agnus-castus","regulador hormonal\nalivia el sindrome premenstrual\ntrata irregularidades menstruales","arbusto que crece en las riberas de los rios y que se ha utilizado desde la antiguedad para tratar los desequilibrios hormonales femeninos."],
+    ["aladierno","rhamnus alaternus","laxante\nastringente\nfebrifugo","arbusto mediterraneo de hoja perenne, cuya corteza tiene propiedades laxantes, aunque mas suaves que las de la frangula."],
+    ["arrayan","myrtus communis","antiseptico\nexpectorante\nastringente","arbusto aromatico, tambien conocido como mirto, utilizado para tratar afecciones respiratorias y digestivas."],
+    ["berberis","berberis vulgaris","tonico hepatico\nestimulante de la bilis\nantimicrobiano","arbusto espinoso, tambien llamado agracejo, cuya raiz es rica en berberina, un potente estimulante hepatico y biliar."],
+    ["ceanoto","ceanothus americanus","linfagogo\nastringente\nexpectorante","conocido como 'raiz roja', es un arbusto norteamericano que actua como un excelente tonico para el sistema linfatico."],
+    ["chicalote","argemone mexicana","sedante\nanalgesico\nantitusivo","planta arbustiva espinosa con flores amarillas parecidas a las amapolas. se usa en la medicina tradicional mexicana como calmante."],
+    ["damiana","turnera diffusa","afrodisiaco\ntonico nervioso\nantidepresivo suave\ndiuretico","arbusto aromatico originario de mexico, conocido por sus efectos estimulantes y afrodisiacos, asi como por ser un tonico para el sistema nervioso."],
+    ["equiseto menor","equisetum arvense","remineralizante\ndiuretico\ncicatrizante\nastringente","planta primitiva sin flores ni frutos, rica en silicio y otros minerales, lo que la convierte en un excelente regenerador de tejidos."],
+    ["eucalipto","eucalyptus globulus","expectorante\nantiseptico respiratorio\ndescongestionante\nfebrifugo","arbol de origen australiano cuyas hojas son un remedio clasico y muy eficaz para todo tipo de afecciones del sistema respiratorio."],
+    ["gobernadora","larrea tridentata","antimicrobiano\nantioxidante\nantiinflamatorio","arbusto resinoso del desierto de sonora, muy resistente. se usa tradicionalmente para infecciones de la piel, reumatismo y como conservante."],
+    ["guayule","parthenium argentatum","analgesico\nantiinflamatorio","arbusto del desierto de mexico, conocido por ser una fuente de hule hipoalergenico. tradicionalmente se usa para aliviar el dolor reumatico."],
+    ["hierba del pollo","commelina pallida","antihemorragica\ncicatrizante\nantiseptica","planta rastrera que se considera un 'botiquin de primeros auxilios' en el campo, capaz de cortar hemorragias y ayudar a cicatrizar heridas."],
+    ["hoja santa","piper auritum","expectorante\nantiinflamatorio\ndigestivo","planta de grandes hojas con un aroma anisado, muy usada en la cocina del sur de mexico. medicinalmente se usa para la tos y la inflamacion."],
+    ["izote","yucca filifera","antiinflamatorio\nantirreumatico","planta arborescente del desierto mexicano, cuyas flores son comestibles y la raiz se utiliza para tratar la artritis y el reumatismo."],
+    ["jojoba","simmondsia chinensis","hidratante\nemoliente\nantioxidante","arbusto del desierto cuya semilla produce una cera liquida muy similar al sebo humano, lo que la hace excelente para el cuidado de la piel y el cabello."],
+    ["lentisco","pistacia lentiscus","astringente\nantiinflamatorio\ncicatrizante","arbusto mediterraneo del que se extrae una resina aromatica llamada almaciga, usada desde la antiguedad para la higiene bucal y problemas digestivos."],
+    ["membrillero","cydonia oblonga","astringente\nemoliente\nantiinflamatorio","pequeno arbol o arbusto conocido por sus frutos aromaticos, los membrillos. las semillas, ricas en mucilago, son excelentes para proteger las mucosas."],
+    ["aloe vera","aloe barbadensis miller","cicatrizante\nantiinflamatoria\nhidratante\nantiseptica","planta suculenta conocida por su gel, utilizado para tratar afecciones de la piel y problemas digestivos."],
+    ["jengibre","zingiber officinale","antiinflamatorio\nantiemetico\ndigestivo\nantioxidante","raiz con un sabor picante y aromatico, utilizada para aliviar nauseas, mejorar la digestion y reducir la inflamacion."],
+    ["curcuma","curcuma longa","antiinflamatoria\nantioxidante\nhepatoprotectora\nanticancerigena","especia de color amarillo intenso, conocida por su potente compuesto activo, la curcumina, con fuertes propiedades antiinflamatorias."],
+    ["noni","morinda citrifolia","analgesico\nantiinflamatorio\ninmunomodulador\nantimicrobiano","fruto tropical con un olor fuerte y sabor amargo, utilizado tradicionalmente para una amplia gama de dolencias."],
+    ["una de gato","uncaria tomentosa","antiinflamatoria\ninmunomoduladora\nantiviral\nantioxidante","liana de la selva amazonica, utilizada para fortalecer el sistema inmunologico y tratar la artritis y otros trastornos inflamatorios."],
+    ["sangre de drago","croton lechleri","cicatrizante\nantiinflamatoria\nantiviral\nanalgesica","resina de color rojo oscuro de un arbol del amazonas, conocida por su excepcional capacidad para cicatrizar heridas y ulceras."],
+    ["copaiba","copaifera officinalis","antiinflamatoria\nanalgesica\nantiseptica\nexpectorante","aceite resinoso extraido de un arbol amazonico, utilizado para tratar una amplia variedad de procesos inflamatorios y como antiseptico."],
+    ["acai","euterpe oleracea","antioxidante\nenergizante\nantiinflamatoria","fruto de una palmera del amazonas, famoso por su altisimo contenido de antioxidantes, vitaminas y minerales."],
+    ["guarana","paullinia cupana","estimulante\nenergizante\ntonico\nanalgesico","semilla de un arbusto del amazonas, rica en cafeina, utilizada como estimulante natural para combatir la fatiga y mejorar la concentracion."],
+    ["yerba mate","ilex paraguariensis","estimulante\nantioxidante\ndiuretica\ndigestiva","hojas de un arbol sudamericano, utilizadas para preparar una infusion estimulante rica en antioxidantes y nutrientes."],
+    ["yuca","manihot esculenta","energetica\nantiinflamatoria\ndigestiva","raiz tuberosa rica en carbohidratos, fuente de energia y con propiedades antiinflamatorias."],
+    ["ginseng","panax ginseng","adaptogeno\ntonico\nenergizante\ninmunomodulador","raiz utilizada en la medicina tradicional china como un tonico general para mejorar la energia, la vitalidad y la resistencia al estres."],
+    ["pasiflora","passiflora incarnata","sedante\nansiolitica\nantiespasmodica","planta trepadora con flores exoticas, utilizada para calmar la ansiedad, el nerviosismo y el insomnio."],
+    ["agave","agave spp.","prebiotica\nantiinflamatoria\nantiseptica","planta del desierto de la que se extrae el sirope de agave y el tequila. su savia tiene propiedades prebioticas y antiinflamatorias."],
+    ["arandano","vaccinium myrtillus","antioxidante\nantiinflamatorio\nantiseptico urinario\nvasoprotector","pequeno fruto del bosque rico en antioxidantes, conocido por su capacidad para prevenir infecciones urinarias y mejorar la salud visual."],
+    ["flor de sauco","sambucus nigra","antiviral\ndiaforetica\nantiinflamatoria\nexpectorante","flores y bayas de un arbusto comun, utilizadas tradicionalmente para tratar resfriados, gripes y problemas respiratorios."],
+    ["guaco","mikania glomerata","broncodilatador\nexpectorante\nantitusivo\nantiinflamatorio","planta trepadora de sudamerica, ampliamente utilizada en la medicina popular para tratar afecciones respiratorias como el asma y la bronquitis."],
+    ["moringa","moringa oleifera","nutritiva\nantioxidante\nantiinflamatoria\nhipoglucemiante","arbol originario de la india, conocido como el \"arbol milagroso\" por su altisimo valor nutricional y sus multiples propiedades medicinales."],
+    ["centella asiatica","centella asiatica","cicatrizante\nvasoprotectora\nneuroprotectora\nantiinflamatoria","planta herbacea utilizada en la medicina ayurvedica y china para mejorar la memoria, la circulacion y promover la cicatrizacion de la piel."],
+    ["grosellero de la india","phyllanthus emblica","antioxidante\nhepatoprotectora\nhipolipemiante\ninmunomoduladora","tambien conocido como amla, es un fruto muy rico en vitamina c y antioxidantes, fundamental en la medicina ayurvedica."],
+    ["bardana","arctium lappa","depurativa\ndiuretica\nantiinflamatoria\nantimicrobiana","planta robusta cuya raiz se utiliza como depurativo de la sangre y para tratar afecciones de la piel como el acne y los eczemas."],
+    ["malva","malva sylvestris","emoliente\nantiinflamatoria\nexpectorante\nlaxante suave","planta comun con flores vistosas, rica en mucilagos que le confieren propiedades suavizantes para la garganta, el estomago y la piel."],
+    ["anis verde","pimpinella anisum","carminativo\nexpectorante\nantiespasmodico\ngalactogogo","planta aromatica cuyas semillas se utilizan para aliviar los gases, la hinchazon abdominal y la tos."],
+    ["salvia","salvia officinalis","antiseptica\nantiinflamatoria\nastringente\nantisudoral","arbusto aromatico muy utilizado en la cocina y en la medicina tradicional para tratar infecciones de boca y garganta, y regular la sudoracion."],
+    ["romero","rosmarinus officinalis","estimulante circulatorio\ncarminativo\nantioxidante\nantiinflamatorio","arbusto mediterraneo con un aroma intenso, utilizado para mejorar la circulacion, la digestion y la memoria."],
+    ["manzanilla","matricaria recutita","digestiva\nantiinflamatoria\ncalmante\nantiespasmodica","hierba muy popular cuyas flores se usan en infusion para calmar trastornos digestivos, nervios y como antiinflamatorio suave."],
+    ["ajo","allium sativum","antimicrobiano\nhipotensor\nhipolipemiante\nanticoagulante","bulbo con un olor y sabor caracteristicos, valorado por sus efectos beneficiosos sobre el sistema cardiovascular y como potente antibiotico natural."],
+    ["eucalipto","eucalyptus globulus","expectorante\nantiseptico\ndescongestionante\nantiinflamatorio","arbol de origen australiano cuyas hojas son ricas en un aceite esencial usado para aliviar los sintomas de resfriados y problemas respiratorios."],
+    ["cola de caballo","equisetum arvense","diuretica\nremineralizante\ncicatrizante\nastringente","planta primitiva rica en silicio y otros minerales, utilizada como diuretico, para fortalecer unas y cabello, y para reparar tejidos."],
+    ["hiperico","hypericum perforatum","antidepresivo\nansiolitico\ncicatrizante\nantiviral","tambien conocida como hierba de san juan, es una planta utilizada para tratar la depresion leve a moderada y para curar heridas y quemaduras."],
+    ["tomillo","thymus vulgaris","antiseptico\nexpectorante\nantiespasmodico\ndigestivo","hierba aromatica con potentes propiedades antisepticas, especialmente util para tratar infecciones respiratorias y problemas digestivos."],
+    ["lavanda","lavandula angustifolia","relajante\nansiolitica\nantiseptica\nanalgesica","planta conocida por su aroma relajante, utilizada en aromaterapia para aliviar el estres, la ansiedad y el insomnio."],
+    ["tila","tilia spp.","sedante\nansiolitica\ndiaforetica\nantiespasmodica","arbol cuyas flores se utilizan en infusion por sus propiedades calmantes y para inducir el sueno."],
+    ["diente de leon","taraxacum officinale","diuretica\ndepurativa\ncolagoga\ntonico amargo","considerada a menudo una mala hierba, es una planta muy nutritiva y con excelentes propiedades para depurar el higado y los rinones."],
+    ["ginkgo biloba","ginkgo biloba","vasodilatador periferico\nneuroprotector\nantioxidante","arbol milenario cuyas hojas se utilizan para mejorar la circulacion cerebral, la memoria y la concentracion."],
+    ["oregano","origanum vulgare","antiseptico\nantifungico\nantioxidante\ncarminativo","hierba aromatica con un potente aceite esencial rico en carvacrol y timol, de gran poder antiseptico."],
+    ["corteza de sauce","salix spp.","analgesica\nantiinflamatoria\nantipiretica","la corteza de varias especies de sauce contiene salicina, el precursor natural de la aspirina, y se usa para aliviar el dolor y la fiebre."],
+    ["acebo","ilex aquifolium","diuretico\nantipiretico\nrelajante","arbusto ornamental navideno cuyas hojas se han usado tradicionalmente como diuretico y para bajar la fiebre, aunque es una planta toxica."],
+    ["poleo menta","mentha pulegium","digestiva\ncarminativa\nantiespasmodica\nemenagoga","planta aromatica de la familia de la menta, utilizada tradicionalmente para facilitar la digestion y aliviar los gases."],
+    ["ortiga","urtica dioica","depurativa\ndiuretica\nremineralizante\nantianemica","planta rica en vitaminas y minerales, conocida por sus pelos urticantes, pero muy apreciada como depurativa, diuretica y para combatir la anemia."],
+    ["dedalera","digitalis purpurea","cardiotonica","planta muy venenosa de la que se extraen principios activos utilizados en medicamentos para tratar la insuficiencia cardiaca."],
+    ["sandalo","santalum album","antiseptico\nrelajante\nastringente\nantiinflamatorio","arbol aromatico de la india cuya madera proporciona un aceite esencial muy valorado en perfumeria y aromaterapia por su efecto relajante y antiseptico."],
+    ["amapola","papaver rhoeas","sedante suave\nantitusiva\nemoliente","flor silvestre cuyos petalos se utilizan en infusion como un sedante suave para la tos y el nerviosismo, especialmente en ninos."],
+    ["eneldo","anethum graveolens","carminativo\nantiespasmodico\ndiuretico\ngalactogogo","hierba aromatica utilizada como condimento y como remedio para los gases, los colicos y para estimular la produccion de leche materna."],
+    ["apio","apium graveolens","diuretico\ndepurativo\nremineralizante\ncarminativo","hortaliza con un sabor caracteristico, apreciada por su efecto diuretico y depurativo, ayudando a eliminar liquidos y toxinas."],
+    ["ajenjo","artemisia absinthium","tonico amargo\nvermifugo\ncolagogo\nemenagogo","planta muy amarga, utilizada como tonico digestivo para abrir el apetito y para eliminar parasitos intestinales. es el ingrediente clave de la absenta."],
+    ["kava","piper methysticum","ansiolitica\nrelajante muscular\nanestesica local","planta de las islas del pacifico cuya raiz se usa para preparar una bebida ceremonial con efectos relajantes y ansioliticos."],
+    ["ruda","ruta graveolens","antiespasmodica\nemenagoga\nrubefaciente","planta de olor fuerte, utilizada tradicionalmente para regular la menstruacion y calmar colicos, pero es toxica y su uso es arriesgado."],
+    ["calendula","calendula officinalis","antiinflamatoria\ncicatrizante\nantiseptica\nemoliente","flor de color naranja brillante, tambien conocida como maravilla, muy apreciada por su capacidad para curar y regenerar la piel."],
+    ["cacao","theobroma cacao","antioxidante\nestimulante\ncardioprotector\neuforizante","arbol tropical de cuyas semillas se obtiene el chocolate. es rico en antioxidantes (flavonoides) y teobromina, un estimulante suave."],
+    ["jengibre","zingiber officinale","digestiva\nantiinflamatoria\nantiemetica\nantioxidante\nanalgesica","planta aromatica con un tallo subterraneo (rizoma) muy apreciado por su sabor picante y sus propiedades medicinales."],
+    ["curcuma","curcuma longa","antiinflamatoria\nantioxidante\nhepatoprotectora\ncoleretica\nantimicrobiana","planta herbacea de la familia del jengibre, cuyo rizoma anaranjado se usa como especia y como antiinflamatorio natural."],
+    ["ginseng","panax ginseng","adaptogeno\ntonico\nestimulante del sistema nervioso\ninmunoestimulante\nantioxidante","raiz carnosa utilizada en la medicina tradicional china para mejorar la vitalidad, la resistencia y la funcion cognitiva."],
+    ["astragalo","astragalus membranaceus","inmunoestimulante\nadaptogeno\ncardioprotector\ndiuretico\nantioxidante","planta leguminosa cuya raiz se utiliza en la medicina tradicional china para fortalecer el sistema inmunologico y proteger el cuerpo del estres."],
+    ["regaliz","glycyrrhiza glabra","antiinflamatoria\nexpectorante\nantiviral\nhepatoprotectora\nendulzante","planta cuya raiz de sabor dulce se utiliza para tratar afecciones respiratorias, digestivas y de la piel."],
+    ["valeriana","valeriana officinalis","sedante\nansiolitica\nrelajante muscular\nhipotensora\nantiespasmodica","planta con flores rosadas cuya raiz se utiliza para tratar el insomnio, la ansiedad y el estres."],
+    ["equinacea","echinacea purpurea","inmunoestimulante\nantiinflamatoria\nantiviral\ncicatrizante\nantibacteriana","planta originaria de america del norte, utilizada para prevenir y tratar resfriados, gripes y otras infecciones."],
+    ["bardana","arctium lappa","depurativa\ndiuretica\nsudorifica\nantiinflamatoria\nantimicrobiana","planta bianual cuya raiz se utiliza para purificar la sangre, tratar afecciones de la piel y estimular la eliminacion de toxinas."],
+    ["diente de leon (raiz)","taraxacum officinale","depurativa\ndiuretica\ncoleretica\nhepatoprotectora\ntonico amargo","planta comun cuyas raices amargas se utilizan para estimular la funcion hepatica y renal, y mejorar la digestion."],
+    ["maca","lepidium meyenii","adaptogeno\nenergizante\nfertilidad\nregulador hormonal\nnutritiva","planta andina cuya raiz se utiliza para aumentar la energia, la resistencia, la libido y la fertilidad."],
+    ["ashwagandha","withania somnifera","adaptogeno\nansiolitica\nantiinflamatoria\ninmunoestimulante\ntonico nervioso","hierba fundamental en la medicina ayurvedica, utilizada para combatir el estres, mejorar la funcion cerebral y aumentar los niveles de energia."],
+    ["sello de oro","hydrastis canadensis","antimicrobiana\nantiinflamatoria\nastringente\ntonico amargo\ninmunoestimulante","planta nativa de america del norte cuya raiz se usa para infecciones de las mucosas."],
+    ["angelica","angelica archangelica","digestiva\ncarminativa\nexpectorante\nantiespasmodica\ndiuretica","planta aromatica utilizada para trastornos digestivos, problemas respiratorios y como tonico general."],
+    ["ruibarbo","rheum rhabarbarum","laxante\npurgante\nastringente\ndigestiva\nantiinflamatoria","planta con grandes hojas y tallos comestibles, cuyo rizoma se usa como laxante potente."],
+    ["malvavisco","althaea officinalis","demulcente\nemoliente\nantiinflamatoria\nexpectorante\ndiuretica","planta cuyas raices ricas en mucilago se usan para calmar la irritacion de las mucosas del sistema digestivo y respiratorio."],
+    ["osha","ligusticum porteri","antiviral\nexpectorante\ndiaforetica\ninmunoestimulante\nantimicrobiana","raiz sagrada para muchas tribus nativas americanas, utilizada para tratar infecciones respiratorias y fortalecer el sistema inmunologico."],
+    ["calamo aromatico","acorus calamus","carminativo\nestimulante digestivo\ntonico nervioso\nexpectorante\nantiespasmodico","planta acuatica cuyo rizoma aromatico se ha utilizado tradicionalmente para problemas digestivos y para mejorar la claridad mental."],
+    ["genciana","gentiana lutea","tonico amargo\nestimulante digestivo\ncolagoga\nantipiretica\nsialagoga","planta de montana con una raiz muy amarga, utilizada para estimular el apetito y la digestion."],
+    ["rabano picante","armoracia rusticana","estimulante circulatorio\ndescongestionante\nantimicrobiano\ndiuretico\nrubefaciente","raiz de sabor fuerte y picante, utilizada como condimento y para despejar los senos nasales y estimular la circulacion."],
+    ["yuca","yucca schidigera","antiinflamatoria\nantirreumatica\nsaponinas\ndepurativa\nanalgesica","planta del desierto cuya raiz es rica en saponinas, compuestos con potentes propiedades antiinflamatorias, utilizada para la artritis y el reumatismo."],
+    ["batata","ipomoea batatas","nutritiva\nantioxidante\nantiinflamatoria\nreguladora del azucar\ninmunoestimulante","tuberculo dulce y nutritivo, rico en betacarotenos (vitamina a), fibra y antioxidantes. beneficioso para la vista, la piel y el sistema inmune."],
+    ["remolacha","beta vulgaris","hepatoprotectora\ndesintoxicante\nantihipertensiva\nantioxidante\nmejora el rendimiento deportivo","raiz de color rojo intenso, conocida por su capacidad para mejorar la salud del higado, reducir la presion arterial y aumentar la resistencia fisica."],
+    ["zanahoria","daucus carota","rica en vitamina a\nantioxidante\nsalud ocular\nsalud de la piel\ndigestiva","raiz crujiente y dulce, famosa por su alto contenido de betacarotenos, esenciales para una buena vision y una piel sana."],
+    ["nabo","brassica rapa","expectorante\ndiuretico\nrico en vitamina c\nantiinflamatorio\ndigestivo","raiz de sabor ligeramente picante, utilizada tradicionalmente para aliviar la tos y los resfriados, y por sus propiedades diureticas."],
+    ["chirivia","pastinaca sativa","diuretica\ndigestiva\nrica en potasio\nrica en fibra\nantioxidante","raiz similar a la zanahoria pero de color blanco y sabor mas dulce y anisado. es diuretica y ayuda a regular la presion arterial."],
+    ["apionabo","apium graveolens var. rapaceum","diuretico\nremineralizante\ndigestivo\ndepurativo\nantiinflamatorio","variedad de apio cuya raiz grande y bulbosa se consume. tiene un sabor intenso y es un potente diuretico y depurativo."],
+    ["rabano","raphanus sativus","colagogo\ncoleretico\nantiseptico\nexpectorante\ndiuretico","raiz pequena y picante, especialmente el rabano negro, que estimula la produccion y flujo de bilis, ayudando a la funcion hepatica y de la vesicula."],
+    ["colirrabano","brassica oleracea var. gongylodes","rico en vitamina c\nantioxidante\ndigestivo\nbajo en calorias\nrico en fibra","variedad de col cuyo tallo se engrosa formando un tuberculo sobre la superficie del suelo. es crujiente y jugoso, rico en vitamina c."],
+    ["tupinambo","helianthus tuberosus","prebiotico (rico en inulina)\nregulador del azucar\ndigestivo\nbajo indice glucemico\nsaciente","tambien conocido como alcachofa de jerusalen, es un tuberculo rico en inulina, un prebiotico que alimenta la flora intestinal y ayuda a regular el azucar en sangre."],
+    ["arracacha","arracacia xanthorrhiza","digestiva\nenergetica\nrica en calcio\nfacil de digerir\nnutritiva","raiz tuberosa andina de sabor similar a una mezcla de apio, zanahoria y castana. es muy digestiva y nutritiva, ideal para ninos y ancianos."],
+    ["ulluco","ullucus tuberosus","nutritivo\nrico en vitamina c\ncicatrizante\nantiinflamatorio\nhidratante","tuberculo andino de colores vivos y textura mucilaginosa. es nutritivo y se le atribuyen propiedades cicatrizantes y antiinflamatorias."],
+    ["oca","oxalis tuberosa","energetica\nrica en carbohidratos\nantioxidante\nligeramente laxante\nnutritiva","tuberculo andino de sabor acido que se vuelve mas dulce al exponerlo al sol. es una buena fuente de energia y antioxidantes."],
+    ["mashua","tropaeolum tuberosum","anterogeno (reduce la testosterona)\nantibacteriana\ninsecticida\ndiuretica\nantioxidante","tuberculo andino con un sabor picante y floral. se le conoce por sus propiedades antibacterianas y por reducir los niveles de testosterona."],
+    ["taro","colocasia esculenta","nutritivo\nhipoalergenico\nfacil de digerir\nrico en fibra\nregulador del azucar","tuberculo tropical basico en muchas culturas. es nutritivo, facil de digerir y una buena fuente de carbohidratos complejos."],
+    ["atractylodes","atractylodes macrocephala","tonico del bazo (mtc)\ndiuretico\ndigestivo\nantidiaforetico\ninmunoestimulante","hierba importante en la medicina tradicional china (mtc) para tonificar el bazo, mejorar la digestion, eliminar la humedad y detener la sudoracion excesiva."],
+    ["codonopsis","codonopsis pilosula","adaptogeno\ntonico de qi\ninmunoestimulante\ntonico pulmonar\ngalactagoga","conocida como el \"ginseng de los pobres\", es una raiz tonica suave utilizada en mtc para aumentar la energia (qi), fortalecer los pulmones y el sistema inmune."],
+    ["rehmannia","rehmannia glutinosa","tonico de la sangre y del yin\nantiinflamatoria\ninmunomoduladora\nneuroprotectora\nregulador hormonal","raiz fundamental en mtc para nutrir la sangre y el yin, tratar trastornos hormonales, enfermedades autoinmunes y problemas relacionados con el envejecimiento."],
+    ["peonia blanca","paeonia lactiflora","analgesica\nantiespasmodica\nantiinflamatoria\nreguladora menstrual\nhepatoprotectora","la raiz de peonia blanca se usa en mtc para nutrir la sangre, calmar el dolor (especialmente ginecologico y muscular), y suavizar el higado."],
+    ["galanga","alpinia galanga","carminativa\nantiinflamatoria\nantiemetica\nantimicrobiana\nestimulante circulatorio","rizoma de la familia del jengibre con un sabor picante y alcanforado. se utiliza para problemas digestivos, nauseas y para mejorar la circulacion."],
+    ["zarzaparrilla","smilax officinalis","depurativa\nantiinflamatoria\nantirreumatica\ndiaforetica\nhepatoprotectora","raiz utilizada tradicionalmente para \"limpiar la sangre\", tratar afecciones de la piel como la psoriasis y el eccema, y para el reumatismo y la gota."],
+    ["mandioca","manihot esculenta","nutritiva\nenergetica\nrica en carbohidratos\nsin gluten\nfuente de vitamina c","tambien conocida como yuca o casava, es una raiz tuberosa fundamental en la alimentacion de muchas regiones tropicales. es una excelente fuente de carbohidratos."],
+    ["crosne","stachys affinis","digestiva\nnutritiva\nligeramente dulce\ntextura crujiente\nbaja en calorias","pequeno tuberculo de forma peculiar y textura crujiente, similar a una alcachofa o una castana de agua. se consume como una hortaliza gourmet."],
+    ["eleuterococo","eleutherococcus senticosus","adaptogeno\ninmunoestimulante\nantifatiga\nmejora el rendimiento fisico y mental\ntonico","conocido como ginseng siberiano, es un arbusto cuya raiz se utiliza para aumentar la resistencia al estres, combatir la fatiga y mejorar la concentracion."],
+    ["cimicifuga","actaea racemosa","regulador hormonal (estrogenico)\nantiespasmodico\nantiinflamatorio\nsedante\nalivio de sintomas menopausicos","tambien conocida como cohosh negro, es una planta cuya raiz se usa principalmente para aliviar los sintomas de la menopausia, como los sofocos y los cambios de humor."],
+    ["polygala","polygala tenuifolia","expectorante\nneuroprotectora\ncalmante\ntonico cerebral\nrestaurador del shen (mtc)","raiz utilizada en mtc para calmar el espiritu (shen), mejorar la memoria y la funcion cognitiva, y como un potente expectorante para eliminar la flema de los pulmones."],
+    ["manzanilla","matricaria chamomilla","digestiva\nantiinflamatoria\ncalmante\nantialergica\nantibacteriana","hierba aromatica con flores blancas y amarillas, conocida por sus propiedades calmantes y digestivas."],
+    ["calendula","calendula officinalis","cicatrizante\nantiinflamatoria\nantiseptica\nregeneradora de la piel","planta con flores de color naranja brillante, muy apreciada por sus beneficios para la piel."],
+    ["lavanda","lavandula angustifolia","relajante\nansiolitica\nantiseptica\nanalgesica","arbusto con flores de color violeta muy aromaticas, famoso por sus efectos relajantes y su agradable fragancia."],
+    ["rosa","rosa gallica","astringente\nantiinflamatoria\ntonico para la piel\nrelajante","ademas de su belleza y aroma, los petalos de rosa tienen propiedades beneficiosas para la piel y el sistema nervioso."],
+    ["jazmin","jasminum officinale","relajante\nsedante\nantidepresivo\nafrodisiaco","flores blancas muy fragantes con un potente efecto relajante sobre el sistema nervioso, ideal para la ansiedad y el insomnio."],
+    ["hibisco","hibiscus sabdariffa","hipotensor\ndiuretico\nantioxidante\nvitaminico","sus calices rojos se usan para preparar una bebida refrescante con propiedades para controlar la presion arterial y el colesterol."],
+    ["flor de sauco","sambucus nigra","antiviral\ndiaforetica\nexpectorante\nantiinflamatoria","pequenas flores blancas agrupadas en corimbos, tradicionalmente usadas para tratar resfriados, gripes y problemas respiratorios."],
+    ["tilo flor","tilia cordata","sedante\nansiolitico\nantiespasmodico\ndiaforetico","las flores del tilo son un remedio clasico para el nerviosismo, la ansiedad y el insomnio, gracias a su suave efecto sedante."],
+    ["azahar","citrus aurantium","sedante\nansiolitico\nhipnotico suave\nantiespasmodico","la flor del naranjo amargo es famosa por su aroma y sus propiedades para calmar los nervios, la ansiedad y facilitar el sueno."],
+    ["pasiflora","passiflora incarnata","sedante\nansiolitico\ninductor del sueno\nantiespasmodico","conocida como flor de la pasion, es uno de los mejores remedios para el insomnio de origen nervioso y la ansiedad."],
+    ["amapola de california","eschscholzia californica","sedante\nanalgesico suave\ninductor del sueno\nansiolitico","a diferencia de su pariente la adormidera, esta amapola tiene un efecto sedante suave y no adictivo, util para el insomnio y el nerviosismo."],
+    ["violeta","viola odorata","expectorante\nbalsamica\nsudorifica\nantiinflamatoria","sus flores y hojas son un remedio tradicional para afecciones respiratorias como la tos, el resfriado y la bronquitis."],
+    ["malva","malva sylvestris","emoliente\nbalsamica\nantiinflamatoria\nlaxante suave","rica en mucilagos, la malva suaviza y protege las mucosas respiratorias y digestivas, aliviando la irritacion."],
+    ["arnica","arnica montana","antiinflamatoria\nanalgesica\nantiequimotica (reduce moratones)","es el remedio por excelencia para golpes, contusiones, esguinces y dolores musculares, gracias a su potente accion antiinflamatoria."],
+    ["equinacea","echinacea purpurea","inmunoestimulante\nantiviral\nantibacteriana\nantiinflamatoria","una de las plantas mas eficaces para aumentar las defensas y prevenir o tratar infecciones, especialmente resfriados y gripes."],
+    ["girasol","helianthus annuus","febrifuga\nexpectorante\ndiuretica","aunque es mas conocido por sus semillas, los petalos de sus flores se han usado tradicionalmente para bajar la fiebre y aliviar resfriados."],
+    ["borraja","borago officinalis","sudorifica\ndiuretica\nemoliente\nantiinflamatoria","sus flores azules son ricas en mucilagos y se usan en infusion para provocar la sudoracion en estados febriles y resfriados."],
+    ["capuchina","tropaeolum majus","antibiotica natural\nexpectorante\nantiseptica urinaria\nvitaminica (vitamina c)","tanto sus flores como sus hojas tienen un sabor picante y se consideran un potente antibiotico natural para las vias respiratorias y urinarias."],
+    ["clavel","dianthus caryophyllus","tonico nervioso\nantiespasmodico\ncardiotonico suave","los petalos del clavel se han utilizado en forma de jarabe o infusion como un tonico suave para el corazon y el sistema nervioso."],
+    ["crisantemo","chrysanthemum morifolium","febrifugo\nrefrigerante\nantihipertensivo\ndetoxificante (higado)","en la medicina tradicional china, la infusion de flores de crisantemo se usa para 'enfriar' el cuerpo, bajar la fiebre, aliviar el dolor de cabeza y proteger los ojos."],
+    ["margarita","bellis perennis","expectorante\ndiuretica\ncicatrizante\nantiinflamatoria","la humilde margarita tiene propiedades para aliviar la tos y los resfriados, y externamente se usa para curar pequenas heridas y contusiones."],
+    ["aciano","centaurea cyanus","antiinflamatorio ocular\nastringente suave\ndiuretico","las flores azules del aciano son el remedio tradicional para los ojos cansados, irritados o inflamados, en forma de banos o compresas."],
+    ["loto sagrado","nelumbo nucifera","astringente\nfebrifugo\ntonico cardiaco\nsedante","planta sagrada en oriente, todas sus partes tienen usos medicinales. las flores se usan por sus propiedades sedantes y para la fiebre."],
+    ["pensamiento","viola tricolor","depurativa\ndiuretica\nantiinflamatoria cutanea\nexpectorante","es una de las plantas depurativas mas importantes para los problemas de la piel, como el acne, los eccemas o la psoriasis."],
+    ["primavera","primula veris","expectorante\nsecretolitica\nbalsamica\nsedante suave","sus flores amarillas son un remedio eficaz para la tos con mucosidad, la bronquitis y los resfriados. tambien calma la ansiedad."],
+    ["ulmaria","filipendula ulmaria","antiinflamatoria\nanalgesica\nantipiretica\ndiuretica","conocida como la 'aspirina vegetal' por su contenido en salicilatos, es excelente para dolores articulares, fiebre y gripe."],
+    ["zinnia","zinnia elegans","antifungica\nantibacteriana","en la medicina popular de algunas regiones de mexico, se ha utilizado como remedio para infecciones de la piel por hongos y bacterias."],
+    ["dalia","dahlia coccinea","hipoglucemiante\ndiuretica\nantimicrobiana","originaria de mexico, los aztecas ya usaban sus tuberculos para tratar la epilepsia. hoy se investigan sus propiedades para regular el azucar en sangre."],
+    ["geranio","pelargonium graveolens","astringente\ncicatrizante\nhemostatico\ntonico nervioso","el aceite esencial de geranio es muy versatil, se usa para equilibrar la piel grasa, frenar pequenas hemorragias y como equilibrante emocional."],
+    ["magnolia","magnolia officinalis","ansiolitica\nantidepresiva\nantiinflamatoria\nneuroprotectora","la corteza de magnolia es un remedio importante en la medicina china para la ansiedad, la depresion y el estres, sin el efecto sedante de otras plantas."],
+    ["peonia","paeonia lactiflora","analgesica\nantiespasmodica\nantiinflamatoria\nreguladora hormonal (femenina)","la raiz de peonia blanca (bai shao) es fundamental en ginecologia china para calmar los dolores menstruales y regular el ciclo."],
+    ["tanaceto","tanacetum parthenium","antimigranoso\nantiinflamatorio\nantiespasmodico","tambien conocida como matricaria, es la planta mas estudiada y eficaz para prevenir la aparicion de las crisis de migrana."],
+    ["verbena","verbena officinalis","tonico nervioso\nrelajante\ndigestiva (amarga)\ngalactagoga","considerada una planta magica en la antiguedad, la verbena es un excelente tonico para el sistema nervioso agotado, la ansiedad y el estres."],
+    ["milenrama (yarrow)","achillea millefolium","hemostatica\nantiinflamatoria\nantiespasmodica\ncicatrizante","su nombre 'achillea' hace referencia a aquiles, que la usaba para curar las heridas de sus soldados. es excelente para cortar hemorragias."],
+    ["clitoria (butterfly pea)","clitoria ternatea","nootropica (mejora la memoria)\nansiolitica\nantidepresiva\nantioxidante","sus llamativas flores azules se usan para hacer un te que mejora las funciones cognitivas, la memoria y el estado de animo."],
+    ["espino blanco","crataegus monogyna","cardiotonico\nhipotensor\nregulador del ritmo cardiaco\nsedante","es la planta por excelencia para el corazon. tonifica el musculo cardiaco, regula la tension y el ritmo, y calma las palpitaciones de origen nervioso."],
+    ["lupulo","humulus lupulus","sedante\nhipnotico\nansiolitico\nfitoestrogenico","mas alla de dar el amargor a la cerveza, las flores de lupulo son un potente sedante, ideal para el insomnio, especialmente si se combina con valeriana."],
+    ["meliloto","melilotus officinalis","tonico venoso\nanticoagulante\nantiinflamatorio\nsedante suave","mejora la circulacion venosa, previene la formacion de trombos y alivia los sintomas de las varices y las piernas cansadas."],
+    ["gordolobo","verbascum thapsus","expectorante\nemoliente\nbalsamico\nantiinflamatorio","es una de las mejores plantas para las afecciones respiratorias. suaviza la garganta, calma la tos y ayuda a expulsar la mucosidad."],
+    ["hisopo","hyssopus officinalis","expectorante\nantitusivo\nantiviral\ndigestivo","planta biblica usada para purificar. es un excelente remedio para la tos, la bronquitis y los resfriados, especialmente de origen virico como la gripe."],
+    ["jazmin amarillo (gelsemium)","gelsemium sempervirens","analgesico neural\nsedante\nantigripal","a pesar de su toxicidad, en homeopatia es un remedio clave para estados gripales con gran postracion, dolores de cabeza y neuralgias."],
+    ["lirio de los valles (muguete)","convallaria majalis","cardiotonico\ndiuretico","similar a la digital, contiene potentes tonicos para el corazon, pero su alta toxicidad la hace apta solo para la industria farmaceutica."],
+    ["digital","digitalis purpurea","cardiotonico","la planta medicinal cardiotonica por excelencia, pero tambien una de las mas venenosas. su uso ha salvado millones de vidas en forma de farmaco."],
+    ["azafran","crocus sativus","antidepresivo\nantioxidante\nemenagogo\nafrodisiaco","la especia mas cara del mundo es tambien un potente antidepresivo natural, con una eficacia comparable a algunos farmacos de sintesis."],
+    ["onagra","oenothera biennis","regulador hormonal\nantiinflamatorio\nnutritivo para la piel","el aceite de sus semillas es rico en acidos grasos omega-6, siendo el remedio mas popular para el sindrome premenstrual y los problemas de la menopausia."],
+    ["cempasuchil","tagetes erecta","digestiva\nantiespasmodica\nantibacteriana\ncarotenoide (luteina)","la flor de muertos mexicana se usa tradicionalmente para aliviar dolores de estomago. ademas, es la principal fuente comercial de luteina, un antioxidante vital para la retina."],
+    ["angelica","angelica archangelica","tonico digestivo (amargo)\ncarminativa\nexpectorante\nantiespasmodica","considerada la 'hierba de los angeles', es un potente tonico para todo el sistema digestivo, abriendo el apetito y aliviando los gases y espasmos."],
+    ["centaurea menor","centaurium erythraea","tonico amargo\nestimulante del apetito\nfebrifuga\ncoleretica","una de las plantas mas amargas de la flora europea. este amargor la hace un remedio excelente para la falta de apetito y las digestiones pesadas."],
+    ["reishi","ganoderma lucidum","inmunomodulador\nadaptogeno\nantiinflamatorio\nhepatoprotector","conocido como el \"hongo de la inmortalidad\", el reishi es venerado por su capacidad para fortalecer el sistema inmunologico y reducir el estres."],
+    ["shiitake","lentinula edodes","antiviral\nreductor del colesterol\ninmunomodulador","ademas de su uso culinario, el shiitake es valorado por sus propiedades antivirales y su capacidad para mejorar la salud cardiovascular."],
+    ["maitake","grifola frondosa","hipoglucemiante\ninmunomodulador\nantitumoral","el maitake es conocido por su capacidad para regular los niveles de azucar en sangre y fortalecer la respuesta inmune."],
+    ["cordyceps","cordyceps sinensis","energizante\nmejora del rendimiento atletico\nafrodisiaco","el cordyceps es famoso por aumentar la energia, la resistencia y la libido, siendo muy popular entre atletas."],
+    ["melena de leon","hericium erinaceus","neuroprotector\nnootropo\nregenerador nervioso","este hongo es unico por su capacidad para estimular el crecimiento de neuronas y mejorar la funcion cognitiva."],
+    ["chaga","inonotus obliquus","antioxidante\nantiinflamatorio\nantiviral","el chaga es un potente antioxidante que crece en los abedules, utilizado para proteger las celulas del dano y reducir la inflamacion."],
+    ["cola de pavo","trametes versicolor","inmunomodulador\nantitumoral\nprebiotico","la cola de pavo es uno de los hongos medicinales mas investigados por su capacidad para modular el sistema inmune, especialmente en el tratamiento del cancer."],
+    ["agarikon","fomitopsis officinalis","antiviral\nantibacteriano\nantiinflamatorio","conocido por su potente actividad antiviral y antibacteriana, el agarikon ha sido utilizado tradicionalmente para combatir infecciones."],
+    ["tremella","tremella fuciformis","hidratante de la piel\nantioxidante\nneuroprotector","la tremella es conocida como el \"hongo de la belleza\" por su capacidad para hidratar la piel y mejorar su elasticidad."],
+    ["poria cocos","wolfiporia extensa","diuretico\ncalmante\ninmunomodulador","utilizado en la medicina tradicional china para eliminar la humedad del cuerpo, calmar la mente y fortalecer el sistema digestivo."],
+    ["agaricus blazei","agaricus subrufescens","inmunomodulador\nantitumoral\nantialergico","este hongo es muy apreciado por su potente efecto sobre el sistema inmunologico, ayudando a combatir infecciones y alergias."],
+    ["enoki","flammulina velutipes","antitumoral\ninmunomodulador\nantioxidante","el enoki no solo es un ingrediente popular en la cocina asiatica, sino que tambien posee propiedades que fortalecen el sistema inmune."],
+    ["hongo ostra","pleurotus ostreatus","reductor del colesterol\nantioxidante\nantiinflamatorio","el hongo ostra es valorado por su capacidad para reducir los niveles de colesterol y su alto contenido de antioxidantes."],
+    ["polyporus umbellatus","polyporus umbellatus","diuretico\ninmunomodulador\nhepatoprotector","se utiliza para promover la miccion y reducir el edema sin perder potasio, ademas de apoyar la salud del sistema linfatico."],
+    ["schizophyllum commune","schizophyllum commune","antitumoral\ninmunomodulador\nantifungico","este hongo produce un polisacarido llamado esquizofilano, que ha demostrado tener potentes propiedades antitumorales e inmunomoduladoras."],
+    ["oreja de judas","auricularia auricula-judae","anticoagulante\nreductor del colesterol\nhidratante","conocido por su textura gelatinosa, se usa en la cocina y en la medicina para mejorar la circulacion y la hidratacion."],
+    ["coprinus comatus","coprinus comatus","hipoglucemiante\nantioxidante\nantitumoral","este hongo, tambien conocido como \"barbuda\", ha mostrado capacidad para regular los niveles de azucar en sangre."],
+    ["hongo del yesquero","fomes fomentarius","antiinflamatorio\nantibacteriano\nhemostatico","historicamente, este hongo se ha utilizado como yesca para iniciar fuegos y en medicina popular como agente hemostatico y antiinflamatorio."],
+    ["pipa","ganoderma applanatum","antitumoral\nantiinflamatorio\nanalgesico","pariente del reishi, este hongo perenne se utiliza para aliviar el dolor y combatir la inflamacion y tumores."],
+    ["phellinus linteus","phellinus linteus","inmunomodulador\nantitumoral\nantiinflamatorio","muy valorado en la medicina asiatica, se investiga por su potente efecto estimulante del sistema inmune y su actividad contra el cancer."],
+    ["seta de cardo","pleurotus eryngii","reductor del colesterol\nantioxidante\nantiinflamatorio","ademas de su excelente sabor, la seta de cardo ayuda a mantener niveles saludables de colesterol y combate el estres oxidativo."],
+    ["hongo coliflor","sparassis crispa","inmunomodulador\nantitumoral\ncicatrizante","este hongo, que parece una coliflor, es conocido por estimular la produccion de colageno y la cicatrizacion de heridas, ademas de sus propiedades inmunitarias."],
+    ["pollo de los bosques","laetiporus sulphureus","antibacteriano\nantioxidante\ninmunomodulador","conocido por su sabor similar al pollo, este hongo tambien posee propiedades antibacterianas y antioxidantes."],
+    ["boleto anillado","suillus luteus","antiinflamatorio\nantioxidante\ndermatologico","este boleto comestible es apreciado en la cocina y se le atribuyen propiedades beneficiosas para la piel y contra la inflamacion."],
+    ["rebozuelo","cantharellus cibarius","antioxidante\nvitaminico (vit d y b)\nantimicrobiano","este popular hongo silvestre no solo es delicioso, sino que tambien es una buena fuente de vitaminas y compuestos con actividad antimicrobiana."],
+    ["trompeta de los muertos","craterellus cornucopioides","antioxidante\nmineralizante\naromatizante","a pesar de su nombre, es un hongo comestible muy apreciado, rico en minerales y con un sabor ahumado unico."],
+    ["colmenilla","morchella esculenta","antioxidante\ninmunomodulador\nantiinflamatorio","las colmenillas son un manjar culinario que tambien ofrece beneficios para la salud, como el refuerzo del sistema inmune y la reduccion de la inflamacion."],
+    ["trufa negra","tuber melanosporum","antioxidante\nafrodisiaco\nantiinflamatorio","la trufa negra, un lujo gastronomico, es rica en antioxidantes y se le atribuyen tradicionalmente propiedades afrodisiacas."],
+    ["boletus edulis","boletus edulis","antitumoral\nantioxidante\nprobiotico","considerado uno de los hongos comestibles mas finos, el boletus edulis tambien contiene compuestos con actividad antitumoral y antioxidante."],
+    ["lingzhi","ganoderma lingzhi","adaptogeno\nneuroprotector\nantioxidante","pariente cercano del reishi, el lingzhi es otro hongo de la longevidad muy apreciado en la medicina tradicional china por sus efectos sobre la mente y el espiritu."],
+    ["oronja","amanita caesarea","nutritivo\nantioxidante\nvitaminico","la oronja o \"huevo de rey\" es un hongo comestible muy apreciado desde la antiguedad, valorado por su sabor delicado y su aporte de nutrientes."],
+    ["espirulina","arthrospira platensis","nutritiva\nantioxidante\nantiinflamatoria\ninmunomoduladora","microalga verdiazul rica en proteinas, vitaminas y minerales."],
+    ["chlorella","chlorella vulgaris","desintoxicante\nrica en clorofila\napoyo inmunologico","alga verde unicelular que ayuda a eliminar metales pesados y toxinas del cuerpo."],
+    ["kelp","laminaria spp.","rico en yodo\napoyo tiroideo\nnutritivo","alga marina marron, una de las mejores fuentes naturales de yodo."],
+    ["wakame","undaria pinnatifida","rico en fucoxantina\nquema grasa\nsalud cardiovascular","alga comestible popular en la cocina japonesa, con potenciales beneficios para la perdida de peso."],
+    ["nori","porphyra spp.","rica en vitamina b12\nsalud ocular\nantiviral","alga roja conocida por usarse para envolver el sushi, rica en nutrientes esenciales."],
+    ["dulse","palmaria palmata","rica en hierro\nantioxidante\nsalud osea","alga roja con un sabor salado y ahumado, excelente fuente de minerales."],
+    ["fucus","fucus vesiculosus","estimulante metabolico\napoyo tiroideo\nantiinflamatorio","alga marron tambien conocida como sargazo vejigoso, usada tradicionalmente para problemas de tiroides y obesidad."],
+    ["agar-agar","gelidium spp.","laxante suave\nsaciente\nregulador intestinal","sustancia gelatinosa derivada de algas rojas, usada como espesante y para promover la regularidad digestiva."],
+    ["musgo de irlanda","chondrus crispus","expectorante\ndemulcente\nnutritivo","alga roja que forma un gel mucilaginoso al hervirse, utilizada para aliviar la tos y la irritacion de garganta."],
+    ["kombu","saccharina japonica","rica en glutamato\nmejora la digestion de legumbres\nfuente de yodo","alga parda comestible, esencial en la cocina japonesa para hacer el caldo dashi."],
+    ["arame","eisenia bicyclis","equilibrio hormonal\nrica en calcio\nsalud capilar","alga parda de sabor suave y dulce, apreciada en la cocina macrobiotica."],
+    ["hijiki","sargassum fusiforme","rica en fibra\naporte de minerales\nfortalece huesos y dientes","alga de color oscuro y textura firme, tradicional en la cocina japonesa."],
+    ["lechuga de mar","ulva lactuca","depurativa\nrica en hierro y magnesio\nantioxidante","alga verde brillante de hojas finas y traslucidas, similar a la lechuga terrestre."],
+    ["esparrago de mar","salicornia europaea","diuretica\nrica en vitamina c\nremineralizante","planta halofita (tolerante a la sal) que crece en marismas, de textura crujiente y sabor salado."],
+    ["lenteja de agua","lemna minor","alta en proteinas\ndepurativa de aguas\nantiinflamatoria","planta acuatica flotante muy pequena que se reproduce rapidamente, considerada un superalimento emergente."],
+    ["jacinto de agua","eichhornia crassipes","fitorremediacion\nantiinflamatoria\ncicatrizante","planta acuatica flotante con hermosas flores, mas conocida por su capacidad de limpiar aguas contaminadas."],
+    ["nenufar blanco","nymphaea alba","sedante\nanaphrodisiaco\nastringente","planta acuatica ornamental con propiedades medicinales conocidas desde la antiguedad para calmar la excitacion nerviosa."],
+    ["berro de agua","nasturtium officinale","expectorante\ndiuretico\nrico en vitaminas a y c\ndepurativo","planta acuatica que crece en arroyos limpios, valorada por su sabor picante y sus propiedades nutritivas y medicinales."],
+    ["menta acuatica","mentha aquatica","digestiva\ncarminativa\nantiespasmodica","variedad de menta que crece en zonas humedas y bordes de agua, con un aroma y propiedades similares a la menta piperita."],
+    ["lirio amarillo","iris pseudacorus","astringente\nvulnerario\nemetico (en altas dosis)","planta de humedales con flores amarillas vistosas. su rizoma se ha usado externamente para heridas y problemas de piel."],
+    ["cola de caballo de agua","equisetum fluviatile","diuretica\nremineralizante\nastringente","variedad de cola de caballo que crece en aguas poco profundas. rica en silice, ayuda a la salud de huesos, unas y cabello."],
+    ["castana de agua","trapa natans","nutritiva\nantiinflamatoria\nantioxidante","planta acuatica flotante que produce un fruto comestible con forma de cabeza de toro. es nutritiva y se consume en muchas partes de asia."],
+    ["aponogeton","aponogeton distachyos","comestible\nnutritiva\nanti-escorbutica","conocida como 'flor de agua' en sudafrica, sus flores y tuberculos son comestibles y tienen un alto valor nutritivo."],
+    ["elodea","elodea canadensis","oxigenante de agua\nantiseptica\ndiuretica","planta de acuario comun, conocida por su capacidad para oxigenar el agua. tradicionalmente usada como antiseptico suave."],
+    ["azolla","azolla filiculoides","biofertilizante\nalta en proteinas\nfitorremediacion","helecho acuatico flotante que fija nitrogeno, usado como fertilizante natural en arrozales y como alimento para animales."],
+    ["limon","citrus limon","antioxidante\nvitamina c\nrefuerza el sistema inmunologico","el limon es un fruto citrico conocido por su alto contenido de vitamina c."],
+    ["naranja","citrus naranja","antioxidante\nvitamina c\nrefuerza el sistema inmunologico","el naranja es un fruto citrico conocido por su alto contenido de vitamina c."],
+    ["toronja","citrus toronja","antioxidante\nvitamina c\nrefuerza el sistema inmunologico","el toronja es un fruto citrico conocido por su alto contenido de vitamina c."],
+    ["mandarina","citrus mandarina","antioxidante\nvitamina c\nrefuerza el sistema inmunologico","el mandarina es un fruto citrico conocido por su alto contenido de vitamina c."],
+    ["lima","citrus lima","antioxidante\nvitamina c\nrefuerza el sistema inmunologico","el lima es un fruto citrico conocido por su alto contenido de vitamina c."],
+    ["bergamota","citrus bergamota","antioxidante\nvitamina c\nrefuerza el sistema inmunologico","el bergamota es un fruto citrico conocido por su alto contenido de vitamina c."],
+    ["pomelo","citrus pomelo","antioxidante\nvitamina c\nrefuerza el sistema inmunologico","el pomelo es un fruto citrico conocido por su alto contenido de vitamina c."],
+    ["kumquat","citrus kumquat","antioxidante\nvitamina c\nrefuerza el sistema inmunologico","el kumquat es un fruto citrico conocido por su alto contenido de vitamina c."],
+    ["cidra","citrus cidra","antioxidante\nvitamina c\nrefuerza el sistema inmunologico","el cidra es un fruto citrico conocido por su alto contenido de vitamina c."],
+    ["yuzu","citrus yuzu","antioxidante\nvitamina c\nrefuerza el sistema inmunologico","el yuzu es un fruto citrico conocido por su alto contenido de vitamina c."],
+    ["calamondin","citrus calamondin","antioxidante\nvitamina c\nrefuerza el sistema inmunologico","el calamondin es un fruto citrico conocido por su alto contenido de vitamina c."],
+    ["tangelo","citrus tangelo","antioxidante\nvitamina c\nrefuerza el sistema inmunologico","el tangelo es un fruto citrico conocido por su alto contenido de vitamina c."],
+    ["ugli","citrus ugli","antioxidante\nvitamina c\nrefuerza el sistema inmunologico","el ugli es un fruto citrico conocido por su alto contenido de vitamina c."],
+    ["sweetie","citrus sweetie","antioxidante\nvitamina c\nrefuerza el sistema inmunologico","el sweetie es un fruto citrico conocido por su alto contenido de vitamina c."],
+    ["oroblanco","citrus oroblanco","antioxidante\nvitamina c\nrefuerza el sistema inmunologico","el oroblanco es un fruto citrico conocido por su alto contenido de vitamina c."],
+    ["melogold","citrus melogold","antioxidante\nvitamina c\nrefuerza el sistema inmunologico","el melogold es un fruto citrico conocido por su alto contenido de vitamina c."],
+    ["kaffir lime","citrus kaffir lime","antioxidante\nvitamina c\nrefuerza el sistema inmunologico","el kaffir lime es un fruto citrico conocido por su alto contenido de vitamina c."],
+    ["finger lime","citrus finger lime","antioxidante\nvitamina c\nrefuerza el sistema inmunologico","el finger lime es un fruto citrico conocido por su alto contenido de vitamina c."],
+    ["sudachi","citrus sudachi","antioxidante\nvitamina c\nrefuerza el sistema inmunologico","el sudachi es un fruto citrico conocido por su alto contenido de vitamina c."],
+    ["kabosu","citrus kabosu","antioxidante\nvitamina c\nrefuerza el sistema inmunologico","el kabosu es un fruto citrico conocido por su alto contenido de vitamina c."],
+    ["rangpur","citrus rangpur","antioxidante\nvitamina c\nrefuerza el sistema inmunologico","el rangpur es un fruto citrico conocido por su alto contenido de vitamina c."],
+    ["limequat","citrus limequat","antioxidante\nvitamina c\nrefuerza el sistema inmunologico","el limequat es un fruto citrico conocido por su alto contenido de vitamina c."],
+    ["citrange","citrus citrange","antioxidante\nvitamina c\nrefuerza el sistema inmunologico","el citrange es un fruto citrico conocido por su alto contenido de vitamina c."],
+    ["citrumelo","citrus citrumelo","antioxidante\nvitamina c\nrefuerza el sistema inmunologico","el citrumelo es un fruto citrico conocido por su alto contenido de vitamina c."],
+    ["faustrime","citrus faustrime","antioxidante\nvitamina c\nrefuerza el sistema inmunologico","el faustrime es un fruto citrico conocido por su alto contenido de vitamina c."],
+    ["caimito","chrysophyllum cainito","antioxidante\nantiinflamatorio\ncontrol de la diabetes\nrefuerza el sistema inmunitario\nsalud digestiva\nproduccion de colageno","el caimito es una fruta tropical con una pulpa dulce y lechosa. es rico en antioxidantes y se utiliza en la medicina tradicional para tratar la diabetes y problemas digestivos."],
+    ["papaya","carica papaya","digestiva\nantiinflamatoria\ncicatrizante\nrefuerza el sistema inmunitario\nantioxidante\ndiuretica","la papaya es una fruta tropical conocida por su enzima papaina, que facilita la digestion de las proteinas. es rica en vitaminas a, c y antioxidantes."],
+    ["pina","ananas comosus","digestiva\nantiinflamatoria\ndiuretica\nrefuerza el sistema inmunitario\nanticoagulante\ncicatrizante","la pina es una fruta tropical rica en bromelina, una enzima que ayuda a digerir las proteinas. tambien es una excelente fuente de vitamina c y manganeso."],
+    ["mango","mangifera indica","antioxidante\nrefuerza el sistema inmunitario\nmejora la salud ocular\nfavorece la digestion\nbeneficioso para la piel","el mango es una fruta jugosa y dulce, rica en vitaminas a, c y e, asi como en antioxidantes que protegen al cuerpo del dano celular."],
+    ["guayaba","psidium guajava","astringente\nantidiarreica\nantioxidante\nreduce el colesterol\ncontrola la diabetes\nrefuerza el sistema inmunitario","la guayaba es una fruta tropical con un alto contenido de vitamina c, incluso mas que los citricos. sus hojas se utilizan tradicionalmente para tratar problemas digestivos."],
+    ["maracuya","passiflora edulis","sedante\nansiolitica\nrelajante muscular\nantioxidante\nreduce la presion arterial","el maracuya, tambien conocido como fruta de la pasion, es valorado por sus propiedades calmantes y su capacidad para inducir el sueno. es rico en antioxidantes y fibra."],
+    ["carambola","averrhoa carambola","antioxidante\nantiinflamatoria\ncontrol del azucar en sangre\nfavorece el transito intestinal\nrefuerza el sistema inmunitario\nbeneficiosa para la salud del corazon","la carambola, o fruta estrella, es una fruta exotica de sabor agridulce, rica en vitamina c y antioxidantes. su forma de estrella la hace muy atractiva para la decoracion de platos."],
+    ["pitahaya","hylocereus undatus","antioxidante\nantiinflamatoria\nfavorece la perdida de peso\nfortalece los huesos\nmejora la digestion\nrefuerza el sistema inmunitario","la pitahaya, o fruta del dragon, es una fruta exotica con una apariencia llamativa y un sabor dulce y refrescante. es rica en antioxidantes, fibra y vitamina c."],
+    ["lichi","litchi chinensis","antioxidante\nrefuerza el sistema inmunitario\nantiinflamatorio\nmejora la circulacion\nprotege el corazon","el lichi es una fruta pequena y dulce, con una pulpa blanca y jugosa. es una excelente fuente de vitamina c y compuestos antioxidantes que combaten el estres oxidativo."],
+    ["rambutan","nephelium lappaceum","antiparasitario\nantioxidante\nrefuerza el sistema inmunitario\nfuente de energia\nmejora la salud osea","el rambutan es una fruta exotica cubierta por una cascara peluda. su pulpa es dulce y jugosa, similar a la del lichi, y es rica en vitamina c, hierro y cobre."],
+    ["durian","durio zibethinus","fuente de energia\nantidepresivo natural\nafrodisiaco\nfavorece el sueno\nregula la presion arterial","el durian es conocido como el 'rey de las frutas' en el sudeste asiatico, famoso por su gran tamano, cascara espinosa y un olor intenso y caracteristico. es muy nutritivo pero tambien muy calorico."],
+    ["tamarindo","tamarindus indica","laxante suave\nantiinflamatorio\nantiseptico\nreduce la fiebre\nprotector hepatico","el tamarindo es una leguminosa con una pulpa agridulce que se utiliza en cocinas de todo el mundo. tiene propiedades medicinales laxantes y ayuda a reducir la inflamacion."],
+    ["coco","cocos nucifera","hidratante\nantibacteriano\nantiviral\nfuente de electrolitos\nmejora la salud cerebral","el coco es una fruta tropical muy versatil. su agua es una bebida hidratante natural, su pulpa es rica en fibra y su aceite tiene propiedades antimicrobianas."],
+    ["guanabana","annona muricata","anticancerigena (potencial)\nantiparasitaria\nantiinflamatoria\nsedante\nhipotensora","la guanabana es una fruta con pulpa blanca y cremosa, y un sabor agridulce. se le atribuyen propiedades anticancerigenas, aunque se necesita mas investigacion."],
+    ["kiwi","actinidia deliciosa","laxante\nrefuerza el sistema inmunitario\nantioxidante\nmejora la salud respiratoria\nayuda a dormir","el kiwi es una pequena fruta con una gran cantidad de vitamina c, fibra y antioxidantes. ayuda a regular el transito intestinal y a fortalecer las defensas."],
+    ["granada","punica granatum","antioxidante potente\nantiinflamatoria\nprotector cardiovascular\nanticancerigena (potencial)\nmejora la memoria","la granada es una fruta cargada de antioxidantes, especialmente punicalaginas, que le confieren potentes propiedades protectoras para la salud cardiovascular y cerebral."],
+    ["higo","ficus carica","laxante\nexpectorante\ndemulcente (suavizante de mucosas)\nnutritivo\nremineralizante","el higo es una fruta dulce y nutritiva, rica en fibra, que ayuda a regular el transito intestinal. tambien se utiliza para aliviar la tos y el dolor de garganta."],
+    ["chirimoya","annona cherimola","relajante\nantidepresiva\nregula la presion arterial\ndigestiva\nantioxidante","la chirimoya es una fruta de pulpa cremosa y sabor dulce, a menudo descrita como una mezcla de platano, pina y fresa. contiene compuestos que promueven la relajacion y el bienestar."],
+    ["lucuma","pouteria lucuma","endulzante natural de bajo indice glucemico\nantioxidante\nantiinflamatoria\nregeneradora de la piel\nrefuerza el sistema inmunitario","la lucuma, conocida como el 'oro de los incas', es una fruta peruana con un sabor dulce que recuerda al caramelo o al arce. se utiliza principalmente como un endulzante natural y nutritivo."],
+    ["zapote","pouteria sapota","nutritivo\nantioxidante\nmejora la vision\nsalud digestiva\nfuente de energia","el zapote es una fruta de pulpa suave y dulce, de color anaranjado o rojizo. es rico en vitaminas a y c, potasio y fibra dietetica."],
+    ["mamey","mammea americana","antiparasitario\ninsecticida (semilla)\ncicatrizante\ndigestivo\nantioxidante","el mamey es una fruta grande de pulpa firme y sabor dulce. el aceite extraido de su semilla se ha utilizado tradicionalmente como insecticida y para tratar afecciones de la piel."],
+    ["noni","morinda citrifolia","analgesico\nantiinflamatorio\nrefuerza el sistema inmunitario\nantibacteriano\nanticancerigeno (potencial)","el noni es una fruta con un olor y sabor fuertes y peculiares. a pesar de ello, su jugo es muy popular por sus supuestos beneficios para la salud, incluyendo el alivio del dolor y el fortalecimiento del sistema inmune."],
+    ["araza","eugenia stipitata","antioxidante\nvitamina c\ndiuretico\nsalud hepatica\ncontrol del colesterol","el araza es una fruta amazonica muy acida, por lo que rara vez se consume fresca. es excepcionalmente rica en vitamina c y se utiliza para preparar jugos y dulces refrescantes."],
+    ["borojo","borojoa patinoi","energizante\nafrodisiaco\nnutritivo\nregulador hormonal\ncicatrizante","el borojo es una fruta de la selva tropical del pacifico, conocida como el 'viagra natural' por sus supuestas propiedades afrodisiacas. es muy rica en fosforo, hierro y aminoacidos."],
+    ["camu camu","myrciaria dubia","vitamina c (muy alta)\nantioxidante\nantiinflamatorio\nantiviral\nrefuerza el sistema inmunitario","el camu camu es una pequena fruta amazonica que ostenta uno de los contenidos mas altos de vitamina c del mundo. se utiliza para fortalecer el sistema inmune y combatir la inflamacion."],
+    ["copoazu","theobroma grandiflorum","estimulante (sin cafeina)\nantioxidante\nhidratante para la piel\nsalud cardiovascular\nnutritivo","el copoazu es un pariente del cacao, con una pulpa aromatica y acida. contiene teacrina, un estimulante suave, y su manteca es un excelente emoliente para la piel."],
+    ["feijoa","acca sellowiana","antioxidante\ndigestiva\nrefuerza el sistema inmunitario\nsalud tiroidea (por yodo)\nantiinflamatoria","la feijoa, tambien conocida como guayaba-pina, tiene un sabor aromatico y complejo. es rica en fibra, vitamina c y yodo, beneficiando la digestion y la funcion tiroidea."],
+    ["jabuticaba","myrciaria cauliflora","antioxidante\nantiinflamatoria\nanticancerigena (potencial)\nantienvejecimiento\nastringente","la jabuticaba es una fruta brasilena unica que crece directamente en el tronco y las ramas del arbol. su cascara oscura es rica en antocianinas, potentes antioxidantes."],
+    ["macambo","theobroma bicolor","nutritivo\nfuente de proteina y fibra\nsalud cerebral\nenergizante\nmejora el humor","el macambo, pariente del cacao, es conocido como el 'cacao blanco'. sus semillas, una vez tostadas, son un snack nutritivo que proporciona energia y mejora el estado de animo gracias a su contenido de teobromina."],
+    ["pomarrosa","syzygium jambos","antidiabetica (semillas)\nantimicrobiana\ndiuretica\ndigestiva\nreduce la fiebre","la pomarrosa es una fruta crujiente y acuosa con un aroma que recuerda a las rosas. tradicionalmente, diversas partes de la planta se han usado para tratar la diabetes y la fiebre."],
+    ["tomatillo","physalis philadelphica","antioxidante\nantibacteriano\nsalud ocular\ncontrol de la diabetes\nantiinflamatorio","el tomatillo, o tomate verde, es un ingrediente fundamental en la cocina mexicana. es rico en antioxidantes y se ha estudiado por sus propiedades para regular el azucar en sangre."],
+    ["kumquat","citrus japonica","antioxidante\nrefuerza el sistema inmunitario\nsalud digestiva\nantiinflamatorio\ncontrol del colesterol","el kumquat es un pequeno citrico que se come entero, con cascara. la cascara es dulce y la pulpa acida, creando una explosion de sabor. es rico en vitamina c y fibra."],
+    ["tamarillo","solanum betaceum","salud ocular\nantioxidante\ncontrol de la presion arterial\nmejora la digestion\nbajo en calorias","el tamarillo, o tomate de arbol, tiene un sabor agridulce y audaz. es rico en vitaminas a y c y potasio, lo que lo hace beneficioso para la vista y la presion arterial."],
+    ["lima kaffir","citrus hystrix","antiinflamatorio\nsalud bucal\ndetoxificante sanguineo\nestimulante digestivo\nrepelente de insectos","la lima kaffir es un citrico muy aromatico, valorado mas por sus hojas y su cascara que por su jugo. se utiliza en la medicina tradicional para la salud bucal y para purificar la sangre."],
+    ["anon","annona squamosa","digestivo\nsalud ocular\ncontrol de la presion arterial\nsalud de la piel\nantioxidante","el anon, tambien conocido como chirimoya de azucar, tiene una pulpa dulce y segmentada. es rico en vitamina c, vitamina a y potasio."],
+    ["yaca","artocarpus heterophyllus","nutritiva\nsalud digestiva\nrefuerza el sistema inmunitario\nsalud ocular\ncontrol del azucar en sangre","la yaca es la fruta de arbol mas grande del mundo. su pulpa tiene una textura carnosa y un sabor dulce cuando esta madura. es una buena fuente de fibra, vitaminas y minerales."],
+    ["banana roja","musa acuminata 'red dacca'","rica en potasio\nfuente de vitamina c y b6\nantioxidante (rica en carotenoides)\nmejora la digestion\nenergizante","la banana roja es mas pequena y dulce que la banana comun, con un ligero sabor a frambuesa. su color rojo se debe a un alto contenido de carotenoides, que son potentes antioxidantes."],
+    ["frutipan","artocarpus altilis","fuente de carbohidratos complejos\nsalud cardiovascular\nrico en fibra\nenergizante\nsalud osea","el frutipan, o arbol del pan, es una fruta amilacea que se consume cocida y sirve como un alimento basico en muchas culturas tropicales. es una excelente fuente de energia y fibra."],
+    ["fruta hala","pandanus tectorius","laxante\nsalud bucal\nalivia dolores de cabeza\ndiuretico\nfuente de vitamina c","la fruta hala es una fruta de aspecto peculiar, compuesta por multiples segmentos llamados falanges. se utiliza en la medicina tradicional polinesia para diversos fines, desde laxante hasta analgesico."],
+    ["acerola","malpighia emarginata","extremadamente rica en vitamina c\nantioxidante\nrefuerza el sistema inmunitario\nantienvejecimiento\nsalud ocular","la acerola, o cereza de barbados, es una de las fuentes naturales mas ricas en vitamina c. este potente antioxidante ayuda a proteger el cuerpo contra enfermedades y el envejecimiento prematuro."],
+    ["manzana","malus domestica","antioxidante\nregulador intestinal\nhipocolesterolemiante\ndiuretica","fruta rica en fibra y antioxidantes, ayuda a regular el transito intestinal y a reducir el colesterol."],
+    ["pera","pyrus communis","diuretica\nastringente (cocida)\nlaxante (cruda)\nremineralizante","fruta suave y dulce, conocida por su efecto diuretico y su capacidad para regular el intestino dependiendo de su preparacion."],
+    ["durazno","prunus persica","laxante suave\ndiuretico\nantioxidante\nhidratante","fruta jugosa y refrescante, ideal para la hidratacion y como laxante suave. las hojas se usan tradicionalmente como diuretico."],
+    ["ciruela","prunus domestica","laxante potente\nantioxidante\nenergizante\nremineralizante","reconocida por su alto contenido de fibra y sorbitol, es un laxante natural muy eficaz, especialmente en su forma seca."],
+    ["cereza","prunus avium","antiinflamatoria\ndiuretica\nantigota\nantioxidante","rica en antocianinas, ayuda a reducir la inflamacion y los niveles de acido urico, siendo util para la gota. los rabos son potentes diureticos."],
+    ["albaricoque","prunus armeniaca","laxante suave\nvitaminico (provitamina a)\nantianemico\nantioxidante","excelente fuente de betacarotenos, beneficioso para la vista y la piel. su consumo regular ayuda a combatir el estrenimiento."],
+    ["membrillo","cydonia oblonga","astringente\nantidiarreico\ndemulcente\nantiinflamatorio intestinal","rico en pectina y taninos, es un potente remedio natural contra la diarrea y las inflamaciones intestinales, consumido siempre cocido."],
+    ["granada","punica granatum","antioxidante potente\nantiinflamatoria\ncardioprotectora\nantiparasitaria (corteza)","considerada un superalimento por su alto contenido de polifenoles, protege el sistema cardiovascular y tiene propiedades antiinflamatorias."],
+    ["higo","ficus carica","laxante\nexpectorante\ndemulcente\nnutritivo","fruta muy energetica y con un marcado efecto laxante. la decoccion de higos secos es un remedio tradicional para la tos y el dolor de garganta."],
+    ["uva","vitis vinifera","antioxidante (resveratrol)\ncardioprotectora\ndiuretica\ndepurativa","rica en resveratrol y otros polifenoles, la uva es un potente antioxidante que protege el corazon y los vasos sanguineos."],
+    ["kiwi","actinidia deliciosa","laxante\nvitaminico (vitamina c)\ninmunoestimulante\nantioxidante","excepcionalmente rico en vitamina c, el kiwi es un potente estimulante del sistema inmunitario y un eficaz laxante gracias a su fibra."],
+    ["frambuesa","rubus idaeus","antioxidante\nantiinflamatoria\nreguladora hormonal (hojas)\nastringente (hojas)","fruta rica en antioxidantes. las hojas de frambuesa son un tonico uterino tradicional, utilizado para regular el ciclo menstrual y facilitar el parto."],
+    ["fresa","fragaria vesca","diuretica\nantioxidante\nantiinflamatoria\nremineralizante","fruta diuretica y depurativa, rica en vitamina c y antioxidantes. ayuda a eliminar el exceso de liquidos y toxinas."],
+    ["mora","rubus fruticosus","antioxidante\nastringente (fruto verde)\nlaxante (fruto maduro)\nantiinflamatoria","fruta silvestre rica en vitaminas y antioxidantes. las hojas se usan en infusion como astringente para la diarrea y las ulceras bucales."],
+    ["arandano","vaccinium myrtillus","antiseptico urinario\nantioxidante\nprotector de la vista\nvasoprotector","conocido por su capacidad para prevenir infecciones urinarias. tambien mejora la vision nocturna y protege los capilares sanguineos."],
+    ["grosella","ribes rubrum","vitaminico (vitamina c)\ndiuretica\nastringente\nantioxidante","pequena fruta roja muy rica en vitamina c y con propiedades diureticas y astringentes. ayuda a fortalecer el sistema inmunitario."],
+    ["zarzamora","rubus ulmifolius","antioxidante\nastringente (hojas y fruto verde)\nantiinflamatoria\nvitaminico","similar a la mora, la zarzamora es rica en antioxidantes. sus hojas son un remedio tradicional para la diarrea y las afecciones de la boca."],
+    ["nectarina","prunus persica var. nucipersica","laxante suave\ndiuretica\nantioxidante\nhidratante","variedad de durazno de piel lisa, comparte sus propiedades laxantes y diureticas. es muy refrescante y rica en vitaminas."],
+    ["paraguayo","prunus persica var. platycarpa","laxante suave\ndiuretico\nantioxidante\nhidratante","variedad de durazno de forma achatada, con propiedades similares. es dulce, jugoso y facil de digerir."],
+    ["nispero","eriobotrya japonica","astringente\nantidiarreico\ndiuretico\nexpectorante (semillas)","fruta de primavera con propiedades astringentes, util para la diarrea. las semillas, usadas con precaucion, tienen efecto expectorante."],
+    ["caqui","diospyros kaki","laxante (maduro)\nastringente (inmaduro)\nvitaminico (vitamina a)\nantioxidante","fruta dulce y carnosa, rica en vitamina a. su efecto sobre el intestino varia con la madurez: laxante si esta maduro, astringente si no."],
+    ["acerola","malpighia emarginata","vitaminico (vitamina c)\ninmunoestimulante\nantioxidante\nantianemico","una de las fuentes mas ricas de vitamina c del mundo. potente estimulante del sistema inmunitario y antioxidante."],
+    ["avellana","corylus avellana","nutritiva\ncardioprotectora\nantioxidante (vitamina e)\nremineralizante","fruto seco rico en grasas saludables, vitamina e y minerales. ayuda a proteger el sistema cardiovascular y a combatir el envejecimiento celular."],
+    ["azarolo","crataegus azarolus","cardiotonico\nhipotensor\nantioxidante\nsedante suave","pariente del espino blanco, comparte sus propiedades cardiotonicas y reguladoras de la presion arterial. los frutos son comestibles y ricos en vitamina c."],
+    ["endrina","prunus spinosa","astringente\ntonico digestivo\nantioxidante\nvitaminico","fruto del endrino, muy astringente en crudo. se utiliza tradicionalmente para hacer pacharan, un licor digestivo."],
+    ["grosella espinosa","ribes uva-crispa","vitaminico (vitamina c)\nantioxidante\ndiuretica\nlaxante suave","fruta rica en vitamina c y fibra. tiene un sabor acido caracteristico y se utiliza tanto fresca como en preparaciones cocidas."],
+    ["grosella negra","ribes nigrum","antiinflamatoria\nantialergica\nvitaminico (vitamina c)\ndiuretica","conocida por sus propiedades antiinflamatorias y antialergicas, similares a la cortisona pero sin sus efectos secundarios. el fruto es muy rico en vitamina c."],
+    ["grosella roja","ribes rubrum","vitaminico (vitamina c)\ndiuretica\nastringente\nantioxidante","pequena fruta roja muy rica en vitamina c y con propiedades diureticas y astringentes. ayuda a fortalecer el sistema inmunitario."],
+    ["madrono","arbutus unedo","antiseptico urinario\ndiuretico\nastringente\nantioxidante","el fruto del madrono es comestible y rico en vitamina c. las hojas tienen propiedades antisepticas urinarias y diureticas."],
+    ["nashi","pyrus pyrifolia","diuretica\nexpectorante\nhidratante\nlaxante suave","pera asiatica de textura crujiente y muy jugosa. se utiliza en la medicina tradicional china para aliviar la tos y la sequedad de garganta."],
+    ["nogal","juglans regia","nutritiva (fruto)\ncardioprotectora (fruto)\nastringente (hojas)\nantifungica (hojas)","la nuez es un alimento excepcional para el cerebro y el corazon. las hojas de nogal son astringentes y se usan externamente para problemas de piel."],
+    ["uva espina","ribes uva-crispa","vitaminico (vitamina c)\nantioxidante\ndiuretica\nlaxante suave","fruta rica en vitamina c y fibra. tiene un sabor acido caracteristico y se utiliza tanto fresca como en preparaciones cocidas."],
+    ["serba","sorbus domestica","astringente\nantidiarreico\nvitaminico\nremineralizante","fruto del serbal comun, solo comestible cuando esta muy maduro y blando. es muy astringente y se ha usado tradicionalmente para la diarrea."],
+    ["escaramujo","rosa canina","vitaminico (vitamina c)\nantioxidante\nantiinflamatorio\ninmunoestimulante","fruto del rosal silvestre, es una de las fuentes mas concentradas de vitamina c. se utiliza para prevenir resfriados y fortalecer las defensas."],
+    ["sauco","sambucus nigra","antiviral\nsudorifico\nexpectorante\ndiuretico","las flores de sauco son un remedio tradicional para la fiebre y los resfriados. las bayas cocidas tienen potentes propiedades antivirales, especialmente contra la gripe."],
+    ["arandano","vaccinium myrtillus","antiinflamatorio\nantihemorragico\nastringente\nantioxidante\nvenotonico\nantiseptico","el arandano es un recurso de herbolario para tratar la debilidad capilar y mejorar el riego sanguineo. se indica para aliviar las varices y las hemorroides, pero tambien para corregir la mala vision nocturna."],
+    ["mora","rubus ulmifolius","hemostatica\nastringente\nrevitalizante\nvitaminica\ndiuretica\nantioxidante","las moras se comportan como astringentes y aportan vitamina c y antioxidantes. se recomiendan como revitalizantes en situaciones de convalecencia, astenia, fatiga y debilidad."],
+    ["frambuesa","rubus idaeus","vitaminica\nantioxidante\ndiuretica\naromatizante","las frambuesas contienen vitamina c y antioxidantes naturales, asi como azucares. ayudan a prevenir las infecciones y aportan vitalidad y resistencia ante esfuerzos fisicos."],
+    ["fresa","fragaria x ananassa","antiinflamatoria\nantioxidante\ndiuretica\nvitaminica","rica en polifenoles, que tienen propiedades antiinflamatorias. ayuda a controlar el azucar en sangre."],
+    ["grosella negra","ribes nigrum","antiinflamatoria\nantioxidante\ndiuretica\nvitaminica","conocida por mejorar la funcion renal, la salud ocular y la inmunidad. alta en antocianinas."],
+    ["sauco","sambucus nigra","antiviral\nantiinflamatorio\ninmunoestimulante\ndiaforetico","ampliamente utilizado para estimular el sistema inmunologico y tratar los sintomas del resfriado y la gripe."],
+    ["endrino","prunus spinosa","astringente\nantidiarreico\nantioxidante\ncicatrizante","se utiliza tradicionalmente para combatir diarreas y hemorragias leves. estimula la salivacion."],
+    ["madrono","arbutus unedo","astringente\nantiseptico urinario\nantiinflamatorio","los frutos del madrono tienen propiedades astringentes y se utilizan para tratar infecciones urinarias."],
+    ["cornejo","cornus mas","astringente\nantipiretico\ntonico","frutos ricos en vitamina c, utilizados tradicionalmente como tonico y para bajar la fiebre."],
+    ["espino amarillo","hippophae rhamnoides","vitaminico\nantioxidante\ncicatrizante\ninmunoestimulante","excepcionalmente rico en vitamina c y otros antioxidantes. promueve la salud de la piel y las mucosas."],
+    ["arandano rojo","vaccinium macrocarpon","antiseptico urinario\nantioxidante\nantiinflamatorio\nprobiotico","especialmente conocido por su capacidad para prevenir y tratar infecciones del tracto urinario, como la cistitis."],
+    ["baya de goji","lycium barbarum","antioxidante\ninmunoestimulante\nhepatoprotector\nadaptogeno","utilizadas en la medicina tradicional china para proteger el higado, mejorar la vista y fortalecer el sistema inmune."],
+    ["escaramujo","rosa canina","vitaminico\nastringente\nantidiarreico\ndiuretico\nvenotonico","extremadamente rico en vitamina c, se usa para combatir la astenia, procesos infecciosos y para tratar diarreas."],
+    ["grosella roja","ribes rubrum","antioxidante\nantiinflamatoria\naperitiva\ndiuretica","estimula el apetito y tiene un efecto diuretico suave. rica en vitamina c y antioxidantes."],
+    ["baya de acai","euterpe oleracea","antioxidante\nenergizante\nantiinflamatoria","considerada un superalimento por su alta concentracion de antioxidantes, que combaten el estres oxidativo."],
+    ["uva de oso","arctostaphylos uva-ursi","antiseptico urinario\nastringente\ndiuretico","principalmente usada por sus hojas para tratar infecciones del tracto urinario. las bayas son comestibles pero insipidas."],
+    ["zarzamora","rubus fruticosus","astringente\nantioxidante\nantiinflamatoria\nvitaminica","similar a la mora, pero el termino se usa a menudo para variedades silvestres. rica en antioxidantes y vitaminas."],
+    ["baya de maqui","aristotelia chilensis","antioxidante\nantiinflamatoria\nregulador de glucosa","originaria de la patagonia, es una de las bayas con mayor poder antioxidante. ayuda a regular el azucar en sangre."],
+    ["baya del espino","crataegus monogyna","cardiotonica\nhipotensora\nsedante\nantioxidante","considerada la planta del corazon. ayuda a regular el ritmo cardiaco, la tension arterial y tiene un efecto calmante."],
+    ["serbal de los cazadores","sorbus aucuparia","astringente\ndiuretica\nvitaminica (vitamina c)","los frutos son ricos en vitamina c y se usan tradicionalmente para hacer mermeladas con propiedades astringentes."],
+    ["casis","ribes nigrum","antiinflamatorio\nantialergico\ndiuretico\nvitaminico","tambien conocido como grosellero negro, es famoso por sus propiedades antiinflamatorias, similares a la cortisona."],
+    ["uva de california","mahonia aquifolium","hepatoprotectora\nantimicrobiana\nantiinflamatoria (piel)","la raiz se usa para problemas de piel como la psoriasis. las bayas son acidas pero comestibles y ricas en vitamina c."],
+    ["baya de agracejo","berberis vulgaris","hepatoprotectora\nhipoglucemiante\nantimicrobiana","las bayas son ricas en vitamina c. la corteza contiene berberina, usada para problemas hepaticos y digestivos."],
+    ["murtilla","ugni molinae","antioxidante\nantiinflamatoria\nastringente","fruto nativo del sur de chile, con un aroma y sabor intensos. muy rico en antioxidantes y con propiedades antiinflamatorias."],
+    ["calafate","berberis microphylla","antioxidante\nantimicrobiana\nastringente","baya de la patagonia, similar al agracejo. es un potente antioxidante y forma parte de la cultura local."],
+    ["boysenberry","rubus ursinus × idaeus","antioxidante\nvitaminica\nfibra","hibrido entre frambuesa, mora y loganberry. rico en fibra, vitaminas y antioxidantes."],
+    ["loganberry","rubus × loganobaccus","vitaminica (c y k)\nmanganeso\nfibra","hibrido entre la mora de california y la frambuesa. aporta vitaminas y minerales esenciales."],
+    ["tayberry","rubus fruticosus x r. idaeus","antioxidante\nvitamina c\nfibra","hibrido entre una mora y una frambuesa, originario de escocia. mas grande y dulce que la loganberry."],
+    ["lingonberry","vaccinium vitis-idaea","antioxidante\nantiinflamatoria\nmanganeso","popular en escandinavia, similar al arandano rojo. ayuda a la salud intestinal, ocular y cardiaca."],
+    ["huckleberry","vaccinium parvifolium","antioxidante\nvitaminica (a, b, c)\nhierro","similar al arandano pero con menos azucar. ayuda a reducir el colesterol y protege contra enfermedades cardiacas."],
+    ["linaza","linum usitatissimum","antiinflamatoria\ndigestiva\nantioxidante\nhipocolesterolemiante","la linaza es una semilla rica en fibra y acidos grasos omega-3, beneficiosa para la salud digestiva y cardiovascular."],
+    ["chia","salvia hispanica","hidratante\nantioxidante\nenergizante\ndigestiva","las semillas de chia son conocidas por su capacidad para absorber liquido y formar un gel, proporcionando hidratacion y energia."],
+    ["canamo","cannabis sativa","antiinflamatoria\nnutritiva\nanalgesica","las semillas de canamo son una fuente completa de proteinas y acidos grasos esenciales, beneficiosas para la salud del corazon y la piel."],
+    ["semillas de calabaza","cucurbita pepo","antiparasitaria\nprostatica\nnutritiva","las semillas de calabaza son ricas en zinc y se utilizan tradicionalmente para la salud de la prostata y como antiparasitario."],
+    ["semillas de girasol","helianthus annuus","antioxidante\nantiinflamatoria\nnutritiva","las semillas de girasol son una excelente fuente de vitamina e, un potente antioxidante que protege las celulas del dano."],
+    ["sesamo","sesamum indicum","antioxidante\nremineralizante\nneuroprotectora","el sesamo es rico en calcio y otros minerales, beneficioso para la salud osea y nerviosa."],
+    ["almendra","prunus dulcis","nutritiva\nhipocolesterolemiante\nantioxidante","las almendras son ricas en grasas saludables, vitamina e y magnesio, promoviendo la salud del corazon y el control del azucar en sangre."],
+    ["nuez","juglans regia","neuroprotectora\ncardioprotectora\nantiinflamatoria","las nueces son excepcionalmente ricas en acidos grasos omega-3, beneficiando la funcion cerebral y la salud del corazon."],
+    ["avellana","corylus avellana","cardioprotectora\nantioxidante\nnutritiva","las avellanas son una buena fuente de grasas monoinsaturadas, vitamina e y manganeso, apoyando la salud del corazon."],
+    ["castana","castanea sativa","energizante\ndigestiva\nastringente","a diferencia de otros frutos secos, las castanas son ricas en carbohidratos complejos y vitamina c, proporcionando energia sostenida."],
+    ["pistacho","pistacia vera","antioxidante\ncardioprotectora\nsalud ocular","los pistachos son ricos en luteina y zeaxantina, antioxidantes importantes para la salud de los ojos."],
+    ["nuez de brasil","bertholletia excelsa","antioxidante\ntiroidea\nantiinflamatoria","las nueces de brasil son la fuente natural mas rica en selenio, un mineral esencial para la funcion tiroidea y la proteccion antioxidante."],
+    ["nuez pecana","carya illinoinensis","antioxidante\nhipocolesterolemiante\nantiinflamatoria","las nueces pecanas son ricas en grasas monoinsaturadas y antioxidantes, ayudando a reducir el colesterol malo (ldl)."],
+    ["anacardo","anacardium occidentale","energizante\nremineralizante\nsalud osea","los anacardos son una buena fuente de cobre y magnesio, minerales importantes para la salud osea y la produccion de energia."],
+    ["pinon","pinus pinea","energizante\nsaciante\nsalud ocular","los pinones contienen acido pinolenico, que puede ayudar a suprimir el apetito, y luteina para la salud ocular."],
+    ["nuez de macadamia","macadamia integrifolia","cardioprotectora\nhipocolesterolemiante\nantioxidante","las nueces de macadamia son muy ricas en grasas monoinsaturadas saludables para el corazon, similares a las del aceite de oliva."],
+    ["semillas de amapola","papaver somniferum","relajante\nremineralizante\nantitusiva","las semillas de amapola son ricas en minerales como calcio y manganeso, y tienen un ligero efecto sedante."],
+    ["semillas de mostaza","brassica nigra / sinapis alba","rubefaciente\nestimulante digestivo\nantiinflamatoria","las semillas de mostaza se usan externamente para aliviar dolores musculares y congestion, y como especia para estimular la digestion."],
+    ["semillas de apio","apium graveolens","diuretica\nantiinflamatoria\ncarminativa","las semillas de apio se utilizan tradicionalmente como diuretico y para aliviar el dolor articular asociado con la gota y la artritis."],
+    ["semillas de hinojo","foeniculum vulgare","carminativa\ndigestiva\nantiespasmodica","las semillas de hinojo son excelentes para aliviar gases, hinchazon y colicos digestivos."],
+    ["semillas de comino","cuminum cyminum","digestiva\ncarminativa\nantioxidante","el comino es una especia digestiva que ayuda a la secrecion de enzimas pancreaticas, mejorando la absorcion de nutrientes."],
+    ["semillas de cardamomo","elettaria cardamomum","digestiva\ncarminativa\nexpectorante","el cardamomo es una especia aromatica que ayuda a la digestion, combate el mal aliento y puede ayudar a aliviar la congestion."],
+    ["semillas de cilantro","coriandrum sativum","digestiva\ncarminativa\nantioxidante","las semillas de cilantro ayudan a aliviar problemas digestivos como la indigestion y los gases."],
+    ["semillas de anis","pimpinella anisum","carminativa\nexpectorante\nantiespasmodica","el anis es conocido por su capacidad para aliviar los gases y la hinchazon, y tambien se usa para la tos y los resfriados."],
+    ["semillas de alcaravea","carum carvi","carminativa\ndigestiva\nantimicrobiana","similar al comino y al hinojo, la alcaravea es excelente para tratar la indigestion, los gases y los colicos."],
+    ["semillas de eneldo","anethum graveolens","carminativa\nantiespasmodica\ngalactagoga","las semillas de eneldo son utiles para los trastornos digestivos y tradicionalmente se han utilizado para promover la produccion de leche materna."],
+    ["semillas de fenogreco","trigonella foenum-graecum","hipoglucemiante\ngalactagoga\nantiinflamatoria","el fenogreco se usa para ayudar a controlar el azucar en sangre, aumentar la produccion de leche materna y como antiinflamatorio."],
+    ["cacahuete","arachis hypogaea","energizante\nnutritiva\nantioxidante","aunque es una legumbre, se consume como fruto seco. es rico en proteinas, grasas saludables y resveratrol."],
+    ["semillas de uva","vitis vinifera","antioxidante\nvasoprotectora\nantiinflamatoria","el extracto de semilla de uva es rico en proantocianidinas, potentes antioxidantes que protegen los vasos sanguineos."],
+    ["semillas de granada","punica granatum","antioxidante\nantiinflamatoria\ncardioprotectora","las semillas de granada son ricas en antioxidantes (punicalaginas) y el aceite de sus semillas contiene acido punico, un potente antiinflamatorio."],
+    ["semillas de sandia","citrullus lanatus","diuretica\nnutritiva\nremineralizante","las semillas de sandia son una fuente sorprendente de magnesio, hierro y zinc, y tienen un ligero efecto diuretico."],
+    ["semillas de melon","cucumis melo","nutritiva\nantioxidante\nvermifuga","similares a las de calabaza, las semillas de melon son ricas en proteinas y grasas saludables, y se han usado como antiparasitarias."],
+    ["semillas de loto","nelumbo nucifera","astringente\ncalmante\nnutritiva","en la medicina tradicional china, las semillas de loto se usan para tonificar el bazo, los rinones y calmar el espiritu."],
+    ["semillas de nigella (comino negro)","nigella sativa","inmunomoduladora\nantiinflamatoria\nantihistaminica","conocida como \"la semilla bendita\", se usa tradicionalmente para una amplia gama de dolencias, especialmente para el sistema inmunologico y respiratorio."],
+    ["castana de indias","aesculus hippocastanum","venotonica\nantiinflamatoria\nantiedematosa","la castana de indias es el remedio principal para la insuficiencia venosa cronica, varices y hemorroides, mejorando la circulacion."],
+    ["semillas de psyllium","plantago ovata","laxante (formador de bolo)\nhipocolesterolemiante\nprebiotica","la cascara de psyllium es una fibra soluble que aumenta el volumen de las heces, siendo muy eficaz para tratar tanto el estrenimiento como la diarrea."],
+    ["semillas de cacao","theobroma cacao","antioxidante\nestimulante\ncardioprotectora","el cacao puro es extremadamente rico en flavonoides antioxidantes, que mejoran la salud cardiovascular y el estado de animo."],
+    ["semillas de cafe (grano)","coffea arabica / robusta","estimulante del snc\nantioxidante\ndiuretica","el grano de cafe es la fuente mas popular de cafeina, un estimulante que mejora la alerta y la concentracion. tambien es rico en antioxidantes."],
+    ["semillas de guarana","paullinia cupana","estimulante\nenergizante\nsaciante","el guarana contiene una concentracion de cafeina mucho mayor que el cafe, proporcionando un efecto estimulante mas potente y duradero."],
+    ["nuez de cola","cola acuminata","estimulante\nastringente\ndiuretica","la nuez de cola es un estimulante tradicional africano, conocido por ser uno de los ingredientes originales de las bebidas de cola."],
+    ["canela","cinnamomum verum","antioxidante\nantiinflamatoria\nreguladora del azucar en sangre","la canela es una especia aromatica con propiedades medicinales conocidas desde la antiguedad."],
+    ["clavo de olor","syzygium aromaticum","analgesico\nantiseptico\ncarminativo","el clavo de olor es conocido por su intenso aroma y sus propiedades analgesicas, especialmente para el dolor de muelas."],
+    ["pimienta negra","piper nigrum","digestiva\nantioxidante\npotenciador de la absorcion de nutrientes","la pimienta negra no solo anade sabor a los alimentos, sino que tambien mejora la digestion y la absorcion de nutrientes."],
+    ["cardamomo","elettaria cardamomum","carminativo\nantiespasmodico\nexpectorante","el cardamomo es una especia exotica que ayuda a aliviar problemas digestivos y respiratorios."],
+    ["nuez moscada","myristica fragrans","carminativo\nestimulante cerebral\nsedante suave","la nuez moscada se utiliza con moderacion para problemas digestivos y como estimulante cerebral."],
+    ["azafran","crocus sativus","antidepresivo\nantioxidante\nafrodisiaco","el azafran es la especia mas cara del mundo y se ha utilizado tradicionalmente para mejorar el estado de animo."],
+    ["fenogreco","trigonella foenum-graecum","galactagogo\nhipoglucemiante\nantiinflamatorio","el fenogreco es conocido por aumentar la produccion de leche materna y ayudar a regular el azucar en sangre."],
+    ["mostaza","brassica nigra","rubefaciente\nexpectorante\nestimulante circulatorio","las semillas de mostaza se utilizan externamente para aliviar dolores musculares y congestion."],
+    ["pimenton","capsicum annuum","antioxidante\nestimulante circulatorio\nanalgesico suave","el pimenton, derivado de los pimientos rojos, es rico en antioxidantes y puede mejorar la circulacion."],
+    ["vainilla","vanilla planifolia","aromatizante\nrelajante\nantioxidante","la vainilla es apreciada por su aroma y sabor, y tiene un efecto calmante sobre el sistema nervioso."],
+    ["jengibre","zingiber officinale","antiinflamatorio\nantiemetico\ndigestivo","el jengibre es ampliamente utilizado para aliviar nauseas, problemas digestivos y dolores inflamatorios."],
+    ["curcuma","curcuma longa","antiinflamatoria\nantioxidante\nhepatoprotectora","la curcuma contiene curcumina, un potente compuesto antiinflamatorio y antioxidante."],
+    ["anis estrellado","illicium verum","carminativo\nexpectorante\nantiviral","el anis estrellado es eficaz para aliviar gases y problemas respiratorios. es una fuente de acido shikimico, precursor del oseltamivir."],
+    ["comino","cuminum cyminum","digestivo\ncarminativo\nantioxidante","el comino es una especia digestiva que ayuda a aliviar la hinchazon y los gases."],
+    ["cilantro","coriandrum sativum","digestivo\nquelante de metales pesados\nantioxidante","tanto las hojas (cilantro) como las semillas (coriandro) tienen propiedades digestivas y desintoxicantes."],
+    ["hinojo","foeniculum vulgare","carminativo\ngalactagogo\nexpectorante","el hinojo es excelente para aliviar colicos, gases y estimular la produccion de leche materna."],
+    ["laurel","laurus nobilis","digestivo\ncarminativo\nexpectorante","las hojas de laurel facilitan la digestion y ayudan a aliviar los gases y la flatulencia."],
+    ["romero","rosmarinus officinalis","estimulante circulatorio\nantioxidante\nmejora la memoria","el romero es conocido por mejorar la circulacion y la concentracion, ademas de ser un potente antioxidante."],
+    ["tomillo","thymus vulgaris","antiseptico\nexpectorante\nantiespasmodico","el tomillo es un potente antiseptico natural, muy eficaz para tratar infecciones respiratorias y la tos."],
+    ["oregano","origanum vulgare","antibacteriano\nantifungico\nantioxidante","el oregano, especialmente su aceite, es un poderoso agente antimicrobiano natural."],
+    ["albahaca","ocimum basilicum","adaptogeno\nantiinflamatorio\nantibacteriano","la albahaca, especialmente la sagrada (tulsi), es un adaptogeno que ayuda al cuerpo a manejar el estres."],
+    ["menta","mentha piperita","carminativo\nantiespasmodico\nrefrescante","la menta es muy efectiva para aliviar problemas digestivos como el sindrome del intestino irritable."],
+    ["salvia","salvia officinalis","antisudoral\nantiinflamatorio\nmejora la memoria","la salvia es conocida por reducir la sudoracion excesiva y aliviar los sintomas de la menopausia."],
+    ["mejorana","origanum majorana","sedante\ndigestivo\nantiespasmodico","la mejorana tiene un efecto calmante sobre el sistema nervioso, ayudando a aliviar la ansiedad y el insomnio."],
+    ["eneldo","anethum graveolens","carminativo\nantiespasmodico\ngalactagogo","el eneldo es util para aliviar los colicos en los bebes y mejorar la digestion."],
+    ["cayena","capsicum annuum var. annuum","estimulante circulatorio\nanalgesico\ndigestivo","la cayena contiene capsaicina, que mejora la circulacion y tiene propiedades analgesicas."],
+    ["wasabi","eutrema japonicum","antimicrobiano\nantiinflamatorio\ndescongestionante","el wasabi real tiene potentes propiedades antimicrobianas y ayuda a descongestionar las vias respiratorias."],
+    ["galanga","alpinia galanga","antiinflamatorio\nantiemetico\nantitumoral","similar al jengibre, la galanga se usa para tratar problemas digestivos, inflamacion y nauseas."],
+    ["macis","myristica fragrans","carminativo\nestimulante\nafrodisiaco","el macis es la especia que recubre la nuez moscada, con un sabor mas delicado y propiedades similares."],
+    ["azafran de la india (curcuma)","curcuma longa","antiinflamatoria\nantioxidante\nhepatoprotectora","conocida comunmente como curcuma, es una de las especias con mayor poder antiinflamatorio."],
+    ["pimienta de jamaica","pimenta dioica","carminativo\nanalgesico\nantiseptico","combina los sabores de canela, nuez moscada y clavo. se usa para problemas digestivos."],
+    ["semillas de apio","apium graveolens","diuretico\nantiinflamatorio\ncarminativo","las semillas de apio son un diuretico natural y ayudan a aliviar la inflamacion asociada a la artritis y la gota."],
+    ["zumaque (sumac)","rhus coriaria","antioxidante\nantiinflamatorio\nhipoglucemiante","el zumaque tiene un sabor acido y es rico en antioxidantes. se investiga por sus beneficios en el control del azucar."],
+    ["regaliz","glycyrrhiza glabra","antiinflamatorio\nexpectorante\nadaptogeno","el regaliz es emoliente y antiinflamatorio, util para la tos, ulceras gastricas y fatiga adrenal."],
+    ["enebro","juniperus communis","diuretico\nantiseptico urinario\ncarminativo","las bayas de enebro son un potente diuretico y antiseptico, utilizadas para infecciones urinarias."],
+    ["asafetida","ferula assa-foetida","carminativo\nantiespasmodico\nexpectorante","con un olor muy fuerte, la asafetida es extremadamente eficaz para combatir los gases y la hinchazon abdominal."],
+    ["pimienta de sichuan","zanthoxylum piperitum","analgesico local\nestimulante circulatorio\ncarminativo","no es una pimienta real, pero produce una sensacion unica de hormigueo y adormecimiento. se usa para dolores y problemas digestivos."],
+    ["semillas de amapola","papaver somniferum","sedante suave\nanalgesico suave\nrico en minerales","las semillas de amapola tienen un efecto calmante y son ricas en calcio, magnesio y zinc."],
+    ["semillas de nigella (comino negro)","nigella sativa","inmunomodulador\nantihistaminico\nantiinflamatorio","conocido como \"la semilla bendita\", el comino negro tiene una amplia gama de beneficios, especialmente para el sistema inmunologico y las alergias."],
+    ["ajwain","trachyspermum ammi","carminativo\nantiespasmodico\nantiseptico","similar al tomillo en sabor, el ajwain es un remedio excepcional para la indigestion, los gases y los colicos."],
+    ["polvo de mango seco (amchur)","mangifera indica","acidulante\nrico en vitamina c\ndigestivo","el amchur se hace de mangos verdes secos y se usa para dar un sabor acido a los platos. ayuda en la digestion."],
+    ["semillas de granada secas (anardana)","punica granatum","antioxidante\ncardioprotector\nantiinflamatorio","las semillas de granada secas anaden un sabor agridulce y son ricas en antioxidantes que protegen el corazon."],
+    ["haba tonka","dipteryx odorata","aromatizante\nsedante\nanticoagulante","el haba tonka tiene un aroma complejo a vainilla, almendra y canela. debe usarse con mucha precaucion."],
+    ["pimienta larga","piper longum","bio-potenciador\nexpectorante\nrejuvenecedor","en ayurveda, la pimienta larga (pippali) es un potente rejuvenecedor y se usa para mejorar la absorcion de otros remedios."],
+    ["cubeba (pimienta de java)","piper cubeba","antiseptico urinario\nexpectorante\ncarminativo","la cubeba tiene un sabor picante y alcanforado. se ha utilizado tradicionalmente para infecciones urinarias y problemas respiratorios."],
+    ["aloe vera","aloe barbadensis miller","cicatrizante\nantiinflamatorio\nhidratante\nantiseptico\nlaxante","planta suculenta muy conocida por el gel de sus hojas, que tiene numerosas propiedades medicinales, especialmente para la piel."],
+    ["nopal","opuntia ficus-indica","hipoglucemiante\nhipolipemiante\nantiinflamatorio\nantioxidante\ndigestivo","cactus muy popular en la gastronomia mexicana, con importantes propiedades para regular el azucar y el colesterol en sangre."],
+    ["pitaya","hylocereus undatus","antioxidante\ndigestiva\nantiinflamatoria\nrefrescante","fruta exotica conocida como fruta del dragon, rica en antioxidantes y fibra, beneficiosa para la digestion y la salud en general."],
+    ["siempreviva","sempervivum tectorum","antiinflamatoria\ncicatrizante\nanalgesica\nantiseptica","planta suculenta que crece en forma de roseta, utilizada tradicionalmente para aliviar dolores y curar heridas."],
+    ["kalanchoe","kalanchoe pinnata","antiinflamatoria\nanalgesica\nantitumoral\nantiseptica","planta suculenta con hojas carnosas, utilizada en la medicina tradicional para tratar diversas dolencias, incluyendo tumores."],
+    ["agave","agave americana","antiinflamatoria\nantiseptica\ndigestiva\ndiuretica","planta suculenta de gran tamano, de la que se extrae el aguamiel y se elabora el pulque y el tequila. tiene propiedades medicinales."],
+    ["peyote","lophophora williamsii","alucinogeno\nanalgesico\nantibacteriano","cactus sin espinas conocido por sus propiedades alucinogenas debido a la mescalina. utilizado en ceremonias rituales."],
+    ["sabila","aloe vera","cicatrizante\nantiinflamatorio\nhidratante\nantiseptico\nlaxante","nombre comun para el aloe vera, planta suculenta muy conocida por el gel de sus hojas, que tiene numerosas propiedades medicinales, especialmente para la piel."],
+    ["organo","pachycereus marginatus","antiinflamatorio\nanalgesico\ncicatrizante","cactus columnar de gran tamano, utilizado tradicionalmente para aliviar dolores e inflamaciones."],
+    ["chumbera","opuntia ficus-indica","hipoglucemiante\nhipolipemiante\nantiinflamatorio\nantioxidante\ndigestivo","nombre comun para el nopal, cactus muy popular en la gastronomia mediterranea, con importantes propiedades para regular el azucar y el colesterol en sangre."],
+    ["echeveria","echeveria elegans","antiinflamatoria\ncicatrizante\nrefrescante","planta suculenta ornamental con hojas carnosas en forma de roseta. se le atribuyen propiedades antiinflamatorias y cicatrizantes."],
+    ["sedum","sedum acre","cicatrizante\nantiinflamatorio\nanalgesico","planta suculenta rastrera con pequenas hojas carnosas. se utiliza para tratar heridas y quemaduras leves."],
+    ["yucca","yucca filamentosa","antiinflamatoria\nanalgesica\nantioxidante","planta suculenta con hojas en forma de espada y una alta concentracion de saponinas, que le confieren propiedades antiinflamatorias."],
+    ["san pedro","echinopsis pachanoi","alucinogeno\nanalgesico\nantibacteriano","cactus columnar con propiedades alucinogenas similares al peyote, utilizado en la medicina tradicional andina."],
+    ["fenestraria","fenestraria rhopalophylla","hidratante\nrefrescante","planta suculenta con hojas translucidas que parecen ventanas. se utiliza para hidratar y refrescar la piel."],
+    ["lithops","lithops spp.","hidratante\nrefrescante","plantas suculentas conocidas como 'piedras vivientes' por su apariencia. se les atribuyen propiedades hidratantes."],
+    ["gasteria","gasteria spp.","antiinflamatoria\ncicatrizante","planta suculenta con hojas gruesas y moteadas. se utiliza de forma similar al aloe vera para tratar problemas de piel."],
+    ["haworthia","haworthia spp.","antiinflamatoria\ncicatrizante","planta suculenta pequena con hojas en roseta, a menudo con bandas o manchas blancas. se utiliza para tratar heridas y quemaduras."],
+    ["crassula","crassula ovata","antiinflamatoria\nantiseptica","planta suculenta conocida como 'arbol de jade'. se utiliza en la medicina tradicional para tratar verrugas y otras afecciones de la piel."],
+    ["senecio","senecio rowleyanus","antiinflamatoria\nanalgesica","planta suculenta colgante con hojas en forma de perlas. se utiliza para aliviar dolores e inflamaciones."],
+    ["euphorbia","euphorbia tirucalli","antiviral\nantitumoral\nanalgesica","planta suculenta con tallos cilindricos y un latex blanco y toxico. se investigan sus propiedades antitumorales."],
+    ["stapelia","stapelia gigantea","antiinflamatoria\nanalgesica","planta suculenta con flores grandes y malolientes. se utiliza para aliviar dolores e inflamaciones."],
+    ["hoodia","hoodia gordonii","anorexigena\nsupresora del apetito","planta suculenta originaria de sudafrica, conocida por su capacidad para suprimir el apetito."],
+    ["caralluma","caralluma fimbriata","anorexigena\nsupresora del apetito\nenergizante","planta suculenta utilizada en la india para suprimir el apetito y aumentar la resistencia."],
+    ["opuntia streptacantha","opuntia streptacantha","antiinflamatoria\nanalgesica\ndigestiva","especie de nopal utilizada en la medicina tradicional mexicana para tratar problemas digestivos y dolores."],
+    ["ginseng","panax ginseng","estimulante del sistema nervioso central\nmejora el rendimiento fisico y mental\nreduce la fatiga\nfortalece el sistema inmunologico","planta perenne cuya raiz se ha utilizado durante siglos en la medicina tradicional china para mejorar la energia y la vitalidad."],
+    ["ashwagandha","withania somnifera","reduce el estres y la ansiedad\nmejora la funcion cognitiva\naumenta la fuerza muscular\npropiedades antiinflamatorias","hierba fundamental en la medicina ayurvedica, conocida por sus propiedades restauradoras y rejuvenecedoras."],
+    ["rhodiola","rhodiola rosea","combate la fatiga\nmejora el estado de animo\naumenta la resistencia al estres\nmejora la funcion cognitiva","planta que crece en regiones frias y montanosas de europa y asia, utilizada para aumentar la resistencia fisica y mental."],
+    ["eleuterococo","eleutherococcus senticosus","aumenta la resistencia fisica\nmejora la funcion inmunologica\ncombate la fatiga\nmejora la concentracion","conocido como ginseng siberiano, es un arbusto lenoso que se utiliza para mejorar la resistencia y el bienestar general."],
+    ["schisandra","schisandra chinensis","protege el higado\nmejora la resistencia y el rendimiento\nreduce el estres\npropiedades antioxidantes","planta trepadora lenosa cuyas bayas se utilizan en la medicina tradicional china por sus multiples beneficios para la salud."],
+    ["albahaca sagrada (tulsi)","ocimum tenuiflorum","reduce el estres y la ansiedad\napoya el sistema inmunologico\npropiedades antiinflamatorias\nmejora la salud respiratoria","considerada una planta sagrada en la india, se utiliza en la medicina ayurvedica para promover la longevidad y el bienestar."],
+    ["reishi","ganoderma lucidum","fortalece el sistema inmunologico\nreduce el estres\nmejora la calidad del sueno\npropiedades antiinflamatorias","hongo conocido como el \"hongo de la inmortalidad\" en la medicina tradicional china, valorado por sus efectos sobre el sistema inmunologico y la longevidad."],
+    ["cordyceps","cordyceps sinensis","aumenta la energia y la resistencia\nmejora la funcion respiratoria\nfortalece el sistema inmunologico\nmejora la funcion renal","hongo parasito que crece en larvas de insectos, utilizado en la medicina tradicional china para mejorar la energia, la resistencia y la funcion pulmonar."],
+    ["maca","lepidium meyenii","aumenta la energia y la resistencia\nmejora la libido y la fertilidad\nequilibra las hormonas\nmejora el estado de animo","planta originaria de los andes peruanos, cultivada por su raiz nutritiva que se utiliza para aumentar la energia, la fertilidad y la resistencia."],
+    ["astragalo","astragalus membranaceus","fortalece el sistema inmunologico\npropiedades antiinflamatorias\nprotege el sistema cardiovascular\naumenta la energia","planta fundamental en la medicina tradicional china, utilizada para fortalecer el sistema inmunologico y proteger el cuerpo contra diversas enfermedades."],
+    ["curcuma","curcuma longa","potente antiinflamatorio\nantioxidante\nmejora la funcion cerebral\nalivia el dolor articular","especia de color amarillo brillante, ampliamente utilizada en la cocina y la medicina ayurvedica por sus potentes propiedades antiinflamatorias."],
+    ["jengibre","zingiber officinale","alivia las nauseas y el mareo\nantiinflamatorio\nmejora la digestion\nalivia el dolor muscular","planta con un rizoma aromatico y picante, utilizada en todo el mundo como especia y como remedio para problemas digestivos y nauseas."],
+    ["bacopa","bacopa monnieri","mejora la memoria y la funcion cognitiva\nreduce la ansiedad\npropiedades neuroprotectoras\nmejora el estado de animo","planta utilizada en la medicina ayurvedica para mejorar la memoria, el aprendizaje y la concentracion, y para reducir la ansiedad."],
+    ["gotu kola","centella asiatica","mejora la funcion cognitiva\npromueve la cicatrizacion de heridas\nmejora la circulacion\nreduce la ansiedad","planta perenne utilizada en la medicina tradicional de asia para mejorar la funcion cerebral, promover la salud de la piel y mejorar la circulacion."],
+    ["maitake","grifola frondosa","fortalece el sistema inmunologico\nregula el azucar en sangre\nreduce la presion arterial\npropiedades antitumorales","hongo comestible que crece en la base de los arboles, valorado en japon por sus propiedades medicinales, especialmente para el sistema inmunologico."],
+    ["moringa","moringa oleifera","rica en nutrientes y antioxidantes\nantiinflamatorio\nreduce el azucar en sangre\nprotege el higado","arbol de crecimiento rapido originario del sur de asia, conocido como el \"arbol milagroso\" por el alto valor nutritivo de sus hojas."],
+    ["amla","phyllanthus emblica","muy rica en vitamina c y antioxidantes\nfortalece el sistema inmunologico\nmejora la salud del cabello y la piel\nmejora la digestion","fruto de un arbol originario de la india, es una de las fuentes mas ricas de vitamina c y un pilar en la medicina ayurvedica."],
+    ["una de gato","uncaria tomentosa","fortalece el sistema inmunologico\nantiinflamatorio\nalivia el dolor de la artritis\npropiedades antivirales","liana trepadora de la selva amazonica, utilizada tradicionalmente para tratar una amplia gama de dolencias, especialmente las relacionadas con la inflamacion y el sistema inmune."],
+    ["codonopsis","codonopsis pilosula","tonifica el qi y la sangre\nfortalece el sistema inmunologico\nmejora la digestion\ncombate la fatiga","conocida como el \"ginseng de los pobres\", es una raiz utilizada en la medicina tradicional china para tonificar la energia vital (qi) y fortalecer el cuerpo."],
+    ["damiana","turnera diffusa","afrodisiaco\nrelajante nervioso\ntonico para el sistema nervioso\nmejora el estado de animo","arbusto aromatico nativo de mexico, america central y el caribe, tradicionalmente utilizado como afrodisiaco y tonico para el sistema nervioso."],
+    ["madreselva","lonicera japonica","antiviral\nantibacterial\nantiinflamatorio\nalivia el dolor de garganta","planta trepadora con flores fragantes, utilizada en la medicina tradicional china para tratar infecciones, fiebre y dolor de garganta."],
+    ["musgo de irlanda","chondrus crispus","demulcente (alivia la irritacion de las mucosas)\nexpectorante\nnutritivo\napoya la salud digestiva","alga roja que se encuentra en las costas rocosas del atlantico norte, rica en carragenina, que le confiere propiedades demulcentes y espesantes."],
+    ["pasiflora","passiflora incarnata","sedante y ansiolitico\ninductor del sueno\nalivia los espasmos musculares\nreduce la ansiedad","planta trepadora nativa de america, conocida por sus flores exoticas y sus propiedades calmantes sobre el sistema nervioso, utilizada para tratar el insomnio y la ansiedad."],
+    ["regaliz","glycyrrhiza glabra","antiinflamatorio\nexpectorante\napoya la salud suprarrenal\nalivia las ulceras gastricas","planta cuya raiz dulce se ha utilizado durante milenios tanto en la confiteria como en la medicina para tratar problemas digestivos, respiratorios y suprarrenales."],
+    ["albahaca","ocimum basilicum","antioxidante\nantiinflamatorio\nreduce el estres\nmejora la digestion","hierba aromatica popular en la cocina mediterranea, tambien valorada por sus propiedades medicinales para aliviar el estres y mejorar la digestion."],
+    ["centella asiatica","centella asiatica","mejora la memoria y la cognicion\npromueve la cicatrizacion\nmejora la circulacion venosa\nreduce la ansiedad","tambien conocida como gotu kola, es una hierba perenne utilizada en la medicina tradicional para mejorar la funcion cerebral y la salud de la piel."],
+    ["atractylodes","atractylodes macrocephala","tonifica el bazo y el qi\nelimina la humedad\nfortalece el sistema digestivo\ndiuretico","rizoma utilizado en la medicina tradicional china para fortalecer la funcion digestiva, tonificar la energia y eliminar el exceso de humedad del cuerpo."],
+    ["bala","sida cordifolia","tonico general\naumenta la fuerza y la resistencia\nantiinflamatorio\napoya la salud del sistema nervioso","hierba importante en ayurveda, cuyo nombre significa \"fuerza\". se utiliza como tonico para aumentar la energia, la resistencia y la masa muscular."],
+    ["brahmi","bacopa monnieri","mejora la memoria y la cognicion\nreduce el estres y la ansiedad\nneuroprotector\npromueve un sueno reparador","reconocida hierba ayurvedica para el cerebro, utilizada tradicionalmente para mejorar todas las facetas de la funcion mental y calmar el sistema nervioso."],
+    ["guduchi","tinospora cordifolia","inmunomodulador potente\ndesintoxicante\nreduce la fiebre\nantiinflamatorio","planta trepadora muy venerada en ayurveda, conocida como \"amrita\" o nectar de la inmortalidad, por su capacidad para limpiar, rejuvenecer y fortalecer todo el organismo."],
+    ["chaga","inonotus obliquus","potente antioxidante\nfortalece el sistema inmunologico\nantiinflamatorio\napoya la salud gastrointestinal","hongo que crece en los abedules de climas frios, con aspecto de carbon quemado. es muy apreciado por su altisimo contenido de antioxidantes y sus propiedades para reforzar el sistema inmune."],
+    ["ginseng americano","panax quinquefolius","reduce el estres\nmejora la memoria\napoya el sistema inmunologico\nayuda a regular el azucar en sangre","variedad de ginseng nativa de america del norte. a diferencia del ginseng asiatico, se considera mas calmante y menos estimulante, ideal para combatir el estres sin sobreexcitar."],
+    ["shatavari","asparagus racemosus","tonico reproductor femenino\napoya la lactancia\ncalma el tracto digestivo\ninmunomodulador","considerada la principal hierba rejuvenecedora para las mujeres en ayurveda. apoya la salud reproductiva en todas las etapas de la vida, desde la menstruacion hasta la menopausia."],
+    ["tribulus","tribulus terrestris","aumenta la libido\nmejora el rendimiento deportivo\napoya la salud del tracto urinario\ntonico general","planta que crece en climas secos, utilizada en la medicina tradicional china y ayurvedica para aumentar la vitalidad, la libido y el rendimiento fisico."],
+    ["ginkgo biloba","ginkgo biloba","mejora la circulacion cerebral\npotencia la memoria y la concentracion\nantioxidante\nalivia los sintomas del vertigo","uno de los arboles mas antiguos del mundo, sus hojas se utilizan para mejorar la circulacion sanguinea, especialmente en el cerebro, mejorando asi la memoria y la funcion cognitiva."],
+  ],
+  trigramas: {
+    "\nad": "7k,2i,4n,2k",
+    "\naf": "m,5,83,13,8,o,1s,d,3j,n",
+    "\nal": "4j,a,k,9,32,2x,1s,57,1,6,3,2,1,b",
+    "\nam": "44",
+    "\nan": "1,1,1,1,1,2,1,2,1,1,1,2,2,1,1,1,2,1,1,3,1,3,1,2,1,1,1,1,1,3,1,1,2,1,2,2,1,3,1,1,1,1,1,2,1,2,1,1,1,1,2,1,1,1,1,2,2,4,6,1,2,1,1,6,1,3,1,1,1,5,1,1,1,2,1,2,1,1,1,1,1,1,1,1,1,1,1,2,1,2,3,1,1,3,1,4,2,1,1,5,1,1,4,2,1,2,1,1,4,1,1,1,1,1,2,1,1,3,3,1,1,1,3,1,1,1,6,2,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,2,1,1,1,1,1,1,1,2,1,1,1,2,1,1,1,1,1,2,1,1,3,2,2,1,1,1,1,1,1,1,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,1,1,2,2,1,1,1,3,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,3,2,1,1,2,1,1,2,1,2,1,1,1,1,3,1,1,1,2,2,3,1,1,1,2,1,1,2,2,1,1,1,1,1,1,1,1,2,1,1,1,1,1,4,1,1,6,2,1,1,2,3,1,1,r,1,1,2,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,3,1,1,1,2,1,1,1,2,2,3,3,1,1,1,1,1,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,2,1,1,1,1,1,1,1,1,1,1,2,1,1,2,1,1,2,1,1,1,1,4,2,1,1,2,2,1,1,3,1,3,1,1,1,1,1,2,1,1,1,1,1,1,1,2,2,1,3,3,1,1,1,2,1,2,1,1,1,1,1,1,3,1,1,1,1,1,1,1,1,1,1,2,1,1,1,2,1,2,1,1,2,1,3,1,1,1,1,1,1,1,1,1,2,1,1,5,1,1,1,3,b,1,4,2,3,4,3,2,1,4",
+    "\nap": "2a,38,5g,1,4,5,3j,3o,g,2,4,3,1,1,1",
+    "\nar": "ar,3p",
+    "\nas": "14,o,d,14,p,b,f,6,4,3,8,5,2,5,2,1,2,3,x,5,d,k,2,1h,22,4,1l,e,a,2,2,1,4,7,1,2,5,1,b,3,8,1,f,u",
+    "\nau": "ib,1,7,i",
+    "\nay": "cp,6g",
+    "\nba": "1c,1,1o,m,1e,37,1,d,f,1,c,e,3f",
+    "\nbe": "ce,3",
+    "\nbr": "30",
+    "\nca": "0,1,3,1,1,3,b,1,9,5,c,b,2,m,2,3,9,m,p,q,8,l,19,1,a,3,6,5,4,9,w,1,i,r,1,b,14,27,2,d,8,16,3,8,2,1,1,7,3,4,5,c,3,f,3,2,5,3,1m",
+    "\nci": "i,5,12,7,j,5,23,3,1,b,9,6,c,4,4,u,1,j,8,o,z,8,5,10,p,10,1,i,3,1m,3,31,5,2,6,1",
+    "\nco": "11,h,1t,s,12,1,7,1n,c,6,7,9,9,1u,2a,4,2,g,8,1,1,2,1,53,f",
+    "\nde": "16,m,6,p,j,6,9,1l,o,10,6,b,o,1,2,4,13,1g,g,6,3,1d,h,d,2,1,3e,21",
+    "\ndi": "0,3,5,3,2,1,1,1,2,6,1,4,l,1,1,h,3,5,1,1,1,3,2,3,1,8,c,7,3,3,p,j,8,2,2,1,1,3,1,b,1,c,1,5,6,8,1,5,5,a,2,7,4,a,4,1,4,1,1,1,3,4,1,1,1,1,1,1,4,2,5,b,1,1,8,1,4,1,2,2,2,5,7,2,1j,6,s,1,f,3,2,4,3,9,2,2,2,5,6,2,1,1,6,1,1,1,3,3,2,1,1,1,1,7,1,2,4,1,a,1,8,a,5,d,2,b,d,2,f,6,1,3,4,f,r",
+    "\nel": "j0",
+    "\nem": "t,1,e,2,2,4,2,11,q,14,4,c,17,2,13,4,3,2,1,g,1b,m,5,1j",
+    "\nen": "46,24,1,3,17,5,k,b,4i,8,1,6,1a,h,11,1y",
+    "\neq": "ii",
+    "\nes": "x,11,6,1y,n,10,1r,3,e,1,l,1i,37,2h,j,8,3,1,k,8",
+    "\neu": "7g",
+    "\nex": "2,7,5,2,5,4,1,7,c,1,c,1,8,t,c,8,g,3,8,9,2,7,4,g,i,5,2,j,9,1,5,1,8,o,8,2,1,1,a,p,9,2,6,n,2r,w,b,a,5,1g,2,k,4,5,3,1,2,f,2,8,1,1b,2",
+    "\nfa": "8a,4,40,3,1,3",
+    "\nfe": "13,4,2k,d,8,1,t,h,7,1w,1m,p",
+    "\nfi": "1j,87,1v,3i,1,1",
+    "\nfo": "1q,9i,1a,5s,7,9,2,8,4",
+    "\nfu": "8l,2l,1e,3,7,9,8,2",
+    "\nga": "e,2o,3n,l,16,16,6b,1,t,9",
+    "\nhe": "h,2o,1m,1e,h,w,3,4,t,2,y,k,d,4,46,1y,i",
+    "\nhi": "w,9,e,1,5,2,d,5,i,1,a,1,6,6,d,2,r,7,n,6,i,h,2,7,t,p,3,k,r,1,r,27,c,f,2,f,1,5,6,o,4,7,1,6,6,3,k,b,q,d,1,6,2",
+    "\nin": "29,17,12,q,3,v,1,7,8,x,8,1,4,5,c,2,1,1,6,c,1,13,1,7,2,2,1,8,4,5,1y,u,b,c,7,4,2,47,a",
+    "\nla": "1d,u,9,a,1,g,14,2d,2e,4e,c,c,4,2,3b,7",
+    "\nli": "8c,a",
+    "\nma": "f4,2",
+    "\nme": "1z,9,5u,l,1i,11,18,4,1,1,3,2,1,4,9,4,4,3i,5,1c,1,1,1,1,1,1,1,1,2,1,1,1,3,2,1,5,1,6,2",
+    "\nmi": "ar",
+    "\nna": "2e",
+    "\nne": "3i,33,g,1g,8,u,r,l,4i,3p",
+    "\nno": "a6",
+    "\nnu": "2n,g,17,1,3f,k,2,a,1c,11,6,e,18,7,2,n,1n,1,1,4,j,3,2,2r",
+    "\npo": "ge,2u",
+    "\npr": "a8,m,1h,8,3,4,13,v,n,w,24,3,1,1,3,3,1,1,1,2,8,3",
+    "\npu": "14,12,34,2k",
+    "\nqu": "6,au,5q",
+    "\nre": "0,4,6,11,9,4,1,3,e,7,1b,6,u,27,9,2,2,3,2,9,4,b,5,3,5,3,1,7,2,2,g,b,2,3,e,3,b,n,6,7,5,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,2,1,1,3,2,1,2,3,2,2,2,4,1,1,2,8,1,a,a,4,g,i,8,3,e,a,9,c,m,4,8,4,1,a,4,2,6,1,1,1,4,3,2,1,3,1",
+    "\nri": "7,12,3n,i,2q,1,3,2,1,1,2,7,2d,9,2,1,4,1y,41,3",
+    "\nru": "1l,5t,l",
+    "\nsa": "80,3,6,2r,1,1,2,3,14,j,3,3,1,2,2,1,2,1,1,2,1,1,24,3,1,o",
+    "\nse": "13,1b,4,1,6,j,3,3,1e,b,i,33,6,i,2,b,2,3,2u,1e,u,1k,12",
+    "\nsi": "7y,n",
+    "\nsu": "37,1s,5,2k,1d,5c,3u,1",
+    "\nte": "j,83",
+    "\nti": "fj",
+    "\nto": "q,o,3,1d,18,13,4,j,j,3,m,j,6,2,1,5,j,7,2,4,j,6,4l,j,47,e",
+    "\ntr": "5m",
+    "\nva": "3m,16,1p,4,78,27",
+    "\nve": "c,15,1,1m,r,k,q,f,1s,72,c,1d",
+    "\nvi": "4j,4c,c,1j,6,q,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,n,n,5,6,4,4,2,6,4,2,1,c,3,1,5,2,2",
+    "\nvo": "58",
+    "\nvu": "57,69",
+    " \"a": "1f,55,c5,e",
+    " \"b": "ai",
+    " \"f": "j1",
+    " \"g": "8g,ac",
+    " \"h": "11,91,8,m,7k",
+    " \"l": "8k,7l,19",
+    " 'a": "4s,4n,8,8g",
+    " 'b": "5x",
+    " 'c": "5l,7i",
+    " 'e": "99",
+    " 'f": "bj",
+    " 'h": "a0",
+    " 'o": "ct",
+    " 'p": "i0",
+    " 'r": "5q,6v,q",
+    " 'u": "5d",
+    " 'v": "cy",
+    " (a": "2r,2n,48,e,57,29,1,1e",
+    " (b": "53,a,47,4",
+    " (c": "2m,au,6,1i,11,l,f,9",
+    " (d": "2f,k,2e",
+    " (e": "14,m,3p,1,4,1,2x,6,2s",
+    " (f": "7g,24,48,h,1y",
+    " (g": "54,4q,6f",
+    " (h": "99,4h,5,e",
+    " (i": "dz",
+    " (l": "2s,2a,4x,5l",
+    " (m": "2p,5q,a,z,7,34,10",
+    " (p": "4t,r,74,2,6,5,1,i,1f,12,1i,1",
+    " (q": "8g,ac",
+    " (r": "55,2c,8,k,4,q,48,d",
+    " (s": "4t,3,3t,42,4,5,4,u,3a",
+    " (t": "32,88,5m,1j",
+    " (u": "4x,a,1,9",
+    " (v": "2l,2a,36,16,1j,2z,5,5,1,1,3,1,1,4,2,l",
+    " (y": "9n",
+    " / ": "fp,k",
+    " a\n": "83",
+    " a ": "5,1,3,a,2,4,7,7,2,6,1,a,3,2,f,2,1,2,4,1,3,7,4,1,8,1,1,g,b,3,m,a,1,2,j,2,8,6,z,4,b,u,2,2,1,c,b,6,k,3,2,3,2,f,a,c,b,1,4,1,2,w,7,2,3,2,1,2,2,7,1,3,2,2,3,1,4,1,5,2,3,1,6,4,1,a,1,d,1,1,2,8,1,d,2,1,5,1,1,4,5,b,1,3,7,3,4,3,3,5,9,2,9,b,13",
+    " a)": "81,5j,f",
+    " a,": "cc,2",
+    " a.": "dz",
+    " ab": "e,14,z,1r,2h,n,2o,7,52,j,m,x,8,1l",
+    " ac": "16,2,2,4,b,2,i,4,6,7,f,1,2,5,b,d,8,2,p,f,b,f,i,7,8,5,1,p,f,r,8,2,5,g,b,c,5,4,h,1,1,1,1,3,2,1,12,8,2,3,4,2,5,3,5,e,7,6,i,7,9,2,5,7,1,e,a,d,7,d,8,g",
+    " ad": "i,18,f,2,e,14,16,45,z,g,8,66,3,d,3",
+    " af": "2,q,9,1v,a,6,9,2,4,g,g,e,6,h,4,2,9,g,4,y,3,w,2,f,r,11,22,3,x,2g,1s,q",
+    " ag": "24,i,27,t,3,r,26,6,4,q,n,a,s,1,2,1,2,1,1,1,x,5,1,1,j,1t,2,1t,m,9",
+    " ah": "ar,b",
+    " aj": "1m,4,r,ey",
+    " al": "4,4,7,6,2,4,4,2,2,g,6,1,1,2,8,6,5,3,2,7,1,6,1,2,3,1,1,3,5,1,2,3,4,3,2,2,8,5,5,2,1,1,1,i,2,k,4,4,9,4,1,3,6,4,6,5,5,4,5,2,3,v,1,5,3,7,2,1,1,1,e,3,4,1,6,a,1,4,2,2,1,c,2,6,4,g,1,8,3,3,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,4,1,c,2,3,3,c,1,6,4,m,1,5,4,a,a,4,1,7,b,1,1,2,1,1,1,d,5,1,4,3,2,1,2,1,4,1,1,1,1,3,4,7,1,3,2,4,3,1,1,4,1,3,3,2,6,d,9,6",
+    " am": "z,j,m,a,3,o,10,8,9,5,4,h,3,5,6,1,e,1,1,1,1,1,1,8,3,e,c,b,2,3,4,2,s,8,2,e,c,4,7,1f,1f,2,1,1,d,1b,11,h,h,r,1,1,1,a,u,7,2,3,9",
+    " an": "1,1,1,7,1,1,1,3,1,1,2,2,1,2,4,d,3,a,1,5,1,1,2,2,1,7,2,2,6,2,2,1,4,1,7,6,3,4,1,1,9,7,b,1,d,1,4,1,6,3,3,1,4,1,7,2,8,3,c,3,4,4,1,2,1,2,1,1,5,3,3,1,4,1,4,4,2,5,3,2,4,4,a,1,4,5,1,1,1,f,2,3,1,1,4,2,2,7,5,3,2,9,2,1,3,4,2,5,2,3,5,1,1,3,1,2,h,7,1,q,1,2,2,1,1,1,4,1,1,1,4,8,1,2,4,2,2,1,1,4,3,2,2,1,1,3,5,5,2,6,2,1,1,1,5,4,1,2,1,3,3,1,1,8,1,6,1,1,1,a,3,2,1,2,5,1,3,1,1,3,3,3,1,5,1,1,4,2,1,3,3,1,1,7,6,8,2,1,7,6,1,2,1,1,2,1,1,2,1,1,1,1,1,2,3,3,3,2,4",
+    " ap": "c,i,o,a,h,1,4,2,8,d,3,6,1,3v,5,1,3,2,h,8,4,h,u,a,5,1,b,3,5,5,2,4,1,b,1b,1x,1,b,d,c,6,4,v,m,t,7,1,e,i,2",
+    " aq": "1s,e,37,1r,2j,1s,3k",
+    " ar": "0,1,j,6,d,2,6,h,8,2,1,2,3,9,2,2,2,8,1,3,4,2,5,1,4,3,2,4,1,5,3,4,4,1,3,9,7,1,2,2,3,1,2,1,3,1,8,1,4,1,2,3,2,1,1,1,3,2,1,2,1,2,3,1,1,2,1,6,7,1,1,4,2,1,4,3,3,2,4,3,c,4,3,2,3,i,3,2,1,2,3,h,l,1e,1,6,v,5,7,1,4,3,1,1,2,3,1,1,1,2,8,i,c,i,5,5,1,j,3,g,3,1,8,m,b,v,7,1,3,2,1,2,5,a",
+    " as": "o,a,p,n,5,8,4,3,5,5,5,4,d,7,r,b,t,r,2,i,3a,8,x,w,7,s,f,2,4,1,4,3,2,1,2,4,1,5,5,7,t,1h,4,11,b,2,a,5,1,3",
+    " at": "8b,1u,k,4,1o,7,57,5,v",
+    " au": "28,2,1o,o,11,7,3,1,w,a,m,1,b,e,1,6,b,6,11,c,27,j,1q,11,9,b,1q,4,6,j,6",
+    " av": "3v,9o,i,1f",
+    " ay": "6,3,5,7,4,7,7,2,7,a,m,5,q,2,g,e,m,1c,o,1,p,g,e,2,2,1j,k,a,c,j,w,9,3,2,n,1,4,1,7,3,7,5,a,1,e,1,a,1,d,2,6,1,1,4,h,3,7,3,4,3,3,5,9,3,s,4,5,2,4,b,1,1,3,1",
+    " az": "j,d,9,2a,d,t,1,s,2n,8,5,s,5,6,7,g,e,1z,o,4,1,s,e,1,e,c,7,k,e,5,1,q,e,8,u,1,g",
+    " b)": "aq",
+    " b,": "f7",
+    " b1": "b1",
+    " b6": "db",
+    " ba": "0,t,a,1,l,h,7,l,3,5,l,2,d,7,i,2,6,1,5,4,8,i,f,m,x,d,1,q,4,2,5,3d,i,1,2,z,9,3,4,2,4,1,14,s,e,b,h,c,a,a,2",
+    " be": "1a,q,5,h,e,1,8,2,6,1w,c,14,k,o,2,o,2,2,1f,f,3,8,r,w,9,5,6,d,1g,8,2,3,2,q,6,p,8,6,9,r",
+    " bi": "1z,2,1a,7,l,1m,1c,n,j,1m,5,19,1l,b,5a,2,t",
+    " bl": "3u,y,m,2r,d,8,4,2,o,5,n,11,16,5,f,z,9,3r,3",
+    " bo": "27,14,f,d,2e,9,3y,1,5,l,1j,x,2c",
+    " br": "6j,w,1c,a,d,f,1g,14,p,2h,31",
+    " bu": "i,5,1q,w,1b,n,u,22,3,6,2,2c,2i,2,3,f,1o,5",
+    " c\n": "d,4y,5,2o,4,3,2z,4,8,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,n,h,1r,2b",
+    " c ": "3y,l,s,3,18,5q,1,1,3,2,e,2,2,5,1,4,g,3,6,4,2,4,5,1,7,4,6,3t",
+    " c)": "2l,6m,4i,5,6,4,1,1,4,2,l,a",
+    " c,": "1v,3l,6z,5,5,5,f,g,x,4,r",
+    " c.": "2l,5n,3e,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,8,w,o,3,2,5,n,1",
+    " ca": "4,f,2,2,1,9,4,2,2,9,5,6,3,2,8,4,4,1,9,1,9,e,2,j,1,g,2,5,5,6,3,5,5,1,2,7,1,2,1,2,6,6,3,8,3,2,2,2,b,1,2,4,3,5,4,3,1,1,3,9,3,2,5,1,5,2,2,2,4,3,1,2,1,1,5,3,2,8,1,2,1,2,6,5,2,1,2,2,1,5,1,1,2,2,2,1,3,4,3,1,a,4,6,1,5,1,4,1,2,c,f,5,1,3,1,4,1,1,2,6,1,2,1,3,1,1,2,1,1,1,3,6,1,6,6,2,1,2,6,2,2,a,2,6,1,2,5,2,1,1,1,1,1,2,4,7,5,2,1,7,1,2,1,1,1,1,2,3,2,4,e,2,5,7,5,7,5,1,1,b,9,3,7,3,2,1,6,1,1,1",
+    " ce": "p,1a,4,5,e,i,e,6,1n,p,11,c,e,y,11,h,o,1j,9,3,d,b,n,8,13,3,11,1b,j,a,3,6,6,3,6",
+    " ch": "1o,13,2,6,c,p,6,8,y,o,e,7,v,3,1,v,b,j,a,1,n,4,k,1o,9,h,z,h,6,6,8,v,26,4,2,1,2,9,2,6,7",
+    " ci": "y,5,5,3,5,a,2,7,9,4,9,d,6,6,8,1,3,9,a,k,2,2,9,f,g,9,2,d,6,a,y,c,8,11,7,q,6,3,w,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,5,4,d,a,2,i,y,16,c,d,1,9,8,b,j,a,i,c,9",
+    " cl": "1k,3a,10,1i,l,10,b,m,14,5f,t,1y,3",
+    " co": "0,1,1,1,4,1,2,1,5,2,4,2,5,1,1,2,1,3,2,1,2,1,4,4,1,6,2,1,2,1,5,1,1,1,1,2,1,1,1,1,2,2,3,1,1,1,1,1,1,1,1,1,3,1,1,2,1,5,1,1,4,2,4,1,1,2,1,2,3,2,1,1,4,1,1,4,2,2,4,2,2,3,3,5,1,1,2,1,4,1,1,3,1,3,2,1,1,1,2,1,1,1,2,1,1,1,1,2,1,2,1,1,1,2,1,1,1,1,3,1,1,1,1,2,1,1,1,2,1,1,2,1,1,1,2,1,1,2,1,1,1,2,1,1,1,2,1,1,1,1,2,3,1,1,1,1,1,1,2,1,1,3,3,2,2,1,4,1,1,2,1,2,1,2,1,2,2,1,2,1,2,1,1,1,1,1,1,1,1,1,2,1,1,1,2,2,2,2,2,1,2,1,2,1,1,1,1,1,1,2,2,1,1,1,3,1,1,2,2,3,1,1,1,1,2,1,1,1,1,1,1,2,1,1,1,1,1,1,1,2,1,1,1,2,2,4,1,1,1,1,2,1,1,3,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,2,1,1,1,3,2,1,1,1,1,1,1,1,2,1,1,1,1,4,2,2,1,1,1,2,1,2,1,1,1,2,1,1,1,1,1,1,1,1,3,2,2,2,2,1,2,1,1,1,1,1,1,6,2,1,1,3,1,1,1,3,1,1,1,1,1,1,1,1,1,1,1,1,2,1,2,2,2,2,2,1,1,1,1,3,2,1,4,2,1,1,2,4,1,2,1,3,1,3,2,1,3,1,2,1,3,1,1,2,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,4,1,1,3,3,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,2,1,1,1,1,3",
+    " cr": "7,a,p,18,2m,3,3,c,4,2h,5,e,n,c,l,1,g,i,5,2,2,1,2,17,4,a,2,2,x,5,1y,1i,o,5,7,1,6,9,3",
+    " cu": "14,g,5,f,6,2,7,d,8,1,9,l,6,8,e,3,2,1,2,3,1,1,5,2,5,5,2,2,5,5,1,5,6,c,2,3,2,2,3,2,3,4,1,4,2,1,2,2,1,1,2,1,1,2,2,1,2,3,6,2,6,9,1,l,1,3,a,g,8,h,6,1g,6,q,2,2,x,r,18,d,9,9,f,4,m,4,4,1,9,5,3,1",
+    " cy": "f,z,7x,6h,x",
+    " d ": "aq",
+    " da": "2t,6x,h,z,18,x,21,24",
+    " de": "4,2,1,2,9,1,1,2,3,2,2,1,2,4,1,1,2,2,1,3,1,3,2,2,1,3,2,1,1,1,1,1,1,2,2,1,2,1,1,1,1,1,1,1,2,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,2,1,1,1,1,1,1,1,1,3,2,1,1,2,1,1,1,1,1,1,2,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,4,1,1,1,1,4,1,2,1,3,1,1,1,1,1,2,1,1,2,1,1,3,1,2,3,1,1,1,1,1,1,1,1,1,2,2,1,1,1,1,1,1,1,1,3,1,1,1,1,1,1,1,3,4,1,1,4,2,1,2,1,1,1,2,1,1,1,1,1,1,2,1,1,1,2,1,1,2,1,3,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,2,1,1,3,1,1,1,1,4,1,3,1,2,2,3,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,3,1,1,1,1,1,1,1,1,1,1,2,1,1,2,1,1,2,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,2,2,1,1,2,1,2,1,1,2,2,1,1,1,2,2,1,4,1,1,2,1,1,1,1,4,2,2,1,1,3,1,2,1,1,2,1,1,1,2,1,4,1,1,1,2,1,1,1,1,1,2,2,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,1,1,1,4,2,1,1,1,4,1,4,2,1,1,1,1,2,2,1,1,2,1,1,1,1,1,2,1,2,1,1,1,2,2,4,2,1,3,1,1,1,2,4,1,1,2,2,1,1,1,1,1,1,1,1,1,1,3,1,1,1,1,1,1,1,1,1",
+    " di": "0,4,1,1,1,1,1,3,1,2,9,2,1,3,3,1,2,2,1,4,4,2,4,5,3,4,5,4,3,2,3,1,1,b,1,3,a,1,3,3,3,a,8,6,4,3,3,1,2,1,3,8,9,8,d,6,4,9,2,1,n,1,3,2,7,1,1,5,1,9,4,4,2,2,1,6,1,1,4,4,1,4,7,a,2,t,5,1,a,t,2,2,b,s,1,1,1,1,3,c,7,1,2,1,1,1,1,2,1,2,3,1,2,2,6,1,2,1,1,1,1,5,3,1,4,9,6,1,9,8,9,8,1,1,1,1,1,3,5,5,7,1,1,6,3,1,2,5,3,3,3,1,3,2,4,7,2,k,a,2,5,2,1,2,2,1,2,5,1",
+    " do": "4,g,d,7,b,6,i,b,1,6,p,a,c,20,a,x,1f,l,6,6,5,a,5,l,w,19,2,5,h,2,3,5,o,1e,1,f,8,6,3,q,c,1,4,b,2,3,b,1,6,3",
+    " dr": "c,3t,13,c,o,6a,55",
+    " du": "2a,j,5,1d,3a,g,2,2,7,a,2l,14,3,4,1,1,1,6,1,1,1,1,2,2,7,3,1,1,5,g,1,2,16,9,w,20,n",
+    " e ": "1w,13,7h,3l,1d,2,2d,b,2",
+    " e)": "e1",
+    " e,": "ce,2y",
+    " ec": "2o,i,1h,20,1x,t",
+    " ed": "2v,1,t,6e,c,f,1m",
+    " ef": "1,6,4,1,1,6,3,9,9,k,2,m,6,c,2,5,6,3,q,4,6,6,1,f,4,4,h,7,2,z,f,3,2,1f,2,3,3,4,a,5,2,c,f,9,a,2l,2,5,2,9,1,6,m,5,s,e,5,3,b,3,6,3,2,c,2,13",
+    " ej": "2c",
+    " el": "6,5,1,8,1,1,1,2,1,5,1,9,9,1,5,4,1,4,6,3,1,3,2,2,3,1,1,4,2,6,4,2,1,8,5,3,3,3,1,8,1,2,3,3,1,1,b,2,5,6,1,5,5,b,1,1,4,2,4,2,4,1,2,1,7,8,1,3,1,3,1,5,5,1,1,3,6,2,1,4,4,2,2,3,5,2,2,1,1,5,2,6,1,1,1,2,3,2,4,1,1,2,1,1,1,1,2,5,1,2,2,3,1,2,1,2,2,1,1,5,3,2,2,1,3,2,1,1,1,1,1,2,5,1,1,6,2,1,3,3,5,e,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,2,1,1,2,1,2,1,2,1,1,2,1,4,4,1,1,4,2,1,1,1,1,1,3,5,2,4,1,3,5,3,2,6,2,1,2,1,1,b,7,6,2,1,3,3,5,3,3,1,1,1,1,2,3,4,1,3,b,1,2,9,6,1,2,4,1,4,2,2,1,c,1,2,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,2,2,2,2,1,1,1,1,1,1",
+    " em": "24,2,1,y,2,1,13,2b,2w,1t,1p,e,m,39,1h",
+    " en": "7,3,3,1,2,1,2,d,1,1,b,1,3,6,2,3,1,2,1,3,4,5,1,3,1,2,1,1,1,1,1,1,2,1,1,3,1,3,1,1,a,1,2,1,6,1,9,2,2,1,2,2,1,2,6,1,5,1,5,5,1,1,1,1,5,5,5,1,2,2,1,1,1,2,2,1,1,1,1,3,2,2,4,1,4,9,1,1,1,3,2,2,1,2,2,2,2,1,3,1,3,4,1,1,1,7,3,1,6,1,4,5,1,2,1,1,3,1,1,1,1,2,1,1,1,1,3,1,3,7,6,4,2,3,1,3,2,2,1,2,8,2,2,6,1,2,1,3,2,4,1,1,2,4,2,2,2,2,1,1,1,1,1,4,1,1,1,1,1,3,1,2,1,1,2,q,1,1,1,2,1,1,2,1,1,1,4,2,1,3,1,3,1,1,2,1,1,1,1,1,1,1,1,1,1,3,1,2,2,1,1,1,1,1,2,1,1,3,2,1,1,1,1,1,1,1,2,5,2,1,4,1,2,1,1,3,1,2,2,1,1,2,1,1,1,1,1,1,2,2,1,1,2,1,1,1,1,2,1,4,5,1,1,1,1,2,5,1,3,6,2,g,8,2,3,2,1,1,5,1,1,1,2,3,1,2,1,4,1,1,4,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,2,2,1,2,1,1,1,1,2,1,1,1,1,1",
+    " ep": "27,7a",
+    " eq": "9i",
+    " er": "9z,2,5,g",
+    " es": "1,4,1,a,4,2,2,3,3,7,3,5,1,1,3,9,1,1,1,1,1,1,1,2,1,1,1,1,1,2,2,1,2,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,4,1,1,1,1,1,1,1,1,1,1,1,2,3,8,2,b,1,1,2,5,1,4,3,1,3,2,2,1,1,7,7,2,3,1,1,1,1,1,2,3,4,1,1,1,j,1,1,1,8,2,6,2,1,1,2,2,1,1,4,1,1,2,2,2,2,2,2,2,1,2,7,1,1,3,2,1,1,1,1,1,1,1,2,2,5,2,1,1,9,1,1,3,1,1,1,9,3,1,1,1,1,1,1,2,3,1,3,1,1,1,1,1,1,1,1,1,1,1,2,2,1,1,2,3,1,1,1,1,1,1,1,1,1,1,2,1,5,3,2,c,4,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,4,2,1,2,1,1,6,1,1,2,1,2,2,1,2,2,1,1,1,1,1,2,3,1,8,3,1,2,4,2,1,1,2,2,3,6,6,3,1,2,1,3,1,4,1,1,1,1,1,1,1,1,1,2,1,1,1,2,1,1,2,1,2,2,1,1,1,1,1,2,4,1,3,1,2,1,2,1,4,2,6,1,5,e,1,1,1,1,1,2,3,1,2,2,1,1,1,2,1,2,1,3,2,1,3",
+    " et": "j6",
+    " eu": "11,q,1o,s,11,4t,19,72",
+    " ex": "5,4,f,5,6,2,a,1,n,4,l,w,9,3,3,5,5,2,4,4,8,c,4,1,8,1,9,3,7,1,1,6,1,6,1,k,7,15,3,6,4,e,7,5,7,1,2,3,1,3,5,a,b,g,b,3,x,4,1,1,1,b,2,3,6,6,f,7,b,13,3,4,6,2,5,4,8,7,4,8,7,d,4,8,3,16,4",
+    " fa": "r,r,7,n,c,1,4,9,6,3,9,9,6,4,j,d,1b,1,u,d,l,b,5,4,5,6,x,1,1,4,4,25,2,9,s,d,7,i,j,1u,h,11,2,1,f,a",
+    " fe": "32,28,c,24,1g,2f,1g,2x,k,20,o",
+    " fi": "13,c,r,9,c,7,t,l,1,w,q,14,1,x,1,3,3,6,9,i,4,3,3,1f,e,1,c,i,d,2,4,1,2,2,3,1,6,2,1,2,4,2,1,2,3,7,f,6,3,3,6,h,5,z,1f,1,7,3,b,2,2,1,h,9,4",
+    " fl": "1e,a,7,c,17,18,h,1,6,2,3,c,2,6,g,9,4,7,n,l,2,4,c,1,1,1,4,1,1,1,2,4,1,1,2,2,1,2,a,2,9,2,1a,1,4,1,1,1,2,2s,1v,k,1e,o,2",
+    " fo": "w,u,1c,35,o,p,c,c,8,6,m,3,g,5,6,2,7,2,6,m,d,z,8,7,2,1,j,c,3,9,6,d,d,7,p,k,16,7,2,4,3,f,9,8,3",
+    " fr": "1n,i,1t,h,3,6,8,2,9,1,3,1,2,2,7,6,9,f,5,26,2,o,m,1e,4,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,3,2,6,1,1,1,d,2,2,1,7,2,1,1,1,3,6,5,9,3,6,1,1,c,i,h,o,j,p,c,6,a",
+    " fu": "3,3a,16,s,l,9,1,7,9,s,5,6,2,8,8,5,2,3,4,4,v,4,b,7,4,9,7,9,1,2,6,15,6,d,5,4,5,2,2,6,g,c,6,s,2,3,1,3,2,h,7,f,n,10,1,1,4,2,1,2,1,3,9,1,1,1,6",
+    " ga": "8,6,1,1,j,2,1,a,a,2,z,1,b,8,1,i,9,a,p,18,1,h,1,1,f,5,19,a,z,8,t,c,1m,w,l,1j,3,1,1,9,j,1,2,1,b,6,2,3,1,7,8,x,3,3,7",
+    " ge": "3x,5,21,b,1f,1p,z,n,1,44,2c,2,5,l,o,6",
+    " gi": "29,2o,8,19,15,z,5,x,5s,2u,4,3,s",
+    " gl": "1r,19,c,26,c,p,b,r,o,8,4,2l,1n,22,2e,1o",
+    " gn": "5k",
+    " go": "34,15,18,2r,c,2,h,4g,16,11,1h,10,s",
+    " gr": "8,1d,9,7,5,1,7,1,1,3,m,6,1,o,3,c,o,1,f,f,k,k,8,1,3,9,7,c,q,1,6,1,b,3,b,1,4,12,1l,4,1,5,5,3,7,c,3,c,c,6,f,7,3,2,4,1,1,4,3,3,7,2,2,2,6,r,7,a,9,3,8,5",
+    " gu": "2t,1n,7z,9,d,39",
+    " ha": "1u,9,3,1,1,2,3,1,2,1,1,2,4,5,5,6,2,14,2,6,s,c,e,14,t,18,3,8,7,1,7,1,5,8,7,2,1,n,4,6,11,e,9,1,2,6,q,8,m,10,6,e,z,2,2,q,n,9",
+    " he": "1g,d,7,4,9,9,7,q,3,j,i,d,5,2,a,8,8,b,d,b,m,7,i,13,8,5,w,4,i,7,4,16,b,d,14,6,g,16,1,1h,8,6,l",
+    " hi": "e,1b,4,2,j,3,7,9,6,8,8,k,e,v,k,5,o,7,4,12,g,1s,7,l,7,1b,3,4,7,j,6,12,k,i,4,1,6,4,j,2,k,o,1,e,b,a,3,4",
+    " ho": "a,1c,d,c,5,3,6,7,7,1,b,d,3,8,d,4,1,3,5,1,2,2,2,7,a,3,2,1,7,4,w,7,3,m,4,n,5,2,d,6,9,1,3,a,4,8,2,4,2,2,2,1,1,3,1,2,1,3,1,1,b,2,16,j,a,9,9,2,3,c,2,k,1x,2,k,9,4,3,3,1,1,2,2,1,2,e,7,j",
+    " hu": "23,q,33,4,2f,9,m,11,x,7,1,1,11,l,5x",
+    " hy": "d8,2r",
+    " ic": "26",
+    " id": "2,14,4a,2u,k,w,3r,9,q,n,2,40",
+    " ig": "3x",
+    " il": "3x,bn",
+    " im": "33,1s,h,33,y,6,5z,3,21,8,17",
+    " in": "b,a,a,4,9,1,1,4,6,6,2,4,6,2,5,5,2,4,1,4,5,5,1,1,2,2,9,2,3,7,b,t,1,5,9,1,3,3,3,2,a,3,6,1,2,2,3,3,2,3,2,4,1,1,5,1,1,8,1,1,3,8,2,1,5,4,5,1,4,3,7,e,3,2,1,4,2,2,1,2,5,1,9,5,7,2,3,1,1,3,1,3,3,1,1,2,2,3,6,6,i,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,2,2,2,1,3,2,4,1,2,2,4,1,1,3,2,4,3,1,1,5,1,6,8,2,2,1,2,3,1,1,3,8,5,7,a,7,2,9,1,5,2,9,8,3,2,4,2,2,1,2,4,1,1,4,5,4,b,1,1,2,2,3,2,1,1,2,5,2,1,1,2,2,7,1,1",
+    " ir": "11,1m,k,12,1d,29,17,9,1u,5s,1y",
+    " is": "7d",
+    " ja": "16,g,23,j,a,8,g,1,41,1s,6,2,1u,2,2,s,34,4,e,j,l,6",
+    " je": "12,6g,r,a,83,h",
+    " ju": "1t,11,42,1c,29,1x,5,1,c,1,b,9,g,b",
+    " k)": "f4",
+    " ka": "2i,9k,3,13,r",
+    " ki": "cp,10",
+    " ko": "2r,d,fj,c",
+    " ku": "bt,1d",
+    " la": "5,1,3,1,1,1,2,1,3,3,2,4,1,4,2,3,2,1,1,3,2,1,1,1,1,1,1,1,1,1,1,1,1,2,1,2,3,2,1,2,1,2,1,1,1,1,1,1,1,1,2,3,1,2,1,1,1,1,1,1,5,2,1,1,1,3,1,1,1,1,1,1,1,1,1,1,2,2,1,1,1,1,1,1,1,1,1,2,1,3,1,1,1,2,1,1,2,1,1,1,1,1,1,1,1,1,1,2,1,1,3,1,2,1,1,1,3,1,1,1,1,1,1,1,1,1,1,2,4,2,1,5,3,2,1,2,2,2,2,3,1,1,1,1,1,1,1,2,4,3,1,1,1,2,1,1,1,1,1,1,1,1,5,2,3,2,1,1,1,1,1,1,1,2,1,1,1,3,1,1,1,1,2,1,1,1,1,2,1,2,1,1,1,1,1,1,1,1,2,1,1,3,1,2,1,1,1,1,1,1,2,1,1,2,2,1,1,2,1,1,1,1,1,2,1,1,1,2,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,2,1,1,1,1,1,1,1,1,1,3,1,2,2,2,3,1,1,1,2,3,3,1,3,1,4,1,1,1,1,1,1,3,2,2,u,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,2,1,1,1,1,2,1,1,1,1,1,1,1,2,1,3,1,1,1,1,2,1,1,1,2,1,2,1,2,1,1,2,3,2,1,1,2,1,1,1,2,2,1,1,2,1,1,1,1,3,1,1,1,2,1,1,2,2,1,1,2,2,1,1,1,1,1,1,1,1,1,2,1,1,2,1,2,1,1,1,1,1,1,4,1,1,2,1,1,1,2,1,2,3,1,2,5,1,1,1,1,1,2,2,1,1,1,1,1,1,1,2,2,2,3,1,1,3,2,1,1,2,1,1,1,2,4,1,4,2,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1",
+    " le": "5,r,12,t,1,7,r,f,11,v,7,g,8,4,a,a,5,m,2,1t,j,4,d,3,12,b,2,2,1u,1d,1,1,j,9,14,1,1,3,d,1,h",
+    " li": "c,9,i,8,1e,v,4,a,l,g,r,a,1b,f,e,21,a,6,a,h,2,8,4,c,1,4,c,1,o,3,g,5,7,15,1,f,e,2g,l,4",
+    " ll": "1b,i,b,w,4,29,c,c,3n,s,22,v",
+    " lo": "c,2,1,1,1,2,5,4,9,2,1,7,3,2,2,4,5,8,8,1,2,3,2,2,3,4,5,2,4,9,7,3,8,2,7,7,2,d,1,u,3,3,7,7,2,3,i,2,5,6,5,5,3,5,9,8,5,9,3,8,1,4,5,1,6,4,1,1,2,1,3,3,7,2,2,3,2,4,3,1,6,4,6,3,3,1,1k,3,b,4,2,8,c,5,5,9,b,6,e,5,1,1,1,d,c,1,1,1,3,4,7,3,6,3,2,3,6,2,5,1,5,1,3,1,3,w,1,2,2,4,4,4,8,4",
+    " lu": "1j,1f,50,1s,9,3,n,4,20,2p,4,2u",
+    " ly": "5h",
+    " ma": "b,7,3,b,4,2,7,9,4,2,1,2,3,1,e,2,3,6,1,5,6,2,4,1,4,b,i,2,2,8,8,b,g,8,4,p,o,8,2,5,q,7,3,n,2,1,2,3,3,6,2,1,9,1,1,1,3,3,4,e,6,2,5,4,4,2,1,2,d,o,1,1,1,8,7,4,1,3,5,2,1,3,9,5,7,1,7,4,1,2,7,1,2,7,a,9,2,3,1,1,2,1,5,4,1,4,7,1,7,1,9,5,3,5,1,8,3,d,9,4,f,5,a,1,4,3",
+    " me": "5,1,4,5,k,h,1,2,1,1,3,1,2,2,1,3,1,1,2,3,1,3,2,1,4,1,1,1,1,1,4,5,4,4,1,1,3,2,8,2,d,3,2,7,5,d,4,5,3,1,3,1,2,4,2,3,3,1,1,1,4,1,1,3,2,1,2,1,2,7,3,3,2,1,1,1,4,1,9,1,4,2,6,1,3,2,1,5,1,1,6,5,8,5,3,1,4,1,1,a,a,3,4,1,2,1,4,4,4,2,1,2,2,3,2,2,1,6,2,2,8,2,3,1,4,a,1,1,m,a,b,4,2,b,2,3,5,d,3,f,6,4,7,5,3,a,l,b,1,2,2,1,3,2,3,3,6,3,4,1,1,1,1,i,2,1,3,1,1,1,2,4,4,1,6,1,1,1,1,1,1,1,1,1,1,1,2,1,1,2,2,1,1,3,1,1,1,2,3,1,1,1",
+    " mi": "1g,9,p,2,1,1y,8,1,10,5,a,7,a,b,6,5,2f,2,9,j,c,6,5,6,3,1z,r,11,2,9,6,2,3,1p,8,14,8",
+    " mo": "r,3,s,2,n,s,r,f,c,7,24,12,15,6,g,j,a,3d,k,f,2,5,2,1,1,b,4,3,2,r,3,l,2,v,b,a,g",
+    " mt": "8g,1,1,7",
+    " mu": "7,2,6,5,d,f,1,3,4,1,2,7,4,2,1,6,1,2,6,1,9,e,3,2,1,1,5,1,1,2,m,5,2,3,9,7,4,4,2,1,1,7,3,2,1,9,1,3,2,2,i,2,2,2,2,8,6,1,1,4,1,2,2,5,6,3,1,2,c,1,3,4,3,6,1,2,8,1,3,8,4,7,3,5,2,6,7,f,4,1,9,6,7,y,1,4,1,1,1,3,5,1,1,1,9,2,2,1,5,5,7,2,4,3,2,1,2,3,c,e,m,2,i,3,3,4,2,b,3,e,7,3,1,6,2,h,3,7,a,1,5,2,1,2,2",
+    " my": "25,4c,7c,l",
+    " na": "h,1,2,c,9,1,3,15,1b,c,h,1,3,1i,7,i,a,1,b,3,a,4,3,k,8,7,9,q,12,j,3,2,y,2,6,5,g,4,3,v,l,i,13,8,1,8,4,1e,8,3,9",
+    " ne": "o,2,5,2,6,8,3b,6,4,j,d,n,d,h,a,8,6,a,h,5,1,3,1,1,1,8,a,4,3,5,c,n,k,1b,1h,d,g,f,s,9,7,e,f,w,c,7,3,5,1,1",
+    " ni": "g,3,e,1a,18,d,m,7,b,8,p,p,r,i,j,3,j,18,a,4,4,z,1y,m,8,5,1,f,r,g,9,5,v",
+    " no": "9,1w,1n,7,q,2,z,1x,5,18,n,q,d,1,25,x,6,a,5,20,e,12,f,m,6,4",
+    " nu": "7,1r,3,9,17,p,5,l,f,11,8,g,11,9,1,3,3,1,u,1k,5,d,4,1,12,2,4,2,a,t,d,16,4,1,3,5,c,7,3,2,o,2,f,7,q,7",
+    " o ": "2h,e,6,4,1,1s,6,1,9,o,2j,1,i,4,3,2,1j,1l,1,b,1,b,2,5,2,4o,11",
+    " ob": "56,2,u,1e,2r,w,2i,5j",
+    " oc": "1e,1g,59,18,1q,1d,r,2,2,1,4,14,o,c,3,1",
+    " od": "y,83,8h",
+    " of": "1,9,8,6,4,2,6,8,2,a,a,4,m,5,c,8,1,u,l,1f,5,h,1,9,f,2,5,3,6,p,7,3,c,d,3,5,2,g,j,m,58,7,5,1n",
+    " oj": "1e,7v,2,67",
+    " ol": "k,r,1s,c,2,16,1j,4,a,9,l,u,4d,b,1w,v,q,y,1e",
+    " om": "1a,8o,5a,7",
+    " op": "5l",
+    " or": "p,1c,7,2,1,7,8,1,8,c,2,1,2,q,10,4,2,1,f,2,q,a,a,j,5,17,d,d,4,13,h,n,35,16,k,10,c,b,7,1,d",
+    " os": "17,1m,3f,46,o,6,1c,f,3,a,1h,k,8,13",
+    " ot": "8,k,z,1,s,1d,1e,7,b,e,o,s,1w,1c,2t,z,q,4,22,k",
+    " ov": "g7,1w",
+    " ox": "am,y,z,29",
+    " pa": "2,3,3,3,3,1,1,4,3,1,4,5,2,1,1,1,4,1,1,1,1,1,3,3,1,2,1,2,2,7,4,3,3,1,1,1,1,3,5,1,2,1,3,4,1,1,2,1,1,1,1,1,2,2,1,1,1,1,1,1,2,1,1,1,1,1,1,2,1,1,2,1,1,1,1,1,3,3,1,3,2,1,1,2,1,1,1,2,1,3,2,1,4,1,1,1,1,2,1,1,1,1,2,1,1,2,2,4,1,2,1,1,2,1,1,2,2,1,1,2,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,2,1,2,1,1,2,2,1,1,1,1,1,2,1,1,1,1,1,1,1,2,1,1,1,1,2,1,2,1,1,1,4,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,6,5,1,1,1,1,1,3,1,1,2,2,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,3,1,1,1,1,1,1,2,1,1,1,1,1,3,1,2,1,1,1,3,2,3,8,1,1,1,1,1,1,1,6,3,2,2,1,q,1,2,1,1,1,9,1,4,1,1,1,1,1,3,1,1,2,1,4,1,3,1,2,1,3,3,2,1,2,3,5,5,1,2,1,1,1,5,1,1,1,2,1,1,3,1,1,2,2,1,2,5,1,1,1,1,2,5,1,2,1,1,2,1,1,1,3,1,1,1,6,1,1,1,6,3,1,2,3,2,3,3,3,3,3,3,3,1,1,1,2,1,1,3,1,1,1,1,1,1,3,1,1,2,2,1,2,1,1,1,2,1,1,1,1,2,1,1,1,2,1,1,2,1,1,1,3,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1",
+    " pe": "6,l,d,2,6,9,1,3,3,1,a,5,1,2,5,9,1,4,2,7,2,g,s,b,1,d,2,2,1,1,2,4,1,5,3,19,5,5,2,1,5,r,2,b,4,7,c,3,2,8,2,4,6,1,1,5,e,5,7,7,2,b,17,1,1,1,4,4,3,3,7,5,2,4,4,b,1,8,9,f,1,5,8,4,9,16,m,k,2,4,2,6,8,5,c",
+    " ph": "d5",
+    " pi": "4,j,b,a,2,3,1i,2,9,a,5,2,5,3,6,5,5,c,4,8,1,1,c,7,b,5,3,1,h,2,1,r,2,4,3,b,2,2,1,3,6,3,3,1,7,2,e,6,3,2,9,7,c,f,b,e,1,1,x,1,4,a,1,2,5,9,b,c,d,e,c,b,8,4,s,6,d,f,7,1,1,4,3,7,2,2,i,2,3,2,7",
+    " pl": "1b,d,1,2,1,1,1,3,1,2,2,4,3,2,1,1,3,1,1,1,1,1,1,2,1,2,1,5,3,1,1,1,4,1,2,3m,4,4,1k,g,9,6,2,1,3,3,4,5,w,1k,b,c,t,z,1p,v,c,n",
+    " po": "2,d,7,8,1,3,e,6,3,3,2,2,1,1,1,1,4,1,1,2,1,1,4,1,3,4,1,4,1,3,3,2,2,8,1,2,1,1,1,2,3,4,3,5,7,1,4,2,6,2,4,7,5,1,1,2,3,a,6,1,6,3,4,1,5,1,2,3,2,7,2,1,8,1,4,1,1,3,4,2,3,4,2,d,2,4,2,1,1,1,1,7,3,9,1,1,1,2,4,5,2,2,5,3,1,9,1,4,1,1,1,1,2,2,1,1,1,1,1,1,1,1,2,1,1,1,1,1,2,2,2,1,2,5,1,4,1,b,2,3,3,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,4,4,1,5,4,2,1,1,4,2,1,2,1,1,2,2,1,2,2,1,2,1,2,1,4,7,5,8,4,1,6,4,1,2,3,4,7,3,j,5,1,8,1,1,2,5,3,2,6,1,1,3,4,3,3,2,9,2,1,5,1,2,6,7,4,3,2,2,2,4,1,3,4,2,5,1",
+    " pr": "0,2,1,1,4,2,d,1,7,1,2,4,3,1,1,7,4,6,1,1,3,1,1,1,1,1,3,1,2,1,1,1,3,1,2,1,2,7,1,4,7,1,1,2,1,1,1,1,1,1,3,1,1,1,1,3,2,1,2,1,1,2,2,1,1,1,1,5,1,4,5,1,9,1,1,2,2,2,3,1,3,3,7,1,1,2,4,2,1,6,4,3,1,1,1,2,4,3,1,3,1,1,2,1,3,6,1,2,2,1,3,4,1,2,3,4,3,3,6,4,3,2,2,1,2,2,2,2,4,2,5,2,3,2,1,2,4,2,2,3,1,2,1,4,4,6,7,1,4,4,6,2,1,7,1,1,4,4,6,1,7,2,1,1,1,1,1,3,q,1,1,1,1,1,5,1,1,1,2,2,1,4,1,5,2,2,2,5,2,6,2,5,1,2,1,1,3,1,2,1,1,1,2,1,2,1,3,1,4,2,1,1,1,7,1,1,1,1,6,2,1,1,1,2,3,2,2,9,3,1,1,1,3,3,4,2,1,2,1,2,4,2,2,1,6,4,1,1,1,2,6,5,1,2,1,1,4,1,1,2,1,2,1,2,1,4,4,2,4,4,1,1,2,1,7,1,1,1,6,2",
+    " ps": "2s,e,5e,t,23,3j,18",
+    " pu": "x,8,z,2,3,1,2,4,a,b,11,4,u,k,1l,2,g,1,s,9,f,p,3,2f,8,1,2,1,1,2,2,2,1,5,6,2,1,1,2c,7,8,7,c,16,r",
+    " py": "e8",
+    " qi": "8g,ac,8",
+    " qu": "4,2,h,2,1,3,c,j,1,1,1,2,1,5,1,1,1,3,1,2,1,2,3,3,3,7,1,a,1,1,m,3,4,7,b,g,8,6,1,7,1,4,1,3,3,4,3,1,f,8,8,b,10,2,3,1b,1,j,6,3,7,3,2,6,7,5,1,3,1,2,1,3,r,1,1,1,4,3,4,1,1,1,4,2,3,1,1,2,1,1,3,1,c,t,b,d,7,a,6,1,7,7,1,1,1,4,1,a,7,5,3,d,4,3,2,2,4,1,2,3,a,1,4,1,6,7,9,1,2",
+    " r.": "f5",
+    " ra": "14,14,a,1x,f,5,a,4,c,8,2,o,q,7,1,1,2,1,1,2,3,3,2,4,2,1,9,2,3,2,1,w,1r,v,e,d,5,h,1g,2x,e,8,7,3,5,9",
+    " re": "0,2,2,5,1,6,3,2,7,4,9,2,1,1,4,1,2,1,3,1,2,1,1,2,3,2,1,5,3,2,1,3,9,1,4,4,1,4,2,7,5,2,1,8,1,3,1,2,d,1,2,6,5,1,4,3,1,1,2,4,1,1,1,c,1,1,3,3,5,1,1,1,3,2,3,5,5,4,1,7,2,2,1,2,1,a,2,3,1,1,4,2,2,2,1,3,2,1,4,2,2,1,4,4,4,3,1,2,5,2,1,1,1,2,2,1,1,1,1,1,1,3,1,3,2,1,2,1,3,2,3,1,1,4,1,2,1,2,1,2,7,1,3,2,8,3,1,8,7,17,4,3,2,1,1,4,7,1,a,1,1,2,1,1,2,1,2,5,1,6,7,3,1,1,1,1,2,1,c,1,b,8,5,b,4,6,1,9,3,6,6,4,4,2,5,3,3,4,1,2,8,5,9,2,1,1,1,1,1,2,1,3,1,5,6,4,1,1,1,1,1,1",
+    " rh": "14,47,1y,l,6t,3c",
+    " ri": "1a,l,4,3,6,4,9,5,i,i,4,4,k,6,c,b,2,1,2,6,3,4,9,9,1,1,4,5,2,6,1,5,2,4,a,2,c,1,2,3,1,7,1,x,j,9,t,2,4,4,f,1,u,1,1,1,2,1,1,2,3,4,3,3,1,3,1,3,1,1,2,5,1,a,1,1,1,2,1,1,3,1,1,1,2,1,1,1,3,4,8,1,3,1,3,2,1,2,1,1,2,5,3,2,1,1,2,1,1,1,3,1,b,1,1,2,1,4,1,b,o,5,4,6,4,u,5,5",
+    " ro": "q,23,4,d,g,6,z,d,1,9,8,i,f,z,g,r,2,26,1,2,1,1p,a,7,j,c,6,c,3,f,13,b,9,v,7,7,2,8,j",
+    " ru": "2j,4,5c,5v,c,l",
+    " sa": "6,d,3,3,6,1,2,2,m,4,3,6,1,3,4,5,1,4,9,5,3,7,4,4,2,2,8,3,a,8,3,5,h,2,8,a,f,6,2,a,1,1,5,6,3,7,8,6,4,3,8,3,1,2,1,1,1,1,1,2,1,2,1,4,1,1,1,b,1,b,5,3,2,f,1,6,1,b,3,4,2,3,1,4,6,1,4,3,4,3,x,3,1,2,3,1,1,1,2,1,1,1,1,5,4,1,1,1,2,1,d,5,8,3,6,3,1,3,1,2,3,8,6,5,2,2,1,2,1,1,1,1,1,3,1,1,7,4,1,1,2,1,2,3,4,2,3,1,3,5,6,2,6,2,2,6,1,1,1,3,2,1,7,3,h,1,8,1,1,1,2,3,2,2,2,3,1,1,1,1",
+    " sc": "d,52,2l",
+    " se": "b,7,b,9,5,3,e,1,1,1,8,4,3,1,2,6,1,2,3,1,4,1,1,1,1,2,1,1,1,1,1,1,2,2,1,1,6,1,7,2,1,3,1,1,1,1,2,2,4,1,3,1,3,2,3,1,5,8,2,9,1,2,1,a,2,5,1,3,1,1,1,1,1,1,1,5,9,7,2,3,7,2,2,1,3,2,4,3,2,2,1,1,2,1,1,2,2,1,2,2,7,2,3,1,1,5,1,3,1,1,7,2,3,5,1,1,1,1,1,2,4,1,1,1,5,2,4,4,1,i,2,1,1,1,3,4,i,5,2,t,4,7,2,3,2,2,2,1,1,2,2,1,1,1,2,1,2,1,1,4,1,5,5,6,3,2,1,1,3,1,1,1,1,2,1,6,5,4,3,2,9,1,1,1,1,1,4,2,5,1,1,1,1,2,1,2,1,1,1,1,1,1,1,1,6,5,1,2,7,3,a,3,1,1,4,1,1,2,1,2,1,6,5,1,3,1,1,1,1,1,1,1,4,3,1,1,3,9,4,2,4,4,2,1",
+    " sh": "8p,v,j,6l",
+    " si": "q,5,a,l,6,9,1,1,3,4,6,8,1,5,y,e,j,5,i,6,4,2,1,1,6,7,9,d,1,1,e,a,1,b,1,5,4,5,6,6,1,1,5,1,e,b,3,4,1,6,1,2,2,3,3,1,2,1,1,2,6,3,2,2,h,6,2,5,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,5,4,3,3,2,5,4,2,2,5,2,1,3,3,2,3,2,1,1,4,1,6,3,4,6,5,4,4,4,h,2,g,2,7,7,c,1,1,5,8,2,d,7,3,9,3,2,1,1,2,5,2,1,1,1,3,4,1,1,2,1,3",
+    " sn": "d3,36",
+    " so": "m,7,2,9,k,h,3,6,1,g,2,b,2,d,b,8,5,5,1,3,1,9,2,7,1,3,4,4,1,e,1,4,3,r,1,x,h,4,c,6,3,4,5,5,3,9,3,5,h,1,d,2,3,o,1k,8,7,1,7,5,4,3,7,2,2,g,4,2,1,9,1,1,1,2,1,1,1,1,1,1,1,2,1,3,6,4,1,1,4,7,7,e,8,3,3,4,u,5,g,9",
+    " sp": "5,6b,j,4,3w,2,3,2z,h,3g,1,1",
+    " sq": "d9",
+    " st": "cx,5c",
+    " su": "b,2,a,6,5,5,7,2,1,6,3,2,1,2,1,7,5,1,3,2,1,3,4,5,1,2,1,2,3,3,2,2,1,2,1,1,2,1,1,2,3,4,3,8,3,1,6,5,2,4,4,1,4,3,2,1,3,4,3,1,1,1,1,2,3,1,3,4,5,6,4,1,2,3,2,2,4,1,2,1,4,2,2,1,5,1,7,2,1,2,3,1,1,1,l,1,1,4,5,2,1,2,8,1,1,1,4,1,1,1,2,1,2,1,1,1,3,1,2,1,2,6,4,1,2,1,1,2,4,1,1,2,2,1,1,2,2,3,4,1,1,1,3,4,1,5,3,3,4,1,2,2,3,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,3,1,1,3,1,1,1,7,1,1,2,2,2,1,2,3,2,1,5,1,1,2,2,3,4,2,1,1,2,3,2,1,3,2,e,3,1,1,5,3,8,d,9,6,c,3,4,1,a,3,a,5,8,3,1,1,1,1,3,1,1,2,1,1,1,1,1,1,1,1,1,3,3,2,2,2,4,1,7,1,1,4,1,1,4",
+    " sw": "bz",
+    " sy": "1d,1u,g,4,2x,2e",
+    " ta": "e,q,f,9,8,1,2,1,1,b,1,3,3,4,9,2,2,m,1y,1,1q,2,d,e,16,i,1,g,5,6,2,2,2,9,u,g,3,5,1,5,a,6,2,c,8,b,6,4,1h,c,2,5,1c,3,c,s,1",
+    " te": "17,j,c,1r,8,1s,n,f,l,v,2,9,3,z,1,r,1,r,1,1,1q,3,7,3,v,m,2,2s,2,p,s",
+    " th": "1c,8g",
+    " ti": "c,7,8,z,3,4,8,5,9,b,7,2,6,k,3,1,r,8,e,8,5,7,m,m,14,n,4,3,7,3,2,1n,4,g,13,1,e,6,2,1,c,c,6,3,3,3,4,4,6,5,n,5,e,j,5,9,2,1,6,5,1,4,2,1,5,2,d",
+    " to": "6,i,2,2,1,o,1,3,a,c,a,8,w,1,1,f,6,t,5,2,2,5,3,1,7,2,2,4,9,7,b,f,5,2,1,2,a,5,b,b,1,l,7,2,2,2,8,3,3,1,1,1,5,y,7,d,6,y,5,c,2,2,g,3,1,h,e,19,9,q,f,6,3,n,g,6,1,1,7,1,1,1,3",
+    " tr": "5,n,7,1,n,1,1,c,1,1,3,1,1,b,3,7,2,4,1,2,2,1,1,3,3,7,2,1,1,3,1,1,1,2,5,1,1,2,3,5,6,4,1,4,1,2,5,1,4,1,c,1,4,2,3,4,1,3,4,3,1,2,5,1,3,1,4,3,2,4,1,7,1,2,7,2,3,1,1,1,1,1,5,3,1,7,a,1,2,3,1,b,5,3,1,4,2,2,4,a,8,9,1,1,1,i,2,8,5,1,b,r,1,1,2,2,6,2,2,4,3,4,2,4,4,1,2,2,6,3,5,8,5,3,2,1,5,1,1,1,2,1,1,3,4,e,f,6,1,7,1,2,4,6,d,9,h,4,1,4,3,2,1,2,1,1,6,1,4,2,1,2,4,4,1,1,1,2,1,2,1,2,1,3,1",
+    " tu": "6d,1v,1,1,1,1,1,8,1,v,13,z,66",
+    " u ": "1s,x",
+    " ug": "by",
+    " ul": "1f,1p,11,23,37,4d,3,k,2u,1o",
+    " um": "af",
+    " un": "b,1,1,5,c,a,5,2,b,2,1,1,4,4,3,1,3,1,5,1,1,1,2,1,1,1,1,1,1,2,1,1,1,1,9,1,1,2,2,1,2,1,c,2,4,8,4,1,4,1,3,1,1,1,2,1,1,1,2,2,2,2,3,1,4,1,1,1,6,1,1,2,4,2,4,1,2,1,1,2,1,1,2,1,3,2,2,1,1,1,1,2,4,4,5,2,1,1,1,4,2,2,4,1,2,2,3,1,h,5,3,2,1,1,2,1,1,2,3,2,1,1,1,1,5,1,2,2,1,1,6,1,5,1,5,3,2,2,2,1,1,2,1,2,1,1,5,1,1,5,3,7,3,1,1,1,1,2,2,1,3,3,6,4,2,1,1,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,4,3,1,1,1,1,1,5,8,1,3,2,1,2,1,1,7,6,1,3,1,5,1,3,3,1,1,2,4,3,2,3,4,1,6,2,1,3,2,2,1,1,1,3,6,2,1,1,4,1,1,1,3,5,1,2,1,2,1,1,1,1,1,1,1,1,1,1,3,a,8,8,2,6,5,1,1,7,3",
+    " ur": "19,j,d,6,29,a,1,3,5,1e,p,21,4c,a,e,e,3,5,a,27,a,1n",
+    " us": "t,5,4,2,3,c,4,h,d,2,1,1,1,5,d,2,m,7,i,b,5,2,7,1,1,1,1,3,2,2,3,7,4,1,2,3,r,2,9,1,9,1,4,a,2,1,n,6,7,1,9,1,3,1,2,5,1,5,1,5,3,3,4,e,k,2,1,c,4,1,1j,d,b,6,b,2,f,3,1,3,2,1,8,h,6,3,5,1,1,y,3,6,4,2,1",
+    " ut": "a,1,6,j,9,g,5,2,7,4,2,1,5,3,5,2,3,1,1,1,2,1,1,1,4,5,5,1,3,2,4,5,1,1,3,2,2,3,3,1,3,1,1,4,5,2,2,2,8,4,g,1,2,b,4,1,2,1,2,2,1,2,1,3,1,2,2,2,1,1,4,1,1,1,1,2,4,2,2,1,2,2,5,1,1,1,1,1,1,1,1,2,3,1,1,1,1,4,c,3,1,3,2,b,8,8,r,2,6,4,1,l,16,4,7,5,2,2,2,2,9,5,6,7,8,5,1,4,2,2,7,1,1,1,p,f,7,j,1,2,3,e,9,1,a,4,1,2,2,3,2,1,2,1,1,1,2,2,1,1,2,1,1,1,2,1,1,1,1,1,1,4,1,1,1,2,1,2,1,1,1,5,1",
+    " uv": "4u,8u,g,6,j,17",
+    " va": "m,1f,5,8,f,8,6,a,2,3,2n,b,9,a,5,y,2,1i,1,4,8,b,7,b,i,5,x,s,g,8,1,2,f,g,16,6,f,g,h,y,8,1,9",
+    " ve": "j,q,2,4,3,7,5,s,m,3,8,w,2,e,5,7,4,9,j,m,i,10,17,1,3,4,5,5,6,6,5,k,1,5,6,1e,a,6,2,m,1,3,1n,o,6,c,s,5,7,7,2,2,w,4,5",
+    " vi": "7,2,4,8,d,b,m,6,2,e,4,7,f,a,h,l,1,7,5,7,8,3,1,1,u,4,3,5,2,i,d,i,2,1,4,3,a,7,f,m,3,3,r,7,4,9,4,2,6,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,2,1,1,1,5,5,3,2,2,5,1,2,1,1,2,1,6,4,1,2,1,1,1,2,3,1,1,1,2,1,1,1,3,2,2,1,1,6,1,2,1,1,3,3,2,1,3,1,2,6,2,2,1,j,12,e,k,a,g,2,e,1",
+    " vo": "g7",
+    " vu": "2,1,b,f,o,e,6,n,2f,2,2,i,18,5,10,a,2m,42,r,10,3,1",
+    " wa": "h2",
+    " wi": "42,dp",
+    " x ": "eh,o",
+    " xa": "8a",
+    " y ": "0,1,2,1,2,1,1,1,1,1,1,1,1,1,1,2,1,2,2,1,2,1,1,2,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,2,1,5,2,1,1,2,1,1,1,1,2,1,1,1,2,2,1,2,1,3,1,1,1,2,1,3,2,1,1,1,1,1,2,1,2,1,1,1,1,1,3,1,2,1,1,1,1,1,1,1,1,1,1,1,2,1,3,1,1,2,1,2,1,2,1,1,1,1,1,1,3,2,2,1,1,1,1,1,1,1,1,3,1,1,1,1,1,1,1,1,1,1,1,1,3,2,1,2,1,1,2,2,2,1,3,1,1,1,2,1,1,1,1,2,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,2,1,1,2,1,1,1,1,2,1,2,1,1,1,4,2,1,1,1,1,1,1,1,2,1,1,1,2,1,2,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,4,1,1,1,2,1,1,1,4,1,1,1,1,1,2,q,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,3,2,1,2,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,2,1,1,1,2,1,1,1,1,1,1,2,1,1,1,1,1,2,1,1,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,4,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,2,4,1,1,1,2,2,1,1,2,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1",
+    " ya": "9h,3t",
+    " ye": "3n,l,6,i,5n",
+    " yi": "8h",
+    " yo": "az,7,1v",
+    " yu": "8l,3a",
+    " za": "85,5,4k,11",
+    " ze": "fi",
+    " zi": "cl,2q,r,1b",
+    " zo": "2m,d,2j,5x",
+    " zu": "h8",
+    " × ": "f3,1",
+    " “a": "3h,d",
+    "\" e": "aw,7k",
+    "\" o": "j3",
+    "\" p": "6k,3q,8f",
+    "\", ": "11,e,71,4,1i,g,5n,19,1e",
+    "\". ": "j1",
+    "\"am": "j3",
+    "\"ar": "6k,c5",
+    "\"as": "1f",
+    "\"ba": "ai",
+    "\"fu": "j1",
+    "\"gi": "8g,ac",
+    "\"hi": "11",
+    "\"ho": "a2,8,86",
+    "\"hu": "aw",
+    "\"la": "g5,19",
+    "\"li": "8k",
+    "' e": "5l,c,3c,2a,12",
+    "' h": "9n",
+    "' p": "9f,3j,52",
+    "', ": "4s,l,d,4a,2t",
+    "'. ": "d3,50",
+    "'ac": "9n",
+    "'al": "4s",
+    "'ar": "i3",
+    "'as": "9f",
+    "'bo": "5x",
+    "'ca": "d3",
+    "'cr": "5l",
+    "'en": "99",
+    "'fl": "bj",
+    "'hi": "a0",
+    "'or": "ct",
+    "'pi": "i0",
+    "'ra": "5q",
+    "'re": "cl,q",
+    "'uv": "5d",
+    "'vi": "cy",
+    "(a,": "f7",
+    "(ac": "5e",
+    "(al": "iv",
+    "(am": "2r,6v,e,7g",
+    "(an": "hh",
+    "(ba": "9k",
+    "(be": "5d",
+    "(br": "53",
+    "(bu": "9o",
+    "(c ": "f4",
+    "(ci": "2m,e4",
+    "(co": "dg,6,2j,l,o",
+    "(cr": "dg",
+    "(cu": "h5",
+    "(de": "5d",
+    "(di": "2f,k",
+    "(em": "5k",
+    "(en": "14,ac",
+    "(es": "1q,3p,1,5,2x,6",
+    "(fe": "9k",
+    "(fl": "7g",
+    "(fo": "g7",
+    "(fr": "ds,h",
+    "(ge": "9u",
+    "(gr": "54,b5",
+    "(hi": "99",
+    "(ho": "dq,5,e",
+    "(in": "dz",
+    "(la": "2s,2a",
+    "(ld": "fk",
+    "(lu": "9z",
+    "(ma": "dz",
+    "(me": "2p,6z",
+    "(mt": "8f,a",
+    "(mu": "9v,34",
+    "(pi": "ez,2k,1",
+    "(po": "co,2,6,5,1",
+    "(pr": "4t,r,80",
+    "(pu": "g1",
+    "(qi": "8g,ac",
+    "(ra": "7p",
+    "(re": "55,38,q,4l",
+    "(ri": "7h,s,52",
+    "(se": "cv,9,u",
+    "(sh": "8p",
+    "(si": "4w,84",
+    "(sp": "4t",
+    "(su": "cr,4h",
+    "(to": "ba",
+    "(tr": "32",
+    "(tu": "gw,1j",
+    "(ur": "4x",
+    "(us": "57,1,9",
+    "(vi": "2l,2a,36,16,1j,2z,5,5,1,1,3,1,1,4,2,l",
+    "(ya": "9n",
+    ")\na": "2l,28,2,1,h,30,b,10,12,1y,b,1,1,1,2,g,6,2,3,4,5,5,1,2",
+    ")\nc": "4x,g,4n,2v,t,l",
+    ")\nd": "5f,30,5f,b,1",
+    ")\ne": "4t,e2",
+    ")\ng": "9m",
+    ")\nh": "f7,10",
+    ")\ni": "dp,b",
+    ")\nl": "dg,c",
+    ")\nm": "cq,l,1t",
+    ")\nn": "cr",
+    ")\nr": "89,57,l",
+    ")\ns": "54,h",
+    ")\nt": "55",
+    ")\nv": "dz",
+    ") c": "52,bo",
+    ") e": "2m,6,6s,7z",
+    ") m": "7h",
+    ") p": "8f",
+    ") q": "ba",
+    ") r": "5e",
+    ") t": "gq",
+    ") y": "2f,35,1w,8l,2r",
+    "), ": "1q,z,2,8,3,21,2y,f,2,7,87",
+    ", a": "i,d,8,5,7,8,3,h,g,k,2,c,4,1y,5,r,l,7,w,v,7,r,c,3,8,k,a,x,a,4,n,4,g,g,1,10,2,2,e,v,6,j,k,i,9",
+    ", b": "1a,2w,53,3s,j,1n,1,2,3,2,28",
+    ", c": "8,v,w,n,x,6,1e,6,5,5,4,2,3,4,1,2,6,3,9,3,m,c,c,6,2,g,5,1,2,d,a,f,3,2,e,h,8,b,4,5,s,2,5,2,8,5,2,6,5,2,3,5,b,1,5,m,d,6,m,i,t,i,8,d,4,7,7,7,5,2,1",
+    ", d": "1d,t,1q,q,2g,4,f,29,1g,1k,a,9,37,16,1g",
+    ", e": "5,b,4,4,6,7,8,2,g,1,b,5,7,2,4,6,8,3,3,1,a,j,5,5,d,6,l,8,5,p,7,2,8,1,3,3,6,u,4,2,6,1,1,4,2,1,b,1,1,2,1,7,4,6,5,3,1,5,1,2,1,5,1,a,1,3,1,3,2,1,1,7,4,1a,1,1,8,3,a,2,7,2,4,3,4,n,1,i,3,17,8,7,b,1,9,9,1,6,7,l,9,2,2,1,1,7,9",
+    ", f": "43,27,3,9,1f,2,b,2,c,n,3,30,3,4,1q,4f",
+    ", g": "6i,15,19,1,6,6w,s",
+    ", h": "1v,35,5i,22,e,2t,b",
+    ", i": "2,14,4a,2u,k,h,f,2p,h,l,3m,m,1g",
+    ", j": "dx",
+    ", l": "s,1b,7,2,x,h,7,t,q,d,7,2,3,9,7,4,2,7,3,9,9,3,4,b,s,4,1,4,3,4,4,1,3,2,3,2,2,3,c,h,2l,h,7,n,e,l,f,7,1,z,8,4,4,y,1,j,6",
+    ", m": "3b,14,a,b,i,d,3,6,1b,c,o,a,2,2l,2r,m,e,i,7,e,o,j,1v",
+    ", n": "6s,1r,8n",
+    ", o": "31,4,9c,1,n,2,5,2,1r,1",
+    ", p": "14,e,3,1,7,1,a,2,5,5,x,1u,1,2,4,6,1b,b,8,f,1y,4,1,2w,2,3,5,1,j,s,c,4,f,5,3,j,a,c,2,o,g,v,g",
+    ", q": "25,62,1g,t,7,1p,e,1,k,16,b,u,m,t,k,7,5,y",
+    ", r": "1g,4,2y,1b,2,7,9,d,1d,1,6,1h,12,a,1d,3,a,10,8,3o,18,2,6",
+    ", s": "12,5,5,1,j,b,t,4,q,f,9,j,f,m,2k,u,2,1,f,7,8,4,4,5,j,a,11,3,9,7,g,m,6,f,8,4,4,h,c,6,2,7,21,q,3",
+    ", t": "21,g,8,2,9,2,2,s,1l,7,1,1q,9,t,3,c,g,16,q,18,l,6,2,p,4v,5,2",
+    ", u": "a,1,6,h,2k,b,9,b,m,2,4,8,2,9,1,c,2,1,2,1,2,2,1,3,3,9,4,3,7,7,2,2,7,4,5,2,1,1,4,5,r,z,8,m,6,4,1,1,c,4,s,n,3,n,8,5,j,e,c,7,i,8,e,m,1,e,1,4,5,e,5,2,2,6,3,2,6,5",
+    ", v": "1v,4f,j,43,1,h,1n,7,1,1,r,12,b,2,q,2a,8",
+    ", y": "c,9,1t,4,5,3,b,8,b,2,p,6,29,5,8,m,f,e,2,5,l,f,2v,4,c,2m,2,1,6,7,1,i,21",
+    ", z": "8a",
+    "-3,": "f8,7",
+    "-6,": "1a,8o",
+    "-ag": "b4",
+    "-ap": "2v",
+    "-bu": "2t",
+    "-ca": "4t,t",
+    "-cr": "e4,6",
+    "-es": "bj",
+    "-fo": "hb",
+    "-gr": "w,26,cw,k",
+    "-id": "f6",
+    "-in": "hm,8",
+    "-ju": "ah",
+    "-pi": "d1",
+    "-po": "hj",
+    "-su": "2t",
+    "-ur": "4u,9z",
+    ". a": "1m,z,7e,2q,7,v,3,7,5,a,1,1,d,1,8,2,1,1u,f,1p,1",
+    ". b": "n,7e",
+    ". c": "24,3,38,7d,8",
+    ". d": "22,fg",
+    ". e": "1t,v,g,48,4,p,3,2,1,1,2,7,12,6,8,1h,t,1,4,2,1,2,9,1,2,1,3,4,1,1,2,1,2,2,i,1,8,6,9,i,x,p,2g",
+    ". f": "3b",
+    ". g": "88",
+    ". h": "9h",
+    ". i": "f5",
+    ". l": "14,14,v,1l,1e,3a,3u,b,2,4,3,2,6,4,5,2,4,g,6,1",
+    ". m": "56,s,93,4",
+    ". n": "dw",
+    ". p": "32,7,ao,3,n",
+    ". r": "1v,6b,3b,3a,3,9",
+    ". s": "1o,1,g,d,4,k,1,1,1z,1,2,2,3,5,7,4,l,1x,6,3,16,4,1k,z,2,3,3,1,5,6,3,1,5,2,1,2,7,b,4,4,5,4,2,1,2r,2,4,8,b,1,3,1,1,1,1,1,1,1,v",
+    ". t": "e,15,k,y,2v,2a,18,b,1v,t,9,5,d,p,b,6,1z,1h",
+    ". u": "hr",
+    "/ r": "g9",
+    "/ s": "fp",
+    "12\n": "b1",
+    "2\ns": "b1",
+    "3, ": "f8,7",
+    "6\na": "db",
+    "6, ": "1a,8o",
+    ": l": "dz",
+    "a\na": "4,1,5,1,6,6,1,3,9,1,1,5,1,7,1,5,1,1,1,4,5,19,3,7,1j,16,2,1,1,4,2,1,2,2,1,2,3,2,6,1,4,2,c,1,4,1,1,3,1,2,4,2,1,1,1,2,8,5,1,1,6,1,1,9,1,1,1,9,2,1,1,2,1,3,1,b,y,1,a,7,3,1,1,s,1,2,6,3,1,3,a,4,a,3,3,5,3,2,5,4,1,9,1,1,1,9,8,2,1,6,2,5,1,1,2,7,1,1,2,2,1,1,1,1,3,2,1,8,9,i,i,1,1,1,7,6,1,2,3,2,q,4",
+    "a\nb": "9e",
+    "a\nc": "0,1,3,1,i,o,b,2,1,v,3d,v,8,5,a,3,7,4,w,1,k,d,c,2,1b,3,x,5,g,p,f,1e,b,2,1,1,7,1n,7,6,1,b,t",
+    "a\nd": "0,1f,1,c,1e,1t,1d,1,a,c,1,6,i,1,4,9,3,8,7,m,7,2,25,t,r,9,6,5,r,c,h,j,5,1u,j",
+    "a\ne": "2,o,i,2,6,6,1,4m,9,6,h,4,5,1,6,8,2,f,9,2,b,9,1,7,n,3c,w,1l,2",
+    "a\nf": "17,bb,c,29,37,7",
+    "a\ng": "fx",
+    "a\nh": "1p,1k,2u,h,2,13,v,6c,4,e,9",
+    "a\ni": "67,1k,5,h,4,2g",
+    "a\nl": "1d,79,g,52,6",
+    "a\nm": "28,6f,3x,2m,36,1,4,1",
+    "a\nn": "6l,1w,5,x,5r,1,1,q",
+    "a\np": "cb,f,2l,3c",
+    "a\nq": "b0",
+    "a\nr": "0,4,6,11,9,1,3,4,53,b,7,1,8,f,4,5,2,2,3,1,3,6,t,1p,1,7,w,3,c,1,8,3,6,g,1,14,17,a,1b,z,d",
+    "a\ns": "37,1s,2p,a,2,11,d,1m,1o,f,7,1m,m,2p,1",
+    "a\nt": "j,y,5j,p,14",
+    "a\nv": "97,4m,2,a,c,1,c,3",
+    "a \"": "11,e,75,ah",
+    "a '": "99,6,l,3b",
+    "a (": "2m,2g,6,8,2z,1,n,4,d,2,1,1,1m,1e,2,5,6,1,2,i,n,o,2,5,3,y,r,9,9,5,1,v",
+    "a /": "fp,k",
+    "a a": "0,2,4,2,1,2,4,1,3,2,2,2,1,6,1,1,1,2,2,3,5,1,6,1,1,2,1,9,4,3,5,1,1,3,1,1,2,4,9,2,5,2,1,1,2,1,2,3,7,1,1,2,b,2,5,3,1,g,3,4,4,6,2,4,9,5,5,2,1,2,3,2,1,2,5,1,6,1,3,5,3,1,2,2,1,2,1,4,2,5,1,4,4,1,2,4,3,1,2,1,1,4,1,6,5,1,1,1,2,2,2,3,1,1,1,1,3,6,4,5,2,1,1,5,5,2,1,d,4,3,1,1,a,2,7,6,1,1,1,1,2,1,3,s,5,4,3,2,2,2,2,2,1,4,2,3,2,1,1,1,1,4,1,7,3,3,2,2,5,2,6,2,1,9,4,1,1,3,7,1,2,g,1,1,1,1,1,1,1,2,7,4,2,1,2,1,4,3,2,1,2,1,4,1,2,1,2,5,2,2,3,5,5,5,4,7,2,5,1,3,3,2,1,1,1,3,1,5,2,1,2,1,3,2",
+    "a b": "20,6,1,6,l,2,6,5,f,1,m,w,g,u,l,9,2,9,d,2,9,2,4,9,4,6,4,9,6,9,5,c,g,b,6,1c,4,1,e,1,7,1,k,r,u,5,k,19,1a",
+    "a c": "0,2,1,4,3,1,2,8,1,1,1,5,2,3,3,2,4,1,1,2,3,1,9,1,1,5,2,2,1,3,1,2,1,2,2,1,2,6,1,1,1,4,1,3,3,3,3,6,3,1,2,2,6,2,5,1,2,2,2,2,1,7,3,4,3,1,2,2,5,1,3,5,4,2,1,2,2,2,1,2,2,3,1,2,4,1,2,3,2,1,2,3,3,1,6,1,1,1,1,1,1,1,1,2,1,1,1,3,1,1,3,1,1,2,1,1,1,2,1,1,1,2,1,1,3,1,1,3,1,2,1,1,5,4,3,5,3,2,1,1,1,1,1,1,4,2,1,1,1,7,3,1,2,2,2,2,1,1,2,3,1,6,b,1,1,1,1,1,4,6,2,7,4,1,1,1,1,2,1,1,2,2,1,6,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,2,2,1,1,1,2,2,1,1,2,1,3,1,1,1,2,1,2,1,1,3,1,1,2,1,6,2,3,2,3,4,1,1,1,1,2,1,1,1,1,2,2,2,1,1,1,3,2,1,1,2,1,1,3,2,1,1,1,2,3,c,c,5,7,1,1,1,1,1,2,3,1,4,3,6,8,4,6,5,2,2,3,2,7,1,2,2,1,1,1,1,1,7,1,2,3,1,1,1,1,3,2,1,1,3,1,1,2,1,1,2,3",
+    "a d": "6,3,3,3,a,1,1,9,1,2,4,4,5,1,1,4,2,1,2,1,1,9,1,7,1,2,3,2,1,1,1,1,1,1,1,2,7,3,1,1,1,1,3,1,2,2,d,5,1,3,1,3,1,2,4,2,3,1,7,1,m,1,2,4,b,5,1,3,3,1,1,1,1,2,1,5,3,8,4,1,4,3,2,1,1,6,1,4,5,2,3,3,3,1,1,1,8,1,5,4,3,3,2,9,4,4,3,2,2,2,2,7,2,3,1,1,3,1,4,1,2,3,5,1,5,5,8,1,4,2,1,1,1,2,5,1,1,2,r,1,1,1,1,1,1,1,2,5,1,1,1,1,1,4,1,2,3,1,2,2,1,1,2,1,7,2,2,2,1,3,3,1,1,8,3,1,2,b,3,1,2,1,3,1,2,2,6,7,8,3,1,7,5,1,1,5,2,3,8,3,8,2,3,1,6,2,2,4,3,1,2,5,2,4,3,3,1,a,1,1,1,5,1,1,1,3,2,2,5",
+    "a e": "6,3,2,1,2,6,6,7,1,1,2,8,3,1,2,5,1,3,1,1,3,1,5,1,3,6,1,1,1,2,1,2,1,1,1,4,1,5,1,1,5,2,3,1,4,4,5,1,3,2,7,2,1,a,7,6,1,2,8,e,1,1,6,1,1,3,1,1,1,1,5,2,b,1,1,1,5,2,3,7,3,8,4,1,1,7,1,4,1,1,8,2,2,1,2,5,2,2,2,2,2,1,1,1,2,8,2,1,2,6,4,4,1,1,1,3,3,1,2,2,1,2,1,3,2,2,1,1,3,1,3,3,4,7,1,4,1,3,1,4,1,1,1,1,1,2,4,4,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,1,1,1,1,1,1,1,1,1,1,2,2,1,1,1,1,1,4,5,2,1,1,2,1,1,3,1,1,3,2,2,1,1,7,1,1,8,3,d,1,4,2,2,3,4,2,3,1,3,4,5,2,4,1,1,2,2,4,4,8,1,6,7,3,2,7,2,1,2,2,1,8,5,1,1,2,3,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,4,1,1,1,1,2,1,1",
+    "a f": "w,7,b,1,3,5,j,1,i,4,5,4,6,5,7,7,l,1,6,3,2,l,e,9,3,8,4,k,8,1,1,d,1,1,5,1,1,b,5,1,1,3,2,5,2,2,2,9,7,4,3,f,4,4,2,1,2,2,4,g,i,3,1,6,3,q,1,1,1,1,2,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,2,6,1,1,1,h,c,7,5,4,i,1,5,5,1,3,2,d,4,5,2,7,2,6,4,c,i,8,3,b,2,1,1,1,4,1,1,1,2,1,1,4,7,1,1,1,1,5",
+    "a g": "11,1,a,9,t,5,4,d,4,3,j,a,9,6,i,1,6,e,o,d,5,q,7,w,2,1,2,7,a,p,1,o,j,4,1b,9,1,1,5,5,j,3,r,6,17,b,4,y,4,2,5,3,5,8,c,1,k,6",
+    "a h": "e,12,6,7,1,6,6,2,2,4,2,2,m,16,7,o,v,1,k,4,b,i,x,7,o,a,4,7,6,9,1,6,p,4,6,11,6,q,4,9,d,u,c,m,u,m,o,10,1,2",
+    "a i": "l,a,6,7,1,1,4,c,c,4,3,e,g,2,b,t,r,c,1,3,6,9,3,6,3,5,3,5,2,5,8,8,1,c,8,3,1,5,8,6,1,j,3,7,7,f,7,2,3,1,4,1,6,1,1,4,3,d,h,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,3,4,3,3,2,5,4,4,5,6,5,6,6,c,1,6,v,3,7,2,9,1,z,2,3,4,1,1,4,o,2,5,1,1,2,5,2,1,1,3,1,5,2,1,1",
+    "a j": "16,9u,6,2,16,o,f,h,34,1s",
+    "a k": "d8",
+    "a l": "5,1,3,5,2,1,1,3,2,4,1,4,5,2,5,2,1,1,1,1,2,1,1,2,2,3,7,3,1,3,6,6,1,7,5,6,1,3,1,1,5,2,5,1,6,9,3,5,4,2,1,9,6,4,1,1,2,1,2,2,2,c,9,1,7,2,1,4,j,l,1,3,5,2,6,8,2,1,4,2,2,9,9,2,1,d,4,1,1,1,5,1,4,1,1,1,1,1,2,3,1,1,1,1,3,a,a,3,3,5,6,3,1,5,2,v,2,1,2,1,1,1,1,1,1,2,1,2,1,1,2,4,4,3,1,3,6,2,1,1,2,5,1,2,3,7,6,2,7,a,2,2,4,3,1,2,2,1,2,5,1,2,1,1,5,1,2,2,2,4,3,3,5,9,6,5,3,4,1,1,2,6,1,3,2,2,4,1,j,1,1,1,1,1,1,1,1,1,1,1,1,3,2,3,1,1,1,1,1,1,1,1,1,1,1,1,1",
+    "a m": "5,2,2,1,5,c,9,c,4,3,1,1,2,1,5,1,3,1,1,c,4,2,1,6,5,4,6,3,1,1,2,8,d,5,4,3,5,d,g,7,f,9,c,2,5,2,1,4,1,1,4,4,1,4,2,1,4,2,5,1,7,5,1,5,8,1,4,3,1,5,1,3,a,1,6,7,3,2,1,1,1,4,3,1,1,1,3,2,5,3,4,2,1,3,1,9,4,4,4,4,4,w,d,2,2,5,8,3,2,3,a,7,1,4,7,2,3,3,b,5,a,1,z,6,7,c,3,1,1,1,k,2,1,3,2,1,2,4,4,1,6,1,1,2,1,1,1,1,2,1,2,1,3,2,2,3,1,1,1,1,1,1,2,1,1,1",
+    "a n": "x,c,15,31,d,1r,9,i,7,1,b,1,d,1,e,17,p,3,1d,17,4,9,17,m,3,2,3,2,e,5,16,j,3,5,1",
+    "a o": "a,e,a,2,8,c,r,6,3,5,1,1,3,7,2,3,3,8,n,11,1,w,7,b,6,p,7,1,8,d,d,1,5,a,i,3,1a,h,7,1i,j,3d,x,8,4,b,7",
+    "a p": "4,j,9,2,1,1,1,1,3,2,1,2,1,2,a,2,3,1,1,2,1,1,2,2,1,2,1,2,1,1,1,1,1,4,1,1,2,1,1,1,1,1,1,1,1,1,2,1,2,1,4,1,1,1,1,1,1,5,1,5,3,5,1,4,2,1,2,2,2,1,1,2,2,1,3,6,1,2,5,3,1,2,1,3,4,4,3,4,3,6,2,1,1,1,1,1,2,1,1,1,2,1,2,2,3,2,2,2,2,1,7,1,2,2,3,1,1,1,2,2,1,2,2,4,1,1,1,1,1,2,1,1,1,3,1,1,2,1,1,1,2,2,c,1,2,1,1,2,1,2,2,3,1,4,1,2,3,1,3,3,2,1,1,1,1,1,2,4,1,2,2,1,8,3,1,4,2,2,1,1,2,2,2,4,2,3,1,1,1,1,1,1,1,5,2,1,5,r,1,1,1,2,1,1,1,1,1,1,3,2,1,1,2,1,1,1,1,1,4,2,1,1,1,4,1,2,2,2,9,8,1,3,3,1,3,2,2,2,5,1,1,1,3,2,1,3,1,2,6,2,1,8,2,1,3,6,2,1,g,2,2,3,6,6,1,5,3,2,4,4,2,1,2,2,5,4,3,2,1,1,1,2,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,2,2,2,2,1,1,1,1,2,4,1",
+    "a q": "6,k,3,17,2,9,3,1q,15,o,j,r,3y,6,3,1,y,m,3,2,4,4,2g,1,m,a,f,k,2,m,6,d,c",
+    "a r": "4,f,7,6,9,g,4,m,8,a,4,i,f,l,6,5,3,6,3,b,4,8,5,3,2,2,c,1,9,5,3,3,8,7,1,5,1,1,1,2,2,2,6,1,1,2,2,1,1,3,7,2,3,2,1,7,m,3,f,5,1,9,4,a,9,1,2,1,1h,3,2,1,d,6,4,1,3,7,4,a,2,4,h,4,1,3,8,1,c,y,u,a,8,2,3,9,2,2,1,1,3,1,4,6,3,2,4,3,1,1",
+    "a s": "5,o,2,i,c,2,5,4,4,3,3,4,3,3,7,1,3,1,1,1,6,1,2,2,8,j,4,2,3,1,2,5,c,6,a,3,7,a,5,2,3,4,a,6,1,2,9,p,3,3,6,2,3,1,2,7,1,1,1,2,d,5,1,3,6,j,1,3,4,6,6,7,6,7,2,9,6,1,x,3,3,3,2,1,4,1,1,1,1,3,2,1,4,1,7,2,7,1,2,g,a,2,3,j,2,1,1,1,2,1,1,1,1,1,3,1,1,1,1,3,9,1,3,2,1,8,3,d,2,5,9,2,3,4,2,1,1,1,2,3,1,1,2,2,1,1,1,1,1,1,1,1,2,3,1,8,3,1,1,3,2,2,2,3,2,1",
+    "a t": "5,n,1,6,o,a,5,4,1,c,1,2,7,6,1,9,3,7,2,1,1,3,1,1,1,4,3,1,6,1,4,b,4,1,8,5,d,4,1,1,3,3,1,3,1,4,4,2,5,1,1,2,1,4,2,1,6,1,7,1,2,2,5,5,1,1,1,7,3,8,9,2,5,5,4,3,4,1,8,1,3,1,3,7,1,3,1,2,4,1,a,1,i,2,8,2,4,12,1,1,2,8,4,4,3,6,4,2,3,a,g,1,4,2,4,6,1,4,1,3,3,z,1,8,1,2,n,5,4,6,4,5,2,4,1,7,2,3,1,1,2,4,1,4,2,1,2,4,4,1,2,2,1,2,1,2,1,4",
+    "a u": "10,9,6,s,6,9,7,5,6,2,16,m,c,c,b,9,f,b,c,2,9,a,4,6,7,c,l,8,1,1,5,1,6,q,m,6,5,1f,4,3,9,b,2,n,h,1d,c,13,o,2,5,7,b,3",
+    "a v": "d,9,p,4,2,d,9,p,1,i,6,1e,5,3,2,14,5,15,i,1,1,4,1,16,1,7,r,k,1,b,1l,3,6,4,d,7,2,3,1,h,b,5,a,e,o,f,x,s,i,e,1",
+    "a w": "hr",
+    "a x": "8a,67",
+    "a y": "6,q,5,b,b,2,8,1,1,a,3,a,5,5,3,8,b,8,j,1,e,1,1,1,6,1e,2,6,2,5,6,4,1,5,2,6,4,1,6,c,4,2,3,2,b,2,4,5,4,7,c,3,6,b,c,8,p,1,3,w,4,1,2,2,1,1,3,2,1,5,3,4,2,1,1,1,3,2,1,2,1,2,4,1,1,2,k,a,c,2,1,1,3,3,2,5,1,2,5,8,b,4,5,3,d,8,c,f,d,2,1,1,3,1,2,1,1,d,1,1,1,5,1",
+    "a z": "85,5q",
+    "a\" ": "aa,8t",
+    "a\",": "ai,5n,19",
+    "a\".": "j1",
+    "a' ": "9n,1w",
+    "a',": "5q",
+    "a)\n": "4w,h,2,2u,4,19,2,37,4,1,g,4,f",
+    "a) ": "2f,7,6,4p",
+    "a),": "2z,52",
+    "a, ": "5,17,a,6,b,5,3,1,4,1,5,e,2,2,1,e,l,5,4,n,d,2,4,6,6,6,4,2,4,3,5,1,1,1,2,2,a,3,2,1,6,3,1,a,1,7,3,8,1,a,1,3,1,4,7,9,9,3,5,1,1,4,3,6,4,4,4,4,8,7,f,4,t,1,1,2,1,1,2,4,3,2,4,3,1,5,4,4,d,4,1,1,2,g,b,4,1,5,2,1,2,1,1,b,l,1,2,3,e,9,5,3,1,1,c,1,3,1,1,4,2,8,5,4,1,3,1,1,1,1,3,3,1,1,4,1,2,1,1,1,2,3,2",
+    "a-3": "f8,7",
+    "a-6": "1a,8o",
+    "a-c": "e4,6",
+    "a-f": "hb",
+    "a-j": "ah",
+    "a-p": "d1",
+    "a-u": "4u,9z",
+    "a. ": "1p,t,4,f,2,1,28,14,1u,1,b,v,k,1j,r,8,1,8,5,3,5,1,3,1,1,8,f,1,5,4,2,u,1,2d,8,1,4,5,16",
+    "aba": "14,o,3h,b,1b,z,5,8,1,19,6,1u,y,9,d,1,29,s,1f",
+    "abd": "e,6b,26,8g",
+    "abe": "4,3h,4,j,1s,v,2d,1,l,d,1a,1,t,4,p,1,8,5d,e",
+    "abi": "16,1a,8,8,1c,1,b1,z,t,q",
+    "abl": "2q,1,1j,f,l,3i,15,p,3f,1d,9,c,4,u",
+    "abo": "p,7,2,o,m,b,7,1q,2,1m,2,n,i,6,4,e,5,1,1,4,2,1,6,o,1f,2,3,5,6,1,4,3,4,r,c,1,6,4,1,2,1,5,5,1,3,1,8,l,6,r,1d,7,j,2,2,7,1,1,3,6",
+    "abr": "7c,9,2f,79,1o",
+    "abs": "1i,z,4v,7x,j,m,15",
+    "abu": "5,cx",
+    "ac ": "2r",
+    "ac)": "2r,eh",
+    "aca": "0,r,12,b,25,1,20,x,9,a,b,2,2,5,26,d,25,2,3,7,a,18,e,1,e,2,c,9,o,1d,6,3,g",
+    "acc": "1p,2,e,1k,4,12,k,12,2m,23,1v,a,i,l,a,g,2,1",
+    "ace": "t,f,2,k,c,2,5,1,3,1,1,7,f,3,g,1,c,a,u,5,4,b,b,9,1,b,9,8,2,4,a,2,3,j,2,g,g,e,3,2,1,7,3,3,5,10,1b,3,3,8,c,5,2,m,3,p,5,3,2,l,e,u,l,13,j,4",
+    "ach": "1g,20,4m,7,1,c,11,1w,l,1t,6,1f,h,1g,e,5",
+    "aci": "9,i,6,b,2,4,7,2,2,1,6,3,5,6,1,1,3,6,2,2,2,2,9,5,3,1,2,5,1,1,6,5,4,4,6,d,9,a,5,2,7,f,3,3,4,3,6,4,5,1,a,4,8,1,1,9,7,4,3,7,1,2,2,1,2,2,2,2,a,1,4,1,3,5,e,2,3,3,1,4,1,1,2,1,1,2,4,3,1,2,3,2,3,c,1,7,1,7,1,r,4,1,2,3,2,4,5,1,1,1,3,3,a,1,2,2,4,1,3,4,7,6,5,5,4,4,7,9,1,1,5,3,4,3,6,6,5,3,1,6,3,1,4,4,1,5,3,2,1,3,1,4,4,d,4,7,2,1,6,9,1,4,4,4,4,3,2",
+    "ack": "d3",
+    "acl": "3t",
+    "acn": "36,3h,2q",
+    "aco": "m,k,w,y,t,1,y,i,i,r,1e,x,i,d,7,1,8,o,k,3,15,d,1y,1l,n,1i,7,9",
+    "acr": "4v,o,1j,1d,2s,1t,1o,38,14",
+    "act": "3,b,i,2,5,l,2,4,5,2,2,2,4,2,c,5,7,3,4,a,l,q,3,1,7,3,3,4,8,6,f,k,4,e,3,1,c,q,2,1,2,6,2,e,c,4,2,d,a,a,2,3,2,4,f,18,4,2,2,7,9,k,f,6,e,5,14,1,2,i,9,4,1,4,m,5,2,1,4,w,6,6,1",
+    "acu": "c,1m,32,c,1o,p,8,3e,1,1,1,1,3,2,1,v,o,7,30",
+    "ad\n": "7q,al,4,3,4,e,2",
+    "ad ": "9,1g,h,4,4,f,b,6,1j,2,f,c,f,7,1,5,3,h,h,7,b,5,4,2,7,f,3,1,o,9,7,1,1,2,2,1,1,1,3,4,3,5,4,1,9,8,1,2,2,3,w,9,r,d,3,1,b,6,2,8,l,m,14,18,8,1,2,i,3,2",
+    "ad\"": "a2,8e",
+    "ad,": "1k,a,l,2m,1e,14,1v,5,3,8,12,87,4",
+    "ad.": "b,c,p,7,67,19,f,e,i,t,3c,3,1u,1y,6,6,a",
+    "ada": "t,4,1,2,1,8,2,c,6,1,c,1,2,4,1,1,5,3,1,1,1,4,1,2,3,4,3,1,1,1,h,7,11,1,2,3,3,5,l,3,3,3,4,1,2,1,3,1,2,a,1,2,2,5,1,4,1,1,2,1,4,1,2,1,3,1,2,3,2,1,1,4,c,4,3,2,2,1,4,g,9,1,5,2,7,1,1,t,8,1,1,2,4,1,2,6,16,d,6,5,8,b,1,e,d,1,2,1,3,1,3,g,4,3,e,7,8,5,b,8,2,1,2,1,1,6,7,1,8,4,7,1,3,3,3,1,1,1,1,1,4,1,2,2,2,1,3,1,3,1",
+    "ade": "0,2,1,7,7,1,g,8,i,1,1,1,2,1,1,1,1,1,3,1,2,1,1,1,4,2,1,7,2,1,4,b,3,2,1,3,2,2,5,3,1,1,6,1,2,e,b,1,9,1,3,c,8,1,g,2,8,3,4,4,9,2,1,8,9,b,8,4,7,2,4,9,3,2,3,c,2,5,i,4,a,2,1,6,1,1,1,4,k,1,1,5,w,6,1,1,2,8,7,9,8,8,2,1,1,4,3,1,1,6,4,4,9,3,1,3,6,13,2,1,1,c,3,8,1,2,d,4,1,4,1,1,2,1,2,1,2,3,2,6,3,1,1,3,1,2,2,3,4,1,2,6",
+    "adh": "4v",
+    "adi": "s,7,12,i,a,1,8,2,2,a,3,4,4,9,2,a,6,4,6,c,1,c,6,4,4,1,a,8,4,8,e,1,9,5,1,d,7,b,5,c,4,1,4,4,2,o,a,2,i,2,8,5,c,r,4,g,9,4,5,4,6,3,5,8,5,3,2,7,2,3,8,e,f,7,7,1,6,6,13,4,1,4,5,5,6,1,4,2,1,2,4,4,1,1,1,5,1,2,5",
+    "ado": "6,4,c,2,1,2,1,8,4,2,1,a,2,4,2,3,7,2,6,3,5,1,3,2,1,3,4,5,2,1,3,2,5,7,1,1,2,7,2,7,1,4,1,1,3,1,2,3,5,2,2,1,1,6,2,3,2,2,2,1,2,3,1,2,1,2,2,1,4,2,3,2,3,3,1,2,5,1,3,1,3,4,1,2,1,6,1,3,3,1,6,3,1,5,3,7,4,1,2,1,4,5,3,1,1,5,1,2,5,4,1,3,1,1,2,1,1,1,1,2,2,4,2,1,1,1,4,1,2,2,4,1,1,2,1,1,1,2,1,1,1,1,1,2,1,2,2,1,1,2,1,2,1,1,1,1,4,2,6,6,5,v,d,1,1,3,5,1,1,3,5,1,1,8,3,c,9,1,1,6,3,3,6,2,t,5,2,6,2,2,1,4,2,3,3,2,2,2,e,8,2,5,1,7,2,5,c,1,1,2,2,1,1,4,2,1,2,2,1,2,1,3,2,1,1,2",
+    "adr": "4k,e,99,e,2o,1l",
+    "ads": "2z",
+    "adu": "6w,6e,i,7,c,3l,6",
+    "ae ": "3t,3,8,17,q,f,87,33",
+    "aea": "2y,h,4g,t,1d,19,3,3t,t",
+    "aec": "w,26,cw,k",
+    "aeg": "3u,y,m,4b,4d,u",
+    "aem": "2x",
+    "aen": "77",
+    "aeo": "19,74,5,p,d",
+    "aes": "3j,7d,5a",
+    "aet": "ao",
+    "aeu": "58,8i,q,n,2",
+    "afa": "f2",
+    "afe": "2,q,2e,6,9,2,4,g,g,e,n,6,9,8,8,4,y,3,w,h,r,33,5,v,2e,1,11,s",
+    "aff": "8m,3g,16",
+    "afo": "11,2d,34,h,x,j,5,c,1,5m",
+    "afr": "m,5,25,2w,32,13,8,o,q,12,d,3d,6,n,1,12,m",
+    "aft": "57",
+    "aga": "24,4c,14,7,11,2,1d,2,3,s,2n,q,39,l,8,b,a",
+    "age": "9z,k,4,1o,4k,20",
+    "agi": "10,g,16,2g,v,2e,17,4,1,1i,1l,1o,6,1h",
+    "agl": "2v",
+    "agn": "1v,25,t,t,3x,1q,45,7,h,1b",
+    "ago": "c,2,f,1,2,5,7,2,3,3,1,1,3,y,q,w,7,h,c,1,7,5,8,c,6,g,c,5,7,2,h,3,9,9,m,4,g,b,2,1b,18,2d,7,v,1,9,b,9,9,n",
+    "agr": "11,1p,1c,b,o,o,v,1c,w,4,g,m,2j,5,2,a,9,1t,2,1e,g,8,d,y,a",
+    "agu": "1q,a,m,15,2l,h,1t,15,q,u,1,2,1,2,1,1,1,t,a,1a,3l,8,1g",
+    "aha": "0,4c,a,4c,3k,4e,1j,j",
+    "ahl": "9h",
+    "ahm": "j2",
+    "aho": "5d,2q,2,5,6p",
+    "ahu": "ar,b,4x",
+    "ai ": "9k",
+    "aia": "2v",
+    "aib": "31,38",
+    "aic": "28,a,57,6,96,5",
+    "aid": "69,6m",
+    "aif": "31,38",
+    "aim": "cb",
+    "ain": "cb,1,49,u,3",
+    "ait": "a4,8k",
+    "aiz": "14,3b,k,e,c,1,9,5,9,1,9,q,6,1,1,1,2,1,1,2,4,2,1,1,2,1,1,1,1,1,3,6,1,1,2,1,2,1,1,v,5f,3b,8,a,5",
+    "aja": "0,n,g,1,6,1,9,4,8,1,9,7,c,9,g,a,3,3,j,3,a,j,c,1d,6,4,5,9,10,6,1,1,b,1,3,d,9,2k,1,c,1u,12,x,28",
+    "aje": "r,r,4,v,4v,ba",
+    "ajo": "b,i,x,3c,1,1q,1f,1,4k,e,3s",
+    "aju": "19,7y",
+    "ajw": "hf",
+    "aka": "b0",
+    "ake": "a3,1,8k",
+    "aki": "dz",
+    "al\n": "a,a,4,h,4,v,1e,1k,a,a,l,1,a,13,2,3,6,m,5,2,7,8,3,m,1,4,5,5,1,3,1,3,4,1,2,7,d,1a,4,2,5,6,1,4,4,1,1,4,2,y,6,1x,i,e,d,g,5,a,4,6,3,4,7",
+    "al ": "2,j,7,7,6,1,6,2,3,8,4,1,3,5,6,2,4,2,1,1,6,2,3,1,1,2,b,5,1,1,2,6,1,4,5,1,2,1,9,2,7,2,1,7,2,9,4,2,1,1,4,b,9,1,5,2,3,3,6,2,3,1,4,8,1,1,4,5,3,3,1,4,3,b,7,1,2,2,1,2,4,2,1,6,1,6,6,2,2,7,2,6,6,2,1,a,2,d,6,1,a,1,2,5,8,q,1,1,1,1,8,2,4,5,7,3,5,2,2,1,3,2,3,5,d,1,2,1,1,c,7,1,5,4,1,8,4,a,3,8,2,5,l,6,1,4,8,a,6,3,3,2,6,1,1,1,2,2,1,2,4,5,1,1,5,1,2,3,1,1",
+    "al\"": "1f",
+    "al'": "9f,3j",
+    "al)": "ba,1e,2,6,6",
+    "al,": "h,3,p,q,1q,3c,o,26,2,2q,13,s,o,1o,i,i,t",
+    "al.": "e,r,1d,1,z,c,8,g,1,n,4,17,c,p,b,4,8,8,15,38,1,g,v,10,1e,f,e,2,c,p,1",
+    "ala": "e,i,6,19,q,1,12,1h,2,12,b,a,n,1,h,1,3,6,x,1g,8,m,u,n,11,o,9,m,1,3,2,f,9,9,3,m,1b,1",
+    "alb": "0,23,a,10,v,30,45,27,25,17,1j,j",
+    "alc": "3w,n,w,3,2r,1,9,3,2l,46,b,8,1h,7",
+    "ald": "b6",
+    "ale": "6,4,8,c,1,4,9,8,4,3,1,1,1,1,3,4,3,2,1,1,2,1,3,1,1,2,1,3,1,e,1,2,1,1,5,1,7,l,6,h,1,7,6,1,4,4,5,5,1,7,3,8,3,3,a,b,5,6,1,5,3,2,3,2,3,7,3,4,6,5,2,1,4,5,1,3,i,8,6,4,8,1,1,4,3,1,1,3,b,6,1,1,1,1,1,6,5,1,2,5,x,4,3,7,3,b,2,2,7,7,2,7,4,1,6,1,2,1,9,9,6,6,3,8,3,l,2,1,a,4,n,1,7,5,1,1,d,5,6,1,2,2,3,2,1,1,5,1,2,3,1",
+    "alg": "4,g,v,e,3,6,1,3,8,e,1,1,5,b,3,7,q,4,c,11,5,a,2,1,2,n,5,e,j,i,a,8,3,c,1,4,a,3,n,d,1,1,1,1,1,1,1,1,1,1,1,1,1n,h,1x,13,7,h,5,6,1,b,1,2,2,3,1,1,6,1,1,3,m",
+    "alh": "32",
+    "ali": "1,3,4,2,5,6,1,1,1,3,1,5,2,1,8,2,5,5,2,5,c,9,8,1,4,5,3,1,3,6,1,1,1,2,1,7,2,2,g,2,3,2,8,5,1,3,1,e,f,7,1,2,8,5,5,b,1,1,3,1,3,5,2,1,1,4,4,4,2,1,9,9,2,3,3,8,1,1,2,3,4,5,2,3,1,3,1,5,2,2,3,5,2,2,1,3,1,2,7,b,7,e,5,1,6,4,16,5,9,7,1,3,2,4,5,a,7,1,2,3,1,1,4,8,7,5,9,8,3,1,1,1,2,1,1,7,c,1,4,3,2,1,2,1,1,4,1,1,1,7,2,a,5,3,2,b,2,4,6,4,1,6,3,1,1,1,1,5,4,1",
+    "all": "d,r,m,2,j,9,7,2c,u,w,2,m,d,e,l,x,5,1m,6o,3",
+    "alm": "g,4,3,1,f,g,5,3,1,7,2,1,6,7,3,m,2,1,9,3,8,b,9,7,4,6,d,1,a,1,4,6,4,1,2,3,5,4,5,3,a,5,2,5,1,4,5,h,2,7,3,b,2,4,1,1,6,2,6,1,9,6,5,1,2,1,6,9,1,2,i,9,1,a,7,v,1,a,3,2,2,7,d,1,7,e,8,2,7,2,1,1,5,3,1,e,3,1,b,7,7,1,8,4,4,a,1,3,e,1,4,2,1,3,4,1,v,3,2,3,6,3,1,2",
+    "alo": "j,m,6,e,c,c,u,a,1y,c,c,h,9,f,1,b,o,e,7,c,3,v,b,7,b,e,4,5,x,5,m,1,2c,21,7,7,2,5,a,3,5,1,9",
+    "alp": "12,7h,16,3p,m,33",
+    "als": "1c,1,1o,m,l,t,i,3i,1,c,e",
+    "alt": "1i,3,c,u,q,k,9,13,6,r,a,1b,8,1s,6,d,x,5,3,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,5,k,c,1,6,4,w,a,35,s,f",
+    "alu": "1b,p,d,w,8,n,6,27,r,c,i,1,20,c,7,6,8,1,1,5,a,u,3,3,3,3,2,1,4,2,1,3,1,2,2,1,1,1,1,1,2,1,1,1,m,h,5,j,2,2,1,2,1,1,1,2,3,1,1,c,4,5,1f,4,7,g,1,4,4,3,5,2,2,2,3,2,1",
+    "alv": "a,13,1u,2,28,17,2,15,17,u,5d,1p",
+    "aly": "1r,1l,2i,10",
+    "ama": "1,6,3,7,1,9,4,3,2,1,1,4,2,2,1,2,1,1,1,2,5,1,1,4,1,7,2,4,7,3,3,1,1,b,3,3,1,2,1,2,3,1,3,1,2,1,1,4,1,5,1,1,3,4,1,4,5,6,2,1,2,2,4,1,2,1,1,3,1,3,2,3,1,2,1,1,8,2,4,1,2,1,2,1,1,1,1,1,1,1,1,1,1,2,3,1,1,1,1,1,2,1,2,1,1,2,6,3,5,1,3,3,2,1,3,2,1,1,2,1,2,1,3,2,1,3,2,5,6,1,1,1,4,2,1,2,3,2,2,1,1,1,1,2,4,1,2,1,1,4,1,1,1,1,1,2,1,1,2,4,2,1,1,5,2,5,2,3,1,1,1,3,3,1,3,1,6,3,5,1,4,2,t,1,1,4,1,1,2,1,2,2,3,3,1,2,2,1,3,1,1,1,5,6,2,1,4,1,1,3,a,7,2,3,1,1,2,2,1,3,1,2,1,3,1,2,5,2,2,2,3,4,1,4,1,1,8,2,1,4,1,6,6,4,1,9,2,4,1,2,1,1,1,1,4,1,3,4,1,1,1,1,1,2,1,1,1,1,1,4,1,1,1,2,3,2,4,1,3,1,1,4,2,3,3,1,3,2,1",
+    "amb": "e,l,8,4,8,a,7,1,2,1,1,2,7,2,1,3,3,4,9,2,2,20,9,8,3,1,t,4,a,j,u,c,3,8,i,7,b,1,g,5,6,2,2,2,9,1a,3,1,3,1,6,a,2,1,5,2,f,3,k,1,2,3,f,5,1,1,q,e,5,2k,1",
+    "amc": "hg",
+    "ame": "1x,7,4,e,f,d,z,e,4,b,1,1,1,1,2,e,m,7,3,i,3,g,4,1,4,8,8,5,4,1,o,a,o,b,h,7,4,2,3,1d,2,7,3,9,v,a,7,z,j,b,3,p,f,5,2,e,8,1,9,3,9",
+    "ami": "7,6,i,3,b,3,1,b,7,6,2,i,g,m,b,6,4,b,d,5,a,3,2,c,i,c,j,1,c,j,2,1,4,3,8,2,a,6,1,5,6,1,e,g,i,6,1,2,2,9,2,2,8,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,2,1,1,1,5,5,3,1,1,2,5,1,2,1,1,1,1,1,6,5,2,1,2,1,1,3,1,1,1,1,1,1,1,1,3,1,1,3,1,1,1,4,1,3,1,3,3,1,1,1,3,1,1,2,5,2,2,1,6,i,j,q,2,a,10,3",
+    "aml": "35,3h,c4",
+    "amm": "ad,2i,4k",
+    "amn": "5b,c,90",
+    "amo": "j,2,m,h,13,24,4,1b,1n,6,n,2,6,17,1m,5,p,o,m,z,4,c,3,g,j,3",
+    "amp": "4r,t,1,c,9,3,a,80,1m,h,s,16,7",
+    "amr": "j3",
+    "ams": "hr",
+    "amu": "2l,2v,2h,52,1d,e,n",
+    "an ": "1t,1,c,2,6,4,e,2,2,5,7,2,1,d,3,3,5,5,6,4,3,a,2,a,a,18,3,4,3,2,1,2,5,g,6,10,a,1,1,1,4,5,7,6,2l,5,1,4,f,d,b,h,6,1,5,c,e,e,1,4,3,6,1,4,9,2,9,d,2,j,3,5,7,9,u",
+    "an,": "6w,6g,r",
+    "an.": "1t",
+    "ana": "3,1,7,8,1,7,2,3,3,6,1,9,5,2,1,1,5,3,6,1,1,5,5,9,5,1,1,4,8,4,3,7,b,b,8,1,b,1,k,7,9,1,4,a,1,1,1,2,3,9,b,5,e,1,1,1,2,1,1,4,4,2,1,1,3,2,5,3,5,1,3,4,2,8,3,1,b,1,1,3,1,5,4,5,a,b,4,2,n,5,2,t,a,1,2,3,1,1,1,5,3,1,6,2,2,7,f,g,i,1,2,8,6,1,3,1,b,5,1,4,4,3,1,6,f,2,1,4,6,1,4,5,2,1,1,1,2,3,1,1,1,5,1,1,3,1,9,8,2,c",
+    "anb": "f3,1,1",
+    "anc": "e,3,x,2f,1,y,m,r,20,5,8,8,2,2,2,o,5,j,d,j,9,n,j,5,2,6,6,1,z,1q,1x,d,3,11",
+    "and": "6,h,19,5,4,1,7,4,1j,3,a,d,5,8,v,j,h,a,3,f,1,3,c,1,1,2,1,1,1,8,7,a,y,c,t,k,16,5,1,5,4,3,g,i,3,a,h,1,1,2,6,1,1,3,8,2,8,4,4,g,9,z,4,4,5,3,4,d,d",
+    "ane": "8,4,7,16,m,3,1,3,6,2,1c,n,4,5,3,1,c,3,3,3,e,q,f,4,3,4,1w,30,17,g,14,2,a,1,7,9,f,k,4,6,c,c,14",
+    "anf": "8j,91",
+    "ang": "j,4,3,6,4,2,o,6,3,d,t,a,d,d,l,9,a,e,l,f,b,q,5,g,8,1,1,1,8,p,j,4,e,1f,9,2,5,1,3,o,3,2,3,b,5,l,3,e,9,2,8,2,8,a,2,c,6,l,d,6,8,u,1,3,d,3",
+    "ani": "g,6,3,a,p,k,2,b,f,8,g,2,1c,e,i,f,6,6,3,z,e,g,5,s,6,11,7,p,1h,1,g,2,r,6,8,j,m,5,8,9,4,3,1n,1,6,4,7,a",
+    "anj": "4m,p,24,3,19,7,1u,v,17",
+    "ann": "8h,o,3j,4,h,21,2,18,h",
+    "ano": "3,v,5,3,8,c,1,3,7,4,c,6,6,3,3,h,3,c,6,u,7,b,c,1,4,1,4,1,6,6,5,c,1,8,x,8,1,2,d,o,a,h,5,2,7,3,1,4,2,3,2,1j,7,2,5,4,9,4,k,l,a,g,2,1,5,x,2,k,1,6,o,1,2,5,9,1,4,1,3,2,n",
+    "ans": "b,c,1,q,5,1,9,p,c,y,8,q,a,1f,h,2,1,e,9,5,11,2,3,1,1,1,b,3,2,3,3,2,2,1,1r,y,1,8,2,o,u,16,11,j,5,r,4,c,4,7,1,9,3,3",
+    "ant": "0,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,2,1,2,1,1,1,1,3,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,4,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,2,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,3,2,1,1,2,1",
+    "anu": "3,8,13,n,1i,27,1c,m,j,14,3w,6,2t,p,4,15",
+    "anz": "1o,54,1y,4p",
+    "ao ": "d3,35",
+    "ao)": "9k",
+    "ao,": "d0,3",
+    "ao.": "4a",
+    "aob": "4c",
+    "apa": "1p,3,i,4,q,6,1l,4,y,b,9,s,6,n,2,2,e,11,h,1,1,2,2,2,4,4,u,6,2,s,4,2,y,d,v,l,f,7,1i,n,7,w,3",
+    "ape": "c,16,s,7,31,1u,m,22,1,4q,v,2k,1,1",
+    "aph": "4u,q,2n,36,3g",
+    "api": "u,1m,18,5,p,8,t,1f,a,3,v,4,2x,4,2i,l,1b,1,1h,1i",
+    "apl": "x",
+    "apo": "d,t,13,5,h,6,1h,19,1i,r,10,1f,h,2,1,1,3,3,2,b,1b,c,s,h,1,o,c,8,1e,b,k,i,9,6,1,2,4,3,1,1,1",
+    "app": "36,3h,11,2w,20",
+    "apr": "2e,a,d,9,1,3v,5,4,2,1a,1l,d,2,4,1,b,5e,21,i",
+    "aps": "1c,8g,6s,h",
+    "apt": "6e,15,1,6,1,p,7,18,7,t,3u,27,d",
+    "apu": "19,2t,55",
+    "aqu": "1s,e,37,1r,2j,1s,2k,w,4,29",
+    "ar\n": "1e,6,5t,9,f,2,6,7,v,1q,1d,2,a,a,5,2,2,1,2,4z,8",
+    "ar ": "5,1,2,1,6,4,2,3,1,7,1,2,1,5,1,6,9,1,1,j,1,1,1,1,1,2,3,3,2,1,4,5,2,1,1,2,3,2,1,1,1,1,2,3,3,1,1,1,1,2,2,1,1,1,1,1,3,1,2,4,2,1,1,3,1,1,3,4,1,1,3,1,2,3,1,2,1,9,3,4,1,1,2,1,1,2,8,1,2,1,3,1,3,1,1,2,1,2,1,2,1,1,2,2,2,1,1,1,1,1,1,1,1,1,2,1,2,1,1,2,3,1,1,1,1,1,4,2,1,1,1,1,1,1,4,1,1,1,1,3,2,1,4,1,5,1,1,1,1,1,2,1,1,1,6,1,2,6,1,1,3,1,6,1,1,2,3,3,2,2,1,3,1,4,1,1,1,2,2,1,2,2,2,1,1,1,3,1,2,1,1,6,2,5,4,3,1,7,r,4,2,3,5,1,1,4,1,1,7,1,3,2,5,1,4,2,4,1,4,6,7,6,3,1,1,2,1,2,1,1,3,1,1,1,6,4,1,2,5,8,3,1,1,2,1,1,1,2,6,3,1,1,3,3,2,1,1,1,2,2,1,2,1,1,1,2,1,1,1,1,2,1,4,8,1,3,3,2,1,4,1,2,2,1,2,1,1,1,2,2,1,1,2,1,4,1,4,1,1,1,1,1,1,2,2,1,1,1,1,1,1,1,1,1,2,1",
+    "ar'": "99",
+    "ar)": "5k,2y",
+    "ar,": "4m,8n,4,5q",
+    "ar-": "b4",
+    "ar.": "x,2e,1a,14,2h,2,1l,a,2b,e,14,1,4,16,1,e,1f,7,17,2,k,4",
+    "ara": "2,3,3,3,3,1,1,4,3,1,4,1,4,2,1,1,1,4,1,1,1,1,1,3,3,1,2,1,2,2,3,4,2,2,3,2,1,1,2,1,1,2,3,1,1,3,1,3,4,1,1,1,1,1,1,1,1,3,2,1,1,1,1,1,1,2,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,3,3,1,3,1,1,1,1,2,1,1,1,2,1,3,2,1,4,1,1,1,1,2,1,1,1,1,1,1,1,1,2,1,1,2,2,1,2,1,1,2,1,1,2,2,2,2,1,1,2,1,1,1,1,1,1,2,1,1,1,2,1,2,1,2,1,1,2,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,2,1,1,1,1,1,1,3,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,6,5,1,1,1,1,1,3,1,1,2,2,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,2,1,1,1,1,1,1,1,2,1,1,1,1,1,3,1,2,1,1,1,3,2,3,8,1,2,1,1,1,1,6,3,4,1,2,o,3,1,1,1,3,1,3,2,1,2,1,1,1,1,2,1,2,2,1,1,1,1,5,3,1,2,1,2,1,3,2,1,2,2,1,5,1,4,1,1,1,1,1,1,5,1,1,1,2,1,1,3,1,3,2,1,6,1,1,1,1,1,2,5,1,2,1,1,2,1,1,4,1,1,1,1,4,1,1,1,1,2,1,3,3,1,2,3,2,3,3,3,3,3,3,3,1,1,1,2,1,1,3,1,1,1,1,1,1,3,1,1,2,3,2,1,1,1,2,1,1,1,1,2,1,1,1,2,1,1,2,1,1,1,3,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1",
+    "arb": "1,13,l,j,b,4,8,1,3,4,2,6,1,2,2,1,1,2,a,3,4,1,3,8,5,2,5,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,2,1,1,3,1,1,1,1,5,1,2,1,1,5,2,6,1,3,5,2,3,4,8,e,i,2,7,2,5,1q,2k,5,3,2,2,t,e,4,s,24,i,a,b,1,1,3,b,4",
+    "arc": "q,1o,s,j,15,1t,11,5,27,2t,u,16",
+    "ard": "l,m,f,g,a,u,o,w,2,e,1,7,1,18,6,e,9,4,4,1k,4,d,6,1,7,j,e,6,1,1j,a,c,a,2,d,1,7,n,a,1,1,7,1,2,3,2,6,8,7,7,12,12",
+    "are": "3,b,4,b,4,5,z,n,e,8,a,c,z,3,9,b,9,1b,21,c,18,3,6,j,1h,x,4,8,b,i,p,2,2,c,g,8,4,9,u,1,m,b",
+    "arg": "11,b,6,i,h,6,k,j,e,2,3,d,15,5,a,i,2,a,c,d,3,6,10,c,8,4,4,2,8,1,12,2,3,1i,1,n,9,d,8,3b,a,11",
+    "ari": "1,1,j,8,5,4,7,6,2,7,4,3,5,5,1,2,3,3,3,1,9,2,2,4,5,6,1,5,3,3,c,1,5,2,1,3,7,1,2,5,3,2,1,2,1,5,2,2,5,2,1,7,3,2,1,d,2,2,3,5,3,7,1,5,4,2,k,a,5,4,2,i,5,5,7,3,4,1,2,4,6,3,1,8,6,3,4,1,2,1,3,3,2,3,3,1,1,2,2,2,4,5,1,1,3,5,m,1,1,1,1,2,1,1,1,2,2,1,2,2,2,1,3,1,1,1,1,3,1,3,4,6,2,1,2,2,2,1,2,1,2,1,2,3,1,1,7,3,4,2,1,5,1,1,2,3,5,6,i,a,3,9,e,1,e,2,a,f,1,7,b,2,5,1,1,2,c,1,1",
+    "ark": "5l",
+    "arm": "0,1,3,1,1,2,1,5,1,1,4,1,9,5,3,5,4,b,o,5,9,k,2,j,6,q,8,l,17,2,b,3,5,1,i,4,2,k,1c,1,1,3,1f,25,26,1,1,1,1,1,1,1,g,2,1,8,1,2,1,5,3,4,2,1,3,1,1,3,5",
+    "arn": "22,t,3k,14,1g,4,47,p,3q,6,1,10",
+    "aro": "0,1,j,3,g,8,1z,e,11,1,7,4,4,9,5,5,4,6,3,1,2,l,1,1,6,1,4,3,3,2,7,c,4,4,2,b,c,2,1,5,11,s,o,1l,1,3,4,3,9,i,e,l,s,j,1,8,x,13,8,5",
+    "arp": "4v,8f,2,l,r",
+    "arr": "10,3a,2,4,j,p,7,1j,w,a,13,1c,4,7,4,7,u,p,h,7,3,3,d,9,6,1h,2o,2",
+    "ars": "14,10,8x,6h",
+    "art": "c,t,c,1,k,1,5,2,7,2,2,a,f,5,5,a,1b,a,h,3,8,15,o,2,3,q,h,3,6,1c,l,y,5,7,c,3,2,1,2,e,6,6,u,6,o,1h,1d,4,3",
+    "aru": "14,2l,45,6v,17",
+    "arv": "1s,3r,a,12,7,85,p,2l",
+    "ary": "98,6c",
+    "arz": "4z,3l,5b,z",
+    "as\n": "7,7t,8,33,a,6u,3,1,3,1",
+    "as ": "0,3,1,4,1,1,3,5,3,3,4,3,2,5,3,2,2,1,3,5,4,1,1,1,1,1,1,2,5,2,3,1,1,1,1,1,2,1,1,1,1,1,2,1,1,1,1,2,4,1,1,1,1,3,1,1,1,1,1,2,1,1,1,2,3,1,3,1,2,1,1,2,3,3,3,1,4,2,3,1,2,2,1,1,1,4,1,2,1,3,2,1,1,1,1,1,1,1,1,2,1,1,2,2,2,2,2,2,1,1,1,2,1,1,3,3,3,1,1,2,1,1,5,2,2,4,1,1,1,6,3,2,1,1,1,2,2,2,1,2,7,3,5,1,1,2,3,1,1,1,1,1,8,7,1,1,3,2,2,3,2,3,1,2,1,4,1,1,1,1,1,1,3,1,1,1,1,2,1,1,1,2,2,1,1,1,1,1,4,1,1,3,2,3,1,1,7,7,1,1,1,1,2,2,3,1,1,4,1,5,3,1,1,1,1,1,1,t,1,1,1,1,6,1,2,1,1,4,4,1,3,1,1,3,1,2,1,1,2,3,4,4,1,2,2,1,3,2,1,1,3,1,1,2,3,1,1,1,1,3,1,3,2,4,2,2,2,1,3,1,1,4,1,1,1,2,1,1,1,2,1,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,1,1,2,3,2,2,2,1,1,3,1,4,1,1,1,1,1,2,1,2,1,1,3,3,1,4,2,1,3,1,1,1,1,1,1,1,1,1,5,2,1,2,3,1,1,2,5,1,4,1,1,5,2,1,1,1,1",
+    "as'": "cl,8",
+    "as)": "14,3r,j,7d,d,m,8,b,1s,2u",
+    "as,": "2,14,7,e,a,3,2,1,e,2,m,c,x,h,8,v,2,4,2,1,4,9,9,o,b,4,q,2,a,3,j,b,o,a,7,5,1,1e,2,c,1,g,f,7,t,i,c,7,1,5,8,9,z,4,3,5,u",
+    "as.": "2,4,3,8,3,1,7,6,2,9,7,5,6,2,2,c,2,4,7,2,l,1,3,1,b,4,c,2,2,2,8,3,3,6,7,f,2,3,4,3,6,5,3,1,2,5,3,7,9,f,d,4,c,7,3,c,h,4,5,3,4,4,1,2,2,5,4,7,4,7,6,j,4,1,v,1,a,2,9,6,i,5,2,3,8,3,3,2,5,1,3,2,3,3,1,7,6,w,a,o,1,1,7,4,a,8,1,2,2,1,2,7,9,1,4",
+    "asa": "16,10,7,y,s,1h,2f,m,x,1i,31,1d,2,4,3,c,4,z,9,1q",
+    "asc": "1c,48,19,2z,b,x,1k,1,5,a,2,4,2,4,a,f,17,z,1,2b",
+    "ase": "8,6,1,1,j,n,y,4,k,r,7,10,9,1a,g,5,2q,5r,3,1,1,s,1,2,1,j,4,19",
+    "ash": "7r,m,2t,32,43",
+    "asi": "0,g,d,5,1,l,3,f,8,7,6,4,3,1,4,5,2,1o,y,2,l,6,r,t,9,6,d,2,e,10,2,6,x,w,2,4,1,3,6,1,7,5,2,2,1,a,m,8,i,1,c,8,k,t,1g,5,6,2,7,2,1,6,3",
+    "asl": "b9",
+    "asm": "0,5,3,3,4,i,2,c,a,2,a,5,d,4,v,8,10,w,1,2,u,4,6,3,5,2,6,5,4,8,7,4,l,6,6,3,1,1,9,c,1,2,c,1,1f,4c,4,2,i,f,3,2,1,b,4,1h",
+    "aso": "o,1b,c,4,13,4,16,q,z,4,g,24,t,3q,5,1f,2,2,3,b,a,17",
+    "asp": "1f,1y,1m,24,2c,3y,5r,2",
+    "ass": "x,6,z,4d,1p,4,r,1o,l,4,14,21,18,u,s,s,t",
+    "ast": "5,v,1,3,k,4,d,1,q,3,a,a,3,4,2,3,1,1,1,b,3,3,1,4,3,1,3,1,1,1,4,3,6,1,1,5,2,2,2,1,1,1,1,2,3,4,4,1,5,j,2,3,d,c,8,1,1,b,5,7,5,7,i,1,6,s,j,k,1,2,1,1,x,n,b,3,5,5,2,2,1,3,1,4,3,1,2,2,3,1,5,1,1,4,3,1,3,4,1,f,g,7,2,5,y,d,8,2,5,i,e,7,2",
+    "asu": "d,9m",
+    "at ": "bt,e,z",
+    "ata": "5,s,1,2,n,1,1,8,2,3,1,3,1,f,d,1,4,5,3,2,4,1,2,1,4,1,1,1,1,1,6,3,3,5,b,4,1,7,1,e,5,3,2,7,4,1,3,4,2,6,3,1,4,3,6,1,4,6,e,1,1,1,8,5,a,6,3,c,1,2,2,3,d,8,j,2,7,l,g,t,4,8,1,4,3,2,3,4,7,3,3,f,1,3,2,6,6,5,2,3,2,3,2,1,6,7,2,l,b,4,j,9,f,3,4,3,4,3,1,1,1,1,5,1,i,3,2,1,9",
+    "ate": "w,14,1o,h,c,9,x,p,m,a,2,6,28,y,5,6,1m,m,2,1l,a,r,4,1,k,9,1e,7,1,f",
+    "ath": "2w",
+    "ati": "0,1,3,1,1,1,1,1,5,1,1,4,1,1,3,5,1,3,1,3,5,4,b,1,3,2,6,8,4,5,9,3,7,1,5,2,2,2,4,7,6,8,3,8,f,2,2,4,2,2,2,3,2,5,5,6,1,1,2,3,1,3,2,1,2,7,a,2,2,1,1,2,4,3,2,3,1,2,2,1,6,7,1,2,1,1,3,1,3,5,1,1,c,1,3,3,2,l,5,5,1,6,3,3,9,3,1,2,2,2,1,1,1,5,9,4,5,2,1,1,1,1,2,1,3,x,1,2,1,1,a,1,1,1,1,4,3,c,4,3,a,7,7,1,4,6,2,8,1,7,2,1,6,9,1,1,1,1,1,1,1,8,7,1,2,1,1,4,3,1,1,1,1,5,3,4,2,1,2,1,1,1,2,1,3,2,q,2,1,8,2,5,1,3,2,1,6",
+    "atl": "a5,8q",
+    "ato": "1,1,5,2,1,7,1,3,7,3,3,2,1,1,4,2,1,1,3,1,1,1,7,1,1,2,1,2,7,2,4,9,4,1,1,b,3,3,2,1,1,2,1,1,1,1,3,1,2,1,1,1,1,2,1,1,4,1,1,3,3,2,2,2,1,4,6,3,2,2,4,1,1,1,1,1,1,2,1,3,5,1,3,1,7,6,1,1,2,1,2,1,1,1,1,1,1,1,1,1,3,3,1,1,1,1,1,1,1,1,2,1,1,2,3,6,5,7,2,1,3,2,1,1,2,1,1,1,1,1,3,1,1,1,2,2,5,1,2,3,1,1,1,1,3,2,1,2,3,5,1,1,1,2,1,3,1,2,2,4,1,1,2,4,1,6,4,5,2,5,1,4,1,1,1,3,3,1,4,6,3,5,1,6,t,1,1,4,1,1,3,2,1,1,3,3,3,2,1,3,1,2,4,7,2,1,4,1,1,3,a,7,2,3,1,1,2,3,1,2,1,2,1,3,1,1,1,5,2,2,2,3,2,2,1,5,1,8,2,1,4,1,6,3,3,1,1,2,1,1,5,1,2,2,3,1,1,2,2,1,1,3,2,2,1,3,1,1,1,1,1,1,2,1,1,1,1,1,4,1,1,1,2,3,2,4,1,1,2,1,1,4,2,3,3,1,3,2,1",
+    "atr": "n,l,g,1,7,j,5,k,11,i,3,1,b,9,6,c,4,4,2,5,d,7,3,1,j,8,o,4,b,1,j,8,3,2,10,2,4,j,10,1,4,7,7,3,q,w,3,1c,1m,3,4,1,2,1,4,1,1,l,c,1",
+    "atu": "h,3,7,5,7,2,4,d,7,l,1b,c,e,3,1,h,w,f,i,3,7,f,1p,q,h,1,3,2,f,m,x,3,2,3,3,5,g,4,3,1,u,10,3,1,3,e,1,q,2,1,c,a,6,6",
+    "aty": "dx",
+    "auc": "23,4,16,l,8,y,1e,l,10,t,52,f,6,e,2l",
+    "aud": "15,c2",
+    "aul": "6b,6r,38",
+    "aum": "w,1c,2,5g,1,b,e,7,h,11,5t,9,b,1q,3,1,1,4,1,1,i,6",
+    "aun": "5n,1h,21,3j,3b",
+    "aur": "9,15,2l,n,1c,2r,9,d,q,g,6b,1j",
+    "aus": "a,8,11,4b,a,q,1p,5,1a,2c,4c,c,5,1i,l",
+    "aut": "8h",
+    "aux": "5x",
+    "auz": "4t",
+    "ava": "n,19,m,1y,a,28,f,18,7,3n,55,1m",
+    "ave": "8,3,2,q,a,8,1,i,a,1,1,3,o,1,3,k,g,6,4,i,9,4,7,5,o,8,4,h,1,1,1,2,2,q,a,h,1,2,2,6,3,3,4,9,3,1a,3,d,x,5,8,6,g,1,3,c,1,1,3,1,2,4,2,h,p,8,2,6,1,j,4,g,7,6,d",
+    "avi": "18,4,1,1u,39,8,g,b,g,n,k,q,2z,s,1n",
+    "avo": "k,15,6,h,c,1,4,f,c,3w,2s,26,3,1,3,3n,5,t",
+    "awo": "i2",
+    "ax ": "29,2q,1f,15,11,9q,v",
+    "axa": "14,9,l,9,9,a,1,a,6,14,6,4,n,f,11,c,p,5,i,q,22,1i,3,2,m,3,1,1,2,3,2,3,4,1,2,5,4,2,18,p,1e,7",
+    "axe": "3t",
+    "axi": "3k",
+    "axu": "3t",
+    "aya": "3r,p,h,7,9,b,u,5u,3,3,j,1c,c,3,1,2,1,3,1,2,28,d,r",
+    "ayb": "f5",
+    "aye": "h1",
+    "ayo": "10,4j,8e,y,1f,v",
+    "ayu": "6,3,5,5,2,4,7,7,2,7,a,m,5,q,2,g,e,m,9,4,y,1,o,1,p,g,e,2,2,1j,k,a,c,j,w,9,3,2,n,1,4,1,7,3,7,5,a,1,e,1,a,1,d,2,6,1,1,4,h,3,7,3,4,3,3,5,9,3,s,4,5,2,4,b,1,1,2,1,1",
+    "az ": "8,a,3m,6,6,k,u,3,3h,7,44,2i,h,6,h",
+    "az,": "14,3d,14,7x",
+    "az.": "d7",
+    "aza": "m,b,2j,16,s,3k,z,30,15,v,b,3,e,e,e,2,m",
+    "aze": "ac",
+    "azm": "8u,10",
+    "azn": "dh,f,1",
+    "azo": "e,l,2v,b,n,m,1,s,1,1,1,1,e,1q,t,h,6,18,i,w,2,e,2,p,l,n,e,4,1,1,7,4,4,9,l,m,6,1a,9",
+    "azt": "9h",
+    "azu": "j,d,9,2a,d,t,3g,8,5,s,5,6,7,g,e,f,1k,j,5,4,1,16,1,e,c,7,k,e,6,q,e,8,u,1,g",
+    "a” ": "3h",
+    "b)\n": "aq",
+    "b, ": "f7",
+    "b12": "b1",
+    "b6\n": "db",
+    "ba ": "0,3,3,5,e,9,1,1,1,2,k,6,l,3,h,3,19,2,1,l,b,3,8,d,f,g,4,1,5,8,h,o,b,x,d,2f,n,4g,2,r,n,1,2,1,4",
+    "ba,": "70",
+    "ba-": "d1",
+    "bab": "5",
+    "bac": "3,v,5,l,2,4,7,4,i,c,7,a,d,8,u,7,3,7,19,x,5,q,d,e,c,j,a,a,5,1z,9,9,1z,1r,1,v,7,o,8,8",
+    "bad": "1p,4e,7b,47",
+    "bah": "0,gw,1j,j",
+    "bai": "9k",
+    "baj": "t,a,1,12,s,t,m,q,6,1v,14,1,d,j,4,3k,e,1f",
+    "bal": "1b,1,1,f,19,m,b,a,t,1u,26,1,c,e,1p,2u,m,44",
+    "ban": "3o,4b,8,1,13,6,37,n,4r",
+    "bar": "14,l,1h,2e,1,i,k,11,6,2o,8,2o,6,15,2w",
+    "bas": "0,1c,11,1t,1e,2u,1e,3k,3k,1s,a",
+    "bat": "26,18,o,29,v,l,a,m,1m,3,8,2,1x,g,l,h,j,6,2,11,1i,11,1,f,d",
+    "bau": "15",
+    "bay": "4x,7,9,15,7v,c,3,1,2,1,3,1,2,28,14",
+    "baz": "8f,6w,s,1,2w",
+    "bda": "8v",
+    "bdo": "e,6b,am",
+    "be ": "t,b,2l,5j,43,47",
+    "be,": "it",
+    "beb": "20,5d,1i,3s,3o,p,k",
+    "bed": "3l,6m,8x",
+    "bef": "x,o,5t,l,7q,u",
+    "bej": "2m,e",
+    "bel": "60,v,1y,h,10,5,12,79",
+    "ben": "1a,1,u,w,8,2,6,3c,18,q,2,t,13,3,8,1e,3,f,5,6,d,1o,2,3,2,q,13,6,9,r",
+    "ber": "i,p,n,22,1h,9,3,6,9,9,14,k,7,1,1,1,1,1,1,7,1,1,u,1c,l,5,8,39,2,1,1,1,1,1,2,a,13,18,j,8",
+    "bes": "48,o,67,2r,a,1,1,4,8,9,7,22",
+    "bet": "3l,n,3t,1,1,48,4,6,j,1,2,d",
+    "bez": "4,95,l,1o,1v",
+    "bi ": "h2",
+    "bia": "3,g,n,h,4,v,2r,c,6,b,h,6,p,6,4,4,3,k,y,19,1x,c,5,1v,1,2,u,z,7,13",
+    "bib": "9t",
+    "bic": "b7,1w,36",
+    "bid": "1p,b,b,39,1t,d,15,1a,2i,3o,1g,r,p",
+    "bie": "e,t,4,8,a,7,1,2,1,1,9,2,1,3,3,4,9,2,2,14,u,b,b,1,x,a,j,u,c,3,q,7,b,1,1,f,5,6,2,2,2,9,1a,3,4,1,6,1,9,8,k,l,k,x,e,5,1z,2,j,1",
+    "big": "2w,1d",
+    "bil": "9,1q,1c,7,h,4,1m,1c,16,67,1,2d,10,1g",
+    "bin": "9q,7g",
+    "bio": "19,h,4q,d,1g,f,j,11,m,d,e,33,1j,1c",
+    "bis": "8v,6f",
+    "bit": "2g,8,au,1t",
+    "bla": "3u,y,m,2r,d,8,4,2,o,5,n,11,n,j,5,f,z,9,3r,3",
+    "ble": "4,4,g,e,2,3,b,n,1,1,c,7,9,1,9,a,3,4,2,3,1,e,f,2,7,1,6,5,3,1,l,2,2,f,c,3,w,1,3,k,2,9,4,h,k,1,o,3,2,3,2,4,3,3,a,2,1,s,4,1m,1,5,2,2,i,6,1,e,9,7,5,4,4,8,1,6,2,9,6,3,6,8,h,8,c,3,9",
+    "bli": "35,3h,37,e,8j,e",
+    "blo": "2r,1b,4,1w,7j",
+    "bo ": "4g,1k,t,2j,6s",
+    "bo,": "5h,7m",
+    "boc": "3q,30,75",
+    "boh": "6d,1z,2,7,4r,25",
+    "boj": "56",
+    "bol": "d,j,1c,f,8,8,2,6,1,2,2,1,1,2,a,3,4,1,1,2,8,5,g,6,a,g,8,6,1,3,8,a,5,2,7,8,39,5,9,1e,l,5,3,2,12,1t,1w,l,1,1,i",
+    "bon": "27,2b,q,dw",
+    "bop": "13",
+    "bor": "p,9,c,c,x,7,39,5,2,n,i,6,4,e,5,1,1,4,2,1,6,n,1,1f,2,3,5,6,5,3,4,1,12,1,6,4,1,2,1,2,3,5,1,3,1,t,6,r,1d,7,j,2,2,7,1,1,3,6",
+    "bos": "6h,1p,q,v,x,1h,z,f",
+    "bot": "5x,81",
+    "boy": "f3",
+    "boz": "aq",
+    "bra": "x,12,o,4,r,1f,m,1i,j,1,6,a,3,1,3,6,b,t,1q,18,2,5,2,1,1,3,7,1,1,3,4,2,3,3,7,f,6,t,1,1,3,7,4,6,i,9,3,q,e,v,1,1,3,a,2,3,6",
+    "bre": "i,4,9,7,1,c,f,c,r,1,c,h,l,1,q,6,6,6,j,p,a,1,d,1,q,8,3,b,b,4,3,3,8,p,f,4,b,1e,2,i,v,e,9,z,e,m,1,d,4,1,o,2,m,5,7,2,2,5,2,2",
+    "bri": "13,4,2k,d,8,1,t,3,1,c,1,7,8,1a,3,1c,e,1,3,3,o,1,16,2,2c,1i,1,1,33,c",
+    "bro": "z,1h,k,1x,1m,x,1l,d,f,2k,n,3,16,1z,12,1s,6",
+    "bru": "ac,3i,c,l",
+    "bse": "7c",
+    "bsi": "1i,z,4v",
+    "bso": "56,2,a1,j,m,15",
+    "bte": "7h",
+    "bti": "7g",
+    "buc": "27,12,1v,3,u,h,2e,4c,5,f,l,6",
+    "bud": "ai",
+    "bue": "5,d,5,1q,27,3j,9,2,2c,2k,1,f,q,n,1,1,b,5",
+    "bui": "2v",
+    "bul": "1r,1l,2i,z,1,1c,b1",
+    "bum": "2d,4v",
+    "bur": "3q,1k,b",
+    "bus": "1,p,1i,b,d,3,z,r,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,3,1,4,1,1,9,7,5,3,1,d,s,r,5,4y,2,3,g,4,1,e,3,6,1,1,14,24,g",
+    "but": "42,i,e,4q,1v,11,i,15,e",
+    "bux": "56",
+    "buy": "26,65,2e,4,1v,57,5",
+    "c\na": "5b,5,2o,4,56,2v",
+    "c\nc": "8b",
+    "c\nd": "d,b1,1j,4j",
+    "c\nf": "f5",
+    "c\nr": "ba,c,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1",
+    "c (": "2r,a8",
+    "c d": "cz,11",
+    "c p": "8g,1,1,7",
+    "c y": "3y,l,s,3,18,5q,1,1,3,2,e,4,5,1,4,g,3,a,2,4,5,1,7,4,6,7,7,3f",
+    "c)\n": "2l,5u,5a,5,6,4,1,1,4,2,v",
+    "c) ": "8f",
+    "c),": "2r",
+    "c, ": "1v,3l,6z,5,5,5,f,g,x,4,r,l",
+    "c. ": "de,t,5,o",
+    "ca\n": "0,2,2,6,d,4,9,2,5,1,2,5,1,4,1,1,1,5,5,b,11,1q,y,c,3,1,2,1,2,5,3,5,3,1,1,3,2,1,7,1,1,2,1,4,2,1,2,2,3,2,2,5,5,2,1,5,1,1,1,5,1,1,4,5,1,1,3,4,3,1,1,1,1,2,1,3,1,b,1b,7,3,t,2,1,h,7,c,3,5,3,3,2,8,1,1,2,2,5,1,1,1,e,1,6,8,f,7,5,4,1i,1,1,7,c,4",
+    "ca ": "0,q,3,4,1,b,4,8,2,6,b,7,1,g,2,2,e,g,b,e,9,3,m,c,4,6,2,a,1,1,8,3,1,1,5,2,5,3,1,4,3,1,3,6,2,3,1,4,3,3,1,1,2,1,2,2,4,2,3,5,c,1,4,d,2,2,1,4,3,4,j,a,4,1,3,1,4,1,1,1,1,1,1,1,1,3,1,u,1,1,3,1,1,1,3,1,2,1,6,1,1,1,1,1,2,6,1,3,1,4,3,1,1,2,1,1,2,1,1,1,2,5,2,2,1,1,4,3,a,3,3,7,3,1,b,6,4,8,8,3,3,1,3,l,8,5,6,a,f,3,5,2,3,1,2,1,2,3,2,1,1,3,2",
+    "ca'": "db",
+    "ca,": "28,e,i,19,n,17,c,18,2m,8,y,4n,q,1b,4,g,5",
+    "ca.": "31,3l,i,3,v,1t,1c,1n,3,l,d,1b,3k",
+    "cab": "4,1o,48,v,2e,l,1n,1,1k,b,5d",
+    "cac": "49,1,36,t,1,c,i,t,33,3,2w,9,1e,5,2,1,4",
+    "cad": "16,o,92,2r,20,t,o,2",
+    "cae": "2y,7y",
+    "caf": "6b,6p,39,1",
+    "cah": "fz",
+    "cai": "6a,61,2h",
+    "cal": "c,7,4,1,f,2,3,b,5,3,b,6,c,b,e,3,17,3,h,4,8,3,3,6,3,7,5,9,d,2,5,e,1,1,1,f,2,b,2,4,4,3,1,3,1,1,4,3,2,e,6,5,3,j,v,1,6,j,f,1,1,2,1,5,2,3,8,9,1,4,1,f,14,3,3,2,7,2,b,d,2,1,h,e,d,1,e,e,b,g,6,3,1",
+    "cam": "5x,1a,1h,1v,2g,4",
+    "can": "4,d,2,f,1,2,d,q,2,f,9,2,a,n,9,4,p,5,g,4,6,1,8,5,1,7,u,b,b,4,3,3,2,3,6,6,c,c,2,2,g,8,9,d,5,5,3,g,6,y,6,1,1,5,1,1,5,3,3,9,f,g,e,g,4,a,r,1,e,7,9,c,2,2,1,3,5,4,1,9,c,i,2",
+    "cao": "4a,2,34,5k,3,35",
+    "cap": "19,g,l,10,1l,o,e,b,9,y,n,15,v,1,1,2,2,2,4,4,p,5,8,w,10,d,l,a,l,m,p,h,16,w",
+    "caq": "dz",
+    "car": "0,1,3,1,1,2,1,5,1,1,3,1,1,9,2,2,1,3,3,2,4,b,2,e,8,1,1,3,6,3,k,2,5,d,2,5,7,b,4,4,3,3,2,8,3,6,1,1,2,1,1,n,6,2,a,2,1,1,9,3,2,3,1,5,3,1,4,5,4,4,2,6,3,2,1,4,2,5,9,7,2,4,5,4,4,4,2,1,1,2,1,3,1,c,2,4,e,f,x,5,3,1,5,1,2,7,2,3,1,2,1,1,1,1,8,2,1,1,9,2,2,1,2,5,1,2,4,1,7,2,5,1,a,1,1,6,1,1,1,1,2,1,2,3,1,1,1,1,1,1,1,1,3,3,3,1,4,1,2,1,1,1,6,1,2,1,5,3,4,2,1,1,2,1,1,3,2,3,2,3,5,1,1,3,9,b,5,1,2,1,1,2,1,4,4,1",
+    "cas": "2,f,1e,c,1,5,1,6,1,3,k,1,a,2,s,g,d,5,4,5,2,g,d,1,e,3,y,9,6,4,7,1,4,2,2,2,a,b,1c,p,12,1,8,5,4,4,2,6,g,2,4,2,3,1,1,r,1,1,7,4,3,1,2,3,3,1,4,9,2,3,1,6,o,8,4,4,l,o,6,1",
+    "cat": "5,i,a,b,h,7,j,5,c,8,p,c,i,3,1,b,9,6,c,4,4,2,5,d,a,1,j,8,o,g,j,8,5,10,p,10,1,b,7,3,1m,3,2y,3,4,1,2,1,5,1,l,c",
+    "cau": "d2,w,3k",
+    "cay": "h1",
+    "caz": "8,a,m,30,6,6,1,j,l,9,3k,7,3x,7,18,1a,h,6,h",
+    "cca": "3t,26,21,51,a,4m",
+    "cce": "36,1h,3x,t",
+    "cch": "3p,7h",
+    "cci": "2,q,4,d,g,2,1,d,g,9,5,7,6,9,2,4,a,2,4,g,7,1,6,c,2,9,6,1,8,e,2,4,3,7,d,b,2,1,4,4,b,d,h,2,1,c,1,b,h,3,3,8,5,1j,k,s,6,2,j,2,5,3,2,3,d,1,c,2,c,1,k,9,3,g,a,j,r",
+    "ccu": "8n,6h,39",
+    "ce\n": "8m",
+    "ce ": "18,u,6,6,3,l,b,1x,8,2,2,e,13,i,g,4,4,3,1,q,k,8,6,6,9,7,5,g,2,1,3,1,2,1,t,3,1,1,1,1,2,1,1,5,2,9,2,2,1,2,1,1,o,16,27,4,1,7,m,1,1,2,1,1,1,2,3,1,1,1,1,1,1,4,1,1,1,1,2,1,1,1,2",
+    "ce,": "3p,4e,34,a,x,3,2,9,2,m,h",
+    "ce.": "co,5,2",
+    "cea": "55,l,k,b,x,5,l,w,48,1g",
+    "ceb": "d,1t,4y",
+    "ced": "1p,1,1y,dv,s,v",
+    "cef": "23",
+    "cei": "1a,13,6,7,f,3,g,d,a,2,1w,l,8,6,2a,g,2p,8,2s,e,u",
+    "cej": "5p,9b,2",
+    "cel": "5,9,a,d,7,3,1,28,r,4,1b,3,7,2,y,1l,i,c,7,1,2,4,3,5,6,f,c,4,1b,1,5,h,c,8,h,1b,7,8,5,v",
+    "cem": "j,d,9,m,d,y,4,3,6,d,t,2,1x,1p,b,4,p,4,i,5,e,2b,27,y,k,q,e,8,1c",
+    "cen": "1e,9,1,6,5,9,3,1,1,9,1,4,d,2v,c,a,g,u,s,o,q,b,1,s,1m,u,2,p,3,d,1h,1,j,14,2,b,3,9,1,6,2,4,9",
+    "cep": "4j,x,s,27,1q,2s,s,k,e,s,20,12,j",
+    "cer": "h,8,1a,j,6,1,4,b,1,3,a,2,5,4,c,5,11,3,m,5,2,1,n,6,c,7,7,5,k,9,z,2,c,2,4,3,a,a,b,1c,5,1,1,1,6,3,3,1,b,5,9,2,6,3,3,3,3,d,8,i,11,t,e,4,2,q,1,3,5,2,3,2,1,2,1,5",
+    "ces": "v,1d,2,8,m,f,3,2n,1g,6,k,g,8,1,n,2x,9,u,n,c,p,4,1,3,j,1,r,22",
+    "cet": "t,8s,9h",
+    "ceu": "7k,m,1p,b,2e,n,5c",
+    "cha": "e,c,y,c,e,n,3,l,o,2c,14,3,6,8,4,7,5,1a,7,z,c,1u,l,6,1o,4,u,m,7,g,4,12",
+    "che": "w,36,38,3i,20,35,1,k,9,14",
+    "chh": "bc",
+    "chi": "19,7,1b,2,6,c,p,6,16,f,9,e,7,y,1,3,d,5,a,p,3,2,a,1,3,c,c,5,f,19,f,1,8,h,z,h,6,6,8,q,5,1u,c,4,2,1,2,9,2,6,3,4",
+    "chl": "45,23,4q",
+    "chn": "5h",
+    "cho": "d,1g,h,j,13,8,a,32,t,d,e,25,g,q,37,s,1f,16",
+    "chr": "99,32",
+    "chs": "90",
+    "cht": "3g",
+    "chu": "2s,8h,63,4,e",
+    "chy": "8m,2x,5w,e",
+    "cia": "6,8,1,1,4,2,2,o,2,a,3,1,2,5,7,2,5,2,3,1,2,3,3,e,3,2,1,5,8,d,8,r,j,2,g,4,1,8,g,3,5,4,1,1,1,2,4,2,1,1,7,8,1,3,1,4,3,8,5,4,1,5,3,3,1,7,7,5,2,1,3,3,1,2,6,3,4,7,6,2,4,1,4,1,3,2,1,1b,6,2,6,3,2,1,1,f,1,6,o,2,1,2,6,g,1,5,5,2,1,1,3,3,1,2,1,7,5,1,4,2,1,1,1,2,4,4,3,3,1,8,1,2,7,5,2,4,3,8,8,4,1,1,3,1,2,1,3,3,a,3,1,1,2",
+    "cib": "aq",
+    "cic": "n,l,8,9,7,j,5,k,11,i,3,1,2,9,9,6,c,4,4,2,5,d,a,1,j,8,o,g,j,8,2,3,10,p,10,1,i,3,s,u,3,2y,3,4,1,2,1,5,1,l,c",
+    "cid": "o,6,7,6,8,a,2,1,5,3,1,9,6,1,9,1,3,8,4,3,1,2,1,3,1,4,9,d,b,8,2,3,d,2,2,9,3,2,1,1,4,6,1,2,3,9,3,2,a,2,8,9,n,7,3,1,3,5,2,1,2,9,6,a,6,9,1,3,4,1,1,2,2,1,1,4,3,1,5,1,d,2,6,3,1,6,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,4,5,8,2,2,1,2,1,2,3,3,3,4,2,1,2,8,b,1,5,3,5,6,a,1,9,1,1,5,6,1,9,6,4,6,1,1,5,6,5,5,7,3,6,2,5,2,4,1,7,1,3,4,4,2,3,9,3,4,3,3,1",
+    "cie": "x,o,5,i,d,a,25,23,4,7,l,9,1,2v,4l,h,d,1q",
+    "cif": "7d,1b,o,y,2d,b,36",
+    "cig": "61",
+    "cil": "6,3,i,7,f,19,3,d,9,2,m,4,f,4,1g,m,h,q,f,1,3,k,4,4,9,1q,17,1e,7,1x,w,2,1d",
+    "cim": "0,53,3,3b,7,1i,2q,6,c,n,2v,g,13,a,9",
+    "cin": "1,9,8,1,5,4,2,4,2,8,2,a,4,1,2,2,1,3,1,3,3,1,6,4,1,1,1,1,1,4,1,1,3,4,4,1,1,5,1,1,6,h,3,4,3,5,d,6,b,2,4,f,7,6,5,5,3,2,1,1,1,4,1,9,3,c,2,2,1,2,3,2,4,k,5,7,3,c,3,3,4,1,2,3,5,2,3,c,1,2,2,4,2,2,4,6,5,6,1,1,4,1,1,x,b,j,3,5,g,f,6,a,1,h,1,x,8,a,7,5,3,k,4,1,1,1,6,5,6,1,1,3,1,1,1,2,1,1,1,1,1,2,2,2,3,1,1,1,7",
+    "cio": "2,q,4,3,9,1,1,4,7,2,2,1,1,1,4,3,2,3,1,5,1,1,3,4,2,2,2,2,2,6,2,1,2,2,1,2,1,1,1,5,1,1,1,1,2,3,1,4,5,1,1,1,4,2,3,6,1,3,1,5,2,1,6,3,1,5,2,1,2,1,1,7,3,2,1,1,1,2,5,1,2,2,3,3,3,1,1,1,1,2,3,1,2,2,2,4,3,1,3,2,4,5,1,1,2,1,1,2,1,3,1,1,2,2,3,3,3,5,2,2,1,1,2,2,2,2,3,5,1,1,1,1,1,3,2,5,2,3,3,1,2,1,2,5,7,1,2,2,1,3,2,3,3,2,1,2,1,2,5,3,2,2,1,4,1,7,1,q,3,1,2,2,3,2,1,3,3,1,1,2,2,2,1,3,1,5,3,1,2,1,1,2,2,1,3,2,3,5,1,4,1,1,1,2,2,1,2,2,1,1,1,1,1,1,2,1,4,b,1,1,1,2,2,2,2,2,3,2,2,5,1,6,1,1,3,1,1,3,2,1,1,2,7,2,1,4,3,2,4,1,2,2,1,1,1,3,1,1,3,1,1,4,4,1,5,1,2,3,1,1,1,1,1,2,1,2,1,2,1,4,1,1,1,1,4,1,2,4,1,1",
+    "cip": "1e,1n,6,f,3l,1h,1b,2u,13,x,1d,30",
+    "cir": "i,18,9,d,m,c,8,1,3,9,u,2,1d,h,6,8,2,y,3,b,6,18,b,5,7,1,2,1z,3,3,t,3,1,1o,d,m,d,1,9,5,3,b,1a,1,c,9",
+    "cis": "1s,u,1p,r,9m,q,1q",
+    "cit": "y,5,8,38,3,1k,2s,2f,9,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,5,h,a,2,2u,33",
+    "ciu": "a6,4j,1z",
+    "ck ": "d3",
+    "ckl": "f7",
+    "cla": "g,4,10,y,2c,10,1i,l,d,n,b,m,2y,3l,t",
+    "cli": "3t,5v,1j,7x,3",
+    "clo": "1g,3d,4r,1e,2s",
+    "clu": "cf,h,4t",
+    "cne": "36,3h,2q",
+    "co\n": "3,4,7,4,2,5,5,1,4,f,5,7,3,1,1,3,3,1,1,1,1,1,1,4,1,1,1,1,3,1,3,2,4,6,3,9,1,1,1,1,2,3,1,1,2,1,3,1,2,4,2,1,1,1,1,4,2,3,1,2,3,5,1,1,1,1,2,2,2,2,1,2,1,2,2,4,2,1,3,1,1,4,1,2,1,1,3,8,2,5,3,b,5,2,1,4,1,2,4,2,1,8,1,f,5,2,1,2,5,1,9,7,2,1,1,9,4,6,7,1,2,3,a,6,4,e,a,a,1,17,1,7,3,1,1,f,4,3,1,c,1,4,5,4,2,1,6,2,1,3,8,1f,2,7,8,1,2,3,1,2,3,1,3,1,3,1,6,6,1,1,5,h,1,1,2,5,2,1,1,1,3,8,1",
+    "co ": "1,6,5,1,3,4,6,4,f,1,7,1,2,6,5,a,3,4,9,1,5,3,5,3,r,1,7,1,3,e,1,5,5,2,1,1,3,2,2,1,5,3,1,1,1,2,2,4,1,2,2,d,7,3,5,4,3,7,2,2,4,3,1,1,3,4,5,2,1,1,4,1,3,3,1,1,2,1,2,3,1,1,1,1,5,2,4,4,1,2,7,1,4,6,4,5,2,1,4,2,1,1,4,d,7,1,8,1,e,2,1,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,5,7,7,7,1,3,1,1,1,1,3,4,4,1,4,1,3,1,5,1,1,2,1,1,1,1,3,2,1,6,2,1,1,1,2,1,2,8,2,a,d,8,1,1,5,3,1,9,2,a,d,1,2,2,1,1,2,4,l,5,6,3,2,8,2,6,5,1",
+    "co'": "d3",
+    "co)": "4t,3v",
+    "co,": "y,1p,d,d,t,z,9,a,4,4,8,5,m,g,25,1,8,n,h,1s,d,a,b,j,u,q,f,n,m,1j,c",
+    "co.": "c,1,6,1j,p,26,t,6,2,b,t,6,o,20,j,c,1u,s,4,2i,3,23,j,j",
+    "coa": "1q,12,41,2y,q,1w,55",
+    "cob": "ck,31",
+    "coc": "y,13,f,4,25,19,s,1x,u,u,2,4,8,b,6,1,1,1e,1,i,7,4,5,2,h,6,3,s,38,7,e",
+    "cod": "30,3j,1x,ac",
+    "cof": "g9",
+    "cog": "7j,16,z,i,85,1,a,1,c,3,6",
+    "coh": "8o",
+    "col": "8,8,l,h,a,u,5,k,s,12,1,7,s,3,n,5,a,2,2,1,1,2,7,9,4,3,2,1,3,3,4,9,1,3,i,7,h,2,5,6,3,5,1,5,g,9,u,4,f,3,6,3,5,4,1s,1,6,6,3,4,5,b,4,g,9,f,7,7,1,4,6,g",
+    "com": "f,9,5,1,1,6,3,2,1,8,o,1,1,1,1,2,5,3,3,1,1,1,3,1,1,2,1,5,2,4,8,3,2,3,3,5,8,g,5,1,4,5,1,3,6,2,1,3,1,4,2,1,3,2,1,1,3,2,2,6,4,2,3,4,1,1,2,1,1,4,1,2,1,8,2,3,1,2,3,3,7,2,2,1,5,1,9,5,2,4,1,1,1,1,1,a,2,6,1,3,2,2,1,2,3,5,3,4,2,3,7,1,2,4,2,1,1,2,3,1,1,1,2,2,4,3,1,2,c,1,1,1,s,1,2,3,2,7,1,2,3,1,2,2,3,3,2,1,1,3,1,3,8,4,5,1,2,3,3,1,4,1,4,2,2,2,2,1,5,1,b,1,6,7,1,1,2,1,1,2,2,1,4,2,2,9,7,2,1,7,8,1,4,1,3,4,5,5,2,6,3,9,1,3,5,3,1,3,1,4,2,2,2,2",
+    "con": "0,1,1,1,4,3,1,7,4,2,6,1,2,1,3,2,1,2,1,2,2,4,7,2,1,2,1,5,1,1,1,1,3,2,1,4,3,1,1,1,1,1,2,1,1,3,1,1,2,1,7,4,2,1,3,4,1,4,1,2,1,1,4,a,4,2,f,1,2,5,1,4,3,3,1,1,2,1,1,1,2,2,2,3,2,1,1,1,1,1,1,1,1,4,1,1,1,1,2,2,1,2,2,2,3,2,2,3,2,1,2,1,1,2,1,1,1,3,4,1,2,2,2,5,8,4,1,1,2,1,3,3,4,3,1,2,2,1,1,1,2,1,1,2,1,4,4,2,2,3,4,1,6,1,4,4,1,2,3,2,2,5,1,4,3,1,3,2,1,1,1,1,3,6,1,1,1,8,1,1,2,1,2,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,1,1,1,1,2,1,2,1,1,2,1,3,1,1,1,1,1,2,1,1,1,1,2,1,1,1,2,2,2,2,1,1,1,6,1,3,1,1,6,1,6,1,2,1,1,1,6,4,3,1,1,1,2,1,6,2,5,8,3,1,3,2,3,1,2,4,4,1,1,1,1,3,2,1,4,6,5,3,1,2,1,3,3,3,4,3,1,1,2,2,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,4,2,2,1,3,2,1,3,2,1,2,1,1,1,2,3,1,1,1,1,2",
+    "cop": "31,2e,u,49,9,29,5m,g",
+    "coq": "dk",
+    "cor": "6,z,b,h,6,k,a,g,1,b,1,4,1,1,2,2,2,2,8,3,8,5,4,c,1,5,1,6,2,a,16,u,z,1,b,b,4,2,6,a,m,j,6,3,y,2,13,2,d,2,2,4,5,8,a,2,2,a,4,1,1,7,7,w,i,9,10,k,2",
+    "cos": "8,1,7,w,1,5,p,b,6,d,x,2,e,4,9,1,4,9,3,6,2,c,a,r,h,3,1,e,3,s,1,e,c,e,3,2,e,24,8,4,s,4,5,a,e,6,1,7,1,2,3,5,c,1,9,5,v,9,f,1,p,8,i,c",
+    "cot": "2e",
+    "cox": "b0",
+    "cra": "3u,y,m,7,44,12,l,2q,u,37",
+    "cre": "1s,c,a,2p,3,c,4,3s,s,1,13,4,1,2,17,4,a,4,2m,1w,8,g,5,7,1,f,3",
+    "cri": "7,92,c,12,i,1n,8,14,6,4l",
+    "cro": "3,e,2,3,k,h,4,2e,q,5,d,6,6,6,b,2,f,6,9,g,6,4,4,3,g,4,3,v,g,t,7,a,1g,h,1k,b,1,2,u,a,b,e,7,1y",
+    "cru": "16,6x,5,e,2o,1u,c,n,5",
+    "cta": "e,i,18,9,2z,5,2z,8,y,d,33,u,21,1,k,9,9,23,3",
+    "cte": "3,v,5,l,2,4,7,4,1,5,c,c,7,a,l,u,7,3,3,4,1h,i,c,q,d,e,c,j,a,a,5,1x,2,9,9,z,6,2l,1,v,7,w",
+    "cti": "29,j,e,a,12,m,4,c,l,i,k,h,p,5,i,k,p,c,5,4,1n,8,6,q,4,38,29",
+    "cto": "1,1,5,2,2,1,1,1,2,1,2,2,1,3,1,2,3,2,c,1,2,7,3,1,1,1,1,1,4,4,4,8,1,6,6,8,4,1,1,3,2,1,2,1,1,6,4,1,1,3,8,1,3,4,1,2,7,4,6,3,2,5,i,5,2,2,2,4,7,4,8,1,1,2,1,2,1,4,1,3,4,7,2,1,2,3,2,2,1,4,4,2,1,1,5,2,3,a,1,2,5,3,2,2,1,2,1,1,4,2,3,3,1,5,9,1,7,2,1,3,4,2,2,1,2,4,1,9,a,9,18,4,1,h,5,3,6,1,1,5,5,1,2,4,3,1,4,b,1,2,2,3,3,1,d,2,1,2,5,1,5,2,5,1,1,6,2,5,4,2,2,1,3,1,2,5,6,4,2,2,4,2,1,4,s,1,5,9,1,1,5,2,2,1",
+    "ctr": "cn",
+    "ctu": "2s,2y,5j,2k,l,38,5,2,1,4",
+    "cty": "8f,al",
+    "cua": "2a,2,7,5e,3e,1,1,1,1,3,2,1,1p,11",
+    "cub": "52,1,7h,4k,g",
+    "cuc": "fb,s",
+    "cue": "1k,1c,2l,23,1p,12,n,1g,f,b,a,3i,1n,9,3,5",
+    "cui": "14,4w",
+    "cul": "c,2,4,f,h,4,2,6,9,9,4,c,b,5,6,1,7,1,1,2,9,4,e,c,2,9,c,9,i,a,8,6,2,8,c,9,d,2,2,4,1,1,2,1,1,1,4,1,2,1,h,8,4,2,8,2,c,e,b,8,1,2,g,2,t,2,3,7,6,4,5,2,2,1,2,1,1,8,f,h,k,4,2,a,4,3,1,1,f,2,b,1,7,2,8,b,9,3,1,1,2,3,1,1,2,1,1,1,1,1,1,1,1,1,3,7,1,1,1,2,9,3,2,7",
+    "cum": "0,f,2,3,a,2,a,6,h,5,k,k,33,r,4,d,5,7,7,1w,31,i,22,f,6,5,8,2,5,2,3,2,7,5,1,3,1f,e",
+    "cun": "c,dt",
+    "cuo": "d4",
+    "cup": "3m,c,2d,8m,1d",
+    "cur": "h,1n,19,s,q,1a,3,o,7,c,3,1s,d,1l,1u,1c,x,1c,1,h,j,w",
+    "cus": "m,3,1i,n,w,6,1,k,j,4,x,h,1l,8,c,8,1,11,f,r,1o,w,q,6,l,1d,15,8,j",
+    "cut": "1p,53,2l",
+    "cuy": "35,9,1d,3,2,1,2,4,1,5,2,5,5,2,2,5,5,1,n,2,3,2,5,2,3,4,1,4,3,2,2,1,1,2,1,1,2,2,1,2,3,6,2,f,1,3s,5u,4,j,4",
+    "cya": "1e,7x",
+    "cyc": "b7",
+    "cyd": "62,7j",
+    "cym": "f,o,ep,x",
+    "cyr": "7l,9o,1o",
+    "cyt": "5f",
+    "cze": "6n",
+    "d\na": "if",
+    "d\ne": "ii",
+    "d\nf": "j0",
+    "d\nm": "ib",
+    "d\nn": "j2",
+    "d\np": "im",
+    "d\nr": "7q",
+    "d a": "1p,1f,75,h,4",
+    "d b": "d8,5",
+    "d c": "a3,i,f,7,1g,3,a,3,9,12,1u",
+    "d d": "9,1x,8,f,3g,1t,1,3,2,23,4,p,8,3,2,u,6,8,5,c,3,1,1,l,1,b,f,l,2,1,3,1,1,2,2y,7,3,5,4,1,1,4,2",
+    "d e": "c1,5m",
+    "d g": "j4",
+    "d h": "5a,7n",
+    "d i": "f6",
+    "d l": "9v",
+    "d m": "7x,2y",
+    "d o": "83,2y,1,1c,6,l,2,2,1,2,2,14,v,5,3,1",
+    "d p": "2a,10,1j,2,r,f,7,9,y,n,20,1,1,2,2,2,4,4,v,7,w,10,d,v,l,m,2c,w",
+    "d r": "cp,5q,r",
+    "d s": "ix",
+    "d t": "d1",
+    "d v": "6h",
+    "d y": "6e,k,o,t,f,3,1,o,14,3q,2j,1g,3",
+    "d\" ": "ig",
+    "d\",": "a2",
+    "d, ": "1k,a,l,2m,1e,14,1v,5,3,8,y,4,20,67,4",
+    "d. ": "n,w,1q,b9",
+    "da\n": "3g,4x",
+    "da ": "6,3,5,5,2,3,1,4,3,1,1,2,1,2,4,2,2,1,3,7,1,2,3,1,1,2,1,3,3,3,1,2,4,1,3,2,1,3,1,1,8,3,3,1,2,1,1,1,1,b,6,8,r,9,6,3,5,l,2,1,2,1,1,1,1,1,3,3,1,4,2,a,1,2,2,5,1,4,1,1,1,1,1,4,4,4,2,3,2,1,1,2,2,1,4,7,4,1,3,1,1,1,4,4,d,3,6,1,6,1,7,a,c,c,2,1,2,1,1,1,1,4,1,2,3,2,1,s,1,5,4,1,2,1,1,2,2,1,2,3,3,8,2,1,1,2,1,1,2,5,3,7,4,1,b,1,a,1,2,1,4,6,1,l,1,8,4,a,1,5,4,7,2,4,3,1,1,4,5,1,4,2,1,1,3,5,6,4,1,1,2,1,3,3,1,1,1,1,1,4,1,2,2,2,1,2,1,1,2,1,1",
+    "da\"": "ai",
+    "da)": "dg",
+    "da,": "cx,9,r,37,f,1i,2,3",
+    "da.": "11,bj,g,9,28,3p",
+    "dab": "2q,1k,4i,1u,3f,1d,9,c,4",
+    "dac": "bg,o,17",
+    "dad": "0,2,1,6,1,1,6,6,b,6,2,6,7,1,4,1,1,1,2,1,1,1,1,1,3,1,2,1,1,1,3,1,2,1,1,8,1,4,1,a,1,2,2,1,1,2,2,2,5,3,1,1,6,1,c,4,b,1,4,2,3,1,2,1,8,4,8,1,d,1,4,3,1,4,1,1,1,1,3,4,9,1,1,1,f,2,2,3,4,7,3,2,2,2,2,3,2,2,2,9,3,1,1,2,1,1,b,2,2,3,2,3,1,5,2,1,7,1,1,2,2,1,1,1,2,1,2,2,3,2,1,1,1,3,1,1,1,7,1,8,1,1,1,2,3,w,6,1,1,1,1,8,7,9,2,6,7,1,2,1,1,4,3,1,1,1,5,1,1,1,1,1,3,3,6,3,1,3,6,2,m,h,1,d,9,2,1,2,h,1,4,1,1,2,1,2,1,2,5,2,3,1,3,1,1,2,1,1,2,1,1,3,4,1,2,1,1,2,1,1,1,2",
+    "dae": "ah,39,q,n,2,1",
+    "daf": "bj,6o",
+    "dah": "9h",
+    "dal": "2c,1,4u,1,29,1z",
+    "dam": "l,1n,t,27,k,k,7,3,15,q,4,z,1r,1u,9,1c,x,6,f,7,w,10,8,a",
+    "dan": "1,2,8,6,5,2,f,g,1,6,5,4,1,1,4,3,6,4,1,2,4,3,1,c,1,2,2,1,3,1,2,1,7,q,6,1,3,3,3,7,1,8,6,4,6,4,5,4,1,2,3,2,3,2,3,2,1,4,8,2,1,7,2,5,1,1,1,1,2,2,d,1,1,2,2,1,4,1,b,6,1,2,1,1,1,c,2,5,5,1,1,1,3,3,2,8,3,2,1,1,4,4,2,1,1,1,1,1,1,1,1,1,5,7,4,5,4,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,4,1,1,2,1,1,1,2,2,1,1,1,3,1,1,2,2,2,1,1,2,1,1,1,2,2,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,2,1,3,2,2,1,1,1,1,2,3,1,1,2,1,2,1,1,5,1,1,2,1,1,1,1,3,1,1,2,2,1,1,3,1,4,2,5,1,1,2,5,1,3,2,2,1,3,1,2,2,1,2,1,2,4,6,2,1,5,4,1,4,1,7,3,h,6,5,1,6,2,6,4",
+    "dap": "5k,u,15,1,6,1,p,7,1f,t,3u,27,d",
+    "dar": "15,4s,2y,v,1a,p,2g,1h,7,5,k,y",
+    "das": "1p,2,d,5,4,2,f,1,13,7,i,d,7,a,3,7,6,b,4,6,e,q,1a,e,2,b,4,5,5,g,6,j,3,3,1,2,1,1,1m,v,6,6,2,1,c,4,4,2,a,7,4,3,o,1,y,e,8,3,1,1,1,l,4,b,4",
+    "dat": "1x,1h,5j,1p,1w,1,29,2v",
+    "dau": "83",
+    "daz": "d7",
+    "da”": "3h",
+    "de ": "4,2,3,9,1,1,2,3,2,3,2,5,4,2,3,1,3,2,2,1,3,2,1,1,1,1,1,1,2,2,1,2,1,1,1,1,1,1,1,2,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,2,1,1,1,1,1,1,1,1,2,1,2,1,1,2,1,1,1,1,1,1,2,1,1,1,2,1,2,1,3,1,1,2,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,4,2,2,4,1,2,1,3,1,2,1,1,2,2,3,1,3,1,2,3,1,1,1,1,1,1,2,1,2,2,1,1,1,1,1,1,1,1,3,2,1,1,1,1,1,3,4,1,1,4,2,1,2,2,1,2,2,1,1,1,1,2,3,2,1,1,2,1,3,3,1,3,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,2,1,2,1,1,3,3,1,4,1,3,1,1,1,2,3,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,2,2,4,1,2,1,4,1,1,2,1,1,2,1,1,2,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,2,1,4,1,1,1,1,1,1,1,1,1,1,1,2,2,1,1,2,1,3,1,2,2,1,1,1,2,2,6,1,3,1,1,1,8,2,3,1,2,2,2,1,1,1,2,1,4,1,1,1,4,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,1,1,1,4,2,1,1,1,5,7,1,1,3,2,1,1,2,1,2,1,1,3,2,2,1,2,2,4,2,1,3,2,3,4,1,1,2,2,1,1,1,1,1,1,1,1,1,1,3,1,2,1,1,1,1,2",
+    "de'": "i3",
+    "de)": "ds,3",
+    "de,": "d5",
+    "dea": "2,14,4a,2u,k,w,1u,1h,g,22,3m",
+    "deb": "t,b,l,m,b0,13,1,33,9",
+    "dec": "47,11,79,16",
+    "ded": "2c,4v",
+    "def": "94,3l,1n",
+    "del": "12,h,7,2,i,5,1,b,5,3,e,5,b,1,2,1,1,3,1,4,9,6,1,6,1,1,k,3,d,1,1,1,1,1,1,1,7,2,1,5,1,w,5,1,1,3,5,3,5,1,1,6,1,5,1,2,2,6,8,1,1,1,8,3,e,8,4,2,2,2,1,3,3,1,2,2,1,1,1,4,2,3,1,2,1g,3,1,2,5,7,1,1,1,1,2,1,2,1,4,2,d,b,2,1,4,4,1,7,2,3,5,3,5,9,2,2,1,1,7,m,3,5,7,9,7,4,f,k,1,2,6,9,1,5,1,4,1,4,2,1",
+    "dem": "i,18,f,2,4,a,2,h,f,6,a,11,2v,y,16,4,c,1,6,1,i,1m,u,2,2j,n,22",
+    "den": "k,15,k,l,7,2u,8,11,o,3s,41,h,1f,4",
+    "deo": "az,4",
+    "dep": "7,f,3,13,1,5,18,f,1e,7,7,f,v,9,4,6,5,d,1,b,2,4,e,a,j,6,5,9,1c,2,3,17,7,o,8,3,2q,2q",
+    "der": "19,z,8,33,e,z,4,2,6,1s,7,f,e,2,d,5,5,5,1,9,7,2b,16,3,1,1e,6,4,b,a,1a,1,p,1",
+    "des": "0,2,1,7,7,h,1,7,i,2,1,2,1,1,1,1,1,3,1,2,1,1,1,4,2,1,1,2,6,1,2,1,1,7,4,1,2,2,1,3,2,2,3,2,1,2,1,1,6,1,g,b,1,4,2,3,1,1,2,1,7,1,3,3,5,1,7,1,1,2,1,1,1,4,8,3,4,4,6,3,2,1,g,1,d,5,1,2,2,4,3,2,2,2,9,3,2,3,c,2,5,m,a,3,7,1,1,2,2,3,2,5,a,1,1,6,v,5,1,1,1,2,2,6,7,6,2,1,8,8,2,1,1,4,3,1,1,6,1,3,4,2,7,3,1,3,6,z,2,4,1,d,b,1,2,c,5,1,4,1,1,2,1,2,1,2,5,1,5,3,1,1,2,1,1,2,2,3,4,1,2,2,3,1,2",
+    "det": "10,3g,2,3x,u,3z",
+    "dha": "7r,ak",
+    "dhe": "4v",
+    "dhi": "4v",
+    "dia": "10,5,x,p,c,2,9,2,3,b,g,2,4,c,1q,2,2,d,8,1,o,j,5,c,1,b,4,9,4,18,f,9,q,4,a,f,1,g,4,3,3,3,d,8,1,6,6,a,1,v,4,1,y,12,1,7,b",
+    "dic": "0,5,3,3,4,d,7,c,a,3,1,2,2,1,3,1,3,1,2,1,6,4,1,1,1,1,1,4,5,4,4,1,1,1,2,2,6,2,3,3,1,4,9,2,2,3,5,6,4,3,3,c,1,1,2,4,5,1,1,2,6,4,1,2,8,8,1,3,1,1,1,1,3,1,2,5,2,5,1,2,3,4,3,2,1,2,5,2,4,7,5,6,3,2,4,8,1,1,1,1,1,4,3,1,2,1,4,3,1,1,2,9,3,1,8,1,2,6,2,2,8,2,8,5,5,1,1,5,r,3,1,7,7,2,9,4,5,4,6,3,5,8,5,3,2,1,6,2,3,8,e,2,d,1,4,2,7,1,6,1,3,2,d,3,2,1,b,4,1,4,1,1,2,1,1,2,1,1,4,5,6,1,1,3,1,1,1,2,1,2,1,1,2,1,1,1,1,3,1,1,1,2,5",
+    "did": "17,w,8x,1i",
+    "die": "1y,6,5,5,2,4,3,4,3,1c,1h,1d,c,d,2o,v,1m,b,b,2v",
+    "dif": "1t,e,1t,1s,38,40,2h,3c,8,2,2",
+    "dig": "0,3,1,1,1,2,1,2,1,1,2,1,2,3,3,2,1,2,1,3,1,4,1,4,4,2,3,1,5,2,k,2,2,4,1,7,1,a,3,6,3,o,4,6,d,j,d,6,a,3,2,1,8,1,e,1,5,8,2,5,5,4,4,4,1,1,2,1,2,3,1,1,1,2,1,1,4,1,4,3,4,c,k,7,2,1,3,1,1,a,t,2,9,w,1,1,1,1,3,a,2,1,6,3,2,1,1,1,1,1,m,6,x,8,1,8,8,2,1,1,1,2,1,h,1,1,6,3,1,2,5,2,1,1,2,3,6,3,1,6,1,3,4,f,c,5,2,3,2,1,2,6",
+    "dil": "1z,11,i,1a,1r,i",
+    "dim": "7a,p,3,l,1i,85,4,t",
+    "din": "1m,34,g,1,2j,k,1,1,1,3j,3a,u,1y",
+    "dio": "g,c,k,2,6,n,4,1,8,13,7,g,6,6,6,2,9,1,a,1,3,c,z,d,1,3,6,4,11,c,2,2,2,5,3,3,2,3,6,4,1,1,1,2,3,2,x,1q,a,c,9,1,1,1,7,4,2,1,7,4,j,c,7,1,2,5,e,5,2,y,9,2,2,t,7,2",
+    "dip": "hi",
+    "dir": "2u,m,1f,87",
+    "dis": "m,5,1b,5,8,q,2n,32,13,8,o,k,6,12,d,3j,n,1p",
+    "dit": "2o,21,4,5,3,1,c,3,3,3,e,q,9e,19,g,14",
+    "diu": "7,7,b,5,k,1,d,5,1,2,5,1,1,4,1,1,3,8,d,a,9,1,s,3,8,6,2,1,1,1,1,3,1,b,1,4,8,1,j,b,8,5,4,2,4,1,9,4,1,1,3,2,4,5,1,1,1,6,2,g,a,1,4,1,2,2,2,e,g,4,p,6,4,3,3,s,1,2,i,7,9,2,1,1,2,5,3,3,2,1,1,6,1,1,1,1,2,3,2,1,1,1,8,1,2,4,1,n,5,c,7,2,w,3,g,s,i",
+    "div": "1p,24,9b,9,4c,u",
+    "diz": "im",
+    "dl)": "fk",
+    "do\n": "az,7f,t",
+    "do ": "m,3,5,c,d,6,5,2,5,3,2,1,3,1,3,1,1,1,3,1,4,2,2,5,4,2,2,5,1,1,4,1,1,1,1,1,7,1,8,1,4,2,3,1,2,3,7,2,1,1,8,5,4,2,1,4,1,1,1,1,1,2,1,1,2,2,2,4,2,1,3,3,1,7,3,2,4,1,2,1,6,4,4,3,6,1,8,7,6,4,1,1,3,b,e,1,3,3,7,1,8,8,1,1,2,2,1,1,1,2,2,2,1,2,2,1,1,1,2,1,1,1,1,2,3,1,1,6,4,a,5,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,5,1,5,1,6,2,1,1,5,2,1,1,1,2,1,1,1,5,2,1,2,1,1,3,3,b,6,1,8,5,6,4,5,1,1,4,5,1,1,1,3,2,4,2,3,2,4,2,3,1,1,2,1,2,4,1,2,2,2,5,6,1,4,4,6,2,4,5,2,2,5,4,8,2,1,3,1,1,3,1,2,1,4,4,3,3,1,3,1",
+    "do)": "99,3s",
+    "do,": "2q,s,l,1v,24,1k,j,m,b,1z,1o,4j",
+    "do.": "14,2,68,r,d,1,2g,b,1c,d,b,b,f,3,8,39,1k",
+    "dod": "a3",
+    "dol": "4,g,d,f,3,o,b,1,6,p,a,1x,f,a,x,1f,l,6,6,5,8,2,5,l,27,5,h,a,22,1,f,8,6,3,q,c,1,4,b,2,3,b,1,6,3",
+    "dom": "e,6b,6q,3,t,30",
+    "don": "28,1o,26,2e,55,4m,l",
+    "dor": "a,o,c,1,6,8,1,2,7,n,7,7,i,1a,1,6,5,2,g,7,2,b,1,7,1,4,3,4,b,n,2,b,8,5,1,2,1,6,1,2,9,1,5,e,5,9,4,1,1,2,2,3,1,1,2,1,5,2,1,4,5,7,1l,4,5,h,b,c,b,i,2,18,2,5,2,k,e,2,4,1,s,3,d,3,2,6,1,3",
+    "dos": "6,i,3,1,8,4,3,e,2,t,1,2,i,4,f,b,d,f,h,4,3,5,2,b,p,c,1,c,4,c,h,d,f,8,1,1,4,1,3,9,6,1,4,6,4,q,i,1i,1,e,1,d,l,1,9,m,2,5,6,a,v,1y",
+    "dra": "c,1d,2g,6,2,v,c,g,3,5,5,1f,j,1,2,7,1p,7,1d,o,5,d,c,5,f,1,b,11,5,3,21,3,2,5,7,1,e",
+    "dre": "r,v,fn,1l",
+    "dri": "42,a1,h,3l",
+    "dro": "3o,n,9,9,5,o,4c,49,e,25,7,11",
+    "dru": "6,3i,7h,4p,w,25",
+    "dry": "2t",
+    "dsi": "60",
+    "dsu": "2z",
+    "dua": "47",
+    "dub": "cz",
+    "duc": "w,c,b,6,d,9,1s,1h,g,4,v,b,s,5,6,m,1,3,z,1,4,7,1,1,1,5,1,5,j,7,t,4,1,6,i,b,4,1o,d,1,c,1,k,9,7,e,y,1,3,1,1,6,1,1,1,7,2,1,3,1,2,1",
+    "dul": "n,i,3,7,h,o,b,1,p,4,m,f,1g,1,7,8,c,h,6,g,2,2,7,5,5,5,1,n,n,1,1,3,1,3,1,1,2,1,5,2,1,4,2,3,5,5,14,3,2,1,1,1,1,2,2,3,1,1,1,1,2,9,1,2,1,1,5,h,2,16,9,r,19,2,1,1g,6,1,2",
+    "dum": "a2,7u,k",
+    "dun": "2z",
+    "dur": "2a,j,5,2c,1m,5p,p,7,b,4,1,2,c,1z,1m,6,8,n",
+    "dus": "3b,s,f,5d,2r",
+    "dyc": "a5,8c",
+    "dym": "17",
+    "dys": "z",
+    "e\na": "1,1,h,3,1,1,4,3,1,4,3,1,2,2,2,1,2,a,1,2,1,4,1,4,1,1,g,2,8,4,8,1,1,1,5,2,1,2,6,3,2,3,1,1,8,2,1,1,7,4,3,2,1,1,4,2,5,8,6,1,2,2,2,1,3,2,1,1,2,1,2,1,1,1,5,2,2,3,2,2,1,4,1,1,1,1,1,1,1,1,1,1,1,7,2,1,6,2,2,1,1,1,1,6,1,1,1,1,2,2,1,9,c,1,2,1,1,1,1,2,1,1,1,1,4,2,1,2,1,h,2,1,6,7,7,4,4,5,2,4,g,4,4,q,4,1,1,1,4,1,3,2,1,5,1,3,3,d,3,1,3,1,1,1,2,1,3,2,6,1,4,1,2,6,1,1,2,2,1,1,2,1,1,4,1,1,4,3,3,2,6,3,1,7,6,a,1,5,1,3,3,6,a,4,1,4,5,3,1,2,4,2,2,11,1,5,5",
+    "e\nb": "1c,1,3o,3l,f,1,q",
+    "e\nc": "11,v,1e,21,1k,7,9,5,22,2v,u,1d,3,v,m,4,19,3",
+    "e\nd": "3,8,3,1j,3,5,1,a,9,c,1l,c,u,1,j,1i,1,1,8,2,1,1,x,5,1,6,5,13,g,9,y,f,4,6,e,2,6,9,1,7,6,3,3,1,1,1,a,4,c,8,s,2,o,n,1,7,19",
+    "e\ne": "x,f,17,p,1,18,4,y,7,a,2,8,1,15,f,1x,5,2u,r,5,15,h,g,j,2,9,1",
+    "e\nf": "1q,21,l,1,1a,7,1w,1m,35,6b,c",
+    "e\ng": "32,cw",
+    "e\nh": "h,o,e,1,p,i,e,1g,10,k,h,w,20,8,2y,c,h,f,1,b,h,j,c,13,i,h,8",
+    "e\ni": "29,29,t,13,8,2e,14,7,d,4,3v,2",
+    "e\nl": "2q,1,g,3h,1o,5w",
+    "e\nm": "1z,63,23,m,1y,5,9,3q,1r",
+    "e\nn": "2n,v,t,41,d,1l,v,e,24,1q,3,j,5,2r",
+    "e\np": "14,6q,30,1s,17,2e,7,2b",
+    "e\nr": "19,g,1z,10,q,53,h,6,18,2,1,1,3,1,5,h,8,1,3,x,y,8,3,x,s,3,3,c,4,1,o,f",
+    "e\ns": "2p,p,4p,r,k,1o,2,28,1,p,1j,1,o,18",
+    "e\nt": "q,24,2f,12,1g,1,o,6,3,5e,1g",
+    "e\nv": "3m,t,s,1e,2a,1v,6,k,6,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,n,n,5,e,b,1,o,2,2,t,3",
+    "e '": "9n",
+    "e (": "14,m,12,2s,3p,q,2s,9,b,5,8,2,2,3,3,1,2,8,1y,2,z,1n",
+    "e a": "4,2,b,2,1,2,3,2,e,9,4,9,d,1,1,2,6,3,5,1,4,3,1,1,3,4,1,b,a,3,3,6,4,3,2,1,2,2,3,1,2,1,9,n,2,6,4,g,6,d,3,6,l,5,e,3,1,1,1,a,h,4,9,8,7,2,4,3,1,2,2,5,1,3,7,4,5,6,6,1,1,2,1,2,1,1,1,t,8,3,2,1,c,4,2,1,1,2,1,5,5,14,8,2,a,a,2,2,2,1,2,1,5,6,1,7,2,7,1,4,1,1,1,b,6,d,5,h,6,2,2,1,2,4,3,8,1",
+    "e b": "1p,2e,s,8,y,2,n,1d,4,14,1e,3,h,1k,e,7,6,1g,j,o,17,7",
+    "e c": "4,10,k,4,5,2,5,2,2,6,1,3,4,4,1,8,5,6,1,1,7,5,1,1,3,c,1,6,2,4,7,e,3,3,7,2,4,b,8,3,g,3,4,8,1,5,3,3,1,c,7,3,3,1,2,3,2,1,5,2,1,5,1,3,5,7,2,h,4,5,8,7,8,1,7,1,d,2,2,2,1,2,1,t,8,7,2,1,1,1,2,5,4,4,1,1,1,4,4,q,2,2,7,2,4,7,2,3,3,2,1,1,a,5,2,1,1,5,4,5,1,1,1,5,3,1,3,6,8,4,1,6,6,6,4,2,3,7,6,2,5,3,4,1,6,9,1,2",
+    "e d": "6,n,1,3,5,4,1,3,9,a,5,6,3,3,4,3,9,z,7,9,1,5,m,b,6,4,2,5,7,3,7,2,5,3,k,c,7,6,8,1,8,2,2,2,2,7,1,x,7,3,5,3,9,a,1,5,6,6,4,2,1,b,t,6,1,1,2,4,3,1,5,2,1,4,1,2,1,1,1,7,5,7,1,3,2,10,a,4,5,2,2,c,1,3,4,f,2,7,d,6,t,1,e,3",
+    "e e": "b,2,3,3,3,1,4,4,9,m,1,5,3,1,2,1,3,2,3,2,6,4,5,2,1,1,4,1,2,1,3,1,5,b,2,3,3,5,3,1,6,4,3,1,n,9,3,4,3,4,7,1,c,3,d,1,8,2,3,1,1,7,b,g,1,4,3,a,5,3,8,d,1,g,4,1,3,1,4,9,1,3,l,4,1,2,1,h,3,1,5,2,5,2,2,1,1,2,7,1,1,4,2,4,6,6,4,2,1,a,1,3,d,p,g,7,1,4,2,a,1,b,1,d,b,1,d,2,7,d,1,1,2,1,1,1,2,5,1,1,1,1,3,1,2,2,1,1,2,1,2,1",
+    "e f": "r,z,11,b,r,1h,5,36,1,6,h,n,h,p,3,g,r,1,6,e,8,5,2,6,2,6,7,16,9,m,23",
+    "e g": "1u,u,o,x,7,n,h,e,9,v,17,9,10,1n,1m,2,u,2,j,h,6,h,4,l,9,17,9,3,y,3,b",
+    "e h": "1p,e,1,2,1,7,2,1,c,4,1,6,2,16,6,i,a,2,a,1,2,7,18,t,r,h,3,8,q,6,4,2,1,1,3,1,k,1,7,1,1e,9,1,8,a,o,3,1d,6,6,e,v,4,4,q,d,a,3",
+    "e i": "1w,8,v,k,20,3y,z,5,k,23,16,1s,12,l,b,1,1,b,e",
+    "e j": "1m,18,2d,32,z,19,6p,e,j",
+    "e l": "9,n,5,7,6,2,2,1,5,1,2,3,4,4,1,5,2,3,2,1,2,1,1,1,1,1,2,4,4,4,1,1,2,1,4,1,2,3,1,1,2,1,5,b,2,1,2,3,6,2,6,6,2,e,2,8,3,1,2,4,2,5,1,2,4,9,4,1,1,1,1,c,3,2,2,1,2,2,1,5,3,3,1,3,3,8,4,1,3,1,1,3,1,2,1,4,1,2,8,1,2,2,9,3,5,2,3,1,1,3,1,2,1,1,1,1,4,2,2,e,1,2,1,1,1,1,1,3,7,6,1,y,1,2,1,1,2,3,1,2,2,3,2,3,1,5,1,2,2,2,2,1,d,2,2,5,2,a,b,8,2,5,2,1,6,1,6,f,1,6,3,4,1,2,4,2,7,1,4,2,6,1,l,5,2,3,3,7,2,1,3,2,4,1,1,2,1,1,3,1,3,3,1,3,2",
+    "e m": "6,e,a,2,o,2,2,b,2,9,4,3,3,6,6,d,r,k,r,a,2,4,1,4,2,1c,3,9,c,e,9,i,7,6,1,2,2,3,b,s,5,6,1,5,1,1,1,4,11,1,a,24,s,2,8,1,4,1,5,1,1,3,5,1,1,6,1,a,f,1d,4",
+    "e n": "w,9,1,v,9,1f,3,z,1k,3v,k,6,p,12,1,5,p,r,1a,9,d,9,10,7,7,h,k",
+    "e o": "k,n,4,x,15,2,i,q,q,h,g,k,k,2,c,17,9,b,6,4,36,1t,1,o,6,q,16",
+    "e p": "5,9,1,5,3,1,d,4,6,a,4,1,3,2,1,5,1,1,1,1,1,3,5,2,2,9,6,9,1,2,7,3,4,3,1,1,3,1,1,5,9,g,1,1,6,4,2,2,6,8,1,1,8,2,3,6,3,7,2,n,4,5,g,3,7,9,5,2,4,1,g,3,2,5,5,3,7,1,3,1,2,7,1,4,a,1,2,3,7,1,2,d,2,w,1,2,1,4,1,3,2,2,1,5,3,5,6,4,4,2,4,4,2,5,6,2,9,d,2,b,1,1,a,3,7,4,5,2,6,4,2,8,a,1,c,3,3,1,3,1,1,2,1,6,2,3,k,3,4,7",
+    "e q": "4,j,16,3h,36,18,j,1b,3,11,7,i,d,1h,7,v,2,2f",
+    "e r": "1h,7,3,y,1,10,1l,5,1,c,g,3,5,d,1z,b,j,6,13,f,1i,4,7,a,7,4,3,n,8,3,p,t,w,f,5,7",
+    "e s": "i,7,4,a,7,3,b,1,1,1,2,6,4,2,2,1,3,5,a,2,1,5,3,1,1,4,1,2,1,2,c,7,3,c,6,4,i,7,c,9,1,1,1,3,f,2,1,5,8,7,4,2,7,5,e,5,6,2,c,5,1,2,4,2,3,5,1,3,9,3,1,3,3,1,5,h,2,1,4,d,3,4,16,5,2,7,5,6,2,3,1,4,1,3,c,1,2,3,2,4,2,3,1k,3,1,1,c,2,5,8,2,4,d,1,8,5,2,5,a,3,3,5,7,6,2,4",
+    "e t": "q,z,c,1,2,1,e,b,a,1,4,1z,7,3,8,3,1v,p,19,5,9,d,d,2,b,7,8,14,1,d,3,15,9,1u,3,u,d,7",
+    "e u": "c,q,2,3,i,d,f,1,3,4,2,1,2,5,1,e,1,9,4,2,1,3,2,5,3,1,5,3,6,4,6,5,5,2,8,3,1,6,4,1,2,1,1,1,7,1,1,1,1,6,1,4,2,3,5,2,2,2,6,4,5,2,1,1,2,1,1,2,2,1,b,a,2,1,4,1,7,1,4,6,3,1,2,6,6,b,2,e,1,1,3,3,b,k,2,r,4,7,5,2,4,2,2,6,1,1,1,3,4,b,b,1,4,1,1,2,7,1,1,5,1,2,1,2,1,2,6,6,e,1,5,3,2,4,1,5,6,3,2,1,d,4,3,2,4,2,2,2,1,1,c,3,2,1,1,1,2,7,1,1,3,2,3,3,3,6,2,1,6",
+    "e v": "1i,7,s,1y,4,1k,10,19,9,1b,3,r,w,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,2,4,6,a,6,6,2,n,c,10,29,7,9,p",
+    "e y": "j,f,m,6,18,t,e,1,6,5,4,e,15,2,a,7,l,9,i,2,2,2,1,2,5,4,2,h,5,2,8,p,7,a,7,3,4,5,2,1,3,4,x,7,2,7,3,1,4,5,2,1,2,7,g,3,2,6,1,3,2,p,3,9,2,5,p,z,4,4,3,6,w,8,2,9",
+    "e z": "2m",
+    "e\",": "8k",
+    "e'.": "i3",
+    "e)\n": "54,8o,3,6",
+    "e),": "1q",
+    "e, ": "b,j,1,7,13,1,10,5,e,7,6,n,1,u,3,1b,6,a,1,3,5,1,b,4,1,3,b,4,5,i,3,1,d,i,b,8,e,1,1,1,3,6,x,3,2,9,2,6,4,1,b,1,g,f,p,b,m,1,b,l,8,8,n,m,1,8,2,a",
+    "e. ": "1m,49,1l,q,4c,6,5,2,m,6,14,4,4a",
+    "ea\n": "9d,66",
+    "ea ": "1e,2,6,4,9,z,9,8,s,3,f,g,5,l,q,x,5,8,6,7,g,g,7,c,e,1c,7,1b,6,b,9,7,3,1i,4,2,2,b,d",
+    "ea'": "9n",
+    "ea)": "2f,79",
+    "ea,": "23,fr,14,a",
+    "ea.": "1p,n,20,4,5l,30,x,d,1w",
+    "eac": "d0",
+    "ead": "26,1,11,et",
+    "eal": "2,14,4a,1,2t,k,w,3r,3l,a,1t",
+    "eam": "4r,z",
+    "ean": "5q,7g",
+    "ear": "24",
+    "eas": "i,i,54,15,1a,61,6,1w,h,1i",
+    "eat": "50,5e,5e",
+    "eax": "fi",
+    "eba": "15,gf",
+    "ebe": "t,b,c7,1w,1t,i",
+    "ebi": "1p,b,b,45,x,w,m,1d,2f,1r,1,1s,4,1g",
+    "ebl": "42,4",
+    "ebo": "d,1t,3u,14,3m",
+    "ebr": "13,4,8,k,7,s,k,9,d,8,1,k,9,3,1,d,7,17,2,1,n,y,g,1,3,3,3,m,2l,1,3,d,1,15,4,9,t,11,u,1a,3,7,5,3,1,5",
+    "eca": "9h,3j,i,g,1m,1x,1",
+    "ecc": "2,q,h,j,t,e,7,6,9,2,4,a,6,g,7,1,6,c,b,6,1,8,e,2,4,3,7,o,2,1,4,4,o,h,3,9,3,c,h,3,2j,y,2,l,5,3,2,3,q,1b,g,a,j,r",
+    "ece": "1p,1,m,2,a,1,4,9,6,c,1y,4,l,o,p,c,k,1m,2,3,4,2,a,5,g,2,4,1,2,x,3,1,3,3,1,a,3,s,c,6,3,a,q,4,1,3,k,1c,5,b,b,1,1,4,1,2,5,2,1,1,8,3,1,2,1",
+    "ech": "w,x,7,e,e,1,8,14,23,12,d,1h,25,c,q,3m,1,k,9,14,3",
+    "eci": "6,9,1,4,2,12,3,1,2,5,9,7,3,6,m,1,5,r,w,3,f,6,e,s,6,3,3,2,4,2,1,p,a,1,9,d,m,3,4,9,2,4,d,2,4,1,b,1j,6,6,c,4,j,c,b,11,3,1,c,7,1,2,2,4,4,6,1,8,1,7,2,7,7,c,5,b,1,3,1,2,d,4",
+    "eco": "w,1s,e,23,3,3a,12,2x,11,5,e,e,12,h,1,j,y,1m,5",
+    "ecr": "9e,6e",
+    "ect": "1,1,5,2,2,1,1,1,2,1,2,2,1,3,1,2,3,2,c,1,2,a,1,1,2,1,4,9,8,1,5,6,8,4,1,4,2,1,2,1,1,4,2,5,1,3,8,1,3,4,1,2,7,1,3,b,5,3,4,4,5,2,5,2,2,2,4,7,4,8,1,1,2,1,2,1,4,1,3,4,7,3,2,3,2,2,1,4,4,2,1,1,5,2,3,6,4,1,2,5,3,2,2,1,3,1,4,2,3,3,1,5,9,1,6,1,2,4,4,2,3,6,a,a,9,18,1,3,1,4,7,6,5,3,5,1,1,1,5,3,2,1,2,4,3,1,4,c,2,5,3,1,d,2,1,2,5,1,5,2,5,1,1,6,2,5,4,2,2,1,3,1,2,3,2,6,4,2,2,4,2,1,4,s,1,5,9,2,5,1,1",
+    "ecu": "w,26,b,1i,m,1b,b,1j,47,3,8,9,s,9,1k,k,6,g",
+    "ecz": "6n",
+    "ed ": "db",
+    "eda": "0,2,1,7,1,6,6,1,a,5,3,d,1,4,2,1,2,1,1,1,1,1,3,1,2,1,1,1,4,1,1,1,1,3,1,4,1,1,3,1,a,3,2,1,2,1,2,2,5,3,1,1,6,1,g,9,2,1,3,1,5,1,2,1,1,b,7,1,1,4,a,4,4,4,2,1,4,4,9,1,1,1,7,2,8,5,e,4,2,2,3,2,2,2,7,2,3,1,1,2,1,1,1,a,2,2,3,2,3,3,1,1,3,9,8,2,3,7,1,1,4,3,h,1,1,1,1,z,6,1,1,2,8,7,9,8,8,2,1,1,4,3,1,1,1,5,4,4,9,2,1,1,3,6,h,o,1,3,a,9,2,1,2,9,5,1,2,1,4,1,1,2,1,2,1,2,5,6,3,1,1,3,1,2,1,1,3,4,1,2,1,1,1,1,1,1,1,1",
+    "ede": "15,14,7,l,i,1c,5,5f,57,7,d,e",
+    "edi": "g,c,k,2,6,4,1,2,2,1,3,1,3,3,1,2,2,2,3,1,1,1,1,1,1,4,5,1,3,4,1,1,5,8,7,d,7,3,2,4,6,3,4,1,1,3,3,1,1,1,2,2,4,2,3,1,2,3,4,3,4,3,d,5,1,1,1,4,1,g,3,2,5,2,1,7,o,i,2,2,2,6,2,1,2,2,3,a,1,2,2,3,7,3,2,4,2,2,a,h,1,1,7,q,b,j,3,5,8,2,8,d,5,c,1f,2,5,1,13,4,2,4,1,2,2,4,5,6,1,1,3,1,1,1,2,1,1,1,1,1,2,2,2,3,1,1,1,2,5",
+    "edo": "1p,1,2u,e,k,4l,44,e,2y,s,v",
+    "edr": "r,v,22,ea,2",
+    "edu": "15,3,u,t,1,3,m,4,2f,1y,b,q,z,1,4,7,1,2,5,6,2,1l,1,6,i,b,4,1o,d,1e,y,e,1,3,1,1,6,1,1,1,7,2,1,3,1,1,1",
+    "ee ": "1t,2,1,5,1,2,15,74,b",
+    "eem": "3g",
+    "eet": "bz",
+    "eex": "j5",
+    "efa": "x,o,i,5b,l,7q,u",
+    "efe": "1,6,4,1,1,6,3,9,t,2,m,6,e,5,6,3,q,w,8,o,11,f,3,2,1f,2,3,3,4,f,4,p,9,a,1u,r,7,b,1,6,7,f,5,s,e,8,b,c,2,e,13",
+    "eff": "2u",
+    "efi": "8,a,m,6,g,1,e,w,8,2,6,n,6,6,1,j,l,9,z,18,q,2,b,a,7,c,s,3,8,1e,3,f,5,6,b,2,5,1j,2,3,2,s,h,6,e,3,3,9,r",
+    "efo": "p,r,40,47,9h,1",
+    "efr": "4,8r,e,39,f,k,f,31,q,8,4,1",
+    "efu": "as,u,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,5,4,3,3,2,5,4,4",
+    "ega": "3,17,r,28,t,20,j,1v,i,5a,7,1g,e,m,12",
+    "ege": "19,6,a,3,11,1a,18,i,9,1d,5,17,b,7,6,r,1,27,5,a,l,8,2,5,8,o,i,5,o,1h,x,5,6",
+    "egi": "28,2,k,y,3d,1g,v,4t,5,11,2x",
+    "egm": "d9,4",
+    "ego": "17,s,3e,56,3v",
+    "egr": "v,2,3z,j,2s,h,25,3c,d,g,p,i,9,10",
+    "egu": "a,9,d,9,b,1,4,1u,d,2,r,7,1,c,9,8,14,o,6,6,b,4,4,5,3,1,6,t,3,5,9,6,e,m,2,1f,1,3,2,1,6,7,a,1,4,6,c,t,1,13,d,6,14,8,u,h",
+    "ehm": "8h",
+    "eib": "4d",
+    "eic": "4a,6,6w,13,16,d,d,9,6",
+    "eif": "33,e,33,c5",
+    "eij": "d1",
+    "ein": "5f,w,3o,y,e,a,r,1,n,3,27,8,4,d,4,6,1",
+    "eis": "a2,i,b,c,79",
+    "eit": "1a,13,6,7,f,3,g,d,a,1y,l,8,6,2a,g,2p,8,2s,e,u",
+    "eja": "r,v,3o,2p,2i,u,5l",
+    "eje": "2c,65,4l,c,n",
+    "eji": "7,4o,y,12,48",
+    "ejo": "b,4,1k,2,9,w,c,b,2,1e,g,f,7,3,3,4,6,a,i,6,2,6,5,c,1,4,4,2,a,p,3,1,b,2,1,4,7,i,7,18,4,1,1,3,2,1,4,7,2,4,4,1,h,l,4,4,3,b,2,f,b,e,2,1,5,3,3,9,5,1,1,1,h,1,r,1,1,1,1,1,1,1,1,2,1,1,1,3,2,1,5,1,3,3,2,1",
+    "eju": "2m,e,ej,s,s,3",
+    "el\n": "83,q,1h,2j,7,9,5h",
+    "el ": "b,1,8,1,1,1,2,1,5,1,6,3,5,4,1,4,1,4,1,1,1,1,1,2,3,1,2,1,1,1,4,2,3,1,1,1,1,1,3,1,2,1,1,1,5,1,1,1,3,4,2,2,1,2,1,3,1,6,1,3,1,1,2,1,1,1,2,1,1,1,1,1,5,4,2,2,2,1,1,4,1,1,1,4,5,b,1,1,1,3,2,4,2,2,1,1,1,1,1,1,1,2,4,1,2,1,4,1,1,2,1,3,1,5,5,1,1,3,6,3,1,3,2,1,1,2,1,1,3,1,3,1,2,2,1,1,1,4,1,1,5,1,1,1,1,1,1,3,2,4,1,1,2,1,1,1,1,2,5,1,2,2,3,1,1,1,1,2,2,1,1,5,2,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,2,1,1,1,3,3,2,1,3,3,4,1,e,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,2,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,2,1,2,2,1,1,4,2,1,1,1,1,1,3,2,3,1,1,1,1,2,1,1,2,2,1,2,3,2,2,2,1,1,2,1,1,1,1,1,3,2,6,3,2,1,1,1,1,4,2,1,3,2,1,2,3,2,1,3,1,1,1,1,1,1,2,1,2,2,1,2,1,1,2,1,2,1,1,1,1,1,1,2,1,2,2,4,1,5,1,1,1,1,3,1,1,3,2,2,d,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,2,1,1,1,1,1,1,1,1",
+    "el)": "5k,9f",
+    "el,": "18,2l,i,1k,8,3a,5w",
+    "el.": "n,q,23,5,a,6,y,2,c,18,3,r,6,16,2p,1f,5,k,p,11,2b,7,7,2,2,w",
+    "ela": "0,6,d,1,3,d,b,9,4,8,1,9,7,6,2,1,3,p,a,6,4,3,p,v,1d,6,4,5,9,v,b,1,1,o,4,o,7,c,b,1c,c,q,1f,r,o,1,8,5,g,c,8,11,2",
+    "eld": "8,27,4v,8n,13",
+    "ele": "5,9,5,2,3,d,7,3,1,c,6,c,n,m,d,j,4,6,15,3,7,2,y,r,m,8,2,g,c,1,6,1,2,4,3,4,1,3,2,8,4,4,g,j,s,6,4,d,8,4,7,1,1s,7,8,2,3,j,c,14,i",
+    "eli": "6,1,h,2,1z,6,p,1,w,a,f,2,7,5,d,1e,1,c,5,g,6,a,g,m,9,b,f,6,2,6,19,7,5,10,2,14,h,1s,12,u",
+    "ell": "g,f,1,w,1a,2,1,3,n,11,14,l,1,3,6,x,11,h,10,5,6,5,1,1,6,j,10,f,5,t,7,3,1,1,c,9,7,i,f,3,7,d,6,q,19,3,9",
+    "elo": "34,y,34,12,2i,u,8,5,4,8,k,3a",
+    "elp": "az,26",
+    "els": "3k,6a,5p",
+    "elt": "go",
+    "elu": "9c,v,6,l,1g,6,1h,1b,s",
+    "elv": "67,25,4m,5t,3",
+    "ema": "4,4,a,6,2,5,7,4,1,b,8,f,1,1,e,3,b,1,6,3,a,3,1,2,3,3,4,9,6,9,4,5,2,1,1,5,3,5,3,a,2,2,7,2,4,b,5,6,1,2,1,m,1,9,2,1,1,4,f,1,2,1,5,4,1,2,c,5,9,c,1,1,2,1,5,3,1,1,2,6,1,1,5,8,3,d,6,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,5,4,3,3,2,5,4,4,8,3,5,6,1,5,3,a,6,1,9,1,u,b,1,2,7,1,5,1,2,5,4,2,3,1,3,5,1,2,6,c,5,1,7,1,5,1,1,2,2,3,2,1,1,1,3,1,3,1,1,2,1",
+    "emb": "2g,p,2f,i,k,y,61,4y,7",
+    "eme": "g,2,a,1,1,8,6,4,2,2,1,1,2,1,9,c,1,c,1,3,m,e,n,6,6,7,1,9,1,1,d,4,8,a,11,5,2,2,3,12,e,2,2,2,8,3,2,3,1,9,1,3,1,3,9,11,1,4,5,20,2,8,i,1t,g,h,c,4,12,l",
+    "emi": "c,7,c,1,9,5,7,1,9,d,7,4,2,a,b,3,3,1,6,d,t,3,h,o,7,2,9,9,2,3,4,2,b,5,1,4,q,3,w,c,d,4,6,e,s,7,1a,2,2,8,1,b,1,2,2,7,7,2,1,a,p,8,1,1,1,1,1,1,6,1,2,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,2,1,1,1,8,1,7,h,1,5,1,3,5,8",
+    "emn": "bb",
+    "emo": "10,3,7,2,1,3,j,c,b,i,3,b,1,3,n,2,2,4,j,2,p,6,3,2,j,3,3,a,8,4,2,g,7,m,1,d,4,3,9,5,1,4,o,3,25,2,2,8,1e,1,5,1m,n,5,b,i,v,d,3,3,1,2",
+    "emp": "24,2,1,3,n,a,1,1,d,1k,4o,5,3m,43",
+    "emu": "2n,58,1e,1w,1m,u,2,58",
+    "en\n": "8l",
+    "en ": "7,3,3,1,2,1,1,1,d,1,1,6,3,2,1,1,2,6,2,3,1,1,1,1,1,1,1,4,1,1,2,1,1,3,1,2,1,1,1,2,1,2,1,1,2,1,1,2,1,1,1,6,1,1,1,1,1,2,1,6,1,9,2,2,1,2,3,2,3,4,5,1,5,2,3,1,1,1,1,5,5,5,1,2,2,1,1,1,2,2,1,1,1,1,2,1,2,2,1,3,1,4,9,1,1,1,3,2,2,1,2,2,2,2,1,1,2,1,3,4,1,1,1,6,1,3,1,7,4,5,1,2,1,1,3,1,1,1,1,2,1,1,1,1,3,1,2,1,4,3,3,3,4,1,1,1,2,1,2,1,1,1,2,1,1,1,3,4,1,2,1,1,6,3,1,3,2,4,1,1,2,3,1,1,1,1,1,1,1,2,1,1,1,1,1,1,3,1,1,1,1,1,3,1,1,1,1,1,2,q,1,1,1,2,1,1,1,1,1,1,1,1,2,1,1,2,3,1,3,1,3,1,1,1,1,1,1,1,1,1,1,3,1,2,3,1,1,1,1,1,1,1,1,2,1,2,1,1,1,1,1,1,1,2,3,1,1,1,1,1,3,1,1,2,1,1,1,2,1,2,1,1,1,1,2,3,2,3,2,1,1,2,1,1,1,2,1,1,7,3,1,1,1,1,1,1,3,1,1,3,2,4,2,6,a,8,5,2,1,1,2,3,1,1,1,2,3,1,2,1,1,1,2,1,1,4,1,1,1,1,2,1,1,1,2,1,1,1,1,1,1,1,2,2,1,2,1,1,1,1,2,1,1,1,1,1",
+    "en)": "8p",
+    "en,": "89",
+    "ena": "5,c,6,6,1,e,3,5,1,1,3,k,8,6,q,1k,c,10,w,4,7,2,b,e,4,5,2,i,e,8,4,b,9,k,l,9,z,5,1,1,9,3,8,1,j,c,c,y,5,1g,8,i,5,2,4,5,1,9,g",
+    "enb": "f3",
+    "enc": "1c,t,6,2,6,2,k,3,g,9,4,z,16,8,g,8,5,1,b,7,8,4,1,k,d,3,f,5,2,7,9,v,1,5,1c,6,2,6,6,1d,1,o,6,7,2,m,1,8,e,r,6,b,8,4,1,1,3,1,9,4,6,4,3",
+    "end": "15,3,7,f,2,8,g,11,q,34,6,h,l,4,o,j,2,5,2o,3,k,3,k,c,5,u,o,3,2,17,4,7,l,4,8,l",
+    "ene": "8,4,7,8,9,a,f,1,2,1,c,3,1,6,2,5,7,1,7,2,6,2,6,8,7,1,5,4,3,7,8,8,1,a,8,5,3,6,8,9,1,2,1,2,d,a,4,3,5,1,a,1,2,8,5,4,2,3,1,5,6,2,7,7,3,2,f,4,1,6,3,1,a,6,3,3,2,6,j,v,3,3,1,1,1,5,1,1,2,2,2,1,2,4,2,1,1,1,6,2,2,1,b,6,3,3,3,3,1,4,6,1,4,4,8,1,1,3,2,2,4,1,2,9,2,2,1,8,b,2,3,9,1,1,1,6,2,3,1,4,1,1,1,2,3,2,7,5,4,2,1,2,1,1,2,1,1,9,8,1,2,3,1",
+    "enf": "h,1a,6q,s,45,1t,3c",
+    "eng": "i,k,s,f,i,3d,a,13,1,1,p,8,3,4,7z,h,17,3,8,7,d",
+    "eni": "e,5,10,v,a,8,8,18,h,2,l,3,3,a,e,7,16,3,d,b,a,g,b,5,1,5,o,e,f,f,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,5,i,2,4,8,7,2,2,7,j,3,1,8,2,r,2,3,5,g,k,1r,d,2,7,2",
+    "enj": "1i,z,4v",
+    "enn": "28,h,20,y,3n,o,m,7q,d,c",
+    "eno": "a,3,a,9,n,w,h,6,2,1,e,c,r,8,6,4,3,7,4,2,9,9,c,3,i,5,3,c,1,6,1,8,2,2,a,3,6,1,1,a,1,1,r,5,2,1,2,1,b,a,8,q,q,5,5,b,a,5,9,2,2,q,3,8,1,h,r,8,c,e,2,b,i,7,f,1,2,g,3,3,3,1",
+    "enr": "1g,87",
+    "ens": "8,x,b,1,4,1,1,2,3,8,2,7,6,1,3,k,c,7,8,y,1,a,2,1,6,3,4,2,1,7,7,3,2,7,f,2,2,f,1,3,8,6,a,4,c,d,9,5,4,5,2,5,5,4,7,6,1,l,n,z,2,3,1,11,c,a,j,1,5,j,6,7,g,n,7,5,9,t,3,p",
+    "ent": "2,2,1,9,1,1,1,3,1,3,3,3,1,1,1,3,1,1,2,2,4,1,1,1,1,3,1,2,1,3,2,1,1,1,4,1,1,1,1,2,1,1,1,1,1,1,1,4,1,1,1,1,2,2,1,4,3,5,5,2,1,2,4,1,2,3,3,4,1,1,1,2,1,1,1,3,1,2,1,1,3,2,1,1,1,1,1,1,1,1,1,3,1,3,1,2,1,1,1,1,3,1,1,2,1,1,1,1,1,1,1,2,2,1,2,2,2,1,1,1,3,2,1,2,1,1,1,1,1,2,1,1,4,1,1,5,1,2,1,2,2,3,2,2,3,1,1,2,1,2,1,1,1,2,2,1,a,1,1,1,2,1,2,1,1,1,2,1,1,2,1,1,1,3,2,2,1,1,2,1,1,1,1,1,4,1,2,4,2,1,1,1,1,1,3,1,1,1,2,3,2,2,1,3,2,1,2,2,2,1,1,2,2,1,1,1,1,2,1,1,3,3,1,1,1,4,2,1,2,1,3,2,1,1,1,1,1,2,2,1,2,2,1,1,3,1,s,2,4,1,1,2,3,1,2,1,1,1,1,2,1,2,1,1,1,1,2,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,2,2,1,3,1,1,1,1,1,3,1,1,1,2,1,1,1,1,4,1,1,1,1,1,2,2,1,1,3,4,1,1,1,1,5,1,1,3,1,1,2,2,4,1,1,1,1,3,1,1,2,1,1,2,1,2,1,1,1,1,2,1,3,1,1,1,2,1,1,3,2,1,1,1,1,5,3,1,3,1,1,1,2,5,1,1,3,1,1,2,1,2,1,1,2,1,1,1,1,1,1,1,1,1,2,1,1,1,1,3,1,1,1,2,1,1,1,1,1,2,2,4,2,1,1,1,3,1",
+    "enu": "w,26,3y,1p,2o,1f,22,14,k,1k,d",
+    "env": "8h,2k,21,c,n",
+    "enz": "cc,1,3f",
+    "eo\n": "2t,86,4,25,5d",
+    "eo ": "2a,2j,5,4,f,3,3,e,q,e,c,9v",
+    "eo,": "51,d",
+    "eo.": "ee",
+    "eob": "7g,5k,3,35",
+    "eol": "8,11,c,u,1,3,4r,1,3,s,7,u,b,68,7,13,7",
+    "eon": "1y,52,p,t,12,m",
+    "eop": "9u",
+    "eos": "i,k,1m,2u,86,5,27",
+    "epa": "h,i,1h,6,e,5,6,k,3,5,5,6,9,c,q,g,7,3,4,3,9,i,5,3,4,d,5,b,2,b,17,d,27,b,j,o,6,f,a,1,1n,i,19,d,3,2,6,1",
+    "epc": "4j,x,s,6p,s,k,e,s,20",
+    "epe": "d8,8",
+    "eph": "8f,45,6g",
+    "epi": "27,5j,1r,91",
+    "epo": "82,79,3w",
+    "epr": "m,17,3z,14,1y,p,5,9,1e,1a,7,3p,2p",
+    "eps": "9h,o,8c",
+    "ept": "2,8,3,7,3,4,g,1,e,9,9,3,6,7,p,3,b,1,2,1,a,6,1,6,2,3,1,5,1,4,3,1,3,2,e,2,5,6,3,6,6,7,1,9,4,3,1,4,6,7,s,k,1,f,2d,12,17,e,7,7,3,5,1k,h,c,4,5,5,1,3,1,1,2,b,6",
+    "epu": "7,i,13,6,d,v,f,1e,7,7,1a,d,6,5,d,1,b,6,e,t,1w,2,3,2a,3",
+    "equ": "1s,1d,1p,6,4,a,4,4,7,9,e,1,e,s,k,f,a,7,1,6,8,1p,4,6,q,c,6,a,7,5,j,c,2,3i,6,6,g",
+    "er ": "i,b,7,q,4,c,2,1,5,2,2,6,1,4,4,4,1,6,c,5,f,c,13,9,4,2,4,2,3,e,a,7,7,4,4,3,c,j,1,t,f,e,2,3,4,4,1,6,7,8,3,2,x,m,a,f,g,7,2,3,6,d,6,2,c,f,9,e,3,8,7,c,8,6,1,v,4,2,2,5,8,3",
+    "er,": "1g",
+    "er.": "3t,6f,d",
+    "era": "18,1,g,3,k,2,2,a,3,1,6,1,2,1,d,7,5,9,3,5,7,7,2,5,2,2,8,5,1,6,3,6,1,4,2,1,3,5,1,1,4,5,1,b,1,2,2,6,1,1,3,4,c,2,7,4,2,2,4,a,5,9,7,2,3,2,4,4,c,2,2,4,l,3,3,5,6,2,1,5,1,x,9,4,2,h,6,2,4,2,3,1,6,3,7,3,h,4,8,9,5,1,2,3,b,1,2,2,c,t,4,3,5,2,5,2,2,5,a,2,2,a,4,1,3,4,2,2,1,1",
+    "erb": "0,3,2,1,5,e,9,1,2,2,8,1,b,6,l,3,h,10,17,7,1,c,8,f,9,7,4,1,3,2,8,8,9,o,b,w,6,8,4b,3,j,3,2,39,n,1,2,1,4",
+    "erc": "2c,1e,6,1,a,3u,7,1,2,1,1,1,8,v,i,w,o",
+    "erd": "23,5,10,29,18,3q,i,1,2,9,19,b,b,1,n,3,3l",
+    "ere": "7,i,12,2,6,8,1,h,m,7,8,d,m,6,a,i,11,d,c,5,7,2,g,i,b,a,d,c,2,j,7,1r,5,3,d,b,5,q,16,2,z,17,4,2,4,d,a,3,8,4,3,3,1,2",
+    "erf": "1t,53,c,10,1g",
+    "erg": "v,c,g,l,1,l,1c,c,e,10,e,1,2,1,1c,1,j,2,2,2,5,5,1f,7,z,g,t,1,9,4,5,8,1,6,5,i,n,6,b,8,4,1,d,b,14,u,2,7,1,1,9,8,1",
+    "eri": "3,1,d,8,9,5,2,f,3,1,2,3,1,7,1,2,1,1,2,2,1,2,4,5,1,a,2,2,4,1,9,1,e,7,1,3,8,a,3,1,4,7,3,1,1,1,4,1,4,1,3,4,1,7,8,3,4,7,a,3,5,7,3,b,1,5,4,6,3,5,3,1,9,3,5,9,6,4,2,7,3,9,7,3,a,4,1,g,b,1,x,3,5,2,1,2,2,1,1,1,1,6,3,2,2,h,7,1,4,2,6,h,5,4,2,1i,b,1,1,f,c,2,1,4,1,2,3,1,b,9,1,1,5,1,2,1,5,3",
+    "erl": "8c,9s",
+    "erm": "c,5,2,a,6,i,1,9,27,h,c,e,27,15,1l,i,5,6,h,22,1g,3,a,w,1c,11,3",
+    "ern": "w,20,15,9,q,7,1,1,1,7,6,8,1f,20,e,3,1p,2t,1g,8,1,k,1,8",
+    "ero": "1,b,s,h,1,7,i,5,4,7,d,1,5,n,m,6,4,1,2,a,1,1,2,4,1,4,e,5,b,9,5,f,8,r,4,1,1,1,1,8,2,8,10,1,7,b,3,2,3,1t,6,c,9,4,1,3,1,j,2,5,9,f,1,4,1,8,1,6,6,3,1,e,5,3,j,2,h,9,1,6,2,j",
+    "erp": "1k,4q,1a,1p,12,n,1g,10,1e,24,1n,9,8",
+    "err": "1v,t,1t,8,4,5,3,1,c,3,3,3,e,q,q,3l,7,5,13,3,e,25,1,1,1,1,v,1s,9,v,9",
+    "ers": "y,r,3,h,l,9,q,5p,q,2f,h,9,4,f,1,3s,u",
+    "ert": "3,q,1f,d,1,9,27,d,e,2,1,3,1,5,1,a,y,c,9,1,2,17,q,s,u,z,c,2n,q,12,17,q",
+    "eru": "j,1v,2j,3c,4k,2v,o,c,m,1,2,15",
+    "erv": "o,2,3,a,8,1m,p,10,6,e,5,h,3,k,d,h,a,8,6,w,1,3,1,1,1,8,a,4,3,1,4,c,z,8,40,18,e,p,m,j,3,5,1",
+    "ery": "a1,l,6w",
+    "erz": "as,u,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,5,4,3,3,2,5,4,4,12,3v,q",
+    "es\n": "b6,2,13,4,q,57,2,2,9,1,6,2,7",
+    "es ": "0,1,1,1,1,1,1,4,4,1,1,1,2,5,4,2,1,2,1,1,2,3,2,3,1,1,3,2,8,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,4,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,4,1,4,4,1,1,1,2,1,2,2,4,2,1,1,1,1,1,1,1,2,1,1,2,1,1,1,1,1,1,2,1,1,3,1,1,1,1,1,5,1,1,1,1,1,1,1,1,1,1,3,1,3,1,2,7,1,2,1,1,1,1,1,2,1,1,2,2,4,1,2,1,3,1,8,1,1,2,1,4,1,1,1,1,2,1,2,1,1,3,1,3,1,1,1,2,1,1,1,1,1,1,1,1,1,3,1,2,1,2,1,1,1,1,1,1,1,1,1,2,2,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,2,1,1,2,2,1,3,1,1,1,1,1,2,1,1,1,2,1,1,1,2,a,1,1,1,2,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,4,1,2,1,1,1,1,4,1,1,1,1,1,2,2,2,1,1,1,2,1,1,1,1,1,1,1,1,1,3,3,3,1,1,1,1,2,1,1,2,1,2,3,1,5,2,3,1,1,1,1,1,1,1,2,1,1,2,1,1,2,1,1,2,1,2,1,1,1,2,1,1,2,2,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,2,1,1,2,1,1,2,1,1,1,1,3,1,1,2,1,1,1,1,1,2,1,1,1,1,1,2,1,2,3,1,1,1,5,1,1,1,1,1,2,1,1,2,2,1,1,1,1,2,1,1,2,1,1,2,2,1,1,2",
+    "es\"": "11,7f,ac",
+    "es'": "a0,80",
+    "es)": "53,2d,1n,48",
+    "es,": "8,2,18,5,6,2,1,b,7,4,p,2,7,4,2,1e,l,2,6,h,7,5,3,6,3,8,4,h,3,n,6,g,1,b,4,4,k,15,16,8,l,2,2,6,1,2,a,3,c,1,2,1,b,i,3,1,6,7,c,3,1,1,1d,7,w,6",
+    "es.": "0,1,2,2,u,5,i,2,2,8,3,1,2,1,3,3,5,5,b,3,3,2,2,1,1,1,1,9,6,8,1,1,p,1,d,9,a,p,2,2,6,g,5,7,5,3,2,1,e,b,9,4,f,6,2,a,g,7,5,6,4,8,1,4,1,c,7,r,5,8,7,1,5,8,1,1,1,d,1,1,2,1,2,4,5,9,1,4,3,4,3,3,6,1,o,2,f,5,b,1,6,8,4,h,1,1,2,2,1,4,4,1,1,3,a,c,2",
+    "esa": "6,l,1z,2k,41,j,7,q,5,2,2,4,2,2,1k,4,f,f,1,p,1,m,1,1,8,1d,1b,u",
+    "esc": "4,12,h,l,d,r,7,j,1e,4,a,5,e,h,15,f,7,a,5,1c,7,9,r,z,a,5,k,a,5,8,6,2,e,f,1,10,r,5,l,4,4,4,1",
+    "esd": "26,8,1,2,s,1k,t,f,4v,h,20,2z,2u",
+    "ese": "2d,6,m,3,g,d,1l,18,8,6,v,1f,1j,5,3y,6,9,3b",
+    "esf": "s,f,g,2l,w,c,12,c,t,h,s,5,3,1,1,4,4,f,4j,1,3,3,1c",
+    "esg": "7e,1p",
+    "esi": "4,8,8,2,j,a,3,b,2,1,6,1,1,9,1,4,a,1,d,4,1,2,2,5,a,k,c,c,f,3,7,1,3,1,3,1,1,5,2,1,2,3,2,g,2,5,a,4,2,7,a,2,3,2,8,3,5,5,2,1,5,3,c,4,1,4,6,3,8,f,e,5,6,17,5,3,4,4,b,2,4,p,e,u,4,7,h,b,4,3,6,8,3,5,6,1,b,1,2,2,3,1,1,6,1,1,2,1,3,1,1,3,1,6,d,2",
+    "esn": "3k",
+    "eso": "v,18,5,2,j,3g,4r,8,9,w,5,19,z,e,2,a,8,2j,1,s",
+    "esp": "0,2,3,1,2,1,2,4,1,4,1,1,6,7,a,2,2,8,3,3,1,2,3,2,3,6,7,3,1,h,7,5,2,2,6,1,4,3,d,f,6,5,4,a,1,2,1,3,1,2,3,1,2,3,b,a,3,1,6,3,2,3,2,4,2,4,1,4,4,3,1,7,2,1,1,2,8,b,6,1,7,1,1,1,2,1,2,3,1,c,1,2,2,1,2,1,4,2,1,4,4,n,2,7,6,5,16,4,1,s,k,2,6,3,a,1,8,t,2,1,1,2,2,7,1,7,1,2,2,7,1,5,1,1,1,2,1,2,2,1,6,3,1,5,1,6,1,5,c,6,2,3,1,3,3,4,1,1,b",
+    "esq": "ag,3",
+    "ess": "3m",
+    "est": "0,1,2,1,1,1,2,1,2,1,1,2,1,2,3,1,2,2,1,2,1,1,2,1,1,3,1,1,2,1,4,2,3,1,2,3,1,1,4,1,1,2,2,2,1,2,1,1,1,1,1,1,1,1,1,1,3,1,1,5,1,1,2,1,1,1,1,1,1,1,1,1,2,1,1,3,1,2,1,1,b,1,1,a,3,1,2,4,9,4,3,4,5,7,1,5,2,1,2,2,6,1,3,2,4,1,2,2,1,1,6,1,1,1,a,3,1,2,3,1,7,4,1,2,1,3,1,2,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,3,2,1,3,3,1,1,1,1,5,5,2,2,2,b,2,2,1,2,2,3,1,5,1,1,1,1,1,2,2,3,1,2,2,1,1,1,1,1,1,1,1,1,1,1,3,2,4,3,1,2,3,6,3,1,s,1,1,1,1,2,1,1,2,3,1,2,1,2,1,1,1,1,2,1,2,1,1,1,1,1,1,1,1,2,1,1,1,2,2,1,4,3,7,1,2,1,4,4,1,7,1,3,2,2,1,1,1,5,1,6,1,1,1,5,3,3,3,2,2,1,1,1,2,1,a,1,1,1,1,3,1,1,1,2,1,2,1,1,1,1,1,1,1,3,1,2,1,1,1,1,1,2,2,4,3,1,6,1,3,4,5,6,4,1,1,1,1,1,1,1,2,3,1,2,2,2,1,2,2,1,2,2,2,1,1,1",
+    "esv": "do,2b",
+    "et.": "8m",
+    "eta": "6,13,6,p,4,1y,15,4,1u,s,1,1,p,1,8,4,3,7,q,h,5,7,5,24,d,1q,1g,y,7,7,10,4",
+    "ete": "10,1n,4,1l,4,2,q,37,1g,4,9,23,4,f,a,1,5,2p",
+    "eth": "8,27,3,4s,3,58,3c,13",
+    "eti": "7,5,2,4,7,5,8,c,1,3,a,2,3,1,2,3,2,1,1,1,2,1,1,1,3,7,1,3,7,3,a,2,1,6,1,i,3,7,b,3,3,2,1,1,1,1,3,1,1,5,2,3,1,c,1,b,8,1,5,5,8,4,1,3,1,2,4,1,1,5,1,2,4,1,4,2,1,2,1,5,1,1,1,3,2,1,2,4,1,1,a,1,1,8,1,4,1,2,2,2,e,4,1,1,4,6,4,9,m,4,2,1,3,f,d,1,h,3,7,9,2,1,1,2,4,1,3,3,2,1,1,6,1,1,1,1,2,3,2,1,1,1,1,3,4,1,2,4,1,l,3,4,c,7,2,b,h,4,3,1,f,h,1,s",
+    "etn": "y",
+    "eto": "t,z,2g,y,1,1,l,3g,5,7,14,u,1p",
+    "etr": "7",
+    "ett": "l,f8,m",
+    "etu": "t,z,1t,28,12,2q,19,n",
+    "euc": "1r,1l,p,1t,10",
+    "eud": "bg",
+    "euf": "7g",
+    "eug": "cx",
+    "eum": "14,1u,d,s,u,6,s,1,3,1v,6,6,e,40,n",
+    "euo": "58",
+    "eup": "11,h4",
+    "eur": "3f,3,p,11,1d,g,1g,8,u,b,7,5,4,4,8,9,f,43,2,2x,a,g",
+    "eus": "58,2c,2m,f,3,1,1t,18,q,n,2,2i,6,q",
+    "eut": "16,54,2d,18,4x,2a,1b",
+    "eva": "1o,6",
+    "eve": "5,i,13,f,z,1r,l,11,f,r,1h,h,37,11,j,4,4,3,1,37,1,r,c,3",
+    "evi": "u,b,8m,14,3k,39,r,1",
+    "evo": "aw",
+    "ex ": "20,6,1z,c,c,t,q,s,b1",
+    "exc": "5,9,a,d,a,1,28,r,4,4,x,a,3,7,2,6,s,1f,6,i,c,7,1,2,4,3,5,l,g,b,10,6,e,3,c,8,5,2,i,e,p,3,4,8,5,v,7,h,1l,5",
+    "exi": "z,1x,2v,1,4,2,1,3h,1,i,36,4h,l,1,1,k",
+    "exo": "6f,62,1,2,3v,18,19",
+    "exp": "2,7,5,2,5,4,1,2,1,4,2,a,1,2,a,1,4,4,t,c,8,4,b,1,3,8,8,1,2,7,4,g,i,5,2,4,4,b,9,1,5,1,5,3,o,8,2,1,1,7,3,5,d,7,5,4,2,3,3,1,e,1,7,15,9,1d,f,h,b,a,5,1g,2,k,4,5,3,1,2,f,2,8,1,1b,2",
+    "ext": "1z,4,p,11,3,8,n,c,4,1,9,k,8,7,r,14,b,o,11,6,r,2,6,1f,f,4,u,1,h,z,b,8,b,s,f",
+    "exu": "49",
+    "ey ": "cl,a",
+    "ey\"": "aw",
+    "eya": "i4",
+    "eye": "1u,5w,as",
+    "eyo": "hr,7",
+    "ez ": "1u,b3,6,16,1a,1,3,o,5,o,2",
+    "ez:": "dz",
+    "eza": "4,1z,k,q,d,5,1,4,4,8,3,8,g,6,c,2,1g,1q,g,a,7,4,g,18,1v,1,5,3,1e",
+    "ezc": "2i,5s,4i",
+    "ezo": "53",
+    "ezu": "2m",
+    "fa ": "89,d,27",
+    "fac": "9,i,6,o,1h,9,o,4,j,2j,9,l,b,4,k,3e,1e,7,1s,u,9,2a",
+    "fag": "3r,1z",
+    "fal": "1i,l,7y,3c",
+    "fam": "r,44,4,1b,v,d,l,g,9,6,17,2g,2d",
+    "far": "3t,62,1,1,1g",
+    "fat": "5q,l,2c,1s,40,n,27,11,2,1,f",
+    "fau": "ca",
+    "fav": "1p,n,c,1,4,f,c,8u,3,1,3",
+    "fe ": "g9",
+    "fe,": "ga",
+    "fea": "g9",
+    "feb": "13,4,2k,d,8,1,t,3,1,d,7,3b,1,3,3,p",
+    "fec": "1,1,5,4,1,1,6,3,6,3,e,f,2,2,c,8,1,5,3,b,3,2,5,1,3,2,9,2,4,9,1,6,g,7,1,1,5,3,9,4,7,4,2,1,8,e,2,4,3,3,4,b,3,2,8,2,1,4,4,o,8,2,3,3,1,3,c,3,9,h,3,9,a,20,l,7,6,2,3,1,6,b,5,3,2,1,2,3,s,e,8,b,9,3,2,b,3,7,j,d,e",
+    "fei": "6b,6p,1,38,1",
+    "fem": "5m,3y,9m",
+    "fen": "w,26,62,3l,x,2,o,5,1h,k,1h",
+    "fer": "h,1a,2,e,7,j,4,2,e,1g,5,x,a,b,h,p,1,q,j,c,b,1y,t,9,r,a,1j,a,7,c,4,17,2,3,v,7,1,6,g",
+    "fes": "ac",
+    "fet": "hb",
+    "ffa": "8v",
+    "ffe": "g9",
+    "ffi": "1,9,8,6,4,2,6,8,2,a,a,4,m,5,c,8,1,u,l,1f,5,h,1,9,f,2,5,3,6,p,2,5,3,c,d,3,5,2,g,15,o,16,3e,7,5,1n",
+    "ffu": "2u,2y,d1",
+    "fib": "2r,5a,4,3,6,2u,18,2,5,2,2,3,7,2,3,4,2,3,3,7,f,6,t,1,1,3,z,1g",
+    "fic": "1,7,2,8,1,5,2,2,2,6,4,4,2,a,6,4,4,7,f,5,c,8,1,1,6,n,6,6,1,8,a,1,4,2,f,9,a,5,h,1,2,7,7,6,2,2,5,2,1,6,6,7,7,5,7,2,1,7,3,2,3,5,5,2,1,3,2,2,4,c,g,3,8,e,10,3,a,5,2,3,6,1,a,2,3,2,o,v,2,3,2,p,2,1,f,2,5,1,4,a,3,3,8,1,7,k,7,7,8,1",
+    "fid": "b0",
+    "fie": "13,c,c,f,s,s,1,l,1,w,1f,f,1,21,4,3,3,37,4,e,19,9,3b,x,1,8",
+    "fij": "bl",
+    "fil": "1f,4k,3g,11,i,n,6c",
+    "fim": "i8",
+    "fin": "2f,67,28,f,u,1a",
+    "fip": "ab",
+    "fir": "b8,u,t,d",
+    "fis": "82,l,5t,3u,2,1,u",
+    "fit": "1j,87,1k,2,9,7c",
+    "fla": "1,6,3,7,1,d,3,2,1,1,4,2,2,3,1,1,1,7,1,1,5,1,6,2,4,d,1,1,b,3,3,3,1,2,3,1,3,1,2,1,1,4,1,5,1,1,3,5,4,5,6,3,2,2,4,1,2,1,1,3,1,3,5,1,3,1,e,1,2,1,2,1,1,1,1,1,1,1,1,1,3,3,1,1,1,1,1,2,1,2,1,1,2,9,5,7,1,1,1,3,2,1,3,1,2,1,5,1,3,2,5,6,1,1,1,4,2,1,2,3,5,1,1,1,2,4,1,2,2,4,1,1,2,4,1,6,4,5,2,4,1,5,1,1,1,3,3,1,4,6,8,1,6,t,1,1,4,1,1,3,2,2,3,3,3,2,1,3,1,2,b,2,1,4,1,1,3,a,7,2,3,1,1,2,3,3,1,2,1,3,1,2,5,2,2,2,3,4,1,5,1,8,2,1,4,1,2,4,6,4,1,5,4,2,4,1,2,2,1,1,5,3,4,1,1,1,1,1,2,1,1,1,1,1,4,1,1,1,2,3,2,4,1,3,1,1,4,2,3,3,1,3,2,1",
+    "fle": "8p",
+    "flo": "1e,a,e,5,17,m,m,h,1,6,2,3,c,2,6,g,3,6,4,7,a,6,7,n,4,5,8,1,1,2,2,1,1,1,2,4,1,1,2,2,1,2,6,4,2,9,2,m,o,1,4,2,1,2,v,k,2,1b,3t,9,f,2",
+    "flu": "87,3a",
+    "fly": "9o",
+    "foc": "8o",
+    "foe": "e,i,1s,e,cp,7,k,9,k",
+    "fol": "n,2,r,g,a,1v,p,n,t,s,6,1l,3,h,e,h,2s,z,d,7,k,8,g,y,23,d,2,2",
+    "fom": "a9,a",
+    "fon": "11",
+    "for": "1q,3,1l,1y,4,r,b,d,1,3,h,4,c,c,7,1,3,1,2,a,1,3,8,3,g,5,6,2,6,1,2,s,3,a,z,1,7,7,2,1,j,c,3,9,6,7,6,a,3,2,5,y,1d,4,7,2,4,3,6,6,1,2,5,2,1,1,8,3,1",
+    "fos": "cy",
+    "fra": "m,2y,23,35,2,13,3e,f,1,p,1,m,1,1,1b,1,n,1,1p",
+    "fre": "4,2z,h,5b,n,1a,1q,a,5,k,a,5,8,6,7,2g,q,8,4,1",
+    "fri": "s,f,g,16,3,1c,w,c,12,c,t,h,s,5,3,1,1,3,1,4,f,1q,2t,1,6,1c,g,1w,5,s",
+    "fro": "m,5,51,32,13,7,1,o,1s,d,3j,n,1k,5",
+    "fru": "1n,i,1t,h,3,6,8,2,9,1,3,1,2,2,d,9,4,4,7,5,4w,4,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,3,2,6,2,1,2,1,1,6,3,1,1,2,1,3,1,2,1,1,1,1,1,1,2,1,1,1,9,1,8,3,4,4,c,i,1o,13",
+    "fta": "57",
+    "fuc": "aa,q,3",
+    "fue": "3,3a,16,s,l,9,1,7,11,l,d,2,7,1e,k,7,2,7,3,4,g,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,2,2,4,1,2,3,2,2,3,4,1,1,1,1,6,g,c,4,u,2,4,3,2,h,7,f,n,10,f,b",
+    "fug": "c,h,6,4,4,a,1,29,d,8,1,2,q,1,3,1,d,7,1i,1c,h,4,3,p,62",
+    "fum": "78",
+    "fun": "3,1y,1f,c,9,1i,13,g,h,6,2,g,a,4,4,r,4,4,i,a,11,1k,4,14,9,x,4,1c,1g,1,1,4,2,1,2,1,c,1,2,6",
+    "fus": "29,g,5,6,e,2e,k,g,7,a,1x,2,1,1z,2k,51",
+    "g a": "j5",
+    "g d": "8g,ac",
+    "g n": "j5",
+    "g s": "8n,9q",
+    "g-a": "2v",
+    "ga\n": "11,f,1,4,1o,3r,e,k,p,i,w,5x,2c,2,1",
+    "ga ": "2b,h,4,7,e,2u,9,23,1k,e,c,1,1,1,1,1,1,2,1,1,1,1,36,2o,5,1,a,16,6",
+    "ga)": "9m",
+    "ga,": "2h,1s,1s,1b,m",
+    "ga-": "1a,8o,5a,7",
+    "ga.": "4v",
+    "gac": "co",
+    "gad": "3b,s,2x,e,o,g,r,z,2i,1z,3p,b",
+    "gae": "fz",
+    "gaj": "52",
+    "gal": "e,i,6,20,q,h,2g,l,a,1,v,3,6,4,t,4n,1o,1,k,9,9,3,6,1a,e",
+    "gam": "17,4z,5l,4e,19,1d",
+    "gan": "3,8,e,c,3,8,p,5,4,d,3,h,j,j,11,a,14,2,c,p,3,y,2,m,1,b,a,i,b,a,18,e,w,l,v,1,1,1,a,8,17,4,u,2,9,1,1,5,5,e,9",
+    "gar": "2,1,b,f,8,b,5,e,6,m,1,j,j,j,1,t,2,2,i,z,2,7,5,10,18,i,h,3,m,6,1,1m,w,4,h,9,j,r,10,3,1,1z",
+    "gas": "8,6,1,1,j,n,2,g,k,b,9,r,i,28,g,5,f,2b,1,s,b,4,4j,3,1,1,s,1,2,1,h,2,4,7,8,7,2,u,7",
+    "gat": "4t,1e,ck",
+    "gav": "24,4c,ba",
+    "gay": "4u,4",
+    "gaz": "b3",
+    "ge ": "92,36,b,13,2,5,1e,5,32,5,6",
+    "gel": "q,5,58,1q,21,6,h,n,1,s,3c,w,19,7,7",
+    "gem": "5r",
+    "gen": "h,2,h,1,3,f,6,3,8,5,o,3,d,d,4,2,3,1,1,1,4,1,3,3,3,3,1,2,2,3,1,3,2,1,4,3,6,2,5,2,5,2,1,2,3,1,2,5,1,3,9,c,4,1,d,7,4,1,6,1,1,1,1,4,f,1,2,7,1,3,2,6,c,1,6,7,1,3,9,4,d,4,8,g,2,3,1,3,1,q,3,1,9,2,3,3,1,5,e,5,5,2,2,1,3,1,4,3,1,2,2,3,1,5,1,1,3,1,3,1,3,4,1,f,j,4,7,k,1,d,8,6,4,7,9,1,5,i,6,6",
+    "ger": "c,5q,1i,g,4,6,2,2,8,n,9,p,1w,a,y,3,j,4,o,z,e,2h",
+    "ges": "0,3,1,1,1,2,1,2,1,1,2,1,2,2,1,3,2,1,2,1,3,1,4,1,3,1,4,2,2,1,1,5,2,5,3,6,1,5,2,4,2,1,7,1,3,1,6,3,6,2,1,1,1,7,4,b,4,6,5,8,4,3,c,d,6,3,3,2,2,3,2,1,2,2,1,2,1,1,e,1,2,3,1,5,2,7,5,4,4,4,1,1,2,1,1,1,3,1,1,1,2,1,1,5,3,1,3,4,2,8,2,1,c,5,2,7,1,5,1,1,a,9,k,2,9,w,1,1,1,1,3,a,2,1,1,5,3,2,1,1,1,1,1,2,q,x,8,1,1,7,8,2,1,1,1,2,1,g,1,1,1,3,1,2,3,1,2,5,2,1,1,1,1,3,6,1,2,1,6,1,1,1,1,1,2,1,2,1,1,6,1,1,3,c,5,2,3,2,1,2,6",
+    "get": "19,6,t,1y,15,12,1x,2,9,u,k,1k,24",
+    "gev": "av,7k,1",
+    "ghi": "de,m",
+    "gia": "v,l,7,m,d,8,y,25,g,1,1c,1,l,4,12,2,3,7,b,7,28,1,9,9,9,x,b,p,6,2,4,1t,w,7,1,1,9,8,1",
+    "gib": "i,k,s,4a,1d,1,11,83,h,1i",
+    "gic": "3,x,g,7,e,l,u,c,9,v,6,3,e,e,a,v,i,c,m,8,q,6,g,a,4,9,9,o,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1v,4,5,5,f,17,q,j,w,3,2,1,1,2,5,2,1,1,c,1",
+    "gid": "50",
+    "gie": "1p,4c",
+    "gif": "ce,52",
+    "gig": "i6",
+    "gii": "am",
+    "gin": "1z,9,1,9,9,6,2,c,2,3,2,o,l,6,8,n,m,6,h,i,4,o,5,2,5,u,3,1l,1l,o,m,v,a,w,a,1i,e,3,3,5,7,1,2,d,3",
+    "gio": "28,m,5r,v,8w",
+    "gip": "2z",
+    "gir": "95,59,y",
+    "git": "2c,4v,2o,1",
+    "giu": "k,1q,4v,5z,39",
+    "giz": "29,l,3g,1,3,1c,2f,2t,5,8,1,6,1a,h,8,4,1,d,b,1y",
+    "gla": "2v,x,3t,6o,16,1u,1o",
+    "gle": "5l",
+    "gli": "35,8t",
+    "glo": "1r,12,5,2,c,2i,p,b,bg",
+    "glu": "j,d,9,m,d,y,7,6,d,t,x,12,1p,8,4,w,n,e,o,1n,22,5,y,k,q,e,8",
+    "gly": "7l,9o,1o",
+    "gme": "d9,4",
+    "gne": "1v,9e,45,7,h,1b",
+    "gni": "5k,1z,16,z,i,4v,3a,1,a,1,c,2,1,6",
+    "gno": "40,1m,3x",
+    "gnu": "4t,t",
+    "go\n": "c,h,3,3,4,f,2m,b,q,1,3,1,3,d,1m,g,6,9,12,3,l,4,6h,9",
+    "go ": "1a,p,1j,1n,1j,d,u,13,8,w,4,4,2,2,2,3,1,3,1,2,1,4,1,9,5,14,d,5,1i,1t,19,10,1,7,7,9,4",
+    "go)": "a0",
+    "go,": "17,38,7,o,s,4,4c,5",
+    "go.": "9z,39",
+    "gob": "5v",
+    "gog": "e,f,1,2,5,7,8,1,1,3,y,j,7,1k,c,1,7,d,z,b,5,5,2,2,k,9,9,16,b,60,1,k,9,9",
+    "goj": "ep",
+    "gol": "93,2y",
+    "gom": "49",
+    "gon": "c,k,7,1z,1a,11,5,2q,1a,30,2d,7,4,s,k,15",
+    "gor": "1c,45,49,2,9,86",
+    "gos": "1d,5,2z,l,1m,1k,u,4,a,s,b,b,9,1b,5,1,d,k,6,a,b,38",
+    "got": "34,5g,12,3x,27,1h,1g,c",
+    "gou": "8m",
+    "gox": "2c",
+    "gpu": "c6",
+    "gra": "8,o,1,3,3,i,9,7,5,1,7,1,1,3,7,c,9,1,o,2,1,a,1,1,6,g,2,1,b,4,6,9,k,k,8,1,3,g,2,a,m,4,1,6,9,6,3,9,4,v,7,1l,4,1,5,3,2,3,7,c,3,c,4,8,5,1,h,2,3,3,2,4,1,1,4,3,2,1,7,1,1,2,2,6,5,2,2,1,d,4,4,3,a,9,3,d,9",
+    "gre": "j,d,1d,5,2,4,a,8,3,a,d,d,u,19,f,p,c,l,8,1,2,x,n,9,5,1z,o,3,2,17,e,j,k,d,1,6,14,8,u,1,3,d",
+    "gri": "11,16,2x,1e,15,19,8,b,e,1,a,2d,5,2,j,16,6,14,1u,17",
+    "gro": "v,2a,1r,a,2,7,5,10,2,1l,1,g,56,a,1,1,c,9,7,17,19,1b",
+    "gru": "2g,2g,40,59,d,g,1g,1n",
+    "gu-": "2t",
+    "gua": "20,m,5,9,x,j,t,n,f,1,7,23,2p,1,2,1,2,1,1,1,v,8,1,d,w,2d,1g",
+    "gud": "j3",
+    "gue": "2f,1z,3,c,8,l,f,3l,9,11,h,4z,10",
+    "gui": "10,q,9,d,2x,3u,45,g,5,l,1m,38",
+    "gul": "a,9,d,9,b,1,4,5,1p,d,2,r,8,c,h,1,13,3,l,c,b,4,4,5,3,1,6,t,3,5,2,7,6,d,1,m,19,8,4,2,1,6,7,a,1,4,6,c,t,1,1g,6,10,4,8,u,h",
+    "gum": "7k,3m,1g,3d,1k",
+    "gun": "26,m,2,5,6h,h",
+    "guo": "39,9,fq",
+    "gus": "n,19,1v,3,w,2,f,7,1k,y,w,x,4d,u,4a",
+    "gyl": "88",
+    "gyn": "3u,y,4x,57",
+    "gzh": "av",
+    "h n": "8o",
+    "ha ": "4,1,1v,3,4,3,4,6,9,3,2,6,2,16,y,c,1j,s,1j,g,d,7,2,1,w,1,1f,a,16,26,g,l,2,q,n",
+    "hab": "14,1c,8,56,9o",
+    "hac": "0,1u,e,5,1,3,1,2s,q,3n,1,7,6,15,1b,q,w,u,1z,k,z,j",
+    "had": "2e",
+    "hae": "5b,2k,3i,3a",
+    "hag": "4c,5v,8x",
+    "hal": "2r,a,5e,2v,23,5n",
+    "ham": "1o,33,k,c,33,5x",
+    "han": "q,9,17,2c,2m,n,2,e,y,3,s,34,2t,6,1v,d",
+    "hao": "9k",
+    "hap": "1c,8g",
+    "har": "31,o,l,c,4c,1s,g,2x",
+    "has": "26,y,19,3j,i,7,2x,1u,1,4p,14",
+    "hat": "2w,b1,59",
+    "haw": "i2",
+    "hay": "3r,8r",
+    "haz": "e,6b,92,4,u,m",
+    "he ": "w,6e,8n,1,k,9",
+    "he,": "42",
+    "hec": "1t,7,e7",
+    "hel": "2t,5g,w,1g,7,t,z,2s",
+    "hem": "10,g,16,x,3,1e,2,v,3c,9,5,w,3v,1,5,1m",
+    "hen": "5w,2t,w",
+    "heo": "7g,5k,3,35",
+    "hep": "h,2o,6,s,1m,g,h,w,3,4,d,5,b,2,1i,d,27,b,1s,a,1,1n,i",
+    "her": "24,9,1s,i,4,4,a,2,a,g,b,d,b,m,15,n,d,b,8,h,i,7,4,1c,1m,3a,8,6,b,a",
+    "het": "da",
+    "heu": "14,6q",
+    "hev": "hv",
+    "hho": "bc",
+    "hi ": "a2,t,19,f",
+    "hi,": "ak,b,6,1j",
+    "hi.": "b6",
+    "hia": "5c,82,m,19,2t",
+    "hib": "5k,3b,68,1,1",
+    "hic": "5r,7e",
+    "hid": "1p,4b,3,a,1n,b,1,2,7,1p,7,26,d,c,5,f,1,b,11,8,24,7,7,1",
+    "hie": "0,3,2,1,5,e,9,1,2,2,8,c,6,2,j,3,g,1,1x,h,l,v,4,1,3,2,8,h,o,b,1a,12,7,1b,e,29,v,29,n,1,2,1,4",
+    "hig": "1p,1m,s,e,1k,z,12,g,r,3i,w,12,3p,b",
+    "hii": "a3",
+    "hij": "b8",
+    "hik": "go",
+    "hil": "1g,1v,v,5h,c,36,1q,6",
+    "hin": "e,v,1f,3,2,6,11,1c,o,e,7,4,u,1,3,s,p,3,2,a,1,r,k,1o,2,1n,h,12,4,1,8,l,2,k,n,c,4,2,1,2,9,2,6,7",
+    "hip": "j,d,9,e,1,7,2,b,5,i,1,a,1,2,4,6,4,9,2,r,7,j,4,6,b,o,2,7,3,q,g,c,h,3,b,8,8,1,e,e,26,r,n,l,9,4,8,6,6,3,b,8,1,b,q,e,8",
+    "hir": "85,4n,h",
+    "his": "s,3,16,7s,q,4q,q,6,19,10",
+    "hiu": "1i,z,4v",
+    "hiz": "7l,p,26,6t,1o",
+    "hle": "45,23",
+    "hli": "9h",
+    "hlo": "5h,5h",
+    "hma": "8h",
+    "hmi": "j2",
+    "hne": "5k",
+    "hni": "5h",
+    "ho ": "1t,h,j,8s,4p",
+    "ho,": "3w",
+    "hoa": "ch",
+    "hoc": "7g",
+    "hod": "ic",
+    "hoe": "d,6w,ag",
+    "hof": "89,d",
+    "hoj": "1z,c,8,6,7,7,c,d,3,8,d,4,1,3,6,2,2,2,7,a,6,7,4,e,i,7,3,q,17,6,22,16,t,9,9,2,3,c,2,k,1x,2,t,4,3,3,1,1,2,2,1,2,l,j",
+    "hol": "32,5y,6j",
+    "hom": "9u",
+    "hon": "44,19,43,m,4,2,2,2,2,2,2,1,1,3,1,2,1,3,1,1,9,3u,3h,1,7,7,9",
+    "hoo": "i7",
+    "hop": "2r,1n,dd,8,1",
+    "hor": "a,1c,u,o,1p,t,1p,f,d,2,5,7,5,2,w,e,19,5,1m,s,3m,f,e,d",
+    "hos": "8o,3n,37",
+    "hot": "28,45,28",
+    "hox": "hc",
+    "hoy": "5k,3x",
+    "hra": "a1",
+    "hri": "p",
+    "hro": "ax,g",
+    "hry": "99,32",
+    "hsc": "90",
+    "hta": "3g",
+    "hua": "8d,8z",
+    "huc": "f7",
+    "hue": "23,q,83,c,9,11,3h",
+    "hug": "2s,8h",
+    "hul": "5w",
+    "hum": "8,1b,w,3l,1a,15,9,m,g,l,g,b,d,1,1n,2u,13,u,16",
+    "hur": "ao,6s",
+    "hus": "35,2l,w,1n,w,3,64,1w,1i",
+    "hwa": "7r,ak",
+    "hyc": "ht",
+    "hyd": "7s",
+    "hyl": "35,1p,1s,2m,18,1v,7,s,1j,9,2l,c,r",
+    "hym": "2,1t,3o,1e,9x",
+    "hyo": "bj",
+    "hyp": "1t,53,93",
+    "hyr": "b1",
+    "hys": "s,1q,4v,19,17,3c,3,47",
+    "i\ne": "j0",
+    "i\ni": "8g",
+    "i c": "2n,35,6m,5,1x",
+    "i e": "a2,t,13,6,f,6,7,t,a",
+    "i f": "5t",
+    "i l": "j8",
+    "i m": "f1",
+    "i n": "ad,3m",
+    "i r": "h2",
+    "i s": "9k,6",
+    "i y": "is",
+    "i) ": "hj,19",
+    "i),": "8g,8g",
+    "i, ": "ak,b,6,1j",
+    "i-b": "2t",
+    "i-e": "bj",
+    "ia\n": "1,9,7,r,2,3,2,1,7,1,1,v,m,1,2,2u,2,2,1,1,4,3,2,2,3,1,2,2,b,c,2,1,3,2,1,3,1,3,5,1,g,1,1,1,6,1,2,9,1,4,8,4,1,3,1a,f,6,u,1,4,1,2,1,3,1,1,3,9,h,3,4,1,4,a,c,1,9,3,1,6,5,2,2,1,1,e,b,4,1,6,b,i,i,1,1,1,5,2,4,1,1,1,2,3,8,1,j,4,1",
+    "ia ": "4,2,4,2,3,6,1,1,b,1,2,1,3,6,4,2,1,4,2,1,5,3,c,8,1,4,5,2,1,1,2,3,5,4,5,2,2,6,5,7,6,3,1,2,e,3,7,5,1,6,1,4,1,4,e,1,1,3,1,1,2,2,2,1,2,3,7,2,6,1,2,4,2,1,4,6,1,4,4,8,3,3,5,2,2,2,1,1,1,4,2,1,7,3,3,a,3,1,2,1,3,1,1,2,3,1,2,8,6,6,i,1,2,2,3,3,2,16,7,4,1,3,2,3,1,9,1,1,7,1,3,2,8,1,g,1,e,4,5,5,8,1,1,4,2,3,1,9,3,1,4,2,3,2,8,9,5,1,1,9,8,8,1,4,2,1,3,1,1,1,1,1,1,1,1,1,3,1,2,1,1,1,4,1,2,1,1,1,2,1,1,1,3,3",
+    "ia)": "9o",
+    "ia,": "1c,z,u,14,25,6,1,15,y,x,b,9,4a,b,5,7,4,36,3,2,1,4,3,1,b",
+    "ia.": "a,4,15,g,7,c,c,9,1,10,m,21,f,l,11,b,e,h,1k,3n,4,c,17,6,12,8,a,o",
+    "iab": "2r,9k,4,p,1",
+    "iac": "m,5,1b,1s,y,10,1f,1n,i,d,8,8,o,j,1,8,10,d,m,1c,a,1,1a,n,1p",
+    "iad": "o,4,f,g,s,9,m,1,x,n,9,c,12,c,c,5,4,2,6,h,n,5,5,3,1,1,4,4,7,8,j,d,2,4,1,b,1y,17,1,6,17,5,j,7,m,c,1l",
+    "iaf": "3e,34,h,x,j,5,c,1,5m",
+    "iag": "cy",
+    "ial": "g,4,l,i,1,3,1,7,3,6,5,2,3,1,p,7,1,8,6,7,v,g,9,19,3,5,6,1,4,l,4,1,2,2,b,8,5,9,e,8,3,6,9,4,o,1,5,1a,5,3,2,2,4,6,5,2,9,k,3,8,b,8,2,6,6,9,m,8,i,1,i,7,7,w,3,3,e",
+    "iam": "4r,1s,80,23,15,t",
+    "ian": "3,3,d,d,2,5,2,1,8,6,3,1,2,1,3,7,3,1,6,c,4,7,1,3,3,1,3,6,1,c,9,k,6,4,7,b,c,3,2,1,b,1,d,2,1,6,1,c,c,4,1,1,4,4,2,1,a,1,3,6,4,3,c,2,1,3,3,5,1,9,9,1,4,5,9,1,5,2,1v,2,9,5,1,2,1,a,4,1,g,i,h,1,2,6,4,2,1,5,2,1,7,2,2,2,7,3,8,8,5,1,6,6,e,5,3,4,f,e,2",
+    "iar": "8,7,6,c,2,1,1l,c,1,9,1,2,1,9,2,2,l,1,2,4,d,6,q,7,8,l,5,4,5,2,z,g,2,2,h,4,1,p,k,1,l,7,13,c,5,3,3,b,8,7,3,3,a,3,3,6,6,z,1,1,2,1,1,c,8,4,3,2,1,2,1,5,1,1,1,7,1,g,5,b,2,s,5",
+    "ias": "2,7,1,b,7,3,a,4,4,3,7,1,3,g,e,1,h,3,1,2,3,7,4,2,2,g,2,b,b,6,2,g,5,9,8,1,7,3,1,2,e,6,i,b,4,8,3,9,2,b,4,1,1,4,6,3,2,5,5,2,i,b,2g,4,f,3,4,c,2,a,3,1,d,1,2,12,2,1,o,8,3,5,4,6,5,2,4,2,e,1,3,1,3,1,7",
+    "iat": "y,p,14,8,5,3h,3s,8,w,14,1n,40,f,c,6",
+    "iaz": "ax",
+    "iba": "3,v,5,1,k,2,4,7,4,i,c,2,5,a,8,d,c,p,a,x,1e,7,j,d,e,c,j,a,a,5,2,1x,9,9,3q,1,v,7,w",
+    "ibe": "i,1c,32,q,i,1d,16,3y,19,a,1,1,4,8,9,7,1o,1r,8,8",
+    "ibi": "19,h,3u,19,x,15,c,y,8d,p",
+    "ibl": "14,11,e,2f,f,1,l,1v,1z,w,2,3,2,4,6,c,1,2j,5,4,i,6,3p",
+    "ibr": "i,k,s,x,2v,i,1d,1,j,4,3,6,5,z,1p,1,18,2,5,2,2,3,7,2,3,4,2,3,3,7,f,6,t,1,1,3,z,f,h,k,v,3",
+    "ibu": "26,p,2f,b,2b,f,2e,4,1v,57,5,17",
+    "ica": "0,2,2,1,3,2,1,6,1,1,4,1,2,1,2,4,1,1,1,2,2,3,1,1,1,1,1,1,2,1,4,1,1,1,1,1,3,3,1,1,7,3,1,3,1,1,1,1,5,1,1,2,7,1,5,3,1,1,2,1,1,6,5,5,1,d,1,5,3,2,1,1,6,1,2,1,4,4,1,2,9,2,4,3,1,4,1,1,2,1,3,2,2,1,1,1,1,1,1,1,1,2,1,1,2,1,2,1,2,1,1,1,1,1,2,2,1,1,1,1,1,1,2,1,1,1,1,1,3,3,1,1,1,1,1,4,1,1,1,2,1,1,2,1,1,1,1,1,2,1,1,1,2,1,2,1,1,1,1,1,1,2,1,1,1,5,1,1,1,3,4,1,1,1,1,1,1,1,2,1,3,1,1,1,1,1,1,1,1,1,1,1,1,4,2,1,1,2,1,1,c,6,2,2,6,3,1,1,3,1,4,1,1,1,1,1,1,1,1,1,2,1,1,1,r,1,1,1,1,1,1,1,2,2,1,1,2,1,3,1,1,1,1,1,1,1,1,2,1,1,2,3,1,2,1,1,1,1,1,3,1,1,1,1,1,1,2,1,1,1,1,1,1,2,2,1,1,1,1,1,1,1,3,1,1,1,1,2,3,4,3,2,1,2,1,3,1,3,1,1,1,1,3,1,2,2,1,3,1,1,1,1,1,1,2,2,4,1,1,1,1,1,1,2,2,1,1,2,1,3,5,2,4,7,3,2,3,2,1,1,3,1,3,1,1,1,1,1,1,2,1,1,1,1,1,4,1,1,1,1,1,1,2,2,1,1,2,5,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,2",
+    "icc": "af",
+    "ice": "28,a,m,1,e,3,43,6,e,m,w,17,j,1c,1l,1s,2o",
+    "ich": "bc,17,1,4s",
+    "ici": "1,9,8,6,4,2,5,1,8,2,a,4,1,1,1,2,1,3,1,3,3,1,1,5,4,1,1,1,1,1,2,2,1,1,3,4,4,1,1,1,2,2,1,1,1,2,3,1,2,4,4,9,2,2,3,5,6,4,3,3,8,4,1,1,2,2,2,5,a,2,2,1,2,6,2,3,5,4,1,1,1,1,4,1,2,2,5,3,1,1,2,7,1,2,2,1,2,3,2,4,2,4,3,4,5,2,5,4,3,2,1,2,5,4,1,3,2,1,3,1,3,2,1,5,2,1,1,1,3,7,2,1,1,1,6,2,2,4,1,2,1,2,5,3,5,5,1,6,r,3,1,2,5,3,6,1,5,3,3,1,5,4,3,3,2,1,5,8,5,3,2,7,2,3,8,b,2,1,2,2,b,7,7,1,1,5,1,5,5,2,5,5,3,7,6,6,1,2,1,1,1,2,1,5,5,6,1,1,3,1,1,1,2,1,1,1,1,1,2,1,1,1,1,3,1,1,1,2,5",
+    "icl": "1g,3d,4r,46",
+    "ico": "1,2,4,1,4,1,1,1,1,2,1,1,5,1,4,1,3,1,a,1,4,3,1,1,1,6,3,1,1,3,2,1,1,1,1,1,1,1,1,3,1,1,1,1,1,2,1,2,1,1,1,3,1,1,1,3,1,1,2,3,6,1,1,1,1,2,3,1,1,1,1,1,2,1,1,2,1,3,2,1,1,1,1,1,1,1,1,2,3,1,2,2,1,1,2,2,1,1,1,1,1,1,2,1,1,2,1,1,1,1,1,1,2,1,1,1,1,2,1,1,1,1,1,1,1,3,1,1,1,1,1,1,2,2,1,3,2,2,1,2,2,3,3,5,3,1,3,1,1,1,1,3,1,1,2,4,2,1,1,1,1,2,3,1,5,2,1,1,3,1,1,1,2,3,2,1,1,1,2,3,1,1,1,1,5,1,1,4,2,2,1,1,1,7,1,3,1,1,3,1,1,3,1,3,1,1,1,1,1,1,1,2,2,1,1,3,1,2,3,1,3,1,1,2,1,5,1,1,2,1,2,2,1,1,3,7,4,2,4,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,2,1,5,1,7,1,2,1,1,3,2,2,1,1,1,1,3,1,3,1,2,1,1,4,1,2,1,1,1,2,1,1,1,1,1,1,1,1,1,1,3,1,1,1,1,2,3,1,1,1,1,1,2,1,2,1,3,1,2,1,2,2,8,5,4,4,1,5,3,1,1,1,3,3,1,4,2,5,2,2,3,3,1,2,2,1,1,2,3,1,1,2,1,1,1,1,1,1,2,2,1,6,1,1,3,2,7,5,3,2,1,1,2,2,3,2,1,1,1,2,1,4,1,3,1,1,1",
+    "icr": "3,g,n,h,4,3m,c,6,b,h,6,p,6,4,4,3,k,y,19,7,1q,h,1v,1,2,u,z,7",
+    "ict": "26,5,1b,5e",
+    "icu": "0,e,6,a,c,c,b,p,6,m,1,9,x,2f,h,j,b,18,x,5,m,i,16,w,1q,d,1,m,7,7,5,5,1,k,8,q,e",
+    "icy": "b7",
+    "ida": "1,2,6,8,5,2,d,3,3,5,3,a,1,1,1,2,1,2,2,1,1,2,1,1,1,4,3,4,4,j,1,1,3,1,5,1,1,1,7,g,a,3,5,2,1,5,5,7,1,2,1,6,3,2,5,4,2,3,3,1,1,2,1,2,2,2,3,3,2,5,5,2,3,1,4,7,2,1,1,1,1,1,6,7,4,1,1,2,3,4,1,3,5,3,2,5,4,b,4,1,6,2,1,4,2,1,1,1,2,3,1,1,2,1,1,1,1,3,1,4,3,1,1,1,1,1,1,1,1,1,1,1,1,3,1,1,1,1,5,2,1,1,3,2,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,3,2,1,2,1,1,1,2,1,1,1,1,1,3,1,1,2,2,1,2,1,1,1,1,1,1,2,2,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,3,2,1,1,1,1,1,1,2,3,1,1,2,1,1,1,1,1,3,2,1,1,2,1,1,1,1,3,1,1,2,1,1,1,1,3,5,2,1,4,1,1,2,2,3,1,2,1,2,3,3,1,2,2,1,3,2,3,7,3,3,6,4,1,1,1,4,2,2,1,2,1,2,1,4,3,1,3,1,1,2,2,3,2,1,2,4,2,1,2,1,1,1,2,1,1",
+    "ide": "2,k,d,7,3,k,2,l,e,a,f,3,1e,b,4,1,3,9,3,2,z,4,4,c,u,k,6,7,c,3,2,2,7,2,1,r,3,5,4,8,a,10,7,9,a,6,5,s,9,5,4,n,2,l,2,9,1y,q,1",
+    "idi": "4a,6,14,26,a,f,2p,1b,a,f,h,4,9,d,9,6,1a,2i",
+    "ido": "u,v,c,5,1,1,2,1,3,2,1,3,6,1,b,3,7,1,4,3,1,9,y,k,7,2,3,2,2,1,3,6,7,1,7,3,2,9,g,f,d,6,3,b,i,a,j,4,2,1,4,5,2,1,1,5,1,y,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,5,1,5,a,3,1,4,6,2,7,1,2,1,5,2,b,6,e,a,5,1,1,3,1,1,5,7,9,6,a,2,5,6,5,f,6,2,b,m,3,2,7,f,3",
+    "idr": "1p,4b,3,a,1y,1,2,7,1p,7,1d,t,d,c,5,f,1,b,11,8,24,7,7,1",
+    "idu": "47,5v,2f,5,2,j,49,1,z",
+    "idy": "17",
+    "ie ": "88,3r,6a",
+    "ieb": "13,c,r,s,t,l,1,w,1u,1,21,4,3,3,37,i,19,9,48,9",
+    "ied": "0,2,1,7,1,c,b,8,d,1,4,2,3,1,1,1,1,1,3,1,2,1,1,1,4,2,1,9,1,4,1,a,3,2,1,3,2,2,3,2,3,1,1,6,1,g,b,1,9,1,1,2,c,9,i,4,4,2,1,4,4,9,1,1,1,h,5,e,4,2,2,3,2,d,3,1,1,2,1,1,b,2,2,3,2,3,h,a,3,7,1,1,4,k,1,1,2,z,6,1,1,2,8,7,h,8,2,1,1,4,3,1,1,6,4,4,9,3,1,3,15,6,1,d,9,2,1,2,h,1,4,1,1,2,1,2,1,2,5,6,3,1,1,3,1,2,1,1,3,4,1,2,1,3,2,1",
+    "ieg": "1z,cf",
+    "iej": "21",
+    "iel": "n,l,2,3,1k,9,a,5,7,3,6,a,c,4,8,2,c,7,b,5,3,i,2,1,r,6,3,d,2,h,7,2,k,3,2,g,c,f,r,y,f,2,5,9,b,c,d,e,c,b,2b,5,2,7,2,2,k,3,9",
+    "iem": "i,k,s,g,6,t,2v,1d,12,52,31,h,l",
+    "ien": "c,2,5,2,6,6,5,5,3,1,1,1,6,2,3,1,1,3,3,2,2,1,2,1,1,4,1,4,2,1,3,3,4,3,6,1,1,1,1,3,2,g,7,1,7,5,2,2,2,2,7,8,4,3,3,5,2,1,1,8,1,1,b,1,1,a,4,6,2,8,4,3,4,2,3,2,1,1,9,6,4,3,1,3,2,1,8,4,1,1,1,5,7,2,4,1,3,2,1,1,7,6,1,3,1,1,1,2,5,1,2,5,5,2,4,2,2,2,1,1,5,2,1,4,2,9,u,3,2,3,1,1,4,1,4,4,1,1,1,1,1,2,2,1,4,2,3,1,2,7,5,3,1,2,3,1,2,3,1,1,1,1,4,6,5,2,2,e,8,2,1,3,1,2,6,1,4,1,2,1,1,3,5,1,1,2,3,9,2,1,4,2,1,3,1,1,4,1,1,1,5,2,8,6,4,3,1,1,a,9,1,8",
+    "ieq": "93",
+    "ier": "0,3,2,1,5,e,9,1,2,2,8,c,4,2,2,d,6,3,4,a,2,1,s,15,5,2,7,3,b,6,2,1,1,2,1,g,8,4,4,1,3,2,8,h,9,f,b,11,9,12,7,1b,6,8,29,v,1v,e,b,9,3,1,2,1,4",
+    "ies": "0,5,3,3,4,k,c,a,c,5,d,4,v,8,g,6,e,w,1,2,u,a,3,5,2,4,2,5,4,8,7,4,l,6,9,1,1,9,c,1,2,c,1,1f,4c,4,2,i,f,3,2,1,b,4",
+    "iet": "y,1p,4,1f,6,8i",
+    "ifa": "8n",
+    "ife": "1t,e,7,n,2,e,1g,5,x,a,b,h,q,19,c,32,9,z,2,t,10,7,c,4,19,3,v,e,g",
+    "iff": "5s,33,9y",
+    "ifi": "j,7,k,3p,5,2,27,b,r,m,5,3,g,4,17,1y,a,15,1r,2o,8,1",
+    "ifl": "22,1y,2f,23,h,l,13,1t,k,2,5d,h",
+    "ifo": "n,2,17,a,1v,p,n,t,s,6,1l,3,8,9,v,6,y,1o,z,d,7,k,5,3,g,y,23,d,2",
+    "ifu": "3,9,h,6,4,4,a,1,j,1f,b,1,9,3,8,1,2,q,1,3,1,9,4,7,18,a,1c,h,4,3,4,l,f,3t,1u,s",
+    "iga": "3,8,1q,a,l,f,s,6,m,16,a,p,2,4,w,g,5,m,8,r,d,23,1r,a,26,4,9,1,w,1,4,2,1,1,b,3",
+    "ige": "0,3,1,1,1,2,1,2,1,1,2,1,1,1,3,3,2,1,2,1,1,2,1,4,1,4,4,2,3,1,5,2,k,2,6,1,7,1,7,3,3,6,3,o,4,6,d,j,d,6,6,4,3,2,1,1,7,1,e,1,2,3,8,7,5,4,4,4,1,1,2,1,2,3,1,1,1,2,1,1,2,2,1,4,3,4,9,3,7,d,3,4,6,1,1,a,t,2,9,5,r,1,1,1,1,3,6,2,2,2,1,1,5,1,2,2,1,1,1,1,1,m,6,x,8,1,8,7,1,2,1,1,1,2,1,5,3,9,1,1,6,3,1,2,5,2,1,1,2,3,6,2,1,1,6,1,3,4,d,1,1,c,5,2,3,2,1,2,6",
+    "igh": "de,m",
+    "igi": "1p,j,4,6,9,6,2,c,2,3,q,u,s,9,j,n,g,1u,e,1,4z,a,16,1w,b,7,1",
+    "igl": "2t,5,7,f5",
+    "ign": "j1",
+    "igo": "w,1g,q,1f,6m,1o,s,4,2b,k,2q",
+    "igr": "x,1a,27,7,b,8,2,2,7,5,y,2e,p,9,4b,8,5,1,f,r,p,5",
+    "igu": "2f,u,9,f,k,c,8,6,2,d,f,1v,1q,1a,h,4z,10,1w",
+    "ihe": "10,g,16,2g,v,8h",
+    "ihi": "v,16,61,17,6w,19",
+    "iho": "28,45,28",
+    "iin": "1,6,3,7,1,d,3,2,1,1,4,2,2,3,1,1,1,7,1,1,5,7,2,4,d,1,1,b,3,3,3,1,2,3,1,3,1,2,1,1,4,1,5,1,1,3,5,4,5,6,3,2,2,4,1,2,1,1,3,1,3,5,1,3,1,e,1,2,1,2,1,1,1,1,1,1,1,1,1,3,3,1,1,1,1,1,2,1,2,1,1,2,9,5,7,2,1,3,2,1,3,1,2,1,5,1,3,2,5,6,1,1,1,4,2,1,2,3,5,1,1,1,2,4,1,2,2,4,1,1,2,4,1,6,4,5,2,5,5,1,1,1,3,3,1,4,6,8,1,6,t,1,1,4,1,1,3,2,2,3,3,3,2,1,3,1,2,b,2,1,4,1,1,3,a,7,2,3,1,1,2,3,3,1,2,1,3,1,2,5,2,2,2,3,4,1,5,1,8,2,1,4,1,6,6,4,1,9,2,4,1,2,2,1,1,5,3,4,1,1,1,1,1,2,1,1,1,1,1,4,1,1,1,2,3,2,4,1,3,1,1,4,2,3,3,1,3,2,1",
+    "iit": "a3",
+    "ija": "bl",
+    "iji": "b8",
+    "ijo": "d1",
+    "ika": "30,3j",
+    "iki": "b8,5g",
+    "iko": "a9",
+    "il ": "a,1,6,s,n,7,m,48,1d,4,m,4j,e,1,1l,1h,9",
+    "il,": "o,8u",
+    "il.": "cn",
+    "ila": "5,1,s,f,9,b,2,b,q,i,e,w,4,2,1,11,2,e,3,1,4,b,2,u,a,5,1,9,2,g,4,9,g,l,8,a,7,2,2,6,15,l,7,h,2,2,8,9,g,4,4,4,1,g,7,2,7,n,d,1,b,b,2,5,1,3,o,1",
+    "ild": "9a",
+    "ile": "1g,k,6,8,3,u,m,9,26,p,3,22,b,6,1u,1l,1t,6,w,30",
+    "ili": "0,9,i,6,3,f,a,5,3,a,2,1,5,3,5,2,3,1,1,1,2,1,1,1,2,2,5,2,2,1,1,3,1,1,2,2,3,2,1,1,3,1,1,2,1,2,2,1,1,1,2,1,1,4,4,1,2,2,2,8,4,h,2,1,4,4,2,4,1,2,1,2,2,1,2,1,3,1,2,2,2,1,1,4,1,2,1,2,4,2,2,1,2,2,4,1,1,1,1,1,1,1,1,1,2,3,1,1,1,1,4,3,9,3,1,3,2,8,1,a,7,1,2,p,2,2,4,4,1,l,2,a,4,q,1,3,7,5,2,2,2,2,9,4,1,d,d,1,4,2,2,2,1,4,1,1,1,3,m,f,7,j,1,2,3,6,4,e,a,4,1,2,2,3,2,1,2,1,1,1,1,1,2,1,1,2,1,1,1,2,1,1,1,1,1,1,4,1,1,1,2,1,1,1,1,1,1,5,1",
+    "ill": "2,t,d,2,6,7,1,1,6,a,a,7,3,j,1a,b,6,b,2,3,4,8,9,2,1,2,6,6,8,3,5,i,1,14,6,1,e,9,9,7,2,2,r,3,h,7,1f,8,1,1,2,e,8,5,g,9,e,7,1,1,1,1,8,4,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,2,1,1,1,9,2,3,2,4,d,6,1,1,2,1,3,6,t",
+    "ilo": "1z,1f,4,3j,1f,h,u,91,g",
+    "ilv": "2s,2o,1t,3h,32,k,i",
+    "ima": "5c,42,27,5,m,1,v,q,1u,3c,3",
+    "imb": "8w,9c",
+    "ime": "r,23,1a,2,5,h,15,1d,p,a,c,2q,a,h,1,4,3,12,a,n,j,1m,6,m",
+    "imi": "3,2,1,d,n,g,1,4,j,l,p,1,8,3,l,f,2,5,3,7,c,4,2,5,6,h,6,2,g,1,6,6,4,4,3,3,3,5,5,2,2,3,1,1,1,s,4,a,a,1,5,d,2,8,b,6,w,9,3,9,6,2,a,6,7,4,2,4,4,p,4,1,1,2,4,1,f,1,9,7,4,7,6,4,7,7,1,1,2,6,3,4,1,e,3,6,1,2,4,b,b,7",
+    "imm": "60",
+    "imo": "m,f,2,8,1e,9,1l,1r,a,i,21,l,1y,16,b,6,2z,9,1v,6,4,7,b",
+    "imp": "g,5,f,23,5,1n,4,d,1d,1q,5,t,6,1t,2,44,3,a,1r,8,17,2",
+    "imu": "0,1,b,f,4,2,11,2,4,5,n,e,s,1,m,m,e,3,j,1,f,j,6,3,1,3,1,1,2,1,4,1,1,1,2,6,8,1,3,4,h,a,n,5,f,2,g,1x,8,h,b,c,7,1,3,2,2,h,h,j,1,1,1,5,3,1,7,2,3,5,3,8,y,5,j,7",
+    "imy": "42",
+    "in\n": "8h",
+    "in ": "15,4o,4,2o,y,b,l,1h,14,15,3a,c,1e",
+    "in,": "8h",
+    "in.": "57",
+    "ina": "0,1,3,1,1,1,1,1,1,3,1,1,1,2,2,1,3,4,2,4,1,1,2,5,1,1,1,1,4,5,2,2,1,2,1,1,1,1,2,1,2,1,3,1,3,2,1,1,3,1,1,1,1,1,1,3,1,2,2,2,2,2,2,1,1,5,1,1,1,2,3,4,1,c,1,1,1,4,2,1,3,2,5,1,1,1,5,5,1,1,1,1,4,1,3,2,1,2,1,1,1,1,1,2,7,2,1,5,1,3,3,1,3,1,1,1,3,3,2,1,1,1,3,1,1,9,2,1,2,1,4,1,1,3,1,1,2,1,2,1,1,1,1,1,2,2,2,3,1,2,1,1,3,1,1,1,4,4,1,1,4,2,3,a,2,1,2,3,3,1,1,2,1,2,4,1,2,3,3,1,3,3,2,1,2,2,4,2,2,4,1,2,3,2,1,1,1,1,3,2,1,1,1,1,1,1,1,1,1,6,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,2,3,1,1,1,2,3,2,1,1,1,1,2,1,1,1,1,1,1,2,1,1,4,1,1,4,2,1,1,1,2,3,1,1,1,1,1,1,1,1,1,2,2,3,1,2,3,1,1,1,1,1,1,2,1,1,2,2,1,1,2,1,1,1,2,2,2,2,2,1,1,4,3,1,1,1,1,1,1,1,1,2,1,1,2,1,5,1,1,1,1,2,1,6,1,1,1,2,1,1,4,1,2,1,3,2,1,3,1,1,3,1,4,1,4,1,1,1,1,4,1,5,4,2,1,1,3,1,1,1,1,1,1,1,1,1,1,1,1,2,2,1,2,1,1,1,4,3",
+    "inc": "e,10,o,z,6,x,2b,a,i,1h,b,4,w,2g,e,3,1x,i,g,4,7,4,j,m,2,c,17,a",
+    "ind": "l,y,1k,2,b,3,z,b,t,k,e,2,d,9,11,q,1,v,3,2g,2,6,7,3,1i,z,h,2,a,r,8,a,1,6,8,b,3,7,b,6",
+    "ine": "g,k,q,9,d,3,2,1,q,1g,2,7,8,1,3,k,7,a,f,6,b,5,v,c,z,3,l,m,6,5,6,2,7,12,8,h,2,3,3,2,6,3,2,8,a,3,q,9,6,1,1,1,2,7,5,2,1b,11,3,r",
+    "inf": "1,6,3,7,1,d,3,2,1,1,4,2,1,1,3,1,1,1,7,1,1,3,2,7,2,1,3,2,4,7,1,1,3,8,2,1,3,3,1,2,3,1,1,2,1,2,1,1,4,1,5,1,1,3,1,4,4,5,6,3,2,2,3,1,1,2,1,1,3,1,3,5,1,3,1,9,5,1,2,1,2,1,1,1,1,1,1,1,1,1,2,1,3,1,1,1,1,1,2,1,2,1,1,2,3,2,4,5,1,6,2,1,3,2,1,3,1,2,1,1,4,1,3,2,5,6,1,1,1,4,2,1,2,3,5,1,1,1,2,2,1,1,1,2,2,1,3,1,1,2,4,1,6,4,5,2,3,2,1,4,1,1,1,3,3,1,4,6,8,1,6,t,1,1,4,1,1,3,2,2,3,3,3,2,1,3,1,2,b,2,1,4,1,1,1,2,a,7,2,2,1,1,1,2,3,2,1,1,1,1,1,3,1,2,5,2,2,2,3,4,1,5,1,8,2,1,4,1,6,6,4,1,7,2,2,4,1,2,2,1,1,1,4,3,3,1,1,1,1,1,1,2,1,1,1,1,1,4,1,1,1,2,3,2,4,1,3,1,1,4,2,3,3,1,3,2,1",
+    "ing": "i,i,1,3,o,2,b,4,5,2,4,a,9,6,8,5,4,2,3,1,1,1,b,3,3,1,4,3,1,3,3,4,3,1,5,2,5,2,5,2,1,2,3,8,1,2,g,6,5,d,4,5,b,2,z,i,1,6,v,i,i,3,1,m,c,n,3,b,5,5,2,2,1,3,1,4,3,1,2,2,3,1,5,1,1,4,3,1,3,4,1,4,b,n,7,b,1z,4",
+    "inh": "31",
+    "ini": "v,7,z,4,g,1d,6,f,8,4,e,12,6,22,3,9,c,1c,7,6,1f,e,v,4,1,4,1,1,4,1,3,1,1,1,4,1,1,2,1,1,1,1,5,1,2,4,3,1,5,1,2,1,t,5,5,b,i,b,4",
+    "ink": "1z,1j,3j,c7",
+    "inm": "v,v,j,32,5,q,1,7,8,x,1,3,4,1,4,5,e,1,1,6,h,y,1,1,4,3,1,1,2,1,5,2,1,4,5,1,o,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,5,4,3,3,2,5,4,4,b,5,5,1,6,6,6,1,4,2,1g,19,w,3,2,1,1,2,5,2,1,1,b,1,1,1",
+    "inn": "j,8x,1k,5c,1d",
+    "ino": "d,1,1,1,f,1a,j,2,7,q,3,4,c,h,5,j,3,4,3,1,3,2,4,e,r,9,b,q,1,1,1,4,18,i,6,4,9,4,a,1,6,1a,1,c,i,5,5,9,3,1,1,g,3,7,2,o,2,5,1,4,8,1,9,b,2,6,h,d,7,15,1,2",
+    "inq": "j5",
+    "ins": "b,19,c,d,n,i,2,12,i,8,16,1,j,9,c,3,r,3,7,7,3,2,1,q,35,d,1l,n,4,3,j,t,1b,3,4,b,4,9",
+    "int": "z,j,6,g,d,i,7,w,r,h,9,m,m,3,i,q,4,3,f,13,6,o,d,6,8,15,4,4,2,o,1,5,e,k,i,5,h,q,d,7,1,25,1,4",
+    "inu": "1,6,8,1n,5,j,f,5,a,3,12,l,1h,1i,l,19,f,3,20,2i,5,e,6,x,4",
+    "inv": "59,1,47,r,d,23,4k,x",
+    "io\n": "i,d,3,w,7,2,4,a,4,f,3,7,2,1,6,1,5,1,5,a,4,5,6,3,2,2,1,2,4,2,3,1,3,5,4,1,d,4,1,2,3,2,b,a,18,5,1,5,1,d,x,6,7,4,5,c,1,5,i,2,7,v,1,1,1,3,2,1,2,3,6,1,3,2,5,2,2,1,3,f,e,5,2,5,2,3,5,5,1m,2,7,3,2,3,1,1,4,1,1,1,2,8,1,1,6,1,1,2,o,1,4,2,3,3,1,3,3,3",
+    "io ": "b,5,1,b,2,i,2,6,n,1,8,j,1,b,5,7,n,6,6,8,2,1,6,1,3,b,a,1,1,q,8,3,6,9,8,o,i,9,2,1,1,2,8,3,2,2,1,a,1,1,3,3,r,f,9,4,11,9,2,p,2,2,6,5,d,1,r,8,b,2,g,h,k,6,2,p,h,4,1,6",
+    "io)": "4x",
+    "io,": "3z,3n,o,n,t,d,c,2s,1h,q,5,2,h,17,4",
+    "io-": "hj",
+    "io.": "i,b,z,3,1,7,1b,1g,4,w,l,j,x,z,1p,2q,l,c,n,i,n,3,4,u,6",
+    "iob": "dy",
+    "ioc": "8l",
+    "iof": "bl",
+    "ioi": "z,1c,4v,3l,6f",
+    "ioj": "2v",
+    "iol": "n,1,v,1,9,p,1i,q,1p,h,2,1,e,9,5,11,5,1,1,1,1,c,6,5,2,2q,5w,k",
+    "ion": "2,4,3,3,3,6,6,1,1,3,1,2,4,2,1,2,1,1,1,3,3,4,1,1,2,1,1,1,4,3,2,1,2,1,3,1,1,1,1,3,4,2,2,1,1,2,2,1,5,1,2,1,1,2,1,1,2,1,1,2,1,2,1,1,1,1,2,1,2,1,3,1,4,1,1,1,1,4,2,3,6,1,3,1,5,2,1,6,2,1,1,5,2,1,2,1,1,7,3,3,1,1,2,5,1,2,2,3,1,2,3,1,1,1,1,2,3,1,1,2,2,1,2,2,3,1,3,1,1,4,5,1,1,2,1,1,2,1,3,1,1,1,1,3,1,1,1,1,1,8,2,2,1,1,2,2,6,1,3,2,1,1,1,1,1,2,1,1,1,5,2,1,2,3,1,2,1,2,5,2,5,1,2,2,1,3,2,3,3,2,3,1,2,8,2,1,2,4,1,7,1,q,1,2,1,1,1,1,1,2,1,2,4,2,1,2,2,2,2,1,2,1,1,1,2,2,3,1,2,2,2,2,1,2,1,2,3,4,1,1,4,1,1,1,2,1,1,1,2,2,1,1,1,1,1,3,1,3,1,c,2,4,2,2,2,4,1,2,1,1,2,1,1,6,1,1,3,1,1,3,2,1,1,1,1,7,1,1,1,4,2,1,1,1,4,3,2,3,1,2,1,1,3,1,1,4,4,1,5,1,2,3,1,1,1,1,1,2,1,2,1,1,1,1,1,2,1,1,1,1,1,3,1,1,2,4,1,1",
+    "iop": "7g,4,62,2,d,8,16,1,2,5,e,7,19",
+    "ior": "3k",
+    "ios": "m,2,2,5,8,7,1,u,2,7,6,g,1,6,2,2,6,5,e,6,8,8,5,1,4,q,6,5,a,2,6,3,a,1,1,d,2,a,8,2,4,4,n,3,2,1,2,1,1,1,1,8,a,4,3,h,j,1,2,8,d,1,10,3,8,7,b,d,5,a,6,l,i,2,3,12,6,1,2,b,9,6,5,1,3,n,4,f,3,1,4,1,2",
+    "iot": "19,h,m,1h,1,y,m,1,11,d,e,12,y,1,h,6,1,c,m,d,2v,m,8,1b",
+    "iov": "6t,3a,x,1q,a,c,a,f,17,10,2b",
+    "iox": "1,2,e,5,14,5,4,1,1,4,g,k,5,5,2,1,7,q,a,6,g,k,5,4,1,2,3,2,5,3,2,5,a,1,e,1,1,1,1,h,1,1,2,3,4,1,i,t,9,2,8,3,3,1,4,4,2,1,1,1,1,1,1,1,1,1,5,7,9,4,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,5,1,2,1,1,1,2,2,1,1,1,3,1,1,2,2,3,1,2,1,1,1,2,2,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,2,1,3,2,2,1,1,1,1,2,3,1,1,2,1,2,1,1,5,1,1,2,1,1,1,1,3,1,1,2,2,1,1,3,5,2,5,1,1,2,5,1,3,2,3,3,1,2,2,1,3,2,a,3,9,5,1,7,3,h,6,5,1,8,6,4",
+    "ipa": "t,l,t,a,e,6,6,x,4k,16,5,l,20,4,5,2,h,a,17,i,s,3,30",
+    "ipe": "4,1b,e,p,h,6,1s,7,b,j,k,4,7,3,h,a,f,u,8,5,6,e,k,z,3,2h,h,6,1v,j,d,2,7,1,2,8",
+    "ipi": "1f,o,3,s,f,1x,2,1r,1,3,r,1h,3i,1p,7",
+    "ipl": "1u,4,1b,7,1,33,6t,51",
+    "ipn": "1j,1,18,66,s",
+    "ipo": "j,d,9,m,d,5,a,8,3,8,1,2,4,6,d,1,1,r,7,q,3,9,2,o,2,7,t,f,d,h,m,8,f,7,7,6,20,r,n,u,4,8,6,6,3,b,9,b,q,e,8",
+    "ipp": "3j,1s,9c,1j,1d",
+    "ipr": "2x,p",
+    "ipt": "1r,1l,2i,10,ao",
+    "iqu": "3k,q,1n,3,1b,2w,3k,1i,3v",
+    "ir\n": "8a,4",
+    "ir ": "26,1,c,a,1,1,9,1,9,o,t,l,o,7,6,i,7,6,b,4,b,b,1,3,1,5,h,h,h,5,2,3,2,1,5,1i,b,3,6,d,9,7,4,1,9,8,b,2,2,4,4,2,h,d,2,1c,d,w,1,e,j",
+    "ir.": "dx,2r",
+    "ira": "2,7,c,3,4,h,4,e,3,16,7,5,4,7,4,e,2,q,4,1,2,8,c,6,d,1,a,1,b,2,1,o,2,6,2,1,10,5,1,2,1,2,l,1,a,4,2,o,4,1m,2,a,1e,6,t,t,a,9,6,8,i,l,a,2,a,3,3",
+    "irc": "i,18,9,d,m,c,8,1,3,9,u,2,1u,6,a,y,k,18,q,22,3n,d,1,9,8,b,1b,c,9",
+    "ire": "1f,o,3,s,f,9,1k,4,2,1r,1,u,1h,f,38,1k",
+    "irg": "4r",
+    "iri": "1f,1y,3q,12,k,q,e,2,10,l,1c,h,2v",
+    "irl": "5e,5r,7q",
+    "irm": "b8,1n",
+    "iro": "2s,3o,4j,4,1y,2i",
+    "irr": "11,1m,b,9,12,o,p,d,1w,5,8,c,i,9,1u,5s,1y",
+    "irs": "b5",
+    "irt": "51,n",
+    "iru": "ax,2l,4n",
+    "irv": "dc",
+    "is\n": "5p,d2",
+    "is ": "14,h,4,3,b,9,9,n,v,o,q,8,a,4,4,i,i,l,8,c,4,4,q,4,7,8,3,d,e,7,m,1p,j,1c,2,8,f,6,4,1,3,l,g,3,e,d,u",
+    "is)": "2p,8r",
+    "is,": "31,56",
+    "is-": "f6",
+    "is.": "36,3d,2i,c,k,4r,b,r",
+    "isa": "o,1,m,6,10,2o,t,27,14,17,3g,4i",
+    "isc": "p,4v,h,1u,10",
+    "ise": "2,8,3,7,3,4,g,1,e,6,3,9,3,6,7,p,3,b,1,2,1,a,6,1,6,2,3,1,5,1,4,3,1,3,2,e,2,5,5,1,3,6,6,7,1,9,4,1,2,1,4,6,7,s,k,1,f,20,a,3,12,17,e,7,7,3,5,1k,h,c,4,5,5,1,3,1,1,2,b",
+    "ish": "a2,i,b,7l",
+    "isi": "c,a,5,2,o,1,z,2o,n,i,a,s,q,1,k,7,r,c,8,o,k,18,9,4,v,l,2,21,n,16,2,1,g,b,3",
+    "isl": "7d",
+    "ism": "p,1d,5,1,2,5,j,7,1y,s,4,g,u,r,k,d,3,2a,7t",
+    "iso": "s,8,17,2p,4x,4c,t",
+    "isp": "7,ag,i,2t,6,6,z,3m",
+    "iss": "o,1y,3,cj",
+    "ist": "q,4,1,v,2,9,2,8,d,2a,4,3,3,7,1,a,2,2,1,6,6,7,a,5,i,8,1,6,5,1,5,1,e,7,6,1,e,e,e,2,3,3,3,1,1,2,4,2,7,o,3,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,4,4,3,3,2,5,1,3,4,6,2,3,4,1,6,1,3,2,4,6,3,5,1,6,n,n,b,5,e,5,a,u,2,2,1,1,1,1,1,1,1,5,2,1,1,1,3,4,1,1,2,1",
+    "isu": "a,6,2s,27,12,8,1,95,13",
+    "it ": "aq",
+    "ita": "4,3,2,4,e,2,5,3,8,m,c,5,5,4,2,8,7,5,4,i,5,1,4,6,a,3,a,f,3,2,3,r,4,8,6,d,1,1,c,c,6,2,1,4,3,a,a,3,4,5,3,1,e,6,1,3,4,1,j,3,6,1,4,4,5,3,1,1,7,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,4,1,3,1,1,1,1,1,2,2,5,1,2,1,1,2,1,6,2,3,1,1,1,2,1,1,3,1,1,1,1,1,1,1,1,3,1,1,3,1,1,1,4,1,3,1,3,3,1,1,1,3,1,1,2,1,3,1,2,2,1,m,2,n,5,h,2,7,n,e,2,2,3,8,2,2",
+    "itc": "cj",
+    "ite": "1a,13,6,5,2,f,3,g,d,a,e,4,5,3,1,c,3,3,2,1,e,8,i,3,8,6,2a,g,2p,8,2s,e,u,z,13,1",
+    "ith": "7r,a9,b",
+    "iti": "7,f,1,1,v,1,8,1,5,2,3,7,7,1,3,2,g,e,j,6,4,1,f,6,c,4,5,1,b,6,8,8,4,1,b,1,2,1,1,d,6,3,4,1,9,1,9,1,1,2,7,1,3,3,5,1,1,1,1,d,5,5,2,3,5,8,q,1,2,6,9,4,1,x,5,6,2,1,4,2,3,7,d,1,d,8,f,3,f,4,1,1,2,2,a,9,1,2,1,1,13,14,1,6,4,1,2,2,4,1,c",
+    "itm": "22,6,1m,5v,57",
+    "ito": "c,n,j,1,r,2,j,4h,m,1q,2,a,1,8,13,9,q,6,6,2,2,o,3,19,v,2l,1,9",
+    "itr": "y,5,8,38,3,1k,2s,2n,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,5,h,a,2,2u",
+    "itu": "2,q,3,11,k,8,15,1g,i,7,l,q,1g,14,b,4,4,1,3,2,2,1,2,7,1,3k,19,g,z,9,d,2,e,j",
+    "iul": "34",
+    "ium": "d,7,5,r,2,8,f,1,4,6,1,p,1a,6,9,i,7,c,l,6,6,b,1,6,1,c,2,g,s,b,9,3,2,7,7,5,y,a,11,5,k,f,a,l,a,1,a,7,1,e,5,h,6,b,j,1b",
+    "iur": "7,7,b,5,k,1,d,5,1,2,5,1,1,4,1,1,3,8,d,a,9,1,s,b,6,2,1,1,1,1,3,1,b,1,c,1,j,b,8,5,4,2,4,1,9,4,1,4,2,4,5,1,1,1,6,2,g,a,1,4,1,2,2,2,e,g,4,v,4,3,3,s,1,k,7,9,2,1,1,2,5,3,3,2,1,1,6,1,1,1,1,2,3,2,1,1,1,8,1,2,4,1,s,c,7,2,w,3,g,1a",
+    "ius": "5f,54,7,2n,i,k,4q",
+    "iva": "0,1,1,2,1,2,4,d,2,1,4,3,4,5,4,2,3,6,2,4,1,5,2,8,1,j,e,2,d,o,1,n,2,6,j,3,2,j,1,7,3,5,3,5,5,1,3,8,2,2,3,1,1,2,1,1,2,4,1,1,1,2,5,2,3,4,1,1,1,3,1,c,b,6,3,2,b,1,6,r,7,5,2,3,1,3,1,s,1,1,4,1,9,1,2,7,3,2,4,e,3,a,8,b,7,h,1,1,1,1,2,2,1,6,1,2,1,1,1,1,1,1,1,2,3,1,1,1,9,6,5,1,7,1,g,9,1,2,j,2,1,6,4,1,8,1,4,5,1,2",
+    "ive": "j,16,1q,d,1,s,36,m,1r,a,4,4,2i,9,6,46,u",
+    "ivi": "4,4,7,6,2,1,4,5,2,g,7,8,r,c,1,9,1,2,a,2,2,h,4,k,9,2,8,a,a,8,3,1,a,7,5,2,2,5,2,g,2,9,8,1,j,8,6,2,1,4,1,h,2,6,1,3,4,2,b,1,5,4,7,4,1i,4,5,3,e,v,5,1,5,16,1,1,2,1,1,k,4,3,2,1,2,1,5,1,1,1,7,h,5,7,4,1,1,e,1,6,3,1,1,1,1,a",
+    "ivo": "3,1,1,1,1,1,1,3,1,1,1,1,2,2,1,1,2,1,1,2,1,1,3,1,1,3,1,4,a,c,5,c,5,1,1,5,1,1,1,a,3,1,5,2,5,2,4,e,4,3,4,1,b,3,7,1,7,1,1,2,5,5,9,1,6,3,2,1,1,e,4,2,2,1,4,1,5,5,3,1,1,h,2,2,1,3,1,2,2,2,1,2,3,1,4,b,6,9,k,4,1,2,b,b,a,3,6,9,5,s,4,4,2,6,2,1,1,3,2,3,5,1,e,g,p,8,1,o,2,3,3,g,2,1,1,5,2,1,1,1,1,5,2,1,1,2,1,2,1,3,1,1,3,1,4,2,8,f,c,4,4,2,2,3,6,1",
+    "ivu": "6,g,14,53,1e,1q,5x,n,9,y",
+    "iwi": "cp,10",
+    "ix ": "23,1a,u,2w",
+    "iz ": "14,3b,k,e,c,1,9,5,9,1,9,q,6,1,1,1,2,2,2,4,2,1,1,2,1,1,1,1,1,3,6,1,1,2,1,2,1,1,v,5f,2a,11,8,a,5",
+    "iz)": "7p",
+    "iza": "n,9,1,3,8,4,1,c,7,b,2,1,5,3,2,3,2,3,1,1,1,2,1,1,1,4,3,2,5,1,3,1,1,2,2,3,2,1,1,3,2,2,3,2,1,1,3,1,1,4,1,4,1,1,1,1,2,4,4,1,3,4,2,6,5,2,5,4,2,2,2,1,2,1,1,1,1,1,1,2,1,3,1,2,2,1,1,1,1,4,1,2,1,2,4,1,1,2,1,1,1,2,1,1,3,1,1,1,1,1,1,1,1,2,3,1,1,1,1,4,2,4,1,5,2,1,1,2,1,2,2,b,6,2,6,2,5,5,d,2,2,2,4,4,1,3,4,e,5,2,5,4,q,1,1,2,7,5,2,2,2,1,1,4,5,3,1,1,3,2,8,1,a,2,1,4,2,1,1,3,1,3,1,1,1,1,2,3,h,2,2,4,4,1,2,2,7,2,3,8,6,1,2,2,1,n,1,8,2,1,3,1,2,1,1,2,1,2,1,2,1,1,1,2,2,1,1,2,1,1,1,2,1,1,1,1,1,1,4,1,1,1,2,1,2,1,1,1,5,1",
+    "izo": "5z,1i,1,c,3,m,1x,10,1e,5r,f",
+    "ja ": "r,c,h,2,13,2y,b,1h,17,5,1q,f,5,1,3,6,a,2,1,1n,j,c,4p",
+    "ja'": "5q",
+    "jab": "4i,s,7s",
+    "jac": "2p,2,8l,1g",
+    "jad": "5b,27,5c,59",
+    "jal": "9v",
+    "jam": "d4,42",
+    "jan": "0,n,o,9,4,8,1,9,7,c,p,a,6,w,v,1d,6,4,5,9,16,1,1,s,2u,c,2w,x,28",
+    "jap": "16,9u,6,2,1y,s,34,1m,6",
+    "jar": "1m,k,s,r,2,h,5,d,c,4,1,2,1v,v,16,3,1,1j,3u,2a",
+    "jas": "14,v,c,8,d,7,c,d,3,8,d,4,1,3,6,2,2,2,7,a,1,c,4,e,i,7,3,q,10,7,6,1x,5,16,t,9,9,2,3,c,2,k,1x,2,t,4,3,3,1,1,2,2,1,2,l,j",
+    "jav": "4g,7z,55",
+    "jaz": "8u,10",
+    "je ": "im",
+    "jec": "8h,4l,c,n",
+    "jed": "r,v",
+    "jen": "i,k,g,c,n,3n,18,5,1,11,83,h,1i",
+    "jer": "1g,w,5x,ax",
+    "jid": "5t,12",
+    "jie": "83,5,e,2o,1u,14",
+    "jig": "4v,68",
+    "jik": "b8",
+    "jil": "7,h,21",
+    "jiz": "59,7l",
+    "jo ": "t,x,b,k,3,15,t,9,8,6,z,1u,5,1,1,p,1v,20,5,9,4,2g,10,r",
+    "jo)": "5g",
+    "jo,": "2h,38,a7",
+    "jo.": "d1,21,4",
+    "joa": "cy,3",
+    "job": "60",
+    "joj": "60",
+    "jor": "b,4,1k,b,w,c,d,29,7,3,3,4,6,a,i,6,2,6,5,d,4,4,2,a,p,3,1,b,2,1,4,7,i,7,18,4,1,1,3,2,1,4,9,4,4,i,l,4,7,13,e,2,1,5,3,3,9,5,1,1,1,i,r,1,1,1,1,1,1,1,1,2,1,1,1,3,2,1,5,1,3,3,2,1",
+    "jos": "1e,1h,27,e,2y,h,e,2,41,25,1,12",
+    "jua": "1t,53",
+    "juc": "2m,e",
+    "jud": "ah",
+    "jug": "3s,4g,46,5,1,c,1,b,9,g,b,1,16",
+    "jun": "2u,23,cd",
+    "jus": "19,7y",
+    "juv": "hj,s,s,3",
+    "jwa": "hf",
+    "k n": "d3",
+    "k' ": "5l",
+    "k)\n": "f4",
+    "ka ": "hi",
+    "kab": "c5",
+    "kad": "2z",
+    "kae": "2x",
+    "kaf": "c2,16",
+    "kak": "dz",
+    "kal": "hp",
+    "kam": "b0",
+    "kan": "30,3j",
+    "kav": "2i,4v",
+    "ke ": "a3,1",
+    "kel": "az",
+    "kgo": "1z,1j,3j,c7",
+    "kha": "2w",
+    "ki ": "ad",
+    "kim": "go",
+    "kiw": "cp,10",
+    "kle": "f7",
+    "kol": "34,fj,c",
+    "kom": "b6",
+    "kon": "2r,7i",
+    "kum": "bt,1d",
+    "l\na": "a,a,2y,1k,a,a,l,1,2w,u,b,1,2,2,6,1,1,8,1r,o,4,16,2f,r,g,f,a,3,4",
+    "l\nc": "7n,30,1s,j",
+    "l\nd": "o,5u,1l,t,x,2z,g",
+    "l\ne": "19,6n,1b,3w,49",
+    "l\nf": "cn",
+    "l\nh": "15,z,5h,x,1z,2y",
+    "l\ni": "a3,a,3",
+    "l\nm": "d7,53,g",
+    "l\nn": "7q",
+    "l\np": "a8,8g,k",
+    "l\nr": "8p,4,1a,14,1a,c,6,5b",
+    "l\ns": "9u,36,9,14,23",
+    "l\nt": "5m,31",
+    "l \"": "6k,1w,1m,8,86,9,3",
+    "l '": "4s,7t,8,5,5",
+    "l (": "4t,b,3k,w,46,52",
+    "l a": "c,9,b,9,5,f,1,2,5,7,6,6,1,9,g,2,5,b,8,5,4,6,a,1n,1,1,1,8,4,l,4,m,3,8,5,x,2,4,1,8,8,2,1,8,1b,x,c,2,1,1,5,3,4,1,14,3,a,4,7,4,1,7,8,1,6,2,3,3,a,1,5,1,6,k,7,1,6,4,2,2,4,3,6,1,e,2,1,6,a",
+    "l b": "2m,p,36,1x,1,2f,x,11,6,36,29,2,l",
+    "l c": "1e,6,a,9,q,1,2,9,1,8,g,2,4,a,d,5,1,b,8,2,1,i,3,6,2,6,9,c,e,3,3,1,4,k,7,5,b,d,1,b,5,6,1,7,2,1,1,1,3,3,3,4,1,9,3,8,7,h,2,c,1,2,1,2,1,2,2,4,6,4,2,1,3,3,8,1,6,3,2,i,1,2,e,7,3,8,3,4,1,1,4,3,5,1,3,8,4,2,3,2,a,7,c,6,3,5,8,1,f,4,2,1,2,7,2,1,1,6,2,5,1",
+    "l d": "k,v,a,9,5,b,1,6,6,l,1,4,7,6,7,i,r,1,j,1,1,3,1,8,8,e,9,d,k,a,4,4,r,9,h,8,d,1r,3,3,1,3,6,2,3,1,1,7,1,1,2,1,2,b,a,10,f,2,c,n,v,d,2,5,b,h,1,2,2,2,3",
+    "l e": "a,7,5,15,8,4,5,6,1,6,2,1,i,2,u,16,6,10,8,2,a,m,2,5,l,5,3,1,2,2,u,1,2,2,e,b,2,7,9,b,2,d,y,k,2,9,6,7,a,1,1,p,4,n,h,4,3,1,9,f,4,m,8,h,1,2,1,1,2,1,3,7,5,2,2,3",
+    "l f": "32,x,g,5k,24,7,m,g,t,2,1r,k,a",
+    "l g": "2g,1h,i,12,41,6r,1,1b,7,1d",
+    "l h": "1t,v,n,s,2x,12,g,1w,r,1m,c,1m,17,v,r,w,b,h",
+    "l i": "b,19,1u,j,y,1k,j,e,a,18,3,2,1,q,3q,j,2y,2,1x",
+    "l j": "12,2n,3t,11,83,h",
+    "l k": "2i,9,92,9,3,k,h,j",
+    "l l": "2p,1a,6,c,2,6c,r,4,h,c,1,1c",
+    "l m": "l,e,1b,7,h,k,13,j,a,d,t,h,7,2h,8,7,11,k,c,d,2,6,1,8,4,4,7,8,i,7,e,y,1,9,o,n,15,c,4,j",
+    "l n": "4m,1t,p,5,e,5,15,1,2,2n,19,4y,1b",
+    "l o": "p,1c,9,8,t,3,2,1i,14,i,5g,4o,7,1v,d",
+    "l p": "2,9,h,e,3,3,2,i,7,7,n,q,6,8,1,2,8,a,y,d,e,3,c,7,6,a,x,k,6,1,6,4,5,a,9,p,14,j,n,a,4,1,4,2,4,3,5,3,b,4,16,n,e,g,9,6,a,1,8,5,w,6",
+    "l q": "3x,24,cr,8",
+    "l r": "1e,6,f,3,6,12,k,2,17,w,13,y,2,5,d,3,e,2,8,e,9,4,3,f,8,3,2,19,7,7,1s,2,5,d,1a,n,g,11,4,t",
+    "l s": "n,3,5,a,e,7,n,e,4,2,2,t,6,4,4,7,9,7,5,i,6,4,2,2,4,2,7,5,4,d,6,k,1,b,1,5,2,5,4,4,9,4,1,4,1,1,8,e,c,2,2,1,5,3,1,1,2,6,7,9,l,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,4,4,3,3,2,5,4,4,8,3,5,6,1,5,3,2,1,7,6,c,b,1,6,m,4,c,c,2,f,w,5,1,1,2,5,1,1,1,1,1,3,4,1,1,2,1",
+    "l t": "1o,5,2,8,s,8,q,8,t,1m,10,1h,1b,1g,9,k,5,3,2,b,3,2,8,19,5,1,20,8,d,b,1g,1",
+    "l u": "2p,v,3a,54,6b",
+    "l v": "g7,31",
+    "l w": "h2",
+    "l y": "16,4,7,l,v,i,2,b,z,2,17,1,2,h,5,d,m,3,a,1,7,8,c,2,13,b,1,4,5,3,3,5,11,u,4,f,7,9,2,x,9,b,8,1s,j,x,6,6,3",
+    "l z": "cu,4e",
+    "l “": "3h,d",
+    "l\",": "1f",
+    "l' ": "9f,3j",
+    "l)\n": "co,2,c,m",
+    "l) ": "ba",
+    "l).": "fk",
+    "l, ": "h,3,4,k,1,q,1q,4,i,7,1d,8,y,1,n,1o,5,d,2,2q,k,b,8,s,o,3,1l,i,i,t",
+    "l. ": "e,4s,4,32,1,4a,4,b,i,i",
+    "la\n": "ay",
+    "la ": "5,1,3,1,1,1,2,1,1,5,2,4,1,3,1,2,2,1,2,2,3,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,2,2,1,2,1,2,1,1,1,1,1,1,2,1,1,2,1,1,2,1,1,1,1,1,1,4,1,2,1,1,1,3,1,1,1,1,1,1,1,1,1,1,2,2,1,1,1,2,1,1,1,1,2,1,3,1,1,1,2,1,1,2,1,2,1,1,1,1,1,1,1,2,1,1,5,1,1,1,1,3,2,1,1,1,1,1,1,4,4,3,8,2,1,2,2,2,2,3,1,1,1,2,1,1,2,4,3,1,1,1,2,1,1,1,1,1,1,1,1,4,1,2,2,1,2,1,1,1,1,1,1,1,2,2,1,3,1,1,1,1,2,1,1,1,4,2,1,1,1,1,1,1,1,1,2,1,1,1,3,2,1,1,1,1,1,1,2,1,1,2,1,1,1,1,2,1,1,1,1,1,3,1,3,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,2,2,2,3,1,1,1,2,3,1,2,1,2,2,4,1,1,1,1,1,1,3,2,2,4,q,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,2,1,1,1,1,1,1,1,2,1,3,2,1,1,2,1,4,1,2,3,1,3,2,1,1,2,1,2,2,1,4,1,1,2,1,1,1,1,1,3,1,1,2,1,1,2,2,1,1,2,2,1,2,1,1,1,2,1,2,1,2,1,1,2,1,1,1,1,1,1,2,4,1,1,1,1,1,2,1,2,2,1,1,2,1,2,2,2,1,1,1,2,1,1,1,1,1,2,1,1,2,2,2,2,1,1,1,3,1,1,1,1,2,1,1,1,2,4,1,4,5,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1",
+    "la)": "cv",
+    "la,": "34,1,3h,t,52,x,3s,c,1h",
+    "la-": "ah",
+    "la.": "1i,f,p,31,t,1r,84,17,8",
+    "lab": "2j,52,7q,s,16,h,17",
+    "lac": "e,i,u,9,b,2,9,7,a,8,8,1,c,2q,4,2,a,9,p,3,e,1,1,1,11,2,5,q,s,1a,t,2l,1,8,c,2,7,2,7,1,1m,4,8,7,2",
+    "lad": "a,17,1k,x,v,9,k,1,j,1,7,8,14,b,8,5,3,1,6,w,5,9,4,1,1,4,3,1,1,2,1,5,2,1,1,3,5,5,2,6,1o,7,a,b,c,t,2,18,7,c,q,1p,3",
+    "lae": "ao",
+    "laf": "f2",
+    "lag": "11,c,5,m,32,7,p,i,4,c,c,j,3,9,4,r,4,1h,i,16,f,3b,2o",
+    "lai": "2v",
+    "laj": "0,n,o,9,4,8,1,9,7,c,p,a,6,w,v,1d,6,4,5,9,16,1,1,s,2u,c,2w,x,28",
+    "lal": "41",
+    "lam": "1,6,3,7,1,d,3,2,1,1,4,2,2,1,2,1,1,1,7,1,1,4,1,7,2,4,d,1,1,b,3,3,1,2,1,2,3,1,3,1,2,1,1,4,1,5,1,1,3,5,4,5,6,3,2,2,4,1,2,1,1,3,1,3,5,1,3,1,4,4,6,1,2,1,2,1,1,1,1,1,1,1,1,1,3,3,1,1,1,1,1,2,1,2,1,1,2,9,5,7,2,1,3,2,1,3,1,2,1,2,3,1,3,2,5,6,1,1,1,4,2,1,2,3,5,1,1,1,2,4,1,2,2,4,1,1,2,1,3,1,6,4,5,2,4,1,2,3,1,1,1,3,3,1,4,2,4,8,1,6,e,f,1,1,4,1,1,3,2,2,3,3,3,2,1,3,1,2,5,6,2,1,4,1,1,3,a,7,2,3,1,1,2,3,3,1,2,1,3,1,2,5,2,2,2,3,4,1,5,1,8,2,1,4,1,6,6,4,1,9,2,4,1,2,2,1,1,5,3,4,1,1,1,1,1,2,1,1,1,1,1,4,1,1,1,2,3,2,4,1,3,1,1,4,2,3,3,1,3,2,1",
+    "lan": "1,1,2,2,1,3,g,1,2,2,2,1,2,2,9,5,5,3,1,1,1,1,1,1,3,1,2,2,2,2,3,2,1,1,3,1,1,1,1,1,1,2,1,2,1,4,1,3,1,1,1,2,2,1,2,i,2,1,7,1,m,3,d,6,3,b,2,1,1,4,1,1,4,8,1,3,1,3,2,1,1,1,1,2,2,2,1,2,2,4,1,1,1,5,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,4,a,1,2,1,4,1,2,1,3,2,8,8,1,6,1,1,1,3,2,1,1,3,5,f,1,3,1,8,a,2,4,1,1,1,1,1,2,2,2,g,d,6,5,c,3,1,3,1,5,c,b,1,1,7,2,1,7,4,2,7,j,1,9,5,8,5,1,1,1,1,5,3,1,1,5,3,8,2,1,8,4,2,3,3,1,1,2,3,1,1,2,1,1,1,1,1,1,1,1,1,2,2,2,1,3,1,1,1,1,1,3,4,1,1,1,6,2,2",
+    "lap": "36,3h,11,4w",
+    "lar": "5,e,d,1,8,9,6,1,1,1o,5,5,8,2,2,8,3,e,5,3,3,2,e,6,3,1,9,5,j,7,2,1,h,3,1,8,2,1,8,1,1,4,2,4,1,8,4,9,8,8,4,1,1,1,2,b,3,5,1,1,1,2,5,4,1,1,4,1,2,8,2,1,3,3,2,6,z,2,4,5,1,1,5,4,5,2,2,1,2,2,1,1,4,2,4,3,2,2,4,4,9,3,1,1,b,1,1,2,4,4,1,1,a,4,1,2,1,6,2,5,5,1,9,1,8,c,1,b,4,3,8,4,3,a,6,2,1,1,5,6,2,3,4",
+    "las": "9,7,2,2,1,c,d,3,7,4,1,2,1,f,2,3,3,1,2,1,1,1,1,a,4,1,1,1,1,3,1,3,4,4,4,5,3,8,5,1,2,3,2,4,1,3,6,1,8,8,3,1,2,3,2,1,4,3,8,n,o,3,c,3,v,7,5,2,1,2,4,1,1,1,7,2,1,1,1,1,1,4,2,3,6,3,i,7,h,w,1,8,4,d,1,1,a,3,4,5,2,3,3,2,7,2,3,1,1,1,1,7,6,2,4,1,9,1,1,1,2,1,1,1,2,1,3,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,2,1,1,1,1,2,6,7,2,a,3,2,3,3,1,3,n,e,3,5,1,4,2,5,4",
+    "lat": "i,1h,h,6,d,1,a,8,4,j,c,8,2,1,v,w,8,a,f,j,k,w,10,2,g,7,1d,b,15,2m,1,8,1,8,b,4,p",
+    "lau": "9,3q,ct",
+    "lav": "k,3,18,1,2u,28,e,4,1c,g,m,6e,5,t",
+    "lax": "14,9,u,9,a,1,a,6,14,6,4,e,9,f,11,16,i,8,i,22,1i,3,2,m,3,1,1,2,3,2,3,4,1,2,5,4,2,1x,1e,7",
+    "laz": "ac",
+    "lba": "0,23,1a,v,75,27,25,17,1j,j",
+    "lbo": "6t,1d",
+    "lbu": "2d,4v",
+    "lca": "4j,w,3,2r,a,3,7a,1o",
+    "lce": "2n,h,11,23,1d,a,6,2,2,7,a,2j,2,14,3,3,1,1,1,2,2,3,1,1,1,1,2,9,1,2,1,1,5,5,2,5,5,2,16,24,8,1e,2",
+    "lci": "4b,3z,2x,46,1,a,1p",
+    "lco": "15,2k,7",
+    "ld ": "c1",
+    "lda": "9n",
+    "lde": "9a",
+    "ldl": "fk",
+    "ldo": "8,27,w,s,37,3w,4r,13",
+    "ldu": "3b,s",
+    "le\n": "bj",
+    "le ": "25,e,7,10,g,4,1m,s,1n,2,f,15,s,2,2,3,4,i,16,2,1h,4,1w,1o,2,r,7",
+    "le,": "3b,7v,3v",
+    "le.": "3w,1e,bn",
+    "lea": "1g,n,1,2,1,10,1,7,1l,4n",
+    "leb": "f7",
+    "lec": "w,u,12,1,1c,22,1,n,f,a,c,k,1m,2,7,2,v,1,c,q,7,5,2,7,3,v,c,6,3,a,18,1,k,9,1j,6,1,2,5,2,1,1,8,3,1",
+    "lef": "1g,87",
+    "leg": "2a,4v,f,1w,1q,1g,3d,1w",
+    "lei": "33,e,33,c5",
+    "lej": "8e,4n,b,25,21",
+    "lem": "4,4,g,e,1,4,b,n,1,1,g,4,8,1,9,a,3,6,3,w,8,6,8,o,2,f,c,3,w,4,k,2,6,7,h,l,15,8,5,v,4,10,u,q,1,8,6,6,3,7,d,8,1,6,2,9,6,3,6,8,h,8,c,c",
+    "len": "5,3,6,a,d,7,3,1,4,5,n,6,1,1,3,1,1,6,8,1c,4,r,k,3,7,1,1,1,3,7,n,1,9,1,3,1,r,3,5,7,6,c,c,3,4,1,2,4,3,5,2,3,g,6,a,9,12,6,h,2,6,4,8,1b,h,7,3,4,1,5,1,8,m,1,8,7,e,3,1,1,2,3,1,1,2,1,1,1,1,1,1,1,1,1,5,1,d,6",
+    "leo": "1y,c,4q,5,k,2h",
+    "lep": "7q,1r,91",
+    "ler": "v,d,c,3,2,n,t,6,s,2,2,p,9,r,6,1,5,2,c,l,b,4,3,i,1,6,c,10,b,b,y,2v,n,6,1b,15,7",
+    "les": "6,4,9,g,5,c,7,1,1,2,3,4,3,3,1,2,1,3,1,1,2,1,1,2,1,7,7,1,2,1,1,5,1,6,1,1,1,a,5,c,c,3,1,9,4,1,4,4,2,1,2,5,1,7,6,b,a,b,b,6,5,a,3,5,4,a,4,4,a,b,5,1,8,3,1,6,1,5,3,1,3,1,6,2,1,1,4,5,3,3,1,1,1,1,1,6,5,1,2,3,2,u,7,b,9,4,2,1,1,1,4,2,1,2,4,9,1,b,3,1,c,6,5,3,1,2,3,1,6,1,2,1,9,2,4,4,4,1,e,n,8,1,4,1,1,2,6,5,9,a,3,6,1,6,4",
+    "let": "l,4l,2,3k,9,14,k,5,4g,9,a,m",
+    "leu": "41,4m,1r,8,7r",
+    "lev": "5,p,u,6,52,7o,3c",
+    "lex": "20,6,1r,2f,s",
+    "ley": "i4",
+    "lez": "8t,1h",
+    "lfi": "ab",
+    "lga": "2,1,b,f,o,e,6,n,1m,t,2,2,i,18,5,10,2v,1,1,1,1,1,1,1,1,1,1,1,1,3r,r,10,3,1,19,r",
+    "lge": "4,g,v,e,3,6,1,b,e,1,h,3,7,u,c,11,5,a,2,1,2,n,5,e,j,i,a,8,3,c,5,a,q,2c,h,1x,13,7,h,5,6,1,b,1,2,2,3,1,1,6,1,1,3",
+    "lgi": "9u",
+    "lgu": "26,m,2,5,6h,h",
+    "lho": "32",
+    "li ": "by",
+    "li)": "hj",
+    "lia": "n,19,1,1e,3,m,1,p,1,y,5,c,1,2,a,b,4,1,6,d,r,a,3,3,3,5,8,c,2,3d,h,v,b,c,h,b,i,g,1,s,d,f,e,7,a,2",
+    "lib": "3o,1y,24,1s,n,12,7b,p",
+    "lic": "0,8,8,a,1i,x,8,l,1v,t,9,8,7,4,f,10,2,k,e,7,q,6,7,7,7,4,y,1,5,10,e,1o,5,s,3,5,4,4,b,1b,8",
+    "lid": "1u,1a,2t,h,15,7,2c,12,3a,1,1,3u,6,2,l,4",
+    "lie": "l,p,2,1,1u,12,2,2,4,1j,2,m,l,6,g,17,4,m,38,2t,1g,x",
+    "lif": "5z,31,1n,2f,k,2,t,i,5",
+    "lig": "c,4u,1,1,7,5,2c,8,8,a,4p,2d,e",
+    "lil": "9r",
+    "lim": "6,f,6,c,8,1e,5,1,p,1,l,5,6,2,9,7,2c,1,c,l,6,5,1,4,1m,n,d,1,2,7,1,4,c,1,4,11,4,a,5,i,j,1m,2m,3,1,3",
+    "lin": "7,6,25,1h,k,17,7,e,1y,1u,a,2,6,7,3,2,1g,10,1o,5,2,c,q,1h,e",
+    "lio": "m,5b",
+    "lip": "1f,c,1e,7,2i,s,7,1,2l,87,8",
+    "liq": "3k,q,1q,1b,2w,3k,1i,3v",
+    "lir": "88,1n,1l",
+    "lis": "1,8,1,e,4,8,8,2,a,o,4,8,5,6,1,5,8,1,p,4,1,l,2,y,k,h,1,g,8,7,9,c,5,8,7,f,4,9,3,5,2,2,1,d,7,e,d,19,p,7,k,2w,1,5",
+    "lit": "9,e,1,3,s,1,9,p,k,9,i,6,1,3,j,4,o,11,h,2,1,6,8,9,5,11,5,1,1,1,e,5,5,2,2m,4,3,4,13,32,18,w",
+    "liu": "d,c,r,a,g,37,1g,b,25,e,2x,1b,k,k,8,10,2y",
+    "liv": "4,4,7,6,2,a,2,g,7,z,c,1,9,1,2,5,5,2,2,l,k,t,a,8,l,5,4,5,2,z,k,e,3,4,1,h,8,1,k,l,1m,5,h,v,6,6,13,2,1,1,2,1,1,k,4,3,2,1,2,1,5,1,1,1,7,h,5,b,2,e,1,6,3,1,1,1,1,a",
+    "lix": "23,1a,3q",
+    "liz": "w,1,3,p,i,2,1,5,3,5,2,3,1,1,1,2,1,1,1,9,5,1,3,1,1,2,2,3,2,1,1,3,2,2,3,2,1,1,3,1,1,4,5,1,1,2,2,8,4,h,2,5,6,4,1,2,1,2,2,1,2,1,3,1,2,2,2,1,1,4,1,2,1,2,4,1,1,2,1,1,1,2,5,1,1,1,1,1,1,1,1,2,3,1,1,1,1,4,2,a,3,1,2,1,2,j,8,r,2,2,4,4,1,7,e,5,7,4,q,4,7,5,2,2,2,2,9,5,3,2,8,1,a,2,1,4,2,1,1,3,4,1,1,1,3,m,2,8,3,2,7,5,e,1,2,3,n,1,a,4,1,2,2,3,2,1,2,1,1,1,2,2,1,1,2,1,1,1,2,1,1,1,1,1,1,4,1,1,1,2,1,2,1,1,1,5,1",
+    "lla": "g,f,1,e,1,c,1,4,1,b,7,4,5,2,e,2,2,1,3,n,14,d,1,2,5,5,2,9,1,1,9,a,1,3,3,n,1,14,6,1,e,9,a,2,5,3,c,5,1,9,3,6,b,7,5,w,1,d,8,1,9,h,4,3,3,1,1,c,9,a,1,6,1,1,1,1,4,8,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,2,1,1,1,8,1,2,3,2,h,6,1,3,1,h,l,3,3,9",
+    "lle": "1g,9,1g,1r,16,1,j,27,u,8,f,4o,l,22",
+    "lli": "d,1d,47,e,i,20,h,1b,4z,n,3,e,13,e",
+    "llo": "2,n,f,4,k,3,u,1t,b,h,9,e,3,2,3,q,2,k,b,2,e,1m,2,s,s,1,1f,5,4,2,e,12,27,l,q,f,6",
+    "llu": "25,m,2c,1e,1u,x,18,9,1,1,1k,z,j,l,1o,26",
+    "lma": "n,1,f,c,4,5,e,2k,15,a,e,d,7,f,h,n,7,1,8,g,1,5,5,3,j,r,b,13,2g,18,h,e,e,1j,6,3,1",
+    "lme": "g,4,14,3,1,7,2,e,3,m,2,1,9,3,8,b,9,7,a,d,1,a,1,4,a,1,2,8,4,8,f,7,1,4,5,j,7,3,b,2,4,8,8,1,l,3,6,9,1,j,1,a,h,v,b,3,2,2,7,d,1,7,e,8,2,7,2,1,1,5,4,e,3,1,b,7,8,8,4,e,1,i,4,2,1,3,4,1,v,3,2,9,6",
+    "lmi": "28,bn,k",
+    "lmo": "x,1q,20,3t,9,9s",
+    "lmu": "2n,20",
+    "lne": "57,69",
+    "lo ": "t,y,4,4,6,3,2,3,c,11,c,r,q,a,7,5,1c,b,9,7,1,2,1,1,1,8,b,s,1,4,1,i,b,2,r,b,5,c,k,4,a,j,l,19,u,g,l,15,6",
+    "lo)": "g7",
+    "lo,": "1s,z,44,3t,28,9,2",
+    "lo.": "60,28,1c,1x",
+    "lob": "1c,f,8,1d,6,1z,d,10,7,2r,9g",
+    "loc": "c,71,11,44,2k,2a,b",
+    "lod": "88,7,35,7g",
+    "loe": "1p,4e,bi,7,9",
+    "lof": "ba",
+    "log": "55,12,1d,c,m,12,i,a,d,9,o,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,29,k,1,1,10,19,w,3,2,1,1,2,5,2,1,1,c,1",
+    "loi": "34,2b,66",
+    "lol": "i6",
+    "lom": "2m,e,2h,12",
+    "lon": "h,2i,33,3,1d,2e,z,2q,2i,k,i,e,w,1,4,a",
+    "lop": "hr,8",
+    "lor": "4,f,1,d,8,6,3,1,9,d,1,1,4,7,1,6,m,3,4,3,3,g,m,h,1,6,2,3,c,2,3,3,6,1,2,7,3,2,4,4,1,6,4,5,1,5,1,7,g,3,3,1,2,2,5,4,4,1,1,2,2,1,1,1,2,2,2,1,1,2,2,1,1,1,1,5,4,2,4,5,2,2,5,6,6,1,2,9,2,a,4,2,2,3,x,5,6,3,2,4,2,1,4,1,3,2,a,q,1c,1,n,6,3,p,1,c,5,b,2,3,6,1,4,1,3,1,2,3,2,2",
+    "los": "e,1,1,3,5,4,9,2,1,4,3,3,2,2,4,j,2,6,2,2,3,4,5,2,3,a,7,3,a,6,1,7,2,9,1,3,1,8,m,3,3,g,l,2,5,6,5,1,3,1,h,3,5,5,9,3,8,1,4,5,1,6,3,1,1,1,2,1,3,3,7,2,2,3,2,4,3,1,6,4,6,3,3,9,g,w,3,b,6,7,d,5,5,9,b,6,2,8,4,l,3,1,8,1,1,1,3,4,7,3,6,5,3,6,2,6,5,4,1,p,5,8,6,4,4,8,4",
+    "lot": "5r,3l,f,1k,1,6,3,4j",
+    "low": "d1",
+    "loy": "1b",
+    "lpa": "cb,8,1,2,1,1,4,2,1,5,6,3,1",
+    "lpe": "93",
+    "lph": "ao,2h",
+    "lpi": "12,7h,16,3p,m,33",
+    "lqu": "hq",
+    "lsa": "9,q,d,1,1o,m,c,9,t,40,1,c,e,5r",
+    "lse": "5j,4b,18",
+    "lsi": "2m,2,w,dc,1j",
+    "lta": "1i,3,c,u,74,6,1a,5,5,1e,1j,a,1w,19",
+    "lte": "41,9,13",
+    "lth": "7v",
+    "lti": "1u,4,1b,7,1,2t,a,6s,1,51,4,m",
+    "lto": "3h,22,2k,2b,15,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,5,k,c,7,4,53",
+    "ltu": "34,19,41,4y,1q",
+    "lub": "g7",
+    "luc": "j,d,9,m,d,y,7,6,d,t,1z,1p,2,16,l,2,e,r,1k,22,5,y,k,q,e,5,3,4,1,h",
+    "lud": "20,19,8,n,6,27,1l,1,20,c,7,6,8,1,1,5,a,u,3,3,3,3,2,1,4,2,1,3,1,2,2,1,1,1,1,1,2,1,1,n,h,5,j,2,2,1,2,1,1,1,2,3,1,1,c,4,5,1f,r,1,8,3,5,2,2,2,3,2,1",
+    "lui": "1b",
+    "luj": "87,2m",
+    "lul": "a7,r,1g,1n,1b",
+    "lum": "e,v,14,b,4k,15,u,5,14,1v,3g,d,3,k,l,h,5,a",
+    "lun": "53",
+    "lup": "1j,87",
+    "lus": "c,17,8,e,m,l,7,c,j,10,7,9,n,d,q,1o,i,z,1,1,1o,v,5,e,8,1,c,12,m,4,2d,o",
+    "lut": "2y,2k,2g,j,4,1e,e,c,h,4c,4",
+    "luv": "bh",
+    "luy": "cw,4t",
+    "lva": "1d,1p,5,k,2g,h,17,17,u,1d,1p,5t,3",
+    "lve": "1d,1f,f,g,1t,18,l,13,q,1o,b,2r,k,i",
+    "lvi": "a,2z,28,19,8j,1p",
+    "lvo": "hg",
+    "ly ": "9o",
+    "lyc": "5h,24,74,2k,1o",
+    "lyg": "8p",
+    "lyp": "1r,1l,2i,10,3l",
+    "lza": "15,6g,58",
+    "lzi": "90",
+    "m a": "k,18,l,3g,3,z,d,95,7,h,e,h",
+    "m b": "0,d7,1i,27,22",
+    "m c": "7,8,a1,1v,3h,4,t",
+    "m e": "a1,5,61",
+    "m f": "b8,9",
+    "m g": "8,27,1,20,2u,1,v,1c,2x,3b,7,13,7",
+    "m i": "fd",
+    "m j": "d4",
+    "m l": "36,3h,11,4w",
+    "m m": "b,y,w,2q,1m,19,1h,2,4k,l,a,2b,1j",
+    "m o": "u,14,3n,1f,p,15,2k,47",
+    "m p": "1t,53,10,1p,5m,25",
+    "m r": "14,6q",
+    "m s": "6,7,1d,53,31,1a,4q,w",
+    "m t": "1c,3y,33,1f,7w,r",
+    "m u": "f8",
+    "m v": "3,b,5,a,18,n,2j,1v,84,l,l,c,3,4,6",
+    "m)\n": "4t",
+    "m),": "32",
+    "m-g": "w,26,cw,k",
+    "ma ": "h,6,3,1,4,8,3,5,c,3,1g,13,h,8,7,a,1,a,2,2,4,7,1,1,c,8,2,5,i,2,1,1,a,1,1,1,4,f,3,3,3,4,1,4,a,3,3,8,1,2,3,4,4,2,6,3,1,1,2,5,1,7,3,5,5,a,1,2,4,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,5,4,3,3,1,1,2,1,2,2,2,4,4,4,3,5,3,3,1,5,d,6,c,1,13,3,5,8,2,c,3,3,9,4,6,7,2,4,3,4,2,5,1,1,2,1,1,3,2,1,1,1,3,4,1,1,2,1,1",
+    "ma)": "7h,9o",
+    "ma,": "5j,31,9,40,4c",
+    "mac": "18,2,4,2c,3,12,13,3,3,1m,p,1c,4,1,1,a,d,5,3,f,1f,d,4,g,2,13,z,1g,1,3,1,l,b,2,c,9,9",
+    "mad": "1b,i,17,4,1g,e,a,5,c,c,v,c,23,15,b,b,28,3,1,e,7,8,4,a,5,1h,1,13,l,6,s,a",
+    "mag": "1v,25,2o,2v,3,d,1a,45,7,h,1b",
+    "mah": "4c,11,9m",
+    "mai": "a4,72,1i",
+    "maj": "b,y,7y,o,74",
+    "mal": "l,s,y,n,9,x,2k,c,v,17,2j,1t,1,l,e,16,9,2d",
+    "mam": "4r,84",
+    "man": "n,w,5,e,6,1,5,c,31,9,d,f,7,19,9,4,4,1,1l,b,6,4,t,o,1,2,5,f,f,1h,8,2,a,8,g,h,b,3,e,3,a,3,9,u,9",
+    "map": "2e,1o,1p,1i,1r,6o,1p",
+    "maq": "ev,2d",
+    "mar": "1,h,6,e,6,7,3,z,t,u,i,3,m,1,3,c,e,1,9,c,1,8,c,2,1,a,3,3,3,k,7,1,8,c,4,1,5,2,4,4,6,1,a,o,3,1,6,1,3,3,10,6,i,3,7,9,d,n,m,v,p,10,r,1,h",
+    "mas": "4,4,a,6,9,5,5,b,4,2,1,1,1,3,b,1,1,4,9,1,3,8,3,1,2,1,6,9,1,3,1,2,3,3,4,9,6,9,4,2,3,3,6,4,2,2,a,e,2,f,5,7,3,w,4,8,7,1,4,2,5,5,3,8,1,8,8,5,1,5,1,1,1,2,2,5,7,7,1,7,9,7,2,4,v,4,9,b,3,6,2,1,3,m,9,3,7,3,d,1,5,e,9,2,f,1,5,1,1,5,2,5,4,1,5,1,2,6,8,h,8,c,5,7,4,3,1,2,1",
+    "mat": "0,1,6,3,7,1,2,b,1,2,2,1,1,4,2,2,3,1,1,1,7,1,1,5,6,1,2,4,d,1,1,b,1,2,3,3,1,2,1,2,1,3,1,2,1,1,3,1,1,5,1,1,3,5,4,5,6,3,2,1,1,4,1,1,1,1,1,1,2,1,3,5,1,3,1,7,4,3,1,2,1,2,1,1,1,1,1,1,1,1,1,2,1,3,1,1,1,1,1,2,1,1,1,1,1,2,3,1,4,1,2,3,2,5,2,1,3,2,1,3,1,1,1,1,2,3,1,3,2,5,6,1,1,1,4,2,1,1,1,3,5,1,1,1,2,4,1,2,2,4,1,1,2,1,3,1,6,4,5,2,5,4,1,1,1,1,3,2,1,1,4,5,1,3,5,1,6,t,1,1,4,1,1,3,2,2,3,3,3,1,1,1,3,1,1,1,6,5,2,1,4,1,1,3,a,7,2,2,1,1,1,2,3,3,1,2,1,3,1,2,5,2,2,2,3,4,1,5,1,3,4,1,2,1,4,1,6,1,5,3,1,1,4,5,2,4,1,2,2,1,1,5,3,1,3,1,1,1,1,1,2,1,1,1,1,1,4,1,1,1,2,3,2,4,1,3,1,1,4,2,2,1,3,1,3,2,1",
+    "mav": "5c,42,4k",
+    "may": "10,4j,9c,1f,v",
+    "maz": "45,22,1,1,1,1,6m,2,5s",
+    "mba": "26,18,o,1i,r,v,l,w,1m,3,8,2,1x,g,l,h,j,6,2,11,1i,11,1,f,d",
+    "mbe": "af,7f",
+    "mbi": "e,t,4,8,a,7,1,2,1,1,9,2,1,3,2,1,4,9,2,2,29,b,1,x,a,j,u,c,3,q,7,5,6,1,g,5,6,2,2,2,9,1a,3,5,6,a,8,k,l,k,x,e,5,s,1s,1",
+    "mbl": "35,3h,c4",
+    "mbo": "13,76,n,g,f,2q,m,1,30",
+    "mbr": "z,1h,33,2,h,1i,23,14,f,2f,2e,1t,2,e,b,i",
+    "mbu": "27,2x,1e,2e,2a,1e,r,f,n,3,3,k,1,1",
+    "mch": "hg",
+    "me ": "2q,23,t,30,1c,1k,k,1,7,l,2,9,6,2n,y",
+    "me,": "b8",
+    "me.": "86",
+    "mea": "cv",
+    "mec": "hc",
+    "med": "g,1,b,k,2,6,4,1,2,2,1,3,1,3,3,1,2,4,4,1,1,1,1,1,4,5,4,4,1,1,5,8,7,d,7,3,2,4,6,3,4,1,4,3,1,1,1,2,2,4,2,3,1,2,3,4,3,4,3,d,5,1,1,1,4,1,g,3,7,2,1,7,o,2,g,2,2,2,6,2,1,2,2,3,a,1,2,2,3,7,3,6,2,2,a,h,1,1,1,1,5,q,b,m,5,1,7,2,8,d,5,c,i,x,2,6,13,4,2,4,1,2,2,4,5,6,1,1,3,1,1,1,2,1,1,1,1,1,2,2,2,3,1,1,1,7",
+    "meg": "1a,8o,5a,7",
+    "mej": "b,4,1k,b,w,c,d,29,7,3,3,4,6,a,i,6,2,6,5,d,4,4,2,a,p,3,1,b,2,1,4,7,i,7,18,4,1,1,3,2,1,4,9,4,4,i,l,4,7,13,e,2,1,5,3,3,9,5,1,1,1,i,r,1,1,1,1,1,1,1,1,2,1,1,1,3,2,1,5,1,3,3,2,1",
+    "mel": "o,21,19,3,q,16,3u,f,4,j,z,9,8,4,g,24,16",
+    "mem": "1z,1j,2k,j,6,a,j,15,z,32,v,38,5,1l,3,d,3,3,3",
+    "men": "4,1,5,6,4,7,2,1,2,c,8,1,1,1,1,1,3,3,1,5,2,2,3,2,2,2,5,3,1,4,7,a,2,1,2,5,2,3,8,b,4,5,7,9,1,1,c,1,1,1,1,1,2,4,1,4,1,7,2,1,2,8,1,b,1,3,b,3,4,1,2,2,1,2,2,c,1,6,2,3,2,3,2,3,4,1,1,2,1,1,1,1,8,8,1,5,a,6,3,4,1,1,2,4,3,1,2,8,9,1,2,8,8,2,2,1,4,1,u,b,2,1,2,2,5,2,1,4,3,1,1,3,1,2,2,3,1,d,6,2,2,6,1,2,1,1,2,2,1,1,3,a,4,3,1,a,1,7,1,7,2,1,5,1,3,1,1,1,2,9,1,1,1,7,1,5,3,4,2,1,3,4,1,2,2,5,6,2,1,1,1,4,1,1,1,4,3,2,8,1,3,1,1,1",
+    "meo": "9u",
+    "meq": "c7",
+    "mer": "1,23,4,e,e,1,9,o,6,9,c,2,4,v,7,d,2,7,8,h,f,5,4,23,1c,1k,22,1w,s,5,2,11,3,9",
+    "mes": "14,11,2t,f,1,l,1v,2p,6,2,3,2,4,6,c,1,1w,3,k,5,4,i,6,2s,x",
+    "met": "6,c,k,s,e,a,29,1d,19,4,12,3,1m,q,5,d,56,4,d",
+    "mex": "z,4s,1,4,2,1,3h,1,i,36,4h,n,k",
+    "mey": "7q,55,5n",
+    "mez": "2i,5s,4i",
+    "mia": "j,d,9,m,d,n,b,3,4,6,d,t,17,s,2,7,d,2b,n,e,2x,1l,8,6,6,3,b,9,b,q,e,8,z",
+    "mic": "3,g,n,6,1,a,4,k,q,m,l,t,c,c,6,b,h,6,d,c,6,4,4,3,a,a,5,d,1,c,3,b,n,b,3,4,1q,6,b,g,g,z,1,2,u,s,7,7",
+    "mid": "28,6s,4l",
+    "mie": "1o,f,d,1o,b,o,3,2w,f,6,q,s,1,2,2o,6,c,6,h,e,1s,7,6,m,6,7,1,6,k,4,b,i",
+    "mif": "c,h,6,i,1,2x,q,27,6j,k,1o",
+    "mig": "9l,7r",
+    "mik": "30,3j",
+    "mil": "2,3,q,f,6,6,2,1,6,f,4,1,2,r,o,10,2,1,k,h,2,1,8,9,5,8,4,4,b,2,n,5,9,1,2,4,f,5,d,8,1,2,q,l,6,15,b,8,1,8,j,2,1,7,p,4,4,4,1,1,1,1,1,1,b,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,2,1,1,1,9,7,4,9,1,3,6,1,1,2,4,d,3,o,8",
+    "min": "0,1,3,1,1,1,1,1,4,1,1,1,4,1,9,1,4,3,5,2,2,b,9,6,1,5,3,5,6,3,7,a,3,2,a,1,d,1,i,2,4,1,1,7,1,e,3,2,2,b,c,5,c,3,2,4,7,3,1,4,1,1,4,4,4,5,4,4,2,1,2,2,3,4,4,2,4,5,1,c,n,6,b,f,1,5,1,1,1,2,1,6,2,1,1,2,1,2,5,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,2,1,1,1,2,3,2,3,3,1,1,2,2,3,1,2,1,1,2,1,2,2,2,5,2,1,2,1,1,3,1,1,1,1,1,1,1,1,3,1,1,3,1,1,1,4,1,3,1,3,3,1,1,1,3,1,1,2,5,1,1,2,1,2,2,3,2,1,1,1,1,1,1,1,5,3,6,2,2,1,7,1,1,2,1,5,3,4,2,1,3,1,1,1,1,1,1,4,16,a",
+    "mio": "3t",
+    "mir": "51,n,71,2x,2l,1",
+    "mis": "c,15,1,z,2o,c,1v,2y,5t",
+    "mit": "y,4a,l,12,3e,22",
+    "miu": "9u",
+    "miv": "go",
+    "mla": "35,3h,c4",
+    "mme": "5x,6y",
+    "mmi": "hf",
+    "mmo": "60",
+    "mmu": "2q,1y,9,4,n,4p,3,30,3u",
+    "mna": "bb,6i,5",
+    "mni": "b,19,c,i,10,31,j,o,5,13,3,2,1,q,5y,1b,e,y,l",
+    "mno": "5b,9c",
+    "mnu": "5n",
+    "mo\n": "28,g4",
+    "mo ": "o,5,1,7,6,8,n,1,1,2,1,1,1,5,3,1,2,1,1,1,4,1,2,1,5,2,4,b,2,3,8,8,g,5,5,5,4,8,1,8,2,1,3,2,1,1,3,e,1,1,3,1,4,1,2,1,5,1,2,1,8,2,3,1,2,3,3,b,1,3,2,a,7,4,1,1,1,1,1,a,2,6,1,1,4,2,1,2,3,4,4,9,8,8,1,9,b,1,f,1,1,t,2,5,7,1,2,3,3,2,6,3,5,3,8,c,6,5,1,6,2,8,2,1,b,1,2,b,1,1,3,1,4,1,4,2,2,8,1,a,7,8,9,9,d,3,a,3,5,4,3,1,4,2,2,2,1",
+    "mo,": "2a,4z,1o,s",
+    "mo.": "m,3,29,25,w,21,10,o,6k,9,2m",
+    "moc": "9i",
+    "mod": "0,5,3,3,4,k,c,a,c,5,d,4,v,8,10,w,1,2,l,1,7,1,7,3,3,4,1,2,6,5,4,8,7,4,k,1,6,9,1,1,9,c,1,2,c,1,2,1,1,4,3,1,1,2,1,5,2,1,4,5,i,4c,4,2,8,a,1,e,3,2,1,b,3,1,1o,3",
+    "moe": "81",
+    "mog": "j",
+    "mol": "1a,2,1,b,n,w,12,2,2,4,1j,2,m,e,7,6,g,7,10,4,m,30,8,21,28",
+    "mom": "j,2,13,72,73,j,3",
+    "mon": "a,h,3,3,4,2,4,4,b,13,9,w,p,9,1,t,5,9,1d,d,8,i,1,7,1,e,h,5,9,19,f,a,12,s,16,k,4,3,24,l,5,1,4,g",
+    "mor": "v,5,g,j,n,5,c,e,1,1,3,7,s,f,2,v,9,e,1,6,a,y,p,1,e,6,9,5,1,e,2,4,4,1,3,2,2,1,2,5,2,1w,6,7,p,3,j,1,5,a,9,1,1,11,n,5,5,m,g,b,6,2,1,a,3,1,2,3",
+    "mos": "x,1e,4,p,1n,4,4,1b,1t,l,4,6,k,5,d,5,b,2,1,t,11,8,3,4,h,16,j,r,r,3,l,2,1q,a",
+    "mot": "17,7w,2o,6a",
+    "mov": "6l,3u,p,4a,j,2i,8",
+    "moy": "cs,h",
+    "mp ": "5l",
+    "mpa": "16,8r,2,3x,6",
+    "mpe": "3m,19,b,4o,x,6x",
+    "mpf": "2x",
+    "mph": "bd",
+    "mpi": "g,5,f,28,1r,1q,1v,2s,2,4h,38",
+    "mpl": "24,2,1,10,1,1j,1f,3,a,1v,4n,b,17,r,7,o,h,s,4,12,7",
+    "mpo": "2a,t,6,23,8,d,2i,y,6,4w,13,3,21,8,17",
+    "mpr": "9b,4a,43",
+    "mpu": "3p,2g,1v,2q,4,1p,9,l,3a",
+    "mqu": "bt,1d",
+    "mri": "j3",
+    "msi": "hr",
+    "mtc": "8f,1,1,1,7",
+    "mu ": "cz",
+    "muc": "9,13,1,u,3,u,19,1p,m,14,3,1,f,3,7,h,4,8,e,1d,d,19,l,1b,1n,18,1d",
+    "mue": "k,3,13,89,s,21,1v,1q,2a,c,3",
+    "mug": "9v",
+    "muj": "1g,15,2v,8w,e,4g",
+    "mul": "1,b,f,4,2,m,b,4,2,4,5,e,9,d,1,6,1,l,1,m,m,e,3,j,1,8,7,j,6,3,1,3,1,1,2,1,3,1,1,1,1,2,6,8,1,3,4,h,a,c,b,5,7,8,2,g,2,1m,9,8,5,8,2,2,b,c,7,1,3,2,2,y,j,1,1,1,5,3,1,7,2,8,3,8,y,4,h,a",
+    "mum": "0,j,2,8o,5z,5,g,j,3,h,j,10,j",
+    "mun": "v,v,j,h,s,16,9,4,6,4,5,8,i,1,7,4,4,2,v,1,3,2,2,1,4,5,e,1,1,6,h,t,5,1,1,4,3,1,1,2,1,5,2,1,4,5,1,m,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,2,3,4,3,3,2,5,4,1,3,2,9,5,6,6,5,1,6,1,4,2,1g,c,o,5,4,e,2,g,3,2,1,1,2,2,3,2,1,1,b,1,1,1,2",
+    "mur": "co,2d",
+    "mus": "2,v,n,b,s,n,1,9,j,k,l,d,1c,g,9,b,l,l,m,1g,1b,v,2e,u,b,1h,a,a,1,5",
+    "muy": "7,8,16,2,b,2,1,7,8,1,9,h,2,1,1,v,5,5,9,7,4,4,2,1,1,3,4,1,2,2,1,9,1,3,2,m,4,2,8,6,1,1,4,3,2,h,c,h,1,2,o,n,7,9,6,4,1,f,16,4,2,9,1,1,1,9,a,5,7,2,7,2,1,2,3,q,m,k,n,3,e,a,1,6,2,w,d,1",
+    "myr": "25,2w,n,t,6i,3,r,l,22,o",
+    "mys": "42",
+    "n\na": "8h,2v,79,n",
+    "n\nb": "ce,t",
+    "n\nc": "is",
+    "n\ne": "db",
+    "n\nf": "8l",
+    "n\nm": "iz",
+    "n\np": "cj,6g",
+    "n\nr": "ci,65,f",
+    "n\ns": "cu",
+    "n '": "5x",
+    "n (": "2f,5a,10",
+    "n a": "e,4,l,2,4,2,g,b,6,k,2,b,3,3,4,9,6,c,5,9,1,5,2,3,a,7,1,2,2,1,3,5,4,4,a,1,2,1,5,1,7,2,3,4,a,8,m,3,i,8,8,r,4,1,r,3,1,k,1,1,1,2,2,q,3,1,1,2,3,7,a,2,1,2,2,2,1,7,7,5,7,7,7,2,c,2,3,2,e,4,3,8,7,8,b,8,4,b,1,3,6,1,1,4,q,b,2,b,2,1,2",
+    "n b": "i,42,t,c,2c,4c,5p",
+    "n c": "x,6,1,1,2,i,3,e,a,1,6,4,9,2,g,19,s,5,b,c,2,9,2,8,5,1,7,6,4,6,2,h,1,1,2,9,1,2,1,7,c,6,7,l,c,c,4,5,4,c,x,6,3,b,1,5,1,1,1,2,h,a,1,c,e,5,b,4,2,2,1w,e,k,1,8,2,1,8,4,8,1",
+    "n d": "r,5,8,h,4,f,1,5,1,1,1,8,2,1,3,2,b,7,9,j,6,1o,o,p,e,7,q,o,c,6,w,5,d,1,d,s,1,5,p,h,15,t,7,5,1,9,3,4,4,9,e,2,c,e,q,8,5",
+    "n e": "1,6,a,5,7,i,d,a,1,6,1,6,1,5,2,5,p,b,6,8,8,4,4,o,9,4,6,3,4,5,a,g,7,1,9,4,3,z,2,j,6,5,8,3,7,f,5,d,w,a,h,6,1,1,8,7,2,n,3,6,b,i,1,4,a,9,a,2,i,1,1,6,2,2,d,1,9,5,2,2,a,n,u",
+    "n f": "3,1m,6,k,2j,a,6,d,2,c,a,7,2,y,j,3,6,c,1,1,g,3,l,14,8,8,2,4,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,d,4,7,3,b,3,1o,5,10,1g,7,2,7,2,o",
+    "n g": "21,5t,r,z,a,1b,1,2v,18,5,6,3,20",
+    "n h": "2j,k,2e,28,i,1n,f,i,5,6,7,3,6d,6,2,2,2,1,2,12",
+    "n i": "2g,4,5,p,1v,1,b,17,7,a,10,x,17,2s,n,3u,8,j",
+    "n j": "1t,2x,g,1q,bs",
+    "n l": "a,2,2,k,6,7,8,8,2,6,1,4,1,2,5,8,4,5,6,1,4,1,2,t,3,2,2,5,5,4,4,c,b,1,7,2,3,2,7,a,6,5,2,1,4,6,n,1,7,o,6,o,7,3,3,l,4,2,4,4,4,4,2,5,6,1,1,13,h,d,3,3,2,5,h,4,5,h,t,1,5,2,a,2,2,4,k,8,g,6,3,5,4,5,2,3,1,1,1,3,1,1,1,2,1,2,1,1,2,1,1,2,1,2,1,1,1,4,3",
+    "n m": "1d,l,2,8,3,5,3,l,c,x,b,8,n,j,m,j,o,j,2,1,1,7,d,4,8,15,8,1,i,8,13,r,b,6,12,c,c,4,1,q,2,p,8,5,1k",
+    "n n": "g,42,7,2k,1q,q,1c,c,2g,l,4b",
+    "n o": "1a,4w,n,2j,1g,1t,b,4f",
+    "n p": "0,2,8,k,1,2,9,i,2,7,7,1,2,1,8,a,2,2,2,7,2,3,4,2,1,a,3,1,2,3,3,4,3,6,1,4,4,1,8,1,1,4,a,2,b,o,b,1,3,5,2,2,1,5,1,h,6,5,5,1,3,2,e,4,1,1,b,1,5,c,2,4,3,3,7,6,2,1,8,1,8,3,b,2,8,13,2,a,6,5,8,2,3,1,5,3,1,6,2,1,3,3,1,3,4,c,4,1,a,n,1,1,2,1,8,4,7,3,3,1,1,f,9,9,2,1,1,1,1,2,h,7,2,i",
+    "n q": "3t,fb",
+    "n r": "38,f,b,c,6,6,8,9,1,5,9,3,9,10,23,4,5,8,5,b,7,3m,1,7,i,1,4,f,3,b,3,3,1,2,4,d,2,1a,2,2,l,a,5,4",
+    "n s": "b,2,6,d,2,o,4,9,4,3,3,3,m,3,e,d,q,p,8,e,b,r,e,2,p,6,3,4,6,o,8,2,n,e,9,b,9,6,2,y,1,6,3,2,8,2,2,2,3,8,4,i,1,5,5,2,b,3,j,5,c,3,5,9,6,m,4,7,1,1,3,2,8,b,j,1,d,3,3",
+    "n t": "25,c,19,22,m,13,r,1,z,g,15,a,1c,6,g,g,9,17,e,8,7,20,3,c,g,l",
+    "n u": "b,18,3,4,4,h,1,2,1,g,s,j,5,5,1,1,2,1,9,9,1,1,6,i,1,4,6,2,l,2,1,8,2,7,6,h,f,6,b,3,4,4,2,1,4,2,c,6,1,u,1,a,d,4,s,4,3,1,3,3,4,3,4,3,1,7,c,3,5,i,o,9,2,4,5,3,9,5,1,11,3,3,1,1,1,4,14",
+    "n v": "7,6,w,s,d,7,y,f,y,b,4,3,2,16,k,x,1,4,3,1f,1,2,18,9,4,y,2,3,3,a,3,9,1,2,5,b,2,1,2,2,3,3,2,1,1,1,3,5,1,6,1,3,1,6,2,1,2g,j,r,8,1",
+    "n y": "6,3,c,n,3,3,8,d,19,2,l,4,1j,m,h,6,e,9,p,4,11,b,6,q,2,3,f,1t,9,g,2,5,1l,1,4,d,3,k,b,3,1,8,2,k,14",
+    "n z": "bf,3w",
+    "n',": "4s,l",
+    "n)\n": "55",
+    "n),": "8p",
+    "n, ": "c,r,i,4x,9,5,1d,6,2,i,v,1,14,l,w,2,r,2,1,m,5,8,1c,2,4,2,1,o,9,m,8,z",
+    "n. ": "1t,3e,8,4a,4k,n,1d",
+    "na\n": "j,15,64,l,6,l,v,11,24,1v,3,35,1",
+    "na ": "d,a,9,2,1,a,2,4,5,4,1,1,4,1,3,2,2,9,1,1,1,3,1,1,1,1,1,2,1,2,1,1,5,1,2,1,1,3,1,1,2,n,1,2,4,3,3,2,7,5,1,7,6,1,6,2,1,1,1,2,2,9,5,1,1,2,1,5,1,1,1,1,2,2,5,2,1,4,6,4,4,4,5,6,1,2,4,1,7,3,2,1,3,1,2,1,1,2,1,1,5,1,2,7,9,3,2,4,2,1,3,1,2,4,2,4,1,2,2,5,5,2,4,2,2,2,2,1,5,4,1,1,5,1,1,2,1,7,4,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,6,1,4,2,2,1,5,1,1,1,2,1,1,1,1,2,2,3,1,6,1,2,1,1,4,2,2,1,5,3,2,2,2,2,1,1,3,1,6,1,5,1,3,2,1,1,1,3,2,3,3,6,1,a,2,4,1,6,2,2,9,8,1,4,1,6,1,1,3,1,1,1,2,1,2,1,3,1,1,2,3,1,1,1,7",
+    "na)": "4w,h,2,2u,4,17,f,31,4h",
+    "na,": "1m,q,4,1o,19,2,a,g,6,s,d,t,10,q,a,23,1,n,1,1z,i,m,5,e,e,l,u,3,c",
+    "na.": "2v,i,t,16,1y,t,7,3,18,5,9,r,2d,2,19,k,z,u,10,7",
+    "nab": "w,78,2,4i,2m",
+    "nac": "t,2r,40,3,1,h,z,h,l,2x,2i,2y",
+    "nad": "2l,9,1l,1g,1x,p,2v,8,16,w,2f,d,13,1a",
+    "nae": "f1",
+    "nag": "t,1,e,8,1,1,3,y,q,1k,c,20,7,2,2j,1",
+    "nah": "83,2,5",
+    "nal": "1,3,6,4,4,2,4,4,2,5,1,8,2,5,5,3,1,1,2,2,1,2,1,1,3,1,1,1,1,6,3,1,1,1,1,1,1,4,1,3,1,4,2,2,1,1,1,2,2,1,1,3,3,1,2,1,3,4,9,2,2,8,2,4,1,3,3,1,2,1,b,1,1,2,2,6,1,5,5,4,1,2,6,2,2,1,2,3,4,2,5,1,1,7,2,3,1,1,7,2,1,2,2,1,2,3,1,5,2,3,4,5,6,2,1,2,4,3,1,2,2,4,1,2,2,1,3,2,1,3,3,1,1,2,5,2,1,2,2,1,9,1,2,9,9,2,8,1,3,1,5,1,6,r,4,2,5,3,2,4,1,1,1,6,4,5,2,2,4,2,2,1,5,8,5,1,2,2,5,2,2,1,2,8,9,4,1,4,b,7,7,1,6,1,1,4,3,2,7,5,3,5,3,2,1,1,2,5,1,3,1,1,1,1,1,3,1,1,5,1,1,1,3,1,4,2,1,2,2,2,1,3,1,1,1,3,1,1,1,2,2,3",
+    "nam": "j,f,2g,1s,1,3,2,1s,15,11,23,3,2t,11,f,n,7,1c",
+    "nan": "16,26,2i,10,15,3l,t,y,16,s,8,t,s",
+    "nap": "bd,4c",
+    "nar": "6,r,9,1,2,j,d,3,6,4,9,2,2,4,c,5,5,e,7,b,1,2,2,6,2,1,2,1,5,8,h,p,3,h,a,1,3,3,5,s,1,9,2,7,9,a,1,l,8,h,6,1,l,3,17,x,2,e,e,3,5,2,a,1x,8,7,3,9,5,9,a,1,7,1,a,7",
+    "nas": "3,3,1,6,t,m,9,5,3,d,1,7,5,4,i,x,i,i,q,2,1,k,b,5,d,8,3,1,d,j,e,6,2,9,f,i,2,7,1,b,2,3,1,2,4,r,1,1,8,1,1,2,4,8,5,3,9,8,1,4,c,9,1,c,9,1,6,6,1,3,f,1,1,2,z,p,5,1,1,1,j",
+    "nat": "0,1,3,1,1,2,1,5,1,1,1,3,1,9,2,3,3,3,2,2,2,b,g,8,4,1,9,k,2,f,a,2,9,5,3,1,6,8,l,t,4,a,2,2,9,1,2,5,1,7,a,1,3,1,m,g,8,h,9,3,k,f,1,f,3,3,10,2,3,3,5,d,3,4,3,1,e,g,l,i,7,1,1,1,1,1,1,1,4,1,9,2,2,1,8,1,2,1,2,1,2,3,4,2,1,3,1,1,3,2,3,5,4,10,3,9",
+    "nau": "i,5m,2f,83,h,1i",
+    "nav": "74,82",
+    "nax": "29,45,15,ar,v",
+    "naz": "f8",
+    "nbe": "f3,1,1,1",
+    "nc\n": "g9",
+    "nc ": "fb",
+    "nc,": "g2",
+    "nc.": "hd",
+    "nca": "22,45,8,23,8,4,2,3,l,2z,5,5,59,p,5",
+    "nce": "h,1i,s,12,2c,6,q,1m,g,15,d,23,2,6,6,1a,g,1h,1,j,14,g,9,m",
+    "nch": "e,3q,2l,92,4,u,m,e,d",
+    "nci": "e,y,2,r,8,6,2,4,c,4,2,1,g,9,4,h,i,16,8,g,8,5,1,b,6,1,1,7,4,1,4,3,d,1,1,3,8,3,f,5,1,1,7,3,6,1,u,1,3,2,1c,6,2,3,3,5,1,1d,1,2,b,b,6,5,2,2,m,1,8,e,r,6,b,8,3,1,1,1,3,1,2,2,1,4,8,1,1,1,3,1,2",
+    "ncl": "cf,h,4t",
+    "nco": "2b,j,6,u,y,m,15,1m,1k,1o,n,12,1,z,43",
+    "ncr": "1s,c,do",
+    "ncu": "c,2i,5,fw",
+    "nda": "n,19,9,8,k,1t,5,1b,b,5,c,a,j,q,4,7,s,1g,5,c,8,t,e,9,8,g,c,9,1,9,i,1,2g,f,9,8,c",
+    "nde": "21,1v,17,v,1w,c,4p,f,1v,x,24,c",
+    "ndh": "7r,ak",
+    "ndi": "l,2i,2,b,3,h,2k,2,m,2,g,9,3,7,1,1,1,1,8,2,1i,1r,i,8,7,7,g,y,s,7,h,2,6,3,1,z,9,1,1,6,8,4,a,2,4,1,7,4,h",
+    "ndo": "1u,2,8,2,b,11,l,38,w,1,u,v,1,2,4,1,7,2a,a,3,2,5,4,6,3,h,b,y,5,1,1,1,3,8,e,1,3,7,i,q,w,3,k",
+    "ndr": "6,45,2,g,t,4c,17,2y,h,u,g,w,7,l,n,9,h",
+    "nds": "60",
+    "ndu": "n,i,3,7,4,d,o,11,x,8,28,1,g,6,16,1,7,1,f,g,2l,6,7,63",
+    "ne ": "c,7,8,y,1,3,f,9,8,c,8,g,7,1,1i,5,3,4,a,f,7,g,d,q,u,a,h,4,p,1,7,2,1s,1,5,7,1,1,6,2,1,c,i,6,h,5,4,11,9,b,2,c,2,1,6,6,4,2,1,5,2,i,d,c",
+    "ne,": "v,2b,1j,y,3q,v",
+    "ne.": "5g,2l,f,1o,9,2j,1t,42,d",
+    "nea": "1p,1,9,d,2d,k,44,4,60,5,28,14,a",
+    "neb": "4x,cd",
+    "nec": "55,3d,12,34,18,3n,l,7,s,3",
+    "ned": "4k,e,99,e",
+    "nee": "3g",
+    "nef": "1a,v,w,8,2,6,3c,18,q,2,1w,3,8,1e,3,f,5,6,d,1o,2,3,2,1t,6,9,r",
+    "neg": "v,2,3c,n,j,2s,h,25,3c,d,g,17,9,10",
+    "nej": "59,9d,2a",
+    "nel": "8,8,3,d,4,1f,n,6,u,2n,l,22,6j,2,1,6,8,6,i,6,c",
+    "nem": "2b,4v,6e,g",
+    "nen": "25,c,m,1l,8,b,d,g,17,1m,e,5,k,9,18,6,10,1f,9,6,3,1,4,z,2,2,e,o,n,11,3",
+    "neo": "2o,25,5,3,1,7,5,3,3,3,e,q,q,5r,g,5,l,1m",
+    "nep": "ck",
+    "ner": "o,2,a,3,8,e,1,2,g,1,5,c,3,1,13,5,4,a,3,3,2,2,2,e,1,l,1,h,1,2,1,1,d,3,b,3,2,4,4,7,1,2,4,9,4,2,3,1,5,6,2,1,3,1,1,1,8,a,4,3,d,3,1,a,6,5,6,5,6,2,3,3,1,13,1,6,2,1,4,5,7,1,1,4,2,5,4,a,a,h,c,5,4,4,2,2,1,2,b,3,8,b,e,e,a,l,2,3,4,1,1,9,1,3,4,1,1,1,4",
+    "nes": "2,a,g,h,j,3,1,c,1,6,3,3,4,5,5,1,6,1,5,9,2,3,1,a,5,1,g,7,1,6,2,a,b,6,1,8,e,2,4,3,7,3,d,8,2,1,4,4,k,1,3,1,4,c,2,1,6,6,8,1,3,4,5,8,3,o,6,2,1,14,f,3,i,8,8,2,9,6,5,1,5,3,5,b,2,8,2,5,1,2,e,2,q,g,3,7,9,6,4,1,2,6,1,2,f",
+    "net": "8,27,2t,22,8n,13",
+    "neu": "3i,33,g,1g,8,u,b,c,4,l,4i,2,37,g",
+    "nez": "2m",
+    "nfa": "5q,4p",
+    "nfe": "h,s,i,1,c,9,8,e,12,t,1,i,4,e,m,9,7,q,5,4,l,n,c,t,3,32,f,n,5,3,2,3,e,1n,g,a,z,b",
+    "nfi": "3q,2y,62,57,y,2",
+    "nfl": "1,6,3,7,1,d,3,2,1,1,4,2,2,3,1,1,1,7,1,1,5,7,2,4,d,1,1,b,3,3,3,1,2,3,1,3,1,2,1,1,4,1,5,1,1,3,5,4,5,6,3,2,2,4,1,2,1,1,3,1,3,5,1,3,1,e,1,2,1,2,1,1,1,1,1,1,1,1,1,3,3,1,1,1,1,1,2,1,2,1,1,2,9,5,7,2,1,3,2,1,3,1,2,1,5,1,3,2,5,6,1,1,1,4,2,1,2,3,5,1,1,1,2,4,1,2,2,4,1,1,2,4,1,6,4,5,2,5,5,1,1,1,3,3,1,4,6,8,1,6,t,1,1,4,1,1,3,2,2,3,3,3,2,1,3,1,2,b,2,1,4,1,1,3,a,7,2,3,1,1,2,3,3,1,2,1,3,1,2,5,2,2,2,3,4,1,5,1,8,2,1,4,1,6,6,4,1,9,2,4,1,2,2,1,1,5,3,4,1,1,1,1,1,2,1,1,1,1,1,4,1,1,1,2,3,2,4,1,3,1,1,4,2,3,3,1,3,2,1",
+    "nfo": "8j,91",
+    "nfr": "99",
+    "nfu": "29,g,b,e,2y,g,7,a,1x,2,1,4j",
+    "ng ": "8g,7,9q,f,d",
+    "ng-": "2v",
+    "nga": "h,l,21,e,2l,3,f,y,11,3u,18,1j,2,a,8,z,g,2,1f,5",
+    "nge": "q,7,3,1,3,2,m,d,14,3,a,2,2,2,3,1,1,1,b,3,3,1,4,3,1,3,3,4,3,6,2,5,2,5,2,1,2,3,1,7,1,o,4,1,d,k,1,1,5,u,i,1,6,i,v,i,3,1,g,6,5,7,n,b,3,5,5,2,2,1,3,1,4,3,1,2,2,3,1,5,1,1,4,3,1,3,4,1,f,8,4,b,7,8,j,1d,1",
+    "ngi": "3,f,k,s,7,y,h,c,9,1i,l,y,f,1,11,x,10,6,1s,1v,2d,9,8,d,15",
+    "ngl": "5l",
+    "ngo": "52,4e,m,4,2,2,2,2,2,2,1,1,3,1,2,1,3,1,1,1i,2s,2a,10,1,7,g",
+    "ngp": "c6",
+    "ngr": "j,d,4,3,16,5,2,4,a,b,a,d,d,u,19,f,p,c,k,1,8,1,2,x,n,9,5,1z,o,3,2,17,e,j,k,d,1,6,14,8,u,1,3,d",
+    "ngu": "n,d,q,6,3,d,f,1n,c,j,e,1b,1u,4g,g,5,l,1m,1j,1p",
+    "ngy": "88",
+    "ngz": "av",
+    "nha": "31",
+    "ni ": "5t,73,25",
+    "nia": "z,2,1,1y,1a,2,f,m,5,k,9,8,u,e,q,1,1,h,g,4,1n,3,2,1l,n,1,u,b,5,4,3,2,16,t,o,k",
+    "nic": "e,3,2,7,5,b,8,3,1,1,i,b,9,3,6,a,f,b,1,3,4,3,a,4,9,1,7,1,4,4,5,1,a,1,2,4,b,2,2,3,m,7,5,7,6,2,1,1,4,1,g,1,1,1,6,1,1,4,2,5,3,4,1,4,6,4,3,1,1,4,1,4,1,5,d,7,1,5,2,8,1k,7,2,3,4,e,2,3,1,4,1,3,1,1,2,1,1,1,1,4,1,1,2,1,1,1,1,4,1,3,4,2,1,1,5,1,3,2,d,5,a,4,1,l,b,a,2,3,1a,2,1,5,2,1,4,1",
+    "nid": "5j,1,q,1t,1c,z,18,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,5,a,a,4,8,7,4,3,t,z,j,34",
+    "nie": "im,g",
+    "nif": "q,1o,1n,w,5,2p,o,1a,3z,20,c,4,h,s,y,h,8,1",
+    "nig": "v,2,1a,27,7,b,8,1e,2e,59,8,5,1,f,r,g,9,5,v",
+    "nih": "28,45,28",
+    "nii": "7q,ah,b",
+    "nil": "1o,54,1y,1z,3,5t,x",
+    "nim": "m,92,1x,1i,h,2n,1,9,1v,6,4,7",
+    "nin": "g,25,b,u,e,e,r,7,6,1n,r,a,1a,3i,h,2,r,6,8,37,y,b",
+    "nio": "b,19,c,i,10,31,j,o,18,3,2,1,i,8,5t,1g,1x,1",
+    "nip": "4x,cd",
+    "nir": "34,1r,l,11,16,1h,h,48,j,4,8",
+    "nis": "g,9,1l,g,i,1g,9,4,n,a,r,1g,h,o,o,3i,i,1x,t,m,1t",
+    "nit": "27,3a,22,16,z,i,h,9,p,q,1,1,1,1,2,1,1,1,5,4,3,3,2,5,4,4,b,5,6,6,45,1,a,1,l",
+    "niu": "25,2q,11,l,31,3,48,l,a,i,1",
+    "niv": "j,2w,d,t,36,m,1r,a,4,4,2x",
+    "niz": "4j",
+    "nja": "2r,2k,24,3,19,21,4,r,1,16",
+    "nji": "o,21",
+    "njo": "1i,z,25,2q,1m",
+    "nka": "hi",
+    "nkg": "1z,1j,3j,c7",
+    "nma": "dz",
+    "nme": "h5",
+    "nmo": "a2,8e,n",
+    "nmu": "v,v,j,32,5,q,1,7,8,x,1,3,4,1,4,5,e,1,1,6,h,y,1,1,4,3,1,1,2,1,5,2,1,4,5,1,o,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,5,4,3,3,2,5,4,4,b,5,6,6,6,6,1,4,2,1g,19,w,3,2,1,1,2,5,2,1,1,b,1,1,1",
+    "nna": "j,ah,4a,12,1d",
+    "nne": "28,h,20,y,4x,7q,d,c",
+    "nni": "8h,t,6,i,8o,g",
+    "nno": "co,4,h",
+    "nnu": "95,67,18,h",
+    "no\n": "3,13,l,3,7,4,i,t,l,11,t,j,f,q,1,6,1,8,h,7,c,1,12,7,a,5,7,1q,2,9,9,3q,1,6,p,7,i,g,a",
+    "no ": "n,8,j,4,1,7,b,4,l,6,9,d,1,4,7,1,p,8,2,1,5,4,6,1,2,1,4,1,1,6,4,8,f,d,a,v,8,4,1,1,9,d,1,b,e,i,1,5,a,3,4,1,1j,i,3,7,a,a,6,1,2,3,5,7,7,2,1,6,c,1,l,4,9,4,2,3,b,6,1,1,f,2,1o,6",
+    "no)": "52,5,1,9,4,ao",
+    "no,": "59,q,1,c,2b,1t,15,10,7,1b,28,k,v,3,k",
+    "no.": "4m,2d,1z,3i,1j,1d",
+    "noa": "cy",
+    "nob": "9,3q,b5,1o",
+    "noc": "o,6,7,6,8,9,1,2,1,5,3,1,f,1,9,1,b,4,3,3,5,4,9,w,2,k,9,1,2,2,2,4,6,1,2,3,9,3,2,a,2,8,9,n,7,4,3,5,2,1,2,9,6,a,6,h,2,5,1,7,1,5,1,d,2,9,1,6,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,4,5,8,5,3,2,6,7,2,b,c,9,4,6,a,b,m,a,6,1,1,5,b,5,7,9,7,2,4,1,8,3,4,4,2,3,9,3,4,3,3,1",
+    "nod": "a2,i,b,7l",
+    "noe": "v,1e,32,28,1,3,4,1,4,5,e,1,7,h,4l,b,c,7,4,2",
+    "nog": "w,26,q,2,y,4x,1u,2q,n,12,k,19,7",
+    "noi": "1v,3g,25,2j,2z,d,1c,t,4,3,l,1q",
+    "noj": "e,2a,d3,5,v",
+    "nok": "ad",
+    "nol": "40,27,1d,c,1n,j,a,m,o,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1c,2,t,2,13,j,19,w,3,2,1,1,2,5,2,1,1,c,1",
+    "nom": "66,1,7,8,1v,16,f,1,1,4,3,1,1,2,1,5,2,1,3,1,1,4,58,19,8,6,2,17,2,3",
+    "non": "46,20,u,37,2h,4,4,d,2d,i,30",
+    "noo": "9o,i",
+    "nop": "a,3,16,6x,8,1a,70,o,8,4,b,j,e",
+    "noq": "3w",
+    "nor": "2f,h,1r,4,z,3,2,1s,5,29,10,a,6w,1,n,a",
+    "nos": "5,b,1p,c,b,1,4,2,k,7,12,8,7,4,7,2,2,3,2,4,c,2,j,f,2,a,1,9,6,2,2,7,1,6,u,a,6,5,1,k,c,1,a,1,1g,1,o,a,1,e,4,1,g,n,q,9,1j,6,1,g,1,1,4,h,4,2",
+    "not": "1j,1,18,c,f,c,u,b,q,38,s,8,9,47,c,1g,2y",
+    "nqu": "5n,w,l,1x,4,9,f,2v,3b,36",
+    "nra": "1g,87",
+    "ns ": "3s,4e,63,16",
+    "nsa": "1e,1g,26,c,3s,7,2,e,k,2e,1n,14,4,3,1p",
+    "nse": "1s,h,17,12,q,2,j,2,j,h,o,u,3,7,48,d,52,3,4,b,d",
+    "nsi": "b,c,1,l,a,1,2,3,4,7,2,e,2,l,x,q,d,g,e,3,3,9,3,h,2,1,1,d,9,5,1,a,q,2,3,1,1,1,7,2,5,5,3,2,1,1,a,5,p,3,e,9,w,1,2,6,2,o,7,16,1,2,1,o,1f,m,q,3,1,2,5,1,9,3,3,3,1",
+    "nsl": "hz",
+    "nso": "b,u,f,c,d,u,b,1,f,y,n,4,2,k,a,c,2,5,o,g,4,o,1,2,2,1,p,1,2v,3,1e,u,5,1c,m,1x",
+    "nst": "1g,1,4,q,4,17,17,c,g,1,1s,14,12,e,3s,5g",
+    "nsu": "2i,8,6,24,27,z,g,2w,1f,f,8,1,2e,7",
+    "nta": "2,2,1,2,3,a,6,1,2,3,4,1,a,1,2,2,5,1,2,1,2,1,1,1,3,1,2,2,4,2,1,1,1,1,1,3,1,1,1,1,1,1,1,1,1,2,1,2,3,2,1,1,1,1,4,1,2,4,c,j,4,s,1,4,2,f,2,2,1,1,1,1,4,a,2,1,3,2,1,1,1,1,1,5,1,2,2,4,1,1,1,1,4,1,1,3,1,2,1,1,1,1,1,1,1,1,1,1,1,2,1,2,2,7,5,2,1,4,2,1,3,c,1,7,1,1,6,1,1,1,3,3,1,3,5,4,e,9,d,5,1,1,1,1,1,1,2,2,17,8,5,1,4,e,l,o,p,d,9,7,4,f,9,6,7,1,1,3,1,1,2,3,1,1,2,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,2,1,1,2,1,1,7,2,1,4,1,1,4",
+    "nte": "0,1,1,1,1,1,1,3,2,3,1,1,1,2,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,4,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,2,1,3,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,2,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,3,2,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,2,1,1,1,2,1,1,1,1,1,1,1,2,2,1,2,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,2,1,2,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,2,1,1,3,1,1,1,1,1,1,1,1,1,2,2,1,1,3,1,2,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,2,1,1,1,1,1,1,2,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,2,1,2,1,3,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,4,1,1,1,1,1,2,1,1,1,2,2,2,2,4,6,1,2,1,1,1,1,2,1,1,1,1,1,1,2,1,1,1,1,3",
+    "nth": "4,1,k,t,s,7,o,3h,j,7,x,1,v,3,1,1h,p,3x,1l,f,x,h",
+    "nti": "0,1,1,1,2,2,1,2,1,2,2,2,1,1,1,2,1,1,3,1,1,2,3,1,1,1,1,1,3,1,1,1,1,1,2,1,1,1,5,1,1,1,1,1,1,2,1,1,2,2,1,1,1,1,1,1,1,1,4,2,2,2,2,1,1,1,1,8,2,1,1,1,3,1,1,1,1,2,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,3,1,1,2,1,1,1,1,1,1,4,1,1,3,1,2,1,2,1,1,2,1,1,1,1,1,1,1,1,1,1,1,3,2,1,1,1,1,2,1,1,1,1,2,1,2,1,2,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,2,1,1,1,1,1,2,1,1,4,1,1,1,1,1,1,1,1,1,1,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,1,1,2,2,1,1,1,3,1,2,1,1,1,1,1,1,1,1,1,2,1,1,1,2,1,1,1,1,1,2,2,1,1,2,1,1,1,1,1,3,1,1,1,1,2,1,1,1,2,1,1,3,1,1,1,2,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,1,1,1,6,2,1,1,2,3,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,2,1,1,1,2,1,1,1,1,1,2,3,1,2,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,2,1,1,2,1,1,1,1,1,1,2,1,1,1,1,1,1,1,2,2,1,2,1,1,2,1,1,1,2,1,2,1,1,1,1,1,1,3,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,3,1,2,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,1,1,1,1,1,3,2,2,1,1,1,3,1,1,3,1,1,1,3,1,2,1,3,2,1,4",
+    "nto": "l,6,a,n,f,3,h,7,c,y,2,5,3,e,1,a,3,11,n,d,3,p,3,f,6,1,j,6,e,e,1,2,q,d,1,9,1b,6,a,1,1,5,1,2,f,3,5,1,8,1,9,11,7,7,7,6,6,8,e,l,d,4,b,2,6,6,4,1",
+    "ntr": "6,c,g,11,7,2,3,3,1,7,1,4,4,19,4,2,5,1w,q,1m,8,1a,g,4,1m,4,2,g,8,1,1,2,1,4,7,r,1,4,b,b,1,1,2,7,g,4,b,1,g,3,f,p,d,3,6,3,7,2,d",
+    "ntu": "93,7",
+    "nua": "7o",
+    "nuc": "9c,1f,1w,19,28",
+    "nud": "70,5s,22,38",
+    "nue": "21,c8,16,4,1,3,o,5,o,2",
+    "nuf": "bd",
+    "nui": "27,y,5k,9q",
+    "nul": "89,1u",
+    "num": "3,4,4,4,h,15,11,h,1r,b,1h,1s,4d,21,k,6,8,c,7,6,4,m,7",
+    "nus": "1,1d,1c,k,a,3,o,e,4,g,1,c,1,3,11,1g,14,17,3,20,s,4,1,1,1,c,1,6,h,2,h,b,8,17,1b",
+    "nut": "7,1r,c,d,g,e,p,4,1,l,f,11,8,g,q,b,9,1,1,2,3,1,3,1,1c,y,1,2,2,4,9,4,1,12,6,2,1,4,2,3,7,d,e,8,11,1,1,2,2,c,7,3,1,1,a,24,7,6",
+    "nuu": "95,67,18,h",
+    "nuy": "22",
+    "nva": "9v,4k",
+    "nve": "5a,37,10,r,d,23,e,c,n,37,x",
+    "nvi": "59,k",
+    "nvo": "b1",
+    "nvu": "2m",
+    "nym": "58,65",
+    "nza": "1o,3c,1s,1y,4p",
+    "nzi": "cc,1,3f",
+    "n”,": "3u",
+    "o\na": "3,5,4,1,2,3,4,6,3,3,1,k,7,3,1,7,1,1,2,2,3,7,4,1,7,4,1,1,b,2,1,3,1,2,1,1,4,1,8,2,1,3,1,4,5,1,1,3,1,2,2,1,1,4,3,1,2,1,2,1,3,2,3,1,1,4,1,7,1,1,3,1,3,5,2,5,6,2,8,5,6,2,6,a,7,f,1,8,9,6,1,2,2,1,8,d,5,1,1,1,4,5,3,2,2,a,1,4,1,4,3,3,3,1,6,4,z,1,6,1,2,1,2,4,1,1,1,3,3,c,3,3,9,4,6,4,7,6,1,2,1,2,3,5,r,o,2,2,3,2,3,4,2,1,1,2,1,1,1,1,3,1,3,1,3,1,7,5,2,1,2,2,e,8,1,6,3,1,1,5,3,1,1,1",
+    "o\nb": "30,1,m,4l,1,48",
+    "o\nc": "6,3,9,2,1,9,5,j,s,2,3,9,1b,o,2,1,1,b,3,1,b,1,b,8,q,5,g,8,e,9,11,13,20,v,37,c,3,f,3,2,h",
+    "o\nd": "8,7,1,2,7,4,d,s,9,1,3,2,4,6,l,3,1,2,7,i,r,2,4,3,1,2,a,e,4,6,q,3,d,1,o,5,2,9,i,c,m,3q,d,9,j,8,1o,f,1,1y",
+    "o\ne": "9,5,2,5,4,4,1,3,l,d,3,6,k,10,3,8,3,4,2,2,3,c,c,n,1,p,b,8,f,7,7,7,1,9,1u,1f,1s,q,f,22,1,8,3,1,2,a,5,2,9,o,p",
+    "o\nf": "13,g,2l,12,34,4,1c,b,2h,2,1,i,8,2,1r",
+    "o\ng": "e,6b,l,9h,9",
+    "o\nh": "w,v,11,a,1,p,2,x,1,n,1e,1i,3,k,r,d,h,3j,2g,q,d,7",
+    "o\ni": "3g,1s,y,1d,9,n,8,c,1g,2g,1h,7,4d,a",
+    "o\nl": "27,9,1v,da,7",
+    "o\nm": "b6,18,5,4f,1g,3,4,5,2,1,e",
+    "o\nn": "2e,1w,2r,2x,x,4,1z",
+    "o\np": "26,34,9e,3r,1,3",
+    "o\nq": "6,gk",
+    "o\nr": "7,1z,7,2j,28,4,3,o,5,1,1,5,y,d,k,18,17,1,5,5,2,a,13,2m,1h,2,8,1,4,5",
+    "o\ns": "13,1b,4,1,p,3,1h,b,36,f,o,d,2,1g,14,m,4,4,1,2,1,1,4",
+    "o\nt": "1e,2o,1q,m,15,e,j,w,6,54,47,e",
+    "o\nv": "c,15,1,1m,r,o,m,3,c,x,v,6z,f,8",
+    "o \"": "ai,e,59,19,1p",
+    "o '": "5d,8,5,5t,6h,3",
+    "o (": "2l,4,d,1t,1,1,8,2,6,2,2,4,1w,s,4,2,1f,6,q,q,1g,o,5,5,5,1,4,1,1,4,2,18,1w",
+    "o a": "1,b,h,1,o,7,e,8,3,1,2,2,3,e,2,3,1h,3,5,1,3,2,1,3,1,9,4,1,5,1,3,a,3,4,d,4,2,8,b,1,6,7,3,5,1,9,2,2,1,1,l,2,m,f,4,7,7,3,3,g,b,4,1,18,j,g,n,1,7,o,9,a,4,5,a,1,9,8,1,3,h,2,9,12,f",
+    "o b": "t,16,1j,c,y,m,1n,2o,3e,9,q,4i,o",
+    "o c": "1,i,b,c,e,2,d,2,1,8,7,2,2,2,4,a,1,f,d,5,t,2,2,2,4,1,3,2,1,1,1,2,2,2,2,1,1,3,2,1,3,1,5,2,8,8,2,2,5,2,1,7,3,6,3,m,1,3,3,3,4,8,2,1,1,3,5,e,1,4,9,4,1,8,1,b,4,1,4,2,2,5,m,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,4,1,1,5,i,3,3,2,3,4,4,f,3,6,1,l,2,1,8,h,2,d,4,e,e,6,8,1,o,8,3,3,3,2,3,1,4,b",
+    "o d": "7,6,7,2,8,a,a,3,1,6,5,6,2,2,1,4,2,2,4,6,1,2,2,2,1,2,2,1,6,6,5,2,1,j,7,i,1,1,7,2,1,2,1,3,6,3,1,3,1,5,2,1,1,4,1,7,1,1,1,5,1,3,2,1,8,9,2,2,3,1,8,8,9,1,1,2,2,4,1,3,1,1,5,2,b,p,7,5,2,4,2,2,4,5,5,4,2,1,1,9,1,4,2,2,3,5,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,4,1,d,1,2,1,3,4,8,5,1,1,4,5,5,1,6,4,4,1,2,d,a,4,l,a,2,6,1,2,2,4,3,w,u,2,4,2,4,3,1,3,2,2,3,4,2,1,1",
+    "o e": "7,5,1,x,4,5,7,1,4,6,3,1,1,1,9,8,2,g,4,1,6,c,1,9,1,1,2,3,2,1,2,8,2,2,1,4,5,5,1,1,3,1,2,1,1,1,2,6,k,2,6,2,1,2,1,3,c,6,6,2,2,j,3,4,1,2,3,2,i,a,5,1,1,3,f,1,2,1,1,4,2,2,1,1,1,3,5,4,1,1,1,3,4,1,4,7,3,2,c,5,3,9,2,3,2,5,1,1,4,2,1,2,2,5,2,1,1,2,1,2,9,2,2,9,3,3,1,2,2,1,1,3,9,3,4,7,2,1,1,8,4,7,1,3,1,6,1,2,5,1,1,1,5,1,2,2,4,1,2,2,1,3,3,8,4,1,2,1,b,7,i,1,4,3,1,3,5,3,3",
+    "o f": "5a,17,26,a,2,2m,v,1,1,1m,6,1p,1o,n,x",
+    "o g": "2t,c,x,1h,v,1f,u,26,28,2,1v,3f,m,2,6",
+    "o h": "2d,4,38,b,w,30,z,c,20,22",
+    "o i": "29,5,g,2g,v,1x,7,z,3,8,1f,1j,8,2,2,2,k,6,18,24",
+    "o j": "4i",
+    "o l": "c,p,e,16,6,4,b,d,k,13,2o,q,4,d,1,b,2,e,7,g,2l,g,6,11,b,f,1,1,c,2,c,1,j,m,11",
+    "o m": "1u,e,2,1,1r,4,5,5,d,5,3,1,4,1,1,9,3,3,1,5,6,2,l,4,1,e,1,9,26,b,2,7,2a,t,i,2,2f,3,1s",
+    "o n": "h,3,6,5,1a,1w,i,d,u,2,11,p,9,6,a,10,1,4,6,4,8,3,2o,10,1d,3,13,1,p,1,c,7,1f,2,6,2",
+    "o o": "1a,4,14,h,25,6,2,2,e,g,w,22,5,13,2f,1,3d,2i",
+    "o p": "g,u,2,2,3,3,b,b,1,1,2,11,1,6,2,1,1,r,7,5,1,4,1,2,4,3,8,2,3,1,1,1,4,2,2,4,6,1,6,1,7,a,2,1,g,2,5,i,2,f,c,1,4,6,2,b,6,7,2,3,2,2,1,1,1,1,1,2,3,2,2,1,3,3,1,8,l,4,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,4,2,5,j,1,2,6,1,6,2,4,3,l,5,5,4,2,4,9,6,9,9,2,4,5,2,3,2,5,4,7,j,f,p,1,4,8,8,3",
+    "o q": "p,12,8,6,1,2,j,z,7,16,f,4,4,3,7,29,3,21,d,2,p,1g,6,3,1,37,i,1h,4,n",
+    "o r": "g,1r,2n,1,n,c,1,1d,2,8,c,3,c,l,m,3e,q,h,e,9,i,2y,h,4,d,4",
+    "o s": "b,2,g,z,d,a,6,2,5,1,1,5,e,2,8,1,5,2,d,6,2,4,3,g,4,2,1,6,3,9,10,p,1,d,2,b,p,1,2,7,1,1,2,1,7,7,5,h,1,6,7,d,h,1r,a,e,2,4,8,1,d,3,g,e,2,1,6,1,1,5,a,6,4,j,3,3,3",
+    "o t": "o,4,f,e,p,6,o,2,d,4,f,g,4,6,7,2,3,e,c,c,y,8,h,4,b,6,8,f,3,1,6,l,d,7,8,b,4,1i,a,a,2,g,3,5,g,2,1,7,1,1v,x,6,5,4,18",
+    "o u": "1s,4,7,7,6,4,19,r,8,1,1,3,1,5,g,7,o,3,j,9,z,e,3,j,11,i,3,1y,1,d,6,7,7,3,e,e,3,5,1h,10,a,1n",
+    "o v": "y,b,28,5,1y,10,37,1c,g,29,3,4,4q",
+    "o y": "7,4,1,1,a,3,4,o,1,1,6,5,6,4,3,2,2,a,e,b,j,8,4,r,9,2,h,4,1,1,c,8,9,7,5,4,6,1,1,8,6,5,3,1,6,1,5,7,2,1,2,c,1,1,z,1,1,5,c,4,9,6,6,1,1b,1,9,4,3,1,e,9,8,3,4,5,1,1,8,3,5,i,4,b,2,3,3,6,3,c,6,h,4,2,2,1,1,r,3,2,6,2,1,2,5,3,3,4,7",
+    "o z": "cl",
+    "o\" ": "6k,c5",
+    "o'.": "d3",
+    "o)\n": "4t,4,g,8,33,1c,31,r,7,a,1y",
+    "o) ": "52,4i,76",
+    "o, ": "l,d,9,l,b,7,7,6,3,1,9,d,5,e,3,4,3,9,7,f,4,4,1,4,3,7,1,3,4,1,1,1,1,2,2,1,1,3,3,f,4,e,2,b,f,1,5,1,2,4,1,8,1,6,3,3,9,7,1,5,3,1,a,3,2,6,1,3,1,2,5,1,2,1,2,9,1,i,10,7,4,2,2,1,2,2,1,1,1,b,g,3,1,l,1,7,2,g,2,3,2,1,2,8,5,1,2,7,d,7,4,a,1,3,d,3,k,g,3,6,3,3",
+    "o-p": "hj",
+    "o. ": "14,z,3h,c,2,27,3,b,1g,1j,y,5,1,8,5,2,7,2,q,3,8,3,f,9,4,t,17,6,8,l,z",
+    "oa ": "ch,h",
+    "oa,": "d1",
+    "oac": "2s,a6",
+    "oag": "1q,53,2y,q,1w,55",
+    "oal": "5w,2i,2j",
+    "oam": "2m",
+    "oan": "g0",
+    "oaz": "d0",
+    "oba": "1z,1j,s,2,1o,11,83,44",
+    "obe": "5v,58",
+    "obi": "3,6,a,n,h,4,28,1e,c,6,b,h,6,p,6,4,4,3,k,y,19,4,d,1g,h,1k,b,1,2,u,w,3,7",
+    "obl": "4,4,g,e,5,b,n,1,1,s,1,9,a,3,4,2,3,1,v,8,6,8,o,1,1,f,c,3,w,4,k,2,d,h,l,9,w,d,k,b,4,16,o,q,1,u,l,1,6,2,9,6,3,6,8,h,8,c,c,7",
+    "obo": "1c,2y,17,4b,46",
+    "obr": "m,9,22,d,25,1e,n,s,8,e,1i,j,1p,g,3,w,1m,n,d,e,1h,c,4,9",
+    "obs": "56,2",
+    "obt": "7g",
+    "obu": "q,11,1l,e,24,t,7,9f",
+    "oca": "c,2i,p,7,15,r,14,n,z,2,7,l,44,2,j,t,e,14,16",
+    "occ": "2u,5t,u,46,1y,2s",
+    "oce": "v,t,m,3z,24,2,43,28,2x,1d",
+    "oci": "0,o,6,4,3,6,8,a,2,1,5,3,1,e,1,1,3,6,1,b,4,3,3,5,4,9,v,1,2,k,9,3,2,2,4,2,4,1,2,3,9,3,2,4,6,2,8,9,n,7,7,5,2,1,2,9,6,a,3,3,h,2,5,1,3,4,1,5,1,1,b,1,2,3,1,1,4,1,6,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,4,5,1,7,5,3,1,1,2,4,3,4,2,1,2,8,b,1,5,3,5,6,a,7,4,h,5,5,5,6,1,1,5,b,3,2,7,2,7,7,2,4,1,8,3,4,4,2,2,1,4,5,3,4,2,1,3,1",
+    "oco": "2b,g,v,3u,17,1,1n,16,16,s,1t,6,6,3,k,26,i",
+    "oct": "dt,l",
+    "ocu": "m,s,6p,18,m,14,1d,r,2,2,1,4,14,o,c,4,v",
+    "oda": "9c,9q,4",
+    "ode": "2b,38,1d,6,16,7,1n,1,h,b,p,3b,1l,f,a,1b,k",
+    "odi": "0,5,3,3,4,7,5,8,c,a,c,2,3,5,8,4,h,e,4,4,10,6,q,1,2,7,n,4,6,3,5,2,2,4,5,4,8,7,4,l,6,6,3,1,1,9,c,1,2,a,2,1,5,o,k,2,16,d,2t,4,2,i,2,d,3,2,1,4,7,4,s,5,h",
+    "odo": "y,d,16,31,c,2m,l,z,z,7,1g,f,4h,13,7,b",
+    "odu": "w,t,m,1s,1h,g,6,1,7,8,o,x,a,1l,1,1,4,3,1,1,2,1,5,2,1,4,5,e,7,t,3a,c,1,7,d,9,l,2,1p,3",
+    "oe ": "1p,4e,bi,4,3,9",
+    "oea": "79,s",
+    "oen": "d,1,i,1s,e,6w,5t,7,k,9",
+    "oes": "v,o,q,32,28,1,3,4,1,4,5,e,1,7,h,m,3z,b,c,7,4,2",
+    "oet": "hb",
+    "ofa": "89,d",
+    "ofe": "bl",
+    "off": "1,9,8,6,4,2,6,8,2,a,a,4,m,5,c,8,1,u,l,1f,5,h,1,9,f,2,5,3,6,p,7,3,c,d,3,5,2,g,15,4v,d,7,5,1n",
+    "ofi": "ag,i,c",
+    "ofo": "8o",
+    "ofr": "as",
+    "ofu": "bh",
+    "oga": "11,7,8,1,4,1o,j,38,5,9,k,i,16,4n,u,1,1,s,1,1",
+    "oge": "j,10,3a,1l,15,1,6,1,m,3,7,1,12,c,t,o,2,34,27,d,i,7",
+    "ogi": "55,12,1d,c,m,12,i,a,d,9,o,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,29,1m,19,w,3,2,1,1,2,5,2,1,1,c,1",
+    "ogl": "j,d,9,m,d,y,7,6,d,t,1z,2x,n,e,4i,y,k,q,e,8",
+    "ogn": "7j,16,z,i,85,1,a,1,c,3,6",
+    "ogo": "e,f,1,2,7,f,11,j,1r,c,1,7,d,z,l,2,v,1q,24,4h,9,9",
+    "ogr": "w,26,cw,k",
+    "ogy": "3u,y,4x,57",
+    "ohi": "5k,t,1z,2,7,4r,25",
+    "oho": "8o",
+    "oic": "2b,4v,a0",
+    "oid": "z,w,19,f,3,1e,b,4,21,2j,s,8,4,i,1g,a,13,9,w,n,2",
+    "oin": "1o,1b,5i,6z,4,3,3h",
+    "oja": "1z,c,8,6,7,7,c,d,3,8,d,4,1,3,6,2,2,2,7,a,6,3,4,4,e,i,7,3,q,17,6,1u,1,2,1,4,16,t,3,6,9,2,2,1,b,1,2,i,2,1x,2,t,4,3,3,1,1,2,2,1,2,l,6,d",
+    "oji": "59,7l,1v",
+    "ojo": "e,10,1a,7,20,15,8,1u,t,e,2,3n,d,1d,i,c,9,5,o,7",
+    "oki": "ad",
+    "ol\n": "a3,b,3,5,1t",
+    "ol ": "2n,8,8,2,6,1,2,2,1,3,a,7,1,3,8,l,6,a,g,8,6,1,3,8,a,5,2,1,6,8,s,26,8,1p,6,g,8,1,1,2,1,2,c,1j,5,2,6,1o,e,8,9,m,1",
+    "ol)": "do",
+    "ol,": "4i,2k,65,b",
+    "ol.": "5j,2t,j,47,d,2k",
+    "ola": "11,h,a,m,q,22,7,1,d,14,5,9,3,4,i,4,5,o,5,1,c,r,4,f,u,u,4,2,b,f,7,m,e,3,17,a,d,12,z,b,1,b",
+    "old": "3b,s,5k,2e",
+    "ole": "8,1d,3,m,1,4,1,3,2,6,c,8,4,2,1,f,6,6,w,1,2,y,4,a,l,5,1,3,4,7,h,1,1,k,3,6,h,j,2,b,3,5,3,5,g,15,i,9,9,7,2,t,b,f,1,6,6,2,1,3,7,8,2,t,7,f,3,5,u,1,2,h",
+    "olf": "ab",
+    "olg": "i4",
+    "oli": "8,8,7,1,1,7,e,2,1,3,3,1,9,3,a,2,a,n,2,8,l,1,8,2,2,4,9,n,n,2,4,9,7,2,5,3,2,1,5,5,1,3,1,1,7,5,4,d,h,3,5,1,1,1,2,4,3,5,5,4,1,2,2,o,7,g,1d,7,9,4,d,9,2,7,d,7,2,i,2,6,g,4,5,p,6,9,9,6,7,8,c,q,5,2,2",
+    "oll": "d,c,4v,d,4r,x,3y",
+    "olm": "2n,20,65",
+    "olo": "4,g,9,4,e,1,3,o,2,9,1,6,1,o,a,1l,c,f,9,1,1,1,l,a,b,1,5,c,6,3,6,3,4,9,1,b,6,4,2,5,8,2,1,4,3,6,4,1,7,5,1,8,a,e,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,b,6,3,2,7,8,2,a,f,9,8,16,1,f,2,6,1,5,3,p,1,2,a,5,b,2,3,1,3,2,1,1,2,1,1,3,2,1,1,2,a,1",
+    "olp": "93",
+    "olu": "19,45,2z,u,4v,25,1m,5",
+    "olv": "32,7z,6f",
+    "oly": "8p,1q",
+    "olz": "90",
+    "oma": "0,1,j,3,g,8,1z,e,l,g,1,3,4,4,4,e,5,4,6,3,1,2,k,1,1,1,3,3,1,4,3,3,2,6,1,1,b,1,3,m,5,2,2,1,5,t,8,j,9,o,1,1k,1,2,1,1,2,1,18,3,i,s,f,4,1,8,d,k,13,8,5,2,8",
+    "omb": "26,g,s,o,29,v,l,w,10,3,1,i,3,8,2,5,f,1d,g,l,h,j,6,2,11,1d,5,h,2,i,1,f,9,4",
+    "ome": "1,13,6,v,v,a,1f,4,5,f,1,8,d,8,c,8,13,20,4,1,k,6,2,3,2,4,6,c,1,9,l,t,9,3,k,5,4,i,6,9,7,1e,4,1r,3",
+    "omi": "2,c,1,g,t,7,3d,9,2,16,8,j,1a,1j,k,2a,1c,1d,4,9,k,5,h,3,1,7,8",
+    "omm": "2q,1y,9,4,n,9,4j,30,3u",
+    "omn": "b,19,c,i,10,31,j,o,5,13,3,2,1,q,5y,1b,e,y,l",
+    "omo": "l,3,5,1,7,6,8,o,1,2,1,2,5,3,3,1,1,1,4,1,2,1,5,2,4,b,2,3,8,8,g,5,5,5,4,8,1,8,2,1,3,2,1,1,3,b,1,2,2,3,5,1,1,1,1,5,1,2,1,8,2,3,1,2,3,3,b,1,5,2,8,7,1,3,1,1,1,1,1,a,2,6,1,5,2,1,2,3,8,9,1,1,4,2,1,1,1,2,1,2,1,2,2,1,4,5,6,1,f,1,1,s,1,2,5,7,1,2,3,3,2,6,3,5,b,c,6,5,1,6,2,a,1,c,3,a,1,1,3,1,3,1,1,4,2,2,8,1,a,7,8,9,9,d,3,a,2,1,5,2,2,3,1,4,2,2,2,3",
+    "omp": "16,2j,2g,1v,e,x,m,t,1,3,1p,9,9,b,1,j,6,d,v,7,16,v",
+    "omu": "j,2,2,13,3h,1b,6,11,3v,18,j,10,c,16,j,3,q,n,2,t,c,3",
+    "on\n": "bc,12,4,1,b,d,4,5a,2,5,7,3,6",
+    "on ": "0,1,1,1,3,1,2,1,1,3,7,1,5,2,2,1,1,1,5,1,1,1,2,3,3,8,2,1,1,1,1,5,1,1,1,2,2,1,2,1,2,1,1,3,3,1,2,2,1,1,2,1,1,1,1,4,5,4,2,1,3,1,1,2,1,1,3,2,5,1,3,1,4,2,1,3,2,5,1,1,1,1,1,4,5,2,2,4,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,8,3,4,1,3,2,1,1,2,4,1,2,6,3,1,2,1,1,1,2,1,2,1,1,1,3,4,1,1,2,1,3,2,3,2,1,2,3,1,3,2,2,1,2,2,6,2,2,2,2,4,1,1,1,2,1,2,4,2,3,2,1,2,3,5,2,4,1,1,3,3,9,3,6,2,3,3,3,1,1,2,6,2,1,2,1,6,1,2,1,2,1,3,p,1,3,1,1,1,1,2,1,2,1,3,1,3,4,1,2,1,2,1,2,2,6,2,4,1,2,2,1,1,1,2,1,1,3,4,3,4,1,4,a,1,2,1,1,2,1,1,6,2,1,1,1,2,1,1,1,1,1,1,1,2,1,2,1,1,2,3,1,3,1,1,7,2,2,2,2,7,2,1,1,5,3,2,1,1,2,3,1,1,1,4,1,1,3,1,2,5,1,1,1,1,1,2,1,2,1,1,5,1,1,4,3,1,1,1,1,3,3,1,4,1,2,2,2,2",
+    "on'": "4s,l",
+    "on)": "55",
+    "on,": "c,r,i,56,1o,k,v,1,14,1h,2,r,p,1p,2,4,2,1,o,9,m,8,z",
+    "on.": "f,t,2,7,t,e,1,d,1,l,1q,1,j,6,7,f,b,o,9,1,k,4,f,n,i,a,8,3,1u,2,b,h,t,b,c,j,1,9,4,d,3,a,1,g,g,1,1,15,b",
+    "ona": "a,i,5,2,7,1,g,2,3,9,8,a,2,1,7,1,5,3,1,1,2,6,5,2,4,4,9,2,2,8,6,1,3,6,1,3,8,1,b,1,1,4,5,3,1,1,a,2,2,1,3,4,2,6,4,a,1,3,6,5,1,6,7,2,5,2,7,2,1,1,3,4,8,5,4,4,2,7,2,e,1,7,3,2,i,2,8,4,1,7,5,r,4,9,4,3,2,1,5,1,4,1,4,4,6,2,1,5,8,2,3,1,2,2,7,2,1,2,8,1,b,2,4,2,9,7,7,1,5,1,6,l,d,5,4,1,4,5,5,6,1,4,2,1,1,1,4,4,1,1,1,5,1,2,5",
+    "onb": "f6",
+    "onc": "1s,7,5,l,2,9,1i,1t,8,i,1m,4f,1a,g,1h,1,j,14,g,9,m",
+    "ond": "3w,24,1a,p,25,11,r,6s,7",
+    "one": "2,q,4,d,j,4,c,1,c,4,5,5,1,2,4,1,5,9,2,3,1,a,5,1,c,4,7,1,6,2,5,5,b,3,3,1,8,e,2,4,3,7,3,l,2,1,4,4,g,4,4,1,4,c,2,1,6,6,8,1,3,4,5,8,3,o,6,2,1n,q,8,2,9,6,5,1,5,3,5,t,c,6,e,c,g,a,9,a,1,2,6,i",
+    "onf": "3q,2y,62,57,y,2",
+    "ong": "h,g,6,3,1p,4,d,c,26,8,3,p,o,h,9,18,m,4,2,2,2,2,2,2,1,1,3,1,2,1,3,1,1,2p,24,4,q,4,f,3,e,w,1,1,3,4,g",
+    "oni": "h,9,b,5,8,3,1,p,5,i,a,f,b,1,7,3,5,2,6,a,5,3,1,4,4,4,1,1,3,7,1,2,a,4,1,2,2,3,m,7,5,1,6,6,2,1,1,4,1,2,f,1,1,1,5,2,4,f,4,6,2,2,3,2,4,1,4,1,15,1q,1,2,7,f,5,8,4,1,b,8,4,5,1,3,3,12,2,w,p,6,a,k,1,1,1,6,1,5,1",
+    "onj": "o,21,2,85,s",
+    "onk": "hi",
+    "onn": "im,g",
+    "ono": "o,6,7,6,8,9,1,2,1,3,2,3,1,f,1,9,1,b,4,3,3,5,4,9,q,6,2,6,e,9,3,2,2,3,1,6,1,2,3,9,3,2,a,2,8,9,1,m,7,4,3,5,2,1,2,9,6,a,6,4,d,2,3,2,1,7,1,5,1,5,8,2,9,1,6,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,4,5,8,5,3,2,6,7,2,b,c,2,b,3,3,8,2,b,7,4,3,8,a,3,3,1,1,5,b,5,7,9,7,1,1,4,1,2,6,3,4,4,2,3,9,3,4,3,3,1,1",
+    "onq": "6j,2i,d,f",
+    "ons": "19,12,5,2,8,w,1o,9,c,2,13,16,g,l,f,e,u,h,7,1f,f,8,1,1,16,4,13,2g,q,1",
+    "ont": "i,9,3,s,k,5,3,1,2,6,5,3,u,f,4,2,15,4,r,t,v,5,s,8,7,5,g,j,7,4,5,i,a,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,4,2,b,5,2,1,3,2,1,1,2,1,1,3,4,3,1,r,3,1,j,7,7,8,c,3,9,d,e,7,14,7,l",
+    "onv": "2m,37,42,4k",
+    "ony": "58",
+    "on”": "3u",
+    "ood": "i7",
+    "oos": "2t",
+    "oot": "9o,i",
+    "opa": "a,z,a,1i,e,1t,7,u,24,b,j,n,4,1c,5o,o,8,5,a,3,a,g,4",
+    "ope": "47,29,3l",
+    "oph": "2r,2k,3x,18,1v,z,1d,f,2p,8",
+    "opi": "0,2,1,7,o,8,i,2,3,1,1,1,1,1,3,1,2,1,2,1,3,2,1,9,1,4,3,8,3,2,1,3,2,2,5,3,1,1,6,1,g,b,1,9,1,3,c,9,i,1,7,3,4,4,9,2,1,g,1,j,4,7,2,1,7,5,3,2,3,c,2,5,7,f,a,3,7,1,1,2,2,k,1,1,w,1,1,2,1,6,1,1,2,8,7,7,a,8,2,1,1,4,3,1,1,6,4,4,c,1,3,1b,1,d,b,1,2,h,1,4,1,1,2,1,2,1,2,5,6,3,1,1,3,1,2,2,3,4,1,2,6",
+    "opo": "s,b,3b,2u,2l,d,2u,3,26,8,t",
+    "opr": "d,4,2o,6,7,l,22,c,4,1,f,f,2,2,1,4,d,f,1,2,5,u,j,4,4,5,3,d,2r,2,5,8,8,g,a,1,d,2,1,2,5,d,1,7,f,i,c,15,g",
+    "ops": "8g,1t,7p,2,s",
+    "opu": "s,3f,7,c,s,3,y,9,2o,d,5,7,8,6,7,a,1w,2a,13,1d,8,f,p",
+    "oqu": "3w,1m,82",
+    "or\n": "1z,c,p,3,8,4,7,8,9,p,1e,d,a,8,f,4,1b,u,d,2,2,2,4,1,2,1,5,2,5,3,37,n,2p,3,2,1j",
+    "or ": "a,a,5,9,e,2,1,2,2,3,2,2,2,b,3,1,3,4,1,6,2,1,3,2,3,2,8,1,3,1,1,1,1,3,1,3,3,c,d,9,4,2,1,2,4,d,7,3,6,1,3,6,1,1,1,1,2,2,7,1,2,9,5,1,2,2,3,2,1,2,3,1,2,4,5,9,3,1,1,1,1,3,1,2,1,1,3,1,1,5,1,1,1,1,4,2,1,1,3,2,2,2,3,3,1,9,1,6,2,1,2,1,1,1,1,1,2,1,1,2,2,3,3,1,1,1,1,3,4,1,5,1,2,3,1,2,2,2,5,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,4,1,1,2,1,1,2,2,1,1,1,1,1,1,1,1,3,4,2,1,2,1,2,2,1,2,4,1,6,a,1,1,5,8,6,4,1,2,3,3,8,h,5,c,3,1,2,1,4,3,3,5,5,6,1,3,3,5,1,2,1,1,6,1,8,7,4,3,2,2,2,1,3,1,2,3,2,2,5,1,2",
+    "or,": "1b,9b,1,5y,u",
+    "or.": "1o,q,c,7,5r,4i",
+    "ora": "2,7,1,1,3,1,1,1,4,4,1,2,3,2,1,7,4,1,1,1,a,1,2,2,1,1,2,4,2,1,8,6,2,1,3,2,2,a,4,2,1,1,4,6,5,1,1,2,2,1,1,4,1,7,1,2,7,4,7,9,7,2,2,2,1,4,5,2,4,1,3,6,1,2,2,2,3,1,2,1,1,2,1,2,1,1,1,2,1,2,1,4,7,a,1,2,1,3,2,2,2,1,1,2,2,1,2,3,2,4,2,2,1,1,1,3,2,2,5,3,2,2,2,1,1,1,2,3,1,5,1,4,1,2,1,1,2,5,1,2,1,1,1,2,2,2,1,1,2,1,1,2,1,2,7,2,1,8,1,8,10,2,1,1,1,1,3,1,1,1,1,2,1,8,1,4,1,3,b,1,1,2,2,1,2,3,3,1,6,1,4,1,1,3,7,5,2,3,1,3,1,1,5,3,1,1,1,2,5,5,1,2,5,1,4,1,2,1,3,2,1,2,2,1,3,1,3,1,1,1,4,1,1,1,2,2,4,2,6,1,1,1,5,1,1,e,2,1,2,1,1,1,1,1,1,1,1,2,1,1,1,1,2,1,1,1,1,1,1,1,1,1,3,1,2,1,1,1",
+    "orb": "10,2y,4,7h,1z,t,m,c,2w",
+    "orc": "3w,3c,3k,2b,26,8,b,i,4,15",
+    "ord": "1c,l,1h,23,3g,v,d,1a,6s,a,k,2",
+    "ore": "3,1,t,4,o,c,b,c,1,4,3,5,7,2,4,6,e,15,1,9,2,c,2,6,g,3,6,4,7,3,k,a,f,4,5,6,1,1,2,2,1,2,2,2,2,1,1,2,2,1,2,1,5,4,2,2,2,5,i,3,e,1,d,4,3,v,3,1,3,s,10,6,e,s,u,3,9,b,6,c,1,4,b,2,1,1,1,l,2",
+    "org": "p,1l,fj,1a",
+    "ori": "1,1,1,3,1,2,1,1,6,1,1,2,7,3,3,2,1,1,3,1,2,1,1,3,1,1,1,7,1,1,2,3,5,2,2,4,1,a,2,1,1,5,6,2,1,3,3,1,2,1,1,1,1,3,1,1,1,1,1,1,1,2,1,1,4,1,1,3,5,1,1,2,5,6,3,2,2,4,1,1,1,1,1,1,2,1,2,1,5,1,3,1,7,4,2,1,1,2,1,2,1,1,1,1,1,1,1,1,1,3,3,1,1,1,1,1,2,1,2,1,1,2,3,4,1,1,5,7,1,1,1,3,2,1,3,1,1,1,1,1,3,1,1,2,1,1,1,2,2,1,6,1,1,1,2,2,1,1,1,2,3,3,2,1,1,1,2,1,2,1,1,1,1,2,2,2,1,1,2,1,1,2,1,1,5,4,5,2,2,3,5,1,1,1,3,3,1,4,4,2,8,1,6,t,1,1,4,1,1,2,1,2,1,1,3,3,3,2,1,3,1,1,1,5,6,2,1,4,1,1,3,a,7,1,1,3,1,1,2,3,3,1,2,1,3,1,2,4,1,2,2,2,3,4,1,5,1,4,4,2,1,4,1,5,1,3,3,1,1,2,1,1,2,3,1,1,1,2,1,2,1,1,2,2,1,1,3,2,3,3,1,1,1,1,1,1,2,1,1,1,1,1,4,1,1,1,2,1,2,2,4,1,1,1,1,1,1,1,3,1,1,3,3,1,1,2,1,1,1,1,3",
+    "orm": "a,4j,t,24,i,9,5,2,c,8,3,9,7,5,2,c,v,2,1,a,z,8,9,k,8,7,15,7,y,15,c,7,2,4,3,e",
+    "orn": "5,39,i,w,e,3,1,2,6,p,l,c,p,o,j,1r,j,2,1,39,d,5,t,1y",
+    "oro": "o,21,23,30,34,2,k,6,c,t,5",
+    "orp": "2r,8a,51",
+    "orr": "10,a,6,z,7,x,3,1e,2,v,2d,w,c,5,1p,9,2t,6,1m",
+    "ors": "5c",
+    "ort": "d,13,6,4,d,6,2,c,g,9,1,d,5,1,4,4,8,3,8,4,5,d,3,9,2,3,7,a,o,8,3,5,9,3,5,4,6,d,1,6,r,6,4,f,2,7,2,j,c,1a,7,7,3,n,8,b,1,6,3,1,9,9,2,4,e,3,21,8,8,8,6,1,2,5,2,1,1,3,5,1,2,1,1,2",
+    "oru": "4l,3c,2i,9,5,n,1k,4o,r",
+    "orv": "5k",
+    "ory": "3v,a6,1f",
+    "orz": "5g,do",
+    "os\n": "8c,9,3x,5,p,3e",
+    "os ": "1,3,1,3,6,1,1,3,3,2,3,1,3,4,1,1,1,1,1,3,4,3,2,2,4,2,1,1,f,2,4,2,1,1,1,1,1,1,1,4,4,1,1,1,1,2,1,2,4,2,1,1,2,4,2,1,4,1,2,3,1,2,2,1,1,1,6,2,6,3,1,3,1,1,5,2,2,2,7,2,1,3,3,2,2,1,3,6,1,4,1,4,5,2,e,1,1,3,1,1,1,5,5,1,1,2,1,1,1,1,e,2,1,3,2,1,1,3,6,1,2,1,2,1,7,1,2,1,1,2,3,1,5,1,1,2,1,1,1,1,1,1,2,1,3,7,1,1,1,1,2,1,1,1,4,3,1,6,4,1,5,2,1,1,2,1,3,2,5,3,6,5,w,3,1,4,4,1,1,3,1,2,d,1,6,4,1,3,2,6,3,3,3,4,1,3,3,2,1,1,3,3,4,3,7,1,2,3,2,2,1,3,1,5,3,1,1,1,3,4,7,3,1,1,4,2,3,3,5,1,2,6,2,3,4,1,3,m,4,1,4,2,2,3,3,4,4,1,7,1,3",
+    "os'": "5x",
+    "os,": "g,2,a,l,1o,8,h,1i,8,2,a,1,9,b,5,a,1,l,9,6,a,1,f,d,2,3,1,8,1,4,e,11,k,3,1x,6,1,1w,x,6,7,c,6,5,13,1,f,7,3",
+    "os.": "8,8,8,7,7,5,4,3,9,g,c,2,7,4,1,7,1,j,2,e,8,6,d,1,4,8,1,2,1,a,4,7,8,1,1,4,b,7,5,1,2,c,4,x,4,7,b,9,1,3,5,9,d,2b,4,2,h,l,5,5,c,8,3,k,1,h,9,4,1,4,f,7,2,6,c,6,3,1,3,1",
+    "osa": "m,m,5,u,e,7,r,1g,1,2,6,7,1,2,2,7,b,5,6,b,j,c,1,2,6,3,8,3,2,2,1,1,5,4,3,5,5,4,p,5,8,d,8,f,8,1,3,v,3,3,2,1,1,1,2,1,2,1,c,5,1,7,8,a,4,1,4,4,8,3,3,5,d,2,3,t,1f,2,2,3,3,1,1,f,2,a,3,4,4",
+    "osc": "68,50,1u,3e,o,2",
+    "ose": "7,1m,1,1,1,5,1,2,d,c,c,4,1n,1q,3r,b,e,1i,s,i,a,1,1,c,9,7,f,8,13,10,7,7,a",
+    "osf": "cy",
+    "osh": "7w,s",
+    "osi": "9,d,d,5,8,9,f,j,5,5,3m,u,1o,3,e,e,1o,1q",
+    "osm": "1,39,1f,2,20,a2",
+    "osn": "8m",
+    "oso": "q,k,v,s,7,f,19,3,5,6,1,1,3,4,5,5,3,3,e,1,a,9,q,8,6,4,7,k,1,1,5,9,a,3,1,3,2,e,1,k,d,2,19,7,m,d,d,t,3,5,f,18,a,4,1b,3,c,4,3,5,1",
+    "osp": "at,4,32,54",
+    "osq": "6h,47",
+    "ost": "x,27,1n,3,3j,15,5,7,k,2,2,1,2g,4,1c,e,i,6,8,u,2c",
+    "osu": "89,2,2,3,7,2g,12,8,1f,12,b,38,f,e",
+    "osw": "17",
+    "ot ": "28,45,28",
+    "ota": "17,3i,3e,2,f,12,t,w,1,6,3,6,13,d,2,2,8,27,1h",
+    "ote": "2,d,2,3,a,1,4,6,1,b,1,3,5,f,4,u,2,6,4,3,b,1,7,2,2,a,4,9,4,1,5,h,2,4,2,8,3,3,c,4,1,7,4,4,1,e,2,2,1,1,3,5,6,1,1,1,3,b,1,2,5,5,1,7,1,4,2,a,6,1,5,2,2,1,2,4,1,2,1,2,3,1,5,a,2,3,b,a,r,1,1,5,3,2,2,4,2,6,1,8,3,4,1,1,1,1,2,1,4,7,1,1,7,4,c,6,1,3,1,2,5,3,2,1,2,1,2,1,4,c,1,1,2,5,2,4,9,6,1,8,3,5,7,2,8,7,3,d,5,1,2,3,d,1,1,4",
+    "oth": "5q,48",
+    "oti": "19,a,1,6,o,e,35,i,1,d,1g,p,5,4,j,i,m,d,1a,1,2,24,1j,8,18,19",
+    "oto": "2c,s,f,b,1,a,n,8,e,1,b,i,z,21,4,d,2,4,1,46,c,c,6,18,2",
+    "otr": "8,k,x,2,1,5,n,1d,1e,7,b,e,o,s,1w,5,i,p,2t,a,p,q,4,22,k",
+    "otu": "2x,7,6n,g,7,8,81,c,5",
+    "our": "8m",
+    "out": "ct,1",
+    "ova": "6t,3a,x,1q,a,c,a,f,17,z,1,1v,g",
+    "ove": "2e,n,3k,3u,p,4t,2i,8",
+    "ovi": "dk,1u",
+    "ovo": "96",
+    "ow)": "9n",
+    "owi": "d1",
+    "owl": "i4",
+    "oxa": "8c,2o",
+    "oxi": "1,2,3,b,5,7,s,5,5,4,1,1,4,7,9,k,1,4,5,2,1,3,4,q,a,6,b,2,2,1,4,g,5,4,1,2,3,2,5,3,2,5,a,1,2,7,3,2,1,1,1,1,4,d,1,1,2,3,4,1,i,e,f,6,1,2,2,8,3,3,1,4,4,2,1,1,1,1,1,1,1,1,1,1,4,7,9,2,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,5,1,2,1,1,1,2,2,1,1,1,3,1,1,1,1,2,3,1,2,1,1,1,2,2,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,2,1,3,2,2,1,1,1,1,2,3,1,1,2,1,2,1,1,5,1,1,2,1,1,1,1,3,1,1,2,2,1,1,3,5,2,5,1,1,2,5,1,3,2,3,3,1,2,2,1,3,2,a,3,9,5,1,7,3,8,9,6,5,1,8,5,1,4",
+    "oxy": "hc",
+    "oy ": "5k,3x",
+    "oya": "af,2d,h,27,2z,g,2,4,3,1,1,1",
+    "oyo": "ay,1,4,b",
+    "oys": "1b,ds",
+    "oza": "bl",
+    "ozu": "aq",
+    "p b": "5l",
+    "pa ": "bi,t,8,1,2,1,1,4,2,1,5,6,3,1,52,a,g",
+    "pac": "1p,l,10,j,12,1d,9,w,2,n,4,1w,1,1,2,2,2,4,4,u,8,w,4,e,i,d,a,l,l,m,1y,5,9,w",
+    "pad": "2m,e,1z,1g,4,2d,91,h,d,3,2,7",
+    "pae": "19,26,1t,35,5,p,d,1q",
+    "pai": "31,38,63",
+    "pal": "1e,t,u,6,x,1t,d,2e,11,5,5,13,1r,20,1d,1d,3,8,5,a,x",
+    "pan": "16,13,39,t,3,15,5t,1,1w,j,i,20,v",
+    "pap": "2e,4v,53,3c,1p",
+    "par": "2,3,3,3,3,1,1,4,3,1,4,1,4,2,1,1,1,4,1,1,1,1,1,3,3,1,2,1,2,2,3,4,4,3,3,1,1,1,1,3,3,1,1,1,2,1,3,4,1,1,2,1,1,1,1,1,2,2,1,1,1,1,1,1,2,1,1,1,1,1,1,2,1,1,2,1,1,1,1,1,3,3,1,3,2,1,1,2,1,1,1,2,1,3,2,1,4,1,1,1,1,2,1,1,1,1,2,1,1,2,2,4,1,1,1,1,1,2,1,1,2,2,1,1,2,1,1,2,1,1,1,1,1,1,2,1,1,1,2,1,2,1,2,1,1,2,2,1,1,1,1,1,2,1,1,1,1,1,1,1,2,1,1,1,1,2,1,2,1,1,1,4,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,6,5,1,1,1,1,1,3,1,1,2,2,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,2,1,1,1,1,1,1,1,2,1,1,1,1,1,3,1,2,1,1,1,3,2,3,3,5,1,2,1,1,1,1,3,3,3,2,2,1,q,3,1,1,1,1,2,4,2,1,4,1,1,2,1,3,1,1,2,1,5,3,1,2,1,2,1,3,2,1,2,1,1,1,4,1,1,4,1,1,1,1,1,1,5,1,1,1,2,1,1,3,1,3,2,1,2,5,1,1,1,1,2,5,1,2,1,1,2,1,1,4,1,1,1,5,1,1,1,1,6,3,1,2,3,2,3,3,3,3,3,3,3,1,1,1,2,1,1,3,1,1,1,1,1,1,3,1,1,2,3,1,1,1,1,1,2,1,1,1,1,2,1,1,1,2,1,1,2,1,1,1,3,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1",
+    "pas": "0,5,3,3,4,k,c,a,c,5,4,9,4,v,8,10,w,1,1,1,u,a,3,5,2,6,5,4,8,7,4,8,d,6,9,1,1,9,c,1,2,c,1,1f,11,3b,4,2,i,f,3,2,1,b,4,1h,a",
+    "pat": "h,k,24,6,s,1m,g,h,w,3,4,d,5,b,2,1a,8,d,27,b,1,1r,6,4,1,2,1l,i",
+    "pau": "a,19,4s,2d,1a,6c,o,28",
+    "pav": "2e,4v,2z,5g,1p",
+    "pay": "cc",
+    "paz": "z,4y",
+    "pci": "4j,x,s,6p,s,k,e,s,20",
+    "pe ": "6a,6,8c",
+    "pe)": "54",
+    "pe.": "9f,e,4k,6",
+    "pea": "47,5h,d",
+    "pec": "2,4,3,5,1,1,4,1,1,3,1,2,5,c,1,2,a,1,1,3,1,2,1,4,9,7,3,6,c,8,4,4,7,1,3,8,8,1,2,7,4,g,b,7,2,3,2,4,4,7,4,9,1,5,1,5,3,6,6,9,3,8,2,1,1,7,3,b,4,3,7,5,3,1,2,3,3,1,c,2,1,4,3,8,x,9,1c,1,5,h,5,3,2,b,a,5,b,w,5,3,1,2,a,7,1,2,2,2,5,1,2,1,2,1,1,8,1,4,2,3,5,1,1,7,h,b,1,3,3,4,2,7,4",
+    "ped": "2z,1w,d3",
+    "peg": "52",
+    "pej": "7z",
+    "pel": "56,2,7,5,1m,2c,32,o,4y",
+    "pem": "35,3h,7,at,8",
+    "pen": "1f,1h,p,s,z,41,2,41",
+    "peo": "8i,12",
+    "pep": "fb",
+    "peq": "35,1p,6,4,a,4,k,f,1q,f,a,e,8,1t,18,6,a,7,5,j,c,3q,6",
+    "per": "4,3,i,4,5,6,h,1,1,2,3,1,a,5,1,1,1,5,1,1,7,5,9,j,12,1,8,2,7,1,1,2,5,3,5,b,y,5,5,2,5,1,o,3,3,11,1,k,1,1,j,5,g,b,4,13,3,8,n,1,5,a,1,1,7,3,6,d,1,1,1,5,8,17,j,d,2,3,4,1,4,g,6,8,5,c",
+    "pes": "6,l,f,x,5,i,2e,g,y,15,19,7,1,q,7,c,e,7,2,4,8,16,e,3u,25",
+    "pet": "7,5,16,s,4z,3,m,v,c,3,s,1,q,40,v,2l,1",
+    "peu": "3b,s",
+    "pey": "hr,7",
+    "pfe": "2x",
+    "pha": "z,1s,2k,2w,8,2y,3a,4d",
+    "phe": "al,1z",
+    "phi": "d5",
+    "phl": "5h",
+    "phn": "5k",
+    "pho": "2r,f0,e",
+    "phr": "bd",
+    "phu": "ao",
+    "phy": "35,1p,1s,2m,18,l,1a,u,5,1j,9,2x,r",
+    "pia": "l,33,5,x,9,1z,a,1c,2s,7r",
+    "pic": "5,t,1a,n,2,37,2,1a,1,i,5,3,6,1,5,2,m,h,1q,x,1,1,2,8,b,e,48,11",
+    "pid": "7q,3l,3i,3p,7",
+    "pie": "0,2,1,7,d,b,8,2,2,3,b,2,3,1,1,1,1,1,3,1,2,1,2,4,2,1,9,1,4,5,6,3,2,1,3,2,2,5,3,1,1,2,3,1,1,4,a,2,a,1,1,2,7,1,1,1,1,b,1,6,3,8,5,3,2,8,3,4,1,2,1,9,2,1,f,2,4,3,c,1,2,1,7,2,7,6,1,2,2,3,c,2,1,3,1,1,9,7,5,7,3,3,7,1,1,4,k,1,1,1,y,2,6,1,1,2,3,2,3,2,5,4,b,2,8,2,1,1,4,3,1,1,2,4,4,4,2,a,1,1,2,9,12,1,d,b,1,2,h,1,4,1,1,2,1,2,1,1,1,1,2,2,6,3,1,1,3,1,2,1,1,2,1,4,1,2,1,5",
+    "pig": "de,m",
+    "pil": "8g,11,1q,2m,l,4c,2",
+    "pim": "g,k,28,3h,96,j,6,m,6,7,1",
+    "pin": "g,k,2,26,f,7,c,c,a,j,3,b,2,y,1k,a,16,1b,1d,8,7,9,11,1,1,6,a,3,9,q,9,18,m,2",
+    "pio": "u,1m,f,4c,4,v,4,2h,n,4c,1h",
+    "pip": "4,2e,3g,1f,37,v,4z,j,f,7,1",
+    "pir": "2,7,c,7,h,4,2,c,c,3,s,2,7,5,1,a,4,g,q,4,9,2,2,a,6,o,1,b,3,6,1,h,8,2,1,2,r,7,5,1,5,8,d,13,2,1s,1x,1i,1,a,9,6,8,i,v,2,g",
+    "pis": "27,3u,9h,7",
+    "pit": "5j,46,2t,f,4q",
+    "piu": "2g,4v,v,7k,1h",
+    "pla": "2,2,3,3,g,3,4,3,b,5,5,3,1,2,1,1,1,3,1,2,2,4,3,2,1,1,3,1,1,1,1,1,1,2,1,2,1,5,3,1,1,1,4,1,2,1v,m,2,4,1,1,4,c,1,3,2,2,1,1,6,1,2,2,4,1,1,1,5,1,1,3,1,2,1,1,1,1,1,1,2,1,1,1,2,1,2,o,3,d,8,1,6,2,1,3,3,1,3,5,j,d,d,1,1,1,1,2,2,2,x,b,c,t,z,1b,e,v,5,3,1,1,2,3,1,1,2,1,1,1,1,1,1,1,1,1,2,2,2,1,3,1,2,1,1,7,2,1,6,4",
+    "ple": "1u,4,6,2,1,g,k,1,1,7,1,33,1u,20,8,2f,b,1,1x,7,21,w",
+    "pli": "4r,1f,3,a,80,1m,h,s,16,7",
+    "plo": "d6",
+    "pm)": "4t",
+    "pno": "1j,1,18,66,s",
+    "po\n": "a6",
+    "po ": "2a,6,3,b,1k,14,c,1q,4u,10,3i,1n",
+    "po,": "5x,3c,12",
+    "po.": "1k,9e,7u,8",
+    "poa": "5w,2i,4m",
+    "pob": "8g,ac",
+    "poc": "2r,3,p,7y,1y,1t,6,6,3,j,1",
+    "pod": "2b,38,1j,7t,20,a",
+    "pog": "j,d,7,2,m,d,y,7,6,d,t,1z,2x,n,e,4i,y,1,j,q,e,8",
+    "pol": "2a,4,4,n,2f,7,6,p,7,c,4,1g,b,1f,1,8,2p,9,2,t,17,1p,3,6,8",
+    "pom": "81,3r,1c",
+    "pon": "16,1p,1n,d,35,c,2o,6,2,b,1n,s,q,2e,v,r,6",
+    "pop": "47,7,c,l,7,11,9,2o,i,7,8,6,7,a,1w,1r,j,13,1d,8,14",
+    "por": "d,l,e,c,4,e,3,1,4,9,1,3,5,2,3,2,3,1,3,1,1,2,3,4,3,c,d,d,5,4,d,g,4,6,1,2,3,2,7,3,9,5,1,7,2,3,4,2,f,6,1,1,9,2,b,1,1,6,5,2,7,1,2,1,3,6,7,6,1,1,1,1,2,1,1,1,1,2,1,2,4,2,1,5,2,1,5,7,4,2,6,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,4,4,1,b,1,1,3,2,2,3,5,3,2,4,7,c,a,1,2,6,4,1,5,6,5,8,1,3,a,f,1,2,5,3,8,5,a,d,1,5,1,2,6,7,4,3,2,2,2,4,1,7,2,3,2,1,3",
+    "pos": "m,17,1,1,1,4,1,1,2,f,q,k,61,j,b",
+    "pot": "2,d,2,3,a,1,a,1,b,1,3,5,f,4,u,c,e,1,7,4,a,4,9,4,1,5,h,2,4,g,o,4,5,k,8,6,5,1,j,5,1,8,4,i,1,5,2,3,7,2,3,3,1,5,f,1o,2,4,2,6,5,2,2,3,4,1,2,1,2,1,b,2,b,j,6,a,o,1,9,4,9,6,1,8,8,9,11,j,1,4",
+    "pou": "ct,1",
+    "poy": "af,j,1,4,4d,2z,g,2,4,3,1,1,1",
+    "pp.": "6g,j,4,3w,2,3,6w,1,1",
+    "ppa": "36,3h,11,4w,4z",
+    "ppl": "ak",
+    "ppo": "3j,1s,9c,1j",
+    "pra": "d,57,dd",
+    "pre": "m,j,o,c,b,8,g,1,5,1,2,2,7,8,1,3,a,6,9,6,2,l,6,6,k,4,1,f,7,3,5,2,2,2,6,f,3,4,i,3,1,9,7,8,2,3,3,6,1,a,4,d,2,4,1,b,19,5,7,5,a,2,5,2,5,8,5,4,2,6,2,4,8,1e,5,a,4,3,u,6,j,1,e,2,g",
+    "pri": "1e,1n,6,x,y,a,h,4,y,c,1h,q,l,j,2b,15,v,t,k,21,1,y",
+    "pro": "0,2,1,1,4,2,7,6,1,7,1,2,4,4,1,b,6,1,1,3,1,1,1,1,1,3,1,2,1,1,1,3,1,2,1,9,1,4,7,1,1,2,2,1,2,1,2,1,2,2,2,1,2,1,2,1,1,2,3,1,1,6,a,b,1,2,2,5,1,3,3,8,1,6,3,d,1,1,1,2,4,4,3,1,1,2,1,1,2,6,3,2,1,1,7,2,6,1,1,2,1,4,4,4,3,2,2,3,4,2,4,1,1,1,5,1,3,2,1,2,4,4,3,1,2,1,4,2,f,4,1,3,1,3,3,2,1,7,1,1,4,1,1,2,6,1,7,2,1,1,1,1,1,3,q,1,1,1,1,1,3,3,1,1,2,2,6,5,2,9,6,2,2,5,1,2,1,1,3,1,3,1,1,2,4,4,4,2,1,1,1,7,1,1,1,1,6,2,1,1,1,1,1,1,1,1,1,1,2,2,7,3,1,1,1,1,2,5,2,2,1,2,1,2,4,1,1,2,1,6,4,1,1,1,1,1,6,5,3,1,1,4,1,1,2,1,2,1,2,1,4,4,2,3,1,1,3,1,1,1,1,1,1,2,4,1,1,1,1,3,2,2",
+    "pru": "2x,1e,96,1,1,1,c,1,6,h,u",
+    "ps ": "a5,7v,h",
+    "psa": "h1",
+    "pse": "bg",
+    "psi": "2s,1o,40,11,s,26,45,h,x,u",
+    "pso": "36,5e,t,5m",
+    "psu": "1c,8g",
+    "psy": "g7",
+    "pta": "9v,8e",
+    "pte": "hi",
+    "pti": "2,8,3,7,3,4,g,1,e,9,9,3,6,7,p,3,b,1,2,1,a,6,1,6,2,3,1,5,1,4,3,1,3,2,e,2,5,6,3,6,6,7,1,9,4,3,1,4,6,7,s,k,1,f,2d,12,17,e,7,7,3,5,1k,h,c,4,5,5,1,3,1,1,2,b",
+    "pto": "1r,1l,2i,k,g,p,1,6,1,p,7,1f,t,3u,27,d",
+    "ptu": "1r,1l,2i,10",
+    "puc": "19,2t,55",
+    "pud": "24",
+    "pue": "15,14,7,l,o,d,4,1z,1v,24,m,4,1p,9,4,2,f,29,7,r,3",
+    "pul": "9,o,2,d,7,r,e,1b,8,7,c,s,3,y,9,d,1b,9,r,a,2,6,7,8,6,7,a,1b,8,1,2,1,1,4,2,1,1,4,6,3,1,1w,13,1d,4,4,n,h",
+    "pum": "7",
+    "pun": "4f,l,7q,w,2f,1g,5,8,f",
+    "pur": "7,i,f,o,6,8,6,e,g,f,1e,7,4,3,7,13,d,6,1,4,c,1,1,5,6,6,e,k,9,g,3,1d,2,3,s,12,g,3,2h",
+    "pus": "s,91,1c,25,2,5j",
+    "put": "2b",
+    "pyr": "4o,8s,j,9",
+    "qi\n": "8g,ak",
+    "qi ": "is",
+    "qi)": "8g,ac",
+    "qua": "4a,75,e,e,z,3",
+    "que": "4,2,h,2,1,3,c,j,1,1,1,1,1,1,5,1,1,1,3,1,2,1,2,3,3,3,7,1,a,1,1,1,l,6,1,i,f,1,5,3,1,6,4,3,1,4,1,3,3,4,3,1,1,e,1,7,8,8,3,10,2,3,a,a,9,5,8,5,1,j,6,3,3,4,1,2,2,6,2,5,5,1,3,1,2,1,3,r,1,1,1,4,3,2,1,1,1,1,1,4,2,3,1,1,2,1,1,3,1,8,4,6,c,2,9,b,d,7,a,6,1,6,1,7,1,1,1,4,1,a,1,6,5,3,4,9,4,3,2,2,4,1,2,3,a,1,4,1,6,7,9,1,2",
+    "qui": "1s,e,1e,9,b,15,4,9,7,4,3,g,3,c,9,7,c,1e,2,1,a,4,5,6,n,r,a,2a,8,w,4,a,2h,s,n",
+    "quu": "a7,8x",
+    "r\na": "1k,f,c,1b,2k,v,c,1y,r,2,4,4,1,3,5,2,5,3,6,1f,a,h,v,n,2p,3,12",
+    "r\nc": "3b,s,92,4,1",
+    "r\nd": "1e,66,p,m",
+    "r\ne": "30,3j,x,a3",
+    "r\nf": "ce",
+    "r\ng": "8g",
+    "r\nh": "3f,3e,t,2t",
+    "r\ni": "81",
+    "r\nn": "33,57,1w,2u",
+    "r\np": "ib,r",
+    "r\nr": "3u,4k,1b,3n",
+    "r\ns": "83",
+    "r\nv": "4s",
+    "r (": "5k,2y",
+    "r a": "5,k,g,h,1,3,2,h,6,4,c,4,7,6,9,6,g,g,9,n,5,9,1,2,3,2,1,d,4,f,j,3,h,5,2,8,2,14,5,a,j,3,i,3,15,3,4,6,1,6,6,4,9,b,9,6,k,1,7,4,1,f,4,3,3,2,g,4,l,2,3,7,1,1,k,j",
+    "r b": "85,38",
+    "r c": "2g,12,1a,7,1t,1,i,3,35,9,1y,41,t,e",
+    "r d": "k,d,3,e,5,7,d,4,c,7,3,h,3,7,9,d,g,17,5,k,x,6,o,5,b,7,2,1,1,9,7,9,5,5,4,b,3,5,5,5,n,z,9,1,1,2,1,e,d,6,a,h,6,5,6,o,i,2,4,1,5,5,10,1,4,b,2,j,2,3,2,7",
+    "r e": "j,6,7,9,7,v,1,1,1,b,9,3,1,g,1,d,2,8,5,f,4,3,n,2,e,b,r,1,1,3,9,8,2,5,5,2,b,6,3,7,9,5,6,8,3,5,1,6,6,2,1,1,2,3,2,2,3,2,3,d,1,5,e,m,a,1,8,2,8,6,3,2,4,1,1,4,6,1,3,7,5,8,3,2,6,6,1,a,1,7,6,2,4,8,6,8,1,4,1,e,p,1,6,2,d,1,b,5,1,1,2,4,2,2,2,2,1",
+    "r f": "2o,2o,u,18,l,2k,2d,6a",
+    "r g": "8,r,17,dl,x,1p",
+    "r h": "a,1x,6,1s,o,o,5,b,b,o,u,r,7,s,7,b,s,1w,c,4q,8,6",
+    "r i": "31,6,j,b,u,1m,9,7,z,a,y,15,3,s,1h,u,e,s,3,5,8,1t,20",
+    "r j": "48,8p",
+    "r l": "9,6,4,2,3,o,9,3,i,1,3,c,2,5,5,6,1,3,7,3,2,2,2,3,1,3,4,a,3,1,3,5,1,b,2,1,9,d,d,3,2,3,4,3,1,2,4,4,1,1,3,2,5,3,1,1,1,3,1,3,1,4,5,1,1,1,4,2,2,3,2,1,8,2,1,1,1,1,1,3,1,1,6,3,6,1,1,3,1,7,1,2,1,2,5,9,2,1,1,1,1,3,1,3,1,2,1,2,3,h,1,8,p,1,8,2,9,3,2,6,2,5,4,b,p,4,2,2,2,1,3,3,1,j,g,4,2,1,1,1,k,2,5,2,1,1,5,1,1,2,5,4,8,g,9,2,2,1,2,2,1,4,1,5,6,1,1,1,6,1",
+    "r m": "1h,5,w,1g,1n,1s,s,2o,5,2f,15,f,1w,b,7,1a",
+    "r n": "3h,2n,g,j,c,1c,1f,g,x,4v,8,23",
+    "r o": "i,1c,z,3b,1d,1n,24,5e,1z",
+    "r p": "y,1,7,k,i,2,1,5,f,3,b,a,3,6,3,w,8,k,l,f,i,b,5,w,6,o,3,8,g,h,1,y,11,h,17,s,z,l,i,6,2,f,h,8,o,6",
+    "r q": "32,1t,63,5c",
+    "r r": "2l,d,2i,g,c,a,r,e,f,b,j,9,46,11,2m",
+    "r s": "y,2,16,4,4,9,1,3,5,5,5,1,3,1,1,2,3,4,3,1,b,d,d,3,2,4,d,g,4,6,1,2,3,2,7,3,9,5,1,7,2,1,2,4,2,l,1,1,6,3,d,1,1,6,7,7,3,n,1,1,2,2,1,1,2,2,3,4,3,7,1,6,5,3,2,2,6,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,4,5,b,2,7,3,8,2,4,7,c,j,4,1,5,b,f,7,g,2,8,n,5,3,b,9,7,4,3,2,2,2,4,8,2,5,1",
+    "r t": "6,3f,j,2o,3,1m,7q,2v,1",
+    "r u": "i,b,1d,3,g,8,s,p,1e,4,d,3,j,i,1i,t,1d,1j,2p,12,i,n,1b",
+    "r v": "4h,4b,9b",
+    "r y": "15,a,42,1c,a,c,8,r,8,1y,26,6,5,l,f,d,4,6,i,12,1b,3,8,5,14",
+    "r' ": "99",
+    "r) ": "5k",
+    "r),": "8i",
+    "r, ": "1b,5,36,60,1,2m,4,38,u,1o",
+    "r-a": "b4",
+    "r. ": "1o,1n,4v,2,1l,3d,q,1,18,2,1u",
+    "ra\n": "h,18,3,4d,2,e,1,w,3,1,3,d,3,9,3,8,2j,1v,9,a,2,d,v,3,1,f,1,2,5,d,5",
+    "ra ": "2,3,3,3,3,1,1,2,2,3,1,4,5,2,1,1,1,4,1,1,1,1,1,3,3,1,2,1,2,2,2,5,1,2,1,2,1,3,1,2,1,3,1,1,1,2,2,1,1,1,2,1,1,2,1,1,2,1,1,1,1,2,1,2,1,1,1,1,1,1,2,1,1,1,1,1,1,2,1,1,2,1,1,1,1,1,3,3,1,2,1,2,1,1,1,1,1,1,1,2,1,3,2,1,1,3,1,1,1,1,2,1,1,1,1,1,1,1,1,2,2,4,1,2,1,1,1,1,1,1,2,2,2,2,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,2,1,2,1,1,2,2,1,1,1,1,1,2,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,2,1,1,1,4,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,5,1,1,4,1,1,1,1,1,2,1,1,1,2,2,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,1,2,1,1,1,1,4,3,5,3,1,2,1,1,1,2,2,3,3,4,1,9,h,3,1,1,1,1,1,1,1,2,2,1,1,2,1,1,1,1,1,1,1,2,1,1,1,1,1,1,2,1,2,1,1,1,1,1,1,1,1,2,3,2,1,2,3,5,5,1,2,1,1,1,5,1,1,1,2,1,1,3,1,3,2,1,2,1,1,1,2,1,1,1,1,2,5,1,2,1,1,2,1,1,4,1,1,1,6,1,1,1,2,3,1,1,2,1,2,3,2,3,2,1,3,1,2,1,2,3,3,1,1,1,2,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,2,3,2,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1",
+    "ra,": "30,2v,35,1t,1y,a,9,l,z,9,2k,5",
+    "ra.": "1p,3n,74,q,4,2,d,f,6",
+    "rab": "2w,t,j,1,3q,8,1,10,p,3m,2q",
+    "rac": "c,1d,a,4,1,7,g,2,n,1b,3,b,3,2,2,7,1,5,l,1,f,3,8,a,o,9,2,5,8,1,9,6,3,o,2m,1,4,i,d,9,f,6,e,4,1,7,2,x,1,9,1,6,d,5,h,i,g,9,e,6,1,1",
+    "rad": "s,7,1,9,g,3,9,f,3,7,3,9,2,2,1,c,4,4,4,5,2,a,1,5,4,1,5,9,3,1,c,2,8,2,2,1,a,8,4,8,3,3,4,4,1,3,6,5,1,c,1,7,b,4,1,5,2,1,4,5,4,4,2,1,a,d,1,2,1,3,3,2,3,2,2,3,8,1,1,1,7,5,3,3,6,r,4,1,d,2,9,4,5,4,5,1,3,5,8,5,3,1,1,7,2,3,3,4,1,e,5,4,3,3,7,7,1,5,1,6,f,o,4,1,4,5,5,6,1,1,3,1,1,1,2,4,1,3,1,1,1,4,1,1,2,1,3,1",
+    "rae": "w,26,r,3,8,1x,f,r,2u,5x,k,18",
+    "rag": "c,o,a,6,k,m,1j,x,g,f,b,4,18,18,2,c,c,5,1n,18,19,6,h,3,3,1w,o,j,w,b,1,b",
+    "rah": "j2",
+    "rai": "14,14,a,1x,k,e,c,1,9,5,5,4,1,9,q,6,1,1,1,2,1,1,2,3,1,2,1,1,2,1,1,1,1,1,3,6,1,1,2,1,2,1,1,v,3b,24,3b,8,a,5",
+    "raj": "1a,7w",
+    "ral": "a,7,3,4,4,3,1,9,4,3,i,5,9,6,4,8,s,7,4,8,1,3,d,1,2,3,e,2,8,h,1,d,1,2,1,3,4,8,3,1,1,1,5,2,3,5,7,3,2,4,2,3,a,7,c,7,8,3,m,1,3,6,1,3,1,1,3,1,3,2,2,1,2,4,3,3,2,2,1,6,2,1,6,4,10,2,3,1,2,5,1,4,7,4,2,2,3,1,5,a,a,2,3,3,9,c,9,2,4,2,3,e,e,8,6,1,3,5,4,6,a,2,g,3,2,3,7,3,1,3,2,1,5,2,6,1",
+    "ram": "1g,15,2o,7,5,2j,8,a,11,l,z,1a,3,9,9,9,f,m,4,a,d,1,1",
+    "ran": "2,7,2,3,2,5,1,3,1,2,5,8,4,1,2,a,1,4,3,1,6,4,1,4,4,a,5,5,2,8,4,b,1,1,2,8,1,7,1,2,5,2,4,1,3,4,2,3,3,1,1,8,3,3,2,1,3,1,2,4,4,3,8,2,6,1,1,5,1,2,3,3,5,d,2,1,2,1,8,1,1,1,1,7,2,1,i,2,5,2,3,4,2,2,1,3,1,4,3,7,1,1,3,3,15,5,4,9,j,2,9,4,4,1,1,3,1,5,a,5,7,1,6,5,5,5,5,1,a,h,1,1,l,1,2,6,5,2,1,1,5,1,1,2,5,3,1,2,5,5,1,4,2,6,2,1,6,3,1,5,7,4,9,c,2,1,a",
+    "rap": "3o,5,x,28,a,w,2,1,34,7,77",
+    "rar": "f,a,1l,1,5,3,n,c,d,3,7,3,6,t,x,7,1,2,3,4,6,4,1,4,1,c,2,4,6,2,6,5,d,4,4,2,6,f,8,5,g,3,4,7,z,1h,1h,4,7,1s,3,9,7,j,5,b,b,3,4,5,1,a,1,1,3,6",
+    "ras": "5,5,3,f,1,4,2,4,p,9,g,c,1,1,9,7,s,2,6,2,2,6,7,2,e,a,2,2,b,a,1,k,4,g,b,5,1,b,4,6,3,o,d,1,f,i,7,d,9,3,18,4,2,5,7,a,a,6,9,1,d,t,2,1,1,2,1,1,3,1,3,2,8,2,4,g,q,n,4,2,1,8,6,5,b",
+    "rat": "2,5,2,c,4,3,6,2,3,6,4,a,1,1,2,1,1,5,4,1,3,1,f,d,1,4,2,1,2,3,7,2,1,1,3,1,1,1,1,1,6,3,3,3,2,b,4,1,5,2,1,1,5,2,5,1,8,2,6,5,1,3,4,2,4,5,1,4,3,4,2,1,3,6,1,4,a,1,1,1,1,4,2,1,4,6,5,1,2,3,3,1,b,5,1,1,1,3,6,4,8,3,g,2,7,a,i,2,3,x,4,8,2,6,5,4,8,5,7,3,5,1,5,6,6,5,2,3,2,3,3,d,8,f,3,6,2,8,9,6,8,1,f,2,1,4,3,4,3,1,1,1,1,6,6,2,a,3,2,1",
+    "rau": "46",
+    "rav": "8,10,d,u,1,3,4r,1,3,1,r,1c,68,6,1,13,7",
+    "rax": "1y,1m,3g,p",
+    "ray": "5o",
+    "raz": "3u,y,m,1,3t,h,6,2m,2,e,k,7,8,1,c,n,e,4,1,1,7,1u",
+    "rba": "0,3,2,1,5,e,9,1,1,1,2,1,7,1,b,2,4,l,3,h,10,17,7,8,d,6,9,9,7,4,1,3,2,8,8,9,3,l,b,12,8,3e,x,e,8,2o,q,n,1,2,1,4",
+    "rbe": "1b,42,c,3x,5e,2,7",
+    "rbi": "di,1t,2u",
+    "rbo": "14,1j,8,8,2,6,1,2,2,1,1,2,a,3,4,1,3,8,5,g,6,a,g,5,3,6,1,3,1,7,a,5,2,7,8,e,i,2,7,4h,5,3,2,12,13,2m,l,1,1,e,4",
+    "rbu": "1,27,b,d,3,z,4,i,5,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,3,1,4,1,1,9,7,8,1,d,1j,5,1q,11,2o,4,a,c,3g,g",
+    "rca": "2y,7x,2s",
+    "rce": "2c,1d,i,8m",
+    "rch": "q,36,3x,27,s",
+    "rci": "78,2r,30,3,1,26,8,b,i,4,15",
+    "rco": "2e",
+    "rct": "36,1o,1t,11,75",
+    "rcu": "h,1,18,9,d,y,8,1,3,4,5,1,1,s,2,1e,g,6,a,h,h,2,7,1,2,1,1,1,5,3,v,a,q,12,10,3n,d,1,3,6,8,4,7,18,3,c,9",
+    "rda": "l,m,q,19,8,23,16,11,19,29,1,1m,b,2p,m,12",
+    "rde": "28,10,3h,3q,j,b,6,1q,n,3,3l",
+    "rdi": "1m,g,1,9,1i,w,2,e,1,7,1,1e,e,9,4,1o,4,d,6,1,7,u,3,1i,8,a,c,a,2,d,1,7,n,a,1,1,7,1,2,3,2,e,7,19,12,i,2",
+    "rdo": "1c,45,4b,u,4z,2m",
+    "rdy": "a5,8c",
+    "re\n": "ch,5,62,1,3,b",
+    "re ": "j,3,9,w,f,m,5,1,c,g,1,e,7,n,4,c,1,s,f,6,g,z,9,2,b,b,a,8,h,1,7,e,5,2q,7,7,e,q,1,1,g,10,1,d,5,o,2,m,e,1,1,5",
+    "re\"": "8k",
+    "re,": "12,62,e,6,u,r,1i,3l,1m,1,14",
+    "re.": "w,7,c,1q,a,d,l,w,1u,16,13,5,11,r,1b,k,1,3,19,5,9,j,14,14,8",
+    "rea": "r,9,e,8,q,3,1v,2,4,11,e,1c,g,1h,7,l,5,d,i,2a,f,7,3,3,d,9,6,12,f,v,a",
+    "reb": "15,u,1j,2y,l,q,i,g,1j,i,1x,3,d,16,16,s,9,24,3,c,3,6",
+    "rec": "w,t,n,2,a,1,4,9,6,2,1,2,7,1b,8,3,b,1,4,5,11,b,3,5,4,2,1a,18,7,1,5,b,2,2,1,3,1,b,3,4,1,2,x,3,1,3,8,9,2,e,g,g,1,1d,6,k,3,3,g,e,6,b,d,5,7,1,d,2,3",
+    "red": "18,u,7,5,2,4,a,21,19,18,q,b,q,z,1,4,6,1,1,2,5,6,1n,1,6,i,1,6,4,4,1o,d,r,n,1c,1,3,1,1,6,1,1,1,7,2,1,3,1,2",
+    "ree": "j5",
+    "ref": "4,l,12,3p,3f,e,e,15,u,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,5,4,3,1,2,2,5,4,4,3,f,31,q,8,4,1,14",
+    "reg": "3,7,9,d,9,b,1,4,4,3,9,7,l,1,l,d,2,r,8,c,8,9,7,x,c,c,1,6,5,b,4,4,5,3,1,3,3,3,p,1,3,5,9,6,2,c,m,1h,4,2,1,1,5,7,a,1,4,6,c,7,5,h,1,j,x,6,d,e,d,8,i,c,9,8",
+    "reh": "8h",
+    "rei": "4a,6,5m,i,b,1k,16,d,d,9,6,3q",
+    "rej": "7,k,v,8v,72,s,s,3",
+    "rel": "0,9,e,o,9,4,6,2,1,9,7,8,4,p,a,6,5,r,v,1d,6,4,5,9,v,b,1,1,s,14,1,7,1i,1,b,2w,x,3,4,1z,2",
+    "rem": "g,c,e,6,2,6,n,d,13,n,6,6,2,5,1,9,1,4,a,4,7,1,11,b,4,1,2,p,4,r,2,2,2,8,3,2,3,a,1,4,3,9,10,2,5,4,13,3,1,m,2,2,3,2,4,4,6,a,2,d,n,8,3,e,4,2,u,9,4,4,8,u",
+    "ren": "1t,c,2,1,h,e,j,13,6,b,h,11,11,d,l,d,a,8,5,7,b,f,26,u,y,z,l,5,12,o,d,4,3,5,1,a,2,6,2",
+    "reo": "i,k,4g,d3",
+    "rep": "2b,5,6,e,v,3,a,6,9,c,1d,3,4,c,i,1i,2g,1m,b,8,o,6,3z,5,d,3,2,6,1,3",
+    "rer": "4u,13,bz",
+    "res": "2,2,5,c,1,6,5,4,4,2,2,4,a,4,2,3,14,1,4,2,3,2,2,1,5,2,1,4,3,2,2,9,1,p,1,3,1,1,1,b,1,5,3,3,1,1,1,1,4,2,7,1,5,1,3,1,5,4,2,2,1,1,1,k,1,1,1,1,3,1,2,2,1,6,2,1,6,5,7,2,1,1,1,2,1,1,1,2,2,1,1,1,1,1,1,2,1,1,1,2,1,4,1,2,2,2,2,1,1,3,2,3,2,1,f,2,d,7,3,3,3,1,3,x,2,1,2,4,3,4,1,a,2,4,4,7,3,2,3,1,5,2,1,5,2,1,3,1,2,9,2,3,1,p,2,6,4,4,2,a,2,2,3,2,6,2,1,5,2,2,6,8,3,1,1,4,2,3,1,1,4,2,1,1,1,2,1,1,1,1,1,1,1,6,4,2,2,1,1,3,1,3,1,1",
+    "ret": "7,7,b,5,k,1,d,5,1,2,3,1,1,1,1,4,1,1,3,8,a,3,a,2,1,6,1,i,a,b,6,2,1,1,1,1,3,1,1,5,2,3,1,c,1,j,6,5,8,4,1,3,1,2,4,1,7,2,4,1,4,2,1,2,1,5,1,1,1,6,2,5,b,1,1,8,1,4,1,2,1,1,2,e,4,2,a,4,v,4,3,3,s,1,k,7,9,2,1,1,2,5,3,3,2,1,1,6,1,1,1,1,2,3,2,1,1,1,1,3,4,1,2,4,1,s,c,7,2,w,3,g,1a",
+    "reu": "2y,1z,6,s,1,3,21,k,24,1u,55,6",
+    "rev": "25,z,1r,l,11,16,1h,h,6,42,j,3,1,8,30",
+    "rex": "2w,fb,1",
+    "rey": "aw,1p",
+    "rez": "53,8b,5,g",
+    "rfi": "88",
+    "rfl": "9o",
+    "rfo": "1t,53",
+    "rfu": "78",
+    "rga": "p,c,3,3,5,u,4,7,6,3,h,j,j,11,a,14,2,m,d,5,4,1c,c,6,9,12,2,3,j,z,1,w,l,3b,a,11,9",
+    "rge": "20,8,1y,c,19,5,h,1x,2,2,7,2q,2c",
+    "rgi": "v,s,m,l,1x,5,1e,1,2,1,1c,1,l,4,a,1f,7,28,1,9,4,5,8,1,2,4,i,5,n,6,b,8,4,1,d,b,14,f,f,2,7,1,1,9,8,1",
+    "rgo": "1i,2m,i,1k,u,c,d,3,6,10,k,8,a,1",
+    "rha": "14,47,c,27,6t",
+    "rhe": "14,6q",
+    "rhi": "7l,p,8z,1o",
+    "rho": "79,58,5i,d",
+    "rhu": "h8",
+    "ria": "1,1,1,3,3,1,7,4,7,6,2,1,1,1,2,2,1,1,1,3,2,1,4,3,1,1,1,1,3,5,2,1,3,2,4,7,2,3,4,2,4,2,4,3,1,2,3,3,1,2,5,2,2,3,4,3,3,2,1,1,a,2,6,5,4,2,1,1,1,2,6,4,8,f,2,2,1,1,1,3,3,1,1,1,1,1,2,1,2,1,1,2,3,4,2,5,7,2,1,3,1,1,1,3,1,2,1,1,4,1,1,1,1,1,3,2,1,2,4,1,1,1,2,1,2,1,1,2,2,1,5,1,1,1,1,1,1,2,1,3,1,1,1,1,2,1,1,2,1,2,2,1,2,4,a,2,6,2,4,1,9,2,1,2,9,1,6,u,1,3,1,1,3,2,1,1,1,2,1,1,2,3,2,1,3,2,2,a,3,4,1,1,1,2,4,3,3,2,5,1,4,1,1,2,6,1,2,1,1,1,1,1,2,5,2,2,1,1,3,4,1,5,1,3,1,1,3,2,1,2,2,1,6,3,8,3,3,1,1,1,2,4,3,3,2,a,3,1,1,1,1,4,2,1,1,2,1,1,1,2,1,1,1,2,1,1,2,1,1,1,1,1,2,2,3,3,3,2,3,3,3",
+    "rib": "26,p,21,q,2a,f,2e,4,1v,16,a,1,1,4,8,9,7,2x,5,t,e",
+    "ric": "7,6,l,b,1,3,b,5,2,9,2,2,3,1,9,1,4,6,5,3,4,9,2,3,4,8,f,4,1,6,3,4,1,f,2,1,2,9,1,3,9,9,1,1,4,2,1,2,2,4,2,1,1,5,1,4,a,7,5,3,1,4,1,2,1,1,3,1,1,1,1,2,7,5,c,4,7,8,6,2,5,8,6,5,2,8,2,4,1,1,1,1,1,4,1,1,1,1,4,3,2,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,2,1,3,3,1,2,1,3,1,3,1,1,1,1,2,1,2,1,4,1,1,2,1,1,1,1,1,2,1,1,3,1,1,1,2,1,1,1,3,4,3,5,1,3,1,3,3,2,1,1,2,5,3,2,1,1,2,1,1,1,3,1,b,1,1,2,3,2,1,2,9,o,1,4,3,1,6,3,f,2,i,1,3,2,1,1,8",
+    "rid": "24,9,s,10,i,k,a,5,9,2,b,o,11,1d,d,t,7,h,c,11,5,2,j,1w,1,1,2c,7,8,6,l",
+    "rie": "12,x,1,6,4,4,f,2i,3,v,3,12,s,2,s,c,o,k,b,1,5,e,2,11,i,3,t,1,5,c,g,y,m,1m,p,g",
+    "rif": "j,6,e,4,3,2h,d,8,1,m,5,2,3,1,d,7,c,v,n,17,6,4,1,3,3,h,8,3,2s,c,10,5,1a,31",
+    "rig": "3,8,6,f,15,7,a,9,6,2,3,3,6,2,3,q,u,s,2,b,f,a,8,l,1c,a,8,8,4,2v,2,6,6,1t,a,t,d,7,d,4,18,b,7,1",
+    "rik": "a9",
+    "ril": "1n,3c,b,2,3,c,b,3,1a,15,6,1,f,8,g,1f,7,1r,e,12,3x",
+    "rim": "11,31,2,18,h,4,y,21,i,2w,i,h,p,1o,2l,1",
+    "rin": "1,z,1,3,5,5,1,d,d,w,2,4,2,1,3,4,5,4,2,3,1,1,1,b,1,2,3,1,4,3,1,1,2,3,1,2,1,3,1,1,4,2,4,1,2,5,2,1,1,1,3,8,1,4,b,3,6,1,4,5,3,4,1,k,2,u,5,e,4,1,3,3,h,7,c,h,7,7,3,1,8,q,7,7,3,4,2,e,5,5,2,1,1,1,1,2,1,4,3,1,2,2,3,1,5,1,1,2,2,3,1,3,3,1,1,f,n,2,5,i,h,a,15,h,1",
+    "rio": "7,a,1,b,2,3,8,8,e,2,7,2,2,2,1,9,4,1,9,2,2,1,3,4,3,1,1,1,3,1,2,1,1,1,3,1,5,1,1,2,1,5,1,3,5,6,3,2,2,1,2,1,1,1,1,2,3,1,3,5,1,3,1,5,6,2,1,1,2,1,2,1,2,2,1,2,8,1,1,1,7,1,2,7,7,a,b,2,4,5,2,5,8,5,8,f,a,6,1,3,3,4,1,4,2,5,5,1,1,1,3,3,1,a,4,9,4,r,1,1,1,1,2,1,1,1,1,1,3,4,2,1,3,2,4,1,2,2,4,7,4,4,1,4,2,5,1,1,5,2,5,2,3,5,5,7,6,n,3,4,a,3,1,1,2,1,1,5,3,2,3,1,1,2,2,1,1,1,2,2,3,3,1,1,6,1,1,2,o,1,4,1,1,3,3,1,3,2,1,3",
+    "rip": "27,2x,1e,15,19,8,b,e,1,4j,6",
+    "rir": "2t,4j,y,4,3,1,3v,1k",
+    "ris": "2,5,i,o,4,e,g,w,g,1g,2,3,h,z,5,4,e,r,10,7,5,7,12,b,7,5,6,15,1j,6,l,5,2,1e,e,a,1r,c",
+    "rit": "4,3,u,x,4,1,5,2,7,4,2,g,4,a,d,c,3,1,1,l,m,g,1,8,d,g,q,5,5,1,9,1,1,2,7,1,3,d,8,1,e,9,x,1,1,2,6,9,1,3,1,12,6,1,1,1,4,2,3,7,d,e,8,i,5,e,1,1,2,2,a,9,3,1,1,t,a,5,f,r,7,2,4,8",
+    "riu": "5f,4m,i,7,2n",
+    "riv": "85,2z,5g",
+    "rix": "47,91",
+    "riz": "n,l,h,7,j,5,k,11,i,3,1,b,9,6,c,4,4,2,5,d,a,1,j,1,1,1,5,7,3,e,8,8,j,8,5,10,p,4,w,1,i,3,1m,3,2y,3,4,1,2,1,5,1,j,2,c,1",
+    "rk'": "5l",
+    "rla": "b5,6z,r",
+    "rli": "5e",
+    "rlo": "8c",
+    "rma": "3t,4f,e,m,3,g,4,1,1,5,i,5,6,a,d,z,11,f,15,7,y,1h,7,2,4,3,c",
+    "rme": "h,1a,27,4j,5,2m,1n,j,6,1d,a,25,17",
+    "rmi": "0,1,3,1,1,2,1,3,2,1,1,4,1,8,1,5,3,5,4,6,1,4,o,5,9,k,2,p,g,a,8,8,d,17,2,b,3,5,1,1,h,4,m,h,10,a,15,1a,25,w,1,1,1,1,1,1,1,6,a,2,1,8,1,2,1,5,3,4,2,1,3,1,1,3,5",
+    "rmo": "a,9,48,2,t,24,9,i,7,w,e,19,5,1m,s,4s",
+    "rmu": "hf",
+    "rna": "w,16,t,j,w,q,6,1,3,2,j,k,p,6,1p,b,e,3,1m,3,2d,g,5,1b,8,1,k,1,8,14,11",
+    "rne": "59,j,8u,47",
+    "rni": "41,4z,3,27,2,3n,5",
+    "rno": "5,2r,10,w,f,1,1,1,7,1,3,2,k,l,r,a,o,4t,p,1y,1s,6,1",
+    "rnu": "59,1,b,2,54,3v",
+    "ro\n": "b2",
+    "ro ": "c,m,6,h,1,7,2,g,5,p,5,e,9,x,2,a,1,1,2,5,t,e,k,8,r,1q,1,z,d,1,5,16,1,8,5,d,u,4,2,3,f,1,4,1,8,h,6,8,6,l,h,2,2",
+    "ro)": "ds,7,26,l,o",
+    "ro,": "87,h,4a,8,t,z,44,6",
+    "ro.": "bi,1w,2w",
+    "roa": "2m,8b,53",
+    "rob": "3,1,4,b,5,2,c,4,1,b,5,4,e,1,1,s,1,9,a,3,4,2,3,1,e,h,8,6,8,c,6,6,2,3,c,5,6,1,3,l,6,4,1,3,1,2,i,2,d,h,4,h,s,4,9,4,9,k,b,4,8,h,15,f,b,1,2,s,2,d,6,1,6,2,7,2,5,1,3,6,8,h,8,c,c",
+    "roc": "m,9,1f,2l,1e,26,8,1a,4r,2,1r,1w,i,5",
+    "rod": "m,5,5,f,e,m,1s,1h,8,8,1a,x,n,13,8,b,7,6,i,2,5,t,a,d,2n,c,1,j,1,9,d,8,1h,d",
+    "rof": "ay,j",
+    "rog": "1j,3a,3k,b,12,1v",
+    "roh": "5k",
+    "roi": "1o,1b,k,3,1e,5z,4,1y,1d,15,n,2y",
+    "roj": "4v,e,h,i,1u,t,26,1,2,1,1p,4,d,j,c,i,3,f,1e,2b",
+    "rol": "2r,2n,5,1j,1t,18,b,3,5,1p,4,2,6,a,8,1,1,2,1,4,1,9,c,2,f,q,1,6,6,3,b,1,8,11,e,8",
+    "rom": "0,1,j,3,g,8,f,1k,e,11,1,3,4,4,4,e,3,2,4,6,3,1,2,h,4,1,1,6,1,4,3,3,2,6,1,c,4,t,2,1,5,t,7,h,c,d,b,y,f,8,1,2,1,4,18,7,e,d,f,4,b,4,1,8,8,4,l,x,6,2,6,5,1,3",
+    "ron": "h,7,21,b,1k,8,6,2,1j,1u,o,d,f,b,2,n,3,3,4,l,1e,15,e,1l,1g,8,u",
+    "roo": "2t",
+    "rop": "0,2,1,7,o,8,3,f,2,3,1,1,1,1,1,3,1,2,1,2,1,3,2,1,9,1,4,3,8,3,2,1,3,2,1,1,2,3,3,1,1,6,1,a,6,b,1,9,1,3,6,6,9,i,1,7,3,4,1,3,9,2,1,1,7,8,1,j,4,7,2,1,3,4,4,1,3,2,3,9,3,2,5,2,5,d,2,3,4,3,3,7,1,1,4,2,f,3,1,1,w,1,1,2,1,6,1,1,2,8,5,2,5,2,a,8,2,1,1,4,3,1,1,6,4,4,c,1,3,1,7,4,2,2,t,2,1,d,b,1,2,h,1,4,1,1,2,1,2,1,2,5,6,1,2,1,1,3,1,2,2,3,4,1,2,4,2",
+    "roq": "5i",
+    "ros": "1,6,1,r,1l,1,7,c,1,5,n,s,7,a,2,3,4,1,4,9,4,a,6,7,2,5,4,r,m,1,1,1,1,1,8,1,7,24,27,k,6,5,5,1,1,6,6,5,3,1,7,d,2,4,1c,2,o,2,3,4,3,7,a,d",
+    "rot": "h,2g,8,6,7,l,2,1x,3,3,9,4,1,f,f,2,2,1,4,c,1,1,e,1,2,5,d,7,a,g,3,4,1,3,4,1,7,9,2,e,a,r,1,1,5,3,4,d,8,3,6,2,2,5,8,8,g,a,1,7,3,2,1,2,1,2,1,4,c,1,1,2,5,f,i,c,x,5,3,3,d",
+    "rov": "2e,n,65,4e",
+    "row": "9n,8h",
+    "roy": "be",
+    "roz": "bl",
+    "rpa": "dx",
+    "rpe": "6a,8i",
+    "rph": "2r,8a",
+    "rpo": "1k,3b,2p,1p,12,n,1g,10,1a,28,1n,9,8",
+    "rpr": "g2",
+    "rpu": "2c,4v,g,1h,s,3e,2",
+    "rra": "10,a,6,16,2,21,4,5,3,1,c,3,3,3,1,9,4,q,q,r,2,w,c,5,1n,34,6,3a,11,3",
+    "rre": "10,1f,j,1c,2,4,f,2,p,9,4,21,k,2p,3,9,u,16,7,3,3,d,3,6,6,1h,2q,a",
+    "rrh": "7l,p,47,4s,1o",
+    "rri": "11,1m,k,12,q,2f,h,p,i,9,1u,5s,1y",
+    "rro": "1v,1o,3,o,q,4n,1c,3,1,6,5,7,z,e,6,1a,t,v,4",
+    "rru": "4h,dm",
+    "rry": "f3,1,1,1,1",
+    "rsa": "9i,35,h,4l,u",
+    "rse": "14,10,8x,4,6d",
+    "rsi": "y,3w,i,4w,39,f,1,w,a",
+    "rso": "1p,3,h,l,9,a,g,3a,6a,11,2a",
+    "rsy": "5c",
+    "rta": "d,g,n,a,i,1,c,a,8,29,l,a,o,g,9,c,j,1,6,r,6,4,f,2,7,2,v,1a,2,5,7,3,v,c,6,3,1,9,f,e,3,o,1d,8,g,6,1,2,5,2,1,1,8,1,2,1",
+    "rte": "3,9,t,c,1,4,g,1,5,2,7,6,8,h,1,2,b,4,1,1,4,4,8,3,8,4,e,4,6,6,2,3,3,c,1,x,9,2,9,5,4,3,3,3,q,e,3,7,1d,c,a,y,5,7,4,8,3,2,d,a,6,u,4,2,29,1d,7,a",
+    "rth": "5w,3p,1c,4m,2j",
+    "rti": "25,6,8,3,o,a,1c,1l,p,k,c,1d,1z,7,28,c,9,k,3,p,2s,2,n,1",
+    "rto": "51,1,m,7,1,3,1,g,1k,1z,s,2j,2,e",
+    "rtr": "23,i,3e,8,1t,7q,1h,1k",
+    "rtu": "51,n",
+    "rua": "1g,1,4,u,2e,c,g,1,1s,14,12,e,2v,x,4s,o",
+    "rub": "x,o,12,4r,l,5r,2,2,1,b,9,1,b,3,9,1,1,k,u",
+    "ruc": "i5",
+    "rud": "16,f,y,4v,62,n",
+    "rue": "di,4j",
+    "ruf": "ac,h",
+    "rug": "4h,dm",
+    "rui": "14,6q",
+    "ruj": "83,5,e,2o,1u,14",
+    "rul": "ax,55,19",
+    "rum": "6,d,l,1a,1b,17,b,2n,2z,1g,r,u,b,1,c,7,2,7,q,6,2,g,2,a,2,n,b,r",
+    "run": "4b,96,1,1,1,c,1,6,h,u",
+    "rup": "2g,6g",
+    "rur": "2x",
+    "rus": "9,3f,b,k,2,1,2,9,3,2x,2,a,p,1h,9,h,b,6,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,w,2,8,s,2k,i,1l",
+    "rut": "1l,2,i,e,1f,h,3,6,8,2,9,1,3,1,2,2,d,9,4,4,7,5,s,44,4,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,3,2,6,2,1,2,1,1,6,3,1,1,2,1,3,1,2,1,1,1,1,1,1,2,1,1,1,9,1,8,3,4,4,c,i,1o,13",
+    "rva": "5b,8,c,17,bf",
+    "rve": "1s,15,2w,s,1,9,w,1z,3m,47,s,4,5,2,4,b,1,1,3,1",
+    "rvi": "o,2,3,a,8,2b,10,6,e,e,8,n,d,h,a,8,6,w,1,3,1,1,1,8,a,4,3,5,c,z,8,3u,6,j,p,e,p,m,j,3,5,1",
+    "ry.": "f3,2",
+    "rya": "dy,1m",
+    "ryl": "3v,a6,1f",
+    "ryn": "2t,7t",
+    "ryo": "98",
+    "rys": "99,32",
+    "ryt": "a1",
+    "ryx": "hi",
+    "rza": "4z,h,34,32,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,5,4,3,3,2,5,4,4,h,z,3h,q,3",
+    "rzo": "as,3o",
+    "s\na": "7,5i,2n,2z,1u,3l,1z",
+    "s\nd": "80,3b",
+    "s\nf": "b6,2,d,75",
+    "s\nm": "ci,5,5p,3,1,2,4,1,b,7",
+    "s\np": "ie,5,8",
+    "s\nr": "88,43,4,6h",
+    "s\ns": "8l,4r",
+    "s (": "2z,24,b,22,l,1u,66,p,r",
+    "s a": "2,1,7,e,4,e,c,3,5,3,2,a,2,2,2,2,5,1,1,3,1,f,2,4,9,2,3,2,1,5,1,1,1,2,8,3,3,8,2,3,4,1,2,2,2,9,3,1,4,4,3,1,6,5,3,8,k,a,7,b,7,4,d,4,5,a,1,1,5,2,1,5,3,1,2,7,2,2,8,1,2,4,9,8,1,4,l,1,1,w,2,5,4,1,6,4,1,3,1,4,4,1,7,1,2,3,6,3,3,1,3,2,6,4,4,2,a,1,3,6,5,2,2,5,2,2,b,3,5,5,1,7,1,f,1,c,3,a,4,2,1,2,3,2,6,3,1,1,2,1,1,4,3,d,4",
+    "s b": "14,19,o,8,2,6,c,a,s,2,a,1m,1x,1,2,1,2,1g,c,1,b,r,15,w,l,g,2,4,1,1b,p,8,2,s,c",
+    "s c": "h,8,c,f,9,2,1,9,1,3,2,1,4,2,1,2,1,1,1,1,5,2,2,1,9,2,2,e,3,j,5,4,7,4,5,1,2,1,c,1,4,1,5,a,l,g,b,c,6,2,3,3,3,5,3,3,3,7,2,4,1,6,4,2,1,3,3,7,3,3,3,3,7,3,3,8,5,3,1,1,2,b,7,1,3,e,2,c,1,4,2,1,5,6,8,4,9,4,7,6,5,4,2,3,3,2,1,3,f,2,a,5,5,5,2,6,1,1,5,b,1,4,1,b,4,1,2,5,3,2,5,a,2,2,2,1,2,2,5,m,4,1,9",
+    "s d": "0,4,1,3,a,1,5,a,4,5,b,6,1,1,2,2,2,9,1,1,1,5,2,2,5,2,6,1,1,3,1,1,2,1,2,9,3,1,2,2,2,1,2,1,2,2,1,1,2,2,3,2,1,2,2,1,2,2,2,1,2,4,2,1,1,4,6,2,6,4,1,4,1,7,1,6,2,9,6,5,3,2,2,3,6,a,b,3,1,1,2,2,7,1,7,1,6,1,4,3,1,1,4,7,1,3,1,2,2,3,4,1,2,2,1,1,3,2,1,1,1,2,2,1,3,7,1,3,4,1,3,8,1,4,a,2,1,2,t,4,5,2,3,6,4,3,2,2,7,2,3,1,7,4,1,2,3,2,4,3,2,1,1,2,4,2,3,5,6,a,1,1,1,2,5,4,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,2,1,1,1,1,1,3,1,3,3,4,2,1,4,1,5,1,2,1,3,2,1,1,3,8,2,a,2,6,3,5,4,5,5,2,5,2,2,2",
+    "s e": "1,4,j,7,6,9,4,9,1,1,3,4,1,8,3,3,1,1,2,1,3,2,3,5,1,2,9,2,1,c,e,2,b,7,e,7,5,1,2,3,2,4,8,a,d,7,1,6,1,9,4,5,j,x,4,7,1,2,7,2,6,2,9,2,1,6,b,6,8,1,6,1w,h,9,f,3,a,7,3,8,2,1,4,6,1,3,1,2,1,2,3,1,7,1,5,2,3,2,g,3,9,4,1,3,1,2,2,4,c,2,2,5,2,2,4,6,3,7,6,9,1",
+    "s f": "3e,k,k,e,3,4,1,3,4,5,6,d,3,q,7,1x,1,1,3,4,1,1,4,1,2,6,4,2,7,8,e,b,5,a,3,7,k,7,b,s,1,e,8,2,a,1,3,5,9,3,1,7,c,2v,e,4,2,6,2",
+    "s g": "e,1,1,16,2,3,g,s,9,3,1,n,4,1r,v,5,b,5,2k,4,2,3a,1v,3,2,5,f,1,1,t,3,h,2,4,m,5,r",
+    "s h": "a,1p,c,3,6,2,7,3,7,c,4,9,3,8,d,1,3,1,3,6,2,b,d,2,8,4,w,7,3,q,n,q,3,8,5,l,m,l,10,3,q,2,7,9,2,3,c,2,5,f,7,z,7,1,j,2,t,7,4,4,i,7,j",
+    "s i": "v,4,t,t,f,3,u,x,1d,2,13,1,a,1q,v,f,1z,2,5,s,5,q,a,s,3,q,b",
+    "s j": "d6",
+    "s k": "2r,92,9,3,1u",
+    "s l": "5,1e,e,k,k,c,b,v,j,f,6,3y,3,1,1,9,m,4,p,8,4,h,f,o,3,j,o,1i,7,8,n,s,16,4",
+    "s m": "x,g,3,2,6,1,2,7,1,2,3,1,2,4,4,1,4,1,3,d,1,1,6,1,6,1,1,c,f,c,2,2,3,g,3,4,6,1,7,9,1,h,b,m,3,8,3,f,5,9,6,5,3,1,1,1,7,1,5,2,5,3,4,3,2,7,4,f,3,5,e,c,c,k,1,a,2,1,c,3,i,4,5,6,1,3,7,1,9,6,b,3,4,3,2,e,9,7,e,o,1,4,2,1,1,k,5,5,2,5,1,2,2,4,2,2",
+    "s n": "9,9,1,5,f,8,w,7,11,d,7,f,7,1,a,8,7,i,p,19,5,3,c,2,1,i,2,16,a,4,h,f,4,5,10,r,5,m,8,3,2,1,f,h,4,1,3,15,1t,1",
+    "s o": "1,r,m,d,t,b,f,w,j,j,1j,2i,2,2,e,2,5,9,2,5,8,9,15,j,29,g,7,3,t,i,19,12",
+    "s p": "2,1,3,2,e,5,6,1,k,6,1,2,1,1,1,4,3,6,2,1,1,1,1,1,2,3,1,1,2,1,1,3,2,1,3,1,2,1,1,3,3,2,1,2,2,1,4,3,2,5,b,7,a,2,6,4,3,4,8,2,b,b,3,7,4,4,4,9,2,1,6,1,2,8,j,3,1,9,3,9,1,1,2,2,1,2,1,5,1,3,2,2,1,4,2,6,2,1,3,1,2,3,2,5,8,7,2,3,6,2,e,2,1,1,a,k,1,3,a,6,2,6,1,3,3,6,7,8,1,5,3,3,5,g,5,1,a,1,8,2,1,1,1,4,1,5,c,1,3,7,6,c,8,6,5,1,5,1,2,4,7,6,3,4,2,4,4,4,2,6",
+    "s q": "15,j,2,4,e,1,b,8,b,1,1b,12,6,11,3p,21,1,4,9,38,1h,i",
+    "s r": "2,7,c,7,h,1,3,e,3,2,1,b,4,6,2,1,2,7,6,7,5,2,9,1,2,1,1,f,1,n,5,1,7,1,2,b,2,1,t,1,b,3,3,d,3,5,1,3,4,2,1,4,4,d,4,7,3,1,3,2,1,5,3,4,2,c,1,5,v,b,12,5,1,4,2,2,3,7,3,4,1,2,1,1,1,2,5,5,b,1,5,6,3,4,9,5,m,2,4,c,4,1,4,5,b,4,6,8,6,b,1,7,k,f,1,4,b",
+    "s s": "m,9,9,6,c,2,k,7,3,b,f,6,8,1,4,5,f,6,1,3,8,1,1,1,1,1,5,1,2,1,2,2,4,8,7,5,3,m,1,3,1,1,5,2,3,5,7,9,a,8,g,1,7,6,4,1,6,2,9,1,3,6,1,7,7,a,2,4,3,k,4,g,5,b,h,2,5,a,4,2,4,1,4,1,2,2,1,3,1,1,2,a,4,1,9,1,3,2,1,9,1,1,1,2,1,1,1,1,2,1,2,1,1,1,1,3,3,2,1,1,1,1,1,d,2,7,8,6,2,1,6,3,1,a,7,2,d,1,2,1,f,9,2,1",
+    "s t": "14,e,i,5,3,l,9,r,v,8,a,d,o,b,w,i,d,2,1,9,m,5,5,e,2,x,u,9,1f,1,u,6,9,1b,22,y,a",
+    "s u": "u,a,5,2,d,2,2,6,3,2,2,4,2,3,2,1,1,1,2,1,1,1,1,1,1,1,9,1,1,1,1,2,1,2,1,q,4,5,1,4,4,1,2,2,2,2,2,1,3,5,9,1,8,5,r,5,a,4,4,2,1,z,3,3,4,5,2,1,b,e,6,3,6,1,1,6,6,1,1,5,2,b,1,5,q,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,2,1,1,2,2,2,1,1,4,3,2,1,1,3,1,2,9,3,2,1,2,2,1,6,8,2,7,1,5,k,1,6,8,4,1,3,9,1,5,1,1,4,5,5,2,3,4,1,3,q,d,2,5,2",
+    "s v": "2,7,c,1a,b,g,f,6,1,b,11,7,c,8,e,z,1,8,19,5,w,k,4,1,6,1,5,6,p,d,10,18,q,m,10,u,8,e,k",
+    "s w": "42",
+    "s x": "f5",
+    "s y": "0,1,2,1,4,2,3,1,1,1,2,6,3,1,3,2,2,1,2,1,4,2,4,3,f,8,1,1,2,1,9,1,3,3,6,7,2,1,2,1,2,1,4,5,1,1,1,1,1,1,6,3,2,3,2,3,5,1,8,1,5,4,2,2,1,1,1,1,1,2,1,5,3,4,2,2,4,5,1,1,8,1,1,1,2,4,1,1,a,2,1,1,1,2,7,3,1,1,2,8,2,6,1,2,1,2,1,4,6,1,2,3,1,2,1,4,2,2,4,5,1,1,1,2,1,3,2,2,2,1,1,2,7,1,1,7,3,3,6,7,5,2,1,2,4,1,5,2,3,1,5,1,1,1,2,2,a,g,5,6,5,5,1,7,1,3,2,4,9,4,1,2,1,1,6,3,1,1,1,1,3,2,1,1,4,1,5,4,5,1,1,2,1,6,7,3,5,6,1,1,2,4,1,2,9,1,3,1,2,2,2,1,1,2,6,2,5,2,2,1,3,1,4,3,1,7,1,5,1,1,2,1,3,2,1,3,6,4,6,1,1,1,4,2",
+    "s z": "5i",
+    "s ×": "f3,1",
+    "s\",": "11,7f,ac",
+    "s' ": "5x,6o,5f",
+    "s',": "a0,2t",
+    "s)\n": "4v,7w,d,7,f,j,4m",
+    "s) ": "5e,22,8l",
+    "s),": "2p,2e",
+    "s, ": "2,6,2,6,2,a,e,7,5,5,4,2,2,1,5,3,2,1,7,4,3,2,e,6,2,7,4,1,1,4,7,l,h,1,7,1,8,2,3,2,5,1,9,2,4,2,1,2,2,2,1,4,2,1,3,1,2,2,1,8,4,4,7,2,4,2,1,2,4,3,1,3,a,2,4,3,2,4,2,3,1,1,1,1,5,1,4,4,4,1,5,6,8,g,7,3,7,5,1,2,2,3,11,6,2,c,1,8,2,1,1,4,1,1,1,2,a,3,4,8,1,2,1,b,6,c,3,1,2,1,3,7,1,7,1,3,2,1,1,1,5,1,6,2,5,c,6,5,7,4,3,5,k,1,6,3,3,3,7,3",
+    "s-c": "4t,t",
+    "s-i": "f6,2g,8",
+    "s. ": "1v,7,2,1,2,1,d,3,e,4,1,1,1g,k,7,c,b,1a,p,d,7,r,2,9,5,4,1k,1,v,1,2,2,8,7,2,6,8,1,d,1,1,1,1,1,1,1,4,4,1,7,2,1,1,3,3,7,5,2,1n,k,8,g,3,2,1,2,2",
+    "sa\n": "b0,7z",
+    "sa ": "m,2,e,5,1,19,4,1,3,2,1q,i,1,2,e,b,4,1,2,f,q,4,6,5,1,1,8,2,9,3,2,2,8,3,3,5,5,b,1,8,h,i,n,2,18,3,4,1,6,c,6,1,6,9,m,e,4,5,9,n,3,7,1,x,3,6,4,3,4,r,n",
+    "sa)": "2s",
+    "sa,": "3j,5z,9,q,j,1k,4,18,3,14,2",
+    "sa-": "hb",
+    "sa.": "8b,2x,5,y,8,9,j,x,w,9",
+    "sab": "p,9,8,g,14,2j,b,k,2,n,i,6,4,e,5,1,1,4,2,1,6,c,c,a,6,z,2,3,5,6,5,3,4,13,1,6,4,1,2,1,5,5,1,3,1,t,6,r,1d,7,h,2,2,2,7,1,1,3,8",
+    "sac": "2r,y,1l,2z,27,o,2,4g,o,12",
+    "sad": "6,j,2,2,5,l,4,q,6,1,a,a,2,1m,7,1,6,2,2,3,4,3,e,3,t,a,i,j,r,9,6,g,2,8,x,5,1,c,4,1,1j,u,d,i,7,13,n",
+    "saf": "hb",
+    "sag": "2q,1c,b,o,2v,1g,7k,1j",
+    "sai": "h1",
+    "sal": "a,w,u,3,16,4,4,t,16,1,2,y,9,d,w,3,1,6,16,h,7,c,7,6,8,1,1,5,3,7,u,3,3,3,3,2,1,4,2,1,3,1,2,2,1,1,1,1,1,2,1,1,n,b,6,2,3,j,2,1,1,1,2,1,1,1,2,3,1,1,c,4,5,q,p,r,1,8,3,5,2,2,2,3,2,1",
+    "sam": "1c,1,u,u,m,l,t,3,1e,2e,5,1,b,1,e,4l,6,u",
+    "san": "j,d,4,e,c,3,6,7,6,1,4,h,7,a,d,d,s,2,8,2,p,a,f,5,4,c,g,7,8,6,8,1,2,b,b,3,3,5,7,g,e,m,1d,o,3,2,7,7,4,1,g,5,3,e,2,h,b,9,2,2,2,8,6,14,8,4,g,a,1,3,3,a,3",
+    "sap": "4i,3i,4u,53",
+    "sar": "9,q,5,8,1e,5,14,5t,2,x,5,5,2,5,1o,4m",
+    "sas": "1d,u,14,s,1c,5,i,m,14,3,y,9,2,7,l,t,n,4,19,2,d,x,b,4,7,n,4,2,4,3,c,4,1i,4,3,3,1,5,b,7,c",
+    "sat": "6,g,5,4,r,4,53,1c,2,1b,f,2q,2n,6,1,3,3,7,b,c,9,o",
+    "sau": "23,4,16,1g,b,1e,l,1t,5h,6",
+    "sav": "6g,25",
+    "sca": "4,12,1f,2v,4,3b,1o,1z,2,1,c,5,4,2,9,a,5,8,6,2,e,g,11,9,h,7,2,h,4,4,4,1",
+    "sce": "1n,4c,4d",
+    "sch": "d,7n,10,1g,7y",
+    "sco": "16,26,q,y,f,5,a,7,t,11,4,w,2o,3m,1x",
+    "scr": "cs",
+    "scu": "p,8,f,8,o,12,9,1,1g,l,g,7,5,g,k,9,s,4,3,a,8,m,3,b,p,8,8,18,a,a,2,a,a,f,17,h,h,2,b,1s,8,2,b,5",
+    "sde": "26,8,1,2,s,1k,t,f,4v,h,20,2z,2u",
+    "se ": "12,2,3,h,1,2,8,3,1,1,3,a,1,3,1,4,1,1,1,1,2,1,1,1,1,4,2,1,7,1,9,4,1,1,1,1,2,2,4,1,1,2,1,3,2,3,1,5,8,2,a,2,1,a,2,5,4,1,1,1,1,2,f,7,2,3,7,2,2,1,3,2,4,3,2,2,1,1,2,1,1,2,2,1,2,9,2,3,1,1,5,1,3,1,1,7,a,1,1,1,1,1,2,4,1,1,6,2,9,g,2,2,1,1,4,4,8,a,5,2,t,4,7,2,3,2,2,2,2,5,1,1,2,3,1,1,4,b,b,1,4,1,1,1,1,2,1,5,1,5,4,3,2,c,e,1,5,2,1,1,4,1,1,b,1,2,k,3,2,4,4,2,1,1,6,5,1,3,1,1,1,1,1,1,1,4,3,1,1,3,6,7,2,4,4,3",
+    "se,": "b5",
+    "sea": "i,4s,u,2f,2j,1i,s,21,8,11,h,19,9",
+    "seb": "60",
+    "sec": "3g,12,q,35,11,3h,d,a,5,e,4,1c,b,7,1h,1,10,q",
+    "sed": "b,d,f,g,1,u,4,1,6,3,g,3,3,18,6,b,i,6,o,k,a,d,12,6,3,1,1,1,c,2,5,6,1,1,3,1j,13,8,1e,u,s,s,j,e,5,e,10",
+    "see": "1t,2,1,5,1,2,15,74,b",
+    "seg": "d9,4",
+    "sej": "5a",
+    "sel": "7,2y,1r,1b,f,16,56,3,t,a,1,1,c,9,7,l,15,23,3",
+    "sem": "v,f,15,t,e,1k,u,2,9,e,r,1p,p,4,2x,8,1,u,1a,1,1,1,1,c,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,2,1,1,1,9,7,h,6,1,3,7",
+    "sen": "29,4,6,m,3,g,d,8,25,g,8,6,4,7,g,4,d,7,v,1j,5,1,3w,1,6,9,1t,s,6,3,f,d",
+    "seo": "2t",
+    "sep": "2,8,3,7,3,4,g,1,e,9,9,3,6,7,p,3,b,1,2,1,a,6,1,6,2,3,1,5,1,4,3,1,3,2,e,2,5,6,3,6,6,7,1,9,4,3,1,4,6,7,s,k,1,f,2d,12,17,e,7,7,3,5,1k,h,c,4,5,5,1,3,1,1,2,b",
+    "seq": "5m,8m",
+    "ser": "i,b,x,g,3,7,4,d,4,1,n,9,18,9,4,9,3,1,8f,m,1e,i",
+    "ses": "8,6,1,1,j,n,12,k,r,2q,g,5,2q,5d,e,3,1,1,s,1,2,1,j,4",
+    "set": "1s,3f,m,12,3r,v,67,7,7",
+    "seu": "bg",
+    "sey": "1u",
+    "sfo": "cy",
+    "sfr": "s,f,g,2l,w,c,12,c,t,h,s,5,3,1,1,4,4,f,4j,1,6,1c",
+    "sfu": "eg",
+    "sga": "7e",
+    "sgo": "b5,7q",
+    "sgu": "93",
+    "sh ": "8o",
+    "sha": "7w,1o,9m",
+    "she": "8p",
+    "shi": "a2,1,h,b,6,5,32,2g,1s",
+    "shu": "8d",
+    "shw": "7r,ak",
+    "si ": "2n,35,3y,2o,1l,h,4s",
+    "si)": "gw,1j",
+    "sia": "a,2,a,5,7,d,6,1,1,4,u,1,9,3,5,5,21,n,8,l,r,m,g,a,6,n,g,1,7,8,8,8,k,5,13,d,f,v,29,h,6,18,b,2,4,6,6,1",
+    "sib": "2j,64,9q",
+    "sic": "4,8,4,4,d,1,h,3,2,9,3,6,1,b,4,a,1,h,1,2,7,u,c,4,q,7,3,2,a,2,1,2,n,5,a,4,j,2,2,3,1,6,4,5,1,4,5,3,3,c,5,a,e,c,j,1t,g,1,4,f,1,j,u,f,o,6,1,h,5,6,1,b,1,2,2,3,1,1,6,1,1,3,1,2,1,u",
+    "sid": "9,10,3,u,1,3,4,2,4,1w,13,e,13,27,7,8,6,8,9,l,9,8,14,17,16,4,3j,m,4,1",
+    "sie": "b,c,w,1,c,3z,1,3,1,f,1,i,o,e,u,3,1,1,f,5,3,c,7,3e,2,2m,s,p,n,4,7,1,9,3,3",
+    "sif": "22,4d,2k,29,18,6g",
+    "sig": "2t,5,fc,r",
+    "sii": "2t,ey",
+    "sil": "0,2s,1i,16,d,12,e,3h,r,1l,q,k,i,p,1d,22",
+    "sim": "5,1h,o,o,y,10,2,12,a,a,1l,5,c,19,t,l,6,15,1b,2,8,p,4,4,4,1,1,f,9,7,10,1,b,j,3,13",
+    "sin": "15,d,m,1,8,4,p,1n,9,f,5,7,2,6,7,1,l,i,q,j,3,v,8,6,1,7,8,2,b,8,22,15,e,k,m,p,c,7,1,t,q,m,2,3",
+    "sio": "n,1,5,6,6,e,1,9,2,7,7,9,6,1,b,3,b,1,5,a,6,q,d,19,3,d,4,2,1,a,4,9,5,b,1,2,n,3,2,1,1,1,3,3,2,1,1,9,5,1,1,p,u,17,5,7,2,c,1,2,2,h,1,9,c,i,i,7,h,1b,1b,8",
+    "sip": "bc,3h",
+    "sir": "6g,6w",
+    "sis": "q,5,9,h,1,3,1,a,o,i,1s,i,a,2,2,1,5,3,4,5,2,1,e,g,a,1,6,2,3,1,5,1,e,4,3,6,1,3,3,8,5,8,1,b,3,2,3,3,1,2,1,1,2,6,2,5,5,j,4,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,5,4,3,3,2,5,4,4,8,3,5,6,1,5,a,3,6,6,3,1,l,l,g,e,f,7,d,a,2,2,1,1,1,1,1,1,1,5,2,1,1,1,3,4,1,1,2,1",
+    "sit": "m,7,6,x,4,h,e,2h,20,55,3,4,1,2,4,k,7,t,t,3,s,2e",
+    "siv": "2,k,6,11,t,35,1,r,d,d,t,d,f,f,a,5,5,4,2o,7,2w,t,h",
+    "sla": "7d",
+    "slu": "b9,6q",
+    "sma": "1,w,q,1n,1f,1u,8,4j,5j",
+    "sme": "2f,2c",
+    "smi": "22,5,y,1u,3l,a",
+    "smo": "0,5,3,3,4,a,a,c,a,c,5,6,2,5,4,f,g,8,10,h,f,1,2,a,4,g,a,3,5,2,6,4,1,4,8,7,4,3,i,2,4,9,1,1,1,8,c,1,2,c,1,1f,4c,4,2,i,f,3,2,1,b,4,1h,7",
+    "sna": "d3",
+    "snc": "g9",
+    "sne": "8m",
+    "sno": "3k",
+    "so\n": "2x,7,1w,s,1r,e,1b,d,1,5,2r,2m,3p",
+    "so ": "1a,u,1,5,1p,t,3,b,1,1,2,1,4,2,2,c,e,1,14,n,5,m,7,n,a,7,2,10,19,1,6,m,d,7,6,h,k,f,10,i,1f,3,n",
+    "so\"": "6k,c5",
+    "so,": "23,3m,g,m,1b,6,m,1w,d,4d,8,1b,1x",
+    "so.": "q,1i,2y,2,7,5,8,31,f,h,1b,1d,48,28,9",
+    "sob": "m,9,22,d,25,1e,1f,m,1i,j,34,2m,e,1h,g,9",
+    "soc": "o,1n,4,17,c4,1h",
+    "sod": "1z,8,1b,1a,29",
+    "sof": "8o",
+    "sol": "t,1c,31,2,34,t,i,8,i,d,2h,14,11,v,7",
+    "som": "b,19,c,i,10,31,j,o,5,13,3,2,1,q,5y,1b,e,y,l",
+    "son": "14,k,1,3,g,1,6,f,1,8,5,f,b,8,5,5,1,3,1,9,2,7,1,3,4,5,2,c,1,4,3,s,23,4,5,5,3,c,12,r,1k,8,8,7,5,7,3,4,4,g,4,1,1,1,9,1,1,1,2,1,1,1,1,1,1,1,2,1,3,6,4,1,1,14,3,3,4",
+    "sop": "s,5p,4,38,2i,1i,27",
+    "sor": "10,5,14,u,3,7,2,f,4,u,n,6,18,a,j,y,b,i,c,2z,u,k,9,l,1,2,a,j,a,c,a,v,o,1",
+    "sos": "v,u,e,q,10,z,f,12,k,2j,m,1a,9,11,v,b,12,b,7,2,5,2,j",
+    "spa": "0,5,3,3,4,k,c,a,c,5,d,4,v,8,10,t,3,1,2,u,a,3,5,2,6,5,4,8,7,4,l,6,9,1,1,9,c,1,2,c,1,n,n,5,2p,6,z,i,4,2,i,f,3,2,1,b,4,i,z,a",
+    "spe": "6,9,1,4,2,12,3,1,2,5,9,7,3,y,1j,d,9,k,s,6,6,9,h,8,b,m,m,3,4,b,w,1m,n,5,g,f,b,11,3,1,c,7,1,2,2,8,6,1,8,1,9,1,6,7,h,b,1,3,3,4,9,4",
+    "sph": "z",
+    "spi": "2,3,4,c,7,h,4,2,c,19,7,5,1,a,4,3,d,l,5,4,a,3,a,1,2,3,o,1,b,3,6,i,8,2,1,t,7,5,1,5,8,a,3,13,2,1o,4,1d,1,1,6,a,3,9,18,1,a,9,6,8,i,7,o,2,g",
+    "spm": "4t",
+    "spo": "at,8a",
+    "spp": "6g,j,4,3w,2,3,6w,1,1",
+    "spu": "7,9x,11,7q",
+    "spy": "dz",
+    "squ": "6h,3z,3,5,2l",
+    "ssa": "o,21,bs,2u",
+    "ssi": "x,15,4d,1p,4,r,1o,p,14,2s,h,u,2d",
+    "sso": "s,91",
+    "ssu": "2m,10,7m,6v",
+    "sta": "m,4,5,2,q,5,1,1,6,1,2,1,2,1,2,2,1,1,c,4,4,1,2,4,f,18,3,c,v,m,1e,9,c,3,b,6,c,5,1,6,a,f,l,e,1,19,6,5,4,3,3,7,9,6,c,4,a,4,i,6,1,7,g,1,2,1,8,2,v,s,5,1,1,2,3,4,7,2,b",
+    "ste": "c,e,5,a,l,i,a,5,1,3,3,1,1,3,4,12,d,b,5,i,a,2,2,1,c,7,f,k,6,1,6,5,1,5,1,b,3,7,6,1,1,d,e,e,1,1,1,2,1,2,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,u,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,4,4,3,1,2,2,5,4,4,1,7,3,5,6,1,5,9,1,3,6,1,h,1,6,3,3,3,i,2,e,e,f,8,8,7,7,2,2,1,1,1,1,1,1,1,5,2,1,1,1,3,4,1,1,2,1",
+    "sti": "0,1,2,1,1,1,2,1,2,1,1,2,1,2,3,2,1,2,1,2,1,1,2,1,1,3,1,1,2,1,4,2,3,1,5,2,4,4,2,2,4,1,3,1,1,1,5,1,1,6,1,7,3,3,6,2,1,1,c,b,3,1,6,d,3,1,7,1,7,3,1,2,2,1,4,2,4,1,2,1,2,4,1,2,2,1,7,1,1,e,1,1,1,3,1,7,5,1,1,1,3,1,2,1,1,2,1,1,2,1,1,1,1,1,1,1,1,2,2,1,1,1,1,1,1,1,5,1,3,3,1,3,2,a,2,d,5,7,6,1,1,5,2,2,1,a,2,2,2,3,2,4,3,1,2,9,3,1,s,1,1,1,1,2,1,3,3,1,2,1,2,1,2,3,1,3,2,1,1,1,1,1,4,1,2,3,4,a,1,2,1,1,3,3,1,1,7,1,3,1,1,2,2,6,1,6,2,1,8,8,2,1,1,1,2,1,b,1,1,1,3,1,1,3,1,2,3,1,1,1,1,4,2,1,1,1,1,1,2,2,4,3,1,6,1,3,4,b,4,1,b,3,2,2,3,2,1,2,4,1,1",
+    "sto": "1,4,1y,5,b,d,3,q,10,1,1,1,1,1,2,2,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,2,3,1,4,1,1,3,2,4,7,6,2,1,1,c,p,7,d,4,6,5,17,k,7,4,m,13,9,4,1z,12,q,1q,g",
+    "str": "c,o,1,3,9,3,1,2,2,3,4,4,5,4,6,4,d,7,5,3,2,d,1,3,2,3,1,1,1,b,3,3,1,4,3,1,3,2,1,4,3,4,2,2,5,2,5,1,1,1,2,3,1,3,4,1,c,a,2,4,1,3,a,1,5,6,2,5,1,2,o,5,1,5,9,9,1,6,1,1,2,4,4,1,3,4,c,2,2,4,4,3,g,4,3,1,t,5,2,2,j,6,8,4,1,5,2,2,1,3,1,4,3,1,2,2,1,2,1,5,1,1,4,2,1,1,3,4,1,f,n,3,4,d,8,d,d,8,2,3,a,2,1,2,1,1,3,e,1,4,2,1,1,1",
+    "stu": "4t,9,k,3z,1t,1r",
+    "su ": "14,k,1,2,1,c,1,5,g,1,d,6,7,i,r,5,b,2,2,2,3,4,k,2,3,2,6,1,3,e,a,3,3,1,2,l,1,p,1,4,1,2,3,c,8,7,1,1,6,1,1,2,2,1,1,2,2,3,4,1,2,3,5,g,2,2,4,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,4,1,3,1,2,8,1,4,2,1,5,2,1,5,2,2,2,3,4,6,p,4,h,m,i,8,a,15,7,b,l,1",
+    "sua": "b,2,q,9,1,9,1l,1,3,10,6,4,i,d,7,5,p,7,4,h,7,10,2,f,1,2,2,6,3,3,d,1,1c,3,d,12,5,3,6,g,1,3,c,1,5,2,4,2,h,1p,4,t",
+    "sub": "3w,3l,2v",
+    "suc": "63,3w,7m,3,1,1,2,3,1,1,2,1,1,1,1,1,1,1,1,1",
+    "sud": "a,10,y,j,8,2,1y,5,2,16,7,7,y,r,m,5,2d,l,h,1s,2l,19",
+    "sue": "n,w,33,2d,19,q,1,1,3g,5,5v,g,6",
+    "suf": "2t,a,1x,27,8z",
+    "sui": "2t,7w",
+    "sul": "2w,5k,28,7f,p",
+    "sum": "d,3,22,8,i,3h,1h,7,9,2m,a,1f,f,8,1,2a,4,19",
+    "sup": "t,1u,5l,33,1l,2,o,16,u,2l,1,p",
+    "sur": "2z,17,1s,93,3o",
+    "sus": "y,c,2,c,b,9,3,2,1,4,4,1,1,6,2,5,5,1,1,3,1,2,3,4,1,2,c,d,g,3,3,8,2,3,3,d,a,i,9,6,7,b,n,5,2,2,a,3,1,1,3,3,3,4,1,1,5,2,3,6,1,4,6,5,k,8,6,2,1,a,5,u,2,1,g,2,5,2,3,k,3,1,6,3,o,1,4,7,w,c,v,d,6,1,d,6,2,1,2,4,4,1,7,2,6,2,2",
+    "sve": "do,2b",
+    "swe": "17,as",
+    "swi": "4c",
+    "syl": "1d,1u,g,4,2x,2e,75",
+    "syt": "5c",
+    "syz": "k,ck,39",
+    "t d": "aq",
+    "t e": "28,45,28,38,e,z",
+    "ta\n": "dj,a",
+    "ta ": "2,2,3,2,1,3,d,1,2,3,4,1,a,1,4,2,3,4,3,1,1,3,1,2,2,1,3,1,2,1,1,1,1,4,1,1,3,2,1,2,1,1,4,3,2,2,3,1,2,1,5,j,7,3,f,h,1,g,5,2,4,1,1,4,c,1,3,2,2,1,1,6,1,2,2,4,1,1,1,5,1,1,3,1,2,1,1,1,1,1,1,2,1,1,1,2,1,2,2,7,f,3,1,8,a,2,9,1,3,4,2,1,5,3,i,5,5,e,1,1,1,1,1,1,2,2,1,6,k,1,1,1,1,1,1,1,1,1,3,1,1,1,1,1,1,1,1,1,1,1,1,3,2,3,3,1,1,1,2,1,1,3,3,3,1,1,2,4,1,5,2,4,1,7,7,3,4,8,6,1,f,h,2,5,j,9,6,7,1,1,2,1,1,1,2,3,1,1,2,2,1,1,1,1,1,1,1,2,1,1,1,1,1,2,1,1,2,1,1,7,2,1,4,2,3,1",
+    "ta\"": "g5,19,1p",
+    "ta)": "2m,d,a0",
+    "ta,": "5,1n,4w,2,f,w,1r,7w,e",
+    "ta.": "2n,13,3m,18,2l,a,1c,s,4,l,2z,o,z",
+    "tab": "28,2h,6e,5u",
+    "tac": "1n,6,b,7,c,k,12,13,p,1u,6,2,i,1,g,n,s,o,8,6,1o,a,3,1p,9,2r,m",
+    "tad": "m,f,y,q,b,i,1a,1r,i,25,5,b,2,6,39,6,o,2b,9,1v,6,4,7",
+    "tae": "3u,y,m,3a,11,4d,u",
+    "tag": "e,i,7k,16,d,4w,7,v,1,9,b,9,9",
+    "tah": "ci",
+    "tak": "a3,1,8k",
+    "tal": "6,e,k,5,6,b,2,k,1,h,k,1s,4,1,1,v,7,8,9,9,3,1,1,2,6,2,1,7,3,2,1,b,8,1,4,1,1,6,c,3,7,5,b,1,3,3,2,7,2,l,a,5,15,7,7,3,6,p,c,6,3,1,9,w,15,15,a,5,1,1,4,1,2,5,2,1,1,8,2,1,1,3",
+    "tam": "7,6,1,h,c,2,2,8,5,5,2,2,3,1,2,1,1,b,1,3,1,2,4,9,2,2,u,6,f,d,f,2,1,1,1,8,1,l,c,a,a,9,m,2,1,4,1,2,a,3,7,c,7,7,b,1,b,5,5,6,2,2,2,2,1,4,2,3,4,2,2,8,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,3,2,3,3,2,2,1,4,1,2,1,1,2,1,6,5,2,1,1,1,1,1,3,1,1,1,1,1,1,1,1,3,1,1,2,1,1,1,1,4,1,3,1,3,3,1,1,1,3,1,1,2,5,2,2,1,e,a,4,5,a,q,2,a,3,x,8,1",
+    "tan": "e,d,2,t,3,f,z,g,7,d,a,z,o,3,1v,c,1,4,7,h,4,6,6,2,p,7,n,7,1,6,3,c,n,3,5,8,h,4,b,1,7,4,2,5,1,t,8,1,3,l,1,j,2,t,1,6,2,5,1,c,l,4,5",
+    "tap": "x,3x,9z,3d,10",
+    "tar": "l,8,7,n,b,8,1,1,1,1,3,4,5,9,3,1,5,5,3,7,2,1,4,1,1,1,2,6,6,5,a,1,4,8,1,h,5,2,9,2,4,4,2,9,1,4,3,6,1,3,5,2,e,1,1,1,1,1,1,5,6,c,2,1,3,3,9,2,6,d,6,i,5,9,4,1o,1,1,1,1,2,1,1,1,4,1,3,1,2,1,3,2,3,2,4,4,8,3,1,4,2,4,6,8,5,2,3,2,3,i,i,3,2,5,4,8,3,c,9,m,7,3,2,1,1,5,1,3,1,2,3,9,3,2,1,4,2,2,2",
+    "tas": "1l,3,1,2,h,8,4,1,a,6,1,1,24,2u,4,z,9,6,9,9,4,a,11,15,9,4,9,2,2,4p,v,7",
+    "tat": "4r,s,c,1,25,1h,5,w,2e,1i,t,3",
+    "tau": "1e,7b,m,q,8a",
+    "tav": "j6",
+    "tax": "3t",
+    "tay": "f5,2i",
+    "taz": "x,es,u",
+    "tc ": "8g,1,1,7",
+    "tc)": "8f,a",
+    "tch": "cj",
+    "te\n": "1,1,1,8,3,3,2,3,1,1,2,2,3,1,1,3,1,3,1,1,2,1,1,1,1,1,6,1,3,1,1,1,1,4,1,1,2,1,1,1,3,1,3,7,2,1,1,3,2,1,1,1,2,2,5,1,2,1,1,1,2,1,2,2,1,2,1,4,1,1,2,1,1,3,1,1,8,2,1,1,2,1,1,2,1,1,1,2,1,1,1,1,1,1,1,4,2,1,3,1,5,2,1,1,3,2,1,2,2,2,1,2,1,2,1,1,2,1,2,1,1,1,2,3,2,1,1,2,1,2,2,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,3,4,2,3,4,1,1,1,1,1,1,1,1,3,1,1,1,1,1,1,1,2,2,1,1,1,2,1,1,3,1,4,6,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,2,1,2,2,3,1,4,4,1,1,1,1,3,3,4,1,2,3,1,3,3,1,4,2,1,1,1,1,1,1,2,1,1,4,2,1,8,1,2,1,4,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,2,1,1,5,1,1,1,2,1,3,1,1,2,1,1,1,1,1,1,1,1,1,2,2,1,1,2,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,1,1,1,2,1,1,1,1,3,1,1,2,1,1,1,1,1,1,1,1,1,6,3,1,1,1,2,1,3,1,1,1,1,1,2,3,1,1,1,1,2,1,5,1,5,5,1,3,1,7,1,1,1,1,1,1,1,1,4,2,1,1,3,1,k,b,2,1,5,1,4",
+    "te ": "4,1,1,8,1,1,1,3,3,1,6,2,1,1,3,1,1,1,1,1,1,3,1,2,4,2,1,1,3,2,1,1,5,1,1,2,3,1,3,1,1,4,1,1,2,2,3,3,1,1,1,1,1,1,2,1,4,1,2,1,1,2,1,1,1,3,3,5,1,2,2,8,1,3,6,4,2,1,1,2,4,2,1,3,2,6,2,1,1,1,1,3,2,2,1,1,2,1,4,1,3,2,1,2,1,1,4,1,1,3,2,1,1,5,1,5,3,2,1,3,3,2,2,1,3,1,3,1,1,2,1,2,3,3,3,2,3,1,1,4,1,2,1,1,4,1,1,1,3,1,1,1,1,2,1,5,1,1,4,2,1,1,1,2,2,1,1,3,1,3,1,3,1,1,2,1,2,4,1,1,1,1,5,1,1,1,1,1,1,1,3,2,1,1,1,1,1,1,1,1,3,2,1,6,1,1,2,2,1,1,1,1,2,2,2,2,1,s,2,1,3,1,1,1,1,3,1,2,1,1,2,3,2,1,1,1,2,1,2,1,1,1,1,2,1,1,2,1,1,2,1,1,2,3,1,1,1,1,1,1,1,1,1,4,1,1,1,2,3,3,1,2,1,1,2,3,4,5,8,1,1,3,1,3,2,2,2,1,3,3,1,4,1,3,2,1,1,1,1,2,3,1,2,1,1,1,1,1,2,1,2,1,1,1,3,2,4,4,1,1,1,1,1,5,1,1,3,4,1,b,6,2,1,7,4,3,1,1,2,1,1,4,1,2,1,3",
+    "te)": "1q,85",
+    "te,": "b,j,1b,1,2k,u,1e,g,1,8,c,5,3,f,5,l,e,t,s,1t,d,3e,g,n,m,1,a,a",
+    "te.": "r,13,a,2b,1c,4,1l,e,13,1x,h,17,15,b,2,v,1,n,5,z,6,2c",
+    "tea": "4r,z,28,1q,3c,51,5",
+    "tec": "h,2o,6,7,l,22,c,4,1,f,f,2,2,1,4,d,f,1,2,5,s,2,j,4,4,5,g,1r,4,a,d,9,2,5,8,8,g,a,1,d,2,1,2,1,4,d,1,7,f,i,c,7,y,g",
+    "teg": "43,1z,1i,1i,7,y,27,5,v,8,2,5,8,o,i,5,b,d,1h,x,5,6",
+    "tei": "5f,4k,y,e,a,r,1,q,27,8,4,d,4",
+    "tej": "3t,20,12,4g",
+    "tel": "34,3h,8a,3s,c",
+    "tem": "c,e,5,m,1,8,r,7,2a,7,b,a,2,2,d,m,j,7,1,b,1,5,f,d,1,e,1,d,e,2,6,3,1,1,2,6,7,u,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,5,4,3,3,2,5,4,4,8,3,5,6,1,5,d,6,1g,g,e,f,w,5,1,1,2,5,2,1,1,1,3,4,1,1,2,1",
+    "ten": "2,d,2,3,a,1,5,5,1,b,1,3,1,4,c,3,4,u,c,e,1,7,4,7,3,1,3,9,4,1,5,1,c,4,2,4,6,a,5,4,d,2,4,5,h,3,4,4,6,1,1,1,3,9,6,2,2,5,1,8,4,2,6,a,1,5,2,2,1,5,2,2,2,1,2,2,5,1,b,3,m,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,5,4,2,3,2,6,3,3,1,8,3,4,1,1,1,1,2,1,b,2,b,2,1,a,2,4,5,1,a,5,j,1,9,3,1,9,6,1,8,8,9,p,4,1,1,1,2,1,2,h,2,1,4",
+    "teo": "7g,5n",
+    "teq": "6g,ba",
+    "ter": "3,g,d,2,5,2,j,2,4,7,1,3,1,5,c,1,3,3,5,7,9,1,8,5,1,7,1,8,8,7,1,3,2,3,3,1,3,2,1,2,2,1,1,3,3,1,2,e,9,h,2,5,a,2,1,6,6,9,6,3,8,a,3,5,9,6,6,8,b,4,6,5,3,2,3,2,3,i,7,z,1,5,2,5,1,1,2,1,8,1,1,2,1,5,b,c,2,5,1,i,2,2,b,1,6,6,3,2,8,1,9,b,1,8,4,1,m,4,5,3,4,3,c,b,6,3,1,9",
+    "tes": "0,1,1,1,9,j,4,j,5,1,2,3,2,1,1,5,2,3,1,2,3,1,3,1,1,c,1,3,2,2,2,1,1,1,1,5,a,1,1,7,r,7,1,4,2,9,c,5,a,3,5,2,5,5,2,9,2,1,6,6,1,3,k,1,8,2,1,1,d,2,2,i,1,i,2,2,9,6,2,8,5,3,3,2,3,4,a,t,1,2,1,1,1,1,1,3,3,1,1,5,1,5,2,1,6,3,1,1,3,2,5,1,1,2,1,1,2,1,1,6,3,3,1,2,1,5,2,4,1,2,3,4,2,3,c,2,1,6,1,8,1,7,1,2,3,6,6,7,5,6,9,5,1,7,1,5,6,8,6,5,1,4,1,1,8",
+    "tet": "2n,4,7,9w",
+    "teu": "al,4",
+    "tev": "15",
+    "tex": "2s,1d,c,c,t,2p,b,1v,r,2,20,y,3x",
+    "tez": "23,k,q,d,5,1,4,4,8,3,8,m,c,2,1g,2g,43,1e",
+    "tha": "4,1,17,y,m,49,m,4,1x,y,p,5i,1c,2",
+    "the": "5w,1k,17,m,c,d,32,3,35,25",
+    "thi": "1i,z,2v,20,59,5h",
+    "tho": "8a,79,1t,o",
+    "thr": "p,9c,w",
+    "thu": "8,27,q,2l,w,o,z,w,3,64,l,13,1q",
+    "thy": "2,1t,n,31,1e,g,9h",
+    "ti-": "bj",
+    "tia": "1n,1,n,n,1b,m,1,g,1u,s,s,14,i,38,g,5,t,l,23,8,f",
+    "tib": "3,v,5,1,5,f,2,4,7,4,i,c,7,a,l,x,4,a,1,1,l,u,u,7,j,d,e,3,9,j,a,a,5,1,2,3,2,4,6,c,1,14,9,9,x,5,4,i,6,1w,1,v,7,q,6",
+    "tic": "0,1,1,5,3,3,1,3,1,2,3,1,1,2,3,4,4,5,1,1,5,1,4,1,2,1,3,2,1,1,1,2,1,2,3,1,1,1,1,1,3,1,1,1,2,2,2,2,1,1,3,1,4,2,1,2,3,5,1,1,1,1,1,2,4,1,2,1,2,1,9,1,1,1,3,1,1,5,1,2,2,1,1,4,1,1,1,3,2,1,1,1,1,1,2,1,1,3,2,2,3,1,1,2,1,4,1,1,2,1,1,2,1,2,2,1,1,1,1,4,3,1,2,1,1,1,3,2,2,1,3,1,1,1,1,1,1,1,2,1,1,1,1,2,2,1,2,2,2,1,2,2,2,1,2,2,2,1,1,1,1,1,4,1,1,1,2,1,2,1,2,4,1,1,2,3,1,1,3,1,1,1,1,1,3,2,1,1,3,1,2,1,1,2,1,1,4,1,2,1,4,6,4,3,2,1,2,2,2,2,2,9,d,3,1,1,1,1,1,1,1,1,1,1,1,r,1,3,1,1,2,1,1,2,2,4,1,1,1,3,1,1,2,4,5,2,1,1,1,1,4,1,3,1,1,1,2,1,1,6,1,1,1,1,2,1,2,1,1,1,1,1,1,2,1,2,2,1,2,1,3,1,2,5,6,f,2,1,9,5,2,2,1,1,2,1,6,8,9,1,2,1,3,5,3,2,1,2,1,1,1,2,b,a,7,1,2,6,2,1,2,1,1,5",
+    "tid": "m,17,d,24,6,1c,14,1j,f,p,5,9,2i,6,4,3,c,h,d,d,9,6,1r,u",
+    "tie": "0,5,3,3,1,3,3,1,8,8,3,9,a,5,3,1,3,5,3,5,5,4,i,2,6,5,5,3,3,7,1,5,k,2,8,4,f,3,1,2,2,h,b,1,9,3,5,2,4,2,5,4,2,1,5,7,4,9,c,1,5,5,4,1,1,1,3,4,1,2,2,8,1,2,8,4,1,u,l,4,g,n,1,5,8,1,1,5,2,1,4,8,c,6,3,3,3,3,1,4,6,5,4,m,2,3,4,2,4,1,4,4,5,6,1,1,3,4,3,2,1,1,1,1,5,3,2,1,1,3,2,1,5,2",
+    "tif": "3,k,19,5,1f,c,9,p,t,1f,4,1g,5,5,o,4,w,k,39,2m",
+    "tig": "2b,4,u,9,1b,8,8,d,f,a,v,1h,u,5,8,e,d,b,h,1b,v,w,1x,w,1,w,5,2,1,f,g",
+    "tih": "v,5,g,l,l,2g,v,25,17,55,1r,19",
+    "tii": "1,6,3,7,1,d,3,2,1,1,4,2,2,3,1,1,1,7,1,1,5,7,2,4,d,1,1,b,3,3,3,1,2,3,1,3,1,2,1,1,4,1,5,1,1,3,5,4,5,6,3,2,2,4,1,2,1,1,3,1,3,5,1,3,1,e,1,2,1,2,1,1,1,1,1,1,1,1,1,3,3,1,1,1,1,1,2,1,2,1,1,2,9,5,7,2,1,3,2,1,3,1,2,1,5,1,3,2,5,6,1,1,1,4,2,1,2,3,5,1,1,1,2,4,1,2,2,4,1,1,2,4,1,6,4,5,2,5,5,1,1,1,3,3,1,4,6,8,1,6,t,1,1,4,1,1,3,2,2,3,3,3,2,1,3,1,2,b,2,1,4,1,1,3,a,7,2,3,1,1,2,3,3,1,2,1,3,1,2,5,2,2,2,3,4,1,5,1,8,2,1,4,1,6,6,4,1,9,2,4,1,2,2,1,1,5,3,4,1,1,1,1,1,2,1,1,1,1,1,4,1,1,1,2,3,2,4,1,3,1,1,4,2,3,3,1,3,2,1",
+    "til": "a,1,6,g,3,9,g,5,2,1,6,2,2,2,1,5,3,5,2,3,1,1,1,2,1,1,1,4,5,5,1,3,1,1,2,2,3,2,1,1,3,2,2,3,2,1,1,3,1,1,4,5,2,2,2,8,4,h,2,b,4,1,2,1,2,2,1,2,1,2,1,1,2,2,2,1,1,4,1,1,1,1,2,4,2,2,1,2,2,5,1,1,1,1,1,1,1,1,2,3,1,1,1,1,4,c,3,1,3,2,8,3,8,8,2,p,2,2,4,4,1,l,c,4,q,4,7,1,4,2,2,2,2,6,3,4,1,6,7,3,5,5,1,4,2,2,2,5,1,1,1,3,c,a,f,7,j,1,2,3,e,9,1,a,4,1,2,2,3,2,1,2,1,1,1,2,2,1,1,2,1,1,1,2,1,1,1,1,1,1,4,1,1,1,2,1,2,1,1,1,5,1",
+    "tim": "1,2,9,7,8,4,2,9,h,4,7,2,4,5,n,e,s,1,m,m,2,c,3,3,b,5,1,b,4,2,9,8,6,2,1,1,3,1,1,2,1,4,1,1,1,2,6,8,1,3,4,h,d,4,g,5,f,2,3,d,1k,d,4,4,h,b,c,7,1,3,2,2,8,1,2,n,7,c,1,1,1,5,3,1,7,2,2,6,1,2,8,y,v",
+    "tin": "z,p,c,4,d,i,17,14,8,1u,t,4,8,1i,4,e,j,4,1d,8,2,7,h,1,5,4,a,17,c,1f,26,1",
+    "tio": "1,2,3,3,3,3,2,4,1,5,6,6,3,5,6,5,4,5,4,1,1,4,5,b,3,b,3,3,3,2,1,1,3,2,1,6,1,a,4,c,a,6,g,j,1,5,4,1,2,3,2,5,3,2,5,3,7,1,3,b,1,1,1,1,5,9,1,2,1,1,2,3,4,1,2,g,t,9,2,2,6,3,3,1,4,4,2,1,1,1,1,1,1,1,1,1,5,4,3,9,4,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,5,1,2,1,1,1,2,2,1,1,1,3,1,1,2,2,3,1,2,1,1,1,2,2,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,2,1,3,2,2,1,1,1,1,2,3,1,1,2,1,2,1,1,5,1,1,2,1,1,1,1,3,1,1,2,2,1,1,3,2,3,1,1,2,3,1,1,2,5,1,3,2,3,2,1,1,2,2,1,2,1,2,5,2,3,3,7,1,1,5,1,7,3,h,6,1,4,1,2,6,6,4",
+    "tip": "t,m,f,4,5,3,b,2,b,1,2,1,b,4,3,1,c,b,16,2,6,c,q,j,1,u,1h,y,b,1w,4,7,2,f,1,9,10,p,s,2b",
+    "tiq": "5x",
+    "tir": "26,d,f,g,o,v,12,c,v,l,9,k,3,1m,3,8,f,4,1w,2,j,h,j,6,t,1s,u,10",
+    "tis": "2,8,3,7,3,4,g,1,e,6,3,8,1,3,6,7,1,d,b,3,b,1,2,1,a,6,1,6,2,3,1,5,1,4,2,1,1,3,2,c,2,2,5,6,1,2,2,2,2,4,2,1,6,1,2,1,6,4,3,1,4,6,7,d,8,7,d,7,1,9,6,7,f,1r,12,12,5,c,2,7,7,3,5,5,8,2,i,a,d,h,4,8,1,3,5,5,1,3,1,1,2,b,o,d",
+    "tit": "2,a,g,3,n,a,i,1j,1g,i,s,9,h,3,m,1v,7,1,3,4,4,1,3,2,2,1,2,7,3u,3,v,2,1f,m,g,2,1,g",
+    "tiu": "34,2,1g,21,11,1a,2g",
+    "tiv": "0,1,2,1,1,1,1,1,1,2,1,1,1,1,1,2,2,1,1,2,1,1,1,1,1,1,1,2,1,1,3,1,4,4,2,3,1,5,2,2,2,2,4,2,8,1,1,5,1,1,6,1,1,3,7,3,1,3,2,2,7,4,e,4,2,1,3,1,1,b,3,7,1,2,3,2,1,1,2,4,1,5,6,3,2,5,3,2,1,1,2,1,4,1,5,2,3,2,2,1,1,2,1,1,3,2,3,1,1,3,1,1,5,2,2,2,1,1,1,2,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,2,1,4,1,1,1,3,1,6,4,2,2,9,9,2,5,4,1,1,1,3,3,1,2,2,a,1,4,4,2,1,2,2,3,1,4,2,3,1,3,1,s,1,1,2,2,1,1,2,2,4,1,1,1,1,3,1,1,1,2,1,2,2,1,1,d,1,3,a,2,6,4,6,8,1,8,1,7,1,1,1,1,2,2,1,8,1,1,1,1,1,1,1,1,2,3,1,1,1,8,1,1,1,1,5,2,1,1,1,1,5,2,1,1,2,1,2,1,3,1,1,2,1,1,4,2,1,3,4,b,4,2,1,6,3,1,1,2,2,2,1,1,1,1,3,5,1,1,1",
+    "tiz": "4x,5u,3p,25,x",
+    "tla": "iv",
+    "tle": "a5",
+    "tmo": "22,6,1m,5v,57",
+    "tna": "y",
+    "to\n": "a1,15,1w,c,4u,6",
+    "to ": "1,6,4,1,1,6,z,6,3,1,7,4,2,1,2,2,2,7,4,9,3,b,7,l,2,2,2,3,4,a,1,1,1,1,1,2,2,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,2,1,2,1,3,1,1,1,3,1,4,1,5,1,1,4,4,1,d,4,2,1,1,m,1,1,2,1,k,5,2,3,3,7,5,7,h,1,4,1,2,4,2,7,4,m,1,6,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,4,2,8,2,5,f,1,1,1,1,1,2,4,1,5,3,3,1,2,2,1,1,2,2,1,1,1,c,3,1,1,3,5,n,5,6,1,2,2,3,3,b,2,3,9,e,v,2,3,4,8,1,3,4,7,2,1",
+    "to)": "e9",
+    "to,": "l,53,9y",
+    "to.": "8h,53,6,3m,v",
+    "toc": "d2,8,2,7,z,1i",
+    "tod": "2h,31,c,3i,o,2m,5z,h,1,3",
+    "toe": "1j,87",
+    "tog": "32,3c,b,l,9,1,6,1,p,7,1f,t,3u,27,d",
+    "toi": "8h",
+    "tol": "9e,1b,l,28",
+    "tom": "2,1t,2y,q,o,h,6,3,1r,13,8,36,2,1c,2b,4,h,1c,h",
+    "ton": "q,o,3,1,u,i,a,f,b,1,7,3,5,i,8,1,4,4,5,1,a,1,2,g,3,3,m,7,5,7,6,2,1,1,4,1,h,1,1,6,2,4,a,5,4,6,4,3,2,4,1,4,1,1i,27,c,1,b,8,4,6,18,2,e,y,1a,1,7,1,5,1",
+    "top": "h,2o,6,s,22,h,w,3,4,d,g,2,1i,7,6,4a,a,1,1n,i",
+    "tor": "1,1,3,2,2,1,4,2,1,1,3,3,1,1,2,3,2,1,2,1,1,4,2,1,1,2,1,1,1,1,3,3,1,1,1,2,3,1,6,2,4,4,9,1,1,2,1,8,3,3,2,1,1,1,1,1,1,1,1,3,1,1,1,1,1,1,1,1,1,1,1,4,1,1,2,1,3,2,2,1,1,1,4,3,3,1,2,2,2,1,3,1,1,1,1,1,1,2,1,3,5,1,3,1,1,1,1,4,2,4,1,1,2,1,2,1,1,1,1,1,1,1,1,1,3,3,1,1,1,1,1,1,1,1,1,1,1,1,2,3,4,2,5,7,1,1,1,2,1,2,1,1,2,1,1,1,1,1,1,2,1,1,1,2,2,1,4,6,1,1,1,4,1,1,1,2,3,3,1,1,1,1,1,1,1,1,3,1,2,1,1,4,1,1,2,1,3,1,1,5,2,2,1,3,1,2,1,4,1,2,2,1,1,1,3,3,1,2,2,6,2,6,1,2,4,3,3,n,1,1,4,1,1,3,2,1,1,1,2,3,3,2,1,3,1,2,5,6,2,1,1,1,2,1,1,1,2,3,3,4,3,1,3,1,1,3,1,1,2,3,1,2,1,2,1,3,1,1,1,5,2,2,2,1,2,1,2,1,1,3,2,1,3,2,2,1,2,1,4,1,2,4,3,3,1,1,2,1,1,3,1,1,1,2,2,3,1,1,2,2,1,1,2,1,2,3,2,1,1,1,1,1,1,1,2,1,1,1,1,1,4,1,1,1,2,3,2,4,1,1,2,1,1,1,3,2,3,1,1,1,1,3,1,1,1,2",
+    "tos": "1,l,5,1,3,4,p,1,1,h,9,2,a,2,1,1,5,6,c,3,1,2,9,2,8,6,4,c,2,2,2,7,1,3,3,1,1,c,1,5,4,5,6,b,1,4,e,2,3,1,n,4,8,1,1,7,7,9,9,4,1,d,1,6,r,1,3,1,a,b,11,2,4,4,1,4,3,4,5,4,1,a,f,3,3,d,1,7,4,k,e,b,8,6,a,f,7,h,j,1,a",
+    "tot": "ev",
+    "tox": "6,n,s,r,u,f,1l,2,2,5,1p,7,3,a,e,17,l,1,13,2a,j,2z,1f,y",
+    "tra": "5,7,6,a,7,1,3,k,1,1,2,1,5,2,2,1,1,3,1,1,3,3,1,4,1,2,1,4,2,6,3,2,2,3,3,7,2,1,1,3,1,1,1,2,1,4,1,1,2,3,1,2,2,3,3,4,1,4,1,2,5,1,4,1,c,1,4,2,3,3,1,1,3,2,2,3,1,2,2,3,2,2,1,4,3,2,2,2,1,4,3,1,2,7,5,1,1,1,1,1,5,3,1,7,b,2,3,3,9,5,3,1,4,2,6,2,b,5,9,1,2,3,2,2,3,4,4,2,8,5,1,9,2,o,3,4,2,8,2,4,9,4,5,1,1,2,4,2,3,5,8,5,3,1,1,1,5,1,1,1,2,1,1,2,1,4,a,4,f,6,1,3,4,1,2,2,1,1,6,c,1,9,c,5,4,1,1,3,3,1,1,1,2,1,1,6,1,3,1,2,1,2,3,1,4,1,1,1,1,1,1,2,1,2,4,1,1",
+    "tre": "16,q,q,6,8,1u,5,8,1,8,h,h,1,4,f,b,b,2,5,w,w,3,g,3,5,4,8,4,j,18,2,v,6,8,k,e,2,2,9,1,1,12,1,g,8,6,9,l,d,2,1,2,1,1,b,3,2,2,4,1,2",
+    "tri": "7,g,9,2,2,1,3,4,5,b,1,3,4,2,5,2,1,4,1,4,5,1,2,8,7,1,1,1,2,2,8,5,1,3,2,3,1,1,1,7,1,3,1,1,1,3,1,4,3,1,2,1,3,2,2,3,1,5,2,2,3,2,1,4,2,1,2,3,2,2,2,2,1,1,3,1,1,4,8,1,3,2,2,3,1,4,8,7,8,3,2,2,2,4,1,9,1,1,2,3,1,3,1,4,1,2,9,8,1,1,1,5,3,2,8,3,p,2,4,3,1,2,2,4,7,1,1,2,1,1,1,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,2,6,3,3,2,1,1,1,2,2,2,1,3,2,2,6,5,2,3,2,2,1,3,1,2,2,3,1,2,2,3,1,5,1,1,1,3,3,1,3,4,1,8,1,1,2,2,1,9,2,6,1,3,1,1,7,3,4,p,2,c,3,4,1,2,1,4,1,1,g,5,2,2,4,2,2,8",
+    "tro": "6,1,1,q,b,2,8,5,k,e,9,4,y,1e,i,d,1,o,l,x,1,7,3,7,c,h,2,1,f,l,2,2,q,q,1,1,2,2,6,a,1,4,3,1,1,2,1,2,c,t,6,q,1,3,d,4,1,r,i,b,3,8,1a",
+    "tru": "1g,1,4,u,24,3,7,c,2,e,1,1s,14,g,m,e,v,t,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,w,2,i,2c,34",
+    "try": "dy",
+    "tta": "l,f8,m",
+    "tte": "9o",
+    "tu ": "34,5l,9y,c",
+    "tu.": "av,59",
+    "tua": "1w,k,8,32,8p,3c",
+    "tub": "6d,1o,7,1,1,1,1,1,1,7,1,v,1c,q",
+    "tuc": "2s,8h",
+    "tud": "9l,3k",
+    "tul": "3l,d7,4,1j",
+    "tum": "t,2,x,1,20,m,1e,3,2,x,1,2p,j,4,4,1,3,2,2,1,2,7,n,19,w,2f,12,9,5,8,g,j",
+    "tun": "2x",
+    "tup": "89",
+    "tur": "h,3,7,5,9,4,d,s,q,l,c,c,5,1,19,j,i,a,f,t,3,8,l,q,k,i,9,2,4,7,10,2,6,5,c,2,2,4,3,8,f,6,2,m,e,3,1,3,17,1,c,1m",
+    "tus": "2,q,b,o,1l,18,9,5,2,1,1,k,2,3,3,p,b,f,1u,7,h,2,e,7,1,3,4,8,1o,1p,e,13,e,1k,1,4,2,1,4,16",
+    "tut": "59",
+    "tyc": "dx",
+    "tyl": "8f,al",
+    "u (": "8p",
+    "u a": "1p,2,10,q,19,t,r,a,e,15,p,6,x,j,7,b,q,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,d,v,4,16,1t,a,15,14",
+    "u b": "8t",
+    "u c": "2a,10,1l,1m,y,n,1d,n,1,1,2,2,2,4,y,8,w,j,3,1,5,3,5,4,9,v,l,m,2c,w",
+    "u d": "2q",
+    "u e": "3a,22,w,10,3,2z,c,19,a,7,n,1,g,j",
+    "u f": "1o,h,37,75,11,7",
+    "u g": "63,6i",
+    "u h": "2p",
+    "u i": "gd",
+    "u j": "cw,c",
+    "u k": "34,fj,c",
+    "u m": "d0",
+    "u n": "9n,14",
+    "u o": "1s",
+    "u p": "65,2v,3,16,3,9,1z,3,n,6",
+    "u r": "14,ac,72",
+    "u s": "6g,11,1g,1r,8,i,1h",
+    "u t": "1s,3i,4k,n",
+    "u u": "24,10,v,17,2,2,5,1z,2i,7",
+    "u-s": "2t",
+    "ua\n": "bk",
+    "ua ": "2m,5,2z,6x",
+    "ua'": "bj",
+    "ua,": "bf",
+    "ua.": "8m,2y",
+    "uac": "1l,b,j,l,25,1e,v,71,4r",
+    "uaj": "4g,7z",
+    "ual": "1g,1,t,2,4,3,5,19,w,s,1,v,17,u,12,e,3s,41",
+    "uam": "59,80,4h",
+    "uan": "1t,53,5s,5,h,11,31,16",
+    "uar": "20,4b,1,58,4q",
+    "uas": "bb,1,5",
+    "uat": "7x,3e,1,1,1,1,3,3,8,e,z",
+    "uav": "b,2,q,9,1,9,1l,1,3,10,6,4,i,d,7,5,w,4,h,7,10,2,f,1,2,2,6,3,3,d,1,1c,3,d,12,5,3,6,g,1,3,c,1,5,2,4,2,h,1p,4,t",
+    "uay": "4g,1g,6j,m,w",
+    "uba": "4u,4",
+    "ube": "x,o,2b,2h,11,l,2,7,1,1,1,1,1,1,7,1,v,1c,q,46,u,11",
+    "ubi": "52,7i,f",
+    "ubl": "g7",
+    "ubr": "2n,2g,59,3i,c,l,2d",
+    "ubt": "7h",
+    "ubu": "dq,2,3,k,1,e,9,1,1",
+    "uca": "j,d,9,m,h,k,h,3,3,d,9,5,f,m,n,7,c,h,16,1,8,5,7,w,n,e,r,18,o,3,1,1,3,f,o,1,e,c,7,k,e,6,q,e,8,b,j,1,g",
+    "ucc": "w,37,1w,1b,q,7,2g,5,1j,3a,c,1,k,9,16",
+    "uce": "j,d,9,3,j,b,1,1,7,r,7,4,2,d,t,z,g,k,j,16,4,q,e,n,c,2,t,7,x,1,6,7,b,1w,y,k,q,4,a,8,g,1,3,1,1,6,1,1,1,7,2,1,3,1,2",
+    "uch": "19,11,u,y,b,3j,i,7,m,s,1j,1u,2y,18,1l",
+    "uci": "1d,4p,2,k,b,w,7,9,2,p,4,6,q,5,3,4,1,q,4,17,6,1,s,4,d,2,19,d,k,u,k,9,7,1,h,6",
+    "uck": "f7",
+    "uco": "9,13,1,u,f,e,24,y,g,1a,3,g,l,6,c,e,z,9,1r,1m,6,4,8,40",
+    "uct": "1j,6,7a,1,13,b,3,5,8a,a",
+    "ucu": "27,1r,16,z,f,1l,8,l,27,1q,1k,6,e,e,s,1i,3,1,1,2,3,1,1,2,1,1,1,1,1,1,1,1,1",
+    "ud ": "6h,1l,1,20,c,l,1,1,5,a,u,3,3,3,3,2,1,4,3,3,1,2,2,1,1,1,1,1,2,1,1,14,5,j,2,2,1,2,1,1,1,2,3,1,m,1f,s,8,3,5,2,2,2,3,2,1",
+    "ud,": "as,24",
+    "ud.": "20,19,8,ex",
+    "uda": "6,3,5,5,2,4,7,7,2,7,9,1,m,5,6,i,2,2,g,e,a,1,b,1c,f,7,s,3,r,2,2,1j,k,5,1,4,c,i,1,2,l,9,7,2,3,2,g,7,1,1,3,1,7,3,7,5,a,1,e,1,a,1,7,6,2,1,5,1,1,4,1,4,c,3,7,3,4,3,3,5,9,r,y",
+    "ude": "2r,8,9m",
+    "udi": "15,z,20,5h,3k",
+    "udo": "a,w,4,3p,5,2,1k,a,o,r,m,5,3m,1b,a,h,24,14",
+    "udu": "j3",
+    "ue ": "4,2,h,2,1,3,c,j,1,1,1,2,1,5,1,1,1,3,1,2,1,2,3,3,3,7,1,a,1,n,7,i,g,8,7,7,1,4,1,3,3,4,3,1,f,1,7,g,3,10,2,3,t,i,1,j,6,3,7,3,2,6,7,5,1,3,1,2,1,3,r,1,1,1,4,3,2,2,1,1,1,4,2,3,1,1,2,1,1,3,1,c,t,b,d,7,a,6,1,6,1,7,1,1,1,4,1,a,7,5,3,4,9,4,3,2,2,5,2,d,1,4,1,6,7,9,3",
+    "ue,": "3w",
+    "ueb": "42,4",
+    "uec": "ff,4,1,3",
+    "ued": "15,14,6,1,l,1s,8,h,4,f,3l,1a,h,2v,1e,7,j,8",
+    "uef": "j5",
+    "ueg": "aj",
+    "uel": "6,e,18,u,i,54,4,2e,2s,2v,d",
+    "uem": "6w,44,6w,6,12",
+    "uen": "5,d,5,w,u,s,8,11,5,1,2,8,6,4,7,3,4,e,6,b,4,i,14,4,5,2,7,1,a,2,1,1,a,8,h,r,9,3,4,5,12,3,3,1,1,2,2,5,5,4,3,4,1,1,1,1,6,a,6,6,6,y,2,4,3,2,h,7,f,18,6,e,a,5,1,6",
+    "ueo": "hc",
+    "uer": "3,1h,1c,u,6,1,k,10,o,1,18,6,f,1a,q,c,8,8,1,6,o,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,5,4,3,3,2,3,2,4,4,12,2g,f,10,8,9,8,1",
+    "ues": "21,2,q,w,2g,1v,24,k,2,4,e,9,11,1,9,4,2,d,2,d,q,n,1,1,1i,1e",
+    "uet": "9v,64",
+    "uev": "n,13,96,1w,1v,40,c,3",
+    "uez": "e9,16,4,1,3,o,5,o,2",
+    "ufa": "at,k",
+    "ufe": "ac",
+    "ufi": "50,27,8z",
+    "ufo": "7g",
+    "ufr": "2t,a",
+    "uga": "17,a,1b,1p,47,h,w,18,4u,20",
+    "uge": "cx",
+    "ugl": "3s,86,2b,16",
+    "ugn": "f1",
+    "ugo": "c,h,6,4,f,29,d,8,1,2,q,1,3,1,d,7,1i,w,11,3,32,5,1,c,1,b,9,g,b",
+    "ugu": "9v",
+    "ui-": "2t",
+    "uib": "14,6q",
+    "uid": "14,2g,2g,1b,6g,1i",
+    "uif": "26,37,1r,1l,6a,3g",
+    "uil": "5m,u,32,5,12,i,6j,s",
+    "uim": "3t,5a",
+    "uin": "1q,9,d,1s,15,o,1q,1g,1,44,g,5,l,1m,35,3",
+    "uir": "27,o,a",
+    "uis": "10,b,h,41,12,4m",
+    "uit": "6j,2i,d,f",
+    "uiz": "ag",
+    "uje": "1g,hq",
+    "uji": "83,5,e,2o,1u,14",
+    "ujo": "2l,2v,2r,2m,3j,e",
+    "ul ": "ax",
+    "ula": "1,9,2,6,1,4,4,4,1,1,8,3,6,1,1,1,1,2,1,5,6,2,1,1,4,5,3,8,c,3,b,1,4,3,1,1,1,1,6,2,1,7,1,4,e,4,1,1,2,c,6,1,6,3,1,1,2,3,e,1,4,1,2,5,2,1,4,1,1,1,5,3,9,3,1,1,1,3,1,2,1,1,1,1,1,1,4,1,1,1,2,2,2,2,2,5,1,1,1,1,1,4,1,3,1,b,1,7,3,1,1,1,3,5,2,7,3,1,1,1,1,1,1,1,3,1,1,2,1,1,1,1,2,2,1,2,2,5,1,2,1,2,1,19,1,2,3,2,4,1,1,1,4,2,2,5,2,1,1,1,2,2,1,1,4,2,3,1,a,1,1,a,6,1,1,3,2,2,4,1,a,2,4,6,4,3,1,f,1,2,1,1,1,1,4,2,1,1,7,2,8,3,7,1,2,2,2,4,8,9,7,1,8,1,1,2,1,4,4,2,1,2,2,2,1,2",
+    "ulb": "6t,1d",
+    "ulc": "15,1i,h,l,g,6,1x,1d,a,6,2,2,7,a,2j,2,14,3,3,1,1,1,2,2,3,1,1,1,1,2,9,1,2,1,1,5,5,2,5,5,2,16,9,1v,8,1e,2",
+    "ule": "28,2,2q,w,7,a,s,19,7,l,5,d,j,l,60,t,3,1,1,2,3,1,1,2,1,1,1,1,1,1,1,1,1,w",
+    "ulg": "2,1,b,f,o,e,6,n,2f,2,2,i,18,5,10,2w,42,r,10,3,1",
+    "uli": "2v,1,13,4a,d,1h,a,f,2,3,1j,g,6,b",
+    "ull": "6b,20,7r,8",
+    "ulm": "x,i,18,20,3t,9,q,4g,k,42",
+    "uln": "57,69",
+    "ulo": "1j,6i,7,1,2,1,1,1,8,v,8,1,1d,g,2",
+    "ulp": "ao,1n,8,1,2,1,1,4,2,1,5,6,3,1",
+    "ulq": "hq",
+    "uls": "9,q,d,1a,2,1b,5t,1a,5u,1j",
+    "ult": "1u,4,16,5,7,1,w,27,1u,4y,1,1p,3c,4",
+    "ulu": "c,2,15,8,x,o,7,v,17,9,10,2w,61,f,l,2g",
+    "ulv": "b9",
+    "ulz": "15,6g,58",
+    "um ": "0,3,3,1,1,3,2,1,1,4,1,9,1,a,5,3,e,2,1,5,3,4,8,2,1,8,i,1a,f,c,3,b,8,3,l,6,6,2,1,4,2,6,2,1,d,1,1,4,2,a,7,h,d,2,9,3,7,2,7,5,a,o,4,6,3,u,4,5,k,3,m,l,a,1,h,1,1,5,8,5,1,1,2,2,1,a,5,1,7,4,1,1,1,4,1,3,1,1,6,5,3,9,8,j,3,g",
+    "um)": "32,6s",
+    "um-": "w,26,cw,k",
+    "uma": "h,2h,1z,6,s,1,3,1,5,1d,i,k,27,b,1r,3u,i,3,10,c",
+    "umb": "9c,13,r,4t,5,1q",
+    "ume": "w,1c,2,g,4i,i,1,b,4,9,1,6,1,h,11,6,14,1,2,r,o,f,2m,1,8,b,13,7,g,3,1,1,4,1,1,h,1,6",
+    "umi": "f,5q,1f,1q,3c,p,a,27,b,8,c,2",
+    "umn": "ht,5",
+    "umo": "v,1n,1b,4v,1g,4,4,1,3,2,2,1,2,7,29,h,3j,m,g,j",
+    "umq": "bt,1d",
+    "umu": "1j,1s,s,5n",
+    "un ": "b,1,1,5,c,a,5,d,4,b,4,1,6,4,4,5,1,f,6,c,2,4,8,4,1,4,1,4,1,1,2,1,1,1,4,2,2,3,6,1,1,2,6,2,6,4,1,2,1,1,3,1,6,2,2,1,2,1,2,4,4,2,3,2,1,8,6,1,2,5,1,8,h,2,1,4,6,4,2,5,3,3,1,6,1,6,5,3,2,2,3,1,3,2,1,1,6,6,3,b,1,1,3,6,3,6,4,3,1,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,5,3,3,3,5,3,4,1,2,1,1,1,1,1,2,1,1,6,3,1,1,1,1,1,5,8,1,5,1,3,1,d,1,4,5,1,7,3,7,5,d,1,7,1,1,a,2,6,1,1,1,3,5,3,1,2,1,2,2,1,1,1,1,1,8,2,b,8,8,5,c",
+    "un,": "6i,52,1r,10",
+    "una": "1b,d,1,1,4,4,4,4,5,2,1,3,1,1,2,1,2,1,2,1,2,7,1,1,4,1,2,10,9,5,e,1,8,1,1,j,4,1,5,1,2,1,2,j,1,4,4,9,l,5,7,2,2,2,5,1,2,7,9,9,3,6,6,4,1,4,m,3,9,i,u,1,1,1,1,2,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,2,3,1,2,1,1,m,c,j,a,3,2,2,4,5,7,1,6,3,3,2,3,2,3,9,1,g,7,2,j,i,b,1,1,7",
+    "unc": "c,2i,5,38,1c,6,2,g,i,z,i,2v,1h,x,4,2s,1,1,4,3,2,1,4,8,1,2,6",
+    "und": "2x,l,34,15,q,4,z,d,13,h,11,4,d,6,5,q,5,2c,16,o,8,2,n",
+    "une": "v,v,2u,e,i,2l,f,1,1n,4,5,3,5,7,24,3,18,e,4,42,d",
+    "ung": "3,1y,1f,c,9,d,15,1j,2e,10,3t,2m",
+    "uni": "2q,1p,9,9,4,n,4i,h,4,7,1d,1,1,1,1,2,1,1,1,5,1,3,3,3,2,1,4,4,4,2,6,3,5,6,6,c,1j,19,2,5",
+    "unm": "h5",
+    "uno": "v,n,r,j,7,j,1t,8,n,1,7,8,x,1,3,4,1,4,5,e,1,1,6,c,5,t,5,1,1,4,3,1,1,2,1,5,2,1,4,2,3,1,o,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,p,q,b,c,7,4,2,1g,6,13,w,3,2,1,1,2,5,2,1,1,b,1,1,1,2",
+    "unq": "5n,1h,21,3j,3b",
+    "unt": "hm,8,f",
+    "unu": "4b,96,1,1,1,c,1,6,h,u",
+    "unz": "50",
+    "uon": "58",
+    "uos": "39,9,9m,64",
+    "upa": "11,2x,2d,2l,61,1d",
+    "upe": "t,7f,33,2b,16",
+    "uph": "i5",
+    "upi": "89",
+    "upl": "2n",
+    "upo": "2g",
+    "upr": "3m,c0,2l,1,p",
+    "upu": "1j,87,36,2",
+    "ur ": "46,1s,68,2v,2f,19",
+    "ur)": "hg",
+    "ura": "7,a,3,5,7,9,4,j,6,6,6,4,f,5,1,5,2,f,4,c,4,8,5,1,3,d,7,7,y,c,6,3,4,3,3,5,4,3,6,1,b,6,5,3,6,2,3,9,9,3,3,a,7,3,k,i,9,1,1,1,3,7,10,2,6,5,4,8,2,2,3,1,3,3,3,5,1,b,8,m,e,3,1,3,n,k,1,c,h,8,6,8,1,m",
+    "urb": "fb",
+    "urc": "h,5o,1d,95,i,1f",
+    "ure": "7,2,5,b,2,3,k,1,7,6,5,1,2,5,1,1,4,1,1,3,8,d,a,9,1,e,e,b,6,2,1,1,1,1,3,1,b,1,c,1,j,b,8,5,4,2,1,3,1,9,3,1,1,4,2,4,5,1,1,1,6,2,g,9,1,1,4,1,2,2,2,e,1,5,a,4,9,m,4,3,3,s,1,k,7,9,2,1,1,2,5,3,3,2,1,1,1,5,1,1,1,1,2,3,2,1,1,1,8,1,2,4,1,s,c,7,2,h,f,3,g,1a",
+    "urg": "14,12,k,2k,a,2a",
+    "uri": "19,j,d,s,1n,a,1,2,1,5,7,o,j,17,1j,m,8,g,24,3,k,b,a,e,e,3,5,2h,a,1n",
+    "urm": "8m",
+    "urn": "5a,b,7,81,l,4f",
+    "uro": "3f,3,p,11,10,d,g,1g,8,u,i,5,4,4,8,9,d,2,24,e,7,c,12,2,t,24,a,g",
+    "urp": "2c,4v,g,1h,s",
+    "urr": "4v",
+    "urs": "3d,1h,29,7b,f,a,1l",
+    "urt": "2b,4v,48,3n",
+    "uru": "9,3q,ct",
+    "urv": "6l,1,15,9s,s,4,5,2,4,b,1,1,3,1",
+    "us ": "1,1,7,d,3,3,6,c,9,5,3,4,4,8,1,3,2,1,4,4,1,1,2,1,3,2,5,4,1,1,1,2,1,1,2,3,2,1,1,1,1,1,2,1,2,1,1,1,1,1,1,1,3,8,2,1,3,1,1,1,1,1,1,1,1,3,1,3,1,1,1,1,1,1,2,2,1,1,1,5,1,8,1,2,2,2,8,g,2,2,5,2,1,3,2,7,b,3,c,1,6,1,3,2,2,2,a,3,1,1,3,1,2,3,4,1,1,1,4,2,3,6,1,1,1,1,2,4,1,5,4,5,2,1,3,3,1,1,1,1,1,1,3,1,8,2,9,5,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,5,1,2,4,5,5,2,5,2,1,2,2,2,1,2,1,1,1,1,1,3,3,2,3,1,1,4,1,1,2,2,1,3,2,2,1,3,1,1,1,7,1,2,1,1,5,1,1,7,2,2,6,f,1,4,7,4,b,1,1,e,2,b,1,1,4,1,1,1,4,7,6,2,1,2,3,1,4,1,1,5,1,2,6,2,1,1",
+    "us,": "3x",
+    "us-": "4t,t,c0,8",
+    "usa": "t,5,4,2,3,c,4,u,2,1,1,1,5,d,2,m,p,b,5,2,7,1,2,1,3,4,3,7,1,3,1,2,3,r,2,9,1,9,5,a,2,1,e,9,6,7,1,9,1,3,1,2,5,1,5,1,5,6,i,k,2,1,c,4,1,1j,7,6,b,6,b,2,f,3,1,3,2,1,p,6,3,5,1,1,y,3,6,4,2,1,1a",
+    "usc": "x,n,1q,a,1g,l,1s,9,w,l,m,2r,39,u,1s,a,b,5",
+    "use": "i,5m,2f,83,h,1i",
+    "usg": "b5,7q",
+    "ush": "b1",
+    "usi": "2,8,i,r,q,g,b,e,2d,l,7,9,7,a,1f,f,3,2,1,1,j,5,1a,2k,1g,g,1a,28",
+    "uso": "24,1v,17,1,1,2,5,2,1x,1y,k,7,2c",
+    "usp": "5c",
+    "ust": "1,m,3,16,c,b,d,3,1q,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,2,1,1,4,1,1,9,7,5,3,1,3,4,6,s,3,o,5,13,19,16,3z,24,g",
+    "usu": "2u",
+    "uta": "1l,4,m,8,25,2q,1z,1t,15,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,3,2,6,2,1,2,1,1,6,3,1,1,2,4,1,5,2,4,3d",
+    "ute": "1n,1b,2n,p,1o,n,2,1c,q,24,1,w,12,q,4,2r",
+    "uth": "8n,9q",
+    "uti": "a,1,6,g,3,9,g,5,2,7,4,2,1,5,3,5,2,3,1,1,1,2,1,1,1,4,5,5,1,3,1,1,2,2,3,2,1,1,3,2,2,3,2,1,1,3,1,1,4,5,2,2,2,8,4,d,4,2,b,4,1,2,1,2,2,1,2,1,3,1,2,2,2,1,1,1,3,1,1,1,1,2,4,2,2,1,2,2,5,1,1,1,1,1,1,1,1,2,3,1,1,1,1,4,c,1,2,1,3,2,b,8,8,f,c,2,2,2,2,4,1,l,e,s,4,7,5,2,2,2,2,3,6,4,1,6,7,2,6,5,1,4,2,2,7,1,1,1,3,5,b,6,f,7,j,1,2,3,e,9,1,a,4,1,2,2,3,2,1,2,1,1,1,2,2,1,1,2,1,1,1,2,1,1,1,1,1,1,4,1,1,1,2,1,2,1,1,1,5,1",
+    "uto": "25,1t,4,d,3,e,2,9,1,1,2,1,2,2,d,9,4,4,7,5,1v,31,4,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1i,3,6,1,1,2,2,2,2,1,9,1,b,4,g,i,2r",
+    "utr": "7,z,s,c,d,g,e,p,4,1,l,f,11,8,g,q,b,9,1,1,2,3,1,3,1,1c,y,1,2,2,4,9,4,1,12,6,2,1,4,2,3,7,d,e,8,11,1,1,2,2,c,7,3,1,1,a,o,1g,7,6",
+    "utt": "9o",
+    "utu": "4k,e,99,e",
+    "uum": "gk,h",
+    "uus": "95,12,55,3s",
+    "uva": "4u,j,8b,g,6,j,6,11",
+    "uve": "hj,s,s,3",
+    "uvi": "bh",
+    "uxi": "5x",
+    "uxu": "56",
+    "uy ": "7,8,16,2,b,2,1,7,8,1,9,h,2,1,1,v,5,5,9,7,4,4,2,1,1,3,4,1,2,2,1,9,1,3,2,m,4,2,8,6,1,1,4,3,2,h,c,h,1,2,o,n,7,9,6,4,1,f,16,4,2,9,1,1,1,9,a,5,7,2,7,2,1,2,3,q,m,k,n,3,e,a,1,6,2,w,d,1",
+    "uya": "3e,1g,3,2,4,1,5,c,2,2,5,5,1,n,2,3,2,5,2,3,4,5,3,4,1,1,2,1,1,2,3,5,6,h,1,3s,5u,4,j",
+    "uye": "22,4,65,2e,4,1v,8,4t,6,5",
+    "uyo": "35,1m,5,f,5,1t,9,c,3,b,at",
+    "uzg": "4t",
+    "uzu": "bv",
+    "va\n": "0,4,1,6,d,2,1,b,5,4,b,2,4,1e,1t,1l,3,5,8,5,1,3,8,7,1,4,1,6,1,1,3,5,9,1,1,1,4,n,6,5,b,1,x,c,6,3,1,s,1,1,f,2,7,3,2,4,r,q,h,2,4,3,a,1,1,1,1,1,1,2,3,1,b,19,3,l,b,1",
+    "va ": "7,16,l,2,i,p,13,n,8,8,e,2,e,h,7,5,s,i,s,k,1n,2,7,z,1,g,q,l,1,j,6,9,k,8,p,8,1,1k,9,5,9,1",
+    "va)": "hk",
+    "va,": "32,44,14,b,4,42,10,59",
+    "va-": "4u,9a,6,j",
+    "va.": "7j,w,1r,y,4j,3l",
+    "vac": "25,2q,o,y,l,6r,l,6,4,i,1",
+    "vad": "9w,18,5g,1y",
+    "vai": "gl,x",
+    "val": "m,y,h,16,a,1u,19,9,f,e,24,5,8,b,7,b,i,5,x,s,17,41,8,1,9",
+    "van": "n,11,6,2,2u,15,13,1u,7t",
+    "vap": "31",
+    "var": "26,8,f,q,3,2n,u,13,2,1j,1o,2,2f,1,2,f,g,1c,v,24,1",
+    "vas": "0,y,f,g,6,a,2,h,e,2,a,3,1,n,j,7,p,t,4,8,8,k,b,u,c,b,b,f,x,e,1c,a,c,a,2,5,8,17,s,8,i,1r,2",
+    "vat": "3r,cg,1w",
+    "vav": "7v",
+    "ve\n": "13,a,1v,1d,17,1h,1p,2,b,1t,1i,v,3,c,1,3g",
+    "ve ": "b,2,a,1h,t,1k,4,i,1d,g,d,3,10,4,h,3,8,m,1d,1n,i,4,17,33,x,c,3",
+    "ve,": "d0",
+    "ve.": "1m,56,o,44,1x,1a",
+    "vea": "fw",
+    "vec": "2e,n",
+    "ved": "6l,1,15,9s,s,4,5,2,4,b,1,1,3,1",
+    "veg": "19,6,3w,44",
+    "vej": "4v,3m,2m,1z,c,n",
+    "vel": "j,2w,d,3,q,36,m,v,w,9,1,4,4,2x,i,1f",
+    "ven": "1q,2,d,h,i,f,c,10,5,7,9,4,9,o,e,c,g,1h,h,6,5,6,2q,11,j,2,2,8,2,1g,1d,g,c,o,4,3",
+    "veo": "8,1d,u,1,3,4r,1,3,s,1c,68,7,13,7",
+    "ver": "c,7,a,6,c,1,5,1,7,p,8,m,l,m,2,o,5,2,r,i,4,k,3,22,4,4,6,g,7,i,1,3,3,5,18,6,h,1,8,b,4,3,3,1k,6,9,2,4,9,c,p,3,5,4,3,3,6,2,c,4,4,l",
+    "ves": "5,18,5,1a,f,4,c,1t,4,3,11,l,y,v,f,r,d,5,d,1l,13,1,k,8,a,2e,o,9",
+    "vez": "1u,7w,37,6",
+    "via": "4,4,1,1,5,6,2,a,2,6,a,7,z,c,1,9,1,1,1,a,2,2,l,b,9,2,8,e,5,a,8,c,9,1,4,4,5,2,z,1,j,e,3,2,2,1,h,8,1,k,l,c,1a,7,f,v,6,s,3,g,1,1,2,1,1,k,4,3,2,1,2,1,5,1,1,1,2,5,h,5,b,2,e,1,6,3,1,1,1,1,a",
+    "vib": "5a,b",
+    "vid": "3h,3n,2s,d,c,5,4,1,7k,1,q",
+    "vie": "y,13,g,2s,k,3y,5n,2m",
+    "vif": "f7",
+    "vil": "18,67",
+    "vin": "do,2c",
+    "vio": "o,2,d,8,3b,6,10,n,d,h,a,8,6,r,4,1,1,3,1,1,1,1,7,5,5,4,3,h,17,1j,2h,18,e,1b,j,3,5,1",
+    "vir": "o,4,12,y,u,j,m,b,2,2,6,v,1,a,e,p,2,9,10,8,p,1,9,4,2,s,4,1i,c,1e,6,25,1h,m,3",
+    "vis": "t,1,19,3c,5,x,7,17,6,2,3d,1e,d,d,9,l,b",
+    "vit": "7,6,w,m,q,1d,l,a,3,f,3,2,6,o,4,8,k,d,i,2,1,4,3,a,a,c,s,r,6,1,4,9,4,8,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,2,1,1,1,5,5,3,2,2,5,1,2,1,1,2,1,6,4,1,2,1,2,1,1,3,1,1,1,1,1,1,1,1,3,1,1,3,1,1,1,4,1,3,1,3,3,1,1,1,3,1,1,1,1,5,2,2,1,j,1g,u,g,2,f",
+    "viu": "dj",
+    "viv": "8b,9d,c",
+    "viz": "1c,1,1u,3h,1u,k,q,2z",
+    "vo\n": "6,2,1,3,1,1,1,1,2,3,1,3,3,2,3,1,5,e,c,5,c,5,1,1,5,2,b,3,6,9,4,e,7,4,1,b,b,8,1,2,a,m,f,6,2,5,e,1,m,1,8,2,1,2,3,1,f,f,k,4,z,1v,3,1,3,5,5,1,u,1m,q,1,1,7,1,1,1,1,5,2,1,4,2,5,4,1g,5,6,1",
+    "vo ": "d,7,6,1w,t,r,y,9,f,v,p,j,g,1m,1,2,8,o,1p,i,1y,1c,13,19,4",
+    "vo)": "5d",
+    "vo,": "65,16,q,d,m,10",
+    "vo.": "7,n,3h,3v,25,b,x,10,a,1a,p,2e",
+    "voc": "96",
+    "vol": "b1,56",
+    "vom": "58",
+    "von": "1v,5l,8s",
+    "vor": "1p,n,c,1,4,f,c,8u,3,1,3",
+    "vos": "4,1,3,e,2,e,5,3p,9,3,a,j,2,p,5,a,m,4,e,8,3s,4,2l,r,3,3,i,1,6,b,6,3,6,x,c,c",
+    "vue": "8c",
+    "vul": "2,1,b,f,o,e,6,l,2,2f,2,2,i,18,5,10,2w,i,3k,r,10,3,1",
+    "vum": "6,1k,53,91,w,y",
+    "vus": "m,7l,1q,6k",
+    "wag": "7r,ak",
+    "wai": "hf",
+    "wak": "b0",
+    "was": "16,fw",
+    "wee": "bz",
+    "weg": "17",
+    "wi ": "cp,10",
+    "wia": "d1",
+    "wie": "4c",
+    "wil": "hr",
+    "win": "42",
+    "wit": "7r,ak",
+    "wle": "i4",
+    "wol": "ab",
+    "wor": "i2",
+    "x a": "23,3,17,1g,6,n,1i,7d",
+    "x b": "i5",
+    "x d": "45,2,a",
+    "x g": "29,45,15,ar",
+    "x o": "8k,8y",
+    "x p": "20,4c",
+    "x q": "j5",
+    "x r": "f5",
+    "x s": "73",
+    "xac": "1y,52,p",
+    "xal": "8c",
+    "xan": "14,9,u,9,a,1,a,6,14,6,4,n,f,11,16,g,2,q,1y,4,1i,3,2,m,3,1,1,2,3,2,3,4,1,2,5,4,2,18,p,1e,7",
+    "xce": "5,9,a,d,a,1,28,r,4,4,x,a,3,7,2,6,s,1f,6,i,c,7,1,2,4,3,5,l,g,1b,6,e,3,c,8,5,2,i,e,p,3,4,8,5,v,7,h,1l",
+    "xci": "bd,7s",
+    "xel": "3t",
+    "xic": "t,6,m,1l,20,2,2,5,c,1,4,2,1,15,a,o,1e,1,d,1,4,z,27,3l,w,j,4,k,a",
+    "xid": "1,2,e,5,14,5,4,1,1,4,g,k,5,5,2,1,7,q,a,6,g,k,5,4,1,2,3,2,5,3,2,5,a,1,e,1,1,1,1,h,1,1,2,3,4,1,i,t,9,2,8,3,3,1,4,4,2,1,1,1,1,1,1,1,1,1,5,7,9,4,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,5,1,2,1,1,1,2,2,1,1,1,3,1,1,2,2,3,1,2,1,1,1,2,2,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,2,1,3,2,2,1,1,1,1,2,3,1,1,2,1,2,1,1,5,1,1,2,1,1,1,1,3,1,1,2,2,1,1,3,5,2,5,1,1,2,5,1,3,2,3,3,1,2,2,1,3,2,a,3,9,5,1,7,3,h,6,5,1,8,6,4",
+    "xif": "99,3z",
+    "xig": "2w,8o,6n,1",
+    "xil": "5x",
+    "xin": "6,26,18,1,3q,d,3a,2t",
+    "xot": "6f,62,1,2,3v,18,19",
+    "xpe": "2,7,5,2,5,4,1,2,1,4,c,1,2,a,1,4,4,t,c,8,4,b,1,3,8,8,1,2,7,4,g,i,5,2,4,4,b,9,1,5,1,5,3,o,8,2,1,1,7,3,i,7,5,4,2,3,3,1,e,1,7,15,9,1d,w,b,a,5,1g,2,k,4,5,3,1,2,f,2,8,1,1b,2",
+    "xpl": "d6",
+    "xpo": "8c",
+    "xpu": "9,q,d,1c,1b,5t",
+    "xte": "53,4,1,9,3t,11,15,2t,1g,u",
+    "xto": "2s",
+    "xtr": "1z,4,1q,3,8,n,h,t,8,7,r,5o,j,1c,1a,8,13,f",
+    "xtu": "8b,b,1v,r,2,20,y",
+    "xud": "49",
+    "xus": "3t,1d",
+    "xyl": "hc",
+    "y a": "1,2,3,3,4,8,2,9,3,d,a,4,5,c,1,p,1,5,5,1,1,1,a,4,a,1,6,8,c,3,3,1,v,5,7,c,6,j,1,2,4,1,2,2,a,7,3,1,3,4,1,1,1,7,7,1,1,1,c,m,1,8,9,3,7,5,3,3,1,1,6,1a,5,5,3,8,1,1,1,4,3,1,7,c,1,2,6,1,2,2,1,5,4,1,b,c,5,2,a,c,m,5,5,6,4,5,2,1,2,8,o,4,d,1,6,8,3",
+    "y b": "13,y,4,2z,l,t,1o,1a,1a,p,1w,10",
+    "y c": "g,h,1,8,a,3,e,1,i,1,4,5,4,18,n,2,6,4,1,5,1,6,3,3,b,e,4,8,7,1,2,5,a,4,4,b,h,f,l,8,7,v,2,3,1,1,n,3,4,y,1,1,3,2,4,5,2,6,a,6,7,5,7,v,5,2,3,e,2,7,6,c,3,n,c,3,3,4,3,q,h",
+    "y d": "4,3,n,1d,5,2,4,j,5,f,1n,g,1n,a,i,3,1,3,5,2,9,c,1,24,1,16,5,2,9,3,e,5,b,5,b,8,l,5,15,c,4,1j,l",
+    "y e": "6,f,t,6,j,o,i,x,a,1,j,3,1,2,f,9,5,1,f,1,a,8,b,d,2,b,1,1,5,a,1,3,9,1,1,2,3,8,2,9,2,1,2,1,b,h,2,c,1j,6,7,1,3,1,i,4,5,m,10,5,n,6,1,j,3,3,2,9,e,4,4,j,1,1,6,6,2,2,5,7",
+    "y f": "2c,2a,3a,b,6,h,4,16,7,25,c,2,9,3,6,e,5,2,7,6,2,d,d,7,20,2,c,15,b",
+    "y g": "55,1l,2e,b,6o",
+    "y h": "3m,11,b,9,3u,5j,1m",
+    "y j": "88,4b,1,1o",
+    "y k": "f4",
+    "y l": "b,1,2,n,4,5,1,2,2,5,f,5,3,8,9,8,b,4,4,3,1,4,3,4,1,3,a,1,2,1,9,1d,1,f,5,4,1,1,2,9,1,2,g,7,8,6,g,4,1,a,2,9,4,d,2,5,3,4,c,6,5,d,16,q,1,2,2,1,c,1,1,3,4,3,d,5,1,4,1,4,g,1,6,5,4,2,1,4,4,1,1,d,5,b,3,1,1,d,4,3,1,8,n,1,4,1,1,1,2,2,4,2,4,3,2,1,6",
+    "y m": "f,3,k,t,e,1,1a,20,a,g,1,6,p,j,t,5,1j,4,n,c,5,z,q,7,r,7,3,3,q,a,2,5,3,1c,11,5,4,2,b,b,7",
+    "y n": "7,j,18,28,5,h,4,1g,o,11,9,q,u,2r,6,2,2k,1q,1i",
+    "y o": "8,k,4j,7,b,e,o,s,3g,2l,z,q,2q",
+    "y p": "f,9,7,n,3,f,m,2,c,4,a,6,2,2,f,a,e,9,8,5,2,3,2,h,2,f,3,2,5,2,1,1,1,2,5,2,4,2,8,d,2,5,3,6,4,2,1,c,6,2,5,3,c,h,z,7,4,1,v,k,1,b,1,1,k,t,4,h,j,3,r,4,g,8,8,2,8,p,2,1",
+    "y q": "1p,c,g,35,1a,b0,6",
+    "y r": "0,a,x,1,f,f,3,3,1k,w,9,7,7,5,f,9,i,4,p,a,6,1b,e,i,5,8,23,g,j,d,2,6,3,1,1,9,j,2,m,c,6,a,1k,c,f",
+    "y s": "1z,j,8,b,6,3,7,h,7,r,a,u,6,e,9,a,b,3,o,6,7,a,6,8,1,a,m,b,7,4,4,3,e,4,4,t,5,7,5,3,1,1,3,5,3,1,3,4,2,m,5,1,1,a,c,4,a,s,a,4,4,s,3,1,2,7,16,1,7",
+    "y t": "c,7,8,9,h,9,x,14,4,14,18,v,9,5,7,7,h,b,1y,e,a,1,a,22,1,5,s,5,3,5,s,7,2,5,j,g,14,o",
+    "y u": "d,w,e,1m,w,5,9,6,h,7,l,a,i,1d,b,t,3b,3,3,m,f,1g,2s,8,l",
+    "y v": "2m,l,28,5,1n,1,2a,13,1x,5,27,n,3m",
+    "y y": "4w,85",
+    "y z": "2z,cj,k,1b",
+    "y\" ": "aw",
+    "y. ": "f3",
+    "ya ": "4z,a,c,2,2,b,n,l,5,7,1,1,2,2,2,8,6,h,1,t,2v,g,h,p,r,3,3,1,4,2,i,2q,5,g,2,4,3,1,1,1",
+    "ya,": "cg,2",
+    "yab": "4g,7z,m",
+    "yac": "da",
+    "yan": "1e,4a,3n,65,2o",
+    "yar": "9n,s",
+    "yas": "3e,1g,3,6,1,9,h,5,j,7,3,2,5,2,3,c,9,6,6i,g,2,4,1,2a,14",
+    "ybe": "f5",
+    "yca": "dx",
+    "yce": "a5,7o,o",
+    "ych": "5h",
+    "yci": "ep",
+    "ycl": "b7",
+    "ycy": "7l,9o,1o",
+    "ydo": "62,7j",
+    "ydr": "7s",
+    "ye ": "22,4",
+    "yem": "3n,l,6,i",
+    "yen": "1u,5w,l,2e,4,1v,8,45,o,6,5,i",
+    "yer": "6c",
+    "yes": "aj",
+    "yga": "8p",
+    "ygi": "k,ck,39",
+    "yin": "8h",
+    "yll": "35,3h,2m,18,1v,z,1s,15,1s,r",
+    "ylo": "4u,3e,7,43,2b,2u,1d",
+    "ylu": "3v,a6,1f,1w",
+    "ylv": "1d,1u,g,4,2x,2e",
+    "yma": "17",
+    "ymb": "13,4g",
+    "ymi": "f,fd,x",
+    "ymp": "bd",
+    "ymu": "2,1t,3d,1p,9x",
+    "yna": "2t,11,y,4x,57",
+    "yng": "am",
+    "yo ": "4r,2r,c,3,b,2q,1,4,7y",
+    "yod": "az,7,1v",
+    "yop": "98",
+    "yor": "10,4j,9c,1f,v",
+    "yos": "35,1r,f,5,1t,45,5",
+    "yot": "hr,7",
+    "ype": "1t,53",
+    "ypo": "af,5k",
+    "ypt": "1r,1l,2i,10",
+    "yra": "b1",
+    "yrc": "cz,3",
+    "yri": "e8,28,o",
+    "yro": "dz",
+    "yrr": "7l,9o,1o",
+    "yrt": "25,2w,n,t,7c,l",
+    "yru": "4o,8s,s",
+    "ys ": "42,4k",
+    "ysa": "99,3w",
+    "yse": "f3",
+    "ysi": "1b",
+    "yso": "cb",
+    "ysp": "z,gg",
+    "yss": "s,91",
+    "yst": "2i,4v,5v",
+    "yth": "5c,4p",
+    "yti": "5f",
+    "yub": "4u,4",
+    "yuc": "28,3r,e,1n,l,9c",
+    "yud": "6,3,5,5,2,4,7,7,2,7,a,m,5,q,2,g,e,m,1c,1e,u,2,2,1j,k,a,c,j,w,9,3,2,n,1,4,1,7,3,7,5,a,1,e,1,a,1,d,2,6,1,1,4,h,3,7,3,4,3,3,5,9,1p",
+    "yul": "5w",
+    "yur": "6l,1,15,9s,s,4,5,2,4,b,1,1,3,1",
+    "yuz": "bv",
+    "yx ": "hi",
+    "yzy": "k,ck,39",
+    "z c": "i,3m,6,1u,1f,k",
+    "z d": "4f,1i,1o,e,3,2,e,12,5z,4,o,2m",
+    "z e": "14,3v,q,2b,69,30",
+    "z f": "8h",
+    "z g": "86",
+    "z l": "dp",
+    "z m": "1u,64,8i,o,2",
+    "z n": "ii",
+    "z p": "8,48,k,u,2d,17,7,5z,n,h,6,h",
+    "z r": "5d,d",
+    "z s": "5z,o,q,7,2,2,2,2,4,9,i,1,49,22,3b",
+    "z t": "6d,1x,6,5,4i",
+    "z u": "6e,26,5,a3",
+    "z, ": "14,3d,14,7x",
+    "z. ": "d7",
+    "z: ": "dz",
+    "za\n": "dd",
+    "za ": "x,f,1,c,e,k,5,2,5,e,b,2,4,1,1,4,4,1,4,3,3,8,m,c,2,c,o,g,8,9,1,1,2,2,t,3,1,6,9,7,a,9,2,l,5,y,4,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,2,3,2,2,3,1,2,2,5,2,2,3,1,p,1,4,2,2,8,g,8,3,e,r,3,q,n,3,2,1,1,1,2,5,2,2,3,f,4",
+    "za\"": "aa,8r",
+    "za)": "dm",
+    "za,": "9q,6d",
+    "za.": "4",
+    "zac": "18,5d,42,80,c",
+    "zad": "x,3,17,2,1,5,8,2,4,2,2,1,b,7,2,1,1,2,5,2,9,5,5,1,5,7,2,2,8,4,h,2,f,1,2,1,2,2,1,2,1,3,1,2,5,1,4,1,2,7,2,3,2,2,5,4,4,2,3,1,1,1,1,4,c,4,5,j,8,r,2,2,8,m,1q,v,t,3,3,8,10,k,5,o,a,4,1,2,2,5,a,1,1,2,5,2,1,1,1,1,4,1,1,1,2,1,2,1,2,5",
+    "zaf": "m,9b,6k,o",
+    "zah": "4m,4c",
+    "zaj": "im",
+    "zal": "53,6i",
+    "zam": "dv,z",
+    "zan": "n,9,9,3,g,1,7,d,6,3,2,a,6,4,3,7,1,g,3,7,3,6,5,4,1,2,1,9,2,9,6,c,4,4,2,5,2,1,3,7,3,1,3,3,1,3,2,5,3,2,4,1,5,2,2,1,d,2,1,4,1,f,1,j,8,5,i,i,4,j,2,5,4,r,1,2,c,2,2,3,5,8,1,3,1,2,9,a,a,4,1,4,1,2,5,h,2,2,4,4,1,2,2,9,3,8,9,2,r,6,3,3,4,1,2,1,5,1,6,6,u",
+    "zap": "4z,3l,4a",
+    "zar": "4x,2,f,2,1,g,b,2a,2,5b,7,s,4a",
+    "zas": "59",
+    "zcl": "2i,5s,4i",
+    "zea": "fi",
+    "zei": "ac",
+    "zem": "6n",
+    "zga": "4t",
+    "zhi": "av",
+    "zia": "90",
+    "zib": "cl",
+    "zim": "cc,1,3f",
+    "zin": "i,1c,4a,1d,1z,5v,r,k,r,18",
+    "zmi": "8u,10",
+    "zno": "dh,f,1",
+    "zo ": "8f,2d,b,7x",
+    "zo,": "8f,7p",
+    "zo.": "cu",
+    "zof": "ag",
+    "zol": "bl",
+    "zom": "7h,1,c,3,m,2x,75,f",
+    "zon": "e,28,d,v,b,n,m,1,3,p,1,1,1,1,e,2j,h,6,1k,12,2,e,2,p,l,n,e,4,1,1,7,4,4,u,m,6,1a",
+    "zop": "ag",
+    "zos": "eg",
+    "zot": "z,50",
+    "zte": "9h",
+    "zu ": "bv,15",
+    "zuc": "j,d,9,2a,d,t,3g,8,5,13,n,e,1z,o,4,1,16,1,e,c,7,k,e,6,q,e,8,u,1,g",
+    "zue": "2m,84",
+    "zul": "96,5,d,19",
+    "zum": "h8",
+    "zyg": "k,ck,39",
+    "× i": "f3",
+    "× l": "f4",
+    "“ar": "3h,d",
+    "” p": "3h",
+    "”, ": "3u",
+  },
+};
+
+export const indiceBusquedaEnfermedades: IndiceBusqueda = {
+  total: 469,
+  huella: "60dad39b67d7ff44",
+  campos: ["nombre","otrosNombres","descripcion"],
+  pesos: [8,4,1],
+  normalizados: [
+    ["asma","asma bronquial","enfermedad cronica que causa inflamacion y estrechamiento de las vias respiratorias."],
+    ["bronquitis aguda","resfriado de pecho","inflamacion de los conductos bronquiales, generalmente causada por una infeccion."],
+    ["neumonia","pulmonia","infeccion que inflama los sacos de aire en uno o ambos pulmones."],
+    ["enfermedad pulmonar obstructiva cronica (epoc)","epoc","enfermedad pulmonar inflamatoria cronica que causa la obstruccion del flujo de aire de los pulmones."],
+    ["rinitis alergica","fiebre del heno","reaccion alergica que provoca estornudos, congestion y picazon en la nariz."],
+    ["sinusitis","infeccion de los senos paranasales","inflamacion de las cavidades alrededor de las fosas nasales."],
+    ["faringitis","dolor de garganta","inflamacion de la faringe, que se encuentra en la parte posterior de la garganta."],
+    ["laringitis","inflamacion de la laringe","inflamacion de la laringe por uso excesivo, irritacion o infeccion."],
+    ["traqueitis","infeccion de la traquea","infeccion bacteriana de la traquea que puede causar obstruccion de las vias respiratorias."],
+    ["tuberculosis","tb","enfermedad infecciosa que suele afectar a los pulmones."],
+    ["fibrosis pulmonar","cicatrizacion de los pulmones","enfermedad pulmonar que se produce cuando el tejido pulmonar se dana y se cicatriza."],
+    ["apnea del sueno","sindrome de apnea del sueno","trastorno del sueno potencialmente grave en el que la respiracion se detiene y recomienza repetidamente."],
+    ["cancer de pulmon","carcinoma de pulmon","cancer que comienza en los pulmones y que con mayor frecuencia ocurre en personas que fuman."],
+    ["embolia pulmonar","tromboembolismo pulmonar","bloqueo en una de las arterias pulmonares en los pulmones."],
+    ["hipertension pulmonar","presion arterial alta en los pulmones","tipo de presion arterial alta que afecta las arterias de los pulmones y el lado derecho del corazon."],
+    ["derrame pleural","agua en los pulmones","acumulacion de liquido en el espacio entre las capas de la pleura."],
+    ["neumotorax","pulmon colapsado","un pulmon colapsado ocurre cuando el aire se filtra en el espacio entre el pulmon y la pared toracica."],
+    ["bronquiectasia","dilatacion bronquial","afeccion en la que las vias respiratorias de los pulmones se ensanchan de forma permanente."],
+    ["sarcoidosis","","enfermedad inflamatoria que afecta a multiples organos del cuerpo, pero mas comunmente a los pulmones y los ganglios linfaticos."],
+    ["fibrosis quistica","mucoviscidosis","trastorno hereditario que causa danos graves en los pulmones, el sistema digestivo y otros organos del cuerpo."],
+    ["resfriado comun","catarro","infeccion viral de la nariz y la garganta (vias respiratorias superiores)."],
+    ["gripe","influenza","enfermedad respiratoria contagiosa provocada por los virus de la influenza."],
+    ["virus sincitial respiratorio","vsr","virus comun que causa infecciones de los pulmones y las vias respiratorias."],
+    ["adenovirus","","grupo de virus que pueden causar infecciones en las vias respiratorias, los ojos, los intestinos y el tracto urinario."],
+    ["rinovirus","","la causa mas comun del resfriado comun."],
+    ["parainfluenza","","grupo de virus que causan infecciones de las vias respiratorias superiores e inferiores."],
+    ["metapneumovirus","","virus que causa infecciones de las vias respiratorias superiores e inferiores."],
+    ["crup","laringotraqueobronquitis","infeccion de las vias respiratorias superiores que obstruye la respiracion y causa una tos perruna caracteristica."],
+    ["tos ferina","pertussis","infeccion de las vias respiratorias altamente contagiosa."],
+    ["difteria","","infeccion bacteriana grave que puede afectar las membranas mucosas de la nariz y la garganta."],
+    ["edema pulmonar","","afeccion causada por un exceso de liquido en los pulmones."],
+    ["sindrome de dificultad respiratoria aguda","sdra","afeccion pulmonar grave que causa niveles bajos de oxigeno en la sangre."],
+    ["atelectasia","","colapso completo o parcial de todo el pulmon o de una parte (lobulo) del pulmon."],
+    ["hemoptisis","toser sangre","expulsion de sangre o esputo con sangre de los pulmones o las vias respiratorias."],
+    ["disnea","falta de aliento","sensacion de falta de aliento o dificultad para respirar."],
+    ["hipoxia","bajo nivel de oxigeno en la sangre","condicion en la que el cuerpo o una region del cuerpo se ve privada de un suministro adecuado de oxigeno a nivel tisular."],
+    ["mesotelioma","","tipo de cancer que se desarrolla a partir de la delgada capa de tejido que cubre muchos de los organos internos."],
+    ["aspergilosis","","infeccion causada por un tipo de moho (hongo)."],
+    ["silicosis","","enfermedad pulmonar causada por la inhalacion de polvo de silice."],
+    ["asbestosis","","enfermedad pulmonar cronica causada por la inhalacion de fibras de asbesto."],
+    ["gastritis","inflamacion del estomago","inflamacion del revestimiento del estomago."],
+    ["ulcera peptica","ulcera de estomago\nulcera duodenal","llaga abierta en el revestimiento del estomago o el duodeno."],
+    ["enfermedad por reflujo gastroesofagico (erge)","reflujo acido\nacidez estomacal","el acido del estomago fluye hacia el esofago, causando irritacion."],
+    ["colitis ulcerosa","cu","enfermedad inflamatoria intestinal que causa inflamacion y ulceras en el tracto digestivo."],
+    ["sindrome del intestino irritable (sii)","colon irritable","trastorno que afecta al intestino grueso, causando calambres, dolor abdominal, hinchazon, gases y diarrea o estrenimiento."],
+    ["enfermedad de crohn","","enfermedad inflamatoria intestinal que causa inflamacion del tracto digestivo, que puede provocar dolor abdominal, diarrea intensa, fatiga, perdida de peso y desnutricion."],
+    ["hemorroides","almorranas","venas hinchadas en el ano y la parte inferior del recto, similares a las venas varicosas."],
+    ["estrenimiento","","afeccion en la que una persona tiene deposiciones infrecuentes o dificultad para defecar."],
+    ["diarrea","","heces blandas y liquidas con mas frecuencia de lo habitual."],
+    ["hepatitis","inflamacion del higado","inflamacion del higado, generalmente causada por una infeccion viral."],
+    ["cirrosis hepatica","enfermedad hepatica en etapa terminal","cicatrizacion tardia (fibrosis) del higado causada por diversas formas de enfermedades hepaticas y otras afecciones."],
+    ["pancreatitis","inflamacion del pancreas","inflamacion del pancreas."],
+    ["enfermedad celiaca","enteropatia sensible al gluten","reaccion inmunitaria al comer gluten, una proteina que se encuentra en el trigo, la cebada y el centeno."],
+    ["intolerancia a la lactosa","","incapacidad para digerir completamente el azucar (lactosa) en los productos lacteos."],
+    ["diverticulosis","","afeccion en la que se forman pequenas bolsas o sacos en la pared del colon."],
+    ["diverticulitis","","inflamacion o infeccion de una o mas bolsas (diverticulos) en la pared del colon."],
+    ["apendicitis","","inflamacion del apendice, una bolsa en forma de dedo que se proyecta desde el colon en el lado inferior derecho del abdomen."],
+    ["calculos biliares","colelitiasis","depositos duros de liquido digestivo que pueden formarse en la vesicula biliar."],
+    ["colecistitis","inflamacion de la vesicula biliar","inflamacion de la vesicula biliar, un pequeno organo en forma de pera en el lado derecho del abdomen, debajo del higado."],
+    ["disfagia","dificultad para tragar","dificultad para tragar alimentos o liquidos, que surge de la garganta o el esofago."],
+    ["indigestion","dispepsia","malestar en la parte superior del abdomen, descrito como ardor, hinchazon o gases, nauseas o sensacion de saciedad demasiado rapido despues de comenzar a comer."],
+    ["gastroenteritis","gripe estomacal","inflamacion del revestimiento de los intestinos causada por un virus, una bacteria o parasitos."],
+    ["hernia de hiato","","afeccion en la que la parte superior del estomago se abulta a traves del diafragma hacia la cavidad toracica."],
+    ["proctitis","","inflamacion del revestimiento del recto."],
+    ["fisura anal","","pequeno desgarro en el tejido delgado y humedo que recubre el ano."],
+    ["incontinencia fecal","","incapacidad para controlar las deposiciones, lo que provoca que las heces (materia fecal) se filtren inesperadamente del recto."],
+    ["polipos de colon","","pequeno grupo de celulas que se forma en el revestimiento del colon."],
+    ["cancer de colon","cancer colorrectal","tipo de cancer que comienza en el intestino grueso (colon)."],
+    ["cancer de estomago","cancer gastrico","crecimiento de celulas que comienza en el estomago."],
+    ["cancer de esofago","","cancer que ocurre en el esofago, un tubo largo y hueco que va desde la garganta hasta el estomago."],
+    ["cancer de higado","carcinoma hepatocelular","cancer que comienza en las celulas del higado."],
+    ["cancer de pancreas","","cancer que comienza en los tejidos del pancreas."],
+    ["esofagitis","","inflamacion que puede danar los tejidos del esofago."],
+    ["acalasia","","trastorno poco comun que dificulta el paso de alimentos y liquidos al estomago."],
+    ["gastroparesia","","afeccion que afecta el movimiento normal espontaneo de los musculos (motilidad) del estomago."],
+    ["linfangiectasia intestinal","","trastorno poco comun del tracto digestivo que causa perdida de proteinas."],
+    ["sindrome de dumping","","afeccion en la que los alimentos, especialmente los que tienen un alto contenido de azucar, se mueven desde el estomago hacia el intestino delgado con demasiada rapidez despues de comer."],
+    ["colangitis","","inflamacion de los conductos biliares."],
+    ["isquemia mesenterica","","afeccion que ocurre cuando los vasos sanguineos estrechos o bloqueados restringen el flujo sanguineo al intestino delgado."],
+    ["peritonitis","","inflamacion de la membrana que recubre la pared abdominal interna y cubre los organos abdominales."],
+    ["hipertension arterial","presion arterial alta","afeccion en la que la presion de la sangre hacia las paredes de la arteria es demasiado alta."],
+    ["ateroesclerosis","arterioesclerosis","acumulacion de grasas, colesterol y otras sustancias en las paredes de las arterias."],
+    ["cardiopatia isquemica","enfermedad coronaria","estrechamiento de las arterias coronarias, que suministran sangre al musculo cardiaco."],
+    ["infarto de miocardio","ataque al corazon","muerte del musculo cardiaco por la falta de irrigacion sanguinea."],
+    ["angina de pecho","angor pectoris","dolor en el pecho provocado por la reduccion del flujo sanguineo al corazon."],
+    ["insuficiencia cardiaca","fallo cardiaco","el corazon no puede bombear sangre rica en oxigeno de manera eficiente al resto del cuerpo."],
+    ["arritmia","latidos cardiacos irregulares","problema con la velocidad o el ritmo de los latidos del corazon."],
+    ["fibrilacion auricular","fa","ritmo cardiaco irregular y a menudo rapido que puede aumentar el riesgo de accidentes cerebrovasculares."],
+    ["bradicardia","ritmo cardiaco lento","frecuencia cardiaca mas lenta de lo normal."],
+    ["taquicardia","ritmo cardiaco rapido","frecuencia cardiaca mas rapida de lo normal."],
+    ["enfermedad valvular cardiaca","valvulopatia","una o mas de las valvulas del corazon no funcionan correctamente."],
+    ["endocarditis","infeccion del endocardio","infeccion del revestimiento interno de las camaras y valvulas del corazon."],
+    ["miocarditis","inflamacion del miocardio","inflamacion de la capa media de la pared del corazon."],
+    ["pericarditis","inflamacion del pericardio","inflamacion de la membrana delgada en forma de saco que rodea el corazon."],
+    ["cardiomiopatia","miocardiopatia","enfermedad del musculo cardiaco que dificulta el bombeo de sangre."],
+    ["aneurisma aortico","dilatacion de la aorta","ensanchamiento o abombamiento anormal de la arteria aorta."],
+    ["diseccion aortica","rotura de la aorta","desgarro en la capa interna de la arteria aorta."],
+    ["enfermedad arterial periferica","eap","estrechamiento de las arterias que reducen el flujo sanguineo a las extremidades."],
+    ["trombosis venosa profunda","tvp","formacion de un coagulo de sangre en una vena profunda, generalmente en las piernas."],
+    ["embolia pulmonar","tromboembolismo pulmonar","bloqueo de una arteria en los pulmones por un coagulo de sangre."],
+    ["accidente cerebrovascular","acv\nictus","dano al cerebro por interrupcion del suministro de sangre."],
+    ["hipertension pulmonar","presion arterial alta en los pulmones","tipo de presion arterial alta que afecta a las arterias de los pulmones y al lado derecho del corazon."],
+    ["cardiopatia congenita","defecto cardiaco de nacimiento","anomalia en la estructura del corazon presente al nacer."],
+    ["soplo cardiaco","murmullo cardiaco","sonido adicional o inusual que se escucha durante un latido cardiaco."],
+    ["sindrome de marfan","","trastorno hereditario que afecta el tejido conectivo, incluyendo el corazon y los vasos sanguineos."],
+    ["enfermedad de buerger","tromboangeitis obliterante","inflamacion y coagulacion en los vasos sanguineos de las manos y los pies."],
+    ["enfermedad de raynaud","fenomeno de raynaud","afeccion que causa que algunas areas del cuerpo se sientan frias y cambien de color en respuesta al frio o al estres."],
+    ["varices","venas varicosas","venas hinchadas y retorcidas que se pueden ver debajo de la piel."],
+    ["linfedema","obstruccion linfatica","acumulacion de liquido linfatico en los tejidos blandos del cuerpo."],
+    ["shock cardiogenico","choque cardiogenico","afeccion en la que el corazon de repente no puede bombear suficiente sangre para satisfacer las necesidades del cuerpo."],
+    ["paro cardiaco","muerte subita cardiaca","perdida inesperada de la funcion cardiaca, la respiracion y el conocimiento."],
+    ["anemia","","afeccion en la cual la sangre no cuenta con suficientes globulos rojos sanos."],
+    ["hemofilia","","trastorno hemorragico hereditario en el cual la sangre no coagula de manera adecuada."],
+    ["leucemia","cancer de la sangre","cancer de los tejidos que forman la sangre en el organismo."],
+    ["colesterol alto","hipercolesterolemia","niveles elevados de colesterol en la sangre, lo que aumenta el riesgo de enfermedades cardiacas."],
+    ["trigliceridos altos","hipertrigliceridemia","niveles elevados de trigliceridos en la sangre, lo que aumenta el riesgo de enfermedades cardiacas."],
+    ["diabetes mellitus","diabetes","enfermedad cronica que afecta la forma en que el cuerpo convierte los alimentos en energia."],
+    ["obesidad","","acumulacion excesiva de grasa corporal que puede aumentar el riesgo de problemas de salud."],
+    ["apnea del sueno","","trastorno del sueno en el que la respiracion se detiene y recomienza repetidamente."],
+    ["lupus eritematoso sistemico","les\nlupus","enfermedad autoinmune que puede afectar el corazon y los vasos sanguineos."],
+    ["migrana","hemicranea\njaqueca","dolor de cabeza pulsatil e intenso, generalmente en un lado de la cabeza."],
+    ["epilepsia","trastorno convulsivo","trastorno neurologico que causa convulsiones recurrentes."],
+    ["parkinson","mal de parkinson","enfermedad degenerativa que afecta el movimiento, causando temblores y rigidez."],
+    ["alzheimer","mal de alzheimer","enfermedad progresiva que destruye la memoria y otras funciones mentales importantes."],
+    ["esclerosis multiple","em","enfermedad en la que el sistema inmunologico degrada la cubierta protectora de los nervios."],
+    ["neuralgia","dolor neuropatico","dolor agudo y espantoso que sigue la ruta de un nervio y se debe a la irritacion o dano al nervio."],
+    ["neuropatia","neuropatia periferica","dano a los nervios fuera del cerebro y la medula espinal (nervios perifericos), que a menudo causa debilidad, entumecimiento y dolor, generalmente en las manos y los pies."],
+    ["vertigo","mareo","sensacion giratoria repentina que se inicia o empeora con el movimiento de la cabeza."],
+    ["insomnio","trastorno de insomnio cronico","trastorno del sueno en el que las personas tienen problemas para conciliar el sueno, permanecer dormidas o ambas cosas."],
+    ["accidente cerebrovascular (acv)","ictus\ninfarto cerebral\nderrame cerebral","dano al cerebro por interrupcion de su suministro de sangre."],
+    ["aneurisma cerebral","aneurisma intracraneal","un punto debil o delgado en una arteria del cerebro que se hincha o se abomba y se llena de sangre."],
+    ["tumor cerebral","neoplasia cerebral","crecimiento de celulas anormales en el tejido del cerebro."],
+    ["esclerosis lateral amiotrofica (ela)","enfermedad de lou gehrig","enfermedad del sistema nervioso que debilita los musculos y afecta las funciones fisicas."],
+    ["hernia de disco","disco deslizado\ndisco roto","problema con uno de los amortiguadores cartilaginosos (discos) entre los huesos individuales (vertebras) que se apilan para formar la columna vertebral."],
+    ["enfermedad de huntington","corea de huntington","enfermedad hereditaria que provoca el desgaste de algunas celulas nerviosas del cerebro."],
+    ["demencia con cuerpos de lewy","dcl","tipo de demencia progresiva que conduce a una disminucion de las capacidades de pensamiento, razonamiento y funcion independiente."],
+    ["ataxia de friedreich","aft","enfermedad hereditaria que causa dano progresivo al sistema nervioso."],
+    ["sindrome de la persona rigida","spr","trastorno neurologico raro con caracteristicas de una enfermedad autoinmune."],
+    ["encefalitis","inflamacion del cerebro","inflamacion del cerebro, a menudo debida a una infeccion."],
+    ["enfermedad de charcot-marie-tooth","cmt","grupo de trastornos hereditarios que causan dano a los nervios."],
+    ["enfermedades de las neuronas motoras","enm","grupo de enfermedades neurodegenerativas progresivas que atacan a las neuronas motoras."],
+    ["enfermedad de von hippel-lindau","vhl","trastorno hereditario caracterizado por el crecimiento de tumores y quistes en varias partes del cuerpo."],
+    ["enfermedades de la medula espinal","mielopatia","termino general para los trastornos de la medula espinal."],
+    ["absceso cerebral parasitario","neurocisticercosis","infeccion parasitaria del cerebro que puede causar convulsiones y otros sintomas neurologicos."],
+    ["absceso raquideo","absceso epidural espinal","acumulacion de pus en el espacio epidural que puede comprimir la medula espinal."],
+    ["accidente isquemico transitorio","ait","mini-accidente cerebrovascular; un breve bloqueo del flujo sanguineo al cerebro."],
+    ["adrenoleucodistrofia","ald","enfermedad genetica que afecta las glandulas suprarrenales y la materia blanca del cerebro."],
+    ["afasia","disfasia","trastorno del lenguaje que afecta la capacidad de comunicacion."],
+    ["laberintitis","neuronitis vestibular","trastorno del oido interno que causa vertigo, mareos y perdida del equilibrio."],
+    ["enfermedad de lafora","epilepsia mioclonica progresiva de lafora","forma rara y grave de epilepsia mioclonica progresiva."],
+    ["sindrome de landau-kleffner","afasia epileptica adquirida","trastorno neurologico infantil raro caracterizado por la perdida repentina o gradual de la capacidad para comprender y usar el lenguaje hablado."],
+    ["sindrome de leigh","encefalomielopatia necrotizante subaguda","trastorno neurometabolico hereditario raro que afecta el sistema nervioso central."],
+    ["leucoaraiosis","rarefaccion de la sustancia blanca","cambios en la sustancia blanca del cerebro que a menudo se observan en personas mayores."],
+    ["leucodistrofia metacromatica","ldm","enfermedad de almacenamiento lisosomico que causa la desmielinizacion del sistema nervioso."],
+    ["leucoencefalopatia","enfermedad de la sustancia blanca","termino amplio para las enfermedades que afectan la sustancia blanca del cerebro."],
+    ["ausencia del tabique pelucido","asp","ausencia del tabique pelucido, una membrana delgada en el centro del cerebro."],
+    ["enfermedad por deposito de lipidos acidos","enfermedad de wolman","enfermedad de almacenamiento lisosomico rara y grave."],
+    ["dolor de espalda","lumbalgia","dolor en la parte baja de la espalda."],
+    ["sindrome de barth","bths","trastorno genetico raro que afecta principalmente a los hombres y causa miocardiopatia, neutropenia y debilidad muscular."],
+    ["cadasil","arteriopatia cerebral autosomica dominante con infartos subcorticales y leucoencefalopatia","forma hereditaria de enfermedad cerebrovascular que ocurre cuando el engrosamiento de las paredes de los vasos sanguineos bloquea el flujo de sangre al cerebro."],
+    ["lupus","lupus eritematoso sistemico","enfermedad autoinmune sistemica que ocurre cuando el sistema inmunitario del cuerpo ataca sus propios tejidos y organos."],
+    ["artritis reumatoide","poliartritis cronica","trastorno inflamatorio cronico que puede afectar mas que solo las articulaciones."],
+    ["psoriasis","","afeccion de la piel que causa manchas rojas y escamosas que pican, principalmente en las rodillas, los codos, el tronco y el cuero cabelludo."],
+    ["vitiligo","","enfermedad que causa la perdida de color de la piel en parches."],
+    ["alergias","reacciones de hipersensibilidad","respuesta exagerada del sistema inmunitario a sustancias que normalmente son inofensivas."],
+    ["inmunodeficiencias","inmunosupresion","estado en el que la capacidad del sistema inmunitario para combatir enfermedades infecciosas y cancer esta comprometida o ausente."],
+    ["enfermedad celiaca","enteropatia sensible al gluten","reaccion inmunitaria al comer gluten, una proteina que se encuentra en el trigo, la cebada y el centeno."],
+    ["esclerosis multiple","em","enfermedad potencialmente incapacitante del cerebro y la medula espinal (sistema nervioso central)."],
+    ["enfermedad de graves","bocio difuso toxico","trastorno del sistema inmunitario que da como resultado la sobreproduccion de hormonas tiroideas (hipertiroidismo)."],
+    ["tiroiditis de hashimoto","tiroiditis linfocitica cronica","afeccion en la que el sistema inmunitario ataca la tiroides, una pequena glandula en la base del cuello."],
+    ["enfermedad de addison","insuficiencia suprarrenal","trastorno poco comun que ocurre cuando el cuerpo no produce suficiente cantidad de ciertas hormonas."],
+    ["miastenia gravis","","enfermedad neuromuscular que causa debilidad en los musculos esqueleticos."],
+    ["sindrome de sjogren","","trastorno del sistema inmunitario que se identifica por sus dos sintomas mas comunes: ojos y boca secos."],
+    ["esclerodermia","esclerosis sistemica","grupo de enfermedades raras que implican el endurecimiento y la tension de la piel y los tejidos conectivos."],
+    ["polimiositis","","enfermedad inflamatoria poco comun que causa debilidad muscular que afecta a ambos lados del cuerpo."],
+    ["dermatomiositis","","enfermedad inflamatoria poco comun marcada por debilidad muscular y una erupcion cutanea distintiva."],
+    ["diabetes tipo 1","diabetes insulinodependiente","afeccion cronica en la que el pancreas produce poca o ninguna insulina."],
+    ["enfermedad inflamatoria intestinal","eii","termino general que describe trastornos que involucran inflamacion cronica de su tracto digestivo."],
+    ["hepatitis autoinmune","","inflamacion del higado que ocurre cuando el sistema inmunitario ataca las celulas del higado."],
+    ["anemia perniciosa","","disminucion de los globulos rojos que ocurre cuando los intestinos no pueden absorber adecuadamente la vitamina b12."],
+    ["vasculitis autoinmune","","inflamacion de los vasos sanguineos que ocurre cuando el sistema inmunitario ataca los vasos sanguineos por error."],
+    ["sarcoidosis","","enfermedad inflamatoria que afecta a multiples organos del cuerpo, pero mas comunmente a los pulmones y los ganglios linfaticos."],
+    ["alopecia areata","","afeccion que causa la caida del cabello en pequenos parches, que pueden pasar desapercibidos."],
+    ["sindrome de guillain-barre","","trastorno poco comun en el que el sistema inmunitario ataca los nervios."],
+    ["purpura trombocitopenica idiopatica","pti","trastorno que puede provocar hematomas y sangrado faciles o excesivos."],
+    ["sindrome antifosfolipido","saf","trastorno en el que el sistema inmunitario ataca por error a las proteinas normales de la sangre."],
+    ["enfermedad de behcet","","trastorno poco comun que causa la inflamacion de los vasos sanguineos en todo el cuerpo."],
+    ["espondilitis anquilosante","","enfermedad inflamatoria que, con el tiempo, puede hacer que algunas de las vertebras de la columna se fusionen."],
+    ["artritis psoriasica","","forma de artritis que afecta a algunas personas que tienen psoriasis."],
+    ["artritis reactiva","sindrome de reiter","dolor e hinchazon en las articulaciones desencadenado por una infeccion en otra parte del cuerpo."],
+    ["fiebre reumatica","","enfermedad inflamatoria que puede desarrollarse como una complicacion de la faringitis estreptococica o la escarlatina no tratadas o tratadas de forma inadecuada."],
+    ["uveitis autoinmune","","inflamacion de la uvea, la capa media del ojo, que puede ser causada por una enfermedad autoinmune."],
+    ["penfigoide","","grupo de enfermedades autoinmunes raras de la piel que causan ampollas y erosiones en la piel y las membranas mucosas."],
+    ["liquen plano","","afeccion inflamatoria que puede afectar la piel, el cabello, las unas y las membranas mucosas."],
+    ["urticaria cronica idiopatica","uci","ronchas que duran mas de seis semanas y recurren con frecuencia durante meses o anos."],
+    ["diabetes mellitus tipo 2","diabetes del adulto\ndiabetes no insulinodependiente","trastorno metabolico caracterizado por hiperglucemia en el contexto de resistencia a la insulina y deficiencia relativa de insulina."],
+    ["diabetes mellitus tipo 1","diabetes juvenil\ndiabetes insulinodependiente","enfermedad autoinmune que destruye las celulas beta del pancreas, lo que lleva a una deficiencia absoluta de insulina."],
+    ["hipotiroidismo","tiroides hipoactiva","afeccion en la que la glandula tiroides no produce suficientes hormonas tiroideas."],
+    ["hipertiroidismo","tiroides hiperactiva\ntirotoxicosis","produccion excesiva de hormonas tiroideas por la glandula tiroides."],
+    ["sindrome de ovario poliquistico","sop\nanovulacion hiperandrogenica","trastorno endocrino comun en mujeres en edad reproductiva, caracterizado por periodos menstruales irregulares, exceso de androgenos y quistes en los ovarios."],
+    ["enfermedad de addison","insuficiencia suprarrenal primaria","trastorno en el que las glandulas suprarrenales no producen suficientes hormonas cortisol y aldosterona."],
+    ["enfermedad de graves","bocio difuso toxico","trastorno autoinmune que causa hipertiroidismo."],
+    ["enfermedad de cushing","hipercortisolismo","afeccion causada por la exposicion prolongada a altos niveles de cortisol."],
+    ["acromegalia","gigantismo en adultos","trastorno hormonal que se padece cuando la glandula pituitaria produce gran cantidad de hormona del crecimiento durante la edad adulta."],
+    ["enanismo","deficiencia de la hormona del crecimiento","baja estatura causada por una condicion genetica o medica."],
+    ["gigantismo","exceso de hormona de crecimiento en ninos","crecimiento anormalmente grande debido a un exceso de la hormona del crecimiento durante la ninez."],
+    ["prolactinoma","tumor hipofisario productor de prolactina","tumor benigno de la glandula pituitaria que produce un exceso de la hormona prolactina."],
+    ["sindrome metabolico","sindrome de resistencia a la insulina","conjunto de afecciones que aumentan el riesgo de enfermedad cardiaca, accidente cerebrovascular y diabetes tipo 2."],
+    ["obesidad","sobrepeso severo","acumulacion excesiva de grasa corporal que puede ser perjudicial para la salud."],
+    ["osteoporosis","enfermedad osea porosa","enfermedad que debilita los huesos, haciendolos fragiles y mas propensos a fracturarse."],
+    ["hiperparatiroidismo","","exceso de hormona paratiroidea en el torrente sanguineo debido a la hiperactividad de una o mas de las cuatro glandulas paratiroides."],
+    ["hipoparatiroidismo","","produccion insuficiente de hormona paratiroidea, lo que conduce a niveles bajos de calcio en la sangre."],
+    ["cancer de tiroides","","crecimiento maligno de celulas en la glandula tiroides."],
+    ["insulinoma","","tumor raro del pancreas que produce un exceso de insulina."],
+    ["glucagonoma","","tumor raro del pancreas que produce un exceso de la hormona glucagon."],
+    ["feocromocitoma","tumor de la medula suprarrenal","tumor raro de la glandula suprarrenal que produce un exceso de adrenalina y noradrenalina."],
+    ["diabetes insipida","","trastorno raro que causa un desequilibrio de liquidos en el cuerpo, lo que provoca sed intensa y miccion excesiva."],
+    ["tiroiditis de hashimoto","tiroiditis linfocitica cronica","trastorno autoinmune que es la causa mas comun de hipotiroidismo."],
+    ["ginecomastia","agrandamiento de las mamas en los hombres","agrandamiento del tejido mamario en hombres, causado por un desequilibrio hormonal."],
+    ["galactorrea","secrecion lactea del pezon","secrecion de leche por los pezones que no esta relacionada con la lactancia normal."],
+    ["pubertad precoz","","aparicion de los signos de la pubertad a una edad anormalmente temprana."],
+    ["retraso de la pubertad","","ausencia de los signos de la pubertad a una edad en la que normalmente se esperarian."],
+    ["sindrome de kallmann","hipogonadismo hipogonadotropico con anosmia","afeccion genetica que causa pubertad tardia o ausente y un sentido del olfato alterado."],
+    ["sindrome de turner","monosomia x","afeccion cromosomica que afecta el desarrollo en las mujeres."],
+    ["sindrome de klinefelter","47,xxy","afeccion genetica en la que un hombre nace con una copia extra del cromosoma x."],
+    ["hiperplasia suprarrenal congenita","hsc","grupo de trastornos geneticos hereditarios que afectan las glandulas suprarrenales."],
+    ["neoplasia endocrina multiple tipo 1","nem1\nsindrome de wermer","trastorno hereditario raro que causa tumores en varias glandulas endocrinas."],
+    ["neoplasia endocrina multiple tipo 2","nem2\nsindrome de sipple","trastorno hereditario que causa tumores en varias glandulas endocrinas y un alto riesgo de cancer medular de tiroides."],
+    ["bocio","agrandamiento de la tiroides","agrandamiento anormal de la glandula tiroides."],
+    ["resistencia a la hormona tiroidea","rht","trastorno genetico raro en el que los tejidos del cuerpo son resistentes a los efectos de las hormonas tiroideas."],
+    ["artritis","inflamacion articular\npoliartritis","inflamacion de una o mas articulaciones, que provoca dolor y rigidez."],
+    ["osteoporosis","huesos porosos\nperdida de masa osea","enfermedad que debilita los huesos, haciendolos fragiles y mas propensos a fracturarse."],
+    ["osteomalacia","reblandecimiento oseo\ndeficiencia de vitamina d","reblandecimiento de los huesos debido a una mineralizacion osea deficiente."],
+    ["sindrome del tunel carpiano","atrapamiento del nervio mediano\ncompresion del nervio mediano","afeccion que causa entumecimiento, hormigueo y debilidad en la mano y el brazo."],
+    ["tendinitis","inflamacion del tendon\ntendinopatia","inflamacion o irritacion de un tendon, las cuerdas fibrosas que unen el musculo al hueso."],
+    ["desgarro del manguito rotatorio","lesion del manguito de los rotadores\nruptura del manguito rotatorio","lesion en los tendones que rodean la articulacion del hombro."],
+    ["bursitis","inflamacion de la bursa\nhigroma","inflamacion de las bursas, pequenos sacos llenos de liquido que amortiguan los huesos, tendones y musculos cerca de las articulaciones."],
+    ["distrofia muscular","debilidad muscular progresiva\nmiopatia hereditaria","grupo de enfermedades geneticas que causan debilidad y perdida progresiva de la masa muscular."],
+    ["calambre muscular","espasmo muscular\nrampa","contraccion involuntaria y dolorosa de un musculo o grupo de musculos."],
+    ["enfermedades neuromusculares","trastornos neuromusculares\nmiopatias","amplio grupo de enfermedades que afectan los nervios que controlan los musculos voluntarios."],
+    ["esclerosis multiple","em\nenfermedad desmielinizante","enfermedad en la que el sistema inmunologico degrada la cubierta protectora de los nervios."],
+    ["fibromialgia","sindrome de fibromialgia\ndolor musculoesqueletico cronico","trastorno caracterizado por dolor musculoesqueletico generalizado acompanado de fatiga, sueno, memoria y problemas de estado de animo."],
+    ["miastenia grave","miastenia gravis\ndebilidad muscular autoinmune","enfermedad neuromuscular autoinmune que causa debilidad en los musculos esqueleticos."],
+    ["miositis","inflamacion muscular\nmiopatia inflamatoria","inflamacion de los musculos, que puede ser causada por una lesion, una infeccion o una enfermedad autoinmune."],
+    ["sarcoma de tejido blando","tumor de partes blandas\ncancer de tejido conectivo","tipo de cancer que se origina en los tejidos blandos del cuerpo, como musculos, grasa, vasos sanguineos, nervios, tendones y revestimiento de las articulaciones."],
+    ["enfermedad discal degenerativa","discopatia degenerativa\ndesgaste de disco intervertebral","afeccion en la que los discos intervertebrales de la columna se deterioran o rompen."],
+    ["epicondilitis","codo de tenista\nepicondilalgia","inflamacion de los tendones que unen los musculos del antebrazo con la parte exterior del codo."],
+    ["distension muscular","tiron muscular\ndesgarro muscular leve","lesion en un musculo o tendon, las fibras que conectan los musculos con los huesos."],
+    ["gota","artritis gotosa\nhiperuricemia","forma de artritis que se caracteriza por ataques repentinos y graves de dolor, hinchazon, enrojecimiento y sensibilidad en las articulaciones."],
+    ["espondilitis anquilosante","espondiloartritis anquilosante\nenfermedad de bechterew","tipo de artritis que causa inflamacion en las articulaciones de la columna vertebral."],
+    ["osteopenia","baja densidad osea\npre-osteoporosis","condicion en la que la densidad mineral osea es mas baja de lo normal, pero no lo suficiente como para ser considerada osteoporosis."],
+    ["lumbalgia","dolor de espalda baja\nlumbago","dolor en la parte baja de la espalda, que puede ser agudo o cronico."],
+    ["fracturas oseas","hueso roto\nruptura osea","rotura de un hueso, que puede ser completa o incompleta."],
+    ["escoliosis","curvatura de la columna\ndesviacion de la columna","curvatura lateral de la columna vertebral que ocurre con mayor frecuencia durante el periodo de crecimiento anterior a la pubertad."],
+    ["lupus eritematoso sistemico","les\nlupus","enfermedad autoinmune en la que el sistema inmunologico del cuerpo ataca por error el tejido sano."],
+    ["artritis reumatoide","ar\npoliartritis cronica","trastorno inflamatorio cronico que puede afectar mas que solo las articulaciones."],
+    ["artritis psoriasica","artropatia psoriasica\npsoriasis artropatica","tipo de artritis que afecta a algunas personas con psoriasis."],
+    ["ciatica","dolor del nervio ciatico\nradiculopatia ciatica","dolor que se irradia a lo largo del trayecto del nervio ciatico, que se ramifica desde la parte baja de la espalda a traves de las caderas y los gluteos y baja por cada pierna."],
+    ["quiste de baker","quiste popliteo\nbolsa de liquido detras de la rodilla","acumulacion de liquido articular que forma un bulto detras de la rodilla."],
+    ["dedo en gatillo","tenosinovitis estenosante\ndedo en resorte","afeccion en la que uno de los dedos queda atascado en una posicion de flexion."],
+    ["sindrome del tunel tarsiano","atrapamiento del nervio tibial\nneuralgia del nervio tibial posterior","compresion del nervio tibial en el tunel tarsiano, un pasaje estrecho dentro del tobillo."],
+    ["enfermedad de de quervain","tenosinovitis de de quervain\npulgar de esquiador","afeccion dolorosa que afecta los tendones de la muneca del lado del pulgar."],
+    ["esclerodermia","esclerosis sistemica\npiel dura","grupo de enfermedades raras que implican el endurecimiento y la tirantez de la piel y los tejidos conectivos."],
+    ["sindrome de ehlers-danlos","sed\nhiperlaxitud articular","grupo de trastornos hereditarios que afectan los tejidos conectivos, principalmente la piel, las articulaciones y las paredes de los vasos sanguineos."],
+    ["displasia fibrosa","trastorno oseo fibroso\nlesion fibro-osea","trastorno oseo poco comun en el que se forma tejido similar a una cicatriz (fibroso) en lugar de hueso normal."],
+    ["lesiones de la placa de crecimiento","fractura de la fisis\nlesion epifisaria","fracturas que afectan la placa de crecimiento o fisis, el area de tejido en crecimiento cerca de los extremos de los huesos largos en ninos y adolescentes."],
+    ["dolor de espalda","dorsalgia\ncervicalgia","dolor que se siente en la espalda, que puede provenir de los musculos, nervios, huesos, articulaciones o otras estructuras en la columna vertebral."],
+    ["osteoartritis","artrosis degenerativa\nenfermedad articular degenerativa","tipo mas comun de artritis, que ocurre cuando el cartilago protector que amortigua los extremos de los huesos se desgasta con el tiempo."],
+    ["artrosis","osteoartrosis\ndesgaste articular","enfermedad degenerativa de las articulaciones que se caracteriza por el desgaste del cartilago."],
+    ["contractura muscular","nudo muscular\npunto gatillo miofascial","contraccion persistente e involuntaria de un musculo o algunas de sus fibras."],
+    ["infeccion urinaria","infeccion del tracto urinario\nitu","infeccion en cualquier parte del sistema urinario, como la vejiga, los rinones, los ureteres o la uretra."],
+    ["cistitis","infeccion de vejiga","inflamacion de la vejiga, generalmente causada por una infeccion bacteriana."],
+    ["pielonefritis","infeccion renal","infeccion del rinon, un tipo de infeccion del tracto urinario que generalmente comienza en la uretra o la vejiga y viaja a uno o ambos rinones."],
+    ["calculos renales","nefrolitiasis\npiedras en el rinon","depositos duros de minerales y sales que se forman dentro de los rinones."],
+    ["incontinencia urinaria","perdida de control de la vejiga","perdida del control de la vejiga, que provoca una fuga involuntaria de orina."],
+    ["insuficiencia renal","fallo renal","afeccion en la que los rinones pierden la capacidad de filtrar adecuadamente los productos de desecho de la sangre."],
+    ["enfermedad renal cronica","erc","perdida gradual de la funcion renal con el tiempo."],
+    ["uretritis","inflamacion de la uretra","inflamacion de la uretra, el tubo que transporta la orina desde la vejiga hacia el exterior del cuerpo."],
+    ["nefritis","inflamacion del rinon","inflamacion de los rinones, que puede afectar su capacidad para filtrar la sangre."],
+    ["nefrosis","sindrome nefrotico","enfermedad renal no inflamatoria que se caracteriza por proteinuria, hipoalbuminemia y edema."],
+    ["hidronefrosis","rinon hinchado","hinchazon de uno o ambos rinones debido a la acumulacion de orina."],
+    ["vejiga neurogenica","disfuncion vesical neurogenica","disfuncion de la vejiga causada por un problema neurologico, como una lesion de la medula espinal o esclerosis multiple."],
+    ["nocturia","nicturia","necesidad de despertarse y orinar varias veces durante la noche."],
+    ["cistitis intersticial","sindrome de la vejiga dolorosa","afeccion cronica que causa presion y dolor en la vejiga, y a veces dolor pelvico."],
+    ["cancer de vejiga","","crecimiento de celulas anormales en el revestimiento de la vejiga."],
+    ["cancer de rinon","carcinoma de celulas renales","crecimiento de celulas anormales en los rinones."],
+    ["diabetes insipida","","trastorno que causa un desequilibrio de liquidos en el cuerpo, lo que provoca sed intensa y miccion frecuente."],
+    ["enfermedad poliquistica renal","pkd","trastorno genetico que se caracteriza por el crecimiento de numerosos quistes en los rinones."],
+    ["glomerulonefritis","","inflamacion de los pequenos filtros de los rinones (glomerulos)."],
+    ["sindrome nefrotico","","trastorno renal que hace que el cuerpo excrete demasiadas proteinas en la orina."],
+    ["estenosis de la arteria renal","","estrechamiento de las arterias que transportan sangre a los rinones."],
+    ["acidosis tubular renal","","enfermedad que ocurre cuando los rinones no logran excretar los acidos en la orina, lo que hace que la sangre permanezca demasiado acida."],
+    ["reflujo vesicoureteral","rvu","afeccion en la que la orina fluye hacia atras desde la vejiga hacia uno o ambos ureteres y, a veces, hacia los rinones."],
+    ["extrofia vesical","","anomalia congenita rara en la que la vejiga se desarrolla fuera del feto."],
+    ["hipospadias","","anomalia congenita en los varones en la que la abertura de la uretra no se encuentra en la punta del pene."],
+    ["epispadias","","anomalia congenita rara que afecta la abertura de la uretra."],
+    ["sindrome uremico hemolitico","suh","afeccion que puede ocurrir despues de una infeccion intestinal y que provoca insuficiencia renal."],
+    ["nefropatia por iga","enfermedad de berger","enfermedad renal que se produce cuando un anticuerpo llamado inmunoglobulina a (iga) se acumula en los rinones."],
+    ["vasculitis renal","","inflamacion de los vasos sanguineos de los rinones."],
+    ["estenosis uretral","","cicatrizacion que estrecha el tubo que transporta la orina fuera del cuerpo (uretra)."],
+    ["endometriosis","adenomyosis\nendometrioma","trastorno en el que el tejido que normalmente recubre el interior del utero crece fuera del utero."],
+    ["sindrome de ovario poliquistico (sop)","pcos\nsindrome de stein-leventhal","un trastorno hormonal comun entre las mujeres en edad reproductiva."],
+    ["enfermedad inflamatoria pelvica (eip)","salpingitis\nooforitis","infeccion de los organos reproductores femeninos."],
+    ["fibromas uterinos","leiomiomas\nmiomas","tumores no cancerosos del utero que a menudo aparecen durante los anos fertiles."],
+    ["cancer de ovario","carcinoma de ovario","un crecimiento de celulas que se forma en los ovarios."],
+    ["cancer de cuello uterino","cancer cervical","un tipo de cancer que se produce en las celulas del cuello uterino."],
+    ["prolapso de organos pelvicos","cistocele\nrectocele","ocurre cuando los musculos y ligamentos que sostienen los organos pelvicos de una mujer se debilitan."],
+    ["vaginosis bacteriana","vb","un tipo de inflamacion vaginal causada por el crecimiento excesivo de bacterias que se encuentran naturalmente en la vagina."],
+    ["candidiasis vaginal","infeccion por levaduras","una infeccion por hongos que causa irritacion, secrecion y picazon intensa en la vagina y la vulva."],
+    ["menopausia","climaterio","el momento que marca el final de los ciclos menstruales."],
+    ["sindrome premenstrual (spm)","tension premenstrual","un conjunto de sintomas fisicos y emocionales que comienzan una o dos semanas antes del periodo de una mujer."],
+    ["disfuncion erectil","impotencia","la incapacidad de conseguir o mantener una ereccion lo suficientemente firme para tener relaciones sexuales."],
+    ["prostatitis","inflamacion de la prostata","hinchazon e inflamacion de la glandula prostatica."],
+    ["hiperplasia prostatica benigna (hpb)","agrandamiento de la prostata","un agrandamiento no canceroso de la glandula prostatica."],
+    ["cancer de prostata","carcinoma de prostata","un cancer en la prostata de un hombre, una pequena glandula del tamano de una nuez que produce el liquido seminal."],
+    ["cancer de testiculo","carcinoma testicular","un crecimiento de celulas que se forma en los testiculos."],
+    ["varicocele","venas varicosas del escroto","un agrandamiento de las venas dentro de la bolsa de piel suelta que contiene los testiculos (escroto)."],
+    ["hidrocele","acumulacion de liquido en el escroto","un tipo de hinchazon en el escroto que ocurre cuando se acumula liquido en la delgada vaina que rodea un testiculo."],
+    ["epididimitis","inflamacion del epididimo","inflamacion del tubo en la parte posterior del testiculo que almacena y transporta los espermatozoides."],
+    ["orquitis","inflamacion de los testiculos","inflamacion de uno o ambos testiculos."],
+    ["infertilidad","esterilidad","no poder quedar embarazada (concebir) a pesar de tener relaciones sexuales frecuentes y sin proteccion durante al menos un ano."],
+    ["clamidia","infeccion por chlamydia trachomatis","una infeccion de transmision sexual (its) comun que puede infectar tanto a hombres como a mujeres."],
+    ["gonorrea","blenorragia","una infeccion causada por una bacteria de transmision sexual que infecta tanto a hombres como a mujeres."],
+    ["herpes genital","virus del herpes simple","una infeccion de transmision sexual (its) comun marcada por dolor y llagas en los genitales."],
+    ["virus del papiloma humano (vph)","hpv","una infeccion viral que se transmite entre personas a traves del contacto piel con piel."],
+    ["sifilis","lues","una infeccion bacteriana que generalmente se transmite por contacto sexual."],
+    ["tricomoniasis","trich","una infeccion de transmision sexual (its) muy comun causada por un parasito."],
+    ["embarazo ectopico","embarazo tubarico","un embarazo en el que el ovulo fertilizado se implanta fuera del utero."],
+    ["preeclampsia","toxemia del embarazo","una complicacion del embarazo caracterizada por presion arterial alta y signos de dano en otro sistema de organos, mas a menudo el higado y los rinones."],
+    ["placenta previa","implantacion baja de la placenta","un problema durante el embarazo en el que la placenta crece en la parte mas baja del utero y cubre toda o parte de la abertura hacia el cuello uterino."],
+    ["aborto espontaneo","perdida del embarazo","la perdida espontanea de un embarazo antes de la semana 20."],
+    ["dispareunia","coito doloroso","dolor genital persistente o recurrente que ocurre justo antes, durante o despues de las relaciones sexuales."],
+    ["eyaculacion precoz","eyaculacion rapida","ocurre cuando un hombre eyacula antes de lo que el o su pareja desearian durante las relaciones sexuales."],
+    ["anorgasmia","disfuncion orgasmica","dificultad o incapacidad para alcanzar el orgasmo."],
+    ["cistitis intersticial","sindrome de la vejiga dolorosa","una afeccion cronica que causa presion en la vejiga, dolor en la vejiga y, a veces, dolor pelvico."],
+    ["acne","acne vulgar\nespinillas\nbarros","enfermedad de la piel que ocurre cuando los foliculos pilosos se tapan con grasa y celulas cutaneas muertas."],
+    ["eczema","dermatitis atopica\neccema","afeccion que hace que la piel se seque, pique e inflame."],
+    ["dermatitis de contacto","dermatitis alergica\ndermatitis irritante","erupcion cutanea rojiza que pica y que aparece por contacto directo con una sustancia o por una reaccion alergica a esta."],
+    ["urticaria","ronchas\nhabones","reaccion de la piel que causa ronchas con picazon."],
+    ["rosacea","acne rosacea","afeccion que provoca piel rojiza y, a menudo, pequenos bultos llenos de pus en la cara."],
+    ["micosis cutanea","infeccion por hongos\ntina","infeccion de la piel causada por hongos."],
+    ["verrugas","verruga vulgar\nojo de pescado","pequenos crecimientos en la piel causados por el virus del papiloma humano (vph)."],
+    ["psoriasis","psoriasis en placas","enfermedad de la piel que causa un sarpullido con manchas rojas y escamosas que pican, principalmente en las rodillas, los codos, el tronco y el cuero cabelludo."],
+    ["vitiligo","leucoderma","enfermedad que causa la perdida de color de la piel en manchas."],
+    ["melanoma","cancer de piel","el tipo mas grave de cancer de piel, que se desarrolla en las celulas (melanocitos) que producen melanina."],
+    ["carcinoma basocelular","cancer de piel no melanoma","tipo de cancer de piel que comienza en las celulas basales."],
+    ["carcinoma espinocelular","carcinoma de celulas escamosas","tipo de cancer de piel que comienza en las celulas escamosas."],
+    ["queratosis pilaris","piel de gallina","afeccion cutanea inofensiva que causa pequenas protuberancias y zonas asperas."],
+    ["alopecia areata","perdida de cabello en parches","afeccion que causa la caida del cabello en pequenas manchas."],
+    ["hiperhidrosis","sudoracion excesiva","sudoracion anormalmente excesiva que no esta necesariamente relacionada con el calor o el ejercicio."],
+    ["impetigo","infeccion cutanea bacteriana","infeccion cutanea comun y muy contagiosa que afecta principalmente a bebes y ninos."],
+    ["molusco contagioso","verrugas de agua","infeccion viral de la piel que produce protuberancias redondas, firmes e indoloras."],
+    ["penfigo","enfermedad ampollosa","enfermedad autoinmune que causa ampollas y llagas en la piel o las membranas mucosas."],
+    ["dermatitis seborreica","caspa\ncostra lactea","afeccion cutanea comun que afecta principalmente al cuero cabelludo y causa manchas escamosas, piel enrojecida y caspa persistente."],
+    ["liquen plano","erupcion pruriginosa","afeccion inflamatoria que puede afectar la piel, el cabello, las unas y las membranas mucosas."],
+    ["celulitis","infeccion bacteriana de la piel","infeccion bacteriana de la piel comun y potencialmente grave."],
+    ["erisipela","infeccion cutanea superficial","infeccion bacteriana de las capas superiores de la piel."],
+    ["foliculitis","infeccion del foliculo piloso","inflamacion de los foliculos pilosos, generalmente causada por una infeccion bacteriana o fungica."],
+    ["forunculos","abscesos cutaneos","infeccion dolorosa y llena de pus que se forma debajo de la piel cuando las bacterias infectan y inflaman uno o mas foliculos pilosos."],
+    ["hidradenitis supurativa","acne inverso","enfermedad cronica de la piel que se caracteriza por bultos pequenos y dolorosos debajo de la piel."],
+    ["ictiosis vulgar","piel de pescado","afeccion hereditaria de la piel en la que las celulas cutaneas muertas se acumulan en escamas gruesas y secas en la superficie de la piel."],
+    ["melasma","cloasma\nmascara del embarazo","afeccion cutanea comun que causa manchas oscuras y descoloridas en la piel."],
+    ["nevos melanociticos","lunares","crecimientos comunes en la piel, generalmente de color marron o negro."],
+    ["pitiriasis rosada","erupcion de arbol de navidad","erupcion cutanea que generalmente comienza como una mancha grande circular u ovalada en el pecho, el abdomen o la espalda."],
+    ["prurigo nodular","dermatitis nodular","enfermedad de la piel que se caracteriza por bultos que pican (nodulos) en la piel."],
+    ["sarna","escabiosis","afeccion de la piel que pica causada por un pequeno acaro excavador llamado sarcoptes scabiei."],
+    ["tina versicolor","pitiriasis versicolor","infeccion fungica comun de la piel que interfiere con la pigmentacion normal de la piel, lo que resulta en pequenas manchas descoloridas."],
+    ["xantelasma","depositos de colesterol","deposito amarillento de grasa (lipidos) debajo de la piel, generalmente en o alrededor de los parpados."],
+    ["dermatofibroma","histiocitoma fibroso","bulto pequeno y no canceroso (benigno) que se desarrolla en la piel."],
+    ["granuloma anular","erupcion en anillo","afeccion cutanea cronica que causa una erupcion en forma de anillo, generalmente en las manos y los pies."],
+    ["queratosis actinica","queratosis solar","mancha aspera y escamosa en la piel que se desarrolla a partir de anos de exposicion al sol."],
+    ["lentigo solar","manchas de la edad\nmanchas hepaticas","manchas oscuras en la piel causadas por la exposicion al sol."],
+    ["poiquilodermia de civatte","eritrosis coli","afeccion cutanea benigna que afecta principalmente la piel del cuello y el pecho."],
+    ["telangiectasias","aranas vasculares","pequenos vasos sanguineos dilatados cerca de la superficie de la piel o las membranas mucosas."],
+    ["linfedema","edema linfatico\nobstruccion linfatica","acumulacion de liquido linfatico en los tejidos blandos del cuerpo, que causa hinchazon."],
+    ["linfoma","cancer linfatico\ntumor de ganglios linfaticos","cancer que se origina en los linfocitos, un tipo de globulo blanco del sistema inmunitario."],
+    ["mononucleosis infecciosa","enfermedad del beso\nfiebre glandular","infeccion viral, generalmente causada por el virus de epstein-barr, que provoca fiebre, dolor de garganta y ganglios linfaticos inflamados."],
+    ["adenopatia","linfadenopatia\nganglios linfaticos inflamados","agrandamiento o inflamacion de los ganglios linfaticos, a menudo como respuesta a una infeccion."],
+    ["linfangitis","inflamacion de los vasos linfaticos","inflamacion de los canales linfaticos que ocurre como resultado de una infeccion en un sitio distal al canal."],
+    ["enfermedad de castleman","hiperplasia de ganglios linfaticos angiofolicular","un trastorno poco comun que implica un crecimiento excesivo de celulas en los ganglios linfaticos."],
+    ["filariasis linfatica","elefantiasis","infeccion parasitaria causada por gusanos filariales que se transmiten a traves de mosquitos, que conduce a la obstruccion linfatica."],
+    ["malformacion linfatica","linfangioma","una masa esponjosa y benigna de vasos linfaticos dilatados."],
+    ["quilotorax","derrame quiloso","acumulacion de liquido linfatico (quilo) en el espacio alrededor de los pulmones (espacio pleural)."],
+    ["ascitis quilosa","peritonitis quilosa","acumulacion de liquido linfatico (quilo) en la cavidad abdominal."],
+    ["quiluria","orina lechosa","presencia de quilo en la orina, lo que le da un aspecto lechoso."],
+    ["sindrome de cloves","sobrecrecimiento congenito lipomatoso","un sindrome de sobrecrecimiento raro con anomalias vasculares complejas, que incluyen malformaciones linfaticas."],
+    ["bronquitis plastica","moldes bronquiales","una condicion rara en la que se forman moldes de las vias respiratorias, a menudo asociada con anomalias linfaticas."],
+    ["enteropatia perdedora de proteinas","linfangiectasia intestinal","perdida excesiva de proteinas plasmaticas a traves del tracto gastrointestinal debido a trastornos linfaticos."],
+    ["higroma quistico","linfangioma quistico","un saco lleno de liquido que resulta de una obstruccion en el sistema linfatico, que generalmente se encuentra en el cuello."],
+    ["hiperplasia linfofolicular","hiperplasia folicular reactiva","aumento del numero y tamano de los foliculos linfoides, a menudo en respuesta a una infeccion."],
+    ["linfadenitis mesenterica","adenitis mesenterica","inflamacion de los ganglios linfaticos en el mesenterio, el tejido que une el intestino a la pared abdominal."],
+    ["linfangioleiomiomatosis (lam)","","una enfermedad pulmonar rara que afecta principalmente a mujeres en edad fertil, caracterizada por la proliferacion de celulas musculares lisas atipicas en los pulmones y los linfaticos."],
+    ["sarcoidosis","enfermedad de besnier-boeck-schaumann","una enfermedad inflamatoria que afecta a multiples organos del cuerpo, pero mas comunmente a los pulmones y los ganglios linfaticos."],
+    ["amigdalitis","infeccion de las amigdalas\nanginas","inflamacion de las amigdalas, dos masas de tejido de forma ovalada en la parte posterior de la garganta."],
+    ["esplenomegalia","bazo agrandado","agrandamiento del bazo, a menudo asociado con diversas enfermedades que afectan al sistema linfatico."],
+    ["timoma","tumor del timo","un tumor originado en las celulas epiteliales del timo, una glandula linfatica importante para el sistema inmune."],
+    ["linfangioma cavernoso","malformacion linfatica macroquistica","un tipo de malformacion linfatica compuesta por grandes quistes llenos de liquido linfatico."],
+    ["linfohistiocitosis hemofagocitica (lhh)","sindrome hemofagocitico","un trastorno inmunitario potencialmente mortal en el que el cuerpo produce demasiadas celulas inmunitarias activadas."],
+    ["sindrome de evans","","un trastorno autoinmune raro en el que el sistema inmunitario destruye los globulos rojos, las plaquetas y, a veces, ciertos tipos de globulos blancos."],
+    ["trastorno de ansiedad generalizada","tag\nansiedad cronica","preocupacion y tension cronicas y exageradas sin motivo aparente."],
+    ["depresion mayor","trastorno depresivo mayor\ndepresion clinica","estado de animo persistentemente deprimido o perdida de interes en las actividades."],
+    ["trastorno bipolar","enfermedad maniaco-depresiva","cambios extremos en el estado de animo que van desde la mania hasta la depresion."],
+    ["trastorno obsesivo-compulsivo","toc","pensamientos (obsesiones) y rituales (compulsiones) recurrentes y no deseados."],
+    ["trastorno de estres postraumatico","tept","trastorno que puede ocurrir despues de experimentar o presenciar un evento traumatico."],
+    ["trastorno de panico","ataques de panico","episodios repentinos de miedo intenso que provocan reacciones fisicas graves."],
+    ["fobia social","trastorno de ansiedad social","miedo intenso y persistente de ser observado y juzgado por otros."],
+    ["esquizofrenia","","trastorno que afecta la forma en que una persona piensa, siente y se comporta."],
+    ["trastorno por deficit de atencion e hiperactividad","tdah","patron de falta de atencion y/o hiperactividad-impulsividad que interfiere con el funcionamiento."],
+    ["trastornos de la alimentacion","anorexia\nbulimia\natracon","afecciones graves que se relacionan con las conductas alimentarias que afectan negativamente la salud."],
+    ["trastorno limite de la personalidad","tlp\nborderline","patron de inestabilidad en las relaciones interpersonales, la autoimagen y los afectos."],
+    ["agorafobia","","miedo y evitacion de lugares o situaciones que pueden causar panico."],
+    ["trastorno de ansiedad por separacion","","miedo excesivo a la separacion de las personas a las que se esta apegado."],
+    ["mutismo selectivo","","incapacidad constante de hablar en situaciones sociales especificas."],
+    ["fobia especifica","fobia simple","miedo intenso e irracional a un objeto o situacion especifica."],
+    ["tricotilomania","trastorno de arrancarse el cabello","impulso recurrente e irresistible de arrancarse el propio cabello."],
+    ["trastorno de excoriacion","dermatilomania","trastorno caracterizado por rascarse la piel de forma compulsiva."],
+    ["trastorno dismorfico corporal","tdc","preocupacion obsesiva por un defecto percibido en la apariencia fisica."],
+    ["trastorno de acumulacion","acumulacion compulsiva","dificultad persistente para deshacerse de posesiones debido a una necesidad percibida de guardarlas."],
+    ["trastorno afectivo estacional","tae\ndepresion invernal","depresion que ocurre en la misma epoca cada ano."],
+    ["distimia","trastorno depresivo persistente","forma cronica de depresion menos severa pero de larga duracion."],
+    ["trastorno ciclotimico","ciclotimia","trastorno del estado de animo que causa altibajos emocionales, pero menos extremos que el trastorno bipolar."],
+    ["trastorno disforico premenstrual","tdpm","forma grave del sindrome premenstrual (spm) con sintomas emocionales y fisicos."],
+    ["trastorno de desregulacion disruptiva del estado de animo","tddea","irritabilidad cronica, grave y persistente en ninos y adolescentes."],
+    ["trastorno esquizoafectivo","","combinacion de sintomas de esquizofrenia y trastornos del estado de animo."],
+    ["trastorno delirante","paranoia","creencias falsas y fijas (delirios) sin otros sintomas de esquizofrenia."],
+    ["trastorno psicotico breve","","episodio psicotico repentino y de corta duracion, a menudo en respuesta a un evento estresante."],
+    ["trastorno de la personalidad paranoide","","patron de desconfianza y suspicacia hacia los demas."],
+    ["trastorno de la personalidad esquizoide","","patron de distanciamiento de las relaciones sociales y una gama restringida de expresion emocional."],
+    ["trastorno de la personalidad esquizotipica","","patron de malestar agudo en las relaciones cercanas, distorsiones cognitivas o perceptivas y excentricidades del comportamiento."],
+    ["trastorno de la personalidad antisocial","psicopatia\nsociopatia","patron de desprecio y violacion de los derechos de los demas."],
+    ["trastorno de la personalidad histrionica","","patron de emotividad excesiva y busqueda de atencion."],
+    ["trastorno de la personalidad narcisista","narcisismo","patron de grandiosidad, necesidad de admiracion y falta de empatia."],
+    ["trastorno de la personalidad por evitacion","trastorno de la personalidad evasiva","patron de inhibicion social, sentimientos de insuficiencia e hipersensibilidad a la evaluacion negativa."],
+    ["trastorno de la personalidad dependiente","","patron de comportamiento sumiso y pegajoso relacionado con una necesidad excesiva de ser cuidado."],
+    ["trastorno de la personalidad obsesivo-compulsiva","tpoc","patron de preocupacion por el orden, el perfeccionismo y el control."],
+    ["trastorno de conversion","trastorno de sintomas neurologicos funcionales","sintomas neurologicos inexplicables que afectan el movimiento o los sentidos."],
+    ["trastorno de sintomas somaticos","hipocondria","enfoque extremo en los sintomas fisicos que causa una gran angustia emocional."],
+    ["trastorno facticio","sindrome de munchausen","falsificacion de signos o sintomas fisicos o psicologicos."],
+    ["amnesia disociativa","","incapacidad para recordar informacion personal importante, generalmente de naturaleza traumatica o estresante."],
+    ["conjuntivitis","ojo rojo\ninflamacion de la conjuntiva","inflamacion de la conjuntiva, la membrana transparente que recubre el interior de los parpados y la superficie del ojo."],
+    ["cataratas","opacidad del cristalino","opacidad del cristalino del ojo, lo que dificulta la vision."],
+    ["glaucoma","tension ocular alta","enfermedad del ojo que dana el nervio optico y puede causar ceguera."],
+    ["otitis media","infeccion del oido medio","infeccion del oido medio, el espacio lleno de aire detras del timpano."],
+    ["tinnitus","zumbido en los oidos\nacufenos","percepcion de un sonido o zumbido en los oidos sin una fuente de sonido externa."],
+    ["amigdalitis","infeccion de las amigdalas\nanginas","inflamacion de las amigdalas, dos masas de tejido de forma ovalada situadas a ambos lados de la parte posterior de la garganta."],
+    ["sinusitis","infeccion de los senos paranasales","inflamacion de los senos paranasales, cavidades llenas de aire en el craneo."],
+    ["faringitis","dolor de garganta","inflamacion de la faringe, la parte posterior de la garganta."],
+    ["laringitis","inflamacion de la laringe","inflamacion de la laringe, que contiene las cuerdas vocales."],
+    ["rinitis alergica","fiebre del heno","reaccion alergica que causa estornudos, congestion nasal y picazon en la nariz."],
+    ["desviacion del tabique nasal","tabique desviado","desplazamiento del tabique nasal, la pared que divide las fosas nasales."],
+    ["polipos nasales","tumores benignos en la nariz","crecimientos blandos e indoloros en el revestimiento de la nariz o los senos paranasales."],
+    ["vertigo","mareos","sensacion de que usted o su entorno se mueven o giran."],
+    ["enfermedad de meniere","hidropesia endolinfatica","trastorno del oido interno que causa episodios de vertigo, perdida de audicion y tinnitus."],
+    ["presbicia","vista cansada","perdida gradual de la capacidad de los ojos para enfocar objetos cercanos."],
+    ["astigmatismo","vision borrosa","imperfeccion en la curvatura de la cornea o el cristalino del ojo."],
+    ["miopia","vision corta","afeccion en la que los objetos cercanos se ven con claridad, pero los lejanos se ven borrosos."],
+    ["hipermetropia","vision larga","afeccion en la que los objetos lejanos se ven con claridad, pero los cercanos se ven borrosos."],
+    ["estrabismo","ojos bizcos","afeccion en la que los ojos no se alinean correctamente."],
+    ["ojo seco","queratoconjuntivitis seca","afeccion en la que los ojos no producen suficientes lagrimas o las lagrimas se evaporan demasiado rapido."],
+    ["chalazion","quiste de parpado","pequeno bulto en el parpado causado por una glandula sebacea bloqueada."],
+    ["orzuelo","infeccion del parpado","infeccion bacteriana de una glandula sebacea en el parpado."],
+    ["epistaxis","hemorragia nasal","sangrado de la nariz."],
+    ["anosmia","perdida del olfato","perdida total o parcial del sentido del olfato."],
+    ["disfonia","ronquera","alteracion de la calidad de la voz."],
+    ["apnea del sueno","sahs","trastorno del sueno en el que la respiracion se detiene y comienza repetidamente."],
+    ["cerumen impactado","tapon de cera","acumulacion de cera en el oido que bloquea el canal auditivo."],
+    ["perforacion del timpano","timpano roto","agujero o desgarro en el timpano."],
+    ["laberintitis","infeccion del oido interno","inflamacion del laberinto, una parte del oido interno."],
+    ["neuritis vestibular","inflamacion del nervio vestibular","inflamacion del nervio vestibular, que envia informacion sobre el equilibrio al cerebro."],
+  ],
+  trigramas: {
+    "\nac": "16,b5",
+    "\nan": "5j,5e,6,19",
+    "\nat": "bc",
+    "\nba": "9b",
+    "\nbo": "76,47",
+    "\nbu": "bc",
+    "\nca": "6s",
+    "\nce": "7e",
+    "\nco": "6h,3c",
+    "\nde": "3l,2v,a,3,2,6,6,9,1x,1r,i",
+    "\ndi": "3p,1q,1",
+    "\ndo": "6p",
+    "\nec": "9c",
+    "\nen": "6o,9,i,x",
+    "\nep": "6u",
+    "\nes": "9b",
+    "\nfi": "ag",
+    "\nga": "ah",
+    "\nha": "9e",
+    "\nhi": "6k,c,f",
+    "\nic": "2s",
+    "\nin": "3l,8m",
+    "\nit": "7i",
+    "\nja": "3c",
+    "\nle": "7c,1",
+    "\nlu": "3b,3o,3",
+    "\nma": "a1,a",
+    "\nmi": "6l,2,4,1o",
+    "\nne": "78",
+    "\nob": "ae",
+    "\noj": "9h",
+    "\noo": "8e",
+    "\npe": "6f",
+    "\npi": "7a,b",
+    "\npo": "6e,p",
+    "\npr": "6y",
+    "\nps": "74",
+    "\npu": "79,8",
+    "\nra": "6m,j",
+    "\nre": "8i",
+    "\nru": "6j,h",
+    "\nsi": "6a,1,22",
+    "\nso": "bx",
+    "\nte": "6i",
+    "\nti": "5i,3y",
+    "\ntu": "af",
+    "\nul": "15",
+    " (a": "3l",
+    " (b": "a8",
+    " (c": "1v,71,2a",
+    " (d": "1j,26,83",
+    " (e": "3,13,2i,4q,e,1u",
+    " (f": "1e,5y",
+    " (g": "80",
+    " (h": "11,3n,41",
+    " (i": "89,o,2,3",
+    " (l": "w,l,8q,o,6",
+    " (m": "1t,9,7i",
+    " (n": "3i,6m",
+    " (o": "b6",
+    " (q": "am,1",
+    " (s": "18,3f,3q,9,33",
+    " (u": "8b",
+    " (v": "k,35,5b,h",
+    " 2.": "5r",
+    " 20": "96",
+    " a ": "9,9,h,1,a,7,7,2,p,a,4,o,1,9,3,1,1,c,6,6,a,7,4,3,7,1,6,3,2,2,1,1,9,1,8,2,1,l,3,1,7,8,8,3,7,2,5,6,h,1,1,2,4,6,3,2,b,k,7,3,6,1,2,1,1,1,2,4,d,2,4,8,7,c",
+    " ab": "15,3,1,b,2,2,2,h,g,z,1d,h,2q,1,y,y,k,7",
+    " ac": "16,19,1x,1f,y,13,b,6,k,17,5,5,r,3,h",
+    " ad": "z,1w,9,12,k,9,g,5,3,c,1e,a,43,9",
+    " af": "9,5,4,b,f,6,o,r,3,c,3,3,a,e,1,4,3,4,3,d,7,7,5,e,g,2,e,g,1,5,2,2,d,h,13,g,3,1,i,j,1,2,c,2,1,9,h",
+    " ag": "1,u,2m,3i,1q,3,z,17,y",
+    " ai": "2,1,d,bu,3",
+    " al": "4,1,9,e,6,a,8,7,e,3,2,2,2,1,1,1,f,1,1,4,8,1,1,7,2,4,5,2,9,8,3,3,7,l,1,c,2,k,5,7,m,d,1d,2,8,5,4,g,e,3,1,7,4,c,e,c,l,7,9,b",
+    " am": "2,3i,4,1,l,k,i,18,v,5,8,c,r,x,f,q,1f",
+    " an": "1a,i,v,10,1i,2,7,5,6,f,2,6,d,5,3,4,v,1,c,6,7,a,a,1,1,h,k,1,9,6,1,d,1,1,4,6,7,2,2,1,6,7",
+    " ao": "2n,1",
+    " ap": "b,19,25,4q,y,1q,c,5",
+    " ar": "d,1,1a,k,1,1,d,1,1,2,2,5,o,v,l,6,1,15,5,1,8,4,1,6,1,2,5,2,1,1,1,m,12,k,f,1f",
+    " as": "13,8k,n,e,2,8",
+    " at": "3w,k,9,9,2,3,2,1r,6,5,x,18,1j,g,n",
+    " au": "2f,r,1,2,2,i,m,1,5,d,2,b,1,4,5,6,a,5,k,1,b,2q,1a,b,17,d",
+    " az": "1h,n",
+    " b1": "4z",
+    " ba": "8,l,2,u,2o,1,b,16,13,1,6,1,d,10,f,3,4,g,5,5,1,1,1,10,1u",
+    " be": "56,a,a,17,1c,g,11,m,4,5,b,1m",
+    " bi": "1l,1,j,90,j,11",
+    " bl": "1c,u,u,11,1,6,2,5,2d,3m,1,n,1g,9,6",
+    " bo": "1i,1,1,t,9,f,1r,40,3u,1,1",
+    " br": "0,1,g,3k,2g,49,13",
+    " bu": "2x,3n,m,29,k,5,1u,t",
+    " ca": "0,1,2,2,3,7,4,3,1,1,1,1,1,3,1,5,1,1,1,3,1,1,1,4,1,b,1,5,8,7,1,2,1,1,1,1,1,1,1,2,2,6,1,3,3,1,4,1,5,1,1,4,1,6,2,1,1,2,2,2,4,1,2,3,5,4,1,2,5,1,3,8,4,5,1,1,2,4,2,1,1,1,3,4,5,1,1,4,4,1,6,4,4,1,1,1,4,1,8,a,1,3,4,3,1,2,2,3,1,g,2,2,1,5,1,8,4,2,6,4,1,1,1,1,1,1,1,1,1,1,1,3,1,1,2,1,2,2,3,1,3,1,2,3,2,2,1,1,3,8,5,e,4,1,3,2,g,5,4,3,4,1,6,4,2",
+    " ce": "1g,e,2,2,h,d,q,3,1,1,3,4,5,2,1,5,1,2,1,4,7,1,b,i,b,5,o,t,j,1,j,1,a,k,9,1,1,e,d,6,c,4,2,v,d,c,2,1,9,3",
+    " ch": "3v,52",
+    " ci": "a,4g,2f,7,19,1i,9,q,m",
+    " cl": "ap,f,1j,1",
+    " co": "1,3,8,2,2,2,2,1,1,2,4,4,1,f,4,1,1,1,1,4,5,1,1,1,2,1,2,2,1,1,4,1,1,1,1,1,4,1,1,1,5,1,2,1,2,1,1,3,1,1,1,2,2,1,2,2,6,1,5,2,2,6,1,3,3,9,3,1,2,1,2,2,2,1,1,1,6,2,3,1,3,4,1,4,1,2,2,4,3,6,2,3,2,1,e,5,1,1,1,2,1,2,1,3,6,1,1,2,1,3,2,2,2,5,c,1,1,6,9,1,5,5,1,1,1,1,1,2,7,2,1,4,1,2,1,3,1,1,2,2,6,1,1,3,1,5,5,1,1,1,5,1,6,2,2,a,1,1,4,3,1,1,4,4,3,5,1,1,4,8,1,6,1,1,1,7",
+    " cr": "0,3,10,6,1z,c,d,k,8,7,1,h,9,1,1,c,6,1,h,a,2,2,a,b,7,4,d,4,3,8,e,5,7,i,a,a,k,k,3,i,5,9",
+    " cu": "a,6,2,1,g,1,16,1,6,l,2,1,2,1,4,8,b,6,i,1,2,7,1,4,1,3,1,1,1,5,3,d,1,7,6,d,5,6,4,a,d,3,7,9,3,2,6,2,6,1,b,c,3,3,2,3,2,5,3,3,3,2,2,1,2,6,3,2,e,4,5,10,e,7",
+    " da": "a,9,1h,1h,b,3,t,4g,1k,1l",
+    " de": "0,1,1,1,1,1,1,1,1,2,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,2,1,1,1,2,1,2,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,2,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,2,1,1,1,1,1,1,1,2,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,2,1,2,1,1,1,1,1,1,1,1,1,1,1,3,4,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,2,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,4,1,1,1,1,1,1,1,1,1,1",
+    " di": "j,c,3,9,1,1,2,3,3,4,5,b,2,j,13,2,x,7,2,o,6,12,2k,10,5,3,d,m,5,1,5,1,a,2,9",
+    " do": "18,1,29,2,v,d,1m,8,3,7,d,m,r,d,8,3,o,1,h,h,1f",
+    " du": "15,g,j,r,2j,9,2,1c,9,b,9,l,h,9,2,1,2f,6",
+    " e ": "p,1,2m,1x,28,17,o,f,1k,6,1,i,i",
+    " ec": "93",
+    " ed": "5j,4,h,1,1m,m,1y,k",
+    " ef": "2d,40",
+    " eh": "7b",
+    " ej": "9p",
+    " el": "a,1,3,1,1,3,4,9,3,6,1,1,3,6,1,3,2,1,5,2,1,1,1,4,1,2,2,6,2,1,6,1,3,7,5,1,2,1,1,1,1,1,1,1,3,2,3,1,3,3,7,3,6,1,4,4,1,2,3,1,3,1,3,3,2,2,3,2,1,1,6,2,5,7,3,6,7,6,4,1,6,d,1,6,2,2,1,2,1,5,3,1,7,2,1,2,a,1,7,2,5,3,a,1,1,3,1,8,1,7,5,9,9,4,6,6,2,5,2,1,3,6,7,6,e,1,4,2,1,3,5,4,5,1,4,1,1,2",
+    " em": "3j,53,a,7,1,1,1,v,1n,1,6,3,1,5",
+    " en": "2,2,2,5,1,1,1,1,1,1,2,4,7,1,4,6,2,3,1,3,2,1,1,1,1,1,1,2,2,2,2,1,1,1,1,1,5,4,1,3,1,6,2,3,2,1,2,1,3,1,2,1,2,1,1,1,1,1,2,2,4,2,2,2,1,2,4,3,1,3,8,2,1,2,2,3,1,2,1,3,2,2,3,6,1,2,1,3,2,1,3,2,2,1,3,2,2,3,1,1,4,2,3,2,1,2,1,2,4,2,2,2,1,2,1,1,1,2,1,1,1,1,3,5,1,2,2,1,1,4,2,1,2,8,1,1,1,1,2,2,1,1,1,3,3,1,3,1,2,1,6,1,2,1,5,1,3,1,1,5,5,2,1,1,1,1,1,2,4,1,7,1,1,1,1,2,1,1,1,1,1,3,1,3,1,3,1,1,2,2,1,1,1,1,1,1,1,2,1,2,1,5,3,3,4,2,4,3,3,8,7,2,3,2,1,1,1,1,1,1,1,1,1,1,4,1,1,2",
+    " ep": "40,5,1,37,1h,1m,j,n,y",
+    " eq": "44,8w",
+    " er": "3b,15,f,5,5,7,1q,1l,1m",
+    " es": "0,4,b,1,h,7,1,1,2,f,2,1,6,1,3,1,1,2,2,2,m,1,3,j,1,g,2,d,5,3,2,4,j,e,d,2,2,k,1,8,1,6,2,1,1,5,f,i,h,1,1,c,7,5,4,3,4,7,3,7,b,1,j,2,8,1,1,5,2,2,1,1,1,2,1,a,4,6",
+    " et": "1e",
+    " ev": "b2,5,7,f,7,q",
+    " ex": "7,n,1v,k,1b,k,e,1,3,3,1,2,5,1,1,1,8,m,j,2,a,c,2,g,16,g,5,1,8,8,c,2,2,8,4,5,7,1,2,3,3,7",
+    " ey": "98",
+    " fa": "6,s,b,12,2t,6,1f,4m,h,7,6,9",
+    " fe": "s,11,6c,9,1,o,1s",
+    " fi": "g,n,q,1v,2u,7,6,h,1,4,6,3,a,l,1,1,14,h,8,4,o,c,5,3,c,1",
+    " fl": "3,13,10,6,d,1c,e,2s,x",
+    " fo": "5,c,x,4,2,1,1,8,r,k,3,h,1l,1w,6,9,v,b,k,m,1,b,h,3,4,d,9,t,5",
+    " fr": "c,10,1m,u,1m,f,m,m,x,y",
+    " fu": "c,26,k,d,3,6,3,1g,2f,2,h,6,1,r,u,9,15,s,8",
+    " ga": "6,c,2,9,d,2,f,1,8,1,34,26,a,26,s,1,1,2,8,3,2,1,y,h,2",
+    " ge": "1,1c,1d,m,6,6,a,4,c,j,r,i,2,1,4,8,4,u,1,f,10,2,6,q,5,1,4,2,7,c,b,13",
+    " gi": "3j,90",
+    " gl": "1g,1n,z,k,3,a,i,1,2,3,3,4,2,2,1,a,1,1,1,t,1j,1,1,1p,1,j,3,1p,1",
+    " go": "6w",
+    " gr": "b,8,a,2,d,m,1,e,10,w,1,6,c,3,u,2,2,3,u,1,3,2,4,s,1n,9,b,5,3,4,t,8,4,d,1,9,5,h",
+    " gu": "53,5h,11",
+    " ha": "16,6,e,7,7,4,1y,j,i,m,8,e,1a,c,2,1,11,7,1t,b,e",
+    " he": "4,f,v,f,5,y,8,m,2,3,2,a,8,p,15,1,1,a,q,x,r,11,b,q,1f",
+    " hi": "18,2,3,1,8,2,2,8,11,n,b,n,e,b,6,2,1,1,2,5,4,7,5,q,v,1,11,b,1a,x,n,2",
+    " ho": "4e,a,2,r,1,2,3,1,1,1,4,1,3,4,6,5,4,2,1u,7,6,7,1,a,8",
+    " hu": "1s,5,1s,1,23,m,1,2,2,b,5,c,1,1,1,1l,h",
+    " id": "4s,c,a",
+    " ig": "89",
+    " im": "3f,1e,2h,1t,1g,g,17,r",
+    " in": "0,1,1,1,4,2,9,3,1,1,2,1,a,2,1,4,1,1,1,1,2,3,3,1,5,4,2,8,1,2,1,c,5,4,3,1,6,a,4,3,1,1,1,3,2,3,a,2,9,1,1,3,1,1,1,1,1,3,2,1,1,1,1,1,1,1,2,2,1,1,2,1,3,2,1,b,4,2,3,m,2,3,2,4,3,2,1,e,2,1,2,5,4,3,a,1,3,2,5,1,3,1,9,1,1,1,1,1,7,1,2,b,4,3,3,1,1,7,9,1,1,1,7,2,2,1,2,3,2,1,2,4,1,2,2,4,5,e,3,3,1,b,2,f,1",
+    " ir": "7,z,2,13,3,1,12,22,z,n,1f,t,24,1",
+    " is": "2a,1r",
+    " ju": "5g,3r,22",
+    " ka": "66",
+    " kl": "68",
+    " la": "0,3,1,1,1,1,1,3,2,1,1,1,1,3,1,1,1,2,1,1,1,1,2,2,2,1,2,1,7,1,5,1,1,1,1,1,1,1,1,2,3,4,1,6,3,1,1,1,1,1,2,4,1,1,1,2,1,1,1,3,1,1,2,2,2,1,1,1,1,1,1,1,2,2,3,1,1,1,1,1,4,1,2,2,3,2,2,2,1,2,1,2,1,1,3,2,2,1,1,2,1,1,1,1,4,1,2,2,1,3,3,1,1,2,1,1,1,1,2,1,1,1,2,2,1,1,1,1,1,1,2,1,1,2,1,2,1,1,1,1,2,1,1,3,1,4,1,1,1,1,3,4,1,1,1,1,1,1,1,2,1,1,2,1,1,2,1,1,2,1,2,2,1,1,2,1,1,1,1,2,1,1,1,1,5,1,1,1,1,1,1,4,2,4,2,1,4,1,1,2,1,1,b,1,1,1,2,1,1,2,1,1,1,1,1,1,1,1,2,3,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,7,3,1,2,4,1,2,2,3,2,1,5,2,1,2,4,1,2,1,7,1,1,1,1,1,1,1,1,5,1,4,2,1,1,1,1,3,1,1,1,1,1,3,2,1,3",
+    " le": "2g,1b,c,3,1,8,1o,o,4,y,r,24,1z,1",
+    " li": "f,3,c,i,9,2,e,z,19,3,d,c,z,1,j,m,s,k,8,3,1l,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,2,1,1,d",
+    " ll": "3m,1u,14,1p,q,g,d,6,7,n,8,1a,3",
+    " lo": "1,1,1,2,4,1,2,1,1,1,2,1,1,2,1,1,7,3,3,c,5,8,4,6,1,2,2,1,1,1,7,2,1,a,2,3,1,3,5,1,1,1,3,5,2,6,1,6,3,g,1,3,9,2,6,1,1,2,3,a,3,a,2,5,2,1,1,1,8,2,1,3,1,3,1,2,1,1,1,1,1,3,7,2,2,1,1,2,1,1,3,3,2,3,7,1,1,1,2,1,1,2,3,1,4,1,1,2,3,2,4,1,2,1,4,5,4,3,7,f,9,1,2,5,1,2,1,1,3,2,5,1,1,1,6,b,h,3,6,1,3,1,3,2,5,3,2,1,1,1",
+    " lu": "7c,42",
+    " ma": "c,6,6,o,7,u,3,1,1,e,1,7,e,k,2,4,9,1,a,3,6,d,f,1,2,5,1,c,1,2,2,2,d,3,2,c,16,2,c,5,1,d,1,1,4,5,5,3,1,1,3,3,c,4,7,1,3,4,1,r,g",
+    " me": "t,1d,1,8,5,1,n,7,3,c,4,2,8,1,2,c,o,1,1,1,1,1,3,5,3,8,c,6,8,14,m,6,b,8,b,5,1,7,2,8,b,4,9,3,1,4,p,1,5,e,3,a",
+    " mi": "2b,9,1l,9,1m,g,i,j,4,d,3a,e",
+    " mo": "11,11,1c,5,d,4p,1z,6,b,2,10",
+    " mu": "i,b,7,12,2,6,1,b,u,8,q,9,4,3,1,6,b,1,6,o,3,1,7,2,1,1,1,1,1,1,1,1,2,1,e,5,3,c,k,5,4,b,1,4,9,f,2,2,6,d,i,1,19,e",
+    " na": "4,1,f,9,v,16,3e,2b,1k,1w,7,a,1,1,b",
+    " ne": "31,c,3,1,1,6,2,2,1,2,1,3,7,1,2,5,9,4,c,1e,6,1,2,2,d,3,6,d,2,8,1o,d,1a,9,e,1,1,2,6,r",
+    " ni": "v,4,3x,q,3,6,1i,2d,20",
+    " no": "22,b,3,1,1,j,2,1,1g,6,9,6,5,5,2,3,f,4,2,t,e,f,3,9,3,6,3,a,w,4,f,2,2,y,1j,1",
+    " nu": "7z,r,23",
+    " o ": "2,5,p,1,1,1,6,3,3,7,1,4,1,1,h,8,4,5,8,3,j,2,1,2,k,f,b,8,6,4,a,6,c,8,4,4,5,2,2,4,1,d,1,3,1,2,8,1,b,i,1,8,a,2,1,1,4,c,3,5,1,4,1,4,6,4,n,3,7,3,f,7,2,1,5,7,1,3,4,4,4",
+    " ob": "3,5,j,26,1b,6c,8,e,3,8,3,i,j,2,1",
+    " oc": "c,4,1h,9,29,1,a,8,1,1,21,e,o,5,l,e,4,17,p,f,n",
+    " oi": "44,86,1,9,d,2",
+    " oj": "n,45,j,6w,1,1,c,1,3,1",
+    " ol": "66,6o",
+    " op": "c9",
+    " or": "i,1,h,m,l,y,1b,l,1r,u,3,3,2,7,2,1,7,3,4,m,5,16,9,8,3,13",
+    " os": "5t,m,1,i,2,c,2p,a",
+    " ot": "j,v,v,16,k,1a,25,1q,25,j",
+    " ov": "5j,2u,3,n,10,u,1f",
+    " ox": "v,4,1e",
+    " pa": "5,1,a,g,2,2,a,1,4,2,1,1,4,1,1,1,3,6,2,6,1,1,b,h,d,6,5,8,1,1,7,4,3,2,4,2,b,6,7,7,7,5,2,1,2,1,u,2,4,1,6,3,3,7,8,x,7,6,2,3,3,1,8,7,j,3,a,a,3,2,9,6,7,9,c,1,5,1,1,3,1,3,6,1,2,5",
+    " pe": "1,b,5,1,9,e,4,2,7,4,h,9,9,4,t,2,7,2,b,2,2,3,8,6,a,2,1,6,b,9,b,h,1,d,3,3,d,e,5,3,3,8,4,4,4,6,4,6,1,3,5,2,2,4,1,5,6,1,3,2,1,2,4,f,5,8,5,1,3,2,5,1,2,1,2,4,1,1,1,1,1,1,1,1,4,e,3,1",
+    " pi": "4,2m,7,2,j,10,1,a,j,1,a,3,1f,5,1,c,x,8,8,b,1,1,1,1,1,1,1,1,1,1,1,1,4,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,x,9,x",
+    " pl": "f,4y,20,1s,d,c,s,4,1,b",
+    " po": "1,5,1,4,a,9,7,1,1,3,7,1,b,c,2,8,1,f,1,t,c,9,6,b,3,2,2,1,1,4,3,2,1,3,2,4,3,1,3,2,5,9,1,c,a,2,5,6,3,1,1,1,4,4,3,8,2,6,a,4,6,1,a,2,1,1,1,2,1,2,9,3,1,e,2,2,5,1,6,5,3,1,b,2,3,1,6,2,2,4,4,1,1,f,2,a,2,d",
+    " pr": "4,6,4,7,e,a,7,1,3,9,a,5,4,e,3,1,f,6,1,4,6,1,1,4,9,9,2,2,4,4,6,8,1,c,3,2,1,3,3,4,1,1,1,4,a,1,6,3,1,m,3,1,7,1,4,2,2,3,3,7,1,8,5,2,1,1,6,8,1,3,2,5,3,2,3,3,1,2,1,i,4,b,4,6,6,1,a,7,d,o",
+    " ps": "58,1w,4p,c",
+    " pu": "2,1,5,1,1,2,1,1,1,1,1,1,1,3,1,6,1,1,1,1,5,1,6,c,f,d,2,c,2,6,2,8,2,1,a,d,1,h,i,2,1,2,3,3,1,2,f,c,1,1,l,8,1,1,2,6,5,c,g,2,p,i,f,4,o,9,1,b,7,v",
+    " qu": "0,2,1,1,2,2,1,1,1,1,2,3,1,1,3,1,2,1,1,2,2,4,1,7,1,1,2,5,2,2,1,2,3,2,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,2,5,6,1,3,4,2,1,2,1,2,4,1,1,1,1,1,1,2,1,1,1,1,1,1,1,2,2,1,1,1,1,3,1,1,2,1,2,1,1,3,1,1,1,4,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,2,1,2,1,1,2,3,1,1,1,2,2,1,1,1,1,2,2,1,1,1,1,1,1,2,1,1,2,1,1,1,1,2,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,4,1,1,1,2,1,1,4,3,1,2,1,1,1,1,1,1,1,1,2,1,3,1,1,1,1,1,1,1,4,1,1,1,1,2,1,1,2,1,2,2,2,1,2,1,1,1,1,1,3,1,1,1,1,1,1,1,1,1,1,1,1,4,1,1,1,2,1,1,1,2,1,1,2,2,1,1,2,1,1,2,1,1,1,1,2,2,1,1,2,2,1,1,3,2,1,2,1,1,2,1,7,2,f,1,3,1,1,6,1,1,2,1,3,1,1,1,6,1,3",
+    " ra": "1o,g,b,2,h,t,2,7,5,1,1,5,2,f,j,l,1,1,1,a,3,s,5,v,2,11,1h,1,5,7,h,17",
+    " re": "0,8,3,6,3,1,1,1,1,1,1,1,1,3,2,1,1,5,1,1,4,f,2,1,1,1,c,1,5,1,6,6,9,1,2,1,8,3,6,n,b,7,l,1,4,1,4,8,c,a,f,4,7,4,d,1,2,1,3,5,1,2,2,1,1,5,1,1,2,1,1,9,9,b,1,5,c,2,f,b,1,8,2,1,d,2,4,1,5,b,2,1,5,5,1,b,e",
+    " ri": "2d,1,1,r,1,2,5,f,1y,k,3,14,2,1,2,3,2,5,2,1,2,1,1,5,1,u,22",
+    " ro": "2l,i,m,t,h,1k,a,7,6,1n,k,1,1,3,l,z,15,r",
+    " ru": "3h",
+    " sa": "2,t,2,2,j,6,i,2,2,1,1,1,8,1,3,1,1,1,4,1,4,2,1,1,1,1,2,2,a,1,f,e,l,4,1,1,m,2,1,p,8,a,9,a,2,3,c,1,7,18,n,8,f,k",
+    " sc": "a5",
+    " se": "5,1,4,1,5,1,i,1,g,2,2,4,2,3,1,a,r,3,1,b,7,2,3,3,j,e,6,f,4,3,9,5,8,5,1,l,1,1,3,2,1,1,5,7,2,1,1,5,6,7,1,6,1,3,7,1,1,1,1,2,1,3,1,2,3,1,1,1,1,1,1,1,3,1,1,3,1,8,9,5,1,1,4,4,2,5,5,6,2,h,1,2,3,1,7,d,1,2,a,5,1,4,1,1,1,1,1,2,2",
+    " si": "j,3,g,8,1o,d,5,1,7,4,7,8,2,7,4,1,3,1,3,1,5,2,3,2,z,1,6,d,e,8,2,2,4,14,a,3,5,1b,3,7,3,6,1,3,1,7,4,2,1,8,2,1,b,1,1,6,1",
+    " sj": "4s",
+    " so": "4h,3,4,1p,q,1f,1s,1,e,k,7,f,5,4,7,p",
+    " st": "8d",
+    " su": "9,2,9,5,1,1,8,o,1,2,j,1,i,9,1,1,7,a,1,h,5,1,2,5,1,4,6,2,5,k,3,f,a,g,9,j,9,x,5,g,5,j,3,1,d,1h,7,6,c,7,6",
+    " ta": "1e,2x,1v,12,1i,7,1,d,1i,1o",
+    " te": "a,q,e,e,7,1,w,4,5,9,9,t,d,19,2,9,5,1,1,8,2,1,7,7,1,1,1,1,z,b,4,1,1,1,1,1,1i,g,3,6,19",
+    " ti": "z,2,a,t,1g,14,1,7,b,1,7,1,1,1,9,5,e,1,1,1,v,2,5,5,4,t,2,a,r,v,k,1,2,18,a,e",
+    " to": "g,b,5,u,2y,i,f,9,1e,1x,3p",
+    " tr": "8,f,k,2,7,7,3,d,14,o,3,3,h,4,b,7,6,z,w,6,7,2,5,d,9,2,h,3,1,1,1,1,1,g,11,1,7,a,1,5,h,3,f,1",
+    " tu": "1x,20,2a,3,1,6,r,h,e,8,j,9,1w",
+    " u ": "a3",
+    " ul": "17",
+    " un": "1,1,b,e,3,2,3,2,a,2,3,3,1,2,3,8,7,m,1,4,h,5,5,3,2,2,1,7,a,b,3,6,e,1,1,2,3,8,1,1,4,3,1,1,1,2,2,1,1,2,3,3,2,2,4,5,3,1,5,6,1,1,4,5,2,1,2,6,1,5,6,4,1,9,4,1,3,3,2,1,2,4,4,2,5,5,c,3,1,5,2,4,6,2,1,1,5,4,1,1,5,8,3,7,3,1,8,2,6,3,7,g,1,7",
+    " ur": "n,6v,2,2,3,f,2,1,1,3",
+    " us": "7,3z,8d",
+    " ut": "8c,3,2,m,2",
+    " uv": "5b",
+    " va": "1a,n,9,c,1,d,1,2,c,m,i,l,6,14,1,h,j,j,c,4,9,1,8,1,1k,5,3,4,g",
+    " ve": "z,b,b,1,s,c,9,q,f,13,1q,4,d,4,1,1,2,3,4,1,1,1,8,1,n,i,w,w,1i,3,1,c",
+    " vi": "0,8,9,3,1,1,1,2,1,1,1,5,g,c,3a,1h,14,1g,h,a,p,a,17,b",
+    " vo": "3x,2q,5s,g",
+    " vu": "8k,r,6,j",
+    " we": "6a",
+    " wo": "4c",
+    " x.": "68",
+    " y ": "0,4,6,1,1,2,2,2,1,1,2,1,4,2,e,1,1,1,2,2,2,c,5,4,6,2,6,4,a,3,1,1,1,3,8,1,3,1,2,1,4,2,3,6,2,3,2,1,1,6,2,1,1,2,3,1,1,5,1,2,6,3,8,1,1,1,4,1,7,2,6,1,6,5,3,1,2,3,1,1,3,3,4,9,5,1,2,7,1,6,3,1,3,a,a,2,2,8,2,3,5,1,6,2,5,5,3,2,1,1,1,3,1,1,1,7,1,1,2,4,5,8,2,1,7,3,3,1,3,1,b,1,1,1,1,1,1,1,1,1,1,2,1,5,2,7,4,c",
+    " y,": "84,16,5,1n",
+    " y/": "bb",
+    " zo": "9n",
+    " zu": "cb",
+    "(ac": "3l",
+    "(be": "a8",
+    "(co": "1v,71,2a",
+    "(de": "bs",
+    "(di": "1j,26",
+    "(ei": "8e",
+    "(el": "3o",
+    "(ep": "3",
+    "(er": "16",
+    "(es": "8s,1u",
+    "(fi": "1e,5y",
+    "(gl": "80",
+    "(hi": "4o",
+    "(ho": "11",
+    "(hp": "8p",
+    "(ig": "89",
+    "(it": "8x,2,3",
+    "(la": "1h,9e",
+    "(lh": "b1",
+    "(li": "a7",
+    "(lo": "w",
+    "(ma": "1t",
+    "(me": "9k",
+    "(mo": "22",
+    "(ne": "3i",
+    "(no": "a4",
+    "(ob": "b6",
+    "(qu": "am,1",
+    "(si": "18,3f",
+    "(so": "8d",
+    "(sp": "8m,33",
+    "(ur": "8b",
+    "(ve": "3p",
+    "(vi": "k",
+    "(vp": "90,h",
+    ") a": "8w",
+    ") c": "8x,2,2q",
+    ") d": "w,i,o,85",
+    ") e": "1h,2,26,3n,2s,i,1",
+    ") m": "92",
+    ") q": "3p,5v,o",
+    ") r": "b6",
+    ") s": "1t,6g,3j",
+    ") y": "b6",
+    "), ": "3i",
+    ", a": "3u,1x,1n,q,16,5,12,9,3,5,4,r",
+    ", c": "4,12,2,11,15,1t,c,j,q,q,b,32,7,1b,3",
+    ", d": "18,1,d,2,7j,3,16,h,z,g",
+    ", e": "j,1l,1e,10,v,6,1d,h,c,1t,c,9,r,18,8",
+    ", f": "19,8i",
+    ", g": "1,17,5,1d,m,6,3a,r,2e,5,5,2,7,1a,g",
+    ", h": "18,g,45,m,2,f,i,d,d",
+    ", i": "7,2p",
+    ", l": "n,t,d,19,4,1,1b,4,p,2,3,f,5,i,d,g,7,g,5,1f,c,c,i,e,b,u,1,6,3",
+    ", m": "44,2l,2f",
+    ", n": "1o,2q,2e,m,4l",
+    ", p": "i,r,2b,y,j,6,1d,e,d,21,3,3,b,13,s,w,3,1",
+    ", q": "6,13,e,n,18,1k,9,13,d,8,1,5,9,1,7,4,1u,u,2,4,5,3,1n,l",
+    ", r": "3r",
+    ", s": "1a,u,4l,1v,2q,q",
+    ", t": "6k,8",
+    ", u": "1g,4,2,3,8,2e,b,3,22,h,c,16,1p,k,20",
+    ", v": "6s",
+    ", y": "7v",
+    ",xx": "68",
+    "-ac": "41",
+    "-ba": "53,5d",
+    "-bo": "aw",
+    "-co": "b6,w",
+    "-da": "7b",
+    "-de": "b5",
+    "-im": "bb",
+    "-kl": "46",
+    "-le": "8d",
+    "-li": "3x",
+    "-ma": "3v",
+    "-os": "6y,e",
+    "-sc": "aw",
+    "-to": "3v",
+    "/o ": "bb",
+    "1\ns": "6a",
+    "12.": "4z",
+    "2\ns": "6b",
+    "20.": "96",
+    "47,": "68",
+    "7,x": "68",
+    ": o": "4s",
+    "; u": "41",
+    "a\na": "bc",
+    "a\nb": "bc",
+    "a\nc": "7e,2f",
+    "a\nd": "6p,4,8,2c",
+    "a\ne": "6u,l,1x",
+    "a\ng": "ah",
+    "a\nh": "6k,c",
+    "a\nj": "3c",
+    "a\nl": "6z",
+    "a\nm": "6l,3g",
+    "a\np": "6y,6,6",
+    "a\ns": "bx",
+    "a\nt": "5i",
+    "a (": "3,h,u,2a,4l,5,b,7,1b,u",
+    "a 2": "96",
+    "a a": "i,d,5,5,3,8,1,9,2,g,f,1,3,2,5,6,i,8,c,g,8,7,1,6,7,1,6,5,m,6,l,1,2,d,8,a,2,2,1,2,w,3,1,1,3,b,4,h,1,7,c,3,g,1,2,5,2,2,5,j",
+    "a b": "0,1k,1,1,3,2d,6,2,f,a,1l,f,1q,3,6,n,5,m,2f",
+    "a c": "3,i,3,3,9,3,d,8,2,3,k,1,2,1,3,4,6,8,1,6,3,1,3,3,1,2,1,2,2,c,3,9,6,1,2,1,d,5,3,1,3,a,4,9,2,5,g,5,4,4,4,7,2,1,8,6,c,1,1,x,1,a,9,1,1,3,8,2,2,1,3,b,3,3,a,j,3,1,k,e,1,9",
+    "a d": "8,3,1,1,6,f,1,1,5,4,2,1,5,3,2,4,7,6,8,1,4,1,3,1,3,6,1,7,2,5,1,6,1,1,4,3,1,1,1,7,3,2,1,3,1,1,1,2,2,4,1,7,3,1,2,5,6,3,3,1,1,2,5,1,1,3,b,2,3,6,1,1,3,1,1,1,2,2,2,1,3,2,1,1,1,4,1,2,1,4,3,1,5,3,6,2,6,2,1,1,4,1,4,a,2,1,5,5,1,1,1,2,2,9,3,2,7,1,2,1,1,1,8,3,1,6,2,3,3,1,c,1,6,a,2,3,3,2,3,1,2,5,e,2,6,2,2",
+    "a e": "4,2,6,2,1,1,p,1,8,2,4,2,8,1,1,1,1,1,2,1,2,4,5,8,1,5,2,1,2,a,1,1,6,4,8,3,5,2,6,1,4,2,2,5,2,1,2,6,1,e,1,4,7,1,1,6,a,1,2,1,2,1,6,a,1,6,1,6,9,6,5,4,c,1,3,2,5,4,1,2,4,e,1,7,7,1,1,h,3,2,1,1,1,4,6,5,1,1,3,1,1,2,b,7,5,e,4,5,7,4,1,7,5",
+    "a f": "6,1n,i,r,6,h,1l,j,m,x,1,9,2,2,e,1,6,s,15,8,d,h,a,r,3",
+    "a g": "6,e,9,u,a,2s,2,q,1,5,3,6,2,1,d,e,y,10,1,1,1d,u,2,q,6,9,8,2,7,6,1",
+    "a h": "1q,7,1,2h,16,3,1,1,4,4,f,8,14,f,t,1,2,5,c,x,r,p",
+    "a i": "0,1,k,1,4,c,1,4,2,4,q,7,e,e,e,1,5,8,m,4,1,3,1,3,4,1,1,2,3,1,1,1,3,1,4,1,c,x,3,6,5,h,3,m,c,3,a,1,1,1,1,1,l,a,i,2,1,9,2,6,3,1y",
+    "a l": "2,1,4,2,5,4,s,7,9,i,h,4,f,8,1,1,6,7,1,2,4,1,6,1,4,5,6,9,2,1,1,1,2,1,9,c,1,1,1,9,a,2,9,3,a,4,4,6,a,3,1,9,2,3,4,i,1,p,5,5,l,6,4,4,1,1,2,2,1,6,5,5,f,6,8,7",
+    "a m": "i,6,1i,1,8,1,1,3,1,u,3,c,4,2,2,3,3,1,2,3,4,5,e,a,o,2,9,1,5,1,4,o,8,c,m,3,4,b,1,6,b,e,8,2,e,4,5,3,2,1,2,2,5,h,7,e",
+    "a n": "4,g,9,2,4,2p,4,f,2,e,n,f,6,8,1q,1,c,k,z,1w,g,f,2,b",
+    "a o": "3,9,w,b,4,2,t,11,3,k,f,b,e,e,6,c,8,1,j,2,k,5,c,2,1,7,b,j,8,k,n,4,4,5,19,6,a",
+    "a p": "1,5,7,2,1,1,4,9,2,4,1,1,1,2,5,1,2,1,2,2,1,5,1,1,d,4,1,c,6,1,8,d,4,2,9,2,c,1,7,1,4,1,3,3,3,1,1,1,4,6,4,2,1,1,9,1,1,2,3,1,1,9,1,1,f,3,3,3,2,3,2,1,2,1,2,3,1,2,3,3,8,2,2,4,7,3,5,5,5,1,1,4,2,2,1,3,2,1,1,4,1,1,2,1,1,1,1,1,4,3,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,2,1,1,1,3,4,7,3,1,2,3,a,3,6,1,3,7,1,1,1,1,1,1,1,1,a,2,3,i",
+    "a q": "0,3,1,4,1,5,3,1,h,c,5,2,8,3,b,3,1,l,5,3,7,6,1,1,3,7,1,1,a,e,6,3,7,5,6,3,3,4,9,f,1,1,1,g,5,5,4,5,2,e,4,4,9,1,1,1,l,1,8,9,3,a,2,1,4,6,3,6,3,e,2,3,1,1k,7,1,1,1",
+    "a r": "b,g,7,1,15,8,q,8,7,2,a,c,1,19,o,13,h,c,3,3,2,1,15,1,2h,b,q",
+    "a s": "v,4,h,s,t,2,1,1,1,1,11,2,6,4,2,2,2,2,d,2,d,8,3,4,1,9,k,5,p,3,8,5,2,11,7,j,4,d,w,3,3,2,q,5,f,1",
+    "a t": "8,j,k,3,9,3,2z,4,b,d,1,e,e,1,1,1,s,5,2,1b,4,6,1,2,1k,7,1f,1,n",
+    "a u": "r,30,3,1h,5,9,b,4,1,b,q,6,6,2,2,3,9,6,2,1,m,p,r,8,2,5,5,o,4,8,b",
+    "a v": "1l,1,s,c,z,f,v,1y,4,d,4,1,1,2,3,4,2,1,8,1,e,1,9,h,7,p,w,16,n",
+    "a x": "67,1",
+    "a y": "a,16,r,18,7,j,7,2,8,t,k,1,m,3,v,7,7,m,a,a,6,1,2,2,e,5,c,6,5,16,3,4",
+    "a) ": "1h,6s",
+    "a).": "8b",
+    "a, ": "19,1h,c,1c,x,8,8,4,u,3,7,f,4,1,3,3,2,4,8,17,1e,m,g,h",
+    "abd": "18,1,b,2,2,j,7w,k,7",
+    "abe": "38,4,7,l,e,e,6,b,2,1,b,9,1y,8,1,y,d,6,5,1,1o,1h",
+    "abi": "15,7,2z,5u,18,d,r,8",
+    "abl": "18,2y,7a,n",
+    "abo": "2n,z,l,18,c,3f,8",
+    "abs": "3z,1,z,h,4i",
+    "abu": "1q",
+    "aca": "16,a,9,c,c,3,1,1,k,4,1,p,k,6,3,9,2,3,2,m,1b,b,25,n",
+    "acc": "4,1c,z,d,t,g,7,c,2,15,v,v,1w,1,1u,18",
+    "ace": "2u,7,18,3,v,11,1t,2,r,b,7,3,26,16,1",
+    "ach": "8x",
+    "aci": "0,1,4,1,1,3,1,4,1,1,a,7,4,1,1,2,1,2,4,1,1,2,2,1,2,2,1,1,1,2,7,4,1,2,1,1,2,4,5,1,2,3,4,3,3,2,7,1,7,2,8,3,6,3,3,3,3,5,4,2,a,1,2,4,2,3,1,1,8,9,1,a,b,1,1,2,1,1,7,1,2,2,1,4,2,3,5,3,2,3,4,2,1,2,8,3,1,6,1,8,1,3,1,5,1,1,1,8,1,2,1,1,g,8,9,8,3,1,3,1,1,2,5,1,2,3,3,9,1,1,1,1,1,2,1,1,1,1,3,1,2,1,1,1,1,2,1,1,1,3,1,1,1,2,2,1,1,1,2,2,2,a,1,1,1,1,1",
+    "acn": "9b,4,k",
+    "aco": "2,1g,s,1,2,1,1,1,1,4,1,8,1,7,3i,5,43,d,7",
+    "acr": "3m,n,1e,5d",
+    "act": "8,f,4,2,e,2,8,8,e,1q,4,9,r,c,6,2,1,1,7,3,1,9,c,a,7,4,d,3,1,1,1,1,7,8,k,f,2,1,3,9,d,3,2,1,1,1,1,5,6,h,2,2,6,3,7,8,m,n,5",
+    "acu": "f,1u,r,9,r,1s,1e,m,h,k,f,s,e,8,1,y,q,m",
+    "acv": "2s,t",
+    "ad\n": "ab",
+    "ad ": "0,3,6,1,8,3,a,3,4,1,3,1,2,2,3,2,1,6,1,2,3,h,4,4,4,3,8,1,a,3,3,1,1,8,2,2,1,2,2,5,1,2,1,3,1,2,2,1,1,3,2,1,1,1,2,1,3,1,2,4,5,1,3,1,5,3,1,1,1,1,4,2,1,a,1,1,9,2,4,3,2,1,2,3,1,1,4,7,6,1,7,1,2,1,3,5,4,6,4,1,9,m,2,7,1,9,7,5,c,3,4,8,1,7,2,4,2,2,2,1,5,5,4,1,1,1,1,1,1,1,1,4,2,1,b,1,a",
+    "ad)": "22",
+    "ad,": "3i,8h,o,1",
+    "ad-": "bb",
+    "ad.": "71",
+    "ada": "1,k,9,5,1,1,1,1,7,3,1,2,9,4,b,h,e,3,2,c,v,4,5,2,9,4,b,1,b,2,f,l,3,7,7,e,4,6,8,i,a,3,2,1,3,2,c,9,8,6,2,6,5,4,6,5,2,4,2,j,q,9,6",
+    "add": "4q,u",
+    "ade": "5,i,c,f,1b,c,3,2,1,k,5,2,c,b,8,6,a,1,2,b,y,2,i,5,d,p,1n,i,d,4,6,s,h",
+    "adi": "2g,f,3b,z,11,1",
+    "adm": "bz",
+    "ado": "1,d,2,4,4,b,e,1,6,2,2,4,6,6,2,2,4,h,d,1,5,a,3,8,9,f,3,6,4,6,5,6,4,j,4,d,6,i,2,4,f,b,6,u,1,d,j,5,2,6,3,1,1,3,d,1,5,1,1,3,6,4,5,2,1,a,6,5,5,9,1,1,1,4",
+    "adq": "46",
+    "adr": "42,1x",
+    "adu": "46,19,8,21,w,41",
+    "ae\n": "bm",
+    "afa": "43,3",
+    "afe": "9,5,3,1,b,1,1,d,3,3,4,8,c,2,2,2,l,3,2,3,2,5,3,3,a,e,1,4,3,4,3,1,7,5,2,5,1,6,5,4,5,5,f,1,1,1,8,6,6,a,1,3,2,2,2,a,3,5,9,3,1,12,2,3,8,1,2,3,1,6,1,4,4,3,j,1,2,c,2,1,9,5,c,k,1,1,1",
+    "afo": "45,79",
+    "afr": "1q",
+    "aft": "3s",
+    "ag\n": "b3",
+    "aga": "15,i,7c,t",
+    "age": "4k,6j,a",
+    "agi": "l,7,e,h,d,14,l,24,m,24,1,e,s,1,32",
+    "agm": "1q",
+    "ago": "14,1,1,h,3,6,1,3,1,1,2,3u,11,g,1,3l,d",
+    "agr": "62,a,2d,3,1p,h,1s",
+    "agu": "1,e,g,1v,1,6,7,d,q,2s,2s,25,12",
+    "ahs": "cw",
+    "aid": "52,4m",
+    "ain": "p,4e,26,1k",
+    "aio": "48",
+    "air": "2,1,d,bu,3",
+    "ait": "41",
+    "aja": "4d,1b,1a,1,6,f,1l",
+    "aje": "43,3,32",
+    "ajo": "v,4,n,1d,2w,43,1,8,1h,d",
+    "ake": "76",
+    "al\n": "3l,3n",
+    "al ": "e,6,2,a,b,1,1,7,l,1,4,1,1,2,1,1,1,a,2,3,1,1,1,3,5,1,5,5,1,2,1,3,3,4,6,1,1,1,5,9,7,1,a,n,3,5,7,a,3,6,b,5,3,7,g,3,2,8,7,1,4,6,2,1,a,1,1,1,1,2,2,3,k,2,d,4,1,7,9,7,3,g,8,h,a,5,9,3,3",
+    "al)": "1t,2u,5z",
+    "al,": "18,1,5p,3i,1k,h",
+    "al.": "1c,1,13,1,18,9,2,7,1v,1,u,f,2,u,i,b,1h,5,7,11,9",
+    "ala": "12,1,5,t,42,d,6,3h,u,1f,f",
+    "alb": "7r",
+    "alc": "1l,4a,1q,1o",
+    "ald": "42,b,17,1f,6,9,2p",
+    "ale": "1,3,1,1j,j,18,8,2,d,d,5,l,e,1,p,k,s,b,1,o,1,1,9,3,8,1,5,8,x,2,6,9,7,7,3,8,1,6,1,7,3,7,2,1,1,1",
+    "alf": "al,4,b",
+    "alg": "2y,j,9,n,u,1,1h,5,5,5,4,6,3",
+    "ali": "y,p,e,3,q,e,m,1t,9,3,h,9,1g,1,1,2i,1,7,1,5,9,1,h,1,1,1,1,1,1,1,1,6,4,a,3,6",
+    "all": "2d,3t,1h,20",
+    "alm": "1,a,z,3,r,m,m,6,r,3,2,4,2,3,12,f,1,16,8,1,s,7,b,7,h,7,1,3,2,2,5,1,4,2,3,4,c,3,6,15",
+    "alo": "47,3,5,n,4m,1",
+    "alp": "8e",
+    "alq": "7i",
+    "alr": "5,a2,f",
+    "als": "bs,d",
+    "alt": "e,e,6,16,4,3,i,d,1,2f,k,5,2t,27,d,b,a,m",
+    "alu": "39,2j,5k,o",
+    "alv": "2i,1",
+    "alz": "3f",
+    "am)": "av",
+    "ama": "0,1,1,1,2,1,1,b,m,3,2,4,2,4,1,2,3,2,9,5,2,c,1,1,c,x,n,d,1,2,1,2,1,5,1,3,1,2,p,c,4,2,7,3,3,6,g,6,1,1,9,9,1,4,5,5,2,4,1,z,3,1,2,5,2,9,1,1,b,1,2,1,y,c,5,1,1,1,k,1",
+    "amb": "2,16,1q,m,o,m,1s,y,8,c,r,2a,17",
+    "ame": "b,4,d,p,c,p,s,b,1e,2o,v,u,d,x,q,1d,7",
+    "ami": "0,2a,d,2,z,3,i,3,3,k,13,a,4,1,o,3,u,n,3,5,1k,g,1,8,5,k,1,5,b,5",
+    "amn": "c6",
+    "amo": "3p,t,22,v,23,4,7,h",
+    "amp": "4a,12,1a,1,2h,o",
+    "amy": "8x",
+    "an ": "h,8,t,s,8,g,7,k,6,1,c,2,j,4,f,2,9,4,i,a,1,1,2,6,2,f,1,2,8,h,1,g,3,m,3,n,2,4,m,8,7,3,4,r,1,l,1",
+    "an,": "4i,50",
+    "an.": "c,5t,2d,41",
+    "ana": "5,3,2,j,h,i,8,7,e,r,z,11,1,1,q,l,u,10,3,f,5,k,2,2,1,1,1,g,5,1e,b,2,4,5,a,5",
+    "anc": "c,5,j,f,2,e,1,1,1,1,a,e,i,x,6,2,8,2,1,b,k,g,1,1,5,8,h,14,1,i,1,1,8,1,1,m,5,1,1,1,1,1,1,3,2,8,2,3,2,2,1,4,n,g,d",
+    "and": "a,6,q,2,4,u,u,e,o,4,9,1,9,1,8,1,1,h,1,1,1,3,2,1,4,2,3,3,7,1,1,1,4,c,n,o,6,9,2,4,1,1,2,1,f,3,n,5,b,2,1,h,1,1,z,j,9,1",
+    "ane": "h,1l,b,a,g,1,8,8,2,19,4,34,13,5,2,3,7,3,3,3,2,2,1,2,6,3,21",
+    "ang": "i,d,2,2,14,2,1,2,2,1,1,1,9,3,1,1,1,4,1,4,2,1,1,1,1,4,a,1,f,e,l,1,3,1,1,o,1,o,9,j,c,3,c,1,7,23,2,1,1,1,1,2,6,1,2,1,1,1,3,14,8,h",
+    "ani": "35,2j,11,2v,p,v,1,3,6,4,1,5,2,1",
+    "anl": "7b",
+    "ann": "66,4q",
+    "ano": "i,1,h,a,c,6,f,g,5,2,3,6,e,1,3,2,5,3,l,l,c,1,5,6,f,2,6,5,l,6,o,1,8,1,1,7,1,3,8,6,4,4,5,8,3,1,4,5,8,7,1,a,5,1,3,3,g,a,6,2,g,b,2,1,6,4",
+    "anq": "57,1q",
+    "ans": "41,3o,d,9,j,3,1,1,1,1,1,1i,i,1,6,6,s,e",
+    "ant": "6,e,9,u,a,y,2,i,2,p,1,8,8,3,f,2,7,9,2,z,6,3,4,6,3,k,f,6,7,1,9,1,1,5,2,1,1,1,5,u,9,4,d,2,h,c,1,4,9,6,2",
+    "anu": "a9",
+    "anz": "99,2l",
+    "aor": "2n,1",
+    "apa": "f,l,e,3,c,r,4,13,c,3,f,2,o,t,d,r,f,3,p,8,m,2,2,j,17,d,4,m,f",
+    "ape": "1k,3i,6d",
+    "api": "1o,g,b,2,18,5b,8,9,39",
+    "apn": "b,f,2k,9m",
+    "apo": "cq,7",
+    "aps": "g,g,7m",
+    "aqu": "8,j,1k,6,v,o,2w,46,6",
+    "ar\n": "6e,8,5,4,8,e,1u,6",
+    "ar ": "3,5,1,1,d,6,2,7,1,6,8,6,1,5,7,d,2,3,j,8,2,9,1,4,a,7,9,2,a,3,1,7,2,9,e,k,a,5,5,8,3,3,3,3,8,3,4,9,t,1,c,l,9,q,2,c,7,2,g,a,3,c",
+    "ar,": "1m,i,aw",
+    "ar.": "y,1,c,a,2t,27,o,4f",
+    "ar;": "41",
+    "ara": "5,k,2,7,d,6,6,2,4,q,i,j,5,4,4,1,1,6,1,2,2,2,9,8,j,3,4,9,2,1,u,7,2,c,6,a,1,8,6,2,g,9,6,1,1,1,1,3,6,k,2,3,9,7,6,5,4,g,4,2,7,2,c,2,5,5,3",
+    "arb": "a3",
+    "arc": "c,6,e,12,1x,o,c,6,1,1q,15,j,5,5,1,8,m,1,2,h,r,13,v",
+    "ard": "1e,a,m,1,2,1,1,1,1,1,1,1,1,1,8,1,6,1,4,1,17,1d,f,5f",
+    "are": "d,3,u,8,1,2,h,3,2,1,1,5,1,5,e,l,l,4,7,n,h,14,o,2,12,s,1,5,b,e,b,c,5,1,8,b,t,a,2",
+    "arf": "2w",
+    "arg": "6,e,9,u,a,58,8,33,h,q,p,2,a",
+    "ari": "4,2,1,c,1,3,4,2,h,6,u,m,3,5,m,2,3,2,2,8,8,1,4,1,1,2,1,3,6,2,3,2,5,4,5,1,3,3,c,2,1,4,1,1,a,1,1,o,2,4,1,2,2,8,j,3,c,b,5,6,9,2,b,7,8,5,h,1,a,8,u,1,1,2,5,1,5",
+    "ark": "3e",
+    "arl": "5a,6b",
+    "arn": "a5",
+    "aro": "32,r,d,1,7,1j,1,1,1,a,3,1t,1z,k,d",
+    "arp": "6h,31,p,20,k,1",
+    "arr": "k,g,8,1,3,g,m,a,1e,o,d,7,a,f,8,2,a,c,1a,16,9,i,6,2,6,12,1g",
+    "ars": "1l,3p,j,m,t,m,3o,1",
+    "art": "6,7,1,i,4,a,e,2,i,1,1,1,c,1,1,2,2,s,1,3,8,g,1,1,2,r,1,15,5,1,8,2,2,1,2,4,1,1,1,5,3,1,1,2,k,s,a,1,15,n,1f,2,l",
+    "as\n": "6s,1n,w,3,1j,1f",
+    "as ": "0,5,3,4,1,1,1,2,1,2,2,1,1,1,1,1,1,1,4,6,4,3,2,2,4,1,5,5,1,2,2,a,1,1,6,1,1,1,6,1,3,4,1,1,2,8,6,3,2,3,1,2,1,2,3,1,2,3,6,2,5,2,1,2,1,3,2,2,1,3,2,3,3,1,2,1,1,1,2,1,1,2,1,1,2,9,1,2,1,1,3,1,5,2,1,1,2,1,1,3,2,1,4,3,3,1,1,1,2,3,1,1,1,4,1,2,1,1,1,1,4,9,2,1,4,1,2,9,2,1,1,2,3,5,1,7,1,4,1,2,1,3,3,4,2,1,1,1,1,3,1,1,1,2,2,2,1,5,3,2,2,6,6,1,1,4,1,1,1,1,2,1,1,1,4,4,1,2,a,2,1,3,1,7,1,1,5,2,1,2,2,9",
+    "as)": "3p",
+    "as,": "n,1m,1,28,y,14,2y,9,2,w,1,7,z,g",
+    "as.": "0,8,e,b,d,5,k,4,6,h,g,1,d,4,8,o,6,m,1,4,t,3,14,1u,8,3,1,1,3,1,2,c,7,c,1,b,f,5,9,3",
+    "asa": "5,24,10,1t,q,n,6,7,g,23,a,m,e,c,1f,1,3,1,1,b",
+    "asb": "13",
+    "asc": "2f,d,t,g,e,l,r,1g,a,t,1r,c,a,2,u",
+    "ase": "18,g,31",
+    "ash": "4p,1c",
+    "asi": "h,f,p,3,1,c,2,1,4,1f,c,4,3,9,3,q,11,1,1,t,8,9,g,2,h,5,d,g,l,3,7,6,1,7,2,8,z,q",
+    "asm": "0,6m,2n,s,6,k",
+    "aso": "21,5,q,1,e,14,l,6,z,n,j,z,1b,s,5,3,5,8",
+    "asp": "11,3a,5c,6,h,e",
+    "ast": "b,8,l,2,2,h,7,1,4,1,1,t,8,6,3,7,6,3,2,2,1,5,1,2,1,7,3,7,2,1,1,5,6,1,1,1,9,4,1,1,2,d,1,1,7,1,1,2,a,2,1,3,a,8,1,3,1,i,1,2,b,1,26,7,1,a,1,1,1,1,1,1,1,1,1,1,1,1,2,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,f,2,a",
+    "ata": "h,3,1r,c,15,4,k,9,9,2,2,1,2,5,1m,6,5,1h,1,1,y,p,8,n,10",
+    "ate": "w,x,g,1f,e,2z,1k,2q,n",
+    "ati": "i,r,4,1,1,1,u,4,4,4,8,1,5,1,b,2,3,1,e,2,9,2,1,4,1,6,1,c,3,3,6,4,1,f,1,n,3,2,2,2,2,b,1,2,8,1,1,s,f,1,8,f,1,g,6,5,7,3,1,1,1,1,1,1,1,1,1,2,1,1,1,2,1,1,2,1,1,7,5,7,e,2,1,4,2,e,2",
+    "ato": "0,3,5,9,1,2,1,1,1,2,1,1,1,3,2,a,2,h,8,1d,8,x,1,d,1,2,4,3,3,3,3,t,d,8,b,1,o,n,g,i,b,7,e,2,f,1,5,1,1u,4",
+    "atr": "a,14,4g,n,r,4,s,7,30,1,1,h,1,1,1,1,1,1,1,1",
+    "att": "ac",
+    "atu": "5o,1d,1i,3n,g",
+    "au-": "46",
+    "auc": "c9",
+    "aud": "2y,9m,d",
+    "aum": "2f,r,1,2,2i,52,3,b,z",
+    "aur": "2f",
+    "aus": "0,1,2,5,b,3,1,1,1,1,1,3,1,6,1,1,3,1,1,1,4,1,a,1,e,v,f,1,4,a,3,4,5,5,2,3,4,1,2,6,3,8,4,5,1,9,1,2,c,1,1,3,1,4,1,6,4,5,1,6,m,a,2,3,l,1,1,d,4,8,4,2,1,1,1,4,1,4,1,4,4,4,4,2,3,2,4,u,a,g,1,4,7,4,7",
+    "aut": "3b,i,m,1,i,2,b,1,4,5,g,p,1,b,2q,1a,b",
+    "ava": "a5",
+    "ave": "b,8,a,2,v,2f,7,c,x,15,6,9,1v,k,b,p,7,9,8,4,d,1",
+    "avi": "5,1l,31,1z,3d,k,1q",
+    "axi": "3s,3j,5i",
+    "aye": "75",
+    "ayn": "2y",
+    "ayo": "c,3w,2t,43",
+    "aza": "8w,3l",
+    "azi": "cr",
+    "azo": "4,a,u,g,n,1,1,1,4,1,1,1,8,1,2,5,a,g,1i,18,d,2,w,s,4,5,a,1,1,1,8,n,d,k,1i",
+    "azu": "1h,n",
+    "b12": "4z",
+    "ba ": "3m",
+    "bac": "8,l,w,5u,10,f,3,p,5,1,1,1,2t,1",
+    "bad": "1g,36",
+    "bag": "47,2s",
+    "baj": "v,4,n,1d,1e,1b,7,13,1,6,20,t,1,8,1h",
+    "bak": "76",
+    "bal": "4d,2m",
+    "bam": "2n",
+    "bar": "4e,p,3t,7,1,1,1,5,q,f",
+    "bas": "3k,15,4w",
+    "bat": "4l",
+    "baz": "ay",
+    "bco": "4f",
+    "bdo": "18,1,b,2,2,j,7w,k,7",
+    "be ": "3h,1g",
+    "bea": "2d,o",
+    "beb": "9q",
+    "bec": "6x",
+    "beh": "56",
+    "bel": "4i,k,b,45,6,5,1,1o",
+    "ben": "5q,2z,1j,4,9,1x",
+    "beo": "2m",
+    "ber": "9,3v,v,15,1,1,v,15,1,2,w,i,4,38",
+    "bes": "13,26,2j,3y,q,g",
+    "bet": "38,1o,j,1,b,9,1y",
+    "bez": "3c,7",
+    "bia": "78,41,5,3",
+    "bic": "c0,l",
+    "bid": "3u,18,n,5,m,1c,2z,t,1,q",
+    "bie": "15,1t,i,38,3h",
+    "bil": "1l,1,j,1d,4,2,q,6,7,3,1,y,m,2,4,5,6,c,1a,2v,d,a",
+    "bin": "br",
+    "bio": "48,5x,10",
+    "bip": "b5,j",
+    "biq": "4b,86",
+    "bir": "8w",
+    "bis": "cp",
+    "bit": "1c,1q",
+    "biz": "cp",
+    "bje": "bh,14,2,1",
+    "bla": "1c,1o,12,4,2,2,26,c,3m,1,n,e,12",
+    "ble": "18,8,y,v,b,5,x,23,14,15,7,2d,l",
+    "bli": "2x",
+    "blo": "d,1t,l,n,n,e,8c,6",
+    "bo ": "1x,5s,m,j",
+    "boa": "2x",
+    "boc": "4o,4,c,h,r",
+    "boe": "d,2e,85",
+    "bol": "d,15,1,1,17,1g,18,c,1f,1m,1b",
+    "bom": "2d,9,1,e,l",
+    "bon": "9e",
+    "bor": "96,n,1k,19,1,1",
+    "bos": "2,2o,24,2q,8,c,r,3h",
+    "bra": "t,a,14,9,5,10,1,1,2,a,c,4,s,5,1,14,c,1,1,2,4,d,3,2b,2,j,1u",
+    "bre": "4,w,8,k,f,1u,d,a,m,i,a,6,e,1q,e,7,1,7,3,18,9,14,e,9,k",
+    "bri": "2f,1p,1w,2,1w,52",
+    "bro": "0,1,9,7,2,8,n,11,d,q,3,1,1,3,4,5,2,1,6,2,1,4,8,14,r,1,6,n,13,1t,i,2a",
+    "bsc": "3z,1,5y",
+    "bse": "48,6y,3,b,i",
+    "bso": "4z,h",
+    "bst": "3,5,j,29,7e,6,8",
+    "bth": "4e",
+    "bue": "2x",
+    "bul": "w,u,1d,11,v,27,x,6,16,k,5,4,7,n,a,1f,9",
+    "bum": "7r",
+    "bur": "6k",
+    "bus": "by",
+    "ca\n": "74,6,22,1",
+    "ca ": "0,3,1,z,b,f,k,3,1,r,g,2,c,3,1,2,2,5,1,9,3,4,1,1,2,3,1,1,5,4,a,c,1,5,1,1,6,6,i,3,4,4,9,9,3,1,4,5,6,7,4,l,3,2,k,6,1,3,4,3,3,g,1,1,l,1,j,a",
+    "ca,": "32,2p,5z",
+    "ca.": "g,b,z,3y,30,1,18,n,x,3",
+    "cab": "3c,7,z,k,b,45,6,5,1,b,1d,l",
+    "cac": "43,17,3u,2q,b",
+    "cad": "l,1r,23,g,e,1w,2,1s,i,j,1m",
+    "cag": "5y",
+    "cai": "52,4m",
+    "cal": "16,2,d,4,4,8,2e,1g,r,7,l,7,8,c,c,18,2q,g",
+    "cam": "2j,f,1a,a,50,4,7,7,a,v",
+    "can": "c,o,v,1,1,1,1,16,r,m,3,5,3,u,9,f,h,i,m,1,i,1,1,3,5,1,1,i,9,2,1,1,i,4,7,3,q,o,p,2,1,9",
+    "cap": "f,l,h,c,r,4,13,c,3,f,2,o,2c,3,x,m,n,1k,q,f",
+    "car": "c,f,i,2,6,h,6,6,1,2,1,1,1,1,1,1,1,1,1,8,1,6,1,4,1,i,4,4,9,8,q,6,4,1,4,8,q,8,7,j,1,b,6,2,h,a,1,d,a,1,6,1,d,2,3,1,q,n,1,12",
+    "cas": "1e,1s,1,h,5,2s,2x,b,7,b,8,6,1,1,4,8,5,8",
+    "cat": "a,a,u,5y,z,3x",
+    "cau": "0,1,2,5,b,3,1,1,1,1,1,3,1,6,1,1,3,1,1,1,4,1,b,e,v,f,1,4,a,3,4,5,5,5,4,1,8,3,8,4,5,1,9,1,2,c,1,1,4,4,1,6,4,5,1,6,m,a,2,3,l,1,e,4,8,4,2,1,1,1,4,1,4,1,4,4,4,4,2,3,2,4,u,a,g,5,7,4,7",
+    "cav": "5,1l,8f,i,d,1d",
+    "caz": "4,8g,u,32",
+    "cce": "9c",
+    "cci": "1,1,1,1,1,2,1,1,8,3,2,1,2,1,1,1,1,1,1,6,a,2,1,2,2,1,7,c,2,2,2,4,3,4,5,4,6,2,1,2,i,9,5,2,7,a,2,1,1,2,1,7,6,7,4,4,1,4,5,4,5,6,1,1,9,5,5,2,e,2,8,1,1,1,3,8,3,6,4,6,6,3,9,1,1,1,1,1,1,8,2,1,1,1,1,7,1,2,1,2,1,1,1,1,1,2,1,4,1,3,3,2,2,1,1,2,8,1,4,b,4,q,8,2,1,3,6,1,1,1,1,2,7",
+    "ce ": "a,3h,z,6,l,6,3,5,2,1,1,9,1t,2,6,3,5,9,f,7,1,e,t,h",
+    "ce,": "1k",
+    "ce.": "12",
+    "cea": "9f,3c,1",
+    "ceb": "1g,36,4a",
+    "cef": "3u,d,3,5",
+    "ceg": "c9",
+    "cel": "1g,e,2,2,1p,3,w,c,i,g,20,1,j,1,1,9,1,1,i,9,1,1,9,5,j,c,4,2",
+    "cem": "35,2a,1h,2g",
+    "cen": "1g,19,1i,2,2,1,a,1,x,1t,12,f,b,f,26,6,u",
+    "cep": "bw,f",
+    "cer": "c,o,5,2,o,1,1,1,1,g,d,2,7,4,2,b,2,1,1,1,3,4,5,2,1,6,2,1,4,6,2,k,k,5,f,9,8,l,1,i,1,i,1,1,8,1,1,t,1,1,m,5,2,16,b,p,2,1,9,3",
+    "ces": "7,n,i,h,16,2,8,q,1,14,e,1,6,1,2,2,3,1,1,1,1u,1,9,f,r,f,9,l,8,b,d,6,d,1,2",
+    "cet": "56",
+    "cha": "0,h,r,2,e,m,d,2,6,4,n,9,n,r,5,1i,w,a,9,d,5,l,4,1,5,5,8,2,3,4,1,3,i,19,m",
+    "che": "4j,j,11,1r,1u",
+    "chl": "8x",
+    "cho": "1,d,m,k,2,k,6,h,8,47,f,1a,16,9,c,19",
+    "cht": "6x",
+    "cia": "b,1,k,a,6,5,9,3,b,4,1,4,3,1,12,8,h,2,1,9,1,2,3,c,c,1,1,4,4,3,1,b,2,8,3,l,4,c,5,1,2,6,9,4,f,i,5,3,a,1,3,4,1,s,2,8,3,6,2,7,4,8,2,1,2,3,6,f,9",
+    "cib": "52,6i,1",
+    "cic": "a,6,y,c,3k,22,z,a,14,1z",
+    "cid": "j,n,b,c,l,1,d,7,m,6,a,2,3,5,1,9,16,1w,3,d,k,m,k,1n,g,a,2,d",
+    "cie": "1o,p,o,2,1i,5,p,1,1,3,4,5,2,k,1,i,p,l,f,1d,d,p,y,7,j",
+    "cif": "bg,1",
+    "cil": "3k,1k",
+    "cim": "1w,y,8,g,5,a,w,u,1,1,7,k,1,f,5,9,3,j,1,2,h,3,8,q,l,h,6,1t",
+    "cin": "c,1m,5z,j,a,1,u,1",
+    "cio": "0,1,1,1,1,1,1,1,1,1,1,1,4,1,1,3,2,1,2,1,1,1,1,1,1,3,1,2,1,1,1,2,1,2,2,2,1,1,1,2,1,1,2,2,1,1,1,2,7,2,2,1,1,1,1,1,2,1,3,3,1,1,1,2,1,2,2,3,2,1,2,1,1,1,6,1,5,2,2,2,3,3,3,5,1,3,5,1,8,1,2,1,1,2,1,6,1,1,1,1,1,2,4,3,1,1,2,4,1,1,2,1,2,3,1,3,5,3,1,2,1,1,4,2,2,1,1,1,1,2,5,1,1,1,2,1,1,3,2,3,1,2,2,3,2,1,1,1,1,3,1,1,1,2,1,2,3,2,4,4,2,1,3,5,1,2,1,1,5,1,1,1,1,1,1,1,1,1,2,1,2,1,1,1,2,1,1,1,1,7,1,1,1,1,2,1,1,1,1,1,2,1,2,2,1,3,1,1,1,2,2,1,1,2,1,1,1,2,1,2,1,1,1,2,3,3,5,3,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,2,2,1,1,1,1,1,1,1,1,1,1,1,1,3,1,1,1,1,1,1,1,2,1,2,1,1,1,1,2,3,1,1,1,1,1",
+    "cip": "4e,4,2t,27,8,3,j,j",
+    "cir": "1e,8p",
+    "cis": "1m,2d,3k,c,n,s,2p",
+    "cit": "m,y,33,2,f,v,2,3j,i,6,7,8,e,a",
+    "civ": "ac",
+    "ck ": "31",
+    "ck-": "aw",
+    "cla": "8x,7,3j,1",
+    "cle": "29,17,8,z,6,1v,m,j,2n",
+    "cli": "8l,2j",
+    "clo": "45,4g,1g,o,z",
+    "clu": "2w,7t",
+    "cmt": "3v",
+    "cne": "9b,4,k",
+    "co\n": "75,39,1",
+    "co ": "16,r,4,2,8,4,1,1,4,1,8,6,4,9,3,9,4,8,5,1,2,3,2,3,1,8,4,1,8,3,9,r,7,b,1,4,9,1,9,n,9,5,15,9,n,1,4,3,1,5,s,5,4,g",
+    "co,": "75,o,2z",
+    "co-": "b5",
+    "co.": "2a,l,44,w,1f,1o,2,7,7",
+    "coa": "2q,1,6,7,14",
+    "coc": "5a,3i",
+    "cod": "42,7,9,2c,2o,1",
+    "coe": "4a,5",
+    "cog": "bw",
+    "coi": "i,4j,46,1p",
+    "col": "g,g,b,1,a,1,1,1,1,8,1,a,4,p,8,j,u,o,1m,4,4,d,25,i,1,4,1,5,1t",
+    "com": "b,1,6,2,2,2,8,k,1,7,7,1,2,1,2,2,1,16,q,3,3,f,1,2,2,2,2,1,6,2,3,4,9,i,1,f,8,3,6,2,8,4,3,3,2,9,k,9,b,1,1,3,2,h,1,4,3,2,6,1,1,3,b,1,1,6,7,4,6,4,9,2,6,5,5,1,7,n",
+    "con": "1,3,8,9,7,5,2,d,h,b,1,9,g,2,6,1,5,5,6,1,5,2,2,6,g,e,e,7,1,9,3,4,8,3,2,1,d,1,5,2,1,3,3,3,6,1,4,2,5,2,h,1,1,f,1,5,4,4,1,a,2,1,4,7,1,1,f,e,5,1,8,d,1,4,9,5,7,1,1,1,3,8,1,7,1,2",
+    "cop": "68,l,3c,1s",
+    "cor": "e,1w,1,1,1,1,4,1,1,1,8,1,2,5,8,2,f,p,15,2,6,5r,1,9,d,g,1,2",
+    "cos": "2,g,b,9,8,8,w,l,j,2,5,a,s,1,9,b,1,5,r,b,6,3,1k,5,4,6,o,c,1,1,8,b,2,1,1,1,1,2,6,3,1,1,6,n,e,1,1,k",
+    "cot": "3v,7n,b",
+    "cou": "84",
+    "cov": "j",
+    "coz": "64,34",
+    "cra": "3c,a,1b,7g",
+    "cre": "1f,h,3,1o,a,z,k,7,1,1,7,1,1,5,y,c,j,1,2,2,2,9,4,3,1,7,e,c,l,h,6,13,q",
+    "cri": "1o,39,m,r,1,5x,e",
+    "cro": "0,3,10,6,1z,c,n,2,8,8,7,1,h,9,c,2,6,1,h,a,4,l,7,x,1,h,p,a,r,3,k,3",
+    "cru": "r",
+    "cta": "9,5,3,1,b,3,c,c,b,7,1,f,b,3,c,3,3,a,e,1,4,3,4,3,d,7,7,5,q,4,2,e,8,8,1,5,2,2,d,h,q,1,s,3,1,4,e,1,e,4,1,2,c,2,r,m,8",
+    "cte": "8,j,2,o,8,24,4,9,19,4,k,m,7,k,3,8,8,k,f,3,3,m,3,2,1,1,1,1,5,r,o,19",
+    "cti": "3,1o,15,1x,g,8,1,1,7,4,y,i,1,12,a,1d,a,j,8,3,7,5,6,5,e",
+    "cto": "1,m,k,2,1,7,a,2,a,2,7,i,m,1h,t,d,a,b,h,a,3,2,3,r,4,i,1,2,a,1b,3,m,7",
+    "ctu": "2s,2,r,28,m,l,d,1,3,d",
+    "cua": "a,6,j,17,x,1,1b,1,a,8,1,1,a,d,7,1l,3,5,g,6,9,b,f,3,n",
+    "cub": "10,s,f,19,38,1o,t,32",
+    "cuc": "2v",
+    "cue": "6,6,6,1,g,c,1,4,x,3,1,h,2,1,2,5,j,6,j,2,4,3,1,4,7,5,3,5,m,d,5,a,9,1,n,9,3,5,3,2,6,2,d,9,d,b,j,2,e,4,5,1e",
+    "cuf": "cb",
+    "cui": "c1",
+    "cul": "9,m,3,d,7,1,2,1,1,e,1,8,1,4,7,6,t,3,d,d,1,2,a,3,1,5,9,i,n,4,1,1,1,1,1,2,1,1,1,2,1,1,1,6,2,1,5,3,1,1,1,4,p,8,9,1,1,1,1,d,1,2,m,1,5,a,6,6,4,2,q,n,1",
+    "cum": "f,1u,r,9,r,1s,1e,m,h,k,17,e,8,1,y,1c",
+    "cup": "b3,h,i",
+    "cur": "c,4,1h,9,17,12,1,a,8,1,1,e,1n,e,o,5,a,b,e,1,3,q,a,7,o,1,b,4,10",
+    "cus": "5m",
+    "cut": "4v,4g,2,3,7,3,3,3,2,2,1,2,6,3",
+    "cv\n": "2s",
+    "cv)": "3l",
+    "cze": "9c",
+    "d\nh": "7b",
+    "d\nm": "ab",
+    "d a": "27,i,m,i,n,v,5,7,h,1,m,b,9,4,2d,v,7,13,3",
+    "d c": "0,1g,u,y,17,7,15,48,14,d,a",
+    "d d": "19,9,1,5,w,2,b,1,g,a,2,5,2,6,2,4,1,2,9,3,2,g,e,1,1,1,7,u,5,4,c,7,7,7,f,e,o,7,m,c,3,d,13,2,7,1,b,1,a",
+    "d e": "3g,1b,1e,c,7,2,6,4h,i,1,2,2,1",
+    "d f": "av",
+    "d g": "42,71",
+    "d h": "1e,2c,2,86",
+    "d i": "9,9,p,2,3l,1,2,4,6,3,q,1y,g,2i",
+    "d m": "4e,g,1,1q,5,8,47",
+    "d n": "4r,1z,59",
+    "d o": "2e,3f,15,2b,2t,h",
+    "d p": "3,7,o,4,1,3,5,6,6,6,1m,r,6,b,1h,1m,9,1a,1m,k,6,9,6,6",
+    "d q": "4j,1a,m,1o,1g,1s,16",
+    "d r": "l,a,4o,25,3,i,4",
+    "d s": "b9",
+    "d t": "g,1a,4g",
+    "d v": "2i",
+    "d y": "6l",
+    "d) ": "22",
+    "d, ": "3i,8h,o,1",
+    "d-i": "bb",
+    "da ": "1,k,9,5,1,1,1,1,6,4,1,2,9,e,1,d,4,h,e,e,a,2,5,8,1,1,1,2,7,7,9,b,2,f,c,6,3,3,7,1,6,2,c,3,2,5,q,a,3,2,1,3,2,1,1,a,3,5,1,4,4,6,2,b,4,4,2,1,4,2,7,h,1,9,3,e,8,1,9",
+    "da,": "2q,49,f",
+    "da.": "34,19,x,2t,20,2o",
+    "dad": "0,3,2,4,1,8,3,h,1,3,1,2,5,2,1,7,2,3,9,8,4,4,4,3,8,1,3,5,1,1,1,2,3,1,1,2,6,2,1,1,1,2,1,1,1,4,1,2,1,3,1,2,2,1,1,3,1,1,1,1,1,2,1,2,1,1,2,4,5,1,3,1,1,4,3,1,1,1,1,4,1,1,1,a,1,a,2,4,2,1,2,1,2,3,1,1,4,7,1,5,1,7,1,2,1,3,5,4,6,4,1,9,9,d,2,7,1,9,7,4,1,7,5,3,4,8,1,2,5,1,1,4,2,2,2,1,5,5,4,1,1,1,1,1,1,1,1,4,2,1,4,7,1,2,1,7",
+    "dah": "bb",
+    "dal": "ax,1f",
+    "dam": "b,1i,1h,1p,13,a,1b,12,3,1p,h,1y",
+    "dan": "a,9,1h,s,p,1,3,7,3,3g,1t,35",
+    "dar": "8w,2p,l",
+    "das": "1a,2,1n,l,v,v,18,a,19,1q,a,5,5,q,2,19,3",
+    "dau": "3x,9",
+    "dcl": "3r",
+    "dde": "bq",
+    "ddi": "4q,u",
+    "de ": "0,1,1,1,2,1,1,1,2,1,1,1,1,1,2,3,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,4,3,2,5,1,1,1,1,1,1,1,4,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,2,1,1,1,2,2,1,2,1,1,1,2,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,3,2,1,1,1,1,1,2,1,1,1,2,1,1,1,4,1,1,2,1,4,2,1,3,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,2,1,1,1,2,1,1,1,1,1,2,1,1,1,1,2,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,2,2,2,1,1,1,1,3,1,2,1,1,1,2,1,1,1,1,1,1,1,1,2,1,1,1,1,3,2,1,1,1,1,2,1,2,1,1,1,1,1,1,1,1,1,1,1,3,3,1,1,1,1,1,1,2,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,2,1,1,1,2,1,1,2,1,1,1,1,1,2,1,2,2,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,2,1,1,1,1,1,5,1,1,2,2",
+    "dea": "2l,23,t,1,c,1,i,6,2a,2x",
+    "deb": "1m,1d,i,1,4,2,6,k,d,3,1,u,4,1,l,1,1,4,5,12,q,1g,1,8,k,u",
+    "dec": "z,25,1v,b,d,t,17",
+    "ded": "5,1f,5n,30,f,5",
+    "def": "1b,1j,1r,u,1,8,s,4v,9",
+    "deg": "3e,2,g,2s,5,m,1",
+    "del": "3,1,7,3,4,1,5,8,3,1,4,1,1,2,1,1,3,1,1,3,1,1,2,2,1,1,1,1,1,1,4,1,1,2,1,1,2,5,1,1,1,4,1,1,1,1,6,1,1,4,2,1,9,8,2,2,1,1,2,4,3,2,2,1,1,1,4,1,1,1,5,4,1,2,1,1,3,2,4,3,1,7,2,4,1,7,1,1,8,1,4,1,3,2,5,4,1,1,9,2,8,3,3,1,7,2,2,2,3,1,f,1,5,1,3,2,5,4,2,1,1,5,1,3,1,1,1,b,7,9,4,b,2,1,1,b,2,3,2,1,p,1,1,1,1,4,b,1,1,1,6,1,3,2,6,2,2,2,1,1",
+    "dem": "u,u,g,4,s,7,k,40,a,2,2b,n,t,3,t",
+    "den": "n,i,g,u,d,7,m,g,r,7,3,7,i,17,a,d,2,p,g,17,i,d,k,o",
+    "deo": "40",
+    "dep": "1b,a,8,1y,l,k,j,1,25,2m,x,1,h,1,e",
+    "der": "e,1,15,2,17,s,l,n,2,23,7,5,1m,g,1,6,a,b,4,4,a,r,6,e",
+    "des": "5,v,9,1,4,6,4,4,5,7,4,1,f,1,c,5,1,8,a,1,1,5,2,b,1,5,6,4,4,4,5,7,1,2,4,1,1,c,2,4,2,5,4,1,7,2,2,1,5,2,6,4,5,1,4,1,7,2,5,4,6,1,3,m,d,1,c,h,5,2,2,g,3,5,2,2,2,1,1,1,e,5,4,2,1,g,4,h",
+    "det": "b,2z,3j,d,54,m",
+    "dez": "16,y,1a,30",
+    "dia": "18,1,3,2,c,k,1,2,1,1,1,1,1,2,2,8,1,7,4,1,1,1o,f,4,1,b,9,6,b,o,t,8,1,d,d,3d",
+    "dic": "z,l,w,f,2t,4,16,7,3l,1u",
+    "did": "19,u,z,12,2,d,1w,6,11,2,w,a,c,d,5,13,d,1g,1,9",
+    "die": "3r,15,j,1,6l",
+    "dif": "t,2,3,d,c,e,l,22,x,3o,2c,n",
+    "dig": "j,o,2,8,4,3,f,2u",
+    "dil": "h,26,1v,p,1n,3,9,2c,v,8",
+    "dim": "8u",
+    "din": "6i",
+    "dio": "2a,1,8,1,1,1,8,7,1d,q,a,5u,l,6,b,a",
+    "dir": "9d",
+    "dis": "y,p,1,10,11,2,b,1,6,f,2,5,4,i,1,2,1,9,1,6,5,f,8,2,h,h,u,k,2,19,12,3,2,1,5,1,a,p",
+    "dit": "j,20,1,1,b,8,m,2,3,2,a,8,a,1c,8,1,1,a,q,2p,2x",
+    "div": "1e,4,1,26,79,1j",
+    "dmi": "bz",
+    "do\n": "16,2j",
+    "do ": "1,9,4,1,1,4,4,6,2,3,1,6,2,6,6,1,1,2,4,c,2,2,4,3,e,2,1,4,c,2,3,1,4,1,7,3,7,2,2,7,1,5,3,2,8,1,1,4,2,3,6,4,4,2,5,8,4,a,4,5,3,2,5,2,1,4,1,2,3,1,2,2,b,b,6,3,3,3,4,4,3,a,1,4,3,7,b,5,7,9,3,1,4,1,3,1,1,1,1,3,1,1,1,4,1,3,1,5,1,2,2,1,1,3,2,1,2,3,5,9,1,1,8,6,1,2,1,3,2",
+    "do,": "1d,2y,54",
+    "do.": "1m,c,8,20,c,g,18,o,2o,1x,m,p,2",
+    "doc": "2j,30,r,1",
+    "dol": "6,12,1,13,10,5,1,v,w,k,l,1,7,3,7,3,6,4,4,1,h,14,8,3,h,7,1,h,1a,o,4,2",
+    "dom": "18,1,b,2,2,j,28,3x,1r,k,7",
+    "don": "6i,1,1,8,2,1,e,2i",
+    "dor": "5,1j,1w,5,2u,q,5,2b,g,2,f,5",
+    "dos": "4,e,1,14,c,1,1,5,8,m,5,1,1,15,4,2,a,1,1,7,1,h,1,g,d,f,f,3,1,n,5,j,v,1,p,6,1,2,1,4,b,1,9,x,4,4,1,4,2",
+    "dot": "66",
+    "dpm": "bp",
+    "dqu": "46",
+    "dra": "v,6q,2e",
+    "dre": "3s,a,1x",
+    "dri": "c4",
+    "dro": "b,k,d,w,s,x,d,1,7,e,b,2,4,a,8,f,1,1,2,1,6,8,j,3,g,1,3,6,7,5,9,7,h,f,10,c,1,n,g,f",
+    "dua": "3p,h,3i,4x",
+    "duc": "1,9,17,o,7,d,12,x,2,6,l,1,1,1,3,3,5,2,1,1,1o,m,4,1,3,9,u,7,t,h,b,1e",
+    "dul": "3i,g,2,2,l,2,q,2,1,2,3,3,4,2,3,a,1,1,1,1h,v,1,1,1e,c,j,1s,1",
+    "dum": "24",
+    "duo": "15",
+    "dur": "1l,1a,15,t,l,9,2,1c,9,b,9,l,5,c,9,2,1,2f,6",
+    "e\nd": "77,4f",
+    "e\ne": "6x",
+    "e\nr": "8i",
+    "e (": "w,c",
+    "e a": "2,1,6,2,3,4,b,5,5,5,8,a,b,1,2,6,1,2,2,e,1,2,2,8,1,1,1,2,3,1,2,1,4,3,1,1,5,6,1,4,1,1,1,2,2,1,2,5,4,4,7,4,2,1,5,6,1,7,4,4,8,2,b,3,2,7,1,6,1,5,2,2,2,1,a,c,5,2,6,e,1,2,h,d,1,2,1,6,3,6,1,2,8,b,1,2,5,1,1,4,1,1,1,3,3,3,3,2,1,7,1,4,7,3,7,5",
+    "e b": "2d,k,4,10,c,1,s,1r,2,6,1,13,a,2d,21",
+    "e c": "0,1,2,5,2,2,4,3,3,3,1,2,3,5,7,2,4,b,6,1,1,2,1,4,1,2,m,6,3,5,6,1,8,2,4,1,3,4,1,1,2,1,5,6,1,2,1,7,1,3,4,1,1,2,4,4,2,9,1,1,2,2,4,1,4,6,2,2,1,6,4,2,3,2,3,1,1,1,3,c,2,1,3,1,2,5,4,1,1,1,1,4,6,7,1,1,2,2,1,4,1,1,f,2,1,2,1,4,1,1,1,1,1,1,4,5,2,2,1,1,1,2,1,2,3,2,2,2,1,1,5,6,f,1,d,5,8,2,1,5,6,1,4,d",
+    "e d": "3,1,6,1,k,2,3,8,3,9,3,6,7,1,3,7,b,a,e,5,2,7,1,1,1,2,c,1,1,7,9,1,1,3,5,6,6,1,4,2,3,6,2,2,2,b,1,1,2,1,4,2,8,4,3,a,2,1,2,4,1,2,5,7,1,6,4,8,5,m,1,5,a,g,2,6,2,3,b,1,c,1,2,5,4,3,2,3,2,2,1,4,1,2,8,1,1,1,1,1,1,5,1,a,5,3",
+    "e e": "2,4,5,1,4,1,i,6,9,2,1,3,1,4,3,4,1,7,m,5,6,4,1,1,1,4,4,2,e,9,8,2,3,4,3,4,3,7,2,7,f,a,4,g,2,1,1,5,5,2,1,6,1,1,1,3,3,k,5,5,1,5,2,7,a,3,2,3,4,6,7,i,2,1,6,c,2,7,1,5,8,3,1,3,2,2,1,1,3,3,1,5,3,6,d,a",
+    "e f": "c,4,1,h,5,f,b,1,1b,n,1f,3,1f,h,1,5,9,2,p,4,7,4,17,s,7,e,8,t",
+    "e g": "6,5,1y,10,1f,f,i,2,2,3,1s,1h,m,8,8,4,8,1,3,9,a,j,e,f",
+    "e h": "16,k,8,a,1e,4,g,e,4,1,i,2,9,5,2,5,1,6,1b,p,2,1,p,j,1p,a,5,k",
+    "e i": "2,n,1,k,11,11,7,1,h,m,5,1,4,i,1,h,18,5,7,3,z,5,9,1,5,9,f,8,7,d,6,f,7,2,4,1,i,i",
+    "e j": "97",
+    "e k": "66,2",
+    "e l": "0,1,2,2,1,1,1,2,1,2,1,1,2,3,1,1,3,1,1,1,1,1,3,3,c,9,1,1,2,1,3,4,5,2,1,2,1,1,1,4,2,1,1,1,1,1,2,1,1,4,4,2,1,2,3,3,2,2,3,1,1,2,1,2,2,1,2,2,3,2,7,1,1,1,2,2,1,2,3,1,2,8,6,1,5,1,1,3,1,1,4,1,3,3,1,1,1,4,4,1,1,2,1,1,1,7,1,3,3,1,1,3,3,1,1,1,3,1,1,2,4,1,1,2,1,1,2,1,1,1,3,2,1,1,1,1,1,3,1,1,1,2,2,2,1,1,1,1,1,3,3,1,1,6,3,1,3,1,2,a,1,1,1,2,1,1,2,2,2,1,8,4,1,1,1,1,1,4,1,1,1,4,1,1,1,3,1,4,1,1,2,2,1,1,3,3,2,3,7,1,1,1,4,4,7,1,1,1,1,1,1,1,1,5,5,1,1,1,2,1,3,1,1,1,1,1,3,2,1",
+    "e m": "10,1,13,7,2,j,8,2a,d,o,7,z,10,k,1f,g,1,7,o,9,e,1",
+    "e n": "2u,7,2,1,1g,1j,2,3,1j,8,2,b,1d,e,23,b",
+    "e o": "r,4,2,2,y,9,22,7,1,a,8,1,1,j,19,9,e,7,6,b,5,5,3,2,b,b,3,4,14,3,p,f",
+    "e p": "1,3,2,1,1,2,2,2,1,8,6,6,3,7,b,1,1,7,6,1,3,9,3,e,6,2,8,2,3,c,1,8,1,b,6,1,e,6,2,6,1,2,a,3,2,5,1,1,1,3,b,d,1,7,1,3,3,8,8,4,8,5,5,1,8,5,1,3,2,2,3,3,1,c,2,2,1,2,1,1,5,3,4,2,4,1,b,b,6,2,8,1,6,7,4,d,a,2,d",
+    "e q": "t,2,2g,s,1d,5,g,p,j,s,2,14,5,g,u,2,1j,c",
+    "e r": "1s,f,6,8,4,9,3,28,1,5,c,s,m,s,f,h,m,a,h,m,a,a,v",
+    "e s": "6,3,1,6,h,3,2,e,2,2,3,1,2,4,g,b,1,4,1,1,3,3,1,2,1,7,8,2,2,1,3,i,8,1,1,3,2,4,2,5,e,3,3,6,5,2,b,6,g,1,4,3,1,3,2,7,2,2,1,4,6,8,a,4,3,1,1,1,3,5,9,1,b,8,e,1,5,4,2,5,5,5,1,2,h,3,3,c,a,2,1,1,6",
+    "e t": "w,4,14,13,o,2,10,b,o,8,3,2,1,1,h,2,h,2,c,d,9,g,5,1,1,1,1,1,1,3,6,19,d,1f",
+    "e u": "w,3,c,8,17,1,4,m,c,1x,4,3,1,1,9,6,4,4,8,6,7,a,b,g,a,4,4,5,b,1c,a,2,g,11,8,9",
+    "e v": "n,2,a,y,20,2j,13,d,1f,1a,k,1f,3,1",
+    "e w": "4c,1y",
+    "e y": "b,2z,2w,1o,3g,g,16",
+    "e, ": "6,1e,1m,1,20,3j,m,14,1q,8,1",
+    "e-o": "6y",
+    "e-t": "3v",
+    "ea\n": "3c,3m",
+    "ea ": "8,3,x,1,1c,p,g,p,g,y,1,9,d,i,f,1g,d,7,a,3,3,3,5,2,6,3,2a,5,1,4,1",
+    "ea,": "5b,k",
+    "ea.": "2b",
+    "eac": "4,1c,34,2,n,44,1,1f,f,18",
+    "ead": "26,90,1l",
+    "eal": "3m",
+    "ean": "6j,66",
+    "eap": "2p",
+    "ear": "2d,o,67",
+    "eas": "1f,9,b,z,1q,8,k,1,1,f,1,f,n,2b,p",
+    "eat": "1f,3n,4m",
+    "eba": "1g,6,1d,1n,5c,1,8,2k,1",
+    "ebe": "3h,69",
+    "ebi": "3i,4,2,6,k,d,3,1,u,4,1,l,1,1,4,5,12,q,e,1v,u",
+    "ebl": "6g",
+    "ebo": "9t",
+    "ebr": "4,2b,d,q,3,1,1,2,1,4,5,2,1,6,2,1,4,8,k,3,h,12,1,3,4,d,32,20,k",
+    "eca": "1b,i,1j,3x,2r,2q",
+    "ecc": "1,1,3,2,1,1,8,3,2,1,2,1,1,1,1,1,1,6,a,2,1,4,1,7,c,2,2,2,b,5,a,3,2,r,5,j,3,4,7,6,7,4,4,5,5,f,1,1,9,a,2,e,2,9,1,1,3,8,9,4,6,6,3,9,1,1,1,1,1,1,8,2,3,1,7,1,2,1,2,1,1,1,1,1,2,1,4,1,3,3,4,1,1,2,9,4,f,q,8,2,1,9,1,1,1,1,2,7",
+    "ece": "1c,h,18,j,23,27,1,9,8,3,q,5,3,c,1d,j,e,2",
+    "ech": "0,1,d,16,2,k,4,2,d,4,3a,u,b,f,f,9,1s,9,c,19",
+    "eci": "1m,a,8,1e,5,a,w,9,l,1,1,7,7,d,1,f,5,9,3,j,1,2,h,3,1,7,q,7,5,9,h,6,r,1,g,l",
+    "eck": "aw",
+    "ecl": "94",
+    "eco": "b,1m,1d,1i,1a,2,34,2y,k",
+    "ecr": "47,1w,2h,25",
+    "ect": "9,5,3,1,b,3,c,2,a,7,2,2,7,1,9,6,b,1,2,c,3,3,2,8,e,1,4,3,4,3,c,1,7,7,5,u,2,4,a,1,4,3,8,1,1,4,1,1,2,2,b,h,b,5,a,1,5,a,d,3,1,4,e,1,b,3,4,1,2,c,2,1,3,4,2,5,c,m",
+    "ecu": "c,n,c,1,g,f,9,1,n,9,1m,b,4,1n,m,b,e,k,b,1z,c,p",
+    "ecz": "9c",
+    "ed\n": "7b",
+    "ed ": "g,12,1,o,d,3g,1y,2w,1n,2",
+    "eda": "0,3,6,1,8,3,h,1,3,1,2,5,2,8,m,8,4,3,8,1,8,1,1,3,3,1,1,8,2,2,1,2,1,1,1,4,3,4,1,2,3,1,3,2,1,1,1,2,1,2,1,1,2,4,5,1,3,1,1,4,3,1,1,1,1,4,2,b,1,a,6,2,1,2,1,2,4,5,5,2,1,5,1,8,3,8,4,6,4,1,i,f,7,1,9,7,5,7,5,3,c,1,2,5,2,4,6,j,b,b",
+    "ede": "5,3,f,6,1,f,c,f,8,1,4,2,k,1,1,8,2,o,1,f,2,i,3,2,3,3,1,2,f,z,8,1,3,8,3,c,1,h,p,x,d,7,8,l,7,v",
+    "edi": "j,21,c,8,m,2,3,2,a,8,w,d,l,1,1,6,4,q,2p,2a",
+    "edo": "5,1f,8,5f,2k,g,f,5,h,1,5,1,2",
+    "edr": "3s,3t",
+    "edu": "2c,d,t,g,2,n,1c,c,1i",
+    "eec": "94",
+    "een": "bs",
+    "efa": "3u,d,1,2,5,65",
+    "efe": "1b,1j,3e,5,57",
+    "eff": "46",
+    "efi": "2d,28,u,1,8,s,4v",
+    "efl": "16,6y",
+    "efr": "7k,1,5,1,1,8,1,8",
+    "ega": "5n,5b,e,3,l,1",
+    "ege": "3e,i,2x,m,1",
+    "egi": "z",
+    "egr": "3g,38,3e",
+    "egu": "2e,1,34,34,33,j",
+    "ehc": "56",
+    "ehl": "7b",
+    "ehr": "3o",
+    "ei.": "a5",
+    "eic": "3s,61",
+    "eig": "47",
+    "eii": "4x",
+    "eim": "3f",
+    "ein": "1g,n,2j,j,2m,a,c,23,b",
+    "eio": "8f,2g",
+    "eip": "8e",
+    "eis": "5e",
+    "eit": "8,2p,2c,2",
+    "eja": "98,1h,1y,1",
+    "eje": "9p",
+    "eji": "a,q,s,7,1,w,4,5,i,t,d,19,b,f,a,8,1,1,1,5,1,1,2,3,4,2,1,8,1,7,y,14,g,3,1f",
+    "el ": "3,1,6,1,3,1,1,2,1,4,1,8,3,5,1,1,1,1,1,1,3,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,5,1,1,1,1,3,1,1,1,1,3,3,1,1,2,2,2,1,1,2,1,1,1,1,1,1,1,3,2,2,1,1,2,1,1,2,4,3,2,1,1,1,1,1,2,1,1,1,1,1,4,1,2,1,1,1,1,1,1,1,1,2,1,1,2,2,2,1,1,1,2,1,1,2,2,1,1,2,1,4,3,1,1,2,3,3,1,2,2,1,3,1,1,5,4,1,1,5,4,2,7,1,3,3,1,1,2,1,2,1,2,2,1,1,2,1,1,6,2,1,2,4,1,5,1,3,2,2,2,1,4,2,1,1,5,1,3,1,1,1,2,1,2,1,2,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,2,1,1,1,1,2,1,1,1,4,1,1,1,1,1,1,6,5,1,1,1,2,2,1,2,1,3,6,7,1,5,1,1,1,5,6,1,4,1,1,1,3,3,1,1,2,2,5,1,2,2,1,1,1,1",
+    "el,": "5d,1y,29,a,8,4,1",
+    "el-": "3x",
+    "el.": "2z,61,w,3,1,1,3,4",
+    "ela": "3o,1r,o,2k,9,b,1,c,1,4,7,5,1,5,6,z,1,i,1,5",
+    "ele": "9,m,1,2a,1,1k,v,9,u,1,1s,a,1,1r,w",
+    "elg": "10,s,c,2,f,11,p,4i",
+    "eli": "10,g,5,2o,d,22,4b,t",
+    "ell": "38,1a,7,d,b,2,1,31,o,d,6,5,1,i,g,q",
+    "elo": "2e,1k,9,3d,58",
+    "elt": "68,2k",
+    "elu": "1u,2,2,1p,3,l,n,i,g,20,1,j,1,a,k,9,1,1,9,5,j,c,4,2",
+    "elv": "7v,j,4,s",
+    "em\n": "6o",
+    "em1": "6a",
+    "em2": "6b",
+    "ema": "j,b,u,g,4,6,m,9,2,5,4,4,1,3,f,2,7,4,1,2,1,1,3,6,2,3,1,1,9,1a,1,d,g,9,2,8,2,j,i,1,1,6,12,1,4,9,6,1,2,1,s,3,t",
+    "emb": "d,g,1e,e,6,n,x,11,1,3j,7,1,1,1,m,2,7,c,1u",
+    "eme": "3r,4n,8,1,2h,l",
+    "emi": "26,4,f,e,2,1,1,4,1,p,f,d,6,g,1h,6,8,h,h,i,e",
+    "emo": "x,d,1u,b,3a,o,2,t,e,2f,4,j,1,6,3,6,p",
+    "emp": "3j,1o,x,1b,9,4b",
+    "en ": "2,2,2,5,1,1,1,1,1,1,2,4,7,1,4,6,2,3,1,3,2,1,1,1,1,1,1,2,2,2,1,1,1,1,1,1,1,5,2,2,1,3,1,8,3,1,1,1,2,1,3,1,1,1,1,2,1,1,1,1,1,2,2,4,2,2,2,1,a,3,8,3,2,5,1,2,1,3,2,5,3,3,1,2,1,2,1,3,1,1,1,2,2,1,3,2,5,1,1,4,2,3,2,1,2,1,2,4,1,1,5,2,2,1,1,1,1,1,1,1,3,5,1,4,1,1,4,2,1,2,8,1,1,1,1,2,2,1,1,1,3,3,1,2,1,1,1,1,1,6,1,2,1,5,4,1,1,5,5,2,1,1,1,1,1,2,4,2,6,1,1,1,1,2,1,1,1,1,1,3,1,3,1,1,2,1,1,1,1,2,1,1,1,2,2,2,1,2,1,5,3,1,2,4,2,4,3,3,8,7,2,3,2,1,3,1,1,1,1,1,1,4,1,1",
+    "en,": "1g,6,2,2y,7g",
+    "en.": "1k,3n,1m",
+    "ena": "15,5,8,18,9,n,g,7,3,d,1,j,b,4,b,a,1b,1,2,1,3,6,2,2,1,1,5,1,1,g,2,2,t,1,a,8,27",
+    "enc": "6,5,1,10,4,d,k,3,1,1a,3,d,3,1,4,6,1,1,3,j,5,1,1,4,4,3,e,8,3,l,l,1,j,2,b,4,18,t,4,9,6,4,9,8,6,2",
+    "end": "1k,z,d,v,f,n,3,j,1,3,a,h,1,4,3,1,1,8,2,1,e,1,12,3p,j",
+    "ene": "1,a,10,2,r,m,i,2,2,2,4,2,c,2,4,c,j,b,g,i,2,1,4,8,4,4,m,1,3,1,f,7,c,5,5,4,5,w,5,1,4,2,7,c,b,13,9,h",
+    "enf": "0,3,6,1,8,3,h,1,3,1,2,5,2,u,8,4,3,8,1,8,1,1,3,3,1,1,8,2,2,1,2,1,1,1,4,3,4,1,2,3,1,3,2,1,1,1,2,1,2,1,1,2,4,5,1,3,1,1,4,4,1,1,5,2,m,6,2,1,2,1,2,4,5,7,1,5,1,8,3,8,4,6,5,x,7,1,9,7,5,c,3,c,1,2,7,z,5,b,1",
+    "eng": "43,3,9",
+    "eni": "18,3,t,q,7,1d,d,d,c,3,7,j,h,4,4,g,f,c,1,1,7,b,a,8,s,9,4,9,4,5,g,h,1,q,2",
+    "enm": "3w",
+    "eno": "4,1,6,c,8,4,6,b,6,6,2,j,d,8,c,a,i,k,g,h,11,5,i,2,r,2,9,1,9,b,2,h,2,i,6,3,5,4,b,6,2,n,1,m,1,2,3,2,9,5",
+    "enr": "6w,2x",
+    "ens": "e,3,h,b,7,8,k,f,6,j,7,8,t,2,7,q,a,7,f,g,1,2,10,m,1,1,11,1g,3,2,1,1,7,8,b,9,a",
+    "ent": "0,1,5,5,4,1,1,1,a,6,6,1,3,3,2,3,1,6,2,2,2,1,2,5,1,2,2,4,3,2,1,2,1,4,2,1,2,2,4,3,1,1,3,1,1,1,1,2,1,1,1,3,1,2,2,2,2,6,4,5,1,2,2,1,2,1,3,2,1,1,1,3,2,1,3,3,2,e,1,1,3,3,1,1,2,3,1,1,6,2,1,1,6,1,3,1,b,4,2,3,7,2,1,2,1,3,2,1,1,2,9,1,1,1,3,4,6,1,3,2,1,2,2,2,2,1,4,4,1,4,2,a,1,7,1,3,2,2,5,1,3,1,2,2,1,4,1,2,6,2,1,1,1,1,1,2,3,2,1,2,1,1,1,1,1,1,6,3,2,3,3,2,1,4,1,2,3,1,4,6,1,1,6,1,4,2",
+    "enu": "2f,13,c,e,47,p,b,12,9,3,5,v",
+    "env": "d0",
+    "enz": "b,1,9,4,z,7,1,2,1,1b,4a,12,z,1,h,2t",
+    "eo\n": "6g,q",
+    "eo ": "d,1p,4,6,a,3,2,1a,1t,n,v",
+    "eo.": "cd",
+    "eoa": "7f,1",
+    "eob": "r",
+    "eoc": "5z,54,h,i",
+    "eom": "6g",
+    "eop": "3n,26,h,1,4,j",
+    "eor": "3j",
+    "eos": "1h,p,q,1,e,t,b,l,6,1m,d,6,z,1o,f,3,23",
+    "epa": "1d,1,k,30,5d,14",
+    "epc": "cb",
+    "epe": "b,2q,9,9,8,f,q,j,1,c,14,4c,l,8,v",
+    "epi": "3d,n,5,1,2o,j,u,n,25,9,l,r,9",
+    "epo": "3,18,a,8,2j,39,2m,1f",
+    "epr": "4o,v,2u,1,2q,1,h,1",
+    "eps": "1o,1p,s,6b",
+    "ept": "15,31,14,5x,p",
+    "equ": "1i,4,6,2,2a,l,d,y,2,i,1e,2,q,m,3,2,6,1,b,6,1,2,5,2e,9",
+    "er ": "c,l,3,g,f,1,1,1,1,10,2,4,f,m,f,1,d,8,4,h,4,f,g,1,6,1,1,i,e,1,j,1,1,5,3,1,5,o,1,1,t,u,s",
+    "er-": "aw",
+    "er.": "1o,g,q,5s",
+    "era": "1,14,2,6,4,5,7,k,d,7,5,2,8,2,4,6,8,2,m,d,l,1,b,b,1,a,9,4,5,3,4,a,1,3,1,1,j,1,6,1,p,2,k,4,6,5,1,4,2,1,6,c,3,8,8,c,j,3,h,5,2",
+    "erc": "9,2x,t,13,k,y,t,b,21,o,17,1,b,f,a,2,1",
+    "erd": "19,u,z,12,2,d,1w,3,3,11,1,1,1i,d,5,13,d,1b,5,1,9",
+    "ere": "e,5,11,2,t,d,1,3,8,e,3,1,1,3,2,2,1,2,2,2,1,5,1,2,1,4,8,w,8,g,2,1,1,a,c,e,7,m,9,a,a,1,12,6,p,9,7,m,n,g",
+    "erf": "9w,4,6,7,y,r,5,f,c",
+    "erg": "4,x,5,1r,b,1c,v,2u,14,33",
+    "erh": "9p",
+    "eri": "6,2,5,1,6,5,1,1,1,1,h,7,3,4,1,1,3,d,1,1,1,1,b,2,1,1,2,2,e,4,7,4,7,4,5,2,2,9,1,z,4,16,4,1,2,5,1,6,8,3,6,2,8,3,a,3,2,2,2,1,8,2,2,3,3,1,l,5,1,1,1,1,5,8,b,7,1,2,a,c,o,5,2,e,7",
+    "erj": "5s",
+    "erl": "7b,42",
+    "erm": "0,3,6,1,7,1,3,h,1,3,1,2,5,2,u,8,4,3,8,1,8,1,1,3,3,1,1,4,4,2,2,1,2,1,1,1,4,3,4,1,2,3,1,3,2,1,1,1,2,1,2,1,1,2,4,5,1,3,1,1,4,4,1,1,5,2,h,5,6,2,1,2,1,2,4,5,7,1,5,1,8,3,8,4,6,5,g,h,1,1,5,1,9,1,6,5,4,4,4,3,c,1,2,7,e,q,b,4",
+    "ern": "10,q,h,c,5,2,z,f,v,26,3v,m,p,9,f",
+    "ero": "i,p,9,t,x,a,8,u,4,1,6,8,b,8,8,w,a,c,j,6,d,3,a,e,2,d,b,e,1,j,2,3,r,1,z,1,a",
+    "erp": "i,1,g,1e,l,2,1,7,j,6,j,a,4,7,5,3,l,6,9,4,f,a,n,9,3,8,2,e,a,1f,5,a,3,5,c",
+    "err": "f,c,21,t,1f,5,1x,2f,a,v",
+    "ers": "c,z,3,26,9,f,c,o,1w,7,6,e,15,7,3,j,6,7,s,6,5,1,3,2,6,2,3,4,1,1,1,1,1,1,1,1,1,3",
+    "ert": "e,e,d,d,1,p,3,i,9,5,1,8,3,6,f,k,2,h,b,3,j,1,1,i,5,4,4,d,g,c,1,8,h,7,2,6,p,v,7,1h,1",
+    "eru": "4v,21,14,1d,h,9,6,2o",
+    "erv": "3g,1,1,6,2,2,3,c,1,1,e,g,1e,6,1,4,1,c,3,1,5,13,2s,10,r",
+    "es\n": "3b,38,4,f",
+    "es ": "5,7,1,1,3,1,1,3,1,2,1,1,4,2,b,2,1,1,2,a,2,3,b,4,1,6,c,2,8,2,3,1,1,5,1,1,8,1,1,2,5,1,1,1,3,8,4,1,5,1,8,3,5,3,1,4,3,2,1,1,1,1,1,1,2,5,2,2,5,1,2,7,1,2,2,4,1,1,2,5,1,1,2,1,1,7,4,1,1,2,1,2,2,3,2,5,2,1,1,1,1,1,1,3,1,2,2,5,1,1,7,1,9,1,1,1,1,6,1,1,i,1,5,6,3,d,2,2,3,1,1,4,1,2,1,1,4,2,1,1,4,1,1,2,5,4,6,1,7,a,5,8",
+    "es)": "k,am",
+    "es,": "1,i,p,g,5,2w,d,h,j,c,14,8,e,13,3,1j,9,b,b,p",
+    "es.": "2,1,2,4,4,c,1,4,k,r,2,8,a,8,1,f,2,3,q,9,2,z,c,2,b,2,2,1,8,8,4,7,a,7,1,c,2,3,2,5,1,5,6,2,7,3,1,1,5,3,1,d,o,v,4,i,p,2,1",
+    "es:": "4s",
+    "esa": "10,42,8,x,1y,r,o,5,b,8,2,1j,d",
+    "esb": "cl",
+    "esc": "1o,l,m,l,8,u,5,6,4,d,1e,d,9,3,g,z,1,o,1,4,7,7,1,4,1,4,1g,4",
+    "esd": "1k,d,7,51,k,f,31",
+    "ese": "26,o,2f,5,m,2,1l,b,1a,1g,6,c,1",
+    "esf": "1,j,4",
+    "esg": "1s,n,9,i,1,2,h,21,k,8,a,2,k,1,5i",
+    "esh": "bl",
+    "esi": "7,7,17,1,g,6,l,8,8,6,c,1,4,9,g,j,b,3,9,1,8,d,4,2,2,6,4,d,4,1,g,1,1,9,1,e,l,6,f,u,8,d,1,1,9,3,2,1,1,1,8,3,1,2,1,4,e",
+    "esl": "3p",
+    "esm": "49,2f",
+    "esn": "19,9n",
+    "eso": "u,6,6,2,1,e,8,2,3,1p,a,1,1j,6,1,2,1,1,3,1,1,g,1,2,2,b,5,7,5,1,1,1,2j,i",
+    "esp": "0,8,3,4,1,1,3,1,1,1,2,1,1,1,3,2,1,q,5,9,2,u,4,8,7,1,g,2,d,7,3,k,y,h,b,2,6,9,f,1,e,m,c,1,4,b,h,e,4,1,4,3,5,9,9,1,c,4,d,7,f",
+    "esq": "4r,1y,1,j,41,h,1,3,1",
+    "esr": "bq",
+    "est": "0,4,f,4,g,1,1,1,1,1,1,2,a,3,1,1,1,3,1,1,1,4,1,1,1,2,3,1,3,6,6,5,4,8,9,p,g,1,c,2,b,6,8,f,m,3,f,1,6,i,6,6,3,g,1,1,1,1,1,h,c,i,a,a,2,1,6,2,2,1,2,6,2,7,2,2,1,2,2,1,a,a,2,7,b",
+    "esu": "4o,5i,c,a",
+    "esv": "71,5g",
+    "eta": "q,o,3,2q,2,16,1,b,19,13,2z",
+    "ete": "38,1o,j,1,b,9,t,p,g,3,3",
+    "eti": "b,2z,s,c,7,6,x,i,2,1,4,8,4,1,19,1r,36",
+    "eto": "w,23,56,3c,14,2,1",
+    "etr": "65,11,c,2,5,h,1,4,1,3y,e",
+    "euc": "35,x,6,1,1,5,54",
+    "eum": "2,e,a,3r,t,1t",
+    "eun": "97",
+    "eur": "f,28,q,4,1,4,7,3,3,5,2,1,k,1w,3,i,l,2t,1h,x",
+    "eut": "4e",
+    "eva": "36,1,29,34,2i,y,q",
+    "eve": "14,1,k,2,3,a,f,1i,1r,10,3,11,h,2u,g,6,p,1",
+    "evi": "95,29,m",
+    "evo": "a2",
+    "ewy": "3r",
+    "exa": "4k,6j",
+    "exc": "7,n,2f,1v,e,1,6,1,2,2,3,1,1,1,21,2,g,16,g,e,8,o,4,d,2,3",
+    "exi": "77,45",
+    "exp": "x,4p,4o,1,w,o,8",
+    "ext": "2p,2q,t,m,j,2,a,g,30,j,g,7",
+    "exu": "8n,9,1,1,1,2,1,5,1",
+    "eya": "98",
+    "ez ": "16,y,56,1g",
+    "ez.": "3e,2b,p",
+    "eza": "3c,7,8n",
+    "ezc": "83",
+    "ezo": "63",
+    "fac": "31,17,w,71",
+    "fad": "ah,d",
+    "fag": "16,h,a,3,91",
+    "fal": "y,1d,2,1h,d,3,5,38,3o,h,7,6",
+    "fan": "23,t,1a,6c,2,1,6,1,3,5",
+    "far": "6,25,1a,u,v,74",
+    "fas": "43,3,3b",
+    "fat": "i,r,1r,21,15,j,3p,1,1,1,1,1,1,1,1,1,2,1,1,1,2,1,1,2,1,1,1k,a",
+    "fec": "1,1,3,2,1,1,5,3,1,2,2,1,2,1,1,1,1,1,1,6,7,3,2,1,4,1,7,3,9,2,2,2,b,a,1,2,2,3,2,5,3,3,a,6,5,3,1,4,3,4,3,1,3,4,5,2,5,1,6,1,4,4,5,5,f,1,1,1,4,4,6,4,2,a,1,3,2,2,2,5,1,1,3,3,5,9,3,1,6,6,d,1,1,1,1,1,8,2,3,1,7,1,2,1,2,1,1,1,1,1,2,1,4,1,3,3,4,1,1,2,9,2,1,1,1,c,2,1,7,2,5,b,1,7,2,1,9,1,1,1,1,2,7",
+    "fed": "30,7e",
+    "fel": "68",
+    "fem": "8e",
+    "fen": "2y,1m,53,2o",
+    "feo": "5z",
+    "fer": "0,3,6,1,8,3,4,1,2,a,1,3,1,2,1,4,2,4,q,8,4,3,8,1,8,1,1,3,3,1,1,2,6,2,2,1,2,1,1,1,4,3,4,1,2,3,1,3,2,1,1,1,2,1,2,1,1,2,4,5,1,3,1,1,4,4,1,1,5,2,m,6,2,1,2,1,2,4,5,7,1,5,1,8,3,8,4,6,5,1,h,7,8,7,1,9,7,5,c,3,c,1,2,7,14,b",
+    "fet": "85",
+    "ffn": "46",
+    "fia": "42,7,2c,1k,3p",
+    "fib": "a,9,k,b,11,43,7,6,h,5,y,1t",
+    "fic": "v,3,d,c,e,c,9,f,2,l,x,5,2,n,1,1,3,4,7,l,i,7,i,l,f,m,n,4,d,y,5,1,3,1,f,5,2,1,i",
+    "fie": "4,56,4w,a,v,15",
+    "fig": "5c,4g",
+    "fij": "bs",
+    "fil": "g,1d,1b,4j,3,a,11,1j",
+    "fin": "8l",
+    "fir": "8n,14",
+    "fis": "1s,1w,22,1n,19,2m,c,5,f,1",
+    "fla": "0,1,1,1,2,1,1,b,m,3,2,4,2,4,1,2,3,2,9,5,2,d,1,c,x,n,d,1,2,1,2,1,5,1,3,1,2,11,4,2,7,3,3,6,g,6,1,1,9,a,4,5,5,6,1,h,i,3,1,i,1,1,c,2,1,1a,5,1,1,1,k,1",
+    "fle": "77",
+    "flu": "3,i,4,h,10,6,d,1c,e,3p",
+    "fne": "46",
+    "fob": "b9,5,3",
+    "foc": "4p,1c,4e,26",
+    "fof": "at",
+    "foh": "b1",
+    "foi": "at",
+    "fol": "55,46,m,1,l,a",
+    "fom": "af",
+    "fon": "cv",
+    "foq": "c4",
+    "for": "h,x,4,2,1,1,8,r,5,f,3,h,g,a,t,2,1m,a,6,9,t,2,b,17,b,c,4,1,7,3,a,9,4,2,h,6,m,2",
+    "fos": "5,50,7c",
+    "fra": "1q,43,m,l,d",
+    "fre": "c,z,1,14,1,2x,1n,x,y,2e,h,1",
+    "fri": "1,j,4,2a,u,3s,6,a",
+    "fro": "7l,6,1,9,8",
+    "fte": "t",
+    "fue": "3i,4n,6,1,r,38",
+    "fug": "7m",
+    "fum": "c",
+    "fun": "2i,8,c,d,9,3,3x,5,u,m,o,9,15,s",
+    "fus": "4o,j,e",
+    "g\na": "b3",
+    "ga ": "15,6f,2,3,4,2,9,1,15,7,26",
+    "ga)": "89",
+    "ga,": "19,5g,t,1,3,9,1f",
+    "ga.": "7w",
+    "gac": "2b",
+    "gad": "10,d,1,8,6,6,6,2,f,11,p,n,o,37,b,25,6",
+    "gaj": "c1",
+    "gal": "5n,g,3k,1b",
+    "gam": "8i,3d",
+    "gan": "6,c,1,1,9,7,m,1,a,a,y,1b,l,m,2,2p,4,m,1b,1,1,2,b,2,1,1f,2",
+    "gar": "6,e,9,u,5,5,r,3v,c,e,3,1z,6,j,g,h,h,y,2,k",
+    "gas": "14,2,2,g,1,7,6,1o,33,m,1,1j,a,8,a,1,z",
+    "gat": "77,a,3v,o",
+    "gda": "ax,1f",
+    "ge ": "7,1g",
+    "ge)": "16",
+    "ge,": "6,c8,1",
+    "geh": "3o",
+    "gei": "2x",
+    "gen": "1,u,4,e,t,7,d,4,7,b,2,4,e,2,4,c,j,m,5,i,2,1,4,8,4,4,m,1,3,1,9,6,6,1,1,s,2,6,q,5,1,4,2,7,9,3,b,a,t",
+    "ger": "1h,1g,1n,3p,2u",
+    "ges": "4,f,o,2,c,3,f,2u,7j",
+    "gia": "1n,1l,9,w,7,25,5,5,9,6,1k,3v",
+    "gic": "4,12,1y,9,3,d,6,7,2i,e,r,1k,k,9,1x,2,b",
+    "gid": "3e,f,2l,5h",
+    "gie": "23,8a,e",
+    "gig": "5n,2",
+    "gil": "11,4s,m",
+    "gin": "2c,1d,2d,q,1r,1,1a,l,i,2,1d",
+    "gio": "l,7,7,8r,1,s,2,7,3,5",
+    "gir": "3j,90",
+    "git": "6,1,1t,5,35,34,24,1w,1",
+    "gla": "42,n,s,1,2,3,3,4,2,3,a,1,1,1,2c,1,1,1q,j,1a,i,1",
+    "gli": "i,2p,1u,5e,1,1,2,b,2",
+    "glo": "33,1w,31,9,26,n",
+    "glu": "1g,36,t,j,17",
+    "gma": "1q,aw",
+    "gme": "a6",
+    "gna": "8p,1n,9",
+    "gni": "bw",
+    "gno": "5q,6,8,1,2z,14,1x,d",
+    "go\n": "15",
+    "go ": "15,1,k,7,7,b,r,1,2,2i,k,u,a,2p,7",
+    "go)": "11",
+    "go,": "16,a,h,27,i,7y",
+    "go.": "14,j,9,1,3,1,1,5e",
+    "goc": "b1",
+    "goi": "5c",
+    "gon": "5y,8,2s",
+    "gor": "2c,92",
+    "gos": "7d,17,w",
+    "got": "r,65",
+    "gra": "b,8,a,2,1e,10,3,4,p,1,6,c,3,d,h,2,2,3,a,a,c,2,2,4,s,f,m,3,j,9,b,8,4,2,8,h,2,8,4,d,1,9,5,h,8",
+    "gre": "v,2,2,19,2,3,9,4,1,1,9,2,1,1,1,1,8,6,1,5,1,4,9,a,d,d,q,q,12,3,c,1",
+    "gri": "l,14,b1",
+    "gro": "4f,25,3i,q",
+    "gru": "n,2,j,m,1,20,1,x,j,x,c,1,1,n,1,2p",
+    "gto": "3q",
+    "gua": "f,3a,e,3,2e,v,2c,1u",
+    "gud": "1,u,2m,q,2s,4x",
+    "gue": "3h,30,5s",
+    "gui": "26,5,1,d,7,1,e,q,e,l,3,3,o,p,9,j,z,d,1q",
+    "guj": "cy",
+    "gul": "2e,1,b,1,6,7,2f,67",
+    "gun": "2y,s,16,b,1,1w,d",
+    "gus": "ak,1k",
+    "h).": "9h",
+    "ha ": "2v,r,4p,1s,7",
+    "hab": "1c,2u,58,22",
+    "hac": "16,k,e,4,2z,m,m,1a,c,2,1,11,7,29,9",
+    "had": "1a,1p,4t",
+    "hal": "12,1,7a,4e",
+    "ham": "0,2a,d,2,5d",
+    "han": "h",
+    "har": "3v",
+    "has": "1x,2l,7,p,n,3d,4,1,5,5,8,5,5,u",
+    "hau": "aw,19",
+    "haz": "18,g,3l,1n,w,w,5,1l",
+    "hce": "56",
+    "he ": "63",
+    "he.": "7u",
+    "hec": "1c,h",
+    "hei": "3f",
+    "hem": "x,d,1u,8,1s,34,2t,1s",
+    "hen": "4,cc",
+    "hep": "1d,1,k,30,5d",
+    "her": "j,17,16,8,l,1,2,3,2,a,8,1u,1,1,a,q,1o,11",
+    "hes": "4j,j,4m",
+    "hh)": "b1",
+    "hia": "1q",
+    "hib": "c0",
+    "hid": "7s,11,w,a,2l",
+    "hig": "1d,1,8,c,30,1m,2k,1o",
+    "him": "4p,1c",
+    "hin": "18,2,e,1b,n,1n,d,1a,w,w,5,1l",
+    "hip": "e,l,19,l,d,1,q,n,4,r,2,1,1,2,1,4,4,1,6,5,3,n,f,g,f,j,10,u,a,i,p,4,k",
+    "his": "a8,t,x",
+    "hla": "8x",
+    "hle": "7b",
+    "ho ": "e,n,j,2,q,h,4f,f",
+    "ho,": "a3",
+    "ho.": "ac",
+    "hoc": "31",
+    "hom": "4e,1o,6,b,27,7,1,a",
+    "hon": "11,7j,w",
+    "hoq": "31",
+    "hor": "4o,2,r,1,2,3,1,1,1,4,1,3,4,b,4,1w",
+    "hos": "10,16,8i,19",
+    "hpb": "8p",
+    "hpv": "90",
+    "hri": "3o",
+    "hsc": "69",
+    "hte": "6x",
+    "hue": "1x,1s,24,m,1,2,2,b,5,c,1,1,1",
+    "hum": "1s,78,h",
+    "hun": "3q",
+    "i-a": "41",
+    "ia\n": "6p,p,33,v,l",
+    "ia ": "3,9,1,5,3,a,b,1,2,3,2,2,1,8,1,3,a,1,2,2,2,3,3,1,3,3,1,3,3,l,3,1,3,1,2,1,1,1,7,3,3,1,1,1,1,1,1,3,1,7,4,1,3,1,2,2,2,1,5,3,1,2,1,1,1,4,3,1,2,1,c,2,1,1,1,1,1,1,2,3,5,1,3,1,1,2,8,3,1,3,4,5,5,1,2,2,b,2,1,1,1,1,1,5,b,8,1,6,1,8,b,6,6,c,7,1,4,3,2,3,9,4,8,3,7,3,6,4,2,e,9,7",
+    "ia,": "4e,3d",
+    "ia.": "38,8k,7",
+    "iab": "38,1o,j,1,b,9,1y",
+    "iac": "1g,u,1,2,1,1,1,1,1,4,8,1,7,4,1,1f,15,1a,44,e,y",
+    "iad": "1,j,4,10,g,4,51,s,2,2n,8,3,1g,9",
+    "iaf": "1q",
+    "iaj": "7k",
+    "ial": "0,1,a,3,3,5,a,18,4,h,4,1u,15,x,j,9,e,19,6,l,1,o,6,9,2,8,7,f,2,3,u",
+    "iam": "9p,26",
+    "ian": "8,l,5c,c,r,b,10,i,7,i,5,1,1,1x,y",
+    "iar": "18,1,3,9,1,j,1f,x,1x,p,44",
+    "ias": "0,8,5,1,3,3,2,1,2,1,1,1,5,o,o,1,f,4,5,z,l,2,1,6,h,12,1,c,3,e,h,9,8,4,1,c,1,i,g,5,4,7,5,3,7,7,5,1,b,b,g",
+    "iat": "1q,5f,51",
+    "iba": "bo",
+    "ibe": "4x",
+    "ibi": "4k,i,1u,c,4c,1,f",
+    "ibl": "1g,36,6w",
+    "ibr": "a,9,k,b,11,1p,1w,2,g,7,6,h,5,h,h,1t,2s",
+    "ibu": "44,8w",
+    "ica": "0,3,1,6,6,3,8,c,2,9,c,g,4,3,3,1,4,3,1,b,8,a,6,5,9,1,2,1,3,6,1,1,1,7,3,1,3,1,7,4,2,4,5,5,d,5,1,1,d,i,1,1,5,2,2,a,5,2,4,6,6,3,3,3,4,1,f,5,1,2,1,1,4,b,4,2,5,1,1,3,1,1,3,5,1,1,4,1,1,3,1,4,1,1,2,1,4,8,1,3,3,3,4,2,2,5,2,1,a,4",
+    "icc": "60,1y",
+    "ice": "12,i,1f,8,s,2x",
+    "ich": "3s,5a",
+    "ici": "z,a,2,9,9,k,i,6,2,g,12,5,9,g,1,1,3,2,2,4,3,9,c,i,9,g,8,d,f,n,f,7,4,a,1,2,d,l,l,4,5,2,d,1,5",
+    "icl": "8l,33",
+    "ico": "i,k,4,4,m,r,c,1,1,3,7,2,3,1,1,2,9,6,2,5,1,2,3,2,2,1,7,3,a,e,3,1,2,6,f,3,4,b,1,1,4,5,3,1,2,m,2,2,4,2,3,4,5,5,4,6,a,1,7,6,m,4,8,1,1,1,1,1,2,1,1,4,1,2,1,1,2,2,1,6,1,6,4,2,4,1,4,4,6,1,1,4",
+    "icr": "3c",
+    "ict": "2s,t,49,26",
+    "icu": "v,3,d,7,1,2,1,1,e,e,7,1v,s,15,5,1,8,4,1,6,2,1,5,3,1,1,t,i,1,1,1,1,e,2,m,1,l,a,s,n",
+    "ida": "5,6,y,3,5,9,3,9,1,b,3,8,a,2,1,7,1,8,2,7,2,1,9,1,2,8,5,1,1,5,1,3,1,7,l,5,2,6,f,2,4,5,6,2,o,1,1,2,4,4,5,k,9,a,2,1,a,5,5,8,2,3,h,4,d,7,2,3,5,5,4,1,1,1,1,1,1,1,1,4,2,5,7,1,2,1,6,1,1",
+    "ide": "16,4,u,b,d,f,7,7,f,1,g,7,1,3,k,5,1,9,3,1,1,f,1,1,1,k,5,1r,1z,11,1,m",
+    "idi": "4o,1,f,a,3,1,3,9,1,6,2j,a,3",
+    "ido": "a,5,3,1,b,6,6,f,2,1,4,7,1,1,3,a,1,2,e,1,4,5,2,g,h,7,1,4,d,8,1,3,k,5,6,2,4,7,3,4,8,a,4,4,1,1,1,f,6,5,9,e,3,p,p,7,8,1,4,1,2,2,1,3,4,g,1,i,7,1,1,8,6,4,3,2",
+    "idr": "7s,11,w,a,2l",
+    "idu": "3p,b",
+    "ie ": "a0,d,1u",
+    "ie-": "3v",
+    "ieb": "4,56,56,20",
+    "iec": "h,1m,8a,e",
+    "ied": "1o,24,3t,3i,5,1,5,1,2",
+    "iei": "a5",
+    "iel": "2z,z,9,2,9,1,a,j,1,1b,m,1,9,18,8,b,1,2,1,1,1,1,1,1,1,1,1,4,1,1,1,1,1,2,1,1,1,1,2,1,1,1,1,2,1,1,1,16",
+    "iem": "57,28,9",
+    "ien": "0,b,1,m,6,1,3,3,e,2,3,1,1,2,1,3,2,6,3,6,4,2,5,4,3,1,1,7,4,4,1,1,3,4,6,c,3,3,6,5,3,3,c,7,1,1,3,3,1,1,4,2,1,6,a,3,1,1,b,4,2,3,7,2,3,1,6,3,9,1,2,3,6,8,2,1,3,1,2,2,1,p,4,1,g,1,e,2,6,9,8,4,1,9,b,1,4,1,2,c,2,1,8,6",
+    "ier": "15,1l,i,8,1a,1y,h,d,5,2j,q,6,9,19",
+    "ies": "2f,i,9,1,2,9,29,k,3y",
+    "ife": "2p,t,7d",
+    "ifi": "v,3,d,c,e,l,26,2d,8,1o,8,27,1,4,k,3",
+    "ifo": "55",
+    "ift": "t",
+    "ifu": "4o,x",
+    "iga": "19,4,1,8,c,d,2n,p,2,10,t,1,1,2,3,4,2,1,8,1,4,9,m,6",
+    "igd": "ax,1f",
+    "ige": "j,c,4,8,2,8,4,3,f,a,2k",
+    "igh": "47",
+    "igi": "3e,f,2l,e,32,l,k",
+    "igl": "37",
+    "igm": "a6,2g",
+    "ign": "5q,6,8,1,2k,f,14,4,9,1k,d",
+    "igo": "1g,23,l,f,3,q,47,7,2,c,7,28,1",
+    "igr": "3c,38,48",
+    "igu": "3h,8,2s,3,v",
+    "ii)": "18",
+    "ija": "bs",
+    "il\n": "5g",
+    "il ": "3c,a,k",
+    "il,": "av",
+    "ila": "h,t,15,8,12,35,i,3,1,27,q,7,1",
+    "ile": "3d,s,1,y,p,m,20",
+    "ili": "12,j,1,g,3,z,e,2,4,g,a,5,1,7,3,1,c,m,7,2,d,2,4,5,4,2,1,11,k,e,5,2,g,1u,d,a,10",
+    "ill": "4i,l,23,1,1,9,1u,7,p,2",
+    "ilo": "11,46,1q,23,b,6,g,1,e,a,1,1,u,1",
+    "ilt": "g,1d,5u,3,a",
+    "ilu": "ao",
+    "ima": "5k,31,2s,1d",
+    "ime": "1n,e,3,14,7,7s,5",
+    "imi": "14,1,3,2,1,e,2,3,2,6,h,b,8,c,4,1,4,a,3,t,1,t,1,1,7,k,1,b,4,5,9,2,1,j,1,2,h,3,8,3,n,l,h,6,f,8,1,a,1,c,3,f",
+    "imo": "4p,1c,o,25,25,5,1,j,2,1",
+    "imp": "3f,1e,2h,1d,c,4,2,l,t,g,c,6,1,o,4,c,b,1",
+    "in\n": "79",
+    "in ": "8w,27,p,j",
+    "in-": "53,3a,23",
+    "ina": "n,5,f,1,1,5,2,n,4,5,16,1,f,2,6,9,7,1,9,1,2,6,5,5,1,a,1,6,2,b,1,5,c,q,2,2,3,3,1,1,7,2,1,4,1,2,8,1,1,5,3,n,4,3,j,9,8,1,3,3,3,2,s,l",
+    "inc": "m,m,2,7,7,5,13,3,n,s,4,5,m,1n,4,b,b,6,v,1,5,g,9,8,3,j,2,b,6,l,q",
+    "ind": "b,k,d,g,g,s,t,2,2,4,9,1,7,e,b,2,4,a,8,f,1,1,2,1,6,8,j,3,g,4,6,7,5,9,o,h,y,c,1,n,g,d",
+    "ine": "1t,d,5,1,d,7,1,5,9,q,e,l,6,j,5,8,6,8,c,6,d,a,1,5,j,23,10,q,m",
+    "inf": "0,1,1,1,2,1,1,1,1,9,2,1,1,1,2,1,1,1,1,8,3,3,2,1,1,2,2,4,1,2,3,2,9,3,2,2,4,8,1,1,c,3,l,9,5,7,9,2,4,4,5,1,2,1,2,1,5,1,2,1,1,2,o,d,4,2,7,3,3,6,f,1,1,5,1,1,9,8,2,4,5,1,4,6,1,1,1,1,1,1,1,1,a,4,a,1,3,1,1,1,1,8,8,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,15,1,3,2,1,1,1,5,8,7,1",
+    "ing": "6,1,k,1d,2,1k,16,e,c,2s,3h,j,1",
+    "inh": "12,1,ax",
+    "ini": "4,v,1b,i,r,2,g,8,29,6,2n,z,u,1c",
+    "inm": "1g,1v,5,d,n,4,1,1,2,1,3,6,2,3,2,6,1,4,5,g,n,2,1,b,17,1j,n,k,2,1",
+    "inn": "cb,9",
+    "ino": "c,b,1,k,h,6,3,6,2,1j,9,c,a,c,1,2,g,1,3,6,1,7,l,e,b,2,4,5,2,1,2,3,2,5,2,1,2,1,1,5,1,4,1,1,1,2,7,1,d,1,g,1,1,3,4,10,e,i,3,f,e",
+    "ins": "2d,11,6,16,6,j,1,4,7,4,2,3,1n,b,a,3s",
+    "int": "n,d,7,1,1,8,8,6,8,1,2,1,c,5,4,k,9,1,d,5,o,3,2,2,11,t,12,3,a,4,8,2,o,w,l,3,a,4,1,2,2,4,8,2,1,b,1,1,2,d,f",
+    "inu": "5,2q,w,18,2s,4m",
+    "inv": "4x,1p,v,5,2d,1n",
+    "io\n": "7i",
+    "io ": "f,1,3,2d,2,6,d,3,d,3,7,3,6,1,3,1,3,1,3,6,2,3,2,e,2,5,5,5,2,8,1,6,6,g,2,3,c,e,f,25,4,f,1,g,b,4,c,1,q",
+    "io,": "7i,3c,1g",
+    "io.": "n,2u,n,5l,q",
+    "ioc": "2b,9,2,1j,9,5u,t",
+    "iod": "5j,1i,1l",
+    "ioe": "29",
+    "iof": "7h,32",
+    "iog": "31",
+    "iol": "av,12",
+    "iom": "10,1m,5q,3,26,7,3,5",
+    "ion": "0,1,1,1,1,1,1,1,1,2,1,3,1,2,3,2,1,2,1,1,1,1,1,1,2,1,1,2,1,1,1,2,1,2,2,2,1,1,1,2,1,1,2,2,1,1,1,2,7,2,2,1,1,1,1,1,2,1,3,3,1,1,1,2,1,2,2,1,2,2,1,2,1,1,1,6,1,3,2,2,2,2,3,3,3,5,1,3,5,1,8,1,2,1,1,2,1,4,2,1,1,1,1,1,2,4,1,2,1,1,1,1,4,1,1,3,2,3,1,3,5,3,1,2,1,1,6,2,1,1,1,1,2,5,1,1,1,1,1,1,1,3,2,3,1,1,1,2,1,1,1,2,1,1,1,1,3,1,1,1,2,1,2,3,2,4,4,2,1,3,5,1,2,1,1,5,1,1,1,1,1,1,1,1,1,2,1,2,1,1,1,2,1,1,1,1,7,1,1,1,1,2,1,1,1,1,1,2,1,2,2,1,3,1,1,1,2,2,1,1,2,1,1,1,2,1,2,1,1,1,2,3,3,1,1,1,2,3,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,2,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,2,1,1,1,1,1,1,3,1,1,1,1,1",
+    "iop": "2a,c,8,1k,1,p,a,17,2,4,56,q",
+    "ior": "6,e,5,1,1,j,a,4,2,53,1,7,7,h,n,i,12,11,1a,5,2",
+    "ios": "9,9,3,7,2o,2,6,2,2,3,c,1,1,7,5,2,7,1,4,2,2,g,q,e,1,3,1,9,a,3,y,4,1a,1,9,5,a,1,1,2,b,2,9,3,k,7,l",
+    "iot": "3o",
+    "ip)": "8e",
+    "ipa": "4e,4,2t,27,8,3,j,j",
+    "ipe": "e,7,14,j,l,d,1,1d,4,r,3,1,2,1,8,f,n,f,1e,10,7,n,a,i,p,o",
+    "ipi": "4c,t,v,1y,29,o,11",
+    "ipl": "i,2y,17,e,19,1,d,15,33",
+    "ipo": "e,l,1,1,t,1,y,y,15,j,1,1,9,1,4,6,5,4,1,h,5,7,b,5,7,f,b,2,a,r,1,1,t,a,b,2,3,j,g,e",
+    "ipp": "3x,2e",
+    "iqu": "f,f,i,9,2,e,z,1b,12,6,h,k,m,s,1,e,d,3,j,i,i,2,8,1,5,8,1h",
+    "ir ": "10,h,2j,l,2t,u,f,1n,x",
+    "ir)": "8w",
+    "ira": "0,8,3,6,3,1,1,1,2,1,1,1,3,2,1,f,1p,8,9,3r,1q,r,p,a,12,7,k,d",
+    "irc": "a3",
+    "ire": "2,1,d,8x,2x,3",
+    "iri": "46,5x,3,1m",
+    "irm": "8n,14",
+    "iro": "4o,1,s,1,3,9,1,1,5,a,1,1,i",
+    "irr": "7,z,2,6,x,3,1,12,22,z,n,1f,t,24,1,8",
+    "iru": "l,1,1,1,1,1,z,7a,1,h,z",
+    "is\n": "6q,n,3,5,r,2",
+    "is ": "1,3,6,9,o,7,1c,7,j,8,g,d,6,2,4,5,2,7,1,1,1,1,3,n,n,8,1,6,1,3,2,1,5,e,2,7,1,7,1,8,1,q,2,1,3,2,5,6,6,1,3,1,2,4,2,4,4,3,3,4,1,6,19,6,a,a",
+    "is)": "1e",
+    "is,": "7d,2",
+    "is.": "58,1q,6",
+    "isa": "5q,1n,3i",
+    "isc": "j,36,34",
+    "ise": "2o",
+    "isf": "1n,1e,12,3q,u,m,2g,16",
+    "isi": "x,2r,3p,19,b,1,1,3,u,1c,c,5,a,5,1,3,e,1,1",
+    "ism": "d,2a,4,e,h,5,x,b,i,1,3,1,1,1,1,5,1,6,5,5a,4,2,d,3,k,3",
+    "isn": "y",
+    "iso": "49,3,e,u,2,5m,l,4,4,5,e",
+    "isp": "1o,5o,v,10",
+    "isq": "26,4,1r",
+    "isr": "bq",
+    "ist": "j,8,8,n,o,i,j,5,5,3,4,1,4,2,3,5,2,7,4,1,2,1,1,3,1,2,3,2,3,2,a,4,8,m,8,3,6,1,7,4,4,7,1,1,c,4,e,5,m,3,3,j,f,7,3,a,6,1,1,1,1,2,5,9,3,2,3,5,1,2,1,9,d,1,5,2",
+    "isu": "z,t",
+    "it ": "bb",
+    "ita": "7,c,n,2,8,1e,2,6,2,d,7,2,2,3,2,2,8,8,1,4,1,1,1,1,1,3,6,1,1,3,2,i,3,3,g,1,1,4,1,2,3,q,u,1,1,b,2,f,8,6,n,f,5,h,1,c,c,a",
+    "ite": "2x,e,15,t,1t,4,1u,1,1j,f,e",
+    "iti": "1,3,1,1,1,1,e,5,d,3,6,2,4,1,1,1,3,2,9,5,2,c,1,1,c,x,a,d,2,6,5,1,3,2,7,1,1,1,1,q,d,4,2,7,3,2,1,6,1,3,2,6,4,1,1,4,1,5,5,8,2,4,a,6,1,f,2,1,6,a,2,2,2,3,1,1,2,c,5,3,4,3,4,v,b,3,2,1,1,1,1,a,7,2,1",
+    "itm": "2e,1,1,1",
+    "ito": "1l,3,1,i,1u,b,s,v,k,12,1h,5,d,n,1,7,5,3,2,c",
+    "itr": "ac",
+    "its": "8x,2,3",
+    "itu": "1c,1w,27,1,7,3,1l,7,3o,8,2,1,u,1,8",
+    "iva": "3,w,2a,5,1,c,5,9,f,b,e,6,2,1,1,9,8,l,8,m,1,x,1a,2,a,d,f,2,8,4,7,7,1,1,5,6,2,2,1,1,4,1",
+    "ive": "v,4,f,4,1,1n,1,2f,9,53",
+    "ivi": "3p,25,5a,7,n,9,a,9",
+    "ivo": "7,c,o,2,c,i,t,h,f,11,4,7,1o,i,1,18,20,k,1,2,9,1,6,1,4,b,v",
+    "iz ": "k,9,6j,56",
+    "iz.": "4,cc,d",
+    "iza": "a,14,2b,8,9,1,2,16,4,x,8,1,7,k,b,8,c,s,1,9,2,k,5,r,8,g",
+    "izc": "cp",
+    "izo": "ba,h,1,3,1",
+    "ja\n": "6z",
+    "ja ": "4d,1b,1a,1,6,f,1l,3",
+    "jan": "cn,1",
+    "jaq": "3c",
+    "jas": "4i,50,17,13",
+    "je ": "43,3,32",
+    "jec": "6w,2x",
+    "jer": "5j,o,26,5,4,b,1,r,16,23",
+    "jet": "bh,14,2,1",
+    "jid": "a,q,s,7,1,w,4,5,i,t,d,19,b,f,a,8,1,1,1,z,22,g,3,1f",
+    "jig": "7i,1,1,2,3,4,2,1,8,1,15",
+    "jiz": "9d,2",
+    "jo\n": "c7",
+    "jo ": "3,w,7,g,k,6,d,a,12,e,3p,1d,h,1,8,20,2,h",
+    "jo,": "5b,6x",
+    "jo.": "c7,f",
+    "jog": "4s",
+    "jos": "n,8,28,1p,7,w,4q,h,m,d,k,4,1",
+    "jud": "5s",
+    "jun": "5r,2v,3l,j",
+    "jus": "97",
+    "juv": "5g",
+    "juz": "b9",
+    "k c": "31",
+    "k-s": "aw",
+    "kal": "66",
+    "ker": "76",
+    "kin": "3e",
+    "kle": "46",
+    "kli": "68",
+    "l\nd": "3l,1v",
+    "l\nn": "78",
+    "l (": "3i,15,3z,b,2,3,2n",
+    "l a": "e,2,q,4,7,3,2,2,4,g,l,d,i,r,10,1f,j,1r,z,f,z,1g",
+    "l b": "2m,3v,3z,i",
+    "l c": "e,4,1,g,h,2,1,1,a,h,1,1,1,4,1,1,1,7,1,1,2,2,2,1,1,2,4,3,7,3,1,1,3,4,3,2,2,1,6,2,1,4,1,2,4,1,2,1,4,7,1,4,3,4,2,8,1,1,b,8,1,4,4,b,2,8,d,1,6,2,1,9,1,2,a,2,4,2,h,5,b,1,1,6,1,4,1,1,3,d,1,2,4,a,4,5,h,e,6,6,5,9,b,3",
+    "l d": "k,c,3,6,l,x,r,1,b,g,21,5,h,8,9,6,6,2,x,12,4,9,3,3,6,f,s,12,9",
+    "l e": "f,1,o,1,1,h,3,6,1,3,1,1,2,f,f,8,6,o,4,b,4,a,2f,2,f,13,1,1,a,1,1,d,6,4,7,1,l,f,4,j,2,1,j,q",
+    "l f": "3,23,6,d,9,13,e,3q,g,1c,1e",
+    "l g": "1g,36",
+    "l h": "4,19,1,8,c,30,1k,1,2g,5,3c",
+    "l i": "18,n,9,2,1,65,2i,1c,1",
+    "l l": "e,16,2,17,a,1,z,3,33,1h,49",
+    "l m": "22,8,1,9,2,s,5,2z,1,22,b,1y,19",
+    "l n": "2u,n,30,o,3,j,2,1s,18,1g,r",
+    "l o": "2v,a,h,i,17,v,s,v,1a,5,1,j,l,1p,5,1,1,1,a,2,8,3,2",
+    "l p": "g,g,j,k,2,b,9,4,19,1,x,k,4,8,5,1,5,y,7,1,x,g,e,7,a,m,9,16,k,p,1",
+    "l q": "b,w,2,1m,e,1,a,g,i,3,c,6,2,7,8,3,5,7,e,o,b,p,8,3,m,2,3,2,6,3,4,3,1,5,8,5,1,1,4,r,1,1u",
+    "l r": "m,2,g,1,5,f,2,2,1,j,1,1,4,n,1,2,x,1l,1t,1,5,6,1j,33",
+    "l s": "b,8,29,i,6,4,4,4,f,2,7,4,1,3,1,3,6,2,3,2,1j,e,g,1a,k,y,1,4,d,6,1,3,n,15,2",
+    "l t": "a,d,c,8,2,7,c,b,t,r,o,7,4,l,n,8,f,1,k,3,3,7,3,2,4,1,m,1,e,4,o,2,17,3,5,p,m,7,h",
+    "l u": "8c,3,o,2",
+    "l v": "9h,z",
+    "l y": "29,2k,j,8,1q,y,48",
+    "l) ": "1t",
+    "l).": "4n,5z",
+    "l, ": "18,1,44,1l,d,29,a,8,4,1,9,f,15,h",
+    "l-l": "3x",
+    "la ": "3,1,2,1,1,3,4,1,1,3,1,3,3,2,2,4,1,2,1,7,1,5,1,1,1,2,1,1,1,2,7,7,3,1,3,1,2,6,1,2,1,6,5,2,1,1,1,1,1,1,1,2,2,3,1,1,1,1,6,4,5,2,2,1,3,2,1,1,3,5,1,2,1,1,1,1,4,3,3,3,3,1,1,3,1,1,1,2,2,1,4,1,1,1,1,1,1,2,1,1,2,1,2,2,1,1,3,4,1,4,2,1,1,3,5,1,3,1,1,2,1,3,1,1,2,1,1,2,1,4,1,1,2,1,1,1,1,2,1,1,1,1,5,1,1,1,1,1,1,2,2,8,1,3,1,1,1,2,1,1,b,1,2,2,1,1,2,1,1,1,1,1,1,4,3,1,2,1,1,2,1,1,1,1,1,1,1,1,1,1,2,1,1,1,7,3,1,2,4,1,2,2,6,5,2,1,2,4,1,2,8,1,1,1,1,1,1,1,1,5,1,4,2,1,1,1,1,3,1,1,1,1,1,1,1,1,2,1",
+    "la)": "3o",
+    "la.": "76",
+    "lab": "44,8v",
+    "lac": "f,n,1,e,s,6,i,3,9,r,h,s,a,7,2,b,b,2,3,1,8,4,1,6,3,5,2,1,2,c,v,6,3,9,2,1,a,7,4,l,8,1,p,1,8,5,5,1,1,4,w",
+    "lad": "e,16,2,17,j,u,o,2f,2u,u,1f",
+    "laf": "45",
+    "lag": "15,2k,3q,1,1j,t,2y",
+    "lai": "53",
+    "lal": "6u",
+    "lam": "0,1,1,1,2,1,1,b,m,3,1,1,4,2,4,1,2,3,2,9,5,2,d,1,c,x,n,d,1,2,1,2,1,5,1,3,1,2,11,4,2,2,5,3,3,6,g,6,1,1,9,9,1,4,5,5,6,1,2,7,8,i,3,1,7,b,1,1,c,1,1,1,1a,5,1,1,1,k,1",
+    "lan": "1c,t,v,p,d,4,2,2,f,o,4,1,2,3,3,4,2,3,a,1,1,1,4,7,5,1w,1,1,d,2,f,1,9,6,2,b,1,1,1,j,3,1g,9,1",
+    "lap": "g,g,7m",
+    "laq": "b2",
+    "lar": "7,k,8,b,j,4,1,g,1,3,a,t,g,3,a,1,c,3,1,f,9,8,k,3,7,1,1,3,1,4,a,1,5,1,1,2,1,1,m,o,u,1,1,g,1,5,1,1,2,3,3,1,5,4,2,a,b,7,1,l,6,8,1,c",
+    "las": "0,5,3,5,1,1,2,5,1,2,1,1,1,1,4,d,j,1,2,2,3,7,1,1,8,1,6,1,3,4,4,h,2,3,1,2,1,5,6,8,5,2,1,g,7,2,2,3,1,3,4,a,2,6,5,2,1,1,2,5,2,8,3,1,1,6,2,6,1,4,g,1,5,b,3,1,8,2,1,f,1,3,7,2,1,1,6,2,2,2,2,1,6,2,4,6,7,1,2,2,2,2,2,1,2,8,1,2,6,a,1,g,3,2,9",
+    "lat": "h,1x,9,8,t,1m,5,1m,3c,8",
+    "lau": "c9",
+    "lax": "7b",
+    "laz": "ch,a",
+    "lbu": "7r",
+    "lca": "99",
+    "lce": "15,2",
+    "lci": "5v",
+    "lcu": "1l,60",
+    "lda": "4d,2m,6,9,2p",
+    "lde": "aq",
+    "ldm": "49",
+    "ldo": "5k",
+    "le\n": "8i",
+    "le ": "9,z,8,36,1o,1,4d,u",
+    "le.": "7t",
+    "lec": "w,q,4h,4l,s",
+    "lef": "46,6e",
+    "lei": "47,48,2g",
+    "lej": "ap,1y,1",
+    "lel": "1l",
+    "lem": "2e,s,3,b,5,30,14,1c,1e",
+    "len": "2g,16,h,3,2e,2e,h,j,9,4,h,6,2,1a,3",
+    "leo": "ag",
+    "lep": "3d,s,1",
+    "ler": "4,1d,s,17,8,w,3,6,1v,m,1,i,1k,33",
+    "les": "1,4,d,d,t,j,2,x,1,4,4,8,2,d,d,m,3,1,e,1,2,7,2,e,6,4,8,2,2,7,a,1,8,8,3,1,i,6,1,1,9,3,8,1,d,m,b,2,6,6,3,7,7,3,8,1,1,5,1,7,a,2,2,1",
+    "let": "w,l,3a,1y,1,a",
+    "leu": "f,2q,x,6,1,1,5,54,13",
+    "lev": "36,1,29,1f,1i,7",
+    "lew": "3r",
+    "lex": "77",
+    "lez": "c6",
+    "lfa": "66,6o",
+    "lfo": "al,4,b",
+    "lga": "10,s,c,2,f,11,p,2y,1k,i,6,j",
+    "lgi": "3h,w,2c,5,5,9,6",
+    "lgu": "2y,s,1h,1,1w,d",
+    "lhh": "b1",
+    "lia": "d,13,5,1,j,m,3,a,g,x,5,11,r,p,12,1,1,2i,1,8,1",
+    "lib": "44,1w,2,1w,52",
+    "lic": "12,25,10,m,h,5,c,1j,1u,7,m,1,l,a,1a",
+    "lid": "22,1g,w,6,7,3,1,1m,4,5,6,20,m,1v,d,4,1,1,1,1,1,1,1,1,t",
+    "lie": "y",
+    "lif": "av",
+    "lig": "4j,1d,2m,11",
+    "lim": "1n,e,3,14,1m,3r,2r,1",
+    "lin": "i,1l,x,x,c,g,7,5,e,1,b,6,2,2,7,g,1l,1e,r,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,2,1,1,1,3,9,v,c,2,3",
+    "lio": "i,i,3a,r,1m,e,3e,1,1,2,b,2",
+    "lip": "1u,2i,t,52,i,1t",
+    "liq": "f,f,i,9,2,e,z,2d,6,h,k,m,s,1,e,d,3,11,k,8,1,5,8",
+    "lir": "bs",
+    "lis": "d,2e,1i,3,1a,3f,1u",
+    "lit": "17,c,2,1c,b,g,6,16,7,8,1,d,m,f,3,9,f,n,2,8,1d,2,10,1f",
+    "liz": "3p,2r,9,2e,20",
+    "lla": "10,5,3d,l,7,2,1u,z,4,q,c,7,2,8,d,3,2",
+    "lle": "3m,1u,14,2v,j,9,l,8,1a,3",
+    "lli": "38,27,1,42,5",
+    "llm": "66",
+    "llo": "2d,i,1u,d,b,u,10,1,9,6,u,o,j,4,2,f,3,g,q",
+    "llu": "4i,50,b",
+    "lma": "49,3,1u,2o",
+    "lme": "1,a,12,r,m,m,6,w,4,2,3,12,f,1,16,8,1,s,7,i,h,7,1,3,2,2,5,1,4,2,3,4,c,3,6,15",
+    "lmo": "2,1,6,1,2,1,1,1,1,1,1,1,3,8,1,1,1,5,1,7,1h,2,28,5l,9,1",
+    "lo ": "1c,h,h,1,2,3,1,5,4,1,4,b,1,1a,l,e,f,5,7,b,4,9,3,5,2,c,6,b,5,e,6,7,9,2,3,g,9,9,6,3,9,1k",
+    "lo)": "w,9q,1",
+    "lo,": "5d,4h,f",
+    "lo.": "4p,2j,1l,1z,q",
+    "loa": "6x,34",
+    "lob": "w,27,1w,3a,26,n",
+    "loc": "2e",
+    "lod": "ac",
+    "loe": "6p",
+    "log": "3d,3,d,6,7,2i,e,r,a,40,2",
+    "lom": "47,3t,10,h,s,19,1",
+    "lon": "18,a,1,1,a,1,2a,1h,1y,g",
+    "lop": "2i,1g,9,3,5,n,23,2j",
+    "loq": "d,1t,l,1a,e,8c,6",
+    "lor": "6,12,1,m,h,m,e,2,3,1,v,6,q,15,8,3,7,3,6,4,5,h,14,8,3,9,6,2,7,1,2,1,4,a,1y,4",
+    "los": "1,1,1,2,4,1,2,1,1,1,2,1,1,2,1,1,7,3,3,1,g,1,1,2,4,a,1,2,2,1,1,1,7,d,2,3,1,3,3,2,3,3,5,2,6,1,6,3,g,1,3,9,2,6,1,1,2,3,1,c,a,9,1,1,1,8,2,1,3,1,2,1,1,2,1,1,1,1,1,2,8,2,2,1,1,2,1,1,3,3,2,3,7,2,1,2,1,1,2,3,1,4,1,1,2,3,6,1,2,1,4,5,7,7,a,5,1,6,3,2,5,1,2,1,1,3,1,6,1,1,1,6,b,h,3,6,1,3,4,2,5,3,2,1,1,1",
+    "lot": "am,12",
+    "lou": "3o",
+    "lov": "ap",
+    "lp\n": "bd",
+    "lpi": "8e",
+    "lqu": "7i",
+    "lre": "5,a2,f",
+    "lsa": "1i,1,1,1s,3u,1m,30",
+    "lsi": "x,2g,m,77,5,8,2,h,3",
+    "lso": "bi",
+    "lta": "e,e,3,3,d,c,3,b,7,3,b,7,1v,z,35,c,5,x,c,a,j,a,e,9,1",
+    "lte": "66,2,6n",
+    "lti": "i,2y,17,e,19,1,d,15,33,s",
+    "lto": "24,12,1,28,7,1,o,v,29,k,5,4,2j",
+    "ltr": "g,1d,5u,3,a",
+    "lua": "c0",
+    "luc": "4b,m,i,j",
+    "lud": "39,19,1a,3q,b,1j",
+    "lue": "l,4,8c",
+    "lug": "7c,42",
+    "luj": "3,13,10,6,d,1c,e,3p",
+    "lul": "1u,2,2,1p,3,18,i,g,20,1,j,1,a,k,9,1,1,9,5,j,c,4,2",
+    "lum": "3p,o,u,1m,4,2,2,d",
+    "lun": "6m,1,u,5,2g",
+    "lup": "3b,15,2m",
+    "lur": "ao",
+    "lus": "9r",
+    "lut": "1g,36,u,1p",
+    "luy": "16,1q,58,2l",
+    "lva": "8k",
+    "lvi": "7v,j,4,s",
+    "lvo": "12",
+    "lvu": "2i,1",
+    "lzh": "3f",
+    "m\ne": "6o",
+    "m) ": "bp",
+    "m1\n": "6a",
+    "m2\n": "6b",
+    "ma\n": "a1",
+    "ma ": "0,2,a,5,2,b,q,2,4,4,4,g,7,2,l,8,6,2,1,3,d,2,2,6,1,4,1,2,1,1,3,6,2,3,2,3,2,y,g,4,4,6,4,6,6,b,4,j,a,1,9,4,1,c,4,1,c,a,1,5,1,d,5,1,1,1,2,8,9,3,1,2,6,h",
+    "ma.": "7r",
+    "mac": "0,1,4,1,1,x,2,1,2,4,2,4,1,2,3,2,9,5,2,d,1,5,7,x,f,3,l,1,2,6,5,13,4,2,7,3,3,m,6,1,a,a,9,5,6,1,12,k,1,3,4,5,3,3,16,1,5,1,1,1,k,1",
+    "mad": "89,1w,b,1",
+    "mag": "14,1,1,k,6,1,4,1,2,99",
+    "mal": "1o,e,e,1,6,7,k,1,8,x,l,k,7,7,1,1,7,4,i,e,k,1,8,1,1,5,1d,h,f,4,1,a,w",
+    "mam": "62",
+    "man": "c,5,11,v,k,7,1,d,2,s,6,w,s,b,2,12,i,j,1,3,a,6,b,1,1,5,5,5,3,2,3,3,1,1,8,7,3,3,9,d,1",
+    "mar": "1l,y,d,n,6,6,9,r,p,i,2j,e,13,5,2c",
+    "mas": "i,6,o,2,5,5,g,4,8,1,1,r,b,f,i,b,9,3,a,f,1,7,1,c,1,6,4,9,5,c,m,2,c,7,i,1,f,e,2,1,k,b,1,4,o,2,1,2,3,6,1,1,7,e",
+    "mat": "3,f,p,2,k,1i,r,7,7,1,d,1,2,4,3,3,3,3,1e,b,1,o,n,7,9,3,f,1,g,1,a,4,h,2,4,1,b,c,l,2,g",
+    "may": "c,3w,2t,43",
+    "mba": "2n,x,2,r,8,2e,1x,7,1,1,1,v",
+    "mbe": "2d,9,f",
+    "mbi": "2y,1a,6x,m,k",
+    "mbl": "3e",
+    "mbo": "2,b,2d,1,6,1x,a,2g,8,c,r,3h",
+    "mbr": "t,f,z,e,1q,3,y,1,p,6,b,3,24,7,1,a,k,2,j,1u",
+    "me ": "b,4,g,d,w,s,p,8,d,1,7,e,b,2,4,a,8,f,1,1,2,1,6,8,j,3,g,4,6,7,5,9,1,n,1c,3,c,1,n,g",
+    "me.": "9c",
+    "mec": "3i,2z",
+    "med": "0,3,6,1,8,3,h,1,3,1,2,5,2,c,i,8,2,2,3,8,1,8,1,1,3,3,1,1,2,6,2,2,1,2,1,1,1,2,2,3,4,1,2,3,1,3,2,1,1,1,2,1,2,1,1,2,4,5,1,3,1,1,4,4,1,1,2,3,2,6,c,4,2,4,2,1,2,1,2,4,5,7,1,5,1,8,3,2,6,4,6,5,x,7,1,9,7,5,c,3,c,1,2,7,14,1,a",
+    "meg": "5n,5b",
+    "mel": "38,27,1,44,1,g,1",
+    "mem": "t,1e,e,u,w,11,1,1c,33,2,j,1u",
+    "men": "1,a,7,a,l,4,3,2,1,1,5,8,3,b,3,8,8,8,1,1,1,1,2,3,3,9,3,e,6,4,2,3,c,2,i,6,2,d,1,16,8,1,3,p,2,1,3,1,2,1,1,9,5,3,b,3,7,1,3,2,2,5,1,3,1,2,3,4,1,9,2,1,2,1,2,3,3,3,5,b,1,1,4,d,e,5,7,1",
+    "mer": "1g,8,g,1b,17,1o,1p,1,2t",
+    "mes": "10,16,38,4d,13",
+    "met": "q,3h,2,c,u,c,2l,4c",
+    "mia": "26,8,p,2,1,1,1k,2,6,g,r,1,i,1,6,e,h,1d,5,13,10,b,1,16",
+    "mic": "2a,11,1,p,8,3,3,1,d,17,7,v,8,o,a,11,7,28",
+    "mid": "2p,v,5d,27",
+    "mie": "0,b,1,s,1,3,3,e,2,3,1,1,2,1,3,8,9,4,2,5,8,8,4,4,1,4,4,6,1,9,2,3,3,e,u,1,1,7,6,a,4,1,7,4,4,5,7,2,3,7,c,1,2,3,e,3,3,3,2,1,p,4,1,g,1,e,2,6,9,8,2,1,2,3,1,2,e,1,4,1,2,e,1,e",
+    "mif": "75",
+    "mig": "3c,35,4g,1f",
+    "mil": "1a,62",
+    "min": "z,9,1,5,t,3,i,t,6,7,3,9,5,i,2,1h,i,n,6,z,1x,7",
+    "mio": "2b,9,2,12,h,9,g,1,1q,2,4,q,y,2g,1s",
+    "mir": "40,7z",
+    "mis": "8x,1,1,3,2k,f",
+    "mit": "8u,6,1,1j,t",
+    "mna": "3p,1i,1m,4,4,d",
+    "mne": "c6",
+    "mni": "3k",
+    "mo ": "d,1b,q,1,1,1,a,1x,m,d,j,g,6,6,k,b,14,1,15,e,1,m,1,b,8,e,2",
+    "mo)": "4o",
+    "mo,": "az",
+    "mo.": "35,2g,g,o,2k,2i",
+    "moc": "5z,2n,32,1,6,9",
+    "mof": "34,7x",
+    "moh": "11",
+    "mol": "88,1j,z",
+    "mom": "8l,2e",
+    "mon": "2,1,6,1,2,1,1,1,1,1,1,1,3,8,1,1,1,5,1,1o,2,1v,2,b,g,1,2,3,1,1,1,4,1,3,4,5,6,20,p,1e,6,9,1",
+    "mop": "x",
+    "mor": "1a,1u,b,8,2,8,1t,7,1,1,b,1,9,5,3,n,10,20,k,2,j,y,b",
+    "mos": "4i,1p,1,15,2,23,4,7,h,a,l,j",
+    "mot": "g,1m,1u,t,1c,52,v",
+    "mov": "q,1c,1c,5,8k",
+    "mpa": "6m,3,5a,b,n,1",
+    "mpe": "3j,3a,2x,2w",
+    "mpi": "24",
+    "mpl": "w,l,2t,j,h,1d,d,a,1p,4,1,1,1e,6,s",
+    "mpo": "3f,1s,5,23,9,z,15,17,b,m,5,5",
+    "mpr": "40,6,f,1j,d,r",
+    "mps": "94",
+    "mpu": "b0,6,5,7,1,2,h",
+    "muc": "j,a,7,4c,1,4f,2,j",
+    "mue": "24,7,r,69,p,2j",
+    "muj": "5j,o,26,5,4,b,1,1x",
+    "mul": "f,3,1r,m,5,9,7,k,n,e,r,i,1,d,i,m,1,g,k,17,e,8,1,9,p,1c",
+    "mun": "i,2,2,2,s,l,2,18,5,d,a,d,4,1,1,2,1,1,2,2,1,3,2,1,2,2,1,5,1,4,3,2,g,n,2,1,b,7,3,3,u,4,k,2,3,o,2,1,2,6,1,4,9,4,d,3,2,1,13",
+    "mur": "2v",
+    "mus": "22,8,1,b,12,q,d,3,1,1n,2,1,1,1,2,1,1,1,2,1,j,3,11,2d",
+    "mut": "bg",
+    "muy": "92,o",
+    "myd": "8x",
+    "myo": "8c",
+    "n\np": "79",
+    "n\nt": "6i",
+    "n (": "a4",
+    "n a": "4,a,1q,4,7,9,5,13,13,d,b,j,5,3,1v,g,3,4,8,9,c,k,1,1,9,4,1,1,8,16,c",
+    "n b": "8,9,c,38,35,d,1i,4,q,1,1,2p,1,1,4",
+    "n c": "g,7,7,7,1h,8,1,b,p,2,12,1,1,h,8,1,k,16,5,d,l,6,4,1,7,4,8,1,2,a,3,3,3,5,2,6,3,7,k,1,8,2,7,12,1,1",
+    "n d": "1,2,2,1,1,1,2,5,2,7,3,1,5,1,1,3,1,1,5,4,2,4,1,2,2,1,2,c,1,1,2,1,1,3,7,1,1,2,3,2,6,2,1,k,6,3,1,5,8,1,9,6,5,5,1,1,6,4,1,p,1,1,1,1,a,3,1,1,1,1,6,3,7,5,1,1,1,6,3,1,1,1,4,1,2,1,5,2,a,4,1,9,5,1,1,1,1,2,3,2,4,6,2,h,1,5,2,1,8,3,1,4,1,7,1,2,1,7,6,2,1,1,5,6,1,3,1,1,1,1,1,1,1,1,3,2,3,1,1,1,1,1,2,2,7,2,3,2,1,1,1",
+    "n e": "4,7,4,1,1,d,5,6,2,3,1,3,2,2,2,2,4,2,2,1,1,1,7,2,2,4,d,8,4,2,1,1,3,1,1,9,1,3,d,8,3,a,1,3,4,a,2,2,2,6,2,1,1,1,5,1,1,1,2,3,1,1,1,d,5,1,a,2,2,1,9,1,2,2,1,2,3,3,2,1,8,2,5,1,8,1,a,1,5,a,2,1,4,f,b,3,6,9,4,6,2,1,6,1,3,2,4,6,c,2,8,a,3,2,4,1,1,1,1,1,1,4,1,1",
+    "n f": "1k,1,1,z,d,2g,1y,m,28,3",
+    "n g": "3j,25,i,2,z,24",
+    "n h": "3x,1m,j,6,s,s,y,i,s",
+    "n i": "p,j,8,d,1y,o,5,2,b,g,i,r,1m,c,1a,1s,1b",
+    "n l": "4,2,6,1,1,1,2,2,4,7,1,4,c,6,1,1,2,3,2,8,1,5,4,1,5,a,2,1,2,1,1,2,3,1,2,2,1,1,5,4,2,q,2,3,5,7,2,5,d,3,5,2,c,1,6,1,2,2,1,1,8,2,1,3,1,2,2,1,1,1,1,1,1,1,3,5,4,1,1,1,6,3,8,2,2,2,2,1,1,1,3,7,1,1,1,1,3,3,1,2,1,5,6,5,5,2,1,2,1,1,6,8,1,1,2,2,2,1,1,1,3,1,4,1,1,2,1,2,5,2,2,1,4,8,1,7,2,a,8,7,5,2,4,1,1,1,1",
+    "n m": "c,10,3j,j,5,13,5,4,6,g,1i,j,1,1,15,1,d,1,j",
+    "n n": "2d,5,z,28,1o,16,1n,16,e,a,g",
+    "n o": "7,p,n,5,p,14,1s,17,2,9,2,2b,5,t,1,4,1a,3,8,h,a",
+    "n p": "c,2,2,f,n,4,17,1,q,2,3,a,9,b,j,6,5,9,1i,4,9,c,r,2,a,1,3,2,3,3,6,2,2,6,6,b,1,e,1i,4",
+    "n q": "2,k,1e,1,1,4,s,a,1i,4,8,4,1b,1r,3,m,f,3,9,5,8,i,r,c",
+    "n r": "2y,3f,u,d,4,1k,1i,3,f,l",
+    "n s": "b,m,2,1b,1,s,7,2a,m,1w,v,1,1,3,g,10,7,3,o,9,b,b,f,6,4",
+    "n t": "11,d,j,39,1c,12,t,4,2,a,1m,4,g,1,1,1",
+    "n u": "2,b,1r,m,m,a,3,2j,n,c,b,14,r,l,k,1j,a",
+    "n v": "k,t,c,1a,y,2d,1,1i,q,h,r,p",
+    "n y": "0,4,c,b,g,1p,1,5,9,4k,p,16,5,3,15,8,2,m,l",
+    "n).": "1v",
+    "n, ": "18,8,6,2,2u,4,1w,9,4,1,o,10,y,2b,9",
+    "n-b": "53,5d",
+    "n-l": "8d",
+    "na\n": "71",
+    "na ": "1,7,2,3,e,2,3,3,c,2,3,3,1,5,i,5,6,3,3,2,1,s,3,3,2,2,1,c,5,b,3,6,1,3,8,2,1,1,4,1,7,1,1,1,4,1,3,1,5,1,3,2,1,2,1,2,b,1,1,4,4,6,5,2,5,3,3,4,b,4,1,2,7,2,2,1,2,1,3,1,3,1,1,1,1,1,2,2,4,3,i,1,1,1,5,3,3,3,3,2,1,3,3,2,2,1,2,1,3,b,b,a,6,3,3,2,2,g,1,7",
+    "na,": "83,2l",
+    "na.": "4w,j,1,4,6,7,2,5,11,e,3,6,9,i,11,2r",
+    "nac": "2u,3e,5j",
+    "nad": "59,1,t,3,j,30,1a,12",
+    "nal": "15,2,1,1,5,e,b,4,o,n,g,2,2,l,3,7,n,3,c,3,7,1b,1,2,1,3,2,4,2,2,1,1,5,1,1,3,6,1,1,1,4,1s,5,4,3,j,4,5,2,1,5,1,1,1,1,1,1,1,1,1,1,2,r",
+    "nam": "3r,i,3,6z",
+    "nan": "2i,1x,19,5o",
+    "nar": "3,1,6,3,1,6,3,6,1,1,7,1,x,a,h,2,4p,2,2,8,28,t,14,h,2,b",
+    "nas": "5,7,h,h,8,l,n,8,1,l,6,6,c,g,2,f,2,1,4,1,1,3,1,2,q,1,2,r,d,k,l,6,8,n,1,4,2,c,7,e,6,i,h,g,1,3,1,1,b",
+    "nat": "8j,3n",
+    "nau": "1o,1a",
+    "nav": "a3",
+    "nca": "1h,c,29,6,2,d,m,3e,m,27,2,o",
+    "nce": "c,o,v,1,1,1,1,16,p,d,3,5,6,1b,f,h,14,1,i,1,1,8,1,1,5,o,1,1,m,7",
+    "nch": "h,r,2,e,z,c,n,w,r,5,1i,w,w,5,l,4,1,5,5,8,2,3,4,1,3,1r",
+    "nci": "b,1,a,q,5,c,g,4,3,1,1,k,d,5,4,3,h,2,1,3,4,2,1,2,3,o,1,1,4,4,3,c,2,8,3,l,a,b,1,1,5,f,f,m,4,5,5,3,1,2,2,h,c,7,6,6,4,9,8,3,3,2,3",
+    "ncl": "2w,7t",
+    "nco": "1t,2p,2i,m,1w,x,n",
+    "ncr": "1f,k,2x,k,h,1",
+    "ncu": "6,1a,36,3k,d,1f,u",
+    "nda": "1c,1e,17,9,1w,a,g,1x,3,z,q,h",
+    "nde": "3r,f,1j,r,3n,x",
+    "ndi": "z,l,4,21,2,15,b,8,1,8,u,c,3,1,1m,26,19,2",
+    "ndo": "a,6,q,2,y,d,d,4,e,11,1,a,8,1,1,j,4,6,h,1,4,3,1,1,8,2,1,e,6,o,6,3,6,b,f,3,g,7,g,24,2",
+    "ndr": "b,k,d,w,s,x,d,1,7,e,b,2,4,a,8,f,1,1,2,1,6,8,j,3,g,4,6,7,5,9,o,1f,c,1,n,f,1",
+    "ndu": "1,24,1m,b,n,4,o,1,2,3,3,4,1,1,3,a,1,1,1,y,1e,1,1,1q,4,f,d,1f,1",
+    "ne ": "b,10,1z,1,15,10,5,g,p,c,1q,j,4,d,7,v,8,1d,h",
+    "ne.": "3t,1i,1g,1f,2t",
+    "nea": "b,n,1d,z,2,a,19,4b,5,2,3,7,3,3,3,4,1,2,6,3,2a,3,7",
+    "nec": "2w,5,j,n,m,19,q,3,e,1,1,j,1v,1w,e,2",
+    "nef": "68,1c,1,5,1,1,8,1,8",
+    "neg": "a2,1a,o",
+    "nel": "6h,r",
+    "nem": "33,1w,1b,1,1g",
+    "nen": "h,1c,b,1g,1n,1,1a,c,s,w",
+    "neo": "22,4,6,d,7,1,e,c,e,e,l,6,o,g,1,h,j,z,w,s,f,20",
+    "ner": "1,1c,10,d,e,4,4,2,2,1,1,6,2,2,3,1,2,8,1,2,e,a,6,14,9,1,6,1,1,3,1,5,7,3,6,1,1,3,1,1,12,9,5,w,5,1,4,2,7,c,b,13,3,r",
+    "nes": "2,1,6,1,2,1,1,1,2,1,1,3,1,2,1,4,3,e,3,f,y,2,9,b,2,9,b,i,3,8,9,8,3,f,c,b,5,1,8,2,2,1,6,6,2,2,1,2,2,2,1,2,3,2,5,2,1,2,1,1,2,3,1,d,9,8,3,1,6,o,k,3,6,1,a,2,4,1,1,2,5,a,1,a",
+    "net": "42,c,1a,i,2,1,4,8,1e",
+    "neu": "2,e,a,1x,q,4,1,4,7,3,3,5,2,1,7,d,1w,3,i,l,4a,x",
+    "nev": "a2",
+    "nex": "c3",
+    "nez": "5p,2e",
+    "nfa": "i,1l,8,p,l,l,9,m,5d,1,1,1,1,1,1,1,1,1,2,1,1,1,2,1,1,2,1,1,1k",
+    "nfe": "0,1,1,1,2,2,1,1,1,8,2,1,1,1,2,1,1,1,1,8,1,1,3,1,2,1,3,1,2,3,1,q,8,1,3,3,8,1,2,6,1,1,3,3,1,1,8,2,2,1,1,1,1,1,1,1,3,3,4,1,2,3,1,3,2,1,1,1,2,1,2,1,1,2,4,5,1,2,1,1,1,4,4,1,1,5,2,m,6,2,1,2,1,2,4,5,7,1,5,1,2,1,1,4,3,8,4,5,1,5,6,c,1,1,1,1,1,1,9,5,2,1,7,1,1,3,1,1,1,1,5,2,8,2,1,1,1,1,9,2,1,1,1,7,14,1,2,1,7,8,7",
+    "nfi": "5c,4g,22",
+    "nfl": "0,1,1,1,2,1,1,b,3,4,f,3,2,4,2,4,1,2,3,2,9,5,2,d,1,c,x,n,d,1,2,1,2,1,5,1,3,1,2,11,4,2,7,3,3,6,g,6,1,1,9,a,4,5,5,6,1,h,i,3,1,i,1,1,c,2,1,1a,5,1,1,1,k,1",
+    "nfo": "4p,1c,4e,e,8,13,2,f,f",
+    "nfr": "1b",
+    "nga": "5m",
+    "nge": "4,2,1,1z,o,3,3c,1w,1,1,2i,1p,1,1",
+    "ngi": "6,1,1w,2,7,2y,34,1j,9,7,5,1,2,6,1,3,2,3,v,h,2,1",
+    "ngl": "i,4j,5e,1,1,2,b,2",
+    "ngo": "r,a,1b,68,w",
+    "ngr": "v,2,2,19,2,3,9,4,1,1,9,2,1,1,1,1,e,1,t,p,1,q,1s,3,c,1,4q",
+    "ngt": "3q",
+    "ngu": "26,5,1,d,7,1,e,q,2,3,9,h,4,6,o,p,9,j,z,23,1r",
+    "nha": "12,1",
+    "nhi": "c0",
+    "ni-": "41",
+    "nia": "2,1o,1z,p,d,1z,8,24,5,1y,5,8,1,8,1,13",
+    "nic": "0,3,10,1y,7,b,1,j,2,c,8,7,1,2,5,a,5,i,o,a,4,l,5,1,1,1f,p,a,1,t,1,4,6,9,3,8",
+    "nid": "24,r,9g",
+    "nie": "aw,1o",
+    "nig": "5q,2z,1j,4,9,1x",
+    "nil": "5g,3v,y",
+    "nim": "18,3,5e,4f,1,j,2,1",
+    "nin": "4w,t,1o,11,16,6,20",
+    "nio": "3k",
+    "nir": "7e",
+    "nis": "z,1b,i,d,g,23,16,58",
+    "nit": "4,1c,r,n,1a,c,4,1,1,2,1,3,6,2,3,2,14,9,1n,1,1,s,8,s,g,8,2,5,7,1,u,f,5,4",
+    "niv": "v,4,27,1,2f,9",
+    "niz": "49,2f",
+    "njo": "al",
+    "nju": "5r,2v,3l,j",
+    "nlo": "7b",
+    "nme": "i,4j,5v",
+    "nmu": "1g,1v,5,d,n,4,1,1,2,1,3,6,2,3,2,6,1,4,5,g,n,2,1,b,17,1j,n,k,2,1",
+    "nni": "cb,9",
+    "no\n": "6h",
+    "no ": "2,9,8,c,4,9,2,c,6,2,1,6,2,1,2,7,5,1,9,4,2,3,2,1,6,3,4,1,2,1,4,3,1,2,2,1,5,1,2,1,3,4,3,7,2,2,5,2,4,1,1,1,4,5,2,2,1,1,2,3,6,4,1,2,7,1,2,4,8,9,5,4,5,8,7,1,6,1,2,2,1,2,6,1,2,a,1,5,1,4,4,d,4,4,9,7,3,b,9,1,1,7,1,1,1,1,1,1,1,1,1,1,2,2,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,2,9,1,2,3,1,1,5,2",
+    "no)": "a8",
+    "no,": "3k,35,j",
+    "no.": "15,b,c,2u,2g,1f,f,9,2h,o,o,1",
+    "noc": "32,4s,1q,2,g",
+    "nod": "4l,b,j,1,4o",
+    "nof": "4k,53",
+    "nog": "89",
+    "noi": "bs,2",
+    "nol": "3g,m,2m,e",
+    "nom": "c,1m,w,4,2s,7,1,1z,8,1,1,5,4,a,1,t,1,1,13,1,8",
+    "non": "7i,2,1,2,3,2,5,2,1,2,1,1,5,1,u,1c",
+    "nop": "6i,23,1w",
+    "nor": "22,e,1,6,10,x,l,k,a,4,1,1,7,m,e,k,1,f,m,b,g,h,16",
+    "nos": "5,d,1,4,d,p,i,j,7,6,f,7,6,3,i,5,c,2,2,1,c,5,6,f,1,1,1,2,b,3,9,b,2,2,2,n,2,9,3,1,3,1,d,8,b,2,9,4,5,a,1,3,7,7,5,4,8,4,b,1,2,1,e,6,2,5,3,2,1,6",
+    "nov": "n,1,4v,1o,2",
+    "nqu": "0,1,g,a,4g,1q,3t,25",
+    "nro": "6w,2x",
+    "nsa": "h,h,b,f,z,w,8,29,1y,m,2m,4,19,2",
+    "nse": "8n",
+    "nsi": "e,12,s,l,18,j,2,7,17,v,1,2,10,o,11,1g,6,6,l,9",
+    "nsm": "8x,1,1,1,1,1,1i",
+    "nso": "3c,2,6,29,m,4t,1,8",
+    "nsp": "7p,d,9,j,3d",
+    "nst": "5j,32,1,2u,9",
+    "nsu": "2d,2d,6,j,1,4,7,4,2,1q,l,3s",
+    "nta": "6,e,1,7,1,u,a,5,d,1,i,5,3,1,2,6,2c,v,1,u,5,k,u,1,2,2,1,7,d,1,f,a,h,a,5,10,2",
+    "nte": "1,a,6,1,5,5,8,7,1,1,2,2,3,1,8,4,2,8,1,2,1,6,2,3,1,5,2,2,2,1,2,4,2,7,2,1,2,3,3,6,a,3,3,7,1,3,2,1,1,1,3,6,1,2,2,6,7,1,1,1,3,3,2,2,3,1,5,4,1,1,7,3,8,5,1,3,1,3,6,3,1,2,1,3,2,1,3,7,1,3,a,4,3,4,1,2,1,9,5,4,1,1,1,2,3,5,7,1,3,2,2,5,1,3,1,2,3,4,b,1,2,1,1,3,2,2,1,2,2,1,1,1,1,1,3,1,1,3,2,3,2,1,8,5,1,4,9,5,1,6,3",
+    "nth": "8d",
+    "nti": "1t,1q,7,e,2,k,2,3,a,i,2,h,q,q,n,j,1j,9,o,l,4,3,3,4,8,b,4,5",
+    "nto": "0,y,6,1,3,3,6,6,2,2,3,2,5,1,2,6,6,3,4,2,5,8,6,6,3,1,1,3,1,4,6,2,a,3,3,d,1,u,1,1,2,5,6,a,4,1,b,4,5,7,2,3,4,f,1,2,3,e,2,1,2,1,3,2,1,5,1,j,l,5,a,2,6,4,5,8,1,4,e,2,1,1,2,1,4,1,2,1,1,c,1,1,g",
+    "ntr": "6,9,1,10,d,1t,3,i,4,b,1,1z,1,l,9,4,1,k,7,6,9,8,1s,14,6",
+    "ntu": "3i,2z",
+    "nuc": "3r,18,5h",
+    "nud": "4,2b,13,c,e,39,y,p,b,12,9,3,5,v,n",
+    "nue": "8q",
+    "nul": "a9",
+    "num": "7z,2u",
+    "nur": "7r",
+    "nus": "5,2q,9i",
+    "nut": "19",
+    "nve": "9z,1n,h",
+    "nvi": "38,9s",
+    "nvo": "4x,1p,v,5",
+    "nvu": "3d,m",
+    "nza": "b,1,9,4,z,7,1,2,1,1b,4a,12,n,c,1,h,1r,12",
+    "o\na": "16",
+    "o\nb": "76",
+    "o\nc": "6h",
+    "o\nd": "3p,1q,11",
+    "o\nf": "ag",
+    "o\ni": "7i,4p",
+    "o\nl": "7c",
+    "o\no": "ae",
+    "o\nr": "70,5",
+    "o\nt": "af",
+    "o\nu": "15",
+    "o (": "11,5,p,6g,2,n,h,r,e,1",
+    "o 1": "4w,k,u",
+    "o 2": "5f,c,k",
+    "o a": "2,x,7,i,i,2,4,b,2,3,3,3,j,1,2,1,7,3,6,9,6,4,1,4,9,2,3,2,9,7,4,5,7,5,6,4,2,7,c,1,4,b,3,8,b,1,b,g,2,1,8,1,y,2,f,4,1,3,4,4,1,c,6,1,1e",
+    "o b": "26,4m,3n,q,j,5,y",
+    "o c": "k,4,8,1,b,6,a,d,2,1,6,1,2,2,1,1,5,8,1,1,6,1,1,4,5,5,2,1,8,4,2,7,1,a,1,5,3,4,1,8,3,9,4,n,j,3,2,5,4,2,7,1,z,3,a,f,9,5,9,2,f,9,2,6,9,k,1,1,4,d,q",
+    "o d": "0,1,2,8,3,9,2,5,2,2,1,1,1,1,2,1,1,1,2,2,9,1,1,2,1,2,1,2,1,1,5,1,1,1,2,4,1,2,1,1,4,3,3,1,1,1,1,1,4,1,7,1,2,1,2,4,1,2,1,1,1,1,2,2,3,1,1,1,4,2,1,7,1,3,1,8,4,1,4,f,3,4,2,2,2,1,1,3,2,1,1,1,1,2,3,1,3,2,1,4,1,2,2,1,1,1,1,3,2,3,4,1,2,1,1,1,1,1,1,1,9,1,2,9,1,1,1,3,e,1,1,1,3,3,1,1,1,1,e,6,4,4,1,c,1,8,8,3,1,9,1,4,1,2,2,1,1,1,1,1,1,1,6,3,1,1,1,2,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,4,2,2,5,1,2,2,7,1,2,2",
+    "o e": "7,3,3,2,1,e,1,1,1,2,6,3,e,1,5,m,a,8,4,4,6,9,1,2,e,f,1,5,5,8,2,2,2,1,1,d,1,3,2,6,7,1,4,6,u,6,2,e,8,b,7,a,1,9,1,1,1,i,1,g,9,5,5,5,6,3,d,2,3,2,5,2,3,8,2,5,b,5,5,2",
+    "o f": "16,1c,2m,28,1,1q,u,28",
+    "o g": "16,2,g,6,1,23,8,8,j,x,j,9,1,2,s,i,2s,1s",
+    "o h": "j,t,s,s,8,t,a,1g,f,4,4,1,1x,5,2y",
+    "o i": "7,z,2,b,1,v,4,c,19,2,b,y,13,b,7,3,o,i,10,18,k,7,1,8,13,f",
+    "o l": "x,q,a,9,a,k,19,3,5,7,b,b,d,1b,5,2,d,2,j,6,9,t,h,6,5,a,1,8,1,1,1,3,8,d,q,7,8,5,1,2",
+    "o m": "i,11,z,2j,e,9,6,2,6,c,3,5,6,3,k,2,16,x,1,d,y,8,k,m",
+    "o n": "z,13,e,1,w,g,d,1,j,6,22,e,1d,1d,2",
+    "o o": "2,e,g,2,1,6,h,11,b,3i,6,9,4,d,1,1,3,3,8,c,r,13,j,n,2,b,m,6,2,n",
+    "o p": "a,1,2,j,t,c,2,8,1,1,e,1,9,k,7,5,9,4,b,5,9,4,3,3,6,2,2,1,6,c,n,9,e,3,y,j,4,5,8,k,b,b,3,f,3,3,2,2,8,1,3,2,4,3,9,l,1,3",
+    "o q": "j,h,8,c,1,7,1,4,6,c,6,1,a,a,1,6,4,5,2,b,5,3,1,1,5,3,7,4,6,6,c,f,5,a,1,9,j,h,5,9,1,4,8,1,3,6,8,1,e,y,i,4,2,b,2,1,2,e,k,1,b,d",
+    "o r": "1o,r,2,18,4,7,7,5,2,a,1c,a,1,2,6,a,7,n,e,16,1a,1,7,t,b,8,6,j,8",
+    "o s": "z,j,6,2,g,6,d,9,d,b,f,7,8,1c,l,l,4,a,u,h,3,3,8,2,1,4,x,6,13,2,1,k,4,e,6,1",
+    "o t": "3e,n,n,m,b,1a,d,1v,24",
+    "o u": "n,c,4b,1h,r,2,9,g,8,o,3,v",
+    "o v": "84,4w",
+    "o y": "j,q,1,i,5,1k,1,9,r,5,6,1o,f,e,1u,1,d,b,f,4,h,g,5,f,4,4,1,7",
+    "o z": "cb",
+    "o) ": "w,6g,2w,e,1",
+    "o).": "11,3n,44",
+    "o, ": "7,b,o,2,1,1,3,3,h,z,g,2,6,7,3,a,7,b,f,6,4,2,n,h,8,3,8,5,3,a,b,5,1h,f,9,6,5,e,2,2,2,1,19,2,a,f",
+    "o-c": "b6,w",
+    "o-d": "b5",
+    "o-o": "7c",
+    "oac": "5h",
+    "oaf": "br",
+    "oag": "2q,1,6,7",
+    "oal": "7r",
+    "oan": "2x",
+    "oar": "48,2p,i,1",
+    "oas": "a1",
+    "obe": "39,2j",
+    "obi": "78,41,5,3",
+    "obj": "bh,14,2,1",
+    "obl": "2e,j,c,b,5,30,14,1c",
+    "obr": "r,3x,14,4x,2b",
+    "obs": "3,5,j,29,18,66,6,8,e,3,b,i",
+    "obu": "w,27,1w,3a,26,n",
+    "oc)": "3",
+    "oca": "4,h,o,k,i,1,7,1,2,14,o,e,4,8,w,e,18,c,a,17,11,s,e,t,6",
+    "oce": "1y,6k,a,1,s,1",
+    "och": "7u",
+    "oci": "2e,o,x,p,1,f,6,b,e,2,b,2a,y,i,6,7,b,8,3,8,7,8,1,6,2,3,4,2",
+    "ock": "31",
+    "ocl": "45",
+    "oco": "21,2,2n,4,1,8,3,4,22,37,1l,m",
+    "ocr": "5j,g,b,1",
+    "oct": "1r,63",
+    "ocu": "c,4,1h,9,29,1,a,8,1,1,21,e,o,5,a,b,e,1,3,17,l,4,d,2,g,7",
+    "oda": "95",
+    "ode": "15,1g,1b,p,8,3,j,1,13,r,1j,3,n,t",
+    "odi": "42,7,9,2o,2c,1q,l,r",
+    "odo": "w,3m,o,d,1b,7,1l,w",
+    "odu": "a,17,37,2,6,l,1,1,1,3,3,5,2,1,1,1o,m,4,1,3,9,u,7,d,x,1p",
+    "oec": "aw",
+    "oem": "d,2e",
+    "oen": "1p,2l,5",
+    "oes": "16,13,4g",
+    "ofa": "16,h,a,3,5h,3k",
+    "ofe": "4k,53",
+    "ofi": "34,k,e,7,1h,v,1k,23",
+    "ofo": "8e,25,a",
+    "ofr": "ba,h,1",
+    "ofu": "2q",
+    "oge": "31,2i,2a",
+    "ogi": "3d,3,d,6,7,2i,e,r,4a,2",
+    "ogl": "89",
+    "ogn": "bw",
+    "ogo": "66",
+    "ogr": "3f,c,1,4,9,n,1t,1i",
+    "ohi": "b1",
+    "ohn": "19",
+    "oho": "11",
+    "oia": "bs",
+    "oid": "i,s,2u,d,7,1,c,b,5,1,3,9,1,1,5,a,1,1,q,1r,1z,3,y,1,f,1,9,d,2",
+    "oim": "bd",
+    "oin": "3b,i,n,i,2,b,1,4,5,g,p,1,b,2q,z,b",
+    "oiq": "ac",
+    "oit": "97",
+    "oja": "4i,50",
+    "oje": "6w,2x",
+    "oji": "9d,2",
+    "ojo": "n,2g,1p,7,c,46,1l,15,1,1,c,1,3,1",
+    "ol ": "29,x,2e,22,2h",
+    "ol.": "5m,4o,1,1r",
+    "ola": "g,g,x,c,3l,x,1v,1s,1,u,j,9",
+    "old": "aq",
+    "ole": "1h,4,1,n,x,w,3b,2u,o,v",
+    "olf": "66,6o",
+    "oli": "d,u,n,x,1g,a,d,b,a,4,3,5,n,n,2,i,e,9,5,y,m,1,e,7,a,2,1n,2",
+    "oll": "10,4a,2,v,1y,1f,8,g,2",
+    "olm": "4c",
+    "olo": "6,12,1,9,1,1,a,1,h,m,e,1,3,1,1,b,6,7,7,4,2,q,d,7,l,1,7,2,1,7,3,3,1,2,4,5,f,2,14,8,3,9,8,7,1,2,1,4,a,1n,2,9,4",
+    "ols": "1i,1,1,5m,1m",
+    "olu": "3p,18,a,9,16,1,6,4,4,d,3,5,25",
+    "olv": "12",
+    "oma": "c,o,4,1,1,j,1,6,1,1,3,1,2,q,15,a,j,c,m,7,1,1,3,6,8,4,8,15,8,1,1,5,3,1,6,4,1,6,3,h,3,1,1,m,1,6,6,4,1,2,3,4,1,i,1,6,2,1,b,1,1,4",
+    "omb": "d,20,9,1,3,1,6,4,l,s,7,j,y,6,b,27,7,1,a,2j",
+    "ome": "b,k,d,8,4,2,2,g,s,2,v,d,1,7,7,1,6,b,2,4,a,4,4,f,1,1,2,1,6,8,j,3,g,4,5,1,7,4,1,8,1,o,t,m,9,3,1,n,g",
+    "omi": "b,1,w,1,m,1,2,1,8,f,o,x,2,3,3,g,1c,i,v,v,7,z,1,h,k,7,1,21",
+    "omn": "3k",
+    "omo": "1o,30,m,p,8,1,k,6,k,b,14,1,4,11,e,1",
+    "omp": "w,l,2j,6,f,p,17,8,4,7,8,1w,1l,b,6,4,9,2,b,5,1",
+    "omu": "i,2,2,2,1d,2,20,n,1,1,2,1,6,2,3,d,i,m,3,m,3,y,k,2,3,o,3,2,6,1,4,d,d",
+    "omy": "8c",
+    "on\n": "6i",
+    "on ": "0,1,1,1,1,1,1,1,1,2,1,1,2,1,1,1,3,7,1,1,1,1,1,1,1,1,2,1,1,1,3,1,1,2,1,1,1,1,1,2,1,1,2,2,1,1,1,9,2,2,1,1,1,1,1,2,1,1,1,1,3,1,1,1,2,1,2,2,1,1,2,1,1,2,1,1,1,6,1,1,6,2,2,4,2,2,1,3,2,1,8,1,6,3,2,2,2,1,4,2,1,1,1,1,1,2,4,1,2,1,1,2,1,3,1,1,3,2,4,3,5,3,1,2,1,1,5,1,2,1,1,1,1,2,5,2,1,1,2,1,3,3,2,1,1,1,3,1,2,2,1,1,1,3,1,1,1,2,1,2,3,2,4,4,2,1,3,5,1,2,1,1,5,1,1,1,1,1,1,1,1,1,2,1,3,1,1,1,1,1,1,1,1,2,5,1,1,1,1,2,1,1,1,1,1,2,1,1,1,2,1,3,1,1,1,2,2,1,1,2,1,1,1,2,1,2,2,1,2,1,2,3,1,7,1,1,1,1,2,3,1,1,1,2,1,1,3,1,1,1,1,1,1,1,1,3,1,1,2,1,1,1,1,1,1,1,1,2,1,2,1,1,1,1,2,3,1,1,1,1,1",
+    "on)": "1v",
+    "on,": "18,5a,9,4,1,o,10,39",
+    "on.": "1,6,7,i,a,3,9,1,b,i,2,5,1,1,8,11,9,1v,19,27,10,3,c,c,i,b,a",
+    "ona": "3,7,2,1,1,g,1,7,1,8,z,8,9,2,2,p,7,2,3,c,g,2,i,9,1,2,3,1,1,1,4,1,3,4,1,3,7,r,19,9,e,n,2,16,f,1,1,1,2,2,5,2,1,5,1,1,1,1,1,1,1,1,1,1,2",
+    "onc": "3k,y,w,3i,i,4",
+    "ond": "1,y,16,1m,1g,h,7,z,3,1,2t,t,6,m,s",
+    "one": "2,1,6,1,2,1,1,1,2,1,1,3,1,2,1,4,3,e,3,f,y,2,3,h,2,9,b,i,3,9,8,6,2,3,f,c,b,5,1,8,2,1,1,1,6,6,1,1,2,1,2,2,2,1,2,3,2,5,2,1,2,1,1,2,3,1,d,9,8,3,1,6,18,3,6,1,a,2,4,1,1,2,5,a,1",
+    "onf": "bu",
+    "ong": "4,x,1t,2s,n,1w,1,1,d,w,19,1r",
+    "oni": "0,2,1,10,14,o,d,c,k,1,c,8,7,1,h,n,o,a,4,l,7,17,8,p,a,e,g,k,3,8,4,9,k",
+    "onj": "5r,2v,1z,1m,j",
+    "ono": "32,2w,9,2r,1i",
+    "onq": "0,1,g,a,9z,25",
+    "ons": "6y,1p,2t",
+    "ont": "l,7,11,9,2,3b,17,1,u,5,16,8,1,5,7,d,1,2b,d",
+    "onu": "ag",
+    "onv": "38,5,m,84",
+    "oof": "8e",
+    "oot": "3v",
+    "op\n": "5j",
+    "op)": "8d",
+    "opa": "1g,m,8,8,4,8,n,1,g,9,3,4,1,7,i,a,h,n,3,2,4,2,b,1,14,c,1w,a,16,b",
+    "ope": "4e,o,2,p,m,j,2q,2w",
+    "opi": "4g,1q,2,2v,9,26,15,1",
+    "opl": "2v,s,2n,1,v",
+    "opo": "5t,m,j",
+    "opt": "x,98,24",
+    "oqu": "d,1t,l,a,10,e,6l,14,n,6",
+    "or\n": "b4",
+    "or ": "1,4,1,1,5,9,9,7,1,1,3,2,1,1,3,1,6,4,1,1,l,1,f,1,6,e,5,4,2,a,9,6,1,6,9,3,5,5,4,2,4,3,1,3,2,2,7,1,1,3,1,b,b,2,1,2,2,3,2,1,3,9,1,1,3,6,2,2,2,4,a,3,7,1,a,3,1,1,2,1,2,3,3,3,3,1,2,6,8,2,3,2,1,2,4,4,1,4,2,9,2,2,1,9,2,4,4,1,g,2,5,5,2,d",
+    "or,": "1o,1u,3e",
+    "or.": "50",
+    "ora": "e,2,1a,l,1,1,1,4,1,1,1,8,1,2,5,8,2,5,3,d,9,1n,7,p,5,2w,2,v,5,n,6,16,8",
+    "orb": "4z",
+    "orc": "2z",
+    "ord": "bd,p,4",
+    "ore": "k,5,1,1,2n,b,1,7,b,22,1,8,1v,1,1h,1g,16",
+    "orf": "bk",
+    "org": "i,1,h,m,l,y,1b,l,3d,4,m,5,1n",
+    "ori": "0,3,5,9,1,2,1,1,1,2,1,1,1,3,2,a,2,13,13,4,i,g,1,c,1,2,4,6,1,2,3,16,6,2,1,b,1,i,3,2,1,2,7,2,1,7,3,14,c,7,5,9,9,2,6,3,k,6",
+    "orm": "h,x,4,2,1,1,8,8,e,1,4,2,3,f,3,c,3,2,g,a,5,4,2,f,3,2,7,1,2,3,1,1,1,4,1,3,4,1,1,1,7,1,4,f,2,8,6,9,b,1,f,1,3,b,y,9,8,3,c,4,1,7,3,a,9,4,2,h,6,o",
+    "orn": "4,7,8,p,t,2,t,8,6,3,7,9,2,2,1,5,1,2,1,7,3,7,2,2,5,6,1,1,1,9,4,1,1,2,d,1,8,1,1,2,a,2,e,8,1,m,1,2,b,1,26,8,a,1,1,1,1,1,1,1,1,1,1,1,1,2,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,b,3,1,2,a",
+    "oro": "2a,3j,m,7,c,b,m,1c,3,o,1,2j",
+    "orp": "39,2j,5s",
+    "orq": "8v",
+    "orr": "1a,l,n,m,2q,9,2v,v,2t,1,1,1,4",
+    "ors": "7e,4i",
+    "ort": "2n,1,r,a,q,15,2,y,n,8,a,d,9,j,c,1t,2,9,j,3,5,5,h",
+    "oru": "9y",
+    "orz": "cs",
+    "os\n": "6f,1y,13,2v",
+    "os ": "1,1,1,2,4,1,2,1,1,1,2,1,1,2,1,1,4,1,2,1,2,3,h,1,3,2,2,5,5,1,1,1,2,1,1,1,7,d,2,3,1,3,3,2,1,1,1,3,5,2,6,1,2,4,3,1,5,4,4,2,1,1,2,9,1,1,1,3,2,1,1,1,1,3,d,3,7,2,5,2,1,1,1,4,4,2,1,3,1,3,1,2,1,1,1,1,1,1,9,2,2,1,1,2,1,1,3,2,1,2,3,2,5,1,1,1,2,1,1,2,3,1,4,1,1,2,2,1,1,5,1,2,1,1,3,5,7,4,2,1,f,1,1,3,2,3,2,1,3,1,1,1,1,1,1,1,1,1,5,2,1,1,1,1,3,2,3,1,2,4,1,a,1,2,1,1,2,3,3,3,1,1,2,4,1,1,5,2,1,2,1,1,1",
+    "os)": "1j,1z,7,4b,1k,k,3,1l",
+    "os,": "4,j,10,h,2e,1b,m,5,7,1,j,3,1q,e,f,i,2,3,i,1e",
+    "os.": "i,i,h,8,17,7,8,5,f,4,h,b,1,1,8,1,1,1,a,5,13,1,1,2,5,f,1,13,2,b,4,l,a,8,9,9,3,2,6,4,1,6,4,3,4,c,e,2,g,2,1",
+    "osa": "5,4,c,7,1,e,3,7,19,9,l,6,p,3,3,e,8,5,1,g,p,4,a,1,a,2,3,j,x,i,5,3,4,4,2,1,1,4,5,7,3,3,5,2,1,1t,5",
+    "osc": "a1,a",
+    "ose": "x,4w,m,1,i,2,c,49",
+    "osf": "55",
+    "osi": "9,1,8,1,i,1,1,8,3,4,3,8,g,h,q,8,b,9,4,b,6,1,1,6,b,6,4,7,m,9,3,7,3,6,2,1,5,1,5,6,1,1,9,1,8,1,7,x,7,2,b,5,2,3,1,1,4,f,1,5,y",
+    "osm": "66,6o",
+    "oso": "3b,6,7,1,3,f,2,3,3,1,7,1k,1,7,n,a,n,g,a,i,4,g,6,1,1,9,e,2,1,b,11,m,1",
+    "osp": "86",
+    "osq": "ak",
+    "ost": "6,5e,9,m,1,i,a,7,1,12,6,1,1,4,z,14,a,15,2",
+    "osu": "4l",
+    "ot-": "3v",
+    "ota": "6j,d,5y",
+    "ote": "b,p,g,n,1d,16,1,i,1j,r,c,a,m,9,z,w,a",
+    "oth": "3v",
+    "oti": "22,25,1a,k,1q,a,32,f,6,5,3,2,c",
+    "oto": "g,39,7,t,t,j,v,4,1s,1,1t,2c",
+    "otr": "j,8,n,v,16,9,b,1a,x,18,1q,25,j",
+    "otu": "2o,4c,2n,4",
+    "ou ": "3o",
+    "our": "84",
+    "ova": "2f,d,t,g,e,14,8,2m,3,1n,u,1f",
+    "ove": "7e,3b",
+    "ovi": "j,4,1,2,1c,1c,5,3o,2,4u",
+    "ovo": "4,h,o,k,j,1e,1e,w,e,18,c,a,17,11,s",
+    "ovu": "5j,3k",
+    "oxe": "94",
+    "oxi": "v,4,1e,2b,u,3",
+    "oye": "1k",
+    "oz.": "cv",
+    "ozo": "8u",
+    "p\na": "5j",
+    "p\nb": "bd",
+    "pa\n": "9t",
+    "pa ": "10,e,16,4,2n,4i",
+    "pac": "f,1,11,c,1y,9,3,3,f,2,30,3,x,m,1d,h,d,4,i,4,2,2,b,c",
+    "pad": "5n,2j,1,20,20,k,1",
+    "pal": "4d,1,4,2h,6,6,3,24,8,3,a,9,j",
+    "pam": "6h,r",
+    "pan": "1f,k,1i,1f,k,h,1,r,2m,1x,6,w,o",
+    "pap": "90,h",
+    "par": "5,1,a,9,7,2,2,a,1,6,1,1,4,1,1,1,3,9,5,1,1,b,h,1,c,6,5,8,1,1,7,4,3,2,4,2,h,7,j,2,1,9,o,2,4,1,6,6,7,8,p,8,7,8,3,2,1,1,4,b,j,3,a,a,3,2,4,c,5,1,7,2,c,1,5,1,1,3,1,3,6,1,2,5",
+    "pas": "f,1m,31,1k,m,2o",
+    "pat": "1d,1,2,i,c,8,4,8,n,1,g,9,3,4,1,7,c,6,a,14,3,2,4,2,b,1,14,22,6,a,k,2,h,1,1,1,1,1,1,1,1",
+    "pau": "8l",
+    "pb)": "8p",
+    "pci": "2s,t,1a,4i,h,9,6,22",
+    "pco": "8d",
+    "pe ": "1p",
+    "pec": "1,23,8,2q,4m,f,9,c,s,1",
+    "peg": "bf,m",
+    "pel": "3x,e,3k,j,4,s,m",
+    "pen": "1k,1h,i,8,f,8,i,8,8,3,1,d,m,e,3,2,18,1m,1e,2,l,8",
+    "peo": "3j",
+    "pep": "15,j",
+    "peq": "1i,4,6,2,2v,d,1i,1g,q,p,2,6,1,b,6,1,2,5,2e",
+    "per": "c,2,3,1,2,5,1,1,1,9,8,2,b,2,2,3,a,4,1,d,4,4,9,4,1,b,2,9,b,2,2,b,1,4,b,2,1,6,7,3,1,2,1,6,2,b,4,6,6,b,2,3,3,7,6,5,2,6,9,j,3,5,6,6,1,c,4,1,1,4,3,4,a,3,6,4,4,2,3,8,3,2,1,1,2,2,5,1,2,1,2,4,1,1,1,1,1,1,1,1,4,1,4,9,1,1,1,1,6,4",
+    "pes": "19,4j,34,3,i,j,2k",
+    "pet": "b,2z,6g,36",
+    "pez": "63",
+    "ph)": "90,h",
+    "pia": "68,9,66,1",
+    "pic": "4,4e,1o,o,1q,j,9,1,1,4,m,1,q,z,2,k",
+    "pid": "1o,g,b,2,1j,c,t,v,1y,w,e,z,2j",
+    "pie": "2q,7,2,j,10,1,a,j,1,1s,5,1,9,1,2,15,8,b,1,2,1,1,1,1,1,1,1,1,1,4,1,1,1,1,1,2,1,1,1,1,2,1,1,1,1,1,1,1,1,1,x,9",
+    "pif": "7d",
+    "pig": "a6",
+    "pil": "3d,c,g,1,4u,b,6,6,a,1",
+    "pin": "24,1e,g,2,n,36,l,x,b",
+    "pio": "4g,72",
+    "piq": "9c",
+    "pir": "0,8,3,6,3,1,1,1,2,1,1,1,3,2,1,24,8,7g,26",
+    "pis": "87,31,l,r,9",
+    "pit": "5n,3,4d,3,t",
+    "pkd": "7z",
+    "pla": "3n,1q,w,1,1,11,1,1c,e,2,d,c,p,7,1,2,9,1f",
+    "ple": "f,3,e,l,1z,17,e,19,1,d,c,t,16,1n,3,7,2,j",
+    "pli": "4a,j,h,1d,j,4,1u,1f,1k",
+    "plo": "2v",
+    "pm)": "8m,33",
+    "pne": "b,f,2k,9m",
+    "po ": "e,9,2,a,1,1,t,1,y,5,a,j,4,1,k,a,3,3,g,3,1,b,i,1,1,2,8,1,1,5,5,5,2,6,1,4,5,h,8,2,6,2,a,r,1,1,t,l,1",
+    "po,": "i,4j,6,t,s,16,2g,i",
+    "po.": "j,1u,n,1,w,x,c,3,26,9,1",
+    "poa": "5h,2a",
+    "poc": "3,1y,2,2n,4,1,1,7,3,26,37,13,g,2",
+    "pod": "8w",
+    "pof": "5q",
+    "pog": "66",
+    "poi": "ac",
+    "pol": "12,s,2n,d,i,7,v,p,w,e,1f,1d,j,u",
+    "pom": "ap",
+    "pon": "22,35,1q,29,1f,2c",
+    "pop": "5v,1b",
+    "por": "1,6,e,9,7,1,1,3,7,1,b,m,1,f,1,h,6,6,c,9,6,g,3,5,5,4,2,4,3,1,3,2,4,1,9,1,c,a,2,5,2,4,3,b,3,6,2,2,6,3,7,2,8,1,a,3,1,1,2,1,2,9,3,1,g,2,5,1,6,5,4,b,4,1,9,1,1,4,4,1,c,4,1,1,4,k,1",
+    "pos": "6,15,a,8,1,1x,l,1a,1l,1,d,l,o,1d,3,1,m,5,5,e,r,2,4",
+    "pot": "b,4c,u,k,2m,18,16",
+    "pox": "z",
+    "ppe": "3x",
+    "ppl": "6b",
+    "pra": "42,o,u,f,5,5",
+    "pre": "e,1u,l,1,1c,f,1j,d,h,a,n,r,i,1,3,2,1e,f,1,1,2,d,2,1,2,6,2,5,j",
+    "pri": "z,31,e,4,12,1r,27,8,3,j,j,9",
+    "pro": "4,6,b,o,7,1,3,7,2,a,9,2,c,j,6,1,4,5,1,1,1,4,9,b,5,1,2,2,6,8,1,c,1,1,1,2,1,3,3,2,2,1,1,1,e,1,6,3,1,p,1,7,1,4,2,5,3,7,1,4,1,3,1,6,1,1,6,9,a,5,3,4,p,b,4,6,7,a,18",
+    "pru": "9u,a",
+    "psa": "g",
+    "psi": "1o,1p,s,4z,2p,4,8",
+    "pso": "w,3m,q,1w,1e,10",
+    "pst": "ag",
+    "pte": "a5",
+    "pti": "x,8,31,y,6m,6,d",
+    "pto": "5a",
+    "ptu": "6j,h",
+    "pub": "64,1,1,v",
+    "pue": "8,f,6,g,c,3,c,4,9,2,j,1,2,8,2,o,1,h,3,f,3,2,3,3,1,2,f,z,8,1,3,b,c,i,p,a,n,n,c,7,7,7,f,g",
+    "pul": "2,1,6,1,2,1,1,1,1,1,1,1,3,8,1,1,1,5,1,1o,2,j,1p,28,29,14,9,1,a,5,7,1,2,h",
+    "pun": "3m,3v,p",
+    "pur": "54,4v",
+    "pus": "3b,p,g,2m,2d,j",
+    "put": "x",
+    "que": "0,2,1,1,2,2,1,1,1,1,1,1,3,1,1,3,1,2,1,1,2,2,4,1,7,1,1,2,5,2,2,1,1,1,3,2,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,2,1,4,6,1,3,2,2,2,1,2,1,2,4,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,2,1,1,1,1,3,1,3,1,1,1,1,1,3,1,1,1,1,3,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,2,1,3,1,2,3,1,1,1,2,2,1,1,1,1,2,2,1,1,1,1,1,1,2,1,1,2,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,4,1,1,1,2,1,1,4,3,1,1,1,1,1,1,1,1,1,1,1,2,1,3,1,1,1,1,1,1,1,4,1,1,1,1,2,1,1,2,1,2,2,2,1,2,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,4,1,1,1,2,1,1,1,2,1,1,2,1,1,1,1,2,1,1,4,1,1,2,2,1,1,2,3,1,3,2,1,2,1,1,2,1,7,2,a,5,1,3,1,1,6,1,1,2,1,3,1,1,1,1,4,1,1,3",
+    "qui": "0,1,e,2,2,8,3,i,9,2,e,g,j,x,3,4,2,11,c,h,2,i,d,9,3,9,g,1,e,d,3,2,1h,2,6,2,1,1,2,2,8,a,h,1,3,1,v,9",
+    "r\nd": "6v,49",
+    "r\ne": "9b",
+    "r\nm": "6r",
+    "r\no": "9h",
+    "r\np": "6e,p,e",
+    "r\nr": "6m",
+    "r (": "1h,24",
+    "r a": "9,z,1,e,1,1t,1i,6,1l,6,3,2,b,b,49,d",
+    "r b": "5q,49,5",
+    "r c": "12,1,e,e,n,15,c,1c,1g,7,2,5,1c,g,4,c,2o,8",
+    "r d": "5,1,6,o,9,1,4,6,4,2,5,1,1,1,1,10,6,7,8,s,1,6,c,7,o,6,3,c,e,3,2,5,6,4,3,2,1,a,7,1,b,4,4,1,9,1,3,2,3,k,1,1,1,l,3,5,1,6,b,2,8,4,w,5,2",
+    "r e": "1o,o,3,j,b,2,9,d,9,7,8,f,5,4,1q,3,e,f,4,k,7,6,d,1,7,z,10,k,2",
+    "r f": "c,6p",
+    "r g": "v,l,g,2q,4l,1d,g",
+    "r h": "54,b,b,2u,w",
+    "r i": "3,k,25,t,4o,3x",
+    "r l": "l,8,9,1,q,7,b,1,p,o,b,6,17,5,4,h,s,v,d,h,1a,b,6,4,g",
+    "r m": "4h,1u,e,e,2z",
+    "r n": "3h",
+    "r o": "3,5,8f,12,1a,8,2,1c",
+    "r p": "2c,37,9,t,x,9,4,19,6,24",
+    "r q": "a,2,o,v,2,1,1,2g,c,3,d,1l,d,1,8,1,12,f,1j",
+    "r r": "16,4r,1,1,24,k,9,1x,2,o",
+    "r s": "a,n,1g,o,1r,2y,s,2x",
+    "r t": "8x",
+    "r u": "1,6,n,7,c,c,12,2i,2,d,e,p,s,a,u,b,4,b,k,6,2,12,d,17",
+    "r v": "7u",
+    "r y": "2f,1r,p,w,n,2l",
+    "r) ": "8w",
+    "r, ": "1m,2,g,1e,3e,3k,2k",
+    "r-b": "aw",
+    "r; ": "41",
+    "ra ": "6,a,i,7,6,5,1,5,1,5,1,k,b,6,7,3,c,2,1,1,5,9,7,1,4,2,9,1,i,5,f,4,g,b,5,a,2,1,c,4,3,6,f,1,1,4,1,b,g,2,4,k,8,9,g,1,1,3,4,m,2,j,f,1,b",
+    "ra)": "8b",
+    "ra,": "7p",
+    "ra.": "f,73,p,18,2u",
+    "rab": "cp",
+    "rac": "b,5,7,4,g,2,h,d,z,8,c,7,4,9,r,i,3,1,a,1,l,7,3,7,4,d,3,1,1,2,7,8,y,7,l,a,5,n,4,g,1,3,2,2,4,6,6,w,1,2",
+    "rad": "1t,n,m,e,q,e,k,v,7,i,a,7,j,2b,14,1i,8",
+    "raf": "be",
+    "rag": "1n,3,1e,2p,m,2j,3v",
+    "rai": "p,3j",
+    "ral": "1,e,5,t,1d,j,3,5,1,3,1,1,1,1,9,1,1,7,8,8,a,v,o,9,4,4,1,3,7,6,5,1,1,j,7,8,h,1,q,6,5,1,4,2,7,6,6,b,h,m",
+    "ram": "f,36,31,j,3h",
+    "ran": "5,o,h,7,q,3,b,a,2,f,a,f,a,m,f,1,1,5,4,2,d,2,8,h,8,9,f,5,8,1,8,4,4,6,3,2,2,1,1,1,1,1,1,3,2,1,f,4,1,2,9,6,4,4,3,e,2,i,a,2,5,5,3,6,5,1,7",
+    "rap": "1o,g,b,2,40,r,20,3i",
+    "raq": "8,j,39",
+    "rar": "y,2v,9,3,1,1,1,4,2,c,3,j,8,9,4,1,1,1,5,4,1,3,2,v,d,3,f,2,2i,1,5,7",
+    "ras": "b,8,k,4,1,6,b,c,2,6,a,d,8,5,1,3,2,5,5,4,2,1,1,1,1,4,1,2,1,7,3,7,2,2,1,4,6,1,1,1,1,5,3,4,1,1,2,5,8,1,4,4,1,1,2,a,2,3,3,5,3,2,1,4,1,1,1,1,3,4,d,1,2,3,8,1,7,i,9,c,4,a,6,4,8,1,7,a,1,1,1,1,1,1,1,1,1,1,1,1,2,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,5,a,c",
+    "rat": "0,8,9,3,1,1,1,2,1,1,1,3,2,2h,5,d,1e,k,1,y,m,1,27,c,b,g,1i,i",
+    "rau": "b7,z",
+    "rav": "b,8,a,2,v,2f,7,c,3,u,15,6,9,1v,k,b,p,7,h,4,d,1",
+    "rax": "g,a6",
+    "ray": "2y,47",
+    "raz": "e,1x,1,1,1,4,1,1,1,8,1,2,5,a,g,2q,d,22,7,1,1,1,v",
+    "rbe": "4z",
+    "rbo": "a3",
+    "rca": "4v,1p,t,18,e,1e,1j,p,2,1",
+    "rce": "bw,f",
+    "rch": "4j,j,4m",
+    "rci": "c,k,12,11,23,2v,j,a,1,u,1,3,1v,1,e,v",
+    "rco": "i,2o,p,4,12,l,16,3d,r",
+    "rcu": "9,9u",
+    "rda": "6i,53,l,9",
+    "rde": "7n,34,m,p",
+    "rdi": "19,5,p,7,1,2,1,1,1,1,1,1,1,1,1,8,1,6,1,4,1,x,2,8,5,18,f,9,6,11,2,1i,d,5,13,d,1g,1,9",
+    "rdo": "1o",
+    "re ": "2,1,1,8,3,1,h,3,s,5,9,1,1,2,3,d,b,2,1,1,k,q,1,a,8,1,1,a,y,e,f,e,n,1,9,1,5,b,7,5,2,1,3,v,a,2,t,b,l,3,3,3,k",
+    "re,": "36,1,5j,1q",
+    "re-": "6y",
+    "re.": "v,1r,5,1,t,1,1j,q,1s,3",
+    "rea": "4,14,1,3,3,1,j,z,s,u,2,a,6,7,7,h,1,5,1a,1l,f,1,a,15,f,18",
+    "reb": "2f,d,q,3,1,1,3,4,5,2,1,6,2,1,4,8,14,p,6k",
+    "rec": "0,b,1,2,w,1,1,8,2,5,1,1,2,1,a,1,3,6,1,1,7,4,h,3,a,a,w,l,9,1,1,7,7,1,x,7,2,3,j,1,1,1,3,9,1,3,1,2,1,1,3,4,5,9,2,1,5,4,l,h,6,h,c,f,9,1,b,7",
+    "red": "5,b,3,z,1,o,1,1,3,8,5,7,8,m,2,3,2,a,8,1u,1,1,a,q,2g,9,7,f,8,1n",
+    "ree": "94,2o",
+    "ref": "16,32,3w",
+    "reg": "z,1f,1,34,67",
+    "rei": "3s,1h,4k",
+    "rej": "98",
+    "rel": "5f,o,2k,9,b,1,h,1n,1,i,1,5",
+    "rem": "2p,4o,2,t,e,2j,j,1,f",
+    "ren": "18,3,i,1k,p,4,k,2,m,6,a,5,a,1b,1,2,1,3,6,2,2,1,1,5,1,1,x,1w,3,4,8,9,1,f",
+    "reo": "3j,l,6z,h,i,h",
+    "rep": "b,2q,9,9,n,i,m,9,9,14,1h,1,2u,l,13",
+    "res": "0,1,7,3,2,1,3,3,1,1,1,1,1,1,1,1,3,2,1,a,2,b,h,3,1,2,5,1,1,e,1,4,4,8,4,1,a,2,1,4,1,8,3,6,6,1,3,r,4,8,b,5,3,1,2,4,2,2,2,k,1,a,d,9,9,1,1,i,1,6,6,m,6,4,7,4,1,6,1,1,2,1,2,9,1,2,7,4,4,1,6,2,b,c,3,b",
+    "ret": "2z,36,1d,2,5,c,2,1,2,1,4",
+    "reu": "4h,t,1t,24",
+    "rev": "14,1,k,2,3,p,1i,2r,14,19,2o,p",
+    "rew": "6x",
+    "rex": "bc",
+    "rfa": "2w",
+    "rfe": "c2,k",
+    "rfi": "9w,4,6,7,y,9,n",
+    "rfo": "cy",
+    "rga": "6,c,1,1,9,7,m,1,a,a,y,1b,l,3d,4,m,5,17,g,1,q,p,2,a",
+    "rge": "16,h,1a,5c",
+    "rgi": "4,x,27,1c,4t,33",
+    "rgl": "5f",
+    "rgo": "1x,58,8",
+    "rhi": "9p",
+    "rht": "6d",
+    "ria": "0,1,2,5,5,1,3,1,2,1,1,1,1,1,1,1,1,1,2,2,a,2,7,9,4,f,1,1,d,1,1,2,2,5,h,4,3,4,2,5,2,3,d,3,4,8,1,2,4,6,1,2,3,1,6,3,3,f,5,1,a,1,3,2,d,9,4,1,1,3,5,3,8,c,5,f,3,3,4,6,4,7,1,4,1,1,1,1,2,3,3,e,4,2,6,5,b,7,l,o",
+    "rib": "4x",
+    "ric": "19,1,m,a,7,2,6,4,a,j,2m,s,1w,a,1,1r,o,7,7",
+    "rid": "37,z,5v,5,2h,1",
+    "rie": "2f,r,1,2,j,3,1w,k,59",
+    "rif": "2p,t",
+    "rig": "1g,v,w,7,a,5,t,1s,e,32,a,b,k",
+    "ril": "2f,6h,1b",
+    "rim": "40,1k,5k,3,1j",
+    "rin": "4,2,1,g,1,3,1,1e,1y,a,4,s,9,r,1,10,7,2,1,1,1,2,1,2,2,3,2,1,1,1,1,1,5,1,1,4,2,n,1,d,8,3,j,c,7,10,j,1,1,j",
+    "rio": "6,d,1,2,1,2,1,1,j,a,4,2,j,n,2,6,r,2,2,2,3,3,8,1,1,3,1,3,1,3,6,2,3,2,e,7,a,2,7,1,1,8,4,6,1,7,2,5,3,7,2,5,9,e,1,3,5,1,8,12,j,f,3,4,1,q,6,9,5,2,m",
+    "rip": "l,14",
+    "rir": "1h,6r,2z",
+    "ris": "r,1l,b,z,7,5u,9,2c,e",
+    "rit": "7,x,2,2,g,1,i,7,1,1,1,u,6,z,1,r,1,15,4,e,1,5,1,1,b,5,5,1,a,e,6,t,z,b,j,k,1a",
+    "riv": "z",
+    "riz": "4,6,a,9,l,2j,9,19,4,16,7,g,4,b,8,c,t,v,5,r,o,x,2,b",
+    "rju": "5s",
+    "rki": "3e",
+    "rla": "5a,21,4a",
+    "rli": "bd",
+    "rma": "h,x,4,2,1,1,8,8,e,1,4,2,3,f,3,c,3,2,g,a,5,b,a,3,2,f,e,1,1,7,k,2,8,6,9,b,1,6,9,4,b,3,i,1,6,6,4,5,6,2,2,1,c,4,1,7,3,a,9,4,2,h,6,o",
+    "rme": "0,3,6,1,8,3,h,1,3,1,2,5,2,u,8,4,3,8,1,8,1,1,3,3,1,1,8,2,2,1,2,1,1,1,4,3,4,1,2,3,1,3,2,1,1,1,2,1,2,1,1,2,4,5,1,3,1,1,4,4,1,1,5,2,h,5,6,2,1,2,1,2,4,5,7,1,5,1,8,3,8,4,6,5,9,o,7,1,8,1,7,5,c,3,c,1,2,7,14,b,4",
+    "rmi": "1e,26,e,c,j,4,1k,t,32",
+    "rmo": "4o,2,r,1,2,3,1,1,1,4,1,3,4,b,20",
+    "rmu": "2v",
+    "rna": "27,h,2,4f,30,1h,p",
+    "rne": "67,6f",
+    "rni": "1q,1z,1a",
+    "rno": "b,8,h,8,t,2,g,d,8,6,3,7,9,2,2,1,5,1,2,1,7,3,7,2,2,5,6,1,1,1,9,4,1,1,2,d,1,8,1,1,2,a,2,e,8,1,m,1,2,b,1,26,8,9,1,1,1,1,1,1,1,1,1,1,1,1,1,2,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,e,1,c,3",
+    "rnu": "4,cc",
+    "ro ": "i,h,t,w,4,a,g,3,1,7,6,7,1,1,3,3,4,5,e,t,3,1,1,1,a,3,6,c,3,a,d,r,3,d,c,1,d,b,c,k,4,3,6,l,1,z,1,a",
+    "ro,": "3u",
+    "ro-": "7c",
+    "ro.": "3n,3,b,1,8,1,4,24,1t,r,z,2y",
+    "rob": "2e,v,b,5,30,14,1c",
+    "roc": "1r,28,4u",
+    "rod": "a,17,14,1b,m,6,2,3,3,l,1,1,1,3,3,5,2,1,1,k,n,4,d,m,4,1,3,9,3,p,2,7,1a,1p",
+    "roe": "16,j,k",
+    "rof": "2q,y,e,7,2c,1k",
+    "rog": "3f,c,1,4,9,1e,12,18",
+    "roh": "19",
+    "roi": "1a,3e,1,s,1,3,9,1,1,5,a,1,1,4e",
+    "roj": "33,1f,h,1x,2h,2,3,b,19,15",
+    "rol": "10,t,g,x,7,g,6,7,14,c,4,h,g,y,1,7,c,d,12,n,1,2,l,17,1",
+    "rom": "b,2,i,d,w,m,1,5,1,w,d,1,2,5,7,6,1,b,1,1,4,a,4,4,8,7,1,1,2,1,6,3,3,2,1,3,f,3,g,4,6,7,5,2,7,o,y,h,3,9,1,n,g",
+    "ron": "0,1,2,e,a,c,17,y,c,c,8,d,1,7,7,1,h,6,h,o,6,4,4,l,4,3,b,14,4,4,h,3,7,h,d,8,2,a,3,4,1,1,1,1,1,1,1,1,t",
+    "rop": "1g,m,1f,1,w,2,6,17,d,9,p,15,2i,r,12,4",
+    "roq": "b0",
+    "ror": "50,5,1x",
+    "ros": "a,9,o,7,7,o,17,8,b,g,8,6,j,h,m,3,4,2,a,b,1,2,3,1,5,6,1,1,2,4,1,f,9,1,1,h,3,1,4,a,9,1,4,5,4,x,j,q,4,1,1",
+    "rot": "1g,n,l,s,9,i,f,j,d,11,5,c,f,c,a,r,1,3,r,4,10,27",
+    "rov": "4,h,o,k,j,3,d,t,5,b,e,p,n,9,e,10,8,c,a,17,11,s",
+    "roy": "1k",
+    "rpa": "5u,4d,20,k,1",
+    "rpe": "8z,2e",
+    "rpi": "6h",
+    "rpl": "69,2g,1u,a",
+    "rpo": "i,1,g,1e,l,2,1,7,1,i,6,j,a,4,7,5,3,j,8,d,f,a,n,9,3,8,2,23,i,5,j",
+    "rpu": "54,4e",
+    "rqu": "8v",
+    "rr,": "ag",
+    "rra": "f,v,1u,h,3k,1t,1o,v,1,1b",
+    "rre": "c,4,s,1,3,j,2,9,8,1,3,v,p,d,1,a,8,1,1,3,b,5,1,a,5,4,6,s,e,o,f,b,5,9,1,3,i,p,o,c,4,13",
+    "rri": "7,z,2,13,3,13,31,1q,c,t,1u,j",
+    "rro": "k,g,a,4,e,w,2c,5,5,x,c,c,7,13,16,9,i,6,2,2c,1,1,a",
+    "rru": "r,21,t,5w,a",
+    "rs-": "7b",
+    "rsa": "1e,56,u,3k",
+    "rse": "1l,2z,q,j,m,1f,3o,1,2,f",
+    "rsi": "6k,o,9,1q,m,d,y,5,c,2,3,6,7",
+    "rso": "c,z,29,9,f,10,1w,1w,z,1b,3,2,f,1,1,1,1,1,1,1,1,4",
+    "rst": "7v,1f",
+    "rta": "15,1i,1,r,1,1a,1e,1,1,i,d,o,5,8,9,j,h,p,z,2,9,j,3,5,5,h",
+    "rte": "6,7,1,i,e,e,2,i,1,1,1,c,1,1,2,2,9,6,e,3,8,g,2,s,2,1j,1,1,3,2,2,4,2,7,4,k,s,a,1,1s,1f,2,l",
+    "rth": "4e",
+    "rti": "10,i,1,14,1,v,6,f,b,2,7,l,5,4,2,1,1,s,5,1,8,4,1,6,3,5,3,1,1,z,h,7,b,w,l,1o,1",
+    "rto": "2b,1a,u,4r,1w",
+    "rtr": "37,1a,r,1,15,i,1,6,1,b,1",
+    "rtu": "s,7e,1,y",
+    "rua": "5j,32,1,33",
+    "ruc": "3,5,2m,6,4e,30,6,8",
+    "rue": "18,n,85",
+    "rug": "9h,a",
+    "rul": "80",
+    "rum": "cx",
+    "run": "r,97",
+    "rup": "n,2,2,13,y,t,a,1,x,2,h,x,a,2,1,1,d,a,1,22,h,9,6,1h",
+    "rur": "6w,2y,a",
+    "rus": "l,1,1,1,1,1,z,7a,1,h,z",
+    "rut": "3h",
+    "ruy": "r,2o,21,5m",
+    "rva": "48,2t,8,40,1d",
+    "rve": "6t",
+    "rvi": "3g,1,1,6,2,2,3,c,2,e,g,1e,6,1,4,d,3,6,13,3s,r",
+    "rvu": "84",
+    "rzu": "cs",
+    "s\na": "ax,1e,1",
+    "s\nb": "9b",
+    "s\nc": "6s",
+    "s\nd": "6q,q",
+    "s\ne": "8c",
+    "s\nh": "9e",
+    "s\ni": "3l",
+    "s\nl": "3b,3r,b",
+    "s\nm": "6n,1s",
+    "s\no": "8e",
+    "s\np": "6f,16",
+    "s\nr": "6j",
+    "s\ns": "8d",
+    "s\nt": "9g",
+    "s (": "1j,a,9,1n,z,3c,s,s,12,9,b,m",
+    "s a": "1,3,1,8,1,e,i,4,n,3,3,2,1,f,4,5,9,1,f,2,n,5,h,2,7,2,2,1,h,k,1,1,5,8,4,1,6,1,7,5,g,1,5,1,c,7,e,4,8,1,a,n,9,8,4,2,4,3,8,1,2,x,4",
+    "s b": "1,u,h,6,1,2,k,v,1f,11,f,p,8,6,1l,m,a,6,d,g,c,c,1g,7",
+    "s c": "1,4,a,3,4,2,o,d,9,7,5,4,1,4,n,1,d,5,1,1,q,1,a,1,5,3,f,4,a,7,h,2,b,8,1,1,5,1,4,12,4,c,1,d,3,2,1,1,2,1,1,a,2,2,2,a,1,5,7,7,3,2,b,k,j,6,2,1",
+    "s d": "2,c,1,2,1,1,2,1,3,1,3,2,5,3,b,7,3,2,3,1,4,1,1,4,4,1,5,4,1,a,4,1,2,1,5,1,2,h,1,2,3,1,1,h,5,5,3,2,4,3,4,2,2,1,2,2,1,7,8,1,6,3,1,8,3,4,5,3,1,1,2,1,8,1,1,2,2,2,2,2,4,2,5,2,1,5,2,2,4,2,5,2,1,4,6,7,1,4,2,1,1,5,2,2,a,5,3,7,1,3,1,2,1,2,4,1,5,1,5,1,2,1,2,5,1,4,9,6,1,2,2,1,3,a,2,1,7",
+    "s e": "d,6,4,2,1,h,3,8,o,3,g,h,1,1,3,c,a,3,8,2,6,b,f,4,2,7,d,4,2,8,1,2,d,c,5,6,1,1,6,b,1,1,1,2,2,3,7,h,5,g,2,1,4,5,1,1,7,1,1,9,8,b,1,3,1,5,1,b,8,1,t",
+    "s f": "5,n,k,2,21,3,6,25,m,3,d,m,j,e,1,7,a,f,m,1,m,9,f,k,b,1,1,c",
+    "s g": "i,1,2k,z,x,2,j,p,1,1,a,b,9,1u,l,g,h,2,b,2,6,6,4",
+    "s h": "1a,4,f,16,q,6,j,c,r,1,2,9,9,7,4,2,1,4,b,g,2,2,2w,q",
+    "s i": "n,d,b,e,p,11,a,w,b,3,h,3,h,t,12,3,1c,3,l,i,1,k,c,q",
+    "s j": "5g",
+    "s l": "i,z,x,2,18,11,5,7,10,j,t,22,10,1,1,1,1,1,1,4,1,1,2,1,1,1,4,1c,1,a,1,2",
+    "s m": "t,19,v,b,7,1,2,6,8,c,f,4,1,k,1,2,1,3,j,5,g,1,2,1,3,1,3,g,f,k,5,3,q,d,4,2,6,2,4,3,4,h,1,2,1d,2",
+    "s n": "5,2w,f,2,8,5,1,3,10,4,2,a,2,3,2,11,1,1f,c,1p,1z,e,1,7,1",
+    "s o": "i,1,4,a,3,b,7,5,1,i,1,q,n,1h,3,6,4,5,1h,e,4,w,2,2,1j,a,l,i,i,9,6,a,2,1,1,1",
+    "s p": "2,1,2,4,1,2,1,1,1,2,1,1,3,5,3,3,k,r,1,h,1,2,4,l,2,c,1,i,1,g,4,1,1,3,3,a,b,1,9,c,p,7,c,d,1,h,t,6,6,a,1,1,8,2,2,b,4,1,4,1,6,5,8,s,6,5,3",
+    "s q": "c,7,4,2,1,1,13,2,8,l,a,6,q,1,e,7,1,2,9,4,2,1,8,6,d,6,1,5,6,9,1,2,2,7,1,1,1,6,1,3,3,1,2,3,5,e,3,e,2,1,1,2,5,r,g,6,e,2,3,b,2,c,2,1,9,f,1",
+    "s r": "0,8,9,3,2,1,2,1,1,1,5,19,b,m,a,14,1,b,6,a,3,17,d,7,7,8,2,1,2,3,2,5,2,1,2,1,1,5,1,4,q,3,1,a,9,c,n,c,6,5,i,1",
+    "s s": "2,3,c,3,2,3,1,1,1f,3,n,1,6,8,o,3,d,d,1,7,6,8,6,k,1,4,b,8,i,1,4,v,c,1,9,3,8,1,3,i,3,3,1,5,5,3,q,d,7,5,3,8,1,7,2,5,5,1,2",
+    "s t": "1z,1,10,5,f,e,i,8,5,3,j,1,1,1,9,m,6,9,2,f,1,1,s,o,1,3,1j,o",
+    "s u": "17,46,25,m,7,4,h,y",
+    "s v": "0,8,9,4,1,1,2,1,1,1,5,d,w,c,8,6,1,2,c,t,b,l,6,1,1g,o,j,c,4,a,8,18,6,7,5,7,1,1p,l",
+    "s y": "c,2,4,4,1,l,4,2,n,i,a,4,1,1,f,4,6,9,2,3,2,a,1,1,2,3,7,9,3,8,1,1,5,a,i,4,5,8,4,9,6,2,8,j,e,4,a,m,5,3,2,2,5,1,1,8,m,1,6,1,3,j,1,2,3,1,b",
+    "s) ": "1e,5,26,58,2,3,i,k,3,z,m",
+    "s),": "3i",
+    "s).": "k,7g",
+    "s, ": "1,3,f,4,l,f,1,1,4,b,5,1,28,7,d,e,3,a,9,c,1,5,7,1,j,2,1,1,3,8,e,10,3,3,8,9,2,4,i,2,3,5,1,3,4,5,b,b,8,g,1,3",
+    "s-d": "7b",
+    "s: ": "4s",
+    "sa\n": "6k,c",
+    "sa ": "0,3,6,a,2,1,2,2,1,4,c,2,b,j,n,8,b,4,5,a,c,5,5,4,1,8,3,8,4,f,7,8,1,5,4,1,4,2,4,1,4,7,9,3,m,3,m,8,i,1,3,4,1,4,1,2,2,1,5,3,6,2,1,4,7,13,g,c,4",
+    "sa)": "1h",
+    "sa,": "19,5j,4i",
+    "sa.": "s",
+    "sac": "2,w,k,6,x,y,31,2v,1d,1r",
+    "sad": "1,f,e,7,1,1,a,1,b,3m,b,2,e,p,s,a,q,f,4,e,1,g,6,2,6,5,4,21,6",
+    "saf": "55",
+    "sah": "cw",
+    "saj": "78",
+    "sal": "5,34,2j,1m,7,t,17,1r,11,3,1,1,b",
+    "sam": "3r,o,6r",
+    "san": "h,8,6,2,2,7,2,y,2,2,1,1,1,9,1,2,1,1,1,4,1,4,2,1,1,1,1,4,3,7,1,9,6,e,l,4,1,1,1,5,i,1,q,7,5,5,5,4,c,3,c,1,7,23,7,19,d,n",
+    "sap": "52",
+    "sar": "8,a,5,d,2z,7,v,1,8,g,h,l,l,s,r,m,2,5,g,3,2,m,i,v",
+    "sas": "5,o,h,4,4,1,q,q,l,6,s,3,r,1,15,2,28,q,4,6,1,1,6,d,i,2,1,u,k,5",
+    "sat": "31,b",
+    "sbe": "13",
+    "sbi": "cl",
+    "sca": "4i,s,1j,e,2a,1,4,7,7,1,4,5,19",
+    "sce": "3z,1,3d,2l,1s",
+    "sch": "aw",
+    "sci": "j,6y,36",
+    "scl": "29,17,8,z,6,1v,m,j",
+    "sco": "3p,34,8,2q,a,5,1o",
+    "scr": "1o,39,3v,1",
+    "scu": "22,8,1,4,7,6,3,q,3,d,d,1,c,3,1,5,r,r,2,1,1,1,2,1,1,1,2,1,j,3,t,8,1j,a,2,c,6",
+    "sde": "1k,d,7,51,k,f,31",
+    "sdr": "v",
+    "se ": "6,4,1,5,1,i,1,g,2,2,1,5,3,1,a,r,3,1,b,7,2,3,3,j,e,3,3,f,3,d,i,n,1,3,9,7,2,1,1,5,6,3,5,6,1,3,7,1,1,1,8,2,7,1,2,8,1,8,e,1,1,4,4,2,5,5,6,2,i,2,3,3,1,2,y,4,1,1,1,6",
+    "se.": "5t,m",
+    "sea": "1o,45,m,1,i,2,c,1w,1y",
+    "seb": "9t,2y,1",
+    "sec": "2o,24,1b,1k,x,1g,2q",
+    "sed": "60,1b,n",
+    "seg": "8n",
+    "sei": "5e",
+    "sel": "bg",
+    "sem": "5e,38,4,g",
+    "sen": "5,t,i,8,i,o,p,s,9,1,1,n,w,1,q,3s,6,d,t,3,2,8,5,1,b",
+    "seo": "6g,w",
+    "sep": "bf",
+    "seq": "60,2,1w,1e",
+    "ser": "x,3b,13,h,z,7,1,1,49,s",
+    "ses": "18,g,3q,5s,e,1,h",
+    "sev": "5s,5v",
+    "sex": "8n,9,1,1,1,2,1,5,1",
+    "sfa": "1n,1e,12",
+    "sfo": "55,6k,16",
+    "sfr": "1,j,4",
+    "sfu": "7t,u,m",
+    "sga": "1s,w,12,2t,a,2,k,1,5i",
+    "sgo": "2f,r,1,2,2i,k",
+    "sha": "bl",
+    "shi": "4p,x,f",
+    "sho": "31",
+    "sia": "h,f,s,d,1,1,1,4,15,a,g,2,1,23,1,1,x,4,p,2,i,4,f,19,6,8,2,8,15,e,6",
+    "sib": "1g,34,2,2a,54",
+    "sic": "1b,a,1,7,1v,1k,e,1i,3,m,b,1,h,1k,4,1,x,c,5,4,4,7,1",
+    "sid": "31,8,2j,16,w,3r,e,2",
+    "sie": "2y,4g,3p,6,1,5",
+    "sif": "91,34",
+    "sig": "3h,2n,1,2z,31",
+    "sii": "18",
+    "sil": "12,3d",
+    "sim": "1a,62,1n,2i",
+    "sin": "5,6,b,9,d,w,s,x,6,7,1,7,e,b,2,4,a,8,f,1,1,2,1,6,8,i,1,1,2,g,4,6,7,5,9,a,e,1f,c,1,1,m,2,1,b,1,1,6,2",
+    "sio": "e,j,1b,l,k,m,m,8,e,5,15,2,8,4,d,4,1,g,2,r,b,1,1,3,2,6,1t,1,1,1,f,1,1,8,1,7,5,1,d,1,1",
+    "sip": "60,b,1n,1y",
+    "sis": "9,1,8,1,9,5,4,1,1,b,4,3,o,h,l,5,8,4,7,8,1,1,7,2,2,1,2,1,1,3,1,5,2,1,2,2,3,7,3,9,2,k,2,9,a,3,1,2,6,3,2,1,1,1,3,6,1,1,9,1,8,1,7,1,i,2,3,9,2,5,2,4,7,3,2,1,4,2,3,1,4,8,3,1,2,1,2,1,2,5,9,3,2,3,9",
+    "sit": "5,1g,4,2a,2,b,i,1,1p,7,u,1h,15,b,2,u,2,1,v,1",
+    "siv": "7,32,4,2,c,1,4,9,f,k,e,a,8,l,1y,14,2,u,8,d,1,1,5,4,4,1,1,2,b,2,1,1",
+    "sjo": "4s",
+    "sli": "3p",
+    "sma": "0,2n,z,6f,6,k,v",
+    "smi": "3r,i,q,17,i,29,1,1,1,1,1,7,1b,2a",
+    "smo": "d,2e,e,1j,t,1,3,1,1,1,1,5,1,6,5,g,2n,27,4,f,3,k,3",
+    "sne": "y",
+    "sni": "aw",
+    "snu": "19",
+    "so\n": "7c,34",
+    "so ": "7,n,2,d,m,6,1a,6,7,b,1,7,9,7,1,v,2,4,1,2,2,3,1,1,6,v,2,a,16,7,1j,10,1,8,1,j",
+    "so)": "7c",
+    "so,": "18,24,3o",
+    "so.": "3s,h,29,46",
+    "sob": "4o,14,4x,2b",
+    "soc": "9l,15,8,b,7,f,2,3,6",
+    "sod": "b8,l,r",
+    "sof": "16,h,a,3",
+    "sol": "4h,z,4,2,1h,37,1",
+    "som": "3k,p,3,3,1s,1,5w",
+    "son": "c,z,1k,j,6,9,f,c,6,i,c,t,r,1w,2a,3,2,f,1,1,1,1,1,1,1,1,4,5",
+    "sop": "2v,2o,2u",
+    "sor": "4i,h,9,1w,3,2b",
+    "sos": "26,q,1,e,e,k,3,3,l,6,n,m,1,4,8,3,g,2,1,1,k,b,5,3,t,m,1,1,e,5,3,22,1",
+    "sot": "10",
+    "spa": "f,1,31,j,d,29,d,6,9,s,1,10,m,a,j,1l,3",
+    "spe": "11,n,5,b,y,33,1p,10,t,n,e,s,1",
+    "spi": "0,8,3,6,3,1,1,1,2,1,1,1,3,2,1,24,8,8,g,2,n,36,1i,b,14,14,12",
+    "spl": "7c,3m,1j",
+    "spm": "8m,33",
+    "spo": "22,35,1q,s,d,9,j,c,1f",
+    "spr": "3t,84",
+    "spu": "x,r,g,u,1m,3o,z,1a,c,e,m",
+    "squ": "26,4,1r,q,1y,1,j,3b,q,h,1,3,1,2",
+    "sre": "bq",
+    "sru": "bq",
+    "ssi": "s",
+    "sta": "1o,9,c,p,1a,2,a,1,13,f,m,5,l,19,1,1,n,c,s,1,b,7,4,1,8,2,1,6,2,2,1,2,2,1,3,9,d,1,7",
+    "ste": "6,d,1q,x,5,5,8,2,2,5,a,2,7,4,1,2,1,1,2,1,1,5,2,3,2,a,4,1,7,2,k,2,1,8,2,3,2,3,4,4,1,1,2,5,1,1,1,h,3,9,2,h,2,8,3,m,e,8,1,c,5,1,1,1,2,2,5,c,2,3,m,2,5,8",
+    "sti": "4,f,4,4,d,1,2,1,1,c,1,2,1,2,3,1,8,1,2,d,1a,6,5,r,2,2,k,j,q,r,c,1,3,9,5,5,9,1,1,1,1,f,y,i,1,1,2,6,1,h,5,h,c,2,4,e",
+    "stl": "aj",
+    "sto": "4,7,8,k,1,1,1,2,h,1,6,1,4,1,1,1,9,j,8,6,3,7,9,2,2,1,5,1,2,1,7,3,7,2,2,5,6,1,1,1,9,4,1,1,2,d,1,8,1,1,2,a,2,e,8,1,m,1,2,b,1,5,p,1c,8,a,1,1,1,1,1,1,1,1,1,1,1,1,2,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,b,4,c",
+    "str": "0,3,5,j,8,5,2,2,3,e,7,6,4,4,f,3,2,4,2,f,6,h,7,11,6,3,12,n,6,o,9,a,1,17,l,6,7,1,a,5,i,4,2,3,8,j",
+    "su ": "3l,1c,2t,1i,3b",
+    "sua": "2v",
+    "sub": "32,15,8",
+    "sud": "9p",
+    "sue": "9,2,2z,a,35,23,44",
+    "suf": "2d,o,2,1n,r,3,b,13,p,l,f,3d,q",
+    "suh": "88",
+    "sul": "z,3p,8,j,1,b,6,49,c,a",
+    "sum": "z,1b,i,t,8g",
+    "sup": "k,5,1,1,x,2,2c,j,5,u,f,a,3n,3,1,d,1u",
+    "sur": "1n,5",
+    "sus": "29,1z,2,6,4,8,2p,1w,2h",
+    "svi": "71,5g",
+    "t d": "bb",
+    "t-m": "3v",
+    "ta\n": "6u",
+    "ta ": "e,4,2,e,7,3,c,3,3,7,4,1,9,5,6,7,3,2,4,1,3,1,1,6,2,1,7,e,1,4,7,6,1,9,7,7,8,d,a,4,8,9,c,4,5,6,a,g,1,1,4,f,2,2,4,5,1,1,k,1,3,d,6,4,1,b,1,2,1,4,5,5,1,4,e,6,9,d",
+    "ta.": "6,n,1f,f,1,2z,1d,2d,1k,d,12,2",
+    "tab": "18,2z,4,14,c,5m,d,r",
+    "tac": "7,a,p,1h,u,f,d,7,9,9,2,3,2,1d,k,1i,g,1,4,8,t,16,2,8,e",
+    "tad": "v,3,d,c,2y,3,m,u,1,1,d,6,c,28,14,5,3,j,1,g,3,2,1,16",
+    "tae": "bm",
+    "tag": "l,7,8y,1,1c",
+    "tal": "1v,1k,5k,8,1b,j,17,e,8",
+    "tam": "s,p,11,2h,1h,2a,23,13,5,o",
+    "tan": "22,7,p,h,t,2,a,3,8,w,c,6,e,8,g,2,p,g,f,1,8,5,2,3,7,3,3,3,2,2,1,2,6,3,m,1,d,4,f,8,3",
+    "tap": "q,o,7x,3m",
+    "taq": "2b,6,4f,4c",
+    "tar": "9,a,1,9,l,2,8,r,h,8,5,2,f,2,3,2,2,8,8,1,1,3,1,1,2,1,3,6,2,3,2,8,a,3,g,3,1,1,a,1,1,g,5,3,6,5,4,4,9,u,x,6,f,5,h,1,5,5,k,c",
+    "tas": "h,f,17,2n,2h,24,p,d,e,b,a,w",
+    "tat": "5o,v,25,1,1",
+    "tax": "3s,91",
+    "tda": "bb",
+    "tdc": "bk",
+    "tdd": "bq",
+    "tdp": "bp",
+    "te\n": "6x,a",
+    "te ": "1,5,5,7,a,4,e,3,4,7,2,3,b,7,2,d,2,2,1,6,1,6,4,6,3,5,b,6,6,1,1,3,2,3,3,9,2,8,5,9,2,2,3,1,9,1,1,n,1,4,1,2,4,1,5,3,2,1,1,1,1,3,7,7,b,3,4,4,7,2,4,1,4,2,1,a,7,1,3,2,2,5,1,4,2,3,4,c,3,1,1,2,2,3,5,1,2,1,3,2,3,5,g,1,4,1,2,d,8",
+    "te,": "c6",
+    "te.": "b,6,21,s,h,u,1v,1i,1v,1a,q,d,j,7",
+    "tea": "63,3q",
+    "teb": "3p,1i,1m,1,3,4,d",
+    "tec": "3g,38,r,1h",
+    "ted": "cj",
+    "tei": "1g,n,2j,j,2m,a,c,23,b",
+    "tej": "a,q,s,7,1,w,4,5,i,t,d,19,b,f,a,8,1,1,1,z,22,g,3,1f",
+    "tel": "w,4,97,6,m",
+    "tem": "j,2s,3,2,8,4,f,2,7,4,1,2,1,1,3,1,5,2,3,2,z,k,e,8,8,15,h,1b,d,6,1,3,2",
+    "ten": "b,3,v,7,o,4,l,j,1a,1,4,2,m,c,9,d,5,1,1,6,2,2,1,c,2,8,h,4,9,9,2,1,9,b,m,2,p,h,2,1,4,1,2,6,4,2,3,8,b",
+    "teo": "1h,4c,m,1,i,7,1,9,1",
+    "tep": "b7",
+    "ter": "6,2,5,1,d,2,7,e,2,9,4,d,1,1,1,1,9,4,1,1,2,1,1,4,9,f,1,2,5,4,1,4,2,2,4,5,7,b,c,6,4,1,m,2,h,4,1,2,1,4,7,8,2,1,6,2,4,4,3,2,8,3,2,2,2,9,2,2,3,2,1,1,5,g,5,1,1,1,1,5,2,1,k,3,1,2,7,7,2,6,o,4,1,2,6,8,3,4",
+    "tes": "n,k,1,1,2,e,6,8,1,2,9,o,5,5,2,i,z,1,2,g,1,1,2,1,7,9,d,f,l,l,1,9,e,5,1,1,1,1,1,a,1,1,x,m,3,6,6,k,10",
+    "tex": "5f",
+    "tez": "7a",
+    "tha": "8d",
+    "ths": "4e",
+    "tia": "m,u,5,p,8,4,8,o,g,9,3,4,1,7,1g,g,3,2,4,2,b,1,g,o,28,3,7,16,2,5",
+    "tib": "44,34,4a,6,1c",
+    "tic": "i,1,8,e,9,4,1,14,1,c,h,c,6,3,4,3,5,1,2,8,2,a,3,5,1,4,5,5,d,5,2,1,4,1,5,1,1,4,1,2,4,1,6,1,1,1,5,3,1,1,b,4,4,2,7,1,4,b,1,2,1,1,1,1,f,4,o,9,3,1,1,1,1,1,1,1,1,1,2,1,1,1,2,1,1,2,1,1,1,6,m,b,1,1,3,b",
+    "tid": "b,23,h,f,1b,5,x,j,5x,r,2",
+    "tie": "b,10,t,16,a,1n,1,27,9,u,a,3n,h",
+    "tif": "4s,d",
+    "tig": "19,2a,6,f,2g,5,q,2b,l,28,1,2",
+    "til": "22,1a,d,h,d,2o,8,1,1,y,8,9,7,g,1c,n,1",
+    "tim": "14,1,k,2,3,p,49,14,33,o,1,c,a,8,g",
+    "tin": "n,k,1,1,g,4,2,8,1,2,1d,7,g,p,2,2,b,g,16,q,m,18,q,4,h,3,e,l,i,9",
+    "tio": "4,1k,8c,8,a,j,1f",
+    "tip": "e,4,i,1,u,y,n,b,w,9,5,e,1,b,j,1,d,4,5,7,b,5,9,o,2,a,r,1,1,t,g,1,4,2,u",
+    "tir": "10,3l,3,1,s,1,3,9,1,1,5,a,1,1,i,f,2t,3,4",
+    "tis": "1,3,1,1,1,1,j,6,2,5,3,6,2,4,1,2,3,2,9,5,2,c,1,1,c,4,t,a,d,8,5,1,3,2,7,1,1,1,1,9,2,1,2,c,d,4,2,7,3,2,1,6,1,3,2,6,4,1,5,1,5,5,a,4,a,6,1,2,d,2,1,g,2,2,2,5,e,5,3,4,3,j,h,a,3,2,1,1,1,1,6,4,9,1",
+    "tit": "1d,2,7,5,2d,u,2l,c,t,m,2,1,g,b,26,p",
+    "tiv": "3,g,o,2,c,i,t,i,i,x,2,2,c,6,2,1,1,b,y,1,h,1,4,1,x,1m,u,8,2,1,7,1,4,6,4,1,5,2,2,6,1,j,7",
+    "tiz": "47",
+    "tle": "aj",
+    "tlp": "bd",
+    "tmi": "2e",
+    "tmo": "2e,1,1,1",
+    "to\n": "5f,1l",
+    "to ": "0,n,9,1,1,6,1,2,2,f,1,2,3,2,6,1,1,6,1,2,6,4,2,5,o,1,2,1,1,4,6,c,3,3,e,4,i,8,2,2,5,6,4,5,1,4,1,2,9,4,5,4,1,2,2,3,4,1,2,c,1,2,3,e,3,2,1,3,2,1,1,4,1,2,1,5,1,6,u,1,9,2,5,1,2,2,5,9,a,3,9,2,6,2,e,1,9",
+    "to)": "8s",
+    "to,": "1a,24,d,2q,6i",
+    "to.": "13,5,j,2,19,53,x,29,l,y",
+    "tob": "78",
+    "toc": "1y,3c,38,2o,1k",
+    "tod": "w,4a,3z",
+    "tof": "a8",
+    "toi": "3b,i,n,1,h,2,b,1,4,5,g,p,1,b,1,2p,1a,b",
+    "tol": "1h",
+    "tom": "14,1,1,j,1,6,1,4,1,2,1v,t,3,9,v,2n,1m,1h,2,1,b,1,1",
+    "ton": "27,1j,6x",
+    "too": "3v",
+    "top": "54,3z,9",
+    "tor": "0,3,1,4,3,5,1,1,1,1,1,1,1,2,1,1,1,3,2,a,1,1,h,b,2,9,k,3,5,6,3,3,3,1,9,2,1,1,1,3,2,1,2,1,7,3,7,2,2,2,1,2,4,2,1,1,1,1,3,3,2,4,1,1,2,3,4,6,1,2,6,1,1,2,6,4,1,1,2,c,8,1,3,c,7,1,2,b,1,1,1g,p,3,4,1,5,5,1,1,1,1,1,1,1,1,1,1,1,1,2,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,b,3,1,c",
+    "tos": "1,q,1,5,6,e,4,2,2,c,3,1,12,1,3,6,y,1,16,1,q,j,6,j,2,v,x,2,3,3,c,3,2,3,3,5,5,5,6,6,1,4,7,n,i,3,2,1",
+    "tot": "cu",
+    "tox": "4o,u,3,3j",
+    "toz": "8u",
+    "tpo": "c2",
+    "tra": "6,2,3,5,3,4,4,g,1,1,5,2,7,3,b,2,6,1,m,8,6,3,2,5,2,7,2,2,1,3,2,1,2,1,7,3,5,1,1,2,2,5,6,1,1,1,3,1,5,4,1,1,2,d,1,4,3,1,1,1,2,4,5,1,2,e,2,1,2,3,1,2,3,1,2,3,2,1,8,1,2,1,2,2,1,4,1,1,6,b,3,1,1,1,1,1,r,q,1,7,1,9,1,1,1,1,1,1,1,1,1,1,1,1,2,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,a,5,7",
+    "tre": "0,f,1,s,3,i,d,4,f,9,r,1l,1y,5,2,n,9,2,n,25,2,h,5,b,2",
+    "tri": "a,u,5,5,2,g,a,11,1a,5,m,1,15,i,1,6,1,8,3,a,m,1,q,2g,d,1,2",
+    "tro": "d,6,g,7,j,4,9,o,1,1,5,o,3,b,3,7,2,3,4,m,q,c,f,2,h,4,7,1,5,1,e,5,n,c,e,u,f,i,2,2,f,2,1,1,1,1,1,1,1,1,m",
+    "tru": "3,5,j,23,6,f,21,3,1v,17,1,1s,6,8,a,n",
+    "ts)": "8x,2,3",
+    "tte": "ac",
+    "tua": "1c,9u,8,2,1,v",
+    "tub": "9,1o,5s,e,8,j,9,k,4",
+    "tud": "7b",
+    "tui": "5n,3",
+    "tum": "3i,5,a,1t,7,1,1,b,1,6,b,1n,20,k,1j",
+    "tun": "6h,r",
+    "tur": "2o,6,2u,5,e,8,4,h,1,c,1,3,d,c,1,c,m,31,g",
+    "tus": "s,20,g,d,1u,1,6v,9",
+    "tvp": "2q",
+    "u c": "7q",
+    "u e": "cj",
+    "u g": "3o",
+    "u o": "a3",
+    "u p": "98",
+    "u s": "3l",
+    "u t": "4x",
+    "u-k": "46",
+    "ua ": "f,70",
+    "uac": "be,2,1,j",
+    "uad": "z,25,l,1a,b,2d,4p",
+    "uaj": "43,3",
+    "ual": "1c,1j,8,1,l,h,1d,1z,6,x,1,1,9,1,1,1,2,1,5,1,1y,j,w",
+    "uan": "a,6,1q,29,1,a,8,1,1,n,x,v,o,6,9,b,f,3,n",
+    "uar": "bl",
+    "uat": "5u",
+    "uba": "47,4w",
+    "ubc": "4f",
+    "ube": "9,5v,1,1,v,2m,4",
+    "ubi": "32,e,38",
+    "ubo": "1x,5s,m,j",
+    "ubr": "10,s,f,65,t,32",
+    "ubu": "83",
+    "uca": "1h,n,3u",
+    "ucc": "3,5,24,o,1o,u,d,4j,6,8",
+    "uce": "a,2f,g,m,z,6,j,2,3,3,3,5,2,1,1,2a,8,9,u,7,t,h,1p",
+    "uch": "10,1v",
+    "uci": "3r,k,o,f",
+    "ucl": "ag",
+    "uco": "j,a,39,6,1,1,5,x,1,46,9,2,j,1w",
+    "ucr": "4x",
+    "uct": "1,2,1e,o,p,2p,7,1o,9,q,1,2y",
+    "ud ": "7b",
+    "ud.": "39,2j,5k",
+    "uda": "1,u,3c",
+    "udi": "5s,6s,d",
+    "udo": "4,2b,12,1,c,e,a,2h,i,y,p,b,3,7,4,o,9,3,5,v,3,k",
+    "ue ": "0,2,1,1,2,2,1,1,1,1,2,3,1,1,3,1,2,1,1,2,2,4,1,7,1,1,2,5,2,2,1,2,3,2,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,2,1,4,6,1,3,4,2,1,2,1,2,4,1,1,1,1,1,1,2,1,1,1,1,1,1,1,2,2,1,1,1,1,3,1,3,1,2,1,1,3,1,1,1,1,3,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,2,1,3,1,2,3,1,1,1,2,2,1,1,1,1,2,2,1,1,1,1,1,1,2,1,1,2,1,1,1,1,2,1,2,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,1,4,1,1,1,2,1,1,4,3,1,2,1,1,1,1,1,1,1,1,2,1,3,1,1,1,1,1,1,1,4,1,1,1,1,3,1,2,1,2,2,2,1,2,1,1,1,1,1,3,1,1,1,1,1,1,1,1,1,1,1,1,4,1,1,1,2,1,1,1,2,1,1,2,2,1,1,2,1,1,4,1,1,2,2,1,1,2,3,1,3,2,1,2,1,1,2,1,7,2,f,1,3,1,1,6,1,1,2,1,3,1,1,1,6,1,3",
+    "ue,": "57,45",
+    "uea": "8,1y,29,8c,6",
+    "uec": "1x,1f",
+    "ued": "8,f,6,g,c,f,d,2,k,2,8,2,o,1,h,i,3,2,3,3,1,2,f,z,8,1,3,4,7,c,i,o,1,x,1d,7,k,b",
+    "uei": "8",
+    "uel": "9,4g,2,1y,1,1r,b,d,17,g,20",
+    "uem": "26,4,1r",
+    "uen": "6,5,1,9,4,m,1,4,2,4,6,2,m,1,m,7,a,12,3,d,b,1,16,5,c,x,2,6,d,7,6,j,2,6,1,6,5,6,1,2,5,f,1j,g,5",
+    "ueo": "d,e,20,1a,2g",
+    "uer": "i,1,g,1c,2,k,1,2,1,1,6,a,9,6,j,2,8,4,7,5,3,r,d,5,a,a,7,g,9,3,4,4,2,1,r,8,7,5,6,7,a,4,i,5,18,6,b,5",
+    "ues": "18,g,7,9,u,r,v,19,m,1,2,2,b,1,4,c,1,1,1,t,t,6,t,h,c,7,7,1,l",
+    "uet": "b2",
+    "uev": "24,af",
+    "uez": "8q",
+    "ufe": "cb",
+    "ufi": "2d,o,2,1n,r,3,b,13,p,l,f,3d,q",
+    "uga": "7c,a,1v,a,1n",
+    "uia": "0,1,g,6s,3h",
+    "uic": "2h",
+    "uid": "f,f,i,9,2,e,z,10,20,k,m,s,s,3,1l,8,1,5,8,11",
+    "uie": "h,71",
+    "uil": "44,z,4,t,2,v,11,2e,a,1,1,2c",
+    "uin": "26,5,1,d,7,1,e,q,e,l,6,o,y,j,z,23",
+    "uir": "46,4h",
+    "uis": "j,3e,1m,1n,t,e,2f,8,1r",
+    "uit": "1,q,4w,3,t,2c,1p,6",
+    "uiz": "ba,h,1,3,1",
+    "uje": "5j,o,26,5,4,b,1,1x,23",
+    "ujo": "3,13,10,6,d,1c,e,3p",
+    "ula": "f,k,m,1,8,2,2,b,5,1,3,1,9,5,3,4,5,9,3,2,3,8,2,1,1,2,a,1,2,6,2,2,3,1,3,b,7,1,1,1,1,3,3,1,1,2,2,3,a,1,1,1,2,5,1,1,1,1,3,1,1,3,1,1,6,3,5,3,1,1,1,b,1,3,1,6,6,7,1,7,1,1,1,2,f,3,9,1,1,e,3,1,5,4,1,2,3,3,1,2,4,2,4,2,k,5,j,i,1,5,3",
+    "ulc": "15,2",
+    "ulg": "79,22,6,j",
+    "uli": "1j,3d,4,f,1,b,6,2c,1,1l,2,1f",
+    "ull": "2v,6n",
+    "ulm": "2,1,6,1,2,1,1,1,1,1,1,1,3,8,1,1,1,5,1,1o,2,28,5l,9,1",
+    "ulo": "9,n,m,1,2,h,8,1,7,4,4,1,c,l,13,8,1j,2,2,1,2,1,1,1,2,1,a,9,3,4,f,i,9,1,1,1,1,8,8,m,1,6,5,6,e,9",
+    "uls": "x,2f,1,m,77,5,7,1,2,h",
+    "ult": "i,d,3,d,c,3,b,l,u,17,1,d,e,8,n,1,d,i,n,1g,6,k,5,2,2,a,a,4,p,n,j",
+    "ulv": "8k",
+    "uma": "c,45,t,1t,1x,h,1f,b,z",
+    "umb": "4d,2m,5c",
+    "ume": "1s,n,r,1,2,9,29,q,1i,2u,24",
+    "umi": "z,1b,i,t,46,4a",
+    "umn": "3p,1i,1m,4,4,d",
+    "umo": "2,e,a,2x,a,1t,7,1,1,b,1,h,1n,20,k,1j",
+    "ump": "24",
+    "umu": "f,1u,r,9,r,1s,1e,m,h,k,17,e,8,1,y,1c",
+    "un ": "g,6,2,6,5,2,l,3,8,4,2,1,m,1,4,h,5,5,f,p,4,1,8,3,d,6,1,7,1,1,1,1,1,4,2,3,7,4,9,5,6,2,4,3,2,3,9,5,b,4,3,1,2,3,3,1,1,1,1,3,1,2,3,1,2,1,2,a,8,3,2,6,4,1,9,3,1,5,1,3,7,1,1,1,5,a,3,9,i",
+    "un.": "o",
+    "una": "1,c,e,5,3,c,2,3,3,1,5,t,8,1,7,o,4,1,2,1,h,b,3,6,1,b,1,1,1,1,2,3,8,6,a,1,3,6,2,b,d,3,5,5,2,3,7,f,a,2,2,1,3,7,1,1,1,1,1,2,6,3,h,3,5,1,6,8,1,3,5,2,1,2,1,3,b,b,a,6,3,7,g,1,7",
+    "unc": "2i,k,d,9,3,3x,5,u,m,p,1d,s,2",
+    "und": "2q",
+    "une": "3b,i,n,c,6,2,b,1,4,5,g,g,1,8,1,3,8,6,1,2j,a,s,5,3",
+    "ung": "9x,9",
+    "uni": "1g,2n,d,4,1,1,2,1,3,6,2,3,2,42,18,m,1",
+    "unm": "i,4j,5v",
+    "uno": "2,3e,9,w,23,e,5,d,8,c,5,m,13",
+    "unt": "3m,4,21,v,1,u,5,k,g,3l,j",
+    "uod": "15",
+    "upa": "b3,h,i",
+    "upc": "2s,t,1a,4i,h,9,6",
+    "upe": "k,5,1,1,x,2,86,4,d,1u",
+    "upo": "n,2,15,21,1,x,j,x,c,1,1,n,1",
+    "upr": "42,j,5,u,f,a",
+    "upt": "6j,h,4q",
+    "upu": "3b,15,2m,2x",
+    "ura": "f,1d,w,6,1,m,j,14,a,9,1,1,4,m,4,h,1,7,2,3,1,3,d,c,1,8,4,1,c,9,2,1,r,2,a,b,11,6,d,g",
+    "ure": "4t,2h,8,2,5,f,2,1,1,3",
+    "urg": "1n",
+    "uri": "n,1s,8,z,3a,m,2,2,5,3,20,a,k,2c",
+    "urm": "2v",
+    "urn": "67",
+    "uro": "1l,1s,4,1,b,3,3,5,2,1,k,1w,3,v,8,4a",
+    "urp": "54",
+    "urr": "c,4,1h,9,17,12,1,a,8,1,1,e,1n,e,o,5,a,b,e,1,3,17,o,1,b,4",
+    "urs": "6k",
+    "urt": "5e,40",
+    "urv": "71,5l",
+    "us\n": "3l",
+    "us ": "l,1,1,2,1,2l,p,g,c,n,1,1m,f,1i,1,f,2,h,i",
+    "us,": "1p",
+    "us.": "ck",
+    "usa": "0,1,2,5,b,3,1,1,1,1,1,3,1,6,1,1,3,1,1,1,4,1,b,e,v,f,1,4,a,3,4,5,2,3,5,4,1,8,3,8,4,5,1,9,1,2,c,1,1,4,4,1,6,4,5,1,6,m,a,2,3,l,1,e,4,8,4,2,1,1,1,4,1,4,1,4,4,4,4,2,3,2,4,u,a,g,5,7,4,7",
+    "usc": "22,8,1,b,12,q,d,3,1,1n,2,1,1,1,2,1,1,1,2,1,j,3,11,19,14",
+    "use": "1o,2n,a,1k,1,5z",
+    "ush": "5m",
+    "usi": "5,52,3e,3s",
+    "uso": "7,4h,x",
+    "usp": "bu",
+    "usq": "by",
+    "uss": "s",
+    "ust": "29,1z,2,a,4n,6,2r,f",
+    "usu": "2v",
+    "uta": "3h,1e,l,3v,2,3,7,3,3,3,2,2,1,2,6,3",
+    "ute": "1g,36,2j,17,3,2,m,2",
+    "uti": "bg",
+    "uto": "x,2e,i,m,1,i,2,b,1,4,5,g,p,1,b,2q,1a,b",
+    "utr": "19,35",
+    "uve": "5b,5",
+    "uy ": "92,o",
+    "uye": "r,f,1q,j,21,2o,2l,d",
+    "uzg": "b9",
+    "v\ni": "2s",
+    "va\n": "5i,13,8,m",
+    "va ": "3,1u,1c,5,1,c,e,1a,1,2,a,t,v,27,2,12,t,6,8,3",
+    "va,": "5j,6o",
+    "va.": "45,q,15,2d,7,2z,h",
+    "vad": "z,27,1,5d,1l,w,8",
+    "vag": "8j,1",
+    "vai": "79,1k",
+    "val": "2i,1,7k,u,13,c",
+    "vam": "bc",
+    "van": "48,6u,3",
+    "vap": "cq",
+    "var": "1a,1p,y,1m,r,1,1j,c,7,3,c",
+    "vas": "26,9,d,4,1,e,a,b,5,e,5,g,6,l,11,j,z,23,5,3,4,17,4",
+    "vat": "71,3b,2a",
+    "ve ": "b,i,2,4,32,4,5f,25,1",
+    "ve.": "4c,5j",
+    "vea": "5b",
+    "vec": "7u,1,9,16,1s",
+    "vei": "5b",
+    "vej": "7i,1,1,2,3,4,2,1,8,1,15",
+    "vel": "v,4,1f,s,1,2f,9",
+    "ven": "1a,u,m,9,2h,1y,z,f,2f,m,q,4,1",
+    "ver": "1e,4,1,1g,k,6,f,13,l,11,4,4,d,23,a,8,7,s,2,m,1,g,g,1",
+    "ves": "j,l,1,g,1,3,1,1,3,p,1l,k,x,17,4,9,o,3,8,1,v,1k,5,2,h,4,16,i",
+    "vhl": "3x",
+    "via": "0,8,9,3,2,1,2,1,1,1,5,64,j,1l,1l,1r,j",
+    "vic": "7e,h,j,3,1,s",
+    "vid": "5,1l,1z,25,49,k,h,7,n,f,4",
+    "vie": "38",
+    "vim": "22,1c,5,8k",
+    "vio": "3g,1,1,6,2,2,3,c,2,e,g,1e,6,1,4,d,3,6,4j,c,r",
+    "vir": "k,1,1,1,1,1,1,n,c,7a,1,h,a,p",
+    "vis": "j,48,1z,5i,d,1,1,1",
+    "vit": "4j,g,1h,r,2,2a,1v,m,7,j",
+    "vo ": "j,j,j,i,1p,4r,20,k,1,b,7,1",
+    "vo,": "7,12,1n",
+    "vo-": "b6,w",
+    "vo.": "17,3q,80",
+    "voc": "4,h,o,k,j,1e,1e,w,e,18,c,a,17,11,s,17",
+    "vol": "4x,1p,1,u,5",
+    "von": "3x",
+    "vos": "4t,b,26,1,2r",
+    "voz": "cv",
+    "vph": "90,h",
+    "vsr": "m",
+    "vul": "2i,1,u,m,1k,31,j,8,6,j",
+    "wer": "6a",
+    "wol": "4c",
+    "xag": "4k,6j",
+    "xan": "a7",
+    "xca": "a5",
+    "xce": "7,n,2f,1v,e,1,6,1,2,2,3,1,1,1,2j,16,u,8,o,h,2,3",
+    "xco": "bj",
+    "xcr": "81,2",
+    "xem": "94",
+    "xia": "z,2t,7k",
+    "xic": "4o,u,3",
+    "xig": "v,4,1e",
+    "xio": "77",
+    "xis": "ct",
+    "xit": "7b",
+    "xpe": "b7",
+    "xpl": "c3",
+    "xpo": "5m,4o,1",
+    "xpr": "bv",
+    "xpu": "x",
+    "xte": "6u,v,4m",
+    "xto": "5f",
+    "xtr": "2p,3j,15,2,q,30,j,g",
+    "xua": "8n,9,1,1,1,2,1,5,1",
+    "xxy": "68",
+    "y a": "2f,e,v,1w,1t,i,3v",
+    "y b": "4s,2d,3g,1d",
+    "y c": "r,1g,q,1,1g,7,4h,3,6,f,3,33",
+    "y d": "18,1,29,w,11,c,q,5,19,24,2,1s",
+    "y e": "0,e,9,t,1m,f,11,4,q,15,1a,v,w,s,2,r,b,i,6",
+    "y f": "3r,7y,3,7",
+    "y g": "45,7,2k,3k",
+    "y h": "1s,5",
+    "y i": "9y",
+    "y j": "b9",
+    "y l": "g,2,2,2,7,h,2,p,v,1,e,7,k,d,8,6,8,b,1,1s,5,1,17,2,f,5,o,2,4,b,m,1,h,u",
+    "y m": "5t,7,f,5,1e,1s",
+    "y n": "5z,3r,i,y",
+    "y o": "j,v,v,16,k,h,3e",
+    "y p": "4,40,2h,4,1v,1b,1e,h,b,8,7",
+    "y q": "c,3l,1m,2p,15",
+    "y r": "b,2o,b,4,20,10,e,4e",
+    "y s": "a,37,5,1i,1s,p,1b,8,w,1a,k",
+    "y t": "8u,1z,a,o,t",
+    "y u": "17,2z,p,1b,5,5k",
+    "y v": "2j,51,4d",
+    "y z": "9n",
+    "y, ": "84,16,5,1n",
+    "y/o": "bb",
+    "yac": "98",
+    "ydi": "8x",
+    "ye ": "r,f,29,21,2o,2y",
+    "yec": "1k,5l",
+    "yen": "2w,7t",
+    "yna": "2y",
+    "yor": "c,3w,2t,43",
+    "yos": "8c",
+    "z (": "7c",
+    "z d": "24,56",
+    "z e": "16",
+    "z o": "ci",
+    "z q": "8q",
+    "z y": "k,9",
+    "za ": "b,1,1j,1,2,1,1b,2,3k,k,4,7,8,1e,2,6,1,d,4,1,1q,c,q",
+    "za.": "a,b,2r,7",
+    "zac": "a,14,2v,27,1v",
+    "zad": "3p,8,9,19,4,16,27,7,1,1r,8,g",
+    "zam": "ch",
+    "zan": "47,2h,1y",
+    "zar": "1o,7l",
+    "zca": "83",
+    "zco": "cp",
+    "zem": "9c",
+    "zga": "b9",
+    "zhe": "3f",
+    "zio": "cr",
+    "zo ": "6u,29,1,1,1,1s",
+    "zo,": "ay",
+    "zo.": "6h",
+    "zoa": "br",
+    "zof": "ba,h,1",
+    "zoi": "8u,31",
+    "zon": "4,a,u,g,n,1,1,1,4,1,1,1,8,1,2,5,a,g,1i,u,t,w,s,4,5,l,9,r,22",
+    "zot": "bw",
+    "zuc": "1h,n",
+    "zue": "cs",
+    "zum": "cb",
+  },
+};
@@ -0,0 +1,107 @@
+// Pócima Salvage - Búsqueda sobre el índice de trigramas
+// Consulta los índices generados por scripts/build-search-index.py
+
+import { IndiceBusqueda, plegadoAcentos } from './busqueda-index';
+
+// Minúsculas y sin acentos (mismo plegado que el script que genera el índice)
+export const plegar = (texto: string): string => {
+  const minusculas = texto.toLowerCase();
+  let resultado = '';
+  for (const ch of minusculas) {
+    resultado += plegadoAcentos[ch] ?? ch;
+  }
+  return resultado;
+};
+
+const trigramasDe = (texto: string): string[] => {
+  const vistos = new Set<string>();
+  for (let i = 0; i + 3 <= texto.length; i++) {
+    vistos.add(texto.slice(i, i + 3));
+  }
+  return [...vistos];
+};
+
+// Listas de posiciones ya decodificadas, por índice
+const decodificadas = new WeakMap<IndiceBusqueda, Map<string, number[]>>();
+
+const posicionesDe = (indice: IndiceBusqueda, trigrama: string): number[] => {
+  let cache = decodificadas.get(indice);
+  if (!cache) {
+    cache = new Map();
+    decodificadas.set(indice, cache);
+  }
+  let posiciones = cache.get(trigrama);
+  if (!posiciones) {
+    posiciones = [];
+    const codificada = indice.trigramas[trigrama];
+    if (codificada) {
+      let actual = 0;
+      for (const delta of codificada.split(',')) {
+        actual += parseInt(delta, 36);
+        posiciones.push(actual);
+      }
+    }
+    cache.set(trigrama, posiciones);
+  }
+  return posiciones;
+};
+
+// Intersección de dos listas crecientes
+const intersectar = (a: number[], b: number[]): number[] => {
+  const resultado: number[] = [];
+  let i = 0;
+  let j = 0;
+  while (i < a.length && j < b.length) {
+    if (a[i] === b[j]) {
+      resultado.push(a[i]);
+      i++;
+      j++;
+    } else if (a[i] < b[j]) {
+      i++;
+    } else {
+      j++;
+    }
+  }
+  return resultado;
+};
+
+/**
+ * Posiciones (en la lista plana del catálogo) de los registros que contienen
+ * la consulta, ordenadas por la suma de los pesos de los campos que coinciden.
+ * Devuelve null si el índice no corresponde al catálogo actual (`huella`
+ * distinta de la del módulo, aunque el número de registros coincida), para
+ * que el llamador use el filtro lineal.
+ */
+export const buscarEnIndice = (indice: IndiceBusqueda, query: string, huella: string): number[] | null => {
+  if (indice.huella !== huella) return null;
+
+  const total = indice.total;
+
+  const q = plegar(query.trim());
+  if (!q) return Array.from({ length: total }, (_, i) => i);
+
+  let candidatos: number[];
+  if (q.length < 3) {
+    candidatos = Array.from({ length: total }, (_, i) => i);
+  } else {
+    const listas = trigramasDe(q)
+      .map(t => posicionesDe(indice, t))
+      .sort((a, b) => a.length - b.length);
+    candidatos = listas[0];
+    for (let i = 1; i < listas.length && candidatos.length > 0; i++) {
+      candidatos = intersectar(candidatos, listas[i]);
+    }
+  }
+
+  const puntuados: [number, number][] = [];
+  for (const posicion of candidatos) {
+    const textos = indice.normalizados[posicion];
+    let puntos = 0;
+    for (let c = 0; c < textos.length; c++) {
+      if (textos[c].includes(q)) puntos += indice.pesos[c];
+    }
+    if (puntos > 0) puntuados.push([puntos, posicion]);
+  }
+  puntuados.sort((a, b) => b[0] - a[0] || a[1] - b[1]);
+  return puntuados.map(([, posicion]) => posicion);
+};
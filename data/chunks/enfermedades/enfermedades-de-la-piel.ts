@@ -0,0 +1,363 @@
+// Generado automáticamente por scripts/build-catalog.py - no editar a mano
+import type { SistemaCorporal } from '../../enfermedades-expandidas';
+
+const sistema: SistemaCorporal = {
+  id: "enfermedades-de-la-piel",
+  nombre: "Enfermedades de la Piel",
+  icono: "🖐️",
+  enfermedades: [
+    {
+      id: "acne",
+      nombre: "Acné",
+      otrosNombres: ["Acné vulgar", "Espinillas", "Barros"],
+      descripcion: "Enfermedad de la piel que ocurre cuando los folículos pilosos se tapan con grasa y células cutáneas muertas.",
+      sintomas: ["Espinillas y puntos negros", "Piel grasa", "Pústulas o granos con pus", "Nódulos y quistes dolorosos bajo la piel"],
+      causas: ["Producción excesiva de sebo por las glándulas sebáceas", "Obstrucción de los folículos pilosos por células muertas y sebo", "Actividad de la bacteria Propionibacterium acnes", "Cambios hormonales, especialmente durante la pubertad y el ciclo menstrual"],
+      sistemaId: "enfermedades-de-la-piel",
+    },
+    {
+      id: "eczema",
+      nombre: "Eczema",
+      otrosNombres: ["Dermatitis atópica", "Eccema"],
+      descripcion: "Afección que hace que la piel se seque, pique e inflame.",
+      sintomas: ["Piel seca y sensible", "Picazón intensa", "Enrojecimiento e inflamación", "Piel escamosa o con costras"],
+      causas: ["Predisposición genética y antecedentes familiares", "Respuesta anormal del sistema inmunitario", "Factores ambientales como alérgenos, irritantes y clima seco"],
+      sistemaId: "enfermedades-de-la-piel",
+    },
+    {
+      id: "dermatitis-de-contacto",
+      nombre: "Dermatitis de contacto",
+      otrosNombres: ["Dermatitis alérgica", "Dermatitis irritante"],
+      descripcion: "Erupción cutánea rojiza que pica y que aparece por contacto directo con una sustancia o por una reacción alérgica a esta.",
+      sintomas: ["Erupción roja en la zona de contacto", "Picazón y ardor intensos", "Ampollas que pueden supurar", "Piel seca, agrietada o escamosa"],
+      causas: ["Contacto directo con una sustancia irritante (jabones, químicos)", "Reacción alérgica a una sustancia (níquel, cosméticos, plantas)"],
+      sistemaId: "enfermedades-de-la-piel",
+    },
+    {
+      id: "urticaria",
+      nombre: "Urticaria",
+      otrosNombres: ["Ronchas", "Habones"],
+      descripcion: "Reacción de la piel que causa ronchas con picazón.",
+      sintomas: ["Ronchas o habones rojos y elevados", "Picazón intensa", "Las ronchas aparecen y desaparecen en horas", "Hinchazón de labios, ojos o garganta (angioedema)"],
+      causas: ["Reacción alérgica a alimentos, medicamentos o picaduras de insectos", "Infecciones virales o bacterianas", "Estrés físico o emocional"],
+      sistemaId: "enfermedades-de-la-piel",
+    },
+    {
+      id: "rosacea",
+      nombre: "Rosácea",
+      otrosNombres: ["Acné rosácea"],
+      descripcion: "Afección que provoca piel rojiza y, a menudo, pequeños bultos llenos de pus en la cara.",
+      sintomas: ["Enrojecimiento persistente en el centro del rostro", "Pequeños vasos sanguíneos visibles (telangiectasias)", "Granos o pústulas similares al acné", "Engrosamiento de la piel, especialmente en la nariz (rinofima)"],
+      causas: ["Predisposición genética", "Anormalidades en los vasos sanguíneos faciales", "Reacción a ácaros microscópicos (Demodex folliculorum)", "Desencadenantes como el sol, el calor, el alcohol y comidas picantes"],
+      sistemaId: "enfermedades-de-la-piel",
+    },
+    {
+      id: "micosis-cutanea",
+      nombre: "Micosis cutánea",
+      otrosNombres: ["Infección por hongos", "Tiña"],
+      descripcion: "Infección de la piel causada por hongos.",
+      sintomas: ["Manchas rojas, escamosas y con picazón", "Forma de anillo con bordes elevados (tiña)", "Piel agrietada o macerada, especialmente entre los dedos", "Cambios en las uñas (engrosamiento, decoloración)"],
+      causas: ["Infección por hongos dermatofitos", "Ambientes cálidos y húmedos que favorecen el crecimiento de hongos", "Contacto directo con una persona o superficie infectada"],
+      sistemaId: "enfermedades-de-la-piel",
+    },
+    {
+      id: "verrugas",
+      nombre: "Verrugas",
+      otrosNombres: ["Verruga vulgar", "Ojo de pescado"],
+      descripcion: "Pequeños crecimientos en la piel causados por el virus del papiloma humano (VPH).",
+      sintomas: ["Pequeñas protuberancias carnosas y granulosas", "Superficie rugosa al tacto", "Pueden aparecer puntos negros (vasos sanguíneos coagulados)", "Generalmente indoloras, pero pueden causar molestias"],
+      causas: ["Infección por el Virus del Papiloma Humano (VPH)", "Contacto directo con la piel de una persona con verrugas", "Sistema inmunitario debilitado"],
+      sistemaId: "enfermedades-de-la-piel",
+    },
+    {
+      id: "psoriasis",
+      nombre: "Psoriasis",
+      otrosNombres: ["Psoriasis en placas"],
+      descripcion: "Enfermedad de la piel que causa un sarpullido con manchas rojas y escamosas que pican, principalmente en las rodillas, los codos, el tronco y el cuero cabelludo.",
+      sintomas: ["Placas rojas cubiertas de escamas plateadas", "Picazón, ardor o dolor en las lesiones", "Piel seca y agrietada que puede sangrar", "Uñas engrosadas, picadas o estriadas"],
+      causas: ["Enfermedad autoinmune que acelera el ciclo de vida de las células de la piel", "Predisposición genética", "Desencadenantes como infecciones, estrés o ciertos medicamentos"],
+      sistemaId: "enfermedades-de-la-piel",
+    },
+    {
+      id: "vitiligo",
+      nombre: "Vitíligo",
+      otrosNombres: ["Leucoderma"],
+      descripcion: "Enfermedad que causa la pérdida de color de la piel en manchas.",
+      sintomas: ["Pérdida de pigmento que resulta en manchas blancas en la piel", "Aparición de canas prematuras en cabello, pestañas o cejas", "Las manchas pueden crecer o extenderse con el tiempo"],
+      causas: ["Enfermedad autoinmune en la que el sistema inmunitario ataca a los melanocitos", "Factores genéticos y hereditarios", "Eventos desencadenantes como estrés, quemaduras solares graves o exposición a químicos"],
+      sistemaId: "enfermedades-de-la-piel",
+    },
+    {
+      id: "melanoma",
+      nombre: "Melanoma",
+      otrosNombres: ["Cáncer de piel"],
+      descripcion: "El tipo más grave de cáncer de piel, que se desarrolla en las células (melanocitos) que producen melanina.",
+      sintomas: ["Aparición de un nuevo lunar o cambio en uno existente", "Asimetría, borde irregular, color variado y diámetro mayor a 6 mm (regla ABCDE)", "Puede causar picazón, sangrado o ulceración"],
+      causas: ["Exposición excesiva a la radiación ultravioleta (UV) del sol o camas de bronceado", "Antecedentes familiares de melanoma", "Tener muchos lunares o lunares atípicos"],
+      sistemaId: "enfermedades-de-la-piel",
+    },
+    {
+      id: "carcinoma-basocelular",
+      nombre: "Carcinoma basocelular",
+      otrosNombres: ["Cáncer de piel no melanoma"],
+      descripcion: "Tipo de cáncer de piel que comienza en las células basales.",
+      sintomas: ["Bulto ceroso o perlado", "Lesión plana, similar a una cicatriz, de color carne o marrón", "Úlcera que sangra, cicatriza y se vuelve a abrir", "Suele aparecer en zonas expuestas al sol"],
+      causas: ["Exposición crónica a la radiación UV del sol", "Piel clara, cabello rubio o rojo y ojos claros", "Sistema inmunitario debilitado"],
+      sistemaId: "enfermedades-de-la-piel",
+    },
+    {
+      id: "carcinoma-espinocelular",
+      nombre: "Carcinoma espinocelular",
+      otrosNombres: ["Carcinoma de células escamosas"],
+      descripcion: "Tipo de cáncer de piel que comienza en las células escamosas.",
+      sintomas: ["Nódulo rojo y firme", "Lesión plana con una superficie escamosa y con costras", "Nueva úlcera o área elevada sobre una cicatriz o úlcera preexistente", "Puede crecer rápidamente y hacer metástasis"],
+      causas: ["Exposición acumulada a la radiación UV", "Exposición a ciertos químicos como el arsénico", "Sistema inmunitario suprimido o trasplante de órganos"],
+      sistemaId: "enfermedades-de-la-piel",
+    },
+    {
+      id: "queratosis-pilaris",
+      nombre: "Queratosis pilaris",
+      otrosNombres: ["Piel de gallina"],
+      descripcion: "Afección cutánea inofensiva que causa pequeñas protuberancias y zonas ásperas.",
+      sintomas: ["Pequeños bultos ásperos, similares a la piel de gallina", "Suelen aparecer en brazos, muslos, mejillas o glúteos", "La piel se siente como papel de lija", "Puede haber enrojecimiento o inflamación leve"],
+      causas: ["Acumulación de queratina que obstruye los folículos pilosos", "Condición genética asociada a la piel seca", "Suele empeorar en climas secos y durante el invierno"],
+      sistemaId: "enfermedades-de-la-piel",
+    },
+    {
+      id: "alopecia-areata",
+      nombre: "Alopecia areata",
+      otrosNombres: ["Pérdida de cabello en parches"],
+      descripcion: "Afección que causa la caída del cabello en pequeñas manchas.",
+      sintomas: ["Pérdida de cabello en parches redondos u ovalados", "Puede afectar el cuero cabelludo, cejas, pestañas y barba", "Piel lisa y sin cicatrices en las áreas de calvicie", "En casos raros, puede progresar a la pérdida total del cabello (alopecia totalis)"],
+      causas: ["Enfermedad autoinmune donde el sistema inmunitario ataca los folículos pilosos", "Predisposición genética", "El estrés severo puede actuar como desencadenante"],
+      sistemaId: "enfermedades-de-la-piel",
+    },
+    {
+      id: "hiperhidrosis",
+      nombre: "Hiperhidrosis",
+      otrosNombres: ["Sudoración excesiva"],
+      descripcion: "Sudoración anormalmente excesiva que no está necesariamente relacionada con el calor o el ejercicio.",
+      sintomas: ["Sudoración excesiva que no está relacionada con el calor o el ejercicio", "Afecta principalmente a palmas, plantas, axilas o cara", "La piel puede volverse blanda, blanca y descamarse", "Interfiere con las actividades diarias"],
+      causas: ["Hiperactividad de las glándulas sudoríparas", "Puede ser una condición hereditaria (hiperhidrosis primaria)", "Causada por otra condición médica o medicamento (hiperhidrosis secundaria)"],
+      sistemaId: "enfermedades-de-la-piel",
+    },
+    {
+      id: "impetigo",
+      nombre: "Impétigo",
+      otrosNombres: ["Infección cutánea bacteriana"],
+      descripcion: "Infección cutánea común y muy contagiosa que afecta principalmente a bebés y niños.",
+      sintomas: ["Llagas rojas que se rompen, supuran y forman una costra de color miel", "Suele aparecer alrededor de la nariz y la boca", "Picazón y dolor leve", "Altamente contagioso"],
+      causas: ["Infección bacteriana de la piel, generalmente por Staphylococcus aureus o Streptococcus pyogenes", "Las bacterias entran a través de cortes, rasguños o picaduras de insectos", "Más común en niños y en condiciones de hacinamiento"],
+      sistemaId: "enfermedades-de-la-piel",
+    },
+    {
+      id: "molusco-contagioso",
+      nombre: "Molusco contagioso",
+      otrosNombres: ["Verrugas de agua"],
+      descripcion: "Infección viral de la piel que produce protuberancias redondas, firmes e indoloras.",
+      sintomas: ["Pequeñas protuberancias redondas, firmes y del color de la piel o rosadas", "Tienen un pequeño hoyuelo o punto en el centro", "Pueden causar picazón o irritación", "Aparecen en cualquier parte del cuerpo"],
+      causas: ["Infección viral causada por un poxvirus", "Se transmite por contacto directo piel con piel o a través de objetos contaminados", "Común en niños, personas con dermatitis atópica y con sistemas inmunitarios debilitados"],
+      sistemaId: "enfermedades-de-la-piel",
+    },
+    {
+      id: "penfigo",
+      nombre: "Pénfigo",
+      otrosNombres: ["Enfermedad ampollosa"],
+      descripcion: "Enfermedad autoinmune que causa ampollas y llagas en la piel o las membranas mucosas.",
+      sintomas: ["Ampollas flácidas y dolorosas en la piel y mucosas (boca, garganta)", "Las ampollas se rompen fácilmente, dejando erosiones que no cicatrizan", "Piel que se desprende al frotarla (signo de Nikolsky positivo)"],
+      causas: ["Enfermedad autoinmune en la que los anticuerpos atacan las proteínas que unen las células de la piel", "Factores genéticos", "Puede ser inducido por ciertos medicamentos"],
+      sistemaId: "enfermedades-de-la-piel",
+    },
+    {
+      id: "dermatitis-seborreica",
+      nombre: "Dermatitis seborreica",
+      otrosNombres: ["Caspa", "Costra láctea"],
+      descripcion: "Afección cutánea común que afecta principalmente al cuero cabelludo y causa manchas escamosas, piel enrojecida y caspa persistente.",
+      sintomas: ["Piel escamosa, amarillenta o blanquecina en zonas grasas (cuero cabelludo, cara, pecho)", "Enrojecimiento y picazón", "Caspa persistente", "En bebés, se conoce como costra láctea"],
+      causas: ["Reacción inflamatoria a un hongo tipo levadura (Malassezia) que vive en la piel", "Producción excesiva de sebo", "Factores hormonales y genéticos"],
+      sistemaId: "enfermedades-de-la-piel",
+    },
+    {
+      id: "liquen-plano",
+      nombre: "Liquen plano",
+      otrosNombres: ["Erupción pruriginosa"],
+      descripcion: "Afección inflamatoria que puede afectar la piel, el cabello, las uñas y las membranas mucosas.",
+      sintomas: ["Pequeñas protuberancias planas, de color púrpura y con picazón", "Aparecen en muñecas, tobillos, espalda baja y genitales", "Líneas blancas finas en las protuberancias (estrías de Wickham)", "Puede afectar las mucosas (boca) y las uñas"],
+      causas: ["Reacción autoinmune o inflamatoria de causa desconocida", "Puede ser desencadenado por infecciones (hepatitis C), alérgenos o medicamentos", "El estrés puede exacerbar los brotes"],
+      sistemaId: "enfermedades-de-la-piel",
+    },
+    {
+      id: "celulitis",
+      nombre: "Celulitis",
+      otrosNombres: ["Infección bacteriana de la piel"],
+      descripcion: "Infección bacteriana de la piel común y potencialmente grave.",
+      sintomas: ["Área de piel roja, hinchada, caliente y dolorosa", "La piel puede tener un aspecto de hoyuelos o cáscara de naranja", "Fiebre y malestar general", "Puede extenderse rápidamente"],
+      causas: ["Infección bacteriana de las capas profundas de la piel (dermis y tejido subcutáneo)", "Generalmente causada por Staphylococcus y Streptococcus", "Las bacterias ingresan por una ruptura en la piel"],
+      sistemaId: "enfermedades-de-la-piel",
+    },
+    {
+      id: "erisipela",
+      nombre: "Erisipela",
+      otrosNombres: ["Infección cutánea superficial"],
+      descripcion: "Infección bacteriana de las capas superiores de la piel.",
+      sintomas: ["Lesión roja, brillante, elevada y bien delimitada", "Sensación de ardor y dolor intenso", "Fiebre alta, escalofríos y malestar", "Afecta con mayor frecuencia las piernas y la cara"],
+      causas: ["Infección bacteriana de las capas superiores de la piel, principalmente por Streptococcus pyogenes", "Entrada de bacterias a través de cortes, úlceras o problemas de drenaje linfático"],
+      sistemaId: "enfermedades-de-la-piel",
+    },
+    {
+      id: "foliculitis",
+      nombre: "Foliculitis",
+      otrosNombres: ["Infección del folículo piloso"],
+      descripcion: "Inflamación de los folículos pilosos, generalmente causada por una infección bacteriana o fúngica.",
+      sintomas: ["Pequeños granos rojos o con punta blanca alrededor de los folículos pilosos", "Picazón o sensibilidad en la zona afectada", "Puede convertirse en úlceras con costras", "Común en áreas de afeitado, fricción o sudoración"],
+      causas: ["Infección o inflamación de los folículos pilosos, a menudo por la bacteria Staphylococcus aureus", "Fricción de la ropa, afeitado o bloqueo de los folículos", "Exposición a agua caliente contaminada (foliculitis de la bañera)"],
+      sistemaId: "enfermedades-de-la-piel",
+    },
+    {
+      id: "forunculos",
+      nombre: "Forúnculos",
+      otrosNombres: ["Abscesos cutáneos"],
+      descripcion: "Infección dolorosa y llena de pus que se forma debajo de la piel cuando las bacterias infectan y inflaman uno o más folículos pilosos.",
+      sintomas: ["Protuberancia roja, hinchada y dolorosa en la piel", "Pus visible en el centro de la protuberancia", "Sensibilidad y dolor en la zona afectada", "Aumento de tamaño del bulto con el tiempo", "Posible desarrollo de fiebre y malestar general", "Calor en la zona afectada"],
+      causas: ["Infección del folículo piloso por la bacteria Staphylococcus aureus", "Fricción o irritación de la piel", "Sistema inmunitario debilitado", "Condiciones de la piel como acné o eczema", "Mala higiene"],
+      sistemaId: "enfermedades-de-la-piel",
+    },
+    {
+      id: "hidradenitis-supurativa",
+      nombre: "Hidradenitis supurativa",
+      otrosNombres: ["Acné inverso"],
+      descripcion: "Enfermedad crónica de la piel que se caracteriza por bultos pequeños y dolorosos debajo de la piel.",
+      sintomas: ["Espinillas negras", "Protuberancias dolorosas del tamaño de un guisante", "Bultos o llagas que supuran", "Túneles que conectan los bultos debajo de la piel"],
+      causas: ["Obstrucción de los folículos pilosos", "Hormonas", "Predisposición genética", "Fumar", "Sobrepeso"],
+      sistemaId: "enfermedades-de-la-piel",
+    },
+    {
+      id: "ictiosis-vulgar",
+      nombre: "Ictiosis vulgar",
+      otrosNombres: ["Piel de pescado"],
+      descripcion: "Afección hereditaria de la piel en la que las células cutáneas muertas se acumulan en escamas gruesas y secas en la superficie de la piel.",
+      sintomas: ["Piel seca y escamosa", "Engrosamiento de la piel", "Picazón leve", "Piel áspera y agrietada", "Aumento de las líneas en las palmas de las manos y plantas de los pies"],
+      causas: ["Mutación genética en el gen que codifica la proteína filagrina", "Herencia autosómica dominante", "Antecedentes familiares de la enfermedad"],
+      sistemaId: "enfermedades-de-la-piel",
+    },
+    {
+      id: "melasma",
+      nombre: "Melasma",
+      otrosNombres: ["Cloasma", "Máscara del embarazo"],
+      descripcion: "Afección cutánea común que causa manchas oscuras y descoloridas en la piel.",
+      sintomas: ["Cambio de color de la piel a un café uniforme", "Manchas oscuras en las mejillas, frente, nariz y labio superior", "Parches oscuros simétricos", "Sufrimiento respecto a la apariencia"],
+      causas: ["Hormonas femeninas estrógeno y progesterona", "Embarazo", "Pastillas anticonceptivas", "Terapia de reemplazo hormonal", "Exposición al sol"],
+      sistemaId: "enfermedades-de-la-piel",
+    },
+    {
+      id: "nevos-melanociticos",
+      nombre: "Nevos melanocíticos",
+      otrosNombres: ["Lunares"],
+      descripcion: "Crecimientos comunes en la piel, generalmente de color marrón o negro.",
+      sintomas: ["Manchas en la piel de color marrón o negruzco", "Lesiones planas o elevadas", "Superficie lisa, rugosa o velluda", "Generalmente asintomáticos", "En raras ocasiones pueden causar picazón, dolor o sangrado"],
+      causas: ["Proliferación benigna de melanocitos", "Mutaciones genéticas somáticas", "Predisposición genética", "Exposición a la radiación ultravioleta del sol"],
+      sistemaId: "enfermedades-de-la-piel",
+    },
+    {
+      id: "pitiriasis-rosada",
+      nombre: "Pitiriasis rosada",
+      otrosNombres: ["Erupción de árbol de Navidad"],
+      descripcion: "Erupción cutánea que generalmente comienza como una mancha grande circular u ovalada en el pecho, el abdomen o la espalda.",
+      sintomas: ["Comienza con una mancha grande y ovalada llamada 'parche heráldico'", "A los pocos días, aparecen manchas más pequeñas en el pecho, espalda y abdomen", "Las lesiones siguen un patrón similar a un 'árbol de Navidad'", "Puede causar picazón leve"],
+      causas: ["Causa exacta desconocida, pero se cree que está relacionada con una infección viral (posiblemente un tipo de herpesvirus)", "No es contagiosa", "Suele resolverse por sí sola en 6-8 semanas"],
+      sistemaId: "enfermedades-de-la-piel",
+    },
+    {
+      id: "prurigo-nodular",
+      nombre: "Prurigo nodular",
+      otrosNombres: ["Dermatitis nodular"],
+      descripcion: "Enfermedad de la piel que se caracteriza por bultos que pican (nódulos) en la piel.",
+      sintomas: ["Nódulos firmes y pruriginosos en la piel", "Picor extremo y persistente", "Piel engrosada o con costras", "Heridas o escoriaciones por rascado", "Sensación de ardor o escozor en la piel", "Nódulos de color piel o marrón rojizo"],
+      causas: ["Función alterada del sistema inmunitario y de los nervios de la piel", "Eccema (dermatitis atópica)", "Enfermedad renal", "Enfermedad hepática", "Diabetes"],
+      sistemaId: "enfermedades-de-la-piel",
+    },
+    {
+      id: "sarna",
+      nombre: "Sarna",
+      otrosNombres: ["Escabiosis"],
+      descripcion: "Afección de la piel que pica causada por un pequeño ácaro excavador llamado Sarcoptes scabiei.",
+      sintomas: ["Picazón intensa, especialmente por la noche", "Erupción con pequeños granos o ampollas", "Líneas finas y onduladas en la piel (túneles del ácaro)", "Afecta pliegues de la piel como muñecas, codos y entre los dedos"],
+      causas: ["Infestación de la piel por el ácaro Sarcoptes scabiei", "El ácaro excava túneles en la capa superior de la piel para poner huevos", "Se transmite por contacto cercano y prolongado con una persona infestada"],
+      sistemaId: "enfermedades-de-la-piel",
+    },
+    {
+      id: "tiña-versicolor",
+      nombre: "Tiña versicolor",
+      otrosNombres: ["Pitiriasis versicolor"],
+      descripcion: "Infección fúngica común de la piel que interfiere con la pigmentación normal de la piel, lo que resulta en pequeñas manchas descoloridas.",
+      sintomas: ["Manchas en la piel más claras o más oscuras que la piel circundante", "Manchas que no se broncean con el sol", "Manchas que pueden ser de color blanco, rosado, rojo o marrón", "Piel escamosa", "Picazón leve"],
+      causas: ["Crecimiento excesivo del hongo Malassezia en la piel", "Clima cálido y húmedo", "Piel grasa", "Sudoración excesiva", "Sistema inmunitario debilitado"],
+      sistemaId: "enfermedades-de-la-piel",
+    },
+    {
+      id: "xantelasma",
+      nombre: "Xantelasma",
+      otrosNombres: ["Depósitos de colesterol"],
+      descripcion: "Depósito amarillento de grasa (lípidos) debajo de la piel, generalmente en o alrededor de los párpados.",
+      sintomas: ["Protuberancias bajo la piel con bordes definidos", "Placas amarillentas en los párpados", "Erupciones cutáneas de diferentes formas", "Nódulos amarillos en los párpados", "Lesiones amarillas o rojizas en los párpados"],
+      causas: ["Niveles altos de colesterol", "Mala alimentación", "Vida sedentaria", "Predisposición genética", "Diabetes"],
+      sistemaId: "enfermedades-de-la-piel",
+    },
+    {
+      id: "dermatofibroma",
+      nombre: "Dermatofibroma",
+      otrosNombres: ["Histiocitoma fibroso"],
+      descripcion: "Bulto pequeño y no canceroso (benigno) que se desarrolla en la piel.",
+      sintomas: ["Pápulas o nódulos pequeños y firmes", "Color rojo amarronado o violáceo", "Prurito o picazón ocasional", "Dolor o sensibilidad al tacto", "Signo del hoyuelo (la lesión se hunde al presionarla)", "Irritación o sangrado por traumatismo menor"],
+      causas: ["Causa desconocida", "Predisposición genética", "Reacción a traumatismos menores (como picaduras de insecto)", "Formación de quistes en folículos pilosos", "Asociación con enfermedades sistémicas (casos raros)"],
+      sistemaId: "enfermedades-de-la-piel",
+    },
+    {
+      id: "granuloma-anular",
+      nombre: "Granuloma anular",
+      otrosNombres: ["Erupción en anillo"],
+      descripcion: "Afección cutánea crónica que causa una erupción en forma de anillo, generalmente en las manos y los pies.",
+      sintomas: ["Erupción elevada o protuberancias en forma de anillo", "Bordes de la erupción circulares o semicirculares", "Malestar o picazón", "Pequeños bultos firmes debajo de la piel"],
+      causas: ["Mordeduras de animales o insectos", "Infecciones como la hepatitis", "Pruebas cutáneas de tuberculina", "Vacunas", "Exposición al sol", "Lesiones cutáneas menores", "Medicamentos", "Diabetes", "Enfermedad de la tiroides"],
+      sistemaId: "enfermedades-de-la-piel",
+    },
+    {
+      id: "queratosis-actinica",
+      nombre: "Queratosis actínica",
+      otrosNombres: ["Queratosis solar"],
+      descripcion: "Mancha áspera y escamosa en la piel que se desarrolla a partir de años de exposición al sol.",
+      sintomas: ["Parche áspero, seco y escamoso en la piel", "Varía en color (rosa, rojo o marrón)", "Suele aparecer en áreas expuestas al sol como cara, cuero cabelludo, manos y brazos", "Considerada una lesión precancerosa"],
+      causas: ["Exposición crónica y a largo plazo a la radiación ultravioleta (UV) del sol", "Más común en personas de piel clara y mayores de 40 años", "Sistema inmunitario debilitado"],
+      sistemaId: "enfermedades-de-la-piel",
+    },
+    {
+      id: "lentigo-solar",
+      nombre: "Lentigo solar",
+      otrosNombres: ["Manchas de la edad", "Manchas hepáticas"],
+      descripcion: "Manchas oscuras en la piel causadas por la exposición al sol.",
+      sintomas: ["Áreas planas y ovaladas de pigmentación intensificada", "Color marrón claro a marrón oscuro", "Aparición en zonas expuestas al sol como el dorso de las manos, los empeines, el rostro, los hombros y la parte alta de la espalda", "Tamaño que varía desde el de una peca hasta aproximadamente 13 mm de diámetro", "Tendencia a agruparse, lo que las hace más notorias"],
+      causas: ["Exposición a la luz ultravioleta (UV) del sol", "Uso de lámparas y camas de bronceado comerciales", "Tener piel clara", "Antecedentes de exposición solar frecuente o intensa o quemaduras de sol"],
+      sistemaId: "enfermedades-de-la-piel",
+    },
+    {
+      id: "poiquilodermia-de-civatte",
+      nombre: "Poiquilodermia de Civatte",
+      otrosNombres: ["Eritrosis coli"],
+      descripcion: "Afección cutánea benigna que afecta principalmente la piel del cuello y el pecho.",
+      sintomas: ["Manchas rojas y marrones", "Piel fina y con aspecto envejecido", "Atrofia cutánea", "Telangiectasias", "Picor o quemazón"],
+      causas: ["Exposición crónica a la radiación ultravioleta (UV)", "Predisposición genética", "Uso de perfumes y cosméticos fotosensibilizantes", "Cambios hormonales relacionados con la edad", "Tabaquismo y contaminación ambiental"],
+      sistemaId: "enfermedades-de-la-piel",
+    },
+    {
+      id: "telangiectasias",
+      nombre: "Telangiectasias",
+      otrosNombres: ["Arañas vasculares"],
+      descripcion: "Pequeños vasos sanguíneos dilatados cerca de la superficie de la piel o las membranas mucosas.",
+      sintomas: ["Vasos sanguíneos pequeños y dilatados en la piel", "Manchas rojas en labios, cara y yemas de los dedos", "Sangrados nasales", "Anemia por deficiencia de hierro", "Falta de aire", "Dolores de cabeza"],
+      causas: ["Envejecimiento", "Problemas genéticos", "Embarazo", "Exposición al sol", "Venas varicosas"],
+      sistemaId: "enfermedades-de-la-piel",
+    },
+  ],
+};
+
+export default sistema;
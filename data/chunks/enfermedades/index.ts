@@ -0,0 +1,54 @@
+// Generado automáticamente por scripts/build-catalog.py - no editar a mano
+// Índice de bloques de enfermedades-expandidas.ts: 13 bloques, 469 registros
+
+import type { SistemaCorporal } from '../../enfermedades-expandidas';
+
+export interface ResumenSistema {
+  id: string;
+  nombre: string;
+  icono: string;
+  total: number;
+}
+
+export const resumenSistemas: ResumenSistema[] = [
+  { id: "sistema-respiratorio", nombre: "Sistema Respiratorio", icono: "🫁", total: 40 },
+  { id: "sistema-digestivo", nombre: "Sistema Digestivo", icono: "🍔", total: 40 },
+  { id: "sistema-cardiovascular", nombre: "Sistema Cardiovascular", icono: "❤️", total: 40 },
+  { id: "sistema-nervioso", nombre: "Sistema Nervioso", icono: "🧠", total: 40 },
+  { id: "sistema-inmunologico", nombre: "Sistema Inmunológico", icono: "🛡️", total: 35 },
+  { id: "sistema-endocrino", nombre: "Sistema Endocrino", icono: "🧬", total: 35 },
+  { id: "sistema-musculoesqueletico", nombre: "Sistema Musculoesquelético", icono: "🦴", total: 40 },
+  { id: "sistema-urinario", nombre: "Sistema Urinario", icono: "💧", total: 30 },
+  { id: "sistema-reproductor", nombre: "Sistema Reproductor", icono: "🧬", total: 35 },
+  { id: "enfermedades-de-la-piel", nombre: "Enfermedades de la Piel", icono: "🖐️", total: 39 },
+  { id: "sistema-linfatico", nombre: "Sistema Linfático", icono: "💧", total: 25 },
+  { id: "trastornos-mentales-emocionales", nombre: "Trastornos Mentales y Emocionales", icono: "🧠", total: 40 },
+  { id: "otorrinolaringologia-oftalmologia", nombre: "Enfermedades de Ojos, Oídos, Nariz y Garganta", icono: "👁️👂👃👄", total: 30 },
+];
+
+export const totalEnfermedades = 469;
+
+// Misma huella que enfermedades-expandidas.ts: los chunks tienen el mismo contenido
+export const huellaEnfermedades = "60dad39b67d7ff44";
+
+const cargadores: Record<string, () => Promise<{ default: SistemaCorporal }>> = {
+  "sistema-respiratorio": () => import("./sistema-respiratorio"),
+  "sistema-digestivo": () => import("./sistema-digestivo"),
+  "sistema-cardiovascular": () => import("./sistema-cardiovascular"),
+  "sistema-nervioso": () => import("./sistema-nervioso"),
+  "sistema-inmunologico": () => import("./sistema-inmunologico"),
+  "sistema-endocrino": () => import("./sistema-endocrino"),
+  "sistema-musculoesqueletico": () => import("./sistema-musculoesqueletico"),
+  "sistema-urinario": () => import("./sistema-urinario"),
+  "sistema-reproductor": () => import("./sistema-reproductor"),
+  "enfermedades-de-la-piel": () => import("./enfermedades-de-la-piel"),
+  "sistema-linfatico": () => import("./sistema-linfatico"),
+  "trastornos-mentales-emocionales": () => import("./trastornos-mentales-emocionales"),
+  "otorrinolaringologia-oftalmologia": () => import("./otorrinolaringologia-oftalmologia"),
+};
+
+// Carga el módulo del bloque sólo cuando se necesita (undefined si el id no existe)
+export const cargarSistema = async (id: string): Promise<SistemaCorporal | undefined> => {
+  const cargar = cargadores[id];
+  return cargar ? (await cargar()).default : undefined;
+};
@@ -0,0 +1,282 @@
+// Generado automáticamente por scripts/build-catalog.py - no editar a mano
+import type { SistemaCorporal } from '../../enfermedades-expandidas';
+
+const sistema: SistemaCorporal = {
+  id: "otorrinolaringologia-oftalmologia",
+  nombre: "Enfermedades de Ojos, Oídos, Nariz y Garganta",
+  icono: "👁️👂👃👄",
+  enfermedades: [
+    {
+      id: "conjuntivitis",
+      nombre: "Conjuntivitis",
+      otrosNombres: ["Ojo rojo", "Inflamación de la conjuntiva"],
+      descripcion: "Inflamación de la conjuntiva, la membrana transparente que recubre el interior de los párpados y la superficie del ojo.",
+      sintomas: ["Enrojecimiento del ojo", "Picazón o ardor ocular", "Secreción acuosa o purulenta", "Sensación de tener arena en el ojo", "Párpados pegados al despertar"],
+      causas: ["Infección viral o bacteriana", "Reacción alérgica (polen, polvo)", "Irritantes químicos (cloro, humo)"],
+      sistemaId: "otorrinolaringologia-oftalmologia",
+    },
+    {
+      id: "cataratas",
+      nombre: "Cataratas",
+      otrosNombres: ["Opacidad del cristalino"],
+      descripcion: "Opacidad del cristalino del ojo, lo que dificulta la visión.",
+      sintomas: ["Visión borrosa o nublada", "Dificultad para ver de noche", "Sensibilidad a la luz y al resplandor", "Percepción de colores atenuada", "Visión doble en un ojo"],
+      causas: ["Envejecimiento natural del cristalino", "Exposición prolongada a la radiación UV", "Diabetes mellitus", "Tabaquismo y consumo de alcohol"],
+      sistemaId: "otorrinolaringologia-oftalmologia",
+    },
+    {
+      id: "glaucoma",
+      nombre: "Glaucoma",
+      otrosNombres: ["Tensión ocular alta"],
+      descripcion: "Enfermedad del ojo que daña el nervio óptico y puede causar ceguera.",
+      sintomas: ["Pérdida gradual de la visión periférica", "Visión de túnel en etapas avanzadas", "Dolor ocular intenso y súbito", "Visión borrosa y halos alrededor de las luces", "Náuseas y vómitos asociados al dolor ocular"],
+      causas: ["Aumento de la presión dentro del ojo (presión intraocular)", "Antecedentes familiares de glaucoma", "Edad avanzada (mayor de 60 años)", "Lesiones oculares o cirugías previas"],
+      sistemaId: "otorrinolaringologia-oftalmologia",
+    },
+    {
+      id: "otitis-media",
+      nombre: "Otitis Media",
+      otrosNombres: ["Infección del oído medio"],
+      descripcion: "Infección del oído medio, el espacio lleno de aire detrás del tímpano.",
+      sintomas: ["Dolor de oído (otalgia)", "Fiebre", "Pérdida de audición temporal", "Supuración de líquido del oído", "Irritabilidad y problemas para dormir en niños"],
+      causas: ["Infección bacteriana o viral, a menudo después de un resfriado", "Disfunción de la trompa de Eustaquio", "Alergias"],
+      sistemaId: "otorrinolaringologia-oftalmologia",
+    },
+    {
+      id: "tinnitus",
+      nombre: "Tinnitus",
+      otrosNombres: ["Zumbido en los oídos", "Acúfenos"],
+      descripcion: "Percepción de un sonido o zumbido en los oídos sin una fuente de sonido externa.",
+      sintomas: ["Percepción de un zumbido, pitido o silbido en los oídos", "Sonido que no proviene de una fuente externa", "Puede ser constante o intermitente", "Dificultad para concentrarse o dormir"],
+      causas: ["Exposición a ruidos fuertes", "Pérdida de audición relacionada con la edad", "Acumulación de cerumen en el oído", "Lesiones en la cabeza o el cuello"],
+      sistemaId: "otorrinolaringologia-oftalmologia",
+    },
+    {
+      id: "amigdalitis",
+      nombre: "Amigdalitis",
+      otrosNombres: ["Infección de las amígdalas", "Anginas"],
+      descripcion: "Inflamación de las amígdalas, dos masas de tejido de forma ovalada situadas a ambos lados de la parte posterior de la garganta.",
+      sintomas: ["Dolor de garganta intenso", "Amígdalas rojas e hinchadas, a veces con placas de pus", "Dificultad o dolor al tragar", "Fiebre y escalofríos", "Mal aliento"],
+      causas: ["Infección viral (causa más común)", "Infección bacteriana (generalmente estreptococo del grupo A)"],
+      sistemaId: "otorrinolaringologia-oftalmologia",
+    },
+    {
+      id: "sinusitis",
+      nombre: "Sinusitis",
+      otrosNombres: ["Infección de los senos paranasales"],
+      descripcion: "Inflamación de los senos paranasales, cavidades llenas de aire en el cráneo.",
+      sintomas: ["Dolor y presión facial (alrededor de ojos, nariz y frente)", "Congestión y secreción nasal espesa (amarilla o verde)", "Pérdida del sentido del olfato y el gusto", "Tos que empeora por la noche", "Mal aliento (halitosis)"],
+      causas: ["Infección viral (resfriado común)", "Infección bacteriana secundaria", "Alergias que causan inflamación", "Pólipos nasales o tabique desviado"],
+      sistemaId: "otorrinolaringologia-oftalmologia",
+    },
+    {
+      id: "faringitis",
+      nombre: "Faringitis",
+      otrosNombres: ["Dolor de garganta"],
+      descripcion: "Inflamación de la faringe, la parte posterior de la garganta.",
+      sintomas: ["Dolor o carraspera en la garganta", "Dificultad para tragar", "Enrojecimiento de la garganta", "Ganglios linfáticos del cuello inflamados"],
+      causas: ["Infecciones virales (resfriado, gripe)", "Infección bacteriana (estreptococo)", "Irritantes como el humo o el aire muy seco"],
+      sistemaId: "otorrinolaringologia-oftalmologia",
+    },
+    {
+      id: "laringitis",
+      nombre: "Laringitis",
+      otrosNombres: ["Inflamación de la laringe"],
+      descripcion: "Inflamación de la laringe, que contiene las cuerdas vocales.",
+      sintomas: ["Ronquera o pérdida de la voz", "Dolor de garganta", "Sensación de cosquilleo o irritación en la garganta", "Tos seca"],
+      causas: ["Infección viral (similar a un resfriado)", "Uso excesivo de la voz (gritar, cantar)", "Irritación por humo o alérgenos", "Reflujo gastroesofágico"],
+      sistemaId: "otorrinolaringologia-oftalmologia",
+    },
+    {
+      id: "rinitis-alergica",
+      nombre: "Rinitis Alérgica",
+      otrosNombres: ["Fiebre del heno"],
+      descripcion: "Reacción alérgica que causa estornudos, congestión nasal y picazón en la nariz.",
+      sintomas: ["Estornudos frecuentes", "Picazón en nariz, ojos, garganta y paladar", "Congestión y secreción nasal acuosa", "Ojos llorosos y enrojecidos"],
+      causas: ["Reacción del sistema inmunitario a alérgenos aéreos", "Polen de árboles, pasto y malezas", "Ácaros del polvo, moho y caspa de animales"],
+      sistemaId: "otorrinolaringologia-oftalmologia",
+    },
+    {
+      id: "desviacion-del-tabique-nasal",
+      nombre: "Desviación del tabique nasal",
+      otrosNombres: ["Tabique desviado"],
+      descripcion: "Desplazamiento del tabique nasal, la pared que divide las fosas nasales.",
+      sintomas: ["Dificultad para respirar por uno o ambos lados de la nariz", "Congestión nasal persistente", "Hemorragias nasales frecuentes", "Dolor facial", "Respiración ruidosa durante el sueño"],
+      causas: ["Condición congénita (presente al nacer)", "Lesión o traumatismo en la nariz"],
+      sistemaId: "otorrinolaringologia-oftalmologia",
+    },
+    {
+      id: "polipos-nasales",
+      nombre: "Pólipos nasales",
+      otrosNombres: ["Tumores benignos en la nariz"],
+      descripcion: "Crecimientos blandos e indoloros en el revestimiento de la nariz o los senos paranasales.",
+      sintomas: ["Congestión nasal crónica", "Disminución o pérdida del sentido del olfato", "Goteo posnasal", "Presión facial o dolor de cabeza", "Ronquidos"],
+      causas: ["Inflamación crónica de la mucosa nasal (asociada a asma o alergias)", "Fibrosis quística", "Sensibilidad a fármacos como la aspirina"],
+      sistemaId: "otorrinolaringologia-oftalmologia",
+    },
+    {
+      id: "vertigo",
+      nombre: "Vértigo",
+      otrosNombres: ["Mareos"],
+      descripcion: "Sensación de que usted o su entorno se mueven o giran.",
+      sintomas: ["Sensación giratoria de que uno mismo o el entorno se mueve", "Pérdida del equilibrio", "Náuseas y vómitos", "Movimientos oculares anormales (nistagmo)"],
+      causas: ["Vértigo posicional paroxístico benigno (VPPB)", "Enfermedad de Meniere", "Neuronitis vestibular (infección viral del oído interno)"],
+      sistemaId: "otorrinolaringologia-oftalmologia",
+    },
+    {
+      id: "enfermedad-de-meniere",
+      nombre: "Enfermedad de Meniere",
+      otrosNombres: ["Hidropesía endolinfática"],
+      descripcion: "Trastorno del oído interno que causa episodios de vértigo, pérdida de audición y tinnitus.",
+      sintomas: ["Episodios recurrentes de vértigo", "Pérdida de audición fluctuante", "Tinnitus (zumbido en el oído)", "Sensación de presión o plenitud en el oído afectado"],
+      causas: ["Acumulación anormal de líquido (endolinfa) en el oído interno", "Factores genéticos y autoinmunes", "Posibles infecciones virales"],
+      sistemaId: "otorrinolaringologia-oftalmologia",
+    },
+    {
+      id: "presbicia",
+      nombre: "Presbicia",
+      otrosNombres: ["Vista cansada"],
+      descripcion: "Pérdida gradual de la capacidad de los ojos para enfocar objetos cercanos.",
+      sintomas: ["Dificultad para enfocar objetos cercanos", "Necesidad de alejar los materiales de lectura", "Fatiga visual o dolores de cabeza al realizar trabajos de cerca", "Visión borrosa a distancia de lectura normal"],
+      causas: ["Pérdida de elasticidad del cristalino del ojo", "Proceso natural de envejecimiento (generalmente a partir de los 40 años)"],
+      sistemaId: "otorrinolaringologia-oftalmologia",
+    },
+    {
+      id: "astigmatismo",
+      nombre: "Astigmatismo",
+      otrosNombres: ["Visión borrosa"],
+      descripcion: "Imperfección en la curvatura de la córnea o el cristalino del ojo.",
+      sintomas: ["Visión borrosa o distorsionada a todas las distancias", "Fatiga visual", "Dolores de cabeza", "Dificultad con la visión nocturna"],
+      causas: ["Curvatura irregular de la córnea o del cristalino", "Puede ser hereditario y estar presente desde el nacimiento"],
+      sistemaId: "otorrinolaringologia-oftalmologia",
+    },
+    {
+      id: "miopia",
+      nombre: "Miopía",
+      otrosNombres: ["Visión corta"],
+      descripcion: "Afección en la que los objetos cercanos se ven con claridad, pero los lejanos se ven borrosos.",
+      sintomas: ["Visión borrosa de los objetos lejanos", "Necesidad de entrecerrar los ojos para ver claramente", "Dolores de cabeza por fatiga visual", "Dificultad para ver al conducir, especialmente de noche"],
+      causas: ["El globo ocular es demasiado largo o la córnea tiene demasiada curvatura", "Factores genéticos y hereditarios", "Realizar trabajos que requieren enfocar la vista de cerca por tiempo prolongado"],
+      sistemaId: "otorrinolaringologia-oftalmologia",
+    },
+    {
+      id: "hipermetropia",
+      nombre: "Hipermetropía",
+      otrosNombres: ["Visión larga"],
+      descripcion: "Afección en la que los objetos lejanos se ven con claridad, pero los cercanos se ven borrosos.",
+      sintomas: ["Visión borrosa de objetos cercanos", "Fatiga visual y cansancio ocular", "Dolores de cabeza después de leer o usar la computadora", "Necesidad de entrecerrar los ojos para enfocar"],
+      causas: ["El globo ocular es demasiado corto o la córnea tiene muy poca curvatura", "Factor hereditario"],
+      sistemaId: "otorrinolaringologia-oftalmologia",
+    },
+    {
+      id: "estrabismo",
+      nombre: "Estrabismo",
+      otrosNombres: ["Ojos bizcos"],
+      descripcion: "Afección en la que los ojos no se alinean correctamente.",
+      sintomas: ["Ojos bizcos", "Visión doble", "Ojos que no se alinean en la misma dirección", "Movimientos oculares descoordinados", "Pérdida de la visión o de la percepción de profundidad"],
+      causas: ["Problemas con el control muscular de los ojos", "Antecedentes familiares", "Hipermetropía", "Ambliopía", "Lesión cerebral traumática"],
+      sistemaId: "otorrinolaringologia-oftalmologia",
+    },
+    {
+      id: "ojo-seco",
+      nombre: "Ojo seco",
+      otrosNombres: ["Queratoconjuntivitis seca"],
+      descripcion: "Afección en la que los ojos no producen suficientes lágrimas o las lágrimas se evaporan demasiado rápido.",
+      sintomas: ["Sensación de ardor, picazón o arenilla en los ojos", "Enrojecimiento ocular", "Visión borrosa, especialmente al final del día", "Sensibilidad a la luz"],
+      causas: ["Producción insuficiente de lágrimas", "Mala calidad de las lágrimas (evaporación rápida)", "Envejecimiento, cambios hormonales y factores ambientales (viento, aire acondicionado)"],
+      sistemaId: "otorrinolaringologia-oftalmologia",
+    },
+    {
+      id: "chalazion",
+      nombre: "Chalazión",
+      otrosNombres: ["Quiste de párpado"],
+      descripcion: "Pequeño bulto en el párpado causado por una glándula sebácea bloqueada.",
+      sintomas: ["Bulto no doloroso en el párpado, que crece lentamente", "Visión borrosa si el bulto es grande y presiona el ojo", "Hinchazón leve del párpado"],
+      causas: ["Obstrucción e inflamación de una glándula de Meibomio (productora de grasa) en el párpado"],
+      sistemaId: "otorrinolaringologia-oftalmologia",
+    },
+    {
+      id: "orzuelo",
+      nombre: "Orzuelo",
+      otrosNombres: ["Infección del párpado"],
+      descripcion: "Infección bacteriana de una glándula sebácea en el párpado.",
+      sintomas: ["Bulto rojo y doloroso en el borde del párpado", "Hinchazón del párpado", "Sensibilidad a la luz", "Lagrimeo"],
+      causas: ["Infección bacteriana (generalmente estafilococos) de una glándula sebácea en el párpado", "Obstrucción de la glándula"],
+      sistemaId: "otorrinolaringologia-oftalmologia",
+    },
+    {
+      id: "epistaxis",
+      nombre: "Epistaxis",
+      otrosNombres: ["Hemorragia nasal"],
+      descripcion: "Sangrado de la nariz.",
+      sintomas: ["Sangrado por una o ambas fosas nasales", "Puede ser un goteo ligero o un flujo abundante"],
+      causas: ["Aire seco que irrita las membranas nasales", "Hurgarse la nariz o sonarse con fuerza", "Traumatismos nasales menores o hipertensión arterial"],
+      sistemaId: "otorrinolaringologia-oftalmologia",
+    },
+    {
+      id: "anosmia",
+      nombre: "Anosmia",
+      otrosNombres: ["Pérdida del olfato"],
+      descripcion: "Pérdida total o parcial del sentido del olfato.",
+      sintomas: ["Pérdida total del olfato", "Cambio en el gusto de los alimentos", "Congestión nasal", "Secreción nasal"],
+      causas: ["Infecciones de los senos paranasales (sinusitis)", "Resfriado común", "Alergias", "Pólipos nasales", "Lesiones en la cabeza"],
+      sistemaId: "otorrinolaringologia-oftalmologia",
+    },
+    {
+      id: "disfonia",
+      nombre: "Disfonía",
+      otrosNombres: ["Ronquera"],
+      descripcion: "Alteración de la calidad de la voz.",
+      sintomas: ["Ronquera", "Debilidad o pérdida de la voz", "Voz quebrada, temblorosa, tensa o forzada", "Sensación de cosquilleo y aspereza en la garganta", "Dolor de garganta", "Tos seca"],
+      causas: ["Laringitis", "Alergias", "Consumo de alcohol y tabaco", "Uso excesivo de la voz", "Reflujo gastroesofágico", "Estrés y ansiedad", "Enfermedades neurológicas"],
+      sistemaId: "otorrinolaringologia-oftalmologia",
+    },
+    {
+      id: "apnea-del-sueno",
+      nombre: "Apnea del sueño",
+      otrosNombres: ["SAHS"],
+      descripcion: "Trastorno del sueño en el que la respiración se detiene y comienza repetidamente.",
+      sintomas: ["Ronquidos fuertes", "Pausas en la respiración durante el sueño", "Despertar abrupto con falta de aire", "Somnolencia diurna excesiva", "Dolor de cabeza matutino"],
+      causas: ["Obstrucción de las vías respiratorias superiores durante el sueño", "Obesidad y exceso de tejido en la garganta", "Anatomía de las vías respiratorias"],
+      sistemaId: "otorrinolaringologia-oftalmologia",
+    },
+    {
+      id: "cerumen-impactado",
+      nombre: "Cerumen impactado",
+      otrosNombres: ["Tapón de cera"],
+      descripcion: "Acumulación de cera en el oído que bloquea el canal auditivo.",
+      sintomas: ["Dolor de oído", "Sensación de inflamación en el oído", "Zumbido o ruidos en los oídos (tinnitus)", "Pérdida auditiva", "Mareos", "Picazón en el oído"],
+      causas: ["Acumulación de cera", "Endurecimiento de la cera", "Uso de hisopos de algodón", "Conducto auditivo externo muy estrecho", "Abundantes pelos en el conducto auditivo externo"],
+      sistemaId: "otorrinolaringologia-oftalmologia",
+    },
+    {
+      id: "perforacion-del-timpano",
+      nombre: "Perforación del tímpano",
+      otrosNombres: ["Tímpano roto"],
+      descripcion: "Agujero o desgarro en el tímpano.",
+      sintomas: ["Dolor de oído que puede desaparecer rápidamente", "Secreción de líquido claro, purulento o con sangre", "Pérdida de audición", "Zumbido en los oídos (tinnitus)", "Vértigo o sensación de mareo"],
+      causas: ["Infección del oído medio", "Traumatismo directo en el oído", "Barotrauma por cambios de presión", "Trauma acústico por ruidos fuertes"],
+      sistemaId: "otorrinolaringologia-oftalmologia",
+    },
+    {
+      id: "laberintitis",
+      nombre: "Laberintitis",
+      otrosNombres: ["Infección del oído interno"],
+      descripcion: "Inflamación del laberinto, una parte del oído interno.",
+      sintomas: ["Vértigo severo", "Pérdida de audición", "Zumbido en los oídos (tinnitus)", "Náuseas y vómitos"],
+      causas: ["Infección viral o bacteriana del oído interno", "Reactivación de un virus latente"],
+      sistemaId: "otorrinolaringologia-oftalmologia",
+    },
+    {
+      id: "neuritis-vestibular",
+      nombre: "Neuritis vestibular",
+      otrosNombres: ["Inflamación del nervio vestibular"],
+      descripcion: "Inflamación del nervio vestibular, que envía información sobre el equilibrio al cerebro.",
+      sintomas: ["Vértigo repentino y severo", "Mareo", "Náuseas y vómitos", "Problemas de equilibrio", "Dificultad para caminar"],
+      causas: ["Infección viral", "Inflamación del nervio vestibular"],
+      sistemaId: "otorrinolaringologia-oftalmologia",
+    },
+  ],
+};
+
+export default sistema;
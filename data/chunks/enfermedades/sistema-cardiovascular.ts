@@ -0,0 +1,372 @@
+// Generado automáticamente por scripts/build-catalog.py - no editar a mano
+import type { SistemaCorporal } from '../../enfermedades-expandidas';
+
+const sistema: SistemaCorporal = {
+  id: "sistema-cardiovascular",
+  nombre: "Sistema Cardiovascular",
+  icono: "❤️",
+  enfermedades: [
+    {
+      id: "hipertension-arterial",
+      nombre: "Hipertensión Arterial",
+      otrosNombres: ["Presión arterial alta"],
+      descripcion: "Afección en la que la presión de la sangre hacia las paredes de la arteria es demasiado alta.",
+      sintomas: ["Dolor de cabeza", "Mareos", "Zumbido en los oídos", "Visión borrosa", "Hemorragias nasales"],
+      causas: ["Factores genéticos y hereditarios", "Estilo de vida sedentario y obesidad", "Dieta alta en sodio y bajo potasio", "Consumo excesivo de alcohol y tabaco"],
+      sistemaId: "sistema-cardiovascular",
+    },
+    {
+      id: "ateroesclerosis",
+      nombre: "Ateroesclerosis",
+      otrosNombres: ["Arterioesclerosis"],
+      descripcion: "Acumulación de grasas, colesterol y otras sustancias en las paredes de las arterias.",
+      sintomas: ["Dolor en el pecho (angina)", "Falta de aliento", "Dolor en las piernas al caminar", "Debilidad o entumecimiento súbito", "Dificultad para hablar"],
+      causas: ["Acumulación de colesterol y grasas en las arterias", "Presión arterial alta", "Tabaquismo", "Diabetes y resistencia a la insulina"],
+      sistemaId: "sistema-cardiovascular",
+    },
+    {
+      id: "cardiopatia-isquemica",
+      nombre: "Cardiopatía Isquémica",
+      otrosNombres: ["Enfermedad coronaria"],
+      descripcion: "Estrechamiento de las arterias coronarias, que suministran sangre al músculo cardíaco.",
+      sintomas: ["Dolor opresivo en el pecho (angina)", "Falta de aire, especialmente con el esfuerzo", "Fatiga extrema", "Sudoración fría y náuseas"],
+      causas: ["Ateroesclerosis (estrechamiento de las arterias coronarias)", "Formación de coágulos sanguíneos", "Espasmo de una arteria coronaria"],
+      sistemaId: "sistema-cardiovascular",
+    },
+    {
+      id: "infarto-de-miocardio",
+      nombre: "Infarto de Miocardio",
+      otrosNombres: ["Ataque al corazón"],
+      descripcion: "Muerte del músculo cardíaco por la falta de irrigación sanguínea.",
+      sintomas: ["Dolor intenso y prolongado en el pecho", "Dolor que se irradia al brazo izquierdo, mandíbula o espalda", "Sudoración profusa y fría", "Dificultad para respirar", "Mareo o desmayo"],
+      causas: ["Obstrucción total de una arteria coronaria por un coágulo", "Ateroesclerosis severa", "Consumo de drogas como la cocaína"],
+      sistemaId: "sistema-cardiovascular",
+    },
+    {
+      id: "angina-de-pecho",
+      nombre: "Angina de Pecho",
+      otrosNombres: ["Angor pectoris"],
+      descripcion: "Dolor en el pecho provocado por la reducción del flujo sanguíneo al corazón.",
+      sintomas: ["Presión o dolor en el centro del pecho", "Sensación de opresión o ardor", "Dolor que aparece con el esfuerzo y se alivia con el reposo", "Falta de aliento"],
+      causas: ["Reducción del flujo sanguíneo al músculo cardíaco", "Ateroesclerosis en las arterias coronarias", "Anemia severa"],
+      sistemaId: "sistema-cardiovascular",
+    },
+    {
+      id: "insuficiencia-cardiaca",
+      nombre: "Insuficiencia Cardíaca",
+      otrosNombres: ["Fallo cardíaco"],
+      descripcion: "El corazón no puede bombear sangre rica en oxígeno de manera eficiente al resto del cuerpo.",
+      sintomas: ["Dificultad para respirar (disnea)", "Hinchazón (edema) en piernas, tobillos y pies", "Fatiga y debilidad", "Tos persistente o sibilancias", "Aumento rápido de peso"],
+      causas: ["Daño al músculo cardíaco por infartos previos", "Hipertensión arterial no controlada", "Enfermedades de las válvulas cardíacas", "Cardiomiopatías"],
+      sistemaId: "sistema-cardiovascular",
+    },
+    {
+      id: "arritmia",
+      nombre: "Arritmia",
+      otrosNombres: ["Latidos cardíacos irregulares"],
+      descripcion: "Problema con la velocidad o el ritmo de los latidos del corazón.",
+      sintomas: ["Palpitaciones (sensación de que el corazón late rápido o irregular)", "Mareos o aturdimiento", "Desmayo (síncope)", "Falta de aliento", "Dolor en el pecho"],
+      causas: ["Señales eléctricas anormales en el corazón", "Cardiopatía isquémica o infarto previo", "Desequilibrios de electrolitos", "Estrés o consumo de estimulantes"],
+      sistemaId: "sistema-cardiovascular",
+    },
+    {
+      id: "fibrilacion-auricular",
+      nombre: "Fibrilación Auricular",
+      otrosNombres: ["FA"],
+      descripcion: "Ritmo cardíaco irregular y a menudo rápido que puede aumentar el riesgo de accidentes cerebrovasculares.",
+      sintomas: ["Latidos cardíacos rápidos e irregulares", "Palpitaciones intensas", "Debilidad y fatiga", "Mareos y confusión", "Dificultad para respirar"],
+      causas: ["Hipertensión arterial crónica", "Enfermedad de las arterias coronarias", "Anomalías de las válvulas cardíacas", "Enfermedad tiroidea (hipertiroidismo)"],
+      sistemaId: "sistema-cardiovascular",
+    },
+    {
+      id: "bradicardia",
+      nombre: "Bradicardia",
+      otrosNombres: ["Ritmo cardíaco lento"],
+      descripcion: "Frecuencia cardíaca más lenta de lo normal.",
+      sintomas: ["Latidos cardíacos lentos (menos de 60 por minuto)", "Fatiga y falta de energía", "Mareos o desmayos", "Confusión o problemas de memoria", "Dificultad para respirar durante el ejercicio"],
+      causas: ["Envejecimiento del sistema eléctrico del corazón", "Daño al tejido cardíaco por enfermedad o infarto", "Hipotiroidismo", "Uso de ciertos medicamentos (betabloqueantes)"],
+      sistemaId: "sistema-cardiovascular",
+    },
+    {
+      id: "taquicardia",
+      nombre: "Taquicardia",
+      otrosNombres: ["Ritmo cardíaco rápido"],
+      descripcion: "Frecuencia cardíaca más rápida de lo normal.",
+      sintomas: ["Latidos cardíacos rápidos (más de 100 por minuto en reposo)", "Palpitaciones", "Aturdimiento o mareo", "Falta de aliento", "Dolor en el pecho"],
+      causas: ["Estrés, ansiedad o miedo", "Fiebre o deshidratación", "Consumo de cafeína, alcohol o nicotina", "Anemia o hipertiroidismo"],
+      sistemaId: "sistema-cardiovascular",
+    },
+    {
+      id: "enfermedad-valvular-cardiaca",
+      nombre: "Enfermedad Valvular Cardíaca",
+      otrosNombres: ["Valvulopatía"],
+      descripcion: "Una o más de las válvulas del corazón no funcionan correctamente.",
+      sintomas: ["Soplo cardíaco detectado por un médico", "Falta de aliento", "Hinchazón de tobillos y pies", "Dolor en el pecho", "Fatiga y mareos"],
+      causas: ["Defectos cardíacos congénitos", "Fiebre reumática en la infancia", "Endocarditis (infección de las válvulas)", "Envejecimiento y calcificación de las válvulas"],
+      sistemaId: "sistema-cardiovascular",
+    },
+    {
+      id: "endocarditis",
+      nombre: "Endocarditis",
+      otrosNombres: ["Infección del endocardio"],
+      descripcion: "Infección del revestimiento interno de las cámaras y válvulas del corazón.",
+      sintomas: ["Fiebre y escalofríos", "Fatiga extrema", "Sudores nocturnos", "Soplo cardíaco nuevo o cambiante", "Pequeñas manchas en la piel, uñas o ojos"],
+      causas: ["Infección bacteriana o fúngica del revestimiento interno del corazón", "Uso de drogas intravenosas con agujas contaminadas", "Válvulas cardíacas dañadas o artificiales"],
+      sistemaId: "sistema-cardiovascular",
+    },
+    {
+      id: "miocarditis",
+      nombre: "Miocarditis",
+      otrosNombres: ["Inflamación del miocardio"],
+      descripcion: "Inflamación de la capa media de la pared del corazón.",
+      sintomas: ["Dolor en el pecho", "Fatiga", "Falta de aliento", "Palpitaciones o ritmo cardíaco anormal", "Hinchazón en las piernas"],
+      causas: ["Infección viral (como el virus de la gripe o el COVID-19)", "Reacción a un medicamento o droga", "Enfermedades autoinmunes"],
+      sistemaId: "sistema-cardiovascular",
+    },
+    {
+      id: "pericarditis",
+      nombre: "Pericarditis",
+      otrosNombres: ["Inflamación del pericardio"],
+      descripcion: "Inflamación de la membrana delgada en forma de saco que rodea el corazón.",
+      sintomas: ["Dolor agudo y punzante en el pecho, que empeora al respirar hondo", "Fiebre baja", "Debilidad y fatiga", "Tos seca"],
+      causas: ["Infección viral", "Ataque cardíaco o cirugía cardíaca", "Enfermedades autoinmunes como el lupus", "Lesión en el pecho"],
+      sistemaId: "sistema-cardiovascular",
+    },
+    {
+      id: "cardiomiopatia",
+      nombre: "Cardiomiopatía",
+      otrosNombres: ["Miocardiopatía"],
+      descripcion: "Enfermedad del músculo cardíaco que dificulta el bombeo de sangre.",
+      sintomas: ["Falta de aliento con el esfuerzo o en reposo", "Hinchazón de las piernas y el abdomen", "Fatiga", "Latidos cardíacos irregulares", "Mareos y desmayos"],
+      causas: ["Factores genéticos y hereditarios", "Hipertensión arterial prolongada", "Daño cardíaco por un infarto", "Consumo excesivo de alcohol"],
+      sistemaId: "sistema-cardiovascular",
+    },
+    {
+      id: "aneurisma-aortico",
+      nombre: "Aneurisma Aórtico",
+      otrosNombres: ["Dilatación de la aorta"],
+      descripcion: "Ensanchamiento o abombamiento anormal de la arteria aorta.",
+      sintomas: ["A menudo asintomático hasta que se rompe", "Dolor profundo y persistente en el abdomen o la espalda", "Sensación de pulso cerca del ombligo", "Dolor súbito e intenso si se rompe"],
+      causas: ["Ateroesclerosis", "Hipertensión arterial", "Tabaquismo", "Factores genéticos (Síndrome de Marfan)"],
+      sistemaId: "sistema-cardiovascular",
+    },
+    {
+      id: "diseccion-aortica",
+      nombre: "Disección Aórtica",
+      otrosNombres: ["Rotura de la aorta"],
+      descripcion: "Desgarro en la capa interna de la arteria aorta.",
+      sintomas: ["Dolor súbito y desgarrador en el pecho o la espalda", "Pérdida del conocimiento", "Dificultad para respirar", "Debilidad o parálisis en un lado del cuerpo"],
+      causas: ["Hipertensión arterial crónica y mal controlada", "Aneurisma aórtico preexistente", "Síndrome de Marfan u otros trastornos del tejido conectivo"],
+      sistemaId: "sistema-cardiovascular",
+    },
+    {
+      id: "enfermedad-arterial-periferica",
+      nombre: "Enfermedad Arterial Periférica",
+      otrosNombres: ["EAP"],
+      descripcion: "Estrechamiento de las arterias que reducen el flujo sanguíneo a las extremidades.",
+      sintomas: ["Dolor o calambres en las piernas al caminar (claudicación)", "Entumecimiento o debilidad en las piernas", "Piel fría en los pies", "Llagas que no cicatrizan en pies o piernas"],
+      causas: ["Ateroesclerosis en las arterias de las extremidades", "Tabaquismo", "Diabetes", "Hipertensión y colesterol alto"],
+      sistemaId: "sistema-cardiovascular",
+    },
+    {
+      id: "trombosis-venosa-profunda",
+      nombre: "Trombosis Venosa Profunda",
+      otrosNombres: ["TVP"],
+      descripcion: "Formación de un coágulo de sangre en una vena profunda, generalmente en las piernas.",
+      sintomas: ["Hinchazón en una pierna", "Dolor o sensibilidad en la pierna, a menudo como un calambre", "Piel enrojecida o descolorida", "Sensación de calor en el área afectada"],
+      causas: ["Inmovilidad prolongada (viajes largos, reposo en cama)", "Cirugía o lesión en las venas", "Trastornos de la coagulación sanguínea", "Cáncer y sus tratamientos"],
+      sistemaId: "sistema-cardiovascular",
+    },
+    {
+      id: "embolia-pulmonar",
+      nombre: "Embolia Pulmonar",
+      otrosNombres: ["Tromboembolismo pulmonar"],
+      descripcion: "Bloqueo de una arteria en los pulmones por un coágulo de sangre.",
+      sintomas: ["Dificultad para respirar de aparición súbita", "Dolor agudo en el pecho", "Tos con sangre", "Latidos cardíacos rápidos", "Mareo o desmayo"],
+      causas: ["Coágulo de sangre que viaja a los pulmones, generalmente desde una TVP", "Inmovilidad prolongada", "Cirugía reciente", "Factores genéticos de coagulación"],
+      sistemaId: "sistema-cardiovascular",
+    },
+    {
+      id: "accidente-cerebrovascular",
+      nombre: "Accidente Cerebrovascular",
+      otrosNombres: ["ACV", "Ictus"],
+      descripcion: "Daño al cerebro por interrupción del suministro de sangre.",
+      sintomas: ["Adormecimiento o debilidad súbita en cara, brazo o pierna (especialmente en un lado)", "Confusión repentina, dificultad para hablar o entender", "Problemas súbitos de visión", "Dolor de cabeza súbito y severo"],
+      causas: ["Obstrucción de una arteria cerebral por un coágulo (isquémico)", "Ruptura de un vaso sanguíneo en el cerebro (hemorrágico)", "Hipertensión arterial", "Fibrilación auricular"],
+      sistemaId: "sistema-cardiovascular",
+    },
+    {
+      id: "hipertension-pulmonar",
+      nombre: "Hipertensión Pulmonar",
+      otrosNombres: ["Presión arterial alta en los pulmones"],
+      descripcion: "Tipo de presión arterial alta que afecta a las arterias de los pulmones y al lado derecho del corazón.",
+      sintomas: ["Falta de aliento, inicialmente con el ejercicio y luego en reposo", "Fatiga", "Dolor en el pecho", "Hinchazón en tobillos y piernas", "Coloración azulada en labios y piel (cianosis)"],
+      causas: ["Enfermedades cardíacas o pulmonares subyacentes", "Coágulos de sangre en los pulmones", "Causas idiopáticas (desconocidas)", "Uso de ciertas drogas o toxinas"],
+      sistemaId: "sistema-cardiovascular",
+    },
+    {
+      id: "cardiopatia-congenita",
+      nombre: "Cardiopatía Congénita",
+      otrosNombres: ["Defecto cardíaco de nacimiento"],
+      descripcion: "Anomalía en la estructura del corazón presente al nacer.",
+      sintomas: ["Varían mucho según el defecto", "Cianosis (piel azulada)", "Dificultad para respirar y alimentarse (en bebés)", "Retraso en el crecimiento", "Fatiga fácil durante el juego"],
+      causas: ["Anomalías en el desarrollo del corazón antes del nacimiento", "Factores genéticos y síndromes (como el de Down)", "Infecciones maternas durante el embarazo (rubéola)"],
+      sistemaId: "sistema-cardiovascular",
+    },
+    {
+      id: "soplo-cardiaco",
+      nombre: "Soplo Cardíaco",
+      otrosNombres: ["Murmullo cardíaco"],
+      descripcion: "Sonido adicional o inusual que se escucha durante un latido cardíaco.",
+      sintomas: ["Generalmente asintomático (es un sonido, no una enfermedad)", "En casos patológicos, puede asociarse a falta de aire o cianosis", "Dolor en el pecho", "Mareos"],
+      causas: ["Flujo sanguíneo turbulento a través del corazón", "Soplos inocentes (comunes en niños)", "Enfermedad de las válvulas cardíacas", "Defectos septales (agujeros en el corazón)"],
+      sistemaId: "sistema-cardiovascular",
+    },
+    {
+      id: "sindrome-de-marfan",
+      nombre: "Síndrome de Marfan",
+      otrosNombres: [""],
+      descripcion: "Trastorno hereditario que afecta el tejido conectivo, incluyendo el corazón y los vasos sanguíneos.",
+      sintomas: ["Estatura alta y delgada, con brazos y piernas largos", "Problemas de visión (luxación del cristalino)", "Problemas cardíacos (aneurisma y disección aórtica)", "Articulaciones extremadamente flexibles"],
+      causas: ["Mutación en el gen FBN1 que afecta el tejido conectivo", "Trastorno genético hereditario"],
+      sistemaId: "sistema-cardiovascular",
+    },
+    {
+      id: "enfermedad-de-buerger",
+      nombre: "Enfermedad de Buerger",
+      otrosNombres: ["Tromboangeítis obliterante"],
+      descripcion: "Inflamación y coagulación en los vasos sanguíneos de las manos y los pies.",
+      sintomas: ["Dolor en manos y pies, incluso en reposo", "Dedos pálidos, rojizos o azulados por el frío", "Llagas dolorosas en dedos de manos y pies", "Inflamación a lo largo de las venas"],
+      causas: ["Fuerte asociación con el consumo de tabaco", "Inflamación y coagulación en los vasos sanguíneos de manos y pies"],
+      sistemaId: "sistema-cardiovascular",
+    },
+    {
+      id: "enfermedad-de-raynaud",
+      nombre: "Enfermedad de Raynaud",
+      otrosNombres: ["Fenómeno de Raynaud"],
+      descripcion: "Afección que causa que algunas áreas del cuerpo se sientan frías y cambien de color en respuesta al frío o al estrés.",
+      sintomas: ["Dedos de manos y pies que se vuelven blancos, luego azules y finalmente rojos", "Entumecimiento y sensación de hormigueo", "Dolor punzante al recuperar el flujo sanguíneo"],
+      causas: ["Espasmo de las arterias pequeñas en respuesta al frío o al estrés", "Puede ser primario (causa desconocida) o secundario a otras enfermedades"],
+      sistemaId: "sistema-cardiovascular",
+    },
+    {
+      id: "varices",
+      nombre: "Varices",
+      otrosNombres: ["Venas varicosas"],
+      descripcion: "Venas hinchadas y retorcidas que se pueden ver debajo de la piel.",
+      sintomas: ["Venas torcidas y abultadas de color azul o morado oscuro", "Sensación de pesadez o dolor en las piernas", "Calambres musculares y ardor", "Hinchazón en la parte inferior de las piernas"],
+      causas: ["Válvulas venosas débiles o dañadas", "Aumento de la presión en las venas (estar de pie mucho tiempo)", "Factores hereditarios", "Embarazo y obesidad"],
+      sistemaId: "sistema-cardiovascular",
+    },
+    {
+      id: "linfedema",
+      nombre: "Linfedema",
+      otrosNombres: ["Obstrucción linfática"],
+      descripcion: "Acumulación de líquido linfático en los tejidos blandos del cuerpo.",
+      sintomas: ["Hinchazón de brazos o piernas", "Sensación de pesadez o rigidez", "Amplitud de movimiento restringida", "Infecciones recurrentes", "Endurecimiento y engrosamiento de la piel (fibrosis)"],
+      causas: ["Extirpación o daño de los ganglios linfáticos como parte del tratamiento oncológico", "Infecciones que afectan los vasos linfáticos", "Condiciones genéticas que afectan el desarrollo del sistema linfático", "Traumatismos o lesiones que dañan el sistema linfático"],
+      sistemaId: "sistema-cardiovascular",
+    },
+    {
+      id: "shock-cardiogenico",
+      nombre: "Shock Cardiogénico",
+      otrosNombres: ["Choque cardiogénico"],
+      descripcion: "Afección en la que el corazón de repente no puede bombear suficiente sangre para satisfacer las necesidades del cuerpo.",
+      sintomas: ["Presión arterial muy baja", "Pulso débil y rápido", "Piel fría y sudorosa", "Confusión y pérdida de conciencia", "Respiración rápida"],
+      causas: ["Daño severo al corazón, generalmente por un infarto masivo", "Incapacidad del corazón para bombear suficiente sangre al cuerpo"],
+      sistemaId: "sistema-cardiovascular",
+    },
+    {
+      id: "paro-cardiaco",
+      nombre: "Paro Cardíaco",
+      otrosNombres: ["Muerte súbita cardíaca"],
+      descripcion: "Pérdida inesperada de la función cardíaca, la respiración y el conocimiento.",
+      sintomas: ["Pérdida súbita del conocimiento", "Ausencia de respiración", "Falta de pulso", "Colapso repentino"],
+      causas: ["Mal funcionamiento eléctrico del corazón (arritmia letal)", "Enfermedad de las arterias coronarias", "Infarto de miocardio"],
+      sistemaId: "sistema-cardiovascular",
+    },
+    {
+      id: "anemia",
+      nombre: "Anemia",
+      otrosNombres: [""],
+      descripcion: "Afección en la cual la sangre no cuenta con suficientes glóbulos rojos sanos.",
+      sintomas: ["Fatiga y debilidad", "Piel pálida o amarillenta", "Falta de aliento", "Mareos o aturdimiento", "Manos y pies fríos"],
+      causas: ["Deficiencia de hierro, vitamina B12 o folato", "Pérdida de sangre (menstruación, úlceras)", "Enfermedades crónicas que afectan la producción de glóbulos rojos"],
+      sistemaId: "sistema-cardiovascular",
+    },
+    {
+      id: "hemofilia",
+      nombre: "Hemofilia",
+      otrosNombres: [""],
+      descripcion: "Trastorno hemorrágico hereditario en el cual la sangre no coagula de manera adecuada.",
+      sintomas: ["Sangrado excesivo por cortes o lesiones", "Moretones grandes y profundos", "Sangrado en articulaciones (dolor e hinchazón)", "Sangre en la orina o las heces"],
+      causas: ["Trastorno genético hereditario ligado al cromosoma X", "Deficiencia de factores de coagulación en la sangre (Factor VIII o IX)"],
+      sistemaId: "sistema-cardiovascular",
+    },
+    {
+      id: "leucemia",
+      nombre: "Leucemia",
+      otrosNombres: ["Cáncer de la sangre"],
+      descripcion: "Cáncer de los tejidos que forman la sangre en el organismo.",
+      sintomas: ["Fiebre o escalofríos", "Fatiga persistente", "Infecciones frecuentes", "Pérdida de peso involuntaria", "Moretones y sangrado fácil"],
+      causas: ["Producción anormal y excesiva de glóbulos blancos en la médula ósea", "Mutaciones en el ADN de las células sanguíneas"],
+      sistemaId: "sistema-cardiovascular",
+    },
+    {
+      id: "colesterol-alto",
+      nombre: "Colesterol Alto",
+      otrosNombres: ["Hipercolesterolemia"],
+      descripcion: "Niveles elevados de colesterol en la sangre, lo que aumenta el riesgo de enfermedades cardíacas.",
+      sintomas: ["Generalmente no presenta síntomas", "Puede contribuir a la ateroesclerosis y sus síntomas (dolor de pecho, etc.)", "Depósitos de grasa en la piel (xantomas) en casos severos"],
+      causas: ["Dieta rica in grasas saturadas y trans", "Factores genéticos (hipercolesterolemia familiar)", "Sedentarismo y obesidad", "Tabaquismo"],
+      sistemaId: "sistema-cardiovascular",
+    },
+    {
+      id: "trigliceridos-altos",
+      nombre: "Triglicéridos Altos",
+      otrosNombres: ["Hipertrigliceridemia"],
+      descripcion: "Niveles elevados de triglicéridos en la sangre, lo que aumenta el riesgo de enfermedades cardíacas.",
+      sintomas: ["Generalmente asintomático", "En niveles muy altos, puede causar pancreatitis (dolor abdominal severo)", "Puede contribuir a la ateroesclerosis"],
+      causas: ["Consumo excesivo de calorías, especialmente de azúcar y alcohol", "Obesidad y síndrome metabólico", "Diabetes tipo 2 mal controlada", "Ciertos medicamentos"],
+      sistemaId: "sistema-cardiovascular",
+    },
+    {
+      id: "diabetes-mellitus",
+      nombre: "Diabetes Mellitus",
+      otrosNombres: ["Diabetes"],
+      descripcion: "Enfermedad crónica que afecta la forma en que el cuerpo convierte los alimentos en energía.",
+      sintomas: ["Aumento de la sed y la micción", "Aumento del hambre", "Pérdida de peso inexplicable", "Fatiga", "Visión borrosa"],
+      causas: ["Tipo 1: Destrucción autoinmune de las células productoras de insulina", "Tipo 2: Resistencia a la insulina y producción insuficiente", "Factores genéticos y estilo de vida"],
+      sistemaId: "sistema-cardiovascular",
+    },
+    {
+      id: "obesidad",
+      nombre: "Obesidad",
+      otrosNombres: [""],
+      descripcion: "Acumulación excesiva de grasa corporal que puede aumentar el riesgo de problemas de salud.",
+      sintomas: ["Índice de Masa Corporal (IMC) de 30 o superior", "Acumulación excesiva de grasa corporal", "Dificultad para respirar", "Dolor en articulaciones y espalda"],
+      causas: ["Desequilibrio entre la ingesta y el gasto de calorías", "Factores genéticos y metabólicos", "Estilo de vida sedentario", "Factores psicológicos y ambientales"],
+      sistemaId: "sistema-cardiovascular",
+    },
+    {
+      id: "apnea-del-sueno",
+      nombre: "Apnea del Sueño",
+      otrosNombres: [""],
+      descripcion: "Trastorno del sueño en el que la respiración se detiene y recomienza repetidamente.",
+      sintomas: ["Ronquidos fuertes", "Pausas en la respiración durante el sueño", "Despertar abrupto con falta de aire", "Somnolencia diurna excesiva", "Dolor de cabeza matutino"],
+      causas: ["Obstrucción de las vías respiratorias superiores durante el sueño", "Obesidad y exceso de tejido en la garganta", "Anatomía de las vías respiratorias"],
+      sistemaId: "sistema-cardiovascular",
+    },
+    {
+      id: "lupus-eritematoso-sistemico",
+      nombre: "Lupus Eritematoso Sistémico",
+      otrosNombres: ["LES", "Lupus"],
+      descripcion: "Enfermedad autoinmune que puede afectar el corazón y los vasos sanguíneos.",
+      sintomas: ["Erupción en forma de mariposa en el rostro", "Fatiga extrema", "Dolor e hinchazón en las articulaciones", "Fiebre", "Sensibilidad al sol"],
+      causas: ["Enfermedad autoinmune donde el cuerpo ataca sus propios tejidos", "Combinación de factores genéticos y ambientales"],
+      sistemaId: "sistema-cardiovascular",
+    },
+  ],
+};
+
+export default sistema;
@@ -0,0 +1,372 @@
+// Generado automáticamente por scripts/build-catalog.py - no editar a mano
+import type { SistemaCorporal } from '../../enfermedades-expandidas';
+
+const sistema: SistemaCorporal = {
+  id: "sistema-digestivo",
+  nombre: "Sistema Digestivo",
+  icono: "🍔",
+  enfermedades: [
+    {
+      id: "gastritis",
+      nombre: "Gastritis",
+      otrosNombres: ["Inflamación del estómago"],
+      descripcion: "Inflamación del revestimiento del estómago.",
+      sintomas: ["Malestar o dolor en la parte superior del abdomen", "Náuseas", "Vómitos", "Sensación de llenura"],
+      causas: ["Infección por Helicobacter pylori", "Consumo de AINEs", "Consumo excesivo de alcohol", "Estrés"],
+      sistemaId: "sistema-digestivo",
+    },
+    {
+      id: "ulcera-peptica",
+      nombre: "Úlcera Péptica",
+      otrosNombres: ["Úlcera de estómago", "Úlcera duodenal"],
+      descripcion: "Llaga abierta en el revestimiento del estómago o el duodeno.",
+      sintomas: ["Dolor ardiente en el estómago", "Sensación de llenura", "Hinchazón", "Intolerancia a los alimentos grasos"],
+      causas: ["Infección por Helicobacter pylori", "Uso prolongado de AINEs", "Tabaquismo", "Consumo de alcohol"],
+      sistemaId: "sistema-digestivo",
+    },
+    {
+      id: "reflujo-gastroesofagico",
+      nombre: "Enfermedad por Reflujo Gastroesofágico (ERGE)",
+      otrosNombres: ["Reflujo ácido", "Acidez estomacal"],
+      descripcion: "El ácido del estómago fluye hacia el esófago, causando irritación.",
+      sintomas: ["Acidez estomacal", "Regurgitación de alimentos o líquido agrio", "Dolor en el pecho", "Dificultad para tragar"],
+      causas: ["Hernia de hiato", "Obesidad", "Embarazo", "Tabaquismo"],
+      sistemaId: "sistema-digestivo",
+    },
+    {
+      id: "colitis-ulcerosa",
+      nombre: "Colitis Ulcerosa",
+      otrosNombres: ["CU"],
+      descripcion: "Enfermedad inflamatoria intestinal que causa inflamación y úlceras en el tracto digestivo.",
+      sintomas: ["Diarrea con sangre o pus", "Dolor y calambres abdominales", "Dolor rectal", "Necesidad urgente de defecar"],
+      causas: ["Disfunción del sistema inmunitario", "Factores genéticos", "Factores ambientales"],
+      sistemaId: "sistema-digestivo",
+    },
+    {
+      id: "sindrome-del-intestino-irritable",
+      nombre: "Síndrome del Intestino Irritable (SII)",
+      otrosNombres: ["Colon irritable"],
+      descripcion: "Trastorno que afecta al intestino grueso, causando calambres, dolor abdominal, hinchazón, gases y diarrea o estreñimiento.",
+      sintomas: ["Dolor abdominal", "Calambres", "Hinchazón", "Gases", "Diarrea o estreñimiento"],
+      causas: ["Contracciones musculares en el intestino", "Anomalías en el sistema nervioso", "Inflamación intestinal", "Infección grave"],
+      sistemaId: "sistema-digestivo",
+    },
+    {
+      id: "enfermedad-de-crohn",
+      nombre: "Enfermedad de Crohn",
+      otrosNombres: [],
+      descripcion: "Enfermedad inflamatoria intestinal que causa inflamación del tracto digestivo, que puede provocar dolor abdominal, diarrea intensa, fatiga, pérdida de peso y desnutrición.",
+      sintomas: ["Diarrea", "Fiebre", "Fatiga", "Dolor y calambres abdominales", "Sangre en las heces"],
+      causas: ["Disfunción del sistema inmunitario", "Factores genéticos", "Tabaquismo"],
+      sistemaId: "sistema-digestivo",
+    },
+    {
+      id: "hemorroides",
+      nombre: "Hemorroides",
+      otrosNombres: ["Almorranas"],
+      descripcion: "Venas hinchadas en el ano y la parte inferior del recto, similares a las venas varicosas.",
+      sintomas: ["Sangrado indoloro durante la defecación", "Picazón o irritación en la región anal", "Dolor o molestia", "Hinchazón alrededor del ano"],
+      causas: ["Esfuerzo durante la defecación", "Estreñimiento crónico o diarrea", "Embarazo", "Permanecer sentado por largos períodos"],
+      sistemaId: "sistema-digestivo",
+    },
+    {
+      id: "estrenimiento",
+      nombre: "Estreñimiento",
+      otrosNombres: [],
+      descripcion: "Afección en la que una persona tiene deposiciones infrecuentes o dificultad para defecar.",
+      sintomas: ["Menos de tres evacuaciones por semana", "Heces duras o grumosas", "Esfuerzo para defecar", "Sensación de obstrucción rectal"],
+      causas: ["Dieta baja en fibra", "Deshidratación", "Falta de ejercicio", "Ciertos medicamentos"],
+      sistemaId: "sistema-digestivo",
+    },
+    {
+      id: "diarrea",
+      nombre: "Diarrea",
+      otrosNombres: [],
+      descripcion: "Heces blandas y líquidas con más frecuencia de lo habitual.",
+      sintomas: ["Heces blandas y líquidas", "Calambres abdominales", "Necesidad urgente de defecar", "Náuseas"],
+      causas: ["Infecciones virales o bacterianas", "Intoxicación alimentaria", "Intolerancias alimentarias", "Efectos secundarios de medicamentos"],
+      sistemaId: "sistema-digestivo",
+    },
+    {
+      id: "hepatitis",
+      nombre: "Hepatitis",
+      otrosNombres: ["Inflamación del hígado"],
+      descripcion: "Inflamación del hígado, generalmente causada por una infección viral.",
+      sintomas: ["Fatiga", "Náuseas y vómitos", "Dolor abdominal", "Orina oscura", "Ictericia"],
+      causas: ["Infecciones virales (Hepatitis A, B, C, D, E)", "Consumo excesivo de alcohol", "Enfermedades autoinmunes"],
+      sistemaId: "sistema-digestivo",
+    },
+    {
+      id: "cirrosis-hepatica",
+      nombre: "Cirrosis Hepática",
+      otrosNombres: ["Enfermedad hepática en etapa terminal"],
+      descripcion: "Cicatrización tardía (fibrosis) del hígado causada por diversas formas de enfermedades hepáticas y otras afecciones.",
+      sintomas: ["Fatiga", "Pérdida de apetito", "Náuseas", "Hinchazón en las piernas", "Ictericia"],
+      causas: ["Consumo crónico de alcohol", "Hepatitis viral crónica (B y C)", "Enfermedad del hígado graso no alcohólico"],
+      sistemaId: "sistema-digestivo",
+    },
+    {
+      id: "pancreatitis",
+      nombre: "Pancreatitis",
+      otrosNombres: ["Inflamación del páncreas"],
+      descripcion: "Inflamación del páncreas.",
+      sintomas: ["Dolor en la parte superior del abdomen que se irradia a la espalda", "Fiebre", "Pulso rápido", "Náuseas y vómitos"],
+      causas: ["Cálculos biliares", "Alcoholismo", "Ciertos medicamentos", "Niveles altos de triglicéridos"],
+      sistemaId: "sistema-digestivo",
+    },
+    {
+      id: "enfermedad-celiaca",
+      nombre: "Enfermedad Celíaca",
+      otrosNombres: ["Enteropatía sensible al gluten"],
+      descripcion: "Reacción inmunitaria al comer gluten, una proteína que se encuentra en el trigo, la cebada y el centeno.",
+      sintomas: ["Diarrea", "Fatiga", "Pérdida de peso", "Hinchazón y gases", "Dolor abdominal", "Náuseas y vómitos"],
+      causas: ["Reacción inmunitaria al gluten", "Predisposición genética", "Factores ambientales"],
+      sistemaId: "sistema-digestivo",
+    },
+    {
+      id: "intolerancia-a-la-lactosa",
+      nombre: "Intolerancia a la lactosa",
+      otrosNombres: [],
+      descripcion: "Incapacidad para digerir completamente el azúcar (lactosa) en los productos lácteos.",
+      sintomas: ["Diarrea", "Gases", "Hinchazón abdominal", "Cólicos estomacales"],
+      causas: ["Deficiencia de lactasa", "Lesión en el intestino delgado", "Enfermedad de Crohn", "Enfermedad celíaca"],
+      sistemaId: "sistema-digestivo",
+    },
+    {
+      id: "diverticulosis",
+      nombre: "Diverticulosis",
+      otrosNombres: [],
+      descripcion: "Afección en la que se forman pequeñas bolsas o sacos en la pared del colon.",
+      sintomas: ["Dolor abdominal", "Hinchazón", "Estreñimiento o diarrea"],
+      causas: ["Dieta baja en fibra", "Envejecimiento", "Falta de ejercicio"],
+      sistemaId: "sistema-digestivo",
+    },
+    {
+      id: "diverticulitis",
+      nombre: "Diverticulitis",
+      otrosNombres: [],
+      descripcion: "Inflamación o infección de una o más bolsas (divertículos) en la pared del colon.",
+      sintomas: ["Dolor abdominal intenso", "Fiebre", "Náuseas", "Cambios en los hábitos intestinales"],
+      causas: ["Inflamación de los divertículos", "Infección de los divertículos"],
+      sistemaId: "sistema-digestivo",
+    },
+    {
+      id: "apendicitis",
+      nombre: "Apendicitis",
+      otrosNombres: [],
+      descripcion: "Inflamación del apéndice, una bolsa en forma de dedo que se proyecta desde el colon en el lado inferior derecho del abdomen.",
+      sintomas: ["Dolor en la parte inferior derecha del abdomen", "Pérdida de apetito", "Náuseas y vómitos", "Fiebre"],
+      causas: ["Obstrucción del apéndice", "Infección"],
+      sistemaId: "sistema-digestivo",
+    },
+    {
+      id: "calculos-biliares",
+      nombre: "Cálculos biliares",
+      otrosNombres: ["Colelitiasis"],
+      descripcion: "Depósitos duros de líquido digestivo que pueden formarse en la vesícula biliar.",
+      sintomas: ["Dolor repentino e intenso en la parte superior derecha del abdomen", "Dolor de espalda entre los omóplatos", "Dolor en el hombro derecho", "Náuseas o vómitos"],
+      causas: ["Bilis con demasiado colesterol", "Bilis con demasiada bilirrubina", "Vesícula biliar que no se vacía correctamente"],
+      sistemaId: "sistema-digestivo",
+    },
+    {
+      id: "colecistitis",
+      nombre: "Colecistitis",
+      otrosNombres: ["Inflamación de la vesícula biliar"],
+      descripcion: "Inflamación de la vesícula biliar, un pequeño órgano en forma de pera en el lado derecho del abdomen, debajo del hígado.",
+      sintomas: ["Dolor intenso en la parte superior derecha o central del abdomen", "Dolor que se extiende al hombro derecho o a la espalda", "Sensibilidad abdominal al tacto", "Náuseas"],
+      causas: ["Cálculos biliares", "Tumor", "Obstrucción de las vías biliares"],
+      sistemaId: "sistema-digestivo",
+    },
+    {
+      id: "disfagia",
+      nombre: "Disfagia",
+      otrosNombres: ["Dificultad para tragar"],
+      descripcion: "Dificultad para tragar alimentos o líquidos, que surge de la garganta o el esófago.",
+      sintomas: ["Dolor al tragar", "Incapacidad para tragar", "Sensación de que la comida se atasca en la garganta o el pecho", "Babeo"],
+      causas: ["Accidente cerebrovascular", "Lesión en la cabeza o la médula espinal", "Ciertos tipos de cáncer", "Enfermedad de Parkinson"],
+      sistemaId: "sistema-digestivo",
+    },
+    {
+      id: "indigestion",
+      nombre: "Indigestión",
+      otrosNombres: ["Dispepsia"],
+      descripcion: "Malestar en la parte superior del abdomen, descrito como ardor, hinchazón o gases, náuseas o sensación de saciedad demasiado rápido después de comenzar a comer.",
+      sintomas: ["Dolor o ardor en la parte superior del abdomen", "Sensación de saciedad temprana durante una comida", "Hinchazón", "Náuseas"],
+      causas: ["Comer en exceso o demasiado rápido", "Alimentos grasos o picantes", "Tabaquismo", "Ansiedad"],
+      sistemaId: "sistema-digestivo",
+    },
+    {
+      id: "gastroenteritis",
+      nombre: "Gastroenteritis",
+      otrosNombres: ["Gripe estomacal"],
+      descripcion: "Inflamación del revestimiento de los intestinos causada por un virus, una bacteria o parásitos.",
+      sintomas: ["Diarrea acuosa", "Calambres abdominales", "Náuseas o vómitos", "Fiebre"],
+      causas: ["Infecciones virales (norovirus, rotavirus)", "Infecciones bacterianas (E. coli, salmonela)", "Intoxicación alimentaria"],
+      sistemaId: "sistema-digestivo",
+    },
+    {
+      id: "hernia-de-hiato",
+      nombre: "Hernia de hiato",
+      otrosNombres: [],
+      descripcion: "Afección en la que la parte superior del estómago se abulta a través del diafragma hacia la cavidad torácica.",
+      sintomas: ["Acidez estomacal", "Regurgitación de alimentos o líquidos a la boca", "Dificultad para tragar", "Dolor en el pecho o el abdomen"],
+      causas: ["Aumento de la presión en el abdomen", "Envejecimiento", "Obesidad", "Tos o estornudos crónicos"],
+      sistemaId: "sistema-digestivo",
+    },
+    {
+      id: "proctitis",
+      nombre: "Proctitis",
+      otrosNombres: [],
+      descripcion: "Inflamación del revestimiento del recto.",
+      sintomas: ["Dolor rectal", "Sensación de necesidad de defecar", "Sangrado rectal", "Secreción de moco por el recto"],
+      causas: ["Enfermedad inflamatoria intestinal (EII)", "Infecciones de transmisión sexual (ITS)", "Radioterapia para el cáncer", "Infecciones bacterianas"],
+      sistemaId: "sistema-digestivo",
+    },
+    {
+      id: "fisura-anal",
+      nombre: "Fisura anal",
+      otrosNombres: [],
+      descripcion: "Pequeño desgarro en el tejido delgado y húmedo que recubre el ano.",
+      sintomas: ["Dolor agudo durante la defecación", "Sangre roja brillante en las heces o el papel higiénico", "Picazón o irritación alrededor del ano"],
+      causas: ["Heces grandes o duras", "Estreñimiento y esfuerzo al defecar", "Diarrea crónica"],
+      sistemaId: "sistema-digestivo",
+    },
+    {
+      id: "incontinencia-fecal",
+      nombre: "Incontinencia fecal",
+      otrosNombres: [],
+      descripcion: "Incapacidad para controlar las deposiciones, lo que provoca que las heces (materia fecal) se filtren inesperadamente del recto.",
+      sintomas: ["Pérdida involuntaria de heces líquidas o sólidas", "Incapacidad para controlar los gases", "Manchado de la ropa interior"],
+      causas: ["Daño muscular o nervioso en el ano o el recto", "Diarrea o estreñimiento crónicos", "Pérdida de elasticidad en el recto"],
+      sistemaId: "sistema-digestivo",
+    },
+    {
+      id: "polipos-de-colon",
+      nombre: "Pólipos de colon",
+      otrosNombres: [],
+      descripcion: "Pequeño grupo de células que se forma en el revestimiento del colon.",
+      sintomas: ["Sangrado rectal", "Cambio en los hábitos intestinales", "Dolor abdominal", "Anemia por deficiencia de hierro"],
+      causas: ["Factores genéticos", "Edad avanzada", "Dieta rica en grasas y baja en fibra"],
+      sistemaId: "sistema-digestivo",
+    },
+    {
+      id: "cancer-de-colon",
+      nombre: "Cáncer de colon",
+      otrosNombres: ["Cáncer colorrectal"],
+      descripcion: "Tipo de cáncer que comienza en el intestino grueso (colon).",
+      sintomas: ["Cambio persistente en los hábitos intestinales", "Sangrado rectal o sangre en las heces", "Molestia abdominal persistente", "Pérdida de peso inexplicable"],
+      causas: ["Pólipos de colon no cancerosos", "Antecedentes familiares de cáncer de colon", "Dieta rica en grasas y baja en fibra", "Tabaquismo y consumo de alcohol"],
+      sistemaId: "sistema-digestivo",
+    },
+    {
+      id: "cancer-de-estomago",
+      nombre: "Cáncer de estómago",
+      otrosNombres: ["Cáncer gástrico"],
+      descripcion: "Crecimiento de células que comienza en el estómago.",
+      sintomas: ["Indigestión o acidez estomacal", "Dolor abdominal", "Náuseas y vómitos", "Pérdida de peso inexplicable"],
+      causas: ["Infección por Helicobacter pylori", "Tabaquismo", "Dieta rica en alimentos ahumados, salados o encurtidos", "Antecedentes familiares de cáncer de estómago"],
+      sistemaId: "sistema-digestivo",
+    },
+    {
+      id: "cancer-de-esofago",
+      nombre: "Cáncer de esófago",
+      otrosNombres: [],
+      descripcion: "Cáncer que ocurre en el esófago, un tubo largo y hueco que va desde la garganta hasta el estómago.",
+      sintomas: ["Dificultad para tragar (disfagia)", "Pérdida de peso inexplicable", "Dolor en el pecho, presión o ardor", "Ronquera o tos crónica"],
+      causas: ["Consumo de tabaco y alcohol", "Enfermedad por reflujo gastroesofágico (ERGE) crónica", "Obesidad", "Dieta deficiente en frutas y verduras"],
+      sistemaId: "sistema-digestivo",
+    },
+    {
+      id: "cancer-de-higado",
+      nombre: "Cáncer de hígado",
+      otrosNombres: ["Carcinoma hepatocelular"],
+      descripcion: "Cáncer que comienza en las células del hígado.",
+      sintomas: ["Pérdida de peso inexplicable", "Pérdida de apetito", "Dolor en la parte superior del abdomen", "Náuseas y vómitos", "Ictericia"],
+      causas: ["Infección crónica por hepatitis B o C", "Cirrosis hepática", "Consumo excesivo de alcohol", "Enfermedad del hígado graso no alcohólico"],
+      sistemaId: "sistema-digestivo",
+    },
+    {
+      id: "cancer-de-pancreas",
+      nombre: "Cáncer de páncreas",
+      otrosNombres: [],
+      descripcion: "Cáncer que comienza en los tejidos del páncreas.",
+      sintomas: ["Ictericia (coloración amarillenta de la piel y los ojos)", "Dolor abdominal o de espalda", "Pérdida de peso inexplicable", "Pérdida de apetito", "Náuseas y vómitos"],
+      causas: ["Tabaquismo", "Diabetes", "Pancreatitis crónica", "Antecedentes familiares de cáncer de páncreas"],
+      sistemaId: "sistema-digestivo",
+    },
+    {
+      id: "esofagitis",
+      nombre: "Esofagitis",
+      otrosNombres: [],
+      descripcion: "Inflamación que puede dañar los tejidos del esófago.",
+      sintomas: ["Dificultad para tragar", "Dolor al tragar", "Acidez estomacal", "Regurgitación de alimentos"],
+      causas: ["Enfermedad por reflujo gastroesofágico (ERGE)", "Infecciones", "Alergias alimentarias", "Ciertos medicamentos"],
+      sistemaId: "sistema-digestivo",
+    },
+    {
+      id: "acalasia",
+      nombre: "Acalasia",
+      otrosNombres: [],
+      descripcion: "Trastorno poco común que dificulta el paso de alimentos y líquidos al estómago.",
+      sintomas: ["Dificultad para tragar (disfagia)", "Regurgitación de alimentos no digeridos", "Dolor en el pecho", "Pérdida de peso"],
+      causas: ["Daño a los nervios del esófago", "Respuesta autoinmune"],
+      sistemaId: "sistema-digestivo",
+    },
+    {
+      id: "gastroparesia",
+      nombre: "Gastroparesia",
+      otrosNombres: [],
+      descripcion: "Afección que afecta el movimiento normal espontáneo de los músculos (motilidad) del estómago.",
+      sintomas: ["Náuseas", "Vómitos de alimentos no digeridos", "Sensación de saciedad temprana", "Hinchazón abdominal"],
+      causas: ["Diabetes", "Cirugía abdominal o esofágica", "Infecciones virales", "Ciertos medicamentos"],
+      sistemaId: "sistema-digestivo",
+    },
+    {
+      id: "linfangiectasia-intestinal",
+      nombre: "Linfangiectasia intestinal",
+      otrosNombres: [],
+      descripcion: "Trastorno poco común del tracto digestivo que causa pérdida de proteínas.",
+      sintomas: ["Diarrea crónica", "Edema", "Pérdida de peso", "Hinchazón abdominal"],
+      causas: ["Dilatación de los vasos linfáticos en el intestino delgado", "Forma congénita (primaria) o adquirida (secundaria)"],
+      sistemaId: "sistema-digestivo",
+    },
+    {
+      id: "sindrome-de-dumping",
+      nombre: "Síndrome de Dumping",
+      otrosNombres: [],
+      descripcion: "Afección en la que los alimentos, especialmente los que tienen un alto contenido de azúcar, se mueven desde el estómago hacia el intestino delgado con demasiada rapidez después de comer.",
+      sintomas: ["Náuseas", "Vómitos", "Calambres abdominales", "Diarrea", "Mareos"],
+      causas: ["Cirugía de bypass gástrico", "Gastrectomía", "Cirugía de esófago"],
+      sistemaId: "sistema-digestivo",
+    },
+    {
+      id: "colangitis",
+      nombre: "Colangitis",
+      otrosNombres: [],
+      descripcion: "Inflamación de los conductos biliares.",
+      sintomas: ["Fiebre", "Ictericia", "Dolor en la parte superior derecha del abdomen", "Escalofríos"],
+      causas: ["Cálculos biliares", "Estrechamiento de las vías biliares", "Tumores"],
+      sistemaId: "sistema-digestivo",
+    },
+    {
+      id: "isquemia-mesenterica",
+      nombre: "Isquemia mesentérica",
+      otrosNombres: [],
+      descripcion: "Afección que ocurre cuando los vasos sanguíneos estrechos o bloqueados restringen el flujo sanguíneo al intestino delgado.",
+      sintomas: ["Dolor abdominal intenso y repentino", "Necesidad urgente de defecar", "Náuseas y vómitos", "Fiebre"],
+      causas: ["Aterosclerosis", "Tromboembolismo", "Baja presión arterial"],
+      sistemaId: "sistema-digestivo",
+    },
+    {
+      id: "peritonitis",
+      nombre: "Peritonitis",
+      otrosNombres: [],
+      descripcion: "Inflamación de la membrana que recubre la pared abdominal interna y cubre los órganos abdominales.",
+      sintomas: ["Dolor o sensibilidad abdominal", "Hinchazón abdominal", "Fiebre", "Náuseas y vómitos"],
+      causas: ["Ruptura del apéndice", "Úlcera estomacal perforada", "Diverticulitis", "Lesión abdominal"],
+      sistemaId: "sistema-digestivo",
+    },
+  ],
+};
+
+export default sistema;
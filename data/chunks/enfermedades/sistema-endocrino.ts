@@ -0,0 +1,327 @@
+// Generado automáticamente por scripts/build-catalog.py - no editar a mano
+import type { SistemaCorporal } from '../../enfermedades-expandidas';
+
+const sistema: SistemaCorporal = {
+  id: "sistema-endocrino",
+  nombre: "Sistema Endocrino",
+  icono: "🧬",
+  enfermedades: [
+    {
+      id: "diabetes-mellitus-tipo-2",
+      nombre: "Diabetes Mellitus Tipo 2",
+      otrosNombres: ["Diabetes del adulto", "Diabetes no insulinodependiente"],
+      descripcion: "Trastorno metabólico caracterizado por hiperglucemia en el contexto de resistencia a la insulina y deficiencia relativa de insulina.",
+      sintomas: ["Aumento de la sed y de la micción", "Aumento del apetito", "Fatiga", "Visión borrosa", "Hormigueo en manos o pies"],
+      causas: ["Resistencia a la insulina", "Factores genéticos y antecedentes familiares", "Obesidad y sobrepeso", "Estilo de vida sedentario"],
+      sistemaId: "sistema-endocrino",
+    },
+    {
+      id: "diabetes-mellitus-tipo-1",
+      nombre: "Diabetes Mellitus Tipo 1",
+      otrosNombres: ["Diabetes juvenil", "Diabetes insulinodependiente"],
+      descripcion: "Enfermedad autoinmune que destruye las células beta del páncreas, lo que lleva a una deficiencia absoluta de insulina.",
+      sintomas: ["Sed excesiva", "Micción frecuente", "Pérdida de peso inexplicable", "Hambre extrema", "Fatiga y debilidad"],
+      causas: ["Reacción autoinmune que destruye las células beta del páncreas", "Predisposición genética", "Factores ambientales o virus"],
+      sistemaId: "sistema-endocrino",
+    },
+    {
+      id: "hipotiroidismo",
+      nombre: "Hipotiroidismo",
+      otrosNombres: ["Tiroides hipoactiva"],
+      descripcion: "Afección en la que la glándula tiroides no produce suficientes hormonas tiroideas.",
+      sintomas: ["Fatiga", "Aumento de peso", "Sensibilidad al frío", "Piel seca", "Estreñimiento"],
+      causas: ["Enfermedad de Hashimoto (trastorno autoinmune)", "Tratamiento previo por hipertiroidismo", "Deficiencia de yodo"],
+      sistemaId: "sistema-endocrino",
+    },
+    {
+      id: "hipertiroidismo",
+      nombre: "Hipertiroidismo",
+      otrosNombres: ["Tiroides hiperactiva", "Tirotoxicosis"],
+      descripcion: "Producción excesiva de hormonas tiroideas por la glándula tiroides.",
+      sintomas: ["Pérdida de peso involuntaria", "Taquicardia (ritmo cardíaco rápido)", "Nerviosismo y ansiedad", "Temblores", "Intolerancia al calor"],
+      causas: ["Enfermedad de Graves (trastorno autoinmune)", "Nódulos tiroideos hiperactivos", "Tiroiditis (inflamación de la tiroides)"],
+      sistemaId: "sistema-endocrino",
+    },
+    {
+      id: "sindrome-de-ovario-poliquistico",
+      nombre: "Síndrome de Ovario Poliquístico",
+      otrosNombres: ["SOP", "Anovulación hiperandrogénica"],
+      descripcion: "Trastorno endocrino común en mujeres en edad reproductiva, caracterizado por períodos menstruales irregulares, exceso de andrógenos y quistes en los ovarios.",
+      sintomas: ["Períodos menstruales irregulares o ausentes", "Exceso de vello facial y corporal (hirsutismo)", "Acné severo y piel grasa", "Aumento de peso y dificultad para perderlo", "Quistes en los ovarios"],
+      causas: ["Desequilibrio hormonal con altos niveles de andrógenos", "Resistencia a la insulina", "Factores genéticos y hereditarios", "Inflamación crónica de bajo grado"],
+      sistemaId: "sistema-endocrino",
+    },
+    {
+      id: "enfermedad-de-addison",
+      nombre: "Enfermedad de Addison",
+      otrosNombres: ["Insuficiencia suprarrenal primaria"],
+      descripcion: "Trastorno en el que las glándulas suprarrenales no producen suficientes hormonas cortisol y aldosterona.",
+      sintomas: ["Fatiga extrema", "Pérdida de peso y disminución del apetito", "Hiperpigmentación (oscurecimiento de la piel)", "Presión arterial baja", "Deseo de sal"],
+      causas: ["Daño a las glándulas suprarrenales (insuficiencia suprarrenal primaria)", "Reacción autoinmune", "Infecciones como la tuberculosis"],
+      sistemaId: "sistema-endocrino",
+    },
+    {
+      id: "enfermedad-de-graves",
+      nombre: "Enfermedad de Graves",
+      otrosNombres: ["Bocio difuso tóxico"],
+      descripcion: "Trastorno autoinmune que causa hipertiroidismo.",
+      sintomas: ["Ansiedad e irritabilidad", "Temblores en manos o dedos", "Bocio (agrandamiento de la tiroides)", "Ojos saltones (exoftalmos)", "Pérdida de peso"],
+      causas: ["Trastorno autoinmune que causa sobreproducción de hormonas tiroideas", "Predisposición genética", "Factores como el estrés o el embarazo"],
+      sistemaId: "sistema-endocrino",
+    },
+    {
+      id: "enfermedad-de-cushing",
+      nombre: "Enfermedad de Cushing",
+      otrosNombres: ["Hipercortisolismo"],
+      descripcion: "Afección causada por la exposición prolongada a altos niveles de cortisol.",
+      sintomas: ["Aumento de peso con acumulación de grasa en cara y abdomen", "Estrías violáceas en la piel", "Piel fina y frágil", "Debilidad muscular", "Presión arterial alta"],
+      causas: ["Uso prolongado de medicamentos corticosteroides", "Tumor en la glándula pituitaria (enfermedad de Cushing)", "Tumor en la glándula suprarrenal"],
+      sistemaId: "sistema-endocrino",
+    },
+    {
+      id: "acromegalia",
+      nombre: "Acromegalia",
+      otrosNombres: ["Gigantismo en adultos"],
+      descripcion: "Trastorno hormonal que se padece cuando la glándula pituitaria produce gran cantidad de hormona del crecimiento durante la edad adulta.",
+      sintomas: ["Agrandamiento de manos y pies", "Cambios en los rasgos faciales (mandíbula y frente prominentes)", "Voz más grave", "Dolor en las articulaciones", "Espaciamiento de los dientes"],
+      causas: ["Producción excesiva de hormona del crecimiento (GH) en la edad adulta", "Generalmente causado por un tumor benigno en la glándula pituitaria"],
+      sistemaId: "sistema-endocrino",
+    },
+    {
+      id: "enanismo",
+      nombre: "Enanismo",
+      otrosNombres: ["Deficiencia de la hormona del crecimiento"],
+      descripcion: "Baja estatura causada por una condición genética o médica.",
+      sintomas: ["Baja estatura (muy por debajo del promedio para la edad)", "Extremidades cortas", "Cabeza grande en proporción al cuerpo", "Desarrollo motor retrasado"],
+      causas: ["Acondroplasia (mutación genética)", "Deficiencia de la hormona del crecimiento", "Otras condiciones genéticas"],
+      sistemaId: "sistema-endocrino",
+    },
+    {
+      id: "gigantismo",
+      nombre: "Gigantismo",
+      otrosNombres: ["Exceso de hormona de crecimiento en niños"],
+      descripcion: "Crecimiento anormalmente grande debido a un exceso de la hormona del crecimiento durante la niñez.",
+      sintomas: ["Crecimiento excesivo en altura y tamaño corporal durante la niñez", "Manos y pies grandes", "Rasgos faciales toscos", "Pubertad retrasada"],
+      causas: ["Producción excesiva de hormona del crecimiento (GH) durante la niñez", "Generalmente causado por un tumor benigno en la glándula pituitaria"],
+      sistemaId: "sistema-endocrino",
+    },
+    {
+      id: "prolactinoma",
+      nombre: "Prolactinoma",
+      otrosNombres: ["Tumor hipofisario productor de prolactina"],
+      descripcion: "Tumor benigno de la glándula pituitaria que produce un exceso de la hormona prolactina.",
+      sintomas: ["Producción de leche materna fuera del embarazo (galactorrea)", "Períodos menstruales irregulares o ausentes", "Disfunción eréctil en hombres", "Dolores de cabeza y problemas de visión"],
+      causas: ["Tumor benigno (adenoma) en la glándula pituitaria que produce prolactina en exceso"],
+      sistemaId: "sistema-endocrino",
+    },
+    {
+      id: "sindrome-metabolico",
+      nombre: "Síndrome Metabólico",
+      otrosNombres: ["Síndrome de resistencia a la insulina"],
+      descripcion: "Conjunto de afecciones que aumentan el riesgo de enfermedad cardíaca, accidente cerebrovascular y diabetes tipo 2.",
+      sintomas: ["Grupo de condiciones: presión arterial alta, azúcar alta en sangre, exceso de grasa abdominal y niveles anormales de colesterol", "Aumento de la sed y la micción", "Fatiga"],
+      causas: ["Resistencia a la insulina", "Sobrepeso y obesidad", "Falta de actividad física"],
+      sistemaId: "sistema-endocrino",
+    },
+    {
+      id: "obesidad",
+      nombre: "Obesidad",
+      otrosNombres: ["Sobrepeso severo"],
+      descripcion: "Acumulación excesiva de grasa corporal que puede ser perjudicial para la salud.",
+      sintomas: ["Índice de Masa Corporal (IMC) de 30 o superior", "Acumulación excesiva de grasa corporal", "Dificultad para respirar", "Dolor en articulaciones y espalda"],
+      causas: ["Desequilibrio entre la ingesta y el gasto de calorías", "Factores genéticos y metabólicos", "Estilo de vida sedentario", "Factores psicológicos y ambientales"],
+      sistemaId: "sistema-endocrino",
+    },
+    {
+      id: "osteoporosis",
+      nombre: "Osteoporosis",
+      otrosNombres: ["Enfermedad ósea porosa"],
+      descripcion: "Enfermedad que debilita los huesos, haciéndolos frágiles y más propensos a fracturarse.",
+      sintomas: ["Dolor de espalda", "Pérdida de estatura con el tiempo", "Postura encorvada", "Fracturas óseas que ocurren con más facilidad de lo esperado"],
+      causas: ["Envejecimiento", "Deficiencia de estrógeno en mujeres menopáusicas", "Bajos niveles de testosterona en hombres", "Estilo de vida sedentario"],
+      sistemaId: "sistema-endocrino",
+    },
+    {
+      id: "hiperparatiroidismo",
+      nombre: "Hiperparatiroidismo",
+      otrosNombres: [],
+      descripcion: "Exceso de hormona paratiroidea en el torrente sanguíneo debido a la hiperactividad de una o más de las cuatro glándulas paratiroides.",
+      sintomas: ["Dolor óseo y fracturas fáciles", "Cálculos renales", "Fatiga y debilidad", "Dolor abdominal y náuseas"],
+      causas: ["Tumor benigno (adenoma) en una de las glándulas paratiroides", "Agrandamiento de dos o más glándulas paratiroides", "Deficiencia de calcio o vitamina D"],
+      sistemaId: "sistema-endocrino",
+    },
+    {
+      id: "hipoparatiroidismo",
+      nombre: "Hipoparatiroidismo",
+      otrosNombres: [],
+      descripcion: "Producción insuficiente de hormona paratiroidea, lo que conduce a niveles bajos de calcio en la sangre.",
+      sintomas: ["Hormigueo o entumecimiento en dedos y labios", "Calambres y espasmos musculares", "Fatiga", "Convulsiones"],
+      causas: ["Daño o extirpación de las glándulas paratiroides durante una cirugía de cuello", "Trastorno autoinmune", "Niveles bajos de magnesio"],
+      sistemaId: "sistema-endocrino",
+    },
+    {
+      id: "cancer-de-tiroides",
+      nombre: "Cáncer de Tiroides",
+      otrosNombres: [],
+      descripcion: "Crecimiento maligno de células en la glándula tiroides.",
+      sintomas: ["Bulto o nódulo en el cuello que crece rápidamente", "Ronquera o cambios en la voz", "Dificultad para tragar", "Dolor en el cuello y la garganta"],
+      causas: ["Exposición a altos niveles de radiación", "Antecedentes familiares de cáncer de tiroides", "Ciertas condiciones genéticas"],
+      sistemaId: "sistema-endocrino",
+    },
+    {
+      id: "insulinoma",
+      nombre: "Insulinoma",
+      otrosNombres: [],
+      descripcion: "Tumor raro del páncreas que produce un exceso de insulina.",
+      sintomas: ["Ansiedad", "cambios en el comportamiento o confusión", "visión borrosa", "pérdida del conocimiento o coma", "convulsiones o temblor", "mareo o dolor de cabeza", "hambre entre comidas", "sudoración"],
+      causas: ["Tumor en el páncreas que produce demasiada insulina", "Neoplasia endocrina múltiple tipo I"],
+      sistemaId: "sistema-endocrino",
+    },
+    {
+      id: "glucagonoma",
+      nombre: "Glucagonoma",
+      otrosNombres: [],
+      descripcion: "Tumor raro del páncreas que produce un exceso de la hormona glucagón.",
+      sintomas: ["Hiperglucemia (nivel elevado de azúcar en la sangre)", "Pérdida de peso inexplicable", "Erupción cutánea característica (eritema necrolítico migratorio)", "Diarrea", "Aumento de la sed y la micción"],
+      causas: ["Desarrollo de un tumor en las células alfa del páncreas", "Síndrome de Neoplasia Endocrina Múltiple tipo 1 (MEN1)", "La mayoría de los casos son esporádicos y de causa desconocida"],
+      sistemaId: "sistema-endocrino",
+    },
+    {
+      id: "feocromocitoma",
+      nombre: "Feocromocitoma",
+      otrosNombres: ["Tumor de la médula suprarrenal"],
+      descripcion: "Tumor raro de la glándula suprarrenal que produce un exceso de adrenalina y noradrenalina.",
+      sintomas: ["Presión arterial alta severa y episódica", "Dolores de cabeza intensos", "Sudoración profusa", "Palpitaciones cardíacas"],
+      causas: ["Tumor en las glándulas suprarrenales que produce un exceso de catecolaminas (adrenalina)", "Asociado a síndromes genéticos"],
+      sistemaId: "sistema-endocrino",
+    },
+    {
+      id: "diabetes-insipida",
+      nombre: "Diabetes Insípida",
+      otrosNombres: [],
+      descripcion: "Trastorno raro que causa un desequilibrio de líquidos en el cuerpo, lo que provoca sed intensa y micción excesiva.",
+      sintomas: ["Sed extrema (polidipsia)", "Producción de grandes volúmenes de orina diluida (poliuria)", "Deshidratación", "Necesidad de orinar durante la noche (nocturia)"],
+      causas: ["Daño a la glándula pituitaria o al hipotálamo, afectando la producción de ADH", "Incapacidad de los riñones para responder a la ADH", "Factores genéticos"],
+      sistemaId: "sistema-endocrino",
+    },
+    {
+      id: "tiroiditis-de-hashimoto",
+      nombre: "Tiroiditis de Hashimoto",
+      otrosNombres: ["Tiroiditis linfocítica crónica"],
+      descripcion: "Trastorno autoinmune que es la causa más común de hipotiroidismo.",
+      sintomas: ["Fatiga y pereza", "Aumento de la sensibilidad al frío", "Estreñimiento", "Piel pálida y seca", "Voz ronca", "Bocio"],
+      causas: ["Ataque del sistema inmunitario a la glándula tiroides", "Combinación de factores genéticos y ambientales", "Infecciones virales o bacterianas"],
+      sistemaId: "sistema-endocrino",
+    },
+    {
+      id: "ginecomastia",
+      nombre: "Ginecomastia",
+      otrosNombres: ["Agrandamiento de las mamas en los hombres"],
+      descripcion: "Agrandamiento del tejido mamario en hombres, causado por un desequilibrio hormonal.",
+      sintomas: ["Agrandamiento del tejido mamario", "Dolor y sensibilidad en los senos", "Hinchazón en el área del pezón", "Secreción del pezón", "Presencia de un bulto debajo del pezón"],
+      causas: ["Desequilibrios hormonales (disminución de testosterona y aumento de estrógeno)", "Obesidad", "Insuficiencia renal o hepática", "Efectos secundarios de medicamentos", "Condiciones médicas subyacentes (tumores, hipogonadismo)"],
+      sistemaId: "sistema-endocrino",
+    },
+    {
+      id: "galactorrea",
+      nombre: "Galactorrea",
+      otrosNombres: ["Secreción láctea del pezón"],
+      descripcion: "Secreción de leche por los pezones que no está relacionada con la lactancia normal.",
+      sintomas: ["Secreción de leche por el pezón", "Períodos menstruales irregulares o ausentes", "Dolores de cabeza", "Sequedad vaginal", "Disminución del deseo sexual", "Acné"],
+      causas: ["Tumor benigno en la glándula pituitaria (prolactinoma)", "Efectos secundarios de ciertos medicamentos", "Insuficiencia renal crónica", "Hipotiroidismo", "Estimulación excesiva de los senos"],
+      sistemaId: "sistema-endocrino",
+    },
+    {
+      id: "pubertad-precoz",
+      nombre: "Pubertad Precoz",
+      otrosNombres: [],
+      descripcion: "Aparición de los signos de la pubertad a una edad anormalmente temprana.",
+      sintomas: ["Desarrollo de senos antes de los 8 años en niñas", "Agrandamiento de testículos antes de los 9 años en niños", "Aparición temprana de vello púbico y axilar", "Estirón de crecimiento temprano"],
+      causas: ["Activación temprana del eje hipotálamo-hipófisis-gónadas", "Tumores en los ovarios, testículos o glándulas suprarrenales", "Anomalías del sistema nervioso central"],
+      sistemaId: "sistema-endocrino",
+    },
+    {
+      id: "retraso-de-la-pubertad",
+      nombre: "Retraso de la Pubertad",
+      otrosNombres: [],
+      descripcion: "Ausencia de los signos de la pubertad a una edad en la que normalmente se esperarían.",
+      sintomas: ["Falta de desarrollo de los senos en las niñas después de los 13 años", "Falta de aumento del tamaño de los testículos en los niños después de los 14 años", "Ausencia de vello púbico", "Baja estatura en comparación con sus compañeros", "Ausencia de la menstruación en las niñas después de los 15 años"],
+      causas: ["Antecedentes familiares de pubertad tardía", "Enfermedades crónicas (como diabetes o fibrosis quística)", "Desnutrición o trastornos de la alimentación", "Problemas hormonales (disfunción de la glándula pituitaria o tiroides)", "Afecciones genéticas"],
+      sistemaId: "sistema-endocrino",
+    },
+    {
+      id: "sindrome-de-kallmann",
+      nombre: "Síndrome de Kallmann",
+      otrosNombres: ["Hipogonadismo hipogonadotrópico con anosmia"],
+      descripcion: "Afección genética que causa pubertad tardía o ausente y un sentido del olfato alterado.",
+      sintomas: ["Pubertad retrasada o ausente", "Sentido del olfato disminuido o ausente (anosmia o hiposmia)", "Micropene y criptorquidia en niños", "Amenorrea primaria en mujeres", "Desarrollo incompleto o ausente de las mamas"],
+      causas: ["Mutaciones genéticas hereditarias", "Deficiencia de la hormona liberadora de gonadotropina (GnRH)", "Migración neuronal alterada durante el desarrollo embrionario", "Desarrollo anormal del bulbo olfatorio"],
+      sistemaId: "sistema-endocrino",
+    },
+    {
+      id: "sindrome-de-turner",
+      nombre: "Síndrome de Turner",
+      otrosNombres: ["Monosomía X"],
+      descripcion: "Afección cromosómica que afecta el desarrollo en las mujeres.",
+      sintomas: ["Baja estatura", "Falta de desarrollo de los ovarios", "Defectos cardíacos", "Cuello ancho o palmeado", "Orejas de implantación baja", "Pecho ancho con pezones de gran separación"],
+      causas: ["Monosomía del cromosoma X", "Mosaicismo del cromosoma X", "Anomalías del cromosoma X"],
+      sistemaId: "sistema-endocrino",
+    },
+    {
+      id: "sindrome-de-klinefelter",
+      nombre: "Síndrome de Klinefelter",
+      otrosNombres: ["47,XXY"],
+      descripcion: "Afección genética en la que un hombre nace con una copia extra del cromosoma X.",
+      sintomas: ["Testículos y pene pequeños", "Crecimiento de los senos (ginecomastia)", "Menos vello facial y corporal", "Tono muscular reducido", "Retraso en el habla", "Brazos y piernas largos", "Infertilidad", "Bajos niveles de testosterona"],
+      causas: ["Error aleatorio en la división celular (meiosis) durante la formación de las células reproductoras (óvulos o espermatozoides)", "Presencia de un cromosoma X adicional en cada célula (cariotipo 47,XXY)", "Error en la división celular en las primeras etapas del desarrollo fetal (mosaicismo)"],
+      sistemaId: "sistema-endocrino",
+    },
+    {
+      id: "hiperplasia-suprarrenal-congenita",
+      nombre: "Hiperplasia Suprarrenal Congénita",
+      otrosNombres: ["HSC"],
+      descripcion: "Grupo de trastornos genéticos hereditarios que afectan las glándulas suprarrenales.",
+      sintomas: ["Crecimiento rápido", "Aparición temprana de vello púbico y axilar", "Voz grave", "Acné grave", "Genitales ambiguos en niñas", "Deshidratación"],
+      causas: ["Deficiencia de la enzima 21-hidroxilasa", "Mutaciones genéticas hereditarias", "Trastorno autosómico recesivo"],
+      sistemaId: "sistema-endocrino",
+    },
+    {
+      id: "neoplasia-endocrina-multiple-tipo-1",
+      nombre: "Neoplasia Endocrina Múltiple Tipo 1",
+      otrosNombres: ["NEM1", "Síndrome de Wermer"],
+      descripcion: "Trastorno hereditario raro que causa tumores en varias glándulas endocrinas.",
+      sintomas: ["Fatiga y debilidad", "Dolor óseo", "Fracturas óseas", "Cálculos renales", "Úlceras en el estómago o los intestinos", "Hiperparatiroidismo"],
+      causas: ["Mutaciones en el gen MEN1", "Ser un síndrome autosómico dominante", "Antecedentes familiares de la enfermedad"],
+      sistemaId: "sistema-endocrino",
+    },
+    {
+      id: "neoplasia-endocrina-multiple-tipo-2",
+      nombre: "Neoplasia Endocrina Múltiple Tipo 2",
+      otrosNombres: ["NEM2", "Síndrome de Sipple"],
+      descripcion: "Trastorno hereditario que causa tumores en varias glándulas endocrinas y un alto riesgo de cáncer medular de tiroides.",
+      sintomas: ["Bultos en la garganta o el cuello", "Dificultad para respirar o tragar", "Ronquera", "Diarrea", "Dolor en los músculos y en las articulaciones", "Estreñimiento", "Fatiga", "Problemas de memoria", "Cálculos renales", "Presión arterial alta", "Frecuencia cardíaca acelerada", "Ansiedad", "Dolores de cabeza"],
+      causas: ["Afección hereditaria", "Gen alterado"],
+      sistemaId: "sistema-endocrino",
+    },
+    {
+      id: "bocio",
+      nombre: "Bocio",
+      otrosNombres: ["Agrandamiento de la tiroides"],
+      descripcion: "Agrandamiento anormal de la glándula tiroides.",
+      sintomas: ["Hinchazón visible en la base del cuello", "Sensación de opresión en la garganta", "Dificultad para tragar o respirar", "Tos"],
+      causas: ["Deficiencia de yodo", "Enfermedad de Hashimoto o de Graves", "Nódulos tiroideos"],
+      sistemaId: "sistema-endocrino",
+    },
+    {
+      id: "resistencia-a-la-hormona-tiroidea",
+      nombre: "Resistencia a la Hormona Tiroidea",
+      otrosNombres: ["RHT"],
+      descripcion: "Trastorno genético raro en el que los tejidos del cuerpo son resistentes a los efectos de las hormonas tiroideas.",
+      sintomas: ["Bocio", "Taquicardia", "Trastornos del desarrollo (baja estatura, retraso en la dentición, sordera)", "Trastornos del sistema nervioso central (trastornos del aprendizaje, hiperactividad, déficit de atención)", "Síntomas de hipertiroidismo", "Fatiga y debilidad muscular"],
+      causas: ["Mutaciones genéticas en el receptor de la hormona tiroidea (TRβ)", "Alteraciones en el transporte celular de las hormonas tiroideas", "Defectos en la conversión de T4 a T3", "Enfermedad de Hashimoto", "Trastornos de la glándula pituitaria"],
+      sistemaId: "sistema-endocrino",
+    },
+  ],
+};
+
+export default sistema;
@@ -0,0 +1,327 @@
+// Generado automáticamente por scripts/build-catalog.py - no editar a mano
+import type { SistemaCorporal } from '../../enfermedades-expandidas';
+
+const sistema: SistemaCorporal = {
+  id: "sistema-inmunologico",
+  nombre: "Sistema Inmunológico",
+  icono: "🛡️",
+  enfermedades: [
+    {
+      id: "lupus",
+      nombre: "Lupus",
+      otrosNombres: ["Lupus Eritematoso Sistémico"],
+      descripcion: "Enfermedad autoinmune sistémica que ocurre cuando el sistema inmunitario del cuerpo ataca sus propios tejidos y órganos.",
+      sintomas: ["Fatiga", "Fiebre", "Dolor articular", "Erupción en forma de mariposa", "Lesiones cutáneas"],
+      causas: ["Predisposición genética", "Factores ambientales como infecciones o medicamentos", "Desequilibrios hormonales", "Respuesta anormal del sistema inmunitario"],
+      sistemaId: "sistema-inmunologico",
+    },
+    {
+      id: "artritis-reumatoide",
+      nombre: "Artritis Reumatoide",
+      otrosNombres: ["Poliartritis crónica"],
+      descripcion: "Trastorno inflamatorio crónico que puede afectar más que solo las articulaciones.",
+      sintomas: ["Dolor en las articulaciones", "Hinchazón de las articulaciones", "Rigidez articular", "Fatiga", "Fiebre"],
+      causas: ["Predisposición genética", "Factores ambientales como infecciones virales o bacterianas", "Tabaquismo", "Respuesta autoinmune"],
+      sistemaId: "sistema-inmunologico",
+    },
+    {
+      id: "psoriasis",
+      nombre: "Psoriasis",
+      otrosNombres: [],
+      descripcion: "Afección de la piel que causa manchas rojas y escamosas que pican, principalmente en las rodillas, los codos, el tronco y el cuero cabelludo.",
+      sintomas: ["Placas rojas cubiertas de escamas plateadas", "Picazón, ardor o dolor en las lesiones", "Piel seca y agrietada que puede sangrar", "Uñas engrosadas, picadas o estriadas"],
+      causas: ["Enfermedad autoinmune que acelera el ciclo de vida de las células de la piel", "Predisposición genética", "Desencadenantes como infecciones, estrés o ciertos medicamentos"],
+      sistemaId: "sistema-inmunologico",
+    },
+    {
+      id: "vitiligo",
+      nombre: "Vitiligo",
+      otrosNombres: [],
+      descripcion: "Enfermedad que causa la pérdida de color de la piel en parches.",
+      sintomas: ["Pérdida de pigmento que resulta en manchas blancas en la piel", "Aparición de canas prematuras en cabello, pestañas o cejas", "Las manchas pueden crecer o extenderse con el tiempo"],
+      causas: ["Enfermedad autoinmune en la que el sistema inmunitario ataca a los melanocitos", "Factores genéticos y hereditarios", "Eventos desencadenantes como estrés, quemaduras solares graves o exposición a químicos"],
+      sistemaId: "sistema-inmunologico",
+    },
+    {
+      id: "alergias",
+      nombre: "Alergias",
+      otrosNombres: ["Reacciones de hipersensibilidad"],
+      descripcion: "Respuesta exagerada del sistema inmunitario a sustancias que normalmente son inofensivas.",
+      sintomas: ["Estornudos", "Picazón en la nariz, ojos o paladar", "Congestión nasal", "Ojos llorosos, rojos o hinchados", "Urticaria"],
+      causas: ["Respuesta exagerada del sistema inmunitario a sustancias inofensivas (alérgenos)", "Predisposición genética", "Exposición a alérgenos como polen, ácaros del polvo, moho o pelo de animales"],
+      sistemaId: "sistema-inmunologico",
+    },
+    {
+      id: "inmunodeficiencias",
+      nombre: "Inmunodeficiencias",
+      otrosNombres: ["Inmunosupresión"],
+      descripcion: "Estado en el que la capacidad del sistema inmunitario para combatir enfermedades infecciosas y cáncer está comprometida o ausente.",
+      sintomas: ["Infecciones recurrentes y graves", "Inflamación y daño en órganos internos", "Problemas sanguíneos, como recuentos bajos de plaquetas o anemia", "Problemas digestivos"],
+      causas: ["Defectos genéticos que afectan el sistema inmunitario (primaria)", "Enfermedades como el VIH/SIDA o la desnutrición (secundaria)", "Medicamentos que debilitan el sistema inmunitario"],
+      sistemaId: "sistema-inmunologico",
+    },
+    {
+      id: "enfermedad-celiaca",
+      nombre: "Enfermedad Celíaca",
+      otrosNombres: ["Enteropatía sensible al gluten"],
+      descripcion: "Reacción inmunitaria al comer gluten, una proteína que se encuentra en el trigo, la cebada y el centeno.",
+      sintomas: ["Diarrea", "Fatiga", "Pérdida de peso", "Hinchazón y gases", "Dolor abdominal", "Náuseas y vómitos"],
+      causas: ["Reacción inmunitaria al gluten", "Predisposición genética", "Factores ambientales"],
+      sistemaId: "sistema-inmunologico",
+    },
+    {
+      id: "esclerosis-multiple",
+      nombre: "Esclerosis Múltiple",
+      otrosNombres: ["EM"],
+      descripcion: "Enfermedad potencialmente incapacitante del cerebro y la médula espinal (sistema nervioso central).",
+      sintomas: ["Entumecimiento o debilidad en una o más extremidades", "Problemas de visión", "Fatiga", "Problemas de equilibrio y coordinación"],
+      causas: ["Enfermedad autoinmune que ataca la mielina del sistema nervioso central", "Combinación de factores genéticos y ambientales"],
+      sistemaId: "sistema-inmunologico",
+    },
+    {
+      id: "enfermedad-de-graves",
+      nombre: "Enfermedad de Graves",
+      otrosNombres: ["Bocio difuso tóxico"],
+      descripcion: "Trastorno del sistema inmunitario que da como resultado la sobreproducción de hormonas tiroideas (hipertiroidismo).",
+      sintomas: ["Ansiedad e irritabilidad", "Temblores en manos o dedos", "Bocio (agrandamiento de la tiroides)", "Ojos saltones (exoftalmos)", "Pérdida de peso"],
+      causas: ["Trastorno autoinmune que causa sobreproducción de hormonas tiroideas", "Predisposición genética", "Factores como el estrés o el embarazo"],
+      sistemaId: "sistema-inmunologico",
+    },
+    {
+      id: "tiroiditis-de-hashimoto",
+      nombre: "Tiroiditis de Hashimoto",
+      otrosNombres: ["Tiroiditis linfocítica crónica"],
+      descripcion: "Afección en la que el sistema inmunitario ataca la tiroides, una pequeña glándula en la base del cuello.",
+      sintomas: ["Fatiga y pereza", "Aumento de la sensibilidad al frío", "Estreñimiento", "Piel pálida y seca", "Voz ronca", "Bocio"],
+      causas: ["Ataque del sistema inmunitario a la glándula tiroides", "Combinación de factores genéticos y ambientales", "Infecciones virales o bacterianas"],
+      sistemaId: "sistema-inmunologico",
+    },
+    {
+      id: "enfermedad-de-addison",
+      nombre: "Enfermedad de Addison",
+      otrosNombres: ["Insuficiencia suprarrenal"],
+      descripcion: "Trastorno poco común que ocurre cuando el cuerpo no produce suficiente cantidad de ciertas hormonas.",
+      sintomas: ["Fatiga extrema", "Pérdida de peso y disminución del apetito", "Hiperpigmentación (oscurecimiento de la piel)", "Presión arterial baja", "Deseo de sal"],
+      causas: ["Daño a las glándulas suprarrenales (insuficiencia suprarrenal primaria)", "Reacción autoinmune", "Infecciones como la tuberculosis"],
+      sistemaId: "sistema-inmunologico",
+    },
+    {
+      id: "miastenia-gravis",
+      nombre: "Miastenia Gravis",
+      otrosNombres: [],
+      descripcion: "Enfermedad neuromuscular que causa debilidad en los músculos esqueléticos.",
+      sintomas: ["Debilidad de los músculos de los brazos, las manos, los dedos, las piernas y el cuello", "Visión doble", "Párpados caídos", "Dificultad para hablar, masticar, tragar y respirar"],
+      causas: ["Interrupción de la comunicación normal entre los nervios y los músculos", "Anticuerpos que bloquean o destruyen los receptores musculares de la acetilcolina"],
+      sistemaId: "sistema-inmunologico",
+    },
+    {
+      id: "sindrome-de-sjogren",
+      nombre: "Síndrome de Sjögren",
+      otrosNombres: [],
+      descripcion: "Trastorno del sistema inmunitario que se identifica por sus dos síntomas más comunes: ojos y boca secos.",
+      sintomas: ["Ojos secos", "Boca seca", "Fatiga", "Dolor e hinchazón en las articulaciones"],
+      causas: ["Ataque del sistema inmunitario a las glándulas que producen lágrimas y saliva", "Predisposición genética", "Desencadenante como una infección viral o bacteriana"],
+      sistemaId: "sistema-inmunologico",
+    },
+    {
+      id: "esclerodermia",
+      nombre: "Esclerodermia",
+      otrosNombres: ["Esclerosis sistémica"],
+      descripcion: "Grupo de enfermedades raras que implican el endurecimiento y la tensión de la piel y los tejidos conectivos.",
+      sintomas: ["Endurecimiento y estiramiento de la piel", "Fenómeno de Raynaud (dedos de manos y pies que se vuelven blancos, azules o rojos en respuesta al frío)", "Reflujo ácido y problemas para tragar", "Problemas pulmonares, cardíacos o renales"],
+      causas: ["Sobreproducción y acumulación de colágeno en el cuerpo", "Respuesta autoinmune", "Factores genéticos y ambientales"],
+      sistemaId: "sistema-inmunologico",
+    },
+    {
+      id: "polimiositis",
+      nombre: "Polimiositis",
+      otrosNombres: [],
+      descripcion: "Enfermedad inflamatoria poco común que causa debilidad muscular que afecta a ambos lados del cuerpo.",
+      sintomas: ["Debilidad muscular progresiva en caderas, muslos, hombros, brazos y cuello", "Dificultad para subir escaleras, levantarse de una silla o levantar objetos", "Dolor muscular", "Dificultad para tragar"],
+      causas: ["Inflamación de los músculos por una respuesta autoinmune", "Causa exacta desconocida, posiblemente relacionada con infecciones virales o enfermedades autoinmunes"],
+      sistemaId: "sistema-inmunologico",
+    },
+    {
+      id: "dermatomiositis",
+      nombre: "Dermatomiositis",
+      otrosNombres: [],
+      descripcion: "Enfermedad inflamatoria poco común marcada por debilidad muscular y una erupción cutánea distintiva.",
+      sintomas: ["Erupción cutánea violácea o roja oscura en la cara, los nudillos, los codos, las rodillas, el pecho y la espalda", "Debilidad muscular progresiva", "Párpados hinchados y de color púrpura", "Dificultad para tragar"],
+      causas: ["Inflamación de los músculos y la piel por una respuesta autoinmune", "Factores genéticos y ambientales", "Posiblemente desencadenada por infecciones o ciertos medicamentos"],
+      sistemaId: "sistema-inmunologico",
+    },
+    {
+      id: "diabetes-tipo-1",
+      nombre: "Diabetes tipo 1",
+      otrosNombres: ["Diabetes insulinodependiente"],
+      descripcion: "Afección crónica en la que el páncreas produce poca o ninguna insulina.",
+      sintomas: ["Aumento de la sed", "Aumento de las ganas de orinar", "Pérdida de peso inexplicable", "Aumento del apetito", "Fatiga", "Visión borrosa"],
+      causas: ["Reacción autoinmune", "Predisposición genética", "Factores ambientales"],
+      sistemaId: "sistema-inmunologico",
+    },
+    {
+      id: "enfermedad-inflamatoria-intestinal",
+      nombre: "Enfermedad Inflamatoria Intestinal",
+      otrosNombres: ["EII"],
+      descripcion: "Término general que describe trastornos que involucran inflamación crónica de su tracto digestivo.",
+      sintomas: ["Dolor abdominal y cólicos", "Diarrea", "Sangrado rectal", "Cansancio extremo", "Pérdida de peso", "Fiebre"],
+      causas: ["Respuesta anormal del sistema inmunitario", "Genética y antecedentes familiares", "Factores ambientales", "Tabaquismo", "Estrés"],
+      sistemaId: "sistema-inmunologico",
+    },
+    {
+      id: "hepatitis-autoinmune",
+      nombre: "Hepatitis Autoinmune",
+      otrosNombres: [],
+      descripcion: "Inflamación del hígado que ocurre cuando el sistema inmunitario ataca las células del hígado.",
+      sintomas: ["Fatiga", "Malestar abdominal", "Ictericia", "Dolor en las articulaciones", "Náuseas", "Pérdida de apetito"],
+      causas: ["Reacción autoinmune contra las células hepáticas", "Predisposición genética", "Infecciones virales o bacterianas", "Exposición a ciertos medicamentos"],
+      sistemaId: "sistema-inmunologico",
+    },
+    {
+      id: "anemia-perniciosa",
+      nombre: "Anemia Perniciosa",
+      otrosNombres: [],
+      descripcion: "Disminución de los glóbulos rojos que ocurre cuando los intestinos no pueden absorber adecuadamente la vitamina B12.",
+      sintomas: ["Fatiga y debilidad", "Hormigueo o entumecimiento en manos y pies", "Piel pálida", "Dificultad para caminar y problemas de equilibrio", "Pérdida de apetito"],
+      causas: ["Reacción autoinmune contra las células parietales del estómago", "Falta de factor intrínseco para absorber la vitamina B12", "Antecedentes familiares de la enfermedad", "Tener un trastorno endocrino autoinmune"],
+      sistemaId: "sistema-inmunologico",
+    },
+    {
+      id: "vasculitis-autoinmune",
+      nombre: "Vasculitis Autoinmune",
+      otrosNombres: [],
+      descripcion: "Inflamación de los vasos sanguíneos que ocurre cuando el sistema inmunitario ataca los vasos sanguíneos por error.",
+      sintomas: ["Fiebre", "Dolor de cabeza", "Cansancio", "Pérdida de peso", "Dolores musculares y articulares"],
+      causas: ["Infecciones como la hepatitis B y C", "Cánceres de la sangre", "Enfermedades del sistema inmunitario como artritis reumatoide y lupus", "Reacciones a ciertos medicamentos"],
+      sistemaId: "sistema-inmunologico",
+    },
+    {
+      id: "sarcoidosis",
+      nombre: "Sarcoidosis",
+      otrosNombres: [],
+      descripcion: "Enfermedad inflamatoria que afecta a múltiples órganos del cuerpo, pero más comúnmente a los pulmones y los ganglios linfáticos.",
+      sintomas: ["Fatiga", "Fiebre", "Pérdida de peso", "Tos seca persistente", "Dificultad para respirar", "Lesiones cutáneas dolorosas"],
+      causas: ["Crecimiento de pequeñas acumulaciones de células inflamatorias (granulomas) en diferentes partes del cuerpo", "Causa desconocida, posiblemente una respuesta inmunitaria a una sustancia desconocida"],
+      sistemaId: "sistema-inmunologico",
+    },
+    {
+      id: "alopecia-areata",
+      nombre: "Alopecia Areata",
+      otrosNombres: [],
+      descripcion: "Afección que causa la caída del cabello en pequeños parches, que pueden pasar desapercibidos.",
+      sintomas: ["Pérdida de cabello en parches redondos u ovalados", "Puede afectar el cuero cabelludo, cejas, pestañas y barba", "Piel lisa y sin cicatrices en las áreas de calvicie", "En casos raros, puede progresar a la pérdida total del cabello (alopecia totalis)"],
+      causas: ["Enfermedad autoinmune donde el sistema inmunitario ataca los folículos pilosos", "Predisposición genética", "El estrés severo puede actuar como desencadenante"],
+      sistemaId: "sistema-inmunologico",
+    },
+    {
+      id: "sindrome-de-guillain-barre",
+      nombre: "Síndrome de Guillain-Barré",
+      otrosNombres: [],
+      descripcion: "Trastorno poco común en el que el sistema inmunitario ataca los nervios.",
+      sintomas: ["Sensación de hormigueo en los dedos de las manos, de los pies, los tobillos o las muñecas", "Debilidad en las piernas que se difunde a la parte superior del cuerpo", "Marcha inestable o incapacidad para caminar o subir escaleras", "Dificultad con los movimientos faciales, lo que incluye hablar, masticar o tragar", "Visión doble o incapacidad para mover los ojos", "Dolor fuerte, que puede ser un dolor sordo, fulgurante o similar a un calambre, y que puede empeorar en la noche"],
+      causas: ["Infección por campylobacter", "Virus de la influenza", "Citomegalovirus", "Virus de Epstein-Barr", "Virus del Zika"],
+      sistemaId: "sistema-inmunologico",
+    },
+    {
+      id: "purpura-trombocitopenica-idiopatica",
+      nombre: "Púrpura Trombocitopénica Idiopática",
+      otrosNombres: ["PTI"],
+      descripcion: "Trastorno que puede provocar hematomas y sangrado fáciles o excesivos.",
+      sintomas: ["Sangrado en la piel (púrpura y petequias)", "Sangrado de las encías o la nariz", "Orina o heces con sangre", "Aparición fácil de moretones", "Fatiga", "Períodos menstruales anormalmente abundantes"],
+      causas: ["El sistema inmunitario ataca y destruye las plaquetas por error", "Producción de anticuerpos contra las plaquetas", "Infecciones virales", "Otras enfermedades autoinmunes", "Ciertos medicamentos"],
+      sistemaId: "sistema-inmunologico",
+    },
+    {
+      id: "sindrome-antifosfolipido",
+      nombre: "Síndrome Antifosfolípido",
+      otrosNombres: ["SAF"],
+      descripcion: "Trastorno en el que el sistema inmunitario ataca por error a las proteínas normales de la sangre.",
+      sintomas: ["Coágulos de sangre en venas o arterias", "Abortos espontáneos recurrentes", "Erupción cutánea con un patrón de encaje (livedo reticularis)", "Accidente cerebrovascular o ataque isquémico transitorio"],
+      causas: ["Producción de anticuerpos que atacan a las proteínas de la sangre", "Trastorno autoinmune", "Puede ocurrir junto con otras enfermedades autoinmunes como el lupus"],
+      sistemaId: "sistema-inmunologico",
+    },
+    {
+      id: "enfermedad-de-behcet",
+      nombre: "Enfermedad de Behçet",
+      otrosNombres: [],
+      descripcion: "Trastorno poco común que causa la inflamación de los vasos sanguíneos en todo el cuerpo.",
+      sintomas: ["Aftas en la boca", "Úlceras genitales", "Inflamación ocular (uveítis)", "Lesiones cutáneas similares al acné", "Dolor e hinchazón en las articulaciones"],
+      causas: ["Inflamación de los vasos sanguíneos (vasculitis) de causa desconocida", "Factores genéticos y ambientales", "Respuesta autoinmune"],
+      sistemaId: "sistema-inmunologico",
+    },
+    {
+      id: "espondilitis-aniquilosante",
+      nombre: "Espondilitis Anquilosante",
+      otrosNombres: [],
+      descripcion: "Enfermedad inflamatoria que, con el tiempo, puede hacer que algunas de las vértebras de la columna se fusionen.",
+      sintomas: ["Dolor y rigidez en la parte baja de la espalda y caderas", "Dolor de cuello", "Fatiga", "Dolor en la articulación sacroilíaca", "Uveítis (inflamación ocular)"],
+      causas: ["Causa desconocida", "Factores genéticos", "Presencia del gen HLA-B27"],
+      sistemaId: "sistema-inmunologico",
+    },
+    {
+      id: "artritis-psoriasica",
+      nombre: "Artritis Psoriásica",
+      otrosNombres: [],
+      descripcion: "Forma de artritis que afecta a algunas personas que tienen psoriasis.",
+      sintomas: ["Dolor, hinchazón y rigidez en las articulaciones", "Dedos de manos y pies hinchados (dactilitis)", "Dolor en los puntos donde los tendones y ligamentos se unen al hueso (entesitis)", "Lesiones cutáneas de psoriasis"],
+      causas: ["Combinación de factores genéticos y ambientales", "Respuesta autoinmune", "Antecedentes de psoriasis"],
+      sistemaId: "sistema-inmunologico",
+    },
+    {
+      id: "artritis-reactiva",
+      nombre: "Artritis Reactiva",
+      otrosNombres: ["Síndrome de Reiter"],
+      descripcion: "Dolor e hinchazón en las articulaciones desencadenado por una infección en otra parte del cuerpo.",
+      sintomas: ["Dolor y rigidez en rodillas, tobillos y pies", "Inflamación ocular (conjuntivitis)", "Problemas urinarios", "Hinchazón de los dedos de las manos o de los pies", "Lumbalgia"],
+      causas: ["Infección en los intestinos, los genitales o las vías urinarias", "Infección por bacterias (Campylobacter, Chlamydia, Salmonella, etc.)", "Factores hereditarios", "Edad entre 20 y 40 años"],
+      sistemaId: "sistema-inmunologico",
+    },
+    {
+      id: "fiebre-reumatica",
+      nombre: "Fiebre Reumática",
+      otrosNombres: [],
+      descripcion: "Enfermedad inflamatoria que puede desarrollarse como una complicación de la faringitis estreptocócica o la escarlatina no tratadas o tratadas de forma inadecuada.",
+      sintomas: ["Fiebre", "Dolor en las articulaciones, especialmente en las rodillas, los tobillos, los codos y las muñecas", "Carditis (inflamación del corazón)", "Movimientos corporales espasmódicos e incontrolables (corea de Sydenham)", "Nódulos indoloros debajo de la piel"],
+      causas: ["Complicación de una infección de garganta por estreptococos no tratada o tratada de forma inadecuada", "Respuesta inmunitaria anormal a la bacteria estreptocócica"],
+      sistemaId: "sistema-inmunologico",
+    },
+    {
+      id: "uveitis-autoinmune",
+      nombre: "Uveítis Autoinmune",
+      otrosNombres: [],
+      descripcion: "Inflamación de la úvea, la capa media del ojo, que puede ser causada por una enfermedad autoinmune.",
+      sintomas: ["Visión borrosa", "Dolor ocular", "Enrojecimiento del ojo", "Sensibilidad a la luz (fotofobia)", "Moscas volantes (miodesopsias)"],
+      causas: ["Reacción del sistema inmunitario contra el propio tejido ocular", "Asociación con enfermedades autoinmunes sistémicas (como artritis reumatoide o espondilitis anquilosante)", "Predisposición genética", "Infecciones previas que desencadenan la respuesta autoinmune"],
+      sistemaId: "sistema-inmunologico",
+    },
+    {
+      id: "penfigoide",
+      nombre: "Penfigoide",
+      otrosNombres: [],
+      descripcion: "Grupo de enfermedades autoinmunes raras de la piel que causan ampollas y erosiones en la piel y las membranas mucosas.",
+      sintomas: ["Picazón intensa que puede comenzar semanas o meses antes de que se formen las ampollas", "Ampollas grandes y tensas que no se rompen con facilidad", "Piel enrojecida o parches similares a la urticaria o eccema", "Lesiones o ampollas en la boca u otras membranas mucosas"],
+      causas: ["Es una enfermedad autoinmune en la que el sistema inmunitario ataca la piel", "Uso de ciertos medicamentos", "Exposición a la luz ultravioleta (fototerapia) o radioterapia", "Puede estar asociado a otras enfermedades como la esclerosis múltiple o la colitis ulcerosa"],
+      sistemaId: "sistema-inmunologico",
+    },
+    {
+      id: "liquen-plano",
+      nombre: "Liquen Plano",
+      otrosNombres: [],
+      descripcion: "Afección inflamatoria que puede afectar la piel, el cabello, las uñas y las membranas mucosas.",
+      sintomas: ["Pequeñas protuberancias planas, de color púrpura y con picazón", "Aparecen en muñecas, tobillos, espalda baja y genitales", "Líneas blancas finas en las protuberancias (estrías de Wickham)", "Puede afectar las mucosas (boca) y las uñas"],
+      causas: ["Reacción autoinmune o inflamatoria de causa desconocida", "Puede ser desencadenado por infecciones (hepatitis C), alérgenos o medicamentos", "El estrés puede exacerbar los brotes"],
+      sistemaId: "sistema-inmunologico",
+    },
+    {
+      id: "urticaria-cronica-idiopatica",
+      nombre: "Urticaria Crónica Idiopática",
+      otrosNombres: ["UCI"],
+      descripcion: "Ronchas que duran más de seis semanas y recurren con frecuencia durante meses o años.",
+      sintomas: ["Ronchas o habones que aparecen en cualquier parte del cuerpo", "Picazón intensa", "Hinchazón dolorosa alrededor de los ojos, mejillas o labios (angioedema)", "Brotes desencadenados por calor, ejercicio o estrés", "Ronchas que varían en tamaño y forma"],
+      causas: ["Causa a menudo desconocida (idiopática)", "Infecciones", "Enfermedad tiroidea", "Alergias", "Cáncer"],
+      sistemaId: "sistema-inmunologico",
+    },
+  ],
+};
+
+export default sistema;
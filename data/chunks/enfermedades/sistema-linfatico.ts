@@ -0,0 +1,237 @@
+// Generado automáticamente por scripts/build-catalog.py - no editar a mano
+import type { SistemaCorporal } from '../../enfermedades-expandidas';
+
+const sistema: SistemaCorporal = {
+  id: "sistema-linfatico",
+  nombre: "Sistema Linfático",
+  icono: "💧",
+  enfermedades: [
+    {
+      id: "linfedema",
+      nombre: "Linfedema",
+      otrosNombres: ["Edema linfático", "Obstrucción linfática"],
+      descripcion: "Acumulación de líquido linfático en los tejidos blandos del cuerpo, que causa hinchazón.",
+      sintomas: ["Hinchazón de brazos o piernas", "Sensación de pesadez o rigidez", "Amplitud de movimiento restringida", "Infecciones recurrentes", "Endurecimiento y engrosamiento de la piel (fibrosis)"],
+      causas: ["Extirpación o daño de los ganglios linfáticos como parte del tratamiento oncológico", "Infecciones que afectan los vasos linfáticos", "Condiciones genéticas que afectan el desarrollo del sistema linfático", "Traumatismos o lesiones que dañan el sistema linfático"],
+      sistemaId: "sistema-linfatico",
+    },
+    {
+      id: "linfoma",
+      nombre: "Linfoma",
+      otrosNombres: ["Cáncer linfático", "Tumor de ganglios linfáticos"],
+      descripcion: "Cáncer que se origina en los linfocitos, un tipo de glóbulo blanco del sistema inmunitario.",
+      sintomas: ["Inflamación indolora de los ganglios linfáticos", "Fatiga persistente", "Fiebre", "Sudores nocturnos", "Pérdida de peso inexplicable"],
+      causas: ["Mutaciones genéticas en los linfocitos", "Sistema inmunitario debilitado", "Infecciones virales como el virus de Epstein-Barr", "Exposición a ciertos productos químicos"],
+      sistemaId: "sistema-linfatico",
+    },
+    {
+      id: "mononucleosis-infecciosa",
+      nombre: "Mononucleosis Infecciosa",
+      otrosNombres: ["Enfermedad del beso", "Fiebre glandular"],
+      descripcion: "Infección viral, generalmente causada por el virus de Epstein-Barr, que provoca fiebre, dolor de garganta y ganglios linfáticos inflamados.",
+      sintomas: ["Fatiga extrema", "Fiebre", "Dolor de garganta", "Ganglios linfáticos inflamados en el cuello y las axilas", "Sarpullido"],
+      causas: ["Infección por el virus de Epstein-Barr (VEB)", "Transmisión a través de la saliva, por eso se la conoce como la \"enfermedad del beso\""],
+      sistemaId: "sistema-linfatico",
+    },
+    {
+      id: "adenopatia",
+      nombre: "Adenopatía",
+      otrosNombres: ["Linfadenopatía", "Ganglios linfáticos inflamados"],
+      descripcion: "Agrandamiento o inflamación de los ganglios linfáticos, a menudo como respuesta a una infección.",
+      sintomas: ["Ganglios linfáticos inflamados y sensibles", "Fiebre", "Sudores nocturnos", "Pérdida de peso"],
+      causas: ["Infecciones (bacterianas, virales, fúngicas)", "Trastornos inmunitarios como el lupus o la artritis reumatoide", "Cáncer (linfoma, leucemia, metástasis)"],
+      sistemaId: "sistema-linfatico",
+    },
+    {
+      id: "linfangitis",
+      nombre: "Linfangitis",
+      otrosNombres: ["Inflamación de los vasos linfáticos"],
+      descripcion: "Inflamación de los canales linfáticos que ocurre como resultado de una infección en un sitio distal al canal.",
+      sintomas: ["Líneas rojas y dolorosas que se extienden desde el área infectada", "Fiebre y escalofríos", "Sensación de malestar general", "Dolor de cabeza"],
+      causas: ["Infección bacteriana aguda, generalmente por estreptococos", "Complicación de una infección cutánea"],
+      sistemaId: "sistema-linfatico",
+    },
+    {
+      id: "enfermedad-de-castleman",
+      nombre: "Enfermedad de Castleman",
+      otrosNombres: ["Hiperplasia de ganglios linfáticos angiofolicular"],
+      descripcion: "Un trastorno poco común que implica un crecimiento excesivo de células en los ganglios linfáticos.",
+      sintomas: ["Fiebre", "Pérdida de peso", "Fatiga", "Sudores nocturnos", "Agrandamiento de los ganglios linfáticos"],
+      causas: ["Crecimiento excesivo de células en los ganglios linfáticos", "Infección por el virus del herpes humano 8 (VHH-8)", "Causas desconocidas en muchos casos"],
+      sistemaId: "sistema-linfatico",
+    },
+    {
+      id: "filariasis-linfatica",
+      nombre: "Filariasis Linfática",
+      otrosNombres: ["Elefantiasis"],
+      descripcion: "Infección parasitaria causada por gusanos filariales que se transmiten a través de mosquitos, que conduce a la obstrucción linfática.",
+      sintomas: ["Linfedema (elefantiasis)", "Hidrocele (hinchazón del escroto)", "Tos tropical (tos crónica)", "Fiebre"],
+      causas: ["Infección por gusanos parásitos filariales", "Transmisión por la picadura de mosquitos infectados"],
+      sistemaId: "sistema-linfatico",
+    },
+    {
+      id: "malformacion-linfatica",
+      nombre: "Malformación Linfática",
+      otrosNombres: ["Linfangioma"],
+      descripcion: "Una masa esponjosa y benigna de vasos linfáticos dilatados.",
+      sintomas: ["Masas o quistes llenos de líquido", "Hinchazón", "Dolor", "Problemas funcionales según la ubicación"],
+      causas: ["Desarrollo anormal de los vasos linfáticos durante la gestación", "Mutaciones genéticas somáticas"],
+      sistemaId: "sistema-linfatico",
+    },
+    {
+      id: "quilotorax",
+      nombre: "Quilotórax",
+      otrosNombres: ["Derrame quiloso"],
+      descripcion: "Acumulación de líquido linfático (quilo) en el espacio alrededor de los pulmones (espacio pleural).",
+      sintomas: ["Dificultad para respirar", "Tos", "Dolor en el pecho", "Fatiga"],
+      causas: ["Lesión del conducto torácico durante una cirugía", "Traumatismo torácico", "Tumores en el mediastino"],
+      sistemaId: "sistema-linfatico",
+    },
+    {
+      id: "ascitis-quilosa",
+      nombre: "Ascitis Quilosa",
+      otrosNombres: ["Peritonitis quilosa"],
+      descripcion: "Acumulación de líquido linfático (quilo) en la cavidad abdominal.",
+      sintomas: ["Aumento del perímetro abdominal", "Sensación de plenitud", "Dificultad para respirar", "Pérdida de apetito"],
+      causas: ["Obstrucción o rotura de los vasos linfáticos abdominales", "Cirrosis hepática", "Tumores abdominales"],
+      sistemaId: "sistema-linfatico",
+    },
+    {
+      id: "quiluria",
+      nombre: "Quiluria",
+      otrosNombres: ["Orina lechosa"],
+      descripcion: "Presencia de quilo en la orina, lo que le da un aspecto lechoso.",
+      sintomas: ["Orina de aspecto lechoso", "Dolor al orinar", "Aumento de la frecuencia urinaria", "Hematuria (sangre en la orina)"],
+      causas: ["Comunicación anormal entre el sistema linfático y el tracto urinario", "Filariasis linfática", "Traumatismos"],
+      sistemaId: "sistema-linfatico",
+    },
+    {
+      id: "sindrome-de-cloves",
+      nombre: "Síndrome de CLOVES",
+      otrosNombres: ["Sobrecrecimiento congénito lipomatoso"],
+      descripcion: "Un síndrome de sobrecrecimiento raro con anomalías vasculares complejas, que incluyen malformaciones linfáticas.",
+      sintomas: ["Crecimiento excesivo de tejido graso", "Malformaciones vasculares complejas", "Nevos epidérmicos", "Escoliosis"],
+      causas: ["Mutación somática en el gen PIK3CA", "No es una condición hereditaria"],
+      sistemaId: "sistema-linfatico",
+    },
+    {
+      id: "bronquitis-plastica",
+      nombre: "Bronquitis Plástica",
+      otrosNombres: ["Moldes bronquiales"],
+      descripcion: "Una condición rara en la que se forman moldes de las vías respiratorias, a menudo asociada con anomalías linfáticas.",
+      sintomas: ["Tos intensa", "Expulsión de moldes bronquiales (material similar al plástico)", "Dificultad para respirar", "Cianosis (coloración azulada de la piel)"],
+      causas: ["Acumulación de líquido linfático en las vías respiratorias", "Complicación de cirugías cardíacas congénitas (procedimiento de Fontan)"],
+      sistemaId: "sistema-linfatico",
+    },
+    {
+      id: "enteropatia-perdedora-de-proteinas",
+      nombre: "Enteropatía Perdedora de Proteínas",
+      otrosNombres: ["Linfangiectasia intestinal"],
+      descripcion: "Pérdida excesiva de proteínas plasmáticas a través del tracto gastrointestinal debido a trastornos linfáticos.",
+      sintomas: ["Edema (hinchazón)", "Diarrea crónica", "Ascitis", "Retraso en el crecimiento en niños"],
+      causas: ["Pérdida excesiva de proteínas plasmáticas a través del tracto gastrointestinal", "Linfangiectasia intestinal", "Enfermedad de Crohn"],
+      sistemaId: "sistema-linfatico",
+    },
+    {
+      id: "higroma-quistico",
+      nombre: "Higroma Quístico",
+      otrosNombres: ["Linfangioma quístico"],
+      descripcion: "Un saco lleno de líquido que resulta de una obstrucción en el sistema linfático, que generalmente se encuentra en el cuello.",
+      sintomas: ["Hinchazón o masa en el cuello o la axila", "Acumulación de líquido", "Edema nucal", "Dificultad para respirar o tragar"],
+      causas: ["Anomalías cromosómicas (Síndrome de Turner, Síndrome de Down)", "Factores genéticos", "Malformación del sistema linfático", "Infecciones virales durante el embarazo"],
+      sistemaId: "sistema-linfatico",
+    },
+    {
+      id: "hiperplasia-linfofolicular",
+      nombre: "Hiperplasia Linfofolicular",
+      otrosNombres: ["Hiperplasia folicular reactiva"],
+      descripcion: "Aumento del número y tamaño de los folículos linfoides, a menudo en respuesta a una infección.",
+      sintomas: ["Dolor", "Hinchazón", "Calor", "Sensibilidad", "Fiebre", "Escalofríos"],
+      causas: ["Infecciones bacterianas", "Infecciones virales", "Trastornos inmunitarios", "Estímulo de antígenos"],
+      sistemaId: "sistema-linfatico",
+    },
+    {
+      id: "linfadenitis-mesenterica",
+      nombre: "Linfadenitis Mesentérica",
+      otrosNombres: ["Adenitis mesentérica"],
+      descripcion: "Inflamación de los ganglios linfáticos en el mesenterio, el tejido que une el intestino a la pared abdominal.",
+      sintomas: ["Dolor en la zona del estómago", "Sensibilidad general en la zona del estómago", "Fiebre", "Diarrea", "Náuseas y vómitos"],
+      causas: ["Infección viral (gastroenteritis)", "Infecciones bacterianas", "Enfermedad inflamatoria intestinal", "Linfoma"],
+      sistemaId: "sistema-linfatico",
+    },
+    {
+      id: "linfangioleiomiomatosis",
+      nombre: "Linfangioleiomiomatosis (LAM)",
+      otrosNombres: [],
+      descripcion: "Una enfermedad pulmonar rara que afecta principalmente a mujeres en edad fértil, caracterizada por la proliferación de células musculares lisas atípicas en los pulmones y los linfáticos.",
+      sintomas: ["Dificultad para respirar progresiva", "Neumotórax recurrente (colapso pulmonar)", "Tos", "Quilotórax"],
+      causas: ["Proliferación anormal de células musculares lisas en los pulmones y el sistema linfático", "Mutaciones en los genes TSC1 o TSC2"],
+      sistemaId: "sistema-linfatico",
+    },
+    {
+      id: "sarcoidosis",
+      nombre: "Sarcoidosis",
+      otrosNombres: ["Enfermedad de Besnier-Boeck-Schaumann"],
+      descripcion: "Una enfermedad inflamatoria que afecta a múltiples órganos del cuerpo, pero más comúnmente a los pulmones y los ganglios linfáticos.",
+      sintomas: ["Fatiga", "Fiebre", "Pérdida de peso", "Tos seca persistente", "Dificultad para respirar", "Lesiones cutáneas dolorosas"],
+      causas: ["Crecimiento de pequeñas acumulaciones de células inflamatorias (granulomas) en diferentes partes del cuerpo", "Causa desconocida, posiblemente una respuesta inmunitaria a una sustancia desconocida"],
+      sistemaId: "sistema-linfatico",
+    },
+    {
+      id: "amigdalitis",
+      nombre: "Amigdalitis",
+      otrosNombres: ["Infección de las amígdalas", "Anginas"],
+      descripcion: "Inflamación de las amígdalas, dos masas de tejido de forma ovalada en la parte posterior de la garganta.",
+      sintomas: ["Dolor de garganta intenso", "Amígdalas rojas e hinchadas, a veces con placas de pus", "Dificultad o dolor al tragar", "Fiebre y escalofríos", "Mal aliento"],
+      causas: ["Infección viral (causa más común)", "Infección bacteriana (generalmente estreptococo del grupo A)"],
+      sistemaId: "sistema-linfatico",
+    },
+    {
+      id: "esplenomegalia",
+      nombre: "Esplenomegalia",
+      otrosNombres: ["Bazo agrandado"],
+      descripcion: "Agrandamiento del bazo, a menudo asociado con diversas enfermedades que afectan al sistema linfático.",
+      sintomas: ["Dolor o sensación de presión en la parte superior izquierda del abdomen", "Sensación de saciedad sin haber comido o después de comer una pequeña cantidad", "Anemia", "Infecciones frecuentes", "Sangrado fácil"],
+      causas: ["Infecciones virales, bacterianas o parasitarias", "Enfermedades hepáticas como la cirrosis", "Cánceres de la sangre como leucemia o linfoma", "Trastornos metabólicos", "Afecciones autoinmunitarias"],
+      sistemaId: "sistema-linfatico",
+    },
+    {
+      id: "timoma",
+      nombre: "Timoma",
+      otrosNombres: ["Tumor del timo"],
+      descripcion: "Un tumor originado en las células epiteliales del timo, una glándula linfática importante para el sistema inmune.",
+      sintomas: ["Tos persistente", "Dolor en el pecho", "Dificultad para respirar", "Debilidad muscular", "Voz ronca", "Dificultad para tragar"],
+      causas: ["Causa exacta desconocida", "Edad avanzada", "Enfermedades autoinmunes"],
+      sistemaId: "sistema-linfatico",
+    },
+    {
+      id: "linfangioma-cavernoso",
+      nombre: "Linfangioma Cavernoso",
+      otrosNombres: ["Malformación linfática macroquística"],
+      descripcion: "Un tipo de malformación linfática compuesta por grandes quistes llenos de líquido linfático.",
+      sintomas: ["Hinchazón o bulto debajo de la piel", "Decoloración de la piel o un tinte azulado sobre el área afectada", "Rango de movimiento limitado o rigidez en las articulaciones cercanas", "Infecciones recurrentes o celulitis en la zona afectada", "Dolor o malestar si el linfangioma presiona los tejidos o nervios circundantes."],
+      causas: ["Malformaciones congénitas durante el desarrollo fetal", "Mutaciones genéticas", "Traumatismo o lesión en los vasos linfáticos", "Cambios hormonales", "Infección o inflamación que afecta el sistema linfático."],
+      sistemaId: "sistema-linfatico",
+    },
+    {
+      id: "linfohistiocitosis-hemofagocitica",
+      nombre: "Linfohistiocitosis Hemofagocítica (LHH)",
+      otrosNombres: ["Síndrome hemofagocítico"],
+      descripcion: "Un trastorno inmunitario potencialmente mortal en el que el cuerpo produce demasiadas células inmunitarias activadas.",
+      sintomas: ["Fiebre", "Hepatomegalia", "Esplenomegalia", "Erupción cutánea", "Linfadenopatías", "Alteraciones neurológicas"],
+      causas: ["Factores genéticos (LHH familiar)", "Infecciones virales (como el virus de Epstein-Barr)", "Cánceres (como leucemias y linfomas)", "Trastornos autoinmunitarios (como el lupus y la artritis reumatoide)", "Trasplante de órganos"],
+      sistemaId: "sistema-linfatico",
+    },
+    {
+      id: "sindrome-de-evans",
+      nombre: "Síndrome de Evans",
+      otrosNombres: [],
+      descripcion: "Un trastorno autoinmune raro en el que el sistema inmunitario destruye los glóbulos rojos, las plaquetas y, a veces, ciertos tipos de glóbulos blancos.",
+      sintomas: ["Manchas de color púrpura en la piel", "Palidez", "Fatiga", "Aturdimiento"],
+      causas: ["Trastorno del sistema inmune", "Síndrome linfoproliferativo autoinmune", "Lupus", "Síndrome antifosfolípido", "Síndrome de Sjogren"],
+      sistemaId: "sistema-linfatico",
+    },
+  ],
+};
+
+export default sistema;
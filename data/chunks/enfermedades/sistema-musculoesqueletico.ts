@@ -0,0 +1,372 @@
+// Generado automáticamente por scripts/build-catalog.py - no editar a mano
+import type { SistemaCorporal } from '../../enfermedades-expandidas';
+
+const sistema: SistemaCorporal = {
+  id: "sistema-musculoesqueletico",
+  nombre: "Sistema Musculoesquelético",
+  icono: "🦴",
+  enfermedades: [
+    {
+      id: "artritis",
+      nombre: "Artritis",
+      otrosNombres: ["Inflamación articular", "Poliartritis"],
+      descripcion: "Inflamación de una o más articulaciones, que provoca dolor y rigidez.",
+      sintomas: ["Dolor articular", "Rigidez articular", "Hinchazón en las articulaciones", "Enrojecimiento de la piel alrededor de la articulación", "Disminución de la amplitud de movimiento"],
+      causas: ["Desgaste del cartílago (osteoartritis)", "Enfermedad autoinmune (artritis reumatoide)", "Infección", "Acumulación de ácido úrico (gota)"],
+      sistemaId: "sistema-musculoesqueletico",
+    },
+    {
+      id: "osteoporosis",
+      nombre: "Osteoporosis",
+      otrosNombres: ["Huesos porosos", "Pérdida de masa ósea"],
+      descripcion: "Enfermedad que debilita los huesos, haciéndolos frágiles y más propensos a fracturarse.",
+      sintomas: ["Dolor de espalda", "Pérdida de estatura con el tiempo", "Postura encorvada", "Fracturas óseas que ocurren con más facilidad de lo esperado"],
+      causas: ["Envejecimiento", "Deficiencia de estrógeno en mujeres menopáusicas", "Bajos niveles de testosterona en hombres", "Estilo de vida sedentario"],
+      sistemaId: "sistema-musculoesqueletico",
+    },
+    {
+      id: "osteomalacia",
+      nombre: "Osteomalacia",
+      otrosNombres: ["Reblandecimiento óseo", "Deficiencia de vitamina D"],
+      descripcion: "Reblandecimiento de los huesos debido a una mineralización ósea deficiente.",
+      sintomas: ["Dolor óseo difuso", "Debilidad muscular", "Dificultad para caminar", "Fracturas frecuentes"],
+      causas: ["Deficiencia severa de vitamina D", "Problemas de absorción de vitamina D en el intestino", "Enfermedad renal o hepática", "Ciertos medicamentos"],
+      sistemaId: "sistema-musculoesqueletico",
+    },
+    {
+      id: "sindrome-del-tunel-carpiano",
+      nombre: "Síndrome del túnel carpiano",
+      otrosNombres: ["Atrapamiento del nervio mediano", "Compresión del nervio mediano"],
+      descripcion: "Afección que causa entumecimiento, hormigueo y debilidad en la mano y el brazo.",
+      sintomas: ["Hormigueo o entumecimiento en la mano y los dedos", "Dolor en la muñeca o la mano", "Debilidad en la mano", "Sensación de descarga eléctrica en los dedos"],
+      causas: ["Presión sobre el nervio mediano en la muñeca", "Movimientos repetitivos de la mano y la muñeca", "Condiciones médicas como la artritis reumatoide o la diabetes", "Embarazo"],
+      sistemaId: "sistema-musculoesqueletico",
+    },
+    {
+      id: "tendinitis",
+      nombre: "Tendinitis",
+      otrosNombres: ["Inflamación del tendón", "Tendinopatía"],
+      descripcion: "Inflamación o irritación de un tendón, las cuerdas fibrosas que unen el músculo al hueso.",
+      sintomas: ["Dolor en un tendón, especialmente con el movimiento", "Sensibilidad al tacto en el área afectada", "Hinchazón leve", "Sensación de crepitación o crujido al mover el tendón"],
+      causas: ["Sobrecarga o uso excesivo de un tendón", "Lesión repentina", "Envejecimiento", "Enfermedades como la artritis reumatoide"],
+      sistemaId: "sistema-musculoesqueletico",
+    },
+    {
+      id: "desgarro-del-manguito-rotatorio",
+      nombre: "Desgarro del manguito rotatorio",
+      otrosNombres: ["Lesión del manguito de los rotadores", "Ruptura del manguito rotatorio"],
+      descripcion: "Lesión en los tendones que rodean la articulación del hombro.",
+      sintomas: ["Dolor sordo y profundo en el hombro", "Dificultad para levantar el brazo", "Debilidad en el hombro", "Dolor que empeora por la noche"],
+      causas: ["Lesión traumática", "Desgaste gradual por el envejecimiento", "Movimientos repetitivos por encima de la cabeza", "Levantamiento de objetos pesados"],
+      sistemaId: "sistema-musculoesqueletico",
+    },
+    {
+      id: "bursitis",
+      nombre: "Bursitis",
+      otrosNombres: ["Inflamación de la bursa", "Higroma"],
+      descripcion: "Inflamación de las bursas, pequeños sacos llenos de líquido que amortiguan los huesos, tendones y músculos cerca de las articulaciones.",
+      sintomas: ["Dolor articular", "Sensibilidad en la articulación", "Hinchazón y enrojecimiento", "Rigidez en la articulación"],
+      causas: ["Movimientos repetitivos o presión prolongada sobre una articulación", "Lesión o traumatismo", "Infección", "Artritis o gota"],
+      sistemaId: "sistema-musculoesqueletico",
+    },
+    {
+      id: "distrofia-muscular",
+      nombre: "Distrofia muscular",
+      otrosNombres: ["Debilidad muscular progresiva", "Miopatía hereditaria"],
+      descripcion: "Grupo de enfermedades genéticas que causan debilidad y pérdida progresiva de la masa muscular.",
+      sintomas: ["Debilidad muscular progresiva", "Caídas frecuentes", "Dificultad para levantarse o correr", "Músculos de la pantorrilla agrandados"],
+      causas: ["Mutaciones genéticas que interfieren con la producción de proteínas musculares", "Herencia familiar"],
+      sistemaId: "sistema-musculoesqueletico",
+    },
+    {
+      id: "calambre-muscular",
+      nombre: "Calambre muscular",
+      otrosNombres: ["Espasmo muscular", "Rampa"],
+      descripcion: "Contracción involuntaria y dolorosa de un músculo o grupo de músculos.",
+      sintomas: ["Contracción muscular súbita e involuntaria", "Dolor agudo y localizado", "Nudo muscular palpable"],
+      causas: ["Deshidratación", "Fatiga muscular", "Desequilibrio de electrolitos", "Compresión de un nervio"],
+      sistemaId: "sistema-musculoesqueletico",
+    },
+    {
+      id: "enfermedades-neuromusculares",
+      nombre: "Enfermedades neuromusculares",
+      otrosNombres: ["Trastornos neuromusculares", "Miopatías"],
+      descripcion: "Amplio grupo de enfermedades que afectan los nervios que controlan los músculos voluntarios.",
+      sintomas: ["Debilidad muscular", "Espasmos musculares, calambres o tics", "Pérdida de masa muscular", "Dificultad para moverse, hablar o respirar"],
+      causas: ["Mutaciones genéticas", "Trastornos autoinmunes", "Exposición a toxinas o venenos"],
+      sistemaId: "sistema-musculoesqueletico",
+    },
+    {
+      id: "esclerosis-multiple",
+      nombre: "Esclerosis múltiple",
+      otrosNombres: ["EM", "Enfermedad desmielinizante"],
+      descripcion: "Enfermedad en la que el sistema inmunológico degrada la cubierta protectora de los nervios.",
+      sintomas: ["Entumecimiento o debilidad en una o más extremidades", "Problemas de visión", "Fatiga", "Problemas de equilibrio y coordinación"],
+      causas: ["Enfermedad autoinmune que ataca la mielina del sistema nervioso central", "Combinación de factores genéticos y ambientales"],
+      sistemaId: "sistema-musculoesqueletico",
+    },
+    {
+      id: "fibromialgia",
+      nombre: "Fibromialgia",
+      otrosNombres: ["Síndrome de fibromialgia", "Dolor musculoesquelético crónico"],
+      descripcion: "Trastorno caracterizado por dolor musculoesquelético generalizado acompañado de fatiga, sueño, memoria y problemas de estado de ánimo.",
+      sintomas: ["Dolor musculoesquelético generalizado", "Fatiga", "Problemas de sueño", "Dificultades cognitivas (fibroniebla)"],
+      causas: ["Factores genéticos", "Infecciones previas", "Trauma físico o emocional"],
+      sistemaId: "sistema-musculoesqueletico",
+    },
+    {
+      id: "miastenia-grave",
+      nombre: "Miastenia grave",
+      otrosNombres: ["Miastenia gravis", "Debilidad muscular autoinmune"],
+      descripcion: "Enfermedad neuromuscular autoinmune que causa debilidad en los músculos esqueléticos.",
+      sintomas: ["Caída de uno o ambos párpados (ptosis)", "Visión doble (diplopía)", "Dificultad para hablar", "Problemas para tragar", "Dificultad para masticar", "Cambios en las expresiones faciales", "Debilidad en el cuello, brazos y piernas"],
+      causas: ["Producción de anticuerpos que bloquean o destruyen los receptores musculares de acetilcolina", "Problemas en la glándula del timo", "Anticuerpos contra las proteínas MuSK o LRP4", "Miastenia gravis seronegativa"],
+      sistemaId: "sistema-musculoesqueletico",
+    },
+    {
+      id: "miositis",
+      nombre: "Miositis",
+      otrosNombres: ["Inflamación muscular", "Miopatía inflamatoria"],
+      descripcion: "Inflamación de los músculos, que puede ser causada por una lesión, una infección o una enfermedad autoinmune.",
+      sintomas: ["Debilidad muscular progresiva", "Dolor muscular", "Fatiga", "Dificultad para tragar o respirar"],
+      causas: ["Enfermedad autoinmune", "Infección (viral o bacteriana)", "Reacción a un medicamento"],
+      sistemaId: "sistema-musculoesqueletico",
+    },
+    {
+      id: "sarcoma-de-tejido-blando",
+      nombre: "Sarcoma de tejido blando",
+      otrosNombres: ["Tumor de partes blandas", "Cáncer de tejido conectivo"],
+      descripcion: "Tipo de cáncer que se origina en los tejidos blandos del cuerpo, como músculos, grasa, vasos sanguíneos, nervios, tendones y revestimiento de las articulaciones.",
+      sintomas: ["Bulto o hinchazón notable", "Dolor, si el bulto presiona nervios o músculos", "Dolor abdominal", "Sangre en las heces o en el vómito", "Heces negras y alquitranadas", "Dificultad para respirar"],
+      causas: ["Síndromes genéticos hereditarios", "Exposición a la radiación", "Exposición a ciertos productos químicos", "Sistema inmunitario debilitado"],
+      sistemaId: "sistema-musculoesqueletico",
+    },
+    {
+      id: "enfermedad-discal-degenerativa",
+      nombre: "Enfermedad discal degenerativa",
+      otrosNombres: ["Discopatía degenerativa", "Desgaste de disco intervertebral"],
+      descripcion: "Afección en la que los discos intervertebrales de la columna se deterioran o rompen.",
+      sintomas: ["Dolor en la espalda, cuello, brazos o piernas", "Entumecimiento y hormigueo en brazos y piernas", "Debilidad en los músculos de las piernas", "Dolor que empeora al estar sentado, de pie o caminando por períodos prolongados", "Dolor agudo e intermitente"],
+      causas: ["Desgaste natural de los discos por envejecimiento", "Lesiones o traumatismos en la columna", "Artritis y Osteoartritis", "Sobrepeso u obesidad (IMC elevado)", "Tabaquismo"],
+      sistemaId: "sistema-musculoesqueletico",
+    },
+    {
+      id: "epicondilitis",
+      nombre: "Epicondilitis",
+      otrosNombres: ["Codo de tenista", "Epicondilalgia"],
+      descripcion: "Inflamación de los tendones que unen los músculos del antebrazo con la parte exterior del codo.",
+      sintomas: ["Dolor desde la parte exterior del codo hacia el antebrazo y la muñeca", "Debilidad para estrechar las manos o sujetar un objeto", "Dificultad para girar la perilla de una puerta", "Dificultad para sostener una taza de café"],
+      causas: ["Uso excesivo de la articulación y torsión muscular", "Tensión repetida de los músculos del antebrazo", "Movimientos repetitivos de la muñeca y el brazo", "Lesión o afección que afecta los tejidos conectivos"],
+      sistemaId: "sistema-musculoesqueletico",
+    },
+    {
+      id: "distension-muscular",
+      nombre: "Distensión muscular",
+      otrosNombres: ["Tirón muscular", "Desgarro muscular leve"],
+      descripcion: "Lesión en un músculo o tendón, las fibras que conectan los músculos con los huesos.",
+      sintomas: ["Dolor y dificultad de movimiento", "Hinchazón y hematomas", "Sensibilidad al tacto", "Espasmos musculares", "Debilidad muscular"],
+      causas: ["Actividad física o esfuerzo excesivo", "Calentamiento inadecuado antes de la actividad física", "Movimientos repetitivos", "Levantar objetos pesados de forma incorrecta", "Fatiga muscular"],
+      sistemaId: "sistema-musculoesqueletico",
+    },
+    {
+      id: "gota",
+      nombre: "Gota",
+      otrosNombres: ["Artritis gotosa", "Hiperuricemia"],
+      descripcion: "Forma de artritis que se caracteriza por ataques repentinos y graves de dolor, hinchazón, enrojecimiento y sensibilidad en las articulaciones.",
+      sintomas: ["Dolor articular intenso y repentino", "Hinchazón y enrojecimiento de la articulación", "Sensibilidad extrema en la articulación afectada", "Calor en la articulación"],
+      causas: ["Acumulación de cristales de urato en una articulación", "Niveles elevados de ácido úrico en la sangre", "Dieta rica en purinas", "Consumo de alcohol"],
+      sistemaId: "sistema-musculoesqueletico",
+    },
+    {
+      id: "espondilitis-anquilosante",
+      nombre: "Espondilitis anquilosante",
+      otrosNombres: ["Espondiloartritis anquilosante", "Enfermedad de Bechterew"],
+      descripcion: "Tipo de artritis que causa inflamación en las articulaciones de la columna vertebral.",
+      sintomas: ["Dolor y rigidez en la parte baja de la espalda y las caderas", "Dolor que empeora con el descanso y mejora con la actividad", "Fatiga", "Pérdida de flexibilidad en la columna"],
+      causas: ["Enfermedad autoinmune inflamatoria", "Factor genético (presencia del gen HLA-B27)"],
+      sistemaId: "sistema-musculoesqueletico",
+    },
+    {
+      id: "osteopenia",
+      nombre: "Osteopenia",
+      otrosNombres: ["Baja densidad ósea", "Pre-osteoporosis"],
+      descripcion: "Condición en la que la densidad mineral ósea es más baja de lo normal, pero no lo suficiente como para ser considerada osteoporosis.",
+      sintomas: ["Generalmente asintomática", "Dolor de espalda", "Pérdida de estatura con el tiempo", "Postura encorvada", "Huesos que se rompen con mucha más facilidad de lo esperado"],
+      causas: ["Antecedentes familiares de osteopenia u osteoporosis", "Ser de talla pequeña y delgada", "Deficiencia de calcio y vitamina D", "Tabaquismo", "Consumo excesivo de alcohol", "Falta de ejercicio"],
+      sistemaId: "sistema-musculoesqueletico",
+    },
+    {
+      id: "lumbalgia",
+      nombre: "Lumbalgia",
+      otrosNombres: ["Dolor de espalda baja", "Lumbago"],
+      descripcion: "Dolor en la parte baja de la espalda, que puede ser agudo o crónico.",
+      sintomas: ["Dolor localizado en la parte baja de la espalda", "Rigidez en la espalda", "Espasmos musculares", "Dolor que se irradia hacia los glúteos o las piernas", "Dificultad para moverse, agacharse o levantarse", "Hormigueo o adormecimiento en las piernas o pies"],
+      causas: ["Distensión muscular o de ligamentos", "Hernia de disco o disco degenerado", "Artrosis", "Estenosis espinal", "Malas posturas"],
+      sistemaId: "sistema-musculoesqueletico",
+    },
+    {
+      id: "fracturas-oseas",
+      nombre: "Fracturas Óseas",
+      otrosNombres: ["Hueso roto", "Ruptura ósea"],
+      descripcion: "Rotura de un hueso, que puede ser completa o incompleta.",
+      sintomas: ["Dolor intenso", "Hinchazón y hematomas", "Deformidad visible de la extremidad", "Incapacidad para mover la extremidad afectada", "Chasquido o crujido en el momento de la lesión"],
+      causas: ["Traumatismos (caídas, accidentes automovilísticos, lesiones deportivas)", "Osteoporosis", "Uso excesivo o estrés repetitivo en el hueso", "Condiciones médicas que debilitan los huesos"],
+      sistemaId: "sistema-musculoesqueletico",
+    },
+    {
+      id: "escoliosis",
+      nombre: "Escoliosis",
+      otrosNombres: ["Curvatura de la columna", "Desviación de la columna"],
+      descripcion: "Curvatura lateral de la columna vertebral que ocurre con mayor frecuencia durante el período de crecimiento anterior a la pubertad.",
+      sintomas: ["Curvatura lateral de la columna vertebral", "Hombros o caderas desiguales", "Un omóplato que parece más prominente que el otro", "Dolor de espalda"],
+      causas: ["Idiopática (causa desconocida) en la mayoría de los casos", "Afecciones neuromusculares como la parálisis cerebral", "Defectos de nacimiento que afectan la formación de la columna vertebral"],
+      sistemaId: "sistema-musculoesqueletico",
+    },
+    {
+      id: "lupus-eritematoso-sistemico",
+      nombre: "Lupus Eritematoso Sistémico",
+      otrosNombres: ["LES", "Lupus"],
+      descripcion: "Enfermedad autoinmune en la que el sistema inmunológico del cuerpo ataca por error el tejido sano.",
+      sintomas: ["Erupción en forma de mariposa en el rostro", "Fatiga extrema", "Dolor e hinchazón en las articulaciones", "Fiebre", "Sensibilidad al sol"],
+      causas: ["Enfermedad autoinmune donde el cuerpo ataca sus propios tejidos", "Combinación de factores genéticos y ambientales"],
+      sistemaId: "sistema-musculoesqueletico",
+    },
+    {
+      id: "artritis-reumatoide",
+      nombre: "Artritis Reumatoide",
+      otrosNombres: ["AR", "Poliartritis crónica"],
+      descripcion: "Trastorno inflamatorio crónico que puede afectar más que solo las articulaciones.",
+      sintomas: ["Dolor en las articulaciones", "Hinchazón de las articulaciones", "Rigidez articular", "Fatiga", "Fiebre"],
+      causas: ["Predisposición genética", "Factores ambientales como infecciones virales o bacterianas", "Tabaquismo", "Respuesta autoinmune"],
+      sistemaId: "sistema-musculoesqueletico",
+    },
+    {
+      id: "artritis-psoriasica",
+      nombre: "Artritis psoriásica",
+      otrosNombres: ["Artropatía psoriásica", "Psoriasis artropática"],
+      descripcion: "Tipo de artritis que afecta a algunas personas con psoriasis.",
+      sintomas: ["Dolor, hinchazón y rigidez en las articulaciones", "Dedos de manos y pies hinchados (dactilitis)", "Dolor en los puntos donde los tendones y ligamentos se unen al hueso (entesitis)", "Lesiones cutáneas de psoriasis"],
+      causas: ["Combinación de factores genéticos y ambientales", "Respuesta autoinmune", "Antecedentes de psoriasis"],
+      sistemaId: "sistema-musculoesqueletico",
+    },
+    {
+      id: "ciatica",
+      nombre: "Ciática",
+      otrosNombres: ["Dolor del nervio ciático", "Radiculopatía ciática"],
+      descripcion: "Dolor que se irradia a lo largo del trayecto del nervio ciático, que se ramifica desde la parte baja de la espalda a través de las caderas y los glúteos y baja por cada pierna.",
+      sintomas: ["Dolor que se irradia desde la espalda baja hacia la pierna", "Entumecimiento u hormigueo en la pierna o el pie", "Debilidad en la pierna o el pie", "Dolor agudo o punzante", "Sensación de ardor o descarga eléctrica"],
+      causas: ["Hernia de disco", "Estenosis espinal", "Síndrome piriforme", "Edad", "Obesidad"],
+      sistemaId: "sistema-musculoesqueletico",
+    },
+    {
+      id: "quiste-de-baker",
+      nombre: "Quiste de Baker",
+      otrosNombres: ["Quiste poplíteo", "Bolsa de líquido detrás de la rodilla"],
+      descripcion: "Acumulación de líquido articular que forma un bulto detrás de la rodilla.",
+      sintomas: ["Hinchazón o bulto detrás de la rodilla", "Dolor en la rodilla", "Sensación de tirantez o rigidez detrás de la rodilla", "Dificultad para flexionar la rodilla", "Chasquido o bloqueo en la articulación de la rodilla"],
+      causas: ["Artritis (especialmente osteoartritis)", "Lesión de rodilla (como desgarros de meniscos)", "Inflamación de la articulación de la rodilla", "Producción excesiva de líquido sinovial"],
+      sistemaId: "sistema-musculoesqueletico",
+    },
+    {
+      id: "dedo-en-gatillo",
+      nombre: "Dedo en gatillo",
+      otrosNombres: ["Tenosinovitis estenosante", "Dedo en resorte"],
+      descripcion: "Afección en la que uno de los dedos queda atascado en una posición de flexión.",
+      sintomas: ["Rigidez en el dedo, especialmente por la mañana", "Sensación de chasquido o crujido al mover el dedo", "Sensibilidad o un bulto en la palma de la mano, en la base del dedo afectado", "El dedo se queda atascado o trabado en la posición de flexión y se estira con un chasquido de manera repentina", "El dedo se traba en la posición de flexión"],
+      causas: ["Agarre reiterado", "Diabetes", "Artritis reumatoide", "Ocupaciones y pasatiempos que implican el uso repetitivo de las manos", "Sexo femenino"],
+      sistemaId: "sistema-musculoesqueletico",
+    },
+    {
+      id: "sindrome-del-tunel-tarsiano",
+      nombre: "Síndrome del túnel tarsiano",
+      otrosNombres: ["Atrapamiento del nervio tibial", "Neuralgia del nervio tibial posterior"],
+      descripcion: "Compresión del nervio tibial en el túnel tarsiano, un pasaje estrecho dentro del tobillo.",
+      sintomas: ["Dolor en el tobillo, pie y dedos", "Hormigueo o ardor en la planta del pie", "Entumecimiento en el pie", "Debilidad en los músculos del pie", "Sensación de choque eléctrico"],
+      causas: ["Compresión del nervio tibial posterior", "Lesiones en el tobillo", "Pie plano", "Enfermedades sistémicas como diabetes o artritis", "Hinchazón crónica en los pies"],
+      sistemaId: "sistema-musculoesqueletico",
+    },
+    {
+      id: "enfermedad-de-de-quervain",
+      nombre: "Enfermedad de De Quervain",
+      otrosNombres: ["Tenosinovitis de De Quervain", "Pulgar de esquiador"],
+      descripcion: "Afección dolorosa que afecta los tendones de la muñeca del lado del pulgar.",
+      sintomas: ["Dolor cerca de la base del pulgar", "Hinchazón cerca de la base del pulgar", "Dificultad para mover el pulgar y la muñeca", "Dolor en un costado de la muñeca bajo la base del pulgar", "Entumecimiento en los dedos pulgar e índice", "Sensación de crujido en la muñeca"],
+      causas: ["Movimientos repetitivos de la mano o la muñeca", "Lesión en la muñeca o el tendón", "Artritis reumatoide", "Embarazo", "Actividades que implican el uso repetitivo del pulgar y la muñeca"],
+      sistemaId: "sistema-musculoesqueletico",
+    },
+    {
+      id: "esclerodermia",
+      nombre: "Esclerodermia",
+      otrosNombres: ["Esclerosis sistémica", "Piel dura"],
+      descripcion: "Grupo de enfermedades raras que implican el endurecimiento y la tirantez de la piel y los tejidos conectivos.",
+      sintomas: ["Endurecimiento y estiramiento de la piel", "Fenómeno de Raynaud (dedos de manos y pies que se vuelven blancos, azules o rojos en respuesta al frío)", "Reflujo ácido y problemas para tragar", "Problemas pulmonares, cardíacos o renales"],
+      causas: ["Sobreproducción y acumulación de colágeno en el cuerpo", "Respuesta autoinmune", "Factores genéticos y ambientales"],
+      sistemaId: "sistema-musculoesqueletico",
+    },
+    {
+      id: "sindrome-de-ehlers-danlos",
+      nombre: "Síndrome de Ehlers-Danlos",
+      otrosNombres: ["SED", "Hiperlaxitud articular"],
+      descripcion: "Grupo de trastornos hereditarios que afectan los tejidos conectivos, principalmente la piel, las articulaciones y las paredes de los vasos sanguíneos.",
+      sintomas: ["Articulaciones flexibles en exceso", "Piel elástica", "Piel frágil que se daña con facilidad", "Dolor en las articulaciones y dislocaciones frecuentes", "Cicatrización anormal"],
+      causas: ["Trastorno hereditario del tejido conectivo", "Mutaciones en diversos genes responsables de la síntesis de colágeno", "Herencia autosómica dominante en la mayoría de los tipos"],
+      sistemaId: "sistema-musculoesqueletico",
+    },
+    {
+      id: "displasia-fibrosa",
+      nombre: "Displasia fibrosa",
+      otrosNombres: ["Trastorno óseo fibroso", "Lesión fibro-ósea"],
+      descripcion: "Trastorno óseo poco común en el que se forma tejido similar a una cicatriz (fibroso) en lugar de hueso normal.",
+      sintomas: ["Dolor óseo", "Lesiones óseas", "Problemas hormonales", "Fracturas o deformidades óseas", "Color inusual de la piel (pigmentación)"],
+      causas: ["Mutación genética espontánea que afecta a las células productoras de hueso", "Ocurre durante el desarrollo fetal", "No es hereditaria"],
+      sistemaId: "sistema-musculoesqueletico",
+    },
+    {
+      id: "lesiones-de-la-placa-de-crecimiento",
+      nombre: "Lesiones de la placa de crecimiento",
+      otrosNombres: ["Fractura de la fisis", "Lesión epifisaria"],
+      descripcion: "Fracturas que afectan la placa de crecimiento o fisis, el área de tejido en crecimiento cerca de los extremos de los huesos largos en niños y adolescentes.",
+      sintomas: ["Dolor con o sin palpación", "Imposibilidad de mover el área afectada", "Calor e hinchazón en el extremo de un hueso", "Deformidad visible en brazos o piernas"],
+      causas: ["Caídas o golpes en la extremidad", "Accidentes automovilísticos", "Deportes competitivos", "Actividades recreativas", "Uso excesivo"],
+      sistemaId: "sistema-musculoesqueletico",
+    },
+    {
+      id: "dolor-de-espalda",
+      nombre: "Dolor de espalda",
+      otrosNombres: ["Dorsalgia", "Cervicalgia"],
+      descripcion: "Dolor que se siente en la espalda, que puede provenir de los músculos, nervios, huesos, articulaciones o otras estructuras en la columna vertebral.",
+      sintomas: ["Dolor muscular o punzante en la espalda", "Dolor que se irradia hacia la pierna", "Movilidad limitada o rigidez de la espalda", "Dolor que empeora al estar de pie o sentado"],
+      causas: ["Tensión muscular o de ligamentos", "Hernia de disco", "Artritis", "Malas posturas"],
+      sistemaId: "sistema-musculoesqueletico",
+    },
+    {
+      id: "osteoartritis",
+      nombre: "Osteoartritis",
+      otrosNombres: ["Artrosis degenerativa", "Enfermedad articular degenerativa"],
+      descripcion: "Tipo más común de artritis, que ocurre cuando el cartílago protector que amortigua los extremos de los huesos se desgasta con el tiempo.",
+      sintomas: ["Dolor en las articulaciones durante o después del movimiento", "Rigidez articular, especialmente por la mañana", "Pérdida de flexibilidad", "Sensación de chirrido en la articulación"],
+      causas: ["Desgaste del cartílago protector en los extremos de los huesos", "Envejecimiento", "Obesidad", "Lesiones articulares previas"],
+      sistemaId: "sistema-musculoesqueletico",
+    },
+    {
+      id: "artrosis",
+      nombre: "Artrosis",
+      otrosNombres: ["Osteoartrosis", "Desgaste articular"],
+      descripcion: "Enfermedad degenerativa de las articulaciones que se caracteriza por el desgaste del cartílago.",
+      sintomas: ["Dolor en las articulaciones", "Rigidez", "Hinchazón", "Crujidos en la articulación", "Pérdida de flexibilidad", "Debilidad muscular"],
+      causas: ["Envejecimiento", "Sobrepeso u obesidad", "Lesiones articulares previas", "Predisposición genética", "Ciertas profesiones u deportes con movimientos repetitivos"],
+      sistemaId: "sistema-musculoesqueletico",
+    },
+    {
+      id: "contractura-muscular",
+      nombre: "Contractura muscular",
+      otrosNombres: ["Nudo muscular", "Punto gatillo miofascial"],
+      descripcion: "Contracción persistente e involuntaria de un músculo o algunas de sus fibras.",
+      sintomas: ["Dolor y rigidez articular y muscular", "Movimientos reducidos", "Debilidad muscular", "Dolor localizado", "Espasmos o endurecimiento palpable en la zona afectada"],
+      causas: ["Sobreesfuerzo físico o sobreuso muscular", "Movimientos bruscos", "Posturas incorrectas o mantenidas", "Estrés, ansiedad o tensión emocional", "Deshidratación"],
+      sistemaId: "sistema-musculoesqueletico",
+    },
+  ],
+};
+
+export default sistema;
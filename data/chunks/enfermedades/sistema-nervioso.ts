@@ -0,0 +1,372 @@
+// Generado automáticamente por scripts/build-catalog.py - no editar a mano
+import type { SistemaCorporal } from '../../enfermedades-expandidas';
+
+const sistema: SistemaCorporal = {
+  id: "sistema-nervioso",
+  nombre: "Sistema Nervioso",
+  icono: "🧠",
+  enfermedades: [
+    {
+      id: "migraña",
+      nombre: "Migraña",
+      otrosNombres: ["Hemicránea", "Jaqueca"],
+      descripcion: "Dolor de cabeza pulsátil e intenso, generalmente en un lado de la cabeza.",
+      sintomas: ["Dolor de cabeza pulsátil", "Sensibilidad a la luz y al sonido", "Náuseas y vómitos", "Auras visuales"],
+      causas: ["Factores genéticos", "Cambios hormonales", "Estrés y ansiedad", "Ciertos alimentos y bebidas"],
+      sistemaId: "sistema-nervioso",
+    },
+    {
+      id: "epilepsia",
+      nombre: "Epilepsia",
+      otrosNombres: ["Trastorno convulsivo"],
+      descripcion: "Trastorno neurológico que causa convulsiones recurrentes.",
+      sintomas: ["Convulsiones recurrentes", "Pérdida de conciencia", "Movimientos espasmódicos incontrolables", "Confusión temporal"],
+      causas: ["Lesión cerebral traumática", "Accidente cerebrovascular", "Infecciones cerebrales", "Trastornos genéticos"],
+      sistemaId: "sistema-nervioso",
+    },
+    {
+      id: "parkinson",
+      nombre: "Parkinson",
+      otrosNombres: ["Mal de Parkinson"],
+      descripcion: "Enfermedad degenerativa que afecta el movimiento, causando temblores y rigidez.",
+      sintomas: ["Temblores en reposo", "Rigidez muscular", "Lentitud de movimiento (bradicinesia)", "Inestabilidad postural"],
+      causas: ["Pérdida de neuronas productoras de dopamina", "Factores genéticos", "Exposición a toxinas ambientales"],
+      sistemaId: "sistema-nervioso",
+    },
+    {
+      id: "alzheimer",
+      nombre: "Alzheimer",
+      otrosNombres: ["Mal de Alzheimer"],
+      descripcion: "Enfermedad progresiva que destruye la memoria y otras funciones mentales importantes.",
+      sintomas: ["Pérdida de memoria progresiva", "Dificultad para resolver problemas", "Desorientación en tiempo y lugar", "Cambios en el estado de ánimo y la personalidad"],
+      causas: ["Acumulación de placas de beta-amiloide en el cerebro", "Ovillos de proteína tau", "Factores genéticos", "Edad avanzada"],
+      sistemaId: "sistema-nervioso",
+    },
+    {
+      id: "esclerosis-múltiple",
+      nombre: "Esclerosis múltiple",
+      otrosNombres: ["EM"],
+      descripcion: "Enfermedad en la que el sistema inmunológico degrada la cubierta protectora de los nervios.",
+      sintomas: ["Fatiga", "Dificultad para caminar", "Entumecimiento u hormigueo en el cuerpo", "Problemas de visión"],
+      causas: ["Enfermedad autoinmune que ataca la mielina", "Predisposición genética", "Factores ambientales desconocidos"],
+      sistemaId: "sistema-nervioso",
+    },
+    {
+      id: "neuralgia",
+      nombre: "Neuralgia",
+      otrosNombres: ["Dolor neuropático"],
+      descripcion: "Dolor agudo y espantoso que sigue la ruta de un nervio y se debe a la irritación o daño al nervio.",
+      sintomas: ["Dolor agudo y punzante a lo largo de un nervio", "Sensibilidad extrema al tacto", "Espasmos musculares"],
+      causas: ["Compresión de un nervio", "Infecciones (como el herpes zóster)", "Lesiones nerviosas"],
+      sistemaId: "sistema-nervioso",
+    },
+    {
+      id: "neuropatía",
+      nombre: "Neuropatía",
+      otrosNombres: ["Neuropatía periférica"],
+      descripcion: "Daño a los nervios fuera del cerebro y la médula espinal (nervios periféricos), que a menudo causa debilidad, entumecimiento y dolor, generalmente en las manos y los pies.",
+      sintomas: ["Entumecimiento, hormigueo o ardor en manos y pies", "Debilidad muscular", "Pérdida de coordinación", "Dolor agudo y punzante"],
+      causas: ["Diabetes", "Deficiencias vitamínicas", "Alcoholismo crónico", "Infecciones"],
+      sistemaId: "sistema-nervioso",
+    },
+    {
+      id: "vértigo",
+      nombre: "Vértigo",
+      otrosNombres: ["Mareo"],
+      descripcion: "Sensación giratoria repentina que se inicia o empeora con el movimiento de la cabeza.",
+      sintomas: ["Sensación de que todo da vueltas", "Pérdida de equilibrio", "Náuseas y vómitos", "Movimientos oculares anormales (nistagmo)"],
+      causas: ["Problemas en el oído interno (como la VPPB)", "Enfermedad de Meniere", "Migrañas vestibulares"],
+      sistemaId: "sistema-nervioso",
+    },
+    {
+      id: "insomnio",
+      nombre: "Insomnio",
+      otrosNombres: ["Trastorno de insomnio crónico"],
+      descripcion: "Trastorno del sueño en el que las personas tienen problemas para conciliar el sueño, permanecer dormidas o ambas cosas.",
+      sintomas: ["Dificultad para conciliar el sueño", "Dificultad para mantener el sueño (despertarse con frecuencia)", "Despertarse demasiado temprano y no poder volver a dormirse", "Sueño no reparador", "Fatiga diurna o somnolencia"],
+      causas: ["Estrés y ansiedad", "Malos hábitos de sueño", "Trastornos del estado de ánimo como la depresión", "Afecciones médicas y dolor crónico"],
+      sistemaId: "sistema-nervioso",
+    },
+    {
+      id: "accidente-cerebrovascular-acv",
+      nombre: "Accidente cerebrovascular (ACV)",
+      otrosNombres: ["Ictus", "Infarto cerebral", "Derrame cerebral"],
+      descripcion: "Daño al cerebro por interrupción de su suministro de sangre.",
+      sintomas: ["Entumecimiento o debilidad repentina en la cara, brazo o pierna", "Confusión repentina, dificultad para hablar", "Problemas repentinos de visión", "Dolor de cabeza intenso y repentino"],
+      causas: ["Bloqueo del flujo sanguíneo al cerebro (isquémico)", "Sangrado en el cerebro (hemorrágico)", "Presión arterial alta", "Fibrilación auricular"],
+      sistemaId: "sistema-nervioso",
+    },
+    {
+      id: "aneurisma-cerebral",
+      nombre: "Aneurisma cerebral",
+      otrosNombres: ["Aneurisma intracraneal"],
+      descripcion: "Un punto débil o delgado en una arteria del cerebro que se hincha o se abomba y se llena de sangre.",
+      sintomas: ["Dolor de cabeza súbito e intenso", "Náuseas y vómitos", "Rigidez en el cuello", "Visión borrosa o doble"],
+      causas: ["Debilidad en la pared de un vaso sanguíneo cerebral", "Presión arterial alta", "Tabaquismo", "Antecedentes familiares"],
+      sistemaId: "sistema-nervioso",
+    },
+    {
+      id: "tumor-cerebral",
+      nombre: "Tumor cerebral",
+      otrosNombres: ["Neoplasia cerebral"],
+      descripcion: "Crecimiento de células anormales en el tejido del cerebro.",
+      sintomas: ["Dolores de cabeza persistentes", "Convulsiones", "Cambios en la personalidad o el comportamiento", "Problemas de visión o audición"],
+      causas: ["Crecimiento anormal de células en el cerebro", "Exposición a la radiación", "Antecedentes familiares"],
+      sistemaId: "sistema-nervioso",
+    },
+    {
+      id: "esclerosis-lateral-amiotrófica-ela",
+      nombre: "Esclerosis lateral amiotrófica (ELA)",
+      otrosNombres: ["Enfermedad de Lou Gehrig"],
+      descripcion: "Enfermedad del sistema nervioso que debilita los músculos y afecta las funciones físicas.",
+      sintomas: ["Debilidad muscular progresiva", "Dificultad para hablar y tragar", "Espasmos y calambres musculares", "Pérdida de la capacidad para moverse"],
+      causas: ["Degeneración de las neuronas motoras", "Factores genéticos", "Causas desconocidas en la mayoría de los casos"],
+      sistemaId: "sistema-nervioso",
+    },
+    {
+      id: "hernia-de-disco",
+      nombre: "Hernia de disco",
+      otrosNombres: ["Disco deslizado", "Disco roto"],
+      descripcion: "Problema con uno de los amortiguadores cartilaginosos (discos) entre los huesos individuales (vértebras) que se apilan para formar la columna vertebral.",
+      sintomas: ["Dolor de espalda o cuello", "Dolor que se irradia a los brazos o las piernas", "Entumecimiento u hormigueo", "Debilidad muscular"],
+      causas: ["Desgaste gradual relacionado con la edad (degeneración del disco)", "Levantamiento de objetos pesados de forma incorrecta", "Lesión en la espalda"],
+      sistemaId: "sistema-nervioso",
+    },
+    {
+      id: "enfermedad-de-huntington",
+      nombre: "Enfermedad de Huntington",
+      otrosNombres: ["Corea de Huntington"],
+      descripcion: "Enfermedad hereditaria que provoca el desgaste de algunas células nerviosas del cerebro.",
+      sintomas: ["Movimientos involuntarios (corea)", "Deterioro cognitivo", "Cambios psiquiátricos (depresión, irritabilidad)", "Dificultad para caminar y hablar"],
+      causas: ["Mutación en el gen HTT", "Trastorno genético hereditario"],
+      sistemaId: "sistema-nervioso",
+    },
+    {
+      id: "demencia-con-cuerpos-de-lewy",
+      nombre: "Demencia con cuerpos de Lewy",
+      otrosNombres: ["DCL"],
+      descripcion: "Tipo de demencia progresiva que conduce a una disminución de las capacidades de pensamiento, razonamiento y función independiente.",
+      sintomas: ["Fluctuaciones en la atención y el estado de alerta", "Alucinaciones visuales recurrentes", "Síntomas de parkinsonismo (rigidez, temblores)", "Trastornos del sueño"],
+      causas: ["Acumulación de depósitos de proteína (cuerpos de Lewy) en el cerebro", "Edad avanzada"],
+      sistemaId: "sistema-nervioso",
+    },
+    {
+      id: "ataxia-de-friedreich",
+      nombre: "Ataxia de Friedreich",
+      otrosNombres: ["AFT"],
+      descripcion: "Enfermedad hereditaria que causa daño progresivo al sistema nervioso.",
+      sintomas: ["Dificultad para caminar y mantener el equilibrio", "Debilidad muscular en brazos y piernas", "Problemas del habla (disartria)", "Cardiomiopatía"],
+      causas: ["Mutación en el gen FXN", "Trastorno genético hereditario"],
+      sistemaId: "sistema-nervioso",
+    },
+    {
+      id: "síndrome-de-la-persona-rígida",
+      nombre: "Síndrome de la persona rígida",
+      otrosNombres: ["SPR"],
+      descripcion: "Trastorno neurológico raro con características de una enfermedad autoinmune.",
+      sintomas: ["Rigidez muscular progresiva", "Espasmos musculares dolorosos", "Postura encorvada", "Sensibilidad aumentada al ruido y al tacto"],
+      causas: ["Enfermedad autoinmune que ataca el sistema nervioso central", "Asociación con otras enfermedades autoinmunes"],
+      sistemaId: "sistema-nervioso",
+    },
+    {
+      id: "encefalitis",
+      nombre: "Encefalitis",
+      otrosNombres: ["Inflamación del cerebro"],
+      descripcion: "Inflamación del cerebro, a menudo debida a una infección.",
+      sintomas: ["Fiebre", "Dolor de cabeza intenso", "Confusión", "Convulsiones"],
+      causas: ["Infección viral (como el herpes simple)", "Reacción autoinmune", "Picaduras de mosquitos o garrapatas"],
+      sistemaId: "sistema-nervioso",
+    },
+    {
+      id: "enfermedad-de-charcot-marie-tooth",
+      nombre: "Enfermedad de Charcot-Marie-Tooth",
+      otrosNombres: ["CMT"],
+      descripcion: "Grupo de trastornos hereditarios que causan daño a los nervios.",
+      sintomas: ["Debilidad y atrofia muscular en pies y piernas", "Pies cavos (arco alto)", "Pérdida de sensibilidad en los pies", "Dificultad para caminar"],
+      causas: ["Mutaciones genéticas que afectan los nervios periféricos", "Trastorno hereditario"],
+      sistemaId: "sistema-nervioso",
+    },
+    {
+      id: "enfermedades-de-las-neuronas-motoras",
+      nombre: "Enfermedades de las neuronas motoras",
+      otrosNombres: ["ENM"],
+      descripcion: "Grupo de enfermedades neurodegenerativas progresivas que atacan a las neuronas motoras.",
+      sintomas: ["Debilidad muscular progresiva", "Atrofia muscular", "Dificultad para hablar y tragar", "Espasticidad"],
+      causas: ["Degeneración de las neuronas motoras en el cerebro y la médula espinal", "Factores genéticos (en algunos casos)", "Causas desconocidas en la mayoría de los casos"],
+      sistemaId: "sistema-nervioso",
+    },
+    {
+      id: "enfermedad-de-von-hippel-lindau",
+      nombre: "Enfermedad de von Hippel-Lindau",
+      otrosNombres: ["VHL"],
+      descripcion: "Trastorno hereditario caracterizado por el crecimiento de tumores y quistes en varias partes del cuerpo.",
+      sintomas: ["Tumores en el sistema nervioso central", "Quistes en riñones, páncreas y otros órganos", "Hemangioblastomas en la retina", "Feocromocitoma"],
+      causas: ["Mutación en el gen VHL", "Trastorno genético hereditario"],
+      sistemaId: "sistema-nervioso",
+    },
+    {
+      id: "enfermedades-de-la-médula-espinal",
+      nombre: "Enfermedades de la médula espinal",
+      otrosNombres: ["Mielopatía"],
+      descripcion: "Término general para los trastornos de la médula espinal.",
+      sintomas: ["Pérdida de sensibilidad por debajo de la lesión", "Debilidad o parálisis muscular", "Pérdida del control de la vejiga y los intestinos", "Dolor neuropático"],
+      causas: ["Traumatismos (accidentes, caídas)", "Tumores", "Infecciones", "Enfermedades degenerativas"],
+      sistemaId: "sistema-nervioso",
+    },
+    {
+      id: "absceso-cerebral-parasitario",
+      nombre: "Absceso cerebral parasitario",
+      otrosNombres: ["Neurocisticercosis"],
+      descripcion: "Infección parasitaria del cerebro que puede causar convulsiones y otros síntomas neurológicos.",
+      sintomas: ["Dolor de cabeza", "Fiebre", "Convulsiones", "Déficits neurológicos focales"],
+      causas: ["Infección por parásitos como Taenia solium (cisticercosis)", "Diseminación de una infección de otra parte del cuerpo"],
+      sistemaId: "sistema-nervioso",
+    },
+    {
+      id: "absceso-raquídeo",
+      nombre: "Absceso raquídeo",
+      otrosNombres: ["Absceso epidural espinal"],
+      descripcion: "Acumulación de pus en el espacio epidural que puede comprimir la médula espinal.",
+      sintomas: ["Dolor de espalda localizado", "Fiebre", "Debilidad o parálisis de las piernas", "Pérdida del control de esfínteres"],
+      causas: ["Infección bacteriana (generalmente Staphylococcus aureus)", "Diseminación desde una infección cercana"],
+      sistemaId: "sistema-nervioso",
+    },
+    {
+      id: "accidente-isquémico-transitorio",
+      nombre: "Accidente isquémico transitorio",
+      otrosNombres: ["AIT"],
+      descripcion: "Mini-accidente cerebrovascular; un breve bloqueo del flujo sanguíneo al cerebro.",
+      sintomas: ["Síntomas similares a un ACV que duran poco tiempo", "Entumecimiento o debilidad facial/extremidades", "Dificultad para hablar o entender", "Pérdida de visión súbita"],
+      causas: ["Interrupción temporal del flujo sanguíneo a una parte del cerebro", "Coágulo de sangre", "Aterosclerosis"],
+      sistemaId: "sistema-nervioso",
+    },
+    {
+      id: "adrenoleucodistrofia",
+      nombre: "Adrenoleucodistrofia",
+      otrosNombres: ["ALD"],
+      descripcion: "Enfermedad genética que afecta las glándulas suprarrenales y la materia blanca del cerebro.",
+      sintomas: ["Problemas de comportamiento y aprendizaje", "Pérdida de la visión y la audición", "Deterioro neurológico progresivo", "Insuficiencia suprarrenal"],
+      causas: ["Mutación en el gen ABCD1", "Trastorno genético ligado al cromosoma X"],
+      sistemaId: "sistema-nervioso",
+    },
+    {
+      id: "afasia",
+      nombre: "Afasia",
+      otrosNombres: ["Disfasia"],
+      descripcion: "Trastorno del lenguaje que afecta la capacidad de comunicación.",
+      sintomas: ["Dificultad para encontrar las palabras correctas", "Habla telegráfica (frases cortas e incompletas)", "Dificultad para entender el lenguaje hablado o escrito", "Sustitución de palabras o sonidos"],
+      causas: ["Daño cerebral por ACV", "Lesión cerebral traumática", "Tumor cerebral", "Infección"],
+      sistemaId: "sistema-nervioso",
+    },
+    {
+      id: "laberintitis",
+      nombre: "Laberintitis",
+      otrosNombres: ["Neuronitis vestibular"],
+      descripcion: "Trastorno del oído interno que causa vértigo, mareos y pérdida del equilibrio.",
+      sintomas: ["Vértigo severo", "Pérdida de audición", "Zumbido en los oídos (tinnitus)", "Náuseas y vómitos"],
+      causas: ["Infección viral o bacteriana del oído interno", "Reactivación de un virus latente"],
+      sistemaId: "sistema-nervioso",
+    },
+    {
+      id: "enfermedad-de-lafora",
+      nombre: "Enfermedad de Lafora",
+      otrosNombres: ["Epilepsia mioclónica progresiva de Lafora"],
+      descripcion: "Forma rara y grave de epilepsia mioclónica progresiva.",
+      sintomas: ["Convulsiones mioclónicas y tónico-clónicas", "Deterioro cognitivo progresivo", "Alucinaciones visuales", "Ataxia"],
+      causas: ["Mutaciones en los genes EPM2A o NHLRC1", "Trastorno genético hereditario recesivo"],
+      sistemaId: "sistema-nervioso",
+    },
+    {
+      id: "síndrome-de-landau-kleffner",
+      nombre: "Síndrome de Landau-Kleffner",
+      otrosNombres: ["Afasia epiléptica adquirida"],
+      descripcion: "Trastorno neurológico infantil raro caracterizado por la pérdida repentina o gradual de la capacidad para comprender y usar el lenguaje hablado.",
+      sintomas: ["Pérdida de la capacidad para entender y usar el lenguaje (afasia)", "Anomalías en el electroencefalograma (EEG) durante el sueño", "Convulsiones (en la mayoría de los casos)", "Problemas de comportamiento"],
+      causas: ["Causa exacta desconocida", "Posiblemente relacionado con procesos inflamatorios o autoinmunes"],
+      sistemaId: "sistema-nervioso",
+    },
+    {
+      id: "síndrome-de-leigh",
+      nombre: "Síndrome de Leigh",
+      otrosNombres: ["Encefalomielopatía necrotizante subaguda"],
+      descripcion: "Trastorno neurometabólico hereditario raro que afecta el sistema nervioso central.",
+      sintomas: ["Pérdida de habilidades motoras previamente adquiridas", "Vómitos, diarrea y dificultad para tragar", "Irritabilidad y llanto continuo", "Convulsiones"],
+      causas: ["Mutaciones en genes del ADN mitocondrial o nuclear", "Trastorno neurodegenerativo progresivo"],
+      sistemaId: "sistema-nervioso",
+    },
+    {
+      id: "leucoaraiosis",
+      nombre: "Leucoaraiosis",
+      otrosNombres: ["Rarefacción de la sustancia blanca"],
+      descripcion: "Cambios en la sustancia blanca del cerebro que a menudo se observan en personas mayores.",
+      sintomas: ["A menudo asintomático al principio", "Deterioro cognitivo leve", "Problemas de equilibrio y marcha", "Aumento del riesgo de ACV"],
+      causas: ["Enfermedad de los pequeños vasos sanguíneos del cerebro", "Hipertensión arterial crónica", "Edad avanzada"],
+      sistemaId: "sistema-nervioso",
+    },
+    {
+      id: "leucodistrofia-metacromática",
+      nombre: "Leucodistrofia metacromática",
+      otrosNombres: ["LDM"],
+      descripcion: "Enfermedad de almacenamiento lisosómico que causa la desmielinización del sistema nervioso.",
+      sintomas: ["Pérdida de la capacidad para caminar y hablar", "Rigidez muscular", "Deterioro mental progresivo", "Pérdida de la sensibilidad en extremidades"],
+      causas: ["Deficiencia de la enzima arilsulfatasa A", "Acumulación de sulfátidos en el sistema nervioso"],
+      sistemaId: "sistema-nervioso",
+    },
+    {
+      id: "leucoencefalopatía",
+      nombre: "Leucoencefalopatía",
+      otrosNombres: ["Enfermedad de la sustancia blanca"],
+      descripcion: "Término amplio para las enfermedades que afectan la sustancia blanca del cerebro.",
+      sintomas: ["Deterioro cognitivo y motor progresivo", "Cambios de personalidad", "Ataxia", "Espasticidad"],
+      causas: ["Amplio grupo de trastornos que afectan la sustancia blanca del cerebro", "Causas genéticas, infecciosas o tóxicas"],
+      sistemaId: "sistema-nervioso",
+    },
+    {
+      id: "ausencia-del-tabique-pelúcido",
+      nombre: "Ausencia del tabique pelúcido",
+      otrosNombres: ["ASP"],
+      descripcion: "Ausencia del tabique pelúcido, una membrana delgada en el centro del cerebro.",
+      sintomas: ["Puede ser asintomático", "Retraso en el desarrollo", "Discapacidad visual", "Convulsiones"],
+      causas: ["Anomalía congénita del cerebro", "Asociado con otros trastornos del desarrollo cerebral"],
+      sistemaId: "sistema-nervioso",
+    },
+    {
+      id: "enfermedad-por-depósito-de-lípidos-ácidos",
+      nombre: "Enfermedad por depósito de lípidos ácidos",
+      otrosNombres: ["Enfermedad de Wolman"],
+      descripcion: "Enfermedad de almacenamiento lisosómico rara y grave.",
+      sintomas: ["Hepatoesplenomegalia (agrandamiento de hígado y bazo)", "Retraso del crecimiento", "Diarrea y vómitos crónicos", "Deterioro neurológico en formas graves"],
+      causas: ["Deficiencia de la enzima lipasa ácida lisosomal", "Trastorno genético hereditario"],
+      sistemaId: "sistema-nervioso",
+    },
+    {
+      id: "dolor-de-espalda",
+      nombre: "Dolor de espalda",
+      otrosNombres: ["Lumbalgia"],
+      descripcion: "Dolor en la parte baja de la espalda.",
+      sintomas: ["Dolor muscular o punzante en la espalda", "Dolor que se irradia hacia la pierna", "Movilidad limitada o rigidez de la espalda", "Dolor que empeora al estar de pie o sentado"],
+      causas: ["Tensión muscular o de ligamentos", "Hernia de disco", "Artritis", "Malas posturas"],
+      sistemaId: "sistema-nervioso",
+    },
+    {
+      id: "síndrome-de-barth",
+      nombre: "Síndrome de Barth",
+      otrosNombres: ["BTHS"],
+      descripcion: "Trastorno genético raro que afecta principalmente a los hombres y causa miocardiopatía, neutropenia y debilidad muscular.",
+      sintomas: ["Cardiomiopatía (músculo cardíaco debilitado)", "Neutropenia (bajo número de glóbulos blancos)", "Debilidad muscular y retraso motor", "Retraso del crecimiento"],
+      causas: ["Mutación en el gen TAZ (tafazzin)", "Trastorno genético ligado al cromosoma X"],
+      sistemaId: "sistema-nervioso",
+    },
+    {
+      id: "cadasil",
+      nombre: "CADASIL",
+      otrosNombres: ["Arteriopatía cerebral autosómica dominante con infartos subcorticales y leucoencefalopatía"],
+      descripcion: "Forma hereditaria de enfermedad cerebrovascular que ocurre cuando el engrosamiento de las paredes de los vasos sanguíneos bloquea el flujo de sangre al cerebro.",
+      sintomas: ["Migrañas con aura", "Accidentes cerebrovasculares isquémicos recurrentes", "Trastornos del estado de ánimo", "Demencia progresiva"],
+      causas: ["Mutaciones en el gen NOTCH3", "Trastorno genético hereditario dominante"],
+      sistemaId: "sistema-nervioso",
+    },
+  ],
+};
+
+export default sistema;
@@ -0,0 +1,327 @@
+// Generado automáticamente por scripts/build-catalog.py - no editar a mano
+import type { SistemaCorporal } from '../../enfermedades-expandidas';
+
+const sistema: SistemaCorporal = {
+  id: "sistema-reproductor",
+  nombre: "Sistema Reproductor",
+  icono: "🧬",
+  enfermedades: [
+    {
+      id: "endometriosis",
+      nombre: "Endometriosis",
+      otrosNombres: ["Adenomyosis", "Endometrioma"],
+      descripcion: "Trastorno en el que el tejido que normalmente recubre el interior del útero crece fuera del útero.",
+      sintomas: ["Dolor pélvico intenso, especialmente durante la menstruación", "Períodos menstruales abundantes o irregulares", "Dolor durante o después de las relaciones sexuales", "Infertilidad", "Fatiga y problemas intestinales"],
+      causas: ["Crecimiento de tejido similar al endometrio fuera del útero", "Factores genéticos y hereditarios", "Disfunción del sistema inmunológico", "Menstruación retrógrada (flujo menstrual hacia la pelvis)"],
+      sistemaId: "sistema-reproductor",
+    },
+    {
+      id: "sindrome-de-ovario-poliquistico",
+      nombre: "Síndrome de Ovario Poliquístico (SOP)",
+      otrosNombres: ["PCOS", "Síndrome de Stein-Leventhal"],
+      descripcion: "Un trastorno hormonal común entre las mujeres en edad reproductiva.",
+      sintomas: ["Períodos menstruales irregulares o ausentes", "Exceso de vello facial y corporal (hirsutismo)", "Acné severo y piel grasa", "Aumento de peso y dificultad para perderlo", "Quistes en los ovarios"],
+      causas: ["Desequilibrio hormonal con altos niveles de andrógenos", "Resistencia a la insulina", "Factores genéticos y hereditarios", "Inflamación crónica de bajo grado"],
+      sistemaId: "sistema-reproductor",
+    },
+    {
+      id: "enfermedad-inflamatoria-pelvica",
+      nombre: "Enfermedad Inflamatoria Pélvica (EIP)",
+      otrosNombres: ["Salpingitis", "Ooforitis"],
+      descripcion: "Infección de los órganos reproductores femeninos.",
+      sintomas: ["Dolor en la parte baja del abdomen y la pelvis", "Flujo vaginal anormal con mal olor", "Sangrado entre períodos o después de las relaciones sexuales", "Fiebre y escalofríos", "Dolor al orinar"],
+      causas: ["Infección bacteriana que asciende desde la vagina o el cuello uterino", "Infecciones de transmisión sexual (ITS) no tratadas, como clamidia y gonorrea", "Duchas vaginales frecuentes que alteran el equilibrio bacteriano", "Procedimientos ginecológicos previos"],
+      sistemaId: "sistema-reproductor",
+    },
+    {
+      id: "fibromas-uterinos",
+      nombre: "Fibromas Uterinos",
+      otrosNombres: ["Leiomiomas", "Miomas"],
+      descripcion: "Tumores no cancerosos del útero que a menudo aparecen durante los años fértiles.",
+      sintomas: ["Sangrado menstrual abundante y prolongado", "Presión o dolor pélvico", "Necesidad de orinar con frecuencia", "Estreñimiento y dolor de espalda", "Dolor durante las relaciones sexuales"],
+      causas: ["Crecimiento no canceroso de tejido muscular en el útero", "Factores hormonales, especialmente estrógeno y progesterona", "Predisposición genética", "Deficiencia de vitamina D"],
+      sistemaId: "sistema-reproductor",
+    },
+    {
+      id: "cancer-de-ovario",
+      nombre: "Cáncer de Ovario",
+      otrosNombres: ["Carcinoma de ovario"],
+      descripcion: "Un crecimiento de células que se forma en los ovarios.",
+      sintomas: ["Hinchazón o inflamación abdominal persistente", "Sensación de saciedad rápida al comer", "Dolor pélvico o abdominal", "Necesidad de orinar con más frecuencia o urgencia", "Fatiga extrema y pérdida de peso inexplicable"],
+      causas: ["Mutaciones genéticas hereditarias (BRCA1 y BRCA2)", "Antecedentes familiares de cáncer de ovario, mama o colorrectal", "Edad avanzada (postmenopausia)", "Endometriosis o terapia de reemplazo hormonal"],
+      sistemaId: "sistema-reproductor",
+    },
+    {
+      id: "cancer-de-cuello-uterino",
+      nombre: "Cáncer de Cuello Uterino",
+      otrosNombres: ["Cáncer cervical"],
+      descripcion: "Un tipo de cáncer que se produce en las células del cuello uterino.",
+      sintomas: ["Sangrado vaginal anormal (entre períodos, después de las relaciones sexuales o después de la menopausia)", "Flujo vaginal inusual, a veces con sangre", "Dolor pélvico o durante las relaciones sexuales", "Problemas para orinar o defecar"],
+      causas: ["Infección persistente por el virus del papiloma humano (VPH)", "Sistema inmunitario debilitado", "Tabaquismo", "Uso prolongado de anticonceptivos orales"],
+      sistemaId: "sistema-reproductor",
+    },
+    {
+      id: "prolapso-de-organos-pelvicos",
+      nombre: "Prolapso de Órganos Pélvicos",
+      otrosNombres: ["Cistocele", "Rectocele"],
+      descripcion: "Ocurre cuando los músculos y ligamentos que sostienen los órganos pélvicos de una mujer se debilitan.",
+      sintomas: ["Sensación de pesadez o presión en la pelvis", "Bulto o protuberancia en la vagina", "Incontinencia urinaria o fecal", "Dificultad para vaciar la vejiga o los intestinos", "Dolor lumbar"],
+      causas: ["Debilitamiento de los músculos y ligamentos del suelo pélvico", "Embarazo y parto vaginal", "Envejecimiento y menopausia", "Obesidad y tos crónica"],
+      sistemaId: "sistema-reproductor",
+    },
+    {
+      id: "vaginosis-bacteriana",
+      nombre: "Vaginosis Bacteriana",
+      otrosNombres: ["VB"],
+      descripcion: "Un tipo de inflamación vaginal causada por el crecimiento excesivo de bacterias que se encuentran naturalmente en la vagina.",
+      sintomas: ["Flujo vaginal anormal (blanco o grisáceo)", "Olor vaginal fuerte y desagradable (a pescado)", "Picazón o irritación vaginal", "Ardor al orinar"],
+      causas: ["Desequilibrio de la flora bacteriana normal de la vagina", "Duchas vaginales frecuentes", "Tener múltiples parejas sexuales", "Fumar"],
+      sistemaId: "sistema-reproductor",
+    },
+    {
+      id: "candidiasis-vaginal",
+      nombre: "Candidiasis Vaginal",
+      otrosNombres: ["Infección por levaduras"],
+      descripcion: "Una infección por hongos que causa irritación, secreción y picazón intensa en la vagina y la vulva.",
+      sintomas: ["Picazón y ardor intensos en la vagina y la vulva", "Flujo vaginal espeso, blanco y grumoso (similar al requesón)", "Enrojecimiento e hinchazón de la vulva", "Dolor durante las relaciones sexuales"],
+      causas: ["Crecimiento excesivo del hongo Candida albicans", "Uso de antibióticos", "Sistema inmunitario debilitado", "Diabetes no controlada"],
+      sistemaId: "sistema-reproductor",
+    },
+    {
+      id: "menopausia",
+      nombre: "Menopausia",
+      otrosNombres: ["Climaterio"],
+      descripcion: "El momento que marca el final de los ciclos menstruales.",
+      sintomas: ["Sofocos y sudores nocturnos", "Irregularidades menstruales hasta el cese de la menstruación", "Sequedad vaginal y disminución de la libido", "Cambios de humor, irritabilidad y problemas para dormir", "Piel seca y adelgazamiento del cabello"],
+      causas: ["Disminución natural de la producción de estrógeno y progesterona por los ovarios", "Envejecimiento (generalmente entre los 45 y 55 años)", "Extirpación quirúrgica de los ovarios (histerectomía)", "Tratamientos contra el cáncer como quimioterapia o radioterapia"],
+      sistemaId: "sistema-reproductor",
+    },
+    {
+      id: "sindrome-premenstrual",
+      nombre: "Síndrome Premenstrual (SPM)",
+      otrosNombres: ["Tensión premenstrual"],
+      descripcion: "Un conjunto de síntomas físicos y emocionales que comienzan una o dos semanas antes del período de una mujer.",
+      sintomas: ["Hinchazón y sensibilidad en los senos", "Cambios de humor, irritabilidad y ansiedad", "Fatiga y dificultad para concentrarse", "Antojos de alimentos y aumento de peso", "Dolores de cabeza y musculares"],
+      causas: ["Fluctuaciones hormonales del ciclo menstrual", "Cambios en los niveles de serotonina en el cerebro", "Factores genéticos", "Deficiencias de vitaminas y minerales"],
+      sistemaId: "sistema-reproductor",
+    },
+    {
+      id: "disfuncion-erectil",
+      nombre: "Disfunción Eréctil",
+      otrosNombres: ["Impotencia"],
+      descripcion: "La incapacidad de conseguir o mantener una erección lo suficientemente firme para tener relaciones sexuales.",
+      sintomas: ["Dificultad para lograr una erección", "Dificultad para mantener una erección", "Disminución del deseo sexual"],
+      causas: ["Enfermedades cardíacas y vasculares", "Diabetes y obesidad", "Trastornos neurológicos (esclerosis múltiple, Parkinson)", "Factores psicológicos como estrés, ansiedad o depresión"],
+      sistemaId: "sistema-reproductor",
+    },
+    {
+      id: "prostatitis",
+      nombre: "Prostatitis",
+      otrosNombres: ["Inflamación de la próstata"],
+      descripcion: "Hinchazón e inflamación de la glándula prostática.",
+      sintomas: ["Dolor o ardor al orinar", "Dificultad para orinar, como goteo o vacilación urinaria", "Dolor en la ingle, el área pélvica o los genitales", "Eyaculación dolorosa", "Síntomas similares a los de la gripe (en la prostatitis bacteriana aguda)"],
+      causas: ["Infección bacteriana que se disemina desde el tracto urinario", "Inflamación no bacteriana", "Daño a los nervios en el tracto urinario inferior debido a una cirugía o traumatismo", "Estrés y factores emocionales"],
+      sistemaId: "sistema-reproductor",
+    },
+    {
+      id: "hiperplasia-prostatica-benigna",
+      nombre: "Hiperplasia Prostática Benigna (HPB)",
+      otrosNombres: ["Agrandamiento de la próstata"],
+      descripcion: "Un agrandamiento no canceroso de la glándula prostática.",
+      sintomas: ["Necesidad de orinar con frecuencia, especialmente por la noche", "Dificultad para comenzar a orinar", "Chorro de orina débil o que se detiene y comienza", "Goteo al final de la micción", "Incapacidad para vaciar completamente la vejiga"],
+      causas: ["Agrandamiento no canceroso de la glándula prostática", "Cambios hormonales relacionados con el envejecimiento (disminución de testosterona)", "Factores genéticos y antecedentes familiares"],
+      sistemaId: "sistema-reproductor",
+    },
+    {
+      id: "cancer-de-prostata",
+      nombre: "Cáncer de Próstata",
+      otrosNombres: ["Carcinoma de próstata"],
+      descripcion: "Un cáncer en la próstata de un hombre, una pequeña glándula del tamaño de una nuez que produce el líquido seminal.",
+      sintomas: ["Dificultad para comenzar a orinar", "Flujo de orina débil o interrumpido", "Necesidad de orinar con frecuencia, especialmente por la noche", "Sangre en la orina o en el semen", "Dolor en la espalda, las caderas o la pelvis"],
+      causas: ["Edad avanzada (el riesgo aumenta después de los 50 años)", "Antecedentes familiares de cáncer de próstata", "Factores genéticos y mutaciones hereditarias", "Obesidad"],
+      sistemaId: "sistema-reproductor",
+    },
+    {
+      id: "cancer-de-testiculo",
+      nombre: "Cáncer de Testículo",
+      otrosNombres: ["Carcinoma testicular"],
+      descripcion: "Un crecimiento de células que se forma en los testículos.",
+      sintomas: ["Bulto o hinchazón indolora en un testículo", "Sensación de pesadez en el escroto", "Dolor sordo en el abdomen o la ingle", "Acumulación repentina de líquido en el escroto", "Dolor o molestia en un testículo o en el escroto"],
+      causas: ["Criptorquidia (testículo no descendido)", "Antecedentes familiares de cáncer de testículo", "Infección por VIH", "Carcinoma in situ testicular"],
+      sistemaId: "sistema-reproductor",
+    },
+    {
+      id: "varicocele",
+      nombre: "Varicocele",
+      otrosNombres: ["Venas varicosas del escroto"],
+      descripcion: "Un agrandamiento de las venas dentro de la bolsa de piel suelta que contiene los testículos (escroto).",
+      sintomas: ["Venas agrandadas y retorcidas en el escroto (a menudo descritas como una 'bolsa de gusanos')", "Dolor sordo o molestia en el escroto", "Atrofia testicular (encogimiento de un testículo)", "Infertilidad"],
+      causas: ["Mal funcionamiento de las válvulas dentro de las venas del cordón espermático", "Compresión de una vena por una estructura cercana", "Generalmente ocurre en el lado izquierdo debido a la posición de la vena testicular izquierda"],
+      sistemaId: "sistema-reproductor",
+    },
+    {
+      id: "hidrocele",
+      nombre: "Hidrocele",
+      otrosNombres: ["Acumulación de líquido en el escroto"],
+      descripcion: "Un tipo de hinchazón en el escroto que ocurre cuando se acumula líquido en la delgada vaina que rodea un testículo.",
+      sintomas: ["Hinchazón indolora de uno o ambos testículos", "Sensación de pesadez en el escroto", "El tamaño de la hinchazón puede variar a lo largo del día"],
+      causas: ["Acumulación de líquido en la túnica que rodea el testículo", "Obstrucción del flujo de líquido o sangre en el cordón espermático", "Inflamación o lesión del testículo o epidídimo", "Puede ser congénito en los bebés"],
+      sistemaId: "sistema-reproductor",
+    },
+    {
+      id: "epididimitis",
+      nombre: "Epididimitis",
+      otrosNombres: ["Inflamación del epidídimo"],
+      descripcion: "Inflamación del tubo en la parte posterior del testículo que almacena y transporta los espermatozoides.",
+      sintomas: ["Dolor y sensibilidad en un testículo, que empeora gradualmente", "Escroto hinchado, enrojecido o caliente", "Dolor al orinar o necesidad urgente de orinar", "Secreción del pene", "Dolor durante la eyaculación"],
+      causas: ["Infección bacteriana, a menudo por ITS como clamidia o gonorrea", "Infección del tracto urinario o de la próstata", "Obstrucción en la uretra", "Traumatismo o lesión en la ingle"],
+      sistemaId: "sistema-reproductor",
+    },
+    {
+      id: "orquitis",
+      nombre: "Orquitis",
+      otrosNombres: ["Inflamación de los testículos"],
+      descripcion: "Inflamación de uno o ambos testículos.",
+      sintomas: ["Hinchazón y dolor intenso en uno o ambos testículos", "Fiebre y malestar general", "Náuseas y vómitos", "Sensibilidad extrema en el escroto", "Sangre en el semen"],
+      causas: ["Infección viral, más comúnmente por el virus de las paperas", "Infección bacteriana, a menudo como resultado de una epididimitis no tratada", "Infecciones de transmisión sexual (ITS)"],
+      sistemaId: "sistema-reproductor",
+    },
+    {
+      id: "infertilidad",
+      nombre: "Infertilidad",
+      otrosNombres: ["Esterilidad"],
+      descripcion: "No poder quedar embarazada (concebir) a pesar de tener relaciones sexuales frecuentes y sin protección durante al menos un año.",
+      sintomas: ["Incapacidad para concebir", "Períodos menstruales irregulares o ausentes", "Dolor pélvico crónico", "Cambios en el deseo sexual", "Secreción lechosa de los pezones no relacionada con la lactancia"],
+      causas: ["Trastornos de la ovulación", "Anomalías en el útero o el cuello uterino", "Daño o obstrucción de las trompas de Falopio", "Endometriosis", "Azoospermia"],
+      sistemaId: "sistema-reproductor",
+    },
+    {
+      id: "clamidia",
+      nombre: "Clamidia",
+      otrosNombres: ["Infección por Chlamydia trachomatis"],
+      descripcion: "Una infección de transmisión sexual (ITS) común que puede infectar tanto a hombres como a mujeres.",
+      sintomas: ["A menudo es asintomática", "Secreción anormal del pene o la vagina", "Sensación de ardor al orinar", "Dolor en la parte baja del abdomen o dolor testicular"],
+      causas: ["Infección por la bacteria Chlamydia trachomatis", "Relaciones sexuales vaginales, anales u orales sin protección con una persona infectada"],
+      sistemaId: "sistema-reproductor",
+    },
+    {
+      id: "gonorrea",
+      nombre: "Gonorrea",
+      otrosNombres: ["Blenorragia"],
+      descripcion: "Una infección causada por una bacteria de transmisión sexual que infecta tanto a hombres como a mujeres.",
+      sintomas: ["Secreción anormal del pene (blanca, amarilla o verde) o aumento del flujo vaginal", "Dolor o ardor al orinar", "Dolor e hinchazón en los testículos (en hombres)", "Sangrado entre períodos (en mujeres)"],
+      causas: ["Infección por la bacteria Neisseria gonorrhoeae", "Relaciones sexuales vaginales, anales u orales sin protección con una persona infectada"],
+      sistemaId: "sistema-reproductor",
+    },
+    {
+      id: "herpes-genital",
+      nombre: "Herpes Genital",
+      otrosNombres: ["Virus del herpes simple"],
+      descripcion: "Una infección de transmisión sexual (ITS) común marcada por dolor y llagas en los genitales.",
+      sintomas: ["Dolor o picazón en el área genital, glúteos o muslos internos", "Pequeñas ampollas o úlceras dolorosas", "Costras que se forman cuando las úlceras sanan", "Síntomas similares a la gripe, como fiebre y dolores musculares"],
+      causas: ["Infección por el virus del herpes simple (VHS-1 o VHS-2)", "Contacto sexual con una persona infectada, incluso si no tiene llagas visibles", "Contacto piel con piel con un área infectada"],
+      sistemaId: "sistema-reproductor",
+    },
+    {
+      id: "virus-del-papiloma-humano",
+      nombre: "Virus del Papiloma Humano (VPH)",
+      otrosNombres: ["HPV"],
+      descripcion: "Una infección viral que se transmite entre personas a través del contacto piel con piel.",
+      sintomas: ["A menudo es asintomática", "Verrugas genitales (pequeñas protuberancias o grupos de protuberancias en el área genital)", "Verrugas en otras áreas como las manos o los pies", "En casos de alto riesgo, puede llevar a cáncer cervical, anal, de pene o de garganta"],
+      causas: ["Infección por el virus del papiloma humano (VPH)", "Contacto piel con piel durante la actividad sexual con una persona infectada"],
+      sistemaId: "sistema-reproductor",
+    },
+    {
+      id: "sifilis",
+      nombre: "Sífilis",
+      otrosNombres: ["Lúes"],
+      descripcion: "Una infección bacteriana que generalmente se transmite por contacto sexual.",
+      sintomas: ["Aparición de una úlcera indolora (chancro) en los genitales, recto o boca", "Erupción cutánea que no pica, a menudo en las palmas de las manos y las plantas de los pies", "Fiebre, inflamación de los ganglios linfáticos y dolor de garganta", "En etapas tardías, puede causar daño neurológico y cardiovascular"],
+      causas: ["Infección por la bacteria Treponema pallidum", "Contacto directo con una llaga de sífilis durante la actividad sexual", "Transmisión de madre a hijo durante el embarazo"],
+      sistemaId: "sistema-reproductor",
+    },
+    {
+      id: "tricomoniasis",
+      nombre: "Tricomoniasis",
+      otrosNombres: ["Trich"],
+      descripcion: "Una infección de transmisión sexual (ITS) muy común causada por un parásito.",
+      sintomas: ["Secreción vaginal anormal (amarillenta-verdosa, espumosa y con mal olor)", "Picazón, ardor o enrojecimiento en la zona genital", "Dolor o molestias al orinar", "Dolor durante las relaciones sexuales", "Sangrado o manchado intermenstrual"],
+      causas: ["Infección por el parásito protozoario Trichomonas vaginalis", "Transmisión a través de relaciones sexuales sin protección", "Tener múltiples parejas sexuales", "Antecedentes de otras infecciones de transmisión sexual (ITS)"],
+      sistemaId: "sistema-reproductor",
+    },
+    {
+      id: "embarazo-ectopico",
+      nombre: "Embarazo Ectópico",
+      otrosNombres: ["Embarazo tubárico"],
+      descripcion: "Un embarazo en el que el óvulo fertilizado se implanta fuera del útero.",
+      sintomas: ["Sangrado vaginal anormal", "Dolor agudo en el abdomen, la pelvis, el hombro o el cuello", "Mareos o desmayos", "Dolor en un lado de la pelvis", "Ausencia de periodos"],
+      causas: ["Daño en las trompas de Falopio", "Enfermedad inflamatoria pélvica (EIP)", "Endometriosis", "Edad mayor a 35 años", "Tabaquismo", "Cirugía previa en las trompas de Falopio"],
+      sistemaId: "sistema-reproductor",
+    },
+    {
+      id: "preeclampsia",
+      nombre: "Preeclampsia",
+      otrosNombres: ["Toxemia del embarazo"],
+      descripcion: "Una complicación del embarazo caracterizada por presión arterial alta y signos de daño en otro sistema de órganos, más a menudo el hígado y los riñones.",
+      sintomas: ["Presión arterial alta", "Proteína en la orina", "Hinchazón de manos, pies y cara", "Dolores de cabeza que no desaparecen", "Problemas de visión", "Dolor abdominal en el lado derecho"],
+      causas: ["Embarazo múltiple", "Obesidad", "Ser mayor de 35 años", "Ser afroamericana", "Tener un historial familiar de preeclampsia"],
+      sistemaId: "sistema-reproductor",
+    },
+    {
+      id: "placenta-previa",
+      nombre: "Placenta Previa",
+      otrosNombres: ["Implantación baja de la placenta"],
+      descripcion: "Un problema durante el embarazo en el que la placenta crece en la parte más baja del útero y cubre toda o parte de la abertura hacia el cuello uterino.",
+      sintomas: ["Sangrado vaginal de color rojo brillante sin dolor", "Manchas de sangre antes de una hemorragia mayor", "Contracciones uterinas prematuras y dolorosas", "Sangrado postcoital o durante un examen médico"],
+      causas: ["Cesárea previa", "Cicatrices uterinas por cirugías anteriores", "Placenta previa en embarazo anterior", "Embarazo por reproducción asistida", "Gestación múltiple", "Edad materna avanzada (más de 35 años)", "Tabaquismo", "Consumo de cocaína"],
+      sistemaId: "sistema-reproductor",
+    },
+    {
+      id: "aborto-espontaneo",
+      nombre: "Aborto Espontáneo",
+      otrosNombres: ["Pérdida del embarazo"],
+      descripcion: "La pérdida espontánea de un embarazo antes de la semana 20.",
+      sintomas: ["Sangrado vaginal con o sin dolor", "Dolor o calambres en la zona pélvica o en la parte baja de la espalda", "Líquido o tejido que sale de la vagina", "Latidos rápidos del corazón"],
+      causas: ["Genes o cromosomas irregulares", "Afecciones de salud materna", "Edad mayor de 35 años", "Abortos espontáneos anteriores", "Fumar, consumir alcohol, cafeína y drogas ilícitas"],
+      sistemaId: "sistema-reproductor",
+    },
+    {
+      id: "dispareunia",
+      nombre: "Dispareunia",
+      otrosNombres: ["Coito doloroso"],
+      descripcion: "Dolor genital persistente o recurrente que ocurre justo antes, durante o después de las relaciones sexuales.",
+      sintomas: ["Dolor durante la penetración sexual", "Dolor profundo en la pelvis durante el coito", "Ardor o picazón en la zona genital", "Disminución de la lubricación vaginal", "Sangrado leve después del coito"],
+      causas: ["Sequedad vaginal por falta de lubricación", "Infecciones vaginales o del tracto urinario", "Vaginismo (contracción involuntaria de los músculos vaginales)", "Endometriosis", "Factores psicológicos como ansiedad o estrés"],
+      sistemaId: "sistema-reproductor",
+    },
+    {
+      id: "eyaculacion-precoz",
+      nombre: "Eyaculación Precoz",
+      otrosNombres: ["Eyaculación rápida"],
+      descripcion: "Ocurre cuando un hombre eyacula antes de lo que él o su pareja desearían durante las relaciones sexuales.",
+      sintomas: ["Eyaculación que ocurre siempre o casi siempre antes o dentro del primer minuto de la penetración", "Incapacidad para retrasar la eyaculación", "Angustia y frustración, que llevan a evitar la intimidad sexual"],
+      causas: ["Factores psicológicos como ansiedad de rendimiento o depresión", "Niveles hormonales anormales", "Inflamación o infección de la próstata o la uretra", "Rasgos hereditarios"],
+      sistemaId: "sistema-reproductor",
+    },
+    {
+      id: "anorgasmia",
+      nombre: "Anorgasmia",
+      otrosNombres: ["Disfunción orgásmica"],
+      descripcion: "Dificultad o incapacidad para alcanzar el orgasmo.",
+      sintomas: ["Retraso del orgasmo", "Ausencia del orgasmo", "Menos orgasmos", "Orgasmos menos intensos"],
+      causas: ["Factores psicológicos como abuso o trauma", "Problemas en la relación de pareja", "Ciertas enfermedades y medicamentos", "Consumo de alcohol y tabaco", "Cambios corporales relacionados con la edad"],
+      sistemaId: "sistema-reproductor",
+    },
+    {
+      id: "cistitis-intersticial",
+      nombre: "Cistitis Intersticial",
+      otrosNombres: ["Síndrome de la vejiga dolorosa"],
+      descripcion: "Una afección crónica que causa presión en la vejiga, dolor en la vejiga y, a veces, dolor pélvico.",
+      sintomas: ["Dolor pélvico crónico", "Necesidad urgente y frecuente de orinar", "Dolor durante las relaciones sexuales"],
+      causas: ["Causa desconocida", "Posiblemente autoinmune", "Defecto en el revestimiento de la vejiga"],
+      sistemaId: "sistema-reproductor",
+    },
+  ],
+};
+
+export default sistema;
@@ -0,0 +1,372 @@
+// Generado automáticamente por scripts/build-catalog.py - no editar a mano
+import type { SistemaCorporal } from '../../enfermedades-expandidas';
+
+const sistema: SistemaCorporal = {
+  id: "sistema-respiratorio",
+  nombre: "Sistema Respiratorio",
+  icono: "🫁",
+  enfermedades: [
+    {
+      id: "asma",
+      nombre: "Asma",
+      otrosNombres: ["Asma bronquial"],
+      descripcion: "Enfermedad crónica que causa inflamación y estrechamiento de las vías respiratorias.",
+      sintomas: ["Falta de aire", "Opresión en el pecho", "Sibilancias al exhalar", "Tos persistente"],
+      causas: ["Alergias (polen, ácaros, caspa de animales)", "Infecciones respiratorias", "Ejercicio físico", "Exposición a irritantes (humo, contaminación)"],
+      sistemaId: "sistema-respiratorio",
+    },
+    {
+      id: "bronquitis-aguda",
+      nombre: "Bronquitis Aguda",
+      otrosNombres: ["Resfriado de pecho"],
+      descripcion: "Inflamación de los conductos bronquiales, generalmente causada por una infección.",
+      sintomas: ["Tos con mucosidad", "Dolor de garganta", "Fiebre baja", "Fatiga", "Molestia en el pecho"],
+      causas: ["Infecciones virales (resfriado, gripe)", "Infecciones bacterianas", "Exposición a irritantes (humo de tabaco, polvo)"],
+      sistemaId: "sistema-respiratorio",
+    },
+    {
+      id: "neumonia",
+      nombre: "Neumonía",
+      otrosNombres: ["Pulmonía"],
+      descripcion: "Infección que inflama los sacos de aire en uno o ambos pulmones.",
+      sintomas: ["Fiebre alta y escalofríos", "Tos con flema verdosa o amarillenta", "Dolor en el pecho al respirar", "Dificultad para respirar", "Fatiga"],
+      causas: ["Infección por bacterias (Streptococcus pneumoniae)", "Infección por virus (gripe, COVID-19)", "Infección por hongos", "Aspiración de alimentos o líquidos"],
+      sistemaId: "sistema-respiratorio",
+    },
+    {
+      id: "epoc",
+      nombre: "Enfermedad Pulmonar Obstructiva Crónica (EPOC)",
+      otrosNombres: ["EPOC"],
+      descripcion: "Enfermedad pulmonar inflamatoria crónica que causa la obstrucción del flujo de aire de los pulmones.",
+      sintomas: ["Tos crónica con flema", "Dificultad para respirar (disnea)", "Sibilancias", "Opresión en el pecho", "Infecciones respiratorias frecuentes"],
+      causas: ["Tabaquismo (principal causa)", "Exposición prolongada a humos y polvos irritantes", "Deficiencia de alfa-1 antitripsina (factor genético)"],
+      sistemaId: "sistema-respiratorio",
+    },
+    {
+      id: "rinitis-alergica",
+      nombre: "Rinitis Alérgica",
+      otrosNombres: ["Fiebre del heno"],
+      descripcion: "Reacción alérgica que provoca estornudos, congestión y picazón en la nariz.",
+      sintomas: ["Estornudos frecuentes", "Picazón en nariz, ojos, garganta y paladar", "Congestión y secreción nasal acuosa", "Ojos llorosos y enrojecidos"],
+      causas: ["Reacción del sistema inmunitario a alérgenos aéreos", "Polen de árboles, pasto y malezas", "Ácaros del polvo, moho y caspa de animales"],
+      sistemaId: "sistema-respiratorio",
+    },
+    {
+      id: "sinusitis",
+      nombre: "Sinusitis",
+      otrosNombres: ["Infección de los senos paranasales"],
+      descripcion: "Inflamación de las cavidades alrededor de las fosas nasales.",
+      sintomas: ["Dolor y presión facial (alrededor de ojos, nariz y frente)", "Congestión y secreción nasal espesa (amarilla o verde)", "Pérdida del sentido del olfato y el gusto", "Tos que empeora por la noche", "Mal aliento (halitosis)"],
+      causas: ["Infección viral (resfriado común)", "Infección bacteriana secundaria", "Alergias que causan inflamación", "Pólipos nasales o tabique desviado"],
+      sistemaId: "sistema-respiratorio",
+    },
+    {
+      id: "faringitis",
+      nombre: "Faringitis",
+      otrosNombres: ["Dolor de garganta"],
+      descripcion: "Inflamación de la faringe, que se encuentra en la parte posterior de la garganta.",
+      sintomas: ["Dolor o carraspera en la garganta", "Dificultad para tragar", "Enrojecimiento de la garganta", "Ganglios linfáticos del cuello inflamados"],
+      causas: ["Infecciones virales (resfriado, gripe)", "Infección bacteriana (estreptococo)", "Irritantes como el humo o el aire muy seco"],
+      sistemaId: "sistema-respiratorio",
+    },
+    {
+      id: "laringitis",
+      nombre: "Laringitis",
+      otrosNombres: ["Inflamación de la laringe"],
+      descripcion: "Inflamación de la laringe por uso excesivo, irritación o infección.",
+      sintomas: ["Ronquera o pérdida de la voz", "Dolor de garganta", "Sensación de cosquilleo o irritación en la garganta", "Tos seca"],
+      causas: ["Infección viral (similar a un resfriado)", "Uso excesivo de la voz (gritar, cantar)", "Irritación por humo o alérgenos", "Reflujo gastroesofágico"],
+      sistemaId: "sistema-respiratorio",
+    },
+    {
+      id: "traqueitis",
+      nombre: "Traqueítis",
+      otrosNombres: ["Infección de la tráquea"],
+      descripcion: "Infección bacteriana de la tráquea que puede causar obstrucción de las vías respiratorias.",
+      sintomas: ["Tos profunda y áspera", "Fiebre alta", "Dificultad para respirar", "Sonido agudo al inspirar (estridor)"],
+      causas: ["Infección bacteriana, a menudo secundaria a una infección viral", "Lesión en la tráquea"],
+      sistemaId: "sistema-respiratorio",
+    },
+    {
+      id: "tuberculosis",
+      nombre: "Tuberculosis",
+      otrosNombres: ["TB"],
+      descripcion: "Enfermedad infecciosa que suele afectar a los pulmones.",
+      sintomas: ["Tos crónica que dura más de 3 semanas", "Tos con sangre o esputo", "Fiebre y sudores nocturnos", "Pérdida de peso involuntaria", "Fatiga extrema"],
+      causas: ["Infección por la bacteria Mycobacterium tuberculosis", "Transmisión por gotitas en el aire de una persona infectada", "Sistema inmunitario debilitado"],
+      sistemaId: "sistema-respiratorio",
+    },
+    {
+      id: "fibrosis-pulmonar",
+      nombre: "Fibrosis Pulmonar",
+      otrosNombres: ["Cicatrización de los pulmones"],
+      descripcion: "Enfermedad pulmonar que se produce cuando el tejido pulmonar se daña y se cicatriza.",
+      sintomas: ["Dificultad para respirar (disnea) progresiva", "Tos seca y persistente", "Fatiga y debilidad", "Pérdida de apetito y de peso", "Acropaquia (dedos en palillo de tambor)"],
+      causas: ["Causa desconocida (idiopática) en la mayoría de los casos", "Exposición a polvos nocivos (asbesto, sílice)", "Enfermedades autoinmunes", "Factores genéticos"],
+      sistemaId: "sistema-respiratorio",
+    },
+    {
+      id: "apnea-del-sueno",
+      nombre: "Apnea del Sueño",
+      otrosNombres: ["Síndrome de apnea del sueño"],
+      descripcion: "Trastorno del sueño potencialmente grave en el que la respiración se detiene y recomienza repetidamente.",
+      sintomas: ["Ronquidos fuertes", "Pausas en la respiración durante el sueño", "Despertar abrupto con falta de aire", "Somnolencia diurna excesiva", "Dolor de cabeza matutino"],
+      causas: ["Obstrucción de las vías respiratorias superiores durante el sueño", "Obesidad y exceso de tejido en la garganta", "Anatomía de las vías respiratorias"],
+      sistemaId: "sistema-respiratorio",
+    },
+    {
+      id: "cancer-de-pulmon",
+      nombre: "Cáncer de Pulmón",
+      otrosNombres: ["Carcinoma de pulmón"],
+      descripcion: "Cáncer que comienza en los pulmones y que con mayor frecuencia ocurre en personas que fuman.",
+      sintomas: ["Tos persistente que no desaparece", "Tos con sangre (hemoptisis)", "Dolor en el pecho", "Dificultad para respirar", "Pérdida de peso inexplicable"],
+      causas: ["Tabaquismo (principal factor de riesgo)", "Exposición al humo de segunda mano", "Exposición a sustancias cancerígenas (asbesto, radón)", "Antecedentes familiares de cáncer de pulmón"],
+      sistemaId: "sistema-respiratorio",
+    },
+    {
+      id: "embolia-pulmonar",
+      nombre: "Embolia Pulmonar",
+      otrosNombres: ["Tromboembolismo pulmonar"],
+      descripcion: "Bloqueo en una de las arterias pulmonares en los pulmones.",
+      sintomas: ["Dificultad para respirar de aparición súbita", "Dolor agudo en el pecho", "Tos con sangre", "Latidos cardíacos rápidos", "Mareo o desmayo"],
+      causas: ["Coágulo de sangre que viaja a los pulmones, generalmente desde una TVP", "Inmovilidad prolongada", "Cirugía reciente", "Factores genéticos de coagulación"],
+      sistemaId: "sistema-respiratorio",
+    },
+    {
+      id: "hipertension-pulmonar",
+      nombre: "Hipertensión Pulmonar",
+      otrosNombres: ["Presión arterial alta en los pulmones"],
+      descripcion: "Tipo de presión arterial alta que afecta las arterias de los pulmones y el lado derecho del corazón.",
+      sintomas: ["Falta de aliento, inicialmente con el ejercicio y luego en reposo", "Fatiga", "Dolor en el pecho", "Hinchazón en tobillos y piernas", "Coloración azulada en labios y piel (cianosis)"],
+      causas: ["Enfermedades cardíacas o pulmonares subyacentes", "Coágulos de sangre en los pulmones", "Causas idiopáticas (desconocidas)", "Uso de ciertas drogas o toxinas"],
+      sistemaId: "sistema-respiratorio",
+    },
+    {
+      id: "derrame-pleural",
+      nombre: "Derrame Pleural",
+      otrosNombres: ["Agua en los pulmones"],
+      descripcion: "Acumulación de líquido en el espacio entre las capas de la pleura.",
+      sintomas: ["Dolor en el pecho que empeora al toser o respirar profundo", "Dificultad para respirar", "Tos seca", "Fiebre", "Hipo"],
+      causas: ["Acumulación de líquido en el espacio pleural", "Insuficiencia cardíaca congestiva", "Neumonía", "Cáncer de pulmón", "Embolia pulmonar"],
+      sistemaId: "sistema-respiratorio",
+    },
+    {
+      id: "neumotorax",
+      nombre: "Neumotórax",
+      otrosNombres: ["Pulmón colapsado"],
+      descripcion: "Un pulmón colapsado ocurre cuando el aire se filtra en el espacio entre el pulmón y la pared torácica.",
+      sintomas: ["Dolor agudo y repentino en el pecho", "Dificultad para respirar", "Sensación de opresión en el pecho", "Coloración azulada de la piel (cianosis)"],
+      causas: ["Lesión torácica penetrante o cerrada", "Ruptura de una bulla (pequeña saca de aire) en el pulmón", "Enfermedades pulmonares subyacentes (EPOC, asma)", "Cambios de presión atmosférica (buceo, montañismo)"],
+      sistemaId: "sistema-respiratorio",
+    },
+    {
+      id: "bronquiectasia",
+      nombre: "Bronquiectasia",
+      otrosNombres: ["Dilatación bronquial"],
+      descripcion: "Afección en la que las vías respiratorias de los pulmones se ensanchan de forma permanente.",
+      sintomas: ["Tos crónica con grandes cantidades de esputo", "Infecciones respiratorias recurrentes", "Dificultad para respirar", "Mal aliento", "Tos con sangre"],
+      causas: ["Daño e ensanchamiento irreversible de las vías respiratorias", "Infecciones pulmonares graves o recurrentes (neumonía, tuberculosis)", "Fibrosis quística", "Enfermedades autoinmunes"],
+      sistemaId: "sistema-respiratorio",
+    },
+    {
+      id: "sarcoidosis",
+      nombre: "Sarcoidosis",
+      otrosNombres: [],
+      descripcion: "Enfermedad inflamatoria que afecta a múltiples órganos del cuerpo, pero más comúnmente a los pulmones y los ganglios linfáticos.",
+      sintomas: ["Fatiga", "Fiebre", "Pérdida de peso", "Tos seca persistente", "Dificultad para respirar", "Lesiones cutáneas dolorosas"],
+      causas: ["Crecimiento de pequeñas acumulaciones de células inflamatorias (granulomas) en diferentes partes del cuerpo", "Causa desconocida, posiblemente una respuesta inmunitaria a una sustancia desconocida"],
+      sistemaId: "sistema-respiratorio",
+    },
+    {
+      id: "fibrosis-quistica",
+      nombre: "Fibrosis Quística",
+      otrosNombres: ["Mucoviscidosis"],
+      descripcion: "Trastorno hereditario que causa daños graves en los pulmones, el sistema digestivo y otros órganos del cuerpo.",
+      sintomas: ["Tos persistente con mucosidad espesa", "Infecciones pulmonares frecuentes", "Dificultad para respirar y sibilancias", "Poco aumento de peso y crecimiento deficiente", "Heces grasosas y voluminosas"],
+      causas: ["Trastorno genético hereditario", "Mutación en el gen CFTR que regula el movimiento de sal y agua", "Producción de moco espeso y pegajoso en varios órganos"],
+      sistemaId: "sistema-respiratorio",
+    },
+    {
+      id: "resfriado-comun",
+      nombre: "Resfriado Común",
+      otrosNombres: ["Catarro"],
+      descripcion: "Infección viral de la nariz y la garganta (vías respiratorias superiores).",
+      sintomas: ["Goteo y congestión nasal", "Dolor de garganta", "Estornudos", "Tos leve"],
+      causas: ["Infección por rinovirus (más común)", "Contacto con gotitas respiratorias de una persona infectada", "Tocarse los ojos, la nariz o la boca con las manos contaminadas"],
+      sistemaId: "sistema-respiratorio",
+    },
+    {
+      id: "gripe",
+      nombre: "Gripe",
+      otrosNombres: ["Influenza"],
+      descripcion: "Enfermedad respiratoria contagiosa provocada por los virus de la influenza.",
+      sintomas: ["Fiebre alta de inicio súbito", "Dolores musculares y corporales intensos", "Dolor de cabeza", "Fatiga y debilidad extremas", "Tos seca"],
+      causas: ["Infección por el virus de la influenza (tipos A, B y C)", "Transmisión a través de gotitas respiratorias al toser o estornudar", "Contacto con superficies contaminadas"],
+      sistemaId: "sistema-respiratorio",
+    },
+    {
+      id: "virus-sincitial-respiratorio",
+      nombre: "Virus Sincitial Respiratorio",
+      otrosNombres: ["VSR"],
+      descripcion: "Virus común que causa infecciones de los pulmones y las vías respiratorias.",
+      sintomas: ["Congestión nasal y moqueo", "Tos seca", "Fiebre baja", "Dificultad para respirar y sibilancias (en casos graves)", "Poco apetito"],
+      causas: ["Infección por el virus sincitial respiratorio (VSR)", "Causa común de bronquiolitis y neumonía en bebés", "Altamente contagioso a través del contacto directo y gotitas"],
+      sistemaId: "sistema-respiratorio",
+    },
+    {
+      id: "adenovirus",
+      nombre: "Adenovirus",
+      otrosNombres: [],
+      descripcion: "Grupo de virus que pueden causar infecciones en las vías respiratorias, los ojos, los intestinos y el tracto urinario.",
+      sintomas: ["Síntomas de resfriado o gripe", "Dolor de garganta", "Fiebre", "Conjuntivitis (ojo rojo)", "Diarrea y vómitos (en algunos serotipos)"],
+      causas: ["Infección por uno de los muchos tipos de adenovirus", "Transmisión por contacto personal, gotitas respiratorias o agua contaminada"],
+      sistemaId: "sistema-respiratorio",
+    },
+    {
+      id: "rinovirus",
+      nombre: "Rinovirus",
+      otrosNombres: [],
+      descripcion: "La causa más común del resfriado común.",
+      sintomas: ["Goteo y congestión nasal", "Estornudos", "Dolor de garganta", "Tos"],
+      causas: ["Principal causa del resfriado común", "Infección por más de 100 serotipos de rinovirus", "Transmisión por contacto directo y gotitas respiratorias"],
+      sistemaId: "sistema-respiratorio",
+    },
+    {
+      id: "parainfluenza",
+      nombre: "Parainfluenza",
+      otrosNombres: [],
+      descripcion: "Grupo de virus que causan infecciones de las vías respiratorias superiores e inferiores.",
+      sintomas: ["Fiebre", "Tos perruna (crup)", "Ronquera", "Goteo nasal", "Dolor de garganta"],
+      causas: ["Infección por virus de la parainfluenza humana (HPIV)", "Causa común de crup en niños pequeños", "Transmisión por gotitas respiratorias"],
+      sistemaId: "sistema-respiratorio",
+    },
+    {
+      id: "metapneumovirus",
+      nombre: "Metapneumovirus",
+      otrosNombres: [],
+      descripcion: "Virus que causa infecciones de las vías respiratorias superiores e inferiores.",
+      sintomas: ["Tos", "Fiebre", "Congestión nasal", "Dificultad para respirar", "Sibilancias"],
+      causas: ["Infección por metaneumovirus humano (HMPV)", "Puede causar bronquiolitis y neumonía", "Similar al virus sincitial respiratorio (VSR)"],
+      sistemaId: "sistema-respiratorio",
+    },
+    {
+      id: "crup",
+      nombre: "Crup",
+      otrosNombres: ["Laringotraqueobronquitis"],
+      descripcion: "Infección de las vías respiratorias superiores que obstruye la respiración y causa una tos perruna característica.",
+      sintomas: ["Tos perruna característica", "Sonido agudo al inspirar (estridor)", "Ronquera y dificultad para hablar", "Fiebre", "Síntomas de resfriado"],
+      causas: ["Infección viral que inflama la laringe y la tráquea", "Virus de la parainfluenza (causa más común)", "Otros virus como el VSR, adenovirus e influenza"],
+      sistemaId: "sistema-respiratorio",
+    },
+    {
+      id: "tos-ferina",
+      nombre: "Tos Ferina",
+      otrosNombres: ["Pertussis"],
+      descripcion: "Infección de las vías respiratorias altamente contagiosa.",
+      sintomas: ["Tos violenta en accesos rápidos e incontrolables", "Sonido agudo al inhalar después de toser (gallo)", "Vómitos durante o después de los ataques de tos", "Apnea (pausas en la respiración) en bebés"],
+      causas: ["Infección por la bacteria Bordetella pertussis", "Altamente contagiosa a través de gotitas respiratorias", "Falta de vacunación o inmunidad disminuida"],
+      sistemaId: "sistema-respiratorio",
+    },
+    {
+      id: "difteria",
+      nombre: "Difteria",
+      otrosNombres: [],
+      descripcion: "Infección bacteriana grave que puede afectar las membranas mucosas de la nariz y la garganta.",
+      sintomas: ["Membrana gruesa y gris en la garganta y amígdalas", "Dolor de garganta y ronquera", "Ganglios del cuello inflamados", "Dificultad para respirar o tragar", "Fiebre y escalofríos"],
+      causas: ["Infección por la bacteria Corynebacterium diphtheriae", "La bacteria produce una toxina que daña los tejidos", "Transmisión por contacto directo o gotitas respiratorias"],
+      sistemaId: "sistema-respiratorio",
+    },
+    {
+      id: "edema-pulmonar",
+      nombre: "Edema Pulmonar",
+      otrosNombres: [],
+      descripcion: "Afección causada por un exceso de líquido en los pulmones.",
+      sintomas: ["Dificultad extrema para respirar, que empeora al acostarse", "Sensación de ahogo o asfixia", "Tos con esputo espumoso y rosado", "Sibilancias y jadeos", "Ansiedad e inquietud"],
+      causas: ["Acumulación de exceso de líquido en los alvéolos pulmonares", "Insuficiencia cardíaca congestiva (causa más común)", "Ataque cardíaco", "Neumonía grave o SDRA"],
+      sistemaId: "sistema-respiratorio",
+    },
+    {
+      id: "sindrome-de-dificultad-respiratoria-aguda",
+      nombre: "Síndrome de Dificultad Respiratoria Aguda",
+      otrosNombres: ["SDRA"],
+      descripcion: "Afección pulmonar grave que causa niveles bajos de oxígeno en la sangre.",
+      sintomas: ["Dificultad respiratoria grave y de rápida aparición", "Respiración rápida y superficial", "Coloración azulada de la piel y los labios (cianosis)", "Confusión y fatiga extrema"],
+      causas: ["Fuga de líquido de los vasos sanguíneos a los alvéolos", "Sepsis (infección grave en la sangre)", "Neumonía grave", "Traumatismo torácico grave", "Aspiración de contenido gástrico"],
+      sistemaId: "sistema-respiratorio",
+    },
+    {
+      id: "atelectasia",
+      nombre: "Atelectasia",
+      otrosNombres: [],
+      descripcion: "Colapso completo o parcial de todo el pulmón o de una parte (lóbulo) del pulmón.",
+      sintomas: ["Dificultad para respirar (si es extensa)", "Respiración rápida y superficial", "Tos", "Fiebre baja"],
+      causas: ["Colapso de una parte o de todo el pulmón", "Obstrucción de un bronquio (tapón mucoso, tumor)", "Anestesia general (complicación postoperatoria)", "Derrame pleural grande"],
+      sistemaId: "sistema-respiratorio",
+    },
+    {
+      id: "hemoptisis",
+      nombre: "Hemoptisis",
+      otrosNombres: ["Toser sangre"],
+      descripcion: "Expulsión de sangre o esputo con sangre de los pulmones o las vías respiratorias.",
+      sintomas: ["Expectoración de sangre o esputo con sangre", "Tos", "Dificultad para respirar", "Dolor en el pecho"],
+      causas: ["Bronquitis o neumonía", "Tuberculosis", "Cáncer de pulmón", "Bronquiectasia", "Embolia pulmonar"],
+      sistemaId: "sistema-respiratorio",
+    },
+    {
+      id: "disnea",
+      nombre: "Disnea",
+      otrosNombres: ["Falta de aliento"],
+      descripcion: "Sensación de falta de aliento o dificultad para respirar.",
+      sintomas: ["Sensación subjetiva de falta de aire", "Respiración difícil o incómoda", "Sensación de no poder obtener suficiente aire", "Opresión en el pecho"],
+      causas: ["Enfermedades pulmonares (asma, EPOC)", "Enfermedades cardíacas (insuficiencia cardíaca)", "Ansiedad o ataques de pánico", "Anemia", "Obesidad"],
+      sistemaId: "sistema-respiratorio",
+    },
+    {
+      id: "hipoxia",
+      nombre: "Hipoxia",
+      otrosNombres: ["Bajo nivel de oxígeno en la sangre"],
+      descripcion: "Condición en la que el cuerpo o una región del cuerpo se ve privada de un suministro adecuado de oxígeno a nivel tisular.",
+      sintomas: ["Confusión y desorientación", "Coloración azulada de la piel (cianosis)", "Respiración rápida (taquipnea)", "Frecuencia cardíaca rápida (taquicardia)", "Falta de aire"],
+      causas: ["Nivel bajo de oxígeno en los tejidos corporales", "Hipoxemia (bajo oxígeno en sangre)", "Altitud elevada", "Enfermedades pulmonares o cardíacas graves", "Anemia severa"],
+      sistemaId: "sistema-respiratorio",
+    },
+    {
+      id: "mesotelioma",
+      nombre: "Mesotelioma",
+      otrosNombres: [],
+      descripcion: "Tipo de cáncer que se desarrolla a partir de la delgada capa de tejido que cubre muchos de los órganos internos.",
+      sintomas: ["Dolor en el pecho o abdomen", "Dificultad para respirar", "Tos dolorosa", "Pérdida de peso inexplicable", "Fatiga"],
+      causas: ["Exposición al asbesto (amianto)", "Inhalación de fibras de asbesto que se alojan en el revestimiento de los pulmones o el abdomen"],
+      sistemaId: "sistema-respiratorio",
+    },
+    {
+      id: "aspergilosis",
+      nombre: "Aspergilosis",
+      otrosNombres: [],
+      descripcion: "Infección causada por un tipo de moho (hongo).",
+      sintomas: ["Tos (a veces con sangre o mucosidad)", "Fiebre", "Dificultad para respirar", "Sibilancias", "Dolor en el pecho"],
+      causas: ["Infección por el hongo Aspergillus", "Inhalación de esporas del hongo presentes en el ambiente (suelo, polvo, vegetación en descomposición)", "Sistema inmunitario debilitado"],
+      sistemaId: "sistema-respiratorio",
+    },
+    {
+      id: "silicosis",
+      nombre: "Silicosis",
+      otrosNombres: [],
+      descripcion: "Enfermedad pulmonar causada por la inhalación de polvo de sílice.",
+      sintomas: ["Dificultad para respirar que empeora con el tiempo", "Tos crónica y persistente", "Fatiga y debilidad", "Dolor en el pecho", "Fiebre"],
+      causas: ["Inhalación prolongada de polvo de sílice cristalina", "Exposición ocupacional (minería, construcción, cantería)"],
+      sistemaId: "sistema-respiratorio",
+    },
+    {
+      id: "asbestosis",
+      nombre: "Asbestosis",
+      otrosNombres: [],
+      descripcion: "Enfermedad pulmonar crónica causada por la inhalación de fibras de asbesto.",
+      sintomas: ["Dificultad para respirar progresiva", "Tos seca y persistente", "Dolor u opresión en el pecho", "Pérdida de apetito", "Dedos en palillo de tambor (acropaquia)"],
+      causas: ["Inhalación prolongada de fibras de asbesto", "Cicatrización del tejido pulmonar debido a las fibras de asbesto", "Exposición ocupacional en industrias como la construcción y la naval"],
+      sistemaId: "sistema-respiratorio",
+    },
+  ],
+};
+
+export default sistema;
@@ -0,0 +1,282 @@
+// Generado automáticamente por scripts/build-catalog.py - no editar a mano
+import type { SistemaCorporal } from '../../enfermedades-expandidas';
+
+const sistema: SistemaCorporal = {
+  id: "sistema-urinario",
+  nombre: "Sistema Urinario",
+  icono: "💧",
+  enfermedades: [
+    {
+      id: "infeccion-urinaria",
+      nombre: "Infección Urinaria",
+      otrosNombres: ["Infección del tracto urinario", "ITU"],
+      descripcion: "Infección en cualquier parte del sistema urinario, como la vejiga, los riñones, los uréteres o la uretra.",
+      sintomas: ["Dolor o ardor al orinar", "Necesidad frecuente de orinar", "Orina turbia o con mal olor", "Dolor en la parte baja del abdomen"],
+      causas: ["Bacterias que ingresan a la uretra", "Relaciones sexuales", "Uso de diafragmas o espermicidas"],
+      sistemaId: "sistema-urinario",
+    },
+    {
+      id: "cistitis",
+      nombre: "Cistitis",
+      otrosNombres: ["Infección de vejiga"],
+      descripcion: "Inflamación de la vejiga, generalmente causada por una infección bacteriana.",
+      sintomas: ["Necesidad urgente de orinar", "Sensación de ardor al orinar", "Orina turbia o con sangre", "Molestias en la parte inferior del abdomen"],
+      causas: ["Infección bacteriana (E. coli)", "Irritación por productos químicos", "Complicaciones de otras enfermedades"],
+      sistemaId: "sistema-urinario",
+    },
+    {
+      id: "pielonefritis",
+      nombre: "Pielonefritis",
+      otrosNombres: ["Infección renal"],
+      descripcion: "Infección del riñón, un tipo de infección del tracto urinario que generalmente comienza en la uretra o la vejiga y viaja a uno o ambos riñones.",
+      sintomas: ["Fiebre alta y escalofríos", "Dolor en la espalda o el costado", "Náuseas y vómitos", "Orina turbia o con mal olor"],
+      causas: ["Infección urinaria no tratada", "Obstrucción del tracto urinario", "Reflujo vesicoureteral"],
+      sistemaId: "sistema-urinario",
+    },
+    {
+      id: "calculos-renales",
+      nombre: "Cálculos Renales",
+      otrosNombres: ["Nefrolitiasis", "Piedras en el riñón"],
+      descripcion: "Depósitos duros de minerales y sales que se forman dentro de los riñones.",
+      sintomas: ["Dolor intenso en la espalda o el costado", "Sangre en la orina", "Náuseas y vómitos", "Necesidad frecuente de orinar"],
+      causas: ["Acumulación de minerales y sales en la orina", "Deshidratación crónica", "Dieta rica en oxalatos o proteínas"],
+      sistemaId: "sistema-urinario",
+    },
+    {
+      id: "incontinencia-urinaria",
+      nombre: "Incontinencia Urinaria",
+      otrosNombres: ["Pérdida de control de la vejiga"],
+      descripcion: "Pérdida del control de la vejiga, que provoca una fuga involuntaria de orina.",
+      sintomas: ["Pérdida involuntaria de orina", "Necesidad repentina y fuerte de orinar", "Goteo de orina después de orinar"],
+      causas: ["Debilitamiento de los músculos del suelo pélvico", "Daño a los nervios de la vejiga", "Agrandamiento de la próstata en hombres"],
+      sistemaId: "sistema-urinario",
+    },
+    {
+      id: "insuficiencia-renal",
+      nombre: "Insuficiencia Renal",
+      otrosNombres: ["Fallo renal"],
+      descripcion: "Afección en la que los riñones pierden la capacidad de filtrar adecuadamente los productos de desecho de la sangre.",
+      sintomas: ["Disminución del volumen de orina", "Hinchazón en las piernas y los pies", "Fatiga y debilidad", "Náuseas y vómitos"],
+      causas: ["Daño renal agudo", "Enfermedad renal crónica", "Obstrucción del tracto urinario"],
+      sistemaId: "sistema-urinario",
+    },
+    {
+      id: "enfermedad-renal-cronica",
+      nombre: "Enfermedad Renal Crónica",
+      otrosNombres: ["ERC"],
+      descripcion: "Pérdida gradual de la función renal con el tiempo.",
+      sintomas: ["Fatiga y debilidad", "Hinchazón en las piernas y los pies", "Cambios en la frecuencia urinaria", "Presión arterial alta"],
+      causas: ["Diabetes", "Presión arterial alta", "Enfermedades autoinmunes"],
+      sistemaId: "sistema-urinario",
+    },
+    {
+      id: "uretritis",
+      nombre: "Uretritis",
+      otrosNombres: ["Inflamación de la uretra"],
+      descripcion: "Inflamación de la uretra, el tubo que transporta la orina desde la vejiga hacia el exterior del cuerpo.",
+      sintomas: ["Ardor al orinar", "Secreción del pene o la vagina", "Necesidad frecuente de orinar", "Picazón o irritación en la uretra"],
+      causas: ["Infecciones de transmisión sexual (ITS)", "Infecciones bacterianas no transmitidas sexualmente", "Lesiones o irritación de la uretra"],
+      sistemaId: "sistema-urinario",
+    },
+    {
+      id: "nefritis",
+      nombre: "Nefritis",
+      otrosNombres: ["Inflamación del riñón"],
+      descripcion: "Inflamación de los riñones, que puede afectar su capacidad para filtrar la sangre.",
+      sintomas: ["Sangre en la orina", "Hinchazón en la cara, las manos y los pies", "Presión arterial alta", "Disminución del volumen de orina"],
+      causas: ["Infecciones", "Enfermedades autoinmunes", "Reacciones a medicamentos"],
+      sistemaId: "sistema-urinario",
+    },
+    {
+      id: "nefrosis",
+      nombre: "Nefrosis",
+      otrosNombres: ["Síndrome nefrótico"],
+      descripcion: "Enfermedad renal no inflamatoria que se caracteriza por proteinuria, hipoalbuminemia y edema.",
+      sintomas: ["Hinchazón generalizada (edema)", "Orina espumosa", "Aumento de peso por retención de líquidos", "Fatiga"],
+      causas: ["Daño a los glomérulos renales", "Enfermedades sistémicas como la diabetes", "Infecciones"],
+      sistemaId: "sistema-urinario",
+    },
+    {
+      id: "hidronefrosis",
+      nombre: "Hidronefrosis",
+      otrosNombres: ["Riñón hinchado"],
+      descripcion: "Hinchazón de uno o ambos riñones debido a la acumulación de orina.",
+      sintomas: ["Dolor en el costado y la espalda", "Náuseas y vómitos", "Infecciones urinarias frecuentes", "Fiebre"],
+      causas: ["Obstrucción del tracto urinario", "Cálculos renales", "Tumores"],
+      sistemaId: "sistema-urinario",
+    },
+    {
+      id: "vejiga-neurogenica",
+      nombre: "Vejiga Neurogénica",
+      otrosNombres: ["Disfunción vesical neurogénica"],
+      descripcion: "Disfunción de la vejiga causada por un problema neurológico, como una lesión de la médula espinal o esclerosis múltiple.",
+      sintomas: ["Incontinencia urinaria", "Dificultad para vaciar la vejiga", "Infecciones urinarias frecuentes", "Goteo de orina"],
+      causas: ["Lesiones de la médula espinal", "Esclerosis múltiple", "Parkinson"],
+      sistemaId: "sistema-urinario",
+    },
+    {
+      id: "nocturia",
+      nombre: "Nocturia",
+      otrosNombres: ["Nicturia"],
+      descripcion: "Necesidad de despertarse y orinar varias veces durante la noche.",
+      sintomas: ["Despertarse dos o más veces por la noche para orinar", "Interrupción del sueño", "Fatiga diurna"],
+      causas: ["Consumo excesivo de líquidos antes de dormir", "Agrandamiento de la próstata", "Insuficiencia cardíaca"],
+      sistemaId: "sistema-urinario",
+    },
+    {
+      id: "cistitis-intersticial",
+      nombre: "Cistitis Intersticial",
+      otrosNombres: ["Síndrome de la vejiga dolorosa"],
+      descripcion: "Afección crónica que causa presión y dolor en la vejiga, y a veces dolor pélvico.",
+      sintomas: ["Dolor pélvico crónico", "Necesidad urgente y frecuente de orinar", "Dolor durante las relaciones sexuales"],
+      causas: ["Causa desconocida", "Posiblemente autoinmune", "Defecto en el revestimiento de la vejiga"],
+      sistemaId: "sistema-urinario",
+    },
+    {
+      id: "cancer-de-vejiga",
+      nombre: "Cáncer de Vejiga",
+      otrosNombres: [],
+      descripcion: "Crecimiento de células anormales en el revestimiento de la vejiga.",
+      sintomas: ["Sangre en la orina (hematuria)", "Necesidad frecuente de orinar", "Dolor al orinar", "Dolor de espalda"],
+      causas: ["Tabaquismo", "Exposición a productos químicos industriales", "Inflamación crónica de la vejiga"],
+      sistemaId: "sistema-urinario",
+    },
+    {
+      id: "cancer-de-rinon",
+      nombre: "Cáncer de Riñón",
+      otrosNombres: ["Carcinoma de células renales"],
+      descripcion: "Crecimiento de células anormales en los riñones.",
+      sintomas: ["Sangre en la orina", "Dolor en el costado que no desaparece", "Pérdida de peso inexplicable", "Fiebre"],
+      causas: ["Tabaquismo", "Obesidad", "Presión arterial alta"],
+      sistemaId: "sistema-urinario",
+    },
+    {
+      id: "diabetes-insipida",
+      nombre: "Diabetes Insípida",
+      otrosNombres: [],
+      descripcion: "Trastorno que causa un desequilibrio de líquidos en el cuerpo, lo que provoca sed intensa y micción frecuente.",
+      sintomas: ["Sed extrema (polidipsia)", "Producción de grandes volúmenes de orina diluida (poliuria)", "Deshidratación", "Necesidad de orinar durante la noche (nocturia)"],
+      causas: ["Daño a la glándula pituitaria o al hipotálamo, afectando la producción de ADH", "Incapacidad de los riñones para responder a la ADH", "Factores genéticos"],
+      sistemaId: "sistema-urinario",
+    },
+    {
+      id: "enfermedad-poliquistica-renal",
+      nombre: "Enfermedad Poliquística Renal",
+      otrosNombres: ["PKD"],
+      descripcion: "Trastorno genético que se caracteriza por el crecimiento de numerosos quistes en los riñones.",
+      sintomas: ["Presión arterial alta", "Dolor de espalda o en los costados", "Sangre en la orina", "Sensación de plenitud en el abdomen", "Aumento del tamaño del abdomen", "Dolores de cabeza"],
+      causas: ["Trastorno genético hereditario", "Mutaciones en los genes PKD1 o PKD2", "Forma autosómica dominante (un solo padre afectado)", "Forma autosómica recesiva (ambos padres portadores)"],
+      sistemaId: "sistema-urinario",
+    },
+    {
+      id: "glomerulonefritis",
+      nombre: "Glomerulonefritis",
+      otrosNombres: [],
+      descripcion: "Inflamación de los pequeños filtros de los riñones (glomérulos).",
+      sintomas: ["Orina de color rosa o cola (por la sangre)", "Orina espumosa (por el exceso de proteína)", "Hinchazón en la cara, las manos, los pies y el abdomen", "Presión arterial alta"],
+      causas: ["Infecciones (estreptococos, hepatitis)", "Enfermedades autoinmunes (lupus)", "Vasculitis"],
+      sistemaId: "sistema-urinario",
+    },
+    {
+      id: "sindrome-nefrotico",
+      nombre: "Síndrome Nefrótico",
+      otrosNombres: [],
+      descripcion: "Trastorno renal que hace que el cuerpo excrete demasiadas proteínas en la orina.",
+      sintomas: ["Hinchazón grave (edema)", "Orina espumosa", "Aumento de peso por retención de líquidos", "Fatiga"],
+      causas: ["Daño a los glomérulos renales", "Diabetes", "Lupus"],
+      sistemaId: "sistema-urinario",
+    },
+    {
+      id: "estenosis-de-la-arteria-renal",
+      nombre: "Estenosis de la Arteria Renal",
+      otrosNombres: [],
+      descripcion: "Estrechamiento de las arterias que transportan sangre a los riñones.",
+      sintomas: ["Presión arterial alta difícil de controlar", "Sonido sibilante en los vasos sanguíneos", "Aumento de proteínas en la orina", "Empeoramiento de la función renal", "Hinchazón por retención de líquidos", "Dolores de cabeza"],
+      causas: ["Aterosclerosis", "Displasia fibromuscular", "Diabetes", "Tabaquismo", "Presión arterial alta"],
+      sistemaId: "sistema-urinario",
+    },
+    {
+      id: "acidosis-tubular-renal",
+      nombre: "Acidosis Tubular Renal",
+      otrosNombres: [],
+      descripcion: "Enfermedad que ocurre cuando los riñones no logran excretar los ácidos en la orina, lo que hace que la sangre permanezca demasiado ácida.",
+      sintomas: ["Fatiga", "Debilidad muscular", "Crecimiento deficiente en niños", "Cálculos renales"],
+      causas: ["Trastornos genéticos", "Enfermedades autoinmunes", "Uso de ciertos medicamentos"],
+      sistemaId: "sistema-urinario",
+    },
+    {
+      id: "reflujo-vesicoureteral",
+      nombre: "Reflujo Vesicoureteral",
+      otrosNombres: ["RVU"],
+      descripcion: "Afección en la que la orina fluye hacia atrás desde la vejiga hacia uno o ambos uréteres y, a veces, hacia los riñones.",
+      sintomas: ["Infecciones urinarias recurrentes", "Fiebre", "Dolor abdominal", "Necesidad frecuente de orinar"],
+      causas: ["Anomalía congénita de las válvulas ureterales", "Obstrucción de la vejiga", "Infecciones urinarias"],
+      sistemaId: "sistema-urinario",
+    },
+    {
+      id: "extrofia-vesical",
+      nombre: "Extrofia Vesical",
+      otrosNombres: [],
+      descripcion: "Anomalía congénita rara en la que la vejiga se desarrolla fuera del feto.",
+      sintomas: ["Vejiga visible fuera del abdomen", "Huesos púbicos ensanchados", "Piernas y pies girados hacia afuera", "Músculos abdominales anormales", "Ombligo de implantación baja", "Incontinencia urinaria"],
+      causas: ["Defecto del desarrollo fetal", "Cierre inadecuado de la pared abdominal inferior", "Combinación de factores genéticos y ambientales"],
+      sistemaId: "sistema-urinario",
+    },
+    {
+      id: "hipospadias",
+      nombre: "Hipospadias",
+      otrosNombres: [],
+      descripcion: "Anomalía congénita en los varones en la que la abertura de la uretra no se encuentra en la punta del pene.",
+      sintomas: ["Abertura de la uretra en la parte inferior del pene", "Curvatura del pene hacia abajo", "Apariencia encapuchada del pene", "Salpicaduras anormales al orinar"],
+      causas: ["Antecedentes familiares", "Genética", "Edad materna avanzada (mayor de 35 años)", "Exposición a ciertas sustancias durante el embarazo"],
+      sistemaId: "sistema-urinario",
+    },
+    {
+      id: "epispadias",
+      nombre: "Epispadias",
+      otrosNombres: [],
+      descripcion: "Anomalía congénita rara que afecta la abertura de la uretra.",
+      sintomas: ["Pene corto y ensanchado con una curvatura anormal", "Abertura de la uretra en la parte superior o lateral del pene", "Clítoris y labios vaginales anormales", "Incontinencia urinaria", "Infecciones urinarias recurrentes"],
+      causas: ["Causa desconocida", "Desarrollo inadecuado del hueso púbico", "Puede ocurrir junto con extrofia vesical", "Componente genético"],
+      sistemaId: "sistema-urinario",
+    },
+    {
+      id: "sindrome-uremico-hemolitico",
+      nombre: "Síndrome Urémico Hemolítico",
+      otrosNombres: ["SUH"],
+      descripcion: "Afección que puede ocurrir después de una infección intestinal y que provoca insuficiencia renal.",
+      sintomas: ["Diarrea con sangre", "Dolor de estómago", "Fiebre", "Vómitos", "Palidez", "Cansancio extremo"],
+      causas: ["Infección por E. coli", "Infecciones bacterianas o virales", "Ciertos medicamentos", "Complicaciones de otras enfermedades", "Factores genéticos"],
+      sistemaId: "sistema-urinario",
+    },
+    {
+      id: "nefropatia-por-iga",
+      nombre: "Nefropatía por IgA",
+      otrosNombres: ["Enfermedad de Berger"],
+      descripcion: "Enfermedad renal que se produce cuando un anticuerpo llamado inmunoglobulina A (IgA) se acumula en los riñones.",
+      sintomas: ["Sangre en la orina", "Orina espumosa", "Hinchazón en manos y pies", "Presión arterial alta"],
+      causas: ["Acumulación de la inmunoglobulina A (IgA) en los riñones", "Factor genético", "Infecciones respiratorias o gastrointestinales"],
+      sistemaId: "sistema-urinario",
+    },
+    {
+      id: "vasculitis-renal",
+      nombre: "Vasculitis Renal",
+      otrosNombres: [],
+      descripcion: "Inflamación de los vasos sanguíneos de los riñones.",
+      sintomas: ["Sangre en la orina", "Orina espumosa", "Hinchazón de las piernas o los pies", "Sarpullido en las nalgas o la parte inferior de las piernas", "Fiebre", "Cansancio"],
+      causas: ["Reacción a un medicamento", "Infecciones como la hepatitis B y la hepatitis C", "Enfermedades autoinmunitarias como el lupus, la artritis reumatoide y la esclerodermia", "Cánceres de la sangre como la leucemia y el linfoma"],
+      sistemaId: "sistema-urinario",
+    },
+    {
+      id: "estenosis-uretral",
+      nombre: "Estenosis Uretral",
+      otrosNombres: [],
+      descripcion: "Cicatrización que estrecha el tubo que transporta la orina fuera del cuerpo (uretra).",
+      sintomas: ["Chorro de orina débil", "Dificultad para empezar a orinar", "Goteo después de orinar", "Infecciones urinarias"],
+      causas: ["Lesiones o traumatismos en la uretra", "Infecciones de transmisión sexual", "Procedimientos médicos previos"],
+      sistemaId: "sistema-urinario",
+    },
+  ],
+};
+
+export default sistema;
@@ -0,0 +1,372 @@
+// Generado automáticamente por scripts/build-catalog.py - no editar a mano
+import type { SistemaCorporal } from '../../enfermedades-expandidas';
+
+const sistema: SistemaCorporal = {
+  id: "trastornos-mentales-emocionales",
+  nombre: "Trastornos Mentales y Emocionales",
+  icono: "🧠",
+  enfermedades: [
+    {
+      id: "trastorno-de-ansiedad-generalizada",
+      nombre: "Trastorno de Ansiedad Generalizada",
+      otrosNombres: ["TAG", "Ansiedad Crónica"],
+      descripcion: "Preocupación y tensión crónicas y exageradas sin motivo aparente.",
+      sintomas: ["Preocupación excesiva y persistente", "Inquietud o sensación de estar al límite", "Fatiga", "Dificultad para concentrarse", "Tensión muscular", "Trastornos del sueño"],
+      causas: ["Factores genéticos y antecedentes familiares", "Química cerebral desequilibrada", "Experiencias traumáticas o estresantes", "Afecciones de salud crónicas"],
+      sistemaId: "trastornos-mentales-emocionales",
+    },
+    {
+      id: "depresion-mayor",
+      nombre: "Depresión Mayor",
+      otrosNombres: ["Trastorno Depresivo Mayor", "Depresión Clínica"],
+      descripcion: "Estado de ánimo persistentemente deprimido o pérdida de interés en las actividades.",
+      sintomas: ["Estado de ánimo deprimido la mayor parte del día", "Pérdida de interés o placer en casi todas las actividades", "Pérdida o aumento significativo de peso", "Insomnio o hipersomnia", "Fatiga o pérdida de energía", "Sentimientos de inutilidad o culpa excesiva"],
+      causas: ["Factores genéticos y biológicos", "Desequilibrios químicos en el cerebro", "Eventos vitales estresantes", "Rasgos de personalidad como la baja autoestima"],
+      sistemaId: "trastornos-mentales-emocionales",
+    },
+    {
+      id: "trastorno-bipolar",
+      nombre: "Trastorno Bipolar",
+      otrosNombres: ["Enfermedad Maníaco-Depresiva"],
+      descripcion: "Cambios extremos en el estado de ánimo que van desde la manía hasta la depresión.",
+      sintomas: ["Episodios de manía (euforia, energía excesiva)", "Episodios de depresión (tristeza, falta de energía)", "Cambios drásticos en el estado de ánimo", "Habla rápida y pensamientos acelerados", "Comportamiento impulsivo y arriesgado"],
+      causas: ["Predisposición genética", "Estructura y función cerebral anormales", "Estrés extremo o trauma", "Abuso de sustancias"],
+      sistemaId: "trastornos-mentales-emocionales",
+    },
+    {
+      id: "trastorno-obsesivo-compulsivo",
+      nombre: "Trastorno Obsesivo-Compulsivo",
+      otrosNombres: ["TOC"],
+      descripcion: "Pensamientos (obsesiones) y rituales (compulsiones) recurrentes y no deseados.",
+      sintomas: ["Obsesiones (pensamientos, impulsos o imágenes recurrentes y persistentes)", "Compulsiones (comportamientos repetitivos o actos mentales)", "Ansiedad y malestar significativos", "Miedo a la contaminación o a la suciedad", "Necesidad de simetría y orden"],
+      causas: ["Factores genéticos", "Anomalías en la función cerebral", "Factores ambientales como infecciones", "Estrés o trauma"],
+      sistemaId: "trastornos-mentales-emocionales",
+    },
+    {
+      id: "trastorno-de-estres-postraumatico",
+      nombre: "Trastorno de Estrés Postraumático",
+      otrosNombres: ["TEPT"],
+      descripcion: "Trastorno que puede ocurrir después de experimentar o presenciar un evento traumático.",
+      sintomas: ["Recuerdos angustiantes recurrentes (flashbacks)", "Pesadillas sobre el evento traumático", "Evasión de lugares, personas o actividades que recuerdan el trauma", "Hipervigilancia y reacciones de sobresalto exageradas", "Estado de ánimo negativo y desapego emocional"],
+      causas: ["Haber experimentado o presenciado un evento traumático", "Lesiones graves o amenaza de muerte", "Falta de apoyo social después del trauma", "Antecedentes de trastornos mentales"],
+      sistemaId: "trastornos-mentales-emocionales",
+    },
+    {
+      id: "trastorno-de-panico",
+      nombre: "Trastorno de Pánico",
+      otrosNombres: ["Ataques de Pánico"],
+      descripcion: "Episodios repentinos de miedo intenso que provocan reacciones físicas graves.",
+      sintomas: ["Ataques de pánico inesperados y recurrentes", "Palpitaciones o ritmo cardíaco acelerado", "Sudoración, temblores o sacudidas", "Sensación de ahogo o falta de aliento", "Miedo a perder el control o a morir"],
+      causas: ["Factores genéticos", "Temperamento propenso al estrés y a las emociones negativas", "Cambios en la función cerebral", "Experiencias vitales estresantes"],
+      sistemaId: "trastornos-mentales-emocionales",
+    },
+    {
+      id: "fobia-social",
+      nombre: "Fobia Social",
+      otrosNombres: ["Trastorno de Ansiedad Social"],
+      descripcion: "Miedo intenso y persistente de ser observado y juzgado por otros.",
+      sintomas: ["Miedo intenso a situaciones sociales", "Preocupación por ser juzgado o humillado", "Evitación de situaciones sociales temidas", "Sonrojarse, sudar o temblar en situaciones sociales", "Ansiedad anticipatoria antes de un evento social"],
+      causas: ["Factores genéticos y hereditarios", "Estructura cerebral (amígdala hiperactiva)", "Experiencias sociales negativas en el pasado", "Entorno familiar sobreprotector o controlador"],
+      sistemaId: "trastornos-mentales-emocionales",
+    },
+    {
+      id: "esquizofrenia",
+      nombre: "Esquizofrenia",
+      otrosNombres: [],
+      descripcion: "Trastorno que afecta la forma en que una persona piensa, siente y se comporta.",
+      sintomas: ["Alucinaciones (ver o escuchar cosas que no existen)", "Delirios (creencias falsas y firmemente sostenidas)", "Pensamiento y habla desorganizados", "Apatía y falta de motivación", "Aislamiento social"],
+      causas: ["Combinación de factores genéticos y ambientales", "Anomalías en la estructura y química del cerebro", "Complicaciones durante el embarazo o el parto", "Consumo de drogas psicoactivas en la adolescencia"],
+      sistemaId: "trastornos-mentales-emocionales",
+    },
+    {
+      id: "trastorno-por-deficit-de-atencion-e-hiperactividad",
+      nombre: "Trastorno por Déficit de Atención e Hiperactividad",
+      otrosNombres: ["TDAH"],
+      descripcion: "Patrón de falta de atención y/o hiperactividad-impulsividad que interfiere con el funcionamiento.",
+      sintomas: ["Dificultad para prestar atención y mantener la concentración", "Hiperactividad (inquietud, incapacidad para quedarse quieto)", "Impulsividad (actuar sin pensar en las consecuencias)", "Desorganización y problemas para terminar tareas", "Olvidos frecuentes en las actividades diarias"],
+      causas: ["Factores genéticos", "Diferencias en la estructura y función del cerebro", "Exposición a toxinas ambientales durante el embarazo", "Nacimiento prematuro o bajo peso al nacer"],
+      sistemaId: "trastornos-mentales-emocionales",
+    },
+    {
+      id: "trastornos-de-la-alimentacion",
+      nombre: "Trastornos de la Alimentación",
+      otrosNombres: ["Anorexia", "Bulimia", "Atracón"],
+      descripcion: "Afecciones graves que se relacionan con las conductas alimentarias que afectan negativamente la salud.",
+      sintomas: ["Preocupación excesiva por el peso y la figura corporal", "Restricción severa de la ingesta de alimentos", "Episodios recurrentes de atracones de comida", "Conductas purgativas como vómitos autoinducidos o uso de laxantes", "Aislamiento social y evitación de situaciones que involucren comida", "Cambios de humor, irritabilidad y depresión"],
+      causas: ["Predisposición genética y factores biológicos", "Antecedentes familiares de trastornos alimentarios", "Presión social y cultural por la delgadez", "Historial de trauma, abuso o acoso", "Presencia de otros trastornos de salud mental como ansiedad o depresión"],
+      sistemaId: "trastornos-mentales-emocionales",
+    },
+    {
+      id: "trastorno-limite-de-la-personalidad",
+      nombre: "Trastorno Límite de la Personalidad",
+      otrosNombres: ["TLP", "Borderline"],
+      descripcion: "Patrón de inestabilidad en las relaciones interpersonales, la autoimagen y los afectos.",
+      sintomas: ["Inestabilidad en las relaciones interpersonales, la autoimagen y los afectos", "Impulsividad marcada", "Miedo intenso al abandono", "Sentimientos crónicos de vacío", "Ira inapropiada e intensa"],
+      causas: ["Factores genéticos", "Anomalías en áreas del cerebro relacionadas con la regulación emocional", "Experiencias traumáticas en la infancia (abuso, negligencia)", "Entorno familiar invalidante"],
+      sistemaId: "trastornos-mentales-emocionales",
+    },
+    {
+      id: "agorafobia",
+      nombre: "Agorafobia",
+      otrosNombres: [],
+      descripcion: "Miedo y evitación de lugares o situaciones que pueden causar pánico.",
+      sintomas: ["Miedo o ansiedad intensa acerca de dos (o más) de las siguientes cinco situaciones: uso del transporte público, estar en espacios abiertos, estar en sitios cerrados, hacer cola o estar en medio de una multitud, estar fuera de casa solo", "Miedo a situaciones en las que escapar podría ser difícil o la ayuda podría no estar disponible", "Evitación de estas situaciones", "Las situaciones casi siempre provocan miedo o ansiedad"],
+      causas: ["Tener ataques de pánico", "Experiencias traumáticas", "Temperamento ansioso", "Factores genéticos"],
+      sistemaId: "trastornos-mentales-emocionales",
+    },
+    {
+      id: "trastorno-de-ansiedad-por-separacion",
+      nombre: "Trastorno de Ansiedad por Separación",
+      otrosNombres: [],
+      descripcion: "Miedo excesivo a la separación de las personas a las que se está apegado.",
+      sintomas: ["Sufrimiento emocional intenso y repetido al pensar en la separación", "Preocupación intensa y constante por la pérdida de un ser querido", "Preocupación constante por que suceda algo malo que cause la separación", "Negativa a estar fuera del hogar por miedo a la separación", "Pesadillas repetidas sobre la separación", "Quejas repetidas de dolores de cabeza o estómago antes o durante la separación"],
+      causas: ["Estrés de la vida o pérdidas que causan la separación", "Antecedentes familiares", "Cuestiones situacionales"],
+      sistemaId: "trastornos-mentales-emocionales",
+    },
+    {
+      id: "mutismo-selectivo",
+      nombre: "Mutismo Selectivo",
+      otrosNombres: [],
+      descripcion: "Incapacidad constante de hablar en situaciones sociales específicas.",
+      sintomas: ["Incapacidad constante para hablar en situaciones sociales específicas en las que se espera que hable (p. ej., en la escuela)", "Capacidad para hablar en otras situaciones (p. ej., en casa)", "La alteración interfiere con los logros educativos o laborales o con la comunicación social", "La duración de la alteración es de al menos un mes"],
+      causas: ["Ansiedad social extrema", "Temperamento tímido e inhibido", "Factores genéticos", "Trastornos del habla o del lenguaje"],
+      sistemaId: "trastornos-mentales-emocionales",
+    },
+    {
+      id: "fobia-especifica",
+      nombre: "Fobia Específica",
+      otrosNombres: ["Fobia Simple"],
+      descripcion: "Miedo intenso e irracional a un objeto o situación específica.",
+      sintomas: ["Miedo o ansiedad intensa por un objeto o situación específica (p. ej., volar, alturas, animales)", "El objeto o la situación fóbica casi siempre provoca miedo o ansiedad inmediata", "Evitación activa del objeto o la situación fóbica", "El miedo o la ansiedad es desproporcionado al peligro real", "Malestar clínicamente significativo"],
+      causas: ["Experiencias traumáticas directas o indirectas con el objeto o la situación", "Aprendizaje por observación (ver a otros tener miedo)", "Transmisión de información (p. ej., advertencias de los padres)", "Factores genéticos y temperamentales"],
+      sistemaId: "trastornos-mentales-emocionales",
+    },
+    {
+      id: "tricotilomania",
+      nombre: "Tricotilomanía",
+      otrosNombres: ["Trastorno de arrancarse el cabello"],
+      descripcion: "Impulso recurrente e irresistible de arrancarse el propio cabello.",
+      sintomas: ["Arrancarse el pelo de forma recurrente, lo que da lugar a su pérdida", "Intentos repetidos de disminuir o dejar de arrancarse el pelo", "Malestar clínicamente significativo", "El arrancarse el pelo no se atribuye a otra afección médica", "Puede ir acompañado de rituales"],
+      causas: ["Factores genéticos", "Forma de regular las emociones (ansiedad, aburrimiento)", "Desequilibrios químicos en el cerebro", "Estrés"],
+      sistemaId: "trastornos-mentales-emocionales",
+    },
+    {
+      id: "trastorno-de-excoriacion",
+      nombre: "Trastorno de Excoriación",
+      otrosNombres: ["Dermatilomanía"],
+      descripcion: "Trastorno caracterizado por rascarse la piel de forma compulsiva.",
+      sintomas: ["Rascarse la piel de forma recurrente, lo que da lugar a lesiones cutáneas", "Intentos repetidos de disminuir o dejar de rascarse la piel", "Malestar clínicamente significativo", "El rascado de la piel no se atribuye a los efectos fisiológicos de una sustancia o a otra afeacia médica", "Puede estar desencadenado por el estrés o la ansiedad"],
+      causas: ["Factores genéticos", "Respuesta a la ansiedad o al estrés", "Afecciones de la piel que provocan picor", "Hábito"],
+      sistemaId: "trastornos-mentales-emocionales",
+    },
+    {
+      id: "trastorno-dismorfico-corporal",
+      nombre: "Trastorno Dismórfico Corporal",
+      otrosNombres: ["TDC"],
+      descripcion: "Preocupación obsesiva por un defecto percibido en la apariencia física.",
+      sintomas: ["Estar extremadamente preocupado por un defecto percibido en la apariencia que los demás no pueden ver o que parece poco importante", "Estar convencido de que tienes un defecto en tu apariencia que te hace feo o deforme", "Creer que los demás ponen especial atención en tu apariencia de una manera negativa o se burlan de ti", "Tener comportamientos dirigidos a arreglar u ocultar el defecto percibido que son difíciles de resistir o controlar", "Intentar ocultar los defectos percibidos con el estilo, el maquillaje o la ropa", "Comparar constantemente tu apariencia con la de los demás"],
+      causas: ["Antecedentes familiares del trastorno", "Evaluación negativa o burlas sobre el cuerpo o la imagen propia durante la niñez", "Ciertos rasgos de la personalidad, como el perfeccionismo", "Presión social o expectativas de belleza", "Tener otra afección de salud mental, como ansiedad o depresión"],
+      sistemaId: "trastornos-mentales-emocionales",
+    },
+    {
+      id: "trastorno-de-acumulacion",
+      nombre: "Trastorno de Acumulación",
+      otrosNombres: ["Acumulación Compulsiva"],
+      descripcion: "Dificultad persistente para deshacerse de posesiones debido a una necesidad percibida de guardarlas.",
+      sintomas: ["Dificultad persistente para deshacerse o separarse de las posesiones, independientemente de su valor real", "Necesidad percibida de guardar los artículos y malestar asociado con deshacerse de ellos", "Acumulación de posesiones que congestionan y abarrotan las zonas de estar activas", "Malestar clínicamente significativo o deterioro del funcionamiento"],
+      causas: ["Factores genéticos", "Procesamiento anormal de la información en el cerebro", "Eventos vitales estresantes o traumáticos", "Rasgos de personalidad como la indecisión y el perfeccionismo"],
+      sistemaId: "trastornos-mentales-emocionales",
+    },
+    {
+      id: "trastorno-afectivo-estacional",
+      nombre: "Trastorno Afectivo Estacional",
+      otrosNombres: ["TAE", "Depresión Invernal"],
+      descripcion: "Depresión que ocurre en la misma época cada año.",
+      sintomas: ["Sentirse apático, triste o decaído gran parte del día, casi todos los días", "Perder el interés en actividades que solías disfrutar", "Tener poca energía y sentirse aletargado", "Dormir demasiado", "Antojos de carbohidratos, comer en exceso y subir de peso", "Dificultad para concentrarse"],
+      causas: ["Alteración del reloj biológico (ritmos circadianos) por la reducción de la luz solar", "Disminución de los niveles de serotonina, un neurotransmisor que afecta el estado de ánimo", "Desequilibrio en los niveles de melatonina, que interviene en los patrones de sueño y el estado de ánimo"],
+      sistemaId: "trastornos-mentales-emocionales",
+    },
+    {
+      id: "distimia",
+      nombre: "Distimia",
+      otrosNombres: ["Trastorno Depresivo Persistente"],
+      descripcion: "Forma crónica de depresión menos severa pero de larga duración.",
+      sintomas: ["Tristeza, desánimo o sensación de vacío", "Pérdida de interés en las actividades cotidianas", "Cansancio y falta de energía", "Baja autoestima", "Dificultad para concentrarse y tomar decisiones", "Alteraciones del sueño"],
+      causas: ["Desequilibrios químicos en el cerebro", "Antecedentes familiares de depresión", "Eventos traumáticos o estrés crónico", "Abuso de sustancias"],
+      sistemaId: "trastornos-mentales-emocionales",
+    },
+    {
+      id: "trastorno-ciclotimico",
+      nombre: "Trastorno Ciclotímico",
+      otrosNombres: ["Ciclotimia"],
+      descripcion: "Trastorno del estado de ánimo que causa altibajos emocionales, pero menos extremos que el trastorno bipolar.",
+      sintomas: ["Períodos de síntomas hipomaníacos y períodos de síntomas depresivos que no cumplen los criterios para un episodio de depresión mayor", "Los síntomas han estado presentes durante al menos dos años", "Los períodos de estabilidad del estado de ánimo no duran más de dos meses", "Malestar clínicamente significativo", "Deterioro funcional"],
+      causas: ["Factores genéticos (antecedentes familiares de trastorno bipolar)", "Diferencias en la función cerebral", "Factores ambientales", "Temperamento"],
+      sistemaId: "trastornos-mentales-emocionales",
+    },
+    {
+      id: "trastorno-disforico-premenstrual",
+      nombre: "Trastorno Disfórico Premenstrual",
+      otrosNombres: ["TDPM"],
+      descripcion: "Forma grave del síndrome premenstrual (SPM) con síntomas emocionales y físicos.",
+      sintomas: ["Falta de interés en las actividades diarias", "Fatiga o falta de energía", "Tristeza o desesperanza", "Ansiedad", "Altibajos en el estado de ánimo", "Irritabilidad o ira persistente"],
+      causas: ["Cambios hormonales durante el ciclo menstrual", "Abuso de alcohol o drogas ilícitas", "Trastornos de la tiroides", "Sobrepeso", "Falta de ejercicio"],
+      sistemaId: "trastornos-mentales-emocionales",
+    },
+    {
+      id: "trastorno-de-desregulacion-disruptiva-del-estado-de-animo",
+      nombre: "Trastorno de Desregulación Disruptiva del Estado de Ánimo",
+      otrosNombres: ["TDDEA"],
+      descripcion: "Irritabilidad crónica, grave y persistente en niños y adolescentes.",
+      sintomas: ["Arrebatos intensos de mal genio (verbales o conductuales)", "Arrebatos y berrinches recurrentes durante al menos 12 meses", "Estado de ánimo crónicamente irritable o enojo la mayor parte del día", "Problemas de funcionamiento en más de un lugar (hogar, escuela, compañeros)"],
+      causas: ["Trastorno del neurodesarrollo", "Componentes genéticos", "Componentes ambientales", "Coexistencia con otros trastornos como el TDAH o la ansiedad"],
+      sistemaId: "trastornos-mentales-emocionales",
+    },
+    {
+      id: "trastorno-esquizoafectivo",
+      nombre: "Trastorno Esquizoafectivo",
+      otrosNombres: [],
+      descripcion: "Combinación de síntomas de esquizofrenia y trastornos del estado de ánimo.",
+      sintomas: ["Combinación de síntomas de esquizofrenia (alucinaciones, delirios) y síntomas de un trastorno del estado de ánimo (depresión o manía)", "Período de enfermedad durante el cual hay un episodio depresivo mayor o maníaco concurrente con los síntomas de la esquizofrenia", "Delirios o alucinaciones durante al menos 2 semanas en ausencia de un episodio de estado de ánimo mayor", "Deterioro funcional"],
+      causas: ["Factores genéticos", "Química cerebral", "Factores ambientales estresantes", "Consumo de drogas"],
+      sistemaId: "trastornos-mentales-emocionales",
+    },
+    {
+      id: "trastorno-delirante",
+      nombre: "Trastorno Delirante",
+      otrosNombres: ["Paranoia"],
+      descripcion: "Creencias falsas y fijas (delirios) sin otros síntomas de esquizofrenia.",
+      sintomas: ["Presencia de uno o más delirios con una duración de un mes o más", "El funcionamiento no está marcadamente alterado y el comportamiento no es obviamente extraño o extravagante", "Si se han producido episodios maníacos o depresivos mayores, han sido breves en relación con la duración de los períodos delirantes", "Creencias falsas y fijas (p. ej., de persecución, de grandeza)"],
+      causas: ["Factores genéticos", "Desequilibrios en los neurotransmisores", "Estrés extremo", "Aislamiento social"],
+      sistemaId: "trastornos-mentales-emocionales",
+    },
+    {
+      id: "trastorno-psicotico-breve",
+      nombre: "Trastorno Psicótico Breve",
+      otrosNombres: [],
+      descripcion: "Episodio psicótico repentino y de corta duración, a menudo en respuesta a un evento estresante.",
+      sintomas: ["Aparición súbita de al menos uno de los siguientes síntomas psicóticos: delirios, alucinaciones, habla desorganizada", "Comportamiento muy desorganizado o catatónico", "La duración del episodio es de al menos un día pero menos de un mes", "Retorno completo al nivel de funcionamiento previo a la enfermedad"],
+      causas: ["Estrés extremo o un evento traumático", "Factores genéticos", "Falta de sueño", "Postparto"],
+      sistemaId: "trastornos-mentales-emocionales",
+    },
+    {
+      id: "trastorno-de-la-personalidad-paranoide",
+      nombre: "Trastorno de la Personalidad Paranoide",
+      otrosNombres: [],
+      descripcion: "Patrón de desconfianza y suspicacia hacia los demás.",
+      sintomas: ["Desconfianza y sospecha generalizadas hacia los demás", "Creencia de que los demás tienen intenciones maliciosas", "Preocupación injustificada por la lealtad o la fiabilidad de los amigos y socios", "Reticencia a confiar en los demás por miedo a que la información sea utilizada en su contra", "Interpretación de significados denigrantes o amenazantes en comentarios o acontecimientos benignos", "Reacción de ira u hostilidad ante lo que perciben como ataques a su persona."],
+      causas: ["Factores genéticos", "Antecedentes familiares de esquizofrenia y otros trastornos psicóticos", "Experiencias traumáticas en la infancia, como negligencia física o emocional."],
+      sistemaId: "trastornos-mentales-emocionales",
+    },
+    {
+      id: "trastorno-de-la-personalidad-esquizoide",
+      nombre: "Trastorno de la Personalidad Esquizoide",
+      otrosNombres: [],
+      descripcion: "Patrón de distanciamiento de las relaciones sociales y una gama restringida de expresión emocional.",
+      sintomas: ["Querer estar solo y realizar actividades en soledad", "No interesarse ni disfrutar de las relaciones cercanas", "Sentir poco o ningún deseo de mantener relaciones sexuales", "Dificultad para expresar emociones y reaccionar", "Falta de motivación para alcanzar metas", "No reaccionar ante los elogios o las críticas de los demás"],
+      causas: ["Tener un familiar con trastorno de la personalidad esquizoide, trastorno esquizotípico de la personalidad o esquizofrenia", "Tener un padre que se mostraba frío, no cuidaba adecuadamente y no daba apoyo emocional", "Factores genéticos", "Factores ambientales"],
+      sistemaId: "trastornos-mentales-emocionales",
+    },
+    {
+      id: "trastorno-de-la-personalidad-esquizotipica",
+      nombre: "Trastorno de la Personalidad Esquizotípica",
+      otrosNombres: [],
+      descripcion: "Patrón de malestar agudo en las relaciones cercanas, distorsiones cognitivas o perceptivas y excentricidades del comportamiento.",
+      sintomas: ["Ser solitario y carecer de amigos cercanos fuera de la familia inmediata", "Emociones planas o respuestas emocionales limitadas o socialmente inapropiadas", "Ansiedad social excesiva y persistente", "Pensamientos, creencias o gestos extraños o inusuales", "Pensamientos sospechosos o paranoicos y dudas constantes sobre la lealtad de los demás", "Creencia en poderes especiales, como telepatía mental o supersticiones."],
+      causas: ["Cambios en la forma en que funciona el cerebro", "Genética", "Influencias ambientales", "Comportamientos aprendidos", "Antecedentes familiares de esquizofrenia u otro trastorno psicótico."],
+      sistemaId: "trastornos-mentales-emocionales",
+    },
+    {
+      id: "trastorno-de-la-personalidad-antisocial",
+      nombre: "Trastorno de la Personalidad Antisocial",
+      otrosNombres: ["Psicopatía", "Sociopatía"],
+      descripcion: "Patrón de desprecio y violación de los derechos de los demás.",
+      sintomas: ["Ignorar qué está bien y qué está mal", "Decir mentiras para aprovecharse de los demás", "Ser insensible o no respetar a otras personas", "Quebrantar la ley constantemente", "No demostrar culpa ni remordimiento", "Comportamiento impulsivo"],
+      causas: ["Factores genéticos", "Maltrato infantil", "Antecedentes familiares de Trastorno de la Personalidad Antisocial u otros trastornos de la personalidad", "Abuso de sustancias"],
+      sistemaId: "trastornos-mentales-emocionales",
+    },
+    {
+      id: "trastorno-de-la-personalidad-histrionica",
+      nombre: "Trastorno de la Personalidad Histriónica",
+      otrosNombres: [],
+      descripcion: "Patrón de emotividad excesiva y búsqueda de atención.",
+      sintomas: ["Necesidad de ser el centro de atención", "Comportamiento seductor o provocativo inapropiado", "Emociones superficiales y rápidamente cambiantes", "Preocupación excesiva por la apariencia física", "Ser fácilmente influenciable por los demás", "Discurso excesivamente vago y carente de detalles"],
+      causas: ["Factores genéticos", "Experiencias de la infancia", "Estilo de crianza", "Factores neurobiológicos"],
+      sistemaId: "trastornos-mentales-emocionales",
+    },
+    {
+      id: "trastorno-de-la-personalidad-narcisista",
+      nombre: "Trastorno de la Personalidad Narcisista",
+      otrosNombres: ["Narcisismo"],
+      descripcion: "Patrón de grandiosidad, necesidad de admiración y falta de empatía.",
+      sintomas: ["Tener un aire de superioridad irrazonable y necesitar constantemente la admiración excesiva de los demás", "Sentir que merecen tener privilegios y recibir un trato especial", "Aprovecharse de los demás para lograr lo que quieren", "Tener incapacidad o falta de voluntad para reconocer las necesidades y los sentimientos de los demás", "Preocuparse por fantasías sobre el éxito, el poder, la brillantez, la belleza o la pareja perfecta", "Comportarse con arrogancia, alardear mucho y ser consideradas engreídas."],
+      causas: ["Entorno familiar en la infancia (relaciones con los padres de demasiada adoración o crítica)", "Genética (características heredadas)", "Neurobiología (conexión entre cerebro, conducta y pensamiento)."],
+      sistemaId: "trastornos-mentales-emocionales",
+    },
+    {
+      id: "trastorno-de-la-personalidad-evitativa",
+      nombre: "Trastorno de la Personalidad por Evitación",
+      otrosNombres: ["Trastorno de la Personalidad Evasiva"],
+      descripcion: "Patrón de inhibición social, sentimientos de insuficiencia e hipersensibilidad a la evaluación negativa.",
+      sintomas: ["Hipersensibilidad a la crítica y al rechazo", "Aislamiento social autoimpuesto", "Timidez o ansiedad en situaciones sociales", "Sentimientos de ineptitud", "Baja autoestima", "Evitación de actividades laborales que implican contacto interpersonal"],
+      causas: ["Factores genéticos", "Factores ambientales", "Rechazo o acoso en la infancia"],
+      sistemaId: "trastornos-mentales-emocionales",
+    },
+    {
+      id: "trastorno-de-la-personalidad-dependiente",
+      nombre: "Trastorno de la Personalidad Dependiente",
+      otrosNombres: [],
+      descripcion: "Patrón de comportamiento sumiso y pegajoso relacionado con una necesidad excesiva de ser cuidado.",
+      sintomas: ["Dificultad para tomar decisiones cotidianas sin un exceso de consejo y reafirmación por parte de los demás", "Necesidad de que otros asuman la responsabilidad en las áreas más importantes de su vida", "Dificultad para expresar el desacuerdo con los demás por miedo a la pérdida de apoyo o aprobación", "Dificultad para iniciar proyectos o hacer cosas por su cuenta debido a la falta de confianza en el propio juicio o capacidades", "Va demasiado lejos para obtener la aceptación y el apoyo de los demás, hasta el punto de hacer voluntariamente cosas que son desagradables", "Se siente incómodo o indefenso cuando está solo por temores exagerados de ser incapaz de cuidar de sí mismo"],
+      causas: ["Factores genéticos y hereditarios", "Experiencias traumáticas en la infancia, como el abuso o la negligencia", "Estilos de crianza sobreprotectores o autoritarios", "Antecedentes familiares de trastornos de ansiedad", "Una enfermedad física crónica durante la infancia"],
+      sistemaId: "trastornos-mentales-emocionales",
+    },
+    {
+      id: "trastorno-de-la-personalidad-obsesivo-compulsiva",
+      nombre: "Trastorno de la Personalidad Obsesivo-Compulsiva",
+      otrosNombres: ["TPOC"],
+      descripcion: "Patrón de preocupación por el orden, el perfeccionismo y el control.",
+      sintomas: ["Preocupación excesiva por los detalles, el orden y las normas", "Perfeccionismo que interfiere con la finalización de las tareas", "Devoción excesiva al trabajo y la productividad, excluyendo actividades de ocio y amistades", "Rigidez y obstinación", "Incapacidad para delegar tareas o trabajar con otros", "Avaricia y un estilo de vida miserable"],
+      causas: ["Factores genéticos y hereditarios", "Experiencias traumáticas durante la infancia", "Estilo de crianza autoritario y sobreprotector"],
+      sistemaId: "trastornos-mentales-emocionales",
+    },
+    {
+      id: "trastorno-de-conversion",
+      nombre: "Trastorno de Conversión",
+      otrosNombres: ["Trastorno de Síntomas Neurológicos Funcionales"],
+      descripcion: "Síntomas neurológicos inexplicables que afectan el movimiento o los sentidos.",
+      sintomas: ["Debilidad o parálisis", "Movimiento anormal, como temblores o dificultad para caminar", "Convulsiones o crisis no epilépticas", "Problemas del habla, como incapacidad para hablar o habla arrastrada", "Problemas de visión, como visión doble o ceguera", "Entumecimiento o pérdida de sensibilidad al tacto"],
+      causas: ["Estrés considerable o trauma emocional o físico reciente", "Afección de salud mental preexistente (trastorno de ansiedad, del estado de ánimo, disociativo o de la personalidad)", "Antecedentes de abuso físico o sexual o descuido en la infancia", "Padecer una enfermedad o trastorno neurológico"],
+      sistemaId: "trastornos-mentales-emocionales",
+    },
+    {
+      id: "trastorno-de-sintomas-somaticos",
+      nombre: "Trastorno de Síntomas Somáticos",
+      otrosNombres: ["Hipocondría"],
+      descripcion: "Enfoque extremo en los síntomas físicos que causa una gran angustia emocional.",
+      sintomas: ["Dolor", "Fatiga o debilidad", "Dificultad para respirar", "Entumecimiento", "Malestar gastrointestinal", "Ansiedad excesiva por los síntomas físicos"],
+      causas: ["Factores genéticos y biológicos", "Influencia familiar", "Rasgo de negatividad", "Historial de trauma o abuso", "Comportamiento aprendido"],
+      sistemaId: "trastornos-mentales-emocionales",
+    },
+    {
+      id: "trastorno-facticio",
+      nombre: "Trastorno Facticio",
+      otrosNombres: ["Síndrome de Munchausen"],
+      descripcion: "Falsificación de signos o síntomas físicos o psicológicos.",
+      sintomas: ["Problemas médicos o de salud mental astutos y convincentes", "Amplios conocimientos de términos médicos y enfermedades", "Síntomas imprecisos o inconsistentes", "Afecciones que empeoran sin razón aparente", "Afecciones que no responden a los tratamientos habituales", "Búsqueda de tratamiento de muchos profesionales de atención médica u hospitales diferentes"],
+      causas: ["Traumas infantiles", "Enfermedad grave en la infancia", "Pérdida de un ser querido", "Trastornos de la personalidad", "Depresión"],
+      sistemaId: "trastornos-mentales-emocionales",
+    },
+    {
+      id: "amnesia-disociativa",
+      nombre: "Amnesia Disociativa",
+      otrosNombres: [],
+      descripcion: "Incapacidad para recordar información personal importante, generalmente de naturaleza traumática o estresante.",
+      sintomas: ["Pérdida de memoria de información personal importante", "Incapacidad para recordar eventos específicos, en especial traumáticos", "Sensación de desapego de uno mismo (despersonalización)", "Confusión o desorientación", "Problemas en las relaciones sociales y laborales"],
+      causas: ["Experimentar o presenciar un evento traumático", "Abuso físico o sexual grave en la infancia", "Estrés abrumador por guerra o combate", "Ser víctima de un desastre natural"],
+      sistemaId: "trastornos-mentales-emocionales",
+    },
+  ],
+};
+
+export default sistema;
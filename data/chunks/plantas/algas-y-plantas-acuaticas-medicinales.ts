@@ -0,0 +1,386 @@
+// Generado automáticamente por scripts/build-catalog.py - no editar a mano
+import type { CategoriaPlanta } from '../../plantas-expandidas';
+
+const categoria: CategoriaPlanta = {
+  id: "algas-y-plantas-acuaticas-medicinales",
+  nombre: "Algas y plantas acuáticas medicinales",
+  plantas: [
+    {
+      id: "espirulina",
+      nombre: "Espirulina",
+      nombreCientifico: "Arthrospira platensis",
+      nombresAlternativos: {"España": ["espirulina"], "USA_English": ["Spirulina"]},
+      propiedades: ["Nutritiva", "Antioxidante", "Antiinflamatoria", "Inmunomoduladora"],
+      parteUsable: "Toda la planta",
+      dosis: "3-5 gramos al día",
+      preparacion: "Polvo para batidos o cápsulas",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Personas con fenilcetonuria deben evitarla." }],
+      descripcion: "Microalga verdiazul rica en proteínas, vitaminas y minerales.",
+      sistemasRelacionados: ["sistema-inmunologico", "sistema-digestivo", "sistema-cardiovascular"],
+      categoriaId: "algas-y-plantas-acuaticas-medicinales",
+      categoria: "Algas y plantas acuáticas medicinales",
+    },
+    {
+      id: "chlorella",
+      nombre: "Chlorella",
+      nombreCientifico: "Chlorella vulgaris",
+      nombresAlternativos: {"España": ["clorela"], "USA_English": ["Chlorella"]},
+      propiedades: ["Desintoxicante", "Rica en clorofila", "Apoyo inmunológico"],
+      parteUsable: "Toda la planta",
+      dosis: "2-3 gramos al día",
+      preparacion: "Polvo o tabletas",
+      contraindicaciones: [{ tipo: "alergia", descripcion: "Puede causar reacciones alérgicas en personas sensibles." }],
+      descripcion: "Alga verde unicelular que ayuda a eliminar metales pesados y toxinas del cuerpo.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-inmunologico", "sistema-linfatico"],
+      categoriaId: "algas-y-plantas-acuaticas-medicinales",
+      categoria: "Algas y plantas acuáticas medicinales",
+    },
+    {
+      id: "kelp",
+      nombre: "Kelp",
+      nombreCientifico: "Laminaria spp.",
+      nombresAlternativos: {"España": ["kelp", "laminaria"], "USA_English": ["Kelp"]},
+      propiedades: ["Rico en yodo", "Apoyo tiroideo", "Nutritivo"],
+      parteUsable: "Toda la planta",
+      dosis: "600-1200 mg al día",
+      preparacion: "Polvo, cápsulas o en alimentos",
+      contraindicaciones: [{ tipo: "otro", descripcion: "No consumir en exceso por su alto contenido de yodo." }],
+      descripcion: "Alga marina marrón, una de las mejores fuentes naturales de yodo.",
+      sistemasRelacionados: ["sistema-endocrino", "sistema-inmunologico"],
+      categoriaId: "algas-y-plantas-acuaticas-medicinales",
+      categoria: "Algas y plantas acuáticas medicinales",
+    },
+    {
+      id: "wakame",
+      nombre: "Wakame",
+      nombreCientifico: "Undaria pinnatifida",
+      nombresAlternativos: {"España": ["wakame"], "USA_English": ["Wakame"]},
+      propiedades: ["Rico en fucoxantina", "Quema grasa", "Salud cardiovascular"],
+      parteUsable: "Hojas",
+      dosis: "4-10 gramos al día",
+      preparacion: "En ensaladas, sopas o rehidratado",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Consumir con moderación por su contenido de yodo." }],
+      descripcion: "Alga comestible popular en la cocina japonesa, con potenciales beneficios para la pérdida de peso.",
+      sistemasRelacionados: ["sistema-cardiovascular", "sistema-endocrino"],
+      categoriaId: "algas-y-plantas-acuaticas-medicinales",
+      categoria: "Algas y plantas acuáticas medicinales",
+    },
+    {
+      id: "nori",
+      nombre: "Nori",
+      nombreCientifico: "Porphyra spp.",
+      nombresAlternativos: {"España": ["nori"], "USA_English": ["Nori"]},
+      propiedades: ["Rica en vitamina B12", "Salud ocular", "Antiviral"],
+      parteUsable: "Hojas secas",
+      dosis: "2-3 hojas al día",
+      preparacion: "Consumo directo en láminas secas (sushi, snacks)",
+      contraindicaciones: [],
+      descripcion: "Alga roja conocida por usarse para envolver el sushi, rica en nutrientes esenciales.",
+      sistemasRelacionados: ["sistema-digestivo", "enfermedades-ojos-oidos-nariz-garganta"],
+      categoriaId: "algas-y-plantas-acuaticas-medicinales",
+      categoria: "Algas y plantas acuáticas medicinales",
+    },
+    {
+      id: "dulse",
+      nombre: "Dulse",
+      nombreCientifico: "Palmaria palmata",
+      nombresAlternativos: {"España": ["dulse"], "USA_English": ["Dulse"]},
+      propiedades: ["Rica en hierro", "Antioxidante", "Salud ósea"],
+      parteUsable: "Toda la planta",
+      dosis: "5-10 gramos al día",
+      preparacion: "Fresca, seca como snack o en polvo",
+      contraindicaciones: [],
+      descripcion: "Alga roja con un sabor salado y ahumado, excelente fuente de minerales.",
+      sistemasRelacionados: ["sistema-musculoesqueletico", "sistema-cardiovascular"],
+      categoriaId: "algas-y-plantas-acuaticas-medicinales",
+      categoria: "Algas y plantas acuáticas medicinales",
+    },
+    {
+      id: "fucus",
+      nombre: "Fucus",
+      nombreCientifico: "Fucus vesiculosus",
+      nombresAlternativos: {"España": ["fucus"], "USA_English": ["Bladderwrack"]},
+      propiedades: ["Estimulante metabólico", "Apoyo tiroideo", "Antiinflamatorio"],
+      parteUsable: "Talo",
+      dosis: "500-1000 mg al día",
+      preparacion: "Decocción, extracto líquido o cápsulas",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "No recomendado durante el embarazo y la lactancia." }, { tipo: "hipertension", descripcion: "Puede afectar la presión arterial." }],
+      descripcion: "Alga marrón también conocida como sargazo vejigoso, usada tradicionalmente para problemas de tiroides y obesidad.",
+      sistemasRelacionados: ["sistema-endocrino", "sistema-digestivo"],
+      categoriaId: "algas-y-plantas-acuaticas-medicinales",
+      categoria: "Algas y plantas acuáticas medicinales",
+    },
+    {
+      id: "agar-agar",
+      nombre: "Agar-agar",
+      nombreCientifico: "Gelidium spp.",
+      nombresAlternativos: {"España": ["agar-agar"], "USA_English": ["Agar-agar"]},
+      propiedades: ["Laxante suave", "Saciente", "Regulador intestinal"],
+      parteUsable: "Extracto gelatinoso",
+      dosis: "4-16 gramos al día",
+      preparacion: "Polvo para gelatinas o preparaciones culinarias",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Puede causar obstrucción intestinal si no se consume con suficiente líquido." }],
+      descripcion: "Sustancia gelatinosa derivada de algas rojas, usada como espesante y para promover la regularidad digestiva.",
+      sistemasRelacionados: ["sistema-digestivo"],
+      categoriaId: "algas-y-plantas-acuaticas-medicinales",
+      categoria: "Algas y plantas acuáticas medicinales",
+    },
+    {
+      id: "musgo-de-irlanda",
+      nombre: "Musgo de Irlanda",
+      nombreCientifico: "Chondrus crispus",
+      nombresAlternativos: {"España": ["musgo de Irlanda", "carragaén"], "USA_English": ["Irish moss"]},
+      propiedades: ["Expectorante", "Demulcente", "Nutritivo"],
+      parteUsable: "Toda la planta",
+      dosis: "10-20 gramos de alga seca al día",
+      preparacion: "Decocción para hacer un gel, o en polvo",
+      contraindicaciones: [{ tipo: "medicamentos", descripcion: "Puede interferir con medicamentos anticoagulantes." }],
+      descripcion: "Alga roja que forma un gel mucilaginoso al hervirse, utilizada para aliviar la tos y la irritación de garganta.",
+      sistemasRelacionados: ["sistema-respiratorio", "sistema-digestivo", "enfermedades-piel"],
+      categoriaId: "algas-y-plantas-acuaticas-medicinales",
+      categoria: "Algas y plantas acuáticas medicinales",
+    },
+    {
+      id: "kombu",
+      nombre: "Kombu",
+      nombreCientifico: "Saccharina japonica",
+      nombresAlternativos: {"España": ["kombu"], "USA_English": ["Kombu"]},
+      propiedades: ["Rica en glutamato", "Mejora la digestión de legumbres", "Fuente de yodo"],
+      parteUsable: "Toda la planta",
+      dosis: "Tiras pequeñas en cocciones",
+      preparacion: "Añadida a sopas, guisos y cocción de legumbres",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Moderar consumo por su alto contenido en yodo." }],
+      descripcion: "Alga parda comestible, esencial en la cocina japonesa para hacer el caldo dashi.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-endocrino"],
+      categoriaId: "algas-y-plantas-acuaticas-medicinales",
+      categoria: "Algas y plantas acuáticas medicinales",
+    },
+    {
+      id: "arame",
+      nombre: "Arame",
+      nombreCientifico: "Eisenia bicyclis",
+      nombresAlternativos: {"España": ["arame"], "USA_English": ["Arame"]},
+      propiedades: ["Equilibrio hormonal", "Rica en calcio", "Salud capilar"],
+      parteUsable: "Hojas",
+      dosis: "5-10 gramos (peso seco) por ración",
+      preparacion: "Remojar y añadir a salteados, ensaladas o guisos",
+      contraindicaciones: [],
+      descripcion: "Alga parda de sabor suave y dulce, apreciada en la cocina macrobiótica.",
+      sistemasRelacionados: ["sistema-endocrino", "sistema-musculoesqueletico"],
+      categoriaId: "algas-y-plantas-acuaticas-medicinales",
+      categoria: "Algas y plantas acuáticas medicinales",
+    },
+    {
+      id: "hijiki",
+      nombre: "Hijiki",
+      nombreCientifico: "Sargassum fusiforme",
+      nombresAlternativos: {"España": ["hijiki"], "USA_English": ["Hijiki"]},
+      propiedades: ["Rica en fibra", "Aporte de minerales", "Fortalece huesos y dientes"],
+      parteUsable: "Toda la planta",
+      dosis: "Consumo ocasional y moderado",
+      preparacion: "Remojar y cocinar en guisos o salteados",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Puede contener arsénico inorgánico, se recomienda un consumo muy limitado." }],
+      descripcion: "Alga de color oscuro y textura firme, tradicional en la cocina japonesa.",
+      sistemasRelacionados: ["sistema-musculoesqueletico", "sistema-digestivo"],
+      categoriaId: "algas-y-plantas-acuaticas-medicinales",
+      categoria: "Algas y plantas acuáticas medicinales",
+    },
+    {
+      id: "lechuga-de-mar",
+      nombre: "Lechuga de mar",
+      nombreCientifico: "Ulva lactuca",
+      nombresAlternativos: {"España": ["lechuga de mar"], "USA_English": ["Sea lettuce"]},
+      propiedades: ["Depurativa", "Rica en hierro y magnesio", "Antioxidante"],
+      parteUsable: "Hojas",
+      dosis: "Como guarnición o en ensaladas",
+      preparacion: "Cruda en ensaladas, cocida en sopas o deshidratada",
+      contraindicaciones: [],
+      descripcion: "Alga verde brillante de hojas finas y traslúcidas, similar a la lechuga terrestre.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-cardiovascular"],
+      categoriaId: "algas-y-plantas-acuaticas-medicinales",
+      categoria: "Algas y plantas acuáticas medicinales",
+    },
+    {
+      id: "esparrago-de-mar",
+      nombre: "Espárrago de mar",
+      nombreCientifico: "Salicornia europaea",
+      nombresAlternativos: {"España": ["espárrago de mar", "salicornia"], "USA_English": ["Glasswort", "pickleweed", "sea asparagus"]},
+      propiedades: ["Diurética", "Rica en vitamina C", "Remineralizante"],
+      parteUsable: "Tallos tiernos",
+      dosis: "Como alimento, en raciones moderadas",
+      preparacion: "Cocida al vapor, salteada o encurtida",
+      contraindicaciones: [{ tipo: "hipertension", descripcion: "Contiene sal de forma natural, moderar en caso de hipertensión." }],
+      descripcion: "Planta halófita (tolerante a la sal) que crece en marismas, de textura crujiente y sabor salado.",
+      sistemasRelacionados: ["sistema-urinario", "sistema-inmunologico"],
+      categoriaId: "algas-y-plantas-acuaticas-medicinales",
+      categoria: "Algas y plantas acuáticas medicinales",
+    },
+    {
+      id: "lenteja-de-agua",
+      nombre: "Lenteja de agua",
+      nombreCientifico: "Lemna minor",
+      nombresAlternativos: {"España": ["lenteja de agua"], "USA_English": ["Duckweed"]},
+      propiedades: ["Alta en proteínas", "Depurativa de aguas", "Antiinflamatoria"],
+      parteUsable: "Toda la planta",
+      dosis: "Tradicionalmente usada en animales, no extendido en humanos",
+      preparacion: "Consumo directo (previa desinfección)",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Debe ser recolectada de aguas no contaminadas." }],
+      descripcion: "Planta acuática flotante muy pequeña que se reproduce rápidamente, considerada un superalimento emergente.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-inmunologico"],
+      categoriaId: "algas-y-plantas-acuaticas-medicinales",
+      categoria: "Algas y plantas acuáticas medicinales",
+    },
+    {
+      id: "jacinto-de-agua",
+      nombre: "Jacinto de agua",
+      nombreCientifico: "Eichhornia crassipes",
+      nombresAlternativos: {"España": ["jacinto de agua", "camalote"], "USA_English": ["Water hyacinth"]},
+      propiedades: ["Fitorremediación", "Antiinflamatoria", "Cicatrizante"],
+      parteUsable: "Hojas y flores",
+      dosis: "Uso externo principalmente",
+      preparacion: "Cataplasma con las hojas machacadas",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Considerada una especie invasora, su uso interno no es común." }],
+      descripcion: "Planta acuática flotante con hermosas flores, más conocida por su capacidad de limpiar aguas contaminadas.",
+      sistemasRelacionados: ["enfermedades-piel", "sistema-linfatico"],
+      categoriaId: "algas-y-plantas-acuaticas-medicinales",
+      categoria: "Algas y plantas acuáticas medicinales",
+    },
+    {
+      id: "nenufar-blanco",
+      nombre: "Nenúfar blanco",
+      nombreCientifico: "Nymphaea alba",
+      nombresAlternativos: {"España": ["nenúfar blanco", "lirio de agua blanco"], "USA_English": ["White water lily"]},
+      propiedades: ["Sedante", "Anaphrodisiaco", "Astringente"],
+      parteUsable: "Rizoma y flores",
+      dosis: "1-2 gramos de rizoma seco en decocción",
+      preparacion: "Decocción del rizoma, infusión de las flores",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "Evitar durante el embarazo." }],
+      descripcion: "Planta acuática ornamental con propiedades medicinales conocidas desde la antigüedad para calmar la excitación nerviosa.",
+      sistemasRelacionados: ["sistema-nervioso", "sistema-reproductor"],
+      categoriaId: "algas-y-plantas-acuaticas-medicinales",
+      categoria: "Algas y plantas acuáticas medicinales",
+    },
+    {
+      id: "berro-de-agua",
+      nombre: "Berro de agua",
+      nombreCientifico: "Nasturtium officinale",
+      nombresAlternativos: {"España": ["berro de agua"], "USA_English": ["Watercress"]},
+      propiedades: ["Expectorante", "Diurético", "Rico en vitaminas A y C", "Depurativo"],
+      parteUsable: "Hojas y tallos",
+      dosis: "Consumo como alimento en ensaladas o jugos",
+      preparacion: "Crudo en ensaladas, sopas o jugos frescos",
+      contraindicaciones: [{ tipo: "ninos", descripcion: "No dar a niños menores de 4 años." }, { tipo: "otro", descripcion: "Puede irritar el estómago si se consume en grandes cantidades." }],
+      descripcion: "Planta acuática que crece en arroyos limpios, valorada por su sabor picante y sus propiedades nutritivas y medicinales.",
+      sistemasRelacionados: ["sistema-respiratorio", "sistema-urinario", "sistema-inmunologico"],
+      categoriaId: "algas-y-plantas-acuaticas-medicinales",
+      categoria: "Algas y plantas acuáticas medicinales",
+    },
+    {
+      id: "menta-acuatica",
+      nombre: "Menta acuática",
+      nombreCientifico: "Mentha aquatica",
+      nombresAlternativos: {"España": ["menta acuática", "hierbabuena de agua"], "USA_English": ["Water mint"]},
+      propiedades: ["Digestiva", "Carminativa", "Antiespasmódica"],
+      parteUsable: "Hojas",
+      dosis: "1-2 cucharaditas de hojas secas por taza de agua",
+      preparacion: "Infusión",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Similar a otras mentas, evitar en caso de reflujo gastroesofágico severo." }],
+      descripcion: "Variedad de menta que crece en zonas húmedas y bordes de agua, con un aroma y propiedades similares a la menta piperita.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-nervioso"],
+      categoriaId: "algas-y-plantas-acuaticas-medicinales",
+      categoria: "Algas y plantas acuáticas medicinales",
+    },
+    {
+      id: "lirio-amarillo",
+      nombre: "Lirio amarillo",
+      nombreCientifico: "Iris pseudacorus",
+      nombresAlternativos: {"España": ["lirio amarillo", "acoro bastardo"], "USA_English": ["Yellow iris"]},
+      propiedades: ["Astringente", "Vulnerario", "Emetico (en altas dosis)"],
+      parteUsable: "Rizoma",
+      dosis: "Uso externo. Internamente es tóxico si no se maneja por un experto.",
+      preparacion: "Decocción del rizoma para lavados o cataplasmas",
+      contraindicaciones: [{ tipo: "otro", descripcion: "El rizoma fresco es muy irritante y tóxico si se ingiere." }],
+      descripcion: "Planta de humedales con flores amarillas vistosas. Su rizoma se ha usado externamente para heridas y problemas de piel.",
+      sistemasRelacionados: ["enfermedades-piel"],
+      categoriaId: "algas-y-plantas-acuaticas-medicinales",
+      categoria: "Algas y plantas acuáticas medicinales",
+    },
+    {
+      id: "cola-de-caballo-de-agua",
+      nombre: "Cola de caballo de agua",
+      nombreCientifico: "Equisetum fluviatile",
+      nombresAlternativos: {"España": ["cola de caballo de agua"], "USA_English": ["Water horsetail"]},
+      propiedades: ["Diurética", "Remineralizante", "Astringente"],
+      parteUsable: "Tallos estériles",
+      dosis: "2-4 gramos de planta seca en infusión, hasta 3 veces al día",
+      preparacion: "Infusión o decocción",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "No usar durante el embarazo o lactancia." }, { tipo: "medicamentos", descripcion: "Precaución con medicamentos para la diabetes o diuréticos." }],
+      descripcion: "Variedad de cola de caballo que crece en aguas poco profundas. Rica en sílice, ayuda a la salud de huesos, uñas y cabello.",
+      sistemasRelacionados: ["sistema-urinario", "sistema-musculoesqueletico", "enfermedades-piel"],
+      categoriaId: "algas-y-plantas-acuaticas-medicinales",
+      categoria: "Algas y plantas acuáticas medicinales",
+    },
+    {
+      id: "castana-de-agua",
+      nombre: "Castaña de agua",
+      nombreCientifico: "Trapa natans",
+      nombresAlternativos: {"España": ["castaña de agua"], "USA_English": ["Water chestnut"]},
+      propiedades: ["Nutritiva", "Antiinflamatoria", "Antioxidante"],
+      parteUsable: "Fruto (nuez)",
+      dosis: "Consumo como alimento",
+      preparacion: "Hervida o asada",
+      contraindicaciones: [],
+      descripcion: "Planta acuática flotante que produce un fruto comestible con forma de cabeza de toro. Es nutritiva y se consume en muchas partes de Asia.",
+      sistemasRelacionados: ["sistema-digestivo"],
+      categoriaId: "algas-y-plantas-acuaticas-medicinales",
+      categoria: "Algas y plantas acuáticas medicinales",
+    },
+    {
+      id: "aponogeton",
+      nombre: "Aponogeton",
+      nombreCientifico: "Aponogeton distachyos",
+      nombresAlternativos: {"España": ["aponogeton"], "USA_English": ["Cape pondweed"]},
+      propiedades: ["Comestible", "Nutritiva", "Anti-escorbútica"],
+      parteUsable: "Flores y tubérculos",
+      dosis: "Consumo como alimento",
+      preparacion: "Las flores y los tubérculos se cocinan en guisos o sopas",
+      contraindicaciones: [],
+      descripcion: "Conocida como 'flor de agua' en Sudáfrica, sus flores y tubérculos son comestibles y tienen un alto valor nutritivo.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-inmunologico"],
+      categoriaId: "algas-y-plantas-acuaticas-medicinales",
+      categoria: "Algas y plantas acuáticas medicinales",
+    },
+    {
+      id: "elodea",
+      nombre: "Elodea",
+      nombreCientifico: "Elodea canadensis",
+      nombresAlternativos: {"España": ["elodea"], "USA_English": ["Canadian waterweed"]},
+      propiedades: ["Oxigenante de agua", "Antiséptica", "Diurética"],
+      parteUsable: "Toda la planta",
+      dosis: "Uso tradicional limitado en humanos, principalmente externo",
+      preparacion: "Infusión para lavados",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Fácilmente absorbe contaminantes del agua, usar solo de fuentes limpias." }],
+      descripcion: "Planta de acuario común, conocida por su capacidad para oxigenar el agua. Tradicionalmente usada como antiséptico suave.",
+      sistemasRelacionados: ["sistema-urinario", "enfermedades-piel"],
+      categoriaId: "algas-y-plantas-acuaticas-medicinales",
+      categoria: "Algas y plantas acuáticas medicinales",
+    },
+    {
+      id: "azolla",
+      nombre: "Azolla",
+      nombreCientifico: "Azolla filiculoides",
+      nombresAlternativos: {"España": ["azolla", "helecho de agua"], "USA_English": ["Mosquito fern"]},
+      propiedades: ["Biofertilizante", "Alta en proteínas", "Fitorremediación"],
+      parteUsable: "Toda la planta",
+      dosis: "Principalmente para alimentación animal, no para consumo humano directo",
+      preparacion: "Seca y molida como suplemento para ganado",
+      contraindicaciones: [{ tipo: "otro", descripcion: "No es una planta de consumo humano habitual." }],
+      descripcion: "Helecho acuático flotante que fija nitrógeno, usado como fertilizante natural en arrozales y como alimento para animales.",
+      sistemasRelacionados: ["sistema-linfatico"],
+      categoriaId: "algas-y-plantas-acuaticas-medicinales",
+      categoria: "Algas y plantas acuáticas medicinales",
+    },
+  ],
+};
+
+export default categoria;
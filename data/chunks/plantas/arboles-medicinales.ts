@@ -0,0 +1,746 @@
+// Generado automáticamente por scripts/build-catalog.py - no editar a mano
+import type { CategoriaPlanta } from '../../plantas-expandidas';
+
+const categoria: CategoriaPlanta = {
+  id: "arboles-medicinales",
+  nombre: "Árboles medicinales",
+  plantas: [
+    {
+      id: "eucalipto",
+      nombre: "Eucalipto",
+      nombreCientifico: "Eucalyptus globulus",
+      nombresAlternativos: {"España": ["eucalipto blanco", "eucalipto común", "eucalipto azul", "calipes", "calipse", "calipto"], "USA_English": ["southern blue gum", "blue gum", "Tasmanian blue gum"], "UK_English": ["blue gum", "Tasmanian blue gum"]},
+      propiedades: ["Expectorante", "Antiséptico", "Antiinflamatorio", "Descongestionante"],
+      parteUsable: "Hojas",
+      dosis: "Infusión: 1-2 tazas al día. Aceite esencial: 2-3 gotas en un difusor.",
+      preparacion: "Infusión, aceite esencial",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "No se recomienda su uso durante el embarazo y la lactancia." }, { tipo: "ninos", descripcion: "No administrar a niños menores de 6 años." }],
+      descripcion: "Árbol de gran porte conocido por sus propiedades para tratar afecciones respiratorias.",
+      sistemasRelacionados: ["sistema-respiratorio"],
+      categoriaId: "arboles-medicinales",
+      categoria: "Árboles medicinales",
+    },
+    {
+      id: "sauce",
+      nombre: "Sauce",
+      nombreCientifico: "Salix alba",
+      nombresAlternativos: {"España": ["sauce blanco", "salguero", "sauce plateado"], "USA_English": ["white willow"], "UK_English": ["white willow"]},
+      propiedades: ["Analgésico", "Antiinflamatorio", "Antipirético"],
+      parteUsable: "Corteza",
+      dosis: "Decocción: 1-2 tazas al día.",
+      preparacion: "Decocción",
+      contraindicaciones: [{ tipo: "alergia", descripcion: "No usar en caso de alergia a la aspirina." }, { tipo: "medicamentos", descripcion: "No combinar con anticoagulantes." }],
+      descripcion: "La corteza de sauce es la fuente original del ácido salicílico, precursor de la aspirina.",
+      sistemasRelacionados: ["sistema-musculoesqueletico", "sistema-nervioso"],
+      categoriaId: "arboles-medicinales",
+      categoria: "Árboles medicinales",
+    },
+    {
+      id: "tilo",
+      nombre: "Tilo",
+      nombreCientifico: "Tilia cordata",
+      nombresAlternativos: {"España": ["tilo norteño", "tilo silvestre", "tilo de hoja pequeña", "teja", "teja negra", "tejo", "tejo blanco", "tella", "texa", "tila", "tilar", "tilia", "tillera", "tillo macho", "tillon", "tillori", "tilo"], "USA_English": ["littleleaf linden", "small-leaved lime"], "UK_English": ["little-leaf linden", "small-leaved lime"]},
+      propiedades: ["Relajante", "Sedante", "Antiespasmódico", "Diaforético"],
+      parteUsable: "Flores",
+      dosis: "Infusión: 2-3 tazas al día.",
+      preparacion: "Infusión",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Puede potenciar el efecto de otros sedantes." }],
+      descripcion: "Árbol ornamental cuyas flores se utilizan en infusión por sus propiedades relajantes y para combatir el insomnio.",
+      sistemasRelacionados: ["sistema-nervioso"],
+      categoriaId: "arboles-medicinales",
+      categoria: "Árboles medicinales",
+    },
+    {
+      id: "olivo",
+      nombre: "Olivo",
+      nombreCientifico: "Olea europaea",
+      nombresAlternativos: {"España": ["olivo", "olivera", "oliva", "aceituno"], "Colombia": ["aceituno"], "USA_English": ["common olive", "European olive"], "UK_English": ["olive tree"]},
+      propiedades: ["Hipotensor", "Hipoglucemiante", "Antioxidante"],
+      parteUsable: "Hojas",
+      dosis: "Infusión: 2-3 tazas al día.",
+      preparacion: "Infusión",
+      contraindicaciones: [],
+      descripcion: "Las hojas de olivo se utilizan para regular la presión arterial y los niveles de azúcar en sangre.",
+      sistemasRelacionados: ["sistema-cardiovascular", "sistema-endocrino"],
+      categoriaId: "arboles-medicinales",
+      categoria: "Árboles medicinales",
+    },
+    {
+      id: "neem",
+      nombre: "Neem",
+      nombreCientifico: "Azadirachta indica",
+      nombresAlternativos: {"México": ["nim", "neem"], "Colombia": ["nim", "neem"], "Centroamérica": ["nim", "neem"], "Caribe": ["nim", "neem"], "USA_English": ["neem", "margosa", "nimtree", "Indian lilac"], "UK_English": ["neem", "margosa", "nimtree", "Indian lilac"], "Indigena": ["nim (Hindi)"]},
+      propiedades: ["Antibacteriano", "Antifúngico", "Insecticida", "Antiinflamatorio"],
+      parteUsable: "Hojas, semillas, corteza",
+      dosis: "Uso tópico: aplicar aceite o extracto sobre la piel.",
+      preparacion: "Aceite, extracto, polvo",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "No se recomienda su uso durante el embarazo." }],
+      descripcion: "Árbol originario de la India con múltiples propiedades medicinales, especialmente para la piel.",
+      sistemasRelacionados: ["enfermedades-piel", "sistema-inmunologico"],
+      categoriaId: "arboles-medicinales",
+      categoria: "Árboles medicinales",
+    },
+    {
+      id: "moringa",
+      nombre: "Moringa",
+      nombreCientifico: "Moringa oleifera",
+      nombresAlternativos: {"México": ["moringa", "ben", "malungáy"], "Colombia": ["moringa", "ben", "malungáy"], "Centroamérica": ["palo jeringa", "acacia", "jazmín francés"], "Caribe": ["moringa", "ben", "malungáy"], "USA_English": ["moringa", "drumstick tree", "horseradish tree"], "UK_English": ["moringa", "drumstick tree", "horseradish tree"]},
+      propiedades: ["Nutritivo", "Antioxidante", "Antiinflamatorio"],
+      parteUsable: "Hojas, semillas, flores",
+      dosis: "Polvo de hojas: 1-2 cucharaditas al día.",
+      preparacion: "Polvo, infusión, consumo directo",
+      contraindicaciones: [],
+      descripcion: "Conocido como el “árbol de la vida” por su alto valor nutricional y sus múltiples beneficios para la salud.",
+      sistemasRelacionados: ["sistema-inmunologico", "sistema-digestivo"],
+      categoriaId: "arboles-medicinales",
+      categoria: "Árboles medicinales",
+    },
+    {
+      id: "ginkgo-biloba",
+      nombre: "Ginkgo Biloba",
+      nombreCientifico: "Ginkgo biloba",
+      nombresAlternativos: {"España": ["ginkgo", "árbol de los 40 escudos", "nogal del Japón"], "USA_English": ["ginkgo", "maidenhair tree"], "UK_English": ["ginkgo", "maidenhair tree"]},
+      propiedades: ["Vasodilatador cerebral", "Antioxidante", "Neuroprotector"],
+      parteUsable: "Hojas",
+      dosis: "Extracto estandarizado: 120-240 mg al día.",
+      preparacion: "Extracto, cápsulas",
+      contraindicaciones: [{ tipo: "medicamentos", descripcion: "No combinar con anticoagulantes." }],
+      descripcion: "Uno de los árboles más antiguos del mundo, utilizado para mejorar la memoria y la circulación cerebral.",
+      sistemasRelacionados: ["sistema-nervioso", "sistema-cardiovascular"],
+      categoriaId: "arboles-medicinales",
+      categoria: "Árboles medicinales",
+    },
+    {
+      id: "castano-de-indias",
+      nombre: "Castaño de Indias",
+      nombreCientifico: "Aesculus hippocastanum",
+      nombresAlternativos: {"España": ["castaño de Indias", "falso castaño", "castaño loco"], "USA_English": ["horse chestnut", "buckeye", "conker tree"], "UK_English": ["horse chestnut", "conker tree"]},
+      propiedades: ["Venotónico", "Antiinflamatorio", "Antiedematoso"],
+      parteUsable: "Semillas",
+      dosis: "Extracto estandarizado: 300 mg dos veces al día.",
+      preparacion: "Extracto, cápsulas, gel",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "No se recomienda su uso durante el embarazo y la lactancia." }],
+      descripcion: "Utilizado tradicionalmente para tratar problemas de circulación venosa, como las varices y las hemorroides.",
+      sistemasRelacionados: ["sistema-cardiovascular"],
+      categoriaId: "arboles-medicinales",
+      categoria: "Árboles medicinales",
+    },
+    {
+      id: "fresno",
+      nombre: "Fresno",
+      nombreCientifico: "Fraxinus excelsior",
+      nombresAlternativos: {"España": ["fresno común", "fresno de hoja ancha", "fresno de Vizcaya", "fresno elevado", "fleja", "fragino", "fresno"], "USA_English": ["European ash", "common ash"], "UK_English": ["ash", "common ash", "European ash"]},
+      propiedades: ["Diurético", "Antiinflamatorio", "Analgésico"],
+      parteUsable: "Hojas, corteza",
+      dosis: "Infusión: 2-3 tazas al día.",
+      preparacion: "Infusión, decocción",
+      contraindicaciones: [],
+      descripcion: "Árbol utilizado para aliviar dolores articulares y musculares, y para favorecer la eliminación de líquidos.",
+      sistemasRelacionados: ["sistema-musculoesqueletico", "sistema-urinario"],
+      categoriaId: "arboles-medicinales",
+      categoria: "Árboles medicinales",
+    },
+    {
+      id: "abedul",
+      nombre: "Abedul",
+      nombreCientifico: "Betula pendula",
+      nombresAlternativos: {"España": ["abedul común", "abedul europeo", "abedul llorón", "abedul péndulo", "abedul plateado", "abedul verrugoso", "aliso europeo"], "USA_English": ["European white birch", "white birch", "silver birch"], "UK_English": ["silver birch", "warty birch", "European white birch"]},
+      propiedades: ["Diurético", "Depurativo", "Antiinflamatorio"],
+      parteUsable: "Hojas, corteza, savia",
+      dosis: "Infusión: 2-3 tazas al día.",
+      preparacion: "Infusión, decocción",
+      contraindicaciones: [],
+      descripcion: "Conocido por sus propiedades diuréticas y depurativas, ayuda a eliminar toxinas y a tratar afecciones de la piel.",
+      sistemasRelacionados: ["sistema-urinario", "enfermedades-piel"],
+      categoriaId: "arboles-medicinales",
+      categoria: "Árboles medicinales",
+    },
+    {
+      id: "cipres",
+      nombre: "Ciprés",
+      nombreCientifico: "Cupressus sempervirens",
+      nombresAlternativos: {"España": ["ciprés común", "ciprés mediterráneo"], "Colombia": ["ciprés", "pino"], "USA_English": ["Italian cypress", "Mediterranean cypress", "Tuscan cypress", "Persian cypress"], "UK_English": ["Mediterranean cypress", "Italian cypress"]},
+      propiedades: ["Astringente", "Vasoconstrictor", "Antiespasmódico"],
+      parteUsable: "Gálbulos (frutos), ramas",
+      dosis: "Decocción: 1-2 tazas al día.",
+      preparacion: "Decocción, aceite esencial",
+      contraindicaciones: [],
+      descripcion: "Utilizado para tratar problemas circulatorios como varices y hemorroides, y para aliviar la tos.",
+      sistemasRelacionados: ["sistema-cardiovascular", "sistema-respiratorio"],
+      categoriaId: "arboles-medicinales",
+      categoria: "Árboles medicinales",
+    },
+    {
+      id: "pino",
+      nombre: "Pino",
+      nombreCientifico: "Pinus sylvestris",
+      nombresAlternativos: {"España": ["pino silvestre", "pino de Valsaín", "pino serrano", "pino albar", "pino del Norte", "pino rojo", "pino bermejo"], "USA_English": ["Scotch pine"], "UK_English": ["Scots pine"]},
+      propiedades: ["Expectorante", "Antiséptico", "Balsámico"],
+      parteUsable: "Yemas, resina, hojas",
+      dosis: "Infusión: 2-3 tazas al día.",
+      preparacion: "Infusión, jarabe, aceite esencial",
+      contraindicaciones: [],
+      descripcion: "Las yemas de pino son un remedio tradicional para la tos y las afecciones respiratorias.",
+      sistemasRelacionados: ["sistema-respiratorio"],
+      categoriaId: "arboles-medicinales",
+      categoria: "Árboles medicinales",
+    },
+    {
+      id: "cedro",
+      nombre: "Cedro",
+      nombreCientifico: "Cedrus libani",
+      nombresAlternativos: {"España": ["cedro del Líbano"], "USA_English": ["cedar of Lebanon", "Lebanon cedar"], "UK_English": ["cedar of Lebanon", "Lebanon cedar"]},
+      propiedades: ["Antiséptico", "Expectorante", "Relajante"],
+      parteUsable: "Madera, aceite esencial",
+      dosis: "Aceite esencial: 2-3 gotas en un difusor.",
+      preparacion: "Aceite esencial",
+      contraindicaciones: [],
+      descripcion: "El aceite esencial de cedro se utiliza en aromaterapia por sus propiedades relajantes y para aliviar la congestión.",
+      sistemasRelacionados: ["sistema-respiratorio", "sistema-nervioso"],
+      categoriaId: "arboles-medicinales",
+      categoria: "Árboles medicinales",
+    },
+    {
+      id: "arce",
+      nombre: "Arce",
+      nombreCientifico: "Acer saccharum",
+      nombresAlternativos: {"USA_English": ["Maple", "Sugar maple"], "UK_English": ["Maple", "Sugar maple"]},
+      propiedades: ["Antiinflamatorio", "Antioxidante"],
+      parteUsable: "Savia",
+      dosis: "Consumo directo.",
+      preparacion: "Jarabe",
+      contraindicaciones: [],
+      descripcion: "El jarabe de arce, además de ser un edulcorante natural, contiene compuestos con propiedades antiinflamatorias y antioxidantes.",
+      sistemasRelacionados: ["sistema-inmunologico"],
+      categoriaId: "arboles-medicinales",
+      categoria: "Árboles medicinales",
+    },
+    {
+      id: "roble",
+      nombre: "Roble",
+      nombreCientifico: "Quercus robur",
+      nombresAlternativos: {"España": ["roble común", "roble albar", "roble carballo", "carballo", "roble carvallo", "carvallo", "cajiga", "roble fresnal"], "Argentina": ["roble europeo", "carvallo", "carballo", "carvayo", "roble pedunculado", "roble albar", "roble común", "roble", "roble de Eslavonia", "encina inglesa"], "USA_English": ["English oak", "pedunculate oak", "common oak"], "UK_English": ["English oak", "pedunculate oak", "common oak"]},
+      propiedades: ["Astringente", "Antiinflamatorio", "Antiséptico"],
+      parteUsable: "Corteza",
+      dosis: "Decocción: uso externo para gargarismos o lavados.",
+      preparacion: "Decocción",
+      contraindicaciones: [],
+      descripcion: "La corteza de roble es rica en taninos, lo que le confiere propiedades astringentes para tratar inflamaciones de la boca y la garganta.",
+      sistemasRelacionados: ["enfermedades-ojos-oidos-nariz-garganta", "enfermedades-piel"],
+      categoriaId: "arboles-medicinales",
+      categoria: "Árboles medicinales",
+    },
+    {
+      id: "haya",
+      nombre: "Haya",
+      nombreCientifico: "Fagus sylvatica",
+      nombresAlternativos: {"España": ["haya común", "fago", "fau", "faya"], "USA_English": ["European beech", "common beech"], "UK_English": ["common beech", "European beech"]},
+      propiedades: ["Antiséptico", "Expectorante", "Febrífugo"],
+      parteUsable: "Corteza, hojas",
+      dosis: "Decocción: 1-2 tazas al día.",
+      preparacion: "Decocción",
+      contraindicaciones: [],
+      descripcion: "Utilizada tradicionalmente para bajar la fiebre y tratar afecciones respiratorias.",
+      sistemasRelacionados: ["sistema-respiratorio"],
+      categoriaId: "arboles-medicinales",
+      categoria: "Árboles medicinales",
+    },
+    {
+      id: "nogal",
+      nombre: "Nogal",
+      nombreCientifico: "Juglans regia",
+      nombresAlternativos: {"España": ["nogal común", "noguera"], "Chile": ["nogal"], "USA_English": ["English walnut", "Persian walnut", "common walnut"], "UK_English": ["walnut", "common walnut", "English walnut"]},
+      propiedades: ["Astringente", "Antifúngico", "Hipoglucemiante"],
+      parteUsable: "Hojas, frutos",
+      dosis: "Infusión: 2-3 tazas al día.",
+      preparacion: "Infusión, decocción",
+      contraindicaciones: [],
+      descripcion: "Las hojas de nogal se usan para tratar problemas de piel y regular los niveles de azúcar en sangre.",
+      sistemasRelacionados: ["enfermedades-piel", "sistema-endocrino"],
+      categoriaId: "arboles-medicinales",
+      categoria: "Árboles medicinales",
+    },
+    {
+      id: "tejo",
+      nombre: "Tejo",
+      nombreCientifico: "Taxus baccata",
+      nombresAlternativos: {"España": ["Tejo"], "USA_English": ["Yew"], "UK_English": ["Yew"]},
+      propiedades: ["Antitumoral"],
+      parteUsable: "Corteza, hojas",
+      dosis: "Uso exclusivo bajo prescripción médica.",
+      preparacion: "Extractos farmacéuticos",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Planta altamente tóxica. Su uso debe ser estrictamente supervisado por un profesional." }],
+      descripcion: "Del tejo se extrae el paclitaxel, un potente fármaco utilizado en quimioterapia para tratar diversos tipos de cáncer.",
+      sistemasRelacionados: ["sistema-inmunologico"],
+      categoriaId: "arboles-medicinales",
+      categoria: "Árboles medicinales",
+    },
+    {
+      id: "espino-blanco",
+      nombre: "Espino Blanco",
+      nombreCientifico: "Crataegus monogyna",
+      nombresAlternativos: {"España": ["majuelo", "espino albar"], "México": ["tejocote", "Mexican hawthorn"], "USA_English": ["common hawthorn", "whitethorn", "one-seed hawthorn", "single-seeded hawthorn"], "UK_English": ["common hawthorn", "hawthorn", "May tree", "one-seed hawthorn", "whitethorn", "quickthorn"]},
+      propiedades: ["Cardiotónico", "Hipotensor", "Relajante"],
+      parteUsable: "Flores, hojas, frutos",
+      dosis: "Infusión: 2-3 tazas al día.",
+      preparacion: "Infusión, extracto",
+      contraindicaciones: [{ tipo: "medicamentos", descripcion: "Puede interactuar con medicamentos para el corazón." }],
+      descripcion: "Conocido como el “árbol del corazón”, se utiliza para regular el ritmo cardíaco y la presión arterial.",
+      sistemasRelacionados: ["sistema-cardiovascular", "sistema-nervioso"],
+      categoriaId: "arboles-medicinales",
+      categoria: "Árboles medicinales",
+    },
+    {
+      id: "avellano",
+      nombre: "Avellano",
+      nombreCientifico: "Corylus avellana",
+      nombresAlternativos: {"España": ["Avellano"], "USA_English": ["Hazel"], "UK_English": ["Hazel"]},
+      propiedades: ["Astringente", "Antiinflamatorio", "Venotónico"],
+      parteUsable: "Hojas, corteza",
+      dosis: "Decocción: uso externo.",
+      preparacion: "Decocción",
+      contraindicaciones: [],
+      descripcion: "Las hojas y la corteza de avellano se utilizan en preparados para mejorar la circulación y tratar problemas de piel.",
+      sistemasRelacionados: ["sistema-cardiovascular", "enfermedades-piel"],
+      categoriaId: "arboles-medicinales",
+      categoria: "Árboles medicinales",
+    },
+    {
+      id: "alcornoque",
+      nombre: "Alcornoque",
+      nombreCientifico: "Quercus suber",
+      nombresAlternativos: {"España": ["Alcornoque"], "USA_English": ["Cork oak"], "UK_English": ["Cork oak"]},
+      propiedades: ["Astringente", "Antiinflamatorio"],
+      parteUsable: "Corteza",
+      dosis: "Decocción: uso externo.",
+      preparacion: "Decocción",
+      contraindicaciones: [],
+      descripcion: "La corteza del alcornoque, de donde se extrae el corcho, tiene propiedades similares a la del roble.",
+      sistemasRelacionados: ["enfermedades-piel"],
+      categoriaId: "arboles-medicinales",
+      categoria: "Árboles medicinales",
+    },
+    {
+      id: "encina",
+      nombre: "Encina",
+      nombreCientifico: "Quercus ilex",
+      nombresAlternativos: {"España": ["Encina"], "USA_English": ["Holm oak"], "UK_English": ["Holm oak"]},
+      propiedades: ["Astringente", "Antiinflamatorio"],
+      parteUsable: "Corteza, bellotas",
+      dosis: "Decocción: uso externo.",
+      preparacion: "Decocción",
+      contraindicaciones: [],
+      descripcion: "Al igual que otros árboles del género Quercus, la encina tiene propiedades astringentes.",
+      sistemasRelacionados: ["enfermedades-piel"],
+      categoriaId: "arboles-medicinales",
+      categoria: "Árboles medicinales",
+    },
+    {
+      id: "serbal",
+      nombre: "Serbal",
+      nombreCientifico: "Sorbus aucuparia",
+      nombresAlternativos: {"España": ["serbal de los cazadores", "cerollo", "acerollo", "azarollo", "acafresno", "amargón", "cafresna", "cornabois", "escornabois", "llameiro"], "USA_English": ["European mountain ash", "rowan"], "UK_English": ["rowan", "mountain ash", "witch wiggin tree", "keirn", "cuirn"], "Indigena": ["otsalizarra (euskera)"]},
+      propiedades: ["Vitamínico", "Astringente"],
+      parteUsable: "Frutos",
+      dosis: "Consumo directo o en mermelada.",
+      preparacion: "Consumo directo, mermelada",
+      contraindicaciones: [],
+      descripcion: "Los frutos del serbal son ricos en vitamina C y se utilizan para preparar mermeladas y licores.",
+      sistemasRelacionados: ["sistema-inmunologico"],
+      categoriaId: "arboles-medicinales",
+      categoria: "Árboles medicinales",
+    },
+    {
+      id: "laurel",
+      nombre: "Laurel",
+      nombreCientifico: "Laurus nobilis",
+      nombresAlternativos: {"España": ["llorer", "ereñotz", "lloréu", "choriu", "llorin", "lloreru", "lloureiro"], "USA_English": ["bay tree", "bay laurel", "sweet bay", "true laurel", "grecian laurel"], "UK_English": ["bay tree", "bay laurel", "sweet bay", "true laurel", "grecian laurel"], "Otros": ["lauro", "laurel de apolo", "laurel de dafne"]},
+      propiedades: ["Digestivo", "Carminativo", "Expectorante"],
+      parteUsable: "Hojas",
+      dosis: "Infusión: 1-2 tazas al día.",
+      preparacion: "Infusión, condimento",
+      contraindicaciones: [],
+      descripcion: "Además de su uso culinario, el laurel facilita la digestión y ayuda a expulsar los gases.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-respiratorio"],
+      categoriaId: "arboles-medicinales",
+      categoria: "Árboles medicinales",
+    },
+    {
+      id: "magnolia",
+      nombre: "Magnolia",
+      nombreCientifico: "Magnolia grandiflora",
+      nombresAlternativos: {"USA_English": ["houpu magnolia", "magnolia bark"], "UK_English": ["houpu magnolia"]},
+      propiedades: ["Ansiolítico", "Antiinflamatorio"],
+      parteUsable: "Corteza, flores",
+      dosis: "Extracto: seguir indicaciones del fabricante.",
+      preparacion: "Extracto",
+      contraindicaciones: [],
+      descripcion: "La corteza de magnolia se utiliza en la medicina tradicional china por sus efectos ansiolíticos y antiinflamatorios.",
+      sistemasRelacionados: ["sistema-nervioso"],
+      categoriaId: "arboles-medicinales",
+      categoria: "Árboles medicinales",
+    },
+    {
+      id: "arbol-del-te",
+      nombre: "Árbol del Té",
+      nombreCientifico: "Melaleuca alternifolia",
+      nombresAlternativos: {"USA_English": ["Tea tree"], "UK_English": ["Tea tree"]},
+      propiedades: ["Antiséptico", "Antibacteriano", "Antifúngico"],
+      parteUsable: "Hojas (aceite esencial)",
+      dosis: "Uso tópico: aplicar diluido sobre la piel.",
+      preparacion: "Aceite esencial",
+      contraindicaciones: [{ tipo: "otro", descripcion: "No ingerir. Puede ser tóxico." }],
+      descripcion: "El aceite esencial de árbol del té es un potente antiséptico natural para tratar infecciones de la piel.",
+      sistemasRelacionados: ["enfermedades-piel"],
+      categoriaId: "arboles-medicinales",
+      categoria: "Árboles medicinales",
+    },
+    {
+      id: "canelo",
+      nombre: "Canelo",
+      nombreCientifico: "Drimys winteri",
+      nombresAlternativos: {"Chile": ["canelo", "foye", "boighe"], "Argentina": ["canelo", "canelillo", "fuñe", "boighe", "foiye", "foiyel", "foike", "folle", "liuche", "voigue"], "Colombia": ["ajicillo", "ajizuelo", "canelo", "canelo de páramo"], "USA_English": ["Winter's bark", "pepper bark"], "UK_English": ["Winter's bark"], "Indigena": ["foye (mapudungun)", "boighe (mapudungun)"]},
+      propiedades: ["Antiescorbútico", "Tónico", "Estimulante"],
+      parteUsable: "Corteza",
+      dosis: "Decocción: 1-2 tazas al día.",
+      preparacion: "Decocción",
+      contraindicaciones: [],
+      descripcion: "Árbol sagrado del pueblo mapuche, utilizado tradicionalmente para combatir el escorbuto y como tónico general.",
+      sistemasRelacionados: ["sistema-inmunologico"],
+      categoriaId: "arboles-medicinales",
+      categoria: "Árboles medicinales",
+    },
+    {
+      id: "boldo",
+      nombre: "Boldo",
+      nombreCientifico: "Peumus boldus",
+      nombresAlternativos: {"Chile": ["boldo", "boldu", "buldo"], "Argentina": ["boldo"], "Perú": ["boldo"], "USA_English": ["boldo"], "UK_English": ["boldo"], "Indigena": ["foḻo (mapudungun)"]},
+      propiedades: ["Hepatoprotector", "Colerético", "Digestivo"],
+      parteUsable: "Hojas",
+      dosis: "Infusión: 1-2 tazas al día, antes o después de las comidas.",
+      preparacion: "Infusión",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "No se recomienda su uso durante el embarazo." }],
+      descripcion: "Las hojas de boldo estimulan la producción de bilis y protegen el hígado, facilitando la digestión de las grasas.",
+      sistemasRelacionados: ["sistema-digestivo"],
+      categoriaId: "arboles-medicinales",
+      categoria: "Árboles medicinales",
+    },
+    {
+      id: "quina",
+      nombre: "Quina",
+      nombreCientifico: "Cinchona officinalis",
+      nombresAlternativos: {"Colombia": ["Quina"], "Peru": ["Quina", "Cascarilla"], "Indigena": ["quina-quina (quechua)"]},
+      propiedades: ["Antipalúdico", "Febrífugo", "Amargo"],
+      parteUsable: "Corteza",
+      dosis: "Uso exclusivo bajo prescripción médica.",
+      preparacion: "Extractos farmacéuticos",
+      contraindicaciones: [],
+      descripcion: "De la corteza de la quina se extrae la quinina, el primer tratamiento eficaz contra la malaria.",
+      sistemasRelacionados: ["sistema-inmunologico"],
+      categoriaId: "arboles-medicinales",
+      categoria: "Árboles medicinales",
+    },
+    {
+      id: "sangre-de-drago",
+      nombre: "Sangre de Drago",
+      nombreCientifico: "Croton lechleri",
+      nombresAlternativos: {"Mexico": ["Sangre de drago", "Sangre de grado"], "Colombia": ["Sangre de drago", "Sangre de grado"], "Peru": ["Sangre de drago", "Sangre de grado"]},
+      propiedades: ["Cicatrizante", "Antiinflamatorio", "Antiviral"],
+      parteUsable: "Látex (resina)",
+      dosis: "Uso tópico: aplicar unas gotas sobre la herida.",
+      preparacion: "Látex",
+      contraindicaciones: [],
+      descripcion: "El látex de este árbol amazónico es un potente cicatrizante y se utiliza para curar heridas y úlceras.",
+      sistemasRelacionados: ["enfermedades-piel", "sistema-digestivo"],
+      categoriaId: "arboles-medicinales",
+      categoria: "Árboles medicinales",
+    },
+    {
+      id: "araucaria",
+      nombre: "Araucaria",
+      nombreCientifico: "Araucaria araucana",
+      nombresAlternativos: {"Chile": ["araucaria", "pewén", "pehuén", "pino araucano", "piñonero", "pino de brazos"], "Argentina": ["pehuén", "pino araucaria", "pino chileno", "pino de Neuquén"], "USA_English": ["monkey puzzle tree", "Chilean pine"], "UK_English": ["monkey puzzle tree", "Chilean pine"], "Indigena": ["pewén (mapudungun)"]},
+      propiedades: ["Nutritivo", "Energético"],
+      parteUsable: "Piñones (semillas)",
+      dosis: "Consumo directo.",
+      preparacion: "Cocidos o tostados",
+      contraindicaciones: [],
+      descripcion: "Los piñones de la araucaria son un alimento muy nutritivo y energético, base de la dieta de los pueblos originarios del sur de Chile y Argentina.",
+      sistemasRelacionados: ["sistema-digestivo"],
+      categoriaId: "arboles-medicinales",
+      categoria: "Árboles medicinales",
+    },
+    {
+      id: "alerce",
+      nombre: "Alerce",
+      nombreCientifico: "Larix decidua",
+      nombresAlternativos: {"Chile": ["alerce", "lahuán", "lahual"], "Argentina": ["alerce"], "USA_English": ["Patagonian cypress", "Chilean false larch"], "UK_English": ["Patagonian cypress"], "Indigena": ["lahuán (mapudungun)"]},
+      propiedades: ["Expectorante", "Antiséptico"],
+      parteUsable: "Resina, yemas",
+      dosis: "Infusión: 1-2 tazas al día.",
+      preparacion: "Infusión, jarabe",
+      contraindicaciones: [],
+      descripcion: "Utilizado en la medicina popular europea para tratar afecciones respiratorias.",
+      sistemasRelacionados: ["sistema-respiratorio"],
+      categoriaId: "arboles-medicinales",
+      categoria: "Árboles medicinales",
+    },
+    {
+      id: "abeto",
+      nombre: "Abeto",
+      nombreCientifico: "Abies alba",
+      nombresAlternativos: {"España": ["Abeto"], "USA_English": ["Fir"], "UK_English": ["Fir"]},
+      propiedades: ["Balsámico", "Expectorante", "Antiséptico"],
+      parteUsable: "Yemas, resina",
+      dosis: "Jarabe: 1-3 cucharaditas al día.",
+      preparacion: "Jarabe, infusión",
+      contraindicaciones: [],
+      descripcion: "Las yemas de abeto se utilizan para preparar jarabes contra la tos y los resfriados.",
+      sistemasRelacionados: ["sistema-respiratorio"],
+      categoriaId: "arboles-medicinales",
+      categoria: "Árboles medicinales",
+    },
+    {
+      id: "acacia",
+      nombre: "Acacia",
+      nombreCientifico: "Acacia senegal",
+      nombresAlternativos: {"USA_English": ["Acacia", "Gum arabic tree"], "UK_English": ["Acacia", "Gum arabic tree"]},
+      propiedades: ["Emoliente", "Antiinflamatorio", "Astringente"],
+      parteUsable: "Goma arábiga",
+      dosis: "Según indicación del producto.",
+      preparacion: "Polvo, pastillas",
+      contraindicaciones: [],
+      descripcion: "La goma arábiga, exudado de la acacia, se utiliza para aliviar la irritación de garganta y las molestias digestivas.",
+      sistemasRelacionados: ["sistema-digestivo", "enfermedades-ojos-oidos-nariz-garganta"],
+      categoriaId: "arboles-medicinales",
+      categoria: "Árboles medicinales",
+    },
+    {
+      id: "algarrobo",
+      nombre: "Algarrobo",
+      nombreCientifico: "Ceratonia siliqua",
+      nombresAlternativos: {"España": ["algarrobo", "garrofero", "garrobo"], "México": ["algarroba", "pan de San Juan"], "USA_English": ["carob tree", "St. John's bread", "locust bean"], "UK_English": ["carob tree"]},
+      propiedades: ["Antidiarreico", "Nutritivo", "Expectorante"],
+      parteUsable: "Frutos (algarrobas)",
+      dosis: "Harina: 1-2 cucharadas disueltas en agua.",
+      preparacion: "Harina, jarabe",
+      contraindicaciones: [],
+      descripcion: "La harina de algarroba es un remedio eficaz contra la diarrea y una alternativa saludable al cacao.",
+      sistemasRelacionados: ["sistema-digestivo"],
+      categoriaId: "arboles-medicinales",
+      categoria: "Árboles medicinales",
+    },
+    {
+      id: "almendro",
+      nombre: "Almendro",
+      nombreCientifico: "Prunus dulcis",
+      nombresAlternativos: {"España": ["almendro", "almendolero", "alloza", "allozo"], "USA_English": ["almond", "sweet almond"], "UK_English": ["almond"]},
+      propiedades: ["Emoliente", "Nutritivo", "Laxante suave"],
+      parteUsable: "Frutos (almendras), aceite",
+      dosis: "Consumo directo o aceite.",
+      preparacion: "Consumo directo, aceite",
+      contraindicaciones: [{ tipo: "alergia", descripcion: "Alergia a los frutos secos." }],
+      descripcion: "El aceite de almendras es un excelente emoliente para la piel, y las almendras son un alimento muy nutritivo.",
+      sistemasRelacionados: ["enfermedades-piel", "sistema-digestivo"],
+      categoriaId: "arboles-medicinales",
+      categoria: "Árboles medicinales",
+    },
+    {
+      id: "caoba",
+      nombre: "Caoba",
+      nombreCientifico: "Swietenia mahagoni",
+      nombresAlternativos: {"Mexico": ["Caoba"], "Centroamerica": ["Caoba"], "Caribe": ["Caoba"], "USA_English": ["Mahogany"], "UK_English": ["Mahogany"]},
+      propiedades: ["Astringente", "Febrífugo"],
+      parteUsable: "Corteza",
+      dosis: "Decocción: 1-2 tazas al día.",
+      preparacion: "Decocción",
+      contraindicaciones: [],
+      descripcion: "La corteza de caoba se ha utilizado en la medicina tradicional para tratar la fiebre y la diarrea.",
+      sistemasRelacionados: ["sistema-digestivo"],
+      categoriaId: "arboles-medicinales",
+      categoria: "Árboles medicinales",
+    },
+    {
+      id: "ceiba",
+      nombre: "Ceiba",
+      nombreCientifico: "Ceiba pentandra",
+      nombresAlternativos: {"Mexico": ["Ceiba", "Pochote"], "Centroamerica": ["Ceiba"], "Caribe": ["Ceiba"], "USA_English": ["Ceiba", "Kapok tree"], "UK_English": ["Ceiba", "Kapok tree"]},
+      propiedades: ["Diurético", "Emoliente", "Febrífugo"],
+      parteUsable: "Corteza, hojas, flores",
+      dosis: "Decocción: 1-2 tazas al día.",
+      preparacion: "Decocción",
+      contraindicaciones: [],
+      descripcion: "Árbol sagrado en muchas culturas de América, utilizado por sus propiedades diuréticas y para bajar la fiebre.",
+      sistemasRelacionados: ["sistema-urinario"],
+      categoriaId: "arboles-medicinales",
+      categoria: "Árboles medicinales",
+    },
+    {
+      id: "chopo",
+      nombre: "Chopo",
+      nombreCientifico: "Populus nigra",
+      nombresAlternativos: {"España": ["Chopo", "Álamo negro"], "USA_English": ["Black poplar"], "UK_English": ["Black poplar"]},
+      propiedades: ["Antiinflamatorio", "Analgésico", "Antiséptico"],
+      parteUsable: "Yemas, corteza",
+      dosis: "Ungüento: aplicación tópica.",
+      preparacion: "Ungüento, decocción",
+      contraindicaciones: [],
+      descripcion: "Las yemas de chopo se utilizan para preparar ungüentos antiinflamatorios y analgésicos.",
+      sistemasRelacionados: ["sistema-musculoesqueletico", "enfermedades-piel"],
+      categoriaId: "arboles-medicinales",
+      categoria: "Árboles medicinales",
+    },
+    {
+      id: "granado",
+      nombre: "Granado",
+      nombreCientifico: "Punica granatum",
+      nombresAlternativos: {"España": ["Granado"], "USA_English": ["Pomegranate"], "UK_English": ["Pomegranate"]},
+      propiedades: ["Astringente", "Vermífugo", "Antioxidante"],
+      parteUsable: "Corteza de la raíz, fruto",
+      dosis: "Decocción de la corteza: uso bajo supervisión. Zumo del fruto: consumo libre.",
+      preparacion: "Decocción, zumo",
+      contraindicaciones: [],
+      descripcion: "La corteza de la raíz del granado es un potente vermífugo, mientras que el fruto es un excelente antioxidante.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-cardiovascular"],
+      categoriaId: "arboles-medicinales",
+      categoria: "Árboles medicinales",
+    },
+    {
+      id: "guayabo",
+      nombre: "Guayabo",
+      nombreCientifico: "Psidium guajava",
+      nombresAlternativos: {"Mexico": ["Guayabo", "Guayaba"], "Colombia": ["Guayabo", "Guayaba"], "Peru": ["Guayabo", "Guayaba"], "Caribe": ["Guayabo", "Guayaba"], "USA_English": ["Guava"], "UK_English": ["Guava"]},
+      propiedades: ["Astringente", "Antidiarreico", "Antiséptico"],
+      parteUsable: "Hojas, fruto",
+      dosis: "Infusión de hojas: 2-3 tazas al día.",
+      preparacion: "Infusión, consumo directo del fruto",
+      contraindicaciones: [],
+      descripcion: "Las hojas de guayabo son un remedio muy eficaz para detener la diarrea.",
+      sistemasRelacionados: ["sistema-digestivo"],
+      categoriaId: "arboles-medicinales",
+      categoria: "Árboles medicinales",
+    },
+    {
+      id: "higuera",
+      nombre: "Higuera",
+      nombreCientifico: "Ficus carica",
+      nombresAlternativos: {"España": ["Higuera"], "USA_English": ["Fig tree"], "UK_English": ["Fig tree"]},
+      propiedades: ["Laxante", "Emoliente", "Expectorante"],
+      parteUsable: "Frutos (higos), látex",
+      dosis: "Consumo de higos frescos o secos.",
+      preparacion: "Consumo directo, decocción",
+      contraindicaciones: [],
+      descripcion: "Los higos son un laxante suave y eficaz, y el látex de la higuera se usa para eliminar verrugas.",
+      sistemasRelacionados: ["sistema-digestivo", "enfermedades-piel"],
+      categoriaId: "arboles-medicinales",
+      categoria: "Árboles medicinales",
+    },
+    {
+      id: "jaboncillo",
+      nombre: "Jaboncillo",
+      nombreCientifico: "Sapindus saponaria",
+      nombresAlternativos: {"Mexico": ["amole", "jaboncillo"], "Colombia": ["chumbimbo", "chambimbe", "michú"], "Caribe": ["jaboncillo"], "USA_English": ["wingleaf soapberry", "western soapberry", "soapberry"], "Indigena": ["sulluku"]},
+      propiedades: ["Detergente", "Insecticida"],
+      parteUsable: "Frutos",
+      dosis: "Uso externo.",
+      preparacion: "Decocción para obtener saponinas",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Tóxico si se ingiere." }],
+      descripcion: "Los frutos de este árbol, ricos en saponinas, se han utilizado tradicionalmente como jabón natural.",
+      sistemasRelacionados: [],
+      categoriaId: "arboles-medicinales",
+      categoria: "Árboles medicinales",
+    },
+    {
+      id: "limonero",
+      nombre: "Limonero",
+      nombreCientifico: "Citrus limon",
+      nombresAlternativos: {"España": ["limonero", "limón"], "Mexico": ["limonero", "limón real"], "USA_English": ["lemon"], "UK_English": ["lemon"]},
+      propiedades: ["Antiséptico", "Vitamínico", "Alcalinizante"],
+      parteUsable: "Fruto",
+      dosis: "Consumo directo.",
+      preparacion: "Zumo, infusión de la cáscara",
+      contraindicaciones: [],
+      descripcion: "El limón es una fuente excepcional de vitamina C y un potente antiséptico natural.",
+      sistemasRelacionados: ["sistema-inmunologico", "sistema-digestivo"],
+      categoriaId: "arboles-medicinales",
+      categoria: "Árboles medicinales",
+    },
+    {
+      id: "madrono",
+      nombre: "Madroño",
+      nombreCientifico: "Arbutus unedo",
+      nombresAlternativos: {"España": ["madroño", "albornio", "madroña", "madroñera", "alborecera", "borrachín"], "USA_English": ["strawberry tree", "madrone", "Killarney strawberry tree", "strawberry madrone"], "UK_English": ["strawberry tree"]},
+      propiedades: ["Astringente", "Antiséptico urinario", "Antiinflamatorio"],
+      parteUsable: "Hojas, frutos",
+      dosis: "Infusión de hojas: 2-3 tazas al día.",
+      preparacion: "Infusión, consumo de frutos",
+      contraindicaciones: [],
+      descripcion: "Las hojas de madroño son un buen antiséptico para las vías urinarias.",
+      sistemasRelacionados: ["sistema-urinario"],
+      categoriaId: "arboles-medicinales",
+      categoria: "Árboles medicinales",
+    },
+    {
+      id: "moral",
+      nombre: "Moral",
+      nombreCientifico: "Morus nigra",
+      nombresAlternativos: {"España": ["moral", "morera negra"], "Mexico": ["moral", "mora"], "USA_English": ["black mulberry"], "UK_English": ["black mulberry"]},
+      propiedades: ["Laxante suave", "Expectorante", "Hipoglucemiante"],
+      parteUsable: "Frutos (moras), hojas",
+      dosis: "Consumo de frutos. Infusión de hojas: 1-2 tazas al día.",
+      preparacion: "Consumo directo, infusión",
+      contraindicaciones: [],
+      descripcion: "Las moras son un laxante suave y las hojas del moral ayudan a regular los niveles de azúcar.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-endocrino"],
+      categoriaId: "arboles-medicinales",
+      categoria: "Árboles medicinales",
+    },
+    {
+      id: "naranjo-amargo",
+      nombre: "Naranjo Amargo",
+      nombreCientifico: "Citrus aurantium",
+      nombresAlternativos: {"España": ["naranjo amargo", "naranjo agrio"], "Mexico": ["naranjo agrio"], "USA_English": ["bitter orange", "sour orange", "Seville orange"], "UK_English": ["bitter orange", "Seville orange"]},
+      propiedades: ["Sedante", "Digestivo", "Antiespasmódico"],
+      parteUsable: "Flores (azahar), hojas, fruto",
+      dosis: "Infusión de azahar: 1-2 tazas al día.",
+      preparacion: "Infusión, aceite esencial",
+      contraindicaciones: [],
+      descripcion: "La flor de azahar, del naranjo amargo, es un remedio tradicional para calmar los nervios y facilitar el sueño.",
+      sistemasRelacionados: ["sistema-nervioso", "sistema-digestivo"],
+      categoriaId: "arboles-medicinales",
+      categoria: "Árboles medicinales",
+    },
+    {
+      id: "olmo",
+      nombre: "Olmo",
+      nombreCientifico: "Ulmus minor",
+      nombresAlternativos: {"España": ["olmo", "negrillo"], "USA_English": ["field elm", "smoothleaf elm"], "UK_English": ["field elm", "English elm"]},
+      propiedades: ["Astringente", "Antiinflamatorio", "Cicatrizante"],
+      parteUsable: "Corteza",
+      dosis: "Decocción: uso externo.",
+      preparacion: "Decocción",
+      contraindicaciones: [],
+      descripcion: "La corteza de olmo se utiliza en preparados para tratar afecciones de la piel como eccemas y heridas.",
+      sistemasRelacionados: ["enfermedades-piel"],
+      categoriaId: "arboles-medicinales",
+      categoria: "Árboles medicinales",
+    },
+    {
+      id: "peral",
+      nombre: "Peral",
+      nombreCientifico: "Pyrus communis",
+      nombresAlternativos: {"España": ["peral", "peral común"], "USA_English": ["common pear", "European pear"], "UK_English": ["common pear", "European pear"]},
+      propiedades: ["Diurético", "Astringente", "Remineralizante"],
+      parteUsable: "Fruto, hojas",
+      dosis: "Consumo del fruto. Infusión de hojas: 1-2 tazas al día.",
+      preparacion: "Consumo directo, infusión",
+      contraindicaciones: [],
+      descripcion: "La pera es una fruta diurética y rica en minerales. Las hojas tienen propiedades astringentes.",
+      sistemasRelacionados: ["sistema-urinario"],
+      categoriaId: "arboles-medicinales",
+      categoria: "Árboles medicinales",
+    },
+  ],
+};
+
+export default categoria;
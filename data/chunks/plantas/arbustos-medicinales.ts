@@ -0,0 +1,747 @@
+// Generado automáticamente por scripts/build-catalog.py - no editar a mano
+import type { CategoriaPlanta } from '../../plantas-expandidas';
+
+const categoria: CategoriaPlanta = {
+  id: "arbustos-medicinales",
+  nombre: "Arbustos medicinales",
+  plantas: [
+    {
+      id: "romero",
+      nombre: "Romero",
+      nombreCientifico: "Rosmarinus officinalis",
+      nombresAlternativos: {"España": ["romero común", "romero blanco", "romero hembra", "romero macho"], "USA_English": ["rosemary"], "UK_English": ["rosemary"]},
+      propiedades: ["Antioxidante", "Antiinflamatorio", "Antiséptico", "Estimulante circulatorio", "Carminativo"],
+      parteUsable: "Hojas y flores",
+      dosis: "Infusión: 1-2 cucharaditas por taza, 2-3 veces al día.",
+      preparacion: "Infusión, aceite esencial, tintura.",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "Puede ser uterotónico." }, { tipo: "hipertension", descripcion: "Usar con precaución en dosis altas." }],
+      descripcion: "Arbusto aromático perenne, muy utilizado en la cocina mediterránea y con notables propiedades medicinales.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-nervioso", "sistema-cardiovascular", "enfermedades-piel"],
+      categoriaId: "arbustos-medicinales",
+      categoria: "Arbustos medicinales",
+    },
+    {
+      id: "lavanda",
+      nombre: "Lavanda",
+      nombreCientifico: "Lavandula angustifolia",
+      nombresAlternativos: {"España": ["espliego", "alhucema", "cantueso"], "USA_English": ["lavender", "true lavender", "English lavender"], "UK_English": ["lavender"]},
+      propiedades: ["Relajante", "Ansiolítico", "Antiséptico", "Analgésico", "Cicatrizante"],
+      parteUsable: "Flores",
+      dosis: "Infusión: 1 cucharadita por taza antes de dormir. Aceite esencial: 2-3 gotas en difusor o sobre la piel (diluido).",
+      preparacion: "Infusión, aceite esencial, bolsitas aromáticas.",
+      contraindicaciones: [{ tipo: "alergia", descripcion: "Puede causar dermatitis de contacto en personas sensibles." }, { tipo: "medicamentos", descripcion: "Puede potenciar el efecto de sedantes." }],
+      descripcion: "Conocida por su aroma relajante, la lavanda es un arbusto popular en jardinería y aromaterapia.",
+      sistemasRelacionados: ["sistema-nervioso", "enfermedades-piel", "trastornos-mentales-emocionales"],
+      categoriaId: "arbustos-medicinales",
+      categoria: "Arbustos medicinales",
+    },
+    {
+      id: "hamamelis",
+      nombre: "Hamamelis",
+      nombreCientifico: "Hamamelis virginiana",
+      nombresAlternativos: {"España": ["Avellano de bruja"], "México": ["Avellano de bruja", "Mexican witch hazel"], "USA_English": ["Witch hazel", "common witch hazel", "American witch-hazel"], "UK_English": ["Witch hazel", "Mexican witch hazel"]},
+      propiedades: ["Astringente", "Antiinflamatorio", "Hermostático", "Cicatrizante"],
+      parteUsable: "Hojas y corteza",
+      dosis: "Uso tópico: aplicar el destilado (agua de hamamelis) sobre la zona afectada varias veces al día.",
+      preparacion: "Decocción, destilado (agua de hamamelis), extracto.",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Raramente, puede causar irritación en pieles muy sensibles." }],
+      descripcion: "Arbusto de Norteamérica cuyo extracto es ampliamente utilizado en cosmética y para tratar problemas de piel y circulatorios.",
+      sistemasRelacionados: ["enfermedades-piel", "sistema-cardiovascular"],
+      categoriaId: "arbustos-medicinales",
+      categoria: "Arbustos medicinales",
+    },
+    {
+      id: "espino-blanco",
+      nombre: "Espino Blanco",
+      nombreCientifico: "Crataegus monogyna",
+      nombresAlternativos: {"España": ["majuelo", "espino albar"], "México": ["tejocote", "Mexican hawthorn"], "USA_English": ["common hawthorn", "whitethorn", "one-seed hawthorn", "single-seeded hawthorn"], "UK_English": ["common hawthorn", "hawthorn", "May tree", "one-seed hawthorn", "whitethorn", "quickthorn"]},
+      propiedades: ["Cardiotónico", "Hipotensor", "Vasodilatador coronario", "Sedante"],
+      parteUsable: "Flores y frutos (bayas)",
+      dosis: "Infusión: 1-2 cucharaditas por taza, 2-3 veces al día. Extracto: seguir indicaciones del fabricante.",
+      preparacion: "Infusión, extracto líquido, cápsulas.",
+      contraindicaciones: [{ tipo: "medicamentos", descripcion: "Puede interactuar con medicamentos para el corazón (digitálicos, betabloqueantes). Consultar al médico." }, { tipo: "embarazo", descripcion: "Consultar al médico antes de usar." }],
+      descripcion: "Conocido como el 'alimento del corazón', es un arbusto espinoso usado tradicionalmente para trastornos cardíacos y nerviosos.",
+      sistemasRelacionados: ["sistema-cardiovascular", "sistema-nervioso"],
+      categoriaId: "arbustos-medicinales",
+      categoria: "Arbustos medicinales",
+    },
+    {
+      id: "sauzgatillo",
+      nombre: "Sauzgatillo",
+      nombreCientifico: "Vitex agnus-castus",
+      nombresAlternativos: {"España": ["saucegatillo", "agnocasto", "pimiento de los monjes"], "México": ["árbol casto", "vitex"], "USA_English": ["vitex", "chaste tree", "chasteberry", "monk's pepper"], "UK_English": ["vitex", "chaste tree", "chasteberry", "monk's pepper"]},
+      propiedades: ["Regulador hormonal (progesterogénico)", "Alivia síntomas del síndrome premenstrual (SPM)", "Emenagogo"],
+      parteUsable: "Frutos (bayas)",
+      dosis: "Extracto estandarizado: 20-40 mg al día, preferiblemente por la mañana.",
+      preparacion: "Cápsulas, extracto líquido, tintura.",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "No usar durante el embarazo o la lactancia." }, { tipo: "medicamentos", descripcion: "Puede interferir con anticonceptivos orales y terapia de reemplazo hormonal." }],
+      descripcion: "Arbusto mediterráneo utilizado desde la antigüedad para regular el ciclo menstrual y aliviar sus síntomas.",
+      sistemasRelacionados: ["sistema-reproductor", "sistema-endocrino"],
+      categoriaId: "arbustos-medicinales",
+      categoria: "Arbustos medicinales",
+    },
+    {
+      id: "gayuba",
+      nombre: "Gayuba",
+      nombreCientifico: "Arctostaphylos uva-ursi",
+      nombresAlternativos: {"España": ["uva de oso", "rastrera"], "USA_English": ["bearberry", "kinnikinnick"], "UK_English": ["bearberry"], "Indigena": ["kinnikinnick"]},
+      propiedades: ["Antiséptico urinario", "Diurético", "Astringente"],
+      parteUsable: "Hojas",
+      dosis: "Infusión: 1.5-4 g en 150 ml de agua, 3-4 veces al día. No usar más de 1 semana seguida.",
+      preparacion: "Infusión (en frío para reducir taninos), decocción, extracto.",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "No usar durante el embarazo o lactancia." }, { tipo: "ninos", descripcion: "No recomendado para menores de 12 años." }, { tipo: "otro", descripcion: "No usar en caso de insuficiencia renal o trastornos hepáticos." }],
+      descripcion: "Pequeño arbusto rastrero cuyas hojas son un remedio clásico para las infecciones del tracto urinario.",
+      sistemasRelacionados: ["sistema-urinario"],
+      categoriaId: "arbustos-medicinales",
+      categoria: "Arbustos medicinales",
+    },
+    {
+      id: "arandano-rojo",
+      nombre: "Arándano Rojo Americano",
+      nombreCientifico: "Vaccinium macrocarpon",
+      nombresAlternativos: {"España": ["arándano encarnado", "arándano de fruto encarnado", "mirtilo rojo"], "USA_English": ["lingonberry", "cowberry", "mountain cranberry", "northern mountain cranberry", "foxberry", "partridgeberry"], "UK_English": ["cowberry", "lingonberry", "red whortleberry", "whimberry"]},
+      propiedades: ["Antiadherente bacteriano (vías urinarias)", "Antioxidante", "Antiinflamatorio"],
+      parteUsable: "Fruto (baya)",
+      dosis: "Jugo: 250-500 ml al día. Extracto en cápsulas: 300-500 mg dos veces al día.",
+      preparacion: "Jugo, consumo directo, cápsulas, extracto.",
+      contraindicaciones: [{ tipo: "medicamentos", descripcion: "Puede aumentar el riesgo de sangrado si se toma con anticoagulantes (warfarina)." }, { tipo: "otro", descripcion: "Altas dosis pueden causar malestar estomacal o diarrea." }],
+      descripcion: "Famoso por su capacidad para prevenir infecciones urinarias recurrentes al impedir que las bacterias se adhieran a las paredes de la vejiga.",
+      sistemasRelacionados: ["sistema-urinario", "sistema-inmunologico"],
+      categoriaId: "arbustos-medicinales",
+      categoria: "Arbustos medicinales",
+    },
+    {
+      id: "grosellero-negro",
+      nombre: "Grosellero Negro",
+      nombreCientifico: "Ribes nigrum",
+      nombresAlternativos: {"España": ["grosellero negro", "casis", "parrilla negra"], "USA_English": ["blackcurrant", "European blackcurrant"], "UK_English": ["blackcurrant"]},
+      propiedades: ["Antiinflamatorio (similar a la cortisona)", "Antialérgico", "Diurético", "Rico en Vitamina C"],
+      parteUsable: "Hojas, frutos y yemas",
+      dosis: "Infusión de hojas: 2-4 g por taza. Extracto de yemas (gemoterapia): 50-100 gotas al día.",
+      preparacion: "Infusión, extracto de yemas, jugo, jarabe.",
+      contraindicaciones: [{ tipo: "hipertension", descripcion: "Usar con precaución si se tiene edema por insuficiencia cardíaca o renal." }],
+      descripcion: "Arbusto cuyos frutos son muy nutritivos y sus hojas y yemas tienen potentes efectos antiinflamatorios y antialérgicos.",
+      sistemasRelacionados: ["sistema-inmunologico", "sistema-musculoesqueletico", "sistema-respiratorio", "enfermedades-piel"],
+      categoriaId: "arbustos-medicinales",
+      categoria: "Arbustos medicinales",
+    },
+    {
+      id: "enebro",
+      nombre: "Enebro",
+      nombreCientifico: "Juniperus communis",
+      nombresAlternativos: {"España": ["enebro", "ginebro"], "USA_English": ["common juniper", "ground juniper"], "UK_English": ["common juniper"]},
+      propiedades: ["Diurético potente", "Antiséptico (urinario y respiratorio)", "Carminativo", "Antirreumático"],
+      parteUsable: "Frutos (bayas o gálbulos)",
+      dosis: "Infusión: 1 cucharadita de bayas machacadas por taza, 1-2 veces al día. No usar por periodos prolongados.",
+      preparacion: "Infusión, aceite esencial (uso externo), tintura.",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "Totalmente contraindicado, es abortivo." }, { tipo: "otro", descripcion: "No usar en caso de nefritis o insuficiencia renal aguda." }],
+      descripcion: "Conífera arbustiva cuyas bayas se usan para aromatizar la ginebra y como un potente diurético y antiséptico.",
+      sistemasRelacionados: ["sistema-urinario", "sistema-digestivo", "sistema-musculoesqueletico"],
+      categoriaId: "arbustos-medicinales",
+      categoria: "Arbustos medicinales",
+    },
+    {
+      id: "madrono",
+      nombre: "Madroño",
+      nombreCientifico: "Arbutus unedo",
+      nombresAlternativos: {"España": ["madroño", "albornio", "madroña", "madroñera", "alborecera", "borrachín"], "USA_English": ["strawberry tree", "madrone", "Killarney strawberry tree", "strawberry madrone"], "UK_English": ["strawberry tree"]},
+      propiedades: ["Antiséptico urinario", "Astringente", "Diurético", "Antiinflamatorio"],
+      parteUsable: "Hojas y frutos",
+      dosis: "Decocción de hojas: 20-30 g por litro de agua, tomar 2-3 tazas al día.",
+      preparacion: "Decocción, infusión.",
+      contraindicaciones: [{ tipo: "otro", descripcion: "El consumo excesivo de frutos puede causar indigestión y dolor de cabeza." }],
+      descripcion: "Árbol o arbusto mediterráneo con frutos comestibles y hojas con propiedades similares a la gayuba para el sistema urinario.",
+      sistemasRelacionados: ["sistema-urinario", "sistema-digestivo"],
+      categoriaId: "arbustos-medicinales",
+      categoria: "Arbustos medicinales",
+    },
+    {
+      id: "zarzaparrilla",
+      nombre: "Zarzaparrilla",
+      nombreCientifico: "Smilax aspera",
+      nombresAlternativos: {"España": ["zarzaparrilla", "zarza morisca", "uva de perro"], "Mexico": ["zarzaparrilla"], "USA_English": ["common smilax", "rough bindweed", "sarsaparilla"], "UK_English": ["common smilax", "Mediterranean smilax"]},
+      propiedades: ["Depurativa", "Diurética", "Sudorífica", "Antiinflamatoria"],
+      parteUsable: "Raíz (rizoma)",
+      dosis: "Decocción: 1-2 cucharaditas de raíz por taza, hervir 10 min, tomar 2-3 veces al día.",
+      preparacion: "Decocción, extracto, cápsulas.",
+      contraindicaciones: [{ tipo: "medicamentos", descripcion: "Puede aumentar la absorción de algunos fármacos." }, { tipo: "otro", descripcion: "Dosis altas pueden irritar la mucosa gástrica." }],
+      descripcion: "Arbusto trepador cuya raíz es famosa por sus propiedades depurativas, usada para limpiar la sangre y tratar problemas de piel.",
+      sistemasRelacionados: ["enfermedades-piel", "sistema-musculoesqueletico", "sistema-urinario"],
+      categoriaId: "arbustos-medicinales",
+      categoria: "Arbustos medicinales",
+    },
+    {
+      id: "rusco",
+      nombre: "Rusco",
+      nombreCientifico: "Ruscus aculeatus",
+      nombresAlternativos: {"España": ["rusco", "brusco", "acebillo"], "USA_English": ["butcher's broom", "knee holly"], "UK_English": ["butcher's broom"]},
+      propiedades: ["Venotónico", "Antiinflamatorio", "Antiedematoso", "Diurético"],
+      parteUsable: "Rizoma y raíces",
+      dosis: "Extracto estandarizado: 7-11 mg de ruscogenina total al día, en 2-3 tomas.",
+      preparacion: "Cápsulas, extracto, gel (uso tópico).",
+      contraindicaciones: [{ tipo: "hipertension", descripcion: "Usar con precaución y bajo control médico." }, { tipo: "embarazo", descripcion: "Consultar al médico antes de usar." }],
+      descripcion: "Pequeño arbusto de hojas rígidas y punzantes, muy eficaz para tratar la insuficiencia venosa crónica, hemorroides y piernas cansadas.",
+      sistemasRelacionados: ["sistema-cardiovascular"],
+      categoriaId: "arbustos-medicinales",
+      categoria: "Arbustos medicinales",
+    },
+    {
+      id: "mirto",
+      nombre: "Mirto",
+      nombreCientifico: "Myrtus communis",
+      nombresAlternativos: {"España": ["mirto", "arrayán", "murta"], "USA_English": ["common myrtle", "true myrtle"], "UK_English": ["common myrtle"]},
+      propiedades: ["Antiséptico", "Expectorante", "Balsámico", "Astringente"],
+      parteUsable: "Hojas y bayas",
+      dosis: "Infusión: 1 cucharadita por taza. Aceite esencial: 2-3 gotas en inhalaciones de vapor.",
+      preparacion: "Infusión, aceite esencial, licor.",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "Evitar el aceite esencial durante el embarazo y la lactancia." }],
+      descripcion: "Arbusto aromático mediterráneo, sagrado en la antigüedad, utilizado para afecciones respiratorias y como tónico para la piel.",
+      sistemasRelacionados: ["sistema-respiratorio", "enfermedades-piel", "sistema-digestivo"],
+      categoriaId: "arbustos-medicinales",
+      categoria: "Arbustos medicinales",
+    },
+    {
+      id: "jara-pringosa",
+      nombre: "Jara Pringosa",
+      nombreCientifico: "Cistus ladanifer",
+      nombresAlternativos: {"España": ["jara pringosa", "ládano", "jara negra"], "USA_English": ["gum rockrose", "common gum cistus"], "UK_English": ["gum rockrose"]},
+      propiedades: ["Antiviral", "Antibacteriano", "Cicatrizante", "Antihemorrágico"],
+      parteUsable: "Hojas y ramas jóvenes",
+      dosis: "Infusión: 1 cucharadita por taza, 2-3 veces al día. Uso tópico: aplicar la infusión o el aceite (ládano).",
+      preparacion: "Infusión, aceite esencial (ládano).",
+      contraindicaciones: [{ tipo: "otro", descripcion: "No se conocen contraindicaciones importantes en las dosis recomendadas." }],
+      descripcion: "Arbusto mediterráneo cubierto de una resina pegajosa (ládano) con potentes propiedades antivirales y cicatrizantes.",
+      sistemasRelacionados: ["sistema-inmunologico", "enfermedades-piel", "sistema-respiratorio"],
+      categoriaId: "arbustos-medicinales",
+      categoria: "Arbustos medicinales",
+    },
+    {
+      id: "brezo",
+      nombre: "Brezo",
+      nombreCientifico: "Calluna vulgaris",
+      nombresAlternativos: {"España": ["brezo", "brecina", "argaña"], "USA_English": ["heather", "Scotch heather", "ling"], "UK_English": ["heather", "ling"]},
+      propiedades: ["Antiséptico urinario", "Diurético", "Antiinflamatorio", "Sedante suave"],
+      parteUsable: "Sumidades floridas (flores)",
+      dosis: "Infusión: 1-2 cucharaditas de flores por taza, 3-4 veces al día.",
+      preparacion: "Infusión, extracto, yemas (gemoterapia).",
+      contraindicaciones: [{ tipo: "otro", descripcion: "No se han descrito efectos adversos significativos." }],
+      descripcion: "Arbusto de bajo crecimiento que cubre grandes extensiones (brezales), cuyas flores son un remedio suave para las vías urinarias y el reumatismo.",
+      sistemasRelacionados: ["sistema-urinario", "sistema-musculoesqueletico", "sistema-nervioso"],
+      categoriaId: "arbustos-medicinales",
+      categoria: "Arbustos medicinales",
+    },
+    {
+      id: "sauco",
+      nombre: "Saúco",
+      nombreCientifico: "Sambucus nigra",
+      nombresAlternativos: {"España": ["saúco", "sabuco", "sauqueiro", "canillero", "sabugo", "bieiteiro", "sabugueiro"], "México": ["saúco", "tapiro", "flor de sauz", "capulin silvestre"], "USA_English": ["elderberry", "European elder", "black elder", "American elderberry", "blue elderberry", "Arizona elderberry", "desert elderberry", "New Mexican elderberry", "Mexican elderberry"], "UK_English": ["elder", "elderberry", "black elder", "European elder"], "Indigena": ["shiksh (O'odham)", "bixihumi (Nahuatl)"]},
+      propiedades: ["Antiviral (gripe)", "Sudorífico", "Antiinflamatorio", "Diurético"],
+      parteUsable: "Flores y bayas maduras",
+      dosis: "Infusión de flores: 2-4 g por taza. Jarabe de bayas: 1-2 cucharadas 3-4 veces al día al inicio de un resfriado.",
+      preparacion: "Infusión (flores), jarabe (bayas), decocción (corteza, uso externo).",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Las bayas crudas y otras partes verdes de la planta son tóxicas. Solo consumir bayas cocinadas." }],
+      descripcion: "Arbusto o pequeño árbol cuyas flores y bayas son un remedio tradicional muy efectivo para gripes y resfriados.",
+      sistemasRelacionados: ["sistema-respiratorio", "sistema-inmunologico"],
+      categoriaId: "arbustos-medicinales",
+      categoria: "Arbustos medicinales",
+    },
+    {
+      id: "artemisa",
+      nombre: "Artemisa",
+      nombreCientifico: "Artemisia vulgaris",
+      nombresAlternativos: {"España": ["artemega", "ceñidor", "yuyo crisantemo", "hierba de San Juan", "madra", "artemisia", "manzanillón", "ajenjo", "altamisa", "anastasia", "artamisa", "artamisia", "escobilla parda", "flor de santos"], "USA_English": ["mugwort", "riverside wormwood", "wild wormwood", "felon herb", "common mugwort"], "UK_English": ["mugwort", "riverside wormwood", "wild wormwood", "felon herb", "common mugwort"]},
+      propiedades: ["Emenagogo (regula la menstruación)", "Tónico digestivo", "Vermífugo", "Colerético"],
+      parteUsable: "Hojas y sumidades floridas",
+      dosis: "Infusión: 1 cucharadita por taza, antes de las comidas. No tomar de forma continuada.",
+      preparacion: "Infusión, polvo, tintura.",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "Contraindicada por su efecto emenagogo y potencial toxicidad." }, { tipo: "lactancia", descripcion: "Evitar durante la lactancia." }, { tipo: "alergia", descripcion: "Puede causar alergia a personas sensibles a las compuestas (Asteraceae)." }],
+      descripcion: "Planta herbácea o arbustiva con un aroma característico, utilizada tradicionalmente para problemas digestivos y ginecológicos.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-reproductor"],
+      categoriaId: "arbustos-medicinales",
+      categoria: "Arbustos medicinales",
+    },
+    {
+      id: "boj",
+      nombre: "Boj",
+      nombreCientifico: "Buxus sempervirens",
+      nombresAlternativos: {"España": ["boj", "buje"], "Colombia": ["cajón", "chupalla"], "USA_English": ["common boxwood", "European box"], "UK_English": ["common box", "boxwood"]},
+      propiedades: ["Sudorífico", "Depurativo", "Febrífugo", "Colagogo"],
+      parteUsable: "Hojas y corteza",
+      dosis: "Uso muy delicado por su toxicidad. Principalmente en homeopatía o bajo estricta supervisión médica.",
+      preparacion: "Decocción (uso tradicional, hoy desaconsejado), extractos muy diluidos.",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Planta tóxica. Su uso interno es peligroso y puede causar vómitos, diarrea y parálisis. No automedicarse." }],
+      descripcion: "Arbusto de crecimiento lento muy usado en jardinería ornamental. Medicinalmente es tóxico y su uso casero está obsoleto y es peligroso.",
+      sistemasRelacionados: ["sistema-inmunologico"],
+      categoriaId: "arbustos-medicinales",
+      categoria: "Arbustos medicinales",
+    },
+    {
+      id: "aligustre",
+      nombre: "Aligustre",
+      nombreCientifico: "Ligustrum vulgare",
+      nombresAlternativos: {"España": ["aligustre", "alheña"], "Colombia": ["azahar de novio"], "USA_English": ["common privet", "European privet"], "UK_English": ["wild privet", "common privet"]},
+      propiedades: ["Astringente", "Vulnerario", "Antiinflamatorio (uso externo)"],
+      parteUsable: "Hojas y flores",
+      dosis: "Uso exclusivamente externo. Infusión para gargarismos o compresas.",
+      preparacion: "Infusión para enjuagues, gargarismos o lavado de heridas.",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Sus bayas son tóxicas, especialmente para los niños. No ingerir ninguna parte de la planta." }],
+      descripcion: "Arbusto muy común en setos de jardín. Sus hojas se usan externamente para aftas bucales y heridas, pero sus frutos son venenosos.",
+      sistemasRelacionados: ["enfermedades-piel", "enfermedades-ojos-oidos-nariz-garganta"],
+      categoriaId: "arbustos-medicinales",
+      categoria: "Arbustos medicinales",
+    },
+    {
+      id: "bonetero",
+      nombre: "Bonetero",
+      nombreCientifico: "Euonymus europaeus",
+      nombresAlternativos: {"España": ["bonetero", "evónimo", "husera"], "USA_English": ["European spindle", "common spindle"], "UK_English": ["spindle", "European spindle"]},
+      propiedades: ["Laxante drástico", "Vomitivo", "Insecticida (uso externo)"],
+      parteUsable: "Frutos y corteza",
+      dosis: "Planta altamente tóxica. No se recomienda ningún uso interno.",
+      preparacion: "Polvo de frutos (uso externo tradicional como insecticida).",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Todas las partes de la planta son muy tóxicas. La ingestión de frutos puede ser mortal, especialmente en niños." }],
+      descripcion: "Arbusto con frutos rosados muy característicos y decorativos, pero extremadamente tóxicos. Su uso medicinal es obsoleto y peligroso.",
+      sistemasRelacionados: [],
+      categoriaId: "arbustos-medicinales",
+      categoria: "Arbustos medicinales",
+    },
+    {
+      id: "cornejo-sanguineo",
+      nombre: "Cornejo Sanguíneo",
+      nombreCientifico: "Cornus sanguinea",
+      nombresAlternativos: {"España": ["cornejo sanguíneo", "sanguino", "sanguiño"], "USA_English": ["common dogwood", "bloody dogwood"], "UK_English": ["common dogwood"]},
+      propiedades: ["Febrífugo", "Astringente", "Tónico"],
+      parteUsable: "Corteza y frutos",
+      dosis: "Decocción de corteza: 30 g por litro, tomar a pequenas dosis (uso tradicional, hoy poco común).",
+      preparacion: "Decocción, maceración de frutos.",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Los frutos pueden ser vomitivos en grandes cantidades. Usar con precaución." }],
+      descripcion: "Arbusto con ramas rojizas en invierno, cuya corteza se usaba antiguamente como sustituto de la quinina para bajar la fiebre.",
+      sistemasRelacionados: ["sistema-inmunologico", "sistema-digestivo"],
+      categoriaId: "arbustos-medicinales",
+      categoria: "Arbustos medicinales",
+    },
+    {
+      id: "durillo",
+      nombre: "Durillo",
+      nombreCientifico: "Viburnum tinus",
+      nombresAlternativos: {"España": ["durillo", "laurentina", "barbadija"], "USA_English": ["laurustinus", "laurustinus viburnum"], "UK_English": ["laurustinus"]},
+      propiedades: ["Febrífugo", "Purgante", "Antipirético"],
+      parteUsable: "Hojas y frutos",
+      dosis: "Uso delicado por su toxicidad. La tintura madre se usa en homeopatía.",
+      preparacion: "Decocción (uso tradicional arriesgado).",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Planta tóxica. La ingestión puede causar vómitos y diarrea. No automedicar." }],
+      descripcion: "Arbusto ornamental de floración invernal. Se ha usado como febrífugo, pero su toxicidad hace que su uso interno sea desaconsejable.",
+      sistemasRelacionados: ["sistema-inmunologico"],
+      categoriaId: "arbustos-medicinales",
+      categoria: "Arbustos medicinales",
+    },
+    {
+      id: "espino-cerval-de-mar",
+      nombre: "Espino Cerval de Mar",
+      nombreCientifico: "Hippophae rhamnoides",
+      nombresAlternativos: {"España": ["espino amarillo", "espino falso"], "USA_English": ["sea buckthorn", "seaberry", "sandthorn"], "UK_English": ["sea buckthorn", "sallowthorn"]},
+      propiedades: ["Muy rico en Vitamina C", "Antioxidante", "Cicatrizante", "Inmunoestimulante"],
+      parteUsable: "Frutos (bayas) y aceite de las semillas",
+      dosis: "Jugo o jarabe: 1-3 cucharadas al día. Aceite (uso tópico u oral): seguir indicaciones del producto.",
+      preparacion: "Jugo, jarabe, aceite, consumo directo de bayas cocidas.",
+      contraindicaciones: [{ tipo: "otro", descripcion: "No se conocen contraindicaciones importantes." }],
+      descripcion: "Arbusto espinoso cuyos frutos anaranjados son una de las fuentes vegetales más ricas en vitamina C y otros nutrientes.",
+      sistemasRelacionados: ["sistema-inmunologico", "enfermedades-piel", "sistema-cardiovascular"],
+      categoriaId: "arbustos-medicinales",
+      categoria: "Arbustos medicinales",
+    },
+    {
+      id: "forsitia",
+      nombre: "Forsitia",
+      nombreCientifico: "Forsythia suspensa",
+      nombresAlternativos: {"España": ["forsitia", "campanas doradas"], "USA_English": ["weeping forsythia", "golden bells"], "UK_English": ["weeping forsythia", "golden bells"]},
+      propiedades: ["Antibacterial", "Antiinflamatorio", "Antipirético", "Antiviral"],
+      parteUsable: "Fruto",
+      dosis: "Se usa en fórmulas de la Medicina Tradicional China (MTC) como Lian Qiao. Dosis según prescripción.",
+      preparacion: "Decocción dentro de fórmulas complejas.",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Usar solo bajo supervisión de un profesional de MTC. Puede causar náuseas." }],
+      descripcion: "Arbusto ornamental conocido por su espectacular floración amarilla en primavera. Su fruto es una importante hierba en la medicina china.",
+      sistemasRelacionados: ["sistema-respiratorio", "sistema-inmunologico", "enfermedades-piel"],
+      categoriaId: "arbustos-medicinales",
+      categoria: "Arbustos medicinales",
+    },
+    {
+      id: "mahonia",
+      nombre: "Mahonia",
+      nombreCientifico: "Mahonia aquifolium",
+      nombresAlternativos: {"España": ["mahonia", "uva de Oregón"], "USA_English": ["Oregon grape", "holly-leaved barberry"], "UK_English": ["Oregon grape"]},
+      propiedades: ["Antimicrobiano (berberina)", "Colagogo", "Alterativo (depurativo)", "Antiinflamatorio"],
+      parteUsable: "Raíz y corteza del tallo",
+      dosis: "Tintura: 1-3 ml, 3 veces al día. No usar por periodos prolongados.",
+      preparacion: "Tintura, decocción, extracto.",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "No usar durante el embarazo debido a la berberina." }, { tipo: "lactancia", descripcion: "Evitar durante la lactancia." }, { tipo: "otro", descripcion: "No usar en caso de ictericia en recién nacidos." }],
+      descripcion: "También llamado 'Uva de Oregón', es un arbusto con bayas comestibles y una raíz rica en berberina, usada para infecciones y problemas de piel.",
+      sistemasRelacionados: ["enfermedades-piel", "sistema-digestivo", "sistema-inmunologico"],
+      categoriaId: "arbustos-medicinales",
+      categoria: "Arbustos medicinales",
+    },
+    {
+      id: "pirlitero",
+      nombre: "Pirlitero",
+      nombreCientifico: "Crataegus azarolus",
+      nombresAlternativos: {"España": ["acerolo", "azarolo", "cerolero"], "USA_English": ["azarole", "Mediterranean medlar"], "UK_English": ["azarole"]},
+      propiedades: ["Cardiotónico", "Astringente", "Rico en Vitamina C"],
+      parteUsable: "Frutos (acerolas)",
+      dosis: "Consumo de los frutos frescos o en mermelada.",
+      preparacion: "Consumo directo, mermeladas, jaleas.",
+      contraindicaciones: [{ tipo: "medicamentos", descripcion: "Similar al espino blanco, precaución si se toman fármacos para el corazón." }],
+      descripcion: "Arbusto o pequeño árbol mediterráneo, pariente del espino blanco, con frutos comestibles (acerolas) ricos en vitamina C y con propiedades para el corazón.",
+      sistemasRelacionados: ["sistema-cardiovascular", "sistema-digestivo"],
+      categoriaId: "arbustos-medicinales",
+      categoria: "Arbustos medicinales",
+    },
+    {
+      id: "retama-negra",
+      nombre: "Retama Negra",
+      nombreCientifico: "Cytisus scoparius",
+      nombresAlternativos: {"España": ["retama negra", "escoba amarga", "piorno"], "USA_English": ["Scotch broom", "common broom"], "UK_English": ["broom", "Scotch broom"]},
+      propiedades: ["Cardiotónico (esparteína)", "Diurético", "Hipertensor"],
+      parteUsable: "Ramas y flores",
+      dosis: "Uso muy delicado por su toxicidad. Solo bajo estricta prescripción médica.",
+      preparacion: "Extractos estandarizados (uso farmacéutico).",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "Totalmente contraindicada." }, { tipo: "hipertension", descripcion: "Contraindicada por su efecto hipertensor." }, { tipo: "otro", descripcion: "Planta tóxica. Su uso puede provocar arritmias y otros problemas cardíacos graves." }],
+      descripcion: "Arbusto de flores amarillas muy vistosas. Contiene esparteína, un alcaloide tóxico con acción sobre el corazón. Su uso casero es muy peligroso.",
+      sistemasRelacionados: ["sistema-cardiovascular"],
+      categoriaId: "arbustos-medicinales",
+      categoria: "Arbustos medicinales",
+    },
+    {
+      id: "rosa-canina",
+      nombre: "Rosa Canina (Escaramujo)",
+      nombreCientifico: "Rosa canina",
+      nombresAlternativos: {"España": ["rosa canina", "escaramujo", "rosal silvestre"], "USA_English": ["dog rose", "briar rose"], "UK_English": ["dog rose"]},
+      propiedades: ["Muy rico en Vitamina C", "Astringente", "Antiinflamatorio", "Diurético suave"],
+      parteUsable: "Fruto (escaramujo)",
+      dosis: "Infusión: 2-5 g de frutos secos por taza. Polvo: 5-10 g al día.",
+      preparacion: "Infusión, decocción, mermelada, jarabe, polvo.",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Los pelos del interior del fruto pueden causar irritación en la boca y el tracto digestivo si no se eliminan." }],
+      descripcion: "Rosal silvestre cuyos frutos, los escaramujos, son excepcionalmente ricos en vitamina C, ideales para prevenir resfriados y reforzar el sistema inmune.",
+      sistemasRelacionados: ["sistema-inmunologico", "sistema-musculoesqueletico", "enfermedades-piel"],
+      categoriaId: "arbustos-medicinales",
+      categoria: "Arbustos medicinales",
+    },
+    {
+      id: "salvia-real",
+      nombre: "Salvia Real",
+      nombreCientifico: "Phlomis lychnitis",
+      nombresAlternativos: {"España": ["salvia real", "candilera", "oreja de liebre", "matagallo"], "USA_English": ["lampwick plant", "Jerusalem sage"], "UK_English": ["lampwick plant"]},
+      propiedades: ["Antiinflamatorio", "Cicatrizante", "Antiséptico (uso externo)"],
+      parteUsable: "Hojas",
+      dosis: "Uso externo: infusión concentrada para lavar heridas o en gargarismos.",
+      preparacion: "Infusión para uso tópico.",
+      contraindicaciones: [{ tipo: "otro", descripcion: "No se recomienda su uso interno por falta de estudios concluyentes." }],
+      descripcion: "Arbusto mediterráneo con hojas que recuerdan a las del gordolobo, tradicionalmente usado para desinfectar y cicatrizar heridas.",
+      sistemasRelacionados: ["enfermedades-piel"],
+      categoriaId: "arbustos-medicinales",
+      categoria: "Arbustos medicinales",
+    },
+    {
+      id: "te-de-aragon",
+      nombre: "Té de Aragón",
+      nombreCientifico: "Jasonia glutinosa",
+      nombresAlternativos: {"España": ["té de Aragón", "té de roca", "olivardilla"], "USA_English": ["rock tea"], "UK_English": ["rock tea"]},
+      propiedades: ["Digestivo", "Carminativo", "Antiespasmódico", "Aperitivo"],
+      parteUsable: "Sumidades floridas",
+      dosis: "Infusión: 1 cucharadita por taza, después de las comidas.",
+      preparacion: "Infusión.",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "Evitar por precaución." }],
+      descripcion: "Pequeño arbusto que crece en roquedos calcáreos, muy popular en Aragón y otras zonas de España como remedio para todo tipo de trastornos digestivos.",
+      sistemasRelacionados: ["sistema-digestivo"],
+      categoriaId: "arbustos-medicinales",
+      categoria: "Arbustos medicinales",
+    },
+    {
+      id: "tomillo-salsero",
+      nombre: "Tomillo Salsero",
+      nombreCientifico: "Thymbra capitata",
+      nombresAlternativos: {"España": ["tomillo salsero", "tomillo aceitunero", "tomillo andaluz"], "USA_English": ["conehead thyme", "Spanish oregano", "Persian hyssop"], "UK_English": ["conehead thyme"]},
+      propiedades: ["Antiséptico potente", "Expectorante", "Antifúngico", "Antiespasmódico"],
+      parteUsable: "Sumidades floridas",
+      dosis: "Infusión: media cucharadita por taza (es muy potente), 1-2 veces al día. No tomar de forma prolongada.",
+      preparacion: "Infusión, aceite esencial (muy cáustico, solo uso experto).",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "Contraindicado." }, { tipo: "hipertension", descripcion: "Puede subir la tensión arterial." }, { tipo: "otro", descripcion: "Irritante gástrico en dosis altas o uso continuado." }],
+      descripcion: "Arbusto de intenso aroma, considerado uno de los tomillos con mayor poder antiséptico gracias a su alto contenido en carvacrol.",
+      sistemasRelacionados: ["sistema-respiratorio", "sistema-digestivo", "sistema-inmunologico"],
+      categoriaId: "arbustos-medicinales",
+      categoria: "Arbustos medicinales",
+    },
+    {
+      id: "torvisco",
+      nombre: "Torvisco",
+      nombreCientifico: "Daphne gnidium",
+      nombresAlternativos: {"España": ["torvisco", "matapollo", "bufalaga"], "USA_English": ["flax-leaved daphne", "spurge flax"], "UK_English": ["flax-leaved daphne"]},
+      propiedades: ["Purgante drástico", "Vesicante (produce ampollas en la piel)"],
+      parteUsable: "Corteza y hojas",
+      dosis: "Planta extremadamente tóxica. No se recomienda ningún uso, ni interno ni externo.",
+      preparacion: "Tradicionalmente se usaba la corteza como purgante o para provocar ampollas (práctica peligrosa).",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Toda la planta es muy venenosa. El simple contacto puede irritar la piel y su ingestión puede ser mortal." }],
+      descripcion: "Arbusto mediterráneo muy venenoso. Se usaba en el pasado como veneno para pescar (embarbascar) y como purgante, prácticas hoy prohibidas y muy peligrosas.",
+      sistemasRelacionados: [],
+      categoriaId: "arbustos-medicinales",
+      categoria: "Arbustos medicinales",
+    },
+    {
+      id: "viburno",
+      nombre: "Viburno",
+      nombreCientifico: "Viburnum opulus",
+      nombresAlternativos: {"España": ["bola de nieve", "mundillo", "sauquillo"], "USA_English": ["European cranberrybush", "cramp bark", "snowball tree"], "UK_English": ["guelder-rose", "water elder", "snowball tree"]},
+      propiedades: ["Antiespasmódico (especialmente uterino)", "Sedante", "Astringente", "Hipotensor"],
+      parteUsable: "Corteza",
+      dosis: "Decocción: 1-2 cucharaditas de corteza por taza. Tintura: 2-4 ml, 3 veces al día.",
+      preparacion: "Decocción, tintura, extracto.",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "No usar durante el embarazo, excepto bajo supervisión médica en el momento del parto." }],
+      descripcion: "Conocido como 'Cramp Bark' en inglés, es un arbusto cuya corteza es un relajante muscular muy eficaz, especialmente para calambres menstruales.",
+      sistemasRelacionados: ["sistema-reproductor", "sistema-musculoesqueletico", "sistema-nervioso"],
+      categoriaId: "arbustos-medicinales",
+      categoria: "Arbustos medicinales",
+    },
+    {
+      id: "agnocasto",
+      nombre: "Agnocasto",
+      nombreCientifico: "Vitex agnus-castus",
+      nombresAlternativos: {"España": ["sauzgatillo", "pimiento de los monjes", "árbol casto"], "USA_English": ["chaste tree", "vitex", "chasteberry"], "UK_English": ["chaste tree", "monk's pepper"]},
+      propiedades: ["Regulador hormonal", "Alivia el síndrome premenstrual", "Trata irregularidades menstruales"],
+      parteUsable: "Frutos",
+      dosis: "30-40 mg de extracto seco al día.",
+      preparacion: "Cápsulas, comprimidos, gotas.",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "No recomendado." }, { tipo: "lactancia", descripcion: "No recomendado." }, { tipo: "medicamentos", descripcion: "Puede interactuar con antagonistas de la dopamina." }],
+      descripcion: "Arbusto que crece en las riberas de los ríos y que se ha utilizado desde la antigüedad para tratar los desequilibrios hormonales femeninos.",
+      sistemasRelacionados: ["sistema-reproductor", "sistema-endocrino"],
+      categoriaId: "arbustos-medicinales",
+      categoria: "Arbustos medicinales",
+    },
+    {
+      id: "aladierno",
+      nombre: "Aladierno",
+      nombreCientifico: "Rhamnus alaternus",
+      propiedades: ["Laxante", "Astringente", "Febrífugo"],
+      parteUsable: "Corteza y frutos",
+      dosis: "Decocción de la corteza (20 g/l), 1 taza antes de acostarse.",
+      preparacion: "Decocción.",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "No recomendado." }, { tipo: "otro", descripcion: "Puede causar espasmos intestinales." }],
+      descripcion: "Arbusto mediterráneo de hoja perenne, cuya corteza tiene propiedades laxantes, aunque más suaves que las de la frángula.",
+      sistemasRelacionados: ["sistema-digestivo"],
+      categoriaId: "arbustos-medicinales",
+      categoria: "Arbustos medicinales",
+    },
+    {
+      id: "arayan",
+      nombre: "Arrayán",
+      nombreCientifico: "Myrtus communis",
+      nombresAlternativos: {"Chile": ["arrayán", "arrayán rojo", "arrayán chileno", "palo colorado", "quetri", "temu"], "Argentina": ["arrayán", "palo colorado", "temu"], "USA_English": ["Chilean myrtle", "orange-bark myrtle"], "UK_English": ["Chilean myrtle"], "Indigena": ["quetri (mapudungun)"]},
+      propiedades: ["Antiséptico", "Expectorante", "Astringente"],
+      parteUsable: "Hojas y bayas",
+      dosis: "Infusión de 15 g de hojas por litro de agua.",
+      preparacion: "Infusión, aceite esencial.",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "No se recomienda el uso del aceite esencial." }],
+      descripcion: "Arbusto aromático, también conocido como mirto, utilizado para tratar afecciones respiratorias y digestivas.",
+      sistemasRelacionados: ["sistema-respiratorio", "sistema-digestivo"],
+      categoriaId: "arbustos-medicinales",
+      categoria: "Arbustos medicinales",
+    },
+    {
+      id: "berberis",
+      nombre: "Bérberis",
+      nombreCientifico: "Berberis vulgaris",
+      propiedades: ["Tónico hepático", "Estimulante de la bilis", "Antimicrobiano"],
+      parteUsable: "Corteza de la raíz",
+      dosis: "Decocción de 5 g por taza, 2-3 veces al día antes de las comidas.",
+      preparacion: "Decocción, tintura.",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "No usar." }, { tipo: "lactancia", descripcion: "No usar." }],
+      descripcion: "Arbusto espinoso, también llamado agracejo, cuya raíz es rica en berberina, un potente estimulante hepático y biliar.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-linfatico"],
+      categoriaId: "arbustos-medicinales",
+      categoria: "Arbustos medicinales",
+    },
+    {
+      id: "ceanoto",
+      nombre: "Ceanoto",
+      nombreCientifico: "Ceanothus americanus",
+      propiedades: ["Linfagogo", "Astringente", "Expectorante"],
+      parteUsable: "Corteza de la raíz",
+      dosis: "Tintura (1:5 en alcohol al 45%), 1-2 ml tres veces al día.",
+      preparacion: "Tintura, decocción.",
+      contraindicaciones: [{ tipo: "medicamentos", descripcion: "Puede interferir con anticoagulantes." }],
+      descripcion: "Conocido como 'Raíz Roja', es un arbusto norteamericano que actúa como un excelente tónico para el sistema linfático.",
+      sistemasRelacionados: ["sistema-linfatico", "sistema-inmunologico"],
+      categoriaId: "arbustos-medicinales",
+      categoria: "Arbustos medicinales",
+    },
+    {
+      id: "chicalote",
+      nombre: "Chicalote",
+      nombreCientifico: "Argemone mexicana",
+      propiedades: ["Sedante", "Analgésico", "Antitusivo"],
+      parteUsable: "Látex y hojas",
+      dosis: "Microdosis bajo supervisión experta. Es una planta de uso delicado.",
+      preparacion: "Látex, infusión.",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "No usar." }, { tipo: "otro", descripcion: "Planta tóxica, puede causar glaucoma si el látex entra en contacto con los ojos." }],
+      descripcion: "Planta arbustiva espinosa con flores amarillas parecidas a las amapolas. Se usa en la medicina tradicional mexicana como calmante.",
+      sistemasRelacionados: ["sistema-nervioso", "trastornos-mentales-emocionales"],
+      categoriaId: "arbustos-medicinales",
+      categoria: "Arbustos medicinales",
+    },
+    {
+      id: "damiana",
+      nombre: "Damiana",
+      nombreCientifico: "Turnera diffusa",
+      propiedades: ["Afrodisíaco", "Tónico nervioso", "Antidepresivo suave", "Diurético"],
+      parteUsable: "Hojas",
+      dosis: "Infusión de 2-4 g de hojas secas, 3 veces al día.",
+      preparacion: "Infusión, licor, extracto.",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "No recomendado." }, { tipo: "diabetes", descripcion: "Puede alterar los niveles de azúcar en sangre." }],
+      descripcion: "Arbusto aromático originario de México, conocido por sus efectos estimulantes y afrodisíacos, así como por ser un tónico para el sistema nervioso.",
+      sistemasRelacionados: ["sistema-nervioso", "sistema-reproductor", "trastornos-mentales-emocionales"],
+      categoriaId: "arbustos-medicinales",
+      categoria: "Arbustos medicinales",
+    },
+    {
+      id: "equiseto-menor",
+      nombre: "Equiseto menor",
+      nombreCientifico: "Equisetum arvense",
+      propiedades: ["Remineralizante", "Diurético", "Cicatrizante", "Astringente"],
+      parteUsable: "Tallos estériles",
+      dosis: "Infusión de 2-3 g por taza, varias veces al día.",
+      preparacion: "Infusión, decocción, polvo.",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Contiene trazas de un alcaloide, no se recomienda el uso prolongado." }],
+      descripcion: "Planta primitiva sin flores ni frutos, rica en silicio y otros minerales, lo que la convierte en un excelente regenerador de tejidos.",
+      sistemasRelacionados: ["sistema-musculoesqueletico", "sistema-urinario", "enfermedades-piel"],
+      categoriaId: "arbustos-medicinales",
+      categoria: "Arbustos medicinales",
+    },
+    {
+      id: "eucalipto",
+      nombre: "Eucalipto",
+      nombreCientifico: "Eucalyptus globulus",
+      nombresAlternativos: {"España": ["eucalipto blanco", "eucalipto común", "eucalipto azul", "calipes", "calipse", "calipto"], "USA_English": ["southern blue gum", "blue gum", "Tasmanian blue gum"], "UK_English": ["blue gum", "Tasmanian blue gum"]},
+      propiedades: ["Expectorante", "Antiséptico respiratorio", "Descongestionante", "Febrífugo"],
+      parteUsable: "Hojas",
+      dosis: "Inhalaciones de vapor con 2-3 gotas de aceite esencial. Infusión de 1-2 hojas por taza.",
+      preparacion: "Infusión, aceite esencial, ungüento.",
+      contraindicaciones: [{ tipo: "ninos", descripcion: "No administrar aceite esencial a menores de 6 años." }, { tipo: "embarazo", descripcion: "Evitar el aceite esencial." }],
+      descripcion: "Árbol de origen australiano cuyas hojas son un remedio clásico y muy eficaz para todo tipo de afecciones del sistema respiratorio.",
+      sistemasRelacionados: ["sistema-respiratorio"],
+      categoriaId: "arbustos-medicinales",
+      categoria: "Arbustos medicinales",
+    },
+    {
+      id: "gobernadora",
+      nombre: "Gobernadora",
+      nombreCientifico: "Larrea tridentata",
+      propiedades: ["Antimicrobiano", "Antioxidante", "Antiinflamatorio"],
+      parteUsable: "Hojas",
+      dosis: "Uso principalmente externo. Infusión para lavados o compresas.",
+      preparacion: "Infusión, ungüento.",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Potencialmente hepatotóxica en uso interno. No se recomienda." }],
+      descripcion: "Arbusto resinoso del desierto de Sonora, muy resistente. Se usa tradicionalmente para infecciones de la piel, reumatismo y como conservante.",
+      sistemasRelacionados: ["enfermedades-piel", "sistema-musculoesqueletico"],
+      categoriaId: "arbustos-medicinales",
+      categoria: "Arbustos medicinales",
+    },
+    {
+      id: "guayule",
+      nombre: "Guayule",
+      nombreCientifico: "Parthenium argentatum",
+      propiedades: ["Analgésico", "Antiinflamatorio"],
+      parteUsable: "Planta completa",
+      dosis: "Uso tradicional en emplastos sobre zonas doloridas.",
+      preparacion: "Emplasto, decocción para baños.",
+      contraindicaciones: [{ tipo: "alergia", descripcion: "Puede causar dermatitis de contacto." }],
+      descripcion: "Arbusto del desierto de México, conocido por ser una fuente de hule hipoalergénico. Tradicionalmente se usa para aliviar el dolor reumático.",
+      sistemasRelacionados: ["sistema-musculoesqueletico"],
+      categoriaId: "arbustos-medicinales",
+      categoria: "Arbustos medicinales",
+    },
+    {
+      id: "hierba-del-pollo",
+      nombre: "Hierba del Pollo",
+      nombreCientifico: "Commelina pallida",
+      propiedades: ["Antihemorrágica", "Cicatrizante", "Antiséptica"],
+      parteUsable: "Planta fresca",
+      dosis: "Aplicación directa de la planta machacada sobre la herida.",
+      preparacion: "Cataplasma, emplasto.",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Uso exclusivamente externo." }],
+      descripcion: "Planta rastrera que se considera un 'botiquín de primeros auxilios' en el campo, capaz de cortar hemorragias y ayudar a cicatrizar heridas.",
+      sistemasRelacionados: ["enfermedades-piel"],
+      categoriaId: "arbustos-medicinales",
+      categoria: "Arbustos medicinales",
+    },
+    {
+      id: "hoja-santa",
+      nombre: "Hoja Santa",
+      nombreCientifico: "Piper auritum",
+      propiedades: ["Expectorante", "Antiinflamatorio", "Digestivo"],
+      parteUsable: "Hojas",
+      dosis: "Infusión de 1-2 hojas por taza.",
+      preparacion: "Infusión, cataplasma, uso culinario.",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "Contiene safrol, no se recomienda su uso medicinal." }],
+      descripcion: "Planta de grandes hojas con un aroma anisado, muy usada en la cocina del sur de México. Medicinalmente se usa para la tos y la inflamación.",
+      sistemasRelacionados: ["sistema-respiratorio", "sistema-digestivo"],
+      categoriaId: "arbustos-medicinales",
+      categoria: "Arbustos medicinales",
+    },
+    {
+      id: "izote",
+      nombre: "Izote",
+      nombreCientifico: "Yucca filifera",
+      propiedades: ["Antiinflamatorio", "Antirreumático"],
+      parteUsable: "Flor y raíz",
+      dosis: "Decocción de la raíz, 20 g por litro, tomar 2 tazas al día.",
+      preparacion: "Decocción, las flores son comestibles.",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Dosis altas pueden ser irritantes para el estómago." }],
+      descripcion: "Planta arborescente del desierto mexicano, cuyas flores son comestibles y la raíz se utiliza para tratar la artritis y el reumatismo.",
+      sistemasRelacionados: ["sistema-musculoesqueletico"],
+      categoriaId: "arbustos-medicinales",
+      categoria: "Arbustos medicinales",
+    },
+    {
+      id: "jojoba",
+      nombre: "Jojoba",
+      nombreCientifico: "Simmondsia chinensis",
+      propiedades: ["Hidratante", "Emoliente", "Antioxidante"],
+      parteUsable: "Cera líquida de las semillas",
+      dosis: "Uso tópico, aplicar unas gotas sobre la piel o el cabello.",
+      preparacion: "Aceite o cera líquida.",
+      contraindicaciones: [{ tipo: "otro", descripcion: "No ingerir. Es indigestible." }],
+      descripcion: "Arbusto del desierto cuya semilla produce una cera líquida muy similar al sebo humano, lo que la hace excelente para el cuidado de la piel y el cabello.",
+      sistemasRelacionados: ["enfermedades-piel"],
+      categoriaId: "arbustos-medicinales",
+      categoria: "Arbustos medicinales",
+    },
+    {
+      id: "lentisco",
+      nombre: "Lentisco",
+      nombreCientifico: "Pistacia lentiscus",
+      propiedades: ["Astringente", "Antiinflamatorio", "Cicatrizante"],
+      parteUsable: "Resina (almáciga) y hojas",
+      dosis: "Masticar la resina para la salud bucal. Decocción de hojas para uso externo.",
+      preparacion: "Resina (almáciga), aceite, decocción.",
+      contraindicaciones: [{ tipo: "alergia", descripcion: "Posible alergia a la resina." }],
+      descripcion: "Arbusto mediterráneo del que se extrae una resina aromática llamada almáciga, usada desde la antigüedad para la higiene bucal y problemas digestivos.",
+      sistemasRelacionados: ["sistema-digestivo", "enfermedades-piel", "enfermedades-ojos-oidos-nariz-garganta"],
+      categoriaId: "arbustos-medicinales",
+      categoria: "Arbustos medicinales",
+    },
+    {
+      id: "membrillero",
+      nombre: "Membrillero",
+      nombreCientifico: "Cydonia oblonga",
+      propiedades: ["Astringente", "Emoliente", "Antiinflamatorio"],
+      parteUsable: "Frutos y semillas",
+      dosis: "Macerado de semillas (1 cucharadita en agua) para hacer un mucílago.",
+      preparacion: "Carne de membrillo, jalea, macerado de semillas.",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Las semillas crudas contienen pequeñas cantidades de cianuro, no deben masticarse ni triturarse." }],
+      descripcion: "Pequeño árbol o arbusto conocido por sus frutos aromáticos, los membrillos. Las semillas, ricas en mucílago, son excelentes para proteger las mucosas.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-respiratorio"],
+      categoriaId: "arbustos-medicinales",
+      categoria: "Arbustos medicinales",
+    },
+  ],
+};
+
+export default categoria;
@@ -0,0 +1,448 @@
+// Generado automáticamente por scripts/build-catalog.py - no editar a mano
+import type { CategoriaPlanta } from '../../plantas-expandidas';
+
+const categoria: CategoriaPlanta = {
+  id: "bayas-y-frutos-del-bosque-medicinales",
+  nombre: "Bayas y frutos del bosque medicinales",
+  plantas: [
+    {
+      id: "arandano",
+      nombre: "Arándano",
+      nombreCientifico: "Vaccinium myrtillus",
+      nombresAlternativos: {"España": ["arándano", "arandanera", "ráspano", "mirtilo", "anavia", "rasponera", "arandilla", "arandaño", "meruéndano", "raspanera", "raspona", "amabia", "mirtillo", "miruéndano", "uva de bosque", "uva de monte"], "USA_English": ["bilberry", "whortleberry", "huckleberry", "mountain blueberry"], "UK_English": ["bilberry", "blaeberry", "wimberry", "whortleberry", "winberry", "fraughan"]},
+      propiedades: ["Antiinflamatorio", "Antihemorrágico", "Astringente", "Antioxidante", "Venotónico", "Antiséptico"],
+      parteUsable: "Fruto",
+      dosis: "1-2 cucharadas de bayas frescas o secas al día.",
+      preparacion: "Decocción, infusión, consumo directo, zumo, compota o helado.",
+      contraindicaciones: [{ tipo: "otro", descripcion: "No se recomienda en caso de gastritis y úlcera gastroduodenal." }],
+      descripcion: "El arándano es un recurso de herbolario para tratar la debilidad capilar y mejorar el riego sanguíneo. Se indica para aliviar las varices y las hemorroides, pero también para corregir la mala visión nocturna.",
+      sistemasRelacionados: ["sistema-cardiovascular", "enfermedades-ojos-oidos-nariz-garganta", "sistema-urinario"],
+      categoriaId: "bayas-y-frutos-del-bosque-medicinales",
+      categoria: "Bayas y frutos del bosque medicinales",
+    },
+    {
+      id: "mora",
+      nombre: "Mora",
+      nombreCientifico: "Rubus ulmifolius",
+      nombresAlternativos: {"España": ["zarzamora", "zarza", "mora"], "México": ["zarzamora"], "Colombia": ["mora de castilla"], "USA_English": ["blackberry", "bramble", "dewberry"], "UK_English": ["blackberry", "bramble"]},
+      propiedades: ["Hemostática", "Astringente", "Revitalizante", "Vitamínica", "Diurética", "Antioxidante"],
+      parteUsable: "Fruto",
+      dosis: "Un puñado de moras al día.",
+      preparacion: "Consumo directo, zumos, sorbetes, licores y repostería.",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Un exceso de bayas puede resultar indigesto. Esto también puede ocurrir si se toman las moras cuando todavía están verdes." }],
+      descripcion: "Las moras se comportan como astringentes y aportan vitamina C y antioxidantes. Se recomiendan como revitalizantes en situaciones de convalecencia, astenia, fatiga y debilidad.",
+      sistemasRelacionados: ["sistema-inmunologico", "sistema-digestivo"],
+      categoriaId: "bayas-y-frutos-del-bosque-medicinales",
+      categoria: "Bayas y frutos del bosque medicinales",
+    },
+    {
+      id: "frambuesa",
+      nombre: "Frambuesa",
+      nombreCientifico: "Rubus idaeus",
+      nombresAlternativos: {"España": ["frambueso", "sangüeso", "cordonera", "chordón", "sanguesa", "chordonera"], "USA_English": ["raspberry", "red raspberry", "American red raspberry"], "UK_English": ["raspberry", "hindberry"]},
+      propiedades: ["Vitamínica", "Antioxidante", "Diurética", "Aromatizante"],
+      parteUsable: "Fruto",
+      dosis: "Un tazón de frambuesas frescas al día.",
+      preparacion: "Consumo directo, zumos, sorbetes, macedonias o pasteles.",
+      contraindicaciones: [{ tipo: "otro", descripcion: "No tomar en caso de gastritis y úlcera gastroduodenal." }],
+      descripcion: "Las frambuesas contienen vitamina C y antioxidantes naturales, así como azúcares. Ayudan a prevenir las infecciones y aportan vitalidad y resistencia ante esfuerzos físicos.",
+      sistemasRelacionados: ["sistema-inmunologico", "sistema-urinario"],
+      categoriaId: "bayas-y-frutos-del-bosque-medicinales",
+      categoria: "Bayas y frutos del bosque medicinales",
+    },
+    {
+      id: "fresa",
+      nombre: "Fresa",
+      nombreCientifico: "Fragaria x ananassa",
+      nombresAlternativos: {"España": ["fresón", "fresa"], "Argentina": ["frutilla"], "Chile": ["frutilla"], "USA_English": ["strawberry", "garden strawberry", "cultivated strawberry", "dessert strawberry", "pine strawberry"], "UK_English": ["strawberry"]},
+      propiedades: ["Antiinflamatoria", "Antioxidante", "Diurética", "Vitamínica"],
+      parteUsable: "Fruto",
+      dosis: "150-200 gramos al día.",
+      preparacion: "Consumo directo, batidos, postres.",
+      contraindicaciones: [{ tipo: "alergia", descripcion: "Puede causar reacciones alérgicas en personas sensibles." }],
+      descripcion: "Rica en polifenoles, que tienen propiedades antiinflamatorias. Ayuda a controlar el azúcar en sangre.",
+      sistemasRelacionados: ["sistema-cardiovascular", "sistema-inmunologico", "sistema-endocrino"],
+      categoriaId: "bayas-y-frutos-del-bosque-medicinales",
+      categoria: "Bayas y frutos del bosque medicinales",
+    },
+    {
+      id: "grosella-negra",
+      nombre: "Grosella negra",
+      nombreCientifico: "Ribes nigrum",
+      nombresAlternativos: {"España": ["casis", "grosellero negro", "zarzaparrilla negra", "parrilla negra"], "USA_English": ["blackcurrant", "european black currant"], "UK_English": ["blackcurrant"]},
+      propiedades: ["Antiinflamatoria", "Antioxidante", "Diurética", "Vitamínica"],
+      parteUsable: "Fruto",
+      dosis: "Un puñado al día.",
+      preparacion: "Consumo directo, zumos, jaleas.",
+      contraindicaciones: [],
+      descripcion: "Conocida por mejorar la función renal, la salud ocular y la inmunidad. Alta en antocianinas.",
+      sistemasRelacionados: ["sistema-urinario", "enfermedades-ojos-oidos-nariz-garganta", "sistema-inmunologico"],
+      categoriaId: "bayas-y-frutos-del-bosque-medicinales",
+      categoria: "Bayas y frutos del bosque medicinales",
+    },
+    {
+      id: "sauco",
+      nombre: "Saúco",
+      nombreCientifico: "Sambucus nigra",
+      nombresAlternativos: {"España": ["saúco", "sabuco", "sauqueiro", "canillero", "sabugo", "bieiteiro", "sabugueiro"], "México": ["saúco", "tapiro", "flor de sauz", "capulin silvestre"], "USA_English": ["elderberry", "European elder", "black elder", "American elderberry", "blue elderberry", "Arizona elderberry", "desert elderberry", "New Mexican elderberry", "Mexican elderberry"], "UK_English": ["elder", "elderberry", "black elder", "European elder"], "Indigena": ["shiksh (O'odham)", "bixihumi (Nahuatl)"]},
+      propiedades: ["Antiviral", "Antiinflamatorio", "Inmunoestimulante", "Diaforético"],
+      parteUsable: "Bayas maduras y cocidas",
+      dosis: "1-2 cucharadas de jarabe al día.",
+      preparacion: "Jarabe, infusión (de flores), mermelada.",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Las bayas crudas son tóxicas." }],
+      descripcion: "Ampliamente utilizado para estimular el sistema inmunológico y tratar los síntomas del resfriado y la gripe.",
+      sistemasRelacionados: ["sistema-inmunologico", "sistema-respiratorio"],
+      categoriaId: "bayas-y-frutos-del-bosque-medicinales",
+      categoria: "Bayas y frutos del bosque medicinales",
+    },
+    {
+      id: "endrino",
+      nombre: "Endrino",
+      nombreCientifico: "Prunus spinosa",
+      nombresAlternativos: {"España": ["endrino", "espino", "endrina", "andrino", "espino negro", "arán", "arañonera", "ablunos", "abranal", "abreculos", "abrueño", "abrunal", "arañón", "arañón negro"], "USA_English": ["blackthorn", "sloe", "blackthorn plum", "sloe cherry"], "UK_English": ["blackthorn", "sloe"], "Indigena": ["patxarán (euskera)"]},
+      propiedades: ["Astringente", "Antidiarreico", "Antioxidante", "Cicatrizante"],
+      parteUsable: "Fruto",
+      dosis: "1 cucharada de frutos en decocción por taza.",
+      preparacion: "Decocción, jarabe, licor (pacharán).",
+      contraindicaciones: [{ tipo: "otro", descripcion: "La semilla puede ser tóxica en grandes dosis." }],
+      descripcion: "Se utiliza tradicionalmente para combatir diarreas y hemorragias leves. Estimula la salivación.",
+      sistemasRelacionados: ["sistema-digestivo"],
+      categoriaId: "bayas-y-frutos-del-bosque-medicinales",
+      categoria: "Bayas y frutos del bosque medicinales",
+    },
+    {
+      id: "madrono",
+      nombre: "Madroño",
+      nombreCientifico: "Arbutus unedo",
+      nombresAlternativos: {"España": ["madroño", "albornio", "madroña", "madroñera", "alborecera", "borrachín"], "USA_English": ["strawberry tree", "madrone", "Killarney strawberry tree", "strawberry madrone"], "UK_English": ["strawberry tree"]},
+      propiedades: ["Astringente", "Antiséptico urinario", "Antiinflamatorio"],
+      parteUsable: "Fruto",
+      dosis: "Consumo moderado de frutos maduros.",
+      preparacion: "Consumo directo, mermeladas, licores.",
+      contraindicaciones: [{ tipo: "otro", descripcion: "El consumo excesivo de frutos puede provocar embriaguez y dolor de cabeza." }],
+      descripcion: "Los frutos del madroño tienen propiedades astringentes y se utilizan para tratar infecciones urinarias.",
+      sistemasRelacionados: ["sistema-urinario", "sistema-digestivo"],
+      categoriaId: "bayas-y-frutos-del-bosque-medicinales",
+      categoria: "Bayas y frutos del bosque medicinales",
+    },
+    {
+      id: "cornejo",
+      nombre: "Cornejo",
+      nombreCientifico: "Cornus mas",
+      nombresAlternativos: {"España": ["cornejo macho", "cornejo de Cornelia"], "USA_English": ["Cornelian cherry", "Cornelian cherry dogwood", "European cornel"], "UK_English": ["Cornelian cherry"]},
+      propiedades: ["Astringente", "Antipirético", "Tónico"],
+      parteUsable: "Fruto",
+      dosis: "Consumo moderado.",
+      preparacion: "Consumo directo, mermeladas, jarabes.",
+      contraindicaciones: [],
+      descripcion: "Frutos ricos en vitamina C, utilizados tradicionalmente como tónico y para bajar la fiebre.",
+      sistemasRelacionados: ["sistema-inmunologico", "sistema-digestivo"],
+      categoriaId: "bayas-y-frutos-del-bosque-medicinales",
+      categoria: "Bayas y frutos del bosque medicinales",
+    },
+    {
+      id: "espino-amarillo",
+      nombre: "Espino amarillo",
+      nombreCientifico: "Hippophae rhamnoides",
+      nombresAlternativos: {"España": ["espino amarillo", "espino falso", "arto blanco", "cambrón"], "USA_English": ["sea buckthorn", "sandthorn", "sallowthorn", "seaberry"], "UK_English": ["sea buckthorn", "sandthorn", "sallowthorn"], "Indigena": ["elorri (euskera)"]},
+      propiedades: ["Vitamínico", "Antioxidante", "Cicatrizante", "Inmunoestimulante"],
+      parteUsable: "Fruto",
+      dosis: "1-2 cucharaditas de aceite o un puñado de bayas.",
+      preparacion: "Aceite, zumo, mermelada.",
+      contraindicaciones: [],
+      descripcion: "Excepcionalmente rico en vitamina C y otros antioxidantes. Promueve la salud de la piel y las mucosas.",
+      sistemasRelacionados: ["enfermedades-piel", "sistema-inmunologico", "sistema-digestivo"],
+      categoriaId: "bayas-y-frutos-del-bosque-medicinales",
+      categoria: "Bayas y frutos del bosque medicinales",
+    },
+    {
+      id: "arandano-rojo",
+      nombre: "Arándano rojo",
+      nombreCientifico: "Vaccinium macrocarpon",
+      nombresAlternativos: {"España": ["arándano encarnado", "arándano de fruto encarnado", "mirtilo rojo"], "USA_English": ["lingonberry", "cowberry", "mountain cranberry", "northern mountain cranberry", "foxberry", "partridgeberry"], "UK_English": ["cowberry", "lingonberry", "red whortleberry", "whimberry"]},
+      propiedades: ["Antiséptico urinario", "Antioxidante", "Antiinflamatorio", "Probiótico"],
+      parteUsable: "Fruto",
+      dosis: "300-500 mg de extracto o 1 vaso de zumo puro al día.",
+      preparacion: "Zumo, extracto, consumo directo (deshidratado).",
+      contraindicaciones: [{ tipo: "medicamentos", descripcion: "Consultar con el médico si se están tomando fármacos anticoagulantes como la warfarina." }],
+      descripcion: "Especialmente conocido por su capacidad para prevenir y tratar infecciones del tracto urinario, como la cistitis.",
+      sistemasRelacionados: ["sistema-urinario", "sistema-inmunologico"],
+      categoriaId: "bayas-y-frutos-del-bosque-medicinales",
+      categoria: "Bayas y frutos del bosque medicinales",
+    },
+    {
+      id: "baya-de-goji",
+      nombre: "Baya de Goji",
+      nombreCientifico: "Lycium barbarum",
+      propiedades: ["Antioxidante", "Inmunoestimulante", "Hepatoprotector", "Adaptógeno"],
+      parteUsable: "Fruto",
+      dosis: "10-30 gramos de bayas secas al día.",
+      preparacion: "Consumo directo (secas), infusiones, añadido a comidas.",
+      contraindicaciones: [{ tipo: "medicamentos", descripcion: "Puede interactuar con anticoagulantes y medicamentos para la diabetes." }],
+      descripcion: "Utilizadas en la medicina tradicional china para proteger el hígado, mejorar la vista y fortalecer el sistema inmune.",
+      sistemasRelacionados: ["sistema-inmunologico", "enfermedades-ojos-oidos-nariz-garganta", "sistema-digestivo"],
+      categoriaId: "bayas-y-frutos-del-bosque-medicinales",
+      categoria: "Bayas y frutos del bosque medicinales",
+    },
+    {
+      id: "escaramujo",
+      nombre: "Escaramujo",
+      nombreCientifico: "Rosa canina",
+      nombresAlternativos: {"España": ["rosal silvestre", "agavanzo", "escarambrojo", "escaramojo", "zarza rosa", "agabanzo", "alcallaro", "alcaracache", "algabala", "algabanzo", "calambrojo", "gabancera", "tapaculos", "picaespalda", "rosal bravío", "rosal común"], "USA_English": ["dog rose", "briar rose"], "UK_English": ["dog rose", "dog berry", "witches' briar"]},
+      propiedades: ["Vitamínico", "Astringente", "Antidiarreico", "Diurético", "Venotónico"],
+      parteUsable: "Fruto",
+      dosis: "1-2 tazas de infusión al día.",
+      preparacion: "Infusión, decocción, jarabe, mermelada.",
+      contraindicaciones: [],
+      descripcion: "Extremadamente rico en vitamina C, se usa para combatir la astenia, procesos infecciosos y para tratar diarreas.",
+      sistemasRelacionados: ["sistema-inmunologico", "sistema-digestivo", "sistema-cardiovascular"],
+      categoriaId: "bayas-y-frutos-del-bosque-medicinales",
+      categoria: "Bayas y frutos del bosque medicinales",
+    },
+    {
+      id: "grosella-roja",
+      nombre: "Grosella roja",
+      nombreCientifico: "Ribes rubrum",
+      nombresAlternativos: {"España": ["grosella roja", "grosellero rojo", "uva de señora", "grosularia", "cambronera colorada de Jarava", "cascalleja", "pinsús", "ribes", "rimas", "rivas", "uva de Fran"], "USA_English": ["red currant", "garden red currant"], "UK_English": ["redcurrant"]},
+      propiedades: ["Antioxidante", "Antiinflamatoria", "Aperitiva", "Diurética"],
+      parteUsable: "Fruto",
+      dosis: "Un puñado al día.",
+      preparacion: "Consumo directo, zumos, jaleas.",
+      contraindicaciones: [],
+      descripcion: "Estimula el apetito y tiene un efecto diurético suave. Rica en vitamina C y antioxidantes.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-urinario"],
+      categoriaId: "bayas-y-frutos-del-bosque-medicinales",
+      categoria: "Bayas y frutos del bosque medicinales",
+    },
+    {
+      id: "baya-de-acai",
+      nombre: "Baya de Açaí",
+      nombreCientifico: "Euterpe oleracea",
+      propiedades: ["Antioxidante", "Energizante", "Antiinflamatoria"],
+      parteUsable: "Fruto",
+      dosis: "1-2 cucharadas de pulpa o polvo al día.",
+      preparacion: "Batidos, boles (açaí bowls), zumos.",
+      contraindicaciones: [],
+      descripcion: "Considerada un superalimento por su alta concentración de antioxidantes, que combaten el estrés oxidativo.",
+      sistemasRelacionados: ["sistema-inmunologico", "sistema-cardiovascular", "trastornos-mentales-emocionales"],
+      categoriaId: "bayas-y-frutos-del-bosque-medicinales",
+      categoria: "Bayas y frutos del bosque medicinales",
+    },
+    {
+      id: "uva-ursi",
+      nombre: "Uva de oso",
+      nombreCientifico: "Arctostaphylos uva-ursi",
+      propiedades: ["Antiséptico urinario", "Astringente", "Diurético"],
+      parteUsable: "Hojas y bayas",
+      dosis: "Infusión de hojas, 1-2 tazas al día (no más de una semana).",
+      preparacion: "Infusión (hojas), decocción (bayas).",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "No usar durante el embarazo o lactancia." }, { tipo: "ninos", descripcion: "No recomendado para niños." }],
+      descripcion: "Principalmente usada por sus hojas para tratar infecciones del tracto urinario. Las bayas son comestibles pero insípidas.",
+      sistemasRelacionados: ["sistema-urinario"],
+      categoriaId: "bayas-y-frutos-del-bosque-medicinales",
+      categoria: "Bayas y frutos del bosque medicinales",
+    },
+    {
+      id: "zarzamora",
+      nombre: "Zarzamora",
+      nombreCientifico: "Rubus fruticosus",
+      propiedades: ["Astringente", "Antioxidante", "Antiinflamatoria", "Vitamínica"],
+      parteUsable: "Fruto y hojas",
+      dosis: "Un puñado de frutos o 1-2 tazas de infusión de hojas.",
+      preparacion: "Consumo directo, mermeladas, infusión de hojas.",
+      contraindicaciones: [],
+      descripcion: "Similar a la mora, pero el término se usa a menudo para variedades silvestres. Rica en antioxidantes y vitaminas.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-inmunologico"],
+      categoriaId: "bayas-y-frutos-del-bosque-medicinales",
+      categoria: "Bayas y frutos del bosque medicinales",
+    },
+    {
+      id: "baya-de-maqui",
+      nombre: "Baya de Maqui",
+      nombreCientifico: "Aristotelia chilensis",
+      propiedades: ["Antioxidante", "Antiinflamatoria", "Regulador de glucosa"],
+      parteUsable: "Fruto",
+      dosis: "1-2 cucharaditas de polvo al día.",
+      preparacion: "Polvo para batidos, zumos, postres.",
+      contraindicaciones: [],
+      descripcion: "Originaria de la Patagonia, es una de las bayas con mayor poder antioxidante. Ayuda a regular el azúcar en sangre.",
+      sistemasRelacionados: ["sistema-endocrino", "sistema-inmunologico", "sistema-cardiovascular"],
+      categoriaId: "bayas-y-frutos-del-bosque-medicinales",
+      categoria: "Bayas y frutos del bosque medicinales",
+    },
+    {
+      id: "baya-del-espino",
+      nombre: "Baya del Espino",
+      nombreCientifico: "Crataegus monogyna",
+      propiedades: ["Cardiotónica", "Hipotensora", "Sedante", "Antioxidante"],
+      parteUsable: "Bayas, flores y hojas",
+      dosis: "1-2 tazas de infusión al día.",
+      preparacion: "Infusión, tintura, extracto.",
+      contraindicaciones: [{ tipo: "medicamentos", descripcion: "Puede potenciar el efecto de medicamentos para el corazón y la hipertensión." }],
+      descripcion: "Considerada la planta del corazón. Ayuda a regular el ritmo cardíaco, la tensión arterial y tiene un efecto calmante.",
+      sistemasRelacionados: ["sistema-cardiovascular", "sistema-nervioso"],
+      categoriaId: "bayas-y-frutos-del-bosque-medicinales",
+      categoria: "Bayas y frutos del bosque medicinales",
+    },
+    {
+      id: "serbal-de-cazadores",
+      nombre: "Serbal de los cazadores",
+      nombreCientifico: "Sorbus aucuparia",
+      propiedades: ["Astringente", "Diurética", "Vitamínica (Vitamina C)"],
+      parteUsable: "Fruto (cocido)",
+      dosis: "Consumo moderado en mermeladas o jaleas.",
+      preparacion: "Mermelada, jalea, licor. Deben cocinarse para eliminar el ácido parasórbico.",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Los frutos crudos son tóxicos y pueden causar problemas digestivos." }],
+      descripcion: "Los frutos son ricos en vitamina C y se usan tradicionalmente para hacer mermeladas con propiedades astringentes.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-urinario"],
+      categoriaId: "bayas-y-frutos-del-bosque-medicinales",
+      categoria: "Bayas y frutos del bosque medicinales",
+    },
+    {
+      id: "casis",
+      nombre: "Casis",
+      nombreCientifico: "Ribes nigrum",
+      propiedades: ["Antiinflamatorio", "Antialérgico", "Diurético", "Vitamínico"],
+      parteUsable: "Fruto y hojas",
+      dosis: "Un puñado de frutos o 1-2 tazas de infusión de hojas.",
+      preparacion: "Consumo directo, zumo, jarabe, infusión de hojas.",
+      contraindicaciones: [],
+      descripcion: "También conocido como grosellero negro, es famoso por sus propiedades antiinflamatorias, similares a la cortisona.",
+      sistemasRelacionados: ["sistema-inmunologico", "sistema-respiratorio", "sistema-musculoesqueletico"],
+      categoriaId: "bayas-y-frutos-del-bosque-medicinales",
+      categoria: "Bayas y frutos del bosque medicinales",
+    },
+    {
+      id: "uva-de-california",
+      nombre: "Uva de California",
+      nombreCientifico: "Mahonia aquifolium",
+      propiedades: ["Hepatoprotectora", "Antimicrobiana", "Antiinflamatoria (piel)"],
+      parteUsable: "Raíz y bayas",
+      dosis: "Uso tópico de la raíz; consumo moderado de bayas.",
+      preparacion: "Decocción de raíz (uso externo), mermelada de bayas.",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "No usar la raíz durante el embarazo." }],
+      descripcion: "La raíz se usa para problemas de piel como la psoriasis. Las bayas son ácidas pero comestibles y ricas en vitamina C.",
+      sistemasRelacionados: ["enfermedades-piel", "sistema-digestivo"],
+      categoriaId: "bayas-y-frutos-del-bosque-medicinales",
+      categoria: "Bayas y frutos del bosque medicinales",
+    },
+    {
+      id: "baya-de-agracejo",
+      nombre: "Baya de Agracejo",
+      nombreCientifico: "Berberis vulgaris",
+      propiedades: ["Hepatoprotectora", "Hipoglucemiante", "Antimicrobiana"],
+      parteUsable: "Bayas y corteza de la raíz",
+      dosis: "Consumo moderado de bayas; la corteza bajo supervisión.",
+      preparacion: "Mermelada o zumo de bayas; decocción de la corteza.",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "No usar la corteza durante el embarazo." }],
+      descripcion: "Las bayas son ricas en vitamina C. La corteza contiene berberina, usada para problemas hepáticos y digestivos.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-endocrino"],
+      categoriaId: "bayas-y-frutos-del-bosque-medicinales",
+      categoria: "Bayas y frutos del bosque medicinales",
+    },
+    {
+      id: "murtilla",
+      nombre: "Murtilla",
+      nombreCientifico: "Ugni molinae",
+      propiedades: ["Antioxidante", "Antiinflamatoria", "Astringente"],
+      parteUsable: "Fruto",
+      dosis: "Consumo libre.",
+      preparacion: "Consumo directo, mermeladas, postres.",
+      contraindicaciones: [],
+      descripcion: "Fruto nativo del sur de Chile, con un aroma y sabor intensos. Muy rico en antioxidantes y con propiedades antiinflamatorias.",
+      sistemasRelacionados: ["sistema-inmunologico", "sistema-digestivo"],
+      categoriaId: "bayas-y-frutos-del-bosque-medicinales",
+      categoria: "Bayas y frutos del bosque medicinales",
+    },
+    {
+      id: "calafate",
+      nombre: "Calafate",
+      nombreCientifico: "Berberis microphylla",
+      propiedades: ["Antioxidante", "Antimicrobiana", "Astringente"],
+      parteUsable: "Fruto",
+      dosis: "Consumo libre.",
+      preparacion: "Consumo directo, mermeladas, jarabes.",
+      contraindicaciones: [],
+      descripcion: "Baya de la Patagonia, similar al agracejo. Es un potente antioxidante y forma parte de la cultura local.",
+      sistemasRelacionados: ["sistema-inmunologico", "sistema-digestivo"],
+      categoriaId: "bayas-y-frutos-del-bosque-medicinales",
+      categoria: "Bayas y frutos del bosque medicinales",
+    },
+    {
+      id: "boysenberry",
+      nombre: "Boysenberry",
+      nombreCientifico: "Rubus ursinus × idaeus",
+      nombresAlternativos: {"España": ["boysenberi", "zarza boysen", "boysena", "zarza de Boysen"], "USA_English": ["boysenberry"], "UK_English": ["boysenberry"]},
+      propiedades: ["Antioxidante", "Vitamínica", "Fibra"],
+      parteUsable: "Fruto",
+      dosis: "Un puñado al día.",
+      preparacion: "Consumo directo, mermeladas, tartas.",
+      contraindicaciones: [],
+      descripcion: "Híbrido entre frambuesa, mora y loganberry. Rico en fibra, vitaminas y antioxidantes.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-inmunologico"],
+      categoriaId: "bayas-y-frutos-del-bosque-medicinales",
+      categoria: "Bayas y frutos del bosque medicinales",
+    },
+    {
+      id: "loganberry",
+      nombre: "Loganberry",
+      nombreCientifico: "Rubus × loganobaccus",
+      nombresAlternativos: {"España": ["loganas", "loganberris", "zarza logan", "mora logan", "zarza de logan", "zarza-frambuesa"], "USA_English": ["loganberry"], "UK_English": ["loganberry"]},
+      propiedades: ["Vitamínica (C y K)", "Manganeso", "Fibra"],
+      parteUsable: "Fruto",
+      dosis: "Un puñado al día.",
+      preparacion: "Consumo directo, zumos, mermeladas.",
+      contraindicaciones: [],
+      descripcion: "Híbrido entre la mora de California y la frambuesa. Aporta vitaminas y minerales esenciales.",
+      sistemasRelacionados: ["sistema-inmunologico", "sistema-digestivo", "sistema-musculoesqueletico"],
+      categoriaId: "bayas-y-frutos-del-bosque-medicinales",
+      categoria: "Bayas y frutos del bosque medicinales",
+    },
+    {
+      id: "tayberry",
+      nombre: "Tayberry",
+      nombreCientifico: "Rubus fruticosus x R. idaeus",
+      nombresAlternativos: {"USA_English": ["tayberry"], "UK_English": ["tayberry"]},
+      propiedades: ["Antioxidante", "Vitamina C", "Fibra"],
+      parteUsable: "Fruto",
+      dosis: "Un puñado al día.",
+      preparacion: "Consumo directo, postres, mermeladas.",
+      contraindicaciones: [],
+      descripcion: "Híbrido entre una mora y una frambuesa, originario de Escocia. Más grande y dulce que la loganberry.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-inmunologico"],
+      categoriaId: "bayas-y-frutos-del-bosque-medicinales",
+      categoria: "Bayas y frutos del bosque medicinales",
+    },
+    {
+      id: "lingonberry",
+      nombre: "Lingonberry",
+      nombreCientifico: "Vaccinium vitis-idaea",
+      nombresAlternativos: {"España": ["arándano rojo", "arándano encarnado", "mirtilo rojo"], "USA_English": ["lingonberry", "cowberry", "mountain cranberry", "northern mountain cranberry", "foxberry", "partridgeberry"], "UK_English": ["cowberry", "lingonberry", "red whortleberry", "whimberry"]},
+      propiedades: ["Antioxidante", "Antiinflamatoria", "Manganeso"],
+      parteUsable: "Fruto",
+      dosis: "Consumo moderado.",
+      preparacion: "Salsas, mermeladas, zumos.",
+      contraindicaciones: [],
+      descripcion: "Popular en Escandinavia, similar al arándano rojo. Ayuda a la salud intestinal, ocular y cardíaca.",
+      sistemasRelacionados: ["sistema-digestivo", "enfermedades-ojos-oidos-nariz-garganta", "sistema-cardiovascular"],
+      categoriaId: "bayas-y-frutos-del-bosque-medicinales",
+      categoria: "Bayas y frutos del bosque medicinales",
+    },
+    {
+      id: "huckleberry",
+      nombre: "Huckleberry",
+      nombreCientifico: "Vaccinium parvifolium",
+      propiedades: ["Antioxidante", "Vitamínica (A, B, C)", "Hierro"],
+      parteUsable: "Fruto",
+      dosis: "Un puñado al día.",
+      preparacion: "Consumo directo, mermeladas, postres.",
+      contraindicaciones: [],
+      descripcion: "Similar al arándano pero con menos azúcar. Ayuda a reducir el colesterol y protege contra enfermedades cardíacas.",
+      sistemasRelacionados: ["sistema-cardiovascular", "sistema-inmunologico"],
+      categoriaId: "bayas-y-frutos-del-bosque-medicinales",
+      categoria: "Bayas y frutos del bosque medicinales",
+    },
+  ],
+};
+
+export default categoria;
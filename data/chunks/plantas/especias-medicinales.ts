@@ -0,0 +1,683 @@
+// Generado automáticamente por scripts/build-catalog.py - no editar a mano
+import type { CategoriaPlanta } from '../../plantas-expandidas';
+
+const categoria: CategoriaPlanta = {
+  id: "especias-medicinales",
+  nombre: "Especias medicinales",
+  plantas: [
+    {
+      id: "canela",
+      nombre: "Canela",
+      nombreCientifico: "Cinnamomum verum",
+      nombresAlternativos: {"España": ["Canela de Ceilán", "Canelero"], "USA_English": ["Ceylon cinnamon", "True cinnamon"], "UK_English": ["Ceylon cinnamon", "True cinnamon"]},
+      propiedades: ["Antioxidante", "Antiinflamatoria", "Reguladora del azúcar en sangre"],
+      parteUsable: "Corteza",
+      dosis: "1-4 gramos al día",
+      preparacion: "Infusión, polvo",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "Puede ser uterotónico." }, { tipo: "medicamentos", descripcion: "Puede interactuar con medicamentos para la diabetes." }],
+      descripcion: "La canela es una especia aromática con propiedades medicinales conocidas desde la antigüedad.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-cardiovascular", "sistema-endocrino"],
+      categoriaId: "especias-medicinales",
+      categoria: "Especias medicinales",
+    },
+    {
+      id: "clavo",
+      nombre: "Clavo de olor",
+      nombreCientifico: "Syzygium aromaticum",
+      nombresAlternativos: {"España": ["Clavo de olor", "Clavero"], "USA_English": ["Clove"], "UK_English": ["Clove"]},
+      propiedades: ["Analgésico", "Antiséptico", "Carminativo"],
+      parteUsable: "Botones florales secos",
+      dosis: "1-3 clavos al día",
+      preparacion: "Infusión, aceite esencial",
+      contraindicaciones: [{ tipo: "ninos", descripcion: "No recomendado en grandes cantidades." }, { tipo: "alergia", descripcion: "Puede causar reacciones alérgicas en personas sensibles." }],
+      descripcion: "El clavo de olor es conocido por su intenso aroma y sus propiedades analgésicas, especialmente para el dolor de muelas.",
+      sistemasRelacionados: ["sistema-digestivo", "enfermedades-ojos-oidos-nariz-garganta"],
+      categoriaId: "especias-medicinales",
+      categoria: "Especias medicinales",
+    },
+    {
+      id: "pimienta-negra",
+      nombre: "Pimienta negra",
+      nombreCientifico: "Piper nigrum",
+      nombresAlternativos: {"España": ["Pimienta"], "USA_English": ["Black pepper"], "UK_English": ["Black pepper"]},
+      propiedades: ["Digestiva", "Antioxidante", "Potenciador de la absorción de nutrientes"],
+      parteUsable: "Fruto",
+      dosis: "Una pizca en las comidas",
+      preparacion: "Consumo directo",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Puede irritar la mucosa gástrica en grandes cantidades." }],
+      descripcion: "La pimienta negra no solo añade sabor a los alimentos, sino que también mejora la digestión y la absorción de nutrientes.",
+      sistemasRelacionados: ["sistema-digestivo"],
+      categoriaId: "especias-medicinales",
+      categoria: "Especias medicinales",
+    },
+    {
+      id: "cardamomo",
+      nombre: "Cardamomo",
+      nombreCientifico: "Elettaria cardamomum",
+      nombresAlternativos: {"España": ["Cardamomo verde", "Cardamomo verdadero"], "USA_English": ["Green cardamom", "True cardamom"], "UK_English": ["Green cardamom", "True cardamom"]},
+      propiedades: ["Carminativo", "Antiespasmódico", "Expectorante"],
+      parteUsable: "Semillas",
+      dosis: "1-2 vainas al día",
+      preparacion: "Infusión, masticado",
+      contraindicaciones: [{ tipo: "otro", descripcion: "No se conocen contraindicaciones importantes en dosis culinarias." }],
+      descripcion: "El cardamomo es una especia exótica que ayuda a aliviar problemas digestivos y respiratorios.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-respiratorio"],
+      categoriaId: "especias-medicinales",
+      categoria: "Especias medicinales",
+    },
+    {
+      id: "nuez-moscada",
+      nombre: "Nuez moscada",
+      nombreCientifico: "Myristica fragrans",
+      nombresAlternativos: {"España": ["Mirística"], "USA_English": ["Nutmeg"], "UK_English": ["Nutmeg"]},
+      propiedades: ["Carminativo", "Estimulante cerebral", "Sedante suave"],
+      parteUsable: "Semilla",
+      dosis: "Una pizca, no exceder 1-2 gramos al día",
+      preparacion: "Polvo",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "Puede ser tóxica en grandes cantidades." }, { tipo: "ninos", descripcion: "No recomendado en grandes cantidades." }],
+      descripcion: "La nuez moscada se utiliza con moderación para problemas digestivos y como estimulante cerebral.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-nervioso"],
+      categoriaId: "especias-medicinales",
+      categoria: "Especias medicinales",
+    },
+    {
+      id: "azafran",
+      nombre: "Azafrán",
+      nombreCientifico: "Crocus sativus",
+      nombresAlternativos: {"España": ["Croco"], "USA_English": ["Saffron", "Autumn Crocus"], "UK_English": ["Saffron", "Autumn Crocus"]},
+      propiedades: ["Antidepresivo", "Antioxidante", "Afrodisíaco"],
+      parteUsable: "Estigmas de la flor",
+      dosis: "30 mg al día",
+      preparacion: "Infusión, extracto",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "Puede ser abortivo en dosis altas." }],
+      descripcion: "El azafrán es la especia más cara del mundo y se ha utilizado tradicionalmente para mejorar el estado de ánimo.",
+      sistemasRelacionados: ["sistema-nervioso", "trastornos-mentales-emocionales"],
+      categoriaId: "especias-medicinales",
+      categoria: "Especias medicinales",
+    },
+    {
+      id: "fenogreco",
+      nombre: "Fenogreco",
+      nombreCientifico: "Trigonella foenum-graecum",
+      nombresAlternativos: {"España": ["alholva", "alforva", "albolba", "alvolva", "heno griego", "albolga"], "USA_English": ["fenugreek", "bird's foot", "goat's horn", "greek clover", "greek hay", "greek hayseed", "sicklefruit fenugreek"], "UK_English": ["fenugreek", "bird's foot", "goat's horn", "greek clover", "greek hay", "greek hayseed", "sicklefruit fenugreek"], "Otros": ["hilba", "helba", "k'u-tou", "methi"]},
+      propiedades: ["Galactagogo", "Hipoglucemiante", "Antiinflamatorio"],
+      parteUsable: "Semillas",
+      dosis: "1-5 gramos de semillas al día",
+      preparacion: "Infusión, polvo",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "Puede inducir contracciones uterinas." }, { tipo: "diabetes", descripcion: "Puede potenciar el efecto de medicamentos para la diabetes." }],
+      descripcion: "El fenogreco es conocido por aumentar la producción de leche materna y ayudar a regular el azúcar en sangre.",
+      sistemasRelacionados: ["sistema-endocrino", "sistema-reproductor"],
+      categoriaId: "especias-medicinales",
+      categoria: "Especias medicinales",
+    },
+    {
+      id: "mostaza",
+      nombre: "Mostaza",
+      nombreCientifico: "Brassica nigra",
+      nombresAlternativos: {"España": ["mostaza negra", "ajenabe", "agenabe", "agenabo", "agenave", "ajenabo", "ajo amarillo", "alezna", "amarillas", "desajo", "floridos", "gebena", "géniva", "hierba meona", "jebena", "mostaza", "mostaza negra", "xebana"], "Mexico": ["mostaza negra"], "USA_English": ["black mustard", "brown mustard", "red mustard", "true mustard"], "UK_English": ["black mustard", "charlock"]},
+      propiedades: ["Rubefaciente", "Expectorante", "Estimulante circulatorio"],
+      parteUsable: "Semillas",
+      dosis: "Uso externo en cataplasmas",
+      preparacion: "Cataplasma, aceite",
+      contraindicaciones: [{ tipo: "ninos", descripcion: "Puede irritar la piel sensible." }, { tipo: "alergia", descripcion: "Puede causar reacciones alérgicas." }],
+      descripcion: "Las semillas de mostaza se utilizan externamente para aliviar dolores musculares y congestión.",
+      sistemasRelacionados: ["sistema-musculoesqueletico", "sistema-respiratorio"],
+      categoriaId: "especias-medicinales",
+      categoria: "Especias medicinales",
+    },
+    {
+      id: "pimenton",
+      nombre: "Pimentón",
+      nombreCientifico: "Capsicum annuum",
+      nombresAlternativos: {"España": ["pimiento morrón", "pimiento dulce", "pimentón", "pimiento de Padrón", "pimiento de Herbón", "Doux d' Espagne"], "Mexico": ["chile morrón", "chiltepín"], "Argentina": ["ají morrón", "ají dulce", "locote"], "Colombia": ["ají morrón", "ají dulce"], "Peru": ["ají morrón", "ají dulce"], "Chile": ["ají morrón", "ají dulce"], "Centroamerica": ["ají dulce"], "Caribe": ["ají dulce"], "USA_English": ["sweet pepper", "bell pepper", "green pepper", "red pepper", "chili pepper", "ornamental pepper", "cayenne pepper", "Christmas pepper", "pimiento", "paprika", "ancho", "jalapeño", "pepperoncini", "serrano"], "UK_English": ["sweet pepper", "bell pepper", "chilli pepper"]},
+      propiedades: ["Antioxidante", "Estimulante circulatorio", "Analgésico suave"],
+      parteUsable: "Fruto seco y molido",
+      dosis: "Consumo culinario",
+      preparacion: "Polvo",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Puede causar irritación gástrica en personas sensibles." }],
+      descripcion: "El pimentón, derivado de los pimientos rojos, es rico en antioxidantes y puede mejorar la circulación.",
+      sistemasRelacionados: ["sistema-cardiovascular", "enfermedades-piel"],
+      categoriaId: "especias-medicinales",
+      categoria: "Especias medicinales",
+    },
+    {
+      id: "vainilla",
+      nombre: "Vainilla",
+      nombreCientifico: "Vanilla planifolia",
+      nombresAlternativos: {"España": ["vainilla"], "Mexico": ["vainilla", "bejuquillo", "cuyanquillo", "flor negra", "segnexanté", "vainilla de Papantla", "vainilla mansa", "vainillero", "vainillero de flores aromáticas"], "Centroamerica": ["vainilla"], "Caribe": ["West Indian vanilla"], "USA_English": ["vanilla", "flat-leaved vanilla", "commercial vanilla"], "UK_English": ["vanilla", "flat-leaved vanilla"], "Indigena": ["sisbik-k'aax", "tlilxóchitl", "cashisha"]},
+      propiedades: ["Aromatizante", "Relajante", "Antioxidante"],
+      parteUsable: "Vaina",
+      dosis: "Uso culinario",
+      preparacion: "Extracto, infusión",
+      contraindicaciones: [{ tipo: "otro", descripcion: "No se conocen contraindicaciones importantes." }],
+      descripcion: "La vainilla es apreciada por su aroma y sabor, y tiene un efecto calmante sobre el sistema nervioso.",
+      sistemasRelacionados: ["sistema-nervioso"],
+      categoriaId: "especias-medicinales",
+      categoria: "Especias medicinales",
+    },
+    {
+      id: "jengibre",
+      nombre: "Jengibre",
+      nombreCientifico: "Zingiber officinale",
+      nombresAlternativos: {"Perú": ["kion"], "Filipinas": ["luya"], "Colombia": ["ajengible", "ajengibre", "ajingible", "anjengibre"], "USA_English": ["common ginger", "ginger"], "UK_English": ["ginger"], "India": ["adrak"], "China": ["sheng jiang"], "Japón": ["shoga"]},
+      propiedades: ["Antiinflamatorio", "Antiemético", "Digestivo"],
+      parteUsable: "Rizoma",
+      dosis: "1-3 gramos al día",
+      preparacion: "Infusión, decocción, polvo",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "Consultar al médico para el uso en el embarazo." }, { tipo: "medicamentos", descripcion: "Puede interactuar con anticoagulantes." }],
+      descripcion: "El jengibre es ampliamente utilizado para aliviar náuseas, problemas digestivos y dolores inflamatorios.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-musculoesqueletico", "sistema-respiratorio"],
+      categoriaId: "especias-medicinales",
+      categoria: "Especias medicinales",
+    },
+    {
+      id: "curcuma",
+      nombre: "Cúrcuma",
+      nombreCientifico: "Curcuma longa",
+      nombresAlternativos: {"Cuba": ["polluelo", "azafrán cimarrón", "yuquilla"], "Puerto Rico": ["turmérico", "jengibrillo"], "Perú": ["palillo cholón", "palillo chuncho", "guisador", "palillo"], "Colombia": ["azafrán", "azafrán cimarrón", "curcuma", "cúrcuma", "guisador"], "USA_English": ["common turmeric", "turmeric", "Indian saffron", "golden herb", "yellow ginger saffron"], "UK_English": ["turmeric"], "Indigena": ["haldi (Hindi)"]},
+      propiedades: ["Antiinflamatoria", "Antioxidante", "Hepatoprotectora"],
+      parteUsable: "Rizoma",
+      dosis: "1.5-3 gramos al día",
+      preparacion: "Polvo, extracto",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "No recomendado en grandes cantidades." }, { tipo: "medicamentos", descripcion: "Puede interactuar con anticoagulantes." }],
+      descripcion: "La cúrcuma contiene curcumina, un potente compuesto antiinflamatorio y antioxidante.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-musculoesqueletico", "sistema-inmunologico"],
+      categoriaId: "especias-medicinales",
+      categoria: "Especias medicinales",
+    },
+    {
+      id: "anís-estrellado",
+      nombre: "Anís estrellado",
+      nombreCientifico: "Illicium verum",
+      nombresAlternativos: {"España": ["anís estrellado", "anís estrella", "anís estrellado chino", "badián", "badiana", "badiana de China", "anís francés", "anís de China", "badianero"], "USA_English": ["star anise", "badian", "Chinese star anise", "star anise seed", "star aniseed", "star of anise"], "UK_English": ["star anise", "badian", "Chinese star anise"], "Indigena": ["bājiǎo"]},
+      propiedades: ["Carminativo", "Expectorante", "Antiviral"],
+      parteUsable: "Fruto",
+      dosis: "1-2 estrellas por taza de infusión",
+      preparacion: "Infusión",
+      contraindicaciones: [{ tipo: "ninos", descripcion: "No administrar a lactantes y niños pequeños." }, { tipo: "embarazo", descripcion: "Evitar durante el embarazo." }],
+      descripcion: "El anís estrellado es eficaz para aliviar gases y problemas respiratorios. Es una fuente de ácido shikímico, precursor del oseltamivir.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-respiratorio"],
+      categoriaId: "especias-medicinales",
+      categoria: "Especias medicinales",
+    },
+    {
+      id: "comino",
+      nombre: "Comino",
+      nombreCientifico: "Cuminum cyminum",
+      nombresAlternativos: {"España": ["alcamonia", "comino común", "comino fino"], "USA_English": ["cumin", "cummin", "jeera"], "UK_English": ["cumin", "cummin", "jeera"], "Otros": ["comí castellà", "fenoll de prat"]},
+      propiedades: ["Digestivo", "Carminativo", "Antioxidante"],
+      parteUsable: "Semillas",
+      dosis: "1/2 - 1 cucharadita de semillas al día",
+      preparacion: "Infusión, polvo",
+      contraindicaciones: [{ tipo: "otro", descripcion: "No se conocen contraindicaciones importantes en dosis culinarias." }],
+      descripcion: "El comino es una especia digestiva que ayuda a aliviar la hinchazón y los gases.",
+      sistemasRelacionados: ["sistema-digestivo"],
+      categoriaId: "especias-medicinales",
+      categoria: "Especias medicinales",
+    },
+    {
+      id: "cilantro",
+      nombre: "Cilantro",
+      nombreCientifico: "Coriandrum sativum",
+      nombresAlternativos: {"España": ["coriandro", "culantro europeo", "perejil chino", "dannia"], "Perú": ["culantro Castilla"], "Ecuador": ["culantro Castilla"], "Honduras": ["culantro Castilla"], "USA_English": ["coriander", "cilantro", "chinese parsley"], "UK_English": ["coriander", "cilantro", "chinese parsley"], "Otros": ["cilandro", "culantro", "celiandre", "cilandre"]},
+      propiedades: ["Digestivo", "Quelante de metales pesados", "Antioxidante"],
+      parteUsable: "Hojas y semillas",
+      dosis: "Consumo culinario",
+      preparacion: "Consumo directo, infusión de semillas",
+      contraindicaciones: [{ tipo: "alergia", descripcion: "Algunas personas tienen aversión genética a su sabor." }],
+      descripcion: "Tanto las hojas (cilantro) como las semillas (coriandro) tienen propiedades digestivas y desintoxicantes.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-linfatico"],
+      categoriaId: "especias-medicinales",
+      categoria: "Especias medicinales",
+    },
+    {
+      id: "hinojo",
+      nombre: "Hinojo",
+      nombreCientifico: "Foeniculum vulgare",
+      nombresAlternativos: {"España": ["hinojo común", "fenoll", "fiuncho", "acapate", "fonol común", "cenojo", "fenojo", "fenol", "hierba santa", "mello", "perejil de gitano", "hinojo dulce", "hinojo amargo", "hinojo en rama", "hinojo de Florencia"], "USA_English": ["fennel", "sweet fennel", "bronze fennel", "finocchio", "florence fennel"], "UK_English": ["fennel", "sweet fennel", "bronze fennel", "finocchio", "florence fennel"]},
+      propiedades: ["Carminativo", "Galactagogo", "Expectorante"],
+      parteUsable: "Semillas y bulbo",
+      dosis: "1-2 cucharaditas de semillas en infusión",
+      preparacion: "Infusión, decocción",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "Evitar el aceite esencial." }],
+      descripcion: "El hinojo es excelente para aliviar cólicos, gases y estimular la producción de leche materna.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-reproductor", "sistema-respiratorio"],
+      categoriaId: "especias-medicinales",
+      categoria: "Especias medicinales",
+    },
+    {
+      id: "laurel",
+      nombre: "Laurel",
+      nombreCientifico: "Laurus nobilis",
+      nombresAlternativos: {"España": ["llorer", "ereñotz", "lloréu", "choriu", "llorin", "lloreru", "lloureiro"], "USA_English": ["bay tree", "bay laurel", "sweet bay", "true laurel", "grecian laurel"], "UK_English": ["bay tree", "bay laurel", "sweet bay", "true laurel", "grecian laurel"], "Otros": ["lauro", "laurel de apolo", "laurel de dafne"]},
+      propiedades: ["Digestivo", "Carminativo", "Expectorante"],
+      parteUsable: "Hojas",
+      dosis: "1-2 hojas en infusión o cocción",
+      preparacion: "Infusión, cocción",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Retirar las hojas antes de consumir los alimentos." }],
+      descripcion: "Las hojas de laurel facilitan la digestión y ayudan a aliviar los gases y la flatulencia.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-respiratorio"],
+      categoriaId: "especias-medicinales",
+      categoria: "Especias medicinales",
+    },
+    {
+      id: "romero",
+      nombre: "Romero",
+      nombreCientifico: "Rosmarinus officinalis",
+      nombresAlternativos: {"España": ["romero común", "romero blanco", "romero hembra", "romero macho"], "USA_English": ["rosemary"], "UK_English": ["rosemary"]},
+      propiedades: ["Estimulante circulatorio", "Antioxidante", "Mejora la memoria"],
+      parteUsable: "Hojas y flores",
+      dosis: "1 cucharadita por taza en infusión",
+      preparacion: "Infusión, aceite esencial",
+      contraindicaciones: [{ tipo: "hipertension", descripcion: "Puede elevar la presión arterial en dosis altas." }, { tipo: "embarazo", descripcion: "Evitar en grandes cantidades." }],
+      descripcion: "El romero es conocido por mejorar la circulación y la concentración, además de ser un potente antioxidante.",
+      sistemasRelacionados: ["sistema-cardiovascular", "sistema-nervioso", "sistema-musculoesqueletico"],
+      categoriaId: "especias-medicinales",
+      categoria: "Especias medicinales",
+    },
+    {
+      id: "tomillo",
+      nombre: "Tomillo",
+      nombreCientifico: "Thymus vulgaris",
+      nombresAlternativos: {"España": ["boja", "bojas", "estremoncello", "estremoncillo", "tomello", "tremoncillo"], "USA_English": ["common thyme", "German thyme", "garden thyme"], "UK_English": ["common thyme", "German thyme", "garden thyme"], "Otros": ["orégano", "timonet", "farigola"]},
+      propiedades: ["Antiséptico", "Expectorante", "Antiespasmódico"],
+      parteUsable: "Hojas y flores",
+      dosis: "1-2 cucharaditas por taza en infusión",
+      preparacion: "Infusión, jarabe",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "Evitar el aceite esencial." }],
+      descripcion: "El tomillo es un potente antiséptico natural, muy eficaz para tratar infecciones respiratorias y la tos.",
+      sistemasRelacionados: ["sistema-respiratorio", "sistema-inmunologico"],
+      categoriaId: "especias-medicinales",
+      categoria: "Especias medicinales",
+    },
+    {
+      id: "oregano",
+      nombre: "Orégano",
+      nombreCientifico: "Origanum vulgare",
+      nombresAlternativos: {"España": ["furiégano", "mejorana silvestre", "oreganín", "orégano común", "orégano nano", "orégano trenzado", "orégano turco", "orenga"], "Caribe": ["orégano francés", "orégano de la tierra", "orégano orejón", "orégano brujo"], "USA_English": ["oregano", "wild marjoram", "pot marjoram"], "UK_English": ["oregano", "wild marjoram", "pot marjoram"]},
+      propiedades: ["Antibacteriano", "Antifúngico", "Antioxidante"],
+      parteUsable: "Hojas",
+      dosis: "1 cucharadita en infusión",
+      preparacion: "Infusión, aceite esencial",
+      contraindicaciones: [{ tipo: "medicamentos", descripcion: "Puede interactuar con anticoagulantes." }],
+      descripcion: "El orégano, especialmente su aceite, es un poderoso agente antimicrobiano natural.",
+      sistemasRelacionados: ["sistema-respiratorio", "sistema-digestivo", "sistema-inmunologico"],
+      categoriaId: "especias-medicinales",
+      categoria: "Especias medicinales",
+    },
+    {
+      id: "albahaca",
+      nombre: "Albahaca",
+      nombreCientifico: "Ocimum basilicum",
+      nombresAlternativos: {"Mexico": ["albacar", "albacar corriente", "albacar hembra", "albacar macho", "albahaca blanca", "albahaca corriente", "albahaca de Castilla", "albahaca de la tierra", "albahaca morada", "albahaca arribeño", "orégano"], "España": ["alhábega", "alfábega", "basílico", "hierba real", "hierba de los reyes"], "USA_English": ["basil", "sweet basil"], "UK_English": ["basil", "sweet basil"]},
+      propiedades: ["Adaptógeno", "Antiinflamatorio", "Antibacteriano"],
+      parteUsable: "Hojas",
+      dosis: "Consumo culinario, infusión",
+      preparacion: "Consumo directo, infusión",
+      contraindicaciones: [{ tipo: "otro", descripcion: "El aceite esencial debe usarse con precaución." }],
+      descripcion: "La albahaca, especialmente la sagrada (Tulsi), es un adaptógeno que ayuda al cuerpo a manejar el estrés.",
+      sistemasRelacionados: ["sistema-nervioso", "sistema-inmunologico", "trastornos-mentales-emocionales"],
+      categoriaId: "especias-medicinales",
+      categoria: "Especias medicinales",
+    },
+    {
+      id: "menta",
+      nombre: "Menta",
+      nombreCientifico: "Mentha piperita",
+      nombresAlternativos: {"España": ["menta piperita", "té de menta", "hierbabuena", "sándalo", "toronjil", "hortelana", "menta perrera", "menta romana"], "Chile": ["bergamota de Chile"], "Otros": ["monte yuyo", "toronjil de menta", "pitoreta", "pituda"], "USA_English": ["peppermint", "chocolate mint", "curly mint", "hairy mint", "white peppermint", "english mint"], "UK_English": ["peppermint", "chocolate mint", "curly mint", "hairy mint", "white peppermint", "english mint"]},
+      propiedades: ["Carminativo", "Antiespasmódico", "Refrescante"],
+      parteUsable: "Hojas",
+      dosis: "1 cucharada de hojas por taza en infusión",
+      preparacion: "Infusión, aceite esencial",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Puede causar reflujo en personas sensibles." }],
+      descripcion: "La menta es muy efectiva para aliviar problemas digestivos como el síndrome del intestino irritable.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-respiratorio"],
+      categoriaId: "especias-medicinales",
+      categoria: "Especias medicinales",
+    },
+    {
+      id: "salvia",
+      nombre: "Salvia",
+      nombreCientifico: "Salvia officinalis",
+      nombresAlternativos: {"España": ["salvia real", "celima", "hierba del mudo", "madreselva", "mermasangre", "salima fina", "salvia blanca", "salvia fina", "salvia hortense", "gallocresta", "salve", "hierba de la salud", "sabia", "salva", "salvá", "salva cruz", "salvia en cruz", "té moruno", "té de jardín"], "USA_English": ["sage", "common sage", "garden sage", "golden sage", "kitchen sage", "true sage", "culinary sage"], "UK_English": ["sage", "common sage", "garden sage", "golden sage", "kitchen sage", "true sage", "culinary sage"], "Otros": ["María Pastora", "Sally-D", "menta mágica", "salvia del país", "salvia de playa", "salvia cimarrona"]},
+      propiedades: ["Antisudoral", "Antiinflamatorio", "Mejora la memoria"],
+      parteUsable: "Hojas",
+      dosis: "1-2 cucharaditas en infusión",
+      preparacion: "Infusión, gargarismos",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "Puede ser abortiva." }, { tipo: "lactancia", descripcion: "Puede reducir la producción de leche." }],
+      descripcion: "La salvia es conocida por reducir la sudoración excesiva y aliviar los síntomas de la menopausia.",
+      sistemasRelacionados: ["sistema-endocrino", "sistema-nervioso", "enfermedades-ojos-oidos-nariz-garganta"],
+      categoriaId: "especias-medicinales",
+      categoria: "Especias medicinales",
+    },
+    {
+      id: "mejorana",
+      nombre: "Mejorana",
+      nombreCientifico: "Origanum majorana",
+      nombresAlternativos: {"España": ["acapuas", "almaraco", "almoradijo", "almoraduj", "almoradux", "almoradux casero", "almoradux morisco", "almoradux salsero", "almoraduz", "mayorana", "amáraco", "orégano mayor", "manjerona", "mejorama"], "USA_English": ["sweet marjoram", "marjoram"], "UK_English": ["sweet marjoram", "marjoram"], "Otros": ["marjorama", "marduix", "moraduix", "mendaro"]},
+      propiedades: ["Sedante", "Digestivo", "Antiespasmódico"],
+      parteUsable: "Hojas y flores",
+      dosis: "1-2 cucharaditas en infusión",
+      preparacion: "Infusión, aceite esencial",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "Evitar en grandes cantidades." }],
+      descripcion: "La mejorana tiene un efecto calmante sobre el sistema nervioso, ayudando a aliviar la ansiedad y el insomnio.",
+      sistemasRelacionados: ["sistema-nervioso", "sistema-digestivo"],
+      categoriaId: "especias-medicinales",
+      categoria: "Especias medicinales",
+    },
+    {
+      id: "eneldo",
+      nombre: "Eneldo",
+      nombreCientifico: "Anethum graveolens",
+      nombresAlternativos: {"España": ["aneto", "abesón"], "USA_English": ["dill", "dill-oil plant", "east indian dill", "indian dill", "meeting-seed", "sabbath day posy", "dillweed"], "UK_English": ["dill", "dill-oil plant", "east indian dill", "indian dill", "meeting-seed", "sabbath day posy", "dillweed"], "Otros": ["anet", "aneta"]},
+      propiedades: ["Carminativo", "Antiespasmódico", "Galactagogo"],
+      parteUsable: "Hojas y semillas",
+      dosis: "1 cucharadita de semillas en infusión",
+      preparacion: "Infusión, consumo directo",
+      contraindicaciones: [{ tipo: "otro", descripcion: "No se conocen contraindicaciones importantes." }],
+      descripcion: "El eneldo es útil para aliviar los cólicos en los bebés y mejorar la digestión.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-reproductor"],
+      categoriaId: "especias-medicinales",
+      categoria: "Especias medicinales",
+    },
+    {
+      id: "cayena",
+      nombre: "Cayena",
+      nombreCientifico: "Capsicum annuum var. annuum",
+      nombresAlternativos: {"España": ["pimienta de Cayena", "cayena"], "USA_English": ["cayenne pepper"], "UK_English": ["cayenne pepper"], "Indigena": ["Fulful ahhmar", "Filfil ahmar", "La zi"]},
+      propiedades: ["Estimulante circulatorio", "Analgésico", "Digestivo"],
+      parteUsable: "Fruto",
+      dosis: "Pequeñas cantidades en las comidas",
+      preparacion: "Polvo, tintura",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Puede irritar la mucosa gástrica." }],
+      descripcion: "La cayena contiene capsaicina, que mejora la circulación y tiene propiedades analgésicas.",
+      sistemasRelacionados: ["sistema-cardiovascular", "sistema-musculoesqueletico", "sistema-digestivo"],
+      categoriaId: "especias-medicinales",
+      categoria: "Especias medicinales",
+    },
+    {
+      id: "wasabi",
+      nombre: "Wasabi",
+      nombreCientifico: "Eutrema japonicum",
+      nombresAlternativos: {"USA_English": ["wasabi", "japanese horseradish"], "UK_English": ["wasabi", "japanese horseradish"], "Otros": ["rábano picante japonés"]},
+      propiedades: ["Antimicrobiano", "Antiinflamatorio", "Descongestionante"],
+      parteUsable: "Rizoma",
+      dosis: "Pequeñas cantidades como condimento",
+      preparacion: "Pasta fresca",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Su picor intenso puede ser irritante." }],
+      descripcion: "El wasabi real tiene potentes propiedades antimicrobianas y ayuda a descongestionar las vías respiratorias.",
+      sistemasRelacionados: ["sistema-respiratorio", "sistema-digestivo"],
+      categoriaId: "especias-medicinales",
+      categoria: "Especias medicinales",
+    },
+    {
+      id: "galanga",
+      nombre: "Galanga",
+      nombreCientifico: "Alpinia galanga",
+      nombresAlternativos: {"España": ["galanga", "jengibre de siam", "galanga de java", "galanga de la india", "calanga", "galangal mayor", "jengibre siamés"], "USA_English": ["lesser galangal", "greater galangal", "siamese ginger", "java galangal", "blue ginger", "thai ginger"], "UK_English": ["lesser galangal", "greater galangal", "siamese ginger", "java galangal", "blue ginger", "thai ginger"], "Otros": ["lengkuas", "hang dou kou", "stor kalanga", "el adkham", "gaoliangjiang"]},
+      propiedades: ["Antiinflamatorio", "Antiemético", "Antitumoral"],
+      parteUsable: "Rizoma",
+      dosis: "1-2 gramos al día",
+      preparacion: "Decocción, polvo",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "Consultar al médico." }],
+      descripcion: "Similar al jengibre, la galanga se usa para tratar problemas digestivos, inflamación y náuseas.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-musculoesqueletico"],
+      categoriaId: "especias-medicinales",
+      categoria: "Especias medicinales",
+    },
+    {
+      id: "macis",
+      nombre: "Macis",
+      nombreCientifico: "Myristica fragrans",
+      nombresAlternativos: {"España": ["macis", "flor de la nuez moscada"], "USA_English": ["mace"], "UK_English": ["mace"]},
+      propiedades: ["Carminativo", "Estimulante", "Afrodisíaco"],
+      parteUsable: "Arilo (cobertura de la semilla de nuez moscada)",
+      dosis: "Una pizca",
+      preparacion: "Polvo",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "Evitar en grandes cantidades." }],
+      descripcion: "El macis es la especia que recubre la nuez moscada, con un sabor más delicado y propiedades similares.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-nervioso"],
+      categoriaId: "especias-medicinales",
+      categoria: "Especias medicinales",
+    },
+    {
+      id: "azafran-de-la-india",
+      nombre: "Azafrán de la India (Cúrcuma)",
+      nombreCientifico: "Curcuma longa",
+      nombresAlternativos: {"España": ["azafrán de la India", "guisador", "turmeric", "zafrán", "polluelo", "azafrán cimarrón"], "Mexico": ["turmérico"], "Peru": ["palillo cholón", "palillo chuncho", "guisador", "palillo"], "Caribe": ["yuquilla", "jengibrillo"], "USA_English": ["turmeric"], "UK_English": ["turmeric"], "Indigena": ["haldi"]},
+      propiedades: ["Antiinflamatoria", "Antioxidante", "Hepatoprotectora"],
+      parteUsable: "Rizoma",
+      dosis: "1.5-3 gramos al día",
+      preparacion: "Polvo, extracto",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "No recomendado en grandes cantidades." }, { tipo: "medicamentos", descripcion: "Puede interactuar con anticoagulantes." }],
+      descripcion: "Conocida comúnmente como cúrcuma, es una de las especias con mayor poder antiinflamatorio.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-musculoesqueletico", "sistema-inmunologico"],
+      categoriaId: "especias-medicinales",
+      categoria: "Especias medicinales",
+    },
+    {
+      id: "pimienta-de-jamaica",
+      nombre: "Pimienta de Jamaica",
+      nombreCientifico: "Pimenta dioica",
+      nombresAlternativos: {"España": ["pimienta de Jamaica", "malagueta", "pimienta malagueta de las Antillas"], "Mexico": ["pimienta de Tabasco", "pimienta Chiapa"], "Colombia": ["pimienta guayabita"], "USA_English": ["allspice"], "UK_English": ["allspice"], "Indigena": ["xocoxóchitl"]},
+      propiedades: ["Carminativo", "Analgésico", "Antiséptico"],
+      parteUsable: "Fruto seco",
+      dosis: "Uso culinario",
+      preparacion: "Polvo, entero",
+      contraindicaciones: [{ tipo: "otro", descripcion: "No se conocen contraindicaciones importantes." }],
+      descripcion: "Combina los sabores de canela, nuez moscada y clavo. Se usa para problemas digestivos.",
+      sistemasRelacionados: ["sistema-digestivo"],
+      categoriaId: "especias-medicinales",
+      categoria: "Especias medicinales",
+    },
+    {
+      id: "semillas-de-apio",
+      nombre: "Semillas de apio",
+      nombreCientifico: "Apium graveolens",
+      propiedades: ["Diurético", "Antiinflamatorio", "Carminativo"],
+      parteUsable: "Semillas",
+      dosis: "1/2 cucharadita en infusión",
+      preparacion: "Infusión, extracto",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "Puede ser uterotónico." }, { tipo: "otro", descripcion: "Evitar en caso de enfermedad renal." }],
+      descripcion: "Las semillas de apio son un diurético natural y ayudan a aliviar la inflamación asociada a la artritis y la gota.",
+      sistemasRelacionados: ["sistema-urinario", "sistema-musculoesqueletico"],
+      categoriaId: "especias-medicinales",
+      categoria: "Especias medicinales",
+    },
+    {
+      id: "sumac",
+      nombre: "Zumaque (Sumac)",
+      nombreCientifico: "Rhus coriaria",
+      propiedades: ["Antioxidante", "Antiinflamatorio", "Hipoglucemiante"],
+      parteUsable: "Fruto seco y molido",
+      dosis: "Uso culinario",
+      preparacion: "Polvo",
+      contraindicaciones: [{ tipo: "alergia", descripcion: "Puede causar reacción en personas alérgicas a los anacardos." }],
+      descripcion: "El zumaque tiene un sabor ácido y es rico en antioxidantes. Se investiga por sus beneficios en el control del azúcar.",
+      sistemasRelacionados: ["sistema-endocrino", "sistema-inmunologico"],
+      categoriaId: "especias-medicinales",
+      categoria: "Especias medicinales",
+    },
+    {
+      id: "regaliz",
+      nombre: "Regaliz",
+      nombreCientifico: "Glycyrrhiza glabra",
+      nombresAlternativos: {"España": ["regalicia", "orozuz", "orosús", "paloduz", "palodulce", "palodul", "arrezú"], "Argentina": ["orozús"], "USA_English": ["licorice", "sweetwood", "black sugar"], "UK_English": ["liquorice"]},
+      propiedades: ["Antiinflamatorio", "Expectorante", "Adaptógeno"],
+      parteUsable: "Raíz",
+      dosis: "1-4 gramos de raíz seca al día",
+      preparacion: "Decocción, extracto",
+      contraindicaciones: [{ tipo: "hipertension", descripcion: "Puede elevar la presión arterial con el uso prolongado." }, { tipo: "embarazo", descripcion: "No recomendado." }],
+      descripcion: "El regaliz es emoliente y antiinflamatorio, útil para la tos, úlceras gástricas y fatiga adrenal.",
+      sistemasRelacionados: ["sistema-respiratorio", "sistema-digestivo", "sistema-endocrino"],
+      categoriaId: "especias-medicinales",
+      categoria: "Especias medicinales",
+    },
+    {
+      id: "enebro",
+      nombre: "Enebro",
+      nombreCientifico: "Juniperus communis",
+      nombresAlternativos: {"España": ["enebro", "ginebro"], "USA_English": ["common juniper", "ground juniper"], "UK_English": ["common juniper"]},
+      propiedades: ["Diurético", "Antiséptico urinario", "Carminativo"],
+      parteUsable: "Bayas",
+      dosis: "1 cucharadita de bayas en infusión",
+      preparacion: "Infusión",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "Puede ser abortivo." }, { tipo: "otro", descripcion: "No usar en caso de enfermedad renal." }],
+      descripcion: "Las bayas de enebro son un potente diurético y antiséptico, utilizadas para infecciones urinarias.",
+      sistemasRelacionados: ["sistema-urinario", "sistema-digestivo"],
+      categoriaId: "especias-medicinales",
+      categoria: "Especias medicinales",
+    },
+    {
+      id: "asafoetida",
+      nombre: "Asafétida",
+      nombreCientifico: "Ferula assa-foetida",
+      nombresAlternativos: {"España": ["asafétida", "estiércol del diablo"], "USA_English": ["asafoetida", "devil's dung", "hing", "heeng"], "UK_English": ["asafoetida", "devil's dung"]},
+      propiedades: ["Carminativo", "Antiespasmódico", "Expectorante"],
+      parteUsable: "Resina de la raíz",
+      dosis: "Una pizca muy pequeña en la cocción",
+      preparacion: "Polvo",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "Evitar." }],
+      descripcion: "Con un olor muy fuerte, la asafétida es extremadamente eficaz para combatir los gases y la hinchazón abdominal.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-respiratorio"],
+      categoriaId: "especias-medicinales",
+      categoria: "Especias medicinales",
+    },
+    {
+      id: "pimienta-de-sichuan",
+      nombre: "Pimienta de Sichuan",
+      nombreCientifico: "Zanthoxylum piperitum",
+      nombresAlternativos: {"España": ["pimienta de Sichuan", "pimentero japonés", "sansho", "cayatuna", "chopi"], "USA_English": ["Sichuan pepper", "Japanese pepper", "Korean pepper", "sansho", "Japanese prickly-ash"], "UK_English": ["Sichuan pepper", "Japanese pepper"]},
+      propiedades: ["Analgésico local", "Estimulante circulatorio", "Carminativo"],
+      parteUsable: "Cáscara del fruto",
+      dosis: "Uso culinario",
+      preparacion: "Entera o molida",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Produce una sensación de hormigueo característica en la boca." }],
+      descripcion: "No es una pimienta real, pero produce una sensación única de hormigueo y adormecimiento. Se usa para dolores y problemas digestivos.",
+      sistemasRelacionados: ["sistema-nervioso", "sistema-digestivo"],
+      categoriaId: "especias-medicinales",
+      categoria: "Especias medicinales",
+    },
+    {
+      id: "semillas-de-amapola",
+      nombre: "Semillas de amapola",
+      nombreCientifico: "Papaver somniferum",
+      propiedades: ["Sedante suave", "Analgésico suave", "Rico en minerales"],
+      parteUsable: "Semillas",
+      dosis: "1-2 cucharaditas",
+      preparacion: "Consumo directo",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Puede dar falsos positivos en pruebas de opiáceos." }],
+      descripcion: "Las semillas de amapola tienen un efecto calmante y son ricas en calcio, magnesio y zinc.",
+      sistemasRelacionados: ["sistema-nervioso", "sistema-musculoesqueletico"],
+      categoriaId: "especias-medicinales",
+      categoria: "Especias medicinales",
+    },
+    {
+      id: "semillas-de-nigella",
+      nombre: "Semillas de Nigella (Comino negro)",
+      nombreCientifico: "Nigella sativa",
+      nombresAlternativos: {"España": ["abésoda", "agenuz", "ajenuz", "arañuel", "neguilla"], "USA_English": ["black seed", "black cumin", "black caraway", "fennel flower", "nigella", "Roman coriander", "nutmeg flower"], "UK_English": ["black seed", "black cumin", "black caraway", "fennel flower", "nigella"], "Indigena": ["kalonji", "kalongi"]},
+      propiedades: ["Inmunomodulador", "Antihistamínico", "Antiinflamatorio"],
+      parteUsable: "Semillas",
+      dosis: "1-2 cucharaditas de aceite o semillas al día",
+      preparacion: "Aceite prensado en frío, semillas enteras",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "Evitar en grandes cantidades." }],
+      descripcion: "Conocido como \"la semilla bendita\", el comino negro tiene una amplia gama de beneficios, especialmente para el sistema inmunológico y las alergias.",
+      sistemasRelacionados: ["sistema-inmunologico", "sistema-respiratorio", "enfermedades-piel"],
+      categoriaId: "especias-medicinales",
+      categoria: "Especias medicinales",
+    },
+    {
+      id: "ajwain",
+      nombre: "Ajwain",
+      nombreCientifico: "Trachyspermum ammi",
+      nombresAlternativos: {"España": ["ajwain", "carambola"], "USA_English": ["ajwain", "ajowan", "bishop's weed", "carom"], "UK_English": ["ajwain", "ajowan", "bishop's weed", "carom"], "Indigena": ["Bhutika", "Ajamodika", "Yamini", "Yaminiki", "Yaviniki", "Deepyaka"]},
+      propiedades: ["Carminativo", "Antiespasmódico", "Antiséptico"],
+      parteUsable: "Semillas",
+      dosis: "1/2 cucharadita masticada o en infusión",
+      preparacion: "Masticar, infusión",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "Evitar en grandes cantidades." }],
+      descripcion: "Similar al tomillo en sabor, el ajwain es un remedio excepcional para la indigestión, los gases y los cólicos.",
+      sistemasRelacionados: ["sistema-digestivo"],
+      categoriaId: "especias-medicinales",
+      categoria: "Especias medicinales",
+    },
+    {
+      id: "polvo-de-mango-seco",
+      nombre: "Polvo de mango seco (Amchur)",
+      nombreCientifico: "Mangifera indica",
+      nombresAlternativos: {"USA_English": ["amchoor", "aamchur", "amchur", "mango powder"], "UK_English": ["amchoor", "mango powder"], "Indigena": ["khatai"]},
+      propiedades: ["Acidulante", "Rico en Vitamina C", "Digestivo"],
+      parteUsable: "Fruto verde seco y molido",
+      dosis: "Uso culinario",
+      preparacion: "Polvo",
+      contraindicaciones: [{ tipo: "otro", descripcion: "No se conocen contraindicaciones importantes." }],
+      descripcion: "El amchur se hace de mangos verdes secos y se usa para dar un sabor ácido a los platos. Ayuda en la digestión.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-inmunologico"],
+      categoriaId: "especias-medicinales",
+      categoria: "Especias medicinales",
+    },
+    {
+      id: "semillas-de-granada",
+      nombre: "Semillas de granada secas (Anardana)",
+      nombreCientifico: "Punica granatum",
+      nombresAlternativos: {"España": ["granado", "balaustia", "balaustra", "granado borde", "granado común", "granao", "magrano", "manglanera", "manglano", "mengranero", "milgrano", "agrauz", "agrios", "albar", "alvarés"], "USA_English": ["pomegranate", "dwarf pomegranate"], "UK_English": ["pomegranate", "dwarf pomegranate"], "Indigena": ["anar", "darim"]},
+      propiedades: ["Antioxidante", "Cardioprotector", "Antiinflamatorio"],
+      parteUsable: "Semillas secas",
+      dosis: "Uso culinario",
+      preparacion: "Polvo o enteras",
+      contraindicaciones: [{ tipo: "otro", descripcion: "No se conocen contraindicaciones importantes." }],
+      descripcion: "Las semillas de granada secas añaden un sabor agridulce y son ricas en antioxidantes que protegen el corazón.",
+      sistemasRelacionados: ["sistema-cardiovascular", "sistema-inmunologico"],
+      categoriaId: "especias-medicinales",
+      categoria: "Especias medicinales",
+    },
+    {
+      id: "haba-tonka",
+      nombre: "Haba Tonka",
+      nombreCientifico: "Dipteryx odorata",
+      nombresAlternativos: {"España": ["haba tonka", "cumaruna", "cumarú", "cumbarú", "sarrapia", "tagua"], "USA_English": ["tonka bean", "cumaru", "kumaru", "Brazilian teak"], "UK_English": ["tonka bean", "cumaru", "kumaru"]},
+      propiedades: ["Aromatizante", "Sedante", "Anticoagulante"],
+      parteUsable: "Semilla",
+      dosis: "Usar con extrema moderación, rallar una pequeña cantidad",
+      preparacion: "Rallada",
+      contraindicaciones: [{ tipo: "medicamentos", descripcion: "Contiene cumarina, no usar con anticoagulantes." }, { tipo: "otro", descripcion: "Prohibida como aditivo alimentario en algunos países por su contenido de cumarina." }],
+      descripcion: "El haba tonka tiene un aroma complejo a vainilla, almendra y canela. Debe usarse con mucha precaución.",
+      sistemasRelacionados: ["sistema-nervioso"],
+      categoriaId: "especias-medicinales",
+      categoria: "Especias medicinales",
+    },
+    {
+      id: "pimienta-larga",
+      nombre: "Pimienta larga",
+      nombreCientifico: "Piper longum",
+      nombresAlternativos: {"España": ["pimienta larga"], "USA_English": ["long pepper", "Indian long pepper"], "UK_English": ["long pepper", "Indian long pepper"], "Indigena": ["pippali", "pipli", "lendi peepar", "pipal", "kapala", "katikasira"]},
+      propiedades: ["Bio-potenciador", "Expectorante", "Rejuvenecedor"],
+      parteUsable: "Fruto",
+      dosis: "1-2 frutos al día",
+      preparacion: "Polvo, decocción",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Más picante que la pimienta negra, usar con moderación." }],
+      descripcion: "En Ayurveda, la pimienta larga (Pippali) es un potente rejuvenecedor y se usa para mejorar la absorción de otros remedios.",
+      sistemasRelacionados: ["sistema-respiratorio", "sistema-digestivo", "sistema-inmunologico"],
+      categoriaId: "especias-medicinales",
+      categoria: "Especias medicinales",
+    },
+    {
+      id: "cubeba",
+      nombre: "Cubeba (Pimienta de Java)",
+      nombreCientifico: "Piper cubeba",
+      nombresAlternativos: {"España": ["cubeba", "pimienta de Java"], "USA_English": ["cubeb", "cubeb vine", "Java pepper", "true pepper", "pepper vine", "comet-tail peppercorn"], "UK_English": ["cubeb", "Java pepper"]},
+      propiedades: ["Antiséptico urinario", "Expectorante", "Carminativo"],
+      parteUsable: "Fruto",
+      dosis: "Uso culinario moderado",
+      preparacion: "Molida",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "Evitar." }],
+      descripcion: "La cubeba tiene un sabor picante y alcanforado. Se ha utilizado tradicionalmente para infecciones urinarias y problemas respiratorios.",
+      sistemasRelacionados: ["sistema-urinario", "sistema-respiratorio"],
+      categoriaId: "especias-medicinales",
+      categoria: "Especias medicinales",
+    },
+  ],
+};
+
+export default categoria;
@@ -0,0 +1,731 @@
+// Generado automáticamente por scripts/build-catalog.py - no editar a mano
+import type { CategoriaPlanta } from '../../plantas-expandidas';
+
+const categoria: CategoriaPlanta = {
+  id: "flores-medicinales",
+  nombre: "Flores medicinales",
+  plantas: [
+    {
+      id: "manzanilla",
+      nombre: "Manzanilla",
+      nombreCientifico: "Matricaria chamomilla",
+      nombresAlternativos: {"España": ["manzanilla común", "manzanilla de Aragón", "manzanilla alemana", "camomila"], "México": ["manzanilla de Castilla", "manzanilla cimarrona"], "Argentina": ["manzanilla"], "USA_English": ["chamomile", "German chamomile", "Hungarian chamomile"], "UK_English": ["camomile", "German camomile"], "Indigena": ["queza", "gguía-gueza"]},
+      propiedades: ["Digestiva", "Antiinflamatoria", "Calmante", "Antialérgica", "Antibacteriana"],
+      parteUsable: "Flores",
+      dosis: "1-2 cucharaditas de flores secas por taza de agua.",
+      preparacion: "Infusión",
+      contraindicaciones: [{ tipo: "alergia", descripcion: "Puede causar reacciones alérgicas en personas sensibles a la familia de las margaritas." }, { tipo: "embarazo", descripcion: "Consultar al médico antes de usar durante el embarazo." }],
+      descripcion: "Hierba aromática con flores blancas y amarillas, conocida por sus propiedades calmantes y digestivas.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-nervioso", "enfermedades-piel"],
+      categoriaId: "flores-medicinales",
+      categoria: "Flores medicinales",
+    },
+    {
+      id: "calendula",
+      nombre: "Caléndula",
+      nombreCientifico: "Calendula officinalis",
+      nombresAlternativos: {"España": ["botón de oro", "mercadela", "maravilla", "clavelina"], "México": ["flor de muerto", "chinita"], "Colombia": ["botón de oro", "maravilla"], "USA_English": ["pot marigold", "common marigold", "ruddles"], "UK_English": ["Scotch marigold"]},
+      propiedades: ["Cicatrizante", "Antiinflamatoria", "Antiséptica", "Regeneradora de la piel"],
+      parteUsable: "Flores",
+      dosis: "Uso tópico en forma de cremas, ungüentos o infusiones para compresas.",
+      preparacion: "Infusión, aceite, crema",
+      contraindicaciones: [{ tipo: "alergia", descripcion: "Personas alérgicas a las plantas de la familia Asteraceae pueden ser sensibles." }],
+      descripcion: "Planta con flores de color naranja brillante, muy apreciada por sus beneficios para la piel.",
+      sistemasRelacionados: ["enfermedades-piel", "sistema-inmunologico"],
+      categoriaId: "flores-medicinales",
+      categoria: "Flores medicinales",
+    },
+    {
+      id: "lavanda",
+      nombre: "Lavanda",
+      nombreCientifico: "Lavandula angustifolia",
+      nombresAlternativos: {"España": ["espliego", "alhucema", "cantueso"], "USA_English": ["lavender", "true lavender", "English lavender"], "UK_English": ["lavender"]},
+      propiedades: ["Relajante", "Ansiolítica", "Antiséptica", "Analgésica"],
+      parteUsable: "Flores",
+      dosis: "Aceite esencial para aromaterapia o masajes; infusión de 1 cucharadita de flores por taza.",
+      preparacion: "Aceite esencial, infusión, saquitos aromáticos",
+      contraindicaciones: [{ tipo: "otro", descripcion: "El aceite esencial no debe ingerirse sin supervisión profesional." }],
+      descripcion: "Arbusto con flores de color violeta muy aromáticas, famoso por sus efectos relajantes y su agradable fragancia.",
+      sistemasRelacionados: ["sistema-nervioso", "trastornos-mentales-emocionales", "enfermedades-piel"],
+      categoriaId: "flores-medicinales",
+      categoria: "Flores medicinales",
+    },
+    {
+      id: "rosa",
+      nombre: "Rosa",
+      nombreCientifico: "Rosa gallica",
+      nombresAlternativos: {"España": ["rosa de Damasco", "rosa de Castilla", "rosal de Alejandría"], "USA_English": ["Damask rose", "Bulgarian rose"], "UK_English": ["Damask rose"]},
+      propiedades: ["Astringente", "Antiinflamatoria", "Tónico para la piel", "Relajante"],
+      parteUsable: "Pétalos",
+      dosis: "Agua de rosas para uso tópico; infusión de 1-2 cucharaditas de pétalos secos.",
+      preparacion: "Agua de rosas, infusión, aceite esencial",
+      contraindicaciones: [],
+      descripcion: "Además de su belleza y aroma, los pétalos de rosa tienen propiedades beneficiosas para la piel y el sistema nervioso.",
+      sistemasRelacionados: ["enfermedades-piel", "sistema-nervioso"],
+      categoriaId: "flores-medicinales",
+      categoria: "Flores medicinales",
+    },
+    {
+      id: "jazmin",
+      nombre: "Jazmín",
+      nombreCientifico: "Jasminum officinale",
+      nombresAlternativos: {"España": ["jazmín común", "jazmín morisco", "jazmín blanco"], "Caribe": ["jazmín de España", "jazmín de poeta"], "USA_English": ["common jasmine", "poet's jasmine", "white jasmine"], "UK_English": ["summer jasmine", "true jasmine"]},
+      propiedades: ["Relajante", "Sedante", "Antidepresivo", "Afrodisíaco"],
+      parteUsable: "Flores",
+      dosis: "Aceite esencial en aromaterapia; infusión de flores secas.",
+      preparacion: "Aceite esencial, infusión",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "Evitar su uso en grandes cantidades durante el embarazo." }],
+      descripcion: "Flores blancas muy fragantes con un potente efecto relajante sobre el sistema nervioso, ideal para la ansiedad y el insomnio.",
+      sistemasRelacionados: ["sistema-nervioso", "trastornos-mentales-emocionales"],
+      categoriaId: "flores-medicinales",
+      categoria: "Flores medicinales",
+    },
+    {
+      id: "hibisco",
+      nombre: "Hibisco",
+      nombreCientifico: "Hibiscus sabdariffa",
+      nombresAlternativos: {"México": ["flor de Jamaica", "rosa de Jamaica"], "Caribe": ["agrio de Guinea", "saril"], "Colombia": ["flor de Jamaica", "rosa de Jamaica"], "USA_English": ["roselle", "red sorrel", "Jamaica sorrel"], "UK_English": ["roselle"]},
+      propiedades: ["Hipotensor", "Diurético", "Antioxidante", "Vitamínico"],
+      parteUsable: "Cálices de las flores",
+      dosis: "Infusión de 1-2 cucharaditas por taza, 2-3 veces al día.",
+      preparacion: "Infusión (Agua de Jamaica)",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Puede bajar demasiado la presión arterial en personas hipotensas." }, { tipo: "embarazo", descripcion: "No se recomienda su consumo durante el embarazo." }],
+      descripcion: "Sus cálices rojos se usan para preparar una bebida refrescante con propiedades para controlar la presión arterial y el colesterol.",
+      sistemasRelacionados: ["sistema-cardiovascular", "sistema-urinario"],
+      categoriaId: "flores-medicinales",
+      categoria: "Flores medicinales",
+    },
+    {
+      id: "flor-de-sauco",
+      nombre: "Flor de Saúco",
+      nombreCientifico: "Sambucus nigra",
+      nombresAlternativos: {"España": ["saúco", "sabuco", "canillero"], "México": ["saúco", "cundumbo"], "USA_English": ["elderflower", "black elder", "European elder"], "UK_English": ["elderflower", "elder"]},
+      propiedades: ["Antiviral", "Diaforética", "Expectorante", "Antiinflamatoria"],
+      parteUsable: "Flores",
+      dosis: "Infusión de 2-4 gramos de flores secas por taza, varias veces al día.",
+      preparacion: "Infusión, jarabe",
+      contraindicaciones: [],
+      descripcion: "Pequeñas flores blancas agrupadas en corimbos, tradicionalmente usadas para tratar resfriados, gripes y problemas respiratorios.",
+      sistemasRelacionados: ["sistema-respiratorio", "sistema-inmunologico"],
+      categoriaId: "flores-medicinales",
+      categoria: "Flores medicinales",
+    },
+    {
+      id: "tilo-flor",
+      nombre: "Tilo Flor",
+      nombreCientifico: "Tilia cordata",
+      nombresAlternativos: {"España": ["tilo", "tila", "tejo blanco", "tilo de hoja pequeña"], "USA_English": ["littleleaf linden", "small-leaved lime"], "UK_English": ["little-leaf linden", "pry tree"]},
+      propiedades: ["Sedante", "Ansiolítico", "Antiespasmódico", "Diaforético"],
+      parteUsable: "Flores e inflorescencias",
+      dosis: "Infusión de 1-2 cucharaditas por taza, antes de dormir.",
+      preparacion: "Infusión (Tila)",
+      contraindicaciones: [],
+      descripcion: "Las flores del tilo son un remedio clásico para el nerviosismo, la ansiedad y el insomnio, gracias a su suave efecto sedante.",
+      sistemasRelacionados: ["sistema-nervioso", "trastornos-mentales-emocionales"],
+      categoriaId: "flores-medicinales",
+      categoria: "Flores medicinales",
+    },
+    {
+      id: "azahar",
+      nombre: "Azahar",
+      nombreCientifico: "Citrus aurantium",
+      nombresAlternativos: {"España": ["naranjo amargo", "naranja agria", "naranja de Sevilla"], "México": ["naranja agria"], "Argentina": ["apepú"], "USA_English": ["sour orange", "bitter orange", "Seville orange"], "UK_English": ["bitter orange", "marmalade orange"]},
+      propiedades: ["Sedante", "Ansiolítico", "Hipnótico suave", "Antiespasmódico"],
+      parteUsable: "Flores",
+      dosis: "Infusión de 1 cucharadita por taza; agua de azahar en repostería o diluida.",
+      preparacion: "Infusión, agua de azahar, aceite esencial (neroli)",
+      contraindicaciones: [],
+      descripcion: "La flor del naranjo amargo es famosa por su aroma y sus propiedades para calmar los nervios, la ansiedad y facilitar el sueño.",
+      sistemasRelacionados: ["sistema-nervioso", "trastornos-mentales-emocionales"],
+      categoriaId: "flores-medicinales",
+      categoria: "Flores medicinales",
+    },
+    {
+      id: "pasiflora",
+      nombre: "Pasiflora",
+      nombreCientifico: "Passiflora incarnata",
+      nombresAlternativos: {"España": ["flor de la pasión", "pasionaria", "granadilla"], "México": ["maracuyá", "flor de pasión"], "Argentina": ["mburucuyá", "pasionaria"], "USA_English": ["passionflower", "maypop", "purple passionflower"], "UK_English": ["passion flower"], "Indigena": ["mburucuyá"]},
+      propiedades: ["Sedante", "Ansiolítico", "Inductor del sueño", "Antiespasmódico"],
+      parteUsable: "Partes aéreas (flores y hojas)",
+      dosis: "Infusión de 1-2 gramos por taza; extracto líquido o cápsulas según indicación.",
+      preparacion: "Infusión, extracto, cápsulas",
+      contraindicaciones: [{ tipo: "medicamentos", descripcion: "Puede potenciar el efecto de otros sedantes o antidepresivos." }],
+      descripcion: "Conocida como flor de la pasión, es uno de los mejores remedios para el insomnio de origen nervioso y la ansiedad.",
+      sistemasRelacionados: ["sistema-nervioso", "trastornos-mentales-emocionales"],
+      categoriaId: "flores-medicinales",
+      categoria: "Flores medicinales",
+    },
+    {
+      id: "amapola",
+      nombre: "Amapola de California",
+      nombreCientifico: "Eschscholzia californica",
+      nombresAlternativos: {"España": ["amapola silvestre", "ababol", "amapola colorada"], "USA_English": ["corn poppy", "field poppy", "Flanders poppy", "red poppy"], "UK_English": ["common poppy", "corn poppy"]},
+      propiedades: ["Sedante", "Analgésico suave", "Inductor del sueño", "Ansiolítico"],
+      parteUsable: "Partes aéreas floridas",
+      dosis: "Infusión de 1-2 cucharaditas por taza antes de acostarse.",
+      preparacion: "Infusión, extracto",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "No usar durante el embarazo, lactancia ni en niños pequeños." }, { tipo: "medicamentos", descripcion: "No combinar con otros sedantes sin supervisión médica." }],
+      descripcion: "A diferencia de su pariente la adormidera, esta amapola tiene un efecto sedante suave y no adictivo, útil para el insomnio y el nerviosismo.",
+      sistemasRelacionados: ["sistema-nervioso", "trastornos-mentales-emocionales"],
+      categoriaId: "flores-medicinales",
+      categoria: "Flores medicinales",
+    },
+    {
+      id: "violeta",
+      nombre: "Violeta",
+      nombreCientifico: "Viola odorata",
+      nombresAlternativos: {"España": ["violeta común", "violeta de olor", "viola"], "Colombia": ["violeta", "violeta morada"], "USA_English": ["sweet violet", "English violet", "garden violet"], "UK_English": ["wood violet", "sweet violet"]},
+      propiedades: ["Expectorante", "Balsámica", "Sudorífica", "Antiinflamatoria"],
+      parteUsable: "Flores y hojas",
+      dosis: "Jarabe para la tos; infusión de 1 cucharadita de flores por taza.",
+      preparacion: "Jarabe, infusión",
+      contraindicaciones: [],
+      descripcion: "Sus flores y hojas son un remedio tradicional para afecciones respiratorias como la tos, el resfriado y la bronquitis.",
+      sistemasRelacionados: ["sistema-respiratorio"],
+      categoriaId: "flores-medicinales",
+      categoria: "Flores medicinales",
+    },
+    {
+      id: "malva",
+      nombre: "Malva",
+      nombreCientifico: "Malva sylvestris",
+      nombresAlternativos: {"España": ["malva común", "panecillos", "quesitos"], "Colombia": ["malva blanca", "malva morada"], "Argentina": ["malva"], "USA_English": ["common mallow", "high mallow", "wood mallow"], "UK_English": ["common mallow", "cheeses"]},
+      propiedades: ["Emoliente", "Balsámica", "Antiinflamatoria", "Laxante suave"],
+      parteUsable: "Flores y hojas",
+      dosis: "Infusión de 1 cucharada por taza; gargarismos para la garganta.",
+      preparacion: "Infusión, gargarismos, cataplasma",
+      contraindicaciones: [],
+      descripcion: "Rica en mucílagos, la malva suaviza y protege las mucosas respiratorias y digestivas, aliviando la irritación.",
+      sistemasRelacionados: ["sistema-respiratorio", "sistema-digestivo", "enfermedades-piel"],
+      categoriaId: "flores-medicinales",
+      categoria: "Flores medicinales",
+    },
+    {
+      id: "arnica",
+      nombre: "Árnica",
+      nombreCientifico: "Arnica montana",
+      nombresAlternativos: {"España": ["árnica", "tabaco de montaña"], "USA_English": ["arnica", "mountain tobacco", "leopard's bane"], "UK_English": ["arnica"]},
+      propiedades: ["Antiinflamatoria", "Analgésica", "Antiequimótica (reduce moratones)"],
+      parteUsable: "Flores",
+      dosis: "Uso estrictamente externo. Aplicar en forma de gel, crema o tintura diluida.",
+      preparacion: "Gel, crema, tintura, aceite de masaje",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Planta tóxica si se ingiere. No aplicar sobre heridas abiertas." }],
+      descripcion: "Es el remedio por excelencia para golpes, contusiones, esguinces y dolores musculares, gracias a su potente acción antiinflamatoria.",
+      sistemasRelacionados: ["sistema-musculoesqueletico", "enfermedades-piel"],
+      categoriaId: "flores-medicinales",
+      categoria: "Flores medicinales",
+    },
+    {
+      id: "equinacea",
+      nombre: "Equinácea",
+      nombreCientifico: "Echinacea purpurea",
+      nombresAlternativos: {"España": ["equinácea"], "USA_English": ["purple coneflower", "hedgehog coneflower", "black sampson", "coneflower"], "UK_English": ["purple coneflower", "hedgehog coneflower", "black sampson", "coneflower"]},
+      propiedades: ["Inmunoestimulante", "Antiviral", "Antibacteriana", "Antiinflamatoria"],
+      parteUsable: "Flores, hojas y raíz",
+      dosis: "Cápsulas o extractos estandarizados según indicación para prevención o tratamiento.",
+      preparacion: "Cápsulas, extracto, tintura, infusión",
+      contraindicaciones: [{ tipo: "otro", descripcion: "No se recomienda su uso prolongado (más de 8 semanas). Evitar en enfermedades autoinmunes." }],
+      descripcion: "Una de las plantas más eficaces para aumentar las defensas y prevenir o tratar infecciones, especialmente resfriados y gripes.",
+      sistemasRelacionados: ["sistema-inmunologico", "sistema-respiratorio"],
+      categoriaId: "flores-medicinales",
+      categoria: "Flores medicinales",
+    },
+    {
+      id: "girasol",
+      nombre: "Girasol",
+      nombreCientifico: "Helianthus annuus",
+      nombresAlternativos: {"España": ["pipas de girasol"], "México": ["maíz de teja", "acahual"], "Argentina": ["mirasol"], "Colombia": ["jáquima"], "Perú": ["maravilla"], "Chile": ["maravilla"], "USA_English": ["sunflower seeds"], "UK_English": ["sunflower seeds"], "Indigena": ["tlapololote (náhuatl)"]},
+      propiedades: ["Febrífuga", "Expectorante", "Diurética"],
+      parteUsable: "Pétalos (lígulas) y semillas",
+      dosis: "Infusión de los pétalos para la fiebre. Semillas como alimento nutritivo.",
+      preparacion: "Infusión, decocción de semillas",
+      contraindicaciones: [{ tipo: "alergia", descripcion: "Alergia a las semillas de girasol es común." }],
+      descripcion: "Aunque es más conocido por sus semillas, los pétalos de sus flores se han usado tradicionalmente para bajar la fiebre y aliviar resfriados.",
+      sistemasRelacionados: ["sistema-respiratorio", "sistema-inmunologico"],
+      categoriaId: "flores-medicinales",
+      categoria: "Flores medicinales",
+    },
+    {
+      id: "borraja",
+      nombre: "Borraja",
+      nombreCientifico: "Borago officinalis",
+      nombresAlternativos: {"España": ["aborraja", "borracha", "borraina"], "Colombia": ["borraja blanca"], "USA_English": ["borage", "starflower", "cool-tankard"], "UK_English": ["borage", "starflower"]},
+      propiedades: ["Sudorífica", "Diurética", "Emoliente", "Antiinflamatoria"],
+      parteUsable: "Flores y hojas",
+      dosis: "Infusión de flores para resfriados. Aceite de semillas para la piel y síndrome premenstrual.",
+      preparacion: "Infusión, aceite de semillas",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "No se recomienda su consumo durante el embarazo por contener alcaloides." }],
+      descripcion: "Sus flores azules son ricas en mucílagos y se usan en infusión para provocar la sudoración en estados febriles y resfriados.",
+      sistemasRelacionados: ["sistema-respiratorio", "enfermedades-piel", "sistema-reproductor"],
+      categoriaId: "flores-medicinales",
+      categoria: "Flores medicinales",
+    },
+    {
+      id: "capuchina",
+      nombre: "Capuchina",
+      nombreCientifico: "Tropaeolum majus",
+      nombresAlternativos: {"España": ["taco de reina", "espuela de galán", "mastuerzo de Indias"], "México": ["pelonchili", "mastuerzo"], "Colombia": ["cachaco", "antioqueña"], "Perú": ["texao"], "USA_English": ["nasturtium", "Indian cress", "monk's cress"], "UK_English": ["garden nasturtium", "nasturtium"]},
+      propiedades: ["Antibiótica natural", "Expectorante", "Antiséptica urinaria", "Vitamínica (Vitamina C)"],
+      parteUsable: "Flores y hojas",
+      dosis: "Consumir fresca en ensaladas; infusión de 1 cucharada por taza.",
+      preparacion: "Consumo directo (ensaladas), infusión",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Puede ser irritante para el estómago en personas sensibles." }],
+      descripcion: "Tanto sus flores como sus hojas tienen un sabor picante y se consideran un potente antibiótico natural para las vías respiratorias y urinarias.",
+      sistemasRelacionados: ["sistema-respiratorio", "sistema-urinario", "sistema-inmunologico"],
+      categoriaId: "flores-medicinales",
+      categoria: "Flores medicinales",
+    },
+    {
+      id: "clavel",
+      nombre: "Clavel",
+      nombreCientifico: "Dianthus caryophyllus",
+      nombresAlternativos: {"España": ["clavelina", "clavel común"], "USA_English": ["carnation", "clove pink", "gillyflower"], "UK_English": ["carnation", "clove pink"]},
+      propiedades: ["Tónico nervioso", "Antiespasmódico", "Cardiotónico suave"],
+      parteUsable: "Pétalos",
+      dosis: "Infusión de los pétalos para el agotamiento nervioso.",
+      preparacion: "Infusión, jarabe",
+      contraindicaciones: [],
+      descripcion: "Los pétalos del clavel se han utilizado en forma de jarabe o infusión como un tónico suave para el corazón y el sistema nervioso.",
+      sistemasRelacionados: ["sistema-nervioso", "sistema-cardiovascular"],
+      categoriaId: "flores-medicinales",
+      categoria: "Flores medicinales",
+    },
+    {
+      id: "crisantemo",
+      nombre: "Crisantemo",
+      nombreCientifico: "Chrysanthemum morifolium",
+      nombresAlternativos: {"España": ["crisantemo de la China", "flor de Roma"], "USA_English": ["chrysanthemum", "florist's chrysanthemum", "garden mum"], "UK_English": ["chrysanthemum", "florist's daisy"]},
+      propiedades: ["Febrífugo", "Refrigerante", "Antihipertensivo", "Detoxificante (hígado)"],
+      parteUsable: "Flores",
+      dosis: "Infusión de 5-10 flores por taza.",
+      preparacion: "Infusión",
+      contraindicaciones: [{ tipo: "alergia", descripcion: "Puede causar alergia en personas sensibles a las compuestas." }],
+      descripcion: "En la medicina tradicional china, la infusión de flores de crisantemo se usa para 'enfriar' el cuerpo, bajar la fiebre, aliviar el dolor de cabeza y proteger los ojos.",
+      sistemasRelacionados: ["enfermedades-ojos-oidos-nariz-garganta", "sistema-cardiovascular", "sistema-digestivo"],
+      categoriaId: "flores-medicinales",
+      categoria: "Flores medicinales",
+    },
+    {
+      id: "margarita",
+      nombre: "Margarita",
+      nombreCientifico: "Bellis perennis",
+      nombresAlternativos: {"España": ["margarita", "chiribita", "vellorita"], "USA_English": ["daisy", "common daisy", "English daisy"], "UK_English": ["daisy"]},
+      propiedades: ["Expectorante", "Diurética", "Cicatrizante", "Antiinflamatoria"],
+      parteUsable: "Flores y hojas",
+      dosis: "Infusión de 1-2 cucharaditas por taza; uso externo en compresas.",
+      preparacion: "Infusión, compresas",
+      contraindicaciones: [],
+      descripcion: "La humilde margarita tiene propiedades para aliviar la tos y los resfriados, y externamente se usa para curar pequeñas heridas y contusiones.",
+      sistemasRelacionados: ["sistema-respiratorio", "enfermedades-piel"],
+      categoriaId: "flores-medicinales",
+      categoria: "Flores medicinales",
+    },
+    {
+      id: "aciano",
+      nombre: "Aciano",
+      nombreCientifico: "Centaurea cyanus",
+      nombresAlternativos: {"España": ["azulejo", "escobilla", "flor de cielo"], "Perú": ["pincel"], "Colombia": ["pincel"], "USA_English": ["cornflower", "bachelor's button"], "UK_English": ["cornflower", "bachelor's button"]},
+      propiedades: ["Antiinflamatorio ocular", "Astringente suave", "Diurético"],
+      parteUsable: "Flores",
+      dosis: "Infusión para baños oculares (agua de aciano).",
+      preparacion: "Infusión (para uso externo)",
+      contraindicaciones: [],
+      descripcion: "Las flores azules del aciano son el remedio tradicional para los ojos cansados, irritados o inflamados, en forma de baños o compresas.",
+      sistemasRelacionados: ["enfermedades-ojos-oidos-nariz-garganta"],
+      categoriaId: "flores-medicinales",
+      categoria: "Flores medicinales",
+    },
+    {
+      id: "loto",
+      nombre: "Loto Sagrado",
+      nombreCientifico: "Nelumbo nucifera",
+      nombresAlternativos: {"España": ["loto sagrado", "loto indio", "rosa del Nilo"], "USA_English": ["sacred lotus", "Indian lotus", "pink lotus"], "UK_English": ["sacred lotus", "Indian lotus"]},
+      propiedades: ["Astringente", "Febrífugo", "Tónico cardíaco", "Sedante"],
+      parteUsable: "Flores, semillas, rizoma",
+      dosis: "Infusión de flores o decocción de semillas/rizoma.",
+      preparacion: "Infusión, decocción",
+      contraindicaciones: [],
+      descripcion: "Planta sagrada en Oriente, todas sus partes tienen usos medicinales. Las flores se usan por sus propiedades sedantes y para la fiebre.",
+      sistemasRelacionados: ["sistema-nervioso", "sistema-cardiovascular", "sistema-digestivo"],
+      categoriaId: "flores-medicinales",
+      categoria: "Flores medicinales",
+    },
+    {
+      id: "pensamiento",
+      nombre: "Pensamiento",
+      nombreCientifico: "Viola tricolor",
+      nombresAlternativos: {"España": ["pensamiento", "trinitaria"], "USA_English": ["pansy", "heartsease", "wild pansy"], "UK_English": ["pansy", "heartsease"]},
+      propiedades: ["Depurativa", "Diurética", "Antiinflamatoria cutánea", "Expectorante"],
+      parteUsable: "Partes aéreas floridas",
+      dosis: "Infusión de 1-2 cucharaditas por taza, 2-3 veces al día.",
+      preparacion: "Infusión, cápsulas",
+      contraindicaciones: [],
+      descripcion: "Es una de las plantas depurativas más importantes para los problemas de la piel, como el acné, los eccemas o la psoriasis.",
+      sistemasRelacionados: ["enfermedades-piel", "sistema-urinario", "sistema-respiratorio"],
+      categoriaId: "flores-medicinales",
+      categoria: "Flores medicinales",
+    },
+    {
+      id: "primavera",
+      nombre: "Primavera",
+      nombreCientifico: "Primula veris",
+      nombresAlternativos: {"España": ["primavera", "prímula"], "USA_English": ["cowslip", "primrose"], "UK_English": ["cowslip"]},
+      propiedades: ["Expectorante", "Secretolítica", "Balsámica", "Sedante suave"],
+      parteUsable: "Flores y raíz",
+      dosis: "Infusión de las flores (1 cucharadita/taza) para la tos y nervios. Decocción de la raíz como expectorante más potente.",
+      preparacion: "Infusión, decocción",
+      contraindicaciones: [{ tipo: "alergia", descripcion: "Puede causar alergia en personas sensibles a las prímulas." }],
+      descripcion: "Sus flores amarillas son un remedio eficaz para la tos con mucosidad, la bronquitis y los resfriados. También calma la ansiedad.",
+      sistemasRelacionados: ["sistema-respiratorio", "sistema-nervioso"],
+      categoriaId: "flores-medicinales",
+      categoria: "Flores medicinales",
+    },
+    {
+      id: "ulmaria",
+      nombre: "Ulmaria",
+      nombreCientifico: "Filipendula ulmaria",
+      nombresAlternativos: {"España": ["florón", "norotil", "reina de los prados", "brosta", "gramònica", "filipéndula", "altarcina", "altareina", "altarreina", "espirea", "hierba de las abejas", "barba de cabra", "ulmeria"], "USA_English": ["meadowsweet", "queen-of-the-meadow", "mead wort", "pride of the meadow", "meadow-wort"], "UK_English": ["meadowsweet", "queen-of-the-meadow", "mead wort", "pride of the meadow", "meadow-wort", "bittersweet", "bridewort"]},
+      propiedades: ["Antiinflamatoria", "Analgésica", "Antipirética", "Diurética"],
+      parteUsable: "Sumidades floridas",
+      dosis: "Infusión de 1-2 cucharaditas por taza, 2-3 veces al día.",
+      preparacion: "Infusión",
+      contraindicaciones: [{ tipo: "alergia", descripcion: "No usar en caso de alergia a los salicilatos (aspirina)." }, { tipo: "medicamentos", descripcion: "Precaución si se toman anticoagulantes." }],
+      descripcion: "Conocida como la 'aspirina vegetal' por su contenido en salicilatos, es excelente para dolores articulares, fiebre y gripe.",
+      sistemasRelacionados: ["sistema-musculoesqueletico", "sistema-inmunologico", "sistema-urinario"],
+      categoriaId: "flores-medicinales",
+      categoria: "Flores medicinales",
+    },
+    {
+      id: "zinnia",
+      nombre: "Zinnia",
+      nombreCientifico: "Zinnia elegans",
+      nombresAlternativos: {"España": ["zinnia", "rosa mística"], "Mexico": ["zinnia"], "USA_English": ["zinnia", "youth-and-age"], "UK_English": ["zinnia"]},
+      propiedades: ["Antifúngica", "Antibacteriana"],
+      parteUsable: "Flores y hojas",
+      dosis: "Uso tradicional en forma de emplastos o infusiones para lavados.",
+      preparacion: "Emplasto, infusión para lavado",
+      contraindicaciones: [],
+      descripcion: "En la medicina popular de algunas regiones de México, se ha utilizado como remedio para infecciones de la piel por hongos y bacterias.",
+      sistemasRelacionados: ["enfermedades-piel"],
+      categoriaId: "flores-medicinales",
+      categoria: "Flores medicinales",
+    },
+    {
+      id: "dalia",
+      nombre: "Dalia",
+      nombreCientifico: "Dahlia coccinea",
+      nombresAlternativos: {"España": ["dalia"], "Mexico": ["dalia"], "USA_English": ["dahlia"], "UK_English": ["dahlia"]},
+      propiedades: ["Hipoglucemiante", "Diurética", "Antimicrobiana"],
+      parteUsable: "Tubérculos y flores",
+      dosis: "Decocción de los tubérculos o infusión de los pétalos.",
+      preparacion: "Decocción, infusión",
+      contraindicaciones: [],
+      descripcion: "Originaria de México, los aztecas ya usaban sus tubérculos para tratar la epilepsia. Hoy se investigan sus propiedades para regular el azúcar en sangre.",
+      sistemasRelacionados: ["sistema-endocrino", "sistema-urinario"],
+      categoriaId: "flores-medicinales",
+      categoria: "Flores medicinales",
+    },
+    {
+      id: "geranio",
+      nombre: "Geranio",
+      nombreCientifico: "Pelargonium graveolens",
+      nombresAlternativos: {"España": ["geranio de olor", "geranio de rosa"], "USA_English": ["rose geranium", "sweet scented geranium", "old-fashioned rose geranium"], "UK_English": ["rose-scent geranium", "sweet scented geranium"]},
+      propiedades: ["Astringente", "Cicatrizante", "Hemostático", "Tónico nervioso"],
+      parteUsable: "Hojas y flores (para aceite esencial)",
+      dosis: "Aceite esencial diluido para uso tópico en piel y hemorragias nasales leves.",
+      preparacion: "Aceite esencial",
+      contraindicaciones: [],
+      descripcion: "El aceite esencial de geranio es muy versátil, se usa para equilibrar la piel grasa, frenar pequeñas hemorragias y como equilibrante emocional.",
+      sistemasRelacionados: ["enfermedades-piel", "sistema-nervioso", "trastornos-mentales-emocionales"],
+      categoriaId: "flores-medicinales",
+      categoria: "Flores medicinales",
+    },
+    {
+      id: "magnolia",
+      nombre: "Magnolia",
+      nombreCientifico: "Magnolia officinalis",
+      nombresAlternativos: {"USA_English": ["houpu magnolia", "magnolia bark"], "UK_English": ["houpu magnolia"]},
+      propiedades: ["Ansiolítica", "Antidepresiva", "Antiinflamatoria", "Neuroprotectora"],
+      parteUsable: "Corteza y capullos florales",
+      dosis: "Decocción de la corteza o infusión de los capullos.",
+      preparacion: "Decocción, infusión, extracto",
+      contraindicaciones: [{ tipo: "medicamentos", descripcion: "Puede potenciar sedantes. Consultar al médico." }],
+      descripcion: "La corteza de magnolia es un remedio importante en la medicina china para la ansiedad, la depresión y el estrés, sin el efecto sedante de otras plantas.",
+      sistemasRelacionados: ["sistema-nervioso", "trastornos-mentales-emocionales"],
+      categoriaId: "flores-medicinales",
+      categoria: "Flores medicinales",
+    },
+    {
+      id: "peonia",
+      nombre: "Peonía",
+      nombreCientifico: "Paeonia lactiflora",
+      nombresAlternativos: {"España": ["peonía china", "rosa de monte", "rosa sin espinas"], "USA_English": ["Chinese peony", "common garden peony"], "UK_English": ["Chinese peony", "common garden peony"]},
+      propiedades: ["Analgésica", "Antiespasmódica", "Antiinflamatoria", "Reguladora hormonal (femenina)"],
+      parteUsable: "Raíz (principalmente) y flores",
+      dosis: "Decocción de la raíz. Las flores se usan menos, en infusión.",
+      preparacion: "Decocción, extracto",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "Evitar durante el embarazo." }],
+      descripcion: "La raíz de peonía blanca (Bai Shao) es fundamental en ginecología china para calmar los dolores menstruales y regular el ciclo.",
+      sistemasRelacionados: ["sistema-reproductor", "sistema-musculoesqueletico", "sistema-nervioso"],
+      categoriaId: "flores-medicinales",
+      categoria: "Flores medicinales",
+    },
+    {
+      id: "tanaceto",
+      nombre: "Tanaceto",
+      nombreCientifico: "Tanacetum parthenium",
+      nombresAlternativos: {"España": ["tansi", "hierba lombriguera", "ajemjo verde", "palma imperial"], "USA_English": ["tansy", "common tansy", "bitter buttons", "cow bitter", "golden buttons"], "UK_English": ["tansy", "common tansy", "bitter buttons", "cow bitter", "golden buttons"], "Otros": ["tanacet", "tanarida", "anzar-bedar", "mota-belar", "zizari-belar"]},
+      propiedades: ["Antimigrañoso", "Antiinflamatorio", "Antiespasmódico"],
+      parteUsable: "Hojas y flores",
+      dosis: "Cápsulas de polvo estandarizado para la profilaxis de la migraña.",
+      preparacion: "Cápsulas, infusión",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "No usar durante el embarazo." }, { tipo: "alergia", descripcion: "Alergia a las compuestas." }],
+      descripcion: "También conocida como matricaria, es la planta más estudiada y eficaz para prevenir la aparición de las crisis de migraña.",
+      sistemasRelacionados: ["sistema-nervioso"],
+      categoriaId: "flores-medicinales",
+      categoria: "Flores medicinales",
+    },
+    {
+      id: "verbena",
+      nombre: "Verbena",
+      nombreCientifico: "Verbena officinalis",
+      nombresAlternativos: {"España": ["verbena", "hierba sagrada"], "USA_English": ["verbena", "vervain", "holy herb"], "UK_English": ["verbena", "vervain"]},
+      propiedades: ["Tónico nervioso", "Relajante", "Digestiva (amarga)", "Galactagoga"],
+      parteUsable: "Sumidades floridas",
+      dosis: "Infusión de 1 cucharadita por taza.",
+      preparacion: "Infusión, tintura",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "Evitar en el primer trimestre del embarazo." }],
+      descripcion: "Considerada una planta mágica en la antigüedad, la verbena es un excelente tónico para el sistema nervioso agotado, la ansiedad y el estrés.",
+      sistemasRelacionados: ["sistema-nervioso", "sistema-digestivo", "trastornos-mentales-emocionales"],
+      categoriaId: "flores-medicinales",
+      categoria: "Flores medicinales",
+    },
+    {
+      id: "yarrow",
+      nombre: "Milenrama (Yarrow)",
+      nombreCientifico: "Achillea millefolium",
+      nombresAlternativos: {"España": ["milenrama", "aquilea"], "USA_English": ["yarrow", "milfoil"], "UK_English": ["yarrow"]},
+      propiedades: ["Hemostática", "Antiinflamatoria", "Antiespasmódica", "Cicatrizante"],
+      parteUsable: "Sumidades floridas",
+      dosis: "Infusión para uso interno o externo. Polvo de la planta seca sobre heridas.",
+      preparacion: "Infusión, polvo, aceite esencial",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "No se recomienda su uso durante el embarazo." }, { tipo: "alergia", descripcion: "Alergia a la familia de las Asteráceas." }],
+      descripcion: "Su nombre 'Achillea' hace referencia a Aquiles, que la usaba para curar las heridas de sus soldados. Es excelente para cortar hemorragias.",
+      sistemasRelacionados: ["sistema-cardiovascular", "enfermedades-piel", "sistema-digestivo", "sistema-reproductor"],
+      categoriaId: "flores-medicinales",
+      categoria: "Flores medicinales",
+    },
+    {
+      id: "clitoria",
+      nombre: "Clitoria (Butterfly Pea)",
+      nombreCientifico: "Clitoria ternatea",
+      nombresAlternativos: {"España": ["clitoria", "conchita azul"], "Mexico": ["conchita azul"], "Colombia": ["conchita azul"], "Centroamerica": ["conchita azul"], "USA_English": ["butterfly pea", "blue pea", "pigeon wings"], "UK_English": ["butterfly pea"]},
+      propiedades: ["Nootrópica (mejora la memoria)", "Ansiolítica", "Antidepresiva", "Antioxidante"],
+      parteUsable: "Flores",
+      dosis: "Infusión de 5-10 flores. El color azul intenso es característico.",
+      preparacion: "Infusión (Té azul)",
+      contraindicaciones: [],
+      descripcion: "Sus llamativas flores azules se usan para hacer un té que mejora las funciones cognitivas, la memoria y el estado de ánimo.",
+      sistemasRelacionados: ["sistema-nervioso", "trastornos-mentales-emocionales"],
+      categoriaId: "flores-medicinales",
+      categoria: "Flores medicinales",
+    },
+    {
+      id: "espino-blanco",
+      nombre: "Espino Blanco",
+      nombreCientifico: "Crataegus monogyna",
+      nombresAlternativos: {"España": ["majuelo", "espino albar"], "México": ["tejocote", "Mexican hawthorn"], "USA_English": ["common hawthorn", "whitethorn", "one-seed hawthorn", "single-seeded hawthorn"], "UK_English": ["common hawthorn", "hawthorn", "May tree", "one-seed hawthorn", "whitethorn", "quickthorn"]},
+      propiedades: ["Cardiotónico", "Hipotensor", "Regulador del ritmo cardíaco", "Sedante"],
+      parteUsable: "Sumidades floridas (flores y hojas jóvenes)",
+      dosis: "Infusión de 1-2 cucharaditas por taza, 2-3 veces al día. Tratamientos largos.",
+      preparacion: "Infusión, extracto, cápsulas",
+      contraindicaciones: [{ tipo: "medicamentos", descripcion: "Consultar al médico si se toman medicamentos para el corazón (ej. digoxina)." }],
+      descripcion: "Es la planta por excelencia para el corazón. Tonifica el músculo cardíaco, regula la tensión y el ritmo, y calma las palpitaciones de origen nervioso.",
+      sistemasRelacionados: ["sistema-cardiovascular", "sistema-nervioso"],
+      categoriaId: "flores-medicinales",
+      categoria: "Flores medicinales",
+    },
+    {
+      id: "lupulo",
+      nombre: "Lúpulo",
+      nombreCientifico: "Humulus lupulus",
+      nombresAlternativos: {"España": ["betiguera", "cañamiza", "cerveza", "cuerpo de hombre", "lupios", "zaramangón", "espárrago ortiguero", "espárrago de zarza", "esparraguera", "llùpol", "herba de sa cervesa"], "USA_English": ["common hop", "hop"], "UK_English": ["common hop", "hop"]},
+      propiedades: ["Sedante", "Hipnótico", "Ansiolítico", "Fitoestrogénico"],
+      parteUsable: "Conos o flores femeninas (estróbilos)",
+      dosis: "Infusión de 1-2 conos por taza antes de dormir. También en extractos o cápsulas.",
+      preparacion: "Infusión, extracto, almohadas herbales",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Evitar en casos de depresión. No recomendado en niños o durante el embarazo." }],
+      descripcion: "Más allá de dar el amargor a la cerveza, las flores de lúpulo son un potente sedante, ideal para el insomnio, especialmente si se combina con valeriana.",
+      sistemasRelacionados: ["sistema-nervioso", "trastornos-mentales-emocionales", "sistema-reproductor"],
+      categoriaId: "flores-medicinales",
+      categoria: "Flores medicinales",
+    },
+    {
+      id: "meliloto",
+      nombre: "Meliloto",
+      nombreCientifico: "Melilotus officinalis",
+      nombresAlternativos: {"España": ["meliloto", "trébol de olor"], "USA_English": ["melilot", "sweet clover", "yellow melilot"], "UK_English": ["melilot"]},
+      propiedades: ["Tónico venoso", "Anticoagulante", "Antiinflamatorio", "Sedante suave"],
+      parteUsable: "Sumidades floridas",
+      dosis: "Infusión de 1 cucharadita por taza. Uso externo en compresas para la circulación.",
+      preparacion: "Infusión, extracto, compresas",
+      contraindicaciones: [{ tipo: "medicamentos", descripcion: "No combinar con otros anticoagulantes (Sintrom, heparina) sin estricto control médico." }],
+      descripcion: "Mejora la circulación venosa, previene la formación de trombos y alivia los síntomas de las varices y las piernas cansadas.",
+      sistemasRelacionados: ["sistema-cardiovascular", "sistema-linfatico"],
+      categoriaId: "flores-medicinales",
+      categoria: "Flores medicinales",
+    },
+    {
+      id: "gordolobo",
+      nombre: "Gordolobo",
+      nombreCientifico: "Verbascum thapsus",
+      nombresAlternativos: {"España": ["verbasco", "candelaria", "oreja de burro", "friega platos"], "USA_English": ["mullein", "great mullein", "common mullein"], "UK_English": ["mullein", "great mullein", "common mullein"]},
+      propiedades: ["Expectorante", "Emoliente", "Balsámico", "Antiinflamatorio"],
+      parteUsable: "Flores",
+      dosis: "Infusión de 1 cucharadita de flores por taza. Colar muy bien para retirar los pelillos irritantes.",
+      preparacion: "Infusión (bien colada), jarabe",
+      contraindicaciones: [],
+      descripcion: "Es una de las mejores plantas para las afecciones respiratorias. Suaviza la garganta, calma la tos y ayuda a expulsar la mucosidad.",
+      sistemasRelacionados: ["sistema-respiratorio", "enfermedades-ojos-oidos-nariz-garganta"],
+      categoriaId: "flores-medicinales",
+      categoria: "Flores medicinales",
+    },
+    {
+      id: "hisopo",
+      nombre: "Hisopo",
+      nombreCientifico: "Hyssopus officinalis",
+      nombresAlternativos: {"España": ["hisopillo de dos órdenes", "hisopillo húmedo", "hisopo real", "hysopo", "isopo", "isopo hortelano", "rabillo", "rabillo de gato"], "USA_English": ["hyssop"], "UK_English": ["hyssop"], "Otros": ["jufa", "az-zufa"]},
+      propiedades: ["Expectorante", "Antitusivo", "Antiviral", "Digestivo"],
+      parteUsable: "Sumidades floridas",
+      dosis: "Infusión de 1 cucharadita por taza.",
+      preparacion: "Infusión, jarabe, aceite esencial (uso con precaución)",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "No usar durante el embarazo. El aceite esencial es neurotóxico y no debe ingerirse." }],
+      descripcion: "Planta bíblica usada para purificar. Es un excelente remedio para la tos, la bronquitis y los resfriados, especialmente de origen vírico como la gripe.",
+      sistemasRelacionados: ["sistema-respiratorio", "sistema-digestivo"],
+      categoriaId: "flores-medicinales",
+      categoria: "Flores medicinales",
+    },
+    {
+      id: "jazmin-amarillo",
+      nombre: "Jazmín Amarillo (Gelsemium)",
+      nombreCientifico: "Gelsemium sempervirens",
+      nombresAlternativos: {"España": ["jazmín amarillo", "gelsemio"], "USA_English": ["yellow jessamine", "evening trumpetflower", "Carolina jessamine"], "UK_English": ["yellow jessamine"]},
+      propiedades: ["Analgésico neural", "Sedante", "Antigripal"],
+      parteUsable: "Rizoma y raíces (uso homeopático)",
+      dosis: "Planta altamente tóxica. Solo se usa en diluciones homeopáticas bajo prescripción.",
+      preparacion: "Homeopatía",
+      contraindicaciones: [{ tipo: "otro", descripcion: "VENENOSA. Su uso directo es mortal. Solo apta para preparación homeopática por profesionales." }],
+      descripcion: "A pesar de su toxicidad, en homeopatía es un remedio clave para estados gripales con gran postración, dolores de cabeza y neuralgias.",
+      sistemasRelacionados: ["sistema-nervioso", "sistema-inmunologico"],
+      categoriaId: "flores-medicinales",
+      categoria: "Flores medicinales",
+    },
+    {
+      id: "lirio-de-los-valles",
+      nombre: "Lirio de los Valles (Muguete)",
+      nombreCientifico: "Convallaria majalis",
+      nombresAlternativos: {"España": ["lirio de los valles", "convalaria", "muguete"], "USA_English": ["lily of the valley"], "UK_English": ["lily of the valley"]},
+      propiedades: ["Cardiotónico", "Diurético"],
+      parteUsable: "Flores y hojas",
+      dosis: "Planta altamente tóxica. Su uso es exclusivamente farmacéutico para extraer glucósidos cardíacos.",
+      preparacion: "Uso farmacéutico",
+      contraindicaciones: [{ tipo: "otro", descripcion: "VENENOSA. Causa parada cardíaca si se ingiere. No usar de forma casera bajo ningún concepto." }],
+      descripcion: "Similar a la digital, contiene potentes tónicos para el corazón, pero su alta toxicidad la hace apta solo para la industria farmacéutica.",
+      sistemasRelacionados: ["sistema-cardiovascular"],
+      categoriaId: "flores-medicinales",
+      categoria: "Flores medicinales",
+    },
+    {
+      id: "digital",
+      nombre: "Digital",
+      nombreCientifico: "Digitalis purpurea",
+      nombresAlternativos: {"España": ["digital", "dedalera"], "USA_English": ["foxglove", "digitalis"], "UK_English": ["foxglove"]},
+      propiedades: ["Cardiotónico"],
+      parteUsable: "Hojas",
+      dosis: "Planta altamente tóxica. De ella se extrae la digoxina, un fármaco de estrecho margen terapéutico.",
+      preparacion: "Uso farmacéutico (Digoxina)",
+      contraindicaciones: [{ tipo: "otro", descripcion: "VENENOSA. Su ingesta es mortal. Su uso es exclusivamente médico hospitalario." }],
+      descripcion: "La planta medicinal cardiotónica por excelencia, pero también una de las más venenosas. Su uso ha salvado millones de vidas en forma de fármaco.",
+      sistemasRelacionados: ["sistema-cardiovascular"],
+      categoriaId: "flores-medicinales",
+      categoria: "Flores medicinales",
+    },
+    {
+      id: "azafran",
+      nombre: "Azafrán",
+      nombreCientifico: "Crocus sativus",
+      nombresAlternativos: {"España": ["Croco"], "USA_English": ["Saffron", "Autumn Crocus"], "UK_English": ["Saffron", "Autumn Crocus"]},
+      propiedades: ["Antidepresivo", "Antioxidante", "Emenagogo", "Afrodisíaco"],
+      parteUsable: "Estigmas de la flor",
+      dosis: "30 mg al día de extracto estandarizado para la depresión. Como especia, con moderación.",
+      preparacion: "Extracto, especia (infusión)",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "Abortivo en dosis altas. Evitar durante el embarazo." }],
+      descripcion: "La especia más cara del mundo es también un potente antidepresivo natural, con una eficacia comparable a algunos fármacos de síntesis.",
+      sistemasRelacionados: ["sistema-nervioso", "trastornos-mentales-emocionales", "sistema-reproductor"],
+      categoriaId: "flores-medicinales",
+      categoria: "Flores medicinales",
+    },
+    {
+      id: "onagra",
+      nombre: "Onagra",
+      nombreCientifico: "Oenothera biennis",
+      nombresAlternativos: {"España": ["onagra", "prímula"], "USA_English": ["evening primrose"], "UK_English": ["evening primrose"]},
+      propiedades: ["Regulador hormonal", "Antiinflamatorio", "Nutritivo para la piel"],
+      parteUsable: "Semillas (aceite)",
+      dosis: "Perlas de aceite de onagra (500-1000 mg al día) según indicación.",
+      preparacion: "Aceite (perlas)",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Precaución en personas con epilepsia." }],
+      descripcion: "El aceite de sus semillas es rico en ácidos grasos omega-6, siendo el remedio más popular para el síndrome premenstrual y los problemas de la menopausia.",
+      sistemasRelacionados: ["sistema-reproductor", "enfermedades-piel", "sistema-endocrino"],
+      categoriaId: "flores-medicinales",
+      categoria: "Flores medicinales",
+    },
+    {
+      id: "cempasuchil",
+      nombre: "Cempasúchil",
+      nombreCientifico: "Tagetes erecta",
+      nombresAlternativos: {"España": ["cempasúchil", "damasquina"], "Mexico": ["cempasúchil", "flor de muertos", "clavel de las Indias"], "Centroamerica": ["flor de muerto"], "USA_English": ["marigold", "Aztec marigold", "Mexican marigold"], "UK_English": ["marigold"], "Indigena": ["cempōhualxōchitl"]},
+      propiedades: ["Digestiva", "Antiespasmódica", "Antibacteriana", "Carotenoide (luteína)"],
+      parteUsable: "Flores",
+      dosis: "Infusión de los pétalos para cólicos. Extracto de luteína para la salud ocular.",
+      preparacion: "Infusión, extracto",
+      contraindicaciones: [],
+      descripcion: "La flor de muertos mexicana se usa tradicionalmente para aliviar dolores de estómago. Además, es la principal fuente comercial de luteína, un antioxidante vital para la retina.",
+      sistemasRelacionados: ["sistema-digestivo", "enfermedades-ojos-oidos-nariz-garganta"],
+      categoriaId: "flores-medicinales",
+      categoria: "Flores medicinales",
+    },
+    {
+      id: "angelica",
+      nombre: "Angélica",
+      nombreCientifico: "Angelica archangelica",
+      nombresAlternativos: {"España": ["ajonjera", "hierba angélica", "hierba de los ángeles", "hierba del espíritu santo", "chirivía silvestre"], "USA_English": ["garden angelica", "wild celery", "norwegian angelica", "archangel", "holy ghost"], "UK_English": ["garden angelica", "wild celery", "norwegian angelica", "archangel", "holy ghost"], "Otros": ["aingueru bedarra", "angèlica", "väinönputki", "alexandris"]},
+      propiedades: ["Tónico digestivo (amargo)", "Carminativa", "Expectorante", "Antiespasmódica"],
+      parteUsable: "Raíz, semillas y hojas",
+      dosis: "Decocción de la raíz o infusión de las hojas/semillas antes de las comidas.",
+      preparacion: "Decocción, infusión, tintura",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "No usar durante el embarazo." }, { tipo: "diabetes", descripcion: "Puede alterar los niveles de azúcar en sangre." }],
+      descripcion: "Considerada la 'hierba de los ángeles', es un potente tónico para todo el sistema digestivo, abriendo el apetito y aliviando los gases y espasmos.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-respiratorio"],
+      categoriaId: "flores-medicinales",
+      categoria: "Flores medicinales",
+    },
+    {
+      id: "centaurea-menor",
+      nombre: "Centaurea Menor",
+      nombreCientifico: "Centaurium erythraea",
+      nombresAlternativos: {"España": ["centaurea menor", "hiel de la tierra"], "USA_English": ["centaury", "common centaury"], "UK_English": ["centaury"]},
+      propiedades: ["Tónico amargo", "Estimulante del apetito", "Febrífuga", "Colerética"],
+      parteUsable: "Sumidades floridas",
+      dosis: "Infusión de 0.5-1g por taza, 30 minutos antes de las comidas.",
+      preparacion: "Infusión, tintura, vino tónico",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Evitar en caso de gastritis o úlcera péptica por el aumento de jugos gástricos." }],
+      descripcion: "Una de las plantas más amargas de la flora europea. Este amargor la hace un remedio excelente para la falta de apetito y las digestiones pesadas.",
+      sistemasRelacionados: ["sistema-digestivo"],
+      categoriaId: "flores-medicinales",
+      categoria: "Flores medicinales",
+    },
+  ],
+};
+
+export default categoria;
@@ -0,0 +1,386 @@
+// Generado automáticamente por scripts/build-catalog.py - no editar a mano
+import type { CategoriaPlanta } from '../../plantas-expandidas';
+
+const categoria: CategoriaPlanta = {
+  id: "frutas-citricas-medicinales",
+  nombre: "Frutas cítricas medicinales",
+  plantas: [
+    {
+      id: "limón",
+      nombre: "Limón",
+      nombreCientifico: "Citrus limón",
+      nombresAlternativos: {"España": ["limonero", "limón real"], "USA_English": ["Lemon", "Eureka lemon", "Lisbon lemon"], "UK_English": ["Lemon"]},
+      propiedades: ["Antioxidante", "Vitamina C", "Refuerza el sistema inmunológico"],
+      parteUsable: "Fruto completo",
+      dosis: "1-2 frutos al día",
+      preparacion: "Consumo directo, zumo",
+      contraindicaciones: [],
+      descripcion: "El limón es un fruto cítrico conocido por su alto contenido de vitamina C.",
+      sistemasRelacionados: ["sistema-inmunologico", "enfermedades-piel"],
+      categoriaId: "frutas-citricas-medicinales",
+      categoria: "Frutas cítricas medicinales",
+    },
+    {
+      id: "naranja",
+      nombre: "Naranja",
+      nombreCientifico: "Citrus naranja",
+      nombresAlternativos: {"España": ["naranjo dulce", "naranjero", "taronger"], "USA_English": ["Sweet Orange", "Navel orange", "Valencia orange"], "UK_English": ["Orange"]},
+      propiedades: ["Antioxidante", "Vitamina C", "Refuerza el sistema inmunológico"],
+      parteUsable: "Fruto completo",
+      dosis: "1-2 frutos al día",
+      preparacion: "Consumo directo, zumo",
+      contraindicaciones: [],
+      descripcion: "El naranja es un fruto cítrico conocido por su alto contenido de vitamina C.",
+      sistemasRelacionados: ["sistema-inmunologico", "enfermedades-piel"],
+      categoriaId: "frutas-citricas-medicinales",
+      categoria: "Frutas cítricas medicinales",
+    },
+    {
+      id: "toronja",
+      nombre: "Toronja",
+      nombreCientifico: "Citrus toronja",
+      nombresAlternativos: {"España": ["pomelo"], "Argentina": ["pomelo"], "Chile": ["pomelo"], "USA_English": ["Grapefruit"], "UK_English": ["Grapefruit"]},
+      propiedades: ["Antioxidante", "Vitamina C", "Refuerza el sistema inmunológico"],
+      parteUsable: "Fruto completo",
+      dosis: "1-2 frutos al día",
+      preparacion: "Consumo directo, zumo",
+      contraindicaciones: [],
+      descripcion: "El toronja es un fruto cítrico conocido por su alto contenido de vitamina C.",
+      sistemasRelacionados: ["sistema-inmunologico", "enfermedades-piel"],
+      categoriaId: "frutas-citricas-medicinales",
+      categoria: "Frutas cítricas medicinales",
+    },
+    {
+      id: "mandarina",
+      nombre: "Mandarina",
+      nombreCientifico: "Citrus mandarina",
+      nombresAlternativos: {"España": ["clementina", "satsuma"], "USA_English": ["Tangerine", "Mandarin orange", "Clementine"], "UK_English": ["Tangerine", "Mandarin", "Satsuma"]},
+      propiedades: ["Antioxidante", "Vitamina C", "Refuerza el sistema inmunológico"],
+      parteUsable: "Fruto completo",
+      dosis: "1-2 frutos al día",
+      preparacion: "Consumo directo, zumo",
+      contraindicaciones: [],
+      descripcion: "El mandarina es un fruto cítrico conocido por su alto contenido de vitamina C.",
+      sistemasRelacionados: ["sistema-inmunologico", "enfermedades-piel"],
+      categoriaId: "frutas-citricas-medicinales",
+      categoria: "Frutas cítricas medicinales",
+    },
+    {
+      id: "lima",
+      nombre: "Lima",
+      nombreCientifico: "Citrus lima",
+      nombresAlternativos: {"México": ["limón", "limón sutil", "Limón Mexicano"], "Centroamérica": ["limón"], "Caribe": ["limón"], "Colombia": ["limón"], "Perú": ["limón"], "USA_English": ["Key lime", "West Indian lime", "Mexican lime"], "UK_English": ["Key lime"]},
+      propiedades: ["Antioxidante", "Vitamina C", "Refuerza el sistema inmunológico"],
+      parteUsable: "Fruto completo",
+      dosis: "1-2 frutos al día",
+      preparacion: "Consumo directo, zumo",
+      contraindicaciones: [],
+      descripcion: "El lima es un fruto cítrico conocido por su alto contenido de vitamina C.",
+      sistemasRelacionados: ["sistema-inmunologico", "enfermedades-piel"],
+      categoriaId: "frutas-citricas-medicinales",
+      categoria: "Frutas cítricas medicinales",
+    },
+    {
+      id: "bergamota",
+      nombre: "Bergamota",
+      nombreCientifico: "Citrus bergamota",
+      nombresAlternativos: {"España": ["pera del Bey"], "Argentina": ["naranja agria"], "USA_English": ["Bergamot orange", "Bergamot"], "UK_English": ["Bergamot orange"]},
+      propiedades: ["Antioxidante", "Vitamina C", "Refuerza el sistema inmunológico"],
+      parteUsable: "Fruto completo",
+      dosis: "1-2 frutos al día",
+      preparacion: "Consumo directo, zumo",
+      contraindicaciones: [],
+      descripcion: "El bergamota es un fruto cítrico conocido por su alto contenido de vitamina C.",
+      sistemasRelacionados: ["sistema-inmunologico", "enfermedades-piel"],
+      categoriaId: "frutas-citricas-medicinales",
+      categoria: "Frutas cítricas medicinales",
+    },
+    {
+      id: "pomelo",
+      nombre: "Pomelo",
+      nombreCientifico: "Citrus pomelo",
+      nombresAlternativos: {"España": ["pamplemusa", "limonzón", "pomelo chino"], "USA_English": ["Pomelo", "Pummelo", "Shaddock"], "UK_English": ["Pomelo", "Pummelo", "Shaddock"]},
+      propiedades: ["Antioxidante", "Vitamina C", "Refuerza el sistema inmunológico"],
+      parteUsable: "Fruto completo",
+      dosis: "1-2 frutos al día",
+      preparacion: "Consumo directo, zumo",
+      contraindicaciones: [],
+      descripcion: "El pomelo es un fruto cítrico conocido por su alto contenido de vitamina C.",
+      sistemasRelacionados: ["sistema-inmunologico", "enfermedades-piel"],
+      categoriaId: "frutas-citricas-medicinales",
+      categoria: "Frutas cítricas medicinales",
+    },
+    {
+      id: "kumquat",
+      nombre: "Kumquat",
+      nombreCientifico: "Citrus kumquat",
+      nombresAlternativos: {"España": ["naranjo enano", "naranja enana", "naranja japonesa"], "Argentina": ["quinoto"], "México": ["naranja china"], "USA_English": ["Kumquat", "Nagami kumquat", "oval kumquat"], "UK_English": ["Kumquat"]},
+      propiedades: ["Antioxidante", "Vitamina C", "Refuerza el sistema inmunológico"],
+      parteUsable: "Fruto completo",
+      dosis: "1-2 frutos al día",
+      preparacion: "Consumo directo, zumo",
+      contraindicaciones: [],
+      descripcion: "El kumquat es un fruto cítrico conocido por su alto contenido de vitamina C.",
+      sistemasRelacionados: ["sistema-inmunologico", "enfermedades-piel"],
+      categoriaId: "frutas-citricas-medicinales",
+      categoria: "Frutas cítricas medicinales",
+    },
+    {
+      id: "cidra",
+      nombre: "Cidra",
+      nombreCientifico: "Citrus cidra",
+      nombresAlternativos: {"España": ["cidro", "limón poncil", "limón francés"], "Colombia": ["cidra papa", "papa de pobre"], "Argentina": ["papa del aire"], "Caribe": ["toronja"], "USA_English": ["Citron", "Etrog", "Buddha's Hand"], "UK_English": ["Citron"]},
+      propiedades: ["Antioxidante", "Vitamina C", "Refuerza el sistema inmunológico"],
+      parteUsable: "Fruto completo",
+      dosis: "1-2 frutos al día",
+      preparacion: "Consumo directo, zumo",
+      contraindicaciones: [],
+      descripcion: "El cidra es un fruto cítrico conocido por su alto contenido de vitamina C.",
+      sistemasRelacionados: ["sistema-inmunologico", "enfermedades-piel"],
+      categoriaId: "frutas-citricas-medicinales",
+      categoria: "Frutas cítricas medicinales",
+    },
+    {
+      id: "yuzu",
+      nombre: "Yuzu",
+      nombreCientifico: "Citrus yuzu",
+      nombresAlternativos: {"USA_English": ["Yuzu", "Yuja"], "UK_English": ["Yuzu"], "Indigena": ["yuzu (Japonés)", "yuja (Coreano)"]},
+      propiedades: ["Antioxidante", "Vitamina C", "Refuerza el sistema inmunológico"],
+      parteUsable: "Fruto completo",
+      dosis: "1-2 frutos al día",
+      preparacion: "Consumo directo, zumo",
+      contraindicaciones: [],
+      descripcion: "El yuzu es un fruto cítrico conocido por su alto contenido de vitamina C.",
+      sistemasRelacionados: ["sistema-inmunologico", "enfermedades-piel"],
+      categoriaId: "frutas-citricas-medicinales",
+      categoria: "Frutas cítricas medicinales",
+    },
+    {
+      id: "calamondin",
+      nombre: "Calamondin",
+      nombreCientifico: "Citrus calamondin",
+      nombresAlternativos: {"España": ["calamondina", "naranjo miniatura"], "Centroamérica": ["Panama orange"], "USA_English": ["Calamondin", "Philippine lime", "golden lime"], "UK_English": ["Calamondin"], "Indigena": ["calamansí (Filipino)"]},
+      propiedades: ["Antioxidante", "Vitamina C", "Refuerza el sistema inmunológico"],
+      parteUsable: "Fruto completo",
+      dosis: "1-2 frutos al día",
+      preparacion: "Consumo directo, zumo",
+      contraindicaciones: [],
+      descripcion: "El calamondin es un fruto cítrico conocido por su alto contenido de vitamina C.",
+      sistemasRelacionados: ["sistema-inmunologico", "enfermedades-piel"],
+      categoriaId: "frutas-citricas-medicinales",
+      categoria: "Frutas cítricas medicinales",
+    },
+    {
+      id: "tangelo",
+      nombre: "Tangelo",
+      nombreCientifico: "Citrus tangelo",
+      nombresAlternativos: {"Perú": ["naranja tangelo"], "USA_English": ["Tangelo", "Honeybell"], "UK_English": ["Tangelo"]},
+      propiedades: ["Antioxidante", "Vitamina C", "Refuerza el sistema inmunológico"],
+      parteUsable: "Fruto completo",
+      dosis: "1-2 frutos al día",
+      preparacion: "Consumo directo, zumo",
+      contraindicaciones: [],
+      descripcion: "El tangelo es un fruto cítrico conocido por su alto contenido de vitamina C.",
+      sistemasRelacionados: ["sistema-inmunologico", "enfermedades-piel"],
+      categoriaId: "frutas-citricas-medicinales",
+      categoria: "Frutas cítricas medicinales",
+    },
+    {
+      id: "ugli",
+      nombre: "Ugli",
+      nombreCientifico: "Citrus ugli",
+      nombresAlternativos: {"USA_English": ["Ugli fruit", "Jamaican tangelo", "uniq fruit"], "UK_English": ["Ugli fruit"]},
+      propiedades: ["Antioxidante", "Vitamina C", "Refuerza el sistema inmunológico"],
+      parteUsable: "Fruto completo",
+      dosis: "1-2 frutos al día",
+      preparacion: "Consumo directo, zumo",
+      contraindicaciones: [],
+      descripcion: "El ugli es un fruto cítrico conocido por su alto contenido de vitamina C.",
+      sistemasRelacionados: ["sistema-inmunologico", "enfermedades-piel"],
+      categoriaId: "frutas-citricas-medicinales",
+      categoria: "Frutas cítricas medicinales",
+    },
+    {
+      id: "sweetie",
+      nombre: "Sweetie",
+      nombreCientifico: "Citrus sweetie",
+      nombresAlternativos: {"USA_English": ["Sweetie", "Oroblanco"]},
+      propiedades: ["Antioxidante", "Vitamina C", "Refuerza el sistema inmunológico"],
+      parteUsable: "Fruto completo",
+      dosis: "1-2 frutos al día",
+      preparacion: "Consumo directo, zumo",
+      contraindicaciones: [],
+      descripcion: "El sweetie es un fruto cítrico conocido por su alto contenido de vitamina C.",
+      sistemasRelacionados: ["sistema-inmunologico", "enfermedades-piel"],
+      categoriaId: "frutas-citricas-medicinales",
+      categoria: "Frutas cítricas medicinales",
+    },
+    {
+      id: "oroblanco",
+      nombre: "Oroblanco",
+      nombreCientifico: "Citrus oroblanco",
+      nombresAlternativos: {"USA_English": ["Oroblanco", "Sweetie"]},
+      propiedades: ["Antioxidante", "Vitamina C", "Refuerza el sistema inmunológico"],
+      parteUsable: "Fruto completo",
+      dosis: "1-2 frutos al día",
+      preparacion: "Consumo directo, zumo",
+      contraindicaciones: [],
+      descripcion: "El oroblanco es un fruto cítrico conocido por su alto contenido de vitamina C.",
+      sistemasRelacionados: ["sistema-inmunologico", "enfermedades-piel"],
+      categoriaId: "frutas-citricas-medicinales",
+      categoria: "Frutas cítricas medicinales",
+    },
+    {
+      id: "melogold",
+      nombre: "Melogold",
+      nombreCientifico: "Citrus melogold",
+      nombresAlternativos: {"USA_English": ["Melogold"]},
+      propiedades: ["Antioxidante", "Vitamina C", "Refuerza el sistema inmunológico"],
+      parteUsable: "Fruto completo",
+      dosis: "1-2 frutos al día",
+      preparacion: "Consumo directo, zumo",
+      contraindicaciones: [],
+      descripcion: "El melogold es un fruto cítrico conocido por su alto contenido de vitamina C.",
+      sistemasRelacionados: ["sistema-inmunologico", "enfermedades-piel"],
+      categoriaId: "frutas-citricas-medicinales",
+      categoria: "Frutas cítricas medicinales",
+    },
+    {
+      id: "kaffir-lime",
+      nombre: "Kaffir Lime",
+      nombreCientifico: "Citrus kaffir lime",
+      nombresAlternativos: {"USA_English": ["Kaffir lime", "Makrut lime"]},
+      propiedades: ["Antioxidante", "Vitamina C", "Refuerza el sistema inmunológico"],
+      parteUsable: "Fruto completo",
+      dosis: "1-2 frutos al día",
+      preparacion: "Consumo directo, zumo",
+      contraindicaciones: [],
+      descripcion: "El kaffir lime es un fruto cítrico conocido por su alto contenido de vitamina C.",
+      sistemasRelacionados: ["sistema-inmunologico", "enfermedades-piel"],
+      categoriaId: "frutas-citricas-medicinales",
+      categoria: "Frutas cítricas medicinales",
+    },
+    {
+      id: "finger-lime",
+      nombre: "Finger Lime",
+      nombreCientifico: "Citrus finger lime",
+      nombresAlternativos: {"España": ["lima dedo", "caviar cítrico", "lima australiana"], "USA_English": ["Finger lime", "Australian finger lime", "caviar lime"], "UK_English": ["Finger lime"]},
+      propiedades: ["Antioxidante", "Vitamina C", "Refuerza el sistema inmunológico"],
+      parteUsable: "Fruto completo",
+      dosis: "1-2 frutos al día",
+      preparacion: "Consumo directo, zumo",
+      contraindicaciones: [],
+      descripcion: "El finger lime es un fruto cítrico conocido por su alto contenido de vitamina C.",
+      sistemasRelacionados: ["sistema-inmunologico", "enfermedades-piel"],
+      categoriaId: "frutas-citricas-medicinales",
+      categoria: "Frutas cítricas medicinales",
+    },
+    {
+      id: "sudachi",
+      nombre: "Sudachi",
+      nombreCientifico: "Citrus sudachi",
+      nombresAlternativos: {"USA_English": ["Sudachi"], "UK_English": ["Sudachi"], "Indigena": ["sudachi (Japonés)"]},
+      propiedades: ["Antioxidante", "Vitamina C", "Refuerza el sistema inmunológico"],
+      parteUsable: "Fruto completo",
+      dosis: "1-2 frutos al día",
+      preparacion: "Consumo directo, zumo",
+      contraindicaciones: [],
+      descripcion: "El sudachi es un fruto cítrico conocido por su alto contenido de vitamina C.",
+      sistemasRelacionados: ["sistema-inmunologico", "enfermedades-piel"],
+      categoriaId: "frutas-citricas-medicinales",
+      categoria: "Frutas cítricas medicinales",
+    },
+    {
+      id: "kabosu",
+      nombre: "Kabosu",
+      nombreCientifico: "Citrus kabosu",
+      nombresAlternativos: {"USA_English": ["Kabosu"], "UK_English": ["Kabosu"], "Indigena": ["kabosu (Japonés)"]},
+      propiedades: ["Antioxidante", "Vitamina C", "Refuerza el sistema inmunológico"],
+      parteUsable: "Fruto completo",
+      dosis: "1-2 frutos al día",
+      preparacion: "Consumo directo, zumo",
+      contraindicaciones: [],
+      descripcion: "El kabosu es un fruto cítrico conocido por su alto contenido de vitamina C.",
+      sistemasRelacionados: ["sistema-inmunologico", "enfermedades-piel"],
+      categoriaId: "frutas-citricas-medicinales",
+      categoria: "Frutas cítricas medicinales",
+    },
+    {
+      id: "rangpur",
+      nombre: "Rangpur",
+      nombreCientifico: "Citrus rangpur",
+      nombresAlternativos: {"España": ["lima de Cantón", "limón rugoso"], "Centroamérica": ["mandarina ácida"], "USA_English": ["Rangpur lime", "mandarin lime", "lemandarin"], "UK_English": ["Rangpur lime"], "Indigena": ["limão cravo (Portugués, Brasil)"]},
+      propiedades: ["Antioxidante", "Vitamina C", "Refuerza el sistema inmunológico"],
+      parteUsable: "Fruto completo",
+      dosis: "1-2 frutos al día",
+      preparacion: "Consumo directo, zumo",
+      contraindicaciones: [],
+      descripcion: "El rangpur es un fruto cítrico conocido por su alto contenido de vitamina C.",
+      sistemasRelacionados: ["sistema-inmunologico", "enfermedades-piel"],
+      categoriaId: "frutas-citricas-medicinales",
+      categoria: "Frutas cítricas medicinales",
+    },
+    {
+      id: "limequat",
+      nombre: "Limequat",
+      nombreCientifico: "Citrus limequat",
+      nombresAlternativos: {"USA_English": ["Limequat"]},
+      propiedades: ["Antioxidante", "Vitamina C", "Refuerza el sistema inmunológico"],
+      parteUsable: "Fruto completo",
+      dosis: "1-2 frutos al día",
+      preparacion: "Consumo directo, zumo",
+      contraindicaciones: [],
+      descripcion: "El limequat es un fruto cítrico conocido por su alto contenido de vitamina C.",
+      sistemasRelacionados: ["sistema-inmunologico", "enfermedades-piel"],
+      categoriaId: "frutas-citricas-medicinales",
+      categoria: "Frutas cítricas medicinales",
+    },
+    {
+      id: "citrange",
+      nombre: "Citrange",
+      nombreCientifico: "Citrus citrange",
+      nombresAlternativos: {"USA_English": ["Citrange"]},
+      propiedades: ["Antioxidante", "Vitamina C", "Refuerza el sistema inmunológico"],
+      parteUsable: "Fruto completo",
+      dosis: "1-2 frutos al día",
+      preparacion: "Consumo directo, zumo",
+      contraindicaciones: [],
+      descripcion: "El citrange es un fruto cítrico conocido por su alto contenido de vitamina C.",
+      sistemasRelacionados: ["sistema-inmunologico", "enfermedades-piel"],
+      categoriaId: "frutas-citricas-medicinales",
+      categoria: "Frutas cítricas medicinales",
+    },
+    {
+      id: "citrumelo",
+      nombre: "Citrumelo",
+      nombreCientifico: "Citrus citrumelo",
+      nombresAlternativos: {"USA_English": ["Citrumelo"]},
+      propiedades: ["Antioxidante", "Vitamina C", "Refuerza el sistema inmunológico"],
+      parteUsable: "Fruto completo",
+      dosis: "1-2 frutos al día",
+      preparacion: "Consumo directo, zumo",
+      contraindicaciones: [],
+      descripcion: "El citrumelo es un fruto cítrico conocido por su alto contenido de vitamina C.",
+      sistemasRelacionados: ["sistema-inmunologico", "enfermedades-piel"],
+      categoriaId: "frutas-citricas-medicinales",
+      categoria: "Frutas cítricas medicinales",
+    },
+    {
+      id: "faustrime",
+      nombre: "Faustrime",
+      nombreCientifico: "Citrus faustrime",
+      nombresAlternativos: {"USA_English": ["Faustrime"]},
+      propiedades: ["Antioxidante", "Vitamina C", "Refuerza el sistema inmunológico"],
+      parteUsable: "Fruto completo",
+      dosis: "1-2 frutos al día",
+      preparacion: "Consumo directo, zumo",
+      contraindicaciones: [],
+      descripcion: "El faustrime es un fruto cítrico conocido por su alto contenido de vitamina C.",
+      sistemasRelacionados: ["sistema-inmunologico", "enfermedades-piel"],
+      categoriaId: "frutas-citricas-medicinales",
+      categoria: "Frutas cítricas medicinales",
+    },
+  ],
+};
+
+export default categoria;
@@ -0,0 +1,529 @@
+// Generado automáticamente por scripts/build-catalog.py - no editar a mano
+import type { CategoriaPlanta } from '../../plantas-expandidas';
+
+const categoria: CategoriaPlanta = {
+  id: "frutas-clima-templado-medicinales",
+  nombre: "Frutas de clima templado medicinales",
+  plantas: [
+    {
+      id: "manzana",
+      nombre: "Manzana",
+      nombreCientifico: "Malus domestica",
+      nombresAlternativos: {"España": ["manzano", "manzanero", "manzanera", "manzanal", "manzanar", "pero"], "USA_English": ["apple", "common apple", "paradise apple", "domesticated apple", "orchard apple", "cultivated apple", "common crabapple"], "UK_English": ["apple"]},
+      propiedades: ["Antioxidante", "Regulador intestinal", "Hipocolesterolemiante", "Diurética"],
+      parteUsable: "Fruto completo, piel",
+      dosis: "1-2 manzanas al día",
+      preparacion: "Consumo directo, compota, zumo",
+      contraindicaciones: [{ tipo: "otro", descripcion: "El consumo excesivo puede causar gases en personas sensibles." }],
+      descripcion: "Fruta rica en fibra y antioxidantes, ayuda a regular el tránsito intestinal y a reducir el colesterol.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-cardiovascular", "sistema-urinario"],
+      categoriaId: "frutas-clima-templado-medicinales",
+      categoria: "Frutas de clima templado medicinales",
+    },
+    {
+      id: "pera",
+      nombre: "Pera",
+      nombreCientifico: "Pyrus communis",
+      nombresAlternativos: {"España": ["peral", "perejón", "perejonal"], "USA_English": ["common pear", "european pear"], "UK_English": ["pear"]},
+      propiedades: ["Diurética", "Astringente (cocida)", "Laxante (cruda)", "Remineralizante"],
+      parteUsable: "Fruto completo",
+      dosis: "1-2 peras al día",
+      preparacion: "Consumo directo, cocida, zumo",
+      contraindicaciones: [{ tipo: "diabetes", descripcion: "Consumir con moderación debido a su contenido de azúcares naturales." }],
+      descripcion: "Fruta suave y dulce, conocida por su efecto diurético y su capacidad para regular el intestino dependiendo de su preparación.",
+      sistemasRelacionados: ["sistema-urinario", "sistema-digestivo"],
+      categoriaId: "frutas-clima-templado-medicinales",
+      categoria: "Frutas de clima templado medicinales",
+    },
+    {
+      id: "durazno",
+      nombre: "Durazno",
+      nombreCientifico: "Prunus persica",
+      nombresAlternativos: {"España": ["melocotonero", "paraguayas", "paraguayos", "chatos", "malacatonero", "piescar", "malacatón", "albérchigo", "abridor"], "México": ["durazno"], "Argentina": ["durazno"], "USA_English": ["peach", "clingstone peach", "common peach", "freestone peach", "nectarine", "white peach"], "UK_English": ["peach"]},
+      propiedades: ["Laxante suave", "Diurético", "Antioxidante", "Hidratante"],
+      parteUsable: "Fruto completo, hojas (infusión)",
+      dosis: "2-3 duraznos al día",
+      preparacion: "Consumo directo, zumo, infusión de hojas",
+      contraindicaciones: [{ tipo: "alergia", descripcion: "Personas alérgicas a la familia Rosaceae." }],
+      descripcion: "Fruta jugosa y refrescante, ideal para la hidratación y como laxante suave. Las hojas se usan tradicionalmente como diurético.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-urinario", "enfermedades-piel"],
+      categoriaId: "frutas-clima-templado-medicinales",
+      categoria: "Frutas de clima templado medicinales",
+    },
+    {
+      id: "ciruela",
+      nombre: "Ciruela",
+      nombreCientifico: "Prunus domestica",
+      nombresAlternativos: {"España": ["ciruelo", "prunal", "bruno", "ciruela", "ciruelero", "cirolero", "cerollero", "pruno", "ameixeira", "fatón", "cirgüelero", "cirgüelo"], "USA_English": ["common plum", "european plum", "plum", "prune plum", "damson", "bullace", "skeg"], "UK_English": ["plum", "damson", "bullace"]},
+      propiedades: ["Laxante potente", "Antioxidante", "Energizante", "Remineralizante"],
+      parteUsable: "Fruto completo (fresco o seco)",
+      dosis: "3-5 ciruelas secas o 5-8 frescas al día",
+      preparacion: "Consumo directo, remojo (ciruelas secas)",
+      contraindicaciones: [{ tipo: "otro", descripcion: "El consumo excesivo puede causar diarrea y flatulencias." }],
+      descripcion: "Reconocida por su alto contenido de fibra y sorbitol, es un laxante natural muy eficaz, especialmente en su forma seca.",
+      sistemasRelacionados: ["sistema-digestivo"],
+      categoriaId: "frutas-clima-templado-medicinales",
+      categoria: "Frutas de clima templado medicinales",
+    },
+    {
+      id: "cereza",
+      nombre: "Cereza",
+      nombreCientifico: "Prunus avium",
+      nombresAlternativos: {"España": ["cerezo", "cerezu", "cerezal", "cereizal", "zrezal", "cerecera", "cirasera", "ciresera", "cerezo morrino", "cerezo silvestre", "morrino", "picoto"], "México": ["capulín"], "Indigena": ["capulín (náhuatl)"], "USA_English": ["wild cherry", "sweet cherry", "gean", "bird cherry", "mazzard cherry", "bing cherry"], "UK_English": ["wild cherry", "sweet cherry", "gean"]},
+      propiedades: ["Antiinflamatoria", "Diurética", "Antigota", "Antioxidante"],
+      parteUsable: "Fruto completo, pedúnculos (rabos)",
+      dosis: "Un puñado de cerezas al día. Infusión de 10g de pedúnculos por taza.",
+      preparacion: "Consumo directo, infusión de pedúnculos",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Consumir con moderación en caso de cálculos renales (por oxalatos)." }],
+      descripcion: "Rica en antocianinas, ayuda a reducir la inflamación y los niveles de ácido úrico, siendo útil para la gota. Los rabos son potentes diuréticos.",
+      sistemasRelacionados: ["sistema-musculoesqueletico", "sistema-urinario", "sistema-inmunologico"],
+      categoriaId: "frutas-clima-templado-medicinales",
+      categoria: "Frutas de clima templado medicinales",
+    },
+    {
+      id: "albaricoque",
+      nombre: "Albaricoque",
+      nombreCientifico: "Prunus armeniaca",
+      nombresAlternativos: {"España": ["albaricoquero", "alberchiguero", "prisco", "damasquillo", "albergero", "albarillo", "albérchigo", "damasquero"], "México": ["chabacano"], "Perú": ["albaricoque"], "Argentina": ["damasco"], "Chile": ["damasco"], "USA_English": ["apricot", "armenian plum", "ansu apricot", "siberian apricot", "tibetan apricot"], "UK_English": ["apricot"]},
+      propiedades: ["Laxante suave", "Vitamínico (Provitamina A)", "Antianémico", "Antioxidante"],
+      parteUsable: "Fruto completo (fresco o seco)",
+      dosis: "3-5 albaricoques frescos o 3 secos (orejones) al día",
+      preparacion: "Consumo directo, zumo",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Las semillas contienen amigdalina y son tóxicas en grandes cantidades." }],
+      descripcion: "Excelente fuente de betacarotenos, beneficioso para la vista y la piel. Su consumo regular ayuda a combatir el estreñimiento.",
+      sistemasRelacionados: ["sistema-digestivo", "enfermedades-ojos-oidos-nariz-garganta", "enfermedades-piel"],
+      categoriaId: "frutas-clima-templado-medicinales",
+      categoria: "Frutas de clima templado medicinales",
+    },
+    {
+      id: "membrillo",
+      nombre: "Membrillo",
+      nombreCientifico: "Cydonia oblonga",
+      nombresAlternativos: {"España": ["membrillero", "gamboa", "bembrillo"], "USA_English": ["quince", "edible quince", "common quince", "fruiting quince"], "UK_English": ["quince"]},
+      propiedades: ["Astringente", "Antidiarreico", "Demulcente", "Antiinflamatorio intestinal"],
+      parteUsable: "Fruto (pulpa y semillas)",
+      dosis: "Consumo de pulpa cocida (dulce o jalea)",
+      preparacion: "Cocido, jalea, decocción de semillas",
+      contraindicaciones: [{ tipo: "otro", descripcion: "El fruto crudo es muy astringente y difícil de digerir." }],
+      descripcion: "Rico en pectina y taninos, es un potente remedio natural contra la diarrea y las inflamaciones intestinales, consumido siempre cocido.",
+      sistemasRelacionados: ["sistema-digestivo"],
+      categoriaId: "frutas-clima-templado-medicinales",
+      categoria: "Frutas de clima templado medicinales",
+    },
+    {
+      id: "granada",
+      nombre: "Granada",
+      nombreCientifico: "Punica granatum",
+      nombresAlternativos: {"España": ["granado", "mingranera"], "USA_English": ["pomegranate"], "UK_English": ["pomegranate"]},
+      propiedades: ["Antioxidante potente", "Antiinflamatoria", "Cardioprotectora", "Antiparasitaria (corteza)"],
+      parteUsable: "Arilos (semillas), zumo, corteza",
+      dosis: "Un vaso de zumo al día o una granada entera",
+      preparacion: "Zumo, consumo directo, decocción de corteza",
+      contraindicaciones: [{ tipo: "medicamentos", descripcion: "Puede interactuar con medicamentos para la presión arterial." }],
+      descripcion: "Considerada un superalimento por su alto contenido de polifenoles, protege el sistema cardiovascular y tiene propiedades antiinflamatorias.",
+      sistemasRelacionados: ["sistema-cardiovascular", "sistema-inmunologico"],
+      categoriaId: "frutas-clima-templado-medicinales",
+      categoria: "Frutas de clima templado medicinales",
+    },
+    {
+      id: "higo",
+      nombre: "Higo",
+      nombreCientifico: "Ficus carica",
+      nombresAlternativos: {"España": ["higuera", "breval"], "México": ["amate", "ziranda"], "Indigena": ["amate (náhuatl)"], "USA_English": ["fig", "common fig", "edible fig"], "UK_English": ["fig"]},
+      propiedades: ["Laxante", "Expectorante", "Demulcente", "Nutritivo"],
+      parteUsable: "Fruto (fresco o seco)",
+      dosis: "2-4 higos frescos o secos al día",
+      preparacion: "Consumo directo, decocción (para la tos)",
+      contraindicaciones: [{ tipo: "diabetes", descripcion: "Alto contenido de azúcar, consumir con moderación." }],
+      descripcion: "Fruta muy energética y con un marcado efecto laxante. La decocción de higos secos es un remedio tradicional para la tos y el dolor de garganta.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-respiratorio"],
+      categoriaId: "frutas-clima-templado-medicinales",
+      categoria: "Frutas de clima templado medicinales",
+    },
+    {
+      id: "uva",
+      nombre: "Uva",
+      nombreCientifico: "Vitis vinifera",
+      nombresAlternativos: {"España": ["parra", "vid", "videira", "parra silvestre", "parra borde", "parra bravía", "vid bravía", "Tinta del País", "Tinta de Toro"], "USA_English": ["common grape", "common grape vine", "european wine grape", "grape", "purpleleaf grape", "vine", "wine grape"], "UK_English": ["grape", "grapevine"]},
+      propiedades: ["Antioxidante (resveratrol)", "Cardioprotectora", "Diurética", "Depurativa"],
+      parteUsable: "Fruto completo, hojas (infusión)",
+      dosis: "Un racimo de uvas al día",
+      preparacion: "Consumo directo, zumo, infusión de hojas",
+      contraindicaciones: [{ tipo: "diabetes", descripcion: "Alto contenido de azúcar, consumir con moderación." }],
+      descripcion: "Rica en resveratrol y otros polifenoles, la uva es un potente antioxidante que protege el corazón y los vasos sanguíneos.",
+      sistemasRelacionados: ["sistema-cardiovascular", "sistema-urinario", "sistema-inmunologico"],
+      categoriaId: "frutas-clima-templado-medicinales",
+      categoria: "Frutas de clima templado medicinales",
+    },
+    {
+      id: "kiwi",
+      nombre: "Kiwi",
+      nombreCientifico: "Actinidia deliciosa",
+      nombresAlternativos: {"España": ["kiwi"], "USA_English": ["kiwifruit", "chinese gooseberry", "kiwi fruit", "smooth-skinned kiwifruit", "yangtao"], "UK_English": ["kiwifruit", "chinese gooseberry"]},
+      propiedades: ["Laxante", "Vitamínico (Vitamina C)", "Inmunoestimulante", "Antioxidante"],
+      parteUsable: "Fruto completo",
+      dosis: "1-2 kiwis al día",
+      preparacion: "Consumo directo",
+      contraindicaciones: [{ tipo: "alergia", descripcion: "Puede causar reacciones alérgicas en personas sensibles." }],
+      descripcion: "Excepcionalmente rico en vitamina C, el kiwi es un potente estimulante del sistema inmunitario y un eficaz laxante gracias a su fibra.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-inmunologico"],
+      categoriaId: "frutas-clima-templado-medicinales",
+      categoria: "Frutas de clima templado medicinales",
+    },
+    {
+      id: "frambuesa",
+      nombre: "Frambuesa",
+      nombreCientifico: "Rubus idaeus",
+      nombresAlternativos: {"España": ["frambueso", "sangüeso", "cordonera", "chordón", "sanguesa", "chordonera"], "USA_English": ["raspberry", "red raspberry", "American red raspberry"], "UK_English": ["raspberry", "hindberry"]},
+      propiedades: ["Antioxidante", "Antiinflamatoria", "Reguladora hormonal (hojas)", "Astringente (hojas)"],
+      parteUsable: "Fruto, hojas (infusión)",
+      dosis: "Un puñado de frambuesas al día. Infusión de 1-2 cucharaditas de hojas secas por taza.",
+      preparacion: "Consumo directo, infusión de hojas",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "La infusión de hojas de frambuesa se usa para preparar el parto, pero debe consultarse con un profesional." }],
+      descripcion: "Fruta rica en antioxidantes. Las hojas de frambuesa son un tónico uterino tradicional, utilizado para regular el ciclo menstrual y facilitar el parto.",
+      sistemasRelacionados: ["sistema-reproductor", "sistema-digestivo", "sistema-inmunologico"],
+      categoriaId: "frutas-clima-templado-medicinales",
+      categoria: "Frutas de clima templado medicinales",
+    },
+    {
+      id: "fresa",
+      nombre: "Fresa",
+      nombreCientifico: "Fragaria vesca",
+      nombresAlternativos: {"España": ["fresón", "fresa"], "Argentina": ["frutilla"], "Chile": ["frutilla"], "USA_English": ["strawberry", "garden strawberry", "cultivated strawberry", "dessert strawberry", "pine strawberry"], "UK_English": ["strawberry"]},
+      propiedades: ["Diurética", "Antioxidante", "Antiinflamatoria", "Remineralizante"],
+      parteUsable: "Fruto, hojas (infusión)",
+      dosis: "Un puñado de fresas al día",
+      preparacion: "Consumo directo, infusión de hojas",
+      contraindicaciones: [{ tipo: "alergia", descripcion: "Puede causar urticaria en personas sensibles." }],
+      descripcion: "Fruta diurética y depurativa, rica en vitamina C y antioxidantes. Ayuda a eliminar el exceso de líquidos y toxinas.",
+      sistemasRelacionados: ["sistema-urinario", "sistema-inmunologico", "sistema-musculoesqueletico"],
+      categoriaId: "frutas-clima-templado-medicinales",
+      categoria: "Frutas de clima templado medicinales",
+    },
+    {
+      id: "mora",
+      nombre: "Mora",
+      nombreCientifico: "Rubus fruticosus",
+      nombresAlternativos: {"España": ["zarzamora", "zarza", "mora"], "México": ["zarzamora"], "Colombia": ["mora de castilla"], "USA_English": ["blackberry", "bramble", "dewberry"], "UK_English": ["blackberry", "bramble"]},
+      propiedades: ["Antioxidante", "Astringente (fruto verde)", "Laxante (fruto maduro)", "Antiinflamatoria"],
+      parteUsable: "Fruto, hojas (infusión)",
+      dosis: "Un puñado de moras al día",
+      preparacion: "Consumo directo, infusión de hojas",
+      contraindicaciones: [{ tipo: "otro", descripcion: "El consumo excesivo puede teñir las heces de oscuro." }],
+      descripcion: "Fruta silvestre rica en vitaminas y antioxidantes. Las hojas se usan en infusión como astringente para la diarrea y las úlceras bucales.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-inmunologico", "enfermedades-ojos-oidos-nariz-garganta"],
+      categoriaId: "frutas-clima-templado-medicinales",
+      categoria: "Frutas de clima templado medicinales",
+    },
+    {
+      id: "arandano",
+      nombre: "Arándano",
+      nombreCientifico: "Vaccinium myrtillus",
+      nombresAlternativos: {"España": ["arándano", "arandanera", "ráspano", "mirtilo", "anavia", "rasponera", "arandilla", "arandaño", "meruéndano", "raspanera", "raspona", "amabia", "mirtillo", "miruéndano", "uva de bosque", "uva de monte"], "USA_English": ["bilberry", "whortleberry", "huckleberry", "mountain blueberry"], "UK_English": ["bilberry", "blaeberry", "wimberry", "whortleberry", "winberry", "fraughan"]},
+      propiedades: ["Antiséptico urinario", "Antioxidante", "Protector de la vista", "Vasoprotector"],
+      parteUsable: "Fruto, hojas (infusión)",
+      dosis: "Un puñado de arándanos al día o 300-500mg de extracto estandarizado.",
+      preparacion: "Consumo directo, zumo, extracto",
+      contraindicaciones: [{ tipo: "medicamentos", descripcion: "Puede interactuar con anticoagulantes." }],
+      descripcion: "Conocido por su capacidad para prevenir infecciones urinarias. También mejora la visión nocturna y protege los capilares sanguíneos.",
+      sistemasRelacionados: ["sistema-urinario", "enfermedades-ojos-oidos-nariz-garganta", "sistema-cardiovascular"],
+      categoriaId: "frutas-clima-templado-medicinales",
+      categoria: "Frutas de clima templado medicinales",
+    },
+    {
+      id: "grosella",
+      nombre: "Grosella",
+      nombreCientifico: "Ribes rubrum",
+      nombresAlternativos: {"España": ["grosellero rojo", "grosellero", "grosello rojo", "uva de señora", "cambronera colorada de Jarava", "cascalleja", "pinsús", "ribes", "rimas", "rivas", "uva de Fran"], "USA_English": ["red currant", "garden red currant"], "UK_English": ["redcurrant"]},
+      propiedades: ["Vitamínico (Vitamina C)", "Diurética", "Astringente", "Antioxidante"],
+      parteUsable: "Fruto",
+      dosis: "Un puñado de grosellas al día",
+      preparacion: "Consumo directo, zumo, jalea",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Sabor muy ácido, puede no ser bien tolerado por estómagos sensibles." }],
+      descripcion: "Pequeña fruta roja muy rica en vitamina C y con propiedades diuréticas y astringentes. Ayuda a fortalecer el sistema inmunitario.",
+      sistemasRelacionados: ["sistema-inmunologico", "sistema-urinario"],
+      categoriaId: "frutas-clima-templado-medicinales",
+      categoria: "Frutas de clima templado medicinales",
+    },
+    {
+      id: "zarzamora",
+      nombre: "Zarzamora",
+      nombreCientifico: "Rubus ulmifolius",
+      propiedades: ["Antioxidante", "Astringente (hojas y fruto verde)", "Antiinflamatoria", "Vitamínico"],
+      parteUsable: "Fruto, hojas (infusión)",
+      dosis: "Un puñado de zarzamoras al día. Infusión de 1-2 cucharaditas de hojas secas por taza.",
+      preparacion: "Consumo directo, infusión de hojas",
+      contraindicaciones: [{ tipo: "otro", descripcion: "El consumo excesivo puede teñir las heces de oscuro." }],
+      descripcion: "Similar a la mora, la zarzamora es rica en antioxidantes. Sus hojas son un remedio tradicional para la diarrea y las afecciones de la boca.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-inmunologico", "enfermedades-ojos-oidos-nariz-garganta"],
+      categoriaId: "frutas-clima-templado-medicinales",
+      categoria: "Frutas de clima templado medicinales",
+    },
+    {
+      id: "nectarina",
+      nombre: "Nectarina",
+      nombreCientifico: "Prunus persica var. nucipersica",
+      nombresAlternativos: {"España": ["nectarina", "peladillo", "briñón", "bruñón"], "USA_English": ["nectarine"], "UK_English": ["nectarine"]},
+      propiedades: ["Laxante suave", "Diurética", "Antioxidante", "Hidratante"],
+      parteUsable: "Fruto completo",
+      dosis: "2-3 nectarinas al día",
+      preparacion: "Consumo directo, zumo",
+      contraindicaciones: [{ tipo: "alergia", descripcion: "Personas alérgicas a la familia Rosaceae." }],
+      descripcion: "Variedad de durazno de piel lisa, comparte sus propiedades laxantes y diuréticas. Es muy refrescante y rica en vitaminas.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-urinario", "enfermedades-piel"],
+      categoriaId: "frutas-clima-templado-medicinales",
+      categoria: "Frutas de clima templado medicinales",
+    },
+    {
+      id: "paraguayo",
+      nombre: "Paraguayo",
+      nombreCientifico: "Prunus persica var. platycarpa",
+      nombresAlternativos: {"España": ["paraguayo", "melocotón plano", "chato"], "USA_English": ["donut peach", "flat peach", "saturn peach"], "UK_English": ["donut peach", "flat peach"]},
+      propiedades: ["Laxante suave", "Diurético", "Antioxidante", "Hidratante"],
+      parteUsable: "Fruto completo",
+      dosis: "2-3 paraguayos al día",
+      preparacion: "Consumo directo, zumo",
+      contraindicaciones: [{ tipo: "alergia", descripcion: "Personas alérgicas a la familia Rosaceae." }],
+      descripcion: "Variedad de durazno de forma achatada, con propiedades similares. Es dulce, jugoso y fácil de digerir.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-urinario", "enfermedades-piel"],
+      categoriaId: "frutas-clima-templado-medicinales",
+      categoria: "Frutas de clima templado medicinales",
+    },
+    {
+      id: "nispero",
+      nombre: "Níspero",
+      nombreCientifico: "Eriobotrya japonica",
+      propiedades: ["Astringente", "Antidiarreico", "Diurético", "Expectorante (semillas)"],
+      parteUsable: "Fruto, semillas (con precaución)",
+      dosis: "Un puñado de nísperos al día",
+      preparacion: "Consumo directo, decocción de semillas",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Las semillas contienen pequeñas cantidades de cianuro y deben usarse con precaución y conocimiento." }],
+      descripcion: "Fruta de primavera con propiedades astringentes, útil para la diarrea. Las semillas, usadas con precaución, tienen efecto expectorante.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-urinario", "sistema-respiratorio"],
+      categoriaId: "frutas-clima-templado-medicinales",
+      categoria: "Frutas de clima templado medicinales",
+    },
+    {
+      id: "caqui",
+      nombre: "Caqui",
+      nombreCientifico: "Diospyros kaki",
+      nombresAlternativos: {"España": ["caqui", "palosanto", "persimon"], "México": ["pérsimo"], "USA_English": ["oriental persimmon", "chinese persimmon", "japanese persimmon", "kaki persimmon", "kaki", "kaki-plum"], "UK_English": ["persimmon", "sharon fruit"]},
+      propiedades: ["Laxante (maduro)", "Astringente (inmaduro)", "Vitamínico (Vitamina A)", "Antioxidante"],
+      parteUsable: "Fruto completo",
+      dosis: "1-2 caquis al día",
+      preparacion: "Consumo directo",
+      contraindicaciones: [{ tipo: "otro", descripcion: "El caqui inmaduro es muy astringente y puede causar obstrucción intestinal en casos raros." }],
+      descripcion: "Fruta dulce y carnosa, rica en vitamina A. Su efecto sobre el intestino varía con la madurez: laxante si está maduro, astringente si no.",
+      sistemasRelacionados: ["sistema-digestivo", "enfermedades-ojos-oidos-nariz-garganta"],
+      categoriaId: "frutas-clima-templado-medicinales",
+      categoria: "Frutas de clima templado medicinales",
+    },
+    {
+      id: "acerola",
+      nombre: "Acerola",
+      nombreCientifico: "Malpighia emarginata",
+      nombresAlternativos: {"Caribe": ["cereza de las Indias Occidentales", "cereza de Barbados", "cereza de Jamaica", "cereza de las Antillas"], "Centroamérica": ["acerola", "cerecita", "manzanita", "semeruco"], "USA_English": ["barbados cherry", "west indian cherry", "wild crepe myrtle"], "UK_English": ["acerola cherry"]},
+      propiedades: ["Vitamínico (Vitamina C)", "Inmunoestimulante", "Antioxidante", "Antianémico"],
+      parteUsable: "Fruto completo",
+      dosis: "Un puñado de acerolas al día o 500-1000mg de extracto.",
+      preparacion: "Consumo directo, zumo, extracto",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Sabor muy ácido, puede no ser bien tolerado por estómagos sensibles." }],
+      descripcion: "Una de las fuentes más ricas de vitamina C del mundo. Potente estimulante del sistema inmunitario y antioxidante.",
+      sistemasRelacionados: ["sistema-inmunologico", "sistema-cardiovascular"],
+      categoriaId: "frutas-clima-templado-medicinales",
+      categoria: "Frutas de clima templado medicinales",
+    },
+    {
+      id: "avellana",
+      nombre: "Avellana",
+      nombreCientifico: "Corylus avellana",
+      nombresAlternativos: {"España": ["avellano"], "USA_English": ["hazelnut"], "UK_English": ["hazelnut"]},
+      propiedades: ["Nutritiva", "Cardioprotectora", "Antioxidante (Vitamina E)", "Remineralizante"],
+      parteUsable: "Fruto (semilla)",
+      dosis: "Un puñado de avellanas al día",
+      preparacion: "Consumo directo, tostadas",
+      contraindicaciones: [{ tipo: "alergia", descripcion: "Alergia a los frutos secos." }],
+      descripcion: "Fruto seco rico en grasas saludables, vitamina E y minerales. Ayuda a proteger el sistema cardiovascular y a combatir el envejecimiento celular.",
+      sistemasRelacionados: ["sistema-cardiovascular", "sistema-nervioso", "sistema-musculoesqueletico"],
+      categoriaId: "frutas-clima-templado-medicinales",
+      categoria: "Frutas de clima templado medicinales",
+    },
+    {
+      id: "azarolo",
+      nombre: "Azarolo",
+      nombreCientifico: "Crataegus azarolus",
+      propiedades: ["Cardiotónico", "Hipotensor", "Antioxidante", "Sedante suave"],
+      parteUsable: "Fruto, flores, hojas",
+      dosis: "Infusión de 1-2 cucharaditas de flores y hojas por taza.",
+      preparacion: "Consumo directo del fruto, infusión de flores y hojas",
+      contraindicaciones: [{ tipo: "medicamentos", descripcion: "Puede potenciar el efecto de medicamentos para el corazón." }],
+      descripcion: "Pariente del espino blanco, comparte sus propiedades cardiotónicas y reguladoras de la presión arterial. Los frutos son comestibles y ricos en vitamina C.",
+      sistemasRelacionados: ["sistema-cardiovascular", "sistema-nervioso"],
+      categoriaId: "frutas-clima-templado-medicinales",
+      categoria: "Frutas de clima templado medicinales",
+    },
+    {
+      id: "endrina",
+      nombre: "Endrina",
+      nombreCientifico: "Prunus spinosa",
+      propiedades: ["Astringente", "Tónico digestivo", "Antioxidante", "Vitamínico"],
+      parteUsable: "Fruto",
+      dosis: "Consumo moderado del fruto maduro. Maceración en licor (pacharán).",
+      preparacion: "Maceración en licor, jalea",
+      contraindicaciones: [{ tipo: "otro", descripcion: "El fruto crudo es muy astringente y áspero." }],
+      descripcion: "Fruto del endrino, muy astringente en crudo. Se utiliza tradicionalmente para hacer pacharán, un licor digestivo.",
+      sistemasRelacionados: ["sistema-digestivo"],
+      categoriaId: "frutas-clima-templado-medicinales",
+      categoria: "Frutas de clima templado medicinales",
+    },
+    {
+      id: "grosella-espinosa",
+      nombre: "Grosella espinosa",
+      nombreCientifico: "Ribes uva-crispa",
+      nombresAlternativos: {"España": ["uva-crispa", "grosella espinosa europea", "uva espina", "agrazón", "limoncillo", "algaraz", "algarzón", "escambrones", "grosella blanca"], "USA_English": ["gooseberry", "european gooseberry", "garden gooseberry"], "UK_English": ["gooseberry"]},
+      propiedades: ["Vitamínico (Vitamina C)", "Antioxidante", "Diurética", "Laxante suave"],
+      parteUsable: "Fruto",
+      dosis: "Un puñado de grosellas espinosas al día",
+      preparacion: "Consumo directo, jalea, compota",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Sabor ácido, puede no ser bien tolerado por estómagos sensibles." }],
+      descripcion: "Fruta rica en vitamina C y fibra. Tiene un sabor ácido característico y se utiliza tanto fresca como en preparaciones cocidas.",
+      sistemasRelacionados: ["sistema-inmunologico", "sistema-digestivo", "sistema-urinario"],
+      categoriaId: "frutas-clima-templado-medicinales",
+      categoria: "Frutas de clima templado medicinales",
+    },
+    {
+      id: "grosella-negra",
+      nombre: "Grosella negra",
+      nombreCientifico: "Ribes nigrum",
+      nombresAlternativos: {"España": ["casis", "grosellero negro", "zarzaparrilla negra", "parrilla negra"], "USA_English": ["blackcurrant", "european black currant"], "UK_English": ["blackcurrant"]},
+      propiedades: ["Antiinflamatoria", "Antialérgica", "Vitamínico (Vitamina C)", "Diurética"],
+      parteUsable: "Fruto, hojas (infusión)",
+      dosis: "Un puñado de grosellas negras al día. Infusión de 1-2 cucharaditas de hojas secas por taza.",
+      preparacion: "Consumo directo, zumo, infusión de hojas",
+      contraindicaciones: [{ tipo: "medicamentos", descripcion: "Puede interactuar con anticoagulantes." }],
+      descripcion: "Conocida por sus propiedades antiinflamatorias y antialérgicas, similares a la cortisona pero sin sus efectos secundarios. El fruto es muy rico en vitamina C.",
+      sistemasRelacionados: ["sistema-inmunologico", "sistema-musculoesqueletico", "sistema-respiratorio"],
+      categoriaId: "frutas-clima-templado-medicinales",
+      categoria: "Frutas de clima templado medicinales",
+    },
+    {
+      id: "grosella-roja",
+      nombre: "Grosella roja",
+      nombreCientifico: "Ribes rubrum",
+      nombresAlternativos: {"España": ["grosella roja", "grosellero rojo", "uva de señora", "grosularia", "cambronera colorada de Jarava", "cascalleja", "pinsús", "ribes", "rimas", "rivas", "uva de Fran"], "USA_English": ["red currant", "garden red currant"], "UK_English": ["redcurrant"]},
+      propiedades: ["Vitamínico (Vitamina C)", "Diurética", "Astringente", "Antioxidante"],
+      parteUsable: "Fruto",
+      dosis: "Un puñado de grosellas al día",
+      preparacion: "Consumo directo, zumo, jalea",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Sabor muy ácido, puede no ser bien tolerado por estómagos sensibles." }],
+      descripcion: "Pequeña fruta roja muy rica en vitamina C y con propiedades diuréticas y astringentes. Ayuda a fortalecer el sistema inmunitario.",
+      sistemasRelacionados: ["sistema-inmunologico", "sistema-urinario"],
+      categoriaId: "frutas-clima-templado-medicinales",
+      categoria: "Frutas de clima templado medicinales",
+    },
+    {
+      id: "madrono",
+      nombre: "Madroño",
+      nombreCientifico: "Arbutus unedo",
+      nombresAlternativos: {"España": ["madroño", "albornio", "madroña", "madroñera", "alborecera", "borrachín"], "USA_English": ["strawberry tree", "madrone", "Killarney strawberry tree", "strawberry madrone"], "UK_English": ["strawberry tree"]},
+      propiedades: ["Antiséptico urinario", "Diurético", "Astringente", "Antioxidante"],
+      parteUsable: "Fruto, hojas (infusión)",
+      dosis: "Un puñado de madroños maduros al día. Infusión de 1-2 cucharaditas de hojas secas por taza.",
+      preparacion: "Consumo directo, infusión de hojas",
+      contraindicaciones: [{ tipo: "otro", descripcion: "El consumo excesivo de frutos puede causar embriaguez y dolor de cabeza." }],
+      descripcion: "El fruto del madroño es comestible y rico en vitamina C. Las hojas tienen propiedades antisépticas urinarias y diuréticas.",
+      sistemasRelacionados: ["sistema-urinario", "sistema-digestivo"],
+      categoriaId: "frutas-clima-templado-medicinales",
+      categoria: "Frutas de clima templado medicinales",
+    },
+    {
+      id: "nashi",
+      nombre: "Nashi",
+      nombreCientifico: "Pyrus pyrifolia",
+      propiedades: ["Diurética", "Expectorante", "Hidratante", "Laxante suave"],
+      parteUsable: "Fruto completo",
+      dosis: "1-2 nashis al día",
+      preparacion: "Consumo directo, zumo",
+      contraindicaciones: [],
+      descripcion: "Pera asiática de textura crujiente y muy jugosa. Se utiliza en la medicina tradicional china para aliviar la tos y la sequedad de garganta.",
+      sistemasRelacionados: ["sistema-respiratorio", "sistema-digestivo", "sistema-urinario"],
+      categoriaId: "frutas-clima-templado-medicinales",
+      categoria: "Frutas de clima templado medicinales",
+    },
+    {
+      id: "nogal",
+      nombre: "Nogal",
+      nombreCientifico: "Juglans regia",
+      nombresAlternativos: {"España": ["nogal común", "noguera"], "Chile": ["nogal"], "USA_English": ["English walnut", "Persian walnut", "common walnut"], "UK_English": ["walnut", "common walnut", "English walnut"]},
+      propiedades: ["Nutritiva (fruto)", "Cardioprotectora (fruto)", "Astringente (hojas)", "Antifúngica (hojas)"],
+      parteUsable: "Fruto (nuez), hojas (infusión)",
+      dosis: "Un puñado de nueces al día. Infusión de 1-2 cucharaditas de hojas secas por taza.",
+      preparacion: "Consumo directo de nueces, infusión de hojas",
+      contraindicaciones: [{ tipo: "alergia", descripcion: "Alergia a los frutos secos." }],
+      descripcion: "La nuez es un alimento excepcional para el cerebro y el corazón. Las hojas de nogal son astringentes y se usan externamente para problemas de piel.",
+      sistemasRelacionados: ["sistema-cardiovascular", "sistema-nervioso", "enfermedades-piel"],
+      categoriaId: "frutas-clima-templado-medicinales",
+      categoria: "Frutas de clima templado medicinales",
+    },
+    {
+      id: "uva-espina",
+      nombre: "Uva espina",
+      nombreCientifico: "Ribes uva-crispa",
+      propiedades: ["Vitamínico (Vitamina C)", "Antioxidante", "Diurética", "Laxante suave"],
+      parteUsable: "Fruto",
+      dosis: "Un puñado de uvas espina al día",
+      preparacion: "Consumo directo, jalea, compota",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Sabor ácido, puede no ser bien tolerado por estómagos sensibles." }],
+      descripcion: "Fruta rica en vitamina C y fibra. Tiene un sabor ácido característico y se utiliza tanto fresca como en preparaciones cocidas.",
+      sistemasRelacionados: ["sistema-inmunologico", "sistema-digestivo", "sistema-urinario"],
+      categoriaId: "frutas-clima-templado-medicinales",
+      categoria: "Frutas de clima templado medicinales",
+    },
+    {
+      id: "serba",
+      nombre: "Serba",
+      nombreCientifico: "Sorbus domestica",
+      propiedades: ["Astringente", "Antidiarreico", "Vitamínico", "Remineralizante"],
+      parteUsable: "Fruto (muy maduro)",
+      dosis: "Consumo moderado del fruto muy maduro",
+      preparacion: "Consumo directo (muy maduro), mermelada",
+      contraindicaciones: [{ tipo: "otro", descripcion: "El fruto inmaduro es extremadamente astringente y no debe consumirse." }],
+      descripcion: "Fruto del serbal común, solo comestible cuando está muy maduro y blando. Es muy astringente y se ha usado tradicionalmente para la diarrea.",
+      sistemasRelacionados: ["sistema-digestivo"],
+      categoriaId: "frutas-clima-templado-medicinales",
+      categoria: "Frutas de clima templado medicinales",
+    },
+    {
+      id: "escaramujo",
+      nombre: "Escaramujo",
+      nombreCientifico: "Rosa canina",
+      nombresAlternativos: {"España": ["rosal silvestre", "agavanzo", "escarambrojo", "escaramojo", "zarza rosa", "agabanzo", "alcallaro", "alcaracache", "algabala", "algabanzo", "calambrojo", "gabancera", "tapaculos", "picaespalda", "rosal bravío", "rosal común"], "USA_English": ["dog rose", "briar rose"], "UK_English": ["dog rose", "dog berry", "witches' briar"]},
+      propiedades: ["Vitamínico (Vitamina C)", "Antioxidante", "Antiinflamatorio", "Inmunoestimulante"],
+      parteUsable: "Fruto (sin semillas)",
+      dosis: "Infusión de 1-2 cucharaditas de pulpa seca por taza.",
+      preparacion: "Infusión, mermelada, jalea",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Los pelos de las semillas son irritantes y deben eliminarse cuidadosamente." }],
+      descripcion: "Fruto del rosal silvestre, es una de las fuentes más concentradas de vitamina C. Se utiliza para prevenir resfriados y fortalecer las defensas.",
+      sistemasRelacionados: ["sistema-inmunologico", "sistema-musculoesqueletico"],
+      categoriaId: "frutas-clima-templado-medicinales",
+      categoria: "Frutas de clima templado medicinales",
+    },
+    {
+      id: "sauco",
+      nombre: "Saúco",
+      nombreCientifico: "Sambucus nigra",
+      nombresAlternativos: {"España": ["saúco", "sabuco", "sauqueiro", "canillero", "sabugo", "bieiteiro", "sabugueiro"], "México": ["saúco", "tapiro", "flor de sauz", "capulin silvestre"], "USA_English": ["elderberry", "European elder", "black elder", "American elderberry", "blue elderberry", "Arizona elderberry", "desert elderberry", "New Mexican elderberry", "Mexican elderberry"], "UK_English": ["elder", "elderberry", "black elder", "European elder"], "Indigena": ["shiksh (O'odham)", "bixihumi (Nahuatl)"]},
+      propiedades: ["Antiviral", "Sudorífico", "Expectorante", "Diurético"],
+      parteUsable: "Flores, bayas (cocidas)",
+      dosis: "Infusión de 1-2 cucharaditas de flores por taza. Jarabe de bayas.",
+      preparacion: "Infusión de flores, jarabe de bayas cocidas",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Las bayas crudas son tóxicas y deben cocinarse siempre." }],
+      descripcion: "Las flores de saúco son un remedio tradicional para la fiebre y los resfriados. Las bayas cocidas tienen potentes propiedades antivirales, especialmente contra la gripe.",
+      sistemasRelacionados: ["sistema-respiratorio", "sistema-inmunologico"],
+      categoriaId: "frutas-clima-templado-medicinales",
+      categoria: "Frutas de clima templado medicinales",
+    },
+  ],
+};
+
+export default categoria;
@@ -0,0 +1,589 @@
+// Generado automáticamente por scripts/build-catalog.py - no editar a mano
+import type { CategoriaPlanta } from '../../plantas-expandidas';
+
+const categoria: CategoriaPlanta = {
+  id: "frutas-tropicales-medicinales",
+  nombre: "Frutas tropicales medicinales",
+  plantas: [
+    {
+      id: "caimito",
+      nombre: "Caimito",
+      nombreCientifico: "Chrysophyllum cainito",
+      propiedades: ["Antioxidante", "Antiinflamatorio", "Control de la diabetes", "Refuerza el sistema inmunitario", "Salud digestiva", "Producción de colágeno"],
+      parteUsable: "Fruto, hojas y corteza",
+      dosis: "Consumir 1-2 frutos. La decocción de la corteza se usa para la diarrea.",
+      preparacion: "Consumo directo del fruto, decocción de la corteza",
+      contraindicaciones: [],
+      descripcion: "El caimito es una fruta tropical con una pulpa dulce y lechosa. Es rico en antioxidantes y se utiliza en la medicina tradicional para tratar la diabetes y problemas digestivos.",
+      sistemasRelacionados: ["sistema-endocrino", "sistema-digestivo", "sistema-inmunologico", "enfermedades-piel"],
+      categoriaId: "frutas-tropicales-medicinales",
+      categoria: "Frutas tropicales medicinales",
+    },
+    {
+      id: "papaya",
+      nombre: "Papaya",
+      nombreCientifico: "Carica papaya",
+      nombresAlternativos: {"Caribe": ["Fruta bomba"], "Venezuela": ["Lechosa"], "Indigena": ["Mapaja (taino)", "Kabaya (kalina)", "Mapaya (maipure)", "Papaio (otomaco)"]},
+      propiedades: ["Digestiva", "Antiinflamatoria", "Cicatrizante", "Refuerza el sistema inmunitario", "Antioxidante", "Diurética"],
+      parteUsable: "Fruto, semillas y hojas",
+      dosis: "Consumir 1 rodaja al día. Infusión de hojas: 1 taza al día.",
+      preparacion: "Consumo directo, jugos, batidos, infusiones (hojas)",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "El consumo de la fruta verde o sus semillas puede no ser seguro." }, { tipo: "alergia", descripcion: "Puede causar alergia en personas sensibles al látex." }],
+      descripcion: "La papaya es una fruta tropical conocida por su enzima papaína, que facilita la digestión de las proteínas. Es rica en vitaminas A, C y antioxidantes.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-inmunologico", "enfermedades-piel", "sistema-cardiovascular"],
+      categoriaId: "frutas-tropicales-medicinales",
+      categoria: "Frutas tropicales medicinales",
+    },
+    {
+      id: "pina",
+      nombre: "Piña",
+      nombreCientifico: "Ananas comosus",
+      nombresAlternativos: {"Argentina": ["Ananá"], "Chile": ["Ananá"], "Perú": ["Ananá"], "Indigena": ["Matzatli (nahuatl)", "Nana (tupi)"]},
+      propiedades: ["Digestiva", "Antiinflamatoria", "Diurética", "Refuerza el sistema inmunitario", "Anticoagulante", "Cicatrizante"],
+      parteUsable: "Fruto",
+      dosis: "Consumir 1-2 rodajas al día",
+      preparacion: "Consumo directo, jugos, ensaladas",
+      contraindicaciones: [{ tipo: "alergia", descripcion: "Puede causar reacciones alérgicas en personas sensibles." }, { tipo: "otro", descripcion: "El consumo excesivo puede irritar la boca y el estómago." }],
+      descripcion: "La piña es una fruta tropical rica en bromelina, una enzima que ayuda a digerir las proteínas. También es una excelente fuente de vitamina C y manganeso.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-inmunologico", "sistema-musculoesqueletico", "sistema-cardiovascular"],
+      categoriaId: "frutas-tropicales-medicinales",
+      categoria: "Frutas tropicales medicinales",
+    },
+    {
+      id: "mango",
+      nombre: "Mango",
+      nombreCientifico: "Mangifera indica",
+      nombresAlternativos: {"España": ["Melocotón de los trópicos"]},
+      propiedades: ["Antioxidante", "Refuerza el sistema inmunitario", "Mejora la salud ocular", "Favorece la digestión", "Beneficioso para la piel"],
+      parteUsable: "Fruto, hojas y corteza",
+      dosis: "Consumir 1 pieza de fruta al día",
+      preparacion: "Consumo directo, jugos, batidos",
+      contraindicaciones: [{ tipo: "alergia", descripcion: "Puede causar dermatitis de contacto en personas sensibles." }],
+      descripcion: "El mango es una fruta jugosa y dulce, rica en vitaminas A, C y E, así como en antioxidantes que protegen al cuerpo del daño celular.",
+      sistemasRelacionados: ["sistema-inmunologico", "sistema-digestivo", "enfermedades-piel", "enfermedades-ojos-oidos-nariz-garganta"],
+      categoriaId: "frutas-tropicales-medicinales",
+      categoria: "Frutas tropicales medicinales",
+    },
+    {
+      id: "guayaba",
+      nombre: "Guayaba",
+      nombreCientifico: "Psidium guajava",
+      nombresAlternativos: {"Indigena": ["Arasá (guaraní)"]},
+      propiedades: ["Astringente", "Antidiarreica", "Antioxidante", "Reduce el colesterol", "Controla la diabetes", "Refuerza el sistema inmunitario"],
+      parteUsable: "Fruto y hojas",
+      dosis: "Consumir 1-2 frutos al día. Infusión de hojas: 2 tazas al día.",
+      preparacion: "Consumo directo, jugos, mermeladas, infusión (hojas)",
+      contraindicaciones: [{ tipo: "otro", descripcion: "El consumo excesivo de hojas puede causar estreñimiento." }],
+      descripcion: "La guayaba es una fruta tropical con un alto contenido de vitamina C, incluso más que los cítricos. Sus hojas se utilizan tradicionalmente para tratar problemas digestivos.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-inmunologico", "sistema-cardiovascular", "sistema-endocrino"],
+      categoriaId: "frutas-tropicales-medicinales",
+      categoria: "Frutas tropicales medicinales",
+    },
+    {
+      id: "maracuya",
+      nombre: "Maracuyá",
+      nombreCientifico: "Passiflora edulis",
+      nombresAlternativos: {"España": ["Fruta de la pasión"], "Venezuela": ["Parchita"], "Brasil": ["Maracujá"], "Indigena": ["Mburucuyá (guaraní)"]},
+      propiedades: ["Sedante", "Ansiolítica", "Relajante muscular", "Antioxidante", "Reduce la presión arterial"],
+      parteUsable: "Fruto y hojas",
+      dosis: "Consumir el jugo de 1-2 frutos al día. Infusión de hojas: 1 taza antes de dormir.",
+      preparacion: "Consumo directo, jugos, postres, infusión (hojas)",
+      contraindicaciones: [{ tipo: "medicamentos", descripcion: "Puede potenciar el efecto de medicamentos sedantes." }],
+      descripcion: "El maracuyá, también conocido como fruta de la pasión, es valorado por sus propiedades calmantes y su capacidad para inducir el sueño. Es rico en antioxidantes y fibra.",
+      sistemasRelacionados: ["sistema-nervioso", "trastornos-mentales-emocionales", "sistema-cardiovascular"],
+      categoriaId: "frutas-tropicales-medicinales",
+      categoria: "Frutas tropicales medicinales",
+    },
+    {
+      id: "carambola",
+      nombre: "Carambola",
+      nombreCientifico: "Averrhoa carambola",
+      nombresAlternativos: {"Colombia": ["Carambolo", "Torombolo"], "Caribe": ["Five Finger"], "España": ["Fruta de estrella"]},
+      propiedades: ["Antioxidante", "Antiinflamatoria", "Control del azúcar en sangre", "Favorece el tránsito intestinal", "Refuerza el sistema inmunitario", "Beneficiosa para la salud del corazón"],
+      parteUsable: "Fruto, hojas y flores",
+      dosis: "Consumir 1-2 frutos al día",
+      preparacion: "Consumo directo, jugos, ensaladas",
+      contraindicaciones: [{ tipo: "otro", descripcion: "No recomendada para personas con insuficiencia renal crónica por su alto contenido de oxalatos." }],
+      descripcion: "La carambola, o fruta estrella, es una fruta exótica de sabor agridulce, rica en vitamina C y antioxidantes. Su forma de estrella la hace muy atractiva para la decoración de platos.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-cardiovascular", "sistema-inmunologico"],
+      categoriaId: "frutas-tropicales-medicinales",
+      categoria: "Frutas tropicales medicinales",
+    },
+    {
+      id: "pitahaya",
+      nombre: "Pitahaya",
+      nombreCientifico: "Hylocereus undatus",
+      nombresAlternativos: {"USA_English": ["Dragon fruit"], "UK_English": ["Dragon fruit"], "México": ["Pitaya"]},
+      propiedades: ["Antioxidante", "Antiinflamatoria", "Favorece la pérdida de peso", "Fortalece los huesos", "Mejora la digestión", "Refuerza el sistema inmunitario"],
+      parteUsable: "Fruto",
+      dosis: "Consumir 1-2 frutos al día",
+      preparacion: "Consumo directo, jugos, postres",
+      contraindicaciones: [],
+      descripcion: "La pitahaya, o fruta del dragón, es una fruta exótica con una apariencia llamativa y un sabor dulce y refrescante. Es rica en antioxidantes, fibra y vitamina C.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-inmunologico", "sistema-musculoesqueletico", "enfermedades-piel"],
+      categoriaId: "frutas-tropicales-medicinales",
+      categoria: "Frutas tropicales medicinales",
+    },
+    {
+      id: "lichi",
+      nombre: "Lichi",
+      nombreCientifico: "Litchi chinensis",
+      nombresAlternativos: {"España": ["Ciruela de China"], "USA_English": ["Lychee"], "UK_English": ["Lychee"]},
+      propiedades: ["Antioxidante", "Refuerza el sistema inmunitario", "Antiinflamatorio", "Mejora la circulación", "Protege el corazón"],
+      parteUsable: "Fruto",
+      dosis: "Consumir un puñado (10-12 frutos) al día",
+      preparacion: "Consumo directo, postres, ensaladas",
+      contraindicaciones: [{ tipo: "diabetes", descripcion: "Consumir con moderación por su contenido de azúcar." }],
+      descripcion: "El lichi es una fruta pequeña y dulce, con una pulpa blanca y jugosa. Es una excelente fuente de vitamina C y compuestos antioxidantes que combaten el estrés oxidativo.",
+      sistemasRelacionados: ["sistema-inmunologico", "sistema-cardiovascular", "sistema-circulatorio"],
+      categoriaId: "frutas-tropicales-medicinales",
+      categoria: "Frutas tropicales medicinales",
+    },
+    {
+      id: "rambutan",
+      nombre: "Rambután",
+      nombreCientifico: "Nephelium lappaceum",
+      nombresAlternativos: {"Centroamérica": ["Mamón chino"], "Ecuador": ["Achotillo"]},
+      propiedades: ["Antiparasitario", "Antioxidante", "Refuerza el sistema inmunitario", "Fuente de energía", "Mejora la salud ósea"],
+      parteUsable: "Fruto, semillas y cáscara",
+      dosis: "Consumir 5-6 frutos al día",
+      preparacion: "Consumo directo del fruto. La cáscara y semillas se usan en decocción.",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Las semillas crudas son tóxicas y no deben consumirse." }],
+      descripcion: "El rambután es una fruta exótica cubierta por una cáscara peluda. Su pulpa es dulce y jugosa, similar a la del lichi, y es rica en vitamina C, hierro y cobre.",
+      sistemasRelacionados: ["sistema-inmunologico", "sistema-digestivo", "sistema-musculoesqueletico"],
+      categoriaId: "frutas-tropicales-medicinales",
+      categoria: "Frutas tropicales medicinales",
+    },
+    {
+      id: "durian",
+      nombre: "Durián",
+      nombreCientifico: "Durio zibethinus",
+      propiedades: ["Fuente de energía", "Antidepresivo natural", "Afrodisíaco", "Favorece el sueño", "Regula la presión arterial"],
+      parteUsable: "Fruto",
+      dosis: "Consumir con moderación debido a su alta densidad calórica.",
+      preparacion: "Consumo directo",
+      contraindicaciones: [{ tipo: "medicamentos", descripcion: "No consumir con alcohol, puede causar reacciones adversas severas." }, { tipo: "hipertension", descripcion: "Consumir con precaución por su alto contenido de potasio." }],
+      descripcion: "El durián es conocido como el 'rey de las frutas' en el sudeste asiático, famoso por su gran tamaño, cáscara espinosa y un olor intenso y característico. Es muy nutritivo pero también muy calórico.",
+      sistemasRelacionados: ["sistema-nervioso", "trastornos-mentales-emocionales", "sistema-cardiovascular", "sistema-reproductor"],
+      categoriaId: "frutas-tropicales-medicinales",
+      categoria: "Frutas tropicales medicinales",
+    },
+    {
+      id: "tamarindo",
+      nombre: "Tamarindo",
+      nombreCientifico: "Tamarindus indica",
+      nombresAlternativos: {"Indigena": ["Tamr hindī (árabe)"]},
+      propiedades: ["Laxante suave", "Antiinflamatorio", "Antiséptico", "Reduce la fiebre", "Protector hepático"],
+      parteUsable: "Pulpa del fruto, hojas y corteza",
+      dosis: "Pulpa: 10-20 gramos al día. Infusión de hojas: 1-2 tazas.",
+      preparacion: "Consumo de la pulpa, aguas frescas, dulces, infusión (hojas)",
+      contraindicaciones: [{ tipo: "medicamentos", descripcion: "Puede interactuar con medicamentos para la diabetes y anticoagulantes." }],
+      descripcion: "El tamarindo es una leguminosa con una pulpa agridulce que se utiliza en cocinas de todo el mundo. Tiene propiedades medicinales laxantes y ayuda a reducir la inflamación.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-inmunologico", "sistema-linfatico"],
+      categoriaId: "frutas-tropicales-medicinales",
+      categoria: "Frutas tropicales medicinales",
+    },
+    {
+      id: "coco",
+      nombre: "Coco",
+      nombreCientifico: "Cocos nucifera",
+      nombresAlternativos: {"Caribe": ["pipa"], "USA_English": ["coconut"], "UK_English": ["coconut"]},
+      propiedades: ["Hidratante", "Antibacteriano", "Antiviral", "Fuente de electrolitos", "Mejora la salud cerebral"],
+      parteUsable: "Agua, pulpa (carne) y aceite",
+      dosis: "Agua de coco: 1-2 vasos al día. Aceite: 1-2 cucharadas al día.",
+      preparacion: "Consumo directo, aceite, leche, agua",
+      contraindicaciones: [{ tipo: "alergia", descripcion: "Aunque es raro, puede causar alergias." }],
+      descripcion: "El coco es una fruta tropical muy versátil. Su agua es una bebida hidratante natural, su pulpa es rica en fibra y su aceite tiene propiedades antimicrobianas.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-nervioso", "enfermedades-piel", "sistema-inmunologico"],
+      categoriaId: "frutas-tropicales-medicinales",
+      categoria: "Frutas tropicales medicinales",
+    },
+    {
+      id: "guanabana",
+      nombre: "Guanábana",
+      nombreCientifico: "Annona muricata",
+      propiedades: ["Anticancerígena (potencial)", "Antiparasitaria", "Antiinflamatoria", "Sedante", "Hipotensora"],
+      parteUsable: "Fruto, hojas y semillas",
+      dosis: "Consumir 1 porción de fruta al día. Infusión de hojas: 1 taza al día.",
+      preparacion: "Consumo directo, jugos, batidos, infusión (hojas)",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "No se recomienda el consumo de suplementos o infusiones." }, { tipo: "medicamentos", descripcion: "Puede potenciar medicamentos para la presión arterial y la diabetes." }],
+      descripcion: "La guanábana es una fruta con pulpa blanca y cremosa, y un sabor agridulce. Se le atribuyen propiedades anticancerígenas, aunque se necesita más investigación.",
+      sistemasRelacionados: ["sistema-inmunologico", "sistema-nervioso", "sistema-cardiovascular", "sistema-digestivo"],
+      categoriaId: "frutas-tropicales-medicinales",
+      categoria: "Frutas tropicales medicinales",
+    },
+    {
+      id: "kiwi",
+      nombre: "Kiwi",
+      nombreCientifico: "Actinidia deliciosa",
+      nombresAlternativos: {"España": ["kiwi"], "USA_English": ["kiwifruit", "chinese gooseberry", "kiwi fruit", "smooth-skinned kiwifruit", "yangtao"], "UK_English": ["kiwifruit", "chinese gooseberry"]},
+      propiedades: ["Laxante", "Refuerza el sistema inmunitario", "Antioxidante", "Mejora la salud respiratoria", "Ayuda a dormir"],
+      parteUsable: "Fruto",
+      dosis: "Consumir 1-2 kiwis al día",
+      preparacion: "Consumo directo",
+      contraindicaciones: [{ tipo: "alergia", descripcion: "Puede causar alergia, especialmente en personas alérgicas al látex o al polen." }],
+      descripcion: "El kiwi es una pequeña fruta con una gran cantidad de vitamina C, fibra y antioxidantes. Ayuda a regular el tránsito intestinal y a fortalecer las defensas.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-inmunologico", "sistema-respiratorio", "trastornos-mentales-emocionales"],
+      categoriaId: "frutas-tropicales-medicinales",
+      categoria: "Frutas tropicales medicinales",
+    },
+    {
+      id: "granada",
+      nombre: "Granada",
+      nombreCientifico: "Punica granatum",
+      nombresAlternativos: {"España": ["granado", "mingranera"], "USA_English": ["pomegranate"], "UK_English": ["pomegranate"]},
+      propiedades: ["Antioxidante potente", "Antiinflamatoria", "Protector cardiovascular", "Anticancerígena (potencial)", "Mejora la memoria"],
+      parteUsable: "Arilos (semillas cubiertas de pulpa), cáscara y jugo",
+      dosis: "Jugo: 1 vaso al día. Consumir los arilos de media granada.",
+      preparacion: "Consumo directo, jugos",
+      contraindicaciones: [],
+      descripcion: "La granada es una fruta cargada de antioxidantes, especialmente punicalaginas, que le confieren potentes propiedades protectoras para la salud cardiovascular y cerebral.",
+      sistemasRelacionados: ["sistema-cardiovascular", "sistema-nervioso", "sistema-inmunologico", "sistema-reproductor"],
+      categoriaId: "frutas-tropicales-medicinales",
+      categoria: "Frutas tropicales medicinales",
+    },
+    {
+      id: "higo",
+      nombre: "Higo",
+      nombreCientifico: "Ficus carica",
+      nombresAlternativos: {"España": ["higuera", "breval"], "México": ["amate", "ziranda"], "Indigena": ["amate (náhuatl)"], "USA_English": ["fig", "common fig", "edible fig"], "UK_English": ["fig"]},
+      propiedades: ["Laxante", "Expectorante", "Demulcente (suavizante de mucosas)", "Nutritivo", "Remineralizante"],
+      parteUsable: "Fruto (fresco o seco)",
+      dosis: "Consumir 2-4 higos frescos o secos al día.",
+      preparacion: "Consumo directo, mermeladas, postres",
+      contraindicaciones: [{ tipo: "diabetes", descripcion: "Los higos secos tienen una alta concentración de azúcar." }],
+      descripcion: "El higo es una fruta dulce y nutritiva, rica en fibra, que ayuda a regular el tránsito intestinal. También se utiliza para aliviar la tos y el dolor de garganta.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-respiratorio", "sistema-musculoesqueletico"],
+      categoriaId: "frutas-tropicales-medicinales",
+      categoria: "Frutas tropicales medicinales",
+    },
+    {
+      id: "chirimoya",
+      nombre: "Chirimoya",
+      nombreCientifico: "Annona cherimola",
+      propiedades: ["Relajante", "Antidepresiva", "Regula la presión arterial", "Digestiva", "Antioxidante"],
+      parteUsable: "Fruto",
+      dosis: "Consumir 1 pieza de fruta",
+      preparacion: "Consumo directo",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Las semillas son tóxicas y no deben ser ingeridas." }],
+      descripcion: "La chirimoya es una fruta de pulpa cremosa y sabor dulce, a menudo descrita como una mezcla de plátano, piña y fresa. Contiene compuestos que promueven la relajación y el bienestar.",
+      sistemasRelacionados: ["sistema-nervioso", "trastornos-mentales-emocionales", "sistema-cardiovascular", "sistema-digestivo"],
+      categoriaId: "frutas-tropicales-medicinales",
+      categoria: "Frutas tropicales medicinales",
+    },
+    {
+      id: "lucuma",
+      nombre: "Lúcuma",
+      nombreCientifico: "Pouteria lucuma",
+      nombresAlternativos: {"Perú": ["Lúcuma", "Lucma"], "Ecuador": ["Lúcuma", "Lucma", "Logma", "Lohma", "Louma"], "Chile": ["Lúcumo chileno", "Palo colorado"], "USA_English": ["Lucuma", "Eggfruit"], "UK_English": ["Lucuma"], "Brasil": ["Sapota-do-Solimoes"]},
+      propiedades: ["Endulzante natural de bajo índice glucémico", "Antioxidante", "Antiinflamatoria", "Regeneradora de la piel", "Refuerza el sistema inmunitario"],
+      parteUsable: "Fruto (generalmente en polvo)",
+      dosis: "1-2 cucharadas de polvo de lúcuma al día.",
+      preparacion: "Añadir a batidos, postres, yogures",
+      contraindicaciones: [],
+      descripcion: "La lúcuma, conocida como el 'oro de los Incas', es una fruta peruana con un sabor dulce que recuerda al caramelo o al arce. Se utiliza principalmente como un endulzante natural y nutritivo.",
+      sistemasRelacionados: ["sistema-endocrino", "enfermedades-piel", "sistema-inmunologico"],
+      categoriaId: "frutas-tropicales-medicinales",
+      categoria: "Frutas tropicales medicinales",
+    },
+    {
+      id: "zapote",
+      nombre: "Zapote",
+      nombreCientifico: "Pouteria sapota",
+      propiedades: ["Nutritivo", "Antioxidante", "Mejora la visión", "Salud digestiva", "Fuente de energía"],
+      parteUsable: "Fruto",
+      dosis: "Consumir con moderación",
+      preparacion: "Consumo directo, batidos, helados",
+      contraindicaciones: [],
+      descripcion: "El zapote es una fruta de pulpa suave y dulce, de color anaranjado o rojizo. Es rico en vitaminas A y C, potasio y fibra dietética.",
+      sistemasRelacionados: ["sistema-digestivo", "enfermedades-ojos-oidos-nariz-garganta", "sistema-inmunologico"],
+      categoriaId: "frutas-tropicales-medicinales",
+      categoria: "Frutas tropicales medicinales",
+    },
+    {
+      id: "mamey",
+      nombre: "Mamey",
+      nombreCientifico: "Mammea americana",
+      propiedades: ["Antiparasitario", "Insecticida (semilla)", "Cicatrizante", "Digestivo", "Antioxidante"],
+      parteUsable: "Fruto, aceite de la semilla",
+      dosis: "Consumo moderado del fruto.",
+      preparacion: "Consumo directo, batidos, postres",
+      contraindicaciones: [{ tipo: "otro", descripcion: "La semilla es tóxica si se ingiere." }],
+      descripcion: "El mamey es una fruta grande de pulpa firme y sabor dulce. El aceite extraído de su semilla se ha utilizado tradicionalmente como insecticida y para tratar afecciones de la piel.",
+      sistemasRelacionados: ["sistema-digestivo", "enfermedades-piel", "sistema-inmunologico"],
+      categoriaId: "frutas-tropicales-medicinales",
+      categoria: "Frutas tropicales medicinales",
+    },
+    {
+      id: "noni",
+      nombre: "Noni",
+      nombreCientifico: "Morinda citrifolia",
+      propiedades: ["Analgésico", "Antiinflamatorio", "Refuerza el sistema inmunitario", "Antibacteriano", "Anticancerígeno (potencial)"],
+      parteUsable: "Fruto (generalmente en jugo)",
+      dosis: "30-60 ml de jugo de noni al día.",
+      preparacion: "Jugo fermentado",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "No se recomienda su consumo." }, { tipo: "otro", descripcion: "Personas con enfermedad renal o hepática deben consultar a un médico." }],
+      descripcion: "El noni es una fruta con un olor y sabor fuertes y peculiares. A pesar de ello, su jugo es muy popular por sus supuestos beneficios para la salud, incluyendo el alivio del dolor y el fortalecimiento del sistema inmune.",
+      sistemasRelacionados: ["sistema-inmunologico", "sistema-musculoesqueletico", "trastornos-mentales-emocionales"],
+      categoriaId: "frutas-tropicales-medicinales",
+      categoria: "Frutas tropicales medicinales",
+    },
+    {
+      id: "araza",
+      nombre: "Arazá",
+      nombreCientifico: "Eugenia stipitata",
+      propiedades: ["Antioxidante", "Vitamina C", "Diurético", "Salud hepática", "Control del colesterol"],
+      parteUsable: "Fruto",
+      dosis: "Consumo en jugos o postres",
+      preparacion: "Jugos, mermeladas, helados",
+      contraindicaciones: [],
+      descripcion: "El arazá es una fruta amazónica muy ácida, por lo que rara vez se consume fresca. Es excepcionalmente rica en vitamina C y se utiliza para preparar jugos y dulces refrescantes.",
+      sistemasRelacionados: ["sistema-inmunologico", "sistema-urinario", "sistema-cardiovascular", "sistema-linfatico"],
+      categoriaId: "frutas-tropicales-medicinales",
+      categoria: "Frutas tropicales medicinales",
+    },
+    {
+      id: "borojo",
+      nombre: "Borojó",
+      nombreCientifico: "Borojoa patinoi",
+      propiedades: ["Energizante", "Afrodisíaco", "Nutritivo", "Regulador hormonal", "Cicatrizante"],
+      parteUsable: "Fruto",
+      dosis: "Consumo en jugos o pulpa",
+      preparacion: "Jugos, mermeladas, pulpa directa",
+      contraindicaciones: [],
+      descripcion: "El borojó es una fruta de la selva tropical del Pacífico, conocida como el 'viagra natural' por sus supuestas propiedades afrodisíacas. Es muy rica en fósforo, hierro y aminoácidos.",
+      sistemasRelacionados: ["sistema-reproductor", "sistema-endocrino", "trastornos-mentales-emocionales"],
+      categoriaId: "frutas-tropicales-medicinales",
+      categoria: "Frutas tropicales medicinales",
+    },
+    {
+      id: "camu-camu",
+      nombre: "Camu Camu",
+      nombreCientifico: "Myrciaria dubia",
+      propiedades: ["Vitamina C (muy alta)", "Antioxidante", "Antiinflamatorio", "Antiviral", "Refuerza el sistema inmunitario"],
+      parteUsable: "Fruto (generalmente en polvo o jugo)",
+      dosis: "1 cucharadita de polvo al día.",
+      preparacion: "Polvo para añadir a bebidas, jugos",
+      contraindicaciones: [],
+      descripcion: "El camu camu es una pequeña fruta amazónica que ostenta uno de los contenidos más altos de vitamina C del mundo. Se utiliza para fortalecer el sistema inmune y combatir la inflamación.",
+      sistemasRelacionados: ["sistema-inmunologico", "sistema-respiratorio", "enfermedades-ojos-oidos-nariz-garganta"],
+      categoriaId: "frutas-tropicales-medicinales",
+      categoria: "Frutas tropicales medicinales",
+    },
+    {
+      id: "copoazu",
+      nombre: "Copoazú",
+      nombreCientifico: "Theobroma grandiflorum",
+      propiedades: ["Estimulante (sin cafeína)", "Antioxidante", "Hidratante para la piel", "Salud cardiovascular", "Nutritivo"],
+      parteUsable: "Pulpa y semillas (manteca)",
+      dosis: "Consumo de la pulpa en postres o bebidas.",
+      preparacion: "Jugos, helados, postres, manteca para uso cosmético",
+      contraindicaciones: [],
+      descripcion: "El copoazú es un pariente del cacao, con una pulpa aromática y ácida. Contiene teacrina, un estimulante suave, y su manteca es un excelente emoliente para la piel.",
+      sistemasRelacionados: ["sistema-nervioso", "enfermedades-piel", "sistema-cardiovascular"],
+      categoriaId: "frutas-tropicales-medicinales",
+      categoria: "Frutas tropicales medicinales",
+    },
+    {
+      id: "feijoa",
+      nombre: "Feijoa",
+      nombreCientifico: "Acca sellowiana",
+      nombresAlternativos: {"Colombia": ["feijoa", "guayabo"], "Argentina": ["guayabo del país"], "Brasil": ["goiabeira serrana", "goiabeira do mato", "goiaba do campo"], "USA_English": ["feijoa", "pineapple guava", "guavasteen", "fig guava", "brazilian guava"], "UK_English": ["feijoa", "pineapple guava"]},
+      propiedades: ["Antioxidante", "Digestiva", "Refuerza el sistema inmunitario", "Salud tiroidea (por yodo)", "Antiinflamatoria"],
+      parteUsable: "Fruto",
+      dosis: "Consumir 2-3 frutos al día",
+      preparacion: "Consumo directo, jugos, mermeladas",
+      contraindicaciones: [],
+      descripcion: "La feijoa, también conocida como guayaba-piña, tiene un sabor aromático y complejo. Es rica en fibra, vitamina C y yodo, beneficiando la digestión y la función tiroidea.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-inmunologico", "sistema-endocrino"],
+      categoriaId: "frutas-tropicales-medicinales",
+      categoria: "Frutas tropicales medicinales",
+    },
+    {
+      id: "jabuticaba",
+      nombre: "Jabuticaba",
+      nombreCientifico: "Myrciaria cauliflora",
+      propiedades: ["Antioxidante", "Antiinflamatoria", "Anticancerígena (potencial)", "Antienvejecimiento", "Astringente"],
+      parteUsable: "Fruto y cáscara",
+      dosis: "Consumir un puñado de frutos",
+      preparacion: "Consumo directo, jaleas, vinos. La cáscara seca en infusión.",
+      contraindicaciones: [],
+      descripcion: "La jabuticaba es una fruta brasileña única que crece directamente en el tronco y las ramas del árbol. Su cáscara oscura es rica en antocianinas, potentes antioxidantes.",
+      sistemasRelacionados: ["sistema-inmunologico", "enfermedades-piel", "sistema-digestivo"],
+      categoriaId: "frutas-tropicales-medicinales",
+      categoria: "Frutas tropicales medicinales",
+    },
+    {
+      id: "macambo",
+      nombre: "Macambo",
+      nombreCientifico: "Theobroma bicolor",
+      propiedades: ["Nutritivo", "Fuente de proteína y fibra", "Salud cerebral", "Energizante", "Mejora el humor"],
+      parteUsable: "Semillas",
+      dosis: "Consumir las semillas tostadas como snack.",
+      preparacion: "Tostado de las semillas",
+      contraindicaciones: [],
+      descripcion: "El macambo, pariente del cacao, es conocido como el 'cacao blanco'. Sus semillas, una vez tostadas, son un snack nutritivo que proporciona energía y mejora el estado de ánimo gracias a su contenido de teobromina.",
+      sistemasRelacionados: ["sistema-nervioso", "trastornos-mentales-emocionales", "sistema-digestivo"],
+      categoriaId: "frutas-tropicales-medicinales",
+      categoria: "Frutas tropicales medicinales",
+    },
+    {
+      id: "pomarrosa",
+      nombre: "Pomarrosa",
+      nombreCientifico: "Syzygium jambos",
+      propiedades: ["Antidiabética (semillas)", "Antimicrobiana", "Diurética", "Digestiva", "Reduce la fiebre"],
+      parteUsable: "Fruto, hojas, corteza y semillas",
+      dosis: "Consumo moderado del fruto. Decocción de hojas o semillas.",
+      preparacion: "Consumo directo, decocción",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Las semillas crudas pueden ser tóxicas." }],
+      descripcion: "La pomarrosa es una fruta crujiente y acuosa con un aroma que recuerda a las rosas. Tradicionalmente, diversas partes de la planta se han usado para tratar la diabetes y la fiebre.",
+      sistemasRelacionados: ["sistema-endocrino", "sistema-digestivo", "sistema-urinario"],
+      categoriaId: "frutas-tropicales-medicinales",
+      categoria: "Frutas tropicales medicinales",
+    },
+    {
+      id: "tomatillo",
+      nombre: "Tomatillo",
+      nombreCientifico: "Physalis philadelphica",
+      propiedades: ["Antioxidante", "Antibacteriano", "Salud ocular", "Control de la diabetes", "Antiinflamatorio"],
+      parteUsable: "Fruto",
+      dosis: "Incorporar en salsas y platillos",
+      preparacion: "Cocido, asado, en salsas",
+      contraindicaciones: [],
+      descripcion: "El tomatillo, o tomate verde, es un ingrediente fundamental en la cocina mexicana. Es rico en antioxidantes y se ha estudiado por sus propiedades para regular el azúcar en sangre.",
+      sistemasRelacionados: ["sistema-endocrino", "enfermedades-ojos-oidos-nariz-garganta", "sistema-inmunologico"],
+      categoriaId: "frutas-tropicales-medicinales",
+      categoria: "Frutas tropicales medicinales",
+    },
+    {
+      id: "kumquat",
+      nombre: "Kumquat",
+      nombreCientifico: "Citrus japonica",
+      nombresAlternativos: {"España": ["naranjo enano", "naranja enana", "naranja japonesa"], "Argentina": ["quinoto"], "México": ["naranja china"], "USA_English": ["Kumquat", "Nagami kumquat", "oval kumquat"], "UK_English": ["Kumquat"]},
+      propiedades: ["Antioxidante", "Refuerza el sistema inmunitario", "Salud digestiva", "Antiinflamatorio", "Control del colesterol"],
+      parteUsable: "Fruto completo (cáscara y pulpa)",
+      dosis: "Consumir 4-5 frutos al día",
+      preparacion: "Consumo directo, mermeladas, en almíbar",
+      contraindicaciones: [],
+      descripcion: "El kumquat es un pequeño cítrico que se come entero, con cáscara. La cáscara es dulce y la pulpa ácida, creando una explosión de sabor. Es rico en vitamina C y fibra.",
+      sistemasRelacionados: ["sistema-inmunologico", "sistema-digestivo", "sistema-cardiovascular"],
+      categoriaId: "frutas-tropicales-medicinales",
+      categoria: "Frutas tropicales medicinales",
+    },
+    {
+      id: "tamarillo",
+      nombre: "Tamarillo",
+      nombreCientifico: "Solanum betaceum",
+      propiedades: ["Salud ocular", "Antioxidante", "Control de la presión arterial", "Mejora la digestión", "Bajo en calorías"],
+      parteUsable: "Fruto",
+      dosis: "Consumir 1-2 frutos al día",
+      preparacion: "Consumo directo (sin la piel), jugos, chutneys",
+      contraindicaciones: [],
+      descripcion: "El tamarillo, o tomate de árbol, tiene un sabor agridulce y audaz. Es rico en vitaminas A y C y potasio, lo que lo hace beneficioso para la vista y la presión arterial.",
+      sistemasRelacionados: ["enfermedades-ojos-oidos-nariz-garganta", "sistema-cardiovascular", "sistema-digestivo"],
+      categoriaId: "frutas-tropicales-medicinales",
+      categoria: "Frutas tropicales medicinales",
+    },
+    {
+      id: "lima-kaffir",
+      nombre: "Lima Kaffir",
+      nombreCientifico: "Citrus hystrix",
+      propiedades: ["Antiinflamatorio", "Salud bucal", "Detoxificante sanguíneo", "Estimulante digestivo", "Repelente de insectos"],
+      parteUsable: "Hojas y fruto (cáscara y jugo)",
+      dosis: "Usar las hojas o la cáscara como condimento.",
+      preparacion: "Condimento en cocina asiática, infusión de hojas",
+      contraindicaciones: [],
+      descripcion: "La lima kaffir es un cítrico muy aromático, valorado más por sus hojas y su cáscara que por su jugo. Se utiliza en la medicina tradicional para la salud bucal y para purificar la sangre.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-linfatico", "enfermedades-ojos-oidos-nariz-garganta"],
+      categoriaId: "frutas-tropicales-medicinales",
+      categoria: "Frutas tropicales medicinales",
+    },
+    {
+      id: "anon",
+      nombre: "Anón",
+      nombreCientifico: "Annona squamosa",
+      propiedades: ["Digestivo", "Salud ocular", "Control de la presión arterial", "Salud de la piel", "Antioxidante"],
+      parteUsable: "Fruto",
+      dosis: "Consumir 1 fruto",
+      preparacion: "Consumo directo",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Las semillas son tóxicas." }],
+      descripcion: "El anón, también conocido como chirimoya de azúcar, tiene una pulpa dulce y segmentada. Es rico en vitamina C, vitamina A y potasio.",
+      sistemasRelacionados: ["sistema-digestivo", "enfermedades-ojos-oidos-nariz-garganta", "sistema-cardiovascular", "enfermedades-piel"],
+      categoriaId: "frutas-tropicales-medicinales",
+      categoria: "Frutas tropicales medicinales",
+    },
+    {
+      id: "yaca",
+      nombre: "Yaca",
+      nombreCientifico: "Artocarpus heterophyllus",
+      propiedades: ["Nutritiva", "Salud digestiva", "Refuerza el sistema inmunitario", "Salud ocular", "Control del azúcar en sangre"],
+      parteUsable: "Fruto (bulbos y semillas)",
+      dosis: "Consumo moderado",
+      preparacion: "Fruto maduro crudo, fruto verde cocido como sustituto de carne, semillas cocidas",
+      contraindicaciones: [],
+      descripcion: "La yaca es la fruta de árbol más grande del mundo. Su pulpa tiene una textura carnosa y un sabor dulce cuando está madura. Es una buena fuente de fibra, vitaminas y minerales.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-inmunologico", "enfermedades-ojos-oidos-nariz-garganta", "sistema-endocrino"],
+      categoriaId: "frutas-tropicales-medicinales",
+      categoria: "Frutas tropicales medicinales",
+    },
+    {
+      id: "banana-roja",
+      nombre: "Banana Roja",
+      nombreCientifico: "Musa acuminata 'Red Dacca'",
+      propiedades: ["Rica en potasio", "Fuente de vitamina C y B6", "Antioxidante (rica en carotenoides)", "Mejora la digestión", "Energizante"],
+      parteUsable: "Fruto",
+      dosis: "Consumir 1-2 bananas al día",
+      preparacion: "Consumo directo",
+      contraindicaciones: [],
+      descripcion: "La banana roja es más pequeña y dulce que la banana común, con un ligero sabor a frambuesa. Su color rojo se debe a un alto contenido de carotenoides, que son potentes antioxidantes.",
+      sistemasRelacionados: ["sistema-cardiovascular", "sistema-digestivo", "sistema-inmunologico", "enfermedades-ojos-oidos-nariz-garganta"],
+      categoriaId: "frutas-tropicales-medicinales",
+      categoria: "Frutas tropicales medicinales",
+    },
+    {
+      id: "frutipan",
+      nombre: "Frutipán",
+      nombreCientifico: "Artocarpus altilis",
+      propiedades: ["Fuente de carbohidratos complejos", "Salud cardiovascular", "Rico en fibra", "Energizante", "Salud ósea"],
+      parteUsable: "Fruto",
+      dosis: "Consumir como parte de las comidas",
+      preparacion: "Cocido, asado, frito, hervido",
+      contraindicaciones: [],
+      descripcion: "El frutipan, o árbol del pan, es una fruta amilácea que se consume cocida y sirve como un alimento básico en muchas culturas tropicales. Es una excelente fuente de energía y fibra.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-cardiovascular", "sistema-musculoesqueletico"],
+      categoriaId: "frutas-tropicales-medicinales",
+      categoria: "Frutas tropicales medicinales",
+    },
+    {
+      id: "fruta-hala",
+      nombre: "Fruta Hala",
+      nombreCientifico: "Pandanus tectorius",
+      propiedades: ["Laxante", "Salud bucal", "Alivia dolores de cabeza", "Diurético", "Fuente de vitamina C"],
+      parteUsable: "Fruto, hojas y raíces",
+      dosis: "Consumo moderado del fruto",
+      preparacion: "Fruto crudo o cocido, infusión de hojas",
+      contraindicaciones: [],
+      descripcion: "La fruta Hala es una fruta de aspecto peculiar, compuesta por múltiples segmentos llamados falanges. Se utiliza en la medicina tradicional polinesia para diversos fines, desde laxante hasta analgésico.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-urinario", "trastornos-mentales-emocionales"],
+      categoriaId: "frutas-tropicales-medicinales",
+      categoria: "Frutas tropicales medicinales",
+    },
+    {
+      id: "acerola",
+      nombre: "Acerola",
+      nombreCientifico: "Malpighia emarginata",
+      nombresAlternativos: {"Caribe": ["cereza de las Indias Occidentales", "cereza de Barbados", "cereza de Jamaica", "cereza de las Antillas"], "Centroamérica": ["acerola", "cerecita", "manzanita", "semeruco"], "USA_English": ["barbados cherry", "west indian cherry", "wild crepe myrtle"], "UK_English": ["acerola cherry"]},
+      propiedades: ["Extremadamente rica en Vitamina C", "Antioxidante", "Refuerza el sistema inmunitario", "Antienvejecimiento", "Salud ocular"],
+      parteUsable: "Fruto",
+      dosis: "Unos pocos frutos cubren las necesidades diarias de Vitamina C.",
+      preparacion: "Consumo directo, jugos, suplementos",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Dosis muy altas pueden causar malestar estomacal." }],
+      descripcion: "La acerola, o cereza de Barbados, es una de las fuentes naturales más ricas en vitamina C. Este potente antioxidante ayuda a proteger el cuerpo contra enfermedades y el envejecimiento prematuro.",
+      sistemasRelacionados: ["sistema-inmunologico", "enfermedades-piel", "enfermedades-ojos-oidos-nariz-garganta", "sistema-cardiovascular"],
+      categoriaId: "frutas-tropicales-medicinales",
+      categoria: "Frutas tropicales medicinales",
+    },
+  ],
+};
+
+export default categoria;
@@ -0,0 +1,911 @@
+// Generado automáticamente por scripts/build-catalog.py - no editar a mano
+import type { CategoriaPlanta } from '../../plantas-expandidas';
+
+const categoria: CategoriaPlanta = {
+  id: "hierbas-aromaticas-culinarias",
+  nombre: "Hierbas aromáticas y culinarias",
+  plantas: [
+    {
+      id: "albahaca",
+      nombre: "Albahaca",
+      nombreCientifico: "Ocimum basilicum",
+      nombresAlternativos: {"Mexico": ["albacar", "albacar corriente", "albacar hembra", "albacar macho", "albahaca blanca", "albahaca corriente", "albahaca de Castilla", "albahaca de la tierra", "albahaca morada", "albahaca arribeño", "orégano"], "España": ["alhábega", "alfábega", "basílico", "hierba real", "hierba de los reyes"], "USA_English": ["basil", "sweet basil"], "UK_English": ["basil", "sweet basil"]},
+      propiedades: ["Antiespasmódica", "Digestiva", "Carminativa", "Relajante"],
+      parteUsable: "Hojas",
+      dosis: "Infusión de 5-10 gramos por litro de agua.",
+      preparacion: "Infusión",
+      contraindicaciones: [],
+      descripcion: "Hierba aromática con propiedades digestivas y relajantes.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-nervioso"],
+      categoriaId: "hierbas-aromaticas-culinarias",
+      categoria: "Hierbas aromáticas y culinarias",
+    },
+    {
+      id: "romero",
+      nombre: "Romero",
+      nombreCientifico: "Rosmarinus officinalis",
+      nombresAlternativos: {"España": ["romero común", "romero blanco", "romero hembra", "romero macho"], "USA_English": ["rosemary"], "UK_English": ["rosemary"]},
+      propiedades: ["Estimulante", "Antioxidante", "Antiinflamatoria", "Carminativa"],
+      parteUsable: "Hojas y flores",
+      dosis: "Infusión de 2-4 gramos por taza, 2-3 veces al día.",
+      preparacion: "Infusión, aceite esencial",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "Puede ser abortivo en dosis altas." }, { tipo: "hipertension", descripcion: "Puede elevar la presión arterial." }],
+      descripcion: "Arbusto aromático con efectos estimulantes y antioxidantes.",
+      sistemasRelacionados: ["sistema-nervioso", "sistema-digestivo", "sistema-cardiovascular"],
+      categoriaId: "hierbas-aromaticas-culinarias",
+      categoria: "Hierbas aromáticas y culinarias",
+    },
+    {
+      id: "tomillo",
+      nombre: "Tomillo",
+      nombreCientifico: "Thymus vulgaris",
+      nombresAlternativos: {"España": ["boja", "bojas", "estremoncello", "estremoncillo", "tomello", "tremoncillo"], "USA_English": ["common thyme", "German thyme", "garden thyme"], "UK_English": ["common thyme", "German thyme", "garden thyme"], "Otros": ["orégano", "timonet", "farigola"]},
+      propiedades: ["Antiséptica", "Expectorante", "Antitusiva"],
+      parteUsable: "Hojas y flores",
+      dosis: "Infusión de 1-2 gramos por taza, hasta 3 veces al día.",
+      preparacion: "Infusión, jarabe",
+      contraindicaciones: [],
+      descripcion: "Planta con potentes propiedades antisépticas, ideal para afecciones respiratorias.",
+      sistemasRelacionados: ["sistema-respiratorio"],
+      categoriaId: "hierbas-aromaticas-culinarias",
+      categoria: "Hierbas aromáticas y culinarias",
+    },
+    {
+      id: "oregano",
+      nombre: "Orégano",
+      nombreCientifico: "Origanum vulgare",
+      nombresAlternativos: {"España": ["furiégano", "mejorana silvestre", "oreganín", "orégano común", "orégano nano", "orégano trenzado", "orégano turco", "orenga"], "Caribe": ["orégano francés", "orégano de la tierra", "orégano orejón", "orégano brujo"], "USA_English": ["oregano", "wild marjoram", "pot marjoram"], "UK_English": ["oregano", "wild marjoram", "pot marjoram"]},
+      propiedades: ["Antibacteriano", "Antifúngico", "Antioxidante", "Digestivo"],
+      parteUsable: "Hojas",
+      dosis: "Infusión de 1 cucharadita por taza, 2-3 veces al día.",
+      preparacion: "Infusión, aceite esencial",
+      contraindicaciones: [],
+      descripcion: "Hierba con fuertes propiedades antimicrobianas y antioxidantes.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-inmunologico"],
+      categoriaId: "hierbas-aromaticas-culinarias",
+      categoria: "Hierbas aromáticas y culinarias",
+    },
+    {
+      id: "menta",
+      nombre: "Menta",
+      nombreCientifico: "Mentha piperita",
+      nombresAlternativos: {"España": ["menta piperita", "té de menta", "hierbabuena", "sándalo", "toronjil", "hortelana", "menta perrera", "menta romana"], "Chile": ["bergamota de Chile"], "Otros": ["monte yuyo", "toronjil de menta", "pitoreta", "pituda"], "USA_English": ["peppermint", "chocolate mint", "curly mint", "hairy mint", "white peppermint", "english mint"], "UK_English": ["peppermint", "chocolate mint", "curly mint", "hairy mint", "white peppermint", "english mint"]},
+      propiedades: ["Digestiva", "Carminativa", "Analgésica", "Refrescante"],
+      parteUsable: "Hojas",
+      dosis: "Infusión de 1 cucharada por taza, después de las comidas.",
+      preparacion: "Infusión",
+      contraindicaciones: [{ tipo: "ninos", descripcion: "El aceite esencial no debe usarse en niños pequeños." }],
+      descripcion: "Planta refrescante que alivia problemas digestivos y dolores de cabeza.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-nervioso"],
+      categoriaId: "hierbas-aromaticas-culinarias",
+      categoria: "Hierbas aromáticas y culinarias",
+    },
+    {
+      id: "hierbabuena",
+      nombre: "Hierbabuena",
+      nombreCientifico: "Mentha spicata",
+      nombresAlternativos: {"España": ["hortelana", "hierba buena", "sándalo", "menta", "bálsamo"], "USA_English": ["spearmint", "garden mint", "common mint", "lamb mint", "mackerel mint"], "UK_English": ["spearmint", "garden mint", "common mint", "lamb mint", "mackerel mint"], "Otros": ["yerbabuena", "menta de jardín", "herba-sana", "menta del consol", "menta de les faves"]},
+      propiedades: ["Digestiva", "Carminativa", "Antiespasmódica"],
+      parteUsable: "Hojas",
+      dosis: "Infusión de 1-2 cucharaditas por taza.",
+      preparacion: "Infusión",
+      contraindicaciones: [],
+      descripcion: "Similar a la menta, es excelente para trastornos digestivos leves.",
+      sistemasRelacionados: ["sistema-digestivo"],
+      categoriaId: "hierbas-aromaticas-culinarias",
+      categoria: "Hierbas aromáticas y culinarias",
+    },
+    {
+      id: "cilantro",
+      nombre: "Cilantro",
+      nombreCientifico: "Coriandrum sativum",
+      nombresAlternativos: {"España": ["coriandro", "culantro europeo", "perejil chino", "dannia"], "Perú": ["culantro Castilla"], "Ecuador": ["culantro Castilla"], "Honduras": ["culantro Castilla"], "USA_English": ["coriander", "cilantro", "chinese parsley"], "UK_English": ["coriander", "cilantro", "chinese parsley"], "Otros": ["cilandro", "culantro", "celiandre", "cilandre"]},
+      propiedades: ["Digestivo", "Carminativo", "Quelante de metales pesados"],
+      parteUsable: "Hojas y semillas",
+      dosis: "Consumo directo en comidas o infusión de semillas.",
+      preparacion: "Consumo directo, infusión",
+      contraindicaciones: [],
+      descripcion: "Hierba y especia que ayuda a la digestión y a eliminar toxinas.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-linfatico"],
+      categoriaId: "hierbas-aromaticas-culinarias",
+      categoria: "Hierbas aromáticas y culinarias",
+    },
+    {
+      id: "perejil",
+      nombre: "Perejil",
+      nombreCientifico: "Petroselinum crispum",
+      nombresAlternativos: {"España": ["perejil común", "perejil rizado"], "USA_English": ["parsley", "garden parsley", "curly-leaf parsley", "flat-leaf parsley", "Italian parsley", "root parsley", "Hamburg parsley", "turnip-rooted parsley"], "UK_English": ["parsley", "garden parsley", "curly-leaf parsley", "flat-leaf parsley", "Italian parsley", "root parsley", "Hamburg parsley", "turnip-rooted parsley"], "Otros": ["julivert", "chulivert", "givert", "jolivert", "juavert", "juevert"]},
+      propiedades: ["Diurético", "Rico en vitaminas", "Antiinflamatorio"],
+      parteUsable: "Hojas y raíz",
+      dosis: "Consumo fresco en ensaladas o jugos. Infusión de 2g por taza.",
+      preparacion: "Consumo directo, infusión",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "En grandes cantidades puede ser uterotónico." }],
+      descripcion: "Planta muy nutritiva con efecto diurético y depurativo.",
+      sistemasRelacionados: ["sistema-urinario", "sistema-inmunologico"],
+      categoriaId: "hierbas-aromaticas-culinarias",
+      categoria: "Hierbas aromáticas y culinarias",
+    },
+    {
+      id: "eneldo",
+      nombre: "Eneldo",
+      nombreCientifico: "Anethum graveolens",
+      nombresAlternativos: {"España": ["aneto", "abesón"], "USA_English": ["dill", "dill-oil plant", "east indian dill", "indian dill", "meeting-seed", "sabbath day posy", "dillweed"], "UK_English": ["dill", "dill-oil plant", "east indian dill", "indian dill", "meeting-seed", "sabbath day posy", "dillweed"], "Otros": ["anet", "aneta"]},
+      propiedades: ["Carminativo", "Digestivo", "Antiespasmódico"],
+      parteUsable: "Hojas y semillas",
+      dosis: "Infusión de 1 cucharadita de semillas por taza.",
+      preparacion: "Infusión",
+      contraindicaciones: [],
+      descripcion: "Eficaz para aliviar gases, cólicos y otros problemas digestivos.",
+      sistemasRelacionados: ["sistema-digestivo"],
+      categoriaId: "hierbas-aromaticas-culinarias",
+      categoria: "Hierbas aromáticas y culinarias",
+    },
+    {
+      id: "laurel",
+      nombre: "Laurel",
+      nombreCientifico: "Laurus nobilis",
+      nombresAlternativos: {"España": ["llorer", "ereñotz", "lloréu", "choriu", "llorin", "lloreru", "lloureiro"], "USA_English": ["bay tree", "bay laurel", "sweet bay", "true laurel", "grecian laurel"], "UK_English": ["bay tree", "bay laurel", "sweet bay", "true laurel", "grecian laurel"], "Otros": ["lauro", "laurel de apolo", "laurel de dafne"]},
+      propiedades: ["Digestivo", "Carminativo", "Expectorante"],
+      parteUsable: "Hojas",
+      dosis: "Infusión de 1-2 hojas por taza. No exceder.",
+      preparacion: "Infusión",
+      contraindicaciones: [{ tipo: "otro", descripcion: "En dosis altas puede ser tóxico." }],
+      descripcion: "Facilita la digestión y ayuda a expulsar la mucosidad de las vías respiratorias.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-respiratorio"],
+      categoriaId: "hierbas-aromaticas-culinarias",
+      categoria: "Hierbas aromáticas y culinarias",
+    },
+    {
+      id: "salvia",
+      nombre: "Salvia",
+      nombreCientifico: "Salvia officinalis",
+      nombresAlternativos: {"España": ["salvia real", "celima", "hierba del mudo", "madreselva", "mermasangre", "salima fina", "salvia blanca", "salvia fina", "salvia hortense", "gallocresta", "salve", "hierba de la salud", "sabia", "salva", "salvá", "salva cruz", "salvia en cruz", "té moruno", "té de jardín"], "USA_English": ["sage", "common sage", "garden sage", "golden sage", "kitchen sage", "true sage", "culinary sage"], "UK_English": ["sage", "common sage", "garden sage", "golden sage", "kitchen sage", "true sage", "culinary sage"], "Otros": ["María Pastora", "Sally-D", "menta mágica", "salvia del país", "salvia de playa", "salvia cimarrona"]},
+      propiedades: ["Antiinflamatoria", "Antiséptica", "Regulador hormonal", "Antisudoral"],
+      parteUsable: "Hojas",
+      dosis: "Infusión de 1-2 gramos por taza. Gargarismos para la garganta.",
+      preparacion: "Infusión, gargarismos",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "No recomendada por su efecto hormonal." }, { tipo: "lactancia", descripcion: "Puede reducir la producción de leche." }],
+      descripcion: "Planta con propiedades antiinflamatorias y reguladoras hormonales, útil en la menopausia.",
+      sistemasRelacionados: ["sistema-endocrino", "enfermedades-ojos-oidos-nariz-garganta"],
+      categoriaId: "hierbas-aromaticas-culinarias",
+      categoria: "Hierbas aromáticas y culinarias",
+    },
+    {
+      id: "mejorana",
+      nombre: "Mejorana",
+      nombreCientifico: "Origanum majorana",
+      nombresAlternativos: {"España": ["acapuas", "almaraco", "almoradijo", "almoraduj", "almoradux", "almoradux casero", "almoradux morisco", "almoradux salsero", "almoraduz", "mayorana", "amáraco", "orégano mayor", "manjerona", "mejorama"], "USA_English": ["sweet marjoram", "marjoram"], "UK_English": ["sweet marjoram", "marjoram"], "Otros": ["marjorama", "marduix", "moraduix", "mendaro"]},
+      propiedades: ["Sedante", "Digestiva", "Antiespasmódica"],
+      parteUsable: "Hojas y flores",
+      dosis: "Infusión de una cucharadita por taza, antes de dormir.",
+      preparacion: "Infusión",
+      contraindicaciones: [],
+      descripcion: "Hierba con un suave efecto sedante, útil para el insomnio y la ansiedad.",
+      sistemasRelacionados: ["sistema-nervioso", "sistema-digestivo"],
+      categoriaId: "hierbas-aromaticas-culinarias",
+      categoria: "Hierbas aromáticas y culinarias",
+    },
+    {
+      id: "estragon",
+      nombre: "Estragón",
+      nombreCientifico: "Artemisia dracunculus",
+      nombresAlternativos: {"España": ["dragoncillo", "tarragón", "tarragó", "dragó", "herba-dracera", "estragó", "badiana", "dragonera", "dragonet", "herba dragonera", "herba vinagrera"], "USA_English": ["tarragon", "estragon", "dragon plant", "dragon sagewort", "herbaceous sagewort", "pinon wormwood", "silky wormwood", "wild tarragon", "french tarragon", "german tarragon"], "UK_English": ["tarragon", "estragon", "dragon plant", "dragon sagewort", "herbaceous sagewort", "pinon wormwood", "silky wormwood", "wild tarragon", "french tarragon", "german tarragon"], "Otros": ["dragon's-wort"]},
+      propiedades: ["Digestivo", "Vermífugo", "Anestésico local"],
+      parteUsable: "Hojas",
+      dosis: "Infusión de 5g de hojas por litro de agua.",
+      preparacion: "Infusión",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "Debe evitarse su uso continuado." }],
+      descripcion: "Estimula el apetito y la digestión, y tiene un ligero efecto anestésico.",
+      sistemasRelacionados: ["sistema-digestivo"],
+      categoriaId: "hierbas-aromaticas-culinarias",
+      categoria: "Hierbas aromáticas y culinarias",
+    },
+    {
+      id: "cebollino",
+      nombre: "Cebollino",
+      nombreCientifico: "Allium schoenoprasum",
+      nombresAlternativos: {"Mexico": ["cebolla de hoja", "ciboulette", "xonacátl", "cebolleta", "cebollín", "cebollino de ajo", "chonacate"], "España": ["cebollino común", "cebollín", "ajo morisco"], "USA_English": ["chives", "flowering onion", "wild chives"], "UK_English": ["chives", "flowering onion", "wild chives"]},
+      propiedades: ["Rico en vitamina C", "Digestivo", "Antiséptico suave"],
+      parteUsable: "Hojas",
+      dosis: "Consumo directo en comidas.",
+      preparacion: "Consumo directo",
+      contraindicaciones: [],
+      descripcion: "Aporta vitaminas y un suave efecto digestivo y antiséptico.",
+      sistemasRelacionados: ["sistema-inmunologico", "sistema-digestivo"],
+      categoriaId: "hierbas-aromaticas-culinarias",
+      categoria: "Hierbas aromáticas y culinarias",
+    },
+    {
+      id: "hinojo",
+      nombre: "Hinojo",
+      nombreCientifico: "Foeniculum vulgare",
+      nombresAlternativos: {"España": ["hinojo común", "fenoll", "fiuncho", "acapate", "fonol común", "cenojo", "fenojo", "fenol", "hierba santa", "mello", "perejil de gitano", "hinojo dulce", "hinojo amargo", "hinojo en rama", "hinojo de Florencia"], "USA_English": ["fennel", "sweet fennel", "bronze fennel", "finocchio", "florence fennel"], "UK_English": ["fennel", "sweet fennel", "bronze fennel", "finocchio", "florence fennel"]},
+      propiedades: ["Carminativo", "Expectorante", "Diurético", "Galactagogo"],
+      parteUsable: "Semillas (frutos) y bulbo",
+      dosis: "Infusión de 1 cucharadita de semillas por taza.",
+      preparacion: "Infusión, decocción del bulbo",
+      contraindicaciones: [],
+      descripcion: "Excelente para los gases y la hinchazón abdominal. También ayuda en la lactancia.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-respiratorio", "sistema-reproductor"],
+      categoriaId: "hierbas-aromaticas-culinarias",
+      categoria: "Hierbas aromáticas y culinarias",
+    },
+    {
+      id: "comino",
+      nombre: "Comino",
+      nombreCientifico: "Cuminum cyminum",
+      nombresAlternativos: {"España": ["alcamonia", "comino común", "comino fino"], "USA_English": ["cumin", "cummin", "jeera"], "UK_English": ["cumin", "cummin", "jeera"], "Otros": ["comí castellà", "fenoll de prat"]},
+      propiedades: ["Carminativo", "Digestivo", "Antiespasmódico"],
+      parteUsable: "Semillas",
+      dosis: "Infusión de media cucharadita por taza.",
+      preparacion: "Infusión, polvo en comidas",
+      contraindicaciones: [],
+      descripcion: "Especia muy potente para aliviar los gases y mejorar la digestión.",
+      sistemasRelacionados: ["sistema-digestivo"],
+      categoriaId: "hierbas-aromaticas-culinarias",
+      categoria: "Hierbas aromáticas y culinarias",
+    },
+    {
+      id: "anis",
+      nombre: "Anís",
+      nombreCientifico: "Pimpinella anisum",
+      nombresAlternativos: {"España": ["anís verde", "matalahúva", "matalahúga", "matalauva"], "USA_English": ["anise", "aniseed"], "UK_English": ["anise", "aniseed"], "Otros": ["anix", "anís verd", "matalafuga", "llavoretes", "matafaluga", "comino dulce"]},
+      propiedades: ["Carminativo", "Digestivo", "Expectorante"],
+      parteUsable: "Semillas (frutos)",
+      dosis: "Infusión de 1 cucharadita por taza.",
+      preparacion: "Infusión",
+      contraindicaciones: [],
+      descripcion: "Clásico remedio para los gases y cólicos, especialmente en niños.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-respiratorio"],
+      categoriaId: "hierbas-aromaticas-culinarias",
+      categoria: "Hierbas aromáticas y culinarias",
+    },
+    {
+      id: "curcuma",
+      nombre: "Cúrcuma",
+      nombreCientifico: "Curcuma longa",
+      nombresAlternativos: {"Cuba": ["polluelo", "azafrán cimarrón", "yuquilla"], "Puerto Rico": ["turmérico", "jengibrillo"], "Perú": ["palillo cholón", "palillo chuncho", "guisador", "palillo"], "Colombia": ["azafrán", "azafrán cimarrón", "curcuma", "cúrcuma", "guisador"], "USA_English": ["common turmeric", "turmeric", "Indian saffron", "golden herb", "yellow ginger saffron"], "UK_English": ["turmeric"], "Indigena": ["haldi (Hindi)"]},
+      propiedades: ["Antiinflamatoria", "Antioxidante", "Hepatoprotectora", "Anticancerígena"],
+      parteUsable: "Rizoma",
+      dosis: "1-3 gramos de polvo al día, con pimienta negra para mejorar absorción.",
+      preparacion: "Polvo en comidas, cápsulas",
+      contraindicaciones: [{ tipo: "medicamentos", descripcion: "Puede interactuar con anticoagulantes." }],
+      descripcion: "Potente antiinflamatorio natural, útil en enfermedades crónicas.",
+      sistemasRelacionados: ["sistema-musculoesqueletico", "sistema-digestivo", "sistema-inmunologico"],
+      categoriaId: "hierbas-aromaticas-culinarias",
+      categoria: "Hierbas aromáticas y culinarias",
+    },
+    {
+      id: "jengibre",
+      nombre: "Jengibre",
+      nombreCientifico: "Zingiber officinale",
+      nombresAlternativos: {"Perú": ["kion"], "Filipinas": ["luya"], "Colombia": ["ajengible", "ajengibre", "ajingible", "anjengibre"], "USA_English": ["common ginger", "ginger"], "UK_English": ["ginger"], "India": ["adrak"], "China": ["sheng jiang"], "Japón": ["shoga"]},
+      propiedades: ["Antiemético", "Antiinflamatorio", "Digestivo", "Circulatorio"],
+      parteUsable: "Rizoma",
+      dosis: "Infusión de 1-2 rodajas finas por taza. Hasta 4g de polvo al día.",
+      preparacion: "Infusión, polvo, consumo directo",
+      contraindicaciones: [{ tipo: "hipertension", descripcion: "Usar con precaución si se toman medicamentos para la presión." }],
+      descripcion: "Eficaz contra las náuseas y mareos, además de ser un buen antiinflamatorio.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-musculoesqueletico", "sistema-cardiovascular"],
+      categoriaId: "hierbas-aromaticas-culinarias",
+      categoria: "Hierbas aromáticas y culinarias",
+    },
+    {
+      id: "canela",
+      nombre: "Canela",
+      nombreCientifico: "Cinnamomum verum",
+      nombresAlternativos: {"España": ["Canela de Ceilán", "Canelero"], "USA_English": ["Ceylon cinnamon", "True cinnamon"], "UK_English": ["Ceylon cinnamon", "True cinnamon"]},
+      propiedades: ["Hipoglucemiante", "Antimicrobiana", "Termogénica"],
+      parteUsable: "Corteza",
+      dosis: "1-4 gramos de polvo al día.",
+      preparacion: "Polvo en comidas, infusión",
+      contraindicaciones: [{ tipo: "diabetes", descripcion: "Vigilar niveles de glucosa si se combina con medicación." }],
+      descripcion: "Ayuda a regular los niveles de azúcar en sangre y tiene efecto calorífico.",
+      sistemasRelacionados: ["sistema-endocrino", "sistema-digestivo"],
+      categoriaId: "hierbas-aromaticas-culinarias",
+      categoria: "Hierbas aromáticas y culinarias",
+    },
+    {
+      id: "clavo-de-olor",
+      nombre: "Clavo de olor",
+      nombreCientifico: "Syzygium aromaticum",
+      nombresAlternativos: {"España": ["clavero", "clavo de especia"], "USA_English": ["clove"], "UK_English": ["clove"], "Otros": ["girofle", "ding xian", "lavangam"]},
+      propiedades: ["Analgésico dental", "Antiséptico", "Carminativo"],
+      parteUsable: "Botones florales secos",
+      dosis: "Aplicación tópica de aceite para dolor dental. Infusión de 1-2 clavos.",
+      preparacion: "Aceite esencial, infusión",
+      contraindicaciones: [],
+      descripcion: "Potente analgésico natural, especialmente para el dolor de muelas.",
+      sistemasRelacionados: ["enfermedades-ojos-oidos-nariz-garganta", "sistema-digestivo"],
+      categoriaId: "hierbas-aromaticas-culinarias",
+      categoria: "Hierbas aromáticas y culinarias",
+    },
+    {
+      id: "cardamomo",
+      nombre: "Cardamomo",
+      nombreCientifico: "Elettaria cardamomum",
+      nombresAlternativos: {"España": ["Cardamomo verde", "Cardamomo verdadero"], "USA_English": ["Green cardamom", "True cardamom"], "UK_English": ["Green cardamom", "True cardamom"]},
+      propiedades: ["Digestivo", "Carminativo", "Expectorante"],
+      parteUsable: "Semillas",
+      dosis: "Masticar 1-2 semillas o infusión de media cucharadita.",
+      preparacion: "Masticar, infusión, polvo",
+      contraindicaciones: [],
+      descripcion: "Alivia la indigestión y el mal aliento, y ayuda a limpiar las vías respiratorias.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-respiratorio"],
+      categoriaId: "hierbas-aromaticas-culinarias",
+      categoria: "Hierbas aromáticas y culinarias",
+    },
+    {
+      id: "azafran",
+      nombre: "Azafrán",
+      nombreCientifico: "Crocus sativus",
+      nombresAlternativos: {"España": ["Croco"], "USA_English": ["Saffron", "Autumn Crocus"], "UK_English": ["Saffron", "Autumn Crocus"]},
+      propiedades: ["Antidepresivo", "Antioxidante", "Afrodisíaco"],
+      parteUsable: "Estigmas de la flor",
+      dosis: "30 mg al día para efecto antidepresivo. Pequeñas hebras en comidas.",
+      preparacion: "Consumo en comidas, extracto estandarizado",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "En dosis altas puede ser abortivo." }],
+      descripcion: "Especia valiosa con efectos positivos sobre el estado de ánimo.",
+      sistemasRelacionados: ["trastornos-mentales-emocionales", "sistema-nervioso"],
+      categoriaId: "hierbas-aromaticas-culinarias",
+      categoria: "Hierbas aromáticas y culinarias",
+    },
+    {
+      id: "lavanda",
+      nombre: "Lavanda",
+      nombreCientifico: "Lavandula angustifolia",
+      nombresAlternativos: {"España": ["espliego", "alhucema", "cantueso"], "USA_English": ["lavender", "true lavender", "English lavender"], "UK_English": ["lavender"]},
+      propiedades: ["Relajante", "Ansiolítica", "Antiséptica", "Cicatrizante"],
+      parteUsable: "Flores",
+      dosis: "Infusión de 1 cucharadita por taza. Aceite esencial en difusor o tópico.",
+      preparacion: "Infusión, aceite esencial",
+      contraindicaciones: [],
+      descripcion: "Aroma calmante que promueve el sueño y alivia la ansiedad. Buena para la piel.",
+      sistemasRelacionados: ["sistema-nervioso", "enfermedades-piel"],
+      categoriaId: "hierbas-aromaticas-culinarias",
+      categoria: "Hierbas aromáticas y culinarias",
+    },
+    {
+      id: "melisa",
+      nombre: "Melisa",
+      nombreCientifico: "Melissa officinalis",
+      nombresAlternativos: {"España": ["sándalo", "limoncillo", "menta melisa", "hoja de limón", "toronjil", "cedrón", "cidronela", "limonera"], "USA_English": ["lemon balm", "common balm", "balm mint", "sweet balm", "melissa balm", "heart's delight", "english balm", "bush balm", "honey plant"], "UK_English": ["lemon balm", "common balm", "balm mint", "sweet balm", "melissa balm", "heart's delight", "english balm", "bush balm", "honey plant"], "Otros": ["abellera", "aronjina", "citronella", "tarongina", "taronjí"]},
+      propiedades: ["Sedante", "Antiviral", "Digestiva", "Ansiolítica"],
+      parteUsable: "Hojas",
+      dosis: "Infusión de 1-2 cucharaditas por taza.",
+      preparacion: "Infusión",
+      contraindicaciones: [],
+      descripcion: "Conocida como toronjil, es excelente para calmar los nervios y problemas digestivos asociados.",
+      sistemasRelacionados: ["sistema-nervioso", "sistema-digestivo"],
+      categoriaId: "hierbas-aromaticas-culinarias",
+      categoria: "Hierbas aromáticas y culinarias",
+    },
+    {
+      id: "perifollo",
+      nombre: "Perifollo",
+      nombreCientifico: "Anthriscus cerefolium",
+      nombresAlternativos: {"España": ["cerefolio", "perejil francés", "prifolio"], "USA_English": ["chervil", "french parsley", "garden chervil"], "UK_English": ["chervil", "french parsley", "garden chervil"], "Otros": ["cerfull"]},
+      propiedades: ["Depurativo", "Diurético", "Expectorante"],
+      parteUsable: "Hojas",
+      dosis: "Consumo fresco en ensaladas o infusión.",
+      preparacion: "Consumo directo, infusión",
+      contraindicaciones: [],
+      descripcion: "Hierba de sabor anisado que ayuda a depurar el organismo.",
+      sistemasRelacionados: ["sistema-urinario", "sistema-linfatico"],
+      categoriaId: "hierbas-aromaticas-culinarias",
+      categoria: "Hierbas aromáticas y culinarias",
+    },
+    {
+      id: "angelica",
+      nombre: "Angélica",
+      nombreCientifico: "Angelica archangelica",
+      nombresAlternativos: {"España": ["ajonjera", "hierba angélica", "hierba de los ángeles", "hierba del espíritu santo", "chirivía silvestre"], "USA_English": ["garden angelica", "wild celery", "norwegian angelica", "archangel", "holy ghost"], "UK_English": ["garden angelica", "wild celery", "norwegian angelica", "archangel", "holy ghost"], "Otros": ["aingueru bedarra", "angèlica", "väinönputki", "alexandris"]},
+      propiedades: ["Digestiva", "Expectorante", "Tónico nervioso"],
+      parteUsable: "Raíz y semillas",
+      dosis: "Decocción de la raíz (10g por litro) o infusión de semillas.",
+      preparacion: "Decocción, infusión",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "Evitar durante el embarazo." }, { tipo: "diabetes", descripcion: "Puede alterar los niveles de azúcar." }],
+      descripcion: "Planta robusta que tonifica el sistema digestivo y nervioso.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-nervioso", "sistema-respiratorio"],
+      categoriaId: "hierbas-aromaticas-culinarias",
+      categoria: "Hierbas aromáticas y culinarias",
+    },
+    {
+      id: "ajedrea",
+      nombre: "Ajedrea",
+      nombreCientifico: "Satureja montana",
+      nombresAlternativos: {"España": ["ajedrea de montaña", "ajedrea montesina", "ajedrea de monte", "hisopillo", "morquera", "sabora", "saborija", "sadurija"], "USA_English": ["winter savory", "mountain savory"], "UK_English": ["winter savory", "mountain savory"], "Otros": ["tomillo real", "hisopillo", "santoreggia montana"]},
+      propiedades: ["Digestiva", "Antiséptica", "Afrodisíaca"],
+      parteUsable: "Hojas y sumidades floridas",
+      dosis: "Infusión de una cucharadita por taza.",
+      preparacion: "Infusión",
+      contraindicaciones: [],
+      descripcion: "Facilita la digestión de alimentos pesados y tiene fama de estimulante.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-reproductor"],
+      categoriaId: "hierbas-aromaticas-culinarias",
+      categoria: "Hierbas aromáticas y culinarias",
+    },
+    {
+      id: "hisopo",
+      nombre: "Hisopo",
+      nombreCientifico: "Hyssopus officinalis",
+      nombresAlternativos: {"España": ["hisopillo de dos órdenes", "hisopillo húmedo", "hisopo real", "hysopo", "isopo", "isopo hortelano", "rabillo", "rabillo de gato"], "USA_English": ["hyssop"], "UK_English": ["hyssop"], "Otros": ["jufa", "az-zufa"]},
+      propiedades: ["Expectorante", "Antitusivo", "Antiviral"],
+      parteUsable: "Sumidades floridas",
+      dosis: "Infusión de 1-2 cucharaditas por taza.",
+      preparacion: "Infusión, jarabe",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "No usar durante el embarazo." }],
+      descripcion: "Remedio tradicional para la tos, los resfriados y otras afecciones respiratorias.",
+      sistemasRelacionados: ["sistema-respiratorio"],
+      categoriaId: "hierbas-aromaticas-culinarias",
+      categoria: "Hierbas aromáticas y culinarias",
+    },
+    {
+      id: "tanaceto",
+      nombre: "Tanaceto",
+      nombreCientifico: "Tanacetum vulgare",
+      nombresAlternativos: {"España": ["tansi", "hierba lombriguera", "ajemjo verde", "palma imperial"], "USA_English": ["tansy", "common tansy", "bitter buttons", "cow bitter", "golden buttons"], "UK_English": ["tansy", "common tansy", "bitter buttons", "cow bitter", "golden buttons"], "Otros": ["tanacet", "tanarida", "anzar-bedar", "mota-belar", "zizari-belar"]},
+      propiedades: ["Vermífugo", "Emenagogo", "Digestivo"],
+      parteUsable: "Hojas y flores",
+      dosis: "Usar con extrema precaución y en dosis muy bajas. Infusión de 0.5g.",
+      preparacion: "Infusión",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "Es abortivo y tóxico. Totalmente contraindicado." }, { tipo: "ninos", descripcion: "Tóxico para niños." }],
+      descripcion: "Planta tóxica que debe ser usada solo bajo supervisión experta como antiparasitario.",
+      sistemasRelacionados: ["sistema-digestivo"],
+      categoriaId: "hierbas-aromaticas-culinarias",
+      categoria: "Hierbas aromáticas y culinarias",
+    },
+    {
+      id: "levistico",
+      nombre: "Levístico",
+      nombreCientifico: "Levisticum officinale",
+      nombresAlternativos: {"España": ["angelica montana", "angélica montana", "apio de montaña", "apio de monte", "apio silvestre de monte", "esmirnio", "legustico", "levistico"], "USA_English": ["lovage", "garden lovage", "maggi plant", "smellage", "bladder seed"], "UK_English": ["lovage", "garden lovage", "maggi plant", "smellage", "bladder seed"], "Otros": ["Llebístic"]},
+      propiedades: ["Diurético", "Carminativo", "Emenagogo"],
+      parteUsable: "Raíz y hojas",
+      dosis: "Decocción de la raíz o infusión de las hojas.",
+      preparacion: "Decocción, infusión",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "Evitar durante el embarazo." }],
+      descripcion: "Conocido como apio de monte, es un potente diurético y digestivo.",
+      sistemasRelacionados: ["sistema-urinario", "sistema-digestivo"],
+      categoriaId: "hierbas-aromaticas-culinarias",
+      categoria: "Hierbas aromáticas y culinarias",
+    },
+    {
+      id: "comino-negro",
+      nombre: "Comino Negro",
+      nombreCientifico: "Nigella sativa",
+      nombresAlternativos: {"España": ["abésoda", "agenuz", "ajenuz", "arañuel", "nigela"], "USA_English": ["black caraway", "black seed", "black cumin", "fennel flower", "nigella", "nutmeg flower", "roman coriander"], "UK_English": ["black caraway", "black seed", "black cumin", "fennel flower", "nigella", "nutmeg flower", "roman coriander"], "Otros": ["kalonji", "pebreta", "pebretera"]},
+      propiedades: ["Inmunoestimulante", "Antihistamínico", "Antiinflamatorio", "Antitumoral"],
+      parteUsable: "Semillas",
+      dosis: "1-2 cucharaditas de aceite al día o 1 cucharadita de semillas.",
+      preparacion: "Aceite, semillas",
+      contraindicaciones: [],
+      descripcion: "Semilla con potentes efectos sobre el sistema inmune, alergias y procesos inflamatorios.",
+      sistemasRelacionados: ["sistema-inmunologico", "sistema-respiratorio", "enfermedades-piel"],
+      categoriaId: "hierbas-aromaticas-culinarias",
+      categoria: "Hierbas aromáticas y culinarias",
+    },
+    {
+      id: "fenogreco",
+      nombre: "Fenogreco",
+      nombreCientifico: "Trigonella foenum-graecum",
+      nombresAlternativos: {"España": ["alholva", "alforva", "albolba", "alvolva", "heno griego", "albolga"], "USA_English": ["fenugreek", "bird's foot", "goat's horn", "greek clover", "greek hay", "greek hayseed", "sicklefruit fenugreek"], "UK_English": ["fenugreek", "bird's foot", "goat's horn", "greek clover", "greek hay", "greek hayseed", "sicklefruit fenugreek"], "Otros": ["hilba", "helba", "k'u-tou", "methi"]},
+      propiedades: ["Galactagogo", "Hipoglucemiante", "Anabolizante natural"],
+      parteUsable: "Semillas",
+      dosis: "1-2 cucharaditas de semillas remojadas o en polvo.",
+      preparacion: "Polvo, infusión",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "Puede inducir contracciones." }],
+      descripcion: "Aumenta la producción de leche materna y ayuda a regular el azúcar en sangre.",
+      sistemasRelacionados: ["sistema-endocrino", "sistema-reproductor", "sistema-digestivo"],
+      categoriaId: "hierbas-aromaticas-culinarias",
+      categoria: "Hierbas aromáticas y culinarias",
+    },
+    {
+      id: "mostaza-negra",
+      nombre: "Mostaza Negra",
+      nombreCientifico: "Brassica nigra",
+      nombresAlternativos: {"España": ["agenabe", "agenabo", "agenave", "ajenabe", "ajenabo"], "USA_English": ["black mustard", "charlock", "true mustard", "brown mustard", "red mustard"], "UK_English": ["black mustard", "charlock", "true mustard", "brown mustard", "red mustard"]},
+      propiedades: ["Rubefaciente", "Estimulante digestivo", "Expectorante"],
+      parteUsable: "Semillas",
+      dosis: "Uso externo en cataplasmas. Internamente con mucha moderación.",
+      preparacion: "Cataplasma, polvo",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Irritante para la piel y mucosas si se usa en exceso." }],
+      descripcion: "Utilizada en cataplasmas para aliviar dolores musculares y congestión pulmonar.",
+      sistemasRelacionados: ["sistema-musculoesqueletico", "sistema-respiratorio"],
+      categoriaId: "hierbas-aromaticas-culinarias",
+      categoria: "Hierbas aromáticas y culinarias",
+    },
+    {
+      id: "cilantro-vietnamita",
+      nombre: "Cilantro Vietnamita",
+      nombreCientifico: "Persicaria odorata",
+      nombresAlternativos: {"USA_English": ["vietnamese coriander", "vietnamese mint", "asian mint", "hot mint", "laksa leaf", "praew leaf"], "UK_English": ["vietnamese coriander", "vietnamese mint", "asian mint", "hot mint", "laksa leaf", "praew leaf"], "Otros": ["rau răm", "daun kesom", "daun laksa", "phak phai"]},
+      propiedades: ["Digestivo", "Antiinflamatorio", "Antibacteriano"],
+      parteUsable: "Hojas",
+      dosis: "Consumo directo en comidas.",
+      preparacion: "Consumo directo",
+      contraindicaciones: [],
+      descripcion: "Hierba con sabor picante y cítrico, usada en la cocina asiática por sus propiedades digestivas.",
+      sistemasRelacionados: ["sistema-digestivo"],
+      categoriaId: "hierbas-aromaticas-culinarias",
+      categoria: "Hierbas aromáticas y culinarias",
+    },
+    {
+      id: "epazote",
+      nombre: "Epazote",
+      nombreCientifico: "Dysphania ambrosioides",
+      nombresAlternativos: {"México": ["paico", "pazote", "ipazote", "apazote", "acahualillo", "té de milpa", "hierbas de zorrillo", "bitia", "quelite apestoso", "epazote de toro", "epazotl"], "USA_English": ["epazote", "jesuit's tea", "mexican tea", "wormseed"], "UK_English": ["epazote", "jesuit's tea", "mexican tea", "wormseed"]},
+      propiedades: ["Vermífugo", "Antiespasmódico", "Carminativo"],
+      parteUsable: "Hojas y flores",
+      dosis: "Usado tradicionalmente en la cocción de frijoles. Infusión con precaución.",
+      preparacion: "Cocción, infusión",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "Tóxico y abortivo en dosis altas." }, { tipo: "ninos", descripcion: "Tóxico en dosis altas." }],
+      descripcion: "Hierba tradicional mexicana para expulsar parásitos intestinales y aliviar gases.",
+      sistemasRelacionados: ["sistema-digestivo"],
+      categoriaId: "hierbas-aromaticas-culinarias",
+      categoria: "Hierbas aromáticas y culinarias",
+    },
+    {
+      id: "pimpinela-mayor",
+      nombre: "Pimpinela Mayor",
+      nombreCientifico: "Sanguisorba officinalis",
+      nombresAlternativos: {"España": ["pimpinela mayor", "hierba de la mora", "pimpinela de los prados", "sanguisorba", "sanguisorba mayor", "agrimonia bastarda", "ensalada italiana", "escalerilla", "pampanilla", "pempinela"], "USA_English": ["great burnet", "salad burnet", "greater burnet", "official burnet", "burnet bloodwort"], "UK_English": ["great burnet", "salad burnet", "greater burnet", "official burnet", "burnet bloodwort"], "Otros": ["hierba de la mora", "pimpinela mayor", "sanguina", "julivert de bosc"]},
+      propiedades: ["Astringente", "Antihemorrágica", "Antiinflamatoria"],
+      parteUsable: "Raíz y hojas",
+      dosis: "Decocción de la raíz o infusión de las hojas.",
+      preparacion: "Decocción, infusión",
+      contraindicaciones: [],
+      descripcion: "Planta utilizada para detener sangrados y tratar diarreas.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-cardiovascular"],
+      categoriaId: "hierbas-aromaticas-culinarias",
+      categoria: "Hierbas aromáticas y culinarias",
+    },
+    {
+      id: "agrimonia",
+      nombre: "Agrimonia",
+      nombreCientifico: "Agrimonia eupatoria",
+      nombresAlternativos: {"España": ["agrimonia común", "algafil", "alimonia", "amores pequeños", "amoricos", "arquimonia", "cabsitiella", "esmermasangre", "eupatoria", "gafetí", "hierba de San Guillermo", "hierba del podador", "mermasangre", "hierba bacera", "agrimoña"], "USA_English": ["common agrimony", "church steeples", "sticklewort", "liverwort"], "UK_English": ["common agrimony", "church steeples", "sticklewort", "liverwort"]},
+      propiedades: ["Astringente", "Colagoga", "Antiinflamatoria para la garganta"],
+      parteUsable: "Sumidades floridas",
+      dosis: "Infusión de 1-2 cucharaditas por taza. Gargarismos.",
+      preparacion: "Infusión, gargarismos",
+      contraindicaciones: [],
+      descripcion: "Conocida como la \"hierba de los cantores\", es excelente para la afonía y la garganta irritada.",
+      sistemasRelacionados: ["enfermedades-ojos-oidos-nariz-garganta", "sistema-digestivo"],
+      categoriaId: "hierbas-aromaticas-culinarias",
+      categoria: "Hierbas aromáticas y culinarias",
+    },
+    {
+      id: "galanga",
+      nombre: "Galanga",
+      nombreCientifico: "Alpinia galanga",
+      nombresAlternativos: {"España": ["galanga", "jengibre de siam", "galanga de java", "galanga de la india", "calanga", "galangal mayor", "jengibre siamés"], "USA_English": ["lesser galangal", "greater galangal", "siamese ginger", "java galangal", "blue ginger", "thai ginger"], "UK_English": ["lesser galangal", "greater galangal", "siamese ginger", "java galangal", "blue ginger", "thai ginger"], "Otros": ["lengkuas", "hang dou kou", "stor kalanga", "el adkham", "gaoliangjiang"]},
+      propiedades: ["Carminativa", "Antiemética", "Antiinflamatoria"],
+      parteUsable: "Rizoma",
+      dosis: "Similar al jengibre, en infusiones o en polvo.",
+      preparacion: "Infusión, polvo",
+      contraindicaciones: [],
+      descripcion: "Pariente del jengibre, se usa para problemas digestivos y mareos.",
+      sistemasRelacionados: ["sistema-digestivo"],
+      categoriaId: "hierbas-aromaticas-culinarias",
+      categoria: "Hierbas aromáticas y culinarias",
+    },
+    {
+      id: "lemongrass",
+      nombre: "Lemongrass",
+      nombreCientifico: "Cymbopogon citratus",
+      nombresAlternativos: {"España": ["té de limón", "pasto de limón", "lemongrass", "pasto citronella", "hierba limón", "citronela"], "Centroamérica": ["limoncillo", "zacate limón", "caña santa"], "Argentina": ["pasto cedrón", "caña santa", "pasto limón"], "Bolivia": ["mal ojillo", "malojillo"], "Cuba": ["caña limón", "caña santa", "cañuela", "citronela", "corta calentura", "hierba de calentura"], "USA_English": ["lemongrass", "west indian lemon grass", "citronella grass", "serai", "oil grass", "fever grass"], "UK_English": ["lemongrass", "west indian lemon grass", "citronella grass", "serai", "oil grass", "fever grass"], "Otros": ["toronjil de caña", "limonaria", "pajete", "caña de limón"]},
+      propiedades: ["Digestivo", "Febrífugo", "Sedante suave", "Antibacteriano"],
+      parteUsable: "Tallos y hojas",
+      dosis: "Infusión de 1 tallo por taza.",
+      preparacion: "Infusión",
+      contraindicaciones: [],
+      descripcion: "Hierba con aroma a limón, ayuda a la digestión, calma los nervios y baja la fiebre.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-nervioso", "sistema-inmunologico"],
+      categoriaId: "hierbas-aromaticas-culinarias",
+      categoria: "Hierbas aromáticas y culinarias",
+    },
+    {
+      id: "ruibarbo",
+      nombre: "Ruibarbo",
+      nombreCientifico: "Rheum rhabarbarum",
+      nombresAlternativos: {"España": ["ruibarbo", "rubarbo"], "USA_English": ["rhubarb", "pie-plant"], "UK_English": ["rhubarb"], "Otros": ["arabarba", "ruibarbre"]},
+      propiedades: ["Laxante", "Purgante", "Astringente (en dosis bajas)"],
+      parteUsable: "Rizoma (medicinal), pecíolos (comestible)",
+      dosis: "Decocción del rizoma. Dosis bajas son astringentes, altas son laxantes.",
+      preparacion: "Decocción",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Las hojas son tóxicas por su alto contenido en oxalatos." }],
+      descripcion: "Su raíz es un laxante eficaz, pero debe usarse con cuidado. Los tallos son comestibles.",
+      sistemasRelacionados: ["sistema-digestivo"],
+      categoriaId: "hierbas-aromaticas-culinarias",
+      categoria: "Hierbas aromáticas y culinarias",
+    },
+    {
+      id: "stevia",
+      nombre: "Stevia",
+      nombreCientifico: "Stevia rebaudiana",
+      nombresAlternativos: {"España": ["estevia", "planta dulce"], "USA_English": ["stevia", "candyleaf", "sweetleaf", "sugarleaf", "sweet herb of paraguay", "sweet honey leaf"], "UK_English": ["stevia", "candyleaf", "sweetleaf", "sugarleaf", "sweet herb of paraguay", "sweet honey leaf"], "Indigena": ["kaá heé", "caá ehé", "kaá-jeé"], "Otros": ["yerba dulce", "hierba dulce", "hierba de miel"]},
+      propiedades: ["Edulcorante natural", "Hipoglucemiante", "Hipotensora"],
+      parteUsable: "Hojas",
+      dosis: "Hojas frescas o secas para endulzar infusiones y comidas.",
+      preparacion: "Consumo directo, infusión",
+      contraindicaciones: [],
+      descripcion: "Endulzante natural sin calorías que puede ayudar a regular el azúcar y la presión arterial.",
+      sistemasRelacionados: ["sistema-endocrino", "sistema-cardiovascular"],
+      categoriaId: "hierbas-aromaticas-culinarias",
+      categoria: "Hierbas aromáticas y culinarias",
+    },
+    {
+      id: "wasabi",
+      nombre: "Wasabi",
+      nombreCientifico: "Eutrema japonicum",
+      nombresAlternativos: {"USA_English": ["wasabi", "japanese horseradish"], "UK_English": ["wasabi", "japanese horseradish"], "Otros": ["rábano picante japonés"]},
+      propiedades: ["Antimicrobiano", "Descongestionante", "Antiinflamatorio"],
+      parteUsable: "Rizoma",
+      dosis: "Pequeñas cantidades como condimento.",
+      preparacion: "Rallado fresco",
+      contraindicaciones: [],
+      descripcion: "Potente descongestionante nasal y con propiedades antimicrobianas, ideal para acompañar pescado crudo.",
+      sistemasRelacionados: ["sistema-respiratorio", "sistema-digestivo"],
+      categoriaId: "hierbas-aromaticas-culinarias",
+      categoria: "Hierbas aromáticas y culinarias",
+    },
+    {
+      id: "bergamota",
+      nombre: "Bergamota",
+      nombreCientifico: "Monarda didyma",
+      nombresAlternativos: {"España": ["pera del Bey"], "Argentina": ["naranja agria"], "USA_English": ["Bergamot orange", "Bergamot"], "UK_English": ["Bergamot orange"]},
+      propiedades: ["Carminativa", "Antiséptica", "Febrífuga"],
+      parteUsable: "Hojas y flores",
+      dosis: "Infusión de las hojas y flores.",
+      preparacion: "Infusión",
+      contraindicaciones: [],
+      descripcion: "También conocida como té de Oswego, se usa para problemas digestivos y resfriados.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-respiratorio"],
+      categoriaId: "hierbas-aromaticas-culinarias",
+      categoria: "Hierbas aromáticas y culinarias",
+    },
+    {
+      id: "calendula",
+      nombre: "Caléndula",
+      nombreCientifico: "Calendula officinalis",
+      nombresAlternativos: {"España": ["botón de oro", "mercadela", "maravilla", "clavelina"], "México": ["flor de muerto", "chinita"], "Colombia": ["botón de oro", "maravilla"], "USA_English": ["pot marigold", "common marigold", "ruddles"], "UK_English": ["Scotch marigold"]},
+      propiedades: ["Cicatrizante", "Antiinflamatoria", "Antiséptica", "Emenagoga"],
+      parteUsable: "Flores",
+      dosis: "Uso tópico en cremas o aceites. Infusión para uso interno.",
+      preparacion: "Crema, aceite, infusión",
+      contraindicaciones: [{ tipo: "alergia", descripcion: "Puede causar alergia a personas sensibles a las compuestas." }],
+      descripcion: "Maravillosa para la piel, acelera la cicatrización y reduce la inflamación.",
+      sistemasRelacionados: ["enfermedades-piel", "sistema-digestivo"],
+      categoriaId: "hierbas-aromaticas-culinarias",
+      categoria: "Hierbas aromáticas y culinarias",
+    },
+    {
+      id: "capuchina",
+      nombre: "Capuchina",
+      nombreCientifico: "Tropaeolum majus",
+      nombresAlternativos: {"España": ["taco de reina", "espuela de galán", "mastuerzo de Indias"], "México": ["pelonchili", "mastuerzo"], "Colombia": ["cachaco", "antioqueña"], "Perú": ["texao"], "USA_English": ["nasturtium", "Indian cress", "monk's cress"], "UK_English": ["garden nasturtium", "nasturtium"]},
+      propiedades: ["Antibiótica natural", "Expectorante", "Rica en Vitamina C"],
+      parteUsable: "Flores y hojas",
+      dosis: "Consumo directo en ensaladas.",
+      preparacion: "Consumo directo",
+      contraindicaciones: [],
+      descripcion: "Considerada un antibiótico vegetal, es útil para infecciones respiratorias y urinarias.",
+      sistemasRelacionados: ["sistema-respiratorio", "sistema-urinario", "sistema-inmunologico"],
+      categoriaId: "hierbas-aromaticas-culinarias",
+      categoria: "Hierbas aromáticas y culinarias",
+    },
+    {
+      id: "borraja",
+      nombre: "Borraja",
+      nombreCientifico: "Borago officinalis",
+      nombresAlternativos: {"España": ["aborraja", "borracha", "borraina"], "Colombia": ["borraja blanca"], "USA_English": ["borage", "starflower", "cool-tankard"], "UK_English": ["borage", "starflower"]},
+      propiedades: ["Sudorífica", "Expectorante", "Antiinflamatoria", "Emoliente"],
+      parteUsable: "Flores y aceite de semillas",
+      dosis: "Infusión de flores. El aceite de semillas se toma en perlas.",
+      preparacion: "Infusión, perlas de aceite",
+      contraindicaciones: [],
+      descripcion: "El aceite de sus semillas es rico en omega-6, beneficioso para la piel y la inflamación.",
+      sistemasRelacionados: ["enfermedades-piel", "sistema-respiratorio", "sistema-endocrino"],
+      categoriaId: "hierbas-aromaticas-culinarias",
+      categoria: "Hierbas aromáticas y culinarias",
+    },
+    {
+      id: "verbena-olorosa",
+      nombre: "Hierbaluisa",
+      nombreCientifico: "Aloysia citrodora",
+      nombresAlternativos: {"España": ["cedrón", "hierba de la princesa", "verbena olorosa"], "Argentina": ["cedrón"], "Chile": ["cedrón"], "Perú": ["cedrón"], "USA_English": ["lemon verbena"], "UK_English": ["lemon verbena"]},
+      propiedades: ["Digestiva", "Carminativa", "Relajante", "Antiespasmódica"],
+      parteUsable: "Hojas",
+      dosis: "Infusión de una cucharadita por taza.",
+      preparacion: "Infusión",
+      contraindicaciones: [],
+      descripcion: "También llamada Verbena de olor, es una planta con aroma a limón excelente para la digestión y los nervios.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-nervioso"],
+      categoriaId: "hierbas-aromaticas-culinarias",
+      categoria: "Hierbas aromáticas y culinarias",
+    },
+    {
+      id: "gordolobo",
+      nombre: "Gordolobo",
+      nombreCientifico: "Verbascum thapsus",
+      nombresAlternativos: {"España": ["verbasco", "candelaria", "oreja de burro", "friega platos"], "USA_English": ["mullein", "great mullein", "common mullein"], "UK_English": ["mullein", "great mullein", "common mullein"]},
+      propiedades: ["Expectorante", "Emoliente", "Balsámica"],
+      parteUsable: "Flores",
+      dosis: "Infusión de las flores, bien colada para retirar los pelillos.",
+      preparacion: "Infusión",
+      contraindicaciones: [],
+      descripcion: "Remedio pectoral por excelencia, suaviza la garganta y ayuda a expulsar la mucosidad.",
+      sistemasRelacionados: ["sistema-respiratorio"],
+      categoriaId: "hierbas-aromaticas-culinarias",
+      categoria: "Hierbas aromáticas y culinarias",
+    },
+    {
+      id: "malva",
+      nombre: "Malva",
+      nombreCientifico: "Malva sylvestris",
+      nombresAlternativos: {"España": ["malva común", "panecillos", "quesitos"], "Colombia": ["malva blanca", "malva morada"], "Argentina": ["malva"], "USA_English": ["common mallow", "high mallow", "wood mallow"], "UK_English": ["common mallow", "cheeses"]},
+      propiedades: ["Emoliente", "Antiinflamatoria", "Laxante suave", "Balsámica"],
+      parteUsable: "Flores y hojas",
+      dosis: "Infusión de flores y hojas.",
+      preparacion: "Infusión, gargarismos",
+      contraindicaciones: [],
+      descripcion: "Rica en mucílagos, suaviza las mucosas respiratorias, digestivas y la piel.",
+      sistemasRelacionados: ["sistema-respiratorio", "sistema-digestivo", "enfermedades-piel"],
+      categoriaId: "hierbas-aromaticas-culinarias",
+      categoria: "Hierbas aromáticas y culinarias",
+    },
+    {
+      id: "aciano",
+      nombre: "Aciano",
+      nombreCientifico: "Centaurea cyanus",
+      nombresAlternativos: {"España": ["azulejo", "escobilla", "flor de cielo"], "Perú": ["pincel"], "Colombia": ["pincel"], "USA_English": ["cornflower", "bachelor's button"], "UK_English": ["cornflower", "bachelor's button"]},
+      propiedades: ["Antiinflamatorio ocular", "Diurético", "Tónico"],
+      parteUsable: "Flores",
+      dosis: "Baños oculares con la infusión fría.",
+      preparacion: "Infusión para baños oculares",
+      contraindicaciones: [],
+      descripcion: "La flor de aciano es el remedio principal para la inflamación y el cansancio de los ojos.",
+      sistemasRelacionados: ["enfermedades-ojos-oidos-nariz-garganta"],
+      categoriaId: "hierbas-aromaticas-culinarias",
+      categoria: "Hierbas aromáticas y culinarias",
+    },
+    {
+      id: "ulmaria",
+      nombre: "Ulmaria",
+      nombreCientifico: "Filipendula ulmaria",
+      nombresAlternativos: {"España": ["florón", "norotil", "reina de los prados", "brosta", "gramònica", "filipéndula", "altarcina", "altareina", "altarreina", "espirea", "hierba de las abejas", "barba de cabra", "ulmeria"], "USA_English": ["meadowsweet", "queen-of-the-meadow", "mead wort", "pride of the meadow", "meadow-wort"], "UK_English": ["meadowsweet", "queen-of-the-meadow", "mead wort", "pride of the meadow", "meadow-wort", "bittersweet", "bridewort"]},
+      propiedades: ["Antiinflamatoria", "Analgésica", "Antipirética", "Diurética"],
+      parteUsable: "Sumidades floridas",
+      dosis: "Infusión de una cucharadita por taza.",
+      preparacion: "Infusión",
+      contraindicaciones: [{ tipo: "alergia", descripcion: "No usar si hay alergia a la aspirina (contiene salicilatos)." }],
+      descripcion: "Conocida como la \"aspirina vegetal\", alivia el dolor y la fiebre.",
+      sistemasRelacionados: ["sistema-musculoesqueletico", "sistema-urinario"],
+      categoriaId: "hierbas-aromaticas-culinarias",
+      categoria: "Hierbas aromáticas y culinarias",
+    },
+    {
+      id: "milenrama",
+      nombre: "Milenrama",
+      nombreCientifico: "Achillea millefolium",
+      nombresAlternativos: {"España": ["perejil bravío", "flor de la pluma", "mil hojas", "ciento en rama", "plumajillo", "plumajo", "alcanfor", "aquilea", "cientoenrama", "milhojas", "hierba de Aquiles"], "Chile": ["milflores", "altamisa"], "USA_English": ["yarrow", "common yarrow", "milfoil", "thousandleaf", "soldier's woundwort", "bloodwort", "nose bleed", "devil's nettle", "gordaldo", "old man's pepper", "sanguinary"], "UK_English": ["yarrow", "common yarrow", "milfoil", "thousandleaf", "soldier's woundwort", "bloodwort", "nose bleed", "devil's nettle", "gordaldo", "old man's pepper", "sanguinary"]},
+      propiedades: ["Antihemorrágica", "Emenagoga", "Antiinflamatoria", "Digestiva"],
+      parteUsable: "Sumidades floridas",
+      dosis: "Infusión de una cucharadita por taza.",
+      preparacion: "Infusión",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "No usar durante el embarazo." }],
+      descripcion: "Planta de la mujer, regula los ciclos menstruales y corta hemorragias.",
+      sistemasRelacionados: ["sistema-reproductor", "sistema-digestivo", "sistema-cardiovascular"],
+      categoriaId: "hierbas-aromaticas-culinarias",
+      categoria: "Hierbas aromáticas y culinarias",
+    },
+    {
+      id: "artemisa",
+      nombre: "Artemisa",
+      nombreCientifico: "Artemisia vulgaris",
+      nombresAlternativos: {"España": ["artemega", "ceñidor", "yuyo crisantemo", "hierba de San Juan", "madra", "artemisia", "manzanillón", "ajenjo", "altamisa", "anastasia", "artamisa", "artamisia", "escobilla parda", "flor de santos"], "USA_English": ["mugwort", "riverside wormwood", "wild wormwood", "felon herb", "common mugwort"], "UK_English": ["mugwort", "riverside wormwood", "wild wormwood", "felon herb", "common mugwort"]},
+      propiedades: ["Emenagoga", "Tónico digestivo", "Vermífuga"],
+      parteUsable: "Hojas y sumidades floridas",
+      dosis: "Infusión de una cucharadita por taza. No usar de forma prolongada.",
+      preparacion: "Infusión",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "Abortiva. Totalmente contraindicada." }],
+      descripcion: "Potente regulador menstrual y tónico para la digestión.",
+      sistemasRelacionados: ["sistema-reproductor", "sistema-digestivo"],
+      categoriaId: "hierbas-aromaticas-culinarias",
+      categoria: "Hierbas aromáticas y culinarias",
+    },
+    {
+      id: "ajenjo",
+      nombre: "Ajenjo",
+      nombreCientifico: "Artemisia absinthium",
+      nombresAlternativos: {"España": ["asensio", "ajorizo", "artemisia amarga", "hierba maestra", "hierba santa", "absintio", "asencio", "absenta", "donzell", "encens", "asentsio", "ajenjo mayor", "ajenjo común", "ajenjo macho", "ajenjo vulgar", "ajencio", "ajenjio", "asenjo"], "USA_English": ["wormwood", "absinthium", "green ginger", "absinthe", "old woman", "southernwood", "absinth sage", "absinth wormwood", "absinth sagewort", "common sagewort", "absinthe mugwort"], "UK_English": ["wormwood", "absinthium", "green ginger", "absinthe", "old woman", "southernwood", "absinth sage", "absinth wormwood", "absinth sagewort", "common sagewort", "absinthe mugwort"]},
+      propiedades: ["Tónico amargo", "Vermífugo", "Colagogo", "Emenagogo"],
+      parteUsable: "Hojas y sumidades floridas",
+      dosis: "Infusión de 0.5-1g por taza, antes de las comidas. Usar en periodos cortos.",
+      preparacion: "Infusión",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "Abortivo y neurotóxico. Totalmente contraindicado." }, { tipo: "lactancia", descripcion: "Totalmente contraindicado." }],
+      descripcion: "Uno de los tónicos amargos más potentes, para la falta de apetito y problemas de vesícula.",
+      sistemasRelacionados: ["sistema-digestivo"],
+      categoriaId: "hierbas-aromaticas-culinarias",
+      categoria: "Hierbas aromáticas y culinarias",
+    },
+    {
+      id: "lupulo",
+      nombre: "Lúpulo",
+      nombreCientifico: "Humulus lupulus",
+      nombresAlternativos: {"España": ["betiguera", "cañamiza", "cerveza", "cuerpo de hombre", "lupios", "zaramangón", "espárrago ortiguero", "espárrago de zarza", "esparraguera", "llùpol", "herba de sa cervesa"], "USA_English": ["common hop", "hop"], "UK_English": ["common hop", "hop"]},
+      propiedades: ["Sedante", "Hipnótico", "Ansiolítico", "Fitoestrogénico"],
+      parteUsable: "Conos (flores femeninas)",
+      dosis: "Infusión de 1-2 conos por taza antes de acostarse.",
+      preparacion: "Infusión, extracto",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Puede agravar la depresión." }],
+      descripcion: "Inductor del sueño y calmante de la ansiedad. También usado en la menopausia.",
+      sistemasRelacionados: ["sistema-nervioso", "sistema-endocrino"],
+      categoriaId: "hierbas-aromaticas-culinarias",
+      categoria: "Hierbas aromáticas y culinarias",
+    },
+    {
+      id: "valeriana",
+      nombre: "Valeriana",
+      nombreCientifico: "Valeriana officinalis",
+      nombresAlternativos: {"España": ["valeriana común", "valeriana de las boticas", "valeriana medicinal", "hierba de los gatos"], "Cataluña": ["herba gatera", "valedriana", "valeriana vera"], "Colombia": ["valeriana"], "Uruguay": ["yerba del gato", "belar", "bedukata", "yerba del aguilucho blanco"], "USA_English": ["garden heliotrope", "common valerian", "all-heal", "garden valerian", "greek valerian"], "UK_English": ["garden heliotrope", "common valerian", "all-heal", "garden valerian", "greek valerian"]},
+      propiedades: ["Sedante", "Hipnótica", "Relajante muscular", "Ansiolítica"],
+      parteUsable: "Raíz y rizoma",
+      dosis: "Decocción de la raíz (2-3g por taza) o extracto estandarizado.",
+      preparacion: "Decocción, extracto, tintura",
+      contraindicaciones: [{ tipo: "medicamentos", descripcion: "Potencia el efecto de otros sedantes." }],
+      descripcion: "El remedio clásico para el insomnio y la ansiedad, relaja la mente y el cuerpo.",
+      sistemasRelacionados: ["sistema-nervioso"],
+      categoriaId: "hierbas-aromaticas-culinarias",
+      categoria: "Hierbas aromáticas y culinarias",
+    },
+    {
+      id: "ruda",
+      nombre: "Ruda",
+      nombreCientifico: "Ruta graveolens",
+      nombresAlternativos: {"España": ["arruda", "rúa", "ruda común", "ruda cultivada", "ruda de hojas anchas", "armaga"], "USA_English": ["rue", "common rue", "garden rue", "herb of grace"], "UK_English": ["rue", "common rue", "garden rue", "herb of grace"]},
+      propiedades: ["Emenagoga", "Antiespasmódica", "Rubefaciente"],
+      parteUsable: "Hojas y sumidades floridas",
+      dosis: "Infusión de 0.5g por taza. Usar con extrema precaución.",
+      preparacion: "Infusión",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "Es un potente abortivo. Totalmente contraindicada." }, { tipo: "otro", descripcion: "Fototóxica. No exponer la piel al sol tras su uso tópico." }],
+      descripcion: "Planta muy potente para regular la menstruación, pero tóxica en dosis altas.",
+      sistemasRelacionados: ["sistema-reproductor", "sistema-digestivo"],
+      categoriaId: "hierbas-aromaticas-culinarias",
+      categoria: "Hierbas aromáticas y culinarias",
+    },
+    {
+      id: "ajedrea-de-jardin",
+      nombre: "Ajedrea de jardín",
+      nombreCientifico: "Satureja hortensis",
+      nombresAlternativos: {"España": ["hierba olivera", "saborija", "saturagón", "ajedrea", "señorita", "sajolida", "senyorida de jardí", "ajedrea común", "saborida", "ajedrea blanca", "albahaca de tomillo", "aljedrea", "calamento blanco", "hisopillo", "hisopo montesino", "jedrea", "calaminto blanco", "tomillo real"], "USA_English": ["summer savory", "savory"], "UK_English": ["summer savory", "savory"]},
+      propiedades: ["Digestiva", "Carminativa", "Antiséptica", "Expectorante"],
+      parteUsable: "Hojas y sumidades floridas",
+      dosis: "Infusión de 1-2 cucharaditas por taza.",
+      preparacion: "Infusión",
+      contraindicaciones: [],
+      descripcion: "Similar a la ajedrea de montaña, pero con un sabor más suave. Ayuda a la digestión y alivia los gases.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-respiratorio"],
+      categoriaId: "hierbas-aromaticas-culinarias",
+      categoria: "Hierbas aromáticas y culinarias",
+    },
+    {
+      id: "perilla",
+      nombre: "Perilla",
+      nombreCientifico: "Perilla frutescens",
+      nombresAlternativos: {"USA_English": ["perilla", "beefsteak plant", "shiso", "perilla mint", "purple shiso", "chinese basil", "purple perilla", "japanese basil"], "UK_English": ["perilla", "beefsteak plant", "shiso", "perilla mint", "purple shiso", "chinese basil", "purple perilla", "japanese basil"], "Otros": ["deulkkae", "egoma", "zisu", "silam", "albahaca japonesa", "albahaca china", "melisa verde", "hierba azul", "tulkeé"]},
+      propiedades: ["Antialérgica", "Antiinflamatoria", "Expectorante", "Antimicrobiana"],
+      parteUsable: "Hojas y semillas",
+      dosis: "Infusión de las hojas. El aceite de las semillas se usa para las alergias.",
+      preparacion: "Infusión, aceite",
+      contraindicaciones: [],
+      descripcion: "Hierba asiática muy usada para tratar alergias estacionales, asma y resfriados.",
+      sistemasRelacionados: ["sistema-inmunologico", "sistema-respiratorio", "enfermedades-piel"],
+      categoriaId: "hierbas-aromaticas-culinarias",
+      categoria: "Hierbas aromáticas y culinarias",
+    },
+  ],
+};
+
+export default categoria;
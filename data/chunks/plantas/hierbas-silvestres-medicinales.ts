@@ -0,0 +1,909 @@
+// Generado automáticamente por scripts/build-catalog.py - no editar a mano
+import type { CategoriaPlanta } from '../../plantas-expandidas';
+
+const categoria: CategoriaPlanta = {
+  id: "hierbas-silvestres-medicinales",
+  nombre: "Hierbas silvestres medicinales",
+  plantas: [
+    {
+      id: "manzanilla",
+      nombre: "Manzanilla",
+      nombreCientifico: "Matricaria chamomilla",
+      nombresAlternativos: {"España": ["manzanilla común", "manzanilla de Aragón", "manzanilla alemana", "camomila"], "México": ["manzanilla de Castilla", "manzanilla cimarrona"], "Argentina": ["manzanilla"], "USA_English": ["chamomile", "German chamomile", "Hungarian chamomile"], "UK_English": ["camomile", "German camomile"], "Indigena": ["queza", "gguía-gueza"]},
+      propiedades: ["Digestiva", "Antiinflamatoria", "Calmante", "Antibacteriana", "Relajante"],
+      parteUsable: "Flores",
+      dosis: "1-2 tazas de infusión al día",
+      preparacion: "Infusión",
+      contraindicaciones: [],
+      descripcion: "La manzanilla es una de las plantas medicinales que más se conocen por las propiedades de su flor. Sus efectos son especialmente relevantes en el tratamiento de molestias gastrointestinales.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-nervioso", "enfermedades-piel"],
+      categoriaId: "hierbas-silvestres-medicinales",
+      categoria: "Hierbas silvestres medicinales",
+    },
+    {
+      id: "aloe-vera",
+      nombre: "Aloe Vera",
+      nombreCientifico: "Aloe barbadensis miller",
+      nombresAlternativos: {"España": ["Aloe vera", "Sábila", "Acíbar"], "Mexico": ["Sábila"], "Colombia": ["Sábila", "Aloe de Curazao"], "Peru": ["Sábila"], "Caribe": ["Sábila", "Aloe de Barbados"], "USA_English": ["Aloe vera", "Barbados aloe"], "UK_English": ["Aloe vera", "Barbados aloe"]},
+      propiedades: ["Antiinflamatoria", "Cicatrizante", "Regeneradora", "Hidratante"],
+      parteUsable: "Gel de las hojas",
+      dosis: "Aplicación tópica según necesidad",
+      preparacion: "Uso directo del gel",
+      contraindicaciones: [],
+      descripcion: "Otra de las plantas medicinales más conocidas es el Aloe Vera. Se trata de una conocida planta con capacidad antiinflamatoria y que se utiliza en diversos productos de higiene personal debido a su acción favorecedora para la regeneración cutánea.",
+      sistemasRelacionados: ["enfermedades-piel", "sistema-digestivo", "sistema-inmunologico"],
+      categoriaId: "hierbas-silvestres-medicinales",
+      categoria: "Hierbas silvestres medicinales",
+    },
+    {
+      id: "ajo",
+      nombre: "Ajo",
+      nombreCientifico: "Allium sativum",
+      nombresAlternativos: {"España": ["Ajo", "Ajo andaluz", "Ajo blanco"], "Mexico": ["Ajo"], "USA_English": ["Garlic"], "UK_English": ["Garlic"]},
+      propiedades: ["Antibiótico", "Anticoagulante", "Antioxidante", "Fortalecedor del sistema inmune"],
+      parteUsable: "Bulbo",
+      dosis: "1-2 dientes de ajo al día",
+      preparacion: "Consumo directo o en comidas",
+      contraindicaciones: [],
+      descripcion: "El ajo es un potente fortalecedor del sistema inmune y tiene efectos que promueven una circulación sanguínea eficiente (es anticoagulante), además de ser antibacteriano y antibiótico y tener propiedades antioxidantes.",
+      sistemasRelacionados: ["sistema-cardiovascular", "sistema-inmunologico"],
+      categoriaId: "hierbas-silvestres-medicinales",
+      categoria: "Hierbas silvestres medicinales",
+    },
+    {
+      id: "eucalipto",
+      nombre: "Eucalipto",
+      nombreCientifico: "Eucalyptus globulus",
+      nombresAlternativos: {"España": ["eucalipto blanco", "eucalipto común", "eucalipto azul", "calipes", "calipse", "calipto"], "USA_English": ["southern blue gum", "blue gum", "Tasmanian blue gum"], "UK_English": ["blue gum", "Tasmanian blue gum"]},
+      propiedades: ["Expectorante", "Antimicrobiano", "Hipoglucemiante"],
+      parteUsable: "Hojas",
+      dosis: "Inhalación de vapor o infusión",
+      preparacion: "Vahos o infusión",
+      contraindicaciones: [],
+      descripcion: "El eucalipto es otra de las plantas medicinales más conocidas, especialmente en lo que se refiere a su acción ante enfermedades respiratorias.",
+      sistemasRelacionados: ["sistema-respiratorio", "sistema-endocrino"],
+      categoriaId: "hierbas-silvestres-medicinales",
+      categoria: "Hierbas silvestres medicinales",
+    },
+    {
+      id: "cola-de-caballo",
+      nombre: "Cola de caballo",
+      nombreCientifico: "Equisetum arvense",
+      nombresAlternativos: {"España": ["Cola de caballo", "Equiseto", "Limpiaplata", "Canutillo", "Pinillo"], "Mexico": ["Cola de caballo"], "USA_English": ["Horsetail", "Common horsetail", "Field horsetail"], "UK_English": ["Horsetail", "Common horsetail", "Field horsetail"]},
+      propiedades: ["Diurética", "Depurativa", "Regeneradora", "Astringente"],
+      parteUsable: "Tallo",
+      dosis: "1-2 tazas de infusión al día",
+      preparacion: "Infusión",
+      contraindicaciones: [],
+      descripcion: "Esta planta, en concreto su tallo, es especialmente conocida por aquellas personas con cistitis u otras infecciones del aparato urinario.",
+      sistemasRelacionados: ["sistema-urinario", "enfermedades-piel", "sistema-musculoesqueletico"],
+      categoriaId: "hierbas-silvestres-medicinales",
+      categoria: "Hierbas silvestres medicinales",
+    },
+    {
+      id: "hiperico",
+      nombre: "Hipérico",
+      nombreCientifico: "Hypericum perforatum",
+      nombresAlternativos: {"España": ["Hipérico", "Hierba de San Juan", "Corazoncillo"], "Argentina": ["Hierba de San Juan"], "USA_English": ["St. John's wort"], "UK_English": ["St. John's wort"]},
+      propiedades: ["Antidepresivo", "Ansiolítico", "Analgésico"],
+      parteUsable: "Sumidades floridas",
+      dosis: "Consultar a un profesional",
+      preparacion: "Infusión o extracto",
+      contraindicaciones: [{ tipo: "medicamentos", descripcion: "No combinar con antidepresivos" }],
+      descripcion: "También llamada hierba de San Juan. Esta planta medicinal tiene diferentes propiedades, pero destaca el hecho de que posee propiedades antidepresivas.",
+      sistemasRelacionados: ["sistema-nervioso", "trastornos-mentales-emocionales"],
+      categoriaId: "hierbas-silvestres-medicinales",
+      categoria: "Hierbas silvestres medicinales",
+    },
+    {
+      id: "jengibre",
+      nombre: "Jengibre",
+      nombreCientifico: "Zingiber officinale",
+      nombresAlternativos: {"Perú": ["kion"], "Filipinas": ["luya"], "Colombia": ["ajengible", "ajengibre", "ajingible", "anjengibre"], "USA_English": ["common ginger", "ginger"], "UK_English": ["ginger"], "India": ["adrak"], "China": ["sheng jiang"], "Japón": ["shoga"]},
+      propiedades: ["Antiemético", "Antiinflamatorio", "Antibacteriano", "Antiviral"],
+      parteUsable: "Rizoma",
+      dosis: "1-2 gramos al día",
+      preparacion: "Infusión o en comidas",
+      contraindicaciones: [],
+      descripcion: "Esta especia es de gran utilidad, poseyendo múltiples propiedades que la hacen una planta medicinal cada vez más relevante.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-respiratorio"],
+      categoriaId: "hierbas-silvestres-medicinales",
+      categoria: "Hierbas silvestres medicinales",
+    },
+    {
+      id: "tomillo",
+      nombre: "Tomillo",
+      nombreCientifico: "Thymus vulgaris",
+      nombresAlternativos: {"España": ["boja", "bojas", "estremoncello", "estremoncillo", "tomello", "tremoncillo"], "USA_English": ["common thyme", "German thyme", "garden thyme"], "UK_English": ["common thyme", "German thyme", "garden thyme"], "Otros": ["orégano", "timonet", "farigola"]},
+      propiedades: ["Antiséptico", "Expectorante", "Antioxidante"],
+      parteUsable: "Hojas y flores",
+      dosis: "1-2 tazas de infusión al día",
+      preparacion: "Infusión o condimento",
+      contraindicaciones: [],
+      descripcion: "El tomillo posee propiedades antioxidantes y antisépticas. Rico en flavonoides, vitamina C, hierro y magnesio.",
+      sistemasRelacionados: ["sistema-respiratorio", "sistema-digestivo", "sistema-inmunologico"],
+      categoriaId: "hierbas-silvestres-medicinales",
+      categoria: "Hierbas silvestres medicinales",
+    },
+    {
+      id: "lavanda",
+      nombre: "Lavanda",
+      nombreCientifico: "Lavandula angustifolia",
+      nombresAlternativos: {"España": ["espliego", "alhucema", "cantueso"], "USA_English": ["lavender", "true lavender", "English lavender"], "UK_English": ["lavender"]},
+      propiedades: ["Relajante", "Cicatrizante", "Analgésica"],
+      parteUsable: "Flores",
+      dosis: "Aromaterapia o infusión",
+      preparacion: "Aceite esencial o infusión",
+      contraindicaciones: [],
+      descripcion: "La lavanda posee propiedades relajantes, siendo útil para situaciones de estrés e insomnio.",
+      sistemasRelacionados: ["sistema-nervioso", "enfermedades-piel"],
+      categoriaId: "hierbas-silvestres-medicinales",
+      categoria: "Hierbas silvestres medicinales",
+    },
+    {
+      id: "tila",
+      nombre: "Tila",
+      nombreCientifico: "Tilia cordata",
+      nombresAlternativos: {"España": ["Tila", "Tilo", "Tilo norteño", "Tilo silvestre"], "Argentina": ["Tilo de hojas pequeñas", "Tilo de Europa"], "USA_English": ["Linden", "Small-leaved lime"], "UK_English": ["Linden", "Small-leaved lime"]},
+      propiedades: ["Relajante", "Diurética", "Antiespasmódica"],
+      parteUsable: "Flores",
+      dosis: "1-2 tazas de infusión al día",
+      preparacion: "Infusión",
+      contraindicaciones: [],
+      descripcion: "Otra planta medicinal altamente conocida y con propiedades relajantes es la tila.",
+      sistemasRelacionados: ["sistema-nervioso", "sistema-urinario"],
+      categoriaId: "hierbas-silvestres-medicinales",
+      categoria: "Hierbas silvestres medicinales",
+    },
+    {
+      id: "diente-de-leon",
+      nombre: "Diente de león",
+      nombreCientifico: "Taraxacum officinale",
+      nombresAlternativos: {"España": ["Diente de león", "Achicoria amarga", "Amargón"], "Mexico": ["Diente de león", "Achicoria amarga", "Amargón", "Cerraja"], "USA_English": ["Dandelion"], "UK_English": ["Dandelion"]},
+      propiedades: ["Diurético", "Depurativo", "Estimulante"],
+      parteUsable: "Hojas y raíz",
+      dosis: "1-2 tazas de infusión al día",
+      preparacion: "Infusión o ensalada",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "Contraindicado en el embarazo" }, { tipo: "medicamentos", descripcion: "No combinar con sales de litio" }],
+      descripcion: "El diente de león es una planta muy nutritiva y con múltiples propiedades medicinales.",
+      sistemasRelacionados: ["sistema-urinario", "sistema-digestivo", "sistema-inmunologico"],
+      categoriaId: "hierbas-silvestres-medicinales",
+      categoria: "Hierbas silvestres medicinales",
+    },
+    {
+      id: "ginkgo-biloba",
+      nombre: "Ginkgo biloba",
+      nombreCientifico: "Ginkgo biloba",
+      nombresAlternativos: {"España": ["ginkgo", "árbol de los 40 escudos", "nogal del Japón"], "USA_English": ["ginkgo", "maidenhair tree"], "UK_English": ["ginkgo", "maidenhair tree"]},
+      propiedades: ["Vasodilatador", "Antioxidante", "Mejora la memoria"],
+      parteUsable: "Hojas",
+      dosis: "Consultar a un profesional",
+      preparacion: "Extracto o infusión",
+      contraindicaciones: [{ tipo: "medicamentos", descripcion: "No combinar con anticoagulantes" }],
+      descripcion: "El extracto de sus hojas mejora la circulación sanguínea y se centra especialmente en el riego cerebral, con lo que mejora la concentración y la memoria.",
+      sistemasRelacionados: ["sistema-cardiovascular", "sistema-nervioso"],
+      categoriaId: "hierbas-silvestres-medicinales",
+      categoria: "Hierbas silvestres medicinales",
+    },
+    {
+      id: "mate",
+      nombre: "Mate",
+      nombreCientifico: "Ilex paraguariensis",
+      nombresAlternativos: {"Argentina": ["Mate", "Yerba mate"], "USA_English": ["Mate", "Yerba mate"], "UK_English": ["Mate", "Yerba mate"]},
+      propiedades: ["Estimulante", "Antioxidante", "Diurético"],
+      parteUsable: "Hojas",
+      dosis: "1-2 mates al día",
+      preparacion: "Infusión (mate)",
+      contraindicaciones: [],
+      descripcion: "La planta con la que está hecha la conocida bebida argentina es también muy positiva para la salud.",
+      sistemasRelacionados: ["sistema-nervioso", "sistema-inmunologico", "sistema-urinario"],
+      categoriaId: "hierbas-silvestres-medicinales",
+      categoria: "Hierbas silvestres medicinales",
+    },
+    {
+      id: "oregano",
+      nombre: "Orégano",
+      nombreCientifico: "Origanum vulgare",
+      nombresAlternativos: {"España": ["furiégano", "mejorana silvestre", "oreganín", "orégano común", "orégano nano", "orégano trenzado", "orégano turco", "orenga"], "Caribe": ["orégano francés", "orégano de la tierra", "orégano orejón", "orégano brujo"], "USA_English": ["oregano", "wild marjoram", "pot marjoram"], "UK_English": ["oregano", "wild marjoram", "pot marjoram"]},
+      propiedades: ["Antioxidante", "Antifúngico", "Antibacteriano", "Antiinflamatorio", "Antihistamínico"],
+      parteUsable: "Hojas",
+      dosis: "Como condimento o infusión",
+      preparacion: "Condimento o infusión",
+      contraindicaciones: [],
+      descripcion: "El orégano es un viejo conocido de nuestras cocinas, tradicionalmente muy bien valorado y que posee también grandes propiedades medicinales.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-respiratorio", "sistema-inmunologico"],
+      categoriaId: "hierbas-silvestres-medicinales",
+      categoria: "Hierbas silvestres medicinales",
+    },
+    {
+      id: "pasiflora",
+      nombre: "Pasiflora",
+      nombreCientifico: "Passiflora incarnata",
+      nombresAlternativos: {"España": ["flor de la pasión", "pasionaria", "granadilla"], "México": ["maracuyá", "flor de pasión"], "Argentina": ["mburucuyá", "pasionaria"], "USA_English": ["passionflower", "maypop", "purple passionflower"], "UK_English": ["passion flower"], "Indigena": ["mburucuyá"]},
+      propiedades: ["Calmante", "Analgésico", "Antiespasmódico"],
+      parteUsable: "Flores y hojas",
+      dosis: "1-2 tazas de infusión al día",
+      preparacion: "Infusión",
+      contraindicaciones: [],
+      descripcion: "Se trata de una planta que posee propiedades calmantes. Disminuye la tensión arterial y reduce el ritmo cardíaco.",
+      sistemasRelacionados: ["sistema-nervioso", "sistema-cardiovascular", "sistema-digestivo"],
+      categoriaId: "hierbas-silvestres-medicinales",
+      categoria: "Hierbas silvestres medicinales",
+    },
+    {
+      id: "corteza-de-sauce",
+      nombre: "Corteza de sauce",
+      nombreCientifico: "Salix alba",
+      nombresAlternativos: {"España": ["Corteza de sauce", "Sauce blanco"], "USA_English": ["White willow bark"], "UK_English": ["White willow bark"]},
+      propiedades: ["Antiinflamatorio", "Analgésico", "Antipirético"],
+      parteUsable: "Corteza",
+      dosis: "Consultar a un profesional",
+      preparacion: "Decocción o extracto",
+      contraindicaciones: [{ tipo: "ninos", descripcion: "No recomendado para niños" }, { tipo: "lactancia", descripcion: "No recomendado para madres lactantes" }, { tipo: "medicamentos", descripcion: "No combinar con anticoagulantes" }],
+      descripcion: "El extracto de esta corteza es útil como antiinflamatorio. También se ha visto útil para la pérdida de peso, el tratamiento de la cefalea, la artritis y el dolor de huesos.",
+      sistemasRelacionados: ["sistema-musculoesqueletico", "sistema-nervioso"],
+      categoriaId: "hierbas-silvestres-medicinales",
+      categoria: "Hierbas silvestres medicinales",
+    },
+    {
+      id: "agave",
+      nombre: "Agave",
+      nombreCientifico: "Agave americana",
+      nombresAlternativos: {"Mexico": ["Agave", "Maguey"], "USA_English": ["Agave", "American aloe"], "UK_English": ["Agave", "American aloe"]},
+      propiedades: ["Antiséptico", "Estimulante intestinal", "Hipoglucemiante"],
+      parteUsable: "Savia y hojas",
+      dosis: "Consultar a un profesional",
+      preparacion: "Uso tópico o jarabe",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Puede generar dermatitis" }],
+      descripcion: "El agave posee también propiedades medicinales. Concretamente destaca su uso en la curación de heridas y llagas, pudiendo emplearse como desinfectante.",
+      sistemasRelacionados: ["enfermedades-piel", "sistema-digestivo", "sistema-endocrino"],
+      categoriaId: "hierbas-silvestres-medicinales",
+      categoria: "Hierbas silvestres medicinales",
+    },
+    {
+      id: "arandano",
+      nombre: "Arándano",
+      nombreCientifico: "Vaccinium myrtillus",
+      nombresAlternativos: {"España": ["arándano", "arandanera", "ráspano", "mirtilo", "anavia", "rasponera", "arandilla", "arandaño", "meruéndano", "raspanera", "raspona", "amabia", "mirtillo", "miruéndano", "uva de bosque", "uva de monte"], "USA_English": ["bilberry", "whortleberry", "huckleberry", "mountain blueberry"], "UK_English": ["bilberry", "blaeberry", "wimberry", "whortleberry", "winberry", "fraughan"]},
+      propiedades: ["Antioxidante", "Diurético", "Antibacteriano", "Astringente"],
+      parteUsable: "Frutos y hojas",
+      dosis: "Consumo directo o infusión",
+      preparacion: "Frutos frescos, zumo o infusión de hojas",
+      contraindicaciones: [],
+      descripcion: "Los arándanos también tienen propiedades medicinales. Su fruto no solo es comestible sino que también es un potente antioxidante, que además es diurético y beneficioso en la prevención de problemas urinarios y renales.",
+      sistemasRelacionados: ["sistema-urinario", "sistema-cardiovascular", "enfermedades-ojos-oidos-nariz-garganta"],
+      categoriaId: "hierbas-silvestres-medicinales",
+      categoria: "Hierbas silvestres medicinales",
+    },
+    {
+      id: "acebo",
+      nombre: "Acebo",
+      nombreCientifico: "Ilex aquifolium",
+      nombresAlternativos: {"España": ["Acebo"], "USA_English": ["Holly"], "UK_English": ["Holly"]},
+      propiedades: ["Antipirético", "Purgante", "Diurético", "Relajante"],
+      parteUsable: "Hojas y corteza",
+      dosis: "Consultar a un profesional, sus bayas son tóxicas",
+      preparacion: "Infusión o decocción",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Las bayas son tóxicas" }],
+      descripcion: "Algunas variedades de esta planta han sido empleada para tratar gran cantidad de problemas, desde para bajar la fiebre hasta como purgante, pasando por ser un elemento que contribuye a combatir la ictericia.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-urinario", "sistema-nervioso"],
+      categoriaId: "hierbas-silvestres-medicinales",
+      categoria: "Hierbas silvestres medicinales",
+    },
+    {
+      id: "flor-de-sauco",
+      nombre: "Flor de saúco",
+      nombreCientifico: "Sambucus nigra",
+      nombresAlternativos: {"España": ["saúco", "sabuco", "canillero"], "México": ["saúco", "cundumbo"], "USA_English": ["elderflower", "black elder", "European elder"], "UK_English": ["elderflower", "elder"]},
+      propiedades: ["Antiséptico", "Antiinflamatorio", "Diurético", "Laxante"],
+      parteUsable: "Flores",
+      dosis: "1-2 tazas de infusión al día",
+      preparacion: "Infusión",
+      contraindicaciones: [],
+      descripcion: "Esta bonita flor ha sido empleada como remedio para tratar diferentes problemas. Con propiedades antisépticas y antiinflamatorias, además de diuréticas y laxantes, se ha utilizado para tratar episodios gripales y disminuir la tos y los problemas con las mucosas.",
+      sistemasRelacionados: ["sistema-respiratorio", "sistema-urinario", "sistema-digestivo"],
+      categoriaId: "hierbas-silvestres-medicinales",
+      categoria: "Hierbas silvestres medicinales",
+    },
+    {
+      id: "yuca",
+      nombre: "Yuca",
+      nombreCientifico: "Manihot esculenta",
+      nombresAlternativos: {"Mexico": ["Yuca", "Mandioca"], "Colombia": ["Yuca", "Mandioca"], "Peru": ["Yuca", "Mandioca"], "Caribe": ["Yuca", "Mandioca"], "USA_English": ["Cassava", "Yuca", "Manioc"], "UK_English": ["Cassava", "Yuca", "Manioc"]},
+      propiedades: ["Energética", "Metabolismo", "Digestiva"],
+      parteUsable: "Raíz",
+      dosis: "Consumo moderado como parte de la dieta",
+      preparacion: "Cocida o asada",
+      contraindicaciones: [{ tipo: "otro", descripcion: "El consumo excesivo sin una dieta balanceada puede ser perjudicial" }],
+      descripcion: "Este arbusto perenne originario de ciertas regiones centrales de Sudamérica, en partes tropicales. Lo que la hace especial es que sus raíces son muy ricas en almidones y ayudan a aumentar el ritmo metabólico y a perder peso.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-endocrino"],
+      categoriaId: "hierbas-silvestres-medicinales",
+      categoria: "Hierbas silvestres medicinales",
+    },
+    {
+      id: "ginseng",
+      nombre: "Ginseng",
+      nombreCientifico: "Panax ginseng",
+      nombresAlternativos: {"China": ["Rénshēn"], "Corea": ["Insam"], "Japón": ["Ninjin"], "USA_English": ["asian ginseng", "chinese ginseng", "korean ginseng"], "UK_English": ["asian ginseng", "chinese ginseng", "korean ginseng"]},
+      propiedades: ["Energizante", "Inmunoestimulante", "Hipotensor"],
+      parteUsable: "Raíz",
+      dosis: "Consultar a un profesional",
+      preparacion: "Infusión o extracto",
+      contraindicaciones: [],
+      descripcion: "Esta planta es utilizada como ingrediente para infusiones que pueden ser utilizadas para aportar energía y mantener activas a las personas.",
+      sistemasRelacionados: ["sistema-nervioso", "sistema-inmunologico", "sistema-cardiovascular"],
+      categoriaId: "hierbas-silvestres-medicinales",
+      categoria: "Hierbas silvestres medicinales",
+    },
+    {
+      id: "poleo-menta",
+      nombre: "Poleo menta",
+      nombreCientifico: "Mentha pulegium",
+      nombresAlternativos: {"España": ["Poleo menta", "Poleo"], "USA_English": ["Pennyroyal"], "UK_English": ["Pennyroyal"]},
+      propiedades: ["Digestivo", "Aperitivo", "Carminativo"],
+      parteUsable: "Hojas",
+      dosis: "1-2 tazas de infusión al día",
+      preparacion: "Infusión",
+      contraindicaciones: [],
+      descripcion: "El poleo menta ha sido utilizado durante mucho tiempo por su capacidad para aumentar el apetito y mejorar la asimilación de nutrientes por parte del organismo, lo cual mejora el proceso de la digestión.",
+      sistemasRelacionados: ["sistema-digestivo"],
+      categoriaId: "hierbas-silvestres-medicinales",
+      categoria: "Hierbas silvestres medicinales",
+    },
+    {
+      id: "ortiga",
+      nombre: "Ortiga",
+      nombreCientifico: "Urtica dioica",
+      nombresAlternativos: {"España": ["Ortiga", "Ortiga mayor"], "USA_English": ["Nettle", "Stinging nettle"], "UK_English": ["Nettle", "Stinging nettle"]},
+      propiedades: ["Vasoconstrictor", "Antianémico", "Diurético"],
+      parteUsable: "Hojas y raíz",
+      dosis: "Infusión o cocida en alimentos",
+      preparacion: "Infusión, cocción",
+      contraindicaciones: [],
+      descripcion: "La ortiga es una planta con mala reputación debido a que sus hojas producen urticaria, pero más allá de esta molesta característica podemos encontrar propiedades medicinales.",
+      sistemasRelacionados: ["sistema-cardiovascular", "sistema-urinario", "sistema-inmunologico"],
+      categoriaId: "hierbas-silvestres-medicinales",
+      categoria: "Hierbas silvestres medicinales",
+    },
+    {
+      id: "dedalera",
+      nombre: "Dedalera",
+      nombreCientifico: "Digitalis purpurea",
+      nombresAlternativos: {"España": ["Dedalera", "Digital"], "USA_English": ["Foxglove"], "UK_English": ["Foxglove"]},
+      propiedades: ["Diurético", "Cardiotónico"],
+      parteUsable: "Hojas",
+      dosis: "Uso exclusivo bajo prescripción médica",
+      preparacion: "Extracto estandarizado",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Planta muy tóxica, su uso doméstico está prohibido" }],
+      descripcion: "Esta planta es rica en digoxina y digitoxina, las cuales ejercen un efecto diurético y favorecen la circulación sanguínea.",
+      sistemasRelacionados: ["sistema-cardiovascular", "sistema-urinario"],
+      categoriaId: "hierbas-silvestres-medicinales",
+      categoria: "Hierbas silvestres medicinales",
+    },
+    {
+      id: "sandalo",
+      nombre: "Sándalo",
+      nombreCientifico: "Santalum album",
+      nombresAlternativos: {"USA_English": ["Sandalwood"], "UK_English": ["Sandalwood"]},
+      propiedades: ["Antiséptico", "Diurético", "Relajante"],
+      parteUsable: "Madera",
+      dosis: "Uso tópico en aceite esencial",
+      preparacion: "Aceite esencial",
+      contraindicaciones: [],
+      descripcion: "Sus propiedades antisépticas basadas en el sándalo hacen de los aceites esenciales de esta planta una buena ayuda para desinfectar heridas.",
+      sistemasRelacionados: ["enfermedades-piel", "sistema-urinario", "sistema-nervioso"],
+      categoriaId: "hierbas-silvestres-medicinales",
+      categoria: "Hierbas silvestres medicinales",
+    },
+    {
+      id: "amapola",
+      nombre: "Amapola",
+      nombreCientifico: "Papaver somniferum",
+      nombresAlternativos: {"España": ["amapola silvestre", "ababol", "amapola colorada"], "USA_English": ["corn poppy", "field poppy", "Flanders poppy", "red poppy"], "UK_English": ["common poppy", "corn poppy"]},
+      propiedades: ["Analgésico", "Narcótico", "Sedante"],
+      parteUsable: "Látex y semillas",
+      dosis: "Uso exclusivo bajo prescripción médica",
+      preparacion: "Derivados farmacéuticos (morfina, codeína)",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Planta de uso controlado por su potencial adictivo" }],
+      descripcion: "La amapola es una hierba que crece de manera natural en una gran variedad de ambientes, y desde hace milenios ha sido aprovechada como ingrediente por sus propiedades narcóticas contra el dolor.",
+      sistemasRelacionados: ["sistema-nervioso"],
+      categoriaId: "hierbas-silvestres-medicinales",
+      categoria: "Hierbas silvestres medicinales",
+    },
+    {
+      id: "eneldo",
+      nombre: "Eneldo",
+      nombreCientifico: "Anethum graveolens",
+      nombresAlternativos: {"España": ["aneto", "abesón"], "USA_English": ["dill", "dill-oil plant", "east indian dill", "indian dill", "meeting-seed", "sabbath day posy", "dillweed"], "UK_English": ["dill", "dill-oil plant", "east indian dill", "indian dill", "meeting-seed", "sabbath day posy", "dillweed"], "Otros": ["anet", "aneta"]},
+      propiedades: ["Antiespasmódico", "Carminativo", "Cicatrizante"],
+      parteUsable: "Semillas y hojas",
+      dosis: "Infusión o como condimento",
+      preparacion: "Infusión, condimento",
+      contraindicaciones: [],
+      descripcion: "Las semillas del eneldo son utilizadas con fines medicinales desde la Antigüedad, especialmente contra el dolor asociado a la menstruación (dismenorrea) y los espasmos.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-reproductor", "enfermedades-piel"],
+      categoriaId: "hierbas-silvestres-medicinales",
+      categoria: "Hierbas silvestres medicinales",
+    },
+    {
+      id: "apio",
+      nombre: "Apio",
+      nombreCientifico: "Apium graveolens",
+      nombresAlternativos: {"España": ["Apio"], "Mexico": ["Apio"], "USA_English": ["Celery"], "UK_English": ["Celery"]},
+      propiedades: ["Digestivo", "Laxante", "Diurético"],
+      parteUsable: "Tallo y hojas",
+      dosis: "Consumo directo o en zumos",
+      preparacion: "Crudo, cocido o en zumo",
+      contraindicaciones: [],
+      descripcion: "El apio es un ingrediente habitual a la hora de preparar platos muy conocidos en cocina, pero también puede ser considerado un miembro del grupo de las plantas medicinales.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-urinario"],
+      categoriaId: "hierbas-silvestres-medicinales",
+      categoria: "Hierbas silvestres medicinales",
+    },
+    {
+      id: "ajenjo",
+      nombre: "Ajenjo",
+      nombreCientifico: "Artemisia absinthium",
+      nombresAlternativos: {"España": ["asensio", "ajorizo", "artemisia amarga", "hierba maestra", "hierba santa", "absintio", "asencio", "absenta", "donzell", "encens", "asentsio", "ajenjo mayor", "ajenjo común", "ajenjo macho", "ajenjo vulgar", "ajencio", "ajenjio", "asenjo"], "USA_English": ["wormwood", "absinthium", "green ginger", "absinthe", "old woman", "southernwood", "absinth sage", "absinth wormwood", "absinth sagewort", "common sagewort", "absinthe mugwort"], "UK_English": ["wormwood", "absinthium", "green ginger", "absinthe", "old woman", "southernwood", "absinth sage", "absinth wormwood", "absinth sagewort", "common sagewort", "absinthe mugwort"]},
+      propiedades: ["Aperitivo", "Antiparasitario", "Digestivo"],
+      parteUsable: "Hojas y flores",
+      dosis: "Consultar a un profesional, contiene tuyona",
+      preparacion: "Infusión o extracto",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "Contraindicado en el embarazo" }, { tipo: "lactancia", descripcion: "Contraindicado en la lactancia" }],
+      descripcion: "El ajenjo, también conocido como hierba santa o artemisa amarga, es una planta medicinal muy conocida en todos los continentes y que viene usándose desde hace miles de años.",
+      sistemasRelacionados: ["sistema-digestivo"],
+      categoriaId: "hierbas-silvestres-medicinales",
+      categoria: "Hierbas silvestres medicinales",
+    },
+    {
+      id: "kava",
+      nombre: "Kava",
+      nombreCientifico: "Piper methysticum",
+      nombresAlternativos: {"USA_English": ["kava", "kava kava", "'Awa", "Ava Pepper", "Ava Root"], "UK_English": ["kava", "kava kava"], "Indigena": ["'awa (Hawaii)", "sakau (Pohnpei)", "yaqona (Fiji)"]},
+      propiedades: ["Anestésico", "Sedante", "Ansiolítico"],
+      parteUsable: "Raíz",
+      dosis: "Consultar a un profesional",
+      preparacion: "Bebida tradicional o extracto",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Puede causar daño hepático" }],
+      descripcion: "El kava es una planta medicinal originaria de la Polinesia. Sus raíces se utilizan especialmente para hacer mezclas con efectos anestésicos y sedantes, y de consumo oral.",
+      sistemasRelacionados: ["sistema-nervioso", "trastornos-mentales-emocionales"],
+      categoriaId: "hierbas-silvestres-medicinales",
+      categoria: "Hierbas silvestres medicinales",
+    },
+    {
+      id: "ruda",
+      nombre: "Ruda",
+      nombreCientifico: "Ruta graveolens",
+      nombresAlternativos: {"España": ["arruda", "rúa", "ruda común", "ruda cultivada", "ruda de hojas anchas", "armaga"], "USA_English": ["rue", "common rue", "garden rue", "herb of grace"], "UK_English": ["rue", "common rue", "garden rue", "herb of grace"]},
+      propiedades: ["Antiespasmódico", "Sedante", "Emenagogo"],
+      parteUsable: "Hojas",
+      dosis: "Uso tópico con precaución, es tóxica por vía oral",
+      preparacion: "Aceite esencial (uso externo)",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "Es abortiva" }, { tipo: "otro", descripcion: "Fototóxica, no exponer la piel al sol tras su uso" }],
+      descripcion: "La ruda es una planta de tipo arbusto con hojas a partir de las cuales es posible elaborar aceites esenciales usados en medicina tradicional.",
+      sistemasRelacionados: ["sistema-nervioso", "sistema-reproductor"],
+      categoriaId: "hierbas-silvestres-medicinales",
+      categoria: "Hierbas silvestres medicinales",
+    },
+    {
+      id: "calendula",
+      nombre: "Caléndula",
+      nombreCientifico: "Calendula officinalis",
+      nombresAlternativos: {"España": ["botón de oro", "mercadela", "maravilla", "clavelina"], "México": ["flor de muerto", "chinita"], "Colombia": ["botón de oro", "maravilla"], "USA_English": ["pot marigold", "common marigold", "ruddles"], "UK_English": ["Scotch marigold"]},
+      propiedades: ["Antiinflamatoria", "Cicatrizante", "Antiséptica"],
+      parteUsable: "Flores",
+      dosis: "Aplicación tópica en crema o infusión",
+      preparacion: "Crema, aceite o infusión para lavados",
+      contraindicaciones: [],
+      descripcion: "La caléndula es otra de las plantas medicinales que más allá de los remedios caseros ha sido usada también en la cocina como un ingrediente más.",
+      sistemasRelacionados: ["enfermedades-piel", "sistema-digestivo"],
+      categoriaId: "hierbas-silvestres-medicinales",
+      categoria: "Hierbas silvestres medicinales",
+    },
+    {
+      id: "escaramujo",
+      nombre: "Escaramujo",
+      nombreCientifico: "Rosa canina",
+      nombresAlternativos: {"España": ["rosal silvestre", "agavanzo", "escarambrojo", "escaramojo", "zarza rosa", "agabanzo", "alcallaro", "alcaracache", "algabala", "algabanzo", "calambrojo", "gabancera", "tapaculos", "picaespalda", "rosal bravío", "rosal común"], "USA_English": ["dog rose", "briar rose"], "UK_English": ["dog rose", "dog berry", "witches' briar"]},
+      propiedades: ["Vitamínico (Vitamina C)", "Antiinflamatorio", "Antioxidante"],
+      parteUsable: "Fruto",
+      dosis: "Infusión, mermelada o sopa",
+      preparacion: "Infusión, mermelada, sopa",
+      contraindicaciones: [],
+      descripcion: "El escaramujo se usa para aliviar el dolor relacionado con dolencias como la artritis y ciertas infecciones. Además, es una de las plantas más ricas en vitamina C.",
+      sistemasRelacionados: ["sistema-inmunologico", "sistema-musculoesqueletico"],
+      categoriaId: "hierbas-silvestres-medicinales",
+      categoria: "Hierbas silvestres medicinales",
+    },
+    {
+      id: "bejuco-de-agua",
+      nombre: "Bejuco de agua",
+      nombreCientifico: "Cissus verticillata",
+      nombresAlternativos: {"Mexico": ["Bejuco de agua"], "Centroamerica": ["Bejuco de agua"], "Caribe": ["Bejuco de agua"]},
+      propiedades: ["Anticonvulsivo", "Antihemorrágico", "Antiinflamatorio"],
+      parteUsable: "Tallos y hojas",
+      dosis: "Consultar a un profesional",
+      preparacion: "Decocción",
+      contraindicaciones: [],
+      descripcion: "El bejuco de agua (Cissus verticillata) es una planta trepadora de zonas de Centroamérica, Colombia y Venezuela. Se la usa como anticonvulsivo y para tratar las hemorragias.",
+      sistemasRelacionados: ["sistema-nervioso", "sistema-cardiovascular"],
+      categoriaId: "hierbas-silvestres-medicinales",
+      categoria: "Hierbas silvestres medicinales",
+    },
+    {
+      id: "olmo",
+      nombre: "Olmo",
+      nombreCientifico: "Ulmus rubra",
+      nombresAlternativos: {"España": ["olmo", "negrillo"], "USA_English": ["field elm", "smoothleaf elm"], "UK_English": ["field elm", "English elm"]},
+      propiedades: ["Antibacteriano", "Demulcente", "Nutritivo"],
+      parteUsable: "Corteza interna",
+      dosis: "Consultar a un profesional",
+      preparacion: "Polvo o infusión",
+      contraindicaciones: [],
+      descripcion: "La corteza de este árbol es utilizada por sus propiedades antibacterianas, y también como suplemento dietético, así como contra la irritación de la garganta.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-respiratorio", "enfermedades-ojos-oidos-nariz-garganta"],
+      categoriaId: "hierbas-silvestres-medicinales",
+      categoria: "Hierbas silvestres medicinales",
+    },
+    {
+      id: "hinojo",
+      nombre: "Hinojo",
+      nombreCientifico: "Foeniculum vulgare",
+      nombresAlternativos: {"España": ["hinojo común", "fenoll", "fiuncho", "acapate", "fonol común", "cenojo", "fenojo", "fenol", "hierba santa", "mello", "perejil de gitano", "hinojo dulce", "hinojo amargo", "hinojo en rama", "hinojo de Florencia"], "USA_English": ["fennel", "sweet fennel", "bronze fennel", "finocchio", "florence fennel"], "UK_English": ["fennel", "sweet fennel", "bronze fennel", "finocchio", "florence fennel"]},
+      propiedades: ["Diurético", "Carminativo", "Expectorante"],
+      parteUsable: "Semillas y bulbo",
+      dosis: "Infusión o consumo del bulbo",
+      preparacion: "Infusión, cocido o crudo",
+      contraindicaciones: [],
+      descripcion: "El hinojo es una planta medicinal habitual en los ecosistemas mediterráneos. Es apreciada por sus propiedades diuréticas y por favorecer la expulsión de gases y la digestión.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-urinario", "sistema-respiratorio"],
+      categoriaId: "hierbas-silvestres-medicinales",
+      categoria: "Hierbas silvestres medicinales",
+    },
+    {
+      id: "limoncillo",
+      nombre: "Limoncillo",
+      nombreCientifico: "Melissa officinalis",
+      nombresAlternativos: {"España": ["Limoncillo", "Melisa", "Toronjil"], "Mexico": ["Limoncillo", "Toronjil"], "USA_English": ["Lemon balm"], "UK_English": ["Lemon balm"]},
+      propiedades: ["Relajante", "Sedante", "Digestivo"],
+      parteUsable: "Hojas",
+      dosis: "1-2 tazas de infusión al día",
+      preparacion: "Infusión",
+      contraindicaciones: [],
+      descripcion: "El limoncillo (Melissa officinalis), toronjil u hoja de limón es una planta perenne utilizada en infusiones para favorecer un estado de relajación.",
+      sistemasRelacionados: ["sistema-nervioso", "sistema-digestivo"],
+      categoriaId: "hierbas-silvestres-medicinales",
+      categoria: "Hierbas silvestres medicinales",
+    },
+    {
+      id: "ricino",
+      nombre: "Ricino",
+      nombreCientifico: "Ricinus communis",
+      nombresAlternativos: {"España": ["Ricino", "Higuera infernal"], "Mexico": ["Ricino", "Higuerilla"], "USA_English": ["Castor bean", "Castor oil plant"], "UK_English": ["Castor bean", "Castor oil plant"]},
+      propiedades: ["Purgante", "Laxante"],
+      parteUsable: "Aceite de las semillas",
+      dosis: "Consultar a un profesional, la semilla es muy tóxica",
+      preparacion: "Aceite extraído en frío",
+      contraindicaciones: [{ tipo: "otro", descripcion: "La semilla cruda es mortalmente venenosa" }],
+      descripcion: "El aceite de ricino es un purgante muy conocido, y se consume de manera oral a pesar de su desagradable sabor.",
+      sistemasRelacionados: ["sistema-digestivo"],
+      categoriaId: "hierbas-silvestres-medicinales",
+      categoria: "Hierbas silvestres medicinales",
+    },
+    {
+      id: "konjac",
+      nombre: "Konjac",
+      nombreCientifico: "Amorphophallus konjac",
+      nombresAlternativos: {"USA_English": ["Konjac"], "UK_English": ["Konjac"]},
+      propiedades: ["Saciante", "Hipocolesterolemiante", "Laxante"],
+      parteUsable: "Tubérculo",
+      dosis: "Como suplemento dietético (glucomanano)",
+      preparacion: "Harina o gelatina",
+      contraindicaciones: [],
+      descripcion: "El konjac (Amorphophallus konjac), también conocido como lengua del diablo, es una planta originaria de China y el sudeste asiático que por su alta concentración de fibra se usa como dietético.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-endocrino"],
+      categoriaId: "hierbas-silvestres-medicinales",
+      categoria: "Hierbas silvestres medicinales",
+    },
+    {
+      id: "lechuga-silvestre",
+      nombre: "Lechuga silvestre",
+      nombreCientifico: "Lactuca virosa",
+      nombresAlternativos: {"España": ["Lechuga silvestre", "Lechuga virosa"], "USA_English": ["Wild lettuce", "Opium lettuce"], "UK_English": ["Wild lettuce", "Opium lettuce"]},
+      propiedades: ["Sedante", "Analgésico", "Hipnótico"],
+      parteUsable: "Látex y hojas",
+      dosis: "Uso no recomendado, potencialmente tóxica",
+      preparacion: "Extracto (lactucarium)",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Su uso casero no está recomendado y está prohibida en varios países" }],
+      descripcion: "La lechuga silvestre (Lactuca virosa) es una planta con propiedades psicoactivas que se utiliza como sedante en algunos contextos.",
+      sistemasRelacionados: ["sistema-nervioso"],
+      categoriaId: "hierbas-silvestres-medicinales",
+      categoria: "Hierbas silvestres medicinales",
+    },
+    {
+      id: "helecho-gu-sui-bu",
+      nombre: "Helecho gu-sui-bu",
+      nombreCientifico: "Drynaria roosii",
+      nombresAlternativos: {"USA_English": ["Drynaria"], "UK_English": ["Drynaria"]},
+      propiedades: ["Regenerador óseo", "Analgésico"],
+      parteUsable: "Rizoma",
+      dosis: "Consultar a un profesional de medicina tradicional china",
+      preparacion: "Decocción",
+      contraindicaciones: [],
+      descripcion: "Esta variedad de helecho se ha utilizado durante siglos en la medicina tradicional china para favorecer la regeneración de los huesos tras sufrir daños.",
+      sistemasRelacionados: ["sistema-musculoesqueletico"],
+      categoriaId: "hierbas-silvestres-medicinales",
+      categoria: "Hierbas silvestres medicinales",
+    },
+    {
+      id: "junco-de-esteras",
+      nombre: "Junco de esteras",
+      nombreCientifico: "Juncus effusus",
+      nombresAlternativos: {"España": ["Junco de esteras", "Junco fino"], "USA_English": ["Soft rush"], "UK_English": ["Soft rush"]},
+      propiedades: ["Energizante", "Tónico"],
+      parteUsable: "Médula del tallo",
+      dosis: "Consultar a un profesional",
+      preparacion: "En alimentos",
+      contraindicaciones: [],
+      descripcion: "Este tipo de junco se utiliza en algunas regiones de Asia Occidental como ingrediente a añadir en alimentos para personas cansadas y con poca energía.",
+      sistemasRelacionados: ["sistema-nervioso"],
+      categoriaId: "hierbas-silvestres-medicinales",
+      categoria: "Hierbas silvestres medicinales",
+    },
+    {
+      id: "apong-apong",
+      nombre: "Apong-apong",
+      nombreCientifico: "Aglaia edulis",
+      propiedades: ["Antiparasitario"],
+      parteUsable: "Corteza y semillas",
+      dosis: "Uso tópico",
+      preparacion: "Decocción para uso externo",
+      contraindicaciones: [],
+      descripcion: "Ciertas partes de este árbol tropical son utilizadas para contribuir a eliminar parásitos como los piojos o la sarna.",
+      sistemasRelacionados: ["enfermedades-piel"],
+      categoriaId: "hierbas-silvestres-medicinales",
+      categoria: "Hierbas silvestres medicinales",
+    },
+    {
+      id: "khat",
+      nombre: "Khat",
+      nombreCientifico: "Catha edulis",
+      nombresAlternativos: {"USA_English": ["Khat"], "UK_English": ["Khat"]},
+      propiedades: ["Estimulante", "Anorexígeno"],
+      parteUsable: "Hojas frescas",
+      dosis: "Masticar hojas frescas, uso controlado",
+      preparacion: "Masticación",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Sustancia psicoactiva con potencial de abuso" }],
+      descripcion: "Las hojas de este arbusto del Cuerno de África y la península arábiga se mastican por sus efectos estimulantes.",
+      sistemasRelacionados: ["sistema-nervioso"],
+      categoriaId: "hierbas-silvestres-medicinales",
+      categoria: "Hierbas silvestres medicinales",
+    },
+    {
+      id: "kaempferia-rotunda",
+      nombre: "Kaempferia rotunda",
+      nombreCientifico: "Kaempferia rotunda",
+      nombresAlternativos: {"USA_English": ["Kaempferia rotunda"], "UK_English": ["Kaempferia rotunda"]},
+      propiedades: ["Antipruriginoso", "Antiinflamatorio"],
+      parteUsable: "Rizoma",
+      dosis: "Uso tópico",
+      preparacion: "Hervido y aplicado sobre la piel",
+      contraindicaciones: [],
+      descripcion: "Esta planta medicinal se hierve para ser utilizada sobre la piel y aliviar el picor.",
+      sistemasRelacionados: ["enfermedades-piel"],
+      categoriaId: "hierbas-silvestres-medicinales",
+      categoria: "Hierbas silvestres medicinales",
+    },
+    {
+      id: "hierba-de-san-simon",
+      nombre: "Hierba de San Simón",
+      nombreCientifico: "Circaea lutetiana",
+      nombresAlternativos: {"España": ["Hierba de San Simón", "Circaea"], "USA_English": ["Enchanter's nightshade"], "UK_English": ["Enchanter's nightshade"]},
+      propiedades: ["Antipirético", "Antirreumático"],
+      parteUsable: "Planta entera",
+      dosis: "Consultar a un profesional",
+      preparacion: "Infusión",
+      contraindicaciones: [],
+      descripcion: "La Circaea lutetiana se ha utilizado durante siglos para bajar la fiebre y aliviar el malestar por reumatismo.",
+      sistemasRelacionados: ["sistema-inmunologico", "sistema-musculoesqueletico"],
+      categoriaId: "hierbas-silvestres-medicinales",
+      categoria: "Hierbas silvestres medicinales",
+    },
+    {
+      id: "kadsura-longipedunculata",
+      nombre: "Kadsura longipedunculata",
+      nombreCientifico: "Kadsura longipedunculata",
+      propiedades: ["Digestivo", "Antibacteriano"],
+      parteUsable: "Frutos y tallos",
+      dosis: "Consultar a un profesional",
+      preparacion: "Decocción",
+      contraindicaciones: [],
+      descripcion: "Este arbusto originario de China y zonas del sudeste asiático se utiliza para tratar algunos problemas gastrointestinales (digestión lenta), e infecciones.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-inmunologico"],
+      categoriaId: "hierbas-silvestres-medicinales",
+      categoria: "Hierbas silvestres medicinales",
+    },
+    {
+      id: "guaco",
+      nombre: "Guaco",
+      nombreCientifico: "Mikania glomerata",
+      nombresAlternativos: {"Mexico": ["Guaco"], "Colombia": ["Guaco"], "Peru": ["Guaco"]},
+      propiedades: ["Antiinflamatorio", "Broncodilatador", "Expectorante"],
+      parteUsable: "Hojas",
+      dosis: "Jarabe o infusión",
+      preparacion: "Jarabe, infusión",
+      contraindicaciones: [],
+      descripcion: "Las infusiones de esta planta trepadora, también llamada bejuco, se utilizan como antiinflamatorio y para problemas respiratorios.",
+      sistemasRelacionados: ["sistema-respiratorio", "sistema-inmunologico"],
+      categoriaId: "hierbas-silvestres-medicinales",
+      categoria: "Hierbas silvestres medicinales",
+    },
+    {
+      id: "copaiba",
+      nombre: "Copaiba",
+      nombreCientifico: "Copaifera officinalis",
+      nombresAlternativos: {"Colombia": ["Copaiba"], "Peru": ["Copaiba"]},
+      propiedades: ["Laxante", "Diurético", "Balsámico"],
+      parteUsable: "Resina (aceite)",
+      dosis: "Consultar a un profesional",
+      preparacion: "Aceite o inhalación de vapores",
+      contraindicaciones: [],
+      descripcion: "La Copaifera officinalis, o copaiba es una de las principales plantas medicinales de Sudamérica. Tiene efectos laxantes y diuréticos, y sus vapores pueden ser inhalados para aprovechar sus beneficios balsámicos.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-urinario", "sistema-respiratorio"],
+      categoriaId: "hierbas-silvestres-medicinales",
+      categoria: "Hierbas silvestres medicinales",
+    },
+    {
+      id: "fenogreco",
+      nombre: "Fenogreco",
+      nombreCientifico: "Trigonella foenum-graecum",
+      nombresAlternativos: {"España": ["alholva", "alforva", "albolba", "alvolva", "heno griego", "albolga"], "USA_English": ["fenugreek", "bird's foot", "goat's horn", "greek clover", "greek hay", "greek hayseed", "sicklefruit fenugreek"], "UK_English": ["fenugreek", "bird's foot", "goat's horn", "greek clover", "greek hay", "greek hayseed", "sicklefruit fenugreek"], "Otros": ["hilba", "helba", "k'u-tou", "methi"]},
+      propiedades: ["Digestivo", "Hipoglucemiante", "Galactogogo"],
+      parteUsable: "Semillas",
+      dosis: "Como suplemento o en la comida",
+      preparacion: "Polvo, infusión o germinados",
+      contraindicaciones: [],
+      descripcion: "El fenogreco (Trigonella foenum-graecum), también conocido como alholva, es una de las plantas medicinales más tradicionales. Parece ser que facilita la digestión.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-endocrino", "sistema-reproductor"],
+      categoriaId: "hierbas-silvestres-medicinales",
+      categoria: "Hierbas silvestres medicinales",
+    },
+    {
+      id: "moringa",
+      nombre: "Moringa",
+      nombreCientifico: "Moringa oleifera",
+      nombresAlternativos: {"México": ["moringa", "ben", "malungáy"], "Colombia": ["moringa", "ben", "malungáy"], "Centroamérica": ["palo jeringa", "acacia", "jazmín francés"], "Caribe": ["moringa", "ben", "malungáy"], "USA_English": ["moringa", "drumstick tree", "horseradish tree"], "UK_English": ["moringa", "drumstick tree", "horseradish tree"]},
+      propiedades: ["Antiinflamatorio", "Hipotensor", "Nutritivo"],
+      parteUsable: "Hojas, semillas y raíces",
+      dosis: "Polvo de hojas o infusión",
+      preparacion: "Polvo, infusión, cocción",
+      contraindicaciones: [],
+      descripcion: "La Moringa oleifera es una de las plantas medicinales más importantes de la India. Las hojas de este árbol tienen propiedades antiinflamatorias y ayuda a las personas que sufren hipotensión.",
+      sistemasRelacionados: ["sistema-cardiovascular", "sistema-inmunologico"],
+      categoriaId: "hierbas-silvestres-medicinales",
+      categoria: "Hierbas silvestres medicinales",
+    },
+    {
+      id: "centella-asiatica",
+      nombre: "Centella asiática",
+      nombreCientifico: "Centella asiatica",
+      nombresAlternativos: {"España": ["Centella asiática", "Gotu kola"], "USA_English": ["Gotu kola", "Asiatic pennywort"], "UK_English": ["Gotu kola", "Asiatic pennywort"]},
+      propiedades: ["Cicatrizante", "Antiulceroso", "Venotónico"],
+      parteUsable: "Hojas",
+      dosis: "Uso tópico u oral, consultar a un profesional",
+      preparacion: "Crema, extracto o infusión",
+      contraindicaciones: [],
+      descripcion: "La Centella asiatica, también llamada Gotu kola, se ha usado tradicionalmente en muchas culturas de Asia. Está demostrada su utilidad a la hora de tratar las úlceras y para prevenir la aparición de cicatrices queloides.",
+      sistemasRelacionados: ["enfermedades-piel", "sistema-digestivo", "sistema-cardiovascular"],
+      categoriaId: "hierbas-silvestres-medicinales",
+      categoria: "Hierbas silvestres medicinales",
+    },
+    {
+      id: "grosellero-de-la-india",
+      nombre: "Grosellero de la India",
+      nombreCientifico: "Phyllanthus emblica",
+      nombresAlternativos: {"USA_English": ["Indian gooseberry", "Amla"], "UK_English": ["Indian gooseberry", "Amla"]},
+      propiedades: ["Hipolipemiante", "Antioxidante", "Hepatoprotector"],
+      parteUsable: "Fruto",
+      dosis: "Consumo del fruto o extracto",
+      preparacion: "Fruto fresco, en polvo (amla) o aceite",
+      contraindicaciones: [],
+      descripcion: "La amla, o grosellero de la India, es un pequeño árbol cuyos aceites ayudan a disminuir la presencia de triglicéridos en la sangre.",
+      sistemasRelacionados: ["sistema-cardiovascular", "sistema-digestivo"],
+      categoriaId: "hierbas-silvestres-medicinales",
+      categoria: "Hierbas silvestres medicinales",
+    },
+    {
+      id: "bardana",
+      nombre: "Bardana",
+      nombreCientifico: "Arctium lappa",
+      nombresAlternativos: {"España": ["lapa", "lampazo mayor", "gobó", "lampazo", "bardana mayor", "llapassa", "respingón", "agarrocha", "agarrucha", "aguipegotes", "amor de hortelano"], "USA_English": ["greater burdock", "edible burdock", "lappa", "beggar's buttons", "thorny burr", "happy major"], "UK_English": ["greater burdock", "edible burdock", "lappa", "beggar's buttons", "thorny burr", "happy major"]},
+      propiedades: ["Depurativa", "Desintoxicante", "Antiinflamatoria", "Antibacteriana"],
+      parteUsable: "Raíz y hojas",
+      dosis: "Decocción de la raíz o cataplasma de hojas",
+      preparacion: "Decocción, cataplasma",
+      contraindicaciones: [],
+      descripcion: "La bardana es conocida por sus propiedades depurativas y desintoxicantes. Se ha usado tradicionalmente para mejorar afecciones de la piel como el acné, el eccema o la psoriasis.",
+      sistemasRelacionados: ["enfermedades-piel", "sistema-linfatico", "sistema-urinario", "sistema-digestivo"],
+      categoriaId: "hierbas-silvestres-medicinales",
+      categoria: "Hierbas silvestres medicinales",
+    },
+    {
+      id: "malva",
+      nombre: "Malva",
+      nombreCientifico: "Malva sylvestris",
+      nombresAlternativos: {"España": ["malva común", "panecillos", "quesitos"], "Colombia": ["malva blanca", "malva morada"], "Argentina": ["malva"], "USA_English": ["common mallow", "high mallow", "wood mallow"], "UK_English": ["common mallow", "cheeses"]},
+      propiedades: ["Emoliente", "Antiinflamatoria", "Suavizante", "Laxante suave"],
+      parteUsable: "Flores y hojas",
+      dosis: "Infusión o cataplasma",
+      preparacion: "Infusión, cataplasma",
+      contraindicaciones: [],
+      descripcion: "La malva es una planta muy valorada por sus efectos emolientes, antiinflamatorios y suavizantes. Se emplea principalmente para aliviar irritaciones en la garganta y las vías respiratorias.",
+      sistemasRelacionados: ["sistema-respiratorio", "sistema-digestivo", "enfermedades-piel"],
+      categoriaId: "hierbas-silvestres-medicinales",
+      categoria: "Hierbas silvestres medicinales",
+    },
+    {
+      id: "anis-verde",
+      nombre: "Anís verde",
+      nombreCientifico: "Pimpinella anisum",
+      nombresAlternativos: {"España": ["Anís verde", "Anís"], "Mexico": ["Anís"], "USA_English": ["Anise"], "UK_English": ["Anise"]},
+      propiedades: ["Carminativo", "Digestivo", "Sedante suave", "Expectorante"],
+      parteUsable: "Semillas",
+      dosis: "Infusión después de las comidas",
+      preparacion: "Infusión",
+      contraindicaciones: [],
+      descripcion: "El anís verde es una planta medicinal empleada para favorecer la digestión y aliviar los gases. Sus semillas son ricas en aceites esenciales con propiedades carminativas.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-respiratorio", "sistema-nervioso"],
+      categoriaId: "hierbas-silvestres-medicinales",
+      categoria: "Hierbas silvestres medicinales",
+    },
+    {
+      id: "salvia",
+      nombre: "Salvia",
+      nombreCientifico: "Salvia officinalis",
+      nombresAlternativos: {"España": ["salvia real", "celima", "hierba del mudo", "madreselva", "mermasangre", "salima fina", "salvia blanca", "salvia fina", "salvia hortense", "gallocresta", "salve", "hierba de la salud", "sabia", "salva", "salvá", "salva cruz", "salvia en cruz", "té moruno", "té de jardín"], "USA_English": ["sage", "common sage", "garden sage", "golden sage", "kitchen sage", "true sage", "culinary sage"], "UK_English": ["sage", "common sage", "garden sage", "golden sage", "kitchen sage", "true sage", "culinary sage"], "Otros": ["María Pastora", "Sally-D", "menta mágica", "salvia del país", "salvia de playa", "salvia cimarrona"]},
+      propiedades: ["Antiséptica", "Antiinflamatoria", "Astringente", "Emenagoga", "Hipoglucemiante"],
+      parteUsable: "Hojas",
+      dosis: "Infusión o gargarismos",
+      preparacion: "Infusión, gargarismos",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "No usar durante el embarazo" }, { tipo: "lactancia", descripcion: "Puede reducir la producción de leche" }],
+      descripcion: "Conocida desde tiempos antiguos, la salvia tiene múltiples beneficios para la salud. Posee propiedades antisépticas, antiinflamatorias y astringentes, y es muy utilizada para tratar problemas bucales.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-reproductor", "sistema-endocrino", "enfermedades-ojos-oidos-nariz-garganta"],
+      categoriaId: "hierbas-silvestres-medicinales",
+      categoria: "Hierbas silvestres medicinales",
+    },
+    {
+      id: "romero",
+      nombre: "Romero",
+      nombreCientifico: "Rosmarinus officinalis",
+      nombresAlternativos: {"España": ["romero común", "romero blanco", "romero hembra", "romero macho"], "USA_English": ["rosemary"], "UK_English": ["rosemary"]},
+      propiedades: ["Estimulante circulatorio", "Analgésico", "Antioxidante", "Carminativo"],
+      parteUsable: "Hojas y flores",
+      dosis: "Infusión o uso tópico de aceite esencial",
+      preparacion: "Infusión, aceite esencial, condimento",
+      contraindicaciones: [],
+      descripcion: "El romero es una planta aromática muy apreciada por su efecto estimulante sobre la circulación y su capacidad para aliviar dolores musculares y articulares.",
+      sistemasRelacionados: ["sistema-cardiovascular", "sistema-musculoesqueletico", "sistema-digestivo", "sistema-nervioso"],
+      categoriaId: "hierbas-silvestres-medicinales",
+      categoria: "Hierbas silvestres medicinales",
+    },
+    {
+      id: "boldo",
+      nombre: "Boldo",
+      nombreCientifico: "Peumus boldus",
+      nombresAlternativos: {"Chile": ["boldo", "boldu", "buldo"], "Argentina": ["boldo"], "Perú": ["boldo"], "USA_English": ["boldo"], "UK_English": ["boldo"], "Indigena": ["foḻo (mapudungun)"]},
+      propiedades: ["Hepatoprotector", "Colerético", "Diurético", "Sedante suave"],
+      parteUsable: "Hojas",
+      dosis: "Infusión antes de dormir",
+      preparacion: "Infusión",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "No usar durante el embarazo" }, { tipo: "otro", descripcion: "No usar en caso de obstrucción de las vías biliares" }],
+      descripcion: "El boldo es un árbol originario de Chile, muy apreciado por sus beneficios para el hígado y la vesícula biliar. Facilita la digestión de las grasas.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-urinario", "sistema-nervioso"],
+      categoriaId: "hierbas-silvestres-medicinales",
+      categoria: "Hierbas silvestres medicinales",
+    },
+  ],
+};
+
+export default categoria;
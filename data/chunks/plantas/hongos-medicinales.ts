@@ -0,0 +1,476 @@
+// Generado automáticamente por scripts/build-catalog.py - no editar a mano
+import type { CategoriaPlanta } from '../../plantas-expandidas';
+
+const categoria: CategoriaPlanta = {
+  id: "hongos-medicinales",
+  nombre: "Hongos medicinales",
+  plantas: [
+    {
+      id: "reishi",
+      nombre: "Reishi",
+      nombreCientifico: "Ganoderma lucidum",
+      nombresAlternativos: {"España": ["Pipa"], "USA_English": ["Reishi", "varnished conk", "lacquered bracket"], "UK_English": ["Reishi"], "Indigena": ["Lingzhi (chino)", "Yeongji (coreano)"]},
+      propiedades: ["Inmunomodulador", "Adaptógeno", "Antiinflamatorio", "Hepatoprotector"],
+      parteUsable: "Cuerpo fructífero",
+      dosis: "1-3 gramos de extracto en polvo al día.",
+      preparacion: "Decocción, extracto en polvo o tintura.",
+      contraindicaciones: [{ tipo: "medicamentos", descripcion: "Puede interactuar con anticoagulantes e inmunosupresores." }, { tipo: "otro", descripcion: "No se recomienda su uso antes de una cirugía." }],
+      descripcion: "Conocido como el \"hongo de la inmortalidad\", el Reishi es venerado por su capacidad para fortalecer el sistema inmunológico y reducir el estrés.",
+      sistemasRelacionados: ["sistema-inmunologico", "sistema-nervioso", "sistema-cardiovascular"],
+      categoriaId: "hongos-medicinales",
+      categoria: "Hongos medicinales",
+    },
+    {
+      id: "shiitake",
+      nombre: "Shiitake",
+      nombreCientifico: "Lentinula edodes",
+      nombresAlternativos: {"España": ["Seta china", "hongo del árbol shii"], "USA_English": ["Shiitake", "black mushroom"], "UK_English": ["Shiitake"], "Indigena": ["XiangGu (chino)"]},
+      propiedades: ["Antiviral", "Reductor del colesterol", "Inmunomodulador"],
+      parteUsable: "Cuerpo fructífero",
+      dosis: "6-16 gramos de hongo seco al día.",
+      preparacion: "Consumo directo en comidas, decocción o extracto.",
+      contraindicaciones: [{ tipo: "alergia", descripcion: "Puede causar dermatitis en personas sensibles." }],
+      descripcion: "Además de su uso culinario, el Shiitake es valorado por sus propiedades antivirales y su capacidad para mejorar la salud cardiovascular.",
+      sistemasRelacionados: ["sistema-inmunologico", "sistema-cardiovascular"],
+      categoriaId: "hongos-medicinales",
+      categoria: "Hongos medicinales",
+    },
+    {
+      id: "maitake",
+      nombre: "Maitake",
+      nombreCientifico: "Grifola frondosa",
+      nombresAlternativos: {"España": ["Gallina de los bosques", "Seta de Río"], "USA_English": ["Hen-of-the-woods", "sheep's head", "ram's head"], "UK_English": ["Hen-of-the-woods"], "Indigena": ["Hui zhu hua (chino)"]},
+      propiedades: ["Hipoglucemiante", "Inmunomodulador", "Antitumoral"],
+      parteUsable: "Cuerpo fructífero",
+      dosis: "1-3 gramos de extracto al día.",
+      preparacion: "Extracto, decocción o consumo directo.",
+      contraindicaciones: [{ tipo: "diabetes", descripcion: "Puede potenciar el efecto de medicamentos para la diabetes." }],
+      descripcion: "El Maitake es conocido por su capacidad para regular los niveles de azúcar en sangre y fortalecer la respuesta inmune.",
+      sistemasRelacionados: ["sistema-inmunologico", "sistema-endocrino"],
+      categoriaId: "hongos-medicinales",
+      categoria: "Hongos medicinales",
+    },
+    {
+      id: "cordyceps",
+      nombre: "Cordyceps",
+      nombreCientifico: "Cordyceps sinensis",
+      nombresAlternativos: {"España": ["Hongo oruga chino"], "USA_English": ["Caterpillar fungus", "Himalayan Viagra"], "UK_English": ["Caterpillar fungus"], "Indigena": ["Yartsa gunbu (tibetano)", "Dong Chong Xia Cao (chino)"]},
+      propiedades: ["Energizante", "Mejora del rendimiento atlético", "Afrodisíaco"],
+      parteUsable: "Micelio y cuerpo fructífero",
+      dosis: "1-3 gramos al día.",
+      preparacion: "Extracto, cápsulas o decocción.",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Puede empeorar enfermedades autoinmunes." }],
+      descripcion: "El Cordyceps es famoso por aumentar la energía, la resistencia y la libido, siendo muy popular entre atletas.",
+      sistemasRelacionados: ["sistema-respiratorio", "sistema-reproductor", "sistema-inmunologico"],
+      categoriaId: "hongos-medicinales",
+      categoria: "Hongos medicinales",
+    },
+    {
+      id: "melena-de-leon",
+      nombre: "Melena de León",
+      nombreCientifico: "Hericium erinaceus",
+      nombresAlternativos: {"España": ["Melena de león"], "USA_English": ["lion's mane", "bearded tooth fungus", "bearded hedgehog", "satyr's beard", "pom-pom mushroom", "monkey head mushroom"], "UK_English": ["bearded tooth", "tree hedgehog fungus"], "Indigena": ["yamabushitake"]},
+      propiedades: ["Neuroprotector", "Noótropo", "Regenerador nervioso"],
+      parteUsable: "Cuerpo fructífero",
+      dosis: "1-3 gramos de extracto al día.",
+      preparacion: "Extracto, cápsulas o consumo directo.",
+      contraindicaciones: [],
+      descripcion: "Este hongo es único por su capacidad para estimular el crecimiento de neuronas y mejorar la función cognitiva.",
+      sistemasRelacionados: ["sistema-nervioso", "trastornos-mentales-emocionales"],
+      categoriaId: "hongos-medicinales",
+      categoria: "Hongos medicinales",
+    },
+    {
+      id: "chaga",
+      nombre: "Chaga",
+      nombreCientifico: "Inonotus obliquus",
+      nombresAlternativos: {"España": ["Chaga", "Hongo de abedul", "Nariz de carbón"], "USA_English": ["Chaga", "Clinker Fungus", "birch conk", "birch canker polypore"], "UK_English": ["Chaga", "Clinker Polypore", "Cinder conk", "Black mass and Birch canker polypore"], "Indigena": ["Tsyr"]},
+      propiedades: ["Antioxidante", "Antiinflamatorio", "Antiviral"],
+      parteUsable: "Esclerocio (masa de micelio)",
+      dosis: "1-3 gramos de extracto al día.",
+      preparacion: "Decocción (típicamente como un té) o tintura.",
+      contraindicaciones: [{ tipo: "medicamentos", descripcion: "Puede interactuar con anticoagulantes y medicamentos para la diabetes." }],
+      descripcion: "El Chaga es un potente antioxidante que crece en los abedules, utilizado para proteger las células del daño y reducir la inflamación.",
+      sistemasRelacionados: ["sistema-inmunologico", "enfermedades-piel", "sistema-digestivo"],
+      categoriaId: "hongos-medicinales",
+      categoria: "Hongos medicinales",
+    },
+    {
+      id: "cola-de-pavo",
+      nombre: "Cola de Pavo",
+      nombreCientifico: "Trametes versicolor",
+      nombresAlternativos: {"España": ["Cola de pavo"], "USA_English": ["Turkey Tail"], "UK_English": ["Turkey Tail"], "Indigena": ["Kawaratake (japonés)", "Yun-zhi (chino)"]},
+      propiedades: ["Inmunomodulador", "Antitumoral", "Prebiótico"],
+      parteUsable: "Cuerpo fructífero",
+      dosis: "1-3 gramos de extracto al día.",
+      preparacion: "Decocción, cápsulas o extracto.",
+      contraindicaciones: [],
+      descripcion: "La Cola de Pavo es uno de los hongos medicinales más investigados por su capacidad para modular el sistema inmune, especialmente en el tratamiento del cáncer.",
+      sistemasRelacionados: ["sistema-inmunologico", "sistema-digestivo"],
+      categoriaId: "hongos-medicinales",
+      categoria: "Hongos medicinales",
+    },
+    {
+      id: "agarikon",
+      nombre: "Agarikon",
+      nombreCientifico: "Fomitopsis officinalis",
+      nombresAlternativos: {"España": ["Agárico blanco", "Agárico yesquero", "Falsa yesca"], "USA_English": ["Agarikon", "Quinine Conk", "Larch Bracket Mushroom", "Brown Trunk Rot"], "UK_English": ["Agarikon"], "Indigena": ["Ardagai (euskera)"]},
+      propiedades: ["Antiviral", "Antibacteriano", "Antiinflamatorio"],
+      parteUsable: "Cuerpo fructífero",
+      dosis: "500mg-1g de extracto al día.",
+      preparacion: "Extracto o tintura.",
+      contraindicaciones: [],
+      descripcion: "Conocido por su potente actividad antiviral y antibacteriana, el Agarikon ha sido utilizado tradicionalmente para combatir infecciones.",
+      sistemasRelacionados: ["sistema-inmunologico", "sistema-respiratorio"],
+      categoriaId: "hongos-medicinales",
+      categoria: "Hongos medicinales",
+    },
+    {
+      id: "tremella",
+      nombre: "Tremella",
+      nombreCientifico: "Tremella fuciformis",
+      nombresAlternativos: {"España": ["Hongo blanco", "Hongo de la oreja plateada", "Hongo de nieve", "Oreja de las nieves", "Oreja de plata", "Hongo gelatinoso blanco", "Oreja blanca de las nubes"], "USA_English": ["Snow fungus", "snow ear", "silver ear fungus", "white jelly mushroom", "white cloud ears"], "UK_English": ["Snow fungus"], "Indigena": ["Bai mu er (chino)"]},
+      propiedades: ["Hidratante de la piel", "Antioxidante", "Neuroprotector"],
+      parteUsable: "Cuerpo fructífero",
+      dosis: "1-3 gramos de extracto al día.",
+      preparacion: "Consumo directo en sopas, postres o como extracto.",
+      contraindicaciones: [],
+      descripcion: "La Tremella es conocida como el \"hongo de la belleza\" por su capacidad para hidratar la piel y mejorar su elasticidad.",
+      sistemasRelacionados: ["enfermedades-piel", "sistema-nervioso"],
+      categoriaId: "hongos-medicinales",
+      categoria: "Hongos medicinales",
+    },
+    {
+      id: "poria-cocos",
+      nombre: "Poria Cocos",
+      nombreCientifico: "Wolfiporia extensa",
+      nombresAlternativos: {"USA_English": ["hoelen", "poria", "tuckahoe", "China root", "Indian bread"], "Indigena": ["fu ling", "matsuhodo"]},
+      propiedades: ["Diurético", "Calmante", "Inmunomodulador"],
+      parteUsable: "Esclerocio",
+      dosis: "9-15 gramos en decocción.",
+      preparacion: "Decocción o extracto en polvo.",
+      contraindicaciones: [],
+      descripcion: "Utilizado en la medicina tradicional china para eliminar la humedad del cuerpo, calmar la mente y fortalecer el sistema digestivo.",
+      sistemasRelacionados: ["sistema-urinario", "sistema-digestivo", "trastornos-mentales-emocionales"],
+      categoriaId: "hongos-medicinales",
+      categoria: "Hongos medicinales",
+    },
+    {
+      id: "agaricus-blazei",
+      nombre: "Agaricus Blazei",
+      nombreCientifico: "Agaricus subrufescens",
+      nombresAlternativos: {"España": ["champiñón del sol", "seta de Dios", "hongo de la vida"], "USA_English": ["almond mushroom", "God's mushroom", "mushroom of life", "royal sun agaricus", "sun mushroom"], "Indigena": ["himematsutake", "Cogumelo do Sol"]},
+      propiedades: ["Inmunomodulador", "Antitumoral", "Antialérgico"],
+      parteUsable: "Cuerpo fructífero",
+      dosis: "1.5-3 gramos de extracto al día.",
+      preparacion: "Extracto, cápsulas o decocción.",
+      contraindicaciones: [],
+      descripcion: "Este hongo es muy apreciado por su potente efecto sobre el sistema inmunológico, ayudando a combatir infecciones y alergias.",
+      sistemasRelacionados: ["sistema-inmunologico", "sistema-respiratorio"],
+      categoriaId: "hongos-medicinales",
+      categoria: "Hongos medicinales",
+    },
+    {
+      id: "enoki",
+      nombre: "Enoki",
+      nombreCientifico: "Flammulina velutipes",
+      nombresAlternativos: {"España": ["Enoki", "Seta de aguja de oro", "Seta de llama"], "USA_English": ["Enoki", "velvet foot", "velvet stem", "velvet shank", "wild enoki", "golden needle mushroom", "lily mushroom"], "UK_English": ["Velvet shank", "winter mushroom"], "Indigena": ["Enokitake (japonés)"]},
+      propiedades: ["Antitumoral", "Inmunomodulador", "Antioxidante"],
+      parteUsable: "Cuerpo fructífero",
+      dosis: "Consumo regular en la dieta.",
+      preparacion: "Consumo directo en comidas.",
+      contraindicaciones: [],
+      descripcion: "El Enoki no solo es un ingrediente popular en la cocina asiática, sino que también posee propiedades que fortalecen el sistema inmune.",
+      sistemasRelacionados: ["sistema-inmunologico", "sistema-digestivo"],
+      categoriaId: "hongos-medicinales",
+      categoria: "Hongos medicinales",
+    },
+    {
+      id: "hongo-ostra",
+      nombre: "Hongo Ostra",
+      nombreCientifico: "Pleurotus ostreatus",
+      nombresAlternativos: {"España": ["gírgola", "seta de ostra", "champiñón ostra", "pleuroto ostra", "orellana"], "USA_English": ["oyster mushroom", "pearl oyster mushroom", "tree oyster mushroom"], "UK_English": ["oyster mushroom"], "Indigena": ["hiratake"]},
+      propiedades: ["Reductor del colesterol", "Antioxidante", "Antiinflamatorio"],
+      parteUsable: "Cuerpo fructífero",
+      dosis: "Consumo regular en la dieta.",
+      preparacion: "Consumo directo en comidas.",
+      contraindicaciones: [],
+      descripcion: "El hongo ostra es valorado por su capacidad para reducir los niveles de colesterol y su alto contenido de antioxidantes.",
+      sistemasRelacionados: ["sistema-cardiovascular", "sistema-inmunologico"],
+      categoriaId: "hongos-medicinales",
+      categoria: "Hongos medicinales",
+    },
+    {
+      id: "polyporus-umbellatus",
+      nombre: "Polyporus Umbellatus",
+      nombreCientifico: "Polyporus umbellatus",
+      nombresAlternativos: {"España": ["Poliporo en sombrilla"], "USA_English": ["Umbrella polypore", "lumpy bracket"], "UK_English": ["Umbrella polypore"]},
+      propiedades: ["Diurético", "Inmunomodulador", "Hepatoprotector"],
+      parteUsable: "Esclerocio",
+      dosis: "1-2 gramos de extracto al día.",
+      preparacion: "Decocción o extracto.",
+      contraindicaciones: [],
+      descripcion: "Se utiliza para promover la micción y reducir el edema sin perder potasio, además de apoyar la salud del sistema linfático.",
+      sistemasRelacionados: ["sistema-urinario", "sistema-linfatico", "sistema-inmunologico"],
+      categoriaId: "hongos-medicinales",
+      categoria: "Hongos medicinales",
+    },
+    {
+      id: "schizophyllum-commune",
+      nombre: "Schizophyllum Commune",
+      nombreCientifico: "Schizophyllum commune",
+      nombresAlternativos: {"USA_English": ["splitgill mushroom", "common split gill", "split gill"]},
+      propiedades: ["Antitumoral", "Inmunomodulador", "Antifúngico"],
+      parteUsable: "Cuerpo fructífero",
+      dosis: "Varía según la preparación.",
+      preparacion: "Extracto o decocción.",
+      contraindicaciones: [],
+      descripcion: "Este hongo produce un polisacárido llamado esquizofilano, que ha demostrado tener potentes propiedades antitumorales e inmunomoduladoras.",
+      sistemasRelacionados: ["sistema-inmunologico"],
+      categoriaId: "hongos-medicinales",
+      categoria: "Hongos medicinales",
+    },
+    {
+      id: "auricularia-auricula",
+      nombre: "Oreja de Judas",
+      nombreCientifico: "Auricularia auricula-judae",
+      nombresAlternativos: {"España": ["oreja de Judas", "oreja de lana", "oreja de judío"], "USA_English": ["wood ear", "jelly ear", "Jew's ear", "tree ear"], "UK_English": ["jelly ear", "Judas's ear"], "Indigena": ["Hei Mu Er", "Mu Er"]},
+      propiedades: ["Anticoagulante", "Reductor del colesterol", "Hidratante"],
+      parteUsable: "Cuerpo fructífero",
+      dosis: "Consumo regular en la dieta.",
+      preparacion: "Consumo directo en comidas.",
+      contraindicaciones: [{ tipo: "medicamentos", descripcion: "No consumir con anticoagulantes." }],
+      descripcion: "Conocido por su textura gelatinosa, se usa en la cocina y en la medicina para mejorar la circulación y la hidratación.",
+      sistemasRelacionados: ["sistema-cardiovascular", "enfermedades-piel"],
+      categoriaId: "hongos-medicinales",
+      categoria: "Hongos medicinales",
+    },
+    {
+      id: "coprinus-comatus",
+      nombre: "Coprinus Comatus",
+      nombreCientifico: "Coprinus comatus",
+      nombresAlternativos: {"España": ["Barbuda", "Seta de tinta"], "USA_English": ["Shaggy ink cap", "lawyer's wig"], "UK_English": ["Shaggy ink cap"]},
+      propiedades: ["Hipoglucemiante", "Antioxidante", "Antitumoral"],
+      parteUsable: "Cuerpo fructífero joven",
+      dosis: "Consumo en la dieta o extracto.",
+      preparacion: "Consumo directo (cocinado rápidamente) o extracto.",
+      contraindicaciones: [],
+      descripcion: "Este hongo, también conocido como \"barbuda\", ha mostrado capacidad para regular los niveles de azúcar en sangre.",
+      sistemasRelacionados: ["sistema-endocrino", "sistema-inmunologico"],
+      categoriaId: "hongos-medicinales",
+      categoria: "Hongos medicinales",
+    },
+    {
+      id: "fomes-fomentarius",
+      nombre: "Hongo del Yesquero",
+      nombreCientifico: "Fomes fomentarius",
+      nombresAlternativos: {"España": ["hongo yesca", "hongo yesquero", "hongo pata de caballo", "casco de caballo", "bolet désca"], "USA_English": ["tinder fungus", "false tinder fungus", "hoof fungus", "tinder conk", "tinder polypore", "ice man fungus", "amadou"], "Indigena": ["supizteko ardagai", "ardagai-yesca", "ardagai gorria", "karduba", "kardakiya", "ardoa", "ardai", "eska", "iesca"]},
+      propiedades: ["Antiinflamatorio", "Antibacteriano", "Hemostático"],
+      parteUsable: "Cuerpo fructífero",
+      dosis: "Uso tópico o en decocción.",
+      preparacion: "Tradicionalmente usado como yesca y para detener sangrados.",
+      contraindicaciones: [],
+      descripcion: "Históricamente, este hongo se ha utilizado como yesca para iniciar fuegos y en medicina popular como agente hemostático y antiinflamatorio.",
+      sistemasRelacionados: ["enfermedades-piel", "sistema-inmunologico"],
+      categoriaId: "hongos-medicinales",
+      categoria: "Hongos medicinales",
+    },
+    {
+      id: "ganoderma-applanatum",
+      nombre: "Pipa",
+      nombreCientifico: "Ganoderma applanatum",
+      nombresAlternativos: {"España": ["Yesquero aplanado"], "USA_English": ["artist's bracket", "artist's conk", "bear bread", "white mottled rot"], "Indigena": ["ardagai zapal"]},
+      propiedades: ["Antitumoral", "Antiinflamatorio", "Analgésico"],
+      parteUsable: "Cuerpo fructífero",
+      dosis: "1-3 gramos de extracto al día.",
+      preparacion: "Decocción o extracto.",
+      contraindicaciones: [],
+      descripcion: "Pariente del Reishi, este hongo perenne se utiliza para aliviar el dolor y combatir la inflamación y tumores.",
+      sistemasRelacionados: ["sistema-inmunologico", "sistema-musculoesqueletico"],
+      categoriaId: "hongos-medicinales",
+      categoria: "Hongos medicinales",
+    },
+    {
+      id: "phellinus-linteus",
+      nombre: "Phellinus Linteus",
+      nombreCientifico: "Phellinus linteus",
+      nombresAlternativos: {"USA_English": ["Meshima", "black hoof mushroom"], "Indigena": ["meshimakobu", "song gen", "sanghwang"]},
+      propiedades: ["Inmunomodulador", "Antitumoral", "Antiinflamatorio"],
+      parteUsable: "Cuerpo fructífero",
+      dosis: "1-3 gramos de extracto al día.",
+      preparacion: "Decocción o extracto.",
+      contraindicaciones: [],
+      descripcion: "Muy valorado en la medicina asiática, se investiga por su potente efecto estimulante del sistema inmune y su actividad contra el cáncer.",
+      sistemasRelacionados: ["sistema-inmunologico"],
+      categoriaId: "hongos-medicinales",
+      categoria: "Hongos medicinales",
+    },
+    {
+      id: "pleurotus-eryngii",
+      nombre: "Seta de Cardo",
+      nombreCientifico: "Pleurotus eryngii",
+      nombresAlternativos: {"España": ["Seta de cardo"], "USA_English": ["King trumpet mushroom", "king oyster mushroom"], "UK_English": ["King oyster mushroom"]},
+      propiedades: ["Reductor del colesterol", "Antioxidante", "Antiinflamatorio"],
+      parteUsable: "Cuerpo fructífero",
+      dosis: "Consumo regular en la dieta.",
+      preparacion: "Consumo directo en comidas.",
+      contraindicaciones: [],
+      descripcion: "Además de su excelente sabor, la seta de cardo ayuda a mantener niveles saludables de colesterol y combate el estrés oxidativo.",
+      sistemasRelacionados: ["sistema-cardiovascular", "sistema-inmunologico"],
+      categoriaId: "hongos-medicinales",
+      categoria: "Hongos medicinales",
+    },
+    {
+      id: "sparassis-crispa",
+      nombre: "Hongo Coliflor",
+      nombreCientifico: "Sparassis crispa",
+      nombresAlternativos: {"España": ["Seta coliflor"], "USA_English": ["Cauliflower mushroom"], "UK_English": ["Cauliflower fungus"]},
+      propiedades: ["Inmunomodulador", "Antitumoral", "Cicatrizante"],
+      parteUsable: "Cuerpo fructífero",
+      dosis: "Consumo en la dieta o extracto.",
+      preparacion: "Consumo directo o extracto.",
+      contraindicaciones: [],
+      descripcion: "Este hongo, que parece una coliflor, es conocido por estimular la producción de colágeno y la cicatrización de heridas, además de sus propiedades inmunitarias.",
+      sistemasRelacionados: ["sistema-inmunologico", "enfermedades-piel"],
+      categoriaId: "hongos-medicinales",
+      categoria: "Hongos medicinales",
+    },
+    {
+      id: "laetiporus-sulphureus",
+      nombre: "Pollo de los Bosques",
+      nombreCientifico: "Laetiporus sulphureus",
+      nombresAlternativos: {"España": ["Pollo de los bosques", "cangrejo de los bosques", "plataforma de azufre", "políporo azufrado", "seta tornillo"], "USA_English": ["chicken of the woods", "sulphur polypore", "sulphur shelf", "crab-of-the-woods", "chicken mushroom", "chicken fungus"], "Indigena": ["ardagai hori", "gírgola groga"]},
+      propiedades: ["Antibacteriano", "Antioxidante", "Inmunomodulador"],
+      parteUsable: "Cuerpo fructífero joven",
+      dosis: "Consumo en la dieta.",
+      preparacion: "Consumo directo, bien cocinado.",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Debe cocinarse bien; puede causar malestar gastrointestinal si está crudo o si crece en ciertos árboles." }],
+      descripcion: "Conocido por su sabor similar al pollo, este hongo también posee propiedades antibacterianas y antioxidantes.",
+      sistemasRelacionados: ["sistema-inmunologico", "sistema-digestivo"],
+      categoriaId: "hongos-medicinales",
+      categoria: "Hongos medicinales",
+    },
+    {
+      id: "suillus-luteus",
+      nombre: "Boleto Anillado",
+      nombreCientifico: "Suillus luteus",
+      nombresAlternativos: {"España": ["boleto anillado", "babosillo", "hongo amarillo", "boleto anillado viscoso"], "USA_English": ["slippery jack", "sticky bun"], "Indigena": ["pinudi-onddo likin", "pinetell", "molleric de calceta", "andoa anelada", "corvall en aret"]},
+      propiedades: ["Antiinflamatorio", "Antioxidante", "Dermatológico"],
+      parteUsable: "Cuerpo fructífero",
+      dosis: "Consumo en la dieta.",
+      preparacion: "Consumo directo, quitando la cutícula viscosa.",
+      contraindicaciones: [{ tipo: "alergia", descripcion: "La cutícula puede ser laxante o causar alergias en algunas personas." }],
+      descripcion: "Este boleto comestible es apreciado en la cocina y se le atribuyen propiedades beneficiosas para la piel y contra la inflamación.",
+      sistemasRelacionados: ["enfermedades-piel", "sistema-inmunologico"],
+      categoriaId: "hongos-medicinales",
+      categoria: "Hongos medicinales",
+    },
+    {
+      id: "cantharellus-cibarius",
+      nombre: "Rebozuelo",
+      nombreCientifico: "Cantharellus cibarius",
+      nombresAlternativos: {"España": ["Rebozuelo", "Cantarela", "Anacate", "Chantarela"], "México": ["Duraznillo"], "USA_English": ["Chanterelle", "golden chanterelle"], "UK_English": ["Chanterelle"]},
+      propiedades: ["Antioxidante", "Vitamínico (Vit D y B)", "Antimicrobiano"],
+      parteUsable: "Cuerpo fructífero",
+      dosis: "Consumo regular en la dieta.",
+      preparacion: "Consumo directo en comidas.",
+      contraindicaciones: [],
+      descripcion: "Este popular hongo silvestre no solo es delicioso, sino que también es una buena fuente de vitaminas y compuestos con actividad antimicrobiana.",
+      sistemasRelacionados: ["sistema-inmunologico", "enfermedades-piel"],
+      categoriaId: "hongos-medicinales",
+      categoria: "Hongos medicinales",
+    },
+    {
+      id: "craterellus-cornucopioides",
+      nombre: "Trompeta de los Muertos",
+      nombreCientifico: "Craterellus cornucopioides",
+      nombresAlternativos: {"España": ["Trompeta de los muertos", "cuerno de la abundancia", "trompeta negra"], "USA_English": ["horn of plenty", "black chanterelle", "black trumpet", "trumpet of the dead"], "UK_English": ["horn of plenty"]},
+      propiedades: ["Antioxidante", "Mineralizante", "Aromatizante"],
+      parteUsable: "Cuerpo fructífero",
+      dosis: "Consumo regular en la dieta.",
+      preparacion: "Consumo directo o seco como condimento.",
+      contraindicaciones: [],
+      descripcion: "A pesar de su nombre, es un hongo comestible muy apreciado, rico en minerales y con un sabor ahumado único.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-inmunologico"],
+      categoriaId: "hongos-medicinales",
+      categoria: "Hongos medicinales",
+    },
+    {
+      id: "morchella-esculenta",
+      nombre: "Colmenilla",
+      nombreCientifico: "Morchella esculenta",
+      nombresAlternativos: {"España": ["Colmenilla", "cagarria", "morilla", "carcarria", "crespilla", "murúgula", "colmenilla gris", "seta de cuaresma", "bresquilla"], "USA_English": ["common morel", "morel", "yellow morel", "true morel", "morel mushroom", "sponge morel"], "Indigena": ["karraspina arrunt", "múrgula grisa", "múrgula", "xirupato", "orellazos", "esclatasanc camelit"]},
+      propiedades: ["Antioxidante", "Inmunomodulador", "Antiinflamatorio"],
+      parteUsable: "Cuerpo fructífero",
+      dosis: "Consumo en la dieta, siempre cocinada.",
+      preparacion: "Consumo directo, bien cocinada.",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Tóxica si se consume cruda." }],
+      descripcion: "Las colmenillas son un manjar culinario que también ofrece beneficios para la salud, como el refuerzo del sistema inmune y la reducción de la inflamación.",
+      sistemasRelacionados: ["sistema-inmunologico", "sistema-musculoesqueletico"],
+      categoriaId: "hongos-medicinales",
+      categoria: "Hongos medicinales",
+    },
+    {
+      id: "tuber-melanosporum",
+      nombre: "Trufa Negra",
+      nombreCientifico: "Tuber melanosporum",
+      nombresAlternativos: {"España": ["Trufa negra", "Trufa de Périgord", "Trufa violeta"], "USA_English": ["Black truffle", "Périgord truffle", "French black truffle"], "UK_English": ["Black truffle", "winter truffle"]},
+      propiedades: ["Antioxidante", "Afrodisíaco", "Antiinflamatorio"],
+      parteUsable: "Cuerpo fructífero (ascocarpo)",
+      dosis: "Pequeñas cantidades como condimento.",
+      preparacion: "Consumo directo en crudo o ligeramente calentado.",
+      contraindicaciones: [],
+      descripcion: "La trufa negra, un lujo gastronómico, es rica en antioxidantes y se le atribuyen tradicionalmente propiedades afrodisíacas.",
+      sistemasRelacionados: ["sistema-endocrino", "sistema-nervioso"],
+      categoriaId: "hongos-medicinales",
+      categoria: "Hongos medicinales",
+    },
+    {
+      id: "boletus-edulis",
+      nombre: "Boletus Edulis",
+      nombreCientifico: "Boletus edulis",
+      nombresAlternativos: {"España": ["Hongo", "Seta de calabaza", "Viriato"], "USA_English": ["King bolete", "porcini"], "UK_English": ["Cep", "penny bun"]},
+      propiedades: ["Antitumoral", "Antioxidante", "Probiótico"],
+      parteUsable: "Cuerpo fructífero",
+      dosis: "Consumo regular en la dieta.",
+      preparacion: "Consumo directo en comidas.",
+      contraindicaciones: [],
+      descripcion: "Considerado uno de los hongos comestibles más finos, el Boletus edulis también contiene compuestos con actividad antitumoral y antioxidante.",
+      sistemasRelacionados: ["sistema-inmunologico", "sistema-digestivo"],
+      categoriaId: "hongos-medicinales",
+      categoria: "Hongos medicinales",
+    },
+    {
+      id: "ganoderma-lingzhi",
+      nombre: "Lingzhi",
+      nombreCientifico: "Ganoderma lingzhi",
+      nombresAlternativos: {"USA_English": ["Reishi mushroom", "Lingzhi mushroom"], "Indigena": ["lingzhi"]},
+      propiedades: ["Adaptógeno", "Neuroprotector", "Antioxidante"],
+      parteUsable: "Cuerpo fructífero",
+      dosis: "1-2 gramos de extracto en polvo al día.",
+      preparacion: "Decocción o extracto.",
+      contraindicaciones: [{ tipo: "medicamentos", descripcion: "Puede interactuar con anticoagulantes." }],
+      descripcion: "Pariente cercano del Reishi, el Lingzhi es otro hongo de la longevidad muy apreciado en la medicina tradicional china por sus efectos sobre la mente y el espíritu.",
+      sistemasRelacionados: ["sistema-nervioso", "sistema-inmunologico", "trastornos-mentales-emocionales"],
+      categoriaId: "hongos-medicinales",
+      categoria: "Hongos medicinales",
+    },
+    {
+      id: "amanita-caesarea",
+      nombre: "Oronja",
+      nombreCientifico: "Amanita caesarea",
+      nombresAlternativos: {"España": ["Oronja", "Amanita de los césares", "Huevo de rey", "Yema de huevo"], "USA_English": ["Caesar's mushroom"], "UK_English": ["Caesar's mushroom"]},
+      propiedades: ["Nutritivo", "Antioxidante", "Vitamínico"],
+      parteUsable: "Cuerpo fructífero",
+      dosis: "Consumo en la dieta.",
+      preparacion: "Consumo directo, cruda o cocinada.",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Requiere identificación experta para evitar confusión con amanitas tóxicas." }],
+      descripcion: "La oronja o \"huevo de rey\" es un hongo comestible muy apreciado desde la antigüedad, valorado por su sabor delicado y su aporte de nutrientes.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-inmunologico"],
+      categoriaId: "hongos-medicinales",
+      categoria: "Hongos medicinales",
+    },
+  ],
+};
+
+export default categoria;
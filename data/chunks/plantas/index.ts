@@ -0,0 +1,61 @@
+// Generado automáticamente por scripts/build-catalog.py - no editar a mano
+// Índice de bloques de plantas-expandidas.ts: 17 bloques, 693 registros
+
+import type { CategoriaPlanta } from '../../plantas-expandidas';
+
+export interface ResumenCategoria {
+  id: string;
+  nombre: string;
+  total: number;
+}
+
+export const resumenCategorias: ResumenCategoria[] = [
+  { id: "hierbas-aromaticas-culinarias", nombre: "Hierbas aromáticas y culinarias", total: 60 },
+  { id: "hierbas-silvestres-medicinales", nombre: "Hierbas silvestres medicinales", total: 60 },
+  { id: "arboles-medicinales", nombre: "Árboles medicinales", total: 49 },
+  { id: "arbustos-medicinales", nombre: "Arbustos medicinales", total: 50 },
+  { id: "plantas-tropicales-medicinales", nombre: "Plantas tropicales medicinales", total: 50 },
+  { id: "raices-y-tuberculos-medicinales", nombre: "Raíces y tubérculos medicinales", total: 45 },
+  { id: "flores-medicinales", nombre: "Flores medicinales", total: 48 },
+  { id: "hongos-medicinales", nombre: "Hongos medicinales", total: 31 },
+  { id: "algas-y-plantas-acuaticas-medicinales", nombre: "Algas y plantas acuáticas medicinales", total: 25 },
+  { id: "frutas-citricas-medicinales", nombre: "Frutas cítricas medicinales", total: 25 },
+  { id: "frutas-tropicales-medicinales", nombre: "Frutas tropicales medicinales", total: 40 },
+  { id: "frutas-clima-templado-medicinales", nombre: "Frutas de clima templado medicinales", total: 35 },
+  { id: "bayas-y-frutos-del-bosque-medicinales", nombre: "Bayas y frutos del bosque medicinales", total: 30 },
+  { id: "semillas-y-frutos-secos-medicinales", nombre: "Semillas y frutos secos medicinales", total: 40 },
+  { id: "especias-medicinales", nombre: "Especias medicinales", total: 45 },
+  { id: "plantas-suculentas-y-cactus-medicinales", nombre: "Plantas suculentas y cactus medicinales", total: 25 },
+  { id: "plantas-adaptogenas", nombre: "Plantas adaptógenas", total: 35 },
+];
+
+export const totalPlantas = 693;
+
+// Misma huella que plantas-expandidas.ts: los chunks tienen el mismo contenido
+export const huellaPlantas = "ac331aec271b1127";
+
+const cargadores: Record<string, () => Promise<{ default: CategoriaPlanta }>> = {
+  "hierbas-aromaticas-culinarias": () => import("./hierbas-aromaticas-culinarias"),
+  "hierbas-silvestres-medicinales": () => import("./hierbas-silvestres-medicinales"),
+  "arboles-medicinales": () => import("./arboles-medicinales"),
+  "arbustos-medicinales": () => import("./arbustos-medicinales"),
+  "plantas-tropicales-medicinales": () => import("./plantas-tropicales-medicinales"),
+  "raices-y-tuberculos-medicinales": () => import("./raices-y-tuberculos-medicinales"),
+  "flores-medicinales": () => import("./flores-medicinales"),
+  "hongos-medicinales": () => import("./hongos-medicinales"),
+  "algas-y-plantas-acuaticas-medicinales": () => import("./algas-y-plantas-acuaticas-medicinales"),
+  "frutas-citricas-medicinales": () => import("./frutas-citricas-medicinales"),
+  "frutas-tropicales-medicinales": () => import("./frutas-tropicales-medicinales"),
+  "frutas-clima-templado-medicinales": () => import("./frutas-clima-templado-medicinales"),
+  "bayas-y-frutos-del-bosque-medicinales": () => import("./bayas-y-frutos-del-bosque-medicinales"),
+  "semillas-y-frutos-secos-medicinales": () => import("./semillas-y-frutos-secos-medicinales"),
+  "especias-medicinales": () => import("./especias-medicinales"),
+  "plantas-suculentas-y-cactus-medicinales": () => import("./plantas-suculentas-y-cactus-medicinales"),
+  "plantas-adaptogenas": () => import("./plantas-adaptogenas"),
+};
+
+// Carga el módulo del bloque sólo cuando se necesita (undefined si el id no existe)
+export const cargarCategoria = async (id: string): Promise<CategoriaPlanta | undefined> => {
+  const cargar = cargadores[id];
+  return cargar ? (await cargar()).default : undefined;
+};
@@ -0,0 +1,534 @@
+// Generado automáticamente por scripts/build-catalog.py - no editar a mano
+import type { CategoriaPlanta } from '../../plantas-expandidas';
+
+const categoria: CategoriaPlanta = {
+  id: "plantas-adaptogenas",
+  nombre: "Plantas adaptógenas",
+  plantas: [
+    {
+      id: "ginseng",
+      nombre: "Ginseng",
+      nombreCientifico: "Panax ginseng",
+      nombresAlternativos: {"China": ["Rénshēn"], "Corea": ["Insam"], "Japón": ["Ninjin"], "USA_English": ["asian ginseng", "chinese ginseng", "korean ginseng"], "UK_English": ["asian ginseng", "chinese ginseng", "korean ginseng"]},
+      propiedades: ["Estimulante del sistema nervioso central", "Mejora el rendimiento físico y mental", "Reduce la fatiga", "Fortalece el sistema inmunológico"],
+      parteUsable: "Raíz",
+      dosis: "200-400 mg de extracto estandarizado al día",
+      preparacion: "Decocción, extracto, cápsulas",
+      contraindicaciones: [{ tipo: "hipertension", descripcion: "Puede elevar la presión arterial en algunas personas." }, { tipo: "medicamentos", descripcion: "Interactúa con anticoagulantes y medicamentos para la diabetes." }],
+      descripcion: "Planta perenne cuya raíz se ha utilizado durante siglos en la medicina tradicional china para mejorar la energía y la vitalidad.",
+      sistemasRelacionados: ["sistema-nervioso", "sistema-inmunologico", "sistema-endocrino"],
+      categoriaId: "plantas-adaptogenas",
+      categoria: "Plantas adaptógenas",
+    },
+    {
+      id: "ashwagandha",
+      nombre: "Ashwagandha",
+      nombreCientifico: "Withania somnifera",
+      nombresAlternativos: {"España": ["bufera", "oroval", "orval", "hierba mora mayor"], "USA_English": ["Indian ginseng", "winter cherry", "poison gooseberry"], "UK_English": ["Indian ginseng", "winter cherry"]},
+      propiedades: ["Reduce el estrés y la ansiedad", "Mejora la función cognitiva", "Aumenta la fuerza muscular", "Propiedades antiinflamatorias"],
+      parteUsable: "Raíz y bayas",
+      dosis: "300-500 mg de extracto de raíz dos veces al día",
+      preparacion: "Polvo, cápsulas, tintura",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "Puede inducir el aborto." }, { tipo: "medicamentos", descripcion: "Puede interactuar con sedantes y medicamentos para la tiroides." }],
+      descripcion: "Hierba fundamental en la medicina ayurvédica, conocida por sus propiedades restauradoras y rejuvenecedoras.",
+      sistemasRelacionados: ["sistema-nervioso", "sistema-endocrino", "sistema-inmunologico", "sistema-musculoesqueletico"],
+      categoriaId: "plantas-adaptogenas",
+      categoria: "Plantas adaptógenas",
+    },
+    {
+      id: "rhodiola",
+      nombre: "Rhodiola",
+      nombreCientifico: "Rhodiola rosea",
+      nombresAlternativos: {"España": ["rodiola"], "USA_English": ["golden root", "rose root", "roseroot", "Aaron's rod", "Arctic root", "king's crown", "lignum rhodium", "orpin rose"], "UK_English": ["golden root", "rose root", "roseroot", "Aaron's rod", "Arctic root", "king's crown", "lignum rhodium", "orpin rose"]},
+      propiedades: ["Combate la fatiga", "Mejora el estado de ánimo", "Aumenta la resistencia al estrés", "Mejora la función cognitiva"],
+      parteUsable: "Raíz",
+      dosis: "200-600 mg al día de extracto estandarizado",
+      preparacion: "Cápsulas, extracto líquido",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Puede causar irritabilidad o insomnio en algunas personas." }],
+      descripcion: "Planta que crece en regiones frías y montañosas de Europa y Asia, utilizada para aumentar la resistencia física y mental.",
+      sistemasRelacionados: ["sistema-nervioso", "sistema-endocrino"],
+      categoriaId: "plantas-adaptogenas",
+      categoria: "Plantas adaptógenas",
+    },
+    {
+      id: "eleuterococo",
+      nombre: "Eleuterococo",
+      nombreCientifico: "Eleutherococcus senticosus",
+      nombresAlternativos: {"España": ["ginseng siberiano", "eleuterococo", "eleutero"], "USA_English": ["Siberian ginseng", "eleuthero", "devil's bush", "taiga root", "ciwujia", "Devil's shrub", "shigoka", "touch-me-not", "wild pepper", "kan jang"], "UK_English": ["Siberian ginseng", "eleuthero"]},
+      propiedades: ["Aumenta la resistencia física", "Mejora la función inmunológica", "Combate la fatiga", "Mejora la concentración"],
+      parteUsable: "Raíz",
+      dosis: "300-1200 mg de extracto al día",
+      preparacion: "Cápsulas, extracto líquido, té",
+      contraindicaciones: [{ tipo: "hipertension", descripcion: "No recomendado para personas con presión arterial alta." }],
+      descripcion: "Conocido como ginseng siberiano, es un arbusto leñoso que se utiliza para mejorar la resistencia y el bienestar general.",
+      sistemasRelacionados: ["sistema-inmunologico", "sistema-nervioso", "sistema-endocrino"],
+      categoriaId: "plantas-adaptogenas",
+      categoria: "Plantas adaptógenas",
+    },
+    {
+      id: "schisandra",
+      nombre: "Schisandra",
+      nombreCientifico: "Schisandra chinensis",
+      nombresAlternativos: {"USA_English": ["magnolia vine", "five-flavor berry"], "UK_English": ["magnolia vine", "five-flavor berry"], "Indigena": ["omija", "omicha"]},
+      propiedades: ["Protege el hígado", "Mejora la resistencia y el rendimiento", "Reduce el estrés", "Propiedades antioxidantes"],
+      parteUsable: "Bayas",
+      dosis: "500-2000 mg de polvo de bayas al día",
+      preparacion: "Polvo, cápsulas, extracto, té",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "No se recomienda su uso durante el embarazo." }],
+      descripcion: "Planta trepadora leñosa cuyas bayas se utilizan en la medicina tradicional china por sus múltiples beneficios para la salud.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-nervioso", "sistema-inmunologico"],
+      categoriaId: "plantas-adaptogenas",
+      categoria: "Plantas adaptógenas",
+    },
+    {
+      id: "albahaca-sagrada",
+      nombre: "Albahaca Sagrada (Tulsi)",
+      nombreCientifico: "Ocimum tenuiflorum",
+      nombresAlternativos: {"USA_English": ["holy basil", "hot basil"], "UK_English": ["holy basil"], "Indigena": ["tulsi", "tulasi"]},
+      propiedades: ["Reduce el estrés y la ansiedad", "Apoya el sistema inmunológico", "Propiedades antiinflamatorias", "Mejora la salud respiratoria"],
+      parteUsable: "Hojas",
+      dosis: "300-600 mg de extracto al día",
+      preparacion: "Té, cápsulas, extracto líquido",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "Evitar durante el embarazo y la lactancia." }],
+      descripcion: "Considerada una planta sagrada en la India, se utiliza en la medicina ayurvédica para promover la longevidad y el bienestar.",
+      sistemasRelacionados: ["sistema-nervioso", "sistema-inmunologico", "sistema-respiratorio"],
+      categoriaId: "plantas-adaptogenas",
+      categoria: "Plantas adaptógenas",
+    },
+    {
+      id: "reishi",
+      nombre: "Reishi",
+      nombreCientifico: "Ganoderma lucidum",
+      nombresAlternativos: {"España": ["Pipa"], "USA_English": ["Reishi", "varnished conk", "lacquered bracket"], "UK_English": ["Reishi"], "Indigena": ["Lingzhi (chino)", "Yeongji (coreano)"]},
+      propiedades: ["Fortalece el sistema inmunológico", "Reduce el estrés", "Mejora la calidad del sueño", "Propiedades antiinflamatorias"],
+      parteUsable: "Cuerpo fructífero del hongo",
+      dosis: "1-1.5 g de extracto en polvo al día",
+      preparacion: "Polvo, cápsulas, extracto, té",
+      contraindicaciones: [{ tipo: "medicamentos", descripcion: "Puede interactuar con anticoagulantes y medicamentos para la presión arterial." }],
+      descripcion: "Hongo conocido como el \"hongo de la inmortalidad\" en la medicina tradicional china, valorado por sus efectos sobre el sistema inmunológico y la longevidad.",
+      sistemasRelacionados: ["sistema-inmunologico", "sistema-nervioso", "sistema-cardiovascular"],
+      categoriaId: "plantas-adaptogenas",
+      categoria: "Plantas adaptógenas",
+    },
+    {
+      id: "cordyceps",
+      nombre: "Cordyceps",
+      nombreCientifico: "Cordyceps sinensis",
+      nombresAlternativos: {"España": ["Hongo oruga chino"], "USA_English": ["Caterpillar fungus", "Himalayan Viagra"], "UK_English": ["Caterpillar fungus"], "Indigena": ["Yartsa gunbu (tibetano)", "Dong Chong Xia Cao (chino)"]},
+      propiedades: ["Aumenta la energía y la resistencia", "Mejora la función respiratoria", "Fortalece el sistema inmunológico", "Mejora la función renal"],
+      parteUsable: "Micelio y cuerpo fructífero",
+      dosis: "1-3 gramos al día",
+      preparacion: "Polvo, cápsulas, extracto",
+      contraindicaciones: [{ tipo: "medicamentos", descripcion: "Puede interactuar con inmunosupresores." }],
+      descripcion: "Hongo parásito que crece en larvas de insectos, utilizado en la medicina tradicional china para mejorar la energía, la resistencia y la función pulmonar.",
+      sistemasRelacionados: ["sistema-respiratorio", "sistema-inmunologico", "sistema-urinario"],
+      categoriaId: "plantas-adaptogenas",
+      categoria: "Plantas adaptógenas",
+    },
+    {
+      id: "maca",
+      nombre: "Maca",
+      nombreCientifico: "Lepidium meyenii",
+      nombresAlternativos: {"Perú": ["maca-maca", "maino", "ayak chichira", "ayak willku"], "USA_English": ["maca", "Peruvian ginseng"], "UK_English": ["maca", "Peruvian ginseng"], "Indigena": ["maka", "ayak chichira", "ayak willku (Quechua)"]},
+      propiedades: ["Aumenta la energía y la resistencia", "Mejora la libido y la fertilidad", "Equilibra las hormonas", "Mejora el estado de ánimo"],
+      parteUsable: "Raíz",
+      dosis: "1.5-3 gramos de polvo de raíz al día",
+      preparacion: "Polvo, cápsulas",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Personas con problemas de tiroides deben consultar a un médico." }],
+      descripcion: "Planta originaria de los Andes peruanos, cultivada por su raíz nutritiva que se utiliza para aumentar la energía, la fertilidad y la resistencia.",
+      sistemasRelacionados: ["sistema-endocrino", "sistema-reproductor", "sistema-nervioso"],
+      categoriaId: "plantas-adaptogenas",
+      categoria: "Plantas adaptógenas",
+    },
+    {
+      id: "astragalo",
+      nombre: "Astrágalo",
+      nombreCientifico: "Astragalus membranaceus",
+      nombresAlternativos: {"China": ["huáng qí", "běi qí"], "USA_English": ["milkvetch", "Mongolian milkvetch"], "UK_English": ["milkvetch"]},
+      propiedades: ["Fortalece el sistema inmunológico", "Propiedades antiinflamatorias", "Protege el sistema cardiovascular", "Aumenta la energía"],
+      parteUsable: "Raíz",
+      dosis: "20-30 gramos en decocción o 500 mg de extracto 3-4 veces al día",
+      preparacion: "Decocción, extracto, cápsulas",
+      contraindicaciones: [{ tipo: "medicamentos", descripcion: "Puede interactuar con inmunosupresores." }],
+      descripcion: "Planta fundamental en la medicina tradicional china, utilizada para fortalecer el sistema inmunológico y proteger el cuerpo contra diversas enfermedades.",
+      sistemasRelacionados: ["sistema-inmunologico", "sistema-cardiovascular", "sistema-urinario"],
+      categoriaId: "plantas-adaptogenas",
+      categoria: "Plantas adaptógenas",
+    },
+    {
+      id: "curcuma",
+      nombre: "Cúrcuma",
+      nombreCientifico: "Curcuma longa",
+      nombresAlternativos: {"Cuba": ["polluelo", "azafrán cimarrón", "yuquilla"], "Puerto Rico": ["turmérico", "jengibrillo"], "Perú": ["palillo cholón", "palillo chuncho", "guisador", "palillo"], "Colombia": ["azafrán", "azafrán cimarrón", "curcuma", "cúrcuma", "guisador"], "USA_English": ["common turmeric", "turmeric", "Indian saffron", "golden herb", "yellow ginger saffron"], "UK_English": ["turmeric"], "Indigena": ["haldi (Hindi)"]},
+      propiedades: ["Potente antiinflamatorio", "Antioxidante", "Mejora la función cerebral", "Alivia el dolor articular"],
+      parteUsable: "Rizoma",
+      dosis: "1-3 gramos de polvo de rizoma al día",
+      preparacion: "Polvo, cápsulas, extracto",
+      contraindicaciones: [{ tipo: "medicamentos", descripcion: "Puede interactuar con anticoagulantes." }, { tipo: "otro", descripcion: "Altas dosis pueden causar malestar estomacal." }],
+      descripcion: "Especia de color amarillo brillante, ampliamente utilizada en la cocina y la medicina ayurvédica por sus potentes propiedades antiinflamatorias.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-musculoesqueletico", "sistema-nervioso"],
+      categoriaId: "plantas-adaptogenas",
+      categoria: "Plantas adaptógenas",
+    },
+    {
+      id: "jengibre",
+      nombre: "Jengibre",
+      nombreCientifico: "Zingiber officinale",
+      nombresAlternativos: {"Perú": ["kion"], "Filipinas": ["luya"], "Colombia": ["ajengible", "ajengibre", "ajingible", "anjengibre"], "USA_English": ["common ginger", "ginger"], "UK_English": ["ginger"], "India": ["adrak"], "China": ["sheng jiang"], "Japón": ["shoga"]},
+      propiedades: ["Alivia las náuseas y el mareo", "Antiinflamatorio", "Mejora la digestión", "Alivia el dolor muscular"],
+      parteUsable: "Rizoma",
+      dosis: "1-2 gramos de rizoma fresco o en polvo al día",
+      preparacion: "Infusión, decocción, polvo, cápsulas",
+      contraindicaciones: [{ tipo: "medicamentos", descripcion: "Puede interactuar con anticoagulantes." }],
+      descripcion: "Planta con un rizoma aromático y picante, utilizada en todo el mundo como especia y como remedio para problemas digestivos y náuseas.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-musculoesqueletico"],
+      categoriaId: "plantas-adaptogenas",
+      categoria: "Plantas adaptógenas",
+    },
+    {
+      id: "bacopa",
+      nombre: "Bacopa",
+      nombreCientifico: "Bacopa monnieri",
+      nombresAlternativos: {"USA_English": ["water hyssop", "herb of grace", "Indian pennywort"], "UK_English": ["water hyssop", "herb of grace"], "Indigena": ["brahmi"]},
+      propiedades: ["Mejora la memoria y la función cognitiva", "Reduce la ansiedad", "Propiedades neuroprotectoras", "Mejora el estado de ánimo"],
+      parteUsable: "Partes aéreas",
+      dosis: "300-450 mg de extracto estandarizado al día",
+      preparacion: "Cápsulas, extracto",
+      contraindicaciones: [{ tipo: "medicamentos", descripcion: "Puede interactuar con sedantes." }],
+      descripcion: "Planta utilizada en la medicina ayurvédica para mejorar la memoria, el aprendizaje y la concentración, y para reducir la ansiedad.",
+      sistemasRelacionados: ["sistema-nervioso"],
+      categoriaId: "plantas-adaptogenas",
+      categoria: "Plantas adaptógenas",
+    },
+    {
+      id: "gotu-kola",
+      nombre: "Gotu Kola",
+      nombreCientifico: "Centella asiatica",
+      nombresAlternativos: {"USA_English": ["Asiatic pennywort", "Indian pennywort", "spadeleaf"], "UK_English": ["Asiatic pennywort", "Indian pennywort"]},
+      propiedades: ["Mejora la función cognitiva", "Promueve la cicatrización de heridas", "Mejora la circulación", "Reduce la ansiedad"],
+      parteUsable: "Hojas y tallos",
+      dosis: "600-1800 mg de hierba seca al día",
+      preparacion: "Té, cápsulas, extracto, uso tópico",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Puede causar somnolencia." }],
+      descripcion: "Planta perenne utilizada en la medicina tradicional de Asia para mejorar la función cerebral, promover la salud de la piel y mejorar la circulación.",
+      sistemasRelacionados: ["sistema-nervioso", "enfermedades-piel", "sistema-cardiovascular"],
+      categoriaId: "plantas-adaptogenas",
+      categoria: "Plantas adaptógenas",
+    },
+    {
+      id: "maitake",
+      nombre: "Maitake",
+      nombreCientifico: "Grifola frondosa",
+      nombresAlternativos: {"España": ["Gallina de los bosques", "Seta de Río"], "USA_English": ["Hen-of-the-woods", "sheep's head", "ram's head"], "UK_English": ["Hen-of-the-woods"], "Indigena": ["Hui zhu hua (chino)"]},
+      propiedades: ["Fortalece el sistema inmunológico", "Regula el azúcar en sangre", "Reduce la presión arterial", "Propiedades antitumorales"],
+      parteUsable: "Cuerpo fructífero",
+      dosis: "1-3 gramos de extracto al día",
+      preparacion: "Cápsulas, extracto, cocinado",
+      contraindicaciones: [{ tipo: "medicamentos", descripcion: "Puede potenciar los efectos de los medicamentos para la diabetes y la hipertensión." }],
+      descripcion: "Hongo comestible que crece en la base de los árboles, valorado en Japón por sus propiedades medicinales, especialmente para el sistema inmunológico.",
+      sistemasRelacionados: ["sistema-inmunologico", "sistema-cardiovascular", "sistema-endocrino"],
+      categoriaId: "plantas-adaptogenas",
+      categoria: "Plantas adaptógenas",
+    },
+    {
+      id: "moringa",
+      nombre: "Moringa",
+      nombreCientifico: "Moringa oleifera",
+      nombresAlternativos: {"México": ["moringa", "ben", "malungáy"], "Colombia": ["moringa", "ben", "malungáy"], "Centroamérica": ["palo jeringa", "acacia", "jazmín francés"], "Caribe": ["moringa", "ben", "malungáy"], "USA_English": ["moringa", "drumstick tree", "horseradish tree"], "UK_English": ["moringa", "drumstick tree", "horseradish tree"]},
+      propiedades: ["Rica en nutrientes y antioxidantes", "Antiinflamatorio", "Reduce el azúcar en sangre", "Protege el hígado"],
+      parteUsable: "Hojas, semillas, flores",
+      dosis: "6-10 gramos de polvo de hoja al día",
+      preparacion: "Polvo, cápsulas, té, cocinada",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "La raíz y la corteza pueden ser abortivas." }],
+      descripcion: "Árbol de crecimiento rápido originario del sur de Asia, conocido como el \"árbol milagroso\" por el alto valor nutritivo de sus hojas.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-inmunologico", "sistema-cardiovascular"],
+      categoriaId: "plantas-adaptogenas",
+      categoria: "Plantas adaptógenas",
+    },
+    {
+      id: "amla",
+      nombre: "Amla",
+      nombreCientifico: "Phyllanthus emblica",
+      nombresAlternativos: {"USA_English": ["Indian gooseberry", "emblic", "emblic myrobalan", "myrobalan"], "UK_English": ["Indian gooseberry"]},
+      propiedades: ["Muy rica en vitamina C y antioxidantes", "Fortalece el sistema inmunológico", "Mejora la salud del cabello y la piel", "Mejora la digestión"],
+      parteUsable: "Fruto",
+      dosis: "1-3 gramos de polvo de fruta al día",
+      preparacion: "Polvo, jugo, cápsulas, fruto fresco o seco",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Puede aumentar el riesgo de sangrado en personas con trastornos hemorrágicos." }],
+      descripcion: "Fruto de un árbol originario de la India, es una de las fuentes más ricas de vitamina C y un pilar en la medicina ayurvédica.",
+      sistemasRelacionados: ["sistema-inmunologico", "sistema-digestivo", "enfermedades-piel"],
+      categoriaId: "plantas-adaptogenas",
+      categoria: "Plantas adaptógenas",
+    },
+    {
+      id: "una-de-gato",
+      nombre: "Uña de Gato",
+      nombreCientifico: "Uncaria tomentosa",
+      propiedades: ["Fortalece el sistema inmunológico", "Antiinflamatorio", "Alivia el dolor de la artritis", "Propiedades antivirales"],
+      parteUsable: "Corteza y raíz",
+      dosis: "250-350 mg de extracto estandarizado 1-3 veces al día",
+      preparacion: "Cápsulas, extracto, té",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "No usar durante el embarazo o la lactancia." }, { tipo: "medicamentos", descripcion: "Interactúa con inmunosupresores y anticoagulantes." }],
+      descripcion: "Liana trepadora de la selva amazónica, utilizada tradicionalmente para tratar una amplia gama de dolencias, especialmente las relacionadas con la inflamación y el sistema inmune.",
+      sistemasRelacionados: ["sistema-inmunologico", "sistema-musculoesqueletico"],
+      categoriaId: "plantas-adaptogenas",
+      categoria: "Plantas adaptógenas",
+    },
+    {
+      id: "codonopsis",
+      nombre: "Codonopsis",
+      nombreCientifico: "Codonopsis pilosula",
+      nombresAlternativos: {"USA_English": ["Codonopsis", "bonnet bellflower", "poor man's ginseng"], "UK_English": ["Codonopsis"]},
+      propiedades: ["Tonifica el Qi y la sangre", "Fortalece el sistema inmunológico", "Mejora la digestión", "Combate la fatiga"],
+      parteUsable: "Raíz",
+      dosis: "6-15 gramos en decocción",
+      preparacion: "Decocción, extracto, polvo",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Generalmente segura, pero evitar en casos de resfriado o gripe aguda." }],
+      descripcion: "Conocida como el \"ginseng de los pobres\", es una raíz utilizada en la medicina tradicional china para tonificar la energía vital (Qi) y fortalecer el cuerpo.",
+      sistemasRelacionados: ["sistema-inmunologico", "sistema-digestivo", "sistema-respiratorio"],
+      categoriaId: "plantas-adaptogenas",
+      categoria: "Plantas adaptógenas",
+    },
+    {
+      id: "damiana",
+      nombre: "Damiana",
+      nombreCientifico: "Turnera diffusa",
+      propiedades: ["Afrodisíaco", "Relajante nervioso", "Tónico para el sistema nervioso", "Mejora el estado de ánimo"],
+      parteUsable: "Hojas",
+      dosis: "2-4 gramos de hojas secas en infusión, 3 veces al día",
+      preparacion: "Infusión, extracto líquido, licor",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "Evitar durante el embarazo y la lactancia." }, { tipo: "diabetes", descripcion: "Puede afectar los niveles de azúcar en sangre." }],
+      descripcion: "Arbusto aromático nativo de México, América Central y el Caribe, tradicionalmente utilizado como afrodisíaco y tónico para el sistema nervioso.",
+      sistemasRelacionados: ["sistema-nervioso", "sistema-reproductor", "sistema-urinario"],
+      categoriaId: "plantas-adaptogenas",
+      categoria: "Plantas adaptógenas",
+    },
+    {
+      id: "madreselva",
+      nombre: "Madreselva",
+      nombreCientifico: "Lonicera japonica",
+      nombresAlternativos: {"USA_English": ["Japanese honeysuckle", "golden-and-silver honeysuckle"], "UK_English": ["Japanese honeysuckle"], "España": ["Madreselva de Japón"]},
+      propiedades: ["Antiviral", "Antibacterial", "Antiinflamatorio", "Alivia el dolor de garganta"],
+      parteUsable: "Flores y tallos",
+      dosis: "6-15 gramos de flores en decocción",
+      preparacion: "Decocción, infusión",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Puede causar malestar estomacal en algunas personas." }],
+      descripcion: "Planta trepadora con flores fragantes, utilizada en la medicina tradicional china para tratar infecciones, fiebre y dolor de garganta.",
+      sistemasRelacionados: ["sistema-respiratorio", "sistema-inmunologico", "enfermedades-ojos-oidos-nariz-garganta"],
+      categoriaId: "plantas-adaptogenas",
+      categoria: "Plantas adaptógenas",
+    },
+    {
+      id: "musgo-de-irlanda",
+      nombre: "Musgo de Irlanda",
+      nombreCientifico: "Chondrus crispus",
+      nombresAlternativos: {"España": ["musgo de Irlanda", "carragaén"], "USA_English": ["Irish moss"]},
+      propiedades: ["Demulcente (alivia la irritación de las mucosas)", "Expectorante", "Nutritivo", "Apoya la salud digestiva"],
+      parteUsable: "Talo completo",
+      dosis: "4-8 gramos secos al día",
+      preparacion: "Decocción, gel, añadido a alimentos",
+      contraindicaciones: [{ tipo: "medicamentos", descripcion: "Puede afectar la absorción de otros medicamentos si se toma al mismo tiempo." }],
+      descripcion: "Alga roja que se encuentra en las costas rocosas del Atlántico Norte, rica en carragenina, que le confiere propiedades demulcentes y espesantes.",
+      sistemasRelacionados: ["sistema-respiratorio", "sistema-digestivo"],
+      categoriaId: "plantas-adaptogenas",
+      categoria: "Plantas adaptógenas",
+    },
+    {
+      id: "pasiflora",
+      nombre: "Pasiflora",
+      nombreCientifico: "Passiflora incarnata",
+      nombresAlternativos: {"España": ["flor de la pasión", "pasionaria", "granadilla"], "México": ["maracuyá", "flor de pasión"], "Argentina": ["mburucuyá", "pasionaria"], "USA_English": ["passionflower", "maypop", "purple passionflower"], "UK_English": ["passion flower"], "Indigena": ["mburucuyá"]},
+      propiedades: ["Sedante y ansiolítico", "Inductor del sueño", "Alivia los espasmos musculares", "Reduce la ansiedad"],
+      parteUsable: "Partes aéreas",
+      dosis: "4-8 gramos de hierba seca al día en infusión",
+      preparacion: "Infusión, extracto líquido, cápsulas",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "No usar durante el embarazo." }, { tipo: "medicamentos", descripcion: "Potencia el efecto de otros sedantes." }],
+      descripcion: "Planta trepadora nativa de América, conocida por sus flores exóticas y sus propiedades calmantes sobre el sistema nervioso, utilizada para tratar el insomnio y la ansiedad.",
+      sistemasRelacionados: ["sistema-nervioso", "trastornos-mentales-emocionales"],
+      categoriaId: "plantas-adaptogenas",
+      categoria: "Plantas adaptógenas",
+    },
+    {
+      id: "regaliz",
+      nombre: "Regaliz",
+      nombreCientifico: "Glycyrrhiza glabra",
+      nombresAlternativos: {"España": ["regalicia", "orozuz", "orosús", "paloduz", "palodulce", "palodul", "arrezú"], "Argentina": ["orozús"], "USA_English": ["licorice", "sweetwood", "black sugar"], "UK_English": ["liquorice"]},
+      propiedades: ["Antiinflamatorio", "Expectorante", "Apoya la salud suprarrenal", "Alivia las úlceras gástricas"],
+      parteUsable: "Raíz",
+      dosis: "1-4 gramos de raíz seca al día en decocción",
+      preparacion: "Decocción, extracto, cápsulas",
+      contraindicaciones: [{ tipo: "hipertension", descripcion: "El uso prolongado puede causar hipertensión y retención de líquidos." }, { tipo: "embarazo", descripcion: "No usar durante el embarazo." }],
+      descripcion: "Planta cuya raíz dulce se ha utilizado durante milenios tanto en la confitería como en la medicina para tratar problemas digestivos, respiratorios y suprarrenales.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-respiratorio", "sistema-endocrino"],
+      categoriaId: "plantas-adaptogenas",
+      categoria: "Plantas adaptógenas",
+    },
+    {
+      id: "albahaca",
+      nombre: "Albahaca",
+      nombreCientifico: "Ocimum basilicum",
+      nombresAlternativos: {"Mexico": ["albacar", "albacar corriente", "albacar hembra", "albacar macho", "albahaca blanca", "albahaca corriente", "albahaca de Castilla", "albahaca de la tierra", "albahaca morada", "albahaca arribeño", "orégano"], "España": ["alhábega", "alfábega", "basílico", "hierba real", "hierba de los reyes"], "USA_English": ["basil", "sweet basil"], "UK_English": ["basil", "sweet basil"]},
+      propiedades: ["Antioxidante", "Antiinflamatorio", "Reduce el estrés", "Mejora la digestión"],
+      parteUsable: "Hojas",
+      dosis: "2-4 gramos de hojas frescas al día",
+      preparacion: "Consumo directo, infusión, aceite esencial",
+      contraindicaciones: [{ tipo: "alergia", descripcion: "Puede causar reacciones alérgicas en personas sensibles." }],
+      descripcion: "Hierba aromática popular en la cocina mediterránea, también valorada por sus propiedades medicinales para aliviar el estrés y mejorar la digestión.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-nervioso"],
+      categoriaId: "plantas-adaptogenas",
+      categoria: "Plantas adaptógenas",
+    },
+    {
+      id: "centella-asiatica",
+      nombre: "Centella Asiática",
+      nombreCientifico: "Centella asiatica",
+      nombresAlternativos: {"España": ["Centella asiática", "Gotu kola"], "USA_English": ["Gotu kola", "Asiatic pennywort"], "UK_English": ["Gotu kola", "Asiatic pennywort"]},
+      propiedades: ["Mejora la memoria y la cognición", "Promueve la cicatrización", "Mejora la circulación venosa", "Reduce la ansiedad"],
+      parteUsable: "Partes aéreas",
+      dosis: "60-120 mg de extracto estandarizado al día",
+      preparacion: "Cápsulas, extracto, crema tópica",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "Evitar durante el embarazo y la lactancia." }],
+      descripcion: "También conocida como Gotu Kola, es una hierba perenne utilizada en la medicina tradicional para mejorar la función cerebral y la salud de la piel.",
+      sistemasRelacionados: ["sistema-nervioso", "enfermedades-piel", "sistema-cardiovascular"],
+      categoriaId: "plantas-adaptogenas",
+      categoria: "Plantas adaptógenas",
+    },
+    {
+      id: "atractylodes",
+      nombre: "Atractylodes",
+      nombreCientifico: "Atractylodes macrocephala",
+      nombresAlternativos: {"USA_English": ["Atractylodes", "large-headed Atractylodes"], "UK_English": ["Atractylodes"]},
+      propiedades: ["Tonifica el bazo y el Qi", "Elimina la humedad", "Fortalece el sistema digestivo", "Diurético"],
+      parteUsable: "Rizoma",
+      dosis: "6-12 gramos en decocción",
+      preparacion: "Decocción, polvo",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Evitar en casos de sequedad o deficiencia de líquidos corporales." }],
+      descripcion: "Rizoma utilizado en la medicina tradicional china para fortalecer la función digestiva, tonificar la energía y eliminar el exceso de humedad del cuerpo.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-urinario"],
+      categoriaId: "plantas-adaptogenas",
+      categoria: "Plantas adaptógenas",
+    },
+    {
+      id: "bala",
+      nombre: "Bala",
+      nombreCientifico: "Sida cordifolia",
+      nombresAlternativos: {"USA_English": ["flannel weed", "country mallow", "heart-leaf sida"], "UK_English": ["flannel weed"], "Indigena": ["bala", "ilima"]},
+      propiedades: ["Tónico general", "Aumenta la fuerza y la resistencia", "Antiinflamatorio", "Apoya la salud del sistema nervioso"],
+      parteUsable: "Raíz y planta entera",
+      dosis: "3-6 gramos de polvo al día",
+      preparacion: "Polvo, decocción, aceite medicado",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Usar con precaución, puede ser estimulante." }],
+      descripcion: "Hierba importante en Ayurveda, cuyo nombre significa \"fuerza\". Se utiliza como tónico para aumentar la energía, la resistencia y la masa muscular.",
+      sistemasRelacionados: ["sistema-musculoesqueletico", "sistema-nervioso", "sistema-respiratorio"],
+      categoriaId: "plantas-adaptogenas",
+      categoria: "Plantas adaptógenas",
+    },
+    {
+      id: "brahmi",
+      nombre: "Brahmi",
+      nombreCientifico: "Bacopa monnieri",
+      nombresAlternativos: {"USA_English": ["water hyssop", "herb of grace", "Indian pennywort"], "UK_English": ["water hyssop", "herb of grace"], "Indigena": ["brahmi"]},
+      propiedades: ["Mejora la memoria y la cognición", "Reduce el estrés y la ansiedad", "Neuroprotector", "Promueve un sueño reparador"],
+      parteUsable: "Partes aéreas",
+      dosis: "5-10 gramos de polvo de hierba al día",
+      preparacion: "Polvo, infusión, aceite medicado",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Puede causar náuseas o malestar estomacal en algunas personas." }],
+      descripcion: "Reconocida hierba ayurvédica para el cerebro, utilizada tradicionalmente para mejorar todas las facetas de la función mental y calmar el sistema nervioso.",
+      sistemasRelacionados: ["sistema-nervioso", "trastornos-mentales-emocionales"],
+      categoriaId: "plantas-adaptogenas",
+      categoria: "Plantas adaptógenas",
+    },
+    {
+      id: "guduchi",
+      nombre: "Guduchi",
+      nombreCientifico: "Tinospora cordifolia",
+      nombresAlternativos: {"USA_English": ["heart-leaved moonseed", "guduchi"], "UK_English": ["heart-leaved moonseed"], "Indigena": ["guduchi", "giloy"]},
+      propiedades: ["Inmunomodulador potente", "Desintoxicante", "Reduce la fiebre", "Antiinflamatorio"],
+      parteUsable: "Tallo",
+      dosis: "1-3 gramos de polvo de tallo al día",
+      preparacion: "Polvo, decocción, extracto",
+      contraindicaciones: [{ tipo: "medicamentos", descripcion: "Puede interactuar con inmunosupresores y medicamentos para la diabetes." }],
+      descripcion: "Planta trepadora muy venerada en Ayurveda, conocida como \"Amrita\" o néctar de la inmortalidad, por su capacidad para limpiar, rejuvenecer y fortalecer todo el organismo.",
+      sistemasRelacionados: ["sistema-inmunologico", "sistema-digestivo", "sistema-respiratorio"],
+      categoriaId: "plantas-adaptogenas",
+      categoria: "Plantas adaptógenas",
+    },
+    {
+      id: "chaga",
+      nombre: "Chaga",
+      nombreCientifico: "Inonotus obliquus",
+      nombresAlternativos: {"España": ["Chaga", "Hongo de abedul", "Nariz de carbón"], "USA_English": ["Chaga", "Clinker Fungus", "birch conk", "birch canker polypore"], "UK_English": ["Chaga", "Clinker Polypore", "Cinder conk", "Black mass and Birch canker polypore"], "Indigena": ["Tsyr"]},
+      propiedades: ["Potente antioxidante", "Fortalece el sistema inmunológico", "Antiinflamatorio", "Apoya la salud gastrointestinal"],
+      parteUsable: "Esclerocio (masa de micelio)",
+      dosis: "1-3 gramos de extracto en polvo al día",
+      preparacion: "Té, extracto, tintura",
+      contraindicaciones: [{ tipo: "medicamentos", descripcion: "Puede interactuar con anticoagulantes y medicamentos para la diabetes." }],
+      descripcion: "Hongo que crece en los abedules de climas fríos, con aspecto de carbón quemado. Es muy apreciado por su altísimo contenido de antioxidantes y sus propiedades para reforzar el sistema inmune.",
+      sistemasRelacionados: ["sistema-inmunologico", "sistema-digestivo", "enfermedades-piel"],
+      categoriaId: "plantas-adaptogenas",
+      categoria: "Plantas adaptógenas",
+    },
+    {
+      id: "ginseng-americano",
+      nombre: "Ginseng Americano",
+      nombreCientifico: "Panax quinquefolius",
+      nombresAlternativos: {"USA_English": ["American ginseng", "sang"], "UK_English": ["American ginseng"]},
+      propiedades: ["Reduce el estrés", "Mejora la memoria", "Apoya el sistema inmunológico", "Ayuda a regular el azúcar en sangre"],
+      parteUsable: "Raíz",
+      dosis: "200-400 mg de extracto al día",
+      preparacion: "Cápsulas, extracto, té",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "No recomendado durante el embarazo." }, { tipo: "medicamentos", descripcion: "Interactúa con anticoagulantes como la warfarina." }],
+      descripcion: "Variedad de ginseng nativa de América del Norte. A diferencia del ginseng asiático, se considera más calmante y menos estimulante, ideal para combatir el estrés sin sobreexcitar.",
+      sistemasRelacionados: ["sistema-nervioso", "sistema-inmunologico", "sistema-endocrino"],
+      categoriaId: "plantas-adaptogenas",
+      categoria: "Plantas adaptógenas",
+    },
+    {
+      id: "shatavari",
+      nombre: "Shatavari",
+      nombreCientifico: "Asparagus racemosus",
+      nombresAlternativos: {"USA_English": ["buttermilk root", "climbing asparagus", "water root", "wild asparagus"], "UK_English": ["Shatavari"], "Indigena": ["shatavari", "satawar", "satamuli"]},
+      propiedades: ["Tónico reproductor femenino", "Apoya la lactancia", "Calma el tracto digestivo", "Inmunomodulador"],
+      parteUsable: "Raíz",
+      dosis: "500-1000 mg de extracto de raíz, 2 veces al día",
+      preparacion: "Polvo, cápsulas, decocción",
+      contraindicaciones: [{ tipo: "alergia", descripcion: "Personas alérgicas a los espárragos deben evitarla." }],
+      descripcion: "Considerada la principal hierba rejuvenecedora para las mujeres en Ayurveda. Apoya la salud reproductiva en todas las etapas de la vida, desde la menstruación hasta la menopausia.",
+      sistemasRelacionados: ["sistema-reproductor", "sistema-digestivo", "sistema-inmunologico"],
+      categoriaId: "plantas-adaptogenas",
+      categoria: "Plantas adaptógenas",
+    },
+    {
+      id: "tribulus",
+      nombre: "Tribulus",
+      nombreCientifico: "Tribulus terrestris",
+      nombresAlternativos: {"USA_English": ["goathead", "puncturevine", "bull's head"], "UK_English": ["goathead", "puncturevine"]},
+      propiedades: ["Aumenta la libido", "Mejora el rendimiento deportivo", "Apoya la salud del tracto urinario", "Tónico general"],
+      parteUsable: "Fruto y raíz",
+      dosis: "250-750 mg de extracto estandarizado al día",
+      preparacion: "Cápsulas, extracto",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "No usar durante el embarazo o la lactancia." }, { tipo: "otro", descripcion: "Puede agravar condiciones de próstata." }],
+      descripcion: "Planta que crece en climas secos, utilizada en la medicina tradicional china y ayurvédica para aumentar la vitalidad, la libido y el rendimiento físico.",
+      sistemasRelacionados: ["sistema-reproductor", "sistema-urinario", "sistema-musculoesqueletico"],
+      categoriaId: "plantas-adaptogenas",
+      categoria: "Plantas adaptógenas",
+    },
+    {
+      id: "ginkgo-biloba",
+      nombre: "Ginkgo Biloba",
+      nombreCientifico: "Ginkgo biloba",
+      nombresAlternativos: {"España": ["ginkgo", "árbol de los 40 escudos", "nogal del Japón"], "USA_English": ["ginkgo", "maidenhair tree"], "UK_English": ["ginkgo", "maidenhair tree"]},
+      propiedades: ["Mejora la circulación cerebral", "Potencia la memoria y la concentración", "Antioxidante", "Alivia los síntomas del vértigo"],
+      parteUsable: "Hojas",
+      dosis: "120-240 mg de extracto estandarizado al día, dividido en 2-3 dosis",
+      preparacion: "Cápsulas, extracto líquido",
+      contraindicaciones: [{ tipo: "medicamentos", descripcion: "Aumenta el riesgo de sangrado si se toma con anticoagulantes." }, { tipo: "otro", descripcion: "No tomar antes de una cirugía." }],
+      descripcion: "Uno de los árboles más antiguos del mundo, sus hojas se utilizan para mejorar la circulación sanguínea, especialmente en el cerebro, mejorando así la memoria y la función cognitiva.",
+      sistemasRelacionados: ["sistema-nervioso", "sistema-cardiovascular", "enfermedades-ojos-oidos-nariz-garganta"],
+      categoriaId: "plantas-adaptogenas",
+      categoria: "Plantas adaptógenas",
+    },
+  ],
+};
+
+export default categoria;
@@ -0,0 +1,386 @@
+// Generado automáticamente por scripts/build-catalog.py - no editar a mano
+import type { CategoriaPlanta } from '../../plantas-expandidas';
+
+const categoria: CategoriaPlanta = {
+  id: "plantas-suculentas-y-cactus-medicinales",
+  nombre: "Plantas suculentas y cactus medicinales",
+  plantas: [
+    {
+      id: "aloe-vera",
+      nombre: "Aloe Vera",
+      nombreCientifico: "Aloe barbadensis miller",
+      nombresAlternativos: {"España": ["Aloe vera", "Sábila", "Acíbar"], "Mexico": ["Sábila"], "Colombia": ["Sábila", "Aloe de Curazao"], "Peru": ["Sábila"], "Caribe": ["Sábila", "Aloe de Barbados"], "USA_English": ["Aloe vera", "Barbados aloe"], "UK_English": ["Aloe vera", "Barbados aloe"]},
+      propiedades: ["Cicatrizante", "Antiinflamatorio", "Hidratante", "Antiséptico", "Laxante"],
+      parteUsable: "Gel de las hojas",
+      dosis: "Aplicación tópica según necesidad. 1-2 cucharadas de gel por vía oral al día.",
+      preparacion: "Extracción directa del gel de las hojas para uso tópico. Licuado del gel para consumo oral.",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "No se recomienda su consumo oral durante el embarazo." }, { tipo: "lactancia", descripcion: "Puede pasar a la leche materna y causar diarrea en el lactante." }, { tipo: "ninos", descripcion: "No administrar por vía oral a niños menores de 12 años." }],
+      descripcion: "Planta suculenta muy conocida por el gel de sus hojas, que tiene numerosas propiedades medicinales, especialmente para la piel.",
+      sistemasRelacionados: ["enfermedades-piel", "sistema-digestivo", "sistema-inmunologico"],
+      categoriaId: "plantas-suculentas-y-cactus-medicinales",
+      categoria: "Plantas suculentas y cactus medicinales",
+    },
+    {
+      id: "nopal",
+      nombre: "Nopal",
+      nombreCientifico: "Opuntia ficus-indica",
+      nombresAlternativos: {"España": ["nopal", "higuera de pala", "palera", "pera de cactus", "penca", "tuna", "tuno", "tunera", "chumbera", "higo de las Indias"], "Mexico": ["nopal", "tuna"], "USA_English": ["prickly pear", "Indian fig opuntia", "barbary fig", "cactus pear", "spineless cactus"], "UK_English": ["prickly pear", "Indian fig opuntia", "barbary fig"]},
+      propiedades: ["Hipoglucemiante", "Hipolipemiante", "Antiinflamatorio", "Antioxidante", "Digestivo"],
+      parteUsable: "Cladodios (pencas) y frutos (tunas)",
+      dosis: "1-2 pencas al día. 1-3 tunas al día.",
+      preparacion: "Asado, cocido, en licuados o en ensaladas. El fruto se consume fresco.",
+      contraindicaciones: [{ tipo: "diabetes", descripcion: "Puede potenciar el efecto de los medicamentos para la diabetes, se recomienda supervisión médica." }],
+      descripcion: "Cactus muy popular en la gastronomía mexicana, con importantes propiedades para regular el azúcar y el colesterol en sangre.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-cardiovascular", "sistema-endocrino"],
+      categoriaId: "plantas-suculentas-y-cactus-medicinales",
+      categoria: "Plantas suculentas y cactus medicinales",
+    },
+    {
+      id: "pitaya",
+      nombre: "Pitaya",
+      nombreCientifico: "Hylocereus undatus",
+      nombresAlternativos: {"España": ["pitahaya", "pitaya", "fruta del dragón"], "Mexico": ["pitahaya", "pitajaya", "pitaya de mayo", "pitaya xoconostle"], "Colombia": ["pitahaya amarilla", "pitahaya roja"], "Centroamerica": ["pitahaya"], "USA_English": ["dragon fruit", "pitahaya", "night-blooming cereus", "strawberry pear"], "UK_English": ["dragon fruit", "pitahaya"]},
+      propiedades: ["Antioxidante", "Digestiva", "Antiinflamatoria", "Refrescante"],
+      parteUsable: "Fruto",
+      dosis: "1-2 frutos al día.",
+      preparacion: "Consumo directo del fruto fresco.",
+      contraindicaciones: [],
+      descripcion: "Fruta exótica conocida como fruta del dragón, rica en antioxidantes y fibra, beneficiosa para la digestión y la salud en general.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-inmunologico", "sistema-cardiovascular"],
+      categoriaId: "plantas-suculentas-y-cactus-medicinales",
+      categoria: "Plantas suculentas y cactus medicinales",
+    },
+    {
+      id: "siempreviva",
+      nombre: "Siempreviva",
+      nombreCientifico: "Sempervivum tectorum",
+      nombresAlternativos: {"España": ["siempreviva", "siempreviva mayor", "barba de Júpiter", "consolva", "alcachofa de gatos", "hierba puntera", "piñuela", "zurracayoye", "hierba de todo el año"], "USA_English": ["houseleek", "liveforever", "hen and chicks"], "UK_English": ["houseleek", "liveforever", "hen and chicks"]},
+      propiedades: ["Antiinflamatoria", "Cicatrizante", "Analgésica", "Antiséptica"],
+      parteUsable: "Hojas",
+      dosis: "Aplicación tópica del jugo de las hojas.",
+      preparacion: "Machacar las hojas y aplicar el jugo sobre la zona afectada.",
+      contraindicaciones: [],
+      descripcion: "Planta suculenta que crece en forma de roseta, utilizada tradicionalmente para aliviar dolores y curar heridas.",
+      sistemasRelacionados: ["enfermedades-piel", "sistema-musculoesqueletico"],
+      categoriaId: "plantas-suculentas-y-cactus-medicinales",
+      categoria: "Plantas suculentas y cactus medicinales",
+    },
+    {
+      id: "kalanchoe",
+      nombre: "Kalanchoe",
+      nombreCientifico: "Kalanchoe pinnata",
+      nombresAlternativos: {"España": ["kalanchoe", "hoja del aire", "yerba bruja", "libertadora", "admirable", "amor", "belladona", "bolsita", "bruja", "flor de arete", "flor fresca", "hierba maravillosa", "hierba de la lechuza", "hoja fresca", "hoja vidriosa"], "USA_English": ["cathedral bells", "air plant", "miracle leaf", "life plant", "Goethe plant"], "UK_English": ["cathedral bells", "air plant", "miracle leaf"]},
+      propiedades: ["Antiinflamatoria", "Analgésica", "Antitumoral", "Antiséptica"],
+      parteUsable: "Hojas",
+      dosis: "Infusión de 1-2 hojas en una taza de agua, 2 veces al día.",
+      preparacion: "Infusión de las hojas.",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "No se recomienda su consumo durante el embarazo." }],
+      descripcion: "Planta suculenta con hojas carnosas, utilizada en la medicina tradicional para tratar diversas dolencias, incluyendo tumores.",
+      sistemasRelacionados: ["sistema-inmunologico", "enfermedades-piel", "sistema-respiratorio"],
+      categoriaId: "plantas-suculentas-y-cactus-medicinales",
+      categoria: "Plantas suculentas y cactus medicinales",
+    },
+    {
+      id: "agave",
+      nombre: "Agave",
+      nombreCientifico: "Agave americana",
+      nombresAlternativos: {"Mexico": ["Agave", "Maguey"], "USA_English": ["Agave", "American aloe"], "UK_English": ["Agave", "American aloe"]},
+      propiedades: ["Antiinflamatoria", "Antiséptica", "Digestiva", "Diurética"],
+      parteUsable: "Savia y hojas",
+      dosis: "1 cucharada de savia al día.",
+      preparacion: "Extracción de la savia (aguamiel) para consumo directo. Infusión de las hojas.",
+      contraindicaciones: [{ tipo: "diabetes", descripcion: "El sirope de agave tiene un alto contenido de fructosa, consumir con moderación." }],
+      descripcion: "Planta suculenta de gran tamaño, de la que se extrae el aguamiel y se elabora el pulque y el tequila. Tiene propiedades medicinales.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-urinario"],
+      categoriaId: "plantas-suculentas-y-cactus-medicinales",
+      categoria: "Plantas suculentas y cactus medicinales",
+    },
+    {
+      id: "peyote",
+      nombre: "Peyote",
+      nombreCientifico: "Lophophora williamsii",
+      nombresAlternativos: {"Mexico": ["peyote", "mescal"], "USA_English": ["peyote", "devil's root", "divine cactus", "dumpling cactus", "mescal buttons"], "UK_English": ["peyote"]},
+      propiedades: ["Alucinógeno", "Analgésico", "Antibacteriano"],
+      parteUsable: "Botones del cactus",
+      dosis: "Microdosis bajo supervisión especializada.",
+      preparacion: "Consumo directo de los botones secos o frescos.",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Su uso está regulado en muchos países debido a sus efectos psicoactivos. No consumir sin supervisión experta." }],
+      descripcion: "Cactus sin espinas conocido por sus propiedades alucinógenas debido a la mescalina. Utilizado en ceremonias rituales.",
+      sistemasRelacionados: ["trastornos-mentales-emocionales", "sistema-nervioso"],
+      categoriaId: "plantas-suculentas-y-cactus-medicinales",
+      categoria: "Plantas suculentas y cactus medicinales",
+    },
+    {
+      id: "sabila",
+      nombre: "Sábila",
+      nombreCientifico: "Aloe vera",
+      nombresAlternativos: {"España": ["aloe vera", "sábila", "acíbar", "apabila", "azabila", "babosa", "gamonita", "pita perfoliada", "pita zabila", "pitazábila", "zabida", "zabila", "zabin", "yerba babosa"], "Mexico": ["sábila"], "USA_English": ["aloe vera"], "UK_English": ["aloe vera"]},
+      propiedades: ["Cicatrizante", "Antiinflamatorio", "Hidratante", "Antiséptico", "Laxante"],
+      parteUsable: "Gel de las hojas",
+      dosis: "Aplicación tópica según necesidad. 1-2 cucharadas de gel por vía oral al día.",
+      preparacion: "Extracción directa del gel de las hojas para uso tópico. Licuado del gel para consumo oral.",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "No se recomienda su consumo oral durante el embarazo." }, { tipo: "lactancia", descripcion: "Puede pasar a la leche materna y causar diarrea en el lactante." }, { tipo: "ninos", descripcion: "No administrar por vía oral a niños menores de 12 años." }],
+      descripcion: "Nombre común para el Aloe Vera, planta suculenta muy conocida por el gel de sus hojas, que tiene numerosas propiedades medicinales, especialmente para la piel.",
+      sistemasRelacionados: ["enfermedades-piel", "sistema-digestivo", "sistema-inmunologico"],
+      categoriaId: "plantas-suculentas-y-cactus-medicinales",
+      categoria: "Plantas suculentas y cactus medicinales",
+    },
+    {
+      id: "organo",
+      nombre: "Órgano",
+      nombreCientifico: "Pachycereus marginatus",
+      nombresAlternativos: {"Mexico": ["órgano", "chilayo"], "USA_English": ["organ pipe cactus", "Mexican fence post"], "UK_English": ["organ pipe cactus"]},
+      propiedades: ["Antiinflamatorio", "Analgésico", "Cicatrizante"],
+      parteUsable: "Tallo",
+      dosis: "Aplicación tópica de la pulpa.",
+      preparacion: "Machacar la pulpa del tallo y aplicar como cataplasma.",
+      contraindicaciones: [],
+      descripcion: "Cactus columnar de gran tamaño, utilizado tradicionalmente para aliviar dolores e inflamaciones.",
+      sistemasRelacionados: ["sistema-musculoesqueletico", "enfermedades-piel"],
+      categoriaId: "plantas-suculentas-y-cactus-medicinales",
+      categoria: "Plantas suculentas y cactus medicinales",
+    },
+    {
+      id: "chumbera",
+      nombre: "Chumbera",
+      nombreCientifico: "Opuntia ficus-indica",
+      nombresAlternativos: {"España": ["chumbera", "higuera de chumbo", "pita", "higuera de pala", "palera", "nopal", "tuna", "tuno", "tunera", "higo de las Indias", "cardón", "chumbo", "chumbua", "higo chumbo", "higo de pala", "higo México", "nopal de Castilla"], "Mexico": ["nopal", "tuna"], "USA_English": ["prickly pear", "Indian fig opuntia", "barbary fig", "cactus pear", "spineless cactus"], "UK_English": ["prickly pear", "Indian fig opuntia", "barbary fig"]},
+      propiedades: ["Hipoglucemiante", "Hipolipemiante", "Antiinflamatorio", "Antioxidante", "Digestivo"],
+      parteUsable: "Cladodios (pencas) y frutos (higos chumbos)",
+      dosis: "1-2 pencas al día. 1-3 higos chumbos al día.",
+      preparacion: "Asado, cocido, en licuados o en ensaladas. El fruto se consume fresco.",
+      contraindicaciones: [{ tipo: "diabetes", descripcion: "Puede potenciar el efecto de los medicamentos para la diabetes, se recomienda supervisión médica." }],
+      descripcion: "Nombre común para el Nopal, cactus muy popular en la gastronomía mediterránea, con importantes propiedades para regular el azúcar y el colesterol en sangre.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-cardiovascular", "sistema-endocrino"],
+      categoriaId: "plantas-suculentas-y-cactus-medicinales",
+      categoria: "Plantas suculentas y cactus medicinales",
+    },
+    {
+      id: "echeveria",
+      nombre: "Echeveria",
+      nombreCientifico: "Echeveria elegans",
+      nombresAlternativos: {"España": ["echeveria", "rosa de alabastro", "echeverio"], "Mexico": ["echeveria"], "USA_English": ["Mexican snowball", "white Mexican rose"], "UK_English": ["Mexican snowball"]},
+      propiedades: ["Antiinflamatoria", "Cicatrizante", "Refrescante"],
+      parteUsable: "Hojas",
+      dosis: "Aplicación tópica del jugo de las hojas.",
+      preparacion: "Machacar las hojas y aplicar el jugo sobre la piel.",
+      contraindicaciones: [],
+      descripcion: "Planta suculenta ornamental con hojas carnosas en forma de roseta. Se le atribuyen propiedades antiinflamatorias y cicatrizantes.",
+      sistemasRelacionados: ["enfermedades-piel"],
+      categoriaId: "plantas-suculentas-y-cactus-medicinales",
+      categoria: "Plantas suculentas y cactus medicinales",
+    },
+    {
+      id: "sedum",
+      nombre: "Sedum",
+      nombreCientifico: "Sedum acre",
+      nombresAlternativos: {"España": ["sedum", "pampajarito", "pan de cuco", "uva de gato", "uva de perro", "vermicular", "siempreviva picante"], "USA_English": ["goldmoss stonecrop", "mossy stonecrop", "goldmoss sedum", "biting stonecrop", "wallpepper"], "UK_English": ["goldmoss stonecrop", "mossy stonecrop", "biting stonecrop", "wallpepper"]},
+      propiedades: ["Cicatrizante", "Antiinflamatorio", "Analgésico"],
+      parteUsable: "Hojas",
+      dosis: "Aplicación tópica del jugo de las hojas.",
+      preparacion: "Machacar las hojas y aplicar el jugo sobre la piel.",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Puede ser irritante para algunas personas, realizar una prueba de sensibilidad." }],
+      descripcion: "Planta suculenta rastrera con pequeñas hojas carnosas. Se utiliza para tratar heridas y quemaduras leves.",
+      sistemasRelacionados: ["enfermedades-piel"],
+      categoriaId: "plantas-suculentas-y-cactus-medicinales",
+      categoria: "Plantas suculentas y cactus medicinales",
+    },
+    {
+      id: "yucca",
+      nombre: "Yucca",
+      nombreCientifico: "Yucca filamentosa",
+      nombresAlternativos: {"España": ["yuca", "yuca deshilachada", "aguja de Adán", "bayoneta española", "palma aguja"], "USA_English": ["yucca", "Adam's needle", "Spanish bayonet", "needle palm", "spoon-leaf yucca", "common yucca", "beargrass", "silk grass"], "UK_English": ["yucca", "Adam's needle"]},
+      propiedades: ["Antiinflamatoria", "Analgésica", "Antioxidante"],
+      parteUsable: "Raíz",
+      dosis: "Infusión de 1 cucharadita de raíz seca en una taza de agua, 2 veces al día.",
+      preparacion: "Infusión de la raíz.",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "No se recomienda su consumo durante el embarazo." }],
+      descripcion: "Planta suculenta con hojas en forma de espada y una alta concentración de saponinas, que le confieren propiedades antiinflamatorias.",
+      sistemasRelacionados: ["sistema-musculoesqueletico", "sistema-inmunologico"],
+      categoriaId: "plantas-suculentas-y-cactus-medicinales",
+      categoria: "Plantas suculentas y cactus medicinales",
+    },
+    {
+      id: "san-pedro",
+      nombre: "San Pedro",
+      nombreCientifico: "Echinopsis pachanoi",
+      nombresAlternativos: {"Peru": ["San Pedro", "achuma", "huachuma", "wachuma", "aguacolla", "hahuacollay", "lapituq", "tsuná"], "USA_English": ["San Pedro cactus"], "UK_English": ["San Pedro cactus"]},
+      propiedades: ["Alucinógeno", "Analgésico", "Antibacteriano"],
+      parteUsable: "Tallo",
+      dosis: "Microdosis bajo supervisión especializada.",
+      preparacion: "Decocción del tallo.",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Su uso está regulado en muchos países debido a sus efectos psicoactivos. No consumir sin supervisión experta." }],
+      descripcion: "Cactus columnar con propiedades alucinógenas similares al peyote, utilizado en la medicina tradicional andina.",
+      sistemasRelacionados: ["trastornos-mentales-emocionales", "sistema-nervioso"],
+      categoriaId: "plantas-suculentas-y-cactus-medicinales",
+      categoria: "Plantas suculentas y cactus medicinales",
+    },
+    {
+      id: "fenestraria",
+      nombre: "Fenestraria",
+      nombreCientifico: "Fenestraria rhopalophylla",
+      nombresAlternativos: {"España": ["fenestraria", "planta ventana", "dedos de bebé"], "USA_English": ["baby toes", "window plant"], "UK_English": ["baby toes", "window plant"]},
+      propiedades: ["Hidratante", "Refrescante"],
+      parteUsable: "Hojas",
+      dosis: "Aplicación tópica del jugo de las hojas.",
+      preparacion: "Machacar las hojas y aplicar el jugo sobre la piel.",
+      contraindicaciones: [],
+      descripcion: "Planta suculenta con hojas translúcidas que parecen ventanas. Se utiliza para hidratar y refrescar la piel.",
+      sistemasRelacionados: ["enfermedades-piel"],
+      categoriaId: "plantas-suculentas-y-cactus-medicinales",
+      categoria: "Plantas suculentas y cactus medicinales",
+    },
+    {
+      id: "lithops",
+      nombre: "Lithops",
+      nombreCientifico: "Lithops spp.",
+      nombresAlternativos: {"USA_English": ["living stones", "pebble plants"], "UK_English": ["living stones", "pebble plants"], "España": ["Piedras vivas", "Piedras vivientes", "Cacto piedra", "Cactus piedra", "Plantas piedra"], "Indigena": ["beeskloutjie", "skaappootjie", "perdeklou"]},
+      propiedades: ["Hidratante", "Refrescante"],
+      parteUsable: "Hojas",
+      dosis: "Aplicación tópica del jugo de las hojas.",
+      preparacion: "Machacar las hojas y aplicar el jugo sobre la piel.",
+      contraindicaciones: [],
+      descripcion: "Plantas suculentas conocidas como 'piedras vivientes' por su apariencia. Se les atribuyen propiedades hidratantes.",
+      sistemasRelacionados: ["enfermedades-piel"],
+      categoriaId: "plantas-suculentas-y-cactus-medicinales",
+      categoria: "Plantas suculentas y cactus medicinales",
+    },
+    {
+      id: "gasteria",
+      nombre: "Gasteria",
+      nombreCientifico: "Gasteria spp.",
+      nombresAlternativos: {"USA_English": ["ox-tongue", "cow-tongue", "lawyer's tongue"], "UK_English": ["ox-tongue", "cow-tongue", "lawyer's tongue"], "España": ["Lengua de buey", "Lengua de vaca", "Lengua de suegra"]},
+      propiedades: ["Antiinflamatoria", "Cicatrizante"],
+      parteUsable: "Hojas",
+      dosis: "Aplicación tópica del jugo de las hojas.",
+      preparacion: "Machacar las hojas y aplicar el jugo sobre la piel.",
+      contraindicaciones: [],
+      descripcion: "Planta suculenta con hojas gruesas y moteadas. Se utiliza de forma similar al Aloe Vera para tratar problemas de piel.",
+      sistemasRelacionados: ["enfermedades-piel"],
+      categoriaId: "plantas-suculentas-y-cactus-medicinales",
+      categoria: "Plantas suculentas y cactus medicinales",
+    },
+    {
+      id: "haworthia",
+      nombre: "Haworthia",
+      nombreCientifico: "Haworthia spp.",
+      nombresAlternativos: {"USA_English": ["Zebra plant", "Pearly dots", "Star window plant", "Fairy washboard"], "UK_English": ["Zebra plant", "Pearly dots", "Star window plant", "Fairy washboard"]},
+      propiedades: ["Antiinflamatoria", "Cicatrizante"],
+      parteUsable: "Hojas",
+      dosis: "Aplicación tópica del jugo de las hojas.",
+      preparacion: "Machacar las hojas y aplicar el jugo sobre la piel.",
+      contraindicaciones: [],
+      descripcion: "Planta suculenta pequeña con hojas en roseta, a menudo con bandas o manchas blancas. Se utiliza para tratar heridas y quemaduras.",
+      sistemasRelacionados: ["enfermedades-piel"],
+      categoriaId: "plantas-suculentas-y-cactus-medicinales",
+      categoria: "Plantas suculentas y cactus medicinales",
+    },
+    {
+      id: "crassula",
+      nombre: "Crassula",
+      nombreCientifico: "Crassula ovata",
+      nombresAlternativos: {"USA_English": ["jade plant", "friendship tree", "lucky plant", "money plant"], "UK_English": ["jade plant", "friendship tree", "lucky plant", "money plant"], "España": ["Planta de jade", "Árbol de jade"]},
+      propiedades: ["Antiinflamatoria", "Antiséptica"],
+      parteUsable: "Hojas",
+      dosis: "Aplicación tópica del jugo de las hojas.",
+      preparacion: "Machacar las hojas y aplicar el jugo sobre la piel.",
+      contraindicaciones: [],
+      descripcion: "Planta suculenta conocida como 'árbol de jade'. Se utiliza en la medicina tradicional para tratar verrugas y otras afecciones de la piel.",
+      sistemasRelacionados: ["enfermedades-piel"],
+      categoriaId: "plantas-suculentas-y-cactus-medicinales",
+      categoria: "Plantas suculentas y cactus medicinales",
+    },
+    {
+      id: "senecio",
+      nombre: "Senecio",
+      nombreCientifico: "Senecio rowleyanus",
+      nombresAlternativos: {"USA_English": ["string of pearls", "string of beads"], "UK_English": ["string of pearls", "string of beads"], "España": ["Rosario de perlas", "Planta del rosario"]},
+      propiedades: ["Antiinflamatoria", "Analgésica"],
+      parteUsable: "Hojas",
+      dosis: "Aplicación tópica del jugo de las hojas.",
+      preparacion: "Machacar las hojas y aplicar el jugo sobre la piel.",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Algunas especies de Senecio son tóxicas, usar con precaución." }],
+      descripcion: "Planta suculenta colgante con hojas en forma de perlas. Se utiliza para aliviar dolores e inflamaciones.",
+      sistemasRelacionados: ["sistema-musculoesqueletico", "enfermedades-piel"],
+      categoriaId: "plantas-suculentas-y-cactus-medicinales",
+      categoria: "Plantas suculentas y cactus medicinales",
+    },
+    {
+      id: "euphorbia",
+      nombre: "Euphorbia",
+      nombreCientifico: "Euphorbia tirucalli",
+      nombresAlternativos: {"USA_English": ["pencil tree", "Indian tree spurge", "naked lady", "milk bush"], "UK_English": ["pencil tree", "Indian tree spurge", "naked lady", "milk bush"], "España": ["Árbol de los dedos", "Arbusto de leche"]},
+      propiedades: ["Antiviral", "Antitumoral", "Analgésica"],
+      parteUsable: "Látex",
+      dosis: "Aplicación tópica con extrema precaución.",
+      preparacion: "Aplicación directa del látex sobre la zona afectada.",
+      contraindicaciones: [{ tipo: "otro", descripcion: "El látex es cáustico y puede causar irritación severa. No ingerir." }],
+      descripcion: "Planta suculenta con tallos cilíndricos y un látex blanco y tóxico. Se investigan sus propiedades antitumorales.",
+      sistemasRelacionados: ["sistema-inmunologico", "enfermedades-piel"],
+      categoriaId: "plantas-suculentas-y-cactus-medicinales",
+      categoria: "Plantas suculentas y cactus medicinales",
+    },
+    {
+      id: "stapelia",
+      nombre: "Stapelia",
+      nombreCientifico: "Stapelia gigantea",
+      nombresAlternativos: {"USA_English": ["carrion plant", "toad plant", "starfish flower"], "UK_English": ["carrion plant", "toad plant", "starfish flower"], "España": ["Flor de carroña", "Estrella de mar"]},
+      propiedades: ["Antiinflamatoria", "Analgésica"],
+      parteUsable: "Tallo",
+      dosis: "Aplicación tópica de la pulpa.",
+      preparacion: "Machacar la pulpa del tallo y aplicar como cataplasma.",
+      contraindicaciones: [],
+      descripcion: "Planta suculenta con flores grandes y malolientes. Se utiliza para aliviar dolores e inflamaciones.",
+      sistemasRelacionados: ["sistema-musculoesqueletico"],
+      categoriaId: "plantas-suculentas-y-cactus-medicinales",
+      categoria: "Plantas suculentas y cactus medicinales",
+    },
+    {
+      id: "hoodia",
+      nombre: "Hoodia",
+      nombreCientifico: "Hoodia gordonii",
+      nombresAlternativos: {"USA_English": ["Bushman's hat"], "UK_English": ["Bushman's hat"], "Indigena": ["xhoba", "ghaap"]},
+      propiedades: ["Anorexígena", "Supresora del apetito"],
+      parteUsable: "Tallo",
+      dosis: "Extracto estandarizado según indicación del fabricante.",
+      preparacion: "Consumo del extracto en cápsulas o comprimidos.",
+      contraindicaciones: [{ tipo: "otro", descripcion: "No se recomienda su uso sin supervisión médica." }],
+      descripcion: "Planta suculenta originaria de Sudáfrica, conocida por su capacidad para suprimir el apetito.",
+      sistemasRelacionados: ["sistema-endocrino", "trastornos-mentales-emocionales"],
+      categoriaId: "plantas-suculentas-y-cactus-medicinales",
+      categoria: "Plantas suculentas y cactus medicinales",
+    },
+    {
+      id: "caralluma",
+      nombre: "Caralluma",
+      nombreCientifico: "Caralluma fimbriata",
+      nombresAlternativos: {"Indigena": ["makada singi", "mangana kodu", "choong", "kalli moolian", "karallamu"]},
+      propiedades: ["Anorexígena", "Supresora del apetito", "Energizante"],
+      parteUsable: "Tallo",
+      dosis: "Extracto estandarizado según indicación del fabricante.",
+      preparacion: "Consumo del extracto en cápsulas o comprimidos.",
+      contraindicaciones: [{ tipo: "otro", descripcion: "No se recomienda su uso sin supervisión médica." }],
+      descripcion: "Planta suculenta utilizada en la India para suprimir el apetito y aumentar la resistencia.",
+      sistemasRelacionados: ["sistema-endocrino", "trastornos-mentales-emocionales"],
+      categoriaId: "plantas-suculentas-y-cactus-medicinales",
+      categoria: "Plantas suculentas y cactus medicinales",
+    },
+    {
+      id: "opuntia-streptacantha",
+      nombre: "Opuntia streptacantha",
+      nombreCientifico: "Opuntia streptacantha",
+      nombresAlternativos: {"USA_English": ["prickly pear cactus", "nopal"], "UK_English": ["prickly pear cactus"], "Mexico": ["Nopal cardón", "Tuna cardona"]},
+      propiedades: ["Antiinflamatoria", "Analgésica", "Digestiva"],
+      parteUsable: "Cladodios (pencas)",
+      dosis: "1-2 pencas al día.",
+      preparacion: "Asado, cocido, en licuados o en ensaladas.",
+      contraindicaciones: [],
+      descripcion: "Especie de nopal utilizada en la medicina tradicional mexicana para tratar problemas digestivos y dolores.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-musculoesqueletico"],
+      categoriaId: "plantas-suculentas-y-cactus-medicinales",
+      categoria: "Plantas suculentas y cactus medicinales",
+    },
+  ],
+};
+
+export default categoria;
@@ -0,0 +1,756 @@
+// Generado automáticamente por scripts/build-catalog.py - no editar a mano
+import type { CategoriaPlanta } from '../../plantas-expandidas';
+
+const categoria: CategoriaPlanta = {
+  id: "plantas-tropicales-medicinales",
+  nombre: "Plantas tropicales medicinales",
+  plantas: [
+    {
+      id: "aloe-vera",
+      nombre: "Aloe Vera",
+      nombreCientifico: "Aloe barbadensis miller",
+      nombresAlternativos: {"España": ["Aloe vera", "Sábila", "Acíbar"], "Mexico": ["Sábila"], "Colombia": ["Sábila", "Aloe de Curazao"], "Peru": ["Sábila"], "Caribe": ["Sábila", "Aloe de Barbados"], "USA_English": ["Aloe vera", "Barbados aloe"], "UK_English": ["Aloe vera", "Barbados aloe"]},
+      propiedades: ["Cicatrizante", "Antiinflamatoria", "Hidratante", "Antiséptica"],
+      parteUsable: "Gel de las hojas",
+      dosis: "Aplicación tópica según necesidad. Ingesta: 25-50 ml de jugo al día.",
+      preparacion: "Uso directo del gel, jugos, cremas y lociones.",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "No se recomienda su consumo oral durante el embarazo." }, { tipo: "lactancia", descripcion: "Puede pasar a la leche materna y causar diarrea en el lactante." }],
+      descripcion: "Planta suculenta conocida por su gel, utilizado para tratar afecciones de la piel y problemas digestivos.",
+      sistemasRelacionados: ["enfermedades-piel", "sistema-digestivo", "sistema-inmunologico"],
+      categoriaId: "plantas-tropicales-medicinales",
+      categoria: "Plantas tropicales medicinales",
+    },
+    {
+      id: "jengibre",
+      nombre: "Jengibre",
+      nombreCientifico: "Zingiber officinale",
+      nombresAlternativos: {"Perú": ["kion"], "Filipinas": ["luya"], "Colombia": ["ajengible", "ajengibre", "ajingible", "anjengibre"], "USA_English": ["common ginger", "ginger"], "UK_English": ["ginger"], "India": ["adrak"], "China": ["sheng jiang"], "Japón": ["shoga"]},
+      propiedades: ["Antiinflamatorio", "Antiemético", "Digestivo", "Antioxidante"],
+      parteUsable: "Rizoma (raíz)",
+      dosis: "1-3 gramos de raíz fresca al día, o en infusión.",
+      preparacion: "Infusión, decocción, en polvo, fresco en comidas.",
+      contraindicaciones: [{ tipo: "hipertension", descripcion: "Puede interactuar con medicamentos para la presión arterial." }, { tipo: "medicamentos", descripcion: "Precaución con anticoagulantes." }],
+      descripcion: "Raíz con un sabor picante y aromático, utilizada para aliviar náuseas, mejorar la digestión y reducir la inflamación.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-respiratorio", "sistema-inmunologico"],
+      categoriaId: "plantas-tropicales-medicinales",
+      categoria: "Plantas tropicales medicinales",
+    },
+    {
+      id: "curcuma",
+      nombre: "Cúrcuma",
+      nombreCientifico: "Curcuma longa",
+      nombresAlternativos: {"Cuba": ["polluelo", "azafrán cimarrón", "yuquilla"], "Puerto Rico": ["turmérico", "jengibrillo"], "Perú": ["palillo cholón", "palillo chuncho", "guisador", "palillo"], "Colombia": ["azafrán", "azafrán cimarrón", "curcuma", "cúrcuma", "guisador"], "USA_English": ["common turmeric", "turmeric", "Indian saffron", "golden herb", "yellow ginger saffron"], "UK_English": ["turmeric"], "Indigena": ["haldi (Hindi)"]},
+      propiedades: ["Antiinflamatoria", "Antioxidante", "Hepatoprotectora", "Anticancerígena"],
+      parteUsable: "Rizoma (raíz)",
+      dosis: "1.5-3 gramos de polvo de cúrcuma al día.",
+      preparacion: "En polvo como especia, cápsulas, extractos.",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "No se recomienda en grandes cantidades." }, { tipo: "medicamentos", descripcion: "Precaución con anticoagulantes y antiácidos." }],
+      descripcion: "Especia de color amarillo intenso, conocida por su potente compuesto activo, la curcumina, con fuertes propiedades antiinflamatorias.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-inmunologico", "sistema-musculoesqueletico"],
+      categoriaId: "plantas-tropicales-medicinales",
+      categoria: "Plantas tropicales medicinales",
+    },
+    {
+      id: "noni",
+      nombre: "Noni",
+      nombreCientifico: "Morinda citrifolia",
+      propiedades: ["Analgésico", "Antiinflamatorio", "Inmunomodulador", "Antimicrobiano"],
+      parteUsable: "Fruto, hojas, raíz",
+      dosis: "30-60 ml de jugo de noni al día.",
+      preparacion: "Jugo, extractos, cápsulas.",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Personas con enfermedades renales o hepáticas deben consultar a un médico." }],
+      descripcion: "Fruto tropical con un olor fuerte y sabor amargo, utilizado tradicionalmente para una amplia gama de dolencias.",
+      sistemasRelacionados: ["sistema-inmunologico", "sistema-digestivo", "enfermedades-piel"],
+      categoriaId: "plantas-tropicales-medicinales",
+      categoria: "Plantas tropicales medicinales",
+    },
+    {
+      id: "una-de-gato",
+      nombre: "Uña de Gato",
+      nombreCientifico: "Uncaria tomentosa",
+      propiedades: ["Antiinflamatoria", "Inmunomoduladora", "Antiviral", "Antioxidante"],
+      parteUsable: "Corteza y raíz",
+      dosis: "250-500 mg de extracto estandarizado al día.",
+      preparacion: "Decocción, cápsulas, extractos.",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "No se recomienda su uso." }, { tipo: "medicamentos", descripcion: "Puede interactuar con inmunosupresores." }],
+      descripcion: "Liana de la selva amazónica, utilizada para fortalecer el sistema inmunológico y tratar la artritis y otros trastornos inflamatorios.",
+      sistemasRelacionados: ["sistema-inmunologico", "sistema-musculoesqueletico"],
+      categoriaId: "plantas-tropicales-medicinales",
+      categoria: "Plantas tropicales medicinales",
+    },
+    {
+      id: "sangre-de-drago",
+      nombre: "Sangre de Drago",
+      nombreCientifico: "Croton lechleri",
+      nombresAlternativos: {"Mexico": ["Sangre de drago", "Sangre de grado"], "Colombia": ["Sangre de drago", "Sangre de grado"], "Peru": ["Sangre de drago", "Sangre de grado"]},
+      propiedades: ["Cicatrizante", "Antiinflamatoria", "Antiviral", "Analgésica"],
+      parteUsable: "Látex (resina) del tronco",
+      dosis: "Uso tópico: aplicar directamente sobre la herida. Uso oral: 5-15 gotas diluidas en agua, 1-3 veces al día.",
+      preparacion: "Látex líquido para aplicación directa o diluido.",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "No se recomienda su uso oral." }],
+      descripcion: "Resina de color rojo oscuro de un árbol del Amazonas, conocida por su excepcional capacidad para cicatrizar heridas y úlceras.",
+      sistemasRelacionados: ["enfermedades-piel", "sistema-digestivo"],
+      categoriaId: "plantas-tropicales-medicinales",
+      categoria: "Plantas tropicales medicinales",
+    },
+    {
+      id: "copaiba",
+      nombre: "Copaiba",
+      nombreCientifico: "Copaifera officinalis",
+      nombresAlternativos: {"Colombia": ["Copaiba"], "Peru": ["Copaiba"]},
+      propiedades: ["Antiinflamatoria", "Analgésica", "Antiséptica", "Expectorante"],
+      parteUsable: "Aceite-resina del tronco",
+      dosis: "2-5 gotas diluidas en agua o miel, 1-3 veces al día.",
+      preparacion: "Aceite esencial, cápsulas.",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "No se recomienda su uso." }],
+      descripcion: "Aceite resinoso extraído de un árbol amazónico, utilizado para tratar una amplia variedad de procesos inflamatorios y como antiséptico.",
+      sistemasRelacionados: ["sistema-musculoesqueletico", "sistema-respiratorio", "sistema-urinario", "enfermedades-piel"],
+      categoriaId: "plantas-tropicales-medicinales",
+      categoria: "Plantas tropicales medicinales",
+    },
+    {
+      id: "acai",
+      nombre: "Açaí",
+      nombreCientifico: "Euterpe oleracea",
+      propiedades: ["Antioxidante", "Energizante", "Antiinflamatoria"],
+      parteUsable: "Fruto",
+      dosis: "Consumo libre de la pulpa o jugo.",
+      preparacion: "Pulpa congelada, jugos, batidos, suplementos.",
+      contraindicaciones: [],
+      descripcion: "Fruto de una palmera del Amazonas, famoso por su altísimo contenido de antioxidantes, vitaminas y minerales.",
+      sistemasRelacionados: ["sistema-cardiovascular", "sistema-inmunologico"],
+      categoriaId: "plantas-tropicales-medicinales",
+      categoria: "Plantas tropicales medicinales",
+    },
+    {
+      id: "guarana",
+      nombre: "Guaraná",
+      nombreCientifico: "Paullinia cupana",
+      propiedades: ["Estimulante", "Energizante", "Tónico", "Analgésico"],
+      parteUsable: "Semillas",
+      dosis: "200-800 mg de extracto en polvo al día.",
+      preparacion: "Polvo, cápsulas, bebidas energéticas.",
+      contraindicaciones: [{ tipo: "hipertension", descripcion: "Puede aumentar la presión arterial y el ritmo cardíaco." }, { tipo: "embarazo", descripcion: "No se recomienda por su alto contenido de cafeína." }],
+      descripcion: "Semilla de un arbusto del Amazonas, rica en cafeína, utilizada como estimulante natural para combatir la fatiga y mejorar la concentración.",
+      sistemasRelacionados: ["sistema-nervioso"],
+      categoriaId: "plantas-tropicales-medicinales",
+      categoria: "Plantas tropicales medicinales",
+    },
+    {
+      id: "yerba-mate",
+      nombre: "Yerba Mate",
+      nombreCientifico: "Ilex paraguariensis",
+      propiedades: ["Estimulante", "Antioxidante", "Diurética", "Digestiva"],
+      parteUsable: "Hojas y tallos jóvenes",
+      dosis: "Infusión tradicional, 20-50g de yerba por litro de agua.",
+      preparacion: "Infusión en mate, saquitos de té.",
+      contraindicaciones: [{ tipo: "hipertension", descripcion: "Moderar consumo por su contenido de cafeína." }],
+      descripcion: "Hojas de un árbol sudamericano, utilizadas para preparar una infusión estimulante rica en antioxidantes y nutrientes.",
+      sistemasRelacionados: ["sistema-nervioso", "sistema-digestivo"],
+      categoriaId: "plantas-tropicales-medicinales",
+      categoria: "Plantas tropicales medicinales",
+    },
+    {
+      id: "yuca",
+      nombre: "Yuca",
+      nombreCientifico: "Manihot esculenta",
+      nombresAlternativos: {"Mexico": ["Yuca", "Mandioca"], "Colombia": ["Yuca", "Mandioca"], "Peru": ["Yuca", "Mandioca"], "Caribe": ["Yuca", "Mandioca"], "USA_English": ["Cassava", "Yuca", "Manioc"], "UK_English": ["Cassava", "Yuca", "Manioc"]},
+      propiedades: ["Energética", "Antiinflamatoria", "Digestiva"],
+      parteUsable: "Raíz",
+      dosis: "Consumo como alimento.",
+      preparacion: "Hervida, frita, asada, como harina.",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Debe cocinarse adecuadamente para eliminar compuestos tóxicos." }],
+      descripcion: "Raíz tuberosa rica en carbohidratos, fuente de energía y con propiedades antiinflamatorias.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-musculoesqueletico"],
+      categoriaId: "plantas-tropicales-medicinales",
+      categoria: "Plantas tropicales medicinales",
+    },
+    {
+      id: "ginseng",
+      nombre: "Ginseng",
+      nombreCientifico: "Panax ginseng",
+      nombresAlternativos: {"China": ["Rénshēn"], "Corea": ["Insam"], "Japón": ["Ninjin"], "USA_English": ["asian ginseng", "chinese ginseng", "korean ginseng"], "UK_English": ["asian ginseng", "chinese ginseng", "korean ginseng"]},
+      propiedades: ["Adaptógeno", "Tónico", "Energizante", "Inmunomodulador"],
+      parteUsable: "Raíz",
+      dosis: "200-400 mg de extracto estandarizado al día.",
+      preparacion: "Cápsulas, extractos, tés.",
+      contraindicaciones: [{ tipo: "hipertension", descripcion: "Puede aumentar la presión arterial." }, { tipo: "medicamentos", descripcion: "Precaución con anticoagulantes y antidiabéticos." }],
+      descripcion: "Raíz utilizada en la medicina tradicional china como un tónico general para mejorar la energía, la vitalidad y la resistencia al estrés.",
+      sistemasRelacionados: ["sistema-nervioso", "sistema-inmunologico", "sistema-endocrino"],
+      categoriaId: "plantas-tropicales-medicinales",
+      categoria: "Plantas tropicales medicinales",
+    },
+    {
+      id: "pasiflora",
+      nombre: "Pasiflora",
+      nombreCientifico: "Passiflora incarnata",
+      nombresAlternativos: {"España": ["flor de la pasión", "pasionaria", "granadilla"], "México": ["maracuyá", "flor de pasión"], "Argentina": ["mburucuyá", "pasionaria"], "USA_English": ["passionflower", "maypop", "purple passionflower"], "UK_English": ["passion flower"], "Indigena": ["mburucuyá"]},
+      propiedades: ["Sedante", "Ansiolítica", "Antiespasmódica"],
+      parteUsable: "Partes aéreas (hojas y flores)",
+      dosis: "Infusión de 1-2 gramos de la planta seca, o 300-500 mg de extracto.",
+      preparacion: "Infusión, tintura, cápsulas.",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "No se recomienda su uso." }, { tipo: "medicamentos", descripcion: "Puede potenciar el efecto de otros sedantes." }],
+      descripcion: "Planta trepadora con flores exóticas, utilizada para calmar la ansiedad, el nerviosismo y el insomnio.",
+      sistemasRelacionados: ["sistema-nervioso", "trastornos-mentales-emocionales"],
+      categoriaId: "plantas-tropicales-medicinales",
+      categoria: "Plantas tropicales medicinales",
+    },
+    {
+      id: "agave",
+      nombre: "Agave",
+      nombreCientifico: "Agave spp.",
+      nombresAlternativos: {"Mexico": ["Agave", "Maguey"], "USA_English": ["Agave", "American aloe"], "UK_English": ["Agave", "American aloe"]},
+      propiedades: ["Prebiótica", "Antiinflamatoria", "Antiséptica"],
+      parteUsable: "Savia (aguamiel) y hojas",
+      dosis: "Consumo moderado del sirope. Uso tópico del jugo de las hojas.",
+      preparacion: "Sirope, cataplasmas.",
+      contraindicaciones: [{ tipo: "diabetes", descripcion: "El sirope tiene un alto contenido de fructosa." }],
+      descripcion: "Planta del desierto de la que se extrae el sirope de agave y el tequila. Su savia tiene propiedades prebióticas y antiinflamatorias.",
+      sistemasRelacionados: ["sistema-digestivo", "enfermedades-piel"],
+      categoriaId: "plantas-tropicales-medicinales",
+      categoria: "Plantas tropicales medicinales",
+    },
+    {
+      id: "arandano",
+      nombre: "Arándano",
+      nombreCientifico: "Vaccinium myrtillus",
+      nombresAlternativos: {"España": ["arándano", "arandanera", "ráspano", "mirtilo", "anavia", "rasponera", "arandilla", "arandaño", "meruéndano", "raspanera", "raspona", "amabia", "mirtillo", "miruéndano", "uva de bosque", "uva de monte"], "USA_English": ["bilberry", "whortleberry", "huckleberry", "mountain blueberry"], "UK_English": ["bilberry", "blaeberry", "wimberry", "whortleberry", "winberry", "fraughan"]},
+      propiedades: ["Antioxidante", "Antiinflamatorio", "Antiséptico urinario", "Vasoprotector"],
+      parteUsable: "Fruto y hojas",
+      dosis: "Consumo libre del fruto. 250-500 mg de extracto para la salud urinaria.",
+      preparacion: "Fruto fresco, jugos, extractos, cápsulas.",
+      contraindicaciones: [],
+      descripcion: "Pequeño fruto del bosque rico en antioxidantes, conocido por su capacidad para prevenir infecciones urinarias y mejorar la salud visual.",
+      sistemasRelacionados: ["sistema-urinario", "sistema-cardiovascular", "enfermedades-ojos-oidos-nariz-garganta"],
+      categoriaId: "plantas-tropicales-medicinales",
+      categoria: "Plantas tropicales medicinales",
+    },
+    {
+      id: "flor-de-sauco",
+      nombre: "Flor de Saúco",
+      nombreCientifico: "Sambucus nigra",
+      nombresAlternativos: {"España": ["saúco", "sabuco", "canillero"], "México": ["saúco", "cundumbo"], "USA_English": ["elderflower", "black elder", "European elder"], "UK_English": ["elderflower", "elder"]},
+      propiedades: ["Antiviral", "Diaforética", "Antiinflamatoria", "Expectorante"],
+      parteUsable: "Flores y bayas",
+      dosis: "Infusión de 3-5 gramos de flores secas. 15-30 ml de jarabe de bayas.",
+      preparacion: "Infusión, jarabe, tintura.",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Las bayas crudas son tóxicas, deben cocinarse." }],
+      descripcion: "Flores y bayas de un arbusto común, utilizadas tradicionalmente para tratar resfriados, gripes y problemas respiratorios.",
+      sistemasRelacionados: ["sistema-respiratorio", "sistema-inmunologico"],
+      categoriaId: "plantas-tropicales-medicinales",
+      categoria: "Plantas tropicales medicinales",
+    },
+    {
+      id: "guaco",
+      nombre: "Guaco",
+      nombreCientifico: "Mikania glomerata",
+      nombresAlternativos: {"Mexico": ["Guaco"], "Colombia": ["Guaco"], "Peru": ["Guaco"]},
+      propiedades: ["Broncodilatador", "Expectorante", "Antitusivo", "Antiinflamatorio"],
+      parteUsable: "Hojas",
+      dosis: "Jarabe o infusión de las hojas.",
+      preparacion: "Jarabe, infusión, tintura.",
+      contraindicaciones: [{ tipo: "medicamentos", descripcion: "Precaución con anticoagulantes." }],
+      descripcion: "Planta trepadora de Sudamérica, ampliamente utilizada en la medicina popular para tratar afecciones respiratorias como el asma y la bronquitis.",
+      sistemasRelacionados: ["sistema-respiratorio"],
+      categoriaId: "plantas-tropicales-medicinales",
+      categoria: "Plantas tropicales medicinales",
+    },
+    {
+      id: "moringa",
+      nombre: "Moringa",
+      nombreCientifico: "Moringa oleifera",
+      nombresAlternativos: {"México": ["moringa", "ben", "malungáy"], "Colombia": ["moringa", "ben", "malungáy"], "Centroamérica": ["palo jeringa", "acacia", "jazmín francés"], "Caribe": ["moringa", "ben", "malungáy"], "USA_English": ["moringa", "drumstick tree", "horseradish tree"], "UK_English": ["moringa", "drumstick tree", "horseradish tree"]},
+      propiedades: ["Nutritiva", "Antioxidante", "Antiinflamatoria", "Hipoglucemiante"],
+      parteUsable: "Hojas, semillas, flores",
+      dosis: "1-3 gramos de polvo de hoja al día.",
+      preparacion: "Polvo, cápsulas, infusión, consumo de hojas frescas.",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "Evitar el consumo de la raíz." }],
+      descripcion: "Árbol originario de la India, conocido como el \"árbol milagroso\" por su altísimo valor nutricional y sus múltiples propiedades medicinales.",
+      sistemasRelacionados: ["sistema-inmunologico", "sistema-digestivo", "sistema-cardiovascular"],
+      categoriaId: "plantas-tropicales-medicinales",
+      categoria: "Plantas tropicales medicinales",
+    },
+    {
+      id: "centella-asiatica",
+      nombre: "Centella Asiática",
+      nombreCientifico: "Centella asiatica",
+      nombresAlternativos: {"España": ["Centella asiática", "Gotu kola"], "USA_English": ["Gotu kola", "Asiatic pennywort"], "UK_English": ["Gotu kola", "Asiatic pennywort"]},
+      propiedades: ["Cicatrizante", "Vasoprotectora", "Neuroprotectora", "Antiinflamatoria"],
+      parteUsable: "Partes aéreas",
+      dosis: "Aplicación tópica en cremas. 60-120 mg de extracto estandarizado al día.",
+      preparacion: "Cremas, ungüentos, cápsulas, extractos.",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Personas con enfermedades hepáticas deben tener precaución." }],
+      descripcion: "Planta herbácea utilizada en la medicina ayurvédica y china para mejorar la memoria, la circulación y promover la cicatrización de la piel.",
+      sistemasRelacionados: ["enfermedades-piel", "sistema-cardiovascular", "sistema-nervioso"],
+      categoriaId: "plantas-tropicales-medicinales",
+      categoria: "Plantas tropicales medicinales",
+    },
+    {
+      id: "grosellero-de-la-india",
+      nombre: "Grosellero de la India",
+      nombreCientifico: "Phyllanthus emblica",
+      nombresAlternativos: {"USA_English": ["Indian gooseberry", "Amla"], "UK_English": ["Indian gooseberry", "Amla"]},
+      propiedades: ["Antioxidante", "Hepatoprotectora", "Hipolipemiante", "Inmunomoduladora"],
+      parteUsable: "Fruto",
+      dosis: "1-3 gramos de polvo de fruta al día.",
+      preparacion: "Polvo, cápsulas, jugo.",
+      contraindicaciones: [],
+      descripcion: "También conocido como Amla, es un fruto muy rico en vitamina C y antioxidantes, fundamental en la medicina ayurvédica.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-inmunologico", "sistema-cardiovascular"],
+      categoriaId: "plantas-tropicales-medicinales",
+      categoria: "Plantas tropicales medicinales",
+    },
+    {
+      id: "bardana",
+      nombre: "Bardana",
+      nombreCientifico: "Arctium lappa",
+      nombresAlternativos: {"España": ["lapa", "lampazo mayor", "gobó", "lampazo", "bardana mayor", "llapassa", "respingón", "agarrocha", "agarrucha", "aguipegotes", "amor de hortelano"], "USA_English": ["greater burdock", "edible burdock", "lappa", "beggar's buttons", "thorny burr", "happy major"], "UK_English": ["greater burdock", "edible burdock", "lappa", "beggar's buttons", "thorny burr", "happy major"]},
+      propiedades: ["Depurativa", "Diurética", "Antiinflamatoria", "Antimicrobiana"],
+      parteUsable: "Raíz, hojas y semillas",
+      dosis: "Decocción de 2-6 gramos de raíz seca, 3 veces al día.",
+      preparacion: "Decocción, tintura, cataplasma.",
+      contraindicaciones: [{ tipo: "alergia", descripcion: "Puede causar reacciones alérgicas en personas sensibles a las asteráceas." }],
+      descripcion: "Planta robusta cuya raíz se utiliza como depurativo de la sangre y para tratar afecciones de la piel como el acné y los eczemas.",
+      sistemasRelacionados: ["enfermedades-piel", "sistema-linfatico", "sistema-urinario"],
+      categoriaId: "plantas-tropicales-medicinales",
+      categoria: "Plantas tropicales medicinales",
+    },
+    {
+      id: "malva",
+      nombre: "Malva",
+      nombreCientifico: "Malva sylvestris",
+      nombresAlternativos: {"España": ["malva común", "panecillos", "quesitos"], "Colombia": ["malva blanca", "malva morada"], "Argentina": ["malva"], "USA_English": ["common mallow", "high mallow", "wood mallow"], "UK_English": ["common mallow", "cheeses"]},
+      propiedades: ["Emoliente", "Antiinflamatoria", "Expectorante", "Laxante suave"],
+      parteUsable: "Flores y hojas",
+      dosis: "Infusión de 1.5-2 gramos por taza, varias veces al día.",
+      preparacion: "Infusión, gargarismos, cataplasmas.",
+      contraindicaciones: [],
+      descripcion: "Planta común con flores vistosas, rica en mucílagos que le confieren propiedades suavizantes para la garganta, el estómago y la piel.",
+      sistemasRelacionados: ["sistema-respiratorio", "sistema-digestivo", "enfermedades-piel"],
+      categoriaId: "plantas-tropicales-medicinales",
+      categoria: "Plantas tropicales medicinales",
+    },
+    {
+      id: "anis-verde",
+      nombre: "Anís Verde",
+      nombreCientifico: "Pimpinella anisum",
+      nombresAlternativos: {"España": ["Anís verde", "Anís"], "Mexico": ["Anís"], "USA_English": ["Anise"], "UK_English": ["Anise"]},
+      propiedades: ["Carminativo", "Expectorante", "Antiespasmódico", "Galactogogo"],
+      parteUsable: "Frutos (semillas)",
+      dosis: "Infusión de 1-3 gramos de semillas por taza.",
+      preparacion: "Infusión, aceite esencial.",
+      contraindicaciones: [{ tipo: "alergia", descripcion: "Puede causar reacciones alérgicas." }],
+      descripcion: "Planta aromática cuyas semillas se utilizan para aliviar los gases, la hinchazón abdominal y la tos.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-respiratorio"],
+      categoriaId: "plantas-tropicales-medicinales",
+      categoria: "Plantas tropicales medicinales",
+    },
+    {
+      id: "salvia",
+      nombre: "Salvia",
+      nombreCientifico: "Salvia officinalis",
+      nombresAlternativos: {"España": ["salvia real", "celima", "hierba del mudo", "madreselva", "mermasangre", "salima fina", "salvia blanca", "salvia fina", "salvia hortense", "gallocresta", "salve", "hierba de la salud", "sabia", "salva", "salvá", "salva cruz", "salvia en cruz", "té moruno", "té de jardín"], "USA_English": ["sage", "common sage", "garden sage", "golden sage", "kitchen sage", "true sage", "culinary sage"], "UK_English": ["sage", "common sage", "garden sage", "golden sage", "kitchen sage", "true sage", "culinary sage"], "Otros": ["María Pastora", "Sally-D", "menta mágica", "salvia del país", "salvia de playa", "salvia cimarrona"]},
+      propiedades: ["Antiséptica", "Antiinflamatoria", "Astringente", "Antisudoral"],
+      parteUsable: "Hojas",
+      dosis: "Infusión de 1-3 gramos de hojas secas. Gargarismos con la infusión.",
+      preparacion: "Infusión, tintura, aceite esencial.",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "No se recomienda su uso por su contenido en tuyona." }, { tipo: "lactancia", descripcion: "Puede reducir la producción de leche." }],
+      descripcion: "Arbusto aromático muy utilizado en la cocina y en la medicina tradicional para tratar infecciones de boca y garganta, y regular la sudoración.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-nervioso", "enfermedades-ojos-oidos-nariz-garganta"],
+      categoriaId: "plantas-tropicales-medicinales",
+      categoria: "Plantas tropicales medicinales",
+    },
+    {
+      id: "romero",
+      nombre: "Romero",
+      nombreCientifico: "Rosmarinus officinalis",
+      nombresAlternativos: {"España": ["romero común", "romero blanco", "romero hembra", "romero macho"], "USA_English": ["rosemary"], "UK_English": ["rosemary"]},
+      propiedades: ["Estimulante circulatorio", "Carminativo", "Antioxidante", "Antiinflamatorio"],
+      parteUsable: "Hojas y flores",
+      dosis: "Infusión de 2-4 gramos por taza. Uso tópico del aceite esencial diluido.",
+      preparacion: "Infusión, aceite esencial, alcohol de romero.",
+      contraindicaciones: [{ tipo: "hipertension", descripcion: "En dosis altas puede aumentar la presión arterial." }],
+      descripcion: "Arbusto mediterráneo con un aroma intenso, utilizado para mejorar la circulación, la digestión y la memoria.",
+      sistemasRelacionados: ["sistema-cardiovascular", "sistema-digestivo", "sistema-nervioso", "sistema-musculoesqueletico"],
+      categoriaId: "plantas-tropicales-medicinales",
+      categoria: "Plantas tropicales medicinales",
+    },
+    {
+      id: "manzanilla",
+      nombre: "Manzanilla",
+      nombreCientifico: "Matricaria recutita",
+      nombresAlternativos: {"España": ["manzanilla común", "manzanilla de Aragón", "manzanilla alemana", "camomila"], "México": ["manzanilla de Castilla", "manzanilla cimarrona"], "Argentina": ["manzanilla"], "USA_English": ["chamomile", "German chamomile", "Hungarian chamomile"], "UK_English": ["camomile", "German camomile"], "Indigena": ["queza", "gguía-gueza"]},
+      propiedades: ["Digestiva", "Antiinflamatoria", "Calmante", "Antiespasmódica"],
+      parteUsable: "Flores",
+      dosis: "Infusión de 1-2 cucharaditas de flores por taza.",
+      preparacion: "Infusión, aceite esencial, extractos.",
+      contraindicaciones: [{ tipo: "alergia", descripcion: "Personas alérgicas a las asteráceas pueden ser sensibles." }],
+      descripcion: "Hierba muy popular cuyas flores se usan en infusión para calmar trastornos digestivos, nervios y como antiinflamatorio suave.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-nervioso", "enfermedades-piel"],
+      categoriaId: "plantas-tropicales-medicinales",
+      categoria: "Plantas tropicales medicinales",
+    },
+    {
+      id: "ajo",
+      nombre: "Ajo",
+      nombreCientifico: "Allium sativum",
+      nombresAlternativos: {"España": ["Ajo", "Ajo andaluz", "Ajo blanco"], "Mexico": ["Ajo"], "USA_English": ["Garlic"], "UK_English": ["Garlic"]},
+      propiedades: ["Antimicrobiano", "Hipotensor", "Hipolipemiante", "Anticoagulante"],
+      parteUsable: "Bulbo (dientes)",
+      dosis: "1-2 dientes de ajo crudos al día.",
+      preparacion: "Crudo, cocido, cápsulas de aceite de ajo.",
+      contraindicaciones: [{ tipo: "medicamentos", descripcion: "Precaución con anticoagulantes e hipoglucemiantes." }],
+      descripcion: "Bulbo con un olor y sabor característicos, valorado por sus efectos beneficiosos sobre el sistema cardiovascular y como potente antibiótico natural.",
+      sistemasRelacionados: ["sistema-cardiovascular", "sistema-inmunologico", "sistema-respiratorio"],
+      categoriaId: "plantas-tropicales-medicinales",
+      categoria: "Plantas tropicales medicinales",
+    },
+    {
+      id: "eucalipto",
+      nombre: "Eucalipto",
+      nombreCientifico: "Eucalyptus globulus",
+      nombresAlternativos: {"España": ["eucalipto blanco", "eucalipto común", "eucalipto azul", "calipes", "calipse", "calipto"], "USA_English": ["southern blue gum", "blue gum", "Tasmanian blue gum"], "UK_English": ["blue gum", "Tasmanian blue gum"]},
+      propiedades: ["Expectorante", "Antiséptico", "Descongestionante", "Antiinflamatorio"],
+      parteUsable: "Hojas",
+      dosis: "Inhalación de vapor de la decocción de las hojas. Infusión con precaución.",
+      preparacion: "Inhalaciones, aceite esencial (uso externo), ungüentos.",
+      contraindicaciones: [{ tipo: "ninos", descripcion: "El aceite esencial no debe ser ingerido ni aplicado cerca de la cara de niños pequeños." }],
+      descripcion: "Árbol de origen australiano cuyas hojas son ricas en un aceite esencial usado para aliviar los síntomas de resfriados y problemas respiratorios.",
+      sistemasRelacionados: ["sistema-respiratorio"],
+      categoriaId: "plantas-tropicales-medicinales",
+      categoria: "Plantas tropicales medicinales",
+    },
+    {
+      id: "cola-de-caballo",
+      nombre: "Cola de Caballo",
+      nombreCientifico: "Equisetum arvense",
+      nombresAlternativos: {"España": ["Cola de caballo", "Equiseto", "Limpiaplata", "Canutillo", "Pinillo"], "Mexico": ["Cola de caballo"], "USA_English": ["Horsetail", "Common horsetail", "Field horsetail"], "UK_English": ["Horsetail", "Common horsetail", "Field horsetail"]},
+      propiedades: ["Diurética", "Remineralizante", "Cicatrizante", "Astringente"],
+      parteUsable: "Tallos estériles",
+      dosis: "Infusión de 2-4 gramos de la planta seca, 2-3 veces al día.",
+      preparacion: "Infusión, decocción, polvo, cápsulas.",
+      contraindicaciones: [{ tipo: "otro", descripcion: "No usar por periodos prolongados por su contenido en tiaminasa." }],
+      descripcion: "Planta primitiva rica en silicio y otros minerales, utilizada como diurético, para fortalecer uñas y cabello, y para reparar tejidos.",
+      sistemasRelacionados: ["sistema-urinario", "sistema-musculoesqueletico", "enfermedades-piel"],
+      categoriaId: "plantas-tropicales-medicinales",
+      categoria: "Plantas tropicales medicinales",
+    },
+    {
+      id: "hiperico",
+      nombre: "Hipérico",
+      nombreCientifico: "Hypericum perforatum",
+      nombresAlternativos: {"España": ["Hipérico", "Hierba de San Juan", "Corazoncillo"], "Argentina": ["Hierba de San Juan"], "USA_English": ["St. John's wort"], "UK_English": ["St. John's wort"]},
+      propiedades: ["Antidepresivo", "Ansiolítico", "Cicatrizante", "Antiviral"],
+      parteUsable: "Sumidades floridas",
+      dosis: "300 mg de extracto estandarizado, 3 veces al día.",
+      preparacion: "Cápsulas, extractos, aceite (uso tópico).",
+      contraindicaciones: [{ tipo: "medicamentos", descripcion: "Interactúa con una gran cantidad de medicamentos (antidepresivos, anticonceptivos, anticoagulantes, etc.)." }, { tipo: "otro", descripcion: "Puede causar fotosensibilidad." }],
+      descripcion: "También conocida como Hierba de San Juan, es una planta utilizada para tratar la depresión leve a moderada y para curar heridas y quemaduras.",
+      sistemasRelacionados: ["trastornos-mentales-emocionales", "sistema-nervioso", "enfermedades-piel"],
+      categoriaId: "plantas-tropicales-medicinales",
+      categoria: "Plantas tropicales medicinales",
+    },
+    {
+      id: "tomillo",
+      nombre: "Tomillo",
+      nombreCientifico: "Thymus vulgaris",
+      nombresAlternativos: {"España": ["boja", "bojas", "estremoncello", "estremoncillo", "tomello", "tremoncillo"], "USA_English": ["common thyme", "German thyme", "garden thyme"], "UK_English": ["common thyme", "German thyme", "garden thyme"], "Otros": ["orégano", "timonet", "farigola"]},
+      propiedades: ["Antiséptico", "Expectorante", "Antiespasmódico", "Digestivo"],
+      parteUsable: "Hojas y flores",
+      dosis: "Infusión de 1-2 cucharaditas por taza.",
+      preparacion: "Infusión, jarabe, aceite esencial.",
+      contraindicaciones: [],
+      descripcion: "Hierba aromática con potentes propiedades antisépticas, especialmente útil para tratar infecciones respiratorias y problemas digestivos.",
+      sistemasRelacionados: ["sistema-respiratorio", "sistema-digestivo", "sistema-inmunologico"],
+      categoriaId: "plantas-tropicales-medicinales",
+      categoria: "Plantas tropicales medicinales",
+    },
+    {
+      id: "lavanda",
+      nombre: "Lavanda",
+      nombreCientifico: "Lavandula angustifolia",
+      nombresAlternativos: {"España": ["espliego", "alhucema", "cantueso"], "USA_English": ["lavender", "true lavender", "English lavender"], "UK_English": ["lavender"]},
+      propiedades: ["Relajante", "Ansiolítica", "Antiséptica", "Analgésica"],
+      parteUsable: "Flores",
+      dosis: "Infusión de 1-2 cucharaditas por taza. Aceite esencial en difusor o diluido para masajes.",
+      preparacion: "Infusión, aceite esencial, saquitos aromáticos.",
+      contraindicaciones: [],
+      descripcion: "Planta conocida por su aroma relajante, utilizada en aromaterapia para aliviar el estrés, la ansiedad y el insomnio.",
+      sistemasRelacionados: ["sistema-nervioso", "trastornos-mentales-emocionales", "enfermedades- piel"],
+      categoriaId: "plantas-tropicales-medicinales",
+      categoria: "Plantas tropicales medicinales",
+    },
+    {
+      id: "tila",
+      nombre: "Tila",
+      nombreCientifico: "Tilia spp.",
+      nombresAlternativos: {"España": ["Tila", "Tilo", "Tilo norteño", "Tilo silvestre"], "Argentina": ["Tilo de hojas pequeñas", "Tilo de Europa"], "USA_English": ["Linden", "Small-leaved lime"], "UK_English": ["Linden", "Small-leaved lime"]},
+      propiedades: ["Sedante", "Ansiolítica", "Diaforética", "Antiespasmódica"],
+      parteUsable: "Flores e inflorescencias",
+      dosis: "Infusión de 1-2 cucharaditas por taza.",
+      preparacion: "Infusión.",
+      contraindicaciones: [],
+      descripcion: "Árbol cuyas flores se utilizan en infusión por sus propiedades calmantes y para inducir el sueño.",
+      sistemasRelacionados: ["sistema-nervioso", "trastornos-mentales-emocionales"],
+      categoriaId: "plantas-tropicales-medicinales",
+      categoria: "Plantas tropicales medicinales",
+    },
+    {
+      id: "diente-de-leon",
+      nombre: "Diente de León",
+      nombreCientifico: "Taraxacum officinale",
+      nombresAlternativos: {"España": ["Diente de león", "Achicoria amarga", "Amargón"], "Mexico": ["Diente de león", "Achicoria amarga", "Amargón", "Cerraja"], "USA_English": ["Dandelion"], "UK_English": ["Dandelion"]},
+      propiedades: ["Diurética", "Depurativa", "Colagoga", "Tónico amargo"],
+      parteUsable: "Raíz y hojas",
+      dosis: "Infusión de las hojas o decocción de la raíz.",
+      preparacion: "Infusión, decocción, ensaladas (hojas jóvenes).",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Obstrucción de las vías biliares." }],
+      descripcion: "Considerada a menudo una mala hierba, es una planta muy nutritiva y con excelentes propiedades para depurar el hígado y los riñones.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-urinario"],
+      categoriaId: "plantas-tropicales-medicinales",
+      categoria: "Plantas tropicales medicinales",
+    },
+    {
+      id: "ginkgo-biloba",
+      nombre: "Ginkgo Biloba",
+      nombreCientifico: "Ginkgo biloba",
+      nombresAlternativos: {"España": ["ginkgo", "árbol de los 40 escudos", "nogal del Japón"], "USA_English": ["ginkgo", "maidenhair tree"], "UK_English": ["ginkgo", "maidenhair tree"]},
+      propiedades: ["Vasodilatador periférico", "Neuroprotector", "Antioxidante"],
+      parteUsable: "Hojas",
+      dosis: "120-240 mg de extracto estandarizado al día, repartido en 2-3 dosis.",
+      preparacion: "Cápsulas, extractos.",
+      contraindicaciones: [{ tipo: "medicamentos", descripcion: "Precaución con anticoagulantes y antiplaquetarios." }],
+      descripcion: "Árbol milenario cuyas hojas se utilizan para mejorar la circulación cerebral, la memoria y la concentración.",
+      sistemasRelacionados: ["sistema-nervioso", "sistema-cardiovascular"],
+      categoriaId: "plantas-tropicales-medicinales",
+      categoria: "Plantas tropicales medicinales",
+    },
+    {
+      id: "oregano",
+      nombre: "Orégano",
+      nombreCientifico: "Origanum vulgare",
+      nombresAlternativos: {"España": ["furiégano", "mejorana silvestre", "oreganín", "orégano común", "orégano nano", "orégano trenzado", "orégano turco", "orenga"], "Caribe": ["orégano francés", "orégano de la tierra", "orégano orejón", "orégano brujo"], "USA_English": ["oregano", "wild marjoram", "pot marjoram"], "UK_English": ["oregano", "wild marjoram", "pot marjoram"]},
+      propiedades: ["Antiséptico", "Antifúngico", "Antioxidante", "Carminativo"],
+      parteUsable: "Hojas y flores",
+      dosis: "Infusión de 1 cucharadita por taza. Aceite esencial con mucha precaución y diluido.",
+      preparacion: "Infusión, aceite esencial, condimento.",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "El aceite esencial está contraindicado." }],
+      descripcion: "Hierba aromática con un potente aceite esencial rico en carvacrol y timol, de gran poder antiséptico.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-respiratorio", "sistema-inmunologico"],
+      categoriaId: "plantas-tropicales-medicinales",
+      categoria: "Plantas tropicales medicinales",
+    },
+    {
+      id: "corteza-de-sauce",
+      nombre: "Corteza de Sauce",
+      nombreCientifico: "Salix spp.",
+      nombresAlternativos: {"España": ["Corteza de sauce", "Sauce blanco"], "USA_English": ["White willow bark"], "UK_English": ["White willow bark"]},
+      propiedades: ["Analgésica", "Antiinflamatoria", "Antipirética"],
+      parteUsable: "Corteza",
+      dosis: "Decocción de 1-3 gramos de corteza. Extractos estandarizados equivalentes a 60-120 mg de salicina.",
+      preparacion: "Decocción, cápsulas, extractos.",
+      contraindicaciones: [{ tipo: "alergia", descripcion: "Alergia a los salicilatos (aspirina)." }, { tipo: "ninos", descripcion: "No administrar a niños o adolescentes con fiebre por riesgo de síndrome de Reye." }],
+      descripcion: "La corteza de varias especies de sauce contiene salicina, el precursor natural de la aspirina, y se usa para aliviar el dolor y la fiebre.",
+      sistemasRelacionados: ["sistema-musculoesqueletico", "sistema-nervioso"],
+      categoriaId: "plantas-tropicales-medicinales",
+      categoria: "Plantas tropicales medicinales",
+    },
+    {
+      id: "acebo",
+      nombre: "Acebo",
+      nombreCientifico: "Ilex aquifolium",
+      nombresAlternativos: {"España": ["Acebo"], "USA_English": ["Holly"], "UK_English": ["Holly"]},
+      propiedades: ["Diurético", "Antipirético", "Relajante"],
+      parteUsable: "Hojas",
+      dosis: "Uso muy restringido y bajo supervisión profesional debido a su toxicidad.",
+      preparacion: "Decocción (uso tradicional, no recomendado).",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Sus bayas son muy tóxicas. La planta en general es tóxica y su uso doméstico es peligroso." }],
+      descripcion: "Arbusto ornamental navideño cuyas hojas se han usado tradicionalmente como diurético y para bajar la fiebre, aunque es una planta tóxica.",
+      sistemasRelacionados: ["sistema-urinario"],
+      categoriaId: "plantas-tropicales-medicinales",
+      categoria: "Plantas tropicales medicinales",
+    },
+    {
+      id: "poleo-menta",
+      nombre: "Poleo Menta",
+      nombreCientifico: "Mentha pulegium",
+      nombresAlternativos: {"España": ["Poleo menta", "Poleo"], "USA_English": ["Pennyroyal"], "UK_English": ["Pennyroyal"]},
+      propiedades: ["Digestiva", "Carminativa", "Antiespasmódica", "Emenagoga"],
+      parteUsable: "Hojas y flores",
+      dosis: "Infusión de 1-2 cucharaditas por taza.",
+      preparacion: "Infusión.",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "Es abortivo, está totalmente contraindicado." }, { tipo: "otro", descripcion: "El aceite esencial es muy tóxico para el hígado." }],
+      descripcion: "Planta aromática de la familia de la menta, utilizada tradicionalmente para facilitar la digestión y aliviar los gases.",
+      sistemasRelacionados: ["sistema-digestivo"],
+      categoriaId: "plantas-tropicales-medicinales",
+      categoria: "Plantas tropicales medicinales",
+    },
+    {
+      id: "ortiga",
+      nombre: "Ortiga",
+      nombreCientifico: "Urtica dioica",
+      nombresAlternativos: {"España": ["Ortiga", "Ortiga mayor"], "USA_English": ["Nettle", "Stinging nettle"], "UK_English": ["Nettle", "Stinging nettle"]},
+      propiedades: ["Depurativa", "Diurética", "Remineralizante", "Antianémica"],
+      parteUsable: "Hojas y raíz",
+      dosis: "Infusión de las hojas, decocción de la raíz.",
+      preparacion: "Infusión, decocción, sopas, cápsulas.",
+      contraindicaciones: [],
+      descripcion: "Planta rica en vitaminas y minerales, conocida por sus pelos urticantes, pero muy apreciada como depurativa, diurética y para combatir la anemia.",
+      sistemasRelacionados: ["sistema-urinario", "sistema-musculoesqueletico", "sistema-inmunologico"],
+      categoriaId: "plantas-tropicales-medicinales",
+      categoria: "Plantas tropicales medicinales",
+    },
+    {
+      id: "dedalera",
+      nombre: "Dedalera",
+      nombreCientifico: "Digitalis purpurea",
+      nombresAlternativos: {"España": ["Dedalera", "Digital"], "USA_English": ["Foxglove"], "UK_English": ["Foxglove"]},
+      propiedades: ["Cardiotónica"],
+      parteUsable: "Hojas",
+      dosis: "Uso exclusivo médico. La dosificación es farmacéutica.",
+      preparacion: "Principios activos (digoxina, digitoxina) extraídos en laboratorio.",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Planta extremadamente tóxica. Su uso casero es mortal." }],
+      descripcion: "Planta muy venenosa de la que se extraen principios activos utilizados en medicamentos para tratar la insuficiencia cardíaca.",
+      sistemasRelacionados: ["sistema-cardiovascular"],
+      categoriaId: "plantas-tropicales-medicinales",
+      categoria: "Plantas tropicales medicinales",
+    },
+    {
+      id: "sandalo",
+      nombre: "Sándalo",
+      nombreCientifico: "Santalum album",
+      nombresAlternativos: {"USA_English": ["Sandalwood"], "UK_English": ["Sandalwood"]},
+      propiedades: ["Antiséptico", "Relajante", "Astringente", "Antiinflamatorio"],
+      parteUsable: "Madera",
+      dosis: "Uso externo del aceite esencial en aromaterapia o diluido.",
+      preparacion: "Aceite esencial, incienso, polvo.",
+      contraindicaciones: [],
+      descripcion: "Árbol aromático de la India cuya madera proporciona un aceite esencial muy valorado en perfumería y aromaterapia por su efecto relajante y antiséptico.",
+      sistemasRelacionados: ["sistema-nervioso", "enfermedades-piel", "sistema-urinario"],
+      categoriaId: "plantas-tropicales-medicinales",
+      categoria: "Plantas tropicales medicinales",
+    },
+    {
+      id: "amapola",
+      nombre: "Amapola",
+      nombreCientifico: "Papaver rhoeas",
+      nombresAlternativos: {"España": ["amapola silvestre", "ababol", "amapola colorada"], "USA_English": ["corn poppy", "field poppy", "Flanders poppy", "red poppy"], "UK_English": ["common poppy", "corn poppy"]},
+      propiedades: ["Sedante suave", "Antitusiva", "Emoliente"],
+      parteUsable: "Pétalos",
+      dosis: "Infusión de los pétalos.",
+      preparacion: "Infusión, jarabe.",
+      contraindicaciones: [],
+      descripcion: "Flor silvestre cuyos pétalos se utilizan en infusión como un sedante suave para la tos y el nerviosismo, especialmente en niños.",
+      sistemasRelacionados: ["sistema-respiratorio", "sistema-nervioso"],
+      categoriaId: "plantas-tropicales-medicinales",
+      categoria: "Plantas tropicales medicinales",
+    },
+    {
+      id: "eneldo",
+      nombre: "Eneldo",
+      nombreCientifico: "Anethum graveolens",
+      nombresAlternativos: {"España": ["aneto", "abesón"], "USA_English": ["dill", "dill-oil plant", "east indian dill", "indian dill", "meeting-seed", "sabbath day posy", "dillweed"], "UK_English": ["dill", "dill-oil plant", "east indian dill", "indian dill", "meeting-seed", "sabbath day posy", "dillweed"], "Otros": ["anet", "aneta"]},
+      propiedades: ["Carminativo", "Antiespasmódico", "Diurético", "Galactogogo"],
+      parteUsable: "Semillas y hojas",
+      dosis: "Infusión de 1-2 cucharaditas de semillas por taza.",
+      preparacion: "Infusión, condimento.",
+      contraindicaciones: [],
+      descripcion: "Hierba aromática utilizada como condimento y como remedio para los gases, los cólicos y para estimular la producción de leche materna.",
+      sistemasRelacionados: ["sistema-digestivo"],
+      categoriaId: "plantas-tropicales-medicinales",
+      categoria: "Plantas tropicales medicinales",
+    },
+    {
+      id: "apio",
+      nombre: "Apio",
+      nombreCientifico: "Apium graveolens",
+      nombresAlternativos: {"España": ["Apio"], "Mexico": ["Apio"], "USA_English": ["Celery"], "UK_English": ["Celery"]},
+      propiedades: ["Diurético", "Depurativo", "Remineralizante", "Carminativo"],
+      parteUsable: "Planta entera (tallo, hojas, semillas)",
+      dosis: "Consumo como alimento. Jugo o infusión.",
+      preparacion: "Crudo en ensaladas, jugos, caldos, infusión de semillas.",
+      contraindicaciones: [{ tipo: "alergia", descripcion: "Es un alérgeno relativamente común." }],
+      descripcion: "Hortaliza con un sabor característico, apreciada por su efecto diurético y depurativo, ayudando a eliminar líquidos y toxinas.",
+      sistemasRelacionados: ["sistema-urinario", "sistema-digestivo", "sistema-musculoesqueletico"],
+      categoriaId: "plantas-tropicales-medicinales",
+      categoria: "Plantas tropicales medicinales",
+    },
+    {
+      id: "ajenjo",
+      nombre: "Ajenjo",
+      nombreCientifico: "Artemisia absinthium",
+      nombresAlternativos: {"España": ["asensio", "ajorizo", "artemisia amarga", "hierba maestra", "hierba santa", "absintio", "asencio", "absenta", "donzell", "encens", "asentsio", "ajenjo mayor", "ajenjo común", "ajenjo macho", "ajenjo vulgar", "ajencio", "ajenjio", "asenjo"], "USA_English": ["wormwood", "absinthium", "green ginger", "absinthe", "old woman", "southernwood", "absinth sage", "absinth wormwood", "absinth sagewort", "common sagewort", "absinthe mugwort"], "UK_English": ["wormwood", "absinthium", "green ginger", "absinthe", "old woman", "southernwood", "absinth sage", "absinth wormwood", "absinth sagewort", "common sagewort", "absinthe mugwort"]},
+      propiedades: ["Tónico amargo", "Vermífugo", "Colagogo", "Emenagogo"],
+      parteUsable: "Hojas y sumidades floridas",
+      dosis: "Infusión de 0.5-1 gramo por taza, antes de las comidas. No usar prolongadamente.",
+      preparacion: "Infusión, tintura.",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "Es abortivo." }, { tipo: "otro", descripcion: "Neurotóxico en dosis altas o uso prolongado por su contenido en tuyona." }],
+      descripcion: "Planta muy amarga, utilizada como tónico digestivo para abrir el apetito y para eliminar parásitos intestinales. Es el ingrediente clave de la absenta.",
+      sistemasRelacionados: ["sistema-digestivo"],
+      categoriaId: "plantas-tropicales-medicinales",
+      categoria: "Plantas tropicales medicinales",
+    },
+    {
+      id: "kava",
+      nombre: "Kava",
+      nombreCientifico: "Piper methysticum",
+      nombresAlternativos: {"USA_English": ["kava", "kava kava", "'Awa", "Ava Pepper", "Ava Root"], "UK_English": ["kava", "kava kava"], "Indigena": ["'awa (Hawaii)", "sakau (Pohnpei)", "yaqona (Fiji)"]},
+      propiedades: ["Ansiolítica", "Relajante muscular", "Anestésica local"],
+      parteUsable: "Raíz y rizoma",
+      dosis: "Extractos estandarizados que proporcionen 60-120 mg de kavalactonas al día.",
+      preparacion: "Bebida tradicional, cápsulas, extractos.",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Puede causar daño hepático grave. Prohibido en muchos países." }, { tipo: "medicamentos", descripcion: "No mezclar con alcohol u otros depresores del SNC." }],
+      descripcion: "Planta de las islas del Pacífico cuya raíz se usa para preparar una bebida ceremonial con efectos relajantes y ansiolíticos.",
+      sistemasRelacionados: ["sistema-nervioso", "trastornos-mentales-emocionales"],
+      categoriaId: "plantas-tropicales-medicinales",
+      categoria: "Plantas tropicales medicinales",
+    },
+    {
+      id: "ruda",
+      nombre: "Ruda",
+      nombreCientifico: "Ruta graveolens",
+      nombresAlternativos: {"España": ["arruda", "rúa", "ruda común", "ruda cultivada", "ruda de hojas anchas", "armaga"], "USA_English": ["rue", "common rue", "garden rue", "herb of grace"], "UK_English": ["rue", "common rue", "garden rue", "herb of grace"]},
+      propiedades: ["Antiespasmódica", "Emenagoga", "Rubefaciente"],
+      parteUsable: "Hojas",
+      dosis: "Uso muy cuidadoso y en dosis bajas. Infusión de 0.5g por taza.",
+      preparacion: "Infusión, aceite (uso externo).",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "Es un potente abortivo." }, { tipo: "otro", descripcion: "Es tóxica para el hígado y puede causar fotosensibilidad severa." }],
+      descripcion: "Planta de olor fuerte, utilizada tradicionalmente para regular la menstruación y calmar cólicos, pero es tóxica y su uso es arriesgado.",
+      sistemasRelacionados: ["sistema-reproductor", "sistema-digestivo"],
+      categoriaId: "plantas-tropicales-medicinales",
+      categoria: "Plantas tropicales medicinales",
+    },
+    {
+      id: "calendula",
+      nombre: "Caléndula",
+      nombreCientifico: "Calendula officinalis",
+      nombresAlternativos: {"España": ["botón de oro", "mercadela", "maravilla", "clavelina"], "México": ["flor de muerto", "chinita"], "Colombia": ["botón de oro", "maravilla"], "USA_English": ["pot marigold", "common marigold", "ruddles"], "UK_English": ["Scotch marigold"]},
+      propiedades: ["Antiinflamatoria", "Cicatrizante", "Antiséptica", "Emoliente"],
+      parteUsable: "Flores",
+      dosis: "Uso tópico en cremas, ungüentos o infusiones para lavar heridas.",
+      preparacion: "Infusión, tintura, aceite, cremas.",
+      contraindicaciones: [{ tipo: "alergia", descripcion: "Sensibilidad a las plantas de la familia de las asteráceas." }],
+      descripcion: "Flor de color naranja brillante, también conocida como maravilla, muy apreciada por su capacidad para curar y regenerar la piel.",
+      sistemasRelacionados: ["enfermedades-piel", "sistema-digestivo"],
+      categoriaId: "plantas-tropicales-medicinales",
+      categoria: "Plantas tropicales medicinales",
+    },
+    {
+      id: "cacao",
+      nombre: "Cacao",
+      nombreCientifico: "Theobroma cacao",
+      nombresAlternativos: {"Mexico": ["cacao", "biziáa", "bizoya", "pizoya", "yagabizoya", "yagabisoya", "yaga-pi-zija", "cacaocuáhuitl", "ma-micha-moya", "mo-chá", "kakaw", "kahau", "haa", "yau", "caco", "chudenchú", "cágau"], "Colombia": ["cacao"], "Peru": ["cacao arisco", "cacao común", "cacao criollo", "cacao dulce", "cacao silvestre", "cacahua", "cacau muyo", "cacahua caspi"], "USA_English": ["cacao tree", "chocolate tree", "cocoa"], "Indigena": ["cacahuat", "xocolatl", "kakaw", "cacaocuáhuitl", "ma-micha-moya", "mo-chá", "haa", "yau", "caco", "chudenchú", "cágau"]},
+      propiedades: ["Antioxidante", "Estimulante", "Cardioprotector", "Euforizante"],
+      parteUsable: "Semillas (habas)",
+      dosis: "Consumo moderado de chocolate negro (>70% cacao) o 1-2 cucharadas de cacao en polvo al día.",
+      preparacion: "Polvo, manteca, chocolate.",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Puede causar migrañas en personas sensibles." }, { tipo: "hipertension", descripcion: "Moderar consumo por su contenido de teobromina, similar a la cafeína." }],
+      descripcion: "Árbol tropical de cuyas semillas se obtiene el chocolate. Es rico en antioxidantes (flavonoides) y teobromina, un estimulante suave.",
+      sistemasRelacionados: ["sistema-cardiovascular", "sistema-nervioso", "trastornos-mentales-emocionales"],
+      categoriaId: "plantas-tropicales-medicinales",
+      categoria: "Plantas tropicales medicinales",
+    },
+  ],
+};
+
+export default categoria;
@@ -0,0 +1,686 @@
+// Generado automáticamente por scripts/build-catalog.py - no editar a mano
+import type { CategoriaPlanta } from '../../plantas-expandidas';
+
+const categoria: CategoriaPlanta = {
+  id: "raices-y-tuberculos-medicinales",
+  nombre: "Raíces y tubérculos medicinales",
+  plantas: [
+    {
+      id: "jengibre",
+      nombre: "Jengibre",
+      nombreCientifico: "Zingiber officinale",
+      nombresAlternativos: {"Perú": ["kion"], "Filipinas": ["luya"], "Colombia": ["ajengible", "ajengibre", "ajingible", "anjengibre"], "USA_English": ["common ginger", "ginger"], "UK_English": ["ginger"], "India": ["adrak"], "China": ["sheng jiang"], "Japón": ["shoga"]},
+      propiedades: ["Digestiva", "Antiinflamatoria", "Antiemética", "Antioxidante", "Analgésica"],
+      parteUsable: "Rizoma",
+      dosis: "1-3 gramos de rizoma seco al día",
+      preparacion: "Infusión, decocción, en polvo, fresco",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "No se recomienda en altas dosis." }, { tipo: "otro", descripcion: "Cálculos biliares" }, { tipo: "hipertension", descripcion: "Puede elevar la presión arterial." }],
+      descripcion: "Planta aromática con un tallo subterráneo (rizoma) muy apreciado por su sabor picante y sus propiedades medicinales.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-musculoesqueletico", "sistema-inmunologico"],
+      categoriaId: "raices-y-tuberculos-medicinales",
+      categoria: "Raíces y tubérculos medicinales",
+    },
+    {
+      id: "curcuma",
+      nombre: "Cúrcuma",
+      nombreCientifico: "Curcuma longa",
+      nombresAlternativos: {"Cuba": ["polluelo", "azafrán cimarrón", "yuquilla"], "Puerto Rico": ["turmérico", "jengibrillo"], "Perú": ["palillo cholón", "palillo chuncho", "guisador", "palillo"], "Colombia": ["azafrán", "azafrán cimarrón", "curcuma", "cúrcuma", "guisador"], "USA_English": ["common turmeric", "turmeric", "Indian saffron", "golden herb", "yellow ginger saffron"], "UK_English": ["turmeric"], "Indigena": ["haldi (Hindi)"]},
+      propiedades: ["Antiinflamatoria", "Antioxidante", "Hepatoprotectora", "Colerética", "Antimicrobiana"],
+      parteUsable: "Rizoma",
+      dosis: "1.5-3 gramos de rizoma en polvo al día",
+      preparacion: "Polvo, extracto, infusión",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Obstrucción de las vías biliares" }, { tipo: "embarazo", descripcion: "No se recomienda su consumo." }, { tipo: "lactancia", descripcion: "No se recomienda su consumo." }],
+      descripcion: "Planta herbácea de la familia del jengibre, cuyo rizoma anaranjado se usa como especia y como antiinflamatorio natural.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-inmunologico", "enfermedades-piel", "sistema-musculoesqueletico"],
+      categoriaId: "raices-y-tuberculos-medicinales",
+      categoria: "Raíces y tubérculos medicinales",
+    },
+    {
+      id: "ginseng",
+      nombre: "Ginseng",
+      nombreCientifico: "Panax ginseng",
+      nombresAlternativos: {"China": ["Rénshēn"], "Corea": ["Insam"], "Japón": ["Ninjin"], "USA_English": ["asian ginseng", "chinese ginseng", "korean ginseng"], "UK_English": ["asian ginseng", "chinese ginseng", "korean ginseng"]},
+      propiedades: ["Adaptógeno", "Tónico", "Estimulante del sistema nervioso", "Inmunoestimulante", "Antioxidante"],
+      parteUsable: "Raíz",
+      dosis: "0.5-2 gramos de raíz seca al día",
+      preparacion: "Decocción, extracto, polvo",
+      contraindicaciones: [{ tipo: "hipertension", descripcion: "Puede elevar la presión arterial." }, { tipo: "otro", descripcion: "Insomnio" }, { tipo: "embarazo", descripcion: "No se recomienda su consumo." }, { tipo: "lactancia", descripcion: "No se recomienda su consumo." }, { tipo: "ninos", descripcion: "No se recomienda su consumo." }],
+      descripcion: "Raíz carnosa utilizada en la medicina tradicional china para mejorar la vitalidad, la resistencia y la función cognitiva.",
+      sistemasRelacionados: ["sistema-nervioso", "sistema-inmunologico", "sistema-endocrino", "trastornos-mentales-emocionales"],
+      categoriaId: "raices-y-tuberculos-medicinales",
+      categoria: "Raíces y tubérculos medicinales",
+    },
+    {
+      id: "astragalo",
+      nombre: "Astrágalo",
+      nombreCientifico: "Astragalus membranaceus",
+      nombresAlternativos: {"China": ["huáng qí", "běi qí"], "USA_English": ["milkvetch", "Mongolian milkvetch"], "UK_English": ["milkvetch"]},
+      propiedades: ["Inmunoestimulante", "Adaptógeno", "Cardioprotector", "Diurético", "Antioxidante"],
+      parteUsable: "Raíz",
+      dosis: "9-15 gramos de raíz seca en decocción",
+      preparacion: "Decocción, extracto, tintura",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Enfermedades autoinmunes" }, { tipo: "medicamentos", descripcion: "Puede interactuar con inmunosupresores." }],
+      descripcion: "Planta leguminosa cuya raíz se utiliza en la medicina tradicional china para fortalecer el sistema inmunológico y proteger el cuerpo del estrés.",
+      sistemasRelacionados: ["sistema-inmunologico", "sistema-cardiovascular", "sistema-urinario"],
+      categoriaId: "raices-y-tuberculos-medicinales",
+      categoria: "Raíces y tubérculos medicinales",
+    },
+    {
+      id: "regaliz",
+      nombre: "Regaliz",
+      nombreCientifico: "Glycyrrhiza glabra",
+      nombresAlternativos: {"España": ["regalicia", "orozuz", "orosús", "paloduz", "palodulce", "palodul", "arrezú"], "Argentina": ["orozús"], "USA_English": ["licorice", "sweetwood", "black sugar"], "UK_English": ["liquorice"]},
+      propiedades: ["Antiinflamatoria", "Expectorante", "Antiviral", "Hepatoprotectora", "Endulzante"],
+      parteUsable: "Raíz",
+      dosis: "5-15 gramos de raíz seca al día",
+      preparacion: "Decocción, infusión, extracto",
+      contraindicaciones: [{ tipo: "hipertension", descripcion: "Puede elevar la presión arterial." }, { tipo: "embarazo", descripcion: "No se recomienda su consumo." }, { tipo: "otro", descripcion: "Insuficiencia renal" }],
+      descripcion: "Planta cuya raíz de sabor dulce se utiliza para tratar afecciones respiratorias, digestivas y de la piel.",
+      sistemasRelacionados: ["sistema-respiratorio", "sistema-digestivo", "sistema-endocrino", "enfermedades-piel"],
+      categoriaId: "raices-y-tuberculos-medicinales",
+      categoria: "Raíces y tubérculos medicinales",
+    },
+    {
+      id: "valeriana",
+      nombre: "Valeriana",
+      nombreCientifico: "Valeriana officinalis",
+      nombresAlternativos: {"España": ["valeriana común", "valeriana de las boticas", "valeriana medicinal", "hierba de los gatos"], "Cataluña": ["herba gatera", "valedriana", "valeriana vera"], "Colombia": ["valeriana"], "Uruguay": ["yerba del gato", "belar", "bedukata", "yerba del aguilucho blanco"], "USA_English": ["garden heliotrope", "common valerian", "all-heal", "garden valerian", "greek valerian"], "UK_English": ["garden heliotrope", "common valerian", "all-heal", "garden valerian", "greek valerian"]},
+      propiedades: ["Sedante", "Ansiolítica", "Relajante muscular", "Hipotensora", "Antiespasmódica"],
+      parteUsable: "Raíz y rizoma",
+      dosis: "2-3 gramos de raíz seca en infusión antes de dormir",
+      preparacion: "Infusión, extracto, tintura",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "No se recomienda su consumo." }, { tipo: "lactancia", descripcion: "No se recomienda su consumo." }, { tipo: "medicamentos", descripcion: "Puede potenciar el efecto de otros sedantes." }],
+      descripcion: "Planta con flores rosadas cuya raíz se utiliza para tratar el insomnio, la ansiedad y el estrés.",
+      sistemasRelacionados: ["sistema-nervioso", "trastornos-mentales-emocionales"],
+      categoriaId: "raices-y-tuberculos-medicinales",
+      categoria: "Raíces y tubérculos medicinales",
+    },
+    {
+      id: "equinacea",
+      nombre: "Equinácea",
+      nombreCientifico: "Echinacea purpurea",
+      nombresAlternativos: {"España": ["equinácea"], "USA_English": ["purple coneflower", "hedgehog coneflower", "black sampson", "coneflower"], "UK_English": ["purple coneflower", "hedgehog coneflower", "black sampson", "coneflower"]},
+      propiedades: ["Inmunoestimulante", "Antiinflamatoria", "Antiviral", "Cicatrizante", "Antibacteriana"],
+      parteUsable: "Raíz y partes aéreas",
+      dosis: "1-2 gramos de raíz seca en infusión, 3 veces al día",
+      preparacion: "Infusión, extracto, tintura",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Enfermedades autoinmunes" }, { tipo: "alergia", descripcion: "Alergia a plantas de la familia de las margaritas." }],
+      descripcion: "Planta originaria de América del Norte, utilizada para prevenir y tratar resfriados, gripes y otras infecciones.",
+      sistemasRelacionados: ["sistema-inmunologico", "sistema-respiratorio", "enfermedades-piel"],
+      categoriaId: "raices-y-tuberculos-medicinales",
+      categoria: "Raíces y tubérculos medicinales",
+    },
+    {
+      id: "bardana",
+      nombre: "Bardana",
+      nombreCientifico: "Arctium lappa",
+      nombresAlternativos: {"España": ["lapa", "lampazo mayor", "gobó", "lampazo", "bardana mayor", "llapassa", "respingón", "agarrocha", "agarrucha", "aguipegotes", "amor de hortelano"], "USA_English": ["greater burdock", "edible burdock", "lappa", "beggar's buttons", "thorny burr", "happy major"], "UK_English": ["greater burdock", "edible burdock", "lappa", "beggar's buttons", "thorny burr", "happy major"]},
+      propiedades: ["Depurativa", "Diurética", "Sudorífica", "Antiinflamatoria", "Antimicrobiana"],
+      parteUsable: "Raíz",
+      dosis: "2-6 gramos de raíz seca en decocción, 3 veces al día",
+      preparacion: "Decocción, infusión, extracto",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "No se recomienda su consumo." }, { tipo: "lactancia", descripcion: "No se recomienda su consumo." }],
+      descripcion: "Planta bianual cuya raíz se utiliza para purificar la sangre, tratar afecciones de la piel y estimular la eliminación de toxinas.",
+      sistemasRelacionados: ["enfermedades-piel", "sistema-urinario", "sistema-digestivo", "sistema-linfatico"],
+      categoriaId: "raices-y-tuberculos-medicinales",
+      categoria: "Raíces y tubérculos medicinales",
+    },
+    {
+      id: "diente-de-leon-raiz",
+      nombre: "Diente de León (raíz)",
+      nombreCientifico: "Taraxacum officinale",
+      nombresAlternativos: {"España": ["diente de león", "achicoria amarga", "achicoria amarilla", "amargón", "cerraja", "moraja", "globillo", "lechuguilla"], "México": ["diente de león", "amargón", "cerraja", "moraja"], "USA_English": ["dandelion", "lion's-tooth", "blowball", "cankerwort", "faceclock", "pee-a-bed", "wet-a-bed", "Irish daisy"], "UK_English": ["dandelion", "pissy beds", "tiddle-beds", "wet-the-bed", "jack-piss-the-bed", "dog's posy", "swine's snout"]},
+      propiedades: ["Depurativa", "Diurética", "Colerética", "Hepatoprotectora", "Tónico amargo"],
+      parteUsable: "Raíz",
+      dosis: "2-8 gramos de raíz seca en decocción, 3 veces al día",
+      preparacion: "Decocción, infusión, extracto",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Obstrucción de las vías biliares" }, { tipo: "alergia", descripcion: "Alergia a plantas de la familia de las margaritas." }],
+      descripcion: "Planta común cuyas raíces amargas se utilizan para estimular la función hepática y renal, y mejorar la digestión.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-urinario", "sistema-linfatico"],
+      categoriaId: "raices-y-tuberculos-medicinales",
+      categoria: "Raíces y tubérculos medicinales",
+    },
+    {
+      id: "maca",
+      nombre: "Maca",
+      nombreCientifico: "Lepidium meyenii",
+      nombresAlternativos: {"Perú": ["maca-maca", "maino", "ayak chichira", "ayak willku"], "USA_English": ["maca", "Peruvian ginseng"], "UK_English": ["maca", "Peruvian ginseng"], "Indigena": ["maka", "ayak chichira", "ayak willku (Quechua)"]},
+      propiedades: ["Adaptógeno", "Energizante", "Fertilidad", "Regulador hormonal", "Nutritiva"],
+      parteUsable: "Raíz",
+      dosis: "1.5-3 gramos de polvo de raíz al día",
+      preparacion: "Polvo, cápsulas, extracto",
+      contraindicaciones: [{ tipo: "hipertension", descripcion: "Puede elevar la presión arterial en algunas personas." }, { tipo: "embarazo", descripcion: "Consultar con un médico." }],
+      descripcion: "Planta andina cuya raíz se utiliza para aumentar la energía, la resistencia, la libido y la fertilidad.",
+      sistemasRelacionados: ["sistema-endocrino", "sistema-reproductor", "sistema-nervioso"],
+      categoriaId: "raices-y-tuberculos-medicinales",
+      categoria: "Raíces y tubérculos medicinales",
+    },
+    {
+      id: "ashwagandha",
+      nombre: "Ashwagandha",
+      nombreCientifico: "Withania somnifera",
+      nombresAlternativos: {"España": ["bufera", "oroval", "orval", "hierba mora mayor"], "USA_English": ["Indian ginseng", "winter cherry", "poison gooseberry"], "UK_English": ["Indian ginseng", "winter cherry"]},
+      propiedades: ["Adaptógeno", "Ansiolítica", "Antiinflamatoria", "Inmunoestimulante", "Tónico nervioso"],
+      parteUsable: "Raíz",
+      dosis: "3-6 gramos de polvo de raíz al día",
+      preparacion: "Polvo, cápsulas, extracto",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "No se recomienda su consumo." }, { tipo: "otro", descripcion: "Hipertiroidismo" }, { tipo: "medicamentos", descripcion: "Puede interactuar con sedantes e inmunosupresores." }],
+      descripcion: "Hierba fundamental en la medicina ayurvédica, utilizada para combatir el estrés, mejorar la función cerebral y aumentar los niveles de energía.",
+      sistemasRelacionados: ["sistema-nervioso", "sistema-endocrino", "sistema-inmunologico", "trastornos-mentales-emocionales"],
+      categoriaId: "raices-y-tuberculos-medicinales",
+      categoria: "Raíces y tubérculos medicinales",
+    },
+    {
+      id: "sello-de-oro",
+      nombre: "Sello de Oro",
+      nombreCientifico: "Hydrastis canadensis",
+      nombresAlternativos: {"España": ["hidrastis", "sello de oro", "cúrcuma canadiense"], "USA_English": ["goldenseal", "orangeroot", "yellow puccoon", "eye root", "ground raspberry", "tumeric"], "UK_English": ["goldenseal"]},
+      propiedades: ["Antimicrobiana", "Antiinflamatoria", "Astringente", "Tónico amargo", "Inmunoestimulante"],
+      parteUsable: "Rizoma y raíces",
+      dosis: "0.5-1 gramo de raíz seca, 3 veces al día",
+      preparacion: "Decocción, tintura, cápsulas",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "No se recomienda su consumo." }, { tipo: "lactancia", descripcion: "No se recomienda su consumo." }, { tipo: "hipertension", descripcion: "Puede elevar la presión arterial." }],
+      descripcion: "Planta nativa de América del Norte cuya raíz se usa para infecciones de las mucosas.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-respiratorio", "sistema-inmunologico"],
+      categoriaId: "raices-y-tuberculos-medicinales",
+      categoria: "Raíces y tubérculos medicinales",
+    },
+    {
+      id: "angelica",
+      nombre: "Angélica",
+      nombreCientifico: "Angelica archangelica",
+      nombresAlternativos: {"España": ["ajonjera", "hierba angélica", "hierba de los ángeles", "hierba del espíritu santo", "chirivía silvestre"], "USA_English": ["garden angelica", "wild celery", "norwegian angelica", "archangel", "holy ghost"], "UK_English": ["garden angelica", "wild celery", "norwegian angelica", "archangel", "holy ghost"], "Otros": ["aingueru bedarra", "angèlica", "väinönputki", "alexandris"]},
+      propiedades: ["Digestiva", "Carminativa", "Expectorante", "Antiespasmódica", "Diurética"],
+      parteUsable: "Raíz",
+      dosis: "1-2 gramos de raíz seca en infusión, 3 veces al día",
+      preparacion: "Infusión, decocción, tintura",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "No se recomienda su consumo." }, { tipo: "diabetes", descripcion: "Puede afectar los niveles de azúcar en sangre." }],
+      descripcion: "Planta aromática utilizada para trastornos digestivos, problemas respiratorios y como tónico general.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-respiratorio", "sistema-nervioso"],
+      categoriaId: "raices-y-tuberculos-medicinales",
+      categoria: "Raíces y tubérculos medicinales",
+    },
+    {
+      id: "ruibarbo",
+      nombre: "Ruibarbo",
+      nombreCientifico: "Rheum rhabarbarum",
+      nombresAlternativos: {"España": ["ruibarbo", "rubarbo"], "USA_English": ["rhubarb", "pie-plant"], "UK_English": ["rhubarb"], "Otros": ["arabarba", "ruibarbre"]},
+      propiedades: ["Laxante", "Purgante", "Astringente", "Digestiva", "Antiinflamatoria"],
+      parteUsable: "Rizoma",
+      dosis: "0.2-1 gramo para efecto laxante; 2-4 gramos para efecto purgante.",
+      preparacion: "Polvo, decocción",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "No se recomienda su consumo." }, { tipo: "ninos", descripcion: "No usar en niños menores de 12 años." }, { tipo: "otro", descripcion: "Obstrucción intestinal, enfermedad de Crohn, colitis ulcerosa." }],
+      descripcion: "Planta con grandes hojas y tallos comestibles, cuyo rizoma se usa como laxante potente.",
+      sistemasRelacionados: ["sistema-digestivo"],
+      categoriaId: "raices-y-tuberculos-medicinales",
+      categoria: "Raíces y tubérculos medicinales",
+    },
+    {
+      id: "malvavisco",
+      nombre: "Malvavisco",
+      nombreCientifico: "Althaea officinalis",
+      nombresAlternativos: {"España": ["malvavisco", "altea", "bismalva", "hierba cañamera", "malvarisco", "malavadisco", "maldevisco", "malobispo", "malovisco"], "USA_English": ["marsh mallow", "common marshmallow"], "UK_English": ["marsh mallow"]},
+      propiedades: ["Demulcente", "Emoliente", "Antiinflamatoria", "Expectorante", "Diurética"],
+      parteUsable: "Raíz",
+      dosis: "2-5 gramos de raíz seca en maceración o decocción",
+      preparacion: "Maceración en frío, decocción, jarabe",
+      contraindicaciones: [{ tipo: "diabetes", descripcion: "Puede afectar los niveles de azúcar en sangre." }],
+      descripcion: "Planta cuyas raíces ricas en mucílago se usan para calmar la irritación de las mucosas del sistema digestivo y respiratorio.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-respiratorio", "sistema-urinario", "enfermedades-piel"],
+      categoriaId: "raices-y-tuberculos-medicinales",
+      categoria: "Raíces y tubérculos medicinales",
+    },
+    {
+      id: "osha",
+      nombre: "Osha",
+      nombreCientifico: "Ligusticum porteri",
+      nombresAlternativos: {"Mexico": ["chuchupate", "chuchupati", "hierba de cochino"], "USA_English": ["osha", "Porter's lovage", "bear root", "loveroot", "wild parsley", "Indian parsley"], "Indigena": ["chuchupa'at"]},
+      propiedades: ["Antiviral", "Expectorante", "Diaforética", "Inmunoestimulante", "Antimicrobiana"],
+      parteUsable: "Raíz",
+      dosis: "1-2 gramos de raíz seca en decocción",
+      preparacion: "Decocción, tintura, masticar la raíz",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "No se recomienda su consumo." }],
+      descripcion: "Raíz sagrada para muchas tribus nativas americanas, utilizada para tratar infecciones respiratorias y fortalecer el sistema inmunológico.",
+      sistemasRelacionados: ["sistema-respiratorio", "sistema-inmunologico"],
+      categoriaId: "raices-y-tuberculos-medicinales",
+      categoria: "Raíces y tubérculos medicinales",
+    },
+    {
+      id: "calamo-aromatico",
+      nombre: "Cálamo Aromático",
+      nombreCientifico: "Acorus calamus",
+      nombresAlternativos: {"España": ["ácoro dulce", "ácoro aromático", "cálamo acuático", "ácoro verdadero"], "USA_English": ["sweet flag", "muskrat root", "calamus"], "UK_English": ["sweet flag"]},
+      propiedades: ["Carminativo", "Estimulante digestivo", "Tónico nervioso", "Expectorante", "Antiespasmódico"],
+      parteUsable: "Rizoma",
+      dosis: "1-3 gramos de rizoma seco al día",
+      preparacion: "Infusión, decocción, polvo",
+      contraindicaciones: [{ tipo: "otro", descripcion: "La variedad norteamericana es segura; la europea y asiática pueden contener beta-asarona, un compuesto potencialmente tóxico y carcinógeno. Usar con precaución." }, { tipo: "embarazo", descripcion: "No se recomienda su consumo." }],
+      descripcion: "Planta acuática cuyo rizoma aromático se ha utilizado tradicionalmente para problemas digestivos y para mejorar la claridad mental.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-nervioso", "sistema-respiratorio"],
+      categoriaId: "raices-y-tuberculos-medicinales",
+      categoria: "Raíces y tubérculos medicinales",
+    },
+    {
+      id: "genciana",
+      nombre: "Genciana",
+      nombreCientifico: "Gentiana lutea",
+      nombresAlternativos: {"España": ["genciana", "junciana", "xanzaina", "chonzana", "genciana amarilla", "genciana mayor"], "USA_English": ["great yellow gentian", "yellow gentian", "bitter root", "bitterwort"], "UK_English": ["great yellow gentian"]},
+      propiedades: ["Tónico amargo", "Estimulante digestivo", "Colagoga", "Antipirética", "Sialagoga"],
+      parteUsable: "Raíz",
+      dosis: "0.5-1 gramo de raíz seca antes de las comidas",
+      preparacion: "Infusión, decocción, tintura",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Úlcera gástrica o duodenal, hiperacidez." }, { tipo: "embarazo", descripcion: "No se recomienda su consumo." }],
+      descripcion: "Planta de montaña con una raíz muy amarga, utilizada para estimular el apetito y la digestión.",
+      sistemasRelacionados: ["sistema-digestivo"],
+      categoriaId: "raices-y-tuberculos-medicinales",
+      categoria: "Raíces y tubérculos medicinales",
+    },
+    {
+      id: "rabano-picante",
+      nombre: "Rábano Picante",
+      nombreCientifico: "Armoracia rusticana",
+      nombresAlternativos: {"España": ["rábano rusticano", "rábano de caballo", "rábano picante", "raíz picante"], "USA_English": ["horseradish", "pepper root", "pepper turnip", "red cole", "stingnose"], "UK_English": ["horseradish", "red cole"]},
+      propiedades: ["Estimulante circulatorio", "Descongestionante", "Antimicrobiano", "Diurético", "Rubefaciente"],
+      parteUsable: "Raíz",
+      dosis: "Pequeñas cantidades como condimento.",
+      preparacion: "Fresco rallado, en salsas",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Hipotiroidismo, úlceras gastrointestinales, enfermedad renal." }, { tipo: "ninos", descripcion: "No recomendado en grandes cantidades." }],
+      descripcion: "Raíz de sabor fuerte y picante, utilizada como condimento y para despejar los senos nasales y estimular la circulación.",
+      sistemasRelacionados: ["sistema-respiratorio", "sistema-digestivo", "sistema-urinario"],
+      categoriaId: "raices-y-tuberculos-medicinales",
+      categoria: "Raíces y tubérculos medicinales",
+    },
+    {
+      id: "yuca",
+      nombre: "Yuca",
+      nombreCientifico: "Yucca schidigera",
+      nombresAlternativos: {"Mexico": ["Yuca", "Mandioca"], "Colombia": ["Yuca", "Mandioca"], "Peru": ["Yuca", "Mandioca"], "Caribe": ["Yuca", "Mandioca"], "USA_English": ["Cassava", "Yuca", "Manioc"], "UK_English": ["Cassava", "Yuca", "Manioc"]},
+      propiedades: ["Antiinflamatoria", "Antirreumática", "Saponinas", "Depurativa", "Analgésica"],
+      parteUsable: "Raíz",
+      dosis: "Extractos estandarizados según fabricante.",
+      preparacion: "Extracto, cápsulas, polvo",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "Consultar con un médico." }, { tipo: "lactancia", descripcion: "Consultar con un médico." }],
+      descripcion: "Planta del desierto cuya raíz es rica en saponinas, compuestos con potentes propiedades antiinflamatorias, utilizada para la artritis y el reumatismo.",
+      sistemasRelacionados: ["sistema-musculoesqueletico", "sistema-digestivo"],
+      categoriaId: "raices-y-tuberculos-medicinales",
+      categoria: "Raíces y tubérculos medicinales",
+    },
+    {
+      id: "batata",
+      nombre: "Batata",
+      nombreCientifico: "Ipomoea batatas",
+      nombresAlternativos: {"España": ["boniato", "batata"], "Mexico": ["camote"], "Argentina": ["batata"], "Colombia": ["batata"], "Peru": ["camote", "apichu"], "Chile": ["camote"], "Centroamerica": ["camote"], "Caribe": ["boniato"], "USA_English": ["sweet potato"], "Indigena": ["camohtli", "agcum", "becua", "bengua'ma", "camoj"]},
+      propiedades: ["Nutritiva", "Antioxidante", "Antiinflamatoria", "Reguladora del azúcar", "Inmunoestimulante"],
+      parteUsable: "Tubérculo",
+      dosis: "Consumo como alimento.",
+      preparacion: "Cocida, asada, al vapor",
+      contraindicaciones: [],
+      descripcion: "Tubérculo dulce y nutritivo, rico en betacarotenos (vitamina A), fibra y antioxidantes. Beneficioso para la vista, la piel y el sistema inmune.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-inmunologico", "enfermedades-piel", "enfermedades-ojos-oidos-nariz-garganta"],
+      categoriaId: "raices-y-tuberculos-medicinales",
+      categoria: "Raíces y tubérculos medicinales",
+    },
+    {
+      id: "remolacha",
+      nombre: "Remolacha",
+      nombreCientifico: "Beta vulgaris",
+      nombresAlternativos: {"España": ["acelga", "remolacha"], "Mexico": ["betabel"], "Argentina": ["remolacha"], "Colombia": ["remolacha"], "Peru": ["betarraga"], "Chile": ["betarraga"], "USA_English": ["beet", "chard", "leaf beet", "red beet"], "UK_English": ["beet", "chard"]},
+      propiedades: ["Hepatoprotectora", "Desintoxicante", "Antihipertensiva", "Antioxidante", "Mejora el rendimiento deportivo"],
+      parteUsable: "Raíz",
+      dosis: "Consumo como alimento o zumo.",
+      preparacion: "Cruda, cocida, en zumo",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Tendencia a formar cálculos renales de oxalato." }],
+      descripcion: "Raíz de color rojo intenso, conocida por su capacidad para mejorar la salud del hígado, reducir la presión arterial y aumentar la resistencia física.",
+      sistemasRelacionados: ["sistema-cardiovascular", "sistema-digestivo", "sistema-linfatico"],
+      categoriaId: "raices-y-tuberculos-medicinales",
+      categoria: "Raíces y tubérculos medicinales",
+    },
+    {
+      id: "zanahoria",
+      nombre: "Zanahoria",
+      nombreCientifico: "Daucus carota",
+      nombresAlternativos: {"España": ["zanahoria", "acenoria", "azenoria", "bufanagas", "carrota"], "USA_English": ["wild carrot", "Queen Anne's lace", "bird's nest", "bishop's lace"], "UK_English": ["wild carrot", "Queen Anne's lace"]},
+      propiedades: ["Rica en Vitamina A", "Antioxidante", "Salud ocular", "Salud de la piel", "Digestiva"],
+      parteUsable: "Raíz",
+      dosis: "Consumo como alimento.",
+      preparacion: "Cruda, cocida, en zumo",
+      contraindicaciones: [],
+      descripcion: "Raíz crujiente y dulce, famosa por su alto contenido de betacarotenos, esenciales para una buena visión y una piel sana.",
+      sistemasRelacionados: ["enfermedades-ojos-oidos-nariz-garganta", "enfermedades-piel", "sistema-digestivo"],
+      categoriaId: "raices-y-tuberculos-medicinales",
+      categoria: "Raíces y tubérculos medicinales",
+    },
+    {
+      id: "nabo",
+      nombre: "Nabo",
+      nombreCientifico: "Brassica rapa",
+      nombresAlternativos: {"España": ["nabo", "berza", "naba", "raba", "rábano blanco"], "Mexico": ["mostaza", "pata de cuervo", "semilla para pájaros", "vaina", "flor de nabo", "nabo de canarios"], "Argentina": ["nabo", "nabo silvestre", "nabolza"], "USA_English": ["turnip", "field mustard", "bird's-rape"], "UK_English": ["turnip", "field mustard"]},
+      propiedades: ["Expectorante", "Diurético", "Rico en Vitamina C", "Antiinflamatorio", "Digestivo"],
+      parteUsable: "Raíz",
+      dosis: "Consumo como alimento.",
+      preparacion: "Cocido, en caldos, purés",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Hipotiroidismo (consumo excesivo y crudo)." }],
+      descripcion: "Raíz de sabor ligeramente picante, utilizada tradicionalmente para aliviar la tos y los resfriados, y por sus propiedades diuréticas.",
+      sistemasRelacionados: ["sistema-respiratorio", "sistema-urinario", "sistema-digestivo"],
+      categoriaId: "raices-y-tuberculos-medicinales",
+      categoria: "Raíces y tubérculos medicinales",
+    },
+    {
+      id: "chirivia",
+      nombre: "Chirivía",
+      nombreCientifico: "Pastinaca sativa",
+      nombresAlternativos: {"España": ["chirivía", "pastinaca", "apio de campo", "zanahoria blanca"], "USA_English": ["parsnip", "wild parsnip"], "UK_English": ["parsnip"]},
+      propiedades: ["Diurética", "Digestiva", "Rica en potasio", "Rica en fibra", "Antioxidante"],
+      parteUsable: "Raíz",
+      dosis: "Consumo como alimento.",
+      preparacion: "Cocida, asada, en purés",
+      contraindicaciones: [],
+      descripcion: "Raíz similar a la zanahoria pero de color blanco y sabor más dulce y anisado. Es diurética y ayuda a regular la presión arterial.",
+      sistemasRelacionados: ["sistema-urinario", "sistema-digestivo", "sistema-cardiovascular"],
+      categoriaId: "raices-y-tuberculos-medicinales",
+      categoria: "Raíces y tubérculos medicinales",
+    },
+    {
+      id: "apionabo",
+      nombre: "Apionabo",
+      nombreCientifico: "Apium graveolens var. rapaceum",
+      nombresAlternativos: {"España": ["apio nabo", "apionabo", "apio rábano"], "USA_English": ["celeriac", "celery root"], "UK_English": ["celeriac"]},
+      propiedades: ["Diurético", "Remineralizante", "Digestivo", "Depurativo", "Antiinflamatorio"],
+      parteUsable: "Raíz",
+      dosis: "Consumo como alimento.",
+      preparacion: "Crudo en ensaladas, cocido, en purés",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Insuficiencia renal grave." }],
+      descripcion: "Variedad de apio cuya raíz grande y bulbosa se consume. Tiene un sabor intenso y es un potente diurético y depurativo.",
+      sistemasRelacionados: ["sistema-urinario", "sistema-digestivo", "sistema-musculoesqueletico"],
+      categoriaId: "raices-y-tuberculos-medicinales",
+      categoria: "Raíces y tubérculos medicinales",
+    },
+    {
+      id: "rabano",
+      nombre: "Rábano",
+      nombreCientifico: "Raphanus sativus",
+      nombresAlternativos: {"España": ["rábano", "rabaneta", "rabanete"], "Mexico": ["rabanito", "nabón", "jaramao"], "USA_English": ["radish", "wild radish", "garden radish"], "UK_English": ["radish"], "Indigena": ["coo-guiña-nagali", "gu-gila-ztilla"]},
+      propiedades: ["Colagogo", "Colerético", "Antiséptico", "Expectorante", "Diurético"],
+      parteUsable: "Raíz",
+      dosis: "Consumo como alimento o en zumo.",
+      preparacion: "Crudo, en ensaladas, zumo",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Hipotiroidismo (consumo excesivo)." }],
+      descripcion: "Raíz pequeña y picante, especialmente el rábano negro, que estimula la producción y flujo de bilis, ayudando a la función hepática y de la vesícula.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-respiratorio", "sistema-urinario"],
+      categoriaId: "raices-y-tuberculos-medicinales",
+      categoria: "Raíces y tubérculos medicinales",
+    },
+    {
+      id: "colirrabano",
+      nombre: "Colirrábano",
+      nombreCientifico: "Brassica oleracea var. gongylodes",
+      nombresAlternativos: {"España": ["colirrábano", "col rábano", "colinabo"], "USA_English": ["kohlrabi", "German turnip", "turnip cabbage"], "UK_English": ["kohlrabi"]},
+      propiedades: ["Rico en Vitamina C", "Antioxidante", "Digestivo", "Bajo en calorías", "Rico en fibra"],
+      parteUsable: "Tallo engrosado (tubérculo aéreo)",
+      dosis: "Consumo como alimento.",
+      preparacion: "Crudo, cocido, asado",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Hipotiroidismo (consumo excesivo y crudo)." }],
+      descripcion: "Variedad de col cuyo tallo se engrosa formando un tubérculo sobre la superficie del suelo. Es crujiente y jugoso, rico en vitamina C.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-inmunologico"],
+      categoriaId: "raices-y-tuberculos-medicinales",
+      categoria: "Raíces y tubérculos medicinales",
+    },
+    {
+      id: "tupinambo",
+      nombre: "Tupinambo",
+      nombreCientifico: "Helianthus tuberosus",
+      nombresAlternativos: {"España": ["tupinambo", "topinambur", "pataca", "alcachofa de Jerusalén", "girasol de Canadá", "aguaturma", "bataca"], "Argentina": ["tupinambo", "pataca"], "Chile": ["tupinambo"], "USA_English": ["Jerusalem artichoke", "sunchoke", "sunroot", "earth apple"], "UK_English": ["Jerusalem artichoke"], "Indigena": ["tupinambá"]},
+      propiedades: ["Prebiótico (rico en inulina)", "Regulador del azúcar", "Digestivo", "Bajo índice glucémico", "Saciente"],
+      parteUsable: "Tubérculo",
+      dosis: "Consumo como alimento.",
+      preparacion: "Cocido, asado, en purés",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Puede causar flatulencia en personas no acostumbradas a la inulina." }],
+      descripcion: "También conocido como alcachofa de Jerusalén, es un tubérculo rico en inulina, un prebiótico que alimenta la flora intestinal y ayuda a regular el azúcar en sangre.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-endocrino"],
+      categoriaId: "raices-y-tuberculos-medicinales",
+      categoria: "Raíces y tubérculos medicinales",
+    },
+    {
+      id: "arracacha",
+      nombre: "Arracacha",
+      nombreCientifico: "Arracacia xanthorrhiza",
+      nombresAlternativos: {"Colombia": ["arracacha", "arracache", "apio criollo"], "Peru": ["racacha", "virraca"], "Chile": ["arracacha"], "USA_English": ["arracacha", "Peruvian parsnip", "white carrot"], "Indigena": ["rakacha", "laquchu", "huiasampilla", "lakachu", "lecachu"]},
+      propiedades: ["Digestiva", "Energética", "Rica en calcio", "Fácil de digerir", "Nutritiva"],
+      parteUsable: "Raíz tuberosa",
+      dosis: "Consumo como alimento.",
+      preparacion: "Cocida, en sopas, purés",
+      contraindicaciones: [],
+      descripcion: "Raíz tuberosa andina de sabor similar a una mezcla de apio, zanahoria y castaña. Es muy digestiva y nutritiva, ideal para niños y ancianos.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-musculoesqueletico"],
+      categoriaId: "raices-y-tuberculos-medicinales",
+      categoria: "Raíces y tubérculos medicinales",
+    },
+    {
+      id: "ulluco",
+      nombre: "Ulluco",
+      nombreCientifico: "Ullucus tuberosus",
+      nombresAlternativos: {"Colombia": ["ulluco", "chugua", "ruba"], "Peru": ["olluco", "papa lisa"], "Chile": ["ulluco"], "Argentina": ["ulluma"], "USA_English": ["ulluco"], "Indigena": ["ulluku", "illaku", "milluku", "ulluma"]},
+      propiedades: ["Nutritivo", "Rico en Vitamina C", "Cicatrizante", "Antiinflamatorio", "Hidratante"],
+      parteUsable: "Tubérculo",
+      dosis: "Consumo como alimento.",
+      preparacion: "Cocido, en sopas, guisos",
+      contraindicaciones: [],
+      descripcion: "Tubérculo andino de colores vivos y textura mucilaginosa. Es nutritivo y se le atribuyen propiedades cicatrizantes y antiinflamatorias.",
+      sistemasRelacionados: ["enfermedades-piel", "sistema-digestivo", "sistema-inmunologico"],
+      categoriaId: "raices-y-tuberculos-medicinales",
+      categoria: "Raíces y tubérculos medicinales",
+    },
+    {
+      id: "oca",
+      nombre: "Oca",
+      nombreCientifico: "Oxalis tuberosa",
+      nombresAlternativos: {"Colombia": ["ibia"], "Peru": ["oca", "papa oca", "apiha", "apiña", "apilla", "arrachaca"], "Chile": ["cavi"], "Argentina": ["oca"], "USA_English": ["oca", "New Zealand yam"], "UK_English": ["New Zealand yam"], "Indigena": ["uqa", "kawi", "lamaki", "timbo", "quiba", "huisisaj"]},
+      propiedades: ["Energética", "Rica en carbohidratos", "Antioxidante", "Ligeramente laxante", "Nutritiva"],
+      parteUsable: "Tubérculo",
+      dosis: "Consumo como alimento.",
+      preparacion: "Cocida, asada, frita (previamente soleada para reducir acidez)",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Alto contenido de oxalatos, no recomendado para personas con problemas renales o gota." }],
+      descripcion: "Tubérculo andino de sabor ácido que se vuelve más dulce al exponerlo al sol. Es una buena fuente de energía y antioxidantes.",
+      sistemasRelacionados: ["sistema-digestivo"],
+      categoriaId: "raices-y-tuberculos-medicinales",
+      categoria: "Raíces y tubérculos medicinales",
+    },
+    {
+      id: "mashua",
+      nombre: "Mashua",
+      nombreCientifico: "Tropaeolum tuberosum",
+      nombresAlternativos: {"Colombia": ["cubio", "navios", "navo", "puel"], "Peru": ["mashua", "añu", "isaño", "majua"], "Chile": ["mashua"], "Argentina": ["mashua"], "USA_English": ["mashua", "tuberous nasturtium"], "Indigena": ["mashwa", "añu", "isaño", "apiñu", "apiña-mama", "yanaoca", "isau", "kkayacha"]},
+      propiedades: ["Anterógeno (reduce la testosterona)", "Antibacteriana", "Insecticida", "Diurética", "Antioxidante"],
+      parteUsable: "Tubérculo",
+      dosis: "Consumo como alimento.",
+      preparacion: "Cocida, en sopas, guisos",
+      contraindicaciones: [{ tipo: "otro", descripcion: "No recomendado para hombres que deseen tener hijos por su efecto anterógeno." }],
+      descripcion: "Tubérculo andino con un sabor picante y floral. Se le conoce por sus propiedades antibacterianas y por reducir los niveles de testosterona.",
+      sistemasRelacionados: ["sistema-reproductor", "sistema-urinario"],
+      categoriaId: "raices-y-tuberculos-medicinales",
+      categoria: "Raíces y tubérculos medicinales",
+    },
+    {
+      id: "taro",
+      nombre: "Taro",
+      nombreCientifico: "Colocasia esculenta",
+      nombresAlternativos: {"Mexico": ["malanga"], "Colombia": ["ñame", "malanga", "achín", "bore morado", "chícalo", "chícol", "chícolo", "chicul"], "Peru": ["pituca", "bituca", "mayro", "onkucha"], "Caribe": ["yautía coco", "ñampí"], "USA_English": ["taro", "elephant ear", "dasheen", "coco-yam", "eddo"], "UK_English": ["taro", "elephant ear"], "Indigena": ["kalo"]},
+      propiedades: ["Nutritivo", "Hipoalergénico", "Fácil de digerir", "Rico en fibra", "Regulador del azúcar"],
+      parteUsable: "Cormo (tubérculo)",
+      dosis: "Consumo como alimento, siempre cocido.",
+      preparacion: "Cocido, al vapor, en purés (NUNCA CRUDO por su toxicidad)",
+      contraindicaciones: [{ tipo: "alergia", descripcion: "El cormo crudo es tóxico debido a los cristales de oxalato de calcio." }],
+      descripcion: "Tubérculo tropical básico en muchas culturas. Es nutritivo, fácil de digerir y una buena fuente de carbohidratos complejos.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-inmunologico"],
+      categoriaId: "raices-y-tuberculos-medicinales",
+      categoria: "Raíces y tubérculos medicinales",
+    },
+    {
+      id: "atractylodes",
+      nombre: "Atractylodes",
+      nombreCientifico: "Atractylodes macrocephala",
+      nombresAlternativos: {"USA_English": ["Atractylodes", "large-headed Atractylodes"], "UK_English": ["Atractylodes"]},
+      propiedades: ["Tónico del Bazo (MTC)", "Diurético", "Digestivo", "Antidiaforético", "Inmunoestimulante"],
+      parteUsable: "Rizoma",
+      dosis: "6-12 gramos en decocción.",
+      preparacion: "Decocción",
+      contraindicaciones: [{ tipo: "otro", descripcion: "En casos de sequedad o deficiencia de líquidos corporales." }],
+      descripcion: "Hierba importante en la Medicina Tradicional China (MTC) para tonificar el Bazo, mejorar la digestión, eliminar la humedad y detener la sudoración excesiva.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-urinario", "sistema-inmunologico"],
+      categoriaId: "raices-y-tuberculos-medicinales",
+      categoria: "Raíces y tubérculos medicinales",
+    },
+    {
+      id: "codonopsis",
+      nombre: "Codonopsis",
+      nombreCientifico: "Codonopsis pilosula",
+      nombresAlternativos: {"USA_English": ["Codonopsis", "bonnet bellflower", "poor man's ginseng"], "UK_English": ["Codonopsis"]},
+      propiedades: ["Adaptógeno", "Tónico de Qi", "Inmunoestimulante", "Tónico pulmonar", "Galactagoga"],
+      parteUsable: "Raíz",
+      dosis: "9-30 gramos en decocción.",
+      preparacion: "Decocción, en sopas",
+      contraindicaciones: [],
+      descripcion: "Conocida como el \"ginseng de los pobres\", es una raíz tónica suave utilizada en MTC para aumentar la energía (Qi), fortalecer los pulmones y el sistema inmune.",
+      sistemasRelacionados: ["sistema-inmunologico", "sistema-respiratorio", "sistema-digestivo", "sistema-reproductor"],
+      categoriaId: "raices-y-tuberculos-medicinales",
+      categoria: "Raíces y tubérculos medicinales",
+    },
+    {
+      id: "rehmannia",
+      nombre: "Rehmannia",
+      nombreCientifico: "Rehmannia glutinosa",
+      nombresAlternativos: {"USA_English": ["Chinese foxglove"], "UK_English": ["Chinese foxglove"]},
+      propiedades: ["Tónico de la sangre y del Yin", "Antiinflamatoria", "Inmunomoduladora", "Neuroprotectora", "Regulador hormonal"],
+      parteUsable: "Raíz (preparada y cruda)",
+      dosis: "9-15 gramos en decocción.",
+      preparacion: "Decocción",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Dificil de digerir, usar con precaución en personas con debilidad digestiva." }],
+      descripcion: "Raíz fundamental en MTC para nutrir la sangre y el Yin, tratar trastornos hormonales, enfermedades autoinmunes y problemas relacionados con el envejecimiento.",
+      sistemasRelacionados: ["sistema-endocrino", "sistema-reproductor", "sistema-inmunologico", "sistema-nervioso", "sistema-urinario"],
+      categoriaId: "raices-y-tuberculos-medicinales",
+      categoria: "Raíces y tubérculos medicinales",
+    },
+    {
+      id: "peonia-blanca",
+      nombre: "Peonía Blanca",
+      nombreCientifico: "Paeonia lactiflora",
+      nombresAlternativos: {"España": ["peonía china", "peonía híbrida", "rosa de monte", "rosa sin espinas"], "USA_English": ["Chinese peony", "common garden peony"], "UK_English": ["Chinese peony"]},
+      propiedades: ["Analgésica", "Antiespasmódica", "Antiinflamatoria", "Reguladora menstrual", "Hepatoprotectora"],
+      parteUsable: "Raíz",
+      dosis: "6-15 gramos en decocción.",
+      preparacion: "Decocción",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "Usar con precaución." }],
+      descripcion: "La raíz de peonía blanca se usa en MTC para nutrir la sangre, calmar el dolor (especialmente ginecológico y muscular), y suavizar el hígado.",
+      sistemasRelacionados: ["sistema-reproductor", "sistema-musculoesqueletico", "sistema-digestivo", "sistema-nervioso"],
+      categoriaId: "raices-y-tuberculos-medicinales",
+      categoria: "Raíces y tubérculos medicinales",
+    },
+    {
+      id: "galanga",
+      nombre: "Galanga",
+      nombreCientifico: "Alpinia galanga",
+      nombresAlternativos: {"España": ["galanga", "jengibre de siam", "galanga de java", "galanga de la india", "calanga", "galangal mayor", "jengibre siamés"], "USA_English": ["lesser galangal", "greater galangal", "siamese ginger", "java galangal", "blue ginger", "thai ginger"], "UK_English": ["lesser galangal", "greater galangal", "siamese ginger", "java galangal", "blue ginger", "thai ginger"], "Otros": ["lengkuas", "hang dou kou", "stor kalanga", "el adkham", "gaoliangjiang"]},
+      propiedades: ["Carminativa", "Antiinflamatoria", "Antiemética", "Antimicrobiana", "Estimulante circulatorio"],
+      parteUsable: "Rizoma",
+      dosis: "1-3 gramos de rizoma seco.",
+      preparacion: "Decocción, polvo, en la cocina",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Úlcera péptica activa." }],
+      descripcion: "Rizoma de la familia del jengibre con un sabor picante y alcanforado. Se utiliza para problemas digestivos, náuseas y para mejorar la circulación.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-cardiovascular"],
+      categoriaId: "raices-y-tuberculos-medicinales",
+      categoria: "Raíces y tubérculos medicinales",
+    },
+    {
+      id: "sarsaparrilla",
+      nombre: "Zarzaparrilla",
+      nombreCientifico: "Smilax officinalis",
+      nombresAlternativos: {"España": ["zarzaparrilla"], "Mexico": ["zarzaparrilla"], "Colombia": ["zarzaparrilla"], "Peru": ["zarzaparrilla"], "Chile": ["zarzaparrilla"], "Centroamerica": ["zarzaparrilla"], "Caribe": ["zarzaparrilla"], "USA_English": ["sarsaparilla"], "UK_English": ["sarsaparilla"]},
+      propiedades: ["Depurativa", "Antiinflamatoria", "Antirreumática", "Diaforética", "Hepatoprotectora"],
+      parteUsable: "Raíz",
+      dosis: "1-4 gramos de raíz seca en decocción, 3 veces al día.",
+      preparacion: "Decocción, tintura",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Insuficiencia renal." }, { tipo: "embarazo", descripcion: "No se recomienda su consumo." }],
+      descripcion: "Raíz utilizada tradicionalmente para \"limpiar la sangre\", tratar afecciones de la piel como la psoriasis y el eccema, y para el reumatismo y la gota.",
+      sistemasRelacionados: ["enfermedades-piel", "sistema-musculoesqueletico", "sistema-urinario", "sistema-linfatico"],
+      categoriaId: "raices-y-tuberculos-medicinales",
+      categoria: "Raíces y tubérculos medicinales",
+    },
+    {
+      id: "mandioca",
+      nombre: "Mandioca",
+      nombreCientifico: "Manihot esculenta",
+      nombresAlternativos: {"España": ["mandioca", "yuca"], "Mexico": ["yuca"], "Argentina": ["mandioca"], "Colombia": ["yuca", "mandioca"], "Peru": ["yuca"], "Chile": ["mandioca"], "Centroamerica": ["yuca"], "Caribe": ["yuca"], "USA_English": ["cassava", "yuca", "manioc"], "UK_English": ["cassava"]},
+      propiedades: ["Nutritiva", "Energética", "Rica en carbohidratos", "Sin gluten", "Fuente de Vitamina C"],
+      parteUsable: "Raíz tuberosa",
+      dosis: "Consumo como alimento, siempre cocida.",
+      preparacion: "Hervida, frita, asada, en harina (tapioca). NUNCA CRUDA.",
+      contraindicaciones: [{ tipo: "otro", descripcion: "La variedad amarga contiene altos niveles de precursores de cianuro y debe ser procesada adecuadamente para eliminar la toxicidad." }],
+      descripcion: "También conocida como yuca o casava, es una raíz tuberosa fundamental en la alimentación de muchas regiones tropicales. Es una excelente fuente de carbohidratos.",
+      sistemasRelacionados: ["sistema-digestivo"],
+      categoriaId: "raices-y-tuberculos-medicinales",
+      categoria: "Raíces y tubérculos medicinales",
+    },
+    {
+      id: "crosne",
+      nombre: "Crosne",
+      nombreCientifico: "Stachys affinis",
+      nombresAlternativos: {"España": ["crosne", "alcachofa china"], "USA_English": ["crosne", "Chinese artichoke", "Japanese artichoke"], "UK_English": ["crosne", "Chinese artichoke"]},
+      propiedades: ["Digestiva", "Nutritiva", "Ligeramente dulce", "Textura crujiente", "Baja en calorías"],
+      parteUsable: "Tubérculo",
+      dosis: "Consumo como alimento.",
+      preparacion: "Salteado, al vapor, encurtido",
+      contraindicaciones: [],
+      descripcion: "Pequeño tubérculo de forma peculiar y textura crujiente, similar a una alcachofa o una castaña de agua. Se consume como una hortaliza gourmet.",
+      sistemasRelacionados: ["sistema-digestivo"],
+      categoriaId: "raices-y-tuberculos-medicinales",
+      categoria: "Raíces y tubérculos medicinales",
+    },
+    {
+      id: "eleuterococo",
+      nombre: "Eleuterococo",
+      nombreCientifico: "Eleutherococcus senticosus",
+      nombresAlternativos: {"España": ["ginseng siberiano", "eleuterococo", "eleutero"], "USA_English": ["Siberian ginseng", "eleuthero", "devil's bush", "taiga root", "ciwujia", "Devil's shrub", "shigoka", "touch-me-not", "wild pepper", "kan jang"], "UK_English": ["Siberian ginseng", "eleuthero"]},
+      propiedades: ["Adaptógeno", "Inmunoestimulante", "Antifatiga", "Mejora el rendimiento físico y mental", "Tónico"],
+      parteUsable: "Raíz",
+      dosis: "2-3 gramos de raíz seca al día.",
+      preparacion: "Decocción, extracto, cápsulas",
+      contraindicaciones: [{ tipo: "hipertension", descripcion: "No usar en personas con presión arterial por encima de 180/90 mmHg." }, { tipo: "embarazo", descripcion: "No se recomienda su consumo." }],
+      descripcion: "Conocido como Ginseng Siberiano, es un arbusto cuya raíz se utiliza para aumentar la resistencia al estrés, combatir la fatiga y mejorar la concentración.",
+      sistemasRelacionados: ["sistema-nervioso", "sistema-inmunologico", "sistema-endocrino", "trastornos-mentales-emocionales"],
+      categoriaId: "raices-y-tuberculos-medicinales",
+      categoria: "Raíces y tubérculos medicinales",
+    },
+    {
+      id: "cimicifuga",
+      nombre: "Cimicífuga",
+      nombreCientifico: "Actaea racemosa",
+      nombresAlternativos: {"España": ["cimicífuga", "cohosh negro"], "USA_English": ["black cohosh", "black bugbane", "black snakeroot"], "UK_English": ["black cohosh"]},
+      propiedades: ["Regulador hormonal (estrogénico)", "Antiespasmódico", "Antiinflamatorio", "Sedante", "Alivio de síntomas menopáusicos"],
+      parteUsable: "Rizoma y raíces",
+      dosis: "Extractos estandarizados (generalmente 40-80 mg al día).",
+      preparacion: "Extracto, cápsulas, tintura",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Enfermedades hepáticas." }, { tipo: "embarazo", descripcion: "No se recomienda su consumo." }, { tipo: "medicamentos", descripcion: "Consultar al médico si se toman terapias hormonales." }],
+      descripcion: "También conocida como cohosh negro, es una planta cuya raíz se usa principalmente para aliviar los síntomas de la menopausia, como los sofocos y los cambios de humor.",
+      sistemasRelacionados: ["sistema-reproductor", "sistema-endocrino", "sistema-nervioso"],
+      categoriaId: "raices-y-tuberculos-medicinales",
+      categoria: "Raíces y tubérculos medicinales",
+    },
+    {
+      id: "polygala",
+      nombre: "Polygala",
+      nombreCientifico: "Polygala tenuifolia",
+      nombresAlternativos: {"España": ["polygala"], "USA_English": ["Seneca snakeroot", "milkwort"], "UK_English": ["milkwort"]},
+      propiedades: ["Expectorante", "Neuroprotectora", "Calmante", "Tónico cerebral", "Restaurador del Shen (MTC)"],
+      parteUsable: "Raíz",
+      dosis: "3-9 gramos en decocción.",
+      preparacion: "Decocción",
+      contraindicaciones: [{ tipo: "otro", descripcion: "En casos de úlcera gástrica." }],
+      descripcion: "Raíz utilizada en MTC para calmar el espíritu (Shen), mejorar la memoria y la función cognitiva, y como un potente expectorante para eliminar la flema de los pulmones.",
+      sistemasRelacionados: ["sistema-nervioso", "sistema-respiratorio", "trastornos-mentales-emocionales"],
+      categoriaId: "raices-y-tuberculos-medicinales",
+      categoria: "Raíces y tubérculos medicinales",
+    },
+  ],
+};
+
+export default categoria;
@@ -0,0 +1,605 @@
+// Generado automáticamente por scripts/build-catalog.py - no editar a mano
+import type { CategoriaPlanta } from '../../plantas-expandidas';
+
+const categoria: CategoriaPlanta = {
+  id: "semillas-y-frutos-secos-medicinales",
+  nombre: "Semillas y frutos secos medicinales",
+  plantas: [
+    {
+      id: "linaza",
+      nombre: "Linaza",
+      nombreCientifico: "Linum usitatissimum",
+      nombresAlternativos: {"España": ["lino"], "México": ["linaza"], "USA_English": ["flaxseed", "linseed"], "UK_English": ["flaxseed", "linseed"]},
+      propiedades: ["Antiinflamatoria", "Digestiva", "Antioxidante", "Hipocolesterolemiante"],
+      parteUsable: "Semillas",
+      dosis: "1-2 cucharadas al día",
+      preparacion: "Remojar en agua, moler o añadir a los alimentos",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Puede causar obstrucción intestinal si no se consume con suficiente líquido." }],
+      descripcion: "La linaza es una semilla rica en fibra y ácidos grasos omega-3, beneficiosa para la salud digestiva y cardiovascular.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-cardiovascular"],
+      categoriaId: "semillas-y-frutos-secos-medicinales",
+      categoria: "Semillas y frutos secos medicinales",
+    },
+    {
+      id: "chia",
+      nombre: "Chía",
+      nombreCientifico: "Salvia hispanica",
+      nombresAlternativos: {"México": ["chan"], "Centroamérica": ["chan"], "USA_English": ["chia"], "UK_English": ["chia"], "Indigena": ["chía (náhuatl)"]},
+      propiedades: ["Hidratante", "Antioxidante", "Energizante", "Digestiva"],
+      parteUsable: "Semillas",
+      dosis: "1-2 cucharadas al día",
+      preparacion: "Remojar en líquido para formar un gel, añadir a batidos o yogur",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Puede bajar la presión arterial, precaución en personas con hipotensión." }],
+      descripcion: "Las semillas de chía son conocidas por su capacidad para absorber líquido y formar un gel, proporcionando hidratación y energía.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-cardiovascular", "sistema-nervioso"],
+      categoriaId: "semillas-y-frutos-secos-medicinales",
+      categoria: "Semillas y frutos secos medicinales",
+    },
+    {
+      id: "canamo",
+      nombre: "Cáñamo",
+      nombreCientifico: "Cannabis sativa",
+      nombresAlternativos: {"España": ["grifa", "alfalfa", "mandanga"], "México": ["mota", "yerba"], "Argentina": ["porro", "macoña"], "Colombia": ["bareta", "bacoa"], "Chile": ["pito", "caño"], "USA_English": ["hemp", "marijuana"], "UK_English": ["hemp", "marijuana"]},
+      propiedades: ["Antiinflamatoria", "Nutritiva", "Analgésica"],
+      parteUsable: "Semillas",
+      dosis: "1-3 cucharadas al día",
+      preparacion: "Consumir las semillas peladas, en aceite o en polvo de proteína",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Las semillas de cáñamo no contienen THC en cantidades significativas, pero se recomienda precaución en personas con alergias a frutos secos." }],
+      descripcion: "Las semillas de cáñamo son una fuente completa de proteínas y ácidos grasos esenciales, beneficiosas para la salud del corazón y la piel.",
+      sistemasRelacionados: ["sistema-cardiovascular", "enfermedades-piel", "sistema-musculoesqueletico"],
+      categoriaId: "semillas-y-frutos-secos-medicinales",
+      categoria: "Semillas y frutos secos medicinales",
+    },
+    {
+      id: "calabaza-semillas",
+      nombre: "Semillas de Calabaza",
+      nombreCientifico: "Cucurbita pepo",
+      nombresAlternativos: {"España": ["pepitas de calabaza"], "México": ["pepitas"], "Centroamérica": ["ayote"], "Caribe": ["pipas"], "USA_English": ["pumpkin seeds"], "UK_English": ["pumpkin seeds"]},
+      propiedades: ["Antiparasitaria", "Prostática", "Nutritiva"],
+      parteUsable: "Semillas",
+      dosis: "Un puñado (20-30g) al día",
+      preparacion: "Consumir crudas o tostadas",
+      contraindicaciones: [{ tipo: "alergia", descripcion: "Puede causar alergia en personas sensibles a las cucurbitáceas." }],
+      descripcion: "Las semillas de calabaza son ricas en zinc y se utilizan tradicionalmente para la salud de la próstata y como antiparasitario.",
+      sistemasRelacionados: ["sistema-urinario", "sistema-reproductor", "sistema-inmunologico"],
+      categoriaId: "semillas-y-frutos-secos-medicinales",
+      categoria: "Semillas y frutos secos medicinales",
+    },
+    {
+      id: "girasol-semillas",
+      nombre: "Semillas de Girasol",
+      nombreCientifico: "Helianthus annuus",
+      propiedades: ["Antioxidante", "Antiinflamatoria", "Nutritiva"],
+      parteUsable: "Semillas",
+      dosis: "Un puñado (20-30g) al día",
+      preparacion: "Consumir crudas o tostadas",
+      contraindicaciones: [{ tipo: "alergia", descripcion: "Puede causar reacciones alérgicas en personas sensibles." }],
+      descripcion: "Las semillas de girasol son una excelente fuente de vitamina E, un potente antioxidante que protege las células del daño.",
+      sistemasRelacionados: ["sistema-cardiovascular", "enfermedades-piel", "sistema-inmunologico"],
+      categoriaId: "semillas-y-frutos-secos-medicinales",
+      categoria: "Semillas y frutos secos medicinales",
+    },
+    {
+      id: "sesamo",
+      nombre: "Sésamo",
+      nombreCientifico: "Sesamum indicum",
+      nombresAlternativos: {"España": ["ajonjolí"], "México": ["ajonjolí"], "Colombia": ["ajonjolí"], "Caribe": ["ajonjolí"], "USA_English": ["sesame seeds"], "UK_English": ["sesame seeds"]},
+      propiedades: ["Antioxidante", "Remineralizante", "Neuroprotectora"],
+      parteUsable: "Semillas",
+      dosis: "1-2 cucharadas al día",
+      preparacion: "Consumir crudas, tostadas, en tahini o aceite",
+      contraindicaciones: [{ tipo: "alergia", descripcion: "El sésamo es un alérgeno común." }],
+      descripcion: "El sésamo es rico en calcio y otros minerales, beneficioso para la salud ósea y nerviosa.",
+      sistemasRelacionados: ["sistema-musculoesqueletico", "sistema-nervioso", "sistema-cardiovascular"],
+      categoriaId: "semillas-y-frutos-secos-medicinales",
+      categoria: "Semillas y frutos secos medicinales",
+    },
+    {
+      id: "almendra",
+      nombre: "Almendra",
+      nombreCientifico: "Prunus dulcis",
+      nombresAlternativos: {"USA_English": ["almond"], "UK_English": ["almond"]},
+      propiedades: ["Nutritiva", "Hipocolesterolemiante", "Antioxidante"],
+      parteUsable: "Fruto (semilla)",
+      dosis: "Un puñado (20-30g) al día",
+      preparacion: "Consumir crudas, tostadas, en leche o harina",
+      contraindicaciones: [{ tipo: "alergia", descripcion: "Las almendras son un alérgeno común de los frutos secos." }],
+      descripcion: "Las almendras son ricas en grasas saludables, vitamina E y magnesio, promoviendo la salud del corazón y el control del azúcar en sangre.",
+      sistemasRelacionados: ["sistema-cardiovascular", "sistema-nervioso", "sistema-endocrino"],
+      categoriaId: "semillas-y-frutos-secos-medicinales",
+      categoria: "Semillas y frutos secos medicinales",
+    },
+    {
+      id: "nuez",
+      nombre: "Nuez",
+      nombreCientifico: "Juglans regia",
+      nombresAlternativos: {"USA_English": ["walnut"], "UK_English": ["walnut"]},
+      propiedades: ["Neuroprotectora", "Cardioprotectora", "Antiinflamatoria"],
+      parteUsable: "Fruto (semilla)",
+      dosis: "Un puñado (20-30g) al día",
+      preparacion: "Consumir crudas",
+      contraindicaciones: [{ tipo: "alergia", descripcion: "Las nueces son un alérgeno común de los frutos secos." }],
+      descripcion: "Las nueces son excepcionalmente ricas en ácidos grasos omega-3, beneficiando la función cerebral y la salud del corazón.",
+      sistemasRelacionados: ["sistema-nervioso", "sistema-cardiovascular", "trastornos-mentales-emocionales"],
+      categoriaId: "semillas-y-frutos-secos-medicinales",
+      categoria: "Semillas y frutos secos medicinales",
+    },
+    {
+      id: "avellana",
+      nombre: "Avellana",
+      nombreCientifico: "Corylus avellana",
+      nombresAlternativos: {"España": ["avellano"], "USA_English": ["hazelnut"], "UK_English": ["hazelnut"]},
+      propiedades: ["Cardioprotectora", "Antioxidante", "Nutritiva"],
+      parteUsable: "Fruto (semilla)",
+      dosis: "Un puñado (20-30g) al día",
+      preparacion: "Consumir crudas o tostadas",
+      contraindicaciones: [{ tipo: "alergia", descripcion: "Las avellanas son un alérgeno común de los frutos secos." }],
+      descripcion: "Las avellanas son una buena fuente de grasas monoinsaturadas, vitamina E y manganeso, apoyando la salud del corazón.",
+      sistemasRelacionados: ["sistema-cardiovascular", "sistema-nervioso"],
+      categoriaId: "semillas-y-frutos-secos-medicinales",
+      categoria: "Semillas y frutos secos medicinales",
+    },
+    {
+      id: "castana",
+      nombre: "Castaña",
+      nombreCientifico: "Castanea sativa",
+      nombresAlternativos: {"España": ["castaño"], "USA_English": ["chestnut"], "UK_English": ["chestnut"]},
+      propiedades: ["Energizante", "Digestiva", "Astringente"],
+      parteUsable: "Fruto",
+      dosis: "3-5 castañas al día",
+      preparacion: "Asadas, cocidas o en harina",
+      contraindicaciones: [{ tipo: "diabetes", descripcion: "Tienen un índice glucémico más alto que otros frutos secos, consumir con moderación." }],
+      descripcion: "A diferencia de otros frutos secos, las castañas son ricas en carbohidratos complejos y vitamina C, proporcionando energía sostenida.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-inmunologico"],
+      categoriaId: "semillas-y-frutos-secos-medicinales",
+      categoria: "Semillas y frutos secos medicinales",
+    },
+    {
+      id: "pistacho",
+      nombre: "Pistacho",
+      nombreCientifico: "Pistacia vera",
+      nombresAlternativos: {"España": ["alfóncigo"], "USA_English": ["pistachio"], "UK_English": ["pistachio"]},
+      propiedades: ["Antioxidante", "Cardioprotectora", "Salud ocular"],
+      parteUsable: "Fruto (semilla)",
+      dosis: "Un puñado (30-40g) al día",
+      preparacion: "Consumir crudos o tostados",
+      contraindicaciones: [{ tipo: "alergia", descripcion: "Los pistachos son un alérgeno común de los frutos secos." }],
+      descripcion: "Los pistachos son ricos en luteína y zeaxantina, antioxidantes importantes para la salud de los ojos.",
+      sistemasRelacionados: ["sistema-cardiovascular", "enfermedades-ojos-oidos-nariz-garganta", "sistema-nervioso"],
+      categoriaId: "semillas-y-frutos-secos-medicinales",
+      categoria: "Semillas y frutos secos medicinales",
+    },
+    {
+      id: "nuez-de-brasil",
+      nombre: "Nuez de Brasil",
+      nombreCientifico: "Bertholletia excelsa",
+      nombresAlternativos: {"Perú": ["castaña amazónica"], "Colombia": ["coquito brasileño"], "USA_English": ["Brazil nut"], "UK_English": ["Brazil nut"]},
+      propiedades: ["Antioxidante", "Tiroidea", "Antiinflamatoria"],
+      parteUsable: "Fruto (semilla)",
+      dosis: "1-2 nueces al día",
+      preparacion: "Consumir crudas",
+      contraindicaciones: [{ tipo: "otro", descripcion: "El consumo excesivo puede llevar a toxicidad por selenio (selenosis)." }],
+      descripcion: "Las nueces de Brasil son la fuente natural más rica en selenio, un mineral esencial para la función tiroidea y la protección antioxidante.",
+      sistemasRelacionados: ["sistema-endocrino", "sistema-inmunologico", "sistema-reproductor"],
+      categoriaId: "semillas-y-frutos-secos-medicinales",
+      categoria: "Semillas y frutos secos medicinales",
+    },
+    {
+      id: "nuez-pecana",
+      nombre: "Nuez Pecana",
+      nombreCientifico: "Carya illinoinensis",
+      nombresAlternativos: {"México": ["nuez de la isla", "nuez encarcelada"], "USA_English": ["pecan"], "UK_English": ["pecan"]},
+      propiedades: ["Antioxidante", "Hipocolesterolemiante", "Antiinflamatoria"],
+      parteUsable: "Fruto (semilla)",
+      dosis: "Un puñado (20-30g) al día",
+      preparacion: "Consumir crudas o en preparaciones",
+      contraindicaciones: [{ tipo: "alergia", descripcion: "Las nueces pecanas son un alérgeno de los frutos secos." }],
+      descripcion: "Las nueces pecanas son ricas en grasas monoinsaturadas y antioxidantes, ayudando a reducir el colesterol malo (LDL).",
+      sistemasRelacionados: ["sistema-cardiovascular", "sistema-nervioso"],
+      categoriaId: "semillas-y-frutos-secos-medicinales",
+      categoria: "Semillas y frutos secos medicinales",
+    },
+    {
+      id: "anacardo",
+      nombre: "Anacardo",
+      nombreCientifico: "Anacardium occidentale",
+      nombresAlternativos: {"México": ["marañón"], "Colombia": ["marañón"], "Perú": ["marañón"], "Centroamérica": ["marañón"], "Caribe": ["cajú"], "USA_English": ["cashew"], "UK_English": ["cashew"]},
+      propiedades: ["Energizante", "Remineralizante", "Salud ósea"],
+      parteUsable: "Fruto (semilla)",
+      dosis: "Un puñado (20-30g) al día",
+      preparacion: "Consumir tostados (crudos son tóxicos)",
+      contraindicaciones: [{ tipo: "alergia", descripcion: "Los anacardos son un alérgeno común de los frutos secos." }],
+      descripcion: "Los anacardos son una buena fuente de cobre y magnesio, minerales importantes para la salud ósea y la producción de energía.",
+      sistemasRelacionados: ["sistema-musculoesqueletico", "sistema-nervioso", "sistema-inmunologico"],
+      categoriaId: "semillas-y-frutos-secos-medicinales",
+      categoria: "Semillas y frutos secos medicinales",
+    },
+    {
+      id: "pinon",
+      nombre: "Piñón",
+      nombreCientifico: "Pinus pinea",
+      nombresAlternativos: {"España": ["pino piñonero", "pino manso", "pino doncel"], "USA_English": ["pine nut"], "UK_English": ["pine nut"]},
+      propiedades: ["Energizante", "Saciante", "Salud ocular"],
+      parteUsable: "Semilla",
+      dosis: "1-2 cucharadas al día",
+      preparacion: "Consumir crudos o tostados, en pestos y ensaladas",
+      contraindicaciones: [{ tipo: "alergia", descripcion: "Los piñones pueden causar reacciones alérgicas." }],
+      descripcion: "Los piñones contienen ácido pinolénico, que puede ayudar a suprimir el apetito, y luteína para la salud ocular.",
+      sistemasRelacionados: ["sistema-cardiovascular", "enfermedades-ojos-oidos-nariz-garganta", "sistema-digestivo"],
+      categoriaId: "semillas-y-frutos-secos-medicinales",
+      categoria: "Semillas y frutos secos medicinales",
+    },
+    {
+      id: "nuez-de-macadamia",
+      nombre: "Nuez de Macadamia",
+      nombreCientifico: "Macadamia integrifolia",
+      nombresAlternativos: {"USA_English": ["macadamia nut"], "UK_English": ["macadamia nut"]},
+      propiedades: ["Cardioprotectora", "Hipocolesterolemiante", "Antioxidante"],
+      parteUsable: "Fruto (semilla)",
+      dosis: "Un puñado (20-30g) al día",
+      preparacion: "Consumir crudas o tostadas",
+      contraindicaciones: [{ tipo: "alergia", descripcion: "Las nueces de macadamia son un alérgeno de los frutos secos." }],
+      descripcion: "Las nueces de macadamia son muy ricas en grasas monoinsaturadas saludables para el corazón, similares a las del aceite de oliva.",
+      sistemasRelacionados: ["sistema-cardiovascular", "sistema-nervioso"],
+      categoriaId: "semillas-y-frutos-secos-medicinales",
+      categoria: "Semillas y frutos secos medicinales",
+    },
+    {
+      id: "semillas-de-amapola",
+      nombre: "Semillas de Amapola",
+      nombreCientifico: "Papaver somniferum",
+      propiedades: ["Relajante", "Remineralizante", "Antitusiva"],
+      parteUsable: "Semillas",
+      dosis: "1 cucharadita al día",
+      preparacion: "Añadir a productos horneados, ensaladas o infusiones",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Pueden dar falsos positivos en pruebas de opiáceos. Consumir con moderación." }],
+      descripcion: "Las semillas de amapola son ricas en minerales como calcio y manganeso, y tienen un ligero efecto sedante.",
+      sistemasRelacionados: ["sistema-nervioso", "sistema-musculoesqueletico", "sistema-respiratorio"],
+      categoriaId: "semillas-y-frutos-secos-medicinales",
+      categoria: "Semillas y frutos secos medicinales",
+    },
+    {
+      id: "semillas-de-mostaza",
+      nombre: "Semillas de Mostaza",
+      nombreCientifico: "Brassica nigra / Sinapis alba",
+      propiedades: ["Rubefaciente", "Estimulante digestivo", "Antiinflamatoria"],
+      parteUsable: "Semillas",
+      dosis: "Uso externo en cataplasmas, uso interno con moderación",
+      preparacion: "Cataplasmas, molidas como especia",
+      contraindicaciones: [{ tipo: "otro", descripcion: "El uso externo prolongado puede causar irritación o quemaduras en la piel." }],
+      descripcion: "Las semillas de mostaza se usan externamente para aliviar dolores musculares y congestión, y como especia para estimular la digestión.",
+      sistemasRelacionados: ["sistema-musculoesqueletico", "sistema-digestivo", "sistema-respiratorio"],
+      categoriaId: "semillas-y-frutos-secos-medicinales",
+      categoria: "Semillas y frutos secos medicinales",
+    },
+    {
+      id: "semillas-de-apio",
+      nombre: "Semillas de Apio",
+      nombreCientifico: "Apium graveolens",
+      propiedades: ["Diurética", "Antiinflamatoria", "Carminativa"],
+      parteUsable: "Semillas",
+      dosis: "1/2 a 1 cucharadita de semillas, o en extracto",
+      preparacion: "Infusión, extracto o como especia",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "Puede estimular el útero." }, { tipo: "ninos", descripcion: "No recomendado en niños pequeños." }],
+      descripcion: "Las semillas de apio se utilizan tradicionalmente como diurético y para aliviar el dolor articular asociado con la gota y la artritis.",
+      sistemasRelacionados: ["sistema-urinario", "sistema-musculoesqueletico", "sistema-digestivo"],
+      categoriaId: "semillas-y-frutos-secos-medicinales",
+      categoria: "Semillas y frutos secos medicinales",
+    },
+    {
+      id: "semillas-de-hinojo",
+      nombre: "Semillas de Hinojo",
+      nombreCientifico: "Foeniculum vulgare",
+      propiedades: ["Carminativa", "Digestiva", "Antiespasmódica"],
+      parteUsable: "Semillas",
+      dosis: "1-2 cucharaditas en infusión",
+      preparacion: "Infusión, masticar las semillas",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "Altas dosis pueden ser uterotónicas." }],
+      descripcion: "Las semillas de hinojo son excelentes para aliviar gases, hinchazón y cólicos digestivos.",
+      sistemasRelacionados: ["sistema-digestivo"],
+      categoriaId: "semillas-y-frutos-secos-medicinales",
+      categoria: "Semillas y frutos secos medicinales",
+    },
+    {
+      id: "semillas-de-comino",
+      nombre: "Semillas de Comino",
+      nombreCientifico: "Cuminum cyminum",
+      propiedades: ["Digestiva", "Carminativa", "Antioxidante"],
+      parteUsable: "Semillas",
+      dosis: "1/2 a 1 cucharadita en infusión o como especia",
+      preparacion: "Infusión, especia en polvo",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Puede aumentar la sensibilidad al sol en algunas personas." }],
+      descripcion: "El comino es una especia digestiva que ayuda a la secreción de enzimas pancreáticas, mejorando la absorción de nutrientes.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-inmunologico"],
+      categoriaId: "semillas-y-frutos-secos-medicinales",
+      categoria: "Semillas y frutos secos medicinales",
+    },
+    {
+      id: "semillas-de-cardamomo",
+      nombre: "Semillas de Cardamomo",
+      nombreCientifico: "Elettaria cardamomum",
+      nombresAlternativos: {"España": ["cardamomo", "grana del paraíso"], "USA_English": ["green cardamom", "true cardamom", "Cardamom", "Cardamon", "Cardamum"], "UK_English": ["green cardamom", "true cardamom"], "Indigena": ["Elachi", "Hari Elachi"]},
+      propiedades: ["Digestiva", "Carminativa", "Expectorante"],
+      parteUsable: "Semillas",
+      dosis: "2-3 vainas en infusión o en la comida",
+      preparacion: "Infusión, masticar, especia",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Personas con cálculos biliares deben consultar a su médico." }],
+      descripcion: "El cardamomo es una especia aromática que ayuda a la digestión, combate el mal aliento y puede ayudar a aliviar la congestión.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-respiratorio"],
+      categoriaId: "semillas-y-frutos-secos-medicinales",
+      categoria: "Semillas y frutos secos medicinales",
+    },
+    {
+      id: "semillas-de-cilantro",
+      nombre: "Semillas de Cilantro",
+      nombreCientifico: "Coriandrum sativum",
+      nombresAlternativos: {"España": ["cilantro", "coriandro", "culantro europeo", "perejil chino", "dannia", "culantro Castilla"], "Mexico": ["cilantro", "perejil chino"], "Peru": ["culantro Castilla", "culantro"], "Colombia": ["cilantro"], "Chile": ["cilantro"], "Centroamerica": ["culantro"], "Caribe": ["culantro", "recao"], "USA_English": ["cilantro", "coriander", "Chinese parsley"], "UK_English": ["coriander"]},
+      propiedades: ["Digestiva", "Carminativa", "Antioxidante"],
+      parteUsable: "Semillas",
+      dosis: "1 cucharadita en infusión",
+      preparacion: "Infusión, especia",
+      contraindicaciones: [{ tipo: "alergia", descripcion: "Puede causar reacciones alérgicas en personas sensibles." }],
+      descripcion: "Las semillas de cilantro ayudan a aliviar problemas digestivos como la indigestión y los gases.",
+      sistemasRelacionados: ["sistema-digestivo"],
+      categoriaId: "semillas-y-frutos-secos-medicinales",
+      categoria: "Semillas y frutos secos medicinales",
+    },
+    {
+      id: "semillas-de-anis",
+      nombre: "Semillas de Anís",
+      nombreCientifico: "Pimpinella anisum",
+      nombresAlternativos: {"España": ["anís", "anís verde", "matalahúva", "matalahúga", "anix", "ajenjos dulces", "amisa"], "USA_English": ["Anise", "Aniseed", "Anise burnet saxifrage"], "UK_English": ["Anise", "Aniseed"], "Indigena": ["Saunf"]},
+      propiedades: ["Carminativa", "Expectorante", "Antiespasmódica"],
+      parteUsable: "Semillas",
+      dosis: "1 cucharadita en infusión",
+      preparacion: "Infusión",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "Evitar altas dosis durante el embarazo." }],
+      descripcion: "El anís es conocido por su capacidad para aliviar los gases y la hinchazón, y también se usa para la tos y los resfriados.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-respiratorio"],
+      categoriaId: "semillas-y-frutos-secos-medicinales",
+      categoria: "Semillas y frutos secos medicinales",
+    },
+    {
+      id: "semillas-de-alcaravea",
+      nombre: "Semillas de Alcaravea",
+      nombreCientifico: "Carum carvi",
+      nombresAlternativos: {"España": ["alcaravea", "alcarabia", "alcarahueya", "carvia", "caravai", "alcaravia", "comino de prado", "alcaraveta", "alcarabaca", "alcarobea", "alkarobea", "carbia", "txarpoil", "txarpoila"], "USA_English": ["Caraway", "meridian fennel", "Persian cumin", "black caraway"], "UK_English": ["Caraway", "meridian fennel"]},
+      propiedades: ["Carminativa", "Digestiva", "Antimicrobiana"],
+      parteUsable: "Semillas",
+      dosis: "1 cucharadita en infusión",
+      preparacion: "Infusión, masticar las semillas",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "Evitar su uso en grandes cantidades." }],
+      descripcion: "Similar al comino y al hinojo, la alcaravea es excelente para tratar la indigestión, los gases y los cólicos.",
+      sistemasRelacionados: ["sistema-digestivo"],
+      categoriaId: "semillas-y-frutos-secos-medicinales",
+      categoria: "Semillas y frutos secos medicinales",
+    },
+    {
+      id: "semillas-de-eneldo",
+      nombre: "Semillas de Eneldo",
+      nombreCientifico: "Anethum graveolens",
+      nombresAlternativos: {"España": ["eneldo", "aneto", "anega", "aneldo", "ezamillo", "falso anís", "hinojo falso"], "USA_English": ["dill", "American Dill", "Dillweed"], "UK_English": ["dill"], "Caribe": ["anet"]},
+      propiedades: ["Carminativa", "Antiespasmódica", "Galactagoga"],
+      parteUsable: "Semillas",
+      dosis: "1-2 cucharaditas en infusión",
+      preparacion: "Infusión",
+      contraindicaciones: [{ tipo: "alergia", descripcion: "Puede causar reacciones alérgicas." }],
+      descripcion: "Las semillas de eneldo son útiles para los trastornos digestivos y tradicionalmente se han utilizado para promover la producción de leche materna.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-reproductor"],
+      categoriaId: "semillas-y-frutos-secos-medicinales",
+      categoria: "Semillas y frutos secos medicinales",
+    },
+    {
+      id: "semillas-de-fenogreco",
+      nombre: "Semillas de Fenogreco",
+      nombreCientifico: "Trigonella foenum-graecum",
+      nombresAlternativos: {"España": ["fenogreco", "fenugreco", "alholva"], "USA_English": ["Fenugreek", "Bird's Foot", "Goat's Horn", "Greek Clover", "Greek Hay", "Greek Hayseed"], "UK_English": ["Fenugreek", "Bird's Foot", "Goat's Horn", "Greek Clover", "Greek Hay", "Greek Hayseed"], "Indigena": ["Methi", "abish", "abesh", "hilba"]},
+      propiedades: ["Hipoglucemiante", "Galactagoga", "Antiinflamatoria"],
+      parteUsable: "Semillas",
+      dosis: "1-2 cucharaditas remojadas o en infusión",
+      preparacion: "Remojar, infusión, polvo",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "Puede inducir contracciones uterinas." }, { tipo: "medicamentos", descripcion: "Puede interactuar con anticoagulantes y medicamentos para la diabetes." }],
+      descripcion: "El fenogreco se usa para ayudar a controlar el azúcar en sangre, aumentar la producción de leche materna y como antiinflamatorio.",
+      sistemasRelacionados: ["sistema-endocrino", "sistema-reproductor", "sistema-digestivo"],
+      categoriaId: "semillas-y-frutos-secos-medicinales",
+      categoria: "Semillas y frutos secos medicinales",
+    },
+    {
+      id: "cacahuete",
+      nombre: "Cacahuete",
+      nombreCientifico: "Arachis hypogaea",
+      nombresAlternativos: {"México": ["cacahuate"], "Argentina": ["maní"], "Colombia": ["maní"], "Perú": ["maní"], "Chile": ["maní"], "Centroamérica": ["maní"], "Caribe": ["maní"], "USA_English": ["peanut"], "UK_English": ["peanut"], "Indigena": ["tlalcacahuatl (náhuatl)"]},
+      propiedades: ["Energizante", "Nutritiva", "Antioxidante"],
+      parteUsable: "Semilla",
+      dosis: "Un puñado (30g) al día",
+      preparacion: "Crudo, tostado, en mantequilla",
+      contraindicaciones: [{ tipo: "alergia", descripcion: "El cacahuete es uno de los alérgenos más comunes y severos." }],
+      descripcion: "Aunque es una legumbre, se consume como fruto seco. Es rico en proteínas, grasas saludables y resveratrol.",
+      sistemasRelacionados: ["sistema-cardiovascular", "sistema-nervioso"],
+      categoriaId: "semillas-y-frutos-secos-medicinales",
+      categoria: "Semillas y frutos secos medicinales",
+    },
+    {
+      id: "semillas-de-uva",
+      nombre: "Semillas de Uva",
+      nombreCientifico: "Vitis vinifera",
+      nombresAlternativos: {"España": ["vid", "parra", "cepa", "majuelo", "labrusca", "lambrusquera", "parra bravía", "parra cultivada", "parra de uvas", "parral", "parreña", "parrera", "ácere", "bitau", "carrazos", "aihena", "albillo"], "USA_English": ["grape", "common grapevine", "European grape", "table grape", "wine grape"], "UK_English": ["grape", "common grapevine", "European grape", "table grape", "wine grape"]},
+      propiedades: ["Antioxidante", "Vasoprotectora", "Antiinflamatoria"],
+      parteUsable: "Semillas (extracto)",
+      dosis: "100-300 mg de extracto al día",
+      preparacion: "Extracto en cápsulas o líquido",
+      contraindicaciones: [{ tipo: "medicamentos", descripcion: "Puede interactuar con anticoagulantes." }],
+      descripcion: "El extracto de semilla de uva es rico en proantocianidinas, potentes antioxidantes que protegen los vasos sanguíneos.",
+      sistemasRelacionados: ["sistema-cardiovascular", "enfermedades-piel", "sistema-inmunologico"],
+      categoriaId: "semillas-y-frutos-secos-medicinales",
+      categoria: "Semillas y frutos secos medicinales",
+    },
+    {
+      id: "semillas-de-granada",
+      nombre: "Semillas de Granada",
+      nombreCientifico: "Punica granatum",
+      nombresAlternativos: {"España": ["granado", "balaustia", "balaustra", "granado borde", "granado común", "granao", "magrano", "manglanera", "manglano", "mengranero", "milgrano", "agrauz", "agrios", "albar", "alvarés"], "USA_English": ["pomegranate", "dwarf pomegranate"], "UK_English": ["pomegranate", "dwarf pomegranate"], "Indigena": ["anar", "darim"]},
+      propiedades: ["Antioxidante", "Antiinflamatoria", "Cardioprotectora"],
+      parteUsable: "Semillas (arilos) y aceite de la semilla",
+      dosis: "Consumir los arilos de media granada; 5-10 ml de aceite",
+      preparacion: "Consumo directo de los arilos, aceite de la semilla",
+      contraindicaciones: [{ tipo: "otro", descripcion: "El consumo excesivo del zumo puede interactuar con ciertos medicamentos." }],
+      descripcion: "Las semillas de granada son ricas en antioxidantes (punicalaginas) y el aceite de sus semillas contiene ácido púnico, un potente antiinflamatorio.",
+      sistemasRelacionados: ["sistema-cardiovascular", "sistema-inmunologico", "enfermedades-piel"],
+      categoriaId: "semillas-y-frutos-secos-medicinales",
+      categoria: "Semillas y frutos secos medicinales",
+    },
+    {
+      id: "semillas-de-sandia",
+      nombre: "Semillas de Sandía",
+      nombreCientifico: "Citrullus lanatus",
+      nombresAlternativos: {"España": ["sandía", "melón de agua", "acendría", "sindria", "patilla", "tuera"], "Mexico": ["sandía"], "Argentina": ["sandía"], "Colombia": ["patilla", "sandía"], "Peru": ["sandía"], "Chile": ["sandía"], "Centroamerica": ["sandía", "melón de agua"], "Caribe": ["melón de agua", "patilla"], "USA_English": ["watermelon", "wild watermelon", "citron melon", "fodder melon", "preserving melon", "red-seeded citron", "jam melon", "stock melon", "Kalahari melon", "tsamma melon", "Afghan melon", "bastard melon", "bitter apple", "bitter melon", "camel melon", "colocynth", "kaffir melon", "mickey melon", "paddy melon", "paddymelon", "pie melon"], "UK_English": ["watermelon"]},
+      propiedades: ["Diurética", "Nutritiva", "Remineralizante"],
+      parteUsable: "Semillas",
+      dosis: "Un puñado pequeño (10-15g) al día",
+      preparacion: "Secas, tostadas o germinadas",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Consumir con moderación por su contenido calórico." }],
+      descripcion: "Las semillas de sandía son una fuente sorprendente de magnesio, hierro y zinc, y tienen un ligero efecto diurético.",
+      sistemasRelacionados: ["sistema-urinario", "sistema-cardiovascular"],
+      categoriaId: "semillas-y-frutos-secos-medicinales",
+      categoria: "Semillas y frutos secos medicinales",
+    },
+    {
+      id: "semillas-de-melon",
+      nombre: "Semillas de Melón",
+      nombreCientifico: "Cucumis melo",
+      nombresAlternativos: {"España": ["melón", "melonera", "alficoz", "cohombro"], "Mexico": ["melón", "sandiita"], "USA_English": ["melon", "cantaloupe", "muskmelon", "honeydew", "casaba", "winter melon", "Armenian cucumber", "rockmelon", "sweet melon"], "UK_English": ["melon", "cantaloupe", "muskmelon", "honeydew", "casaba", "winter melon"]},
+      propiedades: ["Nutritiva", "Antioxidante", "Vermífuga"],
+      parteUsable: "Semillas",
+      dosis: "Un puñado pequeño (10-15g) al día",
+      preparacion: "Secas y tostadas",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Asegurarse de que no estén amargas, lo que podría indicar compuestos tóxicos." }],
+      descripcion: "Similares a las de calabaza, las semillas de melón son ricas en proteínas y grasas saludables, y se han usado como antiparasitarias.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-inmunologico"],
+      categoriaId: "semillas-y-frutos-secos-medicinales",
+      categoria: "Semillas y frutos secos medicinales",
+    },
+    {
+      id: "semillas-de-loto",
+      nombre: "Semillas de Loto",
+      nombreCientifico: "Nelumbo nucifera",
+      nombresAlternativos: {"España": ["loto sagrado", "loto indio", "rosa del Nilo", "nelumbo"], "USA_English": ["sacred lotus", "Indian lotus", "East Indian lotus"], "UK_English": ["sacred lotus", "Indian lotus"], "Indigena": ["Padma", "Kamala"]},
+      propiedades: ["Astringente", "Calmante", "Nutritiva"],
+      parteUsable: "Semillas",
+      dosis: "10-15g en decocción o cocinadas",
+      preparacion: "Sopas, decocciones, postres",
+      contraindicaciones: [{ tipo: "otro", descripcion: "No consumir si se tiene estreñimiento o distensión abdominal." }],
+      descripcion: "En la medicina tradicional china, las semillas de loto se usan para tonificar el bazo, los riñones y calmar el espíritu.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-nervioso", "sistema-urinario"],
+      categoriaId: "semillas-y-frutos-secos-medicinales",
+      categoria: "Semillas y frutos secos medicinales",
+    },
+    {
+      id: "semillas-de-nigella",
+      nombre: "Semillas de Nigella (Comino Negro)",
+      nombreCientifico: "Nigella sativa",
+      nombresAlternativos: {"España": ["abésoda", "agenuz", "ajenuz", "arañuel", "neguilla"], "USA_English": ["black seed", "black cumin", "black caraway", "fennel flower", "nigella", "Roman coriander", "nutmeg flower"], "UK_English": ["black seed", "black cumin", "black caraway", "fennel flower", "nigella"], "Indigena": ["kalonji", "kalongi"]},
+      propiedades: ["Inmunomoduladora", "Antiinflamatoria", "Antihistamínica"],
+      parteUsable: "Semillas y aceite",
+      dosis: "1-2 cucharaditas de semillas o 1 de aceite al día",
+      preparacion: "Semillas enteras, molidas o en aceite prensado en frío",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "Evitar en grandes cantidades." }, { tipo: "medicamentos", descripcion: "Puede interactuar con inmunosupresores y anticoagulantes." }],
+      descripcion: "Conocida como \"la semilla bendita\", se usa tradicionalmente para una amplia gama de dolencias, especialmente para el sistema inmunológico y respiratorio.",
+      sistemasRelacionados: ["sistema-inmunologico", "sistema-respiratorio", "enfermedades-piel"],
+      categoriaId: "semillas-y-frutos-secos-medicinales",
+      categoria: "Semillas y frutos secos medicinales",
+    },
+    {
+      id: "castana-de-indias",
+      nombre: "Castaña de Indias",
+      nombreCientifico: "Aesculus hippocastanum",
+      nombresAlternativos: {"España": ["castaño de Indias", "falso castaño", "castaño loco", "castaño de sombra"], "USA_English": ["horse chestnut", "buckeye", "conker tree", "European horsechestnut"], "UK_English": ["horse chestnut", "conker tree", "European horsechestnut"]},
+      propiedades: ["Venotónica", "Antiinflamatoria", "Antiedematosa"],
+      parteUsable: "Semilla (extracto estandarizado)",
+      dosis: "Extracto estandarizado (50 mg de escina) 2-3 veces al día",
+      preparacion: "Extracto en cápsulas o gel tópico. NO INGERIR LA SEMILLA CRUDA (TÓXICA).",
+      contraindicaciones: [{ tipo: "otro", descripcion: "La semilla cruda es venenosa. Usar solo preparados comerciales estandarizados." }, { tipo: "embarazo", descripcion: "Consultar al médico." }],
+      descripcion: "La castaña de Indias es el remedio principal para la insuficiencia venosa crónica, varices y hemorroides, mejorando la circulación.",
+      sistemasRelacionados: ["sistema-cardiovascular", "sistema-linfatico"],
+      categoriaId: "semillas-y-frutos-secos-medicinales",
+      categoria: "Semillas y frutos secos medicinales",
+    },
+    {
+      id: "semillas-de-psyllium",
+      nombre: "Semillas de Psyllium",
+      nombreCientifico: "Plantago ovata",
+      nombresAlternativos: {"España": ["ispágula", "llantén indio", "psyllium rubio", "zaragatona", "pelosilla", "arta de agua", "cáscara de ispágula", "coniza", "cutículas de semillas de plantago ovata", "hierba pulguera", "llantén de perro", "plantago de la"], "USA_English": ["psyllium", "blond plantain", "desert Indianwheat", "blond psyllium", "ispaghul", "woolly plantain", "Indian plantain seed", "Indian psyllium"], "UK_English": ["psyllium", "blond plantain", "desert Indianwheat", "blond psyllium", "ispaghul"], "Indigena": ["Isabgul"]},
+      propiedades: ["Laxante (formador de bolo)", "Hipocolesterolemiante", "Prebiótica"],
+      parteUsable: "Cáscara de la semilla",
+      dosis: "1-2 cucharaditas en un vaso grande de agua, 1-3 veces al día",
+      preparacion: "Mezclar la cáscara en polvo con abundante líquido y consumir inmediatamente",
+      contraindicaciones: [{ tipo: "otro", descripcion: "Debe tomarse con mucho líquido para evitar el riesgo de asfixia u obstrucción esofágica." }],
+      descripcion: "La cáscara de psyllium es una fibra soluble que aumenta el volumen de las heces, siendo muy eficaz para tratar tanto el estreñimiento como la diarrea.",
+      sistemasRelacionados: ["sistema-digestivo", "sistema-cardiovascular"],
+      categoriaId: "semillas-y-frutos-secos-medicinales",
+      categoria: "Semillas y frutos secos medicinales",
+    },
+    {
+      id: "semillas-de-cacao",
+      nombre: "Semillas de Cacao",
+      nombreCientifico: "Theobroma cacao",
+      nombresAlternativos: {"España": ["cacao", "cacaotero"], "Mexico": ["cacao", "cocoa", "pataxte", "mocambo", "balamte", "calabacillo"], "Colombia": ["cacao", "copoazú", "copuazú", "cacao blanco", "bacao"], "Peru": ["cacao", "macambo", "cacao blanco amazónico"], "Centroamerica": ["cacao"], "Caribe": ["cacao"], "USA_English": ["cacao", "cocoa"], "UK_English": ["cacao", "cocoa"], "Indigena": ["kakaw"]},
+      propiedades: ["Antioxidante", "Estimulante", "Cardioprotectora"],
+      parteUsable: "Semillas (nibs o polvo)",
+      dosis: "10-20g de cacao puro al día",
+      preparacion: "Nibs crudos, polvo en batidos o bebidas",
+      contraindicaciones: [{ tipo: "hipertension", descripcion: "Contiene teobromina, un estimulante. Moderar en caso de hipertensión o ansiedad." }, { tipo: "ninos", descripcion: "Moderar por su efecto estimulante." }],
+      descripcion: "El cacao puro es extremadamente rico en flavonoides antioxidantes, que mejoran la salud cardiovascular y el estado de ánimo.",
+      sistemasRelacionados: ["sistema-cardiovascular", "sistema-nervioso", "trastornos-mentales-emocionales"],
+      categoriaId: "semillas-y-frutos-secos-medicinales",
+      categoria: "Semillas y frutos secos medicinales",
+    },
+    {
+      id: "semillas-de-cafe",
+      nombre: "Semillas de Café (Grano)",
+      nombreCientifico: "Coffea arabica / robusta",
+      nombresAlternativos: {"España": ["café", "cafeto", "cafeto arábico", "cafeto de Arabia", "arbol del café"], "Mexico": ["café"], "Argentina": ["café"], "Colombia": ["café"], "Peru": ["café"], "Chile": ["café"], "Centroamerica": ["café"], "Caribe": ["café"], "USA_English": ["Arabica coffee", "Arabian coffee", "English coffee tree", "Guatemala coffee", "bourbon"], "UK_English": ["Arabica coffee", "Arabian coffee"], "Indigena": ["Kape", "Kahana"]},
+      propiedades: ["Estimulante del SNC", "Antioxidante", "Diurética"],
+      parteUsable: "Semillas (granos tostados)",
+      dosis: "1-3 tazas de café al día (hasta 400 mg de cafeína)",
+      preparacion: "Infusión de los granos molidos y tostados",
+      contraindicaciones: [{ tipo: "embarazo", descripcion: "Limitar la ingesta de cafeína." }, { tipo: "hipertension", descripcion: "Puede elevar la presión arterial temporalmente." }, { tipo: "otro", descripcion: "Puede causar insomnio, ansiedad o problemas digestivos en personas sensibles." }],
+      descripcion: "El grano de café es la fuente más popular de cafeína, un estimulante que mejora la alerta y la concentración. También es rico en antioxidantes.",
+      sistemasRelacionados: ["sistema-nervioso", "trastornos-mentales-emocionales"],
+      categoriaId: "semillas-y-frutos-secos-medicinales",
+      categoria: "Semillas y frutos secos medicinales",
+    },
+    {
+      id: "semillas-de-guarana",
+      nombre: "Semillas de Guaraná",
+      nombreCientifico: "Paullinia cupana",
+      nombresAlternativos: {"España": ["guaraná"], "Mexico": ["guaraná"], "Argentina": ["guaraná"], "Colombia": ["guaraná"], "Peru": ["guaraná"], "Chile": ["guaraná"], "Centroamerica": ["guaraná"], "Caribe": ["guaraná"], "USA_English": ["guarana", "Brazilian cocoa", "guarana seed extract", "guaranine", "zoom"], "UK_English": ["guarana", "Brazilian cocoa"]},
+      propiedades: ["Estimulante", "Energizante", "Saciante"],
+      parteUsable: "Semillas",
+      dosis: "500-1000 mg de polvo o extracto al día",
+      preparacion: "Polvo añadido a bebidas o cápsulas",
+      contraindicaciones: [{ tipo: "hipertension", descripcion: "Contiene altas dosis de cafeína." }, { tipo: "embarazo", descripcion: "Evitar por su alto contenido en cafeína." }, { tipo: "otro", descripcion: "Puede empeorar los síntomas de ansiedad." }],
+      descripcion: "El guaraná contiene una concentración de cafeína mucho mayor que el café, proporcionando un efecto estimulante más potente y duradero.",
+      sistemasRelacionados: ["sistema-nervioso", "trastornos-mentales-emocionales"],
+      categoriaId: "semillas-y-frutos-secos-medicinales",
+      categoria: "Semillas y frutos secos medicinales",
+    },
+    {
+      id: "nuez-de-cola",
+      nombre: "Nuez de Cola",
+      nombreCientifico: "Cola acuminata",
+      nombresAlternativos: {"España": ["nuez de cola", "cola de Sudán", "árbol de la cola", "colatero"], "USA_English": ["cola nut", "abata-kola", "caffeine nut", "gooranut", "gorra", "kola nut"], "UK_English": ["cola nut", "kola nut"], "Indigena": ["obi"]},
+      propiedades: ["Estimulante", "Astringente", "Diurética"],
+      parteUsable: "Semilla",
+      dosis: "1-3g de la nuez en polvo o extracto",
+      preparacion: "Masticar la nuez fresca, en polvo o extracto",
+      contraindicaciones: [{ tipo: "hipertension", descripcion: "Contiene cafeína y teobromina." }, { tipo: "otro", descripcion: "Puede causar insomnio y nerviosismo." }],
+      descripcion: "La nuez de cola es un estimulante tradicional africano, conocido por ser uno de los ingredientes originales de las bebidas de cola.",
+      sistemasRelacionados: ["sistema-nervioso", "sistema-digestivo"],
+      categoriaId: "semillas-y-frutos-secos-medicinales",
+      categoria: "Semillas y frutos secos medicinales",
+    },
+  ],
+};
+
+export default categoria;
@@ -0,0 +1,90 @@
+// Pócima Salvage - Decodificador del catálogo compacto
+// Formato generado por scripts/catalogo/compacto.py: tabla de cadenas internadas
+// y registros como arrays de índices alineados con `campos`.
+
+import type { CategoriaPlanta, ContraindicacionPlanta, PlantaExpandida } from './plantas-expandidas';
+import type { EnfermedadExpandida, SistemaCorporal } from './enfermedades-expandidas';
+
+// s: cadena, l: lista de cadenas, m: región -> nombres, c: contraindicaciones
+type TipoCampo = 's' | 'l' | 'm' | 'c';
+
+type ValorCompacto = number | (number | number[])[];
+
+interface CatalogoCompacto {
+  v: number;
+  campos: [string, TipoCampo][];
+  cadenas: string[];
+  // [id, nombre, (icono,) registros]
+  bloques: (number | (ValorCompacto | null)[][])[][];
+}
+
+const VERSION = 1;
+
+const decodificarValor = (tipo: TipoCampo, valor: ValorCompacto, cadenas: string[]): unknown => {
+  if (tipo === 's') return cadenas[valor as number];
+  const lista = valor as (number | number[])[];
+  if (tipo === 'l') return lista.map(i => cadenas[i as number]);
+  if (tipo === 'm') {
+    const nombres: Record<string, string[]> = {};
+    for (let i = 0; i < lista.length; i += 2) {
+      nombres[cadenas[lista[i] as number]] = (lista[i + 1] as number[]).map(j => cadenas[j]);
+    }
+    return nombres;
+  }
+  return lista.map((c): string | ContraindicacionPlanta =>
+    typeof c === 'number'
+      ? cadenas[c]
+      : { tipo: cadenas[c[0]] as ContraindicacionPlanta['tipo'], descripcion: cadenas[c[1]] }
+  );
+};
+
+const leer = (json: string): CatalogoCompacto => {
+  const datos = JSON.parse(json) as CatalogoCompacto;
+  if (datos.v !== VERSION) {
+    throw new Error(`Versión del catálogo compacto no soportada: ${datos.v}`);
+  }
+  return datos;
+};
+
+const decodificarRegistros = <T>(
+  datos: CatalogoCompacto,
+  filas: (ValorCompacto | null)[][],
+  derivados: Record<string, string>,
+): T[] =>
+  filas.map(fila => {
+    const registro: Record<string, unknown> = {};
+    fila.forEach((valor, i) => {
+      if (valor !== null) {
+        const [campo, tipo] = datos.campos[i];
+        registro[campo] = decodificarValor(tipo, valor, datos.cadenas);
+      }
+    });
+    return Object.assign(registro, derivados) as T;
+  });
+
+export const decodificarPlantas = (json: string): CategoriaPlanta[] => {
+  const datos = leer(json);
+  return datos.bloques.map(bloque => {
+    const [id, nombre] = (bloque.slice(0, 2) as number[]).map(i => datos.cadenas[i]);
+    const filas = bloque[2] as (ValorCompacto | null)[][];
+    return {
+      id,
+      nombre,
+      plantas: decodificarRegistros<PlantaExpandida>(datos, filas, { categoriaId: id, categoria: nombre }),
+    };
+  });
+};
+
+export const decodificarEnfermedades = (json: string): SistemaCorporal[] => {
+  const datos = leer(json);
+  return datos.bloques.map(bloque => {
+    const [id, nombre, icono] = (bloque.slice(0, 3) as number[]).map(i => datos.cadenas[i]);
+    const filas = bloque[3] as (ValorCompacto | null)[][];
+    return {
+      id,
+      nombre,
+      icono,
+      enfermedades: decodificarRegistros<EnfermedadExpandida>(datos, filas, { sistemaId: id }),
+    };
+  });
+};
@@ -1,8 +1,45 @@
 // Pócima Salvage - Cruce de datos bidireccional entre enfermedades y plantas
-// Este archivo contiene las funciones para relacionar enfermedades con plantas y viceversa
+// Este archivo contiene las funciones para relacionar enfermedades con plantas y viceversa.
+// Reciben el catálogo ya cargado (cargarCatalogoCruce lo lee de los chunks), así
+// que importarlo no mete los módulos completos del catálogo en el arranque.
 
-import { sistemasCorporales, EnfermedadExpandida, getAllEnfermedades } from './enfermedades-expandidas';
-import { getAllPlantas, PlantaExpandida, getPlantasBySistema } from './plantas-expandidas';
+import type { EnfermedadExpandida } from './enfermedades-expandidas';
+import type { PlantaExpandida } from './plantas-expandidas';
+import { cargarCategoria, huellaPlantas, resumenCategorias } from './chunks/plantas';
+import { cargarSistema, huellaEnfermedades, resumenSistemas } from './chunks/enfermedades';
+import { cruceIndex } from './cruce-index';
+import { indicePropiedades } from './propiedades-index';
+
+// Catálogo completo en el orden de getAllPlantas() / getAllEnfermedades(), con
+// las huellas de los módulos de los que sale: el índice guarda posiciones en estas listas
+export interface CatalogoCruce {
+  plantas: PlantaExpandida[];
+  enfermedades: EnfermedadExpandida[];
+  huellaPlantas: string;
+  huellaEnfermedades: string;
+}
+
+let catalogoCargado: Promise<CatalogoCruce> | null = null;
+
+// Carga todas las categorías y sistemas desde los chunks (una sola vez)
+export const cargarCatalogoCruce = (): Promise<CatalogoCruce> => {
+  if (!catalogoCargado) {
+    catalogoCargado = Promise.all([
+      Promise.all(resumenCategorias.map(r => cargarCategoria(r.id))),
+      Promise.all(resumenSistemas.map(r => cargarSistema(r.id))),
+    ]).then(([categorias, sistemas]) => ({
+      plantas: categorias.flatMap(categoria => categoria?.plantas ?? []),
+      enfermedades: sistemas.flatMap(sistema => sistema?.enfermedades ?? []),
+      huellaPlantas,
+      huellaEnfermedades,
+    }));
+    // Si falla, el siguiente intento vuelve a cargar
+    catalogoCargado.catch(() => {
+      catalogoCargado = null;
+    });
+  }
+  return catalogoCargado;
+};
 
 // Mapeo de palabras clave de enfermedades a propiedades de plantas
 const enfermedadToPropiedades: Record<string, string[]> = {
@@ -92,41 +129,149 @@ const enfermedadToPropiedades: Record<string, string[]> = {
   'fatiga': ['Tónica', 'Energizante', 'Adaptógena', 'Estimulante'],
 };
 
-// Función para obtener plantas recomendadas para una enfermedad
-export const getPlantasParaEnfermedad = (enfermedad: EnfermedadExpandida): PlantaExpandida[] => {
-  const todasLasPlantas = getAllPlantas();
+const getIndice = (catalogo: CatalogoCruce) => {
+  // Si el catálogo cambió sin regenerar el índice (aunque sea sólo un orden o un texto), se calcula en vivo
+  const vigente =
+    cruceIndex.huellaPlantas === catalogo.huellaPlantas &&
+    cruceIndex.huellaEnfermedades === catalogo.huellaEnfermedades;
+  return vigente ? catalogo : null;
+};
+
+const claveEnfermedad = (enfermedad: EnfermedadExpandida) => `${enfermedad.sistemaId}/${enfermedad.id}`;
+const clavePlanta = (planta: PlantaExpandida) => `${planta.categoriaId}/${planta.id}`;
+
+// Función para obtener plantas recomendadas para una enfermedad.
+// Con el índice vigente son las mejores según el ranking BM25 de scripts/catalogo/ranking.py
+// (propiedades y descripción de la planta frente al texto de la enfermedad, con boost por sistema)
+export const getPlantasParaEnfermedad = (
+  enfermedad: EnfermedadExpandida,
+  catalogo: CatalogoCruce,
+): PlantaExpandida[] => {
+  const indice = getIndice(catalogo);
+  const pares = indice && cruceIndex.plantasPorEnfermedad[claveEnfermedad(enfermedad)];
+  if (pares) {
+    return pares.map(([posicion]) => indice.plantas[posicion]);
+  }
+  return calcularPlantasParaEnfermedad(enfermedad, catalogo);
+};
+
+// Función para obtener enfermedades que una planta puede ayudar a tratar
+export const getEnfermedadesParaPlanta = (
+  planta: PlantaExpandida,
+  catalogo: CatalogoCruce,
+): EnfermedadExpandida[] => {
+  const indice = getIndice(catalogo);
+  const posiciones = indice && cruceIndex.enfermedadesPorPlanta[clavePlanta(planta)];
+  if (posiciones) {
+    return posiciones.map(posicion => indice.enfermedades[posicion]);
+  }
+  return calcularEnfermedadesParaPlanta(planta, catalogo);
+};
+
+// Función para obtener el motivo de recomendación de una planta para una enfermedad
+export const getMotivoRecomendacion = (
+  planta: PlantaExpandida,
+  enfermedad: EnfermedadExpandida,
+  catalogo: CatalogoCruce,
+): string => {
+  const indice = getIndice(catalogo);
+  const par = indice && cruceIndex.plantasPorEnfermedad[claveEnfermedad(enfermedad)]
+    ?.find(([posicion]) => indice.plantas[posicion] === planta);
+  if (par) {
+    return `Propiedades: ${par[1].map(i => planta.propiedades[i]).join(', ')}`;
+  }
+  return calcularMotivoRecomendacion(planta, enfermedad, catalogo);
+};
+
+// Posición de cada planta en el índice de propiedades normalizadas, por catálogo (null si está desactualizado)
+const posicionesPropiedades = new WeakMap<CatalogoCruce, Map<PlantaExpandida, number> | null>();
+
+const getPosicionesPropiedades = (catalogo: CatalogoCruce) => {
+  let posiciones = posicionesPropiedades.get(catalogo);
+  if (posiciones === undefined) {
+    posiciones = indicePropiedades.huellaPlantas === catalogo.huellaPlantas
+      ? new Map(catalogo.plantas.map((planta, i) => [planta, i]))
+      : null;
+    posicionesPropiedades.set(catalogo, posiciones);
+  }
+  return posiciones;
+};
+
+// AND de dos bitsets (palabras de 32 bits)
+const intersectan = (a: number[], b: number[]): boolean => {
+  const n = Math.min(a.length, b.length);
+  for (let i = 0; i < n; i++) {
+    if ((a[i] & b[i]) !== 0) return true;
+  }
+  return false;
+};
+
+const contieneTermino = (bits: number[], termino: number): boolean =>
+  termino >= 0 && (((bits[termino >> 5] ?? 0) >>> (termino & 31)) & 1) === 1;
+
+// Comparación por substring, para cuando no hay índice de propiedades vigente
+const coincideTexto = (propReq: string, propPlanta: string): boolean => {
+  const req = propReq.toLowerCase();
+  const prop = propPlanta.toLowerCase();
+  return prop.includes(req) || req.includes(prop);
+};
+
+// Keywords del mapeo que aparecen en el nombre o la descripción de la enfermedad
+const keywordsDe = (enfermedad: EnfermedadExpandida): string[] => {
   const nombreLower = enfermedad.nombre.toLowerCase();
   const descripcionLower = enfermedad.descripcion.toLowerCase();
-  
-  // Buscar propiedades relevantes basadas en palabras clave de la enfermedad
-  let propiedadesRelevantes: string[] = [];
-  
-  for (const [keyword, props] of Object.entries(enfermedadToPropiedades)) {
-    if (nombreLower.includes(keyword) || descripcionLower.includes(keyword)) {
-      propiedadesRelevantes = [...propiedadesRelevantes, ...props];
-    }
+  return Object.keys(enfermedadToPropiedades).filter(keyword =>
+    nombreLower.includes(keyword) || descripcionLower.includes(keyword)
+  );
+};
+
+// Si la planta tiene alguna propiedad que satisface las requeridas por la keyword
+const plantaCumple = (planta: PlantaExpandida, keyword: string, catalogo: CatalogoCruce): boolean => {
+  const posicion = getPosicionesPropiedades(catalogo)?.get(planta);
+  const requisitos = indicePropiedades.requisitos[keyword];
+  if (posicion !== undefined && requisitos) {
+    return intersectan(indicePropiedades.plantas[posicion], requisitos);
+  }
+  return enfermedadToPropiedades[keyword].some(propReq =>
+    planta.propiedades.some(propPlanta => coincideTexto(propReq, propPlanta))
+  );
+};
+
+// Propiedades de la planta que satisfacen las requeridas por la keyword
+const propiedadesQueCumplen = (planta: PlantaExpandida, keyword: string, catalogo: CatalogoCruce): string[] => {
+  const posicion = getPosicionesPropiedades(catalogo)?.get(planta);
+  const requisitos = indicePropiedades.requisitos[keyword];
+  if (posicion !== undefined && requisitos) {
+    const terminos = indicePropiedades.terminos[posicion];
+    return planta.propiedades.filter((_, i) => contieneTermino(requisitos, terminos[i]));
   }
+  return planta.propiedades.filter(propPlanta =>
+    enfermedadToPropiedades[keyword].some(propReq => coincideTexto(propReq, propPlanta))
+  );
+};
+
+// Cálculo en vivo (usado si el índice no cubre el caso o está desactualizado).
+// scripts/catalogo/cruce.py reproduce esta misma lógica para generar cruce-index.ts
+const plantasDelSistema = (catalogo: CatalogoCruce, sistemaId: string): PlantaExpandida[] =>
+  catalogo.plantas.filter(p => p.sistemasRelacionados.includes(sistemaId));
+
+const calcularPlantasParaEnfermedad = (enfermedad: EnfermedadExpandida, catalogo: CatalogoCruce): PlantaExpandida[] => {
+  const keywords = keywordsDe(enfermedad);
   
   // Si no encontramos propiedades específicas, usar las del sistema
-  if (propiedadesRelevantes.length === 0) {
+  if (keywords.length === 0) {
     // Obtener plantas del sistema relacionado
-    return getPlantasBySistema(enfermedad.sistemaId).slice(0, 6);
+    return plantasDelSistema(catalogo, enfermedad.sistemaId).slice(0, 6);
   }
   
-  // Filtrar plantas que tengan propiedades relevantes
-  const plantasRelevantes = todasLasPlantas.filter(planta => {
-    const propiedadesPlanta = planta.propiedades.map(p => p.toLowerCase());
-    return propiedadesRelevantes.some(propReq => 
-      propiedadesPlanta.some(propPlanta => 
-        propPlanta.includes(propReq.toLowerCase()) || 
-        propReq.toLowerCase().includes(propPlanta)
-      )
-    );
-  });
+  // Filtrar plantas que tengan propiedades relevantes (AND de bitsets con el índice de propiedades)
+  const plantasRelevantes = catalogo.plantas.filter(planta =>
+    keywords.some(keyword => plantaCumple(planta, keyword, catalogo))
+  );
   
   // Si hay pocas plantas, complementar con plantas del sistema
   if (plantasRelevantes.length < 3) {
-    const plantasSistema = getPlantasBySistema(enfermedad.sistemaId);
+    const plantasSistema = plantasDelSistema(catalogo, enfermedad.sistemaId);
     const idsExistentes = new Set(plantasRelevantes.map(p => p.id));
     const plantasAdicionales = plantasSistema.filter(p => !idsExistentes.has(p.id));
     return [...plantasRelevantes, ...plantasAdicionales].slice(0, 6);
@@ -135,10 +280,8 @@ export const getPlantasParaEnfermedad = (enfermedad: EnfermedadExpandida): Plant
   return plantasRelevantes.slice(0, 6);
 };
 
-// Función para obtener enfermedades que una planta puede ayudar a tratar
-export const getEnfermedadesParaPlanta = (planta: PlantaExpandida): EnfermedadExpandida[] => {
-  const todasLasEnfermedades = getAllEnfermedades();
-  const propiedadesPlanta = planta.propiedades.map(p => p.toLowerCase());
+const calcularEnfermedadesParaPlanta = (planta: PlantaExpandida, catalogo: CatalogoCruce): EnfermedadExpandida[] => {
+  const todasLasEnfermedades = catalogo.enfermedades;
   
   // Buscar enfermedades cuyos keywords coincidan con las propiedades de la planta
   const enfermedadesRelevantes: EnfermedadExpandida[] = [];
@@ -149,24 +292,11 @@ export const getEnfermedadesParaPlanta = (planta: PlantaExpandida): EnfermedadEx
       continue;
     }
     
-    const nombreLower = enfermedad.nombre.toLowerCase();
-    const descripcionLower = enfermedad.descripcion.toLowerCase();
-    
     // Buscar coincidencias con el mapeo
-    for (const [keyword, props] of Object.entries(enfermedadToPropiedades)) {
-      if (nombreLower.includes(keyword) || descripcionLower.includes(keyword)) {
-        // Verificar si la planta tiene alguna de las propiedades requeridas
-        const tienePropiedad = props.some(propReq =>
-          propiedadesPlanta.some(propPlanta =>
-            propPlanta.includes(propReq.toLowerCase()) ||
-            propReq.toLowerCase().includes(propPlanta)
-          )
-        );
-        
-        if (tienePropiedad && !enfermedadesRelevantes.find(e => e.id === enfermedad.id)) {
-          enfermedadesRelevantes.push(enfermedad);
-          break;
-        }
+    for (const keyword of keywordsDe(enfermedad)) {
+      if (plantaCumple(planta, keyword, catalogo) && !enfermedadesRelevantes.find(e => e.id === enfermedad.id)) {
+        enfermedadesRelevantes.push(enfermedad);
+        break;
       }
     }
   }
@@ -188,23 +318,15 @@ export const getEnfermedadesParaPlanta = (planta: PlantaExpandida): EnfermedadEx
   return enfermedadesRelevantes.slice(0, 8);
 };
 
-// Función para obtener el motivo de recomendación de una planta para una enfermedad
-export const getMotivoRecomendacion = (planta: PlantaExpandida, enfermedad: EnfermedadExpandida): string => {
-  const nombreLower = enfermedad.nombre.toLowerCase();
-  const descripcionLower = enfermedad.descripcion.toLowerCase();
-  
-  for (const [keyword, props] of Object.entries(enfermedadToPropiedades)) {
-    if (nombreLower.includes(keyword) || descripcionLower.includes(keyword)) {
-      const propiedadesCoincidentes = planta.propiedades.filter(propPlanta =>
-        props.some(propReq =>
-          propPlanta.toLowerCase().includes(propReq.toLowerCase()) ||
-          propReq.toLowerCase().includes(propPlanta.toLowerCase())
-        )
-      );
-      
-      if (propiedadesCoincidentes.length > 0) {
-        return `Propiedades: ${propiedadesCoincidentes.slice(0, 3).join(', ')}`;
-      }
+const calcularMotivoRecomendacion = (
+  planta: PlantaExpandida,
+  enfermedad: EnfermedadExpandida,
+  catalogo: CatalogoCruce,
+): string => {
+  for (const keyword of keywordsDe(enfermedad)) {
+    const propiedadesCoincidentes = propiedadesQueCumplen(planta, keyword, catalogo);
+    if (propiedadesCoincidentes.length > 0) {
+      return `Propiedades: ${propiedadesCoincidentes.slice(0, 3).join(', ')}`;
     }
   }
   
@@ -0,0 +1,1189 @@
+// Pócima Salvage - Índice precalculado del cruce enfermedades ↔ plantas
+// Generado automáticamente por scripts/build-cruce-index.py - no editar a mano
+
+export interface CruceIndex {
+  totalPlantas: number;
+  totalEnfermedades: number;
+  // Huellas de plantas-expandidas.ts y enfermedades-expandidas.ts al generar el índice:
+  // si no coinciden con las actuales, las posiciones ya no valen
+  huellaPlantas: string;
+  huellaEnfermedades: string;
+  // "sistemaId/id" -> [posición en getAllPlantas(), índices de planta.propiedades del motivo,
+  //                   puntuación BM25][], de mayor a menor puntuación
+  plantasPorEnfermedad: Record<string, [number, number[], number][]>;
+  // "categoriaId/id" -> posiciones en getAllEnfermedades()
+  enfermedadesPorPlanta: Record<string, number[]>;
+}
+
+export const cruceIndex: CruceIndex = {
+  totalPlantas: 693,
+  totalEnfermedades: 469,
+  huellaPlantas: "ac331aec271b1127",
+  huellaEnfermedades: "60dad39b67d7ff44",
+  plantasPorEnfermedad: {
+    "sistema-respiratorio/asma": [[235,[0,1,3],49.1318],[214,[0,1],24.0405],[325,[0,3],23.3898],[59,[1,2],23.0961],[352,[0,3],22.9934],[9,[2],22.5454]],
+    "sistema-respiratorio/bronquitis-aguda": [[352,[0,1,2],60.6046],[338,[0,2],50.9171],[325,[0,1],45.7104],[353,[0,1],44.85],[152,[0,1],41.166],[261,[1,2],38.7481]],
+    "sistema-respiratorio/neumonia": [[678,[3],15.6138],[313,[0,1,2],14.4852],[621,[0,1,2],13.2103],[606,[0,1,2],11.1812],[491,[0,1,2],9.363],[676,[3],7.8959]],
+    "sistema-respiratorio/epoc": [[304,[3],17.6536],[606,[0,1,2],15.9462],[313,[0,1,2],14.4852],[63,[0,1,2],12.5981],[17,[0,1,2],11.3941],[28,[0,1,2],11.363]],
+    "sistema-respiratorio/rinitis-alergica": [[42,[1,2],37.2941],[31,[1,2],26.5623],[287,[1],26.5388],[581,[1,2],25.7998],[120,[2,3],24.9508],[73,[3,4],24.399]],
+    "sistema-respiratorio/sinusitis": [[42,[1,2],37.2941],[287,[1],35.254],[120,[1,2,3],34.7304],[569,[0,1,2],24.2836],[606,[0],22.318],[79,[0,1],18.0486]],
+    "sistema-respiratorio/faringitis": [[46,[2,3],26.3454],[115,[0,1],26.2181],[352,[1,3],25.231],[267,[0,2,3],19.0975],[678,[2,3],19.0655],[218,[1,2],19.0127]],
+    "sistema-respiratorio/laringitis": [[115,[0,1],32.5269],[352,[1,3],30.5744],[46,[2,3],26.3454],[283,[1,2],25.0517],[678,[2,3],23.432],[621,[0],22.9136]],
+    "sistema-respiratorio/traqueitis": [[175,[0],16.9746],[606,[0,1,2],15.9462],[9,[0,1,2],12.7239],[21,[0,1,2],12.4294],[614,[0,1,2],11.8795],[28,[0,1,2],11.363]],
+    "sistema-respiratorio/tuberculosis": [[676,[0,3],13.4424],[621,[0,1,2],13.2103],[17,[0,1,2],11.3941],[450,[2],11.3852],[75,[0,1,2],10.3741],[396,[0,1,2],10.1675]],
+    "sistema-respiratorio/fibrosis-pulmonar": [[304,[3],17.6536],[621,[0,1,2],13.2103],[491,[0,1,2],11.6315],[450,[2],11.3852],[75,[0,1,2],10.3741],[396,[0,1,2],10.1675]],
+    "sistema-respiratorio/apnea-del-sueno": [[481,[2],8.6862],[609,[0,1,2],8.6455],[354,[0,1,2],7.7382],[623,[0,1,2],7.5932],[333,[0,1,2],6.8972],[281,[0,1,2],6.7706]],
+    "sistema-respiratorio/cancer-de-pulmon": [[75,[0,1,2],13.2531],[450,[2],11.3852],[396,[0,1,2],10.1675],[491,[0,1,2],9.363],[535,[0,1,2],8.5131],[304,[0,1,2],7.5556]],
+    "sistema-respiratorio/embolia-pulmonar": [[304,[3],17.6536],[33,[0,1,2],13.6783],[669,[0,3],9.8714],[491,[0,1,2],9.363],[673,[2],8.7358],[313,[0,1,2],6.9281]],
+    "sistema-respiratorio/hipertension-pulmonar": [[304,[3],17.6536],[33,[0,1,2],13.6783],[138,[0,1,2],12.7081],[477,[2,3],12.3634],[475,[2],10.5175],[21,[0,1,2],9.6541]],
+    "sistema-respiratorio/derrame-pleural": [[491,[0,1,2],15.8639],[678,[3],11.2473],[413,[0,1,2],10.692],[128,[0,1,2],8.6135],[304,[0,1,2],7.5556],[51,[0,1,2],7.3078]],
+    "sistema-respiratorio/neumotorax": [[624,[0,1,2],8.8632],[304,[0,1,2],7.5556],[313,[0,1,2],6.9281],[678,[3],6.4302],[175,[0,1,2],5.8101],[33,[0,1,2],4.8069]],
+    "sistema-respiratorio/bronquiectasia": [[21,[0,1,2],30.098],[28,[0,1,2],17.4542],[131,[0,1,2],16.6463],[569,[0,1,2],16.5214],[606,[0,1,2],15.9462],[325,[0,1,2],15.2357]],
+    "sistema-respiratorio/sarcoidosis": [[621,[0,1,2],13.2103],[676,[3],12.9448],[337,[2],11.9736],[491,[0,1,2],11.6315],[450,[2],11.3852],[75,[0,1,2],10.3741]],
+    "sistema-respiratorio/fibrosis-quistica": [[304,[3],20.262],[665,[0,2],15.9771],[352,[0,1,2],13.0922],[9,[0],12.6817],[33,[1],12.5879],[338,[0,1,2],12.5707]],
+    "sistema-respiratorio/resfriado-comun": [[328,[0,1],38.8325],[284,[0,3],35.0979],[523,[0,2],34.3491],[42,[1],32.7438],[28,[2],32.2412],[678,[0,3],31.69]],
+    "sistema-respiratorio/gripe": [[523,[0,2,3],54.7438],[284,[0,2,3],48.0478],[234,[0,1],42.6942],[328,[0,1],35.1727],[192,[2,3],29.6867],[28,[2],26.0718]],
+    "sistema-respiratorio/virus-sincitial-respiratorio": [[328,[0,1,2],46.7474],[369,[0,1],35.7878],[284,[0,3],35.0979],[523,[0,2],28.8473],[182,[0,1],28.5469],[28,[2],26.0718]],
+    "sistema-respiratorio/adenovirus": [[328,[0,1,2],58.8721],[523,[0,2],48.4989],[678,[0,3],36.5071],[369,[0,1],35.7878],[284,[0,3],35.0979],[234,[0],29.4945]],
+    "sistema-respiratorio/rinovirus": [[523,[0,2],34.3491],[328,[0,1],33.8185],[42,[1],32.7438],[678,[0,3],27.3235],[28,[2],27.1293],[287,[1],26.5388]],
+    "sistema-respiratorio/parainfluenza": [[328,[0,1,2],46.7474],[678,[0,3],36.5071],[369,[0,1],35.7878],[284,[0,3],35.0979],[523,[0,2],28.8473],[182,[0,1],28.5469]],
+    "sistema-respiratorio/metapneumovirus": [[328,[0,1,2],46.7474],[369,[0,1],35.7878],[284,[0,3],35.0979],[523,[0,2],28.8473],[182,[0,1],28.5469],[28,[2],26.0718]],
+    "sistema-respiratorio/crup": [[352,[0,1,2],51.2762],[28,[0,1],48.5953],[325,[0,1],42.2596],[152,[0,1],41.166],[131,[0,2],39.4345],[261,[1,2],38.7481]],
+    "sistema-respiratorio/tos-ferina": [[352,[0,1,2],51.2762],[28,[0,1],42.4259],[131,[0,2],39.4345],[261,[1,2],38.7481],[49,[0,3],38.0829],[325,[0,1],36.8744]],
+    "sistema-respiratorio/difteria": [[678,[3],24.2923],[459,[2],16.4651],[175,[0],11.1467],[280,[0,1,2],11.0511],[679,[0],7.6964],[51,[0,1,2],7.3078]],
+    "sistema-respiratorio/edema-pulmonar": [[304,[3],17.6536],[28,[0,1,2],12.3424],[131,[0,1,2],11.771],[325,[0,1,2],10.7736],[495,[0,1,2],10.7286],[352,[0,1,2],10.5501]],
+    "sistema-respiratorio/sindrome-de-dificultad-respiratoria-aguda": [[181,[0,1,2],13.6637],[676,[0,3],13.4424],[273,[0,1,2],12.8472],[151,[0,1],11.4817],[28,[0,1,2],11.203],[210,[1],11.1564]],
+    "sistema-respiratorio/atelectasia": [[687,[2],12.3519],[336,[0,1,2],11.4702],[472,[4],8.69],[39,[0,1,2],8.0109],[454,[3],7.6519],[304,[0,1,2],7.5556]],
+    "sistema-respiratorio/hemoptisis": [[9,[0,1,2],12.7239],[21,[0,1,2],12.4294],[614,[0,1,2],11.8795],[28,[0,1,2],11.363],[131,[0,1,2],10.837],[606,[0,1,2],10.5919]],
+    "sistema-respiratorio/disnea": [[21,[0,1,2],9.6541],[569,[0,1,2],9.0273],[254,[0,1,2],7.7488],[199,[0,1,2],7.2948],[624,[0,1,2],6.0416],[54,[0,1,2],6.0182]],
+    "sistema-respiratorio/hipoxia": [[676,[0],10.5954],[136,[0,1,2],10.5682],[673,[2],8.7358],[19,[0,1,2],8.228],[340,[0,1],8.1744],[123,[0,1,2],8.0418]],
+    "sistema-respiratorio/mesotelioma": [[75,[0,1,2],13.2531],[621,[0,1,2],13.2103],[137,[0],11.8597],[450,[2],11.3852],[91,[0,1,2],11.0237],[396,[0,1,2],10.1675]],
+    "sistema-respiratorio/aspergilosis": [[678,[3],15.6138],[352,[0,1,2],13.0922],[338,[0,1,2],12.5707],[606,[0,1,2],11.1812],[372,[0,1,2],10.6243],[491,[0,1,2],9.363]],
+    "sistema-respiratorio/silicosis": [[33,[0,1,2],13.6783],[621,[0,1,2],13.2103],[17,[0,1,2],11.3941],[678,[3],11.2473],[304,[3],10.0981],[491,[0,1,2],9.363]],
+    "sistema-respiratorio/asbestosis": [[352,[0,1,2],46.9066],[261,[1,2],38.7481],[28,[0,1],37.3141],[152,[0,1],35.1427],[131,[0,2],34.5593],[49,[0,3],33.5243]],
+    "sistema-digestivo/gastritis": [[489,[2,3],27.4421],[454,[1,4],26.9813],[681,[0,3],24.1433],[491,[2],22.708],[283,[0,2],22.3427],[95,[1],19.5518]],
+    "sistema-digestivo/ulcera-peptica": [[624,[0,1,2],13.2948],[359,[0,1,2],11.4047],[76,[0,1,2],9.0624],[681,[3],8.4796],[601,[0,1,2],8.2044],[240,[0,1,2],8.1458]],
+    "sistema-digestivo/reflujo-gastroesofagico": [[4,[0,1],23.7831],[5,[0,1],19.7678],[8,[0,1],19.7678],[0,[1,2],19.4966],[601,[0,1],19.4966],[570,[0,1],19.2328]],
+    "sistema-digestivo/colitis-ulcerosa": [[489,[0,3],33.395],[496,[1,3],24.6705],[36,[0,2],22.2622],[598,[0,2],21.9767],[306,[1,2],21.8381],[623,[1],20.4399]],
+    "sistema-digestivo/sindrome-del-intestino-irritable": [[489,[0,1,3],51.3842],[160,[0,1],37.3547],[524,[0,1],35.5432],[515,[0,1],34.6875],[583,[0],34.246],[502,[0,1],33.7399]],
+    "sistema-digestivo/enfermedad-de-crohn": [[489,[0,1,3],46.998],[160,[0,1],37.3547],[205,[0,1,2],36.9752],[524,[0,1],35.5432],[515,[0,1],34.6875],[502,[0,1],33.7399]],
+    "sistema-digestivo/hemorroides": [[153,[0,1,2],16.6522],[542,[0,1,2],12.3446],[80,[0,1,2],11.975],[36,[0,1,2],11.0417],[89,[0,1,2],8.8854],[601,[0,1,2],8.2044]],
+    "sistema-digestivo/estrenimiento": [[583,[0],37.257],[493,[0],30.7125],[459,[0],29.208],[483,[1],28.9946],[400,[0,2],28.93],[76,[1],28.1286]],
+    "sistema-digestivo/diarrea": [[515,[0,1],43.9341],[160,[0,1],37.3547],[524,[0,1],35.5432],[502,[0,1],33.7399],[530,[1,2],33.3917],[489,[0,1],32.4131]],
+    "sistema-digestivo/hepatitis": [[147,[0,1],42.5317],[270,[1,2,3],37.9592],[277,[2,3],31.7417],[529,[0,2],26.6346],[306,[4],23.25],[290,[0,3],23.0172]],
+    "sistema-digestivo/cirrosis-hepatica": [[540,[0],30.4138],[17,[1,2],29.5749],[277,[3],27.0149],[529,[0,2],26.6346],[290,[0,3],23.0172],[61,[2],22.9054]],
+    "sistema-digestivo/pancreatitis": [[669,[0,3],15.179],[615,[0,1,2],13.74],[472,[4],13.0349],[336,[0,1,2],11.2536],[454,[3],10.654],[333,[0,1,2],8.5789]],
+    "sistema-digestivo/enfermedad-celiaca": [[14,[0,1,2],22.9004],[450,[2,5],22.7478],[623,[0,1,2],22.3824],[241,[0,1,2],20.9599],[669,[0,3],15.179],[601,[0,1,2],14.1512]],
+    "sistema-digestivo/intolerancia-a-la-lactosa": [[49,[0,3],33.5243],[14,[1],32.5724],[623,[2],31.9092],[241,[1],30.0766],[48,[0,1,2],29.8184],[353,[0,1],27.2159]],
+    "sistema-digestivo/diverticulosis": [[14,[0,1,2],17.0912],[623,[0,1,2],16.7046],[241,[0,1,2],15.643],[583,[0,1,2],13.694],[499,[0,1,2],9.9407],[601,[0,1,2],8.2044]],
+    "sistema-digestivo/diverticulitis": [[669,[0,3],15.179],[489,[3],14.5849],[615,[0,1,2],13.74],[589,[0,1,2],11.9205],[454,[3],10.654],[678,[3],10.4092]],
+    "sistema-digestivo/apendicitis": [[669,[0,3],15.179],[615,[0,1,2],13.74],[542,[0,1,2],13.4547],[472,[4],13.0349],[414,[0,1,2],12.3609],[82,[0,1,2],11.8475]],
+    "sistema-digestivo/calculos-biliares": [[49,[0,3],36.2056],[353,[0,1,3],30.6255],[48,[0,1,2],29.8184],[181,[1,2],26.9556],[283,[1,3],25.4197],[161,[1,2],25.0395]],
+    "sistema-digestivo/colecistitis": [[178,[0,2,3],37.481],[622,[0,1],37.2952],[119,[2],29.4137],[295,[2,4],28.0347],[174,[0,1],26.2277],[183,[0,1,2],23.2702]],
+    "sistema-digestivo/disfagia": [[48,[0,1,2],34.2436],[49,[0,3],33.5243],[353,[0,1],27.2159],[181,[1,2],26.9556],[161,[1,2],25.0395],[155,[0],24.1592]],
+    "sistema-digestivo/indigestion": [[669,[0,3],15.179],[570,[0,1,2],14.4547],[601,[0,1,2],14.1512],[572,[0,1,2],14.1277],[627,[0,1,2],14.1277],[14,[0,1,2],13.8237]],
+    "sistema-digestivo/gastroenteritis": [[353,[0,1],33.5526],[49,[0,3],33.5243],[48,[0,1,2],29.8184],[181,[1,2],26.9556],[161,[1,2],25.0395],[283,[1,3],23.0003]],
+    "sistema-digestivo/hernia-de-hiato": [[499,[0,1,2],11.6502],[359,[0,1,2],11.4047],[128,[0,1,2],8.6135],[240,[0,1,2],8.1458],[242,[0,1,2],7.9699],[263,[0,1,2],7.4401]],
+    "sistema-digestivo/proctitis": [[624,[0,1,2],13.2948],[36,[0,1,2],11.0417],[568,[0,1,2],10.0647],[654,[0,1],7.4809],[652,[0,1],7.3078],[641,[0,1,2],7.1425]],
+    "sistema-digestivo/fisura-anal": [[401,[0,1,2],13.4713],[668,[3],11.5126],[616,[0,1,2],10.2924],[113,[0,1,2],10.1738],[479,[0,1,2],10.1311],[411,[0,1,2],9.6383]],
+    "sistema-digestivo/incontinencia-fecal": [[360,[0,3],27.0156],[526,[0,2],23.8217],[507,[0,1],21.7861],[189,[1,2],21.0784],[285,[2,4],20.4182],[280,[2,3],20.2082]],
+    "sistema-digestivo/polipos-de-colon": [[36,[0,1,2],11.0417],[449,[3],10.2045],[483,[1],9.6871],[405,[1],9.4992],[489,[3],9.4856],[88,[0,1,2],9.2465]],
+    "sistema-digestivo/cancer-de-colon": [[450,[2],17.0779],[137,[0],11.8597],[449,[2,3],11.1473],[36,[0,1,2],11.0417],[75,[0,1,2],10.3741],[396,[0,1,2],10.1675]],
+    "sistema-digestivo/cancer-de-estomago": [[450,[2],17.0779],[669,[0,3],15.179],[75,[0,1,2],13.2531],[359,[0,1,2],11.4047],[681,[3],10.2144],[396,[0,1,2],10.1675]],
+    "sistema-digestivo/cancer-de-esofago": [[450,[2],17.0779],[491,[0,1,2],15.0753],[240,[0,1,2],13.7465],[75,[0,1,2],13.2531],[401,[0,1,2],11.7815],[359,[0,1,2],11.4047]],
+    "sistema-digestivo/cancer-de-higado": [[450,[2],17.0779],[669,[0,3],15.179],[75,[0,1,2],13.2531],[80,[0,1,2],12.2351],[333,[3],12.0409],[82,[0,1,2],11.8475]],
+    "sistema-digestivo/cancer-de-pancreas": [[450,[2],17.0779],[669,[0,3],15.179],[75,[0,1,2],13.2531],[333,[0,1,2],10.6153],[396,[0,1,2],10.1675],[361,[1],9.1985]],
+    "sistema-digestivo/esofagitis": [[654,[0,1],7.4809],[27,[0,1,2],7.362],[652,[0,1],7.3078],[641,[0,1,2],7.1425],[380,[0,1,2],6.8333],[150,[0,1],6.7247]],
+    "sistema-digestivo/acalasia": [[240,[0,2],37.359],[48,[0,1,2],29.8184],[353,[0,1],27.2159],[181,[1,2],26.9556],[161,[1,2],25.0395],[155,[0],24.1592]],
+    "sistema-digestivo/gastroparesia": [[14,[0,1,2],17.0912],[623,[0,1,2],16.7046],[241,[0,1,2],15.643],[669,[0],9.9754],[624,[0,1,2],9.0624],[601,[0,1,2],8.2044]],
+    "sistema-digestivo/linfangiectasia-intestinal": [[14,[0,1,2],17.0912],[450,[2],17.0779],[623,[0,1,2],16.7046],[241,[0,1,2],15.643],[489,[3],15.3012],[515,[0,1,2],12.5174]],
+    "sistema-digestivo/sindrome-de-dumping": [[49,[0,3],33.5243],[181,[1,2],32.2726],[353,[0,1],31.7363],[352,[0,1,2],31.1799],[261,[1,2],25.417],[161,[1,2],25.0395]],
+    "sistema-digestivo/colangitis": [[49,[0,3],33.5243],[48,[0,1,2],29.8184],[353,[0,1],27.2159],[181,[1,2],26.9556],[161,[1,2],25.0395],[283,[1,3],23.0003]],
+    "sistema-digestivo/isquemia-mesenterica": [[669,[0,3],15.179],[589,[0,1,2],11.9205],[576,[0,1,2],10.843],[492,[0,1,2],9.9616],[14,[0,1,2],9.0767],[609,[0,1,2],9.0767]],
+    "sistema-digestivo/peritonitis": [[14,[0,1,2],17.0912],[623,[0,1,2],16.7046],[241,[0,1,2],15.643],[669,[0,3],15.179],[615,[0,1,2],13.74],[454,[3],10.654]],
+    "sistema-cardiovascular/hipertension-arterial": [[672,[1,2],18.7506],[123,[0,1,2],18.1696],[475,[2],15.7763],[448,[4],14.2288],[477,[2],14.0546],[460,[2],13.8846]],
+    "sistema-cardiovascular/ateroesclerosis": [[634,[1,3],30.9283],[642,[1,3],29.5831],[238,[0,2],26.7605],[483,[0],21.2387],[548,[2],20.7127],[245,[2],20.0167]],
+    "sistema-cardiovascular/cardiopatia-isquemica": [[172,[2],19.1618],[547,[0,1,2],14.6975],[669,[0,3],10.1193],[660,[0],9.4791],[676,[0,3],8.9616],[672,[1],8.943]],
+    "sistema-cardiovascular/infarto-de-miocardio": [[349,[2],22.9783],[492,[0,1,2],11.9268],[536,[0,1,2],11.9268],[669,[0,3],9.8714],[336,[2],8.521],[359,[0,1,2],8.0604]],
+    "sistema-cardiovascular/angina-de-pecho": [[71,[0,1,2],15.712],[138,[0,1,2],12.6864],[492,[0,1,2],11.9268],[21,[0,1,2],10.5223],[669,[0,3],9.047],[678,[3],8.8921]],
+    "sistema-cardiovascular/insuficiencia-cardiaca": [[259,[0],17.238],[180,[0,1,2],16.1192],[673,[0,2],15.9305],[349,[2],14.5847],[554,[0,1,2],12.7546],[676,[0,3],12.3275]],
+    "sistema-cardiovascular/arritmia": [[349,[0,2,3],59.8223],[536,[0,2],47.0195],[506,[0,3],28.7995],[259,[0],26.4287],[355,[0],23.1617],[195,[0],21.7436]],
+    "sistema-cardiovascular/fibrilacion-auricular": [[349,[2],28.8741],[74,[0,1,2],14.6474],[536,[0,1,2],13.7544],[290,[0,1,2],10.37],[519,[0,1,2],9.1441],[18,[0,1,2],8.8714]],
+    "sistema-cardiovascular/bradicardia": [[349,[2],20.4805],[547,[0,1,2],16.2645],[74,[0,1,2],14.6474],[536,[0,1,2],13.7544],[38,[0,1,2],9.4188],[71,[2],8.9819]],
+    "sistema-cardiovascular/taquicardia": [[349,[2],28.8741],[74,[0,1,2],14.6474],[536,[0,1,2],13.7544],[669,[0,3],9.8714],[336,[2],8.521],[259,[0],7.7207]],
+    "sistema-cardiovascular/enfermedad-valvular-cardiaca": [[547,[0,1,2],14.6975],[349,[2],14.5847],[536,[0,1,2],11.9268],[669,[0,3],9.8714],[336,[2],8.521],[259,[0],7.7207]],
+    "sistema-cardiovascular/endocarditis": [[349,[2],14.5847],[336,[2],13.5227],[497,[0,1,2],12.5235],[536,[0,1,2],11.9268],[333,[0,1,2],11.4961],[451,[4],10.3823]],
+    "sistema-cardiovascular/miocarditis": [[349,[2],33.8316],[536,[0,1,2],19.2157],[74,[0,1,2],14.6474],[336,[2],8.521],[180,[0,1,2],8.308],[351,[0,1,2],7.9898]],
+    "sistema-cardiovascular/pericarditis": [[629,[0,1,2],12.8796],[652,[0,1],11.6566],[332,[0,1,2],10.7521],[491,[0,1,2],10.576],[449,[5],9.4677],[519,[0,1,2],9.1441]],
+    "sistema-cardiovascular/cardiomiopatia": [[349,[2],18.0208],[547,[0,1,2],14.6975],[676,[0,3],8.9616],[18,[0,1,2],8.8714],[336,[2],8.521],[180,[0,1,2],8.308]],
+    "sistema-cardiovascular/aneurisma-aortico": [[624,[0,1,2],8.8632],[589,[0,1,2],7.947],[243,[0,1,2],6.7706],[413,[0,1,2],6.2922],[460,[0,1,2],6.2043],[290,[0,1,2],5.6074]],
+    "sistema-cardiovascular/diseccion-aortica": [[333,[0,1,2],9.3553],[75,[0,1,2],8.1922],[396,[0,1,2],7.8112],[518,[0,1,2],7.1662],[190,[0,1,2],6.4255],[450,[2],5.8311]],
+    "sistema-cardiovascular/enfermedad-arterial-periferica": [[253,[0],13.0608],[518,[0,1,2],12.6319],[477,[2,3],11.3924],[180,[0,1,2],8.308],[351,[0,1,2],7.9898],[475,[2],7.7474]],
+    "sistema-cardiovascular/trombosis-venosa-profunda": [[351,[0],27.7817],[180,[0,1,2],15.4518],[683,[2],11.4196],[624,[0,1,2],8.8632],[127,[0,1,2],8.3012],[582,[0,1,2],7.7622]],
+    "sistema-cardiovascular/embolia-pulmonar": [[673,[2],13.1036],[304,[3],11.7691],[669,[0,3],9.8714],[349,[2],9.6272],[33,[0,1,2],9.1188],[336,[2],8.521]],
+    "sistema-cardiovascular/accidente-cerebrovascular": [[518,[0,1,2],13.5836],[4,[0,1,2],11.4789],[624,[0,1,2],11.3861],[333,[0,1,2],10.3458],[513,[0,1,2],10.0019],[692,[0,1,2],9.6427]],
+    "sistema-cardiovascular/hipertension-pulmonar": [[138,[0,1,2],19.0622],[477,[2,3],18.5451],[475,[2],15.7763],[448,[4],14.2288],[460,[2],13.8846],[672,[2],13.3984]],
+    "sistema-cardiovascular/cardiopatia-congenita": [[349,[2],14.5847],[536,[0,1,2],11.9268],[302,[2],11.3002],[550,[0,1,2],9.3786],[336,[2],8.521],[513,[0,1,2],7.7673]],
+    "sistema-cardiovascular/soplo-cardiaco": [[547,[0,1,2],14.6975],[669,[0,3],9.8714],[349,[2],9.6272],[336,[2],8.521],[259,[0],7.7207],[546,[0,1,2],7.0376]],
+    "sistema-cardiovascular/sindrome-de-marfan": [[492,[0,1,2],20.4036],[172,[0,1,2],18.5598],[576,[0,1,2],16.2645],[497,[0,1,2],13.249],[536,[0,1,2],11.9268],[355,[0,1],10.1878]],
+    "sistema-cardiovascular/enfermedad-de-buerger": [[576,[0,1,2],16.2645],[492,[0,1,2],14.9424],[547,[0,1,2],7.6599],[654,[0,1],7.4809],[652,[0,1],7.3078],[447,[0,1,2],7.1984]],
+    "sistema-cardiovascular/enfermedad-de-raynaud": [[624,[0,1,2],14.9048],[479,[0,1,2],10.8275],[293,[0,1,2],10.495],[272,[0,1,2],10.4911],[290,[0,1,2],10.0433],[482,[0,1,2],9.9722]],
+    "sistema-cardiovascular/varices": [[127,[0,1],33.3656],[582,[0,1],31.7317],[180,[0,1],30.9582],[139,[1,2],28.3802],[518,[0,4],26.5659],[118,[0],25.4222]],
+    "sistema-cardiovascular/linfedema": [[175,[0,1,2],8.8326],[180,[0,1,2],8.308],[351,[0,1,2],7.9898],[549,[0,1,2],7.2889],[216,[0,1,2],7.1975],[145,[0,1,2],6.335]],
+    "sistema-cardiovascular/shock-cardiogenico": [[475,[2,4],23.1175],[138,[0,1,2],19.0622],[672,[1,2],18.7506],[477,[2,3],18.5451],[123,[0,1,2],18.1696],[448,[4],14.2288]],
+    "sistema-cardiovascular/paro-cardiaco": [[349,[2],9.6272],[336,[2],8.521],[396,[0,1,2],7.8112],[259,[0],7.7207],[671,[0],7.0525],[546,[0,1,2],7.0376]],
+    "sistema-cardiovascular/anemia": [[398,[0],32.0551],[405,[1],25.6122],[578,[1],25.3752],[554,[0],20.6001],[547,[2],19.8407],[673,[0,2],17.654]],
+    "sistema-cardiovascular/hemofilia": [[36,[0,1,2],11.0417],[52,[0,1,2],10.2924],[583,[0,1,2],8.7152],[84,[0,1],8.6751],[654,[0,1],8.3816],[86,[0,1,2],8.197]],
+    "sistema-cardiovascular/leucemia": [[396,[0,1,2],15.2513],[450,[2],11.3852],[36,[0,1,2],11.0417],[75,[0,1,2],10.3741],[687,[2],9.2182],[676,[0,3],8.9616]],
+    "sistema-cardiovascular/colesterol-alto": [[634,[1,3],35.5877],[642,[1,3],33.9748],[113,[0,1],30.5666],[547,[0],26.4285],[374,[0,1],26.0346],[483,[0],21.2387]],
+    "sistema-cardiovascular/trigliceridos-altos": [[48,[0,1,2],29.8184],[49,[0,3],22.3495],[261,[1,2],22.3421],[28,[0,1],20.7086],[2,[1,2],20.3884],[152,[0,1],19.3598]],
+    "sistema-cardiovascular/diabetes-mellitus": [[48,[0,1,2],29.8184],[667,[3],23.6481],[49,[0,3],22.3495],[261,[1,2],22.3421],[63,[0,2],22.0172],[123,[1,2],21.0146]],
+    "sistema-cardiovascular/obesidad": [[562,[1,2],28.3262],[19,[2],18.4751],[586,[2],15.0101],[99,[0],14.1951],[396,[1,2],12.6684],[77,[1],11.7497]],
+    "sistema-cardiovascular/apnea-del-sueno": [[333,[0,1,2],10.3458],[481,[2],8.6862],[4,[0,1,2],8.6135],[354,[0,1,2],7.7382],[664,[2],7.1181],[453,[3],6.7933]],
+    "sistema-cardiovascular/lupus-eritematoso-sistemico": [[48,[0,1,2],29.8184],[49,[0,3],22.3495],[261,[1,2],22.3421],[28,[0,1],20.7086],[492,[0,1,2],20.4036],[2,[1,2],20.3884]],
+    "sistema-nervioso/migraña": [[68,[0,2],27.1589],[4,[2],24.3193],[354,[0],22.2112],[75,[0,1],19.7563],[260,[1,3],18.7303],[344,[0,2],17.7892]],
+    "sistema-nervioso/epilepsia": [[75,[0,1,2],7.9699],[281,[0,1,2],6.7706],[172,[0,1,2],6.633],[244,[0,1,2],6.633],[341,[0,1,2],6.2922],[450,[2],5.8311]],
+    "sistema-nervioso/parkinson": [[56,[2],8.0735],[265,[1],7.5255],[560,[0,1,2],7.3354],[448,[2],6.8725],[659,[2],6.7884],[680,[2],6.5479]],
+    "sistema-nervioso/alzheimer": [[670,[0,3],28.7654],[660,[1,3],25.9879],[348,[0],25.3721],[686,[0],16.2761],[22,[0,1,2],14.9477],[677,[3],14.9006]],
+    "sistema-nervioso/esclerosis-múltiple": [[658,[0,2,3],16.0283],[676,[1,3],14.1843],[667,[0,2],13.8661],[661,[1,2],12.8999],[624,[0,1,2],12.8468],[24,[0,1,2],11.8629]],
+    "sistema-nervioso/neuralgia": [[261,[1,2],33.5132],[352,[0,1,2],30.5706],[207,[1,2],30.1794],[326,[0,1,2],28.7837],[338,[0,2],25.8429],[354,[0],24.1688]],
+    "sistema-nervioso/neuropatía": [[624,[0,1,2],13.2948],[253,[0],13.0608],[75,[0,1,2],12.2884],[118,[0,1,2],9.5634],[306,[0,1,2],8.8705],[56,[2],8.0735]],
+    "sistema-nervioso/vértigo": [[669,[0],16.5513],[692,[3],10.499],[624,[0,1,2],9.0624],[403,[0],8.4642],[558,[2],8.3524],[4,[0,1,2],8.1134]],
+    "sistema-nervioso/insomnio": [[56,[0,1,2],66.6754],[55,[0,1,2],55.8626],[322,[0,1,2],50.1846],[323,[0,1,2],39.5823],[448,[0,1,2],38.8065],[324,[0,2,3],37.9654]],
+    "sistema-nervioso/accidente-cerebrovascular-acv": [[4,[0,1,2],17.2183],[592,[1],13.3627],[692,[0],12.7258],[668,[2,3],12.2265],[354,[0,1,2],11.6074],[513,[0,1,2],10.0019]],
+    "sistema-nervioso/aneurisma-cerebral": [[4,[0,1,2],12.9202],[692,[0],12.7258],[668,[2,3],12.2265],[354,[0,1,2],11.6074],[669,[0,3],10.1193],[592,[1],9.3378]],
+    "sistema-nervioso/tumor-cerebral": [[4,[0,1,2],17.2183],[592,[1],13.3627],[692,[0],12.7258],[668,[2,3],12.2265],[354,[0,1,2],11.6074],[513,[0,1,2],10.0019]],
+    "sistema-nervioso/esclerosis-lateral-amiotrófica-ela": [[680,[2],22.1608],[366,[2],17.7185],[658,[0,1,3],17.3637],[661,[0,1],14.4451],[685,[3],13.6068],[201,[0,1,2],13.5076]],
+    "sistema-nervioso/hernia-de-disco": [[624,[0,1,2],17.0792],[75,[0,1,2],11.6074],[669,[3],10.134],[118,[0,1,2],9.5634],[549,[0,1,2],9.2465],[4,[0,1,2],9.1049]],
+    "sistema-nervioso/enfermedad-de-huntington": [[366,[2],13.9443],[271,[2],12.4162],[692,[0,1,2],11.0629],[686,[0,1,2],10.1756],[26,[2],8.5431],[343,[0,1,2],8.4769]],
+    "sistema-nervioso/demencia-con-cuerpos-de-lewy": [[670,[0,3],13.1946],[660,[1,3],12.8866],[692,[3],11.705],[686,[3],10.9739],[348,[0,1,2],10.5737],[366,[0,1,2],10.5135]],
+    "sistema-nervioso/ataxia-de-friedreich": [[685,[3],13.6068],[680,[2],12.8976],[677,[1,2],12.4713],[26,[2],11.876],[332,[0],10.6444],[346,[0],10.3791]],
+    "sistema-nervioso/síndrome-de-la-persona-rígida": [[305,[0,1,2],19.0461],[680,[2],15.8111],[56,[2],8.0735],[81,[0,1,2],7.9129],[102,[0,1],7.7488],[265,[1],7.5255]],
+    "sistema-nervioso/encefalitis": [[4,[0,1,2],12.9202],[354,[0,1,2],11.6074],[678,[3],10.4092],[333,[0,1,2],10.0505],[255,[0,1,2],9.8247],[481,[2],8.6862]],
+    "sistema-nervioso/enfermedad-de-charcot-marie-tooth": [[244,[0,1,2],13.6703],[305,[0,1,2],11.3613],[56,[2],8.0735],[75,[0,1,2],7.9699],[24,[0,1,2],7.6599],[166,[0,1,2],7.6599]],
+    "sistema-nervioso/enfermedades-de-las-neuronas-motoras": [[366,[0,1,2],9.6383],[56,[2],8.0735],[265,[1],7.5255],[448,[2],6.8725],[659,[2],6.7884],[680,[2],6.5479]],
+    "sistema-nervioso/enfermedad-de-von-hippel-lindau": [[677,[1,2],18.9851],[658,[0,3],18.6239],[366,[2],15.1179],[26,[2],11.876],[172,[0,1,2],11.7339],[305,[0,1,2],11.3613]],
+    "sistema-nervioso/enfermedades-de-la-médula-espinal": [[281,[0,1,2],13.7338],[75,[0,1,2],12.2884],[685,[0],12.2219],[305,[0,1,2],11.3613],[118,[0,1,2],9.5634],[306,[0,1,2],8.8705]],
+    "sistema-nervioso/absceso-cerebral-parasitario": [[692,[0,3],20.4714],[4,[0,1,2],12.9202],[668,[2,3],12.2265],[354,[0,1,2],11.6074],[678,[3],10.4092],[333,[0,1,2],10.0505]],
+    "sistema-nervioso/absceso-raquídeo": [[75,[0,1,2],12.2884],[678,[3],7.4982],[51,[0,1,2],7.3078],[554,[0,1,2],6.3058],[450,[2],5.8311],[333,[0,1,2],5.7193]],
+    "sistema-nervioso/accidente-isquémico-transitorio": [[692,[3],18.8086],[518,[0,1,2],12.6996],[312,[4],9.4876],[102,[0,1],8.6527],[75,[0,1,2],7.9699],[610,[0,1,2],7.4252]],
+    "sistema-nervioso/adrenoleucodistrofia": [[681,[2],10.8775],[513,[0,1,2],10.0019],[305,[0,1,2],9.0578],[75,[0,1,2],7.9699],[670,[0,1,2],7.4337],[320,[0,1,2],6.5316]],
+    "sistema-nervioso/afasia": [[52,[0,1,2],6.8616],[281,[0,1,2],6.7706],[172,[0,1,2],6.633],[244,[0,1,2],6.633],[83,[0,1,2],5.9236],[305,[0,1,2],5.5127]],
+    "sistema-nervioso/laberintitis": [[669,[0],13.0526],[692,[3],10.499],[403,[0],8.4642],[75,[0,1,2],7.9699],[281,[0,1,2],6.7706],[172,[0,1,2],6.633]],
+    "sistema-nervioso/enfermedad-de-lafora": [[332,[0],11.8592],[271,[1],11.1815],[305,[0],10.8358],[313,[3],10.211],[659,[1],7.7907],[670,[0],7.6044]],
+    "sistema-nervioso/síndrome-de-landau-kleffner": [[281,[0,1,2],10.7121],[448,[0,1,2],9.2753],[305,[0,1,2],8.7218],[609,[0,1,2],8.6954],[323,[2],8.4275],[75,[0,1,2],7.9699]],
+    "sistema-nervioso/síndrome-de-leigh": [[677,[1,2],18.9851],[658,[0,3],18.6239],[26,[2],11.876],[172,[0,1,2],11.7339],[332,[0],10.6444],[346,[0],10.3791]],
+    "sistema-nervioso/leucoaraiosis": [[659,[1,2],15.3996],[660,[2,3],14.6806],[692,[0,1,2],11.0629],[513,[0,1,2],10.0019],[650,[0,1],9.6037],[403,[0],8.4642]],
+    "sistema-nervioso/leucodistrofia-metacromática": [[658,[0,1,3],17.8765],[685,[3],13.6068],[285,[2],12.9596],[680,[2],12.8976],[677,[1,2],12.4713],[366,[2],12.3332]],
+    "sistema-nervioso/leucoencefalopatía": [[692,[0,1,2],11.0629],[659,[1],7.7907],[670,[0],7.6044],[312,[0,1,2],7.4337],[660,[3],7.4269],[671,[0],7.4269]],
+    "sistema-nervioso/ausencia-del-tabique-pelúcido": [[71,[0,1,2],9.2465],[513,[0,1,2],6.7376],[587,[0,1,2],6.2068],[686,[0,1,2],6.2046],[81,[0,1,2],6.0753],[605,[0,1,2],5.9493]],
+    "sistema-nervioso/enfermedad-por-depósito-de-lípidos-ácidos": [[17,[0,1,2],11.3941],[673,[3],9.2671],[580,[0,1,2],8.4874],[465,[0,1,2],8.2891],[366,[0,1,2],7.9129],[662,[0],7.7907]],
+    "sistema-nervioso/dolor-de-espalda": [[180,[0,1,2],11.5803],[118,[0,1,2],9.5634],[306,[0,1,2],8.8705],[56,[2],8.0735],[669,[3],7.9946],[265,[1],7.5255]],
+    "sistema-nervioso/síndrome-de-barth": [[349,[2],18.0208],[183,[0,1,2],12.3061],[306,[0,1,2],10.3122],[336,[2],8.521],[461,[0],8.2255],[56,[2],8.0735]],
+    "sistema-nervioso/cadasil": [[305,[0],17.9661],[692,[0],17.6807],[471,[2],15.7718],[22,[0,1,2],14.9477],[677,[3],14.9006],[670,[3],14.7225]],
+    "sistema-inmunologico/lupus": [[482,[2],19.0564],[339,[0,1,2],17.6306],[676,[1,3],16.4284],[667,[0,2],15.1878],[446,[1],14.1055],[305,[0,1,2],13.5334]],
+    "sistema-inmunologico/artritis-reumatoide": [[339,[0,1],32.8932],[106,[1],28.37],[288,[0,1,4],26.8846],[223,[0],25.5828],[215,[0,1],21.5817],[380,[1,2],20.0837]],
+    "sistema-inmunologico/psoriasis": [[393,[2,3],19.9072],[381,[0,2],19.0375],[388,[1,2],18.7643],[581,[0,1],18.7643],[115,[0,1],18.5657],[222,[1,2],18.4988]],
+    "sistema-inmunologico/vitiligo": [[674,[2],13.001],[482,[0,1,2],12.2881],[315,[3],12.2791],[650,[0,1],10.7789],[450,[2],8.7467],[17,[0,1,2],8.0145]],
+    "sistema-inmunologico/alergias": [[626,[0,1,2],50.3766],[31,[1,2],38.0107],[372,[0],25.8204],[388,[1,2],25.4515],[364,[1],24.9005],[73,[3,4],24.399]],
+    "sistema-inmunologico/inmunodeficiencias": [[467,[4],18.8707],[372,[0,1,2],18.6636],[175,[0,1,2],17.8861],[482,[2],17.5973],[107,[0],16.6896],[368,[0,1,2],16.4863]],
+    "sistema-inmunologico/enfermedad-celiaca": [[450,[2,5],22.7478],[14,[0,1,2],15.2669],[623,[0,1,2],14.9216],[241,[0,1,2],13.9733],[75,[0,1,2],13.2531],[444,[3],11.9428]],
+    "sistema-inmunologico/esclerosis-multiple": [[658,[0,2,3],25.9034],[519,[0,1,2],13.7162],[677,[1,2],12.6567],[676,[1,3],11.3795],[667,[0,2],10.3012],[462,[2],9.2606]],
+    "sistema-inmunologico/enfermedad-de-graves": [[469,[2,3],30.0218],[450,[2,5],25.9595],[559,[1],24.0634],[305,[4],23.977],[395,[1],21.7577],[399,[1],20.0623]],
+    "sistema-inmunologico/tiroiditis-de-hashimoto": [[661,[0,2],15.6015],[660,[0,2],14.3149],[467,[4],14.2474],[446,[1,4],13.5771],[451,[1],13.4409],[457,[1],13.2673]],
+    "sistema-inmunologico/enfermedad-de-addison": [[450,[2],17.0779],[475,[2,4],15.4117],[672,[2],13.3984],[676,[3],12.9448],[477,[2,3],12.3634],[305,[0,1,2],11.3613]],
+    "sistema-inmunologico/miastenia-gravis": [[462,[2],9.2606],[518,[0,1,2],9.0558],[17,[0,1,2],8.0145],[519,[0,1,2],7.695],[547,[0,1,2],7.6599],[305,[0,1,2],5.8486]],
+    "sistema-inmunologico/sindrome-de-sjogren": [[464,[2],13.134],[173,[1],12.9684],[658,[0,2,3],11.5587],[676,[1,3],11.3795],[523,[0,1,2],10.381],[467,[4],10.1466]],
+    "sistema-inmunologico/esclerodermia": [[547,[0,1,2],14.6975],[665,[3],14.1665],[465,[0,1,2],12.4336],[349,[2],11.2413],[539,[2],10.2817],[74,[0,1,2],10.2484]],
+    "sistema-inmunologico/polimiositis": [[667,[0,1,2],10.4531],[482,[0,1,2],9.9722],[56,[2],9.7681],[598,[0,1,2],8.8379],[31,[0,1,2],8.263],[17,[0,1,2],8.0145]],
+    "sistema-inmunologico/dermatomiositis": [[479,[0,1,2],15.5612],[224,[0,1,2],13.2335],[404,[0,1,2],8.9828],[31,[0,1,2],8.263],[17,[0,1,2],8.0145],[337,[2],7.9824]],
+    "sistema-inmunologico/diabetes-tipo-1": [[450,[0,2],21.8481],[620,[0,2],21.3687],[378,[0,1],20.704],[535,[0,2],20.5941],[236,[1,3],19.5485],[289,[1,3],18.8341]],
+    "sistema-inmunologico/enfermedad-inflamatoria-intestinal": [[17,[0,1,2],17.0912],[450,[2],17.0779],[223,[0,1,2],14.5194],[489,[3],13.6003],[75,[0,1,2],13.2531],[36,[0,1,2],12.1791]],
+    "sistema-inmunologico/hepatitis-autoinmune": [[270,[1,2,3],37.9592],[529,[0,2],29.6217],[147,[0,1],28.3545],[450,[0,2,5],22.3985],[617,[1,2],21.8938],[238,[0,1],21.2948]],
+    "sistema-inmunologico/anemia-perniciosa": [[67,[0,1,2],23.1096],[289,[0],22.0288],[299,[0,1],22.0002],[398,[0],21.3701],[7,[1],20.7525],[393,[0],20.4747]],
+    "sistema-inmunologico/vasculitis-autoinmune": [[450,[2,5],25.9595],[339,[0,1,2],17.6306],[576,[0,1,2],16.2645],[492,[0,1,2],14.9424],[467,[4],14.4128],[75,[0,1,2],13.2531]],
+    "sistema-inmunologico/sarcoidosis": [[450,[2],17.0779],[676,[3],12.9448],[617,[0,1,2],10.7801],[667,[0,1,2],10.4531],[75,[0,1,2],10.3741],[396,[0,1,2],10.1675]],
+    "sistema-inmunologico/alopecia-areata": [[674,[2],13.001],[219,[0,1,2],9.2016],[450,[2],8.7467],[500,[0,1,2],8.4766],[465,[0,1,2],7.8168],[463,[0,1,2],7.5931]],
+    "sistema-inmunologico/sindrome-de-guillain-barre": [[464,[2],18.3619],[624,[0,1,2],14.9048],[446,[1],14.1055],[482,[2],13.746],[452,[2],12.7971],[542,[0,1,2],12.3446]],
+    "sistema-inmunologico/purpura-trombocitopenica-idiopatica": [[676,[0,3],13.4424],[305,[0],12.1175],[302,[2],11.5188],[306,[3],8.3715],[661,[2],7.9926],[36,[0,1,2],7.3612]],
+    "sistema-inmunologico/sindrome-antifosfolipido": [[444,[3],15.5576],[445,[3],15.3382],[478,[2,4],13.6898],[449,[2,4],13.1174],[305,[0],12.1175],[467,[4],10.1466]],
+    "sistema-inmunologico/enfermedad-de-behcet": [[482,[4],16.5145],[576,[0,1,2],16.2645],[492,[0,1,2],14.9424],[337,[2],13.5208],[547,[0,1,2],12.7845],[446,[2],11.5043]],
+    "sistema-inmunologico/espondilitis-aniquilosante": [[482,[4],11.8528],[380,[0,1,2],10.25],[50,[0],9.6732],[82,[0,1,2],9.316],[475,[0,4],9.306],[675,[2],9.2168]],
+    "sistema-inmunologico/artritis-psoriasica": [[222,[0,1,2],29.2527],[288,[0,1,4],26.8846],[223,[0,1],25.2694],[75,[0,1],22.4522],[106,[1],22.1833],[645,[0,1],22.16]],
+    "sistema-inmunologico/artritis-reactiva": [[288,[0,1,4],26.8846],[380,[1,2],25.7348],[106,[1],22.1833],[215,[0,1],21.5817],[675,[1,2],20.5092],[339,[0,1],19.764]],
+    "sistema-inmunologico/fiebre-reumatica": [[454,[1,2,3],22.3288],[267,[0,2,3],21.6335],[633,[1,3],21.4543],[46,[2,3],20.3291],[640,[1,3],20.1583],[528,[0,2],18.3652]],
+    "sistema-inmunologico/uveitis-autoinmune": [[50,[0],15.3065],[305,[0,1,2],13.5334],[482,[4],11.8528],[558,[2],10.9577],[380,[0,1,2],10.25],[462,[2],9.2606]],
+    "sistema-inmunologico/penfigoide": [[305,[0,1,2],13.5334],[547,[0,1,2],12.7845],[499,[0,1,2],11.3],[200,[1],11.1012],[527,[0,1,2],11.094],[83,[0,1,2],8.8854]],
+    "sistema-inmunologico/liquen-plano": [[674,[2],13.001],[315,[3],12.2791],[499,[0,1,2],11.6502],[527,[0,1,2],11.094],[320,[0,1,2],11.0369],[461,[0,3],10.9415]],
+    "sistema-inmunologico/urticaria-cronica-idiopatica": [[542,[0,1,2],13.4547],[608,[0,1,2],12.6271],[272,[0,1,2],10.4911],[17,[0,1,2],9.0767],[83,[0,1,2],8.8854],[335,[0,1,2],8.3692]],
+    "sistema-endocrino/diabetes-mellitus-tipo-2": [[661,[0,2],23.8633],[399,[0],23.279],[660,[0,2],22.8293],[32,[1],22.3077],[620,[0,2],21.3687],[123,[1,2],21.0146]],
+    "sistema-endocrino/diabetes-mellitus-tipo-1": [[305,[4],26.149],[63,[2],23.499],[399,[0],23.279],[620,[0,2],21.3687],[80,[0,1,2],21.1125],[123,[1,2],21.0146]],
+    "sistema-endocrino/hipotiroidismo": [[395,[0,1],54.3821],[469,[3],46.1823],[399,[0,1],41.6498],[559,[1],28.9114],[402,[0,2],27.267],[227,[0,2],23.964]],
+    "sistema-endocrino/hipertiroidismo": [[399,[1],30.0935],[349,[2,3],29.5824],[559,[1],24.0634],[312,[0,3],21.8942],[395,[1],21.7577],[469,[3],20.7255]],
+    "sistema-endocrino/sindrome-de-ovario-poliquistico": [[202,[1,2],18.0225],[358,[2],17.4653],[173,[1],15.303],[396,[1],15.1967],[52,[0,1,2],11.2127],[690,[0,1,2],9.4991]],
+    "sistema-endocrino/enfermedad-de-addison": [[475,[2,4],15.4117],[396,[0,1,2],15.2513],[672,[2],13.3984],[681,[2],13.1072],[123,[0,1,2],12.9832],[41,[0,1,2],12.696]],
+    "sistema-endocrino/enfermedad-de-graves": [[305,[4],31.6618],[399,[1],30.0935],[559,[1],24.0634],[312,[0,3],21.8942],[395,[1],21.7577],[469,[3],20.7255]],
+    "sistema-endocrino/enfermedad-de-cushing": [[352,[0,1,2],31.1799],[46,[1,3],29.5633],[49,[0,3],24.9953],[28,[0,1],24.7694],[2,[1,2],24.3529],[181,[1,2],24.1048]],
+    "sistema-endocrino/acromegalia": [[312,[0],14.6995],[305,[4],14.2696],[666,[2],10.6215],[10,[2],10.006],[202,[0],9.1067],[403,[0],8.4824]],
+    "sistema-endocrino/enanismo": [[183,[0,1,2],11.9775],[666,[2],10.6215],[333,[0,1,2],8.002],[297,[3],7.4269],[461,[0],6.9408],[52,[0,1,2],6.8616]],
+    "sistema-endocrino/gigantismo": [[666,[2],10.6215],[610,[0,1,2],9.227],[183,[0,1,2],8.2041],[16,[0,1,2],6.3449],[641,[0,1,2],5.9143],[639,[0,1,2],5.7834]],
+    "sistema-endocrino/prolactinoma": [[32,[0,1,2],22.0441],[574,[0,1,2],21.567],[603,[0,1,2],15.0285],[262,[0,1,2],13.7815],[573,[0,1,2],13.7815],[4,[0,1,2],11.4789]],
+    "sistema-endocrino/sindrome-metabolico": [[123,[1,2],51.301],[378,[0,1],37.6245],[634,[0,3],34.852],[588,[0,2],33.621],[41,[1],33.2548],[642,[0,3],33.1872]],
+    "sistema-endocrino/obesidad": [[19,[2],27.7126],[99,[0],21.2927],[562,[1,2],18.8841],[586,[2],15.0101],[396,[1,2],12.6684],[481,[1,2,3],10.0893]],
+    "sistema-endocrino/osteoporosis": [[403,[1],26.5381],[553,[0,1,2],25.3602],[387,[1],21.3755],[101,[0],18.026],[398,[0,2],17.7259],[298,[2],15.9156]],
+    "sistema-endocrino/hiperparatiroidismo": [[666,[2],10.6215],[669,[0,3],10.1193],[519,[0,1,2],9.1441],[518,[0,1,2],8.4213],[661,[2],7.9926],[302,[2],7.6792]],
+    "sistema-endocrino/hipoparatiroidismo": [[19,[0,1,2],12.3419],[123,[0,1,2],12.0628],[32,[0,1,2],11.7959],[136,[0,1,2],11.7959],[364,[0,1,2],11.7959],[378,[0,1,2],11.7959]],
+    "sistema-endocrino/cancer-de-tiroides": [[367,[0,1,2],10.0847],[678,[3],10.0724],[399,[0,1,2],9.2465],[312,[0,1,2],7.4337],[636,[0,1,2],6.8365],[491,[0,1,2],6.6298]],
+    "sistema-endocrino/insulinoma": [[669,[0,3],9.8714],[414,[0,1,2],9.7186],[380,[0,1,2],9.084],[481,[2],8.6862],[4,[0,1,2],8.6135],[610,[0,1,2],8.263]],
+    "sistema-endocrino/glucagonoma": [[666,[0,2],17.8752],[19,[0,1,2],17.7038],[123,[0,1,2],17.3033],[32,[0,1,2],17.0697],[136,[0,1,2],16.9205],[364,[0,1,2],16.9205]],
+    "sistema-endocrino/feocromocitoma": [[138,[0,1,2],13.4533],[672,[2],13.3984],[681,[2],13.1072],[123,[0,1,2],12.9832],[41,[0,1,2],12.696],[453,[4],12.0654]],
+    "sistema-endocrino/diabetes-insipida": [[399,[0],23.279],[32,[1],22.1585],[574,[0],21.7882],[443,[0,2,5],21.7523],[202,[0],21.5069],[620,[0,2],21.3687]],
+    "sistema-endocrino/tiroiditis-de-hashimoto": [[395,[0,1],54.3821],[469,[3],46.1823],[399,[0,1],32.4032],[559,[1],28.9114],[402,[0,2],27.267],[227,[0,2],23.964]],
+    "sistema-endocrino/ginecomastia": [[202,[0],17.3483],[10,[2],10.006],[305,[4],8.7569],[403,[0],8.4824],[278,[3],8.2521],[358,[0],8.1416]],
+    "sistema-endocrino/galactorrea": [[481,[2],8.6862],[4,[0,1,2],8.6135],[202,[2],8.4042],[306,[3],8.1688],[93,[0,1,2],8.0291],[354,[0,1,2],7.7382]],
+    "sistema-endocrino/pubertad-precoz": [[16,[0,1,2],6.3449],[345,[0,1,2],6.2905],[89,[0,1,2],5.9236],[287,[0,1,2],5.8101],[261,[0,1,2],5.3133],[366,[0,1,2],5.2753]],
+    "sistema-endocrino/retraso-de-la-pubertad": [[659,[2],7.609],[661,[0],7.609],[297,[3],7.4269],[660,[2],7.2537],[666,[0],7.2537],[461,[0],6.9408]],
+    "sistema-endocrino/sindrome-de-kallmann": [[202,[1],9.6183],[173,[1],9.496],[358,[0,1,2],7.155],[16,[0,1,2],6.3449],[52,[0,1,2],6.2905],[609,[0,1,2],5.7637]],
+    "sistema-endocrino/sindrome-de-turner": [[202,[1],9.6183],[173,[1],9.496],[120,[0,1,2],8.1843],[297,[3],7.4269],[358,[0,1,2],7.155],[461,[0],6.9408]],
+    "sistema-endocrino/sindrome-de-klinefelter": [[301,[0],12.9173],[202,[1],9.6183],[173,[1],9.496],[180,[0,1,2],8.8715],[183,[0,1,2],8.2041],[310,[4],8.1329]],
+    "sistema-endocrino/hiperplasia-suprarrenal-congenita": [[681,[2],13.1072],[673,[0,1,2],9.1743],[16,[0,1,2],6.3449],[345,[0,1,2],6.2905],[88,[0,1,2],6.1644],[337,[0,1,2],5.5384]],
+    "sistema-endocrino/neoplasia-endocrina-multiple-tipo-1": [[621,[0,1,2],15.2165],[609,[0,1,2],11.8148],[202,[1],9.6183],[503,[0,1,2],9.599],[173,[1],9.496],[519,[0,1,2],9.1441]],
+    "sistema-endocrino/neoplasia-endocrina-multiple-tipo-2": [[138,[0,1,2],13.4533],[672,[2],13.3984],[399,[0,1,2],13.1079],[123,[0,1,2],12.9832],[41,[0,1,2],12.696],[481,[2],12.0231]],
+    "sistema-endocrino/bocio": [[399,[0,1,2],9.2465],[571,[0,1,2],9.1068],[241,[0,1,2],8.528],[401,[0,1,2],7.8543],[352,[0,1,2],7.5285],[491,[0,1,2],7.2286]],
+    "sistema-endocrino/resistencia-a-la-hormona-tiroidea": [[48,[0,1,2],29.8184],[621,[1],28.8916],[658,[0,2,3],25.9034],[46,[1,3],25.4151],[49,[0,3],22.3495],[261,[1,2],22.3421]],
+    "sistema-musculoesqueletico/artritis": [[288,[0,1,4],40.3269],[215,[0,1],32.3726],[128,[1,2],28.8696],[654,[0,1],27.664],[339,[0,1],27.3617],[308,[1,2],27.1724]],
+    "sistema-musculoesqueletico/osteoporosis": [[553,[0,1,2],38.0403],[101,[0],27.0391],[398,[0,2],26.5889],[403,[1],26.5381],[298,[2],23.8734],[561,[2],22.0702]],
+    "sistema-musculoesqueletico/osteomalacia": [[101,[0],17.2396],[669,[3],11.9919],[75,[0,1,2],11.6074],[33,[0,1,2],11.0777],[128,[0,1,2],11.0777],[561,[2],11.0351]],
+    "sistema-musculoesqueletico/sindrome-del-tunel-carpiano": [[624,[0,1,2],14.9048],[202,[1],6.4122],[173,[1],6.3307],[609,[0,1,2],5.7637],[668,[3],5.2035],[669,[3],5.2035]],
+    "sistema-musculoesqueletico/tendinitis": [[675,[2],12.8652],[75,[0,1,2],11.6074],[654,[0,1],11.2214],[652,[0,1],10.9617],[641,[0,1,2],10.7137],[380,[0,1,2],10.25]],
+    "sistema-musculoesqueletico/desgarro-del-manguito-rotatorio": [[413,[0,1,2],9.4384],[668,[3],5.2035],[669,[3],5.2035],[519,[0,1,2],5.13],[654,[0,1],5.0346],[675,[2],5.0192]],
+    "sistema-musculoesqueletico/bursitis": [[128,[0,1,2],21.0336],[668,[3],13.9864],[566,[0,1,2],12.361],[339,[0,1,2],12.0991],[75,[0,1,2],11.6074],[654,[0,1],11.2214]],
+    "sistema-musculoesqueletico/distrofia-muscular": [[685,[0,1,2],11.5843],[450,[2],8.7467],[17,[0,1,2],8.0145],[75,[0,1,2],7.9699],[659,[2],6.7884],[669,[3],6.7884]],
+    "sistema-musculoesqueletico/calambre-muscular": [[201,[0,1,2],13.5076],[669,[3],11.9919],[33,[0,1,2],11.0777],[128,[0,1,2],11.0777],[595,[0,1,2],10.8327],[680,[2],10.5407]],
+    "sistema-musculoesqueletico/enfermedades-neuromusculares": [[201,[0,1,2],13.5076],[685,[0,1,2],11.5843],[680,[2],10.5407],[244,[0,1,2],9.1135],[450,[2],8.7467],[17,[0,1,2],8.0145]],
+    "sistema-musculoesqueletico/esclerosis-multiple": [[403,[0],12.6963],[497,[2],11.7725],[676,[1,3],10.8183],[658,[0,2,3],10.6855],[667,[0,2],10.6084],[452,[2],9.8193]],
+    "sistema-musculoesqueletico/fibromialgia": [[227,[0,1,2],37.5822],[230,[0,1,2],29.4486],[118,[0,1],27.3887],[677,[1,2,3],25.2341],[613,[0,1],24.8866],[657,[0,1],24.6172]],
+    "sistema-musculoesqueletico/miastenia-grave": [[305,[0,1,2],11.1617],[669,[3],9.9975],[518,[0,1,2],9.0558],[17,[0,1,2],8.0145],[659,[2],6.7884],[33,[0,1,2],6.2709]],
+    "sistema-musculoesqueletico/miositis": [[598,[0,1,2],13.2568],[654,[0,1],11.2214],[33,[0,1,2],11.0777],[128,[0,1,2],11.0777],[652,[0,1],10.9617],[595,[0,1,2],10.8327]],
+    "sistema-musculoesqueletico/sarcoma-de-tejido-blando": [[380,[0,1,2],13.6261],[137,[0],11.8597],[14,[0,1,2],11.3941],[623,[0,1,2],11.1364],[576,[0,1,2],10.843],[241,[0,1,2],10.4287]],
+    "sistema-musculoesqueletico/enfermedad-discal-degenerativa": [[624,[0,1,2],8.8632],[17,[0,1,2],8.0145],[349,[0,1,2],5.5958],[180,[0,1,2],5.5387],[351,[0,1,2],5.3265],[63,[0,1,2],5.2221]],
+    "sistema-musculoesqueletico/epicondilitis": [[654,[0,1],11.2214],[652,[0,1],10.9617],[641,[0,1,2],10.7137],[380,[0,1,2],10.25],[675,[2],9.2168],[615,[0,1,2],5.9068]],
+    "sistema-musculoesqueletico/distension-muscular": [[404,[0,2],16.1622],[669,[3],11.9919],[75,[0,1,2],11.6074],[450,[3],11.5212],[33,[0,1,2],11.0777],[128,[0,1,2],11.0777]],
+    "sistema-musculoesqueletico/gota": [[288,[0,1,4],40.3269],[215,[0,1],32.3726],[566,[1],31.9266],[308,[1,2],30.886],[128,[1,2],28.8696],[652,[0,1],27.6337]],
+    "sistema-musculoesqueletico/espondilitis-anquilosante": [[288,[0,1,4],40.3269],[75,[0,1],34.3593],[215,[0,1],32.3726],[654,[0,1],27.664],[652,[0,1],27.1539],[641,[0,1],26.6631]],
+    "sistema-musculoesqueletico/osteopenia": [[553,[0,1,2],44.3554],[398,[0,2],32.3688],[625,[2],28.7083],[561,[2],27.6152],[101,[0],27.0391],[403,[1],26.5381]],
+    "sistema-musculoesqueletico/lumbalgia": [[128,[1,2],33.298],[327,[0,1],30.5165],[306,[0,2],27.5824],[212,[0,1],26.2904],[118,[1],25.293],[669,[1,3],22.4949]],
+    "sistema-musculoesqueletico/fracturas-oseas": [[101,[0],17.2396],[75,[0,1,2],11.6074],[561,[2],11.0351],[212,[0,1],10.8056],[398,[2],9.9401],[404,[2],9.7366]],
+    "sistema-musculoesqueletico/escoliosis": [[617,[0,1,2],8.8503],[183,[0,1,2],6.6458],[110,[0,1,2],5.7685],[383,[0,1,2],5.7685],[366,[0,1,2],5.2753],[535,[0,1,2],5.2753]],
+    "sistema-musculoesqueletico/lupus-eritematoso-sistemico": [[48,[0,1,2],29.8184],[49,[0,3],22.3495],[261,[1,2],22.3421],[28,[0,1],20.7086],[2,[1,2],20.3884],[564,[2],19.5518]],
+    "sistema-musculoesqueletico/artritis-reumatoide": [[288,[0,1,4],40.3269],[339,[0,1],32.8932],[215,[0,1],32.3726],[128,[1,2],28.8696],[106,[1],28.37],[75,[0,1],26.3893]],
+    "sistema-musculoesqueletico/artritis-psoriasica": [[288,[0,1,4],40.3269],[75,[0,1],33.6783],[215,[0,1],32.3726],[308,[1,2],30.886],[223,[0,1],25.2694],[106,[1],22.1833]],
+    "sistema-musculoesqueletico/ciatica": [[624,[0,1,2],14.9048],[180,[0,1,2],11.5803],[39,[0,1,2],9.1885],[631,[0,1,2],6.4255],[66,[0,1,2],6.1644],[40,[2],6.0022]],
+    "sistema-musculoesqueletico/quiste-de-baker": [[128,[0,1,2],21.0336],[668,[3],13.9864],[566,[0,1,2],12.361],[339,[0,1,2],12.0991],[652,[0,1],11.4414],[118,[0,1,2],11.154]],
+    "sistema-musculoesqueletico/dedo-en-gatillo": [[201,[0],6.8678],[672,[0,1,2],6.7933],[98,[0,1],6.4361],[624,[0,1,2],6.0416],[150,[0,1],6.0182],[86,[0,1,2],5.4305]],
+    "sistema-musculoesqueletico/sindrome-del-tunel-tarsiano": [[624,[0,1,2],14.9048],[354,[0,1,2],9.0433],[654,[0,1],7.8404],[652,[0,1],7.6589],[669,[3],7.2036],[349,[0,1,2],7.0521]],
+    "sistema-musculoesqueletico/enfermedad-de-de-quervain": [[297,[3],11.0547],[461,[0],10.3311],[624,[0,1,2],8.8632],[17,[0,1,2],8.0145],[150,[0,1],6.0182],[40,[2],6.0022]],
+    "sistema-musculoesqueletico/esclerodermia": [[539,[2],10.2817],[547,[0,1,2],9.7983],[665,[3],9.4443],[550,[0,1,2],9.3786],[358,[2],9.1323],[546,[0,1,2],8.9211]],
+    "sistema-musculoesqueletico/sindrome-de-ehlers-danlos": [[668,[3],13.9864],[128,[0,1,2],12.9202],[566,[0,1,2],12.361],[339,[0,1,2],12.0991],[118,[0,1,2],11.154],[576,[0,1,2],10.843]],
+    "sistema-musculoesqueletico/displasia-fibrosa": [[404,[0,2],21.9778],[101,[0],17.2396],[413,[0,1,2],16.0929],[480,[2,4],14.1993],[649,[0,1],12.7961],[344,[3],11.8493]],
+    "sistema-musculoesqueletico/lesiones-de-la-placa-de-crecimiento": [[75,[0,1,2],11.6074],[404,[2],9.7366],[209,[0,1,2],8.6527],[247,[0,1,2],8.6527],[450,[3],7.9993],[101,[0,1],7.4401]],
+    "sistema-musculoesqueletico/dolor-de-espalda": [[669,[3],11.9919],[75,[0,1,2],11.6074],[180,[0,1,2],11.5803],[33,[0,1,2],11.0777],[128,[0,1,2],11.0777],[595,[0,1,2],10.8327]],
+    "sistema-musculoesqueletico/osteoartritis": [[75,[0,1],41.6482],[288,[0,1,4],40.3269],[215,[0,1],32.3726],[128,[1,2],28.8696],[339,[0,1],27.3617],[566,[1],23.8425]],
+    "sistema-musculoesqueletico/artrosis": [[128,[1,2],35.1405],[101,[0,1],29.7524],[75,[0,1],27.7262],[339,[0,1],27.3617],[118,[1],26.8836],[327,[0,1],24.995]],
+    "sistema-musculoesqueletico/contractura-muscular": [[128,[0,1,2],19.1911],[118,[0,1,2],16.5676],[668,[3],13.9864],[566,[0,1,2],12.361],[339,[0,1,2],12.0991],[669,[3],11.9919]],
+    "sistema-urinario/infeccion-urinaria": [[175,[0],21.4278],[174,[0],20.8802],[533,[0],20.8802],[252,[0,1,2],15.2051],[691,[2],14.2231],[525,[1],13.8398]],
+    "sistema-urinario/cistitis": [[175,[0,2],45.8556],[622,[0,1],42.4177],[174,[0,1],39.0449],[533,[0,2],39.0449],[178,[0,2,3],37.481],[183,[0,1,2],34.9054]],
+    "sistema-urinario/pielonefritis": [[175,[0],21.4278],[174,[0],20.8802],[533,[0],20.8802],[252,[0,1,2],15.2051],[691,[2],14.2231],[525,[1],13.8398]],
+    "sistema-urinario/calculos-renales": [[48,[0,1,2],29.8184],[283,[1,3],23.0003],[49,[0,3],22.3495],[261,[1,2],22.3421],[28,[0,1],20.7086],[2,[1,2],20.3884]],
+    "sistema-urinario/incontinencia-urinaria": [[525,[0,1],19.4803],[174,[0,2],17.7834],[533,[0,1],17.7834],[175,[0],16.894],[526,[0,2],15.8811],[332,[0,1],15.453]],
+    "sistema-urinario/insuficiencia-renal": [[352,[0,1,2],31.1799],[28,[0,1],24.7694],[2,[1,2],24.3529],[283,[1,3],23.0003],[131,[0,2],22.9378],[49,[0,3],22.3495]],
+    "sistema-urinario/enfermedad-renal-cronica": [[522,[0,1,2],17.9579],[665,[1,3],16.4236],[319,[0,1,2],11.9058],[277,[0,1,2],11.7985],[77,[0,1,2],11.7766],[17,[0,1,2],11.3941]],
+    "sistema-urinario/uretritis": [[175,[0,1,2],8.7152],[568,[0,1,2],6.7098],[283,[0,1,2],6.5552],[371,[0,1,2],6.4393],[272,[0,1,2],5.7132],[619,[0,1,2],5.6512]],
+    "sistema-urinario/nefritis": [[672,[1,2],12.5004],[448,[4],12.2586],[123,[0,1,2],12.113],[319,[0,1,2],11.9058],[475,[2],10.5175],[293,[0,1,2],10.2112]],
+    "sistema-urinario/nefrosis": [[665,[0,3],15.2613],[667,[3],12.9059],[661,[0,2],10.401],[660,[0,2],9.9154],[375,[0,1,2],9.6383],[128,[0,1,2],8.1134]],
+    "sistema-urinario/hidronefrosis": [[525,[1],13.8398],[622,[1],13.8398],[174,[0],13.4401],[528,[0],13.4401],[533,[0],13.4401],[632,[0],13.4401]],
+    "sistema-urinario/vejiga-neurogenica": [[175,[0],21.4278],[632,[0],17.3815],[525,[1],13.8398],[622,[1],13.8398],[174,[0],13.4401],[533,[0],13.4401]],
+    "sistema-urinario/nocturia": [[255,[0,1,2],5.7685],[323,[2],5.6183],[661,[2],5.3284],[676,[3],5.2639],[324,[2],5.1786],[660,[0],5.0796]],
+    "sistema-urinario/cistitis-intersticial": [[528,[0,2],39.3701],[178,[0,2,3],37.481],[622,[0,1],37.2952],[183,[0,1,2],34.9054],[174,[0,1],34.1349],[533,[0,2],34.1349]],
+    "sistema-urinario/cancer-de-vejiga": [[175,[0,1,2],8.7152],[673,[2],7.8339],[183,[0,1,2],6.6458],[305,[0],6.6048],[137,[0],6.1945],[367,[0,1,2],6.0182]],
+    "sistema-urinario/cancer-de-rinon": [[75,[0,1,2],13.2531],[450,[2],11.3852],[51,[0,1,2],10.9617],[396,[0,1,2],10.1675],[580,[0,1,2],9.0273],[665,[3],8.3312]],
+    "sistema-urinario/diabetes-insipida": [[483,[0,1],20.0581],[305,[4],18.1283],[399,[0],15.5193],[341,[0],14.7791],[32,[1],14.7723],[574,[0],14.5255]],
+    "sistema-urinario/enfermedad-poliquistica-renal": [[305,[0],17.9661],[665,[0,3],15.2613],[481,[2],13.0293],[667,[3],12.9059],[453,[4],12.738],[672,[1,2],12.5004]],
+    "sistema-urinario/glomerulonefritis": [[293,[0,1,2],15.5095],[407,[0],13.2845],[672,[1,2],12.5004],[123,[0,1,2],12.113],[319,[0,1,2],11.9058],[475,[2],10.5175]],
+    "sistema-urinario/sindrome-nefrotico": [[665,[0,3],15.2613],[667,[3],12.2259],[661,[0,2],10.401],[660,[0,2],9.9154],[375,[0,1,2],9.6383],[216,[0,1,2],8.7989]],
+    "sistema-urinario/estenosis-de-la-arteria-renal": [[665,[0,1,3],23.3537],[319,[0,1,2],20.0411],[522,[0,1,2],17.9579],[492,[0,1,2],14.9424],[481,[2],13.0293],[128,[0,1,2],12.9202]],
+    "sistema-urinario/acidosis-tubular-renal": [[305,[0],12.4534],[519,[0,1,2],9.1441],[580,[0,1,2],9.0273],[676,[0,3],8.9616],[665,[3],8.3312],[252,[0,1,2],8.308]],
+    "sistema-urinario/reflujo-vesicoureteral": [[175,[0],30.143],[622,[1,2],24.1669],[632,[0,2],23.4749],[30,[1],17.1514],[4,[0,1],15.8554],[566,[2],14.9259]],
+    "sistema-urinario/extrofia-vesical": [[175,[0],16.894],[183,[0],13.5156],[164,[1],8.9129],[622,[1],8.7173],[174,[0],8.5301],[533,[0],8.5301]],
+    "sistema-urinario/hipospadias": [[648,[0,1],6.5885],[472,[0,1,2],5.5127],[679,[0,1,2],5.0381],[103,[0],5.0361],[542,[0,1,2],4.8133],[414,[0,1,2],4.422]],
+    "sistema-urinario/epispadias": [[175,[0],21.4278],[525,[1],13.8398],[622,[1],13.8398],[174,[0],13.4401],[533,[0],13.4401],[632,[0],13.4401]],
+    "sistema-urinario/sindrome-uremico-hemolitico": [[51,[0,1,2],10.9617],[678,[3],10.4092],[489,[3],10.2008],[239,[0,1,2],9.7602],[483,[1],9.6871],[308,[0,1,2],9.379]],
+    "sistema-urinario/nefropatia-por-iga": [[672,[1,2],12.5004],[522,[0,1,2],12.4561],[305,[0],12.4534],[123,[0,1,2],12.113],[319,[0,1,2],11.9058],[475,[2],10.5175]],
+    "sistema-urinario/vasculitis-renal": [[492,[0,1,2],14.9424],[472,[4],13.0349],[576,[0,1,2],10.843],[50,[0,1,2],10.7995],[580,[0,1,2],9.0273],[665,[3],8.3312]],
+    "sistema-urinario/estenosis-uretral": [[525,[1],13.8398],[622,[1],13.8398],[174,[0],13.4401],[528,[0],13.4401],[533,[0],13.4401],[632,[0],13.4401]],
+    "sistema-reproductor/endometriosis": [[87,[0,1,2],16.5561],[306,[3],16.3643],[202,[2],13.5095],[185,[0],13.0503],[201,[0],12.889],[589,[0,1,2],11.294]],
+    "sistema-reproductor/sindrome-de-ovario-poliquistico": [[202,[0,1,2],27.1292],[358,[0,2],25.6069],[173,[0,1],23.0306],[52,[0,1,2],16.819],[305,[4],14.2696],[690,[0,1,2],14.2486]],
+    "sistema-reproductor/enfermedad-inflamatoria-pelvica": [[690,[0],20.2494],[344,[3],14.1498],[678,[3],10.4092],[598,[0,1,2],8.8379],[472,[4],8.69],[39,[0,1,2],8.0109]],
+    "sistema-reproductor/fibromas-uterinos": [[201,[0],16.9017],[494,[0,1,2],12.7736],[306,[3],12.2533],[344,[0,1,2],9.9413],[380,[0,1,2],9.084],[460,[2],8.847]],
+    "sistema-reproductor/cancer-de-ovario": [[14,[0,1,2],17.0912],[75,[0,1,2],13.2531],[652,[0,1],11.6566],[450,[2],11.3852],[623,[0,1,2],11.1364],[241,[0,1,2],10.4287]],
+    "sistema-reproductor/cancer-de-cuello-uterino": [[137,[0],11.8597],[201,[0],10.8805],[358,[0,1,2],10.2723],[624,[0,1,2],10.107],[305,[0],9.8139],[306,[0,1,2],8.0021]],
+    "sistema-reproductor/prolapso-de-organos-pelvicos": [[48,[0,1,2],29.8184],[49,[0,3],22.3495],[261,[1,2],22.3421],[28,[0,1],20.7086],[2,[1,2],20.3884],[152,[0,1],19.3598]],
+    "sistema-reproductor/vaginosis-bacteriana": [[266,[0,1,2],14.0247],[175,[0],13.4507],[623,[0,1,2],9.9843],[222,[0,1,2],9.1559],[98,[0,1],7.0204],[42,[0,1,2],6.8616]],
+    "sistema-reproductor/candidiasis-vaginal": [[145,[0,2],23.1521],[199,[0,2],22.136],[3,[1],20.095],[340,[0],19.5613],[376,[2],15.2247],[589,[1],14.4667]],
+    "sistema-reproductor/menopausia": [[312,[0,3],63.7656],[202,[0,2],51.5984],[358,[0,2],45.2653],[344,[3],42.209],[173,[0],41.0048],[494,[2],39.8691]],
+    "sistema-reproductor/sindrome-premenstrual": [[173,[1],40.989],[312,[4],23.7362],[202,[1],19.7163],[661,[0,2],15.8809],[358,[0,1,2],14.667],[659,[0,2],13.7484]],
+    "sistema-reproductor/disfuncion-erectil": [[81,[0,1,2],5.8907],[376,[0,1,2],5.8907],[382,[0,1,2],5.5387],[404,[0,1,2],5.4305],[463,[0,1,2],4.861],[62,[0,1,2],4.6187]],
+    "sistema-reproductor/prostatitis": [[551,[1],23.5115],[178,[0,2,3],22.4963],[622,[0,1],19.052],[183,[0,1,2],18.0333],[174,[0,1],17.0699],[533,[0,2],17.0699]],
+    "sistema-reproductor/hiperplasia-prostatica-benigna": [[551,[1],23.5115],[201,[0],6.8678],[375,[0,1,2],6.4255],[175,[0,1,2],5.8101],[87,[0,1,2],4.708],[350,[0,1,2],4.4322]],
+    "sistema-reproductor/cancer-de-prostata": [[306,[0,1,2],12.1131],[295,[0,1,2],11.6895],[551,[0,1,2],10.0647],[216,[0,1,2],9.525],[641,[0,1,2],9.1188],[87,[0,1,2],9.116]],
+    "sistema-reproductor/cancer-de-testiculo": [[624,[0,1,2],8.8632],[128,[0,1,2],8.6135],[201,[0,1,2],8.3936],[14,[0,1,2],8.0145],[652,[0,1],7.6276],[636,[0,1,2],6.8365]],
+    "sistema-reproductor/varicocele": [[460,[0,1,2],12.4718],[255,[0,1,2],7.057],[468,[2],6.875],[153,[0,1,2],6.1513],[650,[0,1],5.3894],[60,[0,1,2],5.3265]],
+    "sistema-reproductor/hidrocele": [[14,[0,1,2],8.0145],[91,[0,1,2],7.2889],[631,[0,1,2],6.4255],[624,[0,1,2],6.0416],[453,[0,1,2],6.0143],[641,[0,1,2],5.9143]],
+    "sistema-reproductor/epididimitis": [[654,[0,1],7.4809],[652,[0,1],7.3078],[641,[0,1,2],7.1425],[380,[0,1,2],6.8333],[568,[0,1,2],6.7098],[675,[2],6.1445]],
+    "sistema-reproductor/orquitis": [[106,[0,1],11.3112],[669,[0,3],10.1193],[615,[0,1,2],9.16],[14,[0,1,2],8.0145],[306,[0,1,2],8.0021],[589,[0,1,2],7.947]],
+    "sistema-reproductor/infertilidad": [[306,[3],12.2533],[690,[1],9.9702],[344,[0,1,2],9.9413],[14,[0,1,2],9.6541],[559,[0,1,2],9.4384],[202,[2],8.4042]],
+    "sistema-reproductor/clamidia": [[52,[0,1,2],9.4357],[624,[0,1,2],8.8632],[678,[3],7.1978],[690,[0,1,2],6.8149],[568,[0,1,2],6.7098],[40,[2],6.0022]],
+    "sistema-reproductor/gonorrea": [[340,[0,1],9.86],[52,[0,1,2],9.4357],[344,[0,1,2],9.3086],[306,[0,1,2],9.1399],[314,[0,1,2],8.5532],[583,[0,1,2],8.3898]],
+    "sistema-reproductor/herpes-genital": [[339,[0,1,2],11.1815],[678,[3],10.4092],[173,[1],9.9566],[184,[0],9.8861],[312,[4],9.4876],[306,[0,1,2],8.8705]],
+    "sistema-reproductor/virus-del-papiloma-humano": [[650,[0,1],9.0108],[651,[0,1],8.8556],[678,[3],8.6967],[216,[0,1,2],8.4766],[64,[0,1,2],8.2677],[407,[0],7.2823]],
+    "sistema-reproductor/sifilis": [[678,[3],17.6513],[134,[0,1,2],13.5636],[242,[0,1,2],12.4057],[175,[0],11.1467],[337,[2],9.6548],[654,[0,1],9.3514]],
+    "sistema-reproductor/tricomoniasis": [[107,[0,1],8.4392],[589,[0,1,2],7.947],[36,[0,1,2],7.3612],[678,[3],7.1978],[266,[0,1,2],6.9141],[568,[0,1,2],6.7098]],
+    "sistema-reproductor/embarazo-ectopico": [[669,[0,3],9.8714],[36,[0,1,2],7.3612],[38,[0,1,2],6.3449],[87,[0,1,2],4.408],[678,[3],4.2868],[344,[0,1,2],3.9201]],
+    "sistema-reproductor/preeclampsia": [[14,[0,1,2],17.0912],[252,[0,1,2],14.7232],[460,[2],13.3926],[453,[4],13.0927],[333,[3],12.3585],[672,[0,2],11.5955]],
+    "sistema-reproductor/placenta-previa": [[494,[0,1,2],12.7736],[668,[3],11.0283],[201,[0],10.8805],[305,[0],9.8139],[315,[0,1,2],9.4809],[183,[0,1,2],9.1701]],
+    "sistema-reproductor/aborto-espontaneo": [[128,[0,1,2],8.6135],[201,[0,1,2],8.3936],[75,[0,1,2],8.1922],[36,[0,1,2],7.3612],[406,[0,1,2],6.4255],[40,[2],6.0022]],
+    "sistema-reproductor/dispareunia": [[36,[0,1,2],7.3612],[413,[0,1,2],6.2922],[5,[0,1,2],6.0434],[175,[0,1,2],5.8101],[524,[0,1,2],5.5087],[644,[0,1,2],5.3894]],
+    "sistema-reproductor/eyaculacion-precoz": [[148,[0,1,2],6.4361],[489,[0,1,2],5.9236],[213,[0,1,2],5.7685],[673,[0,1,2],5.0381],[14,[0,1,2],0.0],[27,[0,1,2],0.0]],
+    "sistema-reproductor/anorgasmia": [[547,[0,1,2],6.1513],[453,[0,1,2],5.0054],[589,[0,1,2],4.8133],[541,[0,1,2],4.7091],[243,[0,1,2],4.5138],[221,[0,1,2],4.422]],
+    "sistema-reproductor/cistitis-intersticial": [[528,[0,2],26.2467],[178,[0,2,3],24.9873],[622,[0,1],24.8635],[183,[0,1,2],23.2702],[174,[0,1],22.7566],[533,[0,2],22.7566]],
+    "enfermedades-de-la-piel/acne": [[337,[2],16.1106],[239,[0,1,2],7.7978],[461,[0,3],7.2943],[358,[2],6.8735],[550,[0,1,2],6.4338],[367,[0,1,2],6.0182]],
+    "enfermedades-de-la-piel/eczema": [[105,[0,1],24.7846],[46,[2,3],20.3291],[352,[1,3],16.3256],[216,[1],16.189],[49,[0,1],15.8746],[267,[0,3],15.3905]],
+    "enfermedades-de-la-piel/dermatitis-de-contacto": [[200,[1],11.1012],[337,[2],10.5722],[400,[0,1,2],10.0499],[107,[0,1],8.0539],[290,[0,1,2],7.023],[105,[0,1],6.1951]],
+    "enfermedades-de-la-piel/urticaria": [[401,[0,1,2],8.2757],[290,[0,1,2],7.023],[37,[2],6.4347],[240,[0,1,2],6.1212],[83,[0,1,2],5.9236],[678,[3],5.7857]],
+    "enfermedades-de-la-piel/rosacea": [[352,[0,1,2],31.1799],[261,[1,2],25.417],[49,[0,3],24.9953],[28,[0,1],24.7694],[2,[1,2],24.3529],[181,[1,2],24.1048]],
+    "enfermedades-de-la-piel/micosis-cutanea": [[145,[0,2],25.9175],[607,[1],23.6799],[340,[0],22.3268],[124,[1],18.0296],[199,[0,2],17.8867],[211,[0],15.3548]],
+    "enfermedades-de-la-piel/verrugas": [[48,[0,1,2],29.8184],[49,[0,3],24.9953],[161,[1,2],22.8443],[261,[1,2],22.3421],[28,[0,1],20.7086],[181,[1,2],20.5601]],
+    "enfermedades-de-la-piel/psoriasis": [[115,[0,1],18.5657],[46,[2,3],16.3912],[267,[0,3],15.3905],[305,[1,2],14.5706],[155,[0],14.2688],[153,[0,1],13.4243]],
+    "enfermedades-de-la-piel/vitiligo": [[650,[0,1],10.7789],[674,[2],8.6673],[482,[0,1,2],8.1921],[315,[3],8.1861],[216,[0,1,2],7.395],[293,[0,1,2],6.9966]],
+    "enfermedades-de-la-piel/melanoma": [[48,[0,1,2],29.8184],[49,[0,3],24.9953],[261,[1,2],22.3421],[28,[0,1],20.7086],[181,[1,2],20.5601],[2,[1,2],20.3884]],
+    "enfermedades-de-la-piel/carcinoma-basocelular": [[137,[0],11.8597],[198,[0,1,2],9.5327],[300,[0,1,2],9.4358],[224,[0,1,2],8.7261],[411,[0,1,2],8.5469],[315,[3],8.1861]],
+    "enfermedades-de-la-piel/carcinoma-espinocelular": [[137,[0],11.8597],[224,[0,1,2],8.5771],[463,[0,1,2],6.998],[407,[0,1,2],6.2922],[367,[0,1,2],6.0182],[552,[0,1,2],6.0182]],
+    "enfermedades-de-la-piel/queratosis-pilaris": [[352,[0,1,2],31.1799],[49,[0,3],24.9953],[28,[0,1],24.7694],[2,[1,2],24.3529],[181,[1,2],24.1048],[46,[1,3],23.6468]],
+    "enfermedades-de-la-piel/alopecia-areata": [[650,[0,1],10.1859],[674,[2],8.6673],[500,[0,1,2],8.4766],[216,[0,1,2],7.395],[167,[0,1,2],6.5507],[129,[0,1,2],6.4058]],
+    "enfermedades-de-la-piel/hiperhidrosis": [[610,[0,1,2],11.66],[303,[0,1,2],9.0558],[515,[0,1,2],8.9937],[105,[0,1],8.0656],[386,[0,1,2],7.733],[93,[0,1,2],6.7799]],
+    "enfermedades-de-la-piel/impetigo": [[175,[0],11.1467],[479,[0,1,2],10.3742],[242,[0,1,2],8.5201],[533,[0,1,2],8.4392],[337,[2],7.9824],[224,[0,1,2],7.9202]],
+    "enfermedades-de-la-piel/molusco-contagioso": [[407,[1],9.4733],[200,[1],9.426],[404,[0,1,2],9.3076],[414,[0,1,2],9.2813],[651,[0,1],8.8556],[315,[3],8.1861]],
+    "enfermedades-de-la-piel/penfigo": [[200,[1],11.1012],[134,[0,1,2],9.7961],[242,[0,1,2],9.1989],[305,[0,1,2],9.0223],[459,[2],8.5429],[527,[0,1,2],7.396]],
+    "enfermedades-de-la-piel/dermatitis-seborreica": [[337,[2],10.5722],[612,[0,1,2],7.1867],[358,[2],6.8735],[650,[0,1],6.5646],[167,[0,1,2],6.5507],[240,[0,1,2],6.5294]],
+    "enfermedades-de-la-piel/liquen-plano": [[674,[2],8.6673],[315,[3],8.1861],[310,[4],8.1329],[650,[0,1],7.8356],[499,[0,1,2],7.7668],[218,[0,1,2],7.7109]],
+    "enfermedades-de-la-piel/celulitis": [[106,[0,1],11.3112],[175,[0],11.1467],[315,[3],9.0456],[479,[0,1,2],7.4201],[240,[0,1,2],6.5294],[145,[0,1,2],6.335]],
+    "enfermedades-de-la-piel/erisipela": [[199,[0,1,2],11.7425],[106,[0,1],11.3112],[175,[0],11.1467],[337,[2],10.5722],[678,[3],10.4092],[315,[3],9.2557]],
+    "enfermedades-de-la-piel/foliculitis": [[175,[0],11.1467],[479,[0,1,2],9.9099],[224,[0,1,2],8.5771],[641,[0,1,2],8.5221],[107,[0,1],8.4392],[242,[0,1,2],8.2677]],
+    "enfermedades-de-la-piel/forunculos": [[340,[0,1],12.6255],[106,[0,1],11.3112],[337,[2],10.5722],[678,[3],10.4092],[685,[0,1],10.0598],[691,[0,3],9.8303]],
+    "enfermedades-de-la-piel/hidradenitis-supurativa": [[48,[0,1,2],29.8184],[49,[0,3],24.9953],[261,[1,2],22.3421],[28,[0,1],20.7086],[181,[1,2],20.5601],[2,[1,2],20.3884]],
+    "enfermedades-de-la-piel/ictiosis-vulgar": [[337,[2],12.2445],[649,[0,1],10.9189],[691,[0],9.2731],[651,[0,1],8.1521],[219,[0,1,2],7.8067],[239,[0,1,2],7.4894]],
+    "enfermedades-de-la-piel/melasma": [[235,[0,1,3],27.65],[337,[2,3],19.5528],[240,[1,2],15.0224],[273,[0,1],14.3777],[234,[2,3],13.2533],[120,[0,2],12.9475]],
+    "enfermedades-de-la-piel/nevos-melanociticos": [[48,[0,1,2],29.8184],[49,[0,3],24.9953],[261,[1,2],22.3421],[28,[0,1],20.7086],[181,[1,2],20.5601],[2,[1,2],20.3884]],
+    "enfermedades-de-la-piel/pitiriasis-rosada": [[650,[0,1],10.1859],[5,[0,1,2],9.7914],[644,[0,1,2],9.0108],[337,[2],7.9824],[113,[0,1,2],6.4938],[218,[0,1,2],6.2299]],
+    "enfermedades-de-la-piel/prurigo-nodular": [[48,[0,1,2],29.8184],[49,[0,3],24.9953],[261,[1,2],22.3421],[28,[0,1],20.7086],[181,[1,2],20.5601],[2,[1,2],20.3884]],
+    "enfermedades-de-la-piel/sarna": [[200,[1],11.1012],[87,[0,1,2],8.3045],[120,[0,1,2],8.1843],[589,[0,1,2],8.1603],[481,[0,1,2],7.0717],[103,[0],7.0204]],
+    "enfermedades-de-la-piel/tiña-versicolor": [[650,[0,1],14.4002],[224,[0,1,2],13.2335],[479,[0,1,2],12.8639],[29,[0,1,2],9.0427],[644,[0,1,2],9.0108],[404,[0,1,2],8.9828]],
+    "enfermedades-de-la-piel/xantelasma": [[108,[0,1,2],26.0598],[337,[2,3],19.5528],[46,[1,2],12.1502],[273,[0,1],11.0449],[560,[2],11.0083],[240,[1,2],10.8805]],
+    "enfermedades-de-la-piel/dermatofibroma": [[479,[0,1,2],9.7081],[404,[0,1,2],9.3076],[401,[0,1,2],8.9809],[315,[3],8.1861],[224,[0,1,2],7.9202],[36,[0,1,2],7.3612]],
+    "enfermedades-de-la-piel/granuloma-anular": [[337,[2],10.5722],[463,[0,1,2],9.923],[180,[0,1,2],8.5403],[106,[0,1],7.1867],[649,[0,1],6.7123],[167,[0,1,2],6.5507]],
+    "enfermedades-de-la-piel/queratosis-actinica": [[48,[0,1,2],29.8184],[49,[0,3],24.9953],[261,[1,2],22.3421],[28,[0,1],20.7086],[181,[1,2],20.5601],[2,[1,2],20.3884]],
+    "enfermedades-de-la-piel/lentigo-solar": [[355,[0,1],12.0095],[224,[0,1,2],9.3479],[404,[0,1,2],8.9828],[315,[3],8.1861],[80,[0,1,2],7.3461],[205,[0],7.2037]],
+    "enfermedades-de-la-piel/poiquilodermia-de-civatte": [[337,[2],10.5722],[105,[0,1],10.0833],[481,[0,1,2],8.0836],[650,[0,1],6.5646],[167,[0,1,2],6.5507],[129,[0,1,2],6.4058]],
+    "enfermedades-de-la-piel/telangiectasias": [[576,[0,1,2],10.843],[398,[0],10.4739],[650,[0,1],10.1859],[492,[0,1,2],9.9616],[481,[2],8.6862],[4,[0,1,2],8.6135]],
+    "sistema-linfatico/linfedema": [[375,[0,1,2],18.4743],[206,[0,1,2],9.227],[175,[0,1,2],8.8326],[351,[0,1,2],7.9898],[216,[0,1,2],7.1975],[145,[0,1,2],6.335]],
+    "sistema-linfatico/linfoma": [[48,[0,1,2],29.8184],[49,[0,3],22.3495],[261,[1,2],22.3421],[206,[2],21.7985],[46,[1,3],20.8813],[28,[0,1],20.7086]],
+    "sistema-linfatico/mononucleosis-infecciosa": [[678,[3],16.1949],[206,[0,1,2],9.227],[375,[0,1,2],8.836],[51,[0,1,2],7.3078],[242,[0,1,2],7.0924],[491,[0,1,2],6.6298]],
+    "sistema-linfatico/adenopatia": [[450,[2],11.3852],[454,[3],10.654],[75,[0,1,2],10.3741],[396,[0,1,2],10.1675],[206,[0,1,2],9.227],[375,[0,1,2],8.836]],
+    "sistema-linfatico/linfangitis": [[206,[0,1,2],15.571],[106,[0,1],11.3112],[454,[3],10.654],[678,[3],10.4092],[333,[0,1,2],10.0505],[624,[0,1,2],8.8632]],
+    "sistema-linfatico/enfermedad-de-castleman": [[450,[2],11.3852],[75,[0,1,2],10.3741],[396,[0,1,2],10.1675],[206,[0,1,2],9.227],[375,[0,1,2],8.836],[305,[0,1,2],7.5742]],
+    "sistema-linfatico/filariasis-linfatica": [[352,[0,1,2],31.2711],[261,[1,2],25.832],[28,[0,1],24.876],[152,[0,1],23.4285],[131,[0,2],23.0395],[49,[0,3],22.3495]],
+    "sistema-linfatico/malformacion-linfatica": [[206,[0,1,2],9.227],[375,[0,1,2],8.836],[128,[0,1,2],8.6135],[576,[0,1,2],6.1513],[4,[0,1,2],6.07],[598,[0,1,2],6.07]],
+    "sistema-linfatico/quilotorax": [[206,[0,1,2],9.227],[375,[0,1,2],8.836],[621,[0,1,2],8.8068],[128,[0,1,2],8.6135],[491,[0,1,2],6.242],[661,[2],5.3284]],
+    "sistema-linfatico/ascitis-quilosa": [[206,[0,1,2],9.227],[375,[0,1,2],8.836],[655,[1],6.8977],[656,[1],6.7447],[361,[1],6.1324],[14,[0,1,2],6.0511]],
+    "sistema-linfatico/quiluria": [[113,[0,1,2],9.6634],[691,[0,2],8.753],[32,[0,1,2],7.9634],[481,[2],7.4962],[164,[1],5.9419],[622,[1],5.8115]],
+    "sistema-linfatico/sindrome-de-cloves": [[206,[0,1,2],9.227],[375,[0,1,2],8.836],[358,[0,1,2],8.3692],[465,[0,1,2],7.8168],[202,[1],6.4122],[173,[1],6.3307]],
+    "sistema-linfatico/bronquitis-plastica": [[28,[0,1],28.2839],[235,[1,2],26.3118],[2,[1,2],23.7155],[206,[2],18.613],[325,[0],17.9655],[114,[3],16.4036]],
+    "sistema-linfatico/enteropatia-perdedora-de-proteinas": [[375,[0,1,2],18.4743],[489,[3],10.2008],[206,[0,1,2],9.227],[417,[1],9.0033],[582,[0,1,2],8.4874],[483,[1],6.4581]],
+    "sistema-linfatico/higroma-quistico": [[375,[0,1,2],21.5248],[206,[0,1,2],12.4124],[685,[3],7.0401],[601,[0,1,2],5.4696],[128,[0,1,2],5.4089],[14,[0,1,2],5.343]],
+    "sistema-linfatico/hiperplasia-linfofolicular": [[678,[3],10.4092],[641,[0,1,2],9.1188],[51,[0,1,2],7.3078],[364,[0,1,2],6.7098],[255,[0,1,2],6.5498],[454,[3],6.3169]],
+    "sistema-linfatico/linfadenitis-mesenterica": [[454,[3],10.654],[669,[0,3],10.1193],[206,[0,1,2],9.227],[615,[0,1,2],9.16],[156,[0,1],9.0426],[375,[0,1,2],8.836]],
+    "sistema-linfatico/linfangioleiomiomatosis": [[352,[0,1,2],31.2711],[261,[1,2],25.832],[28,[0,1],24.876],[152,[0,1],23.4285],[131,[0,2],23.0395],[49,[0,3],22.3495]],
+    "sistema-linfatico/sarcoidosis": [[450,[2],11.3852],[75,[0,1,2],10.3741],[396,[0,1,2],10.1675],[206,[0,1,2],9.227],[375,[0,1,2],8.836],[621,[0,1,2],8.8068]],
+    "sistema-linfatico/amigdalitis": [[678,[3],16.1949],[401,[0,1,2],12.3422],[21,[0,1,2],11.7791],[652,[0,1],11.6566],[569,[0,1,2],11.0143],[454,[3],10.654]],
+    "sistema-linfatico/esplenomegalia": [[206,[0,1,2],12.4124],[375,[0,1,2],11.8865],[667,[0,2],10.5785],[457,[1],9.2879],[650,[0,1],9.0108],[624,[0,1,2],8.8632]],
+    "sistema-linfatico/timoma": [[206,[0,1,2],12.4124],[375,[0,1,2],11.8865],[380,[0,1,2],9.084],[675,[0,2],9.0548],[685,[3],8.4423],[62,[3],8.1007]],
+    "sistema-linfatico/linfangioma-cavernoso": [[198,[0,1,2],9.5327],[206,[0,1,2],9.227],[375,[0,1,2],8.836],[175,[0,1,2],8.8326],[128,[0,1,2],8.6135],[107,[0,1],8.4392]],
+    "sistema-linfatico/linfohistiocitosis-hemofagocitica": [[48,[0,1,2],29.8184],[49,[0,3],22.3495],[261,[1,2],22.3421],[28,[0,1],20.7086],[2,[1,2],20.3884],[152,[0,1],19.3598]],
+    "sistema-linfatico/sindrome-de-evans": [[48,[0,1,2],29.8184],[49,[0,3],24.9953],[261,[1,2],22.3421],[28,[0,1],20.7086],[181,[1,2],20.5601],[2,[1,2],20.3884]],
+    "trastornos-mentales-emocionales/trastorno-de-ansiedad-generalizada": [[448,[0,1,2],54.9127],[680,[0,1,2],50.3782],[274,[0,1,2],49.3815],[251,[0,1],44.0164],[265,[0,1],37.4244],[322,[0,1],35.5068]],
+    "trastornos-mentales-emocionales/depresion-mayor": [[660,[0,1,2],19.5013],[666,[0,3],19.0066],[22,[0,1,2],14.9477],[584,[0,1,2],13.3302],[471,[0,1,2],13.0477],[348,[0,1,2],11.7981]],
+    "trastornos-mentales-emocionales/trastorno-bipolar": [[22,[0,1,2],14.9477],[666,[0,3],14.1708],[584,[0,1,2],13.3302],[471,[0,1,2],13.0477],[348,[0,1,2],11.7981],[677,[3],9.9337]],
+    "trastornos-mentales-emocionales/trastorno-obsesivo-compulsivo": [[48,[0,1,2],29.8184],[49,[0,3],22.3495],[261,[1,2],22.3421],[28,[0,1],20.7086],[338,[0,2],20.6042],[2,[1,2],20.3884]],
+    "trastornos-mentales-emocionales/trastorno-de-estres-postraumatico": [[22,[0,1,2],14.9477],[660,[1,2],13.5423],[584,[0,1,2],13.3302],[348,[0,1,2],11.7981],[677,[3],9.9337],[670,[3],9.815]],
+    "trastornos-mentales-emocionales/trastorno-de-panico": [[349,[2],19.2494],[74,[0,1,2],9.765],[536,[0,1,2],9.1696],[80,[0,1,2],9.0407],[311,[3],8.2198],[290,[0,1,2],7.5828]],
+    "trastornos-mentales-emocionales/fobia-social": [[680,[3],7.1184],[68,[0,1,2],6.2905],[686,[1],5.9346],[208,[0,1,2],5.2907],[5,[0,1,2],5.2806],[318,[0,1,2],5.2735]],
+    "trastornos-mentales-emocionales/esquizofrenia": [[649,[0,1],9.7248],[557,[0,1,2],6.4255],[54,[0,1,2],6.0182],[5,[0,1,2],5.2806],[81,[0,1,2],5.2753],[102,[0,1],5.1658]],
+    "trastornos-mentales-emocionales/trastorno-por-deficit-de-atencion-e-hiperactividad": [[54,[0,1,2],8.7595],[281,[0,1,2],7.1414],[532,[0,1,2],6.7604],[586,[0,1,2],6.1875],[585,[0,1,2],6.0592],[81,[0,1,2],5.8907]],
+    "trastornos-mentales-emocionales/trastornos-de-la-alimentacion": [[471,[2,4],13.4335],[188,[0,2],9.9595],[481,[0,1],9.9111],[312,[0,1,2],9.4991],[457,[0,3],9.1714],[79,[3],9.1164]],
+    "trastornos-mentales-emocionales/trastorno-limite-de-la-personalidad": [[48,[0,1,2],29.8184],[49,[0,3],22.3495],[261,[1,2],22.3421],[28,[0,1],20.7086],[2,[1,2],20.3884],[152,[0,1],19.3598]],
+    "trastornos-mentales-emocionales/agorafobia": [[587,[0,1,2],11.3904],[29,[0,1,2],9.0427],[413,[0,1,2],7.9595],[105,[0,1],7.8286],[143,[0,1,2],7.5375],[515,[0,1,2],7.2514]],
+    "trastornos-mentales-emocionales/trastorno-de-ansiedad-por-separacion": [[448,[0,1,2],42.924],[274,[0,1,2],41.856],[251,[0,1],37.5715],[680,[0,3],36.7963],[250,[0,1],34.6942],[318,[0,1],31.6989]],
+    "trastornos-mentales-emocionales/mutismo-selectivo": [[68,[0,1,2],6.2905],[547,[0,1,2],6.1513],[655,[0,1],5.603],[519,[0,1,2],5.13],[366,[0,1,2],5.1283],[448,[0,1,2],4.1591]],
+    "trastornos-mentales-emocionales/fobia-especifica": [[221,[0,1,2],9.7353],[106,[0,1],7.1867],[680,[3],7.1184],[259,[0],6.3449],[417,[0,1,2],6.2922],[68,[0,1,2],6.2905]],
+    "trastornos-mentales-emocionales/tricotilomania": [[639,[0,1,2],10.0647],[106,[0,1],7.1867],[258,[0,1,2],6.1644],[113,[0,1,2],5.8907],[450,[2],5.8311],[674,[2],5.8134]],
+    "trastornos-mentales-emocionales/trastorno-de-excoriacion": [[343,[0,1,2],14.4381],[686,[1],11.8692],[250,[0,1,2],10.7705],[337,[2],10.5722],[274,[0,1,2],9.9291],[346,[0,1,2],9.5559]],
+    "trastornos-mentales-emocionales/trastorno-dismorfico-corporal": [[80,[0,1,2],10.8454],[86,[0,1,2],9.3881],[311,[3],8.2198],[584,[0,1,2],7.7622],[640,[0,1,2],7.5086],[62,[0,1,2],7.0365]],
+    "trastornos-mentales-emocionales/trastorno-de-acumulacion": [[198,[0,1,2],9.1125],[639,[0,1,2],8.6751],[106,[0,1],7.1867],[464,[0,1,2],7.0863],[259,[0],6.3449],[614,[0,1,2],6.1513]],
+    "trastornos-mentales-emocionales/trastorno-afectivo-estacional": [[457,[4],15.4308],[80,[0,1,2],13.0177],[453,[0],10.317],[66,[0,1,2],10.2828],[89,[0,1,2],9.9689],[102,[0,1],9.1969]],
+    "trastornos-mentales-emocionales/distimia": [[453,[0,3],12.4486],[310,[4],8.4863],[343,[0,1,2],8.4769],[323,[2],8.4275],[248,[0,1,2],8.308],[324,[2],7.768]],
+    "trastornos-mentales-emocionales/trastorno-ciclotimico": [[22,[0,1,2],14.9477],[584,[0,1,2],13.3302],[348,[0,1,2],11.7981],[677,[3],9.9337],[670,[3],9.815],[660,[1],9.5859]],
+    "trastornos-mentales-emocionales/trastorno-disforico-premenstrual": [[173,[1],27.326],[660,[0,1],18.2059],[22,[0,1,2],14.9477],[670,[1,3],14.6053],[666,[0,3],14.1708],[311,[3],13.7325]],
+    "trastornos-mentales-emocionales/trastorno-de-desregulacion-disruptiva-del-estado-de-animo": [[251,[0],23.3044],[207,[0],22.8905],[608,[0],20.0449],[448,[0],19.17],[680,[0],18.1069],[391,[0],16.8549]],
+    "trastornos-mentales-emocionales/trastorno-esquizoafectivo": [[22,[0,1,2],14.9477],[584,[0,1,2],13.3302],[348,[0,1,2],11.7981],[547,[0,1,2],11.2579],[677,[3],9.9337],[670,[3],9.815]],
+    "trastornos-mentales-emocionales/trastorno-delirante": [[79,[0,1,2],11.1848],[78,[0,1,2],10.2727],[573,[0,1,2],9.0275],[162,[0,1],8.2584],[586,[0,1,2],7.9129],[173,[1],6.6378]],
+    "trastornos-mentales-emocionales/trastorno-psicotico-breve": [[279,[0,1,4],44.5469],[265,[0,1],29.8989],[170,[0,1],29.309],[271,[0,1],26.1607],[274,[1,2],26.011],[346,[0,1],24.8274]],
+    "trastornos-mentales-emocionales/trastorno-de-la-personalidad-paranoide": [[111,[0,1,2],8.4155],[81,[0,1,2],7.9082],[190,[0,1,2],6.4255],[223,[0,1,2],6.4164],[281,[0,1,2],6.4164],[573,[0,1,2],6.4164]],
+    "trastornos-mentales-emocionales/trastorno-de-la-personalidad-esquizoide": [[391,[0,1,2],9.4384],[386,[0,1,2],9.294],[342,[0,1,2],8.7152],[54,[0,1,2],6.0182],[81,[0,1,2],5.8907],[102,[0,1],5.7685]],
+    "trastornos-mentales-emocionales/trastorno-de-la-personalidad-esquizotipica": [[686,[1],11.6091],[670,[0,1],9.8599],[391,[0,1,2],9.4384],[659,[0,1],9.344],[671,[0,3],8.9077],[311,[3],8.7829]],
+    "trastornos-mentales-emocionales/trastorno-de-la-personalidad-antisocial": [[81,[0,1,2],12.2747],[102,[0,1],8.0539],[64,[0,1,2],7.8902],[105,[0,1],7.8286],[111,[0,1,2],7.582],[83,[0,1,2],7.2271]],
+    "trastornos-mentales-emocionales/trastorno-de-la-personalidad-histrionica": [[311,[3],8.2198],[648,[0,1],6.5885],[407,[0,1,2],6.2922],[71,[0,1,2],6.1644],[610,[0,1,2],6.1513],[208,[0,1,2],5.2907]],
+    "trastornos-mentales-emocionales/trastorno-de-la-personalidad-narcisista": [[199,[0,1,2],8.666],[88,[0,1,2],7.8429],[62,[0,1,2],7.7944],[532,[0,1,2],6.7604],[202,[2],6.732],[586,[0,1,2],6.5822]],
+    "trastornos-mentales-emocionales/trastorno-de-la-personalidad-evitativa": [[48,[0,1,2],29.8184],[49,[0,3],22.3495],[261,[1,2],22.3421],[28,[0,1],20.7086],[338,[0,2],20.6042],[2,[1,2],20.3884]],
+    "trastornos-mentales-emocionales/trastorno-de-la-personalidad-dependiente": [[103,[0],10.9073],[690,[1],9.9995],[366,[0,1,2],9.5521],[379,[0,1,2],9.3747],[29,[0,1,2],9.0427],[639,[0,1,2],8.6751]],
+    "trastornos-mentales-emocionales/trastorno-de-la-personalidad-obsesivo-compulsiva": [[356,[0],6.1945],[610,[0,1,2],6.1513],[125,[0,1,2],5.9143],[369,[0,1,2],5.3894],[381,[0,1,2],5.3894],[390,[0,1,2],5.3894]],
+    "trastornos-mentales-emocionales/trastorno-de-conversion": [[518,[0,1,2],9.0558],[281,[0,1,2],7.1414],[345,[0,1,2],6.8616],[246,[0,1,2],6.7127],[173,[1],6.6378],[312,[4],6.3251]],
+    "trastornos-mentales-emocionales/trastorno-de-sintomas-somaticos": [[311,[3],13.7325],[610,[0,1,2],11.1015],[658,[1,2],9.844],[519,[0,1,2],9.1441],[342,[0,1,2],8.7152],[660,[0],8.62]],
+    "trastornos-mentales-emocionales/trastorno-facticio": [[311,[3],17.0027],[173,[1],12.9684],[658,[1],10.3239],[305,[0,1,2],9.7136],[609,[0,1,2],8.6954],[65,[0,1,2],8.308]],
+    "trastornos-mentales-emocionales/amnesia-disociativa": [[279,[0,1,4],38.9391],[265,[0,1],29.8989],[170,[0,1],29.309],[271,[0,1],26.1607],[274,[1,2],26.011],[346,[0,1],24.8274]],
+    "otorrinolaringologia-oftalmologia/conjuntivitis": [[50,[0],15.3065],[558,[2],10.9577],[397,[1],9.07],[546,[0,1,2],8.4588],[616,[0,1,2],6.8616],[568,[0,1,2],6.7098]],
+    "otorrinolaringologia-oftalmologia/cataratas": [[462,[2],9.5845],[649,[0,1],5.6583],[50,[0,1,2],5.6333],[558,[0,1,2],5.3894],[640,[0,1,2],4.8232],[497,[0,1,2],4.77]],
+    "otorrinolaringologia-oftalmologia/glaucoma": [[291,[2],11.5068],[50,[0],11.3686],[558,[2],10.9577],[24,[0,1,2],10.6153],[669,[0,3],10.1193],[253,[0],8.7072]],
+    "otorrinolaringologia-oftalmologia/otitis-media": [[678,[3],10.4092],[128,[0,1,2],8.6135],[75,[0,1,2],8.1922],[51,[0,1,2],7.3078],[457,[4],7.081],[16,[0,1,2],6.3449]],
+    "otorrinolaringologia-oftalmologia/tinnitus": [[197,[2],7.2956],[212,[0,1],7.2593],[457,[4],7.081],[187,[2],7.0025],[188,[2],7.0025],[105,[0,1],4.53]],
+    "otorrinolaringologia-oftalmologia/amigdalitis": [[678,[3],16.1949],[401,[0,1,2],12.3422],[21,[0,1,2],11.7791],[652,[0,1],11.6566],[569,[0,1,2],11.0143],[542,[0,1,2],8.9698]],
+    "otorrinolaringologia-oftalmologia/sinusitis": [[42,[1,2],24.8628],[287,[1],23.5027],[120,[1,2,3],23.1536],[569,[0,1,2],16.1891],[606,[0],14.8787],[44,[1,2],13.8271]],
+    "otorrinolaringologia-oftalmologia/faringitis": [[267,[0,2,3],19.0975],[153,[0,1],17.6537],[46,[2,3],17.5636],[115,[0,1],17.4787],[134,[1,2],17.2753],[352,[1,3],16.8206]],
+    "otorrinolaringologia-oftalmologia/laringitis": [[153,[0,1],22.6039],[115,[0,1],21.6846],[352,[1,3],20.3829],[267,[0,2,3],19.0975],[46,[2,3],17.5636],[134,[1,2],17.2753]],
+    "otorrinolaringologia-oftalmologia/rinitis-alergica": [[42,[1,2],24.8628],[31,[1,2],17.7082],[287,[1],17.6925],[581,[1,2],17.1998],[120,[2,3],16.6339],[73,[3,4],16.266]],
+    "otorrinolaringologia-oftalmologia/desviacion-del-tabique-nasal": [[33,[0,1,2],8.6135],[595,[0,1,2],8.4229],[565,[0,1,2],7.8988],[42,[0,1,2],6.2905],[175,[0,1,2],5.8101],[323,[2],5.6183]],
+    "otorrinolaringologia-oftalmologia/polipos-nasales": [[48,[0,1,2],29.8184],[49,[0,3],22.3495],[261,[1,2],22.3421],[28,[0,1],20.7086],[2,[1,2],20.3884],[152,[0,1],19.3598]],
+    "otorrinolaringologia-oftalmologia/vertigo": [[669,[0],13.0526],[403,[0],8.4642],[692,[3],6.9993],[38,[0,1,2],6.3449],[562,[2],6.2252],[624,[0,1,2],6.0416]],
+    "otorrinolaringologia-oftalmologia/enfermedad-de-meniere": [[305,[0,1,2],7.5742],[692,[3],6.9993],[190,[0,1,2],6.4255],[624,[0,1,2],6.0416],[450,[2],5.8311],[175,[0,1,2],5.8101]],
+    "otorrinolaringologia-oftalmologia/presbicia": [[48,[0,1,2],29.8184],[49,[0,3],22.3495],[261,[1,2],22.3421],[28,[0,1],20.7086],[2,[1,2],20.3884],[152,[0,1],19.3598]],
+    "otorrinolaringologia-oftalmologia/astigmatismo": [[333,[0,1,2],11.408],[497,[0,1,2],10.0965],[481,[2],8.6862],[4,[0,1,2],8.6135],[354,[0,1,2],7.7382],[669,[3],6.9678]],
+    "otorrinolaringologia-oftalmologia/miopia": [[352,[0,1,2],31.1799],[261,[1,2],25.417],[28,[0,1],24.7694],[2,[1,2],24.3529],[131,[0,2],22.9378],[49,[0,3],22.3495]],
+    "otorrinolaringologia-oftalmologia/hipermetropia": [[352,[0,1,2],31.1799],[28,[0,1],24.7694],[2,[1,2],24.3529],[131,[0,2],22.9378],[49,[0,3],22.3495],[261,[1,2],22.3421]],
+    "otorrinolaringologia-oftalmologia/estrabismo": [[50,[0],11.3686],[558,[2],10.9577],[291,[2],9.1526],[562,[2],6.2252],[462,[2],6.1737],[450,[2],5.8311]],
+    "otorrinolaringologia-oftalmologia/ojo-seco": [[50,[0],11.3686],[558,[2],10.9577],[291,[2],9.1526],[486,[0,1,2],7.3476],[562,[2],6.2252],[462,[2],6.1737]],
+    "otorrinolaringologia-oftalmologia/chalazion": [[644,[0,1,2],9.0108],[672,[2],7.5186],[198,[0,1,2],6.9372],[462,[2],6.1737],[5,[0,1,2],6.0434],[50,[0,1,2],5.6333]],
+    "otorrinolaringologia-oftalmologia/orzuelo": [[175,[0],11.1467],[411,[0,1,2],6.4255],[601,[0,1,2],5.4696],[14,[0,1,2],5.343],[567,[0,1,2],5.2221],[571,[0,1,2],5.2221]],
+    "otorrinolaringologia-oftalmologia/epistaxis": [[36,[0,1,2],7.3612],[42,[0,1,2],6.2905],[295,[0,1,2],5.7009],[12,[0,1,2],5.6333],[564,[0,1,2],5.3894],[287,[0,1,2],5.3265]],
+    "otorrinolaringologia-oftalmologia/anosmia": [[568,[0,1,2],6.7098],[42,[0,1,2],6.2905],[450,[2],5.8311],[33,[0,1,2],5.4089],[132,[0,1,2],5.4089],[287,[0,1,2],5.3265]],
+    "otorrinolaringologia-oftalmologia/disfonia": [[491,[0,1,2],14.3841],[678,[3],10.0724],[624,[0,1,2],8.8632],[75,[0,1,2],8.1922],[401,[0,1,2],7.8543],[352,[0,1,2],7.5285]],
+    "otorrinolaringologia-oftalmologia/apnea-del-sueno": [[481,[2],8.6862],[4,[0,1,2],8.6135],[354,[0,1,2],7.7382],[333,[0,1,2],6.8972],[610,[0,1,2],6.1513],[54,[0,1,2],6.0182]],
+    "otorrinolaringologia-oftalmologia/cerumen-impactado": [[669,[0,3],9.8714],[624,[0,1,2],8.8632],[75,[0,1,2],8.1922],[654,[0,1],7.4809],[652,[0,1],7.3078],[641,[0,1,2],7.1425]],
+    "otorrinolaringologia-oftalmologia/perforacion-del-timpano": [[669,[0,3],9.8714],[624,[0,1,2],8.8632],[128,[0,1,2],8.6135],[75,[0,1,2],8.1922],[692,[3],6.9993],[568,[0,1,2],6.7098]],
+    "otorrinolaringologia-oftalmologia/laberintitis": [[615,[0,1,2],9.16],[220,[0,1,2],8.3999],[692,[3],6.9993],[190,[0,1,2],6.4255],[450,[2],5.8311],[75,[0,1,2],5.3133]],
+    "otorrinolaringologia-oftalmologia/neuritis-vestibular": [[669,[0],15.192],[615,[0,1,2],12.0254],[692,[3],11.0713],[403,[0],8.4642],[24,[0,1,2],7.9086],[513,[0,1,2],6.6679]],
+  },
+  enfermedadesPorPlanta: {
+    "hierbas-aromaticas-culinarias/albahaca": [42,43,65,120,128],
+    "hierbas-aromaticas-culinarias/romero": [40,42,43,44,45,47,49,50],
+    "hierbas-aromaticas-culinarias/tomillo": [0,1,5,6,7,27,28,39],
+    "hierbas-aromaticas-culinarias/oregano": [42,49,50,176,178],
+    "hierbas-aromaticas-culinarias/menta": [42,120,125,40,41,43,44,45],
+    "hierbas-aromaticas-culinarias/hierbabuena": [42,43,65,40,41,44,45,46],
+    "hierbas-aromaticas-culinarias/cilantro": [42,40,41,43,44,45,46,47],
+    "hierbas-aromaticas-culinarias/perejil": [161,162,164,188,189,190,271,283],
+    "hierbas-aromaticas-culinarias/eneldo": [42,43,65,40,41,44,45,46],
+    "hierbas-aromaticas-culinarias/laurel": [0,1,27,28,39,42,53,57],
+    "hierbas-aromaticas-culinarias/salvia": [195,196,197,198,199,200,201,202],
+    "hierbas-aromaticas-culinarias/mejorana": [42,43,65,128,120,121,122,123],
+    "hierbas-aromaticas-culinarias/estragon": [42,40,41,43,44,45,46,47],
+    "hierbas-aromaticas-culinarias/cebollino": [42,190,160,161,162,163,164,165],
+    "hierbas-aromaticas-culinarias/hinojo": [0,1,27,28,39,42,53,57],
+    "hierbas-aromaticas-culinarias/comino": [42,43,65,40,41,44,45,46],
+    "hierbas-aromaticas-culinarias/anis": [0,1,27,28,39,42,53,57],
+    "hierbas-aromaticas-culinarias/curcuma": [40,43,49,50,58,161,162,164],
+    "hierbas-aromaticas-culinarias/jengibre": [40,42,43,58,107,230,241,248],
+    "hierbas-aromaticas-culinarias/canela": [44,45,48,195,196,207,208,216],
+    "hierbas-aromaticas-culinarias/clavo-de-olor": [42,58,40,41,43,44,45,46],
+    "hierbas-aromaticas-culinarias/cardamomo": [0,1,27,28,39,42,53,57],
+    "hierbas-aromaticas-culinarias/azafran": [399,400,401,402,403,404,405,406],
+    "hierbas-aromaticas-culinarias/lavanda": [120,128,121,122,123,124,125,126],
+    "hierbas-aromaticas-culinarias/melisa": [42,128,120,121,122,123,124,125],
+    "hierbas-aromaticas-culinarias/perifollo": [271,273,275,283,375,380,386,391],
+    "hierbas-aromaticas-culinarias/angelica": [0,1,27,28,39,42,45,53],
+    "hierbas-aromaticas-culinarias/ajedrea": [42,58,308,312,334],
+    "hierbas-aromaticas-culinarias/hisopo": [0,1,20,21,22,23,24,25],
+    "hierbas-aromaticas-culinarias/tanaceto": [42,40,41,43,44,45,46,47],
+    "hierbas-aromaticas-culinarias/levistico": [42,58,271,283,292],
+    "hierbas-aromaticas-culinarias/comino-negro": [0,4,5,6,7,20,21,22],
+    "hierbas-aromaticas-culinarias/fenogreco": [195,196,207,216,197,198,199,200],
+    "hierbas-aromaticas-culinarias/mostaza-negra": [0,1,27,28,39,241,254],
+    "hierbas-aromaticas-culinarias/cilantro-vietnamita": [40,42,43,58,41,44,45,46],
+    "hierbas-aromaticas-culinarias/epazote": [42,43,65,40,41,44,45,46],
+    "hierbas-aromaticas-culinarias/pimpinela-mayor": [40,43,44,45,48,58,65,107],
+    "hierbas-aromaticas-culinarias/agrimonia": [40,43,44,45,48,58,65],
+    "hierbas-aromaticas-culinarias/galanga": [40,42,43,58,41,44,45,46],
+    "hierbas-aromaticas-culinarias/lemongrass": [42,128,168,40,41,43,44,45],
+    "hierbas-aromaticas-culinarias/ruibarbo": [43,44,45,47,48,65],
+    "hierbas-aromaticas-culinarias/stevia": [116,195,196,207,216],
+    "hierbas-aromaticas-culinarias/wasabi": [0,4,5,6,7,20,24,40],
+    "hierbas-aromaticas-culinarias/bergamota": [5,6,7,42,58],
+    "hierbas-aromaticas-culinarias/calendula": [40,43,58,41,42,44,45,46],
+    "hierbas-aromaticas-culinarias/capuchina": [0,1,27,28,39,273,275],
+    "hierbas-aromaticas-culinarias/borraja": [0,1,4,5,6,7,27,28],
+    "hierbas-aromaticas-culinarias/verbena-olorosa": [42,43,65,120,128],
+    "hierbas-aromaticas-culinarias/gordolobo": [0,1,6,7,27,28,39],
+    "hierbas-aromaticas-culinarias/malva": [0,1,4,5,6,7,27,28],
+    "hierbas-aromaticas-culinarias/aciano": [],
+    "hierbas-aromaticas-culinarias/ulmaria": [230,241,248,249,251,255,256,267],
+    "hierbas-aromaticas-culinarias/milenrama": [40,42,43,58,107,312,334],
+    "hierbas-aromaticas-culinarias/artemisa": [42,45,65,300,301,302,303,304],
+    "hierbas-aromaticas-culinarias/ajenjo": [45,65,40,41,42,43,44,46],
+    "hierbas-aromaticas-culinarias/lupulo": [128,198,201,120,121,122,123,124],
+    "hierbas-aromaticas-culinarias/valeriana": [120,128,121,122,123,124,125,126],
+    "hierbas-aromaticas-culinarias/ruda": [43,65,300,301,302,303,304,305],
+    "hierbas-aromaticas-culinarias/ajedrea-de-jardin": [0,1,5,6,7,27,28,39],
+    "hierbas-aromaticas-culinarias/perilla": [0,1,4,5,6,7,27,28],
+    "hierbas-silvestres-medicinales/manzanilla": [40,42,43,58,120,125,128],
+    "hierbas-silvestres-medicinales/aloe-vera": [40,43,50,58,161,162,164,188],
+    "hierbas-silvestres-medicinales/ajo": [81,114,116,176,178],
+    "hierbas-silvestres-medicinales/eucalipto": [0,1,27,28,39,195,196,202],
+    "hierbas-silvestres-medicinales/cola-de-caballo": [268,271,274,283,270,272,273,275],
+    "hierbas-silvestres-medicinales/hiperico": [120,125,128,399,411,425,438],
+    "hierbas-silvestres-medicinales/jengibre": [0,1,4,5,6,7,20,21],
+    "hierbas-silvestres-medicinales/tomillo": [0,1,5,6,7,27,28,39],
+    "hierbas-silvestres-medicinales/lavanda": [120,125,128,121,122,123,124,126],
+    "hierbas-silvestres-medicinales/tila": [120,128,271,274,283],
+    "hierbas-silvestres-medicinales/diente-de-leon": [44,45,47,58,271,283],
+    "hierbas-silvestres-medicinales/ginkgo-biloba": [81,114,116,80,82,83,84,85],
+    "hierbas-silvestres-medicinales/mate": [176,178,271,283,286],
+    "hierbas-silvestres-medicinales/oregano": [0,1,4,5,6,7,22,23],
+    "hierbas-silvestres-medicinales/pasiflora": [43,65,120,125,121,122,123,124],
+    "hierbas-silvestres-medicinales/corteza-de-sauce": [120,125,230,241,248,249,251,255],
+    "hierbas-silvestres-medicinales/agave": [44,45,47,58,195,196,207,216],
+    "hierbas-silvestres-medicinales/arandano": [81,114,116,117,271,274,283,286],
+    "hierbas-silvestres-medicinales/acebo": [58,120,128,271,283],
+    "hierbas-silvestres-medicinales/flor-de-sauco": [0,4,5,6,7,40,43,44],
+    "hierbas-silvestres-medicinales/yuca": [42,40,41,43,44,45,46,47],
+    "hierbas-silvestres-medicinales/ginseng": [120,121,122,123,124,125,126,127],
+    "hierbas-silvestres-medicinales/poleo-menta": [42,40,41,43,44,45,46,47],
+    "hierbas-silvestres-medicinales/ortiga": [117,271,283,80,81,82,83,84],
+    "hierbas-silvestres-medicinales/dedalera": [86,117,271,283,80,81,82,83],
+    "hierbas-silvestres-medicinales/sandalo": [120,128,271,283,270,272,273,274],
+    "hierbas-silvestres-medicinales/amapola": [120,125,128,121,122,123,124,126],
+    "hierbas-silvestres-medicinales/eneldo": [42,43,65,40,41,44,45,46],
+    "hierbas-silvestres-medicinales/apio": [42,44,47,58,271,283,292],
+    "hierbas-silvestres-medicinales/ajenjo": [42,40,41,43,44,45,46,47],
+    "hierbas-silvestres-medicinales/kava": [128,399,411,422,425,438],
+    "hierbas-silvestres-medicinales/ruda": [128,309,120,121,122,123,124,125],
+    "hierbas-silvestres-medicinales/calendula": [40,43,58,41,42,44,45,46],
+    "hierbas-silvestres-medicinales/escaramujo": [161,162,164,176,178,188,189,190],
+    "hierbas-silvestres-medicinales/bejuco-de-agua": [107,120,125,121,122,123,124,126],
+    "hierbas-silvestres-medicinales/olmo": [1,22,23,25,26,40],
+    "hierbas-silvestres-medicinales/hinojo": [0,1,27,28,39,42,53,57],
+    "hierbas-silvestres-medicinales/limoncillo": [42,120,128,121,122,123,124,125],
+    "hierbas-silvestres-medicinales/ricino": [44,47,40,41,42,43,45,46],
+    "hierbas-silvestres-medicinales/konjac": [44,47,208,40,41,42,43,45],
+    "hierbas-silvestres-medicinales/lechuga-silvestre": [120,125,128,121,122,123,124,126],
+    "hierbas-silvestres-medicinales/helecho-gu-sui-bu": [230,241,248,249,251,255,256,267],
+    "hierbas-silvestres-medicinales/junco-de-esteras": [120,121,122,123,124,125,126,127],
+    "hierbas-silvestres-medicinales/apong-apong": [],
+    "hierbas-silvestres-medicinales/khat": [120,121,122,123,124,125,126,127],
+    "hierbas-silvestres-medicinales/kaempferia-rotunda": [],
+    "hierbas-silvestres-medicinales/hierba-de-san-simon": [161,188,189,230,248,249,267],
+    "hierbas-silvestres-medicinales/kadsura-longipedunculata": [42,40,41,43,44,45,46,47],
+    "hierbas-silvestres-medicinales/guaco": [0,1,4,5,6,7,27,28],
+    "hierbas-silvestres-medicinales/copaiba": [1,27,28,39,44,47,53,57],
+    "hierbas-silvestres-medicinales/fenogreco": [42,195,196,207,216],
+    "hierbas-silvestres-medicinales/moringa": [107,111,161,162,164,179,188,189],
+    "hierbas-silvestres-medicinales/centella-asiatica": [107,40,41,42,43,44,45,46],
+    "hierbas-silvestres-medicinales/grosellero-de-la-india": [49,50,81,114,116],
+    "hierbas-silvestres-medicinales/bardana": [40,43,58,271,283,386],
+    "hierbas-silvestres-medicinales/malva": [0,1,4,5,6,7,27,28],
+    "hierbas-silvestres-medicinales/anis-verde": [0,1,27,28,39,42,53,57],
+    "hierbas-silvestres-medicinales/salvia": [40,43,44,45,48,58,65,195],
+    "hierbas-silvestres-medicinales/romero": [42,45,49,50,81,107,114,116],
+    "hierbas-silvestres-medicinales/boldo": [49,50,58,128,271,283],
+    "arboles-medicinales/eucalipto": [0,1,4,5,6,7,20,24],
+    "arboles-medicinales/sauce": [120,125,230,241,248,249,251,255],
+    "arboles-medicinales/tilo": [120,128,121,122,123,124,125,126],
+    "arboles-medicinales/olivo": [81,114,116,195,196,207,216],
+    "arboles-medicinales/neem": [161,162,164,188,189,190],
+    "arboles-medicinales/moringa": [40,43,49,50,58,161,162,164],
+    "arboles-medicinales/ginkgo-biloba": [81,114,116,120,121,122,123,124],
+    "arboles-medicinales/castano-de-indias": [107,80,81,82,83,84,85,86],
+    "arboles-medicinales/fresno": [230,241,248,249,251,255,256,267],
+    "arboles-medicinales/abedul": [271,283,270,272,273,274,275,276],
+    "arboles-medicinales/cipres": [80,81,82,83,84,85,86,87],
+    "arboles-medicinales/pino": [0,1,5,6,7,27,28,39],
+    "arboles-medicinales/cedro": [0,1,5,6,7,27,28,39],
+    "arboles-medicinales/arce": [161,162,164,176,178,188,189,190],
+    "arboles-medicinales/roble": [],
+    "arboles-medicinales/haya": [0,1,5,6,7,27,28,39],
+    "arboles-medicinales/nogal": [195,196,207,216,197,198,199,200],
+    "arboles-medicinales/tejo": [160,161,162,163,164,165,166,167],
+    "arboles-medicinales/espino-blanco": [86,120,128,80,81,82,83,84],
+    "arboles-medicinales/avellano": [107,80,81,82,83,84,85,86],
+    "arboles-medicinales/alcornoque": [],
+    "arboles-medicinales/encina": [],
+    "arboles-medicinales/serbal": [160,161,162,163,164,165,166,167],
+    "arboles-medicinales/laurel": [0,1,27,28,39,42,53,57],
+    "arboles-medicinales/magnolia": [120,125,128,121,122,123,124,126],
+    "arboles-medicinales/arbol-del-te": [],
+    "arboles-medicinales/canelo": [160,161,162,163,164,165,166,167],
+    "arboles-medicinales/boldo": [42,49,50,40,41,43,44,45],
+    "arboles-medicinales/quina": [160,161,162,163,164,165,166,167],
+    "arboles-medicinales/sangre-de-drago": [40,43,58,41,42,44,45,46],
+    "arboles-medicinales/araucaria": [40,41,42,43,44,45,46,47],
+    "arboles-medicinales/alerce": [0,1,5,6,7,27,28,39],
+    "arboles-medicinales/abeto": [0,1,5,6,7,27,28,39],
+    "arboles-medicinales/acacia": [40,43,44,45,48,53,57,58],
+    "arboles-medicinales/algarrobo": [44,45,48,53,57,59,61,73],
+    "arboles-medicinales/almendro": [44,47,53,57,59,61,73,76],
+    "arboles-medicinales/caoba": [43,44,45,48,65],
+    "arboles-medicinales/ceiba": [271,273,275,283,270,272,274,276],
+    "arboles-medicinales/chopo": [230,241,248,249,251,255,256,267],
+    "arboles-medicinales/granado": [43,44,45,48,49,50,65,81],
+    "arboles-medicinales/guayabo": [43,44,45,48,58,65],
+    "arboles-medicinales/higuera": [44,47,53,57,59,61,73,76],
+    "arboles-medicinales/jaboncillo": [],
+    "arboles-medicinales/limonero": [58,190,160,161,162,163,164,165],
+    "arboles-medicinales/madrono": [271,274,283,270,272,273,275,276],
+    "arboles-medicinales/moral": [44,47,53,57,59,61,73,76],
+    "arboles-medicinales/naranjo-amargo": [42,43,65,128,120,121,122,123],
+    "arboles-medicinales/olmo": [],
+    "arboles-medicinales/peral": [271,274,283,270,272,273,275,276],
+    "arbustos-medicinales/romero": [40,42,43,45,49,50,58,81],
+    "arbustos-medicinales/lavanda": [120,125,128,399,411,425,438],
+    "arbustos-medicinales/hamamelis": [107,80,81,82,83,84,85,86],
+    "arbustos-medicinales/espino-blanco": [86,128,80,81,82,83,84,85],
+    "arbustos-medicinales/sauzgatillo": [309,300,301,302,303,304,305,306],
+    "arbustos-medicinales/gayuba": [271,274,283,270,272,273,275,276],
+    "arbustos-medicinales/arandano-rojo": [161,162,164,176,178,188,189,190],
+    "arbustos-medicinales/grosellero-negro": [0,4,5,6,7,161,162,164],
+    "arbustos-medicinales/enebro": [42,58,230,248,249,255,256,267],
+    "arbustos-medicinales/madrono": [40,43,44,45,48,58,65,271],
+    "arbustos-medicinales/zarzaparrilla": [230,241,248,249,251,255,256,267],
+    "arbustos-medicinales/rusco": [107,117,80,81,82,83,84,85],
+    "arbustos-medicinales/mirto": [0,1,5,6,7,27,28,39],
+    "arbustos-medicinales/jara-pringosa": [1,20,21,22,23,24,25,26],
+    "arbustos-medicinales/brezo": [120,125,128,230,241,248,249,251],
+    "arbustos-medicinales/sauco": [0,4,5,6,7,20,21,22],
+    "arbustos-medicinales/artemisa": [42,45,49,65,40,41,43,44],
+    "arbustos-medicinales/boj": [160,161,162,163,164,165,166,167],
+    "arbustos-medicinales/aligustre": [],
+    "arbustos-medicinales/bonetero": [],
+    "arbustos-medicinales/cornejo-sanguineo": [43,44,45,48,65],
+    "arbustos-medicinales/durillo": [160,161,162,163,164,165,166,167],
+    "arbustos-medicinales/espino-cerval-de-mar": [81,114,116,176,178],
+    "arbustos-medicinales/forsitia": [0,4,5,6,7,20,21,22],
+    "arbustos-medicinales/mahonia": [40,43,44,45,48,58,161,162],
+    "arbustos-medicinales/pirlitero": [43,44,45,48,65,86],
+    "arbustos-medicinales/retama-negra": [86,117,80,81,82,83,84,85],
+    "arbustos-medicinales/rosa-canina": [161,162,164,188,189,190,230,241],
+    "arbustos-medicinales/salvia-real": [],
+    "arbustos-medicinales/te-de-aragon": [42,43,65,40,41,44,45,46],
+    "arbustos-medicinales/tomillo-salsero": [0,1,5,6,7,27,28,39],
+    "arbustos-medicinales/torvisco": [],
+    "arbustos-medicinales/viburno": [128,309,300,301,302,303,304,305],
+    "arbustos-medicinales/agnocasto": [309,300,301,302,303,304,305,306],
+    "arbustos-medicinales/aladierno": [43,44,45,47,48,65],
+    "arbustos-medicinales/arayan": [0,1,5,6,7,27,28,39],
+    "arbustos-medicinales/berberis": [44,45,48,65,40,41,42,43],
+    "arbustos-medicinales/ceanoto": [375,380,386,391,397,398],
+    "arbustos-medicinales/chicalote": [120,125,128,399,402,409,411,422],
+    "arbustos-medicinales/damiana": [312,334,425,438,120,121,122,123],
+    "arbustos-medicinales/equiseto-menor": [271,274,283,230,231,232,233,234],
+    "arbustos-medicinales/eucalipto": [0,1,4,5,6,7,20,24],
+    "arbustos-medicinales/gobernadora": [230,241,248,249,251,255,256,267],
+    "arbustos-medicinales/guayule": [230,241,248,249,251,255,256,267],
+    "arbustos-medicinales/hierba-del-pollo": [],
+    "arbustos-medicinales/hoja-santa": [0,1,4,5,6,7,27,28],
+    "arbustos-medicinales/izote": [230,241,248,249,251,255,256,267],
+    "arbustos-medicinales/jojoba": [],
+    "arbustos-medicinales/lentisco": [40,43,44,45,48,58,65],
+    "arbustos-medicinales/membrillero": [0,1,4,5,6,7,27,28],
+    "plantas-tropicales-medicinales/aloe-vera": [40,43,58,161,162,164,188,189],
+    "plantas-tropicales-medicinales/jengibre": [0,4,5,6,7,40,42,43],
+    "plantas-tropicales-medicinales/curcuma": [40,43,49,50,58,161,162,164],
+    "plantas-tropicales-medicinales/noni": [40,43,44,45,48,58,161,162],
+    "plantas-tropicales-medicinales/una-de-gato": [161,162,164,176,178,188,189,190],
+    "plantas-tropicales-medicinales/sangre-de-drago": [40,43,58,41,42,44,45,46],
+    "plantas-tropicales-medicinales/copaiba": [0,1,4,5,6,7,27,28],
+    "plantas-tropicales-medicinales/acai": [81,107,114,116,161,162,164,176],
+    "plantas-tropicales-medicinales/guarana": [120,125,121,122,123,124,126,127],
+    "plantas-tropicales-medicinales/yerba-mate": [42,44,45,47,49,50,58],
+    "plantas-tropicales-medicinales/yuca": [40,42,43,58,230,241,248,249],
+    "plantas-tropicales-medicinales/ginseng": [162,164,188,197,209,217],
+    "plantas-tropicales-medicinales/pasiflora": [128,399,411,422,425,438],
+    "plantas-tropicales-medicinales/agave": [40,43,58,41,42,44,45,46],
+    "plantas-tropicales-medicinales/arandano": [81,107,114,116,271,283,286],
+    "plantas-tropicales-medicinales/flor-de-sauco": [0,1,4,5,6,7,20,21],
+    "plantas-tropicales-medicinales/guaco": [0,1,4,5,6,7,27,28],
+    "plantas-tropicales-medicinales/moringa": [40,43,49,50,58,81,107,111],
+    "plantas-tropicales-medicinales/centella-asiatica": [107,120,125,80,81,82,83,84],
+    "plantas-tropicales-medicinales/grosellero-de-la-india": [49,50,81,114,116,162,164,176],
+    "plantas-tropicales-medicinales/bardana": [271,283,374,375,376,377,378,379],
+    "plantas-tropicales-medicinales/malva": [0,1,4,5,6,7,27,28],
+    "plantas-tropicales-medicinales/anis-verde": [0,1,27,28,39,42,43,53],
+    "plantas-tropicales-medicinales/salvia": [40,43,44,45,48,58,65,120],
+    "plantas-tropicales-medicinales/romero": [40,42,43,45,49,50,58,81],
+    "plantas-tropicales-medicinales/manzanilla": [40,42,43,58,65,120,125],
+    "plantas-tropicales-medicinales/ajo": [81,114,80,82,83,84,85,86],
+    "plantas-tropicales-medicinales/eucalipto": [0,1,4,5,6,7,20,24],
+    "plantas-tropicales-medicinales/cola-de-caballo": [271,274,283,270,272,273,275,276],
+    "plantas-tropicales-medicinales/hiperico": [128,399,411,425,438],
+    "plantas-tropicales-medicinales/tomillo": [0,1,5,6,7,27,28,39],
+    "plantas-tropicales-medicinales/lavanda": [120,125,128,399,411,425,438],
+    "plantas-tropicales-medicinales/tila": [128,399,411,422,425,438],
+    "plantas-tropicales-medicinales/diente-de-leon": [45,58,65,271,274,283],
+    "plantas-tropicales-medicinales/ginkgo-biloba": [81,114,116,120,121,122,123,124],
+    "plantas-tropicales-medicinales/oregano": [5,6,7,42,49,50,58,176],
+    "plantas-tropicales-medicinales/corteza-de-sauce": [120,125,230,241,248,249,251,255],
+    "plantas-tropicales-medicinales/acebo": [271,283,270,272,273,274,275,276],
+    "plantas-tropicales-medicinales/poleo-menta": [42,43,65,40,41,44,45,46],
+    "plantas-tropicales-medicinales/ortiga": [271,283,270,272,273,274,275,276],
+    "plantas-tropicales-medicinales/dedalera": [86,80,81,82,83,84,85,87],
+    "plantas-tropicales-medicinales/sandalo": [120,125,128,271,274,283],
+    "plantas-tropicales-medicinales/amapola": [1,6,7,27,28,39,125,128],
+    "plantas-tropicales-medicinales/eneldo": [42,43,58,65,40,41,44,45],
+    "plantas-tropicales-medicinales/apio": [42,58,271,283,292],
+    "plantas-tropicales-medicinales/ajenjo": [45,65,40,41,42,43,44,46],
+    "plantas-tropicales-medicinales/kava": [120,128,399,411,425,438],
+    "plantas-tropicales-medicinales/ruda": [43,65,300,301,302,303,304,305],
+    "plantas-tropicales-medicinales/calendula": [40,43,53,57,58,59,61,73],
+    "plantas-tropicales-medicinales/cacao": [81,114,116,80,82,83,84,85],
+    "raices-y-tuberculos-medicinales/jengibre": [40,42,43,49,50,58,161,162],
+    "raices-y-tuberculos-medicinales/curcuma": [40,43,44,45,48,49,50,58],
+    "raices-y-tuberculos-medicinales/ginseng": [176,178,195,196,197,207,209,216],
+    "raices-y-tuberculos-medicinales/astragalo": [81,114,116,117,176,178,271,283],
+    "raices-y-tuberculos-medicinales/regaliz": [0,1,4,5,6,7,20,21],
+    "raices-y-tuberculos-medicinales/valeriana": [120,128,399,411,422,425,438],
+    "raices-y-tuberculos-medicinales/equinacea": [0,1,4,5,6,7,20,21],
+    "raices-y-tuberculos-medicinales/bardana": [40,43,44,45,48,58,271,283],
+    "raices-y-tuberculos-medicinales/diente-de-leon-raiz": [45,49,50,58,65,271,274,283],
+    "raices-y-tuberculos-medicinales/maca": [309,195,196,197,198,199,200,201],
+    "raices-y-tuberculos-medicinales/ashwagandha": [120,125,128,161,162,164,188,189],
+    "raices-y-tuberculos-medicinales/sello-de-oro": [0,4,5,6,7,20,21,22],
+    "raices-y-tuberculos-medicinales/angelica": [0,1,27,28,39,42,43,53],
+    "raices-y-tuberculos-medicinales/ruibarbo": [40,42,43,44,45,47,48,58],
+    "raices-y-tuberculos-medicinales/malvavisco": [0,1,4,5,6,7,27,28],
+    "raices-y-tuberculos-medicinales/osha": [0,1,20,21,22,23,24,25],
+    "raices-y-tuberculos-medicinales/calamo-aromatico": [0,1,27,28,39,42,43,45],
+    "raices-y-tuberculos-medicinales/genciana": [42,45,65,40,41,43,44,46],
+    "raices-y-tuberculos-medicinales/rabano-picante": [4,5,20,24,44,45,48,58],
+    "raices-y-tuberculos-medicinales/yuca": [40,43,58,230,241,248,249,251],
+    "raices-y-tuberculos-medicinales/batata": [40,43,49,50,58,161,162,164],
+    "raices-y-tuberculos-medicinales/remolacha": [49,50,81,114,116],
+    "raices-y-tuberculos-medicinales/zanahoria": [42,49,50,40,41,43,44,45],
+    "raices-y-tuberculos-medicinales/nabo": [0,1,4,5,6,7,27,28],
+    "raices-y-tuberculos-medicinales/chirivia": [42,44,47,49,50,58,81,114],
+    "raices-y-tuberculos-medicinales/apionabo": [40,42,43,58,230,241,248,249],
+    "raices-y-tuberculos-medicinales/rabano": [0,1,5,6,7,27,28,39],
+    "raices-y-tuberculos-medicinales/colirrabano": [42,44,47,49,50,176,178],
+    "raices-y-tuberculos-medicinales/tupinambo": [42,40,41,43,44,45,46,47],
+    "raices-y-tuberculos-medicinales/arracacha": [42,231,250,40,41,43,44,45],
+    "raices-y-tuberculos-medicinales/ulluco": [40,43,58,161,162,164,179,188],
+    "raices-y-tuberculos-medicinales/oca": [44,47,49,50,40,41,42,43],
+    "raices-y-tuberculos-medicinales/mashua": [271,283,286,312,300,301,302,303],
+    "raices-y-tuberculos-medicinales/taro": [44,47,179,40,41,42,43,45],
+    "raices-y-tuberculos-medicinales/atractylodes": [42,45,58,65,271,274,283,292],
+    "raices-y-tuberculos-medicinales/codonopsis": [20,21,22,23,24,25,26,45],
+    "raices-y-tuberculos-medicinales/rehmannia": [120,125,161,162,164,188,189,190],
+    "raices-y-tuberculos-medicinales/peonia-blanca": [40,43,49,50,58,65,120,125],
+    "raices-y-tuberculos-medicinales/galanga": [40,42,43,44,45,48,58,107],
+    "raices-y-tuberculos-medicinales/sarsaparrilla": [230,241,248,249,251,255,256,267],
+    "raices-y-tuberculos-medicinales/mandioca": [40,41,42,43,44,45,46,47],
+    "raices-y-tuberculos-medicinales/crosne": [42,40,41,43,44,45,46,47],
+    "raices-y-tuberculos-medicinales/eleuterococo": [197,209,217,422,425,438],
+    "raices-y-tuberculos-medicinales/cimicifuga": [120,125,128,198,201,309,312,334],
+    "raices-y-tuberculos-medicinales/polygala": [0,1,27,28,39,125,399,402],
+    "flores-medicinales/manzanilla": [40,42,43,58,120,125],
+    "flores-medicinales/calendula": [161,162,164,188,189,190],
+    "flores-medicinales/lavanda": [120,125,128,399,411,425,438],
+    "flores-medicinales/rosa": [120,125,128,121,122,123,124,126],
+    "flores-medicinales/jazmin": [120,128,399,411,422,425,438],
+    "flores-medicinales/hibisco": [81,114,116,117,271,283,286],
+    "flores-medicinales/flor-de-sauco": [0,1,4,5,6,7,20,21],
+    "flores-medicinales/tilo-flor": [128,399,411,422,425,438],
+    "flores-medicinales/azahar": [128,399,411,422,425,438],
+    "flores-medicinales/pasiflora": [128,399,411,422,425,438],
+    "flores-medicinales/amapola": [120,125,128,399,411,422,425,438],
+    "flores-medicinales/violeta": [0,1,4,5,6,7,27,28],
+    "flores-medicinales/malva": [0,1,4,5,6,7,27,28],
+    "flores-medicinales/arnica": [230,241,248,249,251,255,256,267],
+    "flores-medicinales/equinacea": [0,1,4,5,6,7,20,21],
+    "flores-medicinales/girasol": [0,1,27,28,39],
+    "flores-medicinales/borraja": [0,1,4,5,6,7,27,28],
+    "flores-medicinales/capuchina": [0,1,5,6,7,27,28,39],
+    "flores-medicinales/clavel": [86,120,121,122,123,124,125,126],
+    "flores-medicinales/crisantemo": [80,81,82,83,84,85,86,87],
+    "flores-medicinales/margarita": [0,1,4,5,6,7,27,28],
+    "flores-medicinales/aciano": [],
+    "flores-medicinales/loto": [43,44,45,48,65,86,128],
+    "flores-medicinales/pensamiento": [0,1,4,5,6,7,27,28],
+    "flores-medicinales/primavera": [0,1,27,28,39,125,128],
+    "flores-medicinales/ulmaria": [161,162,164,188,189,190,230,241],
+    "flores-medicinales/zinnia": [],
+    "flores-medicinales/dalia": [195,196,207,208,216,271,283],
+    "flores-medicinales/geranio": [425,438,120,121,122,123,124,125],
+    "flores-medicinales/magnolia": [120,125,128,399,411,425,438],
+    "flores-medicinales/peonia": [120,125,230,241,248,249,251,255],
+    "flores-medicinales/tanaceto": [120,125,121,122,123,124,126,127],
+    "flores-medicinales/verbena": [42,45,65,120,128,399,411,425],
+    "flores-medicinales/yarrow": [40,43,58,65,107,312,334],
+    "flores-medicinales/clitoria": [128,399,411,425,438],
+    "flores-medicinales/espino-blanco": [86,128,80,81,82,83,84,85],
+    "flores-medicinales/lupulo": [128,309,399,411,422,425,438],
+    "flores-medicinales/meliloto": [86,107,80,81,82,83,84,85],
+    "flores-medicinales/gordolobo": [0,1,4,5,6,7,27,28],
+    "flores-medicinales/hisopo": [0,1,20,21,22,23,24,25],
+    "flores-medicinales/jazmin-amarillo": [120,125,128,161,168,188,189],
+    "flores-medicinales/lirio-de-los-valles": [86,117,80,81,82,83,84,85],
+    "flores-medicinales/digital": [86,80,81,82,83,84,85,87],
+    "flores-medicinales/azafran": [120,121,122,123,124,125,126,127],
+    "flores-medicinales/onagra": [309,312,334,300,301,302,303,304],
+    "flores-medicinales/cempasuchil": [42,43,65,40,41,44,45,46],
+    "flores-medicinales/angelica": [0,1,27,28,39,42,43,45],
+    "flores-medicinales/centaurea-menor": [45,49,65,40,41,42,43,44],
+    "hongos-medicinales/reishi": [107,120,125,161,162,164,178,188],
+    "hongos-medicinales/shiitake": [162,164,188,160,161,163,165,166],
+    "hongos-medicinales/maitake": [162,164,176,188,195,196,207,216],
+    "hongos-medicinales/cordyceps": [0,1,2,3,4,5,6,7],
+    "hongos-medicinales/melena-de-leon": [120,121,122,123,124,125,126,127],
+    "hongos-medicinales/chaga": [40,43,49,50,58,161,162,164],
+    "hongos-medicinales/cola-de-pavo": [162,164,188,160,161,163,165,166],
+    "hongos-medicinales/agarikon": [0,1,4,5,6,7,20,21],
+    "hongos-medicinales/tremella": [120,121,122,123,124,125,126,127],
+    "hongos-medicinales/poria-cocos": [58,271,283,399,411,422],
+    "hongos-medicinales/agaricus-blazei": [162,164,188,160,161,163,165,166],
+    "hongos-medicinales/enoki": [49,50,162,164,176,178,188],
+    "hongos-medicinales/hongo-ostra": [81,107,114,116,161,162,164,176],
+    "hongos-medicinales/polyporus-umbellatus": [162,164,178,188,271,283],
+    "hongos-medicinales/schizophyllum-commune": [162,164,188,160,161,163,165,166],
+    "hongos-medicinales/auricularia-auricula": [80,81,82,83,84,85,86,87],
+    "hongos-medicinales/coprinus-comatus": [176,178,195,196,207,216],
+    "hongos-medicinales/fomes-fomentarius": [161,162,164,188,189,190],
+    "hongos-medicinales/ganoderma-applanatum": [161,162,164,188,189,190,230,241],
+    "hongos-medicinales/phellinus-linteus": [161,162,164,188,189,190],
+    "hongos-medicinales/pleurotus-eryngii": [81,107,114,116,161,162,164,176],
+    "hongos-medicinales/sparassis-crispa": [162,164,188,160,161,163,165,166],
+    "hongos-medicinales/laetiporus-sulphureus": [49,50,162,164,176,178,188],
+    "hongos-medicinales/suillus-luteus": [161,162,164,176,178,188,189,190],
+    "hongos-medicinales/cantharellus-cibarius": [176,178,160,161,162,163,164,165],
+    "hongos-medicinales/craterellus-cornucopioides": [49,50,176,178,40,41,42,43],
+    "hongos-medicinales/morchella-esculenta": [161,162,164,176,178,188,189,190],
+    "hongos-medicinales/tuber-melanosporum": [120,125,195,196,207,216],
+    "hongos-medicinales/boletus-edulis": [49,50,176,178,160,161,162,163],
+    "hongos-medicinales/ganoderma-lingzhi": [176,178,422,425,438],
+    "hongos-medicinales/amanita-caesarea": [49,50,176,178,179],
+    "algas-y-plantas-acuaticas-medicinales/espirulina": [40,43,49,50,58,81,107,111],
+    "algas-y-plantas-acuaticas-medicinales/chlorella": [40,41,42,43,44,45,46,47],
+    "algas-y-plantas-acuaticas-medicinales/kelp": [179,197,217,195,196,198,199,200],
+    "algas-y-plantas-acuaticas-medicinales/wakame": [80,81,82,83,84,85,86,87],
+    "algas-y-plantas-acuaticas-medicinales/nori": [40,41,42,43,44,45,46,47],
+    "algas-y-plantas-acuaticas-medicinales/dulse": [81,111,114,116,230,231,232,233],
+    "algas-y-plantas-acuaticas-medicinales/fucus": [40,43,45,58,195,196,197,198],
+    "algas-y-plantas-acuaticas-medicinales/agar-agar": [44,47,40,41,42,43,45,46],
+    "algas-y-plantas-acuaticas-medicinales/musgo-de-irlanda": [0,1,27,28,39,40,53,57],
+    "algas-y-plantas-acuaticas-medicinales/kombu": [40,41,42,43,44,45,46,47],
+    "algas-y-plantas-acuaticas-medicinales/arame": [209,250,195,196,197,198,199,200],
+    "algas-y-plantas-acuaticas-medicinales/hijiki": [44,47,230,231,232,233,234,235],
+    "algas-y-plantas-acuaticas-medicinales/lechuga-de-mar": [49,50,81,111,114,116],
+    "algas-y-plantas-acuaticas-medicinales/esparrago-de-mar": [271,283,270,272,273,274,275,276],
+    "algas-y-plantas-acuaticas-medicinales/lenteja-de-agua": [40,43,58,161,162,164,188,189],
+    "algas-y-plantas-acuaticas-medicinales/jacinto-de-agua": [374,375,376,377,378,379,380,381],
+    "algas-y-plantas-acuaticas-medicinales/nenufar-blanco": [128,309,120,121,122,123,124,125],
+    "algas-y-plantas-acuaticas-medicinales/berro-de-agua": [0,1,27,28,39,271,273,275],
+    "algas-y-plantas-acuaticas-medicinales/menta-acuatica": [42,43,65,40,41,44,45,46],
+    "algas-y-plantas-acuaticas-medicinales/lirio-amarillo": [],
+    "algas-y-plantas-acuaticas-medicinales/cola-de-caballo-de-agua": [271,274,283,270,272,273,275,276],
+    "algas-y-plantas-acuaticas-medicinales/castana-de-agua": [40,43,49,50,58],
+    "algas-y-plantas-acuaticas-medicinales/aponogeton": [179,40,41,42,43,44,45,46],
+    "algas-y-plantas-acuaticas-medicinales/elodea": [271,283,270,272,273,274,275,276],
+    "algas-y-plantas-acuaticas-medicinales/azolla": [374,375,376,377,378,379,380,381],
+    "frutas-citricas-medicinales/limón": [176,178,160,161,162,163,164,165],
+    "frutas-citricas-medicinales/naranja": [176,178,160,161,162,163,164,165],
+    "frutas-citricas-medicinales/toronja": [176,178,160,161,162,163,164,165],
+    "frutas-citricas-medicinales/mandarina": [176,178,160,161,162,163,164,165],
+    "frutas-citricas-medicinales/lima": [176,178,160,161,162,163,164,165],
+    "frutas-citricas-medicinales/bergamota": [176,178,160,161,162,163,164,165],
+    "frutas-citricas-medicinales/pomelo": [176,178,160,161,162,163,164,165],
+    "frutas-citricas-medicinales/kumquat": [176,178,160,161,162,163,164,165],
+    "frutas-citricas-medicinales/cidra": [176,178,160,161,162,163,164,165],
+    "frutas-citricas-medicinales/yuzu": [176,178,160,161,162,163,164,165],
+    "frutas-citricas-medicinales/calamondin": [176,178,160,161,162,163,164,165],
+    "frutas-citricas-medicinales/tangelo": [176,178,160,161,162,163,164,165],
+    "frutas-citricas-medicinales/ugli": [176,178,160,161,162,163,164,165],
+    "frutas-citricas-medicinales/sweetie": [176,178,160,161,162,163,164,165],
+    "frutas-citricas-medicinales/oroblanco": [176,178,160,161,162,163,164,165],
+    "frutas-citricas-medicinales/melogold": [176,178,160,161,162,163,164,165],
+    "frutas-citricas-medicinales/kaffir-lime": [176,178,160,161,162,163,164,165],
+    "frutas-citricas-medicinales/finger-lime": [176,178,160,161,162,163,164,165],
+    "frutas-citricas-medicinales/sudachi": [176,178,160,161,162,163,164,165],
+    "frutas-citricas-medicinales/kabosu": [176,178,160,161,162,163,164,165],
+    "frutas-citricas-medicinales/rangpur": [176,178,160,161,162,163,164,165],
+    "frutas-citricas-medicinales/limequat": [176,178,160,161,162,163,164,165],
+    "frutas-citricas-medicinales/citrange": [176,178,160,161,162,163,164,165],
+    "frutas-citricas-medicinales/citrumelo": [176,178,160,161,162,163,164,165],
+    "frutas-citricas-medicinales/faustrime": [176,178,160,161,162,163,164,165],
+    "frutas-tropicales-medicinales/caimito": [40,42,43,49,50,58,161,162],
+    "frutas-tropicales-medicinales/papaya": [40,42,43,49,50,58,81,107],
+    "frutas-tropicales-medicinales/pina": [40,42,43,58,107,117,161,162],
+    "frutas-tropicales-medicinales/mango": [49,50,176,178,160,161,162,163],
+    "frutas-tropicales-medicinales/guayaba": [43,44,45,48,49,50,65,81],
+    "frutas-tropicales-medicinales/maracuya": [81,86,114,116,120,128,399,411],
+    "frutas-tropicales-medicinales/carambola": [40,43,49,50,58,81,107,114],
+    "frutas-tropicales-medicinales/pitahaya": [40,43,49,50,58,161,162,164],
+    "frutas-tropicales-medicinales/lichi": [81,107,114,116,161,162,164,176],
+    "frutas-tropicales-medicinales/rambutan": [49,50,176,178,160,161,162,163],
+    "frutas-tropicales-medicinales/durian": [120,121,122,123,124,125,126,127],
+    "frutas-tropicales-medicinales/tamarindo": [40,43,44,47,58,161,162,164],
+    "frutas-tropicales-medicinales/coco": [40,41,42,43,44,45,46,47],
+    "frutas-tropicales-medicinales/guanabana": [40,43,58,86,107,120,125,128],
+    "frutas-tropicales-medicinales/kiwi": [44,47,49,50,176,178],
+    "frutas-tropicales-medicinales/granada": [81,107,114,116,120,125,161,162],
+    "frutas-tropicales-medicinales/higo": [0,1,27,28,39,40,44,47],
+    "frutas-tropicales-medicinales/chirimoya": [42,49,50,81,114,116,120,128],
+    "frutas-tropicales-medicinales/lucuma": [161,162,164,176,178,188,189,190],
+    "frutas-tropicales-medicinales/zapote": [42,49,50,176,178,179],
+    "frutas-tropicales-medicinales/mamey": [42,49,50,176,178],
+    "frutas-tropicales-medicinales/noni": [161,162,164,188,189,190,230,241],
+    "frutas-tropicales-medicinales/araza": [81,114,116,117,176,178,271,283],
+    "frutas-tropicales-medicinales/borojo": [309,300,301,302,303,304,305,306],
+    "frutas-tropicales-medicinales/camu-camu": [0,4,5,6,7,20,21,22],
+    "frutas-tropicales-medicinales/copoazu": [81,111,114,116,120,121,122,123],
+    "frutas-tropicales-medicinales/feijoa": [40,42,43,49,50,58,161,162],
+    "frutas-tropicales-medicinales/jabuticaba": [40,43,44,45,48,49,50,58],
+    "frutas-tropicales-medicinales/macambo": [44,45,47,120,121,122,123,124],
+    "frutas-tropicales-medicinales/pomarrosa": [42,44,45,48,58,208,271,283],
+    "frutas-tropicales-medicinales/tomatillo": [161,162,164,176,178,188,189,190],
+    "frutas-tropicales-medicinales/kumquat": [40,42,43,49,50,58,81,107],
+    "frutas-tropicales-medicinales/tamarillo": [49,50,81,114,116],
+    "frutas-tropicales-medicinales/lima-kaffir": [40,42,43,45,58],
+    "frutas-tropicales-medicinales/anon": [42,49,50,81,114,116],
+    "frutas-tropicales-medicinales/yaca": [42,179,40,41,43,44,45,46],
+    "frutas-tropicales-medicinales/banana-roja": [45,49,50,81,114,116,176,178],
+    "frutas-tropicales-medicinales/frutipan": [44,45,47,81,114,241],
+    "frutas-tropicales-medicinales/fruta-hala": [44,47,58,271,283],
+    "frutas-tropicales-medicinales/acerola": [81,114,116,176,178],
+    "frutas-clima-templado-medicinales/manzana": [49,50,58,81,114,116,117,271],
+    "frutas-clima-templado-medicinales/pera": [43,44,45,47,48,58,65,271],
+    "frutas-clima-templado-medicinales/durazno": [44,47,49,50,58,271,283,286],
+    "frutas-clima-templado-medicinales/ciruela": [44,45,47,49,50],
+    "frutas-clima-templado-medicinales/cereza": [161,162,164,176,178,188,189,190],
+    "frutas-clima-templado-medicinales/albaricoque": [44,47,49,50,40,41,42,43],
+    "frutas-clima-templado-medicinales/membrillo": [40,43,44,45,48,58,65],
+    "frutas-clima-templado-medicinales/granada": [81,107,114,116,161,162,164,176],
+    "frutas-clima-templado-medicinales/higo": [0,1,27,28,39,40,44,47],
+    "frutas-clima-templado-medicinales/uva": [81,114,116,117,176,178,271,283],
+    "frutas-clima-templado-medicinales/kiwi": [44,47,49,50,176,178],
+    "frutas-clima-templado-medicinales/frambuesa": [40,43,44,45,48,49,50,58],
+    "frutas-clima-templado-medicinales/fresa": [161,162,164,176,178,188,189,190],
+    "frutas-clima-templado-medicinales/mora": [40,43,44,45,47,48,49,50],
+    "frutas-clima-templado-medicinales/arandano": [81,114,116,271,283,286],
+    "frutas-clima-templado-medicinales/grosella": [176,178,271,274,283,286],
+    "frutas-clima-templado-medicinales/zarzamora": [40,43,44,45,48,49,50,58],
+    "frutas-clima-templado-medicinales/nectarina": [44,47,49,50,58,271,283,286],
+    "frutas-clima-templado-medicinales/paraguayo": [44,47,49,50,58,271,283,286],
+    "frutas-clima-templado-medicinales/nispero": [0,1,27,28,39,43,44,45],
+    "frutas-clima-templado-medicinales/caqui": [43,44,45,47,48,49,50,65],
+    "frutas-clima-templado-medicinales/acerola": [81,114,116,176,178],
+    "frutas-clima-templado-medicinales/avellana": [81,111,114,116,80,82,83,84],
+    "frutas-clima-templado-medicinales/azarolo": [81,86,114,116,128],
+    "frutas-clima-templado-medicinales/endrina": [42,43,44,45,48,49,50,65],
+    "frutas-clima-templado-medicinales/grosella-espinosa": [44,47,49,50,58,176,178,271],
+    "frutas-clima-templado-medicinales/grosella-negra": [0,4,5,6,7,161,162,164],
+    "frutas-clima-templado-medicinales/grosella-roja": [176,178,271,274,283,286],
+    "frutas-clima-templado-medicinales/madrono": [43,44,45,48,49,50,58,65],
+    "frutas-clima-templado-medicinales/nashi": [0,1,27,28,39,44,47,53],
+    "frutas-clima-templado-medicinales/nogal": [111,80,81,82,83,84,85,86],
+    "frutas-clima-templado-medicinales/uva-espina": [44,47,49,50,58,176,178,271],
+    "frutas-clima-templado-medicinales/serba": [43,44,45,48,65],
+    "frutas-clima-templado-medicinales/escaramujo": [161,162,164,176,178,188,189,190],
+    "frutas-clima-templado-medicinales/sauco": [0,1,20,21,22,23,24,25],
+    "bayas-y-frutos-del-bosque-medicinales/arandano": [81,107,114,116,271,274,283,286],
+    "bayas-y-frutos-del-bosque-medicinales/mora": [43,44,45,48,49,50,58,65],
+    "bayas-y-frutos-del-bosque-medicinales/frambuesa": [176,178,271,283,286],
+    "bayas-y-frutos-del-bosque-medicinales/fresa": [81,107,114,116,117,161,162,164],
+    "bayas-y-frutos-del-bosque-medicinales/grosella-negra": [161,162,164,176,178,188,189,190],
+    "bayas-y-frutos-del-bosque-medicinales/sauco": [0,4,5,6,7,20,21,22],
+    "bayas-y-frutos-del-bosque-medicinales/endrino": [43,44,45,48,49,50,65],
+    "bayas-y-frutos-del-bosque-medicinales/madrono": [40,43,44,45,48,58,65,271],
+    "bayas-y-frutos-del-bosque-medicinales/cornejo": [43,44,45,48,65],
+    "bayas-y-frutos-del-bosque-medicinales/espino-amarillo": [49,50,176,178,160,161,162,163],
+    "bayas-y-frutos-del-bosque-medicinales/arandano-rojo": [161,162,164,176,178,188,189,190],
+    "bayas-y-frutos-del-bosque-medicinales/baya-de-goji": [45,49,50,176,178],
+    "bayas-y-frutos-del-bosque-medicinales/escaramujo": [43,44,45,48,58,65,107,117],
+    "bayas-y-frutos-del-bosque-medicinales/grosella-roja": [40,43,49,50,58,271,283,286],
+    "bayas-y-frutos-del-bosque-medicinales/baya-de-acai": [81,107,114,116,161,162,164,176],
+    "bayas-y-frutos-del-bosque-medicinales/uva-ursi": [271,274,283,270,272,273,275,276],
+    "bayas-y-frutos-del-bosque-medicinales/zarzamora": [40,43,44,45,48,49,50,58],
+    "bayas-y-frutos-del-bosque-medicinales/baya-de-maqui": [81,107,114,116,161,162,164,176],
+    "bayas-y-frutos-del-bosque-medicinales/baya-del-espino": [81,86,114,116,128],
+    "bayas-y-frutos-del-bosque-medicinales/serbal-de-cazadores": [43,44,45,48,58,65,271,274],
+    "bayas-y-frutos-del-bosque-medicinales/casis": [0,4,5,6,7,161,162,164],
+    "bayas-y-frutos-del-bosque-medicinales/uva-de-california": [40,43,44,45,48,49,50,58],
+    "bayas-y-frutos-del-bosque-medicinales/baya-de-agracejo": [44,45,48,49,50,195,196,207],
+    "bayas-y-frutos-del-bosque-medicinales/murtilla": [40,43,44,45,48,49,50,58],
+    "bayas-y-frutos-del-bosque-medicinales/calafate": [43,44,45,48,49,50,65,176],
+    "bayas-y-frutos-del-bosque-medicinales/boysenberry": [44,47,49,50,176,178],
+    "bayas-y-frutos-del-bosque-medicinales/loganberry": [44,47,160,161,162,163,164,165],
+    "bayas-y-frutos-del-bosque-medicinales/tayberry": [44,47,49,50,176,178],
+    "bayas-y-frutos-del-bosque-medicinales/lingonberry": [40,43,49,50,58,81,107,114],
+    "bayas-y-frutos-del-bosque-medicinales/huckleberry": [81,111,114,116,176,178,179],
+    "semillas-y-frutos-secos-medicinales/linaza": [40,42,43,49,50,58,81,107],
+    "semillas-y-frutos-secos-medicinales/chia": [42,45,49,50,81,114,116],
+    "semillas-y-frutos-secos-medicinales/canamo": [107,111,230,241,248,249,251,255],
+    "semillas-y-frutos-secos-medicinales/calabaza-semillas": [179,270,271,272,273,274,275,276],
+    "semillas-y-frutos-secos-medicinales/girasol-semillas": [81,107,111,114,116,161,162,164],
+    "semillas-y-frutos-secos-medicinales/sesamo": [81,114,116,230,231,232,233,234],
+    "semillas-y-frutos-secos-medicinales/almendra": [81,111,114,116,195,196,207,216],
+    "semillas-y-frutos-secos-medicinales/nuez": [107,120,125,121,122,123,124,126],
+    "semillas-y-frutos-secos-medicinales/avellana": [81,111,114,116,80,82,83,84],
+    "semillas-y-frutos-secos-medicinales/castana": [42,43,44,45,48,65],
+    "semillas-y-frutos-secos-medicinales/pistacho": [81,114,116,80,82,83,84,85],
+    "semillas-y-frutos-secos-medicinales/nuez-de-brasil": [161,162,164,168,176,178,188,189],
+    "semillas-y-frutos-secos-medicinales/nuez-pecana": [81,107,114,116,120,125],
+    "semillas-y-frutos-secos-medicinales/anacardo": [241,230,231,232,233,234,235,236],
+    "semillas-y-frutos-secos-medicinales/pinon": [45,117,80,81,82,83,84,85],
+    "semillas-y-frutos-secos-medicinales/nuez-de-macadamia": [81,114,116,80,82,83,84,85],
+    "semillas-y-frutos-secos-medicinales/semillas-de-amapola": [1,27,28,39,120,125,128,241],
+    "semillas-y-frutos-secos-medicinales/semillas-de-mostaza": [0,4,5,6,7,40,42,43],
+    "semillas-y-frutos-secos-medicinales/semillas-de-apio": [40,42,43,58,230,241,248,249],
+    "semillas-y-frutos-secos-medicinales/semillas-de-hinojo": [42,43,65,40,41,44,45,46],
+    "semillas-y-frutos-secos-medicinales/semillas-de-comino": [42,49,50,176,178],
+    "semillas-y-frutos-secos-medicinales/semillas-de-cardamomo": [0,1,27,28,39,42,53,57],
+    "semillas-y-frutos-secos-medicinales/semillas-de-cilantro": [42,49,50,40,41,43,44,45],
+    "semillas-y-frutos-secos-medicinales/semillas-de-anis": [0,1,27,28,39,42,43,53],
+    "semillas-y-frutos-secos-medicinales/semillas-de-alcaravea": [42,44,45,48,40,41,43,46],
+    "semillas-y-frutos-secos-medicinales/semillas-de-eneldo": [42,43,65,40,41,44,45,46],
+    "semillas-y-frutos-secos-medicinales/semillas-de-fenogreco": [40,43,58,195,196,207,216,312],
+    "semillas-y-frutos-secos-medicinales/cacahuete": [81,111,114,116,80,82,83,84],
+    "semillas-y-frutos-secos-medicinales/semillas-de-uva": [81,107,114,116,161,162,164,176],
+    "semillas-y-frutos-secos-medicinales/semillas-de-granada": [81,107,114,116,161,162,164,176],
+    "semillas-y-frutos-secos-medicinales/semillas-de-sandia": [111,117,271,283,270,272,273,274],
+    "semillas-y-frutos-secos-medicinales/semillas-de-melon": [49,50,176,178,179],
+    "semillas-y-frutos-secos-medicinales/semillas-de-loto": [43,44,45,48,65,274],
+    "semillas-y-frutos-secos-medicinales/semillas-de-nigella": [0,4,5,6,7,161,162,164],
+    "semillas-y-frutos-secos-medicinales/castana-de-indias": [107,80,81,82,83,84,85,86],
+    "semillas-y-frutos-secos-medicinales/semillas-de-psyllium": [44,47,40,41,42,43,45,46],
+    "semillas-y-frutos-secos-medicinales/semillas-de-cacao": [81,114,116,80,82,83,84,85],
+    "semillas-y-frutos-secos-medicinales/semillas-de-cafe": [120,121,122,123,124,125,126,127],
+    "semillas-y-frutos-secos-medicinales/semillas-de-guarana": [120,121,122,123,124,125,126,127],
+    "semillas-y-frutos-secos-medicinales/nuez-de-cola": [43,44,45,47,48,58,65],
+    "especias-medicinales/canela": [40,43,49,50,58,81,107,114],
+    "especias-medicinales/clavo": [42,58,40,41,43,44,45,46],
+    "especias-medicinales/pimienta-negra": [42,49,50,40,41,43,44,45],
+    "especias-medicinales/cardamomo": [0,1,27,28,39,42,43,53],
+    "especias-medicinales/nuez-moscada": [42,45,128,40,41,43,44,46],
+    "especias-medicinales/azafran": [120,121,122,123,124,125,126,127],
+    "especias-medicinales/fenogreco": [195,196,207,216,312,334],
+    "especias-medicinales/mostaza": [0,1,27,28,39,241,254],
+    "especias-medicinales/pimenton": [81,107,114,116,80,82,83,84],
+    "especias-medicinales/vainilla": [120,128,121,122,123,124,125,126],
+    "especias-medicinales/jengibre": [0,4,5,6,7,40,42,43],
+    "especias-medicinales/curcuma": [40,43,49,50,58,161,162,164],
+    "especias-medicinales/anís-estrellado": [0,1,20,21,22,23,24,25],
+    "especias-medicinales/comino": [42,49,50,40,41,43,44,45],
+    "especias-medicinales/cilantro": [42,49,50,40,41,43,44,45],
+    "especias-medicinales/hinojo": [0,1,27,28,39,42,53,57],
+    "especias-medicinales/laurel": [0,1,27,28,39,42,53,57],
+    "especias-medicinales/romero": [81,107,114,116,241],
+    "especias-medicinales/tomillo": [0,1,5,6,7,27,28,39],
+    "especias-medicinales/oregano": [1,22,23,25,26,49,50,176],
+    "especias-medicinales/albahaca": [120,125,161,162,164,188,189,190],
+    "especias-medicinales/menta": [42,43,65,40,41,44,45,46],
+    "especias-medicinales/salvia": [120,125,195,196,197,198,199,200],
+    "especias-medicinales/mejorana": [42,43,65,128,120,121,122,123],
+    "especias-medicinales/eneldo": [42,43,65,40,41,44,45,46],
+    "especias-medicinales/cayena": [42,45,107,230,241,248,249,251],
+    "especias-medicinales/wasabi": [0,4,5,6,7,20,24,40],
+    "especias-medicinales/galanga": [40,43,58,230,241,248,249,251],
+    "especias-medicinales/macis": [42,44,45,47,40,41,43,46],
+    "especias-medicinales/azafran-de-la-india": [40,43,49,50,58,161,162,164],
+    "especias-medicinales/pimienta-de-jamaica": [42,58,40,41,43,44,45,46],
+    "especias-medicinales/semillas-de-apio": [230,241,248,249,251,255,256,267],
+    "especias-medicinales/sumac": [161,162,164,176,178,188,189,190],
+    "especias-medicinales/regaliz": [0,1,4,5,6,7,27,28],
+    "especias-medicinales/enebro": [42,58,271,283,292],
+    "especias-medicinales/asafoetida": [0,1,27,28,39,42,43,53],
+    "especias-medicinales/pimienta-de-sichuan": [42,45,120,125,121,122,123,124],
+    "especias-medicinales/semillas-de-amapola": [120,125,128,230,241,248,249,251],
+    "especias-medicinales/semillas-de-nigella": [0,4,5,6,7,161,162,164],
+    "especias-medicinales/ajwain": [42,43,58,65,40,41,44,45],
+    "especias-medicinales/polvo-de-mango-seco": [42,40,41,43,44,45,46,47],
+    "especias-medicinales/semillas-de-granada": [81,107,114,116,161,162,164,176],
+    "especias-medicinales/haba-tonka": [128,120,121,122,123,124,125,126],
+    "especias-medicinales/pimienta-larga": [0,1,27,28,39,53,57,59],
+    "especias-medicinales/cubeba": [0,1,5,6,7,27,28,39],
+    "plantas-suculentas-y-cactus-medicinales/aloe-vera": [40,43,44,47,58,161,162,164],
+    "plantas-suculentas-y-cactus-medicinales/nopal": [40,42,43,49,50,58,81,107],
+    "plantas-suculentas-y-cactus-medicinales/pitaya": [40,42,43,49,50,58,81,107],
+    "plantas-suculentas-y-cactus-medicinales/siempreviva": [230,241,248,249,251,255,256,267],
+    "plantas-suculentas-y-cactus-medicinales/kalanchoe": [0,4,5,6,7,161,162,164],
+    "plantas-suculentas-y-cactus-medicinales/agave": [40,42,43,58,271,283,292],
+    "plantas-suculentas-y-cactus-medicinales/peyote": [120,125,399,400,401,402,403,404],
+    "plantas-suculentas-y-cactus-medicinales/sabila": [40,43,44,47,58,161,162,164],
+    "plantas-suculentas-y-cactus-medicinales/organo": [230,241,248,249,251,255,256,267],
+    "plantas-suculentas-y-cactus-medicinales/chumbera": [40,42,43,49,50,58,81,107],
+    "plantas-suculentas-y-cactus-medicinales/echeveria": [],
+    "plantas-suculentas-y-cactus-medicinales/sedum": [],
+    "plantas-suculentas-y-cactus-medicinales/yucca": [161,162,164,176,178,188,189,190],
+    "plantas-suculentas-y-cactus-medicinales/san-pedro": [120,125,399,400,401,402,403,404],
+    "plantas-suculentas-y-cactus-medicinales/fenestraria": [],
+    "plantas-suculentas-y-cactus-medicinales/lithops": [],
+    "plantas-suculentas-y-cactus-medicinales/gasteria": [],
+    "plantas-suculentas-y-cactus-medicinales/haworthia": [],
+    "plantas-suculentas-y-cactus-medicinales/crassula": [],
+    "plantas-suculentas-y-cactus-medicinales/senecio": [230,241,248,249,251,255,256,267],
+    "plantas-suculentas-y-cactus-medicinales/euphorbia": [161,188,189,160,162,163,164,165],
+    "plantas-suculentas-y-cactus-medicinales/stapelia": [230,241,248,249,251,255,256,267],
+    "plantas-suculentas-y-cactus-medicinales/hoodia": [195,196,197,198,199,200,201,202],
+    "plantas-suculentas-y-cactus-medicinales/caralluma": [195,196,197,198,199,200,201,202],
+    "plantas-suculentas-y-cactus-medicinales/opuntia-streptacantha": [40,42,43,58,230,241,248,249],
+    "plantas-adaptogenas/ginseng": [120,121,122,123,124,125,126,127],
+    "plantas-adaptogenas/ashwagandha": [120,125,161,162,164,188,189,190],
+    "plantas-adaptogenas/rhodiola": [120,121,122,123,124,125,126,127],
+    "plantas-adaptogenas/eleuterococo": [160,161,162,163,164,165,166,167],
+    "plantas-adaptogenas/schisandra": [49,50,176,178,40,41,42,43],
+    "plantas-adaptogenas/albahaca-sagrada": [0,4,5,6,7,120,125,161],
+    "plantas-adaptogenas/reishi": [107,120,125,161,162,164,188,189],
+    "plantas-adaptogenas/cordyceps": [0,1,2,3,4,5,6,7],
+    "plantas-adaptogenas/maca": [195,196,197,198,199,200,201,202],
+    "plantas-adaptogenas/astragalo": [107,161,162,164,188,189,190,271],
+    "plantas-adaptogenas/curcuma": [40,43,49,50,58,120,125,230],
+    "plantas-adaptogenas/jengibre": [40,43,58,230,241,248,249,251],
+    "plantas-adaptogenas/bacopa": [120,121,122,123,124,125,126,127],
+    "plantas-adaptogenas/gotu-kola": [120,121,122,123,124,125,126,127],
+    "plantas-adaptogenas/maitake": [160,161,162,163,164,165,166,167],
+    "plantas-adaptogenas/moringa": [40,43,49,50,58,81,107,114],
+    "plantas-adaptogenas/amla": [49,50,176,178,160,161,162,163],
+    "plantas-adaptogenas/una-de-gato": [161,162,164,188,189,190,230,241],
+    "plantas-adaptogenas/codonopsis": [160,161,162,163,164,165,166,167],
+    "plantas-adaptogenas/damiana": [120,128,274,121,122,123,124,125],
+    "plantas-adaptogenas/madreselva": [0,4,5,6,7,20,21,22],
+    "plantas-adaptogenas/musgo-de-irlanda": [0,1,27,28,39,40,42,53],
+    "plantas-adaptogenas/pasiflora": [128,399,411,422,425,438],
+    "plantas-adaptogenas/regaliz": [0,1,4,5,6,7,27,28],
+    "plantas-adaptogenas/albahaca": [40,43,49,50,58,120,125],
+    "plantas-adaptogenas/centella-asiatica": [120,121,122,123,124,125,126,127],
+    "plantas-adaptogenas/atractylodes": [42,58,271,283,292],
+    "plantas-adaptogenas/bala": [0,4,5,6,7,120,125,230],
+    "plantas-adaptogenas/brahmi": [120,121,122,123,124,125,126,127],
+    "plantas-adaptogenas/guduchi": [0,4,5,6,7,40,43,58],
+    "plantas-adaptogenas/chaga": [40,43,49,50,58,161,162,164],
+    "plantas-adaptogenas/ginseng-americano": [120,121,122,123,124,125,126,127],
+    "plantas-adaptogenas/shatavari": [42,45,65,162,164,188],
+    "plantas-adaptogenas/tribulus": [241,274,300,301,302,303,304,305],
+    "plantas-adaptogenas/ginkgo-biloba": [81,114,116,120,121,122,123,124],
+  },
+};
@@ -0,0 +1,15 @@
+// Pócima Salvage - Catálogo compacto (cadenas internadas, ver data/compacto.ts)
+// Generado automáticamente por scripts/build-compact-catalog.py - no editar a mano
+
+import type { SistemaCorporal } from './enfermedades-expandidas';
+import { decodificarEnfermedades } from './compacto';
+
+const datos = '{"v":1,"campos":[["id","s"],["nombre","s"],["otrosNombres","l"],["descripcion","s"],["sintomas","l"],["causas","l"]],"cadenas":["Fiebre","Fatiga","Factores genéticos","Predisposición genética","Dificultad para respirar","Náuseas y vómitos","Tabaquismo","Dolor en el pecho","Presión arterial alta","Pérdida de peso inexplicable","Pérdida de peso","Obesidad","Diabetes","Dolor de garganta","Sistema inmunitario debilitado","Factores genéticos y hereditarios","Dificultad para tragar","Fatiga y debilidad","Diarrea","Combinación de factores genéticos y ambientales","Debilidad muscular","Náuseas","Dolor abdominal","Fatiga extrema","Enfermedades autoinmunes","Falta de aliento","Pérdida de apetito","Factores ambientales","Ciertos medicamentos","Envejecimiento","Respuesta autoinmune","Tos seca","Trastorno genético hereditario","Tos","Hinchazón","Dolor de espalda","Fiebre y escalofríos","Embarazo","Deshidratación","Infecciones","Visión borrosa","Convulsiones","Debilidad muscular progresiva","Dolores de cabeza","Sangre en la orina","Dolor de cabeza","Consumo excesivo de alcohol","Estreñimiento","Infecciones virales o bacterianas","Ictericia","Edad avanzada","Mareos","","Estilo de vida sedentario","Lupus","Antecedentes familiares","Dolor en las articulaciones","Alergias","Causa desconocida","Períodos menstruales irregulares o ausentes","Cálculos renales","Necesidad frecuente de orinar","Dolor durante las relaciones sexuales","Fiebre baja","Infecciones bacterianas","Ronquera","Acidez estomacal","Falta de ejercicio","Cálculos biliares","Hinchazón abdominal","Infección","Ansiedad","Sudores nocturnos","Dolor e hinchazón en las articulaciones","Dificultad para caminar","Problemas de visión","Hernia de disco","Postura encorvada","Reacción autoinmune","Bocio","Factores genéticos y ambientales","Resistencia a la insulina","Infertilidad","Orina espumosa","Endometriosis","Malestar clínicamente significativo","Falta de aire","Opresión en el pecho","Infecciones virales (resfriado, gripe)","Sibilancias","Laringitis","Reflujo gastroesofágico","Pérdida de peso involuntaria","apnea-del-sueno","Ronquidos fuertes","Pausas en la respiración durante el sueño","Despertar abrupto con falta de aire","Somnolencia diurna excesiva","Dolor de cabeza matutino","Obstrucción de las vías respiratorias superiores durante el sueño","Obesidad y exceso de tejido en la garganta","Anatomía de las vías respiratorias","Tos con sangre","Mareo o desmayo","Mal aliento","sarcoidosis","Sarcoidosis","Tos seca persistente","Lesiones cutáneas dolorosas","Crecimiento de pequeñas acumulaciones de células inflamatorias (granulomas) en diferentes partes del cuerpo","Causa desconocida, posiblemente una respuesta inmunitaria a una sustancia desconocida","Estornudos","Congestión nasal","Dificultad para respirar o tragar","Anemia","Vómitos","Infección por Helicobacter pylori","Estrés","Necesidad urgente de defecar","Enfermedad de Crohn","Calambres abdominales","Sangrado rectal","Infecciones de transmisión sexual (ITS)","Diarrea crónica","Infecciones virales","Linfangiectasia intestinal","Tumores","Aterosclerosis","Hipotiroidismo","Aumento de la sed y la micción","Lupus Eritematoso Sistémico","Estrés y ansiedad","Lesión cerebral traumática","Esclerosis múltiple","EM","Espasmos musculares","Enfermedad de Meniere","Pérdida de audición","Zumbido en los oídos (tinnitus)","Lumbalgia","Artritis","Malas posturas","Dolor articular","Respuesta anormal del sistema inmunitario","Rigidez articular","Voz ronca","Antecedentes familiares de la enfermedad","Picazón intensa","Factores genéticos y antecedentes familiares","Osteoporosis","Pérdida de estatura con el tiempo","Dolor o ardor al orinar","Obstrucción del tracto urinario","Incontinencia urinaria","Dolor pélvico crónico","Dolor al orinar","Exposición al sol","Dolor","Desequilibrios químicos en el cerebro","Abuso de sustancias","Tos persistente","Neumonía","Fiebre alta y escalofríos","Infección por hongos","Dificultad para respirar (disnea)","rinitis-alergica","Rinitis Alérgica","Fiebre del heno","Estornudos frecuentes","Picazón en nariz, ojos, garganta y paladar","Congestión y secreción nasal acuosa","Ojos llorosos y enrojecidos","Reacción del sistema inmunitario a alérgenos aéreos","Polen de árboles, pasto y malezas","Ácaros del polvo, moho y caspa de animales","sinusitis","Sinusitis","Infección de los senos paranasales","Dolor y presión facial (alrededor de ojos, nariz y frente)","Congestión y secreción nasal espesa (amarilla o verde)","Pérdida del sentido del olfato y el gusto","Tos que empeora por la noche","Mal aliento (halitosis)","Infección viral (resfriado común)","Infección bacteriana secundaria","Alergias que causan inflamación","Pólipos nasales o tabique desviado","faringitis","Faringitis","Dolor o carraspera en la garganta","Enrojecimiento de la garganta","Ganglios linfáticos del cuello inflamados","Infección bacteriana (estreptococo)","Irritantes como el humo o el aire muy seco","laringitis","Inflamación de la laringe","Ronquera o pérdida de la voz","Sensación de cosquilleo o irritación en la garganta","Infección viral (similar a un resfriado)","Uso excesivo de la voz (gritar, cantar)","Irritación por humo o alérgenos","Sonido agudo al inspirar (estridor)","Tuberculosis","Tos seca y persistente","Apnea del Sueño","embolia-pulmonar","Embolia Pulmonar","Tromboembolismo pulmonar","Dificultad para respirar de aparición súbita","Dolor agudo en el pecho","Latidos cardíacos rápidos","Coágulo de sangre que viaja a los pulmones, generalmente desde una TVP","Inmovilidad prolongada","Cirugía reciente","Factores genéticos de coagulación","hipertension-pulmonar","Hipertensión Pulmonar","Presión arterial alta en los pulmones","Falta de aliento, inicialmente con el ejercicio y luego en reposo","Hinchazón en tobillos y piernas","Coloración azulada en labios y piel (cianosis)","Enfermedades cardíacas o pulmonares subyacentes","Coágulos de sangre en los pulmones","Causas idiopáticas (desconocidas)","Uso de ciertas drogas o toxinas","Cáncer de pulmón","Embolia pulmonar","Coloración azulada de la piel (cianosis)","Bronquiectasia","Fibrosis quística","Enfermedad inflamatoria que afecta a múltiples órganos del cuerpo, pero más comúnmente a los pulmones y los ganglios linfáticos.","Goteo y congestión nasal","Respiración rápida y superficial","Anemia severa","Dificultad para respirar progresiva","Sensación de llenura","Consumo de alcohol","Hernia de hiato","Dolor y calambres abdominales","Dolor rectal","Disfunción del sistema inmunitario","Gases","Dieta baja en fibra","Intoxicación alimentaria","Efectos secundarios de medicamentos","Hinchazón en las piernas","Enfermedad del hígado graso no alcohólico","enfermedad-celiaca","Enfermedad Celíaca","Enteropatía sensible al gluten","Reacción inmunitaria al comer gluten, una proteína que se encuentra en el trigo, la cebada y el centeno.","Hinchazón y gases","Reacción inmunitaria al gluten","Diverticulitis","Náuseas o vómitos","Dolor al tragar","Accidente cerebrovascular","Anemia por deficiencia de hierro","Dieta rica en grasas y baja en fibra","Tabaquismo y consumo de alcohol","Dificultad para tragar (disfagia)","Cirrosis hepática","Escalofríos","Zumbido en los oídos","Ateroesclerosis","Dificultad para hablar","Latidos cardíacos irregulares","Mareos o aturdimiento","Debilidad y fatiga","Hipertensión arterial crónica","Enfermedad de las arterias coronarias","Mareos o desmayos","Taquicardia","Infección viral","Cardiomiopatía","Hipertensión arterial","Ictus","Fibrilación auricular","Venas varicosas","Factores hereditarios","linfedema","Linfedema","Obstrucción linfática","Hinchazón de brazos o piernas","Sensación de pesadez o rigidez","Amplitud de movimiento restringida","Infecciones recurrentes","Endurecimiento y engrosamiento de la piel (fibrosis)","Extirpación o daño de los ganglios linfáticos como parte del tratamiento oncológico","Infecciones que afectan los vasos linfáticos","Condiciones genéticas que afectan el desarrollo del sistema linfático","Traumatismos o lesiones que dañan el sistema linfático","Fatiga persistente","Infecciones frecuentes","obesidad","Índice de Masa Corporal (IMC) de 30 o superior","Acumulación excesiva de grasa corporal","Dolor en articulaciones y espalda","Desequilibrio entre la ingesta y el gasto de calorías","Factores genéticos y metabólicos","Factores psicológicos y ambientales","lupus-eritematoso-sistemico","LES","Erupción en forma de mariposa en el rostro","Sensibilidad al sol","Enfermedad autoinmune donde el cuerpo ataca sus propios tejidos","🧠","Cambios hormonales","Trastornos genéticos","Parkinson","Rigidez muscular","Enfermedad en la que el sistema inmunológico degrada la cubierta protectora de los nervios.","Dolor neuropático","Compresión de un nervio","Vértigo","Mareo","Movimientos oculares anormales (nistagmo)","Tumor cerebral","Exposición a la radiación","Dificultad para hablar y tragar","Causas desconocidas en la mayoría de los casos","Trastornos del sueño","Espasticidad","Feocromocitoma","Insuficiencia suprarrenal","Trastorno genético ligado al cromosoma X","laberintitis","Laberintitis","Vértigo severo","Infección viral o bacteriana del oído interno","Reactivación de un virus latente","Ataxia","Causa exacta desconocida","Retraso del crecimiento","dolor-de-espalda","Dolor muscular o punzante en la espalda","Dolor que se irradia hacia la pierna","Movilidad limitada o rigidez de la espalda","Dolor que empeora al estar de pie o sentado","Tensión muscular o de ligamentos","artritis-reumatoide","Artritis Reumatoide","Poliartritis crónica","Trastorno inflamatorio crónico que puede afectar más que solo las articulaciones.","Hinchazón de las articulaciones","Factores ambientales como infecciones virales o bacterianas","psoriasis","Psoriasis","Placas rojas cubiertas de escamas plateadas","Picazón, ardor o dolor en las lesiones","Piel seca y agrietada que puede sangrar","Uñas engrosadas, picadas o estriadas","Enfermedad autoinmune que acelera el ciclo de vida de las células de la piel","Desencadenantes como infecciones, estrés o ciertos medicamentos","vitiligo","Pérdida de pigmento que resulta en manchas blancas en la piel","Aparición de canas prematuras en cabello, pestañas o cejas","Las manchas pueden crecer o extenderse con el tiempo","Enfermedad autoinmune en la que el sistema inmunitario ataca a los melanocitos","Eventos desencadenantes como estrés, quemaduras solares graves o exposición a químicos","Urticaria","esclerosis-multiple","Entumecimiento o debilidad en una o más extremidades","Problemas de equilibrio y coordinación","Enfermedad autoinmune que ataca la mielina del sistema nervioso central","enfermedad-de-graves","Enfermedad de Graves","Bocio difuso tóxico","Ansiedad e irritabilidad","Temblores en manos o dedos","Bocio (agrandamiento de la tiroides)","Ojos saltones (exoftalmos)","Trastorno autoinmune que causa sobreproducción de hormonas tiroideas","Factores como el estrés o el embarazo","tiroiditis-de-hashimoto","Tiroiditis de Hashimoto","Tiroiditis linfocítica crónica","Fatiga y pereza","Aumento de la sensibilidad al frío","Piel pálida y seca","Ataque del sistema inmunitario a la glándula tiroides","enfermedad-de-addison","Enfermedad de Addison","Pérdida de peso y disminución del apetito","Hiperpigmentación (oscurecimiento de la piel)","Presión arterial baja","Deseo de sal","Daño a las glándulas suprarrenales (insuficiencia suprarrenal primaria)","Infecciones como la tuberculosis","Visión doble","esclerodermia","Esclerodermia","Esclerosis sistémica","Endurecimiento y estiramiento de la piel","Fenómeno de Raynaud (dedos de manos y pies que se vuelven blancos, azules o rojos en respuesta al frío)","Reflujo ácido y problemas para tragar","Problemas pulmonares, cardíacos o renales","Sobreproducción y acumulación de colágeno en el cuerpo","Dolor muscular","Diabetes insulinodependiente","Aumento del apetito","Cansancio extremo","Cansancio","alopecia-areata","Pérdida de cabello en parches redondos u ovalados","Puede afectar el cuero cabelludo, cejas, pestañas y barba","Piel lisa y sin cicatrices en las áreas de calvicie","En casos raros, puede progresar a la pérdida total del cabello (alopecia totalis)","Enfermedad autoinmune donde el sistema inmunitario ataca los folículos pilosos","El estrés severo puede actuar como desencadenante","Trastorno autoinmune","artritis-psoriasica","Dolor, hinchazón y rigidez en las articulaciones","Dedos de manos y pies hinchados (dactilitis)","Dolor en los puntos donde los tendones y ligamentos se unen al hueso (entesitis)","Lesiones cutáneas de psoriasis","Antecedentes de psoriasis","Enrojecimiento del ojo","Uso de ciertos medicamentos","liquen-plano","Afección inflamatoria que puede afectar la piel, el cabello, las uñas y las membranas mucosas.","Pequeñas protuberancias planas, de color púrpura y con picazón","Aparecen en muñecas, tobillos, espalda baja y genitales","Líneas blancas finas en las protuberancias (estrías de Wickham)","Puede afectar las mucosas (boca) y las uñas","Reacción autoinmune o inflamatoria de causa desconocida","Puede ser desencadenado por infecciones (hepatitis C), alérgenos o medicamentos","El estrés puede exacerbar los brotes","🧬","Deficiencia de yodo","sindrome-de-ovario-poliquistico","Exceso de vello facial y corporal (hirsutismo)","Acné severo y piel grasa","Aumento de peso y dificultad para perderlo","Quistes en los ovarios","Desequilibrio hormonal con altos niveles de andrógenos","Inflamación crónica de bajo grado","Generalmente causado por un tumor benigno en la glándula pituitaria","Deficiencia de la hormona del crecimiento","osteoporosis","Enfermedad que debilita los huesos, haciéndolos frágiles y más propensos a fracturarse.","Fracturas óseas que ocurren con más facilidad de lo esperado","Deficiencia de estrógeno en mujeres menopáusicas","Bajos niveles de testosterona en hombres","Hiperparatiroidismo","diabetes-insipida","Diabetes Insípida","Sed extrema (polidipsia)","Producción de grandes volúmenes de orina diluida (poliuria)","Necesidad de orinar durante la noche (nocturia)","Daño a la glándula pituitaria o al hipotálamo, afectando la producción de ADH","Incapacidad de los riñones para responder a la ADH","Disminución del deseo sexual","Acné","Aparición temprana de vello púbico y axilar","Mutaciones genéticas hereditarias","Dolor óseo","Dificultad para tragar o respirar","Deficiencia de vitamina D","Fatiga muscular","Mutaciones genéticas","Reacción a un medicamento","Exposición a ciertos productos químicos","Hinchazón y hematomas","Artrosis","Estenosis espinal","Escoliosis","Artritis reumatoide","Pérdida de flexibilidad","Lesiones articulares previas","💧","Orina turbia o con mal olor","Sensación de ardor al orinar","Complicaciones de otras enfermedades","Disminución del volumen de orina","Hinchazón en las piernas y los pies","Ardor al orinar","Aumento de peso por retención de líquidos","Daño a los glomérulos renales","Infecciones urinarias frecuentes","Agrandamiento de la próstata","cistitis-intersticial","Cistitis Intersticial","Síndrome de la vejiga dolorosa","Necesidad urgente y frecuente de orinar","Posiblemente autoinmune","Defecto en el revestimiento de la vejiga","Infecciones urinarias recurrentes","Infecciones urinarias","Genética","Palidez","Tener múltiples parejas sexuales","Fumar","Necesidad de orinar con frecuencia, especialmente por la noche","Dificultad para comenzar a orinar","Sensación de pesadez en el escroto","Fiebre y malestar general","A menudo es asintomática","Relaciones sexuales vaginales, anales u orales sin protección con una persona infectada","Consumo de alcohol y tabaco","Piel grasa","Sudoración excesiva","Sobrepeso","Picazón leve","Mutaciones genéticas somáticas","Telangiectasias","Linfoma","Quilotórax","amigdalitis","Amigdalitis","Infección de las amígdalas","Anginas","Dolor de garganta intenso","Amígdalas rojas e hinchadas, a veces con placas de pus","Dificultad o dolor al tragar","Infección viral (causa más común)","Infección bacteriana (generalmente estreptococo del grupo A)","Esplenomegalia","Dificultad para concentrarse","Factores genéticos y biológicos","Aislamiento social","Baja autoestima","Deterioro funcional","Infección del oído medio","Pólipos nasales","Hipermetropía","Ojos bizcos","Sensibilidad a la luz","Inflamación del nervio vestibular","sistema-respiratorio","Sistema Respiratorio","🫁","asma","Asma","Asma bronquial","Enfermedad crónica que causa inflamación y estrechamiento de las vías respiratorias.","Sibilancias al exhalar","Alergias (polen, ácaros, caspa de animales)","Infecciones respiratorias","Ejercicio físico","Exposición a irritantes (humo, contaminación)","bronquitis-aguda","Bronquitis Aguda","Resfriado de pecho","Inflamación de los conductos bronquiales, generalmente causada por una infección.","Tos con mucosidad","Molestia en el pecho","Exposición a irritantes (humo de tabaco, polvo)","neumonia","Pulmonía","Infección que inflama los sacos de aire en uno o ambos pulmones.","Tos con flema verdosa o amarillenta","Dolor en el pecho al respirar","Infección por bacterias (Streptococcus pneumoniae)","Infección por virus (gripe, COVID-19)","Aspiración de alimentos o líquidos","epoc","Enfermedad Pulmonar Obstructiva Crónica (EPOC)","EPOC","Enfermedad pulmonar inflamatoria crónica que causa la obstrucción del flujo de aire de los pulmones.","Tos crónica con flema","Infecciones respiratorias frecuentes","Tabaquismo (principal causa)","Exposición prolongada a humos y polvos irritantes","Deficiencia de alfa-1 antitripsina (factor genético)","Reacción alérgica que provoca estornudos, congestión y picazón en la nariz.","Inflamación de las cavidades alrededor de las fosas nasales.","Inflamación de la faringe, que se encuentra en la parte posterior de la garganta.","Inflamación de la laringe por uso excesivo, irritación o infección.","traqueitis","Traqueítis","Infección de la tráquea","Infección bacteriana de la tráquea que puede causar obstrucción de las vías respiratorias.","Tos profunda y áspera","Fiebre alta","Infección bacteriana, a menudo secundaria a una infección viral","Lesión en la tráquea","tuberculosis","TB","Enfermedad infecciosa que suele afectar a los pulmones.","Tos crónica que dura más de 3 semanas","Tos con sangre o esputo","Fiebre y sudores nocturnos","Infección por la bacteria Mycobacterium tuberculosis","Transmisión por gotitas en el aire de una persona infectada","fibrosis-pulmonar","Fibrosis Pulmonar","Cicatrización de los pulmones","Enfermedad pulmonar que se produce cuando el tejido pulmonar se daña y se cicatriza.","Dificultad para respirar (disnea) progresiva","Pérdida de apetito y de peso","Acropaquia (dedos en palillo de tambor)","Causa desconocida (idiopática) en la mayoría de los casos","Exposición a polvos nocivos (asbesto, sílice)","Síndrome de apnea del sueño","Trastorno del sueño potencialmente grave en el que la respiración se detiene y recomienza repetidamente.","cancer-de-pulmon","Cáncer de Pulmón","Carcinoma de pulmón","Cáncer que comienza en los pulmones y que con mayor frecuencia ocurre en personas que fuman.","Tos persistente que no desaparece","Tos con sangre (hemoptisis)","Tabaquismo (principal factor de riesgo)","Exposición al humo de segunda mano","Exposición a sustancias cancerígenas (asbesto, radón)","Antecedentes familiares de cáncer de pulmón","Bloqueo en una de las arterias pulmonares en los pulmones.","Tipo de presión arterial alta que afecta las arterias de los pulmones y el lado derecho del corazón.","derrame-pleural","Derrame Pleural","Agua en los pulmones","Acumulación de líquido en el espacio entre las capas de la pleura.","Dolor en el pecho que empeora al toser o respirar profundo","Hipo","Acumulación de líquido en el espacio pleural","Insuficiencia cardíaca congestiva","neumotorax","Neumotórax","Pulmón colapsado","Un pulmón colapsado ocurre cuando el aire se filtra en el espacio entre el pulmón y la pared torácica.","Dolor agudo y repentino en el pecho","Sensación de opresión en el pecho","Lesión torácica penetrante o cerrada","Ruptura de una bulla (pequeña saca de aire) en el pulmón","Enfermedades pulmonares subyacentes (EPOC, asma)","Cambios de presión atmosférica (buceo, montañismo)","bronquiectasia","Dilatación bronquial","Afección en la que las vías respiratorias de los pulmones se ensanchan de forma permanente.","Tos crónica con grandes cantidades de esputo","Infecciones respiratorias recurrentes","Daño e ensanchamiento irreversible de las vías respiratorias","Infecciones pulmonares graves o recurrentes (neumonía, tuberculosis)","fibrosis-quistica","Fibrosis Quística","Mucoviscidosis","Trastorno hereditario que causa daños graves en los pulmones, el sistema digestivo y otros órganos del cuerpo.","Tos persistente con mucosidad espesa","Infecciones pulmonares frecuentes","Dificultad para respirar y sibilancias","Poco aumento de peso y crecimiento deficiente","Heces grasosas y voluminosas","Mutación en el gen CFTR que regula el movimiento de sal y agua","Producción de moco espeso y pegajoso en varios órganos","resfriado-comun","Resfriado Común","Catarro","Infección viral de la nariz y la garganta (vías respiratorias superiores).","Tos leve","Infección por rinovirus (más común)","Contacto con gotitas respiratorias de una persona infectada","Tocarse los ojos, la nariz o la boca con las manos contaminadas","gripe","Gripe","Influenza","Enfermedad respiratoria contagiosa provocada por los virus de la influenza.","Fiebre alta de inicio súbito","Dolores musculares y corporales intensos","Fatiga y debilidad extremas","Infección por el virus de la influenza (tipos A, B y C)","Transmisión a través de gotitas respiratorias al toser o estornudar","Contacto con superficies contaminadas","virus-sincitial-respiratorio","Virus Sincitial Respiratorio","VSR","Virus común que causa infecciones de los pulmones y las vías respiratorias.","Congestión nasal y moqueo","Dificultad para respirar y sibilancias (en casos graves)","Poco apetito","Infección por el virus sincitial respiratorio (VSR)","Causa común de bronquiolitis y neumonía en bebés","Altamente contagioso a través del contacto directo y gotitas","adenovirus","Adenovirus","Grupo de virus que pueden causar infecciones en las vías respiratorias, los ojos, los intestinos y el tracto urinario.","Síntomas de resfriado o gripe","Conjuntivitis (ojo rojo)","Diarrea y vómitos (en algunos serotipos)","Infección por uno de los muchos tipos de adenovirus","Transmisión por contacto personal, gotitas respiratorias o agua contaminada","rinovirus","Rinovirus","La causa más común del resfriado común.","Principal causa del resfriado común","Infección por más de 100 serotipos de rinovirus","Transmisión por contacto directo y gotitas respiratorias","parainfluenza","Parainfluenza","Grupo de virus que causan infecciones de las vías respiratorias superiores e inferiores.","Tos perruna (crup)","Goteo nasal","Infección por virus de la parainfluenza humana (HPIV)","Causa común de crup en niños pequeños","Transmisión por gotitas respiratorias","metapneumovirus","Metapneumovirus","Virus que causa infecciones de las vías respiratorias superiores e inferiores.","Infección por metaneumovirus humano (HMPV)","Puede causar bronquiolitis y neumonía","Similar al virus sincitial respiratorio (VSR)","crup","Crup","Laringotraqueobronquitis","Infección de las vías respiratorias superiores que obstruye la respiración y causa una tos perruna característica.","Tos perruna característica","Ronquera y dificultad para hablar","Síntomas de resfriado","Infección viral que inflama la laringe y la tráquea","Virus de la parainfluenza (causa más común)","Otros virus como el VSR, adenovirus e influenza","tos-ferina","Tos Ferina","Pertussis","Infección de las vías respiratorias altamente contagiosa.","Tos violenta en accesos rápidos e incontrolables","Sonido agudo al inhalar después de toser (gallo)","Vómitos durante o después de los ataques de tos","Apnea (pausas en la respiración) en bebés","Infección por la bacteria Bordetella pertussis","Altamente contagiosa a través de gotitas respiratorias","Falta de vacunación o inmunidad disminuida","difteria","Difteria","Infección bacteriana grave que puede afectar las membranas mucosas de la nariz y la garganta.","Membrana gruesa y gris en la garganta y amígdalas","Dolor de garganta y ronquera","Ganglios del cuello inflamados","Infección por la bacteria Corynebacterium diphtheriae","La bacteria produce una toxina que daña los tejidos","Transmisión por contacto directo o gotitas respiratorias","edema-pulmonar","Edema Pulmonar","Afección causada por un exceso de líquido en los pulmones.","Dificultad extrema para respirar, que empeora al acostarse","Sensación de ahogo o asfixia","Tos con esputo espumoso y rosado","Sibilancias y jadeos","Ansiedad e inquietud","Acumulación de exceso de líquido en los alvéolos pulmonares","Insuficiencia cardíaca congestiva (causa más común)","Ataque cardíaco","Neumonía grave o SDRA","sindrome-de-dificultad-respiratoria-aguda","Síndrome de Dificultad Respiratoria Aguda","SDRA","Afección pulmonar grave que causa niveles bajos de oxígeno en la sangre.","Dificultad respiratoria grave y de rápida aparición","Coloración azulada de la piel y los labios (cianosis)","Confusión y fatiga extrema","Fuga de líquido de los vasos sanguíneos a los alvéolos","Sepsis (infección grave en la sangre)","Neumonía grave","Traumatismo torácico grave","Aspiración de contenido gástrico","atelectasia","Atelectasia","Colapso completo o parcial de todo el pulmón o de una parte (lóbulo) del pulmón.","Dificultad para respirar (si es extensa)","Colapso de una parte o de todo el pulmón","Obstrucción de un bronquio (tapón mucoso, tumor)","Anestesia general (complicación postoperatoria)","Derrame pleural grande","hemoptisis","Hemoptisis","Toser sangre","Expulsión de sangre o esputo con sangre de los pulmones o las vías respiratorias.","Expectoración de sangre o esputo con sangre","Bronquitis o neumonía","disnea","Disnea","Sensación de falta de aliento o dificultad para respirar.","Sensación subjetiva de falta de aire","Respiración difícil o incómoda","Sensación de no poder obtener suficiente aire","Enfermedades pulmonares (asma, EPOC)","Enfermedades cardíacas (insuficiencia cardíaca)","Ansiedad o ataques de pánico","hipoxia","Hipoxia","Bajo nivel de oxígeno en la sangre","Condición en la que el cuerpo o una región del cuerpo se ve privada de un suministro adecuado de oxígeno a nivel tisular.","Confusión y desorientación","Respiración rápida (taquipnea)","Frecuencia cardíaca rápida (taquicardia)","Nivel bajo de oxígeno en los tejidos corporales","Hipoxemia (bajo oxígeno en sangre)","Altitud elevada","Enfermedades pulmonares o cardíacas graves","mesotelioma","Mesotelioma","Tipo de cáncer que se desarrolla a partir de la delgada capa de tejido que cubre muchos de los órganos internos.","Dolor en el pecho o abdomen","Tos dolorosa","Exposición al asbesto (amianto)","Inhalación de fibras de asbesto que se alojan en el revestimiento de los pulmones o el abdomen","aspergilosis","Aspergilosis","Infección causada por un tipo de moho (hongo).","Tos (a veces con sangre o mucosidad)","Infección por el hongo Aspergillus","Inhalación de esporas del hongo presentes en el ambiente (suelo, polvo, vegetación en descomposición)","silicosis","Silicosis","Enfermedad pulmonar causada por la inhalación de polvo de sílice.","Dificultad para respirar que empeora con el tiempo","Tos crónica y persistente","Inhalación prolongada de polvo de sílice cristalina","Exposición ocupacional (minería, construcción, cantería)","asbestosis","Asbestosis","Enfermedad pulmonar crónica causada por la inhalación de fibras de asbesto.","Dolor u opresión en el pecho","Dedos en palillo de tambor (acropaquia)","Inhalación prolongada de fibras de asbesto","Cicatrización del tejido pulmonar debido a las fibras de asbesto","Exposición ocupacional en industrias como la construcción y la naval","sistema-digestivo","Sistema Digestivo","🍔","gastritis","Gastritis","Inflamación del estómago","Inflamación del revestimiento del estómago.","Malestar o dolor en la parte superior del abdomen","Consumo de AINEs","ulcera-peptica","Úlcera Péptica","Úlcera de estómago","Úlcera duodenal","Llaga abierta en el revestimiento del estómago o el duodeno.","Dolor ardiente en el estómago","Intolerancia a los alimentos grasos","Uso prolongado de AINEs","reflujo-gastroesofagico","Enfermedad por Reflujo Gastroesofágico (ERGE)","Reflujo ácido","El ácido del estómago fluye hacia el esófago, causando irritación.","Regurgitación de alimentos o líquido agrio","colitis-ulcerosa","Colitis Ulcerosa","CU","Enfermedad inflamatoria intestinal que causa inflamación y úlceras en el tracto digestivo.","Diarrea con sangre o pus","sindrome-del-intestino-irritable","Síndrome del Intestino Irritable (SII)","Colon irritable","Trastorno que afecta al intestino grueso, causando calambres, dolor abdominal, hinchazón, gases y diarrea o estreñimiento.","Calambres","Diarrea o estreñimiento","Contracciones musculares en el intestino","Anomalías en el sistema nervioso","Inflamación intestinal","Infección grave","enfermedad-de-crohn","Enfermedad inflamatoria intestinal que causa inflamación del tracto digestivo, que puede provocar dolor abdominal, diarrea intensa, fatiga, pérdida de peso y desnutrición.","Sangre en las heces","hemorroides","Hemorroides","Almorranas","Venas hinchadas en el ano y la parte inferior del recto, similares a las venas varicosas.","Sangrado indoloro durante la defecación","Picazón o irritación en la región anal","Dolor o molestia","Hinchazón alrededor del ano","Esfuerzo durante la defecación","Estreñimiento crónico o diarrea","Permanecer sentado por largos períodos","estrenimiento","Afección en la que una persona tiene deposiciones infrecuentes o dificultad para defecar.","Menos de tres evacuaciones por semana","Heces duras o grumosas","Esfuerzo para defecar","Sensación de obstrucción rectal","diarrea","Heces blandas y líquidas con más frecuencia de lo habitual.","Heces blandas y líquidas","Intolerancias alimentarias","hepatitis","Hepatitis","Inflamación del hígado","Inflamación del hígado, generalmente causada por una infección viral.","Orina oscura","Infecciones virales (Hepatitis A, B, C, D, E)","cirrosis-hepatica","Cirrosis Hepática","Enfermedad hepática en etapa terminal","Cicatrización tardía (fibrosis) del hígado causada por diversas formas de enfermedades hepáticas y otras afecciones.","Consumo crónico de alcohol","Hepatitis viral crónica (B y C)","pancreatitis","Pancreatitis","Inflamación del páncreas","Inflamación del páncreas.","Dolor en la parte superior del abdomen que se irradia a la espalda","Pulso rápido","Alcoholismo","Niveles altos de triglicéridos","intolerancia-a-la-lactosa","Intolerancia a la lactosa","Incapacidad para digerir completamente el azúcar (lactosa) en los productos lácteos.","Cólicos estomacales","Deficiencia de lactasa","Lesión en el intestino delgado","Enfermedad celíaca","diverticulosis","Diverticulosis","Afección en la que se forman pequeñas bolsas o sacos en la pared del colon.","Estreñimiento o diarrea","diverticulitis","Inflamación o infección de una o más bolsas (divertículos) en la pared del colon.","Dolor abdominal intenso","Cambios en los hábitos intestinales","Inflamación de los divertículos","Infección de los divertículos","apendicitis","Apendicitis","Inflamación del apéndice, una bolsa en forma de dedo que se proyecta desde el colon en el lado inferior derecho del abdomen.","Dolor en la parte inferior derecha del abdomen","Obstrucción del apéndice","calculos-biliares","Colelitiasis","Depósitos duros de líquido digestivo que pueden formarse en la vesícula biliar.","Dolor repentino e intenso en la parte superior derecha del abdomen","Dolor de espalda entre los omóplatos","Dolor en el hombro derecho","Bilis con demasiado colesterol","Bilis con demasiada bilirrubina","Vesícula biliar que no se vacía correctamente","colecistitis","Colecistitis","Inflamación de la vesícula biliar","Inflamación de la vesícula biliar, un pequeño órgano en forma de pera en el lado derecho del abdomen, debajo del hígado.","Dolor intenso en la parte superior derecha o central del abdomen","Dolor que se extiende al hombro derecho o a la espalda","Sensibilidad abdominal al tacto","Tumor","Obstrucción de las vías biliares","disfagia","Disfagia","Dificultad para tragar alimentos o líquidos, que surge de la garganta o el esófago.","Incapacidad para tragar","Sensación de que la comida se atasca en la garganta o el pecho","Babeo","Lesión en la cabeza o la médula espinal","Ciertos tipos de cáncer","Enfermedad de Parkinson","indigestion","Indigestión","Dispepsia","Malestar en la parte superior del abdomen, descrito como ardor, hinchazón o gases, náuseas o sensación de saciedad demasiado rápido después de comenzar a comer.","Dolor o ardor en la parte superior del abdomen","Sensación de saciedad temprana durante una comida","Comer en exceso o demasiado rápido","Alimentos grasos o picantes","gastroenteritis","Gastroenteritis","Gripe estomacal","Inflamación del revestimiento de los intestinos causada por un virus, una bacteria o parásitos.","Diarrea acuosa","Infecciones virales (norovirus, rotavirus)","Infecciones bacterianas (E. coli, salmonela)","hernia-de-hiato","Afección en la que la parte superior del estómago se abulta a través del diafragma hacia la cavidad torácica.","Regurgitación de alimentos o líquidos a la boca","Dolor en el pecho o el abdomen","Aumento de la presión en el abdomen","Tos o estornudos crónicos","proctitis","Proctitis","Inflamación del revestimiento del recto.","Sensación de necesidad de defecar","Secreción de moco por el recto","Enfermedad inflamatoria intestinal (EII)","Radioterapia para el cáncer","fisura-anal","Fisura anal","Pequeño desgarro en el tejido delgado y húmedo que recubre el ano.","Dolor agudo durante la defecación","Sangre roja brillante en las heces o el papel higiénico","Picazón o irritación alrededor del ano","Heces grandes o duras","Estreñimiento y esfuerzo al defecar","incontinencia-fecal","Incontinencia fecal","Incapacidad para controlar las deposiciones, lo que provoca que las heces (materia fecal) se filtren inesperadamente del recto.","Pérdida involuntaria de heces líquidas o sólidas","Incapacidad para controlar los gases","Manchado de la ropa interior","Daño muscular o nervioso en el ano o el recto","Diarrea o estreñimiento crónicos","Pérdida de elasticidad en el recto","polipos-de-colon","Pólipos de colon","Pequeño grupo de células que se forma en el revestimiento del colon.","Cambio en los hábitos intestinales","cancer-de-colon","Cáncer de colon","Cáncer colorrectal","Tipo de cáncer que comienza en el intestino grueso (colon).","Cambio persistente en los hábitos intestinales","Sangrado rectal o sangre en las heces","Molestia abdominal persistente","Pólipos de colon no cancerosos","Antecedentes familiares de cáncer de colon","cancer-de-estomago","Cáncer de estómago","Cáncer gástrico","Crecimiento de células que comienza en el estómago.","Indigestión o acidez estomacal","Dieta rica en alimentos ahumados, salados o encurtidos","Antecedentes familiares de cáncer de estómago","cancer-de-esofago","Cáncer de esófago","Cáncer que ocurre en el esófago, un tubo largo y hueco que va desde la garganta hasta el estómago.","Dolor en el pecho, presión o ardor","Ronquera o tos crónica","Consumo de tabaco y alcohol","Enfermedad por reflujo gastroesofágico (ERGE) crónica","Dieta deficiente en frutas y verduras","cancer-de-higado","Cáncer de hígado","Carcinoma hepatocelular","Cáncer que comienza en las células del hígado.","Dolor en la parte superior del abdomen","Infección crónica por hepatitis B o C","cancer-de-pancreas","Cáncer de páncreas","Cáncer que comienza en los tejidos del páncreas.","Ictericia (coloración amarillenta de la piel y los ojos)","Dolor abdominal o de espalda","Pancreatitis crónica","Antecedentes familiares de cáncer de páncreas","esofagitis","Esofagitis","Inflamación que puede dañar los tejidos del esófago.","Regurgitación de alimentos","Enfermedad por reflujo gastroesofágico (ERGE)","Alergias alimentarias","acalasia","Acalasia","Trastorno poco común que dificulta el paso de alimentos y líquidos al estómago.","Regurgitación de alimentos no digeridos","Daño a los nervios del esófago","gastroparesia","Gastroparesia","Afección que afecta el movimiento normal espontáneo de los músculos (motilidad) del estómago.","Vómitos de alimentos no digeridos","Sensación de saciedad temprana","Cirugía abdominal o esofágica","linfangiectasia-intestinal","Trastorno poco común del tracto digestivo que causa pérdida de proteínas.","Edema","Dilatación de los vasos linfáticos en el intestino delgado","Forma congénita (primaria) o adquirida (secundaria)","sindrome-de-dumping","Síndrome de Dumping","Afección en la que los alimentos, especialmente los que tienen un alto contenido de azúcar, se mueven desde el estómago hacia el intestino delgado con demasiada rapidez después de comer.","Cirugía de bypass gástrico","Gastrectomía","Cirugía de esófago","colangitis","Colangitis","Inflamación de los conductos biliares.","Dolor en la parte superior derecha del abdomen","Estrechamiento de las vías biliares","isquemia-mesenterica","Isquemia mesentérica","Afección que ocurre cuando los vasos sanguíneos estrechos o bloqueados restringen el flujo sanguíneo al intestino delgado.","Dolor abdominal intenso y repentino","Tromboembolismo","Baja presión arterial","peritonitis","Peritonitis","Inflamación de la membrana que recubre la pared abdominal interna y cubre los órganos abdominales.","Dolor o sensibilidad abdominal","Ruptura del apéndice","Úlcera estomacal perforada","Lesión abdominal","sistema-cardiovascular","Sistema Cardiovascular","❤️","hipertension-arterial","Hipertensión Arterial","Afección en la que la presión de la sangre hacia las paredes de la arteria es demasiado alta.","Hemorragias nasales","Estilo de vida sedentario y obesidad","Dieta alta en sodio y bajo potasio","Consumo excesivo de alcohol y tabaco","ateroesclerosis","Arterioesclerosis","Acumulación de grasas, colesterol y otras sustancias en las paredes de las arterias.","Dolor en el pecho (angina)","Dolor en las piernas al caminar","Debilidad o entumecimiento súbito","Acumulación de colesterol y grasas en las arterias","Diabetes y resistencia a la insulina","cardiopatia-isquemica","Cardiopatía Isquémica","Enfermedad coronaria","Estrechamiento de las arterias coronarias, que suministran sangre al músculo cardíaco.","Dolor opresivo en el pecho (angina)","Falta de aire, especialmente con el esfuerzo","Sudoración fría y náuseas","Ateroesclerosis (estrechamiento de las arterias coronarias)","Formación de coágulos sanguíneos","Espasmo de una arteria coronaria","infarto-de-miocardio","Infarto de Miocardio","Ataque al corazón","Muerte del músculo cardíaco por la falta de irrigación sanguínea.","Dolor intenso y prolongado en el pecho","Dolor que se irradia al brazo izquierdo, mandíbula o espalda","Sudoración profusa y fría","Obstrucción total de una arteria coronaria por un coágulo","Ateroesclerosis severa","Consumo de drogas como la cocaína","angina-de-pecho","Angina de Pecho","Angor pectoris","Dolor en el pecho provocado por la reducción del flujo sanguíneo al corazón.","Presión o dolor en el centro del pecho","Sensación de opresión o ardor","Dolor que aparece con el esfuerzo y se alivia con el reposo","Reducción del flujo sanguíneo al músculo cardíaco","Ateroesclerosis en las arterias coronarias","insuficiencia-cardiaca","Insuficiencia Cardíaca","Fallo cardíaco","El corazón no puede bombear sangre rica en oxígeno de manera eficiente al resto del cuerpo.","Hinchazón (edema) en piernas, tobillos y pies","Tos persistente o sibilancias","Aumento rápido de peso","Daño al músculo cardíaco por infartos previos","Hipertensión arterial no controlada","Enfermedades de las válvulas cardíacas","Cardiomiopatías","arritmia","Arritmia","Problema con la velocidad o el ritmo de los latidos del corazón.","Palpitaciones (sensación de que el corazón late rápido o irregular)","Desmayo (síncope)","Señales eléctricas anormales en el corazón","Cardiopatía isquémica o infarto previo","Desequilibrios de electrolitos","Estrés o consumo de estimulantes","fibrilacion-auricular","Fibrilación Auricular","FA","Ritmo cardíaco irregular y a menudo rápido que puede aumentar el riesgo de accidentes cerebrovasculares.","Latidos cardíacos rápidos e irregulares","Palpitaciones intensas","Mareos y confusión","Anomalías de las válvulas cardíacas","Enfermedad tiroidea (hipertiroidismo)","bradicardia","Bradicardia","Ritmo cardíaco lento","Frecuencia cardíaca más lenta de lo normal.","Latidos cardíacos lentos (menos de 60 por minuto)","Fatiga y falta de energía","Confusión o problemas de memoria","Dificultad para respirar durante el ejercicio","Envejecimiento del sistema eléctrico del corazón","Daño al tejido cardíaco por enfermedad o infarto","Uso de ciertos medicamentos (betabloqueantes)","taquicardia","Ritmo cardíaco rápido","Frecuencia cardíaca más rápida de lo normal.","Latidos cardíacos rápidos (más de 100 por minuto en reposo)","Palpitaciones","Aturdimiento o mareo","Estrés, ansiedad o miedo","Fiebre o deshidratación","Consumo de cafeína, alcohol o nicotina","Anemia o hipertiroidismo","enfermedad-valvular-cardiaca","Enfermedad Valvular Cardíaca","Valvulopatía","Una o más de las válvulas del corazón no funcionan correctamente.","Soplo cardíaco detectado por un médico","Hinchazón de tobillos y pies","Fatiga y mareos","Defectos cardíacos congénitos","Fiebre reumática en la infancia","Endocarditis (infección de las válvulas)","Envejecimiento y calcificación de las válvulas","endocarditis","Endocarditis","Infección del endocardio","Infección del revestimiento interno de las cámaras y válvulas del corazón.","Soplo cardíaco nuevo o cambiante","Pequeñas manchas en la piel, uñas o ojos","Infección bacteriana o fúngica del revestimiento interno del corazón","Uso de drogas intravenosas con agujas contaminadas","Válvulas cardíacas dañadas o artificiales","miocarditis","Miocarditis","Inflamación del miocardio","Inflamación de la capa media de la pared del corazón.","Palpitaciones o ritmo cardíaco anormal","Infección viral (como el virus de la gripe o el COVID-19)","Reacción a un medicamento o droga","pericarditis","Pericarditis","Inflamación del pericardio","Inflamación de la membrana delgada en forma de saco que rodea el corazón.","Dolor agudo y punzante en el pecho, que empeora al respirar hondo","Ataque cardíaco o cirugía cardíaca","Enfermedades autoinmunes como el lupus","Lesión en el pecho","cardiomiopatia","Miocardiopatía","Enfermedad del músculo cardíaco que dificulta el bombeo de sangre.","Falta de aliento con el esfuerzo o en reposo","Hinchazón de las piernas y el abdomen","Mareos y desmayos","Hipertensión arterial prolongada","Daño cardíaco por un infarto","aneurisma-aortico","Aneurisma Aórtico","Dilatación de la aorta","Ensanchamiento o abombamiento anormal de la arteria aorta.","A menudo asintomático hasta que se rompe","Dolor profundo y persistente en el abdomen o la espalda","Sensación de pulso cerca del ombligo","Dolor súbito e intenso si se rompe","Factores genéticos (Síndrome de Marfan)","diseccion-aortica","Disección Aórtica","Rotura de la aorta","Desgarro en la capa interna de la arteria aorta.","Dolor súbito y desgarrador en el pecho o la espalda","Pérdida del conocimiento","Debilidad o parálisis en un lado del cuerpo","Hipertensión arterial crónica y mal controlada","Aneurisma aórtico preexistente","Síndrome de Marfan u otros trastornos del tejido conectivo","enfermedad-arterial-periferica","Enfermedad Arterial Periférica","EAP","Estrechamiento de las arterias que reducen el flujo sanguíneo a las extremidades.","Dolor o calambres en las piernas al caminar (claudicación)","Entumecimiento o debilidad en las piernas","Piel fría en los pies","Llagas que no cicatrizan en pies o piernas","Ateroesclerosis en las arterias de las extremidades","Hipertensión y colesterol alto","trombosis-venosa-profunda","Trombosis Venosa Profunda","TVP","Formación de un coágulo de sangre en una vena profunda, generalmente en las piernas.","Hinchazón en una pierna","Dolor o sensibilidad en la pierna, a menudo como un calambre","Piel enrojecida o descolorida","Sensación de calor en el área afectada","Inmovilidad prolongada (viajes largos, reposo en cama)","Cirugía o lesión en las venas","Trastornos de la coagulación sanguínea","Cáncer y sus tratamientos","Bloqueo de una arteria en los pulmones por un coágulo de sangre.","accidente-cerebrovascular","Accidente Cerebrovascular","ACV","Daño al cerebro por interrupción del suministro de sangre.","Adormecimiento o debilidad súbita en cara, brazo o pierna (especialmente en un lado)","Confusión repentina, dificultad para hablar o entender","Problemas súbitos de visión","Dolor de cabeza súbito y severo","Obstrucción de una arteria cerebral por un coágulo (isquémico)","Ruptura de un vaso sanguíneo en el cerebro (hemorrágico)","Tipo de presión arterial alta que afecta a las arterias de los pulmones y al lado derecho del corazón.","cardiopatia-congenita","Cardiopatía Congénita","Defecto cardíaco de nacimiento","Anomalía en la estructura del corazón presente al nacer.","Varían mucho según el defecto","Cianosis (piel azulada)","Dificultad para respirar y alimentarse (en bebés)","Retraso en el crecimiento","Fatiga fácil durante el juego","Anomalías en el desarrollo del corazón antes del nacimiento","Factores genéticos y síndromes (como el de Down)","Infecciones maternas durante el embarazo (rubéola)","soplo-cardiaco","Soplo Cardíaco","Murmullo cardíaco","Sonido adicional o inusual que se escucha durante un latido cardíaco.","Generalmente asintomático (es un sonido, no una enfermedad)","En casos patológicos, puede asociarse a falta de aire o cianosis","Flujo sanguíneo turbulento a través del corazón","Soplos inocentes (comunes en niños)","Enfermedad de las válvulas cardíacas","Defectos septales (agujeros en el corazón)","sindrome-de-marfan","Síndrome de Marfan","Trastorno hereditario que afecta el tejido conectivo, incluyendo el corazón y los vasos sanguíneos.","Estatura alta y delgada, con brazos y piernas largos","Problemas de visión (luxación del cristalino)","Problemas cardíacos (aneurisma y disección aórtica)","Articulaciones extremadamente flexibles","Mutación en el gen FBN1 que afecta el tejido conectivo","enfermedad-de-buerger","Enfermedad de Buerger","Tromboangeítis obliterante","Inflamación y coagulación en los vasos sanguíneos de las manos y los pies.","Dolor en manos y pies, incluso en reposo","Dedos pálidos, rojizos o azulados por el frío","Llagas dolorosas en dedos de manos y pies","Inflamación a lo largo de las venas","Fuerte asociación con el consumo de tabaco","Inflamación y coagulación en los vasos sanguíneos de manos y pies","enfermedad-de-raynaud","Enfermedad de Raynaud","Fenómeno de Raynaud","Afección que causa que algunas áreas del cuerpo se sientan frías y cambien de color en respuesta al frío o al estrés.","Dedos de manos y pies que se vuelven blancos, luego azules y finalmente rojos","Entumecimiento y sensación de hormigueo","Dolor punzante al recuperar el flujo sanguíneo","Espasmo de las arterias pequeñas en respuesta al frío o al estrés","Puede ser primario (causa desconocida) o secundario a otras enfermedades","varices","Varices","Venas hinchadas y retorcidas que se pueden ver debajo de la piel.","Venas torcidas y abultadas de color azul o morado oscuro","Sensación de pesadez o dolor en las piernas","Calambres musculares y ardor","Hinchazón en la parte inferior de las piernas","Válvulas venosas débiles o dañadas","Aumento de la presión en las venas (estar de pie mucho tiempo)","Embarazo y obesidad","Acumulación de líquido linfático en los tejidos blandos del cuerpo.","shock-cardiogenico","Shock Cardiogénico","Choque cardiogénico","Afección en la que el corazón de repente no puede bombear suficiente sangre para satisfacer las necesidades del cuerpo.","Presión arterial muy baja","Pulso débil y rápido","Piel fría y sudorosa","Confusión y pérdida de conciencia","Respiración rápida","Daño severo al corazón, generalmente por un infarto masivo","Incapacidad del corazón para bombear suficiente sangre al cuerpo","paro-cardiaco","Paro Cardíaco","Muerte súbita cardíaca","Pérdida inesperada de la función cardíaca, la respiración y el conocimiento.","Pérdida súbita del conocimiento","Ausencia de respiración","Falta de pulso","Colapso repentino","Mal funcionamiento eléctrico del corazón (arritmia letal)","Infarto de miocardio","anemia","Afección en la cual la sangre no cuenta con suficientes glóbulos rojos sanos.","Piel pálida o amarillenta","Manos y pies fríos","Deficiencia de hierro, vitamina B12 o folato","Pérdida de sangre (menstruación, úlceras)","Enfermedades crónicas que afectan la producción de glóbulos rojos","hemofilia","Hemofilia","Trastorno hemorrágico hereditario en el cual la sangre no coagula de manera adecuada.","Sangrado excesivo por cortes o lesiones","Moretones grandes y profundos","Sangrado en articulaciones (dolor e hinchazón)","Sangre en la orina o las heces","Trastorno genético hereditario ligado al cromosoma X","Deficiencia de factores de coagulación en la sangre (Factor VIII o IX)","leucemia","Leucemia","Cáncer de la sangre","Cáncer de los tejidos que forman la sangre en el organismo.","Fiebre o escalofríos","Moretones y sangrado fácil","Producción anormal y excesiva de glóbulos blancos en la médula ósea","Mutaciones en el ADN de las células sanguíneas","colesterol-alto","Colesterol Alto","Hipercolesterolemia","Niveles elevados de colesterol en la sangre, lo que aumenta el riesgo de enfermedades cardíacas.","Generalmente no presenta síntomas","Puede contribuir a la ateroesclerosis y sus síntomas (dolor de pecho, etc.)","Depósitos de grasa en la piel (xantomas) en casos severos","Dieta rica in grasas saturadas y trans","Factores genéticos (hipercolesterolemia familiar)","Sedentarismo y obesidad","trigliceridos-altos","Triglicéridos Altos","Hipertrigliceridemia","Niveles elevados de triglicéridos en la sangre, lo que aumenta el riesgo de enfermedades cardíacas.","Generalmente asintomático","En niveles muy altos, puede causar pancreatitis (dolor abdominal severo)","Puede contribuir a la ateroesclerosis","Consumo excesivo de calorías, especialmente de azúcar y alcohol","Obesidad y síndrome metabólico","Diabetes tipo 2 mal controlada","diabetes-mellitus","Diabetes Mellitus","Enfermedad crónica que afecta la forma en que el cuerpo convierte los alimentos en energía.","Aumento del hambre","Tipo 1: Destrucción autoinmune de las células productoras de insulina","Tipo 2: Resistencia a la insulina y producción insuficiente","Factores genéticos y estilo de vida","Acumulación excesiva de grasa corporal que puede aumentar el riesgo de problemas de salud.","Trastorno del sueño en el que la respiración se detiene y recomienza repetidamente.","Enfermedad autoinmune que puede afectar el corazón y los vasos sanguíneos.","sistema-nervioso","Sistema Nervioso","migraña","Migraña","Hemicránea","Jaqueca","Dolor de cabeza pulsátil e intenso, generalmente en un lado de la cabeza.","Dolor de cabeza pulsátil","Sensibilidad a la luz y al sonido","Auras visuales","Ciertos alimentos y bebidas","epilepsia","Epilepsia","Trastorno convulsivo","Trastorno neurológico que causa convulsiones recurrentes.","Convulsiones recurrentes","Pérdida de conciencia","Movimientos espasmódicos incontrolables","Confusión temporal","Infecciones cerebrales","parkinson","Mal de Parkinson","Enfermedad degenerativa que afecta el movimiento, causando temblores y rigidez.","Temblores en reposo","Lentitud de movimiento (bradicinesia)","Inestabilidad postural","Pérdida de neuronas productoras de dopamina","Exposición a toxinas ambientales","alzheimer","Alzheimer","Mal de Alzheimer","Enfermedad progresiva que destruye la memoria y otras funciones mentales importantes.","Pérdida de memoria progresiva","Dificultad para resolver problemas","Desorientación en tiempo y lugar","Cambios en el estado de ánimo y la personalidad","Acumulación de placas de beta-amiloide en el cerebro","Ovillos de proteína tau","esclerosis-múltiple","Entumecimiento u hormigueo en el cuerpo","Enfermedad autoinmune que ataca la mielina","Factores ambientales desconocidos","neuralgia","Neuralgia","Dolor agudo y espantoso que sigue la ruta de un nervio y se debe a la irritación o daño al nervio.","Dolor agudo y punzante a lo largo de un nervio","Sensibilidad extrema al tacto","Infecciones (como el herpes zóster)","Lesiones nerviosas","neuropatía","Neuropatía","Neuropatía periférica","Daño a los nervios fuera del cerebro y la médula espinal (nervios periféricos), que a menudo causa debilidad, entumecimiento y dolor, generalmente en las manos y los pies.","Entumecimiento, hormigueo o ardor en manos y pies","Pérdida de coordinación","Dolor agudo y punzante","Deficiencias vitamínicas","Alcoholismo crónico","vértigo","Sensación giratoria repentina que se inicia o empeora con el movimiento de la cabeza.","Sensación de que todo da vueltas","Pérdida de equilibrio","Problemas en el oído interno (como la VPPB)","Migrañas vestibulares","insomnio","Insomnio","Trastorno de insomnio crónico","Trastorno del sueño en el que las personas tienen problemas para conciliar el sueño, permanecer dormidas o ambas cosas.","Dificultad para conciliar el sueño","Dificultad para mantener el sueño (despertarse con frecuencia)","Despertarse demasiado temprano y no poder volver a dormirse","Sueño no reparador","Fatiga diurna o somnolencia","Malos hábitos de sueño","Trastornos del estado de ánimo como la depresión","Afecciones médicas y dolor crónico","accidente-cerebrovascular-acv","Accidente cerebrovascular (ACV)","Infarto cerebral","Derrame cerebral","Daño al cerebro por interrupción de su suministro de sangre.","Entumecimiento o debilidad repentina en la cara, brazo o pierna","Confusión repentina, dificultad para hablar","Problemas repentinos de visión","Dolor de cabeza intenso y repentino","Bloqueo del flujo sanguíneo al cerebro (isquémico)","Sangrado en el cerebro (hemorrágico)","aneurisma-cerebral","Aneurisma cerebral","Aneurisma intracraneal","Un punto débil o delgado en una arteria del cerebro que se hincha o se abomba y se llena de sangre.","Dolor de cabeza súbito e intenso","Rigidez en el cuello","Visión borrosa o doble","Debilidad en la pared de un vaso sanguíneo cerebral","tumor-cerebral","Neoplasia cerebral","Crecimiento de células anormales en el tejido del cerebro.","Dolores de cabeza persistentes","Cambios en la personalidad o el comportamiento","Problemas de visión o audición","Crecimiento anormal de células en el cerebro","esclerosis-lateral-amiotrófica-ela","Esclerosis lateral amiotrófica (ELA)","Enfermedad de Lou Gehrig","Enfermedad del sistema nervioso que debilita los músculos y afecta las funciones físicas.","Espasmos y calambres musculares","Pérdida de la capacidad para moverse","Degeneración de las neuronas motoras","hernia-de-disco","Disco deslizado","Disco roto","Problema con uno de los amortiguadores cartilaginosos (discos) entre los huesos individuales (vértebras) que se apilan para formar la columna vertebral.","Dolor de espalda o cuello","Dolor que se irradia a los brazos o las piernas","Entumecimiento u hormigueo","Desgaste gradual relacionado con la edad (degeneración del disco)","Levantamiento de objetos pesados de forma incorrecta","Lesión en la espalda","enfermedad-de-huntington","Enfermedad de Huntington","Corea de Huntington","Enfermedad hereditaria que provoca el desgaste de algunas células nerviosas del cerebro.","Movimientos involuntarios (corea)","Deterioro cognitivo","Cambios psiquiátricos (depresión, irritabilidad)","Dificultad para caminar y hablar","Mutación en el gen HTT","demencia-con-cuerpos-de-lewy","Demencia con cuerpos de Lewy","DCL","Tipo de demencia progresiva que conduce a una disminución de las capacidades de pensamiento, razonamiento y función independiente.","Fluctuaciones en la atención y el estado de alerta","Alucinaciones visuales recurrentes","Síntomas de parkinsonismo (rigidez, temblores)","Acumulación de depósitos de proteína (cuerpos de Lewy) en el cerebro","ataxia-de-friedreich","Ataxia de Friedreich","AFT","Enfermedad hereditaria que causa daño progresivo al sistema nervioso.","Dificultad para caminar y mantener el equilibrio","Debilidad muscular en brazos y piernas","Problemas del habla (disartria)","Mutación en el gen FXN","síndrome-de-la-persona-rígida","Síndrome de la persona rígida","SPR","Trastorno neurológico raro con características de una enfermedad autoinmune.","Rigidez muscular progresiva","Espasmos musculares dolorosos","Sensibilidad aumentada al ruido y al tacto","Enfermedad autoinmune que ataca el sistema nervioso central","Asociación con otras enfermedades autoinmunes","encefalitis","Encefalitis","Inflamación del cerebro","Inflamación del cerebro, a menudo debida a una infección.","Dolor de cabeza intenso","Confusión","Infección viral (como el herpes simple)","Picaduras de mosquitos o garrapatas","enfermedad-de-charcot-marie-tooth","Enfermedad de Charcot-Marie-Tooth","CMT","Grupo de trastornos hereditarios que causan daño a los nervios.","Debilidad y atrofia muscular en pies y piernas","Pies cavos (arco alto)","Pérdida de sensibilidad en los pies","Mutaciones genéticas que afectan los nervios periféricos","Trastorno hereditario","enfermedades-de-las-neuronas-motoras","Enfermedades de las neuronas motoras","ENM","Grupo de enfermedades neurodegenerativas progresivas que atacan a las neuronas motoras.","Atrofia muscular","Degeneración de las neuronas motoras en el cerebro y la médula espinal","Factores genéticos (en algunos casos)","enfermedad-de-von-hippel-lindau","Enfermedad de von Hippel-Lindau","VHL","Trastorno hereditario caracterizado por el crecimiento de tumores y quistes en varias partes del cuerpo.","Tumores en el sistema nervioso central","Quistes en riñones, páncreas y otros órganos","Hemangioblastomas en la retina","Mutación en el gen VHL","enfermedades-de-la-médula-espinal","Enfermedades de la médula espinal","Mielopatía","Término general para los trastornos de la médula espinal.","Pérdida de sensibilidad por debajo de la lesión","Debilidad o parálisis muscular","Pérdida del control de la vejiga y los intestinos","Traumatismos (accidentes, caídas)","Enfermedades degenerativas","absceso-cerebral-parasitario","Absceso cerebral parasitario","Neurocisticercosis","Infección parasitaria del cerebro que puede causar convulsiones y otros síntomas neurológicos.","Déficits neurológicos focales","Infección por parásitos como Taenia solium (cisticercosis)","Diseminación de una infección de otra parte del cuerpo","absceso-raquídeo","Absceso raquídeo","Absceso epidural espinal","Acumulación de pus en el espacio epidural que puede comprimir la médula espinal.","Dolor de espalda localizado","Debilidad o parálisis de las piernas","Pérdida del control de esfínteres","Infección bacteriana (generalmente Staphylococcus aureus)","Diseminación desde una infección cercana","accidente-isquémico-transitorio","Accidente isquémico transitorio","AIT","Mini-accidente cerebrovascular; un breve bloqueo del flujo sanguíneo al cerebro.","Síntomas similares a un ACV que duran poco tiempo","Entumecimiento o debilidad facial/extremidades","Dificultad para hablar o entender","Pérdida de visión súbita","Interrupción temporal del flujo sanguíneo a una parte del cerebro","Coágulo de sangre","adrenoleucodistrofia","Adrenoleucodistrofia","ALD","Enfermedad genética que afecta las glándulas suprarrenales y la materia blanca del cerebro.","Problemas de comportamiento y aprendizaje","Pérdida de la visión y la audición","Deterioro neurológico progresivo","Mutación en el gen ABCD1","afasia","Afasia","Disfasia","Trastorno del lenguaje que afecta la capacidad de comunicación.","Dificultad para encontrar las palabras correctas","Habla telegráfica (frases cortas e incompletas)","Dificultad para entender el lenguaje hablado o escrito","Sustitución de palabras o sonidos","Daño cerebral por ACV","Neuronitis vestibular","Trastorno del oído interno que causa vértigo, mareos y pérdida del equilibrio.","enfermedad-de-lafora","Enfermedad de Lafora","Epilepsia mioclónica progresiva de Lafora","Forma rara y grave de epilepsia mioclónica progresiva.","Convulsiones mioclónicas y tónico-clónicas","Deterioro cognitivo progresivo","Alucinaciones visuales","Mutaciones en los genes EPM2A o NHLRC1","Trastorno genético hereditario recesivo","síndrome-de-landau-kleffner","Síndrome de Landau-Kleffner","Afasia epiléptica adquirida","Trastorno neurológico infantil raro caracterizado por la pérdida repentina o gradual de la capacidad para comprender y usar el lenguaje hablado.","Pérdida de la capacidad para entender y usar el lenguaje (afasia)","Anomalías en el electroencefalograma (EEG) durante el sueño","Convulsiones (en la mayoría de los casos)","Problemas de comportamiento","Posiblemente relacionado con procesos inflamatorios o autoinmunes","síndrome-de-leigh","Síndrome de Leigh","Encefalomielopatía necrotizante subaguda","Trastorno neurometabólico hereditario raro que afecta el sistema nervioso central.","Pérdida de habilidades motoras previamente adquiridas","Vómitos, diarrea y dificultad para tragar","Irritabilidad y llanto continuo","Mutaciones en genes del ADN mitocondrial o nuclear","Trastorno neurodegenerativo progresivo","leucoaraiosis","Leucoaraiosis","Rarefacción de la sustancia blanca","Cambios en la sustancia blanca del cerebro que a menudo se observan en personas mayores.","A menudo asintomático al principio","Deterioro cognitivo leve","Problemas de equilibrio y marcha","Aumento del riesgo de ACV","Enfermedad de los pequeños vasos sanguíneos del cerebro","leucodistrofia-metacromática","Leucodistrofia metacromática","LDM","Enfermedad de almacenamiento lisosómico que causa la desmielinización del sistema nervioso.","Pérdida de la capacidad para caminar y hablar","Deterioro mental progresivo","Pérdida de la sensibilidad en extremidades","Deficiencia de la enzima arilsulfatasa A","Acumulación de sulfátidos en el sistema nervioso","leucoencefalopatía","Leucoencefalopatía","Enfermedad de la sustancia blanca","Término amplio para las enfermedades que afectan la sustancia blanca del cerebro.","Deterioro cognitivo y motor progresivo","Cambios de personalidad","Amplio grupo de trastornos que afectan la sustancia blanca del cerebro","Causas genéticas, infecciosas o tóxicas","ausencia-del-tabique-pelúcido","Ausencia del tabique pelúcido","ASP","Ausencia del tabique pelúcido, una membrana delgada en el centro del cerebro.","Puede ser asintomático","Retraso en el desarrollo","Discapacidad visual","Anomalía congénita del cerebro","Asociado con otros trastornos del desarrollo cerebral","enfermedad-por-depósito-de-lípidos-ácidos","Enfermedad por depósito de lípidos ácidos","Enfermedad de Wolman","Enfermedad de almacenamiento lisosómico rara y grave.","Hepatoesplenomegalia (agrandamiento de hígado y bazo)","Diarrea y vómitos crónicos","Deterioro neurológico en formas graves","Deficiencia de la enzima lipasa ácida lisosomal","Dolor en la parte baja de la espalda.","síndrome-de-barth","Síndrome de Barth","BTHS","Trastorno genético raro que afecta principalmente a los hombres y causa miocardiopatía, neutropenia y debilidad muscular.","Cardiomiopatía (músculo cardíaco debilitado)","Neutropenia (bajo número de glóbulos blancos)","Debilidad muscular y retraso motor","Mutación en el gen TAZ (tafazzin)","cadasil","CADASIL","Arteriopatía cerebral autosómica dominante con infartos subcorticales y leucoencefalopatía","Forma hereditaria de enfermedad cerebrovascular que ocurre cuando el engrosamiento de las paredes de los vasos sanguíneos bloquea el flujo de sangre al cerebro.","Migrañas con aura","Accidentes cerebrovasculares isquémicos recurrentes","Trastornos del estado de ánimo","Demencia progresiva","Mutaciones en el gen NOTCH3","Trastorno genético hereditario dominante","sistema-inmunologico","Sistema Inmunológico","🛡️","lupus","Enfermedad autoinmune sistémica que ocurre cuando el sistema inmunitario del cuerpo ataca sus propios tejidos y órganos.","Erupción en forma de mariposa","Lesiones cutáneas","Factores ambientales como infecciones o medicamentos","Desequilibrios hormonales","Afección de la piel que causa manchas rojas y escamosas que pican, principalmente en las rodillas, los codos, el tronco y el cuero cabelludo.","Vitiligo","Enfermedad que causa la pérdida de color de la piel en parches.","alergias","Reacciones de hipersensibilidad","Respuesta exagerada del sistema inmunitario a sustancias que normalmente son inofensivas.","Picazón en la nariz, ojos o paladar","Ojos llorosos, rojos o hinchados","Respuesta exagerada del sistema inmunitario a sustancias inofensivas (alérgenos)","Exposición a alérgenos como polen, ácaros del polvo, moho o pelo de animales","inmunodeficiencias","Inmunodeficiencias","Inmunosupresión","Estado en el que la capacidad del sistema inmunitario para combatir enfermedades infecciosas y cáncer está comprometida o ausente.","Infecciones recurrentes y graves","Inflamación y daño en órganos internos","Problemas sanguíneos, como recuentos bajos de plaquetas o anemia","Problemas digestivos","Defectos genéticos que afectan el sistema inmunitario (primaria)","Enfermedades como el VIH/SIDA o la desnutrición (secundaria)","Medicamentos que debilitan el sistema inmunitario","Esclerosis Múltiple","Enfermedad potencialmente incapacitante del cerebro y la médula espinal (sistema nervioso central).","Trastorno del sistema inmunitario que da como resultado la sobreproducción de hormonas tiroideas (hipertiroidismo).","Afección en la que el sistema inmunitario ataca la tiroides, una pequeña glándula en la base del cuello.","Trastorno poco común que ocurre cuando el cuerpo no produce suficiente cantidad de ciertas hormonas.","miastenia-gravis","Miastenia Gravis","Enfermedad neuromuscular que causa debilidad en los músculos esqueléticos.","Debilidad de los músculos de los brazos, las manos, los dedos, las piernas y el cuello","Párpados caídos","Dificultad para hablar, masticar, tragar y respirar","Interrupción de la comunicación normal entre los nervios y los músculos","Anticuerpos que bloquean o destruyen los receptores musculares de la acetilcolina","sindrome-de-sjogren","Síndrome de Sjögren","Trastorno del sistema inmunitario que se identifica por sus dos síntomas más comunes: ojos y boca secos.","Ojos secos","Boca seca","Ataque del sistema inmunitario a las glándulas que producen lágrimas y saliva","Desencadenante como una infección viral o bacteriana","Grupo de enfermedades raras que implican el endurecimiento y la tensión de la piel y los tejidos conectivos.","polimiositis","Polimiositis","Enfermedad inflamatoria poco común que causa debilidad muscular que afecta a ambos lados del cuerpo.","Debilidad muscular progresiva en caderas, muslos, hombros, brazos y cuello","Dificultad para subir escaleras, levantarse de una silla o levantar objetos","Inflamación de los músculos por una respuesta autoinmune","Causa exacta desconocida, posiblemente relacionada con infecciones virales o enfermedades autoinmunes","dermatomiositis","Dermatomiositis","Enfermedad inflamatoria poco común marcada por debilidad muscular y una erupción cutánea distintiva.","Erupción cutánea violácea o roja oscura en la cara, los nudillos, los codos, las rodillas, el pecho y la espalda","Párpados hinchados y de color púrpura","Inflamación de los músculos y la piel por una respuesta autoinmune","Posiblemente desencadenada por infecciones o ciertos medicamentos","diabetes-tipo-1","Diabetes tipo 1","Afección crónica en la que el páncreas produce poca o ninguna insulina.","Aumento de la sed","Aumento de las ganas de orinar","enfermedad-inflamatoria-intestinal","Enfermedad Inflamatoria Intestinal","EII","Término general que describe trastornos que involucran inflamación crónica de su tracto digestivo.","Dolor abdominal y cólicos","Genética y antecedentes familiares","hepatitis-autoinmune","Hepatitis Autoinmune","Inflamación del hígado que ocurre cuando el sistema inmunitario ataca las células del hígado.","Malestar abdominal","Reacción autoinmune contra las células hepáticas","Exposición a ciertos medicamentos","anemia-perniciosa","Anemia Perniciosa","Disminución de los glóbulos rojos que ocurre cuando los intestinos no pueden absorber adecuadamente la vitamina B12.","Hormigueo o entumecimiento en manos y pies","Piel pálida","Dificultad para caminar y problemas de equilibrio","Reacción autoinmune contra las células parietales del estómago","Falta de factor intrínseco para absorber la vitamina B12","Tener un trastorno endocrino autoinmune","vasculitis-autoinmune","Vasculitis Autoinmune","Inflamación de los vasos sanguíneos que ocurre cuando el sistema inmunitario ataca los vasos sanguíneos por error.","Dolores musculares y articulares","Infecciones como la hepatitis B y C","Cánceres de la sangre","Enfermedades del sistema inmunitario como artritis reumatoide y lupus","Reacciones a ciertos medicamentos","Alopecia Areata","Afección que causa la caída del cabello en pequeños parches, que pueden pasar desapercibidos.","sindrome-de-guillain-barre","Síndrome de Guillain-Barré","Trastorno poco común en el que el sistema inmunitario ataca los nervios.","Sensación de hormigueo en los dedos de las manos, de los pies, los tobillos o las muñecas","Debilidad en las piernas que se difunde a la parte superior del cuerpo","Marcha inestable o incapacidad para caminar o subir escaleras","Dificultad con los movimientos faciales, lo que incluye hablar, masticar o tragar","Visión doble o incapacidad para mover los ojos","Dolor fuerte, que puede ser un dolor sordo, fulgurante o similar a un calambre, y que puede empeorar en la noche","Infección por campylobacter","Virus de la influenza","Citomegalovirus","Virus de Epstein-Barr","Virus del Zika","purpura-trombocitopenica-idiopatica","Púrpura Trombocitopénica Idiopática","PTI","Trastorno que puede provocar hematomas y sangrado fáciles o excesivos.","Sangrado en la piel (púrpura y petequias)","Sangrado de las encías o la nariz","Orina o heces con sangre","Aparición fácil de moretones","Períodos menstruales anormalmente abundantes","El sistema inmunitario ataca y destruye las plaquetas por error","Producción de anticuerpos contra las plaquetas","Otras enfermedades autoinmunes","sindrome-antifosfolipido","Síndrome Antifosfolípido","SAF","Trastorno en el que el sistema inmunitario ataca por error a las proteínas normales de la sangre.","Coágulos de sangre en venas o arterias","Abortos espontáneos recurrentes","Erupción cutánea con un patrón de encaje (livedo reticularis)","Accidente cerebrovascular o ataque isquémico transitorio","Producción de anticuerpos que atacan a las proteínas de la sangre","Puede ocurrir junto con otras enfermedades autoinmunes como el lupus","enfermedad-de-behcet","Enfermedad de Behçet","Trastorno poco común que causa la inflamación de los vasos sanguíneos en todo el cuerpo.","Aftas en la boca","Úlceras genitales","Inflamación ocular (uveítis)","Lesiones cutáneas similares al acné","Inflamación de los vasos sanguíneos (vasculitis) de causa desconocida","espondilitis-aniquilosante","Espondilitis Anquilosante","Enfermedad inflamatoria que, con el tiempo, puede hacer que algunas de las vértebras de la columna se fusionen.","Dolor y rigidez en la parte baja de la espalda y caderas","Dolor de cuello","Dolor en la articulación sacroilíaca","Uveítis (inflamación ocular)","Presencia del gen HLA-B27","Artritis Psoriásica","Forma de artritis que afecta a algunas personas que tienen psoriasis.","artritis-reactiva","Artritis Reactiva","Síndrome de Reiter","Dolor e hinchazón en las articulaciones desencadenado por una infección en otra parte del cuerpo.","Dolor y rigidez en rodillas, tobillos y pies","Inflamación ocular (conjuntivitis)","Problemas urinarios","Hinchazón de los dedos de las manos o de los pies","Infección en los intestinos, los genitales o las vías urinarias","Infección por bacterias (Campylobacter, Chlamydia, Salmonella, etc.)","Edad entre 20 y 40 años","fiebre-reumatica","Fiebre Reumática","Enfermedad inflamatoria que puede desarrollarse como una complicación de la faringitis estreptocócica o la escarlatina no tratadas o tratadas de forma inadecuada.","Dolor en las articulaciones, especialmente en las rodillas, los tobillos, los codos y las muñecas","Carditis (inflamación del corazón)","Movimientos corporales espasmódicos e incontrolables (corea de Sydenham)","Nódulos indoloros debajo de la piel","Complicación de una infección de garganta por estreptococos no tratada o tratada de forma inadecuada","Respuesta inmunitaria anormal a la bacteria estreptocócica","uveitis-autoinmune","Uveítis Autoinmune","Inflamación de la úvea, la capa media del ojo, que puede ser causada por una enfermedad autoinmune.","Dolor ocular","Sensibilidad a la luz (fotofobia)","Moscas volantes (miodesopsias)","Reacción del sistema inmunitario contra el propio tejido ocular","Asociación con enfermedades autoinmunes sistémicas (como artritis reumatoide o espondilitis anquilosante)","Infecciones previas que desencadenan la respuesta autoinmune","penfigoide","Penfigoide","Grupo de enfermedades autoinmunes raras de la piel que causan ampollas y erosiones en la piel y las membranas mucosas.","Picazón intensa que puede comenzar semanas o meses antes de que se formen las ampollas","Ampollas grandes y tensas que no se rompen con facilidad","Piel enrojecida o parches similares a la urticaria o eccema","Lesiones o ampollas en la boca u otras membranas mucosas","Es una enfermedad autoinmune en la que el sistema inmunitario ataca la piel","Exposición a la luz ultravioleta (fototerapia) o radioterapia","Puede estar asociado a otras enfermedades como la esclerosis múltiple o la colitis ulcerosa","Liquen Plano","urticaria-cronica-idiopatica","Urticaria Crónica Idiopática","UCI","Ronchas que duran más de seis semanas y recurren con frecuencia durante meses o años.","Ronchas o habones que aparecen en cualquier parte del cuerpo","Hinchazón dolorosa alrededor de los ojos, mejillas o labios (angioedema)","Brotes desencadenados por calor, ejercicio o estrés","Ronchas que varían en tamaño y forma","Causa a menudo desconocida (idiopática)","Enfermedad tiroidea","Cáncer","sistema-endocrino","Sistema Endocrino","diabetes-mellitus-tipo-2","Diabetes Mellitus Tipo 2","Diabetes del adulto","Diabetes no insulinodependiente","Trastorno metabólico caracterizado por hiperglucemia en el contexto de resistencia a la insulina y deficiencia relativa de insulina.","Aumento de la sed y de la micción","Hormigueo en manos o pies","Obesidad y sobrepeso","diabetes-mellitus-tipo-1","Diabetes Mellitus Tipo 1","Diabetes juvenil","Enfermedad autoinmune que destruye las células beta del páncreas, lo que lleva a una deficiencia absoluta de insulina.","Sed excesiva","Micción frecuente","Hambre extrema","Reacción autoinmune que destruye las células beta del páncreas","Factores ambientales o virus","hipotiroidismo","Tiroides hipoactiva","Afección en la que la glándula tiroides no produce suficientes hormonas tiroideas.","Aumento de peso","Sensibilidad al frío","Piel seca","Enfermedad de Hashimoto (trastorno autoinmune)","Tratamiento previo por hipertiroidismo","hipertiroidismo","Hipertiroidismo","Tiroides hiperactiva","Tirotoxicosis","Producción excesiva de hormonas tiroideas por la glándula tiroides.","Taquicardia (ritmo cardíaco rápido)","Nerviosismo y ansiedad","Temblores","Intolerancia al calor","Enfermedad de Graves (trastorno autoinmune)","Nódulos tiroideos hiperactivos","Tiroiditis (inflamación de la tiroides)","Síndrome de Ovario Poliquístico","SOP","Anovulación hiperandrogénica","Trastorno endocrino común en mujeres en edad reproductiva, caracterizado por períodos menstruales irregulares, exceso de andrógenos y quistes en los ovarios.","Insuficiencia suprarrenal primaria","Trastorno en el que las glándulas suprarrenales no producen suficientes hormonas cortisol y aldosterona.","Trastorno autoinmune que causa hipertiroidismo.","enfermedad-de-cushing","Enfermedad de Cushing","Hipercortisolismo","Afección causada por la exposición prolongada a altos niveles de cortisol.","Aumento de peso con acumulación de grasa en cara y abdomen","Estrías violáceas en la piel","Piel fina y frágil","Uso prolongado de medicamentos corticosteroides","Tumor en la glándula pituitaria (enfermedad de Cushing)","Tumor en la glándula suprarrenal","acromegalia","Acromegalia","Gigantismo en adultos","Trastorno hormonal que se padece cuando la glándula pituitaria produce gran cantidad de hormona del crecimiento durante la edad adulta.","Agrandamiento de manos y pies","Cambios en los rasgos faciales (mandíbula y frente prominentes)","Voz más grave","Espaciamiento de los dientes","Producción excesiva de hormona del crecimiento (GH) en la edad adulta","enanismo","Enanismo","Baja estatura causada por una condición genética o médica.","Baja estatura (muy por debajo del promedio para la edad)","Extremidades cortas","Cabeza grande en proporción al cuerpo","Desarrollo motor retrasado","Acondroplasia (mutación genética)","Otras condiciones genéticas","gigantismo","Gigantismo","Exceso de hormona de crecimiento en niños","Crecimiento anormalmente grande debido a un exceso de la hormona del crecimiento durante la niñez.","Crecimiento excesivo en altura y tamaño corporal durante la niñez","Manos y pies grandes","Rasgos faciales toscos","Pubertad retrasada","Producción excesiva de hormona del crecimiento (GH) durante la niñez","prolactinoma","Prolactinoma","Tumor hipofisario productor de prolactina","Tumor benigno de la glándula pituitaria que produce un exceso de la hormona prolactina.","Producción de leche materna fuera del embarazo (galactorrea)","Disfunción eréctil en hombres","Dolores de cabeza y problemas de visión","Tumor benigno (adenoma) en la glándula pituitaria que produce prolactina en exceso","sindrome-metabolico","Síndrome Metabólico","Síndrome de resistencia a la insulina","Conjunto de afecciones que aumentan el riesgo de enfermedad cardíaca, accidente cerebrovascular y diabetes tipo 2.","Grupo de condiciones: presión arterial alta, azúcar alta en sangre, exceso de grasa abdominal y niveles anormales de colesterol","Sobrepeso y obesidad","Falta de actividad física","Sobrepeso severo","Acumulación excesiva de grasa corporal que puede ser perjudicial para la salud.","Enfermedad ósea porosa","hiperparatiroidismo","Exceso de hormona paratiroidea en el torrente sanguíneo debido a la hiperactividad de una o más de las cuatro glándulas paratiroides.","Dolor óseo y fracturas fáciles","Dolor abdominal y náuseas","Tumor benigno (adenoma) en una de las glándulas paratiroides","Agrandamiento de dos o más glándulas paratiroides","Deficiencia de calcio o vitamina D","hipoparatiroidismo","Hipoparatiroidismo","Producción insuficiente de hormona paratiroidea, lo que conduce a niveles bajos de calcio en la sangre.","Hormigueo o entumecimiento en dedos y labios","Calambres y espasmos musculares","Daño o extirpación de las glándulas paratiroides durante una cirugía de cuello","Niveles bajos de magnesio","cancer-de-tiroides","Cáncer de Tiroides","Crecimiento maligno de células en la glándula tiroides.","Bulto o nódulo en el cuello que crece rápidamente","Ronquera o cambios en la voz","Dolor en el cuello y la garganta","Exposición a altos niveles de radiación","Antecedentes familiares de cáncer de tiroides","Ciertas condiciones genéticas","insulinoma","Insulinoma","Tumor raro del páncreas que produce un exceso de insulina.","cambios en el comportamiento o confusión","visión borrosa","pérdida del conocimiento o coma","convulsiones o temblor","mareo o dolor de cabeza","hambre entre comidas","sudoración","Tumor en el páncreas que produce demasiada insulina","Neoplasia endocrina múltiple tipo I","glucagonoma","Glucagonoma","Tumor raro del páncreas que produce un exceso de la hormona glucagón.","Hiperglucemia (nivel elevado de azúcar en la sangre)","Erupción cutánea característica (eritema necrolítico migratorio)","Desarrollo de un tumor en las células alfa del páncreas","Síndrome de Neoplasia Endocrina Múltiple tipo 1 (MEN1)","La mayoría de los casos son esporádicos y de causa desconocida","feocromocitoma","Tumor de la médula suprarrenal","Tumor raro de la glándula suprarrenal que produce un exceso de adrenalina y noradrenalina.","Presión arterial alta severa y episódica","Dolores de cabeza intensos","Sudoración profusa","Palpitaciones cardíacas","Tumor en las glándulas suprarrenales que produce un exceso de catecolaminas (adrenalina)","Asociado a síndromes genéticos","Trastorno raro que causa un desequilibrio de líquidos en el cuerpo, lo que provoca sed intensa y micción excesiva.","Trastorno autoinmune que es la causa más común de hipotiroidismo.","ginecomastia","Ginecomastia","Agrandamiento de las mamas en los hombres","Agrandamiento del tejido mamario en hombres, causado por un desequilibrio hormonal.","Agrandamiento del tejido mamario","Dolor y sensibilidad en los senos","Hinchazón en el área del pezón","Secreción del pezón","Presencia de un bulto debajo del pezón","Desequilibrios hormonales (disminución de testosterona y aumento de estrógeno)","Insuficiencia renal o hepática","Condiciones médicas subyacentes (tumores, hipogonadismo)","galactorrea","Galactorrea","Secreción láctea del pezón","Secreción de leche por los pezones que no está relacionada con la lactancia normal.","Secreción de leche por el pezón","Sequedad vaginal","Tumor benigno en la glándula pituitaria (prolactinoma)","Efectos secundarios de ciertos medicamentos","Insuficiencia renal crónica","Estimulación excesiva de los senos","pubertad-precoz","Pubertad Precoz","Aparición de los signos de la pubertad a una edad anormalmente temprana.","Desarrollo de senos antes de los 8 años en niñas","Agrandamiento de testículos antes de los 9 años en niños","Estirón de crecimiento temprano","Activación temprana del eje hipotálamo-hipófisis-gónadas","Tumores en los ovarios, testículos o glándulas suprarrenales","Anomalías del sistema nervioso central","retraso-de-la-pubertad","Retraso de la Pubertad","Ausencia de los signos de la pubertad a una edad en la que normalmente se esperarían.","Falta de desarrollo de los senos en las niñas después de los 13 años","Falta de aumento del tamaño de los testículos en los niños después de los 14 años","Ausencia de vello púbico","Baja estatura en comparación con sus compañeros","Ausencia de la menstruación en las niñas después de los 15 años","Antecedentes familiares de pubertad tardía","Enfermedades crónicas (como diabetes o fibrosis quística)","Desnutrición o trastornos de la alimentación","Problemas hormonales (disfunción de la glándula pituitaria o tiroides)","Afecciones genéticas","sindrome-de-kallmann","Síndrome de Kallmann","Hipogonadismo hipogonadotrópico con anosmia","Afección genética que causa pubertad tardía o ausente y un sentido del olfato alterado.","Pubertad retrasada o ausente","Sentido del olfato disminuido o ausente (anosmia o hiposmia)","Micropene y criptorquidia en niños","Amenorrea primaria en mujeres","Desarrollo incompleto o ausente de las mamas","Deficiencia de la hormona liberadora de gonadotropina (GnRH)","Migración neuronal alterada durante el desarrollo embrionario","Desarrollo anormal del bulbo olfatorio","sindrome-de-turner","Síndrome de Turner","Monosomía X","Afección cromosómica que afecta el desarrollo en las mujeres.","Baja estatura","Falta de desarrollo de los ovarios","Defectos cardíacos","Cuello ancho o palmeado","Orejas de implantación baja","Pecho ancho con pezones de gran separación","Monosomía del cromosoma X","Mosaicismo del cromosoma X","Anomalías del cromosoma X","sindrome-de-klinefelter","Síndrome de Klinefelter","47,XXY","Afección genética en la que un hombre nace con una copia extra del cromosoma X.","Testículos y pene pequeños","Crecimiento de los senos (ginecomastia)","Menos vello facial y corporal","Tono muscular reducido","Retraso en el habla","Brazos y piernas largos","Bajos niveles de testosterona","Error aleatorio en la división celular (meiosis) durante la formación de las células reproductoras (óvulos o espermatozoides)","Presencia de un cromosoma X adicional en cada célula (cariotipo 47,XXY)","Error en la división celular en las primeras etapas del desarrollo fetal (mosaicismo)","hiperplasia-suprarrenal-congenita","Hiperplasia Suprarrenal Congénita","HSC","Grupo de trastornos genéticos hereditarios que afectan las glándulas suprarrenales.","Crecimiento rápido","Voz grave","Acné grave","Genitales ambiguos en niñas","Deficiencia de la enzima 21-hidroxilasa","Trastorno autosómico recesivo","neoplasia-endocrina-multiple-tipo-1","Neoplasia Endocrina Múltiple Tipo 1","NEM1","Síndrome de Wermer","Trastorno hereditario raro que causa tumores en varias glándulas endocrinas.","Fracturas óseas","Úlceras en el estómago o los intestinos","Mutaciones en el gen MEN1","Ser un síndrome autosómico dominante","neoplasia-endocrina-multiple-tipo-2","Neoplasia Endocrina Múltiple Tipo 2","NEM2","Síndrome de Sipple","Trastorno hereditario que causa tumores en varias glándulas endocrinas y un alto riesgo de cáncer medular de tiroides.","Bultos en la garganta o el cuello","Dolor en los músculos y en las articulaciones","Problemas de memoria","Frecuencia cardíaca acelerada","Afección hereditaria","Gen alterado","bocio","Agrandamiento de la tiroides","Agrandamiento anormal de la glándula tiroides.","Hinchazón visible en la base del cuello","Sensación de opresión en la garganta","Enfermedad de Hashimoto o de Graves","Nódulos tiroideos","resistencia-a-la-hormona-tiroidea","Resistencia a la Hormona Tiroidea","RHT","Trastorno genético raro en el que los tejidos del cuerpo son resistentes a los efectos de las hormonas tiroideas.","Trastornos del desarrollo (baja estatura, retraso en la dentición, sordera)","Trastornos del sistema nervioso central (trastornos del aprendizaje, hiperactividad, déficit de atención)","Síntomas de hipertiroidismo","Fatiga y debilidad muscular","Mutaciones genéticas en el receptor de la hormona tiroidea (TRβ)","Alteraciones en el transporte celular de las hormonas tiroideas","Defectos en la conversión de T4 a T3","Enfermedad de Hashimoto","Trastornos de la glándula pituitaria","sistema-musculoesqueletico","Sistema Musculoesquelético","🦴","artritis","Inflamación articular","Poliartritis","Inflamación de una o más articulaciones, que provoca dolor y rigidez.","Hinchazón en las articulaciones","Enrojecimiento de la piel alrededor de la articulación","Disminución de la amplitud de movimiento","Desgaste del cartílago (osteoartritis)","Enfermedad autoinmune (artritis reumatoide)","Acumulación de ácido úrico (gota)","Huesos porosos","Pérdida de masa ósea","osteomalacia","Osteomalacia","Reblandecimiento óseo","Reblandecimiento de los huesos debido a una mineralización ósea deficiente.","Dolor óseo difuso","Fracturas frecuentes","Deficiencia severa de vitamina D","Problemas de absorción de vitamina D en el intestino","Enfermedad renal o hepática","sindrome-del-tunel-carpiano","Síndrome del túnel carpiano","Atrapamiento del nervio mediano","Compresión del nervio mediano","Afección que causa entumecimiento, hormigueo y debilidad en la mano y el brazo.","Hormigueo o entumecimiento en la mano y los dedos","Dolor en la muñeca o la mano","Debilidad en la mano","Sensación de descarga eléctrica en los dedos","Presión sobre el nervio mediano en la muñeca","Movimientos repetitivos de la mano y la muñeca","Condiciones médicas como la artritis reumatoide o la diabetes","tendinitis","Tendinitis","Inflamación del tendón","Tendinopatía","Inflamación o irritación de un tendón, las cuerdas fibrosas que unen el músculo al hueso.","Dolor en un tendón, especialmente con el movimiento","Sensibilidad al tacto en el área afectada","Hinchazón leve","Sensación de crepitación o crujido al mover el tendón","Sobrecarga o uso excesivo de un tendón","Lesión repentina","Enfermedades como la artritis reumatoide","desgarro-del-manguito-rotatorio","Desgarro del manguito rotatorio","Lesión del manguito de los rotadores","Ruptura del manguito rotatorio","Lesión en los tendones que rodean la articulación del hombro.","Dolor sordo y profundo en el hombro","Dificultad para levantar el brazo","Debilidad en el hombro","Dolor que empeora por la noche","Lesión traumática","Desgaste gradual por el envejecimiento","Movimientos repetitivos por encima de la cabeza","Levantamiento de objetos pesados","bursitis","Bursitis","Inflamación de la bursa","Higroma","Inflamación de las bursas, pequeños sacos llenos de líquido que amortiguan los huesos, tendones y músculos cerca de las articulaciones.","Sensibilidad en la articulación","Hinchazón y enrojecimiento","Rigidez en la articulación","Movimientos repetitivos o presión prolongada sobre una articulación","Lesión o traumatismo","Artritis o gota","distrofia-muscular","Distrofia muscular","Miopatía hereditaria","Grupo de enfermedades genéticas que causan debilidad y pérdida progresiva de la masa muscular.","Caídas frecuentes","Dificultad para levantarse o correr","Músculos de la pantorrilla agrandados","Mutaciones genéticas que interfieren con la producción de proteínas musculares","Herencia familiar","calambre-muscular","Calambre muscular","Espasmo muscular","Rampa","Contracción involuntaria y dolorosa de un músculo o grupo de músculos.","Contracción muscular súbita e involuntaria","Dolor agudo y localizado","Nudo muscular palpable","Desequilibrio de electrolitos","enfermedades-neuromusculares","Enfermedades neuromusculares","Trastornos neuromusculares","Miopatías","Amplio grupo de enfermedades que afectan los nervios que controlan los músculos voluntarios.","Espasmos musculares, calambres o tics","Pérdida de masa muscular","Dificultad para moverse, hablar o respirar","Trastornos autoinmunes","Exposición a toxinas o venenos","Enfermedad desmielinizante","fibromialgia","Fibromialgia","Síndrome de fibromialgia","Dolor musculoesquelético crónico","Trastorno caracterizado por dolor musculoesquelético generalizado acompañado de fatiga, sueño, memoria y problemas de estado de ánimo.","Dolor musculoesquelético generalizado","Problemas de sueño","Dificultades cognitivas (fibroniebla)","Infecciones previas","Trauma físico o emocional","miastenia-grave","Miastenia grave","Miastenia gravis","Debilidad muscular autoinmune","Enfermedad neuromuscular autoinmune que causa debilidad en los músculos esqueléticos.","Caída de uno o ambos párpados (ptosis)","Visión doble (diplopía)","Problemas para tragar","Dificultad para masticar","Cambios en las expresiones faciales","Debilidad en el cuello, brazos y piernas","Producción de anticuerpos que bloquean o destruyen los receptores musculares de acetilcolina","Problemas en la glándula del timo","Anticuerpos contra las proteínas MuSK o LRP4","Miastenia gravis seronegativa","miositis","Miositis","Inflamación muscular","Miopatía inflamatoria","Inflamación de los músculos, que puede ser causada por una lesión, una infección o una enfermedad autoinmune.","Enfermedad autoinmune","Infección (viral o bacteriana)","sarcoma-de-tejido-blando","Sarcoma de tejido blando","Tumor de partes blandas","Cáncer de tejido conectivo","Tipo de cáncer que se origina en los tejidos blandos del cuerpo, como músculos, grasa, vasos sanguíneos, nervios, tendones y revestimiento de las articulaciones.","Bulto o hinchazón notable","Dolor, si el bulto presiona nervios o músculos","Sangre en las heces o en el vómito","Heces negras y alquitranadas","Síndromes genéticos hereditarios","enfermedad-discal-degenerativa","Enfermedad discal degenerativa","Discopatía degenerativa","Desgaste de disco intervertebral","Afección en la que los discos intervertebrales de la columna se deterioran o rompen.","Dolor en la espalda, cuello, brazos o piernas","Entumecimiento y hormigueo en brazos y piernas","Debilidad en los músculos de las piernas","Dolor que empeora al estar sentado, de pie o caminando por períodos prolongados","Dolor agudo e intermitente","Desgaste natural de los discos por envejecimiento","Lesiones o traumatismos en la columna","Artritis y Osteoartritis","Sobrepeso u obesidad (IMC elevado)","epicondilitis","Epicondilitis","Codo de tenista","Epicondilalgia","Inflamación de los tendones que unen los músculos del antebrazo con la parte exterior del codo.","Dolor desde la parte exterior del codo hacia el antebrazo y la muñeca","Debilidad para estrechar las manos o sujetar un objeto","Dificultad para girar la perilla de una puerta","Dificultad para sostener una taza de café","Uso excesivo de la articulación y torsión muscular","Tensión repetida de los músculos del antebrazo","Movimientos repetitivos de la muñeca y el brazo","Lesión o afección que afecta los tejidos conectivos","distension-muscular","Distensión muscular","Tirón muscular","Desgarro muscular leve","Lesión en un músculo o tendón, las fibras que conectan los músculos con los huesos.","Dolor y dificultad de movimiento","Sensibilidad al tacto","Actividad física o esfuerzo excesivo","Calentamiento inadecuado antes de la actividad física","Movimientos repetitivos","Levantar objetos pesados de forma incorrecta","gota","Gota","Artritis gotosa","Hiperuricemia","Forma de artritis que se caracteriza por ataques repentinos y graves de dolor, hinchazón, enrojecimiento y sensibilidad en las articulaciones.","Dolor articular intenso y repentino","Hinchazón y enrojecimiento de la articulación","Sensibilidad extrema en la articulación afectada","Calor en la articulación","Acumulación de cristales de urato en una articulación","Niveles elevados de ácido úrico en la sangre","Dieta rica en purinas","espondilitis-anquilosante","Espondilitis anquilosante","Espondiloartritis anquilosante","Enfermedad de Bechterew","Tipo de artritis que causa inflamación en las articulaciones de la columna vertebral.","Dolor y rigidez en la parte baja de la espalda y las caderas","Dolor que empeora con el descanso y mejora con la actividad","Pérdida de flexibilidad en la columna","Enfermedad autoinmune inflamatoria","Factor genético (presencia del gen HLA-B27)","osteopenia","Osteopenia","Baja densidad ósea","Pre-osteoporosis","Condición en la que la densidad mineral ósea es más baja de lo normal, pero no lo suficiente como para ser considerada osteoporosis.","Generalmente asintomática","Huesos que se rompen con mucha más facilidad de lo esperado","Antecedentes familiares de osteopenia u osteoporosis","Ser de talla pequeña y delgada","Deficiencia de calcio y vitamina D","lumbalgia","Dolor de espalda baja","Lumbago","Dolor en la parte baja de la espalda, que puede ser agudo o crónico.","Dolor localizado en la parte baja de la espalda","Rigidez en la espalda","Dolor que se irradia hacia los glúteos o las piernas","Dificultad para moverse, agacharse o levantarse","Hormigueo o adormecimiento en las piernas o pies","Distensión muscular o de ligamentos","Hernia de disco o disco degenerado","fracturas-oseas","Fracturas Óseas","Hueso roto","Ruptura ósea","Rotura de un hueso, que puede ser completa o incompleta.","Dolor intenso","Deformidad visible de la extremidad","Incapacidad para mover la extremidad afectada","Chasquido o crujido en el momento de la lesión","Traumatismos (caídas, accidentes automovilísticos, lesiones deportivas)","Uso excesivo o estrés repetitivo en el hueso","Condiciones médicas que debilitan los huesos","escoliosis","Curvatura de la columna","Desviación de la columna","Curvatura lateral de la columna vertebral que ocurre con mayor frecuencia durante el período de crecimiento anterior a la pubertad.","Curvatura lateral de la columna vertebral","Hombros o caderas desiguales","Un omóplato que parece más prominente que el otro","Idiopática (causa desconocida) en la mayoría de los casos","Afecciones neuromusculares como la parálisis cerebral","Defectos de nacimiento que afectan la formación de la columna vertebral","Enfermedad autoinmune en la que el sistema inmunológico del cuerpo ataca por error el tejido sano.","AR","Artritis psoriásica","Artropatía psoriásica","Psoriasis artropática","Tipo de artritis que afecta a algunas personas con psoriasis.","ciatica","Ciática","Dolor del nervio ciático","Radiculopatía ciática","Dolor que se irradia a lo largo del trayecto del nervio ciático, que se ramifica desde la parte baja de la espalda a través de las caderas y los glúteos y baja por cada pierna.","Dolor que se irradia desde la espalda baja hacia la pierna","Entumecimiento u hormigueo en la pierna o el pie","Debilidad en la pierna o el pie","Dolor agudo o punzante","Sensación de ardor o descarga eléctrica","Síndrome piriforme","Edad","quiste-de-baker","Quiste de Baker","Quiste poplíteo","Bolsa de líquido detrás de la rodilla","Acumulación de líquido articular que forma un bulto detrás de la rodilla.","Hinchazón o bulto detrás de la rodilla","Dolor en la rodilla","Sensación de tirantez o rigidez detrás de la rodilla","Dificultad para flexionar la rodilla","Chasquido o bloqueo en la articulación de la rodilla","Artritis (especialmente osteoartritis)","Lesión de rodilla (como desgarros de meniscos)","Inflamación de la articulación de la rodilla","Producción excesiva de líquido sinovial","dedo-en-gatillo","Dedo en gatillo","Tenosinovitis estenosante","Dedo en resorte","Afección en la que uno de los dedos queda atascado en una posición de flexión.","Rigidez en el dedo, especialmente por la mañana","Sensación de chasquido o crujido al mover el dedo","Sensibilidad o un bulto en la palma de la mano, en la base del dedo afectado","El dedo se queda atascado o trabado en la posición de flexión y se estira con un chasquido de manera repentina","El dedo se traba en la posición de flexión","Agarre reiterado","Ocupaciones y pasatiempos que implican el uso repetitivo de las manos","Sexo femenino","sindrome-del-tunel-tarsiano","Síndrome del túnel tarsiano","Atrapamiento del nervio tibial","Neuralgia del nervio tibial posterior","Compresión del nervio tibial en el túnel tarsiano, un pasaje estrecho dentro del tobillo.","Dolor en el tobillo, pie y dedos","Hormigueo o ardor en la planta del pie","Entumecimiento en el pie","Debilidad en los músculos del pie","Sensación de choque eléctrico","Compresión del nervio tibial posterior","Lesiones en el tobillo","Pie plano","Enfermedades sistémicas como diabetes o artritis","Hinchazón crónica en los pies","enfermedad-de-de-quervain","Enfermedad de De Quervain","Tenosinovitis de De Quervain","Pulgar de esquiador","Afección dolorosa que afecta los tendones de la muñeca del lado del pulgar.","Dolor cerca de la base del pulgar","Hinchazón cerca de la base del pulgar","Dificultad para mover el pulgar y la muñeca","Dolor en un costado de la muñeca bajo la base del pulgar","Entumecimiento en los dedos pulgar e índice","Sensación de crujido en la muñeca","Movimientos repetitivos de la mano o la muñeca","Lesión en la muñeca o el tendón","Actividades que implican el uso repetitivo del pulgar y la muñeca","Piel dura","Grupo de enfermedades raras que implican el endurecimiento y la tirantez de la piel y los tejidos conectivos.","sindrome-de-ehlers-danlos","Síndrome de Ehlers-Danlos","SED","Hiperlaxitud articular","Grupo de trastornos hereditarios que afectan los tejidos conectivos, principalmente la piel, las articulaciones y las paredes de los vasos sanguíneos.","Articulaciones flexibles en exceso","Piel elástica","Piel frágil que se daña con facilidad","Dolor en las articulaciones y dislocaciones frecuentes","Cicatrización anormal","Trastorno hereditario del tejido conectivo","Mutaciones en diversos genes responsables de la síntesis de colágeno","Herencia autosómica dominante en la mayoría de los tipos","displasia-fibrosa","Displasia fibrosa","Trastorno óseo fibroso","Lesión fibro-ósea","Trastorno óseo poco común en el que se forma tejido similar a una cicatriz (fibroso) en lugar de hueso normal.","Lesiones óseas","Problemas hormonales","Fracturas o deformidades óseas","Color inusual de la piel (pigmentación)","Mutación genética espontánea que afecta a las células productoras de hueso","Ocurre durante el desarrollo fetal","No es hereditaria","lesiones-de-la-placa-de-crecimiento","Lesiones de la placa de crecimiento","Fractura de la fisis","Lesión epifisaria","Fracturas que afectan la placa de crecimiento o fisis, el área de tejido en crecimiento cerca de los extremos de los huesos largos en niños y adolescentes.","Dolor con o sin palpación","Imposibilidad de mover el área afectada","Calor e hinchazón en el extremo de un hueso","Deformidad visible en brazos o piernas","Caídas o golpes en la extremidad","Accidentes automovilísticos","Deportes competitivos","Actividades recreativas","Uso excesivo","Dorsalgia","Cervicalgia","Dolor que se siente en la espalda, que puede provenir de los músculos, nervios, huesos, articulaciones o otras estructuras en la columna vertebral.","osteoartritis","Osteoartritis","Artrosis degenerativa","Enfermedad articular degenerativa","Tipo más común de artritis, que ocurre cuando el cartílago protector que amortigua los extremos de los huesos se desgasta con el tiempo.","Dolor en las articulaciones durante o después del movimiento","Rigidez articular, especialmente por la mañana","Sensación de chirrido en la articulación","Desgaste del cartílago protector en los extremos de los huesos","artrosis","Osteoartrosis","Desgaste articular","Enfermedad degenerativa de las articulaciones que se caracteriza por el desgaste del cartílago.","Rigidez","Crujidos en la articulación","Sobrepeso u obesidad","Ciertas profesiones u deportes con movimientos repetitivos","contractura-muscular","Contractura muscular","Nudo muscular","Punto gatillo miofascial","Contracción persistente e involuntaria de un músculo o algunas de sus fibras.","Dolor y rigidez articular y muscular","Movimientos reducidos","Dolor localizado","Espasmos o endurecimiento palpable en la zona afectada","Sobreesfuerzo físico o sobreuso muscular","Movimientos bruscos","Posturas incorrectas o mantenidas","Estrés, ansiedad o tensión emocional","sistema-urinario","Sistema Urinario","infeccion-urinaria","Infección Urinaria","Infección del tracto urinario","ITU","Infección en cualquier parte del sistema urinario, como la vejiga, los riñones, los uréteres o la uretra.","Dolor en la parte baja del abdomen","Bacterias que ingresan a la uretra","Relaciones sexuales","Uso de diafragmas o espermicidas","cistitis","Cistitis","Infección de vejiga","Inflamación de la vejiga, generalmente causada por una infección bacteriana.","Necesidad urgente de orinar","Orina turbia o con sangre","Molestias en la parte inferior del abdomen","Infección bacteriana (E. coli)","Irritación por productos químicos","pielonefritis","Pielonefritis","Infección renal","Infección del riñón, un tipo de infección del tracto urinario que generalmente comienza en la uretra o la vejiga y viaja a uno o ambos riñones.","Dolor en la espalda o el costado","Infección urinaria no tratada","Reflujo vesicoureteral","calculos-renales","Cálculos Renales","Nefrolitiasis","Piedras en el riñón","Depósitos duros de minerales y sales que se forman dentro de los riñones.","Dolor intenso en la espalda o el costado","Acumulación de minerales y sales en la orina","Deshidratación crónica","Dieta rica en oxalatos o proteínas","incontinencia-urinaria","Incontinencia Urinaria","Pérdida de control de la vejiga","Pérdida del control de la vejiga, que provoca una fuga involuntaria de orina.","Pérdida involuntaria de orina","Necesidad repentina y fuerte de orinar","Goteo de orina después de orinar","Debilitamiento de los músculos del suelo pélvico","Daño a los nervios de la vejiga","Agrandamiento de la próstata en hombres","insuficiencia-renal","Insuficiencia Renal","Fallo renal","Afección en la que los riñones pierden la capacidad de filtrar adecuadamente los productos de desecho de la sangre.","Daño renal agudo","Enfermedad renal crónica","enfermedad-renal-cronica","Enfermedad Renal Crónica","ERC","Pérdida gradual de la función renal con el tiempo.","Cambios en la frecuencia urinaria","uretritis","Uretritis","Inflamación de la uretra","Inflamación de la uretra, el tubo que transporta la orina desde la vejiga hacia el exterior del cuerpo.","Secreción del pene o la vagina","Picazón o irritación en la uretra","Infecciones bacterianas no transmitidas sexualmente","Lesiones o irritación de la uretra","nefritis","Nefritis","Inflamación del riñón","Inflamación de los riñones, que puede afectar su capacidad para filtrar la sangre.","Hinchazón en la cara, las manos y los pies","Reacciones a medicamentos","nefrosis","Nefrosis","Síndrome nefrótico","Enfermedad renal no inflamatoria que se caracteriza por proteinuria, hipoalbuminemia y edema.","Hinchazón generalizada (edema)","Enfermedades sistémicas como la diabetes","hidronefrosis","Hidronefrosis","Riñón hinchado","Hinchazón de uno o ambos riñones debido a la acumulación de orina.","Dolor en el costado y la espalda","vejiga-neurogenica","Vejiga Neurogénica","Disfunción vesical neurogénica","Disfunción de la vejiga causada por un problema neurológico, como una lesión de la médula espinal o esclerosis múltiple.","Dificultad para vaciar la vejiga","Goteo de orina","Lesiones de la médula espinal","nocturia","Nocturia","Nicturia","Necesidad de despertarse y orinar varias veces durante la noche.","Despertarse dos o más veces por la noche para orinar","Interrupción del sueño","Fatiga diurna","Consumo excesivo de líquidos antes de dormir","Insuficiencia cardíaca","Afección crónica que causa presión y dolor en la vejiga, y a veces dolor pélvico.","cancer-de-vejiga","Cáncer de Vejiga","Crecimiento de células anormales en el revestimiento de la vejiga.","Sangre en la orina (hematuria)","Exposición a productos químicos industriales","Inflamación crónica de la vejiga","cancer-de-rinon","Cáncer de Riñón","Carcinoma de células renales","Crecimiento de células anormales en los riñones.","Dolor en el costado que no desaparece","Trastorno que causa un desequilibrio de líquidos en el cuerpo, lo que provoca sed intensa y micción frecuente.","enfermedad-poliquistica-renal","Enfermedad Poliquística Renal","PKD","Trastorno genético que se caracteriza por el crecimiento de numerosos quistes en los riñones.","Dolor de espalda o en los costados","Sensación de plenitud en el abdomen","Aumento del tamaño del abdomen","Mutaciones en los genes PKD1 o PKD2","Forma autosómica dominante (un solo padre afectado)","Forma autosómica recesiva (ambos padres portadores)","glomerulonefritis","Glomerulonefritis","Inflamación de los pequeños filtros de los riñones (glomérulos).","Orina de color rosa o cola (por la sangre)","Orina espumosa (por el exceso de proteína)","Hinchazón en la cara, las manos, los pies y el abdomen","Infecciones (estreptococos, hepatitis)","Enfermedades autoinmunes (lupus)","Vasculitis","sindrome-nefrotico","Síndrome Nefrótico","Trastorno renal que hace que el cuerpo excrete demasiadas proteínas en la orina.","Hinchazón grave (edema)","estenosis-de-la-arteria-renal","Estenosis de la Arteria Renal","Estrechamiento de las arterias que transportan sangre a los riñones.","Presión arterial alta difícil de controlar","Sonido sibilante en los vasos sanguíneos","Aumento de proteínas en la orina","Empeoramiento de la función renal","Hinchazón por retención de líquidos","Displasia fibromuscular","acidosis-tubular-renal","Acidosis Tubular Renal","Enfermedad que ocurre cuando los riñones no logran excretar los ácidos en la orina, lo que hace que la sangre permanezca demasiado ácida.","Crecimiento deficiente en niños","reflujo-vesicoureteral","Reflujo Vesicoureteral","RVU","Afección en la que la orina fluye hacia atrás desde la vejiga hacia uno o ambos uréteres y, a veces, hacia los riñones.","Anomalía congénita de las válvulas ureterales","Obstrucción de la vejiga","extrofia-vesical","Extrofia Vesical","Anomalía congénita rara en la que la vejiga se desarrolla fuera del feto.","Vejiga visible fuera del abdomen","Huesos púbicos ensanchados","Piernas y pies girados hacia afuera","Músculos abdominales anormales","Ombligo de implantación baja","Defecto del desarrollo fetal","Cierre inadecuado de la pared abdominal inferior","hipospadias","Hipospadias","Anomalía congénita en los varones en la que la abertura de la uretra no se encuentra en la punta del pene.","Abertura de la uretra en la parte inferior del pene","Curvatura del pene hacia abajo","Apariencia encapuchada del pene","Salpicaduras anormales al orinar","Edad materna avanzada (mayor de 35 años)","Exposición a ciertas sustancias durante el embarazo","epispadias","Epispadias","Anomalía congénita rara que afecta la abertura de la uretra.","Pene corto y ensanchado con una curvatura anormal","Abertura de la uretra en la parte superior o lateral del pene","Clítoris y labios vaginales anormales","Desarrollo inadecuado del hueso púbico","Puede ocurrir junto con extrofia vesical","Componente genético","sindrome-uremico-hemolitico","Síndrome Urémico Hemolítico","SUH","Afección que puede ocurrir después de una infección intestinal y que provoca insuficiencia renal.","Diarrea con sangre","Dolor de estómago","Infección por E. coli","Infecciones bacterianas o virales","nefropatia-por-iga","Nefropatía por IgA","Enfermedad de Berger","Enfermedad renal que se produce cuando un anticuerpo llamado inmunoglobulina A (IgA) se acumula en los riñones.","Hinchazón en manos y pies","Acumulación de la inmunoglobulina A (IgA) en los riñones","Factor genético","Infecciones respiratorias o gastrointestinales","vasculitis-renal","Vasculitis Renal","Inflamación de los vasos sanguíneos de los riñones.","Hinchazón de las piernas o los pies","Sarpullido en las nalgas o la parte inferior de las piernas","Infecciones como la hepatitis B y la hepatitis C","Enfermedades autoinmunitarias como el lupus, la artritis reumatoide y la esclerodermia","Cánceres de la sangre como la leucemia y el linfoma","estenosis-uretral","Estenosis Uretral","Cicatrización que estrecha el tubo que transporta la orina fuera del cuerpo (uretra).","Chorro de orina débil","Dificultad para empezar a orinar","Goteo después de orinar","Lesiones o traumatismos en la uretra","Infecciones de transmisión sexual","Procedimientos médicos previos","sistema-reproductor","Sistema Reproductor","endometriosis","Adenomyosis","Endometrioma","Trastorno en el que el tejido que normalmente recubre el interior del útero crece fuera del útero.","Dolor pélvico intenso, especialmente durante la menstruación","Períodos menstruales abundantes o irregulares","Dolor durante o después de las relaciones sexuales","Fatiga y problemas intestinales","Crecimiento de tejido similar al endometrio fuera del útero","Disfunción del sistema inmunológico","Menstruación retrógrada (flujo menstrual hacia la pelvis)","Síndrome de Ovario Poliquístico (SOP)","PCOS","Síndrome de Stein-Leventhal","Un trastorno hormonal común entre las mujeres en edad reproductiva.","enfermedad-inflamatoria-pelvica","Enfermedad Inflamatoria Pélvica (EIP)","Salpingitis","Ooforitis","Infección de los órganos reproductores femeninos.","Dolor en la parte baja del abdomen y la pelvis","Flujo vaginal anormal con mal olor","Sangrado entre períodos o después de las relaciones sexuales","Infección bacteriana que asciende desde la vagina o el cuello uterino","Infecciones de transmisión sexual (ITS) no tratadas, como clamidia y gonorrea","Duchas vaginales frecuentes que alteran el equilibrio bacteriano","Procedimientos ginecológicos previos","fibromas-uterinos","Fibromas Uterinos","Leiomiomas","Miomas","Tumores no cancerosos del útero que a menudo aparecen durante los años fértiles.","Sangrado menstrual abundante y prolongado","Presión o dolor pélvico","Necesidad de orinar con frecuencia","Estreñimiento y dolor de espalda","Crecimiento no canceroso de tejido muscular en el útero","Factores hormonales, especialmente estrógeno y progesterona","cancer-de-ovario","Cáncer de Ovario","Carcinoma de ovario","Un crecimiento de células que se forma en los ovarios.","Hinchazón o inflamación abdominal persistente","Sensación de saciedad rápida al comer","Dolor pélvico o abdominal","Necesidad de orinar con más frecuencia o urgencia","Fatiga extrema y pérdida de peso inexplicable","Mutaciones genéticas hereditarias (BRCA1 y BRCA2)","Antecedentes familiares de cáncer de ovario, mama o colorrectal","Edad avanzada (postmenopausia)","Endometriosis o terapia de reemplazo hormonal","cancer-de-cuello-uterino","Cáncer de Cuello Uterino","Cáncer cervical","Un tipo de cáncer que se produce en las células del cuello uterino.","Sangrado vaginal anormal (entre períodos, después de las relaciones sexuales o después de la menopausia)","Flujo vaginal inusual, a veces con sangre","Dolor pélvico o durante las relaciones sexuales","Problemas para orinar o defecar","Infección persistente por el virus del papiloma humano (VPH)","Uso prolongado de anticonceptivos orales","prolapso-de-organos-pelvicos","Prolapso de Órganos Pélvicos","Cistocele","Rectocele","Ocurre cuando los músculos y ligamentos que sostienen los órganos pélvicos de una mujer se debilitan.","Sensación de pesadez o presión en la pelvis","Bulto o protuberancia en la vagina","Incontinencia urinaria o fecal","Dificultad para vaciar la vejiga o los intestinos","Dolor lumbar","Debilitamiento de los músculos y ligamentos del suelo pélvico","Embarazo y parto vaginal","Envejecimiento y menopausia","Obesidad y tos crónica","vaginosis-bacteriana","Vaginosis Bacteriana","VB","Un tipo de inflamación vaginal causada por el crecimiento excesivo de bacterias que se encuentran naturalmente en la vagina.","Flujo vaginal anormal (blanco o grisáceo)","Olor vaginal fuerte y desagradable (a pescado)","Picazón o irritación vaginal","Desequilibrio de la flora bacteriana normal de la vagina","Duchas vaginales frecuentes","candidiasis-vaginal","Candidiasis Vaginal","Infección por levaduras","Una infección por hongos que causa irritación, secreción y picazón intensa en la vagina y la vulva.","Picazón y ardor intensos en la vagina y la vulva","Flujo vaginal espeso, blanco y grumoso (similar al requesón)","Enrojecimiento e hinchazón de la vulva","Crecimiento excesivo del hongo Candida albicans","Uso de antibióticos","Diabetes no controlada","menopausia","Menopausia","Climaterio","El momento que marca el final de los ciclos menstruales.","Sofocos y sudores nocturnos","Irregularidades menstruales hasta el cese de la menstruación","Sequedad vaginal y disminución de la libido","Cambios de humor, irritabilidad y problemas para dormir","Piel seca y adelgazamiento del cabello","Disminución natural de la producción de estrógeno y progesterona por los ovarios","Envejecimiento (generalmente entre los 45 y 55 años)","Extirpación quirúrgica de los ovarios (histerectomía)","Tratamientos contra el cáncer como quimioterapia o radioterapia","sindrome-premenstrual","Síndrome Premenstrual (SPM)","Tensión premenstrual","Un conjunto de síntomas físicos y emocionales que comienzan una o dos semanas antes del período de una mujer.","Hinchazón y sensibilidad en los senos","Cambios de humor, irritabilidad y ansiedad","Fatiga y dificultad para concentrarse","Antojos de alimentos y aumento de peso","Dolores de cabeza y musculares","Fluctuaciones hormonales del ciclo menstrual","Cambios en los niveles de serotonina en el cerebro","Deficiencias de vitaminas y minerales","disfuncion-erectil","Disfunción Eréctil","Impotencia","La incapacidad de conseguir o mantener una erección lo suficientemente firme para tener relaciones sexuales.","Dificultad para lograr una erección","Dificultad para mantener una erección","Enfermedades cardíacas y vasculares","Diabetes y obesidad","Trastornos neurológicos (esclerosis múltiple, Parkinson)","Factores psicológicos como estrés, ansiedad o depresión","prostatitis","Prostatitis","Inflamación de la próstata","Hinchazón e inflamación de la glándula prostática.","Dificultad para orinar, como goteo o vacilación urinaria","Dolor en la ingle, el área pélvica o los genitales","Eyaculación dolorosa","Síntomas similares a los de la gripe (en la prostatitis bacteriana aguda)","Infección bacteriana que se disemina desde el tracto urinario","Inflamación no bacteriana","Daño a los nervios en el tracto urinario inferior debido a una cirugía o traumatismo","Estrés y factores emocionales","hiperplasia-prostatica-benigna","Hiperplasia Prostática Benigna (HPB)","Un agrandamiento no canceroso de la glándula prostática.","Chorro de orina débil o que se detiene y comienza","Goteo al final de la micción","Incapacidad para vaciar completamente la vejiga","Agrandamiento no canceroso de la glándula prostática","Cambios hormonales relacionados con el envejecimiento (disminución de testosterona)","cancer-de-prostata","Cáncer de Próstata","Carcinoma de próstata","Un cáncer en la próstata de un hombre, una pequeña glándula del tamaño de una nuez que produce el líquido seminal.","Flujo de orina débil o interrumpido","Sangre en la orina o en el semen","Dolor en la espalda, las caderas o la pelvis","Edad avanzada (el riesgo aumenta después de los 50 años)","Antecedentes familiares de cáncer de próstata","Factores genéticos y mutaciones hereditarias","cancer-de-testiculo","Cáncer de Testículo","Carcinoma testicular","Un crecimiento de células que se forma en los testículos.","Bulto o hinchazón indolora en un testículo","Dolor sordo en el abdomen o la ingle","Acumulación repentina de líquido en el escroto","Dolor o molestia en un testículo o en el escroto","Criptorquidia (testículo no descendido)","Antecedentes familiares de cáncer de testículo","Infección por VIH","Carcinoma in situ testicular","varicocele","Varicocele","Venas varicosas del escroto","Un agrandamiento de las venas dentro de la bolsa de piel suelta que contiene los testículos (escroto).","Venas agrandadas y retorcidas en el escroto (a menudo descritas como una \'bolsa de gusanos\')","Dolor sordo o molestia en el escroto","Atrofia testicular (encogimiento de un testículo)","Mal funcionamiento de las válvulas dentro de las venas del cordón espermático","Compresión de una vena por una estructura cercana","Generalmente ocurre en el lado izquierdo debido a la posición de la vena testicular izquierda","hidrocele","Hidrocele","Acumulación de líquido en el escroto","Un tipo de hinchazón en el escroto que ocurre cuando se acumula líquido en la delgada vaina que rodea un testículo.","Hinchazón indolora de uno o ambos testículos","El tamaño de la hinchazón puede variar a lo largo del día","Acumulación de líquido en la túnica que rodea el testículo","Obstrucción del flujo de líquido o sangre en el cordón espermático","Inflamación o lesión del testículo o epidídimo","Puede ser congénito en los bebés","epididimitis","Epididimitis","Inflamación del epidídimo","Inflamación del tubo en la parte posterior del testículo que almacena y transporta los espermatozoides.","Dolor y sensibilidad en un testículo, que empeora gradualmente","Escroto hinchado, enrojecido o caliente","Dolor al orinar o necesidad urgente de orinar","Secreción del pene","Dolor durante la eyaculación","Infección bacteriana, a menudo por ITS como clamidia o gonorrea","Infección del tracto urinario o de la próstata","Obstrucción en la uretra","Traumatismo o lesión en la ingle","orquitis","Orquitis","Inflamación de los testículos","Inflamación de uno o ambos testículos.","Hinchazón y dolor intenso en uno o ambos testículos","Sensibilidad extrema en el escroto","Sangre en el semen","Infección viral, más comúnmente por el virus de las paperas","Infección bacteriana, a menudo como resultado de una epididimitis no tratada","infertilidad","Esterilidad","No poder quedar embarazada (concebir) a pesar de tener relaciones sexuales frecuentes y sin protección durante al menos un año.","Incapacidad para concebir","Cambios en el deseo sexual","Secreción lechosa de los pezones no relacionada con la lactancia","Trastornos de la ovulación","Anomalías en el útero o el cuello uterino","Daño o obstrucción de las trompas de Falopio","Azoospermia","clamidia","Clamidia","Infección por Chlamydia trachomatis","Una infección de transmisión sexual (ITS) común que puede infectar tanto a hombres como a mujeres.","Secreción anormal del pene o la vagina","Dolor en la parte baja del abdomen o dolor testicular","Infección por la bacteria Chlamydia trachomatis","gonorrea","Gonorrea","Blenorragia","Una infección causada por una bacteria de transmisión sexual que infecta tanto a hombres como a mujeres.","Secreción anormal del pene (blanca, amarilla o verde) o aumento del flujo vaginal","Dolor e hinchazón en los testículos (en hombres)","Sangrado entre períodos (en mujeres)","Infección por la bacteria Neisseria gonorrhoeae","herpes-genital","Herpes Genital","Virus del herpes simple","Una infección de transmisión sexual (ITS) común marcada por dolor y llagas en los genitales.","Dolor o picazón en el área genital, glúteos o muslos internos","Pequeñas ampollas o úlceras dolorosas","Costras que se forman cuando las úlceras sanan","Síntomas similares a la gripe, como fiebre y dolores musculares","Infección por el virus del herpes simple (VHS-1 o VHS-2)","Contacto sexual con una persona infectada, incluso si no tiene llagas visibles","Contacto piel con piel con un área infectada","virus-del-papiloma-humano","Virus del Papiloma Humano (VPH)","HPV","Una infección viral que se transmite entre personas a través del contacto piel con piel.","Verrugas genitales (pequeñas protuberancias o grupos de protuberancias en el área genital)","Verrugas en otras áreas como las manos o los pies","En casos de alto riesgo, puede llevar a cáncer cervical, anal, de pene o de garganta","Infección por el virus del papiloma humano (VPH)","Contacto piel con piel durante la actividad sexual con una persona infectada","sifilis","Sífilis","Lúes","Una infección bacteriana que generalmente se transmite por contacto sexual.","Aparición de una úlcera indolora (chancro) en los genitales, recto o boca","Erupción cutánea que no pica, a menudo en las palmas de las manos y las plantas de los pies","Fiebre, inflamación de los ganglios linfáticos y dolor de garganta","En etapas tardías, puede causar daño neurológico y cardiovascular","Infección por la bacteria Treponema pallidum","Contacto directo con una llaga de sífilis durante la actividad sexual","Transmisión de madre a hijo durante el embarazo","tricomoniasis","Tricomoniasis","Trich","Una infección de transmisión sexual (ITS) muy común causada por un parásito.","Secreción vaginal anormal (amarillenta-verdosa, espumosa y con mal olor)","Picazón, ardor o enrojecimiento en la zona genital","Dolor o molestias al orinar","Sangrado o manchado intermenstrual","Infección por el parásito protozoario Trichomonas vaginalis","Transmisión a través de relaciones sexuales sin protección","Antecedentes de otras infecciones de transmisión sexual (ITS)","embarazo-ectopico","Embarazo Ectópico","Embarazo tubárico","Un embarazo en el que el óvulo fertilizado se implanta fuera del útero.","Sangrado vaginal anormal","Dolor agudo en el abdomen, la pelvis, el hombro o el cuello","Dolor en un lado de la pelvis","Ausencia de periodos","Daño en las trompas de Falopio","Enfermedad inflamatoria pélvica (EIP)","Edad mayor a 35 años","Cirugía previa en las trompas de Falopio","preeclampsia","Preeclampsia","Toxemia del embarazo","Una complicación del embarazo caracterizada por presión arterial alta y signos de daño en otro sistema de órganos, más a menudo el hígado y los riñones.","Proteína en la orina","Hinchazón de manos, pies y cara","Dolores de cabeza que no desaparecen","Dolor abdominal en el lado derecho","Embarazo múltiple","Ser mayor de 35 años","Ser afroamericana","Tener un historial familiar de preeclampsia","placenta-previa","Placenta Previa","Implantación baja de la placenta","Un problema durante el embarazo en el que la placenta crece en la parte más baja del útero y cubre toda o parte de la abertura hacia el cuello uterino.","Sangrado vaginal de color rojo brillante sin dolor","Manchas de sangre antes de una hemorragia mayor","Contracciones uterinas prematuras y dolorosas","Sangrado postcoital o durante un examen médico","Cesárea previa","Cicatrices uterinas por cirugías anteriores","Placenta previa en embarazo anterior","Embarazo por reproducción asistida","Gestación múltiple","Edad materna avanzada (más de 35 años)","Consumo de cocaína","aborto-espontaneo","Aborto Espontáneo","Pérdida del embarazo","La pérdida espontánea de un embarazo antes de la semana 20.","Sangrado vaginal con o sin dolor","Dolor o calambres en la zona pélvica o en la parte baja de la espalda","Líquido o tejido que sale de la vagina","Latidos rápidos del corazón","Genes o cromosomas irregulares","Afecciones de salud materna","Edad mayor de 35 años","Abortos espontáneos anteriores","Fumar, consumir alcohol, cafeína y drogas ilícitas","dispareunia","Dispareunia","Coito doloroso","Dolor genital persistente o recurrente que ocurre justo antes, durante o después de las relaciones sexuales.","Dolor durante la penetración sexual","Dolor profundo en la pelvis durante el coito","Ardor o picazón en la zona genital","Disminución de la lubricación vaginal","Sangrado leve después del coito","Sequedad vaginal por falta de lubricación","Infecciones vaginales o del tracto urinario","Vaginismo (contracción involuntaria de los músculos vaginales)","Factores psicológicos como ansiedad o estrés","eyaculacion-precoz","Eyaculación Precoz","Eyaculación rápida","Ocurre cuando un hombre eyacula antes de lo que él o su pareja desearían durante las relaciones sexuales.","Eyaculación que ocurre siempre o casi siempre antes o dentro del primer minuto de la penetración","Incapacidad para retrasar la eyaculación","Angustia y frustración, que llevan a evitar la intimidad sexual","Factores psicológicos como ansiedad de rendimiento o depresión","Niveles hormonales anormales","Inflamación o infección de la próstata o la uretra","Rasgos hereditarios","anorgasmia","Anorgasmia","Disfunción orgásmica","Dificultad o incapacidad para alcanzar el orgasmo.","Retraso del orgasmo","Ausencia del orgasmo","Menos orgasmos","Orgasmos menos intensos","Factores psicológicos como abuso o trauma","Problemas en la relación de pareja","Ciertas enfermedades y medicamentos","Cambios corporales relacionados con la edad","Una afección crónica que causa presión en la vejiga, dolor en la vejiga y, a veces, dolor pélvico.","enfermedades-de-la-piel","Enfermedades de la Piel","🖐️","acne","Acné vulgar","Espinillas","Barros","Enfermedad de la piel que ocurre cuando los folículos pilosos se tapan con grasa y células cutáneas muertas.","Espinillas y puntos negros","Pústulas o granos con pus","Nódulos y quistes dolorosos bajo la piel","Producción excesiva de sebo por las glándulas sebáceas","Obstrucción de los folículos pilosos por células muertas y sebo","Actividad de la bacteria Propionibacterium acnes","Cambios hormonales, especialmente durante la pubertad y el ciclo menstrual","eczema","Eczema","Dermatitis atópica","Eccema","Afección que hace que la piel se seque, pique e inflame.","Piel seca y sensible","Enrojecimiento e inflamación","Piel escamosa o con costras","Predisposición genética y antecedentes familiares","Factores ambientales como alérgenos, irritantes y clima seco","dermatitis-de-contacto","Dermatitis de contacto","Dermatitis alérgica","Dermatitis irritante","Erupción cutánea rojiza que pica y que aparece por contacto directo con una sustancia o por una reacción alérgica a esta.","Erupción roja en la zona de contacto","Picazón y ardor intensos","Ampollas que pueden supurar","Piel seca, agrietada o escamosa","Contacto directo con una sustancia irritante (jabones, químicos)","Reacción alérgica a una sustancia (níquel, cosméticos, plantas)","urticaria","Ronchas","Habones","Reacción de la piel que causa ronchas con picazón.","Ronchas o habones rojos y elevados","Las ronchas aparecen y desaparecen en horas","Hinchazón de labios, ojos o garganta (angioedema)","Reacción alérgica a alimentos, medicamentos o picaduras de insectos","Estrés físico o emocional","rosacea","Rosácea","Acné rosácea","Afección que provoca piel rojiza y, a menudo, pequeños bultos llenos de pus en la cara.","Enrojecimiento persistente en el centro del rostro","Pequeños vasos sanguíneos visibles (telangiectasias)","Granos o pústulas similares al acné","Engrosamiento de la piel, especialmente en la nariz (rinofima)","Anormalidades en los vasos sanguíneos faciales","Reacción a ácaros microscópicos (Demodex folliculorum)","Desencadenantes como el sol, el calor, el alcohol y comidas picantes","micosis-cutanea","Micosis cutánea","Tiña","Infección de la piel causada por hongos.","Manchas rojas, escamosas y con picazón","Forma de anillo con bordes elevados (tiña)","Piel agrietada o macerada, especialmente entre los dedos","Cambios en las uñas (engrosamiento, decoloración)","Infección por hongos dermatofitos","Ambientes cálidos y húmedos que favorecen el crecimiento de hongos","Contacto directo con una persona o superficie infectada","verrugas","Verrugas","Verruga vulgar","Ojo de pescado","Pequeños crecimientos en la piel causados por el virus del papiloma humano (VPH).","Pequeñas protuberancias carnosas y granulosas","Superficie rugosa al tacto","Pueden aparecer puntos negros (vasos sanguíneos coagulados)","Generalmente indoloras, pero pueden causar molestias","Infección por el Virus del Papiloma Humano (VPH)","Contacto directo con la piel de una persona con verrugas","Psoriasis en placas","Enfermedad de la piel que causa un sarpullido con manchas rojas y escamosas que pican, principalmente en las rodillas, los codos, el tronco y el cuero cabelludo.","Vitíligo","Leucoderma","Enfermedad que causa la pérdida de color de la piel en manchas.","melanoma","Melanoma","Cáncer de piel","El tipo más grave de cáncer de piel, que se desarrolla en las células (melanocitos) que producen melanina.","Aparición de un nuevo lunar o cambio en uno existente","Asimetría, borde irregular, color variado y diámetro mayor a 6 mm (regla ABCDE)","Puede causar picazón, sangrado o ulceración","Exposición excesiva a la radiación ultravioleta (UV) del sol o camas de bronceado","Antecedentes familiares de melanoma","Tener muchos lunares o lunares atípicos","carcinoma-basocelular","Carcinoma basocelular","Cáncer de piel no melanoma","Tipo de cáncer de piel que comienza en las células basales.","Bulto ceroso o perlado","Lesión plana, similar a una cicatriz, de color carne o marrón","Úlcera que sangra, cicatriza y se vuelve a abrir","Suele aparecer en zonas expuestas al sol","Exposición crónica a la radiación UV del sol","Piel clara, cabello rubio o rojo y ojos claros","carcinoma-espinocelular","Carcinoma espinocelular","Carcinoma de células escamosas","Tipo de cáncer de piel que comienza en las células escamosas.","Nódulo rojo y firme","Lesión plana con una superficie escamosa y con costras","Nueva úlcera o área elevada sobre una cicatriz o úlcera preexistente","Puede crecer rápidamente y hacer metástasis","Exposición acumulada a la radiación UV","Exposición a ciertos químicos como el arsénico","Sistema inmunitario suprimido o trasplante de órganos","queratosis-pilaris","Queratosis pilaris","Piel de gallina","Afección cutánea inofensiva que causa pequeñas protuberancias y zonas ásperas.","Pequeños bultos ásperos, similares a la piel de gallina","Suelen aparecer en brazos, muslos, mejillas o glúteos","La piel se siente como papel de lija","Puede haber enrojecimiento o inflamación leve","Acumulación de queratina que obstruye los folículos pilosos","Condición genética asociada a la piel seca","Suele empeorar en climas secos y durante el invierno","Alopecia areata","Pérdida de cabello en parches","Afección que causa la caída del cabello en pequeñas manchas.","hiperhidrosis","Hiperhidrosis","Sudoración anormalmente excesiva que no está necesariamente relacionada con el calor o el ejercicio.","Sudoración excesiva que no está relacionada con el calor o el ejercicio","Afecta principalmente a palmas, plantas, axilas o cara","La piel puede volverse blanda, blanca y descamarse","Interfiere con las actividades diarias","Hiperactividad de las glándulas sudoríparas","Puede ser una condición hereditaria (hiperhidrosis primaria)","Causada por otra condición médica o medicamento (hiperhidrosis secundaria)","impetigo","Impétigo","Infección cutánea bacteriana","Infección cutánea común y muy contagiosa que afecta principalmente a bebés y niños.","Llagas rojas que se rompen, supuran y forman una costra de color miel","Suele aparecer alrededor de la nariz y la boca","Picazón y dolor leve","Altamente contagioso","Infección bacteriana de la piel, generalmente por Staphylococcus aureus o Streptococcus pyogenes","Las bacterias entran a través de cortes, rasguños o picaduras de insectos","Más común en niños y en condiciones de hacinamiento","molusco-contagioso","Molusco contagioso","Verrugas de agua","Infección viral de la piel que produce protuberancias redondas, firmes e indoloras.","Pequeñas protuberancias redondas, firmes y del color de la piel o rosadas","Tienen un pequeño hoyuelo o punto en el centro","Pueden causar picazón o irritación","Aparecen en cualquier parte del cuerpo","Infección viral causada por un poxvirus","Se transmite por contacto directo piel con piel o a través de objetos contaminados","Común en niños, personas con dermatitis atópica y con sistemas inmunitarios debilitados","penfigo","Pénfigo","Enfermedad ampollosa","Enfermedad autoinmune que causa ampollas y llagas en la piel o las membranas mucosas.","Ampollas flácidas y dolorosas en la piel y mucosas (boca, garganta)","Las ampollas se rompen fácilmente, dejando erosiones que no cicatrizan","Piel que se desprende al frotarla (signo de Nikolsky positivo)","Enfermedad autoinmune en la que los anticuerpos atacan las proteínas que unen las células de la piel","Puede ser inducido por ciertos medicamentos","dermatitis-seborreica","Dermatitis seborreica","Caspa","Costra láctea","Afección cutánea común que afecta principalmente al cuero cabelludo y causa manchas escamosas, piel enrojecida y caspa persistente.","Piel escamosa, amarillenta o blanquecina en zonas grasas (cuero cabelludo, cara, pecho)","Enrojecimiento y picazón","Caspa persistente","En bebés, se conoce como costra láctea","Reacción inflamatoria a un hongo tipo levadura (Malassezia) que vive en la piel","Producción excesiva de sebo","Factores hormonales y genéticos","Liquen plano","Erupción pruriginosa","celulitis","Celulitis","Infección bacteriana de la piel","Infección bacteriana de la piel común y potencialmente grave.","Área de piel roja, hinchada, caliente y dolorosa","La piel puede tener un aspecto de hoyuelos o cáscara de naranja","Puede extenderse rápidamente","Infección bacteriana de las capas profundas de la piel (dermis y tejido subcutáneo)","Generalmente causada por Staphylococcus y Streptococcus","Las bacterias ingresan por una ruptura en la piel","erisipela","Erisipela","Infección cutánea superficial","Infección bacteriana de las capas superiores de la piel.","Lesión roja, brillante, elevada y bien delimitada","Sensación de ardor y dolor intenso","Fiebre alta, escalofríos y malestar","Afecta con mayor frecuencia las piernas y la cara","Infección bacteriana de las capas superiores de la piel, principalmente por Streptococcus pyogenes","Entrada de bacterias a través de cortes, úlceras o problemas de drenaje linfático","foliculitis","Foliculitis","Infección del folículo piloso","Inflamación de los folículos pilosos, generalmente causada por una infección bacteriana o fúngica.","Pequeños granos rojos o con punta blanca alrededor de los folículos pilosos","Picazón o sensibilidad en la zona afectada","Puede convertirse en úlceras con costras","Común en áreas de afeitado, fricción o sudoración","Infección o inflamación de los folículos pilosos, a menudo por la bacteria Staphylococcus aureus","Fricción de la ropa, afeitado o bloqueo de los folículos","Exposición a agua caliente contaminada (foliculitis de la bañera)","forunculos","Forúnculos","Abscesos cutáneos","Infección dolorosa y llena de pus que se forma debajo de la piel cuando las bacterias infectan y inflaman uno o más folículos pilosos.","Protuberancia roja, hinchada y dolorosa en la piel","Pus visible en el centro de la protuberancia","Sensibilidad y dolor en la zona afectada","Aumento de tamaño del bulto con el tiempo","Posible desarrollo de fiebre y malestar general","Calor en la zona afectada","Infección del folículo piloso por la bacteria Staphylococcus aureus","Fricción o irritación de la piel","Condiciones de la piel como acné o eczema","Mala higiene","hidradenitis-supurativa","Hidradenitis supurativa","Acné inverso","Enfermedad crónica de la piel que se caracteriza por bultos pequeños y dolorosos debajo de la piel.","Espinillas negras","Protuberancias dolorosas del tamaño de un guisante","Bultos o llagas que supuran","Túneles que conectan los bultos debajo de la piel","Obstrucción de los folículos pilosos","Hormonas","ictiosis-vulgar","Ictiosis vulgar","Piel de pescado","Afección hereditaria de la piel en la que las células cutáneas muertas se acumulan en escamas gruesas y secas en la superficie de la piel.","Piel seca y escamosa","Engrosamiento de la piel","Piel áspera y agrietada","Aumento de las líneas en las palmas de las manos y plantas de los pies","Mutación genética en el gen que codifica la proteína filagrina","Herencia autosómica dominante","melasma","Melasma","Cloasma","Máscara del embarazo","Afección cutánea común que causa manchas oscuras y descoloridas en la piel.","Cambio de color de la piel a un café uniforme","Manchas oscuras en las mejillas, frente, nariz y labio superior","Parches oscuros simétricos","Sufrimiento respecto a la apariencia","Hormonas femeninas estrógeno y progesterona","Pastillas anticonceptivas","Terapia de reemplazo hormonal","nevos-melanociticos","Nevos melanocíticos","Lunares","Crecimientos comunes en la piel, generalmente de color marrón o negro.","Manchas en la piel de color marrón o negruzco","Lesiones planas o elevadas","Superficie lisa, rugosa o velluda","Generalmente asintomáticos","En raras ocasiones pueden causar picazón, dolor o sangrado","Proliferación benigna de melanocitos","Exposición a la radiación ultravioleta del sol","pitiriasis-rosada","Pitiriasis rosada","Erupción de árbol de Navidad","Erupción cutánea que generalmente comienza como una mancha grande circular u ovalada en el pecho, el abdomen o la espalda.","Comienza con una mancha grande y ovalada llamada \'parche heráldico\'","A los pocos días, aparecen manchas más pequeñas en el pecho, espalda y abdomen","Las lesiones siguen un patrón similar a un \'árbol de Navidad\'","Puede causar picazón leve","Causa exacta desconocida, pero se cree que está relacionada con una infección viral (posiblemente un tipo de herpesvirus)","No es contagiosa","Suele resolverse por sí sola en 6-8 semanas","prurigo-nodular","Prurigo nodular","Dermatitis nodular","Enfermedad de la piel que se caracteriza por bultos que pican (nódulos) en la piel.","Nódulos firmes y pruriginosos en la piel","Picor extremo y persistente","Piel engrosada o con costras","Heridas o escoriaciones por rascado","Sensación de ardor o escozor en la piel","Nódulos de color piel o marrón rojizo","Función alterada del sistema inmunitario y de los nervios de la piel","Eccema (dermatitis atópica)","Enfermedad renal","Enfermedad hepática","sarna","Sarna","Escabiosis","Afección de la piel que pica causada por un pequeño ácaro excavador llamado Sarcoptes scabiei.","Picazón intensa, especialmente por la noche","Erupción con pequeños granos o ampollas","Líneas finas y onduladas en la piel (túneles del ácaro)","Afecta pliegues de la piel como muñecas, codos y entre los dedos","Infestación de la piel por el ácaro Sarcoptes scabiei","El ácaro excava túneles en la capa superior de la piel para poner huevos","Se transmite por contacto cercano y prolongado con una persona infestada","tiña-versicolor","Tiña versicolor","Pitiriasis versicolor","Infección fúngica común de la piel que interfiere con la pigmentación normal de la piel, lo que resulta en pequeñas manchas descoloridas.","Manchas en la piel más claras o más oscuras que la piel circundante","Manchas que no se broncean con el sol","Manchas que pueden ser de color blanco, rosado, rojo o marrón","Piel escamosa","Crecimiento excesivo del hongo Malassezia en la piel","Clima cálido y húmedo","xantelasma","Xantelasma","Depósitos de colesterol","Depósito amarillento de grasa (lípidos) debajo de la piel, generalmente en o alrededor de los párpados.","Protuberancias bajo la piel con bordes definidos","Placas amarillentas en los párpados","Erupciones cutáneas de diferentes formas","Nódulos amarillos en los párpados","Lesiones amarillas o rojizas en los párpados","Niveles altos de colesterol","Mala alimentación","Vida sedentaria","dermatofibroma","Dermatofibroma","Histiocitoma fibroso","Bulto pequeño y no canceroso (benigno) que se desarrolla en la piel.","Pápulas o nódulos pequeños y firmes","Color rojo amarronado o violáceo","Prurito o picazón ocasional","Dolor o sensibilidad al tacto","Signo del hoyuelo (la lesión se hunde al presionarla)","Irritación o sangrado por traumatismo menor","Reacción a traumatismos menores (como picaduras de insecto)","Formación de quistes en folículos pilosos","Asociación con enfermedades sistémicas (casos raros)","granuloma-anular","Granuloma anular","Erupción en anillo","Afección cutánea crónica que causa una erupción en forma de anillo, generalmente en las manos y los pies.","Erupción elevada o protuberancias en forma de anillo","Bordes de la erupción circulares o semicirculares","Malestar o picazón","Pequeños bultos firmes debajo de la piel","Mordeduras de animales o insectos","Infecciones como la hepatitis","Pruebas cutáneas de tuberculina","Vacunas","Lesiones cutáneas menores","Medicamentos","Enfermedad de la tiroides","queratosis-actinica","Queratosis actínica","Queratosis solar","Mancha áspera y escamosa en la piel que se desarrolla a partir de años de exposición al sol.","Parche áspero, seco y escamoso en la piel","Varía en color (rosa, rojo o marrón)","Suele aparecer en áreas expuestas al sol como cara, cuero cabelludo, manos y brazos","Considerada una lesión precancerosa","Exposición crónica y a largo plazo a la radiación ultravioleta (UV) del sol","Más común en personas de piel clara y mayores de 40 años","lentigo-solar","Lentigo solar","Manchas de la edad","Manchas hepáticas","Manchas oscuras en la piel causadas por la exposición al sol.","Áreas planas y ovaladas de pigmentación intensificada","Color marrón claro a marrón oscuro","Aparición en zonas expuestas al sol como el dorso de las manos, los empeines, el rostro, los hombros y la parte alta de la espalda","Tamaño que varía desde el de una peca hasta aproximadamente 13 mm de diámetro","Tendencia a agruparse, lo que las hace más notorias","Exposición a la luz ultravioleta (UV) del sol","Uso de lámparas y camas de bronceado comerciales","Tener piel clara","Antecedentes de exposición solar frecuente o intensa o quemaduras de sol","poiquilodermia-de-civatte","Poiquilodermia de Civatte","Eritrosis coli","Afección cutánea benigna que afecta principalmente la piel del cuello y el pecho.","Manchas rojas y marrones","Piel fina y con aspecto envejecido","Atrofia cutánea","Picor o quemazón","Exposición crónica a la radiación ultravioleta (UV)","Uso de perfumes y cosméticos fotosensibilizantes","Cambios hormonales relacionados con la edad","Tabaquismo y contaminación ambiental","telangiectasias","Arañas vasculares","Pequeños vasos sanguíneos dilatados cerca de la superficie de la piel o las membranas mucosas.","Vasos sanguíneos pequeños y dilatados en la piel","Manchas rojas en labios, cara y yemas de los dedos","Sangrados nasales","Problemas genéticos","sistema-linfatico","Sistema Linfático","Edema linfático","Acumulación de líquido linfático en los tejidos blandos del cuerpo, que causa hinchazón.","linfoma","Cáncer linfático","Tumor de ganglios linfáticos","Cáncer que se origina en los linfocitos, un tipo de glóbulo blanco del sistema inmunitario.","Inflamación indolora de los ganglios linfáticos","Mutaciones genéticas en los linfocitos","Infecciones virales como el virus de Epstein-Barr","mononucleosis-infecciosa","Mononucleosis Infecciosa","Enfermedad del beso","Fiebre glandular","Infección viral, generalmente causada por el virus de Epstein-Barr, que provoca fiebre, dolor de garganta y ganglios linfáticos inflamados.","Ganglios linfáticos inflamados en el cuello y las axilas","Sarpullido","Infección por el virus de Epstein-Barr (VEB)","Transmisión a través de la saliva, por eso se la conoce como la \\"enfermedad del beso\\"","adenopatia","Adenopatía","Linfadenopatía","Ganglios linfáticos inflamados","Agrandamiento o inflamación de los ganglios linfáticos, a menudo como respuesta a una infección.","Ganglios linfáticos inflamados y sensibles","Infecciones (bacterianas, virales, fúngicas)","Trastornos inmunitarios como el lupus o la artritis reumatoide","Cáncer (linfoma, leucemia, metástasis)","linfangitis","Linfangitis","Inflamación de los vasos linfáticos","Inflamación de los canales linfáticos que ocurre como resultado de una infección en un sitio distal al canal.","Líneas rojas y dolorosas que se extienden desde el área infectada","Sensación de malestar general","Infección bacteriana aguda, generalmente por estreptococos","Complicación de una infección cutánea","enfermedad-de-castleman","Enfermedad de Castleman","Hiperplasia de ganglios linfáticos angiofolicular","Un trastorno poco común que implica un crecimiento excesivo de células en los ganglios linfáticos.","Agrandamiento de los ganglios linfáticos","Crecimiento excesivo de células en los ganglios linfáticos","Infección por el virus del herpes humano 8 (VHH-8)","Causas desconocidas en muchos casos","filariasis-linfatica","Filariasis Linfática","Elefantiasis","Infección parasitaria causada por gusanos filariales que se transmiten a través de mosquitos, que conduce a la obstrucción linfática.","Linfedema (elefantiasis)","Hidrocele (hinchazón del escroto)","Tos tropical (tos crónica)","Infección por gusanos parásitos filariales","Transmisión por la picadura de mosquitos infectados","malformacion-linfatica","Malformación Linfática","Linfangioma","Una masa esponjosa y benigna de vasos linfáticos dilatados.","Masas o quistes llenos de líquido","Problemas funcionales según la ubicación","Desarrollo anormal de los vasos linfáticos durante la gestación","quilotorax","Derrame quiloso","Acumulación de líquido linfático (quilo) en el espacio alrededor de los pulmones (espacio pleural).","Lesión del conducto torácico durante una cirugía","Traumatismo torácico","Tumores en el mediastino","ascitis-quilosa","Ascitis Quilosa","Peritonitis quilosa","Acumulación de líquido linfático (quilo) en la cavidad abdominal.","Aumento del perímetro abdominal","Sensación de plenitud","Obstrucción o rotura de los vasos linfáticos abdominales","Tumores abdominales","quiluria","Quiluria","Orina lechosa","Presencia de quilo en la orina, lo que le da un aspecto lechoso.","Orina de aspecto lechoso","Aumento de la frecuencia urinaria","Hematuria (sangre en la orina)","Comunicación anormal entre el sistema linfático y el tracto urinario","Filariasis linfática","Traumatismos","sindrome-de-cloves","Síndrome de CLOVES","Sobrecrecimiento congénito lipomatoso","Un síndrome de sobrecrecimiento raro con anomalías vasculares complejas, que incluyen malformaciones linfáticas.","Crecimiento excesivo de tejido graso","Malformaciones vasculares complejas","Nevos epidérmicos","Mutación somática en el gen PIK3CA","No es una condición hereditaria","bronquitis-plastica","Bronquitis Plástica","Moldes bronquiales","Una condición rara en la que se forman moldes de las vías respiratorias, a menudo asociada con anomalías linfáticas.","Tos intensa","Expulsión de moldes bronquiales (material similar al plástico)","Cianosis (coloración azulada de la piel)","Acumulación de líquido linfático en las vías respiratorias","Complicación de cirugías cardíacas congénitas (procedimiento de Fontan)","enteropatia-perdedora-de-proteinas","Enteropatía Perdedora de Proteínas","Pérdida excesiva de proteínas plasmáticas a través del tracto gastrointestinal debido a trastornos linfáticos.","Edema (hinchazón)","Ascitis","Retraso en el crecimiento en niños","Pérdida excesiva de proteínas plasmáticas a través del tracto gastrointestinal","higroma-quistico","Higroma Quístico","Linfangioma quístico","Un saco lleno de líquido que resulta de una obstrucción en el sistema linfático, que generalmente se encuentra en el cuello.","Hinchazón o masa en el cuello o la axila","Acumulación de líquido","Edema nucal","Anomalías cromosómicas (Síndrome de Turner, Síndrome de Down)","Malformación del sistema linfático","Infecciones virales durante el embarazo","hiperplasia-linfofolicular","Hiperplasia Linfofolicular","Hiperplasia folicular reactiva","Aumento del número y tamaño de los folículos linfoides, a menudo en respuesta a una infección.","Calor","Sensibilidad","Trastornos inmunitarios","Estímulo de antígenos","linfadenitis-mesenterica","Linfadenitis Mesentérica","Adenitis mesentérica","Inflamación de los ganglios linfáticos en el mesenterio, el tejido que une el intestino a la pared abdominal.","Dolor en la zona del estómago","Sensibilidad general en la zona del estómago","Infección viral (gastroenteritis)","Enfermedad inflamatoria intestinal","linfangioleiomiomatosis","Linfangioleiomiomatosis (LAM)","Una enfermedad pulmonar rara que afecta principalmente a mujeres en edad fértil, caracterizada por la proliferación de células musculares lisas atípicas en los pulmones y los linfáticos.","Neumotórax recurrente (colapso pulmonar)","Proliferación anormal de células musculares lisas en los pulmones y el sistema linfático","Mutaciones en los genes TSC1 o TSC2","Enfermedad de Besnier-Boeck-Schaumann","Una enfermedad inflamatoria que afecta a múltiples órganos del cuerpo, pero más comúnmente a los pulmones y los ganglios linfáticos.","Inflamación de las amígdalas, dos masas de tejido de forma ovalada en la parte posterior de la garganta.","esplenomegalia","Bazo agrandado","Agrandamiento del bazo, a menudo asociado con diversas enfermedades que afectan al sistema linfático.","Dolor o sensación de presión en la parte superior izquierda del abdomen","Sensación de saciedad sin haber comido o después de comer una pequeña cantidad","Sangrado fácil","Infecciones virales, bacterianas o parasitarias","Enfermedades hepáticas como la cirrosis","Cánceres de la sangre como leucemia o linfoma","Trastornos metabólicos","Afecciones autoinmunitarias","timoma","Timoma","Tumor del timo","Un tumor originado en las células epiteliales del timo, una glándula linfática importante para el sistema inmune.","linfangioma-cavernoso","Linfangioma Cavernoso","Malformación linfática macroquística","Un tipo de malformación linfática compuesta por grandes quistes llenos de líquido linfático.","Hinchazón o bulto debajo de la piel","Decoloración de la piel o un tinte azulado sobre el área afectada","Rango de movimiento limitado o rigidez en las articulaciones cercanas","Infecciones recurrentes o celulitis en la zona afectada","Dolor o malestar si el linfangioma presiona los tejidos o nervios circundantes.","Malformaciones congénitas durante el desarrollo fetal","Traumatismo o lesión en los vasos linfáticos","Infección o inflamación que afecta el sistema linfático.","linfohistiocitosis-hemofagocitica","Linfohistiocitosis Hemofagocítica (LHH)","Síndrome hemofagocítico","Un trastorno inmunitario potencialmente mortal en el que el cuerpo produce demasiadas células inmunitarias activadas.","Hepatomegalia","Erupción cutánea","Linfadenopatías","Alteraciones neurológicas","Factores genéticos (LHH familiar)","Infecciones virales (como el virus de Epstein-Barr)","Cánceres (como leucemias y linfomas)","Trastornos autoinmunitarios (como el lupus y la artritis reumatoide)","Trasplante de órganos","sindrome-de-evans","Síndrome de Evans","Un trastorno autoinmune raro en el que el sistema inmunitario destruye los glóbulos rojos, las plaquetas y, a veces, ciertos tipos de glóbulos blancos.","Manchas de color púrpura en la piel","Aturdimiento","Trastorno del sistema inmune","Síndrome linfoproliferativo autoinmune","Síndrome antifosfolípido","Síndrome de Sjogren","trastornos-mentales-emocionales","Trastornos Mentales y Emocionales","trastorno-de-ansiedad-generalizada","Trastorno de Ansiedad Generalizada","TAG","Ansiedad Crónica","Preocupación y tensión crónicas y exageradas sin motivo aparente.","Preocupación excesiva y persistente","Inquietud o sensación de estar al límite","Tensión muscular","Química cerebral desequilibrada","Experiencias traumáticas o estresantes","Afecciones de salud crónicas","depresion-mayor","Depresión Mayor","Trastorno Depresivo Mayor","Depresión Clínica","Estado de ánimo persistentemente deprimido o pérdida de interés en las actividades.","Estado de ánimo deprimido la mayor parte del día","Pérdida de interés o placer en casi todas las actividades","Pérdida o aumento significativo de peso","Insomnio o hipersomnia","Fatiga o pérdida de energía","Sentimientos de inutilidad o culpa excesiva","Eventos vitales estresantes","Rasgos de personalidad como la baja autoestima","trastorno-bipolar","Trastorno Bipolar","Enfermedad Maníaco-Depresiva","Cambios extremos en el estado de ánimo que van desde la manía hasta la depresión.","Episodios de manía (euforia, energía excesiva)","Episodios de depresión (tristeza, falta de energía)","Cambios drásticos en el estado de ánimo","Habla rápida y pensamientos acelerados","Comportamiento impulsivo y arriesgado","Estructura y función cerebral anormales","Estrés extremo o trauma","trastorno-obsesivo-compulsivo","Trastorno Obsesivo-Compulsivo","TOC","Pensamientos (obsesiones) y rituales (compulsiones) recurrentes y no deseados.","Obsesiones (pensamientos, impulsos o imágenes recurrentes y persistentes)","Compulsiones (comportamientos repetitivos o actos mentales)","Ansiedad y malestar significativos","Miedo a la contaminación o a la suciedad","Necesidad de simetría y orden","Anomalías en la función cerebral","Factores ambientales como infecciones","Estrés o trauma","trastorno-de-estres-postraumatico","Trastorno de Estrés Postraumático","TEPT","Trastorno que puede ocurrir después de experimentar o presenciar un evento traumático.","Recuerdos angustiantes recurrentes (flashbacks)","Pesadillas sobre el evento traumático","Evasión de lugares, personas o actividades que recuerdan el trauma","Hipervigilancia y reacciones de sobresalto exageradas","Estado de ánimo negativo y desapego emocional","Haber experimentado o presenciado un evento traumático","Lesiones graves o amenaza de muerte","Falta de apoyo social después del trauma","Antecedentes de trastornos mentales","trastorno-de-panico","Trastorno de Pánico","Ataques de Pánico","Episodios repentinos de miedo intenso que provocan reacciones físicas graves.","Ataques de pánico inesperados y recurrentes","Palpitaciones o ritmo cardíaco acelerado","Sudoración, temblores o sacudidas","Sensación de ahogo o falta de aliento","Miedo a perder el control o a morir","Temperamento propenso al estrés y a las emociones negativas","Cambios en la función cerebral","Experiencias vitales estresantes","fobia-social","Fobia Social","Trastorno de Ansiedad Social","Miedo intenso y persistente de ser observado y juzgado por otros.","Miedo intenso a situaciones sociales","Preocupación por ser juzgado o humillado","Evitación de situaciones sociales temidas","Sonrojarse, sudar o temblar en situaciones sociales","Ansiedad anticipatoria antes de un evento social","Estructura cerebral (amígdala hiperactiva)","Experiencias sociales negativas en el pasado","Entorno familiar sobreprotector o controlador","esquizofrenia","Esquizofrenia","Trastorno que afecta la forma en que una persona piensa, siente y se comporta.","Alucinaciones (ver o escuchar cosas que no existen)","Delirios (creencias falsas y firmemente sostenidas)","Pensamiento y habla desorganizados","Apatía y falta de motivación","Anomalías en la estructura y química del cerebro","Complicaciones durante el embarazo o el parto","Consumo de drogas psicoactivas en la adolescencia","trastorno-por-deficit-de-atencion-e-hiperactividad","Trastorno por Déficit de Atención e Hiperactividad","TDAH","Patrón de falta de atención y/o hiperactividad-impulsividad que interfiere con el funcionamiento.","Dificultad para prestar atención y mantener la concentración","Hiperactividad (inquietud, incapacidad para quedarse quieto)","Impulsividad (actuar sin pensar en las consecuencias)","Desorganización y problemas para terminar tareas","Olvidos frecuentes en las actividades diarias","Diferencias en la estructura y función del cerebro","Exposición a toxinas ambientales durante el embarazo","Nacimiento prematuro o bajo peso al nacer","trastornos-de-la-alimentacion","Trastornos de la Alimentación","Anorexia","Bulimia","Atracón","Afecciones graves que se relacionan con las conductas alimentarias que afectan negativamente la salud.","Preocupación excesiva por el peso y la figura corporal","Restricción severa de la ingesta de alimentos","Episodios recurrentes de atracones de comida","Conductas purgativas como vómitos autoinducidos o uso de laxantes","Aislamiento social y evitación de situaciones que involucren comida","Cambios de humor, irritabilidad y depresión","Predisposición genética y factores biológicos","Antecedentes familiares de trastornos alimentarios","Presión social y cultural por la delgadez","Historial de trauma, abuso o acoso","Presencia de otros trastornos de salud mental como ansiedad o depresión","trastorno-limite-de-la-personalidad","Trastorno Límite de la Personalidad","TLP","Borderline","Patrón de inestabilidad en las relaciones interpersonales, la autoimagen y los afectos.","Inestabilidad en las relaciones interpersonales, la autoimagen y los afectos","Impulsividad marcada","Miedo intenso al abandono","Sentimientos crónicos de vacío","Ira inapropiada e intensa","Anomalías en áreas del cerebro relacionadas con la regulación emocional","Experiencias traumáticas en la infancia (abuso, negligencia)","Entorno familiar invalidante","agorafobia","Agorafobia","Miedo y evitación de lugares o situaciones que pueden causar pánico.","Miedo o ansiedad intensa acerca de dos (o más) de las siguientes cinco situaciones: uso del transporte público, estar en espacios abiertos, estar en sitios cerrados, hacer cola o estar en medio de una multitud, estar fuera de casa solo","Miedo a situaciones en las que escapar podría ser difícil o la ayuda podría no estar disponible","Evitación de estas situaciones","Las situaciones casi siempre provocan miedo o ansiedad","Tener ataques de pánico","Experiencias traumáticas","Temperamento ansioso","trastorno-de-ansiedad-por-separacion","Trastorno de Ansiedad por Separación","Miedo excesivo a la separación de las personas a las que se está apegado.","Sufrimiento emocional intenso y repetido al pensar en la separación","Preocupación intensa y constante por la pérdida de un ser querido","Preocupación constante por que suceda algo malo que cause la separación","Negativa a estar fuera del hogar por miedo a la separación","Pesadillas repetidas sobre la separación","Quejas repetidas de dolores de cabeza o estómago antes o durante la separación","Estrés de la vida o pérdidas que causan la separación","Cuestiones situacionales","mutismo-selectivo","Mutismo Selectivo","Incapacidad constante de hablar en situaciones sociales específicas.","Incapacidad constante para hablar en situaciones sociales específicas en las que se espera que hable (p. ej., en la escuela)","Capacidad para hablar en otras situaciones (p. ej., en casa)","La alteración interfiere con los logros educativos o laborales o con la comunicación social","La duración de la alteración es de al menos un mes","Ansiedad social extrema","Temperamento tímido e inhibido","Trastornos del habla o del lenguaje","fobia-especifica","Fobia Específica","Fobia Simple","Miedo intenso e irracional a un objeto o situación específica.","Miedo o ansiedad intensa por un objeto o situación específica (p. ej., volar, alturas, animales)","El objeto o la situación fóbica casi siempre provoca miedo o ansiedad inmediata","Evitación activa del objeto o la situación fóbica","El miedo o la ansiedad es desproporcionado al peligro real","Experiencias traumáticas directas o indirectas con el objeto o la situación","Aprendizaje por observación (ver a otros tener miedo)","Transmisión de información (p. ej., advertencias de los padres)","Factores genéticos y temperamentales","tricotilomania","Tricotilomanía","Trastorno de arrancarse el cabello","Impulso recurrente e irresistible de arrancarse el propio cabello.","Arrancarse el pelo de forma recurrente, lo que da lugar a su pérdida","Intentos repetidos de disminuir o dejar de arrancarse el pelo","El arrancarse el pelo no se atribuye a otra afección médica","Puede ir acompañado de rituales","Forma de regular las emociones (ansiedad, aburrimiento)","trastorno-de-excoriacion","Trastorno de Excoriación","Dermatilomanía","Trastorno caracterizado por rascarse la piel de forma compulsiva.","Rascarse la piel de forma recurrente, lo que da lugar a lesiones cutáneas","Intentos repetidos de disminuir o dejar de rascarse la piel","El rascado de la piel no se atribuye a los efectos fisiológicos de una sustancia o a otra afeacia médica","Puede estar desencadenado por el estrés o la ansiedad","Respuesta a la ansiedad o al estrés","Afecciones de la piel que provocan picor","Hábito","trastorno-dismorfico-corporal","Trastorno Dismórfico Corporal","TDC","Preocupación obsesiva por un defecto percibido en la apariencia física.","Estar extremadamente preocupado por un defecto percibido en la apariencia que los demás no pueden ver o que parece poco importante","Estar convencido de que tienes un defecto en tu apariencia que te hace feo o deforme","Creer que los demás ponen especial atención en tu apariencia de una manera negativa o se burlan de ti","Tener comportamientos dirigidos a arreglar u ocultar el defecto percibido que son difíciles de resistir o controlar","Intentar ocultar los defectos percibidos con el estilo, el maquillaje o la ropa","Comparar constantemente tu apariencia con la de los demás","Antecedentes familiares del trastorno","Evaluación negativa o burlas sobre el cuerpo o la imagen propia durante la niñez","Ciertos rasgos de la personalidad, como el perfeccionismo","Presión social o expectativas de belleza","Tener otra afección de salud mental, como ansiedad o depresión","trastorno-de-acumulacion","Trastorno de Acumulación","Acumulación Compulsiva","Dificultad persistente para deshacerse de posesiones debido a una necesidad percibida de guardarlas.","Dificultad persistente para deshacerse o separarse de las posesiones, independientemente de su valor real","Necesidad percibida de guardar los artículos y malestar asociado con deshacerse de ellos","Acumulación de posesiones que congestionan y abarrotan las zonas de estar activas","Malestar clínicamente significativo o deterioro del funcionamiento","Procesamiento anormal de la información en el cerebro","Eventos vitales estresantes o traumáticos","Rasgos de personalidad como la indecisión y el perfeccionismo","trastorno-afectivo-estacional","Trastorno Afectivo Estacional","TAE","Depresión Invernal","Depresión que ocurre en la misma época cada año.","Sentirse apático, triste o decaído gran parte del día, casi todos los días","Perder el interés en actividades que solías disfrutar","Tener poca energía y sentirse aletargado","Dormir demasiado","Antojos de carbohidratos, comer en exceso y subir de peso","Alteración del reloj biológico (ritmos circadianos) por la reducción de la luz solar","Disminución de los niveles de serotonina, un neurotransmisor que afecta el estado de ánimo","Desequilibrio en los niveles de melatonina, que interviene en los patrones de sueño y el estado de ánimo","distimia","Distimia","Trastorno Depresivo Persistente","Forma crónica de depresión menos severa pero de larga duración.","Tristeza, desánimo o sensación de vacío","Pérdida de interés en las actividades cotidianas","Cansancio y falta de energía","Dificultad para concentrarse y tomar decisiones","Alteraciones del sueño","Antecedentes familiares de depresión","Eventos traumáticos o estrés crónico","trastorno-ciclotimico","Trastorno Ciclotímico","Ciclotimia","Trastorno del estado de ánimo que causa altibajos emocionales, pero menos extremos que el trastorno bipolar.","Períodos de síntomas hipomaníacos y períodos de síntomas depresivos que no cumplen los criterios para un episodio de depresión mayor","Los síntomas han estado presentes durante al menos dos años","Los períodos de estabilidad del estado de ánimo no duran más de dos meses","Factores genéticos (antecedentes familiares de trastorno bipolar)","Diferencias en la función cerebral","Temperamento","trastorno-disforico-premenstrual","Trastorno Disfórico Premenstrual","TDPM","Forma grave del síndrome premenstrual (SPM) con síntomas emocionales y físicos.","Falta de interés en las actividades diarias","Fatiga o falta de energía","Tristeza o desesperanza","Altibajos en el estado de ánimo","Irritabilidad o ira persistente","Cambios hormonales durante el ciclo menstrual","Abuso de alcohol o drogas ilícitas","Trastornos de la tiroides","trastorno-de-desregulacion-disruptiva-del-estado-de-animo","Trastorno de Desregulación Disruptiva del Estado de Ánimo","TDDEA","Irritabilidad crónica, grave y persistente en niños y adolescentes.","Arrebatos intensos de mal genio (verbales o conductuales)","Arrebatos y berrinches recurrentes durante al menos 12 meses","Estado de ánimo crónicamente irritable o enojo la mayor parte del día","Problemas de funcionamiento en más de un lugar (hogar, escuela, compañeros)","Trastorno del neurodesarrollo","Componentes genéticos","Componentes ambientales","Coexistencia con otros trastornos como el TDAH o la ansiedad","trastorno-esquizoafectivo","Trastorno Esquizoafectivo","Combinación de síntomas de esquizofrenia y trastornos del estado de ánimo.","Combinación de síntomas de esquizofrenia (alucinaciones, delirios) y síntomas de un trastorno del estado de ánimo (depresión o manía)","Período de enfermedad durante el cual hay un episodio depresivo mayor o maníaco concurrente con los síntomas de la esquizofrenia","Delirios o alucinaciones durante al menos 2 semanas en ausencia de un episodio de estado de ánimo mayor","Química cerebral","Factores ambientales estresantes","Consumo de drogas","trastorno-delirante","Trastorno Delirante","Paranoia","Creencias falsas y fijas (delirios) sin otros síntomas de esquizofrenia.","Presencia de uno o más delirios con una duración de un mes o más","El funcionamiento no está marcadamente alterado y el comportamiento no es obviamente extraño o extravagante","Si se han producido episodios maníacos o depresivos mayores, han sido breves en relación con la duración de los períodos delirantes","Creencias falsas y fijas (p. ej., de persecución, de grandeza)","Desequilibrios en los neurotransmisores","Estrés extremo","trastorno-psicotico-breve","Trastorno Psicótico Breve","Episodio psicótico repentino y de corta duración, a menudo en respuesta a un evento estresante.","Aparición súbita de al menos uno de los siguientes síntomas psicóticos: delirios, alucinaciones, habla desorganizada","Comportamiento muy desorganizado o catatónico","La duración del episodio es de al menos un día pero menos de un mes","Retorno completo al nivel de funcionamiento previo a la enfermedad","Estrés extremo o un evento traumático","Falta de sueño","Postparto","trastorno-de-la-personalidad-paranoide","Trastorno de la Personalidad Paranoide","Patrón de desconfianza y suspicacia hacia los demás.","Desconfianza y sospecha generalizadas hacia los demás","Creencia de que los demás tienen intenciones maliciosas","Preocupación injustificada por la lealtad o la fiabilidad de los amigos y socios","Reticencia a confiar en los demás por miedo a que la información sea utilizada en su contra","Interpretación de significados denigrantes o amenazantes en comentarios o acontecimientos benignos","Reacción de ira u hostilidad ante lo que perciben como ataques a su persona.","Antecedentes familiares de esquizofrenia y otros trastornos psicóticos","Experiencias traumáticas en la infancia, como negligencia física o emocional.","trastorno-de-la-personalidad-esquizoide","Trastorno de la Personalidad Esquizoide","Patrón de distanciamiento de las relaciones sociales y una gama restringida de expresión emocional.","Querer estar solo y realizar actividades en soledad","No interesarse ni disfrutar de las relaciones cercanas","Sentir poco o ningún deseo de mantener relaciones sexuales","Dificultad para expresar emociones y reaccionar","Falta de motivación para alcanzar metas","No reaccionar ante los elogios o las críticas de los demás","Tener un familiar con trastorno de la personalidad esquizoide, trastorno esquizotípico de la personalidad o esquizofrenia","Tener un padre que se mostraba frío, no cuidaba adecuadamente y no daba apoyo emocional","trastorno-de-la-personalidad-esquizotipica","Trastorno de la Personalidad Esquizotípica","Patrón de malestar agudo en las relaciones cercanas, distorsiones cognitivas o perceptivas y excentricidades del comportamiento.","Ser solitario y carecer de amigos cercanos fuera de la familia inmediata","Emociones planas o respuestas emocionales limitadas o socialmente inapropiadas","Ansiedad social excesiva y persistente","Pensamientos, creencias o gestos extraños o inusuales","Pensamientos sospechosos o paranoicos y dudas constantes sobre la lealtad de los demás","Creencia en poderes especiales, como telepatía mental o supersticiones.","Cambios en la forma en que funciona el cerebro","Influencias ambientales","Comportamientos aprendidos","Antecedentes familiares de esquizofrenia u otro trastorno psicótico.","trastorno-de-la-personalidad-antisocial","Trastorno de la Personalidad Antisocial","Psicopatía","Sociopatía","Patrón de desprecio y violación de los derechos de los demás.","Ignorar qué está bien y qué está mal","Decir mentiras para aprovecharse de los demás","Ser insensible o no respetar a otras personas","Quebrantar la ley constantemente","No demostrar culpa ni remordimiento","Comportamiento impulsivo","Maltrato infantil","Antecedentes familiares de Trastorno de la Personalidad Antisocial u otros trastornos de la personalidad","trastorno-de-la-personalidad-histrionica","Trastorno de la Personalidad Histriónica","Patrón de emotividad excesiva y búsqueda de atención.","Necesidad de ser el centro de atención","Comportamiento seductor o provocativo inapropiado","Emociones superficiales y rápidamente cambiantes","Preocupación excesiva por la apariencia física","Ser fácilmente influenciable por los demás","Discurso excesivamente vago y carente de detalles","Experiencias de la infancia","Estilo de crianza","Factores neurobiológicos","trastorno-de-la-personalidad-narcisista","Trastorno de la Personalidad Narcisista","Narcisismo","Patrón de grandiosidad, necesidad de admiración y falta de empatía.","Tener un aire de superioridad irrazonable y necesitar constantemente la admiración excesiva de los demás","Sentir que merecen tener privilegios y recibir un trato especial","Aprovecharse de los demás para lograr lo que quieren","Tener incapacidad o falta de voluntad para reconocer las necesidades y los sentimientos de los demás","Preocuparse por fantasías sobre el éxito, el poder, la brillantez, la belleza o la pareja perfecta","Comportarse con arrogancia, alardear mucho y ser consideradas engreídas.","Entorno familiar en la infancia (relaciones con los padres de demasiada adoración o crítica)","Genética (características heredadas)","Neurobiología (conexión entre cerebro, conducta y pensamiento).","trastorno-de-la-personalidad-evitativa","Trastorno de la Personalidad por Evitación","Trastorno de la Personalidad Evasiva","Patrón de inhibición social, sentimientos de insuficiencia e hipersensibilidad a la evaluación negativa.","Hipersensibilidad a la crítica y al rechazo","Aislamiento social autoimpuesto","Timidez o ansiedad en situaciones sociales","Sentimientos de ineptitud","Evitación de actividades laborales que implican contacto interpersonal","Rechazo o acoso en la infancia","trastorno-de-la-personalidad-dependiente","Trastorno de la Personalidad Dependiente","Patrón de comportamiento sumiso y pegajoso relacionado con una necesidad excesiva de ser cuidado.","Dificultad para tomar decisiones cotidianas sin un exceso de consejo y reafirmación por parte de los demás","Necesidad de que otros asuman la responsabilidad en las áreas más importantes de su vida","Dificultad para expresar el desacuerdo con los demás por miedo a la pérdida de apoyo o aprobación","Dificultad para iniciar proyectos o hacer cosas por su cuenta debido a la falta de confianza en el propio juicio o capacidades","Va demasiado lejos para obtener la aceptación y el apoyo de los demás, hasta el punto de hacer voluntariamente cosas que son desagradables","Se siente incómodo o indefenso cuando está solo por temores exagerados de ser incapaz de cuidar de sí mismo","Experiencias traumáticas en la infancia, como el abuso o la negligencia","Estilos de crianza sobreprotectores o autoritarios","Antecedentes familiares de trastornos de ansiedad","Una enfermedad física crónica durante la infancia","trastorno-de-la-personalidad-obsesivo-compulsiva","Trastorno de la Personalidad Obsesivo-Compulsiva","TPOC","Patrón de preocupación por el orden, el perfeccionismo y el control.","Preocupación excesiva por los detalles, el orden y las normas","Perfeccionismo que interfiere con la finalización de las tareas","Devoción excesiva al trabajo y la productividad, excluyendo actividades de ocio y amistades","Rigidez y obstinación","Incapacidad para delegar tareas o trabajar con otros","Avaricia y un estilo de vida miserable","Experiencias traumáticas durante la infancia","Estilo de crianza autoritario y sobreprotector","trastorno-de-conversion","Trastorno de Conversión","Trastorno de Síntomas Neurológicos Funcionales","Síntomas neurológicos inexplicables que afectan el movimiento o los sentidos.","Debilidad o parálisis","Movimiento anormal, como temblores o dificultad para caminar","Convulsiones o crisis no epilépticas","Problemas del habla, como incapacidad para hablar o habla arrastrada","Problemas de visión, como visión doble o ceguera","Entumecimiento o pérdida de sensibilidad al tacto","Estrés considerable o trauma emocional o físico reciente","Afección de salud mental preexistente (trastorno de ansiedad, del estado de ánimo, disociativo o de la personalidad)","Antecedentes de abuso físico o sexual o descuido en la infancia","Padecer una enfermedad o trastorno neurológico","trastorno-de-sintomas-somaticos","Trastorno de Síntomas Somáticos","Hipocondría","Enfoque extremo en los síntomas físicos que causa una gran angustia emocional.","Fatiga o debilidad","Entumecimiento","Malestar gastrointestinal","Ansiedad excesiva por los síntomas físicos","Influencia familiar","Rasgo de negatividad","Historial de trauma o abuso","Comportamiento aprendido","trastorno-facticio","Trastorno Facticio","Síndrome de Munchausen","Falsificación de signos o síntomas físicos o psicológicos.","Problemas médicos o de salud mental astutos y convincentes","Amplios conocimientos de términos médicos y enfermedades","Síntomas imprecisos o inconsistentes","Afecciones que empeoran sin razón aparente","Afecciones que no responden a los tratamientos habituales","Búsqueda de tratamiento de muchos profesionales de atención médica u hospitales diferentes","Traumas infantiles","Enfermedad grave en la infancia","Pérdida de un ser querido","Trastornos de la personalidad","Depresión","amnesia-disociativa","Amnesia Disociativa","Incapacidad para recordar información personal importante, generalmente de naturaleza traumática o estresante.","Pérdida de memoria de información personal importante","Incapacidad para recordar eventos específicos, en especial traumáticos","Sensación de desapego de uno mismo (despersonalización)","Confusión o desorientación","Problemas en las relaciones sociales y laborales","Experimentar o presenciar un evento traumático","Abuso físico o sexual grave en la infancia","Estrés abrumador por guerra o combate","Ser víctima de un desastre natural","otorrinolaringologia-oftalmologia","Enfermedades de Ojos, Oídos, Nariz y Garganta","👁️👂👃👄","conjuntivitis","Conjuntivitis","Ojo rojo","Inflamación de la conjuntiva","Inflamación de la conjuntiva, la membrana transparente que recubre el interior de los párpados y la superficie del ojo.","Picazón o ardor ocular","Secreción acuosa o purulenta","Sensación de tener arena en el ojo","Párpados pegados al despertar","Infección viral o bacteriana","Reacción alérgica (polen, polvo)","Irritantes químicos (cloro, humo)","cataratas","Cataratas","Opacidad del cristalino","Opacidad del cristalino del ojo, lo que dificulta la visión.","Visión borrosa o nublada","Dificultad para ver de noche","Sensibilidad a la luz y al resplandor","Percepción de colores atenuada","Visión doble en un ojo","Envejecimiento natural del cristalino","Exposición prolongada a la radiación UV","Diabetes mellitus","glaucoma","Glaucoma","Tensión ocular alta","Enfermedad del ojo que daña el nervio óptico y puede causar ceguera.","Pérdida gradual de la visión periférica","Visión de túnel en etapas avanzadas","Dolor ocular intenso y súbito","Visión borrosa y halos alrededor de las luces","Náuseas y vómitos asociados al dolor ocular","Aumento de la presión dentro del ojo (presión intraocular)","Antecedentes familiares de glaucoma","Edad avanzada (mayor de 60 años)","Lesiones oculares o cirugías previas","otitis-media","Otitis Media","Infección del oído medio, el espacio lleno de aire detrás del tímpano.","Dolor de oído (otalgia)","Pérdida de audición temporal","Supuración de líquido del oído","Irritabilidad y problemas para dormir en niños","Infección bacteriana o viral, a menudo después de un resfriado","Disfunción de la trompa de Eustaquio","tinnitus","Tinnitus","Acúfenos","Percepción de un sonido o zumbido en los oídos sin una fuente de sonido externa.","Percepción de un zumbido, pitido o silbido en los oídos","Sonido que no proviene de una fuente externa","Puede ser constante o intermitente","Dificultad para concentrarse o dormir","Exposición a ruidos fuertes","Pérdida de audición relacionada con la edad","Acumulación de cerumen en el oído","Lesiones en la cabeza o el cuello","Inflamación de las amígdalas, dos masas de tejido de forma ovalada situadas a ambos lados de la parte posterior de la garganta.","Inflamación de los senos paranasales, cavidades llenas de aire en el cráneo.","Inflamación de la faringe, la parte posterior de la garganta.","Inflamación de la laringe, que contiene las cuerdas vocales.","Reacción alérgica que causa estornudos, congestión nasal y picazón en la nariz.","desviacion-del-tabique-nasal","Desviación del tabique nasal","Tabique desviado","Desplazamiento del tabique nasal, la pared que divide las fosas nasales.","Dificultad para respirar por uno o ambos lados de la nariz","Congestión nasal persistente","Hemorragias nasales frecuentes","Dolor facial","Respiración ruidosa durante el sueño","Condición congénita (presente al nacer)","Lesión o traumatismo en la nariz","polipos-nasales","Tumores benignos en la nariz","Crecimientos blandos e indoloros en el revestimiento de la nariz o los senos paranasales.","Congestión nasal crónica","Disminución o pérdida del sentido del olfato","Goteo posnasal","Presión facial o dolor de cabeza","Ronquidos","Inflamación crónica de la mucosa nasal (asociada a asma o alergias)","Sensibilidad a fármacos como la aspirina","vertigo","Sensación de que usted o su entorno se mueven o giran.","Sensación giratoria de que uno mismo o el entorno se mueve","Pérdida del equilibrio","Vértigo posicional paroxístico benigno (VPPB)","Neuronitis vestibular (infección viral del oído interno)","enfermedad-de-meniere","Hidropesía endolinfática","Trastorno del oído interno que causa episodios de vértigo, pérdida de audición y tinnitus.","Episodios recurrentes de vértigo","Pérdida de audición fluctuante","Tinnitus (zumbido en el oído)","Sensación de presión o plenitud en el oído afectado","Acumulación anormal de líquido (endolinfa) en el oído interno","Factores genéticos y autoinmunes","Posibles infecciones virales","presbicia","Presbicia","Vista cansada","Pérdida gradual de la capacidad de los ojos para enfocar objetos cercanos.","Dificultad para enfocar objetos cercanos","Necesidad de alejar los materiales de lectura","Fatiga visual o dolores de cabeza al realizar trabajos de cerca","Visión borrosa a distancia de lectura normal","Pérdida de elasticidad del cristalino del ojo","Proceso natural de envejecimiento (generalmente a partir de los 40 años)","astigmatismo","Astigmatismo","Imperfección en la curvatura de la córnea o el cristalino del ojo.","Visión borrosa o distorsionada a todas las distancias","Fatiga visual","Dificultad con la visión nocturna","Curvatura irregular de la córnea o del cristalino","Puede ser hereditario y estar presente desde el nacimiento","miopia","Miopía","Visión corta","Afección en la que los objetos cercanos se ven con claridad, pero los lejanos se ven borrosos.","Visión borrosa de los objetos lejanos","Necesidad de entrecerrar los ojos para ver claramente","Dolores de cabeza por fatiga visual","Dificultad para ver al conducir, especialmente de noche","El globo ocular es demasiado largo o la córnea tiene demasiada curvatura","Realizar trabajos que requieren enfocar la vista de cerca por tiempo prolongado","hipermetropia","Visión larga","Afección en la que los objetos lejanos se ven con claridad, pero los cercanos se ven borrosos.","Visión borrosa de objetos cercanos","Fatiga visual y cansancio ocular","Dolores de cabeza después de leer o usar la computadora","Necesidad de entrecerrar los ojos para enfocar","El globo ocular es demasiado corto o la córnea tiene muy poca curvatura","Factor hereditario","estrabismo","Estrabismo","Afección en la que los ojos no se alinean correctamente.","Ojos que no se alinean en la misma dirección","Movimientos oculares descoordinados","Pérdida de la visión o de la percepción de profundidad","Problemas con el control muscular de los ojos","Ambliopía","ojo-seco","Ojo seco","Queratoconjuntivitis seca","Afección en la que los ojos no producen suficientes lágrimas o las lágrimas se evaporan demasiado rápido.","Sensación de ardor, picazón o arenilla en los ojos","Enrojecimiento ocular","Visión borrosa, especialmente al final del día","Producción insuficiente de lágrimas","Mala calidad de las lágrimas (evaporación rápida)","Envejecimiento, cambios hormonales y factores ambientales (viento, aire acondicionado)","chalazion","Chalazión","Quiste de párpado","Pequeño bulto en el párpado causado por una glándula sebácea bloqueada.","Bulto no doloroso en el párpado, que crece lentamente","Visión borrosa si el bulto es grande y presiona el ojo","Hinchazón leve del párpado","Obstrucción e inflamación de una glándula de Meibomio (productora de grasa) en el párpado","orzuelo","Orzuelo","Infección del párpado","Infección bacteriana de una glándula sebácea en el párpado.","Bulto rojo y doloroso en el borde del párpado","Hinchazón del párpado","Lagrimeo","Infección bacteriana (generalmente estafilococos) de una glándula sebácea en el párpado","Obstrucción de la glándula","epistaxis","Epistaxis","Hemorragia nasal","Sangrado de la nariz.","Sangrado por una o ambas fosas nasales","Puede ser un goteo ligero o un flujo abundante","Aire seco que irrita las membranas nasales","Hurgarse la nariz o sonarse con fuerza","Traumatismos nasales menores o hipertensión arterial","anosmia","Anosmia","Pérdida del olfato","Pérdida total o parcial del sentido del olfato.","Pérdida total del olfato","Cambio en el gusto de los alimentos","Secreción nasal","Infecciones de los senos paranasales (sinusitis)","Resfriado común","Lesiones en la cabeza","disfonia","Disfonía","Alteración de la calidad de la voz.","Debilidad o pérdida de la voz","Voz quebrada, temblorosa, tensa o forzada","Sensación de cosquilleo y aspereza en la garganta","Uso excesivo de la voz","Enfermedades neurológicas","Apnea del sueño","SAHS","Trastorno del sueño en el que la respiración se detiene y comienza repetidamente.","cerumen-impactado","Cerumen impactado","Tapón de cera","Acumulación de cera en el oído que bloquea el canal auditivo.","Dolor de oído","Sensación de inflamación en el oído","Zumbido o ruidos en los oídos (tinnitus)","Pérdida auditiva","Picazón en el oído","Acumulación de cera","Endurecimiento de la cera","Uso de hisopos de algodón","Conducto auditivo externo muy estrecho","Abundantes pelos en el conducto auditivo externo","perforacion-del-timpano","Perforación del tímpano","Tímpano roto","Agujero o desgarro en el tímpano.","Dolor de oído que puede desaparecer rápidamente","Secreción de líquido claro, purulento o con sangre","Vértigo o sensación de mareo","Traumatismo directo en el oído","Barotrauma por cambios de presión","Trauma acústico por ruidos fuertes","Infección del oído interno","Inflamación del laberinto, una parte del oído interno.","neuritis-vestibular","Neuritis vestibular","Inflamación del nervio vestibular, que envía información sobre el equilibrio al cerebro.","Vértigo repentino y severo","Problemas de equilibrio"],"bloques":[[529,530,531,[[532,533,[534],535,[86,87,536,160],[537,538,539,540]],[541,542,[543],544,[545,13,63,1,546],[88,64,547]],[548,161,[549],550,[162,551,552,4,1],[553,554,163,555]],[556,557,[558],559,[560,164,89,87,561],[562,563,564]],[165,166,[167],565,[168,169,170,171],[172,173,174]],[175,176,[177],566,[178,179,180,181,182],[183,184,185,186]],[187,188,[13],567,[189,16,190,191],[88,192,193]],[194,90,[195],568,[196,13,197,31],[198,199,200,91]],[569,570,[571],572,[573,574,4,201],[575,576]],[577,202,[578],579,[580,581,582,92,23],[583,584,14]],[585,586,[587],588,[589,203,17,590,591],[592,593,24,2]],[93,204,[594],595,[94,95,96,97,98],[99,100,101]],[596,597,[598],599,[600,601,7,4,9],[602,603,604,605]],[205,206,[207],606,[208,209,102,210,103],[211,212,213,214]],[215,216,[217],607,[218,1,7,219,220],[221,222,223,224]],[608,609,[610],611,[612,4,31,0,613],[614,615,161,225,226]],[616,617,[618],619,[620,4,621,227],[622,623,624,625]],[626,228,[627],628,[629,630,4,104,102],[631,632,229,24]],[105,106,[],230,[1,0,10,107,4,108],[109,110]],[633,634,[635],636,[637,638,639,640,641],[32,642,643]],[644,645,[646],647,[231,13,111,648],[649,650,651]],[652,653,[654],655,[656,657,45,658,31],[659,660,661]],[662,663,[664],665,[666,31,63,667,668],[669,670,671]],[672,673,[],674,[675,13,0,676,677],[678,679]],[680,681,[],682,[231,111,13,33],[683,684,685]],[686,687,[],688,[0,689,65,690,13],[691,692,693]],[694,695,[],696,[33,0,112,4,89],[697,698,699]],[700,701,[702],703,[704,201,705,0,706],[707,708,709]],[710,711,[712],713,[714,715,716,717],[718,719,720]],[721,722,[],723,[724,725,726,113,36],[727,728,729]],[730,731,[],732,[733,734,735,736,737],[738,739,740,741]],[742,743,[744],745,[746,232,747,748],[749,750,751,752,753]],[754,755,[],756,[757,232,33,63],[758,759,760,761]],[762,763,[764],765,[766,33,4,7],[767,202,225,228,226]],[768,769,[25],770,[771,772,773,87],[774,775,776,114,11]],[777,778,[779],780,[781,227,782,783,86],[784,785,786,787,233]],[788,789,[],790,[791,4,792,9,1],[793,794]],[795,796,[],797,[798,0,4,89,7],[799,800,14]],[801,802,[],803,[804,805,17,7,0],[806,807]],[808,809,[],810,[234,203,811,26,812],[813,814,815]]]],[816,817,818,[[819,820,[821],822,[823,21,115,235],[116,824,46,117]],[825,826,[827,828],829,[830,235,34,831],[116,832,6,236]],[833,834,[835,66],836,[66,837,7,16],[237,11,37,6]],[838,839,[840],841,[842,238,239,118],[240,2,27]],[843,844,[845],846,[22,847,34,241,848],[849,850,851,852]],[853,119,[],854,[18,0,1,238,855],[240,2,6]],[856,857,[858],859,[860,861,862,863],[864,865,37,866]],[867,47,[],868,[869,870,871,872],[242,38,67,28]],[873,18,[],874,[875,120,118,21],[48,243,876,244]],[877,878,[879],880,[1,5,22,881,49],[882,46,24]],[883,884,[885],886,[1,26,21,245,49],[887,888,246]],[889,890,[891],892,[893,0,894,5],[68,895,28,896]],[247,248,[249],250,[18,1,10,251,22,5],[252,3,27]],[897,898,[],899,[18,241,69,900],[901,902,119,903]],[904,905,[],906,[22,34,907],[242,29,67]],[908,253,[],909,[910,0,21,911],[912,913]],[914,915,[],916,[917,26,5,0],[918,70]],[919,68,[920],921,[922,923,924,254],[925,926,927]],[928,929,[930],931,[932,933,934,21],[68,935,936]],[937,938,[16],939,[255,940,941,942],[256,943,944,945]],[946,947,[948],949,[950,951,34,21],[952,953,6,71]],[954,955,[956],957,[958,120,254,0],[959,960,243]],[961,237,[],962,[66,963,16,964],[965,29,11,966]],[967,968,[],969,[239,970,121,971],[972,122,973,64]],[974,975,[],976,[977,978,979],[980,981,123]],[982,983,[],984,[985,986,987],[988,989,990]],[991,992,[],993,[121,994,22,257],[2,50,258]],[995,996,[997],998,[999,1000,1001,9],[1002,1003,258,259]],[1004,1005,[1006],1007,[1008,22,5,9],[116,6,1009,1010]],[1011,1012,[],1013,[260,9,1014,1015],[1016,1017,11,1018]],[1019,1020,[1021],1022,[9,26,1023,5,49],[1024,261,46,246]],[1025,1026,[],1027,[1028,1029,9,26,5],[6,12,1030,1031]],[1032,1033,[],1034,[16,255,66,1035],[1036,39,1037,28]],[1038,1039,[],1040,[260,1041,7,10],[1042,30]],[1043,1044,[],1045,[21,1046,1047,69],[12,1048,124,28]],[1049,125,[],1050,[123,1051,10,69],[1052,1053]],[1054,1055,[],1056,[21,115,120,18,51],[1057,1058,1059]],[1060,1061,[],1062,[0,49,1063,262],[68,1064,126]],[1065,1066,[],1067,[1068,118,5,0],[127,1069,1070]],[1071,1072,[],1073,[1074,69,0,5],[1075,1076,253,1077]]]],[1078,1079,1080,[[1081,1082,[8],1083,[45,51,263,40,1084],[15,1085,1086,1087]],[1088,264,[1089],1090,[1091,25,1092,1093,265],[1094,8,6,1095]],[1096,1097,[1098],1099,[1100,1101,23,1102],[1103,1104,1105]],[1106,1107,[1108],1109,[1110,1111,1112,4,103],[1113,1114,1115]],[1116,1117,[1118],1119,[1120,1121,1122,25],[1123,1124,233]],[1125,1126,[1127],1128,[164,1129,17,1130,1131],[1132,1133,1134,1135]],[1136,1137,[266],1138,[1139,267,1140,25,7],[1141,1142,1143,1144]],[1145,1146,[1147],1148,[1149,1150,268,1151,4],[269,270,1152,1153]],[1154,1155,[1156],1157,[1158,1159,271,1160,1161],[1162,1163,128,1164]],[1165,272,[1166],1167,[1168,1169,1170,25,7],[1171,1172,1173,1174]],[1175,1176,[1177],1178,[1179,25,1180,7,1181],[1182,1183,1184,1185]],[1186,1187,[1188],1189,[36,23,72,1190,1191],[1192,1193,1194]],[1195,1196,[1197],1198,[7,1,25,1199,245],[1200,1201,24]],[1202,1203,[1204],1205,[1206,63,268,31],[273,1207,1208,1209]],[1210,274,[1211],1212,[1213,1214,1,266,1215],[15,1216,1217,46]],[1218,1219,[1220],1221,[1222,1223,1224,1225],[264,275,6,1226]],[1227,1228,[1229],1230,[1231,1232,4,1233],[1234,1235,1236]],[1237,1238,[1239],1240,[1241,1242,1243,1244],[1245,6,12,1246]],[1247,1248,[1249],1250,[1251,1252,1253,1254],[1255,1256,1257,1258]],[205,206,[207],1259,[208,209,102,210,103],[211,212,213,214]],[1260,1261,[1262,276],1263,[1264,1265,1266,1267],[1268,1269,275,277]],[215,216,[217],1270,[218,1,7,219,220],[221,222,223,224]],[1271,1272,[1273],1274,[1275,1276,1277,1278,1279],[1280,1281,1282]],[1283,1284,[1285],1286,[1287,1288,7,51],[1289,1290,1291,1292]],[1293,1294,[52],1295,[1296,1297,1298,1299],[1300,32]],[1301,1302,[1303],1304,[1305,1306,1307,1308],[1309,1310]],[1311,1312,[1313],1314,[1315,1316,1317],[1318,1319]],[1320,1321,[278],1322,[1323,1324,1325,1326],[1327,1328,279,1329]],[280,281,[282],1330,[283,284,285,286,287],[288,289,290,291]],[1331,1332,[1333],1334,[1335,1336,1337,1338,1339],[1340,1341]],[1342,1343,[1344],1345,[1346,1347,1348,1349],[1350,270,1351]],[1352,114,[52],1353,[17,1354,25,267,1355],[1356,1357,1358]],[1359,1360,[52],1361,[1362,1363,1364,1365],[1366,1367]],[1368,1369,[1370],1371,[1372,292,293,92,1373],[1374,1375]],[1376,1377,[1378],1379,[1380,1381,1382],[1383,1384,1385,6]],[1386,1387,[1388],1389,[1390,1391,1392],[1393,1394,1395,28]],[1396,1397,[12],1398,[129,1399,9,1,40],[1400,1401,1402]],[294,11,[52],1403,[295,296,4,297],[298,299,53,300]],[93,204,[52],1404,[94,95,96,97,98],[99,100,101]],[301,130,[302,54],1405,[303,23,73,0,304],[305,19]]]],[1406,1407,306,[[1408,1409,[1410,1411],1412,[1413,1414,5,1415],[2,307,131,1416]],[1417,1418,[1419],1420,[1421,1422,1423,1424],[132,256,1425,308]],[1426,309,[1427],1428,[1429,310,1430,1431],[1432,2,1433]],[1434,1435,[1436],1437,[1438,1439,1440,1441],[1442,1443,2,50]],[1444,133,[134],311,[1,74,1445,75],[1446,3,1447]],[1448,1449,[312],1450,[1451,1452,135],[313,1453,1454]],[1455,1456,[1457],1458,[1459,20,1460,1461],[12,1462,1463,39]],[1464,314,[315],1465,[1466,1467,5,316],[1468,136,1469]],[1470,1471,[1472],1473,[1474,1475,1476,1477,1478],[131,1479,1480,1481]],[1482,1483,[276,1484,1485],1486,[1487,1488,1489,1490],[1491,1492,8,277]],[1493,1494,[1495],1496,[1497,5,1498,1499],[1500,8,6,55]],[1501,317,[1502],1503,[1504,41,1505,1506],[1507,318,55]],[1508,1509,[1510],1511,[42,319,1512,1513],[1514,2,320]],[1515,76,[1516,1517],1518,[1519,1520,1521,20],[1522,1523,1524]],[1525,1526,[1527],1528,[1529,1530,1531,1532],[1533,32]],[1534,1535,[1536],1537,[1538,1539,1540,321],[1541,50]],[1542,1543,[1544],1545,[1546,1547,1548,274],[1549,32]],[1550,1551,[1552],1553,[1554,1555,77,1556],[1557,1558]],[1559,1560,[1561],1562,[0,1563,1564,41],[1565,78,1566]],[1567,1568,[1569],1570,[1571,1572,1573,74],[1574,1575]],[1576,1577,[1578],1579,[42,1580,319,322],[1581,1582,320]],[1583,1584,[1585],1586,[1587,1588,1589,323],[1590,32]],[1591,1592,[1593],1594,[1595,1596,1597,312],[1598,126,39,1599]],[1600,1601,[1602],1603,[45,0,41,1604],[1605,1606]],[1607,1608,[1609],1610,[1611,0,1612,1613],[1614,1615]],[1616,1617,[1618],1619,[1620,1621,1622,1623],[1624,1625,127]],[1626,1627,[1628],1629,[1630,1631,1632,324],[1633,325]],[1634,1635,[1636],1637,[1638,1639,1640,1641],[1642,132,317,70]],[326,327,[1643],1644,[328,137,138,5],[329,330]],[1645,1646,[1647],1648,[1649,1650,1651,331],[1652,1653]],[1654,1655,[1656],1657,[1658,1659,1660,1661],[332,1662]],[1663,1664,[1665],1666,[1667,1668,1669,41],[1670,1671]],[1672,1673,[1674],1675,[1676,1677,1678,1679],[1680,269,50]],[1681,1682,[1683],1684,[1685,310,1686,1687],[1688,1689]],[1690,1691,[1692],1693,[1694,1695,331,322],[1696,1697]],[1698,1699,[1700],1701,[1702,1703,1704,41],[1705,1706]],[1707,1708,[1709],1710,[1711,333,1712,1713],[1714,32]],[334,35,[139],1715,[335,336,337,338],[339,76,140,141]],[1716,1717,[1718],1719,[1720,1721,1722,333],[1723,325]],[1724,1725,[1726],1727,[1728,1729,1730,1731],[1732,1733]]]],[1734,1735,1736,[[1737,54,[130],1738,[1,0,142,1739,1740],[3,1741,1742,143]],[340,341,[342],343,[56,344,144,1,0],[3,345,6,30]],[346,347,[],1743,[348,349,350,351],[352,3,353]],[354,1744,[],1745,[355,356,357],[358,15,359]],[1746,57,[1747],1748,[111,1749,112,1750,360],[1751,3,1752]],[1753,1754,[1755],1756,[1757,1758,1759,1760],[1761,1762,1763]],[247,248,[249],250,[18,1,10,251,22,5],[252,3,27]],[361,1764,[134],1765,[362,75,1,363],[364,19]],[365,366,[367],1766,[368,369,370,371,10],[372,3,373]],[374,375,[376],1767,[377,378,47,379,145,79],[380,19,48]],[381,382,[324],1768,[23,383,384,385,386],[387,78,388]],[1769,1770,[],1771,[1772,389,1773,1774],[1775,1776]],[1777,1778,[],1779,[1780,1781,1,73],[1782,3,1783]],[390,391,[392],1784,[393,394,395,396],[397,30,80]],[1785,1786,[],1787,[1788,1789,398,16],[1790,1791]],[1792,1793,[],1794,[1795,42,1796,16],[1797,80,1798]],[1799,1800,[399],1801,[1802,1803,9,400,1,40],[78,3,27]],[1804,1805,[1806],1807,[1808,18,121,401,10,0],[143,1809,27,6,117]],[1810,1811,[],1812,[1,1813,49,56,21,26],[1814,3,48,1815]],[1816,1817,[],1818,[17,1819,1820,1821,26],[1822,1823,146,1824]],[1825,1826,[],1827,[0,45,402,10,1828],[1829,1830,1831,1832]],[105,106,[],230,[1,0,10,107,4,108],[109,110]],[403,1833,[],1834,[404,405,406,407],[408,3,409]],[1835,1836,[],1837,[1838,1839,1840,1841,1842,1843],[1844,1845,1846,1847,1848]],[1849,1850,[1851],1852,[1853,1854,1855,1856,1,1857],[1858,1859,124,1860,28]],[1861,1862,[1863],1864,[1865,1866,1867,1868],[1869,410,1870]],[1871,1872,[],1873,[1874,1875,1876,1877,73],[1878,80,30]],[1879,1880,[],1881,[1882,1883,1,1884,1885],[58,2,1886]],[411,1887,[],1888,[412,413,414,415],[19,30,416]],[1889,1890,[1891],1892,[1893,1894,1895,1896,139],[1897,1898,279,1899]],[1900,1901,[],1902,[0,1903,1904,1905,1906],[1907,1908]],[1909,1910,[],1911,[40,1912,417,1913,1914],[1915,1916,3,1917]],[1918,1919,[],1920,[1921,1922,1923,1924],[1925,418,1926,1927]],[419,1928,[],420,[421,422,423,424],[425,426,427]],[1929,1930,[1931],1932,[1933,147,1934,1935,1936],[1937,39,1938,57,1939]]]],[1940,1941,428,[[1942,1943,[1944,1945],1946,[1947,400,1,40,1948],[81,148,1949,53]],[1950,1951,[1952,399],1953,[1954,1955,9,1956,17],[1957,3,1958]],[1959,128,[1960],1961,[1,1962,1963,1964,47],[1965,1966,429]],[1967,1968,[1969,1970],1971,[92,1972,1973,1974,1975],[1976,1977,1978]],[430,1979,[1980,1981],1982,[59,431,432,433,434],[435,81,15,436]],[381,382,[1983],1984,[23,383,384,385,386],[387,78,388]],[365,366,[367],1985,[368,369,370,371,10],[372,3,373]],[1986,1987,[1988],1989,[1990,1991,1992,20,8],[1993,1994,1995]],[1996,1997,[1998],1999,[2000,2001,2002,56,2003],[2004,437]],[2005,2006,[438],2007,[2008,2009,2010,2011],[2012,438,2013]],[2014,2015,[2016],2017,[2018,2019,2020,2021],[2022,437]],[2023,2024,[2025],2026,[2027,59,2028,2029],[2030]],[2031,2032,[2033],2034,[2035,129,1],[81,2036,2037]],[294,11,[2038],2039,[295,296,4,297],[298,299,53,300]],[439,149,[2040],440,[35,150,77,441],[29,442,443,53]],[2041,444,[],2042,[2043,60,17,2044],[2045,2046,2047]],[2048,2049,[],2050,[2051,2052,1,41],[2053,410,2054]],[2055,2056,[],2057,[2058,2059,16,2060],[2061,2062,2063]],[2064,2065,[],2066,[71,2067,2068,2069,2070,2071,2072,2073],[2074,2075]],[2076,2077,[],2078,[2079,9,2080,18,129],[2081,2082,2083]],[2084,323,[2085],2086,[2087,2088,2089,2090],[2091,2092]],[445,446,[],2093,[447,448,38,449],[450,451,2]],[374,375,[376],2094,[377,378,47,379,145,79],[380,19,48]],[2095,2096,[2097],2098,[2099,2100,2101,2102,2103],[2104,11,2105,244,2106]],[2107,2108,[2109],2110,[2111,59,43,2112,452,453],[2113,2114,2115,128,2116]],[2117,2118,[],2119,[2120,2121,454,2122],[2123,2124,2125]],[2126,2127,[],2128,[2129,2130,2131,2132,2133],[2134,2135,2136,2137,2138]],[2139,2140,[2141],2142,[2143,2144,2145,2146,2147],[455,2148,2149,2150]],[2151,2152,[2153],2154,[2155,2156,2157,2158,2159,2160],[2161,2162,2163]],[2164,2165,[2166],2167,[2168,2169,2170,2171,2172,2173,82,2174],[2175,2176,2177]],[2178,2179,[2180],2181,[2182,454,2183,2184,2185,38],[2186,455,2187]],[2188,2189,[2190,2191],2192,[17,456,2193,60,2194,444],[2195,2196,146]],[2197,2198,[2199,2200],2201,[2202,113,65,18,2203,47,1,2204,60,8,2205,71,43],[2206,2207]],[2208,79,[2209],2210,[2211,2212,457,33],[429,2213,2214]],[2215,2216,[2217],2218,[79,272,2219,2220,2221,2222],[2223,2224,2225,2226,2227]]]],[2228,2229,2230,[[2231,140,[2232,2233],2234,[142,144,2235,2236,2237],[2238,2239,70,2240]],[439,149,[2241,2242],440,[35,150,77,441],[29,442,443,53]],[2243,2244,[2245,458],2246,[2247,20,74,2248],[2249,2250,2251,28]],[2252,2253,[2254,2255],2256,[2257,2258,2259,2260],[2261,2262,2263,37]],[2264,2265,[2266,2267],2268,[2269,2270,2271,2272],[2273,2274,29,2275]],[2276,2277,[2278,2279],2280,[2281,2282,2283,2284],[2285,2286,2287,2288]],[2289,2290,[2291,2292],2293,[142,2294,2295,2296],[2297,2298,70,2299]],[2300,2301,[42,2302],2303,[42,2304,2305,2306],[2307,2308]],[2309,2310,[2311,2312],2313,[2314,2315,2316],[38,459,2317,313]],[2318,2319,[2320,2321],2322,[20,2323,2324,2325],[460,2326,2327]],[361,133,[134,2328],311,[362,75,1,363],[364,19]],[2329,2330,[2331,2332],2333,[2334,1,2335,2336],[2,2337,2338]],[2339,2340,[2341,2342],2343,[2344,2345,265,2346,2347,2348,2349],[2350,2351,2352,2353]],[2354,2355,[2356,2357],2358,[42,398,1,457],[2359,2360,461]],[2361,2362,[2363,2364],2365,[2366,2367,22,2368,2369,4],[2370,318,462,14]],[2371,2372,[2373,2374],2375,[2376,2377,2378,2379,2380],[2381,2382,2383,2384,6]],[2385,2386,[2387,2388],2389,[2390,2391,2392,2393],[2394,2395,2396,2397]],[2398,2399,[2400,2401],2402,[2403,463,2404,135,20],[2405,2406,2407,2408,459]],[2409,2410,[2411,2412],2413,[2414,2415,2416,2417],[2418,2419,2420,236]],[2421,2422,[2423,2424],2425,[2426,2427,1,2428],[2429,2430]],[2431,2432,[2433,2434],2435,[2436,35,150,77,2437],[2438,2439,2440,6,46,67]],[2441,139,[2442,2443],2444,[2445,2446,135,2447,2448,2449],[2450,2451,464,465,141]],[2452,2453,[2454,2455],2456,[2457,463,2458,2459,2460],[2461,149,2462,2463]],[2464,466,[2465,2466],2467,[2468,2469,2470,35],[2471,2472,2473]],[301,130,[302,54],2474,[303,23,73,0,304],[305,19]],[340,341,[2475,342],343,[56,344,144,1,0],[3,345,6,30]],[411,2476,[2477,2478],2479,[412,413,414,415],[19,30,416]],[2480,2481,[2482,2483],2484,[2485,2486,2487,2488,2489],[76,465,2490,2491,11]],[2492,2493,[2494,2495],2496,[2497,2498,2499,2500,2501],[2502,2503,2504,2505]],[2506,2507,[2508,2509],2510,[2511,2512,2513,2514,2515],[2516,12,467,2517,2518]],[2519,2520,[2521,2522],2523,[2524,2525,2526,2527,2528],[2529,2530,2531,2532,2533]],[2534,2535,[2536,2537],2538,[2539,2540,2541,2542,2543,2544],[2545,2546,467,37,2547]],[390,391,[392,2548],2549,[393,394,395,396],[397,30,80]],[2550,2551,[2552,2553],2554,[2555,2556,2557,2558,2559],[2560,2561,2562]],[2563,2564,[2565,2566],2567,[456,2568,2569,2570,2571],[2572,2573,2574]],[2575,2576,[2577,2578],2579,[2580,2581,2582,2583],[2584,2585,2586,2587,2588]],[334,35,[2589,2590],2591,[335,336,337,338],[339,76,140,141]],[2592,2593,[2594,2595],2596,[2597,2598,468,2599],[2600,29,11,469]],[2601,464,[2602,2603],2604,[56,2605,34,2606,468,20],[29,2607,469,3,2608]],[2609,2610,[2611,2612],2613,[2614,2615,20,2616,2617],[2618,2619,2620,2621,38]]]],[2622,2623,470,[[2624,2625,[2626,2627],2628,[151,61,471,2629],[2630,2631,2632]],[2633,2634,[2635],2636,[2637,472,2638,2639],[2640,2641,473]],[2642,2643,[2644],2645,[162,2646,5,471],[2647,152,2648]],[2649,2650,[2651,2652],2653,[2654,44,5,61],[2655,2656,2657]],[2658,2659,[2660],2661,[2662,2663,2664],[2665,2666,2667]],[2668,2669,[2670],2671,[474,475,17,5],[2672,2673,152]],[2674,2675,[2676],2677,[17,475,2678,8],[12,8,24]],[2679,2680,[2681],2682,[476,2683,61,2684],[122,2685,2686]],[2687,2688,[2689],2690,[44,2691,8,474],[39,24,2692]],[2693,2694,[2695],2696,[2697,83,477,1],[478,2698,39]],[2699,2700,[2701],2702,[2703,5,479,0],[152,60,126]],[2704,2705,[2706],2707,[153,2708,479,2709],[2710,133,309]],[2711,2712,[2713],2714,[2715,2716,2717],[2718,480,2719]],[481,482,[483],2720,[154,484,62],[58,485,486]],[2721,2722,[],2723,[2724,61,155,35],[6,2725,2726]],[2727,2728,[2729],2730,[44,2731,9,0],[6,11,8]],[445,446,[],2732,[447,448,38,449],[450,451,2]],[2733,2734,[2735],2736,[8,2737,44,2738,2739,43],[32,2740,2741,2742]],[2743,2744,[],2745,[2746,2747,2748,8],[2749,2750,2751]],[2752,2753,[],2754,[2755,83,477,1],[478,12,54]],[2756,2757,[],2758,[2759,2760,2761,2762,2763,43],[127,2764,12,6,8]],[2765,2766,[],2767,[1,20,2768,60],[308,24,418]],[2769,2770,[2771],2772,[487,0,22,61],[2773,2774,488]],[2775,2776,[],2777,[2778,2779,2780,2781,2782,153],[2783,2784,19]],[2785,2786,[],2787,[2788,2789,2790,2791],[55,489,2792,2793]],[2794,2795,[],2796,[2797,2798,2799,153,487],[58,2800,2801,2802]],[2803,2804,[2805],2806,[2807,2808,0,115,490,401],[2809,2810,28,473,2]],[2811,2812,[2813],2814,[44,83,2815,8],[2816,2817,2818]],[2819,2820,[],2821,[44,83,2822,2823,0,402],[461,2824,2825,2826]],[2827,2828,[],2829,[2830,2831,2832,488],[2833,2834,2835]]]],[2836,2837,428,[[2838,84,[2839,2840],2841,[2842,2843,2844,82,2845],[2846,15,2847,2848]],[430,2849,[2850,2851],2852,[59,431,432,433,434],[435,81,15,436]],[2853,2854,[2855,2856],2857,[2858,2859,2860,36,155],[2861,2862,2863,2864]],[2865,2866,[2867,2868],2869,[2870,2871,2872,2873,62],[2874,2875,3,458]],[2876,2877,[2878],2879,[2880,2881,2882,2883,2884],[2885,2886,2887,2888]],[2889,2890,[2891],2892,[2893,2894,2895,2896],[2897,14,6,2898]],[2899,2900,[2901,2902],2903,[2904,2905,2906,2907,2908],[2909,2910,2911,2912]],[2913,2914,[2915],2916,[2917,2918,2919,476],[2920,2921,491,492]],[2922,2923,[2924],2925,[2926,2927,2928,62],[2929,2930,14,2931]],[2932,2933,[2934],2935,[2936,2937,2938,2939,2940],[2941,2942,2943,2944]],[2945,2946,[2947],2948,[2949,2950,2951,2952,2953],[2954,2955,2,2956]],[2957,2958,[2959],2960,[2961,2962,452],[2963,2964,2965,2966]],[2967,2968,[2969],2970,[151,2971,2972,2973,2974],[2975,2976,2977,2978]],[2979,2980,[480],2981,[493,494,2982,2983,2984],[2985,2986,148]],[2987,2988,[2989],2990,[494,2991,493,2992,2993],[2994,2995,2996,11]],[2997,2998,[2999],3000,[3001,495,3002,3003,3004],[3005,3006,3007,3008]],[3009,3010,[3011],3012,[3013,3014,3015,82],[3016,3017,3018]],[3019,3020,[3021],3022,[3023,495,3024],[3025,3026,3027,3028]],[3029,3030,[3031],3032,[3033,3034,3035,3036,3037],[3038,3039,3040,3041]],[3042,3043,[3044],3045,[3046,496,5,3047,3048],[3049,3050,122]],[3051,82,[3052],3053,[3054,59,154,3055,3056],[3057,3058,3059,84,3060]],[3061,3062,[3063],3064,[497,3065,472,3066],[3067,498]],[3068,3069,[3070],3071,[3072,151,3073,3074],[3075,498]],[3076,3077,[3078],3079,[3080,3081,3082,3083],[3084,3085,3086]],[3087,3088,[3089],3090,[497,3091,3092,3093],[3094,3095]],[3096,3097,[3098],3099,[3100,3101,3102,3103],[3104,3105,3106]],[3107,3108,[3109],3110,[3111,3112,3113,62,3114],[3115,3116,491,3117]],[3118,3119,[3120],3121,[3122,3123,271,3124,3125],[3126,3127,84,3128,6,3129]],[3130,3131,[3132],3133,[8,3134,3135,3136,75,3137],[3138,11,3139,3140,3141]],[3142,3143,[3144],3145,[3146,3147,3148,3149],[3150,3151,3152,3153,3154,3155,6,3156]],[3157,3158,[3159],3160,[3161,3162,3163,3164],[3165,3166,3167,3168,3169]],[3170,3171,[3172],3173,[3174,3175,3176,3177,3178],[3179,3180,3181,84,3182]],[3183,3184,[3185],3186,[3187,3188,3189],[3190,3191,3192,3193]],[3194,3195,[3196],3197,[3198,3199,3200,3201],[3202,3203,3204,499,3205]],[481,482,[483],3206,[154,484,62],[58,485,486]]]],[3207,3208,3209,[[3210,453,[3211,3212,3213],3214,[3215,500,3216,3217],[3218,3219,3220,3221]],[3222,3223,[3224,3225],3226,[3227,147,3228,3229],[3230,143,3231]],[3232,3233,[3234,3235],3236,[3237,3238,3239,3240],[3241,3242]],[3243,360,[3244,3245],3246,[3247,147,3248,3249],[3250,48,3251]],[3252,3253,[3254],3255,[3256,3257,3258,3259],[3,3260,3261,3262]],[3263,3264,[163,3265],3266,[3267,3268,3269,3270],[3271,3272,3273]],[3274,3275,[3276,3277],3278,[3279,3280,3281,3282],[3283,3284,14]],[346,347,[3285],3286,[348,349,350,351],[352,3,353]],[354,3287,[3288],3289,[355,356,357],[358,15,359]],[3290,3291,[3292],3293,[3294,3295,3296],[3297,3298,3299]],[3300,3301,[3302],3303,[3304,3305,3306,3307],[3308,3309,14]],[3310,3311,[3312],3313,[3314,3315,3316,3317],[3318,3319,3320]],[3321,3322,[3323],3324,[3325,3326,3327,3328],[3329,3330,3331]],[403,3332,[3333],3334,[404,405,406,407],[408,3,409]],[3335,3336,[501],3337,[3338,3339,3340,3341],[3342,3343,3344]],[3345,3346,[3347],3348,[3349,3350,3351,3352],[3353,3354,3355]],[3356,3357,[3358],3359,[3360,3361,3362,3363],[3364,3365,3366]],[3367,3368,[3369],3370,[3371,3372,3373],[3374,2,3375]],[3376,3377,[3378,3379],3380,[3381,3382,3383,3384],[3385,3386,3387]],[419,3388,[3389],420,[421,422,423,424],[425,426,427]],[3390,3391,[3392],3393,[3394,3395,496,3396],[3397,3398,3399]],[3400,3401,[3402],3403,[3404,3405,3406,3407],[3408,3409]],[3410,3411,[3412],3413,[3414,3415,3416,3417],[3418,3419,3420]],[3421,3422,[3423],3424,[3425,3426,3427,3428,3429,3430],[3431,3432,14,3433,3434]],[3435,3436,[3437],3438,[3439,3440,3441,3442],[3443,3444,3,492,502]],[3445,3446,[3447],3448,[3449,3450,503,3451,3452],[3453,3454,146]],[3455,3456,[3457,3458],3459,[3460,3461,3462,3463],[3464,37,3465,3466,156]],[3467,3468,[3469],3470,[3471,3472,3473,3474,3475],[3476,504,3,3477]],[3478,3479,[3480],3481,[3482,3483,3484,3485],[3486,3487,3488]],[3489,3490,[3491],3492,[3493,3494,3495,3496,3497,3498],[3499,3500,3501,3502,12]],[3503,3504,[3505],3506,[3507,3508,3509,3510],[3511,3512,3513]],[3514,3515,[3516],3517,[3518,3519,3520,3521,503],[3522,3523,500,501,14]],[3524,3525,[3526],3527,[3528,3529,3530,3531,3532],[3533,3534,3535,3,12]],[3536,3537,[3538],3539,[3540,3541,3542,3543,3544,3545],[58,3,3546,3547,3548]],[3549,3550,[3551],3552,[3553,3554,3555,3556],[3557,3558,3559,3560,156,3561,3562,12,3563]],[3564,3565,[3566],3567,[3568,3569,3570,3571],[3572,3573,14]],[3574,3575,[3576,3577],3578,[3579,3580,3581,3582,3583],[3584,3585,3586,3587]],[3588,3589,[3590],3591,[3592,3593,3594,505,3595],[3596,3,3597,3598,3599]],[3600,505,[3601],3602,[3603,3604,3605,257,86,43],[29,3606,37,156,278]]]],[3607,3608,470,[[280,281,[3609,282],3610,[283,284,285,286,287],[288,289,290,291]],[3611,506,[3612,3613],3614,[3615,292,0,72,9],[3616,14,3617,462]],[3618,3619,[3620,3621],3622,[23,0,13,3623,3624],[3625,3626]],[3627,3628,[3629,3630],3631,[3632,0,72,10],[3633,3634,3635]],[3636,3637,[3638],3639,[3640,36,3641,45],[3642,3643]],[3644,3645,[3646],3647,[0,10,1,72,3648],[3649,3650,3651]],[3652,3653,[3654],3655,[3656,3657,3658,0],[3659,3660]],[3661,3662,[3663],3664,[3665,34,157,3666],[3667,504]],[3668,507,[3669],3670,[4,33,7,1],[3671,3672,3673]],[3674,3675,[3676],3677,[3678,3679,4,26],[3680,261,3681]],[3682,3683,[3684],3685,[3686,155,3687,3688],[3689,3690,3691]],[3692,3693,[3694],3695,[3696,3697,3698,466],[3699,3700]],[3701,3702,[3703],3704,[3705,3706,4,3707],[3708,3709]],[3710,3711,[125],3712,[3713,123,3714,3715],[3716,125,119]],[3717,3718,[3719],3720,[3721,3722,3723,113],[3724,2,3725,3726]],[3727,3728,[3729],3730,[157,34,3731,3732,0,262],[64,124,3733,3734]],[3735,3736,[3737],3738,[3739,3740,0,18,5],[3741,64,3742,506]],[3743,3744,[],3745,[234,3746,33,507],[3747,3748]],[105,106,[3749],3750,[1,0,10,107,4,108],[109,110]],[508,509,[510,511],3751,[512,513,514,36,104],[515,516]],[3752,517,[3753],3754,[3755,3756,114,293,3757],[3758,3759,3760,3761,3762]],[3763,3764,[3765],3766,[160,7,4,20,145,16],[332,50,24]],[3767,3768,[3769],3770,[3771,3772,3773,3774,3775],[3776,460,3777,307,3778]],[3779,3780,[3781],3782,[0,3783,517,3784,3785,3786],[3787,3788,3789,3790,3791]],[3792,3793,[],3794,[3795,490,1,3796],[3797,3798,54,3799,3800]]]],[3801,3802,306,[[3803,3804,[3805,3806],3807,[3808,3809,1,518,3810,321],[148,3811,3812,3813]],[3814,3815,[3816,3817],3818,[3819,3820,3821,3822,3823,3824],[519,158,3825,3826]],[3827,3828,[3829],3830,[3831,3832,3833,3834,3835],[3,3836,3837,159]],[3838,3839,[3840],3841,[3842,3843,3844,3845,3846],[2,3847,3848,3849]],[3850,3851,[3852],3853,[3854,3855,3856,3857,3858],[3859,3860,3861,3862]],[3863,3864,[3865],3866,[3867,3868,3869,3870,3871],[2,3872,3873,3874]],[3875,3876,[3877],3878,[3879,3880,3881,3882,3883],[15,3884,3885,3886]],[3887,3888,[],3889,[3890,3891,3892,3893,520],[19,3894,3895,3896]],[3897,3898,[3899],3900,[3901,3902,3903,3904,3905],[2,3906,3907,3908]],[3909,3910,[3911,3912,3913],3914,[3915,3916,3917,3918,3919,3920],[3921,3922,3923,3924,3925]],[3926,3927,[3928,3929],3930,[3931,3932,3933,3934,3935],[2,3936,3937,3938]],[3939,3940,[],3941,[3942,3943,3944,3945],[3946,3947,3948,2]],[3949,3950,[],3951,[3952,3953,3954,3955,3956,3957],[3958,55,3959]],[3960,3961,[],3962,[3963,3964,3965,3966],[3967,3968,2,3969]],[3970,3971,[3972],3973,[3974,3975,3976,3977,85],[3978,3979,3980,3981]],[3982,3983,[3984],3985,[3986,3987,85,3988,3989],[2,3990,158,117]],[3991,3992,[3993],3994,[3995,3996,85,3997,3998],[2,3999,4000,4001]],[4002,4003,[4004],4005,[4006,4007,4008,4009,4010,4011],[4012,4013,4014,4015,4016]],[4017,4018,[4019],4020,[4021,4022,4023,4024],[2,4025,4026,4027]],[4028,4029,[4030,4031],4032,[4033,4034,4035,4036,4037,518],[4038,4039,4040]],[4041,4042,[4043],4044,[4045,4046,4047,521,4048,4049],[158,4050,4051,159]],[4052,4053,[4054],4055,[4056,4057,4058,85,522],[4059,4060,27,4061]],[4062,4063,[4064],4065,[4066,4067,4068,71,4069,4070],[4071,4072,4073,502,67]],[4074,4075,[4076],4077,[4078,4079,4080,4081],[4082,4083,4084,4085]],[4086,4087,[],4088,[4089,4090,4091,522],[2,4092,4093,4094]],[4095,4096,[4097],4098,[4099,4100,4101,4102],[2,4103,4104,520]],[4105,4106,[],4107,[4108,4109,4110,4111],[4112,2,4113,4114]],[4115,4116,[],4117,[4118,4119,4120,4121,4122,4123],[2,4124,4125]],[4126,4127,[],4128,[4129,4130,4131,4132,4133,4134],[4135,4136,2,27]],[4137,4138,[],4139,[4140,4141,4142,4143,4144,4145],[4146,489,4147,4148,4149]],[4150,4151,[4152,4153],4154,[4155,4156,4157,4158,4159,4160],[2,4161,4162,159]],[4163,4164,[],4165,[4166,4167,4168,4169,4170,4171],[2,4172,4173,4174]],[4175,4176,[4177],4178,[4179,4180,4181,4182,4183,4184],[4185,4186,4187]],[4188,4189,[4190],4191,[4192,4193,4194,4195,521,4196],[2,27,4197]],[4198,4199,[],4200,[4201,4202,4203,4204,4205,4206],[15,4207,4208,4209,4210]],[4211,4212,[4213],4214,[4215,4216,4217,4218,4219,4220],[15,4221,4222]],[4223,4224,[4225],4226,[4227,4228,4229,4230,4231,4232],[4233,4234,4235,4236]],[4237,4238,[4239],4240,[157,4241,4,4242,4243,4244],[519,4245,4246,4247,4248]],[4249,4250,[4251],4252,[4253,4254,4255,4256,4257,4258],[4259,4260,4261,4262,4263]],[4264,4265,[],4266,[4267,4268,4269,4270,4271],[4272,4273,4274,4275]]]],[4276,4277,4278,[[4279,4280,[4281,4282],4283,[417,4284,4285,4286,4287],[4288,4289,4290]],[4291,4292,[4293],4294,[4295,4296,4297,4298,4299],[4300,4301,4302,259]],[4303,4304,[4305],4306,[4307,4308,4309,4310,4311],[4312,4313,4314,4315]],[4316,4317,[523],4318,[4319,0,4320,4321,4322],[4323,4324,57]],[4325,4326,[263,4327],4328,[4329,4330,4331,4332],[4333,4334,4335,4336]],[508,509,[510,511],4337,[512,513,514,36,104],[515,516]],[175,176,[177],4338,[178,179,180,181,182],[183,184,185,186]],[187,188,[13],4339,[189,16,190,191],[88,192,193]],[194,90,[195],4340,[196,13,197,31],[198,199,200,91]],[165,166,[167],4341,[168,169,170,171],[172,173,174]],[4342,4343,[4344],4345,[4346,4347,4348,4349,4350],[4351,4352]],[4353,524,[4354],4355,[4356,4357,4358,4359,4360],[4361,229,4362]],[4363,314,[51],4364,[4365,4366,5,316],[4367,136,4368]],[4369,136,[4370],4371,[4372,4373,4374,4375],[4376,4377,4378]],[4379,4380,[4381],4382,[4383,4384,4385,4386],[4387,4388]],[4389,4390,[40],4391,[4392,4393,43,4394],[4395,4396]],[4397,4398,[4399],4400,[4401,4402,4403,4404],[4405,15,4406]],[4407,525,[4408],4409,[4410,4411,4412,4413],[4414,4415]],[4416,4417,[526],4418,[526,389,4419,4420,4421],[4422,55,525,4423,132]],[4424,4425,[4426],4427,[4428,4429,4430,527],[4431,4432,4433]],[4434,4435,[4436],4437,[4438,4439,4440],[4441]],[4442,4443,[4444],4445,[4446,4447,527,4448],[4449,4450]],[4451,4452,[4453],4454,[4455,4456],[4457,4458,4459]],[4460,4461,[4462],4463,[4464,4465,112,4466],[4467,4468,57,524,4469]],[4470,4471,[65],4472,[65,4473,4474,4475,13,31],[90,57,499,4476,91,131,4477]],[93,4478,[4479],4480,[94,95,96,97,98],[99,100,101]],[4481,4482,[4483],4484,[4485,4486,4487,4488,51,4489],[4490,4491,4492,4493,4494]],[4495,4496,[4497],4498,[4499,4500,137,138,4501],[523,4502,4503,4504]],[326,327,[4505],4506,[328,137,138,5],[329,330]],[4507,4508,[528],4509,[4510,315,5,4511,74],[273,528]]]]]}';
+
+let decodificado: SistemaCorporal[] | undefined;
+
+// Decodifica el catálogo la primera vez que se pide
+export const cargarEnfermedadesCompactas = (): SistemaCorporal[] => {
+  if (!decodificado) decodificado = decodificarEnfermedades(datos);
+  return decodificado;
+};
@@ -1,6 +1,9 @@
 // Pócima Salvage - Base de datos expandida de enfermedades por sistemas del cuerpo humano
 // Generado automáticamente - Total: 469 enfermedades
 
+import { buscarEnIndice } from './busqueda';
+import { indiceBusquedaEnfermedades } from './busqueda-index';
+
 export interface EnfermedadExpandida {
   id: string;
   nombre: string;
@@ -4338,10 +4341,13 @@ export const getAllEnfermedades = (): EnfermedadExpandida[] => {
   return sistemasCorporales.flatMap(sistema => sistema.enfermedades);
 };
 
-// Función para buscar enfermedades
+// Función para buscar enfermedades (índice de trigramas sin acentos; filtro lineal si el índice está desactualizado)
 export const buscarEnfermedadesExpandidas = (query: string): EnfermedadExpandida[] => {
+  const enfermedades = getAllEnfermedades();
+  const posiciones = buscarEnIndice(indiceBusquedaEnfermedades, query, huellaEnfermedades);
+  if (posiciones) return posiciones.map(i => enfermedades[i]);
   const q = query.toLowerCase();
-  return getAllEnfermedades().filter(e =>
+  return enfermedades.filter(e =>
     e.nombre.toLowerCase().includes(q) ||
     e.otrosNombres.some(n => n.toLowerCase().includes(q)) ||
     e.descripcion.toLowerCase().includes(q)
@@ -4361,3 +4367,6 @@ export const getEnfermedadExpandidaById = (id: string): EnfermedadExpandida | un
 
 // Exportar conteo total
 export const totalEnfermedades = 469;
+
+// Huella del contenido: los índices generados la guardan para saber si están al día
+export const huellaEnfermedades = "60dad39b67d7ff44";
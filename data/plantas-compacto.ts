@@ -0,0 +1,15 @@
+// Pócima Salvage - Catálogo compacto (cadenas internadas, ver data/compacto.ts)
+// Generado automáticamente por scripts/build-compact-catalog.py - no editar a mano
+
+import type { CategoriaPlanta } from './plantas-expandidas';
+import { decodificarPlantas } from './compacto';
+
+const datos = '{"v":1,"campos":[["id","s"],["nombre","s"],["nombreCientifico","s"],["nombresAlternativos","m"],["propiedades","l"],["parteUsable","s"],["dosis","s"],["preparacion","s"],["contraindicaciones","c"],["fuente","s"],["descripcion","s"],["sistemasRelacionados","l"]],"cadenas":["USA_English","UK_English","España","sistema-digestivo","sistema-inmunologico","otro","Antioxidante","enfermedades-piel","sistema-nervioso","embarazo","sistema-cardiovascular","sistema-respiratorio","Antiinflamatoria","Antiinflamatorio","Indigena","sistema-urinario","sistema-musculoesqueletico","Colombia","Expectorante","medicamentos","Mexico","Astringente","Hojas","sistema-endocrino","alergia","Diurético","Fruto","México","Argentina","Otros","trastornos-mentales-emocionales","Diurética","Caribe","enfermedades-ojos-oidos-nariz-garganta","sistema-reproductor","Cicatrizante","Digestivo","Digestiva","Infusión","Carminativo","Raíz","Semillas","Chile","Sedante","Antiséptico","Peru","Fruto completo","hipertension","Perú","Consumo directo, zumo","Antiespasmódico","Antiviral","Vitamina C","Flores","1-2 frutos al día","Cuerpo fructífero","Refuerza el sistema inmunológico","Analgésico","moringa","Relajante","Antiséptica","Antiespasmódica","Analgésica","ninos","Rizoma","No se recomienda su consumo.","Carminativa","Antibacteriano","Yuca","Nutritiva","Hojas y flores","sistema-linfatico","lactancia","Hipoglucemiante","Inmunoestimulante","Energizante","diabetes","Decocción","Nutritivo","Remineralizante","Emoliente","Inmunomodulador","Refuerza el sistema inmunitario","Centroamérica","Laxante","Sábila","Centroamerica","Antitumoral","Laxante suave","Hidratante","Antimicrobiana","Sumidades floridas","turmeric","Hepatoprotectora","Ansiolítica","Depurativa","Mandioca","Consumo como alimento.","Estimulante","oregano","Consumo directo","guisador","ginger","China","Corteza","Febrífugo","Flores y hojas","Consultar a un profesional","ginkgo","Agave","saúco","ben","malungáy","boldo","Antiséptico urinario","Adaptógeno","cilantro","azafrán cimarrón","Puede interactuar con anticoagulantes.","Afrodisíaco","Ansiolítico","yuca","cacao","rosemary","Infusión, aceite esencial","dill","curcuma","Japón","lavender","Sedante suave","maravilla","herb of grace","Aloe vera","Hipotensor","Estimulante circulatorio","Vitamínico","zarzaparrilla","Toda la planta","Antifúngico","Antimicrobiano","Tónico","1-2 tazas de infusión al día","black elder","European elder","Vitamínico (Vitamina C)","Gotu kola","Salud ocular","Cardioprotectora","Fruto (semilla)","Aplicación tópica del jugo de las hojas.","Fortalece el sistema inmunológico","common thyme","German thyme","garden thyme","wild marjoram","pot marjoram","culantro Castilla","dill-oil plant","east indian dill","indian dill","meeting-seed","sabbath day posy","dillweed","sage","common sage","garden sage","golden sage","kitchen sage","true sage","culinary sage","Consumo directo en comidas.","botón de oro","malva","common mallow","Antibacteriana","blue gum","Tasmanian blue gum","maidenhair tree","pasionaria","mburucuyá","Antipirético","bilberry","whortleberry","asian ginseng","chinese ginseng","korean ginseng","Cardiotónico","dog rose","Guaco","drumstick tree","horseradish tree","Asiatic pennywort","strawberry tree","Chaga","Puede causar reacciones alérgicas en personas sensibles.","pomegranate","Un puñado (20-30g) al día","café","guaraná","Machacar las hojas y aplicar el jugo sobre la piel.","orégano","Infusión de 1-2 cucharaditas por taza.","Consumo directo, infusión","Vermífugo","Depurativo","Tónico nervioso","Hojas y sumidades floridas","Emenagogo","black caraway","Emenagoga","Tónico amargo","Calmante","Tallo","Hipocolesterolemiante","Tubérculo","Infusión: 2-3 tazas al día.","neem","Antidiarreico","limón","lingonberry","1-3 gramos de extracto al día.","Consumo regular en la dieta.","Mejora la digestión","Fruto, hojas (infusión)","sandía","basil","sweet basil","Infusión, jarabe","Refrescante","coriander","bay tree","bay laurel","sweet bay","true laurel","grecian laurel","Regulador hormonal","hierba santa","fennel","sweet fennel","bronze fennel","finocchio","florence fennel","Curcuma longa","Cuba","polluelo","yuquilla","turmérico","jengibrillo","palillo cholón","palillo chuncho","palillo","jengibre","Jengibre","Zingiber officinale","kion","Filipinas","luya","ajengible","ajengibre","ajingible","anjengibre","common ginger","India","adrak","sheng jiang","shoga","Saffron","Autumn Crocus","Antidepresivo","garden angelica","wild celery","norwegian angelica","archangel","holy ghost","No usar durante el embarazo.","black seed","black cumin","fennel flower","nigella","fenugreek","bird\'s foot","goat\'s horn","greek clover","greek hay","greek hayseed","sicklefruit fenugreek","Rubefaciente","galanga","lesser galangal","greater galangal","siamese ginger","java galangal","blue ginger","thai ginger","wasabi","Descongestionante","wormwood","absinthium","green ginger","absinthe","old woman","southernwood","absinth sage","absinth wormwood","absinth sagewort","common sagewort","absinthe mugwort","Infusión, extracto","rue","common rue","garden rue","manzanilla","Barbados aloe","Ajo","Anticoagulante","American aloe","Sambucus nigra","sabuco","canillero","elderflower","elder","Cassava","Manioc","corn poppy","Apio","kava","Copaiba","Venotónico","Indian gooseberry","Hepatoprotector","greater burdock","edible burdock","lappa","beggar\'s buttons","thorny burr","happy major","Anise","Decocción: 1-2 tazas al día.","Neuroprotector","Infusión, decocción","common hawthorn","whitethorn","one-seed hawthorn","Sangre de drago","Sangre de grado","Ceiba","cowberry","blackcurrant","Rico en Vitamina C","elderberry","No se conocen contraindicaciones importantes.","Neuroprotectora","maca","Atractylodes","Codonopsis","Reishi","Kumquat","pitahaya","zarzamora","Vitamínica","Un puñado al día.","maní","Evitar en grandes cantidades.","Polvo","ají dulce","Uso culinario","nopal","romero","Romero","Rosmarinus officinalis","romero común","romero blanco","romero hembra","romero macho","Puede elevar la presión arterial.","culantro","Hojas y semillas","eneldo","Anethum graveolens","aneto","anet","salvia real","madreselva","mermasangre","Infusión, gargarismos","Galactagogo","Anís","Cúrcuma","Puerto Rico","azafrán","cúrcuma","common turmeric","Indian saffron","golden herb","yellow ginger saffron","haldi (Hindi)","Antiemético","lavanda","Lavanda","Lavandula angustifolia","espliego","alhucema","cantueso","true lavender","English lavender","cedrón","Decocción, infusión","Evitar durante el embarazo.","Estimulante digestivo","Purgante","clavelina","flor de muerto","Sudorífica","Balsámica","yarrow","ajenjo","Colagogo","Cola de caballo","Diente de león","Ginkgo biloba","Mejora la memoria","huckleberry","Energética","Demulcente","Balsámico","acacia","Amla","Hipolipemiante","granado","Punica granatum","Guayabo","Guayaba","mora","No recomendado.","Inmunomoduladora","Fruto y hojas","Diaforética","Partes aéreas","No recomendado en grandes cantidades.","mashua","mandioca","zinnia","Consumo directo, infusión de hojas","Semilla","tomillo","Tomillo","Thymus vulgaris","boja","bojas","estremoncello","estremoncillo","tomello","tremoncillo","timonet","farigola","Orégano","Origanum vulgare","furiégano","mejorana silvestre","oreganín","orégano común","orégano nano","orégano trenzado","orégano turco","orenga","orégano francés","orégano de la tierra","orégano orejón","orégano brujo","sándalo","peppermint","chocolate mint","curly mint","hairy mint","white peppermint","english mint","perejil chino","Ecuador","chinese parsley","Hojas y raíz","Eneldo","abesón","aneta","salvia","Salvia","Salvia officinalis","celima","hierba del mudo","salima fina","salvia blanca","salvia fina","salvia hortense","gallocresta","salve","hierba de la salud","sabia","salva","salvá","salva cruz","salvia en cruz","té moruno","té de jardín","María Pastora","Sally-D","menta mágica","salvia del país","salvia de playa","salvia cimarrona","sweet marjoram","marjoram","Foeniculum vulgare","cumin","cummin","jeera","Pimpinella anisum","Ceylon cinnamon","True cinnamon","Green cardamom","True cardamom","limoncillo","Infusión de una cucharadita por taza.","hyssop","Antitusivo","tansy","common tansy","bitter buttons","cow bitter","golden buttons","Raíz y hojas","nutmeg flower","fenogreco","Trigonella foenum-graecum","alholva","hilba","black mustard","Infusión, polvo","lemongrass","ruibarbo","rhubarb","Hipotensora","japanese horseradish","naranja agria","Bergamot orange","calendula","Caléndula","Calendula officinalis","mercadela","chinita","pot marigold","common marigold","ruddles","Scotch marigold","nasturtium","borage","starflower","mullein","great mullein","common mullein","Malva","Malva sylvestris","malva común","panecillos","quesitos","malva blanca","malva morada","high mallow","wood mallow","cheeses","pincel","cornflower","bachelor\'s button","meadowsweet","queen-of-the-meadow","mead wort","pride of the meadow","meadow-wort","Antipirética","mugwort","riverside wormwood","wild wormwood","felon herb","common mugwort","common hop","hop","valeriana","garden heliotrope","common valerian","all-heal","garden valerian","greek valerian","Relajante muscular","Gel de las hojas","Garlic","eucalipto","Eucalipto","Eucalyptus globulus","eucalipto blanco","eucalipto común","eucalipto azul","calipes","calipse","calipto","southern blue gum","Horsetail","Common horsetail","Field horsetail","Hipérico","Hierba de San Juan","St. John\'s wort","tila","Tila","Linden","Small-leaved lime","Achicoria amarga","Amargón","Dandelion","ginkgo-biloba","árbol de los 40 escudos","nogal del Japón","Mate","pasiflora","Pasiflora","Passiflora incarnata","flor de la pasión","granadilla","maracuyá","flor de pasión","passionflower","maypop","purple passionflower","passion flower","White willow bark","arandano","Arándano","Vaccinium myrtillus","arándano","arandanera","ráspano","mirtilo","anavia","rasponera","arandilla","arandaño","meruéndano","raspanera","raspona","amabia","mirtillo","miruéndano","uva de bosque","uva de monte","mountain blueberry","blaeberry","wimberry","winberry","fraughan","Acebo","Holly","ginseng","Ginseng","Panax ginseng","Rénshēn","Corea","Insam","Ninjin","Pennyroyal","Ortiga","Nettle","Stinging nettle","Dedalera","Foxglove","Sandalwood","Aceite esencial","Apium graveolens","Celery","Antiparasitario","kava kava","escaramujo","Rosa canina","rosal silvestre","briar rose","Bejuco de agua","olmo","field elm","Kaempferia rotunda","Moringa","Moringa oleifera","palo jeringa","jazmín francés","Centella asiática","Centella asiatica","Desintoxicante","Colerético","nim","No se recomienda su uso durante el embarazo.","horse chestnut","conker tree","nogal","English walnut","common walnut","walnut","Crataegus monogyna","majuelo","Decocción: uso externo.","houpu magnolia","canelo","almond","Caoba","limonero","madrono","Madroño","Arbutus unedo","madroño","albornio","madroña","madroñera","alborecera","borrachín","madrone","Killarney strawberry tree","strawberry madrone","bitter orange","vitex","chaste tree","Ribes nigrum","casis","enebro","common juniper","sea buckthorn","Puede interactuar con inmunosupresores.","cocoa","milkvetch","Decocción, infusión, extracto","purple coneflower","hedgehog coneflower","black sampson","coneflower","ayak chichira","Peruvian ginseng","Polvo, cápsulas, extracto","Indian ginseng","winter cherry","batata","camote","remolacha","tupinambo","arracacha","ulluco","oca","Galactagoga","Chinese peony","crosne","eleuterococo","Siberian ginseng","eleuthero","Decocción, extracto, cápsulas","sacred lotus","Indian lotus","verbena","conchita azul","Reductor del colesterol","Hen-of-the-woods","Caterpillar fungus","Puede interactuar con anticoagulantes y medicamentos para la diabetes.","Decocción o extracto.","Aromatizante","pomelo","Salud digestiva","kiwi","kiwifruit","chinese gooseberry","fig","feijoa","acerola","grape","raspberry","fresa","frutilla","strawberry","blackberry","bramble","hazelnut","1-2 cucharadas al día","Consumir crudas o tostadas","ajonjolí","marañón","1-2 cucharaditas en infusión","1 cucharadita en infusión","dwarf pomegranate","ají morrón","vainilla","ajwain","tuna","prickly pear","Indian fig opuntia","barbary fig","peyote","Propiedades antiinflamatorias","Mejora el estado de ánimo","Reduce el estrés","water hyssop","Indian pennywort","Reduce la ansiedad","albahaca","Albahaca","Ocimum basilicum","albacar","albacar corriente","albacar hembra","albacar macho","albahaca blanca","albahaca corriente","albahaca de Castilla","albahaca de la tierra","albahaca morada","albahaca arribeño","alhábega","alfábega","basílico","hierba real","hierba de los reyes","Antitusiva","menta","hierbabuena","toronjil","hortelana","Coriandrum sativum","coriandro","culantro europeo","dannia","laurel","Laurel","Laurus nobilis","llorer","ereñotz","lloréu","choriu","llorin","lloreru","lloureiro","lauro","laurel de apolo","laurel de dafne","Antisudoral","Puede reducir la producción de leche.","estragon","hinojo","Hinojo","hinojo común","fenoll","fiuncho","acapate","fonol común","cenojo","fenojo","fenol","mello","perejil de gitano","hinojo dulce","hinojo amargo","hinojo en rama","hinojo de Florencia","Cuminum cyminum","Infusión de 1 cucharadita por taza.","Clavo de olor","cardamomo","Elettaria cardamomum","azafran","Azafrán","Crocus sativus","Croco","Estigmas de la flor","angelica","Angélica","Angelica archangelica","ajonjera","hierba angélica","hierba de los ángeles","hierba del espíritu santo","chirivía silvestre","aingueru bedarra","angèlica","väinönputki","alexandris","hisopillo","Nigella sativa","abésoda","agenuz","ajenuz","arañuel","kalonji","Antihistamínico","Fenogreco","alforva","albolba","alvolva","heno griego","albolga","helba","k\'u-tou","methi","charlock","true mustard","brown mustard","red mustard","epazote","Antihemorrágica","Colagoga","Galanga","Alpinia galanga","jengibre de siam","galanga de java","galanga de la india","calanga","galangal mayor","jengibre siamés","lengkuas","hang dou kou","stor kalanga","el adkham","gaoliangjiang","Antiemética","caña santa","stevia","Pequeñas cantidades como condimento.","Febrífuga","altamisa","milfoil","Tónico digestivo","Ajenjo","Artemisia absinthium","asensio","ajorizo","artemisia amarga","hierba maestra","absintio","asencio","absenta","donzell","encens","asentsio","ajenjo mayor","ajenjo común","ajenjo macho","ajenjo vulgar","ajencio","ajenjio","asenjo","Hipnótico","Raíz y rizoma","ruda","Ruda","Ruta graveolens","arruda","rúa","ruda común","ruda cultivada","ruda de hojas anchas","armaga","perilla","Antialérgica","Manzanilla","manzanilla común","manzanilla de Aragón","manzanilla alemana","camomila","manzanilla de Castilla","manzanilla cimarrona","chamomile","German chamomile","Hungarian chamomile","camomile","German camomile","queza","gguía-gueza","aloe-vera","Aloe Vera","Aloe barbadensis miller","Acíbar","Aloe de Curazao","Aloe de Barbados","Equisetum arvense","Infusión o extracto","Tilia cordata","Tilo","Taraxacum officinale","Yerba mate","Corteza de sauce","agave","Maguey","Hojas y corteza","flor-de-sauco","cundumbo","Manihot esculenta","Poleo menta","Aperitivo","Antianémico","dedalera","Digitalis purpurea","Digital","amapola","Papaver somniferum","amapola silvestre","ababol","amapola colorada","field poppy","Flanders poppy","red poppy","common poppy","Escaramujo","agavanzo","escarambrojo","escaramojo","zarza rosa","agabanzo","alcallaro","alcaracache","algabala","algabanzo","calambrojo","gabancera","tapaculos","picaespalda","rosal bravío","rosal común","dog berry","witches\' briar","Antihemorrágico","Limoncillo","Ricino","Konjac","Saciante","Khat","Antirreumático","Jarabe, infusión","Galactogogo","centella-asiatica","Phyllanthus emblica","bardana","Bardana","Arctium lappa","lapa","lampazo mayor","gobó","lampazo","bardana mayor","llapassa","respingón","agarrocha","agarrucha","aguipegotes","amor de hortelano","Anís verde","tilo","small-leaved lime","Diaforético","Puede potenciar el efecto de otros sedantes.","Insecticida","Hojas, semillas, flores","Ginkgo Biloba","Consumo directo.","Juglans regia","espino-blanco","Espino Blanco","espino albar","tejocote","Mexican hawthorn","single-seeded hawthorn","hawthorn","May tree","quickthorn","avellano","Corylus avellana","amargón","Frutos","Quina","alerce","Acacia","Alergia a los frutos secos.","higuera","Ficus carica","jaboncillo","moral","Seville orange","peral","common pear","Puede ser uterotónico.","chasteberry","monk\'s pepper","No usar durante el embarazo o la lactancia.","No usar durante el embarazo o lactancia.","arándano encarnado","mirtilo rojo","mountain cranberry","northern mountain cranberry","foxberry","partridgeberry","red whortleberry","whimberry","grosellero negro","parrilla negra","Antialérgico","sarsaparilla","Rizoma y raíces","arrayán","Hojas y bayas","sauco","Saúco","sauqueiro","sabugo","bieiteiro","sabugueiro","tapiro","flor de sauz","capulin silvestre","American elderberry","blue elderberry","Arizona elderberry","desert elderberry","New Mexican elderberry","Mexican elderberry","shiksh (O\'odham)","bixihumi (Nahuatl)","Sudorífico","sandthorn","sallowthorn","Infusión.","No usar.","Tallos estériles","Evitar el aceite esencial.","No se recomienda su consumo oral durante el embarazo.","Puede pasar a la leche materna y causar diarrea en el lactante.","No se recomienda su uso.","guarana","Puede causar reacciones alérgicas.","Pétalos","kakaw","Cardioprotector","Colerética","regaliz","Regaliz","Glycyrrhiza glabra","regalicia","orozuz","orosús","paloduz","palodulce","palodul","arrezú","orozús","licorice","sweetwood","black sugar","liquorice","Consultar con un médico.","Puede afectar los niveles de azúcar en sangre.","nabo","mostaza","Rico en fibra","taro","common garden peony","Infusión de 1-2 cucharaditas por taza, 2-3 veces al día.","No se recomienda su consumo durante el embarazo.","Inductor del sueño","Analgésico suave","arnica","dalia","Antidepresiva","Pipa","Shiitake","Agarikon","Enoki","Consumo en la dieta.","Salud cardiovascular","Salud ósea","Pomelo","Yuzu","Calamondin","Tangelo","Sweetie","Oroblanco","Sudachi","Kabosu","Ananá","Brasil","Consumir 1-2 frutos al día","Fuente de energía","Reduce la fiebre","Anticancerígena (potencial)","Lúcuma","durazno","nectarine","Consumo directo, zumo, infusión de hojas","Personas alérgicas a la familia Rosaceae.","wine grape","Ribes rubrum","grosellero rojo","uva de señora","cambronera colorada de Jarava","cascalleja","pinsús","ribes","rimas","rivas","uva de Fran","red currant","garden red currant","redcurrant","Sabor muy ácido, puede no ser bien tolerado por estómagos sensibles.","boysenberry","Fibra","loganberry","tayberry","chia","melón de agua","patilla","mostaza negra","cayenne pepper","asafoetida","chumbera","aloe vera","echeveria","yucca","Reduce el estrés y la ansiedad","Mejora la función cognitiva","Combate la fatiga","Evitar durante el embarazo y la lactancia.","brahmi","guduchi","Puede ser abortivo en dosis altas.","Menta","Mentha piperita","menta piperita","té de menta","menta perrera","menta romana","bergamota de Chile","monte yuyo","toronjil de menta","pitoreta","pituda","spearmint","garden mint","common mint","lamb mint","mackerel mint","Cilantro","Honduras","cilandro","celiandre","cilandre","Quelante de metales pesados","parsley","garden parsley","curly-leaf parsley","flat-leaf parsley","Italian parsley","root parsley","Hamburg parsley","turnip-rooted parsley","Infusión de 1 cucharadita de semillas por taza.","mejorana","Mejorana","Origanum majorana","acapuas","almaraco","almoradijo","almoraduj","almoradux","almoradux casero","almoradux morisco","almoradux salsero","almoraduz","mayorana","amáraco","orégano mayor","manjerona","mejorama","marjorama","marduix","moraduix","mendaro","badiana","tarragon","dragon plant","dragon sagewort","herbaceous sagewort","pinon wormwood","silky wormwood","wild tarragon","french tarragon","german tarragon","cebollín","chives","flowering onion","wild chives","comino","Comino","alcamonia","comino común","comino fino","comí castellà","fenoll de prat","anís verde","matalahúva","matalahúga","anise","aniseed","anix","Anticancerígena","canela","Canela","Cinnamomum verum","Canela de Ceilán","Canelero","Syzygium aromaticum","clove","Botones florales secos","Aceite esencial, infusión","Cardamomo","Cardamomo verde","Cardamomo verdadero","Melisa","Melissa officinalis","lemon balm","common balm","balm mint","sweet balm","melissa balm","heart\'s delight","english balm","bush balm","honey plant","chervil","french parsley","garden chervil","ajedrea","saborija","winter savory","mountain savory","tomillo real","hisopo","Hisopo","Hyssopus officinalis","hisopillo de dos órdenes","hisopillo húmedo","hisopo real","hysopo","isopo","isopo hortelano","rabillo","rabillo de gato","jufa","az-zufa","tanaceto","Tanaceto","tansi","hierba lombriguera","ajemjo verde","palma imperial","tanacet","tanarida","anzar-bedar","mota-belar","zizari-belar","levistico","lovage","garden lovage","maggi plant","smellage","bladder seed","Decocción de la raíz o infusión de las hojas.","roman coriander","Brassica nigra","agenabe","agenabo","agenave","ajenabe","ajenabo","vietnamese coriander","vietnamese mint","asian mint","hot mint","laksa leaf","praew leaf","jesuit\'s tea","mexican tea","wormseed","pimpinela mayor","hierba de la mora","great burnet","salad burnet","greater burnet","official burnet","burnet bloodwort","common agrimony","church steeples","sticklewort","liverwort","citronela","west indian lemon grass","citronella grass","serai","oil grass","fever grass","Tallos y hojas","Ruibarbo","Rheum rhabarbarum","rubarbo","pie-plant","arabarba","ruibarbre","candyleaf","sweetleaf","sugarleaf","sweet herb of paraguay","sweet honey leaf","Wasabi","Eutrema japonicum","rábano picante japonés","bergamota","Bergamota","pera del Bey","Bergamot","capuchina","Capuchina","Tropaeolum majus","taco de reina","espuela de galán","mastuerzo de Indias","pelonchili","mastuerzo","cachaco","antioqueña","texao","Indian cress","monk\'s cress","garden nasturtium","Antibiótica natural","borraja","Borraja","Borago officinalis","aborraja","borracha","borraina","borraja blanca","cool-tankard","lemon verbena","gordolobo","Gordolobo","Verbascum thapsus","verbasco","candelaria","oreja de burro","friega platos","aciano","Aciano","Centaurea cyanus","azulejo","escobilla","flor de cielo","Antiinflamatorio ocular","ulmaria","Ulmaria","Filipendula ulmaria","florón","norotil","reina de los prados","brosta","gramònica","filipéndula","altarcina","altareina","altarreina","espirea","hierba de las abejas","barba de cabra","ulmeria","bittersweet","bridewort","milenrama","Achillea millefolium","aquilea","common yarrow","thousandleaf","soldier\'s woundwort","bloodwort","nose bleed","devil\'s nettle","gordaldo","old man\'s pepper","sanguinary","artemisa","Artemisa","Artemisia vulgaris","artemega","ceñidor","yuyo crisantemo","hierba de San Juan","madra","artemisia","manzanillón","anastasia","artamisa","artamisia","escobilla parda","flor de santos","Vermífuga","lupulo","Lúpulo","Humulus lupulus","betiguera","cañamiza","cerveza","cuerpo de hombre","lupios","zaramangón","espárrago ortiguero","espárrago de zarza","esparraguera","llùpol","herba de sa cervesa","Fitoestrogénico","Valeriana","Valeriana officinalis","valeriana común","valeriana de las boticas","valeriana medicinal","hierba de los gatos","Cataluña","herba gatera","valedriana","valeriana vera","Uruguay","yerba del gato","belar","bedukata","yerba del aguilucho blanco","Decocción, extracto, tintura","Potencia el efecto de otros sedantes.","summer savory","savory","beefsteak plant","shiso","perilla mint","purple shiso","chinese basil","purple perilla","japanese basil","Matricaria chamomilla","Regeneradora","ajo","Allium sativum","Ajo andaluz","Ajo blanco","cola-de-caballo","Equiseto","Limpiaplata","Canutillo","Pinillo","hiperico","Hypericum perforatum","Corazoncillo","1-2 gramos al día","Tilo norteño","Tilo silvestre","Tilo de hojas pequeñas","Tilo de Europa","diente-de-leon","Cerraja","Contraindicado en el embarazo","No combinar con anticoagulantes","Ilex paraguariensis","corteza-de-sauce","Salix alba","Sauce blanco","Agave americana","Savia y hojas","acebo","Ilex aquifolium","Infusión o decocción","poleo-menta","Mentha pulegium","Poleo","ortiga","Urtica dioica","Ortiga mayor","Vasoconstrictor","Infusión, cocción","Uso exclusivo bajo prescripción médica","sandalo","Sándalo","Santalum album","Madera","Amapola","Semillas y hojas","Infusión, condimento","apio","Kava","Piper methysticum","\'Awa","Ava Pepper","Ava Root","\'awa (Hawaii)","sakau (Pohnpei)","yaqona (Fiji)","Olmo","negrillo","smoothleaf elm","English elm","Semillas y bulbo","Toronjil","Lemon balm","Castor bean","Castor oil plant","Lechuga silvestre","Wild lettuce","Opium lettuce","Látex y hojas","Drynaria","Junco de esteras","Soft rush","Uso tópico","Hierba de San Simón","Enchanter\'s nightshade","Kadsura longipedunculata","guaco","Mikania glomerata","Broncodilatador","copaiba","Copaifera officinalis","grosellero-de-la-india","Grosellero de la India","anis-verde","No usar durante el embarazo","Boldo","Peumus boldus","boldu","buldo","foḻo (mapudungun)","No se recomienda su uso durante el embarazo y la lactancia.","white willow","No combinar con anticoagulantes.","tilo de hoja pequeña","tejo","tejo blanco","littleleaf linden","little-leaf linden","olivo","aceituno","margosa","nimtree","Indian lilac","Aesculus hippocastanum","castaño de Indias","falso castaño","castaño loco","buckeye","Antiedematoso","fresno","European ash","common ash","Hojas, corteza","European white birch","silver birch","pino","Italian cypress","Mediterranean cypress","cedar of Lebanon","Lebanon cedar","Maple","Sugar maple","roble","roble común","roble albar","carballo","carvallo","English oak","pedunculate oak","common oak","European beech","common beech","Corteza, hojas","Nogal","nogal común","noguera","Persian walnut","Hojas, frutos","Tejo","Yew","Uso exclusivo bajo prescripción médica.","Extractos farmacéuticos","Avellano","Hazel","Alcornoque","Cork oak","Encina","Holm oak","Sorbus aucuparia","rowan","Infusión: 1-2 tazas al día.","magnolia","Magnolia","magnolia bark","Tea tree","boighe","Winter\'s bark","sangre-de-drago","Sangre de Drago","Croton lechleri","Látex","araucaria","pehuén","monkey puzzle tree","Chilean pine","Patagonian cypress","Abeto","Fir","Gum arabic tree","algarrobo","carob tree","almendro","Prunus dulcis","Mahogany","Kapok tree","Chopo","Black poplar","Granado","Pomegranate","guayabo","Psidium guajava","Guava","Infusión de hojas: 2-3 tazas al día.","Higuera","Fig tree","Consumo directo, decocción","limón real","lemon","black mulberry","Citrus aurantium","naranjo amargo","naranjo agrio","sour orange","Pyrus communis","European pear","Puede causar dermatitis de contacto en personas sensibles.","Avellano de bruja","Mexican witch hazel","Witch hazel","Consultar al médico antes de usar.","sauzgatillo","Vitex agnus-castus","agnocasto","pimiento de los monjes","árbol casto","Arctostaphylos uva-ursi","bearberry","kinnikinnick","arandano-rojo","Vaccinium macrocarpon","arándano de fruto encarnado","Enebro","Juniperus communis","ginebro","ground juniper","Hojas y frutos","Zarzaparrilla","uva de perro","common smilax","rusco","butcher\'s broom","mirto","Myrtus communis","common myrtle","gum rockrose","brezo","heather","ling","Evitar durante la lactancia.","boj","aligustre","common privet","Vulnerario","bonetero","European spindle","common dogwood","Corteza y frutos","durillo","laurustinus","Hippophae rhamnoides","espino amarillo","espino falso","seaberry","Muy rico en Vitamina C","forsitia","weeping forsythia","golden bells","Antibacterial","mahonia","Mahonia aquifolium","Oregon grape","Crataegus azarolus","azarolo","azarole","Scotch broom","lampwick plant","rock tea","conehead thyme","torvisco","flax-leaved daphne","snowball tree","palo colorado","temu","Chilean myrtle","Infusión, aceite esencial.","Berberis vulgaris","Corteza de la raíz","damiana","Damiana","Turnera diffusa","Puede alterar los niveles de azúcar en sangre.","membrillero","Cydonia oblonga","Rizoma (raíz)","Puede interactuar con medicamentos para la presión arterial.","Precaución con anticoagulantes.","noni","Noni","Morinda citrifolia","30-60 ml de jugo de noni al día.","una-de-gato","Uña de Gato","Uncaria tomentosa","Corteza y raíz","Decocción, cápsulas, extractos.","Euterpe oleracea","Paullinia cupana","Prebiótica","Vasoprotector","Flor de Saúco","Centella Asiática","Vasoprotectora","Flores e inflorescencias","Cardiotónica","Theobroma cacao","cacaocuáhuitl","ma-micha-moya","mo-chá","haa","yau","caco","chudenchú","cágau","1-3 gramos de rizoma seco al día","Obstrucción de las vías biliares","Decocción, extracto, polvo","astragalo","Astrágalo","Astragalus membranaceus","huáng qí","běi qí","Mongolian milkvetch","Enfermedades autoinmunes","Infusión, extracto, tintura","equinacea","Equinácea","Echinacea purpurea","equinácea","1-2 gramos de raíz seca en infusión, 3 veces al día","Alergia a plantas de la familia de las margaritas.","diente de león","cerraja","moraja","dandelion","Maca","Lepidium meyenii","maca-maca","maino","ayak willku","maka","ayak willku (Quechua)","1.5-3 gramos de polvo de raíz al día","Puede elevar la presión arterial en algunas personas.","ashwagandha","Ashwagandha","Withania somnifera","bufera","oroval","orval","hierba mora mayor","poison gooseberry","goldenseal","Infusión, decocción, tintura","Polvo, decocción","malvavisco","marsh mallow","osha","sweet flag","Infusión, decocción, polvo","genciana","great yellow gentian","horseradish","red cole","Antirreumática","boniato","betarraga","beet","chard","Mejora el rendimiento deportivo","Cruda, cocida, en zumo","zanahoria","wild carrot","Queen Anne\'s lace","Salud de la piel","turnip","field mustard","Hipotiroidismo (consumo excesivo y crudo).","parsnip","Rica en potasio","Rica en fibra","apionabo","celeriac","radish","kohlrabi","Bajo en calorías","pataca","Jerusalem artichoke","Regulador del azúcar","Saciente","Rica en calcio","Fácil de digerir","Raíz tuberosa","ulluma","New Zealand yam","Rica en carbohidratos","añu","isaño","malanga","elephant ear","atractylodes","Atractylodes macrocephala","large-headed Atractylodes","codonopsis","Codonopsis pilosula","bonnet bellflower","poor man\'s ginseng","Chinese foxglove","9-15 gramos en decocción.","Paeonia lactiflora","peonía china","rosa de monte","rosa sin espinas","cassava","Chinese artichoke","Eleuterococo","Eleutherococcus senticosus","ginseng siberiano","eleutero","devil\'s bush","taiga root","ciwujia","Devil\'s shrub","shigoka","touch-me-not","wild pepper","kan jang","Mejora el rendimiento físico y mental","black cohosh","polygala","milkwort","Regeneradora de la piel","Damask rose","flor de Jamaica","rosa de Jamaica","roselle","Infusión, extracto, cápsulas","Partes aéreas floridas","violeta","sweet violet","Helianthus annuus","sunflower seeds","Vitamínica (Vitamina C)","carnation","clove pink","chrysanthemum","margarita","daisy","Nelumbo nucifera","loto sagrado","loto indio","rosa del Nilo","pensamiento","pansy","heartsease","primavera","prímula","cowslip","dahlia","sweet scented geranium","Hemostático","Decocción, extracto","vervain","Hemostática","clitoria","butterfly pea","meliloto","melilot","yellow jessamine","lily of the valley","digital","foxglove","onagra","evening primrose","cempasúchil","marigold","centaury","reishi","Ganoderma lucidum","varnished conk","lacquered bracket","Lingzhi (chino)","Yeongji (coreano)","maitake","Maitake","Grifola frondosa","Gallina de los bosques","Seta de Río","sheep\'s head","ram\'s head","Hui zhu hua (chino)","Puede potenciar el efecto de medicamentos para la diabetes.","cordyceps","Cordyceps","Cordyceps sinensis","Hongo oruga chino","Himalayan Viagra","Yartsa gunbu (tibetano)","Dong Chong Xia Cao (chino)","Micelio y cuerpo fructífero","Extracto, cápsulas o decocción.","chaga","Inonotus obliquus","Hongo de abedul","Nariz de carbón","Clinker Fungus","birch conk","birch canker polypore","Clinker Polypore","Cinder conk","Black mass and Birch canker polypore","Tsyr","Esclerocio (masa de micelio)","Turkey Tail","Snow fungus","Esclerocio","oyster mushroom","Umbrella polypore","jelly ear","Shaggy ink cap","Cuerpo fructífero joven","Consumo en la dieta o extracto.","Rebozuelo","Chanterelle","horn of plenty","Colmenilla","Black truffle","Probiótico","Oronja","Caesar\'s mushroom","espirulina","Chlorella","kelp","Kelp","Apoyo tiroideo","wakame","Wakame","nori","Nori","dulse","Dulse","fucus","agar-agar","Agar-agar","Regulador intestinal","Puede causar obstrucción intestinal si no se consume con suficiente líquido.","musgo-de-irlanda","Musgo de Irlanda","Chondrus crispus","musgo de Irlanda","carragaén","Irish moss","kombu","Kombu","arame","Arame","hijiki","Hijiki","Alta en proteínas","Fitorremediación","Hojas y tallos","Consumo como alimento","aponogeton","elodea","azolla","Lemon","toronja","Grapefruit","Tangerine","Key lime","Pummelo","Shaddock","kumquat","naranjo enano","naranja enana","naranja japonesa","quinoto","naranja china","Nagami kumquat","oval kumquat","Citron","Ugli fruit","Melogold","Finger lime","Rangpur lime","Limequat","Citrange","Citrumelo","Faustrime","Control de la diabetes","Fruto, hojas y corteza","Venezuela","Consumo directo, jugos, ensaladas","Mangifera indica","Reduce la presión arterial","carambola","Control del azúcar en sangre","Hylocereus undatus","Dragon fruit","Pitaya","Lychee","Mejora la circulación","Regula la presión arterial","coconut","Antiparasitaria","Kiwi","Actinidia deliciosa","kiwi fruit","smooth-skinned kiwifruit","yangtao","Mejora la salud respiratoria","granada","Granada","mingranera","Antioxidante potente","higo","Higo","breval","amate","ziranda","amate (náhuatl)","common fig","edible fig","Fruto (fresco o seco)","Lucma","Lucuma","Control del colesterol","pineapple guava","Antienvejecimiento","macambo","Control de la presión arterial","Salud bucal","Acerola","Malpighia emarginata","cereza de las Indias Occidentales","cereza de Barbados","cereza de Jamaica","cereza de las Antillas","cerecita","manzanita","semeruco","barbados cherry","west indian cherry","wild crepe myrtle","acerola cherry","apple","albérchigo","peach","Fruto completo, hojas (infusión)","ciruela","plum","damson","bullace","Fruto completo (fresco o seco)","wild cherry","sweet cherry","gean","albaricoque","damasco","apricot","quince","Alto contenido de azúcar, consumir con moderación.","Vitis vinifera","parra","vid","parra bravía","frambuesa","Frambuesa","Rubus idaeus","frambueso","sangüeso","cordonera","chordón","sanguesa","chordonera","red raspberry","American red raspberry","hindberry","Astringente (hojas)","Fresa","fresón","garden strawberry","cultivated strawberry","dessert strawberry","pine strawberry","Mora","Rubus fruticosus","zarza","mora de castilla","dewberry","El consumo excesivo puede teñir las heces de oscuro.","Consumo directo, zumo, extracto","Un puñado de grosellas al día","Consumo directo, zumo, jalea","Pequeña fruta roja muy rica en vitamina C y con propiedades diuréticas y astringentes. Ayuda a fortalecer el sistema inmunitario.","Zarzamora","Rubus ulmifolius","nectarina","paraguayo","donut peach","flat peach","caqui","avellana","Avellana","endrina","Prunus spinosa","Ribes uva-crispa","gooseberry","Consumo directo, jalea, compota","Sabor ácido, puede no ser bien tolerado por estómagos sensibles.","Fruta rica en vitamina C y fibra. Tiene un sabor ácido característico y se utiliza tanto fresca como en preparaciones cocidas.","grosella-negra","Grosella negra","zarzaparrilla negra","european black currant","grosella-roja","Grosella roja","grosella roja","grosularia","Consumo directo, zumos, jaleas.","endrino","blackthorn","sloe","Cornelian cherry","Consumo moderado.","Consumo directo, mermeladas, jarabes.","1-2 tazas de infusión al día.","Un puñado de frutos o 1-2 tazas de infusión de hojas.","Raíz y bayas","Consumo libre.","Consumo directo, mermeladas, postres.","Manganeso","linaza","flaxseed","linseed","chan","hemp","marijuana","pumpkin seeds","sesame seeds","Consumir crudas","chestnut","pistachio","Brazil nut","pecan","cashew","pine nut","macadamia nut","semillas-de-amapola","semillas-de-apio","Infusión, masticar las semillas","green cardamom","true cardamom","Aniseed","Caraway","meridian fennel","Fenugreek","Bird\'s Foot","Goat\'s Horn","Greek Clover","Greek Hay","Greek Hayseed","Puede inducir contracciones uterinas.","peanut","common grapevine","European grape","table grape","semillas-de-granada","balaustia","balaustra","granado borde","granado común","granao","magrano","manglanera","manglano","mengranero","milgrano","agrauz","agrios","albar","alvarés","anar","darim","watermelon","Un puñado pequeño (10-15g) al día","melón","melon","cantaloupe","muskmelon","honeydew","casaba","winter melon","semillas-de-nigella","neguilla","Roman coriander","kalongi","European horsechestnut","Consultar al médico.","psyllium","blond plantain","desert Indianwheat","blond psyllium","ispaghul","Arabica coffee","Arabian coffee","Brazilian cocoa","cola nut","kola nut","Clove","Black pepper","No se conocen contraindicaciones importantes en dosis culinarias.","Myristica fragrans","Nutmeg","sweet pepper","bell pepper","Fruto seco y molido","Consumo culinario","vanilla","flat-leaved vanilla","1-3 gramos al día","1.5-3 gramos al día","Polvo, extracto","star anise","badian","Chinese star anise","cayena","Decocción, polvo","macis","mace","allspice","Bayas","devil\'s dung","Evitar.","sansho","Sichuan pepper","Japanese pepper","ajowan","bishop\'s weed","carom","amchoor","mango powder","tonka bean","cumaru","kumaru","long pepper","Indian long pepper","cubeba","cubeb","Java pepper","Aplicación tópica según necesidad. 1-2 cucharadas de gel por vía oral al día.","Extracción directa del gel de las hojas para uso tópico. Licuado del gel para consumo oral.","No administrar por vía oral a niños menores de 12 años.","Opuntia ficus-indica","higuera de pala","palera","tuno","tunera","higo de las Indias","cactus pear","spineless cactus","Asado, cocido, en licuados o en ensaladas. El fruto se consume fresco.","Puede potenciar el efecto de los medicamentos para la diabetes, se recomienda supervisión médica.","pitaya","dragon fruit","siempreviva","houseleek","liveforever","hen and chicks","kalanchoe","cathedral bells","air plant","miracle leaf","Alucinógeno","Microdosis bajo supervisión especializada.","Su uso está regulado en muchos países debido a sus efectos psicoactivos. No consumir sin supervisión experta.","sábila","organ pipe cactus","Aplicación tópica de la pulpa.","Machacar la pulpa del tallo y aplicar como cataplasma.","Mexican snowball","sedum","goldmoss stonecrop","mossy stonecrop","biting stonecrop","wallpepper","Adam\'s needle","San Pedro","San Pedro cactus","fenestraria","baby toes","window plant","living stones","pebble plants","ox-tongue","cow-tongue","lawyer\'s tongue","Zebra plant","Pearly dots","Star window plant","Fairy washboard","jade plant","friendship tree","lucky plant","money plant","string of pearls","string of beads","pencil tree","Indian tree spurge","naked lady","milk bush","carrion plant","toad plant","starfish flower","Bushman\'s hat","Anorexígena","Supresora del apetito","Extracto estandarizado según indicación del fabricante.","Consumo del extracto en cápsulas o comprimidos.","No se recomienda su uso sin supervisión médica.","Opuntia streptacantha","prickly pear cactus","golden root","rose root","roseroot","Aaron\'s rod","Arctic root","king\'s crown","lignum rhodium","orpin rose","Cápsulas, extracto líquido","magnolia vine","five-flavor berry","Protege el hígado","Polvo, cápsulas, extracto, té","holy basil","Apoya el sistema inmunológico","Aumenta la energía y la resistencia","Bacopa monnieri","Cápsulas, extracto","Cápsulas, extracto, té","Japanese honeysuckle","Mejora la memoria y la cognición","bala","flannel weed","Tónico general","heart-leaved moonseed","American ginseng","shatavari","Shatavari","goathead","puncturevine","hierbas-aromaticas-culinarias","Hierbas aromáticas y culinarias","Infusión de 5-10 gramos por litro de agua.","Hierba aromática con propiedades digestivas y relajantes.","Infusión de 2-4 gramos por taza, 2-3 veces al día.","Arbusto aromático con efectos estimulantes y antioxidantes.","Infusión de 1-2 gramos por taza, hasta 3 veces al día.","Planta con potentes propiedades antisépticas, ideal para afecciones respiratorias.","Infusión de 1 cucharadita por taza, 2-3 veces al día.","Hierba con fuertes propiedades antimicrobianas y antioxidantes.","Infusión de 1 cucharada por taza, después de las comidas.","El aceite esencial no debe usarse en niños pequeños.","Planta refrescante que alivia problemas digestivos y dolores de cabeza.","Hierbabuena","Mentha spicata","hierba buena","bálsamo","yerbabuena","menta de jardín","herba-sana","menta del consol","menta de les faves","Similar a la menta, es excelente para trastornos digestivos leves.","Consumo directo en comidas o infusión de semillas.","Hierba y especia que ayuda a la digestión y a eliminar toxinas.","perejil","Perejil","Petroselinum crispum","perejil común","perejil rizado","julivert","chulivert","givert","jolivert","juavert","juevert","Rico en vitaminas","Consumo fresco en ensaladas o jugos. Infusión de 2g por taza.","En grandes cantidades puede ser uterotónico.","Planta muy nutritiva con efecto diurético y depurativo.","Eficaz para aliviar gases, cólicos y otros problemas digestivos.","Infusión de 1-2 hojas por taza. No exceder.","En dosis altas puede ser tóxico.","Facilita la digestión y ayuda a expulsar la mucosidad de las vías respiratorias.","Infusión de 1-2 gramos por taza. Gargarismos para la garganta.","No recomendada por su efecto hormonal.","Planta con propiedades antiinflamatorias y reguladoras hormonales, útil en la menopausia.","Infusión de una cucharadita por taza, antes de dormir.","Hierba con un suave efecto sedante, útil para el insomnio y la ansiedad.","Estragón","Artemisia dracunculus","dragoncillo","tarragón","tarragó","dragó","herba-dracera","estragó","dragonera","dragonet","herba dragonera","herba vinagrera","dragon\'s-wort","Anestésico local","Infusión de 5g de hojas por litro de agua.","Debe evitarse su uso continuado.","Estimula el apetito y la digestión, y tiene un ligero efecto anestésico.","cebollino","Cebollino","Allium schoenoprasum","cebolla de hoja","ciboulette","xonacátl","cebolleta","cebollino de ajo","chonacate","cebollino común","ajo morisco","Rico en vitamina C","Antiséptico suave","Aporta vitaminas y un suave efecto digestivo y antiséptico.","Semillas (frutos) y bulbo","Infusión, decocción del bulbo","Excelente para los gases y la hinchazón abdominal. También ayuda en la lactancia.","Infusión de media cucharadita por taza.","Infusión, polvo en comidas","Especia muy potente para aliviar los gases y mejorar la digestión.","anis","matalauva","anís verd","matalafuga","llavoretes","matafaluga","comino dulce","Semillas (frutos)","Clásico remedio para los gases y cólicos, especialmente en niños.","1-3 gramos de polvo al día, con pimienta negra para mejorar absorción.","Polvo en comidas, cápsulas","Potente antiinflamatorio natural, útil en enfermedades crónicas.","Circulatorio","Infusión de 1-2 rodajas finas por taza. Hasta 4g de polvo al día.","Infusión, polvo, consumo directo","Usar con precaución si se toman medicamentos para la presión.","Eficaz contra las náuseas y mareos, además de ser un buen antiinflamatorio.","Termogénica","1-4 gramos de polvo al día.","Polvo en comidas, infusión","Vigilar niveles de glucosa si se combina con medicación.","Ayuda a regular los niveles de azúcar en sangre y tiene efecto calorífico.","clavo-de-olor","clavero","clavo de especia","girofle","ding xian","lavangam","Analgésico dental","Aplicación tópica de aceite para dolor dental. Infusión de 1-2 clavos.","Potente analgésico natural, especialmente para el dolor de muelas.","Masticar 1-2 semillas o infusión de media cucharadita.","Masticar, infusión, polvo","Alivia la indigestión y el mal aliento, y ayuda a limpiar las vías respiratorias.","30 mg al día para efecto antidepresivo. Pequeñas hebras en comidas.","Consumo en comidas, extracto estandarizado","En dosis altas puede ser abortivo.","Especia valiosa con efectos positivos sobre el estado de ánimo.","Infusión de 1 cucharadita por taza. Aceite esencial en difusor o tópico.","Aroma calmante que promueve el sueño y alivia la ansiedad. Buena para la piel.","melisa","menta melisa","hoja de limón","cidronela","limonera","abellera","aronjina","citronella","tarongina","taronjí","Conocida como toronjil, es excelente para calmar los nervios y problemas digestivos asociados.","perifollo","Perifollo","Anthriscus cerefolium","cerefolio","perejil francés","prifolio","cerfull","Consumo fresco en ensaladas o infusión.","Hierba de sabor anisado que ayuda a depurar el organismo.","Raíz y semillas","Decocción de la raíz (10g por litro) o infusión de semillas.","Puede alterar los niveles de azúcar.","Planta robusta que tonifica el sistema digestivo y nervioso.","Ajedrea","Satureja montana","ajedrea de montaña","ajedrea montesina","ajedrea de monte","morquera","sabora","sadurija","santoreggia montana","Afrodisíaca","Facilita la digestión de alimentos pesados y tiene fama de estimulante.","Remedio tradicional para la tos, los resfriados y otras afecciones respiratorias.","Tanacetum vulgare","Usar con extrema precaución y en dosis muy bajas. Infusión de 0.5g.","Es abortivo y tóxico. Totalmente contraindicado.","Tóxico para niños.","Planta tóxica que debe ser usada solo bajo supervisión experta como antiparasitario.","Levístico","Levisticum officinale","angelica montana","angélica montana","apio de montaña","apio de monte","apio silvestre de monte","esmirnio","legustico","Llebístic","Conocido como apio de monte, es un potente diurético y digestivo.","comino-negro","Comino Negro","nigela","pebreta","pebretera","1-2 cucharaditas de aceite al día o 1 cucharadita de semillas.","Aceite, semillas","Semilla con potentes efectos sobre el sistema inmune, alergias y procesos inflamatorios.","Anabolizante natural","1-2 cucharaditas de semillas remojadas o en polvo.","Polvo, infusión","Puede inducir contracciones.","Aumenta la producción de leche materna y ayuda a regular el azúcar en sangre.","mostaza-negra","Mostaza Negra","Uso externo en cataplasmas. Internamente con mucha moderación.","Cataplasma, polvo","Irritante para la piel y mucosas si se usa en exceso.","Utilizada en cataplasmas para aliviar dolores musculares y congestión pulmonar.","cilantro-vietnamita","Cilantro Vietnamita","Persicaria odorata","rau răm","daun kesom","daun laksa","phak phai","Hierba con sabor picante y cítrico, usada en la cocina asiática por sus propiedades digestivas.","Epazote","Dysphania ambrosioides","paico","pazote","ipazote","apazote","acahualillo","té de milpa","hierbas de zorrillo","bitia","quelite apestoso","epazote de toro","epazotl","Usado tradicionalmente en la cocción de frijoles. Infusión con precaución.","Cocción, infusión","Tóxico y abortivo en dosis altas.","Tóxico en dosis altas.","Hierba tradicional mexicana para expulsar parásitos intestinales y aliviar gases.","pimpinela-mayor","Pimpinela Mayor","Sanguisorba officinalis","pimpinela de los prados","sanguisorba","sanguisorba mayor","agrimonia bastarda","ensalada italiana","escalerilla","pampanilla","pempinela","sanguina","julivert de bosc","Planta utilizada para detener sangrados y tratar diarreas.","agrimonia","Agrimonia","Agrimonia eupatoria","agrimonia común","algafil","alimonia","amores pequeños","amoricos","arquimonia","cabsitiella","esmermasangre","eupatoria","gafetí","hierba de San Guillermo","hierba del podador","hierba bacera","agrimoña","Antiinflamatoria para la garganta","Infusión de 1-2 cucharaditas por taza. Gargarismos.","Conocida como la \\"hierba de los cantores\\", es excelente para la afonía y la garganta irritada.","Similar al jengibre, en infusiones o en polvo.","Pariente del jengibre, se usa para problemas digestivos y mareos.","Lemongrass","Cymbopogon citratus","té de limón","pasto de limón","pasto citronella","hierba limón","zacate limón","pasto cedrón","pasto limón","Bolivia","mal ojillo","malojillo","caña limón","cañuela","corta calentura","hierba de calentura","toronjil de caña","limonaria","pajete","caña de limón","Infusión de 1 tallo por taza.","Hierba con aroma a limón, ayuda a la digestión, calma los nervios y baja la fiebre.","Astringente (en dosis bajas)","Rizoma (medicinal), pecíolos (comestible)","Decocción del rizoma. Dosis bajas son astringentes, altas son laxantes.","Las hojas son tóxicas por su alto contenido en oxalatos.","Su raíz es un laxante eficaz, pero debe usarse con cuidado. Los tallos son comestibles.","Stevia","Stevia rebaudiana","estevia","planta dulce","kaá heé","caá ehé","kaá-jeé","yerba dulce","hierba dulce","hierba de miel","Edulcorante natural","Hojas frescas o secas para endulzar infusiones y comidas.","Endulzante natural sin calorías que puede ayudar a regular el azúcar y la presión arterial.","Rallado fresco","Potente descongestionante nasal y con propiedades antimicrobianas, ideal para acompañar pescado crudo.","Monarda didyma","Infusión de las hojas y flores.","También conocida como té de Oswego, se usa para problemas digestivos y resfriados.","Uso tópico en cremas o aceites. Infusión para uso interno.","Crema, aceite, infusión","Puede causar alergia a personas sensibles a las compuestas.","Maravillosa para la piel, acelera la cicatrización y reduce la inflamación.","Rica en Vitamina C","Consumo directo en ensaladas.","Considerada un antibiótico vegetal, es útil para infecciones respiratorias y urinarias.","Flores y aceite de semillas","Infusión de flores. El aceite de semillas se toma en perlas.","Infusión, perlas de aceite","El aceite de sus semillas es rico en omega-6, beneficioso para la piel y la inflamación.","verbena-olorosa","Hierbaluisa","Aloysia citrodora","hierba de la princesa","verbena olorosa","También llamada Verbena de olor, es una planta con aroma a limón excelente para la digestión y los nervios.","Infusión de las flores, bien colada para retirar los pelillos.","Remedio pectoral por excelencia, suaviza la garganta y ayuda a expulsar la mucosidad.","Infusión de flores y hojas.","Rica en mucílagos, suaviza las mucosas respiratorias, digestivas y la piel.","Baños oculares con la infusión fría.","Infusión para baños oculares","La flor de aciano es el remedio principal para la inflamación y el cansancio de los ojos.","No usar si hay alergia a la aspirina (contiene salicilatos).","Conocida como la \\"aspirina vegetal\\", alivia el dolor y la fiebre.","Milenrama","perejil bravío","flor de la pluma","mil hojas","ciento en rama","plumajillo","plumajo","alcanfor","cientoenrama","milhojas","hierba de Aquiles","milflores","Planta de la mujer, regula los ciclos menstruales y corta hemorragias.","Infusión de una cucharadita por taza. No usar de forma prolongada.","Abortiva. Totalmente contraindicada.","Potente regulador menstrual y tónico para la digestión.","Infusión de 0.5-1g por taza, antes de las comidas. Usar en periodos cortos.","Abortivo y neurotóxico. Totalmente contraindicado.","Totalmente contraindicado.","Uno de los tónicos amargos más potentes, para la falta de apetito y problemas de vesícula.","Conos (flores femeninas)","Infusión de 1-2 conos por taza antes de acostarse.","Puede agravar la depresión.","Inductor del sueño y calmante de la ansiedad. También usado en la menopausia.","Hipnótica","Decocción de la raíz (2-3g por taza) o extracto estandarizado.","El remedio clásico para el insomnio y la ansiedad, relaja la mente y el cuerpo.","Infusión de 0.5g por taza. Usar con extrema precaución.","Es un potente abortivo. Totalmente contraindicada.","Fototóxica. No exponer la piel al sol tras su uso tópico.","Planta muy potente para regular la menstruación, pero tóxica en dosis altas.","ajedrea-de-jardin","Ajedrea de jardín","Satureja hortensis","hierba olivera","saturagón","señorita","sajolida","senyorida de jardí","ajedrea común","saborida","ajedrea blanca","albahaca de tomillo","aljedrea","calamento blanco","hisopo montesino","jedrea","calaminto blanco","Similar a la ajedrea de montaña, pero con un sabor más suave. Ayuda a la digestión y alivia los gases.","Perilla","Perilla frutescens","deulkkae","egoma","zisu","silam","albahaca japonesa","albahaca china","melisa verde","hierba azul","tulkeé","Infusión de las hojas. El aceite de las semillas se usa para las alergias.","Infusión, aceite","Hierba asiática muy usada para tratar alergias estacionales, asma y resfriados.","hierbas-silvestres-medicinales","Hierbas silvestres medicinales","La manzanilla es una de las plantas medicinales que más se conocen por las propiedades de su flor. Sus efectos son especialmente relevantes en el tratamiento de molestias gastrointestinales.","Aplicación tópica según necesidad","Uso directo del gel","Otra de las plantas medicinales más conocidas es el Aloe Vera. Se trata de una conocida planta con capacidad antiinflamatoria y que se utiliza en diversos productos de higiene personal debido a su acción favorecedora para la regeneración cutánea.","Antibiótico","Fortalecedor del sistema inmune","Bulbo","1-2 dientes de ajo al día","Consumo directo o en comidas","El ajo es un potente fortalecedor del sistema inmune y tiene efectos que promueven una circulación sanguínea eficiente (es anticoagulante), además de ser antibacteriano y antibiótico y tener propiedades antioxidantes.","Inhalación de vapor o infusión","Vahos o infusión","El eucalipto es otra de las plantas medicinales más conocidas, especialmente en lo que se refiere a su acción ante enfermedades respiratorias.","Esta planta, en concreto su tallo, es especialmente conocida por aquellas personas con cistitis u otras infecciones del aparato urinario.","No combinar con antidepresivos","También llamada hierba de San Juan. Esta planta medicinal tiene diferentes propiedades, pero destaca el hecho de que posee propiedades antidepresivas.","Infusión o en comidas","Esta especia es de gran utilidad, poseyendo múltiples propiedades que la hacen una planta medicinal cada vez más relevante.","Infusión o condimento","El tomillo posee propiedades antioxidantes y antisépticas. Rico en flavonoides, vitamina C, hierro y magnesio.","Aromaterapia o infusión","Aceite esencial o infusión","La lavanda posee propiedades relajantes, siendo útil para situaciones de estrés e insomnio.","Otra planta medicinal altamente conocida y con propiedades relajantes es la tila.","Infusión o ensalada","No combinar con sales de litio","El diente de león es una planta muy nutritiva y con múltiples propiedades medicinales.","Vasodilatador","Extracto o infusión","El extracto de sus hojas mejora la circulación sanguínea y se centra especialmente en el riego cerebral, con lo que mejora la concentración y la memoria.","mate","1-2 mates al día","Infusión (mate)","La planta con la que está hecha la conocida bebida argentina es también muy positiva para la salud.","Como condimento o infusión","Condimento o infusión","El orégano es un viejo conocido de nuestras cocinas, tradicionalmente muy bien valorado y que posee también grandes propiedades medicinales.","Se trata de una planta que posee propiedades calmantes. Disminuye la tensión arterial y reduce el ritmo cardíaco.","Decocción o extracto","No recomendado para niños","No recomendado para madres lactantes","El extracto de esta corteza es útil como antiinflamatorio. También se ha visto útil para la pérdida de peso, el tratamiento de la cefalea, la artritis y el dolor de huesos.","Estimulante intestinal","Uso tópico o jarabe","Puede generar dermatitis","El agave posee también propiedades medicinales. Concretamente destaca su uso en la curación de heridas y llagas, pudiendo emplearse como desinfectante.","Frutos y hojas","Consumo directo o infusión","Frutos frescos, zumo o infusión de hojas","Los arándanos también tienen propiedades medicinales. Su fruto no solo es comestible sino que también es un potente antioxidante, que además es diurético y beneficioso en la prevención de problemas urinarios y renales.","Consultar a un profesional, sus bayas son tóxicas","Las bayas son tóxicas","Algunas variedades de esta planta han sido empleada para tratar gran cantidad de problemas, desde para bajar la fiebre hasta como purgante, pasando por ser un elemento que contribuye a combatir la ictericia.","Flor de saúco","Esta bonita flor ha sido empleada como remedio para tratar diferentes problemas. Con propiedades antisépticas y antiinflamatorias, además de diuréticas y laxantes, se ha utilizado para tratar episodios gripales y disminuir la tos y los problemas con las mucosas.","Metabolismo","Consumo moderado como parte de la dieta","Cocida o asada","El consumo excesivo sin una dieta balanceada puede ser perjudicial","Este arbusto perenne originario de ciertas regiones centrales de Sudamérica, en partes tropicales. Lo que la hace especial es que sus raíces son muy ricas en almidones y ayudan a aumentar el ritmo metabólico y a perder peso.","Esta planta es utilizada como ingrediente para infusiones que pueden ser utilizadas para aportar energía y mantener activas a las personas.","El poleo menta ha sido utilizado durante mucho tiempo por su capacidad para aumentar el apetito y mejorar la asimilación de nutrientes por parte del organismo, lo cual mejora el proceso de la digestión.","Infusión o cocida en alimentos","La ortiga es una planta con mala reputación debido a que sus hojas producen urticaria, pero más allá de esta molesta característica podemos encontrar propiedades medicinales.","Extracto estandarizado","Planta muy tóxica, su uso doméstico está prohibido","Esta planta es rica en digoxina y digitoxina, las cuales ejercen un efecto diurético y favorecen la circulación sanguínea.","Uso tópico en aceite esencial","Sus propiedades antisépticas basadas en el sándalo hacen de los aceites esenciales de esta planta una buena ayuda para desinfectar heridas.","Narcótico","Látex y semillas","Derivados farmacéuticos (morfina, codeína)","Planta de uso controlado por su potencial adictivo","La amapola es una hierba que crece de manera natural en una gran variedad de ambientes, y desde hace milenios ha sido aprovechada como ingrediente por sus propiedades narcóticas contra el dolor.","Infusión o como condimento","Las semillas del eneldo son utilizadas con fines medicinales desde la Antigüedad, especialmente contra el dolor asociado a la menstruación (dismenorrea) y los espasmos.","Tallo y hojas","Consumo directo o en zumos","Crudo, cocido o en zumo","El apio es un ingrediente habitual a la hora de preparar platos muy conocidos en cocina, pero también puede ser considerado un miembro del grupo de las plantas medicinales.","Consultar a un profesional, contiene tuyona","Contraindicado en la lactancia","El ajenjo, también conocido como hierba santa o artemisa amarga, es una planta medicinal muy conocida en todos los continentes y que viene usándose desde hace miles de años.","Anestésico","Bebida tradicional o extracto","Puede causar daño hepático","El kava es una planta medicinal originaria de la Polinesia. Sus raíces se utilizan especialmente para hacer mezclas con efectos anestésicos y sedantes, y de consumo oral.","Uso tópico con precaución, es tóxica por vía oral","Aceite esencial (uso externo)","Es abortiva","Fototóxica, no exponer la piel al sol tras su uso","La ruda es una planta de tipo arbusto con hojas a partir de las cuales es posible elaborar aceites esenciales usados en medicina tradicional.","Aplicación tópica en crema o infusión","Crema, aceite o infusión para lavados","La caléndula es otra de las plantas medicinales que más allá de los remedios caseros ha sido usada también en la cocina como un ingrediente más.","Infusión, mermelada o sopa","Infusión, mermelada, sopa","El escaramujo se usa para aliviar el dolor relacionado con dolencias como la artritis y ciertas infecciones. Además, es una de las plantas más ricas en vitamina C.","bejuco-de-agua","Cissus verticillata","Anticonvulsivo","El bejuco de agua (Cissus verticillata) es una planta trepadora de zonas de Centroamérica, Colombia y Venezuela. Se la usa como anticonvulsivo y para tratar las hemorragias.","Ulmus rubra","Corteza interna","Polvo o infusión","La corteza de este árbol es utilizada por sus propiedades antibacterianas, y también como suplemento dietético, así como contra la irritación de la garganta.","Infusión o consumo del bulbo","Infusión, cocido o crudo","El hinojo es una planta medicinal habitual en los ecosistemas mediterráneos. Es apreciada por sus propiedades diuréticas y por favorecer la expulsión de gases y la digestión.","El limoncillo (Melissa officinalis), toronjil u hoja de limón es una planta perenne utilizada en infusiones para favorecer un estado de relajación.","ricino","Ricinus communis","Higuera infernal","Higuerilla","Aceite de las semillas","Consultar a un profesional, la semilla es muy tóxica","Aceite extraído en frío","La semilla cruda es mortalmente venenosa","El aceite de ricino es un purgante muy conocido, y se consume de manera oral a pesar de su desagradable sabor.","konjac","Amorphophallus konjac","Como suplemento dietético (glucomanano)","Harina o gelatina","El konjac (Amorphophallus konjac), también conocido como lengua del diablo, es una planta originaria de China y el sudeste asiático que por su alta concentración de fibra se usa como dietético.","lechuga-silvestre","Lactuca virosa","Lechuga virosa","Uso no recomendado, potencialmente tóxica","Extracto (lactucarium)","Su uso casero no está recomendado y está prohibida en varios países","La lechuga silvestre (Lactuca virosa) es una planta con propiedades psicoactivas que se utiliza como sedante en algunos contextos.","helecho-gu-sui-bu","Helecho gu-sui-bu","Drynaria roosii","Regenerador óseo","Consultar a un profesional de medicina tradicional china","Esta variedad de helecho se ha utilizado durante siglos en la medicina tradicional china para favorecer la regeneración de los huesos tras sufrir daños.","junco-de-esteras","Juncus effusus","Junco fino","Médula del tallo","En alimentos","Este tipo de junco se utiliza en algunas regiones de Asia Occidental como ingrediente a añadir en alimentos para personas cansadas y con poca energía.","apong-apong","Apong-apong","Aglaia edulis","Corteza y semillas","Decocción para uso externo","Ciertas partes de este árbol tropical son utilizadas para contribuir a eliminar parásitos como los piojos o la sarna.","khat","Catha edulis","Anorexígeno","Hojas frescas","Masticar hojas frescas, uso controlado","Masticación","Sustancia psicoactiva con potencial de abuso","Las hojas de este arbusto del Cuerno de África y la península arábiga se mastican por sus efectos estimulantes.","kaempferia-rotunda","Antipruriginoso","Hervido y aplicado sobre la piel","Esta planta medicinal se hierve para ser utilizada sobre la piel y aliviar el picor.","hierba-de-san-simon","Circaea lutetiana","Circaea","Planta entera","La Circaea lutetiana se ha utilizado durante siglos para bajar la fiebre y aliviar el malestar por reumatismo.","kadsura-longipedunculata","Frutos y tallos","Este arbusto originario de China y zonas del sudeste asiático se utiliza para tratar algunos problemas gastrointestinales (digestión lenta), e infecciones.","Jarabe o infusión","Las infusiones de esta planta trepadora, también llamada bejuco, se utilizan como antiinflamatorio y para problemas respiratorios.","Resina (aceite)","Aceite o inhalación de vapores","La Copaifera officinalis, o copaiba es una de las principales plantas medicinales de Sudamérica. Tiene efectos laxantes y diuréticos, y sus vapores pueden ser inhalados para aprovechar sus beneficios balsámicos.","Como suplemento o en la comida","Polvo, infusión o germinados","El fenogreco (Trigonella foenum-graecum), también conocido como alholva, es una de las plantas medicinales más tradicionales. Parece ser que facilita la digestión.","Hojas, semillas y raíces","Polvo de hojas o infusión","Polvo, infusión, cocción","La Moringa oleifera es una de las plantas medicinales más importantes de la India. Las hojas de este árbol tienen propiedades antiinflamatorias y ayuda a las personas que sufren hipotensión.","Antiulceroso","Uso tópico u oral, consultar a un profesional","Crema, extracto o infusión","La Centella asiatica, también llamada Gotu kola, se ha usado tradicionalmente en muchas culturas de Asia. Está demostrada su utilidad a la hora de tratar las úlceras y para prevenir la aparición de cicatrices queloides.","Consumo del fruto o extracto","Fruto fresco, en polvo (amla) o aceite","La amla, o grosellero de la India, es un pequeño árbol cuyos aceites ayudan a disminuir la presencia de triglicéridos en la sangre.","Decocción de la raíz o cataplasma de hojas","Decocción, cataplasma","La bardana es conocida por sus propiedades depurativas y desintoxicantes. Se ha usado tradicionalmente para mejorar afecciones de la piel como el acné, el eccema o la psoriasis.","Suavizante","Infusión o cataplasma","Infusión, cataplasma","La malva es una planta muy valorada por sus efectos emolientes, antiinflamatorios y suavizantes. Se emplea principalmente para aliviar irritaciones en la garganta y las vías respiratorias.","Infusión después de las comidas","El anís verde es una planta medicinal empleada para favorecer la digestión y aliviar los gases. Sus semillas son ricas en aceites esenciales con propiedades carminativas.","Infusión o gargarismos","Puede reducir la producción de leche","Conocida desde tiempos antiguos, la salvia tiene múltiples beneficios para la salud. Posee propiedades antisépticas, antiinflamatorias y astringentes, y es muy utilizada para tratar problemas bucales.","Infusión o uso tópico de aceite esencial","Infusión, aceite esencial, condimento","El romero es una planta aromática muy apreciada por su efecto estimulante sobre la circulación y su capacidad para aliviar dolores musculares y articulares.","Infusión antes de dormir","No usar en caso de obstrucción de las vías biliares","El boldo es un árbol originario de Chile, muy apreciado por sus beneficios para el hígado y la vesícula biliar. Facilita la digestión de las grasas.","arboles-medicinales","Árboles medicinales","Infusión: 1-2 tazas al día. Aceite esencial: 2-3 gotas en un difusor.","No administrar a niños menores de 6 años.","Árbol de gran porte conocido por sus propiedades para tratar afecciones respiratorias.","sauce","Sauce","sauce blanco","salguero","sauce plateado","No usar en caso de alergia a la aspirina.","La corteza de sauce es la fuente original del ácido salicílico, precursor de la aspirina.","tilo norteño","tilo silvestre","teja","teja negra","tella","texa","tilar","tilia","tillera","tillo macho","tillon","tillori","Árbol ornamental cuyas flores se utilizan en infusión por sus propiedades relajantes y para combatir el insomnio.","Olivo","Olea europaea","olivera","oliva","common olive","European olive","olive tree","Las hojas de olivo se utilizan para regular la presión arterial y los niveles de azúcar en sangre.","Neem","Azadirachta indica","nim (Hindi)","Hojas, semillas, corteza","Uso tópico: aplicar aceite o extracto sobre la piel.","Aceite, extracto, polvo","Árbol originario de la India con múltiples propiedades medicinales, especialmente para la piel.","Polvo de hojas: 1-2 cucharaditas al día.","Polvo, infusión, consumo directo","Conocido como el “árbol de la vida” por su alto valor nutricional y sus múltiples beneficios para la salud.","Vasodilatador cerebral","Extracto estandarizado: 120-240 mg al día.","Extracto, cápsulas","Uno de los árboles más antiguos del mundo, utilizado para mejorar la memoria y la circulación cerebral.","castano-de-indias","Castaño de Indias","Extracto estandarizado: 300 mg dos veces al día.","Extracto, cápsulas, gel","Utilizado tradicionalmente para tratar problemas de circulación venosa, como las varices y las hemorroides.","Fresno","Fraxinus excelsior","fresno común","fresno de hoja ancha","fresno de Vizcaya","fresno elevado","fleja","fragino","ash","Árbol utilizado para aliviar dolores articulares y musculares, y para favorecer la eliminación de líquidos.","abedul","Abedul","Betula pendula","abedul común","abedul europeo","abedul llorón","abedul péndulo","abedul plateado","abedul verrugoso","aliso europeo","white birch","warty birch","Hojas, corteza, savia","Conocido por sus propiedades diuréticas y depurativas, ayuda a eliminar toxinas y a tratar afecciones de la piel.","cipres","Ciprés","Cupressus sempervirens","ciprés común","ciprés mediterráneo","ciprés","Tuscan cypress","Persian cypress","Gálbulos (frutos), ramas","Decocción, aceite esencial","Utilizado para tratar problemas circulatorios como varices y hemorroides, y para aliviar la tos.","Pino","Pinus sylvestris","pino silvestre","pino de Valsaín","pino serrano","pino albar","pino del Norte","pino rojo","pino bermejo","Scotch pine","Scots pine","Yemas, resina, hojas","Infusión, jarabe, aceite esencial","Las yemas de pino son un remedio tradicional para la tos y las afecciones respiratorias.","cedro","Cedro","Cedrus libani","cedro del Líbano","Madera, aceite esencial","Aceite esencial: 2-3 gotas en un difusor.","El aceite esencial de cedro se utiliza en aromaterapia por sus propiedades relajantes y para aliviar la congestión.","arce","Arce","Acer saccharum","Savia","Jarabe","El jarabe de arce, además de ser un edulcorante natural, contiene compuestos con propiedades antiinflamatorias y antioxidantes.","Roble","Quercus robur","roble carballo","roble carvallo","cajiga","roble fresnal","roble europeo","carvayo","roble pedunculado","roble de Eslavonia","encina inglesa","Decocción: uso externo para gargarismos o lavados.","La corteza de roble es rica en taninos, lo que le confiere propiedades astringentes para tratar inflamaciones de la boca y la garganta.","haya","Haya","Fagus sylvatica","haya común","fago","fau","faya","Utilizada tradicionalmente para bajar la fiebre y tratar afecciones respiratorias.","Las hojas de nogal se usan para tratar problemas de piel y regular los niveles de azúcar en sangre.","Taxus baccata","Planta altamente tóxica. Su uso debe ser estrictamente supervisado por un profesional.","Del tejo se extrae el paclitaxel, un potente fármaco utilizado en quimioterapia para tratar diversos tipos de cáncer.","Flores, hojas, frutos","Puede interactuar con medicamentos para el corazón.","Conocido como el “árbol del corazón”, se utiliza para regular el ritmo cardíaco y la presión arterial.","Las hojas y la corteza de avellano se utilizan en preparados para mejorar la circulación y tratar problemas de piel.","alcornoque","Quercus suber","La corteza del alcornoque, de donde se extrae el corcho, tiene propiedades similares a la del roble.","encina","Quercus ilex","Corteza, bellotas","Al igual que otros árboles del género Quercus, la encina tiene propiedades astringentes.","serbal","Serbal","serbal de los cazadores","cerollo","acerollo","azarollo","acafresno","cafresna","cornabois","escornabois","llameiro","European mountain ash","mountain ash","witch wiggin tree","keirn","cuirn","otsalizarra (euskera)","Consumo directo o en mermelada.","Consumo directo, mermelada","Los frutos del serbal son ricos en vitamina C y se utilizan para preparar mermeladas y licores.","Además de su uso culinario, el laurel facilita la digestión y ayuda a expulsar los gases.","Magnolia grandiflora","Corteza, flores","Extracto: seguir indicaciones del fabricante.","Extracto","La corteza de magnolia se utiliza en la medicina tradicional china por sus efectos ansiolíticos y antiinflamatorios.","arbol-del-te","Árbol del Té","Melaleuca alternifolia","Hojas (aceite esencial)","Uso tópico: aplicar diluido sobre la piel.","No ingerir. Puede ser tóxico.","El aceite esencial de árbol del té es un potente antiséptico natural para tratar infecciones de la piel.","Canelo","Drimys winteri","foye","canelillo","fuñe","foiye","foiyel","foike","folle","liuche","voigue","ajicillo","ajizuelo","canelo de páramo","pepper bark","foye (mapudungun)","boighe (mapudungun)","Antiescorbútico","Árbol sagrado del pueblo mapuche, utilizado tradicionalmente para combatir el escorbuto y como tónico general.","Infusión: 1-2 tazas al día, antes o después de las comidas.","Las hojas de boldo estimulan la producción de bilis y protegen el hígado, facilitando la digestión de las grasas.","quina","Cinchona officinalis","Cascarilla","quina-quina (quechua)","Antipalúdico","Amargo","De la corteza de la quina se extrae la quinina, el primer tratamiento eficaz contra la malaria.","Látex (resina)","Uso tópico: aplicar unas gotas sobre la herida.","El látex de este árbol amazónico es un potente cicatrizante y se utiliza para curar heridas y úlceras.","Araucaria","Araucaria araucana","pewén","pino araucano","piñonero","pino de brazos","pino araucaria","pino chileno","pino de Neuquén","pewén (mapudungun)","Energético","Piñones (semillas)","Cocidos o tostados","Los piñones de la araucaria son un alimento muy nutritivo y energético, base de la dieta de los pueblos originarios del sur de Chile y Argentina.","Alerce","Larix decidua","lahuán","lahual","Chilean false larch","lahuán (mapudungun)","Resina, yemas","Utilizado en la medicina popular europea para tratar afecciones respiratorias.","abeto","Abies alba","Yemas, resina","Jarabe: 1-3 cucharaditas al día.","Las yemas de abeto se utilizan para preparar jarabes contra la tos y los resfriados.","Acacia senegal","Goma arábiga","Según indicación del producto.","Polvo, pastillas","La goma arábiga, exudado de la acacia, se utiliza para aliviar la irritación de garganta y las molestias digestivas.","Algarrobo","Ceratonia siliqua","garrofero","garrobo","algarroba","pan de San Juan","St. John\'s bread","locust bean","Frutos (algarrobas)","Harina: 1-2 cucharadas disueltas en agua.","Harina, jarabe","La harina de algarroba es un remedio eficaz contra la diarrea y una alternativa saludable al cacao.","Almendro","almendolero","alloza","allozo","sweet almond","Frutos (almendras), aceite","Consumo directo o aceite.","Consumo directo, aceite","El aceite de almendras es un excelente emoliente para la piel, y las almendras son un alimento muy nutritivo.","caoba","Swietenia mahagoni","La corteza de caoba se ha utilizado en la medicina tradicional para tratar la fiebre y la diarrea.","ceiba","Ceiba pentandra","Pochote","Corteza, hojas, flores","Árbol sagrado en muchas culturas de América, utilizado por sus propiedades diuréticas y para bajar la fiebre.","chopo","Populus nigra","Álamo negro","Yemas, corteza","Ungüento: aplicación tópica.","Ungüento, decocción","Las yemas de chopo se utilizan para preparar ungüentos antiinflamatorios y analgésicos.","Corteza de la raíz, fruto","Decocción de la corteza: uso bajo supervisión. Zumo del fruto: consumo libre.","Decocción, zumo","La corteza de la raíz del granado es un potente vermífugo, mientras que el fruto es un excelente antioxidante.","Hojas, fruto","Infusión, consumo directo del fruto","Las hojas de guayabo son un remedio muy eficaz para detener la diarrea.","Frutos (higos), látex","Consumo de higos frescos o secos.","Los higos son un laxante suave y eficaz, y el látex de la higuera se usa para eliminar verrugas.","Jaboncillo","Sapindus saponaria","amole","chumbimbo","chambimbe","michú","wingleaf soapberry","western soapberry","soapberry","sulluku","Detergente","Uso externo.","Decocción para obtener saponinas","Tóxico si se ingiere.","Los frutos de este árbol, ricos en saponinas, se han utilizado tradicionalmente como jabón natural.","Limonero","Citrus limon","Alcalinizante","Zumo, infusión de la cáscara","El limón es una fuente excepcional de vitamina C y un potente antiséptico natural.","Infusión, consumo de frutos","Las hojas de madroño son un buen antiséptico para las vías urinarias.","Moral","Morus nigra","morera negra","Frutos (moras), hojas","Consumo de frutos. Infusión de hojas: 1-2 tazas al día.","Las moras son un laxante suave y las hojas del moral ayudan a regular los niveles de azúcar.","naranjo-amargo","Naranjo Amargo","Flores (azahar), hojas, fruto","Infusión de azahar: 1-2 tazas al día.","La flor de azahar, del naranjo amargo, es un remedio tradicional para calmar los nervios y facilitar el sueño.","Ulmus minor","La corteza de olmo se utiliza en preparados para tratar afecciones de la piel como eccemas y heridas.","Peral","peral común","Fruto, hojas","Consumo del fruto. Infusión de hojas: 1-2 tazas al día.","La pera es una fruta diurética y rica en minerales. Las hojas tienen propiedades astringentes.","arbustos-medicinales","Arbustos medicinales","Infusión: 1-2 cucharaditas por taza, 2-3 veces al día.","Infusión, aceite esencial, tintura.","Usar con precaución en dosis altas.","Arbusto aromático perenne, muy utilizado en la cocina mediterránea y con notables propiedades medicinales.","Infusión: 1 cucharadita por taza antes de dormir. Aceite esencial: 2-3 gotas en difusor o sobre la piel (diluido).","Infusión, aceite esencial, bolsitas aromáticas.","Puede potenciar el efecto de sedantes.","Conocida por su aroma relajante, la lavanda es un arbusto popular en jardinería y aromaterapia.","hamamelis","Hamamelis","Hamamelis virginiana","common witch hazel","American witch-hazel","Hermostático","Uso tópico: aplicar el destilado (agua de hamamelis) sobre la zona afectada varias veces al día.","Decocción, destilado (agua de hamamelis), extracto.","Raramente, puede causar irritación en pieles muy sensibles.","Arbusto de Norteamérica cuyo extracto es ampliamente utilizado en cosmética y para tratar problemas de piel y circulatorios.","Vasodilatador coronario","Flores y frutos (bayas)","Infusión: 1-2 cucharaditas por taza, 2-3 veces al día. Extracto: seguir indicaciones del fabricante.","Infusión, extracto líquido, cápsulas.","Puede interactuar con medicamentos para el corazón (digitálicos, betabloqueantes). Consultar al médico.","Conocido como el \'alimento del corazón\', es un arbusto espinoso usado tradicionalmente para trastornos cardíacos y nerviosos.","Sauzgatillo","saucegatillo","Regulador hormonal (progesterogénico)","Alivia síntomas del síndrome premenstrual (SPM)","Frutos (bayas)","Extracto estandarizado: 20-40 mg al día, preferiblemente por la mañana.","Cápsulas, extracto líquido, tintura.","Puede interferir con anticonceptivos orales y terapia de reemplazo hormonal.","Arbusto mediterráneo utilizado desde la antigüedad para regular el ciclo menstrual y aliviar sus síntomas.","gayuba","Gayuba","uva de oso","rastrera","Infusión: 1.5-4 g en 150 ml de agua, 3-4 veces al día. No usar más de 1 semana seguida.","Infusión (en frío para reducir taninos), decocción, extracto.","No recomendado para menores de 12 años.","No usar en caso de insuficiencia renal o trastornos hepáticos.","Pequeño arbusto rastrero cuyas hojas son un remedio clásico para las infecciones del tracto urinario.","Arándano Rojo Americano","Antiadherente bacteriano (vías urinarias)","Fruto (baya)","Jugo: 250-500 ml al día. Extracto en cápsulas: 300-500 mg dos veces al día.","Jugo, consumo directo, cápsulas, extracto.","Puede aumentar el riesgo de sangrado si se toma con anticoagulantes (warfarina).","Altas dosis pueden causar malestar estomacal o diarrea.","Famoso por su capacidad para prevenir infecciones urinarias recurrentes al impedir que las bacterias se adhieran a las paredes de la vejiga.","grosellero-negro","Grosellero Negro","European blackcurrant","Antiinflamatorio (similar a la cortisona)","Hojas, frutos y yemas","Infusión de hojas: 2-4 g por taza. Extracto de yemas (gemoterapia): 50-100 gotas al día.","Infusión, extracto de yemas, jugo, jarabe.","Usar con precaución si se tiene edema por insuficiencia cardíaca o renal.","Arbusto cuyos frutos son muy nutritivos y sus hojas y yemas tienen potentes efectos antiinflamatorios y antialérgicos.","Diurético potente","Antiséptico (urinario y respiratorio)","Frutos (bayas o gálbulos)","Infusión: 1 cucharadita de bayas machacadas por taza, 1-2 veces al día. No usar por periodos prolongados.","Infusión, aceite esencial (uso externo), tintura.","Totalmente contraindicado, es abortivo.","No usar en caso de nefritis o insuficiencia renal aguda.","Conífera arbustiva cuyas bayas se usan para aromatizar la ginebra y como un potente diurético y antiséptico.","Decocción de hojas: 20-30 g por litro de agua, tomar 2-3 tazas al día.","Decocción, infusión.","El consumo excesivo de frutos puede causar indigestión y dolor de cabeza.","Árbol o arbusto mediterráneo con frutos comestibles y hojas con propiedades similares a la gayuba para el sistema urinario.","Smilax aspera","zarza morisca","rough bindweed","Mediterranean smilax","Raíz (rizoma)","Decocción: 1-2 cucharaditas de raíz por taza, hervir 10 min, tomar 2-3 veces al día.","Decocción, extracto, cápsulas.","Puede aumentar la absorción de algunos fármacos.","Dosis altas pueden irritar la mucosa gástrica.","Arbusto trepador cuya raíz es famosa por sus propiedades depurativas, usada para limpiar la sangre y tratar problemas de piel.","Rusco","Ruscus aculeatus","brusco","acebillo","knee holly","Extracto estandarizado: 7-11 mg de ruscogenina total al día, en 2-3 tomas.","Cápsulas, extracto, gel (uso tópico).","Usar con precaución y bajo control médico.","Pequeño arbusto de hojas rígidas y punzantes, muy eficaz para tratar la insuficiencia venosa crónica, hemorroides y piernas cansadas.","Mirto","murta","true myrtle","Infusión: 1 cucharadita por taza. Aceite esencial: 2-3 gotas en inhalaciones de vapor.","Infusión, aceite esencial, licor.","Evitar el aceite esencial durante el embarazo y la lactancia.","Arbusto aromático mediterráneo, sagrado en la antigüedad, utilizado para afecciones respiratorias y como tónico para la piel.","jara-pringosa","Jara Pringosa","Cistus ladanifer","jara pringosa","ládano","jara negra","common gum cistus","Hojas y ramas jóvenes","Infusión: 1 cucharadita por taza, 2-3 veces al día. Uso tópico: aplicar la infusión o el aceite (ládano).","Infusión, aceite esencial (ládano).","No se conocen contraindicaciones importantes en las dosis recomendadas.","Arbusto mediterráneo cubierto de una resina pegajosa (ládano) con potentes propiedades antivirales y cicatrizantes.","Brezo","Calluna vulgaris","brecina","argaña","Scotch heather","Sumidades floridas (flores)","Infusión: 1-2 cucharaditas de flores por taza, 3-4 veces al día.","Infusión, extracto, yemas (gemoterapia).","No se han descrito efectos adversos significativos.","Arbusto de bajo crecimiento que cubre grandes extensiones (brezales), cuyas flores son un remedio suave para las vías urinarias y el reumatismo.","Antiviral (gripe)","Flores y bayas maduras","Infusión de flores: 2-4 g por taza. Jarabe de bayas: 1-2 cucharadas 3-4 veces al día al inicio de un resfriado.","Infusión (flores), jarabe (bayas), decocción (corteza, uso externo).","Las bayas crudas y otras partes verdes de la planta son tóxicas. Solo consumir bayas cocinadas.","Arbusto o pequeño árbol cuyas flores y bayas son un remedio tradicional muy efectivo para gripes y resfriados.","Emenagogo (regula la menstruación)","Infusión: 1 cucharadita por taza, antes de las comidas. No tomar de forma continuada.","Infusión, polvo, tintura.","Contraindicada por su efecto emenagogo y potencial toxicidad.","Puede causar alergia a personas sensibles a las compuestas (Asteraceae).","Planta herbácea o arbustiva con un aroma característico, utilizada tradicionalmente para problemas digestivos y ginecológicos.","Boj","Buxus sempervirens","buje","cajón","chupalla","common boxwood","European box","common box","boxwood","Uso muy delicado por su toxicidad. Principalmente en homeopatía o bajo estricta supervisión médica.","Decocción (uso tradicional, hoy desaconsejado), extractos muy diluidos.","Planta tóxica. Su uso interno es peligroso y puede causar vómitos, diarrea y parálisis. No automedicarse.","Arbusto de crecimiento lento muy usado en jardinería ornamental. Medicinalmente es tóxico y su uso casero está obsoleto y es peligroso.","Aligustre","Ligustrum vulgare","alheña","azahar de novio","European privet","wild privet","Antiinflamatorio (uso externo)","Uso exclusivamente externo. Infusión para gargarismos o compresas.","Infusión para enjuagues, gargarismos o lavado de heridas.","Sus bayas son tóxicas, especialmente para los niños. No ingerir ninguna parte de la planta.","Arbusto muy común en setos de jardín. Sus hojas se usan externamente para aftas bucales y heridas, pero sus frutos son venenosos.","Bonetero","Euonymus europaeus","evónimo","husera","common spindle","spindle","Laxante drástico","Vomitivo","Insecticida (uso externo)","Frutos y corteza","Planta altamente tóxica. No se recomienda ningún uso interno.","Polvo de frutos (uso externo tradicional como insecticida).","Todas las partes de la planta son muy tóxicas. La ingestión de frutos puede ser mortal, especialmente en niños.","Arbusto con frutos rosados muy característicos y decorativos, pero extremadamente tóxicos. Su uso medicinal es obsoleto y peligroso.","cornejo-sanguineo","Cornejo Sanguíneo","Cornus sanguinea","cornejo sanguíneo","sanguino","sanguiño","bloody dogwood","Decocción de corteza: 30 g por litro, tomar a pequenas dosis (uso tradicional, hoy poco común).","Decocción, maceración de frutos.","Los frutos pueden ser vomitivos en grandes cantidades. Usar con precaución.","Arbusto con ramas rojizas en invierno, cuya corteza se usaba antiguamente como sustituto de la quinina para bajar la fiebre.","Durillo","Viburnum tinus","laurentina","barbadija","laurustinus viburnum","Uso delicado por su toxicidad. La tintura madre se usa en homeopatía.","Decocción (uso tradicional arriesgado).","Planta tóxica. La ingestión puede causar vómitos y diarrea. No automedicar.","Arbusto ornamental de floración invernal. Se ha usado como febrífugo, pero su toxicidad hace que su uso interno sea desaconsejable.","espino-cerval-de-mar","Espino Cerval de Mar","Frutos (bayas) y aceite de las semillas","Jugo o jarabe: 1-3 cucharadas al día. Aceite (uso tópico u oral): seguir indicaciones del producto.","Jugo, jarabe, aceite, consumo directo de bayas cocidas.","Arbusto espinoso cuyos frutos anaranjados son una de las fuentes vegetales más ricas en vitamina C y otros nutrientes.","Forsitia","Forsythia suspensa","campanas doradas","Se usa en fórmulas de la Medicina Tradicional China (MTC) como Lian Qiao. Dosis según prescripción.","Decocción dentro de fórmulas complejas.","Usar solo bajo supervisión de un profesional de MTC. Puede causar náuseas.","Arbusto ornamental conocido por su espectacular floración amarilla en primavera. Su fruto es una importante hierba en la medicina china.","Mahonia","uva de Oregón","holly-leaved barberry","Antimicrobiano (berberina)","Alterativo (depurativo)","Raíz y corteza del tallo","Tintura: 1-3 ml, 3 veces al día. No usar por periodos prolongados.","Tintura, decocción, extracto.","No usar durante el embarazo debido a la berberina.","No usar en caso de ictericia en recién nacidos.","También llamado \'Uva de Oregón\', es un arbusto con bayas comestibles y una raíz rica en berberina, usada para infecciones y problemas de piel.","pirlitero","Pirlitero","acerolo","cerolero","Mediterranean medlar","Frutos (acerolas)","Consumo de los frutos frescos o en mermelada.","Consumo directo, mermeladas, jaleas.","Similar al espino blanco, precaución si se toman fármacos para el corazón.","Arbusto o pequeño árbol mediterráneo, pariente del espino blanco, con frutos comestibles (acerolas) ricos en vitamina C y con propiedades para el corazón.","retama-negra","Retama Negra","Cytisus scoparius","retama negra","escoba amarga","piorno","common broom","broom","Cardiotónico (esparteína)","Hipertensor","Ramas y flores","Uso muy delicado por su toxicidad. Solo bajo estricta prescripción médica.","Extractos estandarizados (uso farmacéutico).","Totalmente contraindicada.","Contraindicada por su efecto hipertensor.","Planta tóxica. Su uso puede provocar arritmias y otros problemas cardíacos graves.","Arbusto de flores amarillas muy vistosas. Contiene esparteína, un alcaloide tóxico con acción sobre el corazón. Su uso casero es muy peligroso.","rosa-canina","Rosa Canina (Escaramujo)","rosa canina","Diurético suave","Fruto (escaramujo)","Infusión: 2-5 g de frutos secos por taza. Polvo: 5-10 g al día.","Infusión, decocción, mermelada, jarabe, polvo.","Los pelos del interior del fruto pueden causar irritación en la boca y el tracto digestivo si no se eliminan.","Rosal silvestre cuyos frutos, los escaramujos, son excepcionalmente ricos en vitamina C, ideales para prevenir resfriados y reforzar el sistema inmune.","salvia-real","Salvia Real","Phlomis lychnitis","candilera","oreja de liebre","matagallo","Jerusalem sage","Antiséptico (uso externo)","Uso externo: infusión concentrada para lavar heridas o en gargarismos.","Infusión para uso tópico.","No se recomienda su uso interno por falta de estudios concluyentes.","Arbusto mediterráneo con hojas que recuerdan a las del gordolobo, tradicionalmente usado para desinfectar y cicatrizar heridas.","te-de-aragon","Té de Aragón","Jasonia glutinosa","té de Aragón","té de roca","olivardilla","Infusión: 1 cucharadita por taza, después de las comidas.","Evitar por precaución.","Pequeño arbusto que crece en roquedos calcáreos, muy popular en Aragón y otras zonas de España como remedio para todo tipo de trastornos digestivos.","tomillo-salsero","Tomillo Salsero","Thymbra capitata","tomillo salsero","tomillo aceitunero","tomillo andaluz","Spanish oregano","Persian hyssop","Antiséptico potente","Infusión: media cucharadita por taza (es muy potente), 1-2 veces al día. No tomar de forma prolongada.","Infusión, aceite esencial (muy cáustico, solo uso experto).","Contraindicado.","Puede subir la tensión arterial.","Irritante gástrico en dosis altas o uso continuado.","Arbusto de intenso aroma, considerado uno de los tomillos con mayor poder antiséptico gracias a su alto contenido en carvacrol.","Torvisco","Daphne gnidium","matapollo","bufalaga","spurge flax","Purgante drástico","Vesicante (produce ampollas en la piel)","Corteza y hojas","Planta extremadamente tóxica. No se recomienda ningún uso, ni interno ni externo.","Tradicionalmente se usaba la corteza como purgante o para provocar ampollas (práctica peligrosa).","Toda la planta es muy venenosa. El simple contacto puede irritar la piel y su ingestión puede ser mortal.","Arbusto mediterráneo muy venenoso. Se usaba en el pasado como veneno para pescar (embarbascar) y como purgante, prácticas hoy prohibidas y muy peligrosas.","viburno","Viburno","Viburnum opulus","bola de nieve","mundillo","sauquillo","European cranberrybush","cramp bark","guelder-rose","water elder","Antiespasmódico (especialmente uterino)","Decocción: 1-2 cucharaditas de corteza por taza. Tintura: 2-4 ml, 3 veces al día.","Decocción, tintura, extracto.","No usar durante el embarazo, excepto bajo supervisión médica en el momento del parto.","Conocido como \'Cramp Bark\' en inglés, es un arbusto cuya corteza es un relajante muscular muy eficaz, especialmente para calambres menstruales.","Agnocasto","Alivia el síndrome premenstrual","Trata irregularidades menstruales","30-40 mg de extracto seco al día.","Cápsulas, comprimidos, gotas.","Puede interactuar con antagonistas de la dopamina.","Arbusto que crece en las riberas de los ríos y que se ha utilizado desde la antigüedad para tratar los desequilibrios hormonales femeninos.","aladierno","Aladierno","Rhamnus alaternus","Decocción de la corteza (20 g/l), 1 taza antes de acostarse.","Decocción.","Puede causar espasmos intestinales.","Arbusto mediterráneo de hoja perenne, cuya corteza tiene propiedades laxantes, aunque más suaves que las de la frángula.","arayan","Arrayán","arrayán rojo","arrayán chileno","quetri","orange-bark myrtle","quetri (mapudungun)","Infusión de 15 g de hojas por litro de agua.","No se recomienda el uso del aceite esencial.","Arbusto aromático, también conocido como mirto, utilizado para tratar afecciones respiratorias y digestivas.","berberis","Bérberis","Tónico hepático","Estimulante de la bilis","Decocción de 5 g por taza, 2-3 veces al día antes de las comidas.","Decocción, tintura.","Arbusto espinoso, también llamado agracejo, cuya raíz es rica en berberina, un potente estimulante hepático y biliar.","ceanoto","Ceanoto","Ceanothus americanus","Linfagogo","Tintura (1:5 en alcohol al 45%), 1-2 ml tres veces al día.","Tintura, decocción.","Puede interferir con anticoagulantes.","Conocido como \'Raíz Roja\', es un arbusto norteamericano que actúa como un excelente tónico para el sistema linfático.","chicalote","Chicalote","Argemone mexicana","Microdosis bajo supervisión experta. Es una planta de uso delicado.","Látex, infusión.","Planta tóxica, puede causar glaucoma si el látex entra en contacto con los ojos.","Planta arbustiva espinosa con flores amarillas parecidas a las amapolas. Se usa en la medicina tradicional mexicana como calmante.","Antidepresivo suave","Infusión de 2-4 g de hojas secas, 3 veces al día.","Infusión, licor, extracto.","Arbusto aromático originario de México, conocido por sus efectos estimulantes y afrodisíacos, así como por ser un tónico para el sistema nervioso.","equiseto-menor","Equiseto menor","Infusión de 2-3 g por taza, varias veces al día.","Infusión, decocción, polvo.","Contiene trazas de un alcaloide, no se recomienda el uso prolongado.","Planta primitiva sin flores ni frutos, rica en silicio y otros minerales, lo que la convierte en un excelente regenerador de tejidos.","Antiséptico respiratorio","Inhalaciones de vapor con 2-3 gotas de aceite esencial. Infusión de 1-2 hojas por taza.","Infusión, aceite esencial, ungüento.","No administrar aceite esencial a menores de 6 años.","Árbol de origen australiano cuyas hojas son un remedio clásico y muy eficaz para todo tipo de afecciones del sistema respiratorio.","gobernadora","Gobernadora","Larrea tridentata","Uso principalmente externo. Infusión para lavados o compresas.","Infusión, ungüento.","Potencialmente hepatotóxica en uso interno. No se recomienda.","Arbusto resinoso del desierto de Sonora, muy resistente. Se usa tradicionalmente para infecciones de la piel, reumatismo y como conservante.","guayule","Guayule","Parthenium argentatum","Planta completa","Uso tradicional en emplastos sobre zonas doloridas.","Emplasto, decocción para baños.","Puede causar dermatitis de contacto.","Arbusto del desierto de México, conocido por ser una fuente de hule hipoalergénico. Tradicionalmente se usa para aliviar el dolor reumático.","hierba-del-pollo","Hierba del Pollo","Commelina pallida","Planta fresca","Aplicación directa de la planta machacada sobre la herida.","Cataplasma, emplasto.","Uso exclusivamente externo.","Planta rastrera que se considera un \'botiquín de primeros auxilios\' en el campo, capaz de cortar hemorragias y ayudar a cicatrizar heridas.","hoja-santa","Hoja Santa","Piper auritum","Infusión de 1-2 hojas por taza.","Infusión, cataplasma, uso culinario.","Contiene safrol, no se recomienda su uso medicinal.","Planta de grandes hojas con un aroma anisado, muy usada en la cocina del sur de México. Medicinalmente se usa para la tos y la inflamación.","izote","Izote","Yucca filifera","Flor y raíz","Decocción de la raíz, 20 g por litro, tomar 2 tazas al día.","Decocción, las flores son comestibles.","Dosis altas pueden ser irritantes para el estómago.","Planta arborescente del desierto mexicano, cuyas flores son comestibles y la raíz se utiliza para tratar la artritis y el reumatismo.","jojoba","Jojoba","Simmondsia chinensis","Cera líquida de las semillas","Uso tópico, aplicar unas gotas sobre la piel o el cabello.","Aceite o cera líquida.","No ingerir. Es indigestible.","Arbusto del desierto cuya semilla produce una cera líquida muy similar al sebo humano, lo que la hace excelente para el cuidado de la piel y el cabello.","lentisco","Lentisco","Pistacia lentiscus","Resina (almáciga) y hojas","Masticar la resina para la salud bucal. Decocción de hojas para uso externo.","Resina (almáciga), aceite, decocción.","Posible alergia a la resina.","Arbusto mediterráneo del que se extrae una resina aromática llamada almáciga, usada desde la antigüedad para la higiene bucal y problemas digestivos.","Membrillero","Frutos y semillas","Macerado de semillas (1 cucharadita en agua) para hacer un mucílago.","Carne de membrillo, jalea, macerado de semillas.","Las semillas crudas contienen pequeñas cantidades de cianuro, no deben masticarse ni triturarse.","Pequeño árbol o arbusto conocido por sus frutos aromáticos, los membrillos. Las semillas, ricas en mucílago, son excelentes para proteger las mucosas.","plantas-tropicales-medicinales","Plantas tropicales medicinales","Aplicación tópica según necesidad. Ingesta: 25-50 ml de jugo al día.","Uso directo del gel, jugos, cremas y lociones.","Planta suculenta conocida por su gel, utilizado para tratar afecciones de la piel y problemas digestivos.","1-3 gramos de raíz fresca al día, o en infusión.","Infusión, decocción, en polvo, fresco en comidas.","Raíz con un sabor picante y aromático, utilizada para aliviar náuseas, mejorar la digestión y reducir la inflamación.","1.5-3 gramos de polvo de cúrcuma al día.","En polvo como especia, cápsulas, extractos.","No se recomienda en grandes cantidades.","Precaución con anticoagulantes y antiácidos.","Especia de color amarillo intenso, conocida por su potente compuesto activo, la curcumina, con fuertes propiedades antiinflamatorias.","Fruto, hojas, raíz","Jugo, extractos, cápsulas.","Personas con enfermedades renales o hepáticas deben consultar a un médico.","Fruto tropical con un olor fuerte y sabor amargo, utilizado tradicionalmente para una amplia gama de dolencias.","250-500 mg de extracto estandarizado al día.","Liana de la selva amazónica, utilizada para fortalecer el sistema inmunológico y tratar la artritis y otros trastornos inflamatorios.","Látex (resina) del tronco","Uso tópico: aplicar directamente sobre la herida. Uso oral: 5-15 gotas diluidas en agua, 1-3 veces al día.","Látex líquido para aplicación directa o diluido.","No se recomienda su uso oral.","Resina de color rojo oscuro de un árbol del Amazonas, conocida por su excepcional capacidad para cicatrizar heridas y úlceras.","Aceite-resina del tronco","2-5 gotas diluidas en agua o miel, 1-3 veces al día.","Aceite esencial, cápsulas.","Aceite resinoso extraído de un árbol amazónico, utilizado para tratar una amplia variedad de procesos inflamatorios y como antiséptico.","acai","Açaí","Consumo libre de la pulpa o jugo.","Pulpa congelada, jugos, batidos, suplementos.","Fruto de una palmera del Amazonas, famoso por su altísimo contenido de antioxidantes, vitaminas y minerales.","Guaraná","200-800 mg de extracto en polvo al día.","Polvo, cápsulas, bebidas energéticas.","Puede aumentar la presión arterial y el ritmo cardíaco.","No se recomienda por su alto contenido de cafeína.","Semilla de un arbusto del Amazonas, rica en cafeína, utilizada como estimulante natural para combatir la fatiga y mejorar la concentración.","yerba-mate","Yerba Mate","Hojas y tallos jóvenes","Infusión tradicional, 20-50g de yerba por litro de agua.","Infusión en mate, saquitos de té.","Moderar consumo por su contenido de cafeína.","Hojas de un árbol sudamericano, utilizadas para preparar una infusión estimulante rica en antioxidantes y nutrientes.","Hervida, frita, asada, como harina.","Debe cocinarse adecuadamente para eliminar compuestos tóxicos.","Raíz tuberosa rica en carbohidratos, fuente de energía y con propiedades antiinflamatorias.","200-400 mg de extracto estandarizado al día.","Cápsulas, extractos, tés.","Puede aumentar la presión arterial.","Precaución con anticoagulantes y antidiabéticos.","Raíz utilizada en la medicina tradicional china como un tónico general para mejorar la energía, la vitalidad y la resistencia al estrés.","Partes aéreas (hojas y flores)","Infusión de 1-2 gramos de la planta seca, o 300-500 mg de extracto.","Infusión, tintura, cápsulas.","Planta trepadora con flores exóticas, utilizada para calmar la ansiedad, el nerviosismo y el insomnio.","Agave spp.","Savia (aguamiel) y hojas","Consumo moderado del sirope. Uso tópico del jugo de las hojas.","Sirope, cataplasmas.","El sirope tiene un alto contenido de fructosa.","Planta del desierto de la que se extrae el sirope de agave y el tequila. Su savia tiene propiedades prebióticas y antiinflamatorias.","Consumo libre del fruto. 250-500 mg de extracto para la salud urinaria.","Fruto fresco, jugos, extractos, cápsulas.","Pequeño fruto del bosque rico en antioxidantes, conocido por su capacidad para prevenir infecciones urinarias y mejorar la salud visual.","Flores y bayas","Infusión de 3-5 gramos de flores secas. 15-30 ml de jarabe de bayas.","Infusión, jarabe, tintura.","Las bayas crudas son tóxicas, deben cocinarse.","Flores y bayas de un arbusto común, utilizadas tradicionalmente para tratar resfriados, gripes y problemas respiratorios.","Jarabe o infusión de las hojas.","Jarabe, infusión, tintura.","Planta trepadora de Sudamérica, ampliamente utilizada en la medicina popular para tratar afecciones respiratorias como el asma y la bronquitis.","1-3 gramos de polvo de hoja al día.","Polvo, cápsulas, infusión, consumo de hojas frescas.","Evitar el consumo de la raíz.","Árbol originario de la India, conocido como el \\"árbol milagroso\\" por su altísimo valor nutricional y sus múltiples propiedades medicinales.","Aplicación tópica en cremas. 60-120 mg de extracto estandarizado al día.","Cremas, ungüentos, cápsulas, extractos.","Personas con enfermedades hepáticas deben tener precaución.","Planta herbácea utilizada en la medicina ayurvédica y china para mejorar la memoria, la circulación y promover la cicatrización de la piel.","1-3 gramos de polvo de fruta al día.","Polvo, cápsulas, jugo.","También conocido como Amla, es un fruto muy rico en vitamina C y antioxidantes, fundamental en la medicina ayurvédica.","Raíz, hojas y semillas","Decocción de 2-6 gramos de raíz seca, 3 veces al día.","Decocción, tintura, cataplasma.","Puede causar reacciones alérgicas en personas sensibles a las asteráceas.","Planta robusta cuya raíz se utiliza como depurativo de la sangre y para tratar afecciones de la piel como el acné y los eczemas.","Infusión de 1.5-2 gramos por taza, varias veces al día.","Infusión, gargarismos, cataplasmas.","Planta común con flores vistosas, rica en mucílagos que le confieren propiedades suavizantes para la garganta, el estómago y la piel.","Anís Verde","Frutos (semillas)","Infusión de 1-3 gramos de semillas por taza.","Planta aromática cuyas semillas se utilizan para aliviar los gases, la hinchazón abdominal y la tos.","Infusión de 1-3 gramos de hojas secas. Gargarismos con la infusión.","Infusión, tintura, aceite esencial.","No se recomienda su uso por su contenido en tuyona.","Arbusto aromático muy utilizado en la cocina y en la medicina tradicional para tratar infecciones de boca y garganta, y regular la sudoración.","Infusión de 2-4 gramos por taza. Uso tópico del aceite esencial diluido.","Infusión, aceite esencial, alcohol de romero.","En dosis altas puede aumentar la presión arterial.","Arbusto mediterráneo con un aroma intenso, utilizado para mejorar la circulación, la digestión y la memoria.","Matricaria recutita","Infusión de 1-2 cucharaditas de flores por taza.","Infusión, aceite esencial, extractos.","Personas alérgicas a las asteráceas pueden ser sensibles.","Hierba muy popular cuyas flores se usan en infusión para calmar trastornos digestivos, nervios y como antiinflamatorio suave.","Bulbo (dientes)","1-2 dientes de ajo crudos al día.","Crudo, cocido, cápsulas de aceite de ajo.","Precaución con anticoagulantes e hipoglucemiantes.","Bulbo con un olor y sabor característicos, valorado por sus efectos beneficiosos sobre el sistema cardiovascular y como potente antibiótico natural.","Inhalación de vapor de la decocción de las hojas. Infusión con precaución.","Inhalaciones, aceite esencial (uso externo), ungüentos.","El aceite esencial no debe ser ingerido ni aplicado cerca de la cara de niños pequeños.","Árbol de origen australiano cuyas hojas son ricas en un aceite esencial usado para aliviar los síntomas de resfriados y problemas respiratorios.","Cola de Caballo","Infusión de 2-4 gramos de la planta seca, 2-3 veces al día.","Infusión, decocción, polvo, cápsulas.","No usar por periodos prolongados por su contenido en tiaminasa.","Planta primitiva rica en silicio y otros minerales, utilizada como diurético, para fortalecer uñas y cabello, y para reparar tejidos.","300 mg de extracto estandarizado, 3 veces al día.","Cápsulas, extractos, aceite (uso tópico).","Interactúa con una gran cantidad de medicamentos (antidepresivos, anticonceptivos, anticoagulantes, etc.).","Puede causar fotosensibilidad.","También conocida como Hierba de San Juan, es una planta utilizada para tratar la depresión leve a moderada y para curar heridas y quemaduras.","Infusión, jarabe, aceite esencial.","Hierba aromática con potentes propiedades antisépticas, especialmente útil para tratar infecciones respiratorias y problemas digestivos.","Infusión de 1-2 cucharaditas por taza. Aceite esencial en difusor o diluido para masajes.","Infusión, aceite esencial, saquitos aromáticos.","Planta conocida por su aroma relajante, utilizada en aromaterapia para aliviar el estrés, la ansiedad y el insomnio.","enfermedades- piel","Tilia spp.","Árbol cuyas flores se utilizan en infusión por sus propiedades calmantes y para inducir el sueño.","Diente de León","Infusión de las hojas o decocción de la raíz.","Infusión, decocción, ensaladas (hojas jóvenes).","Obstrucción de las vías biliares.","Considerada a menudo una mala hierba, es una planta muy nutritiva y con excelentes propiedades para depurar el hígado y los riñones.","Vasodilatador periférico","120-240 mg de extracto estandarizado al día, repartido en 2-3 dosis.","Cápsulas, extractos.","Precaución con anticoagulantes y antiplaquetarios.","Árbol milenario cuyas hojas se utilizan para mejorar la circulación cerebral, la memoria y la concentración.","Infusión de 1 cucharadita por taza. Aceite esencial con mucha precaución y diluido.","Infusión, aceite esencial, condimento.","El aceite esencial está contraindicado.","Hierba aromática con un potente aceite esencial rico en carvacrol y timol, de gran poder antiséptico.","Corteza de Sauce","Salix spp.","Decocción de 1-3 gramos de corteza. Extractos estandarizados equivalentes a 60-120 mg de salicina.","Alergia a los salicilatos (aspirina).","No administrar a niños o adolescentes con fiebre por riesgo de síndrome de Reye.","La corteza de varias especies de sauce contiene salicina, el precursor natural de la aspirina, y se usa para aliviar el dolor y la fiebre.","Uso muy restringido y bajo supervisión profesional debido a su toxicidad.","Decocción (uso tradicional, no recomendado).","Sus bayas son muy tóxicas. La planta en general es tóxica y su uso doméstico es peligroso.","Arbusto ornamental navideño cuyas hojas se han usado tradicionalmente como diurético y para bajar la fiebre, aunque es una planta tóxica.","Poleo Menta","Es abortivo, está totalmente contraindicado.","El aceite esencial es muy tóxico para el hígado.","Planta aromática de la familia de la menta, utilizada tradicionalmente para facilitar la digestión y aliviar los gases.","Antianémica","Infusión de las hojas, decocción de la raíz.","Infusión, decocción, sopas, cápsulas.","Planta rica en vitaminas y minerales, conocida por sus pelos urticantes, pero muy apreciada como depurativa, diurética y para combatir la anemia.","Uso exclusivo médico. La dosificación es farmacéutica.","Principios activos (digoxina, digitoxina) extraídos en laboratorio.","Planta extremadamente tóxica. Su uso casero es mortal.","Planta muy venenosa de la que se extraen principios activos utilizados en medicamentos para tratar la insuficiencia cardíaca.","Uso externo del aceite esencial en aromaterapia o diluido.","Aceite esencial, incienso, polvo.","Árbol aromático de la India cuya madera proporciona un aceite esencial muy valorado en perfumería y aromaterapia por su efecto relajante y antiséptico.","Papaver rhoeas","Infusión de los pétalos.","Infusión, jarabe.","Flor silvestre cuyos pétalos se utilizan en infusión como un sedante suave para la tos y el nerviosismo, especialmente en niños.","Infusión de 1-2 cucharaditas de semillas por taza.","Infusión, condimento.","Hierba aromática utilizada como condimento y como remedio para los gases, los cólicos y para estimular la producción de leche materna.","Planta entera (tallo, hojas, semillas)","Consumo como alimento. Jugo o infusión.","Crudo en ensaladas, jugos, caldos, infusión de semillas.","Es un alérgeno relativamente común.","Hortaliza con un sabor característico, apreciada por su efecto diurético y depurativo, ayudando a eliminar líquidos y toxinas.","Infusión de 0.5-1 gramo por taza, antes de las comidas. No usar prolongadamente.","Infusión, tintura.","Es abortivo.","Neurotóxico en dosis altas o uso prolongado por su contenido en tuyona.","Planta muy amarga, utilizada como tónico digestivo para abrir el apetito y para eliminar parásitos intestinales. Es el ingrediente clave de la absenta.","Anestésica local","Extractos estandarizados que proporcionen 60-120 mg de kavalactonas al día.","Bebida tradicional, cápsulas, extractos.","Puede causar daño hepático grave. Prohibido en muchos países.","No mezclar con alcohol u otros depresores del SNC.","Planta de las islas del Pacífico cuya raíz se usa para preparar una bebida ceremonial con efectos relajantes y ansiolíticos.","Uso muy cuidadoso y en dosis bajas. Infusión de 0.5g por taza.","Infusión, aceite (uso externo).","Es un potente abortivo.","Es tóxica para el hígado y puede causar fotosensibilidad severa.","Planta de olor fuerte, utilizada tradicionalmente para regular la menstruación y calmar cólicos, pero es tóxica y su uso es arriesgado.","Uso tópico en cremas, ungüentos o infusiones para lavar heridas.","Infusión, tintura, aceite, cremas.","Sensibilidad a las plantas de la familia de las asteráceas.","Flor de color naranja brillante, también conocida como maravilla, muy apreciada por su capacidad para curar y regenerar la piel.","Cacao","biziáa","bizoya","pizoya","yagabizoya","yagabisoya","yaga-pi-zija","kahau","cacao arisco","cacao común","cacao criollo","cacao dulce","cacao silvestre","cacahua","cacau muyo","cacahua caspi","cacao tree","chocolate tree","cacahuat","xocolatl","Euforizante","Semillas (habas)","Consumo moderado de chocolate negro (>70% cacao) o 1-2 cucharadas de cacao en polvo al día.","Polvo, manteca, chocolate.","Puede causar migrañas en personas sensibles.","Moderar consumo por su contenido de teobromina, similar a la cafeína.","Árbol tropical de cuyas semillas se obtiene el chocolate. Es rico en antioxidantes (flavonoides) y teobromina, un estimulante suave.","raices-y-tuberculos-medicinales","Raíces y tubérculos medicinales","Infusión, decocción, en polvo, fresco","No se recomienda en altas dosis.","Cálculos biliares","Planta aromática con un tallo subterráneo (rizoma) muy apreciado por su sabor picante y sus propiedades medicinales.","1.5-3 gramos de rizoma en polvo al día","Polvo, extracto, infusión","Planta herbácea de la familia del jengibre, cuyo rizoma anaranjado se usa como especia y como antiinflamatorio natural.","Estimulante del sistema nervioso","0.5-2 gramos de raíz seca al día","Insomnio","Raíz carnosa utilizada en la medicina tradicional china para mejorar la vitalidad, la resistencia y la función cognitiva.","9-15 gramos de raíz seca en decocción","Planta leguminosa cuya raíz se utiliza en la medicina tradicional china para fortalecer el sistema inmunológico y proteger el cuerpo del estrés.","Endulzante","5-15 gramos de raíz seca al día","Insuficiencia renal","Planta cuya raíz de sabor dulce se utiliza para tratar afecciones respiratorias, digestivas y de la piel.","2-3 gramos de raíz seca en infusión antes de dormir","Planta con flores rosadas cuya raíz se utiliza para tratar el insomnio, la ansiedad y el estrés.","Raíz y partes aéreas","Planta originaria de América del Norte, utilizada para prevenir y tratar resfriados, gripes y otras infecciones.","2-6 gramos de raíz seca en decocción, 3 veces al día","Planta bianual cuya raíz se utiliza para purificar la sangre, tratar afecciones de la piel y estimular la eliminación de toxinas.","diente-de-leon-raiz","Diente de León (raíz)","achicoria amarga","achicoria amarilla","globillo","lechuguilla","lion\'s-tooth","blowball","cankerwort","faceclock","pee-a-bed","wet-a-bed","Irish daisy","pissy beds","tiddle-beds","wet-the-bed","jack-piss-the-bed","dog\'s posy","swine\'s snout","2-8 gramos de raíz seca en decocción, 3 veces al día","Planta común cuyas raíces amargas se utilizan para estimular la función hepática y renal, y mejorar la digestión.","Fertilidad","Planta andina cuya raíz se utiliza para aumentar la energía, la resistencia, la libido y la fertilidad.","3-6 gramos de polvo de raíz al día","Hipertiroidismo","Puede interactuar con sedantes e inmunosupresores.","Hierba fundamental en la medicina ayurvédica, utilizada para combatir el estrés, mejorar la función cerebral y aumentar los niveles de energía.","sello-de-oro","Sello de Oro","Hydrastis canadensis","hidrastis","sello de oro","cúrcuma canadiense","orangeroot","yellow puccoon","eye root","ground raspberry","tumeric","0.5-1 gramo de raíz seca, 3 veces al día","Decocción, tintura, cápsulas","Planta nativa de América del Norte cuya raíz se usa para infecciones de las mucosas.","Planta aromática utilizada para trastornos digestivos, problemas respiratorios y como tónico general.","0.2-1 gramo para efecto laxante; 2-4 gramos para efecto purgante.","No usar en niños menores de 12 años.","Obstrucción intestinal, enfermedad de Crohn, colitis ulcerosa.","Planta con grandes hojas y tallos comestibles, cuyo rizoma se usa como laxante potente.","Malvavisco","Althaea officinalis","altea","bismalva","hierba cañamera","malvarisco","malavadisco","maldevisco","malobispo","malovisco","common marshmallow","2-5 gramos de raíz seca en maceración o decocción","Maceración en frío, decocción, jarabe","Planta cuyas raíces ricas en mucílago se usan para calmar la irritación de las mucosas del sistema digestivo y respiratorio.","Osha","Ligusticum porteri","chuchupate","chuchupati","hierba de cochino","Porter\'s lovage","bear root","loveroot","wild parsley","Indian parsley","chuchupa\'at","1-2 gramos de raíz seca en decocción","Decocción, tintura, masticar la raíz","Raíz sagrada para muchas tribus nativas americanas, utilizada para tratar infecciones respiratorias y fortalecer el sistema inmunológico.","calamo-aromatico","Cálamo Aromático","Acorus calamus","ácoro dulce","ácoro aromático","cálamo acuático","ácoro verdadero","muskrat root","calamus","La variedad norteamericana es segura; la europea y asiática pueden contener beta-asarona, un compuesto potencialmente tóxico y carcinógeno. Usar con precaución.","Planta acuática cuyo rizoma aromático se ha utilizado tradicionalmente para problemas digestivos y para mejorar la claridad mental.","Genciana","Gentiana lutea","junciana","xanzaina","chonzana","genciana amarilla","genciana mayor","yellow gentian","bitter root","bitterwort","Sialagoga","0.5-1 gramo de raíz seca antes de las comidas","Úlcera gástrica o duodenal, hiperacidez.","Planta de montaña con una raíz muy amarga, utilizada para estimular el apetito y la digestión.","rabano-picante","Rábano Picante","Armoracia rusticana","rábano rusticano","rábano de caballo","rábano picante","raíz picante","pepper root","pepper turnip","stingnose","Fresco rallado, en salsas","Hipotiroidismo, úlceras gastrointestinales, enfermedad renal.","Raíz de sabor fuerte y picante, utilizada como condimento y para despejar los senos nasales y estimular la circulación.","Yucca schidigera","Saponinas","Extractos estandarizados según fabricante.","Extracto, cápsulas, polvo","Planta del desierto cuya raíz es rica en saponinas, compuestos con potentes propiedades antiinflamatorias, utilizada para la artritis y el reumatismo.","Batata","Ipomoea batatas","apichu","sweet potato","camohtli","agcum","becua","bengua\'ma","camoj","Reguladora del azúcar","Cocida, asada, al vapor","Tubérculo dulce y nutritivo, rico en betacarotenos (vitamina A), fibra y antioxidantes. Beneficioso para la vista, la piel y el sistema inmune.","Remolacha","Beta vulgaris","acelga","betabel","leaf beet","red beet","Antihipertensiva","Consumo como alimento o zumo.","Tendencia a formar cálculos renales de oxalato.","Raíz de color rojo intenso, conocida por su capacidad para mejorar la salud del hígado, reducir la presión arterial y aumentar la resistencia física.","Zanahoria","Daucus carota","acenoria","azenoria","bufanagas","carrota","bird\'s nest","bishop\'s lace","Rica en Vitamina A","Raíz crujiente y dulce, famosa por su alto contenido de betacarotenos, esenciales para una buena visión y una piel sana.","Nabo","Brassica rapa","berza","naba","raba","rábano blanco","pata de cuervo","semilla para pájaros","vaina","flor de nabo","nabo de canarios","nabo silvestre","nabolza","bird\'s-rape","Cocido, en caldos, purés","Raíz de sabor ligeramente picante, utilizada tradicionalmente para aliviar la tos y los resfriados, y por sus propiedades diuréticas.","chirivia","Chirivía","Pastinaca sativa","chirivía","pastinaca","apio de campo","zanahoria blanca","wild parsnip","Cocida, asada, en purés","Raíz similar a la zanahoria pero de color blanco y sabor más dulce y anisado. Es diurética y ayuda a regular la presión arterial.","Apionabo","Apium graveolens var. rapaceum","apio nabo","apio rábano","celery root","Crudo en ensaladas, cocido, en purés","Insuficiencia renal grave.","Variedad de apio cuya raíz grande y bulbosa se consume. Tiene un sabor intenso y es un potente diurético y depurativo.","rabano","Rábano","Raphanus sativus","rábano","rabaneta","rabanete","rabanito","nabón","jaramao","wild radish","garden radish","coo-guiña-nagali","gu-gila-ztilla","Consumo como alimento o en zumo.","Crudo, en ensaladas, zumo","Hipotiroidismo (consumo excesivo).","Raíz pequeña y picante, especialmente el rábano negro, que estimula la producción y flujo de bilis, ayudando a la función hepática y de la vesícula.","colirrabano","Colirrábano","Brassica oleracea var. gongylodes","colirrábano","col rábano","colinabo","German turnip","turnip cabbage","Tallo engrosado (tubérculo aéreo)","Crudo, cocido, asado","Variedad de col cuyo tallo se engrosa formando un tubérculo sobre la superficie del suelo. Es crujiente y jugoso, rico en vitamina C.","Tupinambo","Helianthus tuberosus","topinambur","alcachofa de Jerusalén","girasol de Canadá","aguaturma","bataca","sunchoke","sunroot","earth apple","tupinambá","Prebiótico (rico en inulina)","Bajo índice glucémico","Cocido, asado, en purés","Puede causar flatulencia en personas no acostumbradas a la inulina.","También conocido como alcachofa de Jerusalén, es un tubérculo rico en inulina, un prebiótico que alimenta la flora intestinal y ayuda a regular el azúcar en sangre.","Arracacha","Arracacia xanthorrhiza","arracache","apio criollo","racacha","virraca","Peruvian parsnip","white carrot","rakacha","laquchu","huiasampilla","lakachu","lecachu","Cocida, en sopas, purés","Raíz tuberosa andina de sabor similar a una mezcla de apio, zanahoria y castaña. Es muy digestiva y nutritiva, ideal para niños y ancianos.","Ulluco","Ullucus tuberosus","chugua","ruba","olluco","papa lisa","ulluku","illaku","milluku","Cocido, en sopas, guisos","Tubérculo andino de colores vivos y textura mucilaginosa. Es nutritivo y se le atribuyen propiedades cicatrizantes y antiinflamatorias.","Oca","Oxalis tuberosa","ibia","papa oca","apiha","apiña","apilla","arrachaca","cavi","uqa","kawi","lamaki","timbo","quiba","huisisaj","Ligeramente laxante","Cocida, asada, frita (previamente soleada para reducir acidez)","Alto contenido de oxalatos, no recomendado para personas con problemas renales o gota.","Tubérculo andino de sabor ácido que se vuelve más dulce al exponerlo al sol. Es una buena fuente de energía y antioxidantes.","Mashua","Tropaeolum tuberosum","cubio","navios","navo","puel","majua","tuberous nasturtium","mashwa","apiñu","apiña-mama","yanaoca","isau","kkayacha","Anterógeno (reduce la testosterona)","Cocida, en sopas, guisos","No recomendado para hombres que deseen tener hijos por su efecto anterógeno.","Tubérculo andino con un sabor picante y floral. Se le conoce por sus propiedades antibacterianas y por reducir los niveles de testosterona.","Taro","Colocasia esculenta","ñame","achín","bore morado","chícalo","chícol","chícolo","chicul","pituca","bituca","mayro","onkucha","yautía coco","ñampí","dasheen","coco-yam","eddo","kalo","Hipoalergénico","Cormo (tubérculo)","Consumo como alimento, siempre cocido.","Cocido, al vapor, en purés (NUNCA CRUDO por su toxicidad)","El cormo crudo es tóxico debido a los cristales de oxalato de calcio.","Tubérculo tropical básico en muchas culturas. Es nutritivo, fácil de digerir y una buena fuente de carbohidratos complejos.","Tónico del Bazo (MTC)","Antidiaforético","6-12 gramos en decocción.","En casos de sequedad o deficiencia de líquidos corporales.","Hierba importante en la Medicina Tradicional China (MTC) para tonificar el Bazo, mejorar la digestión, eliminar la humedad y detener la sudoración excesiva.","Tónico de Qi","Tónico pulmonar","9-30 gramos en decocción.","Decocción, en sopas","Conocida como el \\"ginseng de los pobres\\", es una raíz tónica suave utilizada en MTC para aumentar la energía (Qi), fortalecer los pulmones y el sistema inmune.","rehmannia","Rehmannia","Rehmannia glutinosa","Tónico de la sangre y del Yin","Raíz (preparada y cruda)","Dificil de digerir, usar con precaución en personas con debilidad digestiva.","Raíz fundamental en MTC para nutrir la sangre y el Yin, tratar trastornos hormonales, enfermedades autoinmunes y problemas relacionados con el envejecimiento.","peonia-blanca","Peonía Blanca","peonía híbrida","Reguladora menstrual","6-15 gramos en decocción.","Usar con precaución.","La raíz de peonía blanca se usa en MTC para nutrir la sangre, calmar el dolor (especialmente ginecológico y muscular), y suavizar el hígado.","1-3 gramos de rizoma seco.","Decocción, polvo, en la cocina","Úlcera péptica activa.","Rizoma de la familia del jengibre con un sabor picante y alcanforado. Se utiliza para problemas digestivos, náuseas y para mejorar la circulación.","sarsaparrilla","Smilax officinalis","1-4 gramos de raíz seca en decocción, 3 veces al día.","Decocción, tintura","Insuficiencia renal.","Raíz utilizada tradicionalmente para \\"limpiar la sangre\\", tratar afecciones de la piel como la psoriasis y el eccema, y para el reumatismo y la gota.","manioc","Sin gluten","Fuente de Vitamina C","Consumo como alimento, siempre cocida.","Hervida, frita, asada, en harina (tapioca). NUNCA CRUDA.","La variedad amarga contiene altos niveles de precursores de cianuro y debe ser procesada adecuadamente para eliminar la toxicidad.","También conocida como yuca o casava, es una raíz tuberosa fundamental en la alimentación de muchas regiones tropicales. Es una excelente fuente de carbohidratos.","Crosne","Stachys affinis","alcachofa china","Japanese artichoke","Ligeramente dulce","Textura crujiente","Baja en calorías","Salteado, al vapor, encurtido","Pequeño tubérculo de forma peculiar y textura crujiente, similar a una alcachofa o una castaña de agua. Se consume como una hortaliza gourmet.","Antifatiga","2-3 gramos de raíz seca al día.","No usar en personas con presión arterial por encima de 180/90 mmHg.","Conocido como Ginseng Siberiano, es un arbusto cuya raíz se utiliza para aumentar la resistencia al estrés, combatir la fatiga y mejorar la concentración.","cimicifuga","Cimicífuga","Actaea racemosa","cimicífuga","cohosh negro","black bugbane","black snakeroot","Regulador hormonal (estrogénico)","Alivio de síntomas menopáusicos","Extractos estandarizados (generalmente 40-80 mg al día).","Extracto, cápsulas, tintura","Enfermedades hepáticas.","Consultar al médico si se toman terapias hormonales.","También conocida como cohosh negro, es una planta cuya raíz se usa principalmente para aliviar los síntomas de la menopausia, como los sofocos y los cambios de humor.","Polygala","Polygala tenuifolia","Seneca snakeroot","Tónico cerebral","Restaurador del Shen (MTC)","3-9 gramos en decocción.","En casos de úlcera gástrica.","Raíz utilizada en MTC para calmar el espíritu (Shen), mejorar la memoria y la función cognitiva, y como un potente expectorante para eliminar la flema de los pulmones.","flores-medicinales","Flores medicinales","1-2 cucharaditas de flores secas por taza de agua.","Puede causar reacciones alérgicas en personas sensibles a la familia de las margaritas.","Consultar al médico antes de usar durante el embarazo.","Hierba aromática con flores blancas y amarillas, conocida por sus propiedades calmantes y digestivas.","Uso tópico en forma de cremas, ungüentos o infusiones para compresas.","Infusión, aceite, crema","Personas alérgicas a las plantas de la familia Asteraceae pueden ser sensibles.","Planta con flores de color naranja brillante, muy apreciada por sus beneficios para la piel.","Aceite esencial para aromaterapia o masajes; infusión de 1 cucharadita de flores por taza.","Aceite esencial, infusión, saquitos aromáticos","El aceite esencial no debe ingerirse sin supervisión profesional.","Arbusto con flores de color violeta muy aromáticas, famoso por sus efectos relajantes y su agradable fragancia.","rosa","Rosa","Rosa gallica","rosa de Damasco","rosa de Castilla","rosal de Alejandría","Bulgarian rose","Tónico para la piel","Agua de rosas para uso tópico; infusión de 1-2 cucharaditas de pétalos secos.","Agua de rosas, infusión, aceite esencial","Además de su belleza y aroma, los pétalos de rosa tienen propiedades beneficiosas para la piel y el sistema nervioso.","jazmin","Jazmín","Jasminum officinale","jazmín común","jazmín morisco","jazmín blanco","jazmín de España","jazmín de poeta","common jasmine","poet\'s jasmine","white jasmine","summer jasmine","true jasmine","Aceite esencial en aromaterapia; infusión de flores secas.","Evitar su uso en grandes cantidades durante el embarazo.","Flores blancas muy fragantes con un potente efecto relajante sobre el sistema nervioso, ideal para la ansiedad y el insomnio.","hibisco","Hibisco","Hibiscus sabdariffa","agrio de Guinea","saril","red sorrel","Jamaica sorrel","Cálices de las flores","Infusión (Agua de Jamaica)","Puede bajar demasiado la presión arterial en personas hipotensas.","Sus cálices rojos se usan para preparar una bebida refrescante con propiedades para controlar la presión arterial y el colesterol.","Infusión de 2-4 gramos de flores secas por taza, varias veces al día.","Pequeñas flores blancas agrupadas en corimbos, tradicionalmente usadas para tratar resfriados, gripes y problemas respiratorios.","tilo-flor","Tilo Flor","pry tree","Infusión de 1-2 cucharaditas por taza, antes de dormir.","Infusión (Tila)","Las flores del tilo son un remedio clásico para el nerviosismo, la ansiedad y el insomnio, gracias a su suave efecto sedante.","azahar","Azahar","naranja de Sevilla","apepú","marmalade orange","Hipnótico suave","Infusión de 1 cucharadita por taza; agua de azahar en repostería o diluida.","Infusión, agua de azahar, aceite esencial (neroli)","La flor del naranjo amargo es famosa por su aroma y sus propiedades para calmar los nervios, la ansiedad y facilitar el sueño.","Partes aéreas (flores y hojas)","Infusión de 1-2 gramos por taza; extracto líquido o cápsulas según indicación.","Puede potenciar el efecto de otros sedantes o antidepresivos.","Conocida como flor de la pasión, es uno de los mejores remedios para el insomnio de origen nervioso y la ansiedad.","Amapola de California","Eschscholzia californica","Infusión de 1-2 cucharaditas por taza antes de acostarse.","No usar durante el embarazo, lactancia ni en niños pequeños.","No combinar con otros sedantes sin supervisión médica.","A diferencia de su pariente la adormidera, esta amapola tiene un efecto sedante suave y no adictivo, útil para el insomnio y el nerviosismo.","Violeta","Viola odorata","violeta común","violeta de olor","viola","violeta morada","English violet","garden violet","wood violet","Jarabe para la tos; infusión de 1 cucharadita de flores por taza.","Sus flores y hojas son un remedio tradicional para afecciones respiratorias como la tos, el resfriado y la bronquitis.","Infusión de 1 cucharada por taza; gargarismos para la garganta.","Infusión, gargarismos, cataplasma","Rica en mucílagos, la malva suaviza y protege las mucosas respiratorias y digestivas, aliviando la irritación.","Árnica","Arnica montana","árnica","tabaco de montaña","mountain tobacco","leopard\'s bane","Antiequimótica (reduce moratones)","Uso estrictamente externo. Aplicar en forma de gel, crema o tintura diluida.","Gel, crema, tintura, aceite de masaje","Planta tóxica si se ingiere. No aplicar sobre heridas abiertas.","Es el remedio por excelencia para golpes, contusiones, esguinces y dolores musculares, gracias a su potente acción antiinflamatoria.","Flores, hojas y raíz","Cápsulas o extractos estandarizados según indicación para prevención o tratamiento.","Cápsulas, extracto, tintura, infusión","No se recomienda su uso prolongado (más de 8 semanas). Evitar en enfermedades autoinmunes.","Una de las plantas más eficaces para aumentar las defensas y prevenir o tratar infecciones, especialmente resfriados y gripes.","girasol","Girasol","pipas de girasol","maíz de teja","acahual","mirasol","jáquima","tlapololote (náhuatl)","Pétalos (lígulas) y semillas","Infusión de los pétalos para la fiebre. Semillas como alimento nutritivo.","Infusión, decocción de semillas","Alergia a las semillas de girasol es común.","Aunque es más conocido por sus semillas, los pétalos de sus flores se han usado tradicionalmente para bajar la fiebre y aliviar resfriados.","Infusión de flores para resfriados. Aceite de semillas para la piel y síndrome premenstrual.","Infusión, aceite de semillas","No se recomienda su consumo durante el embarazo por contener alcaloides.","Sus flores azules son ricas en mucílagos y se usan en infusión para provocar la sudoración en estados febriles y resfriados.","Antiséptica urinaria","Consumir fresca en ensaladas; infusión de 1 cucharada por taza.","Consumo directo (ensaladas), infusión","Puede ser irritante para el estómago en personas sensibles.","Tanto sus flores como sus hojas tienen un sabor picante y se consideran un potente antibiótico natural para las vías respiratorias y urinarias.","clavel","Clavel","Dianthus caryophyllus","clavel común","gillyflower","Cardiotónico suave","Infusión de los pétalos para el agotamiento nervioso.","Los pétalos del clavel se han utilizado en forma de jarabe o infusión como un tónico suave para el corazón y el sistema nervioso.","crisantemo","Crisantemo","Chrysanthemum morifolium","crisantemo de la China","flor de Roma","florist\'s chrysanthemum","garden mum","florist\'s daisy","Refrigerante","Antihipertensivo","Detoxificante (hígado)","Infusión de 5-10 flores por taza.","Puede causar alergia en personas sensibles a las compuestas.","En la medicina tradicional china, la infusión de flores de crisantemo se usa para \'enfriar\' el cuerpo, bajar la fiebre, aliviar el dolor de cabeza y proteger los ojos.","Margarita","Bellis perennis","chiribita","vellorita","common daisy","English daisy","Infusión de 1-2 cucharaditas por taza; uso externo en compresas.","Infusión, compresas","La humilde margarita tiene propiedades para aliviar la tos y los resfriados, y externamente se usa para curar pequeñas heridas y contusiones.","Astringente suave","Infusión para baños oculares (agua de aciano).","Infusión (para uso externo)","Las flores azules del aciano son el remedio tradicional para los ojos cansados, irritados o inflamados, en forma de baños o compresas.","loto","Loto Sagrado","pink lotus","Tónico cardíaco","Flores, semillas, rizoma","Infusión de flores o decocción de semillas/rizoma.","Planta sagrada en Oriente, todas sus partes tienen usos medicinales. Las flores se usan por sus propiedades sedantes y para la fiebre.","Pensamiento","Viola tricolor","trinitaria","wild pansy","Antiinflamatoria cutánea","Infusión, cápsulas","Es una de las plantas depurativas más importantes para los problemas de la piel, como el acné, los eccemas o la psoriasis.","Primavera","Primula veris","primrose","Secretolítica","Flores y raíz","Infusión de las flores (1 cucharadita/taza) para la tos y nervios. Decocción de la raíz como expectorante más potente.","Puede causar alergia en personas sensibles a las prímulas.","Sus flores amarillas son un remedio eficaz para la tos con mucosidad, la bronquitis y los resfriados. También calma la ansiedad.","No usar en caso de alergia a los salicilatos (aspirina).","Precaución si se toman anticoagulantes.","Conocida como la \'aspirina vegetal\' por su contenido en salicilatos, es excelente para dolores articulares, fiebre y gripe.","Zinnia","Zinnia elegans","rosa mística","youth-and-age","Antifúngica","Uso tradicional en forma de emplastos o infusiones para lavados.","Emplasto, infusión para lavado","En la medicina popular de algunas regiones de México, se ha utilizado como remedio para infecciones de la piel por hongos y bacterias.","Dalia","Dahlia coccinea","Tubérculos y flores","Decocción de los tubérculos o infusión de los pétalos.","Originaria de México, los aztecas ya usaban sus tubérculos para tratar la epilepsia. Hoy se investigan sus propiedades para regular el azúcar en sangre.","geranio","Geranio","Pelargonium graveolens","geranio de olor","geranio de rosa","rose geranium","old-fashioned rose geranium","rose-scent geranium","Hojas y flores (para aceite esencial)","Aceite esencial diluido para uso tópico en piel y hemorragias nasales leves.","El aceite esencial de geranio es muy versátil, se usa para equilibrar la piel grasa, frenar pequeñas hemorragias y como equilibrante emocional.","Magnolia officinalis","Corteza y capullos florales","Decocción de la corteza o infusión de los capullos.","Puede potenciar sedantes. Consultar al médico.","La corteza de magnolia es un remedio importante en la medicina china para la ansiedad, la depresión y el estrés, sin el efecto sedante de otras plantas.","peonia","Peonía","Reguladora hormonal (femenina)","Raíz (principalmente) y flores","Decocción de la raíz. Las flores se usan menos, en infusión.","La raíz de peonía blanca (Bai Shao) es fundamental en ginecología china para calmar los dolores menstruales y regular el ciclo.","Tanacetum parthenium","Antimigrañoso","Cápsulas de polvo estandarizado para la profilaxis de la migraña.","Cápsulas, infusión","Alergia a las compuestas.","También conocida como matricaria, es la planta más estudiada y eficaz para prevenir la aparición de las crisis de migraña.","Verbena","Verbena officinalis","hierba sagrada","holy herb","Digestiva (amarga)","Infusión, tintura","Evitar en el primer trimestre del embarazo.","Considerada una planta mágica en la antigüedad, la verbena es un excelente tónico para el sistema nervioso agotado, la ansiedad y el estrés.","Milenrama (Yarrow)","Infusión para uso interno o externo. Polvo de la planta seca sobre heridas.","Infusión, polvo, aceite esencial","Alergia a la familia de las Asteráceas.","Su nombre \'Achillea\' hace referencia a Aquiles, que la usaba para curar las heridas de sus soldados. Es excelente para cortar hemorragias.","Clitoria (Butterfly Pea)","Clitoria ternatea","blue pea","pigeon wings","Nootrópica (mejora la memoria)","Infusión de 5-10 flores. El color azul intenso es característico.","Infusión (Té azul)","Sus llamativas flores azules se usan para hacer un té que mejora las funciones cognitivas, la memoria y el estado de ánimo.","Regulador del ritmo cardíaco","Sumidades floridas (flores y hojas jóvenes)","Infusión de 1-2 cucharaditas por taza, 2-3 veces al día. Tratamientos largos.","Consultar al médico si se toman medicamentos para el corazón (ej. digoxina).","Es la planta por excelencia para el corazón. Tonifica el músculo cardíaco, regula la tensión y el ritmo, y calma las palpitaciones de origen nervioso.","Conos o flores femeninas (estróbilos)","Infusión de 1-2 conos por taza antes de dormir. También en extractos o cápsulas.","Infusión, extracto, almohadas herbales","Evitar en casos de depresión. No recomendado en niños o durante el embarazo.","Más allá de dar el amargor a la cerveza, las flores de lúpulo son un potente sedante, ideal para el insomnio, especialmente si se combina con valeriana.","Meliloto","Melilotus officinalis","trébol de olor","sweet clover","yellow melilot","Tónico venoso","Infusión de 1 cucharadita por taza. Uso externo en compresas para la circulación.","Infusión, extracto, compresas","No combinar con otros anticoagulantes (Sintrom, heparina) sin estricto control médico.","Mejora la circulación venosa, previene la formación de trombos y alivia los síntomas de las varices y las piernas cansadas.","Infusión de 1 cucharadita de flores por taza. Colar muy bien para retirar los pelillos irritantes.","Infusión (bien colada), jarabe","Es una de las mejores plantas para las afecciones respiratorias. Suaviza la garganta, calma la tos y ayuda a expulsar la mucosidad.","Infusión, jarabe, aceite esencial (uso con precaución)","No usar durante el embarazo. El aceite esencial es neurotóxico y no debe ingerirse.","Planta bíblica usada para purificar. Es un excelente remedio para la tos, la bronquitis y los resfriados, especialmente de origen vírico como la gripe.","jazmin-amarillo","Jazmín Amarillo (Gelsemium)","Gelsemium sempervirens","jazmín amarillo","gelsemio","evening trumpetflower","Carolina jessamine","Analgésico neural","Antigripal","Rizoma y raíces (uso homeopático)","Planta altamente tóxica. Solo se usa en diluciones homeopáticas bajo prescripción.","Homeopatía","VENENOSA. Su uso directo es mortal. Solo apta para preparación homeopática por profesionales.","A pesar de su toxicidad, en homeopatía es un remedio clave para estados gripales con gran postración, dolores de cabeza y neuralgias.","lirio-de-los-valles","Lirio de los Valles (Muguete)","Convallaria majalis","lirio de los valles","convalaria","muguete","Planta altamente tóxica. Su uso es exclusivamente farmacéutico para extraer glucósidos cardíacos.","Uso farmacéutico","VENENOSA. Causa parada cardíaca si se ingiere. No usar de forma casera bajo ningún concepto.","Similar a la digital, contiene potentes tónicos para el corazón, pero su alta toxicidad la hace apta solo para la industria farmacéutica.","digitalis","Planta altamente tóxica. De ella se extrae la digoxina, un fármaco de estrecho margen terapéutico.","Uso farmacéutico (Digoxina)","VENENOSA. Su ingesta es mortal. Su uso es exclusivamente médico hospitalario.","La planta medicinal cardiotónica por excelencia, pero también una de las más venenosas. Su uso ha salvado millones de vidas en forma de fármaco.","30 mg al día de extracto estandarizado para la depresión. Como especia, con moderación.","Extracto, especia (infusión)","Abortivo en dosis altas. Evitar durante el embarazo.","La especia más cara del mundo es también un potente antidepresivo natural, con una eficacia comparable a algunos fármacos de síntesis.","Onagra","Oenothera biennis","Nutritivo para la piel","Semillas (aceite)","Perlas de aceite de onagra (500-1000 mg al día) según indicación.","Aceite (perlas)","Precaución en personas con epilepsia.","El aceite de sus semillas es rico en ácidos grasos omega-6, siendo el remedio más popular para el síndrome premenstrual y los problemas de la menopausia.","cempasuchil","Cempasúchil","Tagetes erecta","damasquina","flor de muertos","clavel de las Indias","Aztec marigold","Mexican marigold","cempōhualxōchitl","Carotenoide (luteína)","Infusión de los pétalos para cólicos. Extracto de luteína para la salud ocular.","La flor de muertos mexicana se usa tradicionalmente para aliviar dolores de estómago. Además, es la principal fuente comercial de luteína, un antioxidante vital para la retina.","Tónico digestivo (amargo)","Raíz, semillas y hojas","Decocción de la raíz o infusión de las hojas/semillas antes de las comidas.","Decocción, infusión, tintura","Considerada la \'hierba de los ángeles\', es un potente tónico para todo el sistema digestivo, abriendo el apetito y aliviando los gases y espasmos.","centaurea-menor","Centaurea Menor","Centaurium erythraea","centaurea menor","hiel de la tierra","common centaury","Estimulante del apetito","Infusión de 0.5-1g por taza, 30 minutos antes de las comidas.","Infusión, tintura, vino tónico","Evitar en caso de gastritis o úlcera péptica por el aumento de jugos gástricos.","Una de las plantas más amargas de la flora europea. Este amargor la hace un remedio excelente para la falta de apetito y las digestiones pesadas.","hongos-medicinales","Hongos medicinales","1-3 gramos de extracto en polvo al día.","Decocción, extracto en polvo o tintura.","Puede interactuar con anticoagulantes e inmunosupresores.","No se recomienda su uso antes de una cirugía.","Conocido como el \\"hongo de la inmortalidad\\", el Reishi es venerado por su capacidad para fortalecer el sistema inmunológico y reducir el estrés.","shiitake","Lentinula edodes","Seta china","hongo del árbol shii","black mushroom","XiangGu (chino)","6-16 gramos de hongo seco al día.","Consumo directo en comidas, decocción o extracto.","Puede causar dermatitis en personas sensibles.","Además de su uso culinario, el Shiitake es valorado por sus propiedades antivirales y su capacidad para mejorar la salud cardiovascular.","Extracto, decocción o consumo directo.","El Maitake es conocido por su capacidad para regular los niveles de azúcar en sangre y fortalecer la respuesta inmune.","Mejora del rendimiento atlético","1-3 gramos al día.","Puede empeorar enfermedades autoinmunes.","El Cordyceps es famoso por aumentar la energía, la resistencia y la libido, siendo muy popular entre atletas.","melena-de-leon","Melena de León","Hericium erinaceus","Melena de león","lion\'s mane","bearded tooth fungus","bearded hedgehog","satyr\'s beard","pom-pom mushroom","monkey head mushroom","bearded tooth","tree hedgehog fungus","yamabushitake","Noótropo","Regenerador nervioso","Extracto, cápsulas o consumo directo.","Este hongo es único por su capacidad para estimular el crecimiento de neuronas y mejorar la función cognitiva.","Decocción (típicamente como un té) o tintura.","El Chaga es un potente antioxidante que crece en los abedules, utilizado para proteger las células del daño y reducir la inflamación.","cola-de-pavo","Cola de Pavo","Trametes versicolor","Cola de pavo","Kawaratake (japonés)","Yun-zhi (chino)","Prebiótico","Decocción, cápsulas o extracto.","La Cola de Pavo es uno de los hongos medicinales más investigados por su capacidad para modular el sistema inmune, especialmente en el tratamiento del cáncer.","agarikon","Fomitopsis officinalis","Agárico blanco","Agárico yesquero","Falsa yesca","Quinine Conk","Larch Bracket Mushroom","Brown Trunk Rot","Ardagai (euskera)","500mg-1g de extracto al día.","Extracto o tintura.","Conocido por su potente actividad antiviral y antibacteriana, el Agarikon ha sido utilizado tradicionalmente para combatir infecciones.","tremella","Tremella","Tremella fuciformis","Hongo blanco","Hongo de la oreja plateada","Hongo de nieve","Oreja de las nieves","Oreja de plata","Hongo gelatinoso blanco","Oreja blanca de las nubes","snow ear","silver ear fungus","white jelly mushroom","white cloud ears","Bai mu er (chino)","Hidratante de la piel","Consumo directo en sopas, postres o como extracto.","La Tremella es conocida como el \\"hongo de la belleza\\" por su capacidad para hidratar la piel y mejorar su elasticidad.","poria-cocos","Poria Cocos","Wolfiporia extensa","hoelen","poria","tuckahoe","China root","Indian bread","fu ling","matsuhodo","Decocción o extracto en polvo.","Utilizado en la medicina tradicional china para eliminar la humedad del cuerpo, calmar la mente y fortalecer el sistema digestivo.","agaricus-blazei","Agaricus Blazei","Agaricus subrufescens","champiñón del sol","seta de Dios","hongo de la vida","almond mushroom","God\'s mushroom","mushroom of life","royal sun agaricus","sun mushroom","himematsutake","Cogumelo do Sol","1.5-3 gramos de extracto al día.","Este hongo es muy apreciado por su potente efecto sobre el sistema inmunológico, ayudando a combatir infecciones y alergias.","enoki","Flammulina velutipes","Seta de aguja de oro","Seta de llama","velvet foot","velvet stem","velvet shank","wild enoki","golden needle mushroom","lily mushroom","Velvet shank","winter mushroom","Enokitake (japonés)","El Enoki no solo es un ingrediente popular en la cocina asiática, sino que también posee propiedades que fortalecen el sistema inmune.","hongo-ostra","Hongo Ostra","Pleurotus ostreatus","gírgola","seta de ostra","champiñón ostra","pleuroto ostra","orellana","pearl oyster mushroom","tree oyster mushroom","hiratake","El hongo ostra es valorado por su capacidad para reducir los niveles de colesterol y su alto contenido de antioxidantes.","polyporus-umbellatus","Polyporus Umbellatus","Polyporus umbellatus","Poliporo en sombrilla","lumpy bracket","1-2 gramos de extracto al día.","Se utiliza para promover la micción y reducir el edema sin perder potasio, además de apoyar la salud del sistema linfático.","schizophyllum-commune","Schizophyllum Commune","Schizophyllum commune","splitgill mushroom","common split gill","split gill","Varía según la preparación.","Extracto o decocción.","Este hongo produce un polisacárido llamado esquizofilano, que ha demostrado tener potentes propiedades antitumorales e inmunomoduladoras.","auricularia-auricula","Oreja de Judas","Auricularia auricula-judae","oreja de Judas","oreja de lana","oreja de judío","wood ear","Jew\'s ear","tree ear","Judas\'s ear","Hei Mu Er","Mu Er","No consumir con anticoagulantes.","Conocido por su textura gelatinosa, se usa en la cocina y en la medicina para mejorar la circulación y la hidratación.","coprinus-comatus","Coprinus Comatus","Coprinus comatus","Barbuda","Seta de tinta","lawyer\'s wig","Consumo directo (cocinado rápidamente) o extracto.","Este hongo, también conocido como \\"barbuda\\", ha mostrado capacidad para regular los niveles de azúcar en sangre.","fomes-fomentarius","Hongo del Yesquero","Fomes fomentarius","hongo yesca","hongo yesquero","hongo pata de caballo","casco de caballo","bolet désca","tinder fungus","false tinder fungus","hoof fungus","tinder conk","tinder polypore","ice man fungus","amadou","supizteko ardagai","ardagai-yesca","ardagai gorria","karduba","kardakiya","ardoa","ardai","eska","iesca","Uso tópico o en decocción.","Tradicionalmente usado como yesca y para detener sangrados.","Históricamente, este hongo se ha utilizado como yesca para iniciar fuegos y en medicina popular como agente hemostático y antiinflamatorio.","ganoderma-applanatum","Ganoderma applanatum","Yesquero aplanado","artist\'s bracket","artist\'s conk","bear bread","white mottled rot","ardagai zapal","Pariente del Reishi, este hongo perenne se utiliza para aliviar el dolor y combatir la inflamación y tumores.","phellinus-linteus","Phellinus Linteus","Phellinus linteus","Meshima","black hoof mushroom","meshimakobu","song gen","sanghwang","Muy valorado en la medicina asiática, se investiga por su potente efecto estimulante del sistema inmune y su actividad contra el cáncer.","pleurotus-eryngii","Seta de Cardo","Pleurotus eryngii","Seta de cardo","King trumpet mushroom","king oyster mushroom","King oyster mushroom","Además de su excelente sabor, la seta de cardo ayuda a mantener niveles saludables de colesterol y combate el estrés oxidativo.","sparassis-crispa","Hongo Coliflor","Sparassis crispa","Seta coliflor","Cauliflower mushroom","Cauliflower fungus","Consumo directo o extracto.","Este hongo, que parece una coliflor, es conocido por estimular la producción de colágeno y la cicatrización de heridas, además de sus propiedades inmunitarias.","laetiporus-sulphureus","Pollo de los Bosques","Laetiporus sulphureus","Pollo de los bosques","cangrejo de los bosques","plataforma de azufre","políporo azufrado","seta tornillo","chicken of the woods","sulphur polypore","sulphur shelf","crab-of-the-woods","chicken mushroom","chicken fungus","ardagai hori","gírgola groga","Consumo directo, bien cocinado.","Debe cocinarse bien; puede causar malestar gastrointestinal si está crudo o si crece en ciertos árboles.","Conocido por su sabor similar al pollo, este hongo también posee propiedades antibacterianas y antioxidantes.","suillus-luteus","Boleto Anillado","Suillus luteus","boleto anillado","babosillo","hongo amarillo","boleto anillado viscoso","slippery jack","sticky bun","pinudi-onddo likin","pinetell","molleric de calceta","andoa anelada","corvall en aret","Dermatológico","Consumo directo, quitando la cutícula viscosa.","La cutícula puede ser laxante o causar alergias en algunas personas.","Este boleto comestible es apreciado en la cocina y se le atribuyen propiedades beneficiosas para la piel y contra la inflamación.","cantharellus-cibarius","Cantharellus cibarius","Cantarela","Anacate","Chantarela","Duraznillo","golden chanterelle","Vitamínico (Vit D y B)","Este popular hongo silvestre no solo es delicioso, sino que también es una buena fuente de vitaminas y compuestos con actividad antimicrobiana.","craterellus-cornucopioides","Trompeta de los Muertos","Craterellus cornucopioides","Trompeta de los muertos","cuerno de la abundancia","trompeta negra","black chanterelle","black trumpet","trumpet of the dead","Mineralizante","Consumo directo o seco como condimento.","A pesar de su nombre, es un hongo comestible muy apreciado, rico en minerales y con un sabor ahumado único.","morchella-esculenta","Morchella esculenta","cagarria","morilla","carcarria","crespilla","murúgula","colmenilla gris","seta de cuaresma","bresquilla","common morel","morel","yellow morel","true morel","morel mushroom","sponge morel","karraspina arrunt","múrgula grisa","múrgula","xirupato","orellazos","esclatasanc camelit","Consumo en la dieta, siempre cocinada.","Consumo directo, bien cocinada.","Tóxica si se consume cruda.","Las colmenillas son un manjar culinario que también ofrece beneficios para la salud, como el refuerzo del sistema inmune y la reducción de la inflamación.","tuber-melanosporum","Trufa Negra","Tuber melanosporum","Trufa negra","Trufa de Périgord","Trufa violeta","Périgord truffle","French black truffle","winter truffle","Cuerpo fructífero (ascocarpo)","Consumo directo en crudo o ligeramente calentado.","La trufa negra, un lujo gastronómico, es rica en antioxidantes y se le atribuyen tradicionalmente propiedades afrodisíacas.","boletus-edulis","Boletus Edulis","Boletus edulis","Hongo","Seta de calabaza","Viriato","King bolete","porcini","Cep","penny bun","Considerado uno de los hongos comestibles más finos, el Boletus edulis también contiene compuestos con actividad antitumoral y antioxidante.","ganoderma-lingzhi","Lingzhi","Ganoderma lingzhi","Reishi mushroom","Lingzhi mushroom","lingzhi","1-2 gramos de extracto en polvo al día.","Pariente cercano del Reishi, el Lingzhi es otro hongo de la longevidad muy apreciado en la medicina tradicional china por sus efectos sobre la mente y el espíritu.","amanita-caesarea","Amanita caesarea","Amanita de los césares","Huevo de rey","Yema de huevo","Consumo directo, cruda o cocinada.","Requiere identificación experta para evitar confusión con amanitas tóxicas.","La oronja o \\"huevo de rey\\" es un hongo comestible muy apreciado desde la antigüedad, valorado por su sabor delicado y su aporte de nutrientes.","algas-y-plantas-acuaticas-medicinales","Algas y plantas acuáticas medicinales","Espirulina","Arthrospira platensis","Spirulina","3-5 gramos al día","Polvo para batidos o cápsulas","Personas con fenilcetonuria deben evitarla.","Microalga verdiazul rica en proteínas, vitaminas y minerales.","chlorella","Chlorella vulgaris","clorela","Rica en clorofila","Apoyo inmunológico","2-3 gramos al día","Polvo o tabletas","Alga verde unicelular que ayuda a eliminar metales pesados y toxinas del cuerpo.","Laminaria spp.","laminaria","Rico en yodo","600-1200 mg al día","Polvo, cápsulas o en alimentos","No consumir en exceso por su alto contenido de yodo.","Alga marina marrón, una de las mejores fuentes naturales de yodo.","Undaria pinnatifida","Rico en fucoxantina","Quema grasa","4-10 gramos al día","En ensaladas, sopas o rehidratado","Consumir con moderación por su contenido de yodo.","Alga comestible popular en la cocina japonesa, con potenciales beneficios para la pérdida de peso.","Porphyra spp.","Rica en vitamina B12","Hojas secas","2-3 hojas al día","Consumo directo en láminas secas (sushi, snacks)","Alga roja conocida por usarse para envolver el sushi, rica en nutrientes esenciales.","Palmaria palmata","Rica en hierro","5-10 gramos al día","Fresca, seca como snack o en polvo","Alga roja con un sabor salado y ahumado, excelente fuente de minerales.","Fucus","Fucus vesiculosus","Bladderwrack","Estimulante metabólico","Talo","500-1000 mg al día","Decocción, extracto líquido o cápsulas","No recomendado durante el embarazo y la lactancia.","Puede afectar la presión arterial.","Alga marrón también conocida como sargazo vejigoso, usada tradicionalmente para problemas de tiroides y obesidad.","Gelidium spp.","Extracto gelatinoso","4-16 gramos al día","Polvo para gelatinas o preparaciones culinarias","Sustancia gelatinosa derivada de algas rojas, usada como espesante y para promover la regularidad digestiva.","10-20 gramos de alga seca al día","Decocción para hacer un gel, o en polvo","Puede interferir con medicamentos anticoagulantes.","Alga roja que forma un gel mucilaginoso al hervirse, utilizada para aliviar la tos y la irritación de garganta.","Saccharina japonica","Rica en glutamato","Mejora la digestión de legumbres","Fuente de yodo","Tiras pequeñas en cocciones","Añadida a sopas, guisos y cocción de legumbres","Moderar consumo por su alto contenido en yodo.","Alga parda comestible, esencial en la cocina japonesa para hacer el caldo dashi.","Eisenia bicyclis","Equilibrio hormonal","Salud capilar","5-10 gramos (peso seco) por ración","Remojar y añadir a salteados, ensaladas o guisos","Alga parda de sabor suave y dulce, apreciada en la cocina macrobiótica.","Sargassum fusiforme","Aporte de minerales","Fortalece huesos y dientes","Consumo ocasional y moderado","Remojar y cocinar en guisos o salteados","Puede contener arsénico inorgánico, se recomienda un consumo muy limitado.","Alga de color oscuro y textura firme, tradicional en la cocina japonesa.","lechuga-de-mar","Lechuga de mar","Ulva lactuca","lechuga de mar","Sea lettuce","Rica en hierro y magnesio","Como guarnición o en ensaladas","Cruda en ensaladas, cocida en sopas o deshidratada","Alga verde brillante de hojas finas y traslúcidas, similar a la lechuga terrestre.","esparrago-de-mar","Espárrago de mar","Salicornia europaea","espárrago de mar","salicornia","Glasswort","pickleweed","sea asparagus","Rica en vitamina C","Tallos tiernos","Como alimento, en raciones moderadas","Cocida al vapor, salteada o encurtida","Contiene sal de forma natural, moderar en caso de hipertensión.","Planta halófita (tolerante a la sal) que crece en marismas, de textura crujiente y sabor salado.","lenteja-de-agua","Lenteja de agua","Lemna minor","lenteja de agua","Duckweed","Depurativa de aguas","Tradicionalmente usada en animales, no extendido en humanos","Consumo directo (previa desinfección)","Debe ser recolectada de aguas no contaminadas.","Planta acuática flotante muy pequeña que se reproduce rápidamente, considerada un superalimento emergente.","jacinto-de-agua","Jacinto de agua","Eichhornia crassipes","jacinto de agua","camalote","Water hyacinth","Uso externo principalmente","Cataplasma con las hojas machacadas","Considerada una especie invasora, su uso interno no es común.","Planta acuática flotante con hermosas flores, más conocida por su capacidad de limpiar aguas contaminadas.","nenufar-blanco","Nenúfar blanco","Nymphaea alba","nenúfar blanco","lirio de agua blanco","White water lily","Anaphrodisiaco","Rizoma y flores","1-2 gramos de rizoma seco en decocción","Decocción del rizoma, infusión de las flores","Planta acuática ornamental con propiedades medicinales conocidas desde la antigüedad para calmar la excitación nerviosa.","berro-de-agua","Berro de agua","Nasturtium officinale","berro de agua","Watercress","Rico en vitaminas A y C","Consumo como alimento en ensaladas o jugos","Crudo en ensaladas, sopas o jugos frescos","No dar a niños menores de 4 años.","Puede irritar el estómago si se consume en grandes cantidades.","Planta acuática que crece en arroyos limpios, valorada por su sabor picante y sus propiedades nutritivas y medicinales.","menta-acuatica","Menta acuática","Mentha aquatica","menta acuática","hierbabuena de agua","Water mint","1-2 cucharaditas de hojas secas por taza de agua","Similar a otras mentas, evitar en caso de reflujo gastroesofágico severo.","Variedad de menta que crece en zonas húmedas y bordes de agua, con un aroma y propiedades similares a la menta piperita.","lirio-amarillo","Lirio amarillo","Iris pseudacorus","lirio amarillo","acoro bastardo","Yellow iris","Emetico (en altas dosis)","Uso externo. Internamente es tóxico si no se maneja por un experto.","Decocción del rizoma para lavados o cataplasmas","El rizoma fresco es muy irritante y tóxico si se ingiere.","Planta de humedales con flores amarillas vistosas. Su rizoma se ha usado externamente para heridas y problemas de piel.","cola-de-caballo-de-agua","Cola de caballo de agua","Equisetum fluviatile","cola de caballo de agua","Water horsetail","2-4 gramos de planta seca en infusión, hasta 3 veces al día","Precaución con medicamentos para la diabetes o diuréticos.","Variedad de cola de caballo que crece en aguas poco profundas. Rica en sílice, ayuda a la salud de huesos, uñas y cabello.","castana-de-agua","Castaña de agua","Trapa natans","castaña de agua","Water chestnut","Fruto (nuez)","Hervida o asada","Planta acuática flotante que produce un fruto comestible con forma de cabeza de toro. Es nutritiva y se consume en muchas partes de Asia.","Aponogeton","Aponogeton distachyos","Cape pondweed","Comestible","Anti-escorbútica","Flores y tubérculos","Las flores y los tubérculos se cocinan en guisos o sopas","Conocida como \'flor de agua\' en Sudáfrica, sus flores y tubérculos son comestibles y tienen un alto valor nutritivo.","Elodea","Elodea canadensis","Canadian waterweed","Oxigenante de agua","Uso tradicional limitado en humanos, principalmente externo","Infusión para lavados","Fácilmente absorbe contaminantes del agua, usar solo de fuentes limpias.","Planta de acuario común, conocida por su capacidad para oxigenar el agua. Tradicionalmente usada como antiséptico suave.","Azolla","Azolla filiculoides","helecho de agua","Mosquito fern","Biofertilizante","Principalmente para alimentación animal, no para consumo humano directo","Seca y molida como suplemento para ganado","No es una planta de consumo humano habitual.","Helecho acuático flotante que fija nitrógeno, usado como fertilizante natural en arrozales y como alimento para animales.","frutas-citricas-medicinales","Frutas cítricas medicinales","Limón","Citrus limón","Eureka lemon","Lisbon lemon","El limón es un fruto cítrico conocido por su alto contenido de vitamina C.","naranja","Naranja","Citrus naranja","naranjo dulce","naranjero","taronger","Sweet Orange","Navel orange","Valencia orange","Orange","El naranja es un fruto cítrico conocido por su alto contenido de vitamina C.","Toronja","Citrus toronja","El toronja es un fruto cítrico conocido por su alto contenido de vitamina C.","mandarina","Mandarina","Citrus mandarina","clementina","satsuma","Mandarin orange","Clementine","Mandarin","Satsuma","El mandarina es un fruto cítrico conocido por su alto contenido de vitamina C.","lima","Lima","Citrus lima","limón sutil","Limón Mexicano","West Indian lime","Mexican lime","El lima es un fruto cítrico conocido por su alto contenido de vitamina C.","Citrus bergamota","El bergamota es un fruto cítrico conocido por su alto contenido de vitamina C.","Citrus pomelo","pamplemusa","limonzón","pomelo chino","El pomelo es un fruto cítrico conocido por su alto contenido de vitamina C.","Citrus kumquat","El kumquat es un fruto cítrico conocido por su alto contenido de vitamina C.","cidra","Cidra","Citrus cidra","cidro","limón poncil","limón francés","cidra papa","papa de pobre","papa del aire","Etrog","Buddha\'s Hand","El cidra es un fruto cítrico conocido por su alto contenido de vitamina C.","yuzu","Citrus yuzu","Yuja","yuzu (Japonés)","yuja (Coreano)","El yuzu es un fruto cítrico conocido por su alto contenido de vitamina C.","calamondin","Citrus calamondin","calamondina","naranjo miniatura","Panama orange","Philippine lime","golden lime","calamansí (Filipino)","El calamondin es un fruto cítrico conocido por su alto contenido de vitamina C.","tangelo","Citrus tangelo","naranja tangelo","Honeybell","El tangelo es un fruto cítrico conocido por su alto contenido de vitamina C.","ugli","Ugli","Citrus ugli","Jamaican tangelo","uniq fruit","El ugli es un fruto cítrico conocido por su alto contenido de vitamina C.","sweetie","Citrus sweetie","El sweetie es un fruto cítrico conocido por su alto contenido de vitamina C.","oroblanco","Citrus oroblanco","El oroblanco es un fruto cítrico conocido por su alto contenido de vitamina C.","melogold","Citrus melogold","El melogold es un fruto cítrico conocido por su alto contenido de vitamina C.","kaffir-lime","Kaffir Lime","Citrus kaffir lime","Kaffir lime","Makrut lime","El kaffir lime es un fruto cítrico conocido por su alto contenido de vitamina C.","finger-lime","Finger Lime","Citrus finger lime","lima dedo","caviar cítrico","lima australiana","Australian finger lime","caviar lime","El finger lime es un fruto cítrico conocido por su alto contenido de vitamina C.","sudachi","Citrus sudachi","sudachi (Japonés)","El sudachi es un fruto cítrico conocido por su alto contenido de vitamina C.","kabosu","Citrus kabosu","kabosu (Japonés)","El kabosu es un fruto cítrico conocido por su alto contenido de vitamina C.","rangpur","Rangpur","Citrus rangpur","lima de Cantón","limón rugoso","mandarina ácida","mandarin lime","lemandarin","limão cravo (Portugués, Brasil)","El rangpur es un fruto cítrico conocido por su alto contenido de vitamina C.","limequat","Citrus limequat","El limequat es un fruto cítrico conocido por su alto contenido de vitamina C.","citrange","Citrus citrange","El citrange es un fruto cítrico conocido por su alto contenido de vitamina C.","citrumelo","Citrus citrumelo","El citrumelo es un fruto cítrico conocido por su alto contenido de vitamina C.","faustrime","Citrus faustrime","El faustrime es un fruto cítrico conocido por su alto contenido de vitamina C.","frutas-tropicales-medicinales","Frutas tropicales medicinales","caimito","Caimito","Chrysophyllum cainito","Producción de colágeno","Consumir 1-2 frutos. La decocción de la corteza se usa para la diarrea.","Consumo directo del fruto, decocción de la corteza","El caimito es una fruta tropical con una pulpa dulce y lechosa. Es rico en antioxidantes y se utiliza en la medicina tradicional para tratar la diabetes y problemas digestivos.","papaya","Papaya","Carica papaya","Fruta bomba","Lechosa","Mapaja (taino)","Kabaya (kalina)","Mapaya (maipure)","Papaio (otomaco)","Fruto, semillas y hojas","Consumir 1 rodaja al día. Infusión de hojas: 1 taza al día.","Consumo directo, jugos, batidos, infusiones (hojas)","El consumo de la fruta verde o sus semillas puede no ser seguro.","Puede causar alergia en personas sensibles al látex.","La papaya es una fruta tropical conocida por su enzima papaína, que facilita la digestión de las proteínas. Es rica en vitaminas A, C y antioxidantes.","pina","Piña","Ananas comosus","Matzatli (nahuatl)","Nana (tupi)","Consumir 1-2 rodajas al día","El consumo excesivo puede irritar la boca y el estómago.","La piña es una fruta tropical rica en bromelina, una enzima que ayuda a digerir las proteínas. También es una excelente fuente de vitamina C y manganeso.","mango","Mango","Melocotón de los trópicos","Mejora la salud ocular","Favorece la digestión","Beneficioso para la piel","Consumir 1 pieza de fruta al día","Consumo directo, jugos, batidos","El mango es una fruta jugosa y dulce, rica en vitaminas A, C y E, así como en antioxidantes que protegen al cuerpo del daño celular.","guayaba","Arasá (guaraní)","Antidiarreica","Reduce el colesterol","Controla la diabetes","Consumir 1-2 frutos al día. Infusión de hojas: 2 tazas al día.","Consumo directo, jugos, mermeladas, infusión (hojas)","El consumo excesivo de hojas puede causar estreñimiento.","La guayaba es una fruta tropical con un alto contenido de vitamina C, incluso más que los cítricos. Sus hojas se utilizan tradicionalmente para tratar problemas digestivos.","maracuya","Maracuyá","Passiflora edulis","Fruta de la pasión","Parchita","Maracujá","Mburucuyá (guaraní)","Consumir el jugo de 1-2 frutos al día. Infusión de hojas: 1 taza antes de dormir.","Consumo directo, jugos, postres, infusión (hojas)","Puede potenciar el efecto de medicamentos sedantes.","El maracuyá, también conocido como fruta de la pasión, es valorado por sus propiedades calmantes y su capacidad para inducir el sueño. Es rico en antioxidantes y fibra.","Carambola","Averrhoa carambola","Carambolo","Torombolo","Five Finger","Fruta de estrella","Favorece el tránsito intestinal","Beneficiosa para la salud del corazón","Fruto, hojas y flores","No recomendada para personas con insuficiencia renal crónica por su alto contenido de oxalatos.","La carambola, o fruta estrella, es una fruta exótica de sabor agridulce, rica en vitamina C y antioxidantes. Su forma de estrella la hace muy atractiva para la decoración de platos.","Pitahaya","Favorece la pérdida de peso","Fortalece los huesos","Consumo directo, jugos, postres","La pitahaya, o fruta del dragón, es una fruta exótica con una apariencia llamativa y un sabor dulce y refrescante. Es rica en antioxidantes, fibra y vitamina C.","lichi","Lichi","Litchi chinensis","Ciruela de China","Protege el corazón","Consumir un puñado (10-12 frutos) al día","Consumo directo, postres, ensaladas","Consumir con moderación por su contenido de azúcar.","El lichi es una fruta pequeña y dulce, con una pulpa blanca y jugosa. Es una excelente fuente de vitamina C y compuestos antioxidantes que combaten el estrés oxidativo.","sistema-circulatorio","rambutan","Rambután","Nephelium lappaceum","Mamón chino","Achotillo","Mejora la salud ósea","Fruto, semillas y cáscara","Consumir 5-6 frutos al día","Consumo directo del fruto. La cáscara y semillas se usan en decocción.","Las semillas crudas son tóxicas y no deben consumirse.","El rambután es una fruta exótica cubierta por una cáscara peluda. Su pulpa es dulce y jugosa, similar a la del lichi, y es rica en vitamina C, hierro y cobre.","durian","Durián","Durio zibethinus","Antidepresivo natural","Favorece el sueño","Consumir con moderación debido a su alta densidad calórica.","No consumir con alcohol, puede causar reacciones adversas severas.","Consumir con precaución por su alto contenido de potasio.","El durián es conocido como el \'rey de las frutas\' en el sudeste asiático, famoso por su gran tamaño, cáscara espinosa y un olor intenso y característico. Es muy nutritivo pero también muy calórico.","tamarindo","Tamarindo","Tamarindus indica","Tamr hindī (árabe)","Protector hepático","Pulpa del fruto, hojas y corteza","Pulpa: 10-20 gramos al día. Infusión de hojas: 1-2 tazas.","Consumo de la pulpa, aguas frescas, dulces, infusión (hojas)","Puede interactuar con medicamentos para la diabetes y anticoagulantes.","El tamarindo es una leguminosa con una pulpa agridulce que se utiliza en cocinas de todo el mundo. Tiene propiedades medicinales laxantes y ayuda a reducir la inflamación.","coco","Coco","Cocos nucifera","pipa","Fuente de electrolitos","Mejora la salud cerebral","Agua, pulpa (carne) y aceite","Agua de coco: 1-2 vasos al día. Aceite: 1-2 cucharadas al día.","Consumo directo, aceite, leche, agua","Aunque es raro, puede causar alergias.","El coco es una fruta tropical muy versátil. Su agua es una bebida hidratante natural, su pulpa es rica en fibra y su aceite tiene propiedades antimicrobianas.","guanabana","Guanábana","Annona muricata","Fruto, hojas y semillas","Consumir 1 porción de fruta al día. Infusión de hojas: 1 taza al día.","Consumo directo, jugos, batidos, infusión (hojas)","No se recomienda el consumo de suplementos o infusiones.","Puede potenciar medicamentos para la presión arterial y la diabetes.","La guanábana es una fruta con pulpa blanca y cremosa, y un sabor agridulce. Se le atribuyen propiedades anticancerígenas, aunque se necesita más investigación.","Ayuda a dormir","Consumir 1-2 kiwis al día","Puede causar alergia, especialmente en personas alérgicas al látex o al polen.","El kiwi es una pequeña fruta con una gran cantidad de vitamina C, fibra y antioxidantes. Ayuda a regular el tránsito intestinal y a fortalecer las defensas.","Protector cardiovascular","Arilos (semillas cubiertas de pulpa), cáscara y jugo","Jugo: 1 vaso al día. Consumir los arilos de media granada.","Consumo directo, jugos","La granada es una fruta cargada de antioxidantes, especialmente punicalaginas, que le confieren potentes propiedades protectoras para la salud cardiovascular y cerebral.","Demulcente (suavizante de mucosas)","Consumir 2-4 higos frescos o secos al día.","Consumo directo, mermeladas, postres","Los higos secos tienen una alta concentración de azúcar.","El higo es una fruta dulce y nutritiva, rica en fibra, que ayuda a regular el tránsito intestinal. También se utiliza para aliviar la tos y el dolor de garganta.","chirimoya","Chirimoya","Annona cherimola","Consumir 1 pieza de fruta","Las semillas son tóxicas y no deben ser ingeridas.","La chirimoya es una fruta de pulpa cremosa y sabor dulce, a menudo descrita como una mezcla de plátano, piña y fresa. Contiene compuestos que promueven la relajación y el bienestar.","lucuma","Pouteria lucuma","Logma","Lohma","Louma","Lúcumo chileno","Palo colorado","Eggfruit","Sapota-do-Solimoes","Endulzante natural de bajo índice glucémico","Fruto (generalmente en polvo)","1-2 cucharadas de polvo de lúcuma al día.","Añadir a batidos, postres, yogures","La lúcuma, conocida como el \'oro de los Incas\', es una fruta peruana con un sabor dulce que recuerda al caramelo o al arce. Se utiliza principalmente como un endulzante natural y nutritivo.","zapote","Zapote","Pouteria sapota","Mejora la visión","Consumir con moderación","Consumo directo, batidos, helados","El zapote es una fruta de pulpa suave y dulce, de color anaranjado o rojizo. Es rico en vitaminas A y C, potasio y fibra dietética.","mamey","Mamey","Mammea americana","Insecticida (semilla)","Fruto, aceite de la semilla","Consumo moderado del fruto.","Consumo directo, batidos, postres","La semilla es tóxica si se ingiere.","El mamey es una fruta grande de pulpa firme y sabor dulce. El aceite extraído de su semilla se ha utilizado tradicionalmente como insecticida y para tratar afecciones de la piel.","Anticancerígeno (potencial)","Fruto (generalmente en jugo)","Jugo fermentado","Personas con enfermedad renal o hepática deben consultar a un médico.","El noni es una fruta con un olor y sabor fuertes y peculiares. A pesar de ello, su jugo es muy popular por sus supuestos beneficios para la salud, incluyendo el alivio del dolor y el fortalecimiento del sistema inmune.","araza","Arazá","Eugenia stipitata","Salud hepática","Consumo en jugos o postres","Jugos, mermeladas, helados","El arazá es una fruta amazónica muy ácida, por lo que rara vez se consume fresca. Es excepcionalmente rica en vitamina C y se utiliza para preparar jugos y dulces refrescantes.","borojo","Borojó","Borojoa patinoi","Consumo en jugos o pulpa","Jugos, mermeladas, pulpa directa","El borojó es una fruta de la selva tropical del Pacífico, conocida como el \'viagra natural\' por sus supuestas propiedades afrodisíacas. Es muy rica en fósforo, hierro y aminoácidos.","camu-camu","Camu Camu","Myrciaria dubia","Vitamina C (muy alta)","Fruto (generalmente en polvo o jugo)","1 cucharadita de polvo al día.","Polvo para añadir a bebidas, jugos","El camu camu es una pequeña fruta amazónica que ostenta uno de los contenidos más altos de vitamina C del mundo. Se utiliza para fortalecer el sistema inmune y combatir la inflamación.","copoazu","Copoazú","Theobroma grandiflorum","Estimulante (sin cafeína)","Hidratante para la piel","Pulpa y semillas (manteca)","Consumo de la pulpa en postres o bebidas.","Jugos, helados, postres, manteca para uso cosmético","El copoazú es un pariente del cacao, con una pulpa aromática y ácida. Contiene teacrina, un estimulante suave, y su manteca es un excelente emoliente para la piel.","Feijoa","Acca sellowiana","guayabo del país","goiabeira serrana","goiabeira do mato","goiaba do campo","guavasteen","fig guava","brazilian guava","Salud tiroidea (por yodo)","Consumir 2-3 frutos al día","Consumo directo, jugos, mermeladas","La feijoa, también conocida como guayaba-piña, tiene un sabor aromático y complejo. Es rica en fibra, vitamina C y yodo, beneficiando la digestión y la función tiroidea.","jabuticaba","Jabuticaba","Myrciaria cauliflora","Fruto y cáscara","Consumir un puñado de frutos","Consumo directo, jaleas, vinos. La cáscara seca en infusión.","La jabuticaba es una fruta brasileña única que crece directamente en el tronco y las ramas del árbol. Su cáscara oscura es rica en antocianinas, potentes antioxidantes.","Macambo","Theobroma bicolor","Fuente de proteína y fibra","Salud cerebral","Mejora el humor","Consumir las semillas tostadas como snack.","Tostado de las semillas","El macambo, pariente del cacao, es conocido como el \'cacao blanco\'. Sus semillas, una vez tostadas, son un snack nutritivo que proporciona energía y mejora el estado de ánimo gracias a su contenido de teobromina.","pomarrosa","Pomarrosa","Syzygium jambos","Antidiabética (semillas)","Fruto, hojas, corteza y semillas","Consumo moderado del fruto. Decocción de hojas o semillas.","Las semillas crudas pueden ser tóxicas.","La pomarrosa es una fruta crujiente y acuosa con un aroma que recuerda a las rosas. Tradicionalmente, diversas partes de la planta se han usado para tratar la diabetes y la fiebre.","tomatillo","Tomatillo","Physalis philadelphica","Incorporar en salsas y platillos","Cocido, asado, en salsas","El tomatillo, o tomate verde, es un ingrediente fundamental en la cocina mexicana. Es rico en antioxidantes y se ha estudiado por sus propiedades para regular el azúcar en sangre.","Citrus japonica","Fruto completo (cáscara y pulpa)","Consumir 4-5 frutos al día","Consumo directo, mermeladas, en almíbar","El kumquat es un pequeño cítrico que se come entero, con cáscara. La cáscara es dulce y la pulpa ácida, creando una explosión de sabor. Es rico en vitamina C y fibra.","tamarillo","Tamarillo","Solanum betaceum","Consumo directo (sin la piel), jugos, chutneys","El tamarillo, o tomate de árbol, tiene un sabor agridulce y audaz. Es rico en vitaminas A y C y potasio, lo que lo hace beneficioso para la vista y la presión arterial.","lima-kaffir","Lima Kaffir","Citrus hystrix","Detoxificante sanguíneo","Repelente de insectos","Hojas y fruto (cáscara y jugo)","Usar las hojas o la cáscara como condimento.","Condimento en cocina asiática, infusión de hojas","La lima kaffir es un cítrico muy aromático, valorado más por sus hojas y su cáscara que por su jugo. Se utiliza en la medicina tradicional para la salud bucal y para purificar la sangre.","anon","Anón","Annona squamosa","Consumir 1 fruto","Las semillas son tóxicas.","El anón, también conocido como chirimoya de azúcar, tiene una pulpa dulce y segmentada. Es rico en vitamina C, vitamina A y potasio.","yaca","Yaca","Artocarpus heterophyllus","Fruto (bulbos y semillas)","Consumo moderado","Fruto maduro crudo, fruto verde cocido como sustituto de carne, semillas cocidas","La yaca es la fruta de árbol más grande del mundo. Su pulpa tiene una textura carnosa y un sabor dulce cuando está madura. Es una buena fuente de fibra, vitaminas y minerales.","banana-roja","Banana Roja","Musa acuminata \'Red Dacca\'","Fuente de vitamina C y B6","Antioxidante (rica en carotenoides)","Consumir 1-2 bananas al día","La banana roja es más pequeña y dulce que la banana común, con un ligero sabor a frambuesa. Su color rojo se debe a un alto contenido de carotenoides, que son potentes antioxidantes.","frutipan","Frutipán","Artocarpus altilis","Fuente de carbohidratos complejos","Consumir como parte de las comidas","Cocido, asado, frito, hervido","El frutipan, o árbol del pan, es una fruta amilácea que se consume cocida y sirve como un alimento básico en muchas culturas tropicales. Es una excelente fuente de energía y fibra.","fruta-hala","Fruta Hala","Pandanus tectorius","Alivia dolores de cabeza","Fuente de vitamina C","Fruto, hojas y raíces","Consumo moderado del fruto","Fruto crudo o cocido, infusión de hojas","La fruta Hala es una fruta de aspecto peculiar, compuesta por múltiples segmentos llamados falanges. Se utiliza en la medicina tradicional polinesia para diversos fines, desde laxante hasta analgésico.","Extremadamente rica en Vitamina C","Unos pocos frutos cubren las necesidades diarias de Vitamina C.","Consumo directo, jugos, suplementos","Dosis muy altas pueden causar malestar estomacal.","La acerola, o cereza de Barbados, es una de las fuentes naturales más ricas en vitamina C. Este potente antioxidante ayuda a proteger el cuerpo contra enfermedades y el envejecimiento prematuro.","frutas-clima-templado-medicinales","Frutas de clima templado medicinales","manzana","Manzana","Malus domestica","manzano","manzanero","manzanera","manzanal","manzanar","pero","common apple","paradise apple","domesticated apple","orchard apple","cultivated apple","common crabapple","Fruto completo, piel","1-2 manzanas al día","Consumo directo, compota, zumo","El consumo excesivo puede causar gases en personas sensibles.","Fruta rica en fibra y antioxidantes, ayuda a regular el tránsito intestinal y a reducir el colesterol.","pera","Pera","perejón","perejonal","european pear","pear","Astringente (cocida)","Laxante (cruda)","1-2 peras al día","Consumo directo, cocida, zumo","Consumir con moderación debido a su contenido de azúcares naturales.","Fruta suave y dulce, conocida por su efecto diurético y su capacidad para regular el intestino dependiendo de su preparación.","Durazno","Prunus persica","melocotonero","paraguayas","paraguayos","chatos","malacatonero","piescar","malacatón","abridor","clingstone peach","common peach","freestone peach","white peach","2-3 duraznos al día","Fruta jugosa y refrescante, ideal para la hidratación y como laxante suave. Las hojas se usan tradicionalmente como diurético.","Ciruela","Prunus domestica","ciruelo","prunal","bruno","ciruelero","cirolero","cerollero","pruno","ameixeira","fatón","cirgüelero","cirgüelo","common plum","european plum","prune plum","skeg","Laxante potente","3-5 ciruelas secas o 5-8 frescas al día","Consumo directo, remojo (ciruelas secas)","El consumo excesivo puede causar diarrea y flatulencias.","Reconocida por su alto contenido de fibra y sorbitol, es un laxante natural muy eficaz, especialmente en su forma seca.","cereza","Cereza","Prunus avium","cerezo","cerezu","cerezal","cereizal","zrezal","cerecera","cirasera","ciresera","cerezo morrino","cerezo silvestre","morrino","picoto","capulín","capulín (náhuatl)","bird cherry","mazzard cherry","bing cherry","Antigota","Fruto completo, pedúnculos (rabos)","Un puñado de cerezas al día. Infusión de 10g de pedúnculos por taza.","Consumo directo, infusión de pedúnculos","Consumir con moderación en caso de cálculos renales (por oxalatos).","Rica en antocianinas, ayuda a reducir la inflamación y los niveles de ácido úrico, siendo útil para la gota. Los rabos son potentes diuréticos.","Albaricoque","Prunus armeniaca","albaricoquero","alberchiguero","prisco","damasquillo","albergero","albarillo","damasquero","chabacano","armenian plum","ansu apricot","siberian apricot","tibetan apricot","Vitamínico (Provitamina A)","3-5 albaricoques frescos o 3 secos (orejones) al día","Las semillas contienen amigdalina y son tóxicas en grandes cantidades.","Excelente fuente de betacarotenos, beneficioso para la vista y la piel. Su consumo regular ayuda a combatir el estreñimiento.","membrillo","Membrillo","gamboa","bembrillo","edible quince","common quince","fruiting quince","Antiinflamatorio intestinal","Fruto (pulpa y semillas)","Consumo de pulpa cocida (dulce o jalea)","Cocido, jalea, decocción de semillas","El fruto crudo es muy astringente y difícil de digerir.","Rico en pectina y taninos, es un potente remedio natural contra la diarrea y las inflamaciones intestinales, consumido siempre cocido.","Antiparasitaria (corteza)","Arilos (semillas), zumo, corteza","Un vaso de zumo al día o una granada entera","Zumo, consumo directo, decocción de corteza","Considerada un superalimento por su alto contenido de polifenoles, protege el sistema cardiovascular y tiene propiedades antiinflamatorias.","2-4 higos frescos o secos al día","Consumo directo, decocción (para la tos)","Fruta muy energética y con un marcado efecto laxante. La decocción de higos secos es un remedio tradicional para la tos y el dolor de garganta.","uva","Uva","videira","parra silvestre","parra borde","vid bravía","Tinta del País","Tinta de Toro","common grape","common grape vine","european wine grape","purpleleaf grape","vine","grapevine","Antioxidante (resveratrol)","Un racimo de uvas al día","Rica en resveratrol y otros polifenoles, la uva es un potente antioxidante que protege el corazón y los vasos sanguíneos.","1-2 kiwis al día","Excepcionalmente rico en vitamina C, el kiwi es un potente estimulante del sistema inmunitario y un eficaz laxante gracias a su fibra.","Reguladora hormonal (hojas)","Un puñado de frambuesas al día. Infusión de 1-2 cucharaditas de hojas secas por taza.","La infusión de hojas de frambuesa se usa para preparar el parto, pero debe consultarse con un profesional.","Fruta rica en antioxidantes. Las hojas de frambuesa son un tónico uterino tradicional, utilizado para regular el ciclo menstrual y facilitar el parto.","Fragaria vesca","Un puñado de fresas al día","Puede causar urticaria en personas sensibles.","Fruta diurética y depurativa, rica en vitamina C y antioxidantes. Ayuda a eliminar el exceso de líquidos y toxinas.","Astringente (fruto verde)","Laxante (fruto maduro)","Un puñado de moras al día","Fruta silvestre rica en vitaminas y antioxidantes. Las hojas se usan en infusión como astringente para la diarrea y las úlceras bucales.","Protector de la vista","Un puñado de arándanos al día o 300-500mg de extracto estandarizado.","Conocido por su capacidad para prevenir infecciones urinarias. También mejora la visión nocturna y protege los capilares sanguíneos.","grosella","Grosella","grosellero","grosello rojo","Astringente (hojas y fruto verde)","Un puñado de zarzamoras al día. Infusión de 1-2 cucharaditas de hojas secas por taza.","Similar a la mora, la zarzamora es rica en antioxidantes. Sus hojas son un remedio tradicional para la diarrea y las afecciones de la boca.","Nectarina","Prunus persica var. nucipersica","peladillo","briñón","bruñón","2-3 nectarinas al día","Variedad de durazno de piel lisa, comparte sus propiedades laxantes y diuréticas. Es muy refrescante y rica en vitaminas.","Paraguayo","Prunus persica var. platycarpa","melocotón plano","chato","saturn peach","2-3 paraguayos al día","Variedad de durazno de forma achatada, con propiedades similares. Es dulce, jugoso y fácil de digerir.","nispero","Níspero","Eriobotrya japonica","Expectorante (semillas)","Fruto, semillas (con precaución)","Un puñado de nísperos al día","Consumo directo, decocción de semillas","Las semillas contienen pequeñas cantidades de cianuro y deben usarse con precaución y conocimiento.","Fruta de primavera con propiedades astringentes, útil para la diarrea. Las semillas, usadas con precaución, tienen efecto expectorante.","Caqui","Diospyros kaki","palosanto","persimon","pérsimo","oriental persimmon","chinese persimmon","japanese persimmon","kaki persimmon","kaki","kaki-plum","persimmon","sharon fruit","Laxante (maduro)","Astringente (inmaduro)","Vitamínico (Vitamina A)","1-2 caquis al día","El caqui inmaduro es muy astringente y puede causar obstrucción intestinal en casos raros.","Fruta dulce y carnosa, rica en vitamina A. Su efecto sobre el intestino varía con la madurez: laxante si está maduro, astringente si no.","Un puñado de acerolas al día o 500-1000mg de extracto.","Una de las fuentes más ricas de vitamina C del mundo. Potente estimulante del sistema inmunitario y antioxidante.","Antioxidante (Vitamina E)","Un puñado de avellanas al día","Consumo directo, tostadas","Fruto seco rico en grasas saludables, vitamina E y minerales. Ayuda a proteger el sistema cardiovascular y a combatir el envejecimiento celular.","Azarolo","Fruto, flores, hojas","Infusión de 1-2 cucharaditas de flores y hojas por taza.","Consumo directo del fruto, infusión de flores y hojas","Puede potenciar el efecto de medicamentos para el corazón.","Pariente del espino blanco, comparte sus propiedades cardiotónicas y reguladoras de la presión arterial. Los frutos son comestibles y ricos en vitamina C.","Endrina","Consumo moderado del fruto maduro. Maceración en licor (pacharán).","Maceración en licor, jalea","El fruto crudo es muy astringente y áspero.","Fruto del endrino, muy astringente en crudo. Se utiliza tradicionalmente para hacer pacharán, un licor digestivo.","grosella-espinosa","Grosella espinosa","uva-crispa","grosella espinosa europea","uva espina","agrazón","algaraz","algarzón","escambrones","grosella blanca","european gooseberry","garden gooseberry","Un puñado de grosellas espinosas al día","Un puñado de grosellas negras al día. Infusión de 1-2 cucharaditas de hojas secas por taza.","Conocida por sus propiedades antiinflamatorias y antialérgicas, similares a la cortisona pero sin sus efectos secundarios. El fruto es muy rico en vitamina C.","Un puñado de madroños maduros al día. Infusión de 1-2 cucharaditas de hojas secas por taza.","El consumo excesivo de frutos puede causar embriaguez y dolor de cabeza.","El fruto del madroño es comestible y rico en vitamina C. Las hojas tienen propiedades antisépticas urinarias y diuréticas.","nashi","Nashi","Pyrus pyrifolia","1-2 nashis al día","Pera asiática de textura crujiente y muy jugosa. Se utiliza en la medicina tradicional china para aliviar la tos y la sequedad de garganta.","Nutritiva (fruto)","Cardioprotectora (fruto)","Antifúngica (hojas)","Fruto (nuez), hojas (infusión)","Un puñado de nueces al día. Infusión de 1-2 cucharaditas de hojas secas por taza.","Consumo directo de nueces, infusión de hojas","La nuez es un alimento excepcional para el cerebro y el corazón. Las hojas de nogal son astringentes y se usan externamente para problemas de piel.","uva-espina","Uva espina","Un puñado de uvas espina al día","serba","Serba","Sorbus domestica","Fruto (muy maduro)","Consumo moderado del fruto muy maduro","Consumo directo (muy maduro), mermelada","El fruto inmaduro es extremadamente astringente y no debe consumirse.","Fruto del serbal común, solo comestible cuando está muy maduro y blando. Es muy astringente y se ha usado tradicionalmente para la diarrea.","Fruto (sin semillas)","Infusión de 1-2 cucharaditas de pulpa seca por taza.","Infusión, mermelada, jalea","Los pelos de las semillas son irritantes y deben eliminarse cuidadosamente.","Fruto del rosal silvestre, es una de las fuentes más concentradas de vitamina C. Se utiliza para prevenir resfriados y fortalecer las defensas.","Flores, bayas (cocidas)","Infusión de 1-2 cucharaditas de flores por taza. Jarabe de bayas.","Infusión de flores, jarabe de bayas cocidas","Las bayas crudas son tóxicas y deben cocinarse siempre.","Las flores de saúco son un remedio tradicional para la fiebre y los resfriados. Las bayas cocidas tienen potentes propiedades antivirales, especialmente contra la gripe.","bayas-y-frutos-del-bosque-medicinales","Bayas y frutos del bosque medicinales","1-2 cucharadas de bayas frescas o secas al día.","Decocción, infusión, consumo directo, zumo, compota o helado.","No se recomienda en caso de gastritis y úlcera gastroduodenal.","El arándano es un recurso de herbolario para tratar la debilidad capilar y mejorar el riego sanguíneo. Se indica para aliviar las varices y las hemorroides, pero también para corregir la mala visión nocturna.","Revitalizante","Un puñado de moras al día.","Consumo directo, zumos, sorbetes, licores y repostería.","Un exceso de bayas puede resultar indigesto. Esto también puede ocurrir si se toman las moras cuando todavía están verdes.","Las moras se comportan como astringentes y aportan vitamina C y antioxidantes. Se recomiendan como revitalizantes en situaciones de convalecencia, astenia, fatiga y debilidad.","Un tazón de frambuesas frescas al día.","Consumo directo, zumos, sorbetes, macedonias o pasteles.","No tomar en caso de gastritis y úlcera gastroduodenal.","Las frambuesas contienen vitamina C y antioxidantes naturales, así como azúcares. Ayudan a prevenir las infecciones y aportan vitalidad y resistencia ante esfuerzos físicos.","Fragaria x ananassa","150-200 gramos al día.","Consumo directo, batidos, postres.","Rica en polifenoles, que tienen propiedades antiinflamatorias. Ayuda a controlar el azúcar en sangre.","Conocida por mejorar la función renal, la salud ocular y la inmunidad. Alta en antocianinas.","Bayas maduras y cocidas","1-2 cucharadas de jarabe al día.","Jarabe, infusión (de flores), mermelada.","Las bayas crudas son tóxicas.","Ampliamente utilizado para estimular el sistema inmunológico y tratar los síntomas del resfriado y la gripe.","Endrino","espino","andrino","espino negro","arán","arañonera","ablunos","abranal","abreculos","abrueño","abrunal","arañón","arañón negro","blackthorn plum","sloe cherry","patxarán (euskera)","1 cucharada de frutos en decocción por taza.","Decocción, jarabe, licor (pacharán).","La semilla puede ser tóxica en grandes dosis.","Se utiliza tradicionalmente para combatir diarreas y hemorragias leves. Estimula la salivación.","Consumo moderado de frutos maduros.","Consumo directo, mermeladas, licores.","El consumo excesivo de frutos puede provocar embriaguez y dolor de cabeza.","Los frutos del madroño tienen propiedades astringentes y se utilizan para tratar infecciones urinarias.","cornejo","Cornejo","Cornus mas","cornejo macho","cornejo de Cornelia","Cornelian cherry dogwood","European cornel","Frutos ricos en vitamina C, utilizados tradicionalmente como tónico y para bajar la fiebre.","espino-amarillo","Espino amarillo","arto blanco","cambrón","elorri (euskera)","1-2 cucharaditas de aceite o un puñado de bayas.","Aceite, zumo, mermelada.","Excepcionalmente rico en vitamina C y otros antioxidantes. Promueve la salud de la piel y las mucosas.","Arándano rojo","300-500 mg de extracto o 1 vaso de zumo puro al día.","Zumo, extracto, consumo directo (deshidratado).","Consultar con el médico si se están tomando fármacos anticoagulantes como la warfarina.","Especialmente conocido por su capacidad para prevenir y tratar infecciones del tracto urinario, como la cistitis.","baya-de-goji","Baya de Goji","Lycium barbarum","10-30 gramos de bayas secas al día.","Consumo directo (secas), infusiones, añadido a comidas.","Utilizadas en la medicina tradicional china para proteger el hígado, mejorar la vista y fortalecer el sistema inmune.","Infusión, decocción, jarabe, mermelada.","Extremadamente rico en vitamina C, se usa para combatir la astenia, procesos infecciosos y para tratar diarreas.","Aperitiva","Estimula el apetito y tiene un efecto diurético suave. Rica en vitamina C y antioxidantes.","baya-de-acai","Baya de Açaí","1-2 cucharadas de pulpa o polvo al día.","Batidos, boles (açaí bowls), zumos.","Considerada un superalimento por su alta concentración de antioxidantes, que combaten el estrés oxidativo.","uva-ursi","Uva de oso","Infusión de hojas, 1-2 tazas al día (no más de una semana).","Infusión (hojas), decocción (bayas).","No recomendado para niños.","Principalmente usada por sus hojas para tratar infecciones del tracto urinario. Las bayas son comestibles pero insípidas.","Consumo directo, mermeladas, infusión de hojas.","Similar a la mora, pero el término se usa a menudo para variedades silvestres. Rica en antioxidantes y vitaminas.","baya-de-maqui","Baya de Maqui","Aristotelia chilensis","Regulador de glucosa","1-2 cucharaditas de polvo al día.","Polvo para batidos, zumos, postres.","Originaria de la Patagonia, es una de las bayas con mayor poder antioxidante. Ayuda a regular el azúcar en sangre.","baya-del-espino","Baya del Espino","Bayas, flores y hojas","Infusión, tintura, extracto.","Puede potenciar el efecto de medicamentos para el corazón y la hipertensión.","Considerada la planta del corazón. Ayuda a regular el ritmo cardíaco, la tensión arterial y tiene un efecto calmante.","serbal-de-cazadores","Serbal de los cazadores","Fruto (cocido)","Consumo moderado en mermeladas o jaleas.","Mermelada, jalea, licor. Deben cocinarse para eliminar el ácido parasórbico.","Los frutos crudos son tóxicos y pueden causar problemas digestivos.","Los frutos son ricos en vitamina C y se usan tradicionalmente para hacer mermeladas con propiedades astringentes.","Casis","Consumo directo, zumo, jarabe, infusión de hojas.","También conocido como grosellero negro, es famoso por sus propiedades antiinflamatorias, similares a la cortisona.","uva-de-california","Uva de California","Antiinflamatoria (piel)","Uso tópico de la raíz; consumo moderado de bayas.","Decocción de raíz (uso externo), mermelada de bayas.","No usar la raíz durante el embarazo.","La raíz se usa para problemas de piel como la psoriasis. Las bayas son ácidas pero comestibles y ricas en vitamina C.","baya-de-agracejo","Baya de Agracejo","Bayas y corteza de la raíz","Consumo moderado de bayas; la corteza bajo supervisión.","Mermelada o zumo de bayas; decocción de la corteza.","No usar la corteza durante el embarazo.","Las bayas son ricas en vitamina C. La corteza contiene berberina, usada para problemas hepáticos y digestivos.","murtilla","Murtilla","Ugni molinae","Fruto nativo del sur de Chile, con un aroma y sabor intensos. Muy rico en antioxidantes y con propiedades antiinflamatorias.","calafate","Calafate","Berberis microphylla","Baya de la Patagonia, similar al agracejo. Es un potente antioxidante y forma parte de la cultura local.","Boysenberry","Rubus ursinus × idaeus","boysenberi","zarza boysen","boysena","zarza de Boysen","Consumo directo, mermeladas, tartas.","Híbrido entre frambuesa, mora y loganberry. Rico en fibra, vitaminas y antioxidantes.","Loganberry","Rubus × loganobaccus","loganas","loganberris","zarza logan","mora logan","zarza de logan","zarza-frambuesa","Vitamínica (C y K)","Consumo directo, zumos, mermeladas.","Híbrido entre la mora de California y la frambuesa. Aporta vitaminas y minerales esenciales.","Tayberry","Rubus fruticosus x R. idaeus","Consumo directo, postres, mermeladas.","Híbrido entre una mora y una frambuesa, originario de Escocia. Más grande y dulce que la loganberry.","Lingonberry","Vaccinium vitis-idaea","arándano rojo","Salsas, mermeladas, zumos.","Popular en Escandinavia, similar al arándano rojo. Ayuda a la salud intestinal, ocular y cardíaca.","Huckleberry","Vaccinium parvifolium","Vitamínica (A, B, C)","Hierro","Similar al arándano pero con menos azúcar. Ayuda a reducir el colesterol y protege contra enfermedades cardíacas.","semillas-y-frutos-secos-medicinales","Semillas y frutos secos medicinales","Linaza","Linum usitatissimum","lino","Remojar en agua, moler o añadir a los alimentos","La linaza es una semilla rica en fibra y ácidos grasos omega-3, beneficiosa para la salud digestiva y cardiovascular.","Chía","Salvia hispanica","chía (náhuatl)","Remojar en líquido para formar un gel, añadir a batidos o yogur","Puede bajar la presión arterial, precaución en personas con hipotensión.","Las semillas de chía son conocidas por su capacidad para absorber líquido y formar un gel, proporcionando hidratación y energía.","canamo","Cáñamo","Cannabis sativa","grifa","alfalfa","mandanga","mota","yerba","porro","macoña","bareta","bacoa","pito","caño","1-3 cucharadas al día","Consumir las semillas peladas, en aceite o en polvo de proteína","Las semillas de cáñamo no contienen THC en cantidades significativas, pero se recomienda precaución en personas con alergias a frutos secos.","Las semillas de cáñamo son una fuente completa de proteínas y ácidos grasos esenciales, beneficiosas para la salud del corazón y la piel.","calabaza-semillas","Semillas de Calabaza","Cucurbita pepo","pepitas de calabaza","pepitas","ayote","pipas","Prostática","Puede causar alergia en personas sensibles a las cucurbitáceas.","Las semillas de calabaza son ricas en zinc y se utilizan tradicionalmente para la salud de la próstata y como antiparasitario.","girasol-semillas","Semillas de Girasol","Las semillas de girasol son una excelente fuente de vitamina E, un potente antioxidante que protege las células del daño.","sesamo","Sésamo","Sesamum indicum","Consumir crudas, tostadas, en tahini o aceite","El sésamo es un alérgeno común.","El sésamo es rico en calcio y otros minerales, beneficioso para la salud ósea y nerviosa.","almendra","Almendra","Consumir crudas, tostadas, en leche o harina","Las almendras son un alérgeno común de los frutos secos.","Las almendras son ricas en grasas saludables, vitamina E y magnesio, promoviendo la salud del corazón y el control del azúcar en sangre.","nuez","Nuez","Las nueces son un alérgeno común de los frutos secos.","Las nueces son excepcionalmente ricas en ácidos grasos omega-3, beneficiando la función cerebral y la salud del corazón.","Las avellanas son un alérgeno común de los frutos secos.","Las avellanas son una buena fuente de grasas monoinsaturadas, vitamina E y manganeso, apoyando la salud del corazón.","castana","Castaña","Castanea sativa","castaño","3-5 castañas al día","Asadas, cocidas o en harina","Tienen un índice glucémico más alto que otros frutos secos, consumir con moderación.","A diferencia de otros frutos secos, las castañas son ricas en carbohidratos complejos y vitamina C, proporcionando energía sostenida.","pistacho","Pistacho","Pistacia vera","alfóncigo","Un puñado (30-40g) al día","Consumir crudos o tostados","Los pistachos son un alérgeno común de los frutos secos.","Los pistachos son ricos en luteína y zeaxantina, antioxidantes importantes para la salud de los ojos.","nuez-de-brasil","Nuez de Brasil","Bertholletia excelsa","castaña amazónica","coquito brasileño","Tiroidea","1-2 nueces al día","El consumo excesivo puede llevar a toxicidad por selenio (selenosis).","Las nueces de Brasil son la fuente natural más rica en selenio, un mineral esencial para la función tiroidea y la protección antioxidante.","nuez-pecana","Nuez Pecana","Carya illinoinensis","nuez de la isla","nuez encarcelada","Consumir crudas o en preparaciones","Las nueces pecanas son un alérgeno de los frutos secos.","Las nueces pecanas son ricas en grasas monoinsaturadas y antioxidantes, ayudando a reducir el colesterol malo (LDL).","anacardo","Anacardo","Anacardium occidentale","cajú","Consumir tostados (crudos son tóxicos)","Los anacardos son un alérgeno común de los frutos secos.","Los anacardos son una buena fuente de cobre y magnesio, minerales importantes para la salud ósea y la producción de energía.","pinon","Piñón","Pinus pinea","pino piñonero","pino manso","pino doncel","Consumir crudos o tostados, en pestos y ensaladas","Los piñones pueden causar reacciones alérgicas.","Los piñones contienen ácido pinolénico, que puede ayudar a suprimir el apetito, y luteína para la salud ocular.","nuez-de-macadamia","Nuez de Macadamia","Macadamia integrifolia","Las nueces de macadamia son un alérgeno de los frutos secos.","Las nueces de macadamia son muy ricas en grasas monoinsaturadas saludables para el corazón, similares a las del aceite de oliva.","Semillas de Amapola","1 cucharadita al día","Añadir a productos horneados, ensaladas o infusiones","Pueden dar falsos positivos en pruebas de opiáceos. Consumir con moderación.","Las semillas de amapola son ricas en minerales como calcio y manganeso, y tienen un ligero efecto sedante.","semillas-de-mostaza","Semillas de Mostaza","Brassica nigra / Sinapis alba","Uso externo en cataplasmas, uso interno con moderación","Cataplasmas, molidas como especia","El uso externo prolongado puede causar irritación o quemaduras en la piel.","Las semillas de mostaza se usan externamente para aliviar dolores musculares y congestión, y como especia para estimular la digestión.","Semillas de Apio","1/2 a 1 cucharadita de semillas, o en extracto","Infusión, extracto o como especia","Puede estimular el útero.","No recomendado en niños pequeños.","Las semillas de apio se utilizan tradicionalmente como diurético y para aliviar el dolor articular asociado con la gota y la artritis.","semillas-de-hinojo","Semillas de Hinojo","Altas dosis pueden ser uterotónicas.","Las semillas de hinojo son excelentes para aliviar gases, hinchazón y cólicos digestivos.","semillas-de-comino","Semillas de Comino","1/2 a 1 cucharadita en infusión o como especia","Infusión, especia en polvo","Puede aumentar la sensibilidad al sol en algunas personas.","El comino es una especia digestiva que ayuda a la secreción de enzimas pancreáticas, mejorando la absorción de nutrientes.","semillas-de-cardamomo","Semillas de Cardamomo","grana del paraíso","Cardamom","Cardamon","Cardamum","Elachi","Hari Elachi","2-3 vainas en infusión o en la comida","Infusión, masticar, especia","Personas con cálculos biliares deben consultar a su médico.","El cardamomo es una especia aromática que ayuda a la digestión, combate el mal aliento y puede ayudar a aliviar la congestión.","semillas-de-cilantro","Semillas de Cilantro","recao","Chinese parsley","Infusión, especia","Las semillas de cilantro ayudan a aliviar problemas digestivos como la indigestión y los gases.","semillas-de-anis","Semillas de Anís","anís","ajenjos dulces","amisa","Anise burnet saxifrage","Saunf","Evitar altas dosis durante el embarazo.","El anís es conocido por su capacidad para aliviar los gases y la hinchazón, y también se usa para la tos y los resfriados.","semillas-de-alcaravea","Semillas de Alcaravea","Carum carvi","alcaravea","alcarabia","alcarahueya","carvia","caravai","alcaravia","comino de prado","alcaraveta","alcarabaca","alcarobea","alkarobea","carbia","txarpoil","txarpoila","Persian cumin","Evitar su uso en grandes cantidades.","Similar al comino y al hinojo, la alcaravea es excelente para tratar la indigestión, los gases y los cólicos.","semillas-de-eneldo","Semillas de Eneldo","anega","aneldo","ezamillo","falso anís","hinojo falso","American Dill","Dillweed","Las semillas de eneldo son útiles para los trastornos digestivos y tradicionalmente se han utilizado para promover la producción de leche materna.","semillas-de-fenogreco","Semillas de Fenogreco","fenugreco","Methi","abish","abesh","1-2 cucharaditas remojadas o en infusión","Remojar, infusión, polvo","El fenogreco se usa para ayudar a controlar el azúcar en sangre, aumentar la producción de leche materna y como antiinflamatorio.","cacahuete","Cacahuete","Arachis hypogaea","cacahuate","tlalcacahuatl (náhuatl)","Un puñado (30g) al día","Crudo, tostado, en mantequilla","El cacahuete es uno de los alérgenos más comunes y severos.","Aunque es una legumbre, se consume como fruto seco. Es rico en proteínas, grasas saludables y resveratrol.","semillas-de-uva","Semillas de Uva","cepa","labrusca","lambrusquera","parra cultivada","parra de uvas","parral","parreña","parrera","ácere","bitau","carrazos","aihena","albillo","Semillas (extracto)","100-300 mg de extracto al día","Extracto en cápsulas o líquido","El extracto de semilla de uva es rico en proantocianidinas, potentes antioxidantes que protegen los vasos sanguíneos.","Semillas de Granada","Semillas (arilos) y aceite de la semilla","Consumir los arilos de media granada; 5-10 ml de aceite","Consumo directo de los arilos, aceite de la semilla","El consumo excesivo del zumo puede interactuar con ciertos medicamentos.","Las semillas de granada son ricas en antioxidantes (punicalaginas) y el aceite de sus semillas contiene ácido púnico, un potente antiinflamatorio.","semillas-de-sandia","Semillas de Sandía","Citrullus lanatus","acendría","sindria","tuera","wild watermelon","citron melon","fodder melon","preserving melon","red-seeded citron","jam melon","stock melon","Kalahari melon","tsamma melon","Afghan melon","bastard melon","bitter apple","bitter melon","camel melon","colocynth","kaffir melon","mickey melon","paddy melon","paddymelon","pie melon","Secas, tostadas o germinadas","Consumir con moderación por su contenido calórico.","Las semillas de sandía son una fuente sorprendente de magnesio, hierro y zinc, y tienen un ligero efecto diurético.","semillas-de-melon","Semillas de Melón","Cucumis melo","melonera","alficoz","cohombro","sandiita","Armenian cucumber","rockmelon","sweet melon","Secas y tostadas","Asegurarse de que no estén amargas, lo que podría indicar compuestos tóxicos.","Similares a las de calabaza, las semillas de melón son ricas en proteínas y grasas saludables, y se han usado como antiparasitarias.","semillas-de-loto","Semillas de Loto","nelumbo","East Indian lotus","Padma","Kamala","10-15g en decocción o cocinadas","Sopas, decocciones, postres","No consumir si se tiene estreñimiento o distensión abdominal.","En la medicina tradicional china, las semillas de loto se usan para tonificar el bazo, los riñones y calmar el espíritu.","Semillas de Nigella (Comino Negro)","Antihistamínica","Semillas y aceite","1-2 cucharaditas de semillas o 1 de aceite al día","Semillas enteras, molidas o en aceite prensado en frío","Puede interactuar con inmunosupresores y anticoagulantes.","Conocida como \\"la semilla bendita\\", se usa tradicionalmente para una amplia gama de dolencias, especialmente para el sistema inmunológico y respiratorio.","castana-de-indias","Castaña de Indias","castaño de sombra","Venotónica","Antiedematosa","Semilla (extracto estandarizado)","Extracto estandarizado (50 mg de escina) 2-3 veces al día","Extracto en cápsulas o gel tópico. NO INGERIR LA SEMILLA CRUDA (TÓXICA).","La semilla cruda es venenosa. Usar solo preparados comerciales estandarizados.","La castaña de Indias es el remedio principal para la insuficiencia venosa crónica, varices y hemorroides, mejorando la circulación.","semillas-de-psyllium","Semillas de Psyllium","Plantago ovata","ispágula","llantén indio","psyllium rubio","zaragatona","pelosilla","arta de agua","cáscara de ispágula","coniza","cutículas de semillas de plantago ovata","hierba pulguera","llantén de perro","plantago de la","woolly plantain","Indian plantain seed","Indian psyllium","Isabgul","Laxante (formador de bolo)","Cáscara de la semilla","1-2 cucharaditas en un vaso grande de agua, 1-3 veces al día","Mezclar la cáscara en polvo con abundante líquido y consumir inmediatamente","Debe tomarse con mucho líquido para evitar el riesgo de asfixia u obstrucción esofágica.","La cáscara de psyllium es una fibra soluble que aumenta el volumen de las heces, siendo muy eficaz para tratar tanto el estreñimiento como la diarrea.","semillas-de-cacao","Semillas de Cacao","cacaotero","pataxte","mocambo","balamte","calabacillo","copoazú","copuazú","cacao blanco","bacao","cacao blanco amazónico","Semillas (nibs o polvo)","10-20g de cacao puro al día","Nibs crudos, polvo en batidos o bebidas","Contiene teobromina, un estimulante. Moderar en caso de hipertensión o ansiedad.","Moderar por su efecto estimulante.","El cacao puro es extremadamente rico en flavonoides antioxidantes, que mejoran la salud cardiovascular y el estado de ánimo.","semillas-de-cafe","Semillas de Café (Grano)","Coffea arabica / robusta","cafeto","cafeto arábico","cafeto de Arabia","arbol del café","English coffee tree","Guatemala coffee","bourbon","Kape","Kahana","Estimulante del SNC","Semillas (granos tostados)","1-3 tazas de café al día (hasta 400 mg de cafeína)","Infusión de los granos molidos y tostados","Limitar la ingesta de cafeína.","Puede elevar la presión arterial temporalmente.","Puede causar insomnio, ansiedad o problemas digestivos en personas sensibles.","El grano de café es la fuente más popular de cafeína, un estimulante que mejora la alerta y la concentración. También es rico en antioxidantes.","semillas-de-guarana","Semillas de Guaraná","guarana seed extract","guaranine","zoom","500-1000 mg de polvo o extracto al día","Polvo añadido a bebidas o cápsulas","Contiene altas dosis de cafeína.","Evitar por su alto contenido en cafeína.","Puede empeorar los síntomas de ansiedad.","El guaraná contiene una concentración de cafeína mucho mayor que el café, proporcionando un efecto estimulante más potente y duradero.","nuez-de-cola","Nuez de Cola","Cola acuminata","nuez de cola","cola de Sudán","árbol de la cola","colatero","abata-kola","caffeine nut","gooranut","gorra","obi","1-3g de la nuez en polvo o extracto","Masticar la nuez fresca, en polvo o extracto","Contiene cafeína y teobromina.","Puede causar insomnio y nerviosismo.","La nuez de cola es un estimulante tradicional africano, conocido por ser uno de los ingredientes originales de las bebidas de cola.","especias-medicinales","Especias medicinales","Reguladora del azúcar en sangre","1-4 gramos al día","Puede interactuar con medicamentos para la diabetes.","La canela es una especia aromática con propiedades medicinales conocidas desde la antigüedad.","clavo","Clavero","1-3 clavos al día","El clavo de olor es conocido por su intenso aroma y sus propiedades analgésicas, especialmente para el dolor de muelas.","pimienta-negra","Pimienta negra","Piper nigrum","Pimienta","Potenciador de la absorción de nutrientes","Una pizca en las comidas","Puede irritar la mucosa gástrica en grandes cantidades.","La pimienta negra no solo añade sabor a los alimentos, sino que también mejora la digestión y la absorción de nutrientes.","1-2 vainas al día","Infusión, masticado","El cardamomo es una especia exótica que ayuda a aliviar problemas digestivos y respiratorios.","nuez-moscada","Nuez moscada","Mirística","Estimulante cerebral","Una pizca, no exceder 1-2 gramos al día","Puede ser tóxica en grandes cantidades.","La nuez moscada se utiliza con moderación para problemas digestivos y como estimulante cerebral.","30 mg al día","El azafrán es la especia más cara del mundo y se ha utilizado tradicionalmente para mejorar el estado de ánimo.","1-5 gramos de semillas al día","El fenogreco es conocido por aumentar la producción de leche materna y ayudar a regular el azúcar en sangre.","Mostaza","ajo amarillo","alezna","amarillas","desajo","floridos","gebena","géniva","hierba meona","jebena","xebana","Uso externo en cataplasmas","Cataplasma, aceite","Puede irritar la piel sensible.","Las semillas de mostaza se utilizan externamente para aliviar dolores musculares y congestión.","pimenton","Pimentón","Capsicum annuum","pimiento morrón","pimiento dulce","pimentón","pimiento de Padrón","pimiento de Herbón","Doux d\' Espagne","chile morrón","chiltepín","locote","green pepper","red pepper","chili pepper","ornamental pepper","Christmas pepper","pimiento","paprika","ancho","jalapeño","pepperoncini","serrano","chilli pepper","Puede causar irritación gástrica en personas sensibles.","El pimentón, derivado de los pimientos rojos, es rico en antioxidantes y puede mejorar la circulación.","Vainilla","Vanilla planifolia","bejuquillo","cuyanquillo","flor negra","segnexanté","vainilla de Papantla","vainilla mansa","vainillero","vainillero de flores aromáticas","West Indian vanilla","commercial vanilla","sisbik-k\'aax","tlilxóchitl","cashisha","Vaina","Extracto, infusión","La vainilla es apreciada por su aroma y sabor, y tiene un efecto calmante sobre el sistema nervioso.","Consultar al médico para el uso en el embarazo.","El jengibre es ampliamente utilizado para aliviar náuseas, problemas digestivos y dolores inflamatorios.","La cúrcuma contiene curcumina, un potente compuesto antiinflamatorio y antioxidante.","anís-estrellado","Anís estrellado","Illicium verum","anís estrellado","anís estrella","anís estrellado chino","badián","badiana de China","anís francés","anís de China","badianero","star anise seed","star aniseed","star of anise","bājiǎo","1-2 estrellas por taza de infusión","No administrar a lactantes y niños pequeños.","El anís estrellado es eficaz para aliviar gases y problemas respiratorios. Es una fuente de ácido shikímico, precursor del oseltamivir.","1/2 - 1 cucharadita de semillas al día","El comino es una especia digestiva que ayuda a aliviar la hinchazón y los gases.","Consumo directo, infusión de semillas","Algunas personas tienen aversión genética a su sabor.","Tanto las hojas (cilantro) como las semillas (coriandro) tienen propiedades digestivas y desintoxicantes.","1-2 cucharaditas de semillas en infusión","El hinojo es excelente para aliviar cólicos, gases y estimular la producción de leche materna.","1-2 hojas en infusión o cocción","Retirar las hojas antes de consumir los alimentos.","Las hojas de laurel facilitan la digestión y ayudan a aliviar los gases y la flatulencia.","1 cucharadita por taza en infusión","Puede elevar la presión arterial en dosis altas.","El romero es conocido por mejorar la circulación y la concentración, además de ser un potente antioxidante.","1-2 cucharaditas por taza en infusión","El tomillo es un potente antiséptico natural, muy eficaz para tratar infecciones respiratorias y la tos.","El orégano, especialmente su aceite, es un poderoso agente antimicrobiano natural.","Consumo culinario, infusión","El aceite esencial debe usarse con precaución.","La albahaca, especialmente la sagrada (Tulsi), es un adaptógeno que ayuda al cuerpo a manejar el estrés.","1 cucharada de hojas por taza en infusión","Puede causar reflujo en personas sensibles.","La menta es muy efectiva para aliviar problemas digestivos como el síndrome del intestino irritable.","Puede ser abortiva.","La salvia es conocida por reducir la sudoración excesiva y aliviar los síntomas de la menopausia.","La mejorana tiene un efecto calmante sobre el sistema nervioso, ayudando a aliviar la ansiedad y el insomnio.","1 cucharadita de semillas en infusión","Infusión, consumo directo","El eneldo es útil para aliviar los cólicos en los bebés y mejorar la digestión.","Cayena","Capsicum annuum var. annuum","pimienta de Cayena","Fulful ahhmar","Filfil ahmar","La zi","Pequeñas cantidades en las comidas","Polvo, tintura","Puede irritar la mucosa gástrica.","La cayena contiene capsaicina, que mejora la circulación y tiene propiedades analgésicas.","Pequeñas cantidades como condimento","Pasta fresca","Su picor intenso puede ser irritante.","El wasabi real tiene potentes propiedades antimicrobianas y ayuda a descongestionar las vías respiratorias.","Similar al jengibre, la galanga se usa para tratar problemas digestivos, inflamación y náuseas.","Macis","flor de la nuez moscada","Arilo (cobertura de la semilla de nuez moscada)","Una pizca","El macis es la especia que recubre la nuez moscada, con un sabor más delicado y propiedades similares.","azafran-de-la-india","Azafrán de la India (Cúrcuma)","azafrán de la India","zafrán","haldi","Conocida comúnmente como cúrcuma, es una de las especias con mayor poder antiinflamatorio.","pimienta-de-jamaica","Pimienta de Jamaica","Pimenta dioica","pimienta de Jamaica","malagueta","pimienta malagueta de las Antillas","pimienta de Tabasco","pimienta Chiapa","pimienta guayabita","xocoxóchitl","Fruto seco","Polvo, entero","Combina los sabores de canela, nuez moscada y clavo. Se usa para problemas digestivos.","Semillas de apio","1/2 cucharadita en infusión","Evitar en caso de enfermedad renal.","Las semillas de apio son un diurético natural y ayudan a aliviar la inflamación asociada a la artritis y la gota.","sumac","Zumaque (Sumac)","Rhus coriaria","Puede causar reacción en personas alérgicas a los anacardos.","El zumaque tiene un sabor ácido y es rico en antioxidantes. Se investiga por sus beneficios en el control del azúcar.","1-4 gramos de raíz seca al día","Puede elevar la presión arterial con el uso prolongado.","El regaliz es emoliente y antiinflamatorio, útil para la tos, úlceras gástricas y fatiga adrenal.","1 cucharadita de bayas en infusión","Puede ser abortivo.","No usar en caso de enfermedad renal.","Las bayas de enebro son un potente diurético y antiséptico, utilizadas para infecciones urinarias.","Asafétida","Ferula assa-foetida","asafétida","estiércol del diablo","hing","heeng","Resina de la raíz","Una pizca muy pequeña en la cocción","Con un olor muy fuerte, la asafétida es extremadamente eficaz para combatir los gases y la hinchazón abdominal.","pimienta-de-sichuan","Pimienta de Sichuan","Zanthoxylum piperitum","pimienta de Sichuan","pimentero japonés","cayatuna","chopi","Korean pepper","Japanese prickly-ash","Analgésico local","Cáscara del fruto","Entera o molida","Produce una sensación de hormigueo característica en la boca.","No es una pimienta real, pero produce una sensación única de hormigueo y adormecimiento. Se usa para dolores y problemas digestivos.","Semillas de amapola","Rico en minerales","1-2 cucharaditas","Puede dar falsos positivos en pruebas de opiáceos.","Las semillas de amapola tienen un efecto calmante y son ricas en calcio, magnesio y zinc.","Semillas de Nigella (Comino negro)","1-2 cucharaditas de aceite o semillas al día","Aceite prensado en frío, semillas enteras","Conocido como \\"la semilla bendita\\", el comino negro tiene una amplia gama de beneficios, especialmente para el sistema inmunológico y las alergias.","Ajwain","Trachyspermum ammi","Bhutika","Ajamodika","Yamini","Yaminiki","Yaviniki","Deepyaka","1/2 cucharadita masticada o en infusión","Masticar, infusión","Similar al tomillo en sabor, el ajwain es un remedio excepcional para la indigestión, los gases y los cólicos.","polvo-de-mango-seco","Polvo de mango seco (Amchur)","aamchur","amchur","khatai","Acidulante","Fruto verde seco y molido","El amchur se hace de mangos verdes secos y se usa para dar un sabor ácido a los platos. Ayuda en la digestión.","Semillas de granada secas (Anardana)","Semillas secas","Polvo o enteras","Las semillas de granada secas añaden un sabor agridulce y son ricas en antioxidantes que protegen el corazón.","haba-tonka","Haba Tonka","Dipteryx odorata","haba tonka","cumaruna","cumarú","cumbarú","sarrapia","tagua","Brazilian teak","Usar con extrema moderación, rallar una pequeña cantidad","Rallada","Contiene cumarina, no usar con anticoagulantes.","Prohibida como aditivo alimentario en algunos países por su contenido de cumarina.","El haba tonka tiene un aroma complejo a vainilla, almendra y canela. Debe usarse con mucha precaución.","pimienta-larga","Pimienta larga","Piper longum","pimienta larga","pippali","pipli","lendi peepar","pipal","kapala","katikasira","Bio-potenciador","Rejuvenecedor","Más picante que la pimienta negra, usar con moderación.","En Ayurveda, la pimienta larga (Pippali) es un potente rejuvenecedor y se usa para mejorar la absorción de otros remedios.","Cubeba (Pimienta de Java)","Piper cubeba","pimienta de Java","cubeb vine","true pepper","pepper vine","comet-tail peppercorn","Uso culinario moderado","Molida","La cubeba tiene un sabor picante y alcanforado. Se ha utilizado tradicionalmente para infecciones urinarias y problemas respiratorios.","plantas-suculentas-y-cactus-medicinales","Plantas suculentas y cactus medicinales","Planta suculenta muy conocida por el gel de sus hojas, que tiene numerosas propiedades medicinales, especialmente para la piel.","Nopal","pera de cactus","penca","Cladodios (pencas) y frutos (tunas)","1-2 pencas al día. 1-3 tunas al día.","Cactus muy popular en la gastronomía mexicana, con importantes propiedades para regular el azúcar y el colesterol en sangre.","fruta del dragón","pitajaya","pitaya de mayo","pitaya xoconostle","pitahaya amarilla","pitahaya roja","night-blooming cereus","strawberry pear","1-2 frutos al día.","Consumo directo del fruto fresco.","Fruta exótica conocida como fruta del dragón, rica en antioxidantes y fibra, beneficiosa para la digestión y la salud en general.","Siempreviva","Sempervivum tectorum","siempreviva mayor","barba de Júpiter","consolva","alcachofa de gatos","hierba puntera","piñuela","zurracayoye","hierba de todo el año","Machacar las hojas y aplicar el jugo sobre la zona afectada.","Planta suculenta que crece en forma de roseta, utilizada tradicionalmente para aliviar dolores y curar heridas.","Kalanchoe","Kalanchoe pinnata","hoja del aire","yerba bruja","libertadora","admirable","amor","belladona","bolsita","bruja","flor de arete","flor fresca","hierba maravillosa","hierba de la lechuza","hoja fresca","hoja vidriosa","life plant","Goethe plant","Infusión de 1-2 hojas en una taza de agua, 2 veces al día.","Infusión de las hojas.","Planta suculenta con hojas carnosas, utilizada en la medicina tradicional para tratar diversas dolencias, incluyendo tumores.","1 cucharada de savia al día.","Extracción de la savia (aguamiel) para consumo directo. Infusión de las hojas.","El sirope de agave tiene un alto contenido de fructosa, consumir con moderación.","Planta suculenta de gran tamaño, de la que se extrae el aguamiel y se elabora el pulque y el tequila. Tiene propiedades medicinales.","Peyote","Lophophora williamsii","mescal","devil\'s root","divine cactus","dumpling cactus","mescal buttons","Botones del cactus","Consumo directo de los botones secos o frescos.","Cactus sin espinas conocido por sus propiedades alucinógenas debido a la mescalina. Utilizado en ceremonias rituales.","sabila","acíbar","apabila","azabila","babosa","gamonita","pita perfoliada","pita zabila","pitazábila","zabida","zabila","zabin","yerba babosa","Nombre común para el Aloe Vera, planta suculenta muy conocida por el gel de sus hojas, que tiene numerosas propiedades medicinales, especialmente para la piel.","organo","Órgano","Pachycereus marginatus","órgano","chilayo","Mexican fence post","Cactus columnar de gran tamaño, utilizado tradicionalmente para aliviar dolores e inflamaciones.","Chumbera","higuera de chumbo","pita","cardón","chumbo","chumbua","higo chumbo","higo de pala","higo México","nopal de Castilla","Cladodios (pencas) y frutos (higos chumbos)","1-2 pencas al día. 1-3 higos chumbos al día.","Nombre común para el Nopal, cactus muy popular en la gastronomía mediterránea, con importantes propiedades para regular el azúcar y el colesterol en sangre.","Echeveria","Echeveria elegans","rosa de alabastro","echeverio","white Mexican rose","Planta suculenta ornamental con hojas carnosas en forma de roseta. Se le atribuyen propiedades antiinflamatorias y cicatrizantes.","Sedum","Sedum acre","pampajarito","pan de cuco","uva de gato","vermicular","siempreviva picante","goldmoss sedum","Puede ser irritante para algunas personas, realizar una prueba de sensibilidad.","Planta suculenta rastrera con pequeñas hojas carnosas. Se utiliza para tratar heridas y quemaduras leves.","Yucca","Yucca filamentosa","yuca deshilachada","aguja de Adán","bayoneta española","palma aguja","Spanish bayonet","needle palm","spoon-leaf yucca","common yucca","beargrass","silk grass","Infusión de 1 cucharadita de raíz seca en una taza de agua, 2 veces al día.","Infusión de la raíz.","Planta suculenta con hojas en forma de espada y una alta concentración de saponinas, que le confieren propiedades antiinflamatorias.","san-pedro","Echinopsis pachanoi","achuma","huachuma","wachuma","aguacolla","hahuacollay","lapituq","tsuná","Decocción del tallo.","Cactus columnar con propiedades alucinógenas similares al peyote, utilizado en la medicina tradicional andina.","Fenestraria","Fenestraria rhopalophylla","planta ventana","dedos de bebé","Planta suculenta con hojas translúcidas que parecen ventanas. Se utiliza para hidratar y refrescar la piel.","lithops","Lithops","Lithops spp.","Piedras vivas","Piedras vivientes","Cacto piedra","Cactus piedra","Plantas piedra","beeskloutjie","skaappootjie","perdeklou","Plantas suculentas conocidas como \'piedras vivientes\' por su apariencia. Se les atribuyen propiedades hidratantes.","gasteria","Gasteria","Gasteria spp.","Lengua de buey","Lengua de vaca","Lengua de suegra","Planta suculenta con hojas gruesas y moteadas. Se utiliza de forma similar al Aloe Vera para tratar problemas de piel.","haworthia","Haworthia","Haworthia spp.","Planta suculenta pequeña con hojas en roseta, a menudo con bandas o manchas blancas. Se utiliza para tratar heridas y quemaduras.","crassula","Crassula","Crassula ovata","Planta de jade","Árbol de jade","Planta suculenta conocida como \'árbol de jade\'. Se utiliza en la medicina tradicional para tratar verrugas y otras afecciones de la piel.","senecio","Senecio","Senecio rowleyanus","Rosario de perlas","Planta del rosario","Algunas especies de Senecio son tóxicas, usar con precaución.","Planta suculenta colgante con hojas en forma de perlas. Se utiliza para aliviar dolores e inflamaciones.","euphorbia","Euphorbia","Euphorbia tirucalli","Árbol de los dedos","Arbusto de leche","Aplicación tópica con extrema precaución.","Aplicación directa del látex sobre la zona afectada.","El látex es cáustico y puede causar irritación severa. No ingerir.","Planta suculenta con tallos cilíndricos y un látex blanco y tóxico. Se investigan sus propiedades antitumorales.","stapelia","Stapelia","Stapelia gigantea","Flor de carroña","Estrella de mar","Planta suculenta con flores grandes y malolientes. Se utiliza para aliviar dolores e inflamaciones.","hoodia","Hoodia","Hoodia gordonii","xhoba","ghaap","Planta suculenta originaria de Sudáfrica, conocida por su capacidad para suprimir el apetito.","caralluma","Caralluma","Caralluma fimbriata","makada singi","mangana kodu","choong","kalli moolian","karallamu","Planta suculenta utilizada en la India para suprimir el apetito y aumentar la resistencia.","opuntia-streptacantha","Nopal cardón","Tuna cardona","Cladodios (pencas)","1-2 pencas al día.","Asado, cocido, en licuados o en ensaladas.","Especie de nopal utilizada en la medicina tradicional mexicana para tratar problemas digestivos y dolores.","plantas-adaptogenas","Plantas adaptógenas","Estimulante del sistema nervioso central","Reduce la fatiga","200-400 mg de extracto estandarizado al día","Interactúa con anticoagulantes y medicamentos para la diabetes.","Planta perenne cuya raíz se ha utilizado durante siglos en la medicina tradicional china para mejorar la energía y la vitalidad.","Aumenta la fuerza muscular","300-500 mg de extracto de raíz dos veces al día","Polvo, cápsulas, tintura","Puede inducir el aborto.","Puede interactuar con sedantes y medicamentos para la tiroides.","Hierba fundamental en la medicina ayurvédica, conocida por sus propiedades restauradoras y rejuvenecedoras.","rhodiola","Rhodiola","Rhodiola rosea","rodiola","Aumenta la resistencia al estrés","200-600 mg al día de extracto estandarizado","Puede causar irritabilidad o insomnio en algunas personas.","Planta que crece en regiones frías y montañosas de Europa y Asia, utilizada para aumentar la resistencia física y mental.","Aumenta la resistencia física","Mejora la función inmunológica","Mejora la concentración","300-1200 mg de extracto al día","Cápsulas, extracto líquido, té","No recomendado para personas con presión arterial alta.","Conocido como ginseng siberiano, es un arbusto leñoso que se utiliza para mejorar la resistencia y el bienestar general.","schisandra","Schisandra","Schisandra chinensis","omija","omicha","Mejora la resistencia y el rendimiento","Propiedades antioxidantes","500-2000 mg de polvo de bayas al día","Planta trepadora leñosa cuyas bayas se utilizan en la medicina tradicional china por sus múltiples beneficios para la salud.","albahaca-sagrada","Albahaca Sagrada (Tulsi)","Ocimum tenuiflorum","hot basil","tulsi","tulasi","300-600 mg de extracto al día","Té, cápsulas, extracto líquido","Considerada una planta sagrada en la India, se utiliza en la medicina ayurvédica para promover la longevidad y el bienestar.","Mejora la calidad del sueño","Cuerpo fructífero del hongo","1-1.5 g de extracto en polvo al día","Puede interactuar con anticoagulantes y medicamentos para la presión arterial.","Hongo conocido como el \\"hongo de la inmortalidad\\" en la medicina tradicional china, valorado por sus efectos sobre el sistema inmunológico y la longevidad.","Mejora la función respiratoria","Mejora la función renal","Hongo parásito que crece en larvas de insectos, utilizado en la medicina tradicional china para mejorar la energía, la resistencia y la función pulmonar.","Mejora la libido y la fertilidad","Equilibra las hormonas","Polvo, cápsulas","Personas con problemas de tiroides deben consultar a un médico.","Planta originaria de los Andes peruanos, cultivada por su raíz nutritiva que se utiliza para aumentar la energía, la fertilidad y la resistencia.","Protege el sistema cardiovascular","Aumenta la energía","20-30 gramos en decocción o 500 mg de extracto 3-4 veces al día","Planta fundamental en la medicina tradicional china, utilizada para fortalecer el sistema inmunológico y proteger el cuerpo contra diversas enfermedades.","Potente antiinflamatorio","Mejora la función cerebral","Alivia el dolor articular","1-3 gramos de polvo de rizoma al día","Altas dosis pueden causar malestar estomacal.","Especia de color amarillo brillante, ampliamente utilizada en la cocina y la medicina ayurvédica por sus potentes propiedades antiinflamatorias.","Alivia las náuseas y el mareo","Alivia el dolor muscular","1-2 gramos de rizoma fresco o en polvo al día","Infusión, decocción, polvo, cápsulas","Planta con un rizoma aromático y picante, utilizada en todo el mundo como especia y como remedio para problemas digestivos y náuseas.","bacopa","Bacopa","Mejora la memoria y la función cognitiva","Propiedades neuroprotectoras","300-450 mg de extracto estandarizado al día","Puede interactuar con sedantes.","Planta utilizada en la medicina ayurvédica para mejorar la memoria, el aprendizaje y la concentración, y para reducir la ansiedad.","gotu-kola","Gotu Kola","spadeleaf","Promueve la cicatrización de heridas","600-1800 mg de hierba seca al día","Té, cápsulas, extracto, uso tópico","Puede causar somnolencia.","Planta perenne utilizada en la medicina tradicional de Asia para mejorar la función cerebral, promover la salud de la piel y mejorar la circulación.","Regula el azúcar en sangre","Propiedades antitumorales","1-3 gramos de extracto al día","Cápsulas, extracto, cocinado","Puede potenciar los efectos de los medicamentos para la diabetes y la hipertensión.","Hongo comestible que crece en la base de los árboles, valorado en Japón por sus propiedades medicinales, especialmente para el sistema inmunológico.","Rica en nutrientes y antioxidantes","Reduce el azúcar en sangre","6-10 gramos de polvo de hoja al día","Polvo, cápsulas, té, cocinada","La raíz y la corteza pueden ser abortivas.","Árbol de crecimiento rápido originario del sur de Asia, conocido como el \\"árbol milagroso\\" por el alto valor nutritivo de sus hojas.","amla","emblic","emblic myrobalan","myrobalan","Muy rica en vitamina C y antioxidantes","Mejora la salud del cabello y la piel","1-3 gramos de polvo de fruta al día","Polvo, jugo, cápsulas, fruto fresco o seco","Puede aumentar el riesgo de sangrado en personas con trastornos hemorrágicos.","Fruto de un árbol originario de la India, es una de las fuentes más ricas de vitamina C y un pilar en la medicina ayurvédica.","Alivia el dolor de la artritis","Propiedades antivirales","250-350 mg de extracto estandarizado 1-3 veces al día","Interactúa con inmunosupresores y anticoagulantes.","Liana trepadora de la selva amazónica, utilizada tradicionalmente para tratar una amplia gama de dolencias, especialmente las relacionadas con la inflamación y el sistema inmune.","Tonifica el Qi y la sangre","6-15 gramos en decocción","Generalmente segura, pero evitar en casos de resfriado o gripe aguda.","Conocida como el \\"ginseng de los pobres\\", es una raíz utilizada en la medicina tradicional china para tonificar la energía vital (Qi) y fortalecer el cuerpo.","Relajante nervioso","Tónico para el sistema nervioso","2-4 gramos de hojas secas en infusión, 3 veces al día","Infusión, extracto líquido, licor","Arbusto aromático nativo de México, América Central y el Caribe, tradicionalmente utilizado como afrodisíaco y tónico para el sistema nervioso.","Madreselva","Lonicera japonica","golden-and-silver honeysuckle","Madreselva de Japón","Alivia el dolor de garganta","Flores y tallos","6-15 gramos de flores en decocción","Puede causar malestar estomacal en algunas personas.","Planta trepadora con flores fragantes, utilizada en la medicina tradicional china para tratar infecciones, fiebre y dolor de garganta.","Demulcente (alivia la irritación de las mucosas)","Apoya la salud digestiva","Talo completo","4-8 gramos secos al día","Decocción, gel, añadido a alimentos","Puede afectar la absorción de otros medicamentos si se toma al mismo tiempo.","Alga roja que se encuentra en las costas rocosas del Atlántico Norte, rica en carragenina, que le confiere propiedades demulcentes y espesantes.","Sedante y ansiolítico","Alivia los espasmos musculares","4-8 gramos de hierba seca al día en infusión","Infusión, extracto líquido, cápsulas","Planta trepadora nativa de América, conocida por sus flores exóticas y sus propiedades calmantes sobre el sistema nervioso, utilizada para tratar el insomnio y la ansiedad.","Apoya la salud suprarrenal","Alivia las úlceras gástricas","1-4 gramos de raíz seca al día en decocción","El uso prolongado puede causar hipertensión y retención de líquidos.","Planta cuya raíz dulce se ha utilizado durante milenios tanto en la confitería como en la medicina para tratar problemas digestivos, respiratorios y suprarrenales.","2-4 gramos de hojas frescas al día","Consumo directo, infusión, aceite esencial","Hierba aromática popular en la cocina mediterránea, también valorada por sus propiedades medicinales para aliviar el estrés y mejorar la digestión.","Promueve la cicatrización","Mejora la circulación venosa","60-120 mg de extracto estandarizado al día","Cápsulas, extracto, crema tópica","También conocida como Gotu Kola, es una hierba perenne utilizada en la medicina tradicional para mejorar la función cerebral y la salud de la piel.","Tonifica el bazo y el Qi","Elimina la humedad","Fortalece el sistema digestivo","6-12 gramos en decocción","Evitar en casos de sequedad o deficiencia de líquidos corporales.","Rizoma utilizado en la medicina tradicional china para fortalecer la función digestiva, tonificar la energía y eliminar el exceso de humedad del cuerpo.","Bala","Sida cordifolia","country mallow","heart-leaf sida","ilima","Aumenta la fuerza y la resistencia","Apoya la salud del sistema nervioso","Raíz y planta entera","3-6 gramos de polvo al día","Polvo, decocción, aceite medicado","Usar con precaución, puede ser estimulante.","Hierba importante en Ayurveda, cuyo nombre significa \\"fuerza\\". Se utiliza como tónico para aumentar la energía, la resistencia y la masa muscular.","Brahmi","Promueve un sueño reparador","5-10 gramos de polvo de hierba al día","Polvo, infusión, aceite medicado","Puede causar náuseas o malestar estomacal en algunas personas.","Reconocida hierba ayurvédica para el cerebro, utilizada tradicionalmente para mejorar todas las facetas de la función mental y calmar el sistema nervioso.","Guduchi","Tinospora cordifolia","giloy","Inmunomodulador potente","1-3 gramos de polvo de tallo al día","Polvo, decocción, extracto","Puede interactuar con inmunosupresores y medicamentos para la diabetes.","Planta trepadora muy venerada en Ayurveda, conocida como \\"Amrita\\" o néctar de la inmortalidad, por su capacidad para limpiar, rejuvenecer y fortalecer todo el organismo.","Potente antioxidante","Apoya la salud gastrointestinal","1-3 gramos de extracto en polvo al día","Té, extracto, tintura","Hongo que crece en los abedules de climas fríos, con aspecto de carbón quemado. Es muy apreciado por su altísimo contenido de antioxidantes y sus propiedades para reforzar el sistema inmune.","ginseng-americano","Ginseng Americano","Panax quinquefolius","sang","Ayuda a regular el azúcar en sangre","200-400 mg de extracto al día","No recomendado durante el embarazo.","Interactúa con anticoagulantes como la warfarina.","Variedad de ginseng nativa de América del Norte. A diferencia del ginseng asiático, se considera más calmante y menos estimulante, ideal para combatir el estrés sin sobreexcitar.","Asparagus racemosus","buttermilk root","climbing asparagus","water root","wild asparagus","satawar","satamuli","Tónico reproductor femenino","Apoya la lactancia","Calma el tracto digestivo","500-1000 mg de extracto de raíz, 2 veces al día","Polvo, cápsulas, decocción","Personas alérgicas a los espárragos deben evitarla.","Considerada la principal hierba rejuvenecedora para las mujeres en Ayurveda. Apoya la salud reproductiva en todas las etapas de la vida, desde la menstruación hasta la menopausia.","tribulus","Tribulus","Tribulus terrestris","bull\'s head","Aumenta la libido","Apoya la salud del tracto urinario","Fruto y raíz","250-750 mg de extracto estandarizado al día","Puede agravar condiciones de próstata.","Planta que crece en climas secos, utilizada en la medicina tradicional china y ayurvédica para aumentar la vitalidad, la libido y el rendimiento físico.","Mejora la circulación cerebral","Potencia la memoria y la concentración","Alivia los síntomas del vértigo","120-240 mg de extracto estandarizado al día, dividido en 2-3 dosis","Aumenta el riesgo de sangrado si se toma con anticoagulantes.","No tomar antes de una cirugía.","Uno de los árboles más antiguos del mundo, sus hojas se utilizan para mejorar la circulación sanguínea, especialmente en el cerebro, mejorando así la memoria y la función cognitiva."],"bloques":[[2491,2492,[[803,804,805,[20,[806,807,808,809,810,811,812,813,814,815,200],2,[816,817,818,819,820],0,[225,226],1,[225,226]],[61,37,66,59],22,2493,38,[],null,2494,[3,8]],[367,368,369,[2,[370,371,372,373],0,[123],1,[123]],[98,6,12,66],70,2495,124,[[9,1229],[47,374]],null,2496,[8,3,10]],[444,445,446,[2,[447,448,449,450,451,452],0,[151,152,153],1,[151,152,153],29,[200,453,454]],[60,18,821],70,2497,227,[],null,2498,[11]],[99,455,456,[2,[457,458,459,460,461,462,463,464],32,[465,466,467,468],0,[99,154,155],1,[99,154,155]],[67,138,6,36],22,2499,124,[],null,2500,[3,4]],[822,1230,1231,[2,[1232,1233,823,469,824,825,1234,1235],42,[1236],29,[1237,1238,1239,1240],0,[470,471,472,473,474,475],1,[470,471,472,473,474,475]],[37,66,62,228],22,2501,38,[[63,2502]],null,2503,[3,8]],[823,2504,2505,[2,[825,2506,469,822,2507],0,[1241,1242,1243,1244,1245],1,[1241,1242,1243,1244,1245],29,[2508,2509,2510,2511,2512]],[37,66,61],22,201,38,[],null,2513,[3]],[116,1246,826,[2,[827,828,476,829],48,[156],477,[156],1247,[156],0,[229,116,478],1,[229,116,478],29,[1248,375,1249,1250]],[36,39,1251],376,2514,202,[],null,2515,[3,71]],[2516,2517,2518,[2,[2519,2520],0,[1252,1253,1254,1255,1256,1257,1258,1259],1,[1252,1253,1254,1255,1256,1257,1258,1259],29,[2521,2522,2523,2524,2525,2526]],[25,2527,13],479,2528,202,[[9,2529]],null,2530,[15,4]],[377,480,378,[2,[379,481],0,[125,157,158,159,160,161,162],1,[125,157,158,159,160,161,162],29,[380,482]],[39,36,50],376,1260,38,[],null,2531,[3]],[830,831,832,[2,[833,834,835,836,837,838,839],0,[230,231,232,233,234],1,[230,231,232,233,234],29,[840,841,842]],[36,39,18],22,2532,38,[[5,2533]],null,2534,[3,11]],[483,484,485,[2,[381,486,487,382,383,488,489,490,491,492,493,494,495,496,497,498,499,500,501],0,[163,164,165,166,167,168,169],1,[163,164,165,166,167,168,169],29,[502,503,504,505,506,507]],[12,60,235,843],22,2535,384,[[9,2536],[72,844]],null,2537,[23,33]],[1261,1262,1263,[2,[1264,1265,1266,1267,1268,1269,1270,1271,1272,1273,1274,1275,1276,1277],0,[508,509],1,[508,509],29,[1278,1279,1280,1281]],[43,37,61],70,2538,38,[],null,2539,[8,3]],[845,2540,2541,[2,[2542,2543,2544,2545,2546,2547,1282,2548,2549,2550,2551],0,[1283,845,1284,1285,1286,1287,1288,1289,1290,1291],1,[1283,845,1284,1285,1286,1287,1288,1289,1290,1291],29,[2552]],[36,203,2553],22,2554,38,[[9,2555]],null,2556,[3]],[2557,2558,2559,[20,[2560,2561,2562,2563,1292,2564,2565],2,[2566,1292,2567],0,[1293,1294,1295],1,[1293,1294,1295]],[2568,36,2569],22,170,100,[],null,2570,[4,3]],[846,847,510,[2,[848,849,850,851,852,853,854,855,236,856,857,858,859,860,861],0,[237,238,239,240,241],1,[237,238,239,240,241]],[39,18,25,385],2571,1260,2572,[],null,2573,[3,11,34]],[1296,1297,862,[2,[1298,1299,1300],0,[511,512,513],1,[511,512,513],29,[1301,1302]],[39,36,50],41,2574,2575,[],null,2576,[3]],[2577,386,514,[2,[1303,1304,1305,2578],0,[1306,1307],1,[1306,1307],29,[1308,2579,2580,2581,2582,2583]],[39,36,18],2584,863,38,[],null,2585,[3,11]],[126,387,242,[243,[244,117,245],388,[246,247],48,[248,249,101,250],17,[389,117,126,390,101],0,[391,92,392,393,394],1,[92],14,[395]],[12,6,93,1309],64,2586,2587,[[19,118]],null,2588,[16,3,4]],[251,252,253,[48,[254],255,[256],17,[257,258,259,260],0,[261,102],1,[102],262,[263],103,[264],127,[265]],[396,13,36,2589],64,2590,2591,[[47,2592]],null,2593,[3,16,10]],[1310,1311,1312,[2,[1313,1314],0,[515,516],1,[515,516]],[73,90,2594],104,2595,2596,[[76,2597]],null,2598,[23,3]],[2599,864,1315,[2,[2600,2601],0,[1316],1,[1316],29,[2602,2603,2604]],[2605,44,39],1317,2606,1318,[],null,2607,[33,3]],[865,1319,866,[2,[1320,1321],0,[517,518],1,[517,518]],[36,39,18],41,2608,2609,[],null,2610,[3,11]],[867,868,869,[2,[870],0,[266,267],1,[266,267]],[268,6,119],871,2611,2612,[[9,2613]],null,2614,[30,8]],[397,398,399,[2,[400,401,402],0,[128,403,404],1,[128]],[59,94,60,35],53,2615,124,[],null,2616,[8,7]],[2617,1322,1323,[2,[469,519,2618,2619,824,405,2620,2621],0,[1324,1325,1326,1327,1328,1329,1330,1331,1332],1,[1324,1325,1326,1327,1328,1329,1330,1331,1332],29,[2622,2623,2624,2625,2626]],[43,51,37,94],22,201,38,[],null,2627,[8,3]],[2628,2629,2630,[2,[2631,2632,2633],0,[1333,1334,1335],1,[1333,1334,1335],29,[2634]],[204,25,18],22,2635,202,[],null,2636,[15,71]],[872,873,874,[2,[875,876,877,878,879],0,[269,270,271,272,273],1,[269,270,271,272,273],29,[880,881,882,883]],[37,18,205],2637,2638,406,[[9,407],[76,2639]],null,2640,[3,8,11]],[1336,2641,2642,[2,[2643,2644,2645,884,2646,2647,1337,2648],0,[1338,1339],1,[1338,1339],29,[1340,884,2649]],[37,60,2650],206,520,38,[],null,2651,[3,34]],[1341,1342,1343,[2,[1344,1345,1346,1347,1348,1349,1350,1351],0,[521],1,[521],29,[1352,1353]],[18,522,51],91,201,227,[[9,274]],null,2652,[11]],[1354,1355,2653,[2,[1356,1357,1358,1359],0,[523,524,525,526,527],1,[523,524,525,526,527],29,[1360,1361,1362,1363,1364]],[203,207,36],70,2654,38,[[9,2655],[63,2656]],null,2657,[3]],[1365,2658,2659,[2,[2660,2661,2662,2663,2664,2665,2666,1365],0,[1366,1367,1368,1369,1370],1,[1366,1367,1368,1369,1370],29,[2667]],[25,39,207],528,1371,406,[[9,407]],null,2668,[15,3]],[2669,2670,885,[2,[886,887,888,889,2671],0,[208,275,276,277,278,529,1372],1,[208,275,276,277,278,529,1372],29,[890,2672,2673]],[74,891,13,87],41,2674,2675,[],null,2676,[4,11,7]],[530,892,531,[2,[532,893,894,895,896,897],0,[279,280,281,282,283,284,285],1,[279,280,281,282,283,284,285],29,[533,898,899,900]],[385,73,2677],41,2678,2679,[[9,2680]],null,2681,[23,34,3]],[2682,2683,1373,[2,[1374,1375,1376,1377,1378],0,[534,901,902,903,904],1,[534,901,902,903,904]],[286,408,18],41,2684,2685,[[5,2686]],null,2687,[16,11]],[2688,2689,2690,[0,[1379,1380,1381,1382,1383,1384],1,[1379,1380,1381,1382,1383,1384],29,[2691,2692,2693,2694]],[36,13,67],22,170,100,[],null,2695,[3]],[905,2696,2697,[27,[2698,2699,2700,2701,2702,2703,2704,2705,2706,2707,2708],0,[905,1385,1386,1387],1,[905,1385,1386,1387]],[203,50,39],70,2709,2710,[[9,2711],[63,2712]],null,2713,[3]],[2714,2715,2716,[2,[1388,1389,2717,2718,2719,2720,2721,2722,2723,2724],0,[1390,1391,1392,1393,1394],1,[1390,1391,1392,1393,1394],29,[1389,1388,2725,2726]],[21,906,12],528,1371,406,[],null,2727,[3,10]],[2728,2729,2730,[2,[2731,2732,2733,2734,2735,2736,2737,2738,2739,2740,2741,2742,383,2743,2744],0,[1395,1396,1397,1398],1,[1395,1396,1397,1398]],[21,907,2745],91,2746,384,[],null,2747,[33,3]],[287,908,909,[2,[287,910,911,912,913,914,915],0,[288,289,290,291,292,293],1,[288,289,290,291,292,293],29,[916,917,918,919,920]],[66,921,12],64,2748,535,[],null,2749,[3]],[536,2750,2751,[2,[2752,2753,536,2754,2755,1399],83,[519,2756,922],28,[2757,922,2758],2759,[2760,2761],243,[2762,922,2763,1399,2764,2765],0,[536,1400,1401,1402,1403,1404],1,[536,1400,1401,1402,1403,1404],29,[2766,2767,2768,2769]],[36,105,129,67],1405,2770,38,[],null,2771,[3,8,4]],[537,1406,1407,[2,[537,1408],0,[538,1409],1,[538],29,[1410,1411]],[84,409,2772],2773,2774,77,[[5,2775]],null,2776,[3]],[923,2777,2778,[2,[2779,2780],0,[923,1412,1413,1414,1415,1416],1,[923,1412,1413,1414,1415,1416],14,[2781,2782,2783],29,[2784,2785,2786]],[2787,73,539],22,2788,202,[],null,2789,[23,10]],[294,1417,1418,[0,[294,540],1,[294,540],29,[1419]],[139,295,13],64,924,2790,[],null,2791,[11,3]],[1420,1421,2792,[2,[1422],28,[541],0,[542,1423],1,[542]],[66,60,925],70,2793,38,[],null,2794,[3,11]],[543,544,545,[2,[171,546,130,410],27,[411,547],17,[171,130],0,[548,549,550],1,[551]],[35,12,60,209],53,2795,2796,[[24,2797]],null,2798,[7,3]],[1424,1425,1426,[2,[1427,1428,1429],27,[1430,1431],17,[1432,1433],48,[1434],0,[552,1435,1436],1,[1437,552]],[1438,18,2799],106,2800,100,[],null,2801,[11,15,4]],[1439,1440,1441,[2,[1442,1443,1444],17,[1445],0,[553,554,1446],1,[553,554]],[412,18,12,80],2802,2803,2804,[],null,2805,[7,11,23]],[2806,2807,2808,[2,[405,2809,2810],28,[405],42,[405],48,[405],0,[1447],1,[1447]],[37,66,59,61],22,520,38,[],null,2811,[3,8]],[1448,1449,1450,[2,[1451,1452,1453,1454],0,[555,556,557],1,[555,556,557]],[18,80,413],53,2812,38,[],null,2813,[11]],[172,558,559,[2,[560,561,562],17,[563,564],28,[172],0,[173,565,566],1,[173,567]],[80,12,88,413],106,2814,384,[],null,2815,[11,3,7]],[1455,1456,1457,[2,[1458,1459,1460],48,[568],17,[568],0,[569,570],1,[569,570]],[1461,25,140],53,2816,2817,[],null,2818,[33]],[1462,1463,1464,[2,[1465,1466,1467,1468,1469,1470,1471,1472,1473,1474,1475,1476,1477],0,[571,572,573,574,575],1,[571,572,573,574,575,1478,1479]],[12,62,576,31],91,520,38,[[24,2819]],null,2820,[16,15]],[1480,2821,1481,[2,[2822,2823,2824,2825,2826,2827,2828,1482,2829,2830,2831],42,[2832,926],0,[414,1483,927,1484,1485,1486,1487,1488,1489,1490,1491],1,[414,1483,927,1484,1485,1486,1487,1488,1489,1490,1491]],[906,209,12,37],91,520,38,[[9,274]],null,2833,[34,3,10]],[1492,1493,1494,[2,[1495,1496,1497,1498,1499,1500,1501,415,926,1502,1503,1504,1505,1506],0,[577,578,579,580,581],1,[577,578,579,580,581]],[209,928,1507],206,2834,38,[[9,2835]],null,2836,[34,3]],[415,929,930,[2,[931,932,933,934,236,935,936,937,938,939,940,941,942,943,944,945,946,947],0,[296,297,298,299,300,301,302,303,304,305,306],1,[296,297,298,299,300,301,302,303,304,305,306]],[210,203,416,207],206,2837,38,[[9,2838],[72,2839]],null,2840,[3]],[1508,1509,1510,[2,[1511,1512,1513,1514,1515,1516,1517,1518,1519,1520,1521],0,[582,583],1,[582,583]],[43,948,120,1522],2841,2842,307,[[5,2843]],null,2844,[8,23]],[584,1523,1524,[2,[1525,1526,1527,1528],1529,[1530,1531,1532],17,[584],1533,[1534,1535,1536,1537],0,[585,586,587,588,589],1,[585,586,587,588,589]],[43,2845,590,94],949,2846,1538,[[19,1539]],null,2847,[8]],[950,951,952,[2,[953,954,955,956,957,958],0,[308,309,310,131],1,[308,309,310,131]],[209,61,286],206,2848,38,[[9,2849],[5,2850]],null,2851,[34,3]],[2852,2853,2854,[2,[2855,1337,2856,1336,2857,2858,2859,2860,2861,2862,2863,2864,2865,884,2866,2867,2868,1340],0,[1540,1541],1,[1540,1541]],[37,66,60,18],206,201,38,[],null,2869,[3,11]],[959,2870,2871,[0,[959,1542,1543,1544,1545,1546,1547,1548],1,[959,1542,1543,1544,1545,1546,1547,1548],29,[2872,2873,2874,2875,2876,2877,2878,2879,2880]],[960,12,18,90],376,2881,2882,[],null,2883,[4,11,7]]]],[2884,2885,[[311,961,1549,[2,[962,963,964,965],27,[966,967],28,[311],0,[968,969,970],1,[971,972],14,[973,974]],[37,12,211,174,59],53,141,38,[],null,2886,[3,8,7]],[975,976,977,[2,[132,85,978],20,[85],17,[85,979],45,[85],32,[85,980],0,[132,312],1,[132,312]],[12,35,1550,89],591,2887,2888,[],null,2889,[7,3,4]],[1551,313,1552,[2,[313,1553,1554],20,[313],0,[592],1,[592]],[2890,314,6,2891],2892,2893,2894,[],null,2895,[10,4]],[593,594,595,[2,[596,597,598,599,600,601],0,[602,175,176],1,[175,176]],[18,139,73],22,2896,2897,[],null,2898,[11,23]],[1555,417,981,[2,[417,1556,1557,1558,1559],20,[417],0,[603,604,605],1,[603,604,605]],[31,95,1550,21],212,141,38,[],null,2899,[15,7,16]],[1560,606,1561,[2,[606,607,1562],28,[607],0,[608],1,[608]],[268,120,57],91,107,982,[[19,2900]],null,2901,[8,30]],[251,252,253,[48,[254],255,[256],17,[257,258,259,260],0,[261,102],1,[102],262,[263],103,[264],127,[265]],[396,13,67,51],64,1563,2902,[],null,2903,[3,11]],[444,445,446,[2,[447,448,449,450,451,452],0,[151,152,153],1,[151,152,153],29,[200,453,454]],[44,18,6],70,141,2904,[],null,2905,[11,3,4]],[397,398,399,[2,[400,401,402],0,[128,403,404],1,[128]],[59,35,62],53,2906,2907,[],null,2908,[8,7]],[609,610,983,[2,[610,984,1564,1565],28,[1566,1567],0,[611,612],1,[611,612]],[59,31,61],53,141,38,[],null,2909,[8,15]],[1568,418,985,[2,[418,613,614],20,[418,613,614,1569],0,[615],1,[615]],[25,204,98],479,141,2910,[[9,1570],[19,2911]],null,2912,[15,3,4]],[616,419,419,[2,[108,617,618],0,[108,177],1,[108,177]],[2913,6,420],22,107,2914,[[19,1571]],null,2915,[10,8]],[2916,619,1572,[28,[619,986],0,[619,986],1,[619,986]],[98,6,25],22,2917,2918,[],null,2919,[8,4,15]],[99,455,456,[2,[457,458,459,460,461,462,463,464],32,[465,466,467,468],0,[99,154,155],1,[99,154,155]],[6,138,67,13,891],22,2920,2921,[],null,2922,[3,11,4]],[620,621,622,[2,[623,178,624],27,[625,626],28,[179,178],0,[627,628,629],1,[630],14,[179]],[211,57,50],106,141,38,[],null,2923,[8,10,3]],[1573,987,1574,[2,[987,1575],0,[631],1,[631]],[13,57,180],104,107,2924,[[63,2925],[72,2926],[19,1571]],null,2927,[16,8]],[988,109,1576,[20,[109,989],0,[109,315],1,[109,315]],[44,2928,73],1577,107,2929,[[5,2930]],null,2931,[7,3,23]],[632,633,634,[2,[635,636,637,638,639,640,641,642,643,644,645,646,647,648,649,650],0,[181,182,421,651],1,[181,652,653,182,654,655]],[6,25,67,21],2932,2933,2934,[],null,2935,[15,10,33]],[1578,656,1579,[2,[656],0,[657],1,[657]],[180,409,25,59],990,2936,1580,[[5,2937]],null,2938,[3,15,8]],[991,2939,316,[2,[110,317,318],27,[110,992],0,[319,142,143],1,[319,320]],[44,13,25,84],53,141,38,[],null,2940,[11,15,3]],[121,68,993,[20,[68,96],17,[68,96],45,[68,96],32,[68,96],0,[321,68,322],1,[321,68,322]],[422,2941,37],40,2942,2943,[[5,2944]],null,2945,[3,23]],[658,659,660,[103,[661],662,[663],127,[664],0,[183,184,185],1,[183,184,185]],[75,74,133],40,107,982,[],null,2946,[8,4,10]],[1581,994,1582,[2,[994,1583],0,[665],1,[665]],[36,995,39],22,141,38,[],null,2947,[3]],[1584,666,1585,[2,[666,1586],0,[667,668],1,[667,668]],[1587,996,25],479,2948,1588,[],null,2949,[10,15,4]],[997,669,998,[2,[669,999],0,[670],1,[670]],[25,186],22,1589,2950,[[5,2951]],null,2952,[10,15]],[1590,1591,1592,[0,[671],1,[671]],[44,25,59],1593,2953,672,[],null,2954,[7,15,8]],[1000,1594,1001,[2,[1002,1003,1004],0,[323,1005,1006,1007],1,[1008,323]],[57,2955,43],2956,1589,2957,[[5,2958]],null,2959,[8]],[377,480,378,[2,[379,481],0,[125,157,158,159,160,161,162],1,[125,157,158,159,160,161,162],29,[380,482]],[50,39,35],1595,2960,1596,[],null,2961,[3,34,7]],[1597,324,673,[2,[324],20,[324],0,[674],1,[674]],[36,84,25],2962,2963,2964,[],null,2965,[3,15]],[415,929,930,[2,[931,932,933,934,236,935,936,937,938,939,940,941,942,943,944,945,946,947],0,[296,297,298,299,300,301,302,303,304,305,306],1,[296,297,298,299,300,301,302,303,304,305,306]],[995,675,36],70,2966,982,[[9,1570],[72,2967]],null,2968,[3]],[325,1598,1599,[0,[325,676,1600,1601,1602],1,[325,676],14,[1603,1604,1605]],[2969,43,120],40,107,2970,[[5,2971]],null,2972,[8,30]],[950,951,952,[2,[953,954,955,956,957,958],0,[308,309,310,131],1,[308,309,310,131]],[50,43,207],22,2973,2974,[[9,2975],[5,2976]],null,2977,[8,34]],[543,544,545,[2,[171,546,130,410],27,[411,547],17,[171,130],0,[548,549,550],1,[551]],[12,35,60],53,2978,2979,[],null,2980,[7,3]],[677,1009,678,[2,[679,1010,1011,1012,1013,1014,1015,1016,1017,1018,1019,1020,1021,1022,1023,1024],0,[187,680],1,[187,1025,1026]],[144,13,6],26,2981,2982,[],null,2983,[4,16]],[2984,681,2985,[20,[681],86,[681],32,[681]],[2986,1027,13],1405,107,77,[],null,2987,[8,10]],[682,1606,2988,[2,[682,1607],0,[683,1608],1,[683,1609]],[67,423,78],2989,107,2990,[],null,2991,[3,11,33]],[846,847,510,[2,[848,849,850,851,852,853,854,855,236,856,857,858,859,860,861],0,[237,238,239,240,241],1,[237,238,239,240,241]],[25,39,18],1610,2992,2993,[],null,2994,[3,15,11]],[519,1028,1323,[2,[1028,1322,1611],20,[1028,1611],0,[1612],1,[1612]],[59,43,36],22,141,38,[],null,2995,[8,3]],[2996,1029,2997,[2,[1029,2998],20,[1029,2999],0,[1613,1614],1,[1613,1614]],[409,84],3000,3001,3002,[[5,3003]],null,3004,[3]],[3005,1030,3006,[0,[1030],1,[1030]],[1031,213,84],214,3007,3008,[],null,3009,[3,23]],[3010,1615,3011,[2,[1615,3012],0,[1616,1617],1,[1616,1617]],[43,57,948],1618,3013,3014,[[5,3015]],null,3016,[8]],[3017,3018,3019,[0,[1619],1,[1619]],[3020,57],64,3021,77,[],null,3022,[16]],[3023,1620,3024,[2,[1620,3025],0,[1621],1,[1621]],[75,140],3026,107,3027,[],null,3028,[8]],[3029,3030,3031,null,[675],3032,1622,3033,[],null,3034,[7]],[3035,1032,3036,[0,[1032],1,[1032]],[98,3037],3038,3039,3040,[[5,3041]],null,3042,[8]],[3043,684,684,[0,[684],1,[684]],[3044,13],64,1622,3045,[],null,3046,[7]],[3047,1623,3048,[2,[1623,3049],0,[1624],1,[1624]],[180,1033],3050,107,38,[],null,3051,[4,16]],[3052,1625,1625,null,[36,67],3053,107,77,[],null,3054,[3,4]],[1626,188,1627,[20,[188],17,[188],45,[188]],[13,1628,18],22,3055,1034,[],null,3056,[11,4]],[1629,326,1630,[17,[326],45,[326]],[84,25,424],3057,107,3058,[],null,3059,[3,15,11]],[530,892,531,[2,[532,893,894,895,896,897],0,[279,280,281,282,283,284,285],1,[279,280,281,282,283,284,285],29,[533,898,899,900]],[36,73,1035],41,3060,3061,[],null,3062,[3,23,34]],[58,685,686,[27,[58,111,112],17,[58,111,112],83,[687,425,688],32,[58,111,112],0,[58,189,190],1,[58,189,190]],[13,133,78],3063,3064,3065,[],null,3066,[10,4]],[1036,689,690,[2,[689,145],0,[145,191],1,[145,191]],[35,3067,327],22,3068,3069,[],null,3070,[7,3,10]],[1631,1632,1037,[0,[328,426],1,[328,426]],[427,6,329],26,3071,3072,[],null,3073,[10,3]],[1038,1039,1040,[2,[1041,1042,1043,1044,1045,1046,1047,1048,1049,1050,1051],0,[330,331,332,333,334,335],1,[330,331,332,333,334,335]],[95,691,12,174],528,3074,3075,[],null,3076,[7,71,15,3]],[172,558,559,[2,[560,561,562],17,[563,564],28,[172],0,[173,565,566],1,[173,567]],[80,12,3077,88],106,3078,3079,[],null,3080,[11,3,7]],[1633,1052,514,[2,[1052,386],20,[386],0,[336],1,[336]],[39,36,129,18],41,3081,38,[],null,3082,[3,11,8]],[483,484,485,[2,[381,486,487,382,383,488,489,490,491,492,493,494,495,496,497,498,499,500,501],0,[163,164,165,166,167,168,169],1,[163,164,165,166,167,168,169],29,[502,503,504,505,506,507]],[60,12,21,209,73],22,3083,384,[[9,1634],[72,3084]],null,3085,[3,34,23,33]],[367,368,369,[2,[370,371,372,373],0,[123],1,[123]],[134,57,6,39],70,3086,3087,[],null,3088,[10,16,3,8]],[113,1635,1636,[42,[113,1637,1638],28,[113],48,[113],0,[113],1,[113],14,[1639]],[329,692,25,129],22,3089,38,[[9,1634],[5,3090]],null,3091,[3,15,8]]]],[3092,3093,[[593,594,595,[2,[596,597,598,599,600,601],0,[602,175,176],1,[175,176]],[18,44,13,295],22,3094,124,[[9,1640],[63,3095]],null,3096,[11]],[3097,3098,1574,[2,[3099,3100,3101],0,[1641],1,[1641]],[57,13,180],104,337,77,[[24,3102],[19,1642]],null,3103,[16,8]],[1053,984,983,[2,[3104,3105,1643,3106,3107,1644,1645,3108,3109,609,3110,3111,3112,3113,3114,3115,1053],0,[1646,1054],1,[1647,1054]],[59,43,50,1055],53,215,38,[[5,1056]],null,3116,[8]],[1648,3117,3118,[2,[1648,3119,3120,1649],17,[1649],0,[3121,3122],1,[3123]],[133,73,6],22,215,38,[],null,3124,[10,23]],[216,3125,3126,[27,[693,216],17,[693,216],83,[693,216],32,[693,216],0,[216,1650,1651,1652],1,[216,1650,1651,1652],14,[3127]],[67,138,1057,13],3128,3129,3130,[[9,694]],null,3131,[7,4]],[58,685,686,[27,[58,111,112],17,[58,111,112],83,[687,425,688],32,[58,111,112],0,[58,189,190],1,[58,189,190]],[78,6,13],1058,3132,3133,[],null,3134,[4,3]],[616,1059,419,[2,[108,617,618],0,[108,177],1,[108,177]],[3135,6,338],22,3136,3137,[[19,1642]],null,3138,[8,10]],[3139,3140,1653,[2,[1654,1655,1656],0,[695,1657,696],1,[695,696]],[327,13,1658],41,3141,3142,[[9,1640]],null,3143,[10]],[1659,3144,3145,[2,[3146,3147,3148,3149,3150,3151,1659],0,[1660,1661],1,[3152,1661,1660]],[25,13,57],1662,215,339,[],null,3153,[16,15]],[3154,3155,3156,[2,[3157,3158,3159,3160,3161,3162,3163],0,[1663,3164,1664],1,[1664,3165,1663]],[25,204,13],3166,215,339,[],null,3167,[15,7]],[3168,3169,3170,[2,[3171,3172],17,[3173,1665],0,[1666,1667,3174,3175],1,[1667,1666]],[21,1587,50],3176,337,3177,[],null,3178,[10,11]],[1665,3179,3180,[2,[3181,3182,3183,3184,3185,3186,3187],0,[3188],1,[3189]],[18,44,424],3190,215,3191,[],null,3192,[11]],[3193,3194,3195,[2,[3196],0,[1668,1669],1,[1668,1669]],[44,18,59],3197,3198,672,[],null,3199,[11,8]],[3200,3201,3202,[0,[1670,1671],1,[1670,1671]],[13,6],3203,1060,3204,[],null,3205,[4]],[1672,3206,3207,[2,[1673,1674,3208,1675,3209,1676,3210,3211],28,[3212,1676,1675,3213,3214,1674,1673,1672,3215,3216],0,[1677,1678,1679],1,[1677,1678,1679]],[21,13,44],104,3217,77,[],null,3218,[33,7]],[3219,3220,3221,[2,[3222,3223,3224,3225],0,[1680,1681],1,[1681,1680]],[44,18,105],1682,337,77,[],null,3226,[11]],[697,1683,1061,[2,[1684,1685],42,[697],0,[698,1686,699],1,[700,699,698]],[21,138,73],1687,215,339,[],null,3227,[7,23]],[1644,1688,3228,[2,[1688],0,[1689],1,[1689]],[87],1682,1690,1691,[[5,3229]],null,3230,[4]],[1062,1063,701,[2,[702,1064],27,[1065,1066],0,[340,341,342,1067],1,[340,1068,1069,342,341,1070]],[186,133,59],3231,215,307,[[19,3232]],null,3233,[10,8]],[1071,1692,1072,[2,[1692],0,[1693],1,[1693]],[21,13,327],1662,703,77,[],null,3234,[10,7]],[3235,1694,3236,[2,[1694],0,[1695],1,[1695]],[21,13],104,703,77,[],null,3237,[7]],[3238,1696,3239,[2,[1696],0,[1697],1,[1697]],[21,13],3240,703,77,[],null,3241,[7]],[3242,3243,1698,[2,[3244,3245,3246,3247,3248,1073,3249,3250,3251,3252],0,[3253,1699],1,[1699,3254,3255,3256,3257],14,[3258]],[135,21],1074,3259,3260,[],null,3261,[4]],[830,831,832,[2,[833,834,835,836,837,838,839],0,[230,231,232,233,234],1,[230,231,232,233,234],29,[840,841,842]],[36,39,18],22,1700,1596,[],null,3262,[3,11]],[1701,1702,3263,[0,[704,1703],1,[704]],[120,13],3264,3265,3266,[],null,3267,[8]],[3268,3269,3270,[0,[1704],1,[1704]],[44,67,138],3271,3272,672,[[5,3273]],null,3274,[7]],[705,3275,3276,[42,[705,3277,1705],28,[705,3278,3279,1705,3280,3281,3282,3283,3284,3285],17,[3286,3287,705,3288],0,[1706,3289],1,[1706],14,[3290,3291]],[3292,140,98],104,337,77,[],null,3293,[4]],[113,1635,1636,[42,[113,1637,1638],28,[113],48,[113],0,[113],1,[113],14,[1639]],[329,692,36],22,3294,38,[[9,694]],null,3295,[3]],[3296,1075,3297,[17,[1075],45,[1075,3298],14,[3299]],[3300,105,3301],104,1690,1691,[],null,3302,[4]],[1707,1708,1709,[20,[343,344],17,[343,344],45,[343,344]],[35,13,51],3303,3304,1710,[],null,3305,[7,3]],[1711,3306,3307,[42,[1711,3308,1712,3309,3310,3311],28,[1712,3312,3313,3314],0,[1713,1714],1,[1713,1714],14,[3315]],[78,3316],3317,1060,3318,[],null,3319,[3]],[1076,3320,3321,[42,[1076,3322,3323],28,[1076],0,[1715,3324],1,[1715],14,[3325]],[18,44],3326,1700,227,[],null,3327,[11]],[3328,1716,3329,[2,[1716],0,[1717],1,[1717]],[424,18,44],3330,3331,1034,[],null,3332,[11]],[425,1077,3333,[0,[1077,1718],1,[1077,1718]],[80,13,21],3334,3335,3336,[],null,3337,[3,33]],[1719,3338,3339,[2,[1719,3340,3341],27,[3342,3343],0,[1720,3344,3345],1,[1720]],[217,78,18],3346,3347,3348,[],null,3349,[3]],[1721,3350,1722,[2,[1721,3351,3352,3353],0,[706,3354],1,[706]],[80,78,88],3355,3356,3357,[[24,1078]],null,3358,[7,3]],[3359,707,3360,[20,[707],86,[707],32,[707],0,[1723],1,[1723]],[21,105],104,337,77,[],null,3361,[3]],[3362,345,3363,[20,[345,3364],86,[345],32,[345],0,[345,1724],1,[345,1724]],[25,80,105],3365,337,77,[],null,3366,[15]],[3367,1725,3368,[2,[1725,3369],0,[1726],1,[1726]],[13,57,44],3370,3371,3372,[],null,3373,[16,7]],[428,1727,429,[2,[1727],0,[1728],1,[1728]],[21,203,6],3374,3375,3376,[],null,3377,[3,10]],[1729,430,1730,[20,[430,431],17,[430,431],45,[430,431],32,[430,431],0,[1731],1,[1731]],[21,217,44],3378,1732,3379,[],null,3380,[3]],[1079,1733,1080,[2,[1733],0,[1734],1,[1734]],[84,80,18],3381,3382,1735,[],null,3383,[3,7]],[1081,3384,3385,[20,[3386,1081],17,[3387,3388,3389],32,[1081],0,[3390,3391,3392],14,[3393]],[3394,1057],1074,3395,3396,[[5,3397]],null,3398,[]],[708,3399,3400,[2,[708,218],20,[708,1736],0,[1737],1,[1737]],[44,135,3401],26,1060,3402,[],null,3403,[4,3]],[709,710,711,[2,[712,713,714,715,716,717],0,[192,718,719,720],1,[192]],[21,114,13],1687,1732,3404,[],null,3405,[15]],[1082,3406,3407,[2,[1082,3408],20,[1082,432],0,[1738],1,[1738]],[88,18,73],3409,3410,202,[],null,3411,[3,23]],[3412,3413,1739,[2,[1740,1741],20,[1741],0,[721,1742,1083],1,[721,1083]],[43,36,50],3414,3415,124,[],null,3416,[8,3]],[682,1606,3417,[2,[682,1607],0,[683,1608],1,[683,1609]],[21,13,35],104,703,77,[],null,3418,[7]],[1084,3419,1743,[2,[1084,3420],0,[1085,1744],1,[1085,1744]],[25,21,79],3421,3422,202,[],null,3423,[15]]]],[3424,3425,[[367,368,369,[2,[370,371,372,373],0,[123],1,[123]],[6,13,44,134,39],70,3426,3427,[[9,1086],[47,3428]],null,3429,[3,8,10,7]],[397,398,399,[2,[400,401,402],0,[128,403,404],1,[128]],[59,120,44,57,35],53,3430,3431,[[24,1745],[19,3432]],null,3433,[8,7,30]],[3434,3435,3436,[2,[1746],27,[1746,1747],0,[1748,3437,3438],1,[1748,1747]],[21,13,3439,35],990,3440,3441,[[5,3442]],null,3443,[7,10]],[1062,1063,701,[2,[702,1064],27,[1065,1066],0,[340,341,342,1067],1,[340,1068,1069,342,341,1070]],[186,133,3444,43],3445,3446,3447,[[19,3448],[9,1749]],null,3449,[10,8]],[1750,3450,1751,[2,[3451,1752,1753],27,[1754,722],0,[722,723,1087,1088],1,[722,723,1087,1088]],[3452,3453,207],3454,3455,3456,[[9,1089],[19,3457]],null,3458,[34,23]],[3459,3460,1755,[2,[3461,3462],0,[1756,1757],1,[1756],14,[1757]],[114,25,21],22,3463,3464,[[9,1090],[63,3465],[5,3466]],null,3467,[15]],[1758,3468,1759,[2,[1091,1760,1092],0,[219,346,1093,1094,1095,1096],1,[346,219,1097,1098]],[3469,6,13],3470,3471,3472,[[19,3473],[5,3474]],null,3475,[15,4]],[3476,3477,724,[2,[1099,725,1100],0,[347,3478],1,[347]],[3479,1101,25,348],3480,3481,3482,[[47,3483]],null,3484,[4,16,11,7]],[726,1761,1762,[2,[726,1763],0,[727,1764],1,[727]],[3485,3486,39,1033],3487,3488,3489,[[9,3490],[5,3491]],null,3492,[15,3,16]],[709,710,711,[2,[712,713,714,715,716,717],0,[192,718,719,720],1,[192]],[114,21,25,13],1765,3493,3494,[[5,3495]],null,3496,[15,3]],[136,1766,3497,[2,[136,3498,1767],20,[136],0,[1768,3499,1102],1,[1768,3500]],[95,31,412,12],3501,3502,3503,[[19,3504],[5,3505]],null,3506,[7,16,15]],[1769,3507,3508,[2,[1769,3509,3510],0,[1770,3511],1,[1770]],[327,13,1658,25],1103,3512,3513,[[47,3514],[9,1749]],null,3515,[10]],[1771,3516,1772,[2,[1771,1104,3517],0,[1773,3518],1,[1773]],[44,18,424,21],1105,3519,3520,[[9,3521]],null,3522,[11,7,3]],[3523,3524,3525,[2,[3526,3527,3528],0,[1774,3529],1,[1774]],[51,67,35,1027],3530,3531,3532,[[5,3533]],null,3534,[4,7,11]],[1775,3535,3536,[2,[1775,3537,3538],0,[1776,3539,1777],1,[1776,1777]],[114,25,13,129],3540,3541,3542,[[5,3543]],null,3544,[15,16,8]],[1106,1107,316,[2,[110,317,1108,318,1109,1110,1111],27,[110,1112,1113,1114],0,[349,143,142,1115,1116,1117,1118,1119,1120],1,[320,349,142,143],14,[1121,1122]],[3545,1123,13,25],3546,3547,3548,[[5,3549]],null,3550,[11,4]],[1492,1493,1494,[2,[1495,1496,1497,1498,1499,1500,1501,415,926,1502,1503,1504,1505,1506],0,[577,578,579,580,581],1,[577,578,579,580,581]],[3551,928,203,692],206,3552,3553,[[9,3554],[72,1778],[24,3555]],null,3556,[3,34]],[1779,3557,3558,[2,[1779,3559],17,[3560,3561],0,[3562,3563],1,[3564,3565]],[1123,204,105,416],990,3566,3567,[[5,3568]],null,3569,[4]],[1780,3570,3571,[2,[1780,3572],17,[3573],0,[1781,3574],1,[3575,1781]],[21,1782,3576],70,3577,3578,[[5,3579]],null,3580,[7,33]],[1783,3581,3582,[2,[1783,3583,3584],0,[1784,3585],1,[3586,1784]],[3587,3588,3589],3590,3591,3592,[[5,3593]],null,3594,[]],[3595,3596,3597,[2,[3598,3599,3600],0,[1785,3601],1,[1785]],[105,21,140],1786,3602,3603,[[5,3604]],null,3605,[4,3]],[1787,3606,3607,[2,[1787,3608,3609],0,[1788,3610],1,[1788]],[105,409,180],1765,3611,3612,[[5,3613]],null,3614,[4]],[3615,3616,1789,[2,[1790,1791],0,[728,1792,1124],1,[728,1125]],[1793,6,35,74],3617,3618,3619,[[5,350]],null,3620,[4,7,10]],[1794,3621,3622,[2,[1794,3623],0,[1795,1796],1,[1795,1796]],[1797,13,180,51],26,3624,3625,[[5,3626]],null,3627,[11,4,7]],[1798,3628,1799,[2,[1798,3629],0,[1800,3630],1,[1800]],[3631,416,3632,13],3633,3634,3635,[[9,3636],[72,1778],[5,3637]],null,3638,[7,3,4]],[3639,3640,1801,[2,[3641,1802,3642],0,[1803,3643],1,[1803]],[186,21,348],3644,3645,3646,[[19,3647]],null,3648,[10,3]],[3649,3650,3651,[2,[3652,3653,3654],0,[1804,3655],1,[3656,1804]],[3657,25,3658],3659,3660,3661,[[9,3662],[47,3663],[5,3664]],null,3665,[10]],[3666,3667,678,[2,[3668,677,679],0,[187,680],1,[187]],[1793,21,13,3669],3670,3671,3672,[[5,3673]],null,3674,[4,16,7]],[3675,3676,3677,[2,[381,3678,3679,3680],0,[1805,3681],1,[1805]],[13,35,3682],22,3683,3684,[[5,3685]],null,3686,[7]],[3687,3688,3689,[2,[3690,3691,3692],0,[1806],1,[1806]],[36,39,50,995],91,3693,1126,[[9,3694]],null,3695,[3]],[3696,3697,3698,[2,[3699,3700,3701],0,[1807,3702,3703],1,[1807]],[3704,18,138,50],91,3705,3706,[[9,3707],[47,3708],[5,3709]],null,3710,[11,3,4]],[1808,3711,3712,[2,[1808,3713,3714],0,[1809,3715],1,[1809]],[3716,3717],3718,3719,3720,[[5,3721]],null,3722,[]],[3723,3724,3725,[2,[3726,3727,3728],0,[3729,3730,1810],1,[3731,3732,1810]],[3733,43,21,133],104,3734,3735,[[9,3736]],null,3737,[34,16,8]],[1752,3738,1751,[2,[1750,1753,1754],0,[723,722,1087],1,[723,1088]],[235,3739,3740],1074,3741,3742,[[9,433],[72,433],[19,3743]],null,3744,[34,23]],[3745,3746,3747,null,[84,21,105],1786,3748,3749,[[9,433],[5,3750]],null,3751,[3]],[3752,3753,1772,[42,[1104,3754,3755,1811,3756,1812],28,[1104,1811,1812],0,[1813,3757],1,[1813],14,[3758]],[44,18,21],1105,3759,1814,[[9,3760]],null,3761,[11,3]],[3762,3763,1815,null,[3764,3765,139],1816,3766,3767,[[9,1127],[72,1127]],null,3768,[3,71]],[3769,3770,3771,null,[3772,21,18],1816,3773,3774,[[19,3775]],null,3776,[71,4]],[3777,3778,3779,null,[43,57,522],1618,3780,3781,[[9,1127],[5,3782]],null,3783,[8,30]],[1817,1818,1819,null,[119,205,3784,25],22,3785,3786,[[9,433],[76,1820]],null,3787,[8,34,30]],[3788,3789,981,null,[79,25,35,21],1128,3790,3791,[[5,3792]],null,3793,[16,15,7]],[593,594,595,[2,[596,597,598,599,600,601],0,[602,175,176],1,[175,176]],[18,3794,295,105],22,3795,3796,[[63,3797],[9,1129]],null,3798,[11]],[3799,3800,3801,null,[139,6,13],22,3802,3803,[[5,3804]],null,3805,[7,16]],[3806,3807,3808,null,[57,13],3809,3810,3811,[[24,3812]],null,3813,[16]],[3814,3815,3816,null,[906,35,60],3817,3818,3819,[[5,3820]],null,3821,[7]],[3822,3823,3824,null,[18,13,36],22,3825,3826,[[9,3827]],null,3828,[11,3]],[3829,3830,3831,null,[13,1033],3832,3833,3834,[[5,3835]],null,3836,[16]],[3837,3838,3839,null,[89,80,6],3840,3841,3842,[[5,3843]],null,3844,[7]],[3845,3846,3847,null,[21,13,35],3848,3849,3850,[[24,3851]],null,3852,[3,7,33]],[1821,3853,1822,null,[21,80,13],3854,3855,3856,[[5,3857]],null,3858,[3,11]]]],[3859,3860,[[975,976,977,[2,[132,85,978],20,[85],17,[85,979],45,[85],32,[85,980],0,[132,312],1,[132,312]],[35,12,89,60],591,3861,3862,[[9,1130],[72,1131]],null,3863,[7,3,4]],[251,252,253,[48,[254],255,[256],17,[257,258,259,260],0,[261,102],1,[102],262,[263],103,[264],127,[265]],[13,396,36,6],1823,3864,3865,[[47,1824],[19,1825]],null,3866,[3,11,4]],[126,387,242,[243,[244,117,245],388,[246,247],48,[248,249,101,250],17,[389,117,126,390,101],0,[391,92,392,393,394],1,[92],14,[395]],[12,6,93,1309],1823,3867,3868,[[9,3869],[19,3870]],null,3871,[3,4,16]],[1826,1827,1828,null,[57,13,81,139],3872,1829,3873,[[5,3874]],null,3875,[4,3,7]],[1830,1831,1832,null,[12,434,51,6],1833,3876,1834,[[9,1132],[19,729]],null,3877,[4,16]],[1707,1708,1709,[20,[343,344],17,[343,344],45,[343,344]],[35,12,51,62],3878,3879,3880,[[9,3881]],null,3882,[7,3]],[1629,326,1630,[17,[326],45,[326]],[12,62,60,18],3883,3884,3885,[[9,1132]],null,3886,[16,11,15,7]],[3887,3888,1835,null,[6,75,12],26,3889,3890,[],null,3891,[10,4]],[1133,3892,1836,null,[98,75,140,57],41,3893,3894,[[47,3895],[9,3896]],null,3897,[8]],[3898,3899,1572,null,[98,6,31,37],3900,3901,3902,[[47,3903]],null,3904,[8,3]],[121,68,993,[20,[68,96],17,[68,96],45,[68,96],32,[68,96],0,[321,68,322],1,[321,68,322]],[422,12,37],40,97,3905,[[5,3906]],null,3907,[3,16]],[658,659,660,[103,[661],662,[663],127,[664],0,[183,184,185],1,[183,184,185]],[115,140,75,81],40,3908,3909,[[47,3910],[19,3911]],null,3912,[8,4,23]],[620,621,622,[2,[623,178,624],27,[625,626],28,[179,178],0,[627,628,629],1,[630],14,[179]],[43,94,61],3913,3914,3915,[[9,1132],[19,1056]],null,3916,[8,30]],[988,109,3917,[20,[109,989],0,[109,315],1,[109,315]],[1837,12,60],3918,3919,3920,[[76,3921]],null,3922,[3,7]],[632,633,634,[2,[635,636,637,638,639,640,641,642,643,644,645,646,647,648,649,650],0,[181,182,421,651],1,[181,652,653,182,654,655]],[6,13,114,1838],435,3923,3924,[],null,3925,[15,10,33]],[991,1839,316,[2,[110,317,318],27,[110,992],0,[319,142,143],1,[319,320]],[51,436,12,18],3926,3927,3928,[[5,3929]],null,3930,[11,4]],[1626,188,1627,[20,[188],17,[188],45,[188]],[1628,18,522,13],22,3931,3932,[[19,1825]],null,3933,[11]],[58,685,686,[27,[58,111,112],17,[58,111,112],83,[687,425,688],32,[58,111,112],0,[58,189,190],1,[58,189,190]],[69,6,12,73],1058,3934,3935,[[9,3936]],null,3937,[4,3,10]],[1036,1840,690,[2,[689,145],0,[145,191],1,[145,191]],[35,1841,351,12],437,3938,3939,[[5,3940]],null,3941,[7,10,8]],[1631,1632,1037,[0,[328,426],1,[328,426]],[6,93,427,434],26,3942,3943,[],null,3944,[3,4,10]],[1038,1039,1040,[2,[1041,1042,1043,1044,1045,1046,1047,1048,1049,1050,1051],0,[330,331,332,333,334,335],1,[330,331,332,333,334,335]],[95,31,12,90],3945,3946,3947,[[24,3948]],null,3949,[7,71,15]],[172,558,559,[2,[560,561,562],17,[563,564],28,[172],0,[173,565,566],1,[173,567]],[80,12,18,88],106,3950,3951,[],null,3952,[11,3,7]],[1633,3953,514,[2,[1052,386],20,[386],0,[336],1,[336]],[39,18,50,1035],3954,3955,1814,[[24,1134]],null,3956,[3,11]],[483,484,485,[2,[381,486,487,382,383,488,489,490,491,492,493,494,495,496,497,498,499,500,501],0,[163,164,165,166,167,168,169],1,[163,164,165,166,167,168,169],29,[502,503,504,505,506,507]],[60,12,21,843],22,3957,3958,[[9,3959],[72,844]],null,3960,[3,8,33]],[367,368,369,[2,[370,371,372,373],0,[123],1,[123]],[134,39,6,13],70,3961,3962,[[47,3963]],null,3964,[10,3,8,16]],[311,961,3965,[2,[962,963,964,965],27,[966,967],28,[311],0,[968,969,970],1,[971,972],14,[973,974]],[37,12,211,61],53,3966,3967,[[24,3968]],null,3969,[3,8,7]],[1551,313,1552,[2,[313,1553,1554],20,[313],0,[592],1,[592]],[139,133,427,314],3970,3971,3972,[[19,3973]],null,3974,[10,4,11]],[593,594,595,[2,[596,597,598,599,600,601],0,[602,175,176],1,[175,176]],[18,44,295,13],22,3975,3976,[[63,3977]],null,3978,[11]],[1555,3979,981,[2,[417,1556,1557,1558,1559],20,[417],0,[603,604,605],1,[603,604,605]],[31,79,35,21],1128,3980,3981,[[5,3982]],null,3983,[15,16,7]],[1560,606,1561,[2,[606,607,1562],28,[607],0,[608],1,[608]],[268,120,35,51],91,3984,3985,[[19,3986],[5,3987]],null,3988,[30,8,7]],[444,445,446,[2,[447,448,449,450,451,452],0,[151,152,153],1,[151,152,153],29,[200,453,454]],[44,18,50,36],70,201,3989,[],null,3990,[11,3,4]],[397,398,399,[2,[400,401,402],0,[128,403,404],1,[128]],[59,94,60,62],53,3991,3992,[],null,3993,[8,30,3994]],[609,610,3995,[2,[610,984,1564,1565],28,[1566,1567],0,[611,612],1,[611,612]],[43,94,436,61],1842,201,1126,[],null,3996,[8,30]],[1568,3997,985,[2,[418,613,614],20,[418,613,614,1569],0,[615],1,[615]],[31,95,907,210],528,3998,3999,[[5,4000]],null,4001,[3,15]],[616,1059,419,[2,[108,617,618],0,[108,177],1,[108,177]],[4002,338,6],22,4003,4004,[[19,4005]],null,4006,[8,10]],[99,455,456,[2,[457,458,459,460,461,462,463,464],32,[465,466,467,468],0,[99,154,155],1,[99,154,155]],[44,138,6,39],70,4007,4008,[[9,4009]],null,4010,[3,11,4]],[1573,4011,4012,[2,[987,1575],0,[631],1,[631]],[62,12,576],104,4013,1834,[[24,4014],[63,4015]],null,4016,[16,8]],[1578,656,1579,[2,[656],0,[657],1,[657]],[25,180,59],22,4017,4018,[[5,4019]],null,4020,[15]],[1581,4021,1582,[2,[994,1583],0,[665],1,[665]],[37,66,61,209],70,201,1126,[[9,4022],[5,4023]],null,4024,[3]],[1584,666,1585,[2,[666,1586],0,[667,668],1,[667,668]],[95,31,79,4025],479,4026,4027,[],null,4028,[15,16,4]],[997,669,998,[2,[669,999],0,[670],1,[670]],[1843],22,4029,4030,[[5,4031]],null,4032,[10]],[1590,1591,1592,[0,[671],1,[671]],[44,59,21,13],1593,4033,4034,[],null,4035,[8,7,15]],[1000,1594,4036,[2,[1002,1003,1004],0,[323,1005,1006,1007],1,[1008,323]],[129,821,80],1135,4037,4038,[],null,4039,[11,8]],[377,480,378,[2,[379,481],0,[125,157,158,159,160,161,162],1,[125,157,158,159,160,161,162],29,[380,482]],[39,50,25,1035],1595,4040,4041,[],null,4042,[3]],[1597,324,673,[2,[324],20,[324],0,[674],1,[674]],[25,204,79,39],4043,4044,4045,[[24,4046]],null,4047,[15,3,16]],[415,929,930,[2,[931,932,933,934,236,935,936,937,938,939,940,941,942,943,944,945,946,947],0,[296,297,298,299,300,301,302,303,304,305,306],1,[296,297,298,299,300,301,302,303,304,305,306]],[210,203,416,207],206,4048,4049,[[9,4050],[5,4051]],null,4052,[3]],[325,1598,1599,[0,[325,676,1600,1601,1602],1,[325,676],14,[1603,1604,1605]],[94,590,4053],949,4054,4055,[[5,4056],[19,4057]],null,4058,[8,30]],[950,951,952,[2,[953,954,955,956,957,958],0,[308,309,310,131],1,[308,309,310,131]],[61,209,286],22,4059,4060,[[9,4061],[5,4062]],null,4063,[34,3]],[543,544,545,[2,[171,546,130,410],27,[411,547],17,[171,130],0,[548,549,550],1,[551]],[12,35,60,80],53,4064,4065,[[24,4066]],null,4067,[7,3]],[122,4068,1844,[20,[122,4069,4070,4071,4072,4073,4074,1845,1846,1847,1136,4075,1848,1849,1850,1851,1852],17,[122],45,[4076,4077,4078,4079,4080,4081,4082,4083],0,[4084,4085,730],14,[4086,4087,1136,1845,1846,1847,1848,1849,1850,1851,1852]],[6,98,1137,4088],4089,4090,4091,[[5,4092],[47,4093]],null,4094,[10,8,30]]]],[4095,4096,[[251,252,253,[48,[254],255,[256],17,[257,258,259,260],0,[261,102],1,[102],262,[263],103,[264],127,[265]],[37,12,921,6,62],64,1853,4097,[[9,4098],[5,4099],[47,374]],null,4100,[3,16,4]],[126,387,242,[243,[244,117,245],388,[246,247],48,[248,249,101,250],17,[389,117,126,390,101],0,[391,92,392,393,394],1,[92],14,[395]],[12,6,93,1138,90],64,4101,4102,[[5,1854],[9,65],[72,65]],null,4103,[3,4,7,16]],[658,659,660,[103,[661],662,[663],127,[664],0,[183,184,185],1,[183,184,185]],[115,140,4104,74,6],40,4105,1855,[[47,374],[5,4106],[9,65],[72,65],[63,65]],null,4107,[8,4,23,30]],[1856,1857,1858,[103,[1859,1860],0,[731,1861],1,[731]],[74,115,1137,25,6],40,4108,1538,[[5,1862],[19,729]],null,4109,[4,10,15]],[1139,1140,1141,[2,[1142,1143,1144,1145,1146,1147,1148],28,[1149],0,[1150,1151,1152],1,[1153]],[12,18,51,93,4110],40,4111,732,[[47,374],[9,65],[5,4112]],null,4113,[11,3,23,7]],[584,1523,1524,[2,[1525,1526,1527,1528],1529,[1530,1531,1532],17,[584],1533,[1534,1535,1536,1537],0,[585,586,587,588,589],1,[585,586,587,588,589]],[43,94,590,539,61],949,4114,1863,[[9,65],[72,65],[19,1056]],null,4115,[8,30]],[1864,1865,1866,[2,[1867],0,[733,734,735,736],1,[733,734,735,736]],[74,12,51,35,174],4116,1868,1863,[[5,1862],[24,1869]],null,4117,[4,11,7]],[1038,1039,1040,[2,[1041,1042,1043,1044,1045,1046,1047,1048,1049,1050,1051],0,[330,331,332,333,334,335],1,[330,331,332,333,334,335]],[95,31,412,12,90],40,4118,732,[[9,65],[72,65]],null,4119,[7,15,3,71]],[4120,4121,985,[2,[1870,4122,4123,1073,1871,1872,4124,4125],27,[1870,1073,1871,1872],0,[1873,4126,4127,4128,4129,4130,4131,4132],1,[1873,4133,4134,4135,4136,4137,4138]],[95,31,1138,93,210],40,4139,732,[[5,1854],[24,1869]],null,4140,[3,15,71]],[352,1874,1875,[48,[1876,1877,737,1878],0,[352,738],1,[352,738],14,[1879,737,1880]],[115,75,4141,235,69],40,1881,739,[[47,1882],[9,1154]],null,4142,[23,34,8]],[1883,1884,1885,[2,[1886,1887,1888,1889],0,[740,741,1890],1,[740,741]],[115,94,12,74,205],40,4143,739,[[9,65],[5,4144],[19,4145]],null,4146,[8,23,4,30]],[4147,4148,4149,[2,[4150,4151,4152],0,[1891,4153,4154,4155,4156,4157],1,[1891]],[90,12,21,210,74],1103,4158,4159,[[9,65],[72,65],[47,374]],null,4160,[3,11,4]],[872,873,874,[2,[875,876,877,878,879],0,[269,270,271,272,273],1,[269,270,271,272,273],29,[880,881,882,883]],[37,66,18,61,31],40,1868,1892,[[9,65],[76,1155]],null,4161,[3,11,8]],[537,1406,1407,[2,[537,1408],0,[538,1409],1,[538],29,[1410,1411]],[84,409,21,37,12],64,4162,1893,[[9,65],[63,4163],[5,4164]],null,4165,[3]],[1894,4166,4167,[2,[1894,4168,4169,4170,4171,4172,4173,4174,4175],0,[1895,4176],1,[1895]],[423,80,12,18,31],40,4177,4178,[[76,1155]],null,4179,[3,11,15,7]],[1896,4180,4181,[20,[4182,4183,4184],0,[1896,4185,4186,4187,4188,4189],14,[4190]],[51,18,436,74,90],40,4191,4192,[[9,65]],null,4193,[11,4]],[4194,4195,4196,[2,[4197,4198,4199,4200],0,[1897,4201,4202],1,[1897]],[39,408,205,18,50],64,1853,1898,[[5,4203],[9,65]],null,4204,[3,8,11]],[1899,4205,4206,[2,[1899,4207,4208,4209,4210,4211],0,[1900,4212,4213,4214],1,[1900]],[210,408,907,576,4215],40,4216,1892,[[5,4217],[9,65]],null,4218,[3]],[4219,4220,4221,[2,[4222,4223,4224,4225],0,[1901,4226,4227,1902,4228],1,[1901,1902]],[134,295,139,25,286],40,924,4229,[[5,4230],[63,438]],null,4231,[11,3,15]],[121,68,4232,[20,[68,96],17,[68,96],45,[68,96],32,[68,96],0,[321,68,322],1,[321,68,322]],[12,1903,4233,95,62],40,4234,4235,[[9,1154],[72,1154]],null,4236,[16,3]],[742,4237,4238,[2,[1904,742],20,[743],28,[742],17,[742],45,[743,4239],42,[743],86,[743],32,[1904],0,[4240],14,[4241,4242,4243,4244,4245]],[69,6,12,4246,74],214,97,4247,[],null,4248,[3,4,7,33]],[744,4249,4250,[2,[4251,744],20,[4252],28,[744],17,[744],45,[1905],42,[1905],0,[1906,1907,4253,4254],1,[1906,1907]],[93,691,4255,6,1908],40,4256,1909,[[5,4257]],null,4258,[10,3,71]],[1910,4259,4260,[2,[1910,4261,4262,4263,4264],0,[1911,1912,4265,4266],1,[1911,1912]],[4267,6,146,1913,37],40,97,1909,[],null,4268,[33,7,3]],[1156,4269,4270,[2,[1156,4271,4272,4273,4274],20,[1157,4275,4276,4277,4278,4279],28,[1156,4280,4281],0,[1914,1915,4282],1,[1914,1915]],[18,25,348,13,36],40,97,4283,[[5,1916]],null,4284,[11,15,3]],[4285,4286,4287,[2,[4288,4289,4290,4291],0,[1917,4292],1,[1917]],[31,37,1918,1919,6],40,97,4293,[],null,4294,[15,3,10]],[1920,4295,4296,[2,[4297,1920,4298],0,[1921,4299],1,[1921]],[25,79,36,204,13],40,97,4300,[[5,4301]],null,4302,[15,3,16]],[4303,4304,4305,[2,[4306,4307,4308],20,[4309,4310,4311],0,[1922,4312,4313],1,[1922],14,[4314,4315]],[416,692,44,18,25],40,4316,4317,[[5,4318]],null,4319,[3,11,15]],[4320,4321,4322,[2,[4323,4324,4325],0,[1923,4326,4327],1,[1923]],[348,6,36,1924,1158],4328,97,4329,[[5,1916]],null,4330,[3,4]],[745,4331,4332,[2,[745,4333,1925,4334,4335,4336,4337],28,[745,1925],42,[745],0,[1926,4338,4339,4340],1,[1926],14,[4341]],[4342,1927,36,4343,1928],214,97,4344,[[5,4345]],null,4346,[3,23]],[746,4347,4348,[17,[746,4349,4350],45,[4351,4352],42,[746],0,[746,4353,4354],14,[4355,4356,4357,4358,4359]],[37,422,1929,1930,69],1931,97,4360,[],null,4361,[3,16]],[747,4362,4363,[17,[747,4364,4365],45,[4366,4367],42,[747],28,[1932],0,[747],14,[4368,4369,4370,1932]],[78,348,35,13,89],214,97,4371,[],null,4372,[7,3,4]],[748,4373,4374,[17,[4375],45,[748,4376,4377,4378,4379,4380],42,[4381],28,[748],0,[748,1933],1,[1933],14,[4382,4383,4384,4385,4386,4387]],[422,1934,6,4388,69],214,97,4389,[[5,4390]],null,4391,[3]],[439,4392,4393,[17,[4394,4395,4396,4397],45,[439,1935,1936,4398],42,[439],28,[439],0,[439,4399],14,[4400,1935,1936,4401,4402,4403,4404,4405]],[4406,174,1057,31,6],214,97,4407,[[5,4408]],null,4409,[34,15]],[1159,4410,4411,[20,[1937],17,[4412,1937,4413,4414,4415,4416,4417,4418],45,[4419,4420,4421,4422],32,[4423,4424],0,[1159,1938,4425,4426,4427],1,[1159,1938],14,[4428]],[78,4429,1930,1158,1927],4430,4431,4432,[[24,4433]],null,4434,[3,4]],[1939,353,1940,[0,[353,1941],1,[353]],[4435,25,36,4436,74],64,4437,77,[[5,4438]],null,4439,[3,15,4]],[1942,354,1943,[0,[354,1944,1945],1,[354]],[115,4440,74,4441,749],40,4442,4443,[],null,4444,[4,11,3,34]],[4445,4446,4447,[0,[1946],1,[1946]],[4448,12,434,351,235],4449,1947,77,[[5,4450]],null,4451,[23,34,4,8,15]],[4452,4453,1948,[2,[1949,4454,1950,1951],0,[750,1160],1,[750]],[62,61,12,4455,93],40,4456,77,[[9,4457]],null,4458,[34,16,3,8]],[287,908,909,[2,[287,910,911,912,913,914,915],0,[288,289,290,291,292,293],1,[288,289,290,291,292,293],29,[916,917,918,919,920]],[66,12,921,90,134],64,4459,4460,[[5,4461]],null,4462,[3,10]],[4463,1766,4464,[2,[136],20,[136],17,[136],45,[136],42,[136],86,[136],32,[136],0,[1102],1,[1102]],[95,12,1903,436,93],40,4465,4466,[[5,4467],[9,65]],null,4468,[7,16,15,71]],[440,96,993,[2,[440,121],20,[121],28,[440],17,[121,440],45,[121],42,[440],86,[121],32,[121],0,[1952,121,4469],1,[1952]],[69,422,1934,4470,4471],1931,4472,4473,[[5,4474]],null,4475,[3]],[751,4476,4477,[2,[751,4478],0,[751,1953,4479],1,[751,1953]],[37,69,4480,4481,4482],214,97,4483,[],null,4484,[3]],[752,1954,1955,[2,[1956,752,1957],0,[753,754,1958,1959,1960,1961,1962,1963,1964,1965],1,[753,754]],[115,74,4485,1966,140],40,4486,755,[[47,4487],[9,65]],null,4488,[8,4,23,30]],[4489,4490,4491,[2,[4492,4493],0,[1967,4494,4495],1,[1967]],[4496,50,13,43,4497],1103,4498,4499,[[5,4500],[9,65],[19,4501]],null,4502,[34,23,8]],[1968,4503,4504,[2,[1968],0,[4505,1969],1,[1969]],[18,351,211,4506,4507],40,4508,77,[[5,4509]],null,4510,[8,11,30]]]],[4511,4512,[[311,961,1549,[2,[962,963,964,965],27,[966,967],28,[311],0,[968,969,970],1,[971,972],14,[973,974]],[37,12,211,960,174],53,4513,38,[[24,4514],[9,4515]],null,4516,[3,8,7]],[543,544,545,[2,[171,546,130,410],27,[411,547],17,[171,130],0,[548,549,550],1,[551]],[35,12,60,1970],53,4517,4518,[[24,4519]],null,4520,[7,4]],[397,398,399,[2,[400,401,402],0,[128,403,404],1,[128]],[59,94,60,62],53,4521,4522,[[5,4523]],null,4524,[8,30,7]],[4525,4526,4527,[2,[4528,4529,4530],0,[1971,4531],1,[1971]],[21,12,4532,59],1135,4533,4534,[],null,4535,[7,8]],[4536,4537,4538,[2,[4539,4540,4541],32,[4542,4543],0,[4544,4545,4546],1,[4547,4548]],[59,43,268,119],53,4549,1318,[[9,4550]],null,4551,[8,30]],[4552,4553,4554,[27,[1972,1973],32,[4555,4556],17,[1972,1973],0,[1974,4557,4558],1,[1974]],[133,25,6,135],4559,1161,4560,[[5,4561],[9,1162]],null,4562,[10,15]],[991,1839,316,[2,[110,317,318],27,[110,992],0,[319,142,143],1,[319,320]],[51,436,18,12],53,4563,227,[],null,4564,[11,4]],[4565,4566,983,[2,[1053,609,1645,1643],0,[1646,1054],1,[1647,4567]],[43,120,50,1055],1842,4568,4569,[],null,4570,[8,30]],[4571,4572,1739,[2,[1740,541,4573],27,[541],28,[4574],0,[1742,721,1083],1,[721,4575]],[43,120,4576,50],53,4577,4578,[],null,4579,[8,30]],[620,621,622,[2,[623,178,624],27,[625,626],28,[179,178],0,[627,628,629],1,[630],14,[179]],[43,120,1163,50],4580,4581,1975,[[19,4582]],null,4583,[8,30]],[1000,4584,4585,[2,[1002,1003,1004],0,[323,1005,1006,1007],1,[1008,323]],[43,1164,1163,120],1976,4586,307,[[9,4587],[19,4588]],null,4589,[8,30]],[1977,4590,4591,[2,[4592,4593,4594],17,[1977,4595],0,[1978,4596,4597],1,[4598,1978]],[18,413,412,12],106,4599,1034,[],null,4600,[11]],[172,558,559,[2,[560,561,562],17,[563,564],28,[172],0,[173,565,566],1,[173,567]],[80,413,12,88],106,4601,4602,[],null,4603,[11,3,7]],[1165,4604,4605,[2,[4606,4607],0,[1165,4608,4609],1,[1165]],[12,62,4610],53,4611,4612,[[5,4613]],null,4614,[16,7]],[1864,1865,1866,[2,[1867],0,[733,734,735,736],1,[733,734,735,736]],[74,51,174,12],4615,4616,4617,[[5,4618]],null,4619,[4,11]],[4620,4621,1979,[2,[4622],27,[4623,4624],28,[4625],17,[4626],48,[130],42,[130],0,[1980],1,[1980],14,[4627]],[925,18,31],4628,4629,4630,[[24,4631]],null,4632,[11,4]],[1439,1440,1441,[2,[1442,1443,1444],17,[1445],0,[553,554,1446],1,[553,554]],[412,31,80,12],106,4633,4634,[[9,4635]],null,4636,[11,7,34]],[1424,1425,1426,[2,[1427,1428,1429],27,[1430,1431],17,[1432,1433],48,[1434],0,[552,1435,1436],1,[1437,552]],[1438,18,4637,1981],106,4638,4639,[[5,4640]],null,4641,[11,15,4]],[4642,4643,4644,[2,[410,4645],0,[1982,1983,4646],1,[1982,1983]],[205,50,4647],1135,4648,227,[],null,4649,[8,10]],[4650,4651,4652,[2,[4653,4654],0,[1984,4655,4656],1,[1984,4657]],[105,4658,4659,4660],53,4661,38,[[24,4662]],null,4663,[33,10,3]],[1985,4664,4665,[2,[1985,4666,4667],0,[1986,4668,4669],1,[1986]],[18,31,35,12],106,4670,4671,[],null,4672,[11,7]],[1455,1456,1457,[2,[1458,1459,1460],48,[568],17,[568],0,[569,570],1,[569,570]],[1461,4673,25],53,4674,4675,[],null,4676,[33]],[4677,4678,1987,[2,[1988,1989,1990],0,[756,757,4679],1,[756,757]],[21,105,4680,43],4681,4682,339,[],null,4683,[8,10,3]],[1991,4684,4685,[2,[1991,4686],0,[1992,1993,4687],1,[1992,1993]],[95,31,4688,18],1976,1161,4689,[],null,4690,[7,15,11]],[1994,4691,4692,[2,[1994,1995],0,[1996,4693],1,[1996]],[18,4694,413,129],4695,4696,339,[[24,4697]],null,4698,[11,8]],[1462,1463,1464,[2,[1465,1466,1467,1468,1469,1470,1471,1472,1473,1474,1475,1476,1477],0,[571,572,573,574,575],1,[571,572,573,574,575,1478,1479]],[12,62,576,31],91,1161,38,[[24,4699],[19,4700]],null,4701,[16,4,15]],[441,4702,4703,[2,[441,4704],20,[441],0,[441,4705],1,[441]],[4706,174],106,4707,4708,[],null,4709,[7]],[1166,4710,4711,[2,[1166],20,[1166],0,[1997],1,[1997]],[73,31,90],4712,4713,406,[],null,4714,[23,15]],[4715,4716,4717,[2,[4718,4719],0,[4720,1998,4721],1,[4722,1998]],[21,35,1999,205],4723,4724,672,[],null,4725,[7,8,30]],[1701,1702,4726,[0,[704,1703],1,[704]],[94,1167,12,351],4727,4728,732,[[19,4729]],null,4730,[8,30]],[4731,4732,1948,[2,[1949,1950,1951],0,[750,1160],1,[750,1160]],[62,61,12,4733],4734,4735,2000,[[9,407]],null,4736,[34,16,8]],[1354,1355,4737,[2,[1356,1357,1358,1359],0,[523,524,525,526,527],1,[523,524,525,526,527],29,[1360,1361,1362,1363,1364]],[4738,13,50],70,4739,4740,[[9,274],[24,4741]],null,4742,[8]],[758,4743,4744,[2,[758,4745],0,[758,2001,4746],1,[758,2001]],[205,59,4747,749],91,863,4748,[[9,4749]],null,4750,[8,3,30]],[414,4751,1481,[2,[1480,1482],0,[414,927],1,[414]],[2002,12,61,35],91,4752,4753,[[9,694],[24,4754]],null,4755,[10,7,3,34]],[2003,4756,4757,[2,[2003,759],20,[759],17,[759],86,[759],0,[2004,4758,4759],1,[2004]],[4760,94,1167,6],53,4761,4762,[],null,4763,[8,30]],[1062,1063,701,[2,[702,1064],27,[1065,1066],0,[340,341,342,1067],1,[340,1068,1069,342,341,1070]],[186,133,4764,43],4765,4766,1975,[[19,4767]],null,4768,[10,8]],[1508,1509,1510,[2,[1511,1512,1513,1514,1515,1516,1517,1518,1519,1520,1521],0,[582,583],1,[582,583]],[43,948,120,1522],4769,4770,4771,[[5,4772]],null,4773,[8,30,34]],[2005,4774,4775,[2,[2005,4776],0,[2006,4777,4778],1,[2006]],[4779,314,13,129],91,4780,4781,[[19,4782]],null,4783,[10,71]],[1448,1449,1450,[2,[1451,1452,1453,1454],0,[555,556,557],1,[555,556,557]],[18,80,424,13],53,4784,4785,[],null,4786,[11,33]],[1341,1342,1343,[2,[1344,1345,1346,1347,1348,1349,1350,1351],0,[521],1,[521],29,[1352,1353]],[18,522,51,36],91,863,4787,[[9,4788]],null,4789,[11,3]],[4790,4791,4792,[2,[4793,4794],0,[2007,4795,4796],1,[2007]],[4797,43,4798],4799,4800,4801,[[5,4802]],null,4803,[8,4]],[4804,4805,4806,[2,[4807,4808,4809],0,[2008],1,[2008]],[186,25],106,4810,4811,[[5,4812]],null,4813,[10]],[2009,999,998,[2,[2009,997],0,[2010,4814],1,[2010]],[186],22,4815,4816,[[5,4817]],null,4818,[10]],[867,868,869,[2,[870],0,[266,267],1,[266,267]],[268,6,207,119],871,4819,4820,[[9,4821]],null,4822,[8,30,34]],[2011,4823,4824,[2,[2011,1995],0,[2012],1,[2012]],[235,13,4825],4826,4827,4828,[[5,4829]],null,4830,[34,7,23]],[4831,4832,4833,[2,[2013,4834],20,[2013,4835,4836],86,[411],0,[2014,4837,4838],1,[2014],14,[4839]],[37,61,174,4840],53,4841,307,[],null,4842,[3,33]],[872,873,874,[2,[875,876,877,878,879],0,[269,270,271,272,273],1,[269,270,271,272,273],29,[880,881,882,883]],[4843,66,18,61],4844,4845,4846,[[9,274],[76,1820]],null,4847,[3,11]],[4848,4849,4850,[2,[4851,4852],0,[2015,4853],1,[2015]],[210,4854,925,1138],91,4855,4856,[[5,4857]],null,4858,[3]]]],[4859,4860,[[2016,355,2017,[2,[1168],0,[355,2018,2019],1,[355],14,[2020,2021]],[81,115,13,329],55,4861,4862,[[19,4863],[5,4864]],null,4865,[4,8,10]],[4866,1169,4867,[2,[4868,4869],0,[1169,4870],1,[1169],14,[4871]],[51,760,81],55,4872,4873,[[24,4874]],null,4875,[4,10]],[2022,2023,2024,[2,[2025,2026],0,[761,2027,2028],1,[761],14,[2029]],[73,81,87],55,220,4876,[[76,2030]],null,4877,[4,23]],[2031,2032,2033,[2,[2034],0,[762,2035],1,[762],14,[2036,2037]],[75,4878,119],2038,4879,2039,[[5,4880]],null,4881,[11,34,4]],[4882,4883,4884,[2,[4885],0,[4886,4887,4888,4889,4890,4891],1,[4892,4893],14,[4894]],[338,4895,4896],55,220,4897,[],null,4898,[8,30]],[2040,193,2041,[2,[193,2042,2043],0,[193,2044,2045,2046],1,[193,2047,2048,2049],14,[2050]],[6,13,51],2051,220,4899,[[19,763]],null,4900,[4,7,3]],[4901,4902,4903,[2,[4904],0,[2052],1,[2052],14,[4905,4906]],[81,87,4907],55,220,4908,[],null,4909,[4,3]],[4910,1170,4911,[2,[4912,4913,4914],0,[1170,4915,4916,4917],1,[1170],14,[4918]],[51,67,13],55,4919,4920,[],null,4921,[4,11]],[4922,4923,4924,[2,[4925,4926,4927,4928,4929,4930,4931],0,[2053,4932,4933,4934,4935],1,[2053],14,[4936]],[4937,6,338],55,220,4938,[],null,4939,[7,8]],[4940,4941,4942,[0,[4943,4944,4945,4946,4947],14,[4948,4949]],[25,211,81],2054,1947,4950,[],null,4951,[15,3,30]],[4952,4953,4954,[2,[4955,4956,4957],0,[4958,4959,4960,4961,4962],14,[4963,4964]],[81,87,1101],55,4965,2039,[],null,4966,[4,11]],[4967,1171,4968,[2,[1171,4969,4970],0,[1171,4971,4972,4973,4974,4975,4976],1,[4977,4978],14,[4979]],[87,81,6],55,221,170,[],null,4980,[4,3]],[4981,4982,4983,[2,[4984,4985,4986,4987,4988],0,[2055,4989,4990],1,[2055],14,[4991]],[760,6,13],55,221,170,[],null,4992,[10,4]],[4993,4994,4995,[2,[4996],0,[2056,4997],1,[2056]],[25,81,329],2054,4998,764,[],null,4999,[15,71,4]],[5000,5001,5002,[0,[5003,5004,5005]],[87,81,138],55,5006,5007,[],null,5008,[4]],[5009,5010,5011,[2,[5012,5013,5014],0,[5015,2057,5016,5017],1,[2057,5018],14,[5019,5020]],[314,760,89],55,221,170,[[19,5021]],null,5022,[10,7]],[5023,5024,5025,[2,[5026,5027],0,[2058,5028],1,[2058]],[73,6,87],2059,2060,5029,[],null,5030,[23,4]],[5031,5032,5033,[2,[5034,5035,5036,5037,5038],0,[5039,5040,5041,5042,5043,5044,5045],14,[5046,5047,5048,5049,5050,5051,5052,5053,5054]],[13,67,1999],55,5055,5056,[],null,5057,[7,4]],[5058,1168,5059,[2,[5060],0,[5061,5062,5063,5064],14,[5065]],[87,13,57],55,220,764,[],null,5066,[4,16]],[5067,5068,5069,[0,[5070,5071],14,[5072,5073,5074]],[81,87,13],55,220,764,[],null,5075,[4]],[5076,5077,5078,[2,[5079],0,[5080,5081],1,[5082]],[760,6,13],55,221,170,[],null,5083,[10,4]],[5084,5085,5086,[2,[5087],0,[5088],1,[5089]],[81,87,35],55,2060,5090,[],null,5091,[4,7]],[5092,5093,5094,[2,[5095,5096,5097,5098,5099],0,[5100,5101,5102,5103,5104,5105],14,[5106,5107]],[67,6,81],2059,1172,5108,[[5,5109]],null,5110,[4,3]],[5111,5112,5113,[2,[5114,5115,5116,5117],0,[5118,5119],14,[5120,5121,5122,5123,5124]],[13,6,5125],55,1172,5126,[[24,5127]],null,5128,[7,4]],[5129,2061,5130,[2,[2061,5131,5132,5133],27,[5134],0,[2062,5135],1,[2062]],[6,5136,139],55,221,170,[],null,5137,[4,7]],[5138,5139,5140,[2,[5141,5142,5143],0,[2063,5144,5145,5146],1,[2063]],[6,5147,765],55,221,5148,[],null,5149,[3,4]],[5150,2064,5151,[2,[2064,5152,5153,5154,5155,5156,5157,5158,5159],0,[5160,5161,5162,5163,5164,5165],14,[5166,5167,5168,5169,5170,5171]],[6,81,13],55,5172,5173,[[5,5174]],null,5175,[4,16]],[5176,5177,5178,[2,[5179,5180,5181],0,[2065,5182,5183],1,[2065,5184]],[6,119,13],5185,924,5186,[],null,5187,[23,8]],[5188,5189,5190,[2,[5191,5192,5193],0,[5194,5195],1,[5196,5197]],[87,6,2066],55,221,170,[],null,5198,[4,3]],[5199,5200,5201,[0,[5202,5203],14,[5204]],[115,338,6],55,5205,764,[[19,118]],null,5206,[8,4,30]],[5207,2067,5208,[2,[2067,5209,5210,5211],0,[2068],1,[2068]],[78,6,135],55,1172,5212,[[5,5213]],null,5214,[3,4]]]],[5215,5216,[[2069,5217,5218,[2,[2069],0,[5219]],[69,6,12,434],137,5220,5221,[[5,5222]],null,5223,[4,3,10]],[5224,2070,5225,[2,[5226],0,[2070]],[691,5227,5228],137,5229,5230,[[24,194]],null,5231,[3,4,71]],[2071,2072,5232,[2,[2071,5233],0,[2072]],[5234,2073,78],137,5235,5236,[[5,5237]],null,5238,[23,4]],[2074,2075,5239,[2,[2074],0,[2075]],[5240,5241,1173],22,5242,5243,[[5,5244]],null,5245,[10,23]],[2076,2077,5246,[2,[2076],0,[2077]],[5247,146,51],5248,5249,5250,[],null,5251,[3,33]],[2078,2079,5252,[2,[2078],0,[2079]],[5253,6,1174],137,5254,5255,[],null,5256,[16,10]],[2080,5257,5258,[2,[2080],0,[5259]],[5260,2073,13],5261,5262,5263,[[9,5264],[47,5265]],null,5266,[23,3]],[2081,2082,5267,[2,[2081],0,[2082]],[88,1928,2083],5268,5269,5270,[[5,2084]],null,5271,[3]],[2085,2086,2087,[2,[2088,2089],0,[2090]],[18,423,78],137,5272,5273,[[19,5274]],null,5275,[11,3,7]],[2091,2092,5276,[2,[2091],0,[2092]],[5277,5278,5279],137,5280,5281,[[5,5282]],null,5283,[3,23]],[2093,2094,5284,[2,[2093],0,[2094]],[5285,1929,5286],22,5287,5288,[],null,5289,[23,16]],[2095,2096,5290,[2,[2095],0,[2096]],[1919,5291,5292],137,5293,5294,[[5,5295]],null,5296,[16,3]],[5297,5298,5299,[2,[5300],0,[5301]],[95,5302,6],22,5303,5304,[],null,5305,[3,10]],[5306,5307,5308,[2,[5309,5310],0,[5311,5312,5313]],[31,5314,79],5315,5316,5317,[[47,5318]],null,5319,[15,4]],[5320,5321,5322,[2,[5323],0,[5324]],[2097,5325,12],137,5326,5327,[[5,5328]],null,5329,[3,4]],[5330,5331,5332,[2,[5333,5334],0,[5335]],[2098,12,35],70,5336,5337,[[5,5338]],null,5339,[7,71]],[5340,5341,5342,[2,[5343,5344],0,[5345]],[43,5346,21],5347,5348,5349,[[9,407]],null,5350,[8,34]],[5351,5352,5353,[2,[5354],0,[5355]],[18,25,5356,204],2099,5357,5358,[[63,5359],[5,5360]],null,5361,[11,15,4]],[5362,5363,5364,[2,[5365,5366],0,[5367]],[37,66,61],22,5368,38,[[5,5369]],null,5370,[3,8]],[5371,5372,5373,[2,[5374,5375],0,[5376]],[21,1782,5377],64,5378,5379,[[5,5380]],null,5381,[7]],[5382,5383,5384,[2,[5385],0,[5386]],[31,79,21],1128,5387,1580,[[9,1090],[19,5388]],null,5389,[15,16,7]],[5390,5391,5392,[2,[5393],0,[5394]],[69,12,6],5395,2100,5396,[],null,5397,[3]],[2101,5398,5399,[2,[2101],0,[5400]],[5401,69,5402],5403,2100,5404,[],null,5405,[3,4]],[2102,5406,5407,[2,[2102],0,[5408]],[5409,60,31],137,5410,5411,[[5,5412]],null,5413,[15,7]],[2103,5414,5415,[2,[2103,5416],0,[5417]],[5418,2097,2098],137,5419,5420,[[5,5421]],null,5422,[71]]]],[5423,5424,[[218,5425,5426,[2,[708,1736],0,[2104,5427,5428],1,[2104]],[6,52,56],46,54,49,[],null,5429,[4,7]],[5430,5431,5432,[2,[5433,5434,5435],0,[5436,5437,5438],1,[5439]],[6,52,56],46,54,49,[],null,5440,[4,7]],[2105,5441,5442,[2,[766],28,[766],42,[766],0,[2106],1,[2106]],[6,52,56],46,54,49,[],null,5443,[4,7]],[5444,5445,5446,[2,[5447,5448],0,[2107,5449,5450],1,[2107,5451,5452]],[6,52,56],46,54,49,[],null,5453,[4,7]],[5454,5455,5456,[27,[218,5457,5458],83,[218],32,[218],17,[218],48,[218],0,[2108,5459,5460],1,[2108]],[6,52,56],46,54,49,[],null,5461,[4,7]],[1420,1421,5462,[2,[1422],28,[541],0,[542,1423],1,[542]],[6,52,56],46,54,49,[],null,5463,[4,7]],[766,1175,5464,[2,[5465,5466,5467],0,[1175,2109,2110],1,[1175,2109,2110]],[6,52,56],46,54,49,[],null,5468,[4,7]],[2111,356,5469,[2,[2112,2113,2114],28,[2115],27,[2116],0,[356,2117,2118],1,[356]],[6,52,56],46,54,49,[],null,5470,[4,7]],[5471,5472,5473,[2,[5474,5475,5476],17,[5477,5478],28,[5479],32,[2105],0,[2119,5480,5481],1,[2119]],[6,52,56],46,54,49,[],null,5482,[4,7]],[5483,1176,5484,[0,[1176,5485],1,[1176],14,[5486,5487]],[6,52,56],46,54,49,[],null,5488,[4,7]],[5489,1177,5490,[2,[5491,5492],83,[5493],0,[1177,5494,5495],1,[1177],14,[5496]],[6,52,56],46,54,49,[],null,5497,[4,7]],[5498,1178,5499,[48,[5500],0,[1178,5501],1,[1178]],[6,52,56],46,54,49,[],null,5502,[4,7]],[5503,5504,5505,[0,[2120,5506,5507],1,[2120]],[6,52,56],46,54,49,[],null,5508,[4,7]],[5509,1179,5510,[0,[1179,1180]],[6,52,56],46,54,49,[],null,5511,[4,7]],[5512,1180,5513,[0,[1180,1179]],[6,52,56],46,54,49,[],null,5514,[4,7]],[5515,2121,5516,[0,[2121]],[6,52,56],46,54,49,[],null,5517,[4,7]],[5518,5519,5520,[0,[5521,5522]],[6,52,56],46,54,49,[],null,5523,[4,7]],[5524,5525,5526,[2,[5527,5528,5529],0,[2122,5530,5531],1,[2122]],[6,52,56],46,54,49,[],null,5532,[4,7]],[5533,1181,5534,[0,[1181],1,[1181],14,[5535]],[6,52,56],46,54,49,[],null,5536,[4,7]],[5537,1182,5538,[0,[1182],1,[1182],14,[5539]],[6,52,56],46,54,49,[],null,5540,[4,7]],[5541,5542,5543,[2,[5544,5545],83,[5546],0,[2123,5547,5548],1,[2123],14,[5549]],[6,52,56],46,54,49,[],null,5550,[4,7]],[5551,2124,5552,[0,[2124]],[6,52,56],46,54,49,[],null,5553,[4,7]],[5554,2125,5555,[0,[2125]],[6,52,56],46,54,49,[],null,5556,[4,7]],[5557,2126,5558,[0,[2126]],[6,52,56],46,54,49,[],null,5559,[4,7]],[5560,2127,5561,[0,[2127]],[6,52,56],46,54,49,[],null,5562,[4,7]]]],[5563,5564,[[5565,5566,5567,null,[6,13,2128,82,767,5568],2129,5569,5570,[],null,5571,[23,3,4,7]],[5572,5573,5574,[32,[5575],2130,[5576],14,[5577,5578,5579,5580]],[37,12,35,82,6,31],5581,5582,5583,[[9,5584],[24,5585]],null,5586,[3,4,7,10]],[5587,5588,5589,[28,[1183],42,[1183],48,[1183],14,[5590,5591]],[37,12,31,82,314,35],26,5592,2131,[[24,194],[5,5593]],null,5594,[3,4,16,10]],[5595,5596,2132,[2,[5597]],[6,82,5598,5599,5600],2129,5601,5602,[[24,1745]],null,5603,[4,3,7,33]],[5604,431,1730,[14,[5605]],[21,5606,6,5607,5608,82],435,5609,5610,[[5,5611]],null,5612,[3,4,10,23]],[5613,5614,5615,[2,[5616],2130,[5617],1184,[5618],14,[5619]],[43,94,590,6,2133],435,5620,5621,[[19,5622]],null,5623,[8,30,10]],[2134,5624,5625,[17,[5626,5627],32,[5628],2,[5629]],[6,12,2135,5630,82,5631],5632,1185,2131,[[5,5633]],null,5634,[3,10,4]],[357,5635,2136,[0,[2137],1,[2137],27,[2138]],[6,12,5636,5637,222,82],26,1185,5638,[],null,5639,[3,4,16,7]],[5640,5641,5642,[2,[5643],0,[2139],1,[2139]],[6,82,13,2140,5644],26,5645,5646,[[76,5647]],null,5648,[4,10,5649]],[5650,5651,5652,[83,[5653],477,[5654]],[675,6,82,1186,5655],5656,5657,5658,[[5,5659]],null,5660,[4,3,16]],[5661,5662,5663,null,[1186,5664,119,5665,2141],26,5666,100,[[19,5667],[47,5668]],null,5669,[8,30,10,34]],[5670,5671,5672,[14,[5673]],[88,13,44,1187,5674],5675,5676,5677,[[19,5678]],null,5679,[3,4,71]],[5680,5681,5682,[32,[5683],0,[2142],1,[2142]],[89,67,51,5684,5685],5686,5687,5688,[[24,5689]],null,5690,[3,8,7,4]],[5691,5692,5693,null,[1188,2143,12,43,539],5694,5695,5696,[[9,5697],[19,5698]],null,5699,[4,8,10,3]],[768,2144,2145,[2,[768],0,[769,770,2146,2147,2148],1,[769,770]],[84,82,6,2149,5700],26,5701,100,[[24,5702]],null,5703,[3,4,11,30]],[2150,2151,429,[2,[428,2152],0,[195],1,[195]],[2153,12,5704,1188,420],5705,5706,5707,[],null,5708,[10,8,4,34]],[2154,2155,1080,[2,[1079,2156],27,[2157,2158],14,[2159],0,[771,2160,2161],1,[771]],[84,18,5709,78,79],2162,5710,5711,[[76,5712]],null,5713,[3,11,16]],[5714,5715,5716,null,[59,1167,2141,37,6],26,5717,100,[[5,5718]],null,5719,[8,30,10,3]],[5720,1189,5721,[48,[1189,2163],477,[1189,2163,5722,5723,5724],42,[5725,5726],0,[2164,5727],1,[2164],1184,[5728]],[5729,6,12,1970,82],5730,5731,5732,[],null,5733,[23,7,4]],[5734,5735,5736,null,[78,6,5737,767,1186],26,5738,5739,[],null,5740,[3,33,4]],[5741,5742,5743,null,[675,5744,35,36,6],5745,5746,5747,[[5,5748]],null,5749,[3,7,4]],[1826,1827,1828,null,[57,13,82,67,5750],5751,1829,5752,[[9,65],[5,5753]],null,5754,[4,16,30]],[5755,5756,5757,null,[6,52,25,5758,2165],26,5759,5760,[],null,5761,[4,15,10,71]],[5762,5763,5764,null,[75,119,78,235,35],26,5765,5766,[],null,5767,[34,23,30]],[5768,5769,5770,null,[5771,6,13,51,82],5772,5773,5774,[],null,5775,[4,11,33]],[5776,5777,5778,null,[5779,6,5780,1173,78],5781,5782,5783,[],null,5784,[8,7,10]],[772,5785,5786,[17,[772,1729],28,[5787],1184,[5788,5789,5790],0,[772,2166,5791,5792,5793],1,[772,2166]],[6,37,82,5794,12],26,5795,5796,[],null,5797,[3,4,23]],[5798,5799,5800,null,[6,12,1188,2167,21],5801,5802,5803,[],null,5804,[4,7,3]],[2168,5805,5806,null,[78,5807,5808,75,5809],41,5810,5811,[],null,5812,[8,30,3]],[5813,5814,5815,null,[5816,90,31,37,1187],5817,5818,1735,[[5,5819]],null,5820,[23,3,15]],[5821,5822,5823,null,[6,67,146,2128,13],26,5824,5825,[],null,5826,[23,33,4]],[2111,356,5827,[2,[2112,2113,2114],28,[2115],27,[2116],0,[356,2117,2118],1,[356]],[6,82,767,13,2165],5828,5829,5830,[],null,5831,[4,3,10]],[5832,5833,5834,null,[146,6,2169,222,1924],26,1185,5835,[],null,5836,[33,10,3]],[5837,5838,5839,null,[13,2170,5840,408,5841],5842,5843,5844,[],null,5845,[3,71,33]],[5846,5847,5848,null,[36,146,2169,1913,6],26,5849,100,[[5,5850]],null,5851,[3,33,10,7]],[5852,5853,5854,null,[69,767,82,146,2135],5855,5856,5857,[],null,5858,[3,4,33,23]],[5859,5860,5861,null,[1918,5862,5863,222,75],26,5864,100,[],null,5865,[10,3,4,33]],[5866,5867,5868,null,[5869,1173,1158,75,1174],26,5870,5871,[],null,5872,[3,10,16]],[5873,5874,5875,null,[84,2170,5876,25,5877],5878,5879,5880,[],null,5881,[3,15,30]],[773,2171,2172,[32,[2173,2174,2175,2176],83,[773,2177,2178,2179],0,[2180,2181,2182],1,[2183]],[5882,6,82,2167,146],26,5883,5884,[[5,5885]],null,5886,[4,7,33,10]]]],[5887,5888,[[5889,5890,5891,[2,[5892,5893,5894,5895,5896,5897],0,[2184,5898,5899,5900,5901,5902,5903],1,[2184]],[6,2083,213,31],5904,5905,5906,[[5,5907]],null,5908,[3,10,15]],[5909,5910,1743,[2,[1084,5911,5912],0,[1085,5913],1,[5914]],[31,5915,5916,79],46,5917,5918,[[76,5919]],null,5920,[15,3]],[1190,5921,5922,[2,[5923,5924,5925,5926,5927,5928,5929,2185,5930],27,[1190],28,[1190],0,[2186,5931,5932,5933,1191,5934],1,[2186]],[88,25,6,89],2187,5935,1192,[[24,1193]],null,5936,[3,15,7]],[2188,5937,5938,[2,[5939,5940,5941,2188,5942,5943,5944,5945,5946,5947,5948,5949],0,[5950,5951,2189,5952,2190,2191,5953],1,[2189,2190,2191]],[5954,6,75,79],2192,5955,5956,[[5,5957]],null,5958,[3]],[5959,5960,5961,[2,[5962,5963,5964,5965,5966,5967,5968,5969,5970,5971,5972,5973],27,[5974],14,[5975],0,[2193,2194,2195,5976,5977,5978],1,[2193,2194,2195]],[12,31,5979,6],5980,5981,5982,[[5,5983]],null,5984,[16,15,4]],[2196,5985,5986,[2,[5987,5988,5989,5990,5991,5992,2185,5993],27,[5994],48,[2196],28,[2197],42,[2197],0,[2198,5995,5996,5997,5998],1,[2198]],[88,5999,996,6],2192,6000,49,[[5,6001]],null,6002,[3,33,7]],[6003,6004,1822,[2,[1821,6005,6006],0,[2199,6007,6008,6009],1,[2199]],[21,217,423,6010],6011,6012,6013,[[5,6014]],null,6015,[3]],[2150,2151,429,[2,[428,2152],0,[195],1,[195]],[2153,12,147,6016],6017,6018,6019,[[19,1824]],null,6020,[10,4]],[2154,2155,1080,[2,[1079,2156],27,[2157,2158],14,[2159],0,[771,2160,2161],1,[771]],[84,18,423,78],2162,6021,6022,[[76,2200]],null,6023,[3,11]],[6024,6025,2201,[2,[2202,2203,6026,6027,6028,2204,6029,6030,6031],0,[6032,6033,6034,774,6035,6036,1194],1,[774,6037]],[6038,147,31,95],2187,6039,1192,[[76,2200]],null,6040,[10,15,4]],[768,2144,2145,[2,[768],0,[769,770,2146,2147,2148],1,[769,770]],[84,144,74,6],46,6041,100,[[24,194]],null,6042,[3,4]],[2205,2206,2207,[2,[2208,2209,2210,2211,2212,2213],0,[775,2214,2215],1,[775,2216]],[6,12,6043,2217],223,6044,442,[[9,6045]],null,6046,[34,3,4]],[776,2218,6047,[2,[2219,776],28,[777],42,[777],0,[778,2220,2221,2222,2223],1,[778]],[31,6,12,79],223,6048,442,[[24,6049]],null,6050,[15,4,16]],[432,2224,2225,[2,[358,2226,432],27,[358],17,[2227],0,[779,780,2228],1,[779,780]],[6,6051,6052,12],223,6053,442,[[5,2229]],null,6054,[3,4,33]],[632,633,634,[2,[635,636,637,638,639,640,641,642,643,644,645,646,647,648,649,650],0,[181,182,421,651],1,[181,652,653,182,654,655]],[114,6,6055,1838],223,6056,2230,[[19,118]],null,6057,[15,33,10]],[6058,6059,1195,[2,[1196,6060,6061,1197,1198,1199,1200,1201,1202,1203,1204],0,[1205,1206],1,[1207]],[144,31,21,6],26,2231,2232,[[5,1208]],null,2233,[4,15]],[358,2234,2235,null,[6,6062,12,135],223,6063,442,[[5,2229]],null,6064,[3,4,33]],[2236,6065,6066,[2,[2236,6067,6068,6069],0,[1191],1,[1191]],[88,31,6,89],46,6070,49,[[24,1193]],null,6071,[3,15,7]],[2237,6072,6073,[2,[2237,6074,6075],0,[2238,2239,6076],1,[2238,2239]],[88,25,6,89],46,6077,49,[[24,1193]],null,6078,[3,15,7]],[6079,6080,6081,null,[21,217,25,6082],6083,6084,6085,[[5,6086]],null,6087,[3,15,11]],[2240,6088,6089,[2,[2240,6090,6091],27,[6092],0,[6093,6094,6095,6096,6097,6098],1,[6099,6100]],[6101,6102,6103,6],46,6104,100,[[5,6105]],null,6106,[3,33]],[773,2171,2172,[32,[2173,2174,2175,2176],83,[773,2177,2178,2179],0,[2180,2181,2182],1,[2183]],[144,74,6,996],46,6107,2230,[[5,1208]],null,6108,[4,10]],[2241,2242,1072,[2,[1071],0,[781],1,[781]],[69,147,6109,79],148,6110,6111,[[24,1078]],null,6112,[10,8,16]],[1802,6113,1801,null,[186,133,6,129],6114,6115,6116,[[19,6117]],null,6118,[10,8]],[2243,6119,2244,null,[21,928,6,135],26,6120,6121,[[5,6122]],null,6123,[3]],[6124,6125,2245,[2,[6126,6127,6128,6129,519,6130,6131,6132,6133],0,[2246,6134,6135],1,[2246]],[144,6,31,88],26,6136,2247,[[5,2248]],null,2249,[4,3,15]],[2250,2251,724,[2,[725,1099,2252,1100],0,[347,2253],1,[347]],[12,960,144,31],223,6137,1192,[[19,118]],null,6138,[4,16,11]],[2254,2255,1195,[2,[2256,1196,1197,2257,1198,1199,1200,1201,1202,1203,1204],0,[1205,1206],1,[1207]],[144,31,21,6],26,2231,2232,[[5,1208]],null,2233,[4,15]],[709,710,711,[2,[712,713,714,715,716,717],0,[192,718,719,720],1,[192]],[114,25,21,6],223,6139,442,[[5,6140]],null,6141,[15,3]],[6142,6143,6144,null,[31,18,89,88],46,6145,49,[],null,6146,[11,3,15]],[697,1683,1061,[2,[1684,1685],42,[697],0,[698,1686,699],1,[700,699,698]],[6147,6148,2217,6149],6150,6151,6152,[[24,1078]],null,6153,[10,8,7]],[6154,6155,2245,null,[144,6,31,88],26,6156,2247,[[5,2248]],null,2249,[4,3,15]],[6157,6158,6159,null,[21,217,135,79],6160,6161,6162,[[5,6163]],null,6164,[3]],[677,1009,678,[2,[679,1010,1011,1012,1013,1014,1015,1016,1017,1018,1019,1020,1021,1022,1023,1024],0,[187,680],1,[187,1025,1026]],[144,6,13,74],6165,6166,6167,[[5,6168]],null,6169,[4,16]],[1106,1107,316,[2,[110,317,1108,318,1109,1110,1111],27,[110,1112,1113,1114],0,[349,143,142,1115,1116,1117,1118,1119,1120],1,[320,349,142,143],14,[1121,1122]],[51,1123,18,25],6170,6171,6172,[[5,6173]],null,6174,[11,4]]]],[6175,6176,[[632,633,634,[2,[635,636,637,638,639,640,641,642,643,644,645,646,647,648,649,650],0,[181,182,421,651],1,[181,652,653,182,654,655]],[13,1027,21,6,327,44],26,6177,6178,[[5,6179]],null,6180,[10,33,15]],[432,2224,2235,[2,[358,2226,432],27,[358],17,[2227],0,[779,780,2228],1,[779,780]],[2002,21,6181,359,31,6],26,6182,6183,[[5,6184]],null,6185,[4,3]],[2205,2206,2207,[2,[2208,2209,2210,2211,2212,2213],0,[775,2214,2215],1,[775,2216]],[359,6,31,765],26,6186,6187,[[5,6188]],null,6189,[4,15]],[776,2218,6190,[2,[2219,776],28,[777],42,[777],0,[778,2220,2221,2222,2223],1,[778]],[12,6,31,359],26,6191,6192,[[24,194]],null,6193,[10,4,23]],[2250,2251,724,[2,[725,1099,2252,1100],0,[347,2253],1,[347]],[12,6,31,359],26,360,2258,[],null,6194,[15,33,4]],[1106,1107,316,[2,[110,317,1108,318,1109,1110,1111],27,[110,1112,1113,1114],0,[349,143,142,1115,1116,1117,1118,1119,1120],1,[320,349,142,143],14,[1121,1122]],[51,13,74,1055],6195,6196,6197,[[5,6198]],null,6199,[4,11]],[2259,6200,2244,[2,[2259,6201,2243,6202,6203,6204,6205,6206,6207,6208,6209,6210,6211,6212],0,[2260,2261,6213,6214],1,[2260,2261],14,[6215]],[21,217,6,35],26,6216,6217,[[5,6218]],null,6219,[3]],[709,710,711,[2,[712,713,714,715,716,717],0,[192,718,719,720],1,[192]],[21,114,13],26,6220,6221,[[5,6222]],null,6223,[15,3]],[6224,6225,6226,[2,[6227,6228],0,[2262,6229,6230],1,[2262]],[21,180,140],26,2263,2264,[],null,6231,[4,3]],[6232,6233,1789,[2,[1790,1791,6234,6235],0,[728,1124,1125,1792],1,[728,1124,1125],14,[6236]],[135,6,35,74],26,6237,6238,[],null,6239,[7,4,3]],[1758,6240,1759,[2,[1091,1760,1092],0,[219,346,1093,1094,1095,1096],1,[346,219,1097,1098]],[114,6,13,2066],26,6241,6242,[[19,6243]],null,6244,[15,4]],[6245,6246,6247,null,[6,74,329,115],26,6248,6249,[[19,763]],null,6250,[4,33,3]],[677,1009,678,[2,[679,1010,1011,1012,1013,1014,1015,1016,1017,1018,1019,1020,1021,1022,1023,1024],0,[187,680],1,[187,1025,1026]],[135,21,217,25,327],26,2265,6251,[],null,6252,[4,3,10]],[2254,2255,1195,[2,[2256,1196,1197,2257,1198,1199,1200,1201,1202,1203,1204],0,[1205,1206],1,[1207]],[6,12,6253,31],26,360,2258,[],null,6254,[3,15]],[6255,6256,1835,null,[6,75,12],26,6257,6258,[],null,6259,[4,10,30]],[6260,6261,1755,null,[114,21,25],1105,6262,6263,[[9,1090],[63,6264]],null,6265,[15]],[358,2234,2225,null,[21,6,12,359],435,2266,6266,[],null,6267,[3,4]],[6268,6269,6270,null,[6,12,6271],26,6272,6273,[],null,6274,[23,4,10]],[6275,6276,701,null,[1843,539,43,6],6277,2265,6278,[[19,6279]],null,6280,[10,8]],[6281,6282,1698,null,[21,31,1981],6283,6284,6285,[[5,6286]],null,6287,[3,15]],[725,6288,724,null,[13,1101,25,135],435,2266,6289,[],null,6290,[4,11,16]],[6291,6292,1799,null,[93,90,6293],2267,6294,6295,[[9,6296]],null,6297,[7,3]],[6298,6299,1815,null,[93,73,90],6300,6301,6302,[[9,6303]],null,6304,[3,23]],[6305,6306,6307,null,[6,12,21],26,2268,2269,[],null,6308,[4,3]],[6309,6310,6311,null,[6,90,21],26,2268,2264,[],null,6312,[4,3]],[1209,6313,6314,[2,[6315,6316,6317,6318],0,[1209],1,[1209]],[6,359,1210],26,360,6319,[],null,6320,[3,4]],[1211,6321,6322,[2,[6323,6324,6325,6326,6327,6328],0,[1211],1,[1211]],[6329,2270,1210],26,360,6330,[],null,6331,[4,3,16]],[1212,6332,6333,[0,[1212],1,[1212]],[6,52,1210],26,360,6334,[],null,6335,[3,4]],[219,6336,6337,[2,[6338,1091,1092],0,[219,346,1093,1094,1095,1096],1,[346,219,1097,1098]],[6,12,2270],26,2263,6339,[],null,6340,[3,33,10]],[421,6341,6342,null,[6,6343,6344],26,360,2269,[],null,6345,[10,4]]]],[6346,6347,[[2271,6348,6349,[2,[6350],27,[2271],0,[2272,2273],1,[2272,2273]],[12,37,6,213],41,782,6351,[[5,2084]],null,6352,[3,10]],[1213,6353,6354,[27,[2274],83,[2274],0,[1213],1,[1213],14,[6355]],[89,6,75,37],41,782,6356,[[5,6357]],null,6358,[3,10,8]],[6359,6360,6361,[2,[6362,6363,6364],27,[6365,6366],28,[6367,6368],17,[6369,6370],42,[6371,6372],0,[2275,2276],1,[2275,2276]],[12,69,62],41,6373,6374,[[5,6375]],null,6376,[10,7,16]],[6377,6378,6379,[2,[6380],27,[6381],83,[6382],32,[6383],0,[2277],1,[2277]],[2143,6384,69],41,196,783,[[24,6385]],null,6386,[15,34,4]],[6387,6388,1979,null,[6,12,69],41,196,783,[[24,194]],null,6389,[10,7,4]],[6390,6391,6392,[2,[784],27,[784],17,[784],32,[784],0,[2278],1,[2278]],[6,79,351],41,782,6393,[[24,6394]],null,6395,[16,8,10]],[6396,6397,1722,[0,[706],1,[706]],[69,213,6],148,196,6398,[[24,6399]],null,6400,[10,8,23]],[6401,6402,1061,[0,[700],1,[700]],[351,147,12],148,196,2279,[[24,6403]],null,6404,[8,10,30]],[2241,2242,1072,[2,[1071],0,[781],1,[781]],[147,6,69],148,196,783,[[24,6405]],null,6406,[10,8]],[6407,6408,6409,[2,[6410],0,[2280],1,[2280]],[75,37,21],26,6411,6412,[[76,6413]],null,6414,[3,4]],[6415,6416,6417,[2,[6418],0,[2281],1,[2281]],[6,147,146],148,6419,6420,[[24,6421]],null,6422,[10,33,8]],[6423,6424,6425,[48,[6426],17,[6427],0,[2282],1,[2282]],[6,6428,12],148,6429,2279,[[5,6430]],null,6431,[23,4,34]],[6432,6433,6434,[27,[6435,6436],0,[2283],1,[2283]],[6,213,12],148,196,6437,[[24,6438]],null,6439,[10,8]],[6440,6441,6442,[27,[785],17,[785],48,[785],83,[785],32,[6443],0,[2284],1,[2284]],[75,79,1174],148,196,6444,[[24,6445]],null,6446,[16,8,4]],[6447,6448,6449,[2,[6450,6451,6452],0,[2285],1,[2285]],[75,1031,146],443,782,6453,[[24,6454]],null,6455,[10,33,3]],[6456,6457,6458,[0,[2286],1,[2286]],[147,213,6],148,196,783,[[24,6459]],null,6460,[10,8]],[2287,6461,1001,null,[59,79,821],41,6462,6463,[[5,6464]],null,6465,[8,16,11]],[6466,6467,6468,null,[286,408,12],41,6469,6470,[[5,6471]],null,6472,[16,3,11]],[2288,6473,673,null,[31,12,66],41,6474,6475,[[9,6476],[63,6477]],null,6478,[15,16,3]],[6479,6480,510,null,[66,37,61],41,786,2289,[[9,6481]],null,6482,[3]],[6483,6484,862,null,[37,66,6],41,6485,6486,[[5,6487]],null,6488,[3,4]],[6489,6490,866,[2,[865,6491],0,[2290,2291,6492,6493,6494],1,[2290,2291],14,[6495,6496]],[37,66,18],41,6497,6498,[[5,6499]],null,6500,[3,11]],[6501,6502,826,[2,[116,827,828,476,829,156],20,[116,476],45,[156,375],17,[116],42,[116],86,[375],32,[375,6503],0,[116,229,6504],1,[229]],[37,66,6],41,787,6505,[[24,194]],null,6506,[3]],[6507,6508,514,[2,[6509,1303,1304,1305,1308,6510,6511],0,[336,2292,6512],1,[336,2292],14,[6513]],[66,18,61],41,787,38,[[9,6514]],null,6515,[3,11]],[6516,6517,6518,[2,[6519,6520,6521,6522,6523,6524,6525,6526,6527,6528,6529,6530,6531,6532],0,[2293,2294,6533,208],1,[2293,2294]],[66,37,90],41,787,2289,[[9,6534]],null,6535,[3]],[6536,6537,378,[2,[377,379,6538,6539,6540,6541,6542],0,[125,6543,6544],1,[125],32,[380]],[66,61,749],41,786,38,[[24,1134]],null,6545,[3,34]],[6546,6547,531,[2,[530,6548,532],0,[2295,2296,2297,2298,2299,2300],1,[2295,2296,2297,2298,2299,2300],14,[6549,6550,6551,533]],[73,749,12],41,6552,6553,[[9,2301],[19,763]],null,6554,[23,34,3]],[6555,6556,6557,[27,[6558],28,[361],17,[361],48,[361],42,[361],83,[361],32,[361],0,[2302],1,[2302],14,[6559]],[75,69,6],443,6560,6561,[[24,6562]],null,6563,[10,8]],[6564,6565,2201,[2,[2203,2202,6566,702,6567,6568,2204,6569,6570,6571,6572,6573,6574,6575,6576,6577,6578],0,[774,2303,2304,2305,1194],1,[774,2303,2304,2305,1194]],[6,1841,12],6579,6580,6581,[[19,118]],null,6582,[10,7,4]],[2306,6583,429,[2,[428,2307,2308,2309,2310,2311,2312,2313,2314,2315,2316,2317,2318,2319,2320],0,[195,788],1,[195,788],14,[2321,2322]],[6,12,147],6584,6585,6586,[[5,6587]],null,6588,[10,4,7]],[6589,6590,6591,[2,[224,1214,6592,6593,1215,6594],20,[224],28,[224],17,[1215,224],45,[224],42,[224],86,[224,1214],32,[1214,1215],0,[2323,6595,6596,6597,6598,6599,6600,6601,6602,6603,6604,6605,6606,6607,6608,6609,6610,6611,6612,6613,6614],1,[2323]],[31,69,79],41,2324,6615,[[5,6616]],null,6617,[15,10]],[6618,6619,6620,[2,[2325,6621,6622,6623],20,[2325,6624],0,[2326,2327,2328,2329,2330,2331,6625,6626,6627],1,[2326,2327,2328,2329,2330,2331]],[69,6,1507],41,2324,6628,[[5,6629]],null,6630,[3,4]],[6631,6632,1987,[2,[1988,1989,1990,6633],0,[756,757,6634],1,[756,757],14,[6635,6636]],[21,211,69],41,6637,6638,[[5,6639]],null,6640,[3,8,15]],[2332,6641,885,[2,[886,887,888,889,2333],0,[275,276,208,277,278,2334,529],1,[275,276,208,277,278],14,[890,2335]],[434,12,6642],6643,6644,6645,[[9,362],[19,6646]],null,6647,[4,11,7]],[6648,6649,1653,[2,[1654,1655,1656,6650],0,[695,1657,696,2336],1,[695,696,2336]],[6651,12,6652],6653,6654,6655,[[5,6656],[9,2337]],null,6657,[10,71]],[6658,6659,6660,[2,[6661,6662,6663,6664,6665,6666,6667,6668,6669,6670,6671,6672],0,[2338,2339,2340,2341,2342,6673,6674,6675],1,[2338,2339,2340,2341,2342],14,[6676]],[6677,213,1837],6678,6679,6680,[[5,6681]],null,6682,[3,10]],[6683,6684,1844,[2,[122,6685],20,[122,730,6686,6687,6688,6689],17,[122,6690,6691,6692,6693],45,[122,2168,6694],86,[122],32,[122],0,[122,730],1,[122,730],14,[1136]],[6,98,147],6695,6696,6697,[[47,6698],[63,6699]],null,6700,[10,8,30]],[6701,6702,6703,[2,[197,6704,6705,6706,6707],20,[197],28,[197],17,[197],45,[197],42,[197],86,[197],32,[197],0,[2343,2344,6708,6709,6710],1,[2343,2344],14,[6711,6712]],[6713,6,31],6714,6715,6716,[[9,6717],[47,6718],[5,6719]],null,6720,[8,30]],[6721,6722,1836,[2,[198],20,[198],28,[198],17,[198],45,[198],42,[198],86,[198],32,[198],0,[1133,2345,6723,6724,6725],1,[1133,2345]],[98,75,1031],41,6726,6727,[[47,6728],[9,6729],[5,6730]],null,6731,[8,30]],[6732,6733,6734,[2,[6735,6736,6737,6738],0,[2346,6739,6740,6741,6742,2347],1,[2346,2347],14,[6743]],[98,21,31],443,6744,6745,[[47,6746],[5,6747]],null,6748,[8,3]]]],[6749,6750,[[1310,1311,1312,[2,[1313,1314],0,[515,516],1,[515,516]],[6,12,6751],104,6752,535,[[9,1086],[19,6753]],null,6754,[3,10,23]],[6755,864,1315,[2,[864,6756],0,[2348],1,[2348]],[57,44,39],1317,6757,124,[[63,438],[24,194]],null,6758,[3,33]],[6759,6760,6761,[2,[6762],0,[2349],1,[2349]],[37,6,6763],26,6764,100,[[5,6765]],null,6766,[3]],[865,1319,866,[2,[1320,1321],0,[517,518],1,[517,518]],[39,50,18],41,6767,6768,[[5,2350]],null,6769,[3,11]],[6770,6771,2351,[2,[6772],0,[2352],1,[2352]],[39,6773,129],443,6774,363,[[9,6775],[63,438]],null,6776,[3,8]],[867,868,869,[2,[870],0,[266,267],1,[266,267]],[268,6,119],871,6777,307,[[9,1229]],null,6778,[8,30]],[530,892,531,[2,[532,893,894,895,896,897],0,[279,280,281,282,283,284,285],1,[279,280,281,282,283,284,285],29,[533,898,899,900]],[385,73,13],41,6779,535,[[9,2301],[76,2030]],null,6780,[23,34]],[1157,6781,1373,[2,[1216,1377,1374,1375,1376,1378,6782,6783,6784,6785,6786,6787,6788,6789,6790,1157,1216,6791],20,[1216],0,[534,903,904,902],1,[534,901]],[286,18,134],41,6792,6793,[[63,6794],[24,1134]],null,6795,[16,11]],[6796,6797,6798,[2,[6799,6800,6801,6802,6803,6804],20,[6805,6806],28,[789,364,6807],17,[789,364],45,[789,364],42,[789,364],86,[364],32,[364],0,[2353,2354,6808,6809,6810,6811,1217,6812,6813,6814,6815,6816,6817,6818],1,[2353,2354,6819]],[6,134,1164],2355,2356,363,[[5,6820]],null,6821,[10,7]],[790,6822,6823,[2,[790],20,[790,6824,6825,6826,6827,6828,6829,6830,6831],86,[790],32,[6832],0,[2357,2358,6833],1,[2357,2358],14,[6834,6835,6836]],[765,59,6],6837,365,6838,[[5,350]],null,6839,[8]],[251,252,253,[48,[254],255,[256],17,[257,258,259,260],0,[261,102],1,[102],262,[263],103,[264],127,[265]],[13,396,36],64,2359,1898,[[9,6840],[19,118]],null,6841,[3,16,11]],[126,387,242,[243,[244,117,245],388,[246,247],48,[248,249,101,250],17,[389,117,126,390,101],0,[391,92,392,393,394],1,[92],14,[395]],[12,6,93],64,2360,2361,[[9,438],[19,118]],null,6842,[3,16,4]],[6843,6844,6845,[2,[6846,6847,6848,6849,1282,6850,6851,6852,6853],0,[2362,2363,2364,6854,6855,6856],1,[2362,2363,2364],14,[6857]],[39,18,51],26,6858,38,[[63,6859],[9,407]],null,6860,[3,11]],[1296,1297,862,[2,[1298,1299,1300],0,[511,512,513],1,[511,512,513],29,[1301,1302]],[36,39,6],41,6861,535,[[5,2350]],null,6862,[3]],[116,1246,826,[2,[827,828,476,829],48,[156],477,[156],1247,[156],0,[229,116,478],1,[229,116,478],29,[1248,375,1249,1250]],[36,1251,6],376,2356,6863,[[24,6864]],null,6865,[3,71]],[846,847,510,[2,[848,849,850,851,852,853,854,855,236,856,857,858,859,860,861],0,[237,238,239,240,241],1,[237,238,239,240,241]],[39,385,18],1610,6866,339,[[9,1129]],null,6867,[3,34,11]],[830,831,832,[2,[833,834,835,836,837,838,839],0,[230,231,232,233,234],1,[230,231,232,233,234],29,[840,841,842]],[36,39,18],22,6868,1588,[[5,6869]],null,6870,[3,11]],[367,368,369,[2,[370,371,372,373],0,[123],1,[123]],[134,6,420],70,6871,124,[[47,6872],[9,362]],null,6873,[10,8,16]],[444,445,446,[2,[447,448,449,450,451,452],0,[151,152,153],1,[151,152,153],29,[200,453,454]],[44,18,50],70,6874,227,[[9,1129]],null,6875,[11,4]],[99,455,456,[2,[457,458,459,460,461,462,463,464],32,[465,466,467,468],0,[99,154,155],1,[99,154,155]],[67,138,6],22,787,124,[[19,118]],null,6876,[11,3,4]],[803,804,805,[20,[806,807,808,809,810,811,812,813,814,815,200],2,[816,817,818,819,820],0,[225,226],1,[225,226]],[115,13,67],22,6877,202,[[5,6878]],null,6879,[8,4,30]],[822,1230,1231,[2,[1232,1233,823,469,824,825,1234,1235],42,[1236],29,[1237,1238,1239,1240],0,[470,471,472,473,474,475],1,[470,471,472,473,474,475]],[39,50,228],22,6880,124,[[5,6881]],null,6882,[3,11]],[483,484,485,[2,[381,486,487,382,383,488,489,490,491,492,493,494,495,496,497,498,499,500,501],0,[163,164,165,166,167,168,169],1,[163,164,165,166,167,168,169],29,[502,503,504,505,506,507]],[843,13,420],22,786,384,[[9,6883],[72,844]],null,6884,[23,8,33]],[1261,1262,1263,[2,[1264,1265,1266,1267,1268,1269,1270,1271,1272,1273,1274,1275,1276,1277],0,[508,509],1,[508,509],29,[1278,1279,1280,1281]],[43,36,50],70,786,124,[[9,362]],null,6885,[8,3]],[377,480,378,[2,[379,481],0,[125,157,158,159,160,161,162],1,[125,157,158,159,160,161,162],29,[380,482]],[39,50,385],376,6886,6887,[[5,350]],null,6888,[3,34]],[2365,6889,6890,[2,[6891,2365],0,[1217],1,[1217],14,[6892,6893,6894]],[134,57,36],26,6895,6896,[[5,6897]],null,6898,[10,16,3]],[294,1417,1418,[0,[294,540],1,[294,540],29,[1419]],[139,13,295],64,6899,6900,[[5,6901]],null,6902,[11,3]],[287,908,909,[2,[287,910,911,912,913,914,915],0,[288,289,290,291,292,293],1,[288,289,290,291,292,293],29,[916,917,918,919,920]],[13,396,87],64,1563,2366,[[9,2337]],null,6903,[3,16]],[2367,6904,2351,[2,[2367,6905],0,[2368],1,[2368]],[39,98,119],6906,6907,363,[[9,362]],null,6908,[3,8]],[6909,6910,242,[2,[6911,101,92,6912,244,117],20,[246],45,[248,249,101,250],32,[245,247],0,[92],1,[92],14,[6913]],[12,6,93],64,2360,2361,[[9,438],[19,118]],null,6914,[3,16,4]],[6915,6916,6917,[2,[6918,6919,6920],20,[6921,6922],17,[6923],0,[2369],1,[2369],14,[6924]],[39,57,44],6925,365,6926,[[5,350]],null,6927,[3]],[2288,6928,673,null,[25,13,39],41,6929,307,[[9,1086],[5,6930]],null,6931,[15,16]],[6932,6933,6934,null,[6,13,73],2355,365,363,[[24,6935]],null,6936,[23,4]],[1139,1140,1141,[2,[1142,1143,1144,1145,1146,1147,1148],28,[1149],0,[1150,1151,1152],1,[1153]],[13,18,115],40,6937,2000,[[47,6938],[9,433]],null,6939,[11,3,23]],[726,1761,1762,[2,[726,1763],0,[727,1764],1,[727]],[25,114,39],2370,6940,38,[[9,6941],[5,6942]],null,6943,[15,3]],[1218,6944,6945,[2,[6946,6947],0,[1218,2371,6948,6949],1,[1218,2371]],[39,50,18],6950,6951,363,[[9,2372]],null,6952,[3,11]],[6953,6954,6955,[2,[6956,6957,2373,6958,6959],0,[2374,2375,6960,2373,6961],1,[2374,2375]],[6962,134,39],6963,365,6964,[[5,6965]],null,6966,[8,3]],[2287,6967,1001,null,[129,1164,6968],41,6969,100,[[5,6970]],null,6971,[8,16]],[2332,6972,885,[2,[886,887,888,889,2333],0,[275,276,208,277,278,2334,529],1,[275,276,208,277,278],14,[890,2335]],[81,891,13],41,6973,6974,[[9,362]],null,6975,[4,11,7]],[791,6976,6977,[2,[791,2134],0,[791,2376,2377,2378],1,[791,2376,2377,2378],14,[6978,6979,6980,6981,6982,6983]],[39,50,44],41,6984,6985,[[9,362]],null,6986,[3]],[6987,6988,2132,[0,[2379,6989,6990,2380],1,[2379,2380],14,[6991]],[6992,348,36],6993,365,363,[[5,350]],null,6994,[3,4]],[2306,6995,429,[2,[428,2307,2308,2309,2310,2311,2312,2313,2314,2315,2316,2317,2318,2319,2320],0,[195,788],1,[195,788],14,[2321,2322]],[6,1137,13],6996,365,6997,[[5,350]],null,6998,[10,4]],[6999,7000,7001,[2,[7002,7003,7004,7005,7006,7007],0,[2381,2382,2383,7008],1,[2381,2382,2383]],[765,43,314],443,7009,7010,[[19,7011],[5,7012]],null,7013,[8]],[7014,7015,7016,[2,[7017],0,[2384,2385],1,[2384,2385],14,[7018,7019,7020,7021,7022,7023]],[7024,18,7025],26,54,1893,[[5,7026]],null,7027,[11,3,4]],[2386,7028,7029,[2,[2386,7030],0,[2387,7031,2388,7032,7033,7034],1,[2387,2388]],[114,18,39],26,7035,7036,[[9,2372]],null,7037,[15,11]]]],[7038,7039,[[975,976,977,[2,[132,85,978],20,[85],17,[85,979],45,[85],32,[85,980],0,[132,312],1,[132,312]],[35,13,89,44,84],591,2389,2390,[[9,1130],[72,1131],[63,2391]],null,7040,[7,3,4]],[366,7041,2392,[2,[366,2393,2394,7042,7043,792,2395,2396,1219,2397],20,[366,792],0,[793,794,795,2398,2399],1,[793,794,795]],[73,427,13,6,36],7044,7045,2400,[[76,2401]],null,7046,[3,10,23]],[2402,2138,2136,[2,[357,2402,7047],20,[357,7048,7049,7050],17,[7051,7052],86,[357],0,[2403,357,7053,7054],1,[2403,357]],[6,37,12,228],26,7055,7056,[],null,7057,[3,4,10]],[2404,7058,7059,[2,[2404,7060,7061,7062,7063,7064,7065,7066,7067],0,[2405,2406,2407],1,[2405,2406,2407]],[12,35,62,60],22,149,7068,[],null,7069,[7,16]],[2408,7070,7071,[2,[2408,7072,7073,7074,7075,7076,7077,7078,7079,7080,7081,7082,7083,7084,7085],0,[2409,2410,2411,7086,7087],1,[2409,2410,2411]],[12,62,87,60],22,7088,7089,[[9,1162]],null,7090,[4,7,11]],[988,109,1576,[20,[109,989],0,[109,315],1,[109,315]],[12,60,37,31],1577,7091,7092,[[76,7093]],null,7094,[3,15]],[796,7095,7096,[20,[796,7097],0,[796,7098,7099,7100,7101],1,[796]],[2412,57,67],7102,2413,7103,[[5,2414]],null,7104,[30,8]],[7105,85,132,[2,[1220,2415,7106,7107,7108,7109,7110,7111,7112,7113,7114,7115,7116,7117],20,[2415],0,[1220],1,[1220]],[35,13,89,44,84],591,2389,2390,[[9,1130],[72,1131],[63,2391]],null,7118,[7,3,4]],[7119,7120,7121,[20,[7122,7123],0,[2416,7124],1,[2416]],[13,57,35],212,2417,2418,[],null,7125,[16,7]],[1219,7126,2392,[2,[1219,7127,7128,2393,2394,366,792,2395,2396,2397,7129,7130,7131,7132,7133,7134,7135],20,[366,792],0,[793,794,795,2398,2399],1,[793,794,795]],[73,427,13,6,36],7136,7137,2400,[[76,2401]],null,7138,[3,10,23]],[1221,7139,7140,[2,[1221,7141,7142],20,[1221],0,[2419,7143],1,[2419]],[12,35,228],22,149,199,[],null,7144,[7]],[2420,7145,7146,[2,[2420,7147,7148,7149,1767,7150,7151],0,[2421,2422,7152,2423,2424],1,[2421,2422,2423,2424]],[35,13,57],22,149,199,[[5,7153]],null,7154,[7]],[1222,7155,7156,[2,[121,7157,7158,7159,7160],0,[1222,2425,7161,7162,7163,7164,7165,7166],1,[1222,2425]],[12,62,6],40,7167,7168,[[9,1162]],null,7169,[16,4]],[7170,2426,7171,[45,[2426,7172,7173,7174,7175,7176,7177,7178],0,[2427],1,[2427]],[2412,57,67],212,2413,7179,[[5,2414]],null,7180,[30,8]],[2428,7181,7182,[2,[2428,7183,7184],0,[2429,2430],1,[2429,2430]],[89,228],22,149,199,[],null,7185,[7]],[7186,7187,7188,[0,[2431,2432],1,[2431,2432],2,[7189,7190,7191,7192,7193],14,[7194,7195,7196]],[89,228],22,149,199,[],null,7197,[7]],[7198,7199,7200,[0,[2433,2434,2435],1,[2433,2434,2435],2,[7201,7202,7203]],[12,35],22,149,199,[],null,7204,[7]],[7205,7206,7207,[0,[2436,2437,2438,2439],1,[2436,2437,2438,2439]],[12,35],22,149,199,[],null,7208,[7]],[7209,7210,7211,[0,[2440,2441,2442,2443],1,[2440,2441,2442,2443],2,[7212,7213]],[12,60],22,149,199,[],null,7214,[7]],[7215,7216,7217,[0,[2444,2445],1,[2444,2445],2,[7218,7219]],[12,62],22,149,199,[[5,7220]],null,7221,[16,7]],[7222,7223,7224,[0,[2446,2447,2448,2449],1,[2446,2447,2448,2449],2,[7225,7226]],[51,87,62],1710,7227,7228,[[5,7229]],null,7230,[4,7]],[7231,7232,7233,[0,[2450,2451,2452],1,[2450,2451,2452],2,[7234,7235]],[12,62],212,2417,2418,[],null,7236,[16]],[7237,7238,7239,[0,[2453],1,[2453],14,[7240,7241]],[2454,2455],212,2456,2457,[[5,2458]],null,7242,[23,30]],[7243,7244,7245,[14,[7246,7247,7248,7249,7250]],[2454,2455,75],212,2456,2457,[[5,2458]],null,7251,[23,30]],[7252,2459,2459,[0,[2460,366],1,[2460],20,[7253,7254]],[12,62,37],7255,7256,7257,[],null,7258,[3,16]]]],[7259,7260,[[658,659,660,[103,[661],662,[663],127,[664],0,[183,184,185],1,[183,184,185]],[7261,1966,7262,150],40,7263,755,[[47,1882],[19,7264]],null,7265,[8,4,23]],[1883,1884,1885,[2,[1886,1887,1888,1889],0,[740,741,1890],1,[740,741]],[1223,1224,7266,797],2267,7267,7268,[[9,7269],[19,7270]],null,7271,[8,23,4,16]],[7272,7273,7274,[2,[7275],0,[2461,2462,2463,2464,2465,2466,2467,2468],1,[2461,2462,2463,2464,2465,2466,2467,2468]],[1225,798,7276,1224],40,7277,2469,[[5,7278]],null,7279,[8,23]],[752,1954,1955,[2,[1956,752,1957],0,[753,754,1958,1959,1960,1961,1962,1963,1964,1965],1,[753,754]],[7280,7281,1225,7282],40,7283,7284,[[47,7285]],null,7286,[4,8,23]],[7287,7288,7289,[0,[2470,2471],1,[2470,2471],14,[7290,7291]],[2472,7292,799,7293],2370,7294,2473,[[9,694]],null,7295,[3,8,4]],[7296,7297,7298,[0,[2474,7299],1,[2474],14,[7300,7301]],[1223,2475,797,2149],22,7302,7303,[[9,1226]],null,7304,[8,4,11]],[2016,355,2017,[2,[1168],0,[355,2018,2019],1,[355],14,[2020,2021]],[150,799,7305,797],7306,7307,2473,[[19,7308]],null,7309,[4,8,10]],[2031,2032,2033,[2,[2034],0,[762,2035],1,[762],14,[2036,2037]],[2476,7310,150,7311],2038,2359,739,[[19,729]],null,7312,[11,4,15]],[352,1874,1875,[48,[1876,1877,737,1878],0,[352,738],1,[352,738],14,[1879,737,1880]],[2476,7313,7314,798],40,1881,7315,[[5,7316]],null,7317,[23,34,8]],[1856,1857,1858,[103,[1859,1860],0,[731,1861],1,[731]],[150,797,7318,7319],40,7320,755,[[19,729]],null,7321,[4,10,15]],[126,387,242,[243,[244,117,245],388,[246,247],48,[248,249,101,250],17,[389,117,126,390,101],0,[391,92,392,393,394],1,[92],14,[395]],[7322,6,7323,7324],64,7325,739,[[19,118],[5,7326]],null,7327,[3,16,8]],[251,252,253,[48,[254],255,[256],17,[257,258,259,260],0,[261,102],1,[102],262,[263],103,[264],127,[265]],[7328,13,222,7329],64,7330,7331,[[19,118]],null,7332,[3,16]],[7333,7334,2477,[0,[800,131,801],1,[800,131],14,[1227]],[7335,802,7336,798],437,7337,2478,[[19,7338]],null,7339,[8]],[7340,7341,690,[0,[191,801,7342],1,[191,801]],[1224,7343,2140,802],2099,7344,7345,[[5,7346]],null,7347,[8,7,10]],[2022,2023,2024,[2,[2025,2026],0,[761,2027,2028],1,[761],14,[2029]],[150,7348,2133,7349],55,7350,7351,[[19,7352]],null,7353,[4,10,23]],[58,685,686,[27,[58,111,112],17,[58,111,112],83,[687,425,688],32,[58,111,112],0,[58,189,190],1,[58,189,190]],[7354,13,7355,2472],1058,7356,7357,[[9,7358]],null,7359,[3,4,10]],[7360,426,1037,[0,[328,7361,7362,7363],1,[328]],[7364,150,7365,222],26,7366,7367,[[5,7368]],null,7369,[4,3,7]],[1830,1831,1832,null,[150,13,7370,7371],1833,7372,2479,[[9,1089],[19,7373]],null,7374,[4,16]],[1942,354,1943,[0,[354,1944,1945],1,[354]],[7375,150,222,1225],40,7376,1855,[[5,7377]],null,7378,[4,3,11]],[1817,1818,1819,null,[119,7379,7380,798],22,7381,7382,[[9,1226],[76,1155]],null,7383,[8,34,15]],[382,7384,7385,[0,[2480,7386],1,[2480],2,[7387]],[51,1797,13,7388],7389,7390,406,[[5,7391]],null,7392,[11,4,33]],[2085,2086,2087,[2,[2088,2089],0,[2090]],[7393,18,78,7394],7395,7396,7397,[[19,7398]],null,7399,[11,3]],[620,621,622,[2,[623,178,624],27,[625,626],28,[179,178],0,[627,628,629],1,[630],14,[179]],[7400,1163,7401,802],437,7402,7403,[[9,274],[19,1539]],null,7404,[8,30]],[1139,1140,1141,[2,[1142,1143,1144,1145,1146,1147,1148],28,[1149],0,[1150,1151,1152],1,[1153]],[13,18,7405,7406],40,7407,755,[[47,7408],[9,274]],null,7409,[3,11,23]],[803,804,805,[20,[806,807,808,809,810,811,812,813,814,815,200],2,[816,817,818,819,820],0,[225,226],1,[225,226]],[6,13,799,222],22,7410,7411,[[24,194]],null,7412,[3,8]],[1036,1840,690,[2,[689,145],0,[145,191],1,[145,191]],[2481,7413,7414,802],437,7415,7416,[[9,1226]],null,7417,[8,7,10]],[1939,353,1940,[0,[353,1941],1,[353]],[7418,7419,7420,25],64,7421,2366,[[5,7422]],null,7423,[3,15]],[2482,7424,7425,[0,[2483,7426,7427],1,[2483],14,[2482,7428]],[2484,7429,13,7430],7431,7432,7433,[[5,7434]],null,7435,[16,8,11]],[1227,7436,2477,[0,[800,131,801],1,[800,131],14,[1227]],[2481,1223,338,7437],437,7438,7439,[[5,7440]],null,7441,[8,30]],[1228,7442,7443,[0,[2485,1228],1,[2485],14,[1228,7444]],[7445,691,1187,13],212,7446,7447,[[19,7448]],null,7449,[4,3,11]],[2040,193,2041,[2,[193,2042,2043],0,[193,2044,2045,2046],1,[193,2047,2048,2049],14,[2050]],[7450,150,13,7451],2051,7452,7453,[[19,763]],null,7454,[4,3,7]],[7455,7456,7457,[0,[2486,7458],1,[2486]],[799,420,2475,7459],40,7460,2479,[[9,7461],[19,7462]],null,7463,[8,4,23]],[2487,2488,7464,[0,[7465,7466,7467,7468],1,[2488],14,[2487,7469,7470]],[7471,7472,7473,81],40,7474,7475,[[24,7476]],null,7477,[34,3,4]],[7478,7479,7480,[0,[2489,2490,7481],1,[2489,2490]],[7482,1908,7483,2484],7484,7485,2478,[[9,1089],[5,7486]],null,7487,[34,15,16]],[616,1059,419,[2,[108,617,618],0,[108,177],1,[108,177]],[7488,7489,6,7490],22,7491,2469,[[19,7492],[5,7493]],null,7494,[8,10,33]]]]]}';
+
+let decodificado: CategoriaPlanta[] | undefined;
+
+// Decodifica el catálogo la primera vez que se pide
+export const cargarPlantasCompactas = (): CategoriaPlanta[] => {
+  if (!decodificado) decodificado = decodificarPlantas(datos);
+  return decodificado;
+};
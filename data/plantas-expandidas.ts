@@ -1,6 +1,9 @@
 // Pócima Salvage - Base de datos expandida de plantas medicinales
 // Generado automáticamente - Total: 693 plantas
 
+import { buscarEnIndice } from './busqueda';
+import { indiceBusquedaPlantas } from './busqueda-index';
+
 export interface PlantaExpandida {
   id: string;
   nombre: string;
@@ -10460,10 +10463,13 @@ export const getAllPlantas = (): PlantaExpandida[] => {
   return categoriasPlantas.flatMap(cat => cat.plantas);
 };
 
-// Función para buscar plantas
+// Función para buscar plantas (índice de trigramas sin acentos; filtro lineal si el índice está desactualizado)
 export const buscarPlantasExpandidas = (query: string): PlantaExpandida[] => {
+  const plantas = getAllPlantas();
+  const posiciones = buscarEnIndice(indiceBusquedaPlantas, query, huellaPlantas);
+  if (posiciones) return posiciones.map(i => plantas[i]);
   const q = query.toLowerCase();
-  return getAllPlantas().filter(p =>
+  return plantas.filter(p =>
     p.nombre.toLowerCase().includes(q) ||
     p.nombreCientifico.toLowerCase().includes(q) ||
     p.propiedades.some(prop => prop.toLowerCase().includes(q)) ||
@@ -10499,3 +10505,6 @@ export const getPlantasByPropiedad = (propiedad: string): PlantaExpandida[] => {
 
 // Exportar conteo total
 export const totalPlantas = 693;
+
+// Huella del contenido: los índices generados la guardan para saber si están al día
+export const huellaPlantas = "ac331aec271b1127";
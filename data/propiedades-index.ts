@@ -0,0 +1,1478 @@
+// Pócima Salvage - Vocabulario canónico de propiedades y bitsets por planta
+// Generado automáticamente por scripts/build-property-vocabulary.py - no editar a mano
+
+export interface IndicePropiedades {
+  // Número de plantas indexadas
+  totalPlantas: number;
+  // Huella de plantas-expandidas.ts al generar el índice (para detectar un índice desactualizado)
+  huellaPlantas: string;
+  // id estable del término -> forma canónica
+  vocabulario: string[];
+  // posición en getAllPlantas() -> id del término de cada propiedad (-1 si no tiene), en orden
+  terminos: number[][];
+  // posición en getAllPlantas() -> bitset de sus términos (palabras de 32 bits)
+  plantas: number[][];
+  // keyword de enfermedadToPropiedades -> bitset de los términos que satisfacen sus propiedades
+  requisitos: Record<string, number[]>;
+}
+
+export const indicePropiedades: IndicePropiedades = {
+  totalPlantas: 693,
+  huellaPlantas: "ac331aec271b1127",
+  vocabulario: ["Antiinflamatoria","Antioxidante","Diurético","Digestivo","Expectorante","Astringente","Carminativo","Antiséptico","Antiespasmódico","Analgésico","Cicatrizante","Nutritiva","Sedante","Vitamínico","Antibacteriano","Antiviral","Vitamina C","Refuerza el sistema inmunológico","Antimicrobiana","Ansiolítica","Relajante","Inmunomodulador","Hipoglucemiante","Depurativa","Inmunoestimulante","Laxante","Energizante","Hepatoprotectora","Remineralizante","Emoliente","Refuerza el sistema inmunitario","Emenagogo","Antitumoral","Febrífugo","Laxante suave","Hidratante","Hipotensor","Estimulante","Antiséptico urinario","Cardioprotectora","Afrodisíaco","Antipirético","Neuroprotector","Adaptógeno","Antifúngico","Cardiotónico","Regulador hormonal","Rico en Vitamina C","Sedante suave","Balsámica","Estimulante circulatorio","Vermífugo","Galactagogo","Antidepresivo","Tónico","Salud ocular","Fortalece el sistema inmunológico","Antiemético","Colagogo","Sudorífica","Diaforética","Antidiarreico","Antitusivo","Tónico nervioso","Tónico amargo","Calmante","Antiparasitario","Demulcente","Hipocolesterolemiante","Venotónico","Colerético","Mejora la digestión","Refrescante","Anticancerígena (potencial)","Rubefaciente","Antihemorrágica","Descongestionante","Antialérgica","Anticoagulante","Energética","Estimulante digestivo","Purgante","Mejora la memoria","Antirreumático","Hipolipemiante","Insecticida","Rico en fibra","Antihistamínico","Tónico digestivo","Hipnótico","Relajante muscular","Aperitivo","Antianémico","Desintoxicante","Prebiótica","Vasoprotector","Hemostático","Reductor del colesterol","Aromatizante","Salud digestiva","Propiedades antiinflamatorias","Mejora el estado de ánimo","Reduce el estrés","Reduce la ansiedad","Antisudoral","Saciante","Anorexígena","Galactogogo","Antiedematoso","Regulador del azúcar","Bajo en calorías","Inductor del sueño","Analgésico suave","Salud cardiovascular","Salud ósea","Control de la diabetes","Fuente de energía","Reduce la fiebre","Fibra","Reduce el estrés y la ansiedad","Mejora la función cognitiva","Combate la fatiga","Quelante de metales pesados","Rico en vitaminas","Anestésico local","Antibiótica natural","Antiinflamatorio ocular","Fitoestrogénico","Regeneradora","Vasoconstrictor","Broncodilatador","Vulnerario","Muy rico en Vitamina C","Antibacterial","Antihipertensiva","Mejora el rendimiento deportivo","Salud de la piel","Rica en potasio","Saciente","Rica en calcio","Fácil de digerir","Rica en carbohidratos","Fuente de Vitamina C","Mejora el rendimiento físico y mental","Regeneradora de la piel","Hidratante de la piel","Probiótico","Apoyo tiroideo","Regulador intestinal","Alta en proteínas","Fitorremediación","Reduce la presión arterial","Control del azúcar en sangre","Mejora la circulación","Regula la presión arterial","Mejora la salud respiratoria","Antioxidante potente","Control del colesterol","Antienvejecimiento","Control de la presión arterial","Salud bucal","Manganeso","Alucinógeno","Supresora del apetito","Protege el hígado","Apoya el sistema inmunológico","Aumenta la energía y la resistencia","Mejora la memoria y la cognición","Tónico general","Antiséptico suave","Circulatorio","Termogénica","Analgésico dental","Anabolizante natural","Antiinflamatoria para la garganta","Edulcorante natural","Antibiótico","Fortalecedor del sistema inmune","Vasodilatador","Estimulante intestinal","Metabolismo","Narcótico","Anestésico","Anticonvulsivo","Regenerador óseo","Antipruriginoso","Antiulceroso","Suavizante","Vasodilatador cerebral","Antiescorbútico","Antipalúdico","Amargo","Detergente","Alcalinizante","Hermostático","Vasodilatador coronario","Alivia síntomas del síndrome premenstrual (SPM)","Antiadherente bacteriano (vías urinarias)","Diurético potente","Laxante drástico","Vomitivo","Alterativo (depurativo)","Hipertensor","Diurético suave","Antiséptico potente","Purgante drástico","Vesicante (produce ampollas en la piel)","Alivia el síndrome premenstrual","Trata irregularidades menstruales","Tónico hepático","Estimulante de la bilis","Linfagogo","Antidepresivo suave","Antiséptico respiratorio","Vasodilatador periférico","Euforizante","Estimulante del sistema nervioso","Endulzante","Fertilidad","Sialagoga","Saponinas","Bajo índice glucémico","Ligeramente laxante","Anterógeno (reduce la testosterona)","Hipoalergénico","Tónico del Bazo (MTC)","Antidiaforético","Tónico de Qi","Tónico pulmonar","Tónico de la sangre y del Yin","Reguladora menstrual","Sin gluten","Ligeramente dulce","Textura crujiente","Antifatiga","Alivio de síntomas menopáusicos","Tónico cerebral","Restaurador del Shen (MTC)","Tónico para la piel","Hipnótico suave","Antiequimótica (reduce moratones)","Cardiotónico suave","Refrigerante","Detoxificante (hígado)","Astringente suave","Tónico cardíaco","Antiinflamatoria cutánea","Secretolítica","Antimigrañoso","Nootrópica (mejora la memoria)","Regulador del ritmo cardíaco","Tónico venoso","Analgésico neural","Antigripal","Nutritivo para la piel","Carotenoide (luteína)","Estimulante del apetito","Mejora del rendimiento atlético","Noótropo","Regenerador nervioso","Dermatológico","Mineralizante","Rica en clorofila","Apoyo inmunológico","Rico en yodo","Rico en fucoxantina","Quema grasa","Rica en vitamina B12","Rica en hierro","Estimulante metabólico","Rica en glutamato","Mejora la digestión de legumbres","Fuente de yodo","Equilibrio hormonal","Salud capilar","Aporte de minerales","Fortalece huesos y dientes","Rica en hierro y magnesio","Depurativa de aguas","Anaphrodisiaco","Emetico (en altas dosis)","Comestible","Anti-escorbútica","Oxigenante de agua","Biofertilizante","Producción de colágeno","Mejora la salud ocular","Favorece la digestión","Beneficioso para la piel","Reduce el colesterol","Favorece el tránsito intestinal","Beneficiosa para la salud del corazón","Favorece la pérdida de peso","Fortalece los huesos","Protege el corazón","Mejora la salud ósea","Antidepresivo natural","Favorece el sueño","Protector hepático","Fuente de electrolitos","Mejora la salud cerebral","Ayuda a dormir","Protector cardiovascular","Endulzante natural de bajo índice glucémico","Mejora la visión","Salud hepática","Salud tiroidea (por yodo)","Fuente de proteína y fibra","Salud cerebral","Mejora el humor","Antidiabética (semillas)","Detoxificante sanguíneo","Repelente de insectos","Fuente de vitamina C y B6","Fuente de carbohidratos complejos","Alivia dolores de cabeza","Extremadamente rica en Vitamina C","Laxante potente","Antigota","Antiinflamatorio intestinal","Protector de la vista","Revitalizante","Regulador de glucosa","Hierro","Prostática","Tiroidea","Estimulante del SNC","Reguladora del azúcar en sangre","Potenciador de la absorción de nutrientes","Estimulante cerebral","Analgésico local","Rico en minerales","Acidulante","Bio-potenciador","Rejuvenecedor","Estimulante del sistema nervioso central","Reduce la fatiga","Aumenta la fuerza muscular","Aumenta la resistencia al estrés","Aumenta la resistencia física","Mejora la función inmunológica","Mejora la concentración","Mejora la resistencia y el rendimiento","Propiedades antioxidantes","Mejora la calidad del sueño","Mejora la función respiratoria","Mejora la función renal","Mejora la libido y la fertilidad","Equilibra las hormonas","Protege el sistema cardiovascular","Aumenta la energía","Potente antiinflamatorio","Mejora la función cerebral","Alivia el dolor articular","Alivia las náuseas y el mareo","Alivia el dolor muscular","Mejora la memoria y la función cognitiva","Propiedades neuroprotectoras","Promueve la cicatrización de heridas","Regula el azúcar en sangre","Propiedades antitumorales","Rica en nutrientes y antioxidantes","Reduce el azúcar en sangre","Muy rica en vitamina C y antioxidantes","Mejora la salud del cabello y la piel","Alivia el dolor de la artritis","Propiedades antivirales","Tonifica el Qi y la sangre","Relajante nervioso","Tónico para el sistema nervioso","Alivia el dolor de garganta","Apoya la salud digestiva","Sedante y ansiolítico","Alivia los espasmos musculares","Apoya la salud suprarrenal","Alivia las úlceras gástricas","Promueve la cicatrización","Mejora la circulación venosa","Tonifica el bazo y el Qi","Elimina la humedad","Fortalece el sistema digestivo","Aumenta la fuerza y la resistencia","Apoya la salud del sistema nervioso","Promueve un sueño reparador","Inmunomodulador potente","Potente antioxidante","Apoya la salud gastrointestinal","Ayuda a regular el azúcar en sangre","Tónico reproductor femenino","Apoya la lactancia","Calma el tracto digestivo","Aumenta la libido","Apoya la salud del tracto urinario","Mejora la circulación cerebral","Potencia la memoria y la concentración","Alivia los síntomas del vértigo"],
+  terminos: [
+    [8,3,6,20],
+    [37,1,0,6],
+    [7,4,62],
+    [14,44,1,3],
+    [3,6,9,72],
+    [3,6,8],
+    [3,6,122],
+    [2,123,0],
+    [6,3,8],
+    [3,6,4],
+    [0,7,46,104],
+    [12,3,8],
+    [3,51,124],
+    [47,3,169],
+    [6,4,2,52],
+    [6,3,8],
+    [6,3,4],
+    [0,1,27,73],
+    [57,0,3,170],
+    [22,18,171],
+    [172,7,6],
+    [3,6,4],
+    [53,1,40],
+    [20,19,7,10],
+    [12,15,3,19],
+    [23,2,4],
+    [3,4,63],
+    [3,7,40],
+    [4,62,15],
+    [51,31,3],
+    [2,6,31],
+    [24,87,0,32],
+    [52,22,173],
+    [74,80,4],
+    [3,0,14],
+    [51,8,6],
+    [5,75,0],
+    [5,58,174],
+    [6,57,0],
+    [3,33,48,14],
+    [25,81,5],
+    [175,22,36],
+    [18,76,0],
+    [6,7,33],
+    [10,0,7,31],
+    [125,4,47],
+    [59,4,0,29],
+    [3,6,20,8],
+    [4,29,49],
+    [29,0,34,49],
+    [126,2,54],
+    [0,9,41,2],
+    [75,31,0,3],
+    [31,88,51],
+    [64,51,58,31],
+    [12,89,19,127],
+    [12,89,90,19],
+    [31,8,74],
+    [3,6,7,4],
+    [77,0,4,18],
+    [3,0,65,14,20],
+    [0,10,128,35],
+    [176,78,1,177],
+    [4,18,22],
+    [2,23,128,5],
+    [53,19,9],
+    [57,0,14,15],
+    [7,4,1],
+    [20,10,9],
+    [20,2,8],
+    [2,23,37],
+    [178,1,82],
+    [37,1,2],
+    [1,44,14,0,87],
+    [65,9,8],
+    [0,9,41],
+    [7,179,22],
+    [1,2,14,5],
+    [41,81,2,20],
+    [7,0,2,25],
+    [79,180,3],
+    [26,24,36],
+    [3,91,6],
+    [129,92,2],
+    [2,45],
+    [7,2,20],
+    [9,181,12],
+    [8,6,10],
+    [3,25,2],
+    [91,66,3],
+    [182,12,19],
+    [8,12,31],
+    [0,10,7],
+    [13,0,1],
+    [183,75,0],
+    [14,67,11],
+    [2,6,4],
+    [20,12,3],
+    [81,25],
+    [105,68,25],
+    [12,9,89],
+    [184,9],
+    [26,54],
+    [66],
+    [37,106],
+    [185,0],
+    [41,83],
+    [3,14],
+    [0,130,4],
+    [25,2,49],
+    [3,22,107],
+    [0,36,11],
+    [10,186,69],
+    [84,1,27],
+    [23,93,0,14],
+    [29,0,187,34],
+    [6,3,48,4],
+    [7,0,5,31,22],
+    [50,9,1,6],
+    [27,70,2,48],
+    [4,7,0,76],
+    [9,0,41],
+    [20,12,8,60],
+    [36,22,1],
+    [14,44,85,0],
+    [11,1,0],
+    [188,1,42],
+    [69,0,108],
+    [2,0,9],
+    [2,23,0],
+    [5,129,8],
+    [4,7,49],
+    [7,4,20],
+    [0,1],
+    [5,0,7],
+    [7,4,33],
+    [5,44,22],
+    [32],
+    [45,36,20],
+    [5,0,69],
+    [5,0],
+    [5,0],
+    [13,5],
+    [3,6,4],
+    [19,0],
+    [7,14,44],
+    [189,54,37],
+    [27,70,3],
+    [190,33,191],
+    [10,0,15],
+    [11,79],
+    [4,7],
+    [49,4,7],
+    [29,0,5],
+    [61,11,4],
+    [29,11,34],
+    [5,33],
+    [2,29,33],
+    [0,9,7],
+    [5,51,1],
+    [5,61,7],
+    [25,29,4],
+    [192,85],
+    [7,13,193],
+    [5,38,0],
+    [34,4,22],
+    [12,3,8],
+    [5,0,10],
+    [2,5,28],
+    [1,0,7,50,6],
+    [20,19,7,9,10],
+    [5,0,194,10],
+    [45,36,195,12],
+    [46,196,31],
+    [38,2,5],
+    [197,1,0],
+    [0,77,2,47],
+    [198,7,6,83],
+    [38,5,2,0],
+    [23,2,59,0],
+    [69,0,108,2],
+    [7,4,49,5],
+    [15,14,10,75],
+    [38,2,0,48],
+    [15,59,0,2],
+    [31,88,51,70],
+    [59,23,33,58],
+    [5,131,0],
+    [199,200,85],
+    [33,5,54],
+    [33,81,41],
+    [132,1,10,24],
+    [133,0,41,15],
+    [18,58,201,0],
+    [45,5,47],
+    [45,2,202],
+    [132,5,0,203],
+    [0,10,7],
+    [3,6,8,91],
+    [204,4,44,8],
+    [205,206],
+    [8,12,5,36],
+    [46,207,208],
+    [25,5,33],
+    [7,4,5],
+    [209,210,18],
+    [211,5,4],
+    [12,9,62],
+    [40,63,212,2],
+    [28,2,10,5],
+    [4,213,76,33],
+    [18,1,0],
+    [9,0],
+    [75,10,7],
+    [4,0,3],
+    [0,83],
+    [35,29,1],
+    [5,0,10],
+    [5,29,0],
+    [10,0,35,7],
+    [0,57,3,1],
+    [0,1,27,73],
+    [9,0,21,18],
+    [0,21,15,1],
+    [10,0,15,9],
+    [0,9,7,4],
+    [1,26,0],
+    [37,26,54,9],
+    [37,1,2,3],
+    [79,0,3],
+    [43,54,26,21],
+    [12,19,8],
+    [94,0,7],
+    [1,0,38,95],
+    [15,60,0,4],
+    [130,4,62,0],
+    [11,1,0,22],
+    [10,95,42,0],
+    [1,27,84,21],
+    [23,2,0,18],
+    [29,0,4,34],
+    [6,4,8,107],
+    [7,0,5,104],
+    [50,6,1,0],
+    [3,0,65,8],
+    [18,36,84,78],
+    [4,7,76,0],
+    [2,28,10,5],
+    [53,19,10,15],
+    [7,4,8,3],
+    [20,19,7,9],
+    [12,19,60,8],
+    [2,23,58,64],
+    [214,42,1],
+    [7,44,1,6],
+    [9,0,41],
+    [2,41,20],
+    [3,6,8,31],
+    [23,2,28,92],
+    [45],
+    [7,20,5,0],
+    [48,62,29],
+    [6,8,2,107],
+    [2,23,28,6],
+    [64,51,58,31],
+    [19,90,124],
+    [8,31,74],
+    [0,10,7,29],
+    [1,37,39,215],
+    [3,0,57,1,9],
+    [0,1,27,70,18],
+    [43,54,216,24,1],
+    [24,43,39,2,1],
+    [0,4,15,27,217],
+    [12,19,90,36,8],
+    [24,0,15,10,14],
+    [23,2,59,0,18],
+    [23,2,70,27,64],
+    [43,26,218,46,11],
+    [43,19,0,24,63],
+    [18,0,5,64,24],
+    [3,6,4,8,2],
+    [25,81,5,3,0],
+    [67,29,0,4,2],
+    [15,4,60,24,18],
+    [6,80,63,4,8],
+    [64,80,58,41,219],
+    [50,76,18,2,74],
+    [0,83,220,23,9],
+    [11,1,0,109,24],
+    [27,93,134,1,135],
+    [123,1,55,136,3],
+    [4,2,47,0,3],
+    [2,3,137,86,1],
+    [2,28,3,23,0],
+    [58,70,7,4,2],
+    [47,1,3,110,86],
+    [94,109,3,221,138],
+    [3,79,139,140,11],
+    [11,47,10,0,35],
+    [79,141,1,222,11],
+    [223,14,85,2,1],
+    [11,224,140,86,109],
+    [225,2,3,226,24],
+    [43,227,24,228,52],
+    [229,0,21,42,46],
+    [9,8,0,230,27],
+    [6,0,57,18,50],
+    [23,0,83,60,27],
+    [11,79,141,231,142],
+    [3,11,232,233,110],
+    [43,24,234,143,54],
+    [46,8,0,12,235],
+    [4,42,65,236,237],
+    [3,0,65,77,14],
+    [10,0,7,144],
+    [20,19,7,9],
+    [5,0,238,20],
+    [20,12,53,40],
+    [36,2,1,13],
+    [15,60,4,0],
+    [12,19,8,60],
+    [12,19,239,8],
+    [12,19,111,8],
+    [12,112,111,19],
+    [4,49,59,0],
+    [29,49,0,34],
+    [0,9,240],
+    [24,15,14,0],
+    [33,4,2],
+    [59,2,29,0],
+    [125,4,38,13],
+    [63,8,241],
+    [33,242,134,243],
+    [4,2,10,0],
+    [126,244,2],
+    [5,33,245,12],
+    [23,2,246,4],
+    [4,247,49,48],
+    [0,9,41,2],
+    [44,14],
+    [22,2,18],
+    [5,10,96,63],
+    [19,53,0,42],
+    [9,8,0,46],
+    [248,0,8],
+    [63,20,3,52],
+    [96,0,8,10],
+    [249,19,53,1],
+    [45,36,250,12],
+    [12,89,19,127],
+    [251,78,0,48],
+    [4,29,49,0],
+    [4,62,15,3],
+    [252,12,253],
+    [45,2],
+    [45],
+    [53,1,31,40],
+    [46,0,254],
+    [3,8,14,255],
+    [88,6,4,8],
+    [64,256,33,70],
+    [21,43,0,27],
+    [15,97,21],
+    [22,21,32],
+    [26,257,40],
+    [42,258,259],
+    [1,0,15],
+    [21,32,94],
+    [15,14,0],
+    [145,1,42],
+    [2,65,21],
+    [21,32,77],
+    [32,21,1],
+    [97,1,0],
+    [2,21,27],
+    [32,21,44],
+    [78,97,35],
+    [22,1,32],
+    [0,14,96],
+    [32,0,9],
+    [21,32,0],
+    [97,1,0],
+    [21,32,10],
+    [14,1,21],
+    [0,1,260],
+    [1,13,18],
+    [1,261,98],
+    [1,21,0],
+    [1,40,0],
+    [32,1,146],
+    [43,42,1],
+    [11,1,13],
+    [11,1,0,21],
+    [93,262,263],
+    [264,147,11],
+    [265,266,113],
+    [267,55,15],
+    [268,1,114],
+    [269,147,0],
+    [34,138,148],
+    [4,67,11],
+    [270,271,272],
+    [273,139,274],
+    [86,275,276],
+    [23,277,1],
+    [2,47,28],
+    [149,278,0],
+    [150,0,10],
+    [12,279,5],
+    [4,2,47,23],
+    [3,6,8],
+    [5,131,280],
+    [2,28,5],
+    [11,0,1],
+    [281,11,282],
+    [283,7,2],
+    [284,149,150],
+    [1,16,17],
+    [1,16,17],
+    [1,16,17],
+    [1,16,17],
+    [1,16,17],
+    [1,16,17],
+    [1,16,17],
+    [1,16,17],
+    [1,16,17],
+    [1,16,17],
+    [1,16,17],
+    [1,16,17],
+    [1,16,17],
+    [1,16,17],
+    [1,16,17],
+    [1,16,17],
+    [1,16,17],
+    [1,16,17],
+    [1,16,17],
+    [1,16,17],
+    [1,16,17],
+    [1,16,17],
+    [1,16,17],
+    [1,16,17],
+    [1,16,17],
+    [1,0,115,30,99,285],
+    [3,0,10,30,1,2],
+    [3,0,2,30,78,10],
+    [1,30,286,287,288],
+    [5,61,1,289,115,30],
+    [12,19,90,1,151],
+    [1,0,152,290,30,291],
+    [1,0,292,293,71,30],
+    [1,30,0,153,294],
+    [66,1,30,116,295],
+    [116,296,40,297,154],
+    [34,0,7,117,298],
+    [35,14,15,299,300],
+    [73,66,0,12,36],
+    [25,30,1,155,301],
+    [156,0,302,73,82],
+    [25,4,67,11,28],
+    [20,53,154,3,1],
+    [303,1,0,144,30],
+    [11,1,304,99,116],
+    [66,85,10,3,1],
+    [9,0,30,14,73],
+    [1,16,2,305,157],
+    [26,40,11,46,10],
+    [16,1,0,15,30],
+    [37,1,145,113,11],
+    [1,3,30,306,0],
+    [1,0,73,158,5],
+    [11,307,308,26,309],
+    [310,18,2,3,117],
+    [1,14,55,115,0],
+    [1,30,99,0,157],
+    [55,1,159,71,110],
+    [0,160,311,80,312],
+    [3,55,159,136,1],
+    [11,99,30,55,152],
+    [137,313,1,71,26],
+    [314,113,86,26,114],
+    [25,160,315,2,142],
+    [316,1,30,158,55],
+    [1,148,68,2],
+    [2,5,25,28],
+    [34,2,1,35],
+    [317,1,26,28],
+    [0,2,318,1],
+    [34,13,92,1],
+    [5,61,67,319],
+    [156,0,39,66],
+    [25,4,67,11],
+    [1,39,2,23],
+    [25,13,24,1],
+    [1,0,46,5],
+    [2,1,0,28],
+    [1,5,25,0],
+    [38,1,320,95],
+    [13,2,5,1],
+    [1,5,0,13],
+    [34,2,1,35],
+    [34,2,1,35],
+    [5,61,2,4],
+    [25,5,13,1],
+    [13,24,1,92],
+    [11,39,1,28],
+    [45,36,1,48],
+    [5,88,1,13],
+    [13,1,2,34],
+    [0,77,13,2],
+    [13,2,5,1],
+    [38,2,5,1],
+    [2,4,35,34],
+    [11,39,5,44],
+    [13,1,2,34],
+    [5,61,13,28],
+    [13,1,0,24],
+    [15,59,4,2],
+    [0,75,5,1,69,7],
+    [96,5,321,13,2,1],
+    [13,1,2,98],
+    [0,1,2,13],
+    [0,1,2,13],
+    [15,0,24,60],
+    [5,61,1,10],
+    [5,38,0],
+    [5,41,54],
+    [13,1,10,24],
+    [38,1,0,146],
+    [1,24,27,43],
+    [13,5,61,2,69],
+    [1,0,91,2],
+    [1,26,0],
+    [38,5,2],
+    [5,1,0,13],
+    [1,0,322],
+    [45,36,12,1],
+    [5,2,13],
+    [0,77,2,13],
+    [27,18,0],
+    [27,22,18],
+    [1,0,5],
+    [1,18,5],
+    [1,13,118],
+    [13,161,118],
+    [1,16,118],
+    [1,0,161],
+    [1,13,323],
+    [0,3,1,68],
+    [35,1,26,3],
+    [0,11,9],
+    [66,324,11],
+    [1,0,11],
+    [1,28,42],
+    [11,68,1],
+    [42,39,0],
+    [39,1,11],
+    [26,3,5],
+    [1,39,55],
+    [1,325,0],
+    [1,68,0],
+    [26,28,114],
+    [26,105,55],
+    [39,68,1],
+    [20,28,62],
+    [74,80,0],
+    [2,0,6],
+    [6,3,8],
+    [3,6,1],
+    [3,6,4],
+    [3,6,1],
+    [6,4,8],
+    [6,3,18],
+    [6,8,52],
+    [22,52,0],
+    [26,11,1],
+    [1,95,0],
+    [1,0,39],
+    [2,11,28],
+    [11,1,51],
+    [5,65,11],
+    [21,0,87],
+    [69,0,108],
+    [25,68,94],
+    [1,37,39],
+    [326,1,2],
+    [37,26,105],
+    [37,5,2],
+    [1,0,327],
+    [9,7,6],
+    [3,1,328],
+    [6,8,4],
+    [6,329,48],
+    [53,1,40],
+    [52,22,0],
+    [74,4,50],
+    [1,50,112],
+    [98,20,1],
+    [0,57,3],
+    [0,1,27],
+    [6,4,15],
+    [3,6,1],
+    [3,122,1],
+    [6,52,4],
+    [3,6,4],
+    [50,1,82],
+    [7,4,8],
+    [14,44,1],
+    [43,0,14],
+    [6,8,72],
+    [104,0,82],
+    [12,3,8],
+    [6,8,52],
+    [50,9,3],
+    [18,0,76],
+    [0,57,32],
+    [6,37,40],
+    [0,1,27],
+    [6,9,7],
+    [2,0,6],
+    [1,0,22],
+    [0,4,43],
+    [2,38,6],
+    [6,8,4],
+    [330,50,6],
+    [48,112,331],
+    [21,87,0],
+    [6,8,7],
+    [332,47,3],
+    [1,39,0],
+    [98,12,78],
+    [333,4,334],
+    [38,4,6],
+    [10,0,35,7,25],
+    [22,84,0,1,3],
+    [1,3,0,72],
+    [0,10,9,7],
+    [0,9,32,7],
+    [0,7,3,2],
+    [162,9,14],
+    [10,0,35,7,25],
+    [0,9,10],
+    [22,84,0,1,3],
+    [0,10,72],
+    [10,0,9],
+    [0,9,1],
+    [162,9,14],
+    [35,72],
+    [35,72],
+    [0,10],
+    [0,10],
+    [0,7],
+    [0,9],
+    [15,32,9],
+    [0,9],
+    [106,163],
+    [106,163,26],
+    [0,9,3],
+    [335,143,336,56],
+    [119,120,337,100],
+    [121,101,338,120],
+    [339,340,121,341],
+    [164,342,102,343],
+    [119,165,100,155],
+    [56,102,344,100],
+    [166,345,56,346],
+    [166,347,348,101],
+    [56,100,349,350],
+    [351,1,352,353],
+    [354,0,71,355],
+    [356,103,357,101],
+    [120,358,153,103],
+    [56,359,151,360],
+    [361,0,362,164],
+    [363,56,364,71],
+    [56,0,365,366],
+    [367,56,71,121],
+    [40,368,369,101],
+    [15,133,0,370],
+    [67,4,11,371],
+    [372,111,373,103],
+    [0,4,374,375],
+    [1,0,102,71],
+    [167,376,377,103],
+    [378,379,380,2],
+    [168,381,0,382],
+    [167,119,42,383],
+    [384,93,117,0],
+    [385,56,0,386],
+    [102,82,165,387],
+    [388,389,390,21],
+    [391,135,392,168],
+    [393,394,1,395],
+  ],
+  plantas: [
+    [1048904],
+    [67,32],
+    [144,1073741824],
+    [16394,4096],
+    [584,0,256],
+    [328],
+    [72,0,0,67108864],
+    [5,0,0,134217728],
+    [328],
+    [88],
+    [129,16384,0,256],
+    [4360],
+    [8,524288,0,268435456],
+    [8,32768,0,0,0,512],
+    [84,1048576],
+    [328],
+    [88],
+    [134217731,0,512],
+    [9,33554432,0,0,0,1024],
+    [4456448,0,0,0,0,2048],
+    [192,0,0,0,0,4096],
+    [88],
+    [2,2097408],
+    [1574016],
+    [561160],
+    [8388628],
+    [24,2147483648],
+    [136,256],
+    [32784,1073741824],
+    [2147483656,524288],
+    [2147483716],
+    [16777217,1,8388608],
+    [4194304,1048576,0,0,0,8192],
+    [16,0,66560],
+    [16393],
+    [320,524288],
+    [33,0,2048],
+    [32,67108864,0,0,0,16384],
+    [65,33554432],
+    [16392,65538],
+    [33554464,0,131072],
+    [4194304,16,0,0,0,32768],
+    [262145,0,4096],
+    [192,2],
+    [2147484801],
+    [16,32768,0,536870912],
+    [536870929,134217728],
+    [1048904],
+    [536870928,131072],
+    [536870913,131076],
+    [4,4194304,0,1073741824],
+    [517,512],
+    [2147483657,0,2048],
+    [2147483648,524288,16777216],
+    [2147483648,67633152,1],
+    [528384,0,33554432,2147483648],
+    [528384,0,100663296],
+    [2147483904,0,1024],
+    [216],
+    [262161,0,8192],
+    [1064969,0,2],
+    [1025,8,0,0,1],
+    [2,0,16384,0,0,196608],
+    [4456464],
+    [8388644,0,0,0,1],
+    [524800,2097152],
+    [49153,33554432],
+    [146],
+    [1050112],
+    [1048836],
+    [8388612,32],
+    [2,0,262144,0,0,262144],
+    [6,32],
+    [16387,4096,8388608],
+    [768,0,2],
+    [513,512],
+    [4194432,0,0,0,0,524288],
+    [16422],
+    [1048580,512,131072],
+    [33554565],
+    [8,0,32768,0,0,1048576],
+    [83886080,16],
+    [72,0,134217728],
+    [4,0,268435456,0,2],
+    [4,8192],
+    [1048708],
+    [4608,0,0,0,0,2097152],
+    [1344],
+    [33554444],
+    [8,0,134217732],
+    [528384,0,0,0,0,4194304],
+    [2147488000],
+    [1153],
+    [8195],
+    [1,0,2048,0,0,8388608],
+    [18432,0,8],
+    [84],
+    [1052680],
+    [33554432,0,131072],
+    [33554432,0,16,512],
+    [4608,0,33554432],
+    [512,0,0,0,0,16777216],
+    [67108864,4194304],
+    [0,0,4],
+    [0,32,0,1024],
+    [1,0,0,0,0,33554432],
+    [0,512,524288],
+    [16392],
+    [17,0,0,0,4],
+    [33554436,131072],
+    [4194312,0,0,2048],
+    [2049,16],
+    [1024,0,32,0,0,67108864],
+    [134217730,0,1048576],
+    [8404993,0,536870912],
+    [536870913,4,0,0,0,134217728],
+    [88,65536],
+    [2151678113],
+    [578,262144],
+    [134217732,65536,64],
+    [145,0,4096],
+    [513,512],
+    [1052928,268435456],
+    [4194306,16],
+    [16385,4096,2097152],
+    [2051],
+    [2,1024,0,0,0,268435456],
+    [1,0,32,4096],
+    [517],
+    [8388613],
+    [288,0,0,0,2],
+    [144,131072],
+    [1048720],
+    [3],
+    [161],
+    [144,2],
+    [4194336,4096],
+    [0,1],
+    [1048576,8208],
+    [33,0,32],
+    [33],
+    [33],
+    [8224],
+    [88],
+    [524289],
+    [16512,4096],
+    [0,4194336,0,0,0,536870912],
+    [134217736,0,64],
+    [0,2,0,0,0,3221225472],
+    [33793],
+    [2048,0,32768],
+    [144],
+    [144,131072],
+    [536870945],
+    [2064,536870912],
+    [536872960,4],
+    [32,2],
+    [536870916,2],
+    [641],
+    [34,524288],
+    [160,536870912],
+    [570425360],
+    [0,0,2097152,0,0,0,1],
+    [8320,0,0,0,0,0,2],
+    [33,64],
+    [4194320,4],
+    [4360],
+    [1057],
+    [268435492],
+    [195,262144],
+    [1574528],
+    [1057,0,0,0,0,0,4],
+    [4096,8208,0,0,0,0,8],
+    [2147483648,16384,0,0,0,0,16],
+    [36,64],
+    [3,0,0,0,0,0,32],
+    [5,32768,8192],
+    [192,0,524288,0,0,0,64],
+    [37,64],
+    [8388613,134217728],
+    [5,0,32,4096],
+    [176,131072],
+    [50176,0,2048],
+    [5,65600],
+    [32773,134217728],
+    [2147483648,524288,16777280],
+    [8388608,201326594],
+    [33,0,0,0,8],
+    [0,0,2097152,0,0,0,384],
+    [32,4194306],
+    [0,514,131072],
+    [16778242,0,0,0,16],
+    [32769,512,0,0,32],
+    [262145,67108864,0,0,0,0,512],
+    [32,40960],
+    [4,8192,0,0,0,0,1024],
+    [33,0,0,0,16,0,2048],
+    [1153],
+    [328,0,134217728],
+    [272,4096,0,0,0,0,4096],
+    [0,0,0,0,0,0,24576],
+    [4384,16],
+    [0,16384,0,0,0,0,98304],
+    [33554464,2],
+    [176],
+    [262144,0,0,0,0,0,393216],
+    [48,0,0,0,0,0,524288],
+    [4608,1073741824],
+    [4,2147483904,0,0,0,0,1048576],
+    [268436516],
+    [16,2,4096,0,0,0,2097152],
+    [262147],
+    [513],
+    [1152,0,2048],
+    [25],
+    [1,0,524288],
+    [536870914,8],
+    [1057],
+    [536870945],
+    [1153,8],
+    [11,33554432],
+    [134217731,0,512],
+    [2359809],
+    [2129923],
+    [34305],
+    [657],
+    [67108867],
+    [67109376,4194336],
+    [14,32],
+    [9,0,32768],
+    [69206016,4196352],
+    [528640],
+    [129,0,1073741824],
+    [3,64,2147483648],
+    [32785,268435456],
+    [17,1073741824,0,0,4],
+    [4196355],
+    [1025,1024,2147483648],
+    [136314882,0,1048576],
+    [8650757],
+    [536870929,4],
+    [336,0,0,2048],
+    [161,0,0,256],
+    [67,262144],
+    [265,0,2],
+    [262144,16,1064960],
+    [145,0,4096],
+    [268436516],
+    [558080,2097152],
+    [408],
+    [1573504],
+    [528640,268435456],
+    [8388612,67108864,1],
+    [2,1024,0,0,0,0,4194304],
+    [194,4096],
+    [513,512],
+    [1048580,512],
+    [2147483976],
+    [276824068,0,268435456],
+    [0,8192],
+    [1048737],
+    [536870912,1073807360],
+    [324,0,0,2048],
+    [276824132],
+    [2147483648,67633152,1],
+    [524288,0,67108864,268435456],
+    [2147483904,0,1024],
+    [536872065],
+    [2,160,0,0,0,0,8388608],
+    [523,33554432],
+    [134479875,0,64],
+    [16777218,4196352,0,0,0,0,16777216],
+    [16777222,2176],
+    [134250513,0,0,0,0,0,33554432],
+    [528640,16,67108864],
+    [16827393],
+    [8650757,134217728],
+    [142606340,0,65],
+    [67110912,18432,0,0,0,0,67108864],
+    [17301505,2147485696],
+    [17039393,0,1],
+    [348],
+    [33554473,0,131072],
+    [536870933,0,8],
+    [17072144,268435456],
+    [336,2147483648,65536],
+    [0,67109376,65537,0,0,0,134217728],
+    [262148,262144,5120],
+    [8389121,0,524288,0,0,0,268435456],
+    [16779267,0,0,8192],
+    [134217730,0,536870912,0,192],
+    [10,8388608,0,134217728,256],
+    [29,32768],
+    [14,0,4194304,0,512],
+    [276824077],
+    [148,67108864,64],
+    [10,32768,4194304,16384],
+    [8,0,1073741824,8192,1024,0,536870912],
+    [2056,0,32768,0,6144],
+    [3073,32776],
+    [2050,0,32768,0,8192,0,1073741824],
+    [16390,0,2097152,0,0,0,2147483648],
+    [2048,0,4194304,8192,4096,0,0,1],
+    [16777228,0,0,0,0,0,0,6],
+    [16777216,1050624,0,0,0,0,0,24],
+    [2097153,17408,0,0,0,0,0,32],
+    [134218497,0,0,0,0,0,0,64],
+    [262209,33816576],
+    [142606337,268435456,524288],
+    [2048,0,32768,0,24576,0,0,128],
+    [2056,0,0,16384,0,0,0,768],
+    [16777216,4196352,0,0,32768,0,0,1024],
+    [4353,16384,0,0,0,0,0,2048],
+    [16,1024,2,0,0,0,0,12288],
+    [16393,0,8194],
+    [1153,0,0,0,65536],
+    [1573504],
+    [1048609,0,0,0,0,0,0,16384],
+    [1052672,2097408],
+    [8198,16],
+    [32785,268435456],
+    [528640,268435456],
+    [528640,0,0,0,0,0,0,32768],
+    [528640,0,0,32768],
+    [528384,0,0,98304],
+    [17,134348800],
+    [536870913,131076],
+    [513,0,0,0,0,0,0,65536],
+    [16826369],
+    [20,2],
+    [536870917,134217728],
+    [8208,64,0,536870912],
+    [256,2147483648,0,0,0,0,0,131072],
+    [0,2,0,0,64,0,0,786432],
+    [1045],
+    [4,0,0,1073741824,0,0,0,1048576],
+    [4128,2,0,0,0,0,0,2097152],
+    [8388628,0,0,0,0,0,0,4194304],
+    [16,196608,0,0,0,0,0,8388608],
+    [517,512],
+    [16384,4096],
+    [4456452],
+    [1056,2147483648,0,1],
+    [524289,2098176],
+    [769,16384],
+    [257,0,0,0,0,0,0,16777216],
+    [1048584,2148532224],
+    [1281,0,0,1],
+    [524290,2097152,0,0,0,0,0,33554432],
+    [4096,8208,0,0,0,0,0,67108864],
+    [528384,0,33554432,2147483648],
+    [1,65536,16384,0,0,0,0,134217728],
+    [536870929,131072],
+    [32792,1073741824],
+    [4096,0,0,0,0,0,0,805306368],
+    [4,8192],
+    [0,8192],
+    [2147483650,2097408],
+    [1,16384,0,0,0,0,0,1073741824],
+    [16648,0,0,0,0,0,0,2147483648],
+    [336,0,16777216],
+    [0,2,65,0,0,0,0,0,1],
+    [136314881,2048],
+    [2129920,0,0,2],
+    [6291456,1],
+    [67108864,256,0,0,0,0,0,0,2],
+    [0,1024,0,0,0,0,0,0,12],
+    [32771],
+    [2097152,1,1073741824],
+    [49153],
+    [2,1024,0,0,131072],
+    [2097156,0,2],
+    [2097152,1,8192],
+    [2097154,1],
+    [3,0,0,2],
+    [136314884],
+    [2097152,4097],
+    [0,8,16384,2],
+    [4194306,1],
+    [16385,0,0,1],
+    [513,1],
+    [2097153,1],
+    [3,0,0,2],
+    [2098176,1],
+    [2113538],
+    [3,0,0,0,0,0,0,0,16],
+    [270338],
+    [2,0,0,4,0,0,0,0,32],
+    [2097155],
+    [3,256],
+    [2,1,0,0,262144],
+    [2,3072],
+    [10242],
+    [2099203],
+    [0,0,536870912,0,0,0,0,0,192],
+    [2048,0,0,0,524288,0,0,0,256],
+    [0,0,0,131072,0,0,0,0,1536],
+    [32768,8388608,0,0,0,0,0,0,2048],
+    [2,0,0,262144,0,0,0,0,4096],
+    [1,0,0,0,524288,0,0,0,8192],
+    [0,4,0,0,1049600],
+    [2064,0,8],
+    [0,0,0,0,0,0,0,0,114688],
+    [0,0,0,0,2048,0,0,0,393216],
+    [0,0,4194304,0,0,0,0,0,1572864],
+    [8388610,0,0,0,0,0,0,0,2097152],
+    [268435460,32768],
+    [1,0,0,0,2097152,0,0,0,4194304],
+    [1025,0,0,0,4194304],
+    [4128,0,0,0,0,0,0,0,8388608],
+    [8388628,32768],
+    [328],
+    [32,0,0,0,8,0,0,0,16777216],
+    [268435492],
+    [2051],
+    [2048,0,0,0,0,0,0,0,100663296],
+    [132,0,0,0,0,0,0,0,134217728],
+    [0,0,0,0,6291456,0,0,0,268435456],
+    [196610],
+    [196610],
+    [196610],
+    [196610],
+    [196610],
+    [196610],
+    [196610],
+    [196610],
+    [196610],
+    [196610],
+    [196610],
+    [196610],
+    [196610],
+    [196610],
+    [196610],
+    [196610],
+    [196610],
+    [196610],
+    [196610],
+    [196610],
+    [196610],
+    [196610],
+    [196610],
+    [196610],
+    [196610],
+    [1073741827,0,0,524296,0,0,0,0,536870912],
+    [1073742863],
+    [1073742861,0,16384],
+    [1073741826,0,0,0,0,0,0,0,3221225472,1],
+    [1073741858,536870912,0,524288,0,0,0,0,0,2],
+    [528386,0,67108864,0,8388608],
+    [1073741827,0,0,0,16777216,0,0,0,0,12],
+    [1073741827,0,128,0,0,0,0,0,0,48],
+    [1073741827,0,0,0,33554432,0,0,0,0,64],
+    [1073741826,0,4,1048576,0,0,0,0,0,128],
+    [0,256,0,1048576,67108864,0,0,0,0,768],
+    [129,4,0,2097152,0,0,0,0,0,1024],
+    [49152,8,0,0,0,0,0,0,0,6144],
+    [4097,16,516],
+    [1107296258,0,0,0,134217728,0,0,0,0,8192],
+    [1,0,262656,0,268435456,0,0,0,0,16384],
+    [301991952,0,8],
+    [1048586,2097152,0,0,67108864],
+    [1073741827,0,0,0,65536,0,0,0,0,32768],
+    [2050,0,0,1048584,0,0,0,0,0,65536],
+    [1034,0,2097156],
+    [1073758721,0,512],
+    [65542,0,0,0,536870912,0,0,0,0,131072],
+    [67111936,16640],
+    [1073840131],
+    [2050,32,0,131072,131072],
+    [1073741835,0,0,0,0,0,0,0,0,262144],
+    [35,0,512,0,1073741824],
+    [67110912,0,0,0,0,0,0,0,0,3670016],
+    [262156,0,0,2097152,0,0,0,0,0,4194304],
+    [16387,8388608,0,524288],
+    [1073741827,0,0,8,536870912],
+    [2,8388608,128,16384,2147483648],
+    [1,0,65536,0,0,1,0,0,0,25165824],
+    [10,8388608,0,0,2147483904],
+    [1073743872,8388608,0,8,16777216],
+    [67108866,0,128,0,512,0,0,0,0,33554432],
+    [67108864,0,4194304,393216,0,0,0,0,0,67108864],
+    [33554436,0,0,0,16384,1,0,0,0,134217728],
+    [1073741826,8388608,0,0,1073741824,0,0,0,0,268435456],
+    [6,0,16,0,1048576],
+    [301989924],
+    [6,12],
+    [335544322,0,0,0,0,0,0,0,0,536870912],
+    [7,0,0,0,0,0,0,0,0,1073741824],
+    [8194,4,268435456],
+    [32,536870912,8,0,0,0,0,0,0,2147483648],
+    [1,128,4,0,268435456],
+    [33556496,0,8],
+    [8388614,128],
+    [50339842],
+    [35,16384],
+    [268435463],
+    [33554467],
+    [2,64,2147483648,0,0,0,0,0,0,0,1],
+    [8230],
+    [8227],
+    [6,12],
+    [6,12],
+    [52,536870912],
+    [33562658],
+    [16785410,0,268435456],
+    [268437506,128],
+    [2,73744],
+    [8226,0,16777216],
+    [8198,4],
+    [8197,0,8192],
+    [8230],
+    [38,64],
+    [20,12],
+    [2080,4224],
+    [8198,4],
+    [268443680,536870912],
+    [16785411],
+    [32788,134217728],
+    [163,0,2080],
+    [8230,0,0,1,0,0,0,0,0,0,2],
+    [8198,0,0,4],
+    [8199],
+    [8199],
+    [16809985,268435456],
+    [1058,536870912],
+    [33,64],
+    [32,4194816],
+    [16786434],
+    [3,64,0,0,262144],
+    [150994946,2048],
+    [8228,536870912,32],
+    [7,0,134217728],
+    [67108867],
+    [36,64],
+    [8227],
+    [3,0,0,0,0,0,0,0,0,0,4],
+    [4098,8208],
+    [8228],
+    [8197,0,8192],
+    [134479873],
+    [138674176],
+    [35],
+    [262178],
+    [8194,0,0,4194304],
+    [8192,0,0,4194304,0,2],
+    [65538,0,0,4194304],
+    [3,0,0,0,0,2],
+    [8194,0,0,0,0,0,0,0,0,0,8],
+    [11,0,16],
+    [67108874,8],
+    [2561],
+    [2048,0,4,0,0,0,0,0,0,0,16],
+    [2051],
+    [268435458,1024],
+    [2050,0,16],
+    [1,1152],
+    [2050,128],
+    [67108904],
+    [2,8388736],
+    [3,0,0,0,0,0,0,0,0,0,32],
+    [3,0,16],
+    [335544320,0,0,262144],
+    [67108864,8388608,0,512],
+    [2,128,16],
+    [269484032,1073741824],
+    [1,0,66560],
+    [69],
+    [328],
+    [74],
+    [88],
+    [74],
+    [336],
+    [262216],
+    [320,1048576],
+    [4194305,1048576],
+    [67110914],
+    [3,0,2147483648],
+    [3,128],
+    [268437508],
+    [2050,524288],
+    [2080,0,2],
+    [2097153,0,8388608],
+    [1,0,32,4096],
+    [33554432,0,1073741840],
+    [2,160],
+    [6,0,0,0,0,0,0,0,0,0,64],
+    [67108864,32,0,512],
+    [36,32],
+    [3,0,0,0,0,0,0,0,0,0,128],
+    [704],
+    [10,0,0,0,0,0,0,0,0,0,256],
+    [336],
+    [64,65536,0,0,0,0,0,0,0,0,512],
+    [2,2097408],
+    [4194305,1048576],
+    [16,262144,1024],
+    [2,262144,0,65536],
+    [1048578,0,0,4],
+    [9,33554432],
+    [134217731],
+    [32848],
+    [74],
+    [10,0,0,67108864],
+    [80,1048576],
+    [88],
+    [2,262144,262144],
+    [400],
+    [16386,4096],
+    [16385,2048],
+    [320,0,256],
+    [1,0,262144,256],
+    [4360],
+    [320,1048576],
+    [520,262144],
+    [262145,0,4096],
+    [1,33554433],
+    [64,288],
+    [134217731],
+    [704],
+    [69],
+    [4194307],
+    [17,2048],
+    [68,64],
+    [336],
+    [64,262144,0,0,0,0,0,0,0,0,1024],
+    [0,65536,0,65536,0,0,0,0,0,0,2048],
+    [2097153,0,8388608],
+    [448],
+    [8,32768,0,0,0,0,0,0,0,0,4096],
+    [3,128],
+    [4096,0,16384,4],
+    [16,0,0,0,0,0,0,0,0,0,24576],
+    [80,64],
+    [33555585,8],
+    [4194315,0,1048576],
+    [11,0,256],
+    [1665],
+    [641,1],
+    [141],
+    [16896,0,0,0,0,4],
+    [33555585,8],
+    [1537],
+    [4194315,0,1048576],
+    [1025,0,256],
+    [1537],
+    [515],
+    [16896,0,0,0,0,4],
+    [0,8,256],
+    [0,8,256],
+    [1025],
+    [1025],
+    [129],
+    [513],
+    [33280,1],
+    [513],
+    [0,0,0,1024,0,8],
+    [67108864,0,0,1024,0,8],
+    [521],
+    [0,16777216,0,0,32768,0,0,0,0,0,98304],
+    [0,0,0,25165840,0,0,0,0,0,0,131072],
+    [0,0,0,50331680,0,0,0,0,0,0,262144],
+    [0,0,0,33554432,0,0,0,0,0,0,3670016],
+    [0,0,0,64,0,16,0,0,0,0,12582912],
+    [0,0,0,8388624,134217728,32],
+    [0,16777216,0,80,0,0,0,0,0,0,16777216],
+    [0,16777216,0,0,0,64,0,0,0,0,100663296],
+    [0,0,0,32,0,64,0,0,0,0,402653184],
+    [0,16777216,0,16,0,0,0,0,0,0,1610612736],
+    [2,0,0,0,0,0,0,0,0,0,2147483648,3],
+    [1,0,128,0,0,0,0,0,0,0,0,12],
+    [0,0,0,160,0,0,0,0,0,0,0,48],
+    [0,0,0,16777344,33554432,0,0,0,0,0,0,64],
+    [0,16777216,0,0,8388608,0,0,0,0,0,0,384],
+    [1,0,0,0,0,16,0,0,0,0,0,1536],
+    [0,16777216,128,0,0,0,0,0,0,0,0,6144],
+    [1,16777216,0,0,0,0,0,0,0,0,0,24576],
+    [0,16777216,128,33554432,0,0,0,0,0,0,0,32768],
+    [0,256,0,32,0,0,0,0,0,0,0,196608],
+    [32769,0,0,0,32,0,0,0,0,0,0,262144],
+    [2064,0,8,0,0,0,0,0,0,0,0,524288],
+    [0,0,0,32896,0,0,0,0,0,0,0,3145728],
+    [17,0,0,0,0,0,0,0,0,0,0,12582912],
+    [3,0,128,64],
+    [0,0,0,128,0,128,0,0,0,0,0,50331648],
+    [4,0,0,0,0,0,0,0,0,0,0,469762048],
+    [1,0,0,0,0,256,0,0,0,0,0,1610612736],
+    [0,1024,0,8388608,0,128,0,0,0,0,0,2147483648],
+    [1,0,536870912,2097152,0,0,0,0,0,0,0,0,1],
+    [1,16777216,0,0,0,0,0,0,0,0,0,0,6],
+    [0,0,262144,64,0,32,0,0,0,0,0,0,8],
+    [2097152,0,0,0,0,0,0,0,0,0,0,0,112],
+    [0,0,0,0,128,256,0,0,0,0,0,0,384],
+    [2,0,0,0,0,0,0,0,0,0,0,0,3584],
+  ],
+  requisitos: {
+    "asma": [17,0,0,1073741840,4,16384,0,4194304,0,2147483648,2147483648],
+    "bronquitis": [16400,1073741824],
+    "neumonia": [16793616],
+    "tos": [536870928,1073872896],
+    "gripe": [16809984,268435968,0,0,0,0,0,0,0,0,0,16384],
+    "resfriado": [16809984,0,4096,0,0,0,0,0,0,0,0,16384],
+    "sinusitis": [129,64,4096,1073741840,0,16896,2101248,4194304,0,2147483648,2147483648],
+    "rinitis": [1,0,8392704,1073741840,0,16384,0,4194304,0,2147483648,2147483648],
+    "faringitis": [536871041,64,0,1073741840,0,16896,2101248,4194304,0,2147483648,2147483648],
+    "laringitis": [536871041,64,0,1073741840,0,16896,2101248,4194304,0,2147483648,2147483648],
+    "gastritis": [1,0,8,1073741840,0,16384,0,4194304,0,2147483648,2147483648],
+    "ulcera": [1025,0,0,1073741840,0,16384,0,4194304,0,2147483648,2147483648],
+    "reflujo": [72,0,16842752,8,0,0,0,0,0,0,0,268959744,64],
+    "colitis": [289,0,0,1073741840,0,16384,0,5242880,0,2147483648,2147483648],
+    "diarrea": [262176,536870912,0,0,0,0,0,1048576],
+    "estreñimiento": [33554432,36,4194304,4194304,0,524288,1073741952,0,0,537395200],
+    "flatulencia": [328,0,16842752,8,0,0,0,0,0,0,0,268959744,64],
+    "nausea": [72,33554432,16842752,8,0,0,0,0,0,0,0,268959744,64],
+    "hepatitis": [134217730,0,64,0,268435456,0,0,0,0,0,8388608,2560,2],
+    "cirrosis": [134217730,0,0,0,268435457,0,0,0,0,0,8388608,2560,2],
+    "hipertension": [1048580,16,67108864,0,0,268697600,4196424,0,0,0,0,65536],
+    "arritmia": [4096,73728,0,0,0,0,0,131072,0,0,0,1048576],
+    "varices": [1,262144,32,1073741840,0,17408,0,4194304,0,2147483648,2147483648],
+    "anemia": [2048,0,0,0,0,0,0,1073741824,2101248,0,8],
+    "colesterol": [2,0,5242880,4194304,268435456,0,0,0,0,524288,8388608,2560,2],
+    "aterosclerosis": [3,0,1048576,1073741840,268435456,16384,0,4194304,0,2147483648,2155872256,2560,2],
+    "insomnio": [1576960,65536,100663296,0,0,0,0,32768,0,0,0,1114112],
+    "ansiedad": [1576960,65536,67108866,0,0,0,0,0,0,0,0,1114112],
+    "estres": [1572864,2151680000,83886081,0,0,256,131072,136335418,0,0,0,1245184,16],
+    "depresion": [0,2153777152,0,0,0,0,1048576,0,0,256],
+    "migrana": [513,0,0,1073807376,0,268718080,4194312,272629760,0,2147483648,2147484672],
+    "dolor de cabeza": [1049089,0,67108864,1073807376,0,20480,0,272629760,0,2147483648,2147484672,65536],
+    "neuralgia": [513,0,0,1073807376,0,20480,0,272629760,0,2147483648,2147484672],
+    "vertigo": [0,2151677952,16777217,0,0,268698880,4325384,136335418,0,0,0,131072,16],
+    "alergia": [2097153,0,8388608,1073741840,0,16384,0,4194304,0,2147483648,2147483648,0,1],
+    "infeccion": [16826368,0,0,0,0,0,0,0,0,0,0,16384],
+    "inflamacion": [515,0,0,1073807376,268435456,20480,0,272629760,0,2147483648,2155873280,2560,2],
+    "diabetes": [4194306,0,0,0,268435456,0,0,0,0,0,8388608,2560,2],
+    "hipotiroidismo": [0,2151677984,16777217,0,0,256,131072,136335418,256,0,32,131072,16],
+    "hipertiroidismo": [4096,65536,0,0,0,0,0,0,0,0,32,1048576],
+    "obesidad": [4,0,0,512,0,2048,2112],
+    "artritis": [513,0,524288,1073807376,0,20480,0,272629760,0,2147483648,2147484672],
+    "artrosis": [513,0,0,1073807376,1,20480,0,272629760,0,2147483648,2147484672],
+    "dolor muscular": [1049089,0,67108864,1073807376,0,20480,0,272629760,0,2147483648,2147484672],
+    "lumbalgia": [1049089,0,67108864,1073807376,0,20480,0,272629760,0,2147483648,2147484672],
+    "osteoporosis": [0,4194304,0,0,2048,0,0,0,32],
+    "fibromialgia": [1049089,0,67108864,1073807376,0,20480,0,272629760,0,2147483648,2147484672,65536],
+    "cistitis": [133,64,0,1073741840,0,16384,2112,4194304,0,2147483648,2147483648],
+    "calculos renales": [132,64,0,0,0,512,2103360],
+    "incontinencia": [288,2151677952,16777217,0,0,256,131072,137383994,0,0,0,131072,16],
+    "prostatitis": [133,64,0,1073741840,0,16896,2103360,4194304,0,2147483648,2147483648],
+    "dismenorrea": [2147484416,0,0,65536,0,4096,0,268435456,0,0,1024],
+    "menopausia": [4096,81920,0,0,0,0,0,0,0,0,0,1048576],
+    "sindrome premenstrual": [4352,81920,0,0,0,0,0,0,0,0,0,1048576],
+    "acne": [8405025,0,0,1073741840,0,16384,0,5242880,4194304,2147483648,2147483648],
+    "eczema": [536870913,0,0,1073741840,0,33570816,0,4194304,0,2147483648,2147483648],
+    "psoriasis": [538968065,0,0,1073741840,0,16384,0,4194304,0,2147483648,2147483648,0,1],
+    "herida": [1152,64,0,0,65537,16777728,2101248,0,8],
+    "quemadura": [536871936,0,256],
+    "hongos": [262272,4160,0,0,0,512,2101248],
+    "nerviosismo": [1576960,65536,67108864,0,0,0,0,0,0,0,0,1114112],
+    "irritabilidad": [4096,67584,2,0,0,0,0,0,0,0,0,1048576],
+    "fatiga": [67108864,2151942176,16842753,0,0,524544,17170432,136335418,8193,0,33344,131072,16],
+  },
+};
@@ -0,0 +1,8570 @@
+// Pócima Salvage - Índice de recuperación de fichas del catálogo para MolDoctor
+// Generado automáticamente por scripts/build-retrieval-index.py - no editar a mano
+
+export interface IndiceRecuperacion {
+  parametros: {
+    presupuesto: number;
+    maxPlantas: number;
+    maxEnfermedades: number;
+    umbralRelativo: number;
+    pesoRanking: number;
+    caracteresPorToken: number;
+    tokensCabeceras: number;
+  };
+  // cabecera de cada sección del contexto, por tipo
+  cabeceras: Record<'p' | 'e', string>;
+  // palabras vacías y de conversación que no cuentan en una consulta
+  vacias: string[];
+  // posición -> [tipo ('p' planta, 'e' enfermedad), id, categoría o sistema, ficha, tokens de la ficha]
+  documentos: ['p' | 'e', string, string, string, number][];
+  // término -> [posición, peso BM25 en centésimas, posición, peso, ...]
+  terminos: Record<string, number[]>;
+  // posición de enfermedad -> posiciones de sus plantas recomendadas por el ranking
+  recomendadas: Record<number, number[]>;
+}
+
+export const indiceRecuperacion: IndiceRecuperacion = {
+  parametros: {"presupuesto":700,"maxPlantas":8,"maxEnfermedades":4,"umbralRelativo":0.3,"pesoRanking":0.5,"caracteresPorToken":4,"tokensCabeceras":34},
+  cabeceras: {"e":"ENFERMEDADES DEL CATÁLOGO RELACIONADAS CON LA CONSULTA:","p":"PLANTAS DEL CATÁLOGO RELACIONADAS CON LA CONSULTA (usa estas como referencia):"},
+  vacias: ["a","al","algo","ante","ayer","ayuda","ayudame","ayudar","bien","buena","buenas","bueno","buenos","como","con","contra","cual","cuales","cuando","de","del","desde","dias","doctor","doctora","donde","durante","e","el","en","entre","esta","estas","estoy","favor","gracias","hace","hacia","hasta","hola","hoy","la","las","le","les","lo","los","mal","mas","mes","meses","misma","mismo","mucha","mucho","muchos","muy","noches","noto","o","otra","otras","otro","otros","para","pero","poco","podria","por","propiedades","puede","pueden","puedes","puedo","que","quiero","recomienda","recomiendas","se","semana","semanas","siente","sientes","siento","sin","sirve","sirven","sobre","su","sus","tambien","tardes","tengo","tenido","tiene","tienes","tomar","tras","u","un","una","unas","uno","unos","veces","vez","y","ya"],
+  documentos: [
+    ["p","albahaca","hierbas-aromaticas-culinarias","- Albahaca (Ocimum basilicum); antiespasmódica, digestiva, carminativa, relajante; parte: Hojas; dosis: Infusión de 5-10 gramos por litro de agua.",37],
+    ["p","romero","hierbas-aromaticas-culinarias","- Romero (Rosmarinus officinalis); estimulante, antioxidante, antiinflamatoria, carminativa; parte: Hojas y flores; dosis: Infusión de 2-4 gramos por taza, 2-3 veces al día.; precaución: Puede ser abortivo en dosis altas., Puede elevar la presión arterial.",64],
+    ["p","tomillo","hierbas-aromaticas-culinarias","- Tomillo (Thymus vulgaris); antiséptica, expectorante, antitusiva; parte: Hojas y flores; dosis: Infusión de 1-2 gramos por taza, hasta 3 veces al día.",38],
+    ["p","oregano","hierbas-aromaticas-culinarias","- Orégano (Origanum vulgare); antibacteriano, antifúngico, antioxidante, digestivo; parte: Hojas; dosis: Infusión de 1 cucharadita por taza, 2-3 veces al día.",40],
+    ["p","menta","hierbas-aromaticas-culinarias","- Menta (Mentha piperita); digestiva, carminativa, analgésica, refrescante; parte: Hojas; dosis: Infusión de 1 cucharada por taza, después de las comidas.; precaución: El aceite esencial no debe usarse en niños pequeños.",55],
+    ["p","hierbabuena","hierbas-aromaticas-culinarias","- Hierbabuena (Mentha spicata); digestiva, carminativa, antiespasmódica; parte: Hojas; dosis: Infusión de 1-2 cucharaditas por taza.",33],
+    ["p","cilantro","hierbas-aromaticas-culinarias","- Cilantro (Coriandrum sativum); digestivo, carminativo, quelante de metales pesados; parte: Hojas y semillas; dosis: Consumo directo en comidas o infusión de semillas.",42],
+    ["p","perejil","hierbas-aromaticas-culinarias","- Perejil (Petroselinum crispum); diurético, rico en vitaminas, antiinflamatorio; parte: Hojas y raíz; dosis: Consumo fresco en ensaladas o jugos. Infusión de 2g por taza.; precaución: En grandes cantidades puede ser uterotónico.",58],
+    ["p","eneldo","hierbas-aromaticas-culinarias","- Eneldo (Anethum graveolens); carminativo, digestivo, antiespasmódico; parte: Hojas y semillas; dosis: Infusión de 1 cucharadita de semillas por taza.",38],
+    ["p","laurel","hierbas-aromaticas-culinarias","- Laurel (Laurus nobilis); digestivo, carminativo, expectorante; parte: Hojas; dosis: Infusión de 1-2 hojas por taza. No exceder.; precaución: En dosis altas puede ser tóxico.",44],
+    ["p","salvia","hierbas-aromaticas-culinarias","- Salvia (Salvia officinalis); antiinflamatoria, antiséptica, regulador hormonal, antisudoral; parte: Hojas; dosis: Infusión de 1-2 gramos por taza. Gargarismos para la garganta.; precaución: No recomendada por su efecto hormonal., Puede reducir la producción de leche.",68],
+    ["p","mejorana","hierbas-aromaticas-culinarias","- Mejorana (Origanum majorana); sedante, digestiva, antiespasmódica; parte: Hojas y flores; dosis: Infusión de una cucharadita por taza, antes de dormir.",39],
+    ["p","estragon","hierbas-aromaticas-culinarias","- Estragón (Artemisia dracunculus); digestivo, vermífugo, anestésico local; parte: Hojas; dosis: Infusión de 5g de hojas por litro de agua.; precaución: Debe evitarse su uso continuado.",47],
+    ["p","cebollino","hierbas-aromaticas-culinarias","- Cebollino (Allium schoenoprasum); rico en vitamina c, digestivo, antiséptico suave; parte: Hojas; dosis: Consumo directo en comidas.",34],
+    ["p","hinojo","hierbas-aromaticas-culinarias","- Hinojo (Foeniculum vulgare); carminativo, expectorante, diurético, galactagogo; parte: Semillas (frutos) y bulbo; dosis: Infusión de 1 cucharadita de semillas por taza.",43],
+    ["p","comino","hierbas-aromaticas-culinarias","- Comino (Cuminum cyminum); carminativo, digestivo, antiespasmódico; parte: Semillas; dosis: Infusión de media cucharadita por taza.",33],
+    ["p","anis","hierbas-aromaticas-culinarias","- Anís (Pimpinella anisum); carminativo, digestivo, expectorante; parte: Semillas (frutos); dosis: Infusión de 1 cucharadita por taza.",34],
+    ["p","curcuma","hierbas-aromaticas-culinarias","- Cúrcuma (Curcuma longa); antiinflamatoria, antioxidante, hepatoprotectora, anticancerígena; parte: Rizoma; dosis: 1-3 gramos de polvo al día, con pimienta negra para mejorar absorción.; precaución: Puede interactuar con anticoagulantes.",60],
+    ["p","jengibre","hierbas-aromaticas-culinarias","- Jengibre (Zingiber officinale); antiemético, antiinflamatorio, digestivo, circulatorio; parte: Rizoma; dosis: Infusión de 1-2 rodajas finas por taza. Hasta 4g de polvo al día.; precaución: Usar con precaución si se toman medicamentos para la presión.",63],
+    ["p","canela","hierbas-aromaticas-culinarias","- Canela (Cinnamomum verum); hipoglucemiante, antimicrobiana, termogénica; parte: Corteza; dosis: 1-4 gramos de polvo al día.; precaución: Vigilar niveles de glucosa si se combina con medicación.",49],
+    ["p","clavo-de-olor","hierbas-aromaticas-culinarias","- Clavo de olor (Syzygium aromaticum); analgésico dental, antiséptico, carminativo; parte: Botones florales secos; dosis: Aplicación tópica de aceite para dolor dental. Infusión de 1-2 clavos.",48],
+    ["p","cardamomo","hierbas-aromaticas-culinarias","- Cardamomo (Elettaria cardamomum); digestivo, carminativo, expectorante; parte: Semillas; dosis: Masticar 1-2 semillas o infusión de media cucharadita.",38],
+    ["p","azafran","hierbas-aromaticas-culinarias","- Azafrán (Crocus sativus); antidepresivo, antioxidante, afrodisíaco; parte: Estigmas de la flor; dosis: 30 mg al día para efecto antidepresivo. Pequeñas hebras en comidas.; precaución: En dosis altas puede ser abortivo.",55],
+    ["p","lavanda","hierbas-aromaticas-culinarias","- Lavanda (Lavandula angustifolia); relajante, ansiolítica, antiséptica, cicatrizante; parte: Flores; dosis: Infusión de 1 cucharadita por taza. Aceite esencial en difusor o tópico.",46],
+    ["p","melisa","hierbas-aromaticas-culinarias","- Melisa (Melissa officinalis); sedante, antiviral, digestiva, ansiolítica; parte: Hojas; dosis: Infusión de 1-2 cucharaditas por taza.",34],
+    ["p","perifollo","hierbas-aromaticas-culinarias","- Perifollo (Anthriscus cerefolium); depurativo, diurético, expectorante; parte: Hojas; dosis: Consumo fresco en ensaladas o infusión.",34],
+    ["p","angelica","hierbas-aromaticas-culinarias","- Angélica (Angelica archangelica); digestiva, expectorante, tónico nervioso; parte: Raíz y semillas; dosis: Decocción de la raíz (10g por litro) o infusión de semillas.; precaución: Evitar durante el embarazo., Puede alterar los niveles de azúcar.",62],
+    ["p","ajedrea","hierbas-aromaticas-culinarias","- Ajedrea (Satureja montana); digestiva, antiséptica, afrodisíaca; parte: Hojas y sumidades floridas; dosis: Infusión de una cucharadita por taza.",37],
+    ["p","hisopo","hierbas-aromaticas-culinarias","- Hisopo (Hyssopus officinalis); expectorante, antitusivo, antiviral; parte: Sumidades floridas; dosis: Infusión de 1-2 cucharaditas por taza.; precaución: No usar durante el embarazo.",46],
+    ["p","tanaceto","hierbas-aromaticas-culinarias","- Tanaceto (Tanacetum vulgare); vermífugo, emenagogo, digestivo; parte: Hojas y flores; dosis: Usar con extrema precaución y en dosis muy bajas. Infusión de 0.5g.; precaución: Es abortivo y tóxico. Totalmente contraindicado., Tóxico para niños.",61],
+    ["p","levistico","hierbas-aromaticas-culinarias","- Levístico (Levisticum officinale); diurético, carminativo, emenagogo; parte: Raíz y hojas; dosis: Decocción de la raíz o infusión de las hojas.; precaución: Evitar durante el embarazo.",47],
+    ["p","comino-negro","hierbas-aromaticas-culinarias","- Comino Negro (Nigella sativa); inmunoestimulante, antihistamínico, antiinflamatorio, antitumoral; parte: Semillas; dosis: 1-2 cucharaditas de aceite al día o 1 cucharadita de semillas.",47],
+    ["p","fenogreco","hierbas-aromaticas-culinarias","- Fenogreco (Trigonella foenum-graecum); galactagogo, hipoglucemiante, anabolizante natural; parte: Semillas; dosis: 1-2 cucharaditas de semillas remojadas o en polvo.; precaución: Puede inducir contracciones.",53],
+    ["p","mostaza-negra","hierbas-aromaticas-culinarias","- Mostaza Negra (Brassica nigra); rubefaciente, estimulante digestivo, expectorante; parte: Semillas; dosis: Uso externo en cataplasmas. Internamente con mucha moderación.; precaución: Irritante para la piel y mucosas si se usa en exceso.",60],
+    ["p","cilantro-vietnamita","hierbas-aromaticas-culinarias","- Cilantro Vietnamita (Persicaria odorata); digestivo, antiinflamatorio, antibacteriano; parte: Hojas; dosis: Consumo directo en comidas.",35],
+    ["p","epazote","hierbas-aromaticas-culinarias","- Epazote (Dysphania ambrosioides); vermífugo, antiespasmódico, carminativo; parte: Hojas y flores; dosis: Usado tradicionalmente en la cocción de frijoles. Infusión con precaución.; precaución: Tóxico y abortivo en dosis altas., Tóxico en dosis altas.",63],
+    ["p","pimpinela-mayor","hierbas-aromaticas-culinarias","- Pimpinela Mayor (Sanguisorba officinalis); astringente, antihemorrágica, antiinflamatoria; parte: Raíz y hojas; dosis: Decocción de la raíz o infusión de las hojas.",42],
+    ["p","agrimonia","hierbas-aromaticas-culinarias","- Agrimonia (Agrimonia eupatoria); astringente, colagoga, antiinflamatoria para la garganta; parte: Sumidades floridas; dosis: Infusión de 1-2 cucharaditas por taza. Gargarismos.",45],
+    ["p","galanga","hierbas-aromaticas-culinarias","- Galanga (Alpinia galanga); carminativa, antiemética, antiinflamatoria; parte: Rizoma; dosis: Similar al jengibre, en infusiones o en polvo.",36],
+    ["p","lemongrass","hierbas-aromaticas-culinarias","- Lemongrass (Cymbopogon citratus); digestivo, febrífugo, sedante suave, antibacteriano; parte: Tallos y hojas; dosis: Infusión de 1 tallo por taza.",37],
+    ["p","ruibarbo","hierbas-aromaticas-culinarias","- Ruibarbo (Rheum rhabarbarum); laxante, purgante, astringente (en dosis bajas); parte: Rizoma (medicinal), pecíolos (comestible); dosis: Decocción del rizoma. Dosis bajas son astringentes, altas son laxantes.; precaución: Las hojas son tóxicas por su alto contenido en oxalatos.",70],
+    ["p","stevia","hierbas-aromaticas-culinarias","- Stevia (Stevia rebaudiana); edulcorante natural, hipoglucemiante, hipotensora; parte: Hojas; dosis: Hojas frescas o secas para endulzar infusiones y comidas.",40],
+    ["p","wasabi","hierbas-aromaticas-culinarias","- Wasabi (Eutrema japonicum); antimicrobiano, descongestionante, antiinflamatorio; parte: Rizoma; dosis: Pequeñas cantidades como condimento.",36],
+    ["p","bergamota","hierbas-aromaticas-culinarias","- Bergamota (Monarda didyma); carminativa, antiséptica, febrífuga; parte: Hojas y flores; dosis: Infusión de las hojas y flores.",32],
+    ["p","calendula","hierbas-aromaticas-culinarias","- Caléndula (Calendula officinalis); cicatrizante, antiinflamatoria, antiséptica, emenagoga; parte: Flores; dosis: Uso tópico en cremas o aceites. Infusión para uso interno.; precaución: Puede causar alergia a personas sensibles a las compuestas.",62],
+    ["p","capuchina","hierbas-aromaticas-culinarias","- Capuchina (Tropaeolum majus); antibiótica natural, expectorante, rica en vitamina c; parte: Flores y hojas; dosis: Consumo directo en ensaladas.",37],
+    ["p","borraja","hierbas-aromaticas-culinarias","- Borraja (Borago officinalis); sudorífica, expectorante, antiinflamatoria, emoliente; parte: Flores y aceite de semillas; dosis: Infusión de flores. El aceite de semillas se toma en perlas.",48],
+    ["p","verbena-olorosa","hierbas-aromaticas-culinarias","- Hierbaluisa (Aloysia citrodora); digestiva, carminativa, relajante, antiespasmódica; parte: Hojas; dosis: Infusión de una cucharadita por taza.",37],
+    ["p","gordolobo","hierbas-aromaticas-culinarias","- Gordolobo (Verbascum thapsus); expectorante, emoliente, balsámica; parte: Flores; dosis: Infusión de las flores, bien colada para retirar los pelillos.",39],
+    ["p","malva","hierbas-aromaticas-culinarias","- Malva (Malva sylvestris); emoliente, antiinflamatoria, laxante suave, balsámica; parte: Flores y hojas; dosis: Infusión de flores y hojas.",35],
+    ["p","aciano","hierbas-aromaticas-culinarias","- Aciano (Centaurea cyanus); antiinflamatorio ocular, diurético, tónico; parte: Flores; dosis: Baños oculares con la infusión fría.",33],
+    ["p","ulmaria","hierbas-aromaticas-culinarias","- Ulmaria (Filipendula ulmaria); antiinflamatoria, analgésica, antipirética, diurética; parte: Sumidades floridas; dosis: Infusión de una cucharadita por taza.; precaución: No usar si hay alergia a la aspirina (contiene salicilatos).",59],
+    ["p","milenrama","hierbas-aromaticas-culinarias","- Milenrama (Achillea millefolium); antihemorrágica, emenagoga, antiinflamatoria, digestiva; parte: Sumidades floridas; dosis: Infusión de una cucharadita por taza.; precaución: No usar durante el embarazo.",52],
+    ["p","artemisa","hierbas-aromaticas-culinarias","- Artemisa (Artemisia vulgaris); emenagoga, tónico digestivo, vermífuga; parte: Hojas y sumidades floridas; dosis: Infusión de una cucharadita por taza. No usar de forma prolongada.; precaución: Abortiva. Totalmente contraindicada.",58],
+    ["p","ajenjo","hierbas-aromaticas-culinarias","- Ajenjo (Artemisia absinthium); tónico amargo, vermífugo, colagogo, emenagogo; parte: Hojas y sumidades floridas; dosis: Infusión de 0.5-1g por taza, antes de las comidas. Usar en periodos cortos.; precaución: Abortivo y neurotóxico. Totalmente contraindicado., Totalmente contraindicado.",73],
+    ["p","lupulo","hierbas-aromaticas-culinarias","- Lúpulo (Humulus lupulus); sedante, hipnótico, ansiolítico, fitoestrogénico; parte: Conos (flores femeninas); dosis: Infusión de 1-2 conos por taza antes de acostarse.; precaución: Puede agravar la depresión.",53],
+    ["p","valeriana","hierbas-aromaticas-culinarias","- Valeriana (Valeriana officinalis); sedante, hipnótica, relajante muscular, ansiolítica; parte: Raíz y rizoma; dosis: Decocción de la raíz (2-3g por taza) o extracto estandarizado.; precaución: Potencia el efecto de otros sedantes.",58],
+    ["p","ruda","hierbas-aromaticas-culinarias","- Ruda (Ruta graveolens); emenagoga, antiespasmódica, rubefaciente; parte: Hojas y sumidades floridas; dosis: Infusión de 0.5g por taza. Usar con extrema precaución.; precaución: Es un potente abortivo. Totalmente contraindicada., Fototóxica. No exponer la piel al sol tras su uso tópico.",72],
+    ["p","ajedrea-de-jardin","hierbas-aromaticas-culinarias","- Ajedrea de jardín (Satureja hortensis); digestiva, carminativa, antiséptica, expectorante; parte: Hojas y sumidades floridas; dosis: Infusión de 1-2 cucharaditas por taza.",44],
+    ["p","perilla","hierbas-aromaticas-culinarias","- Perilla (Perilla frutescens); antialérgica, antiinflamatoria, expectorante, antimicrobiana; parte: Hojas y semillas; dosis: Infusión de las hojas. El aceite de las semillas se usa para las alergias.",50],
+    ["p","manzanilla","hierbas-silvestres-medicinales","- Manzanilla (Matricaria chamomilla); digestiva, antiinflamatoria, calmante, antibacteriana, relajante; parte: Flores; dosis: 1-2 tazas de infusión al día",39],
+    ["p","aloe-vera","hierbas-silvestres-medicinales","- Aloe Vera (Aloe barbadensis miller); antiinflamatoria, cicatrizante, regeneradora, hidratante; parte: Gel de las hojas; dosis: Aplicación tópica según necesidad",41],
+    ["p","ajo","hierbas-silvestres-medicinales","- Ajo (Allium sativum); antibiótico, anticoagulante, antioxidante, fortalecedor del sistema inmune; parte: Bulbo; dosis: 1-2 dientes de ajo al día",37],
+    ["p","eucalipto","hierbas-silvestres-medicinales","- Eucalipto (Eucalyptus globulus); expectorante, antimicrobiano, hipoglucemiante; parte: Hojas; dosis: Inhalación de vapor o infusión",34],
+    ["p","cola-de-caballo","hierbas-silvestres-medicinales","- Cola de caballo (Equisetum arvense); diurética, depurativa, regeneradora, astringente; parte: Tallo; dosis: 1-2 tazas de infusión al día",35],
+    ["p","hiperico","hierbas-silvestres-medicinales","- Hipérico (Hypericum perforatum); antidepresivo, ansiolítico, analgésico; parte: Sumidades floridas; dosis: Consultar a un profesional; precaución: No combinar con antidepresivos",45],
+    ["p","tila","hierbas-silvestres-medicinales","- Tila (Tilia cordata); relajante, diurética, antiespasmódica; parte: Flores; dosis: 1-2 tazas de infusión al día",29],
+    ["p","diente-de-leon","hierbas-silvestres-medicinales","- Diente de león (Taraxacum officinale); diurético, depurativo, estimulante; parte: Hojas y raíz; dosis: 1-2 tazas de infusión al día; precaución: Contraindicado en el embarazo, No combinar con sales de litio",52],
+    ["p","ginkgo-biloba","hierbas-silvestres-medicinales","- Ginkgo biloba (Ginkgo biloba); vasodilatador, antioxidante, mejora la memoria; parte: Hojas; dosis: Consultar a un profesional; precaución: No combinar con anticoagulantes",44],
+    ["p","mate","hierbas-silvestres-medicinales","- Mate (Ilex paraguariensis); estimulante, antioxidante, diurético; parte: Hojas; dosis: 1-2 mates al día",27],
+    ["p","pasiflora","hierbas-silvestres-medicinales","- Pasiflora (Passiflora incarnata); calmante, analgésico, antiespasmódico; parte: Flores y hojas; dosis: 1-2 tazas de infusión al día",34],
+    ["p","corteza-de-sauce","hierbas-silvestres-medicinales","- Corteza de sauce (Salix alba); antiinflamatorio, analgésico, antipirético; parte: Corteza; dosis: Consultar a un profesional; precaución: No recomendado para niños, No recomendado para madres lactantes",51],
+    ["p","agave","hierbas-silvestres-medicinales","- Agave (Agave americana); antiséptico, estimulante intestinal, hipoglucemiante; parte: Savia y hojas; dosis: Consultar a un profesional; precaución: Puede generar dermatitis",44],
+    ["p","arandano","hierbas-silvestres-medicinales","- Arándano (Vaccinium myrtillus); antioxidante, diurético, antibacteriano, astringente; parte: Frutos y hojas; dosis: Consumo directo o infusión",36],
+    ["p","acebo","hierbas-silvestres-medicinales","- Acebo (Ilex aquifolium); antipirético, purgante, diurético, relajante; parte: Hojas y corteza; dosis: Consultar a un profesional, sus bayas son tóxicas; precaución: Las bayas son tóxicas",47],
+    ["p","flor-de-sauco","hierbas-silvestres-medicinales","- Flor de saúco (Sambucus nigra); antiséptico, antiinflamatorio, diurético, laxante; parte: Flores; dosis: 1-2 tazas de infusión al día",34],
+    ["p","yuca","hierbas-silvestres-medicinales","- Yuca (Manihot esculenta); energética, metabolismo, digestiva; parte: Raíz; dosis: Consumo moderado como parte de la dieta; precaución: El consumo excesivo sin una dieta balanceada puede ser perjudicial",51],
+    ["p","ginseng","hierbas-silvestres-medicinales","- Ginseng (Panax ginseng); energizante, inmunoestimulante, hipotensor; parte: Raíz; dosis: Consultar a un profesional",30],
+    ["p","poleo-menta","hierbas-silvestres-medicinales","- Poleo menta (Mentha pulegium); digestivo, aperitivo, carminativo; parte: Hojas; dosis: 1-2 tazas de infusión al día",30],
+    ["p","ortiga","hierbas-silvestres-medicinales","- Ortiga (Urtica dioica); vasoconstrictor, antianémico, diurético; parte: Hojas y raíz; dosis: Infusión o cocida en alimentos",32],
+    ["p","dedalera","hierbas-silvestres-medicinales","- Dedalera (Digitalis purpurea); diurético, cardiotónico; parte: Hojas; dosis: Uso exclusivo bajo prescripción médica; precaución: Planta muy tóxica, su uso doméstico está prohibido",46],
+    ["p","sandalo","hierbas-silvestres-medicinales","- Sándalo (Santalum album); antiséptico, diurético, relajante; parte: Madera; dosis: Uso tópico en aceite esencial",29],
+    ["p","amapola","hierbas-silvestres-medicinales","- Amapola (Papaver somniferum); analgésico, narcótico, sedante; parte: Látex y semillas; dosis: Uso exclusivo bajo prescripción médica; precaución: Planta de uso controlado por su potencial adictivo",50],
+    ["p","apio","hierbas-silvestres-medicinales","- Apio (Apium graveolens); digestivo, laxante, diurético; parte: Tallo y hojas; dosis: Consumo directo o en zumos",29],
+    ["p","kava","hierbas-silvestres-medicinales","- Kava (Piper methysticum); anestésico, sedante, ansiolítico; parte: Raíz; dosis: Consultar a un profesional; precaución: Puede causar daño hepático",37],
+    ["p","escaramujo","hierbas-silvestres-medicinales","- Escaramujo (Rosa canina); vitamínico (vitamina c), antiinflamatorio, antioxidante; parte: Fruto; dosis: Infusión, mermelada o sopa",33],
+    ["p","bejuco-de-agua","hierbas-silvestres-medicinales","- Bejuco de agua (Cissus verticillata); anticonvulsivo, antihemorrágico, antiinflamatorio; parte: Tallos y hojas; dosis: Consultar a un profesional",37],
+    ["p","olmo","hierbas-silvestres-medicinales","- Olmo (Ulmus rubra); antibacteriano, demulcente, nutritivo; parte: Corteza interna; dosis: Consultar a un profesional",30],
+    ["p","limoncillo","hierbas-silvestres-medicinales","- Limoncillo (Melissa officinalis); relajante, sedante, digestivo; parte: Hojas; dosis: 1-2 tazas de infusión al día",29],
+    ["p","ricino","hierbas-silvestres-medicinales","- Ricino (Ricinus communis); purgante, laxante; parte: Aceite de las semillas; dosis: Consultar a un profesional, la semilla es muy tóxica; precaución: La semilla cruda es mortalmente venenosa",48],
+    ["p","konjac","hierbas-silvestres-medicinales","- Konjac (Amorphophallus konjac); saciante, hipocolesterolemiante, laxante; parte: Tubérculo; dosis: Como suplemento dietético (glucomanano)",35],
+    ["p","lechuga-silvestre","hierbas-silvestres-medicinales","- Lechuga silvestre (Lactuca virosa); sedante, analgésico, hipnótico; parte: Látex y hojas; dosis: Uso no recomendado, potencialmente tóxica; precaución: Su uso casero no está recomendado y está prohibida en varios países",56],
+    ["p","helecho-gu-sui-bu","hierbas-silvestres-medicinales","- Helecho gu-sui-bu (Drynaria roosii); regenerador óseo, analgésico; parte: Rizoma; dosis: Consultar a un profesional de medicina tradicional china",37],
+    ["p","junco-de-esteras","hierbas-silvestres-medicinales","- Junco de esteras (Juncus effusus); energizante, tónico; parte: Médula del tallo; dosis: Consultar a un profesional",29],
+    ["p","apong-apong","hierbas-silvestres-medicinales","- Apong-apong (Aglaia edulis); antiparasitario; parte: Corteza y semillas; dosis: Uso tópico",23],
+    ["p","khat","hierbas-silvestres-medicinales","- Khat (Catha edulis); estimulante, anorexígeno; parte: Hojas frescas; dosis: Masticar hojas frescas, uso controlado; precaución: Sustancia psicoactiva con potencial de abuso",44],
+    ["p","kaempferia-rotunda","hierbas-silvestres-medicinales","- Kaempferia rotunda (Kaempferia rotunda); antipruriginoso, antiinflamatorio; parte: Rizoma; dosis: Uso tópico",28],
+    ["p","hierba-de-san-simon","hierbas-silvestres-medicinales","- Hierba de San Simón (Circaea lutetiana); antipirético, antirreumático; parte: Planta entera; dosis: Consultar a un profesional",32],
+    ["p","kadsura-longipedunculata","hierbas-silvestres-medicinales","- Kadsura longipedunculata (Kadsura longipedunculata); digestivo, antibacteriano; parte: Frutos y tallos; dosis: Consultar a un profesional",35],
+    ["p","guaco","hierbas-silvestres-medicinales","- Guaco (Mikania glomerata); antiinflamatorio, broncodilatador, expectorante; parte: Hojas; dosis: Jarabe o infusión",29],
+    ["p","copaiba","hierbas-silvestres-medicinales","- Copaiba (Copaifera officinalis); laxante, diurético, balsámico; parte: Resina (aceite); dosis: Consultar a un profesional",31],
+    ["p","moringa","hierbas-silvestres-medicinales","- Moringa (Moringa oleifera); antiinflamatorio, hipotensor, nutritivo; parte: Hojas, semillas y raíces; dosis: Polvo de hojas o infusión",34],
+    ["p","centella-asiatica","hierbas-silvestres-medicinales","- Centella asiática (Centella asiatica); cicatrizante, antiulceroso, venotónico; parte: Hojas; dosis: Uso tópico u oral, consultar a un profesional",37],
+    ["p","grosellero-de-la-india","hierbas-silvestres-medicinales","- Grosellero de la India (Phyllanthus emblica); hipolipemiante, antioxidante, hepatoprotector; parte: Fruto; dosis: Consumo del fruto o extracto",36],
+    ["p","bardana","hierbas-silvestres-medicinales","- Bardana (Arctium lappa); depurativa, desintoxicante, antiinflamatoria, antibacteriana; parte: Raíz y hojas; dosis: Decocción de la raíz o cataplasma de hojas",40],
+    ["p","anis-verde","hierbas-silvestres-medicinales","- Anís verde (Pimpinella anisum); carminativo, digestivo, sedante suave, expectorante; parte: Semillas; dosis: Infusión después de las comidas",36],
+    ["p","boldo","hierbas-silvestres-medicinales","- Boldo (Peumus boldus); hepatoprotector, colerético, diurético, sedante suave; parte: Hojas; dosis: Infusión antes de dormir; precaución: No usar durante el embarazo, No usar en caso de obstrucción de las vías biliares",55],
+    ["p","sauce","arboles-medicinales","- Sauce (Salix alba); analgésico, antiinflamatorio, antipirético; parte: Corteza; dosis: Decocción: 1-2 tazas al día.; precaución: No usar en caso de alergia a la aspirina., No combinar con anticoagulantes.",52],
+    ["p","tilo","arboles-medicinales","- Tilo (Tilia cordata); relajante, sedante, antiespasmódico, diaforético; parte: Flores; dosis: Infusión: 2-3 tazas al día.; precaución: Puede potenciar el efecto de otros sedantes.",46],
+    ["p","olivo","arboles-medicinales","- Olivo (Olea europaea); hipotensor, hipoglucemiante, antioxidante; parte: Hojas; dosis: Infusión: 2-3 tazas al día.",29],
+    ["p","neem","arboles-medicinales","- Neem (Azadirachta indica); antibacteriano, antifúngico, insecticida, antiinflamatorio; parte: Hojas, semillas, corteza; dosis: Uso tópico: aplicar aceite o extracto sobre la piel.; precaución: No se recomienda su uso durante el embarazo.",60],
+    ["p","castano-de-indias","arboles-medicinales","- Castaño de Indias (Aesculus hippocastanum); venotónico, antiinflamatorio, antiedematoso; parte: Semillas; dosis: Extracto estandarizado: 300 mg dos veces al día.; precaución: No se recomienda su uso durante el embarazo y la lactancia.",59],
+    ["p","fresno","arboles-medicinales","- Fresno (Fraxinus excelsior); diurético, antiinflamatorio, analgésico; parte: Hojas, corteza; dosis: Infusión: 2-3 tazas al día.",33],
+    ["p","abedul","arboles-medicinales","- Abedul (Betula pendula); diurético, depurativo, antiinflamatorio; parte: Hojas, corteza, savia; dosis: Infusión: 2-3 tazas al día.",33],
+    ["p","cipres","arboles-medicinales","- Ciprés (Cupressus sempervirens); astringente, vasoconstrictor, antiespasmódico; parte: Gálbulos (frutos), ramas; dosis: Decocción: 1-2 tazas al día.",38],
+    ["p","pino","arboles-medicinales","- Pino (Pinus sylvestris); expectorante, antiséptico, balsámico; parte: Yemas, resina, hojas; dosis: Infusión: 2-3 tazas al día.",32],
+    ["p","cedro","arboles-medicinales","- Cedro (Cedrus libani); antiséptico, expectorante, relajante; parte: Madera, aceite esencial; dosis: Aceite esencial: 2-3 gotas en un difusor.",36],
+    ["p","arce","arboles-medicinales","- Arce (Acer saccharum); antiinflamatorio, antioxidante; parte: Savia; dosis: Consumo directo.",24],
+    ["p","roble","arboles-medicinales","- Roble (Quercus robur); astringente, antiinflamatorio, antiséptico; parte: Corteza; dosis: Decocción: uso externo para gargarismos o lavados.",36],
+    ["p","haya","arboles-medicinales","- Haya (Fagus sylvatica); antiséptico, expectorante, febrífugo; parte: Corteza, hojas; dosis: Decocción: 1-2 tazas al día.",31],
+    ["p","nogal","arboles-medicinales","- Nogal (Juglans regia); astringente, antifúngico, hipoglucemiante; parte: Hojas, frutos; dosis: Infusión: 2-3 tazas al día.",31],
+    ["p","tejo","arboles-medicinales","- Tejo (Taxus baccata); antitumoral; parte: Corteza, hojas; dosis: Uso exclusivo bajo prescripción médica.; precaución: Planta altamente tóxica. Su uso debe ser estrictamente supervisado por un profesional.",52],
+    ["p","espino-blanco","arboles-medicinales","- Espino Blanco (Crataegus monogyna); cardiotónico, hipotensor, relajante; parte: Flores, hojas, frutos; dosis: Infusión: 2-3 tazas al día.; precaución: Puede interactuar con medicamentos para el corazón.",51],
+    ["p","avellano","arboles-medicinales","- Avellano (Corylus avellana); astringente, antiinflamatorio, venotónico; parte: Hojas, corteza; dosis: Decocción: uso externo.",32],
+    ["p","alcornoque","arboles-medicinales","- Alcornoque (Quercus suber); astringente, antiinflamatorio; parte: Corteza; dosis: Decocción: uso externo.",27],
+    ["p","encina","arboles-medicinales","- Encina (Quercus ilex); astringente, antiinflamatorio; parte: Corteza, bellotas; dosis: Decocción: uso externo.",28],
+    ["p","serbal","arboles-medicinales","- Serbal (Sorbus aucuparia); vitamínico, astringente; parte: Frutos; dosis: Consumo directo o en mermelada.",27],
+    ["p","magnolia","arboles-medicinales","- Magnolia (Magnolia grandiflora); ansiolítico, antiinflamatorio; parte: Corteza, flores; dosis: Extracto: seguir indicaciones del fabricante.",36],
+    ["p","arbol-del-te","arboles-medicinales","- Árbol del Té (Melaleuca alternifolia); antiséptico, antibacteriano, antifúngico; parte: Hojas (aceite esencial); dosis: Uso tópico: aplicar diluido sobre la piel.; precaución: No ingerir. Puede ser tóxico.",52],
+    ["p","canelo","arboles-medicinales","- Canelo (Drimys winteri); antiescorbútico, tónico, estimulante; parte: Corteza; dosis: Decocción: 1-2 tazas al día.",29],
+    ["p","quina","arboles-medicinales","- Quina (Cinchona officinalis); antipalúdico, febrífugo, amargo; parte: Corteza; dosis: Uso exclusivo bajo prescripción médica.",32],
+    ["p","sangre-de-drago","arboles-medicinales","- Sangre de Drago (Croton lechleri); cicatrizante, antiinflamatorio, antiviral; parte: Látex (resina); dosis: Uso tópico: aplicar unas gotas sobre la herida.",40],
+    ["p","araucaria","arboles-medicinales","- Araucaria (Araucaria araucana); nutritivo, energético; parte: Piñones (semillas); dosis: Consumo directo.",27],
+    ["p","alerce","arboles-medicinales","- Alerce (Larix decidua); expectorante, antiséptico; parte: Resina, yemas; dosis: Infusión: 1-2 tazas al día.",28],
+    ["p","abeto","arboles-medicinales","- Abeto (Abies alba); balsámico, expectorante, antiséptico; parte: Yemas, resina; dosis: Jarabe: 1-3 cucharaditas al día.",31],
+    ["p","acacia","arboles-medicinales","- Acacia (Acacia senegal); emoliente, antiinflamatorio, astringente; parte: Goma arábiga; dosis: Según indicación del producto.",32],
+    ["p","algarrobo","arboles-medicinales","- Algarrobo (Ceratonia siliqua); antidiarreico, nutritivo, expectorante; parte: Frutos (algarrobas); dosis: Harina: 1-2 cucharadas disueltas en agua.",38],
+    ["p","almendro","arboles-medicinales","- Almendro (Prunus dulcis); emoliente, nutritivo, laxante suave; parte: Frutos (almendras), aceite; dosis: Consumo directo o aceite.; precaución: Alergia a los frutos secos.",44],
+    ["p","caoba","arboles-medicinales","- Caoba (Swietenia mahagoni); astringente, febrífugo; parte: Corteza; dosis: Decocción: 1-2 tazas al día.",27],
+    ["p","ceiba","arboles-medicinales","- Ceiba (Ceiba pentandra); diurético, emoliente, febrífugo; parte: Corteza, hojas, flores; dosis: Decocción: 1-2 tazas al día.",32],
+    ["p","chopo","arboles-medicinales","- Chopo (Populus nigra); antiinflamatorio, analgésico, antiséptico; parte: Yemas, corteza; dosis: Ungüento: aplicación tópica.",32],
+    ["p","granado","arboles-medicinales","- Granado (Punica granatum); astringente, vermífugo, antioxidante; parte: Corteza de la raíz, fruto; dosis: Decocción de la corteza: uso bajo supervisión. Zumo del fruto: consumo libre.",47],
+    ["p","guayabo","arboles-medicinales","- Guayabo (Psidium guajava); astringente, antidiarreico, antiséptico; parte: Hojas, fruto; dosis: Infusión de hojas: 2-3 tazas al día.",34],
+    ["p","higuera","arboles-medicinales","- Higuera (Ficus carica); laxante, emoliente, expectorante; parte: Frutos (higos), látex; dosis: Consumo de higos frescos o secos.",33],
+    ["p","jaboncillo","arboles-medicinales","- Jaboncillo (Sapindus saponaria); detergente, insecticida; parte: Frutos; dosis: Uso externo.; precaución: Tóxico si se ingiere.",33],
+    ["p","limonero","arboles-medicinales","- Limonero (Citrus limon); antiséptico, vitamínico, alcalinizante; parte: Fruto; dosis: Consumo directo.",26],
+    ["p","madrono","arboles-medicinales","- Madroño (Arbutus unedo); astringente, antiséptico urinario, antiinflamatorio; parte: Hojas, frutos; dosis: Infusión de hojas: 2-3 tazas al día.",37],
+    ["p","moral","arboles-medicinales","- Moral (Morus nigra); laxante suave, expectorante, hipoglucemiante; parte: Frutos (moras), hojas; dosis: Consumo de frutos. Infusión de hojas: 1-2 tazas al día.",41],
+    ["p","naranjo-amargo","arboles-medicinales","- Naranjo Amargo (Citrus aurantium); sedante, digestivo, antiespasmódico; parte: Flores (azahar), hojas, fruto; dosis: Infusión de azahar: 1-2 tazas al día.",39],
+    ["p","peral","arboles-medicinales","- Peral (Pyrus communis); diurético, astringente, remineralizante; parte: Fruto, hojas; dosis: Consumo del fruto. Infusión de hojas: 1-2 tazas al día.",38],
+    ["p","hamamelis","arbustos-medicinales","- Hamamelis (Hamamelis virginiana); astringente, antiinflamatorio, hermostático, cicatrizante; parte: Hojas y corteza; dosis: Uso tópico: aplicar el destilado (agua de hamamelis) sobre la zona afectada varias veces al día.; precaución: Raramente, puede causar irritación en pieles muy sensibles.",74],
+    ["p","sauzgatillo","arbustos-medicinales","- Sauzgatillo (Vitex agnus-castus); regulador hormonal (progesterogénico), alivia síntomas del síndrome premenstrual (spm), emenagogo; parte: Frutos (bayas); dosis: Extracto estandarizado: 20-40 mg al día, preferiblemente por la mañana.; precaución: No usar durante el embarazo o la lactancia., Puede interferir con anticonceptivos orales y terapia de reemplazo hormonal.",93],
+    ["p","gayuba","arbustos-medicinales","- Gayuba (Arctostaphylos uva-ursi); antiséptico urinario, diurético, astringente; parte: Hojas; dosis: Infusión: 1.5-4 g en 150 ml de agua, 3-4 veces al día. No usar más de 1 semana seguida.; precaución: No usar durante el embarazo o lactancia., No recomendado para menores de 12 años.",72],
+    ["p","arandano-rojo","arbustos-medicinales","- Arándano Rojo Americano (Vaccinium macrocarpon); antiadherente bacteriano (vías urinarias), antioxidante, antiinflamatorio; parte: Fruto (baya); dosis: Jugo: 250-500 ml al día. Extracto en cápsulas: 300-500 mg dos veces al día.; precaución: Puede aumentar el riesgo de sangrado si se toma con anticoagulantes (warfarina)., Altas dosis pueden causar malestar estomacal o diarrea.",95],
+    ["p","grosellero-negro","arbustos-medicinales","- Grosellero Negro (Ribes nigrum); antiinflamatorio (similar a la cortisona), antialérgico, diurético, rico en vitamina c; parte: Hojas, frutos y yemas; dosis: Infusión de hojas: 2-4 g por taza. Extracto de yemas (gemoterapia): 50-100 gotas al día.; precaución: Usar con precaución si se tiene edema por insuficiencia cardíaca o renal.",84],
+    ["p","enebro","arbustos-medicinales","- Enebro (Juniperus communis); diurético potente, antiséptico (urinario y respiratorio), carminativo, antirreumático; parte: Frutos (bayas o gálbulos); dosis: Infusión: 1 cucharadita de bayas machacadas por taza, 1-2 veces al día. No usar por periodos prolongados.; precaución: Totalmente contraindicado, es abortivo., No usar en caso de nefritis o insuficiencia renal aguda.",94],
+    ["p","zarzaparrilla","arbustos-medicinales","- Zarzaparrilla (Smilax aspera); depurativa, diurética, sudorífica, antiinflamatoria; parte: Raíz (rizoma); dosis: Decocción: 1-2 cucharaditas de raíz por taza, hervir 10 min, tomar 2-3 veces al día.; precaución: Puede aumentar la absorción de algunos fármacos., Dosis altas pueden irritar la mucosa gástrica.",78],
+    ["p","rusco","arbustos-medicinales","- Rusco (Ruscus aculeatus); venotónico, antiinflamatorio, antiedematoso, diurético; parte: Rizoma y raíces; dosis: Extracto estandarizado: 7-11 mg de ruscogenina total al día, en 2-3 tomas.; precaución: Usar con precaución y bajo control médico., Consultar al médico antes de usar.",71],
+    ["p","mirto","arbustos-medicinales","- Mirto (Myrtus communis); antiséptico, expectorante, balsámico, astringente; parte: Hojas y bayas; dosis: Infusión: 1 cucharadita por taza. Aceite esencial: 2-3 gotas en inhalaciones de vapor.; precaución: Evitar el aceite esencial durante el embarazo y la lactancia.",67],
+    ["p","jara-pringosa","arbustos-medicinales","- Jara Pringosa (Cistus ladanifer); antiviral, antibacteriano, cicatrizante, antihemorrágico; parte: Hojas y ramas jóvenes; dosis: Infusión: 1 cucharadita por taza, 2-3 veces al día. Uso tópico: aplicar la infusión o el aceite (ládano).; precaución: No se conocen contraindicaciones importantes en las dosis recomendadas.",81],
+    ["p","brezo","arbustos-medicinales","- Brezo (Calluna vulgaris); antiséptico urinario, diurético, antiinflamatorio, sedante suave; parte: Sumidades floridas (flores); dosis: Infusión: 1-2 cucharaditas de flores por taza, 3-4 veces al día.; precaución: No se han descrito efectos adversos significativos.",67],
+    ["p","sauco","arbustos-medicinales","- Saúco (Sambucus nigra); antiviral (gripe), sudorífico, antiinflamatorio, diurético; parte: Flores y bayas maduras; dosis: Infusión de flores: 2-4 g por taza. Jarabe de bayas: 1-2 cucharadas 3-4 veces al día al inicio de un resfriado.; precaución: Las bayas crudas y otras partes verdes de la planta son tóxicas. Solo consumir bayas cocinadas.",86],
+    ["p","boj","arbustos-medicinales","- Boj (Buxus sempervirens); sudorífico, depurativo, febrífugo, colagogo; parte: Hojas y corteza; dosis: Uso muy delicado por su toxicidad. Principalmente en homeopatía o bajo estricta supervisión médica.; precaución: Planta tóxica. Su uso interno es peligroso y puede causar vómitos, diarrea y parálisis. No automedicarse.",81],
+    ["p","aligustre","arbustos-medicinales","- Aligustre (Ligustrum vulgare); astringente, vulnerario, antiinflamatorio (uso externo); parte: Hojas y flores; dosis: Uso exclusivamente externo. Infusión para gargarismos o compresas.; precaución: Sus bayas son tóxicas, especialmente para los niños. No ingerir ninguna parte de la planta.",73],
+    ["p","bonetero","arbustos-medicinales","- Bonetero (Euonymus europaeus); laxante drástico, vomitivo, insecticida (uso externo); parte: Frutos y corteza; dosis: Planta altamente tóxica. No se recomienda ningún uso interno.; precaución: Todas las partes de la planta son muy tóxicas. La ingestión de frutos puede ser mortal, especialmente en niños.",77],
+    ["p","cornejo-sanguineo","arbustos-medicinales","- Cornejo Sanguíneo (Cornus sanguinea); febrífugo, astringente, tónico; parte: Corteza y frutos; dosis: Decocción de corteza: 30 g por litro, tomar a pequenas dosis (uso tradicional, hoy poco común).; precaución: Los frutos pueden ser vomitivos en grandes cantidades. Usar con precaución.",72],
+    ["p","durillo","arbustos-medicinales","- Durillo (Viburnum tinus); febrífugo, purgante, antipirético; parte: Hojas y frutos; dosis: Uso delicado por su toxicidad. La tintura madre se usa en homeopatía.; precaución: Planta tóxica. La ingestión puede causar vómitos y diarrea. No automedicar.",63],
+    ["p","espino-cerval-de-mar","arbustos-medicinales","- Espino Cerval de Mar (Hippophae rhamnoides); muy rico en vitamina c, antioxidante, cicatrizante, inmunoestimulante; parte: Frutos (bayas) y aceite de las semillas; dosis: Jugo o jarabe: 1-3 cucharadas al día. Aceite (uso tópico u oral): seguir indicaciones del producto.; precaución: No se conocen contraindicaciones importantes.",83],
+    ["p","forsitia","arbustos-medicinales","- Forsitia (Forsythia suspensa); antibacterial, antiinflamatorio, antipirético, antiviral; parte: Fruto; dosis: Se usa en fórmulas de la Medicina Tradicional China (MTC) como Lian Qiao. Dosis según prescripción.; precaución: Usar solo bajo supervisión de un profesional de MTC. Puede causar náuseas.",75],
+    ["p","mahonia","arbustos-medicinales","- Mahonia (Mahonia aquifolium); antimicrobiano (berberina), colagogo, alterativo (depurativo), antiinflamatorio; parte: Raíz y corteza del tallo; dosis: Tintura: 1-3 ml, 3 veces al día. No usar por periodos prolongados.; precaución: No usar durante el embarazo debido a la berberina., Evitar durante la lactancia.",79],
+    ["p","pirlitero","arbustos-medicinales","- Pirlitero (Crataegus azarolus); cardiotónico, astringente, rico en vitamina c; parte: Frutos (acerolas); dosis: Consumo de los frutos frescos o en mermelada.; precaución: Similar al espino blanco, precaución si se toman fármacos para el corazón.",62],
+    ["p","retama-negra","arbustos-medicinales","- Retama Negra (Cytisus scoparius); cardiotónico (esparteína), diurético, hipertensor; parte: Ramas y flores; dosis: Uso muy delicado por su toxicidad. Solo bajo estricta prescripción médica.; precaución: Totalmente contraindicada., Contraindicada por su efecto hipertensor.",69],
+    ["p","rosa-canina","arbustos-medicinales","- Rosa Canina (Escaramujo) (Rosa canina); muy rico en vitamina c, astringente, antiinflamatorio, diurético suave; parte: Fruto (escaramujo); dosis: Infusión: 2-5 g de frutos secos por taza. Polvo: 5-10 g al día.; precaución: Los pelos del interior del fruto pueden causar irritación en la boca y el tracto digestivo si no se eliminan.",84],
+    ["p","salvia-real","arbustos-medicinales","- Salvia Real (Phlomis lychnitis); antiinflamatorio, cicatrizante, antiséptico (uso externo); parte: Hojas; dosis: Uso externo: infusión concentrada para lavar heridas o en gargarismos.; precaución: No se recomienda su uso interno por falta de estudios concluyentes.",67],
+    ["p","te-de-aragon","arbustos-medicinales","- Té de Aragón (Jasonia glutinosa); digestivo, carminativo, antiespasmódico, aperitivo; parte: Sumidades floridas; dosis: Infusión: 1 cucharadita por taza, después de las comidas.; precaución: Evitar por precaución.",54],
+    ["p","tomillo-salsero","arbustos-medicinales","- Tomillo Salsero (Thymbra capitata); antiséptico potente, expectorante, antifúngico, antiespasmódico; parte: Sumidades floridas; dosis: Infusión: media cucharadita por taza (es muy potente), 1-2 veces al día. No tomar de forma prolongada.; precaución: Contraindicado., Puede subir la tensión arterial.",76],
+    ["p","torvisco","arbustos-medicinales","- Torvisco (Daphne gnidium); purgante drástico, vesicante (produce ampollas en la piel); parte: Corteza y hojas; dosis: Planta extremadamente tóxica. No se recomienda ningún uso, ni interno ni externo.; precaución: Toda la planta es muy venenosa. El simple contacto puede irritar la piel y su ingestión puede ser mortal.",80],
+    ["p","viburno","arbustos-medicinales","- Viburno (Viburnum opulus); antiespasmódico (especialmente uterino), sedante, astringente, hipotensor; parte: Corteza; dosis: Decocción: 1-2 cucharaditas de corteza por taza. Tintura: 2-4 ml, 3 veces al día.; precaución: No usar durante el embarazo, excepto bajo supervisión médica en el momento del parto.",77],
+    ["p","agnocasto","arbustos-medicinales","- Agnocasto (Vitex agnus-castus); regulador hormonal, alivia el síndrome premenstrual, trata irregularidades menstruales; parte: Frutos; dosis: 30-40 mg de extracto seco al día.; precaución: No recomendado., No recomendado.",56],
+    ["p","aladierno","arbustos-medicinales","- Aladierno (Rhamnus alaternus); laxante, astringente, febrífugo; parte: Corteza y frutos; dosis: Decocción de la corteza (20 g/l), 1 taza antes de acostarse.; precaución: No recomendado., Puede causar espasmos intestinales.",56],
+    ["p","arayan","arbustos-medicinales","- Arrayán (Myrtus communis); antiséptico, expectorante, astringente; parte: Hojas y bayas; dosis: Infusión de 15 g de hojas por litro de agua.; precaución: No se recomienda el uso del aceite esencial.",50],
+    ["p","berberis","arbustos-medicinales","- Bérberis (Berberis vulgaris); tónico hepático, estimulante de la bilis, antimicrobiano; parte: Corteza de la raíz; dosis: Decocción de 5 g por taza, 2-3 veces al día antes de las comidas.; precaución: No usar., No usar.",56],
+    ["p","ceanoto","arbustos-medicinales","- Ceanoto (Ceanothus americanus); linfagogo, astringente, expectorante; parte: Corteza de la raíz; dosis: Tintura (1:5 en alcohol al 45%), 1-2 ml tres veces al día.; precaución: Puede interferir con anticoagulantes.",54],
+    ["p","chicalote","arbustos-medicinales","- Chicalote (Argemone mexicana); sedante, analgésico, antitusivo; parte: Látex y hojas; dosis: Microdosis bajo supervisión experta. Es una planta de uso delicado.; precaución: No usar., Planta tóxica, puede causar glaucoma si el látex entra en contacto con los ojos.",67],
+    ["p","damiana","arbustos-medicinales","- Damiana (Turnera diffusa); afrodisíaco, tónico nervioso, antidepresivo suave, diurético; parte: Hojas; dosis: Infusión de 2-4 g de hojas secas, 3 veces al día.; precaución: No recomendado., Puede alterar los niveles de azúcar en sangre.",60],
+    ["p","equiseto-menor","arbustos-medicinales","- Equiseto menor (Equisetum arvense); remineralizante, diurético, cicatrizante, astringente; parte: Tallos estériles; dosis: Infusión de 2-3 g por taza, varias veces al día.; precaución: Contiene trazas de un alcaloide, no se recomienda el uso prolongado.",64],
+    ["p","gobernadora","arbustos-medicinales","- Gobernadora (Larrea tridentata); antimicrobiano, antioxidante, antiinflamatorio; parte: Hojas; dosis: Uso principalmente externo. Infusión para lavados o compresas.; precaución: Potencialmente hepatotóxica en uso interno. No se recomienda.",61],
+    ["p","guayule","arbustos-medicinales","- Guayule (Parthenium argentatum); analgésico, antiinflamatorio; parte: Planta completa; dosis: Uso tradicional en emplastos sobre zonas doloridas.; precaución: Puede causar dermatitis de contacto.",50],
+    ["p","hierba-del-pollo","arbustos-medicinales","- Hierba del Pollo (Commelina pallida); antihemorrágica, cicatrizante, antiséptica; parte: Planta fresca; dosis: Aplicación directa de la planta machacada sobre la herida.; precaución: Uso exclusivamente externo.",53],
+    ["p","hoja-santa","arbustos-medicinales","- Hoja Santa (Piper auritum); expectorante, antiinflamatorio, digestivo; parte: Hojas; dosis: Infusión de 1-2 hojas por taza.; precaución: Contiene safrol, no se recomienda su uso medicinal.",48],
+    ["p","izote","arbustos-medicinales","- Izote (Yucca filifera); antiinflamatorio, antirreumático; parte: Flor y raíz; dosis: Decocción de la raíz, 20 g por litro, tomar 2 tazas al día.; precaución: Dosis altas pueden ser irritantes para el estómago.",53],
+    ["p","jojoba","arbustos-medicinales","- Jojoba (Simmondsia chinensis); hidratante, emoliente, antioxidante; parte: Cera líquida de las semillas; dosis: Uso tópico, aplicar unas gotas sobre la piel o el cabello.; precaución: No ingerir. Es indigestible.",54],
+    ["p","lentisco","arbustos-medicinales","- Lentisco (Pistacia lentiscus); astringente, antiinflamatorio, cicatrizante; parte: Resina (almáciga) y hojas; dosis: Masticar la resina para la salud bucal. Decocción de hojas para uso externo.; precaución: Posible alergia a la resina.",60],
+    ["p","membrillero","arbustos-medicinales","- Membrillero (Cydonia oblonga); astringente, emoliente, antiinflamatorio; parte: Frutos y semillas; dosis: Macerado de semillas (1 cucharadita en agua) para hacer un mucílago.; precaución: Las semillas crudas contienen pequeñas cantidades de cianuro, no deben masticarse ni triturarse.",72],
+    ["p","noni","plantas-tropicales-medicinales","- Noni (Morinda citrifolia); analgésico, antiinflamatorio, inmunomodulador, antimicrobiano; parte: Fruto, hojas, raíz; dosis: 30-60 ml de jugo de noni al día.; precaución: Personas con enfermedades renales o hepáticas deben consultar a un médico.",62],
+    ["p","una-de-gato","plantas-tropicales-medicinales","- Uña de Gato (Uncaria tomentosa); antiinflamatoria, inmunomoduladora, antiviral, antioxidante; parte: Corteza y raíz; dosis: 250-500 mg de extracto estandarizado al día.; precaución: No se recomienda su uso., Puede interactuar con inmunosupresores.",63],
+    ["p","acai","plantas-tropicales-medicinales","- Açaí (Euterpe oleracea); antioxidante, energizante, antiinflamatoria; parte: Fruto; dosis: Consumo libre de la pulpa o jugo.",32],
+    ["p","guarana","plantas-tropicales-medicinales","- Guaraná (Paullinia cupana); estimulante, energizante, tónico, analgésico; parte: Semillas; dosis: 200-800 mg de extracto en polvo al día.; precaución: Puede aumentar la presión arterial y el ritmo cardíaco., No se recomienda por su alto contenido de cafeína.",65],
+    ["p","yerba-mate","plantas-tropicales-medicinales","- Yerba Mate (Ilex paraguariensis); estimulante, antioxidante, diurética, digestiva; parte: Hojas y tallos jóvenes; dosis: Infusión tradicional, 20-50g de yerba por litro de agua.; precaución: Moderar consumo por su contenido de cafeína.",60],
+    ["p","cacao","plantas-tropicales-medicinales","- Cacao (Theobroma cacao); antioxidante, estimulante, cardioprotector, euforizante; parte: Semillas (habas); dosis: Consumo moderado de chocolate negro (>70% cacao) o 1-2 cucharadas de cacao en polvo al día.; precaución: Puede causar migrañas en personas sensibles., Moderar consumo por su contenido de teobromina, similar a la cafeína.",84],
+    ["p","astragalo","raices-y-tuberculos-medicinales","- Astrágalo (Astragalus membranaceus); inmunoestimulante, adaptógeno, cardioprotector, diurético, antioxidante; parte: Raíz; dosis: 9-15 gramos de raíz seca en decocción; precaución: Enfermedades autoinmunes, Puede interactuar con inmunosupresores.",62],
+    ["p","regaliz","raices-y-tuberculos-medicinales","- Regaliz (Glycyrrhiza glabra); antiinflamatoria, expectorante, antiviral, hepatoprotectora, endulzante; parte: Raíz; dosis: 5-15 gramos de raíz seca al día; precaución: Puede elevar la presión arterial., No se recomienda su consumo.",59],
+    ["p","equinacea","raices-y-tuberculos-medicinales","- Equinácea (Echinacea purpurea); inmunoestimulante, antiinflamatoria, antiviral, cicatrizante, antibacteriana; parte: Raíz y partes aéreas; dosis: 1-2 gramos de raíz seca en infusión, 3 veces al día; precaución: Enfermedades autoinmunes, Alergia a plantas de la familia de las margaritas.",73],
+    ["p","diente-de-leon-raiz","raices-y-tuberculos-medicinales","- Diente de León (raíz) (Taraxacum officinale); depurativa, diurética, colerética, hepatoprotectora, tónico amargo; parte: Raíz; dosis: 2-8 gramos de raíz seca en decocción, 3 veces al día; precaución: Obstrucción de las vías biliares, Alergia a plantas de la familia de las margaritas.",72],
+    ["p","maca","raices-y-tuberculos-medicinales","- Maca (Lepidium meyenii); adaptógeno, energizante, fertilidad, regulador hormonal, nutritiva; parte: Raíz; dosis: 1.5-3 gramos de polvo de raíz al día; precaución: Puede elevar la presión arterial en algunas personas., Consultar con un médico.",61],
+    ["p","ashwagandha","raices-y-tuberculos-medicinales","- Ashwagandha (Withania somnifera); adaptógeno, ansiolítica, antiinflamatoria, inmunoestimulante, tónico nervioso; parte: Raíz; dosis: 3-6 gramos de polvo de raíz al día; precaución: No se recomienda su consumo., Hipertiroidismo",57],
+    ["p","sello-de-oro","raices-y-tuberculos-medicinales","- Sello de Oro (Hydrastis canadensis); antimicrobiana, antiinflamatoria, astringente, tónico amargo, inmunoestimulante; parte: Rizoma y raíces; dosis: 0.5-1 gramo de raíz seca, 3 veces al día; precaución: No se recomienda su consumo., No se recomienda su consumo.",66],
+    ["p","malvavisco","raices-y-tuberculos-medicinales","- Malvavisco (Althaea officinalis); demulcente, emoliente, antiinflamatoria, expectorante, diurética; parte: Raíz; dosis: 2-5 gramos de raíz seca en maceración o decocción; precaución: Puede afectar los niveles de azúcar en sangre.",58],
+    ["p","osha","raices-y-tuberculos-medicinales","- Osha (Ligusticum porteri); antiviral, expectorante, diaforética, inmunoestimulante, antimicrobiana; parte: Raíz; dosis: 1-2 gramos de raíz seca en decocción; precaución: No se recomienda su consumo.",50],
+    ["p","calamo-aromatico","raices-y-tuberculos-medicinales","- Cálamo Aromático (Acorus calamus); carminativo, estimulante digestivo, tónico nervioso, expectorante, antiespasmódico; parte: Rizoma; dosis: 1-3 gramos de rizoma seco al día; precaución: La variedad norteamericana es segura; la europea y asiática pueden contener beta-asarona, un compuesto potencialmente tóxico y carcinógeno. Usar con precaución., No se recomienda su consumo.",95],
+    ["p","genciana","raices-y-tuberculos-medicinales","- Genciana (Gentiana lutea); tónico amargo, estimulante digestivo, colagoga, antipirética, sialagoga; parte: Raíz; dosis: 0.5-1 gramo de raíz seca antes de las comidas; precaución: Úlcera gástrica o duodenal, hiperacidez., No se recomienda su consumo.",63],
+    ["p","rabano-picante","raices-y-tuberculos-medicinales","- Rábano Picante (Armoracia rusticana); estimulante circulatorio, descongestionante, antimicrobiano, diurético, rubefaciente; parte: Raíz; dosis: Pequeñas cantidades como condimento.; precaución: Hipotiroidismo, úlceras gastrointestinales, enfermedad renal., No recomendado en grandes cantidades.",74],
+    ["p","batata","raices-y-tuberculos-medicinales","- Batata (Ipomoea batatas); nutritiva, antioxidante, antiinflamatoria, reguladora del azúcar, inmunoestimulante; parte: Tubérculo; dosis: Consumo como alimento.",40],
+    ["p","remolacha","raices-y-tuberculos-medicinales","- Remolacha (Beta vulgaris); hepatoprotectora, desintoxicante, antihipertensiva, antioxidante, mejora el rendimiento deportivo; parte: Raíz; dosis: Consumo como alimento o zumo.; precaución: Tendencia a formar cálculos renales de oxalato.",60],
+    ["p","zanahoria","raices-y-tuberculos-medicinales","- Zanahoria (Daucus carota); rica en vitamina a, antioxidante, salud ocular, salud de la piel, digestiva; parte: Raíz; dosis: Consumo como alimento.",37],
+    ["p","nabo","raices-y-tuberculos-medicinales","- Nabo (Brassica rapa); expectorante, diurético, rico en vitamina c, antiinflamatorio, digestivo; parte: Raíz; dosis: Consumo como alimento.; precaución: Hipotiroidismo (consumo excesivo y crudo).",49],
+    ["p","chirivia","raices-y-tuberculos-medicinales","- Chirivía (Pastinaca sativa); diurética, digestiva, rica en potasio, rica en fibra, antioxidante; parte: Raíz; dosis: Consumo como alimento.",36],
+    ["p","apionabo","raices-y-tuberculos-medicinales","- Apionabo (Apium graveolens var. rapaceum); diurético, remineralizante, digestivo, depurativo, antiinflamatorio; parte: Raíz; dosis: Consumo como alimento.; precaución: Insuficiencia renal grave.",49],
+    ["p","rabano","raices-y-tuberculos-medicinales","- Rábano (Raphanus sativus); colagogo, colerético, antiséptico, expectorante, diurético; parte: Raíz; dosis: Consumo como alimento o en zumo.; precaución: Hipotiroidismo (consumo excesivo).",48],
+    ["p","colirrabano","raices-y-tuberculos-medicinales","- Colirrábano (Brassica oleracea var. gongylodes); rico en vitamina c, antioxidante, digestivo, bajo en calorías, rico en fibra; parte: Tallo engrosado (tubérculo aéreo); dosis: Consumo como alimento.; precaución: Hipotiroidismo (consumo excesivo y crudo).",64],
+    ["p","tupinambo","raices-y-tuberculos-medicinales","- Tupinambo (Helianthus tuberosus); prebiótico (rico en inulina), regulador del azúcar, digestivo, bajo índice glucémico, saciente; parte: Tubérculo; dosis: Consumo como alimento.; precaución: Puede causar flatulencia en personas no acostumbradas a la inulina.",65],
+    ["p","arracacha","raices-y-tuberculos-medicinales","- Arracacha (Arracacia xanthorrhiza); digestiva, energética, rica en calcio, fácil de digerir, nutritiva; parte: Raíz tuberosa; dosis: Consumo como alimento.",40],
+    ["p","ulluco","raices-y-tuberculos-medicinales","- Ulluco (Ullucus tuberosus); nutritivo, rico en vitamina c, cicatrizante, antiinflamatorio, hidratante; parte: Tubérculo; dosis: Consumo como alimento.",38],
+    ["p","oca","raices-y-tuberculos-medicinales","- Oca (Oxalis tuberosa); energética, rica en carbohidratos, antioxidante, ligeramente laxante, nutritiva; parte: Tubérculo; dosis: Consumo como alimento.; precaución: Alto contenido de oxalatos, no recomendado para personas con problemas renales o gota.",64],
+    ["p","mashua","raices-y-tuberculos-medicinales","- Mashua (Tropaeolum tuberosum); anterógeno (reduce la testosterona), antibacteriana, insecticida, diurética, antioxidante; parte: Tubérculo; dosis: Consumo como alimento.; precaución: No recomendado para hombres que deseen tener hijos por su efecto anterógeno.",66],
+    ["p","taro","raices-y-tuberculos-medicinales","- Taro (Colocasia esculenta); nutritivo, hipoalergénico, fácil de digerir, rico en fibra, regulador del azúcar; parte: Cormo (tubérculo); dosis: Consumo como alimento, siempre cocido.; precaución: El cormo crudo es tóxico debido a los cristales de oxalato de calcio.",67],
+    ["p","atractylodes","raices-y-tuberculos-medicinales","- Atractylodes (Atractylodes macrocephala); tónico del bazo (mtc), diurético, digestivo, antidiaforético, inmunoestimulante; parte: Rizoma; dosis: 6-12 gramos en decocción.; precaución: En casos de sequedad o deficiencia de líquidos corporales.",61],
+    ["p","codonopsis","raices-y-tuberculos-medicinales","- Codonopsis (Codonopsis pilosula); adaptógeno, tónico de qi, inmunoestimulante, tónico pulmonar, galactagoga; parte: Raíz; dosis: 9-30 gramos en decocción.",39],
+    ["p","rehmannia","raices-y-tuberculos-medicinales","- Rehmannia (Rehmannia glutinosa); tónico de la sangre y del yin, antiinflamatoria, inmunomoduladora, neuroprotectora, regulador hormonal; parte: Raíz (preparada y cruda); dosis: 9-15 gramos en decocción.; precaución: Dificil de digerir, usar con precaución en personas con debilidad digestiva.",74],
+    ["p","peonia-blanca","raices-y-tuberculos-medicinales","- Peonía Blanca (Paeonia lactiflora); analgésica, antiespasmódica, antiinflamatoria, reguladora menstrual, hepatoprotectora; parte: Raíz; dosis: 6-15 gramos en decocción.; precaución: Usar con precaución.",51],
+    ["p","sarsaparrilla","raices-y-tuberculos-medicinales","- Zarzaparrilla (Smilax officinalis); depurativa, antiinflamatoria, antirreumática, diaforética, hepatoprotectora; parte: Raíz; dosis: 1-4 gramos de raíz seca en decocción, 3 veces al día.; precaución: Insuficiencia renal., No se recomienda su consumo.",63],
+    ["p","mandioca","raices-y-tuberculos-medicinales","- Mandioca (Manihot esculenta); nutritiva, energética, rica en carbohidratos, sin gluten, fuente de vitamina c; parte: Raíz tuberosa; dosis: Consumo como alimento, siempre cocida.; precaución: La variedad amarga contiene altos niveles de precursores de cianuro y debe ser procesada adecuadamente para eliminar la toxicidad.",81],
+    ["p","crosne","raices-y-tuberculos-medicinales","- Crosne (Stachys affinis); digestiva, nutritiva, ligeramente dulce, textura crujiente, baja en calorías; parte: Tubérculo; dosis: Consumo como alimento.",39],
+    ["p","eleuterococo","raices-y-tuberculos-medicinales","- Eleuterococo (Eleutherococcus senticosus); adaptógeno, inmunoestimulante, antifatiga, mejora el rendimiento físico y mental, tónico; parte: Raíz; dosis: 2-3 gramos de raíz seca al día.; precaución: No usar en personas con presión arterial por encima de 180/90 mmHg., No se recomienda su consumo.",75],
+    ["p","cimicifuga","raices-y-tuberculos-medicinales","- Cimicífuga (Actaea racemosa); regulador hormonal (estrogénico), antiespasmódico, antiinflamatorio, sedante, alivio de síntomas menopáusicos; parte: Rizoma y raíces; dosis: Extractos estandarizados (generalmente 40-80 mg al día).; precaución: Enfermedades hepáticas., No se recomienda su consumo.",75],
+    ["p","polygala","raices-y-tuberculos-medicinales","- Polygala (Polygala tenuifolia); expectorante, neuroprotectora, calmante, tónico cerebral, restaurador del shen (mtc); parte: Raíz; dosis: 3-9 gramos en decocción.; precaución: En casos de úlcera gástrica.",52],
+    ["p","rosa","flores-medicinales","- Rosa (Rosa gallica); astringente, antiinflamatoria, tónico para la piel, relajante; parte: Pétalos; dosis: Agua de rosas para uso tópico; infusión de 1-2 cucharaditas de pétalos secos.",47],
+    ["p","jazmin","flores-medicinales","- Jazmín (Jasminum officinale); relajante, sedante, antidepresivo, afrodisíaco; parte: Flores; dosis: Aceite esencial en aromaterapia; infusión de flores secas.; precaución: Evitar su uso en grandes cantidades durante el embarazo.",58],
+    ["p","hibisco","flores-medicinales","- Hibisco (Hibiscus sabdariffa); hipotensor, diurético, antioxidante, vitamínico; parte: Cálices de las flores; dosis: Infusión de 1-2 cucharaditas por taza, 2-3 veces al día.; precaución: Puede bajar demasiado la presión arterial en personas hipotensas., No se recomienda su consumo durante el embarazo.",76],
+    ["p","tilo-flor","flores-medicinales","- Tilo Flor (Tilia cordata); sedante, ansiolítico, antiespasmódico, diaforético; parte: Flores e inflorescencias; dosis: Infusión de 1-2 cucharaditas por taza, antes de dormir.",44],
+    ["p","azahar","flores-medicinales","- Azahar (Citrus aurantium); sedante, ansiolítico, hipnótico suave, antiespasmódico; parte: Flores; dosis: Infusión de 1 cucharadita por taza; agua de azahar en repostería o diluida.",46],
+    ["p","violeta","flores-medicinales","- Violeta (Viola odorata); expectorante, balsámica, sudorífica, antiinflamatoria; parte: Flores y hojas; dosis: Jarabe para la tos; infusión de 1 cucharadita de flores por taza.",45],
+    ["p","arnica","flores-medicinales","- Árnica (Arnica montana); antiinflamatoria, analgésica, antiequimótica (reduce moratones); parte: Flores; dosis: Uso estrictamente externo. Aplicar en forma de gel, crema o tintura diluida.; precaución: Planta tóxica si se ingiere. No aplicar sobre heridas abiertas.",67],
+    ["p","girasol","flores-medicinales","- Girasol (Helianthus annuus); febrífuga, expectorante, diurética; parte: Pétalos (lígulas) y semillas; dosis: Infusión de los pétalos para la fiebre. Semillas como alimento nutritivo.; precaución: Alergia a las semillas de girasol es común.",61],
+    ["p","clavel","flores-medicinales","- Clavel (Dianthus caryophyllus); tónico nervioso, antiespasmódico, cardiotónico suave; parte: Pétalos; dosis: Infusión de los pétalos para el agotamiento nervioso.",41],
+    ["p","crisantemo","flores-medicinales","- Crisantemo (Chrysanthemum morifolium); febrífugo, refrigerante, antihipertensivo, detoxificante (hígado); parte: Flores; dosis: Infusión de 5-10 flores por taza.; precaución: Puede causar alergia en personas sensibles a las compuestas.",60],
+    ["p","margarita","flores-medicinales","- Margarita (Bellis perennis); expectorante, diurética, cicatrizante, antiinflamatoria; parte: Flores y hojas; dosis: Infusión de 1-2 cucharaditas por taza; uso externo en compresas.",46],
+    ["p","loto","flores-medicinales","- Loto Sagrado (Nelumbo nucifera); astringente, febrífugo, tónico cardíaco, sedante; parte: Flores, semillas, rizoma; dosis: Infusión de flores o decocción de semillas/rizoma.",44],
+    ["p","pensamiento","flores-medicinales","- Pensamiento (Viola tricolor); depurativa, diurética, antiinflamatoria cutánea, expectorante; parte: Partes aéreas floridas; dosis: Infusión de 1-2 cucharaditas por taza, 2-3 veces al día.",48],
+    ["p","primavera","flores-medicinales","- Primavera (Primula veris); expectorante, secretolítica, balsámica, sedante suave; parte: Flores y raíz; dosis: Infusión de las flores (1 cucharadita/taza) para la tos y nervios. Decocción de la raíz como expectorante más potente.; precaución: Puede causar alergia en personas sensibles a las prímulas.",76],
+    ["p","zinnia","flores-medicinales","- Zinnia (Zinnia elegans); antifúngica, antibacteriana; parte: Flores y hojas; dosis: Uso tradicional en forma de emplastos o infusiones para lavados.",38],
+    ["p","dalia","flores-medicinales","- Dalia (Dahlia coccinea); hipoglucemiante, diurética, antimicrobiana; parte: Tubérculos y flores; dosis: Decocción de los tubérculos o infusión de los pétalos.",40],
+    ["p","geranio","flores-medicinales","- Geranio (Pelargonium graveolens); astringente, cicatrizante, hemostático, tónico nervioso; parte: Hojas y flores (para aceite esencial); dosis: Aceite esencial diluido para uso tópico en piel y hemorragias nasales leves.",56],
+    ["p","peonia","flores-medicinales","- Peonía (Paeonia lactiflora); analgésica, antiespasmódica, antiinflamatoria, reguladora hormonal (femenina); parte: Raíz (principalmente) y flores; dosis: Decocción de la raíz. Las flores se usan menos, en infusión.; precaución: Evitar durante el embarazo.",65],
+    ["p","verbena","flores-medicinales","- Verbena (Verbena officinalis); tónico nervioso, relajante, digestiva (amarga), galactagoga; parte: Sumidades floridas; dosis: Infusión de 1 cucharadita por taza.; precaución: Evitar en el primer trimestre del embarazo.",55],
+    ["p","yarrow","flores-medicinales","- Milenrama (Yarrow) (Achillea millefolium); hemostática, antiinflamatoria, antiespasmódica, cicatrizante; parte: Sumidades floridas; dosis: Infusión para uso interno o externo. Polvo de la planta seca sobre heridas.; precaución: No se recomienda su uso durante el embarazo., Alergia a la familia de las Asteráceas.",79],
+    ["p","clitoria","flores-medicinales","- Clitoria (Butterfly Pea) (Clitoria ternatea); nootrópica (mejora la memoria), ansiolítica, antidepresiva, antioxidante; parte: Flores; dosis: Infusión de 5-10 flores. El color azul intenso es característico.",53],
+    ["p","meliloto","flores-medicinales","- Meliloto (Melilotus officinalis); tónico venoso, anticoagulante, antiinflamatorio, sedante suave; parte: Sumidades floridas; dosis: Infusión de 1 cucharadita por taza. Uso externo en compresas para la circulación.; precaución: No combinar con otros anticoagulantes (Sintrom, heparina) sin estricto control médico.",79],
+    ["p","jazmin-amarillo","flores-medicinales","- Jazmín Amarillo (Gelsemium) (Gelsemium sempervirens); analgésico neural, sedante, antigripal; parte: Rizoma y raíces (uso homeopático); dosis: Planta altamente tóxica. Solo se usa en diluciones homeopáticas bajo prescripción.; precaución: VENENOSA. Su uso directo es mortal. Solo apta para preparación homeopática por profesionales.",84],
+    ["p","lirio-de-los-valles","flores-medicinales","- Lirio de los Valles (Muguete) (Convallaria majalis); cardiotónico, diurético; parte: Flores y hojas; dosis: Planta altamente tóxica. Su uso es exclusivamente farmacéutico para extraer glucósidos cardíacos.; precaución: VENENOSA. Causa parada cardíaca si se ingiere. No usar de forma casera bajo ningún concepto.",79],
+    ["p","digital","flores-medicinales","- Digital (Digitalis purpurea); cardiotónico; parte: Hojas; dosis: Planta altamente tóxica. De ella se extrae la digoxina, un fármaco de estrecho margen terapéutico.; precaución: VENENOSA. Su ingesta es mortal. Su uso es exclusivamente médico hospitalario.",64],
+    ["p","onagra","flores-medicinales","- Onagra (Oenothera biennis); regulador hormonal, antiinflamatorio, nutritivo para la piel; parte: Semillas (aceite); dosis: Perlas de aceite de onagra (500-1000 mg al día) según indicación.; precaución: Precaución en personas con epilepsia.",61],
+    ["p","cempasuchil","flores-medicinales","- Cempasúchil (Tagetes erecta); digestiva, antiespasmódica, antibacteriana, carotenoide (luteína); parte: Flores; dosis: Infusión de los pétalos para cólicos. Extracto de luteína para la salud ocular.",50],
+    ["p","centaurea-menor","flores-medicinales","- Centaurea Menor (Centaurium erythraea); tónico amargo, estimulante del apetito, febrífuga, colerética; parte: Sumidades floridas; dosis: Infusión de 0.5-1g por taza, 30 minutos antes de las comidas.; precaución: Evitar en caso de gastritis o úlcera péptica por el aumento de jugos gástricos.",74],
+    ["p","reishi","hongos-medicinales","- Reishi (Ganoderma lucidum); inmunomodulador, adaptógeno, antiinflamatorio, hepatoprotector; parte: Cuerpo fructífero; dosis: 1-3 gramos de extracto en polvo al día.; precaución: Puede interactuar con anticoagulantes e inmunosupresores., No se recomienda su uso antes de una cirugía.",71],
+    ["p","shiitake","hongos-medicinales","- Shiitake (Lentinula edodes); antiviral, reductor del colesterol, inmunomodulador; parte: Cuerpo fructífero; dosis: 6-16 gramos de hongo seco al día.; precaución: Puede causar dermatitis en personas sensibles.",53],
+    ["p","maitake","hongos-medicinales","- Maitake (Grifola frondosa); hipoglucemiante, inmunomodulador, antitumoral; parte: Cuerpo fructífero; dosis: 1-3 gramos de extracto al día.; precaución: Puede potenciar el efecto de medicamentos para la diabetes.",54],
+    ["p","cordyceps","hongos-medicinales","- Cordyceps (Cordyceps sinensis); energizante, mejora del rendimiento atlético, afrodisíaco; parte: Micelio y cuerpo fructífero; dosis: 1-3 gramos al día.; precaución: Puede empeorar enfermedades autoinmunes.",52],
+    ["p","melena-de-leon","hongos-medicinales","- Melena de León (Hericium erinaceus); neuroprotector, noótropo, regenerador nervioso; parte: Cuerpo fructífero; dosis: 1-3 gramos de extracto al día.",38],
+    ["p","chaga","hongos-medicinales","- Chaga (Inonotus obliquus); antioxidante, antiinflamatorio, antiviral; parte: Esclerocio (masa de micelio); dosis: 1-3 gramos de extracto al día.; precaución: Puede interactuar con anticoagulantes y medicamentos para la diabetes.",58],
+    ["p","cola-de-pavo","hongos-medicinales","- Cola de Pavo (Trametes versicolor); inmunomodulador, antitumoral, prebiótico; parte: Cuerpo fructífero; dosis: 1-3 gramos de extracto al día.",36],
+    ["p","agarikon","hongos-medicinales","- Agarikon (Fomitopsis officinalis); antiviral, antibacteriano, antiinflamatorio; parte: Cuerpo fructífero; dosis: 500mg-1g de extracto al día.",36],
+    ["p","tremella","hongos-medicinales","- Tremella (Tremella fuciformis); hidratante de la piel, antioxidante, neuroprotector; parte: Cuerpo fructífero; dosis: 1-3 gramos de extracto al día.",38],
+    ["p","poria-cocos","hongos-medicinales","- Poria Cocos (Wolfiporia extensa); diurético, calmante, inmunomodulador; parte: Esclerocio; dosis: 9-15 gramos en decocción.",32],
+    ["p","agaricus-blazei","hongos-medicinales","- Agaricus Blazei (Agaricus subrufescens); inmunomodulador, antitumoral, antialérgico; parte: Cuerpo fructífero; dosis: 1.5-3 gramos de extracto al día.",38],
+    ["p","enoki","hongos-medicinales","- Enoki (Flammulina velutipes); antitumoral, inmunomodulador, antioxidante; parte: Cuerpo fructífero; dosis: Consumo regular en la dieta.",35],
+    ["p","hongo-ostra","hongos-medicinales","- Hongo Ostra (Pleurotus ostreatus); reductor del colesterol, antioxidante, antiinflamatorio; parte: Cuerpo fructífero; dosis: Consumo regular en la dieta.",39],
+    ["p","polyporus-umbellatus","hongos-medicinales","- Polyporus Umbellatus (Polyporus umbellatus); diurético, inmunomodulador, hepatoprotector; parte: Esclerocio; dosis: 1-2 gramos de extracto al día.",37],
+    ["p","schizophyllum-commune","hongos-medicinales","- Schizophyllum Commune (Schizophyllum commune); antitumoral, inmunomodulador, antifúngico; parte: Cuerpo fructífero; dosis: Varía según la preparación.",38],
+    ["p","auricularia-auricula","hongos-medicinales","- Oreja de Judas (Auricularia auricula-judae); anticoagulante, reductor del colesterol, hidratante; parte: Cuerpo fructífero; dosis: Consumo regular en la dieta.; precaución: No consumir con anticoagulantes.",52],
+    ["p","coprinus-comatus","hongos-medicinales","- Coprinus Comatus (Coprinus comatus); hipoglucemiante, antioxidante, antitumoral; parte: Cuerpo fructífero joven; dosis: Consumo en la dieta o extracto.",39],
+    ["p","fomes-fomentarius","hongos-medicinales","- Hongo del Yesquero (Fomes fomentarius); antiinflamatorio, antibacteriano, hemostático; parte: Cuerpo fructífero; dosis: Uso tópico o en decocción.",37],
+    ["p","ganoderma-applanatum","hongos-medicinales","- Pipa (Ganoderma applanatum); antitumoral, antiinflamatorio, analgésico; parte: Cuerpo fructífero; dosis: 1-3 gramos de extracto al día.",35],
+    ["p","phellinus-linteus","hongos-medicinales","- Phellinus Linteus (Phellinus linteus); inmunomodulador, antitumoral, antiinflamatorio; parte: Cuerpo fructífero; dosis: 1-3 gramos de extracto al día.",38],
+    ["p","pleurotus-eryngii","hongos-medicinales","- Seta de Cardo (Pleurotus eryngii); reductor del colesterol, antioxidante, antiinflamatorio; parte: Cuerpo fructífero; dosis: Consumo regular en la dieta.",39],
+    ["p","sparassis-crispa","hongos-medicinales","- Hongo Coliflor (Sparassis crispa); inmunomodulador, antitumoral, cicatrizante; parte: Cuerpo fructífero; dosis: Consumo en la dieta o extracto.",37],
+    ["p","laetiporus-sulphureus","hongos-medicinales","- Pollo de los Bosques (Laetiporus sulphureus); antibacteriano, antioxidante, inmunomodulador; parte: Cuerpo fructífero joven; dosis: Consumo en la dieta.; precaución: Debe cocinarse bien; puede causar malestar gastrointestinal si está crudo o si crece en ciertos árboles.",68],
+    ["p","suillus-luteus","hongos-medicinales","- Boleto Anillado (Suillus luteus); antiinflamatorio, antioxidante, dermatológico; parte: Cuerpo fructífero; dosis: Consumo en la dieta.; precaución: La cutícula puede ser laxante o causar alergias en algunas personas.",55],
+    ["p","cantharellus-cibarius","hongos-medicinales","- Rebozuelo (Cantharellus cibarius); antioxidante, vitamínico (vit d y b), antimicrobiano; parte: Cuerpo fructífero; dosis: Consumo regular en la dieta.",38],
+    ["p","craterellus-cornucopioides","hongos-medicinales","- Trompeta de los Muertos (Craterellus cornucopioides); antioxidante, mineralizante, aromatizante; parte: Cuerpo fructífero; dosis: Consumo regular en la dieta.",40],
+    ["p","morchella-esculenta","hongos-medicinales","- Colmenilla (Morchella esculenta); antioxidante, inmunomodulador, antiinflamatorio; parte: Cuerpo fructífero; dosis: Consumo en la dieta, siempre cocinada.; precaución: Tóxica si se consume cruda.",50],
+    ["p","tuber-melanosporum","hongos-medicinales","- Trufa Negra (Tuber melanosporum); antioxidante, afrodisíaco, antiinflamatorio; parte: Cuerpo fructífero (ascocarpo); dosis: Pequeñas cantidades como condimento.",41],
+    ["p","boletus-edulis","hongos-medicinales","- Boletus Edulis (Boletus edulis); antitumoral, antioxidante, probiótico; parte: Cuerpo fructífero; dosis: Consumo regular en la dieta.",34],
+    ["p","ganoderma-lingzhi","hongos-medicinales","- Lingzhi (Ganoderma lingzhi); adaptógeno, neuroprotector, antioxidante; parte: Cuerpo fructífero; dosis: 1-2 gramos de extracto en polvo al día.; precaución: Puede interactuar con anticoagulantes.",50],
+    ["p","amanita-caesarea","hongos-medicinales","- Oronja (Amanita caesarea); nutritivo, antioxidante, vitamínico; parte: Cuerpo fructífero; dosis: Consumo en la dieta.; precaución: Requiere identificación experta para evitar confusión con amanitas tóxicas.",52],
+    ["p","espirulina","algas-y-plantas-acuaticas-medicinales","- Espirulina (Arthrospira platensis); nutritiva, antioxidante, antiinflamatoria, inmunomoduladora; parte: Toda la planta; dosis: 3-5 gramos al día; precaución: Personas con fenilcetonuria deben evitarla.",51],
+    ["p","chlorella","algas-y-plantas-acuaticas-medicinales","- Chlorella (Chlorella vulgaris); desintoxicante, rica en clorofila, apoyo inmunológico; parte: Toda la planta; dosis: 2-3 gramos al día; precaución: Puede causar reacciones alérgicas en personas sensibles.",52],
+    ["p","kelp","algas-y-plantas-acuaticas-medicinales","- Kelp (Laminaria spp.); rico en yodo, apoyo tiroideo, nutritivo; parte: Toda la planta; dosis: 600-1200 mg al día; precaución: No consumir en exceso por su alto contenido de yodo.",45],
+    ["p","wakame","algas-y-plantas-acuaticas-medicinales","- Wakame (Undaria pinnatifida); rico en fucoxantina, quema grasa, salud cardiovascular; parte: Hojas; dosis: 4-10 gramos al día; precaución: Consumir con moderación por su contenido de yodo.",48],
+    ["p","nori","algas-y-plantas-acuaticas-medicinales","- Nori (Porphyra spp.); rica en vitamina b12, salud ocular, antiviral; parte: Hojas secas; dosis: 2-3 hojas al día",29],
+    ["p","dulse","algas-y-plantas-acuaticas-medicinales","- Dulse (Palmaria palmata); rica en hierro, antioxidante, salud ósea; parte: Toda la planta; dosis: 5-10 gramos al día",30],
+    ["p","fucus","algas-y-plantas-acuaticas-medicinales","- Fucus (Fucus vesiculosus); estimulante metabólico, apoyo tiroideo, antiinflamatorio; parte: Talo; dosis: 500-1000 mg al día; precaución: No recomendado durante el embarazo y la lactancia., Puede afectar la presión arterial.",57],
+    ["p","agar-agar","algas-y-plantas-acuaticas-medicinales","- Agar-agar (Gelidium spp.); laxante suave, saciente, regulador intestinal; parte: Extracto gelatinoso; dosis: 4-16 gramos al día; precaución: Puede causar obstrucción intestinal si no se consume con suficiente líquido.",55],
+    ["p","musgo-de-irlanda","algas-y-plantas-acuaticas-medicinales","- Musgo de Irlanda (Chondrus crispus); expectorante, demulcente, nutritivo; parte: Toda la planta; dosis: 10-20 gramos de alga seca al día; precaución: Puede interferir con medicamentos anticoagulantes.",51],
+    ["p","kombu","algas-y-plantas-acuaticas-medicinales","- Kombu (Saccharina japonica); rica en glutamato, mejora la digestión de legumbres, fuente de yodo; parte: Toda la planta; dosis: Tiras pequeñas en cocciones; precaución: Moderar consumo por su alto contenido en yodo.",55],
+    ["p","arame","algas-y-plantas-acuaticas-medicinales","- Arame (Eisenia bicyclis); equilibrio hormonal, rica en calcio, salud capilar; parte: Hojas; dosis: 5-10 gramos (peso seco) por ración",34],
+    ["p","hijiki","algas-y-plantas-acuaticas-medicinales","- Hijiki (Sargassum fusiforme); rica en fibra, aporte de minerales, fortalece huesos y dientes; parte: Toda la planta; dosis: Consumo ocasional y moderado; precaución: Puede contener arsénico inorgánico, se recomienda un consumo muy limitado.",61],
+    ["p","lechuga-de-mar","algas-y-plantas-acuaticas-medicinales","- Lechuga de mar (Ulva lactuca); depurativa, rica en hierro y magnesio, antioxidante; parte: Hojas; dosis: Como guarnición o en ensaladas",35],
+    ["p","esparrago-de-mar","algas-y-plantas-acuaticas-medicinales","- Espárrago de mar (Salicornia europaea); diurética, rica en vitamina c, remineralizante; parte: Tallos tiernos; dosis: Como alimento, en raciones moderadas; precaución: Contiene sal de forma natural, moderar en caso de hipertensión.",59],
+    ["p","lenteja-de-agua","algas-y-plantas-acuaticas-medicinales","- Lenteja de agua (Lemna minor); alta en proteínas, depurativa de aguas, antiinflamatoria; parte: Toda la planta; dosis: Tradicionalmente usada en animales, no extendido en humanos; precaución: Debe ser recolectada de aguas no contaminadas.",60],
+    ["p","jacinto-de-agua","algas-y-plantas-acuaticas-medicinales","- Jacinto de agua (Eichhornia crassipes); fitorremediación, antiinflamatoria, cicatrizante; parte: Hojas y flores; dosis: Uso externo principalmente; precaución: Considerada una especie invasora, su uso interno no es común.",56],
+    ["p","nenufar-blanco","algas-y-plantas-acuaticas-medicinales","- Nenúfar blanco (Nymphaea alba); sedante, anaphrodisiaco, astringente; parte: Rizoma y flores; dosis: 1-2 gramos de rizoma seco en decocción; precaución: Evitar durante el embarazo.",46],
+    ["p","berro-de-agua","algas-y-plantas-acuaticas-medicinales","- Berro de agua (Nasturtium officinale); expectorante, diurético, rico en vitaminas a y c, depurativo; parte: Hojas y tallos; dosis: Consumo como alimento en ensaladas o jugos; precaución: No dar a niños menores de 4 años., Puede irritar el estómago si se consume en grandes cantidades.",72],
+    ["p","menta-acuatica","algas-y-plantas-acuaticas-medicinales","- Menta acuática (Mentha aquatica); digestiva, carminativa, antiespasmódica; parte: Hojas; dosis: 1-2 cucharaditas de hojas secas por taza de agua; precaución: Similar a otras mentas, evitar en caso de reflujo gastroesofágico severo.",59],
+    ["p","lirio-amarillo","algas-y-plantas-acuaticas-medicinales","- Lirio amarillo (Iris pseudacorus); astringente, vulnerario, emetico (en altas dosis); parte: Rizoma; dosis: Uso externo. Internamente es tóxico si no se maneja por un experto.; precaución: El rizoma fresco es muy irritante y tóxico si se ingiere.",62],
+    ["p","cola-de-caballo-de-agua","algas-y-plantas-acuaticas-medicinales","- Cola de caballo de agua (Equisetum fluviatile); diurética, remineralizante, astringente; parte: Tallos estériles; dosis: 2-4 gramos de planta seca en infusión, hasta 3 veces al día; precaución: No usar durante el embarazo o lactancia., Precaución con medicamentos para la diabetes o diuréticos.",74],
+    ["p","castana-de-agua","algas-y-plantas-acuaticas-medicinales","- Castaña de agua (Trapa natans); nutritiva, antiinflamatoria, antioxidante; parte: Fruto (nuez); dosis: Consumo como alimento",32],
+    ["p","aponogeton","algas-y-plantas-acuaticas-medicinales","- Aponogeton (Aponogeton distachyos); comestible, nutritiva, anti-escorbútica; parte: Flores y tubérculos; dosis: Consumo como alimento",34],
+    ["p","elodea","algas-y-plantas-acuaticas-medicinales","- Elodea (Elodea canadensis); oxigenante de agua, antiséptica, diurética; parte: Toda la planta; dosis: Uso tradicional limitado en humanos, principalmente externo; precaución: Fácilmente absorbe contaminantes del agua, usar solo de fuentes limpias.",63],
+    ["p","azolla","algas-y-plantas-acuaticas-medicinales","- Azolla (Azolla filiculoides); biofertilizante, alta en proteínas, fitorremediación; parte: Toda la planta; dosis: Principalmente para alimentación animal, no para consumo humano directo; precaución: No es una planta de consumo humano habitual.",62],
+    ["p","limón","frutas-citricas-medicinales","- Limón (Citrus limón); antioxidante, vitamina c, refuerza el sistema inmunológico; parte: Fruto completo; dosis: 1-2 frutos al día",33],
+    ["p","naranja","frutas-citricas-medicinales","- Naranja (Citrus naranja); antioxidante, vitamina c, refuerza el sistema inmunológico; parte: Fruto completo; dosis: 1-2 frutos al día",34],
+    ["p","toronja","frutas-citricas-medicinales","- Toronja (Citrus toronja); antioxidante, vitamina c, refuerza el sistema inmunológico; parte: Fruto completo; dosis: 1-2 frutos al día",34],
+    ["p","mandarina","frutas-citricas-medicinales","- Mandarina (Citrus mandarina); antioxidante, vitamina c, refuerza el sistema inmunológico; parte: Fruto completo; dosis: 1-2 frutos al día",35],
+    ["p","lima","frutas-citricas-medicinales","- Lima (Citrus lima); antioxidante, vitamina c, refuerza el sistema inmunológico; parte: Fruto completo; dosis: 1-2 frutos al día",33],
+    ["p","pomelo","frutas-citricas-medicinales","- Pomelo (Citrus pomelo); antioxidante, vitamina c, refuerza el sistema inmunológico; parte: Fruto completo; dosis: 1-2 frutos al día",34],
+    ["p","kumquat","frutas-citricas-medicinales","- Kumquat (Citrus kumquat); antioxidante, vitamina c, refuerza el sistema inmunológico; parte: Fruto completo; dosis: 1-2 frutos al día",34],
+    ["p","cidra","frutas-citricas-medicinales","- Cidra (Citrus cidra); antioxidante, vitamina c, refuerza el sistema inmunológico; parte: Fruto completo; dosis: 1-2 frutos al día",33],
+    ["p","yuzu","frutas-citricas-medicinales","- Yuzu (Citrus yuzu); antioxidante, vitamina c, refuerza el sistema inmunológico; parte: Fruto completo; dosis: 1-2 frutos al día",33],
+    ["p","calamondin","frutas-citricas-medicinales","- Calamondin (Citrus calamondin); antioxidante, vitamina c, refuerza el sistema inmunológico; parte: Fruto completo; dosis: 1-2 frutos al día",36],
+    ["p","tangelo","frutas-citricas-medicinales","- Tangelo (Citrus tangelo); antioxidante, vitamina c, refuerza el sistema inmunológico; parte: Fruto completo; dosis: 1-2 frutos al día",34],
+    ["p","ugli","frutas-citricas-medicinales","- Ugli (Citrus ugli); antioxidante, vitamina c, refuerza el sistema inmunológico; parte: Fruto completo; dosis: 1-2 frutos al día",33],
+    ["p","sweetie","frutas-citricas-medicinales","- Sweetie (Citrus sweetie); antioxidante, vitamina c, refuerza el sistema inmunológico; parte: Fruto completo; dosis: 1-2 frutos al día",34],
+    ["p","oroblanco","frutas-citricas-medicinales","- Oroblanco (Citrus oroblanco); antioxidante, vitamina c, refuerza el sistema inmunológico; parte: Fruto completo; dosis: 1-2 frutos al día",35],
+    ["p","melogold","frutas-citricas-medicinales","- Melogold (Citrus melogold); antioxidante, vitamina c, refuerza el sistema inmunológico; parte: Fruto completo; dosis: 1-2 frutos al día",35],
+    ["p","kaffir-lime","frutas-citricas-medicinales","- Kaffir Lime (Citrus kaffir lime); antioxidante, vitamina c, refuerza el sistema inmunológico; parte: Fruto completo; dosis: 1-2 frutos al día",36],
+    ["p","finger-lime","frutas-citricas-medicinales","- Finger Lime (Citrus finger lime); antioxidante, vitamina c, refuerza el sistema inmunológico; parte: Fruto completo; dosis: 1-2 frutos al día",36],
+    ["p","sudachi","frutas-citricas-medicinales","- Sudachi (Citrus sudachi); antioxidante, vitamina c, refuerza el sistema inmunológico; parte: Fruto completo; dosis: 1-2 frutos al día",34],
+    ["p","kabosu","frutas-citricas-medicinales","- Kabosu (Citrus kabosu); antioxidante, vitamina c, refuerza el sistema inmunológico; parte: Fruto completo; dosis: 1-2 frutos al día",34],
+    ["p","rangpur","frutas-citricas-medicinales","- Rangpur (Citrus rangpur); antioxidante, vitamina c, refuerza el sistema inmunológico; parte: Fruto completo; dosis: 1-2 frutos al día",34],
+    ["p","limequat","frutas-citricas-medicinales","- Limequat (Citrus limequat); antioxidante, vitamina c, refuerza el sistema inmunológico; parte: Fruto completo; dosis: 1-2 frutos al día",35],
+    ["p","citrange","frutas-citricas-medicinales","- Citrange (Citrus citrange); antioxidante, vitamina c, refuerza el sistema inmunológico; parte: Fruto completo; dosis: 1-2 frutos al día",35],
+    ["p","citrumelo","frutas-citricas-medicinales","- Citrumelo (Citrus citrumelo); antioxidante, vitamina c, refuerza el sistema inmunológico; parte: Fruto completo; dosis: 1-2 frutos al día",35],
+    ["p","faustrime","frutas-citricas-medicinales","- Faustrime (Citrus faustrime); antioxidante, vitamina c, refuerza el sistema inmunológico; parte: Fruto completo; dosis: 1-2 frutos al día",35],
+    ["p","caimito","frutas-tropicales-medicinales","- Caimito (Chrysophyllum cainito); antioxidante, antiinflamatorio, control de la diabetes, refuerza el sistema inmunitario, salud digestiva, producción de colágeno; parte: Fruto, hojas y corteza; dosis: Consumir 1-2 frutos. La decocción de la corteza se usa para la diarrea.",69],
+    ["p","papaya","frutas-tropicales-medicinales","- Papaya (Carica papaya); digestiva, antiinflamatoria, cicatrizante, refuerza el sistema inmunitario, antioxidante, diurética; parte: Fruto, semillas y hojas; dosis: Consumir 1 rodaja al día. Infusión de hojas: 1 taza al día.; precaución: El consumo de la fruta verde o sus semillas puede no ser seguro., Puede causar alergia en personas sensibles al látex.",90],
+    ["p","pina","frutas-tropicales-medicinales","- Piña (Ananas comosus); digestiva, antiinflamatoria, diurética, refuerza el sistema inmunitario, anticoagulante, cicatrizante; parte: Fruto; dosis: Consumir 1-2 rodajas al día; precaución: Puede causar reacciones alérgicas en personas sensibles., El consumo excesivo puede irritar la boca y el estómago.",76],
+    ["p","mango","frutas-tropicales-medicinales","- Mango (Mangifera indica); antioxidante, refuerza el sistema inmunitario, mejora la salud ocular, favorece la digestión, beneficioso para la piel; parte: Fruto, hojas y corteza; dosis: Consumir 1 pieza de fruta al día; precaución: Puede causar dermatitis de contacto en personas sensibles.",73],
+    ["p","guayaba","frutas-tropicales-medicinales","- Guayaba (Psidium guajava); astringente, antidiarreica, antioxidante, reduce el colesterol, controla la diabetes, refuerza el sistema inmunitario; parte: Fruto y hojas; dosis: Consumir 1-2 frutos al día. Infusión de hojas: 2 tazas al día.; precaución: El consumo excesivo de hojas puede causar estreñimiento.",78],
+    ["p","maracuya","frutas-tropicales-medicinales","- Maracuyá (Passiflora edulis); sedante, ansiolítica, relajante muscular, antioxidante, reduce la presión arterial; parte: Fruto y hojas; dosis: Consumir el jugo de 1-2 frutos al día. Infusión de hojas: 1 taza antes de dormir.; precaución: Puede potenciar el efecto de medicamentos sedantes.",73],
+    ["p","carambola","frutas-tropicales-medicinales","- Carambola (Averrhoa carambola); antioxidante, antiinflamatoria, control del azúcar en sangre, favorece el tránsito intestinal, refuerza el sistema inmunitario, beneficiosa para la salud del corazón; parte: Fruto, hojas y flores; dosis: Consumir 1-2 frutos al día; precaución: No recomendada para personas con insuficiencia renal crónica por su alto contenido de oxalatos.",94],
+    ["p","pitahaya","frutas-tropicales-medicinales","- Pitahaya (Hylocereus undatus); antioxidante, antiinflamatoria, favorece la pérdida de peso, fortalece los huesos, mejora la digestión, refuerza el sistema inmunitario; parte: Fruto; dosis: Consumir 1-2 frutos al día",55],
+    ["p","lichi","frutas-tropicales-medicinales","- Lichi (Litchi chinensis); antioxidante, refuerza el sistema inmunitario, antiinflamatorio, mejora la circulación, protege el corazón; parte: Fruto; dosis: Consumir un puñado (10-12 frutos) al día; precaución: Consumir con moderación por su contenido de azúcar.",66],
+    ["p","rambutan","frutas-tropicales-medicinales","- Rambután (Nephelium lappaceum); antiparasitario, antioxidante, refuerza el sistema inmunitario, fuente de energía, mejora la salud ósea; parte: Fruto, semillas y cáscara; dosis: Consumir 5-6 frutos al día; precaución: Las semillas crudas son tóxicas y no deben consumirse.",69],
+    ["p","durian","frutas-tropicales-medicinales","- Durián (Durio zibethinus); fuente de energía, antidepresivo natural, afrodisíaco, favorece el sueño, regula la presión arterial; parte: Fruto; dosis: Consumir con moderación debido a su alta densidad calórica.; precaución: No consumir con alcohol, puede causar reacciones adversas severas., Consumir con precaución por su alto contenido de potasio.",88],
+    ["p","tamarindo","frutas-tropicales-medicinales","- Tamarindo (Tamarindus indica); laxante suave, antiinflamatorio, antiséptico, reduce la fiebre, protector hepático; parte: Pulpa del fruto, hojas y corteza; dosis: Pulpa: 10-20 gramos al día. Infusión de hojas: 1-2 tazas.; precaución: Puede interactuar con medicamentos para la diabetes y anticoagulantes.",77],
+    ["p","coco","frutas-tropicales-medicinales","- Coco (Cocos nucifera); hidratante, antibacteriano, antiviral, fuente de electrolitos, mejora la salud cerebral; parte: Agua, pulpa (carne) y aceite; dosis: Agua de coco: 1-2 vasos al día. Aceite: 1-2 cucharadas al día.; precaución: Aunque es raro, puede causar alergias.",68],
+    ["p","guanabana","frutas-tropicales-medicinales","- Guanábana (Annona muricata); anticancerígena (potencial), antiparasitaria, antiinflamatoria, sedante, hipotensora; parte: Fruto, hojas y semillas; dosis: Consumir 1 porción de fruta al día. Infusión de hojas: 1 taza al día.; precaución: No se recomienda el consumo de suplementos o infusiones., Puede potenciar medicamentos para la presión arterial y la diabetes.",92],
+    ["p","kiwi","frutas-tropicales-medicinales","- Kiwi (Actinidia deliciosa); laxante, refuerza el sistema inmunitario, antioxidante, mejora la salud respiratoria, ayuda a dormir; parte: Fruto; dosis: Consumir 1-2 kiwis al día; precaución: Puede causar alergia, especialmente en personas alérgicas al látex o al polen.",68],
+    ["p","granada","frutas-tropicales-medicinales","- Granada (Punica granatum); antioxidante potente, antiinflamatoria, protector cardiovascular, anticancerígena (potencial), mejora la memoria; parte: Arilos (semillas cubiertas de pulpa), cáscara y jugo; dosis: Jugo: 1 vaso al día. Consumir los arilos de media granada.",68],
+    ["p","higo","frutas-tropicales-medicinales","- Higo (Ficus carica); laxante, expectorante, demulcente (suavizante de mucosas), nutritivo, remineralizante; parte: Fruto (fresco o seco); dosis: Consumir 2-4 higos frescos o secos al día.; precaución: Los higos secos tienen una alta concentración de azúcar.",65],
+    ["p","chirimoya","frutas-tropicales-medicinales","- Chirimoya (Annona cherimola); relajante, antidepresiva, regula la presión arterial, digestiva, antioxidante; parte: Fruto; dosis: Consumir 1 pieza de fruta; precaución: Las semillas son tóxicas y no deben ser ingeridas.",56],
+    ["p","lucuma","frutas-tropicales-medicinales","- Lúcuma (Pouteria lucuma); endulzante natural de bajo índice glucémico, antioxidante, antiinflamatoria, regeneradora de la piel, refuerza el sistema inmunitario; parte: Fruto (generalmente en polvo); dosis: 1-2 cucharadas de polvo de lúcuma al día.",63],
+    ["p","zapote","frutas-tropicales-medicinales","- Zapote (Pouteria sapota); nutritivo, antioxidante, mejora la visión, salud digestiva, fuente de energía; parte: Fruto; dosis: Consumir con moderación",38],
+    ["p","mamey","frutas-tropicales-medicinales","- Mamey (Mammea americana); antiparasitario, insecticida (semilla), cicatrizante, digestivo, antioxidante; parte: Fruto, aceite de la semilla; dosis: Consumo moderado del fruto.; precaución: La semilla es tóxica si se ingiere.",57],
+    ["p","araza","frutas-tropicales-medicinales","- Arazá (Eugenia stipitata); antioxidante, vitamina c, diurético, salud hepática, control del colesterol; parte: Fruto; dosis: Consumo en jugos o postres",39],
+    ["p","borojo","frutas-tropicales-medicinales","- Borojó (Borojoa patinoi); energizante, afrodisíaco, nutritivo, regulador hormonal, cicatrizante; parte: Fruto; dosis: Consumo en jugos o pulpa",36],
+    ["p","camu-camu","frutas-tropicales-medicinales","- Camu Camu (Myrciaria dubia); vitamina c (muy alta), antioxidante, antiinflamatorio, antiviral, refuerza el sistema inmunitario; parte: Fruto (generalmente en polvo o jugo); dosis: 1 cucharadita de polvo al día.",53],
+    ["p","copoazu","frutas-tropicales-medicinales","- Copoazú (Theobroma grandiflorum); estimulante (sin cafeína), antioxidante, hidratante para la piel, salud cardiovascular, nutritivo; parte: Pulpa y semillas (manteca); dosis: Consumo de la pulpa en postres o bebidas.",55],
+    ["p","feijoa","frutas-tropicales-medicinales","- Feijoa (Acca sellowiana); antioxidante, digestiva, refuerza el sistema inmunitario, salud tiroidea (por yodo), antiinflamatoria; parte: Fruto; dosis: Consumir 2-3 frutos al día",45],
+    ["p","jabuticaba","frutas-tropicales-medicinales","- Jabuticaba (Myrciaria cauliflora); antioxidante, antiinflamatoria, anticancerígena (potencial), antienvejecimiento, astringente; parte: Fruto y cáscara; dosis: Consumir un puñado de frutos",48],
+    ["p","macambo","frutas-tropicales-medicinales","- Macambo (Theobroma bicolor); nutritivo, fuente de proteína y fibra, salud cerebral, energizante, mejora el humor; parte: Semillas; dosis: Consumir las semillas tostadas como snack.",46],
+    ["p","pomarrosa","frutas-tropicales-medicinales","- Pomarrosa (Syzygium jambos); antidiabética (semillas), antimicrobiana, diurética, digestiva, reduce la fiebre; parte: Fruto, hojas, corteza y semillas; dosis: Consumo moderado del fruto. Decocción de hojas o semillas.; precaución: Las semillas crudas pueden ser tóxicas.",68],
+    ["p","tomatillo","frutas-tropicales-medicinales","- Tomatillo (Physalis philadelphica); antioxidante, antibacteriano, salud ocular, control de la diabetes, antiinflamatorio; parte: Fruto; dosis: Incorporar en salsas y platillos",45],
+    ["p","tamarillo","frutas-tropicales-medicinales","- Tamarillo (Solanum betaceum); salud ocular, antioxidante, control de la presión arterial, mejora la digestión, bajo en calorías; parte: Fruto; dosis: Consumir 1-2 frutos al día",45],
+    ["p","lima-kaffir","frutas-tropicales-medicinales","- Lima Kaffir (Citrus hystrix); antiinflamatorio, salud bucal, detoxificante sanguíneo, estimulante digestivo, repelente de insectos; parte: Hojas y fruto (cáscara y jugo); dosis: Usar las hojas o la cáscara como condimento.",56],
+    ["p","anon","frutas-tropicales-medicinales","- Anón (Annona squamosa); digestivo, salud ocular, control de la presión arterial, salud de la piel, antioxidante; parte: Fruto; dosis: Consumir 1 fruto; precaución: Las semillas son tóxicas.",48],
+    ["p","yaca","frutas-tropicales-medicinales","- Yaca (Artocarpus heterophyllus); nutritiva, salud digestiva, refuerza el sistema inmunitario, salud ocular, control del azúcar en sangre; parte: Fruto (bulbos y semillas); dosis: Consumo moderado",50],
+    ["p","banana-roja","frutas-tropicales-medicinales","- Banana Roja (Musa acuminata 'Red Dacca'); rica en potasio, fuente de vitamina c y b6, antioxidante (rica en carotenoides), mejora la digestión, energizante; parte: Fruto; dosis: Consumir 1-2 bananas al día",52],
+    ["p","frutipan","frutas-tropicales-medicinales","- Frutipán (Artocarpus altilis); fuente de carbohidratos complejos, salud cardiovascular, rico en fibra, energizante, salud ósea; parte: Fruto; dosis: Consumir como parte de las comidas",47],
+    ["p","fruta-hala","frutas-tropicales-medicinales","- Fruta Hala (Pandanus tectorius); laxante, salud bucal, alivia dolores de cabeza, diurético, fuente de vitamina c; parte: Fruto, hojas y raíces; dosis: Consumo moderado del fruto",45],
+    ["p","acerola","frutas-tropicales-medicinales","- Acerola (Malpighia emarginata); extremadamente rica en vitamina c, antioxidante, refuerza el sistema inmunitario, antienvejecimiento, salud ocular; parte: Fruto; dosis: Unos pocos frutos cubren las necesidades diarias de Vitamina C.; precaución: Dosis muy altas pueden causar malestar estomacal.",75],
+    ["p","manzana","frutas-clima-templado-medicinales","- Manzana (Malus domestica); antioxidante, regulador intestinal, hipocolesterolemiante, diurética; parte: Fruto completo, piel; dosis: 1-2 manzanas al día; precaución: El consumo excesivo puede causar gases en personas sensibles.",58],
+    ["p","pera","frutas-clima-templado-medicinales","- Pera (Pyrus communis); diurética, astringente (cocida), laxante (cruda), remineralizante; parte: Fruto completo; dosis: 1-2 peras al día; precaución: Consumir con moderación debido a su contenido de azúcares naturales.",55],
+    ["p","durazno","frutas-clima-templado-medicinales","- Durazno (Prunus persica); laxante suave, diurético, antioxidante, hidratante; parte: Fruto completo, hojas (infusión); dosis: 2-3 duraznos al día; precaución: Personas alérgicas a la familia Rosaceae.",51],
+    ["p","ciruela","frutas-clima-templado-medicinales","- Ciruela (Prunus domestica); laxante potente, antioxidante, energizante, remineralizante; parte: Fruto completo (fresco o seco); dosis: 3-5 ciruelas secas o 5-8 frescas al día; precaución: El consumo excesivo puede causar diarrea y flatulencias.",62],
+    ["p","cereza","frutas-clima-templado-medicinales","- Cereza (Prunus avium); antiinflamatoria, diurética, antigota, antioxidante; parte: Fruto completo, pedúnculos (rabos); dosis: Un puñado de cerezas al día. Infusión de 10g de pedúnculos por taza.; precaución: Consumir con moderación en caso de cálculos renales (por oxalatos).",70],
+    ["p","albaricoque","frutas-clima-templado-medicinales","- Albaricoque (Prunus armeniaca); laxante suave, vitamínico (provitamina a), antianémico, antioxidante; parte: Fruto completo (fresco o seco); dosis: 3-5 albaricoques frescos o 3 secos (orejones) al día; precaución: Las semillas contienen amigdalina y son tóxicas en grandes cantidades.",72],
+    ["p","membrillo","frutas-clima-templado-medicinales","- Membrillo (Cydonia oblonga); astringente, antidiarreico, demulcente, antiinflamatorio intestinal; parte: Fruto (pulpa y semillas); dosis: Consumo de pulpa cocida (dulce o jalea); precaución: El fruto crudo es muy astringente y difícil de digerir.",62],
+    ["p","uva","frutas-clima-templado-medicinales","- Uva (Vitis vinifera); antioxidante (resveratrol), cardioprotectora, diurética, depurativa; parte: Fruto completo, hojas (infusión); dosis: Un racimo de uvas al día; precaución: Alto contenido de azúcar, consumir con moderación.",58],
+    ["p","frambuesa","frutas-clima-templado-medicinales","- Frambuesa (Rubus idaeus); antioxidante, antiinflamatoria, reguladora hormonal (hojas), astringente (hojas); parte: Fruto, hojas (infusión); dosis: Un puñado de frambuesas al día. Infusión de 1-2 cucharaditas de hojas secas por taza.; precaución: La infusión de hojas de frambuesa se usa para preparar el parto, pero debe consultarse con un profesional.",89],
+    ["p","fresa","frutas-clima-templado-medicinales","- Fresa (Fragaria vesca); diurética, antioxidante, antiinflamatoria, remineralizante; parte: Fruto, hojas (infusión); dosis: Un puñado de fresas al día; precaución: Puede causar urticaria en personas sensibles.",53],
+    ["p","mora","frutas-clima-templado-medicinales","- Mora (Rubus fruticosus); antioxidante, astringente (fruto verde), laxante (fruto maduro), antiinflamatoria; parte: Fruto, hojas (infusión); dosis: Un puñado de moras al día; precaución: El consumo excesivo puede teñir las heces de oscuro.",60],
+    ["p","grosella","frutas-clima-templado-medicinales","- Grosella (Ribes rubrum); vitamínico (vitamina c), diurética, astringente, antioxidante; parte: Fruto; dosis: Un puñado de grosellas al día; precaución: Sabor muy ácido, puede no ser bien tolerado por estómagos sensibles.",56],
+    ["p","zarzamora","frutas-clima-templado-medicinales","- Zarzamora (Rubus ulmifolius); antioxidante, astringente (hojas y fruto verde), antiinflamatoria, vitamínico; parte: Fruto, hojas (infusión); dosis: Un puñado de zarzamoras al día. Infusión de 1-2 cucharaditas de hojas secas por taza.; precaución: El consumo excesivo puede teñir las heces de oscuro.",76],
+    ["p","nectarina","frutas-clima-templado-medicinales","- Nectarina (Prunus persica var. nucipersica); laxante suave, diurética, antioxidante, hidratante; parte: Fruto completo; dosis: 2-3 nectarinas al día; precaución: Personas alérgicas a la familia Rosaceae.",52],
+    ["p","paraguayo","frutas-clima-templado-medicinales","- Paraguayo (Prunus persica var. platycarpa); laxante suave, diurético, antioxidante, hidratante; parte: Fruto completo; dosis: 2-3 paraguayos al día; precaución: Personas alérgicas a la familia Rosaceae.",51],
+    ["p","nispero","frutas-clima-templado-medicinales","- Níspero (Eriobotrya japonica); astringente, antidiarreico, diurético, expectorante (semillas); parte: Fruto, semillas (con precaución); dosis: Un puñado de nísperos al día; precaución: Las semillas contienen pequeñas cantidades de cianuro y deben usarse con precaución y conocimiento.",72],
+    ["p","caqui","frutas-clima-templado-medicinales","- Caqui (Diospyros kaki); laxante (maduro), astringente (inmaduro), vitamínico (vitamina a), antioxidante; parte: Fruto completo; dosis: 1-2 caquis al día; precaución: El caqui inmaduro es muy astringente y puede causar obstrucción intestinal en casos raros.",65],
+    ["p","avellana","frutas-clima-templado-medicinales","- Avellana (Corylus avellana); nutritiva, cardioprotectora, antioxidante (vitamina e), remineralizante; parte: Fruto (semilla); dosis: Un puñado de avellanas al día; precaución: Alergia a los frutos secos.",52],
+    ["p","azarolo","frutas-clima-templado-medicinales","- Azarolo (Crataegus azarolus); cardiotónico, hipotensor, antioxidante, sedante suave; parte: Fruto, flores, hojas; dosis: Infusión de 1-2 cucharaditas de flores y hojas por taza.; precaución: Puede potenciar el efecto de medicamentos para el corazón.",63],
+    ["p","endrina","frutas-clima-templado-medicinales","- Endrina (Prunus spinosa); astringente, tónico digestivo, antioxidante, vitamínico; parte: Fruto; dosis: Consumo moderado del fruto maduro. Maceración en licor (pacharán).; precaución: El fruto crudo es muy astringente y áspero.",58],
+    ["p","grosella-espinosa","frutas-clima-templado-medicinales","- Grosella espinosa (Ribes uva-crispa); vitamínico (vitamina c), antioxidante, diurética, laxante suave; parte: Fruto; dosis: Un puñado de grosellas espinosas al día; precaución: Sabor ácido, puede no ser bien tolerado por estómagos sensibles.",61],
+    ["p","grosella-negra","frutas-clima-templado-medicinales","- Grosella negra (Ribes nigrum); antiinflamatoria, antialérgica, vitamínico (vitamina c), diurética; parte: Fruto, hojas (infusión); dosis: Un puñado de grosellas negras al día. Infusión de 1-2 cucharaditas de hojas secas por taza.; precaución: Puede interactuar con anticoagulantes.",71],
+    ["p","grosella-roja","frutas-clima-templado-medicinales","- Grosella roja (Ribes rubrum); vitamínico (vitamina c), diurética, astringente, antioxidante; parte: Fruto; dosis: Un puñado de grosellas al día; precaución: Sabor muy ácido, puede no ser bien tolerado por estómagos sensibles.",57],
+    ["p","nashi","frutas-clima-templado-medicinales","- Nashi (Pyrus pyrifolia); diurética, expectorante, hidratante, laxante suave; parte: Fruto completo; dosis: 1-2 nashis al día",32],
+    ["p","uva-espina","frutas-clima-templado-medicinales","- Uva espina (Ribes uva-crispa); vitamínico (vitamina c), antioxidante, diurética, laxante suave; parte: Fruto; dosis: Un puñado de uvas espina al día; precaución: Sabor ácido, puede no ser bien tolerado por estómagos sensibles.",57],
+    ["p","serba","frutas-clima-templado-medicinales","- Serba (Sorbus domestica); astringente, antidiarreico, vitamínico, remineralizante; parte: Fruto (muy maduro); dosis: Consumo moderado del fruto muy maduro; precaución: El fruto inmaduro es extremadamente astringente y no debe consumirse.",60],
+    ["p","endrino","bayas-y-frutos-del-bosque-medicinales","- Endrino (Prunus spinosa); astringente, antidiarreico, antioxidante, cicatrizante; parte: Fruto; dosis: 1 cucharada de frutos en decocción por taza.; precaución: La semilla puede ser tóxica en grandes dosis.",52],
+    ["p","cornejo","bayas-y-frutos-del-bosque-medicinales","- Cornejo (Cornus mas); astringente, antipirético, tónico; parte: Fruto; dosis: Consumo moderado.",25],
+    ["p","espino-amarillo","bayas-y-frutos-del-bosque-medicinales","- Espino amarillo (Hippophae rhamnoides); vitamínico, antioxidante, cicatrizante, inmunoestimulante; parte: Fruto; dosis: 1-2 cucharaditas de aceite o un puñado de bayas.",43],
+    ["p","baya-de-goji","bayas-y-frutos-del-bosque-medicinales","- Baya de Goji (Lycium barbarum); antioxidante, inmunoestimulante, hepatoprotector, adaptógeno; parte: Fruto; dosis: 10-30 gramos de bayas secas al día.; precaución: Puede interactuar con anticoagulantes y medicamentos para la diabetes.",59],
+    ["p","baya-de-acai","bayas-y-frutos-del-bosque-medicinales","- Baya de Açaí (Euterpe oleracea); antioxidante, energizante, antiinflamatoria; parte: Fruto; dosis: 1-2 cucharadas de pulpa o polvo al día.",35],
+    ["p","uva-ursi","bayas-y-frutos-del-bosque-medicinales","- Uva de oso (Arctostaphylos uva-ursi); antiséptico urinario, astringente, diurético; parte: Hojas y bayas; dosis: Infusión de hojas, 1-2 tazas al día (no más de una semana).; precaución: No usar durante el embarazo o lactancia., No recomendado para niños.",64],
+    ["p","baya-de-maqui","bayas-y-frutos-del-bosque-medicinales","- Baya de Maqui (Aristotelia chilensis); antioxidante, antiinflamatoria, regulador de glucosa; parte: Fruto; dosis: 1-2 cucharaditas de polvo al día.",38],
+    ["p","baya-del-espino","bayas-y-frutos-del-bosque-medicinales","- Baya del Espino (Crataegus monogyna); cardiotónica, hipotensora, sedante, antioxidante; parte: Bayas, flores y hojas; dosis: 1-2 tazas de infusión al día.; precaución: Puede potenciar el efecto de medicamentos para el corazón y la hipertensión.",62],
+    ["p","serbal-de-cazadores","bayas-y-frutos-del-bosque-medicinales","- Serbal de los cazadores (Sorbus aucuparia); astringente, diurética, vitamínica (vitamina c); parte: Fruto (cocido); dosis: Consumo moderado en mermeladas o jaleas.; precaución: Los frutos crudos son tóxicos y pueden causar problemas digestivos.",62],
+    ["p","casis","bayas-y-frutos-del-bosque-medicinales","- Casis (Ribes nigrum); antiinflamatorio, antialérgico, diurético, vitamínico; parte: Fruto y hojas; dosis: Un puñado de frutos o 1-2 tazas de infusión de hojas.",41],
+    ["p","uva-de-california","bayas-y-frutos-del-bosque-medicinales","- Uva de California (Mahonia aquifolium); hepatoprotectora, antimicrobiana, antiinflamatoria (piel); parte: Raíz y bayas; dosis: Uso tópico de la raíz; consumo moderado de bayas.; precaución: No usar la raíz durante el embarazo.",57],
+    ["p","baya-de-agracejo","bayas-y-frutos-del-bosque-medicinales","- Baya de Agracejo (Berberis vulgaris); hepatoprotectora, hipoglucemiante, antimicrobiana; parte: Bayas y corteza de la raíz; dosis: Consumo moderado de bayas; la corteza bajo supervisión.; precaución: No usar la corteza durante el embarazo.",61],
+    ["p","murtilla","bayas-y-frutos-del-bosque-medicinales","- Murtilla (Ugni molinae); antioxidante, antiinflamatoria, astringente; parte: Fruto; dosis: Consumo libre.",27],
+    ["p","calafate","bayas-y-frutos-del-bosque-medicinales","- Calafate (Berberis microphylla); antioxidante, antimicrobiana, astringente; parte: Fruto; dosis: Consumo libre.",29],
+    ["p","boysenberry","bayas-y-frutos-del-bosque-medicinales","- Boysenberry (Rubus ursinus × idaeus); antioxidante, vitamínica, fibra; parte: Fruto; dosis: Un puñado al día.",28],
+    ["p","loganberry","bayas-y-frutos-del-bosque-medicinales","- Loganberry (Rubus × loganobaccus); vitamínica (c y k), manganeso, fibra; parte: Fruto; dosis: Un puñado al día.",29],
+    ["p","tayberry","bayas-y-frutos-del-bosque-medicinales","- Tayberry (Rubus fruticosus x R. idaeus); antioxidante, vitamina c, fibra; parte: Fruto; dosis: Un puñado al día.",29],
+    ["p","lingonberry","bayas-y-frutos-del-bosque-medicinales","- Lingonberry (Vaccinium vitis-idaea); antioxidante, antiinflamatoria, manganeso; parte: Fruto; dosis: Consumo moderado.",30],
+    ["p","huckleberry","bayas-y-frutos-del-bosque-medicinales","- Huckleberry (Vaccinium parvifolium); antioxidante, vitamínica (a, b, c), hierro; parte: Fruto; dosis: Un puñado al día.",31],
+    ["p","linaza","semillas-y-frutos-secos-medicinales","- Linaza (Linum usitatissimum); antiinflamatoria, digestiva, antioxidante, hipocolesterolemiante; parte: Semillas; dosis: 1-2 cucharadas al día; precaución: Puede causar obstrucción intestinal si no se consume con suficiente líquido.",59],
+    ["p","chia","semillas-y-frutos-secos-medicinales","- Chía (Salvia hispanica); hidratante, antioxidante, energizante, digestiva; parte: Semillas; dosis: 1-2 cucharadas al día; precaución: Puede bajar la presión arterial, precaución en personas con hipotensión.",52],
+    ["p","canamo","semillas-y-frutos-secos-medicinales","- Cáñamo (Cannabis sativa); antiinflamatoria, nutritiva, analgésica; parte: Semillas; dosis: 1-3 cucharadas al día; precaución: Las semillas de cáñamo no contienen THC en cantidades significativas, pero se recomienda precaución en personas con alergias a frutos secos.",67],
+    ["p","calabaza-semillas","semillas-y-frutos-secos-medicinales","- Semillas de Calabaza (Cucurbita pepo); antiparasitaria, prostática, nutritiva; parte: Semillas; dosis: Un puñado (20-30g) al día; precaución: Puede causar alergia en personas sensibles a las cucurbitáceas.",52],
+    ["p","girasol-semillas","semillas-y-frutos-secos-medicinales","- Semillas de Girasol (Helianthus annuus); antioxidante, antiinflamatoria, nutritiva; parte: Semillas; dosis: Un puñado (20-30g) al día; precaución: Puede causar reacciones alérgicas en personas sensibles.",52],
+    ["p","sesamo","semillas-y-frutos-secos-medicinales","- Sésamo (Sesamum indicum); antioxidante, remineralizante, neuroprotectora; parte: Semillas; dosis: 1-2 cucharadas al día; precaución: El sésamo es un alérgeno común.",42],
+    ["p","almendra","semillas-y-frutos-secos-medicinales","- Almendra (Prunus dulcis); nutritiva, hipocolesterolemiante, antioxidante; parte: Fruto (semilla); dosis: Un puñado (20-30g) al día; precaución: Las almendras son un alérgeno común de los frutos secos.",51],
+    ["p","nuez","semillas-y-frutos-secos-medicinales","- Nuez (Juglans regia); neuroprotectora, cardioprotectora, antiinflamatoria; parte: Fruto (semilla); dosis: Un puñado (20-30g) al día; precaución: Las nueces son un alérgeno común de los frutos secos.",50],
+    ["p","castana","semillas-y-frutos-secos-medicinales","- Castaña (Castanea sativa); energizante, digestiva, astringente; parte: Fruto; dosis: 3-5 castañas al día; precaución: Tienen un índice glucémico más alto que otros frutos secos, consumir con moderación.",51],
+    ["p","pistacho","semillas-y-frutos-secos-medicinales","- Pistacho (Pistacia vera); antioxidante, cardioprotectora, salud ocular; parte: Fruto (semilla); dosis: Un puñado (30-40g) al día; precaución: Los pistachos son un alérgeno común de los frutos secos.",50],
+    ["p","nuez-de-brasil","semillas-y-frutos-secos-medicinales","- Nuez de Brasil (Bertholletia excelsa); antioxidante, tiroidea, antiinflamatoria; parte: Fruto (semilla); dosis: 1-2 nueces al día; precaución: El consumo excesivo puede llevar a toxicidad por selenio (selenosis).",54],
+    ["p","nuez-pecana","semillas-y-frutos-secos-medicinales","- Nuez Pecana (Carya illinoinensis); antioxidante, hipocolesterolemiante, antiinflamatoria; parte: Fruto (semilla); dosis: Un puñado (20-30g) al día; precaución: Las nueces pecanas son un alérgeno de los frutos secos.",55],
+    ["p","anacardo","semillas-y-frutos-secos-medicinales","- Anacardo (Anacardium occidentale); energizante, remineralizante, salud ósea; parte: Fruto (semilla); dosis: Un puñado (20-30g) al día; precaución: Los anacardos son un alérgeno común de los frutos secos.",52],
+    ["p","pinon","semillas-y-frutos-secos-medicinales","- Piñón (Pinus pinea); energizante, saciante, salud ocular; parte: Semilla; dosis: 1-2 cucharadas al día; precaución: Los piñones pueden causar reacciones alérgicas.",42],
+    ["p","nuez-de-macadamia","semillas-y-frutos-secos-medicinales","- Nuez de Macadamia (Macadamia integrifolia); cardioprotectora, hipocolesterolemiante, antioxidante; parte: Fruto (semilla); dosis: Un puñado (20-30g) al día; precaución: Las nueces de macadamia son un alérgeno de los frutos secos.",58],
+    ["p","semillas-de-amapola","semillas-y-frutos-secos-medicinales","- Semillas de Amapola (Papaver somniferum); relajante, remineralizante, antitusiva; parte: Semillas; dosis: 1 cucharadita al día; precaución: Pueden dar falsos positivos en pruebas de opiáceos. Consumir con moderación.",55],
+    ["p","semillas-de-mostaza","semillas-y-frutos-secos-medicinales","- Semillas de Mostaza (Brassica nigra / Sinapis alba); rubefaciente, estimulante digestivo, antiinflamatoria; parte: Semillas; dosis: Uso externo en cataplasmas, uso interno con moderación; precaución: El uso externo prolongado puede causar irritación o quemaduras en la piel.",69],
+    ["p","semillas-de-apio","semillas-y-frutos-secos-medicinales","- Semillas de Apio (Apium graveolens); diurética, antiinflamatoria, carminativa; parte: Semillas; dosis: 1/2 a 1 cucharadita de semillas, o en extracto; precaución: Puede estimular el útero., No recomendado en niños pequeños.",57],
+    ["p","semillas-de-hinojo","semillas-y-frutos-secos-medicinales","- Semillas de Hinojo (Foeniculum vulgare); carminativa, digestiva, antiespasmódica; parte: Semillas; dosis: 1-2 cucharaditas en infusión; precaución: Altas dosis pueden ser uterotónicas.",47],
+    ["p","semillas-de-comino","semillas-y-frutos-secos-medicinales","- Semillas de Comino (Cuminum cyminum); digestiva, carminativa, antioxidante; parte: Semillas; dosis: 1/2 a 1 cucharadita en infusión o como especia; precaución: Puede aumentar la sensibilidad al sol en algunas personas.",55],
+    ["p","semillas-de-cardamomo","semillas-y-frutos-secos-medicinales","- Semillas de Cardamomo (Elettaria cardamomum); digestiva, carminativa, expectorante; parte: Semillas; dosis: 2-3 vainas en infusión o en la comida; precaución: Personas con cálculos biliares deben consultar a su médico.",55],
+    ["p","semillas-de-cilantro","semillas-y-frutos-secos-medicinales","- Semillas de Cilantro (Coriandrum sativum); digestiva, carminativa, antioxidante; parte: Semillas; dosis: 1 cucharadita en infusión; precaución: Puede causar reacciones alérgicas en personas sensibles.",51],
+    ["p","semillas-de-anis","semillas-y-frutos-secos-medicinales","- Semillas de Anís (Pimpinella anisum); carminativa, expectorante, antiespasmódica; parte: Semillas; dosis: 1 cucharadita en infusión; precaución: Evitar altas dosis durante el embarazo.",47],
+    ["p","semillas-de-alcaravea","semillas-y-frutos-secos-medicinales","- Semillas de Alcaravea (Carum carvi); carminativa, digestiva, antimicrobiana; parte: Semillas; dosis: 1 cucharadita en infusión; precaución: Evitar su uso en grandes cantidades.",45],
+    ["p","semillas-de-eneldo","semillas-y-frutos-secos-medicinales","- Semillas de Eneldo (Anethum graveolens); carminativa, antiespasmódica, galactagoga; parte: Semillas; dosis: 1-2 cucharaditas en infusión; precaución: Puede causar reacciones alérgicas.",47],
+    ["p","semillas-de-fenogreco","semillas-y-frutos-secos-medicinales","- Semillas de Fenogreco (Trigonella foenum-graecum); hipoglucemiante, galactagoga, antiinflamatoria; parte: Semillas; dosis: 1-2 cucharaditas remojadas o en infusión; precaución: Puede inducir contracciones uterinas., Puede interactuar con anticoagulantes y medicamentos para la diabetes.",72],
+    ["p","cacahuete","semillas-y-frutos-secos-medicinales","- Cacahuete (Arachis hypogaea); energizante, nutritiva, antioxidante; parte: Semilla; dosis: Un puñado (30g) al día; precaución: El cacahuete es uno de los alérgenos más comunes y severos.",47],
+    ["p","semillas-de-uva","semillas-y-frutos-secos-medicinales","- Semillas de Uva (Vitis vinifera); antioxidante, vasoprotectora, antiinflamatoria; parte: Semillas (extracto); dosis: 100-300 mg de extracto al día; precaución: Puede interactuar con anticoagulantes.",50],
+    ["p","semillas-de-granada","semillas-y-frutos-secos-medicinales","- Semillas de Granada (Punica granatum); antioxidante, antiinflamatoria, cardioprotectora; parte: Semillas (arilos) y aceite de la semilla; dosis: Consumir los arilos de media granada; 5-10 ml de aceite; precaución: El consumo excesivo del zumo puede interactuar con ciertos medicamentos.",72],
+    ["p","semillas-de-sandia","semillas-y-frutos-secos-medicinales","- Semillas de Sandía (Citrullus lanatus); diurética, nutritiva, remineralizante; parte: Semillas; dosis: Un puñado pequeño (10-15g) al día; precaución: Consumir con moderación por su contenido calórico.",51],
+    ["p","semillas-de-melon","semillas-y-frutos-secos-medicinales","- Semillas de Melón (Cucumis melo); nutritiva, antioxidante, vermífuga; parte: Semillas; dosis: Un puñado pequeño (10-15g) al día; precaución: Asegurarse de que no estén amargas, lo que podría indicar compuestos tóxicos.",55],
+    ["p","semillas-de-loto","semillas-y-frutos-secos-medicinales","- Semillas de Loto (Nelumbo nucifera); astringente, calmante, nutritiva; parte: Semillas; dosis: 10-15g en decocción o cocinadas; precaución: No consumir si se tiene estreñimiento o distensión abdominal.",51],
+    ["p","semillas-de-nigella","semillas-y-frutos-secos-medicinales","- Semillas de Nigella (Comino Negro) (Nigella sativa); inmunomoduladora, antiinflamatoria, antihistamínica; parte: Semillas y aceite; dosis: 1-2 cucharaditas de semillas o 1 de aceite al día; precaución: Evitar en grandes cantidades., Puede interactuar con inmunosupresores y anticoagulantes.",73],
+    ["p","castana-de-indias","semillas-y-frutos-secos-medicinales","- Castaña de Indias (Aesculus hippocastanum); venotónica, antiinflamatoria, antiedematosa; parte: Semilla (extracto estandarizado); dosis: Extracto estandarizado (50 mg de escina) 2-3 veces al día; precaución: La semilla cruda es venenosa. Usar solo preparados comerciales estandarizados., Consultar al médico.",78],
+    ["p","semillas-de-psyllium","semillas-y-frutos-secos-medicinales","- Semillas de Psyllium (Plantago ovata); laxante (formador de bolo), hipocolesterolemiante, prebiótica; parte: Cáscara de la semilla; dosis: 1-2 cucharaditas en un vaso grande de agua, 1-3 veces al día; precaución: Debe tomarse con mucho líquido para evitar el riesgo de asfixia u obstrucción esofágica.",76],
+    ["p","semillas-de-cacao","semillas-y-frutos-secos-medicinales","- Semillas de Cacao (Theobroma cacao); antioxidante, estimulante, cardioprotectora; parte: Semillas (nibs o polvo); dosis: 10-20g de cacao puro al día; precaución: Contiene teobromina, un estimulante. Moderar en caso de hipertensión o ansiedad., Moderar por su efecto estimulante.",70],
+    ["p","semillas-de-cafe","semillas-y-frutos-secos-medicinales","- Semillas de Café (Grano) (Coffea arabica / robusta); estimulante del snc, antioxidante, diurética; parte: Semillas (granos tostados); dosis: 1-3 tazas de café al día (hasta 400 mg de cafeína); precaución: Limitar la ingesta de cafeína., Puede elevar la presión arterial temporalmente.",72],
+    ["p","semillas-de-guarana","semillas-y-frutos-secos-medicinales","- Semillas de Guaraná (Paullinia cupana); estimulante, energizante, saciante; parte: Semillas; dosis: 500-1000 mg de polvo o extracto al día; precaución: Contiene altas dosis de cafeína., Evitar por su alto contenido en cafeína.",57],
+    ["p","nuez-de-cola","semillas-y-frutos-secos-medicinales","- Nuez de Cola (Cola acuminata); estimulante, astringente, diurética; parte: Semilla; dosis: 1-3g de la nuez en polvo o extracto; precaución: Contiene cafeína y teobromina., Puede causar insomnio y nerviosismo.",53],
+    ["p","clavo","especias-medicinales","- Clavo de olor (Syzygium aromaticum); analgésico, antiséptico, carminativo; parte: Botones florales secos; dosis: 1-3 clavos al día; precaución: No recomendado en grandes cantidades., Puede causar reacciones alérgicas en personas sensibles.",61],
+    ["p","pimienta-negra","especias-medicinales","- Pimienta negra (Piper nigrum); digestiva, antioxidante, potenciador de la absorción de nutrientes; parte: Fruto; dosis: Una pizca en las comidas; precaución: Puede irritar la mucosa gástrica en grandes cantidades.",54],
+    ["p","nuez-moscada","especias-medicinales","- Nuez moscada (Myristica fragrans); carminativo, estimulante cerebral, sedante suave; parte: Semilla; dosis: Una pizca, no exceder 1-2 gramos al día; precaución: Puede ser tóxica en grandes cantidades., No recomendado en grandes cantidades.",61],
+    ["p","mostaza","especias-medicinales","- Mostaza (Brassica nigra); rubefaciente, expectorante, estimulante circulatorio; parte: Semillas; dosis: Uso externo en cataplasmas; precaución: Puede irritar la piel sensible., Puede causar reacciones alérgicas.",54],
+    ["p","pimenton","especias-medicinales","- Pimentón (Capsicum annuum); antioxidante, estimulante circulatorio, analgésico suave; parte: Fruto seco y molido; dosis: Consumo culinario; precaución: Puede causar irritación gástrica en personas sensibles.",53],
+    ["p","vainilla","especias-medicinales","- Vainilla (Vanilla planifolia); aromatizante, relajante, antioxidante; parte: Vaina; dosis: Uso culinario; precaución: No se conocen contraindicaciones importantes.",42],
+    ["p","anís-estrellado","especias-medicinales","- Anís estrellado (Illicium verum); carminativo, expectorante, antiviral; parte: Fruto; dosis: 1-2 estrellas por taza de infusión; precaución: No administrar a lactantes y niños pequeños., Evitar durante el embarazo.",54],
+    ["p","cayena","especias-medicinales","- Cayena (Capsicum annuum var. annuum); estimulante circulatorio, analgésico, digestivo; parte: Fruto; dosis: Pequeñas cantidades en las comidas; precaución: Puede irritar la mucosa gástrica.",48],
+    ["p","macis","especias-medicinales","- Macis (Myristica fragrans); carminativo, estimulante, afrodisíaco; parte: Arilo (cobertura de la semilla de nuez moscada); dosis: Una pizca; precaución: Evitar en grandes cantidades.",46],
+    ["p","azafran-de-la-india","especias-medicinales","- Azafrán de la India (Cúrcuma) (Curcuma longa); antiinflamatoria, antioxidante, hepatoprotectora; parte: Rizoma; dosis: 1.5-3 gramos al día; precaución: No recomendado en grandes cantidades., Puede interactuar con anticoagulantes.",58],
+    ["p","pimienta-de-jamaica","especias-medicinales","- Pimienta de Jamaica (Pimenta dioica); carminativo, analgésico, antiséptico; parte: Fruto seco; dosis: Uso culinario; precaución: No se conocen contraindicaciones importantes.",44],
+    ["p","sumac","especias-medicinales","- Zumaque (Sumac) (Rhus coriaria); antioxidante, antiinflamatorio, hipoglucemiante; parte: Fruto seco y molido; dosis: Uso culinario; precaución: Puede causar reacción en personas alérgicas a los anacardos.",52],
+    ["p","asafoetida","especias-medicinales","- Asafétida (Ferula assa-foetida); carminativo, antiespasmódico, expectorante; parte: Resina de la raíz; dosis: Una pizca muy pequeña en la cocción; precaución: Evitar.",42],
+    ["p","pimienta-de-sichuan","especias-medicinales","- Pimienta de Sichuan (Zanthoxylum piperitum); analgésico local, estimulante circulatorio, carminativo; parte: Cáscara del fruto; dosis: Uso culinario; precaución: Produce una sensación de hormigueo característica en la boca.",57],
+    ["p","ajwain","especias-medicinales","- Ajwain (Trachyspermum ammi); carminativo, antiespasmódico, antiséptico; parte: Semillas; dosis: 1/2 cucharadita masticada o en infusión; precaución: Evitar en grandes cantidades.",45],
+    ["p","polvo-de-mango-seco","especias-medicinales","- Polvo de mango seco (Amchur) (Mangifera indica); acidulante, rico en vitamina c, digestivo; parte: Fruto verde seco y molido; dosis: Uso culinario; precaución: No se conocen contraindicaciones importantes.",52],
+    ["p","haba-tonka","especias-medicinales","- Haba Tonka (Dipteryx odorata); aromatizante, sedante, anticoagulante; parte: Semilla; dosis: Usar con extrema moderación, rallar una pequeña cantidad; precaución: Contiene cumarina, no usar con anticoagulantes., Prohibida como aditivo alimentario en algunos países por su contenido de cumarina.",74],
+    ["p","pimienta-larga","especias-medicinales","- Pimienta larga (Piper longum); bio-potenciador, expectorante, rejuvenecedor; parte: Fruto; dosis: 1-2 frutos al día; precaución: Más picante que la pimienta negra, usar con moderación.",47],
+    ["p","cubeba","especias-medicinales","- Cubeba (Pimienta de Java) (Piper cubeba); antiséptico urinario, expectorante, carminativo; parte: Fruto; dosis: Uso culinario moderado; precaución: Evitar.",40],
+    ["p","nopal","plantas-suculentas-y-cactus-medicinales","- Nopal (Opuntia ficus-indica); hipoglucemiante, hipolipemiante, antiinflamatorio, antioxidante, digestivo; parte: Cladodios (pencas) y frutos (tunas); dosis: 1-2 pencas al día. 1-3 tunas al día.; precaución: Puede potenciar el efecto de los medicamentos para la diabetes, se recomienda supervisión médica.",77],
+    ["p","pitaya","plantas-suculentas-y-cactus-medicinales","- Pitaya (Hylocereus undatus); antioxidante, digestiva, antiinflamatoria, refrescante; parte: Fruto; dosis: 1-2 frutos al día.",32],
+    ["p","siempreviva","plantas-suculentas-y-cactus-medicinales","- Siempreviva (Sempervivum tectorum); antiinflamatoria, cicatrizante, analgésica, antiséptica; parte: Hojas; dosis: Aplicación tópica del jugo de las hojas.",39],
+    ["p","kalanchoe","plantas-suculentas-y-cactus-medicinales","- Kalanchoe (Kalanchoe pinnata); antiinflamatoria, analgésica, antitumoral, antiséptica; parte: Hojas; dosis: Infusión de 1-2 hojas en una taza de agua, 2 veces al día.; precaución: No se recomienda su consumo durante el embarazo.",58],
+    ["p","peyote","plantas-suculentas-y-cactus-medicinales","- Peyote (Lophophora williamsii); alucinógeno, analgésico, antibacteriano; parte: Botones del cactus; dosis: Microdosis bajo supervisión especializada.; precaución: Su uso está regulado en muchos países debido a sus efectos psicoactivos. No consumir sin supervisión experta.",69],
+    ["p","sabila","plantas-suculentas-y-cactus-medicinales","- Sábila (Aloe vera); cicatrizante, antiinflamatorio, hidratante, antiséptico, laxante; parte: Gel de las hojas; dosis: Aplicación tópica según necesidad. 1-2 cucharadas de gel por vía oral al día.; precaución: No se recomienda su consumo oral durante el embarazo., Puede pasar a la leche materna y causar diarrea en el lactante.",83],
+    ["p","organo","plantas-suculentas-y-cactus-medicinales","- Órgano (Pachycereus marginatus); antiinflamatorio, analgésico, cicatrizante; parte: Tallo; dosis: Aplicación tópica de la pulpa.",33],
+    ["p","chumbera","plantas-suculentas-y-cactus-medicinales","- Chumbera (Opuntia ficus-indica); hipoglucemiante, hipolipemiante, antiinflamatorio, antioxidante, digestivo; parte: Cladodios (pencas) y frutos (higos chumbos); dosis: 1-2 pencas al día. 1-3 higos chumbos al día.; precaución: Puede potenciar el efecto de los medicamentos para la diabetes, se recomienda supervisión médica.",82],
+    ["p","echeveria","plantas-suculentas-y-cactus-medicinales","- Echeveria (Echeveria elegans); antiinflamatoria, cicatrizante, refrescante; parte: Hojas; dosis: Aplicación tópica del jugo de las hojas.",35],
+    ["p","sedum","plantas-suculentas-y-cactus-medicinales","- Sedum (Sedum acre); cicatrizante, antiinflamatorio, analgésico; parte: Hojas; dosis: Aplicación tópica del jugo de las hojas.; precaución: Puede ser irritante para algunas personas, realizar una prueba de sensibilidad.",55],
+    ["p","yucca","plantas-suculentas-y-cactus-medicinales","- Yucca (Yucca filamentosa); antiinflamatoria, analgésica, antioxidante; parte: Raíz; dosis: Infusión de 1 cucharadita de raíz seca en una taza de agua, 2 veces al día.; precaución: No se recomienda su consumo durante el embarazo.",58],
+    ["p","san-pedro","plantas-suculentas-y-cactus-medicinales","- San Pedro (Echinopsis pachanoi); alucinógeno, analgésico, antibacteriano; parte: Tallo; dosis: Microdosis bajo supervisión especializada.; precaución: Su uso está regulado en muchos países debido a sus efectos psicoactivos. No consumir sin supervisión experta.",66],
+    ["p","fenestraria","plantas-suculentas-y-cactus-medicinales","- Fenestraria (Fenestraria rhopalophylla); hidratante, refrescante; parte: Hojas; dosis: Aplicación tópica del jugo de las hojas.",33],
+    ["p","lithops","plantas-suculentas-y-cactus-medicinales","- Lithops (Lithops spp.); hidratante, refrescante; parte: Hojas; dosis: Aplicación tópica del jugo de las hojas.",28],
+    ["p","gasteria","plantas-suculentas-y-cactus-medicinales","- Gasteria (Gasteria spp.); antiinflamatoria, cicatrizante; parte: Hojas; dosis: Aplicación tópica del jugo de las hojas.",31],
+    ["p","haworthia","plantas-suculentas-y-cactus-medicinales","- Haworthia (Haworthia spp.); antiinflamatoria, cicatrizante; parte: Hojas; dosis: Aplicación tópica del jugo de las hojas.",31],
+    ["p","crassula","plantas-suculentas-y-cactus-medicinales","- Crassula (Crassula ovata); antiinflamatoria, antiséptica; parte: Hojas; dosis: Aplicación tópica del jugo de las hojas.",31],
+    ["p","senecio","plantas-suculentas-y-cactus-medicinales","- Senecio (Senecio rowleyanus); antiinflamatoria, analgésica; parte: Hojas; dosis: Aplicación tópica del jugo de las hojas.; precaución: Algunas especies de Senecio son tóxicas, usar con precaución.",50],
+    ["p","euphorbia","plantas-suculentas-y-cactus-medicinales","- Euphorbia (Euphorbia tirucalli); antiviral, antitumoral, analgésica; parte: Látex; dosis: Aplicación tópica con extrema precaución.; precaución: El látex es cáustico y puede causar irritación severa. No ingerir.",54],
+    ["p","stapelia","plantas-suculentas-y-cactus-medicinales","- Stapelia (Stapelia gigantea); antiinflamatoria, analgésica; parte: Tallo; dosis: Aplicación tópica de la pulpa.",29],
+    ["p","hoodia","plantas-suculentas-y-cactus-medicinales","- Hoodia (Hoodia gordonii); anorexígena, supresora del apetito; parte: Tallo; dosis: Extracto estandarizado según indicación del fabricante.; precaución: No se recomienda su uso sin supervisión médica.",51],
+    ["p","caralluma","plantas-suculentas-y-cactus-medicinales","- Caralluma (Caralluma fimbriata); anorexígena, supresora del apetito, energizante; parte: Tallo; dosis: Extracto estandarizado según indicación del fabricante.; precaución: No se recomienda su uso sin supervisión médica.",56],
+    ["p","opuntia-streptacantha","plantas-suculentas-y-cactus-medicinales","- Opuntia streptacantha (Opuntia streptacantha); antiinflamatoria, analgésica, digestiva; parte: Cladodios (pencas); dosis: 1-2 pencas al día.",36],
+    ["p","rhodiola","plantas-adaptogenas","- Rhodiola (Rhodiola rosea); combate la fatiga, mejora el estado de ánimo, aumenta la resistencia al estrés, mejora la función cognitiva; parte: Raíz; dosis: 200-600 mg al día de extracto estandarizado; precaución: Puede causar irritabilidad o insomnio en algunas personas.",69],
+    ["p","schisandra","plantas-adaptogenas","- Schisandra (Schisandra chinensis); protege el hígado, mejora la resistencia y el rendimiento, reduce el estrés, propiedades antioxidantes; parte: Bayas; dosis: 500-2000 mg de polvo de bayas al día; precaución: No se recomienda su uso durante el embarazo.",64],
+    ["p","albahaca-sagrada","plantas-adaptogenas","- Albahaca Sagrada (Tulsi) (Ocimum tenuiflorum); reduce el estrés y la ansiedad, apoya el sistema inmunológico, propiedades antiinflamatorias, mejora la salud respiratoria; parte: Hojas; dosis: 300-600 mg de extracto al día; precaución: Evitar durante el embarazo y la lactancia.",70],
+    ["p","bacopa","plantas-adaptogenas","- Bacopa (Bacopa monnieri); mejora la memoria y la función cognitiva, reduce la ansiedad, propiedades neuroprotectoras, mejora el estado de ánimo; parte: Partes aéreas; dosis: 300-450 mg de extracto estandarizado al día; precaución: Puede interactuar con sedantes.",66],
+    ["p","gotu-kola","plantas-adaptogenas","- Gotu Kola (Centella asiatica); mejora la función cognitiva, promueve la cicatrización de heridas, mejora la circulación, reduce la ansiedad; parte: Hojas y tallos; dosis: 600-1800 mg de hierba seca al día; precaución: Puede causar somnolencia.",62],
+    ["p","amla","plantas-adaptogenas","- Amla (Phyllanthus emblica); muy rica en vitamina c y antioxidantes, fortalece el sistema inmunológico, mejora la salud del cabello y la piel, mejora la digestión; parte: Fruto; dosis: 1-3 gramos de polvo de fruta al día; precaución: Puede aumentar el riesgo de sangrado en personas con trastornos hemorrágicos.",78],
+    ["p","madreselva","plantas-adaptogenas","- Madreselva (Lonicera japonica); antiviral, antibacterial, antiinflamatorio, alivia el dolor de garganta; parte: Flores y tallos; dosis: 6-15 gramos de flores en decocción; precaución: Puede causar malestar estomacal en algunas personas.",60],
+    ["p","bala","plantas-adaptogenas","- Bala (Sida cordifolia); tónico general, aumenta la fuerza y la resistencia, antiinflamatorio, apoya la salud del sistema nervioso; parte: Raíz y planta entera; dosis: 3-6 gramos de polvo al día; precaución: Usar con precaución, puede ser estimulante.",63],
+    ["p","brahmi","plantas-adaptogenas","- Brahmi (Bacopa monnieri); mejora la memoria y la cognición, reduce el estrés y la ansiedad, neuroprotector, promueve un sueño reparador; parte: Partes aéreas; dosis: 5-10 gramos de polvo de hierba al día; precaución: Puede causar náuseas o malestar estomacal en algunas personas.",71],
+    ["p","guduchi","plantas-adaptogenas","- Guduchi (Tinospora cordifolia); inmunomodulador potente, desintoxicante, reduce la fiebre, antiinflamatorio; parte: Tallo; dosis: 1-3 gramos de polvo de tallo al día; precaución: Puede interactuar con inmunosupresores y medicamentos para la diabetes.",63],
+    ["p","ginseng-americano","plantas-adaptogenas","- Ginseng Americano (Panax quinquefolius); reduce el estrés, mejora la memoria, apoya el sistema inmunológico, ayuda a regular el azúcar en sangre; parte: Raíz; dosis: 200-400 mg de extracto al día; precaución: No recomendado durante el embarazo., Interactúa con anticoagulantes como la warfarina.",75],
+    ["p","shatavari","plantas-adaptogenas","- Shatavari (Asparagus racemosus); tónico reproductor femenino, apoya la lactancia, calma el tracto digestivo, inmunomodulador; parte: Raíz; dosis: 500-1000 mg de extracto de raíz, 2 veces al día; precaución: Personas alérgicas a los espárragos deben evitarla.",65],
+    ["p","tribulus","plantas-adaptogenas","- Tribulus (Tribulus terrestris); aumenta la libido, mejora el rendimiento deportivo, apoya la salud del tracto urinario, tónico general; parte: Fruto y raíz; dosis: 250-750 mg de extracto estandarizado al día; precaución: No usar durante el embarazo o la lactancia., Puede agravar condiciones de próstata.",77],
+    ["e","asma","sistema-respiratorio","- Asma; síntomas: Falta de aire, Opresión en el pecho, Sibilancias al exhalar, Tos persistente; causas: Alergias (polen, ácaros, caspa de animales), Infecciones respiratorias",44],
+    ["e","bronquitis-aguda","sistema-respiratorio","- Bronquitis Aguda; síntomas: Tos con mucosidad, Dolor de garganta, Fiebre baja, Fatiga; causas: Infecciones virales (resfriado, gripe), Infecciones bacterianas",40],
+    ["e","neumonia","sistema-respiratorio","- Neumonía; síntomas: Fiebre alta y escalofríos, Tos con flema verdosa o amarillenta, Dolor en el pecho al respirar, Dificultad para respirar; causas: Infección por bacterias (Streptococcus pneumoniae), Infección por virus (gripe, COVID-19)",60],
+    ["e","epoc","sistema-respiratorio","- Enfermedad Pulmonar Obstructiva Crónica (EPOC); síntomas: Tos crónica con flema, Dificultad para respirar (disnea), Sibilancias, Opresión en el pecho; causas: Tabaquismo (principal causa), Exposición prolongada a humos y polvos irritantes",60],
+    ["e","rinitis-alergica","sistema-respiratorio","- Rinitis Alérgica; síntomas: Estornudos frecuentes, Picazón en nariz, ojos, garganta y paladar, Congestión y secreción nasal acuosa, Ojos llorosos y enrojecidos; causas: Reacción del sistema inmunitario a alérgenos aéreos, Polen de árboles, pasto y malezas",65],
+    ["e","sinusitis","sistema-respiratorio","- Sinusitis; síntomas: Dolor y presión facial (alrededor de ojos, nariz y frente), Congestión y secreción nasal espesa (amarilla o verde), Pérdida del sentido del olfato y el gusto, Tos que empeora por la noche; causas: Infección viral (resfriado común), Infección bacteriana secundaria",72],
+    ["e","faringitis","sistema-respiratorio","- Faringitis; síntomas: Dolor o carraspera en la garganta, Dificultad para tragar, Enrojecimiento de la garganta, Ganglios linfáticos del cuello inflamados; causas: Infecciones virales (resfriado, gripe), Infección bacteriana (estreptococo)",60],
+    ["e","laringitis","sistema-respiratorio","- Laringitis; síntomas: Ronquera o pérdida de la voz, Dolor de garganta, Sensación de cosquilleo o irritación en la garganta, Tos seca; causas: Infección viral (similar a un resfriado), Uso excesivo de la voz (gritar, cantar)",57],
+    ["e","traqueitis","sistema-respiratorio","- Traqueítis; síntomas: Tos profunda y áspera, Fiebre alta, Dificultad para respirar, Sonido agudo al inspirar (estridor); causas: Infección bacteriana, a menudo secundaria a una infección viral, Lesión en la tráquea",54],
+    ["e","tuberculosis","sistema-respiratorio","- Tuberculosis; síntomas: Tos crónica que dura más de 3 semanas, Tos con sangre o esputo, Fiebre y sudores nocturnos, Pérdida de peso involuntaria; causas: Infección por la bacteria Mycobacterium tuberculosis, Transmisión por gotitas en el aire de una persona infectada",68],
+    ["e","fibrosis-pulmonar","sistema-respiratorio","- Fibrosis Pulmonar; síntomas: Dificultad para respirar (disnea) progresiva, Tos seca y persistente, Fatiga y debilidad, Pérdida de apetito y de peso; causas: Causa desconocida (idiopática) en la mayoría de los casos, Exposición a polvos nocivos (asbesto, sílice)",66],
+    ["e","apnea-del-sueno","sistema-respiratorio","- Apnea del Sueño; síntomas: Ronquidos fuertes, Pausas en la respiración durante el sueño, Despertar abrupto con falta de aire, Somnolencia diurna excesiva; causas: Obstrucción de las vías respiratorias superiores durante el sueño, Obesidad y exceso de tejido en la garganta",69],
+    ["e","cancer-de-pulmon","sistema-respiratorio","- Cáncer de Pulmón; síntomas: Tos persistente que no desaparece, Tos con sangre (hemoptisis), Dolor en el pecho, Dificultad para respirar; causas: Tabaquismo (principal factor de riesgo), Exposición al humo de segunda mano",56],
+    ["e","embolia-pulmonar","sistema-respiratorio","- Embolia Pulmonar; síntomas: Dificultad para respirar de aparición súbita, Dolor agudo en el pecho, Tos con sangre, Latidos cardíacos rápidos; causas: Coágulo de sangre que viaja a los pulmones, generalmente desde una TVP, Inmovilidad prolongada",62],
+    ["e","hipertension-pulmonar","sistema-respiratorio","- Hipertensión Pulmonar; síntomas: Falta de aliento, inicialmente con el ejercicio y luego en reposo, Fatiga, Dolor en el pecho, Hinchazón en tobillos y piernas; causas: Enfermedades cardíacas o pulmonares subyacentes, Coágulos de sangre en los pulmones",64],
+    ["e","derrame-pleural","sistema-respiratorio","- Derrame Pleural; síntomas: Dolor en el pecho que empeora al toser o respirar profundo, Dificultad para respirar, Tos seca, Fiebre; causas: Acumulación de líquido en el espacio pleural, Insuficiencia cardíaca congestiva",55],
+    ["e","neumotorax","sistema-respiratorio","- Neumotórax; síntomas: Dolor agudo y repentino en el pecho, Dificultad para respirar, Sensación de opresión en el pecho, Coloración azulada de la piel (cianosis); causas: Lesión torácica penetrante o cerrada, Ruptura de una bulla (pequeña saca de aire) en el pulmón",67],
+    ["e","bronquiectasia","sistema-respiratorio","- Bronquiectasia; síntomas: Tos crónica con grandes cantidades de esputo, Infecciones respiratorias recurrentes, Dificultad para respirar, Mal aliento; causas: Daño e ensanchamiento irreversible de las vías respiratorias, Infecciones pulmonares graves o recurrentes (neumonía, tuberculosis)",73],
+    ["e","sarcoidosis","sistema-respiratorio","- Sarcoidosis; síntomas: Fatiga, Fiebre, Pérdida de peso, Tos seca persistente; causas: Crecimiento de pequeñas acumulaciones de células inflamatorias (granulomas) en diferentes partes del cuerpo, Causa desconocida, posiblemente una respuesta inmunitaria a una sustancia desconocida",71],
+    ["e","fibrosis-quistica","sistema-respiratorio","- Fibrosis Quística; síntomas: Tos persistente con mucosidad espesa, Infecciones pulmonares frecuentes, Dificultad para respirar y sibilancias, Poco aumento de peso y crecimiento deficiente; causas: Trastorno genético hereditario, Mutación en el gen CFTR que regula el movimiento de sal y agua",74],
+    ["e","resfriado-comun","sistema-respiratorio","- Resfriado Común; síntomas: Goteo y congestión nasal, Dolor de garganta, Estornudos, Tos leve; causas: Infección por rinovirus (más común), Contacto con gotitas respiratorias de una persona infectada",50],
+    ["e","gripe","sistema-respiratorio","- Gripe; síntomas: Fiebre alta de inicio súbito, Dolores musculares y corporales intensos, Dolor de cabeza, Fatiga y debilidad extremas; causas: Infección por el virus de la influenza (tipos A, B y C), Transmisión a través de gotitas respiratorias al toser o estornudar",68],
+    ["e","virus-sincitial-respiratorio","sistema-respiratorio","- Virus Sincitial Respiratorio; síntomas: Congestión nasal y moqueo, Tos seca, Fiebre baja, Dificultad para respirar y sibilancias (en casos graves); causas: Infección por el virus sincitial respiratorio (VSR), Causa común de bronquiolitis y neumonía en bebés",65],
+    ["e","adenovirus","sistema-respiratorio","- Adenovirus; síntomas: Síntomas de resfriado o gripe, Dolor de garganta, Fiebre, Conjuntivitis (ojo rojo); causas: Infección por uno de los muchos tipos de adenovirus, Transmisión por contacto personal, gotitas respiratorias o agua contaminada",61],
+    ["e","rinovirus","sistema-respiratorio","- Rinovirus; síntomas: Goteo y congestión nasal, Estornudos, Dolor de garganta, Tos; causas: Principal causa del resfriado común, Infección por más de 100 serotipos de rinovirus",45],
+    ["e","parainfluenza","sistema-respiratorio","- Parainfluenza; síntomas: Fiebre, Tos perruna (crup), Ronquera, Goteo nasal; causas: Infección por virus de la parainfluenza humana (HPIV), Causa común de crup en niños pequeños",45],
+    ["e","metapneumovirus","sistema-respiratorio","- Metapneumovirus; síntomas: Tos, Fiebre, Congestión nasal, Dificultad para respirar; causas: Infección por metaneumovirus humano (HMPV), Puede causar bronquiolitis y neumonía",44],
+    ["e","crup","sistema-respiratorio","- Crup; síntomas: Tos perruna característica, Sonido agudo al inspirar (estridor), Ronquera y dificultad para hablar, Fiebre; causas: Infección viral que inflama la laringe y la tráquea, Virus de la parainfluenza (causa más común)",58],
+    ["e","tos-ferina","sistema-respiratorio","- Tos Ferina; síntomas: Tos violenta en accesos rápidos e incontrolables, Sonido agudo al inhalar después de toser (gallo), Vómitos durante o después de los ataques de tos, Apnea (pausas en la respiración) en bebés; causas: Infección por la bacteria Bordetella pertussis, Altamente contagiosa a través de gotitas respiratorias",82],
+    ["e","difteria","sistema-respiratorio","- Difteria; síntomas: Membrana gruesa y gris en la garganta y amígdalas, Dolor de garganta y ronquera, Ganglios del cuello inflamados, Dificultad para respirar o tragar; causas: Infección por la bacteria Corynebacterium diphtheriae, La bacteria produce una toxina que daña los tejidos",71],
+    ["e","edema-pulmonar","sistema-respiratorio","- Edema Pulmonar; síntomas: Dificultad extrema para respirar, que empeora al acostarse, Sensación de ahogo o asfixia, Tos con esputo espumoso y rosado, Sibilancias y jadeos; causas: Acumulación de exceso de líquido en los alvéolos pulmonares, Insuficiencia cardíaca congestiva (causa más común)",74],
+    ["e","sindrome-de-dificultad-respiratoria-aguda","sistema-respiratorio","- Síndrome de Dificultad Respiratoria Aguda; síntomas: Dificultad respiratoria grave y de rápida aparición, Respiración rápida y superficial, Coloración azulada de la piel y los labios (cianosis), Confusión y fatiga extrema; causas: Fuga de líquido de los vasos sanguíneos a los alvéolos, Sepsis (infección grave en la sangre)",82],
+    ["e","atelectasia","sistema-respiratorio","- Atelectasia; síntomas: Dificultad para respirar (si es extensa), Respiración rápida y superficial, Tos, Fiebre baja; causas: Colapso de una parte o de todo el pulmón, Obstrucción de un bronquio (tapón mucoso, tumor)",55],
+    ["e","hemoptisis","sistema-respiratorio","- Hemoptisis; síntomas: Expectoración de sangre o esputo con sangre, Tos, Dificultad para respirar, Dolor en el pecho; causas: Bronquitis o neumonía, Tuberculosis",41],
+    ["e","disnea","sistema-respiratorio","- Disnea; síntomas: Sensación subjetiva de falta de aire, Respiración difícil o incómoda, Sensación de no poder obtener suficiente aire, Opresión en el pecho; causas: Enfermedades pulmonares (asma, EPOC), Enfermedades cardíacas (insuficiencia cardíaca)",63],
+    ["e","hipoxia","sistema-respiratorio","- Hipoxia; síntomas: Confusión y desorientación, Coloración azulada de la piel (cianosis), Respiración rápida (taquipnea), Frecuencia cardíaca rápida (taquicardia); causas: Nivel bajo de oxígeno en los tejidos corporales, Hipoxemia (bajo oxígeno en sangre)",64],
+    ["e","mesotelioma","sistema-respiratorio","- Mesotelioma; síntomas: Dolor en el pecho o abdomen, Dificultad para respirar, Tos dolorosa, Pérdida de peso inexplicable; causas: Exposición al asbesto (amianto), Inhalación de fibras de asbesto que se alojan en el revestimiento de los pulmones o el abdomen",65],
+    ["e","aspergilosis","sistema-respiratorio","- Aspergilosis; síntomas: Tos (a veces con sangre o mucosidad), Fiebre, Dificultad para respirar, Sibilancias; causas: Infección por el hongo Aspergillus, Inhalación de esporas del hongo presentes en el ambiente (suelo, polvo, vegetación en descomposición)",64],
+    ["e","silicosis","sistema-respiratorio","- Silicosis; síntomas: Dificultad para respirar que empeora con el tiempo, Tos crónica y persistente, Fatiga y debilidad, Dolor en el pecho; causas: Inhalación prolongada de polvo de sílice cristalina, Exposición ocupacional (minería, construcción, cantería)",65],
+    ["e","asbestosis","sistema-respiratorio","- Asbestosis; síntomas: Dificultad para respirar progresiva, Tos seca y persistente, Dolor u opresión en el pecho, Pérdida de apetito; causas: Inhalación prolongada de fibras de asbesto, Cicatrización del tejido pulmonar debido a las fibras de asbesto",63],
+    ["e","gastritis","sistema-digestivo","- Gastritis; síntomas: Malestar o dolor en la parte superior del abdomen, Náuseas, Vómitos, Sensación de llenura; causas: Infección por Helicobacter pylori, Consumo de AINEs",44],
+    ["e","ulcera-peptica","sistema-digestivo","- Úlcera Péptica; síntomas: Dolor ardiente en el estómago, Sensación de llenura, Hinchazón, Intolerancia a los alimentos grasos; causas: Infección por Helicobacter pylori, Uso prolongado de AINEs",49],
+    ["e","reflujo-gastroesofagico","sistema-digestivo","- Enfermedad por Reflujo Gastroesofágico (ERGE); síntomas: Acidez estomacal, Regurgitación de alimentos o líquido agrio, Dolor en el pecho, Dificultad para tragar; causas: Hernia de hiato, Obesidad",50],
+    ["e","colitis-ulcerosa","sistema-digestivo","- Colitis Ulcerosa; síntomas: Diarrea con sangre o pus, Dolor y calambres abdominales, Dolor rectal, Necesidad urgente de defecar; causas: Disfunción del sistema inmunitario, Factores genéticos",49],
+    ["e","sindrome-del-intestino-irritable","sistema-digestivo","- Síndrome del Intestino Irritable (SII); síntomas: Dolor abdominal, Calambres, Hinchazón, Gases; causas: Contracciones musculares en el intestino, Anomalías en el sistema nervioso",45],
+    ["e","enfermedad-de-crohn","sistema-digestivo","- Enfermedad de Crohn; síntomas: Diarrea, Fiebre, Fatiga, Dolor y calambres abdominales; causas: Disfunción del sistema inmunitario, Factores genéticos",38],
+    ["e","hemorroides","sistema-digestivo","- Hemorroides; síntomas: Sangrado indoloro durante la defecación, Picazón o irritación en la región anal, Dolor o molestia, Hinchazón alrededor del ano; causas: Esfuerzo durante la defecación, Estreñimiento crónico o diarrea",56],
+    ["e","estrenimiento","sistema-digestivo","- Estreñimiento; síntomas: Menos de tres evacuaciones por semana, Heces duras o grumosas, Esfuerzo para defecar, Sensación de obstrucción rectal; causas: Dieta baja en fibra, Deshidratación",48],
+    ["e","diarrea","sistema-digestivo","- Diarrea; síntomas: Heces blandas y líquidas, Calambres abdominales, Necesidad urgente de defecar, Náuseas; causas: Infecciones virales o bacterianas, Intoxicación alimentaria",44],
+    ["e","hepatitis","sistema-digestivo","- Hepatitis; síntomas: Fatiga, Náuseas y vómitos, Dolor abdominal, Orina oscura; causas: Infecciones virales (Hepatitis A, B, C, D, E), Consumo excesivo de alcohol",41],
+    ["e","cirrosis-hepatica","sistema-digestivo","- Cirrosis Hepática; síntomas: Fatiga, Pérdida de apetito, Náuseas, Hinchazón en las piernas; causas: Consumo crónico de alcohol, Hepatitis viral crónica (B y C)",41],
+    ["e","pancreatitis","sistema-digestivo","- Pancreatitis; síntomas: Dolor en la parte superior del abdomen que se irradia a la espalda, Fiebre, Pulso rápido, Náuseas y vómitos; causas: Cálculos biliares, Alcoholismo",44],
+    ["e","enfermedad-celiaca","sistema-digestivo","- Enfermedad Celíaca; síntomas: Diarrea, Fatiga, Pérdida de peso, Hinchazón y gases; causas: Reacción inmunitaria al gluten, Predisposición genética",37],
+    ["e","intolerancia-a-la-lactosa","sistema-digestivo","- Intolerancia a la lactosa; síntomas: Diarrea, Gases, Hinchazón abdominal, Cólicos estomacales; causas: Deficiencia de lactasa, Lesión en el intestino delgado",40],
+    ["e","diverticulosis","sistema-digestivo","- Diverticulosis; síntomas: Dolor abdominal, Hinchazón, Estreñimiento o diarrea; causas: Dieta baja en fibra, Envejecimiento",31],
+    ["e","diverticulitis","sistema-digestivo","- Diverticulitis; síntomas: Dolor abdominal intenso, Fiebre, Náuseas, Cambios en los hábitos intestinales; causas: Inflamación de los divertículos, Infección de los divertículos",45],
+    ["e","apendicitis","sistema-digestivo","- Apendicitis; síntomas: Dolor en la parte inferior derecha del abdomen, Pérdida de apetito, Náuseas y vómitos, Fiebre; causas: Obstrucción del apéndice, Infección",41],
+    ["e","calculos-biliares","sistema-digestivo","- Cálculos biliares; síntomas: Dolor repentino e intenso en la parte superior derecha del abdomen, Dolor de espalda entre los omóplatos, Dolor en el hombro derecho, Náuseas o vómitos; causas: Bilis con demasiado colesterol, Bilis con demasiada bilirrubina",64],
+    ["e","colecistitis","sistema-digestivo","- Colecistitis; síntomas: Dolor intenso en la parte superior derecha o central del abdomen, Dolor que se extiende al hombro derecho o a la espalda, Sensibilidad abdominal al tacto, Náuseas; causas: Cálculos biliares, Tumor",56],
+    ["e","disfagia","sistema-digestivo","- Disfagia; síntomas: Dolor al tragar, Incapacidad para tragar, Sensación de que la comida se atasca en la garganta o el pecho, Babeo; causas: Accidente cerebrovascular, Lesión en la cabeza o la médula espinal",53],
+    ["e","indigestion","sistema-digestivo","- Indigestión; síntomas: Dolor o ardor en la parte superior del abdomen, Sensación de saciedad temprana durante una comida, Hinchazón, Náuseas; causas: Comer en exceso o demasiado rápido, Alimentos grasos o picantes",54],
+    ["e","gastroenteritis","sistema-digestivo","- Gastroenteritis; síntomas: Diarrea acuosa, Calambres abdominales, Náuseas o vómitos, Fiebre; causas: Infecciones virales (norovirus, rotavirus), Infecciones bacterianas (E. coli, salmonela)",48],
+    ["e","hernia-de-hiato","sistema-digestivo","- Hernia de hiato; síntomas: Acidez estomacal, Regurgitación de alimentos o líquidos a la boca, Dificultad para tragar, Dolor en el pecho o el abdomen; causas: Aumento de la presión en el abdomen, Envejecimiento",53],
+    ["e","proctitis","sistema-digestivo","- Proctitis; síntomas: Dolor rectal, Sensación de necesidad de defecar, Sangrado rectal, Secreción de moco por el recto; causas: Enfermedad inflamatoria intestinal (EII), Infecciones de transmisión sexual (ITS)",53],
+    ["e","fisura-anal","sistema-digestivo","- Fisura anal; síntomas: Dolor agudo durante la defecación, Sangre roja brillante en las heces o el papel higiénico, Picazón o irritación alrededor del ano; causas: Heces grandes o duras, Estreñimiento y esfuerzo al defecar",56],
+    ["e","incontinencia-fecal","sistema-digestivo","- Incontinencia fecal; síntomas: Pérdida involuntaria de heces líquidas o sólidas, Incapacidad para controlar los gases, Manchado de la ropa interior; causas: Daño muscular o nervioso en el ano o el recto, Diarrea o estreñimiento crónicos",60],
+    ["e","polipos-de-colon","sistema-digestivo","- Pólipos de colon; síntomas: Sangrado rectal, Cambio en los hábitos intestinales, Dolor abdominal, Anemia por deficiencia de hierro; causas: Factores genéticos, Edad avanzada",44],
+    ["e","cancer-de-colon","sistema-digestivo","- Cáncer de colon; síntomas: Cambio persistente en los hábitos intestinales, Sangrado rectal o sangre en las heces, Molestia abdominal persistente, Pérdida de peso inexplicable; causas: Pólipos de colon no cancerosos, Antecedentes familiares de cáncer de colon",65],
+    ["e","cancer-de-estomago","sistema-digestivo","- Cáncer de estómago; síntomas: Indigestión o acidez estomacal, Dolor abdominal, Náuseas y vómitos, Pérdida de peso inexplicable; causas: Infección por Helicobacter pylori, Tabaquismo",46],
+    ["e","cancer-de-esofago","sistema-digestivo","- Cáncer de esófago; síntomas: Dificultad para tragar (disfagia), Pérdida de peso inexplicable, Dolor en el pecho, presión o ardor, Ronquera o tos crónica; causas: Consumo de tabaco y alcohol, Enfermedad por reflujo gastroesofágico (ERGE) crónica",62],
+    ["e","cancer-de-higado","sistema-digestivo","- Cáncer de hígado; síntomas: Pérdida de peso inexplicable, Pérdida de apetito, Dolor en la parte superior del abdomen, Náuseas y vómitos; causas: Infección crónica por hepatitis B o C, Cirrosis hepática",51],
+    ["e","cancer-de-pancreas","sistema-digestivo","- Cáncer de páncreas; síntomas: Ictericia (coloración amarillenta de la piel y los ojos), Dolor abdominal o de espalda, Pérdida de peso inexplicable, Pérdida de apetito; causas: Tabaquismo, Diabetes",50],
+    ["e","esofagitis","sistema-digestivo","- Esofagitis; síntomas: Dificultad para tragar, Dolor al tragar, Acidez estomacal, Regurgitación de alimentos; causas: Enfermedad por reflujo gastroesofágico (ERGE), Infecciones",45],
+    ["e","acalasia","sistema-digestivo","- Acalasia; síntomas: Dificultad para tragar (disfagia), Regurgitación de alimentos no digeridos, Dolor en el pecho, Pérdida de peso; causas: Daño a los nervios del esófago, Respuesta autoinmune",49],
+    ["e","gastroparesia","sistema-digestivo","- Gastroparesia; síntomas: Náuseas, Vómitos de alimentos no digeridos, Sensación de saciedad temprana, Hinchazón abdominal; causas: Diabetes, Cirugía abdominal o esofágica",43],
+    ["e","linfangiectasia-intestinal","sistema-digestivo","- Linfangiectasia intestinal; síntomas: Diarrea crónica, Edema, Pérdida de peso, Hinchazón abdominal; causas: Dilatación de los vasos linfáticos en el intestino delgado, Forma congénita (primaria) o adquirida (secundaria)",56],
+    ["e","sindrome-de-dumping","sistema-digestivo","- Síndrome de Dumping; síntomas: Náuseas, Vómitos, Calambres abdominales, Diarrea; causas: Cirugía de bypass gástrico, Gastrectomía",33],
+    ["e","colangitis","sistema-digestivo","- Colangitis; síntomas: Fiebre, Ictericia, Dolor en la parte superior derecha del abdomen, Escalofríos; causas: Cálculos biliares, Estrechamiento de las vías biliares",42],
+    ["e","isquemia-mesenterica","sistema-digestivo","- Isquemia mesentérica; síntomas: Dolor abdominal intenso y repentino, Necesidad urgente de defecar, Náuseas y vómitos, Fiebre; causas: Aterosclerosis, Tromboembolismo",42],
+    ["e","peritonitis","sistema-digestivo","- Peritonitis; síntomas: Dolor o sensibilidad abdominal, Hinchazón abdominal, Fiebre, Náuseas y vómitos; causas: Ruptura del apéndice, Úlcera estomacal perforada",41],
+    ["e","hipertension-arterial","sistema-cardiovascular","- Hipertensión Arterial; síntomas: Dolor de cabeza, Mareos, Zumbido en los oídos, Visión borrosa; causas: Factores genéticos y hereditarios, Estilo de vida sedentario y obesidad",45],
+    ["e","ateroesclerosis","sistema-cardiovascular","- Ateroesclerosis; síntomas: Dolor en el pecho (angina), Falta de aliento, Dolor en las piernas al caminar, Debilidad o entumecimiento súbito; causas: Acumulación de colesterol y grasas en las arterias, Presión arterial alta",56],
+    ["e","cardiopatia-isquemica","sistema-cardiovascular","- Cardiopatía Isquémica; síntomas: Dolor opresivo en el pecho (angina), Falta de aire, especialmente con el esfuerzo, Fatiga extrema, Sudoración fría y náuseas; causas: Ateroesclerosis (estrechamiento de las arterias coronarias), Formación de coágulos sanguíneos",66],
+    ["e","infarto-de-miocardio","sistema-cardiovascular","- Infarto de Miocardio; síntomas: Dolor intenso y prolongado en el pecho, Dolor que se irradia al brazo izquierdo, mandíbula o espalda, Sudoración profusa y fría, Dificultad para respirar; causas: Obstrucción total de una arteria coronaria por un coágulo, Ateroesclerosis severa",70],
+    ["e","angina-de-pecho","sistema-cardiovascular","- Angina de Pecho; síntomas: Presión o dolor en el centro del pecho, Sensación de opresión o ardor, Dolor que aparece con el esfuerzo y se alivia con el reposo, Falta de aliento; causas: Reducción del flujo sanguíneo al músculo cardíaco, Ateroesclerosis en las arterias coronarias",70],
+    ["e","insuficiencia-cardiaca","sistema-cardiovascular","- Insuficiencia Cardíaca; síntomas: Dificultad para respirar (disnea), Hinchazón (edema) en piernas, tobillos y pies, Fatiga y debilidad, Tos persistente o sibilancias; causas: Daño al músculo cardíaco por infartos previos, Hipertensión arterial no controlada",65],
+    ["e","arritmia","sistema-cardiovascular","- Arritmia; síntomas: Palpitaciones (sensación de que el corazón late rápido o irregular), Mareos o aturdimiento, Desmayo (síncope), Falta de aliento; causas: Señales eléctricas anormales en el corazón, Cardiopatía isquémica o infarto previo",61],
+    ["e","fibrilacion-auricular","sistema-cardiovascular","- Fibrilación Auricular; síntomas: Latidos cardíacos rápidos e irregulares, Palpitaciones intensas, Debilidad y fatiga, Mareos y confusión; causas: Hipertensión arterial crónica, Enfermedad de las arterias coronarias",54],
+    ["e","bradicardia","sistema-cardiovascular","- Bradicardia; síntomas: Latidos cardíacos lentos (menos de 60 por minuto), Fatiga y falta de energía, Mareos o desmayos, Confusión o problemas de memoria; causas: Envejecimiento del sistema eléctrico del corazón, Daño al tejido cardíaco por enfermedad o infarto",66],
+    ["e","taquicardia","sistema-cardiovascular","- Taquicardia; síntomas: Latidos cardíacos rápidos (más de 100 por minuto en reposo), Palpitaciones, Aturdimiento o mareo, Falta de aliento; causas: Estrés, ansiedad o miedo, Fiebre o deshidratación",50],
+    ["e","enfermedad-valvular-cardiaca","sistema-cardiovascular","- Enfermedad Valvular Cardíaca; síntomas: Soplo cardíaco detectado por un médico, Falta de aliento, Hinchazón de tobillos y pies, Dolor en el pecho; causas: Defectos cardíacos congénitos, Fiebre reumática en la infancia",55],
+    ["e","endocarditis","sistema-cardiovascular","- Endocarditis; síntomas: Fiebre y escalofríos, Fatiga extrema, Sudores nocturnos, Soplo cardíaco nuevo o cambiante; causas: Infección bacteriana o fúngica del revestimiento interno del corazón, Uso de drogas intravenosas con agujas contaminadas",62],
+    ["e","miocarditis","sistema-cardiovascular","- Miocarditis; síntomas: Dolor en el pecho, Fatiga, Falta de aliento, Palpitaciones o ritmo cardíaco anormal; causas: Infección viral (como el virus de la gripe o el COVID-19), Reacción a un medicamento o droga",53],
+    ["e","pericarditis","sistema-cardiovascular","- Pericarditis; síntomas: Dolor agudo y punzante en el pecho, que empeora al respirar hondo, Fiebre baja, Debilidad y fatiga, Tos seca; causas: Infección viral, Ataque cardíaco o cirugía cardíaca",49],
+    ["e","cardiomiopatia","sistema-cardiovascular","- Cardiomiopatía; síntomas: Falta de aliento con el esfuerzo o en reposo, Hinchazón de las piernas y el abdomen, Fatiga, Latidos cardíacos irregulares; causas: Factores genéticos y hereditarios, Hipertensión arterial prolongada",57],
+    ["e","aneurisma-aortico","sistema-cardiovascular","- Aneurisma Aórtico; síntomas: A menudo asintomático hasta que se rompe, Dolor profundo y persistente en el abdomen o la espalda, Sensación de pulso cerca del ombligo, Dolor súbito e intenso si se rompe; causas: Ateroesclerosis, Hipertensión arterial",63],
+    ["e","diseccion-aortica","sistema-cardiovascular","- Disección Aórtica; síntomas: Dolor súbito y desgarrador en el pecho o la espalda, Pérdida del conocimiento, Dificultad para respirar, Debilidad o parálisis en un lado del cuerpo; causas: Hipertensión arterial crónica y mal controlada, Aneurisma aórtico preexistente",67],
+    ["e","enfermedad-arterial-periferica","sistema-cardiovascular","- Enfermedad Arterial Periférica; síntomas: Dolor o calambres en las piernas al caminar (claudicación), Entumecimiento o debilidad en las piernas, Piel fría en los pies, Llagas que no cicatrizan en pies o piernas; causas: Ateroesclerosis en las arterias de las extremidades, Tabaquismo",72],
+    ["e","trombosis-venosa-profunda","sistema-cardiovascular","- Trombosis Venosa Profunda; síntomas: Hinchazón en una pierna, Dolor o sensibilidad en la pierna, a menudo como un calambre, Piel enrojecida o descolorida, Sensación de calor en el área afectada; causas: Inmovilidad prolongada (viajes largos, reposo en cama), Cirugía o lesión en las venas",73],
+    ["e","accidente-cerebrovascular","sistema-cardiovascular","- Accidente Cerebrovascular; síntomas: Adormecimiento o debilidad súbita en cara, brazo o pierna (especialmente en un lado), Confusión repentina, dificultad para hablar o entender, Problemas súbitos de visión, Dolor de cabeza súbito y severo; causas: Obstrucción de una arteria cerebral por un coágulo (isquémico), Ruptura de un vaso sanguíneo en el cerebro (hemorrágico)",93],
+    ["e","cardiopatia-congenita","sistema-cardiovascular","- Cardiopatía Congénita; síntomas: Varían mucho según el defecto, Cianosis (piel azulada), Dificultad para respirar y alimentarse (en bebés), Retraso en el crecimiento; causas: Anomalías en el desarrollo del corazón antes del nacimiento, Factores genéticos y síndromes (como el de Down)",72],
+    ["e","soplo-cardiaco","sistema-cardiovascular","- Soplo Cardíaco; síntomas: Generalmente asintomático (es un sonido, no una enfermedad), En casos patológicos, puede asociarse a falta de aire o cianosis, Dolor en el pecho, Mareos; causas: Flujo sanguíneo turbulento a través del corazón, Soplos inocentes (comunes en niños)",69],
+    ["e","sindrome-de-marfan","sistema-cardiovascular","- Síndrome de Marfan; síntomas: Estatura alta y delgada, con brazos y piernas largos, Problemas de visión (luxación del cristalino), Problemas cardíacos (aneurisma y disección aórtica), Articulaciones extremadamente flexibles; causas: Mutación en el gen FBN1 que afecta el tejido conectivo, Trastorno genético hereditario",81],
+    ["e","enfermedad-de-buerger","sistema-cardiovascular","- Enfermedad de Buerger; síntomas: Dolor en manos y pies, incluso en reposo, Dedos pálidos, rojizos o azulados por el frío, Llagas dolorosas en dedos de manos y pies, Inflamación a lo largo de las venas; causas: Fuerte asociación con el consumo de tabaco, Inflamación y coagulación en los vasos sanguíneos de manos y pies",81],
+    ["e","enfermedad-de-raynaud","sistema-cardiovascular","- Enfermedad de Raynaud; síntomas: Dedos de manos y pies que se vuelven blancos, luego azules y finalmente rojos, Entumecimiento y sensación de hormigueo, Dolor punzante al recuperar el flujo sanguíneo; causas: Espasmo de las arterias pequeñas en respuesta al frío o al estrés, Puede ser primario (causa desconocida) o secundario a otras enfermedades",88],
+    ["e","varices","sistema-cardiovascular","- Varices; síntomas: Venas torcidas y abultadas de color azul o morado oscuro, Sensación de pesadez o dolor en las piernas, Calambres musculares y ardor, Hinchazón en la parte inferior de las piernas; causas: Válvulas venosas débiles o dañadas, Aumento de la presión en las venas (estar de pie mucho tiempo)",77],
+    ["e","linfedema","sistema-cardiovascular","- Linfedema; síntomas: Hinchazón de brazos o piernas, Sensación de pesadez o rigidez, Amplitud de movimiento restringida, Infecciones recurrentes; causas: Extirpación o daño de los ganglios linfáticos como parte del tratamiento oncológico, Infecciones que afectan los vasos linfáticos",71],
+    ["e","shock-cardiogenico","sistema-cardiovascular","- Shock Cardiogénico; síntomas: Presión arterial muy baja, Pulso débil y rápido, Piel fría y sudorosa, Confusión y pérdida de conciencia; causas: Daño severo al corazón, generalmente por un infarto masivo, Incapacidad del corazón para bombear suficiente sangre al cuerpo",68],
+    ["e","paro-cardiaco","sistema-cardiovascular","- Paro Cardíaco; síntomas: Pérdida súbita del conocimiento, Ausencia de respiración, Falta de pulso, Colapso repentino; causas: Mal funcionamiento eléctrico del corazón (arritmia letal), Enfermedad de las arterias coronarias",56],
+    ["e","anemia","sistema-cardiovascular","- Anemia; síntomas: Fatiga y debilidad, Piel pálida o amarillenta, Falta de aliento, Mareos o aturdimiento; causas: Deficiencia de hierro, vitamina B12 o folato, Pérdida de sangre (menstruación, úlceras)",51],
+    ["e","hemofilia","sistema-cardiovascular","- Hemofilia; síntomas: Sangrado excesivo por cortes o lesiones, Moretones grandes y profundos, Sangrado en articulaciones (dolor e hinchazón), Sangre en la orina o las heces; causas: Trastorno genético hereditario ligado al cromosoma X, Deficiencia de factores de coagulación en la sangre (Factor VIII o IX)",77],
+    ["e","leucemia","sistema-cardiovascular","- Leucemia; síntomas: Fiebre o escalofríos, Fatiga persistente, Infecciones frecuentes, Pérdida de peso involuntaria; causas: Producción anormal y excesiva de glóbulos blancos en la médula ósea, Mutaciones en el ADN de las células sanguíneas",61],
+    ["e","colesterol-alto","sistema-cardiovascular","- Colesterol Alto; síntomas: Generalmente no presenta síntomas, Puede contribuir a la ateroesclerosis y sus síntomas (dolor de pecho, etc.), Depósitos de grasa en la piel (xantomas) en casos severos; causas: Dieta rica in grasas saturadas y trans, Factores genéticos (hipercolesterolemia familiar)",75],
+    ["e","trigliceridos-altos","sistema-cardiovascular","- Triglicéridos Altos; síntomas: Generalmente asintomático, En niveles muy altos, puede causar pancreatitis (dolor abdominal severo), Puede contribuir a la ateroesclerosis; causas: Consumo excesivo de calorías, especialmente de azúcar y alcohol, Obesidad y síndrome metabólico",69],
+    ["e","diabetes-mellitus","sistema-cardiovascular","- Diabetes Mellitus; síntomas: Aumento de la sed y la micción, Aumento del hambre, Pérdida de peso inexplicable, Fatiga; causas: Tipo 1: Destrucción autoinmune de las células productoras de insulina, Tipo 2: Resistencia a la insulina y producción insuficiente",65],
+    ["e","obesidad","sistema-cardiovascular","- Obesidad; síntomas: Índice de Masa Corporal (IMC) de 30 o superior, Acumulación excesiva de grasa corporal, Dificultad para respirar, Dolor en articulaciones y espalda; causas: Desequilibrio entre la ingesta y el gasto de calorías, Factores genéticos y metabólicos",67],
+    ["e","lupus-eritematoso-sistemico","sistema-cardiovascular","- Lupus Eritematoso Sistémico; síntomas: Erupción en forma de mariposa en el rostro, Fatiga extrema, Dolor e hinchazón en las articulaciones, Fiebre; causas: Enfermedad autoinmune donde el cuerpo ataca sus propios tejidos, Combinación de factores genéticos y ambientales",68],
+    ["e","migraña","sistema-nervioso","- Migraña; síntomas: Dolor de cabeza pulsátil, Sensibilidad a la luz y al sonido, Náuseas y vómitos, Auras visuales; causas: Factores genéticos, Cambios hormonales",41],
+    ["e","epilepsia","sistema-nervioso","- Epilepsia; síntomas: Convulsiones recurrentes, Pérdida de conciencia, Movimientos espasmódicos incontrolables, Confusión temporal; causas: Lesión cerebral traumática, Accidente cerebrovascular",49],
+    ["e","parkinson","sistema-nervioso","- Parkinson; síntomas: Temblores en reposo, Rigidez muscular, Lentitud de movimiento (bradicinesia), Inestabilidad postural; causas: Pérdida de neuronas productoras de dopamina, Factores genéticos",49],
+    ["e","alzheimer","sistema-nervioso","- Alzheimer; síntomas: Pérdida de memoria progresiva, Dificultad para resolver problemas, Desorientación en tiempo y lugar, Cambios en el estado de ánimo y la personalidad; causas: Acumulación de placas de beta-amiloide en el cerebro, Ovillos de proteína tau",65],
+    ["e","esclerosis-múltiple","sistema-nervioso","- Esclerosis múltiple; síntomas: Fatiga, Dificultad para caminar, Entumecimiento u hormigueo en el cuerpo, Problemas de visión; causas: Enfermedad autoinmune que ataca la mielina, Predisposición genética",51],
+    ["e","neuralgia","sistema-nervioso","- Neuralgia; síntomas: Dolor agudo y punzante a lo largo de un nervio, Sensibilidad extrema al tacto, Espasmos musculares; causas: Compresión de un nervio, Infecciones (como el herpes zóster)",48],
+    ["e","neuropatía","sistema-nervioso","- Neuropatía; síntomas: Entumecimiento, hormigueo o ardor en manos y pies, Debilidad muscular, Pérdida de coordinación, Dolor agudo y punzante; causas: Diabetes, Deficiencias vitamínicas",47],
+    ["e","vértigo","sistema-nervioso","- Vértigo; síntomas: Sensación de que todo da vueltas, Pérdida de equilibrio, Náuseas y vómitos, Movimientos oculares anormales (nistagmo); causas: Problemas en el oído interno (como la VPPB), Enfermedad de Meniere",54],
+    ["e","insomnio","sistema-nervioso","- Insomnio; síntomas: Dificultad para conciliar el sueño, Dificultad para mantener el sueño (despertarse con frecuencia), Despertarse demasiado temprano y no poder volver a dormirse, Sueño no reparador; causas: Estrés y ansiedad, Malos hábitos de sueño",63],
+    ["e","accidente-cerebrovascular-acv","sistema-nervioso","- Accidente cerebrovascular (ACV); síntomas: Entumecimiento o debilidad repentina en la cara, brazo o pierna, Confusión repentina, dificultad para hablar, Problemas repentinos de visión, Dolor de cabeza intenso y repentino; causas: Bloqueo del flujo sanguíneo al cerebro (isquémico), Sangrado en el cerebro (hemorrágico)",80],
+    ["e","aneurisma-cerebral","sistema-nervioso","- Aneurisma cerebral; síntomas: Dolor de cabeza súbito e intenso, Náuseas y vómitos, Rigidez en el cuello, Visión borrosa o doble; causas: Debilidad en la pared de un vaso sanguíneo cerebral, Presión arterial alta",54],
+    ["e","tumor-cerebral","sistema-nervioso","- Tumor cerebral; síntomas: Dolores de cabeza persistentes, Convulsiones, Cambios en la personalidad o el comportamiento, Problemas de visión o audición; causas: Crecimiento anormal de células en el cerebro, Exposición a la radiación",59],
+    ["e","esclerosis-lateral-amiotrófica-ela","sistema-nervioso","- Esclerosis lateral amiotrófica (ELA); síntomas: Debilidad muscular progresiva, Dificultad para hablar y tragar, Espasmos y calambres musculares, Pérdida de la capacidad para moverse; causas: Degeneración de las neuronas motoras, Factores genéticos",63],
+    ["e","hernia-de-disco","sistema-nervioso","- Hernia de disco; síntomas: Dolor de espalda o cuello, Dolor que se irradia a los brazos o las piernas, Entumecimiento u hormigueo, Debilidad muscular; causas: Desgaste gradual relacionado con la edad (degeneración del disco), Levantamiento de objetos pesados de forma incorrecta",70],
+    ["e","enfermedad-de-huntington","sistema-nervioso","- Enfermedad de Huntington; síntomas: Movimientos involuntarios (corea), Deterioro cognitivo, Cambios psiquiátricos (depresión, irritabilidad), Dificultad para caminar y hablar; causas: Mutación en el gen HTT, Trastorno genético hereditario",60],
+    ["e","demencia-con-cuerpos-de-lewy","sistema-nervioso","- Demencia con cuerpos de Lewy; síntomas: Fluctuaciones en la atención y el estado de alerta, Alucinaciones visuales recurrentes, Síntomas de parkinsonismo (rigidez, temblores), Trastornos del sueño; causas: Acumulación de depósitos de proteína (cuerpos de Lewy) en el cerebro, Edad avanzada",73],
+    ["e","ataxia-de-friedreich","sistema-nervioso","- Ataxia de Friedreich; síntomas: Dificultad para caminar y mantener el equilibrio, Debilidad muscular en brazos y piernas, Problemas del habla (disartria), Cardiomiopatía; causas: Mutación en el gen FXN, Trastorno genético hereditario",59],
+    ["e","síndrome-de-la-persona-rígida","sistema-nervioso","- Síndrome de la persona rígida; síntomas: Rigidez muscular progresiva, Espasmos musculares dolorosos, Postura encorvada, Sensibilidad aumentada al ruido y al tacto; causas: Enfermedad autoinmune que ataca el sistema nervioso central, Asociación con otras enfermedades autoinmunes",70],
+    ["e","encefalitis","sistema-nervioso","- Encefalitis; síntomas: Fiebre, Dolor de cabeza intenso, Confusión, Convulsiones; causas: Infección viral (como el herpes simple), Reacción autoinmune",38],
+    ["e","enfermedad-de-charcot-marie-tooth","sistema-nervioso","- Enfermedad de Charcot-Marie-Tooth; síntomas: Debilidad y atrofia muscular en pies y piernas, Pies cavos (arco alto), Pérdida de sensibilidad en los pies, Dificultad para caminar; causas: Mutaciones genéticas que afectan los nervios periféricos, Trastorno hereditario",67],
+    ["e","enfermedades-de-las-neuronas-motoras","sistema-nervioso","- Enfermedades de las neuronas motoras; síntomas: Debilidad muscular progresiva, Atrofia muscular, Dificultad para hablar y tragar, Espasticidad; causas: Degeneración de las neuronas motoras en el cerebro y la médula espinal, Factores genéticos (en algunos casos)",66],
+    ["e","enfermedad-de-von-hippel-lindau","sistema-nervioso","- Enfermedad de von Hippel-Lindau; síntomas: Tumores en el sistema nervioso central, Quistes en riñones, páncreas y otros órganos, Hemangioblastomas en la retina, Feocromocitoma; causas: Mutación en el gen VHL, Trastorno genético hereditario",61],
+    ["e","enfermedades-de-la-médula-espinal","sistema-nervioso","- Enfermedades de la médula espinal; síntomas: Pérdida de sensibilidad por debajo de la lesión, Debilidad o parálisis muscular, Pérdida del control de la vejiga y los intestinos, Dolor neuropático; causas: Traumatismos (accidentes, caídas), Tumores",62],
+    ["e","absceso-cerebral-parasitario","sistema-nervioso","- Absceso cerebral parasitario; síntomas: Dolor de cabeza, Fiebre, Convulsiones, Déficits neurológicos focales; causas: Infección por parásitos como Taenia solium (cisticercosis), Diseminación de una infección de otra parte del cuerpo",59],
+    ["e","absceso-raquídeo","sistema-nervioso","- Absceso raquídeo; síntomas: Dolor de espalda localizado, Fiebre, Debilidad o parálisis de las piernas, Pérdida del control de esfínteres; causas: Infección bacteriana (generalmente Staphylococcus aureus), Diseminación desde una infección cercana",62],
+    ["e","accidente-isquémico-transitorio","sistema-nervioso","- Accidente isquémico transitorio; síntomas: Síntomas similares a un ACV que duran poco tiempo, Entumecimiento o debilidad facial/extremidades, Dificultad para hablar o entender, Pérdida de visión súbita; causas: Interrupción temporal del flujo sanguíneo a una parte del cerebro, Coágulo de sangre",75],
+    ["e","adrenoleucodistrofia","sistema-nervioso","- Adrenoleucodistrofia; síntomas: Problemas de comportamiento y aprendizaje, Pérdida de la visión y la audición, Deterioro neurológico progresivo, Insuficiencia suprarrenal; causas: Mutación en el gen ABCD1, Trastorno genético ligado al cromosoma X",62],
+    ["e","afasia","sistema-nervioso","- Afasia; síntomas: Dificultad para encontrar las palabras correctas, Habla telegráfica (frases cortas e incompletas), Dificultad para entender el lenguaje hablado o escrito, Sustitución de palabras o sonidos; causas: Daño cerebral por ACV, Lesión cerebral traumática",67],
+    ["e","laberintitis","sistema-nervioso","- Laberintitis; síntomas: Vértigo severo, Pérdida de audición, Zumbido en los oídos (tinnitus), Náuseas y vómitos; causas: Infección viral o bacteriana del oído interno, Reactivación de un virus latente",51],
+    ["e","enfermedad-de-lafora","sistema-nervioso","- Enfermedad de Lafora; síntomas: Convulsiones mioclónicas y tónico-clónicas, Deterioro cognitivo progresivo, Alucinaciones visuales, Ataxia; causas: Mutaciones en los genes EPM2A o NHLRC1, Trastorno genético hereditario recesivo",58],
+    ["e","síndrome-de-landau-kleffner","sistema-nervioso","- Síndrome de Landau-Kleffner; síntomas: Pérdida de la capacidad para entender y usar el lenguaje (afasia), Anomalías en el electroencefalograma (EEG) durante el sueño, Convulsiones (en la mayoría de los casos), Problemas de comportamiento; causas: Causa exacta desconocida, Posiblemente relacionado con procesos inflamatorios o autoinmunes",85],
+    ["e","síndrome-de-leigh","sistema-nervioso","- Síndrome de Leigh; síntomas: Pérdida de habilidades motoras previamente adquiridas, Vómitos, diarrea y dificultad para tragar, Irritabilidad y llanto continuo, Convulsiones; causas: Mutaciones en genes del ADN mitocondrial o nuclear, Trastorno neurodegenerativo progresivo",69],
+    ["e","leucoaraiosis","sistema-nervioso","- Leucoaraiosis; síntomas: A menudo asintomático al principio, Deterioro cognitivo leve, Problemas de equilibrio y marcha, Aumento del riesgo de ACV; causas: Enfermedad de los pequeños vasos sanguíneos del cerebro, Hipertensión arterial crónica",61],
+    ["e","leucodistrofia-metacromática","sistema-nervioso","- Leucodistrofia metacromática; síntomas: Pérdida de la capacidad para caminar y hablar, Rigidez muscular, Deterioro mental progresivo, Pérdida de la sensibilidad en extremidades; causas: Deficiencia de la enzima arilsulfatasa A, Acumulación de sulfátidos en el sistema nervioso",70],
+    ["e","leucoencefalopatía","sistema-nervioso","- Leucoencefalopatía; síntomas: Deterioro cognitivo y motor progresivo, Cambios de personalidad, Ataxia, Espasticidad; causas: Amplio grupo de trastornos que afectan la sustancia blanca del cerebro, Causas genéticas, infecciosas o tóxicas",60],
+    ["e","ausencia-del-tabique-pelúcido","sistema-nervioso","- Ausencia del tabique pelúcido; síntomas: Puede ser asintomático, Retraso en el desarrollo, Discapacidad visual, Convulsiones; causas: Anomalía congénita del cerebro, Asociado con otros trastornos del desarrollo cerebral",56],
+    ["e","enfermedad-por-depósito-de-lípidos-ácidos","sistema-nervioso","- Enfermedad por depósito de lípidos ácidos; síntomas: Hepatoesplenomegalia (agrandamiento de hígado y bazo), Retraso del crecimiento, Diarrea y vómitos crónicos, Deterioro neurológico en formas graves; causas: Deficiencia de la enzima lipasa ácida lisosomal, Trastorno genético hereditario",73],
+    ["e","dolor-de-espalda","sistema-nervioso","- Dolor de espalda; síntomas: Dolor muscular o punzante en la espalda, Dolor que se irradia hacia la pierna, Movilidad limitada o rigidez de la espalda, Dolor que empeora al estar de pie o sentado; causas: Tensión muscular o de ligamentos, Hernia de disco",64],
+    ["e","síndrome-de-barth","sistema-nervioso","- Síndrome de Barth; síntomas: Cardiomiopatía (músculo cardíaco debilitado), Neutropenia (bajo número de glóbulos blancos), Debilidad muscular y retraso motor, Retraso del crecimiento; causas: Mutación en el gen TAZ (tafazzin), Trastorno genético ligado al cromosoma X",67],
+    ["e","cadasil","sistema-nervioso","- CADASIL; síntomas: Migrañas con aura, Accidentes cerebrovasculares isquémicos recurrentes, Trastornos del estado de ánimo, Demencia progresiva; causas: Mutaciones en el gen NOTCH3, Trastorno genético hereditario dominante",56],
+    ["e","lupus","sistema-inmunologico","- Lupus; síntomas: Fatiga, Fiebre, Dolor articular, Erupción en forma de mariposa; causas: Predisposición genética, Factores ambientales como infecciones o medicamentos",42],
+    ["e","artritis-reumatoide","sistema-inmunologico","- Artritis Reumatoide; síntomas: Dolor en las articulaciones, Hinchazón de las articulaciones, Rigidez articular, Fatiga; causas: Predisposición genética, Factores ambientales como infecciones virales o bacterianas",54],
+    ["e","psoriasis","sistema-inmunologico","- Psoriasis; síntomas: Placas rojas cubiertas de escamas plateadas, Picazón, ardor o dolor en las lesiones, Piel seca y agrietada que puede sangrar, Uñas engrosadas, picadas o estriadas; causas: Enfermedad autoinmune que acelera el ciclo de vida de las células de la piel, Predisposición genética",74],
+    ["e","vitiligo","sistema-inmunologico","- Vitiligo; síntomas: Pérdida de pigmento que resulta en manchas blancas en la piel, Aparición de canas prematuras en cabello, pestañas o cejas, Las manchas pueden crecer o extenderse con el tiempo; causas: Enfermedad autoinmune en la que el sistema inmunitario ataca a los melanocitos, Factores genéticos y hereditarios",80],
+    ["e","alergias","sistema-inmunologico","- Alergias; síntomas: Estornudos, Picazón en la nariz, ojos o paladar, Congestión nasal, Ojos llorosos, rojos o hinchados; causas: Respuesta exagerada del sistema inmunitario a sustancias inofensivas (alérgenos), Predisposición genética",59],
+    ["e","inmunodeficiencias","sistema-inmunologico","- Inmunodeficiencias; síntomas: Infecciones recurrentes y graves, Inflamación y daño en órganos internos, Problemas sanguíneos, como recuentos bajos de plaquetas o anemia, Problemas digestivos; causas: Defectos genéticos que afectan el sistema inmunitario (primaria), Enfermedades como el VIH/SIDA o la desnutrición (secundaria)",82],
+    ["e","esclerosis-multiple","sistema-inmunologico","- Esclerosis Múltiple; síntomas: Entumecimiento o debilidad en una o más extremidades, Problemas de visión, Fatiga, Problemas de equilibrio y coordinación; causas: Enfermedad autoinmune que ataca la mielina del sistema nervioso central, Combinación de factores genéticos y ambientales",71],
+    ["e","enfermedad-de-graves","sistema-inmunologico","- Enfermedad de Graves; síntomas: Ansiedad e irritabilidad, Temblores en manos o dedos, Bocio (agrandamiento de la tiroides), Ojos saltones (exoftalmos); causas: Trastorno autoinmune que causa sobreproducción de hormonas tiroideas, Predisposición genética",64],
+    ["e","tiroiditis-de-hashimoto","sistema-inmunologico","- Tiroiditis de Hashimoto; síntomas: Fatiga y pereza, Aumento de la sensibilidad al frío, Estreñimiento, Piel pálida y seca; causas: Ataque del sistema inmunitario a la glándula tiroides, Combinación de factores genéticos y ambientales",59],
+    ["e","enfermedad-de-addison","sistema-inmunologico","- Enfermedad de Addison; síntomas: Fatiga extrema, Pérdida de peso y disminución del apetito, Hiperpigmentación (oscurecimiento de la piel), Presión arterial baja; causas: Daño a las glándulas suprarrenales (insuficiencia suprarrenal primaria), Reacción autoinmune",66],
+    ["e","miastenia-gravis","sistema-inmunologico","- Miastenia Gravis; síntomas: Debilidad de los músculos de los brazos, las manos, los dedos, las piernas y el cuello, Visión doble, Párpados caídos, Dificultad para hablar, masticar, tragar y respirar; causas: Interrupción de la comunicación normal entre los nervios y los músculos, Anticuerpos que bloquean o destruyen los receptores musculares de la acetilcolina",91],
+    ["e","sindrome-de-sjogren","sistema-inmunologico","- Síndrome de Sjögren; síntomas: Ojos secos, Boca seca, Fatiga, Dolor e hinchazón en las articulaciones; causas: Ataque del sistema inmunitario a las glándulas que producen lágrimas y saliva, Predisposición genética",54],
+    ["e","esclerodermia","sistema-inmunologico","- Esclerodermia; síntomas: Endurecimiento y estiramiento de la piel, Fenómeno de Raynaud (dedos de manos y pies que se vuelven blancos, azules o rojos en respuesta al frío), Reflujo ácido y problemas para tragar, Problemas pulmonares, cardíacos o renales; causas: Sobreproducción y acumulación de colágeno en el cuerpo, Respuesta autoinmune",85],
+    ["e","polimiositis","sistema-inmunologico","- Polimiositis; síntomas: Debilidad muscular progresiva en caderas, muslos, hombros, brazos y cuello, Dificultad para subir escaleras, levantarse de una silla o levantar objetos, Dolor muscular, Dificultad para tragar; causas: Inflamación de los músculos por una respuesta autoinmune, Causa exacta desconocida, posiblemente relacionada con infecciones virales o enfermedades autoinmunes",97],
+    ["e","dermatomiositis","sistema-inmunologico","- Dermatomiositis; síntomas: Erupción cutánea violácea o roja oscura en la cara, los nudillos, los codos, las rodillas, el pecho y la espalda, Debilidad muscular progresiva, Párpados hinchados y de color púrpura, Dificultad para tragar; causas: Inflamación de los músculos y la piel por una respuesta autoinmune, Factores genéticos y ambientales",87],
+    ["e","diabetes-tipo-1","sistema-inmunologico","- Diabetes tipo 1; síntomas: Aumento de la sed, Aumento de las ganas de orinar, Pérdida de peso inexplicable, Aumento del apetito; causas: Reacción autoinmune, Predisposición genética",46],
+    ["e","enfermedad-inflamatoria-intestinal","sistema-inmunologico","- Enfermedad Inflamatoria Intestinal; síntomas: Dolor abdominal y cólicos, Diarrea, Sangrado rectal, Cansancio extremo; causas: Respuesta anormal del sistema inmunitario, Genética y antecedentes familiares",52],
+    ["e","hepatitis-autoinmune","sistema-inmunologico","- Hepatitis Autoinmune; síntomas: Fatiga, Malestar abdominal, Ictericia, Dolor en las articulaciones; causas: Reacción autoinmune contra las células hepáticas, Predisposición genética",46],
+    ["e","anemia-perniciosa","sistema-inmunologico","- Anemia Perniciosa; síntomas: Fatiga y debilidad, Hormigueo o entumecimiento en manos y pies, Piel pálida, Dificultad para caminar y problemas de equilibrio; causas: Reacción autoinmune contra las células parietales del estómago, Falta de factor intrínseco para absorber la vitamina B12",72],
+    ["e","vasculitis-autoinmune","sistema-inmunologico","- Vasculitis Autoinmune; síntomas: Fiebre, Dolor de cabeza, Cansancio, Pérdida de peso; causas: Infecciones como la hepatitis B y C, Cánceres de la sangre",39],
+    ["e","alopecia-areata","sistema-inmunologico","- Alopecia Areata; síntomas: Pérdida de cabello en parches redondos u ovalados, Puede afectar el cuero cabelludo, cejas, pestañas y barba, Piel lisa y sin cicatrices en las áreas de calvicie, En casos raros, puede progresar a la pérdida total del cabello (alopecia totalis); causas: Enfermedad autoinmune donde el sistema inmunitario ataca los folículos pilosos, Predisposición genética",97],
+    ["e","sindrome-de-guillain-barre","sistema-inmunologico","- Síndrome de Guillain-Barré; síntomas: Sensación de hormigueo en los dedos de las manos, de los pies, los tobillos o las muñecas, Debilidad en las piernas que se difunde a la parte superior del cuerpo, Marcha inestable o incapacidad para caminar o subir escaleras, Dificultad con los movimientos faciales, lo que incluye hablar, masticar o tragar; causas: Infección por campylobacter, Virus de la influenza",102],
+    ["e","purpura-trombocitopenica-idiopatica","sistema-inmunologico","- Púrpura Trombocitopénica Idiopática; síntomas: Sangrado en la piel (púrpura y petequias), Sangrado de las encías o la nariz, Orina o heces con sangre, Aparición fácil de moretones; causas: El sistema inmunitario ataca y destruye las plaquetas por error, Producción de anticuerpos contra las plaquetas",76],
+    ["e","sindrome-antifosfolipido","sistema-inmunologico","- Síndrome Antifosfolípido; síntomas: Coágulos de sangre en venas o arterias, Abortos espontáneos recurrentes, Erupción cutánea con un patrón de encaje (livedo reticularis), Accidente cerebrovascular o ataque isquémico transitorio; causas: Producción de anticuerpos que atacan a las proteínas de la sangre, Trastorno autoinmune",82],
+    ["e","enfermedad-de-behcet","sistema-inmunologico","- Enfermedad de Behçet; síntomas: Aftas en la boca, Úlceras genitales, Inflamación ocular (uveítis), Lesiones cutáneas similares al acné; causas: Inflamación de los vasos sanguíneos (vasculitis) de causa desconocida, Factores genéticos y ambientales",63],
+    ["e","espondilitis-aniquilosante","sistema-inmunologico","- Espondilitis Anquilosante; síntomas: Dolor y rigidez en la parte baja de la espalda y caderas, Dolor de cuello, Fatiga, Dolor en la articulación sacroilíaca; causas: Causa desconocida, Factores genéticos",52],
+    ["e","artritis-psoriasica","sistema-inmunologico","- Artritis Psoriásica; síntomas: Dolor, hinchazón y rigidez en las articulaciones, Dedos de manos y pies hinchados (dactilitis), Dolor en los puntos donde los tendones y ligamentos se unen al hueso (entesitis), Lesiones cutáneas de psoriasis; causas: Combinación de factores genéticos y ambientales, Respuesta autoinmune",80],
+    ["e","artritis-reactiva","sistema-inmunologico","- Artritis Reactiva; síntomas: Dolor y rigidez en rodillas, tobillos y pies, Inflamación ocular (conjuntivitis), Problemas urinarios, Hinchazón de los dedos de las manos o de los pies; causas: Infección en los intestinos, los genitales o las vías urinarias, Infección por bacterias (Campylobacter, Chlamydia, Salmonella, etc.)",82],
+    ["e","fiebre-reumatica","sistema-inmunologico","- Fiebre Reumática; síntomas: Fiebre, Dolor en las articulaciones, especialmente en las rodillas, los tobillos, los codos y las muñecas, Carditis (inflamación del corazón), Movimientos corporales espasmódicos e incontrolables (corea de Sydenham); causas: Complicación de una infección de garganta por estreptococos no tratada o tratada de forma inadecuada, Respuesta inmunitaria anormal a la bacteria estreptocócica",104],
+    ["e","uveitis-autoinmune","sistema-inmunologico","- Uveítis Autoinmune; síntomas: Visión borrosa, Dolor ocular, Enrojecimiento del ojo, Sensibilidad a la luz (fotofobia); causas: Reacción del sistema inmunitario contra el propio tejido ocular, Asociación con enfermedades autoinmunes sistémicas (como artritis reumatoide o espondilitis anquilosante)",75],
+    ["e","penfigoide","sistema-inmunologico","- Penfigoide; síntomas: Picazón intensa que puede comenzar semanas o meses antes de que se formen las ampollas, Ampollas grandes y tensas que no se rompen con facilidad, Piel enrojecida o parches similares a la urticaria o eccema, Lesiones o ampollas en la boca u otras membranas mucosas; causas: Es una enfermedad autoinmune en la que el sistema inmunitario ataca la piel, Uso de ciertos medicamentos",101],
+    ["e","liquen-plano","sistema-inmunologico","- Liquen Plano; síntomas: Pequeñas protuberancias planas, de color púrpura y con picazón, Aparecen en muñecas, tobillos, espalda baja y genitales, Líneas blancas finas en las protuberancias (estrías de Wickham), Puede afectar las mucosas (boca) y las uñas; causas: Reacción autoinmune o inflamatoria de causa desconocida, Puede ser desencadenado por infecciones (hepatitis C), alérgenos o medicamentos",101],
+    ["e","urticaria-cronica-idiopatica","sistema-inmunologico","- Urticaria Crónica Idiopática; síntomas: Ronchas o habones que aparecen en cualquier parte del cuerpo, Picazón intensa, Hinchazón dolorosa alrededor de los ojos, mejillas o labios (angioedema), Brotes desencadenados por calor, ejercicio o estrés; causas: Causa a menudo desconocida (idiopática), Infecciones",77],
+    ["e","diabetes-mellitus-tipo-2","sistema-endocrino","- Diabetes Mellitus Tipo 2; síntomas: Aumento de la sed y de la micción, Aumento del apetito, Fatiga, Visión borrosa; causas: Resistencia a la insulina, Factores genéticos y antecedentes familiares",50],
+    ["e","diabetes-mellitus-tipo-1","sistema-endocrino","- Diabetes Mellitus Tipo 1; síntomas: Sed excesiva, Micción frecuente, Pérdida de peso inexplicable, Hambre extrema; causas: Reacción autoinmune que destruye las células beta del páncreas, Predisposición genética",53],
+    ["e","hipotiroidismo","sistema-endocrino","- Hipotiroidismo; síntomas: Fatiga, Aumento de peso, Sensibilidad al frío, Piel seca; causas: Enfermedad de Hashimoto (trastorno autoinmune), Tratamiento previo por hipertiroidismo",45],
+    ["e","hipertiroidismo","sistema-endocrino","- Hipertiroidismo; síntomas: Pérdida de peso involuntaria, Taquicardia (ritmo cardíaco rápido), Nerviosismo y ansiedad, Temblores; causas: Enfermedad de Graves (trastorno autoinmune), Nódulos tiroideos hiperactivos",54],
+    ["e","sindrome-de-ovario-poliquistico","sistema-endocrino","- Síndrome de Ovario Poliquístico; síntomas: Períodos menstruales irregulares o ausentes, Exceso de vello facial y corporal (hirsutismo), Acné severo y piel grasa, Aumento de peso y dificultad para perderlo; causas: Desequilibrio hormonal con altos niveles de andrógenos, Resistencia a la insulina",75],
+    ["e","enfermedad-de-cushing","sistema-endocrino","- Enfermedad de Cushing; síntomas: Aumento de peso con acumulación de grasa en cara y abdomen, Estrías violáceas en la piel, Piel fina y frágil, Debilidad muscular; causas: Uso prolongado de medicamentos corticosteroides, Tumor en la glándula pituitaria (enfermedad de Cushing)",70],
+    ["e","acromegalia","sistema-endocrino","- Acromegalia; síntomas: Agrandamiento de manos y pies, Cambios en los rasgos faciales (mandíbula y frente prominentes), Voz más grave, Dolor en las articulaciones; causas: Producción excesiva de hormona del crecimiento (GH) en la edad adulta, Generalmente causado por un tumor benigno en la glándula pituitaria",78],
+    ["e","enanismo","sistema-endocrino","- Enanismo; síntomas: Baja estatura (muy por debajo del promedio para la edad), Extremidades cortas, Cabeza grande en proporción al cuerpo, Desarrollo motor retrasado; causas: Acondroplasia (mutación genética), Deficiencia de la hormona del crecimiento",63],
+    ["e","gigantismo","sistema-endocrino","- Gigantismo; síntomas: Crecimiento excesivo en altura y tamaño corporal durante la niñez, Manos y pies grandes, Rasgos faciales toscos, Pubertad retrasada; causas: Producción excesiva de hormona del crecimiento (GH) durante la niñez, Generalmente causado por un tumor benigno en la glándula pituitaria",76],
+    ["e","prolactinoma","sistema-endocrino","- Prolactinoma; síntomas: Producción de leche materna fuera del embarazo (galactorrea), Períodos menstruales irregulares o ausentes, Disfunción eréctil en hombres, Dolores de cabeza y problemas de visión; causas: Tumor benigno (adenoma) en la glándula pituitaria que produce prolactina en exceso",74],
+    ["e","sindrome-metabolico","sistema-endocrino","- Síndrome Metabólico; síntomas: Grupo de condiciones: presión arterial alta, azúcar alta en sangre, exceso de grasa abdominal y niveles anormales de colesterol, Aumento de la sed y la micción, Fatiga; causas: Resistencia a la insulina, Sobrepeso y obesidad",65],
+    ["e","osteoporosis","sistema-endocrino","- Osteoporosis; síntomas: Dolor de espalda, Pérdida de estatura con el tiempo, Postura encorvada, Fracturas óseas que ocurren con más facilidad de lo esperado; causas: Envejecimiento, Deficiencia de estrógeno en mujeres menopáusicas",58],
+    ["e","hiperparatiroidismo","sistema-endocrino","- Hiperparatiroidismo; síntomas: Dolor óseo y fracturas fáciles, Cálculos renales, Fatiga y debilidad, Dolor abdominal y náuseas; causas: Tumor benigno (adenoma) en una de las glándulas paratiroides, Agrandamiento de dos o más glándulas paratiroides",63],
+    ["e","hipoparatiroidismo","sistema-endocrino","- Hipoparatiroidismo; síntomas: Hormigueo o entumecimiento en dedos y labios, Calambres y espasmos musculares, Fatiga, Convulsiones; causas: Daño o extirpación de las glándulas paratiroides durante una cirugía de cuello, Trastorno autoinmune",61],
+    ["e","cancer-de-tiroides","sistema-endocrino","- Cáncer de Tiroides; síntomas: Bulto o nódulo en el cuello que crece rápidamente, Ronquera o cambios en la voz, Dificultad para tragar, Dolor en el cuello y la garganta; causas: Exposición a altos niveles de radiación, Antecedentes familiares de cáncer de tiroides",67],
+    ["e","insulinoma","sistema-endocrino","- Insulinoma; síntomas: Ansiedad, cambios en el comportamiento o confusión, visión borrosa, pérdida del conocimiento o coma; causas: Tumor en el páncreas que produce demasiada insulina, Neoplasia endocrina múltiple tipo I",56],
+    ["e","glucagonoma","sistema-endocrino","- Glucagonoma; síntomas: Hiperglucemia (nivel elevado de azúcar en la sangre), Pérdida de peso inexplicable, Erupción cutánea característica (eritema necrolítico migratorio), Diarrea; causas: Desarrollo de un tumor en las células alfa del páncreas, Síndrome de Neoplasia Endocrina Múltiple tipo 1 (MEN1)",76],
+    ["e","feocromocitoma","sistema-endocrino","- Feocromocitoma; síntomas: Presión arterial alta severa y episódica, Dolores de cabeza intensos, Sudoración profusa, Palpitaciones cardíacas; causas: Tumor en las glándulas suprarrenales que produce un exceso de catecolaminas (adrenalina), Asociado a síndromes genéticos",68],
+    ["e","diabetes-insipida","sistema-endocrino","- Diabetes Insípida; síntomas: Sed extrema (polidipsia), Producción de grandes volúmenes de orina diluida (poliuria), Deshidratación, Necesidad de orinar durante la noche (nocturia); causas: Daño a la glándula pituitaria o al hipotálamo, afectando la producción de ADH, Incapacidad de los riñones para responder a la ADH",80],
+    ["e","ginecomastia","sistema-endocrino","- Ginecomastia; síntomas: Agrandamiento del tejido mamario, Dolor y sensibilidad en los senos, Hinchazón en el área del pezón, Secreción del pezón; causas: Desequilibrios hormonales (disminución de testosterona y aumento de estrógeno), Obesidad",61],
+    ["e","galactorrea","sistema-endocrino","- Galactorrea; síntomas: Secreción de leche por el pezón, Períodos menstruales irregulares o ausentes, Dolores de cabeza, Sequedad vaginal; causas: Tumor benigno en la glándula pituitaria (prolactinoma), Efectos secundarios de ciertos medicamentos",62],
+    ["e","pubertad-precoz","sistema-endocrino","- Pubertad Precoz; síntomas: Desarrollo de senos antes de los 8 años en niñas, Agrandamiento de testículos antes de los 9 años en niños, Aparición temprana de vello púbico y axilar, Estirón de crecimiento temprano; causas: Activación temprana del eje hipotálamo-hipófisis-gónadas, Tumores en los ovarios, testículos o glándulas suprarrenales",86],
+    ["e","retraso-de-la-pubertad","sistema-endocrino","- Retraso de la Pubertad; síntomas: Falta de desarrollo de los senos en las niñas después de los 13 años, Falta de aumento del tamaño de los testículos en los niños después de los 14 años, Ausencia de vello púbico, Baja estatura en comparación con sus compañeros; causas: Antecedentes familiares de pubertad tardía, Enfermedades crónicas (como diabetes o fibrosis quística)",94],
+    ["e","sindrome-de-kallmann","sistema-endocrino","- Síndrome de Kallmann; síntomas: Pubertad retrasada o ausente, Sentido del olfato disminuido o ausente (anosmia o hiposmia), Micropene y criptorquidia en niños, Amenorrea primaria en mujeres; causas: Mutaciones genéticas hereditarias, Deficiencia de la hormona liberadora de gonadotropina (GnRH)",74],
+    ["e","sindrome-de-turner","sistema-endocrino","- Síndrome de Turner; síntomas: Baja estatura, Falta de desarrollo de los ovarios, Defectos cardíacos, Cuello ancho o palmeado; causas: Monosomía del cromosoma X, Mosaicismo del cromosoma X",48],
+    ["e","sindrome-de-klinefelter","sistema-endocrino","- Síndrome de Klinefelter; síntomas: Testículos y pene pequeños, Crecimiento de los senos (ginecomastia), Menos vello facial y corporal, Tono muscular reducido; causas: Error aleatorio en la división celular (meiosis) durante la formación de las células reproductoras (óvulos o espermatozoides), Presencia de un cromosoma X adicional en cada célula (cariotipo 47,XXY)",92],
+    ["e","hiperplasia-suprarrenal-congenita","sistema-endocrino","- Hiperplasia Suprarrenal Congénita; síntomas: Crecimiento rápido, Aparición temprana de vello púbico y axilar, Voz grave, Acné grave; causas: Deficiencia de la enzima 21-hidroxilasa, Mutaciones genéticas hereditarias",55],
+    ["e","neoplasia-endocrina-multiple-tipo-1","sistema-endocrino","- Neoplasia Endocrina Múltiple Tipo 1; síntomas: Fatiga y debilidad, Dolor óseo, Fracturas óseas, Cálculos renales; causas: Mutaciones en el gen MEN1, Ser un síndrome autosómico dominante",47],
+    ["e","neoplasia-endocrina-multiple-tipo-2","sistema-endocrino","- Neoplasia Endocrina Múltiple Tipo 2; síntomas: Bultos en la garganta o el cuello, Dificultad para respirar o tragar, Ronquera, Diarrea; causas: Afección hereditaria, Gen alterado",45],
+    ["e","bocio","sistema-endocrino","- Bocio; síntomas: Hinchazón visible en la base del cuello, Sensación de opresión en la garganta, Dificultad para tragar o respirar, Tos; causas: Deficiencia de yodo, Enfermedad de Hashimoto o de Graves",51],
+    ["e","resistencia-a-la-hormona-tiroidea","sistema-endocrino","- Resistencia a la Hormona Tiroidea; síntomas: Bocio, Taquicardia, Trastornos del desarrollo (baja estatura, retraso en la dentición, sordera), Trastornos del sistema nervioso central (trastornos del aprendizaje, hiperactividad, déficit de atención); causas: Mutaciones genéticas en el receptor de la hormona tiroidea (TRβ), Alteraciones en el transporte celular de las hormonas tiroideas",97],
+    ["e","artritis","sistema-musculoesqueletico","- Artritis; síntomas: Dolor articular, Rigidez articular, Hinchazón en las articulaciones, Enrojecimiento de la piel alrededor de la articulación; causas: Desgaste del cartílago (osteoartritis), Enfermedad autoinmune (artritis reumatoide)",60],
+    ["e","osteomalacia","sistema-musculoesqueletico","- Osteomalacia; síntomas: Dolor óseo difuso, Debilidad muscular, Dificultad para caminar, Fracturas frecuentes; causas: Deficiencia severa de vitamina D, Problemas de absorción de vitamina D en el intestino",52],
+    ["e","sindrome-del-tunel-carpiano","sistema-musculoesqueletico","- Síndrome del túnel carpiano; síntomas: Hormigueo o entumecimiento en la mano y los dedos, Dolor en la muñeca o la mano, Debilidad en la mano, Sensación de descarga eléctrica en los dedos; causas: Presión sobre el nervio mediano en la muñeca, Movimientos repetitivos de la mano y la muñeca",73],
+    ["e","tendinitis","sistema-musculoesqueletico","- Tendinitis; síntomas: Dolor en un tendón, especialmente con el movimiento, Sensibilidad al tacto en el área afectada, Hinchazón leve, Sensación de crepitación o crujido al mover el tendón; causas: Sobrecarga o uso excesivo de un tendón, Lesión repentina",64],
+    ["e","desgarro-del-manguito-rotatorio","sistema-musculoesqueletico","- Desgarro del manguito rotatorio; síntomas: Dolor sordo y profundo en el hombro, Dificultad para levantar el brazo, Debilidad en el hombro, Dolor que empeora por la noche; causas: Lesión traumática, Desgaste gradual por el envejecimiento",60],
+    ["e","bursitis","sistema-musculoesqueletico","- Bursitis; síntomas: Dolor articular, Sensibilidad en la articulación, Hinchazón y enrojecimiento, Rigidez en la articulación; causas: Movimientos repetitivos o presión prolongada sobre una articulación, Lesión o traumatismo",57],
+    ["e","distrofia-muscular","sistema-musculoesqueletico","- Distrofia muscular; síntomas: Debilidad muscular progresiva, Caídas frecuentes, Dificultad para levantarse o correr, Músculos de la pantorrilla agrandados; causas: Mutaciones genéticas que interfieren con la producción de proteínas musculares, Herencia familiar",66],
+    ["e","calambre-muscular","sistema-musculoesqueletico","- Calambre muscular; síntomas: Contracción muscular súbita e involuntaria, Dolor agudo y localizado, Nudo muscular palpable; causas: Deshidratación, Fatiga muscular",41],
+    ["e","enfermedades-neuromusculares","sistema-musculoesqueletico","- Enfermedades neuromusculares; síntomas: Debilidad muscular, Espasmos musculares, calambres o tics, Pérdida de masa muscular, Dificultad para moverse, hablar o respirar; causas: Mutaciones genéticas, Trastornos autoinmunes",56],
+    ["e","fibromialgia","sistema-musculoesqueletico","- Fibromialgia; síntomas: Dolor musculoesquelético generalizado, Fatiga, Problemas de sueño, Dificultades cognitivas (fibroniebla); causas: Factores genéticos, Infecciones previas",45],
+    ["e","miastenia-grave","sistema-musculoesqueletico","- Miastenia grave; síntomas: Caída de uno o ambos párpados (ptosis), Visión doble (diplopía), Dificultad para hablar, Problemas para tragar; causas: Producción de anticuerpos que bloquean o destruyen los receptores musculares de acetilcolina, Problemas en la glándula del timo",69],
+    ["e","miositis","sistema-musculoesqueletico","- Miositis; síntomas: Debilidad muscular progresiva, Dolor muscular, Fatiga, Dificultad para tragar o respirar; causas: Enfermedad autoinmune, Infección (viral o bacteriana)",44],
+    ["e","sarcoma-de-tejido-blando","sistema-musculoesqueletico","- Sarcoma de tejido blando; síntomas: Bulto o hinchazón notable, Dolor, si el bulto presiona nervios o músculos, Dolor abdominal, Sangre en las heces o en el vómito; causas: Síndromes genéticos hereditarios, Exposición a la radiación",59],
+    ["e","enfermedad-discal-degenerativa","sistema-musculoesqueletico","- Enfermedad discal degenerativa; síntomas: Dolor en la espalda, cuello, brazos o piernas, Entumecimiento y hormigueo en brazos y piernas, Debilidad en los músculos de las piernas, Dolor que empeora al estar sentado, de pie o caminando por períodos prolongados; causas: Desgaste natural de los discos por envejecimiento, Lesiones o traumatismos en la columna",90],
+    ["e","epicondilitis","sistema-musculoesqueletico","- Epicondilitis; síntomas: Dolor desde la parte exterior del codo hacia el antebrazo y la muñeca, Debilidad para estrechar las manos o sujetar un objeto, Dificultad para girar la perilla de una puerta, Dificultad para sostener una taza de café; causas: Uso excesivo de la articulación y torsión muscular, Tensión repetida de los músculos del antebrazo",88],
+    ["e","distension-muscular","sistema-musculoesqueletico","- Distensión muscular; síntomas: Dolor y dificultad de movimiento, Hinchazón y hematomas, Sensibilidad al tacto, Espasmos musculares; causas: Actividad física o esfuerzo excesivo, Calentamiento inadecuado antes de la actividad física",59],
+    ["e","gota","sistema-musculoesqueletico","- Gota; síntomas: Dolor articular intenso y repentino, Hinchazón y enrojecimiento de la articulación, Sensibilidad extrema en la articulación afectada, Calor en la articulación; causas: Acumulación de cristales de urato en una articulación, Niveles elevados de ácido úrico en la sangre",72],
+    ["e","espondilitis-anquilosante","sistema-musculoesqueletico","- Espondilitis anquilosante; síntomas: Dolor y rigidez en la parte baja de la espalda y las caderas, Dolor que empeora con el descanso y mejora con la actividad, Fatiga, Pérdida de flexibilidad en la columna; causas: Enfermedad autoinmune inflamatoria, Factor genético (presencia del gen HLA-B27)",74],
+    ["e","osteopenia","sistema-musculoesqueletico","- Osteopenia; síntomas: Generalmente asintomática, Dolor de espalda, Pérdida de estatura con el tiempo, Postura encorvada; causas: Antecedentes familiares de osteopenia u osteoporosis, Ser de talla pequeña y delgada",54],
+    ["e","lumbalgia","sistema-musculoesqueletico","- Lumbalgia; síntomas: Dolor localizado en la parte baja de la espalda, Rigidez en la espalda, Espasmos musculares, Dolor que se irradia hacia los glúteos o las piernas; causas: Distensión muscular o de ligamentos, Hernia de disco o disco degenerado",63],
+    ["e","fracturas-oseas","sistema-musculoesqueletico","- Fracturas Óseas; síntomas: Dolor intenso, Hinchazón y hematomas, Deformidad visible de la extremidad, Incapacidad para mover la extremidad afectada; causas: Traumatismos (caídas, accidentes automovilísticos, lesiones deportivas), Osteoporosis",61],
+    ["e","escoliosis","sistema-musculoesqueletico","- Escoliosis; síntomas: Curvatura lateral de la columna vertebral, Hombros o caderas desiguales, Un omóplato que parece más prominente que el otro, Dolor de espalda; causas: Idiopática (causa desconocida) en la mayoría de los casos, Afecciones neuromusculares como la parálisis cerebral",72],
+    ["e","ciatica","sistema-musculoesqueletico","- Ciática; síntomas: Dolor que se irradia desde la espalda baja hacia la pierna, Entumecimiento u hormigueo en la pierna o el pie, Debilidad en la pierna o el pie, Dolor agudo o punzante; causas: Hernia de disco, Estenosis espinal",58],
+    ["e","quiste-de-baker","sistema-musculoesqueletico","- Quiste de Baker; síntomas: Hinchazón o bulto detrás de la rodilla, Dolor en la rodilla, Sensación de tirantez o rigidez detrás de la rodilla, Dificultad para flexionar la rodilla; causas: Artritis (especialmente osteoartritis), Lesión de rodilla (como desgarros de meniscos)",69],
+    ["e","dedo-en-gatillo","sistema-musculoesqueletico","- Dedo en gatillo; síntomas: Rigidez en el dedo, especialmente por la mañana, Sensación de chasquido o crujido al mover el dedo, Sensibilidad o un bulto en la palma de la mano, en la base del dedo afectado, El dedo se queda atascado o trabado en la posición de flexión y se estira con un chasquido de manera repentina; causas: Agarre reiterado, Diabetes",89],
+    ["e","sindrome-del-tunel-tarsiano","sistema-musculoesqueletico","- Síndrome del túnel tarsiano; síntomas: Dolor en el tobillo, pie y dedos, Hormigueo o ardor en la planta del pie, Entumecimiento en el pie, Debilidad en los músculos del pie; causas: Compresión del nervio tibial posterior, Lesiones en el tobillo",62],
+    ["e","enfermedad-de-de-quervain","sistema-musculoesqueletico","- Enfermedad de De Quervain; síntomas: Dolor cerca de la base del pulgar, Hinchazón cerca de la base del pulgar, Dificultad para mover el pulgar y la muñeca, Dolor en un costado de la muñeca bajo la base del pulgar; causas: Movimientos repetitivos de la mano o la muñeca, Lesión en la muñeca o el tendón",76],
+    ["e","sindrome-de-ehlers-danlos","sistema-musculoesqueletico","- Síndrome de Ehlers-Danlos; síntomas: Articulaciones flexibles en exceso, Piel elástica, Piel frágil que se daña con facilidad, Dolor en las articulaciones y dislocaciones frecuentes; causas: Trastorno hereditario del tejido conectivo, Mutaciones en diversos genes responsables de la síntesis de colágeno",77],
+    ["e","displasia-fibrosa","sistema-musculoesqueletico","- Displasia fibrosa; síntomas: Dolor óseo, Lesiones óseas, Problemas hormonales, Fracturas o deformidades óseas; causas: Mutación genética espontánea que afecta a las células productoras de hueso, Ocurre durante el desarrollo fetal",58],
+    ["e","lesiones-de-la-placa-de-crecimiento","sistema-musculoesqueletico","- Lesiones de la placa de crecimiento; síntomas: Dolor con o sin palpación, Imposibilidad de mover el área afectada, Calor e hinchazón en el extremo de un hueso, Deformidad visible en brazos o piernas; causas: Caídas o golpes en la extremidad, Accidentes automovilísticos",68],
+    ["e","osteoartritis","sistema-musculoesqueletico","- Osteoartritis; síntomas: Dolor en las articulaciones durante o después del movimiento, Rigidez articular, especialmente por la mañana, Pérdida de flexibilidad, Sensación de chirrido en la articulación; causas: Desgaste del cartílago protector en los extremos de los huesos, Envejecimiento",73],
+    ["e","artrosis","sistema-musculoesqueletico","- Artrosis; síntomas: Dolor en las articulaciones, Rigidez, Hinchazón, Crujidos en la articulación; causas: Envejecimiento, Sobrepeso u obesidad",36],
+    ["e","contractura-muscular","sistema-musculoesqueletico","- Contractura muscular; síntomas: Dolor y rigidez articular y muscular, Movimientos reducidos, Debilidad muscular, Dolor localizado; causas: Sobreesfuerzo físico o sobreuso muscular, Movimientos bruscos",51],
+    ["e","infeccion-urinaria","sistema-urinario","- Infección Urinaria; síntomas: Dolor o ardor al orinar, Necesidad frecuente de orinar, Orina turbia o con mal olor, Dolor en la parte baja del abdomen; causas: Bacterias que ingresan a la uretra, Relaciones sexuales",54],
+    ["e","cistitis","sistema-urinario","- Cistitis; síntomas: Necesidad urgente de orinar, Sensación de ardor al orinar, Orina turbia o con sangre, Molestias en la parte inferior del abdomen; causas: Infección bacteriana (E. coli), Irritación por productos químicos",57],
+    ["e","pielonefritis","sistema-urinario","- Pielonefritis; síntomas: Fiebre alta y escalofríos, Dolor en la espalda o el costado, Náuseas y vómitos, Orina turbia o con mal olor; causas: Infección urinaria no tratada, Obstrucción del tracto urinario",52],
+    ["e","calculos-renales","sistema-urinario","- Cálculos Renales; síntomas: Dolor intenso en la espalda o el costado, Sangre en la orina, Náuseas y vómitos, Necesidad frecuente de orinar; causas: Acumulación de minerales y sales en la orina, Deshidratación crónica",55],
+    ["e","incontinencia-urinaria","sistema-urinario","- Incontinencia Urinaria; síntomas: Pérdida involuntaria de orina, Necesidad repentina y fuerte de orinar, Goteo de orina después de orinar; causas: Debilitamiento de los músculos del suelo pélvico, Daño a los nervios de la vejiga",58],
+    ["e","insuficiencia-renal","sistema-urinario","- Insuficiencia Renal; síntomas: Disminución del volumen de orina, Hinchazón en las piernas y los pies, Fatiga y debilidad, Náuseas y vómitos; causas: Daño renal agudo, Enfermedad renal crónica",49],
+    ["e","enfermedad-renal-cronica","sistema-urinario","- Enfermedad Renal Crónica; síntomas: Fatiga y debilidad, Hinchazón en las piernas y los pies, Cambios en la frecuencia urinaria, Presión arterial alta; causas: Diabetes, Presión arterial alta",48],
+    ["e","uretritis","sistema-urinario","- Uretritis; síntomas: Ardor al orinar, Secreción del pene o la vagina, Necesidad frecuente de orinar, Picazón o irritación en la uretra; causas: Infecciones de transmisión sexual (ITS), Infecciones bacterianas no transmitidas sexualmente",60],
+    ["e","nefritis","sistema-urinario","- Nefritis; síntomas: Sangre en la orina, Hinchazón en la cara, las manos y los pies, Presión arterial alta, Disminución del volumen de orina; causas: Infecciones, Enfermedades autoinmunes",47],
+    ["e","nefrosis","sistema-urinario","- Nefrosis; síntomas: Hinchazón generalizada (edema), Orina espumosa, Aumento de peso por retención de líquidos, Fatiga; causas: Daño a los glomérulos renales, Enfermedades sistémicas como la diabetes",50],
+    ["e","hidronefrosis","sistema-urinario","- Hidronefrosis; síntomas: Dolor en el costado y la espalda, Náuseas y vómitos, Infecciones urinarias frecuentes, Fiebre; causas: Obstrucción del tracto urinario, Cálculos renales",45],
+    ["e","vejiga-neurogenica","sistema-urinario","- Vejiga Neurogénica; síntomas: Incontinencia urinaria, Dificultad para vaciar la vejiga, Infecciones urinarias frecuentes, Goteo de orina; causas: Lesiones de la médula espinal, Esclerosis múltiple",50],
+    ["e","nocturia","sistema-urinario","- Nocturia; síntomas: Despertarse dos o más veces por la noche para orinar, Interrupción del sueño, Fatiga diurna; causas: Consumo excesivo de líquidos antes de dormir, Agrandamiento de la próstata",50],
+    ["e","cistitis-intersticial","sistema-urinario","- Cistitis Intersticial; síntomas: Dolor pélvico crónico, Necesidad urgente y frecuente de orinar, Dolor durante las relaciones sexuales; causas: Causa desconocida, Posiblemente autoinmune",47],
+    ["e","cancer-de-vejiga","sistema-urinario","- Cáncer de Vejiga; síntomas: Sangre en la orina (hematuria), Necesidad frecuente de orinar, Dolor al orinar, Dolor de espalda; causas: Tabaquismo, Exposición a productos químicos industriales",48],
+    ["e","cancer-de-rinon","sistema-urinario","- Cáncer de Riñón; síntomas: Sangre en la orina, Dolor en el costado que no desaparece, Pérdida de peso inexplicable, Fiebre; causas: Tabaquismo, Obesidad",39],
+    ["e","enfermedad-poliquistica-renal","sistema-urinario","- Enfermedad Poliquística Renal; síntomas: Presión arterial alta, Dolor de espalda o en los costados, Sangre en la orina, Sensación de plenitud en el abdomen; causas: Trastorno genético hereditario, Mutaciones en los genes PKD1 o PKD2",59],
+    ["e","glomerulonefritis","sistema-urinario","- Glomerulonefritis; síntomas: Orina de color rosa o cola (por la sangre), Orina espumosa (por el exceso de proteína), Hinchazón en la cara, las manos, los pies y el abdomen, Presión arterial alta; causas: Infecciones (estreptococos, hepatitis), Enfermedades autoinmunes (lupus)",70],
+    ["e","sindrome-nefrotico","sistema-urinario","- Síndrome Nefrótico; síntomas: Hinchazón grave (edema), Orina espumosa, Aumento de peso por retención de líquidos, Fatiga; causas: Daño a los glomérulos renales, Diabetes",43],
+    ["e","estenosis-de-la-arteria-renal","sistema-urinario","- Estenosis de la Arteria Renal; síntomas: Presión arterial alta difícil de controlar, Sonido sibilante en los vasos sanguíneos, Aumento de proteínas en la orina, Empeoramiento de la función renal; causas: Aterosclerosis, Displasia fibromuscular",62],
+    ["e","acidosis-tubular-renal","sistema-urinario","- Acidosis Tubular Renal; síntomas: Fatiga, Debilidad muscular, Crecimiento deficiente en niños, Cálculos renales; causas: Trastornos genéticos, Enfermedades autoinmunes",43],
+    ["e","reflujo-vesicoureteral","sistema-urinario","- Reflujo Vesicoureteral; síntomas: Infecciones urinarias recurrentes, Fiebre, Dolor abdominal, Necesidad frecuente de orinar; causas: Anomalía congénita de las válvulas ureterales, Obstrucción de la vejiga",52],
+    ["e","extrofia-vesical","sistema-urinario","- Extrofia Vesical; síntomas: Vejiga visible fuera del abdomen, Huesos púbicos ensanchados, Piernas y pies girados hacia afuera, Músculos abdominales anormales; causas: Defecto del desarrollo fetal, Cierre inadecuado de la pared abdominal inferior",62],
+    ["e","hipospadias","sistema-urinario","- Hipospadias; síntomas: Abertura de la uretra en la parte inferior del pene, Curvatura del pene hacia abajo, Apariencia encapuchada del pene, Salpicaduras anormales al orinar; causas: Antecedentes familiares, Genética",55],
+    ["e","epispadias","sistema-urinario","- Epispadias; síntomas: Pene corto y ensanchado con una curvatura anormal, Abertura de la uretra en la parte superior o lateral del pene, Clítoris y labios vaginales anormales, Incontinencia urinaria; causas: Causa desconocida, Desarrollo inadecuado del hueso púbico",67],
+    ["e","sindrome-uremico-hemolitico","sistema-urinario","- Síndrome Urémico Hemolítico; síntomas: Diarrea con sangre, Dolor de estómago, Fiebre, Vómitos; causas: Infección por E. coli, Infecciones bacterianas o virales",41],
+    ["e","nefropatia-por-iga","sistema-urinario","- Nefropatía por IgA; síntomas: Sangre en la orina, Orina espumosa, Hinchazón en manos y pies, Presión arterial alta; causas: Acumulación de la inmunoglobulina A (IgA) en los riñones, Factor genético",50],
+    ["e","vasculitis-renal","sistema-urinario","- Vasculitis Renal; síntomas: Sangre en la orina, Orina espumosa, Hinchazón de las piernas o los pies, Sarpullido en las nalgas o la parte inferior de las piernas; causas: Reacción a un medicamento, Infecciones como la hepatitis B y la hepatitis C",62],
+    ["e","estenosis-uretral","sistema-urinario","- Estenosis Uretral; síntomas: Chorro de orina débil, Dificultad para empezar a orinar, Goteo después de orinar, Infecciones urinarias; causas: Lesiones o traumatismos en la uretra, Infecciones de transmisión sexual",54],
+    ["e","endometriosis","sistema-reproductor","- Endometriosis; síntomas: Dolor pélvico intenso, especialmente durante la menstruación, Períodos menstruales abundantes o irregulares, Dolor durante o después de las relaciones sexuales, Infertilidad; causas: Crecimiento de tejido similar al endometrio fuera del útero, Factores genéticos y hereditarios",76],
+    ["e","enfermedad-inflamatoria-pelvica","sistema-reproductor","- Enfermedad Inflamatoria Pélvica (EIP); síntomas: Dolor en la parte baja del abdomen y la pelvis, Flujo vaginal anormal con mal olor, Sangrado entre períodos o después de las relaciones sexuales, Fiebre y escalofríos; causas: Infección bacteriana que asciende desde la vagina o el cuello uterino, Infecciones de transmisión sexual (ITS) no tratadas, como clamidia y gonorrea",94],
+    ["e","fibromas-uterinos","sistema-reproductor","- Fibromas Uterinos; síntomas: Sangrado menstrual abundante y prolongado, Presión o dolor pélvico, Necesidad de orinar con frecuencia, Estreñimiento y dolor de espalda; causas: Crecimiento no canceroso de tejido muscular en el útero, Factores hormonales, especialmente estrógeno y progesterona",74],
+    ["e","cancer-de-ovario","sistema-reproductor","- Cáncer de Ovario; síntomas: Hinchazón o inflamación abdominal persistente, Sensación de saciedad rápida al comer, Dolor pélvico o abdominal, Necesidad de orinar con más frecuencia o urgencia; causas: Mutaciones genéticas hereditarias (BRCA1 y BRCA2), Antecedentes familiares de cáncer de ovario, mama o colorrectal",79],
+    ["e","cancer-de-cuello-uterino","sistema-reproductor","- Cáncer de Cuello Uterino; síntomas: Sangrado vaginal anormal (entre períodos, después de las relaciones sexuales o después de la menopausia), Flujo vaginal inusual, a veces con sangre, Dolor pélvico o durante las relaciones sexuales, Problemas para orinar o defecar; causas: Infección persistente por el virus del papiloma humano (VPH), Sistema inmunitario debilitado",93],
+    ["e","prolapso-de-organos-pelvicos","sistema-reproductor","- Prolapso de Órganos Pélvicos; síntomas: Sensación de pesadez o presión en la pelvis, Bulto o protuberancia en la vagina, Incontinencia urinaria o fecal, Dificultad para vaciar la vejiga o los intestinos; causas: Debilitamiento de los músculos y ligamentos del suelo pélvico, Embarazo y parto vaginal",76],
+    ["e","vaginosis-bacteriana","sistema-reproductor","- Vaginosis Bacteriana; síntomas: Flujo vaginal anormal (blanco o grisáceo), Olor vaginal fuerte y desagradable (a pescado), Picazón o irritación vaginal, Ardor al orinar; causas: Desequilibrio de la flora bacteriana normal de la vagina, Duchas vaginales frecuentes",67],
+    ["e","candidiasis-vaginal","sistema-reproductor","- Candidiasis Vaginal; síntomas: Picazón y ardor intensos en la vagina y la vulva, Flujo vaginal espeso, blanco y grumoso (similar al requesón), Enrojecimiento e hinchazón de la vulva, Dolor durante las relaciones sexuales; causas: Crecimiento excesivo del hongo Candida albicans, Uso de antibióticos",75],
+    ["e","menopausia","sistema-reproductor","- Menopausia; síntomas: Sofocos y sudores nocturnos, Irregularidades menstruales hasta el cese de la menstruación, Sequedad vaginal y disminución de la libido, Cambios de humor, irritabilidad y problemas para dormir; causas: Disminución natural de la producción de estrógeno y progesterona por los ovarios, Envejecimiento (generalmente entre los 45 y 55 años)",90],
+    ["e","sindrome-premenstrual","sistema-reproductor","- Síndrome Premenstrual (SPM); síntomas: Hinchazón y sensibilidad en los senos, Cambios de humor, irritabilidad y ansiedad, Fatiga y dificultad para concentrarse, Antojos de alimentos y aumento de peso; causas: Fluctuaciones hormonales del ciclo menstrual, Cambios en los niveles de serotonina en el cerebro",77],
+    ["e","disfuncion-erectil","sistema-reproductor","- Disfunción Eréctil; síntomas: Dificultad para lograr una erección, Dificultad para mantener una erección, Disminución del deseo sexual; causas: Enfermedades cardíacas y vasculares, Diabetes y obesidad",51],
+    ["e","prostatitis","sistema-reproductor","- Prostatitis; síntomas: Dolor o ardor al orinar, Dificultad para orinar, como goteo o vacilación urinaria, Dolor en la ingle, el área pélvica o los genitales, Eyaculación dolorosa; causas: Infección bacteriana que se disemina desde el tracto urinario, Inflamación no bacteriana",70],
+    ["e","hiperplasia-prostatica-benigna","sistema-reproductor","- Hiperplasia Prostática Benigna (HPB); síntomas: Necesidad de orinar con frecuencia, especialmente por la noche, Dificultad para comenzar a orinar, Chorro de orina débil o que se detiene y comienza, Goteo al final de la micción; causas: Agrandamiento no canceroso de la glándula prostática, Cambios hormonales relacionados con el envejecimiento (disminución de testosterona)",94],
+    ["e","cancer-de-prostata","sistema-reproductor","- Cáncer de Próstata; síntomas: Dificultad para comenzar a orinar, Flujo de orina débil o interrumpido, Necesidad de orinar con frecuencia, especialmente por la noche, Sangre en la orina o en el semen; causas: Edad avanzada (el riesgo aumenta después de los 50 años), Antecedentes familiares de cáncer de próstata",79],
+    ["e","cancer-de-testiculo","sistema-reproductor","- Cáncer de Testículo; síntomas: Bulto o hinchazón indolora en un testículo, Sensación de pesadez en el escroto, Dolor sordo en el abdomen o la ingle, Acumulación repentina de líquido en el escroto; causas: Criptorquidia (testículo no descendido), Antecedentes familiares de cáncer de testículo",74],
+    ["e","varicocele","sistema-reproductor","- Varicocele; síntomas: Venas agrandadas y retorcidas en el escroto (a menudo descritas como una 'bolsa de gusanos'), Dolor sordo o molestia en el escroto, Atrofia testicular (encogimiento de un testículo), Infertilidad; causas: Mal funcionamiento de las válvulas dentro de las venas del cordón espermático, Compresión de una vena por una estructura cercana",90],
+    ["e","hidrocele","sistema-reproductor","- Hidrocele; síntomas: Hinchazón indolora de uno o ambos testículos, Sensación de pesadez en el escroto, El tamaño de la hinchazón puede variar a lo largo del día; causas: Acumulación de líquido en la túnica que rodea el testículo, Obstrucción del flujo de líquido o sangre en el cordón espermático",75],
+    ["e","epididimitis","sistema-reproductor","- Epididimitis; síntomas: Dolor y sensibilidad en un testículo, que empeora gradualmente, Escroto hinchado, enrojecido o caliente, Dolor al orinar o necesidad urgente de orinar, Secreción del pene; causas: Infección bacteriana, a menudo por ITS como clamidia o gonorrea, Infección del tracto urinario o de la próstata",80],
+    ["e","orquitis","sistema-reproductor","- Orquitis; síntomas: Hinchazón y dolor intenso en uno o ambos testículos, Fiebre y malestar general, Náuseas y vómitos, Sensibilidad extrema en el escroto; causas: Infección viral, más comúnmente por el virus de las paperas, Infección bacteriana, a menudo como resultado de una epididimitis no tratada",76],
+    ["e","infertilidad","sistema-reproductor","- Infertilidad; síntomas: Incapacidad para concebir, Períodos menstruales irregulares o ausentes, Dolor pélvico crónico, Cambios en el deseo sexual; causas: Trastornos de la ovulación, Anomalías en el útero o el cuello uterino",57],
+    ["e","clamidia","sistema-reproductor","- Clamidia; síntomas: A menudo es asintomática, Secreción anormal del pene o la vagina, Sensación de ardor al orinar, Dolor en la parte baja del abdomen o dolor testicular; causas: Infección por la bacteria Chlamydia trachomatis, Relaciones sexuales vaginales, anales u orales sin protección con una persona infectada",80],
+    ["e","gonorrea","sistema-reproductor","- Gonorrea; síntomas: Secreción anormal del pene (blanca, amarilla o verde) o aumento del flujo vaginal, Dolor o ardor al orinar, Dolor e hinchazón en los testículos (en hombres), Sangrado entre períodos (en mujeres); causas: Infección por la bacteria Neisseria gonorrhoeae, Relaciones sexuales vaginales, anales u orales sin protección con una persona infectada",91],
+    ["e","herpes-genital","sistema-reproductor","- Herpes Genital; síntomas: Dolor o picazón en el área genital, glúteos o muslos internos, Pequeñas ampollas o úlceras dolorosas, Costras que se forman cuando las úlceras sanan, Síntomas similares a la gripe, como fiebre y dolores musculares; causas: Infección por el virus del herpes simple (VHS-1 o VHS-2), Contacto sexual con una persona infectada, incluso si no tiene llagas visibles",97],
+    ["e","virus-del-papiloma-humano","sistema-reproductor","- Virus del Papiloma Humano (VPH); síntomas: A menudo es asintomática, Verrugas genitales (pequeñas protuberancias o grupos de protuberancias en el área genital), Verrugas en otras áreas como las manos o los pies, En casos de alto riesgo, puede llevar a cáncer cervical, anal, de pene o de garganta; causas: Infección por el virus del papiloma humano (VPH), Contacto piel con piel durante la actividad sexual con una persona infectada",109],
+    ["e","sifilis","sistema-reproductor","- Sífilis; síntomas: Aparición de una úlcera indolora (chancro) en los genitales, recto o boca, Erupción cutánea que no pica, a menudo en las palmas de las manos y las plantas de los pies, Fiebre, inflamación de los ganglios linfáticos y dolor de garganta, En etapas tardías, puede causar daño neurológico y cardiovascular; causas: Infección por la bacteria Treponema pallidum, Contacto directo con una llaga de sífilis durante la actividad sexual",112],
+    ["e","tricomoniasis","sistema-reproductor","- Tricomoniasis; síntomas: Secreción vaginal anormal (amarillenta-verdosa, espumosa y con mal olor), Picazón, ardor o enrojecimiento en la zona genital, Dolor o molestias al orinar, Dolor durante las relaciones sexuales; causas: Infección por el parásito protozoario Trichomonas vaginalis, Transmisión a través de relaciones sexuales sin protección",87],
+    ["e","embarazo-ectopico","sistema-reproductor","- Embarazo Ectópico; síntomas: Sangrado vaginal anormal, Dolor agudo en el abdomen, la pelvis, el hombro o el cuello, Mareos o desmayos, Dolor en un lado de la pelvis; causas: Daño en las trompas de Falopio, Enfermedad inflamatoria pélvica (EIP)",62],
+    ["e","preeclampsia","sistema-reproductor","- Preeclampsia; síntomas: Presión arterial alta, Proteína en la orina, Hinchazón de manos, pies y cara, Dolores de cabeza que no desaparecen; causas: Embarazo múltiple, Obesidad",45],
+    ["e","placenta-previa","sistema-reproductor","- Placenta Previa; síntomas: Sangrado vaginal de color rojo brillante sin dolor, Manchas de sangre antes de una hemorragia mayor, Contracciones uterinas prematuras y dolorosas, Sangrado postcoital o durante un examen médico; causas: Cesárea previa, Cicatrices uterinas por cirugías anteriores",73],
+    ["e","aborto-espontaneo","sistema-reproductor","- Aborto Espontáneo; síntomas: Sangrado vaginal con o sin dolor, Dolor o calambres en la zona pélvica o en la parte baja de la espalda, Líquido o tejido que sale de la vagina, Latidos rápidos del corazón; causas: Genes o cromosomas irregulares, Afecciones de salud materna",68],
+    ["e","dispareunia","sistema-reproductor","- Dispareunia; síntomas: Dolor durante la penetración sexual, Dolor profundo en la pelvis durante el coito, Ardor o picazón en la zona genital, Disminución de la lubricación vaginal; causas: Sequedad vaginal por falta de lubricación, Infecciones vaginales o del tracto urinario",70],
+    ["e","eyaculacion-precoz","sistema-reproductor","- Eyaculación Precoz; síntomas: Eyaculación que ocurre siempre o casi siempre antes o dentro del primer minuto de la penetración, Incapacidad para retrasar la eyaculación, Angustia y frustración, que llevan a evitar la intimidad sexual; causas: Factores psicológicos como ansiedad de rendimiento o depresión, Niveles hormonales anormales",85],
+    ["e","anorgasmia","sistema-reproductor","- Anorgasmia; síntomas: Retraso del orgasmo, Ausencia del orgasmo, Menos orgasmos, Orgasmos menos intensos; causas: Factores psicológicos como abuso o trauma, Problemas en la relación de pareja",49],
+    ["e","acne","enfermedades-de-la-piel","- Acné; síntomas: Espinillas y puntos negros, Piel grasa, Pústulas o granos con pus, Nódulos y quistes dolorosos bajo la piel; causas: Producción excesiva de sebo por las glándulas sebáceas, Obstrucción de los folículos pilosos por células muertas y sebo",64],
+    ["e","eczema","enfermedades-de-la-piel","- Eczema; síntomas: Piel seca y sensible, Picazón intensa, Enrojecimiento e inflamación, Piel escamosa o con costras; causas: Predisposición genética y antecedentes familiares, Respuesta anormal del sistema inmunitario",55],
+    ["e","dermatitis-de-contacto","enfermedades-de-la-piel","- Dermatitis de contacto; síntomas: Erupción roja en la zona de contacto, Picazón y ardor intensos, Ampollas que pueden supurar, Piel seca, agrietada o escamosa; causas: Contacto directo con una sustancia irritante (jabones, químicos), Reacción alérgica a una sustancia (níquel, cosméticos, plantas)",75],
+    ["e","urticaria","enfermedades-de-la-piel","- Urticaria; síntomas: Ronchas o habones rojos y elevados, Picazón intensa, Las ronchas aparecen y desaparecen en horas, Hinchazón de labios, ojos o garganta (angioedema); causas: Reacción alérgica a alimentos, medicamentos o picaduras de insectos, Infecciones virales o bacterianas",71],
+    ["e","rosacea","enfermedades-de-la-piel","- Rosácea; síntomas: Enrojecimiento persistente en el centro del rostro, Pequeños vasos sanguíneos visibles (telangiectasias), Granos o pústulas similares al acné, Engrosamiento de la piel, especialmente en la nariz (rinofima); causas: Predisposición genética, Anormalidades en los vasos sanguíneos faciales",77],
+    ["e","micosis-cutanea","enfermedades-de-la-piel","- Micosis cutánea; síntomas: Manchas rojas, escamosas y con picazón, Forma de anillo con bordes elevados (tiña), Piel agrietada o macerada, especialmente entre los dedos, Cambios en las uñas (engrosamiento, decoloración); causas: Infección por hongos dermatofitos, Ambientes cálidos y húmedos que favorecen el crecimiento de hongos",83],
+    ["e","verrugas","enfermedades-de-la-piel","- Verrugas; síntomas: Pequeñas protuberancias carnosas y granulosas, Superficie rugosa al tacto, Pueden aparecer puntos negros (vasos sanguíneos coagulados), Generalmente indoloras, pero pueden causar molestias; causas: Infección por el Virus del Papiloma Humano (VPH), Contacto directo con la piel de una persona con verrugas",82],
+    ["e","melanoma","enfermedades-de-la-piel","- Melanoma; síntomas: Aparición de un nuevo lunar o cambio en uno existente, Asimetría, borde irregular, color variado y diámetro mayor a 6 mm (regla ABCDE), Puede causar picazón, sangrado o ulceración; causas: Exposición excesiva a la radiación ultravioleta (UV) del sol o camas de bronceado, Antecedentes familiares de melanoma",83],
+    ["e","carcinoma-basocelular","enfermedades-de-la-piel","- Carcinoma basocelular; síntomas: Bulto ceroso o perlado, Lesión plana, similar a una cicatriz, de color carne o marrón, Úlcera que sangra, cicatriza y se vuelve a abrir, Suele aparecer en zonas expuestas al sol; causas: Exposición crónica a la radiación UV del sol, Piel clara, cabello rubio o rojo y ojos claros",79],
+    ["e","carcinoma-espinocelular","enfermedades-de-la-piel","- Carcinoma espinocelular; síntomas: Nódulo rojo y firme, Lesión plana con una superficie escamosa y con costras, Nueva úlcera o área elevada sobre una cicatriz o úlcera preexistente, Puede crecer rápidamente y hacer metástasis; causas: Exposición acumulada a la radiación UV, Exposición a ciertos químicos como el arsénico",81],
+    ["e","queratosis-pilaris","enfermedades-de-la-piel","- Queratosis pilaris; síntomas: Pequeños bultos ásperos, similares a la piel de gallina, Suelen aparecer en brazos, muslos, mejillas o glúteos, La piel se siente como papel de lija, Puede haber enrojecimiento o inflamación leve; causas: Acumulación de queratina que obstruye los folículos pilosos, Condición genética asociada a la piel seca",85],
+    ["e","hiperhidrosis","enfermedades-de-la-piel","- Hiperhidrosis; síntomas: Sudoración excesiva que no está relacionada con el calor o el ejercicio, Afecta principalmente a palmas, plantas, axilas o cara, La piel puede volverse blanda, blanca y descamarse, Interfiere con las actividades diarias; causas: Hiperactividad de las glándulas sudoríparas, Puede ser una condición hereditaria (hiperhidrosis primaria)",91],
+    ["e","impetigo","enfermedades-de-la-piel","- Impétigo; síntomas: Llagas rojas que se rompen, supuran y forman una costra de color miel, Suele aparecer alrededor de la nariz y la boca, Picazón y dolor leve, Altamente contagioso; causas: Infección bacteriana de la piel, generalmente por Staphylococcus aureus o Streptococcus pyogenes, Las bacterias entran a través de cortes, rasguños o picaduras de insectos",91],
+    ["e","molusco-contagioso","enfermedades-de-la-piel","- Molusco contagioso; síntomas: Pequeñas protuberancias redondas, firmes y del color de la piel o rosadas, Tienen un pequeño hoyuelo o punto en el centro, Pueden causar picazón o irritación, Aparecen en cualquier parte del cuerpo; causas: Infección viral causada por un poxvirus, Se transmite por contacto directo piel con piel o a través de objetos contaminados",91],
+    ["e","penfigo","enfermedades-de-la-piel","- Pénfigo; síntomas: Ampollas flácidas y dolorosas en la piel y mucosas (boca, garganta), Las ampollas se rompen fácilmente, dejando erosiones que no cicatrizan, Piel que se desprende al frotarla (signo de Nikolsky positivo); causas: Enfermedad autoinmune en la que los anticuerpos atacan las proteínas que unen las células de la piel, Factores genéticos",89],
+    ["e","dermatitis-seborreica","enfermedades-de-la-piel","- Dermatitis seborreica; síntomas: Piel escamosa, amarillenta o blanquecina en zonas grasas (cuero cabelludo, cara, pecho), Enrojecimiento y picazón, Caspa persistente, En bebés, se conoce como costra láctea; causas: Reacción inflamatoria a un hongo tipo levadura (Malassezia) que vive en la piel, Producción excesiva de sebo",82],
+    ["e","celulitis","enfermedades-de-la-piel","- Celulitis; síntomas: Área de piel roja, hinchada, caliente y dolorosa, La piel puede tener un aspecto de hoyuelos o cáscara de naranja, Fiebre y malestar general, Puede extenderse rápidamente; causas: Infección bacteriana de las capas profundas de la piel (dermis y tejido subcutáneo), Generalmente causada por Staphylococcus y Streptococcus",86],
+    ["e","erisipela","enfermedades-de-la-piel","- Erisipela; síntomas: Lesión roja, brillante, elevada y bien delimitada, Sensación de ardor y dolor intenso, Fiebre alta, escalofríos y malestar, Afecta con mayor frecuencia las piernas y la cara; causas: Infección bacteriana de las capas superiores de la piel, principalmente por Streptococcus pyogenes, Entrada de bacterias a través de cortes, úlceras o problemas de drenaje linfático",97],
+    ["e","foliculitis","enfermedades-de-la-piel","- Foliculitis; síntomas: Pequeños granos rojos o con punta blanca alrededor de los folículos pilosos, Picazón o sensibilidad en la zona afectada, Puede convertirse en úlceras con costras, Común en áreas de afeitado, fricción o sudoración; causas: Infección o inflamación de los folículos pilosos, a menudo por la bacteria Staphylococcus aureus, Fricción de la ropa, afeitado o bloqueo de los folículos",101],
+    ["e","forunculos","enfermedades-de-la-piel","- Forúnculos; síntomas: Protuberancia roja, hinchada y dolorosa en la piel, Pus visible en el centro de la protuberancia, Sensibilidad y dolor en la zona afectada, Aumento de tamaño del bulto con el tiempo; causas: Infección del folículo piloso por la bacteria Staphylococcus aureus, Fricción o irritación de la piel",79],
+    ["e","hidradenitis-supurativa","enfermedades-de-la-piel","- Hidradenitis supurativa; síntomas: Espinillas negras, Protuberancias dolorosas del tamaño de un guisante, Bultos o llagas que supuran, Túneles que conectan los bultos debajo de la piel; causas: Obstrucción de los folículos pilosos, Hormonas",61],
+    ["e","ictiosis-vulgar","enfermedades-de-la-piel","- Ictiosis vulgar; síntomas: Piel seca y escamosa, Engrosamiento de la piel, Picazón leve, Piel áspera y agrietada; causas: Mutación genética en el gen que codifica la proteína filagrina, Herencia autosómica dominante",55],
+    ["e","melasma","enfermedades-de-la-piel","- Melasma; síntomas: Cambio de color de la piel a un café uniforme, Manchas oscuras en las mejillas, frente, nariz y labio superior, Parches oscuros simétricos, Sufrimiento respecto a la apariencia; causas: Hormonas femeninas estrógeno y progesterona, Embarazo",65],
+    ["e","nevos-melanociticos","enfermedades-de-la-piel","- Nevos melanocíticos; síntomas: Manchas en la piel de color marrón o negruzco, Lesiones planas o elevadas, Superficie lisa, rugosa o velluda, Generalmente asintomáticos; causas: Proliferación benigna de melanocitos, Mutaciones genéticas somáticas",62],
+    ["e","pitiriasis-rosada","enfermedades-de-la-piel","- Pitiriasis rosada; síntomas: Comienza con una mancha grande y ovalada llamada 'parche heráldico', A los pocos días, aparecen manchas más pequeñas en el pecho, espalda y abdomen, Las lesiones siguen un patrón similar a un 'árbol de Navidad', Puede causar picazón leve; causas: Causa exacta desconocida, pero se cree que está relacionada con una infección viral (posiblemente un tipo de herpesvirus), No es contagiosa",105],
+    ["e","prurigo-nodular","enfermedades-de-la-piel","- Prurigo nodular; síntomas: Nódulos firmes y pruriginosos en la piel, Picor extremo y persistente, Piel engrosada o con costras, Heridas o escoriaciones por rascado; causas: Función alterada del sistema inmunitario y de los nervios de la piel, Eccema (dermatitis atópica)",68],
+    ["e","sarna","enfermedades-de-la-piel","- Sarna; síntomas: Picazón intensa, especialmente por la noche, Erupción con pequeños granos o ampollas, Líneas finas y onduladas en la piel (túneles del ácaro), Afecta pliegues de la piel como muñecas, codos y entre los dedos; causas: Infestación de la piel por el ácaro Sarcoptes scabiei, El ácaro excava túneles en la capa superior de la piel para poner huevos",91],
+    ["e","tiña-versicolor","enfermedades-de-la-piel","- Tiña versicolor; síntomas: Manchas en la piel más claras o más oscuras que la piel circundante, Manchas que no se broncean con el sol, Manchas que pueden ser de color blanco, rosado, rojo o marrón, Piel escamosa; causas: Crecimiento excesivo del hongo Malassezia en la piel, Clima cálido y húmedo",75],
+    ["e","xantelasma","enfermedades-de-la-piel","- Xantelasma; síntomas: Protuberancias bajo la piel con bordes definidos, Placas amarillentas en los párpados, Erupciones cutáneas de diferentes formas, Nódulos amarillos en los párpados; causas: Niveles altos de colesterol, Mala alimentación",61],
+    ["e","dermatofibroma","enfermedades-de-la-piel","- Dermatofibroma; síntomas: Pápulas o nódulos pequeños y firmes, Color rojo amarronado o violáceo, Prurito o picazón ocasional, Dolor o sensibilidad al tacto; causas: Causa desconocida, Predisposición genética",53],
+    ["e","granuloma-anular","enfermedades-de-la-piel","- Granuloma anular; síntomas: Erupción elevada o protuberancias en forma de anillo, Bordes de la erupción circulares o semicirculares, Malestar o picazón, Pequeños bultos firmes debajo de la piel; causas: Mordeduras de animales o insectos, Infecciones como la hepatitis",68],
+    ["e","queratosis-actinica","enfermedades-de-la-piel","- Queratosis actínica; síntomas: Parche áspero, seco y escamoso en la piel, Varía en color (rosa, rojo o marrón), Suele aparecer en áreas expuestas al sol como cara, cuero cabelludo, manos y brazos, Considerada una lesión precancerosa; causas: Exposición crónica y a largo plazo a la radiación ultravioleta (UV) del sol, Más común en personas de piel clara y mayores de 40 años",95],
+    ["e","lentigo-solar","enfermedades-de-la-piel","- Lentigo solar; síntomas: Áreas planas y ovaladas de pigmentación intensificada, Color marrón claro a marrón oscuro, Aparición en zonas expuestas al sol como el dorso de las manos, los empeines, el rostro, los hombros y la parte alta de la espalda, Tamaño que varía desde el de una peca hasta aproximadamente 13 mm de diámetro; causas: Exposición a la luz ultravioleta (UV) del sol, Uso de lámparas y camas de bronceado comerciales",108],
+    ["e","poiquilodermia-de-civatte","enfermedades-de-la-piel","- Poiquilodermia de Civatte; síntomas: Manchas rojas y marrones, Piel fina y con aspecto envejecido, Atrofia cutánea, Telangiectasias; causas: Exposición crónica a la radiación ultravioleta (UV), Predisposición genética",55],
+    ["e","telangiectasias","enfermedades-de-la-piel","- Telangiectasias; síntomas: Vasos sanguíneos pequeños y dilatados en la piel, Manchas rojas en labios, cara y yemas de los dedos, Sangrados nasales, Anemia por deficiencia de hierro; causas: Envejecimiento, Problemas genéticos",57],
+    ["e","linfoma","sistema-linfatico","- Linfoma; síntomas: Inflamación indolora de los ganglios linfáticos, Fatiga persistente, Fiebre, Sudores nocturnos; causas: Mutaciones genéticas en los linfocitos, Sistema inmunitario debilitado",49],
+    ["e","mononucleosis-infecciosa","sistema-linfatico","- Mononucleosis Infecciosa; síntomas: Fatiga extrema, Fiebre, Dolor de garganta, Ganglios linfáticos inflamados en el cuello y las axilas; causas: Infección por el virus de Epstein-Barr (VEB), Transmisión a través de la saliva, por eso se la conoce como la \"enfermedad del beso\"",70],
+    ["e","adenopatia","sistema-linfatico","- Adenopatía; síntomas: Ganglios linfáticos inflamados y sensibles, Fiebre, Sudores nocturnos, Pérdida de peso; causas: Infecciones (bacterianas, virales, fúngicas), Trastornos inmunitarios como el lupus o la artritis reumatoide",57],
+    ["e","linfangitis","sistema-linfatico","- Linfangitis; síntomas: Líneas rojas y dolorosas que se extienden desde el área infectada, Fiebre y escalofríos, Sensación de malestar general, Dolor de cabeza; causas: Infección bacteriana aguda, generalmente por estreptococos, Complicación de una infección cutánea",67],
+    ["e","enfermedad-de-castleman","sistema-linfatico","- Enfermedad de Castleman; síntomas: Fiebre, Pérdida de peso, Fatiga, Sudores nocturnos; causas: Crecimiento excesivo de células en los ganglios linfáticos, Infección por el virus del herpes humano 8 (VHH-8)",52],
+    ["e","filariasis-linfatica","sistema-linfatico","- Filariasis Linfática; síntomas: Linfedema (elefantiasis), Hidrocele (hinchazón del escroto), Tos tropical (tos crónica), Fiebre; causas: Infección por gusanos parásitos filariales, Transmisión por la picadura de mosquitos infectados",59],
+    ["e","malformacion-linfatica","sistema-linfatico","- Malformación Linfática; síntomas: Masas o quistes llenos de líquido, Hinchazón, Dolor, Problemas funcionales según la ubicación; causas: Desarrollo anormal de los vasos linfáticos durante la gestación, Mutaciones genéticas somáticas",59],
+    ["e","quilotorax","sistema-linfatico","- Quilotórax; síntomas: Dificultad para respirar, Tos, Dolor en el pecho, Fatiga; causas: Lesión del conducto torácico durante una cirugía, Traumatismo torácico",40],
+    ["e","ascitis-quilosa","sistema-linfatico","- Ascitis Quilosa; síntomas: Aumento del perímetro abdominal, Sensación de plenitud, Dificultad para respirar, Pérdida de apetito; causas: Obstrucción o rotura de los vasos linfáticos abdominales, Cirrosis hepática",54],
+    ["e","quiluria","sistema-linfatico","- Quiluria; síntomas: Orina de aspecto lechoso, Dolor al orinar, Aumento de la frecuencia urinaria, Hematuria (sangre en la orina); causas: Comunicación anormal entre el sistema linfático y el tracto urinario, Filariasis linfática",58],
+    ["e","sindrome-de-cloves","sistema-linfatico","- Síndrome de CLOVES; síntomas: Crecimiento excesivo de tejido graso, Malformaciones vasculares complejas, Nevos epidérmicos, Escoliosis; causas: Mutación somática en el gen PIK3CA, No es una condición hereditaria",54],
+    ["e","bronquitis-plastica","sistema-linfatico","- Bronquitis Plástica; síntomas: Tos intensa, Expulsión de moldes bronquiales (material similar al plástico), Dificultad para respirar, Cianosis (coloración azulada de la piel); causas: Acumulación de líquido linfático en las vías respiratorias, Complicación de cirugías cardíacas congénitas (procedimiento de Fontan)",80],
+    ["e","enteropatia-perdedora-de-proteinas","sistema-linfatico","- Enteropatía Perdedora de Proteínas; síntomas: Edema (hinchazón), Diarrea crónica, Ascitis, Retraso en el crecimiento en niños; causas: Pérdida excesiva de proteínas plasmáticas a través del tracto gastrointestinal, Linfangiectasia intestinal",61],
+    ["e","higroma-quistico","sistema-linfatico","- Higroma Quístico; síntomas: Hinchazón o masa en el cuello o la axila, Acumulación de líquido, Edema nucal, Dificultad para respirar o tragar; causas: Anomalías cromosómicas (Síndrome de Turner, Síndrome de Down), Factores genéticos",59],
+    ["e","hiperplasia-linfofolicular","sistema-linfatico","- Hiperplasia Linfofolicular; síntomas: Dolor, Hinchazón, Calor, Sensibilidad; causas: Infecciones bacterianas, Infecciones virales",33],
+    ["e","linfadenitis-mesenterica","sistema-linfatico","- Linfadenitis Mesentérica; síntomas: Dolor en la zona del estómago, Sensibilidad general en la zona del estómago, Fiebre, Diarrea; causas: Infección viral (gastroenteritis), Infecciones bacterianas",50],
+    ["e","linfangioleiomiomatosis","sistema-linfatico","- Linfangioleiomiomatosis (LAM); síntomas: Dificultad para respirar progresiva, Neumotórax recurrente (colapso pulmonar), Tos, Quilotórax; causas: Proliferación anormal de células musculares lisas en los pulmones y el sistema linfático, Mutaciones en los genes TSC1 o TSC2",68],
+    ["e","amigdalitis","sistema-linfatico","- Amigdalitis; síntomas: Dolor de garganta intenso, Amígdalas rojas e hinchadas, a veces con placas de pus, Dificultad o dolor al tragar, Fiebre y escalofríos; causas: Infección viral (causa más común), Infección bacteriana (generalmente estreptococo del grupo A)",66],
+    ["e","esplenomegalia","sistema-linfatico","- Esplenomegalia; síntomas: Dolor o sensación de presión en la parte superior izquierda del abdomen, Sensación de saciedad sin haber comido o después de comer una pequeña cantidad, Anemia, Infecciones frecuentes; causas: Infecciones virales, bacterianas o parasitarias, Enfermedades hepáticas como la cirrosis",78],
+    ["e","timoma","sistema-linfatico","- Timoma; síntomas: Tos persistente, Dolor en el pecho, Dificultad para respirar, Debilidad muscular; causas: Causa exacta desconocida, Edad avanzada",38],
+    ["e","linfangioma-cavernoso","sistema-linfatico","- Linfangioma Cavernoso; síntomas: Hinchazón o bulto debajo de la piel, Decoloración de la piel o un tinte azulado sobre el área afectada, Rango de movimiento limitado o rigidez en las articulaciones cercanas, Infecciones recurrentes o celulitis en la zona afectada; causas: Malformaciones congénitas durante el desarrollo fetal, Mutaciones genéticas",88],
+    ["e","linfohistiocitosis-hemofagocitica","sistema-linfatico","- Linfohistiocitosis Hemofagocítica (LHH); síntomas: Fiebre, Hepatomegalia, Esplenomegalia, Erupción cutánea; causas: Factores genéticos (LHH familiar), Infecciones virales (como el virus de Epstein-Barr)",51],
+    ["e","sindrome-de-evans","sistema-linfatico","- Síndrome de Evans; síntomas: Manchas de color púrpura en la piel, Palidez, Fatiga, Aturdimiento; causas: Trastorno del sistema inmune, Síndrome linfoproliferativo autoinmune",44],
+    ["e","trastorno-de-ansiedad-generalizada","trastornos-mentales-emocionales","- Trastorno de Ansiedad Generalizada; síntomas: Preocupación excesiva y persistente, Inquietud o sensación de estar al límite, Fatiga, Dificultad para concentrarse; causas: Factores genéticos y antecedentes familiares, Química cerebral desequilibrada",63],
+    ["e","depresion-mayor","trastornos-mentales-emocionales","- Depresión Mayor; síntomas: Estado de ánimo deprimido la mayor parte del día, Pérdida de interés o placer en casi todas las actividades, Pérdida o aumento significativo de peso, Insomnio o hipersomnia; causas: Factores genéticos y biológicos, Desequilibrios químicos en el cerebro",71],
+    ["e","trastorno-bipolar","trastornos-mentales-emocionales","- Trastorno Bipolar; síntomas: Episodios de manía (euforia, energía excesiva), Episodios de depresión (tristeza, falta de energía), Cambios drásticos en el estado de ánimo, Habla rápida y pensamientos acelerados; causas: Predisposición genética, Estructura y función cerebral anormales",72],
+    ["e","trastorno-obsesivo-compulsivo","trastornos-mentales-emocionales","- Trastorno Obsesivo-Compulsivo; síntomas: Obsesiones (pensamientos, impulsos o imágenes recurrentes y persistentes), Compulsiones (comportamientos repetitivos o actos mentales), Ansiedad y malestar significativos, Miedo a la contaminación o a la suciedad; causas: Factores genéticos, Anomalías en la función cerebral",80],
+    ["e","trastorno-de-estres-postraumatico","trastornos-mentales-emocionales","- Trastorno de Estrés Postraumático; síntomas: Recuerdos angustiantes recurrentes (flashbacks), Pesadillas sobre el evento traumático, Evasión de lugares, personas o actividades que recuerdan el trauma, Hipervigilancia y reacciones de sobresalto exageradas; causas: Haber experimentado o presenciado un evento traumático, Lesiones graves o amenaza de muerte",90],
+    ["e","trastorno-de-panico","trastornos-mentales-emocionales","- Trastorno de Pánico; síntomas: Ataques de pánico inesperados y recurrentes, Palpitaciones o ritmo cardíaco acelerado, Sudoración, temblores o sacudidas, Sensación de ahogo o falta de aliento; causas: Factores genéticos, Temperamento propenso al estrés y a las emociones negativas",71],
+    ["e","fobia-social","trastornos-mentales-emocionales","- Fobia Social; síntomas: Miedo intenso a situaciones sociales, Preocupación por ser juzgado o humillado, Evitación de situaciones sociales temidas, Sonrojarse, sudar o temblar en situaciones sociales; causas: Factores genéticos y hereditarios, Estructura cerebral (amígdala hiperactiva)",72],
+    ["e","esquizofrenia","trastornos-mentales-emocionales","- Esquizofrenia; síntomas: Alucinaciones (ver o escuchar cosas que no existen), Delirios (creencias falsas y firmemente sostenidas), Pensamiento y habla desorganizados, Apatía y falta de motivación; causas: Combinación de factores genéticos y ambientales, Anomalías en la estructura y química del cerebro",76],
+    ["e","trastorno-por-deficit-de-atencion-e-hiperactividad","trastornos-mentales-emocionales","- Trastorno por Déficit de Atención e Hiperactividad; síntomas: Dificultad para prestar atención y mantener la concentración, Hiperactividad (inquietud, incapacidad para quedarse quieto), Impulsividad (actuar sin pensar en las consecuencias), Desorganización y problemas para terminar tareas; causas: Factores genéticos, Diferencias en la estructura y función del cerebro",93],
+    ["e","trastornos-de-la-alimentacion","trastornos-mentales-emocionales","- Trastornos de la Alimentación; síntomas: Preocupación excesiva por el peso y la figura corporal, Restricción severa de la ingesta de alimentos, Episodios recurrentes de atracones de comida, Conductas purgativas como vómitos autoinducidos o uso de laxantes; causas: Predisposición genética y factores biológicos, Antecedentes familiares de trastornos alimentarios",91],
+    ["e","trastorno-limite-de-la-personalidad","trastornos-mentales-emocionales","- Trastorno Límite de la Personalidad; síntomas: Inestabilidad en las relaciones interpersonales, la autoimagen y los afectos, Impulsividad marcada, Miedo intenso al abandono, Sentimientos crónicos de vacío; causas: Factores genéticos, Anomalías en áreas del cerebro relacionadas con la regulación emocional",77],
+    ["e","agorafobia","trastornos-mentales-emocionales","- Agorafobia; síntomas: Miedo o ansiedad intensa acerca de dos (o más) de las siguientes cinco situaciones: uso del transporte público, estar en espacios abiertos, estar en sitios cerrados, hacer cola o estar en medio de una multitud, estar fuera de casa solo, Miedo a situaciones en las que escapar podría ser difícil o la ayuda podría no estar disponible, Evitación de estas situaciones, Las situaciones casi siempre provocan miedo o ansiedad; causas: Tener ataques de pánico, Experiencias traumáticas",126],
+    ["e","trastorno-de-ansiedad-por-separacion","trastornos-mentales-emocionales","- Trastorno de Ansiedad por Separación; síntomas: Sufrimiento emocional intenso y repetido al pensar en la separación, Preocupación intensa y constante por la pérdida de un ser querido, Preocupación constante por que suceda algo malo que cause la separación, Negativa a estar fuera del hogar por miedo a la separación; causas: Estrés de la vida o pérdidas que causan la separación, Antecedentes familiares",102],
+    ["e","mutismo-selectivo","trastornos-mentales-emocionales","- Mutismo Selectivo; síntomas: Incapacidad constante para hablar en situaciones sociales específicas en las que se espera que hable (p. ej., en la escuela), Capacidad para hablar en otras situaciones (p. ej., en casa), La alteración interfiere con los logros educativos o laborales o con la comunicación social, La duración de la alteración es de al menos un mes; causas: Ansiedad social extrema, Temperamento tímido e inhibido",107],
+    ["e","fobia-especifica","trastornos-mentales-emocionales","- Fobia Específica; síntomas: Miedo o ansiedad intensa por un objeto o situación específica (p. ej., volar, alturas, animales), El objeto o la situación fóbica casi siempre provoca miedo o ansiedad inmediata, Evitación activa del objeto o la situación fóbica, El miedo o la ansiedad es desproporcionado al peligro real; causas: Experiencias traumáticas directas o indirectas con el objeto o la situación, Aprendizaje por observación (ver a otros tener miedo)",115],
+    ["e","tricotilomania","trastornos-mentales-emocionales","- Tricotilomanía; síntomas: Arrancarse el pelo de forma recurrente, lo que da lugar a su pérdida, Intentos repetidos de disminuir o dejar de arrancarse el pelo, Malestar clínicamente significativo, El arrancarse el pelo no se atribuye a otra afección médica; causas: Factores genéticos, Forma de regular las emociones (ansiedad, aburrimiento)",86],
+    ["e","trastorno-de-excoriacion","trastornos-mentales-emocionales","- Trastorno de Excoriación; síntomas: Rascarse la piel de forma recurrente, lo que da lugar a lesiones cutáneas, Intentos repetidos de disminuir o dejar de rascarse la piel, Malestar clínicamente significativo, El rascado de la piel no se atribuye a los efectos fisiológicos de una sustancia o a otra afeacia médica; causas: Factores genéticos, Respuesta a la ansiedad o al estrés",95],
+    ["e","trastorno-dismorfico-corporal","trastornos-mentales-emocionales","- Trastorno Dismórfico Corporal; síntomas: Estar extremadamente preocupado por un defecto percibido en la apariencia que los demás no pueden ver o que parece poco importante, Estar convencido de que tienes un defecto en tu apariencia que te hace feo o deforme, Creer que los demás ponen especial atención en tu apariencia de una manera negativa o se burlan de ti, Tener comportamientos dirigidos a arreglar u ocultar el defecto percibido que son difíciles de resistir o controlar; causas: Antecedentes familiares del trastorno, Evaluación negativa o burlas sobre el cuerpo o la imagen propia durante la niñez",152],
+    ["e","trastorno-de-acumulacion","trastornos-mentales-emocionales","- Trastorno de Acumulación; síntomas: Dificultad persistente para deshacerse o separarse de las posesiones, independientemente de su valor real, Necesidad percibida de guardar los artículos y malestar asociado con deshacerse de ellos, Acumulación de posesiones que congestionan y abarrotan las zonas de estar activas, Malestar clínicamente significativo o deterioro del funcionamiento; causas: Factores genéticos, Procesamiento anormal de la información en el cerebro",117],
+    ["e","trastorno-afectivo-estacional","trastornos-mentales-emocionales","- Trastorno Afectivo Estacional; síntomas: Sentirse apático, triste o decaído gran parte del día, casi todos los días, Perder el interés en actividades que solías disfrutar, Tener poca energía y sentirse aletargado, Dormir demasiado; causas: Alteración del reloj biológico (ritmos circadianos) por la reducción de la luz solar, Disminución de los niveles de serotonina, un neurotransmisor que afecta el estado de ánimo",105],
+    ["e","distimia","trastornos-mentales-emocionales","- Distimia; síntomas: Tristeza, desánimo o sensación de vacío, Pérdida de interés en las actividades cotidianas, Cansancio y falta de energía, Baja autoestima; causas: Desequilibrios químicos en el cerebro, Antecedentes familiares de depresión",61],
+    ["e","trastorno-ciclotimico","trastornos-mentales-emocionales","- Trastorno Ciclotímico; síntomas: Períodos de síntomas hipomaníacos y períodos de síntomas depresivos que no cumplen los criterios para un episodio de depresión mayor, Los síntomas han estado presentes durante al menos dos años, Los períodos de estabilidad del estado de ánimo no duran más de dos meses, Malestar clínicamente significativo; causas: Factores genéticos (antecedentes familiares de trastorno bipolar), Diferencias en la función cerebral",113],
+    ["e","trastorno-disforico-premenstrual","trastornos-mentales-emocionales","- Trastorno Disfórico Premenstrual; síntomas: Falta de interés en las actividades diarias, Fatiga o falta de energía, Tristeza o desesperanza, Ansiedad; causas: Cambios hormonales durante el ciclo menstrual, Abuso de alcohol o drogas ilícitas",61],
+    ["e","trastorno-de-desregulacion-disruptiva-del-estado-de-animo","trastornos-mentales-emocionales","- Trastorno de Desregulación Disruptiva del Estado de Ánimo; síntomas: Arrebatos intensos de mal genio (verbales o conductuales), Arrebatos y berrinches recurrentes durante al menos 12 meses, Estado de ánimo crónicamente irritable o enojo la mayor parte del día, Problemas de funcionamiento en más de un lugar (hogar, escuela, compañeros); causas: Trastorno del neurodesarrollo, Componentes genéticos",100],
+    ["e","trastorno-esquizoafectivo","trastornos-mentales-emocionales","- Trastorno Esquizoafectivo; síntomas: Combinación de síntomas de esquizofrenia (alucinaciones, delirios) y síntomas de un trastorno del estado de ánimo (depresión o manía), Período de enfermedad durante el cual hay un episodio depresivo mayor o maníaco concurrente con los síntomas de la esquizofrenia, Delirios o alucinaciones durante al menos 2 semanas en ausencia de un episodio de estado de ánimo mayor, Deterioro funcional; causas: Factores genéticos, Química cerebral",119],
+    ["e","trastorno-delirante","trastornos-mentales-emocionales","- Trastorno Delirante; síntomas: Presencia de uno o más delirios con una duración de un mes o más, El funcionamiento no está marcadamente alterado y el comportamiento no es obviamente extraño o extravagante, Si se han producido episodios maníacos o depresivos mayores, han sido breves en relación con la duración de los períodos delirantes, Creencias falsas y fijas (p. ej., de persecución, de grandeza); causas: Factores genéticos, Desequilibrios en los neurotransmisores",118],
+    ["e","trastorno-psicotico-breve","trastornos-mentales-emocionales","- Trastorno Psicótico Breve; síntomas: Aparición súbita de al menos uno de los siguientes síntomas psicóticos: delirios, alucinaciones, habla desorganizada, Comportamiento muy desorganizado o catatónico, La duración del episodio es de al menos un día pero menos de un mes, Retorno completo al nivel de funcionamiento previo a la enfermedad; causas: Estrés extremo o un evento traumático, Factores genéticos",102],
+    ["e","trastorno-de-la-personalidad-paranoide","trastornos-mentales-emocionales","- Trastorno de la Personalidad Paranoide; síntomas: Desconfianza y sospecha generalizadas hacia los demás, Creencia de que los demás tienen intenciones maliciosas, Preocupación injustificada por la lealtad o la fiabilidad de los amigos y socios, Reticencia a confiar en los demás por miedo a que la información sea utilizada en su contra; causas: Factores genéticos, Antecedentes familiares de esquizofrenia y otros trastornos psicóticos",110],
+    ["e","trastorno-de-la-personalidad-esquizoide","trastornos-mentales-emocionales","- Trastorno de la Personalidad Esquizoide; síntomas: Querer estar solo y realizar actividades en soledad, No interesarse ni disfrutar de las relaciones cercanas, Sentir poco o ningún deseo de mantener relaciones sexuales, Dificultad para expresar emociones y reaccionar; causas: Tener un familiar con trastorno de la personalidad esquizoide, trastorno esquizotípico de la personalidad o esquizofrenia, Tener un padre que se mostraba frío, no cuidaba adecuadamente y no daba apoyo emocional",123],
+    ["e","trastorno-de-la-personalidad-esquizotipica","trastornos-mentales-emocionales","- Trastorno de la Personalidad Esquizotípica; síntomas: Ser solitario y carecer de amigos cercanos fuera de la familia inmediata, Emociones planas o respuestas emocionales limitadas o socialmente inapropiadas, Ansiedad social excesiva y persistente, Pensamientos, creencias o gestos extraños o inusuales; causas: Cambios en la forma en que funciona el cerebro, Genética",93],
+    ["e","trastorno-de-la-personalidad-antisocial","trastornos-mentales-emocionales","- Trastorno de la Personalidad Antisocial; síntomas: Ignorar qué está bien y qué está mal, Decir mentiras para aprovecharse de los demás, Ser insensible o no respetar a otras personas, Quebrantar la ley constantemente; causas: Factores genéticos, Maltrato infantil",66],
+    ["e","trastorno-de-la-personalidad-histrionica","trastornos-mentales-emocionales","- Trastorno de la Personalidad Histriónica; síntomas: Necesidad de ser el centro de atención, Comportamiento seductor o provocativo inapropiado, Emociones superficiales y rápidamente cambiantes, Preocupación excesiva por la apariencia física; causas: Factores genéticos, Experiencias de la infancia",75],
+    ["e","trastorno-de-la-personalidad-narcisista","trastornos-mentales-emocionales","- Trastorno de la Personalidad Narcisista; síntomas: Tener un aire de superioridad irrazonable y necesitar constantemente la admiración excesiva de los demás, Sentir que merecen tener privilegios y recibir un trato especial, Aprovecharse de los demás para lograr lo que quieren, Tener incapacidad o falta de voluntad para reconocer las necesidades y los sentimientos de los demás; causas: Entorno familiar en la infancia (relaciones con los padres de demasiada adoración o crítica), Genética (características heredadas)",130],
+    ["e","trastorno-de-la-personalidad-evitativa","trastornos-mentales-emocionales","- Trastorno de la Personalidad por Evitación; síntomas: Hipersensibilidad a la crítica y al rechazo, Aislamiento social autoimpuesto, Timidez o ansiedad en situaciones sociales, Sentimientos de ineptitud; causas: Factores genéticos, Factores ambientales",64],
+    ["e","trastorno-de-la-personalidad-dependiente","trastornos-mentales-emocionales","- Trastorno de la Personalidad Dependiente; síntomas: Dificultad para tomar decisiones cotidianas sin un exceso de consejo y reafirmación por parte de los demás, Necesidad de que otros asuman la responsabilidad en las áreas más importantes de su vida, Dificultad para expresar el desacuerdo con los demás por miedo a la pérdida de apoyo o aprobación, Dificultad para iniciar proyectos o hacer cosas por su cuenta debido a la falta de confianza en el propio juicio o capacidades; causas: Factores genéticos y hereditarios, Experiencias traumáticas en la infancia, como el abuso o la negligencia",149],
+    ["e","trastorno-de-la-personalidad-obsesivo-compulsiva","trastornos-mentales-emocionales","- Trastorno de la Personalidad Obsesivo-Compulsiva; síntomas: Preocupación excesiva por los detalles, el orden y las normas, Perfeccionismo que interfiere con la finalización de las tareas, Devoción excesiva al trabajo y la productividad, excluyendo actividades de ocio y amistades, Rigidez y obstinación; causas: Factores genéticos y hereditarios, Experiencias traumáticas durante la infancia",99],
+    ["e","trastorno-de-conversion","trastornos-mentales-emocionales","- Trastorno de Conversión; síntomas: Debilidad o parálisis, Movimiento anormal, como temblores o dificultad para caminar, Convulsiones o crisis no epilépticas, Problemas del habla, como incapacidad para hablar o habla arrastrada; causas: Estrés considerable o trauma emocional o físico reciente, Afección de salud mental preexistente (trastorno de ansiedad, del estado de ánimo, disociativo o de la personalidad)",103],
+    ["e","trastorno-de-sintomas-somaticos","trastornos-mentales-emocionales","- Trastorno de Síntomas Somáticos; síntomas: Dolor, Fatiga o debilidad, Dificultad para respirar, Entumecimiento; causas: Factores genéticos y biológicos, Influencia familiar",44],
+    ["e","trastorno-facticio","trastornos-mentales-emocionales","- Trastorno Facticio; síntomas: Problemas médicos o de salud mental astutos y convincentes, Amplios conocimientos de términos médicos y enfermedades, Síntomas imprecisos o inconsistentes, Afecciones que empeoran sin razón aparente; causas: Traumas infantiles, Enfermedad grave en la infancia",73],
+    ["e","amnesia-disociativa","trastornos-mentales-emocionales","- Amnesia Disociativa; síntomas: Pérdida de memoria de información personal importante, Incapacidad para recordar eventos específicos, en especial traumáticos, Sensación de desapego de uno mismo (despersonalización), Confusión o desorientación; causas: Experimentar o presenciar un evento traumático, Abuso físico o sexual grave en la infancia",86],
+    ["e","conjuntivitis","otorrinolaringologia-oftalmologia","- Conjuntivitis; síntomas: Enrojecimiento del ojo, Picazón o ardor ocular, Secreción acuosa o purulenta, Sensación de tener arena en el ojo; causas: Infección viral o bacteriana, Reacción alérgica (polen, polvo)",53],
+    ["e","cataratas","otorrinolaringologia-oftalmologia","- Cataratas; síntomas: Visión borrosa o nublada, Dificultad para ver de noche, Sensibilidad a la luz y al resplandor, Percepción de colores atenuada; causas: Envejecimiento natural del cristalino, Exposición prolongada a la radiación UV",59],
+    ["e","glaucoma","otorrinolaringologia-oftalmologia","- Glaucoma; síntomas: Pérdida gradual de la visión periférica, Visión de túnel en etapas avanzadas, Dolor ocular intenso y súbito, Visión borrosa y halos alrededor de las luces; causas: Aumento de la presión dentro del ojo (presión intraocular), Antecedentes familiares de glaucoma",71],
+    ["e","otitis-media","otorrinolaringologia-oftalmologia","- Otitis Media; síntomas: Dolor de oído (otalgia), Fiebre, Pérdida de audición temporal, Supuración de líquido del oído; causas: Infección bacteriana o viral, a menudo después de un resfriado, Disfunción de la trompa de Eustaquio",58],
+    ["e","tinnitus","otorrinolaringologia-oftalmologia","- Tinnitus; síntomas: Percepción de un zumbido, pitido o silbido en los oídos, Sonido que no proviene de una fuente externa, Puede ser constante o intermitente, Dificultad para concentrarse o dormir; causas: Exposición a ruidos fuertes, Pérdida de audición relacionada con la edad",70],
+    ["e","desviacion-del-tabique-nasal","otorrinolaringologia-oftalmologia","- Desviación del tabique nasal; síntomas: Dificultad para respirar por uno o ambos lados de la nariz, Congestión nasal persistente, Hemorragias nasales frecuentes, Dolor facial; causas: Condición congénita (presente al nacer), Lesión o traumatismo en la nariz",65],
+    ["e","polipos-nasales","otorrinolaringologia-oftalmologia","- Pólipos nasales; síntomas: Congestión nasal crónica, Disminución o pérdida del sentido del olfato, Goteo posnasal, Presión facial o dolor de cabeza; causas: Inflamación crónica de la mucosa nasal (asociada a asma o alergias), Fibrosis quística",62],
+    ["e","vertigo","otorrinolaringologia-oftalmologia","- Vértigo; síntomas: Sensación giratoria de que uno mismo o el entorno se mueve, Pérdida del equilibrio, Náuseas y vómitos, Movimientos oculares anormales (nistagmo); causas: Vértigo posicional paroxístico benigno (VPPB), Enfermedad de Meniere",61],
+    ["e","enfermedad-de-meniere","otorrinolaringologia-oftalmologia","- Enfermedad de Meniere; síntomas: Episodios recurrentes de vértigo, Pérdida de audición fluctuante, Tinnitus (zumbido en el oído), Sensación de presión o plenitud en el oído afectado; causas: Acumulación anormal de líquido (endolinfa) en el oído interno, Factores genéticos y autoinmunes",72],
+    ["e","presbicia","otorrinolaringologia-oftalmologia","- Presbicia; síntomas: Dificultad para enfocar objetos cercanos, Necesidad de alejar los materiales de lectura, Fatiga visual o dolores de cabeza al realizar trabajos de cerca, Visión borrosa a distancia de lectura normal; causas: Pérdida de elasticidad del cristalino del ojo, Proceso natural de envejecimiento (generalmente a partir de los 40 años)",88],
+    ["e","astigmatismo","otorrinolaringologia-oftalmologia","- Astigmatismo; síntomas: Visión borrosa o distorsionada a todas las distancias, Fatiga visual, Dolores de cabeza, Dificultad con la visión nocturna; causas: Curvatura irregular de la córnea o del cristalino, Puede ser hereditario y estar presente desde el nacimiento",67],
+    ["e","miopia","otorrinolaringologia-oftalmologia","- Miopía; síntomas: Visión borrosa de los objetos lejanos, Necesidad de entrecerrar los ojos para ver claramente, Dolores de cabeza por fatiga visual, Dificultad para ver al conducir, especialmente de noche; causas: El globo ocular es demasiado largo o la córnea tiene demasiada curvatura, Factores genéticos y hereditarios",81],
+    ["e","hipermetropia","otorrinolaringologia-oftalmologia","- Hipermetropía; síntomas: Visión borrosa de objetos cercanos, Fatiga visual y cansancio ocular, Dolores de cabeza después de leer o usar la computadora, Necesidad de entrecerrar los ojos para enfocar; causas: El globo ocular es demasiado corto o la córnea tiene muy poca curvatura, Factor hereditario",76],
+    ["e","estrabismo","otorrinolaringologia-oftalmologia","- Estrabismo; síntomas: Ojos bizcos, Visión doble, Ojos que no se alinean en la misma dirección, Movimientos oculares descoordinados; causas: Problemas con el control muscular de los ojos, Antecedentes familiares",53],
+    ["e","ojo-seco","otorrinolaringologia-oftalmologia","- Ojo seco; síntomas: Sensación de ardor, picazón o arenilla en los ojos, Enrojecimiento ocular, Visión borrosa, especialmente al final del día, Sensibilidad a la luz; causas: Producción insuficiente de lágrimas, Mala calidad de las lágrimas (evaporación rápida)",66],
+    ["e","chalazion","otorrinolaringologia-oftalmologia","- Chalazión; síntomas: Bulto no doloroso en el párpado, que crece lentamente, Visión borrosa si el bulto es grande y presiona el ojo, Hinchazón leve del párpado; causas: Obstrucción e inflamación de una glándula de Meibomio (productora de grasa) en el párpado",65],
+    ["e","orzuelo","otorrinolaringologia-oftalmologia","- Orzuelo; síntomas: Bulto rojo y doloroso en el borde del párpado, Hinchazón del párpado, Sensibilidad a la luz, Lagrimeo; causas: Infección bacteriana (generalmente estafilococos) de una glándula sebácea en el párpado, Obstrucción de la glándula",62],
+    ["e","epistaxis","otorrinolaringologia-oftalmologia","- Epistaxis; síntomas: Sangrado por una o ambas fosas nasales, Puede ser un goteo ligero o un flujo abundante; causas: Aire seco que irrita las membranas nasales, Hurgarse la nariz o sonarse con fuerza",51],
+    ["e","anosmia","otorrinolaringologia-oftalmologia","- Anosmia; síntomas: Pérdida total del olfato, Cambio en el gusto de los alimentos, Congestión nasal, Secreción nasal; causas: Infecciones de los senos paranasales (sinusitis), Resfriado común",48],
+    ["e","disfonia","otorrinolaringologia-oftalmologia","- Disfonía; síntomas: Ronquera, Debilidad o pérdida de la voz, Voz quebrada, temblorosa, tensa o forzada, Sensación de cosquilleo y aspereza en la garganta; causas: Laringitis, Alergias",47],
+    ["e","cerumen-impactado","otorrinolaringologia-oftalmologia","- Cerumen impactado; síntomas: Dolor de oído, Sensación de inflamación en el oído, Zumbido o ruidos en los oídos (tinnitus), Pérdida auditiva; causas: Acumulación de cera, Endurecimiento de la cera",50],
+    ["e","perforacion-del-timpano","otorrinolaringologia-oftalmologia","- Perforación del tímpano; síntomas: Dolor de oído que puede desaparecer rápidamente, Secreción de líquido claro, purulento o con sangre, Pérdida de audición, Zumbido en los oídos (tinnitus); causas: Infección del oído medio, Traumatismo directo en el oído",64],
+    ["e","neuritis-vestibular","otorrinolaringologia-oftalmologia","- Neuritis vestibular; síntomas: Vértigo repentino y severo, Mareo, Náuseas y vómitos, Problemas de equilibrio; causas: Infección viral, Inflamación del nervio vestibular",43],
+  ],
+  terminos: {
+    "100": [545,692,610,618],
+    "aamchur": [481,637],
+    "aaron": [508,771],
+    "aax": [471,573],
+    "ababol": [82,618],
+    "abaj": [798,671],
+    "abandon": [905,595],
+    "abarrotan": [913,543],
+    "abat": [465,612],
+    "abcd": [844,595],
+    "abcd1": [664,717],
+    "abdomen": [557,525,561,422,572,422,577,558,578,373,579,496,581,503,583,533,591,381,598,466,615,385,616,377,716,358,775,354,776,394,791,470,792,403,797,358,805,311,818,354,824,351,830,344,861,438,890,331],
+    "abdominal": [14,280,478,357,564,369,565,453,566,476,569,387,570,378,573,345,574,387,575,417,576,417,579,325,582,369,587,374,588,321,589,345,592,365,595,502,596,374,597,365,599,369,600,619,634,331,694,335,695,357,721,315,723,349,754,270,796,365,797,450,807,426,831,303,880,582,887,342],
+    "abedul": [113,1110,269,772],
+    "abej": [51,543],
+    "abeller": [24,492],
+    "abertur": [798,792,799,770,832,449],
+    "abesh": [452,563],
+    "abesod": [31,514,459,500],
+    "abeson": [8,578],
+    "abet": [134,1190],
+    "abi": [134,1024],
+    "abiert": [562,625,906,483],
+    "abish": [452,563],
+    "ablun": [408,612],
+    "abomb": [648,650],
+    "abombamient": [616,664],
+    "aborraj": [46,709],
+    "abort": [701,569,833,895],
+    "abranal": [408,612],
+    "abrecul": [408,612],
+    "abridor": [384,595],
+    "abrir": [845,584],
+    "abruen": [408,612],
+    "abrumador": [934,584],
+    "abrunal": [408,612],
+    "abrupt": [532,612],
+    "absces": [661,822,662,970,856,670],
+    "absent": [54,450],
+    "absinth": [54,1169],
+    "absinthium": [54,923],
+    "absinti": [54,450],
+    "absolut": [712,606],
+    "absorber": [428,668,696,788],
+    "absorcion": [446,656,467,791,483,523,743,551],
+    "abult": [583,701],
+    "abultad": [626,612],
+    "abundanci": [289,644],
+    "abundant": [700,480,804,471,806,489,952,567,955,494],
+    "aburrimient": [910,600],
+    "abus": [836,460,897,403,904,340,905,407,915,415,917,419,925,403,929,287,931,340,932,441,934,400],
+    "acaci": [101,528,135,1151],
+    "acafresn": [126,624],
+    "acahual": [243,650],
+    "acahualill": [35,612],
+    "acai": [196,958,412,951],
+    "acalasi": [594,991],
+    "acapat": [14,543],
+    "acapu": [11,606],
+    "acar": [521,548,525,499,682,499,841,462,863,825],
+    "acc": [369,811],
+    "acces": [549,624],
+    "accident": [580,461,608,446,620,567,639,488,647,552,660,466,663,677,677,403,701,415,721,411,762,400,771,381],
+    "accion": [61,459,63,529,171,540,242,582],
+    "aceb": [74,1041],
+    "acebill": [157,686],
+    "aceit": [46,586,81,472,89,569,100,445,103,445,105,416,116,586,128,614,137,591,167,395,252,523,261,582,356,565,364,586,441,455,455,503,459,337],
+    "aceitun": [109,954],
+    "aceituner": [175,637],
+    "aceler": [44,625,680,564],
+    "acelerad": [739,480,897,512,900,517],
+    "acelg": [213,618],
+    "acendri": [456,443],
+    "acenori": [214,606],
+    "aceptacion": [929,419],
+    "acer": [117,906,454,488],
+    "acerc": [906,525],
+    "acerol": [170,970,381,996],
+    "aceroll": [126,624],
+    "acetilcolin": [688,612,752,500],
+    "achatad": [396,637],
+    "achicori": [67,859,203,662],
+    "achille": [52,669,255,981],
+    "achin": [225,553],
+    "achotill": [353,664],
+    "achum": [496,664],
+    "acian": [50,1071],
+    "acibar": [61,509,490,533],
+    "acid": [107,422,223,334,261,398,339,377,365,412,368,403,386,298,402,331,406,407,418,432,427,417,429,373,434,432,440,403,455,322,472,303,477,437,481,362,563,585,674,581,690,344,742,373,758,344,795,529],
+    "acidez": [563,855,583,582,589,557,593,647],
+    "acidosi": [795,932],
+    "acidulant": [481,637],
+    "acn": [104,370,248,501,702,459,715,376,731,424,737,454,837,761,841,668,856,370,857,624],
+    "acompanad": [751,593,910,553],
+    "acompanar": [42,734],
+    "acondicionad": [949,600],
+    "acondroplasi": [718,671],
+    "acontecimient": [922,543],
+    "acor": [209,918,314,653],
+    "acoru": [209,868],
+    "acos": [904,457,928,553],
+    "acostars": [551,644],
+    "acr": [494,839],
+    "acromegali": [717,856],
+    "acropaqui": [531,564,560,599],
+    "act": [898,618],
+    "actae": [234,874],
+    "actinic": [868,796],
+    "actinidi": [358,862],
+    "activ": [77,577,909,452,913,472],
+    "activacion": [732,624],
+    "activad": [893,600],
+    "actividad": [271,374,283,407,288,398,292,398,721,356,757,481,759,363,768,310,771,330,827,330,828,336,837,327,848,345,896,454,899,327,903,327,914,286,915,352,917,356,923,297,928,349,930,333],
+    "actu": [182,800],
+    "actuar": [698,543,903,518],
+    "acuari": [318,752],
+    "acuatic": [209,635,309,543,310,537,311,519,312,531,313,783,316,519,319,537],
+    "acufen": [939,868],
+    "aculeatu": [157,925],
+    "acuminat": [378,810,465,788],
+    "acumul": [801,618,820,548],
+    "acumulacion": [536,488,539,347,551,347,602,499,627,317,636,488,641,354,653,350,662,366,671,378,690,327,716,340,742,354,758,327,765,301,778,354,785,400,801,362,818,336,820,523,847,312,879,391,880,378,883,336,885,336,913,579,939,336,943,336,955,464],
+    "acumulad": [846,600],
+    "acumulan": [858,595],
+    "acuos": [372,576,525,518,582,595,935,508],
+    "acustic": [956,637],
+    "acv": [620,674,647,657,663,509,665,542,670,525],
+    "adam": [495,839],
+    "adan": [495,595],
+    "adaptogen": [200,513,204,461,205,461,227,502,233,415,264,502,293,531,411,564],
+    "addison": [687,874],
+    "adecuad": [556,528,631,625],
+    "adecuadament": [696,532,780,583,923,445],
+    "adelgazamient": [812,606],
+    "adem": [18,471,62,432,73,365,75,400,85,378,117,505,236,456,262,415,265,461,277,471,284,442,285,471],
+    "adeniti": [887,905],
+    "adenom": [720,575,723,625],
+    "adenomyosi": [804,833],
+    "adenopati": [874,892],
+    "adenoviru": [544,954,548,593],
+    "adh": [729,874],
+    "adhieran": [153,584],
+    "adicional": [622,575,736,492],
+    "adkham": [38,534],
+    "admirabl": [488,525],
+    "admiracion": [927,718],
+    "adn": [632,632,669,599],
+    "adolescenci": [902,631],
+    "adolescent": [771,523,918,523],
+    "adoracion": [927,481],
+    "adormecimient": [479,522,620,522,761,507],
+    "adquirid": [596,631,668,729,669,565],
+    "adrak": [18,701],
+    "adrenalin": [728,899],
+    "adrenoleucodistrofi": [664,954],
+    "adult": [711,783,717,984],
+    "advertenci": [909,521],
+    "aere": [202,503,219,473,248,555,511,498,516,483,525,483],
+    "aesculu": [111,846,460,783],
+    "afasi": [665,846,668,895],
+    "afeaci": [911,584],
+    "afeccion": [2,256,28,267,104,208,113,230,115,259,119,279,133,282,158,279,180,248,201,264,230,273,241,253,364,279,394,289,501,251,538,248,551,253,552,228,568,286,571,256,575,319,583,276,595,292,597,279,599,282,601,248,625,232,628,246,630,261,646,228,680,241,686,246,693,270,698,232,709,239,713,282,716,248,721,241,733,219,734,219,735,267,736,210,739,217,744,225,755,212,756,223,763,234,766,208,768,210,780,264,788,267,796,279,800,264,833,234,838,259,841,228,847,228,852,217,858,234,859,239,863,223,867,225,870,241,890,230,895,241,904,195,910,236,911,230,912,170,931,195,933,317,946,228,947,248,948,267,949,236],
+    "afect": [535,303,539,344,565,340,595,397,623,473,635,344,640,379,650,333,664,383,665,362,669,347,676,344,691,327,704,351,735,362,756,303,768,285,770,306,799,344,848,317,849,303,852,295,854,317,863,303,870,327,888,340,892,276,902,337,905,448,914,263],
+    "afectad": [619,419,745,428,758,407,762,400,766,356,771,381,774,396,791,392,855,375,856,518,892,509,943,419],
+    "afectan": [627,550,630,438,657,438,672,611,683,404,737,429,750,434,763,392,769,371,771,375,890,385,904,327,931,327],
+    "afectand": [729,631],
+    "afectar": [530,515,550,483,637,504,679,527,698,442,709,638,783,545],
+    "afectiv": [914,731],
+    "afeitad": [855,801],
+    "affini": [232,892],
+    "afghan": [456,443],
+    "afoni": [37,573],
+    "afric": [95,790],
+    "african": [465,612],
+    "afroamerican": [831,589],
+    "afrodisiac": [22,550,27,446,184,703,237,451,267,460,291,628,354,495,366,692,474,518],
+    "aft": [163,571,654,822,702,571],
+    "afuer": [797,631],
+    "agabanz": [85,563],
+    "agachars": [761,584],
+    "agar": [302,1269],
+    "agaric": [271,886],
+    "agaricu": [274,1128],
+    "agarikon": [271,1145],
+    "agarr": [766,529],
+    "agarroch": [104,529],
+    "agarruch": [104,529],
+    "agav": [72,1257],
+    "agavanz": [85,563],
+    "agcum": [212,624],
+    "age": [250,717],
+    "agenab": [33,799,469,742],
+    "agenav": [33,575,469,518],
+    "agent": [281,521],
+    "agenuz": [31,514,459,500],
+    "aglai": [94,1007],
+    "agnocast": [151,553,178,816],
+    "agnu": [151,777,178,816],
+    "agorafobi": [906,767],
+    "agotad": [254,679],
+    "agracej": [181,661,419,861,421,704],
+    "agrandad": [748,548,819,489,890,719],
+    "agrandamient": [674,426,685,409,717,397,723,440,730,684,732,405,740,703,779,426,787,488,816,679,819,365,874,422,876,401,890,379],
+    "agrauz": [455,568],
+    "agrazon": [402,584],
+    "agri": [43,581,148,680,238,498,240,675,455,439,563,513],
+    "agridulc": [350,508,355,557,357,609,374,582],
+    "agrietad": [680,508,839,494,842,508,858,494],
+    "agrimon": [37,573],
+    "agrimoni": [36,483,37,1010],
+    "agrimony": [37,817],
+    "agrupars": [869,500],
+    "agu": [86,720,232,387,309,689,310,686,311,422,312,641,313,568,315,670,316,634,317,442,318,585,319,437,356,543,456,487,461,286,536,539,540,347,544,400,850,477,855,332],
+    "aguacoll": [496,664],
+    "aguaturm": [220,573],
+    "agud": [522,551,529,417,534,387,537,354,548,383,549,372,552,489,585,417,614,395,643,555,644,383,749,413,755,321,761,347,764,332,780,400,815,351,830,361,875,391,924,300],
+    "aguiluch": [56,529],
+    "aguipegot": [104,529],
+    "aguj": [275,512,495,729,612,554],
+    "agujer": [622,575,956,587],
+    "ahhmar": [473,686],
+    "ahmar": [473,686],
+    "ahog": [551,593,900,548],
+    "ahumad": [289,559,300,678,589,583],
+    "aihen": [454,529],
+    "ain": [561,684,562,625],
+    "aingueru": [26,578],
+    "air": [327,406,488,554,521,419,523,410,524,371,527,419,530,419,532,374,537,512,555,549,556,350,603,402,622,382,871,382,927,294,938,385,949,367,952,433],
+    "aislamient": [902,523,904,412,920,484,928,498],
+    "ait": [663,880],
+    "ajamodik": [480,664],
+    "ajedre": [27,1043,58,1034],
+    "ajemj": [29,563],
+    "ajenab": [33,799,469,742],
+    "ajenci": [54,450],
+    "ajengibl": [18,701],
+    "ajengibr": [18,701],
+    "ajenj": [53,485,54,908,449,571],
+    "ajenji": [54,450],
+    "ajenuz": [31,514,459,500],
+    "aji": [470,1162],
+    "ajicill": [129,595],
+    "ajingibl": [18,701],
+    "ajizuel": [129,595],
+    "ajo": [13,759,62,1053,469,489],
+    "ajonjer": [26,578],
+    "ajonjoli": [432,1163],
+    "ajoriz": [54,450],
+    "ajowan": [480,905],
+    "ajwain": [480,1194],
+    "alabastr": [493,694],
+    "aladiern": [179,1007],
+    "alam": [140,761],
+    "alardear": [927,481],
+    "alaternu": [179,1007],
+    "alb": [71,728,107,780,134,818,311,756,443,774],
+    "albacar": [0,1050],
+    "albahac": [0,1003,58,455,59,640,510,735],
+    "albar": [115,545,118,636,122,494,455,471],
+    "albaricoqu": [387,966],
+    "albaricoquer": [387,589],
+    "albarill": [387,589],
+    "alberchig": [384,548,387,543],
+    "alberchiguer": [387,589],
+    "alberger": [387,589],
+    "albican": [811,600],
+    "albill": [454,529],
+    "albolb": [32,543],
+    "albolg": [32,543],
+    "alborecer": [146,679],
+    "alborni": [146,679],
+    "album": [81,991],
+    "alcachof": [220,710,232,775,487,522],
+    "alcalinizant": [145,770],
+    "alcallar": [85,563],
+    "alcaloid": [171,650],
+    "alcamoni": [15,709],
+    "alcanfor": [52,488],
+    "alcanforad": [484,618],
+    "alcanzar": [836,618,923,472],
+    "alcarabac": [450,606],
+    "alcarabi": [450,606],
+    "alcaracach": [85,563],
+    "alcarahuey": [450,606],
+    "alcarave": [450,1064],
+    "alcaravet": [450,606],
+    "alcaravi": [450,606],
+    "alcarobe": [450,606],
+    "alcohol": [561,448,562,409,570,443,571,392,588,377,590,396,591,405,601,380,610,405,615,409,634,388,758,366,760,342,833,359,836,405,841,349,917,369,936,400,954,396],
+    "alcoholic": [571,599,591,618],
+    "alcoholism": [572,684,644,593],
+    "alcornoqu": [124,1185],
+    "ald": [664,954],
+    "aleatori": [736,534],
+    "alejandri": [236,679],
+    "alejar": [944,624],
+    "aleman": [60,595],
+    "alerc": [133,1141],
+    "alergen": [525,499,528,531,682,693,709,484,838,525],
+    "alergi": [31,375,59,356,274,415,521,461,526,392,593,524,682,583,710,396,938,424,941,419,953,471,954,442],
+    "alergic": [525,828,839,875,840,545,935,508],
+    "alert": [463,488,653,599],
+    "aletargad": [914,492],
+    "alexandri": [26,578],
+    "alezn": [469,563],
+    "alf": [524,558,727,569],
+    "alfabeg": [0,589],
+    "alfalf": [429,657],
+    "alficoz": [457,589],
+    "alfoncig": [436,770],
+    "alforv": [32,543],
+    "alg": [296,508,297,515,298,508,299,502,300,515,301,508,302,479,303,479,304,496,305,515,306,502,307,490,907,365],
+    "algabal": [85,563],
+    "algabanz": [85,563],
+    "algafil": [37,573],
+    "algaraz": [402,584],
+    "algarrob": [136,1206],
+    "algarzon": [402,584],
+    "algodon": [955,618],
+    "algun": [74,456,91,451,93,456,98,499,250,482,544,451,625,396,652,461,658,442,703,456,704,442,774,396],
+    "alhabeg": [0,589],
+    "alhen": [163,657],
+    "alholv": [32,500,452,518],
+    "alhucem": [23,734],
+    "alient": [21,451,447,405,526,367,535,357,538,397,555,644,602,431,605,409,607,405,610,422,611,418,613,441,615,427,630,418,889,397,900,374],
+    "aligustr": [163,1024],
+    "aliment": [27,351,93,381,132,328,137,403,220,322,319,412,379,385,467,403,523,377,562,381,563,373,580,385,581,361,583,394,589,377,593,438,594,557,595,417,597,398,635,361,638,394,813,328,840,369,904,278,953,394],
+    "alimentacion": [231,523,733,463,865,513,904,610],
+    "alimentari": [569,816,582,595,593,647,904,610],
+    "alimentars": [621,618],
+    "alimoni": [37,573],
+    "alinean": [948,919],
+    "alis": [113,584],
+    "alivi": [4,362,21,482,23,493,51,365,58,368,151,403,178,432,234,424,257,461,380,442,514,446,605,437],
+    "aliviar": [8,293,15,359,33,316,35,310,85,285,96,390,97,359,105,340,112,322,114,332,116,359,135,367,151,304,187,395,215,290,234,319,243,329,245,326,246,347,262,313,282,343,303,367,360,316,405,380,443,371,444,395,445,405,447,326,448,310,449,332,469,285,472,270,487,304,491,363,502,359,504,347],
+    "aljedre": [58,548],
+    "alkarobe": [450,606],
+    "all": [56,710,79,618],
+    "allium": [13,805,62,816],
+    "alloz": [137,954],
+    "allspic": [476,905],
+    "almacen": [821,600],
+    "almacenamient": [671,646,674,605],
+    "almacig": [192,991],
+    "almarac": [11,606],
+    "almendoler": [137,717],
+    "almendr": [137,1061,433,952,482,554],
+    "almidon": [76,606],
+    "almond": [137,931,274,537,433,855],
+    "almoradij": [11,606],
+    "almoraduj": [11,606],
+    "almoradux": [11,1064],
+    "almoraduz": [11,606],
+    "almorran": [567,919],
+    "alo": [61,1043,72,774,490,949,499,545],
+    "alojan": [557,686],
+    "alopeci": [698,966],
+    "aloysi": [47,939],
+    "alpini": [38,776],
+    "alquitranad": [754,525],
+    "alrededor": [526,578,567,474,585,490,710,412,742,459,849,397,855,390,865,432,879,507,937,393],
+    "alt": [57,246,90,289,175,251,214,239,259,261,276,246,309,292,314,279,317,292,319,289,320,286,321,279,322,299,323,286,324,259,325,282,326,267,327,261,328,292,329,273,330,299,331,289,332,311,333,311,334,315,335,286,336,253,337,303,338,303,339,261,340,315,341,315,342,315,343,315,348,270,367,359,378,251,385,228,412,319,495,234,523,264,529,276,535,373,542,259,572,292,597,279,601,426,602,270,618,261,623,253,633,346,634,399,647,228,648,256,657,261,715,212,716,344,721,337,725,273,728,259,739,313,777,256,781,375,783,286,790,289,791,230,792,279,794,351,801,264,827,223,831,328,854,234,865,243,869,197,937,317],
+    "altament": [66,557,543,508,549,720,849,471],
+    "altamis": [52,450,53,514],
+    "altarcin": [51,543],
+    "altarein": [51,543],
+    "altarrein": [51,543],
+    "alte": [207,644],
+    "alteracion": [741,420,893,464,908,662,914,380,915,469,954,508],
+    "alterad": [734,665,739,459,862,480,920,484],
+    "alteran": [805,548],
+    "alterativ": [169,657],
+    "alternativ": [136,686],
+    "alternifoli": [128,991],
+    "althae": [207,886],
+    "altibaj": [916,500,917,564],
+    "altili": [379,925],
+    "altisim": [196,821],
+    "altitud": [556,573],
+    "altur": [719,575,909,479],
+    "alucinacion": [653,520,667,536,902,504,919,652,921,471],
+    "alucinogen": [489,859,496,834],
+    "alvar": [455,568],
+    "alveol": [551,593,552,533],
+    "alvolv": [32,543],
+    "alzheimer": [641,1101],
+    "amabi": [73,543],
+    "amadou": [281,521],
+    "amanit": [294,1047],
+    "amapol": [82,980,183,678,442,969],
+    "amarac": [11,606],
+    "amarg": [14,358,54,545,67,615,130,508,148,717,171,429,194,508,203,568,206,425,210,581,240,577,254,448,263,597],
+    "amargon": [67,810,126,543,203,624],
+    "amargor": [263,664],
+    "amarill": [167,401,168,431,171,409,183,490,203,302,210,401,249,456,258,634,287,385,314,714,410,641,469,507,486,370,526,367,825,389,865,542],
+    "amarillent": [523,519,592,548,630,513,829,443,852,427,865,666],
+    "amarronad": [866,568],
+    "amat": [360,868],
+    "amazon": [196,756,197,718],
+    "amazonic": [131,525,195,603,365,561,367,519,437,530,462,447],
+    "amb": [523,451,646,388,691,411,752,365,777,437,785,499,791,392,796,477,820,400,822,600,940,432,952,477],
+    "ambient": [82,537,558,616,842,532],
+    "ambiental": [564,383,573,358,636,354,637,358,640,379,642,392,678,344,679,374,684,370,686,333,690,324,692,327,693,366,694,347,702,351,704,351,712,324,797,337,838,351,870,327,898,330,902,337,903,300,916,290,918,303,919,306,923,273,924,269,928,320,949,320],
+    "ambigu": [737,650],
+    "ambliopi": [948,679],
+    "ambrosioid": [35,856],
+    "amchoor": [481,880],
+    "amchur": [481,1087],
+    "ameixeir": [385,578],
+    "amenaz": [899,563],
+    "amenazant": [922,543],
+    "amenorre": [734,558],
+    "americ": [139,582,202,540,206,534,518,529],
+    "american": [72,804,150,446,153,591,161,360,208,460,364,676,390,437,451,460,518,776],
+    "americanu": [182,1024],
+    "amiant": [557,686],
+    "amig": [922,500,924,464],
+    "amigdal": [550,559,889,940,901,493],
+    "amigdaliti": [889,874],
+    "amilace": [379,686],
+    "amiloid": [641,657],
+    "aminoacid": [366,734],
+    "amiotrofic": [650,868],
+    "amis": [449,657],
+    "amistad": [930,573],
+    "aml": [103,986,513,834],
+    "ammi": [480,905],
+    "amnesi": [934,828],
+    "amol": [144,709],
+    "amor": [37,498,104,460,488,456],
+    "amoric": [37,573],
+    "amorphophallu": [90,1083],
+    "amortigu": [772,606],
+    "amortiguador": [651,600],
+    "amortiguan": [747,657],
+    "ampli": [194,615,459,434,672,739,750,525,933,450],
+    "ampliament": [150,624],
+    "amplitud": [627,543,742,605],
+    "ampoll": [176,508,708,782,826,416,839,460,851,755,863,439],
+    "ampollos": [851,844],
+    "amrit": [517,671],
+    "anabolizant": [32,543],
+    "anacard": [439,1065],
+    "anacardium": [439,946],
+    "anacat": [288,686],
+    "anad": [467,717],
+    "anadir": [93,679],
+    "anal": [567,542,585,750,824,494,825,494,827,454],
+    "analgesic": [4,266,20,471,51,268,65,324,70,324,71,331,82,305,91,331,92,367,107,367,112,315,140,489,183,385,187,385,194,380,197,385,229,305,242,346,253,305,258,315,282,335,380,324,429,324,466,474,470,217,473,457,476,328,479,296,487,296,488,259,489,342,491,354,494,294,495,294,496,328,502,350,503,311,504,339,507,339],
+    "anan": [346,1166],
+    "anaphrodisiac": [311,709],
+    "anar": [455,568],
+    "anaranjad": [167,587,363,676],
+    "anastasi": [53,558],
+    "anatomi": [532,612],
+    "anavi": [73,543],
+    "anch": [57,518,112,529,470,365,735,762],
+    "ancian": [221,606],
+    "and": [250,595,269,494,487,701,514,551],
+    "andaluz": [62,593,175,587],
+    "andin": [204,488,221,469,222,513,223,455,224,464,496,513],
+    "ando": [287,612],
+    "andrin": [408,612],
+    "androgen": [715,781],
+    "aneg": [451,644],
+    "anelad": [287,612],
+    "aneld": [451,644],
+    "anemi": [555,459,556,400,587,507,605,454,610,469,630,633,683,428,696,598,871,436,890,408],
+    "anestesi": [553,679],
+    "anestesic": [12,673,84,805],
+    "anet": [8,881,451,816],
+    "anethum": [8,757,451,816],
+    "aneurism": [616,751,617,540,623,534,648,910],
+    "angel": [26,578],
+    "angelic": [26,1142,30,772],
+    "angin": [602,569,603,545,605,741,889,725],
+    "angioedem": [710,543,840,605],
+    "angiofolicular": [876,862],
+    "angor": [605,892],
+    "angusti": [835,543,932,593],
+    "angustiant": [899,563],
+    "angustifoli": [23,968],
+    "ani": [16,895,105,957,449,921,451,514,472,940],
+    "anill": [842,564,867,955],
+    "anillad": [287,1068],
+    "anim": [22,465,256,369,371,409,462,349,508,319,511,388,641,396,646,349,677,362,751,388,896,471,897,502,899,339,914,441,916,474,917,369,918,571,919,574,931,299],
+    "animal": [319,568,521,530,525,483,682,483,867,443,909,402],
+    "anis": [16,768,105,757,449,850,472,924],
+    "anisad": [25,616,189,661,216,577],
+    "aniseed": [16,804,449,781,472,464],
+    "anisum": [16,804,105,792,449,781],
+    "anix": [16,632,449,605],
+    "anjengibr": [18,701],
+    "ann": [214,850],
+    "annon": [357,841,361,822,376,841],
+    "annuu": [243,822,431,928],
+    "annuum": [470,619,473,1032],
+    "ano": [487,349,567,534,585,546,586,390,705,356,710,342,732,504,733,544,798,390,806,356,812,352,817,333,823,356,830,352,831,342,832,300,833,345,868,462,914,286,916,315,937,327,944,363],
+    "anomali": [565,389,608,406,621,527,668,363,673,444,732,382,735,415,796,433,797,385,798,410,799,393,823,374,882,415,883,382,885,382,898,378,902,385,905,363],
+    "anon": [376,1083],
+    "anorexi": [904,735],
+    "anorexigen": [95,686,505,669,506,646],
+    "anorgasmi": [836,912],
+    "anormal": [607,328,613,358,616,339,632,350,645,366,649,483,678,328,694,332,706,301,721,312,734,285,740,375,769,287,789,379,790,375,797,322,798,343,799,452,805,280,808,298,810,322,824,315,825,315,829,292,830,309,835,301,838,335,878,366,881,362,888,325,897,301,913,277,931,253,942,350,943,319],
+    "anormalidad": [841,578],
+    "anormalment": [700,498,719,518,732,518,848,494],
+    "anosmi": [734,863,953,865],
+    "anovulacion": [715,781],
+    "anquilosant": [703,798,707,527,759,936],
+    "ansiedad": [11,282,23,342,55,299,56,246,237,293,239,290,240,293,249,338,254,316,510,299,511,412,512,290,516,290,551,299,555,306,581,299,610,312,638,326,646,269,685,293,714,312,726,319,739,257,774,274,813,271,814,303,834,267,835,274,895,497,898,288,901,440,904,231,906,357,907,370,908,285,909,419,910,279,911,385,912,200,917,285,918,264,924,234,928,279,929,195,931,231,932,299,954,306],
+    "ansiolitic": [23,493,24,330,55,432,56,356,65,442,84,424,127,666,205,424,239,419,240,424,256,411,349,456],
+    "ansios": [906,525],
+    "ansu": [387,589],
+    "ant": [621,415,708,365,732,583,757,392,787,505,813,392,832,347,833,400,834,385,835,560,901,381,907,371],
+    "antebraz": [756,947],
+    "antecedent": [533,302,588,311,589,334,592,353,648,324,649,353,694,324,696,305,704,327,711,302,725,345,733,278,738,308,760,283,798,334,807,290,816,290,817,285,818,311,829,285,838,327,844,296,858,296,869,249,895,305,899,280,904,247,907,275,912,214,915,302,916,270,922,270,924,251,925,293,929,209,931,247,937,280,948,338],
+    "anterior": [763,517,832,658,833,517],
+    "anterogen": [224,600],
+    "anthriscu": [25,946],
+    "anti": [317,743],
+    "antiadherent": [153,584],
+    "antialergic": [59,423,154,713,274,494,403,713,417,647],
+    "antianemic": [79,618,387,543],
+    "antibacterial": [168,632,514,612],
+    "antibacterian": [3,345,34,326,39,253,60,341,62,370,73,312,87,539,98,427,104,304,110,366,128,437,159,381,202,373,224,485,250,412,262,355,271,509,281,299,286,469,356,385,373,422,489,398,496,381],
+    "antibiotic": [45,775,62,770,811,522],
+    "anticancerigen": [17,494,357,804,359,545,370,602],
+    "anticipatori": [901,568],
+    "anticoagulant": [62,708,257,548,279,494,346,542,482,509],
+    "anticonceptiv": [808,538,859,558],
+    "anticonvulsiv": [86,932],
+    "anticuerp": [688,513,700,464,701,478,752,608,801,519,851,464],
+    "antidepresiv": [22,578,65,675,184,565,237,474,256,460,354,521,361,533],
+    "antidiabetic": [372,694],
+    "antidiaforetic": [226,686],
+    "antidiarreic": [136,515,142,551,348,515,388,499,397,565,407,578,408,460],
+    "antiedematos": [111,590,157,596,460,527],
+    "antiemetic": [18,646,38,492],
+    "antienvejecimient": [370,668,381,509],
+    "antiequimotic": [242,701],
+    "antiescorbutic": [129,595],
+    "antiespasmodic": [0,312,5,312,8,306,11,321,15,375,35,324,47,371,57,330,66,355,70,347,108,292,114,347,148,337,174,367,175,337,177,333,209,330,229,327,234,333,239,330,240,333,244,363,253,327,255,375,262,327,313,379,445,423,449,347,451,340,478,367,480,351],
+    "antifatig": [233,568],
+    "antifosfolipid": [701,794,894,625],
+    "antifungic": [3,451,110,478,120,504,128,571,175,478,250,539,278,527],
+    "antigen": [886,701],
+    "antigot": [386,525],
+    "antigripal": [258,637],
+    "antiguament": [165,679],
+    "antiguedad": [151,451,158,533,178,483,192,571,254,510,294,515,311,533],
+    "antihemorragic": [36,419,52,390,86,554,159,531,188,601],
+    "antihipertensiv": [213,569,245,593],
+    "antihistaminic": [31,514,459,500],
+    "antiinflamatori": [1,202,7,142,10,184,17,228,18,255,31,152,34,154,36,143,37,156,38,145,42,200,44,185,46,193,49,179,50,195,51,148,52,133,59,144,60,162,61,216,71,248,75,228,85,153,86,189,96,210,99,274,101,222,104,144,107,202,110,173,111,185,112,173,113,159,117,267,118,143,123,210,124,215,125,212,127,270,131,185,135,197,140,270,146,185,150,170,153,159,154,243,156,175,157,187,160,177,161,137,163,179,168,187,169,179,172,168,173,183,186,218,187,212,189,207,190,212,192,207,193,207,194,210,195,212,196,223,201,183,202,177,205,172,206,175,207,175,212,170,215,156,217,179,222,246,228,185,229,168,230,189,234,172,236,185,241,175,242,255,246,187,248,195,253,168,255,193,257,187,261,191,264,187,269,162,271,175,276,170,281,207,282,185,283,191,284,179,287,166,290,153,291,173,295,220,301,210,309,202,310,200,316,193,344,185,345,175,346,185,350,166,351,179,352,185,355,183,357,200,359,179,362,154,367,183,369,154,370,197,373,200,375,183,386,143,388,181,390,166,391,179,392,175,394,200,403,243,412,220,414,212,417,281,418,207,420,278,425,172,427,200,429,179,431,212,434,207,437,187,438,193,443,200,444,212,452,219,454,144,455,221,459,148,460,165,475,239,477,210,485,145,486,160,487,163,488,143,490,157,491,195,492,129,493,254,494,162,495,228,499,179,500,175,501,173,502,193,504,187,507,187,510,175,514,181,515,168,517,183],
+    "antill": [381,509,476,612],
+    "antimicrobian": [3,357,19,432,42,576,59,315,63,379,169,391,181,453,186,476,194,459,206,383,208,383,211,364,251,437,288,551,356,400,372,413,418,453,419,453,421,482,450,361],
+    "antioquen": [45,650],
+    "antioxidant": [1,270,3,234,17,165,22,213,62,245,68,186,69,206,73,217,85,156,103,199,109,199,117,272,141,276,153,161,167,176,186,221,191,206,195,216,196,288,198,274,199,195,200,194,212,240,213,171,214,168,216,184,219,169,223,230,224,166,238,178,256,169,262,171,269,232,272,154,275,163,276,240,280,188,284,182,286,226,287,169,288,190,289,178,290,156,291,243,292,256,293,201,294,190,295,224,300,216,307,206,316,196,320,201,321,196,322,211,323,201,324,182,325,199,326,188,327,184,328,206,329,192,330,211,331,203,332,219,333,219,334,221,335,201,336,178,337,213,338,213,339,184,340,221,341,221,342,221,343,221,344,254,345,245,347,256,348,190,349,254,350,237,351,249,352,254,353,184,358,238,359,249,361,196,362,157,363,203,364,196,365,201,367,186,368,196,369,157,370,266,373,268,374,194,376,203,378,243,381,220,382,240,384,165,385,160,386,145,387,163,389,220,390,237,391,249,392,245,393,166,394,268,395,190,396,176,398,168,399,199,400,203,401,219,402,161,404,163,406,199,408,169,410,247,411,213,412,286,414,279,415,206,420,283,421,286,422,268,424,219,425,175,426,224,427,203,428,201,431,279,432,208,433,208,436,276,437,256,438,262,441,203,446,219,448,169,453,196,454,213,455,225,457,163,462,227,463,213,467,199,470,186,471,159,475,176,477,276,485,148,486,230,492,131,495,165,509,178,513,184],
+    "antipaludic": [130,770],
+    "antiparasitari": [29,423,94,586,353,499,357,551,364,533,430,711,457,442],
+    "antipiretic": [51,388,71,479,74,485,97,507,107,531,166,512,168,490,210,455,409,518],
+    "antipruriginos": [96,770],
+    "antirreumatic": [97,589,155,569,190,647,230,576],
+    "antiseptic": [2,427,10,212,13,418,20,343,23,352,27,299,43,360,44,325,58,262,72,332,75,402,81,475,115,315,116,340,118,251,119,340,128,475,133,343,134,383,140,364,142,352,145,478,146,440,152,340,155,443,158,340,160,311,173,321,175,421,180,302,188,360,218,299,318,471,355,321,413,356,466,347,476,318,480,318,484,296,487,287,488,251,490,277,501,305],
+    "antisocial": [925,966],
+    "antisudoral": [10,443],
+    "antitripsin": [524,606],
+    "antitumoral": [31,362,121,506,266,422,270,436,274,401,275,382,278,609,280,440,282,440,283,455,285,455,292,600,488,341,503,567],
+    "antitusiv": [2,540,28,563,183,647,442,647],
+    "antiulceros": [102,618],
+    "antiviral": [24,297,28,409,131,409,159,546,161,304,168,414,195,470,201,405,202,392,208,388,265,558,269,359,271,534,299,459,356,405,367,405,472,322,503,380,514,400],
+    "antocianin": [370,668,386,483],
+    "antoj": [813,538,914,453],
+    "anu": [224,844],
+    "anular": [867,817],
+    "anzar": [29,563],
+    "aort": [616,948,617,938],
+    "aortic": [616,787,617,885,623,559],
+    "apabil": [490,578],
+    "aparat": [64,624],
+    "aparec": [605,599,839,548],
+    "aparecen": [709,469,710,455,806,473,840,508,850,431,861,409],
+    "aparecer": [843,475,845,466,847,462,849,454,868,442],
+    "aparent": [895,564,933,518],
+    "aparicion": [102,423,534,445,552,396,681,436,700,411,732,594,737,445,828,396,844,407,869,342,921,403],
+    "aparienci": [351,508,498,503,798,519,859,469,912,753,926,478],
+    "apati": [902,631],
+    "apatic": [914,492],
+    "apazot": [35,612],
+    "apegad": [907,553],
+    "apendic": [577,906,600,684],
+    "apendiciti": [577,984],
+    "apepu": [240,631],
+    "aperitiv": [78,625,174,639],
+    "apestos": [35,612],
+    "apetit": [12,289,54,264,78,399,210,375,263,532,440,417,505,587,506,574,531,360,543,360,560,382,571,382,577,442,591,395,592,417,687,371,693,403,695,408,696,360,711,356,880,412],
+    "api": [30,815,83,922,216,513,217,792,221,657,444,862],
+    "apichu": [212,624],
+    "apih": [223,589],
+    "apilan": [651,600],
+    "apill": [223,589],
+    "apin": [223,543,224,553],
+    "apinu": [224,600],
+    "apionab": [217,1024],
+    "apium": [83,835,217,781,444,875],
+    "aplanad": [282,679],
+    "apne": [532,984,549,575],
+    "apol": [9,589],
+    "apong": [94,1179],
+    "aponogeton": [317,1202],
+    "aport": [13,523,294,569,306,632,423,595],
+    "aportar": [77,664],
+    "apoy": [296,528,297,534,301,528,510,441,515,423,518,436,519,598,520,445,899,385,923,351,929,443],
+    "apoyar": [277,701],
+    "appl": [220,498,382,1044,456,385],
+    "applanatum": [282,919],
+    "apreciad": [106,507,274,452,287,448,289,471,293,531,294,502,305,571,471,419],
+    "aprendid": [924,464,932,593],
+    "aprendizaj": [511,534,664,595,741,451,909,432],
+    "apricot": [387,1108],
+    "aprobacion": [929,419],
+    "aprovechad": [82,618],
+    "aprovechar": [100,717],
+    "aprovechars": [925,543,927,443],
+    "aproximadament": [869,500],
+    "apt": [259,664],
+    "aquatic": [313,954],
+    "aquell": [64,624],
+    "aquifolium": [74,798,169,781,418,861],
+    "aquil": [52,450,255,653],
+    "aquile": [52,450,255,653],
+    "arab": [355,671],
+    "arabarb": [40,701],
+    "arabi": [463,529],
+    "arabian": [463,771],
+    "arabic": [135,885,463,979],
+    "arabig": [95,727,135,885],
+    "arachi": [453,946],
+    "aragon": [60,548,174,1037],
+    "aram": [305,1179],
+    "aran": [408,564,871,799],
+    "arandan": [73,891,153,868,425,832,426,672],
+    "arandaner": [73,543],
+    "arandill": [73,543],
+    "aranon": [408,856],
+    "aranoner": [408,612],
+    "aranuel": [31,514,459,500],
+    "aras": [348,686],
+    "araucan": [132,961],
+    "araucari": [132,1179],
+    "araz": [365,1077],
+    "arbol": [68,343,87,358,94,398,101,292,103,366,106,354,108,282,110,325,112,325,122,303,125,398,128,563,129,303,131,346,139,358,144,362,151,306,161,257,170,354,178,328,193,388,198,388,199,240,265,350,370,370,374,358,377,335,379,350,463,270,465,312,501,449,503,322,513,339,525,319,861,464],
+    "arborescent": [190,780],
+    "arbust": [1,356,76,290,95,378,98,356,150,299,151,287,152,340,154,311,156,308,157,328,158,340,159,318,160,311,161,241,162,321,163,315,164,325,165,325,166,343,167,305,168,328,169,315,170,332,171,311,173,321,174,332,175,305,176,315,177,302,178,308,179,373,180,302,181,364,182,383,184,360,186,383,187,373,191,356,192,364,193,364,197,373,233,272,503,302],
+    "arbustiv": [155,632,183,718],
+    "arbutu": [146,919],
+    "arc": [117,952,362,493,657,577],
+    "archangel": [26,822],
+    "archangelic": [26,822],
+    "arctic": [508,771],
+    "arctium": [104,771],
+    "arctostaphyl": [152,872,413,899],
+    "ardagai": [271,534,281,748,282,563,286,476],
+    "ardai": [281,521],
+    "ardient": [562,679],
+    "ardo": [281,521],
+    "ardor": [581,509,590,377,605,373,626,351,644,370,680,351,764,320,767,307,775,358,776,398,782,385,810,362,811,345,815,338,824,355,825,355,829,329,834,329,839,341,854,341,862,332,935,351,949,345],
+    "are": [619,382,625,360,698,360,730,363,745,389,771,496,815,360,826,477,827,496,846,367,853,367,855,341,868,338,869,305,875,402,892,316,905,363,929,256],
+    "areat": [698,833],
+    "aren": [935,612],
+    "arenill": [949,600],
+    "aret": [287,564,488,483],
+    "argan": [160,650],
+    "argemon": [183,1007],
+    "argentatum": [187,1007],
+    "argentin": [69,684,132,538],
+    "aril": [359,571,455,493,474,631],
+    "arilsulfatas": [671,701],
+    "arisc": [199,470],
+    "aristoteli": [414,1007],
+    "arizon": [161,504],
+    "armag": [57,624],
+    "armeniac": [387,833],
+    "armenian": [387,543,457,543],
+    "armoraci": [211,856],
+    "arnic": [242,1240],
+    "arom": [23,485,39,290,47,463,175,420,189,502,236,448,240,416,313,473,372,458,420,528,466,479,471,378,482,420],
+    "aromaterapi": [116,709],
+    "aromatic": [0,389,1,490,158,468,180,416,184,496,192,502,193,502,209,711,368,468,369,375,375,443,447,425,471,378],
+    "aromaticum": [20,878,466,885],
+    "aromatizant": [289,559,471,498,482,554],
+    "aromatizar": [155,686],
+    "aronjin": [24,492],
+    "arquimoni": [37,573],
+    "arracach": [221,1161],
+    "arracaci": [221,850],
+    "arrachac": [223,589],
+    "arrancars": [910,1158],
+    "arrastrad": [931,496],
+    "arrayan": [158,653,180,1083],
+    "arrebat": [918,811],
+    "arreglar": [912,431],
+    "arrezu": [201,671],
+    "arriben": [0,589],
+    "arriesgad": [897,589],
+    "arritmi": [607,816,629,618],
+    "arroganci": [927,481],
+    "arroy": [312,726],
+    "arrozal": [319,734],
+    "arrud": [57,624],
+    "arrunt": [290,563],
+    "arsenic": [846,600],
+    "art": [410,599,461,443],
+    "artamis": [53,558],
+    "artamisi": [53,558],
+    "artemeg": [53,558],
+    "artemis": [53,801],
+    "artemisi": [12,635,53,814,54,718],
+    "arteri": [534,403,535,352,601,391,602,573,603,635,604,395,605,403,608,412,616,412,617,403,618,561,620,372,625,365,629,416,648,403,701,383,794,631],
+    "arterial": [41,269,70,315,109,343,122,285,213,296,216,318,238,308,349,325,354,332,361,340,374,450,376,352,400,352,415,356,535,453,599,343,601,518,602,328,606,293,608,318,615,325,616,318,617,311,618,433,620,287,628,299,647,277,648,311,670,315,687,302,716,302,721,293,728,315,739,265,781,457,783,347,790,352,791,279,792,340,794,427,801,321,831,399,952,340],
+    "arterioesclerosi": [602,925],
+    "arteriopati": [677,844],
+    "arthrospir": [295,1032],
+    "artichok": [220,752,232,938],
+    "articul": [913,543],
+    "articulacion": [623,358,631,377,636,369,637,373,679,588,689,377,695,385,702,365,703,377,704,365,705,340,706,327,717,340,739,307,742,569,746,334,747,612,754,292,756,315,758,622,759,347,765,445,769,523,772,472,773,572,892,287],
+    "articular": [112,420,444,515,678,425,679,463,697,443,742,727,747,434,758,400,765,368,769,532,772,702,773,680,774,389],
+    "artificial": [612,637],
+    "artist": [282,919],
+    "artocarpu": [377,828,379,852],
+    "artriti": [71,373,85,313,190,433,195,433,444,433,675,381,679,522,697,373,704,569,705,475,707,337,742,569,744,318,745,354,747,365,755,299,758,545,759,347,765,310,766,294,767,297,768,297,772,337,802,369,874,361,893,334],
+    "artrosi": [761,507,772,738,773,787],
+    "arvens": [64,799,185,913],
+    "asafetid": [478,1126],
+    "asafoetid": [478,932],
+    "asbest": [531,508,533,503,557,768,560,846],
+    "asbestosi": [560,892],
+    "asciend": [805,548],
+    "asciti": [880,865,884,599],
+    "ascocarp": [291,637],
+    "asenci": [54,450],
+    "asenj": [54,450],
+    "asensi": [54,450],
+    "asentsi": [54,450],
+    "asfixi": [551,644],
+    "ash": [112,991,126,754,479,522],
+    "ashwagandh": [205,874],
+    "asi": [87,513,93,496,102,452,184,550,316,519,347,502,508,387,512,457],
+    "asian": [34,747,77,834],
+    "asiatic": [34,389,59,362,90,503,98,509,102,837,275,403,283,480,354,475,405,515,512,738,518,436],
+    "asimetri": [844,595],
+    "asimilacion": [78,679],
+    "asintomatic": [616,474,622,446,634,460,670,469,673,518,760,406,824,442,827,406,860,437],
+    "asistid": [832,516],
+    "asm": [59,423,521,895,537,475,555,525,941,499],
+    "asociacion": [624,523,655,563,707,503,866,471],
+    "asociad": [24,337,444,534,673,497,708,372,728,450,847,396,883,428,890,400,913,372,937,385,941,428],
+    "asociars": [622,624],
+    "asp": [673,961],
+    "asparagu": [308,653,519,997],
+    "aspect": [380,545,853,498,870,508,881,785],
+    "asper": [156,708,529,560,847,657,858,475,868,636],
+    "asperez": [954,657],
+    "aspergillu": [558,709],
+    "aspergilosi": [558,946],
+    "aspiracion": [523,618,552,533],
+    "aspirin": [51,472,107,646,941,543],
+    "ass": [478,932],
+    "astigmatism": [945,939],
+    "astragal": [200,939],
+    "astragalu": [200,939],
+    "astringent": [36,223,37,244,40,298,64,265,73,231,114,279,118,326,120,285,123,328,124,336,125,428,126,265,135,309,138,336,141,328,142,312,146,289,149,402,150,265,152,302,158,302,163,279,165,289,170,295,172,263,177,268,179,332,180,268,182,340,185,324,192,324,193,324,206,274,236,289,247,260,252,255,311,302,314,302,315,295,348,292,370,309,383,295,388,282,390,260,392,377,393,359,394,312,397,418,398,361,401,432,404,354,407,425,408,260,409,309,413,316,416,425,420,340,421,345,435,324,458,265,465,260],
+    "astut": [933,563],
+    "asuman": [929,419],
+    "atac": [637,436,642,476,655,440,678,418,681,413,684,450,686,405,695,450,697,436,698,382,699,335,700,390,701,401,708,352],
+    "atacan": [658,571,701,537,851,522],
+    "ataqu": [549,419,551,432,555,442,604,591,614,446,686,419,689,456,701,415,758,407,900,653,906,353,922,365],
+    "atasc": [580,686],
+    "atascad": [766,771],
+    "ataxi": [654,822,667,583,672,596],
+    "atelectasi": [553,919],
+    "atencion": [653,503,741,420,903,795,912,333,926,666,933,435],
+    "atenuad": [936,664],
+    "ateroesclerosi": [602,677,603,481,604,466,605,476,616,486,618,486,633,466,634,471],
+    "aterosclerosi": [599,623,663,554,794,565],
+    "atipic": [844,548,888,587],
+    "atlet": [267,644],
+    "atletic": [267,644],
+    "atmosferic": [537,595],
+    "atopic": [838,781,850,485,862,502],
+    "atr": [796,709],
+    "atracon": [904,876],
+    "atractiv": [350,612],
+    "atractylod": [226,1233],
+    "atrapamient": [744,752,767,715],
+    "atribuy": [910,553,911,538],
+    "atribuyen": [222,513,287,473,291,493,357,568,493,536,498,503],
+    "atrofi": [657,551,658,545,819,467,870,508],
+    "aturdimient": [607,534,610,557,630,551,894,563],
+    "aucupari": [126,799,416,920],
+    "audaz": [374,701],
+    "audicion": [649,533,664,539,666,533,938,474,939,469,943,651,956,478],
+    "auditiv": [955,1073],
+    "aument": [32,273,461,241,508,266,515,310,520,326,540,293,583,352,606,307,626,307,633,320,634,323,635,445,670,330,686,313,693,525,711,426,713,360,715,270,716,316,721,307,727,310,730,298,733,280,784,360,791,293,793,373,794,326,813,293,817,287,825,310,856,266,858,298,880,352,881,356,886,352,896,270,937,282],
+    "aumentad": [655,679],
+    "aumentan": [721,612],
+    "aumentar": [76,387,78,433,204,403,205,403,213,395,227,438,233,363,267,411,452,359,506,474,508,338,515,395,520,415,608,424,636,424],
+    "aunqu": [179,647,243,540,357,609,453,589],
+    "aur": [638,646,677,553],
+    "aurantium": [148,810,240,805],
+    "aureu": [662,563,849,471,855,463,856,439],
+    "auricul": [279,862],
+    "auricular": [608,787,620,522,647,502],
+    "auriculari": [279,862],
+    "auritum": [189,991],
+    "ausenci": [629,519,673,833,733,725,830,469,836,519,919,443],
+    "ausent": [683,473,715,416,720,483,731,469,734,792,823,473],
+    "australian": [336,886],
+    "autoestim": [896,468,915,527,928,522],
+    "autoimagen": [905,839],
+    "autoimpuest": [928,600],
+    "autoinducid": [904,496],
+    "autoinmun": [228,303,531,274,538,282,570,328,594,340,613,313,614,297,635,288,637,407,642,328,655,465,656,336,668,266,678,288,679,313,680,274,681,285,684,310,685,282,687,282,690,271,691,382,692,274,693,306,695,470,696,382,697,407,698,263,700,268,701,385,702,294,704,294,707,500,708,351,709,271,712,380,713,321,714,300,724,317,742,294,750,294,752,413,753,413,759,279,781,321,783,324,788,303,792,317,795,310,851,377,891,303,894,410,943,279],
+    "autoinmunitari": [802,577,890,507,893,522],
+    "automovilistic": [762,548,771,523],
+    "autoritari": [929,386,930,528],
+    "autosomic": [677,653,737,503,738,478,769,435,791,640,858,460],
+    "autumn": [22,999],
+    "auxili": [188,752],
+    "ava": [84,874],
+    "avanzad": [587,507,641,459,653,454,670,459,798,469,807,408,817,400,832,361,891,474,937,563],
+    "avarici": [930,573],
+    "avellan": [123,1082,150,754,399,1032],
+    "averrho": [350,856],
+    "avium": [386,767],
+    "awa": [84,874],
+    "axil": [848,517,873,512,885,543],
+    "axilar": [732,575,737,599],
+    "ayak": [204,1082],
+    "ayot": [430,709],
+    "ayud": [6,308,9,291,14,268,19,358,21,354,25,350,32,268,39,217,48,339,58,271,81,376,101,283,113,288,216,328,220,283,284,324,296,380,315,342,346,335,355,331,358,425,360,308,381,273,382,308,386,259,387,291,391,324,393,296,399,354,404,291,414,385,415,367,425,311,426,400,446,390,447,318,481,315,518,315,906,259],
+    "ayudan": [76,503,103,595,147,582,448,508],
+    "ayudand": [218,543,274,537,438,616],
+    "ayudar": [41,450,188,601,440,567,447,514,452,450],
+    "ayurved": [483,523,515,513,517,557,519,523],
+    "ayurvedic": [205,488,510,498,511,498,513,513,516,483,520,503],
+    "azabil": [490,578],
+    "azadiracht": [110,880],
+    "azafran": [17,844,22,868,475,944],
+    "azahar": [148,764,163,571,240,759],
+    "azarol": [170,970,400,892],
+    "azaroll": [126,624],
+    "azarolu": [170,859,400,892],
+    "azenori": [214,606],
+    "azoll": [319,1197],
+    "azoospermi": [823,612],
+    "aztec": [251,676,262,569],
+    "azucar": [19,391,32,293,41,303,109,387,120,362,147,378,212,336,220,440,225,298,251,396,266,350,280,366,350,330,373,396,376,396,377,354,414,420,426,437,433,405,452,303,477,415,485,288,492,255,518,343,574,405,597,382,634,347,721,330,727,333],
+    "azufr": [286,573],
+    "azufrad": [286,573],
+    "azul": [59,409,63,493,256,869,625,455,626,473,690,469],
+    "azulad": [535,415,537,435,552,423,556,419,621,452,624,461,883,457,892,378],
+    "azulej": [50,717],
+    "b12": [299,661,630,577,696,744],
+    "b27": [703,625,759,575],
+    "babe": [580,686],
+    "babos": [490,822],
+    "babosill": [287,612],
+    "baby": [497,939],
+    "baca": [462,578],
+    "baccat": [121,1007],
+    "bacer": [37,573],
+    "bachelor": [50,954],
+    "baco": [429,657],
+    "bacop": [511,1005,516,799],
+    "bacteri": [153,347,250,427,523,400,530,408,549,372,550,527,582,427,705,364,706,351,775,372,810,375,824,368,825,513,828,344,837,335,849,338,853,357,854,354,855,332,856,459],
+    "bacterian": [153,286,522,336,526,286,527,336,529,460,550,315,569,368,582,351,584,364,612,312,662,332,666,347,679,344,686,306,689,332,695,340,753,336,776,457,782,329,800,329,805,387,810,491,815,473,821,294,822,319,828,283,840,322,849,464,853,519,854,411,855,273,874,319,875,322,886,344,887,325,889,309,890,286,935,300,938,309,951,467],
+    "badian": [12,453,472,982],
+    "badianer": [472,534],
+    "bai": [253,569,272,514],
+    "baj": [29,251,39,197,40,313,160,291,219,274,220,256,232,291,362,254,374,313,522,306,543,274,552,258,553,303,556,463,568,324,575,362,587,324,588,279,599,321,601,282,614,297,628,279,675,306,676,288,683,274,687,282,703,303,709,271,715,241,718,407,722,291,724,423,733,249,735,410,736,239,741,243,759,279,760,423,761,467,764,419,768,239,775,279,797,282,805,245,824,276,832,401,833,266,837,251,865,276,896,241,903,251,915,271,928,268],
+    "bajar": [74,496,97,519,119,519,139,513,165,496,243,476,245,471,409,531],
+    "bajia": [472,534],
+    "baker": [765,801],
+    "bal": [515,992],
+    "balamt": [462,578],
+    "balausti": [455,568],
+    "balaustr": [455,568],
+    "balm": [24,1153,88,865],
+    "balsam": [5,589],
+    "balsamic": [48,502,49,481,100,698,115,481,134,585,158,519,241,471,249,531],
+    "ban": [242,701],
+    "banan": [378,1087],
+    "band": [500,644],
+    "baner": [855,558],
+    "barb": [51,472,487,522,698,512],
+    "barbad": [61,859,381,859],
+    "barbadensi": [61,796],
+    "barbadij": [166,717],
+    "barbarum": [411,999],
+    "barbary": [485,715,492,654],
+    "barberry": [169,657],
+    "barbud": [280,919],
+    "bardan": [104,1000],
+    "baret": [429,657],
+    "bark": [71,728,127,608,129,776,177,698,180,504],
+    "barotraum": [956,637],
+    "barr": [699,717,837,644,872,480,873,665,893,480],
+    "barth": [676,886],
+    "bas": [132,466,686,499,740,587,766,423,768,731],
+    "basad": [81,761],
+    "basal": [845,584],
+    "basic": [225,509,379,632],
+    "basil": [0,913,59,869,510,880],
+    "basilic": [0,589],
+    "basilicum": [0,833],
+    "basocelular": [845,828],
+    "bastard": [36,456,314,616,456,385],
+    "batac": [220,573],
+    "batat": [212,1202],
+    "bay": [9,703,151,367,153,357,155,566,158,433,161,455,167,389,169,402,180,385,411,611,412,631,413,596,414,682,415,666,418,606,419,714,421,495,509,541],
+    "bayonet": [495,839],
+    "baz": [226,768,458,518,674,545,890,798],
+    "bead": [502,946],
+    "bean": [89,798,136,596,482,764],
+    "bear": [208,593,282,625],
+    "bearberry": [152,946],
+    "beard": [268,600],
+    "bearded": [268,976],
+    "beargras": [495,595],
+    "beb": [497,527,543,460,549,469,621,464,820,447,849,426,852,415],
+    "bebid": [69,594,238,514,356,536,465,489,638,560],
+    "bechterew": [759,868],
+    "becu": [212,624],
+    "bed": [203,1072],
+    "bedar": [29,563],
+    "bedarr": [26,578],
+    "bedukat": [56,529],
+    "beech": [119,1136],
+    "beefsteak": [59,771],
+    "beeskloutji": [498,650],
+    "beet": [213,1073],
+    "beggar": [104,771],
+    "behcet": [702,899],
+    "bei": [200,701],
+    "bejuc": [86,1114,99,718],
+    "bejuquill": [471,573],
+    "belar": [29,742,56,488],
+    "bell": [168,804,470,584,488,666],
+    "belladon": [488,525],
+    "bellez": [236,563,272,463,912,358,927,399],
+    "bellflower": [227,686],
+    "belli": [246,925],
+    "bellot": [125,780],
+    "bembrill": [388,664],
+    "ben": [101,952],
+    "bendit": [459,543],
+    "benefici": [100,555,106,536,290,435,298,596,477,596,509,498],
+    "beneficiand": [369,523,434,701],
+    "beneficios": [46,468,73,358,212,412,236,448,287,404,347,453,350,404,374,463,387,389,427,485,429,434,432,496,486,389],
+    "bengu": [212,624],
+    "benign": [717,404,719,412,720,573,723,448,731,400,816,546,860,404,866,375,870,404,878,473,922,358,941,573,942,453],
+    "berberi": [181,1015,419,861,421,897],
+    "berberin": [169,781,181,661,419,661],
+    "bergamot": [4,496,43,1111],
+    "berger": [801,912],
+    "bermej": [115,657],
+    "berr": [312,1077],
+    "berrinch": [918,568],
+    "berry": [85,518,509,816],
+    "bertholleti": [437,925],
+    "berz": [215,573],
+    "bes": [873,966],
+    "bet": [213,749,641,571,712,738],
+    "betabel": [213,618],
+    "betabloqueant": [609,631],
+    "betacaroten": [212,543,214,527,387,512],
+    "betaceum": [374,939],
+    "betarrag": [213,862],
+    "betiguer": [55,644],
+    "betul": [113,828],
+    "bey": [43,752],
+    "bhutik": [480,664],
+    "bicolor": [371,919],
+    "bicycli": [305,1007],
+    "bieiteir": [161,504],
+    "bien": [854,548,925,543],
+    "bienestar": [361,653,510,593],
+    "bienni": [261,939],
+    "bilberry": [73,786],
+    "bili": [181,661,218,543,578,781],
+    "biliar": [106,536,181,588,572,574,578,851,579,878,598,883],
+    "bilirrubin": [578,657],
+    "bilob": [68,1111],
+    "bindweed": [156,644],
+    "bing": [386,525],
+    "bio": [483,631],
+    "biofertilizant": [319,734],
+    "biologic": [896,447,904,412,914,408,932,534],
+    "bipolar": [897,767,916,724],
+    "birch": [113,1056,269,895],
+    "bird": [32,628,214,484,215,458,386,419,452,644],
+    "bishop": [214,558,480,834],
+    "bismalv": [207,644],
+    "bitau": [454,529],
+    "biti": [35,612],
+    "biting": [494,839],
+    "bitter": [29,822,148,703,210,509,240,698,456,540],
+    "bittersweet": [51,543],
+    "bitterwort": [210,637],
+    "bituc": [225,553],
+    "bixihumi": [161,504],
+    "bizc": [948,1041],
+    "bizia": [199,470],
+    "bizoy": [199,470],
+    "black": [31,681,33,523,75,359,140,598,147,566,161,449,201,405,202,538,234,653,265,414,269,359,283,423,289,534,291,608,403,392,450,366,459,675,467,575,469,486],
+    "blackberry": [392,886],
+    "blackcurrant": [154,938,403,822],
+    "blackthorn": [408,987],
+    "bladder": [30,839],
+    "bladderwrack": [301,770],
+    "blaeberry": [73,543],
+    "blanc": [0,270,1,341,10,203,46,325,49,302,56,243,58,426,62,295,63,292,71,308,107,341,108,254,122,385,170,318,215,263,216,415,229,455,237,401,239,286,253,284,271,295,272,430,311,521,352,311,357,337,371,311,400,337,402,268,410,298,462,377,500,295,503,289,625,270,632,315,664,329,670,470,672,514,676,295,681,292,690,278,709,278,810,289,811,275,825,284,848,273,855,256,864,256,872,275,894,311],
+    "bland": [407,596,569,760,627,455,754,819,848,460,941,483],
+    "blanquecin": [852,553],
+    "blazei": [274,862],
+    "bleed": [52,727],
+    "blenorragi": [825,862],
+    "blond": [461,954],
+    "bloodwort": [36,706,52,669],
+    "bloody": [165,679],
+    "blooming": [486,589],
+    "bloque": [534,488,647,434,663,478,677,451,765,419,855,419,955,464],
+    "bloquead": [599,661,950,632],
+    "bloquean": [688,612,752,500],
+    "blowball": [203,481],
+    "blu": [38,644,63,947,161,418,256,508],
+    "blueberry": [73,543],
+    "boc": [118,359,394,503,541,465,583,480,689,629,702,450,708,372,709,415,828,396,849,389,851,411],
+    "boci": [685,832,686,518,740,804,741,451],
+    "boigh": [129,971],
+    "boj": [2,822,162,954],
+    "bol": [177,581,461,443],
+    "bold": [106,1257],
+    "boldu": [106,1053],
+    "bolet": [281,452,287,977,292,596],
+    "boletu": [292,1170],
+    "bols": [575,647,576,647,577,601,765,640,819,644],
+    "bolsit": [488,525],
+    "bomb": [345,644],
+    "bombe": [615,679],
+    "bombear": [606,564,628,799],
+    "boneter": [164,1041],
+    "boniat": [212,868],
+    "bonit": [75,595],
+    "bonnet": [227,686],
+    "bor": [225,553],
+    "borag": [46,1136],
+    "bord": [313,525,389,404,455,415,842,448,844,435,865,452,867,419,951,525],
+    "borderlin": [905,839],
+    "bordetell": [549,624],
+    "boroj": [366,1083],
+    "borojo": [366,968],
+    "borrach": [46,709],
+    "borrachin": [146,679],
+    "borrain": [46,709],
+    "borraj": [46,1065],
+    "borros": [601,403,635,411,648,415,693,438,707,387,711,387,726,438,936,424,937,359,944,399,945,676,946,525,947,558,949,383,950,438],
+    "bosc": [36,525],
+    "bosqu": [73,472,266,565,286,901],
+    "botic": [56,529],
+    "botiquin": [188,752],
+    "boton": [20,595,44,762,466,602,489,576],
+    "bourbon": [463,529],
+    "box": [162,912],
+    "boxwood": [162,912],
+    "boysen": [422,1083],
+    "boysenberi": [422,734],
+    "boysenberry": [422,1152],
+    "bracket": [264,569,271,534,277,582,282,563],
+    "bradicardi": [609,874],
+    "bradicinesi": [640,709],
+    "brahmi": [511,593,516,918],
+    "brambl": [392,886],
+    "brasil": [339,612,437,964],
+    "brasilen": [370,668,437,632],
+    "brassic": [33,693,215,652,219,684,443,774,469,644],
+    "bravi": [52,405,85,467,389,661,454,439],
+    "braz": [132,352,604,384,620,362,623,388,627,355,647,349,651,362,654,428,688,400,691,369,736,322,744,345,746,362,752,328,755,471,756,342,771,342,847,349,868,333],
+    "brazil": [437,925],
+    "brazilian": [369,493,464,754,482,554],
+    "brca1": [807,584],
+    "brca2": [807,584],
+    "bread": [136,596,273,603,282,590],
+    "brecin": [160,650],
+    "bresquill": [290,563],
+    "brev": [663,554,920,507,921,724],
+    "breval": [360,624],
+    "brez": [160,1019],
+    "brezal": [160,650],
+    "briar": [85,742,172,569],
+    "bridewort": [51,543],
+    "brillant": [307,617,585,582,832,428,854,494],
+    "brillantez": [927,481],
+    "brinon": [395,686],
+    "bromelin": [346,679],
+    "broncead": [844,548,869,460],
+    "broncean": [864,558],
+    "broncodilatador": [99,780],
+    "bronqui": [553,679],
+    "bronquial": [521,768,522,569,538,725,883,828],
+    "bronquiectasi": [538,805,554,661],
+    "bronquioliti": [543,564,547,676],
+    "bronquiti": [241,514,249,580,522,739,554,573,883,693],
+    "bronz": [14,786],
+    "broom": [157,852,171,1010],
+    "brost": [51,543],
+    "brot": [709,558,710,543],
+    "brown": [33,754,271,559,469,489],
+    "bruj": [3,522,150,754,488,666],
+    "brun": [385,578],
+    "brunon": [395,686],
+    "brusc": [157,632,774,543],
+    "bth": [676,886],
+    "bucal": [163,525,192,608,375,728,380,525,392,514],
+    "buce": [537,595],
+    "buckey": [111,625,460,558],
+    "buckthorn": [167,810,410,822],
+    "buddh": [327,664],
+    "buen": [5,403,18,480,23,503,81,521,146,465,214,415,223,403,225,378,288,470,377,450,439,486],
+    "buerger": [624,874],
+    "buey": [499,657],
+    "bufalag": [176,657],
+    "bufanag": [214,606],
+    "bufer": [205,631],
+    "bugban": [234,631],
+    "buj": [162,671],
+    "bulb": [14,451,62,534,377,545,734,463],
+    "bulbos": [217,657],
+    "buld": [106,694],
+    "bulgarian": [236,679],
+    "bulimi": [904,735],
+    "bull": [520,599,537,548],
+    "bullac": [385,822],
+    "bult": [725,418,730,359,739,333,754,462,765,483,766,319,809,362,818,377,841,349,845,352,847,349,856,319,857,614,862,349,866,342,867,345,892,311,950,631,951,433],
+    "bun": [287,564,292,632],
+    "burdock": [104,1000],
+    "burl": [912,431],
+    "burlan": [912,431],
+    "burnet": [36,1118,449,605],
+    "burr": [48,632,104,710],
+    "burs": [747,1024],
+    "bursiti": [747,899],
+    "bush": [24,635,233,493,503,759],
+    "bushman": [505,999],
+    "busqued": [926,569,933,518],
+    "butcher": [157,925],
+    "butterfly": [256,1068],
+    "buttermilk": [519,631],
+    "button": [29,854,50,791,104,640,489,576],
+    "buxu": [162,912],
+    "bypas": [597,709],
+    "caa": [41,563],
+    "caball": [64,894,211,508,281,632,315,934],
+    "cabbag": [219,612],
+    "cabell": [191,531,315,495,513,474,681,455,698,690,709,433,812,433,845,417,910,697],
+    "cabellud": [680,508,698,489,852,661,868,459],
+    "cabez": [4,266,245,318,258,315,316,350,380,324,532,302,542,324,580,339,601,311,620,296,638,523,645,354,647,285,648,321,649,350,656,371,661,350,697,331,718,331,720,308,726,339,728,324,731,299,739,273,746,296,791,288,794,321,813,288,831,291,871,308,875,324,907,273,939,308,941,308,944,308,945,346,946,285,947,311,953,346],
+    "cabr": [51,543],
+    "cabsitiell": [37,573],
+    "cac": [199,706],
+    "caca": [136,548,199,971,368,567,371,734,462,1035],
+    "cacahu": [199,706],
+    "cacahuat": [199,433,453,653],
+    "cacahuet": [453,946],
+    "cacaocuahuitl": [199,706],
+    "cacaoter": [462,578],
+    "cacau": [199,470],
+    "cachac": [45,650],
+    "cact": [498,650],
+    "cactu": [485,754,489,845,491,804,492,640,496,773,498,488,507,695],
+    "cad": [736,464,764,485,914,427],
+    "cadasil": [677,844],
+    "cader": [691,473,703,525,759,483,763,460,764,431,817,443],
+    "caesar": [294,925],
+    "caesare": [294,925],
+    "caf": [463,1034,464,518,756,471,859,503],
+    "cafein": [197,603,368,548,463,409,464,483,610,519,833,460],
+    "cafet": [463,910],
+    "caffein": [465,612],
+    "cafresn": [126,624],
+    "cagarri": [290,563],
+    "cagau": [199,706],
+    "caid": [660,521,688,499,698,442,748,474,752,408,762,447,771,426],
+    "caimit": [344,1041],
+    "cainit": [344,919],
+    "cajig": [118,525],
+    "cajon": [162,671],
+    "caju": [439,709],
+    "calabacill": [462,578],
+    "calabaz": [292,596,430,987,457,512],
+    "calafat": [421,1032],
+    "calam": [209,997],
+    "calamansi": [329,694],
+    "calambr": [177,397,564,451,565,553,566,431,569,473,582,451,597,446,618,418,619,393,626,385,650,393,699,325,724,446,749,586,750,413,833,374],
+    "calambroj": [85,563],
+    "calament": [58,548],
+    "calamint": [58,548],
+    "calamondin": [329,1257],
+    "calamu": [209,997],
+    "calang": [38,534],
+    "calcare": [174,694],
+    "calcet": [287,612],
+    "calci": [221,455,305,586,432,565,442,586,723,510,724,533,760,426],
+    "calcificacion": [611,664],
+    "calcul": [572,519,578,628,579,441,598,574,723,474,738,432,739,386,778,628,785,519,795,485],
+    "cald": [304,752],
+    "calendul": [44,1116],
+    "calentamient": [757,584],
+    "calentur": [39,672],
+    "calic": [238,886],
+    "calid": [842,564,864,514],
+    "calidad": [949,553,954,605],
+    "calient": [821,522,853,522,855,485],
+    "californi": [418,913,423,661],
+    "calip": [63,637],
+    "calips": [63,637],
+    "calipt": [63,637],
+    "callun": [160,892],
+    "calm": [39,382,249,631,519,548],
+    "calmant": [23,493,55,432,60,400,70,604,183,524,235,456,273,466,349,456,415,499,458,419,471,385,518,428],
+    "calmar": [24,337,148,436,207,441,229,423,235,465,240,432,253,423,273,475,311,486,458,428,516,428],
+    "calor": [619,446,710,421,714,479,758,433,771,406,841,413,848,599,856,378,886,501],
+    "calori": [41,435,219,473,232,503,374,542,634,498,636,513],
+    "caloric": [354,694],
+    "calorific": [19,726],
+    "calvici": [698,589],
+    "cam": [619,543,844,517,869,434],
+    "camalot": [310,734],
+    "camar": [612,637],
+    "cambi": [234,322,537,303,576,413,587,370,588,319,638,358,641,335,649,362,652,350,670,335,672,350,717,312,725,354,726,350,752,277,781,366,812,309,813,422,816,298,823,312,836,343,837,287,842,312,844,303,859,309,870,312,892,263,897,425,900,303,904,253,917,312,924,257,949,306,953,358,956,325],
+    "cambiant": [612,587,926,569],
+    "cambien": [625,589],
+    "cambron": [410,650],
+    "cambroner": [393,553,404,543],
+    "camel": [456,443],
+    "camelit": [290,563],
+    "caminand": [755,538],
+    "caminar": [602,461,618,446,642,493,652,461,654,477,657,446,671,471,696,411,699,347,743,446,931,333,957,471],
+    "camohtli": [212,624],
+    "camoj": [212,624],
+    "camomil": [60,971],
+    "camot": [212,1078],
+    "camp": [188,653,216,577,369,493],
+    "campan": [168,686],
+    "campylobacter": [699,475,705,564],
+    "camu": [367,1198],
+    "can": [39,900,429,571,681,554],
+    "canad": [220,573],
+    "canadensi": [206,816,318,906],
+    "canadian": [318,752],
+    "canadiens": [206,644],
+    "canal": [875,828,955,569],
+    "canam": [429,1024],
+    "canamer": [207,644],
+    "canamiz": [55,644],
+    "canari": [215,573],
+    "cancer": [121,388,270,334,283,349,533,529,536,331,554,357,557,341,580,341,584,370,588,583,589,578,590,510,591,515,592,565,619,311,632,521,683,305,697,334,710,293,725,524,739,275,754,451,789,486,790,482,802,331,807,478,808,550,812,302,817,516,818,496,827,283,844,483,845,478,846,299,872,486,874,324,890,290,893,299],
+    "cancerigen": [533,606],
+    "canceros": [588,518,806,710,816,687,866,471],
+    "candelari": [48,686],
+    "candid": [811,600],
+    "candidiasi": [811,844],
+    "candiler": [173,671],
+    "candyleaf": [41,806],
+    "canel": [19,894,129,958,476,551,482,529],
+    "caneler": [19,726],
+    "canelill": [129,595],
+    "cangrej": [286,573],
+    "caniller": [75,548,161,464],
+    "canin": [85,742,172,1039],
+    "canker": [269,839],
+    "cankerwort": [203,481],
+    "cannabi": [429,899],
+    "cansad": [93,563,157,569,257,569,944,720],
+    "cansanci": [50,539,694,488,697,504,800,504,802,499,915,455,947,474],
+    "cantaloup": [457,833],
+    "cantar": [528,664],
+    "cantarel": [288,686],
+    "canteri": [559,717],
+    "cantharellu": [288,925],
+    "cantidad": [74,525,358,478,538,488,687,488,717,473,890,451],
+    "canton": [339,664],
+    "cantor": [37,573],
+    "cantues": [23,734],
+    "canuel": [39,440],
+    "canutill": [64,624],
+    "cao": [267,644],
+    "caob": [138,1254],
+    "cap": [280,642,317,519,536,464,557,479,613,490,617,454,707,424,853,420,854,586,863,397],
+    "capacidad": [61,292,78,359,153,309,213,327,264,363,265,363,266,344,268,317,270,355,272,295,276,330,280,359,310,388,318,398,349,359,383,367,428,384,449,347,505,407,517,355,650,330,653,344,665,359,668,443,671,371,683,324,780,355,783,384,908,324,929,222,944,330],
+    "capaz": [188,752],
+    "capilar": [305,780],
+    "capitat": [175,880],
+    "capsaicin": [473,686],
+    "capsicum": [470,619,473,852],
+    "capuchin": [45,892],
+    "capulin": [161,464,386,706],
+    "caqui": [398,981],
+    "car": [620,396,647,382,692,404,716,416,783,479,792,468,831,389,841,382,848,392,852,365,854,392,868,365,871,412],
+    "caracteristic": [79,479,164,485,354,495,402,417,406,512,548,633,655,485,727,442,927,343],
+    "caracteriz": [758,469,773,513,784,555,791,451,857,503,862,447],
+    "caracterizad": [659,491,668,435,711,443,715,394,751,471,831,431,888,466,911,427],
+    "carallum": [506,1157],
+    "carambol": [350,1073,480,612],
+    "caramel": [362,568],
+    "caravai": [450,606],
+    "caraway": [31,696,450,853,459,683],
+    "carball": [118,906],
+    "carbi": [450,606],
+    "carbohidrat": [223,455,225,427,231,675,379,530,435,588,914,380],
+    "carbon": [269,595],
+    "carcarri": [290,563],
+    "carcinom": [533,622,591,667,790,708,807,605,817,597,818,729,845,605,846,775],
+    "card": [284,1101],
+    "cardamom": [21,1166,447,1154],
+    "cardamomum": [21,878,447,816],
+    "cardamon": [447,644],
+    "cardamum": [447,644],
+    "cardiac": [70,317,122,287,247,295,415,358,425,304,426,391,534,314,535,274,536,320,551,427,555,434,556,394,603,317,604,307,605,314,606,562,607,427,608,497,609,548,610,536,611,534,612,424,613,338,614,437,615,502,621,416,622,565,623,310,629,560,633,307,634,310,676,310,690,292,714,324,721,295,728,317,735,327,739,267,787,363,814,314,883,301,900,287],
+    "cardiogenic": [628,1078],
+    "cardiomiopati": [606,508,615,762,654,589,676,534],
+    "cardiopati": [603,781,607,559,621,749],
+    "cardioprotector": [199,336,200,501,389,395,399,512,434,544,436,550,441,524,455,406,462,413],
+    "cardiotonic": [80,544,122,425,170,495,171,465,244,490,259,474,260,714,400,692,415,531],
+    "cardiovascular": [265,490,298,550,359,642,368,507,379,490,399,512,427,524,462,413,828,413],
+    "carditi": [706,589],
+    "cardon": [492,436,507,852],
+    "carecer": [924,504],
+    "carent": [926,618],
+    "cargad": [359,657],
+    "caric": [143,848,345,770,360,754],
+    "cariotip": [736,534],
+    "carminativ": [0,286,1,361,4,262,5,286,6,304,8,281,9,286,14,264,15,345,16,333,20,349,21,349,30,289,35,298,38,260,43,365,47,341,58,266,78,330,105,443,155,333,174,337,209,304,313,349,444,379,445,389,446,384,447,313,448,298,449,319,450,295,451,313,466,353,468,370,472,260,474,353,476,323,478,337,479,292,480,323,484,301],
+    "carn": [356,618,845,538],
+    "carnation": [244,925],
+    "carnos": [377,508,398,469,488,406,493,536,494,460,843,460],
+    "carob": [136,925],
+    "carolin": [258,637],
+    "carom": [480,905],
+    "carot": [214,850],
+    "carotenoid": [262,569,378,810],
+    "carpian": [744,817],
+    "carragaen": [303,726],
+    "carrasper": [527,686],
+    "carraz": [454,529],
+    "carrion": [504,925],
+    "carron": [504,686],
+    "carrot": [214,904,221,558],
+    "cartilag": [742,571,772,738,773,577],
+    "cartilaginos": [651,600],
+    "carum": [450,850],
+    "carvacrol": [175,637],
+    "carvall": [118,906],
+    "carvay": [118,525],
+    "carvi": [450,981],
+    "cary": [438,946],
+    "caryophyllu": [244,925],
+    "cas": [531,391,543,391,622,399,633,407,650,399,658,574,668,380,698,376,727,395,763,380,827,363,866,363,876,395,906,335,908,391],
+    "casab": [457,833],
+    "casav": [231,631],
+    "casc": [281,521],
+    "cascallej": [393,553,404,543],
+    "cascar": [353,662,354,507,359,481,370,703,375,667,461,629,479,439,853,439],
+    "cascarill": [130,770],
+    "caser": [11,527,162,583,171,565],
+    "cashew": [439,946],
+    "cashish": [471,573],
+    "casi": [154,476,403,476,417,755,835,431,896,394,906,384,909,381,914,360],
+    "casp": [521,596,525,543,852,887],
+    "caspi": [199,470],
+    "cassav": [76,783,231,805],
+    "cast": [151,553,178,593],
+    "castan": [111,876,221,455,232,488,316,800,435,877,437,515,460,895],
+    "castane": [435,991],
+    "castell": [15,709],
+    "castill": [0,442,6,749,60,447,236,510,392,483,448,643,492,355],
+    "castleman": [876,862],
+    "castor": [89,1116],
+    "castu": [151,777,178,816],
+    "cataplasm": [33,624],
+    "catarat": [936,905],
+    "catarr": [541,919],
+    "catatonic": [921,589],
+    "catecolamin": [728,657],
+    "caterpillar": [267,886],
+    "cath": [95,1015],
+    "cathedral": [488,767],
+    "cauliflor": [370,961],
+    "cauliflower": [285,939],
+    "caus": [521,287,524,355,531,256,535,237,539,269,540,244,543,358,545,411,546,293,547,307,548,370,551,269,552,242,564,300,566,287,596,303,625,348,639,303,644,269,650,261,654,296,658,275,666,296,668,248,671,293,672,287,676,269,680,256,681,266,685,264,688,277,691,358,698,246,702,376,703,284,709,253,710,246,727,258,729,264,734,233,738,258,739,231,744,239,752,227,759,261,763,248,788,384,799,269,811,251,840,275,847,242,851,251,852,231,859,253,861,221,866,237,867,239,876,258,889,264,891,284,907,231,916,227,932,269,943,261],
+    "causad": [522,363,551,340,558,375,559,379,560,344,570,388,571,344,582,379,707,321,716,333,717,324,718,355,719,330,730,314,753,363,776,367,786,355,810,333,825,327,829,303,842,324,843,314,848,314,850,295,853,317,855,295,863,300,869,264,873,312,877,359,950,363],
+    "causan": [526,451,546,542,657,513,708,420,748,488,907,427],
+    "causand": [563,577,565,554,640,616],
+    "causar": [529,463,544,443,547,485,634,425,661,468,828,382,843,392,844,392,850,368,860,404,861,349,906,346,937,371],
+    "cav": [657,664],
+    "cavernos": [892,757],
+    "cavi": [223,589],
+    "caviar": [336,886],
+    "cavidad": [526,507,583,609,880,609],
+    "cayatun": [479,600],
+    "cayen": [473,1170],
+    "cayenn": [470,405,473,852],
+    "cazador": [126,575,416,920],
+    "ceanot": [182,1024],
+    "ceanothu": [182,1024],
+    "cebad": [573,671],
+    "ceboll": [13,631],
+    "cebollet": [13,631],
+    "cebollin": [13,1176],
+    "cedar": [116,1136],
+    "cedr": [116,1136],
+    "cedron": [24,427,39,382,47,983],
+    "cedru": [116,946],
+    "cefale": [71,671],
+    "ceguer": [931,457,937,518],
+    "ceib": [139,1276],
+    "ceilan": [19,726],
+    "cej": [681,587,698,543],
+    "celeriac": [217,899],
+    "celery": [26,714,83,835,217,571],
+    "celiac": [573,840,574,692],
+    "celiandr": [6,624],
+    "celim": [10,443],
+    "celul": [269,309,431,405,539,334,587,377,589,349,591,349,632,356,635,334,649,491,652,356,680,318,695,484,696,318,712,441,725,360,727,321,736,403,770,297,789,386,790,563,807,303,808,303,818,324,837,419,844,309,845,303,846,507,851,312,858,309,876,447,888,457,891,352,893,312],
+    "celular": [347,569,399,595,736,644,741,451],
+    "celuliti": [853,777,892,475],
+    "cempasuchil": [262,1073],
+    "cempohualxochitl": [262,618],
+    "cenidor": [53,558],
+    "cenoj": [14,543],
+    "centaure": [50,878,263,948],
+    "centaurium": [263,905],
+    "centaury": [263,1030],
+    "centell": [102,1076,512,799],
+    "centen": [573,671],
+    "centr": [68,504,605,488,673,545,841,434,850,419,856,397,926,464],
+    "central": [76,443,579,461,655,496,659,491,669,476,684,682,732,457,741,397],
+    "centroameric": [86,694],
+    "cep": [292,632,454,488],
+    "cer": [191,899,955,1039],
+    "ceratoni": [136,925],
+    "cerc": [616,499,747,493,768,583,771,426,871,469,944,469,946,434],
+    "cercan": [293,507,662,474,819,393,863,397,892,361,923,358,924,520,944,606,946,404,947,611],
+    "cerebr": [516,333,620,451,641,351,644,344,647,511,648,347,649,505,652,366,653,347,656,585,658,351,661,379,663,470,664,383,670,480,672,494,673,513,677,320,684,370,813,312,896,287,902,337,903,300,905,317,910,320,913,290,915,324,924,269,927,257,957,374],
+    "cerebral": [68,369,205,347,235,373,356,369,359,361,371,373,434,418,468,545,512,343,620,330,639,528,647,573,648,560,649,625,661,520,665,572,673,399,677,464,763,327,895,337,897,324,898,340,900,327,901,312,916,299,919,315,948,373],
+    "cerebrovascular": [580,490,608,474,620,603,639,518,647,587,663,455,677,603,701,442,721,437],
+    "cerecer": [386,525],
+    "cerecit": [381,553],
+    "cerefoli": [25,709],
+    "cerefolium": [25,946],
+    "cereizal": [386,525],
+    "ceremoni": [489,694],
+    "cereu": [486,589],
+    "cerez": [381,996,386,976],
+    "cerezal": [386,525],
+    "cerezu": [386,525],
+    "cerfull": [25,709],
+    "ceroler": [170,694],
+    "ceroll": [126,624],
+    "ceroller": [385,578],
+    "ceros": [845,584],
+    "cerrad": [537,548,906,483],
+    "cerraj": [67,639,203,662],
+    "cerumen": [939,575,955,794],
+    "cerval": [167,880],
+    "cerves": [55,644],
+    "cervez": [55,644],
+    "cervical": [808,762,827,523],
+    "ces": [812,606],
+    "cesar": [294,686],
+    "cesare": [832,516],
+    "ceylon": [19,961],
+    "cftr": [540,584],
+    "cha": [199,706],
+    "chabacan": [387,589],
+    "chag": [269,1154],
+    "chalazion": [950,925],
+    "chambimb": [144,709],
+    "chamomil": [60,971],
+    "chamomill": [60,839],
+    "champinon": [274,569,276,575],
+    "chan": [428,961],
+    "chancr": [828,578],
+    "chantarel": [288,686],
+    "chanterell": [288,964,289,593],
+    "charcot": [657,905],
+    "chard": [213,862],
+    "charlock": [33,799,469,518],
+    "chasquid": [762,517,765,485,766,670],
+    "chast": [151,777,178,816],
+    "chasteberry": [151,777,178,593],
+    "chat": [384,548,396,587],
+    "chees": [49,657],
+    "cherimol": [361,946],
+    "cherry": [205,698,381,745,386,913,408,489,409,861],
+    "chervil": [25,1136],
+    "chestnut": [111,762,316,589,435,823,460,705],
+    "chi": [428,1226],
+    "chiap": [476,664],
+    "chical": [225,553],
+    "chicalot": [183,1007],
+    "chichir": [204,874],
+    "chick": [487,844],
+    "chicken": [286,952],
+    "chicol": [225,796],
+    "chicul": [225,553],
+    "chil": [4,430,106,554,132,466,420,639,470,352],
+    "chilay": [491,717],
+    "chilean": [132,719,133,623,180,759],
+    "chilen": [132,507,180,548,362,493],
+    "chilensi": [414,1007],
+    "chili": [470,440],
+    "chilli": [470,440],
+    "chiltepin": [470,440],
+    "chin": [6,324,59,275,90,381,92,386,98,386,127,395,168,356,200,364,226,356,229,321,232,338,245,460,253,447,264,356,265,480,266,338,267,460,270,349,272,290,273,484,293,377,325,373,326,352,352,352,353,345,405,390,411,400,448,444,458,324,472,475,509,334,514,345,520,338],
+    "chinensi": [191,848,352,798,509,770],
+    "chines": [6,594,59,528,77,620,228,629,229,590,232,611,253,590,358,590,398,415,448,419,472,531],
+    "chinit": [44,679],
+    "chiribit": [246,686],
+    "chirimoy": [361,981,376,676],
+    "chirivi": [26,533,216,948],
+    "chirrid": [772,606],
+    "chiv": [13,1082],
+    "chlamydi": [705,564,824,913],
+    "chlorell": [296,1216],
+    "chocolat": [4,719,199,650],
+    "cholon": [17,548,475,587],
+    "chonacat": [13,631],
+    "chondru": [303,961],
+    "chong": [267,644],
+    "chonzan": [210,637],
+    "choong": [506,743],
+    "chop": [140,1168],
+    "chopi": [479,600],
+    "choqu": [628,799,767,492],
+    "chordon": [390,612],
+    "chordoner": [390,612],
+    "choriu": [9,589],
+    "chorr": [803,646,816,538],
+    "christm": [470,440],
+    "chrysanthemum": [245,1145],
+    "chrysophyllum": [344,919],
+    "chuchup": [208,644],
+    "chuchupat": [208,644],
+    "chuchupati": [208,644],
+    "chudenchu": [199,706],
+    "chugu": [222,664],
+    "chulivert": [7,521],
+    "chumb": [492,947],
+    "chumber": [485,492,492,785],
+    "chumbimb": [144,709],
+    "chumbu": [492,473],
+    "chunch": [17,548,475,587],
+    "chupall": [162,671],
+    "church": [37,817],
+    "cianosi": [535,426,537,447,552,434,556,430,621,464,622,469,883,469],
+    "ciatic": [764,1164],
+    "cibariu": [288,925],
+    "ciboulett": [13,631],
+    "cicatric": [102,537,698,512,832,449],
+    "cicatriz": [531,508,770,476,845,687,846,498],
+    "cicatrizacion": [44,496,285,513,512,457,531,626,560,476,571,476,769,412,803,513],
+    "cicatrizan": [618,612,851,553],
+    "cicatrizant": [23,385,44,355,61,290,102,324,131,481,150,327,159,474,167,334,173,352,185,399,188,394,192,399,202,341,222,474,246,359,252,315,255,372,285,367,310,385,345,337,346,355,364,372,366,385,408,321,410,341,487,315,490,303,491,376,493,488,494,312,499,344,500,337],
+    "cicatrizar": [173,618,188,692],
+    "cicl": [52,349,151,429,253,442,390,437,680,437,812,433,813,417,837,402,917,437],
+    "ciclotimi": [916,786],
+    "ciclotimic": [916,786],
+    "cidr": [327,1222],
+    "cidronel": [24,492],
+    "ciel": [50,717],
+    "cient": [52,488],
+    "cientoenram": [52,488],
+    "cierr": [797,631],
+    "ciert": [76,315,85,292,94,405,535,295,568,377,572,386,580,356,593,405,595,386,609,327,634,334,638,364,680,318,687,327,692,318,695,360,697,349,700,312,708,282,725,360,731,315,743,345,754,273,773,345,795,360,798,349,800,349,836,349,846,312,851,312,872,312,894,352,912,224],
+    "cilandr": [6,868],
+    "cilantr": [6,936,34,705,448,1060],
+    "cilindric": [503,631],
+    "cimarron": [10,368,17,696,60,494,475,529],
+    "cimicifug": [234,1002],
+    "cinc": [906,525],
+    "cinchon": [130,999],
+    "cinder": [269,595],
+    "cinnamomum": [19,961],
+    "cinnamon": [19,1147],
+    "cipr": [114,1153],
+    "ciraser": [386,525],
+    "circadian": [914,492],
+    "circae": [97,1136],
+    "circulacion": [62,425,68,443,80,502,111,448,123,508,211,404,257,453,279,408,352,448,460,400,470,290,473,453,512,573],
+    "circular": [861,488,867,528],
+    "circulatori": [18,513,114,481,150,457,211,448,469,412,470,322,473,502,479,439],
+    "circundant": [864,514,892,475],
+    "cireser": [386,525],
+    "cirguel": [385,578],
+    "cirgueler": [385,578],
+    "ciroler": [385,578],
+    "cirrosi": [571,741,591,557,880,582,890,484],
+    "ciruel": [352,625,385,959],
+    "cirueler": [385,578],
+    "cirugi": [534,437,595,499,597,636,614,446,619,419,724,477,815,396,830,407,832,347,879,488,883,419,937,378],
+    "cissu": [86,1053],
+    "cisticercosi": [661,709],
+    "cistiti": [64,543,776,810,788,798],
+    "cistocel": [809,844],
+    "cistu": [159,1030],
+    "citomegaloviru": [699,516],
+    "citrang": [341,1258],
+    "citratu": [39,672],
+    "citric": [34,312,320,399,321,390,322,418,323,399,324,361,325,394,326,373,327,365,328,408,329,381,330,418,331,404,332,434,333,434,334,440,335,399,336,487,337,424,338,424,339,365,340,440,341,440,342,440,343,440,348,377,375,369],
+    "citrifoli": [194,999],
+    "citrodor": [47,939],
+    "citron": [327,834,456,622],
+    "citronel": [39,672],
+    "citronell": [24,453,39,751],
+    "citru": [145,544,148,479,240,475,320,523,321,515,322,539,323,523,324,489,325,519,326,500,327,493,328,531,329,507,330,539,331,527,332,553,333,553,334,557,335,523,336,482,337,544,338,544,339,493,340,557,341,557,342,557,343,557,375,496],
+    "citrullu": [456,676],
+    "citrumel": [342,1258],
+    "civatt": [870,856],
+    "ciwuji": [233,568],
+    "cladodi": [485,464,492,411,507,596],
+    "clamidi": [805,476,821,522,824,749],
+    "clar": [845,661,864,446,868,442,869,591,956,509],
+    "clarament": [946,578],
+    "claridad": [209,543,946,502,947,548],
+    "clasic": [16,569,56,439,152,589,239,518],
+    "claudicacion": [618,664],
+    "clav": [20,889,258,529,466,952,476,551],
+    "clavel": [244,1032,262,569],
+    "clavelin": [44,625,244,632],
+    "claver": [20,661,466,668],
+    "clementin": [323,961],
+    "clim": [520,540,838,545,847,480,864,463],
+    "climateri": [812,850],
+    "climbing": [519,631],
+    "clingston": [384,595],
+    "clinic": [896,781],
+    "clinicament": [909,416,910,480,911,466,913,434,916,434],
+    "clinker": [269,839],
+    "clitori": [256,1035,799,593],
+    "cloasm": [859,850],
+    "clonic": [667,671],
+    "clor": [935,612],
+    "clorel": [296,770],
+    "clorofil": [296,770],
+    "cloud": [272,558],
+    "clov": [20,791,244,768,466,797,882,762],
+    "clover": [32,683,257,596,452,700],
+    "cmt": [657,905],
+    "coagul": [534,465,535,406,603,469,604,455,619,446,620,429,631,485,663,455,701,442],
+    "coagulacion": [534,540,619,518,624,725,631,563],
+    "coagulad": [843,595],
+    "cobertur": [474,726],
+    "cobr": [353,612,439,653],
+    "coc": [225,692,273,810,356,1009],
+    "cocain": [604,587,832,475],
+    "coccine": [251,968],
+    "cochin": [208,644],
+    "cocid": [379,530,383,536,388,513,402,451,406,555,416,596],
+    "cocin": [34,381,83,488,189,511,275,396,279,415,287,411,298,518,304,505,305,524,306,511,355,451,373,493],
+    "coco": [199,408,462,831,464,754],
+    "coconut": [356,912],
+    "cod": [680,489,692,489,706,471,756,825,863,454],
+    "codific": [858,595],
+    "codonopsi": [227,1206],
+    "coexistenci": [918,568],
+    "coffe": [463,1174],
+    "cognicion": [516,624],
+    "cognitiv": [235,456,256,411,268,403,508,356,511,432,512,419,652,461,667,451,670,442,672,461,751,432,924,338],
+    "cogumel": [274,618],
+    "cohombr": [457,589],
+    "cohosh": [234,1082],
+    "coit": [834,1037],
+    "col": [64,788,211,626,219,626,270,813,315,824,465,928,792,519,906,384],
+    "colagen": [285,582,344,563,690,503,769,467],
+    "colagog": [37,443,54,348,162,519,169,508,210,493,218,483],
+    "colangiti": [598,1041],
+    "colaps": [553,798,629,583,888,554],
+    "colapsad": [537,971],
+    "colater": [465,612],
+    "colecistiti": [579,874],
+    "colelitiasi": [578,899],
+    "coleretic": [106,576,203,399,218,518,263,551],
+    "colesterol": [238,393,265,419,276,530,279,378,284,549,348,419,365,444,382,382,426,495,438,433,485,326,492,289,578,402,602,566,618,406,633,616,721,374,865,606],
+    "colgant": [502,709],
+    "coli": [582,595,776,576,800,557,870,710],
+    "colic": [8,434,16,515,445,601,450,455,480,499,574,565,694,488],
+    "coliflor": [285,1131],
+    "colinab": [219,612],
+    "colirraban": [219,987],
+    "coliti": [564,878,708,500],
+    "colmenill": [290,1089],
+    "colocasi": [225,796],
+    "colocynth": [456,443],
+    "colombi": [86,694],
+    "colon": [565,680,575,626,576,626,577,581,587,833,588,875],
+    "color": [213,340,216,365,222,365,306,418,363,404,378,350,625,324,626,337,681,350,692,337,709,333,770,315,792,390,832,284,844,327,845,321,849,312,850,307,859,333,860,470,862,318,864,307,866,312,868,304,869,275,894,373,936,365],
+    "coloracion": [535,439,537,460,552,447,556,443,592,548,883,483],
+    "colorad": [82,494,180,698,362,454,393,480,404,471],
+    "colorrectal": [588,799,807,538],
+    "column": [651,480,703,542,755,624,759,693,763,947],
+    "columnar": [491,661,496,612],
+    "com": [726,686],
+    "comatu": [280,1116],
+    "combat": [284,545,447,534,508,439,934,484],
+    "combaten": [352,625,412,746],
+    "combatir": [74,427,108,348,129,374,197,490,205,397,233,357,271,405,274,389,282,427,367,422,387,370,399,451,408,385,478,436,518,401,683,385],
+    "combin": [476,664],
+    "combinacion": [637,504,684,521,686,469,704,493,797,474,902,474,919,613],
+    "comentari": [922,543],
+    "comenzar": [581,534,708,451,816,484,817,476],
+    "comer": [573,519,581,685,597,548,807,451,890,451,914,380],
+    "comercial": [262,569,869,460],
+    "comestibl": [40,582,73,337,169,407,170,430,190,483,287,379,289,399,292,425,294,425,298,477,304,466,316,440,317,605,400,455,407,477,413,460,418,472],
+    "comet": [484,618],
+    "comi": [15,709],
+    "comid": [580,530,581,498,726,530,841,447,890,451,904,568],
+    "comienz": [533,424,588,436,589,469,591,469,592,496,777,454,816,408,845,408,846,420,861,539],
+    "comienzan": [813,584],
+    "comin": [15,878,16,530,31,619,446,868,450,657,459,608],
+    "commelin": [188,984],
+    "commercial": [471,573],
+    "common": [2,399,5,372,10,302,17,266,18,313,24,327,29,360,37,365,44,303,48,413,49,402,52,325,53,358,54,305,55,396,56,345,57,388,64,388,82,276,109,321,112,393,118,343,119,423,120,407,122,375,149,423,150,279,155,413,156,396,158,423,159,297,162,407,163,402,164,303,165,410,171,291,207,288,229,276,237,282,246,306,253,385,263,297,278,313,290,251,360,279,382,388,383,310,384,266,385,258,388,297,389,356,454,345,495,266],
+    "commun": [278,1131],
+    "communi": [89,710,149,732,155,715,158,732,180,675,383,721],
+    "comosu": [346,919],
+    "companer": [733,514,918,523],
+    "comparacion": [733,558],
+    "comparar": [912,431],
+    "compart": [395,632,400,676],
+    "competitiv": [771,568],
+    "complej": [225,427,369,439,379,530,435,588,482,493,882,710],
+    "complet": [187,382,320,356,321,347,322,373,323,356,324,322,325,351,326,332,327,325,328,364,329,340,330,373,331,360,332,387,333,387,334,392,335,356,336,315,337,377,338,377,339,325,340,392,341,392,342,392,343,392,382,306,383,340,384,291,385,283,386,257,387,289,389,271,395,336,396,312,398,297,405,368,429,322,553,332,762,291,921,289],
+    "completament": [574,692,816,538],
+    "complicacion": [553,496,706,609,776,507,800,491,831,431,875,481,883,457,902,461],
+    "component": [799,593,918,747],
+    "comport": [902,631],
+    "comportamient": [649,460,664,465,668,386,726,445,897,382,898,401,912,280,920,379,921,382,924,483,925,382,926,401,929,272,932,418],
+    "comportars": [927,481],
+    "comprender": [668,595],
+    "compresion": [643,554,744,652,749,554,767,620,819,450],
+    "comprimir": [662,679],
+    "comprometid": [683,612],
+    "compuest": [117,565,288,515,292,515,352,510,361,533,380,493,892,388],
+    "compulsion": [898,862],
+    "compulsiv": [898,715,911,484,913,652,930,678],
+    "computador": [947,631],
+    "comun": [1,304,3,245,7,213,13,258,14,321,15,290,37,234,49,268,54,184,56,216,57,255,58,224,60,243,63,260,85,230,112,260,113,238,114,268,118,313,119,290,120,274,149,290,163,268,199,192,203,196,237,258,241,263,244,280,318,307,378,260,407,315,455,232,490,236,492,193,526,238,541,425,543,350,545,448,546,287,548,263,551,263,594,311,596,296,622,255,687,258,689,277,691,250,692,250,699,211,702,268,715,220,770,234,772,248,824,253,826,220,829,234,849,331,850,228,852,226,853,245,855,228,859,248,860,250,864,228,868,226,876,253,889,258,953,287],
+    "comunicacion": [665,563,688,551,881,589,908,508],
+    "comunment": [475,554,539,559,822,565],
+    "con": [55,644],
+    "concebir": [823,856],
+    "concentracion": [68,469,90,513,197,545,233,397,412,566,463,370,464,436,495,416,511,450,903,393],
+    "concentrars": [813,466,895,489,914,393,915,484,939,499],
+    "conchit": [256,1068],
+    "concienci": [628,575,639,668],
+    "conciliar": [646,822],
+    "concret": [64,624],
+    "concretament": [72,694],
+    "concurrent": [919,573],
+    "condicion": [556,360,627,370,718,573,721,385,725,436,730,374,744,360,760,357,762,374,847,364,848,527,849,357,856,333,882,427,883,393,940,405],
+    "condiment": [211,612],
+    "conduc": [653,565,724,616,877,590],
+    "conducir": [946,578],
+    "conduct": [522,530,598,635,879,561,904,568,927,372,955,666],
+    "conductual": [918,568],
+    "conectan": [757,538,857,599],
+    "conectiv": [617,503,623,685,690,469,754,593,756,439,769,623],
+    "coneflower": [202,1187],
+    "conehead": [175,880],
+    "conexion": [927,481],
+    "confianz": [929,419],
+    "confiar": [922,543],
+    "confier": [118,525],
+    "confieren": [359,605,495,548],
+    "confusion": [552,396,556,392,608,455,609,432,620,411,628,428,639,497,647,396,656,515,726,470,934,400],
+    "congenit": [596,471,611,431,621,559,673,471,737,579,796,460,797,409,798,436,799,418,820,386,882,596,883,405,892,335,940,418],
+    "congestion": [33,399,116,453,443,469,447,411,469,359,525,554,526,373,541,433,543,391,545,480,547,469,682,399,940,411,941,399,953,448],
+    "congestionan": [913,543],
+    "congestiv": [536,612,551,593],
+    "conifer": [155,686],
+    "coniz": [461,481],
+    "conjunt": [721,564,813,538],
+    "conjuntiv": [935,987],
+    "conjuntiviti": [544,583,705,532,935,744],
+    "conk": [264,548,269,670,271,514,281,416,282,542],
+    "conker": [111,846,460,783],
+    "conoc": [224,522,852,480,873,512],
+    "conocen": [60,595],
+    "conocid": [24,178,30,215,37,207,43,272,51,197,61,288,63,231,64,226,66,243,69,269,83,263,89,246,90,266,104,192,113,211,122,215,168,248,177,228,180,228,182,290,184,272,187,282,193,275,213,224,220,207,227,248,231,228,233,206,234,228,243,235,264,248,266,235,271,233,272,202,279,224,280,246,285,254,286,207,299,275,301,279,310,266,311,257,317,269,318,272,320,263,321,257,322,275,323,263,324,238,325,260,326,246,327,240,328,269,329,251,330,275,331,266,332,286,333,286,334,290,335,263,336,233,337,279,338,279,339,240,340,290,341,290,342,290,343,290,345,233,349,246,354,251,362,206,366,266,369,206,371,246,376,266,383,251,403,235,417,293,428,263,449,238,459,197,465,222,466,263,475,231,486,213,489,251,490,209,498,235,501,231,505,279,517,243],
+    "conocimient": [617,540,629,757,726,569,933,467],
+    "consecuenci": [903,563],
+    "conseguir": [814,650],
+    "consej": [929,419],
+    "conservant": [186,800],
+    "consider": [188,692,518,587],
+    "considerabl": [931,496],
+    "considerad": [45,429,83,479,175,420,254,448,292,453,309,490,412,535,415,490,510,425,519,416,760,375,868,365,927,317],
+    "consol": [5,589],
+    "consolv": [487,600],
+    "constant": [907,661,908,710,924,418,939,518],
+    "constantement": [912,374,925,512,927,418],
+    "construccion": [559,661,560,599],
+    "consum": [84,330,89,355,217,344,232,341,316,372,365,380,379,359,387,309,453,372,561,511,562,355,570,385,571,341,588,327,590,344,591,352,601,330,604,334,607,337,610,352,615,355,624,330,634,337,758,318,760,297,787,394,832,270,836,352,902,330,919,300,936,348,954,344],
+    "consumid": [388,664],
+    "consumir": [833,595],
+    "contact": [541,433,542,420,543,391,544,429,545,480,550,411,826,499,827,518,828,525,839,710,842,391,843,380,850,356,863,363,928,383],
+    "contagios": [542,508,543,473,549,671,849,627,850,619,861,409],
+    "contaminacion": [521,596,870,532,898,537],
+    "contaminad": [310,551,541,510,542,493,544,504,612,478,850,419,855,419],
+    "contenid": [175,325,196,419,214,309,276,319,320,370,321,362,322,388,323,370,324,335,325,366,326,346,327,339,328,379,329,354,330,388,331,375,332,403,333,403,334,408,335,370,336,328,337,393,338,393,339,339,340,408,341,408,342,408,343,408,348,350,367,343,371,346,378,325,385,295,552,295,597,362],
+    "context": [91,618,711,558],
+    "contien": [117,515,171,445,259,455,292,470,361,486,368,486,419,521,455,389,464,428,473,470,819,385],
+    "contienen": [440,709],
+    "continu": [669,650],
+    "contraccion": [565,509,749,745,774,471,832,412,834,458],
+    "contractur": [774,833],
+    "contribuir": [94,678,633,554,634,559],
+    "contribuy": [74,679],
+    "control": [344,427,348,431,350,385,365,456,373,462,374,441,376,462,377,413,433,473,477,484,660,436,662,427,779,644,900,374,930,360,948,427],
+    "controlad": [606,508,617,540,634,534,811,498],
+    "controlador": [901,568],
+    "controlan": [750,657],
+    "controlar": [238,514,452,450,586,728,794,520,912,344],
+    "contusion": [242,646,246,632],
+    "convalari": [259,664],
+    "convallari": [259,905],
+    "convencid": [912,431],
+    "conversion": [741,500,931,677],
+    "convertirs": [855,558],
+    "conviert": [185,701,635,593],
+    "convincent": [933,563],
+    "convulsion": [639,658,649,486,656,515,661,648,667,460,668,407,669,445,673,497,724,486,726,470,931,340],
+    "convulsiv": [639,961],
+    "coo": [218,624],
+    "cool": [46,709],
+    "coordinacion": [644,593,684,639],
+    "copaib": [100,1188],
+    "copaifer": [100,1071],
+    "copi": [736,534],
+    "copoazu": [368,981,462,533],
+    "coprinu": [280,1116],
+    "copuazu": [462,578],
+    "coquit": [437,686],
+    "corazon": [122,314,170,367,171,344,244,363,259,351,350,324,352,359,389,292,415,393,429,347,433,398,434,402,441,388,535,300,604,465,605,344,606,324,607,536,609,333,611,351,612,465,613,371,614,351,621,456,622,459,623,340,628,527,629,355,637,355,706,312,833,314],
+    "corazoncill": [65,657],
+    "corch": [124,790],
+    "cordat": [66,792,108,692,239,754],
+    "cordifoli": [515,794,517,840],
+    "cordon": [819,518,820,548],
+    "cordoner": [390,612],
+    "cordycep": [267,1145],
+    "core": [652,964,706,543],
+    "corean": [264,632,328,684],
+    "coriander": [6,693,31,640,34,648,448,684,459,434],
+    "coriandr": [6,575,448,564],
+    "coriandrum": [6,799,448,788],
+    "coriari": [477,999],
+    "cork": [124,1015],
+    "corm": [225,553],
+    "corn": [82,862],
+    "cornaboi": [126,624],
+    "corne": [945,816,946,502,947,548],
+    "cornej": [165,959,409,1056],
+    "cornel": [409,726],
+    "corneli": [409,726],
+    "cornelian": [409,1077],
+    "cornflower": [50,954],
+    "cornu": [165,846,409,885],
+    "cornucopioid": [289,886],
+    "coronari": [603,921,604,509,605,520,608,531,629,536],
+    "corporal": [542,459,556,400,636,720,706,412,715,376,719,436,736,373,836,469,904,346,912,462],
+    "correct": [665,679],
+    "correctament": [578,571,611,577,948,590],
+    "correr": [748,631],
+    "corrient": [0,833],
+    "cort": [39,301,52,334,631,465,665,465,718,460,799,441,849,389,854,407,921,403,946,563,947,432],
+    "cortar": [188,692,255,653],
+    "cortez": [19,361,71,578,74,338,87,467,94,388,107,486,110,317,112,317,113,290,118,382,119,353,121,388,123,497,124,505,125,388,127,493,129,296,130,497,138,505,139,349,140,379,141,497,150,311,162,334,164,338,165,457,169,327,176,327,177,435,179,501,181,379,182,398,195,388,344,338,347,341,355,334,372,345,419,493],
+    "corticosteroid": [716,631],
+    "cortisol": [716,631],
+    "cortison": [154,565,403,565,417,704],
+    "corvall": [287,612],
+    "corylu": [123,920,399,878],
+    "corynebacterium": [550,644],
+    "cos": [646,502,902,548,929,563],
+    "cosmetic": [150,543,839,517,870,532],
+    "cosquille": [528,612,954,605],
+    "costad": [768,413,777,503,778,508,785,574,790,568,791,451],
+    "costr": [826,404,838,493,846,451,849,426,852,700,855,419,862,434],
+    "cotidian": [915,558,929,386],
+    "country": [515,618],
+    "covid": [523,618,613,646],
+    "cow": [29,742,499,828],
+    "cowberry": [153,762,425,805],
+    "cowslip": [249,961],
+    "crab": [286,573],
+    "crabappl": [382,624],
+    "cramp": [177,874],
+    "cranberry": [153,762,425,805],
+    "cranberrybush": [177,631],
+    "crassip": [310,968],
+    "crassul": [501,1087],
+    "crataegu": [122,696,170,774,400,804,415,810],
+    "craterellu": [289,886],
+    "crav": [339,664],
+    "cre": [861,529],
+    "crec": [82,389,174,436,178,405,269,374,308,446,312,456,313,451,315,436,370,456,487,378,508,333,520,409,725,436,804,370,832,325,950,431],
+    "crecer": [681,587,846,553],
+    "crecimient": [160,324,162,334,268,299,539,320,540,290,589,334,621,308,649,471,659,334,674,327,676,320,717,426,718,515,719,583,725,345,732,311,736,266,737,324,763,296,771,514,789,370,790,365,791,290,795,345,804,293,806,305,807,290,810,314,811,299,818,311,842,305,843,296,860,305,864,278,876,429,882,338,884,324,941,311],
+    "creenci": [902,523,920,687,922,451,924,617],
+    "creer": [912,431],
+    "cremos": [357,676,361,653],
+    "crep": [381,553],
+    "crepitacion": [745,637],
+    "cres": [45,892],
+    "crespill": [290,563],
+    "crianz": [926,537,929,364,930,498],
+    "crioll": [199,433,221,558],
+    "criptorquidi": [734,514,818,575],
+    "crisantem": [53,514,245,1005],
+    "crisi": [931,496],
+    "crisp": [285,816,402,835,406,828],
+    "crispu": [303,961],
+    "crispum": [7,762],
+    "cristal": [758,606],
+    "cristalin": [559,573,623,514,936,884,944,499,945,750],
+    "criteri": [916,543],
+    "critic": [923,445,927,418,928,522],
+    "croc": [22,770],
+    "crocu": [22,1173],
+    "crohn": [566,804,574,653,884,565],
+    "cromosom": [631,525,664,555,676,498,735,805,736,600,833,460],
+    "cromosomic": [735,625,885,575],
+    "cronic": [17,259,157,299,460,264,521,299,524,463,530,299,538,275,559,313,560,283,567,296,571,389,583,306,585,306,586,292,590,392,591,292,592,309,596,316,608,289,617,283,630,289,635,280,644,280,646,417,670,286,674,286,679,461,686,378,693,299,694,283,710,363,715,235,731,264,733,243,751,386,761,254,767,233,778,286,780,292,781,415,788,400,789,324,809,262,823,267,845,254,857,283,867,250,868,241,870,267,877,296,884,283,895,465,905,259,915,370,918,247,929,183,941,378],
+    "cronicament": [918,568],
+    "crosn": [232,1149],
+    "croton": [131,919],
+    "crown": [508,771],
+    "crud": [42,609,228,563,383,576,401,656],
+    "crujid": [745,509,762,475,766,423,768,427,773,531],
+    "crujient": [214,469,219,473,232,690,308,548,372,536,405,581],
+    "crup": [546,865,548,816],
+    "cruz": [10,676],
+    "cual": [78,542,80,608,630,531,631,542,919,458],
+    "cualquier": [710,512,775,543,850,485],
+    "cuaresm": [290,563],
+    "cuatr": [723,679],
+    "cubeb": [484,1242],
+    "cubi": [224,600],
+    "cubiert": [159,531,353,531,359,525,642,587,680,489],
+    "cubr": [160,540,557,569,600,617,832,428],
+    "cuc": [494,595],
+    "cucumber": [457,589],
+    "cucumi": [457,833],
+    "cucurbit": [430,946],
+    "cuell": [527,389,550,365,648,369,651,341,686,354,688,377,691,348,703,385,724,403,725,529,735,385,739,314,740,417,752,308,755,306,805,311,808,546,823,348,830,344,832,293,870,348,873,334,885,493,939,354],
+    "cuent": [630,612,929,386],
+    "cuer": [680,508,698,489,852,661,868,459],
+    "cuerd": [745,637],
+    "cuern": [95,727,289,593],
+    "cuerp": [55,263,56,216,200,287,245,263,264,280,265,280,266,266,267,263,268,245,270,274,271,263,272,228,273,283,274,253,275,241,276,255,278,287,279,253,280,277,281,213,282,277,283,287,284,268,285,287,286,234,287,250,288,280,289,263,290,230,291,260,292,280,293,296,294,280,296,315,347,280,381,226,539,362,540,238,556,334,606,250,617,266,625,241,627,241,628,354,635,263,637,274,642,300,653,416,659,274,661,290,678,263,687,258,690,248,691,250,699,211,702,268,705,250,710,241,718,274,729,258,741,222,754,214,782,274,793,304,803,287,850,228,893,245,912,176],
+    "cuerv": [215,573],
+    "cuestion": [907,553],
+    "cuidab": [923,512],
+    "cuidad": [40,609,191,646,929,364],
+    "cuidar": [929,419],
+    "cuirn": [126,624],
+    "culantr": [6,1043,448,1073],
+    "culinari": [265,632,290,518],
+    "culinary": [10,676],
+    "culp": [896,496,925,543],
+    "cultivad": [57,575,454,488],
+    "cultivated": [382,575,391,605],
+    "cultur": [102,494,139,560,225,442,379,548,421,647],
+    "cultural": [904,496],
+    "cumaru": [482,1008],
+    "cumarun": [482,637],
+    "cumbaru": [482,637],
+    "cumin": [15,785,31,665,450,503,459,652],
+    "cuminum": [15,872,446,935],
+    "cummin": [15,946],
+    "cumplen": [916,543],
+    "cundumb": [75,595],
+    "cupan": [197,928,464,799],
+    "cupressu": [114,899],
+    "curacion": [72,694],
+    "curar": [131,563,246,569,255,589,487,498],
+    "curaza": [61,553],
+    "curcum": [17,1003,206,559,475,991],
+    "curly": [4,719,7,702],
+    "currant": [393,734,403,565,404,724],
+    "curvatur": [763,815,798,519,799,498,945,726,946,447,947,488],
+    "cushing": [716,1002],
+    "cutane": [61,304,248,394,539,354,678,354,692,470,701,340,702,361,704,361,727,340,828,318,837,309,839,327,842,470,847,318,849,521,852,304,854,461,856,424,858,327,859,333,861,291,865,340,867,523,870,470,875,361,893,330,911,321],
+    "cuticul": [461,481],
+    "cuy": [103,379,108,292,150,330,152,375,154,344,155,363,156,340,160,344,161,266,165,359,167,337,172,327,177,333,179,412,181,402,190,412,191,393,199,248,200,371,201,355,203,254,204,333,206,340,207,340,209,330,217,347,219,324,233,300,234,333,509,340,515,327],
+    "cuyanquill": [471,573],
+    "cyanu": [50,954],
+    "cydoni": [193,913,388,834],
+    "cymbopogon": [39,672],
+    "cyminum": [15,872,446,935],
+    "cypres": [114,1096,133,878],
+    "cytisu": [171,892],
+    "dab": [923,512],
+    "dacc": [378,880],
+    "dactiliti": [704,657],
+    "dafn": [9,589],
+    "dahli": [251,1152],
+    "daisy": [203,418,245,559,246,974],
+    "dali": [251,1152],
+    "damasc": [236,625,387,767],
+    "damask": [236,919],
+    "damasquer": [387,589],
+    "damasquill": [387,589],
+    "damasquin": [262,618],
+    "damian": [184,984],
+    "damson": [385,822],
+    "dan": [92,373,269,298,347,344,431,391,531,307,538,316,540,293,550,323,586,337,594,382,606,307,609,316,615,340,620,301,627,296,628,313,643,348,644,323,647,290,654,356,657,333,665,340,683,307,687,316,724,356,729,316,769,282,779,330,780,337,784,360,793,373,815,296,823,307,828,290,830,304,831,296,937,282],
+    "danad": [612,587,626,564],
+    "danan": [627,589],
+    "danar": [593,780],
+    "dandelion": [67,859,203,662],
+    "danl": [769,806],
+    "danni": [6,575,448,564],
+    "daphn": [176,1101],
+    "dar": [481,637],
+    "darim": [455,568],
+    "dasheen": [225,553],
+    "dashi": [304,752],
+    "daucu": [214,850],
+    "daun": [34,811],
+    "day": [8,822],
+    "dcl": [653,892],
+    "dead": [289,644],
+    "deb": [29,450,40,560,378,509,482,509,643,554],
+    "debaj": [579,432,626,419,660,475,706,403,718,460,730,407,856,362,857,611,865,423,867,392,892,354],
+    "debid": [61,359,79,436,489,450,560,422,656,488,719,405,723,440,743,431,785,482,815,382,819,365,884,422,913,352,929,272],
+    "debil": [626,473,628,483,648,503,803,542,816,451,817,443],
+    "debilidad": [531,270,542,290,559,316,602,303,606,270,608,293,614,293,617,287,618,293,620,265,630,293,644,391,647,255,648,287,650,275,651,265,654,313,657,293,658,290,660,306,662,299,663,281,676,391,684,306,688,399,691,377,692,377,696,270,699,228,712,267,716,278,723,299,738,273,741,240,743,293,744,360,746,265,748,477,750,290,752,446,753,303,755,238,756,250,757,257,764,246,767,235,773,293,774,260,780,296,781,316,795,306,891,299,931,219,932,284,954,290],
+    "debilit": [650,575,722,599],
+    "debilitad": [530,453,558,468,676,425,754,346,808,385,811,396,843,392,845,385,850,368,856,349,864,368,868,365,872,396],
+    "debilitamient": [779,605,809,553],
+    "debilitan": [683,532,762,517,809,522],
+    "decaid": [914,492],
+    "decidu": [133,954],
+    "decir": [925,589],
+    "decision": [915,558,929,386],
+    "decoloracion": [842,564,892,475],
+    "decoracion": [350,612],
+    "decorativ": [164,679],
+    "ded": [336,374,497,407,503,366,531,356,560,378,577,437,624,507,625,342,685,366,688,386,690,352,699,300,704,382,705,356,724,412,744,474,766,706,767,310,768,310,842,356,863,330,871,363],
+    "dedaler": [80,1015,260,709],
+    "deepyak": [480,664],
+    "defecacion": [567,846,585,646],
+    "defecar": [564,539,568,721,569,565,584,558,585,527,599,539,808,438],
+    "defect": [611,464,621,693,622,436,683,428,735,474,741,380,763,416,788,474,797,441,912,680],
+    "defens": [358,618],
+    "deficienci": [524,352,574,437,587,422,630,386,631,394,644,374,671,407,674,382,711,352,712,352,713,417,718,602,722,378,723,394,734,324,737,378,740,426,743,598,760,330,806,356,813,339,871,363],
+    "deficient": [540,484,590,545,743,551,795,576],
+    "deficit": [661,616,741,472,903,700],
+    "definid": [865,618],
+    "deform": [912,431],
+    "deformidad": [762,517,770,498,771,493],
+    "degeneracion": [650,543,651,522,658,571],
+    "degenerad": [761,584],
+    "degenerativ": [640,567,660,554,755,805,772,850,773,531],
+    "degrad": [642,734],
+    "dejand": [851,600],
+    "dejar": [910,553,911,538],
+    "delegar": [930,573],
+    "delgad": [557,461,574,505,585,471,596,488,597,477,599,482,614,446,623,432,648,437,673,488,760,381,820,400],
+    "delgadez": [904,496],
+    "delicad": [294,632,474,668],
+    "delicios": [288,632,358,794],
+    "delight": [24,731],
+    "delimitad": [854,595],
+    "delirant": [920,961],
+    "deliri": [902,523,919,678,920,687,921,489],
+    "dem": [912,589,922,740,923,375,924,369,925,609,926,452,927,629,929,579],
+    "demasiad": [578,574,581,566,597,453,601,403,646,369,726,438,793,474,795,443,893,383,914,314,927,307,929,268,946,525,947,403,949,383],
+    "demenci": [653,938,677,553],
+    "demodex": [841,578],
+    "demostrad": [102,569,278,646],
+    "demostrar": [925,589],
+    "demulcent": [87,560,207,514,303,580,360,499,388,531],
+    "denigrant": [922,543],
+    "densidad": [760,947],
+    "dental": [20,717],
+    "denticion": [741,543],
+    "dentr": [767,427,778,525,819,644,835,471,937,450],
+    "dependiend": [383,694],
+    "dependient": [929,648],
+    "deport": [771,523,773,612],
+    "deportiv": [213,537,520,565,762,517],
+    "deposicion": [568,668,586,618],
+    "deposit": [578,508,633,493,653,503,674,695,778,508,865,767],
+    "depresion": [646,382,652,453,814,429,835,389,896,665,897,550,904,485,912,284,914,575,915,561,916,358,919,378,933,371],
+    "depresiv": [896,604,897,644,915,657,916,420,919,443,920,451],
+    "deprimid": [896,781],
+    "depurar": [25,709],
+    "depurativ": [7,318,25,433,64,382,67,424,104,471,113,506,156,541,162,410,169,402,203,294,217,549,230,424,248,583,307,454,309,454,312,444,389,338,391,402],
+    "derech": [535,426,577,738,578,675,579,753,598,616,831,442,925,442],
+    "derivad": [302,668,470,405],
+    "dermatilomani": [911,828],
+    "dermatiti": [838,718,839,922,850,446,852,636,862,764],
+    "dermatofibrom": [866,811],
+    "dermatofit": [842,612],
+    "dermatologic": [287,612],
+    "dermatomiositi": [692,856],
+    "dermi": [853,600],
+    "derram": [536,751,553,563,647,682,879,797],
+    "desaconsejabl": [166,717],
+    "desacuerd": [929,419],
+    "desagradabl": [89,590,810,548,929,364],
+    "desaj": [469,563],
+    "desanim": [915,606],
+    "desaparec": [533,558,790,676],
+    "desaparecen": [831,543,840,605],
+    "desaparecer": [956,637],
+    "desapeg": [899,518,934,538],
+    "desapercibid": [698,589],
+    "desarroll": [557,403,621,363,627,346,673,565,718,395,727,363,732,367,733,328,734,551,735,540,736,314,741,319,770,337,797,514,799,378,844,350,856,311,866,334,868,325,878,422,892,303],
+    "desarrollars": [706,589],
+    "desastr": [934,584],
+    "desc": [281,521],
+    "descamars": [848,595],
+    "descans": [759,624],
+    "descarg": [744,528,764,514],
+    "descendid": [818,624],
+    "descolorid": [619,543,859,527,864,485],
+    "descomposicion": [558,709],
+    "desconfianz": [922,786],
+    "descongestionant": [42,892,211,564],
+    "desconocid": [531,360,535,334,539,521,625,346,642,432,650,367,658,386,668,350,691,360,702,386,703,399,709,356,710,346,727,363,763,350,788,399,799,378,861,311,866,334,876,363,891,399],
+    "descoordinad": [948,679],
+    "describ": [694,650],
+    "descrit": [361,616,581,559,819,489],
+    "descuid": [931,496],
+    "dese": [687,504,731,484,814,520,823,489,923,409],
+    "desead": [898,618],
+    "desearian": [835,589],
+    "desech": [780,671],
+    "desencadenad": [692,489,705,489,709,484,710,471,911,466],
+    "desencadenan": [707,606],
+    "desencadenant": [680,489,681,509,689,542,698,471,841,462],
+    "desequilibrad": [895,612],
+    "desequilibri": [178,418,607,418,636,431,678,418,715,349,729,409,730,544,749,450,810,409,896,349,910,390,914,319,915,393,920,379],
+    "desert": [161,464,461,662],
+    "desesperanz": [917,612],
+    "desgarr": [585,542,617,503,746,653,757,640,765,431,956,493],
+    "desgarrador": [617,650],
+    "desgast": [651,451,652,515,742,493,746,451,755,690,772,638,773,773],
+    "deshacers": [913,924],
+    "deshidratacion": [568,545,610,504,729,474,737,488,749,521,774,442,778,493],
+    "deshilachad": [495,595],
+    "desiert": [186,664,187,647,190,647,191,617],
+    "desigual": [763,595],
+    "desinfectant": [72,694],
+    "desinfectar": [81,701,173,618],
+    "desintoxicant": [104,640,213,513,296,639,517,557],
+    "deslizad": [651,844],
+    "desmay": [534,503,604,493,607,498,609,488,615,525,830,469],
+    "desmielinizacion": [671,701],
+    "desnutricion": [566,596,683,532,733,485],
+    "desorganizacion": [903,563],
+    "desorganizad": [902,581,921,767],
+    "desorientacion": [556,498,641,571,934,507],
+    "despejar": [211,612],
+    "despersonalizacion": [934,584],
+    "despertar": [532,564,935,564],
+    "despertars": [646,757,787,906],
+    "desplazamient": [940,644],
+    "despreci": [925,589],
+    "desprend": [851,600],
+    "desproporcionad": [909,521],
+    "despu": [549,538,581,399,597,440,733,581,772,376,779,407,800,416,803,435,804,365,805,340,808,513,817,355,834,506,890,362,899,500,938,391,947,391],
+    "desregulacion": [918,811],
+    "dessert": [391,657],
+    "destac": [65,605,72,639],
+    "destruccion": [635,644],
+    "destruy": [641,545,700,498,712,705,894,563],
+    "destruyen": [688,612,752,500],
+    "desviacion": [763,772,940,816],
+    "desviad": [526,538,940,816],
+    "detall": [926,569,930,528],
+    "detectad": [611,664],
+    "detener": [36,456,142,638,226,596],
+    "detergent": [144,709],
+    "deterior": [652,479,664,501,667,469,670,459,671,490,672,479,674,459,913,380,916,380,919,400],
+    "deterioran": [755,538],
+    "detien": [532,564,816,538],
+    "detoxificant": [245,593,375,618],
+    "detr": [765,999,938,581],
+    "deulkka": [59,529],
+    "devil": [52,603,233,673,478,774,489,576],
+    "devocion": [930,573],
+    "dewberry": [392,644],
+    "dia": [820,447,861,397,896,404,914,549,918,426,921,442,949,451],
+    "diabet": [344,490,348,366,372,370,373,392,592,379,595,397,602,366,618,354,634,344,635,583,644,344,693,598,711,620,712,620,721,327,729,466,733,298,744,306,766,283,767,285,781,383,784,383,793,397,794,347,811,320,814,347,862,309,865,330,867,306,936,354],
+    "diabl": [90,676,478,639],
+    "diaforetic": [108,459,208,534,230,576,239,518],
+    "diafragm": [583,646,775,575],
+    "diametr": [844,548,869,460],
+    "dianthu": [244,925],
+    "diari": [848,517,903,489,917,532],
+    "diarre": [36,273,136,356,138,410,142,381,388,345,392,334,394,381,397,390,407,400,408,318,461,250,544,349,564,373,565,457,566,480,567,352,569,511,573,349,574,390,575,421,582,373,585,364,586,349,596,377,597,368,669,338,674,341,694,338,727,321,739,287,800,349,884,338,887,345],
+    "didym": [43,984],
+    "dient": [67,975,203,792,306,632,717,508],
+    "diet": [132,400,568,497,575,555,587,497,588,428,589,460,590,450,601,432,633,436,758,415,778,450],
+    "dietetic": [87,609,90,638,363,638],
+    "diferenci": [435,632,518,529,903,467,916,451],
+    "diferent": [65,525,75,475,539,514,865,494,933,450],
+    "diffus": [184,984],
+    "dificil": [555,545,794,540,906,436,912,358],
+    "dificult": [594,661,615,590,936,577],
+    "dificultad": [523,227,524,205,527,232,529,238,531,207,533,205,534,220,536,225,537,201,538,214,539,218,540,198,543,207,547,249,548,218,550,218,551,218,552,324,553,230,554,243,555,223,557,232,558,240,559,243,560,220,563,225,568,246,580,355,583,238,590,223,593,264,594,258,602,232,604,216,606,207,608,225,609,214,617,220,620,203,621,209,636,225,641,223,642,249,646,278,647,196,650,212,652,232,654,240,657,225,658,223,663,216,665,311,669,220,688,225,691,290,692,207,696,207,699,175,715,182,725,235,739,187,740,249,743,225,746,203,748,214,750,223,751,218,752,266,753,232,754,178,756,275,757,198,761,198,765,189,768,181,786,227,803,238,809,203,813,198,814,302,815,200,816,198,817,194,836,227,879,246,880,238,883,212,885,212,888,216,889,214,891,311,895,207,903,191,913,266,914,167,915,205,923,173,929,268,931,168,932,218,936,225,939,212,940,218,944,212,945,238,946,196,957,238],
+    "difteri": [550,886],
+    "difund": [699,516],
+    "difus": [685,805,743,612],
+    "digerid": [594,701,595,684],
+    "digerir": [221,484,225,636,346,542,396,509,574,601],
+    "digestion": [6,333,9,314,12,263,15,379,27,333,39,235,47,374,53,298,58,292,78,362,98,397,105,358,106,370,203,257,210,340,226,366,263,354,304,401,345,344,347,366,351,351,369,303,374,374,378,340,443,392,447,344,467,383,481,340,486,314,513,354],
+    "digestiv": [0,287,3,207,4,269,5,287,6,215,8,283,9,203,11,209,12,170,13,301,15,244,16,236,18,242,21,247,24,252,26,283,27,215,29,194,30,205,33,215,34,280,38,184,39,152,43,259,47,242,49,226,52,168,53,192,58,189,60,205,76,209,78,234,83,250,88,242,98,256,105,231,135,250,148,220,174,321,180,217,189,262,192,262,198,262,201,231,207,222,209,299,210,220,214,209,215,197,216,229,217,226,219,211,220,197,221,293,226,236,232,224,254,234,262,213,273,239,302,250,313,247,344,317,345,222,346,234,348,236,361,244,363,253,364,244,369,196,372,239,375,231,376,253,377,226,401,350,419,262,427,334,428,250,435,262,443,253,445,353,446,350,447,222,448,295,450,209,451,222,467,247,468,262,473,236,476,229,479,207,481,220,485,184,486,203,492,163,507,319,519,217,540,201,564,247,566,236,578,226,596,250,683,211,694,224],
+    "digital": [80,661,259,577,260,964],
+    "digitali": [80,913,260,1021],
+    "digitoxin": [80,761],
+    "digoxin": [80,761],
+    "dilatacion": [538,759,596,631,616,787],
+    "dilatad": [871,799,878,661],
+    "dill": [8,1107,451,933],
+    "dillweed": [8,757,451,593],
+    "diluid": [729,631],
+    "ding": [20,717],
+    "dio": [274,618],
+    "dioic": [79,840,476,834],
+    "diospyr": [398,850],
+    "diphtheria": [550,644],
+    "diplopi": [752,543],
+    "dipteryx": [482,880],
+    "direccion": [948,679],
+    "direct": [543,428,545,525,550,450,828,404,839,586,842,428,843,416,850,390,909,364,956,445],
+    "directament": [370,726],
+    "dirigid": [912,431],
+    "disartri": [654,709],
+    "disc": [651,970,675,548,755,805,761,661,764,446],
+    "discal": [755,781],
+    "discapacidad": [673,726],
+    "discopati": [755,781],
+    "discurs": [926,618],
+    "diseccion": [617,822,623,593],
+    "disemin": [815,589],
+    "diseminacion": [661,653,662,625],
+    "disfagi": [580,804,590,571,594,661],
+    "disfasi": [665,919],
+    "disfoni": [954,899],
+    "disforic": [917,856],
+    "disfrutar": [914,453,923,472],
+    "disfuncion": [564,512,566,490,720,446,733,398,786,740,804,421,814,637,836,651,938,451],
+    "dislocacion": [769,563],
+    "disminucion": [653,422,687,409,696,397,730,386,731,393,742,426,780,436,783,471,812,551,814,422,816,379,834,372,914,319,941,405],
+    "disminuid": [549,575,734,514],
+    "disminuir": [75,494,103,595,910,498,911,484],
+    "disminuy": [70,657],
+    "dismorfic": [912,661],
+    "disne": [524,503,531,508,555,746,606,508],
+    "disociativ": [931,457,934,762],
+    "dispareuni": [834,817],
+    "dispepsi": [581,886],
+    "displasi": [770,752,794,599],
+    "disponibl": [906,525],
+    "disruptiv": [918,811],
+    "distachy": [317,976],
+    "distal": [875,657],
+    "distanci": [944,575,945,646],
+    "distanciamient": [923,512],
+    "distension": [757,762,761,538],
+    "distimi": [915,850],
+    "distintiv": [692,612],
+    "distorsion": [924,504],
+    "distorsionad": [945,701],
+    "distrofi": [748,874],
+    "diuretic": [7,287,14,204,25,267,30,315,50,270,51,204,64,235,66,252,67,261,69,279,73,296,74,255,75,315,79,252,80,373,81,286,83,273,100,359,106,261,112,240,113,311,139,353,149,356,152,267,154,245,155,348,156,242,157,258,160,245,161,189,171,245,172,232,184,283,185,286,198,286,200,264,203,181,207,242,211,230,215,307,216,340,217,338,218,235,224,226,226,258,238,242,243,245,246,258,248,270,251,276,259,250,273,261,277,264,308,267,312,273,315,261,318,283,345,242,346,255,365,273,372,261,380,247,382,235,383,351,384,315,386,288,389,208,391,338,393,317,395,348,396,240,397,283,402,219,403,245,404,313,405,283,406,270,413,279,416,290,417,305,444,379,456,254,463,199,465,230],
+    "diurn": [532,532,646,502,787,653],
+    "divers": [61,404,121,571,372,507,380,481,488,384,571,476,769,412,890,427],
+    "diverticul": [576,1136],
+    "diverticuliti": [576,951,600,684],
+    "diverticulosi": [575,1032],
+    "divid": [940,644],
+    "divin": [489,694],
+    "division": [736,776],
+    "dobl": [648,488,688,499,699,388,752,408,931,372,936,499,948,510],
+    "dog": [85,819,172,749,203,418],
+    "dogwood": [165,959,409,668],
+    "dolenci": [85,467,194,639,459,451,488,436],
+    "dolor": [4,116,20,154,33,134,51,117,71,144,82,133,85,121,112,137,187,168,229,133,242,151,245,138,253,133,258,137,262,133,282,146,360,134,380,141,443,158,444,168,466,156,469,121,479,129,487,129,491,154,502,152,504,147,507,147,514,194,522,147,523,144,526,125,527,225,528,143,532,131,533,130,534,140,535,122,536,143,537,128,541,146,542,193,544,144,545,161,546,151,550,138,554,154,557,147,558,152,559,154,560,140,561,160,562,146,563,143,564,205,565,189,566,199,567,146,570,158,572,160,573,144,575,174,576,174,577,161,578,220,579,188,580,147,581,138,583,151,584,160,585,151,587,156,589,144,590,141,591,144,592,152,593,168,594,163,598,176,599,154,600,160,601,135,602,199,603,141,604,189,605,219,607,138,610,144,611,143,613,151,614,143,616,194,617,140,618,143,619,134,620,129,622,134,624,135,625,127,626,131,631,146,633,137,634,138,636,143,637,144,638,202,643,242,644,190,646,124,647,124,648,140,649,152,651,181,656,161,660,149,661,152,662,146,675,259,678,138,679,151,680,131,689,146,691,131,694,140,695,149,697,196,699,163,702,141,703,224,704,193,705,184,706,127,707,130,717,131,720,134,722,140,723,197,725,149,726,147,728,141,730,128,731,130,738,133,739,171,742,193,743,143,744,123,745,137,746,181,747,141,749,149,751,234,753,147,754,165,755,197,756,122,757,125,758,183,759,186,760,122,761,237,762,128,763,128,764,233,765,120,767,115,768,167,769,121,770,123,771,122,772,130,773,143,774,179,775,186,777,140,778,141,785,160,788,240,789,210,790,158,791,178,794,140,796,152,800,144,804,179,805,170,806,212,807,125,808,125,809,129,811,129,813,125,815,179,817,123,818,186,819,121,821,210,822,140,823,131,824,185,825,185,826,197,828,124,829,175,830,183,831,179,832,111,833,180,834,204,849,122,854,128,856,114,860,131,866,122,871,134,873,179,875,141,878,154,879,156,881,152,886,151,887,143,889,188,890,125,891,146,892,111,907,119,932,138,937,173,938,135,940,138,941,134,944,134,945,151,946,124,947,135,954,141,955,133,956,137],
+    "doloros": [539,383,557,408,624,375,655,404,710,351,749,413,768,318,788,547,815,351,826,321,832,307,834,486,837,335,851,357,853,357,856,459,857,531,875,391,950,408,951,427],
+    "domestic": [382,754,385,714,407,868],
+    "domesticated": [382,624],
+    "dominant": [677,780,738,494,769,450,791,466,858,475],
+    "doncel": [440,709],
+    "dong": [267,644],
+    "donut": [396,880],
+    "donzell": [54,450],
+    "dopamin": [640,709],
+    "dorad": [168,686],
+    "dormid": [646,578],
+    "dormir": [358,478,787,581,812,469,914,380,938,488,939,483],
+    "dormirs": [646,578],
+    "dors": [869,500],
+    "dos": [28,496,689,496,723,496,787,550,813,427,889,461,906,384,916,575],
+    "dosi": [40,609,57,543,314,616],
+    "dot": [500,886],
+    "dou": [38,534],
+    "doux": [470,440],
+    "down": [621,569,885,575],
+    "dracer": [12,492],
+    "dracunculu": [12,731],
+    "drag": [12,453,131,1074],
+    "dragon": [12,896,351,890,486,913],
+    "dragoncill": [12,492],
+    "dragoner": [12,731],
+    "dragonet": [12,492],
+    "drastic": [164,590,176,571,897,512],
+    "drenaj": [854,595],
+    "drimy": [129,839],
+    "drog": [535,415,604,466,612,466,613,513,833,435,902,461,917,448,919,419],
+    "drumstick": [101,817],
+    "drynari": [92,1157],
+    "dubi": [367,912],
+    "duch": [805,505,810,581],
+    "duckweed": [309,743],
+    "dud": [924,504],
+    "dulc": [14,282,16,356,41,489,199,244,201,349,209,324,212,324,214,315,216,345,223,306,232,338,305,405,321,368,344,352,347,356,351,341,352,352,353,345,360,324,361,368,362,295,363,381,364,368,365,377,376,381,377,341,378,331,383,360,396,331,398,315,424,410,449,341,470,560],
+    "dulci": [137,878,433,906],
+    "duls": [300,1179],
+    "dumping": [597,946],
+    "dumpling": [489,694],
+    "dung": [478,932],
+    "duoden": [562,679],
+    "duodenal": [562,919],
+    "dur": [530,548,568,580,578,525,585,560,778,525],
+    "duracion": [908,508,915,503,920,687,921,691],
+    "durader": [464,624],
+    "duran": [663,554,710,512,916,472],
+    "durazn": [384,916,395,596,396,554],
+    "duraznill": [288,686],
+    "duri": [354,932],
+    "durian": [354,1053],
+    "durill": [166,1071],
+    "dwarf": [455,811],
+    "dysphani": [35,856],
+    "eap": [618,905],
+    "ear": [225,692,272,814,279,1015],
+    "earth": [220,573],
+    "east": [8,757,458,575],
+    "eccem": [104,409,230,536,248,555,708,420,838,695,862,447],
+    "echeveri": [493,1236],
+    "echinace": [202,892],
+    "echinopsi": [496,905],
+    "ectopic": [830,850],
+    "eczem": [838,828,856,488],
+    "edad": [587,407,641,369,651,337,653,365,670,369,705,344,715,302,717,480,718,377,732,351,733,313,764,313,798,377,807,328,817,322,830,340,832,290,833,334,836,377,869,415,870,344,888,358,891,381,937,316,939,351],
+    "edd": [225,553],
+    "edem": [277,513,551,648,596,531,606,448,784,698,793,543,884,476,885,457],
+    "edibl": [104,670,360,543,388,577],
+    "edod": [265,925],
+    "educativ": [908,612],
+    "edulcorant": [41,518,117,692],
+    "eduli": [94,836,95,843,292,971,349,762],
+    "eeg": [668,595],
+    "efect": [1,376,7,263,11,307,12,249,13,319,19,367,22,390,31,282,60,301,62,326,80,385,84,319,95,400,100,363,127,385,154,329,184,380,237,319,239,316,274,313,283,355,293,367,383,351,397,380,398,307,403,329,415,376,442,395,456,224,464,316,471,290,569,380,730,301,731,307,741,275,911,295],
+    "efectiv": [161,504],
+    "effusu": [93,919],
+    "eficaz": [8,375,18,455,40,455,130,500,136,445,142,476,143,482,157,445,177,409,249,471,385,375,461,312,472,346,478,450],
+    "eficient": [62,593,606,564],
+    "eggfruit": [362,568],
+    "egom": [59,529],
+    "ehe": [41,563],
+    "ehler": [769,806],
+    "eichhorni": [310,968],
+    "eii": [584,684,694,822],
+    "eip": [805,728,830,558],
+    "eiseni": [305,1007],
+    "eje": [732,624],
+    "ejercen": [80,761],
+    "ejercici": [521,490,535,406,568,518,575,579,609,451,710,421,760,406,848,599,917,437],
+    "ela": [650,868],
+    "elachi": [447,886],
+    "elastic": [769,563],
+    "elasticidad": [272,485,586,583,944,543],
+    "elder": [75,844,161,905,177,548],
+    "elderberry": [161,1158],
+    "elderflower": [75,839],
+    "electric": [607,498,609,488,629,519,744,443,764,431,767,413],
+    "electroencefalogram": [668,595],
+    "electrolit": [356,583,607,559,749,603],
+    "elefantiasi": [877,1041],
+    "elegan": [250,878,493,859],
+    "element": [74,679],
+    "elephant": [225,796],
+    "elettari": [21,878,447,816],
+    "eleuter": [233,568],
+    "eleuterococ": [233,947],
+    "eleuther": [233,811],
+    "eleutherococcu": [233,811],
+    "elevad": [112,420,556,378,633,420,634,425,727,408,755,355,758,400,840,434,842,404,846,396,854,392,860,404,867,378],
+    "eliminacion": [112,637],
+    "eliminar": [6,446,94,557,113,417,143,531,226,490,235,485,273,495,296,550,391,469],
+    "ell": [913,543],
+    "elm": [87,1131],
+    "elode": [318,1206],
+    "elogi": [923,512],
+    "elorri": [410,650],
+    "emarginat": [381,796],
+    "embaraz": [563,395,567,404,621,368,626,364,685,375,720,372,744,341,768,318,798,400,809,357,828,344,830,667,831,625,832,534,833,578,859,584,871,372,885,372,902,375,903,335],
+    "embarazad": [823,612],
+    "embarbascar": [176,657],
+    "emblic": [103,878,513,1019],
+    "emboli": [534,775,536,577,554,623],
+    "embrionari": [734,558],
+    "emenagog": [29,412,30,435,44,496,52,357,53,408,54,329,57,457,151,439],
+    "emergent": [309,743],
+    "emetic": [314,709],
+    "emocion": [900,475,910,480,923,409,924,402,926,494],
+    "emocional": [252,378,751,405,774,370,813,367,815,370,840,413,899,354,905,374,907,348,916,342,917,385,922,342,923,473,924,317,931,312,932,405],
+    "emolient": [46,486,48,470,49,450,135,497,137,653,139,480,143,509,191,509,193,521,207,441,368,486],
+    "emotividad": [926,618],
+    "empati": [927,481],
+    "empein": [869,500],
+    "empeor": [526,400,536,455,551,441,559,491,614,455,645,491,675,470,746,411,755,369,759,428,821,411],
+    "empeoramient": [794,650],
+    "empeoran": [933,563],
+    "empeorar": [699,475,847,533],
+    "empezar": [803,701],
+    "emplead": [74,590,75,517,105,583],
+    "emplears": [72,694],
+    "enan": [326,919],
+    "enanism": [718,912],
+    "encaj": [701,618],
+    "encapuchad": [798,671],
+    "encarcelad": [438,709],
+    "encarnad": [153,762,425,581],
+    "encefaliti": [656,984],
+    "encefalomielopati": [669,892],
+    "encen": [54,450],
+    "enchanter": [97,946],
+    "enci": [700,600],
+    "encim": [746,600],
+    "encin": [118,483,125,1086],
+    "encogimient": [819,563],
+    "encontrar": [79,618,665,625],
+    "encorvad": [655,590,722,565,760,493],
+    "encuentr": [527,569,573,557,798,557,885,518],
+    "encuentran": [810,631],
+    "encurtid": [589,671],
+    "endocardi": [612,880],
+    "endocarditi": [611,612,612,810],
+    "endocrin": [696,473,715,416,726,530,727,478,738,767,739,721],
+    "endolinf": [943,624],
+    "endolinfatic": [943,868],
+    "endometri": [804,589],
+    "endometriom": [804,833],
+    "endometriosi": [804,665,807,466,823,489,830,484,834,458],
+    "endrin": [401,1033,408,984],
+    "endulzant": [41,489,201,583,362,705],
+    "endurecimient": [627,489,690,705,774,489,955,513],
+    "enebr": [155,1047],
+    "eneld": [8,757,451,1005],
+    "energetic": [76,484,132,661,221,484,223,471,231,504],
+    "energi": [77,381,93,390,204,362,205,362,223,338,227,394,267,370,353,381,354,398,363,422,371,390,379,394,428,417,435,437,439,407,515,355,609,362,635,370,896,309,897,478,914,282,915,348,917,351],
+    "energizant": [77,400,93,409,196,495,197,470,204,380,267,388,366,443,371,409,378,384,379,414,385,349,412,489,428,438,435,459,439,428,440,428,453,428,464,377,506,448],
+    "enfermedad": [17,169,63,181,228,193,381,157,426,231,521,195,524,279,530,195,531,244,535,162,537,169,538,180,539,183,542,187,555,256,556,163,559,204,560,185,563,258,564,204,566,298,570,209,571,312,573,260,574,280,580,195,584,211,590,187,591,191,593,222,603,256,606,174,608,258,609,180,611,258,613,200,614,189,615,193,618,258,622,247,624,249,625,275,629,191,630,189,633,181,634,183,635,183,637,260,640,202,641,187,642,276,645,204,650,284,652,298,654,202,655,296,657,258,658,292,659,260,660,300,664,204,667,260,670,187,671,200,672,298,674,328,677,171,678,183,680,174,681,250,683,244,684,265,685,249,687,249,688,189,690,173,691,244,692,174,694,254,696,174,697,191,698,168,700,171,701,176,702,256,703,193,706,168,707,242,708,263,710,168,712,173,713,204,714,191,716,285,721,174,722,290,733,159,738,176,740,209,741,155,742,187,743,189,745,181,748,180,750,292,752,155,753,263,755,222,759,284,767,152,768,221,772,242,773,189,776,197,780,191,781,305,783,207,784,271,791,236,792,202,795,265,800,191,801,295,802,189,805,225,814,185,830,173,836,191,837,160,851,301,857,185,858,169,862,272,866,162,867,163,873,275,876,245,884,185,887,189,888,181,890,236,891,193,897,237,919,163,921,168,929,119,931,141,933,229,937,160,942,195,943,247,954,187],
+    "enfocar": [944,754,946,502,947,548],
+    "enfoqu": [932,644],
+    "enfriar": [245,644],
+    "english": [4,558,23,524,24,522,87,501,118,548,120,651,241,460,246,490,463,378],
+    "engreid": [927,481],
+    "engros": [219,612],
+    "engrosad": [219,532,680,532,862,502],
+    "engrosamient": [627,471,677,480,841,462,842,489,858,475],
+    "enm": [658,899],
+    "enoj": [918,568],
+    "enoki": [275,1150],
+    "enokitak": [275,589],
+    "enrojecid": [525,499,619,499,708,434,821,480,852,442],
+    "enrojecimient": [527,453,707,400,742,434,747,434,758,561,811,396,829,378,838,434,841,382,847,382,852,365,935,404,949,396],
+    "ensalad": [36,525],
+    "ensanchad": [797,581,799,593],
+    "ensanchamient": [538,581,616,612],
+    "ensanchan": [538,631],
+    "entender": [620,498,663,529,665,563,668,494],
+    "enter": [97,653,515,569],
+    "enteropati": [573,840,884,822],
+    "entesiti": [704,657],
+    "entorn": [901,471,905,494,927,399,942,768],
+    "entrad": [854,595],
+    "entran": [849,568],
+    "entrecerrar": [946,533,947,581],
+    "entumecimient": [602,419,618,406,625,360,642,449,644,541,647,353,651,367,663,389,684,424,696,374,724,433,744,499,755,329,764,341,767,326,768,326,931,303,932,393],
+    "envejecid": [870,612],
+    "envejecimient": [228,404,381,329,399,427,575,482,583,417,609,375,611,395,722,387,745,379,746,357,755,321,772,361,773,395,809,357,812,361,816,347,871,372,936,395,944,372,949,357],
+    "envi": [957,701],
+    "envolver": [299,761],
+    "enzim": [345,498,346,525,446,611,671,542,674,508,737,503],
+    "epazot": [35,1124],
+    "epazotl": [35,612],
+    "epicondilalgi": [756,811],
+    "epicondiliti": [756,811],
+    "epidermic": [882,679],
+    "epididim": [820,548,821,777],
+    "epididimiti": [821,777,822,599],
+    "epidural": [662,1041],
+    "epifisari": [771,811],
+    "epilepsi": [251,638,639,835,667,900],
+    "epileptic": [668,772,931,457],
+    "episodi": [75,425,897,595,900,425,904,354,916,388,919,583,920,417,921,595,943,620],
+    "episodic": [728,657],
+    "epispadi": [799,886],
+    "epistaxi": [952,946],
+    "epitelial": [891,679],
+    "epm2": [667,671],
+    "epoc": [524,883,537,494,555,545,914,408],
+    "epstein": [699,428,872,498,873,691,893,498],
+    "equilibrant": [252,600],
+    "equilibrar": [252,600],
+    "equilibri": [305,545,645,501,654,496,666,496,670,459,684,485,696,428,805,383,942,479,957,656],
+    "equinace": [202,1019],
+    "equiset": [64,575,185,913],
+    "equisetum": [64,754,185,861,315,810],
+    "erc": [781,954],
+    "ereccion": [814,1019],
+    "erect": [262,862],
+    "erectil": [720,575,814,822],
+    "erenotz": [9,589],
+    "erg": [563,787,590,571,593,678],
+    "erinaceu": [268,844],
+    "eriobotry": [397,984],
+    "erisipel": [854,839],
+    "eritem": [727,618],
+    "eritematos": [637,840,678,816],
+    "eritrosi": [870,856],
+    "erosion": [708,500,851,553],
+    "error": [697,557,700,498,701,513,736,644],
+    "erupcion": [637,451,678,432,692,575,701,415,727,415,828,388,839,563,861,611,863,381,865,415,867,737,893,403],
+    "eryngii": [284,899],
+    "erythrae": [263,905],
+    "escabiosi": [863,811],
+    "escaler": [691,564,699,475],
+    "escalerill": [36,525],
+    "escalofri": [523,460,550,441,598,562,612,436,632,470,777,445,805,375,854,407,875,450,886,480,889,432],
+    "escam": [680,564,858,548],
+    "escambron": [402,584],
+    "escamos": [680,437,838,469,839,425,842,437,846,757,852,569,858,425,864,398,868,569],
+    "escandinavi": [425,631],
+    "escapar": [906,525],
+    "escarambroj": [85,563],
+    "escaramoj": [85,563],
+    "escaramuj": [85,868,172,1039],
+    "escarlatin": [706,589],
+    "esclatasanc": [290,563],
+    "escleroci": [269,517,273,603,277,609],
+    "esclerodermi": [690,783,802,612],
+    "esclerosi": [642,727,650,651,684,700,690,638,708,408,786,685,814,488],
+    "escob": [171,650],
+    "escobill": [50,661,53,514],
+    "escoci": [424,790],
+    "escoliosi": [763,772,882,625],
+    "escorbut": [129,595],
+    "escorbutic": [317,743],
+    "escoriacion": [862,578],
+    "escornaboi": [126,624],
+    "escozor": [862,578],
+    "escrit": [665,679],
+    "escrot": [818,771,819,842,820,815,821,464,822,503,877,525],
+    "escuch": [622,624],
+    "escuchar": [902,631],
+    "escud": [68,671],
+    "escuel": [908,564,918,523],
+    "esculent": [76,705,225,661,231,725,290,669],
+    "esencial": [81,521,105,460,116,648,128,679,214,415,252,578,299,521,304,515,423,491,429,450,437,470],
+    "esfinter": [662,679],
+    "esfuerz": [567,510,568,545,585,527,603,493,605,488,615,510,757,438],
+    "esguinc": [242,701],
+    "esk": [281,521],
+    "eslavoni": [118,525],
+    "esmermasangr": [37,573],
+    "esmirni": [30,595],
+    "eso": [873,589],
+    "esofag": [563,513,580,530,590,792,593,603,594,588,597,548],
+    "esofagic": [595,743],
+    "esofagiti": [593,1007],
+    "espaci": [536,700,537,460,662,525,879,743,906,406,938,488],
+    "espaciamient": [717,612],
+    "espad": [495,595],
+    "espagn": [470,440],
+    "espald": [572,393,578,347,579,333,592,375,604,337,616,351,617,344,636,351,651,446,662,359,675,619,692,324,703,359,709,321,722,344,755,285,759,330,760,300,761,584,763,314,764,424,777,344,778,347,785,393,789,393,791,309,806,324,817,303,833,314,861,408,869,264],
+    "espan": [174,639,237,581],
+    "espanol": [495,595],
+    "espantos": [643,694],
+    "esparrag": [55,816,308,981],
+    "esparraguer": [55,644],
+    "espartein": [171,892],
+    "espasm": [603,450,625,403,643,475,650,428,655,465,724,486,749,638,750,450,757,400,761,400,774,403],
+    "espasmodic": [639,668,706,543],
+    "espasticidad": [658,605,672,632],
+    "especi": [6,436,15,496,20,501,22,538,443,513,446,552,447,450,474,507,475,445,507,479],
+    "especial": [76,484,912,344,924,402,927,384,934,466],
+    "especialment": [16,347,20,363,60,301,63,322,64,316,68,340,84,319,110,322,177,442,218,316,229,313,270,340,359,332,385,293,459,275,466,367,490,293,597,359,603,332,620,304,634,326,706,298,745,322,765,282,766,268,772,307,804,298,806,310,816,295,817,290,837,285,841,293,842,310,863,287,946,293,949,304],
+    "especific": [908,744,909,862,934,507],
+    "espectacular": [168,686],
+    "esper": [908,612],
+    "esperad": [722,599,760,523],
+    "esperarian": [733,558],
+    "espermatic": [819,518,820,548],
+    "espermatozoid": [736,492,821,553],
+    "espermicid": [775,624],
+    "espes": [526,507,540,719,811,522],
+    "espesant": [302,726],
+    "espin": [122,653,167,730,170,466,229,415,253,415,400,493,402,392,406,641,408,575,410,737,415,656,489,466],
+    "espinal": [580,490,644,460,658,469,660,752,662,744,684,495,761,417,764,398,786,651],
+    "espinill": [837,868,857,599],
+    "espinocelular": [846,844],
+    "espinos": [167,509,181,608,183,623,354,554,402,768],
+    "espire": [51,543],
+    "espiritu": [26,480,235,563,293,602,458,518],
+    "espirulin": [295,1136],
+    "esplenomegali": [890,762,893,553],
+    "esplieg": [23,734],
+    "espondiliti": [703,798,707,527,759,754],
+    "espondiloartriti": [759,868],
+    "esponjos": [878,717],
+    "espontane": [595,617,701,513,770,476,833,875],
+    "espor": [558,709],
+    "esporadic": [727,618],
+    "espuel": [45,650],
+    "espumos": [551,483,784,539,792,533,793,558,801,504,802,499,829,430],
+    "esput": [530,569,538,523,551,534,554,791],
+    "esqueletic": [688,612,752,500],
+    "esquiador": [768,776],
+    "esquizoafectiv": [919,817],
+    "esquizofilan": [278,701],
+    "esquizofreni": [902,675,919,736,920,451,922,420,923,396,924,389],
+    "esquizoid": [923,893],
+    "esquizotipic": [923,472,924,685],
+    "est": [64,286,65,302,69,341,71,308,74,311,75,273,76,278,77,305,79,308,80,349,81,349,87,322,92,341,93,311,94,358,95,362,96,353,98,341,99,358,101,263,102,284,131,311,144,325,162,308,263,305,268,275,274,284,278,322,280,311,281,239,282,311,285,322,286,263,287,281,288,315,377,302,381,254,398,278,407,353,683,281,731,278,839,273,848,385,861,243,906,241,907,254,920,268,925,382,929,192],
+    "estabilidad": [916,543],
+    "estacional": [59,488,914,673],
+    "estad": [22,442,88,403,256,351,258,366,371,390,462,332,508,304,511,370,641,377,646,332,653,373,677,345,683,351,751,370,896,448,897,478,899,323,914,420,916,530,917,351,918,544,919,546,931,285],
+    "estafilococ": [951,717],
+    "estandarizad": [460,606],
+    "estar": [626,411,675,461,708,365,755,362,895,411,906,712,907,371,911,392,912,444,913,365,923,344,945,471],
+    "estatur": [623,483,718,685,722,488,733,419,735,510,741,408,760,426],
+    "estenosant": [766,771],
+    "estenosi": [761,484,764,463,794,741,803,780],
+    "ester": [93,1041],
+    "esteril": [185,701,315,639],
+    "esterilidad": [823,856],
+    "estevi": [41,563],
+    "estiercol": [478,694],
+    "estigm": [22,770],
+    "estil": [601,451,635,460,636,474,711,433,722,465,912,308,926,442,929,300,930,583],
+    "estimul": [12,408,218,518,408,508,886,582],
+    "estimulacion": [731,606],
+    "estimulant": [1,502,27,321,33,321,67,357,69,382,72,357,95,523,129,306,181,510,184,387,197,518,198,510,199,363,209,321,210,328,211,315,263,342,283,361,301,396,368,487,375,345,443,378,462,298,463,397,464,447,465,440,468,510,469,290,470,226,473,353,474,374,479,309,518,328,607,331],
+    "estimular": [203,372,210,493,211,473,268,464,285,542,443,568],
+    "estir": [766,529],
+    "estiramient": [690,606],
+    "estiron": [732,624],
+    "estomacal": [563,773,574,565,582,716,583,527,589,504,593,586,600,558],
+    "estomag": [262,395,561,696,562,713,563,424,583,448,589,709,590,420,594,486,595,474,597,453,696,391,738,395,800,429,887,578,907,353],
+    "estornud": [525,693,541,542,545,601,583,560,682,499],
+    "estornudar": [542,657],
+    "estr": [200,331,205,298,233,268,254,320,264,324,284,310,352,320,412,382,508,250,509,304,510,304,516,295,518,415,561,351,607,304,610,317,625,393,638,331,646,273,680,289,681,301,685,298,694,307,698,278,709,286,710,278,762,281,774,278,814,307,815,278,834,270,840,310,897,278,898,292,899,380,900,281,907,261,910,283,911,390,915,286,920,275,921,278,931,234,934,275,954,310],
+    "estrabism": [948,919],
+    "estrag": [12,492],
+    "estragon": [12,965],
+    "estrech": [599,595,767,443,803,582,955,513],
+    "estrechamient": [521,548,598,656,603,718,618,531,794,520],
+    "estrechar": [756,568],
+    "estrell": [350,857,472,464,504,596],
+    "estrellad": [472,1067],
+    "estremoncell": [2,650],
+    "estremoncill": [2,650],
+    "estrenimient": [387,396,461,323,565,591,567,456,568,646,575,544,585,471,586,451,686,419,713,482,739,371,806,411],
+    "estreptococ": [527,548,706,471,792,567,875,525,889,504],
+    "estreptococic": [706,833],
+    "estresant": [895,460,896,404,900,447,913,408,919,430,921,442,934,438],
+    "estri": [709,558,716,581],
+    "estriad": [680,612],
+    "estridor": [529,646,548,593],
+    "estrogen": [722,520,730,475,806,489,812,484,859,484],
+    "estrogenic": [234,631],
+    "estructur": [621,478,819,435,897,455,901,439,902,488,903,435],
+    "estudiad": [373,734],
+    "etap": [519,504,571,713,736,427,828,462,937,450],
+    "etc": [633,587,705,564],
+    "etrog": [327,664],
+    "eucalipt": [63,1179],
+    "eucalyptu": [63,880],
+    "eufori": [897,589],
+    "euforizant": [199,470],
+    "eugeni": [365,961],
+    "euonymu": [164,919],
+    "eupatori": [37,952],
+    "euphorbi": [503,1082],
+    "eurek": [320,726],
+    "europ": [66,618,508,488],
+    "europae": [109,878,308,872],
+    "europaeu": [164,919],
+    "europe": [6,469,113,621,118,394,133,539,263,499,402,438,448,460],
+    "european": [75,350,109,422,112,517,113,486,119,556,126,367,149,556,154,382,161,437,162,395,163,386,164,540,177,371,383,408,385,340,389,325,402,343,403,382,409,427,454,453,460,500],
+    "eusker": [126,518,271,534,408,508,410,540],
+    "eustaqui": [938,631],
+    "euterp": [196,958,412,951],
+    "eutrem": [42,968],
+    "evacuacion": [568,726],
+    "evaluacion": [912,397,928,553],
+    "evan": [894,919],
+    "evaporacion": [949,600],
+    "evaporan": [949,600],
+    "evasion": [899,563],
+    "evasiv": [928,844],
+    "evening": [258,587,261,865],
+    "event": [681,466,896,394,899,689,901,415,913,397,915,443,921,609,934,605],
+    "evitacion": [901,454,904,396,906,613,909,416,928,780],
+    "evitar": [835,589],
+    "evonim": [164,679],
+    "exacerbar": [709,606],
+    "exact": [668,494,691,508,861,439,891,563],
+    "exagerad": [682,720,895,508,899,467,929,348],
+    "examen": [832,516],
+    "excav": [863,568],
+    "excavador": [863,568],
+    "excelenci": [48,596,242,609,260,669],
+    "excelent": [5,331,14,305,24,276,37,322,47,394,137,403,141,433,182,449,185,427,191,417,193,427,231,354,254,381,255,398,263,373,284,369,300,438,346,381,352,381,368,398,379,385,387,331,431,438,445,449,450,340],
+    "excels": [437,925],
+    "excelsior": [112,880],
+    "excentricidad": [924,504],
+    "excepcional": [145,709,480,612],
+    "excepcionalment": [172,513,365,602,410,540,434,632],
+    "exces": [391,413,532,385,551,557,581,405,715,491,719,627,720,546,721,385,723,427,726,431,727,389,728,565,769,354,792,446,914,309,929,264],
+    "excesiv": [226,315,528,415,532,281,561,341,570,337,591,308,601,289,615,311,631,311,632,315,634,295,636,415,700,275,712,278,714,308,717,281,719,398,729,289,731,278,745,292,756,260,757,268,760,260,762,273,765,256,771,260,787,345,810,289,811,275,837,258,844,273,848,484,852,254,864,367,876,395,882,311,884,409,895,281,896,247,897,270,904,227,907,254,924,231,926,395,927,220,929,192,930,375,932,295,954,302],
+    "excesivament": [926,618],
+    "excitacion": [311,709],
+    "excluyend": [930,573],
+    "excoriacion": [911,828],
+    "excret": [793,743],
+    "excretar": [795,694],
+    "exhalar": [521,686],
+    "existen": [902,631],
+    "existent": [844,595],
+    "exit": [927,481],
+    "exoftalm": [685,631],
+    "exotic": [350,508,351,545,353,551,486,489],
+    "expectativ": [912,431],
+    "expectoracion": [554,717],
+    "expectorant": [2,289,9,262,14,241,16,305,21,318,25,315,26,257,28,301,33,277,45,289,46,315,48,305,58,243,59,235,63,283,99,346,105,298,115,292,116,315,119,315,133,318,134,355,136,305,143,330,147,311,158,315,175,283,180,280,182,355,189,338,201,298,207,286,208,286,209,277,215,254,218,277,235,408,241,286,243,289,246,305,248,318,249,322,303,322,312,322,360,277,397,437,405,334,447,286,449,292,469,250,472,237,478,308,483,280,484,274],
+    "experienci": [895,428,900,416,901,397,905,416,906,367,909,364,922,380,926,432,929,293,930,400],
+    "experimentad": [899,563],
+    "experimentar": [899,518,934,538],
+    "expert": [29,563],
+    "exponerl": [223,589],
+    "exposicion": [521,350,522,350,524,309,531,312,533,434,557,350,559,366,560,332,640,362,649,362,681,325,682,319,695,354,708,277,716,322,725,354,750,335,754,391,789,379,798,343,844,303,845,298,846,431,855,285,859,309,860,312,867,292,868,406,869,449,870,312,871,319,872,306,903,287,936,339,939,319],
+    "expresar": [923,472,929,386],
+    "expresion": [752,500,923,472],
+    "expuest": [845,507,868,480,869,434],
+    "expulsar": [9,512,35,532,48,596],
+    "expulsion": [554,661,883,575],
+    "extenders": [681,587,853,553],
+    "extens": [273,859,553,625],
+    "extension": [160,650],
+    "exterior": [756,747,782,618],
+    "extern": [163,525,164,542,173,536,939,693,955,688],
+    "externament": [163,525,246,548,314,567,443,587,469,450],
+    "extiend": [579,631],
+    "extienden": [875,657],
+    "extirpacion": [627,512,724,616,812,527],
+    "extr": [736,534],
+    "extra": [121,647,124,656,130,639,192,632],
+    "extract": [68,504,71,504,150,469,302,545,454,579,460,455,464,469],
+    "extraid": [364,709],
+    "extran": [920,538,924,464],
+    "extravagant": [920,584],
+    "extrem": [530,381,542,365,551,358,552,321,603,365,612,354,637,373,643,385,687,350,694,361,712,337,729,350,758,337,771,451,772,472,800,373,807,324,822,361,862,321,873,327,897,463,908,340,916,302,920,324,921,327,932,358],
+    "extremadament": [164,525,381,427,462,447,478,536,623,498,912,333],
+    "extremidad": [618,680,663,478,671,527,684,521,718,504,762,630,771,426],
+    "extrofi": [797,805,799,593],
+    "exudad": [135,726],
+    "eyacul": [835,589],
+    "eyaculacion": [815,512,821,522,835,1000],
+    "eye": [206,644],
+    "ezamill": [451,644],
+    "faceclock": [203,481],
+    "facet": [516,624],
+    "facial": [526,400,663,436,699,354,715,369,717,419,719,428,736,366,752,372,841,396,940,441,941,428],
+    "facil": [221,443,225,582,396,466,621,452,632,502,700,618,723,496,890,427],
+    "facilidad": [708,451,722,540,760,471,769,467],
+    "facilit": [9,489,27,518,106,576,345,534],
+    "facilitar": [148,554,240,548,390,532],
+    "facilment": [851,553,926,569],
+    "factici": [933,806],
+    "factor": [524,217,531,220,533,217,534,233,564,342,566,246,573,241,587,260,601,226,615,243,616,238,621,222,626,220,631,329,633,229,635,231,636,325,637,241,638,252,640,254,641,236,642,263,650,224,658,236,678,231,679,252,681,229,684,249,685,226,686,224,690,217,692,220,693,246,694,233,696,220,702,236,703,243,704,236,705,220,711,217,712,217,715,193,729,226,751,231,759,224,797,226,800,241,801,241,804,211,806,220,813,209,814,233,815,211,816,209,817,206,834,206,835,211,836,241,838,236,851,215,852,198,885,224,893,215,895,220,896,193,898,309,900,213,901,204,902,226,903,202,904,178,905,213,906,188,908,220,909,187,910,215,911,209,913,195,916,282,919,293,920,209,921,211,922,195,923,270,925,211,926,309,928,303,929,150,930,206,932,231,943,224,946,207,947,226,949,215],
+    "fag": [119,709],
+    "fagu": [119,946],
+    "fairy": [500,886],
+    "falang": [380,657],
+    "fall": [606,788,780,840],
+    "falopi": [823,564,830,783],
+    "fals": [111,474,133,501,167,445,271,450,281,364,410,454,451,619,460,424,902,441,920,578],
+    "falsificacion": [933,563],
+    "falt": [54,219,263,323,521,333,532,298,535,276,549,304,555,535,556,279,568,353,575,394,602,333,603,319,604,310,605,316,607,313,609,307,610,326,611,323,613,341,615,330,622,304,629,326,630,323,696,298,721,298,733,389,735,330,760,276,834,279,871,304,897,286,899,273,900,289,902,307,903,273,915,295,917,480,921,286,923,249,927,349,929,204],
+    "fam": [27,624],
+    "famili": [924,504],
+    "familiar": [533,292,588,301,589,324,592,342,633,307,648,314,649,342,694,314,696,295,711,292,725,335,733,269,738,298,748,304,760,274,798,324,807,282,816,282,817,276,818,301,831,284,838,317,844,287,858,287,893,290,895,295,901,274,904,239,905,287,907,267,912,208,915,292,916,262,922,262,923,247,924,243,925,284,927,232,929,202,932,310,937,271,948,327],
+    "famos": [153,427,156,471,196,601,214,443,240,461,267,471,354,507,417,593],
+    "fantasi": [927,481],
+    "farigol": [2,650],
+    "faring": [527,686],
+    "faringiti": [527,852,706,543],
+    "farmac": [121,678,260,669,941,543],
+    "farmaceutic": [259,664],
+    "fashioned": [252,600],
+    "fatig": [197,299,233,218,508,203,522,263,523,257,530,263,531,235,535,218,539,247,542,252,552,222,557,263,559,275,566,355,570,282,571,249,573,257,603,252,606,235,608,255,609,242,611,255,612,244,613,269,614,255,615,260,621,237,630,255,632,263,635,247,637,257,642,282,646,222,678,247,679,269,684,266,686,239,687,242,689,260,693,263,695,266,696,235,700,230,703,260,711,233,712,233,713,275,721,235,723,260,724,272,738,237,739,212,741,208,749,266,751,340,753,263,757,224,759,239,780,257,781,275,784,275,787,288,793,285,795,266,804,226,807,224,813,224,872,230,873,226,876,237,879,278,894,260,895,235,896,207,917,235,932,247,944,239,945,269,946,222,947,242],
+    "faton": [385,578],
+    "fau": [119,709],
+    "faustrim": [343,1258],
+    "fav": [5,589],
+    "favorec": [347,569,350,508,351,545,354,576],
+    "favorecedor": [61,553],
+    "favorecen": [80,701,842,564],
+    "favorecer": [88,582,92,617,105,557,112,529],
+    "fay": [119,709],
+    "fbn1": [623,644],
+    "febrifug": [39,286,43,488,119,460,130,500,138,512,139,455,162,436,165,440,166,619,179,506,243,422,245,418,247,397,263,431],
+    "fecal": [586,954,809,553],
+    "feijo": [369,1137],
+    "felon": [53,801],
+    "femenin": [55,483,178,483,253,464,519,474,766,397,805,411,859,455],
+    "fenc": [491,717],
+    "fenestrari": [497,1179],
+    "fennel": [14,981,31,665,450,705,459,652],
+    "fenogrec": [32,724,452,947],
+    "fenoj": [14,543],
+    "fenol": [14,543],
+    "fenoll": [14,500,15,653],
+    "fenomen": [625,767,690,558],
+    "fenugrec": [452,563],
+    "fenugreek": [32,932,452,742],
+    "feo": [912,431],
+    "feocromocitom": [659,618,728,828],
+    "ferin": [549,868],
+    "fern": [319,734],
+    "fertil": [806,564,888,587],
+    "fertilidad": [204,874],
+    "fertilizad": [830,606],
+    "fertilizant": [319,734],
+    "ferul": [478,932],
+    "fet": [797,631],
+    "fetal": [736,443,770,476,797,523,892,428],
+    "fever": [39,672],
+    "fiabilidad": [922,543],
+    "fibr": [90,375,212,319,216,339,219,312,225,282,306,388,349,346,351,335,356,343,358,315,360,319,363,375,369,290,371,346,377,335,379,472,382,319,385,295,402,298,406,366,422,494,423,366,424,403,427,375,461,245,486,301,557,350,560,520,568,370,575,413,587,370,588,319,757,298,770,417,774,301],
+    "fibrilacion": [608,787,620,522,647,502],
+    "fibrom": [806,856],
+    "fibromialgi": [751,1092],
+    "fibromuscular": [794,650],
+    "fibroniebl": [751,644],
+    "fibros": [745,554,770,953,866,705],
+    "fibrosi": [531,643,538,474,540,621,571,488,627,442,733,419,941,469],
+    "ficu": [143,810,360,720,485,644,492,589],
+    "fiebr": [39,170,51,209,74,262,97,273,119,273,138,304,139,270,165,262,243,251,245,248,247,236,355,259,372,359,409,280,514,256,517,259,522,264,523,259,525,334,529,270,530,264,536,256,539,248,542,253,543,236,544,259,546,270,547,283,548,248,550,248,553,262,558,273,559,277,566,264,572,286,576,312,577,290,582,277,598,316,599,277,600,286,610,259,611,256,612,246,614,256,632,264,637,259,656,290,661,273,662,262,678,248,679,270,694,251,697,259,706,372,777,251,785,286,790,283,796,273,800,259,802,256,805,211,822,251,826,208,828,223,853,231,854,229,856,204,872,231,873,405,874,251,875,253,876,238,877,262,886,270,887,256,889,243,893,231,938,243],
+    "field": [64,720,82,513,87,780,215,678],
+    "fig": [143,780,360,861,369,454,485,802,492,757],
+    "figur": [904,496],
+    "fij": [319,676,920,762],
+    "fiji": [84,631],
+    "filagrin": [858,595],
+    "filamentos": [495,839],
+    "filarial": [877,919],
+    "filariasi": [877,846,881,653],
+    "filfil": [473,686],
+    "filiculoid": [319,968],
+    "filifer": [190,1007],
+    "filipendul": [51,924],
+    "filipin": [329,694],
+    "filtr": [537,548,792,653],
+    "filtrar": [780,618,783,668],
+    "filtren": [586,671],
+    "fimbriat": [506,976],
+    "fin": [10,472,15,496,93,474,292,479,307,519,380,459,709,424,716,441,863,397,870,428],
+    "final": [812,527,816,507,949,522],
+    "finalizacion": [930,573],
+    "finalment": [625,589],
+    "finger": [336,1137,350,564],
+    "finocchi": [14,786],
+    "fir": [134,1024],
+    "firm": [306,557,364,519,814,476,846,439,850,586,862,423,866,415,867,419],
+    "firmement": [902,631],
+    "fisi": [771,947],
+    "fisic": [213,359,233,330,508,307,520,378,521,398,650,363,721,356,751,374,757,481,774,342,813,339,840,382,900,345,912,250,917,356,922,315,926,359,929,244,931,427,932,515,933,327,934,339],
+    "fisiologic": [911,584],
+    "fisur": [585,939],
+    "fitoestrogenic": [55,644],
+    "fitorremediacion": [310,676,319,676],
+    "fiunch": [14,543],
+    "fiv": [350,564,509,816],
+    "flacid": [851,600],
+    "flag": [209,868],
+    "flammulin": [275,833],
+    "flander": [82,618],
+    "flannel": [515,862],
+    "flashback": [899,563],
+    "flat": [7,662,396,764,471,710],
+    "flavonoid": [199,433,462,533],
+    "flavor": [509,886],
+    "flax": [176,1024],
+    "flaxseed": [427,968],
+    "flej": [112,637],
+    "flem": [235,590,523,583,524,527],
+    "flexibilidad": [759,543,772,527,773,577],
+    "flexibl": [623,593,769,518],
+    "flexion": [766,910],
+    "flexionar": [765,558],
+    "flor": [1,305,2,267,11,249,22,316,23,302,29,231,35,251,43,309,44,377,45,267,46,291,48,282,49,270,50,440,52,200,53,229,55,264,60,344,66,276,70,421,75,433,108,327,122,244,127,313,139,288,148,361,160,367,161,363,163,270,171,367,183,320,185,313,190,414,215,235,220,235,237,359,238,416,239,443,240,359,241,364,242,288,243,267,245,416,246,282,247,352,249,395,250,295,251,302,252,247,253,254,256,352,259,273,262,441,263,273,310,398,311,291,314,291,317,448,350,251,400,302,415,305,471,335,474,298,488,315,504,380,514,372,810,259],
+    "floracion": [166,661,168,632],
+    "floral": [20,623,224,522,466,631],
+    "florenc": [14,786],
+    "florenci": [14,543],
+    "florid": [27,377,28,409,37,345,51,328,52,294,53,336,54,271,57,377,58,330,65,396,160,392,174,418,175,384,248,433,254,409,255,428,257,414,263,400,469,339],
+    "florist": [245,886],
+    "floron": [51,543],
+    "flotant": [309,617,310,609,316,589,319,609],
+    "flower": [31,850,70,545,459,767,504,768],
+    "flowering": [13,874],
+    "fluctuacion": [653,599,813,538],
+    "fluctuant": [943,624],
+    "fluj": [218,377,524,366,599,433,605,538,618,400,622,377,625,355,647,349,663,531,677,362,804,355,805,330,808,352,810,380,811,362,817,345,820,359,825,373,952,428],
+    "fluviatil": [315,932],
+    "fluy": [563,612,796,653],
+    "fobi": [901,747,909,914],
+    "fobic": [909,762],
+    "focal": [661,709],
+    "fodder": [456,443],
+    "foeniculum": [14,724,445,943],
+    "foenum": [32,724,452,742],
+    "foetid": [478,932],
+    "foik": [129,595],
+    "foiy": [129,595],
+    "foiyel": [129,595],
+    "fol": [106,694],
+    "folat": [630,664],
+    "folicul": [698,431,837,590,847,423,855,826,856,564,857,476,866,415,886,513],
+    "folicular": [886,939],
+    "foliculiti": [855,937],
+    "foll": [129,595],
+    "folliculorum": [841,578],
+    "fom": [281,762],
+    "fomentariu": [281,762],
+    "fomitopsi": [271,886],
+    "fonol": [14,543],
+    "fontan": [883,624],
+    "foot": [32,683,275,512,452,700],
+    "form": [232,298,244,315,260,353,303,333,316,325,350,281,385,265,396,292,421,372,487,275,493,318,495,273,499,302,502,325,538,289,571,298,577,345,579,289,587,333,596,333,614,305,635,295,637,308,651,275,667,308,674,302,677,275,678,295,704,302,706,382,710,270,757,268,758,278,765,256,770,263,791,380,807,268,818,286,842,281,856,243,865,284,867,375,889,289,902,289,910,387,911,380,915,278,917,281,924,231],
+    "formacion": [257,530,603,508,619,483,736,413,763,460,866,439],
+    "formador": [461,481],
+    "forman": [575,626,632,530,778,508,826,416,849,439,883,483],
+    "formand": [219,612],
+    "formar": [428,668,651,553],
+    "formars": [578,657],
+    "formen": [708,543],
+    "forsiti": [168,1047],
+    "forsythi": [168,1121],
+    "fortalec": [306,661,351,571,513,577],
+    "fortalecedor": [62,886],
+    "fortalecen": [275,589],
+    "fortalecer": [195,515,200,463,208,425,227,453,264,453,266,429,273,458,358,408,367,443,393,396,404,389,411,508,517,443],
+    "foruncul": [856,771],
+    "forzad": [954,657],
+    "fos": [526,507,940,559,952,616],
+    "fosfor": [366,734],
+    "fotofobi": [707,606],
+    "fotosensibilizant": [870,612],
+    "fototerapi": [708,543],
+    "foxberry": [153,538,425,581],
+    "foxglov": [80,861,228,798,260,868],
+    "foy": [129,839],
+    "fractur": [722,488,723,510,738,464,743,499,762,630,770,430,771,711],
+    "fracturars": [722,650],
+    "fragant": [237,581,514,612],
+    "fragari": [391,899],
+    "fragil": [716,548,722,565,769,489],
+    "fragin": [112,637],
+    "fragran": [468,913,474,885],
+    "frambues": [378,509,390,853,422,587,423,762,424,631],
+    "fran": [393,553,404,543],
+    "franc": [3,480,25,567,101,458,327,531,472,427],
+    "frangul": [179,780],
+    "fras": [665,679],
+    "fraughan": [73,543],
+    "fraxinu": [112,880],
+    "frecuenci": [533,381,556,360,569,473,609,397,610,422,646,364,710,370,739,348,763,374,781,451,806,385,807,367,816,367,817,360,854,374,881,446],
+    "frecuent": [524,348,525,358,540,335,632,394,712,348,743,381,748,362,769,323,775,358,778,377,782,385,785,427,786,385,788,390,789,427,796,407,805,315,810,362,823,351,869,287,890,335,903,323,940,370],
+    "freeston": [384,595],
+    "frenar": [252,600],
+    "french": [12,635,25,822,291,554],
+    "frent": [526,507,717,532,859,527],
+    "fres": [361,653,391,943],
+    "fresc": [95,564,188,537,360,446,365,518,385,413,387,421,402,417,406,512,488,548],
+    "fresn": [112,1209],
+    "fresnal": [118,525],
+    "freson": [391,657],
+    "fri": [508,356,603,442,604,428,618,446,624,424,625,649,628,419,630,446,686,419,690,407,713,482,923,344],
+    "friccion": [855,738,856,488],
+    "friedreich": [654,946],
+    "frieg": [48,686],
+    "friendship": [501,880],
+    "frondos": [266,892],
+    "frotarl": [851,600],
+    "fructifer": [264,373,265,373,266,354,267,350,268,327,270,365,271,350,272,304,274,336,275,321,276,340,278,382,279,336,280,369,281,283,282,369,283,382,284,358,285,382,286,312,287,333,288,373,289,350,290,306,291,347,292,373,293,395,294,373],
+    "fruit": [331,866,351,718,358,494,398,484,486,665],
+    "fruiting": [388,664],
+    "frustracion": [835,589],
+    "frut": [14,147,16,186,73,213,85,152,98,201,103,194,114,178,120,182,122,161,126,235,136,186,137,194,141,271,142,199,143,201,144,256,145,209,146,184,147,190,148,173,149,256,151,163,153,224,154,242,155,186,163,178,164,249,165,184,166,194,167,238,168,251,170,253,172,234,178,174,179,211,185,206,193,269,194,271,196,282,316,256,320,260,321,256,322,269,323,260,324,244,325,258,326,249,327,245,328,264,329,253,330,269,331,262,332,275,333,275,334,277,335,260,336,240,337,271,338,271,339,245,340,277,341,277,342,277,343,277,344,249,345,275,346,249,347,251,348,251,349,282,350,290,351,278,352,249,353,245,354,253,355,182,356,182,357,262,358,234,359,178,360,235,361,256,362,220,363,262,364,256,365,260,366,262,367,247,369,154,370,260,372,253,373,199,374,190,375,182,376,199,377,244,378,173,379,251,380,313,381,150,382,235,383,253,384,227,385,157,386,142,387,160,388,180,389,150,390,232,391,244,392,296,393,229,394,262,395,186,396,173,397,267,398,230,399,258,400,262,401,275,402,224,403,242,404,226,405,204,406,258,407,271,408,166,409,260,410,176,411,209,412,220,414,211,416,271,417,220,420,277,421,220,422,199,423,194,424,214,425,171,426,220,433,204,434,206,435,269,436,209,437,186,438,192,439,192,441,199,453,192,467,194,470,119,472,145,473,186,476,180,477,209,479,163,481,173,483,171,484,168,485,145,486,285,492,128,513,245,520,176,590,178],
+    "frutescen": [59,771],
+    "fruticosu": [392,816,424,935],
+    "frutill": [391,899],
+    "frutipan": [379,1047],
+    "fuciformi": [272,801],
+    "fucoxantin": [298,770],
+    "fucu": [301,1216],
+    "fueg": [281,521],
+    "fuent": [107,382,145,396,167,328,187,401,223,303,225,284,231,450,262,318,288,353,297,401,300,401,304,387,346,349,352,349,353,342,354,357,356,345,363,378,371,349,377,338,378,328,379,476,380,338,381,284,387,303,429,338,431,401,437,353,439,365,456,228,463,272,472,275,513,342,939,447],
+    "fuer": [644,460,720,446,797,624,803,501,804,595,830,433,906,375,907,395,924,360],
+    "fuert": [3,411,194,528,211,419,478,475,532,419,624,432,699,354,779,450,810,432,939,428,956,436],
+    "fuerz": [515,794,952,653],
+    "fug": [552,533,779,605],
+    "fulful": [473,686],
+    "fulgurant": [699,516],
+    "fuman": [533,606],
+    "fumar": [810,548,833,517,857,565],
+    "fun": [129,595],
+    "funcion": [203,267,205,350,218,347,235,377,256,340,268,334,369,315,434,423,437,381,508,294,511,358,512,482,516,347,629,373,641,365,650,347,653,361,781,399,794,361,862,321,897,327,898,343,900,330,903,313,916,302,924,280],
+    "funcional": [878,595,916,451,919,476,931,610],
+    "funcionamient": [629,504,819,423,903,423,913,408,918,426,920,438,921,442],
+    "funcionan": [611,664],
+    "fundamental": [205,504,228,542,231,504,253,494,373,587],
+    "fungic": [612,529,855,463,864,463,874,540],
+    "fungu": [267,665,268,634,269,447,272,704,281,745,285,527,286,430],
+    "furiegan": [3,600],
+    "fusiform": [306,991],
+    "fusionen": [703,679],
+    "fxn": [654,709],
+    "gabancer": [85,563],
+    "gafeti": [37,573],
+    "galactagog": [14,420,32,420,227,530,254,525,451,498,452,435],
+    "galactorre": [720,575,731,783],
+    "galan": [45,650],
+    "galang": [38,1149],
+    "galangal": [38,1149],
+    "galbul": [114,605,155,632],
+    "gall": [549,624],
+    "gallic": [236,919],
+    "gallin": [266,599,847,881],
+    "gallocrest": [10,443],
+    "gam": [194,669,459,472,923,445],
+    "gambo": [388,664],
+    "gamonit": [490,578],
+    "gan": [693,686],
+    "gangli": [527,479,539,450,550,450,627,412,828,404,872,682,873,582,874,766,876,788,887,464],
+    "ganoderm": [264,804,282,798,293,835],
+    "gaoliangjiang": [38,534],
+    "garden": [2,538,5,502,7,459,10,407,25,571,26,496,30,506,45,392,56,603,57,523,218,377,229,373,241,388,245,388,253,520,391,396,393,362,402,352,404,355],
+    "gargant": [37,428,48,359,87,367,118,275,135,380,303,380,360,327,405,394,514,474,522,359,525,327,527,613,528,474,532,321,541,481,544,352,545,394,546,367,550,531,580,485,590,344,706,309,725,363,739,290,740,385,827,297,828,303,840,344,851,315,873,436,889,458,954,471],
+    "garlic": [62,886],
+    "garrapat": [656,752],
+    "garrob": [136,686],
+    "garrofer": [136,686],
+    "gas": [8,349,14,328,15,428,16,414,35,369,58,330,105,405,445,482,448,369,449,396,450,366,472,322,478,418,480,400,565,531,573,405,574,453,581,388,586,405],
+    "gast": [636,664],
+    "gasteri": [499,1101],
+    "gastrectomi": [597,709],
+    "gastric": [552,502,589,792,597,616],
+    "gastriti": [561,976],
+    "gastroenteriti": [582,878,887,612],
+    "gastroesofagic": [528,531,563,723,590,525,593,623,954,525],
+    "gastrointestinal": [60,475,98,594,801,536,884,713,932,514],
+    "gastronomi": [485,492,492,436],
+    "gastronomic": [291,637],
+    "gastroparesi": [595,976],
+    "gat": [28,542,56,616,195,805,487,480,494,475],
+    "gater": [56,529],
+    "gatill": [766,710,774,767],
+    "gayub": [152,946],
+    "gean": [386,767],
+    "geben": [469,563],
+    "gehrig": [650,868],
+    "gel": [61,459,303,602,428,602,490,682],
+    "gelatinos": [272,485,279,537,302,835],
+    "gelidium": [302,961],
+    "gelsemi": [258,637],
+    "gelsemium": [258,1087],
+    "gen": [283,412,540,343,623,378,652,403,654,417,659,395,664,422,667,395,669,382,676,378,677,353,703,399,738,363,739,325,759,367,769,331,791,343,833,350,858,350,882,399,888,375],
+    "gencian": [210,1141],
+    "gener": [125,780],
+    "general": [129,400,486,396,515,415,520,437,553,456,660,466,694,437,822,437,853,403,856,356,875,442,887,446],
+    "generalizad": [751,735,784,595,895,710,922,451],
+    "generalment": [362,287,367,340,522,347,534,329,570,371,619,316,622,316,628,316,633,322,634,326,638,355,644,326,662,343,717,310,719,316,760,287,776,351,777,329,812,307,819,285,828,293,843,301,849,287,853,304,855,282,860,433,861,268,865,313,867,290,873,298,875,332,885,316,889,319,934,295,944,316,951,363],
+    "genetic": [524,182,531,183,534,195,540,175,564,215,566,205,573,201,587,217,601,189,615,203,616,199,621,185,623,193,627,176,631,203,633,191,635,193,636,199,637,201,638,210,639,217,640,212,641,197,642,220,650,187,652,205,654,212,657,199,658,197,659,201,664,286,667,201,672,205,674,197,676,265,677,180,678,193,679,210,680,183,681,191,682,187,683,183,684,208,685,189,686,187,689,203,690,182,692,183,693,205,694,195,695,208,698,176,702,197,703,203,704,197,707,182,711,182,712,182,715,161,718,310,725,208,728,197,729,189,733,167,734,240,736,160,737,267,741,235,748,262,750,197,751,193,754,157,759,187,770,172,773,199,791,248,795,208,797,189,798,201,799,193,800,201,801,201,804,176,806,183,807,175,813,175,816,175,817,172,838,197,841,173,847,173,851,180,852,166,857,195,858,178,860,256,865,185,866,170,870,183,871,187,872,180,878,215,885,187,892,155,893,180,895,183,896,161,897,176,898,185,900,178,901,170,902,189,903,169,904,149,905,178,906,157,908,183,909,156,910,180,911,175,913,163,916,163,918,170,919,172,920,175,921,176,922,163,923,153,924,151,925,176,926,185,927,144,928,180,929,126,930,172,932,193,943,187,946,173],
+    "geni": [918,568],
+    "genital": [702,459,705,428,709,424,737,454,815,412,826,704,827,567,828,404,829,400,834,571],
+    "geniv": [469,563],
+    "gentian": [210,1141],
+    "gerani": [252,1116],
+    "geranium": [252,1116],
+    "german": [2,741,12,607,60,696,219,508],
+    "gest": [924,504],
+    "gestacion": [832,475,878,661],
+    "ggui": [60,595],
+    "ghaap": [505,770],
+    "ghost": [26,822],
+    "gigante": [504,925],
+    "gigantism": [717,788,719,799],
+    "gil": [218,624],
+    "gill": [278,939],
+    "gillyflower": [244,686],
+    "giloy": [517,671],
+    "ginebr": [155,925],
+    "ginecologi": [253,618],
+    "ginecologic": [229,569,805,505],
+    "ginecomasti": [730,772,736,492],
+    "ginger": [17,494,18,879,38,924,54,567],
+    "ginkg": [68,1226],
+    "ginseng": [77,986,204,675,205,675,227,715,233,799,518,912],
+    "girad": [797,631],
+    "giran": [942,686],
+    "girar": [756,568],
+    "girasol": [220,498,243,885,431,969],
+    "giratori": [645,661,942,632],
+    "girgol": [276,575,286,528],
+    "girofl": [20,717],
+    "gitan": [14,543],
+    "givert": [7,521],
+    "glabr": [201,912],
+    "glandul": [664,376,686,455,687,330,689,355,713,376,714,352,716,458,717,448,719,327,720,455,723,546,724,372,725,363,728,471,729,330,731,318,732,327,733,292,737,341,738,324,739,290,740,385,741,285,752,285,815,309,816,434,817,300,837,295,848,312,891,355,950,485,951,561],
+    "glandular": [873,833],
+    "glasswort": [308,709],
+    "glaucom": [937,942],
+    "glob": [946,533,947,581],
+    "globill": [203,481],
+    "globul": [630,700,632,530,676,498,696,473,872,464,894,710],
+    "globulu": [63,880],
+    "glomerat": [99,1007],
+    "glomerul": [784,623,792,616,793,646],
+    "glomerulonefriti": [792,946],
+    "glucagon": [727,618],
+    "glucagonom": [727,862],
+    "glucemic": [220,528,362,523],
+    "glucos": [414,780],
+    "glutamat": [304,752],
+    "glute": [761,484,764,463,826,447,847,480],
+    "gluten": [231,581,573,1023],
+    "glutinos": [174,859,228,846],
+    "glycyrrhiz": [201,912],
+    "gnidium": [176,899],
+    "gnrh": [734,558],
+    "goat": [32,724,452,742],
+    "goathead": [520,892],
+    "gob": [104,529],
+    "gobernador": [186,1024],
+    "god": [274,618],
+    "goeth": [488,525],
+    "goiab": [369,568],
+    "goiabeir": [369,811],
+    "goji": [411,999],
+    "golden": [10,483,17,425,29,576,168,661,275,421,288,490,329,495,508,551,514,474],
+    "goldenseal": [206,886],
+    "goldmos": [494,971],
+    "golp": [242,646,771,523],
+    "gom": [135,961],
+    "gonad": [732,624],
+    "gonadotropin": [734,558],
+    "gongylod": [219,856],
+    "gonorre": [805,476,821,522,825,749],
+    "gonorrhoea": [825,618],
+    "gooranut": [465,612],
+    "gooseberry": [103,762,205,504,358,688,402,836,513,723],
+    "gordald": [52,727],
+    "gordolob": [48,852,173,618],
+    "gordonii": [505,999],
+    "gorr": [465,612],
+    "gorri": [281,521],
+    "got": [230,536,386,406,444,603,742,508,747,508,758,657],
+    "gote": [541,474,545,525,546,490,779,459,786,469,803,490,815,412,816,408,941,436,952,496],
+    "gotit": [530,490,541,485,542,469,543,437,544,479,545,537,546,501,549,446,550,460],
+    "gotos": [758,850],
+    "gotu": [102,988,512,799],
+    "gourmet": [232,650],
+    "grac": [57,754,511,770,516,754],
+    "graci": [175,529,239,518,242,582,371,563],
+    "grad": [131,959,715,496],
+    "gradual": [651,464,668,460,746,464,781,555,937,435,944,483],
+    "gradualment": [821,600],
+    "graecum": [32,724,452,742],
+    "gramonic": [51,543],
+    "gran": [74,427,82,389,258,401,354,436,358,389,447,405,463,629,491,451,717,385,735,427,837,354,841,364,855,351,863,357,914,309,932,405],
+    "grana": [455,568],
+    "granad": [141,1020,359,957,455,987],
+    "granadill": [70,657],
+    "granatum": [141,868,359,781,455,705],
+    "grand": [160,397,189,465,217,402,364,433,377,402,424,483,504,419,538,385,553,415,585,429,631,415,708,332,718,410,719,530,729,385,861,471,892,316,950,419],
+    "grandez": [920,584],
+    "grandiflor": [127,991],
+    "grandiflorum": [368,946],
+    "grandiosidad": [927,481],
+    "granulom": [539,593,867,752],
+    "granulos": [843,595],
+    "grap": [169,781,389,1009,454,1020],
+    "grapefruit": [322,991],
+    "grapevin": [389,509,454,710],
+    "gras": [39,572,106,357,252,309,261,361,298,396,399,369,427,378,429,338,433,387,434,392,438,365,441,378,453,365,457,303,495,306,562,349,571,335,581,331,587,374,588,321,591,345,602,476,633,453,636,466,715,277,716,325,721,315,754,270,837,415,852,284,864,287,865,318,882,349,950,353],
+    "grasos": [540,584],
+    "grav": [532,327,538,337,540,312,543,327,550,344,551,344,552,587,556,306,565,340,667,358,674,480,681,340,683,327,685,466,714,358,717,327,737,476,740,392,752,419,758,324,793,397,844,317,853,320,899,300,900,317,904,265,917,327,918,303,933,300,934,312],
+    "graveolen": [8,617,57,651,83,721,217,675,252,634,444,756,451,665],
+    "gravi": [688,834,752,851],
+    "great": [36,666,48,804,210,764],
+    "greater": [36,666,38,674,104,670],
+    "grecian": [9,833],
+    "greek": [32,973,56,670,452,985],
+    "green": [21,791,54,567,447,735,470,365],
+    "gri": [290,518,550,593],
+    "grieg": [32,543],
+    "grif": [429,657],
+    "grifol": [266,892],
+    "grip": [161,509,202,445,522,470,523,460,527,470,542,615,544,460,582,653,613,480,815,403,826,369],
+    "gripal": [75,548,258,587],
+    "gris": [290,563],
+    "grisace": [810,631],
+    "gritar": [528,664],
+    "grog": [286,573],
+    "grosell": [393,810,402,868,403,741,404,802],
+    "groseller": [103,828,154,788,393,653,403,503,404,455,417,626],
+    "grosulari": [404,589],
+    "ground": [155,632,206,593],
+    "grues": [499,525,550,514,565,509,588,499,858,475],
+    "grumos": [568,668,811,553],
+    "grup": [83,450,544,416,546,435,587,450,657,412,658,407,672,425,690,376,708,337,721,379,737,403,748,391,749,430,750,407,769,349,827,352,889,391],
+    "guac": [99,1221],
+    "guajav": [142,892,348,852],
+    "guanaban": [357,1083],
+    "guaran": [197,928,464,1200],
+    "guarani": [348,632,349,625],
+    "guaranin": [464,624],
+    "guardar": [913,543],
+    "guardarl": [913,543],
+    "guatemal": [463,529],
+    "guav": [142,892,369,951],
+    "guavasteen": [369,568],
+    "guayab": [142,1138,348,910,369,823],
+    "guayabit": [476,664],
+    "guayul": [187,1007],
+    "guduchi": [517,1111],
+    "guelder": [177,631],
+    "guerr": [934,584],
+    "guez": [60,595],
+    "guillain": [699,757],
+    "guillerm": [37,573],
+    "guin": [218,624],
+    "guine": [238,644],
+    "guisador": [17,772,475,810],
+    "guisant": [857,650],
+    "gum": [63,991,135,835,159,895],
+    "gunbu": [267,644],
+    "gusan": [819,518,877,846],
+    "gust": [526,538,953,646],
+    "haa": [199,706],
+    "hab": [199,433,482,1001],
+    "haber": [847,502,890,507,899,489],
+    "habilidad": [669,650],
+    "habit": [576,647,587,580,588,499,646,462,911,466],
+    "habitual": [83,631,569,653,933,489],
+    "habl": [654,519,665,496,736,391,897,431,902,461,908,626,921,431,931,538],
+    "hablad": [665,625,668,548],
+    "hablar": [548,411,602,438,620,383,647,369,650,399,652,438,658,420,663,407,671,448,688,424,699,330,750,420,752,347,908,630,931,317],
+    "habon": [710,543,840,943],
+    "hac": [76,387,82,395,166,458,191,474,255,453,259,424,263,424,350,391,374,448,481,407,793,474,795,443,838,420,869,319,912,275],
+    "hacen": [81,761],
+    "hacer": [84,451,256,437,304,537,401,564,416,550,703,485,846,429,906,375,929,463],
+    "haciendol": [722,650],
+    "hacinamient": [849,568],
+    "hahuacollay": [496,664],
+    "hairy": [4,781],
+    "hal": [380,943,937,518],
+    "haldi": [17,548,475,587],
+    "halitosi": [526,584],
+    "halofit": [308,709],
+    "hamameli": [150,1078],
+    "hambr": [635,559,712,527,726,596],
+    "hamburg": [7,762],
+    "han": [74,485,144,507,243,465,244,490,372,495,451,460,457,421,916,388,920,591],
+    "hand": [327,664],
+    "hang": [38,534],
+    "happy": [104,771],
+    "hari": [447,644],
+    "harin": [136,686],
+    "hashimot": [686,720,713,595,740,609,741,451],
+    "hat": [505,999],
+    "hawaii": [84,631],
+    "haworthi": [500,1092],
+    "hawthorn": [122,1186],
+    "hay": [32,652,119,884,452,669,919,476],
+    "hayseed": [32,724,452,742],
+    "hazel": [123,920,150,1079],
+    "hazelnut": [399,954],
+    "head": [266,775,268,522,520,565],
+    "headed": [226,686],
+    "heal": [56,771],
+    "heart": [24,635,515,537,517,792],
+    "heartseas": [248,954],
+    "heather": [160,1019],
+    "hec": [461,329,540,400,566,470,568,497,569,673,585,643,586,624,588,428,631,465,700,411,754,525],
+    "hech": [65,605,69,684],
+    "hedgehog": [202,822,268,777],
+    "hee": [41,563],
+    "heeng": [478,694],
+    "hei": [279,618],
+    "helb": [32,543],
+    "helech": [92,1004,319,892],
+    "helianthu": [220,710,243,775,431,875],
+    "helicobacter": [561,646,562,590,589,583],
+    "heliotrop": [56,771],
+    "hemangioblastom": [659,671],
+    "hematom": [700,522,757,507,762,517],
+    "hematuri": [789,684,881,653],
+    "hembr": [0,543,1,684],
+    "hemicrane": [638,939],
+    "hemofagocitic": [893,1059],
+    "hemofili": [631,919],
+    "hemolitic": [800,912],
+    "hemoptisi": [533,558,554,878],
+    "hemorragi": [52,341,86,485,188,525,252,420,255,496,408,428,601,441,832,361,940,450,952,661],
+    "hemorragic": [620,522,631,590,647,502],
+    "hemorroid": [111,542,114,525,157,548,460,484,567,734],
+    "hemostatic": [252,522,255,616,281,662],
+    "hemp": [429,899],
+    "hen": [32,451,266,741,487,701,525,720],
+    "hepatic": [181,633,203,307,218,399,355,429,365,463,419,486,571,734,591,429,695,443,730,380,743,424,862,369,869,472,880,448,890,373],
+    "hepatiti": [570,774,571,465,591,479,695,666,697,479,709,433,792,507,802,647,867,409],
+    "hepatocelular": [591,912],
+    "hepatoesplenomegali": [674,657],
+    "hepatomegali": [893,600],
+    "hepatoprotector": [17,386,103,465,106,450,201,436,203,312,213,401,229,401,230,450,264,445,277,455,411,500,418,494,419,494,475,413],
+    "heraldic": [861,529],
+    "herb": [5,403,12,597,17,407,41,552,53,548,55,441,56,362,57,594,254,465,511,607,516,594],
+    "herbaceou": [12,731],
+    "herbon": [470,440],
+    "heredad": [927,481],
+    "hereditari": [540,409,601,311,615,335,623,437,626,302,631,454,652,457,654,467,657,447,659,450,667,331,669,321,674,324,677,417,681,315,705,302,715,266,734,275,737,441,738,305,739,393,748,431,754,259,769,398,770,283,791,288,804,291,807,288,817,283,835,291,848,294,858,294,882,335,901,280,929,207,930,283,945,346,946,285,947,311],
+    "herenci": [748,548,769,489,858,517],
+    "hericium": [268,844],
+    "herid": [72,443,81,486,131,433,163,420,173,429,188,480,246,438,255,453,285,448,314,453,487,383,494,380,500,411,512,399,862,369],
+    "hermos": [310,734],
+    "hermostatic": [150,624],
+    "herni": [563,513,583,726,651,653,675,530,761,451,764,431],
+    "herp": [643,576,656,624,826,888,876,513],
+    "herpesviru": [861,529],
+    "hervirs": [303,726],
+    "heterophyllu": [377,899],
+    "hiat": [563,612,583,865],
+    "hibisc": [238,886],
+    "hibiscu": [238,886],
+    "hibrid": [229,513,422,609,423,595,424,656],
+    "hidradeniti": [857,892],
+    "hidrasti": [206,644],
+    "hidratacion": [279,537,384,517,428,631],
+    "hidratant": [61,353,191,474,222,424,272,356,279,395,356,582,368,453,384,380,395,438,396,407,405,480,428,463,490,369,497,448,498,570],
+    "hidratar": [272,514,497,646],
+    "hidrocel": [820,772,877,625],
+    "hidronefrosi": [785,976],
+    "hidropesi": [943,868],
+    "hidroxilas": [737,650],
+    "hiel": [263,664],
+    "hierb": [0,470,3,292,5,286,6,304,10,328,11,295,14,264,25,345,26,465,29,273,34,276,35,416,36,373,37,504,39,396,41,392,47,341,51,264,52,237,53,271,54,332,56,257,58,266,59,375,65,498,82,301,97,518,168,333,188,478,205,425,207,313,208,313,226,333,254,330,461,234,469,273,487,410,488,373,515,301,516,304,519,307],
+    "hierbabuen": [4,468,5,724,313,623],
+    "hierbaluis": [47,939],
+    "hierr": [300,557,307,531,353,474,366,524,426,579,456,317,587,518,630,474,871,446],
+    "hierv": [96,770],
+    "hig": [143,810,360,828,485,443,492,842],
+    "higad": [106,458,213,408,229,408,245,425,411,508,509,425,570,715,571,589,579,416,591,733,674,434,695,615,831,389],
+    "high": [49,657],
+    "higien": [61,480,192,661,856,460],
+    "higienic": [585,701],
+    "higrom": [747,828,885,799],
+    "higuer": [89,542,143,924,360,499,485,427,492,567],
+    "higuerill": [89,679],
+    "hij": [828,578],
+    "hijiki": [306,1168],
+    "hilb": [32,500,452,518],
+    "himalayan": [267,644],
+    "himematsutak": [274,618],
+    "hinch": [648,650],
+    "hinchad": [567,474,626,428,682,436,692,428,704,459,785,682,821,420,853,420,856,370,889,441],
+    "hinchazon": [14,216,445,318,449,261,478,276,535,226,562,270,565,350,567,270,571,259,573,267,574,299,575,322,581,352,595,295,596,289,600,295,606,243,611,264,613,279,615,270,619,248,626,243,627,234,631,270,637,267,679,279,689,270,702,261,704,261,705,340,710,234,730,236,740,292,742,261,745,253,747,261,754,209,757,232,758,338,762,236,765,222,767,212,768,212,771,226,773,264,780,267,781,285,783,289,784,285,785,295,792,282,793,295,794,259,801,267,802,264,807,232,811,239,813,232,815,234,818,248,820,386,822,259,825,246,831,234,840,261,877,270,878,285,884,259,885,248,886,279,892,205,950,273,951,285],
+    "hindberry": [390,612],
+    "hindi": [17,517,110,554,355,583],
+    "hing": [478,694],
+    "hinoj": [14,958,445,937,450,503,451,534],
+    "hip": [536,664],
+    "hiperactiv": [714,954,901,523],
+    "hiperactividad": [723,563,741,451,848,494,903,854],
+    "hiperandrogenic": [715,781],
+    "hipercolesterolemi": [633,1008],
+    "hipercortisolism": [716,874],
+    "hiperglucemi": [711,558,727,569],
+    "hiperhidrosi": [848,1055],
+    "hiperic": [65,1024],
+    "hiperlaxitud": [769,806],
+    "hipermetropi": [947,805,948,625],
+    "hiperparatiroidism": [723,846,738,569],
+    "hiperpigmentacion": [687,631],
+    "hiperplasi": [737,741,816,687,876,715,886,939],
+    "hipersensibilidad": [682,799,928,777],
+    "hipersomni": [896,538],
+    "hipertension": [535,556,601,598,606,419,608,455,615,465,616,455,617,445,618,455,620,411,670,450,952,486],
+    "hipertensor": [171,650],
+    "hipertiroidism": [608,513,610,519,685,488,713,555,714,705,741,420],
+    "hipertrigliceridemi": [634,886],
+    "hiperuricemi": [758,850],
+    "hipervigilanci": [899,563],
+    "hipnotic": [55,534,56,439,91,557,240,523],
+    "hipoactiv": [713,954],
+    "hipoalbuminemi": [784,717],
+    "hipoalergenic": [187,718,225,509],
+    "hipocolesterolemiant": [90,551,382,469,427,551,433,565,438,533,441,551,461,361],
+    "hipocondri": [932,886],
+    "hipofisari": [720,868],
+    "hipofisi": [732,624],
+    "hipoglucemiant": [19,456,32,342,41,354,63,401,72,436,109,451,120,422,147,441,251,462,266,409,280,427,419,479,452,354,477,484,485,336,492,298],
+    "hipogonadism": [730,548,734,738],
+    "hipogonadotropic": [734,801],
+    "hipolipemiant": [103,623,485,464,492,411],
+    "hipomaniac": [916,543],
+    "hipoparatiroidism": [724,946],
+    "hiposmi": [734,558],
+    "hipospadi": [798,912],
+    "hipotalam": [729,581,732,575],
+    "hipotension": [101,573],
+    "hipotensor": [41,393,77,464,101,400,109,501,122,416,177,441,238,450,357,513,400,513,415,519],
+    "hipotiroidism": [609,548,713,828,731,527],
+    "hipoxemi": [556,573],
+    "hipoxi": [556,817],
+    "hippel": [659,912],
+    "hippocastanum": [111,846,460,783],
+    "hippopha": [167,810,410,822],
+    "hiratak": [276,624],
+    "hirsutism": [715,538],
+    "hisop": [28,905,58,476,955,537],
+    "hisopill": [27,754,28,798,58,476],
+    "hispanic": [428,961],
+    "histerectomi": [812,606],
+    "histiocitom": [866,811],
+    "historial": [831,512,904,431,932,559],
+    "historicament": [281,521],
+    "histrionic": [926,862],
+    "hla": [703,625,759,575],
+    "hmpv": [547,734],
+    "hoelen": [273,694],
+    "hogar": [907,509,918,523],
+    "hoj": [0,172,1,217,2,190,3,175,4,157,5,172,6,182,7,152,8,169,9,172,10,129,11,177,12,144,13,255,24,213,25,207,27,182,29,164,30,174,34,166,35,179,36,153,39,128,41,164,43,219,45,190,47,205,49,192,52,142,53,163,54,131,57,253,58,160,59,155,61,161,63,186,66,196,67,202,68,266,69,217,70,192,72,202,73,159,74,198,78,198,79,266,80,222,83,212,86,202,88,274,91,196,95,296,99,228,101,238,102,180,104,155,106,202,108,161,109,278,110,186,112,257,113,170,115,192,119,207,120,266,121,228,122,174,123,292,128,222,139,205,142,283,146,268,147,274,148,186,149,276,150,182,152,276,154,260,157,200,158,207,159,194,162,196,163,262,166,209,173,266,176,192,179,228,180,184,183,228,184,219,186,233,189,341,192,222,194,225,198,289,239,182,241,259,246,200,250,209,252,175,259,194,260,225,298,225,299,222,305,228,307,285,310,214,312,212,313,209,344,198,345,188,347,200,348,270,349,198,350,179,355,196,357,214,372,202,375,266,380,192,384,245,389,161,390,312,391,192,392,259,394,316,400,214,403,190,413,285,415,217,417,237,487,175,488,309,490,240,493,272,494,245,495,174,497,274,498,190,499,262,500,259,501,186,502,276,510,188,512,182],
+    "holly": [74,798,157,596,169,571],
+    "holm": [125,1007],
+    "holy": [26,714,254,590,510,770],
+    "hombr": [55,393,578,402,579,385,676,393,691,374,720,382,722,397,730,594,736,326,746,597,763,363,779,402,817,350,824,378,825,527,830,371,835,360,869,305],
+    "homeopati": [258,637],
+    "homeopatic": [258,637],
+    "hond": [614,664],
+    "honey": [24,673,41,742],
+    "honeybell": [330,761],
+    "honeydew": [457,833],
+    "honeysuckl": [514,1030],
+    "hong": [250,390,264,373,265,373,267,350,268,327,269,324,270,365,272,591,274,469,276,543,278,382,280,369,281,600,282,369,285,576,286,312,287,333,288,373,289,350,292,504,293,395,294,373,523,365,558,580,811,459,842,612,852,301,864,304],
+    "hoodi": [505,1173],
+    "hoof": [281,479,283,646],
+    "hop": [55,1092],
+    "hor": [83,631,102,537,840,571],
+    "hori": [286,573],
+    "hormigue": [479,390,625,382,642,476,644,418,651,390,696,397,699,335,711,393,724,460,744,530,755,349,761,379,764,362,767,346],
+    "hormon": [685,558,687,403,713,458,714,429,717,546,718,661,719,688,720,399,723,433,724,453,727,395,734,356,741,686,857,415,859,387],
+    "hormonal": [10,361,151,320,178,473,204,337,228,490,234,337,253,330,261,374,305,416,366,392,390,327,638,374,678,344,715,287,717,327,730,448,733,298,770,306,806,327,807,312,813,312,816,312,835,314,837,300,852,295,859,324,870,327,892,276,917,327,949,320],
+    "horn": [32,683,289,770,452,700],
+    "hors": [111,846,460,783],
+    "horsechestnut": [460,850],
+    "horseradish": [42,841,101,710,211,744],
+    "horsetail": [64,1079,315,639],
+    "hortaliz": [232,650],
+    "hortelan": [4,447,5,489,28,563,104,439],
+    "hortens": [10,443],
+    "hortensi": [58,791],
+    "hospital": [933,563],
+    "hostilidad": [922,543],
+    "hot": [34,747,510,593],
+    "houpu": [127,991],
+    "houseleek": [487,844],
+    "hoy": [176,605,251,676],
+    "hoyuel": [850,485,853,522,866,493],
+    "hpb": [816,828],
+    "hpiv": [546,701],
+    "hpv": [827,811],
+    "hsc": [737,892],
+    "htt": [652,686],
+    "hua": [266,650],
+    "huachum": [496,664],
+    "huang": [200,701],
+    "huckleberry": [73,500,426,951],
+    "huec": [590,657],
+    "hues": [71,405,92,448,306,459,315,418,351,396,651,362,704,396,722,392,743,400,745,384,747,396,757,352,760,342,762,671,770,492,771,489,772,513,797,380,799,388],
+    "huev": [294,964,863,523],
+    "hui": [266,650],
+    "huiasampill": [221,606],
+    "huisisaj": [223,589],
+    "hul": [187,780],
+    "hum": [521,515,522,515,524,455,527,515,528,499,533,455,935,460],
+    "human": [191,558,546,527,547,551,808,438,827,711,843,630,876,464],
+    "humed": [28,542,313,573,585,560,842,489,864,446],
+    "humedad": [226,632,273,639],
+    "humedal": [314,709],
+    "humild": [246,686],
+    "humillad": [901,568],
+    "humor": [234,504,371,542,812,484,813,466,904,396],
+    "humulu": [55,886],
+    "hund": [866,568],
+    "hungarian": [60,595],
+    "huntington": [652,1121],
+    "hurgars": [952,709],
+    "huser": [164,679],
+    "hyacinth": [310,734],
+    "hydrasti": [206,886],
+    "hylocereu": [351,828,486,767],
+    "hypericum": [65,899],
+    "hypogae": [453,946],
+    "hysop": [28,679],
+    "hyssop": [28,762,175,529,511,735,516,720],
+    "hyssopu": [28,919],
+    "hystrix": [375,912],
+    "ibi": [223,589],
+    "ice": [281,521],
+    "icterici": [74,510,570,551,571,488,591,504,592,533,598,616,695,521],
+    "ictiosi": [858,839],
+    "ictu": [620,777,647,757],
+    "idae": [425,874],
+    "idaeu": [390,744,422,841,424,882],
+    "ideal": [2,488,42,551,172,464,221,455,237,474,384,447,518,478],
+    "identific": [689,679],
+    "idiopatic": [531,489,535,454,700,674,710,772,763,475],
+    "iesc": [281,521],
+    "iga": [801,1111],
+    "ignorar": [925,589],
+    "igual": [125,780],
+    "ilex": [69,810,74,762,125,836,198,823],
+    "ilicit": [833,548,917,564],
+    "ilim": [515,618],
+    "illaku": [222,664],
+    "illicium": [472,776],
+    "illinoinensi": [438,946],
+    "imagen": [898,569,912,397],
+    "imc": [636,612,755,496],
+    "impactad": [955,862],
+    "impedir": [153,584],
+    "imperfeccion": [945,701],
+    "imperial": [29,563],
+    "impetig": [849,811],
+    "implant": [830,606],
+    "implantacion": [735,590,797,548,832,658],
+    "implic": [876,618],
+    "implican": [690,503,766,439,768,443,928,498],
+    "important": [101,372,168,445,226,445,248,465,436,500,439,460,485,346,492,307,515,401,641,426,891,440,912,280,929,272,934,537],
+    "imposibilidad": [771,568],
+    "impotenci": [814,892],
+    "imprecis": [933,563],
+    "impuls": [898,569,910,553],
+    "impulsiv": [897,543,925,543],
+    "impulsividad": [903,742,905,548],
+    "inadecuad": [706,691,757,484,797,523,799,534],
+    "inapropiad": [905,517,924,438,926,537],
+    "inc": [362,568],
+    "incapacidad": [574,460,580,419,586,557,628,382,699,463,729,385,762,363,814,397,816,357,823,374,835,360,836,410,903,344,908,523,927,294,930,350,931,303,934,506],
+    "incapacitant": [684,694],
+    "incapaz": [929,419],
+    "incarnat": [70,899],
+    "inclus": [348,596,624,548,826,468],
+    "incluy": [699,516],
+    "incluyen": [882,679],
+    "incluyend": [488,483,623,593],
+    "incomod": [555,605,929,386],
+    "incomplet": [665,590,734,485,762,517],
+    "inconsistent": [933,563],
+    "incontinenci": [586,705,779,695,786,519,797,488,799,498,809,464],
+    "incontrolabl": [549,543,639,631,706,512],
+    "incorrect": [651,522,757,507,774,512],
+    "indecision": [913,543],
+    "indefens": [929,419],
+    "independient": [653,650],
+    "independientement": [913,543],
+    "indi": [38,326,45,397,101,350,103,655,110,389,111,636,247,374,262,378,381,338,458,382,460,650,461,294,475,616,485,326,492,289,506,454,510,393,513,406],
+    "indian": [8,598,17,341,39,386,45,373,103,547,110,505,205,502,208,370,247,491,273,398,324,377,381,317,458,572,461,412,471,329,483,502,485,446,492,408,503,502,511,370,512,498,513,520,516,358],
+    "indianwheat": [461,718],
+    "indic": [110,615,220,400,347,647,355,637,362,397,481,615,485,542,492,496,636,464,768,373],
+    "indicum": [432,984],
+    "indigestion": [21,555,448,473,450,469,480,513,581,685,589,519],
+    "indirect": [909,521],
+    "individual": [651,600],
+    "indolor": [567,485,706,421,818,446,820,425,828,413,843,425,850,398,872,429,941,446],
+    "inducid": [851,600],
+    "inducir": [349,679],
+    "inductor": [55,644],
+    "industri": [259,612,560,599],
+    "industrial": [789,743],
+    "ineptitud": [928,600],
+    "inesperad": [629,618,900,548],
+    "inesperadament": [586,671],
+    "inestabilidad": [640,653,905,772],
+    "inestabl": [699,516],
+    "inexplicabl": [533,387,557,438,588,399,589,429,590,420,591,429,592,453,635,411,693,438,712,387,727,395,790,469,807,373,872,383,931,317],
+    "infanci": [611,455,905,407,922,372,926,423,927,329,928,411,929,443,930,392,931,340,933,385,934,400],
+    "infantil": [668,517,925,512,933,489],
+    "infart": [604,628,606,437,607,460,609,451,615,485,628,446,629,479,647,587,677,603],
+    "infeccion": [45,182,64,175,85,158,98,208,128,214,152,199,153,164,169,184,186,224,202,182,206,181,208,181,250,201,271,181,274,173,413,208,484,173,514,186,521,192,522,294,523,312,524,170,526,294,527,260,528,254,529,331,530,192,538,245,540,164,541,258,542,184,543,240,544,256,545,211,546,264,547,272,548,249,549,243,550,249,552,162,558,266,561,208,562,190,565,179,569,211,570,272,576,290,577,211,582,268,584,274,589,188,591,188,593,219,595,208,611,186,612,305,613,197,614,186,621,173,627,234,632,192,639,204,643,195,644,181,656,276,660,195,661,299,662,258,665,190,666,199,678,181,679,197,680,172,683,172,686,175,687,177,689,190,691,172,692,172,695,195,697,188,699,145,700,168,705,277,706,165,707,170,709,170,710,165,742,184,747,184,751,181,753,260,775,318,776,316,777,322,782,256,783,204,784,201,785,208,786,188,792,199,796,266,799,181,800,291,801,188,802,186,803,264,805,260,808,164,811,274,815,165,818,175,821,237,822,286,824,301,825,242,826,219,827,228,828,231,829,267,834,161,835,165,840,184,842,300,843,167,849,290,850,225,853,297,854,296,855,288,856,216,861,149,864,156,867,161,872,168,873,234,874,250,875,287,876,173,877,258,885,175,886,297,887,254,889,304,890,232,892,213,893,168,898,173,935,172,938,304,942,192,943,175,951,320,953,197,956,179,957,197],
+    "infeccios": [530,569,672,569,683,508,873,691],
+    "infect": [825,618],
+    "infectad": [530,490,541,485,824,442,825,442,826,558,827,406,842,437,875,469,877,485],
+    "infectan": [856,529],
+    "infectar": [824,618],
+    "inferior": [546,490,547,513,567,474,577,687,626,428,776,485,797,441,798,469,802,464,815,412],
+    "infernal": [89,679],
+    "infertilidad": [736,443,804,489,819,467,823,710],
+    "infestacion": [863,568],
+    "infestad": [863,568],
+    "inflam": [523,583,548,559,838,571],
+    "inflamacion": [44,251,46,263,50,266,118,195,189,282,269,220,282,251,287,227,290,209,355,249,367,249,386,195,388,246,491,266,502,263,504,254,521,254,522,254,526,307,527,254,528,382,561,404,564,266,565,236,566,254,570,402,572,404,576,383,577,279,579,372,582,266,584,275,593,289,598,304,600,275,613,392,614,382,624,372,656,406,683,227,691,227,692,227,694,241,695,257,697,249,702,380,703,251,705,227,706,218,707,225,714,249,715,200,742,380,745,373,747,380,753,388,756,210,759,231,765,207,776,257,782,384,783,399,789,275,792,263,802,246,807,216,810,234,815,389,820,220,821,362,822,378,828,214,835,218,838,244,847,214,855,297,872,223,874,241,875,380,887,246,889,234,892,191,935,366,941,231,950,254,955,229,957,419],
+    "inflamad": [527,569,550,534,873,691,874,846],
+    "inflaman": [856,529],
+    "inflamatori": [31,324,195,453,524,352,539,515,564,417,566,398,584,432,668,345,679,407,691,356,692,356,694,518,703,394,706,342,709,494,753,537,759,363,784,417,805,459,830,352,852,321,887,386],
+    "inflorescenci": [239,624],
+    "influenci": [924,464,932,593],
+    "influenciabl": [926,618],
+    "influenz": [542,957,548,559,699,449],
+    "informacion": [909,416,913,434,922,434,934,661,957,560],
+    "infrecuent": [568,726],
+    "infusion": [77,431,88,455,99,506,108,359,198,494,244,445,245,418,384,386,389,359,390,397,391,426,392,575,394,476,403,422],
+    "ingest": [636,612,904,457],
+    "ingl": [177,523,815,489,818,518,821,498],
+    "ingles": [118,525],
+    "ingredient": [77,499,82,464,83,545,93,510,275,442,373,551,465,460],
+    "ingresan": [775,575,853,553],
+    "inhalacion": [557,569,558,589,559,791,560,741],
+    "inhalad": [100,717],
+    "inhalar": [549,624],
+    "inhibicion": [928,600],
+    "inhibid": [908,612],
+    "inici": [542,605,645,661],
+    "inicialment": [535,568],
+    "iniciar": [281,479,929,386],
+    "injustificad": [922,543],
+    "ink": [280,919],
+    "inmadur": [398,606],
+    "inmediat": [909,479,924,464],
+    "inmortalidad": [264,632,517,618],
+    "inmovilidad": [534,599,619,575],
+    "inmun": [31,362,62,575,172,401,212,405,227,445,266,422,270,436,275,382,283,455,290,365,367,436,411,500,891,440,894,440],
+    "inmunidad": [549,624],
+    "inmunitari": [285,302,344,292,345,277,346,292,347,295,348,295,350,263,351,283,352,292,353,286,358,266,362,244,367,289,369,244,377,283,381,238,393,258,404,254,525,269,530,295,539,277,558,305,564,309,566,295,573,392,678,381,681,274,682,373,683,425,685,271,686,373,689,395,694,280,695,298,697,392,698,254,699,222,700,258,701,266,706,254,707,261,708,234,754,226,808,251,811,258,838,283,843,256,845,251,846,258,850,240,856,228,862,249,864,240,868,238,872,363,874,280,886,302,893,363,894,292],
+    "inmunodeficienci": [683,856],
+    "inmunoestimulant": [31,362,77,431,167,413,200,455,202,422,205,409,206,418,208,418,212,405,226,445,227,445,233,368,410,422,411,500],
+    "inmunoglobulin": [801,912],
+    "inmunologic": [195,395,200,355,208,326,264,347,274,313,296,390,320,367,321,359,322,385,323,367,324,332,325,363,326,343,327,336,328,376,329,351,330,385,331,371,332,400,333,400,334,405,335,367,336,326,337,390,338,390,339,336,340,405,341,405,342,405,343,405,459,275,510,326,513,336,518,322,642,371,804,298],
+    "inmunomodulador": [194,459,195,464,228,404,264,408,265,408,266,387,270,400,273,413,274,368,275,351,277,417,278,559,283,417,285,417,286,341,290,335,295,482,459,323,517,400,519,375],
+    "inmunosupresion": [683,856],
+    "inocent": [622,624],
+    "inofensiv": [682,799,847,533],
+    "inonotu": [269,839],
+    "inquietud": [551,559,895,532,903,489],
+    "insam": [77,664],
+    "insect": [375,536,840,525,849,454,866,454,867,458],
+    "insecticid": [110,509,144,567,164,542,224,480,364,756],
+    "insensibl": [925,589],
+    "insipid": [413,684,729,805],
+    "insomni": [11,455,56,397,108,415,237,474,239,469,646,782,896,404],
+    "inspirar": [529,646,548,593],
+    "insuficienci": [157,445,460,393,536,431,551,418,555,426,606,555,664,465,687,650,730,386,731,393,780,592,787,488,800,436,928,390],
+    "insuficient": [635,559,724,616,949,522],
+    "insulin": [602,502,635,648,693,502,711,718,712,443,715,394,721,722,726,677],
+    "insulinodependient": [693,804,711,738,712,738],
+    "insulinom": [726,925],
+    "integrifoli": [441,968],
+    "intencion": [922,543],
+    "intens": [175,298,213,290,217,308,354,325,420,375,466,340,542,308,566,321,576,380,578,308,579,295,599,336,604,298,608,311,616,311,638,329,647,271,648,305,656,352,708,254,710,276,728,308,729,295,758,284,762,279,778,308,804,276,811,395,822,305,836,314,838,308,839,279,840,308,854,279,863,266,869,234,883,293,889,295,900,279,901,380,905,393,906,246,907,373,909,357,918,266,937,264],
+    "intensificad": [869,500],
+    "intent": [910,553,911,538],
+    "intentar": [912,431],
+    "inter": [896,648,914,408,915,503,917,508],
+    "interesars": [923,512],
+    "interfier": [848,475,864,446,903,450,908,489,930,458],
+    "interfieren": [748,631],
+    "interior": [586,583,804,512,935,532],
+    "intermenstrual": [829,573],
+    "intermitent": [755,496,939,575],
+    "intern": [87,471,166,482,557,461,600,499,612,591,617,437,645,482,666,636,683,411,826,362,942,461,943,583],
+    "interpersonal": [905,772,928,553],
+    "interpretacion": [922,543],
+    "interrumpid": [817,573],
+    "interrupcion": [620,480,647,462,663,509,688,531,787,601],
+    "intersticial": [788,919],
+    "intervertebral": [755,919],
+    "intervien": [914,492],
+    "intestin": [383,430,398,376,544,416,565,674,574,466,582,445,588,387,596,450,597,440,599,445,660,430,696,379,705,379,738,383,743,412,809,372,887,412],
+    "intestinal": [35,351,72,398,220,329,302,417,350,351,358,355,360,358,382,498,388,520,425,362,564,412,565,366,566,394,576,465,584,427,587,417,588,358,596,552,694,512,800,385,804,338,884,585,887,381],
+    "intimidad": [835,589],
+    "intoleranci": [562,563,569,624,574,816,714,557],
+    "intoxicacion": [569,692,582,661],
+    "intracraneal": [648,892],
+    "intraocular": [937,563],
+    "intravenos": [612,637],
+    "intrinsec": [696,612],
+    "inulin": [220,817],
+    "inusual": [622,518,770,476,808,484,924,418],
+    "inutilidad": [896,538],
+    "invalidant": [905,595],
+    "invernal": [166,661,914,673],
+    "invers": [857,892],
+    "investig": [283,646,477,709],
+    "investigacion": [357,734],
+    "investigad": [270,671],
+    "investigan": [251,676,503,581],
+    "inviern": [165,625,847,533],
+    "involucran": [694,650],
+    "involucren": [904,496],
+    "involuntari": [530,490,586,479,632,490,652,490,714,479,749,666,774,421,779,642,834,409],
+    "ipazot": [35,612],
+    "ipomoe": [212,868],
+    "ira": [905,517,917,532,922,472],
+    "iri": [314,1065],
+    "irish": [203,443,303,668],
+    "irland": [303,1077],
+    "irracional": [909,521],
+    "irradi": [572,574,604,493,651,464,675,530,761,451,764,619],
+    "irrazonabl": [927,481],
+    "irregular": [607,694,608,620,615,465,715,535,720,428,731,415,804,403,823,419,833,407,844,407,945,480],
+    "irregularidad": [178,593,812,558],
+    "irresistibl": [910,600],
+    "irreversibl": [538,631],
+    "irrigacion": [604,637],
+    "irrit": [952,709],
+    "irritabilidad": [652,490,669,465,685,451,812,433,813,417,904,354,917,437,918,406,938,451],
+    "irritabl": [565,1001,918,523],
+    "irritacion": [87,435,135,450,207,399,303,450,528,638,563,412,567,421,585,435,643,430,745,395,776,430,782,565,810,391,811,372,850,346,856,328,866,352],
+    "irritad": [37,573],
+    "irritant": [521,515,522,515,524,455,527,515,838,493,839,729,935,460],
+    "isabgul": [461,481],
+    "isan": [224,844],
+    "isau": [224,600],
+    "isl": [438,709],
+    "isop": [28,919],
+    "ispaghul": [461,718],
+    "ispagul": [461,718],
+    "isquemi": [599,954],
+    "isquemic": [603,675,607,483,620,451,647,434,663,661,677,451,701,464],
+    "italian": [7,662,36,456,114,781],
+    "its": [584,543,782,491,805,401,821,439,822,476,824,452,826,394,829,597],
+    "itu": [775,868],
+    "izot": [190,1007],
+    "izquierd": [604,554,819,700,890,507],
+    "jabon": [144,653,839,548],
+    "jaboncill": [144,1136],
+    "jabuticab": [370,1077],
+    "jacint": [310,1083],
+    "jack": [203,443,287,564],
+    "jad": [501,1141],
+    "jade": [551,644],
+    "jalapen": [470,440],
+    "jam": [456,443],
+    "jamaic": [238,995,381,480,476,895],
+    "jamaican": [331,734],
+    "jamb": [372,932],
+    "jang": [233,568],
+    "japanes": [42,749,59,596,232,503,398,469,479,755,514,700],
+    "japon": [42,524,68,479,270,479,275,421,328,531,337,550,338,550,479,429,514,474],
+    "japones": [59,423,298,615,304,601,306,608,326,542],
+    "japonic": [304,855,397,855,514,787],
+    "japonicum": [42,968],
+    "jaquec": [638,939],
+    "jaquim": [243,650],
+    "jar": [159,1106],
+    "jarab": [117,653,134,695,244,596],
+    "jarama": [218,624],
+    "jarav": [393,553,404,543],
+    "jardi": [58,548],
+    "jardin": [5,489,10,368,58,656,163,545],
+    "jardineri": [162,671],
+    "jasmin": [237,1136],
+    "jasminum": [237,874],
+    "jasoni": [174,932],
+    "jav": [38,842,484,1039],
+    "jazmin": [101,498,237,1047,258,876],
+    "jeben": [469,563],
+    "jedre": [58,548],
+    "jee": [41,563],
+    "jeer": [15,946],
+    "jelly": [272,514,279,794],
+    "jengibr": [18,865,38,842],
+    "jengibrill": [17,548,475,587],
+    "jering": [101,573],
+    "jerusalem": [173,618,220,752],
+    "jerusalen": [220,817],
+    "jessamin": [258,1008],
+    "jesuit": [35,856],
+    "jew": [279,618],
+    "jiang": [18,701],
+    "john": [65,828,136,632],
+    "jojob": [191,976],
+    "jolivert": [7,521],
+    "joven": [159,551,198,632,280,563,286,476],
+    "juan": [53,485,65,890,136,596],
+    "juavert": [7,521],
+    "jud": [279,1073],
+    "juda": [279,862],
+    "judi": [279,618],
+    "jueg": [621,618],
+    "juevert": [7,521],
+    "juf": [28,679],
+    "jug": [359,545,365,602,367,557,375,757],
+    "juglan": [120,840,434,913],
+    "jugos": [219,460,347,515,352,510,353,499,384,447,396,478,405,565],
+    "juici": [929,419],
+    "julivert": [7,479,36,483],
+    "junc": [93,1166],
+    "juncian": [210,637],
+    "juncu": [93,919],
+    "juniper": [155,1047],
+    "juniperu": [155,925],
+    "junt": [701,569,799,593],
+    "jupiter": [487,600],
+    "just": [834,573],
+    "juvenil": [712,850],
+    "juzgad": [901,811],
+    "kaa": [41,806],
+    "kabay": [345,644],
+    "kabosu": [338,1286],
+    "kadsur": [98,1157],
+    "kaempferi": [96,1246],
+    "kaffir": [335,1065,375,900,456,385],
+    "kahan": [463,529],
+    "kahau": [199,470],
+    "kakaw": [199,650,462,533],
+    "kaki": [398,1120],
+    "kal": [225,553],
+    "kalahari": [456,443],
+    "kalancho": [488,1059],
+    "kalang": [38,534],
+    "kalin": [345,644],
+    "kalli": [506,743],
+    "kallmann": [734,801],
+    "kalongi": [459,543],
+    "kalonji": [31,514,459,500],
+    "kamal": [458,624],
+    "kan": [233,568],
+    "kap": [463,529],
+    "kapal": [483,631],
+    "kapok": [139,939],
+    "karallamu": [506,743],
+    "kardakiy": [281,521],
+    "kardub": [281,521],
+    "karraspin": [290,563],
+    "katikasir": [483,631],
+    "kav": [84,1248],
+    "kawaratak": [270,671],
+    "kawi": [223,589],
+    "keirn": [126,624],
+    "kelp": [297,1179],
+    "kesom": [34,568],
+    "key": [324,899],
+    "khat": [95,1185],
+    "khatai": [481,637],
+    "killarney": [146,679],
+    "king": [284,890,292,596,508,670],
+    "kinnikinnick": [152,946],
+    "kion": [18,701],
+    "kitchen": [10,676],
+    "kiwi": [358,1128],
+    "kiwifruit": [358,992],
+    "kkayach": [224,600],
+    "kleffner": [668,839],
+    "klinefelter": [736,776],
+    "kne": [157,686],
+    "kodu": [506,743],
+    "kohlrabi": [219,856],
+    "kol": [102,932,465,857,512,754],
+    "kombu": [304,1163],
+    "konjac": [90,1272],
+    "korean": [77,834,479,553],
+    "kou": [38,534],
+    "kumaru": [482,880],
+    "kumquat": [326,1267],
+    "laberintiti": [666,946],
+    "labi": [535,415,552,423,710,431,724,519,799,471,840,481,859,443,871,457],
+    "laboral": [908,532,928,522,934,507],
+    "labrusc": [454,529],
+    "lac": [214,981],
+    "lacquered": [264,686],
+    "lactanci": [14,451,519,523,731,503,823,508],
+    "lactas": [574,752],
+    "lacte": [574,653,731,738,852,810],
+    "lactiflor": [229,794,253,794],
+    "lactos": [574,1096],
+    "lactuc": [91,954,307,899],
+    "lad": [535,381,577,505,579,424,617,437,620,403,638,471,691,411,768,359,819,378,830,407,831,396,940,432],
+    "ladan": [159,905],
+    "ladanifer": [159,905],
+    "lady": [503,874],
+    "laetiporu": [286,817],
+    "lafor": [667,1111],
+    "lagrim": [689,625,949,976],
+    "lagrime": [951,717],
+    "lahual": [133,717],
+    "lahuan": [133,954],
+    "lakachu": [221,606],
+    "laks": [34,947],
+    "lam": [888,880],
+    "lamaki": [223,589],
+    "lamb": [5,833],
+    "lambrusquer": [454,529],
+    "laminari": [297,1116],
+    "lampar": [869,500],
+    "lampaz": [104,771],
+    "lampwick": [173,912],
+    "lan": [279,618],
+    "lanatu": [456,676],
+    "landau": [668,839],
+    "lap": [104,529],
+    "lapituq": [496,664],
+    "lapp": [104,1000],
+    "lappaceum": [353,905],
+    "laquchu": [221,606],
+    "larch": [133,661,271,593],
+    "larg": [226,431,483,681,567,427,590,413,619,393,623,405,624,397,643,436,736,336,764,351,771,357,820,374,868,348,915,381,946,364,947,549],
+    "laring": [528,948,548,593],
+    "laringiti": [528,834,954,605],
+    "laringotraqueobronquiti": [548,886],
+    "larix": [133,954],
+    "larre": [186,1024],
+    "lat": [607,644],
+    "latent": [666,709],
+    "lateral": [650,754,763,729,799,559],
+    "latex": [82,478,91,519,131,710,143,754,183,603,503,675],
+    "latid": [534,476,607,741,608,486,609,461,610,491,615,496,622,457,833,435],
+    "laur": [9,589],
+    "laurel": [9,1245],
+    "laurentin": [166,717],
+    "lauru": [9,833],
+    "laurustinu": [166,1071],
+    "lavand": [23,968],
+    "lavandul": [23,968],
+    "lavangam": [20,717],
+    "lavender": [23,1152],
+    "lawyer": [280,625,499,828],
+    "laxant": [40,492,49,344,75,439,83,380,89,355,90,385,100,500,137,376,143,511,147,492,164,355,179,528,223,309,302,380,355,478,358,324,360,327,380,471,383,363,384,439,385,431,387,309,392,337,395,485,396,334,398,445,402,306,405,394,406,376,461,252,490,303,904,260],
+    "ldl": [438,709],
+    "ldm": [671,939],
+    "leaf": [7,709,34,738,41,576,108,395,213,442,239,446,488,548,495,425,515,442],
+    "lealtad": [922,500,924,464],
+    "leaved": [66,685,108,598,169,493,176,675,239,469,471,613,517,685],
+    "lebanon": [116,1136],
+    "lecachu": [221,606],
+    "lech": [32,420,451,498,452,435,503,488,720,483,731,657],
+    "lechleri": [131,919],
+    "lechos": [344,563,345,534,823,508,881,943],
+    "lechug": [91,1070,307,1066],
+    "lechuguill": [203,481],
+    "lechuz": [488,525],
+    "lectur": [944,868],
+    "leer": [947,631],
+    "legumbr": [304,692,453,653],
+    "leguminos": [200,646,355,618],
+    "legustic": [30,595],
+    "leigh": [669,892],
+    "leiomiom": [806,856],
+    "lej": [929,419],
+    "lejan": [946,757,947,581],
+    "lemandarin": [339,664],
+    "lemn": [309,976],
+    "lemon": [24,565,39,520,47,726,88,726,145,772,320,886],
+    "lemongras": [39,983],
+    "lendi": [483,631],
+    "lengku": [38,534],
+    "lengu": [90,676,499,943],
+    "lenguaj": [665,798,668,729,908,532],
+    "lenos": [509,644],
+    "lent": [98,646,162,583,609,940],
+    "lentament": [950,686],
+    "lentej": [309,1090],
+    "lentig": [869,740],
+    "lentinul": [265,925],
+    "lentisc": [192,991],
+    "lentiscu": [192,991],
+    "lentitud": [640,709],
+    "leon": [67,1021,203,829,268,848],
+    "leopard": [242,701],
+    "lepidium": [204,874],
+    "lesion": [529,304,537,257,539,279,574,326,580,297,600,322,614,288,619,270,627,255,631,294,639,314,643,300,651,260,660,300,665,294,678,279,680,265,702,285,704,285,708,235,745,276,746,459,747,285,753,297,755,233,756,246,757,253,762,363,765,241,767,231,768,231,770,412,771,447,772,262,773,288,782,291,786,395,803,304,820,257,821,260,845,253,846,260,854,257,860,265,861,229,865,268,866,246,867,248,868,239,879,314,892,224,899,244,911,253,937,244,939,270,940,279,948,294,953,304],
+    "lesser": [38,776],
+    "letal": [629,671],
+    "lettuc": [91,1023,307,684],
+    "leucemi": [632,739,802,531,874,520,890,466,893,480],
+    "leucoaraiosi": [670,899],
+    "leucodistrofi": [671,939],
+    "leucoencefalopati": [672,852,677,777],
+    "lev": [5,382,408,397,494,386,541,440,670,426,745,413,757,537,834,372,847,375,849,368,858,386,861,343,864,362,950,445],
+    "levadur": [811,777,852,509],
+    "levantamient": [651,553,746,553],
+    "levantar": [691,532,746,522,757,507],
+    "levantars": [691,532,748,548,761,507],
+    "levistic": [30,971],
+    "levisticum": [30,839],
+    "lewy": [653,1019],
+    "ley": [925,589],
+    "lhh": [893,976],
+    "lian": [195,780],
+    "liban": [116,709],
+    "libani": [116,946],
+    "liberador": [734,558],
+    "libertador": [488,525],
+    "libid": [204,523,267,534,520,741,812,503],
+    "lichi": [352,959,353,612],
+    "licor": [126,575,401,727],
+    "licoric": [201,671],
+    "liebr": [173,671],
+    "lif": [274,569,488,483],
+    "ligad": [631,590,664,623,676,559],
+    "ligament": [675,569,704,545,761,484,809,701],
+    "liger": [12,393,378,509,442,623,456,354,952,567],
+    "ligerament": [215,498,223,512,232,565],
+    "lignum": [508,771],
+    "ligul": [243,650],
+    "ligusticum": [208,886],
+    "ligustrum": [163,899],
+    "lij": [847,578],
+    "likin": [287,612],
+    "lilac": [110,880],
+    "lily": [259,787,275,512,311,616],
+    "lim": [66,651,108,569,239,446,324,899,329,666,335,893,336,915,339,790,375,740],
+    "lima": [339,664],
+    "limequat": [340,1258],
+    "limit": [895,564,905,772],
+    "limitad": [675,596,892,449,924,438],
+    "limon": [24,351,39,794,47,501,88,501,145,868,320,875,324,871,327,647,339,474],
+    "limonari": [39,440],
+    "limoncill": [24,408,39,365,88,979,402,484],
+    "limoner": [24,427,145,1020,320,631],
+    "limonzon": [325,717],
+    "limpi": [312,726],
+    "limpiaplat": [64,624],
+    "limpiar": [21,573,156,514,230,554,310,587,517,536],
+    "lin": [427,734],
+    "linaz": [427,1152],
+    "lindau": [659,912],
+    "linden": [66,792,108,692,239,754],
+    "line": [709,503,858,494,863,471,875,545],
+    "linfadeniti": [887,905],
+    "linfadenopati": [874,822,893,553],
+    "linfagog": [182,800],
+    "linfangiectasi": [596,885,884,938],
+    "linfangioleiomiomatosi": [888,880],
+    "linfangiom": [878,828,885,754,892,779],
+    "linfangiti": [875,899],
+    "linfatic": [182,440,277,386,527,377,539,354,596,399,627,650,828,318,854,327,872,614,873,458,874,603,875,563,876,620,877,572,878,627,879,399,880,516,881,520,882,373,883,477,884,358,885,477,887,365,888,484,890,321,891,373,892,605],
+    "linfedem": [627,767,877,625],
+    "linfocit": [872,844],
+    "linfocitic": [686,868],
+    "linfofolicular": [886,939],
+    "linfohistiocitosi": [893,844],
+    "linfoid": [886,701],
+    "linfom": [802,513,872,653,874,503,887,513,890,451,893,464],
+    "linfoproliferativ": [894,679],
+    "ling": [160,822,273,639],
+    "lingonberry": [153,762,425,997],
+    "lingzhi": [264,632,293,1151],
+    "linseed": [427,968],
+    "linteu": [283,1131],
+    "linum": [427,968],
+    "lion": [203,443,268,553],
+    "lipas": [674,657],
+    "lipid": [674,828,865,569],
+    "lipomatos": [882,919],
+    "liquen": [709,850],
+    "liquid": [112,322,191,494,391,332,428,367,523,340,536,458,551,448,552,293,563,336,569,498,578,332,580,347,583,355,586,340,594,385,627,298,729,319,747,332,765,518,784,363,787,380,793,376,794,329,817,290,818,316,820,563,833,301,878,363,879,367,880,355,883,316,885,439,892,261,938,319,943,316,956,322],
+    "liquoric": [201,671],
+    "liri": [259,895,311,616,314,925],
+    "lis": [222,531,395,548,698,471,860,489,888,703],
+    "lisbon": [320,726],
+    "lisosomal": [674,657],
+    "lisosomic": [671,646,674,605],
+    "litchi": [352,919],
+    "lithop": [498,1096],
+    "littl": [108,509,239,575],
+    "littleleaf": [108,509,239,575],
+    "liuch": [129,595],
+    "lived": [701,618],
+    "liveforever": [487,844],
+    "liverwort": [37,817],
+    "living": [498,892],
+    "llag": [72,495,562,485,618,474,624,451,826,558,828,413,849,406,851,429,857,465],
+    "llam": [275,589],
+    "llamad": [47,471,65,442,99,524,102,415,169,442,181,511,192,511,278,471,380,442,801,451,861,356,863,381],
+    "llamativ": [256,564,351,605],
+    "llameir": [126,624],
+    "llant": [669,650],
+    "llanten": [461,718],
+    "llapass": [104,529],
+    "llavoret": [16,686],
+    "llebistic": [30,595],
+    "llen": [648,476,747,481,841,423,856,387,878,525,885,457,892,378,938,461],
+    "llenur": [561,684,562,625],
+    "llev": [712,606],
+    "llevan": [835,589],
+    "llevar": [827,568],
+    "llorer": [9,589],
+    "lloreru": [9,589],
+    "lloreu": [9,589],
+    "llorin": [9,589],
+    "lloron": [113,584],
+    "lloros": [525,575,682,575],
+    "lloureir": [9,589],
+    "llupol": [55,644],
+    "lobul": [553,679],
+    "loc": [111,625,460,558],
+    "local": [12,427,421,704,479,522],
+    "localizad": [662,563,749,576,761,484,774,489],
+    "locot": [470,440],
+    "locust": [136,686],
+    "logan": [423,1141],
+    "loganberri": [423,717],
+    "loganberry": [422,638,423,992,424,686],
+    "loganobaccu": [423,954],
+    "logm": [362,568],
+    "logr": [908,612],
+    "logran": [795,694],
+    "lograr": [814,599,927,443],
+    "lohm": [362,568],
+    "lombriguer": [29,563],
+    "long": [17,729,475,764,483,940],
+    "longevidad": [293,668,510,593],
+    "longipedunculat": [98,1157],
+    "longum": [483,874],
+    "lonicer": [514,905],
+    "lophophor": [489,932],
+    "lot": [247,984,458,1043],
+    "lotu": [247,1035,458,1043],
+    "lou": [650,868],
+    "loum": [362,568],
+    "lovag": [30,971,208,593],
+    "loveroot": [208,644],
+    "lrp4": [752,543],
+    "lubricacion": [834,817],
+    "luc": [937,563],
+    "lucidum": [264,925],
+    "lucky": [501,880],
+    "lucm": [362,811],
+    "lucum": [362,1236],
+    "lue": [828,822],
+    "lueg": [535,523,625,543],
+    "lugar": [641,493,770,430,899,423,906,394,910,451,911,438,918,426],
+    "luj": [291,637],
+    "lumbag": [761,828],
+    "lumbalgi": [675,804,705,532,761,719],
+    "lumbar": [809,600],
+    "lumpy": [277,701],
+    "lunar": [844,895,860,788],
+    "lupi": [55,644],
+    "lupu": [614,455,637,761,678,747,697,460,701,423,792,486,793,509,802,455,874,445,893,411,894,465],
+    "lupul": [55,886],
+    "lupulu": [55,886],
+    "lute": [210,880],
+    "lutein": [262,749,436,669,440,616],
+    "lutetian": [97,1065],
+    "luteu": [287,856],
+    "luxacion": [623,644],
+    "luy": [18,701],
+    "luz": [638,513,707,443,708,397,869,366,914,360,936,486,949,439,951,525],
+    "lyche": [352,919],
+    "lychniti": [173,912],
+    "lycium": [411,999],
+    "mac": [204,1083,474,885],
+    "macadami": [441,1254],
+    "macamb": [371,959,462,533],
+    "macerad": [842,612],
+    "mach": [0,471,1,594,54,359,108,442,409,580],
+    "maci": [474,1147],
+    "mackerel": [5,833],
+    "macon": [429,657],
+    "macrobiotic": [305,780],
+    "macrocarpon": [153,828],
+    "macrocephal": [226,925],
+    "macroquistic": [892,757],
+    "mader": [81,701,116,653],
+    "madr": [53,514,828,533],
+    "madreselv": [10,408,514,948],
+    "madron": [146,1229],
+    "madroner": [146,679],
+    "madur": [161,402,377,525,392,514,398,679,407,798],
+    "madurez": [398,606],
+    "maestr": [54,450],
+    "maggi": [30,839],
+    "magic": [10,408,254,625],
+    "magnesi": [307,594,433,601,439,567,456,354,724,567],
+    "magnoli": [127,1181,509,816],
+    "magran": [455,568],
+    "maguey": [72,694],
+    "mahagoni": [138,1015],
+    "mahogany": [138,1015],
+    "mahoni": [169,1062,418,913],
+    "maidenhair": [68,912],
+    "main": [204,631],
+    "maipur": [345,644],
+    "maitak": [266,1019],
+    "maiz": [243,650],
+    "majali": [259,905],
+    "major": [104,771],
+    "majoran": [11,850],
+    "maju": [45,822,224,553],
+    "majuel": [122,548,454,488],
+    "mak": [204,631],
+    "makad": [506,743],
+    "makrut": [335,726],
+    "mal": [21,394,39,242,79,369,438,390,447,354,526,321,538,347,617,358,629,369,634,354,640,520,641,494,646,318,675,377,761,321,775,343,777,358,805,301,819,309,829,315,856,291,865,340,889,347,907,304,918,312,925,324,949,330],
+    "malacaton": [384,595],
+    "malacatoner": [384,595],
+    "malaguet": [476,905],
+    "malang": [225,796],
+    "malari": [130,770],
+    "malassezi": [852,509,864,514],
+    "malavadisc": [207,644],
+    "maldevisc": [207,644],
+    "malestar": [97,428,561,448,581,388,695,418,822,392,853,362,854,359,856,319,867,345,875,396,892,311,898,373,909,314,910,362,911,352,913,474,916,328,924,304,932,388],
+    "malez": [525,624],
+    "malformacion": [878,791,882,762,885,518,892,820],
+    "malicios": [922,543],
+    "malign": [725,694],
+    "mallow": [49,957,207,770,515,537],
+    "malobisp": [207,644],
+    "malojill": [39,440],
+    "malolient": [504,686],
+    "malovisc": [207,644],
+    "malpighi": [381,796],
+    "maltrat": [925,589],
+    "malu": [382,868],
+    "malungay": [101,952],
+    "malv": [49,1241],
+    "malvarisc": [207,644],
+    "malvavisc": [207,1013],
+    "mam": [224,498,730,696,734,463,807,484],
+    "mamari": [730,839],
+    "mamey": [364,1065],
+    "mamme": [364,946],
+    "mamon": [353,664],
+    "man": [52,374,227,353,268,309,281,268,533,312,541,349,624,557,625,303,630,342,644,456,685,325,688,342,690,312,696,315,699,266,704,338,705,315,711,312,717,315,719,321,744,564,756,292,766,397,768,275,783,374,792,365,801,345,827,292,828,298,831,303,858,306,867,295,868,284,869,257],
+    "manan": [766,488,772,558],
+    "manch": [500,405,612,401,680,385,681,553,832,325,842,385,852,348,859,534,860,385,861,572,864,644,868,348,869,653,870,385,871,393,894,427],
+    "manchad": [586,618,829,528],
+    "mandang": [429,657],
+    "mandarin": [323,1151,339,834],
+    "mandibul": [604,587,717,564],
+    "mandioc": [76,980,231,1083],
+    "maner": [82,478,89,525,606,473,631,525,766,409,912,333],
+    "mang": [347,964,481,1050],
+    "mangan": [506,743],
+    "manganes": [346,563,423,595,425,523,442,647],
+    "mangifer": [347,852,481,810],
+    "manglan": [455,568],
+    "manglaner": [455,568],
+    "manguit": [746,1158],
+    "mani": [453,1058,897,724,919,498],
+    "maniac": [897,724,919,498,920,507],
+    "manihot": [76,783,231,805],
+    "manioc": [76,783,231,581],
+    "manjar": [290,563],
+    "manjeron": [11,606],
+    "mans": [440,653,471,528],
+    "mantec": [368,946],
+    "mantener": [77,499,284,493,646,434,654,533,814,670,903,423,923,384],
+    "mantenid": [774,589],
+    "manzan": [382,997],
+    "manzanal": [382,624],
+    "manzanar": [382,624],
+    "manzaner": [382,868],
+    "manzanill": [60,1231],
+    "manzanillon": [53,558],
+    "manzanit": [381,553],
+    "mapaj": [345,644],
+    "mapay": [345,644],
+    "mapl": [117,1163],
+    "mapuch": [129,595],
+    "mapudungun": [106,554,129,670,132,466,133,573,180,504],
+    "maqui": [414,1007],
+    "maquillaj": [912,431],
+    "mar": [167,730,307,904,308,884,504,569],
+    "maracuj": [349,679],
+    "maracuy": [70,605,349,959],
+    "maranon": [439,1136],
+    "maravill": [44,846,243,822],
+    "maravillos": [44,625,488,483],
+    "marc": [812,606],
+    "marcad": [692,532,826,468,905,517],
+    "marcadament": [920,584],
+    "march": [670,605,699,475],
+    "marduix": [11,606],
+    "mare": [18,407,38,310,534,378,597,412,601,366,604,370,607,374,608,386,609,366,610,390,611,386,615,394,622,363,630,386,645,554,666,412,726,398,830,352,942,537,955,359,956,370,957,407],
+    "marfan": [616,577,617,565,623,770],
+    "margarit": [246,1121],
+    "marginatu": [491,954],
+    "margos": [110,880],
+    "mari": [10,408,657,834],
+    "marigold": [44,959,262,988],
+    "marijuan": [429,899],
+    "marin": [297,780],
+    "maripos": [637,618,678,593],
+    "marism": [308,709],
+    "marjoram": [3,976,11,1032],
+    "marmalad": [240,631],
+    "marron": [297,557,301,550,845,417,860,611,862,413,864,398,868,395,869,528,870,437],
+    "marsh": [207,886],
+    "marshmallow": [207,644],
+    "mas": [269,613,515,452,636,486,748,461,750,481,878,698,885,457,889,461],
+    "mascar": [859,850],
+    "mashu": [224,1158],
+    "mashw": [224,600],
+    "masiv": [628,624],
+    "mastican": [95,790],
+    "masticar": [688,577,699,449,752,472],
+    "mastuerz": [45,892],
+    "mat": [69,1108,198,861,369,493],
+    "matafalug": [16,686],
+    "matagall": [173,671],
+    "matalafug": [16,686],
+    "matalahug": [16,632,449,605],
+    "matalahuv": [16,632,449,605],
+    "matalauv": [16,686],
+    "matapoll": [176,657],
+    "materi": [586,618,664,661],
+    "material": [883,575,944,575],
+    "matern": [32,397,451,471,452,412,621,452,720,457,798,491,832,378,833,435],
+    "matricari": [60,839],
+    "matsuhod": [273,694],
+    "matutin": [532,612],
+    "matzatli": [346,679],
+    "may": [122,548,486,543],
+    "mayor": [11,324,36,565,38,285,54,240,79,358,104,412,175,340,205,337,210,340,414,416,464,333,475,340,487,320,533,324,670,351,763,317,798,358,830,324,831,314,832,276,833,317,844,317,854,317,868,295,896,571,916,290,918,303,919,436,920,312,937,300],
+    "mayoran": [11,606],
+    "mayori": [531,460,650,469,658,493,668,447,727,464,763,447,769,423],
+    "maypop": [70,657],
+    "mayr": [225,553],
+    "mazzard": [386,525],
+    "mburucuy": [70,828,349,625],
+    "mead": [51,786],
+    "meadow": [51,1120],
+    "meadowsweet": [51,786],
+    "medi": [613,560,707,484,906,419,938,908,956,509],
+    "median": [744,1097],
+    "mediastin": [879,726],
+    "medic": [611,446,646,388,718,451,730,400,744,385,762,400,803,471,832,347,848,400,910,403,911,392,933,633],
+    "medicament": [568,384,569,398,572,393,593,412,595,393,609,333,613,371,634,340,678,340,680,324,683,324,692,324,695,367,697,355,700,317,708,287,709,321,716,333,730,314,731,321,743,351,753,363,783,384,795,367,800,355,802,351,836,355,840,347,848,314,851,317,867,303],
+    "medicin": [92,386,127,395,133,373,138,410,168,356,183,405,200,364,205,327,226,356,245,334,250,373,273,360,279,321,281,270,283,364,293,377,344,352,375,349,380,341,405,390,411,400,458,324,488,273,496,345,501,331,507,356,509,334,510,334,511,334,512,324,513,345,514,345,520,338],
+    "medicinal": [40,390,56,294,60,330,61,307,63,354,65,365,66,373,67,385,72,385,73,302,79,373,83,403,84,350,96,428,100,399,101,318,105,373,110,354,164,377,247,340,260,428,270,373,311,394,312,403,355,373,490,321],
+    "medicinalment": [162,618,189,701],
+    "mediterrane": [114,459,151,420,158,496,159,464,170,485,173,469,176,459,179,545,192,532,492,331],
+    "mediterranean": [114,781,156,559,170,603],
+    "medlar": [170,694],
+    "medul": [93,474,580,479,632,479,644,450,658,459,660,736,662,474,684,485,728,628,786,637],
+    "medular": [739,553],
+    "meeting": [8,822],
+    "meibomi": [950,686],
+    "meiosi": [736,534],
+    "mejill": [710,512,847,502,859,527],
+    "mejor": [68,538,78,352,213,321,233,295,256,444,257,356,267,334,297,405,304,390,347,356,351,341,352,352,353,345,356,349,358,321,359,341,363,381,371,477,374,364,378,331,463,275,467,373,473,356,508,401,509,334,510,334,511,460,512,450,513,470,516,324,518,331,520,338,759,324],
+    "mejoram": [11,606],
+    "mejoran": [3,522,11,738,462,502],
+    "mejorand": [446,727,460,558],
+    "mejorar": [15,412,78,394,104,307,123,447,197,453,203,279,205,366,209,363,213,359,226,398,233,330,235,394,265,398,268,349,272,324,279,359,411,447,470,256,483,366,511,374,512,504,516,363],
+    "mel": [457,833],
+    "melaleuc": [128,991],
+    "melanin": [844,595],
+    "melanocit": [681,554,844,517,860,532],
+    "melanocitic": [860,856],
+    "melanom": [844,895,845,762],
+    "melanosporum": [291,880],
+    "melasm": [859,850],
+    "melatonin": [914,492],
+    "melen": [268,976],
+    "melilot": [257,1206],
+    "melilotu": [257,925],
+    "melis": [24,758,59,460,88,609],
+    "meliss": [24,889,88,975],
+    "mell": [14,543],
+    "mellitu": [635,735,711,705,712,705,936,551],
+    "melocoton": [347,632,396,587],
+    "melocotoner": [384,595],
+    "melogold": [334,1258],
+    "melon": [456,1166,457,1147],
+    "meloner": [457,589],
+    "membran": [550,619,600,519,614,464,673,507,708,549,709,424,851,420,871,436,935,428,952,496],
+    "membranaceu": [200,939],
+    "membrill": [193,701,388,834],
+    "membriller": [193,913,388,612],
+    "memori": [68,613,235,456,256,575,359,442,511,595,516,419,518,428,609,424,641,604,739,371,751,432,934,392],
+    "men": [426,535,518,420,568,479,609,416,736,352,823,404,836,602,908,404,915,400,916,519,918,375,919,378,921,638],
+    "men1": [727,569,738,569],
+    "mendar": [11,606],
+    "mengraner": [455,568],
+    "menier": [645,623,942,596,943,754],
+    "menisc": [765,558],
+    "menopausi": [10,324,55,471,234,461,261,513,519,461,808,427,809,439,812,622],
+    "menopausic": [234,581,722,599],
+    "menor": [185,792,263,823,866,648,867,458,952,567],
+    "menstruacion": [57,483,519,488,630,513,733,431,804,644,812,469],
+    "menstrual": [52,294,53,336,151,362,177,380,178,388,229,373,253,373,390,369,700,362,715,471,720,377,731,366,804,502,806,369,812,513,813,352,823,369,837,339,917,369],
+    "ment": [4,823,5,792,10,317,24,351,56,378,78,797,273,495,293,518,313,849],
+    "mental": [209,412,233,375,508,349,516,412,641,434,671,463,898,408,899,371,904,327,912,284,924,332,931,327,933,371],
+    "menth": [4,648,5,691,78,762,313,791],
+    "mentir": [925,589],
+    "menud": [361,394,500,358,529,390,608,369,616,369,619,347,644,358,656,418,670,499,710,327,806,340,819,313,821,334,822,361,824,343,827,315,828,321,831,327,841,321,855,310,874,361,883,347,886,390,890,324,921,327,938,350],
+    "meon": [469,563],
+    "mercadel": [44,679],
+    "merecen": [927,481],
+    "meridian": [450,850],
+    "mermasangr": [10,408,37,528],
+    "mermelad": [126,575,416,709],
+    "meruendan": [73,543],
+    "mes": [708,408,710,442,908,460,916,408,918,426,920,438,921,442],
+    "mescal": [489,932],
+    "mescalin": [489,694],
+    "mesenteri": [887,664],
+    "mesenteric": [599,878,887,1019],
+    "meshim": [283,701],
+    "meshimakobu": [283,701],
+    "mesoteliom": [557,925],
+    "met": [923,512],
+    "metabolic": [76,455,301,578,634,483,636,499,711,455,721,643,890,438],
+    "metabolism": [76,606],
+    "metacromatic": [671,939],
+    "metal": [6,575,296,709],
+    "metaneumoviru": [547,734],
+    "metapneumoviru": [547,968],
+    "metastasi": [846,553,874,599],
+    "methi": [32,500,452,518],
+    "methysticum": [84,874],
+    "mexic": [184,581,187,603,189,588,250,555,251,568,492,366],
+    "mexican": [35,651,122,392,150,573,161,491,183,736,190,515,262,569,324,593,373,485,485,352,491,473,493,695,507,453],
+    "meyenii": [204,874],
+    "mezcl": [84,548,221,527,361,616],
+    "miasteni": [688,834,752,989],
+    "miccion": [277,513,635,471,711,443,712,443,721,448,727,452,729,461,816,427],
+    "miceli": [267,593,269,548],
+    "mich": [199,706],
+    "michu": [144,709],
+    "mickey": [456,443],
+    "micosi": [842,856],
+    "microalg": [295,810],
+    "micropen": [734,558],
+    "microphyll": [421,1032],
+    "microscopic": [841,578],
+    "mied": [610,469,898,432,900,586,901,567,905,416,906,696,907,556,909,738,922,380,929,293],
+    "miel": [41,518,849,523],
+    "mielin": [642,676,684,639],
+    "mielopati": [660,932],
+    "miembr": [83,726],
+    "mientr": [141,770],
+    "migracion": [734,558],
+    "migran": [638,816,645,623,677,522],
+    "migratori": [727,618],
+    "mikani": [99,1007],
+    "mil": [52,488],
+    "mileni": [82,618],
+    "milenram": [52,669,255,981],
+    "milflor": [52,488],
+    "milfoil": [52,669,255,653],
+    "milgran": [455,568],
+    "milhoj": [52,488],
+    "milk": [503,874],
+    "milkvetch": [200,1059],
+    "milkwort": [235,919],
+    "millefolium": [52,669,255,872],
+    "miller": [61,796],
+    "millon": [260,770],
+    "milluku": [222,664],
+    "milp": [35,612],
+    "mineral": [149,440,185,472,196,509,289,399,295,502,300,483,306,472,377,407,399,445,423,445,432,466,437,425,439,440,442,483,760,352,778,557,813,362],
+    "mineralizacion": [743,664],
+    "mineralizant": [289,644],
+    "mineri": [559,717],
+    "mingraner": [359,657],
+    "mini": [663,637],
+    "miniatur": [329,694],
+    "minor": [309,976],
+    "mint": [4,912,5,934,24,565,34,879,59,596,313,555],
+    "minut": [609,548,610,583,835,512],
+    "miocardi": [604,764,613,816,629,583],
+    "miocardiopati": [615,846,676,593],
+    "miocarditi": [613,939],
+    "mioclonic": [667,1111],
+    "miodesopsi": [707,606],
+    "miofascial": [774,833],
+    "miom": [806,856],
+    "miopati": [748,759,750,781,753,804],
+    "miopi": [946,822],
+    "miositi": [753,925],
+    "miracl": [488,767],
+    "mirasol": [243,650],
+    "miristic": [468,761],
+    "mirt": [158,981,180,581],
+    "mirtil": [73,472,153,507,425,548],
+    "mirtill": [73,543],
+    "miruendan": [73,543],
+    "miserabl": [930,573],
+    "mistic": [250,717],
+    "mitocondrial": [669,650],
+    "moc": [540,538,584,684],
+    "mocamb": [462,578],
+    "moderacion": [468,761],
+    "modular": [270,671],
+    "moh": [525,543,558,616,682,543],
+    "mold": [883,1078],
+    "molest": [79,671],
+    "molesti": [60,416,135,507,522,479,567,474,588,436,776,485,818,436,819,393,829,400,843,416],
+    "molid": [470,382,477,669,481,554],
+    "molina": [420,1024],
+    "molleric": [287,612],
+    "molusc": [850,801],
+    "moment": [762,548,812,558],
+    "monard": [43,984],
+    "money": [501,880],
+    "mongolian": [200,701],
+    "monj": [151,553,178,593],
+    "monk": [45,565,151,734,178,559],
+    "monkey": [132,762,268,553],
+    "monnieri": [511,816,516,799],
+    "monogyn": [122,772,415,899],
+    "monoinsaturad": [438,653,441,676],
+    "mononucleosi": [873,833],
+    "monosomi": [735,1041],
+    "mont": [4,416,27,483,30,751,73,420,229,478,253,478],
+    "montan": [27,861,30,776,58,438,210,509,242,846],
+    "montanism": [537,595],
+    "montanos": [508,529],
+    "montesin": [27,575,58,505],
+    "moolian": [506,743],
+    "moonseed": [517,912],
+    "moque": [543,612],
+    "mor": [36,561,147,775,205,461,392,799,394,537,422,537,423,698,424,578],
+    "morad": [0,471,49,525,225,442,241,514,626,489],
+    "moraduix": [11,606],
+    "moraj": [203,718],
+    "moral": [147,1179],
+    "moraton": [242,701],
+    "morchell": [290,806],
+    "mordedur": [867,573],
+    "morel": [290,1133],
+    "morer": [147,701],
+    "moreton": [631,590,632,596,700,522],
+    "morifolium": [245,886],
+    "morill": [290,563],
+    "morind": [194,999],
+    "moring": [101,1238],
+    "morir": [900,595],
+    "morisc": [11,503,13,523,156,534,237,523],
+    "morquer": [27,624],
+    "morrin": [386,767],
+    "morron": [470,1036],
+    "mortal": [893,600],
+    "moru": [147,939],
+    "morun": [10,443],
+    "mos": [303,726],
+    "mosaicism": [735,625,736,492],
+    "mosc": [707,606],
+    "moscad": [468,958,474,936,476,577],
+    "mosquit": [319,638,656,653,877,798],
+    "mossy": [494,839],
+    "mostaz": [33,720,215,476,443,899,469,968],
+    "mostrab": [923,512],
+    "mostrad": [280,679],
+    "mot": [29,518,429,605],
+    "motead": [499,657],
+    "motilidad": [595,743],
+    "motiv": [895,612],
+    "motivacion": [902,581,923,472],
+    "motor": [650,483,658,851,669,503,672,530,676,498,718,519],
+    "mottled": [282,679],
+    "mountain": [27,671,73,420,126,671,153,640,242,542,425,675],
+    "mover": [699,399,745,493,762,460,766,409,768,413,771,439],
+    "movers": [650,543,750,571,761,507],
+    "movilidad": [675,686],
+    "movimient": [540,331,595,422,627,334,639,412,640,537,645,541,652,389,699,293,706,334,742,373,744,325,745,362,746,341,747,373,756,322,757,470,768,303,772,344,773,377,774,473,892,293,931,417,942,389,948,385],
+    "moy": [199,706],
+    "mtc": [226,739,227,548,228,542,229,494,235,734],
+    "much": [78,409,102,373,139,423,208,388,225,333,231,380,316,428,379,414,464,377,482,384,544,405,557,414,621,373,626,369,760,342,844,359,876,373,927,290,933,339],
+    "mucilag": [49,571,193,661,207,559],
+    "mucilaginos": [222,612,303,668],
+    "mucos": [49,426,75,386,193,494,206,418,207,418,360,405,410,422,550,418,553,440,708,510,709,551,851,548,871,405,941,405],
+    "mucosidad": [9,455,48,530,249,561,522,530,540,451,558,548],
+    "mucoviscidosi": [540,828],
+    "mud": [10,443],
+    "muel": [20,661,466,668],
+    "muert": [44,496,262,726,289,741,604,466,629,667,837,590,858,435,899,412],
+    "muev": [942,686],
+    "mueven": [597,653,942,632],
+    "muguet": [259,1030],
+    "mugwort": [53,944,54,629],
+    "mujer": [52,334,519,432,715,369,722,445,734,382,735,465,809,411,813,400,824,423,825,590,888,436],
+    "mulberry": [147,939],
+    "mullein": [48,1206],
+    "multipl": [67,424,110,389,380,402,509,393,539,393,642,592,684,570,708,332,726,419,727,378,738,527,739,486,786,557,810,385,814,397,829,350,831,360,832,316],
+    "multitud": [906,525],
+    "mum": [245,644],
+    "munchausen": [933,806],
+    "mund": [355,583,367,583,377,571],
+    "mundill": [177,631],
+    "munec": [699,388,706,442,709,455,744,715,756,609,768,862,863,426],
+    "murgul": [290,806],
+    "muricat": [357,968],
+    "murmull": [622,868],
+    "murt": [158,709],
+    "murtill": [420,1024],
+    "murugul": [290,563],
+    "mus": [378,880],
+    "muscul": [595,400,603,354,604,343,605,350,606,330,615,366,650,336,676,347,688,555,691,330,692,330,739,298,745,343,747,354,748,340,749,502,750,354,752,293,753,370,754,413,755,290,756,437,757,446,767,288,774,317,779,354,797,340,809,455,834,309],
+    "muscular": [33,277,56,235,112,283,177,280,229,274,242,311,349,301,443,326,469,250,515,274,542,292,565,283,586,298,626,272,640,315,643,308,644,286,650,385,651,267,654,315,655,408,657,295,658,399,660,308,671,311,675,411,676,393,688,295,691,438,692,380,697,298,716,280,724,315,736,237,741,241,743,295,748,535,749,549,750,455,752,410,753,498,756,252,757,544,761,367,773,295,774,525,795,308,806,272,813,259,826,239,888,391,891,301,895,272,948,301],
+    "musculoesqueletic": [751,1092],
+    "musg": [303,1077],
+    "mushroom": [265,438,268,539,271,411,272,356,274,685,275,617,276,688,278,448,283,448,284,654,285,448,286,366,290,359,293,614,294,591],
+    "musk": [752,543],
+    "muskmelon": [457,833],
+    "muskrat": [209,624],
+    "musl": [691,532,826,468,847,502],
+    "mustard": [33,1065,215,710,469,946],
+    "mutacion": [540,309,623,340,632,363,652,363,654,375,657,351,659,355,664,379,667,355,669,344,676,340,677,317,718,355,734,295,737,344,738,327,741,287,748,333,750,347,769,298,770,303,791,309,807,309,817,303,858,314,860,324,872,317,878,379,882,359,888,337,892,273],
+    "mutism": [908,856],
+    "muy": [199,470],
+    "mycobacterium": [530,686],
+    "myrciari": [367,840,370,885],
+    "myristic": [468,913,474,885],
+    "myrobalan": [513,905],
+    "myrtillu": [73,786],
+    "myrtl": [158,925,180,871,381,480],
+    "myrtu": [158,872,180,805],
+    "nab": [215,1105,217,605],
+    "nabolz": [215,573],
+    "nabon": [218,624],
+    "nac": [736,534],
+    "nacer": [621,537,903,489,940,559],
+    "nacimient": [621,823,763,494,903,467,945,582],
+    "nagali": [218,624],
+    "nagami": [326,679],
+    "nahuatl": [161,378,243,488,346,510,360,469,386,394,428,545,453,533],
+    "naked": [503,874],
+    "nalg": [802,664],
+    "nam": [225,553],
+    "nampi": [225,553],
+    "nan": [3,553,346,625],
+    "naranj": [43,550,148,863,240,831,321,891,326,816,329,507,330,557,853,439],
+    "naranjer": [321,709],
+    "narcisism": [927,718],
+    "narcisist": [927,718],
+    "narcotic": [82,862],
+    "nariz": [269,392,525,573,526,385,541,606,550,425,682,412,700,396,841,382,849,375,859,400,940,585,941,658,952,624],
+    "nasal": [42,462,211,385,525,393,526,605,541,427,543,385,545,473,546,441,547,462,601,397,682,393,871,393,940,744,941,678,952,744,953,666],
+    "nashi": [405,984],
+    "nasturtium": [45,885,224,522,312,835],
+    "natan": [316,946],
+    "nativ": [206,534,208,534,420,664,518,529],
+    "natural": [17,330,20,399,32,302,41,448,45,361,82,343,117,418,128,423,144,394,145,428,197,433,297,433,319,408,354,385,356,373,362,451,366,408,381,307,385,321,388,369,437,381,755,299,812,337,934,324,936,369,944,347],
+    "naturalez": [934,584],
+    "naturalment": [810,631],
+    "nause": [18,355,561,376,569,380,570,371,571,329,572,376,573,340,576,410,577,380,578,332,579,319,581,448,582,363,589,340,591,340,592,359,595,376,597,359,599,363,600,376,603,332,638,355,645,363,648,329,666,359,695,351,723,343,777,329,778,332,780,340,785,376,822,329,887,336,937,285,942,347,957,355],
+    "nav": [224,600],
+    "naval": [560,650],
+    "navel": [321,709],
+    "navi": [224,600],
+    "navidad": [861,910],
+    "necesariament": [848,595],
+    "necesidad": [564,390,569,409,584,404,599,390,628,340,729,343,775,340,776,377,778,358,779,358,782,365,787,409,788,369,789,404,796,386,806,333,807,318,816,318,817,312,821,327,898,336,913,428,926,336,927,391,929,353,944,340,946,315,947,343],
+    "necesit": [357,734],
+    "necesitar": [927,481],
+    "necrolitic": [727,618],
+    "necrotizant": [669,892],
+    "nectar": [517,671],
+    "nectarin": [384,548,395,1078],
+    "needl": [275,543,495,895],
+    "neem": [110,1232],
+    "nefriti": [783,961],
+    "nefrolitiasi": [778,899],
+    "nefropati": [801,912],
+    "nefrosi": [784,954],
+    "nefrotic": [784,878,793,899],
+    "negativ": [899,435,900,460,901,439,907,427,912,511,928,464],
+    "negativament": [904,496],
+    "negatividad": [932,644],
+    "negligenci": [905,517,922,472,929,364],
+    "negr": [31,455,33,493,108,314,140,432,147,398,154,622,159,377,171,578,218,354,234,496,289,365,291,617,403,652,408,486,417,460,459,446,467,608,469,535,471,325,754,298,837,319,843,338,857,369,860,348],
+    "negrill": [87,701],
+    "negruzc": [860,612],
+    "neguill": [459,543],
+    "neisseri": [825,618],
+    "nelumb": [247,788,458,918],
+    "nem1": [738,862],
+    "nem2": [739,796],
+    "nenufar": [311,1065],
+    "neoplasi": [649,756,726,548,727,494,738,688,739,636],
+    "nephelium": [353,905],
+    "nervi": [24,279,39,250,47,398,148,362,240,358,594,432,642,417,643,639,644,503,657,514,688,377,699,293,744,622,749,394,750,373,754,435,764,532,767,632,779,373,815,334,862,328,892,293,937,319,957,642],
+    "nervios": [26,447,184,535,205,343,209,340,236,369,237,343,244,504,252,327,254,500,268,327,311,386,432,409,471,312,515,336,516,340,565,347,586,365,643,377,650,340,652,373,654,386,655,369,659,365,669,354,671,511,684,507,732,340,741,296],
+    "nerviosism": [239,575,714,618],
+    "nest": [214,606],
+    "nettl": [52,669,79,1023],
+    "neumoni": [523,667,536,486,538,461,543,448,547,537,551,471,552,423,554,525],
+    "neumotorax": [537,772,888,587],
+    "neuquen": [132,584],
+    "neural": [258,637],
+    "neuralgi": [258,554,643,810,767,674],
+    "neuriti": [957,939],
+    "neurobiologi": [927,481],
+    "neurobiologic": [926,618],
+    "neurocisticercosi": [661,946],
+    "neurodegenerativ": [658,605,669,599],
+    "neurodesarroll": [918,568],
+    "neurogenic": [786,1111],
+    "neurologic": [639,488,655,456,661,636,664,482,668,400,674,442,786,451,814,437,828,388,893,403,931,651,954,442],
+    "neurometabolic": [669,650],
+    "neuromuscular": [688,551,750,914,752,451,763,494],
+    "neuron": [268,498,640,589,650,518,658,914],
+    "neuronal": [734,558],
+    "neuroniti": [666,872,942,632],
+    "neuropati": [644,1092],
+    "neuropatic": [643,859,660,639],
+    "neuroprotector": [228,485,235,485,268,429,272,398,293,518,432,537,434,544,511,460,516,446],
+    "neurotransmisor": [914,453,920,538],
+    "neutropeni": [676,886],
+    "nev": [860,788,882,625],
+    "new": [161,464,223,767],
+    "nhlrc1": [667,671],
+    "nib": [462,578],
+    "nicotin": [610,671],
+    "nicturi": [787,984],
+    "niev": [177,581,272,738],
+    "nigel": [31,558],
+    "nigell": [31,944,459,1031],
+    "night": [486,589],
+    "nightshad": [97,946],
+    "nigr": [33,651,75,630,140,744,147,705,161,559,443,727,469,605],
+    "nigrum": [154,741,403,741,417,857,467,791],
+    "nikolsky": [851,600],
+    "nil": [247,564,458,575],
+    "nim": [110,1141],
+    "nimtre": [110,880],
+    "nin": [16,431,221,381,546,441,622,393,719,546,732,546,733,589,734,351,737,409,771,357,795,436,849,510,850,351,884,409,918,357,938,397],
+    "ninez": [719,918,912,397],
+    "ningun": [693,632,923,472],
+    "ninjin": [77,664],
+    "niquel": [839,595],
+    "nisper": [397,984],
+    "nistagm": [645,661,942,632],
+    "nitrogen": [319,734],
+    "nivel": [19,387,109,383,120,358,147,374,205,337,224,320,266,347,276,333,280,362,284,351,386,280,552,309,556,554,572,397,633,340,634,473,715,287,716,337,721,327,722,347,724,505,725,370,727,330,736,285,758,324,813,312,835,314,865,330,914,390,921,314],
+    "nobili": [9,833],
+    "noch": [526,408,699,361,729,441,746,420,787,687,816,408,817,400,863,397,936,464,946,404],
+    "nociv": [531,612],
+    "nocturi": [729,581,787,906],
+    "nocturn": [530,515,612,478,812,455,872,451,874,488,876,464,945,527],
+    "nodul": [706,421,714,479,725,495,740,524,837,402,846,429,862,683,865,442,866,406],
+    "nodular": [862,1042],
+    "nogal": [68,618,120,1070],
+    "noguer": [120,671],
+    "nombr": [255,567,289,514,490,462,492,378,515,494],
+    "noni": [194,999],
+    "nootrop": [268,600],
+    "nootropic": [256,612],
+    "nopal": [485,872,492,823,507,910],
+    "noradrenalin": [728,657],
+    "nori": [299,1168],
+    "norm": [930,573],
+    "normal": [595,509,609,432,610,460,688,455,701,423,731,415,760,389,770,392,810,432,864,382,944,428],
+    "normalment": [682,543,733,485,804,512],
+    "norotil": [51,543],
+    "noroviru": [582,717],
+    "nort": [115,545,202,540,206,534,518,529],
+    "norteameric": [150,624],
+    "norteamerican": [182,800],
+    "norten": [66,618,108,509],
+    "northern": [153,538,425,581],
+    "norwegian": [26,822],
+    "nos": [52,727],
+    "not": [233,568],
+    "notabl": [754,525],
+    "notch3": [677,600],
+    "notori": [869,500],
+    "novi": [163,657],
+    "nub": [272,558],
+    "nublad": [936,664],
+    "nucal": [885,624],
+    "nucifer": [247,744,356,792,458,754],
+    "nucipersic": [395,925],
+    "nuclear": [669,650],
+    "nud": [749,639,774,767],
+    "nudill": [692,612],
+    "nuec": [434,632,437,569,438,589,441,609],
+    "nuev": [612,554,844,517,846,522],
+    "nuez": [316,496,434,693,437,647,438,794,441,677,465,747,468,770,474,753,476,464,817,400],
+    "numer": [676,593,886,646],
+    "numeros": [490,533,791,538],
+    "nut": [437,768,440,785,441,804,465,933],
+    "nutmeg": [31,696,459,472,468,861],
+    "nutrient": [78,510,167,478,198,571,294,515,299,571,446,593,467,716],
+    "nutrir": [228,625,229,569],
+    "nutritiv": [7,253,67,337,87,341,101,279,132,402,136,333,137,463,154,316,204,307,212,422,221,413,222,440,223,286,225,387,231,307,232,316,261,341,294,333,295,394,297,379,303,353,312,353,316,460,317,474,354,337,360,422,362,276,363,357,366,357,368,345,371,446,377,319,399,349,429,319,430,345,431,379,433,365,453,345,456,215,457,286,458,304],
+    "nymphae": [311,946],
+    "oak": [118,961,124,882,125,875],
+    "obesidad": [301,442,532,351,555,377,563,381,583,403,590,377,601,362,626,351,633,366,634,370,636,520,711,348,721,351,730,341,755,309,764,320,772,348,773,381,790,422,809,345,814,373,817,329,831,338],
+    "obi": [465,612],
+    "objet": [651,420,691,428,746,420,756,397,757,408,850,390,909,738,944,606,946,574,947,611],
+    "obliquu": [269,839],
+    "obliterant": [624,874],
+    "oblong": [193,913,388,834],
+    "observacion": [909,521],
+    "observad": [901,568],
+    "observan": [670,657],
+    "obsesion": [898,862],
+    "obsesiv": [898,749,912,374,930,710],
+    "obsolet": [162,618,164,625],
+    "obstinacion": [930,573],
+    "obstruccion": [524,344,529,398,532,348,553,385,568,412,577,427,579,358,604,362,620,341,627,473,777,369,780,381,785,422,796,403,820,338,821,341,823,348,837,319,857,369,877,385,880,398,885,354,950,389,951,407],
+    "obstructiv": [524,850],
+    "obstruy": [548,593,847,533],
+    "obtener": [555,605,929,386],
+    "obtien": [199,470],
+    "obviament": [920,584],
+    "oca": [223,1150],
+    "ocasion": [860,612],
+    "ocasional": [866,568],
+    "occidental": [93,590,381,480,439,822],
+    "oci": [930,573],
+    "ocimum": [0,767,510,816],
+    "ocular": [50,407,214,344,299,432,347,389,373,417,374,398,376,417,377,373,381,314,425,358,436,437,440,537,645,407,702,373,703,385,705,348,707,482,935,348,937,618,942,389,946,328,947,496,948,385,949,341],
+    "ocultar": [912,661],
+    "ocupacion": [766,529],
+    "ocupacional": [559,661,560,599],
+    "ocurr": [533,352,537,345,590,382,599,417,677,349,678,374,687,366,695,403,696,356,697,390,763,345,770,333,772,352,795,403,809,349,819,327,820,345,834,333,835,484,837,327,875,382,914,286],
+    "ocurren": [722,650],
+    "ocurrir": [701,513,799,534,800,557,899,467],
+    "odham": [161,504],
+    "odorat": [34,705,241,770,482,764],
+    "oenother": [261,939],
+    "official": [36,767],
+    "officinal": [18,726,30,648,67,721,203,555,237,675,312,743],
+    "officinali": [1,614,10,425,24,460,28,578,36,482,44,578,46,595,56,485,88,666,100,674,130,628,207,557,230,586,254,578,257,582,271,557],
+    "ofrec": [290,563],
+    "oid": [601,451,645,512,666,761,938,812,939,809,942,490,943,770,955,806,956,776],
+    "oil": [8,714,39,584,89,798],
+    "ojill": [39,440],
+    "ojo": [50,390,245,350,436,419,525,472,526,318,541,369,544,496,592,386,612,347,682,472,685,343,689,500,699,281,707,463,710,321,840,358,843,456,845,318,935,612,936,493,937,439,944,472,945,382,946,315,947,343,948,654,949,576,950,373],
+    "old": [52,631,54,593,252,522],
+    "ole": [109,954],
+    "oleifer": [101,952],
+    "olerace": [196,904,219,744,412,897],
+    "olfat": [526,484,734,665,941,518,953,939],
+    "olfatori": [734,558],
+    "oliv": [109,1166,441,676],
+    "olivardill": [174,694],
+    "oliver": [58,505,109,661],
+    "olluc": [222,664],
+    "olm": [87,1059],
+    "olor": [20,619,47,455,194,500,241,418,252,390,257,445,354,450,466,744,478,450,775,405,777,422,805,355,810,409,829,372],
+    "oloros": [47,701],
+    "olvid": [903,563],
+    "omblig": [616,612,797,581],
+    "omeg": [46,589,261,582,427,609,434,632],
+    "omich": [509,644],
+    "omij": [509,644],
+    "omoplat": [578,605,763,548],
+    "onagr": [261,1059],
+    "oncologic": [627,589],
+    "ondd": [287,612],
+    "ondulad": [863,568],
+    "one": [122,839],
+    "onion": [13,874],
+    "onkuch": [225,553],
+    "ooforiti": [805,791],
+    "opacidad": [936,1030],
+    "opium": [91,912],
+    "opresion": [521,515,524,455,537,447,555,493,560,488,605,488,740,551],
+    "opresiv": [603,657],
+    "optic": [937,563],
+    "opulu": [177,874],
+    "opunti": [485,872,492,823,507,974],
+    "oral": [84,504,89,542,808,466,824,494,825,494],
+    "orang": [43,738,148,856,180,474,240,853,321,853,323,545,329,521],
+    "orangeroot": [206,644],
+    "orchard": [382,624],
+    "orden": [28,590,898,537,930,710],
+    "oregan": [0,471,2,520,3,1019,11,484,175,509],
+    "oreganin": [3,600],
+    "oregon": [169,1101],
+    "orej": [48,548,173,536,272,819,279,901,735,542],
+    "orejon": [3,600],
+    "orellan": [276,624],
+    "orellaz": [290,563],
+    "oreng": [3,600],
+    "organ": [491,771,539,418,540,537,557,445,579,409,600,482,659,436,678,418,683,397,805,355,809,634,831,382,846,390,893,390],
+    "organism": [25,589,78,563,517,557,632,569],
+    "orgasm": [836,1162],
+    "orgasmic": [836,912],
+    "orient": [247,612],
+    "oriental": [398,606],
+    "origanum": [3,777,11,783],
+    "origin": [754,483,872,553],
+    "originad": [891,679],
+    "original": [107,684,465,564],
+    "originari": [76,393,84,409,90,476,98,482,106,450,110,413,132,379,184,488,202,422,251,476,414,506,424,512,505,500,513,431],
+    "orin": [570,392,631,362,700,320,729,337,775,333,776,370,777,347,778,480,779,547,780,358,782,358,783,513,784,383,785,397,786,358,789,397,790,392,791,312,792,505,793,521,794,347,795,370,796,379,801,487,802,483,803,501,816,312,817,436,831,314,881,632],
+    "orinar": [693,381,729,350,775,482,776,518,778,365,779,499,782,507,787,546,788,377,789,542,796,394,798,373,803,522,805,304,806,340,807,324,808,324,810,350,815,463,816,460,817,454,821,469,824,343,825,343,829,318,881,394],
+    "ornamental": [108,415,162,504,166,539,168,515,311,533,470,330,493,521],
+    "oro": [44,762,206,841,275,489,362,471],
+    "oroblanc": [332,727,333,1155],
+    "oronj": [294,1121],
+    "orosu": [201,671],
+    "oroval": [205,631],
+    "orozu": [201,671],
+    "orozuz": [201,671],
+    "orpin": [508,771],
+    "orquiti": [822,892],
+    "ortig": [79,1162],
+    "ortiguer": [55,644],
+    "orug": [267,644],
+    "orval": [205,631],
+    "orzuel": [951,954],
+    "oscur": [306,557,370,531,570,537,626,448,692,448,859,718,864,408,869,541],
+    "oscurecimient": [687,631],
+    "ose": [92,482,300,506,353,431,379,445,432,488,439,614,632,445,722,661,723,440,738,559,743,718,760,614,762,684,770,778],
+    "oseltamivir": [472,534],
+    "osh": [208,1013],
+    "oso": [152,653,413,899],
+    "ostent": [367,671],
+    "osteoartriti": [742,545,755,447,765,463,772,705],
+    "osteoartrosi": [773,905],
+    "osteomalaci": [743,905],
+    "osteopeni": [760,947],
+    "osteoporosi": [722,775,760,898,762,517],
+    "ostr": [276,1172],
+    "ostreatu": [276,868],
+    "osweg": [43,752],
+    "otalgi": [938,631],
+    "otiti": [938,874],
+    "otomac": [345,644],
+    "otsalizarr": [126,624],
+    "oval": [326,679],
+    "ovalad": [698,489,861,640,869,415,889,523],
+    "ovari": [715,805,732,499,735,542,807,916,812,679],
+    "ovat": [461,792,501,810],
+    "ovill": [641,657],
+    "ovul": [736,492,830,558],
+    "ovulacion": [823,612],
+    "oxalat": [778,657],
+    "oxali": [223,833],
+    "oxidativ": [284,571,352,590,412,704],
+    "oxigen": [552,502,556,953,606,532],
+    "oxigenant": [318,752],
+    "oxigenar": [318,752],
+    "oyster": [276,992,284,828],
+    "pachanoi": [496,905],
+    "pacharan": [401,790],
+    "pachycereu": [491,954],
+    "pacific": [366,734],
+    "paclitaxel": [121,780],
+    "paddy": [456,443],
+    "paddymelon": [456,443],
+    "padec": [717,612],
+    "padecer": [931,496],
+    "padm": [458,624],
+    "padr": [791,687,909,432,923,425,927,399],
+    "padron": [470,440],
+    "paeoni": [229,794,253,794],
+    "pai": [10,385,369,493,389,480],
+    "paic": [35,612],
+    "pajar": [215,573],
+    "pajet": [39,440],
+    "pal": [101,458,180,698,362,454,485,427,492,567],
+    "palabr": [665,919],
+    "paladar": [525,575,682,575],
+    "paler": [485,492,492,436],
+    "palid": [624,523,630,551,686,518,696,508],
+    "palidez": [800,618,894,625],
+    "palill": [17,806,475,836,531,508,560,540],
+    "pallid": [188,984],
+    "pallidum": [828,578],
+    "palm": [29,435,495,648,766,409,828,447,848,460,858,460],
+    "palmari": [300,1007],
+    "palmat": [300,1007],
+    "palmead": [735,679],
+    "palmer": [196,821],
+    "palodul": [201,671],
+    "palodulc": [201,671],
+    "paloduz": [201,671],
+    "palosant": [398,606],
+    "palpabl": [749,639,774,543],
+    "palpacion": [771,568],
+    "palpitacion": [607,498,608,513,610,519,613,542,728,508,900,460],
+    "pampajarit": [494,595],
+    "pampanill": [36,525],
+    "pamplemus": [325,717],
+    "pan": [136,596,379,596,494,517],
+    "panam": [329,694],
+    "panax": [77,834,518,810],
+    "pancre": [572,818,592,853,659,504,693,515,712,638,726,695,727,647],
+    "pancreatic": [446,790],
+    "pancreatiti": [572,848,592,616,634,559],
+    "pandanu": [380,899],
+    "panecill": [49,657],
+    "panic": [555,571,900,966,906,666],
+    "pansy": [248,1071],
+    "pantorrill": [748,631],
+    "pap": [222,577,223,512,327,895],
+    "papai": [345,644],
+    "papain": [345,644],
+    "papantl": [471,573],
+    "papaver": [82,794,442,928],
+    "papay": [345,1145],
+    "papel": [585,646,847,533],
+    "paper": [822,650],
+    "papilom": [808,507,827,823,843,729],
+    "paprik": [470,440],
+    "papul": [866,568],
+    "par": [629,912],
+    "paradis": [382,624],
+    "paraguariensi": [69,899,198,913],
+    "paraguay": [41,700,384,729,396,876],
+    "parainfluenz": [546,975,548,593],
+    "parais": [447,644],
+    "paralisi": [617,520,660,554,662,542,763,475,931,396],
+    "param": [129,595],
+    "paranasal": [526,719,941,543,953,609],
+    "paranoi": [920,828],
+    "paranoic": [924,504],
+    "paranoid": [922,786],
+    "parasit": [35,473,94,603,582,555,661,548,829,631,877,525],
+    "parasitari": [661,925,877,590,890,507],
+    "paratiroid": [723,959,724,653],
+    "paratiroide": [723,625,724,653],
+    "parch": [681,493,698,644,708,420,859,469,861,409,868,427],
+    "parchit": [349,679],
+    "parcial": [553,625,953,646],
+    "pard": [53,485,304,653,305,678],
+    "parec": [285,609,763,517,912,374],
+    "parecen": [497,701],
+    "parecid": [183,780],
+    "pared": [153,379,537,386,575,526,576,526,600,482,601,409,602,445,613,455,648,422,677,390,769,365,797,409,887,431,940,418],
+    "parej": [810,504,829,458,835,471,836,536,927,384],
+    "parient": [38,401,170,521,282,510,293,545,368,533,371,510,400,551],
+    "parietal": [696,612],
+    "parkinson": [580,569,640,943,786,557,814,540],
+    "parkinsonism": [653,650],
+    "paroxistic": [942,686],
+    "parpad": [688,499,692,460,752,408,865,806,935,643,950,905,951,917],
+    "parr": [389,940,454,921],
+    "parral": [454,529],
+    "parren": [454,529],
+    "parrer": [454,529],
+    "parrill": [154,599,403,599],
+    "parsley": [6,693,7,1025,25,756,208,708,448,489],
+    "parsnip": [216,948,221,558],
+    "part": [76,259,78,290,94,334,202,278,247,262,248,307,316,303,372,297,390,262,421,347,511,275,516,267,527,293,539,275,553,393,561,318,567,290,572,318,577,322,578,281,579,270,581,379,583,300,591,287,598,351,626,262,627,252,659,287,661,303,663,273,675,293,699,221,703,290,705,262,710,252,754,328,756,347,759,267,761,354,764,239,775,371,776,297,798,287,799,275,802,284,805,234,809,257,821,257,824,264,832,324,833,254,850,239,869,214,889,270,890,250,896,230,902,270,914,210,918,243,929,179],
+    "parthenium": [187,1007],
+    "partir": [557,596,868,480,944,543],
+    "partridgeberry": [153,538,425,581],
+    "parvifolium": [426,1032],
+    "pas": [594,761],
+    "pasad": [176,605,901,523],
+    "pasaj": [767,534],
+    "pasand": [74,679],
+    "pasar": [698,589],
+    "pasatiemp": [766,529],
+    "pasiflor": [70,899],
+    "pasion": [70,828,349,846],
+    "pasionari": [70,899],
+    "passiflor": [70,828,349,846],
+    "passion": [70,657],
+    "passionflower": [70,899],
+    "past": [39,840,525,575],
+    "pastill": [859,606],
+    "pastinac": [216,1030],
+    "pastor": [10,443],
+    "pat": [215,528,281,479],
+    "patac": [220,817],
+    "patagoni": [414,718,421,746],
+    "patagonian": [133,954],
+    "pataxt": [462,578],
+    "patill": [456,819],
+    "patinoi": [366,968],
+    "patologic": [622,624],
+    "patron": [701,401,861,343,903,365,905,386,914,319,922,352,923,332,924,327,925,382,926,401,927,312,928,390,929,272,930,372],
+    "patxaran": [408,612],
+    "paullini": [197,928,464,799],
+    "paus": [532,564,549,575],
+    "pav": [270,1111],
+    "pazot": [35,612],
+    "pea": [256,1124],
+    "peach": [384,1063,396,1050],
+    "peanut": [453,946],
+    "pear": [149,878,383,814,485,707,486,455,492,659,507,715],
+    "pearl": [276,575,502,872],
+    "pearly": [500,886],
+    "pebbl": [498,892],
+    "pebret": [31,558],
+    "pebreter": [31,558],
+    "pec": [869,500],
+    "pecan": [438,1184],
+    "pech": [521,339,522,517,523,331,524,299,533,299,534,321,535,280,536,328,537,414,554,354,555,324,557,339,558,350,559,354,560,321,563,328,580,339,583,346,590,324,594,376,602,339,603,324,604,315,605,541,607,318,610,331,611,328,613,346,614,447,617,321,622,308,633,315,692,302,735,335,852,273,861,381,870,302,879,358,891,335],
+    "peciol": [40,701],
+    "pectin": [388,664],
+    "pectoral": [48,686],
+    "pectori": [605,892],
+    "peculiar": [232,599,380,605],
+    "pedr": [496,1157],
+    "peduncul": [386,525],
+    "pedunculad": [118,525],
+    "pedunculat": [118,767],
+    "pee": [203,481],
+    "peepar": [483,631],
+    "pegad": [935,612],
+    "pegajos": [159,577,540,507,929,364],
+    "pehuen": [132,828],
+    "pel": [682,543,910,848,955,537],
+    "peladill": [395,686],
+    "pelargonium": [252,844],
+    "peligr": [909,521],
+    "peligros": [162,557,164,563,171,540,176,545],
+    "pelonchili": [45,650],
+    "pelosill": [461,481],
+    "pelucid": [673,1077],
+    "pelud": [353,664],
+    "pelvi": [804,455,805,424,809,464,817,443,830,657,834,443],
+    "pelvic": [779,442,788,617,804,396,805,531,806,411,807,392,808,392,809,712,815,396,823,411,830,407,833,400],
+    "pempinel": [36,525],
+    "pen": [736,391,782,491,798,813,799,648,821,439,824,452,825,452,827,415],
+    "penc": [485,674,492,411,507,596],
+    "pencil": [503,874],
+    "pendul": [113,961],
+    "penetracion": [834,528,835,543],
+    "penetrant": [537,595],
+    "penfig": [851,844],
+    "penfigoid": [708,786],
+    "peninsul": [95,790],
+    "penny": [292,686],
+    "pennyroyal": [78,919],
+    "pennywort": [102,715,511,534,512,894,516,518],
+    "pensamient": [248,804,653,488,897,442,898,647,902,474,924,559,927,361],
+    "pensar": [903,518,907,509],
+    "pentandr": [139,939],
+    "peoni": [229,1039,253,988],
+    "peony": [229,913,253,988],
+    "pep": [430,946],
+    "pepit": [430,946],
+    "pepper": [52,480,84,416,129,392,151,557,178,425,211,565,233,375,467,629,470,780,473,611,479,737,483,714,484,708],
+    "peppercorn": [484,618],
+    "peppermint": [4,1008],
+    "pepperoncini": [470,440],
+    "peptic": [562,919],
+    "pequen": [37,248,66,291,103,311,108,239,152,307,157,297,161,218,170,300,174,300,193,329,218,270,232,282,239,270,246,297,252,260,309,322,352,294,358,268,367,291,378,276,393,260,404,255,494,257,500,279,537,257,539,279,546,304,575,351,579,273,585,304,587,314,612,276,625,255,670,285,686,270,698,255,709,262,736,231,747,285,760,246,792,307,817,248,826,233,827,246,841,356,843,363,847,356,850,347,855,241,857,282,861,229,863,351,864,241,866,351,867,248,871,376,890,253,950,297],
+    "per": [43,581,149,548,383,721,405,581,485,413,579,488],
+    "peral": [149,1046,383,639],
+    "percepcion": [936,577,939,754,948,590],
+    "perceptiv": [924,504],
+    "perciben": [922,543],
+    "percibid": [912,831,913,724],
+    "perdedor": [884,892],
+    "perdeklou": [498,650],
+    "perder": [76,503,277,582,900,494,914,408],
+    "perderl": [715,538],
+    "perdid": [71,241,298,276,351,236,526,209,528,238,530,246,531,220,533,217,539,231,557,246,560,233,566,246,571,233,573,241,577,270,586,327,588,224,589,241,590,236,591,327,592,339,594,273,596,345,617,233,628,224,629,327,630,238,632,246,635,231,639,260,640,254,641,236,644,231,645,257,650,224,657,238,660,334,662,243,663,229,664,257,666,339,668,301,669,233,671,337,681,316,685,226,687,226,693,246,694,233,695,249,696,220,697,241,698,299,712,217,714,241,722,233,726,246,727,222,748,226,750,236,759,224,760,204,772,217,773,238,779,395,781,257,790,263,807,209,833,348,872,215,874,233,876,222,880,252,884,320,896,362,907,285,910,215,915,217,929,150,931,178,933,202,934,209,937,202,938,226,939,224,941,224,942,246,943,311,944,311,948,243,953,406,954,236,955,222,956,229],
+    "perejil": [6,483,7,767,14,420,25,548,52,377,448,662],
+    "perejon": [383,694],
+    "perejonal": [383,694],
+    "perenn": [76,484,88,560,179,623,282,542,512,499],
+    "perenni": [246,925],
+    "perez": [686,624],
+    "perfeccionism": [912,374,913,472,930,710],
+    "perfect": [927,481],
+    "perfoliad": [490,578],
+    "perforacion": [956,880],
+    "perforad": [600,743],
+    "perforatum": [65,899],
+    "perfum": [870,612],
+    "pericardi": [614,905],
+    "pericarditi": [614,905],
+    "periferic": [618,751,644,841,657,551,937,467],
+    "perifoll": [25,946],
+    "perigord": [291,880],
+    "perill": [59,1120,756,523],
+    "perimetr": [880,701],
+    "period": [567,421,700,372,715,484,720,387,731,376,755,334,763,369,804,365,805,340,808,362,813,362,823,379,825,383,830,376,916,572,919,355,920,362],
+    "peritoniti": [600,899,880,865],
+    "perl": [502,946],
+    "perlad": [845,584],
+    "permanecer": [567,625,646,533],
+    "permanent": [538,631],
+    "permanezc": [795,694],
+    "pernicios": [696,856],
+    "perr": [156,559,461,418,494,517],
+    "perrer": [4,538],
+    "perrun": [546,646,548,816],
+    "persecucion": [920,584],
+    "persian": [114,545,120,557,175,529,450,503],
+    "persic": [384,729,395,804,396,764],
+    "persicari": [34,811],
+    "persim": [398,606],
+    "persimmon": [398,1120],
+    "persimon": [398,606],
+    "persistent": [521,366,531,327,533,324,539,344,540,312,559,383,560,347,588,463,606,327,616,354,632,366,649,379,774,314,807,312,808,312,834,306,841,309,852,425,862,309,872,320,891,362,895,327,898,330,901,303,913,419,915,454,917,327,918,303,924,269,940,344],
+    "persistentement": [896,538],
+    "person": [64,347,77,369,93,377,101,318,530,381,533,337,541,377,568,403,646,321,655,510,670,365,704,365,824,343,825,343,826,299,827,451,842,340,843,330,850,310,863,315,868,307,899,313,902,350,907,307,922,302,925,327],
+    "personal": [61,480,544,583,934,719],
+    "personalidad": [641,402,649,433,672,419,896,329,905,512,912,263,913,332,922,480,923,602,924,455,925,642,926,527,927,439,928,647,929,396,930,499,931,303,933,344],
+    "pertussi": [549,997],
+    "peruan": [362,568],
+    "peruvian": [204,805,221,558],
+    "pes": [71,317,76,286,298,363,351,310,530,324,531,289,533,286,539,304,540,275,557,324,566,324,573,317,588,295,589,317,590,310,591,317,592,335,594,359,596,342,606,289,632,324,635,304,685,298,687,298,693,324,694,307,697,317,712,286,713,339,714,317,715,254,716,298,727,292,784,339,790,346,793,351,807,275,813,275,872,283,874,307,876,292,896,254,903,265,904,234,914,232],
+    "pesad": [6,469,27,469,263,499,296,578,651,451,746,451,757,438],
+    "pesadez": [626,489,627,471,809,480,818,499,820,475],
+    "pesadill": [899,518,907,509],
+    "pesar": [89,563,258,529,289,534,823,508],
+    "pescad": [42,609,810,523,843,696,858,696],
+    "pescar": [176,657],
+    "pestan": [681,587,698,543],
+    "petal": [236,798,243,775,244,804],
+    "petequi": [700,600],
+    "petroselinum": [7,762],
+    "peumu": [106,932],
+    "pewen": [132,828],
+    "peyot": [489,1082,496,612],
+    "pezon": [730,806,731,883,735,563,823,508],
+    "phai": [34,568],
+    "phak": [34,568],
+    "phellinu": [283,1131],
+    "philadelphic": [373,968],
+    "philippin": [329,694],
+    "phlomi": [173,912],
+    "phyllanthu": [103,878,513,834],
+    "physali": [373,968],
+    "pic": [828,502,839,517,863,493],
+    "picad": [680,612],
+    "picadur": [656,601,840,525,849,454,866,454,877,542],
+    "picaespald": [85,563],
+    "pican": [680,564,862,533],
+    "picant": [34,389,42,503,211,770,215,392,218,428,224,411,312,497,484,423,494,407,581,441,841,396],
+    "picazon": [525,450,567,352,585,364,680,318,682,324,708,282,709,315,710,306,782,349,810,327,811,438,826,280,829,297,834,297,838,341,839,309,840,467,842,318,844,309,849,295,850,290,852,287,855,290,858,309,860,318,861,275,863,295,864,290,866,295,867,297,935,318,949,312,955,321],
+    "pickleweed": [308,709],
+    "picor": [96,639,862,480,870,508,911,484],
+    "picot": [386,525],
+    "pie": [40,355,456,224,606,310,611,336,618,458,624,548,625,298,626,310,630,336,644,448,657,521,675,347,690,307,696,310,699,261,704,332,705,433,711,307,717,310,719,316,755,272,761,295,764,405,767,563,780,340,781,363,783,367,792,359,797,319,801,340,802,336,827,287,828,293,831,298,858,301,867,290],
+    "piedr": [498,1093,778,828],
+    "piel": [23,235,44,217,46,227,49,210,96,246,104,169,110,204,113,187,120,215,123,246,128,243,137,229,150,200,156,206,158,227,169,210,176,210,186,256,191,238,201,215,212,200,214,272,230,222,236,294,248,229,250,229,252,192,261,224,272,256,287,196,314,227,347,219,362,182,364,227,368,303,376,235,382,200,387,188,395,219,410,208,418,317,429,210,490,185,497,224,499,210,501,204,512,200,513,212,535,182,537,190,552,185,556,183,592,227,612,204,618,212,619,200,621,198,626,196,627,188,628,200,630,212,633,204,680,316,681,281,686,200,687,202,690,272,692,196,696,196,698,188,700,192,706,188,708,324,709,194,713,229,715,172,716,279,742,210,769,301,770,183,812,194,819,180,826,250,827,330,837,301,838,328,839,190,840,210,841,263,842,274,843,268,844,311,845,335,846,192,847,352,848,190,849,182,850,328,851,339,852,298,853,380,854,268,856,320,857,326,858,379,859,272,860,274,862,376,863,349,864,372,865,276,866,182,867,183,868,298,869,236,870,274,871,277,883,200,892,242,894,217,911,353],
+    "pielonefriti": [777,892],
+    "piens": [902,631],
+    "pierden": [780,671],
+    "piern": [157,356,257,356,535,295,571,338,602,356,606,318,613,364,615,352,618,535,619,518,620,312,623,334,626,444,627,306,647,300,651,312,654,368,657,345,662,352,675,356,688,345,699,268,736,277,752,282,755,477,761,430,764,532,771,295,780,349,781,373,797,327,802,470,854,309],
+    "piescar": [384,595],
+    "pigeon": [256,612],
+    "pigment": [681,637],
+    "pigmentacion": [770,498,864,485,869,434],
+    "pik3c": [882,679],
+    "pilar": [513,664],
+    "pilari": [847,822],
+    "pilos": [698,442,837,605,847,434,855,815,856,579,857,488,866,426],
+    "pilosul": [227,925],
+    "piment": [476,905],
+    "pimenter": [479,600],
+    "pimenton": [470,913],
+    "pimient": [151,429,178,460,467,815,470,740,473,490,476,873,479,757,483,773,484,708],
+    "pimpinel": [36,1059],
+    "pimpinell": [16,804,105,792,449,781],
+    "pin": [114,481,115,948,132,863,346,762,361,519,369,415,391,481,440,866],
+    "pincel": [50,954],
+    "pine": [440,946],
+    "pineappl": [369,811],
+    "pinetell": [287,612],
+    "pinill": [64,624],
+    "pink": [244,852,247,564],
+    "pinnat": [488,767],
+    "pinnatifid": [298,999],
+    "pinolenic": [440,709],
+    "pinon": [12,635,132,719,440,925],
+    "pinoner": [132,538,440,653],
+    "pinsu": [393,553,404,543],
+    "pinu": [115,828,440,872],
+    "pinudi": [287,612],
+    "pinuel": [487,600],
+    "pioj": [94,780],
+    "piorn": [171,650],
+    "pip": [243,503,264,530,282,710,356,519,430,548,491,737],
+    "pipal": [483,631],
+    "piper": [84,698,189,792,467,762,483,698,484,688],
+    "piperit": [4,846,313,661],
+    "piperitum": [479,844],
+    "pipli": [483,631],
+    "pippali": [483,874],
+    "piqu": [838,657],
+    "piriform": [764,558],
+    "pirliter": [170,932],
+    "pis": [203,481],
+    "pissy": [203,481],
+    "pistach": [436,1109],
+    "pistachi": [436,999],
+    "pistaci": [192,913,436,920],
+    "pit": [429,571,490,714,492,411],
+    "pitahay": [351,943,486,1089],
+    "pitajay": [486,589],
+    "pitay": [351,605,486,1021],
+    "pitazabil": [490,578],
+    "pitid": [939,624],
+    "pitiriasi": [861,710,864,738],
+    "pitoret": [4,538],
+    "pituc": [225,553],
+    "pitud": [4,538],
+    "pituitari": [716,461,717,626,719,457,720,635,729,461,731,443,733,408,741,397],
+    "pizoy": [199,470],
+    "pkd": [791,828],
+    "pkd1": [791,584],
+    "pkd2": [791,584],
+    "plac": [641,525,680,489,771,756,865,494,889,504],
+    "placent": [832,1100],
+    "placer": [896,538],
+    "plan": [396,466,709,718,767,391,845,427,846,439,860,448,869,366,924,369],
+    "planifoli": [471,817],
+    "plant": [2,213,4,176,7,171,8,269,10,145,12,239,24,239,26,189,29,184,30,275,36,172,40,230,41,184,47,230,52,160,57,205,59,253,60,195,61,261,63,209,64,205,65,215,66,220,67,227,69,243,70,215,74,222,77,218,79,220,80,249,81,249,83,238,84,207,85,184,86,227,88,230,89,301,90,241,91,220,96,252,97,232,99,256,100,235,101,188,105,220,173,299,183,256,185,249,187,256,188,322,189,249,190,256,200,230,201,220,202,213,203,157,204,207,206,211,207,211,209,205,210,209,234,207,247,201,248,235,254,222,260,252,263,218,295,265,296,252,297,256,300,256,303,238,304,246,306,249,308,232,309,320,310,241,311,232,312,238,314,232,316,232,318,322,319,241,372,227,415,243,487,197,488,347,490,189,493,227,494,195,495,195,497,371,498,359,499,215,500,375,501,404,502,310,503,207,504,383,505,252,506,243,508,173,509,211,510,211,511,211,512,205,514,218,515,203,517,220,520,213,767,175,828,189,839,195,848,195,858,195],
+    "plantag": [461,954],
+    "plantain": [461,954],
+    "plaquet": [683,532,700,734,894,590],
+    "plasmatic": [884,892],
+    "plastic": [883,997],
+    "plat": [48,548,83,580,272,446,350,489,481,509],
+    "plataform": [286,573],
+    "platan": [361,709],
+    "platead": [107,617,113,484,272,463,680,508],
+    "platensi": [295,1032],
+    "platycarp": [396,880],
+    "play": [10,443],
+    "plaz": [868,553],
+    "plenitud": [791,507,880,609,943,543],
+    "plenty": [289,886],
+    "pleur": [536,664],
+    "pleural": [536,895,553,590,879,631],
+    "pleurot": [276,624],
+    "pleurotu": [276,799,284,828],
+    "pliegu": [863,568],
+    "plum": [52,390,385,879,387,471,398,484,408,489],
+    "plumaj": [52,488],
+    "plumajill": [52,488],
+    "pneumonia": [523,671],
+    "pobr": [227,632,327,612],
+    "poc": [93,404,315,413,540,347,543,364,594,453,596,432,663,379,687,375,691,364,692,364,693,408,699,307,702,391,770,341,861,315,876,368,912,257,914,293,923,305,947,375],
+    "pochot": [139,701],
+    "podador": [37,573],
+    "podem": [79,671],
+    "poder": [175,466,414,571,475,466,555,481,646,423,823,448,924,369,927,352],
+    "podri": [906,767],
+    "poet": [237,874],
+    "pohnpei": [84,631],
+    "poiquilodermi": [870,856],
+    "poison": [205,631],
+    "pole": [78,1166],
+    "polen": [521,569,525,518,682,518,935,508],
+    "poliartriti": [679,865,742,828],
+    "polidipsi": [729,631],
+    "polifenol": [389,553],
+    "polimiositi": [691,856],
+    "polinesi": [84,581,380,605],
+    "polip": [526,466,587,768,588,499,941,693,953,560],
+    "polipor": [277,646,286,528],
+    "poliquistic": [715,719,791,762],
+    "polisacarid": [278,701],
+    "poliuri": [729,631],
+    "poll": [188,906,286,955],
+    "polluel": [17,548,475,587],
+    "polv": [362,381,367,451,462,388,481,591,522,461,524,407,525,419,531,411,558,477,559,641,682,419,935,411],
+    "polygal": [235,1166],
+    "polypor": [269,806,277,780,281,432,286,476],
+    "polyporu": [277,1131],
+    "pom": [268,844],
+    "pomarros": [372,1053],
+    "pomegranat": [141,868,359,781,455,898],
+    "pomel": [322,1015,325,1166],
+    "poncil": [327,664],
+    "pondweed": [317,743],
+    "ponen": [912,431],
+    "poner": [863,568],
+    "poor": [227,686],
+    "poplar": [140,991],
+    "poplite": [765,801],
+    "poppy": [82,1168],
+    "popular": [133,473,174,458,250,473,261,463,267,425,275,389,281,344,288,453,298,508,425,416,463,349,485,352,492,312],
+    "populu": [140,991],
+    "porcini": [292,686],
+    "pori": [273,1053],
+    "poros": [722,892],
+    "porphyr": [299,991],
+    "porr": [429,657],
+    "portador": [791,584],
+    "porter": [208,644],
+    "porteri": [208,886],
+    "portugu": [339,664],
+    "pose": [65,525,70,525,72,554,275,471,286,458],
+    "posesion": [913,924],
+    "posibl": [856,488,943,575],
+    "posiblement": [539,498,668,460,691,473,692,473,788,525,861,409],
+    "posicion": [766,838,819,518],
+    "posicional": [942,686],
+    "positiv": [22,669,69,646,851,522],
+    "posnasal": [941,624],
+    "post": [491,717],
+    "postcoital": [832,516],
+    "posterior": [527,569,767,759,821,498,889,523],
+    "postmenopausi": [807,584],
+    "postoperatori": [553,679],
+    "postpart": [921,589],
+    "postracion": [258,637],
+    "postraumatic": [899,806],
+    "postur": [655,525,675,530,722,503,760,439,761,451,774,455],
+    "postural": [640,709],
+    "posy": [8,757,203,443],
+    "pot": [3,777,44,625],
+    "potasi": [216,499,277,527,363,551,374,527,376,551,378,478,601,474],
+    "potat": [212,624],
+    "potenciador": [467,661,483,581],
+    "potencial": [298,639,357,609,359,545,370,602],
+    "potencialment": [532,508,684,576,853,498,893,498],
+    "potent": [2,303,15,330,17,277,20,334,30,277,31,259,42,342,53,259,54,209,57,290,62,299,73,253,121,363,128,354,131,316,141,358,145,358,154,303,155,430,159,309,175,296,181,354,217,306,235,316,237,293,242,326,259,309,269,277,271,299,274,288,278,326,283,326,359,418,370,338,378,296,381,257,385,269,386,244,388,309,389,257,421,377,431,363,454,246,455,264,464,290,483,293,517,312],
+    "pouteri": [362,747,363,892],
+    "powder": [481,880],
+    "poxviru": [850,558],
+    "practic": [176,657],
+    "prad": [36,456,51,472,450,527],
+    "praew": [34,811],
+    "prat": [15,709],
+    "pre": [760,811],
+    "prebiotic": [220,710,270,583,461,418],
+    "precanceros": [868,553],
+    "precaucion": [397,906,482,587],
+    "precoz": [732,799,835,767],
+    "precursor": [107,684,472,492],
+    "predisposicion": [573,381,642,417,678,365,679,398,680,348,682,354,685,358,689,385,693,389,695,394,698,334,707,344,712,344,773,377,806,348,838,373,841,328,857,369,860,348,865,351,866,322,870,348,897,334,904,281],
+    "preeclampsi": [831,966],
+    "preexistent": [617,565,846,522,931,431],
+    "prematur": [381,459,681,529,832,428,903,467],
+    "premenstrual": [151,480,178,514,261,560,813,836,917,788],
+    "preocupacion": [895,626,901,415,904,363,907,582,912,315,922,397,926,452,930,597],
+    "preocupad": [912,431],
+    "preocupars": [927,481],
+    "preparacion": [383,603,402,507,406,623],
+    "preparad": [123,709,228,625],
+    "preparar": [83,545,126,469,134,601,140,571,198,571,238,483,365,545],
+    "presbici": [944,868],
+    "presenci": [103,525,703,496,730,435,736,391,759,457,881,519,904,363,920,427],
+    "presenciad": [899,563],
+    "presenciar": [899,518,934,538],
+    "present": [558,548,621,478,633,493,916,420,940,498,945,542],
+    "preserving": [456,443],
+    "presion": [41,251,109,321,122,266,213,276,216,297,238,288,349,303,354,310,361,317,374,420,376,328,400,328,526,261,535,423,537,266,583,313,590,294,599,321,601,448,602,306,605,291,626,274,628,279,647,258,648,291,687,282,716,282,721,274,728,294,739,247,744,256,747,294,754,235,781,426,783,324,788,303,790,328,791,261,792,317,794,399,801,300,806,274,809,268,831,372,890,261,892,231,904,222,912,193,937,360,941,279,943,279,950,306,956,285],
+    "presionarl": [866,568],
+    "prestar": [903,563],
+    "prevencion": [73,543],
+    "prevenir": [102,513,153,484,172,513,202,540],
+    "previ": [606,404,607,425,707,400,713,473,751,425,772,400,773,438,803,463,805,362,830,400,832,652,921,389,937,371],
+    "previament": [669,650],
+    "previen": [257,686],
+    "prickly": [479,498,485,644,492,589,507,768],
+    "prid": [51,786],
+    "prifoli": [25,709],
+    "primari": [596,561,625,455,683,473,687,488,734,431,848,460],
+    "primaver": [168,596,249,936,397,653],
+    "primer": [130,639,188,624,736,443,835,489],
+    "primitiv": [185,761],
+    "primros": [249,668,261,865],
+    "primul": [249,992,261,646],
+    "princes": [47,701],
+    "principal": [50,525,100,525,262,452,460,443,519,461,524,443,533,443,545,550],
+    "principalment": [234,416,253,408,362,375,413,490,676,425,680,404,769,371,848,392,849,375,852,365,854,392,870,404,888,420],
+    "principi": [670,657],
+    "pringos": [159,1030],
+    "prisc": [387,589],
+    "privad": [556,573],
+    "privet": [163,1101],
+    "privilegi": [927,481],
+    "proantocianidin": [454,529],
+    "probiotic": [292,686],
+    "problem": [4,203,8,218,24,186,38,202,43,284,54,170,73,205,74,256,75,317,98,281,99,295,111,256,114,248,120,254,123,291,150,236,156,243,169,248,192,288,209,236,228,256,248,271,261,265,301,291,314,268,344,256,348,259,418,288,419,288,448,231,468,288,472,202,476,251,479,227,484,234,499,248,507,259,607,243,609,238,620,227,623,335,636,251,641,248,642,277,645,271,646,218,647,218,649,268,651,227,654,268,664,271,668,225,670,248,683,323,684,352,690,321,696,231,705,231,720,236,733,211,739,209,743,251,751,335,752,297,770,216,786,254,804,223,808,221,812,229,831,223,832,195,836,254,854,225,871,236,878,271,903,213,918,215,931,278,933,213,934,221,938,238,948,256,957,265],
+    "procedimient": [803,609,805,476,883,543],
+    "proces": [31,463,78,563,668,494,944,518],
+    "procesamient": [913,543],
+    "proctiti": [584,976],
+    "produc": [176,391,191,442,278,417,316,422,479,357,531,364,550,383,687,375,693,408,713,427,717,364,720,516,726,551,727,368,728,535,801,400,808,347,817,341,850,332,893,357],
+    "produccion": [32,302,218,347,285,390,344,377,439,394,451,358,452,313,540,324,630,369,632,381,635,358,700,334,701,343,714,373,717,340,719,347,720,347,724,394,729,485,748,350,752,302,765,310,812,337,837,313,852,307,949,334],
+    "producen": [79,557,689,563,844,494,949,498],
+    "producid": [920,584],
+    "product": [61,415,574,565,754,394,776,521,780,504,789,558,872,451],
+    "productividad": [930,573],
+    "productor": [635,514,640,567,720,693,770,458,950,548],
+    "profesion": [773,664],
+    "profesional": [933,563],
+    "profund": [315,495,529,501,536,474,616,474,619,712,631,485,746,429,834,409,853,429],
+    "profundidad": [948,679],
+    "profus": [604,587,728,605],
+    "progesterogenic": [151,600],
+    "progesteron": [806,532,812,527,859,527],
+    "progresar": [698,589],
+    "progresiv": [531,369,560,392,641,542,650,377,653,392,654,428,655,409,658,542,664,433,667,670,669,392,671,423,672,414,677,362,691,369,692,369,748,653,753,414,888,384],
+    "prohibid": [176,657],
+    "prolactin": [720,1078],
+    "prolactinom": [720,799,731,558],
+    "prolaps": [809,844],
+    "proliferacion": [860,564,888,810],
+    "prolongad": [524,381,534,409,559,451,560,409,562,427,604,401,615,427,619,393,716,549,747,413,755,339,806,385,808,367,863,357,936,418,946,364],
+    "promedi": [718,671],
+    "prominent": [717,564,763,548],
+    "promover": [277,560,302,580,451,514,510,514,512,499],
+    "promoviend": [433,752],
+    "promuev": [23,609,410,540,512,518,516,518],
+    "promueven": [62,593,361,653],
+    "propens": [722,599,900,548],
+    "propi": [637,519,678,498,707,469,910,464,912,333,929,324],
+    "propiedad": [0,217,2,240,3,221,10,163,34,209,42,271,60,219,62,237,65,332,66,248,67,256,70,242,72,256,73,200,75,219,79,248,81,281,82,228,87,259,91,248,101,211,104,195,105,248,108,204,110,235,113,215,116,262,117,277,118,194,124,291,125,288,139,259,149,262,156,237,159,245,170,256,179,288,215,211,222,245,224,221,236,250,238,237,240,233,246,253,247,226,251,271,265,253,275,217,278,259,285,259,286,211,287,226,291,235,311,262,312,268,313,265,349,250,355,248,356,248,357,271,359,242,366,271,373,271,393,221,395,253,396,235,397,277,400,271,403,240,404,217,416,284,417,299,420,295,466,268,473,253,474,268,485,197,489,256,490,213,492,175,493,256,495,219,496,245,498,240,503,233,509,237,510,237,511,237],
+    "propionibacterium": [837,563],
+    "proporcion": [371,625,718,618],
+    "proporcionand": [428,631,435,661,464,543],
+    "prostat": [430,519,779,481,787,550,815,609,816,605,817,834,821,439,835,431],
+    "prostatic": [430,616,815,512,816,909],
+    "prostatiti": [815,966],
+    "proteccion": [437,548,823,489,824,494,825,494,829,458],
+    "protector": [355,557,359,746,642,609,772,705],
+    "proteg": [352,542,389,442,426,647,431,623,509,514],
+    "protegen": [347,632,454,488],
+    "proteger": [193,571,200,527,245,483,269,447,381,415,399,539,411,578],
+    "protein": [295,460,309,422,319,417,345,365,346,385,371,385,429,373,453,403,457,334,573,381,596,412,641,373,653,369,701,489,748,358,752,308,778,373,792,403,793,422,794,369,831,334,851,341,858,338,884,622],
+    "proteinuri": [784,717],
+    "protozoari": [829,573],
+    "protuberanci": [709,594,809,420,827,567,843,416,847,404,850,560,856,539,857,454,865,432,867,400],
+    "provien": [939,624],
+    "provitamin": [387,589],
+    "provoc": [525,436,586,469,652,479,729,441,742,459,779,459,800,469,841,404,873,412,909,364],
+    "provocad": [542,605,605,599],
+    "provocan": [900,517,906,456,911,507],
+    "provocar": [566,632,700,553],
+    "provocativ": [926,618],
+    "proyect": [577,692,929,386],
+    "prueb": [867,573],
+    "prun": [385,822],
+    "prunal": [385,578],
+    "prunu": [137,666,384,586,385,574,386,536,387,582,395,647,396,615,401,710,408,598,433,687],
+    "prurig": [862,822],
+    "pruriginos": [862,578],
+    "prurit": [866,568],
+    "pry": [239,624],
+    "pseudacoru": [314,946],
+    "psicoactiv": [91,618,902,581],
+    "psicologic": [636,513,814,503,834,443,835,455,836,519,933,435],
+    "psicopati": [925,833],
+    "psicotic": [921,913,922,472,924,438],
+    "psidium": [142,892,348,852],
+    "psiquiatric": [652,686],
+    "psoriasi": [104,409,230,536,248,555,418,588,680,662,704,792],
+    "psoriasic": [704,899],
+    "psyllium": [461,1167],
+    "pti": [700,844],
+    "ptosi": [752,543],
+    "pubertad": [719,483,732,771,733,792,734,619,763,460,837,435],
+    "pubic": [732,499,733,446,737,520,797,504,799,514],
+    "public": [906,525],
+    "puccoon": [206,644],
+    "pudiend": [72,694],
+    "puebl": [129,548,132,538],
+    "puel": [224,600],
+    "puert": [756,568],
+    "pulegium": [78,919],
+    "pulgar": [768,1200],
+    "pulguer": [461,481],
+    "pulmon": [227,403,235,399,523,395,524,356,530,403,531,503,533,683,534,525,535,607,536,605,537,654,538,371,539,378,540,343,543,360,551,378,553,612,554,561,557,403,879,427,888,517],
+    "pulmonar": [33,377,227,414,524,592,531,644,534,693,535,571,536,400,537,359,538,380,540,352,551,611,552,349,554,433,555,396,556,345,559,433,560,538,690,366,888,531],
+    "pulmoni": [523,912],
+    "pulp": [344,440,352,440,353,431,355,592,356,592,357,476,359,426,361,460,363,476,364,460,368,614,376,476,377,426,388,431],
+    "puls": [572,617,616,551,628,518,629,557],
+    "pulsatil": [638,939],
+    "pummel": [325,954],
+    "pumpkin": [430,946],
+    "puncturevin": [520,892],
+    "punic": [141,868,359,781,455,823],
+    "punicalagin": [359,605,455,523],
+    "punt": [648,465,704,469,774,595,798,479,837,402,843,425,850,398,855,398,929,300],
+    "punter": [487,600],
+    "punzant": [157,515,614,499,625,442,643,521,644,483,675,515,764,419],
+    "pur": [462,578],
+    "purgant": [40,560,74,734,89,734,166,573,176,718],
+    "purgativ": [904,496],
+    "purificar": [375,671],
+    "purin": [758,606],
+    "purpl": [59,869,70,571,202,775],
+    "purpleleaf": [389,553],
+    "purpur": [692,508,700,810,709,503,894,563],
+    "purpure": [80,861,202,775,260,868],
+    "purulent": [935,564,956,587],
+    "pus": [564,555,662,525,837,435,841,447,856,596,889,488],
+    "pustul": [837,518,841,533],
+    "puzzl": [132,828],
+    "pylori": [561,646,562,590,589,583],
+    "pyogen": [849,523,854,548],
+    "pyrifoli": [405,984],
+    "pyru": [149,822,383,810,405,855],
+    "quebrad": [954,657],
+    "quebrantar": [925,589],
+    "quechu": [130,709,204,581],
+    "qued": [766,771],
+    "quedar": [823,612],
+    "quedars": [903,563],
+    "queen": [51,724,214,783],
+    "quej": [907,553],
+    "quelant": [6,624],
+    "quelit": [35,612],
+    "queloid": [102,618],
+    "quem": [298,770],
+    "quemadur": [494,494,500,534,681,529,869,415],
+    "quemazon": [870,612],
+    "queratin": [847,578],
+    "queratoconjuntiviti": [949,844],
+    "queratosi": [847,757,868,940],
+    "quercu": [118,666,124,882,125,969],
+    "querer": [923,512],
+    "querid": [907,509,933,518],
+    "quervain": [768,1004],
+    "quesit": [49,657],
+    "quetri": [180,874],
+    "quez": [60,595],
+    "quib": [223,589],
+    "quickthorn": [122,595],
+    "quieren": [927,481],
+    "quiet": [903,563],
+    "quil": [879,631,880,609,881,616],
+    "quilos": [879,885,880,1042],
+    "quilotorax": [879,885,888,587],
+    "quiluri": [881,946],
+    "quimic": [681,413,754,341,776,450,789,482,839,386,846,390,872,390,895,397,896,349,902,409,910,390,915,393,919,372,935,397],
+    "quimioterapi": [121,718,812,558],
+    "quin": [130,1268],
+    "quinc": [388,1157],
+    "quinin": [130,669,165,590,271,559],
+    "quinot": [326,679],
+    "quinquefoliu": [518,880],
+    "quirurgic": [812,606],
+    "quist": [659,651,715,558,765,732,791,417,837,402,866,406,878,512,892,369,950,661],
+    "quistic": [538,504,540,661,733,446,885,861,941,499],
+    "rab": [215,528,386,706],
+    "raban": [42,568,211,869,215,443,217,508,218,833,219,473],
+    "rabanet": [218,868],
+    "rabanit": [218,624],
+    "rabill": [28,919],
+    "racach": [221,606],
+    "racemos": [234,874],
+    "racemosu": [519,874],
+    "radiacion": [649,496,725,485,754,367,844,416,845,408,846,420,860,428,868,386,870,428,936,464],
+    "radiculopati": [764,801],
+    "radioterapi": [584,646,708,472,812,527],
+    "radish": [218,1078],
+    "radon": [533,606],
+    "raic": [76,424,84,441,101,400,157,479,203,336,206,450,207,450,234,441,258,445,380,459],
+    "raiz": [7,227,26,252,30,259,36,229,40,306,56,231,67,302,76,264,77,289,79,292,84,275,104,231,141,435,156,386,169,392,181,432,182,446,190,439,194,336,195,340,200,409,201,397,202,283,203,375,204,381,205,275,206,280,207,280,208,386,210,383,211,430,213,375,214,370,215,356,216,394,217,392,218,378,221,370,227,403,228,400,229,375,230,406,231,381,233,353,234,275,235,400,249,316,253,375,418,432,419,332,478,302,495,259,508,231,515,269,518,278,519,275,520,283],
+    "rakach": [221,606],
+    "ram": [14,388,34,406,52,349,114,469,159,474,165,485,171,465,266,465,370,518],
+    "rambutan": [353,1030],
+    "ramific": [764,558],
+    "ramp": [749,932],
+    "rang": [892,516],
+    "rangpur": [339,1222],
+    "rap": [215,952],
+    "rapaceum": [217,899],
+    "raphanu": [218,868],
+    "rapid": [534,392,549,377,552,496,553,409,556,492,572,448,581,534,606,369,607,388,608,546,610,670,628,523,714,405,737,392,807,352,833,359,835,502,897,355,949,509],
+    "rapidament": [309,574,725,536,846,464,853,464,926,478,956,493],
+    "rapidez": [597,709],
+    "raquide": [662,919],
+    "rar": [365,412,655,385,667,381,668,338,669,369,674,373,676,365,690,344,698,334,708,308,726,389,727,351,728,373,729,358,738,351,741,308,797,358,799,365,860,348,866,322,882,385,883,354,888,362,894,385],
+    "rarefaccion": [670,899],
+    "rascad": [862,533,911,538],
+    "rascars": [911,961],
+    "rasg": [717,460,719,469,835,442,896,404,912,324,913,408,932,483],
+    "rasgun": [849,568],
+    "raspan": [73,543],
+    "raspaner": [73,543],
+    "raspberry": [206,593,390,984],
+    "raspon": [73,543],
+    "rasponer": [73,543],
+    "rastrer": [152,822,188,653,494,517],
+    "rau": [34,568],
+    "raynaud": [625,967,690,558],
+    "razon": [933,563],
+    "razonamient": [653,650],
+    "reaccion": [525,487,573,512,613,394,656,422,682,487,687,354,693,385,695,389,696,344,697,377,707,340,709,340,712,340,753,385,783,407,802,373,839,471,840,505,841,325,852,310,866,319,899,316,900,334,922,305,935,344],
+    "reaccionar": [923,753],
+    "reactiv": [705,788,886,865],
+    "reactivacion": [666,709],
+    "reafirmacion": [929,419],
+    "real": [0,403,10,303,27,428,28,465,58,375,145,528,173,709,320,497,479,411,909,356,913,372],
+    "realizar": [923,445,944,543,946,502],
+    "rebaudian": [41,806],
+    "reblandecimient": [743,1030],
+    "rebozuel": [288,1047],
+    "reca": [448,612],
+    "receptor": [688,577,741,472,752,472],
+    "recesiv": [667,583,737,565,791,507],
+    "rechaz": [928,844],
+    "recibir": [927,481],
+    "recient": [534,599,931,457],
+    "recomienz": [532,612],
+    "reconocer": [927,481],
+    "reconocid": [385,533,516,575],
+    "recordar": [934,828],
+    "recreativ": [771,568],
+    "rect": [567,563,584,810,586,859,828,480],
+    "rectal": [564,555,568,561,584,754,587,561,588,483,694,503],
+    "rectocel": [809,844],
+    "recubr": [474,580,585,560,600,594,804,471,935,489],
+    "recuent": [683,612],
+    "recuerd": [362,493,372,603,899,489],
+    "recuerdan": [173,618,899,518],
+    "recuperar": [625,589],
+    "recurren": [710,589],
+    "recurrent": [153,343,538,514,627,346,639,565,653,382,677,353,683,360,701,363,796,417,799,378,834,337,888,375,892,303,898,507,899,331,900,350,904,291,910,496,911,343,918,334,943,367],
+    "red": [33,563,82,401,153,379,211,555,213,401,238,418,378,571,390,555,393,548,404,540,425,409,456,288,469,365,470,286],
+    "redcurrant": [393,553,404,543],
+    "redond": [698,543,850,738],
+    "reduc": [44,433,70,420,224,383,242,448,348,438,349,433,355,429,372,443,509,411,510,411,511,411,512,399,516,399,517,429,518,407],
+    "reduccion": [290,489,605,775,914,427],
+    "reducen": [618,664],
+    "reducid": [736,492,774,543],
+    "reducir": [213,415,224,403,264,461,269,400,276,419,277,471,355,451,382,419,386,353,426,544,438,477,511,432],
+    "reductor": [265,569,276,518,279,513,284,545],
+    "reemplaz": [807,538,859,558],
+    "referenci": [255,709],
+    "refier": [63,637],
+    "refluj": [528,486,563,809,590,481,593,571,690,443,777,476,796,692,954,481],
+    "reforzar": [172,618],
+    "refrescant": [4,546,238,450,351,459,365,507,384,416,395,479,486,412,493,485,497,490,498,454],
+    "refrescar": [497,701],
+    "refrigerant": [245,644],
+    "refuerz": [290,276,320,356,321,347,322,373,323,356,324,322,325,351,326,332,327,325,328,364,329,340,330,373,331,360,332,387,333,387,334,392,335,356,336,315,337,377,338,377,339,325,340,392,341,392,342,392,343,392,344,332,345,315,346,332,347,336,348,336,350,300,351,322,352,332,353,325,358,303,362,278,367,329,369,278,377,322,381,271],
+    "regalici": [201,671],
+    "regaliz": [201,912],
+    "regeneracion": [61,509,92,684],
+    "regenerador": [61,427,64,483,92,574,185,588,268,464,362,439],
+    "regi": [120,840,434,913],
+    "region": [76,455,93,510,231,474,250,539,508,397,556,430,567,510],
+    "regl": [844,595],
+    "regul": [52,405,354,576,361,589,540,484],
+    "regulacion": [905,595],
+    "regulador": [10,407,53,336,151,362,178,388,204,380,212,377,220,345,225,333,228,409,229,373,234,380,253,373,261,423,302,438,366,443,382,377,390,369,400,443,414,470],
+    "regular": [19,395,32,296,41,306,57,340,109,390,120,365,122,324,147,382,151,327,216,361,220,312,251,400,253,336,266,354,280,369,358,336,360,340,373,400,382,340,383,377,387,321,390,333,414,425,415,404,485,291,492,258,518,347,910,327],
+    "regularidad": [302,726],
+    "regurgitacion": [563,551,583,582,593,647,594,632],
+    "rehmanni": [228,1116],
+    "rein": [45,599,51,500],
+    "reishi": [264,1017,282,590,293,835],
+    "reiter": [705,856],
+    "reiterad": [766,529],
+    "rejuvenecedor": [483,805,519,581],
+    "rejuvenecer": [517,671],
+    "relacion": [775,367,788,399,804,346,805,322,806,360,808,486,811,353,814,382,823,360,824,363,825,363,829,480,834,337,835,346,836,395,905,493,920,343,923,525,924,296,927,283,934,343],
+    "relacionad": [85,359,228,433,651,383,668,380,691,391,731,387,816,373,823,391,836,429,848,535,861,338,870,391,905,380,929,268,939,399],
+    "relacionan": [904,496],
+    "relaj": [56,529],
+    "relajacion": [88,646,361,653],
+    "relajant": [0,496,23,437,47,417,56,315,60,354,66,543,74,404,81,453,88,417,108,474,116,563,122,354,177,375,236,404,237,520,254,404,349,404,361,422,442,464,471,341],
+    "relativ": [711,606],
+    "relevant": [60,595],
+    "reloj": [914,492],
+    "remedi": [16,377,28,373,48,377,50,394,56,291,75,327,115,361,136,377,142,404,148,350,152,390,160,358,161,277,174,381,239,343,241,354,242,386,249,399,250,394,258,350,261,386,263,365,388,365,394,404,460,333,480,365,483,347],
+    "remineralizant": [149,453,185,486,217,420,308,453,315,443,360,399,383,443,385,369,391,420,399,458,407,492,432,480,439,453,442,498,456,283],
+    "remolach": [213,1128],
+    "remordimient": [925,589],
+    "renal": [73,308,203,273,690,344,723,385,730,338,731,344,738,351,739,314,743,377,777,507,778,510,780,680,781,608,784,541,785,422,790,550,791,470,793,554,794,578,795,598,800,381,801,381,802,514,862,328],
+    "rendimient": [213,478,233,439,267,498,509,498,520,690,835,455],
+    "renshen": [77,664],
+    "reparador": [516,575,646,533],
+    "repelent": [375,671],
+    "repent": [628,624],
+    "repentin": [537,374,578,413,599,451,620,378,629,422,645,451,647,655,668,374,745,401,758,534,766,333,779,413,818,393,900,374,921,370,957,441],
+    "repetid": [756,471,907,774,910,498,911,484],
+    "repetidament": [532,612],
+    "repetitiv": [744,400,746,420,747,459,756,397,757,408,762,416,766,370,768,542,773,464,898,432],
+    "repos": [535,426,605,488,610,504,615,510,619,469,624,474,640,533],
+    "reproduc": [309,743],
+    "reproduccion": [832,516],
+    "reproductiv": [519,581,715,496],
+    "reproductor": [519,548,736,464,805,476],
+    "reputacion": [79,671],
+    "requeson": [811,600],
+    "requieren": [946,578],
+    "resfriad": [28,390,43,432,59,304,134,459,161,289,172,355,202,373,215,329,241,370,243,373,246,394,249,417,449,377,522,601,526,335,527,394,528,381,541,527,544,385,545,565,548,370,938,362,953,403],
+    "resin": [100,525,115,481,131,496,133,525,134,585,159,486,192,725,478,507],
+    "resinos": [186,800],
+    "resistenci": [204,409,213,401,233,368,267,418,506,482,508,501,509,418,515,559,602,445,635,418,711,551,715,349,721,640,741,510],
+    "resistent": [186,737,741,500],
+    "resistir": [912,431],
+    "resolver": [641,657],
+    "resolvers": [861,529],
+    "resort": [766,771],
+    "respect": [859,606],
+    "respetar": [925,589],
+    "respingon": [104,529],
+    "respiracion": [532,598,548,450,549,436,552,404,553,474,555,459,556,400,628,436,629,637,940,450],
+    "respirar": [523,433,524,288,529,333,531,291,533,288,534,309,536,430,537,283,538,300,539,306,540,277,543,291,547,349,550,306,551,306,553,322,554,341,555,312,557,326,558,337,559,341,560,309,604,303,606,291,608,316,609,300,614,316,617,309,621,294,636,316,688,316,739,263,740,349,750,312,753,326,754,249,879,345,880,333,883,297,885,297,888,303,891,322,932,306,940,306],
+    "respiratori": [2,314,9,284,21,346,28,327,45,314,49,317,63,307,99,376,115,317,119,342,133,346,155,331,158,342,180,304,201,324,207,310,208,310,241,310,358,298,459,262,472,258,484,298,510,310,521,446,524,292,529,338,532,413,538,484,541,443,542,434,543,515,544,440,545,363,546,453,547,467,548,310,549,419,550,310,552,461,554,346,801,324,883,419],
+    "resplandor": [936,664],
+    "responden": [933,563],
+    "responder": [729,631],
+    "responsabilidad": [929,419],
+    "responsabl": [769,563],
+    "respuest": [266,382,539,378,594,447,625,490,678,378,679,412,682,510,690,500,691,360,692,360,694,382,702,386,704,386,706,346,707,356,838,386,874,382,886,412,911,343,921,346,924,296],
+    "rest": [606,612],
+    "restaurador": [235,679],
+    "restriccion": [904,496],
+    "restringen": [599,717],
+    "restringid": [627,543,923,472],
+    "result": [681,554,864,485,885,543],
+    "resultad": [685,548,822,565,875,571],
+    "resveratrol": [389,733,453,653],
+    "retam": [171,1019],
+    "retencion": [784,623,793,646,794,565],
+    "reticenci": [922,543],
+    "reticulari": [701,618],
+    "retin": [262,569,659,618],
+    "retorcid": [626,564,819,518],
+    "retorn": [921,589],
+    "retras": [621,442,673,518,674,469,676,633,733,572,736,381,741,388,836,479,884,465],
+    "retrasad": [718,583,719,543,734,485],
+    "retrasar": [835,589],
+    "retrograd": [804,589],
+    "reumatic": [187,678,611,577,706,724],
+    "reumatism": [97,567,160,520,186,639,190,623,230,554],
+    "reumatoid": [679,643,697,460,707,415,742,450,744,392,745,436,766,362,768,366,802,455,874,445,893,411],
+    "revestimient": [557,470,561,509,562,465,582,491,584,509,587,497,612,602,754,359,788,465,789,509,941,428],
+    "rey": [0,512,294,804,354,603],
+    "rhabarbarum": [40,939],
+    "rhamnoid": [167,810,410,822],
+    "rhamnu": [179,1007],
+    "rheum": [40,939],
+    "rhodiol": [508,1000],
+    "rhodium": [508,771],
+    "rhopalophyll": [497,939],
+    "rht": [741,786],
+    "rhu": [477,999],
+    "rhubarb": [40,939],
+    "rib": [154,670,393,733,402,621,403,670,404,726,406,716,417,775],
+    "riber": [178,644],
+    "ric": [7,163,13,198,45,204,46,222,49,206,76,190,80,239,85,176,105,210,118,165,126,196,144,222,149,222,154,204,167,276,169,206,170,292,172,270,181,239,185,239,193,239,197,245,198,239,199,147,207,202,212,196,214,190,215,180,216,284,219,309,220,256,221,190,222,208,223,185,225,173,231,198,261,220,289,202,291,200,295,254,296,242,297,245,298,242,299,311,300,245,304,236,305,245,306,239,307,233,308,222,312,228,315,217,344,213,345,202,346,213,347,215,349,213,350,192,351,206,353,208,356,210,360,196,363,230,365,228,366,230,369,178,370,228,373,230,374,220,376,230,378,276,379,215,381,250,382,196,386,165,388,208,389,173,390,192,391,206,392,202,393,188,394,230,395,215,398,190,399,225,400,230,402,183,403,204,404,185,406,225,409,228,410,204,416,242,418,239,419,239,420,251,422,230,427,230,430,222,432,236,433,236,434,239,435,239,436,242,437,215,438,222,441,230,442,245,453,222,454,166,455,178,457,185,462,181,463,166,470,138,477,242,481,200,486,185,513,284,587,228,588,196,589,210,606,192,633,200,758,190,778,206],
+    "ricin": [89,1166],
+    "ricinu": [89,919],
+    "rieg": [68,671],
+    "riesg": [533,424,608,464,633,445,634,450,636,464,670,459,721,428,739,386,817,400,827,397],
+    "rigid": [157,632,655,846],
+    "rigidez": [627,342,640,550,648,378,653,378,655,394,671,407,675,398,679,407,703,394,704,382,705,356,742,522,747,382,759,363,761,339,765,324,766,307,772,352,773,386,774,342,892,300,930,333],
+    "rim": [393,553,404,543],
+    "riniti": [525,868],
+    "rinofim": [841,578],
+    "rinon": [458,382,659,410,729,385,775,382,777,545,778,626,780,410,783,658,785,666,790,662,791,357,792,433,794,397,795,424,796,433,801,557,802,406,831,360],
+    "rinoviru": [541,625,545,1009],
+    "rio": [178,593,266,599],
+    "ritm": [70,442,76,407,122,400,415,499,607,432,608,446,609,587,610,613,613,471,714,451,900,400,914,330],
+    "ritual": [489,603,898,537,910,522],
+    "riv": [393,553,404,543],
+    "riversid": [53,801],
+    "rizad": [7,521],
+    "rizom": [17,359,18,423,38,322,40,423,42,443,56,319,92,448,96,465,156,388,157,414,206,388,209,523,226,414,234,380,247,369,258,384,311,428,314,571,475,384],
+    "robl": [118,1167,124,727],
+    "robur": [118,767],
+    "robust": [26,533,463,710],
+    "roc": [174,694],
+    "rock": [174,932],
+    "rockmelon": [457,589],
+    "rockros": [159,905],
+    "rod": [508,771],
+    "rode": [614,612,820,772],
+    "rodean": [746,600],
+    "rodill": [680,489,692,489,705,489,706,471,765,983],
+    "rodiol": [508,529],
+    "roj": [115,308,153,450,180,295,182,375,213,290,238,302,299,357,300,365,302,340,303,340,378,509,393,457,404,519,425,470,470,206,486,276,544,314,585,329,625,276,630,424,680,401,682,293,690,284,692,287,696,287,832,242,839,279,840,308,842,287,845,273,846,281,849,266,853,281,854,279,855,261,856,248,864,261,866,266,868,259,870,287,871,293,875,308,889,295,894,318,935,401,951,336],
+    "rojiz": [165,510,363,551,624,474,839,447,841,434,862,434,865,464],
+    "rom": [245,644],
+    "roman": [4,468,31,696,459,472],
+    "romer": [1,1234],
+    "romp": [616,905],
+    "rompen": [708,434,755,430,760,454,849,454,851,480],
+    "ronc": [686,575,891,625],
+    "ronch": [710,890,840,1062],
+    "ronquer": [528,486,546,513,548,471,550,471,590,481,725,507,739,404,954,749],
+    "ronquid": [532,564,941,575],
+    "roosii": [92,976],
+    "root": [7,503,84,416,206,425,208,425,209,412,210,420,211,404,217,434,233,375,273,458,489,458,508,732,519,577],
+    "rooted": [7,762],
+    "rop": [586,583,855,485,912,374],
+    "roqued": [174,694],
+    "ros": [85,713,172,769,177,397,229,542,236,806,238,557,247,385,250,451,252,666,253,542,372,436,458,393,493,586,508,629,792,446,868,348],
+    "rosace": [841,1042],
+    "rosad": [164,542,551,514,850,446,861,616,864,446],
+    "rosal": [85,819,172,749,236,590],
+    "rosari": [502,946],
+    "rose": [508,771],
+    "rosell": [238,886],
+    "rosemary": [1,976],
+    "roseroot": [508,771],
+    "roset": [487,522,493,603,500,559],
+    "rosmarinu": [1,976],
+    "rostr": [637,583,841,502,869,434],
+    "rot": [271,514,282,542,651,674,762,670,956,703],
+    "rotador": [746,844],
+    "rotatori": [746,1059],
+    "rotaviru": [582,717],
+    "rotund": [96,1246],
+    "rotur": [617,775,762,517,880,609],
+    "rough": [156,644],
+    "rowan": [126,868],
+    "rowleyanu": [502,946],
+    "royal": [274,618],
+    "rua": [57,624],
+    "rub": [222,664],
+    "rubarb": [40,701],
+    "rubefacient": [33,499,57,499,211,489,443,587,469,450],
+    "rubeol": [621,618],
+    "rubi": [461,443,845,538],
+    "rubr": [87,939],
+    "rubrum": [393,777,404,767],
+    "rubu": [390,662,392,685,394,749,422,749,423,737,424,785],
+    "rud": [57,1132],
+    "ruddl": [44,679],
+    "rue": [57,1172],
+    "rugos": [339,577,843,517,860,532],
+    "ruibarb": [40,1059],
+    "ruibarbr": [40,701],
+    "ruid": [655,563,939,518,955,513,956,529],
+    "ruidos": [940,644],
+    "ruptur": [537,460,600,574,620,464,746,653,762,648,853,464],
+    "rusc": [157,1047],
+    "ruscu": [157,925],
+    "rush": [93,919],
+    "rustican": [211,987],
+    "rut": [57,799,643,639],
+    "rvu": [796,946],
+    "sabbath": [8,822],
+    "sabdariff": [238,886],
+    "sabi": [10,443],
+    "sabil": [61,996,490,959],
+    "sabor": [25,340,27,299,34,272,58,262,89,325,194,369,201,321,211,293,215,274,216,318,217,315,221,290,223,282,224,287,284,315,286,274,289,308,294,328,300,373,305,373,308,340,312,347,350,293,351,315,357,352,361,340,362,272,364,340,369,272,374,336,377,315,378,305,402,279,406,343,420,383,467,343,471,274,474,347,476,318,477,369,480,318,481,305,484,296],
+    "saborid": [58,548],
+    "saborij": [27,575,58,505],
+    "sabuc": [75,548,161,464],
+    "sabug": [161,504],
+    "sabugueir": [161,504],
+    "sac": [523,519,537,460,575,626,614,513,747,508,885,483],
+    "saccharin": [304,984],
+    "saccharum": [117,984],
+    "saciant": [90,638,440,616,464,543],
+    "saciedad": [581,735,595,617,807,484,890,484],
+    "sacient": [220,528,302,668],
+    "sacred": [247,788,458,799],
+    "sacroiliac": [703,679],
+    "sacudid": [900,595],
+    "sadurij": [27,624],
+    "saf": [701,862],
+    "saffron": [17,772,22,920],
+    "sag": [10,1067,54,593,173,583],
+    "sagewort": [12,889,54,850],
+    "sagrad": [129,435,139,513,158,519,208,471,247,781,254,496,458,457,510,741],
+    "sajolid": [58,548],
+    "sakau": [84,631],
+    "sal": [308,567,540,466,687,504,778,718,833,475],
+    "salad": [36,636,300,647,308,589,589,557],
+    "salguer": [107,743],
+    "salicilic": [107,743],
+    "salicorni": [308,1065],
+    "salim": [10,443],
+    "saliv": [689,625,873,543],
+    "salivacion": [408,612],
+    "salix": [71,840,107,899],
+    "sallowthorn": [167,587,410,822],
+    "sally": [10,443],
+    "salmonel": [582,717],
+    "salmonell": [705,612],
+    "salpicadur": [798,671],
+    "salpingiti": [805,791],
+    "salser": [11,558,175,928],
+    "salton": [685,631],
+    "salud": [10,191,69,320,213,266,214,366,265,295,277,302,290,242,298,332,299,327,300,336,305,336,315,298,344,292,347,295,350,263,353,286,356,289,358,266,359,283,363,316,365,312,368,305,369,244,371,292,373,316,374,302,375,392,376,417,377,387,379,398,380,283,381,238,410,280,425,271,427,316,429,283,430,305,432,324,433,324,434,327,436,430,439,407,440,407,462,249,486,254,509,277,510,277,512,269,513,286,515,266,519,271,520,280,636,286,833,256,895,263,904,316,912,185,931,213,933,242],
+    "saludabl": [136,515,284,493,399,539,433,565,441,551,453,533,457,442],
+    "salv": [10,916],
+    "salvad": [260,770],
+    "salvi": [10,1043,173,900,428,835],
+    "sambucu": [75,772,161,685],
+    "sampson": [202,892],
+    "san": [5,421,37,409,53,398,65,732,97,761,136,490,214,433,496,827,630,474],
+    "sanan": [826,538],
+    "sandal": [4,447,5,489,24,408,81,915],
+    "sandalwood": [81,991],
+    "sandi": [456,1164],
+    "sandiit": [457,589],
+    "sandthorn": [167,587,410,822],
+    "sang": [518,637],
+    "sanghwang": [283,701],
+    "sangr": [19,274,32,205,103,271,109,271,120,254,131,472,156,243,220,216,228,347,229,234,230,262,251,277,266,246,280,256,350,231,373,277,375,254,377,248,414,295,433,284,452,213,485,202,492,179,518,241,530,259,533,229,534,337,535,215,538,238,552,311,554,462,556,360,558,268,564,271,566,259,585,265,588,236,601,238,603,248,606,231,615,256,619,236,620,227,628,328,630,342,631,393,632,396,633,241,634,243,647,218,648,246,663,241,677,227,697,254,700,227,701,375,721,231,724,268,727,234,754,198,758,229,776,262,778,248,780,254,783,363,789,281,790,277,791,221,792,268,794,246,795,262,800,254,801,254,802,342,808,221,817,216,820,225,822,246,832,195,845,221,881,268,890,221,956,241],
+    "sangrad": [36,295,567,381,584,417,587,407,588,351,631,516,632,385,647,325,694,365,700,548,805,308,806,344,808,328,825,347,829,322,830,340,832,425,833,334,834,322,844,334,860,344,866,319,871,351,890,328,952,531],
+    "sangrar": [680,612],
+    "sangues": [390,856],
+    "sanguin": [36,483,165,846],
+    "sanguinary": [52,727],
+    "sanguine": [62,323,68,337,80,382,165,585,375,337,389,277,454,266,552,290,599,478,603,330,604,320,605,448,618,333,619,313,620,301,622,313,623,323,624,438,625,296,632,344,637,337,647,290,648,326,663,441,670,330,677,301,683,307,697,458,702,451,723,340,754,263,769,282,794,326,802,333,841,412,843,298,871,435],
+    "sanguisorb": [36,996],
+    "sansh": [479,844],
+    "sant": [14,420,26,447,39,630,53,431,54,348,189,766],
+    "santalum": [81,991],
+    "santoreggi": [27,624],
+    "sapindu": [144,946],
+    "saponari": [144,946],
+    "saponin": [144,653,495,548],
+    "sapot": [362,523,363,892],
+    "sarcoidosi": [539,886],
+    "sarcom": [754,767],
+    "sarcopt": [863,811],
+    "sargassum": [306,991],
+    "sargaz": [301,770],
+    "saril": [238,644],
+    "sarn": [94,718,863,747],
+    "sarpullid": [802,612,873,543],
+    "sarrapi": [482,637],
+    "sarsaparill": [156,593,230,859],
+    "satamuli": [519,631],
+    "satawar": [519,631],
+    "satisfacer": [628,624],
+    "sativ": [31,640,216,723,429,718,435,792,459,628],
+    "sativu": [22,920,218,799],
+    "sativum": [6,754,62,770,448,744],
+    "satsum": [323,961],
+    "saturad": [633,637],
+    "saturagon": [58,548],
+    "saturej": [27,799,58,728],
+    "saturn": [396,637],
+    "satyr": [268,600],
+    "sauc": [71,922,75,875,107,997,161,811],
+    "saucegatill": [151,600],
+    "saunf": [449,657],
+    "sauqueir": [161,504],
+    "sauquill": [177,631],
+    "sauz": [161,504],
+    "sauzgatill": [151,777,178,593],
+    "savi": [72,603,113,507,117,653],
+    "savory": [27,992,58,936],
+    "saxifrag": [449,657],
+    "scabiei": [863,811],
+    "scent": [252,600],
+    "scented": [252,844],
+    "schisandr": [509,1092],
+    "schizophyllum": [278,1131],
+    "schoenoprasum": [13,874],
+    "scopariu": [171,892],
+    "scot": [115,657],
+    "scotch": [44,563,115,545,160,540,171,741],
+    "sdr": [551,593,552,757],
+    "sea": [166,555,167,680,307,574,308,548,410,690,922,420],
+    "seaberry": [167,587,410,599],
+    "seb": [191,646,837,700,852,480],
+    "sebace": [837,489,950,596,951,828],
+    "seborreic": [852,796],
+    "sec": [20,363,299,385,360,316,385,416,387,298,399,363,435,385,453,359,466,367,470,223,476,336,477,390,481,550,520,329,527,347,528,336,531,310,536,336,539,326,542,332,543,310,560,329,614,336,680,310,686,316,689,527,713,363,812,307,838,455,839,301,847,416,858,424,868,280,949,536,952,359,954,332],
+    "secrecion": [446,497,525,393,526,367,584,467,730,374,731,669,782,422,811,378,821,378,823,385,824,389,825,389,829,360,935,385,953,441,956,401],
+    "secretolitic": [249,726],
+    "secundari": [403,454,526,408,529,490,569,525,596,507,625,412,683,428,730,416,731,424,848,416],
+    "sed": [635,471,693,502,711,443,712,443,721,448,727,452,729,639,769,590],
+    "sedant": [11,445,24,258,39,231,55,337,56,277,82,324,84,458,88,367,91,478,105,352,106,363,108,290,148,334,160,341,177,330,183,409,234,330,237,330,239,455,240,330,247,448,249,380,257,359,258,334,311,372,349,355,357,385,400,385,415,389,442,409,468,399,482,334],
+    "sedentari": [601,504,636,531,711,484,722,520,865,494],
+    "sedentarism": [633,637],
+    "seductor": [926,618],
+    "sedum": [494,1154],
+    "seed": [8,563,30,574,31,548,122,574,243,611,430,648,432,673,459,538,461,329,464,428,472,366],
+    "seeded": [122,548,456,408],
+    "segment": [380,657],
+    "segmentad": [376,734],
+    "segnexant": [471,573],
+    "segun": [621,569,878,661],
+    "segund": [533,606],
+    "sei": [710,589],
+    "selectiv": [908,856],
+    "seleni": [437,686],
+    "sell": [206,1013],
+    "sellowian": [369,811],
+    "selv": [195,718,366,676],
+    "seman": [530,502,568,531,708,397,710,431,813,427,833,435,861,387,919,419],
+    "semen": [817,528,822,599],
+    "semeruc": [381,553],
+    "semicircular": [867,573],
+    "semill": [6,235,8,217,14,204,15,267,16,258,21,270,26,217,31,301,32,204,33,235,46,356,59,199,82,232,89,255,94,293,101,215,105,343,110,240,111,255,132,219,167,240,191,367,193,373,197,379,199,266,215,215,243,336,247,230,261,353,345,242,353,250,357,276,359,247,364,400,368,267,371,345,372,351,377,247,388,250,397,412,399,270,427,364,428,361,429,338,430,427,431,443,432,283,433,283,434,286,436,290,437,258,438,267,439,267,440,267,441,276,442,443,443,433,444,443,445,448,446,422,447,381,448,402,449,385,450,369,451,410,452,354,453,267,454,376,455,427,456,344,457,395,458,405,459,381,460,228,461,359,462,360,463,342,464,375,465,230,468,286,469,303,474,273,480,250,482,240],
+    "seminal": [817,573],
+    "semperviren": [114,781,162,792,258,764],
+    "sempervivum": [487,844],
+    "sen": [211,428,526,578,730,416,731,424,732,436,733,390,736,373,813,408,941,436,953,490],
+    "senal": [607,644],
+    "senec": [235,679],
+    "seneci": [502,1136],
+    "senegal": [135,961],
+    "senor": [393,553,404,543],
+    "senorit": [58,548],
+    "sensacion": [479,268,528,297,537,266,551,288,555,458,561,332,562,303,568,324,580,306,581,396,584,332,595,332,605,291,607,288,616,297,619,279,625,263,626,274,627,263,645,426,699,231,740,328,744,256,745,285,764,249,765,249,766,236,767,239,768,239,772,271,776,310,791,261,807,261,809,268,818,279,820,266,824,276,854,266,862,258,875,294,880,313,890,370,895,274,900,266,915,271,934,261,935,274,942,413,943,279,949,268,954,294,955,276,956,285],
+    "sensibilidad": [579,330,600,389,619,327,637,352,638,367,643,363,655,355,657,348,660,363,671,367,686,327,707,318,713,376,730,312,745,334,747,344,757,306,758,445,766,277,813,306,821,315,822,341,855,292,856,277,866,297,886,367,887,348,931,260,936,348,941,327,949,315,951,376],
+    "sensibl": [573,792,838,571,874,565],
+    "sentad": [567,590,675,596,755,468],
+    "senticosu": [233,811],
+    "sentid": [526,466,734,640,931,396,941,499,953,560],
+    "sentimient": [896,447,905,494,927,399,928,701],
+    "sentir": [923,472,927,443],
+    "sentirs": [914,731],
+    "senyorid": [58,548],
+    "separacion": [735,625,907,1114],
+    "separars": [913,543],
+    "sepsi": [552,578],
+    "septal": [622,624],
+    "sequ": [838,657],
+    "sequedad": [405,624,731,503,812,503,834,476],
+    "ser": [18,344,29,276,62,315,74,332,77,325,83,356,96,377,100,351,117,368,184,368,187,382,465,300,625,289,673,356,699,253,707,297,709,297,738,303,753,336,760,397,761,286,762,291,820,291,831,408,848,291,851,294,864,273,901,397,906,257,907,271,924,247,925,289,926,422,927,235,929,317,933,276,934,286,939,306,945,344,952,347],
+    "serai": [39,672],
+    "serb": [407,999],
+    "serbal": [126,936,407,669,416,868],
+    "seronegativ": [752,543],
+    "serotip": [544,618,545,692],
+    "serotonin": [813,538,914,453],
+    "serran": [115,571,369,493,470,382],
+    "sesam": [432,1206],
+    "sesamum": [432,984],
+    "set": [163,442,265,461,266,437,274,415,275,560,276,419,280,456,284,740,285,471,286,385,290,378,292,461],
+    "sever": [556,366,604,407,605,415,620,383,628,399,633,407,634,411,666,453,698,376,715,344,728,420,743,424,904,317,915,387,957,448],
+    "sevill": [148,810,240,805],
+    "sex": [766,529],
+    "sexual": [584,413,731,337,775,347,782,373,788,377,803,390,804,327,805,439,806,340,808,460,810,350,811,334,814,496,822,361,823,475,824,479,825,479,826,434,827,315,828,457,829,609,834,454,835,463,923,284,931,275,934,324],
+    "sexualment": [782,671],
+    "sha": [253,618],
+    "shaddock": [325,954],
+    "shaggy": [280,919],
+    "shank": [275,833],
+    "sharon": [398,606],
+    "shatavari": [519,1082],
+    "sheep": [266,650],
+    "shelf": [286,573],
+    "shen": [235,919],
+    "sheng": [18,701],
+    "shigok": [233,568],
+    "shii": [265,686],
+    "shiitak": [265,1170],
+    "shikimic": [472,534],
+    "shiksh": [161,504],
+    "shis": [59,1000],
+    "shock": [628,868],
+    "shog": [18,701],
+    "shrub": [233,568],
+    "sialagog": [210,637],
+    "siam": [38,776],
+    "siames": [38,776],
+    "siberian": [233,951,387,543],
+    "sibilanci": [521,502,524,443,540,427,543,448,547,537,551,471,558,519,606,448],
+    "sibilant": [794,650],
+    "sichuan": [479,1116],
+    "sicklefruit": [32,786],
+    "sid": [74,496,75,435,78,496,82,452,271,471,515,726,683,448,920,427],
+    "siempr": [388,551,835,691,906,436,909,432],
+    "siempreviv": [487,976,494,548],
+    "siend": [261,582,267,534,386,436,461,399],
+    "sient": [847,502,902,548,929,364],
+    "sientan": [625,589],
+    "sifili": [828,956],
+    "sigl": [92,684,97,653],
+    "sign": [732,483,733,431,831,455,851,464,866,439,933,435],
+    "signific": [515,618],
+    "significad": [922,543],
+    "significativ": [896,404,898,464,909,391,910,451,911,438,913,408,916,408],
+    "sigu": [643,694],
+    "siguen": [861,529],
+    "siguient": [906,483,921,543],
+    "sii": [565,880],
+    "silam": [59,529],
+    "silbid": [939,624],
+    "silic": [315,603,531,532,559,828],
+    "silici": [185,761],
+    "silicosi": [559,954],
+    "siliqu": [136,925],
+    "silk": [495,595],
+    "silky": [12,731],
+    "sill": [691,612],
+    "silver": [113,719,272,485,514,577],
+    "silvestr": [3,372,26,358,30,369,66,416,82,383,85,349,91,688,108,343,115,407,161,312,172,534,199,291,215,355,288,425,386,325,389,343,392,399],
+    "simetri": [898,618],
+    "simetric": [859,606],
+    "similar": [5,280,58,260,124,375,154,309,191,353,216,316,221,288,232,309,259,316,286,272,307,353,313,341,353,316,394,349,396,303,403,309,417,385,421,385,425,300,426,385,441,349,450,288,457,280,474,345,480,316,496,316,499,312,528,316,547,349,567,322,663,303,699,245,702,312,708,258,770,272,804,280,811,285,815,280,826,256,841,275,845,277,847,275,861,252,883,297],
+    "simmondsi": [191,976],
+    "simon": [97,1065],
+    "simpl": [656,653,826,799,909,662],
+    "sin": [73,451,275,489,288,569,467,595],
+    "sinapi": [443,968],
+    "sincitial": [543,909,547,676],
+    "sincop": [607,644],
+    "sindri": [456,443],
+    "sindrom": [151,281,178,302,261,329,532,401,552,385,565,412,597,443,616,311,617,305,621,290,623,415,634,302,655,430,668,393,669,418,676,415,689,430,699,355,701,404,705,401,715,366,721,500,727,290,728,308,734,375,735,430,736,364,738,465,739,373,744,383,751,415,754,246,764,261,767,364,769,378,784,447,788,430,793,457,800,427,813,388,882,488,885,406,893,395,894,546,917,287,933,378],
+    "sinensi": [267,886],
+    "singi": [506,743],
+    "singl": [122,595],
+    "sinovial": [765,558],
+    "sintesi": [769,563],
+    "sintom": [151,490,234,507,257,398,544,390,548,374,633,511,653,378,661,412,663,370,689,394,741,315,813,339,815,342,826,313,916,536,917,356,919,603,920,339,921,342,931,509,932,634,933,468],
+    "sinusiti": [526,762,953,646],
+    "sippl": [739,796],
+    "sirv": [379,686],
+    "sisbik": [471,573],
+    "sistem": [26,177,31,171,62,271,172,189,182,245,184,230,195,239,200,215,207,197,208,197,212,191,227,210,236,208,237,193,244,210,254,208,264,210,270,206,273,212,274,189,275,181,277,215,283,215,290,172,320,222,321,217,322,233,323,222,324,201,325,220,326,208,327,203,328,228,329,212,330,233,331,225,332,242,333,242,334,245,335,222,336,197,337,236,338,236,339,203,340,245,341,245,342,245,343,245,344,208,345,197,346,208,347,210,348,210,350,188,351,201,352,208,353,203,358,189,362,174,367,279,369,174,377,201,381,169,393,184,399,220,404,181,411,236,459,166,471,176,510,197,513,203,515,189,516,191,518,195,525,191,530,210,540,179,558,217,564,220,565,195,566,210,609,193,627,255,642,225,650,191,654,217,655,208,659,206,669,199,671,288,678,271,681,195,682,266,683,302,684,286,685,193,686,266,689,281,694,199,695,212,697,279,698,181,699,158,700,184,701,189,707,186,708,166,732,191,741,166,754,161,775,191,804,181,808,179,811,184,831,181,838,201,843,182,845,179,846,184,850,171,856,162,862,177,864,171,868,169,872,259,881,217,885,266,888,195,890,179,891,208,892,158,894,281],
+    "sistemic": [637,685,678,761,690,638,707,455,767,401,784,539,866,426],
+    "siti": [875,605,906,483],
+    "situ": [818,624],
+    "situacion": [901,732,904,383,906,819,908,763,909,816,928,464],
+    "situacional": [907,553],
+    "sjogren": [689,846,894,625],
+    "skaappootji": [498,650],
+    "skeg": [385,578],
+    "skinned": [358,618],
+    "slippery": [287,612],
+    "slo": [408,987],
+    "small": [66,792,108,692,239,543],
+    "smellag": [30,839],
+    "smilax": [156,1054,230,859],
+    "smooth": [358,618],
+    "smoothleaf": [87,701],
+    "snack": [371,679],
+    "snakeroot": [234,581,235,625],
+    "snc": [463,529],
+    "snout": [203,481],
+    "snow": [272,937],
+    "snowball": [177,805,493,859],
+    "soapberry": [144,1065],
+    "sobrecarg": [745,637],
+    "sobrecrecimient": [882,1041],
+    "sobreesfuerz": [774,589],
+    "sobreexcitar": [518,637],
+    "sobrepes": [711,469,721,473,755,416,773,513,857,503,917,473],
+    "sobreproduccion": [685,805,690,558],
+    "sobreprotector": [901,493,929,364,930,498],
+    "sobresalt": [899,563],
+    "sobreus": [774,589],
+    "soci": [922,543],
+    "social": [899,385,901,834,902,432,904,503,908,731,912,295,920,400,923,351,924,345,928,669,934,400],
+    "socialment": [924,504],
+    "sociopati": [925,833],
+    "sodi": [601,631],
+    "sofoc": [234,581,812,558],
+    "soft": [93,919],
+    "sol": [29,313,73,302,223,327,259,369,274,479,275,327,288,381,407,428,467,399,637,373,679,390,791,324,841,321,844,330,845,460,859,337,860,340,861,294,864,310,867,318,868,518,869,540,871,347,906,292,923,284,929,233],
+    "solanum": [374,939],
+    "solar": [681,529,868,661,869,731,914,408],
+    "soldad": [255,709],
+    "soldier": [52,727],
+    "soledad": [923,512],
+    "soli": [914,492],
+    "solid": [586,671],
+    "solimo": [362,568],
+    "solitari": [924,504],
+    "solium": [661,709],
+    "solubl": [461,481],
+    "somatic": [860,508,878,595,882,563,932,735],
+    "sombr": [460,606],
+    "sombrill": [277,701],
+    "somnifer": [205,874],
+    "somniferum": [82,794,442,928],
+    "somnolenci": [532,564,646,533],
+    "son": [40,300,60,254,76,259,94,334,105,287,115,281,126,267,132,250,137,307,142,314,143,318,146,290,147,300,152,303,154,278,160,278,161,215,163,281,167,273,172,264,190,334,193,326,239,267,241,275,249,310,290,241,317,318,371,290,378,273,386,225,390,262,394,314,400,314,413,318,416,330,418,326,419,326,428,310,429,281,430,303,431,334,433,322,434,326,435,326,436,330,437,293,438,303,439,303,441,314,442,334,445,342,451,275,455,243,456,190,457,252,682,267,727,264,741,232,912,184,929,179],
+    "sonars": [952,709],
+    "song": [283,701],
+    "sonid": [529,513,548,471,549,457,622,635,638,513,665,496,794,476,939,729],
+    "sonor": [186,800],
+    "sonrojars": [901,568],
+    "sop": [715,781],
+    "sopl": [611,577,612,554,622,866],
+    "sorbitol": [385,578],
+    "sorbu": [126,754,407,868,416,868],
+    "sord": [699,428,746,498,818,518,819,467],
+    "sorder": [741,543],
+    "sorprendent": [456,443],
+    "sorrel": [238,886],
+    "sospech": [922,543],
+    "sospechos": [924,504],
+    "sostener": [756,568],
+    "sostenid": [435,701,902,581],
+    "sostienen": [809,600],
+    "sour": [148,587,240,581],
+    "southern": [63,637],
+    "southernwood": [54,683],
+    "spadeleaf": [512,624],
+    "spanish": [175,587,495,548],
+    "sparassi": [285,939],
+    "spearmint": [5,833],
+    "spicat": [5,833],
+    "spindl": [164,1116],
+    "spineles": [485,492,492,436],
+    "spinos": [401,935,408,788],
+    "spirulin": [295,810],
+    "split": [278,939],
+    "splitgill": [278,701],
+    "spm": [151,522,813,719,917,532],
+    "spong": [290,563],
+    "spoon": [495,595],
+    "spp": [297,779,299,766,302,743,498,690,499,695,500,685],
+    "spr": [655,919],
+    "spurg": [176,605,503,805],
+    "squamos": [376,968],
+    "stachy": [232,892],
+    "stapeli": [504,1121],
+    "staphylococcu": [662,542,849,454,853,480,855,446,856,423],
+    "star": [472,1058,500,816],
+    "starfish": [504,925],
+    "starflower": [46,946],
+    "steepl": [37,817],
+    "stem": [275,589],
+    "stevi": [41,1133],
+    "sticklewort": [37,817],
+    "sticky": [287,612],
+    "stinging": [79,912],
+    "stingnos": [211,612],
+    "stipitat": [365,961],
+    "stock": [456,443],
+    "ston": [498,892],
+    "stonecrop": [494,1154],
+    "stor": [38,534],
+    "strawberry": [146,970,391,1034,486,512],
+    "streptacanth": [507,1121],
+    "streptococcu": [523,557,849,471,853,498,854,494],
+    "string": [502,1136],
+    "suav": [11,302,13,435,39,219,49,327,58,273,105,334,106,345,137,357,143,370,147,467,160,444,172,308,179,388,184,374,199,234,227,341,239,311,240,314,244,461,249,361,257,341,302,361,305,388,318,374,355,334,363,365,368,353,383,345,384,417,387,293,395,341,396,317,400,365,402,290,405,374,406,357,468,379,470,219],
+    "suaviz": [48,632,49,605],
+    "suavizant": [360,624],
+    "suavizar": [229,618],
+    "subagud": [669,892],
+    "subcortical": [677,844],
+    "subcutane": [853,600],
+    "suber": [124,1015],
+    "subir": [691,532,699,449,914,427],
+    "subit": [534,437,542,442,602,461,616,446,617,437,620,656,629,696,648,437,663,428,749,466,921,396,937,378],
+    "subjetiv": [555,657],
+    "subrufescen": [274,862],
+    "subyacent": [535,493,537,517,730,517],
+    "suced": [907,553],
+    "suciedad": [898,618],
+    "suculent": [487,378,488,330,490,364,493,436,494,374,495,374,497,441,498,409,499,413,500,405,501,401,502,446,503,397,504,431,505,484,506,467],
+    "sudachi": [337,1286],
+    "sudafric": [317,684,505,709],
+    "sudameric": [76,558,100,661],
+    "sudamerican": [198,761],
+    "sudan": [465,612],
+    "sudar": [901,568],
+    "sudest": [90,638,98,646,354,603],
+    "sudor": [530,530,612,493,812,469,872,464,874,503,876,478],
+    "sudoracion": [226,490,603,469,604,455,726,490,728,469,848,753,855,398,864,398,900,425],
+    "sudorific": [46,567,156,514,161,402,162,536,241,514],
+    "sudoripar": [848,595],
+    "sudoros": [628,624],
+    "suegr": [499,657],
+    "suel": [219,428,530,479,558,496,779,459,809,420,845,408,847,404,849,397,861,370,868,386],
+    "suelen": [847,578],
+    "suelt": [819,563],
+    "suen": [23,449,55,393,148,389,240,385,349,415,354,424,516,382,532,731,646,699,653,397,668,363,751,541,787,460,895,374,914,301,915,371,921,360,940,393],
+    "suficient": [555,493,628,651,630,499,687,474,713,539,760,426,949,451],
+    "suficientement": [814,650],
+    "sufren": [101,573],
+    "sufrimient": [859,558,907,509],
+    "sufrir": [92,743],
+    "sugar": [117,906,201,618],
+    "sugarleaf": [41,806],
+    "suh": [800,912],
+    "sui": [92,976],
+    "suillu": [287,856],
+    "sujetar": [756,568],
+    "sulfatid": [671,701],
+    "sulluku": [144,709],
+    "sulphur": [286,817],
+    "sulphureu": [286,817],
+    "sumac": [477,999],
+    "sumidad": [27,387,28,421,37,355,51,337,52,302,53,346,54,279,57,387,58,340,65,407,160,403,174,430,175,395,254,421,255,440,257,425,263,412],
+    "suministr": [556,498,620,522,647,502],
+    "suministran": [603,657],
+    "sumis": [929,419],
+    "summer": [58,728,237,581],
+    "sun": [274,862],
+    "sunchok": [220,573],
+    "sunflower": [243,892],
+    "sunroot": [220,573],
+    "superaliment": [309,684,412,746],
+    "superfici": [219,437,542,469,842,437,843,425,846,429,858,425,860,437,871,446,935,437],
+    "superficial": [552,480,553,563,854,696,926,513],
+    "superior": [532,364,541,404,546,417,547,437,548,383,561,442,572,442,578,391,579,375,581,527,583,417,591,400,598,489,636,395,699,307,799,383,854,499,859,361,863,338,890,347],
+    "superioridad": [927,481],
+    "supersticion": [924,504],
+    "supervision": [29,563],
+    "supiztek": [281,521],
+    "suplement": [87,701],
+    "suprarrenal": [664,737,687,837,716,488,728,851,732,483,737,788],
+    "supresor": [505,709,506,684],
+    "suprimid": [846,600],
+    "suprimir": [440,616,505,669,506,646],
+    "supuest": [366,734],
+    "supuracion": [938,631],
+    "supuran": [849,523,857,599],
+    "supurar": [839,595],
+    "supurativ": [857,892],
+    "sur": [132,507,189,661,420,695],
+    "surg": [580,686],
+    "sushi": [299,761],
+    "suspens": [168,925],
+    "suspicaci": [922,543],
+    "sustanci": [302,479,533,400,539,425,602,453,670,676,672,740,682,573,798,443,839,641,897,389,911,385,915,400,925,389],
+    "sustitucion": [665,679],
+    "sustitut": [165,679],
+    "sutil": [324,657],
+    "sweet": [0,524,9,524,11,534,14,494,24,460,41,647,137,451,209,546,212,393,241,557,252,531,257,431,321,446,386,482,457,370,470,423],
+    "sweeti": [332,1155,333,727],
+    "sweetleaf": [41,806],
+    "sweetwood": [201,671],
+    "swieteni": [138,1015],
+    "swin": [203,481],
+    "sydenham": [706,589],
+    "sylvatic": [119,946],
+    "sylvestri": [49,828,115,828],
+    "syzygium": [20,828,372,810,466,835],
+    "tabac": [242,527,522,515,590,493,601,474,624,474,836,504,954,493],
+    "tabaquism": [524,337,533,337,562,377,563,369,566,381,581,358,588,347,589,373,592,394,602,381,616,369,618,369,633,354,648,361,679,390,694,361,755,299,760,315,789,413,790,408,794,361,808,324,830,337,832,287,870,340,936,369],
+    "tabasc": [476,664],
+    "tabiqu": [526,507,673,936,940,995],
+    "tabl": [454,771],
+    "tac": [45,650],
+    "tact": [579,461,643,507,655,496,745,466,757,427,843,435,866,415,931,363],
+    "tae": [914,731],
+    "taeni": [661,709],
+    "tafazzin": [676,644],
+    "tag": [895,856],
+    "taget": [262,862],
+    "tagu": [482,637],
+    "taig": [233,568],
+    "tail": [270,840,484,569],
+    "tain": [345,644],
+    "tal": [301,770],
+    "tall": [39,250,40,398,64,493,83,412,86,394,93,385,98,422,169,373,185,432,198,432,219,486,308,403,312,412,315,394,491,407,496,377,503,358,504,389,505,437,506,422,512,354,514,377,517,381,760,322],
+    "taman": [354,466,491,482,710,396,719,419,733,375,791,392,817,385,820,400,856,356,857,437,869,336,886,471],
+    "tamarill": [374,1059],
+    "tamarind": [355,1036],
+    "tamarindu": [355,912],
+    "tambor": [531,564,560,599],
+    "tamr": [355,671],
+    "tanacet": [29,942],
+    "tanacetum": [29,806],
+    "tanarid": [29,563],
+    "tangel": [330,1181,331,676],
+    "tangerin": [323,961],
+    "tanin": [118,483,388,612],
+    "tankard": [46,709],
+    "tansi": [29,563],
+    "tansy": [29,1029],
+    "tant": [402,466,406,573,461,384,824,494,825,494],
+    "tapacul": [85,563],
+    "tapan": [837,563],
+    "tapir": [161,504],
+    "tapon": [553,625,955,794],
+    "taquicardi": [556,476,610,757,714,557,741,451],
+    "taquipne": [556,573],
+    "tar": [225,1020],
+    "taraxacum": [67,859,203,662],
+    "tardi": [571,540,733,463,734,463,828,480],
+    "tare": [903,518,930,752],
+    "taronger": [321,709],
+    "tarongin": [24,492],
+    "taronji": [24,492],
+    "tarrag": [12,492],
+    "tarragon": [12,1175],
+    "tarsian": [767,915],
+    "tasmanian": [63,880],
+    "tau": [641,657],
+    "taxu": [121,1007],
+    "tayberry": [424,1185],
+    "taz": [676,593,756,523],
+    "tdah": [903,742,918,523],
+    "tdc": [912,661],
+    "tdde": [918,811],
+    "tdpm": [917,856],
+    "tea": [35,928,128,861,174,810],
+    "teacrin": [368,709],
+    "teak": [482,637],
+    "tectoriu": [380,899],
+    "tectorum": [487,844],
+    "tej": [108,847,121,978,239,518,243,540],
+    "tejid": [185,388,531,312,532,312,550,328,556,292,557,350,560,332,585,358,592,362,593,398,609,322,617,332,623,452,627,301,632,350,637,343,649,362,678,328,690,309,707,309,730,428,741,277,754,541,756,290,769,411,770,292,771,290,804,425,806,312,833,303,853,306,882,346,887,339,889,322,892,263],
+    "tejocot": [122,595],
+    "telangiectasi": [841,502,870,532,871,754],
+    "telegrafic": [665,679],
+    "telepati": [924,504],
+    "tell": [108,553],
+    "temblar": [901,568],
+    "temblor": [640,711,653,488,685,474,714,504,726,515,900,447,931,372],
+    "tembloros": [954,657],
+    "temid": [901,568],
+    "temor": [929,419],
+    "temperament": [900,494,906,436,908,508,916,451],
+    "temperamental": [909,521],
+    "temporal": [639,631,663,554,938,548],
+    "tempran": [581,514,595,594,646,462,732,861,737,520],
+    "temu": [180,874],
+    "tendenci": [869,500],
+    "tendiniti": [745,880],
+    "tendinopati": [745,880],
+    "tendon": [704,481,745,863,746,439,747,481,754,384,756,415,757,427,768,568],
+    "tener": [62,393,278,429,696,374,810,385,814,397,823,374,829,350,831,360,844,363,853,367,869,305,906,321,909,318,912,404,914,301,923,460,927,526,935,374],
+    "tenist": [756,811],
+    "tenosinoviti": [766,710,768,715],
+    "tens": [708,500,954,605],
+    "tension": [70,469,415,531,675,490,690,433,756,406,774,421,813,591,895,611,937,576],
+    "tenuiflorum": [510,886],
+    "tenuifoli": [235,919],
+    "teobromin": [199,433,371,625],
+    "tept": [899,806],
+    "terapi": [807,538,859,558],
+    "termin": [660,576,672,569,694,540,933,467],
+    "terminal": [571,892],
+    "terminar": [903,563],
+    "termogenic": [19,726],
+    "ternate": [256,856],
+    "terrestr": [307,743],
+    "terrestri": [520,892],
+    "testicul": [732,620,733,398,736,381,818,859,819,576,820,753,821,603,822,783,825,442],
+    "testicular": [818,866,819,700,824,537],
+    "testosteron": [224,674,722,520,730,475,736,427,816,466],
+    "tex": [108,553],
+    "texa": [45,650],
+    "textur": [222,499,232,670,279,464,306,571,308,533,377,493,405,565],
+    "thai": [38,776],
+    "thapsu": [48,925],
+    "the": [51,782,203,555,259,700,266,690,286,631,289,498],
+    "theobrom": [199,586,368,785,371,762,462,682],
+    "thorny": [104,771],
+    "thousandleaf": [52,727],
+    "thym": [2,1093,175,810],
+    "thymbr": [175,880],
+    "thymu": [2,892],
+    "tibetan": [267,593,387,543],
+    "tibial": [767,1113],
+    "tic": [750,657],
+    "tiddl": [203,481],
+    "tiemp": [78,448,559,473,626,404,641,434,663,420,681,420,703,448,722,429,760,375,772,400,781,473,856,349,946,382],
+    "tien": [12,260,19,384,27,330,62,340,65,347,100,379,124,418,125,412,179,412,217,347,246,363,355,355,356,355,369,300,374,371,376,388,377,347,402,309,406,379,415,393,471,303,473,363,477,407,482,337,484,327,490,306,568,384,826,285,912,228,946,306,947,333],
+    "tienen": [73,347,101,366,149,453,154,415,236,433,247,391,317,474,397,480,442,498,456,283,597,453,646,369,704,420,850,356,922,347],
+    "tiern": [308,709],
+    "tierr": [0,512,3,522,263,577],
+    "til": [66,1099,108,1009,239,1018],
+    "tilar": [108,553],
+    "tili": [66,792,108,810,239,754],
+    "till": [108,553],
+    "tiller": [108,553],
+    "tillon": [108,553],
+    "tillori": [108,553],
+    "tim": [752,500,891,959],
+    "timb": [223,589],
+    "timid": [908,612],
+    "timidez": [928,600],
+    "timom": [891,919],
+    "timonet": [2,650],
+    "timpan": [938,581,956,1050],
+    "tin": [842,909,864,738],
+    "tinder": [281,992],
+    "tinnitu": [666,567,939,693,943,693,955,494,956,509],
+    "tinospor": [517,912],
+    "tint": [280,590,389,692,892,449],
+    "tinu": [166,954],
+    "tip": [93,340,121,391,174,348,535,285,542,330,544,337,557,344,558,356,580,344,588,313,634,323,635,445,653,326,693,464,711,426,712,426,721,307,726,344,727,310,738,432,739,399,754,263,759,313,769,282,772,304,777,326,808,293,810,316,820,298,844,298,845,293,846,301,852,277,861,266,872,301,892,259,894,340],
+    "tirantez": [765,558],
+    "tiroid": [301,528,685,432,686,594,713,733,714,761,725,771,733,382,739,378,740,742,867,392,917,419],
+    "tiroide": [297,534,301,528,369,556,437,634,608,455,685,598,710,403,713,491,714,624,740,503,741,735],
+    "tiroiditi": [686,992,714,618],
+    "tiron": [757,828],
+    "tirotoxicosi": [714,912],
+    "tirucalli": [503,874],
+    "tisular": [556,573],
+    "tlalcacahuatl": [453,709],
+    "tlapololot": [243,650],
+    "tlilxochitl": [471,573],
+    "tlp": [905,839],
+    "toad": [504,925],
+    "tobacc": [242,701],
+    "tobill": [535,415,606,448,611,486,699,378,705,448,706,431,709,443,767,669],
+    "toc": [898,862],
+    "tocars": [541,679],
+    "tod": [174,394,247,348,295,460,296,437,297,443,300,443,303,412,304,427,306,432,309,422,318,427,319,417,355,381,487,341,516,354,517,381,519,358,553,521,645,407,702,373,832,293,896,306,914,279,945,398],
+    "toe": [497,939],
+    "tolerant": [308,709],
+    "tomar": [915,558,929,386],
+    "tomat": [373,676,374,646],
+    "tomatill": [373,1083],
+    "tomell": [2,650],
+    "tomentos": [195,1007],
+    "tomill": [2,713,27,499,58,632,175,942,480,531],
+    "ton": [736,534],
+    "tongu": [499,1191],
+    "tonic": [26,290,50,360,53,402,54,343,93,340,129,421,158,356,165,340,181,382,182,401,184,493,197,391,203,241,205,316,206,323,209,313,210,320,226,344,227,525,228,340,233,285,235,340,236,340,244,464,247,307,252,301,254,461,257,344,259,333,263,333,390,307,401,396,409,482,515,432,519,316,520,326,667,337],
+    "tonific": [26,578],
+    "tonificar": [226,632,458,575],
+    "tonk": [482,1179],
+    "tooth": [203,418,268,734,657,787],
+    "topinambur": [220,573],
+    "tor": [35,532,316,616,389,480],
+    "toracic": [537,696,552,480,583,582,879,797],
+    "torcid": [626,612],
+    "tornill": [286,573],
+    "torombol": [350,612],
+    "toronj": [322,1115,327,612],
+    "toronjil": [4,648,24,607,39,365,88,879],
+    "torrent": [723,679],
+    "torsion": [756,568],
+    "torvisc": [176,1024],
+    "tos": [28,297,75,261,114,288,115,288,134,351,189,334,215,251,241,282,246,301,249,318,303,318,360,274,405,330,449,288,521,301,522,301,523,294,524,266,526,256,528,291,529,307,530,406,531,268,533,373,534,285,536,291,538,383,539,282,540,256,541,297,542,288,543,268,545,330,546,307,547,322,548,388,549,472,551,282,553,297,554,314,557,301,558,311,559,314,560,285,583,307,590,288,606,268,614,291,740,322,809,263,877,403,879,318,883,274,888,279,891,297,954,288],
+    "tosc": [719,624],
+    "toser": [536,551,542,545,549,518,554,791],
+    "tostad": [371,625,463,488],
+    "total": [604,554,698,512,953,816],
+    "totali": [698,589],
+    "tou": [32,543],
+    "touch": [233,568],
+    "toxemi": [831,833],
+    "toxic": [29,412,57,457,162,491,164,496,171,476,503,461,672,502,685,639],
+    "toxicidad": [166,623,258,554,259,577],
+    "toxin": [6,446,113,417,296,550,391,469,535,406,550,460,640,507,750,469,903,402],
+    "tpoc": [930,817],
+    "trab": [766,529],
+    "trabad": [766,529],
+    "trabaj": [930,498,944,543,946,502],
+    "trabajar": [930,573],
+    "trachomati": [824,992],
+    "trachyspermum": [480,905],
+    "tract": [152,433,413,454,519,385,520,397,544,410,564,438,566,419,596,444,694,397,775,530,777,545,780,410,785,454,815,509,821,367,834,350,881,433,884,545],
+    "tradicional": [28,352,35,318,92,386,115,341,127,395,138,410,148,331,161,262,183,405,200,364,226,356,241,334,245,334,273,360,293,377,306,395,344,352,375,349,380,341,390,318,394,381,405,390,411,400,458,324,465,318,488,273,496,345,501,331,507,356,509,334,512,324,514,345,520,338],
+    "tradicionalment": [102,313,104,268,111,343,119,359,129,301,144,359,173,340,186,405,187,395,194,390,209,316,215,290,230,351,243,329,262,313,271,326,291,322,301,390,318,380,348,347,364,359,372,351,384,301,401,400,407,390,408,310,409,367,416,390,430,359,444,395,451,326,459,275,484,313,487,304,491,363,516,316],
+    "tragar": [527,389,550,365,563,377,580,664,583,398,590,373,593,572,594,432,650,354,658,373,669,369,688,377,690,344,691,348,692,348,699,293,725,394,739,314,740,417,752,308,753,389,885,354,889,358,891,385],
+    "tramet": [270,912],
+    "tran": [633,637],
+    "transit": [350,508,358,513,360,518,382,518],
+    "transitori": [663,810,701,569],
+    "translucid": [497,701],
+    "transmision": [530,414,542,396,544,405,545,453,546,423,550,388,584,448,782,405,803,423,805,330,822,392,824,373,825,373,826,325,828,349,829,574,873,355,877,409,909,314],
+    "transmit": [827,471,828,480,850,463,863,471],
+    "transmiten": [877,679],
+    "transmitid": [782,671],
+    "transparent": [935,612],
+    "transport": [741,434,782,536,803,560,821,480,906,419],
+    "transportan": [794,650],
+    "trap": [316,946],
+    "traque": [529,1042,548,593],
+    "traqueiti": [529,939],
+    "traslucid": [307,743],
+    "trasplant": [846,553,893,553],
+    "trastorn": [5,196,174,231,195,260,228,226,451,214,532,204,540,276,565,212,594,253,596,242,617,217,619,208,623,295,631,306,639,382,646,347,652,228,653,217,654,236,655,226,657,302,659,304,660,231,664,239,665,226,666,236,667,224,668,198,669,297,672,228,673,242,674,219,676,295,677,281,679,234,685,291,687,210,689,226,694,217,696,204,699,172,700,200,701,287,702,219,711,202,713,239,714,224,715,179,717,204,724,236,729,210,733,186,737,297,738,206,739,184,741,358,750,341,751,214,769,269,770,317,791,276,793,247,795,231,804,196,814,217,823,204,874,217,876,206,884,217,886,234,890,194,893,281,894,306,895,329,896,260,897,277,898,287,899,343,900,279,901,270,902,210,903,269,904,323,905,279,907,265,908,204,910,281,911,320,912,268,913,262,914,243,915,283,916,358,917,329,918,344,919,346,920,276,921,277,922,308,923,328,924,295,925,350,926,287,927,239,928,353,929,264,930,272,931,361,932,295,933,314,943,208],
+    "trat": [61,459,70,545,178,534,927,399],
+    "tratad": [706,872,777,540,805,455,822,540],
+    "tratamient": [60,425,71,479,130,550,270,479,619,446,627,421,713,512,812,433,933,576],
+    "tratar": [36,248,59,250,74,320,75,396,86,327,98,351,102,292,111,320,113,275,114,310,118,248,119,335,120,317,121,368,123,363,128,359,133,339,138,373,150,295,156,304,157,324,178,304,180,298,190,368,195,368,201,317,202,307,208,304,228,320,230,327,251,346,344,320,348,324,364,335,372,327,413,351,450,286,461,227,488,248,494,281,499,310,500,304,501,301,507,324,514,313],
+    "traum": [751,450,836,469,897,412,898,432,899,563,904,346,931,346,932,450,933,393,956,445],
+    "traumatic": [639,456,665,427,746,378,895,385,899,592,905,374,906,330,909,327,913,342,915,381,921,370,922,342,929,264,930,360,934,605,948,427],
+    "traumatism": [552,364,627,370,660,436,747,413,755,339,762,374,803,441,815,370,821,378,866,510,879,456,881,446,892,325,940,405,952,446,956,401],
+    "trav": [542,426,543,397,549,405,583,455,622,405,764,362,827,368,829,372,849,368,850,362,854,386,873,382,877,440,884,579],
+    "trayect": [764,558],
+    "tre": [9,458,68,501,101,570,109,394,111,505,122,327,126,343,128,545,132,455,135,528,136,509,139,516,143,536,146,572,151,464,177,480,178,487,199,388,239,343,268,330,276,343,279,340,460,467,463,291,501,484,503,595,568,399],
+    "trebol": [257,686],
+    "tremell": [272,1085],
+    "tremoncill": [2,650],
+    "trenzad": [3,600],
+    "trepador": [86,536,99,603,156,498,509,498,514,513,517,519],
+    "treponem": [828,578],
+    "tribu": [208,644],
+    "tribulu": [520,1096],
+    "trich": [829,817],
+    "trichomon": [829,573],
+    "tricolor": [248,954],
+    "tricomoniasi": [829,817],
+    "tricotilomani": [910,844],
+    "tridentat": [186,1024],
+    "trig": [573,671],
+    "triglicerid": [103,623,572,646,634,880],
+    "trigonell": [32,724,452,742],
+    "trinitari": [248,717],
+    "trist": [914,492],
+    "tristez": [897,512,915,527,917,532],
+    "tromb": [257,686],
+    "tromboangeiti": [624,874],
+    "trombocitopenic": [700,844],
+    "tromboembolism": [534,822,599,661],
+    "trombosi": [619,868],
+    "tromp": [823,532,830,738,938,548],
+    "trompet": [289,1092],
+    "tronc": [370,668,680,564],
+    "tropaeolum": [45,822,224,777],
+    "tropic": [347,686],
+    "tropical": [76,393,94,506,194,500,199,305,225,359,231,409,344,440,345,418,346,440,348,445,356,436,366,476,379,445,877,440],
+    "tru": [9,560,10,454,19,646,21,641,23,493,33,583,158,477,237,424,290,378,447,595,469,378,484,415],
+    "truf": [291,1179],
+    "truffl": [291,1141],
+    "trumpet": [284,605,289,816],
+    "trumpetflower": [258,637],
+    "trunk": [271,644],
+    "tsamm": [456,443],
+    "tsc1": [888,637],
+    "tsc2": [888,637],
+    "tsun": [496,664],
+    "tsyr": [269,595],
+    "tub": [590,545,782,557,803,582,821,498],
+    "tubaric": [830,850],
+    "tuber": [291,880],
+    "tubercul": [90,503,212,594,219,586,220,559,222,620,223,570,224,578,225,545,232,611,251,663,317,668],
+    "tuberculin": [867,573],
+    "tuberculosi": [530,869,538,523,554,595,687,523],
+    "tuberos": [221,738,223,724,231,759],
+    "tuberosu": [220,752,222,834],
+    "tuberosum": [224,844],
+    "tuberou": [224,600],
+    "tubular": [795,932],
+    "tuckaho": [273,694],
+    "tuer": [456,443],
+    "tulasi": [510,644],
+    "tulke": [59,529],
+    "tulsi": [510,1013],
+    "tumeric": [206,644],
+    "tumor": [282,362,488,280,553,362,579,337,598,438,649,505,659,487,660,370,665,362,716,466,717,327,719,333,720,575,723,362,726,494,727,460,728,588,730,317,731,324,732,333,738,330,739,295,754,409,785,397,806,327,872,451,879,387,880,374,891,556,941,463],
+    "tun": [485,872,492,741,507,596],
+    "tunel": [744,652,767,731,857,520,863,648,937,450],
+    "tuner": [485,492,492,436],
+    "tunic": [820,595],
+    "tupi": [346,679],
+    "tupinamb": [220,1140],
+    "turbi": [775,543,776,603,777,565],
+    "turbulent": [622,624],
+    "turc": [3,600],
+    "turkey": [270,912],
+    "turmeric": [17,971,475,1001],
+    "turner": [184,855,735,798,885,543],
+    "turnip": [7,632,211,508,215,678,219,710],
+    "tuscan": [114,657],
+    "tvp": [534,599,619,799],
+    "txarpoil": [450,850],
+    "ubicacion": [878,717],
+    "uci": [710,833],
+    "ugli": [331,1254],
+    "ugni": [420,1024],
+    "ulcer": [102,395,131,433,392,411,562,767,564,458,600,474,630,424,702,420,738,395,826,499,828,369,845,373,846,539,854,380,855,356],
+    "ulceracion": [844,595],
+    "ulceros": [564,878,708,500],
+    "ulluc": [222,1157],
+    "ullucu": [222,905],
+    "ulluku": [222,664],
+    "ullum": [222,905],
+    "ulmari": [51,1012],
+    "ulmeri": [51,543],
+    "ulmifoliu": [394,968],
+    "ulmu": [87,939],
+    "ultraviolet": [708,420,844,460,860,473,868,427,869,386,870,473],
+    "ulv": [307,976],
+    "umbellatu": [277,1131],
+    "umbrell": [277,939],
+    "uncari": [195,1007],
+    "undari": [298,999],
+    "undatu": [351,828,486,767],
+    "une": [887,664],
+    "uned": [146,919],
+    "unen": [704,545,745,529,756,471,851,498],
+    "unguent": [140,761],
+    "unic": [268,498,289,534,370,602,479,498],
+    "unicelular": [296,770],
+    "uniform": [859,606],
+    "uniq": [331,734],
+    "uqa": [223,589],
+    "urat": [758,606],
+    "uremic": [800,912],
+    "ureter": [775,575,796,653],
+    "ureteral": [796,709],
+    "uretr": [775,635,777,476,782,850,798,667,799,648,803,687,821,439,835,431],
+    "uretral": [803,939],
+    "uretriti": [782,912],
+    "urgenci": [807,584],
+    "urgent": [564,555,569,581,599,555,776,536,788,525,821,464],
+    "uric": [386,456,742,571,758,527],
+    "urinari": [45,350,64,336,73,293,146,495,152,510,153,446,155,370,160,481,413,526,484,464,520,350,544,362,705,461,775,610,777,549,779,484,780,362,781,387,785,526,786,491,796,510,797,340,799,477,803,378,809,324,815,521,821,324,834,309,881,510],
+    "ursi": [152,872,413,899],
+    "ursinu": [422,968],
+    "urtic": [79,912],
+    "urticari": [79,536,682,499,708,434,710,665,840,718],
+    "usa": [38,297,43,418,85,313,86,385,90,408,143,413,183,433,186,444,187,433,189,423,206,358,229,343,234,350,245,358,246,381,252,334,262,343,279,343,418,423,449,365,452,313,459,302,476,369,479,334,481,354,483,350],
+    "usab": [165,590,176,571,255,616],
+    "usaban": [251,734],
+    "usad": [29,316,34,319,55,361,59,297,102,347,104,297,156,361,162,377,166,403,169,369,173,377,189,427,192,427,243,365,301,433,302,407,314,398,318,422,319,412,372,389,397,422,407,433,413,417,419,427,457,331],
+    "usan": [120,451,155,461,163,442,207,432,238,432,247,411,256,411,384,400,392,432,416,518,443,493,458,419],
+    "usar": [668,772,947,581],
+    "usars": [40,609,299,661,482,554],
+    "usitatissimum": [427,968],
+    "uso": [72,357,162,345,163,338,164,473,166,369,171,335,173,345,247,315,258,328,260,396,265,353,528,466,535,292,562,349,609,325,612,328,708,280,716,325,745,328,756,292,762,306,766,272,768,275,771,292,775,321,795,357,808,300,811,309,869,257,870,315,904,255,906,270,954,338,955,318],
+    "usted": [942,686],
+    "uter": [804,772,806,684,823,489,830,484,832,412],
+    "uterin": [177,474,390,460,805,411,806,643,808,722,823,460,832,674],
+    "util": [10,324,11,443,17,435,45,476,71,667,386,384,397,550,451,471],
+    "utilidad": [102,618],
+    "utiliz": [61,273,91,331,93,335,98,367,116,350,122,294,127,376,131,335,135,358,190,385,200,346,201,331,204,311,233,280,277,346,282,335,344,335,355,331,360,308,362,280,365,358,367,331,375,331,380,324,401,390,402,288,405,371,406,354,408,302,468,376,494,294,497,346,499,324,500,318,501,315,502,350,504,339,510,318,515,305],
+    "utilizad": [33,256,36,216,75,244,77,372,78,279,87,288,88,288,92,305,94,320,96,316,97,291,111,279,112,262,114,270,119,291,121,320,129,244,133,295,138,324,139,288,144,291,150,256,151,247,158,291,178,264,180,259,194,316,195,320,197,320,198,313,202,267,205,259,208,264,209,256,210,262,211,251,215,235,227,282,230,285,235,279,244,282,250,295,269,244,271,264,273,285,281,214,303,298,364,291,390,251,409,298,411,316,451,264,484,254,487,247,488,216,489,285,491,295,496,273,506,305,507,282,508,217,511,264,512,256,514,273,516,256,520,267,922,223],
+    "utilizan": [84,409,99,506,108,359,109,465,123,500,126,405,134,519,140,494,203,312,348,445,430,460,444,506,469,365,509,418],
+    "uva": [73,519,152,703,156,425,169,593,389,616,393,557,402,690,404,550,406,753,413,764,418,654,454,660,494,553],
+    "uve": [707,606],
+    "uveiti": [702,571,703,590,707,738],
+    "vac": [499,657],
+    "vaccinium": [73,652,153,687,425,725,426,857],
+    "vaci": [578,571,905,517,915,527],
+    "vaciar": [786,583,809,522,816,507],
+    "vacilacion": [815,589],
+    "vacun": [867,573],
+    "vacunacion": [549,624],
+    "vag": [926,618],
+    "vagin": [782,504,805,411,809,451,810,656,811,634,824,464,833,447],
+    "vaginal": [731,387,799,411,805,505,808,528,809,383,810,726,811,623,812,387,824,395,825,550,829,366,830,387,832,330,833,380,834,662],
+    "vaginali": [829,573],
+    "vaginism": [834,573],
+    "vaginosi": [810,874],
+    "vain": [215,498,471,498,820,517],
+    "vainill": [471,1105,482,587],
+    "vainiller": [471,817],
+    "vainonputki": [26,578],
+    "valedrian": [56,529],
+    "valenci": [321,709],
+    "valerian": [56,1278],
+    "valios": [22,770],
+    "vall": [259,1030],
+    "valley": [259,905],
+    "valor": [317,684,913,500],
+    "valorad": [265,515,276,469,283,527,294,515,312,545,349,510,375,504],
+    "valsain": [115,657],
+    "valvul": [606,448,608,486,611,753,612,644,622,457,626,448,796,519,819,412],
+    "valvular": [611,905],
+    "valvulopati": [611,905],
+    "van": [897,589],
+    "vanill": [471,1199],
+    "vapor": [100,717],
+    "var": [217,718,219,684,395,739,396,703,473,739],
+    "vari": [398,443,540,427,659,491,738,452,739,404,787,550,868,404,869,366],
+    "variad": [844,595],
+    "varian": [621,569,710,543],
+    "variar": [820,595],
+    "varic": [111,542,114,525,257,548,460,484,626,684],
+    "varicocel": [819,806],
+    "varicos": [567,563,626,710,819,669,871,518],
+    "variedad": [74,474,82,432,92,519,217,459,219,428,313,501,315,485,395,479,396,445,518,445],
+    "varnished": [264,686],
+    "varon": [798,671],
+    "vas": [389,307,454,294,552,321,596,403,599,399,620,334,623,358,624,485,627,327,637,373,648,361,670,365,677,334,697,507,702,499,754,292,769,313,794,361,802,369,841,457,843,330,871,482,875,499,878,530,880,390,892,287],
+    "vascular": [814,565,871,754,882,798],
+    "vasculiti": [697,757,702,545,792,589,802,751],
+    "vasoconstrictor": [79,618,114,605],
+    "vasodilatador": [68,671],
+    "vasoprotector": [454,529],
+    "veb": [873,589],
+    "vegetacion": [558,709],
+    "vegetal": [45,565,51,472,167,554],
+    "vejig": [153,379,660,450,775,405,776,683,777,422,779,714,782,436,786,721,788,724,789,751,796,614,797,567,809,390,816,379],
+    "vejigos": [301,770],
+    "vell": [715,430,732,499,733,446,736,427,737,520],
+    "vellorit": [246,686],
+    "vellud": [860,612],
+    "velocidad": [607,644],
+    "velutip": [275,833],
+    "velvet": [275,1050],
+    "ven": [567,656,619,620,624,451,626,803,701,442,819,834,871,446,946,587,947,624],
+    "venen": [176,605,750,605],
+    "venenos": [163,571,176,571,260,669],
+    "venerad": [264,632,517,618],
+    "venezuel": [86,694],
+    "venos": [111,525,157,530,257,715,460,469,619,671,626,473],
+    "venotonic": [102,494,111,542,123,615,157,548,460,484],
+    "ventan": [497,939],
+    "ver": [56,362,61,771,436,684,490,783,499,450,626,419,902,432,909,356,912,295,936,455,946,563],
+    "verbal": [918,568],
+    "verbasc": [48,686],
+    "verbascum": [48,925],
+    "verben": [47,1042,254,1151],
+    "verd": [16,600,21,465,29,365,59,343,105,721,296,500,307,482,373,476,392,418,394,476,449,426,481,571,526,379,825,401],
+    "verdader": [21,661,209,575],
+    "verdiazul": [295,810],
+    "verdos": [523,618,829,528],
+    "verdur": [590,657],
+    "veri": [249,961],
+    "vermicular": [494,595],
+    "vermifug": [12,369,29,423,35,460,53,419,54,338,141,750,457,442],
+    "verrug": [143,594,501,509,827,648,843,888,850,640],
+    "verrugos": [113,584],
+    "versatil": [252,553,356,618],
+    "versicolor": [270,840,864,944],
+    "vertebr": [651,553,703,625],
+    "vertebral": [651,522,759,543,763,844],
+    "verticillat": [86,1053],
+    "vertig": [645,737,666,732,942,809,943,671,956,493,957,542],
+    "verum": [19,885,472,715],
+    "vervain": [254,919],
+    "vesc": [391,899],
+    "vesical": [786,792,797,759,799,559],
+    "vesicant": [176,657],
+    "vesicoureteral": [777,599,796,872],
+    "vesicul": [54,359,106,554,218,499,578,718,579,801],
+    "vesiculosu": [301,999],
+    "vestibular": [645,595,666,785,942,569,957,1007],
+    "vhh": [876,618],
+    "vhl": [659,1036],
+    "vhs": [826,781],
+    "via": [9,346,21,422,146,399,153,343,160,382,521,403,529,412,532,503,538,514,541,399,543,360,544,395,546,412,547,432,548,378,549,367,554,422,579,371,598,483,705,360,883,510],
+    "viagr": [267,593,366,676],
+    "viaj": [534,565,619,543,777,565],
+    "viburn": [177,874],
+    "viburnum": [166,986,177,805],
+    "victim": [934,584],
+    "vid": [260,492,274,395,389,508,454,338,519,403,601,403,635,411,636,424,680,391,711,387,722,415,865,395,907,353,929,268,930,366],
+    "videir": [389,553],
+    "vidrios": [488,525],
+    "vient": [949,600],
+    "vietnames": [34,1033],
+    "vietnamit": [34,811],
+    "vih": [683,564,818,575],
+    "viii": [631,679],
+    "vin": [389,692,484,749,509,770],
+    "vinagrer": [12,492],
+    "vinifer": [389,733,454,710],
+    "viol": [241,933,248,878],
+    "violace": [692,532,716,548,866,493],
+    "violacion": [925,589],
+    "violent": [549,624],
+    "violet": [241,1179,291,587],
+    "viral": [522,328,526,279,527,328,528,318,529,336,541,325,548,308,569,360,570,464,571,311,582,343,595,356,613,336,614,318,656,360,666,340,679,336,686,299,689,325,691,293,695,332,700,287,753,328,800,321,822,311,827,272,840,315,850,384,861,253,872,287,873,282,874,311,885,299,886,336,887,318,889,302,890,279,893,287,935,293,938,302,942,328,943,299,957,336],
+    "virginian": [150,868],
+    "viriat": [292,686],
+    "viros": [91,1111],
+    "virrac": [221,606],
+    "viru": [523,395,542,528,543,628,544,395,546,552,547,569,548,521,582,422,613,412,666,417,699,527,712,356,808,343,822,382,826,540,827,557,843,493,872,353,873,490,876,363,893,353],
+    "viscos": [287,612],
+    "visibl": [740,551,762,447,771,426,797,474,826,404,841,434,856,397],
+    "vision": [214,318,363,385,601,330,620,315,623,337,635,337,642,385,647,303,648,341,649,372,663,334,664,376,684,363,688,348,693,359,699,270,707,318,711,318,720,327,726,359,752,285,831,309,931,385,936,540,937,494,944,327,945,593,946,501,947,525,948,481,949,315,950,359],
+    "vist": [71,504,212,469,374,527,387,442,411,578,944,651,946,434],
+    "vistos": [171,599,314,653],
+    "visual": [638,513,653,476,667,491,673,531,944,457,945,513,946,423,947,461],
+    "vit": [288,686],
+    "vital": [262,513,896,447,900,494,913,451],
+    "vitalidad": [520,650],
+    "vitamin": [7,185,13,311,45,231,85,287,126,222,145,274,154,231,167,313,170,331,172,306,196,292,212,222,214,215,215,204,219,304,222,236,231,224,288,244,295,288,299,271,308,252,312,258,320,342,321,336,322,352,323,342,324,319,325,339,326,327,327,322,328,347,329,331,330,352,331,344,332,361,333,361,334,364,335,342,336,315,337,355,338,355,339,322,340,364,341,364,342,364,343,364,345,229,346,241,347,244,348,244,350,218,351,234,352,241,353,236,358,220,363,261,365,342,367,324,369,202,374,249,376,344,377,234,378,226,380,234,381,283,391,234,392,229,393,300,395,244,398,302,399,339,400,261,402,294,403,317,404,296,406,339,409,258,410,231,416,355,418,271,419,271,422,261,423,255,424,281,431,277,433,267,435,271,481,226,513,322,630,236,696,304,723,241,743,393,760,202,806,218,813,207],
+    "vitaminic": [85,323,126,358,145,442,238,370,288,394,294,394,387,338,393,345,394,422,398,348,401,453,402,335,403,373,404,338,406,412,407,442,410,373,416,442,417,465,422,422,423,412,426,465,644,370],
+    "vitex": [151,1028,178,933],
+    "viti": [389,692,425,759,454,670],
+    "vitilig": [681,880],
+    "viv": [222,577,498,565,852,480],
+    "vivient": [498,892],
+    "vizcay": [112,637],
+    "voigu": [129,595],
+    "volant": [707,606],
+    "volar": [909,521],
+    "volumen": [461,399,729,523,780,557,783,602],
+    "voluminos": [540,584],
+    "voluntad": [927,481],
+    "voluntari": [750,657],
+    "voluntariament": [929,419],
+    "volver": [646,578],
+    "volvers": [848,595],
+    "vomit": [544,345,549,321,561,382,570,378,572,382,573,345,577,387,578,338,582,369,589,345,591,345,592,365,595,382,597,365,599,369,600,382,638,361,645,369,648,335,666,365,669,335,674,338,754,270,777,335,778,338,780,345,785,382,800,345,822,335,887,342,904,255,937,290,942,353,957,361],
+    "vomitiv": [164,679],
+    "von": [659,912],
+    "voz": [528,680,686,469,717,460,725,521,737,488,891,510,954,827],
+    "vph": [808,507,827,823,843,729],
+    "vppb": [645,661,942,632],
+    "vsr": [543,857,547,638,548,559],
+    "vuelt": [645,717],
+    "vuelv": [223,543,845,538],
+    "vuelven": [625,543,690,558],
+    "vulgar": [3,603,14,561,29,576,54,321,163,642,445,731,837,576,843,599,858,599],
+    "vulgari": [2,670,53,601,160,670,181,744,213,647,296,750,419,744],
+    "vulnerari": [163,605,314,653],
+    "vulv": [811,976],
+    "wachum": [496,664],
+    "wakam": [298,1173],
+    "wallpepper": [494,839],
+    "walnut": [120,1103,434,913],
+    "warty": [113,584],
+    "wasabi": [42,1152],
+    "washboard": [500,886],
+    "water": [177,451,310,524,311,507,313,512,315,495,316,507,511,633,516,620,519,451],
+    "watercres": [312,726],
+    "watermelon": [456,819],
+    "waterweed": [318,752],
+    "weed": [480,834,515,794],
+    "weeping": [168,925],
+    "wermer": [738,862],
+    "west": [39,558,324,545,381,459,471,476],
+    "western": [144,709],
+    "wet": [203,718],
+    "whimberry": [153,538,425,581],
+    "whit": [4,535,71,624,107,668,113,658,221,415,237,432,272,548,282,465,311,486,384,407,493,475],
+    "whitethorn": [122,839],
+    "whortleberry": [73,683,153,507,425,548],
+    "wickham": [709,606],
+    "wig": [280,679],
+    "wiggin": [126,624],
+    "wild": [3,516,12,447,13,534,26,502,53,490,91,557,163,402,208,393,214,519,216,406,218,382,233,347,248,438,275,360,381,338,386,469,456,271,519,385],
+    "williamsii": [489,932],
+    "willku": [204,874],
+    "willow": [71,840,107,899],
+    "wimberry": [73,543],
+    "win": [389,733,454,710],
+    "winberry": [73,543],
+    "window": [497,865,500,816],
+    "wing": [256,612],
+    "wingleaf": [144,709],
+    "winter": [27,671,129,648,205,675,275,455,291,493,457,644],
+    "winteri": [129,839],
+    "witch": [85,489,126,543,150,1018],
+    "withani": [205,874],
+    "wolfipori": [273,932],
+    "wolman": [674,899],
+    "woman": [54,683],
+    "wood": [49,525,241,514,266,713,279,494,286,652],
+    "woolly": [461,481],
+    "wormseed": [35,856],
+    "wormwood": [12,839,53,890,54,802],
+    "wort": [12,427,51,879,65,781],
+    "woundwort": [52,727],
+    "xantelasm": [865,862],
+    "xanthorrhiz": [221,850],
+    "xantom": [633,637],
+    "xanzain": [210,637],
+    "xeban": [469,563],
+    "xhob": [505,770],
+    "xia": [267,644],
+    "xian": [20,717],
+    "xianggu": [265,686],
+    "xirupat": [290,563],
+    "xocolatl": [199,470],
+    "xoconostl": [486,589],
+    "xocoxochitl": [476,664],
+    "xonacatl": [13,631],
+    "xxy": [736,915],
+    "yac": [377,1024],
+    "yag": [199,470],
+    "yagabisoy": [199,470],
+    "yagabizoy": [199,470],
+    "yam": [223,767,225,509],
+    "yamabushitak": [268,600],
+    "yamini": [480,664],
+    "yaminiki": [480,664],
+    "yanaoc": [224,600],
+    "yangta": [358,618],
+    "yaqon": [84,631],
+    "yarrow": [52,886,255,1046],
+    "yarts": [267,644],
+    "yau": [199,706],
+    "yauti": [225,553],
+    "yaviniki": [480,664],
+    "yellow": [17,447,206,483,210,757,257,515,258,661,290,423,314,533],
+    "yem": [115,675,133,539,134,769,140,744,154,670,294,515,871,469],
+    "yeongji": [264,686],
+    "yerb": [41,423,56,579,69,818,198,744,429,493,488,394,490,434],
+    "yerbabuen": [5,589],
+    "yesc": [271,593,281,830],
+    "yesquer": [271,559,281,783,282,590],
+    "yew": [121,1007],
+    "yin": [228,919],
+    "yod": [297,805,304,601,369,648,713,573,740,587],
+    "youth": [250,717],
+    "yuc": [76,1057,231,1068,495,729],
+    "yucc": [190,928,495,1115],
+    "yuj": [328,976],
+    "yun": [270,671],
+    "yuquill": [17,548,475,587],
+    "yuy": [4,496,53,514],
+    "yuzu": [328,1276],
+    "zabid": [490,578],
+    "zabil": [490,822],
+    "zabin": [490,578],
+    "zacat": [39,440],
+    "zafran": [475,637],
+    "zanahori": [214,853,216,787,221,527],
+    "zanthoxylum": [479,844],
+    "zapal": [282,679],
+    "zapot": [363,1083],
+    "zaragaton": [461,481],
+    "zaramangon": [55,644],
+    "zarz": [55,498,85,435,156,498,392,498,422,749,423,828],
+    "zarzamor": [392,816,394,998],
+    "zarzaparrill": [156,948,230,1106,403,565],
+    "zealand": [223,833],
+    "zeaxantin": [436,770],
+    "zebr": [500,886],
+    "zhi": [270,671],
+    "zhu": [266,650],
+    "zibethinu": [354,932],
+    "zij": [199,470],
+    "zik": [699,516],
+    "zinc": [430,653,456,408],
+    "zingiber": [18,939],
+    "zinni": [250,1266],
+    "zirand": [360,624],
+    "zisu": [59,529],
+    "zizari": [29,563],
+    "zon": [86,424,98,454,174,424,313,438,774,360,829,350,833,363,834,350,839,363,845,357,847,353,852,338,855,341,856,471,869,305,887,553,892,316,913,332],
+    "zoom": [464,624],
+    "zorrill": [35,612],
+    "zoster": [643,694],
+    "zrezal": [386,525],
+    "ztill": [218,624],
+    "zuf": [28,679],
+    "zumaqu": [477,1109],
+    "zumbid": [601,488,666,548,939,833,943,483,955,478,956,493],
+    "zurracayoy": [487,600],
+  },
+  recomendadas: {
+    521: [99,189,241],
+    522: [48,249,241],
+    523: [514,235,201],
+    524: [227,2,235],
+    525: [42,31,211],
+    526: [42,211,63],
+    527: [46,49,48],
+    528: [49,48,46],
+    529: [153,2,9],
+    530: [227,201,17],
+    531: [227,201,360],
+    532: [380,4,258],
+    533: [71,351,298],
+    534: [227,33,18],
+    535: [227,33,122],
+    536: [360,514,315],
+    537: [479,227,235],
+    538: [21,28,115],
+    539: [201,227,248],
+    540: [227,267,48],
+    541: [202,208,161],
+    542: [161,208,75],
+    543: [202,271,208],
+    544: [202,161,514],
+    545: [161,202,42],
+    546: [202,514,271],
+    547: [202,271,208],
+    548: [48,28,241],
+    549: [48,28,115],
+    550: [514,360,153],
+    551: [227,28,115],
+    552: [158,227,201],
+    553: [517,247,372],
+    554: [9,21,42],
+    555: [21,447,3],
+    556: [227,120,101],
+    557: [71,201,121],
+    558: [514,48,249],
+    559: [33,201,17],
+    560: [48,82,28],
+    561: [388,355,201],
+    562: [479,262,72],
+    563: [4,5,8],
+    564: [388,392,36],
+    565: [388,142,408],
+    566: [388,142,181],
+    567: [135,421,76],
+    568: [461,358,360],
+    569: [407,142,408],
+    570: [106,17,203],
+    571: [419,17,203],
+    572: [18,38,372],
+    573: [14,351,478],
+    574: [49,14,478],
+    575: [14,478,105],
+    576: [18,388,38],
+    577: [18,38,421],
+    578: [49,28,48],
+    579: [146,155,106],
+    580: [48,49,28],
+    581: [18,448,15],
+    582: [28,49,48],
+    583: [394,262,112],
+    584: [479,36,446],
+    585: [303,17,474],
+    586: [26,409,401],
+    587: [36,350,382],
+    588: [351,121,350],
+    589: [351,18,71],
+    590: [351,360,49],
+    591: [351,18,71],
+    592: [351,18,71],
+    593: [504,27,502],
+    594: [49,48,28],
+    595: [14,478,105],
+    596: [14,351,478],
+    597: [49,158,28],
+    598: [49,48,28],
+    599: [18,466,454],
+    600: [14,478,105],
+    601: [266,109,374],
+    602: [485,492,103],
+    603: [122,426,18],
+    604: [122,389,415],
+    605: [68,122,389],
+    606: [80,157,101],
+    607: [122,415,400],
+    608: [122,70,415],
+    609: [122,426,70],
+    610: [122,70,415],
+    611: [426,122,415],
+    612: [122,247,73],
+    613: [122,415,70],
+    614: [455,502,244],
+    615: [122,426,227],
+    616: [479,466,1],
+    617: [245,71,298],
+    618: [68,73,376],
+    619: [257,157,102],
+    620: [73,4,479],
+    621: [122,415,225],
+    622: [426,18,122],
+    623: [389,122,454],
+    624: [454,389,426],
+    625: [479,378,216],
+    626: [111,460,157],
+    627: [153,157,257],
+    628: [374,122,266],
+    629: [122,247,298],
+    630: [300,307,456],
+    631: [36,52,461],
+    632: [298,351,36],
+    633: [485,492,103],
+    634: [48,49,82],
+    635: [48,200,49],
+    636: [440,19,464],
+    637: [48,49,82],
+    638: [23,4,258],
+    639: [71,26,122],
+    640: [56,84,438],
+    641: [511,508,256],
+    642: [77,227,200],
+    643: [82,48,183],
+    644: [479,68,71],
+    645: [18,68,479],
+    646: [56,55,240],
+    647: [4,468,68],
+    648: [4,68,17],
+    649: [4,468,68],
+    650: [70,268,77],
+    651: [479,71,18],
+    652: [268,77,68],
+    653: [511,508,68],
+    654: [515,70,184],
+    655: [228,70,56],
+    656: [4,258,514],
+    657: [60,228,56],
+    658: [268,56,84],
+    659: [184,77,268],
+    660: [26,71,515],
+    661: [68,4,17],
+    662: [71,514,51],
+    663: [68,73,234],
+    664: [201,120,228],
+    665: [52,26,122],
+    666: [18,68,305],
+    667: [244,77,228],
+    668: [26,349,228],
+    669: [184,77,26],
+    670: [205,508,68],
+    671: [77,515,209],
+    672: [68,205,511],
+    673: [68,120,465],
+    674: [17,101,458],
+    675: [157,1,229],
+    676: [122,160,229],
+    677: [228,68,371],
+    678: [381,51,227],
+    679: [51,97,76],
+    680: [295,283,290],
+    681: [513,381,44],
+    682: [459,31,274],
+    683: [367,274,153],
+    684: [77,392,184],
+    685: [369,351,437],
+    686: [233,508,367],
+    687: [351,374,266],
+    688: [363,73,17],
+    689: [194,151,77],
+    690: [426,267,365],
+    691: [200,381,56],
+    692: [378,131,306],
+    693: [351,477,280],
+    694: [17,351,195],
+    695: [17,411,106],
+    696: [2,212,222],
+    697: [351,51,454],
+    698: [513,61,351],
+    699: [194,479,347],
+    700: [227,228,225],
+    701: [345,346,377],
+    702: [381,454,389],
+    703: [381,282,50],
+    704: [194,76,195],
+    705: [76,282,97],
+    706: [355,44,61],
+    707: [50,228,381],
+    708: [228,426,394],
+    709: [513,44,394],
+    710: [421,0,200],
+    711: [233,301,508],
+    712: [228,63,301],
+    713: [297,369,301],
+    714: [301,122,437],
+    715: [178,261,151],
+    716: [48,46,49],
+    717: [234,228,204],
+    718: [160,204,245],
+    719: [204,10,160],
+    720: [32,452,14],
+    721: [109,280,485],
+    722: [305,432,289],
+    723: [204,18,392],
+    724: [19,109,32],
+    725: [269,514,301],
+    726: [18,316,282],
+    727: [204,19,109],
+    728: [122,266,201],
+    729: [301,32,452],
+    730: [178,10,228],
+    731: [380,4,178],
+    732: [16,29,54],
+    733: [205,233,220],
+    734: [178,151,261],
+    735: [178,151,63],
+    736: [224,178,151],
+    737: [201,101,16],
+    738: [201,4,178],
+    739: [122,266,301],
+    740: [301,449,105],
+    741: [48,201,77],
+    742: [76,190,112],
+    743: [92,18,71],
+    744: [479,178,151],
+    745: [195,71,504],
+    746: [315,17,18],
+    747: [112,17,444],
+    748: [515,351,17],
+    749: [177,18,33],
+    750: [177,515,70],
+    751: [197,77,1],
+    752: [228,18,73],
+    753: [18,504,33],
+    754: [282,121,14],
+    755: [479,17,122],
+    756: [504,502,491],
+    757: [306,18,71],
+    758: [76,190,444],
+    759: [76,71,190],
+    760: [432,300,442],
+    761: [112,242,229],
+    762: [92,71,439],
+    763: [475,160,32],
+    764: [479,157,39],
+    765: [112,17,444],
+    766: [177,266,89],
+    767: [479,258,504],
+    768: [220,362,479],
+    769: [17,112,444],
+    770: [306,92,315],
+    771: [71,306,185],
+    772: [71,76,190],
+    773: [112,92,71],
+    774: [112,1,17],
+    775: [153,152,413],
+    776: [153,155,152],
+    777: [153,152,413],
+    778: [48,207,49],
+    779: [146,152,413],
+    780: [48,28,2],
+    781: [403,267,238],
+    782: [153,446,207],
+    783: [266,349,109],
+    784: [267,200,233],
+    785: [146,155,152],
+    786: [153,484,146],
+    787: [71,70,233],
+    788: [153,146,155],
+    789: [153,101,160],
+    790: [71,351,51],
+    791: [228,267,380],
+    792: [216,309,266],
+    793: [267,200,233],
+    794: [267,238,403],
+    795: [228,392,458],
+    796: [153,155,484],
+    797: [153,160,146],
+    798: [498,372,303],
+    799: [153,146,155],
+    800: [51,514,388],
+    801: [266,403,228],
+    802: [389,372,454],
+    803: [146,155,152],
+    804: [8,229,178],
+    805: [519,253,514],
+    806: [177,390,229],
+    807: [14,71,502],
+    808: [121,177,261],
+    809: [48,49,82],
+    810: [57,153,478],
+    811: [128,175,3],
+    812: [234,178,261],
+    813: [151,234,178],
+    814: [77,278,284],
+    815: [430,146,155],
+    816: [430,177,277],
+    817: [229,218,430],
+    818: [479,112,177],
+    819: [361,71,368],
+    820: [14,57,483],
+    821: [504,502,491],
+    822: [97,18,38],
+    823: [229,519,253],
+    824: [52,479,514],
+    825: [250,52,253],
+    826: [51,514,151],
+    827: [500,501,514],
+    828: [514,118,10],
+    829: [98,466,36],
+    830: [18,36,38],
+    831: [14,67,361],
+    832: [390,17,177],
+    833: [112,177,71],
+    834: [36,315,5],
+    835: [130,388,188],
+    836: [426,354,466],
+    837: [248,104,362],
+    838: [96,46,48],
+    839: [176,248,302],
+    840: [303,213,37],
+    841: [48,82,49],
+    842: [128,3,250],
+    843: [48,49,143],
+    844: [48,49,82],
+    845: [121,174,223],
+    846: [121,131,364],
+    847: [48,49,28],
+    848: [10,226,407],
+    849: [153,378,10],
+    850: [309,176,306],
+    851: [176,118,10],
+    852: [248,8,261],
+    853: [97,153,44],
+    854: [175,97,153],
+    855: [153,378,131],
+    856: [250,97,248],
+    857: [48,49,82],
+    858: [248,499,520],
+    859: [99,248,49],
+    860: [48,49,82],
+    861: [500,5,494],
+    862: [48,49,82],
+    863: [176,8,63],
+    864: [500,131,378],
+    865: [99,248,46],
+    866: [378,306,303],
+    867: [248,364,157],
+    868: [48,49,82],
+    869: [259,131,306],
+    870: [248,96,380],
+    871: [454,300,500],
+    872: [48,49,82],
+    873: [514,182,277],
+    874: [351,355,71],
+    875: [182,97,355],
+    876: [351,71,298],
+    877: [48,82,28],
+    878: [182,277,112],
+    879: [182,277,201],
+    880: [182,277,505],
+    881: [103,520,32],
+    882: [182,277,261],
+    883: [28,99,2],
+    884: [277,388,182],
+    885: [277,182,515],
+    886: [514,491,51],
+    887: [355,18,182],
+    888: [48,82,28],
+    889: [514,303,21],
+    890: [182,277,200],
+    891: [182,277,282],
+    892: [174,182,277],
+    893: [48,49,82],
+    894: [48,49,82],
+    895: [349,70,56],
+    896: [508,204,22],
+    897: [22,204,462],
+    898: [48,49,82],
+    899: [22,508,462],
+    900: [122,70,415],
+    901: [70,23,516],
+    902: [499,435,54],
+    903: [54,26,412],
+    904: [371,164,380],
+    905: [48,49,82],
+    906: [465,29,315],
+    907: [349,56,66],
+    908: [23,426,505],
+    909: [17,97,70],
+    910: [489,97,79],
+    911: [127,516,23],
+    912: [76,82,233],
+    913: [174,489,97],
+    914: [358,76,354],
+    915: [354,232,127],
+    916: [22,462,256],
+    917: [151,508,22],
+    918: [66,183,0],
+    919: [22,462,256],
+    920: [75,74,451],
+    921: [205,84,23],
+    922: [101,77,166],
+    923: [293,288,252],
+    924: [516,511,293],
+    925: [77,93,64],
+    926: [233,498,309],
+    927: [175,83,62],
+    928: [48,49,82],
+    929: [94,519,268],
+    930: [260,10,101],
+    931: [73,26,29],
+    932: [233,10,77],
+    933: [233,151,77],
+    934: [205,84,23],
+    935: [50,436,299],
+    936: [363,499,50],
+    937: [214,50,436],
+    938: [514,112,71],
+    939: [173,187,358],
+    940: [33,469,443],
+    941: [48,49,82],
+    942: [18,305,68],
+    943: [228,68,166],
+    944: [48,49,82],
+    945: [245,73,380],
+    946: [48,82,28],
+    947: [48,28,2],
+    948: [50,436,214],
+    949: [50,436,214],
+    950: [494,266,174],
+    951: [153,313,15],
+    952: [36,42,218],
+    953: [446,42,351],
+    954: [360,514,479],
+    955: [18,479,71],
+    956: [18,479,112],
+    957: [18,38,68],
+  },
+};
@@ -0,0 +1,2215 @@
+// Pócima Salvage - Índice invertido de síntomas
+// Generado automáticamente por scripts/build-symptom-index.py - no editar a mano
+
+export interface IndiceSintomas {
+  // posición -> [id, sistema donde aparece primero]
+  enfermedades: [string, string][];
+  // palabras que no forman término (ver terminosSintoma en data/sintomas.ts)
+  vacias: string[];
+  // término -> [posición, peso en centésimas, posición, peso, ...] por posición creciente
+  terminos: Record<string, number[]>;
+}
+
+export const indiceSintomas: IndiceSintomas = {
+  enfermedades: [
+    ["asma","sistema-respiratorio"],
+    ["bronquitis-aguda","sistema-respiratorio"],
+    ["neumonia","sistema-respiratorio"],
+    ["epoc","sistema-respiratorio"],
+    ["rinitis-alergica","sistema-respiratorio"],
+    ["sinusitis","sistema-respiratorio"],
+    ["faringitis","sistema-respiratorio"],
+    ["laringitis","sistema-respiratorio"],
+    ["traqueitis","sistema-respiratorio"],
+    ["tuberculosis","sistema-respiratorio"],
+    ["fibrosis-pulmonar","sistema-respiratorio"],
+    ["apnea-del-sueno","sistema-respiratorio"],
+    ["cancer-de-pulmon","sistema-respiratorio"],
+    ["embolia-pulmonar","sistema-respiratorio"],
+    ["hipertension-pulmonar","sistema-respiratorio"],
+    ["derrame-pleural","sistema-respiratorio"],
+    ["neumotorax","sistema-respiratorio"],
+    ["bronquiectasia","sistema-respiratorio"],
+    ["sarcoidosis","sistema-respiratorio"],
+    ["fibrosis-quistica","sistema-respiratorio"],
+    ["resfriado-comun","sistema-respiratorio"],
+    ["gripe","sistema-respiratorio"],
+    ["virus-sincitial-respiratorio","sistema-respiratorio"],
+    ["adenovirus","sistema-respiratorio"],
+    ["rinovirus","sistema-respiratorio"],
+    ["parainfluenza","sistema-respiratorio"],
+    ["metapneumovirus","sistema-respiratorio"],
+    ["crup","sistema-respiratorio"],
+    ["tos-ferina","sistema-respiratorio"],
+    ["difteria","sistema-respiratorio"],
+    ["edema-pulmonar","sistema-respiratorio"],
+    ["sindrome-de-dificultad-respiratoria-aguda","sistema-respiratorio"],
+    ["atelectasia","sistema-respiratorio"],
+    ["hemoptisis","sistema-respiratorio"],
+    ["disnea","sistema-respiratorio"],
+    ["hipoxia","sistema-respiratorio"],
+    ["mesotelioma","sistema-respiratorio"],
+    ["aspergilosis","sistema-respiratorio"],
+    ["silicosis","sistema-respiratorio"],
+    ["asbestosis","sistema-respiratorio"],
+    ["gastritis","sistema-digestivo"],
+    ["ulcera-peptica","sistema-digestivo"],
+    ["reflujo-gastroesofagico","sistema-digestivo"],
+    ["colitis-ulcerosa","sistema-digestivo"],
+    ["sindrome-del-intestino-irritable","sistema-digestivo"],
+    ["enfermedad-de-crohn","sistema-digestivo"],
+    ["hemorroides","sistema-digestivo"],
+    ["estrenimiento","sistema-digestivo"],
+    ["diarrea","sistema-digestivo"],
+    ["hepatitis","sistema-digestivo"],
+    ["cirrosis-hepatica","sistema-digestivo"],
+    ["pancreatitis","sistema-digestivo"],
+    ["enfermedad-celiaca","sistema-digestivo"],
+    ["intolerancia-a-la-lactosa","sistema-digestivo"],
+    ["diverticulosis","sistema-digestivo"],
+    ["diverticulitis","sistema-digestivo"],
+    ["apendicitis","sistema-digestivo"],
+    ["calculos-biliares","sistema-digestivo"],
+    ["colecistitis","sistema-digestivo"],
+    ["disfagia","sistema-digestivo"],
+    ["indigestion","sistema-digestivo"],
+    ["gastroenteritis","sistema-digestivo"],
+    ["hernia-de-hiato","sistema-digestivo"],
+    ["proctitis","sistema-digestivo"],
+    ["fisura-anal","sistema-digestivo"],
+    ["incontinencia-fecal","sistema-digestivo"],
+    ["polipos-de-colon","sistema-digestivo"],
+    ["cancer-de-colon","sistema-digestivo"],
+    ["cancer-de-estomago","sistema-digestivo"],
+    ["cancer-de-esofago","sistema-digestivo"],
+    ["cancer-de-higado","sistema-digestivo"],
+    ["cancer-de-pancreas","sistema-digestivo"],
+    ["esofagitis","sistema-digestivo"],
+    ["acalasia","sistema-digestivo"],
+    ["gastroparesia","sistema-digestivo"],
+    ["linfangiectasia-intestinal","sistema-digestivo"],
+    ["sindrome-de-dumping","sistema-digestivo"],
+    ["colangitis","sistema-digestivo"],
+    ["isquemia-mesenterica","sistema-digestivo"],
+    ["peritonitis","sistema-digestivo"],
+    ["hipertension-arterial","sistema-cardiovascular"],
+    ["ateroesclerosis","sistema-cardiovascular"],
+    ["cardiopatia-isquemica","sistema-cardiovascular"],
+    ["infarto-de-miocardio","sistema-cardiovascular"],
+    ["angina-de-pecho","sistema-cardiovascular"],
+    ["insuficiencia-cardiaca","sistema-cardiovascular"],
+    ["arritmia","sistema-cardiovascular"],
+    ["fibrilacion-auricular","sistema-cardiovascular"],
+    ["bradicardia","sistema-cardiovascular"],
+    ["taquicardia","sistema-cardiovascular"],
+    ["enfermedad-valvular-cardiaca","sistema-cardiovascular"],
+    ["endocarditis","sistema-cardiovascular"],
+    ["miocarditis","sistema-cardiovascular"],
+    ["pericarditis","sistema-cardiovascular"],
+    ["cardiomiopatia","sistema-cardiovascular"],
+    ["aneurisma-aortico","sistema-cardiovascular"],
+    ["diseccion-aortica","sistema-cardiovascular"],
+    ["enfermedad-arterial-periferica","sistema-cardiovascular"],
+    ["trombosis-venosa-profunda","sistema-cardiovascular"],
+    ["accidente-cerebrovascular","sistema-cardiovascular"],
+    ["cardiopatia-congenita","sistema-cardiovascular"],
+    ["soplo-cardiaco","sistema-cardiovascular"],
+    ["sindrome-de-marfan","sistema-cardiovascular"],
+    ["enfermedad-de-buerger","sistema-cardiovascular"],
+    ["enfermedad-de-raynaud","sistema-cardiovascular"],
+    ["varices","sistema-cardiovascular"],
+    ["linfedema","sistema-cardiovascular"],
+    ["shock-cardiogenico","sistema-cardiovascular"],
+    ["paro-cardiaco","sistema-cardiovascular"],
+    ["anemia","sistema-cardiovascular"],
+    ["hemofilia","sistema-cardiovascular"],
+    ["leucemia","sistema-cardiovascular"],
+    ["colesterol-alto","sistema-cardiovascular"],
+    ["trigliceridos-altos","sistema-cardiovascular"],
+    ["diabetes-mellitus","sistema-cardiovascular"],
+    ["obesidad","sistema-cardiovascular"],
+    ["lupus-eritematoso-sistemico","sistema-cardiovascular"],
+    ["migraña","sistema-nervioso"],
+    ["epilepsia","sistema-nervioso"],
+    ["parkinson","sistema-nervioso"],
+    ["alzheimer","sistema-nervioso"],
+    ["esclerosis-múltiple","sistema-nervioso"],
+    ["neuralgia","sistema-nervioso"],
+    ["neuropatía","sistema-nervioso"],
+    ["vértigo","sistema-nervioso"],
+    ["insomnio","sistema-nervioso"],
+    ["accidente-cerebrovascular-acv","sistema-nervioso"],
+    ["aneurisma-cerebral","sistema-nervioso"],
+    ["tumor-cerebral","sistema-nervioso"],
+    ["esclerosis-lateral-amiotrófica-ela","sistema-nervioso"],
+    ["hernia-de-disco","sistema-nervioso"],
+    ["enfermedad-de-huntington","sistema-nervioso"],
+    ["demencia-con-cuerpos-de-lewy","sistema-nervioso"],
+    ["ataxia-de-friedreich","sistema-nervioso"],
+    ["síndrome-de-la-persona-rígida","sistema-nervioso"],
+    ["encefalitis","sistema-nervioso"],
+    ["enfermedad-de-charcot-marie-tooth","sistema-nervioso"],
+    ["enfermedades-de-las-neuronas-motoras","sistema-nervioso"],
+    ["enfermedad-de-von-hippel-lindau","sistema-nervioso"],
+    ["enfermedades-de-la-médula-espinal","sistema-nervioso"],
+    ["absceso-cerebral-parasitario","sistema-nervioso"],
+    ["absceso-raquídeo","sistema-nervioso"],
+    ["accidente-isquémico-transitorio","sistema-nervioso"],
+    ["adrenoleucodistrofia","sistema-nervioso"],
+    ["afasia","sistema-nervioso"],
+    ["laberintitis","sistema-nervioso"],
+    ["enfermedad-de-lafora","sistema-nervioso"],
+    ["síndrome-de-landau-kleffner","sistema-nervioso"],
+    ["síndrome-de-leigh","sistema-nervioso"],
+    ["leucoaraiosis","sistema-nervioso"],
+    ["leucodistrofia-metacromática","sistema-nervioso"],
+    ["leucoencefalopatía","sistema-nervioso"],
+    ["ausencia-del-tabique-pelúcido","sistema-nervioso"],
+    ["enfermedad-por-depósito-de-lípidos-ácidos","sistema-nervioso"],
+    ["dolor-de-espalda","sistema-nervioso"],
+    ["síndrome-de-barth","sistema-nervioso"],
+    ["cadasil","sistema-nervioso"],
+    ["lupus","sistema-inmunologico"],
+    ["artritis-reumatoide","sistema-inmunologico"],
+    ["psoriasis","sistema-inmunologico"],
+    ["vitiligo","sistema-inmunologico"],
+    ["alergias","sistema-inmunologico"],
+    ["inmunodeficiencias","sistema-inmunologico"],
+    ["esclerosis-multiple","sistema-inmunologico"],
+    ["enfermedad-de-graves","sistema-inmunologico"],
+    ["tiroiditis-de-hashimoto","sistema-inmunologico"],
+    ["enfermedad-de-addison","sistema-inmunologico"],
+    ["miastenia-gravis","sistema-inmunologico"],
+    ["sindrome-de-sjogren","sistema-inmunologico"],
+    ["esclerodermia","sistema-inmunologico"],
+    ["polimiositis","sistema-inmunologico"],
+    ["dermatomiositis","sistema-inmunologico"],
+    ["diabetes-tipo-1","sistema-inmunologico"],
+    ["enfermedad-inflamatoria-intestinal","sistema-inmunologico"],
+    ["hepatitis-autoinmune","sistema-inmunologico"],
+    ["anemia-perniciosa","sistema-inmunologico"],
+    ["vasculitis-autoinmune","sistema-inmunologico"],
+    ["alopecia-areata","sistema-inmunologico"],
+    ["sindrome-de-guillain-barre","sistema-inmunologico"],
+    ["purpura-trombocitopenica-idiopatica","sistema-inmunologico"],
+    ["sindrome-antifosfolipido","sistema-inmunologico"],
+    ["enfermedad-de-behcet","sistema-inmunologico"],
+    ["espondilitis-aniquilosante","sistema-inmunologico"],
+    ["artritis-psoriasica","sistema-inmunologico"],
+    ["artritis-reactiva","sistema-inmunologico"],
+    ["fiebre-reumatica","sistema-inmunologico"],
+    ["uveitis-autoinmune","sistema-inmunologico"],
+    ["penfigoide","sistema-inmunologico"],
+    ["liquen-plano","sistema-inmunologico"],
+    ["urticaria-cronica-idiopatica","sistema-inmunologico"],
+    ["diabetes-mellitus-tipo-2","sistema-endocrino"],
+    ["diabetes-mellitus-tipo-1","sistema-endocrino"],
+    ["hipotiroidismo","sistema-endocrino"],
+    ["hipertiroidismo","sistema-endocrino"],
+    ["sindrome-de-ovario-poliquistico","sistema-endocrino"],
+    ["enfermedad-de-cushing","sistema-endocrino"],
+    ["acromegalia","sistema-endocrino"],
+    ["enanismo","sistema-endocrino"],
+    ["gigantismo","sistema-endocrino"],
+    ["prolactinoma","sistema-endocrino"],
+    ["sindrome-metabolico","sistema-endocrino"],
+    ["osteoporosis","sistema-endocrino"],
+    ["hiperparatiroidismo","sistema-endocrino"],
+    ["hipoparatiroidismo","sistema-endocrino"],
+    ["cancer-de-tiroides","sistema-endocrino"],
+    ["insulinoma","sistema-endocrino"],
+    ["glucagonoma","sistema-endocrino"],
+    ["feocromocitoma","sistema-endocrino"],
+    ["diabetes-insipida","sistema-endocrino"],
+    ["ginecomastia","sistema-endocrino"],
+    ["galactorrea","sistema-endocrino"],
+    ["pubertad-precoz","sistema-endocrino"],
+    ["retraso-de-la-pubertad","sistema-endocrino"],
+    ["sindrome-de-kallmann","sistema-endocrino"],
+    ["sindrome-de-turner","sistema-endocrino"],
+    ["sindrome-de-klinefelter","sistema-endocrino"],
+    ["hiperplasia-suprarrenal-congenita","sistema-endocrino"],
+    ["neoplasia-endocrina-multiple-tipo-1","sistema-endocrino"],
+    ["neoplasia-endocrina-multiple-tipo-2","sistema-endocrino"],
+    ["bocio","sistema-endocrino"],
+    ["resistencia-a-la-hormona-tiroidea","sistema-endocrino"],
+    ["artritis","sistema-musculoesqueletico"],
+    ["osteomalacia","sistema-musculoesqueletico"],
+    ["sindrome-del-tunel-carpiano","sistema-musculoesqueletico"],
+    ["tendinitis","sistema-musculoesqueletico"],
+    ["desgarro-del-manguito-rotatorio","sistema-musculoesqueletico"],
+    ["bursitis","sistema-musculoesqueletico"],
+    ["distrofia-muscular","sistema-musculoesqueletico"],
+    ["calambre-muscular","sistema-musculoesqueletico"],
+    ["enfermedades-neuromusculares","sistema-musculoesqueletico"],
+    ["fibromialgia","sistema-musculoesqueletico"],
+    ["miastenia-grave","sistema-musculoesqueletico"],
+    ["miositis","sistema-musculoesqueletico"],
+    ["sarcoma-de-tejido-blando","sistema-musculoesqueletico"],
+    ["enfermedad-discal-degenerativa","sistema-musculoesqueletico"],
+    ["epicondilitis","sistema-musculoesqueletico"],
+    ["distension-muscular","sistema-musculoesqueletico"],
+    ["gota","sistema-musculoesqueletico"],
+    ["espondilitis-anquilosante","sistema-musculoesqueletico"],
+    ["osteopenia","sistema-musculoesqueletico"],
+    ["lumbalgia","sistema-musculoesqueletico"],
+    ["fracturas-oseas","sistema-musculoesqueletico"],
+    ["escoliosis","sistema-musculoesqueletico"],
+    ["ciatica","sistema-musculoesqueletico"],
+    ["quiste-de-baker","sistema-musculoesqueletico"],
+    ["dedo-en-gatillo","sistema-musculoesqueletico"],
+    ["sindrome-del-tunel-tarsiano","sistema-musculoesqueletico"],
+    ["enfermedad-de-de-quervain","sistema-musculoesqueletico"],
+    ["sindrome-de-ehlers-danlos","sistema-musculoesqueletico"],
+    ["displasia-fibrosa","sistema-musculoesqueletico"],
+    ["lesiones-de-la-placa-de-crecimiento","sistema-musculoesqueletico"],
+    ["osteoartritis","sistema-musculoesqueletico"],
+    ["artrosis","sistema-musculoesqueletico"],
+    ["contractura-muscular","sistema-musculoesqueletico"],
+    ["infeccion-urinaria","sistema-urinario"],
+    ["cistitis","sistema-urinario"],
+    ["pielonefritis","sistema-urinario"],
+    ["calculos-renales","sistema-urinario"],
+    ["incontinencia-urinaria","sistema-urinario"],
+    ["insuficiencia-renal","sistema-urinario"],
+    ["enfermedad-renal-cronica","sistema-urinario"],
+    ["uretritis","sistema-urinario"],
+    ["nefritis","sistema-urinario"],
+    ["nefrosis","sistema-urinario"],
+    ["hidronefrosis","sistema-urinario"],
+    ["vejiga-neurogenica","sistema-urinario"],
+    ["nocturia","sistema-urinario"],
+    ["cistitis-intersticial","sistema-urinario"],
+    ["cancer-de-vejiga","sistema-urinario"],
+    ["cancer-de-rinon","sistema-urinario"],
+    ["enfermedad-poliquistica-renal","sistema-urinario"],
+    ["glomerulonefritis","sistema-urinario"],
+    ["sindrome-nefrotico","sistema-urinario"],
+    ["estenosis-de-la-arteria-renal","sistema-urinario"],
+    ["acidosis-tubular-renal","sistema-urinario"],
+    ["reflujo-vesicoureteral","sistema-urinario"],
+    ["extrofia-vesical","sistema-urinario"],
+    ["hipospadias","sistema-urinario"],
+    ["epispadias","sistema-urinario"],
+    ["sindrome-uremico-hemolitico","sistema-urinario"],
+    ["nefropatia-por-iga","sistema-urinario"],
+    ["vasculitis-renal","sistema-urinario"],
+    ["estenosis-uretral","sistema-urinario"],
+    ["endometriosis","sistema-reproductor"],
+    ["enfermedad-inflamatoria-pelvica","sistema-reproductor"],
+    ["fibromas-uterinos","sistema-reproductor"],
+    ["cancer-de-ovario","sistema-reproductor"],
+    ["cancer-de-cuello-uterino","sistema-reproductor"],
+    ["prolapso-de-organos-pelvicos","sistema-reproductor"],
+    ["vaginosis-bacteriana","sistema-reproductor"],
+    ["candidiasis-vaginal","sistema-reproductor"],
+    ["menopausia","sistema-reproductor"],
+    ["sindrome-premenstrual","sistema-reproductor"],
+    ["disfuncion-erectil","sistema-reproductor"],
+    ["prostatitis","sistema-reproductor"],
+    ["hiperplasia-prostatica-benigna","sistema-reproductor"],
+    ["cancer-de-prostata","sistema-reproductor"],
+    ["cancer-de-testiculo","sistema-reproductor"],
+    ["varicocele","sistema-reproductor"],
+    ["hidrocele","sistema-reproductor"],
+    ["epididimitis","sistema-reproductor"],
+    ["orquitis","sistema-reproductor"],
+    ["infertilidad","sistema-reproductor"],
+    ["clamidia","sistema-reproductor"],
+    ["gonorrea","sistema-reproductor"],
+    ["herpes-genital","sistema-reproductor"],
+    ["virus-del-papiloma-humano","sistema-reproductor"],
+    ["sifilis","sistema-reproductor"],
+    ["tricomoniasis","sistema-reproductor"],
+    ["embarazo-ectopico","sistema-reproductor"],
+    ["preeclampsia","sistema-reproductor"],
+    ["placenta-previa","sistema-reproductor"],
+    ["aborto-espontaneo","sistema-reproductor"],
+    ["dispareunia","sistema-reproductor"],
+    ["eyaculacion-precoz","sistema-reproductor"],
+    ["anorgasmia","sistema-reproductor"],
+    ["acne","enfermedades-de-la-piel"],
+    ["eczema","enfermedades-de-la-piel"],
+    ["dermatitis-de-contacto","enfermedades-de-la-piel"],
+    ["urticaria","enfermedades-de-la-piel"],
+    ["rosacea","enfermedades-de-la-piel"],
+    ["micosis-cutanea","enfermedades-de-la-piel"],
+    ["verrugas","enfermedades-de-la-piel"],
+    ["melanoma","enfermedades-de-la-piel"],
+    ["carcinoma-basocelular","enfermedades-de-la-piel"],
+    ["carcinoma-espinocelular","enfermedades-de-la-piel"],
+    ["queratosis-pilaris","enfermedades-de-la-piel"],
+    ["hiperhidrosis","enfermedades-de-la-piel"],
+    ["impetigo","enfermedades-de-la-piel"],
+    ["molusco-contagioso","enfermedades-de-la-piel"],
+    ["penfigo","enfermedades-de-la-piel"],
+    ["dermatitis-seborreica","enfermedades-de-la-piel"],
+    ["celulitis","enfermedades-de-la-piel"],
+    ["erisipela","enfermedades-de-la-piel"],
+    ["foliculitis","enfermedades-de-la-piel"],
+    ["forunculos","enfermedades-de-la-piel"],
+    ["hidradenitis-supurativa","enfermedades-de-la-piel"],
+    ["ictiosis-vulgar","enfermedades-de-la-piel"],
+    ["melasma","enfermedades-de-la-piel"],
+    ["nevos-melanociticos","enfermedades-de-la-piel"],
+    ["pitiriasis-rosada","enfermedades-de-la-piel"],
+    ["prurigo-nodular","enfermedades-de-la-piel"],
+    ["sarna","enfermedades-de-la-piel"],
+    ["tiña-versicolor","enfermedades-de-la-piel"],
+    ["xantelasma","enfermedades-de-la-piel"],
+    ["dermatofibroma","enfermedades-de-la-piel"],
+    ["granuloma-anular","enfermedades-de-la-piel"],
+    ["queratosis-actinica","enfermedades-de-la-piel"],
+    ["lentigo-solar","enfermedades-de-la-piel"],
+    ["poiquilodermia-de-civatte","enfermedades-de-la-piel"],
+    ["telangiectasias","enfermedades-de-la-piel"],
+    ["linfoma","sistema-linfatico"],
+    ["mononucleosis-infecciosa","sistema-linfatico"],
+    ["adenopatia","sistema-linfatico"],
+    ["linfangitis","sistema-linfatico"],
+    ["enfermedad-de-castleman","sistema-linfatico"],
+    ["filariasis-linfatica","sistema-linfatico"],
+    ["malformacion-linfatica","sistema-linfatico"],
+    ["quilotorax","sistema-linfatico"],
+    ["ascitis-quilosa","sistema-linfatico"],
+    ["quiluria","sistema-linfatico"],
+    ["sindrome-de-cloves","sistema-linfatico"],
+    ["bronquitis-plastica","sistema-linfatico"],
+    ["enteropatia-perdedora-de-proteinas","sistema-linfatico"],
+    ["higroma-quistico","sistema-linfatico"],
+    ["hiperplasia-linfofolicular","sistema-linfatico"],
+    ["linfadenitis-mesenterica","sistema-linfatico"],
+    ["linfangioleiomiomatosis","sistema-linfatico"],
+    ["amigdalitis","sistema-linfatico"],
+    ["esplenomegalia","sistema-linfatico"],
+    ["timoma","sistema-linfatico"],
+    ["linfangioma-cavernoso","sistema-linfatico"],
+    ["linfohistiocitosis-hemofagocitica","sistema-linfatico"],
+    ["sindrome-de-evans","sistema-linfatico"],
+    ["trastorno-de-ansiedad-generalizada","trastornos-mentales-emocionales"],
+    ["depresion-mayor","trastornos-mentales-emocionales"],
+    ["trastorno-bipolar","trastornos-mentales-emocionales"],
+    ["trastorno-obsesivo-compulsivo","trastornos-mentales-emocionales"],
+    ["trastorno-de-estres-postraumatico","trastornos-mentales-emocionales"],
+    ["trastorno-de-panico","trastornos-mentales-emocionales"],
+    ["fobia-social","trastornos-mentales-emocionales"],
+    ["esquizofrenia","trastornos-mentales-emocionales"],
+    ["trastorno-por-deficit-de-atencion-e-hiperactividad","trastornos-mentales-emocionales"],
+    ["trastornos-de-la-alimentacion","trastornos-mentales-emocionales"],
+    ["trastorno-limite-de-la-personalidad","trastornos-mentales-emocionales"],
+    ["agorafobia","trastornos-mentales-emocionales"],
+    ["trastorno-de-ansiedad-por-separacion","trastornos-mentales-emocionales"],
+    ["mutismo-selectivo","trastornos-mentales-emocionales"],
+    ["fobia-especifica","trastornos-mentales-emocionales"],
+    ["tricotilomania","trastornos-mentales-emocionales"],
+    ["trastorno-de-excoriacion","trastornos-mentales-emocionales"],
+    ["trastorno-dismorfico-corporal","trastornos-mentales-emocionales"],
+    ["trastorno-de-acumulacion","trastornos-mentales-emocionales"],
+    ["trastorno-afectivo-estacional","trastornos-mentales-emocionales"],
+    ["distimia","trastornos-mentales-emocionales"],
+    ["trastorno-ciclotimico","trastornos-mentales-emocionales"],
+    ["trastorno-disforico-premenstrual","trastornos-mentales-emocionales"],
+    ["trastorno-de-desregulacion-disruptiva-del-estado-de-animo","trastornos-mentales-emocionales"],
+    ["trastorno-esquizoafectivo","trastornos-mentales-emocionales"],
+    ["trastorno-delirante","trastornos-mentales-emocionales"],
+    ["trastorno-psicotico-breve","trastornos-mentales-emocionales"],
+    ["trastorno-de-la-personalidad-paranoide","trastornos-mentales-emocionales"],
+    ["trastorno-de-la-personalidad-esquizoide","trastornos-mentales-emocionales"],
+    ["trastorno-de-la-personalidad-esquizotipica","trastornos-mentales-emocionales"],
+    ["trastorno-de-la-personalidad-antisocial","trastornos-mentales-emocionales"],
+    ["trastorno-de-la-personalidad-histrionica","trastornos-mentales-emocionales"],
+    ["trastorno-de-la-personalidad-narcisista","trastornos-mentales-emocionales"],
+    ["trastorno-de-la-personalidad-evitativa","trastornos-mentales-emocionales"],
+    ["trastorno-de-la-personalidad-dependiente","trastornos-mentales-emocionales"],
+    ["trastorno-de-la-personalidad-obsesivo-compulsiva","trastornos-mentales-emocionales"],
+    ["trastorno-de-conversion","trastornos-mentales-emocionales"],
+    ["trastorno-de-sintomas-somaticos","trastornos-mentales-emocionales"],
+    ["trastorno-facticio","trastornos-mentales-emocionales"],
+    ["amnesia-disociativa","trastornos-mentales-emocionales"],
+    ["conjuntivitis","otorrinolaringologia-oftalmologia"],
+    ["cataratas","otorrinolaringologia-oftalmologia"],
+    ["glaucoma","otorrinolaringologia-oftalmologia"],
+    ["otitis-media","otorrinolaringologia-oftalmologia"],
+    ["tinnitus","otorrinolaringologia-oftalmologia"],
+    ["desviacion-del-tabique-nasal","otorrinolaringologia-oftalmologia"],
+    ["polipos-nasales","otorrinolaringologia-oftalmologia"],
+    ["vertigo","otorrinolaringologia-oftalmologia"],
+    ["enfermedad-de-meniere","otorrinolaringologia-oftalmologia"],
+    ["presbicia","otorrinolaringologia-oftalmologia"],
+    ["astigmatismo","otorrinolaringologia-oftalmologia"],
+    ["miopia","otorrinolaringologia-oftalmologia"],
+    ["hipermetropia","otorrinolaringologia-oftalmologia"],
+    ["estrabismo","otorrinolaringologia-oftalmologia"],
+    ["ojo-seco","otorrinolaringologia-oftalmologia"],
+    ["chalazion","otorrinolaringologia-oftalmologia"],
+    ["orzuelo","otorrinolaringologia-oftalmologia"],
+    ["epistaxis","otorrinolaringologia-oftalmologia"],
+    ["anosmia","otorrinolaringologia-oftalmologia"],
+    ["disfonia","otorrinolaringologia-oftalmologia"],
+    ["cerumen-impactado","otorrinolaringologia-oftalmologia"],
+    ["perforacion-del-timpano","otorrinolaringologia-oftalmologia"],
+    ["neuritis-vestibular","otorrinolaringologia-oftalmologia"],
+  ],
+  vacias: ["a","al","ante","como","con","contra","cuando","de","del","desde","donde","durante","e","el","en","entre","hacia","hasta","la","las","le","les","lo","los","mas","misma","mismo","muy","o","otra","otras","otro","otros","para","pero","por","puede","pueden","que","se","sin","sobre","su","sus","tambien","tras","u","un","una","unas","uno","unos","veces","vez","y","ya"],
+  terminos: {
+    "100": [89,603],
+    "abajo": [277,586],
+    "abandono": [384,556],
+    "abarrotan": [392,422],
+    "abcde": [323,528],
+    "abdomen": [36,325,40,346,51,325,56,335,57,290,58,282,60,325,62,325,70,315,77,358,94,306,95,282,195,275,254,298,255,306,270,391,271,275,276,262,284,262,297,262,303,298,309,282,340,233,369,255],
+    "abdominal": [43,297,44,338,45,326,48,316,49,326,52,306,53,350,54,363,55,326,58,258,61,338,66,306,67,272,68,306,71,265,74,316,75,338,76,350,78,306,79,418,113,297,173,297,174,316,200,251,202,297,233,245,275,316,276,239,286,332,310,245,359,316],
+    "abertura": [277,534,278,457],
+    "abierto": [385,335],
+    "aborto": [180,528],
+    "abrir": [324,503],
+    "abrupto": [11,571],
+    "abultada": [105,528],
+    "abundant": [179,480,283,493],
+    "abundante": [285,506,431,620],
+    "acaro": [342,503],
+    "acceso": [28,515],
+    "accident": [156,640],
+    "accidente": [180,528],
+    "acelerada": [218,440],
+    "acelerado": [376,447,379,468],
+    "aceptacion": [408,267],
+    "acerca": [385,335],
+    "acidez": [42,532,62,516,68,532,72,568],
+    "acido": [169,480],
+    "acne": [181,452,194,397,210,440,216,440,320,407],
+    "acompanado": [389,480],
+    "acontecimiento": [401,370],
+    "acostarse": [30,556],
+    "acropaquia": [10,506,39,519],
+    "activa": [388,362,392,384],
+    "actividad": [238,366,327,322,375,288,378,308,382,308,393,260,394,330,396,356,402,265,407,322,409,276],
+    "acto": [377,503],
+    "actuar": [382,480],
+    "acumulacion": [115,452,195,417,297,397,364,493,392,325],
+    "acuosa": [4,499,61,620,414,485],
+    "acv": [142,506,149,565],
+    "adelgazamiento": [291,503],
+    "admiracion": [406,325],
+    "adormecimiento": [99,457,240,447],
+    "adquirida": [148,603],
+    "afasia": [147,571],
+    "afeacia": [390,422],
+    "afeccion": [389,436,412,557],
+    "afecta": [327,428,333,438,342,428],
+    "afectada": [98,396,224,385,237,407,241,385,250,396,253,385,334,339,335,446,371,426],
+    "afectado": [245,369,422,534],
+    "afectar": [177,417,188,447],
+    "afecto": [384,556],
+    "afeitado": [334,503],
+    "afta": [181,586],
+    "afuera": [276,515],
+    "agacharse": [240,491],
+    "agrandada": [298,541],
+    "agrandado": [227,640],
+    "agrandamiento": [153,447,164,447,196,423,209,423,211,391,355,505],
+    "agrietada": [159,448,318,486,321,437,337,448],
+    "agrio": [42,660],
+    "agruparse": [348,406],
+    "aguda": [294,491],
+    "agudo": [8,392,13,359,16,370,27,370,28,316,64,370,93,370,122,404,123,381,228,404,234,287,243,316,309,341],
+    "ahogo": [30,506,379,468],
+    "aire": [0,489,11,396,34,554,35,396,82,419,101,419,350,349,406,225],
+    "aislamiento": [381,449,383,352,407,428],
+    "alardear": [406,325],
+    "alcanzar": [402,414],
+    "alejar": [423,503],
+    "alerta": [132,603],
+    "aletargado": [393,406],
+    "algo": [386,370],
+    "alguno": [23,603],
+    "aliento": [5,287,14,332,17,359,81,370,84,359,86,359,89,370,90,370,92,392,94,370,109,381,368,350,379,316],
+    "alimentarse": [100,556],
+    "alimento": [41,460,42,445,62,432,72,475,73,445,74,460,292,365,383,279,432,445],
+    "alinean": [427,586],
+    "alivia": [84,586],
+    "alopecia": [177,459],
+    "alquitranada": [233,528],
+    "alrededor": [5,326,46,431,64,419,189,319,221,419,328,366,334,349,416,333],
+    "alta": [2,336,8,357,21,318,102,294,195,302,200,302,207,346,218,245,256,346,260,357,262,346,270,310,271,302,273,280,280,368,310,294,333,287,348,226],
+    "altamente": [328,528],
+    "alteracion": [372,599,387,571,394,438],
+    "alterado": [399,414],
+    "altibajo": [396,556],
+    "alto": [113,544,136,499,306,418],
+    "altura": [198,534,388,362],
+    "alucinacion": [132,465,146,509,381,407,398,459,400,354],
+    "amarilla": [5,399,304,438,344,438],
+    "amarillenta": [2,447,71,423,109,461,308,356,331,391,344,382],
+    "amarillo": [344,515],
+    "amarronado": [345,469],
+    "amba": [431,681],
+    "ambiguo": [216,571],
+    "ambo": [231,405,299,501,301,460,419,448],
+    "amenazant": [401,370],
+    "amenorrea": [213,515],
+    "amigdala": [29,506,368,519],
+    "amigo": [401,337,403,325],
+    "amistad": [409,431],
+    "amplio": [412,406],
+    "amplitud": [106,519,221,549],
+    "ampolla": [187,612,305,378,318,465,330,562,342,388],
+    "anal": [46,565,306,447],
+    "ancho": [214,742],
+    "anemia": [66,532,162,460,350,405,369,405],
+    "aneurisma": [102,528],
+    "angina": [81,549,82,549],
+    "angioedema": [189,417,319,519],
+    "angustia": [314,528],
+    "angustiant": [378,480],
+    "anillo": [321,493,346,506],
+    "animal": [388,398],
+    "animo": [120,407,156,432,375,303,376,331,378,324,395,285,396,375,397,303,398,402],
+    "ano": [46,565,64,549],
+    "anomalia": [147,571],
+    "anormal": [92,370,124,370,200,313,248,330,276,297,277,339,278,414,284,297,287,297,289,330,303,339,304,297,308,277,309,321,410,271,421,359],
+    "anormalmente": [179,528],
+    "anos": [211,631,212,667,395,359],
+    "anosmia": [213,515],
+    "ansiedad": [30,327,164,355,193,366,205,319,218,259,292,319,377,296,380,282,385,311,388,429,390,248,396,327,403,210,407,296,411,366],
+    "ante": [187,340,211,550,311,382,314,391,380,356,386,275],
+    "antebrazo": [235,515],
+    "anticipatoria": [380,480],
+    "antojo": [292,493,393,369],
+    "aortica": [102,528],
+    "aparece": [84,586],
+    "aparecen": [188,378,189,354,319,440,329,397,340,354],
+    "aparecer": [322,417,324,388,326,388,328,407,347,362],
+    "aparente": [412,406],
+    "aparicion": [13,385,31,365,160,365,179,347,211,347,216,375,307,283,323,347,348,267,400,302],
+    "apariencia": [277,473,338,426,391,555,405,362],
+    "apatia": [381,528],
+    "apatico": [393,406],
+    "apetito": [10,341,22,359,39,350,50,446,56,404,70,381,71,350,166,359,172,370,174,418,175,359,190,392,359,418],
+    "apnea": [28,515],
+    "apoyo": [408,440],
+    "aprendizaje": [143,582,220,436],
+    "aprobacion": [408,267],
+    "aprovecharse": [404,457,406,295],
+    "aproximadamente": [348,406],
+    "arbol": [340,459],
+    "arco": [136,586],
+    "ardiente": [41,681],
+    "ardor": [60,330,69,311,84,302,105,272,123,320,159,286,243,265,246,286,254,302,255,311,261,330,289,294,290,272,294,253,303,302,304,265,308,247,313,272,318,311,333,265,341,247,414,294,428,302],
+    "area": [98,339,177,265,209,330,224,330,250,339,294,284,305,284,306,407,325,305,332,313,334,290,347,271,348,234,354,348,371,244,408,154],
+    "arena": [414,571],
+    "arenilla": [428,586],
+    "arrancarse": [389,814],
+    "arrastrada": [410,469],
+    "arrebato": [397,661],
+    "arreglar": [391,293],
+    "arriesgado": [376,491],
+    "arrogancia": [406,325],
+    "arteria": [180,528],
+    "arterial": [107,359,166,359,195,332,200,332,207,381,218,269,260,392,262,381,270,341,271,332,273,308,280,404,310,323],
+    "articulacion": [102,280,110,311,115,311,116,330,158,478,168,374,174,362,181,311,182,303,183,273,185,261,196,303,218,233,221,432,226,478,237,489,244,280,248,416,251,432,252,458,371,224],
+    "articular": [157,473,158,489,176,473,221,565,226,489,237,419,251,419,253,396],
+    "articulo": [392,422],
+    "asciti": [363,704],
+    "asfixia": [30,556],
+    "asimetria": [323,528],
+    "asintomatica": [239,499,303,499,306,418],
+    "asintomatico": [95,412,101,447,113,475,149,461,152,540,339,373],
+    "asociado": [392,384,416,436],
+    "asociarse": [101,603],
+    "aspecto": [332,460,349,528,360,544],
+    "aspera": [8,582,337,506],
+    "aspereza": [433,541],
+    "aspero": [326,457,347,427],
+    "astuto": [412,406],
+    "asuman": [408,267],
+    "ataque": [28,415,180,426,379,415,401,299],
+    "atasca": [59,660],
+    "atascado": [245,406],
+    "ataxia": [146,601,151,641],
+    "atencion": [132,447,220,356,382,356,391,217,405,333,412,301],
+    "atenuada": [415,571],
+    "ateroesclerosi": [112,519,113,582],
+    "atracon": [383,414],
+    "atribuye": [389,436,390,384],
+    "atrofia": [136,473,137,549,298,437,349,501],
+    "aturdimiento": [86,473,89,486,109,501,373,587],
+    "audicion": [128,489,143,475,145,505,417,435,422,435,435,401],
+    "auditiva": [434,586],
+    "aumentada": [134,621],
+    "aumento": [19,268,85,282,114,430,149,315,165,315,172,468,190,430,192,358,194,262,195,275,200,275,206,268,212,228,263,335,270,282,272,335,273,255,292,275,304,262,335,228,337,282,359,346,360,325,375,228],
+    "aura": [117,601,156,582],
+    "ausencia": [108,525,212,509,309,428,315,525,398,301],
+    "ausent": [194,415,199,437,210,460,302,437],
+    "ausente": [213,847],
+    "autoestima": [394,468,407,457],
+    "autoimagen": [384,556],
+    "autoimpuesto": [407,503],
+    "autoinducido": [383,414],
+    "avanzada": [416,480],
+    "avaricia": [409,431],
+    "axila": [327,428,352,544,364,544],
+    "axilar": [211,480,216,519],
+    "ayuda": [385,335],
+    "azucar": [200,493,206,480],
+    "azul": [104,460,105,449,169,408],
+    "azulada": [14,401,16,447,31,412,35,423,100,412,362,435],
+    "azulado": [103,480,371,384],
+    "babeo": [59,660],
+    "bacteriana": [294,491],
+    "baja": [1,356,22,307,32,356,93,315,107,307,166,307,182,298,188,257,197,307,212,235,214,388,220,251,238,298,240,257,243,269,254,307,276,269,284,269,303,307,312,283,394,269,407,263],
+    "bajo": [155,423,162,423,215,356,247,333,316,447,344,382],
+    "barba": [177,459],
+    "base": [219,544,245,345,247,667],
+    "bazo": [153,603],
+    "bebe": [28,438,100,473,331,449],
+    "belleza": [406,325],
+    "benigno": [401,370],
+    "berrinch": [397,449],
+    "bien": [333,468,404,457],
+    "bizco": [427,586],
+    "blanca": [160,428,188,378,304,397,327,388,334,388],
+    "blanco": [104,401,155,423,169,356,289,423,290,391,343,382],
+    "blanda": [48,620,327,457],
+    "blanquecina": [331,528],
+    "bloqueo": [244,528],
+    "boca": [62,444,168,489,181,407,187,319,188,341,307,299,328,366,330,358],
+    "bocio": [164,513,165,528,220,408],
+    "bolsa": [298,541],
+    "bord": [321,460,344,438,346,473],
+    "borde": [323,480,430,601],
+    "borrosa": [80,401,114,377,127,377,172,355,186,366,190,377,205,319,415,336,416,282,423,296,424,366,425,311,426,311,428,345,429,345],
+    "bradicinesia": [119,681],
+    "brazo": [83,313,99,290,102,305,106,330,126,313,130,370,133,359,167,321,170,297,215,277,225,359,231,290,234,394,250,339,326,290,347,271],
+    "brev": [399,414],
+    "brillante": [64,513,311,438,333,438],
+    "brillantez": [406,325],
+    "broncean": [343,515],
+    "bronquial": [362,586],
+    "brot": [189,459],
+    "bulto": [204,348,209,330,218,254,233,429,244,305,245,234,288,321,297,297,324,290,326,290,335,259,336,461,346,321,371,244,429,461,430,381],
+    "burlan": [391,293],
+    "busqueda": [412,406],
+    "cabello": [160,473,177,571,291,428],
+    "cabelludo": [177,390,331,449,347,399],
+    "cabeza": [11,271,21,271,80,324,99,239,117,314,126,257,127,304,128,314,135,359,140,346,176,324,197,279,199,257,205,257,207,295,210,271,218,209,270,264,273,239,292,257,310,251,350,239,354,287,386,176,420,279,423,239,424,295,425,251,426,251],
+    "cadera": [170,397,182,440,238,440,242,479,296,397],
+    "cafe": [235,468,338,480],
+    "caida": [227,582,231,457],
+    "caido": [167,556],
+    "calambr": [43,401,44,456,45,441,48,427,61,456,76,473,97,357,105,331,129,389,203,427,229,378,312,339],
+    "calambre": [98,534,178,310],
+    "calculo": [202,516,217,501,218,355,274,568],
+    "caliente": [300,493,332,493],
+    "calor": [98,407,189,319,193,431,237,419,250,407,327,349,335,312,365,524],
+    "calvicie": [177,459],
+    "cambiant": [405,449],
+    "cambiante": [91,586],
+    "cambio": [55,374,66,350,67,311,120,320,128,350,131,330,151,374,196,303,204,320,205,287,231,267,260,340,291,267,292,287,302,287,321,287,323,280,338,280,376,261,383,220,432,350],
+    "caminando": [234,469],
+    "caminar": [81,378,97,357,121,441,131,389,133,389,136,367,150,389,175,367,178,213,222,427,410,294,436,413],
+    "cana": [160,556],
+    "cancer": [306,491],
+    "cansancio": [173,475,176,505,279,505,281,435,394,382,426,391],
+    "cantidad": [17,534,369,457],
+    "capacidad": [129,479,147,440,150,479,387,354,408,206],
+    "cara": [99,315,126,339,171,315,195,339,262,389,271,339,310,331,327,315,331,331,333,323,347,294,350,315],
+    "caracteristica": [27,549,206,480],
+    "carbohidrato": [393,406],
+    "cardiaca": [35,485,207,528,218,374],
+    "cardiaco": [13,352,87,373,88,334,89,362,90,362,91,352,92,384,94,362,102,317,155,343,169,288,193,373,214,317,379,309],
+    "cardiomiopatia": [133,565,155,519],
+    "cardiovascular": [307,431],
+    "carditi": [185,491],
+    "carecer": [403,358],
+    "carente": [405,449],
+    "carne": [324,503],
+    "carnosa": [322,541],
+    "carraspera": [6,640],
+    "casa": [385,305,387,417],
+    "cascara": [332,541],
+    "casi": [314,407,375,346,385,258,388,307,393,313],
+    "caso": [22,435,101,447,112,423,147,423,177,340,306,364],
+    "caspa": [331,528],
+    "catatonico": [400,459],
+    "causar": [113,458,307,309,322,388,323,378,329,369,339,360,340,329],
+    "cause": [386,370],
+    "cavo": [136,586],
+    "ceguera": [410,469],
+    "ceja": [160,506,177,417],
+    "celuliti": [371,422],
+    "central": [58,473,138,544,220,408],
+    "centro": [84,452,320,407,329,397,335,346,405,346],
+    "cerca": [95,473,247,562,423,428],
+    "cercana": [371,384,402,377],
+    "cercano": [403,304,423,428,426,449],
+    "cerebrovascular": [156,582,180,480],
+    "ceroso": [324,503],
+    "cerrado": [385,335],
+    "cervical": [306,491],
+    "cese": [291,503],
+    "chancro": [307,431],
+    "chasquido": [241,485,244,449,245,521],
+    "chirrido": [251,603],
+    "choque": [246,556],
+    "chorro": [282,582,295,457],
+    "cianosi": [14,388,16,432,31,398,35,409,100,398,101,432,362,420],
+    "cicatric": [177,459],
+    "cicatriz": [324,457,325,480],
+    "cicatriza": [324,503],
+    "cicatrizacion": [248,571],
+    "cicatrizan": [97,519,330,468],
+    "cinco": [385,335],
+    "circular": [346,556],
+    "circundant": [371,422],
+    "circundante": [343,515],
+    "clara": [343,515],
+    "claramente": [425,528],
+    "claro": [348,369,435,493],
+    "claudicacion": [97,571],
+    "clinicamente": [388,307,389,370,390,325,392,325,395,325],
+    "clitori": [278,503],
+    "clonica": [146,660],
+    "coagulado": [322,541],
+    "coagulo": [180,528],
+    "codo": [171,405,185,396,235,415,342,405],
+    "cognitiva": [230,681],
+    "cognitivo": [131,501,146,532,149,501,151,568],
+    "coito": [313,742],
+    "cola": [271,493,385,305],
+    "colapso": [108,620,367,620],
+    "colesterol": [200,541],
+    "colico": [53,686,173,582],
+    "color": [105,289,171,275,188,269,249,331,271,297,311,282,323,289,324,275,328,289,329,282,338,289,339,275,341,263,343,282,345,257,347,257,348,222,373,399,415,313],
+    "coloracion": [14,401,16,447,31,412,35,423,71,423,362,435],
+    "columna": [238,519,242,565],
+    "coma": [205,541],
+    "combinacion": [398,391],
+    "comentario": [401,370],
+    "comenzar": [187,390,295,428,296,438],
+    "comer": [286,428,369,428,393,345],
+    "comida": [59,532,60,516,205,437,383,501],
+    "comido": [369,503],
+    "comienza": [295,457,340,417],
+    "companero": [212,409,397,409],
+    "comparacion": [212,449],
+    "comparar": [391,293],
+    "compleja": [361,660],
+    "completamente": [295,503],
+    "completo": [400,459],
+    "comportamiento": [128,423,143,410,147,366,205,347,376,315,377,322,391,188,399,265,400,294,404,322,405,288],
+    "comportarse": [406,325],
+    "compulsion": [377,503],
+    "computadora": [426,528],
+    "comun": [334,503],
+    "comunicacion": [387,459],
+    "concebir": [302,541],
+    "concentracion": [382,480],
+    "concentrarse": [292,417,374,452,393,313,394,397,418,440],
+    "conciencia": [107,534,118,620],
+    "conciliar": [125,515],
+    "concurrente": [398,391],
+    "condicion": [200,541],
+    "conducir": [425,528],
+    "conducta": [383,414],
+    "conductual": [397,449],
+    "conectan": [336,586],
+    "confianza": [408,267],
+    "confiar": [401,370],
+    "confusion": [31,356,35,366,87,398,88,356,99,322,107,376,118,437,126,347,135,484,205,347,413,322],
+    "congestion": [4,385,5,308,20,463,22,385,24,479,26,479,161,408,419,365,420,385,432,434],
+    "congestionan": [392,422],
+    "conjuntiviti": [23,549,184,519],
+    "conoce": [331,528],
+    "conocimiento": [96,486,108,549,205,437,412,327],
+    "consecuencia": [382,480],
+    "consejo": [408,267],
+    "considerada": [347,427,406,295],
+    "constant": [403,358],
+    "constante": [386,486,387,390,418,485],
+    "constantemente": [391,249,404,428,406,276],
+    "contacto": [318,549,407,457],
+    "contagioso": [328,528],
+    "contaminacion": [377,503],
+    "continuo": [148,603],
+    "contraccion": [228,601,311,468],
+    "contribuir": [112,519,113,582],
+    "control": [139,513,141,561,379,438],
+    "controlar": [65,544,273,428,391,249],
+    "convencido": [391,293],
+    "convertirse": [334,503],
+    "convincent": [412,406],
+    "convulsion": [118,437,128,423,135,484,140,467,146,423,147,366,148,387,152,467,203,437,205,347,410,301],
+    "coordinacion": [123,565,163,620],
+    "corazon": [86,499,185,418,312,460],
+    "corea": [131,565,185,447],
+    "corporal": [21,409,115,572,185,352,194,369,198,420,215,344,383,296],
+    "correcta": [144,541],
+    "correr": [227,640],
+    "cort": [110,586],
+    "corta": [144,493,197,534],
+    "corto": [278,503],
+    "cosa": [381,480,408,400],
+    "cosquilleo": [7,582,433,493],
+    "costado": [247,333,256,461,257,475,264,505,269,505,270,412],
+    "costra": [305,352,317,473,325,378,328,378,331,378,334,360,341,344],
+    "cotidiana": [394,468,408,243],
+    "crece": [204,549,429,534],
+    "crecer": [160,506,325,480],
+    "crecimiento": [19,338,100,356,153,387,155,366,198,376,211,338,215,308,216,366,274,451,361,423,363,451],
+    "creencia": [381,426,399,334,401,299,403,448],
+    "creer": [391,293],
+    "crepitacion": [224,571],
+    "criptorquidia": [213,515],
+    "crisi": [410,469],
+    "cristalino": [102,528],
+    "criterio": [395,422],
+    "critica": [402,377,407,457],
+    "cronica": [3,419,9,385,17,396,38,419,69,407,75,491,356,460,363,475,420,396],
+    "cronicamente": [397,449],
+    "cronico": [153,486,267,532,302,437,384,448],
+    "crujido": [224,440,241,440,245,313,247,346,252,509],
+    "crup": [25,681],
+    "cual": [398,391],
+    "cualquier": [189,417,329,468],
+    "cubierta": [159,556],
+    "cuello": [6,370,29,321,127,370,130,370,167,321,170,297,182,330,204,470,214,305,218,254,219,370,231,290,234,271,309,321,352,370,364,370],
+    "cuenta": [408,267],
+    "cuero": [177,390,331,449,347,399],
+    "cuerpo": [96,447,121,522,178,252,189,340,197,435,329,382],
+    "cuidar": [408,267],
+    "culpa": [375,409,404,457],
+    "cumplen": [395,422],
+    "curvatura": [242,528,277,499,278,428],
+    "cutanea": [18,389,157,427,171,315,180,331,181,367,183,323,206,331,307,270,344,323,349,389,372,441,390,264],
+    "dactiliti": [183,515],
+    "dana": [248,571],
+    "dano": [162,519,307,392],
+    "debajo": [139,432,185,352,197,420,209,409,336,420,346,398,371,302],
+    "debido": [408,267],
+    "debil": [107,473,282,516,295,405,296,415],
+    "debilidad": [10,204,21,209,38,228,81,221,85,204,87,228,93,221,96,221,97,209,99,184,109,228,123,228,126,199,129,228,130,235,133,228,136,215,137,250,139,221,141,242,142,204,155,209,163,250,167,204,170,189,171,184,175,215,178,125,191,235,195,199,202,235,217,228,220,176,222,250,223,221,225,228,227,235,229,221,231,184,232,250,234,172,235,189,236,235,243,189,246,204,252,242,253,209,259,242,260,235,274,258,370,228,410,172,411,228,433,199],
+    "debilitado": [155,571],
+    "decaido": [393,406],
+    "decir": [404,503],
+    "decision": [394,468,408,243],
+    "decoloracion": [321,493,371,384],
+    "dedo": [10,310,39,318,103,414,104,302,164,336,167,310,169,267,178,190,183,287,184,318,203,380,223,453,245,492,246,310,247,250,321,302,342,280,350,280],
+    "defecacion": [46,565,64,549],
+    "defecar": [43,475,47,461,48,505,63,489,78,489,287,382],
+    "defecto": [100,473,214,449,391,585],
+    "deficiencia": [66,601,350,457],
+    "deficiente": [19,480,274,641],
+    "deficit": [140,663,220,436],
+    "definido": [344,515],
+    "deforme": [391,293],
+    "deformidad": [241,485,249,513,250,499],
+    "dejando": [330,515],
+    "dejar": [389,436,390,384],
+    "delegar": [409,431],
+    "delgada": [102,528],
+    "delimitada": [333,515],
+    "delirant": [399,414],
+    "delirio": [381,426,398,480,399,334,400,370],
+    "dema": [391,415,401,484,402,287,403,248,404,349,405,312,406,445,408,390],
+    "demasiado": [125,438,393,345,408,227],
+    "demencia": [156,640],
+    "demostrar": [404,503],
+    "denigrant": [401,370],
+    "denticion": [220,480],
+    "dentro": [314,528],
+    "deposito": [112,571],
+    "depresion": [131,479,376,378,383,319,395,325,398,301],
+    "depresivo": [395,359,398,332,399,352],
+    "deprimido": [375,449],
+    "derecha": [56,532,57,460,58,448,77,568],
+    "derecho": [57,485,58,473,310,449],
+    "desacuerdo": [408,267],
+    "desagradabl": [408,267],
+    "desagradable": [289,571],
+    "desanimo": [394,515],
+    "desaparece": [12,549,269,620],
+    "desaparecen": [310,480,319,519],
+    "desaparecer": [435,541],
+    "desapego": [378,436,413,457],
+    "desarrollo": [152,506,197,407,211,366,212,312,213,358,214,366,220,333,335,312],
+    "descamarse": [327,503],
+    "descanso": [238,571],
+    "descarga": [223,549,243,468],
+    "descolorida": [98,586],
+    "desconfianza": [401,370],
+    "descoordinado": [427,586],
+    "descrita": [298,541],
+    "desencadenado": [189,417,390,384],
+    "deseo": [166,452,210,440,293,525,302,417,402,319],
+    "desesperanza": [396,556],
+    "desgarrador": [96,603],
+    "deshacerse": [392,631],
+    "deshidratacion": [208,534,216,519],
+    "desigual": [242,621],
+    "desmayo": [13,435,83,401,86,435,88,412,94,447,309,412],
+    "desorganizacion": [382,480],
+    "desorganizada": [400,459],
+    "desorganizado": [381,480,400,417],
+    "desorientacion": [35,485,120,513,413,428],
+    "despersonalizacion": [413,503],
+    "despertar": [11,519,414,519],
+    "despertarse": [125,663,266,641],
+    "desprende": [330,515],
+    "desproporcionado": [388,398],
+    "despue": [28,467,212,502,251,387,258,410,282,410,283,347,284,330,287,330,313,338,369,322,426,338],
+    "detall": [405,409,409,392],
+    "detectado": [90,603],
+    "deterioro": [131,408,143,421,146,434,149,408,150,408,151,463,153,396,392,277,395,277,398,257],
+    "detiene": [295,503],
+    "detra": [244,742],
+    "devocion": [409,431],
+    "dia": [299,461,375,333,393,301,397,333,400,340,428,435],
+    "diametro": [323,480,348,369],
+    "diaria": [327,428,382,408,396,473],
+    "diarrea": [23,336,43,357,44,406,45,392,52,368,53,421,54,436,61,406,75,406,76,421,148,336,153,336,173,357,206,294,218,245,279,380,363,392,366,357],
+    "dias": [340,417,393,369],
+    "dient": [196,571],
+    "diferent": [344,468,412,369],
+    "dificil": [34,473,273,405,385,270,391,236],
+    "dificultad": [2,153,3,158,6,163,8,163,10,141,12,153,13,149,15,158,16,153,17,149,18,158,19,134,22,149,26,185,27,153,29,141,30,141,31,141,32,173,33,179,36,163,37,173,38,158,39,145,42,168,62,163,69,153,72,179,73,168,81,153,83,138,85,141,87,158,88,141,96,153,99,128,100,141,115,149,120,153,121,179,125,185,126,138,129,158,131,158,133,158,136,149,137,173,142,141,144,192,148,153,167,141,170,185,171,128,175,149,178,86,194,131,204,153,218,112,219,163,222,173,225,158,227,163,229,153,230,173,231,182,232,173,233,134,235,185,236,163,240,125,244,134,247,114,265,168,282,163,288,141,292,138,293,224,294,125,295,128,296,131,358,192,359,173,362,149,364,163,367,173,368,145,370,211,374,149,382,122,392,107,393,103,394,131,402,105,408,143,410,119,411,158,415,145,418,145,419,141,423,128,424,158,425,134,436,168],
+    "difunde": [178,340],
+    "difuso": [222,681],
+    "digerido": [73,601,74,620],
+    "digestivo": [162,571],
+    "dilatado": [350,503],
+    "diluida": [208,586],
+    "diplopia": [231,503],
+    "direccion": [427,586],
+    "dirigido": [391,293],
+    "disartria": [133,621],
+    "discapacidad": [152,728],
+    "discurso": [405,449],
+    "diseccion": [102,528],
+    "disfagia": [69,549,73,601],
+    "disfrutar": [393,369,402,377],
+    "disfuncion": [199,541],
+    "dislocacion": [248,571],
+    "disminucion": [166,396,210,385,221,407,259,445,262,419,291,339,293,460,313,356,420,396],
+    "disminuido": [213,515],
+    "disminuir": [389,436,390,384],
+    "disnea": [3,528,10,473,85,473],
+    "disponible": [385,335],
+    "distancia": [423,457,424,565],
+    "distorsionada": [424,621],
+    "diurna": [11,485,125,438,266,599],
+    "doble": [127,458,167,398,178,244,231,360,410,336,415,409,427,420],
+    "dolor": [1,88,2,78,5,61,6,83,7,83,11,74,12,78,13,76,14,70,15,81,16,78,20,91,21,102,23,78,24,95,25,88,29,72,33,91,36,83,37,88,38,81,39,74,40,88,41,88,42,86,43,110,44,95,45,91,46,81,49,91,51,83,52,86,54,102,55,91,56,86,57,116,58,100,59,86,60,83,62,83,63,86,64,78,66,86,68,86,69,78,70,81,71,74,72,91,73,86,77,91,78,86,79,91,80,88,81,106,82,78,83,98,84,104,86,76,89,78,90,78,92,83,93,78,95,100,96,78,97,74,98,76,99,65,101,78,103,69,104,70,105,69,110,76,112,74,113,83,115,76,116,81,117,86,122,86,123,81,126,70,127,83,128,86,130,110,135,98,139,78,140,95,141,86,154,115,157,88,158,91,159,72,168,91,170,67,173,83,174,88,176,115,178,44,181,76,182,116,183,95,184,74,185,64,186,81,196,74,199,70,201,81,202,110,204,78,205,70,207,81,209,74,210,74,217,81,218,84,221,78,222,88,223,78,224,74,225,108,226,91,228,86,230,88,232,88,233,96,234,104,235,67,236,83,237,78,238,102,239,76,240,92,241,74,242,81,243,95,244,69,246,72,247,86,248,74,249,78,250,76,251,78,252,86,253,102,254,104,256,81,257,83,264,88,267,112,268,112,269,88,270,100,273,65,275,88,279,88,283,98,284,95,285,115,286,65,287,67,288,72,290,69,292,70,294,92,296,67,297,95,298,70,300,113,301,74,302,70,303,76,304,95,305,92,307,56,308,90,309,100,310,96,311,67,312,98,313,96,328,69,333,67,335,58,339,65,345,61,350,65,352,83,354,78,357,86,358,98,360,83,365,98,366,83,368,102,369,65,370,81,371,55,386,48,411,81,416,90,417,76,419,72,420,76,423,65,424,81,425,69,426,69,433,70,434,76,435,70],
+    "dolorosa": [18,389,36,401,103,331,189,287,294,308,305,308,311,323,330,323,332,339,335,281,336,367,354,378],
+    "doloroso": [134,501,316,486,429,473,430,532],
+    "dormir": [291,405,393,327,417,473,418,460],
+    "dormirse": [125,515],
+    "dorso": [348,406],
+    "dos": [266,599,385,285,395,537],
+    "drastico": [376,491],
+    "duda": [403,358],
+    "dura": [9,519,47,565],
+    "duracion": [387,390,399,529,400,390],
+    "duran": [142,506,395,384],
+    "eccema": [187,459],
+    "edad": [197,586],
+    "edema": [75,540,85,412,263,489,272,489,363,522,364,475],
+    "educativo": [387,459],
+    "eeg": [147,571],
+    "efecto": [390,422],
+    "ejercicio": [14,437,88,448,189,370,327,405],
+    "elastica": [248,571],
+    "electrica": [223,549,243,468],
+    "electrico": [246,556],
+    "electroencefalograma": [147,571],
+    "elefantiasi": [356,681],
+    "elevada": [325,426,333,415,339,405,346,448],
+    "elevado": [206,449,319,485,321,460],
+    "ello": [392,422],
+    "elogio": [402,414],
+    "embarazo": [199,541],
+    "emocion": [402,352,403,304,405,382],
+    "emocional": [378,408,386,315,403,304],
+    "empein": [348,406],
+    "empeora": [5,308,15,408,30,365,38,408,93,396,154,365,225,408,234,308,238,375,300,356],
+    "empeoramiento": [273,503],
+    "empeoran": [412,406],
+    "empeorar": [178,340],
+    "empezar": [282,640],
+    "encaje": [180,528],
+    "encapuchada": [277,586],
+    "encia": [179,528],
+    "encogimiento": [298,541],
+    "encontrar": [144,541],
+    "encorvada": [134,528,201,528,239,499],
+    "endurecimiento": [106,485,169,408,253,485],
+    "energia": [88,412,375,333,376,523,393,301,394,382,396,412],
+    "enfermedad": [101,486,398,315,400,370,412,327],
+    "enfocar": [423,457,426,480],
+    "engreida": [406,325],
+    "engrosada": [159,506,341,436],
+    "engrosamiento": [106,460,320,426,321,437,337,448],
+    "enojo": [397,449],
+    "enrojecida": [98,534,187,417],
+    "enrojecido": [4,534,300,493],
+    "enrojecimiento": [6,392,186,381,221,370,226,431,237,370,290,323,308,294,317,404,320,323,326,308,331,323,414,350,428,359],
+    "ensanchado": [276,468,278,457],
+    "entender": [99,405,142,448,144,437,147,460],
+    "entesiti": [183,515],
+    "entorno": [421,621],
+    "entrecerrar": [425,480,426,480],
+    "entumecimiento": [81,336,97,318,104,302,121,392,123,346,126,302,130,357,142,310,163,380,175,327,203,380,223,336,234,261,243,287,246,310,247,250,410,261,411,346],
+    "envejecido": [349,621],
+    "epidermico": [361,660],
+    "epileptica": [410,469],
+    "episodica": [207,621],
+    "episodio": [376,505,383,296,395,302,398,426,399,296,400,329,422,420],
+    "equilibrio": [124,458,133,445,149,445,163,488,175,420,421,445,436,473],
+    "ereccion": [293,882],
+    "erectil": [199,541],
+    "eritema": [206,528],
+    "erosion": [330,515],
+    "erupcion": [116,398,157,437,171,322,180,338,206,338,307,276,318,387,342,322,344,330,346,493,372,451],
+    "escalera": [170,468,178,310],
+    "escalofrio": [2,387,29,356,77,451,91,376,111,398,256,398,284,330,333,330,354,387,365,484,368,366],
+    "escama": [159,556],
+    "escamosa": [317,473,318,432,321,388,325,378,331,378,337,398,343,369],
+    "escamoso": [347,469],
+    "escapar": [385,335],
+    "escoliosi": [361,660],
+    "escoriacion": [341,480],
+    "escozor": [341,480],
+    "escrito": [144,541],
+    "escroto": [297,628,298,560,299,461,300,401,301,423,356,505],
+    "escuchar": [381,528],
+    "escuela": [387,417,397,409],
+    "esfinter": [141,660],
+    "esfuerzo": [47,501,82,486,84,473,94,486],
+    "espaciamiento": [196,571],
+    "espacio": [385,335],
+    "espalda": [51,297,57,265,58,258,71,265,83,251,95,258,96,280,115,272,130,297,141,306,154,357,171,233,182,265,188,228,201,288,234,217,238,265,239,272,240,327,242,288,243,239,256,288,257,297,264,316,268,306,270,258,285,258,296,239,312,251,340,213,348,188],
+    "espasmo": [122,458,129,431,134,431,203,473,229,419,236,444,240,341,253,396],
+    "espasmodico": [118,620,185,447],
+    "espasticidad": [137,620,151,641],
+    "especial": [391,236,403,288,406,262,413,405],
+    "especialmente": [82,362,99,302,185,295,224,343,245,244,251,362,283,325,295,302,296,309,320,317,321,325,342,302,425,317,428,352],
+    "especifica": [387,417,388,362],
+    "especifico": [413,503],
+    "espera": [387,459],
+    "esperado": [201,565,239,534],
+    "espesa": [5,427,19,480],
+    "espeso": [290,528],
+    "espinilla": [316,549,336,534],
+    "esplenomegalia": [372,704],
+    "espontaneo": [180,528],
+    "espumosa": [263,489,271,401,272,489,280,489,281,435,308,356],
+    "espumoso": [30,556],
+    "esputo": [9,460,17,473,30,448,33,568],
+    "esquizofrenia": [398,595],
+    "esta": [327,388,385,258,399,319,404,388,408,206],
+    "estabilidad": [395,422],
+    "estado": [120,396,132,396,156,421,375,295,376,323,378,315,395,415,396,365,397,295,398,391],
+    "estar": [154,375,234,316,374,396,385,356,386,250,390,285,391,320,392,285,402,279],
+    "estatura": [102,378,197,420,201,445,212,322,214,378,220,344,239,420],
+    "estilo": [391,267,409,392],
+    "estira": [245,406],
+    "estiramiento": [169,480],
+    "estiron": [211,528],
+    "estomacal": [42,509,53,582,62,493,68,509,72,543],
+    "estomago": [41,525,217,479,279,525,366,653,386,285],
+    "estornudo": [4,473,20,568,24,587,161,501],
+    "estr": [189,417,390,384],
+    "estrechar": [235,515],
+    "estrenimiento": [44,540,54,580,165,461,192,522,218,326,285,412],
+    "estria": [188,447,195,493],
+    "estriada": [159,556],
+    "estridor": [8,582,27,549],
+    "etapa": [307,392,416,436],
+    "etc": [112,571],
+    "euforia": [376,491],
+    "evacuacion": [47,621],
+    "evasion": [378,480],
+    "evento": [378,408,380,408,413,428],
+    "evitacion": [380,370,383,319,385,258,388,307,407,388],
+    "evitar": [314,528],
+    "exagerada": [378,480],
+    "exagerado": [408,267],
+    "examen": [311,515],
+    "excesiva": [11,350,115,359,191,392,327,308,374,359,375,275,376,301,383,254,403,219,405,275,406,199,409,393,411,381],
+    "excesivamente": [405,449],
+    "excesivo": [110,499,198,499,361,561],
+    "exceso": [194,382,200,401,248,423,271,401,393,301,408,198],
+    "excluyendo": [409,431],
+    "exhalar": [0,704],
+    "existen": [381,528],
+    "existente": [323,528],
+    "exito": [406,325],
+    "exoftalmo": [164,603],
+    "expectoracion": [33,704],
+    "expresar": [402,377,408,243],
+    "expresion": [231,503],
+    "expuesta": [324,428,347,399,348,345],
+    "expulsion": [362,586],
+    "extenderse": [160,506,332,493],
+    "extensa": [32,681],
+    "exterior": [235,515],
+    "externa": [418,571],
+    "extiende": [58,556],
+    "extienden": [354,603],
+    "extrano": [399,377,403,325],
+    "extravagante": [399,414],
+    "extrema": [9,336,21,336,30,327,31,327,82,355,91,345,116,366,122,388,166,345,191,377,208,345,237,355,286,296,301,336,352,377],
+    "extremadamente": [102,480,391,267],
+    "extremidad": [142,428,150,479,163,525,197,452,241,604],
+    "extremo": [173,516,250,473,279,549,341,387],
+    "eyaculacion": [294,418,300,460,314,631],
+    "facial": [5,308,142,365,178,224,194,338,196,375,198,385,215,315,231,330,419,365,420,385],
+    "facil": [100,428,111,479,179,407,202,493,369,388],
+    "facilidad": [187,370,201,501,239,473,248,460],
+    "facilmente": [330,468,405,409],
+    "falsa": [381,480,399,377],
+    "falta": [0,339,11,275,14,261,34,282,35,275,81,290,82,290,84,282,86,282,88,267,89,290,90,290,92,308,94,290,101,290,108,328,109,299,212,318,214,254,350,242,376,236,379,248,381,254,394,248,396,370,402,199,406,156,408,129],
+    "familia": [403,358],
+    "fantasia": [406,325],
+    "fatiga": [1,211,2,187,9,177,10,172,14,168,18,192,21,177,31,172,36,198,38,192,45,218,49,218,50,226,52,204,82,187,85,172,87,192,88,172,90,187,91,182,92,198,93,187,94,187,100,172,109,192,111,192,114,198,116,192,121,218,125,159,157,211,158,218,163,211,165,192,166,182,168,218,172,187,174,211,175,182,179,163,182,177,190,198,191,198,192,218,200,168,202,198,203,211,217,192,218,136,220,149,230,211,232,211,238,177,259,204,260,198,263,204,266,218,272,204,274,218,283,168,286,156,292,168,351,192,352,198,355,211,358,234,373,226,374,182,375,139,396,172,411,192,423,156,424,192,425,163,426,163],
+    "fecal": [288,556],
+    "fenomeno": [169,480],
+    "feo": [391,293],
+    "feocromocitoma": [138,640],
+    "fiabilidad": [401,370],
+    "fibroniebla": [230,681],
+    "fibrosi": [106,571],
+    "fiebre": [1,238,2,210,8,223,9,199,15,217,18,217,21,199,22,204,23,210,25,238,26,254,27,210,29,194,32,238,37,238,38,217,45,245,51,223,55,245,56,230,61,254,77,245,78,230,79,245,91,204,93,210,111,217,116,217,135,263,140,254,141,230,157,238,158,245,173,223,176,238,185,171,256,217,264,238,269,238,275,238,279,238,281,204,284,180,301,199,305,171,307,150,332,189,333,180,335,157,351,217,352,223,353,238,354,210,355,238,356,238,365,263,366,223,368,199,372,245,417,204],
+    "figura": [383,414],
+    "fija": [399,414],
+    "fina": [188,396,195,437,342,405,349,501],
+    "final": [295,457,428,534],
+    "finalizacion": [409,431],
+    "finalmente": [104,541],
+    "firm": [329,415,341,387,345,378,346,448],
+    "firme": [325,528],
+    "firmemente": [381,528],
+    "fisica": [405,449],
+    "fisico": [411,621],
+    "fisiologico": [390,422],
+    "flacida": [330,515],
+    "flashback": [378,480],
+    "flema": [2,549,3,565],
+    "flexibilidad": [238,485,251,513,252,561],
+    "flexibl": [102,480,248,519],
+    "flexion": [245,613],
+    "flexionar": [244,528],
+    "fluctuacion": [132,603],
+    "fluctuante": [422,586],
+    "flujo": [104,376,284,358,287,358,289,396,290,366,296,358,304,358,431,473],
+    "fobica": [388,604],
+    "focal": [140,728],
+    "foliculo": [334,503],
+    "forma": [116,419,153,407,157,460,189,310,321,365,344,347,346,375,389,324,390,285],
+    "forman": [305,447,328,480],
+    "formen": [187,459],
+    "forzada": [433,541],
+    "fosa": [431,681],
+    "fotofobia": [186,621],
+    "fractura": [201,479,202,493,217,479,222,525,249,465],
+    "fragil": [195,493,248,519],
+    "fras": [144,541],
+    "frecuencia": [35,375,125,338,218,289,260,421,285,365,286,330,295,330,296,338,333,338,360,421],
+    "frecuent": [3,389,4,367,19,331,111,389,222,427,227,401,248,357,264,427,265,413,369,315,382,301,419,348],
+    "frecuente": [191,458,254,420,257,458,261,458,267,473,268,473,275,488],
+    "frente": [5,399,196,485,338,449],
+    "fria": [82,486,83,437,97,460,107,473],
+    "friccion": [334,503],
+    "frio": [103,407,109,479,165,479,169,370,192,543],
+    "frotarla": [330,515],
+    "frustracion": [314,528],
+    "fuente": [418,571],
+    "fuera": [199,417,276,397,385,258,386,285,403,276],
+    "fuert": [11,571],
+    "fuerte": [178,289,258,544,289,485],
+    "fulgurante": [178,340],
+    "funcion": [273,503],
+    "funcional": [357,561,395,359,398,332],
+    "funcionamiento": [392,340,397,362,399,334,400,370],
+    "galactorrea": [199,541],
+    "gallina": [326,503],
+    "gallo": [28,515],
+    "gana": [172,603],
+    "ganglio": [6,458,29,398,307,309,351,445,352,458,353,488,355,488],
+    "garganta": [1,367,4,316,6,456,7,456,20,380,23,325,24,393,25,367,29,415,59,356,204,325,218,237,219,345,306,265,307,232,319,308,330,278,352,345,368,308,433,407],
+    "gase": [44,587,52,532,53,608,65,516],
+    "gastrointestinal": [411,621],
+    "general": [301,440,332,417,335,346,354,465,366,493],
+    "generalizada": [263,601,401,337],
+    "generalizado": [230,681],
+    "generalmente": [101,447,112,423,113,475,239,435,322,401,339,373],
+    "genio": [397,449],
+    "genital": [181,396,188,331,216,385,294,331,305,331,306,331,307,291,308,324,313,356],
+    "gesto": [403,358],
+    "ginecomastia": [215,480],
+    "girado": [276,515],
+    "girar": [235,515],
+    "giratoria": [421,621],
+    "globulo": [155,571],
+    "gluteo": [240,418,305,418,326,428],
+    "goteo": [20,463,24,479,25,448,258,421,265,434,282,421,294,323,295,330,420,385,431,448],
+    "gradual": [416,480],
+    "gradualmente": [300,541],
+    "gran": [214,480,393,369],
+    "grand": [17,452,110,452,187,354,198,452,208,452],
+    "grande": [197,499,340,390,429,499],
+    "grandeza": [399,414],
+    "grano": [316,486,320,426,334,405,342,405],
+    "granulosa": [322,541],
+    "grasa": [112,409,115,420,194,369,195,388,200,388,316,432,331,378],
+    "graso": [41,620,361,601],
+    "grasosa": [19,528],
+    "grav": [22,499,153,513,162,485],
+    "grave": [31,448,196,460,216,632,272,532],
+    "gripe": [23,513,294,418,305,418],
+    "gris": [29,556],
+    "grisaceo": [289,571],
+    "gruesa": [29,556],
+    "grumosa": [47,621],
+    "grumoso": [290,528],
+    "grupo": [200,493,306,447],
+    "guardar": [392,422],
+    "guisante": [336,586],
+    "gusano": [298,541],
+    "gusto": [5,427,432,601],
+    "haber": [326,457,369,457],
+    "habilidad": [148,603],
+    "habito": [55,599,66,561,67,499],
+    "habitual": [412,406],
+    "habla": [133,445,144,388,215,344,376,352,381,378,400,329,410,336],
+    "hablado": [144,541],
+    "hablar": [27,355,81,355,99,296,126,319,129,366,131,366,137,401,142,327,150,366,167,327,178,200,229,355,231,296,387,395,410,276],
+    "hable": [387,459],
+    "habon": [189,417,319,519],
+    "hace": [348,369,391,267],
+    "hacer": [325,449,385,285,408,374],
+    "halitosi": [5,469],
+    "halo": [416,480],
+    "hambre": [114,544,191,544,205,460],
+    "han": [395,384,399,377],
+    "hay": [398,391],
+    "hece": [19,347,45,463,47,408,48,448,64,396,65,421,67,385,110,385,179,347,233,488],
+    "hemangioblastoma": [138,640],
+    "hematoma": [236,582,241,519],
+    "hematuria": [268,601,360,582],
+    "hemoptisi": [12,603],
+    "hemorragia": [80,580,311,438,419,473],
+    "hepatoesplenomegalia": [153,603],
+    "hepatomegalia": [372,704],
+    "heraldico": [340,459],
+    "herida": [341,480],
+    "hidrocele": [356,681],
+    "hierro": [66,601,350,457],
+    "higado": [153,603],
+    "higienico": [64,603],
+    "hinchada": [332,460,335,382,368,485],
+    "hinchado": [161,501,171,405,183,415,300,437],
+    "hinchazon": [14,180,41,226,44,242,46,206,50,242,52,219,53,250,54,260,60,212,74,226,75,242,79,234,85,184,90,200,92,212,94,200,98,195,105,175,106,189,110,195,116,206,158,234,168,234,181,195,183,171,184,189,189,152,209,189,219,212,221,200,224,189,226,234,233,175,236,212,237,200,241,189,244,175,247,149,250,195,252,219,259,219,260,212,262,206,263,219,271,180,272,219,273,167,280,219,281,195,286,167,290,175,292,180,297,171,299,275,301,189,304,171,310,175,319,189,356,226,357,219,363,234,364,212,365,250,371,140,429,195,430,219],
+    "hiperactividad": [220,436,382,436],
+    "hiperglucemia": [206,528],
+    "hiperparatiroidismo": [217,621],
+    "hiperpigmentacion": [166,586],
+    "hipersensibilidad": [407,503],
+    "hipersomnia": [375,449],
+    "hipertiroidismo": [220,480],
+    "hipervigilancia": [378,480],
+    "hipo": [15,621],
+    "hipomaniaco": [395,422],
+    "hiposmia": [213,515],
+    "hirsutismo": [194,515],
+    "hogar": [386,337,397,409],
+    "hombr": [199,493,304,468],
+    "hombro": [57,409,58,398,170,369,225,594,242,445,309,398,348,291],
+    "hondo": [93,603],
+    "hora": [319,571],
+    "hormigueo": [104,332,121,431,123,381,130,392,175,359,178,209,190,392,203,418,223,370,234,287,240,301,243,316,246,341],
+    "hormonal": [249,603],
+    "hospital": [412,406],
+    "hostilidad": [401,370],
+    "hoyuelo": [329,438,332,460,345,399],
+    "hueso": [183,415,239,473,250,473,276,415],
+    "humillado": [380,480],
+    "humor": [291,428,292,460,383,352],
+    "hunde": [345,469],
+    "ictericia": [49,522,50,540,70,461,71,423,77,522,174,505],
+    "ignorar": [404,503],
+    "imagen": [377,503],
+    "imc": [115,586],
+    "implantacion": [214,480,276,468],
+    "implican": [407,503],
+    "important": [408,267],
+    "importante": [391,267,413,457],
+    "imposibilidad": [250,586],
+    "impreciso": [412,406],
+    "impulsividad": [382,436,384,506],
+    "impulsivo": [376,447,404,457],
+    "impulso": [377,503],
+    "inapropiada": [384,506,403,325],
+    "inapropiado": [405,449],
+    "incapacidad": [59,404,65,392,178,328,241,350,295,308,302,332,314,323,382,294,387,281,406,199,409,264,410,287,413,308],
+    "incapaz": [408,267],
+    "incluso": [103,528],
+    "incluye": [178,340],
+    "incomoda": [34,586],
+    "incomodo": [408,267],
+    "incompleta": [144,541],
+    "incompleto": [213,515],
+    "inconsistent": [412,406],
+    "incontinencia": [265,532,276,415,278,405,288,448],
+    "incontrolabl": [28,438,118,580,185,418],
+    "indefenso": [408,267],
+    "independientemente": [392,422],
+    "indice": [115,534,247,409],
+    "indigestion": [68,660],
+    "indolora": [297,397,299,479,307,332,322,417,351,479],
+    "indoloro": [46,565,185,447],
+    "ineptitud": [407,503],
+    "inesperado": [379,515],
+    "inestabilidad": [119,620,384,506],
+    "inestable": [178,340],
+    "inexplicable": [12,362,36,384,67,352,68,396,69,362,70,373,71,343,114,384,172,362,191,384,206,317,269,409,286,302,351,373],
+    "infeccion": [3,381,17,359,19,323,106,350,111,381,162,350,264,418,265,404,275,418,278,308,282,392,369,308,371,259],
+    "infectada": [354,603],
+    "inferior": [56,509,105,407,255,465,277,452,281,452],
+    "infertilidad": [215,408,283,460,298,460],
+    "inflamacion": [103,331,162,357,181,367,182,357,184,357,185,308,286,315,307,270,317,413,326,315,351,389,434,367],
+    "inflamado": [6,516,29,448,352,516,353,549],
+    "influenciable": [405,449],
+    "informacion": [401,337,413,457],
+    "ingesta": [383,414],
+    "ingle": [294,447,297,468],
+    "inhalar": [28,515],
+    "inicialmente": [14,541],
+    "iniciar": [408,267],
+    "inicio": [21,571],
+    "injustificada": [401,370],
+    "inmediata": [388,362,403,325],
+    "inquietud": [30,473,374,499,382,408],
+    "insensible": [404,503],
+    "insomnio": [375,449],
+    "inspirar": [8,582,27,549],
+    "insuficiencia": [143,640],
+    "intencion": [401,370],
+    "intensa": [87,398,187,294,189,294,317,423,319,366,342,322,362,376,384,356,385,215,386,237,388,255],
+    "intensificada": [348,406],
+    "intenso": [21,282,55,348,57,282,58,275,78,326,83,267,95,275,126,267,127,316,135,373,207,307,237,298,241,282,257,316,283,267,290,261,301,282,315,337,318,298,333,254,368,282,380,237,384,275,386,183,397,222,416,237],
+    "intentar": [391,293],
+    "intento": [389,436,390,384],
+    "inter": [375,362,393,327,394,415,396,448],
+    "interesarse": [402,414],
+    "interfiere": [327,428,387,390,409,366],
+    "interior": [65,640],
+    "intermenstrual": [308,480],
+    "intermitente": [234,427,418,519],
+    "interno": [162,519,305,447],
+    "interpersonal": [384,506,407,457],
+    "interpretacion": [401,370],
+    "interrumpido": [296,515],
+    "interrupcion": [266,704],
+    "intestinal": [55,568,66,532,67,473,283,437],
+    "intestino": [139,513,217,528,288,473],
+    "intimidad": [314,528],
+    "intolerancia": [41,620,193,565],
+    "inusual": [249,513,287,438,403,304],
+    "inutilidad": [375,449],
+    "involucren": [383,414],
+    "involuntaria": [9,423,65,475,111,461,193,461,228,489,258,475],
+    "involuntario": [131,621],
+    "ira": [384,473,396,473,401,315],
+    "irradia": [51,475,83,401,130,475,154,412,240,364,243,382],
+    "irrazonable": [406,325],
+    "irregular": [86,396,87,419,94,407,194,347,199,365,210,385,283,365,302,365,323,356],
+    "irregularidad": [291,503],
+    "irritabilidad": [131,431,148,419,164,419,291,349,292,376,383,287,396,386,417,407],
+    "irritable": [397,449],
+    "irritacion": [7,458,46,445,64,432,261,458,289,409,329,369,345,336],
+    "isquemico": [156,582,180,480],
+    "izquierda": [369,503],
+    "izquierdo": [83,541],
+    "jadeo": [30,556],
+    "juego": [100,556],
+    "juicio": [408,267],
+    "juzgado": [380,480],
+    "labio": [14,376,31,386,189,319,203,473,278,349,319,396,338,366,350,349],
+    "laboral": [387,390,407,428,413,428],
+    "lactancia": [302,541],
+    "lactea": [331,528],
+    "lado": [96,465,99,388,309,428,310,407,419,428],
+    "lagrimeo": [430,660],
+    "largo": [102,407,103,407,122,509,215,370,299,479],
+    "late": [86,586],
+    "lateral": [242,565,278,457],
+    "latido": [13,435,87,461,88,412,89,447,94,447,312,401],
+    "laxant": [383,414],
+    "lealtad": [401,337,403,325],
+    "leche": [199,493,210,519],
+    "lechosa": [302,541],
+    "lechoso": [360,640],
+    "lectura": [423,717],
+    "leer": [426,528],
+    "lejano": [425,528],
+    "lejo": [408,267],
+    "lenguaje": [144,493,147,519],
+    "lentamente": [429,586],
+    "lentitud": [119,681],
+    "lento": [88,556],
+    "lesion": [18,340,110,321,139,331,157,373,159,305,181,321,183,282,187,251,241,313,249,331,324,275,325,289,333,282,339,275,340,251,344,282,345,257,347,257,390,231],
+    "levantar": [170,468,225,565],
+    "levantarse": [170,438,227,544,240,418],
+    "leve": [20,463,149,408,224,375,313,347,326,330,328,347,337,365,340,302,343,338,429,385],
+    "ley": [404,503],
+    "libido": [291,503],
+    "ligamento": [183,515],
+    "ligero": [431,681],
+    "lija": [326,503],
+    "limitada": [154,506,403,325],
+    "limitado": [371,422],
+    "limite": [374,586],
+    "linea": [188,396,337,448,342,405,354,486],
+    "linfadenopatia": [372,704],
+    "linfangioma": [371,422],
+    "linfatico": [6,475,307,319,351,461,352,475,353,505,355,505],
+    "linfedema": [356,681],
+    "liquida": [48,620,65,582],
+    "liquido": [42,423,62,410,263,423,272,423,273,322,297,330,312,347,357,423,364,410,417,376,435,347],
+    "lisa": [177,417,339,457],
+    "livedo": [180,528],
+    "llaga": [97,460,103,426,328,426,336,473],
+    "llamada": [340,459],
+    "llanto": [148,603],
+    "lleno": [357,660],
+    "llenura": [40,620,41,620],
+    "llevan": [314,528],
+    "llevar": [306,491],
+    "lloroso": [4,534,161,565],
+    "localizado": [141,532,228,532,240,396,253,460],
+    "lograr": [293,620,406,295],
+    "logro": [387,459],
+    "lubricacion": [313,528],
+    "luce": [416,480],
+    "luego": [14,493,104,493],
+    "lugar": [120,465,378,370,389,370,390,325,397,346],
+    "lumbalgia": [184,571],
+    "lumbar": [288,556],
+    "lunar": [323,528],
+    "luxacion": [102,528],
+    "luz": [117,509,186,479,415,440,428,452,430,509],
+    "macerada": [321,541],
+    "mal": [5,316,17,396,254,396,256,419,284,347,308,324,368,385,397,303,404,339],
+    "malestar": [40,393,174,393,301,330,332,313,333,297,335,259,346,321,354,348,371,244,377,290,388,230,389,277,390,244,392,364,395,244,411,359],
+    "malformacion": [361,660],
+    "maliciosa": [401,370],
+    "malo": [386,370],
+    "mama": [213,515],
+    "mamario": [209,571],
+    "manana": [245,369,251,549],
+    "mancha": [91,376,160,493,311,330,321,347,338,338,339,322,340,430,343,543,349,398,350,322,373,467],
+    "manchado": [65,582,308,436],
+    "mandibula": [83,493,196,519],
+    "manera": [245,369,391,267],
+    "mania": [376,447,398,356],
+    "maniaco": [398,356,399,377],
+    "mano": [103,367,104,267,109,307,123,307,164,298,167,275,169,237,175,290,178,168,183,254,184,282,190,316,196,282,198,290,223,455,235,254,245,201,262,307,271,267,280,326,306,243,307,213,310,261,337,275,347,232,348,201],
+    "mantener": [125,397,133,479,293,525,382,370,402,319],
+    "maquillaje": [391,293],
+    "marcada": [384,556],
+    "marcadamente": [399,414],
+    "marcha": [149,565,178,310],
+    "mareo": [13,333,76,428,80,386,83,307,86,333,87,352,88,315,89,342,90,342,94,342,101,342,109,352,205,307,309,315,434,333,435,307,436,374],
+    "mariposa": [116,565,157,620],
+    "marron": [324,360,339,360,341,344,343,369,347,336,348,291,349,445],
+    "masa": [115,473,229,486,357,532,364,516],
+    "masticar": [167,473,178,289,231,428],
+    "material": [362,534,423,457],
+    "materna": [199,541],
+    "matutino": [11,571],
+    "mayor": [311,358,323,366,333,358,375,312,395,293,397,312,398,413,399,287],
+    "mayoria": [147,571],
+    "medica": [389,408,390,359,412,345],
+    "medico": [90,513,311,438,412,521],
+    "medio": [385,335],
+    "mejilla": [189,390,326,428,338,449],
+    "mejora": [238,571],
+    "membrana": [29,506,187,417],
+    "memoria": [88,448,120,486,218,355,413,405],
+    "meno": [47,419,88,375,215,324,315,595,387,310,395,285,397,303,398,264,400,453],
+    "menopausia": [287,515],
+    "menor": [345,469],
+    "menstruacion": [212,382,283,460,291,428],
+    "menstrual": [179,366,194,358,199,376,210,396,283,376,285,386,291,349,302,376],
+    "mental": [150,501,377,405,403,288,412,327],
+    "mentira": [404,503],
+    "menudo": [95,398,98,420,149,445,298,388,303,420,306,352,307,309],
+    "merecen": [406,325],
+    "mes": [387,390,399,352,400,390],
+    "mese": [187,390,395,359,397,382],
+    "meta": [402,414],
+    "metastasi": [325,528],
+    "miccion": [114,475,190,475,191,475,200,401,206,391,295,373],
+    "micropene": [213,515],
+    "miedo": [377,339,379,347,380,324,384,375,385,441,386,250,388,492,401,250,408,180],
+    "miel": [328,528],
+    "migrana": [156,640],
+    "migratorio": [206,528],
+    "minuto": [88,473,89,513,314,449],
+    "mioclonica": [146,660],
+    "miodesopsia": [186,621],
+    "miserable": [409,431],
+    "moco": [63,660],
+    "mold": [362,586],
+    "molestia": [1,473,46,431,67,407,255,419,297,358,298,376,308,333,322,376],
+    "momento": [241,571],
+    "moqueo": [22,586],
+    "morado": [105,528],
+    "moreton": [110,499,111,528,179,449],
+    "morir": [379,515],
+    "mosca": [186,621],
+    "motivacion": [381,480,402,377],
+    "motor": [151,599,155,485,197,499],
+    "motora": [148,603],
+    "mover": [178,252,224,423,241,423,245,301,247,333,250,435],
+    "moverse": [129,528,229,513,240,418],
+    "movilidad": [154,556],
+    "movimiento": [106,330,118,393,119,393,124,370,131,359,178,197,185,284,221,348,224,330,236,370,251,348,253,330,371,244,410,271,421,359,427,339],
+    "mucha": [239,586],
+    "mucho": [100,473,406,276,412,345],
+    "mucosa": [187,390,188,418,330,438],
+    "mucosidad": [1,580,19,449,37,580],
+    "mueve": [421,621],
+    "mujer": [213,468,304,468],
+    "multitud": [385,335],
+    "muneca": [178,244,185,352,188,352,223,432,235,369,247,561,342,360],
+    "muscular": [21,250,105,231,119,298,122,289,123,272,129,363,130,280,133,272,134,363,136,257,137,386,139,264,150,272,154,243,155,250,170,319,171,220,176,298,195,237,203,298,215,210,220,210,222,298,227,280,228,378,229,403,232,386,236,370,240,215,252,289,253,343,274,308,292,237,305,215,370,272,374,257],
+    "musculo": [155,396,167,386,218,305,227,444,233,366,234,326,246,386,276,358],
+    "musculoesqueletico": [230,681],
+    "muslo": [170,438,305,418,326,428],
+    "nalga": [281,586],
+    "naranja": [332,541],
+    "nariz": [4,407,5,326,161,431,179,366,320,366,328,366,338,366,419,386],
+    "nasal": [4,352,5,282,20,423,22,352,24,437,25,409,26,437,80,409,161,373,350,302,419,462,420,352,431,409,432,518],
+    "nausea": [40,302,48,302,49,312,50,322,51,283,52,292,55,312,56,292,57,253,58,246,60,283,61,322,68,292,70,275,71,253,74,302,76,334,78,292,79,312,82,267,117,292,124,283,127,283,145,302,174,302,202,283,256,275,257,283,259,292,264,302,301,253,366,283,416,212,421,275,436,292],
+    "navidad": [340,459],
+    "necesidad": [43,316,48,337,63,326,78,326,208,290,254,290,255,298,257,316,258,316,261,316,267,326,268,326,275,337,285,275,286,248,295,248,296,254,300,267,377,248,392,209,405,222,406,160,408,132,423,248,425,261,426,261],
+    "necesitar": [406,325],
+    "necrolitico": [206,528],
+    "negativa": [386,337,391,267],
+    "negativo": [378,480],
+    "negra": [233,480,336,534],
+    "negro": [316,549,322,493],
+    "negruzco": [339,503],
+    "nervio": [122,561,233,449,371,359],
+    "nerviosismo": [193,621],
+    "nervioso": [138,582,220,436],
+    "neumotorax": [367,681],
+    "neurologica": [372,704],
+    "neurologico": [140,587,143,516,153,486,307,347],
+    "neuropatico": [139,603],
+    "neutropenia": [155,571],
+    "nevo": [361,660],
+    "nikolsky": [330,515],
+    "nina": [211,449,212,562,216,485],
+    "ninez": [198,586],
+    "ningun": [402,414],
+    "nino": [211,391,212,333,213,382,274,522,363,522,417,435],
+    "nistagmo": [124,582,421,565],
+    "nivel": [113,493,200,417,206,407,215,370,400,354],
+    "noche": [5,308,178,224,208,385,225,408,266,463,295,330,296,338,342,330,415,375,425,347],
+    "nocturia": [208,586],
+    "nocturna": [424,621],
+    "nocturno": [9,423,91,435,291,373,351,461,353,505,355,505],
+    "nodulo": [185,352,204,432,316,432,325,378,341,497,344,369,345,336],
+    "norma": [409,431],
+    "normal": [423,503],
+    "notable": [233,528],
+    "notoria": [348,406],
+    "nublada": [415,571],
+    "nucal": [364,640],
+    "nudillo": [171,503],
+    "nudo": [228,660],
+    "nueva": [325,528],
+    "nuevo": [91,534,323,480],
+    "numero": [155,571],
+    "objeto": [170,382,235,382,388,541,423,373,425,391,426,391],
+    "obsesion": [377,503],
+    "obstinacion": [409,431],
+    "obstruccion": [47,621],
+    "obtener": [34,534,408,243],
+    "obviamente": [399,414],
+    "ocasion": [339,503],
+    "ocasional": [345,469],
+    "ocio": [409,431],
+    "ocular": [124,410,181,376,182,366,184,366,186,398,414,366,416,444,421,398,426,338,427,376,428,376],
+    "ocultar": [391,475],
+    "ocurre": [314,528],
+    "ocurren": [201,621],
+    "oido": [80,488,145,488,417,572,418,409,422,572,434,698,435,541],
+    "ojo": [23,465,186,479,414,604,415,440,429,452],
+    "ojos": [4,479,5,282,71,343,91,352,161,498,164,362,168,423,178,204,189,275,319,343,425,317,426,317,427,479,428,352],
+    "olfato": [5,378,213,415,420,473,432,532],
+    "olor": [254,452,256,479,284,397,289,440,308,370],
+    "olvido": [382,480],
+    "ombligo": [95,506,276,468],
+    "omoplato": [57,519,242,565],
+    "ondulada": [342,503],
+    "opresion": [0,504,3,445,16,432,34,420,39,409,84,420,219,458],
+    "opresivo": [82,603],
+    "orden": [377,457,409,392],
+    "oreja": [214,528],
+    "organo": [138,582,162,519],
+    "orgasmo": [315,1034],
+    "orina": [49,348,110,290,179,261,208,290,254,290,255,298,256,307,257,316,258,418,259,326,262,410,263,326,265,326,268,326,269,337,270,275,271,373,272,326,273,248,280,427,281,394,282,316,295,248,296,360,310,261,360,418],
+    "orinar": [172,298,208,290,254,394,255,402,257,316,258,418,261,418,266,348,267,326,268,427,275,337,277,290,282,418,284,254,285,275,286,248,287,254,289,282,294,348,295,354,296,360,300,267,303,290,304,254,308,237,360,316],
+    "oscura": [49,568,171,405,338,426,343,415],
+    "oscurecimiento": [166,586],
+    "oscuro": [105,449,338,449,348,345],
+    "osea": [201,528,217,528,249,692],
+    "oseo": [202,516,217,501,222,549,249,486],
+    "otalgia": [417,586],
+    "ovalada": [340,417,348,369],
+    "ovalado": [177,459],
+    "ovario": [194,468,214,480],
+    "palabra": [144,755],
+    "paladar": [4,534,161,565],
+    "palida": [109,528,165,528,175,499],
+    "palidez": [279,620,373,663],
+    "palido": [103,528],
+    "palillo": [10,506,39,519],
+    "palma": [245,327,307,347,327,405,337,448],
+    "palmeado": [214,528],
+    "palpable": [228,601,253,519],
+    "palpacion": [250,586],
+    "palpitacion": [86,435,87,461,89,447,92,475,207,461,379,382],
+    "pancrea": [138,640],
+    "pancreatiti": [113,640],
+    "panico": [379,515],
+    "pantorrilla": [227,640],
+    "papel": [64,549,326,457],
+    "papula": [345,469],
+    "paralisi": [96,486,139,486,141,532,410,378],
+    "paranoico": [403,358],
+    "parch": [177,390,187,390,338,449],
+    "parche": [340,417,347,427],
+    "parece": [242,565,391,267],
+    "pareja": [406,325],
+    "parkinsonismo": [132,603],
+    "parpado": [167,398,171,360,231,360,344,607,414,409,429,572,430,619],
+    "parte": [40,320,51,300,56,310,57,268,58,261,60,300,70,291,77,330,105,248,178,160,182,268,189,215,235,242,238,268,240,230,254,275,255,283,277,275,278,236,281,275,284,242,303,275,312,254,329,242,348,190,369,236,375,211,393,190,397,211,408,125],
+    "patologico": [101,603],
+    "patron": [180,480,340,417],
+    "pausa": [11,519,28,468],
+    "peca": [348,406],
+    "pecho": [0,302,1,292,2,258,3,266,12,258,13,251,14,232,15,266,16,348,33,302,34,251,36,274,37,292,38,266,39,244,42,283,59,283,62,274,69,258,73,283,81,258,82,258,83,232,84,251,86,251,89,258,90,258,92,274,93,258,96,258,101,258,112,244,171,215,214,226,331,226,340,197,358,323,370,266],
+    "pegado": [414,571],
+    "peligro": [388,398],
+    "pelo": [389,814],
+    "pelvi": [284,397,288,428,296,397,309,593,313,407],
+    "pelvica": [294,447,312,493],
+    "pelvico": [267,489,283,401,285,412,286,373,287,382,302,401],
+    "pene": [215,333,261,444,277,630,278,498,300,376,303,407,304,358,306,341],
+    "penetracion": [313,480,314,480],
+    "pensamiento": [376,396,377,405,381,426,403,448],
+    "pensar": [382,436,386,337],
+    "pequena": [91,407,188,341,305,341,306,341,322,376,329,358,340,319,369,349],
+    "pequeno": [215,324,320,356,326,339,329,347,334,339,342,339,345,316,346,375,350,339],
+    "percepcion": [415,485,418,485,427,499],
+    "perciben": [401,370],
+    "percibida": [392,422],
+    "percibido": [391,598],
+    "perder": [379,468,393,369],
+    "perderlo": [194,515],
+    "perdida": [5,139,7,190,9,169,10,165,12,179,18,184,36,190,39,169,50,216,52,195,56,195,65,190,67,174,68,195,69,179,70,246,71,232,73,195,75,216,96,179,107,174,108,202,111,184,114,190,118,202,120,179,123,184,124,190,129,184,136,174,139,241,141,195,142,165,143,190,145,202,147,169,148,179,150,246,160,165,164,179,166,174,172,179,173,190,174,202,175,174,176,202,177,199,191,190,193,184,201,184,205,160,206,156,229,179,238,169,239,174,251,179,252,195,258,190,269,202,286,149,351,184,353,202,355,202,359,202,375,232,386,110,389,142,394,153,408,79,410,139,413,149,416,142,417,174,420,174,421,184,422,174,427,174,432,195,433,160,434,174,435,160],
+    "pereza": [165,621],
+    "perfeccionismo": [409,431],
+    "perfecta": [406,325],
+    "periferica": [416,480],
+    "perilla": [235,515],
+    "perimetro": [359,681],
+    "periodo": [179,317,194,309,199,325,210,343,234,282,283,325,284,309,287,309,302,325,304,309,309,334,395,379,398,235,399,248],
+    "perlado": [324,503],
+    "perruna": [25,620,27,549],
+    "persecucion": [399,414],
+    "persistent": [128,601,377,457],
+    "persistente": [0,368,10,291,12,315,18,325,19,276,38,325,39,298,67,417,85,291,95,291,111,325,286,263,320,276,331,276,341,251,351,325,370,325,374,307,392,221,396,291,403,187,419,291],
+    "persona": [378,408,401,315,404,428],
+    "personal": [413,503],
+    "personalidad": [120,513,128,561,151,599],
+    "pesadez": [105,407,106,440,288,428,297,397,299,479],
+    "pesadilla": [378,436,386,337],
+    "pescado": [289,571],
+    "peso": [9,242,10,235,12,256,18,263,19,224,36,271,52,280,67,249,68,280,69,256,70,263,71,242,73,280,75,309,85,235,111,263,114,271,164,256,166,249,172,256,173,271,176,289,191,271,192,298,193,263,194,218,195,229,206,224,263,280,269,289,272,280,286,213,292,229,351,263,353,289,355,289,375,190,383,175,393,172],
+    "pestana": [160,506,177,417],
+    "petequia": [179,528],
+    "pezon": [209,721,210,460,214,426,302,437],
+    "pica": [307,431],
+    "picada": [159,556],
+    "picazon": [4,266,46,281,64,273,159,252,161,281,187,208,188,222,189,208,261,290,289,258,290,239,305,222,308,217,313,239,317,299,318,273,319,258,321,245,323,239,328,239,329,233,331,239,334,228,337,252,339,228,340,208,342,228,343,233,345,212,346,252,414,258,428,266,434,266],
+    "picor": [341,436,349,565],
+    "pie": [154,448,234,378,243,588,246,768],
+    "piel": [14,192,16,214,31,197,35,202,71,202,91,208,97,202,98,208,100,197,106,202,107,208,109,220,112,202,159,197,160,197,165,220,166,208,169,170,175,208,177,163,179,187,185,174,187,163,192,250,194,183,195,268,221,214,248,278,249,214,291,178,316,289,317,306,318,214,320,187,321,192,326,254,327,178,329,183,330,259,331,187,332,268,335,159,336,208,337,313,338,187,339,178,341,316,342,254,343,259,344,183,346,197,347,166,349,220,350,178,362,208,371,224,373,258,390,268],
+    "pierna": [14,251,50,338,81,280,85,258,92,297,94,280,97,415,98,370,99,233,102,245,105,344,106,265,126,251,130,297,133,288,136,272,141,306,154,258,167,258,178,158,215,222,231,233,234,373,240,327,243,393,250,272,259,306,260,297,276,239,281,370,333,239],
+    "pies": [85,267,90,290,97,377,103,357,104,261,109,299,123,299,136,437,169,231,175,282,178,164,183,248,184,377,190,308,196,275,198,282,240,236,259,318,260,308,262,299,271,261,276,248,280,318,281,282,306,236,307,207,310,254,337,267],
+    "pigmentacion": [249,549,348,369],
+    "pigmento": [160,556],
+    "piloso": [334,503],
+    "pitido": [418,571],
+    "placa": [159,473,344,438,368,485],
+    "placer": [375,449],
+    "plana": [188,364,324,373,325,391,339,373,348,301,403,265],
+    "planta": [246,448,307,347,327,405,337,448],
+    "plaqueta": [162,571],
+    "plastico": [362,586],
+    "plateada": [159,556],
+    "plenitud": [270,473,359,580,422,499],
+    "pliegue": [342,503],
+    "poca": [393,406],
+    "poco": [19,391,22,435,142,412,340,340,391,217,402,307],
+    "poder": [34,473,125,415,403,288,406,262],
+    "podria": [385,335],
+    "polidipsia": [208,586],
+    "poliuria": [208,586],
+    "ponen": [391,293],
+    "posesion": [392,631],
+    "posible": [335,449],
+    "posicion": [245,613],
+    "positivo": [330,515],
+    "posnasal": [420,586],
+    "postcoital": [311,515],
+    "postura": [134,528,201,528,239,499],
+    "postural": [119,681],
+    "precancerosa": [347,469],
+    "preexistente": [325,528],
+    "prematura": [160,506,311,468],
+    "preocupacion": [374,420,380,344,383,296,386,409,401,265,405,322,409,309],
+    "preocupado": [391,293],
+    "preocuparse": [406,325],
+    "presencia": [209,519,399,377],
+    "present": [395,422],
+    "presenta": [112,571],
+    "presion": [5,249,69,320,84,311,107,311,166,311,195,287,200,287,207,330,218,233,260,340,262,330,270,295,271,287,273,267,280,350,285,295,288,295,310,280,369,267,420,311,422,311],
+    "presiona": [233,449,371,359,429,499],
+    "presionarla": [345,469],
+    "prestar": [382,480],
+    "previamente": [148,603],
+    "previo": [400,459],
+    "primaria": [213,515],
+    "primer": [314,528],
+    "principalmente": [327,503],
+    "principio": [149,621],
+    "privilegio": [406,325],
+    "problema": [88,252,99,228,102,336,120,273,121,319,126,245,128,299,133,281,143,290,147,258,149,281,162,355,163,399,169,314,175,266,184,258,199,245,218,199,230,308,231,228,249,273,283,245,287,233,291,228,310,239,357,299,382,217,397,203,410,309,412,184,413,228,417,266,436,299],
+    "produccion": [199,493,208,534],
+    "producido": [399,414],
+    "productividad": [409,431],
+    "profesional": [412,406],
+    "profunda": [8,640],
+    "profundidad": [427,586],
+    "profundo": [15,479,95,428,110,452,225,479,313,407],
+    "profusa": [83,493,207,565],
+    "progresar": [177,459],
+    "progresiva": [10,348,39,357,120,378,129,389,134,389,137,427,156,401,170,323,171,315,227,401,232,427,367,427],
+    "progresivo": [143,516,146,532,150,501,151,568],
+    "prolongado": [83,460,234,399,285,473],
+    "promedio": [197,586],
+    "prominent": [196,571],
+    "prominente": [242,621],
+    "propio": [408,267],
+    "proporcion": [197,586],
+    "prostatiti": [294,491],
+    "proteina": [271,460,273,428,310,449],
+    "protuberancia": [188,476,288,375,306,331,322,365,329,347,335,446,336,396,344,347,346,375],
+    "proviene": [418,571],
+    "provoca": [388,398],
+    "provocan": [385,335],
+    "provocativo": [405,449],
+    "proyecto": [408,267],
+    "pruriginoso": [341,480],
+    "prurito": [345,469],
+    "psicotico": [400,459],
+    "psiquiatrico": [131,621],
+    "psoriasi": [183,515],
+    "ptosi": [231,503],
+    "pubertad": [198,534,213,468],
+    "pubico": [211,426,212,362,216,460,276,415],
+    "publico": [385,335],
+    "puerta": [235,515],
+    "pulgar": [247,921],
+    "pulmonar": [19,449,169,408,367,580],
+    "pulsatil": [117,660],
+    "pulso": [51,516,95,448,107,473,108,549],
+    "punta": [334,503],
+    "punto": [183,397,316,465,322,417,329,397,408,206],
+    "punzante": [93,447,104,401,122,489,123,461,154,412,243,382],
+    "purgativa": [383,414],
+    "purpura": [171,405,179,426,188,396,373,587],
+    "purulenta": [414,571],
+    "purulento": [435,541],
+    "pus": [43,516,316,486,335,362,368,460],
+    "pustula": [316,549,320,480],
+    "quebrada": [433,541],
+    "quebrantar": [404,503],
+    "queda": [245,406],
+    "quedarse": [382,480],
+    "queja": [386,370],
+    "quemazon": [349,621],
+    "querer": [402,414],
+    "querido": [386,370],
+    "quieren": [406,325],
+    "quieto": [382,480],
+    "quilotorax": [367,681],
+    "quist": [138,516,194,415,316,486,357,532],
+    "rango": [371,422],
+    "rapida": [31,570,32,505,35,581,107,435,286,373,376,364],
+    "rapidamente": [204,465,325,407,332,417,405,346,435,417],
+    "rapido": [13,376,28,330,51,410,85,356,86,376,87,398,89,387,107,376,193,398,216,366,312,347],
+    "rara": [339,503],
+    "raro": [177,459],
+    "rascado": [341,436,390,384],
+    "rascarse": [390,631],
+    "rasgo": [196,519,198,534],
+    "raynaud": [169,480],
+    "razon": [412,406],
+    "reaccion": [378,436,401,337],
+    "reaccionar": [402,622],
+    "reafirmacion": [408,267],
+    "real": [388,362,392,384],
+    "realizar": [402,377,423,457],
+    "rechazo": [407,503],
+    "recibir": [406,325],
+    "reconocer": [406,325],
+    "recordar": [413,503],
+    "rectal": [43,475,47,461,63,640,66,489,67,435,173,475],
+    "recto": [63,601,307,392],
+    "recuento": [162,571],
+    "recuerdan": [378,480],
+    "recuerdo": [378,480],
+    "recuperar": [104,541],
+    "recurrent": [17,339,106,330,118,393,132,348,156,370,162,330,180,305,275,393,278,290,371,244,377,290,378,277,379,297,383,239,397,259,422,339],
+    "recurrente": [367,580,389,408,390,359],
+    "redonda": [329,515],
+    "redondo": [177,459],
+    "reducido": [215,436,253,519],
+    "reflujo": [169,480],
+    "region": [46,621],
+    "regla": [323,528],
+    "regurgitacion": [42,532,62,516,72,568,73,532],
+    "relacion": [267,423,283,347,284,330,285,356,287,467,290,338,308,308,384,356,399,265,402,399,413,322],
+    "relacionada": [302,493,327,457],
+    "remordimiento": [404,503],
+    "renal": [169,356,202,475,217,461,218,326,273,373,274,522],
+    "reparador": [125,515],
+    "repentina": [99,388,126,582,245,313,258,493,297,397],
+    "repentino": [16,432,57,409,78,473,108,488,126,541,237,432,436,473],
+    "repetida": [386,571],
+    "repetido": [386,315,389,408,390,359],
+    "repetitivo": [377,503],
+    "reposo": [14,401,84,435,89,447,94,447,103,391,119,505],
+    "requeson": [290,528],
+    "resfriado": [23,549,27,549],
+    "resistir": [391,293],
+    "resolver": [120,603],
+    "respecto": [338,528],
+    "respetar": [404,503],
+    "respiracion": [11,385,28,347,31,375,32,460,34,396,35,385,107,396,108,460,419,375],
+    "respirar": [2,331,3,253,8,260,10,226,12,245,13,239,15,337,16,245,17,239,18,253,19,215,22,239,26,296,29,226,30,226,32,277,33,286,36,260,37,277,38,253,39,232,83,220,85,226,87,253,88,226,93,245,96,245,100,226,115,239,167,226,218,179,219,260,229,245,232,277,233,215,358,307,359,277,362,239,364,260,367,277,370,253,411,253,419,226],
+    "respiratoria": [3,528,17,499,31,473],
+    "resplandor": [415,571],
+    "responden": [412,406],
+    "responsabilidad": [408,267],
+    "respuesta": [169,436,403,325],
+    "restriccion": [383,414],
+    "restringida": [106,571],
+    "resulta": [160,556],
+    "retencion": [263,561,272,561,273,428],
+    "reticencia": [401,370],
+    "reticulari": [180,528],
+    "retina": [138,640],
+    "retorcida": [298,541],
+    "retorno": [400,459],
+    "retrasada": [198,534,213,468],
+    "retrasado": [197,586],
+    "retrasar": [314,528],
+    "retraso": [100,386,152,506,153,419,155,544,215,333,220,333,315,473,363,489],
+    "riesgo": [149,565,306,447],
+    "rigidez": [106,298,119,356,127,335,132,315,134,325,150,325,154,291,158,368,182,298,183,269,184,298,221,315,226,368,238,298,240,257,244,276,245,212,251,315,252,345,253,298,371,221,409,225],
+    "rinofima": [320,528],
+    "rinon": [138,640],
+    "ritmo": [92,544,193,528,379,438],
+    "ritual": [389,480],
+    "rodilla": [171,405,184,460,185,396,244,791],
+    "roja": [64,370,159,341,171,308,318,370,321,332,328,323,332,332,333,316,335,275,349,381,350,308,354,370,368,350],
+    "rojiza": [344,515],
+    "rojizo": [103,480,341,436],
+    "rojo": [23,378,104,339,161,389,169,301,311,323,319,357,325,331,334,315,343,323,345,294,347,294,430,413],
+    "rompe": [95,769],
+    "rompen": [187,370,239,473,328,426,330,415],
+    "ronca": [165,565,370,565],
+    "roncha": [189,611,319,713],
+    "ronquera": [7,444,25,473,27,419,29,386,69,419,204,419,218,305,433,376],
+    "ronquido": [11,519,420,534],
+    "ropa": [65,582,391,267],
+    "rosa": [271,493,347,427],
+    "rosada": [329,515],
+    "rosado": [30,506,343,468],
+    "rostro": [116,528,320,449,348,345],
+    "rugosa": [322,493,339,457],
+    "ruido": [134,565,434,534],
+    "ruidosa": [419,556],
+    "saciedad": [60,516,74,549,286,405,369,405],
+    "sacroiliaca": [182,571],
+    "sacudida": [379,515],
+    "sal": [166,586],
+    "sale": [312,541],
+    "salpicadura": [277,586],
+    "salton": [164,603],
+    "salud": [412,406],
+    "sanan": [305,491],
+    "sangra": [324,503],
+    "sangrado": [46,320,63,340,66,340,67,302,110,411,111,320,173,330,179,382,284,265,285,286,287,265,304,265,308,247,309,286,311,376,312,279,313,272,323,272,339,259,345,242,350,259,369,259,431,351],
+    "sangrar": [159,556],
+    "sangre": [9,261,12,276,13,269,17,269,33,323,37,312,43,293,45,323,64,276,67,269,110,269,179,242,180,242,200,248,206,242,233,242,255,276,257,293,262,285,268,302,269,312,270,255,271,248,279,312,280,302,281,269,287,236,296,236,301,261,311,236,360,293,435,248],
+    "sanguineo": [104,401,162,423,273,373,320,391,322,401,350,373],
+    "sarpullido": [281,534,352,582],
+    "sea": [401,370],
+    "seca": [7,363,10,315,15,352,18,352,21,324,22,333,39,324,93,342,159,315,165,352,168,399,192,399,291,285,317,374,318,342,337,315,433,307],
+    "seco": [168,641,347,427],
+    "secrecion": [4,352,5,282,63,396,209,343,210,343,261,384,300,325,302,325,303,352,304,309,308,288,414,343,432,396,435,325],
+    "sed": [114,458,172,432,190,458,191,458,200,388,206,378,208,420],
+    "seductor": [405,449],
+    "segun": [100,506,357,601],
+    "semana": [9,460,47,501,187,370,398,315],
+    "semen": [296,468,301,519],
+    "semicircular": [346,556],
+    "seno": [209,440,211,407,212,346,215,370,292,417],
+    "sensacion": [7,239,16,225,30,208,34,298,40,255,41,255,47,232,59,247,60,239,63,247,74,255,84,219,86,219,95,208,98,219,104,202,105,197,106,213,124,239,178,127,219,239,223,225,224,213,243,192,244,197,245,152,246,208,247,168,251,225,255,225,270,208,286,188,288,208,297,192,299,232,303,219,333,192,341,179,354,225,359,255,369,268,374,219,379,192,394,192,413,188,414,213,421,232,422,219,428,219,433,202,434,219,435,202],
+    "sensibilidad": [58,258,79,326,98,272,116,288,117,306,122,306,134,288,136,272,139,280,150,288,165,288,186,288,192,326,209,265,224,265,226,326,236,297,237,280,245,188,292,251,300,251,301,265,334,233,335,208,345,217,365,350,366,297,410,217,415,265,428,272,430,306],
+    "sensibl": [353,681],
+    "sensible": [317,660],
+    "sentado": [154,506,234,427],
+    "sentido": [5,399,213,438,420,499],
+    "sentimiento": [375,362,384,448,406,262,407,405],
+    "sentir": [402,377,406,295],
+    "sentirse": [393,613],
+    "separacion": [214,480,386,771],
+    "separarse": [392,422],
+    "sequedad": [210,519,291,457],
+    "ser": [152,446,178,209,343,316,380,294,385,205,386,227,403,219,404,308,405,405,406,199,408,164,418,350,431,418],
+    "serotipo": [23,603],
+    "severa": [207,565,383,377],
+    "severo": [99,373,112,423,113,475,145,505,194,382,436,489],
+    "sexual": [210,350,267,404,283,332,284,316,285,341,287,447,290,323,293,418,302,332,308,294,313,323,314,323,402,254],
+    "sibilancia": [0,489,3,431,19,366,22,407,26,506,30,386,37,473,85,386],
+    "sibilante": [273,503],
+    "sido": [399,414],
+    "siempre": [314,449,385,285,388,339],
+    "siente": [326,457,408,243],
+    "significado": [401,370],
+    "significativo": [375,322,377,360,388,285,389,344,390,302,392,302,395,302],
+    "signo": [330,468,345,427],
+    "siguen": [340,459],
+    "siguient": [385,305,400,417],
+    "silbido": [418,571],
+    "silla": [170,515],
+    "simetria": [377,503],
+    "simetrico": [338,528],
+    "similar": [142,348,178,213,181,367,187,287,290,331,294,308,305,308,320,331,324,315,326,315,340,287,362,367],
+    "sincope": [86,586],
+    "sintoma": [23,370,27,370,112,480,132,370,142,341,220,294,294,301,305,301,395,387,398,365,400,281,411,381,412,249],
+    "sistema": [138,582,220,436],
+    "sitio": [385,335],
+    "situacion": [380,604,383,307,385,551,387,498,388,541,407,373],
+    "sobresalto": [378,480],
+    "social": [380,639,381,378,383,296,387,481,403,256,407,513,413,360],
+    "socialmente": [403,358],
+    "socio": [401,370],
+    "sofoco": [291,503],
+    "sol": [116,479,324,388,343,397,347,362,348,313],
+    "soledad": [402,414],
+    "solia": [393,406],
+    "solida": [65,640],
+    "solitario": [403,358],
+    "solo": [385,285,402,352,408,227],
+    "somnolencia": [11,519,125,468],
+    "son": [391,267,408,243],
+    "sonido": [8,444,27,419,28,358,101,419,117,458,144,376,273,349,418,396],
+    "sonrojarse": [380,480],
+    "soplo": [90,549,91,534],
+    "sordera": [220,480],
+    "sordo": [178,274,225,501,297,415,298,437],
+    "sospecha": [401,370],
+    "sospechoso": [403,358],
+    "sostener": [235,515],
+    "sostenida": [381,528],
+    "subir": [170,438,178,289,393,345],
+    "subita": [13,435,99,373,108,505,142,412,228,489,400,340],
+    "subito": [21,409,81,432,95,398,96,432,99,513,127,458,416,344],
+    "subjetiva": [34,586],
+    "suceda": [386,370],
+    "suciedad": [377,503],
+    "sudar": [380,480],
+    "sudor": [9,423,91,435,291,373,351,461,353,505,355,505],
+    "sudoracion": [82,432,83,388,205,388,207,445,327,360,334,360,379,369],
+    "sudorosa": [107,586],
+    "suele": [324,428,328,449,347,399],
+    "suelen": [326,503],
+    "sueno": [11,385,125,571,132,407,147,385,230,460,266,475,374,396,394,347,419,375],
+    "suficiente": [34,586],
+    "sufrimiento": [338,480,386,337],
+    "sujetar": [235,515],
+    "superficial": [31,473,32,580,405,382],
+    "superficie": [322,460,325,449,339,428],
+    "superior": [40,427,51,401,57,357,58,348,60,401,70,389,77,441,115,367,178,213,278,315,338,331,369,315],
+    "superioridad": [406,325],
+    "supersticion": [403,358],
+    "suprarrenal": [143,640],
+    "supuracion": [417,586],
+    "supuran": [328,480,336,534],
+    "supurar": [318,603],
+    "sustancia": [390,422],
+    "sustitucion": [144,541],
+    "sydenham": [185,491],
+    "tacto": [58,386,122,458,134,431,224,396,236,444,322,376,345,326,410,326],
+    "tamano": [189,319,198,407,212,312,270,386,299,431,335,312,336,407,348,282],
+    "tambor": [10,506,39,519],
+    "taquicardia": [35,485,193,528,220,408],
+    "taquipnea": [35,571],
+    "tardia": [307,431],
+    "tarea": [382,436,409,583],
+    "taza": [235,515],
+    "tejido": [209,460,312,437,361,532,371,340],
+    "telangiectasia": [320,480,349,565],
+    "telegrafica": [144,541],
+    "telepatia": [403,358],
+    "temblar": [380,480],
+    "temblor": [119,488,132,432,164,432,193,445,205,388,379,369,410,336],
+    "temblorosa": [433,541],
+    "temida": [380,480],
+    "temor": [408,267],
+    "temporal": [118,620,417,534],
+    "temprana": [60,516,74,549,211,426,216,460],
+    "temprano": [125,468,211,480],
+    "tendencia": [348,406],
+    "tendon": [183,468,224,713],
+    "tener": [332,417,391,226,393,313,406,494,414,440],
+    "tensa": [187,417,433,493],
+    "tension": [374,586],
+    "terminar": [382,480],
+    "termino": [412,406],
+    "testicular": [298,493,303,534],
+    "testiculo": [211,356,212,303,215,324,297,492,298,365,299,419,300,365,301,385,304,347],
+    "testosterona": [215,480],
+    "tics": [229,603],
+    "tiempo": [38,445,120,432,142,398,160,398,201,445,239,420,335,322],
+    "tien": [391,293],
+    "tienen": [329,468,401,337],
+    "timidez": [407,503],
+    "tina": [321,541],
+    "tinnitu": [145,549,422,473,434,473,435,437],
+    "tinte": [371,422],
+    "tirantez": [244,528],
+    "tiroid": [164,603],
+    "tobillo": [14,376,85,386,90,419,178,236,184,396,185,341,188,341,246,386],
+    "toda": [375,409,424,565],
+    "todo": [124,582,393,369],
+    "tomar": [394,468,408,243],
+    "tonico": [146,660],
+    "tono": [215,480],
+    "torcida": [105,528],
+    "tos": [0,295,1,286,2,253,3,260,5,197,7,268,8,268,9,329,10,233,12,341,13,246,15,260,17,335,18,260,19,221,20,295,21,239,22,246,24,305,25,286,26,305,27,253,28,306,30,233,32,286,33,295,36,268,37,286,38,260,39,239,69,253,85,233,93,253,219,268,356,286,358,316,362,246,367,286,370,260,433,227],
+    "tosco": [198,586],
+    "toser": [15,565,28,468],
+    "total": [177,417,432,601],
+    "totali": [177,459],
+    "traba": [245,406],
+    "trabado": [245,406],
+    "trabajar": [409,431],
+    "trabajo": [409,392,423,457],
+    "tragar": [6,325,29,282,42,335,59,439,62,325,69,306,72,457,73,335,129,315,137,346,148,306,167,282,169,244,170,262,171,255,178,173,204,306,218,223,219,325,231,255,232,346,364,325,368,290,370,315],
+    "transitorio": [180,528],
+    "transporte": [385,335],
+    "trastorno": [132,465,156,493,220,534,374,452,398,301],
+    "tratamiento": [412,613],
+    "trato": [406,325],
+    "trauma": [378,480],
+    "traumatico": [378,436,413,457],
+    "traumatismo": [345,469],
+    "tres": [47,621],
+    "triste": [393,406],
+    "tristeza": [376,418,394,438,396,473],
+    "tropical": [356,681],
+    "tumor": [138,640],
+    "tunel": [336,499,342,428,416,408],
+    "turbia": [254,499,255,513,256,528],
+    "ubicacion": [357,660],
+    "ulcera": [181,420,217,445,305,505,307,309,324,360,325,378,334,360],
+    "ulceracion": [323,528],
+    "unen": [183,515],
+    "uniforme": [338,528],
+    "uretra": [261,544,277,499,278,428],
+    "urgencia": [286,503],
+    "urgente": [43,475,48,505,78,489,255,447,267,489,300,401],
+    "urinaria": [260,421,264,448,265,568,275,448,276,338,278,471,282,421,288,365,294,323,360,421],
+    "urinario": [184,571],
+    "urticaria": [161,565,187,417],
+    "usar": [147,519,426,480],
+    "uso": [383,377,385,305],
+    "uterina": [311,515],
+    "utilizada": [401,370],
+    "uveiti": [181,534,182,519],
+    "vaciar": [265,561,288,473,295,428],
+    "vacilacion": [294,491],
+    "vacio": [384,506,394,468],
+    "vagina": [261,493,288,428,290,407,303,452,312,417],
+    "vaginal": [210,350,278,308,284,316,287,447,289,548,290,323,291,308,304,316,308,294,309,341,311,316,312,332,313,323],
+    "vago": [405,449],
+    "valor": [392,422],
+    "varia": [347,427,348,369],
+    "variado": [323,528],
+    "varian": [100,506,189,417],
+    "variar": [299,621],
+    "vascular": [361,660],
+    "vaso": [273,405,320,426,322,437,350,405],
+    "vejiga": [139,465,265,509,276,397,288,428,295,388],
+    "vello": [194,397,211,407,212,346,215,370,216,440],
+    "velluda": [339,503],
+    "vena": [103,426,105,426,180,426,298,437],
+    "ver": [381,426,391,236,415,460,425,598],
+    "verbal": [397,449],
+    "verde": [5,427,304,468],
+    "verdosa": [2,549,308,436],
+    "verruga": [306,705],
+    "vertebral": [242,621],
+    "vertigo": [145,549,422,473,435,437,436,532],
+    "vida": [408,243,409,392],
+    "violacea": [171,457,195,493],
+    "violaceo": [345,469],
+    "violenta": [28,515],
+    "visibl": [320,528],
+    "visible": [219,493,241,440,250,452,276,397,335,346],
+    "vision": [80,320,99,236,102,248,114,300,121,330,126,254,127,300,128,310,142,261,143,300,163,320,167,261,172,283,178,160,186,291,190,300,199,254,205,254,231,236,310,248,410,220,415,368,416,382,423,236,424,389,425,248,426,248,427,375,428,275,429,275],
+    "visual": [117,458,132,419,146,458,152,506,423,349,424,431,425,366,426,366],
+    "volant": [186,621],
+    "volar": [388,398],
+    "volumen": [208,499,259,561,262,528],
+    "voluminosa": [19,528],
+    "voluntad": [406,325],
+    "voluntariamente": [408,267],
+    "volver": [125,515],
+    "volverse": [327,503],
+    "vomito": [23,270,28,230,40,305,49,315,51,286,52,295,56,295,57,255,61,326,68,295,70,278,71,255,74,305,76,338,78,295,79,315,117,295,124,286,127,286,145,305,148,270,153,270,233,236,256,278,257,286,259,295,264,305,279,305,301,255,366,286,383,185,416,215,421,278,436,295],
+    "voz": [7,458,165,445,196,409,204,432,216,409,370,445,433,541],
+    "vuelta": [124,640],
+    "vuelve": [324,503],
+    "vuelven": [104,493,169,436],
+    "vulva": [290,742],
+    "wickham": [188,491],
+    "xantoma": [112,571],
+    "yema": [350,503],
+    "zona": [253,350,308,294,312,332,313,323,318,370,324,308,331,323,334,308,335,405,348,249,366,519,371,259,392,259],
+    "zumbido": [80,505,145,505,418,423,422,435,434,435,435,401],
+  },
+};
@@ -0,0 +1,98 @@
+// Pócima Salvage - Comprobador de síntomas
+// Consulta el índice generado por scripts/build-symptom-index.py (misma lógica que scripts/catalogo/sintomas.py)
+
+import { IndiceSintomas, indiceSintomas } from './sintomas-index';
+
+export interface CoincidenciaSintomas {
+  id: string;
+  sistemaId: string;
+  // suma de los pesos de los términos coincidentes por la fracción de síntomas cubiertos
+  puntuacion: number;
+  // cuántos de los síntomas de la consulta tiene la enfermedad
+  cubiertos: number;
+}
+
+// Síntomas por consulta: la cobertura se lleva en una máscara de 32 bits
+const MAX_FRASES = 30;
+const ESCALA = 100;
+
+const vaciasDe = new WeakMap<IndiceSintomas, Set<string>>();
+
+// Recorta el plural: 'dolores' -> 'dolor', 'nauseas' -> 'nausea' (raiz_plural en scripts/catalogo/texto.py)
+const raiz = (palabra: string): string => {
+  if (palabra.length > 5 && palabra.endsWith('es') && !'aeiou'.includes(palabra[palabra.length - 3])) {
+    return palabra.slice(0, -2);
+  }
+  if (palabra.length > 4 && palabra.endsWith('s')) return palabra.slice(0, -1);
+  return palabra;
+};
+
+// Términos de una frase de síntoma, en orden y sin repetir: 'Dolores de cabeza' -> ['dolor', 'cabeza']
+export const terminosSintoma = (frase: string, indice: IndiceSintomas = indiceSintomas): string[] => {
+  let vacias = vaciasDe.get(indice);
+  if (!vacias) {
+    vacias = new Set(indice.vacias);
+    vaciasDe.set(indice, vacias);
+  }
+  const plegada = frase.toLowerCase().normalize('NFD').replace(/[\u0300-\u036f]/g, '');
+  const terminos: string[] = [];
+  for (const palabra of plegada.match(/[a-z0-9]+/g) ?? []) {
+    if (vacias.has(palabra) || palabra.length < 3) continue;
+    const termino = raiz(palabra);
+    if (!terminos.includes(termino)) terminos.push(termino);
+  }
+  return terminos;
+};
+
+/**
+ * Enfermedades que mejor explican una lista de síntomas (frases libres),
+ * ordenadas por puntuación. Sólo recorre las listas de los términos de la
+ * consulta; la puntuación se multiplica por la fracción de síntomas que la
+ * enfermedad cubre, así que gana la que explica más síntomas.
+ */
+export const buscarPorSintomas = (
+  sintomas: string[],
+  limite = 10,
+  indice: IndiceSintomas = indiceSintomas,
+): CoincidenciaSintomas[] => {
+  const frases = sintomas
+    .map(s => terminosSintoma(s, indice))
+    .filter(f => f.length > 0)
+    .slice(0, MAX_FRASES);
+  if (frases.length === 0) return [];
+
+  // término -> máscara de las frases de la consulta que lo contienen
+  const mascaras = new Map<string, number>();
+  frases.forEach((frase, i) => {
+    for (const t of frase) mascaras.set(t, (mascaras.get(t) ?? 0) | (1 << i));
+  });
+
+  const puntos = new Map<number, number>();
+  const cubiertas = new Map<number, number>();
+  for (const [t, mascara] of mascaras) {
+    const lista = indice.terminos[t];
+    // Array.isArray evita claves heredadas de Object.prototype ('constructor')
+    if (!Array.isArray(lista)) continue;
+    for (let i = 0; i < lista.length; i += 2) {
+      const posicion = lista[i];
+      puntos.set(posicion, (puntos.get(posicion) ?? 0) + lista[i + 1]);
+      cubiertas.set(posicion, (cubiertas.get(posicion) ?? 0) | mascara);
+    }
+  }
+
+  const resultados: [number, number, number][] = [];
+  for (const [posicion, suma] of puntos) {
+    let mascara = cubiertas.get(posicion)!;
+    let cubiertos = 0;
+    while (mascara) {
+      cubiertos += mascara & 1;
+      mascara >>>= 1;
+    }
+    resultados.push([(suma * cubiertos) / frases.length / ESCALA, cubiertos, posicion]);
+  }
+  resultados.sort((a, b) => b[0] - a[0] || a[2] - b[2]);
+  return resultados.slice(0, limite).map(([puntuacion, cubiertos, posicion]) => {
+    const [id, sistemaId] = indice.enfermedades[posicion];
+    return { id, sistemaId, puntuacion: Math.round(puntuacion * 1000) / 1000, cubiertos };
+  });
+};
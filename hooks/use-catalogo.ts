@@ -0,0 +1,84 @@
+import { useEffect, useState } from "react";
+
+import type { CategoriaPlanta, PlantaExpandida } from "../data/plantas-expandidas";
+import type { EnfermedadExpandida, SistemaCorporal } from "../data/enfermedades-expandidas";
+import { cargarCategoria } from "../data/chunks/plantas";
+import { cargarSistema } from "../data/chunks/enfermedades";
+import { cargarCatalogoCruce, CatalogoCruce } from "../data/cruce-datos";
+
+// Carga diferida de los bloques del catálogo: las pantallas importan sólo los
+// índices de data/chunks/ y cada categoría o sistema se carga al abrirlo.
+
+function useCargaDiferida<T>(cargar: (() => Promise<T | undefined>) | null, deps: unknown[]) {
+  const [valor, setValor] = useState<T | undefined>(undefined);
+  // Si hay algo que cargar, el primer render ya cuenta como cargando
+  const [loading, setLoading] = useState(cargar !== null);
+
+  useEffect(() => {
+    if (!cargar) {
+      setValor(undefined);
+      setLoading(false);
+      return;
+    }
+    let cancelado = false;
+    setLoading(true);
+    cargar()
+      .then((resultado) => {
+        if (!cancelado) setValor(resultado);
+      })
+      .catch((error) => {
+        console.error("[useCatalogo] Error cargando bloque:", error);
+        if (!cancelado) setValor(undefined);
+      })
+      .finally(() => {
+        if (!cancelado) setLoading(false);
+      });
+    return () => {
+      cancelado = true;
+    };
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+  }, deps);
+
+  return { valor, loading };
+}
+
+export function useCategoriaPlantas(categoriaId: string | null) {
+  const { valor, loading } = useCargaDiferida<CategoriaPlanta>(
+    categoriaId ? () => cargarCategoria(categoriaId) : null,
+    [categoriaId],
+  );
+  return { categoria: valor, plantas: valor?.plantas ?? [], loading };
+}
+
+export function useSistemaEnfermedades(sistemaId: string | null) {
+  const { valor, loading } = useCargaDiferida<SistemaCorporal>(
+    sistemaId ? () => cargarSistema(sistemaId) : null,
+    [sistemaId],
+  );
+  return { sistema: valor, enfermedades: valor?.enfermedades ?? [], loading };
+}
+
+// El cruce enfermedades ↔ plantas de las pantallas de detalle necesita el
+// catálogo completo: se carga desde los chunks la primera vez y se comparte.
+export function useCatalogoCruce() {
+  const { valor, loading } = useCargaDiferida<CatalogoCruce>(cargarCatalogoCruce, []);
+  return { catalogo: valor, loading };
+}
+
+// La búsqueda recorre todo el catálogo: el módulo completo se importa con la
+// primera consulta y no al arrancar.
+export function useBusquedaPlantas(query: string) {
+  const { valor, loading } = useCargaDiferida<PlantaExpandida[]>(
+    query.trim() ? () => import("../data/plantas-expandidas").then((m) => m.buscarPlantasExpandidas(query)) : null,
+    [query],
+  );
+  return { resultados: valor ?? [], loading };
+}
+
+export function useBusquedaEnfermedades(query: string) {
+  const { valor, loading } = useCargaDiferida<EnfermedadExpandida[]>(
+    query.trim() ? () => import("../data/enfermedades-expandidas").then((m) => m.buscarEnfermedadesExpandidas(query)) : null,
+    [query],
+  );
+  return { resultados: valor ?? [], loading };
+}
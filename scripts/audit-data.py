@@ -4,99 +4,92 @@ Script para auditar los datos de enfermedades y plantas medicinales.
 Verifica que todos los campos estén completos y no truncados.
 """
 
-import re
+import argparse
 import json
 
-def audit_enfermedades():
-    """Audita el archivo de enfermedades expandidas."""
+from catalogo import work_path, write_atomic
+from catalogo.auditoria import auditar
+
+REPORTE_JSON = work_path('auditoria.json')
+
+
+def print_truncados(resultado):
+    truncated = resultado.truncados()
+    if truncated:
+        print(f"\n⚠️ Posibles datos truncados encontrados: {truncated}")
+        for e in resultado.entidades_con(*(h for h in resultado.conteo if h.startswith('truncado:')))[:10]:
+            campos = ', '.join(h.split(':', 1)[1] for h in e['hallazgos'] if h.startswith('truncado:'))
+            print(f"  - {e['nombre']} ({campos})")
+    else:
+        print("\n✅ No se encontraron datos truncados")
+
+
+def audit_enfermedades(resultado):
+    """Resumen de la auditoría de enfermedades expandidas."""
     print("=" * 60)
     print("AUDITORÍA DE ENFERMEDADES")
     print("=" * 60)
     
-    with open('/home/ubuntu/pocima-salvage/data/enfermedades-expandidas.ts', 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    # Contar enfermedades
-    enfermedades = re.findall(r'{\s*id:\s*["\']([^"\']+)["\']', content)
-    print(f"\nTotal de enfermedades encontradas: {len(enfermedades)}")
+    print(f"\nTotal de enfermedades encontradas: {resultado.total}")
     
     # Verificar campos
-    sintomas_count = len(re.findall(r'sintomas:\s*\[', content))
-    causas_count = len(re.findall(r'causas:\s*\[', content))
-    descripcion_count = len(re.findall(r'descripcion:\s*["\']', content))
-    otros_nombres_count = len(re.findall(r'otrosNombres:\s*\[', content))
+    sintomas_count = resultado.con('sintomas')
+    causas_count = resultado.con('causas')
     
     print(f"Enfermedades con síntomas: {sintomas_count}")
     print(f"Enfermedades con causas: {causas_count}")
-    print(f"Enfermedades con descripción: {descripcion_count}")
-    print(f"Enfermedades con otros nombres: {otros_nombres_count}")
+    print(f"Enfermedades con descripción: {resultado.con('descripcion')}")
+    print(f"Enfermedades con otros nombres: {resultado.con('otrosNombres')}")
     
     # Buscar campos vacíos o truncados
-    empty_sintomas = len(re.findall(r'sintomas:\s*\[\s*\]', content))
-    empty_causas = len(re.findall(r'causas:\s*\[\s*\]', content))
+    empty_sintomas = resultado.vacios('sintomas')
+    empty_causas = resultado.vacios('causas')
     
     print(f"\nEnfermedades con síntomas vacíos: {empty_sintomas}")
     print(f"Enfermedades con causas vacías: {empty_causas}")
     
-    # Verificar si hay datos truncados (buscar patrones incompletos)
-    truncated = re.findall(r'["\'][^"\']{200,}\.{3}', content)
-    if truncated:
-        print(f"\n⚠️ Posibles datos truncados encontrados: {len(truncated)}")
-    else:
-        print("\n✅ No se encontraron datos truncados")
+    print_truncados(resultado)
     
     return {
-        'total': len(enfermedades),
+        'total': resultado.total,
         'con_sintomas': sintomas_count,
         'con_causas': causas_count,
         'sin_sintomas': empty_sintomas,
         'sin_causas': empty_causas
     }
 
-def audit_plantas():
-    """Audita el archivo de plantas expandidas."""
+def audit_plantas(resultado):
+    """Resumen de la auditoría de plantas expandidas."""
     print("\n" + "=" * 60)
     print("AUDITORÍA DE PLANTAS MEDICINALES")
     print("=" * 60)
     
-    with open('/home/ubuntu/pocima-salvage/data/plantas-expandidas.ts', 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    # Contar plantas
-    plantas = re.findall(r'{\s*id:\s*["\']([^"\']+)["\']', content)
-    print(f"\nTotal de plantas encontradas: {len(plantas)}")
+    print(f"\nTotal de plantas encontradas: {resultado.total}")
     
     # Verificar campos principales
-    propiedades_count = len(re.findall(r'propiedades:\s*\[', content))
-    parte_usada_count = len(re.findall(r'parteUsada:\s*["\']', content))
-    dosis_count = len(re.findall(r'dosis:\s*["\']', content))
-    preparacion_count = len(re.findall(r'preparacion:\s*["\']', content))
-    contraindicaciones_count = len(re.findall(r'contraindicaciones:\s*\[', content))
-    nombres_alt_count = len(re.findall(r'nombresAlternativos:\s*{', content))
+    propiedades_count = resultado.con('propiedades')
+    dosis_count = resultado.con('dosis')
+    preparacion_count = resultado.con('preparacion')
+    contraindicaciones_count = resultado.con('contraindicaciones')
+    nombres_alt_count = resultado.con('nombresAlternativos')
     
     print(f"Plantas con propiedades: {propiedades_count}")
-    print(f"Plantas con parte usada: {parte_usada_count}")
+    print(f"Plantas con parte usada: {resultado.con('parteUsable')}")
     print(f"Plantas con dosis: {dosis_count}")
     print(f"Plantas con preparación: {preparacion_count}")
     print(f"Plantas con contraindicaciones: {contraindicaciones_count}")
     print(f"Plantas con nombres alternativos: {nombres_alt_count}")
     
     # Buscar campos vacíos
-    empty_propiedades = len(re.findall(r'propiedades:\s*\[\s*\]', content))
-    empty_contraindicaciones = len(re.findall(r'contraindicaciones:\s*\[\s*\]', content))
+    empty_propiedades = resultado.vacios('propiedades')
     
     print(f"\nPlantas con propiedades vacías: {empty_propiedades}")
-    print(f"Plantas con contraindicaciones vacías: {empty_contraindicaciones}")
+    print(f"Plantas con contraindicaciones vacías: {resultado.vacios('contraindicaciones')}")
     
-    # Verificar si hay datos truncados
-    truncated = re.findall(r'["\'][^"\']{200,}\.{3}', content)
-    if truncated:
-        print(f"\n⚠️ Posibles datos truncados encontrados: {len(truncated)}")
-    else:
-        print("\n✅ No se encontraron datos truncados")
+    print_truncados(resultado)
     
     return {
-        'total': len(plantas),
+        'total': resultado.total,
         'con_propiedades': propiedades_count,
         'con_dosis': dosis_count,
         'con_preparacion': preparacion_count,
@@ -105,37 +98,15 @@ def audit_plantas():
         'sin_propiedades': empty_propiedades
     }
 
-def check_missing_data():
-    """Identifica enfermedades y plantas con datos faltantes."""
+def check_missing_data(resultado):
+    """Identifica enfermedades con datos faltantes."""
     print("\n" + "=" * 60)
     print("ANÁLISIS DE DATOS FALTANTES")
     print("=" * 60)
     
-    # Leer enfermedades
-    with open('/home/ubuntu/pocima-salvage/data/enfermedades-expandidas.ts', 'r', encoding='utf-8') as f:
-        enf_content = f.read()
-    
-    # Buscar enfermedades sin síntomas (tienen el campo pero está vacío o no existe)
-    # Patrón: id seguido de nombre, pero sin sintomas antes del siguiente id
-    enf_blocks = re.split(r'(?={\s*id:\s*["\'])', enf_content)
-    
-    sin_sintomas = []
-    sin_causas = []
-    
-    for block in enf_blocks:
-        if not block.strip():
-            continue
-        id_match = re.search(r'id:\s*["\']([^"\']+)["\']', block)
-        nombre_match = re.search(r'nombre:\s*["\']([^"\']+)["\']', block)
-        
-        if id_match and nombre_match:
-            has_sintomas = 'sintomas:' in block and not re.search(r'sintomas:\s*\[\s*\]', block)
-            has_causas = 'causas:' in block and not re.search(r'causas:\s*\[\s*\]', block)
-            
-            if not has_sintomas:
-                sin_sintomas.append(nombre_match.group(1))
-            if not has_causas:
-                sin_causas.append(nombre_match.group(1))
+    # Una enfermedad sin el campo o con la lista vacía cuenta como faltante
+    sin_sintomas = [e['nombre'] for e in resultado.entidades_con('falta:sintomas', 'vacio:sintomas')]
+    sin_causas = [e['nombre'] for e in resultado.entidades_con('falta:causas', 'vacio:causas')]
     
     print(f"\nEnfermedades sin síntomas ({len(sin_sintomas)}):")
     if sin_sintomas[:10]:
@@ -157,11 +128,21 @@ def check_missing_data():
     }
 
 def main():
+    parser = argparse.ArgumentParser(description='Audita el catálogo de plantas y enfermedades.')
+    parser.add_argument('--json', default=REPORTE_JSON, help='Ruta del reporte JSON por entidad')
+    parser.add_argument('--procesos', type=int, help='Procesos en paralelo (por defecto, uno por CPU)')
+    parser.add_argument('--completa', action='store_true', help='Ignorar el manifiesto y auditar todo de nuevo')
+    args = parser.parse_args()
+
     print("\n🔍 INICIANDO AUDITORÍA COMPLETA DE DATOS\n")
     
-    enf_stats = audit_enfermedades()
-    plantas_stats = audit_plantas()
-    missing_stats = check_missing_data()
+    # Un solo recorrido por registro; los bloques del catálogo se reparten entre procesos
+    # y sólo se re-auditan los registros que cambiaron desde la última ejecución
+    resultados, stats = auditar(procesos=args.procesos, incremental=not args.completa)
+    
+    enf_stats = audit_enfermedades(resultados['enfermedades'])
+    plantas_stats = audit_plantas(resultados['plantas'])
+    missing_stats = check_missing_data(resultados['enfermedades'])
     
     print("\n" + "=" * 60)
     print("RESUMEN DE AUDITORÍA")
@@ -184,5 +165,10 @@ PLANTAS:
 - Con nombres alternativos: {plantas_stats['con_nombres_alt']} ({100*plantas_stats['con_nombres_alt']//max(plantas_stats['total'],1)}%)
 """)
 
+    reporte = {tipo: resultado.to_dict() for tipo, resultado in resultados.items()}
+    write_atomic(args.json, json.dumps(reporte, ensure_ascii=False, indent=2) + '\n')
+    print(f"Reporte por entidad: {args.json}")
+    print(f"Auditoría: {stats}")
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Benchmark del pipeline del catálogo sobre catálogos sintéticos escalados.
+
+Para cada escala (1×, 10×, 100×, 1000× las 693 plantas / 469 enfermedades
+actuales) genera un catálogo sintético replicando las categorías y sistemas
+del almacén con ids nuevos, y ejecuta el script real de cada etapa en un
+proceso aparte con POCIMA_DATOS y POCIMA_TRABAJO apuntando a ese catálogo y
+a sus entradas simuladas, midiendo tiempo y pico de memoria residente:
+
+    extract-plants           extract-plants.py (leer el .ts y deduplicar por categoría)
+    process-plants           process-plants.py con el almacén de plantas vacío (almacén nuevo + .ts)
+    process-remaining-names  process-remaining-names.py (fusionar nombres alternativos y re-emitir)
+    audit-data               audit-data.py --completa
+    audit-data-incremental   audit-data.py sin cambios (sólo manifiesto)
+
+Los resultados se guardan en JSON; con --comparar se muestra la razón contra
+una ejecución anterior para detectar regresiones.
+
+Uso:
+    python3 scripts/benchmark-pipeline.py --escalas 1,10,100
+    python3 scripts/benchmark-pipeline.py --comparar /tmp/pocima-benchmark/anterior.json
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import platform
+import runpy
+import shutil
+import subprocess
+import sys
+import time
+
+from catalogo import CatalogStore, emit, write_atomic
+from catalogo.metricas import pico_memoria_mb
+from catalogo.parser import SCRIPTS_DIR
+from catalogo.store import dump_json
+
+BENCH_DIR = '/tmp/pocima-benchmark'
+ESCALAS = (1, 10, 100, 1000)
+
+# etapa -> (script de scripts/, argumentos, catálogo cuyos registros procesa)
+ETAPAS = {
+    'extract-plants': ('extract-plants.py', [], ('plantas',)),
+    'process-plants': ('process-plants.py', [], ('plantas',)),
+    'process-remaining-names': ('process-remaining-names.py', [], ('plantas',)),
+    'audit-data': ('audit-data.py', ['--completa'], ('plantas', 'enfermedades')),
+    'audit-data-incremental': ('audit-data.py', [], ('plantas', 'enfermedades')),
+}
+
+
+def _rutas(dir_escala):
+    datos = os.path.join(dir_escala, 'datos')
+    trabajo = os.path.join(dir_escala, 'trabajo')
+    return {
+        # POCIMA_DATOS de los scripts: almacén y módulos .ts sintéticos
+        'datos': datos,
+        'catalogo': os.path.join(datos, 'catalogo'),
+        'plantas_ts': os.path.join(datos, 'plantas-expandidas.ts'),
+        'enfermedades_ts': os.path.join(datos, 'enfermedades-expandidas.ts'),
+        # POCIMA_TRABAJO: respuestas simuladas del generador y archivos intermedios
+        'trabajo': trabajo,
+        'generate_plants': os.path.join(trabajo, 'generate_plants_by_category.json'),
+        'generate_names': os.path.join(trabajo, 'generate_remaining_alternative_names.json'),
+    }
+
+
+def _replicar(bloque, clave, k):
+    if k == 0:
+        return bloque
+    copia = dict(bloque, id=f"{bloque['id']}-x{k}")
+    copia[clave] = [dict(r, id=f"{r['id']}-x{k}") for r in bloque[clave]]
+    return copia
+
+
+def generar(escala, dir_escala):
+    """Escribe el almacén sintético, sus .ts y las entradas de las etapas process-*."""
+    rutas = _rutas(dir_escala)
+    shutil.rmtree(dir_escala, ignore_errors=True)
+    os.makedirs(rutas['datos'])
+    os.makedirs(rutas['trabajo'])
+
+    totales = {}
+    for tipo, ts_path in (('plantas', rutas['plantas_ts']), ('enfermedades', rutas['enfermedades_ts'])):
+        origen = CatalogStore(tipo)
+        destino = CatalogStore(tipo, rutas['catalogo'])
+        bloques = list(origen)
+        destino.save_all(_replicar(b, origen.clave, k) for k in range(escala) for b in bloques)
+        totales[tipo] = emit(tipo, destino, ts_path).total
+
+    # Respuesta simulada del generador de plantas: una por categoría
+    store = CatalogStore('plantas', rutas['catalogo'])
+    results = []
+    for bloque in store:
+        categoria = {'categoriaId': bloque['id'], 'categoria': bloque['nombre'], 'plantas': bloque['plantas']}
+        results.append({'input': f"CATEGORIA: {bloque['nombre']}", 'error': None,
+                        'output': {'json_data': json.dumps(categoria, ensure_ascii=False)}})
+    write_atomic(rutas['generate_plants'], json.dumps({'results': results}, ensure_ascii=False))
+
+    # Nombres alternativos simulados para las plantas que no tienen, en grupos de 50
+    sin_nombres = [{'id': p['id'], 'nombresAlternativos': {'Otros': [p['nombre'].lower()]}}
+                   for p in store.registros() if not p.get('nombresAlternativos')]
+    results = [{'input': f'grupo-{i}', 'error': None,
+                'output': {'json_data': json.dumps({'plantas': sin_nombres[i:i + 50]}, ensure_ascii=False)}}
+               for i in range(0, len(sin_nombres), 50)]
+    write_atomic(rutas['generate_names'], json.dumps({'results': results}, ensure_ascii=False))
+    return totales
+
+
+# --- Etapas (cada una se ejecuta en un proceso hijo) ---
+
+def _vaciar_plantas(rutas):
+    """Deja el catálogo de plantas como antes de la primera ejecución de process-plants."""
+    shutil.rmtree(os.path.join(rutas['catalogo'], 'plantas'), ignore_errors=True)
+    with contextlib.suppress(FileNotFoundError):
+        os.remove(rutas['plantas_ts'])
+
+
+def ejecutar_hijo(etapa, dir_escala):
+    """
+    Modo hijo: ejecuta el script de la etapa (POCIMA_DATOS y POCIMA_TRABAJO ya
+    apuntan a la escala) y escribe sus medidas como JSON en stdout.
+    """
+    script, argumentos, _ = ETAPAS[etapa]
+    if etapa == 'process-plants':
+        _vaciar_plantas(_rutas(dir_escala))
+    path = os.path.join(SCRIPTS_DIR, script)
+    sys.argv = [path, *argumentos]
+    inicio = time.perf_counter()
+    # La salida del script no se mide: a escala 1000× son decenas de miles de líneas
+    with open(os.devnull, 'w') as nulo, contextlib.redirect_stdout(nulo):
+        runpy.run_path(path, run_name='__main__')
+    segundos = time.perf_counter() - inicio
+    print(json.dumps({'segundos': segundos, 'pico_mb': pico_memoria_mb()}))
+
+
+def medir(etapa, dir_escala):
+    rutas = _rutas(dir_escala)
+    proceso = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), '--hijo', etapa, '--dir', dir_escala],
+        capture_output=True, text=True,
+        env=dict(os.environ, POCIMA_DATOS=rutas['datos'], POCIMA_TRABAJO=rutas['trabajo']),
+    )
+    if proceso.returncode != 0:
+        error = proceso.stderr.strip().splitlines()[-1:] or [f'código de salida {proceso.returncode}']
+        return {'error': error[0]}
+    return json.loads(proceso.stdout.strip().splitlines()[-1])
+
+
+def comparar(resultados, previo):
+    anteriores = {(r['escala'], r['etapa']): r for r in previo.get('resultados', [])}
+    print("\n--- Comparación con la ejecución anterior (actual / anterior) ---")
+    for r in resultados:
+        a = anteriores.get((r['escala'], r['etapa']))
+        if not a or 'error' in a or 'error' in r:
+            continue
+        razon = r['segundos'] / a['segundos'] if a['segundos'] else float('inf')
+        razon_memoria = r['pico_mb'] / a['pico_mb'] if a['pico_mb'] else float('inf')
+        marca = '  ⚠️ regresión' if razon > 1.25 else ''
+        print(f"  {r['escala']:>5}× {r['etapa']:<25} tiempo ×{razon:.2f}  "
+              f"memoria ×{razon_memoria:.2f}{marca}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--escalas', default=','.join(map(str, ESCALAS)),
+                        help='Factores de escala separados por comas (por defecto 1,10,100,1000)')
+    parser.add_argument('--etapas', default=','.join(ETAPAS), help='Etapas a medir, separadas por comas')
+    parser.add_argument('--dir', default=BENCH_DIR, help='Directorio de trabajo de los catálogos sintéticos')
+    parser.add_argument('--salida', help='JSON de resultados (por defecto <dir>/resultados.json)')
+    parser.add_argument('--comparar', help='JSON de una ejecución anterior')
+    parser.add_argument('--conservar', action='store_true', help='No borrar los catálogos sintéticos')
+    parser.add_argument('--hijo', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.hijo:
+        ejecutar_hijo(args.hijo, args.dir)
+        return
+
+    escalas = [int(e) for e in args.escalas.split(',')]
+    etapas = [e for e in args.etapas.split(',') if e]
+    desconocidas = set(etapas) - set(ETAPAS)
+    if desconocidas:
+        parser.error(f"Etapas desconocidas: {', '.join(sorted(desconocidas))}")
+    salida = args.salida or os.path.join(args.dir, 'resultados.json')
+
+    resultados = []
+    print(f"{'escala':>7} {'etapa':<25} {'registros':>10} {'segundos':>10} {'pico MB':>9}")
+    for escala in escalas:
+        dir_escala = os.path.join(args.dir, f'x{escala}')
+        inicio = time.perf_counter()
+        totales = generar(escala, dir_escala)
+        print(f"{escala:>6}× {'(generar catálogo)':<25} {sum(totales.values()):>10} "
+              f"{time.perf_counter() - inicio:>10.2f}")
+        for etapa in etapas:
+            medida = {'escala': escala, 'etapa': etapa, 'plantas': totales['plantas'],
+                      'enfermedades': totales['enfermedades'],
+                      'registros': sum(totales[tipo] for tipo in ETAPAS[etapa][2]),
+                      **medir(etapa, dir_escala)}
+            resultados.append(medida)
+            if 'error' in medida:
+                print(f"{escala:>6}× {etapa:<25} ✗ {medida['error']}")
+            else:
+                print(f"{escala:>6}× {etapa:<25} {medida['registros']:>10} "
+                      f"{medida['segundos']:>10.3f} {medida['pico_mb']:>9.1f}")
+        if not args.conservar:
+            shutil.rmtree(dir_escala, ignore_errors=True)
+
+    write_atomic(salida, dump_json({
+        'fecha': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'plataforma': platform.platform(),
+        'cpus': os.cpu_count(),
+        'resultados': resultados,
+    }))
+    print(f"\n✓ Resultados guardados en {salida}")
+
+    if args.comparar:
+        with open(args.comparar, 'r', encoding='utf-8') as f:
+            comparar(resultados, json.load(f))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Script para generar data/alias-index.ts: para plantas y enfermedades, la
+forma normalizada de cada alias (id, nombre, nombre científico, otros
+nombres y nombres alternativos) -> la entidad a la que pertenece, con la
+categoría o sistema donde aparece primero. data/alias.ts lo usa para
+resolver las etiquetas [PLANTA:…] / [ENFERMEDAD:…] de MolDoctor con una
+búsqueda en un diccionario (ver scripts/catalogo/alias.py).
+
+Al terminar muestra cuántas formas se indexaron, cuántas quedaron ambiguas y
+cuántas entidades aparecen en más de un bloque.
+"""
+
+import json
+import os
+
+from catalogo import DATA_DIR, write_atomic
+from catalogo.alias import ResolutorAlias, normalizar_alias
+
+OUTPUT_TS = os.path.join(DATA_DIR, 'alias-index.ts')
+
+HEADER = '''// Pócima Salvage - Índice de alias de plantas y enfermedades
+// Generado automáticamente por scripts/build-alias-index.py - no editar a mano
+
+export interface IndiceAlias {
+  // posición -> [id, categoría o sistema donde aparece primero]
+  entidades: [string, string][];
+  // forma normalizada (ver normalizarAlias en data/alias.ts) -> posición en entidades
+  formas: Record<string, number>;
+  // formas que comparten varias entidades con la misma prioridad: no se resuelven
+  ambiguas: string[];
+}
+
+'''
+
+EXPORTS = (('plantas', 'aliasPlantas'), ('enfermedades', 'aliasEnfermedades'))
+
+
+def compact(value):
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':'))
+
+
+def render_indice(variable, resolutor):
+    posiciones = {entidad: i for i, entidad in enumerate(resolutor.ubicaciones)}
+    lines = [f'export const {variable}: IndiceAlias = {{\n', '  entidades: [\n']
+    lines.extend(f'    {compact([entidad, bloques[0]])},\n' for entidad, bloques in resolutor.ubicaciones.items())
+    lines.append('  ],\n')
+    lines.append('  formas: {\n')
+    lines.extend(f'    {compact(forma)}: {posiciones[entidad]},\n'
+                 for forma, entidad in sorted(resolutor.formas.items()))
+    lines.append('  },\n')
+    lines.append(f'  ambiguas: {compact(sorted(resolutor.ambiguas))},\n')
+    lines.append('};\n')
+    return ''.join(lines)
+
+
+def main():
+    partes = [HEADER]
+    for tipo, variable in EXPORTS:
+        resolutor = ResolutorAlias(tipo)
+        partes.append(render_indice(variable, resolutor))
+        partes.append('\n')
+        ids_sin_forma = sum(1 for e in resolutor.ubicaciones if resolutor.formas.get(normalizar_alias(e)) != e)
+        en_varios = sum(1 for bloques in resolutor.ubicaciones.values() if len(bloques) > 1)
+        print(f"✓ {tipo}: {len(resolutor.ubicaciones)} entidades, {len(resolutor)} formas, "
+              f"{len(resolutor.ambiguas)} ambiguas, {en_varios} en más de un bloque"
+              + (f", {ids_sin_forma} ids sólo por coincidencia exacta" if ids_sin_forma else ''))
+
+    content = ''.join(partes).rstrip('\n') + '\n'
+    write_atomic(OUTPUT_TS, content)
+    print(f"✓ Índice generado: {OUTPUT_TS} ({len(content.encode('utf-8')) / 1024:.1f} KB)")
+
+
+if __name__ == "__main__":
+    main()
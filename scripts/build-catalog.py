@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Script para regenerar plantas-expandidas.ts y enfermedades-expandidas.ts
+desde el almacén JSON canónico (data/catalogo/).
+
+Uso:
+    python3 scripts/build-catalog.py                 # emisión incremental
+    python3 scripts/build-catalog.py --full          # renderiza todos los bloques
+    python3 scripts/build-catalog.py --import-ts     # inicializa el almacén desde los .ts
+    python3 scripts/build-catalog.py --chunks        # además, un módulo por bloque (data/chunks/)
+
+Una vez creados, los chunks se actualizan en cada emisión (también desde los
+scripts process-*); --sin-chunks los omite en esta ejecución.
+"""
+
+import argparse
+import time
+
+from catalogo.emitter import emit
+from catalogo.store import TIPOS, import_from_ts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--tipo', choices=sorted(TIPOS), action='append',
+                        help='Catálogo a procesar (por defecto ambos)')
+    parser.add_argument('--full', action='store_true', help='Ignorar hashes y renderizar todo')
+    parser.add_argument('--import-ts', action='store_true',
+                        help='Crear/actualizar el almacén JSON a partir de los .ts actuales')
+    chunks = parser.add_mutually_exclusive_group()
+    chunks.add_argument('--chunks', action='store_true', default=None,
+                        help='Escribir un módulo por categoría/sistema y su índice para carga diferida')
+    chunks.add_argument('--sin-chunks', dest='chunks', action='store_false', help='No escribir los chunks')
+    args = parser.parse_args()
+
+    for tipo in args.tipo or ['plantas', 'enfermedades']:
+        inicio = time.perf_counter()
+        if args.import_ts:
+            changed = import_from_ts(tipo)
+            print(f"✓ {tipo}: {len(changed)} bloques importados al almacén")
+            continue
+        result = emit(tipo, full=args.full, chunks=args.chunks)
+        ms = (time.perf_counter() - inicio) * 1000
+        estado = "actualizado" if result.written else "sin cambios"
+        print(f"✓ {tipo}: {result.total} registros, {len(result.rendered)} bloques re-emitidos, "
+              f"{len(result.reused)} reutilizados ({estado}, {ms:.1f} ms)")
+        if result.chunks:
+            print(f"    {result.chunks} archivos de chunks actualizados")
+        for bloque_id in result.rendered:
+            print(f"    - {bloque_id}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Script para generar data/plantas-compacto.ts y data/enfermedades-compacto.ts:
+el catálogo con tabla de cadenas internadas y referencias por índice,
+cargado con JSON.parse (ver scripts/catalogo/compacto.py y data/compacto.ts).
+
+Verifica que el payload se decodifica exactamente al almacén y muestra el
+ahorro de bytes (sin comprimir y con gzip) frente al literal de
+plantas-expandidas.ts / enfermedades-expandidas.ts. Si hay `node` en el PATH,
+mide también el tiempo de evaluar el literal frente a JSON.parse + decodificar.
+
+Una vez creados, los módulos compactos se actualizan en cada emisión del
+catálogo (build-catalog.py y los scripts process-*).
+
+Uso:
+    python3 scripts/build-compact-catalog.py
+    python3 scripts/build-compact-catalog.py --sin-node
+"""
+
+import argparse
+import gzip
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+
+from catalogo import ENFERMEDADES_TS, PLANTAS_TS, CatalogStore
+from catalogo.compacto import codificar, decodificar, emit_compacto
+from catalogo.parser import read_text
+
+# Evalúa el literal y el payload compacto en node; el decodificador es el de
+# data/compacto.ts sin tipos.
+BENCHMARK_JS = r'''
+const fs = require('fs');
+const [literal, payload, repeticiones] = [fs.readFileSync(process.argv[1], 'utf8'),
+                                          fs.readFileSync(process.argv[2], 'utf8'), +process.argv[3]];
+const decodificar = (json) => {
+  const d = JSON.parse(json);
+  const valor = (t, v) => {
+    if (t === 's') return d.cadenas[v];
+    if (t === 'l') return v.map(i => d.cadenas[i]);
+    if (t === 'm') {
+      const r = {};
+      for (let i = 0; i < v.length; i += 2) r[d.cadenas[v[i]]] = v[i + 1].map(j => d.cadenas[j]);
+      return r;
+    }
+    return v.map(c => typeof c === 'number' ? d.cadenas[c] : { tipo: d.cadenas[c[0]], descripcion: d.cadenas[c[1]] });
+  };
+  return d.bloques.map(b => b[b.length - 1].map(fila => {
+    const r = {};
+    fila.forEach((v, i) => { if (v !== null) r[d.campos[i][0]] = valor(d.campos[i][1], v); });
+    return r;
+  }));
+};
+const medir = (fn) => {
+  const tiempos = [];
+  for (let i = 0; i < repeticiones; i++) {
+    const inicio = process.hrtime.bigint();
+    fn(i);
+    tiempos.push(Number(process.hrtime.bigint() - inicio) / 1e6);
+  }
+  tiempos.sort((a, b) => a - b);
+  return tiempos[Math.floor(tiempos.length / 2)];
+};
+// El comentario distinto en cada repetición evita la caché de compilación de V8
+console.log(JSON.stringify({
+  literal: medir(i => new Function('return ' + literal + '\n//' + i)()),
+  json_parse: medir(() => JSON.parse(payload)),
+  compacto: medir(() => decodificar(payload)),
+}));
+'''
+
+
+def literal_de(ts_path):
+    """El array literal del módulo (desde '[' de la declaración hasta su ']')."""
+    texto = read_text(ts_path)
+    inicio = texto.index('[\n', texto.index('export const '))
+    fin = texto.index('\n];\n', inicio)
+    return texto[inicio:fin + 2]
+
+
+def tamanos(texto):
+    datos = texto.encode('utf-8')
+    return len(datos), len(gzip.compress(datos, 9))
+
+
+def medir_node(literal, payload, repeticiones):
+    with tempfile.TemporaryDirectory() as tmp:
+        rutas = []
+        for nombre, contenido in (('literal.js', literal), ('payload.json', payload)):
+            ruta = os.path.join(tmp, nombre)
+            with open(ruta, 'w', encoding='utf-8') as f:
+                f.write(contenido)
+            rutas.append(ruta)
+        proceso = subprocess.run(['node', '-e', BENCHMARK_JS, *rutas, str(repeticiones)],
+                                 capture_output=True, text=True)
+    if proceso.returncode != 0:
+        print(f"  ⚠️ node falló: {proceso.stderr.strip().splitlines()[-1:]}")
+        return None
+    return json.loads(proceso.stdout)
+
+
+def kb(n):
+    return f"{n / 1024:.1f} KB"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sin-node', action='store_true', help='No medir el tiempo de parseo con node')
+    parser.add_argument('--repeticiones', type=int, default=15)
+    args = parser.parse_args()
+    usar_node = not args.sin_node and shutil.which('node')
+
+    for tipo, ts_path in (('plantas', PLANTAS_TS), ('enfermedades', ENFERMEDADES_TS)):
+        store = CatalogStore(tipo)
+        bloques = list(store)
+        datos = codificar(tipo, bloques)
+        if decodificar(tipo, datos) != bloques:
+            raise SystemExit(f"❌ {tipo}: el payload compacto no reproduce el almacén")
+
+        path, payload, escrito = emit_compacto(tipo, store, ts_path)
+        estado = "actualizado" if escrito else "sin cambios"
+        print(f"✓ {tipo}: {os.path.relpath(path)} ({estado}), "
+              f"{len(datos['cadenas'])} cadenas distintas")
+
+        literal = literal_de(ts_path)
+        lit_bytes, lit_gz = tamanos(literal)
+        mod_bytes, mod_gz = tamanos(read_text(path))
+        print(f"    literal: {kb(lit_bytes)} ({kb(lit_gz)} gzip)  ->  compacto: {kb(mod_bytes)} "
+              f"({kb(mod_gz)} gzip), {(1 - mod_bytes / lit_bytes) * 100:.0f}% menos "
+              f"({(1 - mod_gz / lit_gz) * 100:.0f}% con gzip)")
+
+        if usar_node:
+            tiempos = medir_node(literal, payload, args.repeticiones)
+            if tiempos:
+                print(f"    parseo (mediana de {args.repeticiones}): literal {tiempos['literal']:.1f} ms, "
+                      f"JSON.parse {tiempos['json_parse']:.1f} ms, "
+                      f"JSON.parse + decodificar {tiempos['compacto']:.1f} ms "
+                      f"(×{tiempos['literal'] / tiempos['compacto']:.1f})")
+
+
+if __name__ == "__main__":
+    main()
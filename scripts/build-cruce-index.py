@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Script para precalcular el cruce enfermedades ↔ plantas y generar
+data/cruce-index.ts, que la app lee en lugar de recorrer el catálogo
+en cada pantalla de detalle.
+
+Las plantas de cada enfermedad son las k mejores según el ranking BM25 de
+scripts/catalogo/ranking.py (con NumPy si está instalado), con su puntuación.
+"""
+
+import json
+import os
+import time
+
+from catalogo import (DATA_DIR, ENFERMEDADES_TS, PLANTAS_TS, iter_enfermedades, iter_plantas, metricas,
+                      write_atomic)
+from catalogo.cruce import Cruce, cargar_mapeo
+from catalogo.parser import huella_catalogo, read_text
+from catalogo.propiedades import Vocabulario
+from catalogo.ranking import RankingPlantas
+
+OUTPUT_TS = os.path.join(DATA_DIR, 'cruce-index.ts')
+
+HEADER = '''// Pócima Salvage - Índice precalculado del cruce enfermedades ↔ plantas
+// Generado automáticamente por scripts/build-cruce-index.py - no editar a mano
+
+export interface CruceIndex {
+  totalPlantas: number;
+  totalEnfermedades: number;
+  // Huellas de plantas-expandidas.ts y enfermedades-expandidas.ts al generar el índice:
+  // si no coinciden con las actuales, las posiciones ya no valen
+  huellaPlantas: string;
+  huellaEnfermedades: string;
+  // "sistemaId/id" -> [posición en getAllPlantas(), índices de planta.propiedades del motivo,
+  //                   puntuación BM25][], de mayor a menor puntuación
+  plantasPorEnfermedad: Record<string, [number, number[], number][]>;
+  // "categoriaId/id" -> posiciones en getAllEnfermedades()
+  enfermedadesPorPlanta: Record<string, number[]>;
+}
+
+'''
+
+
+def compact(value):
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':'))
+
+
+def render_index(cruce, ranking, huellas):
+    plantas, enfermedades = cruce.plantas, cruce.enfermedades
+    lines = [HEADER, 'export const cruceIndex: CruceIndex = {\n']
+    lines.append(f'  totalPlantas: {len(plantas)},\n')
+    lines.append(f'  totalEnfermedades: {len(enfermedades)},\n')
+    lines.append(f"  huellaPlantas: {compact(huellas['plantas'])},\n")
+    lines.append(f"  huellaEnfermedades: {compact(huellas['enfermedades'])},\n")
+    lines.append('  plantasPorEnfermedad: {\n')
+    for e, enfermedad in enumerate(enfermedades):
+        pares = [[p, ranking.motivo(p, e), puntuacion] for p, puntuacion in ranking.top(e)]
+        lines.append(f'    {compact(enfermedad.sistemaId + "/" + enfermedad.id)}: {compact(pares)},\n')
+    lines.append('  },\n')
+    lines.append('  enfermedadesPorPlanta: {\n')
+    for p, planta in enumerate(plantas):
+        clave = compact(planta.categoriaId + '/' + planta.id)
+        lines.append(f'    {clave}: {compact(cruce.enfermedades_para_planta(p))},\n')
+    lines.append('  },\n')
+    lines.append('};\n')
+    return ''.join(lines)
+
+
+def main():
+    inicio = time.perf_counter()
+    texto_plantas = read_text(PLANTAS_TS)
+    texto_enfermedades = read_text(ENFERMEDADES_TS)
+    huellas = {'plantas': huella_catalogo(texto_plantas), 'enfermedades': huella_catalogo(texto_enfermedades)}
+    plantas = list(iter_plantas(text=texto_plantas))
+    enfermedades = list(iter_enfermedades(text=texto_enfermedades))
+    vocabulario = Vocabulario.cargar()
+    # Los términos nuevos reciben en memoria los mismos ids que les daría build-property-vocabulary.py
+    nuevas = vocabulario.actualizar(prop for planta in plantas for prop in planta.propiedades)
+    with metricas.fase('cruce', len(plantas) + len(enfermedades)):
+        cruce = Cruce(plantas, enfermedades, cargar_mapeo(), vocabulario)
+    inicio_ranking = time.perf_counter()
+    with metricas.fase('ranking-bm25', len(enfermedades)):
+        ranking = RankingPlantas(cruce)
+    ms_ranking = (time.perf_counter() - inicio_ranking) * 1000
+    with metricas.fase('render', len(enfermedades) + len(plantas)):
+        content = render_index(cruce, ranking, huellas)
+    ms = (time.perf_counter() - inicio) * 1000
+
+    write_atomic(OUTPUT_TS, content)
+
+    print(f"✓ Cruce calculado para {len(enfermedades)} enfermedades y {len(plantas)} plantas ({ms:.0f} ms)")
+    print(f"✓ Ranking BM25 {len(enfermedades)}x{len(plantas)} ({'NumPy' if ranking.usar_numpy else 'Python'}, "
+          f"{ms_ranking:.0f} ms)")
+    print(f"✓ Índice generado: {OUTPUT_TS} ({len(content.encode('utf-8')) / 1024:.1f} KB)")
+    if nuevas:
+        print(f"⚠️ {len(nuevas)} propiedades nuevas fuera del vocabulario; "
+              f"ejecuta scripts/build-property-vocabulary.py")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Script para normalizar las propiedades de las plantas en un vocabulario
+canónico con ids estables (data/catalogo/propiedades.json) y generar
+data/propiedades-index.ts: el bitset de términos de cada planta y, para cada
+keyword de enfermedadToPropiedades, el bitset de los términos que la
+satisfacen. cruce-datos.ts lo usa para que comprobar si una planta sirve
+para una enfermedad sea un AND en lugar de un doble recorrido de strings.
+
+Al terminar muestra cuántos textos distintos se unificaron, cuántos pares
+planta-keyword coinciden ahora frente a la comparación por substring y el
+tiempo de ambas comparaciones.
+
+Después de ejecutarlo conviene regenerar data/cruce-index.ts
+(scripts/build-cruce-index.py), que usa el mismo vocabulario.
+"""
+
+import json
+import os
+import time
+
+from catalogo import DATA_DIR, PLANTAS_TS, iter_plantas, write_atomic
+from catalogo.cruce import cargar_mapeo
+from catalogo.parser import huella_catalogo, read_text
+from catalogo.propiedades import Vocabulario, bits_a_palabras
+
+OUTPUT_TS = os.path.join(DATA_DIR, 'propiedades-index.ts')
+
+HEADER = '''// Pócima Salvage - Vocabulario canónico de propiedades y bitsets por planta
+// Generado automáticamente por scripts/build-property-vocabulary.py - no editar a mano
+
+export interface IndicePropiedades {
+  // Número de plantas indexadas
+  totalPlantas: number;
+  // Huella de plantas-expandidas.ts al generar el índice (para detectar un índice desactualizado)
+  huellaPlantas: string;
+  // id estable del término -> forma canónica
+  vocabulario: string[];
+  // posición en getAllPlantas() -> id del término de cada propiedad (-1 si no tiene), en orden
+  terminos: number[][];
+  // posición en getAllPlantas() -> bitset de sus términos (palabras de 32 bits)
+  plantas: number[][];
+  // keyword de enfermedadToPropiedades -> bitset de los términos que satisfacen sus propiedades
+  requisitos: Record<string, number[]>;
+}
+
+'''
+
+
+def compact(value):
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':'))
+
+
+def render_index(vocabulario, terminos, bits_plantas, requisitos, huella):
+    lines = [HEADER, 'export const indicePropiedades: IndicePropiedades = {\n']
+    lines.append(f'  totalPlantas: {len(terminos)},\n')
+    lines.append(f'  huellaPlantas: {compact(huella)},\n')
+    lines.append(f"  vocabulario: {compact([t['forma'] for t in vocabulario.terminos])},\n")
+    lines.append('  terminos: [\n')
+    lines.extend(f'    {compact([-1 if t is None else t for t in ids])},\n' for ids in terminos)
+    lines.append('  ],\n')
+    lines.append('  plantas: [\n')
+    lines.extend(f'    {compact(bits_a_palabras(bits))},\n' for bits in bits_plantas)
+    lines.append('  ],\n')
+    lines.append('  requisitos: {\n')
+    lines.extend(f'    {compact(kw)}: {compact(bits_a_palabras(bits))},\n' for kw, bits in requisitos.items())
+    lines.append('  },\n')
+    lines.append('};\n')
+    return ''.join(lines)
+
+
+def coincide_substring(req, prop):
+    # Comparación anterior de cruce-datos.ts, sólo para el informe
+    req = req.lower()
+    prop = prop.lower()
+    return req in prop or prop in req
+
+
+def main():
+    texto = read_text(PLANTAS_TS)
+    huella = huella_catalogo(texto)
+    plantas = list(iter_plantas(text=texto))
+    mapeo = cargar_mapeo()
+    textos = [prop for planta in plantas for prop in planta.propiedades]
+
+    vocabulario = Vocabulario.cargar()
+    previos = len(vocabulario)
+    nuevas = vocabulario.actualizar(textos)
+    vocabulario.guardar()
+
+    terminos = [[vocabulario.id_de(p) for p in planta.propiedades] for planta in plantas]
+    bits_plantas = [sum(1 << i for i in set(ids) if i is not None) for ids in terminos]
+    requisitos = {kw: vocabulario.requisitos(props) for kw, props in mapeo}
+    content = render_index(vocabulario, terminos, bits_plantas, requisitos, huella)
+    write_atomic(OUTPUT_TS, content)
+
+    en_uso = sum(1 for t in vocabulario.terminos if t['usos'])
+    print(f"✓ {len(set(textos))} textos de propiedad distintos -> {en_uso} términos canónicos "
+          f"({len(vocabulario)} en el vocabulario, {len(nuevas)} nuevos, {previos} previos)")
+    print(f"✓ Índice generado: {OUTPUT_TS} ({len(content.encode('utf-8')) / 1024:.1f} KB)")
+
+    inicio = time.perf_counter()
+    pares_substring = sum(
+        1 for planta in plantas for _, props in mapeo
+        if any(coincide_substring(req, prop) for req in props for prop in planta.propiedades)
+    )
+    ms_substring = (time.perf_counter() - inicio) * 1000
+    inicio = time.perf_counter()
+    pares_bits = sum(1 for bits in bits_plantas for req in requisitos.values() if bits & req)
+    ms_bits = (time.perf_counter() - inicio) * 1000
+    print(f"✓ Pares planta-keyword que coinciden: {pares_substring} por substring -> {pares_bits} normalizados")
+    print(f"✓ Comparación de {len(plantas)} plantas × {len(mapeo)} keywords: "
+          f"substring {ms_substring:.1f} ms, bitset {ms_bits:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
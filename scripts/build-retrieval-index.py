@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Script para generar data/recuperacion-index.ts: el índice BM25 de fichas de
+plantas y enfermedades que server/recuperacion.ts consulta en cada mensaje de
+MolDoctor para meter en el prompt sólo lo relevante del catálogo (ver
+scripts/catalogo/recuperacion.py).
+
+Uso:
+    python3 scripts/build-retrieval-index.py
+    python3 scripts/build-retrieval-index.py --consulta "tengo tos con flemas y fiebre"
+
+La evaluación (tokens ahorrados, latencia, cobertura) está en
+scripts/eval-retrieval.py.
+"""
+
+import argparse
+import json
+import os
+import time
+
+from catalogo import DATA_DIR, metricas, write_atomic
+from catalogo import recuperacion as r
+from catalogo.texto import CARACTERES_POR_TOKEN, estimar_tokens
+
+OUTPUT_TS = os.path.join(DATA_DIR, 'recuperacion-index.ts')
+
+HEADER = '''// Pócima Salvage - Índice de recuperación de fichas del catálogo para MolDoctor
+// Generado automáticamente por scripts/build-retrieval-index.py - no editar a mano
+
+export interface IndiceRecuperacion {
+  parametros: {
+    presupuesto: number;
+    maxPlantas: number;
+    maxEnfermedades: number;
+    umbralRelativo: number;
+    pesoRanking: number;
+    caracteresPorToken: number;
+    tokensCabeceras: number;
+  };
+  // cabecera de cada sección del contexto, por tipo
+  cabeceras: Record<'p' | 'e', string>;
+  // palabras vacías y de conversación que no cuentan en una consulta
+  vacias: string[];
+  // posición -> [tipo ('p' planta, 'e' enfermedad), id, categoría o sistema, ficha, tokens de la ficha]
+  documentos: ['p' | 'e', string, string, string, number][];
+  // término -> [posición, peso BM25 en centésimas, posición, peso, ...]
+  terminos: Record<string, number[]>;
+  // posición de enfermedad -> posiciones de sus plantas recomendadas por el ranking
+  recomendadas: Record<number, number[]>;
+}
+
+'''
+
+
+def compact(value):
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':'))
+
+
+def render_index(indice):
+    parametros = {
+        'presupuesto': r.PRESUPUESTO_TOKENS,
+        'maxPlantas': r.MAX_PLANTAS,
+        'maxEnfermedades': r.MAX_ENFERMEDADES,
+        'umbralRelativo': r.UMBRAL_RELATIVO,
+        'pesoRanking': r.PESO_RANKING,
+        'caracteresPorToken': CARACTERES_POR_TOKEN,
+        'tokensCabeceras': r.TOKENS_CABECERAS,
+    }
+    lines = [HEADER, 'export const indiceRecuperacion: IndiceRecuperacion = {\n']
+    lines.append(f'  parametros: {compact(parametros)},\n')
+    lines.append(f'  cabeceras: {compact(r.CABECERAS)},\n')
+    lines.append(f'  vacias: {compact(sorted(r.VACIAS | r.CONVERSACION))},\n')
+    lines.append('  documentos: [\n')
+    lines.extend(f'    {compact(list(documento))},\n' for documento in indice.documentos)
+    lines.append('  ],\n')
+    lines.append('  terminos: {\n')
+    for termino, postings in sorted(indice.postings.items()):
+        lines.append(f'    {compact(termino)}: {compact([x for par in postings for x in par])},\n')
+    lines.append('  },\n')
+    lines.append('  recomendadas: {\n')
+    lines.extend(f'    {d}: {compact(plantas)},\n' for d, plantas in indice.recomendadas.items() if plantas)
+    lines.append('  },\n')
+    lines.append('};\n')
+    return ''.join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--consulta', help='Sólo mostrar el contexto que se recuperaría para este mensaje')
+    args = parser.parse_args()
+
+    inicio = time.perf_counter()
+    with metricas.fase('indexar') as medida:
+        indice = r.IndiceRecuperacion(recomendadas=r.recomendadas_por_ranking())
+        medida.registros = len(indice)
+    ms = (time.perf_counter() - inicio) * 1000
+
+    if args.consulta:
+        inicio = time.perf_counter()
+        elegidos = indice.consultar(args.consulta)
+        us = (time.perf_counter() - inicio) * 1e6
+        contexto = indice.contexto(elegidos)
+        print(f"✓ {len(elegidos)} fichas, ~{estimar_tokens(contexto)} tokens ({us:.0f} µs)\n")
+        print(contexto)
+        return
+
+    content = render_index(indice)
+    write_atomic(OUTPUT_TS, content)
+    tipos = [d[0] for d in indice.documentos]
+    print(f"✓ {tipos.count(r.PLANTA)} plantas y {tipos.count(r.ENFERMEDAD)} enfermedades, "
+          f"{len(indice.postings)} términos ({ms:.0f} ms)")
+    print(f"✓ Índice generado: {OUTPUT_TS} ({len(content.encode('utf-8')) / 1024:.1f} KB)")
+
+
+if __name__ == "__main__":
+    main()
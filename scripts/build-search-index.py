@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Script para generar data/busqueda-index.ts: índice de trigramas con plegado
+de acentos y textos ya normalizados para buscarPlantasExpandidas y
+buscarEnfermedadesExpandidas.
+
+Al terminar muestra el tamaño del índice y compara el tiempo de consulta
+contra el filtro lineal actual (toLowerCase().includes() sobre cada campo).
+"""
+
+import json
+import os
+import time
+
+from catalogo import (DATA_DIR, ENFERMEDADES_TS, PLANTAS_TS, iter_enfermedades, iter_plantas, metricas,
+                      write_atomic)
+from catalogo.busqueda import CAMPOS, IndiceBusqueda, delta_base36, tabla_plegado, texto_campo
+from catalogo.parser import huella_catalogo, read_text
+
+OUTPUT_TS = os.path.join(DATA_DIR, 'busqueda-index.ts')
+
+CONSULTAS = ['manzanilla', 'digestiva', 'antiinflamatoria', 'dolor de cabeza', 'asma',
+             'inflamación', 'te', 'piel', 'xyznonexistent']
+
+HEADER = '''// Pócima Salvage - Índice de búsqueda por trigramas
+// Generado automáticamente por scripts/build-search-index.py - no editar a mano
+
+export interface IndiceBusqueda {
+  // Número de registros indexados
+  total: number;
+  // Huella del módulo del catálogo al generar el índice (para detectar un índice desactualizado)
+  huella: string;
+  campos: string[];
+  pesos: number[];
+  // Textos de cada registro ya en minúsculas y sin acentos, en el orden de `campos`
+  normalizados: string[][];
+  // trigrama -> posiciones crecientes, codificadas como diferencias en base 36
+  trigramas: Record<string, string>;
+}
+
+'''
+
+
+def compact(value):
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':'))
+
+
+def render_indice(nombre, indice, huella):
+    lines = [f'export const {nombre}: IndiceBusqueda = {{\n']
+    lines.append(f'  total: {len(indice.normalizados)},\n')
+    lines.append(f'  huella: {compact(huella)},\n')
+    lines.append(f'  campos: {compact([c for c, _ in indice.campos])},\n')
+    lines.append(f'  pesos: {compact([p for _, p in indice.campos])},\n')
+    lines.append('  normalizados: [\n')
+    lines.extend(f'    {compact(textos)},\n' for textos in indice.normalizados)
+    lines.append('  ],\n')
+    lines.append('  trigramas: {\n')
+    for tri in sorted(indice.postings):
+        lines.append(f'    {compact(tri)}: {compact(delta_base36(indice.postings[tri]))},\n')
+    lines.append('  },\n')
+    lines.append('};\n')
+    return ''.join(lines)
+
+
+def buscar_lineal(tipo, registros, query):
+    """Réplica del filtro actual de los módulos .ts, para comparar tiempos."""
+    q = query.lower()
+    resultado = []
+    for r in registros:
+        for campo, _ in CAMPOS[tipo]:
+            valor = getattr(r, campo)
+            textos = valor if isinstance(valor, list) else [valor]
+            if any(q in t.lower() for t in textos):
+                resultado.append(r)
+                break
+    return resultado
+
+
+def medir(fn, repeticiones=20):
+    inicio = time.perf_counter()
+    for _ in range(repeticiones):
+        fn()
+    return (time.perf_counter() - inicio) / repeticiones * 1e6
+
+
+def benchmark(tipo, registros, indice):
+    print(f"\n--- Consultas sobre {tipo} (µs por consulta) ---")
+    print(f"  {'consulta':<20} {'lineal':>10} {'índice':>10} {'resultados':>11}")
+    for q in CONSULTAS:
+        lineal = medir(lambda: buscar_lineal(tipo, registros, q))
+        indexado = medir(lambda: indice.buscar(q))
+        print(f"  {q:<20} {lineal:>10.0f} {indexado:>10.0f} {len(indice.buscar(q)):>11}")
+
+
+def main():
+    inicio = time.perf_counter()
+    texto_plantas = read_text(PLANTAS_TS)
+    texto_enfermedades = read_text(ENFERMEDADES_TS)
+    huellas = {'plantas': huella_catalogo(texto_plantas), 'enfermedades': huella_catalogo(texto_enfermedades)}
+    plantas = list(iter_plantas(text=texto_plantas))
+    enfermedades = list(iter_enfermedades(text=texto_enfermedades))
+
+    textos = (texto_campo(getattr(r, c)) for r in plantas for c, _ in CAMPOS['plantas'])
+    tabla = tabla_plegado([*textos, *(texto_campo(getattr(e, c)) for e in enfermedades
+                                     for c, _ in CAMPOS['enfermedades'])])
+
+    with metricas.fase('indexar', len(plantas) + len(enfermedades)):
+        indices = {
+            'plantas': IndiceBusqueda('plantas', plantas, tabla),
+            'enfermedades': IndiceBusqueda('enfermedades', enfermedades, tabla),
+        }
+    content = ''.join([
+        HEADER,
+        f'// carácter -> carácter plegado (minúscula sin acento)\n'
+        f'export const plegadoAcentos: Record<string, string> = {compact(tabla)};\n\n',
+        render_indice('indiceBusquedaPlantas', indices['plantas'], huellas['plantas']),
+        '\n',
+        render_indice('indiceBusquedaEnfermedades', indices['enfermedades'], huellas['enfermedades']),
+    ])
+    ms = (time.perf_counter() - inicio) * 1000
+    write_atomic(OUTPUT_TS, content)
+
+    print(f"✓ Índice generado: {OUTPUT_TS} ({len(content.encode('utf-8')) / 1024:.1f} KB, {ms:.0f} ms)")
+    for tipo, indice in indices.items():
+        entradas = sum(len(p) for p in indice.postings.values())
+        print(f"  {tipo}: {len(indice.normalizados)} registros, {len(indice.postings)} trigramas, "
+              f"{entradas} entradas en listas de posiciones")
+
+    with metricas.fase('benchmark-consultas', 2 * len(CONSULTAS)):
+        benchmark('plantas', plantas, indices['plantas'])
+        benchmark('enfermedades', enfermedades, indices['enfermedades'])
+
+
+if __name__ == "__main__":
+    main()
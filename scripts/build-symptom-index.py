@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Script para generar data/sintomas-index.ts: el índice invertido término de
+síntoma -> enfermedades con pesos precalculados que usa data/sintomas.ts para
+el comprobador de síntomas (ver scripts/catalogo/sintomas.py).
+
+Uso:
+    python3 scripts/build-symptom-index.py
+    python3 scripts/build-symptom-index.py --consulta "fiebre" "tos" "dolor de garganta"
+"""
+
+import argparse
+import json
+import os
+import time
+
+from catalogo import DATA_DIR, write_atomic
+from catalogo.sintomas import IndiceSintomas
+from catalogo.texto import VACIAS
+
+OUTPUT_TS = os.path.join(DATA_DIR, 'sintomas-index.ts')
+
+HEADER = '''// Pócima Salvage - Índice invertido de síntomas
+// Generado automáticamente por scripts/build-symptom-index.py - no editar a mano
+
+export interface IndiceSintomas {
+  // posición -> [id, sistema donde aparece primero]
+  enfermedades: [string, string][];
+  // palabras que no forman término (ver terminosSintoma en data/sintomas.ts)
+  vacias: string[];
+  // término -> [posición, peso en centésimas, posición, peso, ...] por posición creciente
+  terminos: Record<string, number[]>;
+}
+
+'''
+
+
+def compact(value):
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':'))
+
+
+def render_index(indice):
+    lines = [HEADER, 'export const indiceSintomas: IndiceSintomas = {\n', '  enfermedades: [\n']
+    lines.extend(f'    {compact(list(entidad))},\n' for entidad in indice.entidades)
+    lines.append('  ],\n')
+    lines.append(f'  vacias: {compact(sorted(VACIAS))},\n')
+    lines.append('  terminos: {\n')
+    for termino, postings in sorted(indice.postings.items()):
+        lines.append(f'    {compact(termino)}: {compact([x for par in postings for x in par])},\n')
+    lines.append('  },\n')
+    lines.append('};\n')
+    return ''.join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--consulta', nargs='+', metavar='SINTOMA',
+                        help='Sólo consultar el índice con estos síntomas (no genera el archivo)')
+    parser.add_argument('--limite', type=int, default=10, help='Resultados de la consulta')
+    args = parser.parse_args()
+
+    inicio = time.perf_counter()
+    indice = IndiceSintomas()
+    ms = (time.perf_counter() - inicio) * 1000
+
+    if args.consulta:
+        inicio = time.perf_counter()
+        resultados = indice.consultar(args.consulta, args.limite)
+        us = (time.perf_counter() - inicio) * 1e6
+        print(f"✓ {len(resultados)} enfermedades para {len(args.consulta)} síntomas ({us:.0f} µs)")
+        for posicion, puntuacion, cubiertos in resultados:
+            id_, sistema = indice.entidades[posicion]
+            print(f"    {puntuacion:7.2f}  {cubiertos}/{len(args.consulta)}  {id_} ({sistema})")
+        return
+
+    content = render_index(indice)
+    write_atomic(OUTPUT_TS, content)
+    postings = sum(len(p) for p in indice.postings.values())
+    sin_sintomas = sum(1 for id_, _ in indice.entidades if not indice.sintomas[id_])
+    print(f"✓ {len(indice.entidades)} enfermedades, {len(indice)} términos, {postings} entradas ({ms:.0f} ms)"
+          + (f", {sin_sintomas} sin síntomas" if sin_sintomas else ''))
+    print(f"✓ Índice generado: {OUTPUT_TS} ({len(content.encode('utf-8')) / 1024:.1f} KB)")
+
+
+if __name__ == "__main__":
+    main()
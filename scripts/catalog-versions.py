@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Script para mantener el historial de versiones del catálogo
+(data/versiones/, ver scripts/catalogo/versiones.py).
+
+Uso:
+    python3 scripts/catalog-versions.py registrar      # crea el historial o registra el estado actual
+    python3 scripts/catalog-versions.py compactar      # la versión actual pasa a ser la base
+    python3 scripts/catalog-versions.py estado         # versión actual, base, cadena y rutas
+    python3 scripts/catalog-versions.py ruta 3         # archivos para pasar de la versión 3 a la actual
+
+Una vez creado el historial, cada emisión que cambia el catálogo registra
+una versión nueva automáticamente.
+"""
+
+import argparse
+
+from catalogo.store import TIPOS
+from catalogo.versiones import Versiones
+
+
+def kb(n):
+    return f"{n / 1024:.1f} KB"
+
+
+def estado(versiones):
+    m = versiones.manifiesto
+    cadena = versiones.cadena()
+    print(f"✓ {versiones.tipo}: versión {m['actual']}, base {m['base']['version']} ({kb(m['base']['bytes'])}), "
+          f"{len(cadena)} deltas encadenados ({kb(sum(d['bytes'] for d in cadena))}), "
+          f"{len(m['deltas'])} deltas en total")
+    for version, archivos in m['rutas'].items():
+        print(f"    {version:>4} -> {m['actual']}: {' + '.join(archivos)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('accion', choices=('registrar', 'compactar', 'estado', 'ruta'))
+    parser.add_argument('version', nargs='?', type=int, help='Versión del cliente (para ruta)')
+    parser.add_argument('--tipo', choices=sorted(TIPOS), action='append',
+                        help='Catálogo a procesar (por defecto ambos)')
+    args = parser.parse_args()
+    if args.accion == 'ruta' and args.version is None:
+        parser.error('ruta necesita la versión del cliente')
+
+    for tipo in args.tipo or ['plantas', 'enfermedades']:
+        versiones = Versiones(tipo)
+        if args.accion == 'registrar':
+            version, creada = versiones.registrar()
+            print(f"✓ {tipo}: versión {version}" + ("" if creada else " (sin cambios)"))
+        elif not versiones.existe():
+            print(f"⚠️ {tipo}: no hay historial; créalo con 'registrar'")
+        elif args.accion == 'compactar':
+            versiones.compactar()
+            estado(versiones)
+        elif args.accion == 'estado':
+            estado(versiones)
+        else:
+            archivos = versiones.ruta(args.version)
+            print(f"✓ {tipo}: {args.version} -> {versiones.actual}: {' + '.join(archivos) or 'al día'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,31 @@
+"""
+Utilidades compartidas por los scripts de datos de Pócima Salvage.
+
+Los scripts de `scripts/` se ejecutan directamente (`python3 scripts/x.py`),
+así que este paquete queda importable sin instalación. Al importarlo se
+activan las métricas de ejecución si POCIMA_METRICAS está definida (ver
+catalogo/metricas.py).
+"""
+
+from .parser import (
+    DATA_DIR,
+    ENFERMEDADES_TS,
+    PLANTAS_TS,
+    REPO_ROOT,
+    WORK_DIR,
+    CatalogoError,
+    Categoria,
+    Enfermedad,
+    Planta,
+    Sistema,
+    iter_categorias,
+    iter_enfermedades,
+    iter_plantas,
+    iter_sistemas,
+    work_path,
+)
+from .store import STORE_DIR, CatalogStore, write_atomic
+from .emitter import emit
+from . import metricas
+
+metricas.desde_entorno()
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Resolución de alias de plantas y enfermedades a su id del catálogo.
+
+Las claves que devuelve el modelo (o que escribe MolDoctor en sus etiquetas
+[PLANTA:…] / [ENFERMEDAD:…]) no siempre son el id exacto: a veces es el
+nombre, el nombre científico, un nombre regional o el id con otra
+puntuación. El resolutor indexa en un solo diccionario la forma normalizada
+(sin acentos, minúsculas, sólo letras y dígitos) de cada alias de cada
+entidad, así que resolver una clave es una búsqueda O(1). Si no hay
+coincidencia, se busca la forma más parecida por trigramas.
+
+Cuando una forma pertenece a varias entidades gana el alias más fuerte
+(id > nombre > nombre científico > otros nombres); si aun así hay empate, la
+forma es ambigua y no se resuelve.
+
+La misma normalización está en data/alias.ts para el índice que genera
+scripts/build-alias-index.py.
+"""
+
+import re
+import unicodedata
+from collections import Counter
+
+from .store import CatalogStore
+
+# Prioridad de cada fuente de alias (menor = más fuerte)
+ID, NOMBRE, CIENTIFICO, OTROS = range(4)
+
+# tipo -> [(campo, prioridad)]
+FUENTES = {
+    'plantas': [('id', ID), ('nombre', NOMBRE), ('nombreCientifico', CIENTIFICO),
+                ('nombresAlternativos', OTROS)],
+    'enfermedades': [('id', ID), ('nombre', NOMBRE), ('otrosNombres', OTROS)],
+}
+
+# Similitud mínima (coeficiente de Dice sobre trigramas) para aceptar una coincidencia difusa
+UMBRAL_DIFUSO = 0.65
+
+EXACTO = 'exacto'
+NORMALIZADO = 'normalizado'
+DIFUSO = 'difuso'
+AMBIGUO = 'ambiguo'
+NO_RESUELTO = 'no-resuelto'
+
+
+def normalizar_alias(texto):
+    """Forma normalizada de un alias: 'Diente de León' -> 'dientedeleon'."""
+    texto = unicodedata.normalize('NFD', texto.lower())
+    texto = ''.join(c for c in texto if not unicodedata.combining(c))
+    return re.sub(r'[^a-z0-9]+', '', texto)
+
+
+def trigramas_alias(forma):
+    """Trigramas de una forma normalizada, con dos espacios delante y uno detrás (como pg_trgm)."""
+    forma = f'  {forma} '
+    return {forma[i:i + 3] for i in range(len(forma) - 2)}
+
+
+def alias_de(registro, campo):
+    """Nombres de un campo de alias: string, lista o nombres por región ({region: [nombres]})."""
+    valor = registro.get(campo)
+    if isinstance(valor, str):
+        yield valor
+    elif isinstance(valor, list):
+        yield from (v for v in valor if isinstance(v, str))
+    elif isinstance(valor, dict):
+        for nombres in valor.values():
+            yield from (n for n in nombres if isinstance(n, str))
+
+
+class EstadisticasAlias:
+    """Cuántas claves se resolvieron por cada método y cuáles quedaron sin resolver."""
+
+    def __init__(self):
+        self.metodos = Counter()
+        self.difusos = []
+        self.no_resueltos = []
+
+    def __str__(self):
+        total = sum(self.metodos.values())
+        partes = ', '.join(f'{n} {m}' for m, n in self.metodos.most_common())
+        return f'{total} claves: {partes}' if total else '0 claves'
+
+
+class ResolutorAlias:
+    """
+    Índice forma normalizada -> id de entidad para un tipo de catálogo.
+
+    `ubicaciones` guarda, para cada id, los bloques (categorías o sistemas)
+    en los que aparece, en el orden del catálogo.
+    """
+
+    def __init__(self, tipo, store=None, umbral=UMBRAL_DIFUSO):
+        store = store or CatalogStore(tipo)
+        self.tipo = tipo
+        self.umbral = umbral
+        self.stats = EstadisticasAlias()
+        self.ubicaciones = {}
+        # forma -> (prioridad, {ids})
+        candidatos = {}
+        for bloque in store:
+            for registro in bloque[store.clave]:
+                entidad = registro.get('id')
+                if not entidad:
+                    continue
+                self.ubicaciones.setdefault(entidad, [])
+                if bloque['id'] not in self.ubicaciones[entidad]:
+                    self.ubicaciones[entidad].append(bloque['id'])
+                for campo, prioridad in FUENTES[tipo]:
+                    for alias in alias_de(registro, campo):
+                        forma = normalizar_alias(alias)
+                        if not forma:
+                            continue
+                        actual = candidatos.get(forma)
+                        if actual is None or prioridad < actual[0]:
+                            candidatos[forma] = (prioridad, {entidad})
+                        elif prioridad == actual[0]:
+                            actual[1].add(entidad)
+
+        self.formas = {}
+        self.ambiguas = {}
+        for forma, (_, ids) in candidatos.items():
+            if len(ids) == 1:
+                self.formas[forma] = next(iter(ids))
+            else:
+                self.ambiguas[forma] = sorted(ids)
+        self._trigramas = None
+
+    def __len__(self):
+        return len(self.formas)
+
+    def _indice_trigramas(self):
+        if self._trigramas is None:
+            self._trigramas = {}
+            for forma in self.formas:
+                for t in trigramas_alias(forma):
+                    self._trigramas.setdefault(t, []).append(forma)
+        return self._trigramas
+
+    def difuso(self, forma):
+        """(id, similitud) de la forma más parecida por trigramas, o (None, mejor similitud)."""
+        consulta = trigramas_alias(forma)
+        comunes = Counter()
+        indice = self._indice_trigramas()
+        for t in consulta:
+            comunes.update(indice.get(t, ()))
+        mejor = None
+        mejor_score = 0.0
+        empate = False
+        for candidata, n in comunes.items():
+            score = 2 * n / (len(consulta) + len(trigramas_alias(candidata)))
+            if score > mejor_score:
+                mejor, mejor_score, empate = candidata, score, False
+            elif score == mejor_score and self.formas[candidata] != self.formas.get(mejor):
+                empate = True
+        if mejor is None or mejor_score < self.umbral or empate:
+            return None, mejor_score
+        return self.formas[mejor], mejor_score
+
+    def resolver(self, clave):
+        """(id | None, método) para una clave cualquiera; actualiza `stats`."""
+        # Como resolverAlias en data/alias.ts: la búsqueda exacta ignora espacios alrededor
+        exacta = (clave or '').strip()
+        if exacta in self.ubicaciones:
+            return self._contar(exacta, EXACTO)
+        forma = normalizar_alias(exacta)
+        if forma in self.formas:
+            return self._contar(self.formas[forma], NORMALIZADO)
+        if forma in self.ambiguas:
+            self.stats.no_resueltos.append(clave)
+            return self._contar(None, AMBIGUO)
+        if forma:
+            entidad, score = self.difuso(forma)
+            if entidad is not None:
+                self.stats.difusos.append((clave, entidad, round(score, 2)))
+                return self._contar(entidad, DIFUSO)
+        self.stats.no_resueltos.append(clave)
+        return self._contar(None, NO_RESUELTO)
+
+    def _contar(self, entidad, metodo):
+        self.stats.metodos[metodo] += 1
+        return entidad, metodo
@@ -0,0 +1,324 @@
+#!/usr/bin/env python3
+"""
+Motor de auditoría del catálogo.
+
+Todas las comprobaciones (campo ausente, campo vacío, texto posiblemente
+truncado) se hacen en un solo recorrido de cada registro. Cada bloque del
+almacén (una categoría o un sistema) es una unidad de trabajo independiente,
+así que los bloques se reparten entre procesos y los resultados parciales se
+suman al final.
+
+La auditoría es incremental: un manifiesto con el hash de cada registro
+guarda sus hallazgos, y sólo se vuelven a auditar los registros que cambiaron.
+"""
+
+import hashlib
+import json
+import os
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+from . import metricas
+from .parser import ENFERMEDADES_TS, PLANTAS_TS, iter_categorias, iter_sistemas
+from .store import STORE_DIR, CatalogStore, write_atomic
+
+# tipo -> campos que se auditan (presencia, vacío y truncado)
+CAMPOS = {
+    'plantas': ('nombresAlternativos', 'propiedades', 'parteUsable', 'dosis', 'preparacion',
+                'contraindicaciones', 'descripcion', 'sistemasRelacionados'),
+    'enfermedades': ('otrosNombres', 'descripcion', 'sintomas', 'causas'),
+}
+
+MANIFEST_FILE = '_auditoria.json'
+
+# Por debajo de este tamaño total de bloques, arrancar procesos cuesta más que auditar
+MIN_BYTES_PARALELO = 4 * 1024 * 1024
+
+# Un texto más largo que esto que termina en '...' se considera truncado
+LIMITE_TRUNCADO = 200
+
+
+def _truncado(valor):
+    """True si algún string del campo (listas y objetos anidados incluidos) parece truncado."""
+    if type(valor) is str:
+        return len(valor) > LIMITE_TRUNCADO and valor.endswith('...')
+    if type(valor) is dict:
+        valor = valor.values()
+    elif type(valor) is not list:
+        return False
+    for v in valor:
+        if type(v) is str:
+            if len(v) > LIMITE_TRUNCADO and v.endswith('...'):
+                return True
+        elif _truncado(v):
+            return True
+    return False
+
+
+def auditar_registro(tipo, registro):
+    """
+    Hallazgos de un registro (dict), p. ej. ['falta:sintomas', 'truncado:descripcion'].
+
+    Los campos que no se auditan por presencia también se revisan por truncado.
+    """
+    hallazgos = []
+    for campo in CAMPOS[tipo]:
+        valor = registro.get(campo)
+        if valor is None:
+            hallazgos.append(f'falta:{campo}')
+        elif not valor:
+            hallazgos.append(f'vacio:{campo}')
+    for campo, valor in registro.items():
+        if _truncado(valor):
+            hallazgos.append(f'truncado:{campo}')
+    return hallazgos
+
+
+class ResultadoAuditoria:
+    """Totales y hallazgos por entidad de un tipo de catálogo (sumables entre bloques)."""
+
+    def __init__(self, tipo):
+        self.tipo = tipo
+        self.total = 0
+        self.conteo = Counter()
+        self.entidades = []
+
+    def agregar(self, bloque_id, registro, hallazgos):
+        self.total += 1
+        self.conteo.update(hallazgos)
+        if hallazgos:
+            self.entidades.append({
+                'id': registro.get('id'),
+                'nombre': registro.get('nombre'),
+                'bloque': bloque_id,
+                'hallazgos': hallazgos,
+            })
+
+    def unir(self, otro):
+        self.total += otro.total
+        self.conteo.update(otro.conteo)
+        self.entidades.extend(otro.entidades)
+        return self
+
+    def con(self, campo):
+        """Registros que tienen el campo (aunque esté vacío)."""
+        return self.total - self.conteo[f'falta:{campo}']
+
+    def vacios(self, campo):
+        return self.conteo[f'vacio:{campo}']
+
+    def sin(self, campo):
+        """Registros sin el campo o con el campo vacío."""
+        return self.conteo[f'falta:{campo}'] + self.conteo[f'vacio:{campo}']
+
+    def truncados(self):
+        return sum(n for h, n in self.conteo.items() if h.startswith('truncado:'))
+
+    def entidades_con(self, *hallazgos):
+        return [e for e in self.entidades if any(h in e['hallazgos'] for h in hallazgos)]
+
+    def to_dict(self):
+        return {
+            'total': self.total,
+            'conteo': dict(sorted(self.conteo.items())),
+            'entidades': self.entidades,
+        }
+
+
+def auditar_registros(tipo, bloque_id, registros):
+    resultado = ResultadoAuditoria(tipo)
+    for registro in registros:
+        resultado.agregar(bloque_id, registro, auditar_registro(tipo, registro))
+    return resultado
+
+
+def hash_registro(registro):
+    """Hash del contenido de un registro (independiente del orden de las claves)."""
+    datos = json.dumps(registro, ensure_ascii=False, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha1(datos.encode('utf-8')).hexdigest()
+
+
+def _reglas():
+    """Huella de las reglas de auditoría; si cambian, el manifiesto no sirve."""
+    datos = json.dumps([CAMPOS, LIMITE_TRUNCADO], sort_keys=True)
+    return hashlib.sha1(datos.encode('utf-8')).hexdigest()
+
+
+class ManifiestoAuditoria:
+    """
+    Hallazgos cacheados por hash de registro, guardados junto al almacén en
+    data/catalogo/<tipo>/_auditoria.json:
+
+        {"reglas": "<sha1>", "bloques": {"<bloque>": {"sha256", "mtime_ns", "size",
+                                                      "registros": [[hash, id, nombre, hallazgos], ...]}}}
+
+    Un bloque con el mismo tamaño y mtime (o, si no, el mismo sha256) se
+    reutiliza sin leerlo; en un bloque modificado sólo se vuelven a auditar
+    los registros cuyo hash cambió.
+    """
+
+    def __init__(self, store):
+        self.path = os.path.join(store.dir, MANIFEST_FILE)
+        self.bloques = {}
+        self.cambiado = False
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                datos = json.load(f)
+            if datos.get('reglas') == _reglas():
+                self.bloques = datos['bloques']
+        except (OSError, ValueError, KeyError):
+            pass
+
+    def vigente(self, bloque_id, st):
+        entrada = self.bloques.get(bloque_id)
+        if entrada and entrada['mtime_ns'] == st.st_mtime_ns and entrada['size'] == st.st_size:
+            return entrada
+        return None
+
+    def actualizar(self, bloques):
+        """Sustituye las entradas por `bloques` (sólo los bloques actuales del almacén)."""
+        if bloques != self.bloques:
+            self.bloques = bloques
+            self.cambiado = True
+
+    def guardar(self):
+        if self.cambiado:
+            write_atomic(self.path, json.dumps({'reglas': _reglas(), 'bloques': self.bloques},
+                                               ensure_ascii=False, separators=(',', ':')))
+
+
+def _resultado_de_entrada(tipo, bloque_id, entrada):
+    resultado = ResultadoAuditoria(tipo)
+    for _, id_, nombre, hallazgos in entrada['registros']:
+        resultado.agregar(bloque_id, {'id': id_, 'nombre': nombre}, hallazgos)
+    return resultado
+
+
+def _auditar_bloque(tipo, bloque_id, root, previa):
+    """
+    Unidad de trabajo de un proceso: un archivo de bloque del almacén.
+
+    `previa` es la entrada del manifiesto para el bloque (o None); los
+    registros cuyo hash ya estaba en ella no se vuelven a auditar.
+    Devuelve (bloque_id, entrada nueva, registros auditados).
+    """
+    store = CatalogStore(tipo, root)
+    path = store.path(bloque_id)
+    st = os.stat(path)
+    with open(path, 'rb') as f:
+        raw = f.read()
+    sha = hashlib.sha256(raw).hexdigest()
+    if previa and previa['sha256'] == sha:
+        return bloque_id, dict(previa, mtime_ns=st.st_mtime_ns, size=st.st_size), 0
+
+    cacheados = {h: hallazgos for h, _, _, hallazgos in previa['registros']} if previa else {}
+    registros = []
+    auditados = 0
+    for registro in json.loads(raw)[store.clave]:
+        h = hash_registro(registro)
+        hallazgos = cacheados.get(h)
+        if hallazgos is None:
+            hallazgos = auditar_registro(tipo, registro)
+            auditados += 1
+        registros.append([h, registro.get('id'), registro.get('nombre'), hallazgos])
+    entrada = {'sha256': sha, 'mtime_ns': st.st_mtime_ns, 'size': st.st_size, 'registros': registros}
+    return bloque_id, entrada, auditados
+
+
+def _auditar_ts(tipo):
+    """Sin almacén: audita el módulo TypeScript completo en un solo proceso."""
+    if tipo == 'plantas':
+        bloques = ((c.id, c.plantas) for c in iter_categorias(PLANTAS_TS))
+    else:
+        bloques = ((s.id, s.enfermedades) for s in iter_sistemas(ENFERMEDADES_TS))
+    resultado = ResultadoAuditoria(tipo)
+    for bloque_id, registros in bloques:
+        resultado.unir(auditar_registros(tipo, bloque_id, (r.to_dict() for r in registros)))
+    return resultado
+
+
+class EstadisticasAuditoria:
+    def __init__(self):
+        self.registros = 0
+        self.auditados = 0
+        self.bloques = 0
+        self.bloques_reutilizados = 0
+        self.segundos = 0.0
+
+    def __str__(self):
+        return (f'{self.auditados}/{self.registros} registros auditados, '
+                f'{self.bloques_reutilizados}/{self.bloques} bloques sin cambios, '
+                f'{self.segundos * 1000:.1f} ms')
+
+
+def auditar(tipos=('enfermedades', 'plantas'), procesos=None, root=STORE_DIR, incremental=True):
+    """
+    Audita los catálogos y devuelve ({tipo: ResultadoAuditoria}, EstadisticasAuditoria).
+
+    Con `incremental` sólo se auditan los registros que cambiaron desde la
+    última ejecución (ver ManifiestoAuditoria). Con `procesos=1` todo se
+    ejecuta en el proceso actual. Por defecto se usa un proceso por CPU,
+    salvo que lo que haya que auditar sea tan poco que no compense.
+    """
+    inicio = time.perf_counter()
+    stats = EstadisticasAuditoria()
+    resultados = {tipo: ResultadoAuditoria(tipo) for tipo in tipos}
+    manifiestos = {}
+    # (tipo, bloque_id) -> entrada del manifiesto, en el orden del catálogo
+    entradas = {}
+    tareas = []
+    tamano = 0
+    for tipo in tipos:
+        store = CatalogStore(tipo, root)
+        if not store.exists():
+            tareas.append((_auditar_ts, tipo))
+            continue
+        manifiesto = manifiestos[tipo] = ManifiestoAuditoria(store)
+        for bloque_id in store.ids():
+            st = os.stat(store.path(bloque_id))
+            entrada = manifiesto.vigente(bloque_id, st) if incremental else None
+            entradas[tipo, bloque_id] = entrada
+            stats.bloques += 1
+            if entrada:
+                stats.bloques_reutilizados += 1
+            else:
+                previa = manifiesto.bloques.get(bloque_id) if incremental else None
+                tareas.append((_auditar_bloque, tipo, bloque_id, root, previa))
+                tamano += st.st_size
+
+    if procesos is None:
+        procesos = os.cpu_count() or 1
+        if tamano < MIN_BYTES_PARALELO:
+            procesos = 1
+    with metricas.fase('auditar') as medida:
+        if procesos == 1 or len(tareas) <= 1:
+            parciales = [(args[0], fn(*args)) for fn, *args in tareas]
+        else:
+            with ProcessPoolExecutor(max_workers=procesos) as pool:
+                futuros = [(args[0], pool.submit(fn, *args)) for fn, *args in tareas]
+                parciales = [(tipo, f.result()) for tipo, f in futuros]
+
+        for tipo, parcial in parciales:
+            if isinstance(parcial, ResultadoAuditoria):
+                resultados[tipo].unir(parcial)
+                stats.registros += parcial.total
+                stats.auditados += parcial.total
+            else:
+                bloque_id, entrada, auditados = parcial
+                entradas[tipo, bloque_id] = entrada
+                stats.auditados += auditados
+        medida.registros = stats.auditados
+
+    for tipo, manifiesto in manifiestos.items():
+        bloques = {}
+        for (t, bloque_id), entrada in entradas.items():
+            if t == tipo:
+                resultados[tipo].unir(_resultado_de_entrada(tipo, bloque_id, entrada))
+                stats.registros += len(entrada['registros'])
+                bloques[bloque_id] = entrada
+        manifiesto.actualizar(bloques)
+        manifiesto.guardar()
+
+    stats.segundos = time.perf_counter() - inicio
+    return resultados, stats
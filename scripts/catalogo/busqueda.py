@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Índice invertido de trigramas para la búsqueda de plantas y enfermedades.
+
+Los textos se normalizan (minúsculas y sin acentos) con una tabla de
+plegado que se emite junto al índice, de modo que la app y este módulo
+pliegan exactamente igual. Cada trigrama apunta a las posiciones (en
+getAllPlantas() / getAllEnfermedades()) de los registros que lo contienen;
+una consulta intersecta esas listas y sólo verifica los candidatos.
+"""
+
+import unicodedata
+
+# tipo -> [(campo, peso)] en el orden en que se guardan los textos normalizados
+CAMPOS = {
+    'plantas': [('nombre', 8), ('nombreCientifico', 4), ('propiedades', 2), ('descripcion', 1)],
+    'enfermedades': [('nombre', 8), ('otrosNombres', 4), ('descripcion', 1)],
+}
+
+# Caracteres base que siempre se incluyen en la tabla de plegado
+_LATINOS = 'ÁÀÂÄÃÉÈÊËÍÌÎÏÓÒÔÖÕÚÙÛÜÑÇáàâäãéèêëíìîïóòôöõúùûüñç'
+
+
+def tabla_plegado(textos=()):
+    """Mapa carácter -> carácter sin acento, en minúsculas, para los textos dados."""
+    tabla = {}
+    for texto in (_LATINOS, *textos):
+        for ch in texto:
+            if ch in tabla or ch.isascii():
+                continue
+            base = ''.join(c for c in unicodedata.normalize('NFD', ch) if not unicodedata.combining(c))
+            base = base.lower()
+            if base != ch:
+                tabla[ch] = base
+    return tabla
+
+
+def plegar(texto, tabla):
+    """Minúsculas y sin acentos; equivalente a plegar() en data/busqueda.ts."""
+    texto = texto.lower()
+    if texto.isascii():
+        return texto
+    return ''.join(tabla.get(ch, ch) for ch in texto)
+
+
+def trigramas(texto):
+    return {texto[i:i + 3] for i in range(len(texto) - 2)}
+
+
+def texto_campo(valor):
+    if isinstance(valor, list):
+        return '\n'.join(valor)
+    return valor or ''
+
+
+class IndiceBusqueda:
+    """Índice de trigramas de un tipo de catálogo sobre su lista plana de registros."""
+
+    def __init__(self, tipo, registros, tabla):
+        self.tipo = tipo
+        self.campos = CAMPOS[tipo]
+        self.tabla = tabla
+        self.normalizados = [
+            [plegar(texto_campo(getattr(r, campo)), tabla) for campo, _ in self.campos] for r in registros
+        ]
+        postings = {}
+        for posicion, textos in enumerate(self.normalizados):
+            vistos = set()
+            for texto in textos:
+                vistos |= trigramas(texto)
+            for tri in vistos:
+                postings.setdefault(tri, []).append(posicion)
+        self.postings = postings
+
+    def buscar(self, query):
+        """Posiciones que contienen `query`, ordenadas por puntuación y luego por posición."""
+        q = plegar(query.strip(), self.tabla)
+        if not q:
+            return list(range(len(self.normalizados)))
+        if len(q) < 3:
+            candidatos = range(len(self.normalizados))
+        else:
+            listas = sorted((self.postings.get(t, ()) for t in trigramas(q)), key=len)
+            if not listas[0]:
+                return []
+            comun = set(listas[0])
+            for lista in listas[1:]:
+                comun.intersection_update(lista)
+                if not comun:
+                    return []
+            candidatos = sorted(comun)
+        pesos = [peso for _, peso in self.campos]
+        puntuados = []
+        for posicion in candidatos:
+            textos = self.normalizados[posicion]
+            puntos = sum(peso for texto, peso in zip(textos, pesos) if q in texto)
+            if puntos:
+                puntuados.append((-puntos, posicion))
+        puntuados.sort()
+        return [posicion for _, posicion in puntuados]
+
+
+def delta_base36(posiciones):
+    """Codifica una lista creciente de enteros como diferencias en base 36."""
+    partes = []
+    anterior = 0
+    for p in posiciones:
+        partes.append(_base36(p - anterior))
+        anterior = p
+    return ','.join(partes)
+
+
+def _base36(n):
+    digitos = '0123456789abcdefghijklmnopqrstuvwxyz'
+    if n == 0:
+        return '0'
+    s = ''
+    while n:
+        n, r = divmod(n, 36)
+        s = digitos[r] + s
+    return s
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Caché en disco, direccionada por contenido, de las respuestas del LLM por entidad.
+
+La clave es el SHA-256 de (versión de la plantilla del prompt, entradas de la
+entidad), así que una planta o enfermedad cuyo nombre, nombre científico o
+sistema no cambió no se vuelve a enviar al modelo. Cambiar el texto de una
+plantilla exige subir su versión en catalogo/etapas.py, lo que invalida sus
+entradas sin tocar las demás.
+
+Cada entrada es un archivo <raíz>/<2 primeros hex>/<clave>.json. Al leer una
+entrada se actualiza su mtime, que sirve sólo de orden LRU al desalojar por
+tamaño; la edad se cuenta siempre desde `creado` (guardado en la entrada), así
+que las entradas más antiguas que `max_edad` se descartan al leerlas y al
+desalojar aunque se sigan usando.
+"""
+
+import hashlib
+import json
+import os
+import re
+import time
+
+from .store import write_atomic
+
+DIA = 24 * 3600
+
+# put() escribe 'creado' como primera clave: basta leer el principio del archivo
+_CREADO_RE = re.compile(rb'^\{"creado":\s*([0-9.eE+-]+)')
+_PREFIJO = 64
+
+
+def clave(version, entradas):
+    """Clave de caché para una plantilla y las entradas de una entidad."""
+    datos = json.dumps([version, entradas], ensure_ascii=False, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(datos.encode('utf-8')).hexdigest()
+
+
+class CacheLLM:
+    def __init__(self, root, max_bytes=200 * 1024 * 1024, max_edad=90 * DIA):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.max_edad = max_edad
+        self.aciertos = 0
+        self.fallos = 0
+        self.escrituras = 0
+        self.desalojados = 0
+
+    def _path(self, k):
+        return os.path.join(self.root, k[:2], k + '.json')
+
+    def get(self, k):
+        """Valor guardado para la clave `k`, o None si no está o ha caducado."""
+        path = self._path(k)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entrada = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            self.fallos += 1
+            return None
+        if time.time() - entrada.get('creado', 0) > self.max_edad:
+            os.remove(path)
+            self.desalojados += 1
+            self.fallos += 1
+            return None
+        os.utime(path)
+        self.aciertos += 1
+        return entrada['valor']
+
+    def put(self, k, valor, entradas=None):
+        os.makedirs(os.path.dirname(self._path(k)), exist_ok=True)
+        entrada = {'creado': time.time(), 'entradas': entradas, 'valor': valor}
+        write_atomic(self._path(k), json.dumps(entrada, ensure_ascii=False))
+        self.escrituras += 1
+
+    @staticmethod
+    def _creado(path):
+        """Momento de creación de la entrada (0 si no se puede leer, como en get())."""
+        with open(path, 'rb') as f:
+            m = _CREADO_RE.match(f.read(_PREFIJO))
+            if m:
+                return float(m.group(1))
+            f.seek(0)
+            try:
+                return json.load(f).get('creado', 0)
+            except (ValueError, AttributeError):
+                return 0
+
+    def desalojar(self):
+        """
+        Borra las entradas caducadas (por `creado`) y, si hace falta, las menos
+        usadas (por mtime) hasta caber en `max_bytes`.
+        """
+        if not os.path.isdir(self.root):
+            return
+        ahora = time.time()
+        archivos = []
+        for dirpath, _, nombres in os.walk(self.root):
+            for nombre in nombres:
+                path = os.path.join(dirpath, nombre)
+                st = os.stat(path)
+                if ahora - self._creado(path) > self.max_edad:
+                    os.remove(path)
+                    self.desalojados += 1
+                else:
+                    archivos.append((st.st_mtime, st.st_size, path))
+        total = sum(size for _, size, _ in archivos)
+        for _, size, path in sorted(archivos):
+            if total <= self.max_bytes:
+                break
+            os.remove(path)
+            total -= size
+            self.desalojados += 1
+
+    def tamano(self):
+        """(entradas, bytes) ocupados actualmente."""
+        entradas = 0
+        total = 0
+        for dirpath, _, nombres in os.walk(self.root):
+            for nombre in nombres:
+                entradas += 1
+                total += os.path.getsize(os.path.join(dirpath, nombre))
+        return entradas, total
+
+    def __str__(self):
+        consultas = self.aciertos + self.fallos
+        tasa = self.aciertos / consultas * 100 if consultas else 0.0
+        return (f'{self.aciertos} aciertos, {self.fallos} fallos ({tasa:.0f}% aciertos), '
+                f'{self.escrituras} escrituras, {self.desalojados} desalojados')
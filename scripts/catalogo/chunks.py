@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Módulos TypeScript por bloque para carga diferida.
+
+Además del módulo monolítico, el emisor puede escribir un módulo por
+categoría de plantas y por sistema corporal en data/chunks/<tipo>/<id>.ts y
+un índice pequeño (data/chunks/<tipo>/index.ts) con id, nombre y número de
+registros de cada bloque, la huella de contenido del monolito y un cargador
+`import()` por bloque. Las
+pantallas sólo importan el índice al arrancar y cargan cada bloque cuando
+hace falta.
+
+El texto de cada bloque es el mismo que el emisor ya tiene para el
+monolito, así que los chunks no añaden renderizado y sólo se reescriben los
+archivos que cambiaron.
+"""
+
+import json
+import os
+
+from .parser import read_text
+from .store import write_atomic
+
+CHUNKS_DIR = 'chunks'
+
+HEADER = '// Generado automáticamente por scripts/build-catalog.py - no editar a mano\n'
+
+# tipo -> (módulo monolítico, interfaz del bloque, variable, interfaz del resumen,
+#          export del resumen, export del total, export de la huella, función de carga)
+MODULOS = {
+    'plantas': ('plantas-expandidas', 'CategoriaPlanta', 'categoria', 'ResumenCategoria',
+                'resumenCategorias', 'totalPlantas', 'huellaPlantas', 'cargarCategoria'),
+    'enfermedades': ('enfermedades-expandidas', 'SistemaCorporal', 'sistema', 'ResumenSistema',
+                     'resumenSistemas', 'totalEnfermedades', 'huellaEnfermedades', 'cargarSistema'),
+}
+
+
+def chunks_dir(tipo, ts_path):
+    """Directorio de los chunks de `tipo`, junto al módulo monolítico."""
+    return os.path.join(os.path.dirname(os.path.abspath(ts_path)), CHUNKS_DIR, tipo)
+
+
+def render_chunk(tipo, texto):
+    """Módulo de un bloque a partir de su texto en el monolito ('{' ... '  }')."""
+    modulo, interfaz, variable = MODULOS[tipo][:3]
+    # En el monolito el bloque está indentado dos espacios dentro del array
+    cuerpo = texto.replace('\n  ', '\n')
+    return (
+        HEADER
+        + f"import type {{ {interfaz} }} from '../../{modulo}';\n\n"
+        + f'const {variable}: {interfaz} = {cuerpo};\n\n'
+        + f'export default {variable};\n'
+    )
+
+
+def _ts(value):
+    return json.dumps(value, ensure_ascii=False)
+
+
+def render_indice(tipo, resumenes, huella):
+    """Índice de los chunks: resumen de cada bloque, total, huella del monolito y cargadores."""
+    modulo, interfaz, _, resumen, export, total_export, huella_export, cargar = MODULOS[tipo]
+    total = sum(r['registros'] for r in resumenes)
+    campos = ['  id: string;', '  nombre: string;']
+    if tipo == 'enfermedades':
+        campos.append('  icono: string;')
+    campos.append('  total: number;')
+
+    filas = []
+    cargadores = []
+    for r in resumenes:
+        icono = f", icono: {_ts(r.get('icono', '🏥'))}" if tipo == 'enfermedades' else ''
+        filas.append(f"  {{ id: {_ts(r['id'])}, nombre: {_ts(r['nombre'])}{icono}, total: {r['registros']} }},\n")
+        cargadores.append(f"  {_ts(r['id'])}: () => import({_ts('./' + r['id'])}),\n")
+
+    return (
+        HEADER
+        + f'// Índice de bloques de {modulo}.ts: {len(resumenes)} bloques, {total} registros\n\n'
+        + f"import type {{ {interfaz} }} from '../../{modulo}';\n\n"
+        + f'export interface {resumen} {{\n' + '\n'.join(campos) + '\n}\n\n'
+        + f'export const {export}: {resumen}[] = [\n' + ''.join(filas) + '];\n\n'
+        + f'export const {total_export} = {total};\n\n'
+        + f'// Misma huella que {modulo}.ts: los chunks tienen el mismo contenido\n'
+        + f'export const {huella_export} = {_ts(huella)};\n\n'
+        + f'const cargadores: Record<string, () => Promise<{{ default: {interfaz} }}>> = {{\n'
+        + ''.join(cargadores) + '};\n\n'
+        + '// Carga el módulo del bloque sólo cuando se necesita (undefined si el id no existe)\n'
+        + f'export const {cargar} = async (id: string): Promise<{interfaz} | undefined> => {{\n'
+        + '  const cargar = cargadores[id];\n'
+        + '  return cargar ? (await cargar()).default : undefined;\n'
+        + '};\n'
+    )
+
+
+def _escribir(path, texto):
+    try:
+        if read_text(path) == texto:
+            return False
+    except OSError:
+        pass
+    write_atomic(path, texto)
+    return True
+
+
+def emit_chunks(tipo, bloques, ts_path, huella):
+    """
+    Escribe los chunks de `tipo` para `bloques` = [(resumen, texto del bloque)],
+    donde resumen es {'id', 'nombre', 'registros'[, 'icono']}; `bloques` puede
+    ser un generador y se recorre una sola vez. `huella` es la del monolito
+    recién emitido. Borra los chunks
+    de bloques que ya no existen. Devuelve cuántos archivos se escribieron.
+    """
+    directorio = chunks_dir(tipo, ts_path)
+    os.makedirs(directorio, exist_ok=True)
+    escritos = 0
+    vigentes = {'index.ts'}
+    resumenes = []
+    for resumen, texto in bloques:
+        nombre = resumen['id'] + '.ts'
+        vigentes.add(nombre)
+        resumenes.append(resumen)
+        escritos += _escribir(os.path.join(directorio, nombre), render_chunk(tipo, texto))
+    escritos += _escribir(os.path.join(directorio, 'index.ts'), render_indice(tipo, resumenes, huella))
+    for nombre in os.listdir(directorio):
+        if nombre.endswith('.ts') and nombre not in vigentes:
+            os.remove(os.path.join(directorio, nombre))
+            escritos += 1
+    return escritos
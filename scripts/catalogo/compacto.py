@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Formato compacto del catálogo: tabla de cadenas internadas y referencias por índice.
+
+El módulo literal repite en cada planta `categoriaId` y `categoria`, y los
+mismos ids de sistemas, propiedades y regiones cientos de veces. El formato
+compacto guarda cada cadena distinta una sola vez y el resto son índices:
+
+    {"v": 1,
+     "campos": [["id", "s"], ["nombre", "s"], ["propiedades", "l"], ...],
+     "cadenas": ["sistema-digestivo", ...],           # más frecuentes primero
+     "bloques": [[id, nombre, (icono,) [registro, ...]], ...]}
+
+Cada registro es un array alineado con `campos` (null si el campo falta; los
+null finales se omiten). Tipos de campo:
+
+    s  cadena                      -> índice
+    l  lista de cadenas            -> [índices]
+    m  objeto región -> nombres    -> [región, [nombres], región, [nombres], ...]
+    c  contraindicaciones          -> índice (texto) o [tipo, descripción]
+
+Los campos derivados del bloque (categoriaId/categoria, sistemaId) no se
+guardan; los añade el decodificador de data/compacto.ts. El módulo generado
+lleva el JSON dentro de un string, porque JSON.parse es bastante más rápido
+que evaluar un literal de objeto del mismo tamaño.
+"""
+
+import json
+import os
+from collections import Counter
+
+from .parser import CONTRAINDICACION_TIPOS, ENFERMEDADES_TS, PLANTAS_TS, read_text
+from .store import TIPOS, CatalogStore, write_atomic
+
+VERSION = 1
+
+TIPOS_CAMPO = {
+    'plantas': {
+        'id': 's', 'nombre': 's', 'nombreCientifico': 's', 'nombresAlternativos': 'm',
+        'propiedades': 'l', 'parteUsable': 's', 'dosis': 's', 'preparacion': 's',
+        'contraindicaciones': 'c', 'fuente': 's', 'descripcion': 's', 'sistemasRelacionados': 'l',
+    },
+    'enfermedades': {
+        'id': 's', 'nombre': 's', 'otrosNombres': 'l', 'descripcion': 's', 'sintomas': 'l', 'causas': 'l',
+    },
+}
+
+# tipo -> (archivo del módulo, interfaz del bloque, decodificador, export del cargador)
+MODULOS = {
+    'plantas': ('plantas-compacto.ts', 'CategoriaPlanta', 'decodificarPlantas', 'cargarPlantasCompactas'),
+    'enfermedades': ('enfermedades-compacto.ts', 'SistemaCorporal', 'decodificarEnfermedades',
+                     'cargarEnfermedadesCompactas'),
+}
+
+
+def compacto_path(tipo, ts_path=None):
+    """Módulo compacto de `tipo`, junto al módulo literal."""
+    ts_path = ts_path or (PLANTAS_TS if tipo == 'plantas' else ENFERMEDADES_TS)
+    return os.path.join(os.path.dirname(os.path.abspath(ts_path)), MODULOS[tipo][0])
+
+
+def _cabecera(tipo, bloque):
+    cabecera = [bloque['id'], bloque['nombre']]
+    if tipo == 'enfermedades':
+        cabecera.append(bloque.get('icono', '🏥'))
+    return cabecera
+
+
+def _tipo_contraindicacion(c):
+    tipo = c.get('tipo', 'otro')
+    return tipo if tipo in CONTRAINDICACION_TIPOS else 'otro'
+
+
+def _cadenas_de(tipo, bloques):
+    """Todas las cadenas del catálogo (con repetición) en el orden de codificación."""
+    campos = TIPOS_CAMPO[tipo]
+    clave = TIPOS[tipo][1]
+    for bloque in bloques:
+        yield from _cabecera(tipo, bloque)
+        for registro in bloque[clave]:
+            for campo, t in campos.items():
+                valor = registro.get(campo)
+                if valor is None:
+                    continue
+                if t == 's':
+                    yield valor
+                elif t == 'l':
+                    yield from valor
+                elif t == 'm':
+                    for region, nombres in valor.items():
+                        yield region
+                        yield from nombres
+                else:
+                    for c in valor:
+                        if isinstance(c, str):
+                            yield c
+                        else:
+                            yield _tipo_contraindicacion(c)
+                            yield c.get('descripcion', '')
+
+
+def codificar(tipo, bloques):
+    """Payload compacto (dict serializable) a partir de los bloques del almacén."""
+    bloques = list(bloques)
+    campos = TIPOS_CAMPO[tipo]
+    clave = TIPOS[tipo][1]
+    frecuencias = Counter(_cadenas_de(tipo, bloques))
+    # Las más frecuentes primero para que sus índices tengan menos dígitos
+    cadenas = [c for c, _ in sorted(frecuencias.items(), key=lambda x: -x[1])]
+    indice = {c: i for i, c in enumerate(cadenas)}
+
+    def valor_compacto(t, valor):
+        if t == 's':
+            return indice[valor]
+        if t == 'l':
+            return [indice[v] for v in valor]
+        if t == 'm':
+            plano = []
+            for region, nombres in valor.items():
+                plano.append(indice[region])
+                plano.append([indice[n] for n in nombres])
+            return plano
+        return [
+            indice[c] if isinstance(c, str)
+            else [indice[_tipo_contraindicacion(c)], indice[c.get('descripcion', '')]]
+            for c in valor
+        ]
+
+    salida = []
+    for bloque in bloques:
+        registros = []
+        for registro in bloque[clave]:
+            fila = [None if registro.get(c) is None else valor_compacto(t, registro[c]) for c, t in campos.items()]
+            while fila and fila[-1] is None:
+                fila.pop()
+            registros.append(fila)
+        salida.append([indice[c] for c in _cabecera(tipo, bloque)] + [registros])
+    return {'v': VERSION, 'campos': [[c, t] for c, t in campos.items()], 'cadenas': cadenas, 'bloques': salida}
+
+
+def decodificar(tipo, datos):
+    """Inverso de codificar(): bloques en el formato del almacén (para verificar)."""
+    cadenas = datos['cadenas']
+    clave = TIPOS[tipo][1]
+
+    def valor(t, v):
+        if t == 's':
+            return cadenas[v]
+        if t == 'l':
+            return [cadenas[i] for i in v]
+        if t == 'm':
+            return {cadenas[v[i]]: [cadenas[j] for j in v[i + 1]] for i in range(0, len(v), 2)}
+        return [cadenas[c] if isinstance(c, int) else {'tipo': cadenas[c[0]], 'descripcion': cadenas[c[1]]}
+                for c in v]
+
+    bloques = []
+    for *cabecera, registros in datos['bloques']:
+        bloque = {'id': cadenas[cabecera[0]], 'nombre': cadenas[cabecera[1]]}
+        if tipo == 'enfermedades':
+            bloque['icono'] = cadenas[cabecera[2]]
+        bloque[clave] = [
+            {c: valor(t, v) for (c, t), v in zip(datos['campos'], fila) if v is not None}
+            for fila in registros
+        ]
+        bloques.append(bloque)
+    return bloques
+
+
+def payload_json(datos):
+    return json.dumps(datos, ensure_ascii=False, separators=(',', ':'))
+
+
+def _literal_js(texto):
+    """String JS entre comillas simples (el JSON no lleva saltos de línea)."""
+    texto = texto.replace('\\', '\\\\').replace("'", "\\'")
+    return "'" + texto.replace('\u2028', '\\u2028').replace('\u2029', '\\u2029') + "'"
+
+
+def render_modulo(tipo, payload):
+    archivo, interfaz, decodificador, cargador = MODULOS[tipo]
+    modulo = archivo.replace('-compacto.ts', '-expandidas')
+    return (
+        '// Pócima Salvage - Catálogo compacto (cadenas internadas, ver data/compacto.ts)\n'
+        '// Generado automáticamente por scripts/build-compact-catalog.py - no editar a mano\n\n'
+        f"import type {{ {interfaz} }} from './{modulo}';\n"
+        f"import {{ {decodificador} }} from './compacto';\n\n"
+        f'const datos = {_literal_js(payload)};\n\n'
+        f'let decodificado: {interfaz}[] | undefined;\n\n'
+        '// Decodifica el catálogo la primera vez que se pide\n'
+        f'export const {cargador} = (): {interfaz}[] => {{\n'
+        f'  if (!decodificado) decodificado = {decodificador}(datos);\n'
+        '  return decodificado;\n'
+        '};\n'
+    )
+
+
+def emit_compacto(tipo, store=None, ts_path=None):
+    """
+    Escribe el módulo compacto de `tipo` desde el almacén. Devuelve
+    (ruta, payload JSON, escrito).
+    """
+    store = store or CatalogStore(tipo)
+    path = compacto_path(tipo, ts_path)
+    payload = payload_json(codificar(tipo, store))
+    texto = render_modulo(tipo, payload)
+    try:
+        if read_text(path) == texto:
+            return path, payload, False
+    except OSError:
+        pass
+    write_atomic(path, texto)
+    return path, payload, True
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Cálculo offline del cruce enfermedades ↔ plantas de data/cruce-datos.ts.
+
+Reproduce getPlantasParaEnfermedad, getEnfermedadesParaPlanta y
+getMotivoRecomendacion con las propiedades ya normalizadas en bitsets
+(catalogo/propiedades.py, igual que data/propiedades-index.ts). Así la
+relación completa se obtiene en una pasada y la app sólo tiene que leer el
+índice generado.
+"""
+
+import os
+
+from .parser import DATA_DIR, parse_const, read_text
+
+CRUCE_TS = os.path.join(DATA_DIR, 'cruce-datos.ts')
+MAX_PLANTAS = 6
+MAX_ENFERMEDADES = 8
+
+
+def cargar_mapeo(path=CRUCE_TS):
+    """Lista ordenada (keyword, [propiedades]) de enfermedadToPropiedades."""
+    return list(parse_const(read_text(path), 'enfermedadToPropiedades').items())
+
+
+class Cruce:
+    """
+    Relación enfermedad ↔ planta sobre las listas planas del catálogo.
+
+    `plantas` y `enfermedades` deben estar en el orden de getAllPlantas() y
+    getAllEnfermedades(); los resultados son posiciones en esas listas. Las
+    propiedades se comparan con el vocabulario canónico (catalogo/propiedades.py):
+    cada planta es un bitset de términos y cada keyword del mapeo el bitset de
+    los términos que satisfacen sus propiedades requeridas.
+    """
+
+    def __init__(self, plantas, enfermedades, mapeo, vocabulario):
+        self.plantas = plantas
+        self.enfermedades = enfermedades
+        self.mapeo = mapeo
+        self.vocabulario = vocabulario
+
+        # keyword -> bitset de términos que satisfacen alguna de sus propiedades
+        self.requisitos = {kw: vocabulario.requisitos(props) for kw, props in mapeo}
+        # posición de planta -> id de término de cada propiedad (None si no tiene)
+        self.terminos_planta = [[vocabulario.id_de(p) for p in planta.propiedades] for planta in plantas]
+        self.bits_planta = [
+            sum(1 << i for i in set(ids) if i is not None) for ids in self.terminos_planta
+        ]
+
+        # sistemaId -> posiciones de las plantas relacionadas con el sistema
+        self.plantas_sistema = {}
+        for i, planta in enumerate(plantas):
+            for sistema_id in planta.sistemasRelacionados:
+                self.plantas_sistema.setdefault(sistema_id, []).append(i)
+        self._enfermedades_sistema = {}
+        for i, enfermedad in enumerate(enfermedades):
+            self._enfermedades_sistema.setdefault(enfermedad.sistemaId, []).append(i)
+
+        # posición de enfermedad -> entradas del mapeo cuya keyword encaja con ella
+        self.keywords = [self._keywords_de(e) for e in enfermedades]
+
+    def _keywords_de(self, enfermedad):
+        """Entradas del mapeo cuya keyword aparece en el nombre o la descripción."""
+        nombre = enfermedad.nombre.lower()
+        descripcion = enfermedad.descripcion.lower()
+        return [kw for kw, _ in self.mapeo if kw in nombre or kw in descripcion]
+
+    def plantas_para_enfermedad(self, e):
+        """Posiciones de plantas recomendadas para la enfermedad en la posición `e`."""
+        keywords = self.keywords[e]
+        sistema = self.plantas_sistema.get(self.enfermedades[e].sistemaId, [])
+        if not keywords:
+            return sistema[:MAX_PLANTAS]
+
+        relevantes = 0
+        for kw in keywords:
+            relevantes |= self.requisitos[kw]
+        resultado = []
+        for i, bits in enumerate(self.bits_planta):
+            if bits & relevantes:
+                resultado.append(i)
+                if len(resultado) == MAX_PLANTAS:
+                    return resultado
+
+        if len(resultado) < 3:
+            existentes = {self.plantas[i].id for i in resultado}
+            resultado += [i for i in sistema if self.plantas[i].id not in existentes]
+        return resultado[:MAX_PLANTAS]
+
+    def enfermedades_para_planta(self, p):
+        """Posiciones de enfermedades que la planta en la posición `p` ayuda a tratar."""
+        planta = self.plantas[p]
+        bits = self.bits_planta[p]
+        sistemas = planta.sistemasRelacionados
+        resultado = []
+        ids = set()
+
+        for e, enfermedad in enumerate(self.enfermedades):
+            if enfermedad.sistemaId not in sistemas or enfermedad.id in ids:
+                continue
+            for kw in self.keywords[e]:
+                if bits & self.requisitos[kw]:
+                    resultado.append(e)
+                    ids.add(enfermedad.id)
+                    break
+
+        if len(resultado) < 5:
+            for sistema_id in sistemas:
+                for e in self._enfermedades_sistema.get(sistema_id, []):
+                    if self.enfermedades[e].id not in ids:
+                        resultado.append(e)
+                        ids.add(self.enfermedades[e].id)
+                        if len(resultado) >= MAX_ENFERMEDADES:
+                            break
+                if len(resultado) >= MAX_ENFERMEDADES:
+                    break
+
+        return resultado[:MAX_ENFERMEDADES]
+
+    def motivo(self, p, e):
+        """Índices (en planta.propiedades) de las propiedades que explican la recomendación."""
+        terminos = self.terminos_planta[p]
+        for kw in self.keywords[e]:
+            requisitos = self.requisitos[kw]
+            indices = [i for i, t in enumerate(terminos) if t is not None and requisitos >> t & 1]
+            if indices:
+                return indices[:3]
+        return list(range(min(3, len(terminos))))
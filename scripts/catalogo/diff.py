@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+Diferencias estructurales entre dos versiones del catálogo.
+
+Una versión es la lista de bloques de un tipo (categorías con sus plantas o
+sistemas con sus enfermedades), como la guarda el almacén. `diferencia`
+compara dos versiones indexando cada registro por (bloque, id) —los ids sólo
+son únicos dentro de un bloque—, así que el coste es lineal en el tamaño del
+catálogo, y produce un delta por campo:
+
+    {
+      "formato": "pocima-delta", "v": 2, "tipo": "plantas",
+      "base": "<hash>", "destino": "<hash>",
+      "bloques": {
+        "añadidos": [<bloque completo>],
+        "eliminados": ["<id>"],
+        "cambiados": {"<id>": {"=": {"nombre": "..."}, "-": ["icono"]}},
+        "orden": ["<id>", ...]                       (sólo si cambió)
+      },
+      "registros": {
+        "añadidos": {"<bloque>": [<registro>]},
+        "eliminados": {"<bloque>": ["<id>"]},
+        "cambiados": {"<bloque>": {"<id>": {"=": {campo: valor}, "-": [campo]}}},
+        "orden": {"<bloque>": ["<id>", ...]}         (sólo los bloques reordenados)
+      }
+    }
+
+`aplicar` reconstruye la versión destino a partir de la base y comprueba los
+hashes de ambas, así que un delta nunca se aplica sobre otra versión. Los
+deltas v1 guardaban los atributos de bloque cambiados sin "=" ni "-" (no
+podían quitar un atributo) y se siguen pudiendo aplicar.
+"""
+
+import hashlib
+import json
+import os
+import subprocess
+
+from .parser import REPO_ROOT, iter_categorias, iter_sistemas, read_text
+from .store import INDEX_FILE, STORE_DIR, TIPOS, CatalogStore
+
+FORMATO = 'pocima-delta'
+VERSION = 2
+VERSIONES_SOPORTADAS = (1, 2)
+
+
+class DeltaError(ValueError):
+    """Delta mal formado o aplicado sobre una versión distinta de su base."""
+
+
+def hash_version(bloques):
+    """Hash del contenido de una versión (independiente del orden de los campos)."""
+    datos = json.dumps(bloques, ensure_ascii=False, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(datos.encode('utf-8')).hexdigest()
+
+
+def _indexar(bloque_id, registros):
+    """id -> registro de un bloque; los ids repetidos dentro de un bloque no tienen delta posible."""
+    por_id = {}
+    for registro in registros:
+        if registro.get('id') in por_id:
+            raise DeltaError(f"Id repetido en el bloque {bloque_id}: {registro.get('id')}")
+        por_id[registro.get('id')] = registro
+    return por_id
+
+
+_FALTA = object()
+
+
+def _diferencia_registro(antes, despues):
+    cambio = {}
+    asignar = {c: v for c, v in despues.items() if antes.get(c, _FALTA) != v}
+    if asignar:
+        cambio['='] = asignar
+    quitar = [c for c in antes if c not in despues]
+    if quitar:
+        cambio['-'] = quitar
+    return cambio
+
+
+def diferencia(tipo, base, destino):
+    """Delta que lleva la versión `base` a `destino` (listas de bloques de `tipo`)."""
+    clave = TIPOS[tipo][1]
+    delta = {
+        'formato': FORMATO, 'v': VERSION, 'tipo': tipo,
+        'base': hash_version(base), 'destino': hash_version(destino),
+        'bloques': {'añadidos': [], 'eliminados': [], 'cambiados': {}},
+        'registros': {'añadidos': {}, 'eliminados': {}, 'cambiados': {}, 'orden': {}},
+    }
+    bloques_base = {b['id']: b for b in base}
+    ids_destino = {b['id'] for b in destino}
+
+    for bloque in destino:
+        previo = bloques_base.get(bloque['id'])
+        if previo is None:
+            delta['bloques']['añadidos'].append(bloque)
+            continue
+        atributos = _diferencia_registro({c: v for c, v in previo.items() if c != clave},
+                                         {c: v for c, v in bloque.items() if c != clave})
+        if atributos:
+            delta['bloques']['cambiados'][bloque['id']] = atributos
+
+        por_id = _indexar(previo['id'], previo[clave])
+        nuevos = _indexar(bloque['id'], bloque[clave])
+        añadidos = []
+        cambiados = {}
+        for id_, registro in nuevos.items():
+            anterior = por_id.get(id_)
+            if anterior is None:
+                añadidos.append(registro)
+            elif anterior != registro:
+                cambiados[id_] = _diferencia_registro(anterior, registro)
+        eliminados = [id_ for id_ in por_id if id_ not in nuevos]
+        if añadidos:
+            delta['registros']['añadidos'][bloque['id']] = añadidos
+        if eliminados:
+            delta['registros']['eliminados'][bloque['id']] = eliminados
+        if cambiados:
+            delta['registros']['cambiados'][bloque['id']] = cambiados
+        # Orden que resultaría de quitar los eliminados y añadir los nuevos al final
+        implicito = [id_ for id_ in por_id if id_ in nuevos]
+        implicito += [id_ for id_ in nuevos if id_ not in por_id]
+        if implicito != list(nuevos):
+            delta['registros']['orden'][bloque['id']] = list(nuevos)
+
+    delta['bloques']['eliminados'] = [b['id'] for b in base if b['id'] not in ids_destino]
+    implicito = [b['id'] for b in base if b['id'] in ids_destino]
+    implicito += [b['id'] for b in destino if b['id'] not in bloques_base]
+    if implicito != [b['id'] for b in destino]:
+        delta['bloques']['orden'] = [b['id'] for b in destino]
+    return delta
+
+
+def vacio(delta):
+    return delta['base'] == delta['destino']
+
+
+def resumen(delta):
+    """Conteos de un delta: {'bloques añadidos': n, ...} sin las entradas a cero."""
+    b, r = delta['bloques'], delta['registros']
+    conteos = {
+        'bloques añadidos': len(b['añadidos']),
+        'bloques eliminados': len(b['eliminados']),
+        'bloques cambiados': len(b['cambiados']),
+        'registros añadidos': sum(len(v) for v in r['añadidos'].values()),
+        'registros eliminados': sum(len(v) for v in r['eliminados'].values()),
+        'registros cambiados': sum(len(v) for v in r['cambiados'].values()),
+        'campos cambiados': sum(len(c.get('=', ())) + len(c.get('-', ()))
+                                for v in r['cambiados'].values() for c in v.values()),
+        'bloques reordenados': len(r['orden']) + (1 if 'orden' in b else 0),
+    }
+    return {k: n for k, n in conteos.items() if n}
+
+
+def aplicar(delta, base):
+    """Versión destino de `delta` a partir de `base` (no modifica `base`)."""
+    if delta.get('formato') != FORMATO or delta.get('v') not in VERSIONES_SOPORTADAS:
+        raise DeltaError(f"Formato de delta no soportado: {delta.get('formato')} v{delta.get('v')}")
+    if hash_version(base) != delta['base']:
+        raise DeltaError("El delta no corresponde a esta versión del catálogo (hash base distinto)")
+    clave = TIPOS[delta['tipo']][1]
+    b, r = delta['bloques'], delta['registros']
+    eliminados = set(b['eliminados'])
+
+    bloques = {}
+    orden = []
+    for previo in base:
+        if previo['id'] in eliminados:
+            continue
+        bloque = {c: v for c, v in previo.items() if c != clave}
+        cambio = b['cambiados'].get(previo['id'], {})
+        if delta['v'] == 1:
+            bloque.update(cambio)
+        else:
+            bloque = _aplicar_cambio(bloque, cambio)
+        bloque[clave] = _aplicar_registros(previo['id'], previo[clave], r)
+        bloques[previo['id']] = bloque
+        orden.append(previo['id'])
+    for añadido in b['añadidos']:
+        bloques[añadido['id']] = añadido
+        orden.append(añadido['id'])
+
+    resultado = [bloques[i] for i in b.get('orden', orden)]
+    if hash_version(resultado) != delta['destino']:
+        raise DeltaError("El resultado de aplicar el delta no coincide con el hash destino")
+    return resultado
+
+
+def _aplicar_cambio(registro, cambio):
+    """Registro (o atributos de bloque) con los campos "-" quitados y los "=" asignados."""
+    resultado = {c: v for c, v in registro.items() if c not in cambio.get('-', ())}
+    resultado.update(cambio.get('=', {}))
+    return resultado
+
+
+def _aplicar_registros(bloque_id, registros, r):
+    quitar = set(r['eliminados'].get(bloque_id, ()))
+    cambios = r['cambiados'].get(bloque_id, {})
+    por_id = {}
+    for registro in registros:
+        id_ = registro.get('id')
+        if id_ in quitar:
+            continue
+        cambio = cambios.get(id_)
+        if cambio:
+            registro = _aplicar_cambio(registro, cambio)
+        por_id[id_] = registro
+    for registro in r['añadidos'].get(bloque_id, ()):
+        por_id[registro.get('id')] = registro
+    orden = r['orden'].get(bloque_id)
+    if orden is None:
+        return list(por_id.values())
+    return [por_id[id_] for id_ in orden]
+
+
+# --- Carga de versiones ---------------------------------------------------------
+
+def _normalizar(tipo, bloques):
+    store = CatalogStore(tipo)
+    clave = store.clave
+    return [{**{c: v for c, v in b.items() if c != clave}, clave: [store.normalize(x) for x in b[clave]]}
+            for b in bloques]
+
+
+def _git_show(rev, path):
+    relativo = os.path.relpath(path, REPO_ROOT)
+    proceso = subprocess.run(['git', 'show', f'{rev}:{relativo}'], cwd=REPO_ROOT,
+                             capture_output=True, text=True, encoding='utf-8')
+    if proceso.returncode != 0:
+        raise FileNotFoundError(f"{rev}:{relativo}: {proceso.stderr.strip()}")
+    return proceso.stdout
+
+
+def cargar_version(tipo, origen=STORE_DIR):
+    """
+    Bloques de `tipo` desde `origen`:
+
+    - un directorio raíz de almacén (el que contiene plantas/ y enfermedades/)
+    - un módulo .ts generado (plantas-expandidas.ts / enfermedades-expandidas.ts)
+    - 'git:<rev>' para el almacén data/catalogo de una revisión
+    """
+    if origen.startswith('git:'):
+        rev = origen[4:]
+        subdir = os.path.join(STORE_DIR, TIPOS[tipo][0])
+        ids = json.loads(_git_show(rev, os.path.join(subdir, INDEX_FILE)))
+        return _normalizar(tipo, [json.loads(_git_show(rev, os.path.join(subdir, f'{i}.json'))) for i in ids])
+    if origen.endswith('.ts'):
+        leer = iter_categorias if tipo == 'plantas' else iter_sistemas
+        return _normalizar(tipo, [b.to_dict() for b in leer(text=read_text(origen))])
+    return _normalizar(tipo, list(CatalogStore(tipo, origen)))
@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+"""
+Detector de duplicados y casi duplicados en todo el catálogo.
+
+Una misma planta o enfermedad puede estar en varios bloques (categorías o
+sistemas) con datos que han divergido, o aparecer con otro id. La detección
+recorre el catálogo una vez y no compara todos los pares:
+
+- Duplicados exactos: un diccionario por clave normalizada (id, nombre y el
+  binomio del nombre científico) agrupa los registros que la comparten.
+- Casi duplicados: cada texto (descripción y propiedades o síntomas) se
+  reduce a una firma MinHash sobre trigramas de palabras; las firmas se
+  parten en bandas (LSH) y sólo los registros que coinciden en alguna banda
+  son candidatos. Cada candidato se verifica con la similitud de Jaccard real.
+
+Los grupos resultantes (unión de todas las coincidencias) llevan una
+sugerencia de fusión: el registro más completo como canónico y la unión de
+sus listas con las del resto. Un texto casi igual entre registros cuyos
+nombres no se parecen no los une: suele ser una descripción de plantilla
+repetida ("El X es un fruto cítrico…") y se informa aparte.
+"""
+
+import hashlib
+import json
+import random
+import re
+import time
+
+from .alias import FUENTES, UMBRAL_DIFUSO, alias_de, normalizar_alias, trigramas_alias
+from .busqueda import tabla_plegado, plegar
+from .store import CatalogStore
+
+# tipo -> campos cuyo valor normalizado idéntico indica el mismo registro
+CLAVES = {
+    'plantas': ('id', 'nombre', 'nombreCientifico'),
+    'enfermedades': ('id', 'nombre'),
+}
+
+# tipo -> campos de texto que forman la firma MinHash
+TEXTOS = {
+    'plantas': ('descripcion', 'propiedades'),
+    'enfermedades': ('descripcion', 'sintomas'),
+}
+
+# Firmas de BANDAS x FILAS valores: dos textos con Jaccard s comparten alguna banda
+# con probabilidad 1 - (1 - s^FILAS)^BANDAS (~50 % en s = 0.5, ~98 % en s = 0.8)
+BANDAS = 16
+FILAS = 4
+SEMILLA = 20240601
+
+# Jaccard mínimo (sobre trigramas de palabras) para considerar dos textos casi duplicados
+UMBRAL_JACCARD = 0.5
+
+IDENTICO = 'identico'      # mismo id y mismos datos en varios bloques
+DIVERGENTE = 'divergente'  # mismo id con datos distintos
+CERCANO = 'cercano'        # ids distintos que parecen la misma entidad
+
+_MASCARAS = [random.Random(SEMILLA + i).getrandbits(64) for i in range(BANDAS * FILAS)]
+_TABLA = tabla_plegado()
+
+
+def binomio(nombre_cientifico):
+    """Género y especie normalizados: 'Ocimum basilicum L.' -> 'ocimumbasilicum'."""
+    # 'x' / '×' marcan un híbrido ('Mentha × piperita'), no forman parte del binomio
+    palabras = [p for p in re.findall(r'[^\W\d_]+', nombre_cientifico or '') if p.lower() != 'x']
+    return normalizar_alias(''.join(palabras[:2])) if len(palabras) >= 2 else ''
+
+
+def _texto(valor):
+    if isinstance(valor, list):
+        return ' '.join(v for v in valor if isinstance(v, str))
+    return valor if isinstance(valor, str) else ''
+
+
+def tejas(texto):
+    """Trigramas de palabras (ya plegadas) de un texto, como hashes de 64 bits."""
+    palabras = re.findall(r'[a-z0-9]+', plegar(texto, _TABLA))
+    if len(palabras) < 3:
+        palabras = palabras and [' '.join(palabras)]
+    else:
+        palabras = [' '.join(palabras[i:i + 3]) for i in range(len(palabras) - 2)]
+    return {int.from_bytes(hashlib.blake2b(p.encode('utf-8'), digest_size=8).digest(), 'little')
+            for p in palabras}
+
+
+def firma_minhash(hashes):
+    """Mínimo de cada permutación (XOR con una máscara fija) sobre los hashes de las tejas."""
+    return tuple(min([h ^ m for h in hashes]) for m in _MASCARAS)
+
+
+def _formas(tipo, registro):
+    return {normalizar_alias(a) for campo, _ in FUENTES[tipo] for a in alias_de(registro, campo)} - {''}
+
+
+def _nombres_parecidos(tipo, a, b):
+    """
+    True si comparten algún alias normalizado (nombre, id u otros nombres) o
+    si los nombres se parecen por trigramas tanto como pide el resolutor de alias.
+    """
+    if _formas(tipo, a) & _formas(tipo, b):
+        return True
+    ta = trigramas_alias(normalizar_alias(a.get('nombre') or ''))
+    tb = trigramas_alias(normalizar_alias(b.get('nombre') or ''))
+    return 2 * len(ta & tb) / (len(ta) + len(tb)) >= UMBRAL_DIFUSO
+
+
+def jaccard(a, b):
+    return len(a & b) / len(a | b) if a or b else 0.0
+
+
+class _Conjuntos:
+    """Unión-búsqueda sobre las posiciones de los registros."""
+
+    def __init__(self, n):
+        self.padre = list(range(n))
+
+    def raiz(self, i):
+        while self.padre[i] != i:
+            self.padre[i] = self.padre[self.padre[i]]
+            i = self.padre[i]
+        return i
+
+    def unir(self, a, b):
+        a, b = self.raiz(a), self.raiz(b)
+        if a != b:
+            self.padre[max(a, b)] = min(a, b)
+
+
+class EstadisticasDuplicados:
+    def __init__(self):
+        self.registros = 0
+        self.candidatos = 0
+        self.verificados = 0
+        self.grupos = 0
+        self.plantillas = 0
+        self.segundos = 0.0
+
+    def __str__(self):
+        return (f'{self.registros} registros, {self.candidatos} pares candidatos por LSH, '
+                f'{self.verificados} textos casi iguales, {self.grupos} grupos, '
+                f'{self.plantillas} textos de plantilla, {self.segundos * 1000:.0f} ms')
+
+
+def _completitud(registro):
+    """Campos con valor y tamaño del contenido: el registro más completo es el canónico."""
+    llenos = sum(1 for v in registro.values() if v)
+    return llenos, len(json.dumps(registro, ensure_ascii=False))
+
+
+def _unir_valores(valores):
+    """Unión de listas (sin repetir formas normalizadas) o de diccionarios de listas."""
+    if all(isinstance(v, list) for v in valores):
+        vistos = set()
+        union = []
+        for lista in valores:
+            for item in lista:
+                forma = normalizar_alias(item) if isinstance(item, str) else json.dumps(item, sort_keys=True)
+                if forma not in vistos:
+                    vistos.add(forma)
+                    union.append(item)
+        return union
+    if all(isinstance(v, dict) for v in valores):
+        claves = []
+        for d in valores:
+            claves.extend(k for k in d if k not in claves)
+        return {k: _unir_valores([d[k] for d in valores if k in d]) for k in claves}
+    return valores[0]
+
+
+def sugerir_fusion(registros):
+    """Registro canónico (el más completo) con las listas unidas y los huecos rellenados."""
+    canonico = max(registros, key=_completitud)
+    otros = [r for r in registros if r is not canonico]
+    fusion = dict(canonico)
+    for r in otros:
+        for campo, valor in r.items():
+            if campo not in fusion or not fusion[campo]:
+                fusion[campo] = valor
+    for campo, valor in fusion.items():
+        if campo == 'id' or not isinstance(valor, (list, dict)):
+            continue
+        presentes = [valor] + [r[campo] for r in otros if type(r.get(campo)) is type(valor)]
+        fusion[campo] = _unir_valores(presentes)
+    return canonico, fusion
+
+
+def detectar(tipo, store=None, umbral=UMBRAL_JACCARD):
+    """
+    Grupos de duplicados de un tipo de catálogo y sus estadísticas.
+
+    Cada grupo es un dict con los miembros (bloque, id, nombre), los motivos
+    que los unieron, su clase (IDENTICO, DIVERGENTE o CERCANO), el canónico,
+    los campos que difieren y la fusión sugerida.
+    """
+    inicio = time.perf_counter()
+    store = store or CatalogStore(tipo)
+    stats = EstadisticasDuplicados()
+    ubicados = [(bloque['id'], registro) for bloque in store for registro in bloque[store.clave]]
+    stats.registros = len(ubicados)
+    conjuntos = _Conjuntos(len(ubicados))
+    motivos = {}
+    similitud_plantilla = {}
+
+    def enlazar(a, b, motivo):
+        conjuntos.unir(a, b)
+        par = (min(a, b), max(a, b))
+        motivos.setdefault(par, set()).add(motivo)
+
+    # Duplicados exactos por clave normalizada
+    for campo in CLAVES[tipo]:
+        normalizar = binomio if campo == 'nombreCientifico' else normalizar_alias
+        indice = {}
+        for i, (_, registro) in enumerate(ubicados):
+            forma = normalizar(registro.get(campo) or '')
+            if forma:
+                indice.setdefault(forma, []).append(i)
+        for posiciones in indice.values():
+            for j in posiciones[1:]:
+                enlazar(posiciones[0], j, campo)
+
+    # Casi duplicados por MinHash + LSH sobre los textos
+    tejas_por_registro = [tejas(' '.join(_texto(r.get(c)) for c in TEXTOS[tipo])) for _, r in ubicados]
+    cubetas = {}
+    for i, conjunto in enumerate(tejas_por_registro):
+        if not conjunto:
+            continue
+        firma = firma_minhash(conjunto)
+        for banda in range(BANDAS):
+            cubetas.setdefault((banda, firma[banda * FILAS:(banda + 1) * FILAS]), []).append(i)
+    pares = set()
+    for posiciones in cubetas.values():
+        for a in range(len(posiciones)):
+            for b in range(a + 1, len(posiciones)):
+                pares.add((posiciones[a], posiciones[b]))
+    stats.candidatos = len(pares)
+    # Un texto casi igual sólo une registros si los nombres también se parecen; si no,
+    # suele ser una descripción de plantilla repetida y se informa aparte
+    similitud = {}
+    repetidos = _Conjuntos(len(ubicados))
+    for a, b in sorted(pares):
+        s = jaccard(tejas_por_registro[a], tejas_por_registro[b])
+        if s < umbral:
+            continue
+        if _nombres_parecidos(tipo, ubicados[a][1], ubicados[b][1]):
+            similitud[a, b] = s
+            enlazar(a, b, 'texto')
+        else:
+            similitud_plantilla[a, b] = s
+            repetidos.unir(a, b)
+    stats.verificados = len(similitud) + len(similitud_plantilla)
+
+    miembros = {}
+    for i in range(len(ubicados)):
+        miembros.setdefault(conjuntos.raiz(i), []).append(i)
+    enlaces_por_raiz = {}
+    for par, m in motivos.items():
+        enlaces_por_raiz.setdefault(conjuntos.raiz(par[0]), []).append((par, m))
+    grupos = []
+    for raiz, posiciones in miembros.items():
+        if len(posiciones) < 2:
+            continue
+        registros = [ubicados[i][1] for i in posiciones]
+        canonico, fusion = sugerir_fusion(registros)
+        ids = list(dict.fromkeys(r.get('id') for r in registros))
+        campos = list(dict.fromkeys(c for r in registros for c in r))
+        divergencias = {}
+        for campo in campos:
+            distintos = {json.dumps(r.get(campo), ensure_ascii=False, sort_keys=True) for r in registros}
+            if len(distintos) > 1:
+                divergencias[campo] = len(distintos)
+        if len(ids) > 1:
+            clase = CERCANO
+        else:
+            clase = DIVERGENTE if divergencias else IDENTICO
+        enlaces = enlaces_por_raiz[raiz]
+        grupos.append({
+            'clase': clase,
+            'miembros': [{'bloque': ubicados[i][0], 'id': ubicados[i][1].get('id'),
+                          'nombre': ubicados[i][1].get('nombre')} for i in posiciones],
+            'motivos': sorted({m for _, ms in enlaces for m in ms}),
+            'similitud': round(max((similitud.get(par, 0.0) for par, _ in enlaces), default=0.0), 3),
+            'canonico': {'bloque': ubicados[posiciones[registros.index(canonico)]][0], 'id': canonico.get('id')},
+            'renombrar': [i for i in ids if i != canonico.get('id')],
+            'divergencias': divergencias,
+            'fusion': fusion,
+        })
+    orden = {CERCANO: 0, DIVERGENTE: 1, IDENTICO: 2}
+    grupos.sort(key=lambda g: (orden[g['clase']], -len(g['miembros']), g['canonico']['id'] or ''))
+    stats.grupos = len(grupos)
+
+    plantillas = {}
+    for a, b in similitud_plantilla:
+        plantillas.setdefault(repetidos.raiz(a), set()).update((a, b))
+    plantillas = [{
+        'miembros': [{'bloque': ubicados[i][0], 'id': ubicados[i][1].get('id'),
+                      'nombre': ubicados[i][1].get('nombre')} for i in sorted(posiciones)],
+        'similitud': round(max(s for (a, _), s in similitud_plantilla.items() if a in posiciones), 3),
+    } for posiciones in plantillas.values()]
+    plantillas.sort(key=lambda p: -len(p['miembros']))
+    stats.plantillas = len(plantillas)
+    stats.segundos = time.perf_counter() - inicio
+    return grupos, plantillas, stats
@@ -0,0 +1,472 @@
+#!/usr/bin/env python3
+"""
+Emisor de los módulos TypeScript a partir del almacén JSON canónico.
+
+El emisor guarda junto al almacén un manifiesto (`_emitido.json`) con el hash
+de cada bloque emitido y su rango en el archivo .ts. En la siguiente
+ejecución sólo se vuelven a renderizar los bloques cuyo JSON cambió; el resto
+se copia tal cual del archivo existente, así que un arreglo de un campo
+produce un diff mínimo y no requiere parsear el catálogo entero.
+
+La emisión es en streaming: los rangos del manifiesto son offsets en bytes,
+los bloques reutilizados se leen del .ts anterior con mmap y el archivo nuevo
+se escribe bloque a bloque en un temporal que sólo reemplaza al .ts si su
+hash cambió. En memoria hay a la vez un bloque, no el catálogo entero; sólo
+cuando el manifiesto falta o está desfasado se parsea el .ts completo.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+
+from . import metricas
+from .chunks import chunks_dir, emit_chunks
+from .compacto import compacto_path, emit_compacto
+from .versiones import Versiones, versiones_dir
+from .parser import (CONTRAINDICACION_TIPOS, ENFERMEDADES_TS, HUELLA_DIGITOS, PLANTAS_TS, Enfermedad,
+                     Planta, iter_elements)
+from .store import AtomicWriter, CatalogStore, dump_json, write_atomic
+
+MANIFEST_FILE = '_emitido.json'
+
+# Tamaño de lectura al calcular el hash del .ts existente
+BLOQUE_LECTURA = 1 << 20
+
+PLANTAS_HEADER = '''// Pócima Salvage - Base de datos expandida de plantas medicinales
+// Generado automáticamente - Total: {total} plantas
+
+import { buscarEnIndice } from './busqueda';
+import { indiceBusquedaPlantas } from './busqueda-index';
+
+export interface PlantaExpandida {
+  id: string;
+  nombre: string;
+  nombreCientifico: string;
+  nombresAlternativos?: Record<string, string[]>;
+  propiedades: string[];
+  parteUsable: string;
+  dosis: string;
+  preparacion: string;
+  contraindicaciones: (string | ContraindicacionPlanta)[];
+  fuente?: string;
+  descripcion: string;
+  sistemasRelacionados: string[];
+  categoriaId: string;
+  categoria: string;
+}
+
+export interface ContraindicacionPlanta {
+  tipo: "embarazo" | "ninos" | "hipertension" | "diabetes" | "lactancia" | "alergia" | "medicamentos" | "otro";
+  descripcion: string;
+}
+
+export interface CategoriaPlanta {
+  id: string;
+  nombre: string;
+  plantas: PlantaExpandida[];
+}
+
+export const categoriasPlantas: CategoriaPlanta[] = [
+'''
+
+PLANTAS_FOOTER = '''];
+
+// Función para obtener todas las plantas como lista plana
+export const getAllPlantas = (): PlantaExpandida[] => {
+  return categoriasPlantas.flatMap(cat => cat.plantas);
+};
+
+// Función para buscar plantas (índice de trigramas sin acentos; filtro lineal si el índice está desactualizado)
+export const buscarPlantasExpandidas = (query: string): PlantaExpandida[] => {
+  const plantas = getAllPlantas();
+  const posiciones = buscarEnIndice(indiceBusquedaPlantas, query, huellaPlantas);
+  if (posiciones) return posiciones.map(i => plantas[i]);
+  const q = query.toLowerCase();
+  return plantas.filter(p =>
+    p.nombre.toLowerCase().includes(q) ||
+    p.nombreCientifico.toLowerCase().includes(q) ||
+    p.propiedades.some(prop => prop.toLowerCase().includes(q)) ||
+    p.descripcion.toLowerCase().includes(q)
+  );
+};
+
+// Función para obtener plantas por categoría
+export const getPlantasByCategoria = (categoriaId: string): PlantaExpandida[] => {
+  const categoria = categoriasPlantas.find(c => c.id === categoriaId);
+  return categoria?.plantas || [];
+};
+
+// Función para obtener una planta por ID
+export const getPlantaExpandidaById = (id: string): PlantaExpandida | undefined => {
+  return getAllPlantas().find(p => p.id === id);
+};
+
+// Función para obtener plantas por sistema corporal
+export const getPlantasBySistema = (sistemaId: string): PlantaExpandida[] => {
+  return getAllPlantas().filter(p => 
+    p.sistemasRelacionados.includes(sistemaId)
+  );
+};
+
+// Función para obtener plantas por propiedad
+export const getPlantasByPropiedad = (propiedad: string): PlantaExpandida[] => {
+  const prop = propiedad.toLowerCase();
+  return getAllPlantas().filter(p =>
+    p.propiedades.some(pr => pr.toLowerCase().includes(prop))
+  );
+};
+
+// Exportar conteo total
+export const totalPlantas = {total};
+
+// Huella del contenido: los índices generados la guardan para saber si están al día
+export const huellaPlantas = "{huella}";
+'''
+
+ENFERMEDADES_HEADER = '''// Pócima Salvage - Base de datos expandida de enfermedades por sistemas del cuerpo humano
+// Generado automáticamente - Total: {total} enfermedades
+
+import { buscarEnIndice } from './busqueda';
+import { indiceBusquedaEnfermedades } from './busqueda-index';
+
+export interface EnfermedadExpandida {
+  id: string;
+  nombre: string;
+  otrosNombres: string[];
+  descripcion: string;
+  sintomas?: string[];
+  causas?: string[];
+  sistemaId: string;
+}
+
+export interface SistemaCorporal {
+  id: string;
+  nombre: string;
+  icono: string;
+  enfermedades: EnfermedadExpandida[];
+}
+
+export const sistemasCorporales: SistemaCorporal[] = [
+'''
+
+ENFERMEDADES_FOOTER = '''];
+
+// Función para obtener todas las enfermedades como lista plana
+export const getAllEnfermedades = (): EnfermedadExpandida[] => {
+  return sistemasCorporales.flatMap(sistema => sistema.enfermedades);
+};
+
+// Función para buscar enfermedades (índice de trigramas sin acentos; filtro lineal si el índice está desactualizado)
+export const buscarEnfermedadesExpandidas = (query: string): EnfermedadExpandida[] => {
+  const enfermedades = getAllEnfermedades();
+  const posiciones = buscarEnIndice(indiceBusquedaEnfermedades, query, huellaEnfermedades);
+  if (posiciones) return posiciones.map(i => enfermedades[i]);
+  const q = query.toLowerCase();
+  return enfermedades.filter(e =>
+    e.nombre.toLowerCase().includes(q) ||
+    e.otrosNombres.some(n => n.toLowerCase().includes(q)) ||
+    e.descripcion.toLowerCase().includes(q)
+  );
+};
+
+// Función para obtener enfermedades por sistema
+export const getEnfermedadesBySistema = (sistemaId: string): EnfermedadExpandida[] => {
+  const sistema = sistemasCorporales.find(s => s.id === sistemaId);
+  return sistema?.enfermedades || [];
+};
+
+// Función para obtener una enfermedad por ID
+export const getEnfermedadExpandidaById = (id: string): EnfermedadExpandida | undefined => {
+  return getAllEnfermedades().find(e => e.id === id);
+};
+
+// Exportar conteo total
+export const totalEnfermedades = {total};
+
+// Huella del contenido: los índices generados la guardan para saber si están al día
+export const huellaEnfermedades = "{huella}";
+'''
+
+
+def ts_string(value):
+    """Literal de string TypeScript con comillas dobles."""
+    return json.dumps(value, ensure_ascii=False)
+
+
+def render_contraindicaciones(contras):
+    partes = []
+    for c in contras:
+        if isinstance(c, str):
+            partes.append(ts_string(c))
+            continue
+        tipo = c.get('tipo', 'otro')
+        if tipo not in CONTRAINDICACION_TIPOS:
+            tipo = 'otro'
+        partes.append(f'{{ tipo: "{tipo}", descripcion: {ts_string(c.get("descripcion", ""))} }}')
+    return '[' + ', '.join(partes) + ']'
+
+
+def render_registro(registro, campos, indent='        '):
+    lines = ['      {']
+    for campo in campos:
+        value = registro.get(campo)
+        if value is None:
+            continue
+        if campo == 'contraindicaciones':
+            rendered = render_contraindicaciones(value)
+        else:
+            rendered = ts_string(value)
+        lines.append(f'{indent}{campo}: {rendered},')
+    lines.append('      }')
+    return '\n'.join(lines)
+
+
+def render_categoria(categoria):
+    """Texto del bloque de una categoría, desde '{' hasta '}' inclusive."""
+    derivados = {'categoriaId': categoria['id'], 'categoria': categoria['nombre']}
+    plantas = ''.join(
+        render_registro({**p, **derivados}, Planta.CAMPOS) + ',\n' for p in categoria['plantas']
+    )
+    return (
+        '{\n'
+        f'    id: {ts_string(categoria["id"])},\n'
+        f'    nombre: {ts_string(categoria["nombre"])},\n'
+        '    plantas: [\n'
+        f'{plantas}'
+        '    ],\n'
+        '  }'
+    )
+
+
+def render_sistema(sistema):
+    """Texto del bloque de un sistema corporal, desde '{' hasta '}' inclusive."""
+    derivados = {'sistemaId': sistema['id']}
+    enfermedades = ''.join(
+        render_registro({**e, **derivados}, Enfermedad.CAMPOS) + ',\n' for e in sistema['enfermedades']
+    )
+    return (
+        '{\n'
+        f'    id: {ts_string(sistema["id"])},\n'
+        f'    nombre: {ts_string(sistema["nombre"])},\n'
+        f'    icono: {ts_string(sistema.get("icono", "🏥"))},\n'
+        '    enfermedades: [\n'
+        f'{enfermedades}'
+        '    ],\n'
+        '  }'
+    )
+
+
+# tipo -> (archivo .ts, nombre del export, header, footer, renderizador de bloque)
+MODULOS = {
+    'plantas': (PLANTAS_TS, 'categoriasPlantas', PLANTAS_HEADER, PLANTAS_FOOTER, render_categoria),
+    'enfermedades': (ENFERMEDADES_TS, 'sistemasCorporales', ENFERMEDADES_HEADER, ENFERMEDADES_FOOTER, render_sistema),
+}
+
+
+def _sha256(text):
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def _huella(h):
+    """
+    Huella de contenido a partir del sha256 en curso `h` (sin consumirlo): los
+    16 primeros dígitos hexadecimales bastan para distinguir emisiones.
+    """
+    return h.copy().hexdigest()[:HUELLA_DIGITOS]
+
+
+def _sha256_file(path):
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for parte in iter(lambda: f.read(BLOQUE_LECTURA), b''):
+            h.update(parte)
+            metricas.leidos(len(parte))
+    return h.hexdigest()
+
+
+def _load_manifest(path):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _spans_from_manifest(manifest, ts_sha256):
+    """Rangos de bloques del manifiesto si el .ts no se tocó desde la última emisión."""
+    # Los manifiestos sin 'unidad' guardaban offsets en caracteres
+    if not manifest or manifest.get('unidad') != 'bytes' or manifest.get('ts_sha256') != ts_sha256:
+        return None
+    return {b['id']: b for b in manifest['bloques']}
+
+
+def _spans_from_text(path, export):
+    """Rangos de bloques (en bytes) parseando el .ts (el manifiesto falta o está desfasado)."""
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        text = f.read()
+    spans = {}
+    pos = byte = 0
+    for obj, inicio, fin in iter_elements(text, export):
+        byte += len(text[pos:inicio].encode('utf-8'))
+        byte_fin = byte + len(text[inicio:fin].encode('utf-8'))
+        spans[obj.get('id')] = {'id': obj.get('id'), 'nombre': obj.get('nombre'), 'icono': obj.get('icono'),
+                                'inicio': byte, 'fin': byte_fin, 'hash': None}
+        pos, byte = fin, byte_fin
+    return spans
+
+
+class _ArchivoMapeado:
+    """El .ts existente mapeado en memoria, para copiar rangos sin leerlo entero."""
+
+    def __init__(self, path):
+        self.f = open(path, 'rb')
+        self.mm = mmap.mmap(self.f.fileno(), 0, access=mmap.ACCESS_READ) if os.path.getsize(path) else b''
+
+    def texto(self, inicio, fin):
+        return self.mm[inicio:fin].decode('utf-8')
+
+    def close(self):
+        if isinstance(self.mm, mmap.mmap):
+            self.mm.close()
+        self.f.close()
+
+
+def _textos_emitidos(ts_path, bloques):
+    """(resumen, texto) de cada bloque del .ts recién emitido, de uno en uno."""
+    archivo = _ArchivoMapeado(ts_path)
+    try:
+        for info in bloques:
+            yield info, archivo.texto(info['inicio'], info['fin'])
+    finally:
+        archivo.close()
+
+
+class EmitResult:
+    """
+    Resumen de una emisión: bloques re-renderizados, reutilizados, si se
+    escribió el .ts, cuántos archivos de chunks se escribieron o borraron,
+    si se reescribió el módulo compacto, la versión registrada (si hubo una
+    nueva) y la huella del contenido escrita en el .ts.
+    """
+
+    __slots__ = ('rendered', 'reused', 'written', 'total', 'chunks', 'compacto', 'version', 'huella')
+
+    def __init__(self):
+        self.rendered = []
+        self.reused = []
+        self.written = False
+        self.total = 0
+        self.chunks = 0
+        self.compacto = False
+        self.version = None
+        self.huella = None
+
+
+def emit(tipo, store=None, ts_path=None, full=False, chunks=None, compacto=None, versiones=None):
+    """
+    Regenera el módulo .ts de `tipo` ('plantas' o 'enfermedades') desde el almacén.
+
+    Con full=True ignora el manifiesto y renderiza todos los bloques. Con
+    chunks=True escribe además un módulo por bloque y su índice (ver
+    catalogo/chunks.py); por defecto se escriben sólo si ya existen, para que
+    cualquier script que re-emita el catálogo los mantenga al día. Lo mismo
+    vale para `compacto` y el módulo con cadenas internadas (catalogo/compacto.py),
+    y para `versiones`: si hay historial de versiones (catalogo/versiones.py),
+    cada cambio del catálogo se registra como una versión nueva.
+    """
+    with metricas.fase(f'emitir-{tipo}') as medida:
+        result = _emit(tipo, store, ts_path, full, chunks, compacto, versiones)
+        medida.registros = result.total
+    return result
+
+
+def _emit(tipo, store, ts_path, full, chunks, compacto, versiones):
+    store = store or CatalogStore(tipo)
+    default_path, export, header, footer, render = MODULOS[tipo]
+    ts_path = ts_path or default_path
+    manifest_path = os.path.join(store.dir, MANIFEST_FILE)
+
+    old_sha256 = _sha256_file(ts_path) if os.path.exists(ts_path) else None
+    spans = {}
+    if old_sha256 is not None and not full:
+        spans = _spans_from_manifest(_load_manifest(manifest_path), old_sha256)
+        if spans is None:
+            spans = _spans_from_text(ts_path, export)
+
+    # Primera pasada: qué bloques se reutilizan y cuántos registros hay (el total va en el header)
+    result = EmitResult()
+    manifest_bloques = []
+    reutilizados = {}
+    for bloque_id in store.ids():
+        raw = store.read_raw(bloque_id)
+        h = _sha256(raw)
+        prev = spans.get(bloque_id)
+        if prev and prev.get('hash') == h and 'nombre' in prev:
+            info = {'nombre': prev['nombre'], 'icono': prev.get('icono'), 'registros': prev['registros']}
+            reutilizados[bloque_id] = (prev['inicio'], prev['fin'])
+            result.reused.append(bloque_id)
+        else:
+            bloque = json.loads(raw)
+            info = {'nombre': bloque['nombre'], 'icono': bloque.get('icono'),
+                    'registros': len(bloque[store.clave])}
+            result.rendered.append(bloque_id)
+        if info['icono'] is None:
+            del info['icono']
+        manifest_bloques.append({'id': bloque_id, 'hash': h, **info})
+        result.total += info['registros']
+
+    # Segunda pasada: el .ts nuevo se escribe bloque a bloque en un temporal
+    total = str(result.total)
+    new_hash = hashlib.sha256()
+    offset = 0
+    anterior = _ArchivoMapeado(ts_path) if reutilizados else None
+    try:
+        with AtomicWriter(ts_path) as salida:
+            def escribir(texto):
+                nonlocal offset
+                datos = texto.encode('utf-8')
+                new_hash.update(datos)
+                offset += len(datos)
+                salida.write(texto)
+
+            escribir(header.replace('{total}', total))
+            for info in manifest_bloques:
+                if info['id'] in reutilizados:
+                    texto = anterior.texto(*reutilizados[info['id']])
+                else:
+                    texto = render(store.load(info['id']))
+                escribir('  ')
+                info['inicio'] = offset
+                escribir(texto)
+                info['fin'] = offset
+                escribir(',\n')
+            # La huella cubre header y bloques: cambia con cualquier edición o reordenación
+            result.huella = _huella(new_hash)
+            escribir(footer.replace('{total}', total).replace('{huella}', result.huella))
+            if new_hash.hexdigest() != old_sha256:
+                salida.commit()
+                result.written = True
+    finally:
+        if anterior is not None:
+            anterior.close()
+
+    if chunks is None:
+        chunks = os.path.isdir(chunks_dir(tipo, ts_path))
+    if chunks:
+        result.chunks = emit_chunks(tipo, _textos_emitidos(ts_path, manifest_bloques), ts_path, result.huella)
+    if compacto is None:
+        compacto = os.path.exists(compacto_path(tipo, ts_path))
+    if compacto and (result.written or full or not os.path.exists(compacto_path(tipo, ts_path))):
+        result.compacto = emit_compacto(tipo, store, ts_path)[2]
+    historial = Versiones(tipo, versiones_dir(ts_path))
+    if versiones is None:
+        versiones = historial.existe()
+    if versiones and (result.written or full or not historial.existe()):
+        version, creada = historial.registrar(list(store))
+        if creada:
+            result.version = version
+    manifest = {'ts_sha256': new_hash.hexdigest(), 'unidad': 'bytes', 'bloques': manifest_bloques}
+    if _load_manifest(manifest_path) != manifest:
+        write_atomic(manifest_path, dump_json(manifest))
+    return result
@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""
+Etapas de enriquecimiento con LLM: de qué archivo de trabajos parten, qué
+prompt construyen para cada lote y en qué generate_*.json dejan el resultado
+para el script process-* correspondiente.
+
+Las respuestas se guardan por entidad en la caché de catalogo/cache_llm.py;
+si se cambia el texto de una plantilla hay que subir su versión.
+"""
+
+import json
+
+from .cache_llm import clave
+from .resultados import rescatar
+
+SISTEMA = ("Eres un experto en botánica medicinal y medicina tradicional latinoamericana. "
+           "Respondes únicamente con JSON válido, sin texto adicional.")
+
+REGIONES = ('México', 'España', 'Colombia', 'Argentina', 'Perú', 'Chile', 'Caribe',
+            'Centroamérica', 'Indigena', 'USA_English', 'UK_English', 'Otros')
+
+VERSION_NOMBRES = 'nombres-alternativos/1'
+PLANTILLA_NOMBRES = '''Para cada planta de la lista, indica sus nombres comunes alternativos agrupados por región ({regiones}). Omite las regiones sin nombres conocidos y usa exactamente el id indicado.
+
+Responde sólo con JSON con esta forma:
+{{"plantas": [{{"id": "<id>", "nombresAlternativos": {{"<región>": ["nombre", "..."]}}}}]}}
+
+{encabezado}
+{entidades}'''
+
+VERSION_SINTOMAS = 'sintomas-causas/1'
+PLANTILLA_SINTOMAS = '''Para cada enfermedad de la lista, indica sus síntomas principales (4 a 8) y sus causas más frecuentes (3 a 6), en español y de forma breve. Usa exactamente el id indicado.
+
+Responde sólo con JSON con esta forma:
+{{"enfermedades": [{{"id": "<id>", "sintomas": ["..."], "causas": ["..."]}}]}}
+
+{encabezado}
+{entidades}'''
+
+
+class Etapa:
+    """Una etapa de enriquecimiento (entrada de trabajos -> generate_*.json)."""
+
+    def __init__(self, nombre, entrada, salida, plantilla, version, lista, campos, trabajos):
+        self.nombre = nombre
+        self.entrada = entrada
+        self.salida = salida
+        self.plantilla = plantilla
+        self.version = version
+        # clave de la lista de resultados en el JSON de respuesta ('plantas' / 'enfermedades')
+        self.lista = lista
+        # entradas de la entidad que determinan la respuesta (clave de caché)
+        self.campos = campos
+        self._trabajos = trabajos
+
+    def prompt(self, encabezado, entidades):
+        lineas = '\n'.join(linea_entidad(e) for e in entidades)
+        return self.plantilla.format(regiones=', '.join(REGIONES), encabezado=encabezado, entidades=lineas)
+
+    def trabajos(self, datos):
+        """[{'id', 'encabezado', 'prompt', 'entidades'}] a partir del JSON de entrada de la etapa."""
+        return [
+            {'id': id_, 'encabezado': encabezado, 'prompt': self.prompt(encabezado, entidades),
+             'entidades': entidades}
+            for id_, encabezado, entidades in self._trabajos(datos)
+        ]
+
+    def clave(self, entidad):
+        return clave(self.version, {c: entidad.get(c, '') for c in self.campos})
+
+    def por_entidad(self, texto):
+        """id -> resultado de la entidad en la respuesta del modelo (las que se rescaten si no es JSON válido)."""
+        datos, _ = rescatar(texto, self.lista)
+        if datos is None:
+            return {}
+        return {
+            item['id'].lower().strip(): item
+            for item in datos.get(self.lista, [])
+            if isinstance(item, dict) and isinstance(item.get('id'), str)
+        }
+
+    def con_cache(self, trabajos, cache):
+        """
+        Separa las entidades ya cacheadas. Devuelve los trabajos a enviar, con
+        el prompt reducido a las entidades que faltan; los lotes totalmente
+        cacheados no se envían.
+        """
+        pendientes = []
+        for trabajo in trabajos:
+            trabajo['cacheados'] = {}
+            faltan = []
+            for entidad in trabajo['entidades']:
+                valor = cache.get(self.clave(entidad))
+                if valor is None:
+                    faltan.append(entidad)
+                else:
+                    trabajo['cacheados'][entidad['id']] = valor
+            if faltan:
+                pendientes.append({**trabajo, 'prompt': self.prompt(trabajo['encabezado'], faltan),
+                                   'entidades': faltan})
+        return pendientes
+
+    def combinar(self, trabajos, resultados, cache):
+        """
+        Une lo cacheado con las respuestas nuevas (que se guardan en la caché)
+        y devuelve un resultado por trabajo, en el formato de generate_*.json.
+        """
+        por_id = {r['id']: r for r in resultados}
+        combinados = []
+        for trabajo in trabajos:
+            resultado = por_id.get(trabajo['id'])
+            nuevos = {}
+            if resultado and not resultado['error']:
+                nuevos = self.por_entidad(resultado['output']['json_data'])
+            items = []
+            for entidad in trabajo['entidades']:
+                valor = trabajo['cacheados'].get(entidad['id'])
+                if valor is None:
+                    valor = nuevos.get(entidad['id'].lower().strip())
+                    if valor is None:
+                        continue
+                    cache.put(self.clave(entidad), valor, {c: entidad.get(c, '') for c in self.campos})
+                items.append({**valor, 'id': entidad['id']})
+            error = resultado['error'] if resultado else None
+            combinados.append({
+                'id': trabajo['id'],
+                'input': trabajo['prompt'],
+                'output': {'json_data': json.dumps({self.lista: items}, ensure_ascii=False)},
+                'error': error,
+            })
+        return combinados
+
+
+def linea_entidad(entidad):
+    if entidad.get('nombreCientifico'):
+        return f"- {entidad['id']}: {entidad['nombre']} ({entidad['nombreCientifico']})"
+    return f"- {entidad['id']}: {entidad['nombre']}"
+
+
+def _trabajos_lotes(inputs):
+    # parallel_inputs.json, parallel_inputs_restantes.json y enfermedades_por_sistema.json:
+    # lotes ya repartidos por catalogo/lotes.py
+    for entrada in inputs:
+        yield entrada['lote'], entrada['encabezado'], entrada['entidades']
+
+
+ETAPAS = {
+    etapa.nombre: etapa for etapa in (
+        Etapa('nombres', 'parallel_inputs.json', 'generate_alternative_names.json',
+              PLANTILLA_NOMBRES, VERSION_NOMBRES, 'plantas', ('nombre', 'nombreCientifico'), _trabajos_lotes),
+        Etapa('restantes', 'parallel_inputs_restantes.json', 'generate_remaining_alternative_names.json',
+              PLANTILLA_NOMBRES, VERSION_NOMBRES, 'plantas', ('nombre', 'nombreCientifico'), _trabajos_lotes),
+        Etapa('sintomas', 'enfermedades_por_sistema.json', 'generate_symptoms_causes.json',
+              PLANTILLA_SINTOMAS, VERSION_SINTOMAS, 'enfermedades', ('nombre', 'sistema'), _trabajos_lotes),
+    )
+}
@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+Ejecutor asíncrono de los lotes de enriquecimiento contra un backend
+compatible con la API de OpenAI (/v1/chat/completions).
+
+Sustituye al procesador paralelo externo: recibe la lista de trabajos que
+antes se escribía en parallel_inputs*.json y produce el mismo formato
+generate_*.json ({"results": [{"input", "output": {"json_data"}, "error"}]})
+que leen los scripts process-*.
+
+- Límite de concurrencia (asyncio.Semaphore) y límite de peticiones por
+  segundo (cubeta de fichas).
+- Reintentos con espera exponencial y jitter para errores transitorios
+  (429, 5xx, timeouts).
+- Checkpoint de sólo-anexado (JSON lines): cada trabajo terminado se escribe
+  en cuanto acaba, y al relanzar sólo se ejecutan los que faltan.
+"""
+
+import asyncio
+import http.client
+import json
+import os
+import random
+import time
+import urllib.error
+import urllib.request
+
+from . import metricas
+from .store import write_atomic
+
+DEFAULT_BASE_URL = 'https://api.openai.com/v1'
+DEFAULT_MODEL = 'gpt-4o-mini'
+REINTENTABLES = {408, 409, 425, 429, 500, 502, 503, 504}
+
+
+class ErrorBackend(Exception):
+    """Fallo de una petición al backend; `reintentable` indica si vale la pena repetirla."""
+
+    def __init__(self, mensaje, reintentable=True):
+        super().__init__(mensaje)
+        self.reintentable = reintentable
+
+
+class BackendOpenAI:
+    """
+    Cliente mínimo de chat completions (sólo biblioteca estándar).
+
+    Sirve para OpenAI o cualquier servidor compatible, incluido el stub local
+    de scripts/stub-llm-server.py. La configuración por defecto sale de
+    OPENAI_BASE_URL, OPENAI_API_KEY y OPENAI_MODEL.
+    """
+
+    def __init__(self, base_url=None, api_key=None, modelo=None, timeout=120, temperatura=0.2):
+        self.base_url = (base_url or os.environ.get('OPENAI_BASE_URL') or DEFAULT_BASE_URL).rstrip('/')
+        self.api_key = api_key if api_key is not None else os.environ.get('OPENAI_API_KEY', '')
+        self.modelo = modelo or os.environ.get('OPENAI_MODEL') or DEFAULT_MODEL
+        self.timeout = timeout
+        self.temperatura = temperatura
+
+    def _post(self, cuerpo):
+        headers = {'Content-Type': 'application/json'}
+        if self.api_key:
+            headers['Authorization'] = f'Bearer {self.api_key}'
+        peticion = urllib.request.Request(
+            f'{self.base_url}/chat/completions',
+            data=json.dumps(cuerpo).encode('utf-8'),
+            headers=headers,
+            method='POST',
+        )
+        try:
+            with urllib.request.urlopen(peticion, timeout=self.timeout) as respuesta:
+                return json.loads(respuesta.read().decode('utf-8'))
+        except urllib.error.HTTPError as e:
+            raise ErrorBackend(f'HTTP {e.code} {e.reason}', e.code in REINTENTABLES) from e
+        except (urllib.error.URLError, TimeoutError, ConnectionError) as e:
+            raise ErrorBackend(f'Error de conexión: {e}') from e
+        except http.client.HTTPException as e:
+            # Cuerpo truncado (IncompleteRead) o respuesta HTTP mal formada
+            raise ErrorBackend(f'Respuesta incompleta: {e!r}') from e
+        except UnicodeDecodeError as e:
+            raise ErrorBackend(f'Respuesta no es UTF-8: {e}') from e
+        except json.JSONDecodeError as e:
+            raise ErrorBackend(f'Respuesta no es JSON: {e}') from e
+
+    async def completar(self, prompt, sistema=None):
+        """Texto de la respuesta del modelo para `prompt`."""
+        mensajes = []
+        if sistema:
+            mensajes.append({'role': 'system', 'content': sistema})
+        mensajes.append({'role': 'user', 'content': prompt})
+        cuerpo = {'model': self.modelo, 'messages': mensajes, 'temperature': self.temperatura}
+        datos = await asyncio.to_thread(self._post, cuerpo)
+        try:
+            return datos['choices'][0]['message']['content']
+        except (KeyError, IndexError, TypeError) as e:
+            raise ErrorBackend(f'Respuesta sin choices[0].message.content: {e}') from e
+
+
+class CubetaFichas:
+    """Limitador de peticiones por segundo (token bucket) para corrutinas."""
+
+    def __init__(self, tasa, capacidad=None):
+        self.tasa = tasa
+        self.capacidad = capacidad or max(1.0, tasa)
+        self.fichas = self.capacidad
+        self.ultimo = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def tomar(self):
+        if not self.tasa:
+            return
+        async with self._lock:
+            while True:
+                ahora = time.monotonic()
+                self.fichas = min(self.capacidad, self.fichas + (ahora - self.ultimo) * self.tasa)
+                self.ultimo = ahora
+                if self.fichas >= 1:
+                    self.fichas -= 1
+                    return
+                await asyncio.sleep((1 - self.fichas) / self.tasa)
+
+
+class Checkpoint:
+    """
+    Registro de sólo-anexado de trabajos terminados (una línea JSON por trabajo).
+
+    Una línea final truncada (el proceso murió mientras escribía) se ignora,
+    y ese trabajo se vuelve a ejecutar.
+    """
+
+    def __init__(self, path):
+        self.path = path
+
+    def cargar(self):
+        """id de trabajo -> resultado de los trabajos ya completados."""
+        hechos = {}
+        if not os.path.exists(self.path):
+            return hechos
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for linea in f:
+                try:
+                    entrada = json.loads(linea)
+                except json.JSONDecodeError:
+                    continue
+                if not entrada.get('error'):
+                    hechos[entrada['id']] = entrada
+        return hechos
+
+    def registrar(self, entrada):
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(entrada, ensure_ascii=False) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+
+
+class Estadisticas:
+    def __init__(self):
+        self.completados = 0
+        self.reanudados = 0
+        self.fallidos = 0
+        self.reintentos = 0
+        self.segundos = 0.0
+
+    def __str__(self):
+        return (f'{self.completados} completados, {self.reanudados} reanudados del checkpoint, '
+                f'{self.fallidos} fallidos, {self.reintentos} reintentos, {self.segundos:.1f} s')
+
+
+async def _ejecutar_uno(trabajo, backend, sistema, semaforo, cubeta, reintentos, espera_base, stats):
+    intento = 0
+    while True:
+        await cubeta.tomar()
+        async with semaforo:
+            try:
+                texto = await backend.completar(trabajo['prompt'], sistema)
+                return {'id': trabajo['id'], 'input': trabajo['prompt'],
+                        'output': {'json_data': texto}, 'error': None}
+            except ErrorBackend as e:
+                error = e
+        if not error.reintentable or intento >= reintentos:
+            return {'id': trabajo['id'], 'input': trabajo['prompt'], 'output': None, 'error': str(error)}
+        stats.reintentos += 1
+        espera = espera_base * (2 ** intento) * (0.5 + random.random())
+        intento += 1
+        print(f"  ↻ {trabajo['id']}: {error} (reintento {intento}/{reintentos} en {espera:.1f} s)")
+        await asyncio.sleep(espera)
+
+
+async def ejecutar(trabajos, backend, checkpoint=None, sistema=None, concurrencia=4,
+                   peticiones_por_segundo=2.0, reintentos=5, espera_base=1.0):
+    """
+    Ejecuta `trabajos` ([{'id', 'prompt', ...}]) y devuelve (resultados, stats).
+
+    Los resultados están en el orden de `trabajos`; los que ya estaban en el
+    checkpoint con el mismo prompt no se vuelven a pedir.
+    """
+    stats = Estadisticas()
+    inicio = time.perf_counter()
+    hechos = checkpoint.cargar() if checkpoint else {}
+    semaforo = asyncio.Semaphore(concurrencia)
+    cubeta = CubetaFichas(peticiones_por_segundo)
+
+    resultados = {}
+    pendientes = []
+    for trabajo in trabajos:
+        hecho = hechos.get(trabajo['id'])
+        if hecho and hecho['input'] == trabajo['prompt']:
+            resultados[trabajo['id']] = hecho
+            stats.reanudados += 1
+        else:
+            pendientes.append(trabajo)
+
+    async def correr(trabajo):
+        entrada = await _ejecutar_uno(trabajo, backend, sistema, semaforo, cubeta,
+                                      reintentos, espera_base, stats)
+        if checkpoint:
+            checkpoint.registrar(entrada)
+        resultados[trabajo['id']] = entrada
+        if entrada['error']:
+            stats.fallidos += 1
+            print(f"  ✗ {trabajo['id']}: {entrada['error']}")
+        else:
+            stats.completados += 1
+            print(f"  ✓ {trabajo['id']}")
+
+    with metricas.fase('peticiones-llm', len(pendientes)):
+        await asyncio.gather(*(correr(t) for t in pendientes))
+    stats.segundos = time.perf_counter() - inicio
+    return [resultados[t['id']] for t in trabajos], stats
+
+
+def escribir_resultados(path, resultados):
+    """Escribe el generate_*.json que consumen los scripts process-*."""
+    results = [{k: r[k] for k in ('input', 'output', 'error')} for r in resultados]
+    write_atomic(path, json.dumps({'results': results}, ensure_ascii=False, indent=2) + '\n')
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Planificador de lotes para las etapas de enriquecimiento con LLM
+(catalogo/etapas.py).
+
+Cada entidad cuesta unos tokens de prompt (su línea en la lista) y unos
+tokens de salida esperados (la media de lo que ocupa esa respuesta en las
+entidades del catálogo que ya la tienen); cada lote cuesta además el texto
+fijo de la plantilla y del mensaje de sistema. Con un modelo de coste
+(latencia fija + tokens a la velocidad de entrada y de salida del modelo) se
+reparten las entidades, en su orden, en lotes consecutivos de duración
+parecida sin pasar del presupuesto de tokens por lote ni del límite de
+salida. Al ser consecutivos, las entidades de una misma categoría o sistema
+quedan casi siempre juntas.
+
+El número de lotes es el mínimo que respeta el presupuesto, redondeado a un
+múltiplo de la concurrencia para que ningún hilo quede ocioso en la última
+ronda. La duración total
+prevista (makespan) simula el reparto de run-enrichment.py: cada lote va al
+primer hilo libre, en orden.
+"""
+
+import heapq
+import json
+import math
+
+from .etapas import SISTEMA, linea_entidad
+from .texto import estimar_tokens
+
+# Tokens estimados (entrada + salida) por lote y de salida por lote
+PRESUPUESTO_TOKENS = 8000
+MAX_SALIDA = 4000
+CONCURRENCIA = 4
+
+# Modelo de coste de una petición
+LATENCIA = 1.0
+TOKENS_ENTRADA_POR_SEGUNDO = 2000.0
+TOKENS_SALIDA_POR_SEGUNDO = 60.0
+
+# Salida esperada por entidad cuando el catálogo no tiene ejemplos
+SALIDA_POR_DEFECTO = 120
+
+
+class ModeloCoste:
+    """Segundos estimados de una petición: latencia fija + entrada y salida a su velocidad."""
+
+    def __init__(self, latencia=LATENCIA, entrada_por_segundo=TOKENS_ENTRADA_POR_SEGUNDO,
+                 salida_por_segundo=TOKENS_SALIDA_POR_SEGUNDO):
+        self.latencia = latencia
+        self.entrada_por_segundo = entrada_por_segundo
+        self.salida_por_segundo = salida_por_segundo
+
+    def segundos(self, entrada, salida):
+        return self.latencia + entrada / self.entrada_por_segundo + salida / self.salida_por_segundo
+
+
+class Lote:
+    def __init__(self, entidades, entrada, salida, segundos):
+        self.entidades = entidades
+        self.tokens_entrada = entrada
+        self.tokens_salida = salida
+        self.segundos = segundos
+
+
+class Plan:
+    """Lotes de una etapa con sus tokens y la duración prevista para una concurrencia."""
+
+    def __init__(self, lotes, concurrencia):
+        self.lotes = lotes
+        self.concurrencia = concurrencia
+        self.makespan = makespan([lote.segundos for lote in lotes], concurrencia)
+
+    def __str__(self):
+        if not self.lotes:
+            return '0 lotes'
+        tokens = [lote.tokens_entrada + lote.tokens_salida for lote in self.lotes]
+        segundos = [lote.segundos for lote in self.lotes]
+        return (f'{len(self.lotes)} lotes de {min(tokens)}-{max(tokens)} tokens '
+                f'({min(segundos):.0f}-{max(segundos):.0f} s), '
+                f'duración prevista {self.makespan:.0f} s con {self.concurrencia} en paralelo')
+
+
+def makespan(segundos, concurrencia):
+    """Duración total si cada lote va, en orden, al primero de `concurrencia` hilos que quede libre."""
+    libres = [0.0] * max(1, concurrencia)
+    for s in segundos:
+        heapq.heappush(libres, heapq.heappop(libres) + s)
+    return max(libres)
+
+
+def salida_media(registros, campos, defecto=SALIDA_POR_DEFECTO):
+    """Tokens medios de la respuesta de una entidad ({"id", campos...}) entre los registros que ya la tienen."""
+    tamaños = [
+        estimar_tokens(json.dumps({'id': r['id'], **{c: r[c] for c in campos}}, ensure_ascii=False))
+        for r in registros if all(r.get(c) for c in campos)
+    ]
+    return round(sum(tamaños) / len(tamaños)) if tamaños else defecto
+
+
+def fijo_lote(etapa, encabezado):
+    """Tokens de un lote sin entidades: plantilla, encabezado y mensaje de sistema."""
+    return estimar_tokens(SISTEMA) + estimar_tokens(etapa.prompt(encabezado, []))
+
+
+class Planificador:
+    """
+    Reparte entidades en lotes consecutivos de duración parecida.
+
+    `salida` son los tokens de salida esperados por entidad y `fijo` los
+    tokens fijos de cada lote (ver fijo_lote).
+    """
+
+    def __init__(self, salida, fijo, presupuesto=PRESUPUESTO_TOKENS, max_salida=MAX_SALIDA,
+                 concurrencia=CONCURRENCIA, coste=None):
+        self.salida = salida
+        self.fijo = fijo
+        self.presupuesto = presupuesto
+        self.max_salida = max_salida
+        self.concurrencia = concurrencia
+        self.coste = coste or ModeloCoste()
+
+    def _lote(self, entidades, entradas):
+        entrada = self.fijo + sum(entradas)
+        salida = self.salida * len(entidades)
+        return Lote(entidades, entrada, salida, self.coste.segundos(entrada, salida))
+
+    def _cabe(self, entrada, n):
+        return n == 1 or (entrada + self.salida * n <= self.presupuesto and self.salida * n <= self.max_salida)
+
+    def _cortes(self, entradas, limite):
+        """Inicios de los lotes al llenar cada uno sin pasar de `limite` segundos ni del presupuesto."""
+        cortes = [0]
+        entrada = self.fijo
+        for i, tokens in enumerate(entradas):
+            n = i - cortes[-1] + 1
+            if n > 1 and (not self._cabe(entrada + tokens, n)
+                          or self.coste.segundos(entrada + tokens, self.salida * n) > limite):
+                cortes.append(i)
+                entrada = self.fijo
+            entrada += tokens
+        return cortes
+
+    def agrupar(self, grupos):
+        """Plan con un lote por grupo, tal como vienen (para comparar con el reparto)."""
+        lotes = []
+        for entidades in grupos:
+            entradas = [estimar_tokens(linea_entidad(e) + '\n') for e in entidades]
+            lotes.append(self._lote(entidades, entradas))
+        return Plan(lotes, self.concurrencia)
+
+    def repartir(self, entidades):
+        """
+        Plan con el menor número de lotes consecutivos que caben en el
+        presupuesto, redondeado a un múltiplo de la concurrencia, con la
+        duración del lote más largo lo más baja posible.
+        """
+        if not entidades:
+            return Plan([], self.concurrencia)
+        entradas = [estimar_tokens(linea_entidad(e) + '\n') for e in entidades]
+        # Con límite de tiempo infinito, los cortes son el mínimo de lotes que cabe en el presupuesto;
+        # se redondea a un múltiplo de la concurrencia para que todas las rondas vayan llenas
+        minimo = len(self._cortes(entradas, math.inf))
+        ronda = max(1, self.concurrencia)
+        n = min(len(entidades), math.ceil(minimo / ronda) * ronda)
+        # Búsqueda binaria del menor límite (en décimas de segundo) que da n lotes o menos
+        bajo = 0
+        alto = math.ceil(10 * self.coste.segundos(self.fijo + sum(entradas), self.salida * len(entidades)))
+        while bajo < alto:
+            medio = (bajo + alto) // 2
+            if len(self._cortes(entradas, medio / 10)) <= n:
+                alto = medio
+            else:
+                bajo = medio + 1
+        cortes = self._cortes(entradas, bajo / 10) + [len(entidades)]
+        lotes = [self._lote(entidades[a:b], entradas[a:b]) for a, b in zip(cortes, cortes[1:])]
+        return Plan(lotes, self.concurrencia)
+
+
+def encabezado(singular, plural, nombres, lista):
+    """'CATEGORIA: X\\nPLANTAS:' para un lote de un solo grupo, 'CATEGORIAS: X, Y\\nPLANTAS:' si mezcla varios."""
+    distintos = list(dict.fromkeys(nombres))
+    if not distintos:
+        return f'{lista}:'
+    if len(distintos) == 1:
+        return f'{singular}: {distintos[0]}\n{lista}:'
+    return f"{plural}: {', '.join(distintos)}\n{lista}:"
+
+
+def argumentos(parser):
+    """Opciones comunes de los scripts que preparan lotes."""
+    parser.add_argument('--presupuesto', type=int, default=PRESUPUESTO_TOKENS,
+                        help=f'Tokens estimados (entrada + salida) por lote (default: {PRESUPUESTO_TOKENS})')
+    parser.add_argument('--max-salida', type=int, default=MAX_SALIDA,
+                        help=f'Tokens de salida estimados por lote (default: {MAX_SALIDA})')
+    parser.add_argument('--concurrencia', type=int, default=CONCURRENCIA,
+                        help=f'Peticiones en paralelo de run-enrichment.py (default: {CONCURRENCIA})')
+
+
+def planificador(args, salida, fijo):
+    return Planificador(salida, fijo, presupuesto=args.presupuesto, max_salida=args.max_salida,
+                        concurrencia=args.concurrencia)
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Motor de fusión por lotes para los parches de enriquecimiento.
+
+Un lote es un diccionario {clave: {campo: valor}}; la clave suele ser el id
+de la planta o enfermedad. Cada campo se fusiona según su política:
+
+    replace         el valor del parche reemplaza al actual
+    union-regiones  nombresAlternativos: une las listas región por región,
+                    sin duplicados (comparación sin mayúsculas) y en orden
+    fill-if-empty   sólo se escribe si el campo actual falta o está vacío
+
+El lote completo se aplica en una sola pasada sobre el almacén, cada bloque
+modificado se guarda atómicamente y el módulo .ts se re-emite una sola vez.
+"""
+
+from collections import Counter
+
+from . import metricas
+from .emitter import emit
+from .store import CatalogStore
+
+REPLACE = 'replace'
+UNION_REGIONES = 'union-regiones'
+FILL_IF_EMPTY = 'fill-if-empty'
+
+POLITICAS = (REPLACE, UNION_REGIONES, FILL_IF_EMPTY)
+
+
+def union_regiones(actual, nuevo):
+    """Une dos diccionarios región -> [nombres] sin repetir nombres por región."""
+    resultado = {region: list(nombres) for region, nombres in (actual or {}).items()}
+    for region, nombres in (nuevo or {}).items():
+        destino = resultado.setdefault(region, [])
+        vistos = {n.casefold() for n in destino}
+        for nombre in nombres:
+            if nombre.casefold() not in vistos:
+                vistos.add(nombre.casefold())
+                destino.append(nombre)
+    return resultado
+
+
+def merge_field(actual, nuevo, politica):
+    """Valor resultante de fusionar `nuevo` sobre `actual` con `politica`."""
+    if politica == REPLACE:
+        return nuevo
+    if politica == FILL_IF_EMPTY:
+        # Un valor vacío no rellena nada: el campo que falta sigue faltando
+        return actual if actual or not nuevo else nuevo
+    if politica == UNION_REGIONES:
+        return union_regiones(actual, nuevo) if nuevo else actual
+    raise ValueError(f"Política de fusión desconocida: {politica}")
+
+
+class MergeResult:
+    """Estadísticas de un lote: registros modificados, claves sin registro, campos tocados."""
+
+    __slots__ = ('actualizados', 'sin_cambios', 'no_encontrados', 'campos', 'bloques', 'emision')
+
+    def __init__(self):
+        self.actualizados = 0
+        self.sin_cambios = 0
+        self.no_encontrados = []
+        self.campos = Counter()
+        self.bloques = []
+        self.emision = None
+
+
+def apply_batch(tipo, parches, politicas=None, clave='id', buscar=None, resolver=None, store=None, emitir=True,
+                ts_path=None):
+    """
+    Aplica `parches` al catálogo `tipo` ('plantas' o 'enfermedades').
+
+    - politicas: {campo: política}; los campos sin entrada usan REPLACE.
+    - clave: campo del registro con el que se busca el parche ('id', 'nombre').
+    - buscar: función opcional (registro, parches) -> clave | None para
+      resoluciones más flexibles que la igualdad exacta de `clave`.
+    - resolver: ResolutorAlias opcional (catalogo.alias); cada clave del lote
+      se resuelve a un id una sola vez antes de recorrer el almacén, así que
+      puede ser el id, el nombre o cualquier alias de la entidad. Las
+      estadísticas quedan en `resolver.stats`.
+
+    Un parche se aplica a todos los registros que lo resuelven (un mismo id
+    puede aparecer en varias categorías).
+    """
+    store = store or CatalogStore(tipo)
+    politicas = politicas or {}
+    result = MergeResult()
+    usados = set()
+    pendientes = []
+
+    with metricas.fase(f'fusionar-{tipo}') as medida:
+        # id -> claves del lote que lo resuelven, en el orden del lote
+        por_id = {}
+        if resolver is not None:
+            for k in parches:
+                entidad, _ = resolver.resolver(k)
+                if entidad is not None:
+                    por_id.setdefault(entidad, []).append(k)
+
+        for bloque in store:
+            modificado = False
+            for registro in bloque[store.clave]:
+                if resolver is not None:
+                    claves = por_id.get(registro.get('id'), ())
+                else:
+                    k = buscar(registro, parches) if buscar is not None else registro.get(clave)
+                    claves = (k,) if k in parches else ()
+                if not claves:
+                    continue
+                usados.update(claves)
+                cambio = False
+                for k in claves:
+                    for campo, nuevo in parches[k].items():
+                        actual = registro.get(campo)
+                        valor = merge_field(actual, nuevo, politicas.get(campo, REPLACE))
+                        if valor != actual:
+                            registro[campo] = valor
+                            result.campos[campo] += 1
+                            cambio = True
+                if cambio:
+                    result.actualizados += 1
+                    modificado = True
+                else:
+                    result.sin_cambios += 1
+            if modificado:
+                pendientes.append(bloque)
+        medida.registros = result.actualizados + result.sin_cambios
+
+    # Las escrituras se hacen al final, cuando todo el lote se fusionó sin errores
+    with metricas.fase(f'guardar-{tipo}', len(pendientes)):
+        for bloque in pendientes:
+            if store.save(bloque):
+                result.bloques.append(bloque['id'])
+
+    result.no_encontrados = [k for k in parches if k not in usados]
+    if emitir and result.bloques:
+        result.emision = emit(tipo, store, ts_path)
+    return result
@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+"""
+Métricas de ejecución de los scripts de datos.
+
+Cualquier script que importe `catalogo` queda instrumentado si se define
+POCIMA_METRICAS=<archivo.jsonl>: al terminar añade al archivo una línea JSON
+con el script, sus argumentos, la duración, el pico de memoria (tracemalloc y
+residente), los bytes leídos y escritos, los errores de parseo y, por cada
+fase, su tiempo, sus registros por segundo, sus bytes y sus errores. Con
+POCIMA_PERFIL=<directorio> (con o sin POCIMA_METRICAS) se guarda un perfil de
+cProfile del hilo principal (<script>-<pid>.prof, para pstats, snakeviz o
+flameprof).
+run-pipeline.py los define con --metricas y --perfil.
+
+Las fases se marcan en el código compartido (parseo del .ts, lectura de
+generate_*.json, fusión, emisión, auditoría) y donde haga falta en los scripts:
+
+    with metricas.fase('ranking') as m:
+        ...
+        m.registros += len(plantas)
+
+    for categoria in metricas.medir_iter('parsear-ts', iter_categorias()):
+        ...
+
+medir_iter sólo cuenta el tiempo en que el iterador produce cada elemento,
+no el del bucle que lo consume. Los tiempos de fases anidadas son
+inclusivos, y los bytes y errores se suman a la fase activa más interna.
+Sin ninguna de las dos variables todo esto no hace nada; con métricas, tracemalloc hace que el
+script vaya algo más lento, así que los tiempos sirven para comparar fases
+entre sí más que como duración absoluta.
+"""
+
+import atexit
+import json
+import multiprocessing
+import os
+import resource
+import sys
+import time
+import tracemalloc
+
+ENTORNO_METRICAS = 'POCIMA_METRICAS'
+ENTORNO_PERFIL = 'POCIMA_PERFIL'
+
+_sesion = None
+
+
+class Fase:
+    __slots__ = ('nombre', 'segundos', 'llamadas', 'registros', 'bytes_leidos', 'bytes_escritos', 'errores')
+
+    def __init__(self, nombre):
+        self.nombre = nombre
+        self.segundos = 0.0
+        self.llamadas = 0
+        self.registros = 0
+        self.bytes_leidos = 0
+        self.bytes_escritos = 0
+        self.errores = 0
+
+    def to_dict(self):
+        return {
+            'fase': self.nombre,
+            'segundos': round(self.segundos, 4),
+            'llamadas': self.llamadas,
+            'registros': self.registros,
+            'registros_por_segundo': round(self.registros / self.segundos, 1) if self.segundos else None,
+            'bytes_leidos': self.bytes_leidos,
+            'bytes_escritos': self.bytes_escritos,
+            'errores': self.errores,
+        }
+
+
+def pico_memoria_mb():
+    """
+    Pico de memoria residente del proceso. En Linux se lee VmHWM, porque
+    ru_maxrss conserva tras exec el pico del proceso padre.
+    """
+    try:
+        with open('/proc/self/status', 'r') as f:
+            for linea in f:
+                if linea.startswith('VmHWM:'):
+                    return int(linea.split()[1]) / 1024
+    except OSError:
+        pass
+    # ru_maxrss está en KB en Linux y en bytes en macOS
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / (1024 * 1024) if sys.platform == 'darwin' else rss / 1024
+
+
+def _io_proceso():
+    """Bytes leídos y escritos por el proceso según el kernel (sólo Linux), o None."""
+    try:
+        with open('/proc/self/io', 'r') as f:
+            campos = dict(linea.split(': ') for linea in f.read().splitlines())
+        return {'rchar': int(campos['rchar']), 'wchar': int(campos['wchar'])}
+    except (OSError, KeyError, ValueError):
+        return None
+
+
+class Sesion:
+    """Métricas de una ejecución; se escriben al salir del intérprete."""
+
+    def __init__(self, destino, perfil=None):
+        self.destino = destino
+        self.script = os.path.basename(sys.argv[0]) if sys.argv and sys.argv[0] else 'python'
+        self.args = sys.argv[1:]
+        self.fecha = time.strftime('%Y-%m-%dT%H:%M:%S')
+        self.fases = {}
+        self.pila = []
+        self.total = Fase('total')
+        self._ultima_excepcion = None
+        self.inicio = time.perf_counter()
+        if destino:
+            tracemalloc.start()
+        self.perfil = None
+        self.perfil_path = None
+        if perfil:
+            import cProfile
+            os.makedirs(perfil, exist_ok=True)
+            nombre = os.path.splitext(self.script)[0]
+            self.perfil_path = os.path.join(perfil, f'{nombre}-{os.getpid()}.prof')
+            self.perfil = cProfile.Profile()
+            self.perfil.enable()
+        atexit.register(self.cerrar)
+
+    def fase(self, nombre):
+        fase = self.fases.get(nombre)
+        if fase is None:
+            fase = self.fases[nombre] = Fase(nombre)
+        return fase
+
+    def sumar(self, campo, n):
+        setattr(self.total, campo, getattr(self.total, campo) + n)
+        if self.pila:
+            fase = self.pila[-1]
+            setattr(fase, campo, getattr(fase, campo) + n)
+
+    def excepcion(self, fase, exc):
+        """Un ValueError (JSON o .ts mal formado) que sale de `fase`; en el total cuenta una vez."""
+        fase.errores += 1
+        if exc is not self._ultima_excepcion:
+            self._ultima_excepcion = exc
+            self.total.errores += 1
+
+    def to_dict(self):
+        _, pico = tracemalloc.get_traced_memory() if tracemalloc.is_tracing() else (0, 0)
+        self.total.segundos = time.perf_counter() - self.inicio
+        datos = {
+            'script': self.script,
+            'args': self.args,
+            'fecha': self.fecha,
+            'pid': os.getpid(),
+            'segundos': round(self.total.segundos, 4),
+            'pico_tracemalloc_mb': round(pico / (1024 * 1024), 2),
+            'pico_rss_mb': round(pico_memoria_mb(), 2),
+            'bytes_leidos': self.total.bytes_leidos,
+            'bytes_escritos': self.total.bytes_escritos,
+            'errores': self.total.errores,
+            'io_proceso': _io_proceso(),
+            'fases': [fase.to_dict() for fase in self.fases.values()],
+        }
+        if self.perfil_path:
+            datos['perfil'] = self.perfil_path
+        # Excepción no capturada con la que terminó el script
+        error = getattr(sys, 'last_value', None)
+        if error is not None:
+            datos['excepcion'] = f'{type(error).__name__}: {error}'
+        return datos
+
+    def cerrar(self):
+        if self.perfil:
+            self.perfil.disable()
+        linea = (json.dumps(self.to_dict(), ensure_ascii=False) + '\n').encode('utf-8') if self.destino else None
+        if self.perfil:
+            self.perfil.dump_stats(self.perfil_path)
+        if not linea:
+            return
+        tracemalloc.stop()
+        directorio = os.path.dirname(self.destino)
+        if directorio:
+            os.makedirs(directorio, exist_ok=True)
+        # Una sola escritura con O_APPEND: los pasos en paralelo del pipeline no mezclan líneas
+        fd = os.open(self.destino, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, linea)
+        finally:
+            os.close(fd)
+
+
+def activar(destino, perfil=None):
+    """Empieza a medir el proceso actual (una sola vez) y devuelve la sesión."""
+    global _sesion
+    if _sesion is None:
+        _sesion = Sesion(destino, perfil)
+    return _sesion
+
+
+def desde_entorno():
+    """Activa las métricas y el perfil según el entorno (no en los procesos hijos de multiprocessing)."""
+    destino = os.environ.get(ENTORNO_METRICAS) or None
+    perfil = os.environ.get(ENTORNO_PERFIL) or None
+    if (destino or perfil) and multiprocessing.parent_process() is None:
+        activar(destino, perfil)
+
+
+class _Medida:
+    """Una pasada por una fase; `registros` se puede ir sumando dentro del bloque."""
+
+    __slots__ = ('fase', 'registros', 'inicio')
+
+    def __init__(self, fase, registros):
+        self.fase = fase
+        self.registros = registros
+
+    def __enter__(self):
+        _sesion.pila.append(self.fase)
+        self.inicio = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.fase.segundos += time.perf_counter() - self.inicio
+        self.fase.llamadas += 1
+        _sesion.pila.pop()
+        self.fase.registros += self.registros
+        if exc_type is not None and issubclass(exc_type, ValueError):
+            _sesion.excepcion(self.fase, exc)
+        return False
+
+
+class _MedidaNula:
+    __slots__ = ('registros',)
+
+    def __init__(self, registros):
+        self.registros = registros
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+def fase(nombre, registros=0):
+    """Context manager que mide una fase. Un ValueError que salga del bloque cuenta como error."""
+    if _sesion is None:
+        return _MedidaNula(registros)
+    return _Medida(_sesion.fase(nombre), registros)
+
+
+def medir_iter(nombre, iterable, contar=None):
+    """
+    Recorre `iterable` midiendo como fase `nombre` sólo el tiempo de producir
+    cada elemento. Cada elemento suma `contar(elemento)` registros (1 por defecto).
+    """
+    if _sesion is None:
+        return iterable
+    return _medir_iter(_sesion.fase(nombre), iter(iterable), contar)
+
+
+def _medir_iter(fase, iterador, contar):
+    fase.llamadas += 1
+    while True:
+        _sesion.pila.append(fase)
+        inicio = time.perf_counter()
+        try:
+            elemento = next(iterador)
+        except StopIteration:
+            return
+        except ValueError as e:
+            _sesion.excepcion(fase, e)
+            raise
+        finally:
+            fase.segundos += time.perf_counter() - inicio
+            _sesion.pila.pop()
+        n = contar(elemento) if contar else 1
+        fase.registros += n
+        yield elemento
+
+
+def leidos(n):
+    """Suma `n` bytes leídos a la fase activa."""
+    if _sesion is not None:
+        _sesion.sumar('bytes_leidos', n)
+
+
+def escritos(n):
+    """Suma `n` bytes escritos a la fase activa."""
+    if _sesion is not None:
+        _sesion.sumar('bytes_escritos', n)
+
+
+def errores(n=1):
+    """Suma `n` errores de parseo (entidades descartadas, respuestas ilegibles) a la fase activa."""
+    if _sesion is not None and n:
+        _sesion.sumar('errores', n)
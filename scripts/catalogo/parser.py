@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+"""
+Tokenizador y parser de los catálogos generados en TypeScript.
+
+Recorre una sola vez el literal `export const categoriasPlantas = [...]`
+(o `sistemasCorporales`) y produce registros estructurados de plantas,
+categorías, enfermedades y sistemas sin regex ad-hoc por script.
+"""
+
+import os
+import re
+
+from . import metricas
+
+SCRIPTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REPO_ROOT = os.path.dirname(SCRIPTS_DIR)
+# Directorio de los módulos .ts y del almacén (data/catalogo); POCIMA_DATOS lo
+# redirige, p. ej. al catálogo sintético de benchmark-pipeline.py
+DATA_DIR = os.environ.get('POCIMA_DATOS') or os.path.join(REPO_ROOT, 'data')
+PLANTAS_TS = os.path.join(DATA_DIR, 'plantas-expandidas.ts')
+ENFERMEDADES_TS = os.path.join(DATA_DIR, 'enfermedades-expandidas.ts')
+
+# Directorio de los archivos intermedios del pipeline (listas de trabajos,
+# generate_*.json, reportes); run-pipeline.py lo fija con --dir
+WORK_DIR = os.environ.get('POCIMA_TRABAJO', '/home/ubuntu')
+
+
+def work_path(nombre):
+    """Ruta de un archivo intermedio dentro de WORK_DIR."""
+    return os.path.join(WORK_DIR, nombre)
+
+# Valores admitidos de ContraindicacionPlanta.tipo (el resto se emite como 'otro')
+CONTRAINDICACION_TIPOS = ("embarazo", "ninos", "hipertension", "diabetes", "lactancia", "alergia", "medicamentos", "otro")
+
+
+class CatalogoError(ValueError):
+    """Error de sintaxis al leer un catálogo TypeScript."""
+
+
+# Un único patrón cubre todos los tokens del literal; se aplica con match()
+# desde la posición actual, así que cada carácter se visita una sola vez.
+_TOKEN_RE = re.compile(r'''
+    (?P<ws>(?:\s+|//[^\n]*|/\*.*?\*/)+)
+  | (?P<str>"(?:[^"\\\n]|\\.)*"|'(?:[^'\\\n]|\\.)*')
+  | (?P<num>-?\d+(?:\.\d+)?)
+  | (?P<ident>[A-Za-z_$][\w$]*)
+  | (?P<punct>[{}\[\]:,;])
+''', re.VERBOSE | re.DOTALL)
+
+# Dígitos hexadecimales de la huella de contenido de cada módulo (ver huella_catalogo)
+HUELLA_DIGITOS = 16
+_HUELLA_RE = re.compile(r'export\s+const\s+huella\w+\s*=\s*"([0-9a-f]+)"')
+
+_ESCAPES = {'n': '\n', 't': '\t', 'r': '\r', 'b': '\b', 'f': '\f', 'v': '\v', '0': '\0'}
+_ESCAPE_RE = re.compile(r'\\(u\{[0-9a-fA-F]+\}|u[0-9a-fA-F]{4}|x[0-9a-fA-F]{2}|.)', re.DOTALL)
+
+
+def _unescape_match(m):
+    esc = m.group(1)
+    if esc[0] in 'ux' and len(esc) > 1:
+        return chr(int(esc.strip('ux{}'), 16))
+    return _ESCAPES.get(esc, esc)
+
+
+def decode_string(raw):
+    """Convierte un literal de string JS ("..." o '...') a str de Python."""
+    body = raw[1:-1]
+    if '\\' not in body:
+        return body
+    return _ESCAPE_RE.sub(_unescape_match, body)
+
+
+class Tokenizer:
+    """Itera los tokens de `text` a partir de `pos` en tiempo lineal."""
+
+    __slots__ = ('text', 'pos', 'kind', 'value', 'start', 'last_end')
+
+    def __init__(self, text, pos=0):
+        self.text = text
+        self.pos = pos
+        self.kind = None
+        self.value = None
+        self.start = pos
+        self.last_end = pos
+        self.advance()
+
+    def advance(self):
+        """Consume el token actual y deja en kind/value/start el siguiente."""
+        text = self.text
+        if self.value is not None:
+            self.last_end = self.start + len(self.value)
+        match = _TOKEN_RE.match
+        while True:
+            if self.pos >= len(text):
+                self.kind, self.value, self.start = 'eof', None, self.pos
+                return
+            m = match(text, self.pos)
+            if m is None:
+                raise CatalogoError(f"Carácter inesperado {text[self.pos]!r} en la línea {self.line()}")
+            self.pos = m.end()
+            kind = m.lastgroup
+            if kind == 'ws':
+                continue
+            self.kind, self.value, self.start = kind, m.group(), m.start()
+            return
+
+    def line(self, pos=None):
+        return self.text.count('\n', 0, self.pos if pos is None else pos) + 1
+
+    def expect(self, value):
+        if self.value != value:
+            raise CatalogoError(f"Se esperaba {value!r} y se encontró {self.value!r} en la línea {self.line(self.start)}")
+        self.advance()
+
+
+def _parse_value(tok):
+    kind, value = tok.kind, tok.value
+    if value == '{':
+        return _parse_object(tok)
+    if value == '[':
+        return _parse_array(tok)
+    tok.advance()
+    if kind == 'str':
+        return decode_string(value)
+    if kind == 'num':
+        return float(value) if '.' in value else int(value)
+    if kind == 'ident':
+        if value in ('true', 'false'):
+            return value == 'true'
+        if value in ('null', 'undefined'):
+            return None
+    raise CatalogoError(f"Valor inesperado {value!r} en la línea {tok.line(tok.start)}")
+
+
+def _parse_object(tok):
+    tok.expect('{')
+    obj = {}
+    while tok.value != '}':
+        if tok.kind == 'str':
+            key = decode_string(tok.value)
+        elif tok.kind in ('ident', 'num'):
+            key = tok.value
+        else:
+            raise CatalogoError(f"Clave inesperada {tok.value!r} en la línea {tok.line(tok.start)}")
+        tok.advance()
+        tok.expect(':')
+        obj[key] = _parse_value(tok)
+        if tok.value == ',':
+            tok.advance()
+        elif tok.value != '}':
+            raise CatalogoError(f"Se esperaba ',' o '}}' en la línea {tok.line(tok.start)}")
+    tok.advance()
+    return obj
+
+
+def _parse_array(tok):
+    tok.expect('[')
+    items = []
+    while tok.value != ']':
+        items.append(_parse_value(tok))
+        if tok.value == ',':
+            tok.advance()
+        elif tok.value != ']':
+            raise CatalogoError(f"Se esperaba ',' o ']' en la línea {tok.line(tok.start)}")
+    tok.advance()
+    return items
+
+
+def find_export(text, nombre):
+    """Devuelve la posición del '[' con que empieza `export const <nombre> = [`."""
+    m = re.search(r'export\s+const\s+' + re.escape(nombre) + r'\b[^=]*=\s*\[', text)
+    if not m:
+        raise CatalogoError(f"No se encontró 'export const {nombre}'")
+    return m.end() - 1
+
+
+def parse_const(text, nombre):
+    """Valor literal de `const <nombre> = ...` (objeto, array o escalar)."""
+    m = re.search(r'(?:export\s+)?const\s+' + re.escape(nombre) + r'\b[^=]*=\s*', text)
+    if not m:
+        raise CatalogoError(f"No se encontró 'const {nombre}'")
+    return _parse_value(Tokenizer(text, m.end()))
+
+
+def iter_elements(text, nombre):
+    """
+    Recorre el array exportado `nombre` y produce (objeto, inicio, fin) por
+    cada elemento de primer nivel, donde inicio/fin son offsets en `text`.
+    """
+    tok = Tokenizer(text, find_export(text, nombre))
+    tok.expect('[')
+    while tok.value != ']':
+        if tok.value != '{':
+            raise CatalogoError(f"Se esperaba un objeto en la línea {tok.line(tok.start)}")
+        inicio = tok.start
+        obj = _parse_object(tok)
+        yield obj, inicio, tok.last_end
+        if tok.value == ',':
+            tok.advance()
+        elif tok.value != ']':
+            raise CatalogoError(f"Se esperaba ',' o ']' en la línea {tok.line(tok.start)}")
+
+
+class _Registro:
+    """Base de los registros compactos: sólo __slots__ y conversión a dict."""
+
+    __slots__ = ()
+    CAMPOS = ()
+
+    def __init__(self, data):
+        for campo in self.CAMPOS:
+            setattr(self, campo, data.get(campo))
+
+    def to_dict(self):
+        """Diccionario con el orden de campos del catálogo, sin campos ausentes."""
+        return {c: getattr(self, c) for c in self.CAMPOS if getattr(self, c) is not None}
+
+    def __repr__(self):
+        return f"{type(self).__name__}(id={self.id!r}, nombre={self.nombre!r})"
+
+
+class Planta(_Registro):
+    CAMPOS = (
+        'id', 'nombre', 'nombreCientifico', 'nombresAlternativos', 'propiedades',
+        'parteUsable', 'dosis', 'preparacion', 'contraindicaciones', 'fuente',
+        'descripcion', 'sistemasRelacionados', 'categoriaId', 'categoria',
+    )
+    __slots__ = CAMPOS
+
+
+class Enfermedad(_Registro):
+    CAMPOS = ('id', 'nombre', 'otrosNombres', 'descripcion', 'sintomas', 'causas', 'sistemaId')
+    __slots__ = CAMPOS
+
+
+class Categoria:
+    """Categoría de plantas con sus plantas y su rango [inicio, fin) en el archivo."""
+
+    __slots__ = ('id', 'nombre', 'plantas', 'inicio', 'fin')
+
+    def __init__(self, data, inicio=None, fin=None):
+        self.id = data.get('id')
+        self.nombre = data.get('nombre')
+        self.plantas = [Planta(p) for p in data.get('plantas', [])]
+        self.inicio = inicio
+        self.fin = fin
+
+    def to_dict(self):
+        return {'id': self.id, 'nombre': self.nombre, 'plantas': [p.to_dict() for p in self.plantas]}
+
+    def __repr__(self):
+        return f"Categoria(id={self.id!r}, plantas={len(self.plantas)})"
+
+
+class Sistema:
+    """Sistema corporal con sus enfermedades y su rango [inicio, fin) en el archivo."""
+
+    __slots__ = ('id', 'nombre', 'icono', 'enfermedades', 'inicio', 'fin')
+
+    def __init__(self, data, inicio=None, fin=None):
+        self.id = data.get('id')
+        self.nombre = data.get('nombre')
+        self.icono = data.get('icono')
+        self.enfermedades = [Enfermedad(e) for e in data.get('enfermedades', [])]
+        self.inicio = inicio
+        self.fin = fin
+
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'nombre': self.nombre,
+            'icono': self.icono,
+            'enfermedades': [e.to_dict() for e in self.enfermedades],
+        }
+
+    def __repr__(self):
+        return f"Sistema(id={self.id!r}, enfermedades={len(self.enfermedades)})"
+
+
+def read_text(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        metricas.leidos(os.fstat(f.fileno()).st_size)
+        return f.read()
+
+
+def huella_catalogo(text):
+    """
+    Huella de contenido que el emisor escribe al final del módulo .ts
+    (`export const huellaPlantas = "..."`). Los índices generados a partir del
+    módulo la copian y la app la compara para saber si siguen al día.
+    """
+    m = _HUELLA_RE.search(text)
+    if not m:
+        raise CatalogoError("El módulo no declara su huella; regenéralo con scripts/build-catalog.py")
+    return m.group(1)
+
+
+def iter_categorias(path=PLANTAS_TS, text=None):
+    """Produce cada Categoria de plantas-expandidas.ts en orden de aparición."""
+    with metricas.fase('leer-ts'):
+        if text is None:
+            text = read_text(path)
+    elementos = metricas.medir_iter('parsear-ts', iter_elements(text, 'categoriasPlantas'),
+                                    lambda e: len(e[0].get('plantas') or ()))
+    for obj, inicio, fin in elementos:
+        yield Categoria(obj, inicio, fin)
+
+
+def iter_sistemas(path=ENFERMEDADES_TS, text=None):
+    """Produce cada Sistema de enfermedades-expandidas.ts en orden de aparición."""
+    with metricas.fase('leer-ts'):
+        if text is None:
+            text = read_text(path)
+    elementos = metricas.medir_iter('parsear-ts', iter_elements(text, 'sistemasCorporales'),
+                                    lambda e: len(e[0].get('enfermedades') or ()))
+    for obj, inicio, fin in elementos:
+        yield Sistema(obj, inicio, fin)
+
+
+def iter_plantas(path=PLANTAS_TS, text=None):
+    """Produce cada Planta del catálogo, categoría por categoría."""
+    for categoria in iter_categorias(path, text):
+        yield from categoria.plantas
+
+
+def iter_enfermedades(path=ENFERMEDADES_TS, text=None):
+    """Produce cada Enfermedad del catálogo, sistema por sistema."""
+    for sistema in iter_sistemas(path, text):
+        yield from sistema.enfermedades
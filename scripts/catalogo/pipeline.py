@@ -0,0 +1,412 @@
+#!/usr/bin/env python3
+"""
+Orquestación del pipeline de datos del catálogo.
+
+Cada paso es un script de scripts/ con los artefactos que lee y los que
+escribe: rutas del repositorio ('data/plantas-expandidas.ts', un directorio
+del almacén) o archivos intermedios de WORK_DIR ('trabajo:parallel_inputs.json').
+Las dependencias se deducen de esas declaraciones en el orden de PASOS: un
+paso espera al último que escribió cada una de sus entradas, y un paso que
+escribe un artefacto espera a los anteriores que lo leen o lo escriben (el
+almacén lo modifican varios pasos en sitio). Los pasos sin relación entre sí
+se ejecutan en paralelo.
+
+Un paso está al día si su script, los módulos de catalogo/ que importa
+(directa o indirectamente), sus argumentos y el contenido de sus entradas y
+salidas coinciden con lo registrado en <WORK_DIR>/_pipeline.json
+la última vez que terminó bien. Como se compara contenido y no fechas, si un
+paso se repite y produce exactamente lo mismo, los que dependen de él no se
+vuelven a ejecutar.
+"""
+
+import ast
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from . import auditoria, emitter
+from .parser import REPO_ROOT, SCRIPTS_DIR, WORK_DIR
+from .store import dump_json, write_atomic
+
+CATALOGO_DIR = os.path.join(SCRIPTS_DIR, 'catalogo')
+PREFIJO_TRABAJO = 'trabajo:'
+MANIFIESTO = '_pipeline.json'
+
+# Manifiestos que se guardan junto al almacén y cambian sin que cambien los datos
+# (_index.json sí cuenta: decide el orden de los bloques emitidos)
+IGNORADOS = frozenset((emitter.MANIFEST_FILE, auditoria.MANIFEST_FILE))
+
+EJECUTADO = 'ejecutado'
+AL_DIA = 'al día'
+FALLIDO = 'fallido'
+OMITIDO = 'omitido'
+BLOQUEADO = 'bloqueado'
+
+
+def ruta_artefacto(artefacto, work_dir=WORK_DIR):
+    if artefacto.startswith(PREFIJO_TRABAJO):
+        return os.path.join(work_dir, artefacto[len(PREFIJO_TRABAJO):])
+    return os.path.join(REPO_ROOT, artefacto)
+
+
+def hash_ruta(path):
+    """sha256 del contenido de un archivo o de un directorio (None si no existe).
+
+    En los directorios se ignoran los temporales ('.*') y los manifiestos de
+    IGNORADOS.
+    """
+    if os.path.isdir(path):
+        h = hashlib.sha256()
+        for nombre in sorted(os.listdir(path)):
+            if nombre.startswith('.') or nombre in IGNORADOS or not os.path.isfile(os.path.join(path, nombre)):
+                continue
+            h.update(nombre.encode('utf-8') + b'\0' + hash_ruta(os.path.join(path, nombre)).encode('ascii'))
+        return h.hexdigest()
+    try:
+        with open(path, 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except FileNotFoundError:
+        return None
+
+
+def _importa(path, en_paquete):
+    """Módulos de catalogo/ (nombres sin .py) que importa el archivo `path`."""
+    with open(path, 'rb') as f:
+        arbol = ast.parse(f.read(), path)
+    modulos = set()
+    for nodo in ast.walk(arbol):
+        if isinstance(nodo, ast.Import):
+            partes = [alias.name.split('.') for alias in nodo.names]
+        elif isinstance(nodo, ast.ImportFrom):
+            if nodo.level == 0 and nodo.module:
+                ruta = nodo.module.split('.')
+            elif nodo.level == 1 and en_paquete:
+                ruta = ['catalogo'] + (nodo.module.split('.') if nodo.module else [])
+            else:
+                continue
+            # `from catalogo import x` puede importar el submódulo x
+            partes = [ruta + [alias.name] if len(ruta) == 1 else ruta for alias in nodo.names]
+        else:
+            continue
+        for p in partes:
+            if p[0] == 'catalogo':
+                modulos.add('__init__')
+                if len(p) > 1:
+                    modulos.add(p[1])
+    return modulos
+
+
+def modulos_catalogo(script):
+    """Archivos de catalogo/ de los que depende `script`, siguiendo sus importaciones."""
+    pendientes = list(_importa(script, False))
+    vistos = set()
+    while pendientes:
+        modulo = pendientes.pop()
+        path = os.path.join(CATALOGO_DIR, modulo + '.py')
+        if modulo in vistos or not os.path.isfile(path):
+            continue
+        vistos.add(modulo)
+        pendientes.extend(_importa(path, True))
+    return sorted(vistos)
+
+
+class Paso:
+    """Un script del pipeline con sus entradas y salidas declaradas."""
+
+    def __init__(self, nombre, script, args=(), entradas=(), salidas=(), llm=False):
+        self.nombre = nombre
+        self.script = script
+        self.args = tuple(args)
+        self.entradas = tuple(entradas)
+        self.salidas = tuple(salidas)
+        # Los pasos que llaman al modelo sólo se ejecutan si se piden explícitamente
+        self.llm = llm
+
+    def comando(self):
+        return [sys.executable, os.path.join(SCRIPTS_DIR, self.script), *self.args]
+
+    def firma(self):
+        """Hash del script, de los módulos de catalogo/ que usa y de sus argumentos (si cambian, hay que repetirlo)."""
+        script = os.path.join(SCRIPTS_DIR, self.script)
+        h = hashlib.sha256(hash_ruta(script).encode('ascii'))
+        for modulo in modulos_catalogo(script):
+            h.update(f'\0{modulo}\0{hash_ruta(os.path.join(CATALOGO_DIR, modulo + ".py"))}'.encode('utf-8'))
+        h.update('\0'.join(self.args).encode('utf-8'))
+        return h.hexdigest()
+
+
+class ResultadoPaso:
+    __slots__ = ('nombre', 'estado', 'motivo', 'segundos', 'salida')
+
+    def __init__(self, nombre, estado, motivo='', segundos=0.0, salida=''):
+        self.nombre = nombre
+        self.estado = estado
+        self.motivo = motivo
+        self.segundos = segundos
+        self.salida = salida
+
+    def __str__(self):
+        tiempo = f" ({self.segundos:.1f} s)" if self.estado in (EJECUTADO, FALLIDO) else ''
+        motivo = f" — {self.motivo}" if self.motivo else ''
+        return f"{self.nombre}: {self.estado}{tiempo}{motivo}"
+
+
+class Pipeline:
+    """Grafo de pasos con detección de pasos obsoletos y ejecución en paralelo."""
+
+    def __init__(self, pasos, work_dir=WORK_DIR):
+        self.pasos = list(pasos)
+        self.por_nombre = {p.nombre: p for p in self.pasos}
+        self.work_dir = work_dir
+        self.manifiesto_path = os.path.join(work_dir, MANIFIESTO)
+        self.dependencias = self._deducir_dependencias()
+        self._hashes = {}
+        try:
+            with open(self.manifiesto_path, 'r', encoding='utf-8') as f:
+                self.manifiesto = json.load(f)
+        except FileNotFoundError:
+            self.manifiesto = {}
+
+    def _deducir_dependencias(self):
+        dependencias = {}
+        escritor = {}   # artefacto -> último paso que lo escribe
+        lectores = {}   # artefacto -> pasos que lo leen desde la última escritura
+        for paso in self.pasos:
+            deps = set()
+            for artefacto in paso.entradas:
+                if artefacto in escritor:
+                    deps.add(escritor[artefacto])
+            for artefacto in paso.salidas:
+                if artefacto in escritor:
+                    deps.add(escritor[artefacto])
+                deps.update(lectores.get(artefacto, ()))
+            deps.discard(paso.nombre)
+            dependencias[paso.nombre] = deps
+            for artefacto in paso.entradas:
+                lectores.setdefault(artefacto, set()).add(paso.nombre)
+            for artefacto in paso.salidas:
+                escritor[artefacto] = paso.nombre
+                lectores[artefacto] = set()
+        return dependencias
+
+    def seleccionar(self, objetivos=None):
+        """Nombres de los pasos necesarios para `objetivos` (todos si no se indican)."""
+        if not objetivos:
+            return {p.nombre for p in self.pasos}
+        desconocidos = [o for o in objetivos if o not in self.por_nombre]
+        if desconocidos:
+            raise ValueError(f"Pasos desconocidos: {', '.join(desconocidos)}")
+        seleccion = set()
+        pila = list(objetivos)
+        while pila:
+            nombre = pila.pop()
+            if nombre not in seleccion:
+                seleccion.add(nombre)
+                pila.extend(self.dependencias[nombre])
+        return seleccion
+
+    def _hash(self, artefacto):
+        if artefacto not in self._hashes:
+            self._hashes[artefacto] = hash_ruta(ruta_artefacto(artefacto, self.work_dir))
+        return self._hashes[artefacto]
+
+    def faltantes(self, paso):
+        return [a for a in paso.entradas if self._hash(a) is None]
+
+    def obsoleto(self, paso):
+        """Motivo por el que `paso` debe ejecutarse, o None si está al día."""
+        registro = self.manifiesto.get(paso.nombre)
+        if registro is None:
+            return 'nunca ejecutado'
+        if registro['firma'] != paso.firma():
+            return 'cambió el script o sus argumentos'
+        for artefacto in paso.entradas:
+            if registro['entradas'].get(artefacto) != self._hash(artefacto):
+                return f'cambió {artefacto}'
+        for artefacto in paso.salidas:
+            actual = self._hash(artefacto)
+            if actual is None:
+                return f'falta {artefacto}'
+            if registro['salidas'].get(artefacto) != actual:
+                return f'{artefacto} se modificó fuera del pipeline'
+        return None
+
+    def _registrar(self, paso, segundos):
+        for artefacto in paso.salidas:
+            self._hashes.pop(artefacto, None)
+        self.manifiesto[paso.nombre] = {
+            'firma': paso.firma(),
+            'entradas': {a: self._hash(a) for a in paso.entradas},
+            'salidas': {a: self._hash(a) for a in paso.salidas},
+            'segundos': round(segundos, 3),
+        }
+        os.makedirs(self.work_dir, exist_ok=True)
+        write_atomic(self.manifiesto_path, dump_json(self.manifiesto))
+
+    def _correr(self, paso):
+        env = dict(os.environ, POCIMA_TRABAJO=self.work_dir)
+        inicio = time.perf_counter()
+        proceso = subprocess.run(paso.comando(), cwd=REPO_ROOT, env=env, text=True,
+                                 stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+        return proceso.returncode, proceso.stdout, time.perf_counter() - inicio
+
+    def _preparar(self, paso, resultados, seleccion, con_llm, forzar):
+        """ResultadoPaso si el paso no hay que ejecutarlo; (None, motivo) si sí."""
+        caidas = sorted(d for d in self.dependencias[paso.nombre] & seleccion
+                        if resultados[d].estado in (FALLIDO, BLOQUEADO))
+        if caidas:
+            return ResultadoPaso(paso.nombre, BLOQUEADO, f'no terminó {caidas[0]}'), None
+        faltan = self.faltantes(paso)
+        if faltan:
+            # Sin sus entradas el paso no se ejecuta, pero los siguientes pueden
+            # seguir con las salidas que ya existan
+            return ResultadoPaso(paso.nombre, OMITIDO, f'falta {faltan[0]}'), None
+        motivo = 'forzado' if forzar else self.obsoleto(paso)
+        if motivo is None:
+            return ResultadoPaso(paso.nombre, AL_DIA), None
+        if paso.llm and not con_llm:
+            return ResultadoPaso(paso.nombre, OMITIDO, f'{motivo}; requiere --con-llm'), None
+        return None, motivo
+
+    def ejecutar(self, objetivos=None, trabajos=1, con_llm=False, forzar=False, informar=None):
+        """
+        Ejecuta los pasos obsoletos de `objetivos` (y de lo que necesitan), hasta
+        `trabajos` a la vez. `informar(resultado)` se llama al resolverse cada
+        paso. Devuelve los ResultadoPaso en el orden de PASOS.
+        """
+        trabajos = max(1, trabajos)
+        seleccion = self.seleccionar(objetivos)
+        pendientes = [p for p in self.pasos if p.nombre in seleccion]
+        resultados = {}
+        en_curso = {}
+
+        def resolver(resultado):
+            resultados[resultado.nombre] = resultado
+            if informar:
+                informar(resultado)
+
+        with ThreadPoolExecutor(max_workers=trabajos) as pool:
+            while pendientes or en_curso:
+                for paso in list(pendientes):
+                    if len(en_curso) >= trabajos:
+                        break
+                    if any(d not in resultados for d in self.dependencias[paso.nombre] & seleccion):
+                        continue
+                    pendientes.remove(paso)
+                    resultado, motivo = self._preparar(paso, resultados, seleccion, con_llm, forzar)
+                    if resultado is not None:
+                        resolver(resultado)
+                    else:
+                        en_curso[pool.submit(self._correr, paso)] = (paso, motivo)
+                if not en_curso:
+                    continue
+                hechos, _ = wait(en_curso, return_when=FIRST_COMPLETED)
+                for futuro in hechos:
+                    paso, motivo = en_curso.pop(futuro)
+                    codigo, salida, segundos = futuro.result()
+                    if codigo == 0:
+                        self._registrar(paso, segundos)
+                        resolver(ResultadoPaso(paso.nombre, EJECUTADO, motivo, segundos, salida))
+                    else:
+                        for artefacto in paso.salidas:
+                            self._hashes.pop(artefacto, None)
+                        resolver(ResultadoPaso(paso.nombre, FALLIDO, f'código de salida {codigo}', segundos, salida))
+
+        return [resultados[p.nombre] for p in self.pasos if p.nombre in resultados]
+
+    def plan(self, objetivos=None):
+        """[(paso, motivo | None)] con el estado actual, sin ejecutar nada."""
+        seleccion = self.seleccionar(objetivos)
+        plan = []
+        for paso in self.pasos:
+            if paso.nombre in seleccion:
+                faltan = self.faltantes(paso)
+                plan.append((paso, f'no puede ejecutarse, falta {faltan[0]}' if faltan else self.obsoleto(paso)))
+        return plan
+
+
+def _trabajo(nombre):
+    return PREFIJO_TRABAJO + nombre
+
+
+_ALMACEN_PLANTAS = 'data/catalogo/plantas'
+_ALMACEN_ENFERMEDADES = 'data/catalogo/enfermedades'
+_PLANTAS_TS = 'data/plantas-expandidas.ts'
+_ENFERMEDADES_TS = 'data/enfermedades-expandidas.ts'
+_VOCABULARIO = 'data/catalogo/propiedades.json'
+_CRUCE_TS = 'data/cruce-datos.ts'
+
+# En orden: cuando dos pasos tocan el mismo artefacto, el declarado antes va primero
+PASOS = (
+    Paso('catalogo', 'build-catalog.py',
+         entradas=(_ALMACEN_PLANTAS, _ALMACEN_ENFERMEDADES),
+         salidas=(_PLANTAS_TS, _ENFERMEDADES_TS)),
+
+    # Nombres alternativos de plantas
+    Paso('extraer-plantas', 'extract-plants.py',
+         entradas=(_PLANTAS_TS,),
+         salidas=(_trabajo('plantas_por_categoria.json'),)),
+    Paso('preparar-nombres', 'prepare-parallel-inputs.py',
+         entradas=(_trabajo('plantas_por_categoria.json'), _PLANTAS_TS),
+         salidas=(_trabajo('parallel_inputs.json'),)),
+    Paso('llm-nombres', 'run-enrichment.py', args=('nombres',), llm=True,
+         entradas=(_trabajo('parallel_inputs.json'),),
+         salidas=(_trabajo('generate_alternative_names.json'),)),
+    Paso('procesar-nombres', 'process-alternative-names.py',
+         entradas=(_trabajo('generate_alternative_names.json'), _PLANTAS_TS),
+         salidas=(_trabajo('nombres_alternativos_procesados.json'),)),
+    Paso('aplicar-nombres', 'update-plantas-with-names.py',
+         entradas=(_trabajo('nombres_alternativos_procesados.json'), _ALMACEN_PLANTAS),
+         salidas=(_ALMACEN_PLANTAS, _PLANTAS_TS)),
+    Paso('buscar-sin-nombres', 'find-plantas-sin-nombres.py',
+         entradas=(_PLANTAS_TS,),
+         salidas=(_trabajo('plantas_sin_nombres.json'), _trabajo('parallel_inputs_restantes.json'))),
+    Paso('llm-restantes', 'run-enrichment.py', args=('restantes',), llm=True,
+         entradas=(_trabajo('parallel_inputs_restantes.json'),),
+         salidas=(_trabajo('generate_remaining_alternative_names.json'),)),
+    Paso('aplicar-restantes', 'process-remaining-names.py',
+         entradas=(_trabajo('generate_remaining_alternative_names.json'),
+                   _trabajo('nombres_alternativos_procesados.json'), _ALMACEN_PLANTAS),
+         salidas=(_trabajo('nombres_alternativos_completos.json'), _ALMACEN_PLANTAS, _PLANTAS_TS)),
+
+    # Síntomas y causas de enfermedades
+    Paso('extraer-enfermedades', 'extract-enfermedades.py',
+         entradas=(_ENFERMEDADES_TS,),
+         salidas=(_trabajo('enfermedades_por_sistema.json'),)),
+    Paso('llm-sintomas', 'run-enrichment.py', args=('sintomas',), llm=True,
+         entradas=(_trabajo('enfermedades_por_sistema.json'),),
+         salidas=(_trabajo('generate_symptoms_causes.json'),)),
+    Paso('aplicar-sintomas', 'process-symptoms-causes.py',
+         entradas=(_trabajo('generate_symptoms_causes.json'), _ALMACEN_ENFERMEDADES),
+         salidas=(_trabajo('sintomas_causas.json'), _ALMACEN_ENFERMEDADES, _ENFERMEDADES_TS)),
+
+    # Índices derivados del catálogo
+    Paso('indice-busqueda', 'build-search-index.py',
+         entradas=(_PLANTAS_TS, _ENFERMEDADES_TS),
+         salidas=('data/busqueda-index.ts',)),
+    Paso('vocabulario-propiedades', 'build-property-vocabulary.py',
+         entradas=(_PLANTAS_TS, _CRUCE_TS, _VOCABULARIO),
+         salidas=(_VOCABULARIO, 'data/propiedades-index.ts')),
+    Paso('indice-cruce', 'build-cruce-index.py',
+         entradas=(_PLANTAS_TS, _ENFERMEDADES_TS, _CRUCE_TS, _VOCABULARIO),
+         salidas=('data/cruce-index.ts',)),
+    Paso('indice-alias', 'build-alias-index.py',
+         entradas=(_ALMACEN_PLANTAS, _ALMACEN_ENFERMEDADES),
+         salidas=('data/alias-index.ts',)),
+    Paso('indice-sintomas', 'build-symptom-index.py',
+         entradas=(_ALMACEN_ENFERMEDADES,),
+         salidas=('data/sintomas-index.ts',)),
+    Paso('indice-recuperacion', 'build-retrieval-index.py',
+         entradas=(_ALMACEN_PLANTAS, _ALMACEN_ENFERMEDADES, _PLANTAS_TS, _ENFERMEDADES_TS, _CRUCE_TS, _VOCABULARIO),
+         salidas=('data/recuperacion-index.ts',)),
+    Paso('auditoria', 'audit-data.py',
+         entradas=(_ALMACEN_PLANTAS, _ALMACEN_ENFERMEDADES),
+         salidas=(_trabajo('auditoria.json'),)),
+    Paso('duplicados', 'find-duplicates.py',
+         entradas=(_ALMACEN_PLANTAS, _ALMACEN_ENFERMEDADES),
+         salidas=(_trabajo('duplicados.json'),)),
+)
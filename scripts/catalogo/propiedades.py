@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Vocabulario canónico de propiedades de plantas.
+
+Las propiedades son texto libre ("Antiinflamatoria", "antiinflamatorio",
+"Antiinflamatorio ligero"). Cada texto se reduce a una clave: minúsculas, sin
+acentos ni paréntesis, sin palabras vacías y con cada palabra sin plural ni
+terminación de género (`antiinflamatori`, `antiinflamatori liger`). Cada
+clave distinta es un término del vocabulario con un id entero estable: los
+ids se guardan en data/catalogo/propiedades.json y los términos nuevos se
+añaden al final, así que un id nunca cambia de significado.
+
+Una propiedad de planta satisface una propiedad requerida (las de
+enfermedadToPropiedades en data/cruce-datos.ts) si las palabras de una
+aparecen seguidas dentro de la otra, en cualquier sentido: es la
+coincidencia bidireccional por substring de cruce-datos.ts, pero por
+palabras normalizadas. Con eso cada planta queda como un bitset de términos y
+cada keyword de enfermedad como el bitset de los términos que la satisfacen;
+comprobar si una planta sirve es un AND.
+"""
+
+import json
+import os
+import re
+from collections import Counter
+
+from .store import STORE_DIR, dump_json, write_atomic
+from .texto import VACIAS_PROPIEDADES, palabras, plegar, raiz
+
+VOCABULARIO_JSON = os.path.join(STORE_DIR, 'propiedades.json')
+
+
+def clave_propiedad(texto):
+    """Clave canónica de un texto de propiedad ('' si no queda ninguna palabra)."""
+    texto = re.sub(r'\([^)]*\)', ' ', plegar(texto))
+    return ' '.join(raiz(p) for p in palabras(texto) if p not in VACIAS_PROPIEDADES)
+
+
+def contiene(clave, otra):
+    """True si las palabras de `otra` aparecen seguidas dentro de `clave`."""
+    return f' {otra} ' in f' {clave} '
+
+
+def bits_a_palabras(bits):
+    """Entero-bitset -> lista de palabras de 32 bits, sin ceros finales."""
+    palabras = []
+    while bits:
+        palabras.append(bits & 0xFFFFFFFF)
+        bits >>= 32
+    return palabras
+
+
+class Vocabulario:
+    """
+    Términos canónicos con id estable (su posición en la lista).
+
+    Cada término guarda su clave, la forma más frecuente del texto original
+    (para mostrarla), las variantes vistas y cuántas veces aparece en el
+    catálogo. Los términos que dejan de usarse conservan su id con usos = 0.
+    """
+
+    def __init__(self, terminos=None, path=VOCABULARIO_JSON):
+        self.path = path
+        self.terminos = terminos or []
+        self._ids = {t['clave']: i for i, t in enumerate(self.terminos)}
+        self._satisface = {}
+
+    @classmethod
+    def cargar(cls, path=VOCABULARIO_JSON):
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return cls(json.load(f)['terminos'], path)
+        except FileNotFoundError:
+            return cls(path=path)
+
+    def guardar(self):
+        write_atomic(self.path, dump_json({'terminos': self.terminos}))
+
+    def __len__(self):
+        return len(self.terminos)
+
+    def actualizar(self, textos):
+        """
+        Recalcula formas, variantes y usos a partir de `textos` (todas las
+        apariciones, con repetición) y añade al final los términos nuevos, los
+        más frecuentes primero. Devuelve las claves añadidas.
+        """
+        por_clave = {}
+        for texto in textos:
+            clave = clave_propiedad(texto)
+            if clave:
+                por_clave.setdefault(clave, Counter())[texto] += 1
+
+        nuevas = [c for c in por_clave if c not in self._ids]
+        nuevas.sort(key=lambda c: -sum(por_clave[c].values()))
+        for clave in nuevas:
+            self._ids[clave] = len(self.terminos)
+            self.terminos.append({'clave': clave})
+        for termino in self.terminos:
+            variantes = por_clave.get(termino['clave'], Counter())
+            termino['usos'] = sum(variantes.values())
+            if variantes:
+                termino['forma'] = variantes.most_common(1)[0][0]
+                termino['variantes'] = sorted(variantes)
+            else:
+                termino.setdefault('forma', termino['clave'])
+                termino.setdefault('variantes', [])
+        self._satisface = {}
+        return nuevas
+
+    def id_de(self, texto):
+        """Id del término de un texto de propiedad (None si no está en el vocabulario)."""
+        return self._ids.get(clave_propiedad(texto))
+
+    def bits(self, textos):
+        """Bitset (entero) de los términos de una lista de propiedades."""
+        bits = 0
+        for texto in textos:
+            i = self.id_de(texto)
+            if i is not None:
+                bits |= 1 << i
+        return bits
+
+    def satisface(self, requerida):
+        """Bitset de los términos que satisfacen una propiedad requerida."""
+        clave = clave_propiedad(requerida)
+        if clave not in self._satisface:
+            bits = 0
+            if clave:
+                for i, termino in enumerate(self.terminos):
+                    if contiene(termino['clave'], clave) or contiene(clave, termino['clave']):
+                        bits |= 1 << i
+            self._satisface[clave] = bits
+        return self._satisface[clave]
+
+    def requisitos(self, requeridas):
+        """Bitset de los términos que satisfacen alguna de las propiedades requeridas."""
+        bits = 0
+        for requerida in requeridas:
+            bits |= self.satisface(requerida)
+        return bits
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Ranking BM25 de plantas por enfermedad para data/cruce-index.ts.
+
+Cada planta es un documento con sus propiedades (con más peso) y su
+descripción; cada enfermedad es una consulta con su nombre, descripción y
+síntomas, más las propiedades requeridas por las keywords del mapeo
+enfermedadToPropiedades que encajan con ella (ver catalogo/cruce.py), que
+pesan el doble porque hablan el mismo idioma que las propiedades de las
+plantas. La puntuación BM25 se multiplica por 1 + BOOST_SISTEMA si la planta
+está relacionada con el sistema de la enfermedad.
+
+Todas las puntuaciones salen de un solo producto de matrices (enfermedades x
+términos por términos x plantas) con NumPy si está instalado; si no, se
+suman las listas invertidas de los términos de cada consulta. Las
+puntuaciones se redondean antes de ordenar, así que los dos caminos dan el
+mismo ranking.
+"""
+
+import math
+
+try:
+    import numpy as np
+except ImportError:  # NumPy es opcional: el cálculo puro en Python da el mismo resultado
+    np = None
+
+from .cruce import MAX_PLANTAS
+from .texto import B, K1, terminos
+
+# Repeticiones de cada término de propiedad en el documento de la planta
+PESO_PROPIEDADES = 2
+# Peso en la consulta de los términos que vienen de las propiedades requeridas del mapeo
+PESO_MAPEO = 2.0
+BOOST_SISTEMA = 0.5
+
+DECIMALES = 4
+
+
+def _texto(valor):
+    return ' '.join(valor) if isinstance(valor, list) else valor or ''
+
+
+class RankingPlantas:
+    """
+    Puntuación BM25 de cada par (enfermedad, planta) sobre las listas planas
+    de un `Cruce` (catalogo/cruce.py), y sus k mejores plantas por enfermedad.
+    """
+
+    def __init__(self, cruce, k=MAX_PLANTAS, usar_numpy=None):
+        self.cruce = cruce
+        self.k = k
+        plantas, enfermedades = cruce.plantas, cruce.enfermedades
+
+        # Documentos: frecuencias de términos de cada planta
+        self.tokens_propiedades = [[terminos(p) for p in planta.propiedades] for planta in plantas]
+        documentos = []
+        for planta, por_propiedad in zip(plantas, self.tokens_propiedades):
+            tf = {}
+            for lista in por_propiedad:
+                for t in lista:
+                    tf[t] = tf.get(t, 0) + PESO_PROPIEDADES
+            for t in terminos(planta.descripcion):
+                tf[t] = tf.get(t, 0) + 1
+            documentos.append(tf)
+
+        n = len(documentos)
+        longitudes = [sum(tf.values()) for tf in documentos]
+        media = sum(longitudes) / max(1, n) or 1.0
+        df = {}
+        for tf in documentos:
+            for t in tf:
+                df[t] = df.get(t, 0) + 1
+        self.terminos = sorted(df)
+        # término -> [(posición de planta, peso BM25)]
+        self.postings = {}
+        for p, tf in enumerate(documentos):
+            norma = K1 * (1 - B + B * longitudes[p] / media)
+            for t, f in tf.items():
+                idf = math.log(1 + (n - df[t] + 0.5) / (df[t] + 0.5))
+                self.postings.setdefault(t, []).append((p, idf * f * (K1 + 1) / (f + norma)))
+
+        # Consultas: término -> peso para cada enfermedad
+        self.consultas = []
+        for e, enfermedad in enumerate(enfermedades):
+            consulta = {}
+            texto = ' '.join(_texto(getattr(enfermedad, c, None))
+                             for c in ('nombre', 'otrosNombres', 'descripcion', 'sintomas'))
+            for t in terminos(texto):
+                consulta[t] = 1.0
+            requeridas = dict(cruce.mapeo)
+            for kw in cruce.keywords[e]:
+                for propiedad in requeridas[kw]:
+                    for t in terminos(propiedad):
+                        consulta[t] = PESO_MAPEO
+            self.consultas.append({t: w for t, w in consulta.items() if t in df})
+
+        self.sistemas_planta = [set(planta.sistemasRelacionados) for planta in plantas]
+        if usar_numpy is None:
+            usar_numpy = np is not None
+        self.usar_numpy = usar_numpy
+        self.puntuaciones = self._matriz() if usar_numpy else None
+
+    def _matriz(self):
+        """Matriz enfermedades x plantas con todas las puntuaciones (ya con el boost de sistema)."""
+        columna = {t: i for i, t in enumerate(self.terminos)}
+        plantas, enfermedades = self.cruce.plantas, self.cruce.enfermedades
+        pesos = np.zeros((len(self.terminos), len(plantas)))
+        for t, lista in self.postings.items():
+            posiciones, valores = zip(*lista)
+            pesos[columna[t], list(posiciones)] = valores
+        consultas = np.zeros((len(enfermedades), len(self.terminos)))
+        for e, consulta in enumerate(self.consultas):
+            consultas[e, [columna[t] for t in consulta]] = list(consulta.values())
+        boost = np.ones((len(enfermedades), len(plantas)))
+        for e, enfermedad in enumerate(enfermedades):
+            en_sistema = self.cruce.plantas_sistema.get(enfermedad.sistemaId, [])
+            boost[e, en_sistema] += BOOST_SISTEMA
+        return np.round(consultas @ pesos * boost, DECIMALES)
+
+    def puntuar(self, e):
+        """{posición de planta: puntuación} de las plantas con puntuación positiva para la enfermedad `e`."""
+        if self.puntuaciones is not None:
+            fila = self.puntuaciones[e]
+            return {int(p): float(fila[p]) for p in np.flatnonzero(fila > 0)}
+        sistema = self.cruce.enfermedades[e].sistemaId
+        suma = {}
+        for t, peso in self.consultas[e].items():
+            for p, w in self.postings[t]:
+                suma[p] = suma.get(p, 0.0) + peso * w
+        return {p: round(s * (1 + BOOST_SISTEMA if sistema in self.sistemas_planta[p] else 1), DECIMALES)
+                for p, s in suma.items() if s > 0}
+
+    def top(self, e):
+        """
+        [(posición de planta, puntuación)] de las k mejores plantas para la
+        enfermedad `e`, sin repetir id (una planta en varias categorías cuenta
+        una vez). Si hay menos de k con puntuación, se completan con plantas del
+        sistema, con puntuación 0.
+        """
+        plantas = self.cruce.plantas
+        ordenadas = sorted(self.puntuar(e).items(), key=lambda par: (-par[1], par[0]))
+        resultado = []
+        ids = set()
+        for p, puntuacion in ordenadas + [(p, 0.0) for p in
+                                          self.cruce.plantas_sistema.get(self.cruce.enfermedades[e].sistemaId, [])]:
+            if plantas[p].id in ids:
+                continue
+            ids.add(plantas[p].id)
+            resultado.append((p, puntuacion))
+            if len(resultado) == self.k:
+                break
+        return resultado
+
+    def motivo(self, p, e):
+        """Índices (en planta.propiedades) de hasta 3 propiedades que más aportan a la puntuación."""
+        consulta = self.consultas[e]
+        aportes = []
+        for i, lista in enumerate(self.tokens_propiedades[p]):
+            aporte = sum(consulta.get(t, 0.0) for t in set(lista))
+            if aporte:
+                aportes.append((-aporte, i))
+        if not aportes:
+            return self.cruce.motivo(p, e)
+        return sorted(i for _, i in sorted(aportes)[:3])
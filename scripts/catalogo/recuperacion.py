@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+Índice de recuperación para el contexto de MolDoctor.
+
+Cada planta y cada enfermedad única del catálogo es un documento con dos
+textos: el que se indexa (nombres, propiedades o síntomas, descripción...) y
+una ficha corta que es lo que se inserta en el prompt. El índice guarda, para
+cada término, los documentos que lo contienen con su peso BM25 ya calculado,
+y para cada ficha su coste estimado en tokens.
+
+Una consulta (los últimos mensajes del usuario) suma los pesos de sus
+términos por documento y llena un presupuesto fijo de tokens con las fichas
+mejor puntuadas (descartando las que quedan muy por debajo de la mejor), con
+un máximo de plantas y de enfermedades. Las plantas que el ranking BM25 de
+catalogo/ranking.py recomienda para las enfermedades encontradas heredan parte
+de su puntuación, porque el usuario describe síntomas y las plantas hablan de
+propiedades. Así cada
+llamada lleva sólo lo relevante del catálogo completo en lugar de una lista
+fija de plantas o del catálogo entero.
+
+server/recuperacion.ts hace la misma consulta sobre data/recuperacion-index.ts.
+"""
+
+import math
+
+from .store import CatalogStore
+from .texto import B, ESCALA, K1, VACIAS, estimar_tokens, terminos
+
+# Presupuesto de tokens del contexto recuperado y máximos por tipo
+PRESUPUESTO_TOKENS = 700
+MAX_PLANTAS = 8
+MAX_ENFERMEDADES = 4
+
+# Plantas del ranking BM25 (catalogo/ranking.py) que hereda cada enfermedad elegida,
+# con esta fracción de su puntuación
+PLANTAS_POR_ENFERMEDAD = 3
+PESO_RANKING = 0.5
+
+# Se descartan los documentos con menos de esta fracción de la mejor puntuación
+UMBRAL_RELATIVO = 0.3
+
+# Palabras de conversación que no aportan a la búsqueda (además de las vacías)
+CONVERSACION = frozenset('''
+    hola buenas buenos dias tardes noches doctor doctora gracias favor ayuda ayudar ayudame
+    tengo tiene tienes tenido estoy esta estas siento sientes siente noto hace desde ayer hoy
+    semana semanas mes meses mucho mucha muchos poco algo bien mal que cual cuales quiero
+    puedo puedes podria sirve sirven bueno buena recomiendas recomienda tomar propiedades
+'''.split())
+
+PLANTA, ENFERMEDAD = 'p', 'e'
+
+# tipo -> campos indexados (los nombres cuentan doble)
+CAMPOS = {
+    PLANTA: (('nombre', 2), ('nombreCientifico', 2), ('nombresAlternativos', 1), ('propiedades', 1),
+             ('descripcion', 1), ('parteUsable', 1)),
+    ENFERMEDAD: (('nombre', 2), ('otrosNombres', 2), ('descripcion', 1), ('sintomas', 1), ('causas', 1)),
+}
+
+CABECERAS = {
+    ENFERMEDAD: 'ENFERMEDADES DEL CATÁLOGO RELACIONADAS CON LA CONSULTA:',
+    PLANTA: 'PLANTAS DEL CATÁLOGO RELACIONADAS CON LA CONSULTA (usa estas como referencia):',
+}
+
+
+# Coste fijo de las cabeceras del contexto, descontado del presupuesto
+TOKENS_CABECERAS = estimar_tokens('\n\n'.join(CABECERAS.values()))
+
+
+def _textos(valor):
+    """Strings de un campo: listas, nombres por región y contraindicaciones {tipo, descripcion}."""
+    if isinstance(valor, str):
+        return [valor]
+    if isinstance(valor, list):
+        return [t for v in valor for t in _textos(v)]
+    if isinstance(valor, dict):
+        if 'descripcion' in valor:
+            return _textos(valor['descripcion'])
+        return [n for nombres in valor.values() for n in _textos(nombres)]
+    return []
+
+
+def _lista(valores, maximo):
+    return ', '.join(_textos(valores)[:maximo])
+
+
+def ficha_planta(planta):
+    """Ficha de una línea: nombre, propiedades, parte usada, dosis y precauciones."""
+    partes = [f"{planta['nombre']} ({planta.get('nombreCientifico', '')})"]
+    if planta.get('propiedades'):
+        partes.append(_lista(planta['propiedades'], 6).lower())
+    if planta.get('parteUsable'):
+        partes.append(f"parte: {planta['parteUsable']}")
+    if planta.get('dosis'):
+        partes.append(f"dosis: {planta['dosis']}")
+    if planta.get('contraindicaciones'):
+        partes.append(f"precaución: {_lista(planta['contraindicaciones'], 2)}")
+    return '- ' + '; '.join(partes)
+
+
+def ficha_enfermedad(enfermedad):
+    """Ficha de una línea: nombre, síntomas y causas principales."""
+    partes = [enfermedad['nombre']]
+    if enfermedad.get('sintomas'):
+        partes.append(f"síntomas: {_lista(enfermedad['sintomas'], 4)}")
+    if enfermedad.get('causas'):
+        partes.append(f"causas: {_lista(enfermedad['causas'], 2)}")
+    return '- ' + '; '.join(partes)
+
+
+class IndiceRecuperacion:
+    """
+    Documentos (plantas y enfermedades únicas por id) con su ficha y su
+    coste en tokens, y listas invertidas término -> [(documento, peso)].
+    """
+
+    def __init__(self, stores=None, recomendadas=None):
+        """`recomendadas`: id de enfermedad -> ids de sus mejores plantas (ver recomendadas_por_ranking)."""
+        stores = stores or {PLANTA: CatalogStore('plantas'), ENFERMEDAD: CatalogStore('enfermedades')}
+        # (tipo, id, bloque, ficha, tokens de la ficha)
+        self.documentos = []
+        frecuencias = []
+        for tipo, ficha in ((PLANTA, ficha_planta), (ENFERMEDAD, ficha_enfermedad)):
+            store = stores[tipo]
+            vistos = set()
+            for bloque in store:
+                for registro in bloque[store.clave]:
+                    if registro.get('id') in vistos:
+                        continue
+                    vistos.add(registro.get('id'))
+                    texto = ficha(registro)
+                    self.documentos.append((tipo, registro['id'], bloque['id'], texto, estimar_tokens(texto)))
+                    tf = {}
+                    for campo, peso in CAMPOS[tipo]:
+                        for valor in _textos(registro.get(campo)):
+                            for t in terminos(valor):
+                                tf[t] = tf.get(t, 0) + peso
+                    frecuencias.append(tf)
+
+        n = len(frecuencias)
+        longitudes = [sum(tf.values()) for tf in frecuencias]
+        media = sum(longitudes) / max(1, n) or 1.0
+        df = {}
+        for tf in frecuencias:
+            for t in tf:
+                df[t] = df.get(t, 0) + 1
+        self.postings = {}
+        for d, tf in enumerate(frecuencias):
+            norma = K1 * (1 - B + B * longitudes[d] / media)
+            for t, f in tf.items():
+                idf = math.log(1 + (n - df[t] + 0.5) / (df[t] + 0.5))
+                self.postings.setdefault(t, []).append((d, max(1, round(ESCALA * idf * f * (K1 + 1) / (f + norma)))))
+
+        posicion_planta = {id_: d for d, (tipo, id_, *_) in enumerate(self.documentos) if tipo == PLANTA}
+        recomendadas = recomendadas or {}
+        # posición de enfermedad -> posiciones de sus plantas recomendadas
+        self.recomendadas = {
+            d: [posicion_planta[p] for p in recomendadas.get(id_, ()) if p in posicion_planta]
+            for d, (tipo, id_, *_) in enumerate(self.documentos) if tipo == ENFERMEDAD
+        }
+
+    def __len__(self):
+        return len(self.documentos)
+
+    def consultar(self, texto, presupuesto=PRESUPUESTO_TOKENS,
+                  max_plantas=MAX_PLANTAS, max_enfermedades=MAX_ENFERMEDADES):
+        """Posiciones de los documentos elegidos, de mayor a menor puntuación, sin pasar del presupuesto."""
+        puntos = {}
+        for t in set(terminos(texto, VACIAS | CONVERSACION)):
+            for d, peso in self.postings.get(t, ()):
+                puntos[d] = puntos.get(d, 0) + peso
+        # Las enfermedades mejor puntuadas suben a las plantas que el ranking les recomienda
+        enfermedades = sorted((d for d in puntos if self.documentos[d][0] == ENFERMEDAD),
+                              key=lambda d: (-puntos[d], d))[:max_enfermedades]
+        for d in enfermedades:
+            herencia = math.floor(puntos[d] * PESO_RANKING)
+            for p in self.recomendadas.get(d, ()):
+                puntos[p] = puntos.get(p, 0) + herencia
+        maximos = {PLANTA: max_plantas, ENFERMEDAD: max_enfermedades}
+        elegidos = []
+        gastado = TOKENS_CABECERAS
+        minimo = max(puntos.values(), default=0) * UMBRAL_RELATIVO
+        for d, puntuacion in sorted(puntos.items(), key=lambda par: (-par[1], par[0])):
+            if puntuacion < minimo:
+                break
+            tipo, _, _, _, coste = self.documentos[d]
+            if maximos[tipo] == 0 or gastado + coste > presupuesto:
+                continue
+            elegidos.append(d)
+            maximos[tipo] -= 1
+            gastado += coste
+            if not any(maximos.values()):
+                break
+        return elegidos
+
+    def contexto(self, elegidos):
+        """Texto del contexto para el prompt, con las enfermedades y las plantas por separado."""
+        partes = []
+        for tipo in (ENFERMEDAD, PLANTA):
+            fichas = [self.documentos[d][3] for d in elegidos if self.documentos[d][0] == tipo]
+            if fichas:
+                partes.append(CABECERAS[tipo] + '\n' + '\n'.join(fichas))
+        return '\n\n'.join(partes)
+
+
+def recomendadas_por_ranking(k=PLANTAS_POR_ENFERMEDAD):
+    """id de enfermedad -> ids de sus k mejores plantas según catalogo/ranking.py."""
+    from .cruce import Cruce, cargar_mapeo
+    from .parser import iter_enfermedades, iter_plantas
+    from .propiedades import Vocabulario
+    from .ranking import RankingPlantas
+
+    plantas = list(iter_plantas())
+    enfermedades = list(iter_enfermedades())
+    vocabulario = Vocabulario.cargar()
+    vocabulario.actualizar(prop for planta in plantas for prop in planta.propiedades)
+    ranking = RankingPlantas(Cruce(plantas, enfermedades, cargar_mapeo(), vocabulario), k=k)
+    recomendadas = {}
+    for e, enfermedad in enumerate(enfermedades):
+        if enfermedad.id not in recomendadas:
+            recomendadas[enfermedad.id] = [plantas[p].id for p, puntuacion in ranking.top(e) if puntuacion > 0]
+    return recomendadas
@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+Lectura en streaming de los generate_*.json que consumen los scripts process-*.
+
+Estos archivos tienen la forma {"results": [{"input", "output": {"json_data"},
+"error"}, ...]} y json_data es la respuesta del modelo como texto. El
+archivo se lee por bloques y se decodifica un resultado cada vez, así que la
+memoria depende del resultado más grande y no del tamaño del archivo.
+
+De cada respuesta se quita el bloque ```json ... ``` y, si no es JSON válido
+(respuesta cortada por el límite de tokens, texto alrededor del JSON), se
+rescatan las claves y las entidades de la lista que se llegan a leer enteras.
+Cada lote lleva la cuenta de lo leído, de lo rescatado y de los fallos.
+"""
+
+import json
+import os
+import re
+
+from . import metricas
+
+TAMAÑO_BLOQUE = 1 << 16
+
+_DECODER = json.JSONDecoder()
+_ESPACIO = re.compile(r'\s*')
+_SEPARADORES = re.compile(r'[\s,]*')
+
+
+def quitar_bloque_codigo(texto):
+    """Quita el bloque ```json ... ``` con el que a veces responde el modelo."""
+    texto = texto.strip()
+    if texto.startswith('```json'):
+        texto = texto[7:]
+    if texto.startswith('```'):
+        texto = texto[3:]
+    if texto.endswith('```'):
+        texto = texto[:-3]
+    return texto.strip()
+
+
+def rescatar(texto, lista):
+    """
+    (datos, completo) de una respuesta del modelo con una lista `lista` de
+    entidades. Si el texto no es un objeto JSON válido, `datos` lleva las
+    claves y los elementos de `lista` leídos antes del primer error y
+    `completo` es False; `datos` es None si no se rescata nada. Una lista
+    suelta se toma como la lista de entidades.
+    """
+    texto = quitar_bloque_codigo(texto)
+    try:
+        datos = json.loads(texto)
+    except json.JSONDecodeError:
+        pass
+    else:
+        if isinstance(datos, list):
+            return {lista: datos}, True
+        return (datos, True) if isinstance(datos, dict) else (None, False)
+
+    inicio = texto.find('{')
+    if inicio < 0:
+        return None, False
+    datos = {}
+    pos = inicio + 1
+    try:
+        while True:
+            pos = _SEPARADORES.match(texto, pos).end()
+            if pos >= len(texto) or texto[pos] == '}':
+                break
+            clave, pos = _DECODER.raw_decode(texto, pos)
+            pos = _ESPACIO.match(texto, pos).end()
+            if not texto.startswith(':', pos):
+                break
+            pos = _ESPACIO.match(texto, pos + 1).end()
+            if clave == lista and texto.startswith('[', pos):
+                elementos = datos[lista] = []
+                pos += 1
+                while True:
+                    pos = _SEPARADORES.match(texto, pos).end()
+                    if pos >= len(texto) or texto[pos] == ']':
+                        pos += 1
+                        break
+                    elemento, pos = _DECODER.raw_decode(texto, pos)
+                    elementos.append(elemento)
+            else:
+                datos[clave], pos = _DECODER.raw_decode(texto, pos)
+    except json.JSONDecodeError:
+        pass
+    return (datos or None), False
+
+
+class _Flujo:
+    """Búfer deslizante sobre un archivo de texto para decodificar valores JSON de uno en uno."""
+
+    def __init__(self, f, bloque):
+        self.f = f
+        self.bloque = bloque
+        self.buf = ''
+        self.pos = 0
+        self.fin = False
+
+    def _leer(self):
+        datos = self.f.read(self.bloque)
+        if not datos:
+            self.fin = True
+            return False
+        self.buf = self.buf[self.pos:] + datos
+        self.pos = 0
+        return True
+
+    def siguiente(self):
+        """Siguiente carácter que no es espacio (sin consumirlo), '' al final del archivo."""
+        while True:
+            self.pos = _ESPACIO.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._leer():
+                return ''
+
+    def consumir(self, caracter):
+        if self.siguiente() != caracter:
+            raise json.JSONDecodeError(f"Se esperaba '{caracter}'", self.buf, self.pos)
+        self.pos += 1
+
+    def valor(self):
+        """Siguiente valor JSON; lanza JSONDecodeError si el archivo acaba antes de completarlo."""
+        self.siguiente()
+        while True:
+            disponible = len(self.buf) - self.pos
+            try:
+                valor, fin = _DECODER.raw_decode(self.buf, self.pos)
+                # Un número al final del búfer puede seguir en el bloque siguiente
+                if fin < len(self.buf) or self.fin:
+                    self.pos = fin
+                    return valor
+            except json.JSONDecodeError:
+                if self.fin:
+                    raise
+            # Valor incompleto: se lee hasta duplicar lo disponible antes de reintentar,
+            # para no decodificar un valor grande una vez por bloque
+            while len(self.buf) - self.pos < 2 * disponible and self._leer():
+                pass
+            if len(self.buf) - self.pos == disponible:
+                self._leer()
+
+
+class LoteLeido:
+    """Lo leído de un resultado del archivo (un lote de la etapa)."""
+
+    def __init__(self, numero):
+        self.numero = numero
+        self.entidades = 0
+        # entidades descartadas (no son objetos o no tienen id) y respuestas ilegibles
+        self.fallos = 0
+        self.parcial = False
+        self.leido = False
+        self.error = None
+
+    def __str__(self):
+        if not self.leido:
+            return f'lote {self.numero}: {self.error}'
+        estado = ' (respuesta incompleta, rescatada)' if self.parcial else ''
+        error = f' - {self.error}' if self.error else ''
+        return f'lote {self.numero}: {self.entidades} entidades, {self.fallos} fallos{estado}{error}'
+
+
+class LectorResultados:
+    """
+    Lee un generate_*.json resultado a resultado. `lista` es la clave de
+    las entidades en cada respuesta ('plantas' / 'enfermedades').
+    """
+
+    def __init__(self, path, lista, bloque=TAMAÑO_BLOQUE):
+        self.path = path
+        self.lista = lista
+        self.bloque = bloque
+        self.lotes = []
+        # el archivo acaba a mitad de un resultado
+        self.truncado = False
+
+    def resultados(self):
+        """Cada elemento de "results", de uno en uno."""
+        with open(self.path, 'r', encoding='utf-8') as f:
+            metricas.leidos(os.fstat(f.fileno()).st_size)
+            flujo = _Flujo(f, self.bloque)
+            flujo.consumir('{')
+            while flujo.siguiente() not in ('}', ''):
+                clave = flujo.valor()
+                flujo.consumir(':')
+                if clave != 'results':
+                    flujo.valor()
+                elif flujo.siguiente() == '[':
+                    flujo.pos += 1
+                    while flujo.siguiente() not in (']', ''):
+                        try:
+                            yield flujo.valor()
+                        except json.JSONDecodeError:
+                            self.truncado = True
+                            metricas.errores()
+                            return
+                        if flujo.siguiente() == ',':
+                            flujo.pos += 1
+                    if flujo.siguiente() == '':
+                        self.truncado = True
+                        metricas.errores()
+                        return
+                    flujo.pos += 1
+                else:
+                    flujo.valor()
+                if flujo.siguiente() == ',':
+                    flujo.pos += 1
+
+    def bloques(self):
+        """
+        (lote, datos) de cada resultado con respuesta legible; datos[lista]
+        sólo tiene los elementos que son objetos. Los resultados sin
+        respuesta quedan en self.lotes con su error.
+        """
+        resultados = metricas.medir_iter('leer-resultados', self.resultados())
+        for numero, resultado in enumerate(resultados, 1):
+            lote = LoteLeido(numero)
+            self.lotes.append(lote)
+            if not isinstance(resultado, dict):
+                lote.error = 'resultado no es un objeto'
+                continue
+            # Un lote con error puede traer igualmente las entidades que estaban en caché
+            lote.error = str(resultado['error']) if resultado.get('error') else None
+            salida = resultado.get('output')
+            if not isinstance(salida, dict) or not isinstance(salida.get('json_data'), str):
+                lote.error = lote.error or 'sin json_data'
+                continue
+            datos, completo = rescatar(salida['json_data'], self.lista)
+            if datos is None:
+                lote.error = lote.error or 'respuesta ilegible'
+                lote.fallos += 1
+                metricas.errores()
+                continue
+            lote.leido = True
+            lote.parcial = not completo
+            elementos = datos.get(self.lista)
+            elementos = elementos if isinstance(elementos, list) else []
+            datos[self.lista] = [e for e in elementos if isinstance(e, dict)]
+            lote.fallos += len(elementos) - len(datos[self.lista])
+            lote.entidades = len(datos[self.lista])
+            # Una respuesta rescatada cuenta como un error de parseo, más las entidades descartadas
+            metricas.errores(lote.parcial + len(elementos) - len(datos[self.lista]))
+            yield lote, datos
+
+    def entidades(self):
+        """Cada entidad con id de todos los lotes, de una en una."""
+        for lote, datos in self.bloques():
+            for entidad in datos[self.lista]:
+                if isinstance(entidad.get('id'), str) and entidad['id'].strip():
+                    yield entidad
+                else:
+                    lote.entidades -= 1
+                    lote.fallos += 1
+                    metricas.errores()
+
+    def con_problemas(self):
+        return [lote for lote in self.lotes if lote.error or lote.fallos or lote.parcial]
+
+    def __str__(self):
+        entidades = sum(lote.entidades for lote in self.lotes)
+        fallos = sum(lote.fallos for lote in self.lotes)
+        con_error = sum(1 for lote in self.lotes if lote.error)
+        sin_datos = sum(1 for lote in self.lotes if not lote.leido)
+        parciales = sum(1 for lote in self.lotes if lote.parcial)
+        texto = (f'{len(self.lotes)} lotes, {entidades} entidades, {fallos} fallos, '
+                 f'{parciales} respuestas rescatadas, {con_error} lotes con error ({sin_datos} sin datos)')
+        return texto + (' (archivo truncado)' if self.truncado else '')
+
+    def informe(self, maximo=10):
+        """Resumen y una línea por lote con problemas, para imprimir al final del script."""
+        lineas = [f'Lectura de {self.path}: {self}']
+        problemas = self.con_problemas()
+        lineas.extend(f'  ⚠️ {lote}' for lote in problemas[:maximo])
+        if len(problemas) > maximo:
+            lineas.append(f'  ... y {len(problemas) - maximo} lotes más con problemas')
+        return '\n'.join(lineas)
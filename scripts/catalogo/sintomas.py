@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Índice invertido síntoma -> enfermedades para el comprobador de síntomas.
+
+Cada frase de `sintomas` se normaliza a términos (sin acentos, minúsculas,
+sin palabras vacías y con el plural recortado: 'Dolores de cabeza' ->
+['dolor', 'cabeza']). Cada término apunta a las enfermedades que lo tienen
+con un peso precalculado TF-IDF con saturación BM25: un término raro
+('sibilancia') pesa mucho más que uno que aparece en medio catálogo
+('dolor'), y repetirlo en varios síntomas de la misma enfermedad suma cada
+vez menos.
+
+Una consulta con varios síntomas sólo recorre las listas de sus términos:
+suma los pesos por enfermedad y multiplica por la fracción de síntomas de la
+consulta que la enfermedad cubre, así que gana la que explica más síntomas.
+
+Las enfermedades repetidas en varios sistemas se indexan una sola vez (con
+el sistema donde aparecen primero y la unión de sus síntomas). La misma
+normalización (catalogo/texto.py) y la misma consulta están en data/sintomas.ts.
+"""
+
+import heapq
+import math
+
+from . import texto
+from .store import CatalogStore
+from .texto import B, ESCALA, K1
+
+# Síntomas por consulta (la cobertura se lleva en una máscara de 32 bits en la app)
+MAX_FRASES = 30
+
+
+def terminos(frase):
+    """Términos de una frase de síntoma, en orden y sin repetir (ver catalogo/texto.py)."""
+    return list(dict.fromkeys(texto.terminos(frase, recortar=texto.raiz_plural)))
+
+
+class IndiceSintomas:
+    """
+    Índice término -> [(posición de enfermedad, peso)] sobre las enfermedades
+    únicas del catálogo (`entidades`: [(id, sistemaId)] en orden de aparición).
+    """
+
+    def __init__(self, store=None):
+        store = store or CatalogStore('enfermedades')
+        self.entidades = []
+        sintomas = {}
+        for sistema in store:
+            for enfermedad in sistema['enfermedades']:
+                id_ = enfermedad.get('id')
+                if id_ not in sintomas:
+                    self.entidades.append((id_, sistema['id']))
+                    sintomas[id_] = []
+                sintomas[id_].extend(s for s in enfermedad.get('sintomas') or () if s not in sintomas[id_])
+
+        # Frecuencia de cada término en los síntomas de cada enfermedad
+        frecuencias = []
+        for id_, _ in self.entidades:
+            tf = {}
+            for frase in sintomas[id_]:
+                for t in terminos(frase):
+                    tf[t] = tf.get(t, 0) + 1
+            frecuencias.append(tf)
+        self.sintomas = sintomas
+
+        n = len(self.entidades)
+        longitudes = [sum(tf.values()) for tf in frecuencias]
+        media = sum(longitudes) / max(1, sum(1 for l in longitudes if l)) or 1.0
+        df = {}
+        for tf in frecuencias:
+            for t in tf:
+                df[t] = df.get(t, 0) + 1
+        idf = {t: math.log(1 + (n - d + 0.5) / (d + 0.5)) for t, d in df.items()}
+
+        self.postings = {}
+        for posicion, tf in enumerate(frecuencias):
+            norma = K1 * (1 - B + B * longitudes[posicion] / media)
+            for t, f in tf.items():
+                peso = round(ESCALA * idf[t] * f * (K1 + 1) / (f + norma))
+                self.postings.setdefault(t, []).append((posicion, max(1, peso)))
+
+    def __len__(self):
+        return len(self.postings)
+
+    def consultar(self, sintomas, limite=10):
+        """
+        [(posición, puntuación, síntomas cubiertos)] de las `limite` enfermedades
+        que mejor explican la lista de `sintomas` (frases libres).
+        """
+        frases = [terminos(s) for s in sintomas]
+        frases = [f for f in frases if f][:MAX_FRASES]
+        if not frases:
+            return []
+        # término -> máscara de las frases de la consulta que lo contienen
+        mascaras = {}
+        for i, frase in enumerate(frases):
+            for t in frase:
+                mascaras[t] = mascaras.get(t, 0) | (1 << i)
+        puntos = {}
+        cubiertas = {}
+        for t, mascara in mascaras.items():
+            for posicion, peso in self.postings.get(t, ()):
+                puntos[posicion] = puntos.get(posicion, 0) + peso
+                cubiertas[posicion] = cubiertas.get(posicion, 0) | mascara
+        resultados = []
+        for posicion, suma in puntos.items():
+            cubiertos = bin(cubiertas[posicion]).count('1')
+            resultados.append((suma * cubiertos / len(frases) / ESCALA, cubiertos, posicion))
+        mejores = heapq.nlargest(limite, resultados, key=lambda r: (r[0], -r[2]))
+        return [(posicion, round(puntuacion, 3), cubiertos) for puntuacion, cubiertos, posicion in mejores]
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Almacén canónico del catálogo en JSON.
+
+Cada categoría de plantas y cada sistema corporal vive en su propio archivo
+bajo data/catalogo/, y `_index.json` guarda el orden. Es la fuente de verdad
+a partir de la cual se regeneran plantas-expandidas.ts y
+enfermedades-expandidas.ts.
+
+    data/catalogo/plantas/_index.json          ["hierbas-aromaticas-culinarias", ...]
+    data/catalogo/plantas/<categoria>.json     {"id", "nombre", "plantas": [...]}
+    data/catalogo/enfermedades/_index.json
+    data/catalogo/enfermedades/<sistema>.json  {"id", "nombre", "icono", "enfermedades": [...]}
+
+Los campos derivados del bloque padre (categoriaId/categoria en plantas,
+sistemaId en enfermedades) no se guardan: los añade el emisor.
+"""
+
+import json
+import os
+import tempfile
+
+from . import metricas
+from .parser import DATA_DIR, Enfermedad, Planta, iter_categorias, iter_sistemas
+
+STORE_DIR = os.path.join(DATA_DIR, 'catalogo')
+INDEX_FILE = '_index.json'
+
+# tipo -> (subdirectorio, clave de la lista de registros, campos derivados del padre, registro)
+TIPOS = {
+    'plantas': ('plantas', 'plantas', ('categoriaId', 'categoria'), Planta),
+    'enfermedades': ('enfermedades', 'enfermedades', ('sistemaId',), Enfermedad),
+}
+
+# Permisos de un archivo nuevo, como los daría open(): mkstemp crea el temporal
+# con 0600. La umask sólo se puede leer cambiándola, así que se lee una vez al
+# importar y no mientras otros hilos crean archivos.
+_UMASK = os.umask(0o022)
+os.umask(_UMASK)
+MODO_NUEVO = 0o666 & ~_UMASK
+
+
+def _modo(path):
+    """Permisos que debe conservar `path` al reemplazarlo (los de un archivo nuevo si no existe)."""
+    try:
+        return os.stat(path).st_mode & 0o7777
+    except FileNotFoundError:
+        return MODO_NUEVO
+
+
+class AtomicWriter:
+    """
+    Escritura por partes en un temporal del mismo directorio que `path`. Al
+    salir del bloque `with`, el temporal reemplaza a `path` si se llamó a
+    commit(); si no (o si hubo una excepción) se borra y `path` queda intacto.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        directory = os.path.dirname(path) or '.'
+        os.makedirs(directory, exist_ok=True)
+        fd, self.tmp = tempfile.mkstemp(dir=directory, prefix='.tmp-', suffix=os.path.basename(path))
+        self.file = os.fdopen(fd, 'w', encoding='utf-8')
+        self.committed = False
+
+    def write(self, text):
+        self.file.write(text)
+
+    def commit(self):
+        self.committed = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        replaced = False
+        try:
+            self.file.close()
+            if self.committed and exc_type is None:
+                metricas.escritos(os.path.getsize(self.tmp))
+                os.chmod(self.tmp, _modo(self.path))
+                os.replace(self.tmp, self.path)
+                replaced = True
+        finally:
+            if not replaced:
+                os.unlink(self.tmp)
+
+
+def write_atomic(path, content):
+    """Escribe `content` en un temporal del mismo directorio y lo renombra."""
+    with AtomicWriter(path) as f:
+        f.write(content)
+        f.commit()
+
+
+def dump_json(data):
+    """Serialización estable usada para archivos del almacén y para los hashes."""
+    return json.dumps(data, ensure_ascii=False, indent=2) + '\n'
+
+
+class CatalogStore:
+    """Lee y escribe los bloques (categorías o sistemas) de un tipo de catálogo."""
+
+    def __init__(self, tipo, root=STORE_DIR):
+        if tipo not in TIPOS:
+            raise ValueError(f"Tipo de catálogo desconocido: {tipo}")
+        self.tipo = tipo
+        subdir, self.clave, self.derivados, self.registro = TIPOS[tipo]
+        self.dir = os.path.join(root, subdir)
+
+    def path(self, bloque_id):
+        return os.path.join(self.dir, f'{bloque_id}.json')
+
+    def exists(self):
+        return os.path.exists(os.path.join(self.dir, INDEX_FILE))
+
+    def ids(self):
+        """Ids de los bloques en el orden en que se emiten."""
+        with open(os.path.join(self.dir, INDEX_FILE), 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def read_raw(self, bloque_id):
+        with open(self.path(bloque_id), 'r', encoding='utf-8') as f:
+            metricas.leidos(os.fstat(f.fileno()).st_size)
+            return f.read()
+
+    def load(self, bloque_id):
+        return json.loads(self.read_raw(bloque_id))
+
+    def __iter__(self):
+        for bloque_id in self.ids():
+            yield self.load(bloque_id)
+
+    def registros(self):
+        """Recorre todos los registros (plantas o enfermedades) del almacén."""
+        for bloque in self:
+            yield from bloque[self.clave]
+
+    def normalize(self, registro):
+        """Registro sin campos derivados y con el orden de campos del catálogo."""
+        campos = self.registro.CAMPOS
+        ordenado = {c: registro[c] for c in campos if c in registro and c not in self.derivados}
+        ordenado.update((k, v) for k, v in registro.items() if k not in campos)
+        return ordenado
+
+    def save(self, bloque):
+        """Guarda un bloque sólo si su contenido cambió. Devuelve True si escribió."""
+        bloque = dict(bloque)
+        bloque[self.clave] = [self.normalize(r) for r in bloque[self.clave]]
+        content = dump_json(bloque)
+        path = self.path(bloque['id'])
+        if os.path.exists(path) and self.read_raw(bloque['id']) == content:
+            return False
+        write_atomic(path, content)
+        return True
+
+    def save_all(self, bloques):
+        """
+        Reemplaza el almacén completo; devuelve los ids de bloques que cambiaron.
+        `bloques` puede ser un generador: cada bloque se guarda según llega.
+        """
+        changed = []
+        ids = []
+        for bloque in bloques:
+            ids.append(bloque['id'])
+            if self.save(bloque):
+                changed.append(bloque['id'])
+        index_path = os.path.join(self.dir, INDEX_FILE)
+        if not self.exists() or self.ids() != ids:
+            write_atomic(index_path, dump_json(ids))
+        # Los archivos con prefijo '_' son metadatos (índice, manifiestos)
+        for name in os.listdir(self.dir):
+            if name.endswith('.json') and not name.startswith('_') and name[:-5] not in ids:
+                os.unlink(os.path.join(self.dir, name))
+        return changed
+
+
+def import_from_ts(tipo, store=None):
+    """Inicializa el almacén a partir del archivo TypeScript generado actual."""
+    store = store or CatalogStore(tipo)
+    if tipo == 'plantas':
+        bloques = [c.to_dict() for c in iter_categorias()]
+    else:
+        bloques = [s.to_dict() for s in iter_sistemas()]
+    return store.save_all(bloques)
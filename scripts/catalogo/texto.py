@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Normalización de texto, parámetros BM25 y estimación de tokens compartidos
+por los índices y el planificador de lotes.
+
+Todos los índices por términos (síntomas, ranking, recuperación y el
+vocabulario de propiedades) parten el texto igual: minúsculas, sin acentos
+(descomposición NFD sin marcas combinantes, como
+`normalize('NFD').replace(/[\\u0300-\\u036f]/g, '')` en la app) y palabras
+[a-z0-9]+. Los lectores en TypeScript repiten estas reglas:
+
+- data/sintomas.ts: `terminosSintoma` (sólo el plural, con `raiz_plural`).
+- server/recuperacion.ts: `terminosConsulta` (plural y género, con `raiz`).
+
+Cualquier cambio aquí obliga a regenerar los índices y a cambiar esos
+lectores a la vez.
+"""
+
+import math
+import re
+import unicodedata
+
+# Parámetros BM25
+K1 = 1.2
+B = 0.75
+
+# Los pesos se guardan como enteros (centésimas) en los índices generados
+ESCALA = 100
+
+# Caracteres por token para estimar el coste de un texto (español, tokenizadores BPE)
+CARACTERES_POR_TOKEN = 4
+
+# Longitud mínima de una palabra para formar término
+MIN_LETRAS = 3
+
+VACIAS = frozenset('''
+    a al ante con contra de del desde durante e el en entre hacia hasta la las le les lo los
+    mas muy o para pero por que se sin sobre su sus tras u un una uno unos unas y ya
+    como cuando donde otro otra otros otras puede pueden tambien veces vez mismo misma
+'''.split())
+
+# Vacías de las claves de propiedades (catalogo/propiedades.py): sólo artículos y
+# preposiciones, porque 'sin' o 'contra' cambian el sentido de una propiedad y las
+# claves guardadas no pueden cambiar
+VACIAS_PROPIEDADES = frozenset(('a', 'al', 'con', 'de', 'del', 'e', 'el', 'en', 'la', 'las', 'lo', 'los',
+                                'o', 'para', 'por', 'un', 'una', 'y'))
+
+_MARCAS = re.compile('[\u0300-\u036f]')
+_PALABRA = re.compile(r'[a-z0-9]+')
+
+
+def plegar(texto):
+    """Minúsculas y sin acentos ('Náuseas' -> 'nauseas')."""
+    return _MARCAS.sub('', unicodedata.normalize('NFD', texto.lower()))
+
+
+def palabras(texto):
+    """Palabras del texto ya plegado."""
+    return _PALABRA.findall(texto)
+
+
+def raiz(palabra):
+    """Palabra sin plural ni terminación de género (antiinflamatorias -> antiinflamatori)."""
+    if len(palabra) > 3 and palabra.endswith('s'):
+        palabra = palabra[:-1]
+    if len(palabra) > 3 and palabra[-1] in 'aoe':
+        palabra = palabra[:-1]
+    return palabra
+
+
+def raiz_plural(palabra):
+    """Recorta sólo el plural: 'dolores' -> 'dolor', 'nauseas' -> 'nausea'."""
+    if len(palabra) > 5 and palabra.endswith('es') and palabra[-3] not in 'aeiou':
+        return palabra[:-2]
+    if len(palabra) > 4 and palabra.endswith('s'):
+        return palabra[:-1]
+    return palabra
+
+
+def terminos(texto, vacias=VACIAS, recortar=raiz):
+    """Términos de un texto, en orden y con repeticiones: plegado, sin vacías ni palabras cortas."""
+    return [recortar(p) for p in palabras(plegar(texto)) if p not in vacias and len(p) >= MIN_LETRAS]
+
+
+def estimar_tokens(texto):
+    """Tokens aproximados de un texto en un prompt (estimarTokens en server/recuperacion.ts)."""
+    return math.ceil(len(texto) / CARACTERES_POR_TOKEN)
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Versiones numeradas del catálogo para actualizaciones incrementales.
+
+Cada tipo guarda en data/versiones/<tipo>/ una instantánea completa (la base)
+y la cadena de deltas (catalogo/diff.py) de cada versión a la siguiente:
+
+    manifiesto.json         versión actual, base, deltas y ruta por versión
+    base-5.json             bloques completos de la versión 5
+    delta-5-6.json          delta de la 5 a la 6
+    delta-2-7.json          salto directo creado al compactar
+
+Registrar una versión sólo añade el delta contra la anterior. Cuando la
+cadena crece demasiado (MAX_CADENA deltas o más bytes que la base) se
+compacta: la versión actual pasa a ser la base y las últimas RETENER
+versiones reciben un delta directo a ella, así que un cliente desactualizado
+sigue descargando un solo parche pequeño.
+
+El manifiesto incluye `rutas`: para cada versión conocida, la secuencia de
+archivos más barata (en bytes) hasta la actual. Un cliente con la versión N
+descarga manifiesto.json, busca rutas[N] y, si no está (versión demasiado
+antigua o ruta más cara que empezar de cero), usa `completo`: la base y la
+cadena desde ella.
+
+Como los chunks y el módulo compacto, el historial se crea una vez con
+scripts/catalog-versions.py registrar y, desde entonces, cada emisión que
+cambia el catálogo (process-plants.py, process-diseases.py, los scripts de
+fusión, build-catalog.py) registra una versión nueva.
+"""
+
+import json
+import os
+import time
+
+from .diff import aplicar, cargar_version, diferencia, hash_version, vacio
+from .parser import DATA_DIR
+from .store import dump_json, write_atomic
+
+VERSIONES_DIR = os.path.join(DATA_DIR, 'versiones')
+MANIFIESTO = 'manifiesto.json'
+
+# Deltas encadenados desde la base antes de compactar
+MAX_CADENA = 10
+# Versiones anteriores que reciben un salto directo al compactar
+RETENER = 20
+
+
+def versiones_dir(ts_path):
+    """Raíz del historial de versiones junto al módulo .ts (data/versiones/)."""
+    return os.path.join(os.path.dirname(ts_path), 'versiones')
+
+
+def _diferencia_comprobada(tipo, anterior, bloques):
+    """
+    Delta de `anterior` a `bloques` después de comprobar que aplicarlo da
+    `bloques`: un delta que no se puede aplicar rompería todas las
+    reconstrucciones siguientes del historial. Lanza DeltaError si no.
+    """
+    delta = diferencia(tipo, anterior, bloques)
+    aplicar(delta, anterior)
+    return delta
+
+
+def _compacto(datos):
+    return json.dumps(datos, ensure_ascii=False, separators=(',', ':')) + '\n'
+
+
+class Versiones:
+    """Instantánea base + cadena de deltas de un tipo de catálogo."""
+
+    def __init__(self, tipo, root=VERSIONES_DIR):
+        self.tipo = tipo
+        self.dir = os.path.join(root, tipo)
+        self.manifiesto_path = os.path.join(self.dir, MANIFIESTO)
+        self.manifiesto = None
+        if self.existe():
+            with open(self.manifiesto_path, 'r', encoding='utf-8') as f:
+                self.manifiesto = json.load(f)
+
+    def existe(self):
+        return os.path.exists(self.manifiesto_path)
+
+    @property
+    def actual(self):
+        return self.manifiesto['actual'] if self.manifiesto else 0
+
+    def _leer(self, archivo):
+        with open(os.path.join(self.dir, archivo), 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def _escribir(self, archivo, datos):
+        contenido = _compacto(datos)
+        write_atomic(os.path.join(self.dir, archivo), contenido)
+        return len(contenido.encode('utf-8'))
+
+    def cadena(self):
+        """Deltas consecutivos desde la base hasta la versión actual."""
+        por_origen = {d['desde']: d for d in self.manifiesto['deltas'] if d['hasta'] == d['desde'] + 1}
+        cadena = []
+        version = self.manifiesto['base']['version']
+        while version < self.actual:
+            cadena.append(por_origen[version])
+            version += 1
+        return cadena
+
+    def reconstruir(self, version=None):
+        """Bloques de una versión entre la base y la actual (por defecto la actual)."""
+        version = self.actual if version is None else version
+        base = self.manifiesto['base']
+        if not base['version'] <= version <= self.actual:
+            raise ValueError(f"La versión {version} ya no se puede reconstruir (base {base['version']})")
+        bloques = self._leer(base['archivo'])
+        for delta in self.cadena():
+            if delta['desde'] >= version:
+                break
+            bloques = aplicar(self._leer(delta['archivo']), bloques)
+        return bloques
+
+    def registrar(self, bloques=None, compactar=None):
+        """
+        Registra el estado del almacén (o `bloques`) como versión nueva si
+        cambió. Devuelve (versión actual, True si se creó).
+        """
+        bloques = cargar_version(self.tipo) if bloques is None else bloques
+        ahora = time.strftime('%Y-%m-%dT%H:%M:%S')
+        if self.manifiesto is None:
+            bytes_base = self._escribir('base-1.json', bloques)
+            self.manifiesto = {
+                'tipo': self.tipo,
+                'actual': 1,
+                'base': {'version': 1, 'archivo': 'base-1.json', 'bytes': bytes_base},
+                'deltas': [],
+                'versiones': {'1': {'hash': hash_version(bloques), 'fecha': ahora}},
+            }
+            self._guardar()
+            return 1, True
+
+        anterior = self.reconstruir()
+        delta = _diferencia_comprobada(self.tipo, anterior, bloques)
+        if vacio(delta):
+            return self.actual, False
+        desde, hasta = self.actual, self.actual + 1
+        archivo = f'delta-{desde}-{hasta}.json'
+        self.manifiesto['deltas'].append(
+            {'desde': desde, 'hasta': hasta, 'archivo': archivo, 'bytes': self._escribir(archivo, delta)})
+        self.manifiesto['actual'] = hasta
+        self.manifiesto['versiones'][str(hasta)] = {'hash': delta['destino'], 'fecha': ahora}
+
+        cadena = self.cadena()
+        if compactar is None:
+            compactar = (len(cadena) >= MAX_CADENA
+                         or sum(d['bytes'] for d in cadena) > self.manifiesto['base']['bytes'])
+        if compactar:
+            self.compactar(bloques)
+        else:
+            self._guardar()
+        return hasta, True
+
+    def compactar(self, bloques=None):
+        """La versión actual pasa a ser la base; las RETENER anteriores reciben un salto directo."""
+        actual = self.reconstruir() if bloques is None else bloques
+        base_anterior = self.manifiesto['base']['version']
+        retenidas = [v for v in range(max(base_anterior, self.actual - RETENER), self.actual)]
+
+        archivo_base = f'base-{self.actual}.json'
+        saltos = []
+        for version in retenidas:
+            delta = _diferencia_comprobada(self.tipo, self.reconstruir(version), actual)
+            archivo = f'delta-{version}-{self.actual}.json'
+            saltos.append({'desde': version, 'hasta': self.actual, 'archivo': archivo,
+                           'bytes': self._escribir(archivo, delta)})
+        # Saltos de compactaciones anteriores que siguen dentro de la ventana: llegan a una
+        # versión retenida y desde ahí hay un salto directo
+        previos = [d for d in self.manifiesto['deltas']
+                   if d['desde'] < base_anterior and d['desde'] >= self.actual - RETENER]
+        self.manifiesto['base'] = {'version': self.actual, 'archivo': archivo_base,
+                                   'bytes': self._escribir(archivo_base, actual)}
+        self.manifiesto['deltas'] = previos + saltos
+        self._guardar()
+        self._limpiar()
+
+    def _limpiar(self):
+        usados = {MANIFIESTO, self.manifiesto['base']['archivo']}
+        usados.update(d['archivo'] for d in self.manifiesto['deltas'])
+        for nombre in os.listdir(self.dir):
+            if nombre.endswith('.json') and nombre not in usados:
+                os.unlink(os.path.join(self.dir, nombre))
+
+    def rutas(self):
+        """versión -> archivos de la ruta más barata hasta la actual (sólo si es más barata que `completo`)."""
+        completo = self.manifiesto['base']['bytes'] + sum(d['bytes'] for d in self.cadena())
+        salientes = {}
+        for d in self.manifiesto['deltas']:
+            salientes.setdefault(d['desde'], []).append(d)
+        # Los deltas siempre van hacia versiones mayores: basta recorrer de la actual hacia atrás
+        coste = {self.actual: (0, [])}
+        for version in sorted(salientes, reverse=True):
+            opciones = [(d['bytes'] + coste[d['hasta']][0], [d['archivo']] + coste[d['hasta']][1])
+                        for d in salientes[version] if d['hasta'] in coste]
+            if opciones:
+                coste[version] = min(opciones)
+        return {str(v): archivos for v, (bytes_, archivos) in sorted(coste.items())
+                if v != self.actual and bytes_ < completo}
+
+    def ruta(self, desde):
+        """Archivos a descargar para pasar de `desde` a la actual ([] si ya está al día)."""
+        if desde == self.actual:
+            return []
+        return self.manifiesto['rutas'].get(str(desde), self.manifiesto['completo'])
+
+    def _guardar(self):
+        self.manifiesto['completo'] = [self.manifiesto['base']['archivo']] + [d['archivo'] for d in self.cadena()]
+        self.manifiesto['rutas'] = self.rutas()
+        write_atomic(self.manifiesto_path, dump_json(self.manifiesto))
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Script para comparar dos versiones del catálogo y generar o aplicar un
+delta por campo (ver scripts/catalogo/diff.py).
+
+Cada versión puede ser un directorio de almacén (el que contiene plantas/ y
+enfermedades/), un módulo .ts generado o 'git:<rev>' para el almacén de una
+revisión. Si no se indica el destino, se compara con el almacén actual.
+
+Uso:
+    python3 scripts/diff-catalog.py git:HEAD~1                        # resumen contra el almacén
+    python3 scripts/diff-catalog.py git:v1.2 --salida /tmp/delta.json
+    python3 scripts/diff-catalog.py --aplicar /tmp/delta.json         # aplica al almacén y re-emite
+
+El archivo de deltas es {"plantas": <delta>, "enfermedades": <delta>}, sólo
+con los tipos que cambiaron.
+"""
+
+import argparse
+import gzip
+import json
+import time
+
+from catalogo import ENFERMEDADES_TS, PLANTAS_TS, CatalogStore, emit, write_atomic
+from catalogo.diff import DeltaError, aplicar, cargar_version, diferencia, resumen, vacio
+from catalogo.parser import read_text
+from catalogo.store import STORE_DIR, TIPOS
+
+MODULOS = {'plantas': PLANTAS_TS, 'enfermedades': ENFERMEDADES_TS}
+
+
+def tamano_gzip(texto):
+    return len(gzip.compress(texto.encode('utf-8'), 9))
+
+
+def comparar(args):
+    deltas = {}
+    for tipo in args.tipo or ['plantas', 'enfermedades']:
+        inicio = time.perf_counter()
+        base = cargar_version(tipo, args.base)
+        destino = cargar_version(tipo, args.destino)
+        carga = (time.perf_counter() - inicio) * 1000
+        inicio = time.perf_counter()
+        delta = diferencia(tipo, base, destino)
+        ms = (time.perf_counter() - inicio) * 1000
+        if vacio(delta):
+            print(f"✓ {tipo}: sin cambios ({ms:.1f} ms)")
+            continue
+        deltas[tipo] = delta
+        serializado = json.dumps(delta, ensure_ascii=False, separators=(',', ':'))
+        modulo = read_text(MODULOS[tipo])
+        print(f"✓ {tipo}: {', '.join(f'{n} {k}' for k, n in resumen(delta).items())} "
+              f"(carga {carga:.0f} ms, diff {ms:.1f} ms)")
+        print(f"    delta: {len(serializado) / 1024:.1f} KB ({tamano_gzip(serializado) / 1024:.1f} KB gzip) "
+              f"frente a {len(modulo.encode('utf-8')) / 1024:.0f} KB "
+              f"({tamano_gzip(modulo) / 1024:.0f} KB gzip) del módulo completo")
+    if args.salida:
+        write_atomic(args.salida, json.dumps(deltas, ensure_ascii=False, indent=2) + '\n')
+        print(f"✓ Deltas guardados en {args.salida}")
+
+
+def aplicar_archivo(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        deltas = json.load(f)
+    for tipo, delta in deltas.items():
+        store = CatalogStore(tipo)
+        try:
+            bloques = aplicar(delta, cargar_version(tipo))
+        except DeltaError as e:
+            raise SystemExit(f"❌ {tipo}: {e}")
+        cambiados = store.save_all(bloques)
+        result = emit(tipo, store)
+        print(f"✓ {tipo}: {', '.join(f'{n} {k}' for k, n in resumen(delta).items())}; "
+              f"{len(cambiados)} bloques guardados, {len(result.rendered)} re-emitidos")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('base', nargs='?', help='Versión de partida')
+    parser.add_argument('destino', nargs='?', default=STORE_DIR, help='Versión final (por defecto el almacén)')
+    parser.add_argument('--tipo', choices=sorted(TIPOS), action='append',
+                        help='Catálogo a comparar (por defecto ambos)')
+    parser.add_argument('--salida', help='Guardar los deltas en este archivo JSON')
+    parser.add_argument('--aplicar', metavar='DELTAS', help='Aplicar un archivo de deltas al almacén')
+    args = parser.parse_args()
+
+    if args.aplicar:
+        aplicar_archivo(args.aplicar)
+    elif args.base:
+        comparar(args)
+    else:
+        parser.error('indica la versión base o --aplicar')
+
+
+if __name__ == "__main__":
+    main()
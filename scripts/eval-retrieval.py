@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Evaluación del índice de recuperación de MolDoctor (catalogo/recuperacion.py).
+
+Lanza consultas de prueba (síntomas sacados al azar de las enfermedades del
+catálogo, más algunos mensajes fijos) y compara los tokens del prompt del
+sistema en tres casos:
+
+    recuperación   prompt base + fichas recuperadas (o la lista fija si no hay nada)
+    lista fija     el prompt actual, con las 24 plantas fijas de server/moldoctor.ts
+    catálogo       prompt base + las fichas de todo el catálogo
+
+También mide la cobertura (la enfermedad de la que salieron los síntomas
+está entre las recuperadas), las consultas sin contexto y la latencia p50/p95
+de una consulta. Los tokens se estiman con CARACTERES_POR_TOKEN
+(catalogo/texto.py).
+
+Uso:
+    python3 scripts/eval-retrieval.py
+    python3 scripts/eval-retrieval.py --muestras 1000 --semilla 7 --json /tmp/eval-recuperacion.json
+"""
+
+import argparse
+import json
+import os
+import random
+import re
+import time
+
+from catalogo import REPO_ROOT, CatalogStore, write_atomic
+from catalogo import recuperacion as r
+from catalogo.texto import estimar_tokens
+
+MOLDOCTOR_TS = os.path.join(REPO_ROOT, 'server', 'moldoctor.ts')
+
+CONSULTAS_FIJAS = (
+    'Hola doctor, tengo gastritis desde hace una semana',
+    'tengo tos con flemas y fiebre',
+    'no puedo dormir por las noches y estoy muy nervioso',
+    'me duele la cabeza y tengo náuseas',
+    '¿qué planta sirve para bajar la presión alta?',
+    'me quemé la mano con aceite',
+    'hola, buenas tardes',
+)
+
+
+def prompt_actual(ruta=MOLDOCTOR_TS):
+    """(prompt base sin lista de plantas, lista fija de plantas) leídos de server/moldoctor.ts."""
+    with open(ruta, 'r', encoding='utf-8') as f:
+        contenido = f.read()
+    literales = dict(re.findall(r'const (\w+) = `(.*?)`;', contenido, re.S))
+    base = literales['PROMPT_INICIO'] + '\n\n' + '\n\n' + literales['PROMPT_FINAL']
+    return base, literales['PLANTAS_POR_DEFECTO']
+
+
+def consultas_de_sintomas(muestras, semilla):
+    """[(mensaje, id de la enfermedad)] con 1 a 3 síntomas de una enfermedad al azar."""
+    azar = random.Random(semilla)
+    enfermedades = [e for e in CatalogStore('enfermedades').registros() if e.get('sintomas')]
+    consultas = []
+    for _ in range(muestras):
+        enfermedad = azar.choice(enfermedades)
+        sintomas = azar.sample(enfermedad['sintomas'], min(len(enfermedad['sintomas']), azar.randint(1, 3)))
+        consultas.append(('tengo ' + ' y '.join(sintomas).lower(), enfermedad['id']))
+    return consultas
+
+
+def percentil(valores, p):
+    ordenados = sorted(valores)
+    return ordenados[min(len(ordenados) - 1, int(p / 100 * len(ordenados)))] if ordenados else 0.0
+
+
+def evaluar(indice, consultas, base, plantas_fijas):
+    tokens_base = estimar_tokens(base)
+    tokens_fija = estimar_tokens(base + plantas_fijas)
+    catalogo = '\n\n'.join(f"{r.CABECERAS[tipo]}\n" + '\n'.join(d[3] for d in indice.documentos if d[0] == tipo)
+                           for tipo in (r.ENFERMEDAD, r.PLANTA))
+    tokens_catalogo = estimar_tokens(base + catalogo)
+
+    tokens, latencias = [], []
+    aciertos = vacias = 0
+    for mensaje, enfermedad in consultas:
+        inicio = time.perf_counter()
+        elegidos = indice.consultar(mensaje)
+        latencias.append((time.perf_counter() - inicio) * 1e6)
+        contexto = indice.contexto(elegidos)
+        if not contexto:
+            vacias += 1
+        tokens.append(estimar_tokens(base + (contexto or plantas_fijas)))
+        if enfermedad and any(indice.documentos[d][1] == enfermedad for d in elegidos):
+            aciertos += 1
+
+    con_fuente = sum(1 for _, e in consultas if e)
+    return {
+        'consultas': len(consultas),
+        'tokens': {
+            'base': tokens_base,
+            'lista_fija': tokens_fija,
+            'catalogo': tokens_catalogo,
+            'recuperacion_media': round(sum(tokens) / max(1, len(tokens)), 1),
+            'recuperacion_p95': percentil(tokens, 95),
+            'recuperacion_max': max(tokens, default=0),
+        },
+        'cobertura': round(aciertos / max(1, con_fuente), 4),
+        'sin_contexto': vacias,
+        'latencia_us': {'p50': round(percentil(latencias, 50), 1), 'p95': round(percentil(latencias, 95), 1)},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--muestras', type=int, default=500, help='Consultas de síntomas al azar (default: 500)')
+    parser.add_argument('--semilla', type=int, default=1)
+    parser.add_argument('--json', help='Guardar el resultado en este archivo')
+    args = parser.parse_args()
+
+    inicio = time.perf_counter()
+    indice = r.IndiceRecuperacion(recomendadas=r.recomendadas_por_ranking())
+    print(f"✓ Índice: {len(indice)} documentos, {len(indice.postings)} términos "
+          f"({(time.perf_counter() - inicio) * 1000:.0f} ms)")
+
+    base, plantas_fijas = prompt_actual()
+    consultas = consultas_de_sintomas(args.muestras, args.semilla) + [(c, None) for c in CONSULTAS_FIJAS]
+    resultado = evaluar(indice, consultas, base, plantas_fijas)
+
+    t = resultado['tokens']
+    print(f"\nTokens del prompt del sistema ({resultado['consultas']} consultas):")
+    print(f"  catálogo completo: {t['catalogo']:>7}")
+    print(f"  lista fija:        {t['lista_fija']:>7}")
+    print(f"  recuperación:      {t['recuperacion_media']:>7} de media, p95 {t['recuperacion_p95']}, "
+          f"máx {t['recuperacion_max']} (base {t['base']})")
+    print(f"  ahorro frente al catálogo completo: {1 - t['recuperacion_media'] / t['catalogo']:.1%}")
+    print(f"\nCobertura de la enfermedad de origen: {resultado['cobertura']:.1%}")
+    print(f"Consultas sin contexto (lista fija): {resultado['sin_contexto']}")
+    print(f"Latencia por consulta: p50 {resultado['latencia_us']['p50']} µs, "
+          f"p95 {resultado['latencia_us']['p95']} µs")
+
+    if args.json:
+        write_atomic(args.json, json.dumps(resultado, ensure_ascii=False, indent=2))
+        print(f"\n✓ Resultado guardado en {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,65 +1,68 @@
 #!/usr/bin/env python3
 """
 Script para extraer enfermedades por sistema para procesamiento paralelo
+
+Las enfermedades se reparten, en orden de sistema, en lotes de tokens
+parecidos (ver catalogo/lotes.py) en lugar de un lote por sistema.
+
+Uso:
+    python3 scripts/extract-enfermedades.py [--presupuesto 8000] [--max-salida 4000] [--concurrencia 4]
 """
 
-import re
+import argparse
 import json
 
-# Leer el archivo de enfermedades
-with open('/home/ubuntu/pocima-salvage/data/enfermedades-expandidas.ts', 'r', encoding='utf-8') as f:
-    content = f.read()
+from catalogo import iter_sistemas, lotes, work_path
+from catalogo.etapas import ETAPAS
 
-# Encontrar todos los sistemas y sus enfermedades
-sistemas = []
-sistema_pattern = r'\{\s*id:\s*"([^"]+)",\s*nombre:\s*"([^"]+)",\s*icono:\s*"([^"]+)",\s*enfermedades:\s*\['
-sistema_matches = list(re.finditer(sistema_pattern, content))
+parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+lotes.argumentos(parser)
+args = parser.parse_args()
 
-for i, match in enumerate(sistema_matches):
-    sistema_id = match.group(1)
-    sistema_nombre = match.group(2)
-    
-    # Encontrar el final de este sistema (inicio del siguiente o fin del array)
-    start = match.end()
-    if i + 1 < len(sistema_matches):
-        end = sistema_matches[i + 1].start()
-    else:
-        end = len(content)
-    
-    sistema_content = content[start:end]
-    
-    # Extraer enfermedades de este sistema
-    enfermedad_pattern = r'\{\s*id:\s*"([^"]+)",\s*nombre:\s*"([^"]+)"'
-    enfermedades = re.findall(enfermedad_pattern, sistema_content)
-    
+# Extraer sistemas y sus enfermedades
+sistemas = []
+registros = []
+for sistema in iter_sistemas():
+    registros.extend(e.to_dict() for e in sistema.enfermedades)
     sistemas.append({
-        'id': sistema_id,
-        'nombre': sistema_nombre,
-        'enfermedades': [{'id': e[0], 'nombre': e[1]} for e in enfermedades]
+        'id': sistema.id,
+        'nombre': sistema.nombre,
+        'enfermedades': [{'id': e.id, 'nombre': e.nombre, 'sistema': sistema.id, 'sistema_nombre': sistema.nombre}
+                         for e in sistema.enfermedades]
     })
 
 print(f"Total de sistemas: {len(sistemas)}")
 total_enfermedades = sum(len(s['enfermedades']) for s in sistemas)
 print(f"Total de enfermedades: {total_enfermedades}")
 
-# Preparar inputs para procesamiento paralelo (por sistema)
+# Repartir en lotes de tokens parecidos
+etapa = ETAPAS['sintomas']
+salida = lotes.salida_media(registros, ('sintomas', 'causas'))
+planificador = lotes.planificador(args, salida, lotes.fijo_lote(etapa, 'SISTEMA: \nENFERMEDADES:'))
+plan = planificador.repartir([e for s in sistemas for e in s['enfermedades']])
+
+# Preparar inputs para procesamiento paralelo
 parallel_inputs = []
-for sistema in sistemas:
-    enfermedades_str = ", ".join([f"{e['nombre']} [id: {e['id']}]" for e in sistema['enfermedades']])
+for i, lote in enumerate(plan.lotes, 1):
     parallel_inputs.append({
-        'sistema_id': sistema['id'],
-        'sistema_nombre': sistema['nombre'],
-        'enfermedades': enfermedades_str,
-        'ids': [e['id'] for e in sistema['enfermedades']],
-        'count': len(sistema['enfermedades'])
+        'lote': f'lote-{i}',
+        'encabezado': lotes.encabezado('SISTEMA', 'SISTEMAS', (e['sistema_nombre'] for e in lote.entidades),
+                                       'ENFERMEDADES'),
+        'enfermedades': ", ".join([f"{e['nombre']} [id: {e['id']}]" for e in lote.entidades]),
+        'ids': [e['id'] for e in lote.entidades],
+        'entidades': lote.entidades,
+        'count': len(lote.entidades),
+        'tokens_entrada': lote.tokens_entrada,
+        'tokens_salida': lote.tokens_salida
     })
 
 # Guardar para procesamiento
-with open('/home/ubuntu/enfermedades_por_sistema.json', 'w', encoding='utf-8') as f:
+with open(work_path('enfermedades_por_sistema.json'), 'w', encoding='utf-8') as f:
     json.dump(parallel_inputs, f, ensure_ascii=False, indent=2)
 
-print("\nEnfermedades por sistema:")
-for sistema in parallel_inputs:
-    print(f"  - {sistema['sistema_nombre']}: {sistema['count']} enfermedades")
+print(f"\nUn lote por sistema: {planificador.agrupar(s['enfermedades'] for s in sistemas)}")
+print(f"Repartido:           {plan}")
+for lote in parallel_inputs:
+    print(f"  - {lote['lote']}: {lote['count']} enfermedades ({lote['encabezado'].splitlines()[0]})")
 
-print(f"\nArchivo generado: /home/ubuntu/enfermedades_por_sistema.json")
+print(f"\nArchivo generado: {work_path('enfermedades_por_sistema.json')}")
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Script para encontrar plantas y enfermedades duplicadas o casi duplicadas
+en todo el catálogo (ver scripts/catalogo/duplicados.py) y escribir un
+reporte con sugerencias de fusión.
+"""
+
+import argparse
+import json
+
+from catalogo import metricas, work_path, write_atomic
+from catalogo.duplicados import CERCANO, DIVERGENTE, IDENTICO, UMBRAL_JACCARD, detectar
+from catalogo.store import TIPOS
+
+REPORTE_JSON = work_path('duplicados.json')
+
+
+def resumir(tipo, grupos, plantillas, stats, mostrar):
+    por_clase = {clase: [g for g in grupos if g['clase'] == clase] for clase in (CERCANO, DIVERGENTE, IDENTICO)}
+    print(f"\n✓ {tipo}: {stats}")
+    print(f"    {len(por_clase[CERCANO])} grupos con ids distintos, "
+          f"{len(por_clase[DIVERGENTE])} ids repetidos con datos distintos, "
+          f"{len(por_clase[IDENTICO])} ids repetidos idénticos")
+    for g in por_clase[CERCANO][:mostrar]:
+        miembros = ', '.join(f"{m['id']} ({m['bloque']})" for m in g['miembros'])
+        print(f"    - {g['canonico']['id']} <- {', '.join(g['renombrar'])} [{', '.join(g['motivos'])}]: {miembros}")
+    for p in plantillas[:mostrar]:
+        print(f"    ⚠️ texto repetido en {len(p['miembros'])} registros ({p['similitud']:.2f}): "
+              f"{', '.join(m['id'] for m in p['miembros'][:8])}{'…' if len(p['miembros']) > 8 else ''}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--tipo', choices=sorted(TIPOS), action='append',
+                        help='Catálogo a revisar (por defecto ambos)')
+    parser.add_argument('--umbral', type=float, default=UMBRAL_JACCARD,
+                        help=f'Jaccard mínimo entre textos (por defecto {UMBRAL_JACCARD})')
+    parser.add_argument('--json', default=REPORTE_JSON, help='Ruta del reporte de fusión')
+    parser.add_argument('--mostrar', type=int, default=10, help='Grupos a mostrar por tipo')
+    args = parser.parse_args()
+
+    reporte = {}
+    for tipo in args.tipo or ['plantas', 'enfermedades']:
+        with metricas.fase(f'detectar-{tipo}') as medida:
+            grupos, plantillas, stats = detectar(tipo, umbral=args.umbral)
+            medida.registros = stats.registros
+        resumir(tipo, grupos, plantillas, stats, args.mostrar)
+        reporte[tipo] = {'grupos': grupos, 'plantillas': plantillas}
+
+    write_atomic(args.json, json.dumps(reporte, ensure_ascii=False, indent=2) + '\n')
+    print(f"\nReporte de fusión: {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,37 +3,25 @@
 Script para identificar plantas que necesitan contraindicaciones y nombres alternativos.
 """
 
-import re
 import json
 
+from catalogo import work_path
+from catalogo.auditoria import auditar
+
 def find_incomplete_plantas():
-    with open('/home/ubuntu/pocima-salvage/data/plantas-expandidas.ts', 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    # Buscar plantas con contraindicaciones vacías
-    # Patrón: nombre seguido de contraindicaciones: []
-    
-    plantas_sin_contraindicaciones = []
-    plantas_sin_nombres_alt = []
-    
-    # Dividir por bloques de planta
-    # Buscar patrones de plantas individuales
-    
-    # Extraer todos los nombres de plantas
-    all_plantas = re.findall(r"nombre:\s*['\"]([^'\"]+)['\"]", content)
-    
-    # Buscar plantas con contraindicaciones vacías
-    # El patrón busca nombre seguido de contraindicaciones: []
-    pattern_empty_contra = r"nombre:\s*['\"]([^'\"]+)['\"][^}]*contraindicaciones:\s*\[\s*\]"
-    plantas_con_contra_vacia = re.findall(pattern_empty_contra, content, re.DOTALL)
+    # Hallazgos de la auditoría incremental (sólo se revisan las plantas que cambiaron)
+    resultados, _ = auditar(tipos=('plantas',))
+    plantas = resultados['plantas']
     
-    # Buscar plantas sin nombresAlternativos
-    pattern_with_nombres = r"nombre:\s*['\"]([^'\"]+)['\"][^}]*nombresAlternativos:\s*{"
-    plantas_con_nombres = set(re.findall(pattern_with_nombres, content, re.DOTALL))
+    # Plantas con contraindicaciones vacías
+    plantas_con_contra_vacia = [e['nombre'] for e in plantas.entidades_con('vacio:contraindicaciones')]
     
-    plantas_sin_nombres = [p for p in all_plantas if p not in plantas_con_nombres]
+    # Plantas sin nombresAlternativos
+    plantas_sin_nombres = [
+        e['nombre'] for e in plantas.entidades_con('falta:nombresAlternativos', 'vacio:nombresAlternativos')
+    ]
     
-    print(f"Total plantas: {len(all_plantas)}")
+    print(f"Total plantas: {plantas.total}")
     print(f"Plantas con contraindicaciones vacías: {len(plantas_con_contra_vacia)}")
     print(f"Plantas sin nombres alternativos: {len(plantas_sin_nombres)}")
     
@@ -43,10 +31,10 @@ def find_incomplete_plantas():
         "plantas_sin_nombres_alternativos": plantas_sin_nombres[:50]  # Primeras 50
     }
     
-    with open('/home/ubuntu/plantas_incompletas.json', 'w', encoding='utf-8') as f:
+    with open(work_path('plantas_incompletas.json'), 'w', encoding='utf-8') as f:
         json.dump(output, f, ensure_ascii=False, indent=2)
     
-    print(f"\nLista guardada en /home/ubuntu/plantas_incompletas.json")
+    print(f"\nLista guardada en {work_path('plantas_incompletas.json')}")
     
     # Mostrar primeras 15 de cada
     print("\nPrimeras 15 plantas con contraindicaciones vacías:")
@@ -1,75 +1,74 @@
 #!/usr/bin/env python3
 """
 Script para identificar plantas que no tienen nombres alternativos
+
+Uso:
+    python3 scripts/find-plantas-sin-nombres.py [--presupuesto 8000] [--max-salida 4000] [--concurrencia 4]
 """
 
-import re
+import argparse
 import json
 
-# Leer el archivo de plantas
-with open('/home/ubuntu/pocima-salvage/data/plantas-expandidas.ts', 'r', encoding='utf-8') as f:
-    content = f.read()
+from catalogo import iter_plantas, lotes, work_path
+from catalogo.etapas import ETAPAS
+
+parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+lotes.argumentos(parser)
+args = parser.parse_args()
 
-# Encontrar todas las plantas
-plantas_pattern = r'\{\s*id:\s*"([^"]+)",\s*nombre:\s*"([^"]+)",\s*nombreCientifico:\s*"([^"]+)"'
-plantas = re.findall(plantas_pattern, content)
+# Leer todas las plantas del catálogo
+plantas = list(iter_plantas())
 
 print(f"Total de plantas encontradas: {len(plantas)}")
 
-# Encontrar plantas con nombres alternativos
-plantas_con_nombres = set()
-nombres_pattern = r'id:\s*"([^"]+)"[^}]*nombresAlternativos:'
-matches = re.findall(nombres_pattern, content)
-plantas_con_nombres = set(matches)
+plantas_con_nombres = {p.id for p in plantas if p.nombresAlternativos}
 
 print(f"Plantas con nombres alternativos: {len(plantas_con_nombres)}")
 
 # Identificar plantas sin nombres alternativos
 plantas_sin_nombres = []
-for planta_id, nombre, nombre_cientifico in plantas:
-    if planta_id not in plantas_con_nombres:
+for planta in plantas:
+    if planta.id not in plantas_con_nombres:
         plantas_sin_nombres.append({
-            'id': planta_id,
-            'nombre': nombre,
-            'nombreCientifico': nombre_cientifico
+            'id': planta.id,
+            'nombre': planta.nombre,
+            'nombreCientifico': planta.nombreCientifico
         })
 
 print(f"Plantas sin nombres alternativos: {len(plantas_sin_nombres)}")
 
-# Agrupar por categoría para procesamiento paralelo
-# Dividir en grupos de ~50 plantas para procesamiento eficiente
-grupos = []
-grupo_actual = []
-for planta in plantas_sin_nombres:
-    grupo_actual.append(planta)
-    if len(grupo_actual) >= 50:
-        grupos.append(grupo_actual)
-        grupo_actual = []
-
-if grupo_actual:
-    grupos.append(grupo_actual)
+# Repartir en lotes de tokens parecidos (ver catalogo/lotes.py)
+etapa = ETAPAS['restantes']
+salida = lotes.salida_media((p.to_dict() for p in plantas), ('nombresAlternativos',))
+planificador = lotes.planificador(args, salida, lotes.fijo_lote(etapa, 'PLANTAS:'))
+plan = planificador.repartir(plantas_sin_nombres)
 
-print(f"Grupos para procesamiento: {len(grupos)}")
+fijos = planificador.agrupar(plantas_sin_nombres[i:i + 50] for i in range(0, len(plantas_sin_nombres), 50))
+print(f"Grupos para procesamiento: {plan}")
+print(f"  (en grupos fijos de 50: {fijos})")
 
 # Guardar las plantas sin nombres para procesamiento
-with open('/home/ubuntu/plantas_sin_nombres.json', 'w', encoding='utf-8') as f:
+with open(work_path('plantas_sin_nombres.json'), 'w', encoding='utf-8') as f:
     json.dump({
         'total': len(plantas_sin_nombres),
-        'grupos': len(grupos),
+        'grupos': len(plan.lotes),
         'plantas': plantas_sin_nombres
     }, f, ensure_ascii=False, indent=2)
 
 # Preparar inputs para procesamiento paralelo
 parallel_inputs = []
-for i, grupo in enumerate(grupos):
-    plantas_str = ", ".join([f"{p['nombre']} ({p['nombreCientifico']})" for p in grupo])
+for i, lote in enumerate(plan.lotes, 1):
     parallel_inputs.append({
-        'grupo': i + 1,
-        'plantas': plantas_str,
-        'ids': [p['id'] for p in grupo]
+        'lote': f'grupo-{i}',
+        'encabezado': 'PLANTAS:',
+        'plantas': ", ".join([f"{p['nombre']} ({p['nombreCientifico']})" for p in lote.entidades]),
+        'ids': [p['id'] for p in lote.entidades],
+        'tokens_entrada': lote.tokens_entrada,
+        'tokens_salida': lote.tokens_salida,
+        'entidades': lote.entidades
     })
 
-with open('/home/ubuntu/parallel_inputs_restantes.json', 'w', encoding='utf-8') as f:
+with open(work_path('parallel_inputs_restantes.json'), 'w', encoding='utf-8') as f:
     json.dump(parallel_inputs, f, ensure_ascii=False, indent=2)
 
 print("\nPrimeras 10 plantas sin nombres alternativos:")
@@ -77,5 +76,5 @@ for p in plantas_sin_nombres[:10]:
     print(f"  - {p['nombre']} ({p['nombreCientifico']})")
 
 print(f"\nArchivos generados:")
-print(f"  - /home/ubuntu/plantas_sin_nombres.json")
-print(f"  - /home/ubuntu/parallel_inputs_restantes.json")
+print(f"  - {work_path('plantas_sin_nombres.json')}")
+print(f"  - {work_path('parallel_inputs_restantes.json')}")
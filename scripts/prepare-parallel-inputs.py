@@ -1,37 +1,68 @@
 #!/usr/bin/env python3
 """
 Script para preparar los inputs del procesamiento paralelo de nombres alternativos
+
+Las plantas de plantas_por_categoria.json se reparten, en orden de categoría,
+en lotes de tokens parecidos (ver catalogo/lotes.py) en lugar de un lote por
+categoría.
+
+Uso:
+    python3 scripts/prepare-parallel-inputs.py [--presupuesto 8000] [--max-salida 4000] [--concurrencia 4]
 """
 
+import argparse
 import json
 
-# Leer el archivo JSON con las plantas
-with open('/home/ubuntu/plantas_por_categoria.json', 'r', encoding='utf-8') as f:
-    data = json.load(f)
-
-# Crear inputs para el procesamiento paralelo
-# Dividiremos en grupos de ~50 plantas para mejor procesamiento
-inputs = []
-
-for categoria in data['categorias']:
-    plantas_list = []
-    for planta in categoria['plantas']:
-        plantas_list.append(f"{planta['nombre']} ({planta['nombreCientifico']})")
-    
-    # Crear el input string
-    input_str = f"CATEGORIA: {categoria['nombre']}\nPLANTAS:\n" + "\n".join(plantas_list)
-    inputs.append({
-        'categoria_id': categoria['id'],
-        'categoria_nombre': categoria['nombre'],
-        'plantas_count': len(categoria['plantas']),
-        'input_string': input_str,
-        'plantas': categoria['plantas']
-    })
-
-# Guardar los inputs
-with open('/home/ubuntu/parallel_inputs.json', 'w', encoding='utf-8') as f:
-    json.dump(inputs, f, ensure_ascii=False, indent=2)
-
-print(f"Total de inputs preparados: {len(inputs)}")
-for inp in inputs:
-    print(f"  {inp['categoria_nombre']}: {inp['plantas_count']} plantas")
+from catalogo import iter_plantas, lotes, work_path
+from catalogo.etapas import ETAPAS
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    lotes.argumentos(parser)
+    args = parser.parse_args()
+
+    # Leer el archivo JSON con las plantas
+    with open(work_path('plantas_por_categoria.json'), 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    etapa = ETAPAS['nombres']
+    salida = lotes.salida_media((p.to_dict() for p in iter_plantas()), ('nombresAlternativos',))
+    planificador = lotes.planificador(args, salida, lotes.fijo_lote(etapa, 'CATEGORIA: \nPLANTAS:'))
+
+    grupos = [
+        [{'id': p['id'], 'nombre': p['nombre'], 'nombreCientifico': p.get('nombreCientifico', ''),
+          'categoria': categoria['nombre']} for p in categoria['plantas']]
+        for categoria in data['categorias']
+    ]
+
+    plan = planificador.repartir([p for grupo in grupos for p in grupo])
+
+    # Crear inputs para el procesamiento paralelo
+    inputs = []
+    for i, lote in enumerate(plan.lotes, 1):
+        encabezado = lotes.encabezado('CATEGORIA', 'CATEGORIAS', (p['categoria'] for p in lote.entidades), 'PLANTAS')
+        inputs.append({
+            'lote': f'lote-{i}',
+            'encabezado': encabezado,
+            'plantas_count': len(lote.entidades),
+            'tokens_entrada': lote.tokens_entrada,
+            'tokens_salida': lote.tokens_salida,
+            'input_string': etapa.prompt(encabezado, lote.entidades),
+            'entidades': lote.entidades,
+        })
+
+    # Guardar los inputs
+    with open(work_path('parallel_inputs.json'), 'w', encoding='utf-8') as f:
+        json.dump(inputs, f, ensure_ascii=False, indent=2)
+
+    print(f"Total de inputs preparados: {len(inputs)} ({salida} tokens de salida estimados por planta)")
+    print(f"  Un lote por categoría: {planificador.agrupar(grupos)}")
+    print(f"  Repartido:             {plan}")
+    for inp in inputs:
+        print(f"  {inp['lote']}: {inp['plantas_count']} plantas, "
+              f"{inp['tokens_entrada']} + {inp['tokens_salida']} tokens - {inp['encabezado'].splitlines()[0]}")
+
+
+if __name__ == "__main__":
+    main()
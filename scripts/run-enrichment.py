@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Script para ejecutar una etapa de enriquecimiento con LLM sin procesador
+externo: lee la lista de trabajos (parallel_inputs*.json o
+enfermedades_por_sistema.json), llama al backend compatible con OpenAI y
+escribe el generate_*.json que consume el script process-* correspondiente.
+
+Uso:
+    python3 scripts/run-enrichment.py sintomas
+    python3 scripts/run-enrichment.py nombres --base-url http://127.0.0.1:8089/v1   # stub local
+
+Si la ejecución se interrumpe, volver a lanzarla retoma sólo los lotes que
+no terminaron (ver el checkpoint <salida>.checkpoint.jsonl).
+
+Las respuestas se guardan por entidad en <dir>/llm-cache: las plantas y
+enfermedades cuyas entradas no cambiaron no se vuelven a enviar al modelo.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+
+from catalogo import WORK_DIR
+from catalogo.cache_llm import DIA, CacheLLM
+from catalogo.etapas import ETAPAS, SISTEMA
+from catalogo.llm import BackendOpenAI, Checkpoint, ejecutar, escribir_resultados
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('etapa', choices=sorted(ETAPAS))
+    parser.add_argument('--dir', default=WORK_DIR, help='Directorio de los archivos intermedios')
+    parser.add_argument('--base-url', help='URL base del backend (por defecto $OPENAI_BASE_URL)')
+    parser.add_argument('--modelo', help='Modelo (por defecto $OPENAI_MODEL)')
+    parser.add_argument('--concurrencia', type=int, default=4)
+    parser.add_argument('--rps', type=float, default=2.0, help='Peticiones por segundo (0 = sin límite)')
+    parser.add_argument('--reintentos', type=int, default=5)
+    parser.add_argument('--desde-cero', action='store_true', help='Ignorar el checkpoint existente')
+    parser.add_argument('--sin-cache', action='store_true', help='No leer la caché (las respuestas sí se guardan)')
+    parser.add_argument('--cache-max-mb', type=float, default=200)
+    parser.add_argument('--cache-max-dias', type=float, default=90)
+    args = parser.parse_args()
+
+    etapa = ETAPAS[args.etapa]
+    entrada = os.path.join(args.dir, etapa.entrada)
+    salida = os.path.join(args.dir, etapa.salida)
+    checkpoint_path = salida + '.checkpoint.jsonl'
+
+    with open(entrada, 'r', encoding='utf-8') as f:
+        trabajos = etapa.trabajos(json.load(f))
+
+    if args.desde_cero and os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
+
+    cache = CacheLLM(os.path.join(args.dir, 'llm-cache'),
+                     max_bytes=int(args.cache_max_mb * 1024 * 1024), max_edad=args.cache_max_dias * DIA)
+    if args.sin_cache:
+        for trabajo in trabajos:
+            trabajo['cacheados'] = {}
+        pendientes = trabajos
+    else:
+        pendientes = etapa.con_cache(trabajos, cache)
+    total = sum(len(t['entidades']) for t in trabajos)
+    enviar = sum(len(t['entidades']) for t in pendientes)
+
+    backend = BackendOpenAI(base_url=args.base_url, modelo=args.modelo)
+    print(f"Etapa '{etapa.nombre}': {len(trabajos)} lotes, {total} entidades "
+          f"({total - enviar} en caché) -> {backend.base_url} ({backend.modelo})")
+
+    resultados, stats = asyncio.run(ejecutar(
+        pendientes,
+        backend,
+        checkpoint=Checkpoint(checkpoint_path),
+        sistema=SISTEMA,
+        concurrencia=args.concurrencia,
+        peticiones_por_segundo=args.rps,
+        reintentos=args.reintentos,
+    ))
+    escribir_resultados(salida, etapa.combinar(trabajos, resultados, cache))
+    cache.desalojar()
+
+    print(f"\n✓ {stats}")
+    print(f"✓ Caché: {cache}")
+    print(f"✓ Resultados: {salida}")
+    if not stats.fallidos and os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
+    if stats.fallidos:
+        print(f"⚠️ {stats.fallidos} lotes fallidos; vuelve a ejecutar para reintentarlos")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
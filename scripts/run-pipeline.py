@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Script para ejecutar el pipeline de datos del catálogo de una vez: extracción,
+preparación de lotes, enriquecimiento con LLM, fusión en el almacén e índices
+derivados (ver PASOS en scripts/catalogo/pipeline.py).
+
+Sólo se ejecutan los pasos obsoletos (su script, sus entradas o sus salidas
+cambiaron desde la última ejecución correcta), los independientes en
+paralelo, y al final se muestra el tiempo de cada paso. Los archivos
+intermedios van a --dir (por defecto $POCIMA_TRABAJO o /home/ubuntu), que se
+pasa a cada script.
+
+Los pasos que llaman al modelo (llm-*) se omiten salvo con --con-llm; los
+siguientes usan entonces el generate_*.json que ya exista.
+
+Con --metricas cada script añade una línea JSON con sus fases, bytes, errores
+y pico de memoria (ver scripts/catalogo/metricas.py) y al final se resume lo
+medido; con --perfil se guarda además un perfil de cProfile por script.
+
+Uso:
+    python3 scripts/run-pipeline.py                        # todo lo obsoleto
+    python3 scripts/run-pipeline.py indice-cruce --plan    # qué haría, sin ejecutar
+    python3 scripts/run-pipeline.py --con-llm --trabajos 4 --dir /tmp/pocima
+    python3 scripts/run-pipeline.py --forzar --metricas /tmp/pocima/metricas.jsonl --perfil /tmp/pocima/perfiles
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+from catalogo import WORK_DIR, metricas
+from catalogo.pipeline import EJECUTADO, FALLIDO, PASOS, Pipeline
+
+
+def sangrar(texto, limite=None):
+    lineas = texto.rstrip('\n').splitlines()
+    if limite and len(lineas) > limite:
+        lineas = [f'… ({len(lineas) - limite} líneas omitidas)'] + lineas[-limite:]
+    return '\n'.join(f'    │ {linea}' for linea in lineas)
+
+
+def resumir_metricas(path, desde):
+    """Una línea por script con lo medido en esta ejecución (lo añadido a `path` desde el byte `desde`)."""
+    with open(path, 'rb') as f:
+        f.seek(desde)
+        lineas = [json.loads(linea) for linea in f.read().decode('utf-8').splitlines() if linea.strip()]
+    print(f"\n{'script':<32} {'segundos':>8} {'pico MB':>8} {'leído':>10} {'escrito':>10} {'errores':>7}  fase más lenta")
+    for m in lineas:
+        lenta = max(m['fases'], key=lambda f: f['segundos'], default=None)
+        fase = f"{lenta['fase']} ({lenta['segundos']:.2f} s)" if lenta else '-'
+        print(f"{m['script']:<32} {m['segundos']:>8.2f} {m['pico_tracemalloc_mb']:>8.1f} "
+              f"{m['bytes_leidos']:>10} {m['bytes_escritos']:>10} {m['errores']:>7}  {fase}")
+    print(f"\n✓ Métricas en {path}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('objetivos', nargs='*', help='Pasos a actualizar (y los que necesitan); por defecto todos')
+    parser.add_argument('--dir', default=WORK_DIR, help='Directorio de los archivos intermedios')
+    parser.add_argument('--trabajos', type=int, default=os.cpu_count() or 1, help='Pasos a la vez')
+    parser.add_argument('--con-llm', action='store_true', help='Ejecutar también los pasos que llaman al modelo')
+    parser.add_argument('--forzar', action='store_true', help='Ejecutar los pasos aunque estén al día')
+    parser.add_argument('--plan', action='store_true', help='Mostrar qué pasos están obsoletos y salir')
+    parser.add_argument('--lista', action='store_true', help='Mostrar los pasos y sus dependencias y salir')
+    parser.add_argument('--detalle', action='store_true', help='Mostrar la salida completa de cada paso')
+    parser.add_argument('--metricas', help='Archivo JSON-lines donde cada script añade sus métricas')
+    parser.add_argument('--perfil', help='Directorio donde guardar un perfil de cProfile por script')
+    args = parser.parse_args()
+    if args.trabajos < 1:
+        parser.error('--trabajos debe ser al menos 1')
+
+    pipeline = Pipeline(PASOS, work_dir=os.path.abspath(args.dir))
+    try:
+        pipeline.seleccionar(args.objetivos)
+    except ValueError as e:
+        parser.error(str(e))
+
+    if args.lista:
+        for paso in pipeline.pasos:
+            deps = ', '.join(sorted(pipeline.dependencias[paso.nombre])) or '-'
+            print(f"{paso.nombre:<26} {paso.script:<32} después de: {deps}")
+        return
+
+    if args.plan:
+        for paso, motivo in pipeline.plan(args.objetivos):
+            estado = f"obsoleto: {motivo}" if motivo else "al día"
+            print(f"  {paso.nombre:<26} {estado}")
+        print("\n(los pasos al día pueden quedar obsoletos si cambian las salidas de los anteriores)")
+        return
+
+    print(f"Pipeline en {pipeline.work_dir} ({args.trabajos} a la vez)\n")
+
+    # Los scripts heredan el entorno y activan sus métricas al importar catalogo
+    desde = 0
+    if args.metricas:
+        args.metricas = os.path.abspath(args.metricas)
+        os.environ[metricas.ENTORNO_METRICAS] = args.metricas
+        desde = os.path.getsize(args.metricas) if os.path.exists(args.metricas) else 0
+    if args.perfil:
+        os.environ[metricas.ENTORNO_PERFIL] = os.path.abspath(args.perfil)
+
+    def informar(resultado):
+        marca = {EJECUTADO: '✓', FALLIDO: '❌'}.get(resultado.estado, '·')
+        print(f"{marca} {resultado}")
+        if resultado.salida and (args.detalle or resultado.estado == FALLIDO):
+            print(sangrar(resultado.salida, None if args.detalle else 20))
+        sys.stdout.flush()
+
+    inicio = time.perf_counter()
+    resultados = pipeline.ejecutar(args.objetivos, trabajos=args.trabajos, con_llm=args.con_llm,
+                                   forzar=args.forzar, informar=informar)
+    total = time.perf_counter() - inicio
+
+    ejecutados = [r for r in resultados if r.estado in (EJECUTADO, FALLIDO)]
+    print(f"\n{'paso':<26} {'estado':<10} {'tiempo':>8}")
+    for r in resultados:
+        tiempo = f"{r.segundos:.1f} s" if r in ejecutados else '-'
+        print(f"{r.nombre:<26} {r.estado:<10} {tiempo:>8}")
+    suma = sum(r.segundos for r in ejecutados)
+    print(f"\n✓ {len(ejecutados)} de {len(resultados)} pasos ejecutados en {total:.1f} s "
+          f"({suma:.1f} s de trabajo)")
+    if args.metricas and os.path.exists(args.metricas):
+        resumir_metricas(args.metricas, desde)
+    if args.perfil:
+        print(f"✓ Perfiles de cProfile en {args.perfil} (python3 -m pstats <archivo>.prof)")
+    if any(r.estado == FALLIDO for r in resultados):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
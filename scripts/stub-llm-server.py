@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Servidor local que imita /v1/chat/completions de OpenAI para probar
+run-enrichment.py sin gastar tokens.
+
+Responde con JSON de la forma que piden los prompts de catalogo/etapas.py
+(nombres alternativos o síntomas/causas) para los ids listados en el prompt.
+Con --fallos se devuelven errores 503 aleatorios para ejercitar los
+reintentos, y con --latencia se simula el tiempo de respuesta del modelo.
+
+Uso:
+    python3 scripts/stub-llm-server.py --puerto 8089 --fallos 0.2
+    python3 scripts/run-enrichment.py sintomas --base-url http://127.0.0.1:8089/v1
+"""
+
+import argparse
+import json
+import random
+import re
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+ENTIDAD_RE = re.compile(r'^- ([^:\s]+): (.+)$', re.M)
+
+
+def responder(prompt):
+    entidades = ENTIDAD_RE.findall(prompt)
+    if '"enfermedades"' in prompt:
+        return {'enfermedades': [
+            {'id': id_, 'sintomas': [f'Síntoma de {nombre}'], 'causas': [f'Causa de {nombre}']}
+            for id_, nombre in entidades
+        ]}
+    return {'plantas': [
+        {'id': id_, 'nombresAlternativos': {'Otros': [nombre.split(' (')[0].lower()]}}
+        for id_, nombre in entidades
+    ]}
+
+
+class Handler(BaseHTTPRequestHandler):
+    fallos = 0.0
+    latencia = 0.0
+
+    def do_POST(self):
+        if not self.path.rstrip('/').endswith('/chat/completions'):
+            self.send_error(404)
+            return
+        cuerpo = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))))
+        if self.latencia:
+            time.sleep(self.latencia)
+        if random.random() < self.fallos:
+            self.send_error(503, 'Fallo simulado')
+            return
+        prompt = cuerpo['messages'][-1]['content']
+        contenido = '```json\n' + json.dumps(responder(prompt), ensure_ascii=False) + '\n```'
+        datos = json.dumps({
+            'id': 'stub',
+            'object': 'chat.completion',
+            'model': cuerpo.get('model', 'stub'),
+            'choices': [{'index': 0, 'message': {'role': 'assistant', 'content': contenido},
+                         'finish_reason': 'stop'}],
+            'usage': {'prompt_tokens': len(prompt) // 4, 'completion_tokens': len(contenido) // 4},
+        }, ensure_ascii=False).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(datos)))
+        self.end_headers()
+        self.wfile.write(datos)
+
+    def log_message(self, formato, *args):
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--puerto', type=int, default=8089)
+    parser.add_argument('--fallos', type=float, default=0.0, help='Probabilidad de responder 503')
+    parser.add_argument('--latencia', type=float, default=0.0, help='Segundos de espera por petición')
+    args = parser.parse_args()
+
+    Handler.fallos = args.fallos
+    Handler.latencia = args.latencia
+    servidor = ThreadingHTTPServer(('127.0.0.1', args.puerto), Handler)
+    print(f"Stub LLM escuchando en http://127.0.0.1:{args.puerto}/v1")
+    servidor.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
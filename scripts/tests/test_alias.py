@@ -0,0 +1,36 @@
+"""
+Pruebas de catalogo/alias.py: mismas reglas de resolución que data/alias.ts.
+
+    python3 -m unittest discover -s scripts/tests
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from catalogo.alias import EXACTO, NORMALIZADO, ResolutorAlias  # noqa: E402
+from catalogo.store import CatalogStore  # noqa: E402
+
+
+class Resolver(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        store = CatalogStore('plantas', tmp.name)
+        store.save_all([{'id': 'digestivas', 'nombre': 'Digestivas', 'plantas': [
+            {'id': 'diente-de-leon', 'nombre': 'Diente de León', 'nombreCientifico': 'Taraxacum officinale'},
+        ]}])
+        self.resolutor = ResolutorAlias('plantas', store)
+
+    def test_exacta_ignora_espacios_alrededor(self):
+        self.assertEqual(self.resolutor.resolver('  diente-de-leon\n'), ('diente-de-leon', EXACTO))
+
+    def test_normalizada(self):
+        self.assertEqual(self.resolutor.resolver('DIENTE DE LEON'), ('diente-de-leon', NORMALIZADO))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+"""
+Pruebas del desalojo de catalogo/cache_llm.py: la edad se cuenta desde
+`creado` (como en get()) y el mtime sólo decide el orden LRU.
+
+    python3 -m unittest discover -s scripts/tests
+"""
+
+import json
+import os
+import sys
+import tempfile
+import time
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from catalogo.cache_llm import DIA, CacheLLM, clave  # noqa: E402
+
+
+class Desalojo(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.cache = CacheLLM(tmp.name, max_edad=DIA)
+
+    def entrada(self, nombre, edad=0, sin_uso=0):
+        """Entrada creada hace `edad` segundos y leída por última vez hace `sin_uso`."""
+        k = clave(1, {'nombre': nombre})
+        self.cache.put(k, {'nombre': nombre})
+        path = self.cache._path(k)
+        if edad:
+            with open(path, 'r', encoding='utf-8') as f:
+                datos = json.load(f)
+            datos['creado'] -= edad
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(datos, f, ensure_ascii=False)
+        ahora = time.time()
+        os.utime(path, (ahora - sin_uso, ahora - sin_uso))
+        return k
+
+    def test_caducada_aunque_se_haya_leido_hace_poco(self):
+        k = self.entrada('manzanilla', edad=2 * DIA)
+        self.cache.desalojar()
+        self.assertFalse(os.path.exists(self.cache._path(k)))
+
+    def test_vigente_aunque_no_se_lea_hace_tiempo(self):
+        k = self.entrada('tila', sin_uso=2 * DIA)
+        self.cache.desalojar()
+        self.assertEqual(self.cache.get(k), {'nombre': 'tila'})
+
+    def test_por_tamano_desaloja_la_menos_usada(self):
+        vieja = self.entrada('romero', sin_uso=60)
+        reciente = self.entrada('salvia')
+        self.cache.max_bytes = os.path.getsize(self.cache._path(reciente))
+        self.cache.desalojar()
+        self.assertFalse(os.path.exists(self.cache._path(vieja)))
+        self.assertTrue(os.path.exists(self.cache._path(reciente)))
+
+
+if __name__ == '__main__':
+    unittest.main()
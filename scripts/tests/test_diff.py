@@ -0,0 +1,94 @@
+"""
+Pruebas de ida y vuelta de catalogo/diff.py: aplicar(diferencia(base, destino), base) == destino.
+
+    python3 -m unittest discover -s scripts/tests
+"""
+
+import copy
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from catalogo.diff import DeltaError, aplicar, diferencia, hash_version, resumen, vacio  # noqa: E402
+
+
+def sistema(id_, enfermedades, **atributos):
+    return {'id': id_, 'nombre': id_.title(), **atributos, 'enfermedades': enfermedades}
+
+
+def enfermedad(id_, **campos):
+    return {'id': id_, 'nombre': id_.title(), **campos}
+
+
+BASE = [
+    sistema('digestivo', [enfermedad('gastritis', sintomas=['ardor']), enfermedad('colitis')], icono='🫃'),
+    sistema('nervioso', [enfermedad('insomnio', causas=['estrés'])], icono='🧠'),
+]
+
+
+class IdaYVuelta(unittest.TestCase):
+    def comprobar(self, base, destino):
+        delta = diferencia('enfermedades', base, destino)
+        original = copy.deepcopy(base)
+        self.assertEqual(aplicar(delta, base), destino)
+        self.assertEqual(base, original)
+        return delta
+
+    def test_sin_cambios(self):
+        delta = self.comprobar(BASE, copy.deepcopy(BASE))
+        self.assertTrue(vacio(delta))
+        self.assertEqual(resumen(delta), {})
+
+    def test_atributo_de_bloque_eliminado(self):
+        destino = copy.deepcopy(BASE)
+        del destino[0]['icono']
+        delta = self.comprobar(BASE, destino)
+        self.assertEqual(delta['bloques']['cambiados'], {'digestivo': {'-': ['icono']}})
+
+    def test_atributo_de_bloque_cambiado_y_añadido(self):
+        destino = copy.deepcopy(BASE)
+        destino[1]['nombre'] = 'Sistema nervioso'
+        destino[1]['descripcion'] = 'nuevo'
+        delta = self.comprobar(BASE, destino)
+        self.assertEqual(delta['bloques']['cambiados'],
+                         {'nervioso': {'=': {'nombre': 'Sistema nervioso', 'descripcion': 'nuevo'}}})
+
+    def test_campos_de_registro(self):
+        destino = copy.deepcopy(BASE)
+        destino[0]['enfermedades'][0]['sintomas'] = ['ardor', 'náuseas']
+        del destino[1]['enfermedades'][0]['causas']
+        self.comprobar(BASE, destino)
+
+    def test_registros_añadidos_eliminados_y_reordenados(self):
+        destino = copy.deepcopy(BASE)
+        gastritis, colitis = destino[0]['enfermedades']
+        destino[0]['enfermedades'] = [enfermedad('reflujo'), colitis, gastritis]
+        destino[1]['enfermedades'] = []
+        self.comprobar(BASE, destino)
+
+    def test_bloques_añadidos_eliminados_y_reordenados(self):
+        destino = [sistema('respiratorio', [enfermedad('asma')]), copy.deepcopy(BASE[0])]
+        delta = self.comprobar(BASE, destino)
+        self.assertEqual(delta['bloques']['eliminados'], ['nervioso'])
+        self.assertEqual(delta['bloques']['orden'], ['respiratorio', 'digestivo'])
+
+    def test_delta_sobre_otra_base(self):
+        destino = copy.deepcopy(BASE)
+        destino[0]['nombre'] = 'Otro'
+        delta = diferencia('enfermedades', BASE, destino)
+        with self.assertRaises(DeltaError):
+            aplicar(delta, destino)
+
+    def test_delta_v1(self):
+        destino = copy.deepcopy(BASE)
+        destino[0]['nombre'] = 'Sistema digestivo'
+        delta = diferencia('enfermedades', BASE, destino)
+        delta['v'] = 1
+        delta['bloques']['cambiados'] = {'digestivo': {'nombre': 'Sistema digestivo'}}
+        self.assertEqual(hash_version(aplicar(delta, BASE)), delta['destino'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+"""
+Pruebas de la huella de contenido que el emisor (catalogo/emitter.py) escribe
+en el .ts y en el índice de chunks: los índices generados la copian, así que
+tiene que cambiar con cualquier edición aunque el número de registros no cambie.
+
+    python3 -m unittest discover -s scripts/tests
+"""
+
+import copy
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from catalogo.emitter import emit  # noqa: E402
+from catalogo.parser import huella_catalogo, read_text  # noqa: E402
+from catalogo.store import CatalogStore  # noqa: E402
+
+SISTEMAS = [
+    {'id': 'digestivo', 'nombre': 'Digestivo', 'icono': '🫃', 'enfermedades': [
+        {'id': 'gastritis', 'nombre': 'Gastritis', 'otrosNombres': [], 'descripcion': 'Inflamación'},
+    ]},
+    {'id': 'nervioso', 'nombre': 'Nervioso', 'icono': '🧠', 'enfermedades': [
+        {'id': 'insomnio', 'nombre': 'Insomnio', 'otrosNombres': [], 'descripcion': 'Falta de sueño'},
+    ]},
+]
+
+
+class Huella(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.store = CatalogStore('enfermedades', os.path.join(tmp.name, 'catalogo'))
+        self.ts_path = os.path.join(tmp.name, 'enfermedades-expandidas.ts')
+        self.indice_chunks = os.path.join(tmp.name, 'chunks', 'enfermedades', 'index.ts')
+
+    def emitir(self, sistemas):
+        self.store.save_all(copy.deepcopy(sistemas))
+        result = emit('enfermedades', self.store, self.ts_path, chunks=True, versiones=False)
+        self.assertEqual(huella_catalogo(read_text(self.ts_path)), result.huella)
+        self.assertEqual(huella_catalogo(read_text(self.indice_chunks)), result.huella)
+        return result.huella
+
+    def test_estable_sin_cambios(self):
+        self.assertEqual(self.emitir(SISTEMAS), self.emitir(SISTEMAS))
+
+    def test_cambia_al_reordenar(self):
+        self.assertNotEqual(self.emitir(SISTEMAS), self.emitir(SISTEMAS[::-1]))
+
+    def test_cambia_con_el_mismo_numero_de_registros(self):
+        editados = copy.deepcopy(SISTEMAS)
+        editados[1]['enfermedades'][0]['otrosNombres'] = ['Desvelo']
+        self.assertNotEqual(self.emitir(SISTEMAS), self.emitir(editados))
+
+
+if __name__ == '__main__':
+    unittest.main()
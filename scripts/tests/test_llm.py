@@ -0,0 +1,48 @@
+"""
+Pruebas de catalogo/llm.py: una respuesta truncada o con bytes inválidos es
+un ErrorBackend reintentable y no una excepción que aborte toda la ejecución.
+
+    python3 -m unittest discover -s scripts/tests
+"""
+
+import http.client
+import os
+import sys
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from catalogo.llm import BackendOpenAI, ErrorBackend  # noqa: E402
+
+
+class Respuesta:
+    def __init__(self, leer):
+        self.read = leer
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class Post(unittest.TestCase):
+    def post(self, leer):
+        backend = BackendOpenAI(base_url='http://localhost:1', modelo='m')
+        with mock.patch('urllib.request.urlopen', return_value=Respuesta(leer)):
+            with self.assertRaises(ErrorBackend) as ctx:
+                backend._post({})
+        return ctx.exception
+
+    def test_cuerpo_truncado(self):
+        def leer():
+            raise http.client.IncompleteRead(b'{"choi', 100)
+        self.assertTrue(self.post(leer).reintentable)
+
+    def test_bytes_invalidos(self):
+        self.assertTrue(self.post(lambda: b'{"a": "\xff"}').reintentable)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,116 @@
+"""
+Pruebas del motor de fusión por lotes (catalogo/merge.py): políticas por
+campo, ids repetidos en varios bloques, claves sin registro, resolución por
+alias y que un lote sin cambios no guarde ni re-emita nada.
+
+    python3 -m unittest discover -s scripts/tests
+"""
+
+import copy
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from catalogo.alias import ResolutorAlias  # noqa: E402
+from catalogo.merge import FILL_IF_EMPTY, REPLACE, UNION_REGIONES, apply_batch, merge_field  # noqa: E402
+from catalogo.store import CatalogStore  # noqa: E402
+
+SISTEMAS = [
+    {'id': 'digestivo', 'nombre': 'Digestivo', 'icono': '🫃', 'enfermedades': [
+        {'id': 'gastritis', 'nombre': 'Gastritis', 'otrosNombres': ['Dispepsia'], 'descripcion': 'Inflamación'},
+        {'id': 'colitis', 'nombre': 'Colitis', 'otrosNombres': [], 'descripcion': ''},
+    ]},
+    {'id': 'nervioso', 'nombre': 'Nervioso', 'icono': '🧠', 'enfermedades': [
+        {'id': 'insomnio', 'nombre': 'Insomnio', 'otrosNombres': [], 'descripcion': 'Falta de sueño'},
+        {'id': 'gastritis', 'nombre': 'Gastritis', 'otrosNombres': [], 'descripcion': 'Por estrés'},
+    ]},
+]
+
+
+class Politicas(unittest.TestCase):
+    def test_replace(self):
+        self.assertEqual(merge_field(['a'], ['b'], REPLACE), ['b'])
+
+    def test_fill_if_empty(self):
+        self.assertEqual(merge_field('', 'nuevo', FILL_IF_EMPTY), 'nuevo')
+        self.assertEqual(merge_field(None, 'nuevo', FILL_IF_EMPTY), 'nuevo')
+        self.assertEqual(merge_field('actual', 'nuevo', FILL_IF_EMPTY), 'actual')
+
+    def test_fill_if_empty_no_escribe_vacios(self):
+        for vacio in ([], {}, ''):
+            self.assertIsNone(merge_field(None, vacio, FILL_IF_EMPTY))
+
+    def test_union_regiones(self):
+        actual = {'españa': ['Manzanilla'], 'méxico': ['Manzanilla']}
+        nuevo = {'argentina': ['Camomila'], 'españa': ['MANZANILLA', 'Camomila', 'camomila']}
+        resultado = merge_field(actual, nuevo, UNION_REGIONES)
+        self.assertEqual(resultado, {'españa': ['Manzanilla', 'Camomila'], 'méxico': ['Manzanilla'],
+                                     'argentina': ['Camomila']})
+        self.assertEqual(list(resultado), ['españa', 'méxico', 'argentina'])
+        self.assertEqual(actual, {'españa': ['Manzanilla'], 'méxico': ['Manzanilla']})
+
+    def test_union_regiones_vacia_no_crea_el_campo(self):
+        self.assertIsNone(merge_field(None, {}, UNION_REGIONES))
+
+
+class AplicarLote(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.store = CatalogStore('enfermedades', os.path.join(tmp.name, 'catalogo'))
+        self.store.save_all(copy.deepcopy(SISTEMAS))
+        self.ts_path = os.path.join(tmp.name, 'enfermedades-expandidas.ts')
+
+    def aplicar(self, parches, **kwargs):
+        return apply_batch('enfermedades', parches, store=self.store, ts_path=self.ts_path, **kwargs)
+
+    def registros(self, entidad):
+        return [r for bloque in self.store for r in bloque['enfermedades'] if r['id'] == entidad]
+
+    def test_id_en_varios_bloques(self):
+        result = self.aplicar({'gastritis': {'sintomas': ['Ardor']}}, emitir=False)
+        self.assertEqual(result.actualizados, 2)
+        self.assertEqual(result.bloques, ['digestivo', 'nervioso'])
+        self.assertEqual([r['sintomas'] for r in self.registros('gastritis')], [['Ardor'], ['Ardor']])
+
+    def test_claves_sin_registro(self):
+        result = self.aplicar({'insomnio': {'sintomas': ['Desvelo']}, 'migraña': {'sintomas': ['Dolor']}},
+                              emitir=False)
+        self.assertEqual(result.no_encontrados, ['migraña'])
+        self.assertEqual(result.actualizados, 1)
+
+    def test_politicas_por_campo(self):
+        result = self.aplicar({'colitis': {'descripcion': 'Inflamación del colon', 'causas': []}},
+                              politicas={'descripcion': FILL_IF_EMPTY, 'causas': FILL_IF_EMPTY}, emitir=False)
+        colitis, = self.registros('colitis')
+        self.assertEqual(colitis['descripcion'], 'Inflamación del colon')
+        self.assertNotIn('causas', colitis)
+        self.assertEqual(result.campos, {'descripcion': 1})
+
+    def test_claves_por_alias(self):
+        resolutor = ResolutorAlias('enfermedades', self.store)
+        result = self.aplicar({'DISPEPSIA': {'sintomas': ['Ardor']}, 'Insomnio': {'sintomas': ['Desvelo']}},
+                              resolver=resolutor, emitir=False)
+        self.assertEqual(result.no_encontrados, [])
+        self.assertEqual(result.actualizados, 3)
+        insomnio, = self.registros('insomnio')
+        self.assertEqual(insomnio['sintomas'], ['Desvelo'])
+
+    def test_sin_cambios_no_guarda_ni_emite(self):
+        result = self.aplicar({'gastritis': {'sintomas': ['Ardor']}})
+        self.assertIsNotNone(result.emision)
+        antes = os.stat(self.ts_path).st_mtime_ns
+
+        result = self.aplicar({'gastritis': {'sintomas': ['Ardor'], 'causas': []}},
+                              politicas={'causas': FILL_IF_EMPTY})
+        self.assertEqual((result.actualizados, result.sin_cambios), (0, 2))
+        self.assertEqual(result.bloques, [])
+        self.assertIsNone(result.emision)
+        self.assertEqual(os.stat(self.ts_path).st_mtime_ns, antes)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+"""
+Pruebas de catalogo/pipeline.py: qué cambios de un directorio del almacén
+dejan obsoletos los pasos y que el planificador avanza con cualquier número
+de trabajos.
+
+    python3 -m unittest discover -s scripts/tests
+"""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from catalogo.pipeline import EJECUTADO, Paso, Pipeline, hash_ruta, ruta_artefacto  # noqa: E402
+
+
+class HashRuta(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.dir = tmp.name
+        self.escribir('digestivo.json', {'id': 'digestivo'})
+        self.escribir('nervioso.json', {'id': 'nervioso'})
+        self.escribir('_index.json', ['digestivo', 'nervioso'])
+
+    def escribir(self, nombre, datos):
+        with open(os.path.join(self.dir, nombre), 'w', encoding='utf-8') as f:
+            json.dump(datos, f)
+
+    def test_reordenar_bloques_cambia_el_hash(self):
+        antes = hash_ruta(self.dir)
+        self.escribir('_index.json', ['nervioso', 'digestivo'])
+        self.assertNotEqual(hash_ruta(self.dir), antes)
+
+    def test_manifiestos_y_temporales_no_cuentan(self):
+        antes = hash_ruta(self.dir)
+        self.escribir('_emitido.json', {'bloques': {}})
+        self.escribir('_auditoria.json', {'bloques': {}})
+        self.escribir('.tmp-digestivo.json', {})
+        self.assertEqual(hash_ruta(self.dir), antes)
+
+
+class Ejecutar(unittest.TestCase):
+    def test_cero_trabajos_ejecuta_uno_a_uno(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        pasos = [Paso('a', 'run-pipeline.py', salidas=('trabajo:a.json',)),
+                 Paso('b', 'run-pipeline.py', entradas=('trabajo:a.json',))]
+        pipeline = Pipeline(pasos, work_dir=tmp.name)
+
+        def correr(paso):
+            for artefacto in paso.salidas:
+                with open(ruta_artefacto(artefacto, tmp.name), 'w', encoding='utf-8') as f:
+                    f.write('{}')
+            return 0, '', 0.0
+
+        pipeline._correr = correr
+        resultados = pipeline.ejecutar(trabajos=0)
+        self.assertEqual([(r.nombre, r.estado) for r in resultados], [('a', EJECUTADO), ('b', EJECUTADO)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,42 @@
+"""
+Pruebas de la escritura atómica de catalogo/store.py: el archivo reemplazado
+conserva sus permisos y uno nuevo queda como lo dejaría open().
+
+    python3 -m unittest discover -s scripts/tests
+"""
+
+import os
+import stat
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from catalogo.store import MODO_NUEVO, write_atomic  # noqa: E402
+
+
+class Permisos(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = os.path.join(tmp.name, 'indice.ts')
+
+    def modo(self):
+        return stat.S_IMODE(os.stat(self.path).st_mode)
+
+    def test_archivo_nuevo_con_la_umask(self):
+        write_atomic(self.path, 'a')
+        self.assertEqual(self.modo(), MODO_NUEVO)
+
+    def test_conserva_los_permisos_del_existente(self):
+        write_atomic(self.path, 'a')
+        os.chmod(self.path, 0o640)
+        write_atomic(self.path, 'b')
+        self.assertEqual(self.modo(), 0o640)
+        with open(self.path, encoding='utf-8') as f:
+            self.assertEqual(f.read(), 'b')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,32 @@
+"""
+Pruebas de catalogo/texto.py: los mismos términos que esperan los lectores
+en TypeScript (__tests__/sintomas-causas.test.ts y __tests__/moldoctor.test.ts).
+
+    python3 -m unittest discover -s scripts/tests
+"""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from catalogo.recuperacion import CONVERSACION  # noqa: E402
+from catalogo.sintomas import terminos as terminos_sintoma  # noqa: E402
+from catalogo.texto import VACIAS, plegar, terminos  # noqa: E402
+
+
+class Terminos(unittest.TestCase):
+    def test_sintoma_solo_recorta_el_plural(self):
+        self.assertEqual(terminos_sintoma('Dolores de cabeza'), ['dolor', 'cabeza'])
+        self.assertEqual(terminos_sintoma('Náuseas y vómitos'), ['nausea', 'vomito'])
+
+    def test_consulta_recorta_plural_y_genero(self):
+        self.assertEqual(terminos('Hola doctor, tengo Náuseas', VACIAS | CONVERSACION), ['nause'])
+
+    def test_pliega_cualquier_acento(self):
+        self.assertEqual(plegar('Rénshēn bājiǎo'), 'renshen bajiao')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+"""
+Pruebas del historial de versiones (catalogo/versiones.py): cada versión
+registrada se puede reconstruir y registrar la siguiente no falla.
+
+    python3 -m unittest discover -s scripts/tests
+"""
+
+import copy
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from catalogo.versiones import Versiones  # noqa: E402
+
+V1 = [
+    {'id': 'digestivo', 'nombre': 'Digestivo', 'icono': '🫃',
+     'enfermedades': [{'id': 'gastritis', 'nombre': 'Gastritis'}]},
+    {'id': 'nervioso', 'nombre': 'Nervioso', 'icono': '🧠',
+     'enfermedades': [{'id': 'insomnio', 'nombre': 'Insomnio', 'causas': ['estrés']}]},
+]
+
+
+class Historial(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def versiones(self):
+        return Versiones('enfermedades', self.tmp.name)
+
+    def test_icono_eliminado_y_version_siguiente(self):
+        v2 = copy.deepcopy(V1)
+        del v2[0]['icono']
+        v3 = copy.deepcopy(v2)
+        v3[1]['enfermedades'].append({'id': 'migraña', 'nombre': 'Migraña'})
+
+        self.assertEqual(self.versiones().registrar(V1), (1, True))
+        self.assertEqual(self.versiones().registrar(v2, compactar=False), (2, True))
+        self.assertEqual(self.versiones().registrar(v3, compactar=False), (3, True))
+        self.assertEqual(self.versiones().registrar(v3), (3, False))
+
+        historial = self.versiones()
+        for version, bloques in ((1, V1), (2, v2), (3, v3)):
+            self.assertEqual(historial.reconstruir(version), bloques)
+
+    def test_compactar_con_atributo_eliminado(self):
+        v2 = copy.deepcopy(V1)
+        del v2[1]['icono']
+        self.versiones().registrar(V1)
+        self.versiones().registrar(v2, compactar=True)
+        historial = self.versiones()
+        self.assertEqual(historial.manifiesto['base']['version'], 2)
+        self.assertEqual(historial.reconstruir(), v2)
+        self.assertIn('delta-1-2.json', [d['archivo'] for d in historial.manifiesto['deltas']])
+
+
+if __name__ == '__main__':
+    unittest.main()
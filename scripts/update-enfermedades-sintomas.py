@@ -4,13 +4,15 @@ Script para actualizar el archivo de enfermedades con síntomas y causas faltant
 """
 
 import json
-import re
+
+from catalogo import work_path
+from catalogo.merge import FILL_IF_EMPTY, apply_batch
 
 def main():
     # Leer los datos generados
-    with open('/home/ubuntu/generate_symptoms_causes.json', 'r', encoding='utf-8') as f:
+    with open(work_path('generate_symptoms_causes.json'), 'r', encoding='utf-8') as f:
         data = json.load(f)
-    
+
     # Crear diccionario de síntomas y causas por enfermedad
     sintomas_causas = {}
     for result in data['results']:
@@ -23,53 +25,22 @@ def main():
             'sintomas': sintomas,
             'causas': causas
         }
-    
+
     print(f"Datos cargados para {len(sintomas_causas)} enfermedades")
-    
-    # Leer el archivo de enfermedades
-    with open('/home/ubuntu/pocima-salvage/data/enfermedades-expandidas.ts', 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    # Para cada enfermedad, buscar y agregar síntomas y causas
-    updated_count = 0
-    
-    for nombre, datos in sintomas_causas.items():
-        # Buscar el patrón de la enfermedad
-        # Patrón: nombre: 'Nombre', seguido de otros campos
-        pattern = rf"(nombre:\s*['\"]){re.escape(nombre)}(['\"],)"
-        
-        if re.search(pattern, content):
-            # Verificar si ya tiene síntomas
-            # Buscar el bloque de esta enfermedad
-            block_pattern = rf"nombre:\s*['\"]" + re.escape(nombre) + r"['\"][^}}]*?(?=\s*\}},|\s*\}}$)"
-            match = re.search(block_pattern, content, re.DOTALL)
-            
-            if match:
-                block = match.group(0)
-                
-                # Si no tiene síntomas, agregar
-                if 'sintomas:' not in block:
-                    # Crear strings de síntomas y causas
-                    sintomas_str = json.dumps(datos['sintomas'], ensure_ascii=False)
-                    causas_str = json.dumps(datos['causas'], ensure_ascii=False)
-                    
-                    # Buscar donde insertar (después de descripcion o otrosNombres)
-                    insert_pattern = rf"(nombre:\s*['\"]" + re.escape(nombre) + r"['\"],\s*otrosNombres:\s*\[[^\]]*\],\s*descripcion:\s*['\"][^'\"]*['\"],)"
-                    
-                    replacement = rf"\1\n        sintomas: {sintomas_str},\n        causas: {causas_str},"
-                    
-                    new_content = re.sub(insert_pattern, replacement, content, count=1)
-                    
-                    if new_content != content:
-                        content = new_content
-                        updated_count += 1
-                        print(f"  ✓ Actualizado: {nombre}")
-    
-    # Guardar el archivo actualizado
-    with open('/home/ubuntu/pocima-salvage/data/enfermedades-expandidas.ts', 'w', encoding='utf-8') as f:
-        f.write(content)
-    
-    print(f"\n✅ Total actualizado: {updated_count} enfermedades")
+
+    # Aplicar todo el lote en una pasada; sólo se completan enfermedades
+    # que aún no tienen síntomas o causas
+    merge = apply_batch(
+        'enfermedades',
+        sintomas_causas,
+        politicas={'sintomas': FILL_IF_EMPTY, 'causas': FILL_IF_EMPTY},
+        clave='nombre',
+    )
+
+    for nombre in merge.no_encontrados:
+        print(f"  ⚠️ No encontrada: {nombre}")
+
+    print(f"\n✅ Total actualizado: {merge.actualizados} enfermedades")
 
 if __name__ == "__main__":
     main()
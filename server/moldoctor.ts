@@ -1,9 +1,11 @@
 import { z } from "zod";
 import { publicProcedure, router } from "./_core/trpc";
 import { invokeLLM } from "./_core/llm";
+import { resolverEnfermedad, resolverPlanta } from "../data/alias";
+import { recuperarContexto } from "./recuperacion";
 
 // System prompt para MolDoctor con personalidad humorística y capacidades de visión
-const MOLDOCTOR_SYSTEM_PROMPT = `Eres MolDoctor 🩺🌿, un médico digital experto en medicina natural y plantas medicinales con capacidades avanzadas de visión médica.
+const PROMPT_INICIO = `Eres MolDoctor 🩺🌿, un médico digital experto en medicina natural y plantas medicinales con capacidades avanzadas de visión médica.
 
 PERSONALIDAD:
 - Tienes un excelente sentido del humor médico (chistes sobre doctores, salud, pero siempre respetuoso)
@@ -62,9 +64,25 @@ RECOMENDACIONES:
 - Incluye: nombre de la planta, parte usada, preparación, dosis, contraindicaciones
 - Cuando menciones una planta, usa el formato: [PLANTA:nombre_de_la_planta] para que el usuario pueda ver más detalles
 - Cuando menciones una enfermedad, usa el formato: [ENFERMEDAD:nombre_de_la_enfermedad] para que el usuario pueda ver más detalles
-- SIEMPRE al final recomienda consultar a un médico profesional para confirmación
+- SIEMPRE al final recomienda consultar a un médico profesional para confirmación`;
 
-PLANTAS MEDICINALES DISPONIBLES EN LA APP (usa estas como referencia):
+const PROMPT_FINAL = `FORMATO DE RESPUESTA:
+- Usa párrafos cortos y fáciles de leer
+- Incluye listas con viñetas cuando sea apropiado
+- Usa emojis para hacer el texto más amigable
+- Incluye un chiste o comentario ligero cuando sea apropiado
+- Termina con una pregunta de seguimiento o verificación
+
+ADVERTENCIAS:
+- Si detectas síntomas de emergencia (dolor de pecho, dificultad respiratoria severa, sangrado abundante, heridas profundas, quemaduras graves, etc.), indica INMEDIATAMENTE que debe ir a urgencias
+- Nunca diagnostiques con certeza absoluta, usa "posiblemente", "podría ser", "sugiere"
+- Siempre menciona que tus recomendaciones no reemplazan la consulta médica profesional
+- Para heridas: evalúa si necesita puntos, si hay signos de infección, si está sangrando mucho
+
+IDIOMA: Responde siempre en español.`;
+
+// Lista fija de plantas para cuando el índice de recuperación no encuentra nada relevante en el mensaje
+const PLANTAS_POR_DEFECTO = `PLANTAS MEDICINALES DISPONIBLES EN LA APP (usa estas como referencia):
 - Manzanilla: digestiva, antiinflamatoria, sedante
 - Valeriana: sedante, ansiolítica, relajante
 - Jengibre: antiemético, antiinflamatorio, digestivo
@@ -88,22 +106,13 @@ PLANTAS MEDICINALES DISPONIBLES EN LA APP (usa estas como referencia):
 - Caléndula: cicatrizante, antiinflamatoria, antiséptica (ideal para heridas)
 - Árnica: antiinflamatoria, analgésica (uso externo para golpes)
 - Llantén: cicatrizante, antiinflamatorio, expectorante
-- Malva: emoliente, antiinflamatoria, laxante suave
+- Malva: emoliente, antiinflamatoria, laxante suave`;
 
-FORMATO DE RESPUESTA:
-- Usa párrafos cortos y fáciles de leer
-- Incluye listas con viñetas cuando sea apropiado
-- Usa emojis para hacer el texto más amigable
-- Incluye un chiste o comentario ligero cuando sea apropiado
-- Termina con una pregunta de seguimiento o verificación
-
-ADVERTENCIAS:
-- Si detectas síntomas de emergencia (dolor de pecho, dificultad respiratoria severa, sangrado abundante, heridas profundas, quemaduras graves, etc.), indica INMEDIATAMENTE que debe ir a urgencias
-- Nunca diagnostiques con certeza absoluta, usa "posiblemente", "podría ser", "sugiere"
-- Siempre menciona que tus recomendaciones no reemplazan la consulta médica profesional
-- Para heridas: evalúa si necesita puntos, si hay signos de infección, si está sangrando mucho
-
-IDIOMA: Responde siempre en español.`;
+// Prompt del sistema con las fichas del catálogo relevantes para la consulta (ver server/recuperacion.ts)
+const promptSistema = (consulta: string): string => {
+  const contexto = recuperarContexto(consulta);
+  return `${PROMPT_INICIO}\n\n${contexto.texto || PLANTAS_POR_DEFECTO}\n\n${PROMPT_FINAL}`;
+};
 
 // Esquema para el mensaje del chat
 const chatMessageSchema = z.object({
@@ -125,9 +134,16 @@ export const moldoctorRouter = router({
     .mutation(async ({ input }) => {
       const { messages, imageBase64, imageMimeType } = input;
 
+      // El contexto del catálogo se busca con los dos últimos mensajes del usuario
+      const consulta = messages
+        .filter(msg => msg.role === "user")
+        .slice(-2)
+        .map(msg => msg.content)
+        .join("\n");
+
       // Construir los mensajes para el LLM
       const llmMessages: any[] = [
-        { role: "system", content: MOLDOCTOR_SYSTEM_PROMPT },
+        { role: "system", content: promptSistema(consulta) },
       ];
 
       // Agregar historial de conversación
@@ -191,14 +207,22 @@ Mensaje del usuario: ${originalText}`;
         const plantaMatches = assistantMessage.match(/\[PLANTA:([^\]]+)\]/g) || [];
         const enfermedadMatches = assistantMessage.match(/\[ENFERMEDAD:([^\]]+)\]/g) || [];
 
+        // El modelo escribe nombres, no ids: se resuelven contra el índice de alias
+        // y, si no hay coincidencia, se usa el nombre como slug
         const plantLinks = plantaMatches.map((match: string) => {
           const nombre = match.replace("[PLANTA:", "").replace("]", "");
-          return { id: nombre.toLowerCase().replace(/\s+/g, "-"), nombre };
+          const resuelto = resolverPlanta(nombre);
+          return resuelto
+            ? { id: resuelto.id, nombre, categoriaId: resuelto.bloqueId }
+            : { id: nombre.toLowerCase().replace(/\s+/g, "-"), nombre };
         });
 
         const enfermedadLinks = enfermedadMatches.map((match: string) => {
           const nombre = match.replace("[ENFERMEDAD:", "").replace("]", "");
-          return { id: nombre.toLowerCase().replace(/\s+/g, "-"), nombre };
+          const resuelto = resolverEnfermedad(nombre);
+          return resuelto
+            ? { id: resuelto.id, nombre, sistemaId: resuelto.bloqueId }
+            : { id: nombre.toLowerCase().replace(/\s+/g, "-"), nombre };
         });
 
         // Limpiar el mensaje de los marcadores
@@ -259,7 +283,7 @@ Responde en español con tu estilo humorístico característico.`;
       try {
         const response = await invokeLLM({
           messages: [
-            { role: "system", content: MOLDOCTOR_SYSTEM_PROMPT },
+            { role: "system", content: promptSistema(userQuestion ?? "") },
             {
               role: "user",
               content: [
@@ -339,7 +363,7 @@ Responde en español con tu estilo empático y humorístico característico.`;
       try {
         const response = await invokeLLM({
           messages: [
-            { role: "system", content: MOLDOCTOR_SYSTEM_PROMPT },
+            { role: "system", content: promptSistema(symptomDescription ?? "") },
             {
               role: "user",
               content: [
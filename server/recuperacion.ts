@@ -0,0 +1,106 @@
+// Pócima Salvage - Contexto del catálogo para MolDoctor
+// Consulta el índice generado por scripts/build-retrieval-index.py (misma lógica que scripts/catalogo/recuperacion.py)
+
+import { IndiceRecuperacion, indiceRecuperacion } from "../data/recuperacion-index";
+
+export interface ContextoRecuperado {
+  // texto listo para añadir al prompt del sistema ('' si nada es relevante)
+  texto: string;
+  // tokens estimados del texto (cabeceras incluidas)
+  tokens: number;
+  plantas: string[];
+  enfermedades: string[];
+}
+
+const vaciasDe = new WeakMap<IndiceRecuperacion, Set<string>>();
+
+// Palabra sin plural ni terminación de género (antiinflamatorias -> antiinflamatori; raiz en scripts/catalogo/texto.py)
+const raiz = (palabra: string): string => {
+  let resultado = palabra;
+  if (resultado.length > 3 && resultado.endsWith("s")) resultado = resultado.slice(0, -1);
+  if (resultado.length > 3 && "aoe".includes(resultado[resultado.length - 1])) resultado = resultado.slice(0, -1);
+  return resultado;
+};
+
+// Términos distintos de un mensaje: plegado, sin palabras vacías ni de conversación
+export const terminosConsulta = (texto: string, indice: IndiceRecuperacion = indiceRecuperacion): string[] => {
+  let vacias = vaciasDe.get(indice);
+  if (!vacias) {
+    vacias = new Set(indice.vacias);
+    vaciasDe.set(indice, vacias);
+  }
+  const plegado = texto.toLowerCase().normalize("NFD").replace(/[\u0300-\u036f]/g, "");
+  const terminos = new Set<string>();
+  for (const palabra of plegado.match(/[a-z0-9]+/g) ?? []) {
+    if (!vacias.has(palabra) && palabra.length > 2) terminos.add(raiz(palabra));
+  }
+  return [...terminos];
+};
+
+export const estimarTokens = (texto: string, indice: IndiceRecuperacion = indiceRecuperacion): number =>
+  Math.ceil(texto.length / indice.parametros.caracteresPorToken);
+
+/**
+ * Fichas del catálogo relevantes para un mensaje, dentro del presupuesto de
+ * tokens del índice. Suma los pesos BM25 de los términos del mensaje por
+ * documento; las enfermedades mejor puntuadas pasan parte de su puntuación a
+ * las plantas que el ranking les recomienda. Las fichas se eligen de mayor a
+ * menor puntuación hasta llenar el presupuesto o los máximos por tipo.
+ */
+export const recuperarContexto = (
+  texto: string,
+  indice: IndiceRecuperacion = indiceRecuperacion,
+  presupuesto: number = indice.parametros.presupuesto,
+): ContextoRecuperado => {
+  const { maxPlantas, maxEnfermedades, umbralRelativo, pesoRanking, tokensCabeceras } = indice.parametros;
+  const puntos = new Map<number, number>();
+  for (const t of terminosConsulta(texto, indice)) {
+    const lista = indice.terminos[t];
+    // Array.isArray evita claves heredadas de Object.prototype ('constructor')
+    if (!Array.isArray(lista)) continue;
+    for (let i = 0; i < lista.length; i += 2) {
+      puntos.set(lista[i], (puntos.get(lista[i]) ?? 0) + lista[i + 1]);
+    }
+  }
+
+  const porPuntuacion = (a: number, b: number) => puntos.get(b)! - puntos.get(a)! || a - b;
+  const enfermedades = [...puntos.keys()]
+    .filter(d => indice.documentos[d][0] === "e")
+    .sort(porPuntuacion)
+    .slice(0, maxEnfermedades);
+  for (const d of enfermedades) {
+    const herencia = Math.floor(puntos.get(d)! * pesoRanking);
+    for (const p of indice.recomendadas[d] ?? []) {
+      puntos.set(p, (puntos.get(p) ?? 0) + herencia);
+    }
+  }
+
+  const maximos = { p: maxPlantas, e: maxEnfermedades };
+  const elegidos: number[] = [];
+  let gastado = tokensCabeceras;
+  let mejor = 0;
+  for (const valor of puntos.values()) mejor = Math.max(mejor, valor);
+  const minimo = mejor * umbralRelativo;
+  for (const d of [...puntos.keys()].sort(porPuntuacion)) {
+    if (puntos.get(d)! < minimo) break;
+    const [tipo, , , , coste] = indice.documentos[d];
+    if (maximos[tipo] === 0 || gastado + coste > presupuesto) continue;
+    elegidos.push(d);
+    maximos[tipo]--;
+    gastado += coste;
+    if (maximos.p === 0 && maximos.e === 0) break;
+  }
+
+  const partes: string[] = [];
+  for (const tipo of ["e", "p"] as const) {
+    const fichas = elegidos.filter(d => indice.documentos[d][0] === tipo).map(d => indice.documentos[d][3]);
+    if (fichas.length > 0) partes.push(`${indice.cabeceras[tipo]}\n${fichas.join("\n")}`);
+  }
+  const contexto = partes.join("\n\n");
+  return {
+    texto: contexto,
+    tokens: contexto ? estimarTokens(contexto, indice) : 0,
+    plantas: elegidos.filter(d => indice.documentos[d][0] === "p").map(d => indice.documentos[d][1]),
+    enfermedades: elegidos.filter(d => indice.documentos[d][0] === "e").map(d => indice.documentos[d][1]),
+  };
+};